@@ -1,10 +1,19 @@
-from flask import Flask, request, jsonify, send_file, render_template
+from flask import Flask, Response, request, jsonify, send_file, render_template
 from werkzeug.utils import secure_filename
 import pandas as pd
 import os
 import uuid
+import time
+import json
+import shutil
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import networkx as nx
+
+from grounding import GroundingProcessor
+from topology_graph import build_topology_graphs, to_graphml
 
 app = Flask(__name__)
 
@@ -14,6 +23,36 @@ ALLOWED_EXTENSIONS = {'xlsx', 'xls'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# 后台任务：上传后立即返回任务ID，处理在有界线程池中进行
+JOB_WORKERS = 2           # 同时处理的任务数
+MAX_PENDING_JOBS = 20     # 排队+处理中的任务上限，超过时拒绝新上传
+JOB_RETENTION = 3600      # 已结束任务在内存中保留的秒数
+
+# 结果缓存：三个输入文件内容都相同时直接复用上次的结果
+RESULT_CACHE_FOLDER = 'app/result_cache'
+RESULT_CACHE_MAX_ENTRIES = 50
+RESULT_CACHE_VERSION = '2'  # 处理逻辑或结果格式变化时修改，旧缓存自动失效
+
+# 会话存储回收：app/uploads 下每次上传一个会话目录
+SESSION_STORAGE_BUDGET = 2 * 1024 * 1024 * 1024  # 所有会话目录总大小上限（字节）
+SESSION_TTL = 24 * 3600                          # 会话最后一次使用（上传/下载）后保留的秒数
+SESSION_SWEEP_INTERVAL = 600                     # 后台清理的间隔秒数
+SESSION_GRACE = 300                              # 最近这么多秒内用过的会话不删除（上传中、尚未登记任务的会话）
+EVICTED_LOG = 'app/evicted_sessions.txt'         # 已回收的会话ID，下载时据此返回410
+EVICTED_LOG_MAX = 10000
+
+# 接地清单明细分页：任务完成时只返回第一页，其余按页或NDJSON流获取
+# 结果数据同时写入会话目录，任务从内存中移除后仍可按会话获取明细
+DETAILS_PAGE_SIZE = 200
+DETAILS_MAX_PAGE_SIZE = 2000
+SESSION_RESULT_FILE = 'result.json'
+
+# 拓扑图：处理时按接地分量预先算好布局写入会话目录
+TOPOLOGY_FILE = 'topology_graph.json'
+
+# 会话目录中的JSON结果（明细、拓扑图）最近读取的几个保留在内存中
+SESSION_JSON_CACHE_SIZE = 16
+
 # 确保上传目录存在
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
@@ -21,386 +60,441 @@ def allowed_file(filename):
     """检查文件扩展名是否允许"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-class GroundingProcessor:
-    """接地清单处理器"""
-    
-    def __init__(self, wirelist_path, connlist_path, inline_path):
-        self.wirelist_df = pd.read_excel(wirelist_path)
-        self.connlist_df = pd.read_excel(connlist_path)
-        self.inline_df = pd.read_excel(inline_path)
-        
-        # 获取列名（兼容不同的列名格式）
-        self._standardize_columns()
-        
-        # 识别接地短号
-        self.ground_short_codes = self._identify_ground_codes()
-        
-        # 识别inline列表
-        self.inline_list = self._get_inline_list()
-        
-        # 定义分类
-        self.weld_points = self._identify_weld_points()
-        self.connectors = self._identify_connectors()
-        
-        # 构建连接图
-        self.connection_graph = self._build_connection_graph()
-        
-        # 生成接地清单
-        self.grounding_list = self._generate_grounding_list()
+class JobManager:
+    """
+    后台任务管理：有界线程池 + 任务状态表
+    任务状态: queued → running → done / failed
+    """
     
-    def _standardize_columns(self):
-        """标准化列名，去除空格"""
-        for df in [self.wirelist_df, self.connlist_df, self.inline_df]:
-            df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
+    def __init__(self, workers, max_pending, retention):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='grounding-job')
+        self.max_pending = max_pending
+        self.retention = retention
+        self.jobs = {}
+        self.lock = threading.Lock()
     
-    def _identify_ground_codes(self):
-        """识别接地短号"""
-        ground_codes = []
-        
-        for idx, row in self.connlist_df.iterrows():
-            # 获取短号列
-            short_code_col = None
-            for col in self.connlist_df.columns:
-                if '短号' in str(col) or 'Short Code' in str(col) or 'Code' in str(col):
-                    short_code_col = col
-                    break
+    def submit(self, func, **info):
+        """提交任务，返回任务ID；排队任务已满时返回None"""
+        with self.lock:
+            self._prune()
+            pending = sum(1 for job in self.jobs.values() if job['status'] in ('queued', 'running'))
+            if pending >= self.max_pending:
+                return None
             
-            if short_code_col is None:
-                continue
-                
-            short_code = str(row[short_code_col]).strip() if pd.notna(row[short_code_col]) else ""
-            if not short_code:
-                continue
-            
-            # 查找中文描述
-            is_ground = False
-            for col in self.connlist_df.columns:
-                col_lower = str(col).lower()
-                if any(keyword in col_lower for keyword in ['中文', '描述', 'description', 'desc']):
-                    if pd.notna(row[col]):
-                        desc = str(row[col])
-                        if '接地' in desc or 'ground' in desc.lower() or 'gnd' in desc.lower():
-                            is_ground = True
-                            break
-            
-            # 查找英文描述
-            if not is_ground:
-                for col in self.connlist_df.columns:
-                    col_lower = str(col).lower()
-                    if any(keyword in col_lower for keyword in ['english', 'eng', '英文']):
-                        if pd.notna(row[col]):
-                            desc = str(row[col])
-                            if 'ground' in desc.lower() or 'gnd' in desc.lower():
-                                is_ground = True
-                                break
-            
-            if is_ground:
-                ground_codes.append(short_code)
+            job_id = str(uuid.uuid4())
+            job = dict(info, id=job_id, status='queued', stage='排队中', timings={},
+                       error=None, result=None, created=time.time(), finished=None)
+            self.jobs[job_id] = job
         
-        return list(set(ground_codes))
+        self.executor.submit(self._run, job, func)
+        return job_id
     
-    def _get_inline_list(self):
-        """获取inline插件列表"""
-        inline_codes = []
-        
-        # 从inlinelist中读取
-        for col in self.inline_df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ['inline', '短号', 'code']):
-                inline_codes.extend([str(x).strip() for x in self.inline_df[col].dropna() if x])
-        
-        return list(set(inline_codes))
+    def _run(self, job, func):
+        self.update(job['id'], status='running', stage='开始处理')
+        start = time.perf_counter()
+        try:
+            result = func(job['id'])
+            self.update(job['id'], status='done', stage='完成', result=result)
+        except Exception as e:
+            import traceback
+            print(traceback.format_exc())
+            self.update(job['id'], status='failed', error=str(e))
+        finally:
+            with self.lock:
+                job['timings']['总计'] = round(time.perf_counter() - start, 3)
+                job['finished'] = time.time()
     
-    def _identify_weld_points(self):
-        """识别焊点"""
-        weld_points = []
-        
-        # 获取connlist中的所有短号
-        connlist_codes = set()
-        for col in self.connlist_df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ['短号', 'code', 'short code']):
-                connlist_codes.update([str(x).strip() for x in self.connlist_df[col].dropna() if x])
-        
-        # 查找wirelist中的焊点
-        for idx, row in self.wirelist_df.iterrows():
-            # 查找from pin和to pin列
-            from_pin_col = to_pin_col = None
-            for col in self.wirelist_df.columns:
-                col_lower = str(col).lower()
-                if 'from pin' in col_lower or 'frompin' in col_lower:
-                    from_pin_col = col
-                if 'to pin' in col_lower or 'topin' in col_lower:
-                    to_pin_col = col
-            
-            if from_pin_col is None or to_pin_col is None:
+    def update(self, job_id, **fields):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is not None:
+                job.update(fields)
+    
+    def get(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            return dict(job, timings=dict(job['timings'])) if job else None
+    
+    def complete(self, result, **info):
+        """登记一个已完成的任务（如命中结果缓存），返回任务ID"""
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        with self.lock:
+            self._prune()
+            self.jobs[job_id] = dict(info, id=job_id, status='done', stage='完成', timings={},
+                                     error=None, result=result, created=now, finished=now)
+        return job_id
+    
+    def active_sessions(self):
+        """排队或处理中的任务所属的会话ID"""
+        with self.lock:
+            return {job.get('session_id') for job in self.jobs.values()
+                    if job['status'] in ('queued', 'running')}
+    
+    def _prune(self):
+        """清理结束超过保留时间的任务（调用方持有锁）"""
+        now = time.time()
+        expired = [job_id for job_id, job in self.jobs.items()
+                   if job['finished'] and now - job['finished'] > self.retention]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    接地清单结果缓存（磁盘）
+    键为 wirelist/connlist/inline 三个文件内容哈希的组合，
+    （上传了配置表时再加上配置表的哈希），
+    每个条目一个目录，保存结果Excel（grounding_list.xlsx，及按配置的 grounding_by_config.xlsx）、
+    拓扑图 topology_graph.json 和前端数据 result.json；
+    条目数超过上限时淘汰最久未使用的条目
+    """
+    
+    RESULT_FILES = ('grounding_list.xlsx', 'grounding_by_config.xlsx', TOPOLOGY_FILE)
+    DATA_FILE = 'result.json'
+    
+    def __init__(self, folder, max_entries):
+        self.folder = folder
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+        os.makedirs(folder, exist_ok=True)
+    
+    def make_key(self, paths):
+        digest = hashlib.sha256(RESULT_CACHE_VERSION.encode('ascii'))
+        for path in paths:
+            digest.update(file_sha256(path).encode('ascii'))
+        return digest.hexdigest()
+    
+    def _entry_dir(self, key):
+        return os.path.join(self.folder, key)
+    
+    def get(self, key, session_dir):
+        """命中时把结果Excel复制到会话目录并返回前端数据，否则返回None"""
+        entry_dir = self._entry_dir(key)
+        try:
+            with open(os.path.join(entry_dir, self.DATA_FILE), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            for name in self.RESULT_FILES:
+                if os.path.exists(os.path.join(entry_dir, name)):
+                    shutil.copyfile(os.path.join(entry_dir, name), os.path.join(session_dir, name))
+            os.utime(entry_dir)  # 记录最近使用时间
+        except (OSError, ValueError):
+            with self.lock:
+                self.misses += 1
+            return None
+        
+        with self.lock:
+            self.hits += 1
+        return payload
+    
+    def put(self, key, session_dir, payload):
+        entry_dir = self._entry_dir(key)
+        tmp_dir = f"{entry_dir}.{uuid.uuid4().hex}.tmp"
+        os.makedirs(tmp_dir)
+        for name in self.RESULT_FILES:
+            if os.path.exists(os.path.join(session_dir, name)):
+                shutil.copyfile(os.path.join(session_dir, name), os.path.join(tmp_dir, name))
+        with open(os.path.join(tmp_dir, self.DATA_FILE), 'w', encoding='utf-8') as f:
+            json.dump(payload, f, ensure_ascii=False, default=str)
+        
+        with self.lock:
+            if os.path.exists(entry_dir):
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            else:
+                os.replace(tmp_dir, entry_dir)
+            self._evict()
+    
+    def _evict(self):
+        """按目录修改时间淘汰最久未使用的条目（调用方持有锁）"""
+        entries = [name for name in os.listdir(self.folder) if not name.endswith('.tmp')]
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda name: os.path.getmtime(self._entry_dir(name)))
+        for name in entries[:len(entries) - self.max_entries]:
+            shutil.rmtree(self._entry_dir(name), ignore_errors=True)
+            self.evictions += 1
+    
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            entries = sum(1 for name in os.listdir(self.folder) if not name.endswith('.tmp'))
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': entries,
+                'max_entries': self.max_entries,
+            }
+
+
+class SessionStorage:
+    """
+    会话目录回收
+    - 会话目录的修改时间即最近使用时间，上传和下载时更新
+    - 超过保留时间的会话删除；总大小超出上限时按最近使用时间从旧到新删除
+    - 处理中的会话、最近 grace 秒内用过的会话（如刚上传、还未登记任务）不删除
+    - 已删除的会话ID记录在文件中，下载时可区分“已过期”和“不存在”
+    """
+    
+    def __init__(self, folder, budget, ttl, interval, grace, evicted_log, evicted_max, active_sessions):
+        self.folder = folder
+        self.budget = budget
+        self.ttl = ttl
+        self.interval = interval
+        self.grace = grace
+        self.evicted_log = evicted_log
+        self.evicted_max = evicted_max
+        self.active_sessions = active_sessions
+        
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.total_bytes = 0
+        self.session_count = 0
+        self.evictions = 0
+        self.last_sweep = None
+        self.evicted = {}  # 会话ID → 删除时间，按删除顺序
+        self._load_evicted()
+    
+    def _load_evicted(self):
+        try:
+            with open(self.evicted_log, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.split()
+                    if len(parts) == 2:
+                        self.evicted[parts[0]] = float(parts[1])
+        except (OSError, ValueError):
+            pass
+    
+    def _save_evicted(self):
+        while len(self.evicted) > self.evicted_max:
+            del self.evicted[next(iter(self.evicted))]
+        tmp_path = self.evicted_log + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for session_id, evicted_at in self.evicted.items():
+                f.write(f"{session_id} {evicted_at:.0f}\n")
+        os.replace(tmp_path, self.evicted_log)
+    
+    def session_dir(self, session_id):
+        return os.path.join(self.folder, session_id)
+    
+    def touch(self, session_id):
+        """记录会话被使用（上传/下载）"""
+        try:
+            os.utime(self.session_dir(session_id))
+        except OSError:
+            pass
+    
+    def is_evicted(self, session_id):
+        with self.lock:
+            return session_id in self.evicted
+    
+    def request_sweep(self):
+        """新会话登记任务后唤醒后台清理"""
+        self.wakeup.set()
+    
+    def start(self):
+        threading.Thread(target=self._run, name='session-sweeper', daemon=True).start()
+    
+    def _run(self):
+        while True:
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"会话清理出错: {e}")
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+    
+    def _scan(self):
+        """返回 [(最近使用时间, 会话ID, 字节数)]"""
+        sessions = []
+        for entry in os.scandir(self.folder):
+            if not entry.is_dir():
                 continue
-            
-            from_pin = str(row[from_pin_col]).strip() if pd.notna(row[from_pin_col]) else ""
-            to_pin = str(row[to_pin_col]).strip() if pd.notna(row[to_pin_col]) else ""
-            
-            # 如果pin是X，对应的code不在connlist中，则为焊点
-            if from_pin == 'X':
-                for col in self.wirelist_df.columns:
-                    col_lower = str(col).lower()
-                    if 'from code' in col_lower or 'fromcode' in col_lower:
-                        code = str(row[col]).strip() if pd.notna(row[col]) else ""
-                        if code and code not in connlist_codes:
-                            weld_points.append(code)
-            
-            if to_pin == 'X':
-                for col in self.wirelist_df.columns:
-                    col_lower = str(col).lower()
-                    if 'to code' in col_lower or 'tocode' in col_lower:
-                        code = str(row[col]).strip() if pd.notna(row[col]) else ""
-                        if code and code not in connlist_codes:
-                            weld_points.append(code)
-        
-        return list(set(weld_points))
-    
-    def _identify_connectors(self):
-        """识别插件（除去接地和inline）"""
-        all_codes = set()
-        for col in self.connlist_df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ['短号', 'code', 'short code']):
-                all_codes.update([str(x).strip() for x in self.connlist_df[col].dropna() if x])
-        
-        ground_set = set(self.ground_short_codes)
-        inline_set = set(self.inline_list)
-        
-        connectors = [code for code in all_codes if code and code not in ground_set and code not in inline_set]
-        return connectors
+            size = 0
+            for root, _, files in os.walk(entry.path):
+                for name in files:
+                    try:
+                        size += os.path.getsize(os.path.join(root, name))
+                    except OSError:
+                        pass
+            sessions.append((entry.stat().st_mtime, entry.name, size))
+        return sessions
     
-    def _build_connection_graph(self):
-        """构建连接图，使用networkx来追踪回路连接"""
-        G = nx.Graph()
-        
-        # 获取列名映射
-        from_code_col = to_code_col = from_pin_col = to_pin_col = None
-        for col in self.wirelist_df.columns:
-            col_lower = str(col).lower()
-            if 'from code' in col_lower or 'fromcode' in col_lower:
-                from_code_col = col
-            elif 'to code' in col_lower or 'tocode' in col_lower:
-                to_code_col = col
-            elif 'from pin' in col_lower or 'frompin' in col_lower:
-                from_pin_col = col
-            elif 'to pin' in col_lower or 'topin' in col_lower:
-                to_pin_col = col
-        
-        if not all([from_code_col, to_code_col, from_pin_col, to_pin_col]):
-            return G
-        
-        # 遍历wirelist，添加连接关系
-        for idx, row in self.wirelist_df.iterrows():
-            from_code = str(row[from_code_col]).strip() if pd.notna(row[from_code_col]) else ""
-            to_code = str(row[to_code_col]).strip() if pd.notna(row[to_code_col]) else ""
-            from_pin = str(row[from_pin_col]).strip() if pd.notna(row[from_pin_col]) else ""
-            to_pin = str(row[to_pin_col]).strip() if pd.notna(row[to_pin_col]) else ""
-            
-            if not from_code or not to_code:
+    def sweep(self):
+        """删除过期会话，并把总大小压到上限以内；返回删除的会话数"""
+        now = time.time()
+        active = self.active_sessions()
+        sessions = sorted(self._scan())
+        total = sum(size for _, _, size in sessions)
+        
+        victims = []
+        for last_used, session_id, size in sessions:
+            if session_id in active or now - last_used < self.grace:
                 continue
-            
-            # 添加节点和边
-            node1 = f"{from_code}:{from_pin}"
-            node2 = f"{to_code}:{to_pin}"
-            
-            G.add_edge(node1, node2)
-            
-            # 添加不带pin的节点（用于焊点和inline连接）
-            G.add_node(from_code)
-            G.add_node(to_code)
-            
-            # 如果是焊点，连接焊点到具体节点
-            if from_code in self.weld_points:
-                G.add_edge(from_code, node1)
-            if to_code in self.weld_points:
-                G.add_edge(to_code, node2)
-            
-            # 如果是inline，连接inline两端
-            if from_code in self.inline_list and to_code in self.inline_list:
-                G.add_edge(from_code, to_code)
-        
-        return G
+            if now - last_used > self.ttl or total > self.budget:
+                victims.append(session_id)
+                total -= size
+        
+        for session_id in victims:
+            shutil.rmtree(self.session_dir(session_id), ignore_errors=True)
+        
+        with self.lock:
+            for session_id in victims:
+                self.evicted[session_id] = now
+            if victims:
+                self._save_evicted()
+            self.evictions += len(victims)
+            self.total_bytes = total
+            self.session_count = len(sessions) - len(victims)
+            self.last_sweep = now
+        return len(victims)
     
-    def _get_connected_components(self, start_node):
-        """获取与起始节点相连的所有节点"""
-        if start_node not in self.connection_graph:
-            return []
-        
-        connected = []
-        # 找出所有连通的节点
-        components = nx.connected_components(self.connection_graph)
-        
-        for component in components:
-            if any(start_node in node for node in component):
-                connected = list(component)
-                break
-        
-        return connected
-
-    def _determine_grounding_type(self, ground_code):
-        """
-        判断接地类型：单根回路 或 多根汇流
-        逻辑：
-        1. 找到该接地短号所在的连通分量。
-        2. 检查该连通分量中有多少个接地短号。
-        3. 如果只有1个接地短号，说明它是独立接地点 -> 单根回路。
-        4. 如果有多个接地短号，说明它们汇流在一起 -> 多根汇流。
-        """
-        # 1. 找到该接地点所在的连通分量（所有连接在一起的节点）
-        # 由于我们之前在_build_connection_graph中添加了不带pin的节点，
-        # 我们可以直接搜索包含该ground_code的连通分量。
-        
-        # 从ground_code开始查找所有连通的节点
-        connected_nodes = []
-        for node in self.connection_graph.nodes():
-            if ground_code in node: # 找到包含该短号的节点
-                # 找到包含该节点的连通分量
-                for component in nx.connected_components(self.connection_graph):
-                    if node in component:
-                        connected_nodes = list(component)
-                        break
-                if connected_nodes:
-                    break
-        
-        if not connected_nodes:
-            return "未知类型"
-        
-        # 2. 在这些连通节点中，统计包含多少个接地短号
-        connected_ground_codes = []
-        for node in connected_nodes:
-            # 节点可能是 "Code:Pin" 或只是 "Code"
-            check_code = node.split(':')[0] if ':' in node else node
-            if check_code in self.ground_short_codes:
-                connected_ground_codes.append(check_code)
-        
-        # 去重
-        unique_ground_codes = list(set(connected_ground_codes))
-        
-        # 3. 判断逻辑
-        if len(unique_ground_codes) == 1:
-            # 只有一个接地点，这是典型的单根回路结构
-            return "单根回路"
-        elif len(unique_ground_codes) > 1:
-            # 有多个接地点连在一起，这是多根汇流结构
-            return "多根汇流"
-        else:
-            return "未知类型"
-    
-    def _get_wire_info(self, code, pin):
-        """获取线径和option信息"""
-        # 获取列名映射
-        from_code_col = to_code_col = from_pin_col = to_pin_col = None
-        wire_size_col = option_col = None
-        
-        for col in self.wirelist_df.columns:
-            col_lower = str(col).lower()
-            if 'from code' in col_lower or 'fromcode' in col_lower:
-                from_code_col = col
-            elif 'to code' in col_lower or 'tocode' in col_lower:
-                to_code_col = col
-            elif 'from pin' in col_lower or 'frompin' in col_lower:
-                from_pin_col = col
-            elif 'to pin' in col_lower or 'topin' in col_lower:
-                to_pin_col = col
-            elif 'wire' in col_lower and 'size' in col_lower:
-                wire_size_col = col
-            elif 'option' in col_lower:
-                option_col = col
-        
-        if not all([from_code_col, to_code_col, from_pin_col, to_pin_col]):
-            return '', ''
-        
-        # 查找匹配的线
-        for idx, row in self.wirelist_df.iterrows():
-            fc = str(row[from_code_col]).strip() if pd.notna(row[from_code_col]) else ""
-            tc = str(row[to_code_col]).strip() if pd.notna(row[to_code_col]) else ""
-            fp = str(row[from_pin_col]).strip() if pd.notna(row[from_pin_col]) else ""
-            tp = str(row[to_pin_col]).strip() if pd.notna(row[to_pin_col]) else ""
-            
-            # 检查是否匹配
-            match = False
-            if fc == code and fp == pin:
-                match = True
-            elif tc == code and tp == pin:
-                match = True
-            
-            if match:
-                wire_size = str(row[wire_size_col]).strip() if wire_size_col and pd.notna(row[wire_size_col]) else ""
-                option = str(row[option_col]).strip() if option_col and pd.notna(row[option_col]) else ""
-                return wire_size, option
-        
-        return '', ''
-    
-    def _get_chinese_description(self, code):
-        """获取中文描述"""
-        for col in self.connlist_df.columns:
-            col_lower = str(col).lower()
-            if any(keyword in col_lower for keyword in ['短号', 'code', 'short code']):
-                matching_rows = self.connlist_df[self.connlist_df[col].astype(str).str.strip() == code]
-                for _, row in matching_rows.iterrows():
-                    for desc_col in self.connlist_df.columns:
-                        desc_col_lower = str(desc_col).lower()
-                        if any(keyword in desc_col_lower for keyword in ['中文', '描述', 'description']):
-                            desc = str(row[desc_col]).strip() if pd.notna(row[desc_col]) else ""
-                            if desc and '接地' not in desc:
-                                return desc
-        return ''
-    
-    def _generate_grounding_list(self):
-        """生成接地清单"""
-        grounding_data = []
-        
-        for ground_code in self.ground_short_codes:
-            # 获取与接地相连的所有节点
-            connected_nodes = []
-            for node in self.connection_graph.nodes():
-                if ground_code in node:
-                    connected_nodes = list(nx.node_connected_component(self.connection_graph, node))
-                    break
-            
-            # 判断接地类型（单根回路 vs 多根汇流）
-            grounding_type = self._determine_grounding_type(ground_code)
-            
-            # 提取非接地、非inline的插件及其pin
-            connector_info = {}
-            for node in connected_nodes:
-                # 跳过接地节点和inline节点
-                if ground_code in node or any(inline in node for inline in self.inline_list):
-                    continue
-                
-                # 解析code和pin
-                if ':' in node:
-                    parts = node.split(':')
-                    if len(parts) == 2:
-                        code, pin = parts[0], parts[1]
-                        
-                        # 检查是否是插件
-                        if code in self.connectors:
-                            if code not in connector_info:
-                                connector_info[code] = []
-                            connector_info[code].append(pin)
-            
-            # 为每个连接的插件生成记录
-            for code, pins in connector_info.items():
-                chinese_desc = self._get_chinese_description(code)
-                
-                for pin in pins:
-                    wire_size, option = self._get_wire_info(code, pin)
-                    
-                    grounding_data.append({
-                        '接地短号': ground_code,
-                        '插件短号': code,
-                        '中文描述': chinese_desc,
-                        '插件PIN': pin,
-                        '线径': wire_size,
-                        'Option': option,
-                        '搭铁类型': grounding_type  # 新增字段
-                    })
-        
-        return grounding_data
+    def stats(self):
+        with self.lock:
+            return {
+                'sessions': self.session_count,
+                'bytes': self.total_bytes,
+                'budget_bytes': self.budget,
+                'ttl_seconds': self.ttl,
+                'evictions': self.evictions,
+                'last_sweep': self.last_sweep,
+            }
+
+
+job_manager = JobManager(JOB_WORKERS, MAX_PENDING_JOBS, JOB_RETENTION)
+result_cache = ResultCache(RESULT_CACHE_FOLDER, RESULT_CACHE_MAX_ENTRIES)
+session_storage = SessionStorage(UPLOAD_FOLDER, SESSION_STORAGE_BUDGET, SESSION_TTL, SESSION_SWEEP_INTERVAL,
+                                 SESSION_GRACE, EVICTED_LOG, EVICTED_LOG_MAX, job_manager.active_sessions)
+
+
+def build_result_payload(processor):
+    """接地清单处理结果 → 前端展示用的数据"""
+    # 准备响应数据
+    wirelist_preview = processor.wirelist_df.head(100).to_dict('records')
+    
+    # 拓扑汇总：按接地短号一次分组（搭铁类型取该接地点第一行，插件按出现顺序去重）
+    groups = {}
+    for row in processor.grounding_list:
+        group = groups.get(row['接地短号'])
+        if group is None:
+            group = groups[row['接地短号']] = (row['搭铁类型'], {})
+        group[1][row['插件短号']] = None
+    
+    topology_summary = []
+    for ground_code in processor.ground_short_codes:
+        grounding_type, connectors = groups.get(ground_code, ("未知", {}))
+        topology_summary.append({
+            '接地端子编号': ground_code,
+            '搭铁类型': grounding_type,
+            '连接的插件数': len(connectors),
+            '连接的插件': list(connectors)
+        })
+    
+    # 统计信息
+    statistics = {
+        'total_B_color_wires': len(processor.wirelist_df),
+        'processed_ground_wires': len(processor.grounding_list),
+        'unique_ground_points': len(processor.ground_short_codes),
+        'total_connected_connectors': len({row['插件短号'] for row in processor.grounding_list})
+    }
+    
+    return {
+        'wirelist_preview': wirelist_preview,
+        'topology_summary': topology_summary,
+        'topology_details': processor.grounding_list,
+        'statistics': statistics
+    }
+
+
+def configuration_summary(configuration_lists):
+    """每个配置的接地回路数及单根/多根汇流的接地点数"""
+    summary = []
+    for version, grounding_list in configuration_lists.items():
+        ground_types = {row['接地短号']: row['搭铁类型'] for row in grounding_list}
+        types = list(ground_types.values())
+        summary.append({
+            '配置': version,
+            '接地回路数': len(grounding_list),
+            '接地点数': len(ground_types),
+            '单根回路': types.count('单根回路'),
+            '多根汇流': types.count('多根汇流'),
+        })
+    return summary
+
+
+def write_configuration_workbook(path, configuration_lists, summary):
+    """按配置的接地清单：汇总sheet + 全部配置合在一张sheet（首列为配置）"""
+    rows = [{'配置': version, **row} for version, grounding_list in configuration_lists.items()
+            for row in grounding_list]
+    with pd.ExcelWriter(path, engine='openpyxl') as writer:
+        pd.DataFrame(summary).to_excel(writer, sheet_name='配置汇总', index=False)
+        pd.DataFrame(rows).to_excel(writer, sheet_name='按配置接地清单', index=False)
+
+
+def save_session_result(session_dir, payload):
+    """前端数据写入会话目录，供任务过期后按会话获取明细"""
+    with open(os.path.join(session_dir, SESSION_RESULT_FILE), 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False, default=str)
+
+
+def process_session(job_id, session_dir, cache_key=None):
+    """
+    后台任务：处理会话目录中的三个文件，写出结果Excel，返回前端数据（并写入结果缓存）
+    会话目录中有配置表 config.xlsx 时，同时按配置生成接地清单
+    """
+    def progress(stage):
+        job_manager.update(job_id, stage=stage)
+    
+    processor = GroundingProcessor(
+        os.path.join(session_dir, 'wirelist.xlsx'),
+        os.path.join(session_dir, 'connlist.xlsx'),
+        os.path.join(session_dir, 'inline.xlsx'),
+        progress=progress,
+    )
+    config_path = os.path.join(session_dir, 'config.xlsx')
+    configuration_lists = None
+    if os.path.exists(config_path):
+        configuration_lists = processor.generate_configuration_lists(config_path)
+    timings = dict(processor.timings)
+    job_manager.update(job_id, timings=timings)
+    
+    # 保存结果Excel
+    progress('写出结果')
+    start = time.perf_counter()
+    result_path = os.path.join(session_dir, 'grounding_list.xlsx')
+    result_df = pd.DataFrame(processor.grounding_list)
+    result_df.to_excel(result_path, index=False, engine='openpyxl')
+    payload = build_result_payload(processor)
+    if configuration_lists is not None:
+        payload['configurations'] = configuration_summary(configuration_lists)
+        write_configuration_workbook(os.path.join(session_dir, 'grounding_by_config.xlsx'),
+                                     configuration_lists, payload['configurations'])
+    timings['写出结果'] = round(time.perf_counter() - start, 3)
+    
+    # 拓扑图及布局
+    progress('拓扑布局')
+    start = time.perf_counter()
+    with open(os.path.join(session_dir, TOPOLOGY_FILE), 'w', encoding='utf-8') as f:
+        json.dump(build_topology_graphs(processor), f, ensure_ascii=False)
+    timings['拓扑布局'] = round(time.perf_counter() - start, 3)
+    job_manager.update(job_id, timings=timings)
+    
+    save_session_result(session_dir, payload)
+    if cache_key:
+        result_cache.put(cache_key, session_dir, payload)
+    return payload
 
 
 @app.route('/')
@@ -410,6 +504,7 @@ def index():
 
 @app.route('/api/upload', methods=['POST'])
 def upload_files():
+    """保存上传的文件并提交后台任务，立即返回任务ID"""
     try:
         # 检查文件
         if 'wirelist' not in request.files or 'connlist' not in request.files or 'inline' not in request.files:
@@ -425,61 +520,53 @@ def upload_files():
         if not all([allowed_file(wirelist_file.filename), allowed_file(connlist_file.filename), allowed_file(inline_file.filename)]):
             return jsonify({'success': False, 'error': '只支持.xlsx或.xls文件'}), 400
         
+        # 配置表可选：上传后额外按每个配置生成接地清单
+        config_file = request.files.get('config')
+        if config_file is not None and not config_file.filename:
+            config_file = None
+        if config_file is not None and not allowed_file(config_file.filename):
+            return jsonify({'success': False, 'error': '配置表只支持.xlsx或.xls文件'}), 400
+        
         # 生成会话ID
         session_id = str(uuid.uuid4())
         session_dir = os.path.join(app.config['UPLOAD_FOLDER'], session_id)
         os.makedirs(session_dir, exist_ok=True)
         
         # 保存文件
-        wirelist_path = os.path.join(session_dir, 'wirelist.xlsx')
-        connlist_path = os.path.join(session_dir, 'connlist.xlsx')
-        inline_path = os.path.join(session_dir, 'inline.xlsx')
-        
-        wirelist_file.save(wirelist_path)
-        connlist_file.save(connlist_path)
-        inline_file.save(inline_path)
-        
-        # 处理数据
-        processor = GroundingProcessor(wirelist_path, connlist_path, inline_path)
-        
-        # 保存结果Excel
-        result_path = os.path.join(session_dir, 'grounding_list.xlsx')
-        result_df = pd.DataFrame(processor.grounding_list)
-        result_df.to_excel(result_path, index=False, engine='openpyxl')
-        
-        # 准备响应数据
-        wirelist_preview = processor.wirelist_df.head(100).to_dict('records')
-        
-        # 统计信息
-        statistics = {
-            'total_B_color_wires': len(processor.wirelist_df),
-            'processed_ground_wires': len(processor.grounding_list),
-            'unique_ground_points': len(processor.ground_short_codes),
-            'total_connected_connectors': len(set([x['插件短号'] for x in processor.grounding_list]))
-        }
-        
-        # 拓扑汇总
-        topology_summary = []
-        for ground_code in processor.ground_short_codes:
-            connected_connectors = list(set([x['插件短号'] for x in processor.grounding_list if x['接地短号'] == ground_code]))
-            grounding_type = next((x['搭铁类型'] for x in processor.grounding_list if x['接地短号'] == ground_code), "未知")
-            topology_summary.append({
-                '接地端子编号': ground_code,
-                '搭铁类型': grounding_type, # 新增
-                '连接的插件数': len(connected_connectors),
-                '连接的插件': connected_connectors
-            })
+        uploads = [(wirelist_file, 'wirelist.xlsx'), (connlist_file, 'connlist.xlsx'), (inline_file, 'inline.xlsx')]
+        if config_file is not None:
+            uploads.append((config_file, 'config.xlsx'))
+        input_paths = [os.path.join(session_dir, name) for _, name in uploads]
+        for (upload, _), path in zip(uploads, input_paths):
+            upload.save(path)
+        
+        # 上传的文件内容都与之前某次上传相同时直接复用结果
+        cache_key = result_cache.make_key(input_paths)
+        payload = result_cache.get(cache_key, session_dir)
+        if payload is not None:
+            save_session_result(session_dir, payload)
+            job_id = job_manager.complete(payload, session_id=session_id)
+            session_storage.request_sweep()
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'session_id': session_id,
+                'cached': True,
+            }), 200
+        
+        # 提交后台处理
+        job_id = job_manager.submit(lambda job_id: process_session(job_id, session_dir, cache_key),
+                                    session_id=session_id)
+        if job_id is None:
+            return jsonify({'success': False, 'error': '当前处理任务过多，请稍后再试'}), 503
+        session_storage.request_sweep()
         
         return jsonify({
             'success': True,
+            'job_id': job_id,
             'session_id': session_id,
-            'data': {
-                'wirelist_preview': wirelist_preview,
-                'topology_summary': topology_summary,
-                'topology_details': processor.grounding_list,
-                'statistics': statistics
-            }
-        })
+            'cached': False,
+        }), 202
         
     except Exception as e:
         import traceback
@@ -487,17 +574,230 @@ def upload_files():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@app.route('/api/download/<session_id>')
-def download_result(session_id):
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    """任务进度：状态、当前阶段、各阶段耗时；完成后附带结果数据"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': '任务不存在'}), 404
+    
+    response = {
+        'success': job['status'] != 'failed',
+        'job_id': job['id'],
+        'session_id': job['session_id'],
+        'status': job['status'],
+        'stage': job['stage'],
+        'timings': job['timings'],
+        'elapsed': round((job['finished'] or time.time()) - job['created'], 3),
+    }
+    if job['status'] == 'done':
+        # 明细只带第一页，其余通过 /api/jobs/<job_id>/details 获取
+        data = dict(job['result'])
+        details = data['topology_details']
+        data['topology_details'] = details[:DETAILS_PAGE_SIZE]
+        data['topology_total'] = len(details)
+        data['page_size'] = DETAILS_PAGE_SIZE
+        response['data'] = data
+    elif job['status'] == 'failed':
+        response['error'] = job['error']
+    return jsonify(response)
+
+
+def finished_details(job_id):
+    """已完成任务的接地清单明细；任务不存在或未完成时返回 (None, 错误响应)"""
+    job = job_manager.get(job_id)
+    if job is None:
+        return None, (jsonify({'success': False, 'error': '任务不存在'}), 404)
+    if job['status'] != 'done':
+        return None, (jsonify({'success': False, 'error': '任务尚未完成', 'status': job['status']}), 409)
+    return job['result']['topology_details'], None
+
+
+def session_details(session_id):
+    """会话目录中保存的接地清单明细（任务已从内存中移除后也可用）"""
+    payload, error = load_session_json(session_id, SESSION_RESULT_FILE)
+    if error:
+        return None, error
+    return payload['topology_details'], None
+
+
+def details_page_response(details):
+    """接地清单明细分页：?page=1&page_size=200"""
+    try:
+        page = max(1, int(request.args.get('page', 1)))
+        page_size = min(DETAILS_MAX_PAGE_SIZE, max(1, int(request.args.get('page_size', DETAILS_PAGE_SIZE))))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'page/page_size 必须是整数'}), 400
+    
+    start = (page - 1) * page_size
+    return jsonify({
+        'success': True,
+        'total': len(details),
+        'page': page,
+        'page_size': page_size,
+        'pages': (len(details) + page_size - 1) // page_size,
+        'items': details[start:start + page_size],
+    })
+
+
+def details_stream_response(details):
+    """接地清单明细逐行流式输出（每行一个JSON对象）"""
+    def generate():
+        for row in details:
+            yield json.dumps(row, ensure_ascii=False, default=str) + '\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
+
+@app.route('/api/jobs/<job_id>/details')
+def job_details_page(job_id):
+    details, error = finished_details(job_id)
+    if error:
+        return error
+    return details_page_response(details)
+
+
+@app.route('/api/jobs/<job_id>/details.ndjson')
+def job_details_stream(job_id):
+    details, error = finished_details(job_id)
+    if error:
+        return error
+    return details_stream_response(details)
+
+
+@app.route('/api/sessions/<session_id>/details')
+def session_details_page(session_id):
+    details, error = session_details(session_id)
+    if error:
+        return error
+    return details_page_response(details)
+
+
+@app.route('/api/sessions/<session_id>/details.ndjson')
+def session_details_stream(session_id):
+    details, error = session_details(session_id)
+    if error:
+        return error
+    return details_stream_response(details)
+
+
+@app.route('/api/cache/stats')
+def cache_stats():
+    """结果缓存命中统计及会话存储占用"""
+    return jsonify({'success': True, 'result_cache': result_cache.stats(), 'storage': session_storage.stats()})
+
+
+def session_file(session_id, filename):
+    """会话目录中的结果文件路径；返回 (路径, None) 或 (None, 错误响应)，会话已被清理时为410"""
     try:
-        result_path = os.path.join(app.config['UPLOAD_FOLDER'], session_id, 'grounding_list.xlsx')
-        if os.path.exists(result_path):
-            return send_file(result_path, as_attachment=True, download_name='接地清单.xlsx')
-        else:
-            return jsonify({'success': False, 'error': '文件不存在'}), 404
+        session_id = str(uuid.UUID(session_id))
+    except ValueError:
+        return None, (jsonify({'success': False, 'error': '文件不存在'}), 404)
+    
+    result_path = os.path.join(app.config['UPLOAD_FOLDER'], session_id, filename)
+    if os.path.exists(result_path):
+        session_storage.touch(session_id)
+        return result_path, None
+    elif session_storage.is_evicted(session_id):
+        return None, (jsonify({'success': False, 'error': '结果已过期被清理，请重新上传文件生成'}), 410)
+    else:
+        return None, (jsonify({'success': False, 'error': '文件不存在'}), 404)
+
+
+def send_session_file(session_id, filename, download_name):
+    """发送会话目录中的结果文件"""
+    try:
+        result_path, error = session_file(session_id, filename)
+        if error:
+            return error
+        return send_file(os.path.abspath(result_path), as_attachment=True, download_name=download_name)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/download/<session_id>')
+def download_result(session_id):
+    return send_session_file(session_id, 'grounding_list.xlsx', '接地清单.xlsx')
+
+
+@app.route('/api/download/<session_id>/configs')
+def download_configuration_result(session_id):
+    """按配置的接地清单（上传了配置表时才有）"""
+    return send_session_file(session_id, 'grounding_by_config.xlsx', '按配置接地清单.xlsx')
+
+
+session_json_cache = OrderedDict()  # 结果文件路径 → 解析后的JSON
+session_json_cache_lock = threading.Lock()
+
+
+def load_session_json(session_id, filename):
+    """会话目录中的JSON结果文件；返回 (数据, None) 或 (None, 错误响应)"""
+    path, error = session_file(session_id, filename)
+    if error:
+        return None, error
+    
+    with session_json_cache_lock:
+        data = session_json_cache.get(path)
+        if data is not None:
+            session_json_cache.move_to_end(path)
+            return data, None
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    with session_json_cache_lock:
+        session_json_cache[path] = data
+        while len(session_json_cache) > SESSION_JSON_CACHE_SIZE:
+            session_json_cache.popitem(last=False)
+    return data, None
+
+
+def graphml_response(graphs, download_name):
+    return Response(to_graphml(graphs), mimetype='application/graphml+xml',
+                    headers={'Content-Disposition': f'attachment; filename={download_name}'})
+
+
+@app.route('/api/topology/<session_id>')
+def topology_index(session_id):
+    """
+    拓扑图目录：每个接地分量的接地点和规模
+    ?format=graphml 时下载全部分量的GraphML
+    """
+    graphs, error = load_session_json(session_id, TOPOLOGY_FILE)
+    if error:
+        return error
+    if request.args.get('format') == 'graphml':
+        return graphml_response(graphs, 'topology.graphml')
+    
+    return jsonify({
+        'success': True,
+        'graphs': [{
+            'id': graph['id'],
+            'ground_codes': graph['ground_codes'],
+            'node_count': len(graph['nodes']),
+            'edge_count': len(graph['edges']),
+        } for graph in graphs],
+    })
+
+
+@app.route('/api/topology/<session_id>/<int:graph_id>')
+def topology_graph(session_id, graph_id):
+    """
+    一个接地分量的拓扑图（节点带预先算好的坐标，edges 为 [节点序号, 节点序号, 导线数]）
+    ?format=graphml 时返回GraphML
+    """
+    graphs, error = load_session_json(session_id, TOPOLOGY_FILE)
+    if error:
+        return error
+    if graph_id >= len(graphs):
+        return jsonify({'success': False, 'error': '拓扑图不存在'}), 404
+    
+    graph = graphs[graph_id]
+    if request.args.get('format') == 'graphml':
+        return graphml_response([graph], f'topology_{graph_id}.graphml')
+    return jsonify({'success': True, 'graph': graph})
+
+
 if __name__ == '__main__':
-    app.run(debug=True, port=5000)
\ No newline at end of file
+    # 会话清理线程只在提供服务的进程中启动；不用自动重载（重载器的父进程看不到子进程中的任务，会误删处理中的会话）
+    session_storage.start()
+    app.run(port=5000, use_reloader=False)
\ No newline at end of file
@@ -0,0 +1,154 @@
+"""
+连接图基准测试：CSR邻接表（csr_graph.py） 对比 原networkx实现
+- 用同一份回路表分别建图并做连通分量标注，比较耗时和内存（tracemalloc 峰值/建完后保留）
+- 两种实现的连通分量逐一核对，确保结果一致
+- --scale N 把回路表复制N份（短号加后缀区分），模拟整车规模的回路表
+- 需要另外安装 networkx（应用本身不再依赖它）
+
+用法:
+    python benchmark_graph.py wirelist.xlsx connlist.xlsx inline.xlsx [--scale 10] [--repeat 3]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+import pandas as pd
+
+from grounding import GroundingProcessor
+
+try:
+    import networkx as nx
+except ImportError:
+    nx = None
+
+
+def build_networkx_graph(processor):
+    """原 _build_connection_graph 的networkx实现（字符串节点 "code:pin" / "code"）"""
+    G = nx.Graph()
+    cols = processor.wire_columns
+    df = processor.wirelist_df
+    from_codes = processor._text_column(df, cols['from_code']).tolist()
+    to_codes = processor._text_column(df, cols['to_code']).tolist()
+    from_pins = processor._text_column(df, cols['from_pin']).tolist()
+    to_pins = processor._text_column(df, cols['to_pin']).tolist()
+    weld_set = set(processor.weld_points)
+    inline_set = set(processor.inline_list)
+
+    for from_code, to_code, from_pin, to_pin in zip(from_codes, to_codes, from_pins, to_pins):
+        if not from_code or not to_code:
+            continue
+        node1 = f"{from_code}:{from_pin}"
+        node2 = f"{to_code}:{to_pin}"
+        G.add_edge(node1, node2)
+        G.add_node(from_code)
+        G.add_node(to_code)
+        if from_code in weld_set:
+            G.add_edge(from_code, node1)
+        if to_code in weld_set:
+            G.add_edge(to_code, node2)
+        if from_code in inline_set and to_code in inline_set:
+            G.add_edge(from_code, to_code)
+    return G
+
+
+def run_networkx(processor):
+    graph = build_networkx_graph(processor)
+    components = list(nx.connected_components(graph))
+    return graph, components
+
+
+def run_csr(processor):
+    graph = processor._build_connection_graph()
+    graph.connected_components()
+    return graph, None
+
+
+def measure(func, processor, repeat):
+    """返回 (最短耗时秒, 峰值内存字节, 建完后保留内存字节, 结果)"""
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = func(processor)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    result = func(processor)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak - base, current - base, result
+
+
+def scale_processor(processor, factor):
+    """把回路表复制factor份，每份的短号加后缀 #k，焊点/inline/接地列表同步扩展"""
+    if factor <= 1:
+        return
+    cols = processor.wire_columns
+    code_cols = [cols['from_code'], cols['to_code']]
+    copies = []
+    for k in range(factor):
+        copy = processor.wirelist_df.copy()
+        for col in code_cols:
+            copy[col] = processor._text_column(copy, col) + f"#{k}"
+        copies.append(copy)
+    processor.wirelist_df = pd.concat(copies, ignore_index=True)
+
+    def expand(codes):
+        return [f"{code}#{k}" for k in range(factor) for code in codes]
+
+    processor.weld_points = expand(processor.weld_points)
+    processor.inline_list = expand(processor.inline_list)
+    processor.ground_short_codes = expand(processor.ground_short_codes)
+
+
+def same_components(nx_components, csr_graph):
+    """两种实现的连通分量（节点名集合）是否完全一致"""
+    labels = csr_graph.connected_components()
+    if len(nx_components) != csr_graph.num_components:
+        return False
+    names = csr_graph.node_names
+    csr_components = {frozenset(names[i] for i in csr_graph.component_nodes(c))
+                      for c in range(csr_graph.num_components)}
+    return len(labels) == len(names) and all(frozenset(c) in csr_components for c in nx_components)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="连接图基准测试：CSR vs networkx")
+    parser.add_argument("wirelist")
+    parser.add_argument("connlist")
+    parser.add_argument("inline")
+    parser.add_argument("--scale", type=int, default=1, help="回路表复制份数（默认1）")
+    parser.add_argument("--repeat", type=int, default=3, help="计时重复次数，取最短（默认3）")
+    args = parser.parse_args(argv)
+
+    if nx is None:
+        print("未安装 networkx，无法对比: pip install networkx")
+        return 1
+
+    processor = GroundingProcessor(args.wirelist, args.connlist, args.inline)
+    scale_processor(processor, args.scale)
+    print(f"回路表 {len(processor.wirelist_df)} 行（复制 {args.scale} 份）")
+
+    nx_time, nx_peak, nx_kept, (nx_graph, nx_components) = measure(run_networkx, processor, args.repeat)
+    csr_time, csr_peak, csr_kept, (csr_graph, _) = measure(run_csr, processor, args.repeat)
+
+    print(f"节点 {csr_graph.num_nodes}，边 {csr_graph.num_edges}，连通分量 {csr_graph.num_components}")
+    print(f"{'实现':<10}{'耗时(s)':>10}{'峰值内存(MB)':>14}{'保留内存(MB)':>14}")
+    for name, elapsed, peak, kept in (('networkx', nx_time, nx_peak, nx_kept),
+                                      ('CSR', csr_time, csr_peak, csr_kept)):
+        print(f"{name:<10}{elapsed:>10.3f}{peak / 1e6:>14.1f}{kept / 1e6:>14.1f}")
+    print(f"加速 {nx_time / csr_time:.1f} 倍，保留内存为 networkx 的 {csr_kept / nx_kept:.0%}")
+
+    consistent = same_components(nx_components, csr_graph)
+    print("连通分量一致" if consistent else "连通分量不一致！")
+    return 0 if consistent else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,100 @@
+"""
+生成 接地清单生成器V6.html 使用的模板资源（替代一次性加载的 template_data.js）
+- 每个模板xlsx原样gzip压缩（解压后与原文件逐字节相同，下载到的仍是原来的xlsx）
+- 压缩结果以内容哈希命名，写成 template_assets/<模板>.<哈希>.js，内容为一次 registerTemplateAsset(...) 调用；
+  用script标签加载，页面直接双击打开（file://）时也能用
+- 生成 template_manifest.js（TEMPLATE_MANIFEST：文件名、资源路径、大小、哈希），页面只加载这个清单，
+  点击下载某个模板时才加载并解压对应资源
+- 模板来源：--source-dir 中的xlsx；没有时用本目录下的 *_full_b64.txt
+- 清单中不再引用的旧资源文件会被删除
+
+用法:
+    python build_template_assets.py [--source-dir 模板xlsx目录]
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSET_DIR = 'template_assets'
+MANIFEST_FILE = 'template_manifest.js'
+HASH_LENGTH = 12
+
+# (模板键, 下载文件名, base64来源文件)
+TEMPLATES = [
+    ('WIRELIST', 'WIRELIST.xlsx', 'wirelist_full_b64.txt'),
+    ('CONNLIST', 'T28-Connlist_20260113.xlsx', 'connlist_full_b64.txt'),
+    ('INLINE', 'inline.xlsx', 'inline_full_b64.txt'),
+]
+
+
+def read_template(filename, b64_name, source_dir=None):
+    """模板xlsx的字节：优先读 source_dir 中的xlsx，否则解码本目录的base64文本"""
+    if source_dir:
+        path = os.path.join(source_dir, filename)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return f.read()
+    with open(os.path.join(SCRIPT_DIR, b64_name), 'r', encoding='ascii') as f:
+        return base64.b64decode(f.read())
+
+
+def compress_template(xlsx_bytes):
+    """返回gzip压缩后的字节；mtime固定为0，相同内容每次生成相同的资源文件"""
+    return gzip.compress(xlsx_bytes, compresslevel=9, mtime=0)
+
+
+def build(source_dir=None):
+    """生成各模板资源和清单，返回清单（模板键 → 信息）"""
+    asset_dir = os.path.join(SCRIPT_DIR, ASSET_DIR)
+    os.makedirs(asset_dir, exist_ok=True)
+
+    manifest = {}
+    for key, filename, b64_name in TEMPLATES:
+        xlsx_bytes = read_template(filename, b64_name, source_dir)
+        compressed = compress_template(xlsx_bytes)
+        digest = hashlib.sha256(xlsx_bytes).hexdigest()
+        asset_name = f"{key}.{digest[:HASH_LENGTH]}.js"
+
+        payload = base64.b64encode(compressed).decode('ascii')
+        with open(os.path.join(asset_dir, asset_name), 'w', encoding='ascii') as f:
+            f.write(f"registerTemplateAsset('{key}', '{payload}');\n")
+
+        manifest[key] = {
+            'filename': filename,
+            'asset': f"{ASSET_DIR}/{asset_name}",
+            'size': len(xlsx_bytes),
+            'compressed_size': len(compressed),
+            'sha256': digest,
+        }
+        print(f"{filename}: {len(xlsx_bytes)} → gzip {len(compressed)} 字节 → {ASSET_DIR}/{asset_name}")
+
+    # 删除不再引用的旧资源
+    current = {os.path.basename(entry['asset']) for entry in manifest.values()}
+    for name in os.listdir(asset_dir):
+        if name not in current:
+            os.remove(os.path.join(asset_dir, name))
+            print(f"删除旧资源 {ASSET_DIR}/{name}")
+
+    content = ("// 由 build_template_assets.py 生成，请勿手工修改\n"
+               f"const TEMPLATE_MANIFEST = {json.dumps(manifest, ensure_ascii=False, indent=4)};\n")
+    with open(os.path.join(SCRIPT_DIR, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+        f.write(content)
+    print(f"已生成 {MANIFEST_FILE}（{len(content.encode('utf-8'))} 字节）")
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="生成压缩、按内容哈希命名的模板资源")
+    parser.add_argument("--source-dir", help="模板xlsx所在目录（默认用本目录的 *_full_b64.txt）")
+    args = parser.parse_args(argv)
+    build(args.source_dir)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""
+配置表读取与 导线 × 配置 存在矩阵
+- 配置表布局与配置表比对工具相同：sheet "产品工程配置表"（没有时取第一个sheet），
+  第4行为表头，第4列起每列一个配置（版本）；数据从第6行开始，A列为特征值，单元格为 ● 表示该配置带有此特征值
+- 特征值 × 配置 存为布尔矩阵，每个不同的Option只在矩阵上向量化求值一次，得到它在所有配置下的取值
+- Option为空的导线在所有配置中都存在；ALL 由 option_expr 解析为所有配置（规则见工具35的 option_expr.py）
+- VersionMatrix 按 Wire Chart 工具（35）xdot_matrix.py 中的 ConfigMatrix 改写（零件号换成配置），以那份为准：
+  矩阵构建和 column/constant 接口的修改先改35，再同步到这里
+"""
+
+import numpy as np
+import pandas as pd
+
+from option_expr import compile_option, normalize_option
+
+CONFIG_SHEET_NAME = '产品工程配置表'
+HEADER_ROW = 3
+DATA_START_ROW = 5
+FIXED_COLUMNS = 3  # 特征值编号、特征值描述、备注
+FEATURE_MARK = '●'
+
+
+class VersionMatrix:
+    """配置矩阵：bits[特征值序号, 配置序号] 为 True 表示该配置带有此特征值"""
+
+    def __init__(self, versions, version_features):
+        self.versions = list(versions)
+        self.version_count = len(self.versions)
+
+        vocabulary = set()
+        for features in version_features:
+            vocabulary.update(features)
+        self.vocabulary = sorted(vocabulary)
+        self.index = {name: i for i, name in enumerate(self.vocabulary)}
+
+        self.bits = np.zeros((len(self.vocabulary), self.version_count), dtype=bool)
+        for vi, features in enumerate(version_features):
+            rows = [self.index[name] for name in features]
+            self.bits[rows, vi] = True
+
+        self._false = np.zeros(self.version_count, dtype=bool)
+        self._true = np.ones(self.version_count, dtype=bool)
+
+    def column(self, name):
+        """某个特征值在所有配置上的取值（配置表中没有的特征值全为False）"""
+        idx = self.index.get(name)
+        if idx is None:
+            return self._false
+        return self.bits[idx]
+
+    def constant(self, value):
+        return self._true if value else self._false
+
+
+def read_config_table(path):
+    """读取配置表，返回 VersionMatrix（配置按表头从左到右的顺序）"""
+    with pd.ExcelFile(path) as xls:
+        sheet_name = CONFIG_SHEET_NAME if CONFIG_SHEET_NAME in xls.sheet_names else xls.sheet_names[0]
+        df = pd.read_excel(xls, sheet_name=sheet_name, header=None, dtype=str)
+
+    headers = df.iloc[HEADER_ROW] if len(df) > HEADER_ROW else pd.Series(dtype=object)
+    body = df.iloc[DATA_START_ROW:]
+    features = body.iloc[:, 0].fillna('').str.strip().str.upper()
+    has_feature = (features != '').to_numpy()
+    features = features.to_numpy()[has_feature]
+
+    versions = []
+    version_features = []
+    for col in range(FIXED_COLUMNS, df.shape[1]):
+        name = headers.iloc[col] if col < len(headers) else None
+        name = str(name).strip() if pd.notna(name) else ''
+        if not name:
+            continue
+        marks = body.iloc[:, col].fillna('').str.strip().to_numpy()[has_feature]
+        versions.append(name)
+        version_features.append(set(features[marks == FEATURE_MARK]))
+
+    return VersionMatrix(versions, version_features)
+
+
+def wire_presence(option_values, matrix):
+    """
+    导线 × 配置 存在矩阵
+    option_values: 每根导线的Option原值（顺序与回路表行一致）
+    返回 (导线数, 配置数) 的布尔矩阵
+    """
+    presence = np.zeros((len(option_values), matrix.version_count), dtype=bool)
+    if not len(option_values) or not matrix.version_count:
+        return presence
+
+    # 相同Option的导线共享一次求值
+    rows_by_option = {}
+    for row_idx, value in enumerate(option_values):
+        rows_by_option.setdefault(normalize_option(value), []).append(row_idx)
+
+    for text, rows in rows_by_option.items():
+        if not text:
+            presence[rows] = True
+        else:
+            presence[rows] = compile_option(text).evaluate_matrix(matrix)
+
+    return presence
@@ -0,0 +1,195 @@
+"""
+插件清单（Connlist）目录索引
+- 加载时只扫描插件清单一次，建立 短号 → 中文描述/英文描述/是否接地/是否inline 的索引
+- 列按列名关键字识别（短号/code、中文/描述/description、english/英文），规则与接地清单处理一致
+- 不依赖Flask，接地清单、保险丝线径匹配、插件查询等工具都可直接使用
+- load_catalog 按文件内容哈希缓存，同一份插件清单在同一进程中只解析一次
+
+用法:
+    from connlist_catalog import load_catalog
+    catalog = load_catalog('Connlist.xlsx', 'inline.xlsx')
+    entry = catalog.get('X101')   # ConnectorEntry 或 None
+    entry.chinese, entry.english, entry.is_ground, entry.is_inline
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+ConnectorEntry = namedtuple('ConnectorEntry', ['code', 'chinese', 'english', 'is_ground', 'is_inline'])
+
+CATALOG_CACHE_SIZE = 8
+
+
+def text_column(df, col):
+    """整列转为去空格的字符串，空值为 ''"""
+    values = df[col]
+    return values.where(values.notna(), '').astype(str).str.strip()
+
+
+def strip_columns(df):
+    """列名去除首尾空格"""
+    df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
+    return df
+
+
+def resolve_columns(df):
+    """
+    识别插件清单中各类列
+    - short_code: 第一个短号列（识别接地用）
+    - code_cols: 所有短号列（汇总全部短号、查描述用）
+    - desc_cols: 描述列（中文/描述/description/desc，识别接地用）
+    - chinese_cols: 中文描述列（中文/描述/description）
+    - english_cols: 英文描述列
+    """
+    columns = {'short_code': None, 'code_cols': [], 'desc_cols': [], 'chinese_cols': [], 'english_cols': []}
+    for col in df.columns:
+        col_str = str(col)
+        col_lower = col_str.lower()
+        if columns['short_code'] is None and ('短号' in col_str or 'Short Code' in col_str or 'Code' in col_str):
+            columns['short_code'] = col
+        if any(keyword in col_lower for keyword in ['短号', 'code', 'short code']):
+            columns['code_cols'].append(col)
+        if any(keyword in col_lower for keyword in ['中文', '描述', 'description', 'desc']):
+            columns['desc_cols'].append(col)
+        if any(keyword in col_lower for keyword in ['中文', '描述', 'description']):
+            columns['chinese_cols'].append(col)
+        if any(keyword in col_lower for keyword in ['english', 'eng', '英文']):
+            columns['english_cols'].append(col)
+    return columns
+
+
+def inline_codes_from_df(inline_df):
+    """inline表中 inline/短号/code 列的全部短号"""
+    codes = set()
+    for col in inline_df.columns:
+        col_lower = str(col).lower()
+        if any(keyword in col_lower for keyword in ['inline', '短号', 'code']):
+            codes.update(str(x).strip() for x in inline_df[col].dropna() if x)
+    return codes
+
+
+class ConnlistCatalog:
+    """插件清单索引，建成后只读，可在多个线程/任务间共用"""
+
+    def __init__(self, connlist_df, inline_codes=()):
+        self.columns = resolve_columns(connlist_df)
+        self.inline_codes = set(inline_codes)
+        self.codes = self._collect_codes(connlist_df)
+        self.ground_codes = self._identify_ground_codes(connlist_df)
+        self.chinese = self._first_descriptions(connlist_df, self.columns['chinese_cols'], skip_ground=True)
+        self.english = self._first_descriptions(connlist_df, self.columns['english_cols'])
+        self._ground_set = set(self.ground_codes)
+
+    def _collect_codes(self, df):
+        """所有短号列中的短号"""
+        codes = set()
+        for col in self.columns['code_cols']:
+            codes.update(str(x).strip() for x in df[col].dropna() if x)
+        return codes
+
+    def _identify_ground_codes(self, df):
+        """识别接地短号：描述列含“接地”，或（中/英文）描述含 ground / gnd"""
+        short_code_col = self.columns['short_code']
+        if short_code_col is None:
+            return []
+
+        short_codes = text_column(df, short_code_col)
+
+        # 各描述列上的关键字掩码，按行取或
+        is_ground = pd.Series(False, index=df.index)
+        for col in self.columns['desc_cols']:
+            desc = df[col].astype(str)
+            is_ground |= df[col].notna() & (
+                desc.str.contains('接地', regex=False) | desc.str.lower().str.contains('ground|gnd')
+            )
+        for col in self.columns['english_cols']:
+            desc = df[col].astype(str).str.lower()
+            is_ground |= df[col].notna() & desc.str.contains('ground|gnd')
+
+        return list(set(short_codes[is_ground & (short_codes != '')]))
+
+    def _first_descriptions(self, df, desc_cols, skip_ground=False):
+        """
+        短号 → 描述：按 短号列 → 行 → 描述列 的顺序取第一个非空描述
+        skip_ground 时跳过含“接地”的描述（接地清单中插件的描述不用接地点的说明）
+        """
+        if not desc_cols:
+            return {}
+
+        # 每行按描述列顺序取第一个有效描述（从后往前覆盖）
+        row_desc = pd.Series('', index=df.index)
+        for col in reversed(desc_cols):
+            desc = text_column(df, col)
+            valid = desc != ''
+            if skip_ground:
+                valid &= ~desc.str.contains('接地', regex=False)
+            row_desc = desc.where(valid, row_desc)
+
+        descriptions = {}
+        for col in self.columns['code_cols']:
+            codes = df[col].astype(str).str.strip()
+            has_desc = row_desc != ''
+            for code, desc in zip(codes[has_desc].tolist(), row_desc[has_desc].tolist()):
+                descriptions.setdefault(code, desc)
+        return descriptions
+
+    def __contains__(self, code):
+        return code in self.codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def is_ground(self, code):
+        return code in self._ground_set
+
+    def is_inline(self, code):
+        return code in self.inline_codes
+
+    def chinese_description(self, code):
+        """插件的中文描述（跳过含“接地”的描述），没有时为 ''"""
+        return self.chinese.get(code, '')
+
+    def english_description(self, code):
+        return self.english.get(code, '')
+
+    def get(self, code):
+        """短号的索引条目；短号不在插件清单和inline表中时返回None"""
+        if code not in self.codes and code not in self.inline_codes:
+            return None
+        return ConnectorEntry(code, self.chinese_description(code), self.english_description(code),
+                              self.is_ground(code), self.is_inline(code))
+
+
+_catalog_cache = OrderedDict()
+_catalog_lock = threading.Lock()
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_catalog(connlist_path, inline_path=None):
+    """读取插件清单（及inline表）建立索引；文件内容相同时直接返回已建好的索引"""
+    key = (_file_digest(connlist_path), _file_digest(inline_path) if inline_path else None)
+    with _catalog_lock:
+        catalog = _catalog_cache.get(key)
+        if catalog is not None:
+            _catalog_cache.move_to_end(key)
+            return catalog
+
+    connlist_df = strip_columns(pd.read_excel(connlist_path))
+    inline_codes = inline_codes_from_df(strip_columns(pd.read_excel(inline_path))) if inline_path else ()
+    catalog = ConnlistCatalog(connlist_df, inline_codes)
+
+    with _catalog_lock:
+        _catalog_cache[key] = catalog
+        while len(_catalog_cache) > CATALOG_CACHE_SIZE:
+            _catalog_cache.popitem(last=False)
+    return catalog
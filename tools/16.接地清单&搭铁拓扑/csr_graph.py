@@ -0,0 +1,199 @@
+"""
+接地拓扑用的轻量连接图（CSR邻接表）
+- 节点（"code:pin" 或只有 "code"）驻留为从0开始的整数编号，短号也驻留为整数编号
+- 建图时边只追加到两个int32数组，完成后转为CSR：节点i的邻居为 indices[indptr[i]:indptr[i+1]]
+- 连通分量用数组化的并查集（根标签取最小值挂接 + 指针跳跃压缩）一次标出，没有逐节点的Python循环
+- 每条边可带一个整数标记（接地清单中为产生该边的回路表行号），用于按配置筛选边后重新标注
+- 只提供接地清单处理需要的几个操作，不是通用图库
+
+用法:
+    builder = GraphBuilder()
+    a = builder.add_node('X1', '3')
+    b = builder.add_node('G101', '1')
+    builder.add_edge(a, b)
+    graph = builder.build()
+    labels = graph.connected_components()
+"""
+
+from array import array
+
+import numpy as np
+
+
+def label_components(num_nodes, src, dst):
+    """
+    数组化并查集：返回 节点编号 → 分量编号 数组
+    分量按其中最小的节点编号排序编号
+    """
+    labels = np.arange(num_nodes, dtype=np.int32)
+    while True:
+        # 每条边两端所在的根挂接到较小的根上
+        root_src, root_dst = labels[src], labels[dst]
+        smaller = np.minimum(root_src, root_dst)
+        hooked = labels.copy()
+        np.minimum.at(hooked, root_src, smaller)
+        np.minimum.at(hooked, root_dst, smaller)
+        # 指针跳跃，直到每个节点都直接指向根
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            break
+        labels = hooked
+
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels.astype(np.int32)
+
+
+def group_components(labels, num_components=None):
+    """
+    按分量分组节点编号，返回 (members, offsets)
+    分量c的节点为 members[offsets[c]:offsets[c+1]]（按编号排序）；没有节点的分量为空区间
+    """
+    if num_components is None:
+        num_components = int(labels.max()) + 1 if len(labels) else 0
+    members = np.argsort(labels, kind='stable').astype(np.int32)
+    offsets = np.zeros(num_components + 1, dtype=np.int64)
+    np.cumsum(np.bincount(labels, minlength=num_components), out=offsets[1:])
+    return members, offsets
+
+
+class GraphBuilder:
+    """逐边构建连接图，重复的节点名返回同一编号"""
+
+    def __init__(self):
+        self.node_ids = {}   # 节点名 → 节点编号
+        self.code_ids = {}   # 短号 → 短号编号
+        self.node_names = []
+        self.node_pins = []  # "code" 节点的pin为None
+        self.node_codes = array('i')
+        self.code_nodes = []  # 短号编号 → 该短号的节点编号（按加入顺序）
+        self._src = array('i')
+        self._dst = array('i')
+        self._tags = array('i')
+
+    def add_node(self, code, pin=None):
+        """加入节点 "code:pin"（pin为None时为 "code"），返回节点编号"""
+        name = code if pin is None else f"{code}:{pin}"
+        node = self.node_ids.get(name)
+        if node is not None:
+            return node
+
+        code_id = self.code_ids.get(code)
+        if code_id is None:
+            code_id = self.code_ids[code] = len(self.code_nodes)
+            self.code_nodes.append([])
+
+        node = self.node_ids[name] = len(self.node_names)
+        self.node_names.append(name)
+        self.node_pins.append(pin)
+        self.node_codes.append(code_id)
+        self.code_nodes[code_id].append(node)
+        return node
+
+    def add_edge(self, u, v, tag=-1):
+        self._src.append(u)
+        self._dst.append(v)
+        self._tags.append(tag)
+
+    def build(self):
+        return CSRGraph(self)
+
+
+class CSRGraph:
+    """无向图的CSR表示，建成后只读"""
+
+    def __init__(self, builder):
+        self.node_ids = builder.node_ids
+        self.code_ids = builder.code_ids
+        self.node_names = builder.node_names
+        self.node_pins = builder.node_pins
+        self.code_names = list(builder.code_ids)
+        self.node_codes = np.frombuffer(builder.node_codes, dtype=np.int32).copy()
+        self._code_nodes = builder.code_nodes
+
+        n = len(self.node_names)
+        self.src = np.frombuffer(builder._src, dtype=np.int32).copy()
+        self.dst = np.frombuffer(builder._dst, dtype=np.int32).copy()
+        self.edge_tags = np.frombuffer(builder._tags, dtype=np.int32).copy()
+
+        # 无向边两个方向都存，按起点排序得到CSR
+        heads = np.concatenate([self.src, self.dst])
+        tails = np.concatenate([self.dst, self.src])
+        order = np.argsort(heads, kind='stable')
+        self.indices = tails[order]
+        self.indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=n), out=self.indptr[1:])
+
+        self._labels = None
+        self._members = None
+        self._offsets = None
+
+    @property
+    def num_nodes(self):
+        return len(self.node_names)
+
+    @property
+    def num_edges(self):
+        return len(self.src)
+
+    @property
+    def nbytes(self):
+        """NumPy数组占用的字节数（不含节点名字符串）"""
+        arrays = [self.node_codes, self.src, self.dst, self.edge_tags, self.indices, self.indptr,
+                  self._labels, self._members, self._offsets]
+        return sum(a.nbytes for a in arrays if a is not None)
+
+    def node_id(self, name):
+        """节点名 → 节点编号，不存在时返回None"""
+        return self.node_ids.get(name)
+
+    def nodes_for_code(self, code):
+        """短号对应的所有节点编号（"code" 及 "code:pin"），按加入顺序"""
+        code_id = self.code_ids.get(code)
+        if code_id is None:
+            return []
+        return self._code_nodes[code_id]
+
+    def neighbors(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def bfs(self, start):
+        """从起始节点出发能到达的所有节点编号（按编号排序）"""
+        visited = np.zeros(self.num_nodes, dtype=bool)
+        visited[start] = True
+        frontier = np.array([start], dtype=np.int64)
+        while len(frontier):
+            starts = self.indptr[frontier]
+            counts = self.indptr[frontier + 1] - starts
+            # 把前沿所有节点的邻居区间一次取出
+            positions = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+            neighbors = self.indices[positions]
+            neighbors = np.unique(neighbors[~visited[neighbors]])
+            visited[neighbors] = True
+            frontier = neighbors
+        return np.flatnonzero(visited)
+
+    def connected_components(self):
+        """
+        连通分量标注，返回 节点编号 → 分量编号 数组
+        分量按其中最小的节点编号排序编号
+        """
+        if self._labels is not None:
+            return self._labels
+
+        self._labels = label_components(self.num_nodes, self.src, self.dst)
+        self._members, self._offsets = group_components(self._labels)
+        return self._labels
+
+    @property
+    def num_components(self):
+        self.connected_components()
+        return len(self._offsets) - 1
+
+    def component_nodes(self, component_id):
+        """分量中的节点编号（按编号排序）"""
+        self.connected_components()
+        return self._members[self._offsets[component_id]:self._offsets[component_id + 1]]
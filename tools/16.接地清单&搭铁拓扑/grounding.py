@@ -0,0 +1,424 @@
+"""
+接地清单处理（不依赖Flask，可作为库使用）
+- GroundingProcessor：读取回路表/插件清单/inline表，构建连接图，生成接地清单
+- 多个线束共用同一份插件清单和inline表时，可先建好 ConnlistCatalog 传入，共用的文件只解析一次
+- Web应用（app.py）和批量命令行（grounding_batch.py）都使用这里的实现
+
+用法:
+    from grounding import GroundingProcessor
+    processor = GroundingProcessor('WIRELIST.xlsx', 'Connlist.xlsx', 'inline.xlsx')
+    processor.grounding_list, processor.timings
+"""
+
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from connlist_catalog import ConnlistCatalog, inline_codes_from_df
+from config_table import read_config_table, wire_presence
+from csr_graph import GraphBuilder, group_components, label_components
+
+
+class ComponentView:
+    """
+    一次连通分量标注：节点编号 → 分量编号，分量 → 节点编号 / 分量中的接地短号
+    全部导线一份，按配置生成时每个配置一份
+    """
+    
+    def __init__(self, graph, labels, ground_codes, num_components=None):
+        self.node_component = labels
+        self.members, self.offsets = group_components(labels, num_components)
+        
+        # 只需看接地短号的节点：按短号找出接地节点，再归到各自分量
+        self.ground_codes = [set() for _ in range(len(self.offsets) - 1)]
+        for ground_code in ground_codes:
+            for node in graph.nodes_for_code(ground_code):
+                self.ground_codes[labels[node]].add(ground_code)
+    
+    def nodes(self, component_id):
+        """分量中的节点编号（按编号排序）"""
+        return self.members[self.offsets[component_id]:self.offsets[component_id + 1]]
+
+
+class GroundingProcessor:
+    """接地清单处理器"""
+    
+    def __init__(self, wirelist_path, connlist_path=None, inline_path=None, progress=None, catalog=None):
+        # progress(阶段名) 在每个阶段开始时调用；各阶段耗时记录在 self.timings
+        # catalog 为已建好的插件清单索引时不再读取插件清单和inline表
+        self.progress = progress or (lambda stage: None)
+        self.timings = {}
+        
+        with self._stage('读取文件'):
+            self.wirelist_df = pd.read_excel(wirelist_path)
+            self.connlist_df = pd.read_excel(connlist_path) if catalog is None else None
+            self.inline_df = pd.read_excel(inline_path) if catalog is None else None
+        
+        with self._stage('建立索引'):
+            # 获取列名（兼容不同的列名格式）
+            self._standardize_columns()
+            
+            # 回路表列名映射，以及 (短号, PIN) → 导线记录 索引（from端和to端都收录）
+            self.wire_columns = self._resolve_wirelist_columns()
+            self.wire_records, self.wire_index = self._build_wire_index()
+            
+            # 插件清单索引：短号 → 中英文描述、是否接地、是否inline（见 connlist_catalog.py）
+            if catalog is None:
+                catalog = ConnlistCatalog(self.connlist_df, inline_codes_from_df(self.inline_df))
+            self.catalog = catalog
+            self.conn_columns = self.catalog.columns
+            self.connlist_codes = self.catalog.codes
+        
+        with self._stage('识别接地/焊点/插件'):
+            # 接地短号及inline列表（插件清单索引中已识别）
+            self.ground_short_codes = self.catalog.ground_codes
+            self.inline_list = list(self.catalog.inline_codes)
+            
+            # 定义分类
+            self.weld_points = self._identify_weld_points()
+            self.connectors = self._identify_connectors()
+        
+        with self._stage('构建连接图'):
+            # 构建连接图
+            self.connection_graph = self._build_connection_graph()
+            
+            # 连通分量标注：节点 → 分量编号，分量 → 节点编号 / 接地短号
+            self.components = ComponentView(self.connection_graph, self.connection_graph.connected_components(),
+                                            self.ground_short_codes)
+        
+        with self._stage('生成接地清单'):
+            # 生成接地清单
+            self.grounding_list = self._generate_grounding_list()
+    
+    @contextmanager
+    def _stage(self, name):
+        """处理阶段：开始时通知进度，结束时记录耗时（秒）"""
+        self.progress(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(time.perf_counter() - start, 3)
+    
+    def _standardize_columns(self):
+        """标准化列名，去除空格"""
+        for df in [self.wirelist_df, self.connlist_df, self.inline_df]:
+            if df is None:
+                continue
+            df.columns = [col.strip() if isinstance(col, str) else col for col in df.columns]
+    
+    def _resolve_wirelist_columns(self):
+        """识别回路表中 from/to code、from/to pin、线径、option、wire id 所在的列"""
+        columns = dict.fromkeys(['from_code', 'to_code', 'from_pin', 'to_pin', 'wire_size', 'option', 'wire_id'])
+        for col in self.wirelist_df.columns:
+            col_lower = str(col).lower()
+            if 'from code' in col_lower or 'fromcode' in col_lower:
+                columns['from_code'] = col
+            elif 'to code' in col_lower or 'tocode' in col_lower:
+                columns['to_code'] = col
+            elif 'from pin' in col_lower or 'frompin' in col_lower:
+                columns['from_pin'] = col
+            elif 'to pin' in col_lower or 'topin' in col_lower:
+                columns['to_pin'] = col
+            elif 'wire' in col_lower and 'size' in col_lower:
+                columns['wire_size'] = col
+            elif 'option' in col_lower:
+                columns['option'] = col
+            elif 'wire' in col_lower and 'id' in col_lower:
+                columns['wire_id'] = col
+        return columns
+    
+    def _text_column(self, df, col):
+        """整列转为去空格的字符串，空值为 ''；列不存在时返回全空列"""
+        if col is None:
+            return pd.Series([''] * len(df), index=df.index)
+        values = df[col]
+        return values.where(values.notna(), '').astype(str).str.strip()
+    
+    def _build_wire_index(self):
+        """
+        构建 (短号, PIN) → 导线记录 的索引，回路表只遍历一次
+        返回 (导线记录列表, 索引)；索引值为记录序号列表，按回路表行顺序排列
+        每条记录为 {'wire_id', 'wire_size', 'option'}
+        """
+        cols = self.wire_columns
+        if not all([cols['from_code'], cols['to_code'], cols['from_pin'], cols['to_pin']]):
+            return [], {}
+        
+        df = self.wirelist_df
+        from_codes = self._text_column(df, cols['from_code']).tolist()
+        from_pins = self._text_column(df, cols['from_pin']).tolist()
+        to_codes = self._text_column(df, cols['to_code']).tolist()
+        to_pins = self._text_column(df, cols['to_pin']).tolist()
+        wire_ids = self._text_column(df, cols['wire_id']).tolist()
+        wire_sizes = self._text_column(df, cols['wire_size']).tolist()
+        options = self._text_column(df, cols['option']).tolist()
+        
+        records = []
+        index = {}
+        for i in range(len(df)):
+            record_id = len(records)
+            records.append({'wire_id': wire_ids[i], 'wire_size': wire_sizes[i], 'option': options[i]})
+            from_key = (from_codes[i], from_pins[i])
+            to_key = (to_codes[i], to_pins[i])
+            index.setdefault(from_key, []).append(record_id)
+            if to_key != from_key:
+                index.setdefault(to_key, []).append(record_id)
+        
+        return records, index
+    
+    def find_wires(self, code, pin):
+        """返回接在 code 的 pin 上的所有导线记录（按回路表行顺序）"""
+        return [self.wire_records[i] for i in self.wire_index.get((code, pin), ())]
+    
+    def _identify_weld_points(self):
+        """识别焊点：pin为X，且对应的code不在connlist中"""
+        cols = self.wire_columns
+        if cols['from_pin'] is None or cols['to_pin'] is None:
+            return []
+        
+        df = self.wirelist_df
+        weld_points = set()
+        for pin_col, code_col in [(cols['from_pin'], cols['from_code']), (cols['to_pin'], cols['to_code'])]:
+            if code_col is None:
+                continue
+            codes = self._text_column(df, code_col)[self._text_column(df, pin_col) == 'X']
+            weld_points.update(codes[(codes != '') & ~codes.isin(self.connlist_codes)])
+        
+        return list(weld_points)
+    
+    def _identify_connectors(self):
+        """识别插件（除去接地和inline）"""
+        ground_set = set(self.ground_short_codes)
+        inline_set = set(self.inline_list)
+        
+        connectors = [code for code in self.connlist_codes if code and code not in ground_set and code not in inline_set]
+        return connectors
+    
+    def _build_connection_graph(self):
+        """
+        构建连接图（CSR邻接表，见 csr_graph.py）
+        节点为 "code:pin" 和不带pin的 "code"，图中同时记录 短号 → 节点 的索引
+        """
+        builder = GraphBuilder()
+        
+        # 获取列名映射
+        cols = self.wire_columns
+        if not all([cols['from_code'], cols['to_code'], cols['from_pin'], cols['to_pin']]):
+            return builder.build()
+        
+        df = self.wirelist_df
+        from_codes = self._text_column(df, cols['from_code']).tolist()
+        to_codes = self._text_column(df, cols['to_code']).tolist()
+        from_pins = self._text_column(df, cols['from_pin']).tolist()
+        to_pins = self._text_column(df, cols['to_pin']).tolist()
+        
+        weld_set = set(self.weld_points)
+        inline_set = set(self.inline_list)
+        add_node = builder.add_node
+        add_edge = builder.add_edge
+        
+        # 遍历wirelist，添加连接关系（每条边记下回路表行号，按配置生成时据此筛选）
+        for row, (from_code, to_code, from_pin, to_pin) in enumerate(zip(from_codes, to_codes, from_pins, to_pins)):
+            if not from_code or not to_code:
+                continue
+            
+            # 添加节点和边
+            node1 = add_node(from_code, from_pin)
+            node2 = add_node(to_code, to_pin)
+            add_edge(node1, node2, row)
+            
+            # 添加不带pin的节点（用于焊点和inline连接）
+            code1 = add_node(from_code)
+            code2 = add_node(to_code)
+            
+            # 如果是焊点，连接焊点到具体节点
+            if from_code in weld_set:
+                add_edge(code1, node1, row)
+            if to_code in weld_set:
+                add_edge(code2, node2, row)
+            
+            # 如果是inline，连接inline两端
+            if from_code in inline_set and to_code in inline_set:
+                add_edge(code1, code2, row)
+        
+        return builder.build()
+    
+    def nodes_for_code(self, code):
+        """短号对应的所有图节点编号（"code" 及 "code:pin"），精确匹配短号"""
+        return self.connection_graph.nodes_for_code(code)
+    
+    def ground_components(self, ground_code, view=None):
+        """
+        接地短号所有节点所在的连通分量编号（按节点加入图的顺序，去重）
+        通过 短号 → 节点 索引精确查找，G1 不会匹配到 G10:3
+        """
+        node_component = (view or self.components).node_component
+        component_ids = {}
+        for node in self.nodes_for_code(ground_code):
+            component_ids[int(node_component[node])] = None
+        return list(component_ids)
+    
+    def _get_connected_components(self, start_node):
+        """获取与起始节点（"code:pin" 或 "code"）相连的所有节点名"""
+        graph = self.connection_graph
+        node = graph.node_id(start_node)
+        if node is None:
+            return []
+        return [graph.node_names[i] for i in self.components.nodes(self.components.node_component[node])]
+
+    def grounding_type(self, ground_code, view=None):
+        """
+        判断接地类型：单根回路 或 多根汇流
+        逻辑：
+        1. 找到该接地短号（所有pin）所在的连通分量。
+        2. 检查该连通分量中有多少个接地短号。
+        3. 如果只有1个接地短号，说明它是独立接地点 -> 单根回路。
+        4. 如果有多个接地短号，说明它们汇流在一起 -> 多根汇流。
+        分量及其中的接地短号已在 ComponentView 中预先算好，这里只做查表
+        """
+        view = view or self.components
+        component_ids = self.ground_components(ground_code, view)
+        if not component_ids:
+            return "未知类型"
+        
+        ground_codes = set()
+        for component_id in component_ids:
+            ground_codes.update(view.ground_codes[component_id])
+        ground_count = len(ground_codes)
+        if ground_count == 1:
+            # 只有一个接地点，这是典型的单根回路结构
+            return "单根回路"
+        elif ground_count > 1:
+            # 有多个接地点连在一起，这是多根汇流结构
+            return "多根汇流"
+        else:
+            return "未知类型"
+    
+    def _get_wire_info(self, code, pin, wire_present=None):
+        """
+        获取线径和option信息（回路表中第一根接在该pin上的导线）
+        wire_present 为按回路表行的布尔数组时，只看该配置中存在的导线
+        """
+        record_ids = self.wire_index.get((code, pin))
+        if not record_ids:
+            return '', ''
+        if wire_present is not None:
+            record_ids = [i for i in record_ids if wire_present[i]]
+            if not record_ids:
+                return '', ''
+        record = self.wire_records[record_ids[0]]
+        return record['wire_size'], record['option']
+    
+    def _generate_grounding_list(self, view=None, wire_present=None):
+        """生成接地清单；view/wire_present 为某个配置的分量标注和导线存在情况，默认为全部导线"""
+        view = view or self.components
+        grounding_data = []
+        inline_set = set(self.inline_list)
+        connector_set = set(self.connectors)
+        graph = self.connection_graph
+        node_pins = graph.node_pins
+        node_codes = graph.node_codes.tolist()
+        code_names = graph.code_names
+        
+        for ground_code in self.ground_short_codes:
+            # 获取与接地相连的所有节点（查预先标注好的连通分量）
+            connected_nodes = []
+            for component_id in self.ground_components(ground_code, view):
+                connected_nodes.extend(view.nodes(component_id).tolist())
+            
+            # 判断接地类型（单根回路 vs 多根汇流）
+            grounding_type = self.grounding_type(ground_code, view)
+            
+            # 提取非接地、非inline的插件及其pin（只看带pin的节点）
+            connector_info = {}
+            for node in connected_nodes:
+                pin = node_pins[node]
+                if pin is None:
+                    continue
+                code = code_names[node_codes[node]]
+                # 跳过接地节点和inline节点（按短号精确比较）
+                if code == ground_code or code in inline_set:
+                    continue
+                
+                # 检查是否是插件
+                if code in connector_set:
+                    if code not in connector_info:
+                        connector_info[code] = []
+                    connector_info[code].append(pin)
+            
+            # 为每个连接的插件生成记录
+            for code, pins in connector_info.items():
+                chinese_desc = self.catalog.chinese_description(code)
+                
+                for pin in pins:
+                    wire_size, option = self._get_wire_info(code, pin, wire_present)
+                    
+                    grounding_data.append({
+                        '接地短号': ground_code,
+                        '插件短号': code,
+                        '中文描述': chinese_desc,
+                        '插件PIN': pin,
+                        '线径': wire_size,
+                        'Option': option,
+                        '搭铁类型': grounding_type  # 新增字段
+                    })
+        
+        return grounding_data
+    
+    def _configuration_views(self, presence):
+        """
+        按配置逐个产出 (配置序号, 分量标注)
+        presence 为 导线 × 配置 存在矩阵。增量计算：
+        - 所有配置中都存在的导线产生的边不变，只含这种边的分量在每个配置中都与全部导线时相同，直接沿用
+        - 含有随配置变化的边的分量，每个配置只在这些分量的节点上、用该配置存在的边重新标注
+        - 这些边的存在情况完全相同的配置共用同一次标注
+        """
+        graph = self.connection_graph
+        base_labels = self.components.node_component
+        base_count = len(self.components.offsets) - 1
+        edge_present = presence[graph.edge_tags]
+        
+        # 受配置影响的分量及其节点/边，节点重新编号为局部编号
+        variable_edges = ~edge_present.all(axis=1)
+        affected_components = np.unique(base_labels[graph.src[variable_edges]])
+        affected_nodes = np.flatnonzero(np.isin(base_labels, affected_components))
+        local_id = np.full(graph.num_nodes, -1, dtype=np.int32)
+        local_id[affected_nodes] = np.arange(len(affected_nodes), dtype=np.int32)
+        affected_edges = np.flatnonzero(local_id[graph.src] >= 0)
+        local_src = local_id[graph.src[affected_edges]]
+        local_dst = local_id[graph.dst[affected_edges]]
+        affected_present = edge_present[affected_edges]
+        
+        views = {}
+        for version_idx in range(presence.shape[1]):
+            present = affected_present[:, version_idx]
+            signature = np.packbits(present).tobytes()
+            view = views.get(signature)
+            if view is None:
+                local_labels = label_components(len(affected_nodes), local_src[present], local_dst[present])
+                # 受影响的分量换成新的分量编号（接在原编号之后），原编号留空
+                labels = base_labels.copy()
+                labels[affected_nodes] = base_count + local_labels
+                view = views[signature] = ComponentView(
+                    graph, labels, self.ground_short_codes,
+                    base_count + (int(local_labels.max()) + 1 if len(local_labels) else 0))
+            yield version_idx, view
+    
+    def generate_configuration_lists(self, config_path):
+        """
+        按配置表中的每个配置（版本）生成接地清单
+        返回 {配置名: 接地清单}，清单格式与 self.grounding_list 相同
+        """
+        with self._stage('按配置生成'):
+            matrix = read_config_table(config_path)
+            option_values = self._text_column(self.wirelist_df, self.wire_columns['option']).tolist()
+            presence = wire_presence(option_values, matrix)
+            
+            configuration_lists = {}
+            for version_idx, view in self._configuration_views(presence):
+                configuration_lists[matrix.versions[version_idx]] = self._generate_grounding_list(
+                    view, presence[:, version_idx])
+        return configuration_lists
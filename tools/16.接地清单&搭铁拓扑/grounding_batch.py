@@ -0,0 +1,203 @@
+"""
+接地清单批量生成（命令行）
+- 项目目录中文件名含 connlist 的xlsx为插件清单，含 inline 的为inline表，其余xlsx都视为各线束的回路表
+- 插件清单和inline表只解析一次（建成插件清单索引后传给各子进程），各线束回路表在进程池中并行处理
+- 输出一个汇总工作簿：汇总sheet（各线束接地回路数、搭铁类型统计、各阶段耗时）、
+  全部线束合并的接地清单，以及每个线束一个sheet
+- 每个线束完成时打印各阶段耗时，最后打印汇总
+
+用法:
+    python grounding_batch.py 项目目录 [-o 输出.xlsx] [-j 进程数] [--connlist 文件] [--inline 文件]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from connlist_catalog import load_catalog
+from grounding import GroundingProcessor
+
+OUTPUT_NAME = "接地清单汇总.xlsx"
+SUMMARY_SHEET = "汇总"
+COMBINED_SHEET = "全部接地清单"
+STAGES = ('读取文件', '建立索引', '识别接地/焊点/插件', '构建连接图', '生成接地清单')
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+
+# 子进程中共用的插件清单索引（进程启动时传入一次）
+_catalog = None
+
+
+def discover_inputs(folder, connlist=None, inline=None, output=None):
+    """
+    查找插件清单、inline表和各线束回路表
+    返回 (插件清单路径, inline表路径, 回路表路径列表, 错误说明)；有错误时前三项可能为None/空
+    """
+    xlsx_files = sorted(
+        os.path.join(folder, name) for name in os.listdir(folder)
+        if name.lower().endswith(('.xlsx', '.xls')) and not name.startswith('~$')
+    )
+    if output:
+        xlsx_files = [path for path in xlsx_files if os.path.abspath(path) != os.path.abspath(output)]
+
+    def pick(keyword, given):
+        if given:
+            return given, None
+        matches = [path for path in xlsx_files if keyword in os.path.basename(path).lower()]
+        if len(matches) != 1:
+            found = [os.path.basename(path) for path in matches]
+            return None, f"需要且只能有一个文件名含 {keyword} 的文件，找到 {found}，可用 --{keyword} 指定"
+        return matches[0], None
+
+    connlist_path, error = pick('connlist', connlist)
+    if error:
+        return None, None, [], error
+    inline_path, error = pick('inline', inline)
+    if error:
+        return None, None, [], error
+
+    shared = {os.path.abspath(connlist_path), os.path.abspath(inline_path)}
+    wirelists = [path for path in xlsx_files
+                 if os.path.abspath(path) not in shared and OUTPUT_NAME not in os.path.basename(path)]
+    return connlist_path, inline_path, wirelists, None
+
+
+def _init_worker(catalog):
+    global _catalog
+    _catalog = catalog
+
+
+def _run_one(wirelist_path):
+    """子进程入口：用共用的插件清单索引处理一个线束"""
+    start = time.perf_counter()
+    processor = GroundingProcessor(wirelist_path, catalog=_catalog)
+    timings = dict(processor.timings)
+    timings['总计'] = round(time.perf_counter() - start, 3)
+    return {
+        'grounding_list': processor.grounding_list,
+        'ground_points': len(processor.ground_short_codes),
+        'timings': timings,
+    }
+
+
+def _format_timings(timings):
+    parts = [f"{stage}={timings[stage]:.2f}s" for stage in STAGES if stage in timings]
+    return " ".join(parts) + f" 总计={timings['总计']:.2f}s"
+
+
+def harness_summary(name, wirelist_path, result):
+    """汇总sheet中一个线束的一行"""
+    row = {'线束': name, '回路表文件': os.path.basename(wirelist_path)}
+    if 'error' in result:
+        row['状态'] = f"失败: {result['error']}"
+        return row
+
+    grounding_list = result['grounding_list']
+    ground_types = {item['接地短号']: item['搭铁类型'] for item in grounding_list}
+    types = list(ground_types.values())
+    row.update({
+        '状态': '完成',
+        '接地回路数': len(grounding_list),
+        '有回路的接地点数': len(ground_types),
+        '单根回路': types.count('单根回路'),
+        '多根汇流': types.count('多根汇流'),
+    })
+    for stage in STAGES + ('总计',):
+        row[f"{stage}(s)"] = result['timings'].get(stage)
+    return row
+
+
+def sheet_names_for(names):
+    """线束名 → 合法且不重复的sheet名（最长31字符，去掉非法字符）"""
+    used = {SUMMARY_SHEET, COMBINED_SHEET}
+    result = {}
+    for name in names:
+        base = INVALID_SHEET_CHARS.sub('_', name)[:31] or 'Sheet'
+        sheet = base
+        suffix = 2
+        while sheet in used:
+            tail = f"_{suffix}"
+            sheet = base[:31 - len(tail)] + tail
+            suffix += 1
+        used.add(sheet)
+        result[name] = sheet
+    return result
+
+
+def write_workbook(output, harnesses, results):
+    """harnesses: [(线束名, 回路表路径)]，results: 线束名 → 结果"""
+    summary = [harness_summary(name, path, results[name]) for name, path in harnesses]
+    combined = [{'线束': name, **item} for name, _ in harnesses
+                for item in results[name].get('grounding_list', ())]
+    sheets = sheet_names_for([name for name, _ in harnesses])
+
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        pd.DataFrame(summary).to_excel(writer, sheet_name=SUMMARY_SHEET, index=False)
+        pd.DataFrame(combined).to_excel(writer, sheet_name=COMBINED_SHEET, index=False)
+        for name, _ in harnesses:
+            pd.DataFrame(results[name].get('grounding_list', [])).to_excel(
+                writer, sheet_name=sheets[name], index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="接地清单批量生成")
+    parser.add_argument("folder", help="项目目录（各线束回路表 + 共用的插件清单和inline表）")
+    parser.add_argument("-o", "--output", help=f"输出工作簿（默认 项目目录/{OUTPUT_NAME}）")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="并行进程数（默认CPU核数）")
+    parser.add_argument("--connlist", help="插件清单文件（默认按文件名查找）")
+    parser.add_argument("--inline", help="inline表文件（默认按文件名查找）")
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.join(args.folder, OUTPUT_NAME)
+    connlist_path, inline_path, wirelists, error = discover_inputs(
+        args.folder, args.connlist, args.inline, output)
+    if error:
+        print(error)
+        return 1
+    if not wirelists:
+        print("没有找到线束回路表")
+        return 1
+
+    start = time.perf_counter()
+    catalog = load_catalog(connlist_path, inline_path)
+    print(f"插件清单 {os.path.basename(connlist_path)}、inline表 {os.path.basename(inline_path)}: "
+          f"{len(catalog)} 个短号，{len(catalog.ground_codes)} 个接地点，"
+          f"用时 {time.perf_counter() - start:.2f}s")
+
+    harnesses = [(os.path.splitext(os.path.basename(path))[0], path) for path in wirelists]
+    workers = max(1, min(args.workers, len(harnesses)))
+    print(f"共 {len(harnesses)} 个线束，{workers} 个进程")
+
+    results = {}
+    failed = 0
+    busy = 0.0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(catalog,)) as pool:
+        futures = {pool.submit(_run_one, path): name for name, path in harnesses}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                results[name] = {'error': str(e)}
+                print(f"[失败] {name}: {e}")
+                continue
+
+            results[name] = result
+            busy += result['timings']['总计']
+            print(f"[完成] {name}: {len(result['grounding_list'])} 条接地回路, {_format_timings(result['timings'])}")
+
+    write_workbook(output, harnesses, results)
+    elapsed = time.perf_counter() - start
+    print(f"汇总: 成功 {len(harnesses) - failed}/{len(harnesses)}, 墙钟 {elapsed:.2f}s, "
+          f"累计线束耗时 {busy:.2f}s → {output}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
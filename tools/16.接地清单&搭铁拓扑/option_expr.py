@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""
+Option表达式编译器
+- 词法分析 → AST → 闭包求值，同一表达式只解析一次
+- 按归一化后的表达式文本做LRU缓存，跨零件号、跨回路复用编译结果
+- 语义与原 _calculate_option 一致：& 与 / 同级、从左到右结合，- 对紧随的配置或括号取反
+  （原实现对单个配置前的 - 漏了取反，这里一并修正）
+- ALL 表示所有配置，解析为常量真（-ALL 为假）；空表达式求值为假，
+  空Option的导线是否在所有配置中存在由调用方决定（工具16的接地清单视为存在）
+- 工具16（接地清单&搭铁拓扑）中有本文件逐字节相同的副本：只在这里修改，改完整个文件复制过去
+
+用法:
+    compiled = compile_option('(LC02/LC20)&-AB1')
+    compiled.evaluate({'LC02', 'MB05'})  # -> True
+    compiled.evaluate_matrix(matrix)  # -> 矩阵每列（零件号/配置）一个布尔值
+"""
+
+import re
+from functools import lru_cache
+
+TOKEN_PATTERN = re.compile(r'([&/\-()])')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+OPERATORS = ('&', '/')
+ALWAYS_TOKEN = 'ALL'  # 表示所有配置
+
+# 编译缓存容量：一个项目的WIRE表/回路表通常只有几百个不同的option
+CACHE_SIZE = 4096
+
+
+def normalize_option(expression):
+    """归一化option文本：去空白、转大写；空值/NaN返回空串"""
+    if expression is None:
+        return ''
+    if isinstance(expression, float) and expression != expression:
+        return ''
+    text = WHITESPACE_PATTERN.sub('', str(expression)).upper()
+    if text == 'NAN':
+        return ''
+    return text
+
+
+def _operand(token):
+    """配置名 → AST叶子节点（ALL 为常量真）"""
+    return ('const', True) if token == ALWAYS_TOKEN else ('var', token)
+
+
+def tokenize(text):
+    """把归一化后的表达式切分为token列表"""
+    return [t for t in TOKEN_PATTERN.split(text) if t]
+
+
+class _Parser:
+    """
+    递归下降解析器，输出元组形式的AST:
+        ('var', name) / ('not', node) / ('and', a, b) / ('or', a, b) / ('const', bool)
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self):
+        node = self._parse_sequence()
+        return node if node is not None else ('const', False)
+
+    def _peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _parse_group(self):
+        """解析 '(' 之后的内容，并吃掉对应的 ')'（缺失时视为到结尾闭合）"""
+        self.pos += 1
+        node = self._parse_sequence()
+        if self._peek() == ')':
+            self.pos += 1
+        return node
+
+    def _parse_sequence(self):
+        result = None
+        current_op = None
+
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+
+            if token == ')':
+                break
+            if token in OPERATORS:
+                # 开头或连续出现的运算符直接跳过
+                self.pos += 1
+                continue
+
+            if token == '(':
+                value = self._parse_group()
+                if value is None:
+                    value = ('const', False)
+            elif token == '-':
+                self.pos += 1
+                operand = self._peek()
+                if operand is None:
+                    break
+                if operand == '(':
+                    inner = self._parse_group()
+                    value = ('not', inner) if inner is not None else ('const', False)
+                elif operand in OPERATORS or operand == ')':
+                    value = ('const', False)
+                else:
+                    value = ('not', _operand(operand))
+                    self.pos += 1
+            else:
+                value = _operand(token)
+                self.pos += 1
+
+            if result is None:
+                result = value
+            elif current_op == '&':
+                result = ('and', result, value)
+            elif current_op == '/':
+                result = ('or', result, value)
+
+            operator = self._peek()
+            if operator in OPERATORS:
+                current_op = operator
+                self.pos += 1
+
+        return result
+
+
+def parse_option(text):
+    """把归一化后的表达式解析为AST"""
+    return _Parser(tokenize(text)).parse()
+
+
+def _compile_scalar(node):
+    """把AST编译为 configs -> bool 的闭包（configs 为集合）"""
+    kind = node[0]
+
+    if kind == 'var':
+        name = node[1]
+        return lambda configs: name in configs
+
+    if kind == 'not':
+        operand = _compile_scalar(node[1])
+        return lambda configs: not operand(configs)
+
+    if kind == 'and':
+        left = _compile_scalar(node[1])
+        right = _compile_scalar(node[2])
+        return lambda configs: left(configs) and right(configs)
+
+    if kind == 'or':
+        left = _compile_scalar(node[1])
+        right = _compile_scalar(node[2])
+        return lambda configs: left(configs) or right(configs)
+
+    constant = bool(node[1])
+    return lambda configs: constant
+
+
+def _compile_vector(node):
+    """
+    把AST编译为 matrix -> 布尔向量 的闭包
+    matrix 需提供 column(name) 与 constant(value)，见 xdot_matrix.ConfigMatrix（工具16为 config_table.VersionMatrix）
+    """
+    kind = node[0]
+
+    if kind == 'var':
+        name = node[1]
+        return lambda matrix: matrix.column(name)
+
+    if kind == 'not':
+        operand = _compile_vector(node[1])
+        return lambda matrix: ~operand(matrix)
+
+    if kind == 'and':
+        left = _compile_vector(node[1])
+        right = _compile_vector(node[2])
+        return lambda matrix: left(matrix) & right(matrix)
+
+    if kind == 'or':
+        left = _compile_vector(node[1])
+        right = _compile_vector(node[2])
+        return lambda matrix: left(matrix) | right(matrix)
+
+    constant = bool(node[1])
+    return lambda matrix: matrix.constant(constant)
+
+
+def _collect_variables(node, names):
+    kind = node[0]
+    if kind == 'var':
+        names.add(node[1])
+    elif kind == 'not':
+        _collect_variables(node[1], names)
+    elif kind in ('and', 'or'):
+        _collect_variables(node[1], names)
+        _collect_variables(node[2], names)
+    return names
+
+
+class CompiledOption:
+    """编译后的option表达式"""
+
+    __slots__ = ('text', 'ast', 'variables', '_scalar', '_vector')
+
+    def __init__(self, text, ast):
+        self.text = text
+        self.ast = ast
+        self.variables = frozenset(_collect_variables(ast, set()))
+        self._scalar = _compile_scalar(ast)
+        self._vector = None
+
+    def evaluate(self, configs):
+        """判断一组车型配置是否满足该option（configs 建议传 set/frozenset）"""
+        return self._scalar(configs)
+
+    def evaluate_matrix(self, matrix):
+        """对矩阵的所有列（工具35为零件号，工具16为配置）一次性求值，返回长度为列数的布尔向量"""
+        if self._vector is None:
+            self._vector = _compile_vector(self.ast)
+        return self._vector(matrix)
+
+    def __repr__(self):
+        return f"CompiledOption({self.text!r})"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_normalized(text):
+    return CompiledOption(text, parse_option(text))
+
+
+def compile_option(expression):
+    """编译option表达式（带LRU缓存，缓存键为归一化后的文本）"""
+    return _compile_normalized(normalize_option(expression))
+
+
+def cache_info():
+    """返回编译缓存命中统计"""
+    return _compile_normalized.cache_info()
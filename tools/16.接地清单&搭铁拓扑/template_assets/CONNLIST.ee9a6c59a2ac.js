@@ -0,0 +1 @@
+registerTemplateAsset('CONNLIST', 'H4sIAAAAAAACA3R5BVhUUde1SoxIl3Q30iApDDB0SLeEdJeEtIDSzSApNQylgEgJEiIgqXSndHcMOf8F3/y+759ngDvznHN3rLX3XueiroyC+uje7Sv8+aLkvf94YQA/li4W6u4urq+41YFlRMAXD++WMS1ozdvev3cv78G9e3j/ueylqyvXayfHD0n9Sm2SpO17IXt4p3PMZXAFRc128Gt8v2ITq1l/O5Kk2c+XZIZ7hvj+KFIysmomvvvqF4JjtS5/CoMzIlhcqsSq2lzMZk9p4z4RQVc1XxfoekaghXS/ic6Wf94ASnEytyugz00kWkiksx06FRKaiUvCYF3O5dSiq5a/iFDsrX26BVHxHJ34IZynzSv7SlvcKIzO5jPLpCzWg52GJQEnUtqIeyFKX7gYfSyedCDfoydZ+V9Ui6lgfd7bZVRsJ5OtGgIvqihyQqpPQVj041wZu3QDjv7h7vAAoQ7dR1jwLwItAkdb7aJF5F8M4wu03dgHRmwqrz4PaeRrnFfFp/ZvXC8e/KqJzZkvs+Q1HGn8I6R7n6Gn9RPtGo9c+ude3gcBlF7FP8BvKGQXiCFxmUvbSnT05Qefdkcyn5fV6sgYQ/qz5U2XhqJqahobMtXmSSrUegd3clzWlrr9D3m+1Qt2m+dWr4+jX665nM//NypEda9/WwKoOACo4P8nKhYu7la3sAQkSSm38ZCG7YUg85bnmHfkPPO2JK1YQCGEHUYKzb/Mk98zNuystuA9i2RRgwyEttju2qTVTs+oP1v1m9/7EwBOOi7kO9uVyvykbkyEjuqT+5qO7+lufvTLebBMdqUKxnuSRw226OgnQ9dNb1OhJOS/PTRCaslI+xOheY3b+RQOylGVf4Ro0zGyICJu2rbdn/w2ebnIWqwsvuPT8b43Szd7/+fReioFvSEd2jxtr9iH8XutvMu0UgahbbTtYBNMwwwwib1VLxu/2BPjIp0Zp9qF2K9uaqq1vM+Zk82GSi2+XtE1k2dlj+tcq+jULb4ZknHtecpjtO5xcLPIuZaDMZehc9abXonivamBvmj7PlD8F4kLTXTn2spW6N6VM2dri1PcCxK7fdpnJLGCsmM9VlsIywl5O5n8WjXDQCJcxXA5J6UuzxRzm5aoKaxl9l5k+wRLHo1X2PIbOSqlRc5F8oSxeu8W+Qvs/4aEkG9g2wyA5B7KvXuE/wWJ5ysPF6dbUGqSTNVCeYg65lWvcAr2JNk8YtD00WPabfPTX1UUSk8qKCnbpnP93HMme772MWjO95XL7/PZacLfpuTW23YsDq0MC/p4pFCS/E/ngg9wt2ayHkDYfyj/QC3CF1bHWD1YkX09Hvneq7RwaIDghZxZkbZYlZPBti2kAD79wpt98KnMxpfpqfzSzRDr/HWKnpRY2qwJWe4U275TLZwY36qmixJLtqjg585j4bpLP/+EI1qLyXVS8V//cs2wIjUn5Awd8chNTgumQDBnSUcQQFdbzc/RY7xI5b4vFAx+NIVTlNXo8Y9JKI92pMfPznQGE36NJGF8fZ/QZeO5ety12SON0/XcgRty3B3Cn9zBM4QDJ9dlc1XbmCnHT58IVV/+DKeVKwzluC55fMg8gSQh34uxlu3Gy6Jwx2siN8h+a+Ymm1Ygf2ZxbpP6nWUP+jnfRmYDr8JXTn5rKvrPoDb4N+cOHaWFx5K3+v+3wd1++xcHfSfH/9Hh4o/S0fj+0eEI/2udnYeVE+8tcPAkUyUUXrzwebQ9vMNda28HZc5vRjJEjySIavqVG8S8UCYtu7HK5lrFjqnnis5cL8JLcd9F4QajWjdfNSt+OTBy6CB4QL7nni5TSbTAbkpR17WyvfLHnhUtyaumdk6Ka/7+ytevjV3VNYGephQZdKitROH1jhGilGw1IT7VmzylWQ807bKwdD7GJl82DOYlYVba546SnuNQ8psE2D494OUg8rrvEYt9r+Y92cHCd1uB5zNDuelGaejz4nZ1C5aVHF8+z0qQM1Zu+TFrVUGJ/NGkuuBE2eQPp7u0Hpa1Np3eZx7FkL5w+XEy+ZZ++CWJqyYmn+Wk49FBvUHFMB8VtImPM/lL/0eWjt+ncUUyN9PYLh8f4QVt3m8ZGtthFK5/uf0mDwsppktVFGjuf121IlJwcVIZ9T9SnPWb9vIY+PQOSDPp/0rxXZnc5TkgodW+jQdPZu/dTejkN85JRjdyc5DQc9rxIeny0sY4tPeW1e7Dmhd7KbziBeFZ7yetrKm/zQZsSlxIyvdkPBh6C3krNyWXrnzfpaLzNTa+z0vyQaNQNH+61nJ//wnBaru3JMtlbcnyVO/ePTrSJtlv+vT+Sfa4Gq/piEFjMa7di51zuvLDZ/1xzwLm1jZwZfKm35Ky5x4FTvDIfYFwslaiZLg6lg3/AG1w9dWWJekbidgLZFtlVaRRQpoktqh7Im28WsyU69ylKT5kGLGOvDgQr8eBKrS5RimNq2BavZk9mC2CtebZFkOOG3L+3BBMgr8ozvuXX6H9/0kLNJJ7r/+y9f9egPN3gbeLu8MrWysrj/85u4u43HSNDu7ds7dFv0v7f6+9+3OX9qxr42T+7sSCyLmKrnNcaIMp3wF2dULTUKR/Io07l5xX/259+Us9Na2wjkVdHSGb0/EK+l8zbao6DAzqrzRc4o+CfSRHf82IL+CfdyJ3gq4Q4/PXa7hg5GFqzs1p0Z5gS9DFrjf4aqcffL1lenM6f3M8izxHfruuWNsLPOutmEfumLYgt9SCLv+ozV/30wSe7wZdriH7kYedQVfHR0HIlfkgxJ/xebof84Hnw97Im62KIGQR+OpPKhh5iQsORPbuBV1c4ga1IQ9dwNdXS2cti8jLo6DLNu4g5Hn4HvLkCAK+OcGdLipaogm8uuEOuuSivxrudzC/OnZBngI32T8czkEuddLcnDqgnp+HtwQin5QjU4OQvfNBdoM3nS3lUWcV4CAkrv+4l3gbU3M7cmjJ6dQ9AHyz0g9GHveqIU+39pBXw/FBEcrDLj7nbXD/fhokR3CMPuAb4H58C7Li4ZW3fz3yIrXlZmUceX7uOY12vb9FtEaDRHTuIQ/OTAORay0rOlgPnJ7fhroVdHW4pQZu9kdunc1fH9GAqRDcYOSfHCSiIig4ynsr6OwIFwlk9sbqSI0ms2hnQ+xKLWcAeZJKc3PQux+E3B3fQ24hD9pMgxBHFeCrJ3K93i3f4kOQF8NqyGucZtgGxh/kzfV8IGIWiQDfxD25Gfb+BkABPkKi3gA4IJE3+y4tJkGILVPk8Wzv6bf5AOSaKfIwB3xF4r8IYDSeE9jx9GYv6NwFAGMt7ZLYCXl6pIbsxw26bMzud3YrOXNwQJ7t7QZcb4i9jY1PR3Lmz/lxahwmw/u/pjV+ZSgHzGuvrLxGLtM00C4hZ9vrA3COkIdHezcn4UGXN+Cbi62TopYbJPKwouXmMqf529XNV3H/8SnkWc7NwWnbNYV00/XeAZj2MCfo4smPhZaWywPuM8orgGSBSLD07MNKMPLm9Zwqcq/8N/LqSfMZ9aOb8+HJbcfkA3qCm/F+BcQZDb7dq5vr1cCn5z4eJx2dL2fXOg9cAv2Dzq+ncPeO2hBC4EaIy8cLWZKc68X5sb2bs7XhqeyXM7erLse+RuiI5xzCEHWmx3vekH4/24N35sUpOcZL81dX52epo76mh8OIOmPEhoTMmPElespl1dElMjFnPhvU8rg8YLhz1s07W04FZ57LNGacsoR2mnayHTnbcko7NQ7bvmkV1D9E/qYt3ALLlPsXLjalAfgH3WzQtEDyWuLL+pFhYolxgzEEbsicG4wG2t7d/RbUpo46GeqbkFXk1VoR+OYPOHEi6PnyJG1m1AvsL2Vd0VJexOfWCQGyzsHbeZotMxBZE2z3T12ZUs+JfYS66ulp0Os9lnFdYUYPPGk+M67v2Fw3+B3PkBfuNdLFl6PTxe9qYXE9QO70OHXBXNDz4pzR6ShMUSYZjIqyuzrrLNXTmMNi/L2xRM4HLxvUlGHLCj9BjLi+CY1PsVLlGZbt8cjpuNFfdmPzYef3EzWxfWHSM0E5Nzy0bIbO8BiRy9MUVuwcl0VhnHWjb1H7m+twPvJ3zXuqwuVo99kYW9piRxafDBHlaCcwh/WDC/WwBrPbfyPkZe2zfT/TZ/t7ycsXhzTHtD4OpIxrwS541IioiOUoR58FirdMuMsO3clkTPMaWWe/Z1hO/Aav1xMNzNp9LNVBEqwz5MzvvKHmeqEqZKc+PvoR8xUPVlxKc976a1nKT77SklFSpjV9koV1k14edrg2yyPWMxI/R+IQp7POkAGSiKqC9foIPoRPjNJCH3FHdQnrAZvctSwhck3omi8mNBoamY7gmE/ScIfHXwS3zOMbmDqGyK1swizVfBCOeM9xQge6gjRkHDUs1TLmifCNCILNh/Xypa7fY91s9IXJLV0+WoWddXQHqw6hMKOKj8DGeIznsrn27PGU3pPIyrjLnkLVhGQLqNE0+V62JbEcWTF7FOpdUaejNbsw0KgLH/QbMeV0XNTXYZFr4X8VDeO76uDJ//ISB2ol1Bbxu3s7r0fA2WD9LQ6ebYjtcaPYuqRBrJ9TDjlMTAN8aoDYK5VdDjjCqfo9fFpSpzL+OjfKzRNrNJSkrfii7CyPm2DHerH4An/tTRDzS7YBI3TRGMIP0Mcgqq78ePSAOYEnygjV7c+uVFsjuFdvmIJadlFGo9ZiRExOg9lbR3nNFTwEf2pAoCIJcULDqeQEbs3lYswJFy+5FLbXPyjyte861FAF444GDhuiBxUQkckpJfKVNvHJs8n2FJ+2ctjmDOgfW6XnzAeCR1fjx459kPU41xMWZWOi++/yaPCudjbcCjRfz7K+wjtP0fjHO9QgwRSl5CJ2Q8s5UOft+2Dqy4rRRZAEzvEYHyunzjyPpiVUA54iopSoIZeCYy218fZncLnOT0l5Nv4mMQ2aVhqDA1SJ0nlD9BM78q/OWJDh79EvtQMIw5WmfrVrnDD8DrnA+JOT3VraHBwH/UHjo+i83YnjeDKB65+3jyrwOJtwdHFLLh1Gmh9Dnt+ngaUhh41h3YqHXRDICvM6/s1IZr5WMxX3vdPSlnM4QURxUAgr5WNq7G3ILOx2QoTyNfHCmFMsx558pOsyowcM3CUeQt7DLwkpakbrUpJNu+IfGh6Gbq48RSGWezYkvJnId/vW4JEVmMTMjB67Gvg9kjdHttZ5WrnjtggJPH5PB379xRVrnLkt4jRMxM2JL8Y2p298Smi998p1IJIlGn1D2i664fi79gdEcSAqqfxJuk3YTUl3Hr/O51vwC7l7cjMjYZvyWWgnhBeGAUBWm8TILhN28E9QaEZdOEO/aFdUnJmuDWLcTKdS2rDncodpnKhSlroBgYwCgWyyHNdcoGue+HnnB26fL/wuzSScnqF/Xhfm25v7STv7tCQ4sQcWU1rRZ8Aez1cayKdfcfyHVqcloLJitF8hLdePUafFm2Wz08u55qLx0m+u9n3JJT9x88eXXNofTLBgmw6mJKVmQiTh7gdP0/lOubV/zJED9txkl5oiTkW0Viw+1hpufe8UHTZkLuM+ni3PAX2y/1Cv8IHXrTjM/5VbcUXmS48CeVNMQ8DLMaoftHHz3kcP8F78fCotrjmMQlPjzBk6pqmDxaAjS0Y13vOioJQVZgiqyvWURhSRYBmoOIsJ2M2GRo9VbhmKl0/Llb8L/IlhnE3BrQmBTj5TxOfFWzkRGp5cVSyNQNesCWWzd8BWWwe4fixDcpNIsovut/1blwIPMe5X4iSZVlukcSiDtmBPx9shk793+gudQEsgIYOgL4SNXIH/O4+94p6qO72X4UdOu8w6NhbD3mIw8eHWmJR2tykl48U3Se1dZ+aETZrgx8dqtiqP6gezmlJKakA29d7xTqaEND0BLmQrhYaBNXjEmySgypk4n/wob/6Erg994+5CtlCjn9/eISI25WEeP66f4bTckCouwlC6iKdonQS1H5RfW4SqPvvQLKxAqT84/QtVE0Q/EIKCEbDzJhRR3SNvQniRTBnB+Tj/05TCzgMaKltO2NcX7hedchHKcaHt98cpUikJFagiJDFxGI9rUHCm1IkRXQ7uOO2CDjUowfE41e81XrDzjF+KaykSsVNz4xCAVGh1z6wf8B5l9IWgDFJsnu+v2C401imgDQ33kvUsS253ZqGc2UAP7xMcPezgknj9HTzsa/PVh8rmTdIPHjJaEyKDiKH1Dunr1tD+uWaDMKJvZArX3cbsgurDnsPETVa5aEF8mifhX05h78gvKao5wAN75nprlJcd50SINP4yK4SzUc+kw6lmLKzdtxLPb9EXtvwtXXJTEdWwK/1t1IzAg7mqOntK7iIJcit39EGaCfa9u5hDUdwpG4Ic3xbTNwlHpLnEJfIPomuCFr+QUCo8RB6PvHSar6pzK5nKiJmpnDQSX0ChWXHmHCZ2QhCdeq7RkosAcdcb0yohMjEK3OVz0eoJyVfG4KWhXtBDGh/VdbXHSpUORjuS0xinTZPlNTE46k/rDSPYO6KDuZaHhNocEX0nvyQ3JefLno9z1onzq5cxeyjuEY4InNuqyu1O1JS9F9vXLD2rxn09JxIRtjsqLWDUIhzxIOBVX/Zqf2ZocdW4JStIYbZOLuADaj0J9fPWmv6XQ+s19s5Ts+Dal88bM6R1Fialoe/1MDV2G4UjVN36sg+3VmkFmdLtH9HUBTqMpBaqqPdHjxX4VMrLPePZY5ZQQW2y+uLXZvOl4jE9pymlTJ9QJ6VCb2ZwARaT1vF7vpHcihUctE6fuoDfXbGtYgxnAQ6f529ujshcqlYbW97fy+E4Uxbyv3cuUpJE7y93aU/XAyMBRVK4qdYI9dRkYnrkvvBTtW2NW9/dMsiTJVfSdDDUSTLXq/PK/gpG4ur99LfltJBQl/16Go+Nl1Mc4JYgbOa7ZPFdiFDhiO4BMcqy91usajNJOXbFVwWYSNs8laj2XWeAi6mNCWuou/HnQVMCm6pWS/Z0N1StUsezzSJyqoPKmlohBjyyKN3moyb4xqfy0uux46VnmG/8z6hOSr/5dtP8fDu9L7K6VrDbv3Wc8iMs/rGpONMoe/nnn/nciF/hSb5W0iX896l6aIs6JqYZIZkR8zUbsKexedYkKm/M2jdnHvp/el5mBc2KOjjJnk/i1P5hQskYkinpr4uwflAyg7/ONSqgLbP7dr8fdfDLqbjfNyS/lH/YKUyDmdh8um4q+Ls8yLB3AozhPSsWsTkaHco6INS5H9yXGTwS/DUfDUTAvhiFgiOKf5I4/vamgFS81m2uzsm9t3Vtjk9UEm3Fno6d+LbwDJEWLlCgbytQ8VDYfMgjvJi6D+p2K2tkXvtu4bdxGZqTs2LpnluDldGlOHhTiZ/PiYi+K3Apob8FLpIwMI4jrEC1fu2GM0OTHGBGreBfLN1kRZT6qG9UWtsTIMJi4Ku+dL4ba1o32vQKKtuBVBz9dRWdBZiG4bvd/mGJRckFqyKPQvfDLN4nMvBFe7rsLCrGwjTlRZREIRIFQRcMzq8EsymRersv6xTaVsuexmohZw7Xb64OGQpRJQplHciGQnC9TapSzQnnRV8DuC/4whgb6yXbG5m1sBdQUl1iL0S5FzOiVCmaKa4GpdMbI2Zp+kxqtL66TEushWm49vywwdQ4fMEp0320SOvWYUzANPELjUDPneGFHFfOY/9eBbxG1fi9qePBjJiFymsjztfTnLVz2XstgsloRhJRr2vw2M7MaSUeH/3iMZIY9K5Sv8Y+fpouumrn7uswMA6RQGWFBF7K5EkYsi5JbqPpieEh9D0Ne6Go0ywZ1BVnv6onZNIPzWk9v6PlOzbUS/I1M6i7mV3KsJ29T4xqcA8yD5n6fGWrul7gMmK9JXEVULALkhAdMAxrRrDOnDRP2oAQjlPRwSP3SSJ0a4FkUUZIKuMwvgtqSNqUDGcGvThmW+u9HwVx3NRdk1yAoZRZNfzkxPT+ZfIz3bvXZtgEqz24mcy6168kM3Tda8GBTxknjbOiPEBUQCRB9aM7raDnR6qH/h65QO9RIHZP0KZ7N3Lfqta/a8eLJ0EYry8JRTFWJBfHw9Y9V15ei+qgUsSozHsBNldmNZJZunayQGsY00iqcCIY/NrPkz84zUfVWnFvvVw7YPQbJHlustq6nYZmGpVFQhgQliBE2vyotBbx1TNGIJlu33mMAjE2fkm+WDBJNnDN1TCNQ2Bs4lQX6uCYHYN59qhR7gYOSvVhw2l8LB5xIQlKCUq5ELsJQEl32nQmUP63ile57zLeI2nK7FJQKo0hah9rjTprlxy9wGfA5DHENuGUgW92AN1zK2g7tmfyF1qSHw4GpwHeNaf+QF5hT3isBFNA+sO4+J3XhDTJkkJZRuUp4zeVUiIScwhz2prvJ4IBNf2+XvzBAhjbp+/lOozkDF1pIbGKC/lqqQZUrx0x/R0p5qzPXrmQdcA7ToEq+GiCVYBTfdM5V5w9+4JWNWSm/r0SndhnrBozqTByTtfBNY7vTM/4CFElmKUcyGTzpvzFRSOiRgFgH5AAvfsX6hAjAKwVa0nF2iJOjdt5op46rF8E71vNKL/UHaweb+yPTmxpJdAv7qi0KP4Zs0ARL7FUIQNV8U9OM8Yq/WX2NZ0WM+aLYxFM82+1UyHf5TENez1ip69HJm2cmqmpZDqAfNgHY8qg7Vg/sCOQyWUCJV1MBeOo4nxdT2b1ZI7YmbIH/R30KNqZFfIgjTJf3gTRhQca4t/qJTNQ8e26Qwqaa3MhyWhcF1lolaFGToBraGVW1beurdOy63Kja2Kq0Ep4+d2mjX4AYE/Azl+SkoGex+9EE9JQrt9O1IJx6WHijuYJycU3L2uBT1L+LKzpaCDyEzgK4QiVrWoa/BKVzxt88XYQ+d2e9WAw+OGb2O4RkpyTplsyjJb+JUOpzX+QYRzGOcJDXAfwpz0bR7xsiiTnH5JFO6Pi2oLhLxfebN0y4U7o3Pr2AYUqw/27bI57s0pH0cT3Mi/a/cHgMb6IXpuCiknMcgclIgn7y9ts35Jh4nEmQCZUQ3faksH756rM355EfvlDAaWJNUx5XAk3clJagLHdlsXjnPHkUNuX5+a0TzvQ8h958wePQB9WWyppwti+yHft/hSXdjBcuZcrXxh219zX7xFvba1BGE+ujYx87lcAdT5OofMVkAs4/8bnXbdszpe6x8yoQe3B/97ULel/fH4bFGY7hdVdo77rC76yo5TrA8tvoiXWJLfXdfXy7nYANBgeMdhOVsPJ1zz524vcAXKPBD+sXpbUNBUbyOu+TxJAAF+VdFzXBRrYuqQDGVVuj7+4SITS6N/u89hC6J9WTmqAzFECnKaMwJ79N2fSK1hAGiW3nMkNFmz83ZD+z4RVUP31aOn7eaWT+2IoSpOVq+TzSqOInrPo4Pb7bY79w3rRaKWhrzOzAG0YS06VAHxAyLXKh/LInpFZOS/5y0k84xFikfAluN8TuKAii5wCC75IaESflNyM3IotXfiFlv/EV9W6O3m9fBtk6eycFxb7CkizpOPBwHBp7NF1vGHb51too5TvtkprD5gC1fp1rvjRnAptiXI3hwjeLDFI4InoyFYS0Bhc0jP3gq4vEyltKcbHJl+hf9dROWd2gXjh5dwEAdENXND4LjEc3aaji9ONDH4o9vxvdxBZyAdq9vL7qMiAV0kyULQjlpscY0Vn4IGbdFEGmXd//sK1pfU3kSIJI8L8tsSb6oQrDBW5cjkyJcDm+lEcVAndvFtfU859vfBS7tjOhZdS9ZcUpYmr/wbs933UoIJHaLfzQg5UzGfaj7N4UgKghV29JM/pzIXHNHPb8WW8MXWKIckok6gMhVPPAFqs3c4Ki9H5AwvKfhuQ6rXNS3e8jWNz+hI2rgSiwje7QW32STJjn+5z1ieNkCo90Qpn1ntxrJhimG4eXzeV8r2zETjgjs92t1HbgBSt3PF0PrgIEsD//JKGhlVgEOMKXoEC58lPakBuKwo53aGOhilklb1GO0CvAJVZ7b/JWf6aTcUoJoQiHgnCIcClZKRGrV6W0jT1A0JCIQxwLvKKnK0KYOoa5xb5pTaXk7WO0bI0dZCl7ZPXGRcvbSouy7TaobmYBH/tFvSKyHTMQXplh/Yb9sqeEUwih/WSo+lujsvx26hKKfWpTGFmt4P21MhwsgeEA5tRdQrTsGOXPr6zpWwRVsDmnT2I2lilP1CzrMDgLFCFycEnkWcYm3bDGWPQcuVt7CDlqXaW1CHm4gzBNtdIMomKfE0K3u4OzVRKuCCZ0jBzLrxa0V6Fwu6iq0LfHFsUKnJN4AfBqtM5e0ZAs5o8x2eJC55yq0mAln4l8s9hw9VxR3Gye/WKf7ZkAd+WjTsJ0CyiAivvIiUcpLZJPqBh7nV8a2dx2JjSLAt4XrrOvmdTizdaRwIqgbhp1Ij1VGRGF8CfCA1ZuA3q6IVd+IL5pJJlmS8+yX59m97d0cRwSYBIYyqzIp1ufNZy2yUrGrDaMSNcwiZ3CmWvbegayRSSGbm+MXbHzZ9cvU98TNml3tZQF/Cc5kkL7Tz1oNi+xt4Yn5Ii2lpGEzSxAWYICJbR6RM5u9evgm1tzjP6kuYGZ0PmqDLk/AXJmixI1pUSqOaD433r3mu4GEKMuXGSyGEJm2V9zixMcnTZGaZHUaVz/oXIMo2Ein6VBuGo3Si2Qz/1aEvKCPEFe9DUTV36pb8d5/DTXUTZL+D48fL17aDxhQ36/6snwVBeSMxXiQkPyNyedvYm9srGxPbd2m8NlvDgJD36a46bWI5uVCyNqSn5wnAPR9X3bN2WfUvlquRruJLvEqijqFDDnYsve5F9iRV/VkrMp60GZknvNBCyS3WpiQje7DkTpNpELPniKtH4JzY/xR46gj0YH9NIV69HbxbuUdgTLVDyfJVn2S5kq3GxXknkWsIrPqFu6ZuZTG347HPC5DM00wIXVdixtj1dE6yYUsoXHnP8aAchPpVgUhL7LGO4WHaHYSLp9AN5WEDtS8/JtdV6natVNi8rHt9R67qDjtiHwSZ+3mKBK3wzrkQ67F/zoG6QPKotLCEoXyTeQD5ZJOdI7nNs62Oc6qtOZ4emYyeSyXywS7bhMKt42QVtUx5i/VmBXo9CxcBznMBJdccBB9jjmniuVII8LdUPuNOt/vTt1o5NFK2pMraqoRRXha++/mFlN3GFsC2FSYsFVggSSLElP7zPmZE4IU3vYc8D886NfGOL++thK8mG0a0JdiAo2+6HGyl8Q0+WrVHhMzF4I/mnkX9ySgaG1GB7O5udTEEuoWjXyUeReN9qTyIHBFN+OUDhYwKedUtr2AthMA+d0tuIZhM3af9tK4Tsg/1iLvsJjgC+uVqdyUXtiuMgXYADecEaCJu2CYaozYDFHHNBy5VS3CPv7HHazpcU4lQLUfWxSG/PjH3D92dTLrPzCLUXn3GFcmmn8DmzVi+lljDg/ytraYMlrTFzwYw/rotY+x6etTTWOxtk0JDW7KnCTrW3KyiUu7+MqJc2BXuxAApiPM8+J+99tcvE+JTaSEGAA/9lFTb6FUOV26HsxUMNL9Qr0VcKLqwSPMhFVoYmTNkTrKEnVgW4AB/aHxfsjdAG7EmGB2zP3PtEeXKXN57N8/p7CnuspcoJJmwMTdJiEuK4txkEVbMGmGMOedsnNHvnDnVKODUd11dsCenmCGWOCShxO6graxiEHJP3AmjGzdPfbWF5W6NoSre7XB4U/87O44clxpTvM283iQsWtbNaXwoPQqO6k6E6cVv+x0N1hX++/Nb25d2kkv0oo1ABTTTJo8pJDT9WIttAMaQ8ieSMuXj+1O3WV3i86qTvRig3WtEt2YODAE8NmaT/8pZL+xttk6bcxZvHcDVHqYvn2ENnONq+Mn62GaqBw8mP2iSm1EcLHZfPriB+8hrGIadKZDvEU8bFr6X84DGn9zntc0hv0pthulnPsaeAjZcTIWU0p62pL+czwnobBhrwh8SiNgn+8nVXugPzf6URHk81cesaEI3ihTjNbvhxXD4T3d8NN5FRJLdXNAP5x5GcCvMlUhdzwUo0l2UnQ6B/lKAfwFZLsAMAUtgQKNY4XO7iYc2/U0475EJzBRc617iYE1BS07lqqCQiXieRLzkWJALEFrYsymKNlPKQTTym9wWLfVJzTfrO9uOl60QfwXP6gLekRZPi4HdoG1SyaOS3buvZ9uMySvrCPUZYAFTb2Yd6fbLHLOrrnnnmwiRqjbb2Fh2XUGQvxwSwLrFT3GwBMgwMmLDBmqT9JL7d20nhmwJVFweYW3TwTnnbk542oYxKCHp89pwte+u0L3sBsEHNivI/kpVNk/zmL5JQiUoNX/GFBPGxl/Ni6hsWLTUmFwvRx2V20Gx77gJv6CcubKsC7zwAkVtA73Mq5UyEHH8gl7tL7vWY78arIMHtktoyu4TsFsYCb6IUppi/yIfPMy5afsGGHzmG/Tj0m+LYMM7yMtBn9+ojysISnOuwyxHwdqvlOczzEUTwbRoNexj4+TibJ1PlHZ9Ez7uUcEj5xt4mhVvt+YQ6e8DbW8b9yQk8KVzwsCc9aUKhOqmcNQRvhlY8GqI/8KnyhI7RytthuxOlpLrUyj8GySpYHFzFENtIdsSJI4Pf1sXFeqWpdJkt3Rcab02oOcFZExS02sJ+1Lws55Dx81d2jqmkgTtRrM5ymKaYj3WHxiXVCtnMgP7P2DdRFBQSTzCECIxcLdBOBi3qqaS2h2/bhRvsaazzQD7IWTjqEMuZdWVG3b4F5viWQolM6IGhB0MlmpCuuivMm63D4WxhTPj8cv7BFrFHCyzqqFHx04hwIPXiVPFh9UQ2S19qWIrZFW2rkNog8/Iqaw1rRbN+9bwWfcukvsCjeSrgkjpIoPRY2Kjfq+uD/OrF8sdAj7zPHPm6UUNo70WiCO7HsVkl9ahfimMzCa+aDy6fTBXTL2Sr/Wz78lBwm2khobo13pH/xAH0LvfG5bXt62SaJuRgLZvPV7y2yPU/gQpm3219MJ9wyDFQm5D2pb/83NR4PivHj0HU2nPU7BdoJTqjgKU8eyPreZPT/L2a0iGH8uOSf3O79YGQyGMaYw8OHvcYTaw4gxh3rDiyPhHrz9fB7vjnFjxL+urRcUy1C/p77q59Hjx7+tu8iW+3nHNmymSfmwufuFWvEfZ3PZHXYApWDBtamgpzf1yvD+1yVWCzUJes+X5wYF2gbW5hngbdHDFT35MkwagkMXaR31f2It1USObYdiX6laNABs+iUtqJh8I/Q9gs5CWjvRhrzeSL0MV8Qfag/F99SNMWfcuqaLUxtPHER3gETJ8Xc6hpa4lU513lLERsoFNbGOaEvcKEebtBIq/Y0f3RSSIJJn5wnkWSZ3Wr/cida/Vniv71UfkDU8Vi8uhHQmLc18T6B0pzzTtsPU9fwyuz9JR21KCJXfTwGL37oxyLKFX77LwP54mFZMu0QvWaUH7lT3TNYa72KDJLuCK11q/ZT1lUs79vGi7IDPNtZnQIBGCtPuOdyO73/0EUSqYXUupwX4L8kR7B5QuGTopkFYqxIeYZIMu6oyvRfrtBVZjNWMgq5kiYLRxLmRKuuMhKfjMRK6pURA73ukrdrazDKLWOnJyuNnNCWDi0qbrCQMkxE+DX3LTnpU3LoXBGKg6mSTPWZKywqaMn3i4UEDt2Rm34WnKYC6duugpibONS8mm4hG/mpO1uImqLGyydhrOiaOqo8vuaqnmNtjEj9zPmyD88a8/9y6ZKKjvNxHzo1C4fwXU3KHxEBcdKmYdG0MXyxwmca3V3eA9txl7W6jK1QLnxa9R9Swc6GtQDfCZJe0QWfQueyTWzWh0y5Xb4KzpmDag2e9h3pc4Fv6+Y8Sz/0H/WyrAg8CFnw4FBHgvOgs0JX1G2EBEDUNKADMMqGaQ5p4ART/WBfHudqpiqMkdGuszIZCeUZu/orLA7L5T6aTUR5/2ER5xXpNFKs0JqGnAIuy0HLEBS9rKNkJOIx5NR0L7CYTqSvHqPqvi00udFRcD+bSPdlEVbjVJ6ImSCowaFDMxpVKO+OY3T3KGSTT+dMueMomntaXRqB8ZIYG29D4WuhAAnqmk7MBUQ7kWbgZPrthxmIIki9AMq2Y37t7+CgyugZIj7Ojtkbd/VsJDHFw7VeyO5QJcEBW6fjeFeLUSfltk1fGoLG3qMMq8BpQYMljbBWCNzAclFyogeqB69yFJLGwjc0Q/EHrjLpacHbEGU2RHlsKO1exON3ovYYyUGNtrjmbJRDw5I5MruEBoNNGuF3vX6Wk/nBe4Zm6lOlt6AQhSa+h+ixU5MIJvXIjg2lLJWqL9Za9bCH2skQUX3fRiFYVA35txNrBxDaUUlR1G7ENXM6pepA22RuOGgs4HueJGBTDl4SfULt0BINLjF9qRDQ86OQtnaRFnDubmWWtFe6TfQThVzxd5sE2h1QFHLsAldc4Ss62xBjO0Mr9wOO+IealhPchI/nHjJeiMBlKf4Y5tclJwPDZPqlmR9ETdRZAk38UEItWdoF2tBN0trxmJpiRO2Yc87CJ+mDYoNqER8IH/juYWE3I0tkYABLb3rUAZZTUlfwugc+gtrNnHPFXNetANYJ/1N8PzqowNCI7wWrVBEEwox+NRqqwO3OWI+Q87ATifEbY+V/RHevLrv8i8N/+qHKPPtfIugGtZAc8xFb3u8Fu/cxc6fjk2IVpIDQJk2P6aCbByUhOYhyHBi/CEHkZwRLqzGb5l1OtYIjUjP8beb8ddTZqAfnmMv2kw3iNDW2m/tPKTuHq2wrzh7twtGOVh1UHtCVRAOqxZks9rFnNSv5g2GkCuPQzCIQ2ca8SrDNs6aOmimbgsNa36vQELgPqiFsVkTdLMkhDevod2qngl1X3ziOaH1IRShRHaAYkgErrTbQTmAYy+euRpGmFfUBi6DwFFBCyg+/ZmXFY/4DmsEyaL0qAE2NEfHDhUMBJsuPrqTAdrVYEpWJ410gtDqJvR9exxnD/tilcLQ81G77bWxS0L/g/D49VYaeY0Pku7CUV5k+/JsS/HSoEAUtiuNHgQh3jnEBz2IwGi/SCsUDHSy9xOjZd4MiMuaYyn3AS2bs6rQLC6QKglko4Sf0KH/iP2woyOfgmYf0P/ykh24rwimOvIr33oM4vxSXC9Qiq/C8AAvH3VtJ10lWUWmPFuCeY3Hwi2dhaCVfeqggJTivJEvb6Pe/OQjUebgT6jsOxF2ITvcousNMa3m+GxPFkCjv8pqgE/aY7BqrgFvqKeOtcK3H/wyZvHEZo+rkb+rPUfoIbmEpfp+NDqaLnb+tDRPl4Y2hynlChZfJYKSFkuzh5RoIF+K+XGslH5hQlXfsbCLwbbsn8MGI87OBRJOTCw9vl8u/vfwgTmqq/1Zhc0mXTOcMEVbvxBayZEr26vCUaNCZ5O+4Tb3ZaK1vI4DcUDdWvk09rRLtF/zGPtlfLTsu4PMItbH24P6V69+OIRGia/GejOPBfdr0sPzO7+wODlZq/nGOO347ky/bxidXVMNKy7JG/0U4OoRcRzyt9NU5gLa+PJN1OkV5lom5kpBv/4w1wksgODAKjYg5tfmrXJta34amz9EFFy6zJqEOSSmBPcm6gg5DluEVJGeSRHv4PqbES9mmlnP2HymD9yT7Ihv2rg+D0s5kvHPjXEPzGRzb9XQrn4ZkYcoEMJyg5Ivsj6VYeNXRdW+WiBM+AyB1L/o0u+IozbdiShbv3jxsHlZ2oHcHVDw747D+O6MQZUA5S+RS9+kjBa7Ut1vJns5F2xP4zd4MlXX9IQ+4MY2DNDicjuKGLYurLAmmDag4uOLIYCKRzEcMbEQ2eHXHwSE8lQO9Uw1Czjuck7AXs3XWAgInlO2srksyvMV1D6HisvOpSL6NHWvrPPLcbqo+g7vIs3kzIcQ7qm6Qg2/Bq5/3br7q5A4+Q4DkZ0aZp1Q0MkxVV4AOkVngEMb5bSQalXmGy3HQzzrWf8sfzcG6RE2Q13IdeiwLFUMBfNj8PxbFVdoA3AYZsjdDJMwfumnLcSn7wYcT9PxvtUAwYgvCKBkGQ7nsoMtg1V4oINzGhkYgJd3BVVjg5WeW9mHlaBdJn3bbE8dtmpcxHqkgBlir+ZNBXTwmDs44VNPOvKba3tLp46Uq/OafrpPgXRq+ms9dVhrXbdmHzZr540JNNDV0T8P43MWVpr9hz+07hAcxcmP4+zQViXiTSpb5nZnp6ZTJ1NhSwCLGhamBIwwvikxpRpvopOImoRbupSeNlAJVr5gtvycD8yXmviySYBizK4DAFOmkk0G5tTlABQ4+pr/4X918a0rNv/HYi0JaT8I2a3jwP31emyBk9Apea9dTmvU36FiDcSZ+f1vnB9t/wVDyen/xpdm5pIZ/LumyW7ERPfqFl6mKSOlaiEAXfXBm6744yYnFWAkYwraz0/1Na3xy10x+M0vR5/iP/gW1VwvJjHYHbVVGOSa3+fcq1nadMpa6VwuDwt4yz6Veel02lBc3lxH3VvKD47E8ZjplMPS++xc5IfTbDufwawT7/+GYuoJk2/Ta6UaU3zMqSdW1bjFtkH++ZnLpGfkvbGXWLo/7wKPnbgtRJfSszUgHO4tP4jIztMxqT2+T5FoO0/fD0rk5jdRnP1H9ILmW/OtQc5+zVJXYwJRaiskKKZsLM0wjwWxKN+3dz26dHGLk5qwNxLY8Xf8GG+BAvfh69UAa4cAT1aqgVq9qGV/XD2u/xe2er7KrFOyT7bASWvHYr7G5PJOFYxkM9PbVkCH7xSBx8xtBLYafv9RbpflJ1NrEmVgy7NGkduSMFig6LGrqHzR6g21r4AOStBdDafalS84cBQFaC75IabPBPf+gDubHQAahQuNAPAZXyeaPnrndmdDdPeWqJ7L49iNtVuGlAjyvkgabWMr60wjq58/eyNb9vGORSR8gmo/4aYzgBnfVT/EcigLTvr2O8x9zJYj9XGcpgNUNKPxYan+q5FQ8Olhya45SkKrkuomlYJqw7OvB6qBWbi+w6wSim6zpD0RLmzdmMoa8ULjDNTqxf0TzYKlERVT09SylwVKhtWCKt0Bjr9v9l9LRT37Qvy8+Ss+nT17QogrhG0tDMY6VqdTuRD2090ZVWeGpxNXlUcLnlTqlYazuhPxa/rC+AeThPqVrWrydSd2LCUiD3rUprEZDhMQw4Krxax6EoP7oE7cOc3LfpdJo/FfsTxy4Wy1LjyOs02Ryvuyd4Ay3Vt8stLuDY261VXqcle5Cv4NV0JB5+yB6BRr764W4aHnlhHYs75iIdxe1YWDOPWyvho9k39Ya9o07MPzYqikiGtwGqxqUyu8LD+by+9JvqLz8tjq6Kda+Oz5tbpQyl8iNOaFek/knWpjb86LQSimNKFwwxMwg/OKj7vHVLHIHGfEqrmdT3FSJ4bKSFqcqIuaIGGkFVvFLhu8UMKWdzTAcfGfvtku9xpr+p2LHvLrk50Dw1yaSKzlxAvV9JGGQwbjM5zrgGxGWS7WlW1X6NSth+o/43K7cERIX3Kb7nSZdcTNBT/On1gBjOywhL+wBTSsQBpts+Zzf/kSRJzmAbZVO25pVIXQ3vbKRwTZpwiAnQcWNHUmVwu9XbeC9zC6VfaW+tq368PuRFQzRqGa3XLqp97BufvRLQG+jkUzCKmrEkCtFnwVVeo4I4reY9s8sGbDb9HAXBRyzNr0eOQ8whroMtz0/RTD4iY41m0pGoFv3ljO0JKG/T9weNwh1Gq5XMdt0LFHtd4Vbo0bSeOP3/I0liGnh65d718Z1ezk3PlsMu2pc2C1Ms/z9sr8YLKYPfAFuijg/Dy6t+5OSJ2ak0OkwoFM34iA8bjGHHSNlSUQE9wx9A320Txv25aDJVBdxz/d1ZhHz4tvgudPrZrhgYV87T/CTjaTD7TClrvL0kaXNzTOH56FkOKMqmjN+pujgUSab9Uni3VN8zyHgICUyMGckmD7ZyCmJQwtkvhWLMWyB0/TCMGhxHeqfrtrLJrGvyTgUGHzVLFkKS71Js490JZDL5ISHsjqCfUmqd1iD+ziL4llV0pjE/b9VCVZW29A62UJSM1movwxgdUHbMHSBbdFnIEZl0/Ni8nqOaPBsSytLuvXhD/7memAX7/73VzwqvRfQ7dJW9y6kL/FTuGzyzQLAJ8S1floNh64mL45O8lhIulfcN/GXXtGYR0MlEZ/3Yc6NSWRAyr4ophSh95mVwXGO4QU8cFs17iZ8+MuM9mrueCIIKSFZPynq2Qa+UAX8vY1PZhxHUANI6X2OmiESzFDC8txjbEevmm/rJDjy2WbVPhqnaDWkRDp0T/RXOz1z6Qa/cjSalL7XvOgRp73cNWc6jzeBXIVodMuxDBvQjo6dkbtSHmuBRI9zPsJWQT9PX0xPpEDotGNqIAabOvfdmLy6CBQyOl94h2Nha2NyLqw+zf2vdMhxDvGoOHED+Crq2HwzXk8on8v8Kep5mR7LfbSy1lm4fPFsEnHw2jzP2GwEWx4FkWcphCUzxm1ej3sJ98rycBOw7AXoCrn9mynJgonb2HV7swxgdhMhpbBx7eDW72n/g+rJ3CwgQ+VOwziYK9uPyydSnSayDlpJA/MyV+OMJ657RrdgxmFu3FX4Rwvw/OWR1vj3L1sOYTUWK1O0X2MO+IYWiJIa5RCRcRCSr0sKW4MXspvL45ND55mQ4BuU/KNoQWLzEs4itm7j1IJOAqLUq/b0AGXB2r7aSIP2J2/pkMsRAAFky4C+FnDXusJ6IvArIE4EDth/3QsrJinlVZ+8AcqOtsKlubm61x9HgU2/nRUbazFFtY3joPqv3NidK42Djx1iC8bT5xRW5bDYLYlD4QoZR/9uM2GkgiQjQ2CgSQK8p76xMooCuabK20CI6m1/nFQTV0mwlK8+FfFsNwiqi7WyrhdG7v8oJORPhxa1aMBHVCghHv5S4DgnMWLxDcFeRxRT9P4n4QSV6mAqqydaGayWMC/L5vs0myX300ZKXfLWLBahMMVWjO3NLb0w9id1w1ekvR+HQyJda4WrBKap5e1rg0/k6lHooVMlDRe76civVzqj4KQNy5n/VeEp1fn0zMtjvzqvEzm45R59QjRANfquLf+blD+jhOFSrMoTcPfBIYCshYiWiHsDpUlKOnGtQmOP4mA8z9sAHRehT0dI6rZCes7eZ802aH+G6epfCnRvBUHrhKHqr29QMHpwgV9xWCRQsR7sIap68j3crPB+GrM0SYWrEQVz3eZqZ/PNgTcOwiapA8copK57nOew/KywGQfEcNLDrXt1K+aKFrHyW4U6gZz6qa/83Bd6G50uXjLn7hD+/bD3L3S9JmNsayuHpYi3J6pZkYj2vx3Dz/QkX0iNRdNU0ub8C6vY0WUiquOuHZpiLYIR62iMsZo/qaDx10NEQJXoGt8QTb3iE1epQyMwpYftWYdeQjLDbO5vInocm8F7yb5wEQJSnci1XtddPIlECWRcKg7DpuVJmtu/nyiKeP9UIH3ynlYulh8VH0URJmDJ+hoploR1oSky6zs73i61K9W3QoSNH/TwuMoMdkKoMp5uaUQ3/weNH42aGsUpAnlg6e5WMMc7iyCWm0zPA9xjHHlSkSVGU6jJAKGugeyWhEw58qKASbSsHT/PrP54+HF4YioO+huoBTesiTU72bxIbwQDNVRUk7/6f5bOMqcTgvK9xtV5vf6C1hlFj/ZJ2EL0TROq2+gs8vueKPeOQGO37/5KvWj3HetHFiXwuDt2PIbIzlEk1JWZ79MSQO6z+RSmlZGghl7cNgOu+b4zukD37KGZuHim9Zdh8Jk2Zt/3h6ul0no5l/EZzzyMYiecohnJjb8zEtsmFk/+SXUkn+Km6jkypJT01ePr3ITi/Pij8oLOXjxAh0nFHBPaViabUlFsoPsldaQSaq1LPqT34AOidZ2FObFsoxvWdbx/+LrmRfQfXR6wyOBjlJuN2V6mNP8Vi8u/wd2BdTdRESpSbPnNbH6weZrOhL1VoH3vflYuo1A7v2I/TTWUppMazFvbmwQ6Dslgq157aWy2oUvE1ufX/UovrbksUnqGGEKJctMCkm7js5GBCR97kZ9JeGJVdWzhv02/nSQD281IIqq5MiOrWgxmano+ZW7nHBh5gphCyp+mEjUIWGgSJQ/YpWtR61PhVzZNGe4OH8lEhklPhNllrbPorVSkYE7YqYbSIA8/sPjorv9/IOBREkITfJK+9qnhQSYAByrwyUkBBLmqxmO1cFtEnLLpJBSHCfbkHeQSFU07F4BO8jhsWuDSvSHNd+TUO7e6jGB9IBFgmBLVyhzKEzbHu71DJW2RrMIG97nAIsaWS32QqfQbUkQFSWdovWsrdcx2GYfVy67HCdseQhCmdUQ6JAMkNcQNcsVUxrV6ympgGqBi2VPCNuEd9He5WCE0nwgV9LYkwwP3GYav8T3T6foK0sxNoNLHOyp8LRruIPn1f2ayd7Ut3bkmwd7uBKV/UzEkSKGPDfq0dLObn+MtTFiFrFh5uU8Af4aqtas7zE19DBwjlmXM7/H9YSIU9yU0orji3iU7HuC6CT6aNaV+Zl3dj3H1CyhLxA+oQniLU5F9fFqSTraSWY6Zh3sN+SfezSSVOMW0X4J0SiX8Yk7j5bmdrF3FzZ+fknv45LKWx1wXKuzVSoukFn5s/xjUoXSsFAIDX6N5vG7hXAYK3aiaBhfIGkUjfe3SX0xpbFxOWIwjj87XgmhsfRlRWFmJHkSC9iuEBmwLbBnpDO54QdZRHkKQRjwCxOQiu5qLUWqsfzAhxzAtFzbNaDyXXjydmHCUT8JKTFKhd2HUEiwKfQapsKweP+sRutt8yfCgm7iTQOvNzqn1cBIhLhMI0uZmG81bjP5j6JJMwWzjoSm31xx+fcxIZTwMGElbDcoOcFIPl0kMaQAOyzN9Sisvdmtia41mU6A8EfC91I6gWFaCBY8/ISqQ22NDvKC4wv20151v6eMxWLPmL52J7RH0Q2hQ1S++kDMl77OJSzsBX3xb9CViMCFPPhIFOBGusiaYZ9AF8YXBoT/+s3tBeO7D3PHTLF0kap7fW0FXE487W8zhRhrU7ewMZqtI6j750G6fMu5TL0ahl+wrLB4iVocSIFw+UheKahHkyXpd+PZhdIxzzTSVba8cFHYH8WTGIjFwvhE6l7wIATLjWg0wDIiL+bWDhAbhv3gfzoYVA842I3HLsfD+Nn+ITED4JzxGXkPqTmrhFw0Fi+UzUCKkzxJn1dmyiwCQ8ih60+ruP+h5cOU9DUn81G8jIuKbAIgAU/bNewjYCMJBe+x7CZsI2oDqisMfvyiCJl5bWnx+mE2Vl5BOF0wMeSY8iMszj4iEggBytuu/jMhNyrEmiYpNV7k28753DQJzZ0Rl4cCoXRb3mHhCEnPZZlhFEqMT6LSwyia7RraSBMOK0q3ymKlOUcOCYv9qWJZ+fxeqQBheidXxumfVseNDJWxbyO3vMK8WRZoyaTbyMNQw56kP47zHyC8jf3OKsvTO8uPsRU/FURUt+IROs8lTMiVCzG+5pNhSQTQFY3859KfeBAySIihAGOl+X+tRDTwP9tgTPo2zAtBjHDxAY7dqH+B8nmvYnsuJn9mNSDfKqjzo3iHLaO2j+ISNO/Lw+Eg9vOsWqP9S68d8mH0F6dts7n8Cf3bEZeE5StxssBaygrMOW3cPwm3M+65zVTWDzo4Qk+oj+1+SgzvWRAF+sWTUL4JqB5PsfebE6mArfZr/M7w98at8V7b5w4WShqbBSBtTllPHC/bT1Q0mOerxcPpBGSA4JIgvCf2gN3LEZFNcchUiSYmOvre+jPMO9ervfAwkNFuhZKG5muRGQ0Ri0TcI8iDby2F9t+LhemkOOSi+fXNedYiW7PY0PnLUT1peq4p0o4SfewGYBuxGSk0H6YWgjGETKvMbeqbrdHA1PIi1YUbm2okGWV5LbDiGKlAOI5/IYgsbyRSTZ+eAXr7GIlv0SPPPDxG4ZO+zAqxs0epCKqQLygJvxMktNkdj7bZLs+fU/c+f+jVCRFxCok8mZhKvI0Es8+rypE4LJ1t4a36n2EBTp0yql7VtZXFfcyd15QbDPwKh2eo25H+C36+rqw/4iSyz7sYgKkPJ6bUtK+INoN8yGE9X0j4KbrPVgH0l+jTxpYghwk3oowgh0CXEe3nEoZakeA9PBn/rryFj8fQztvnp4RmCTDbTpRQKN9RZN5vDnGsIX3mdw/YLz6cV7z5kdP+WLNYC/LoBKc6v+Mx4ZLtLFEQVjNjX3p/6I/47wMuah/5+x/tt2nwtVL0MMVEy3aDwFA+7u7npeT0Qd8H0fjPh3wptyMKCQIlTM17N7AMhYsD5hUOqVL5TWk/PfpkCC9ZYlWlgr/YZPWcG/AHfYTylRCqJx425hnglyRPSG962O+XeueWEIqprsWIU7hxf9q3KM0aaH6KbffDiK8gEmZbH/MFDh02KTniOZWgYXpz95yKfSpT1vVnAzJs2uF+vLTKE+DYzVYreKV2ndxWM9a0hH9Ak6EXwu18K7r551vfUMTlp5Pd/UO3p/4fjwudiY4a3s90mSGKngStQvLTEH45GZSVZS9yKFtT2duDFEHni6yl0rf8NV244+/vK+/nCdxKZOEP2HHSjUzJHLoBrUW5KGbp2nUskiNdid0EHqGPDobXM3t/TpssvF8FI0dDPnjCdTRf/CYoLr+E8oZt5Uprs0/tfhsYHhN0PzFI4IJnnFFQ1GLzQ97vny1zRdb6jlrGYZzpxDkc3jf9YsZaIN1fQ++CYQpEaXAovzJbqqMSWdUD+qr/R8ZbxzX9he/DIjAapEdLtxIDpEE6RyopMJBGEASUltHdju6WmNJKDBglNUBARLpBaRjpM/x8n+/viX/er/2x0/e57uu6z32OoxvBZwpzoW96owKTm66fcpm/picFeENj5o6nDRoY28w0wW1ZJn2iSpk4oml+GQ/eqdpu11jePH3vilB1iHcgES1PBqvXqD2jGkzkj1kAGaks7PYkbFWYfAsWX0Lqcwf2jvYVSQV4weOYXpt+Jw0s1TprsVMDMMz4/k7V9Y86TDpD0P42n6yQHWEbX9D/lCWKka7IIubCf0FvmkawK+Oa1Ixdoofj3EyDeHmgK9gG9vH+XsfGlE9L8bhItommPaWWPq4CXwtzJU3QMdX3p7OF8OHFPXUMZZ7+7t1Dcx31qJrlx8Z1lOCWn3xo/zgsA+KH89eOR+5P7IkH1UjRQQ+GyQaibXiCTtmu9YYuyKeKWKIF0ahKVnk/vE8HUshn3u0siA9zU1mAWPT3rQeL+mkmD6wqobccThWiLFYRaPpvU2Uh6v6aBtqT/1KGFP0nEddShBiT4f1nMigSPm6PHn0j3aUIg1dlejvD3DnLEQb/0gY2yObsPpaaSkHTM4v+RZm/nWY+CEBhjHVul/dPanEDMe96w/Mhp7v43d1ZHjSpnS3btM1QievkLs+FrnZGDl0U6JL1aDeg5JSwr734TThG+b/gLf/fyVO8+r+TYrZq5OP9Ysio7g6y5Kh9o/Z5zMQKt3jW76IldWkXGsL+FkbyoYLGubokOw7ZpmS5LPOS3PIxi9mqh06AL68EVY67Y4vj0OI07dwYFb49MKanNSext5ssr596VjPilOh3POD6X7xV9bcTc/hZxErx0fi/rtgvZZuoXuE3VgRCiOZ8ncc7fB8abzJmy97bPXs5aMv60yH3c15IM5VOTT27RBYnjQ51vRKvQ6SBg+yiC4ROWoSqbHBZ2oA6cHcmPGZBuGPmUk4PylQG/VG6JXnmsUsyUbOZOdYm7y7K96jE6irTKpMIaiFQY6wpCU2TOpa0m+IrHVZONtKAibI8j1Aid7UpglUgCq9L+J/BI8331Q5KTRrLFAM6cO8OaSXD9oTS/qQwIdXiWDv6RH6Q66FuuzavCzD9RvLxXK9JOLpLwcYS/jvtWlF1of9VUMoz70H1HafFBiM4CtFhwhhEaCEfL2KIFmxBVSJIJhFfGaL+jiszB1Q+DYiibxzSNwq/w07ce5jeHdZuZxePBqwAAU4CtnoKyALRzjma7RTg7TZuZh1RqkY5AOqH51hdTjsKR5ljcIRWGj3W10OqhvpIIs2oYoornebpw+M97dXBlQFnf5rM1HD+nilacBYeerkFn7eg+IK4U2wkRUwAYs+0jdhikFWaJ4DXG5XaudEWp0heBbRbSM6EZ5SdEZ+lxwsNvJG0WoEQtS58WlL79iggiS5DMmbDby2tmOc4yVBT8lta25a+NeU3E5rCmJd4gd6WfaEva94WFqyrlYvPono0FL/ItGiAO2LAqWcY1DCiqM0rmvd/nUa+eKZO5+cFJzXfOWzUL5HD9d+dhRG2mQ8SMchcbuX3Pi0A63zefq0Ikfl0Xz3IIvEUA7BE+eYRTCh9eAaYuIf0LoPDEm0hvKe3MxAZZK2mhyTNU1pWNZhsCZZwG+9Qm7Toeh6svr2079DcFk8b1CiYwlpfxf8dWLHPk/mLSeXH+UgkG+GKS6RZFEXV3HG2A2tQrxlMmqsqnX82Od/iAyE8Mgy6++ejRehjvIpHlws/ej04ofFpf4R4Qo017X3Vkk+EBsLZCAG8L4kJK+h71VJtkqJVmNgs6UGztt1jz6tm7aX8aXTbLFdSv/PcMnwcKOmKwe35HsAcE6EvDuRkJMzsUac0WW8raQgz1qSrvs9WXaFm8hJCjlNNDzL53uNiE8u0ebmo+Ojw/U6kRk5XFYvUyBdrmd1uskgUbSRLrdbpvyPTNbx12Wsh+BZmZaAAeb+3p+zisEf6e4O5WgfFo/4dX8Ixk9OtVpDMFLFiTDSsN8T4TCjtJGpt3KQvLqSKLkCIzr7BRMdBfUwHZqRdX6g7JXjD2ZSzO4LPbHnyozuzcEoFrOewaPvxmy5/ep8I2bMfJll09N9g5OM3v0xupF+gl4SHHeEA0RYCe5j1sX1v3+t2OsRq583TXDrMyrR/GSBWQ23cyyxME1WqJOrcp8H8EmYvuHKBXfq+wTQMpZvHEdWufycK+dmyELf0YSjNgDZwcB+p7xxhMEpcmkOnSSd6v0hEZRJLpBhJP7zEBbMJHcmE+/u5Fi+gbRieiJFgRyemWsmqcKdaMZZ26knudHOXuSdMWFXQG5d+KC+WFp82av0trTdSmLhQ5kvtCx54j+cTEf94RS1KWPLRdZkxBujoX2BQu+HP5QavJmtUHTzBgsGKQWXl2KzSlmhF7cOqYPKtBrccyF/9v2QKxosGXyg6YuVzzx3Ws2A+b67IV/jXVYP0VAJkpWZDA9sJWCps1s5Jx589U/tSPnuvG25s/qePfQlkeri87ABGmeEGNdxsAbVSEfpZxAkTdnqaGyE+psgEos7YlRpbotYHstMWA+IfiOCD5u54+5SFgS70xt8thKjyA1QeAWPA/Oy0xEgHtWSiO2ZSNcfCW1fwH3Kq42I8Sw6j+dfTVwePyDGuBUEi+XObd4i2xQZyWHzfA+PJ5gxa/hGSlQh+7f8wKH7hPQ2Xsr/jM/wOKq6gHr49D6p0AiouNZQdvnTaSnaPh1Lht+RP5K94Xs7jV7QgiFxKVA3Q5c8dP8uJTIWPndoM2rXljGXM4teOZSzF2no+IgVLBSVANfUVQ2wTVuKbiuNsH1GtszEaxuwPQYyp9V7HzYR5CFTi9hOvM+5aOqsiFzza5REfvJ+5ZPVNryuLig9jnO6sOktpHB2hJXqcCWOvJWAFZJxgJy/+Kw7xNsT52AKeM499LdSpZKKN/yxid2TpN6ezqQv9SAEfriijCi6+Pc/LYb2tbjV8G4wbjQuJoZNeqO6O66UZ3pqyVt1XOFq67ehRs89Y08JN+fJZWkvnT787bV6K1EtIJQOg7YBl/ksrqcTXjEA3I7jSwuepShRJrtlR25A4kqoqwgZ3fLPyR+VLqMy7gU9L/RPprFWxBm0CnKXf9PryfUgmz78caMiii9NG2Qmo/bW3nWe3EjNqo7M+lTbWiGLTy9mpHiDjpkHO7KUuqzy8lhEi9jA9T5nXDk/pRNmMhHvSauOMJ7pgyYgyQxKW33zj7zNqZyXnJBBBN5R7ryhZ2juNPm/+DAcby0ns5eVil3kLFJGXhQ9bX0pPapd/2hiq05P6XonUp5W7QttfgZACxlcnbLcdvlccC4+Lb3v/HElcULJYnnDXFyHCF9v8frkJqDLk0sZKBruChp5PiUDpgonXr4Vhh9wVyyMdA/mOn297gyjFfH/9qtX5A9YS0cN9OsrT+G6lJ+egF/LGgTyPZ0NAnzDQIK+bAqqfATkD45tH5h3jqzIacEl+9OJOKBs/f0+/8WEBWkZsXx1pn7qkL1Hu8nbFFnZXHI75SC3z2weRHCJ4tpeiAaKmFHqZL9f0LIiMuehSOeiqtUVkO6QozAdONSiui9hpitnuqwmoSkYK6A9LFk1tRI/JdJNDUVtqGThGjIpCQ1Z2Gp4P3tIXgg6SOHPpP5WcF+T1Lni2cyMS8xjRYJWHGmndEkVs97UEVO8jKJA5nJqF4NxdElXZ7pSQWQoKhgyOZmuMO9XyI3PW2BOaMae4diToeJJO/xYizMeG6WqazoGysOzILo8F/TrjhDI0s5ta77D32i8FnsH3HMCfXu37MMOVZf4Ht/wfbb/JpK/grwQtf2RUG5eQNlycAUKaPdlEZUcOH9n+bkQv5l1OhwpuLRbFXzaLf5b9wUbHnPkt9fGlWlQW57UdzkkzkFPu5Pnwdh0Vh+ENCRcnr7/dDe9IYTCO+USnoaGGc35vStXY4x7k9M84c/yLJHYErZrZ5BTTVHJommzya4Mk4g1GeGAVO8BQ7T5ELQrKPhgoq6E9taS+r8hv8Cpk5tWTJgTtjbkhKj9GVKTbJqAHi64QNmnFm00OYLe0Mk/82GmvjGM+FKVLcunwsy1uIHDdWS30cQKGpZLLfSPELAEUmMCzwajvfNyrpiGsxmNPmsOhknGQKqkeHdVkdzeHn0Z0KOC0yi/Nm/EWAVbEjjrIe1W3Ql0Q0IF1CGT0Xqn1vXRFYAFM9GHFS+wU8wqNXHriLVlHnacNkRthS/prlwFQd930m3fNjbBp3sjDx/JCKsI3/i4JczKHsZY2MQBpuDePkSK14cnjWm/iNzPQ3b0rBZK8E9Kp1NnLmwyGyJ9ox9bX+OQVo135S0O5Sh5GdcliecVM9IwijEHfbldZbikdhm+vx4Kvv5pfjkC2MlKomTM97N8xGF1ArfyDbNkJn0PUQ/8kL9BmtjHKiDAN19VCfLc0f3T/QrsFfJIJ+Tyzyhf9feqnIS70JXm80Kf7CbwbxIaEQfptPY+hKJOnmrhGBs5j/drWzyG2mnRfpMRmX0rBmvl9Erx8fjd3/g14vrHY+fdnu8wtpQin2mHnXtMhaoXWqHAngoOoVgrhoG0DQ765qoCJaleOUP7lBQPthcQEHorEpVBHcDZZm5QDevzwDLB9yf4spLLQAtqd1K+45fL8fr3T5stBoH1L3EXh6rPZSHw/Nz19K/fLjZfpxpm6CpRi0Ytzw1WutNI6Hxj+JDdaHqlc4yva5veR9jYDvzfQxqJyAIduAnwBDxat+YIUVK6P30PaG01UAmuMf7BXKAZOIlxr5hRVjQoXPz0cSFz4W7AFupA9LEzctPRseLjU+Yu4Z8UgarKnO0G000LS9bhkM5zJIWMiOp0aqxul9979j/n4UoC70YUs6lRo33xPxea07dfITSaGtR1ViMWfbWcu3w6GOpFPOo5SlT5kG4Qqi8C4DBQ4kx/EiTAmcJyfcojoK3GdMr+hiI7f9LvxKp47pnqHyoqpN8JPoqEp9qbYgUH8g5xpw7V51VW/EW25C32XL8z627bjjKgP2/HuHmanc0P/XLgR6WPeEGXzKdplIujQZfd7hL6dSZajdGhDj0xGTzA/Mo0DQbVoiu1CdWgmQfrai7mLofp5B7HcydzkbjAtvfKS38XNrT9kffJ2ZfGDUNixTmUm2qJIyM57JMiYyosZp3FP0XMygJSshIT55K1ZJsShdQG6RCvrAcwfUmE20fZhpFn90M1G5grSlEvjR+bgKQr6J1kcKswtKSaWM/f6vG7HQzz2WxIKMuWRqQeSeEyxRdKRMfpMm5XAjjE7hSyFn1mdQWbrcAo6i1V7/hD96amzju3vzZn3T91j9d+FLsS00plVjkxmxgAjviIcmxByjx8aXGmLEafLS1Klyyllt6uWF3jn6bvmg7wQtwg3nyMxPPTenqhuV9YFbOzDCwehKsbHokCCCzdAcVzbiHUaXx0JVFBnoHlBnBR9XdUTdo2S5H4ScXkTMTEniJBDqyAEVatd8V8Ja9xPrFwSz7J7n6i6yhCq1sD3tokaUUoSmphfI++3z/pLKRSvk6cF4aH9aeEgYokmNXPaBnxt4BjnwRB/hMs+bw2mpZap/z+FOBG28gC1aTe/u2xeo+k8bQ1hYNA7CkxrKvc4kda6HtBlH+ffVKEMe9H7pJAwvGe4Y01sLQ2KB4efOd66Dk0TMV8XLQF6xBuCfOM8Yp00hGGU89YwU5fyB/PWr/4/f99rniaqle6KZ1gGYD/vlMbxBbLYIvEl7kowyPUTIkg2cMg+Eua5qXg4QZdWHTQOZtVraGXQIt0SAWnU1VSY2uGwDCrko+tdRs0Wg6Tsy7AFADv+KUfBFw/D7fmDrAffMtYOxnr1yf1ZKpqW3nO345m27tvaNi6kLvWn+0c8zG7obgCTPu9cPqeEdPH7LL0nvkkPvTWzphJtzhYFMijwEmGzzVmO1BFjaItCUzzN2ILFz3653aDUN+tTDCwVgIOLZ2vRSEdyaLedsFluFzdy9DpWJMCAkE6bN0RGGKg4kBoywCWnRpidwp+uOZdEzbXwlRfOap7PjTE0iLCmM8a5aQq/LYIdK/O+fWooKyMM86N44P80Gh+cwp+HMTbhQ3tZSZmWXZ2gxebQsS8LILuTCPd1K9m+8+9WjH3f+t1Ju4cVnd56wXgtf1/qW5WlNCx/eNZx6gg8olTr2QssKJsQO33o1X9zGpG4N5hiNUQQewhXf0vRPuMYsIBhD/ae3XpC4TihvPRx3DczgNe645rYecpC2tw6bk8eurG0u31fex3CTPaOIsBYfzOB2Fw4aJ1R5jUKbcQsoz/8rohKpnDiPpiYy5uP9SwsFJGK/0w2WfxtituuTLTO4s05U+Y47WjaLzJuxCj70EpaM0OQ0oMdE4/zyCJAQqJ198Mx/dP3ShFeNHSun5e9Yg4GXjsb6HGnnR5qPcBLTfkZF83uJsT7U4622pvfM8qN9dNvG7WV1PPZVRUDn57kJSFd1Tg+QmI4bHgP4OUzay3yOdu6LEZFYAj4YhkRN72p19tC8OzEUSr2oaBQ737nJ9k9lYAG5tRfWwRyjDdogRhv623yDjrdzz29Xj7AYfvIVccpWzOCKuaYHweZCsCU+Tf9DJMxDYgUxx7200n8XCtnJOlR0Nclm9SV4vIsoYAQMoJUxjagSMQYFrutjFpmOIX9E4cUhHUKV/zqVElJwW80J0++jYHnyz8fxGFpbquXrxZKZl+2FdmPXf0Cp7Ie92GFxN/7dR0hTLqq9OYACQH1dNMgc/g1lxPwfw8I1/H4rH2As3qFttXVAAzR9QzaGq/aWt8PJ4vDICsj2fffsZgl4VptktjG9KC7mLThMNcNkg1tOIIHzzoGgR/KjYU6Kcq+6EtXHhzTdTvo7c0+5/DJ3KXkRKuAGX1K0rFk4LDpx8gcbk038YBHZHlAbVmCKNlCKtU8DontRBnMGmJa8fMM8BDNv07hppE28O7EMKnFa6RNHyWLdsyHnt7UsFlKeiP330NDfaWBPkfbxV6rOGL7BCJryXPexEEoyshDU1WMbZvG0Q2/g0D1Wb/+kPueGoXMG3d8zz2oc9mZ/a8J//veLEcc6J3B6I7J4z+OwvT2GJ5n8IV4QwaOcKzBAROrzvyde3gUZsVPCAYBF/uhGiTO/vRvqXQ4b7+qwQ/Daj6ZNBHBbQ8aymVQIaEaiGWDCG/iv6cesDUhObkoSBlMVIP32rmYi05bh7AiKsrKjafUxoBo+iSScx5Hyw/0w5DZ9kvrQshSdX3b1lA99erzA4Vg2vhE0qfByJxbTUURTW2OaIhaxw1UgCCGeDzdY7X+CqZK/1JSZtDRMBDKWxZ5IRMtuOWXHZo/vakePQ2y2IoAa3dTxKJ4Ijhpir93N9PFTVDnOYKYDes5Hn5SHiMRf9XQa1Qb90xgW9Yxr/fMsx0LMYMzriSHVjo7l4wR0vSCQYSzUm1iIHiPFA569UF2NtEGfSkhAxRy/eEipQhSmdWHWiJmcAy1zujd8GznRHzIcdSx1bWosFMIik22S1q0XiOfkhiPsLIhuCAp+6ysoBJ0bD8fZxwUL0GQjIi5rIVu83+XRp5f2ZLVNIc+DmooW8EzpkbbCFfxHfRYTyI3KS9J5w5+KKIL4dpSOA1bahDgXOCoUNCbqpHfMFELvMnnbPIQw9bbN703zaljkCmp3hJUVhk/MvBx2yGukoDqS+KIJx+Zz5+GPlFf/L0tpJMUZUyMsFmf4xwyhBBFvKnaxlbCcKe8P/KjMimkg4mdredlRXKB33ZHbY2QL2SelaI3WGXvObdNvXF8EDMAGjW+ibBxBQPfnSw8dg2gqAs8evP3XTXpLWVZeOQUWYd278ZNGF2Ttbks+45wla2HsnT7FgtQhMozqerXCO7kYpXIMw18nGLpR+6CJpki6BwmmehdllelASfixzxdBJ9k1zQOVnGSWatuA2io6FBykvEVIxljfYrByOHPjyOe1lfuBOlyjFtBM215NJKxXKmIoxy1AG+c+TR+p46GzOLN5c/89rm6NaQawW+vVNdCAkgbwDTaGdoAL9JZ6wbu99gxknihEDweyWUFz9USa4MCQyh2O56gFnxbaeHjl8XXhB0lCi58QwaSIVg0xcpqhDz2TdMRc66tSz33SDaI8auA1re1zwDmQyHE4rVmP7ktAb2k+++Jo8gejl3Oh7nr8mdv/tqs9nJkaWbyOc4Xu1826wgq7KGCZhbvkf48IlPyQCoXP7JiMNJG0JaGqTxTrp8EkdjSRzVJkdhlHz9serPr9RDtN+b+pfQkEg+RbJw2c9AFSZM/6LIexYZKkhGXMeP0MuuNdkMx3hPEM8jbMlFZKJLJHKGvqVUxey2ZTzMKyV1JXQO6v14y8fguLLdE0C+gSinEKArzGrY2lwNFfxSGSdE8kOxT41828TRMD5WfiECmRkvsg10BLBUvD7GawlVJXQkSXAsDoII0xZgPwKsJ6FrtALQENXJC4IJZ6oPU5iUkTbC3x029GeOl8Va2uFbfNywptOFAHWUhJCSLn4adFc7QABQ8S+KPaX0nz+MZvhgeZafxqvCrtzOPO8bTv81lmY/nBtfqkcrsy6hKeuQi7EaFUY8uuXVJGn8c6Xdk707CUhAxvPbC0/V1spkVg6nT9jT3HdYG2K8Qa/t4Jpdffccl/Dmf1UyyxzEXh/n9oHMd2ze52cDYCZixOxXdt1rKdEEeNqNKDT67rppojohHvI0JzC9AJLdEUQQ1ZeWS37Imhlqd8NQfzhXSfmdZi0dW3HaxI3PUNJnQY77dbKVvfUkj7/NRSEWCMi5+FJ8/MbFbGTOn+jnynXJUEq0Se78n/cQOqtJgEqJCU/yUIJbKi4Z3XcBg6KW+Xiyzk9CmfjEgUfv6XSIku22B/ZeGUkDWc6Ebk7gN6rcYNkKKYI98/Uuxxgv4VyRB2WCvpVRLiQvX2MLzGAwhOgaXA7LvAtcMOV57+rm85ySjz917RxInDLLA6d0FW0Vc5J155ADTuCFWYoPha1kGJbemee5rlHXZOK7RnqJQVRcsNsX8wOHuKiXWn3QHOfj4qtKx4YEdvrEY2l64yvlgBJJWdqAjvJltMC0BRakrmuH2duhfIprXDsAzZu6etYVL5vuGooJnjY8m9/K2GGValXGJHklqJ6r5aT/3ox9pLUnzHrTeMVBYo+jsI3/E2bw0QUj46FTue+nsRq0vL/rqfafTgetp79oPLyPlJJ284jVlKbpRyZdCLumrU9UlQruJVhma9796orb4rU07QkOft4NP+ZraRqvDs7020Rw6lgH0eIPUjJla1DhlpnEG1Hm8ZWQBDFtdV1baFvRD2hZY6VNSBxHErzibkkxzQ8kuElrPBo0/T60jvpANJs6xvPU9+So6Zf+t/HmdKCxNnlKHSWT8fTC84wczZ6EIlaSy16Z5bOOBqB6R+K/Bq618kC/zo4HsTOMeWX85FnPPYHxWebXWnk2zZe1elhuoKAdWDhz4HUkbmem5CdVffy8xx/036XyuYIWkI4TqC3GTne4b00rBv2JvgRk5osQG3fU/yvk6zaqtVj77GkYOjTyuC3NCfJdod78I4LX4zJj/O8wtwquDjvjxdMF12OuEYlbczdA2eZIfnR8vROVIGKo/1F5xOVf517jtWft4B0XLigRYnnv5HqFJb1bGLpXyCx8Cf61GgN3G5HCxVWMQXMhhVkYlVmApn/aEtZQEp9Gnb8M6JAzp4swqiev9M2eDqF8YC4R+XSheUksswPlOZ5eKrAjt4ohFCdxLpfLi4g3XKuYk0hYBkhBxGCjYUVgCy8p7abR3ppLU27FN5y2t54dP7Jq1BhPLlf0M6a4bBKDXKENhr/5NadZOiG5QqfgXbkE70urNB6zBGHcmM6Jode+Su7kguBxw409WJV8kWxJ8oPJ3GrTVuWr4cXwRAgIWdiLyTkpnSX8eWkX2oyVQFVrAB3pi1v3cijYKnujyGVfDUikx4Li/HjYk1S/4w8VQNLucHqOjTo/375OKDSQkbdMDg4NY0N8nH8tiy0iVP77ESzH3+A/AvR825e2SJVqtYK8/x7WT5xTYCF9yRqIoc5iLze6bg+jBKouMYTNRKD8sp0L4MFmZRjK/zCD7Y1CWRiyAJE+ZcqWaG05iKW+42dTYeY2301wmzIveHysWMI3beFtRB9O3Yq0AE2FV7AtlUlN0t+TGjCRYxRMcpkIzKNU+/JXTg16342UE/z2Z5eo47Hl/W+nU8pGpM+5YCqrP1/5E+++b6uKDOWkpq+Bj4PZiYZU8S2TA7vyHSzKjmc7m7eTbG0NXshnSv31kXt1ToB35j3GrsA1iVVz6y37c+NLh7bq074s2RcEKRgHoAe4T8J9vvDYFgBsdMqjCOl7DDWXHZeBz0uznOpO/sdcTDpNpt8ZooPZpXQOpW51h2GqNuKr/s//We6tL6uWznR/cirusL6XHqlqdBhYA6rTJjl8g5cjPYoytFoUW5JHcuzqPr79PXKosmXm0VBxeGXwPdSJdhfIfDFu3LX0C3mratIsbSVDGH100KqZZBsjhJWRaO5tAAZ1Flb355/xNkWRrzwKWbmPiaju/1fRW6QTcUotnemQzsbiFgx/liQ69HuX9ZixvY2yg1xBsasHUeq/aAlSUZJFLPywiO5xN7a/xweJVT0cwYYe2Tk1lACvfy3okxMhoCcO9FgKDvKiUS3pVjxyFZAdRFSJtpxxq/X2V0Z9ZEpQ/rFrWLJTxr2LmknNmlyUA1SlGfdPoJxkH3sXQxhOyFumhnTrEyVdDoqaKYBx+idX421x6EbafObfwZIu6/0x1ZwxPUPhWUNVfcsu9nuTvSgiOEPD2SL1GXP0eMiGHq0JDkRo74RrPXC+FAppluD2RssZzHZ/g58QimyXK6ZOyq0PQAZvIitBCLtZU0GIZCqg2EpUBhzMhQtcq7+d4tfWHMymminijBWETlaz8GJQvXn+9xznD8CBAuECMGrviac+9WP3DUKyYbas9D6oXBzUMqiQb9uEFMbdRqkQgOxVPIgzPESo4fwiYDx7yX5L7I3eBClkA0Xdt4tdOchOphq8hIfY1a9Kl852tjn49VfpILNHHDvlEx93KOoAGccNQceDVOQnbtIHPzCFyrOnqeu/me5Rhbu+Xty5Mb1/N3/CpJlSRCcS42CTsEMqI5MiF2wgTu2rqwKZ6xJAvzBmCStzc3NtJiPJvxd68eFUU4MzErX/J3T+VaVn5CjL2ZHfg7PrqauIbY9Dsptru/tZb71IghWXSeIACMOJtgiY2sXDOLbl7rNuBeJvfO6HesNWfzfU8FUfSbZnDDE1LZgD+2kzSDcvYXPaIlJLk5hiJfPXUaRDJ4wolasIykzhNMoyyHeaIeJqfhvBQhjJdPObqSi7QZFICDXlxGHjaSg3knr935kWjflqwxv5a8sMOfSyq4cIH0Lt4j+Fxn+5jU3kBeHAHeWxtQiCjIQUZJOqvECG6JIAT5vFnMwbZsw9qJR6iIQou9CRJk91XewTbP3YPAO5ilS9xAI6gG415ffwyMQ1oZqORjymxh+g7HH7RVo2Qu0Bwtta9lotxAz50UbALX7cz7ifYs4fItebyG1XWgTpcdeHmJMKqgURHs5CUHvlJ/CK5xZ+l6dKM71q3FPuD9/BmEv8uxd7WOLUIyLx+gSdOmIRsuMe7QZhkkKRNlASpvYdrTPxk5xlbZ9cEesx6kp6YMmTbOkg3IX7RTy20zjscvAvJawKms7TYCfMJVBjE/L4oG5JQWx7D07eHZI1bq332JKxqCXNM64KVmzc8C06ixOgr7YZ3WhD+loWUpe0PJEHcfDIECR+LeyO5aYpxoNwxresfDfSSJx7kPflYBsrQxYJzpkXUc7SGD32v3GB03ZFVX5+TayEA52kvrzaOXa1V8Qa4nklBNYpgjn1USstgbY0ikzgdjSjtZfZS999EAmmfadwEHGpIPvvlR9l7OcR+bHX/jlX303YNr4+uTELnRpE569Ja443KqL5U+5PhYSE5ICdGI4iKagPYwW8SUS11lC+LypSd3OxjFp8mqWWYDNJis+HwaqlgA0zihrCIhWCtVrtCjMFVq0ykMMc0yTqSKsCSnjpJREmUtZYGqhIR4uoF6B09bJ5n+NGntttOzlhfMRNfRG3RLhHKcs6PFymj5odg68nMNib9ueQwNicoI7I8rPkE7ukVNrbYU4zv83fXtP16S86uCJB4lGrrN0JbOwuqzTtpRnxocNLpCV/Z7Ksixcj8aUFoZvZXuSyaR/EbjAQxxxEpDzCSnc9FZntqSWMfy83bvSPebdUPL/QxKUba3TPmeLIkJCcT81EI5tVl3ZJt5qZmwLPBiO/84/0aDePW1JLCviKTQkNkWcKSPmH58FTzrz/NgJ5cFN8DC0xbfMiT1xWZ1maVINgrlaPuGO4yXZWK0tYSQyj7D4BtW8KxN5/4h93PHOgUzhqnnVdQc+2VSGSDLu/GtR7hmI2ejWIKkPhq288JtojNnwDrl5LCe//l06WLeuwzmvZ2vJGUWa1a3wI3tXKXkPmT78Ll5touH3rQjI+cP0BGqUsP+u0a39DFHVHk4RjJtB6QmcKkKBgEl+HncnpKWSekUymzErXNmKapapzeOA10y0x+aQRGY11Qi+L5EpeC37WY4Mkp4F0U97P9VQR/EnOl330gLS/VGHgi/rnjl2wLJTiI6osENbxSyuqcmRJOYt8rnkb+U0+KlcOoQXVBDzfQZSaRtzB+xXfyDPUzZxY4mag9+GUpdramMkrHmxFiro18Nhxdk0ZpzsvuoyAgPkLwQLqVralBcY8ZPDTwSNz73toCsnt549qu/WcY3zPu2s1Az5fIMItq4NcoIlbtdr3hd4Vpx095V1UU1nDHKg6KcBn6ZCUQBJRuFS3evh7BYa5c5BlfB90e3m7HhpBEKFIzLeBExtILm5aZuVYvOII24w1GGUrjJLDgEm9sDspwGb4uc721LRrxp8xuW0yROBy8+mKmhnLiCpFAJEsYeSRLkIou8Gx8JSCUZwKVvmrCNkA3Ku7hGFs8YWWy9hto0tqneqFsjhFnKq77ObRncf03uoJHVdrAmsq3T3FpIdLDUTUwzFA/4GtmKuNXDLwMWhz9VpfqFfQmS6kgiKz8WMV1ftqFKQDVJkZd47QQMk0qasa/0fBsyKkmDSVVoFJDmf0Gqf5B3PFXT+U0nNW8zvunRtOaCrmTjopLbgCTfcOzYcw/J814i70VjF06LmKqUkxQZnMF3mTlZv26Lu3TiA+vf2Wp1lxg4cW5RNLVUHuZ8a9jqndk0vtudvvK+cu1mdJRcerteFukYY3tceOL3fmPpxdYq/+6E4hd8/9q4SkwMZBkaccbMvkmjp7NDVOGsuac7I9FKku/t3tWrffnxW9sKEhVIyJuOkLEjEGzUdfRyULClb5n39/tasvNfrWtPyrPtO6nt/qRyi6+Pm3gtckINZ6+J66oGeT/OZBYM+5nDRl3Y95uSYifChy53fyLXp/JD/p6c3KcuMie+YfltUP9+eF7Nh8XeuM1vPCHTT1xszGS8HRPCP/LXlJH/b3emNkJANz/CbW0j2qST+m0m5dxWGnNN9EXV69UD/POiMcXbVT/Baokb9JFLvGMTtRsSnR6zL/cithu+NLPWSsklgPWaJwasRA9KLn2pSHHaBJsAa5qpVg6bFCWqAKvQ4hBX0hIDNYlu/GLm4dihP5BnkMEA4vFlddwFjP5W6+/Rmubm10PO5F25KvCWcFWFiDuzrPttedDA/njLVE/9i5eVgP/DsZXA92gWLJ59A+yS04BOFYxgS70hisKvpZ6roz2fW0QXdfSnFlNOjh2mwuoBCQ/iQtPzVYVV/3yb7MgEywn/ODQOmSElVss6pVwVYZQl03fPWQOlqYkdpoIAKcXoKcTjjVIjV2CcaFvnRVcc5lNfvbiDWBVrXp02Vy+yUTGYdOPSBakeSnwrioorN37u47/JMnitcLcEmb4pL0RzoGEOFYkS3hb1iHILXs+g/9f9ST/p3pI1zLCzeXo+73ArgnItckvb3dhsS7rvntKdNjEpQCOXsB4zHKNpbyzTNjNNfXfXw13aPJB1npvbO8lbZD/EHhiPzSAAv0u36Jxj+f4PTKO9nW7LWgz3GCUqDSOFgtOm0L87uZ77PXeGtnXrUMQ3UHNEvKSlp4JIyV+v9gIVyX9uZcIKmVl0n5yfQb23kV6juJQjrZaC9kqGcxKk+yyBelR8qKKSXhZ3eoL+w0ZIME+f500mxBakuQspUqj1zicnmxPpNaGE/W6yb/RqRFvMgrDvHqt+5ILhsg3R/Ly58PYBwNp8p+VlJAkwN5+lsdlhlA6yH5qDj/C/vgk3u0J5fvM4jeRohmio8BRSVuhzTgEOmTe5Yu4Z1keQchj2ekk3gmAVREJCmQI4Y6M4Ype0cEPmq/9NdYRfKsqXSYmH0zYymQ/9Q8XMVvAq0Ly8Udtsg3S4J6yzHui3m+EhoEPpH8egB97HWs88P9yeoRnteauY+g7YNMq5suiuZKSbCXM3WmAEXw514qCQ/kmyVZzD4PJym1lz17vIkk7on5lxcy2UXjCyM2FuZsM/pmVomBMrgm5+dxDH7JySH+GW/ssghZubkhuPiNDKgrh3+h9NoTpzbt0xI3YsnqrCpySH6LF0Ptn2WhvNq+GVhqN2Xt8kMl4AqPXkXRwai8I/zqmxFc6oceu+nv44kauRq+doLM/7M/M+/Ekvg7akv45xvpz8A0sQLOqtlnnn4jqOEJizIlyGGjNY6kljk9tg866fl68cBke3wz76VDelDgaf2hfjrq6smaZ81nHy2iyxKzxRSmWEOfl4+UuVAplLVC33p3GqwPDamAl9eIs8YWHeLZ+oLQPFmsuDHHbhyXEvzr/2oqfuP1642Z/nv3a9IXp6rAHSLYHMFnzGWE9CoDSMaSwMTiKQ0lk56yhDQgApbucPMQWsGmX3lnPJNfHvR+8FMQoC3oss5/as+LShQ4EqKfhq8GePUbmyGtK+qeJ/MF50zkpbyl/+4d8v+Xo8rWvuwe3nHQDIjcu0rSkP9uXu9m1j+kLnjQgEWvcdrVfZghgsiJ0i6LOMNEW1B82LUr7rMxrq6HwncLLi62uc3hrDqAlslAV+ENY/PVu8MwgmYAfxWv+vv3pEG4aQzCVVx7Puoz+0FsKPVM7tzMunRSGDw0XuYD8pehoiXwu+GcvleFyjYMSsRF/dcpYfXEERez2VBEM04TDv0B4DOel79ncOtlOZ7b4E0j3iDTFz87TBJxgAWOfMXdUCCci2Qu02UUBZUKL0cN+U3tl8KwL6A+ZUDwwfaqEKxoI4dQoIck48WhbihFcvqPu3cwnuMxqsShhmi134TYWohtqr0v+RsmDWKT7I1jrCKpNoDoDmqcKrrVXsRgYBxAdrciV31yuzQiLx+wK4ucJjFfZCddo0hQXAoiovGh41g0UeFPvY6VTheS2zenUroU0IEKYwZ5LJ0s+MhgJJZufG7zAQDjzmHMAcllLCqW7IWmU3KqWIvZZkRaq+01Ehad7PbBp3lMmrfjvlVLN+h+my2EWXY88vFU55C3vTyU+KFbTe0qY1F9yj264si4wC+UO2a6TIKBuRe+PKV5uefCAxl/MPQxqyjTX5+Y5SZpC0FaaT9ZnPjlAvoD/ud0j+Jt7xog3ekUbKVnpJlT1XoI2zr/3SaKJisvCmsJuSZ9UMcYhqk1KUZpLwVj9Hb9cy+AmhhRDjBDCU4Kq1IyX5nE7vHd5MYsVTdHh0zVObWaitdh8ZtmN9n1V2Bh+RXcPrtNyUUXxs/n0aJfZ8O/Q2W0JFWF8xrvYyssYydP0OUYT1ycQIT434A2WoFTKbImcZnwDgpzy1ULy7NcaXw60MGsOu6Yi09wlGwtjX12NotxdmsuQFETIm6NgBT8UNR8ek2YBV56zxpiLcnUsynBvYdqc4vpmvk+v5K3wezbqeUemDspfTFBemuI2UkMqrzKecLnKIDYd4rIyHCPt1oN8h3DuaGpwCUkezOM4r/fMrZ0bgZF/rF0UsfoaoZw0xffxtKjuzCZDXfO1t9IyYcUTzyfjzWHs0dRqGNw88ZBy719wa7+1Z29bP//yNBhjaZbsGEd8rUm9Vfcvh4cCMJmG74gK6Y3BmgBg+z0Re3j2apcEv4MjRLTLGi/InZDYAyasIIxxvtP3oJVYWNTY4ng3SjkXuDvOfPLSrffxtL/+KHrzV9bBfrX+AKoXlFJGfDuZhZFAMbFHkPpdYi7DiGj7PWEqqnTeHhsI+CkyL7ZDubrfWWv7fJu/sSxxOsw6hclhDRlH6WOefF1R3Rpow8OjuE69o7ZpK2QNiv76ZLjSHYoy8vJCvHn+gfbZ9821oGyIWGVh0JeYaZzT4kqc7DHiqMMkFkSi+Y6XCz2t8aUPQSJKk3bFBcTdYWDvLA6POyOvGsDsEnOch0GehuShlxOAC38Zpms4dpj87tnU5v8Q5e245FfCZoinrkgMAcAQmwlvPZ8BiCFW2Cz5x+H7cwB4qlc6l7gvBtyZ/+j4Yx/bjvywxgsEzds6h6hiRPQ6sd4Q8MH4J6zBdNQjN6GC/kkUs3nrHcVQ9Xehl5E88NoD/qYx/IfbLx2Mofr0HU1E1c7uoyAN6xa1eqn5UhJnh2yGP3AN8zqfA++WXSjaAcoEhGLTGOJReZHyvGQSgklh6sceTD985OaBqf+QOfvTKSmOFeOTPSdX65fbQkF2LKQm2uXPkTnYmqZ4xGWkOEZMQs36V7SO/HTadTfFNSSAOLdTn3HJuzcIB3Qs5Odx4OaTJh5oJNaDnxCp+X9dQ4rDYnIfKGfZw6FycYsdXW9wqJ03HcrFK9xWRuo4bbWaXvxd0kK466wfOWlh3wiq7gYKuFNhYGjd/nnpsJnIQ+bdhh6FdnCtEYMT9Jpr4eP1h9m12mCgqLyHvNkPvFjJhJ36kfcsNh1/ZPvBh50mo7Mr3XRWjGV9IMJvyFtjCbzAp52vJ2EBLLW+VU/jf26TnoceJjJ9xxbvxaNxEwJ23P/lFEmSV2yAxUC86SoEw3iVvoiSAQBfjntPo9igjdJ+IUY1NQkvBARZ58h/+t6OI2+Pd1JWM3S8YGvwSYaL85u1J9fKT+18I/tXpKlKvHXxRUWlZHybpTbJUht6siLE2U8bbXiJsj+NCJg/hr83/2viGrR0O7ucNHjZ5el5Cp+FytXL9OibsVquPNWSOX6eydgkmcNzZR1P4HDEWXFpsbdccpEyX951IaR0dq8wIkD4cOOYs8lHXbrVHO4xeUKRX5Jddh0nYMDdkmVzKVDeD/LWBh3ThgaARpgo4y2Ud3CUK3uCiahPBVpfd8yIc8T8dwQVHCt/qHEUydIRKo8wDkYfAO0ZY50AdMMXtvXY8tAwHBHYJeX4J/lB6uASklvY2+Pb3meoC1t3b6vQ/AxmoQKx+MaE/M+hWDTFmYSc2sLH50IYIM9xkoPe0g9P1YWo/xUtfXTELnktSuWdaSYlZgSa7PnKDve12Fc/QCZPg17w/N3meAIRnvvZQ47EAJ4b6XU9OYat2SsrrOH/jTZ+kjIfyp5LzygsOyxNcfUNr+wv+p7O34D7pJmUFpm1rPTbWMUyaqICOSKMfzUTvDMLx/lfsn0UyTHPxH1WFnxcFRGnmqV+Zlf/iVno7mJyNur0B2XAYN40yH4s3JlIGw40JnlbBNQi0aIKZZf6xRAHICq7CtE8OhhX2uFoTJLKpTco71czb20O35RhnvsKCnoQ7My3YqjTZrbHk5j5RLvXd3xjgMx6XqBvRaIiqjOd/YzpyuDm/c7OufjwYSBFlhZARuWogAVBK3+XE9lb+JLyuh44eLwitBoZr4IkDQLGSQW46R3a9stfdXi7IhK3Xs+LnYF3ag8PqBg0A9SbuF45fUcXBYXxuPwsvg6c3U5FclSZ6FkV051Shy4bTRd0IIxuQmIuDWLMKuqa97DFOJQS60p5mmur/3sxLqbKKE34BOOuiFb47XufO3qtqT1/2AE5YneGxqBrqVQ+cp5Ki1Xku+1q6rvSz3ArHSATp0GXiMSVLrJYfWQoSwydPFUoC2h0ORLSlxgSw1JLxdmkFyMlhkZJj7tGYWjDKfTxTnNZkZzxywp3YTPzp4HQbfGfEDU5duIbHZAIgaGigkowTCOdxEvxvzhq14mQvAT7LbaEHxkYQatlZghXJkpDNijQDZtChByiEVN35/u6TCYpjBi1z3xBVI8tZgLxgzVziIdXB1MhHqEne8JZVASaJIeOKb1yMh5N/u4zXX+ymb469bFE75SbMqFPgDaesOvqwBLvszbZsf36nzenOCwBg/nTRh0PAl+ngWL115U0RGGiSOtRSmTCdbOx3mToCg5bY7LCoCCHXjkAjCmV1zvtcQOiDDgsEaMGO/ISgQVUGxnzgMPv7q5OQtQWtLpSCzJkNV4hUnUxrpPZXrZ10cLPLk8j6KREghpsl3cIGxYFTIZ/eC+uFpSy6uMBXN93gcawthEN6r1kGmbqODeZlEUnLtg3hTCUdCut4CW66TyGXz5hDnK+iZMyeBCpq2/pIJSpYwEK7Wg1oc17bxPZKtTIXgDBY54teLRoVg/B9yVQEjET7j0R6q07/ygOj+xVm/49kcqClD/evnaQod0XYBO0TkbaOb8GbuPGgqbDWfDCVDQPgwB0lA9MORIRb/7sUkwXUcdixkqDVPVqV0F8oJjOKut9OjQuQyAvoPp5LBY5RcYQW8YDhAjRcwtxFDhHMaN+z4ey0tUAJ/y7ZJToKK6GMKolOFhFtw7yIHuDaE3dw1xbj12NEqCtUWsts99Nhawf+igv9FArbY7x3Eh6OQYxlR5Sxa/2jqcY17zKjpxEjtj5YPFRr6utVO5YzmxybfMjdIpkTaUFTToPzE5YUwhWMhv9PVJDE8GxQ/kvaSVKpyin703q/N2NSbOERnDbBQuKOesv9PElxgLl410wrHVI8j/isQUOxNCRylsswd18xtvMPvl4Fu3zXPqTfVnH7Rim9cvDf0cVJB+817APMIQl4B7zJf/GyXPCS0ObsFuA4Q222bR8K+6NtNjWor/eje15y4v/IsZTfxVwGTDMj+vlv3YqR5Kv/vs/281Fg9wO2LP4NpJynZGiwBaK1U4k9rApBsN2mKs/8xLkoyP4y15BmdbrsEat06aEkMqiX95EMl1QV3sglQ2f36+qdUVzinpwtqKoPxNsT1nHbNv45HXUvWfO5E5hOS6RIBllulgnef51ss9Vm1QE/GTYZKWenaWts1X3ZebJXMXOYHLiRqf3Hxfw0UT9VpaMkxus9+og7xxH4ziJG0ELxqDPr42BzYvlaGSJjyTGkov1AV2UyBxuRUF/DMBy59LLYADWn+KnaoDdL/tAhgBeh352QY7818cIDlyWokgwTXH6WmzPsGovXrEfWbZ2/hqnCHfBzoRu3tLefKgWXY2d7r5iGcxtj3HGn0Lm/hmjsoEebig3TbHYA5nXQJaGSO4YSTDGEi5Acv+l9b1jq3v5CkEjHvnjZY19WeTFcLTbqt+H0MffP4rF9x2ycEHZadgDl6IQFWuBn8eT8wVCWLmmk8FH7Dr3qzP0hLtOUqaepjzZGUjEDThx3C3LmbWsleBFQwxc+Lj0Td9r0BRzhGkADFOJ36z1E1mnIB2F8VPvm4vwVuKmMq5riwSOOlBcBjhaPggQrhSL5zpMJREahDScvv+fIp042KmM9iK89ZypKd3yhpXcPYvmHxrvSaVq5x9zIfPeBHLhWmk76/QgWS7IyTC2WsUnNGjtnPI+wcGAmEtyGEY1m6KhIQhb43FI2fZaKJlt/t++oVKIuUzjqti0RWBZdgXs8hZYqVSrnyl4fLCMY4cDb/riubYTUynFBOr8ydo8Ypl2/C6gj4+ay9g6H00w9o1FKARBK68BnkcMrmOR7dYK1t8AHM3WCuUYZk0G6fqDsAw+8l4fBiNlVsMj7SV65N9aOQiZlrc6QmKgCV+n2388iuelc0Ol9QW6DSnrlDWIe30Ligx4a+cHztMuzCIxFBGYeJ1FlHhkNMjIXTqElD7md+9o9Hjj3TAKFX7tjVucfDBX4Pzt8OmP2+lWFE27Q4ZlBpOOi1fT0hzzJ070UbzudQi+KxwoCE/ipykGvX0NO+7FSZUw66KEVnJjGYN1r7mlljQ8J/Nu/wWLNhVcJZ6Dac87J3H6xw+fLIkJY5RfJ+F9PAFV1FIIZBSrVHwUC1qJjWWMZ/GMozmJOpc+xnhf0SFpNrz2nAO9Ev2NMHawaudWgUM6YCV/fjkaMkpZ+pEbYAi+X5XX8lG91i68gZXfT8b7YVPCLhN+kIXyb7PJJB7uIHtiOmvhqg49czilvHDYO8XKEQ0WkDBwNGValBoGZDNJNs+/93v2KcCufpBya1Fa74b8d+E71ruTJvrTmU1NH5pJSQW4bOcc8JIf98bpoS2p3vA2y1TRbfRy/otkb8pky+l3rb4Fl/0R7jdoso6txayyb6E0DdA+dDNs9F5M62Ed1WUJId4NdWp/sNAt1GxKHq4f/PnRDlXDbYAWYV/wvsJp4s0vvxsoi8O9r7HN9qAMFU1FZrOwbowoC1TQMNjr8tVMpkhg81+OMhhNLohhR983EoALTDhuSJzrkiTASO33vfYgRC0LxUtaCQ1lwmrooPvEcOAPIiUqLzHNyhEndEo+lDKBZ8PZSA9DsIyJMATraQpOuHzcE5MJ/ySOH/ItKN0gUIEENXaJ+rs41cNvCOu3XY32yxJqiHu8BlzAxLgZmuot9w1HSq3yKFKdFQfK7mo08DxxePzq7jZaZdTj9YrgT9YGCcQbvc2BBritTNpC7EG9ZlRWX0ArEo4POiOfH9ou4ln/Itu4Wurftvm8+ZNw7O1hi+nFceMLByFeNa4s0d4zDQ1sJSrpPzzgZFJFYzVSqr0am5BOE+FTZjw1bXSh5/Tx96vZxZpzHvRh0eh1E5tJydRGbzDFfRrTuJOnCINh0xLMLO/g3SUJ4RoLPAXxBR+oFx+qB+QXIIqZrT5znfnfZd3nvZU/zPcJ4UbEjy4z6L+/w6sJ7H9xmUbJw+13d6nIHDxHYWQePZTx9jJO40saiXV5vcwed9d4zL4I6BPu6DGFsNMU/6ZnvLsFhGkyDcoOEJX4Rvnl76TLVN91mF03nZZZPpQTZbQy9uHTLM8dEojMNJct7+acGSktRSErnnT9o70IcjOrLnIoCtg1TKGH+ibYAMqAFytCmWS/2qvvUcz89+4Z9WGjgqk2URpEN6BUnFtOkuyQpGwFr4Gno0/kf2dWqeXFddOxK0pYuqFMP0DOOyHZXZjPFHgRI3mYHoou4e+VACoCL7AEY+rgcWgS56MA4mXj69nLGlp5tMiRuSF5foxIbzPQmDuqDkZpxRsFFiNeYdBGkmHI7Y9jshewTDGYfqci9FK2oyL4rYdv7nVFkDvfjiFWB7OM6vo20kY1kCUuZnYEd/WqoY6Ebye7yL3N6FAaFJ2vg1+3Yjsu/+mL3P88OB2wx7xiri3uBfBa+Wlt1PuwA2G3xf2/Y5HP+oiGj2DXv/INxP/HZNEnTKwdyAoZmzX+jd7nzl4rq38eLFq/sfk/Y6Hv3V/2Xuu/dWtHu+XPFsmz/NnPyGARSjQKuSsopRiAzEFrKgZU2fzPrZKA5yc6QsVBu/DtY9SjbtKb2cqa5/Loq/yb7CZe7qBgeQEN0g4yRpatSO7B5SI13W/6L7inKXO9aoGuXis9v+uRr3e09M774/3Ko1TnzWPFv0N93UKJyH+f2FUFu45Ofxk/811vq4jrwolF8eExm8RN4L0rhHkp8KqragCwiVXbinhwjY7uP96uPp9h7ewTcUIVsAr6vRXUhMuau6v/XKZWqqDvehCLMsONeBI3lt7zAJnDqumme23ISqyvfVsiwEhQJdXtC1iOAogmgBw9SiKfq0HGmhbIF84Ub6ZBWb0Om4UdSEePp4HInEtNxUD6br1F6yn23v8W0tZDzwpKd8oAqlhcrb6EJ5rXye1fFQS58O24CH+C0bD/V0ZQFWB4il21c3xDEvW/M4wxls937zpexUyYxQmUIQds/LauCmCiypUj0Yly7EzEZRE4RiSSh1hOT4oQcewk9Izbh8jk1etnF7udz7wGwAvPPXtSQv8adXmt7hxFgyEYH6VZRRtJ53U0VwE2i/llIfRLw0FAPPIIPYJr6HUZrrPRgv7c/DlRPVdNfGYQvCuJJmdVZ6jiOOiBpPkdKAlvRhqo02jqoW2ENDLC6tGMfb9M9/kzrfsSp1eX1EAIdx2aqLOkSwTtqblh61v6TL1FyBuJ+zv8G1MYG9qg/IGZlaogBTGG4WG3ULpT88Q7y65i+ak4+/nPQl9ycyLwqqayAuwCxMibGpW7sF3opZFcQQfEz5Wd1SDfl5wrDdVxKuHIouOztvnIq/GsdfHr5vhmpYAjxmTPzHwFyrzV4ESLFbfik+XTTCT2G+9DYs42EpyDRq4SX002qCtttlsCK7jG1dy9wrnPfHcj5dzJWTGe5tHu8Gb1nXI7JQjvtzYPEmM8kZh9p/SS2HbR2uzd/Tuv8X9R9dZhTb5x+7AI0iHdIJJD0NFd0jlaBJQxuqSRBpmAjFJAGN0pIB3SMamBNCMkpENpaXg3v8/z/I73nx0cwM11c93XfX7O85P/0VMpeTOZh1CroHjq22XNFVdt5ZDL5NEliGFuTgckRWaKqv/r5AYSL5Cto2ur+zWj4VqKmK4lNVV1ckRIMe5FLcnTk95UCzwErmvQ8zqZX1Tzrd//BptH7LdnXRCLStfQGQn6FsCP1QC+SqekLPRaMoQlvu/BhvtgfQ/dVs3hnvsiZQZQ9aJIv0QIe9NiQUNKRuVga//fEvSSBpxa6IMkiMhQ18gFVVihidX9x4knC+7B7wq1Bu1tHm/L2LNFZy77a/oKRUUViGg/VSAq08UkrJE/Vsc4fMJlSxfZ1ImLLvF6Lw0uH6snmKkl6JCojwc8vNlvSVb1eTgQT6nuyntp0NWERp7CZYTl5R9P1uhvrc0mGwtBuE8u070Ne9qTQ/K4LszSX6pmAg9YE+R899T9M5Msz2I64pyLSF6795BHqysLwv0EknJF7YJZRfkEgjRUOAyZx/L7SMzcOPzLbXaRfYFyc58/60TCTGcsilHUj0++VVgcIcRkpwiXHu+oKSiWWrMkatgCN9O3j6Piv3SLQUtdsagJ3IcyGqH0XySfp9wt+pdPppKJ9TQultI0ouQq35a6KBTvCYKCM5PCNE/4P72iyWcI9y9GZa3fbfCcqCMonzoAf4pxGZp/2yLTljF+Yl1VEO6qrSuXplF1UR7FvOsvNyfadBpJ5aCdqJwulD0VcU4zMV4E96MYx0tEJPcIK+f15aWkO1OY8bhkOt7v+riINVdijwj2aLvuSmluF6G+2DZ7Hhytx9aDeoEsryd+MFT6GrznBDxGWekrhyjlf543izb+QnYa9f6DrAIJrjXj7bbnSaBK53LkBloDYZIbSC3Uhj4h6pgAG3x6g6Z58FoOnob3MEa+Mftvqnuj4A9Rcq5qe9wv7ticpImutpdvcpQaAzw3WJ/pNYW13JFkfspPeD95yGTEuBa3gqQsI+1Z1/v+OEBLvNGYdC8Y3/KaJmn2gLf5B+f+5o0xR3Rdrmmq7/Fir6hH0A0hyy5021Ts+pg3QwB1Id9MasWnEo7dTheD7PFazBHVsJRHvzjJ5v4uutqfSe56CS7YUbopjzrqFG6dPaUSUUKVtFLnytUkPhucj3sb4MZPoKUoNKS90U5EBfbgQvDq+Hw8JjjuVReSQM58mz5KCmVb0b75MtL9dfFi7OrZ4QSP3DHR92yyAb2bMSGkENNUKS3jj9ZaWy6mVK/aFa/tuXZnfjnVwcRGNtPjazTFrWvQH7Ed+nED5trYWbLWD/SaLVhGcfB+fcFHZzWry00pm02cSLypJYjaQBYHWiasql3PqFDrkceKwyfzSbjUGbVgDRSuaPVA8ot9V3Rjc7nvgZErA+UODxFvvHqUB/zCctDSTvaKCG9unXRGpbs7NNRxRfIYy5Luo/kAV9rZR7FMR9GuhEVocg0mzSrnNyDStW4FEnNkUyXU8ZYpylKgTLSfCCpzKHw5DLGTzSc20BIW4XwkGq7PWMQhNsI1h0uk1XpR/kF7xd8gLHJoIuOXlgAqdamGyICP6wl3pISBs7AGCA4BinDmmqqCknqBnE01WeOi8PFVh9e9DW5tD7qemYLRS71kohHXipeRQr4E549RYNHQafGrlZh2qkZaKrhN3XeAPpDJMn3I2LUk/K5PNYX7YNn+/swLSLaM6tS98EG3N/fFUBvlXxE+K0jeJ3mfCWZ0lttmRIXADR9FTSC/hlPKUOS3XIkeQi9Tuu14heGaYVaJJe8fOUirTmFx0Y+kWgPhSmcSH0XjJloJHGcLWFyA6nPghCgxV/09xhna2uUh3i8iJAbIVLHNg06IoSP4XdcC7xDYTnaaGI+4CBenl/KS8m7uU5duU4Rr2ZfyGFHtq6qCs5xCvr8JaFUf7C6K3pAZZSACYtpKvGFLCc28ELP4tyPoXXxKUqvukbjA82ocs4+z5U29T4PrAQPPUn9V1bbTzFsZTr4mJRUqEt8LzB1/WzvWm0TzRecwcO6y4sETg8BgH/sre6Ys5qTWJvlr1T/F3B32Cu/5UeEgXwuyp3Pr6rDPPRkPGgzmhjrvQ0sfEFATPQ1cY6DBEeu/eTMHVogvppEvjOTDz6orjAmSNedT8aaiMYlJvtd/HypBROyzMiPWg7kMa2rca+XFg56wtfasZ1xl2rtAxAnQohxyh88685OnGSf+aRH/SjgrXbg2WsSTOnvQsd6Ga+N6itLvdX/ljtDGNUi/b9oAaH6QLimCsvaHNwJ8knZdBpntq6PIxHu4oj/RVQ1AktKrBsAjXNBX59zSKGvgt5oZ3E/agcI0s1RdNMYWlCKopOze4Jr4c790yEzzYtFCIWm1GK1VIsJeJxK96gCDKD1y1rqKKHs2/P/WC3femQQnblsucvVmt4TfDWGKl4MWL7n3iI7pP4VImP/CPp35Gb2YpVX5BvDMLO1yxbDXKo7L28RG/DVFSO3kRjf3W8vPUd+XsACfl6jvTrB+BLBzJEUhVImqbftNJvY74Fla137FHtHf/P0JgxcsX5tOnHg/IqV+ZgIRMDVBU3Uky5LuViKaVipBU1nnE3kHoBaKvtDZqjGxyjI3jm9Mxj5uHPPIHx0pqIDKZ/b/VbZbRKcg6nwBtnGO6zYzRoR3LlhbX7sybhWobw6tWvYOhObGmRLHivi5ibdkcnKmst8/qz42d5U/WBUT44YK7aitMI59fK5jDwSbFlIJuVaIdcVdR8vxjZn42wmy+bwvYqYCkETkc4m4f6RQmErqF0XytuGPUJeuTlxH3O1a/J7n3q3doZXduVoQP4qGTXjj5tcc/wKeDump3l4cb/AcflHYo5U4nG46dCqziGW42XEx7Y4D9WfiiebFsmqgJoVJcNewprj6WWViU8hiRGU+/ktMUPWLhUbbrMXrcshlJ4dfzxUmyuWTPCgPopBxw5KSVYiLXCO7vU2Iz/JL/0lZ+iEJvxI2zF20EoVoei/xrwRuVkGHLiZnBrcaUPf0HYABmTpe0v74DSsfMzKlChXTPWfUiBUH6krp9l7zJAQCgOYLa+vhP/a6Czr//NiIz6B5SrJprj9I/bRQawPHUHjB/NyQX2scPFIQYyzYdwLc199Tnmmhur4Z29d7wWteBThros5PgmqTrrJXlrjiBvySU74dhtAGGzIOWOc5CHK+D987UL6I7TwANJFQ7WUIlVkpSp4+retFLHq28Xel0BeJaM/UNx/k67h1QjjwmHSR61H59tpYN58F/Sh0hxOZ9wNyO3A9j+zqErjb8D7LNeZ9cXpxoHw7bbhWbEp8wa+SoBCMyLiOyzP5aAFgD5Hnk3sltzYD1rmNMV4Tk0GmlKJAi3d0k4OzHLK6Ox3Xn9WTAFA2Tfu0UO2s/HWuQMEMoUHITlJXjJF67t4ZYd2sy/Yc+HPURusOSrdUi/b4NWLaM+g3YfvIJF6mHl+REKznHCgYo4+8WOOpVwes6suL5J60wW+7+4fOVKZINPcVdl/uycyY5bWYB5kfnqNls8ca/x2xypnk8gcVzzhxDWa9QXEKXe81j4Jw6SMVaHOdw+RHkSLobHnzUlOQtUFi4OzkskzEqU7vsUB1mnkg5FISqlcf4g6X1d/hkf5h/HVvg+eU51mHb90m9c/0aBu+HVMtmubzYxq2EJYannMIOcX7pFDVrk+qgnicxqJq+Kr1WFw2jauBYEEHo69VA+ZMFaQWjIbO3YVj9u9BXHQDh7IKUO1Did6U8YZ3zmSpFIECiHVt8FoUUnQ2AHEuLY1mHU9dkzz88pMG0kNhbE9dhZOH0lVIIuDnx36UjONX2XgWjb7zvXjf171cGabFaSUK4+3k5VSxK9+YEr461/6FVhApbHF5KzAcvcFzct1DxRA39+oMVnpnc+1NIxTxQMWm438xjsdPPmMhH9PkE1BjxMPbpLKvSXpyOcqnIskGclDq0wA802xIStT9Bo+93WCf/PhkFjHclgNmcnGIgD45pkGFOxXiuSyPDRNBiXjYV3V2QsoIXM9k6zqI+r4Cf1Tmpr/mHEvjlJzWbEUpx3udWZoJejOBWWhw+nbihgkaLWJusahvXsloEN9pnSYx9b3/WfpPMwj5OHPNDLEGlqpWODSVR0uneyyIa2Vpu6Pe/fBVCGaM8ZH6aFG9mqzVHQYoUb6hNBvtMIDetmEz31aDzL+GzC82bNFhvNrZ2eUKp9V0nBJl8RCdkEJRWj9AB9HGSTw4+pK7ISekOO053V0b9pRcQ/ju6WYm5wlGZmhobbkKlOmPLoE3/nzreXr0OphWGyQvXEZ3TwqgB8TqrQ8Kug/JwcU7Siy6//NOFMkeELHWRziZDsOukauik4s+8vBCJTc2L/H5jFm4aQuvyuuvhTINOWY+FR/NizVwc/LEDDdfkz/QbGlwAXtf/PgC2x2z8mjsAdvO2JYMh4MmfzpnGxKgz4q0wLzoDCfnXUC0sqnuUYhwuZdES+L89wZX722NrDcvze2xTgK14io/w7ACo/8Q5BcoigKK9r+6T/6Nym4NdWXQSjEgoCb/eUNGqxXrJKNT7wx7VjsgKgr9W6ry9uAEzsqDBzpEOLBhgx4f3JC+tLh6l/+TSeuQKdalCSIe5JSDGOXn5A4UWIkLDMWlpzbxg5N3VMykf3JlvuIzOjRmm4hwFljZqOX0Cd+t5Xz76eazBTBXhJrMvr8TO1qvsuc+4qQgPx98b52PeBTMJUDR7ejFpJQ0OyrXdDU/JsXNrY3nqBa7CC1Sccaa2WWVNvoi84pPi+ANn+LDD4MPtdzh0lG/qmJfBl3YJ9W7KUt5e4boFr52yT4HYKHyxmKeELLRFNLpF5+VqiBwx+nr3ebcGbP5knM9y2iq+Joc6UOoTWwFhtkR5pxOhozlbsUiJPkZ758PEH4YzsV5LzGgrflU63IcdyVAmlrWJ0rHV+4tjgVNd4XDpQYw1AN30DTGA5daQ+C1hiV9+Sh6LyVDUaRfwlkheEqQiXXF3d5H6y9OSw2GPUr2JeFcYx7CjIxTeCmIf4FQr9yHkTs411Uor1fZno+udZHnuR99COSYuIJxDK9R283jMfV1gAGwQURn/OI7W8U9uhk76J/0wzZAtl4AnwonYZxJTJG/eB6aEBWyKSd1F+qxQTlh7isqMBxDPgVgheoA/5pacQTTtswH7ha8xp2Bmedfs3xjxm/9T+CG/FB6EHF90C872TeVoFMOK37/8ab/LXcU3Zey7mdPP1vr451K/87LCYpmkuEyGgTr3DXtSQqfu/wetahml8s5muMRDGWt9d1dCMMas5MYSZx5xyIMOGAGd16yGr49xLrcMTTLOhSRW6VQMcJ+iSbaeM9IhTocz8FJUW7KV0qAzVl2gE84BU2lUl34tlVeRF0/CCIwT3u/lrGzRYGMU+NgCwK76U1kda6Bax2yTKyN2Y9wFeq29t9DFcBrATwNUUVKqKSF50dejlWlZzkDlIwq1gvfWK333xqDIaWvK0rPlSjljnohaGnJDWveKcQc9IBQLJgEdhgvLjz7ThCln2Zd5f55SnYb9mIPe2Z3qSFl+BWHvBPvpVNmDXwagDC/z/PgRgSLSqj2rXz0EXcD8FpqCufS/n4uGjg+/NXVJmwnvsNYt8fRK/vAoIYesA4aahxZIjogKrehsOt57mDh++vcEtcTuwJLQr6sJQohMz2GfrtFrrRSvacE5IHuaL1PC3tW8GAAYvqRatVMcSnOb8q78tfb9J6HsQgpb76i+7wRBzJMqE+TYcwRYTSGTB8ft4G0P6EeY5r0elDCpJTGCGE4+Y7vy6vh/gXwQzU2NYUhWd814EvTB3VrnyIE6fM/epeclZAiItzbFJu7mP6U75saqNOXbVb1QAx3gZFPbPd07a9647k6SSOjmAksqc7m6j6/kK03ITqbqu17/lLVvNjTxuVueUTmorr8tOhQagcblyW98sm+Db2WjOBD6TwNfynTGBmNkoKY5pSpqq+7afkZqrFCBncsF0f9k9mB7hzPJx/7FOx4yfwF0ayWHLSKI29OVvL1lCO5/V02iuMLYAA3+M6BWXRD1V+Xse/1rmi4k2+KZMJnIdpjG7gwuTl2dxXg1XdDWPqb/ARviCfnNoACHzEW2WePJBU4iqx6zqP1ln6JV3BqiYPydGX+CfDzh2+P5/v+uJ+eJFyPbyf1HjDjil0U7lcB/LljPIgH8uESmRAelFIqfrow5hANZlLaPHYmfDNQNL25nLALni5EvcVUkurNkNyyvK2YU+NC5NBN4TVZC5jKdXIizAUB4bKAdysJkJHCnH5O2b+EKQlm8Ldo6r/mD68H/C1GU/+bvSrjlhDqJO0TSQ7SjkrCZBPnb5UNpLrIl3lUKkQk3iYYT0GpflDW+frvKo7mB5phz/1JkptYir7qnJIcsqZFhLEK4Tlpl6n1M0XrhXWhJURNPxMiQ1tjZbwE9O/ol7QQrcrnL0RqD6xkj6Q6lBhAtdvw6j4B6JiA68E/PH/GDgQFhprnEuK84FOpf1AprgUqY0A2/wobuNp6lT3yGV+l8qD6RVPCQtiTTAbzbZmSJ9UEryzaPCYkY2J+U7KWhQNo8l1wtdB2kEVfWcAOpt8krE2NyACoKzRn3f+g8pLYICGdpn+/omL6Ga1rQzBC1qsN0DWjNWZQEhCt97yLKnrgeA/XswgFnuTeSYGMJOWIG/DMWMJUhNa/KChmnZwncEde/LztJq+8tm4OaPh5oLCwaeWB6CVhNWsbAU+oDSqHRvks11Ys2YbppS0yRbBCdrqP6vUQmdgdIicVVlbf16Ygi6lI+yX5JaMQ6UdCLGkaR9gF/EHYJg/dCfIJ7xPxqRSuICxH7jNq8etquV43EjHGC7vqtGJDH5A7f7zCeCREpTdzLu59YnkJYQ7jdnBYx8LjU1m/T8ohGqy3RkV93wQsvvlu9zOo5jEJlRALjmENuGWl7/eygseq80ikzbJGcUTvFmbXOt637SabnOXh0O6T1WjVLkTsM3TT/BjjCX+Wla8EfRbh2c5h/DXuiByTyUun2EWnYUZHaa5N6qDoceLrqLjHOvPMm+wQi05qLmfWUmCYNNrBgyeC6jFIQJWn4XOHPR7lv8UTsGlG5+6zcIgN46k9cIDicS3uOXy+omQj+1y+TKvtDmdRG150qlsxnW+tGCsHwLqojkiLeGy1CErSPDbsfltqeCCoHKAArsUD5d3Kg9vlwSDeyE/6Nck0xodjii/zXH273v2iNg8atastFAz7tS7B+5DndUQtCz0pl55xD0cPfUrYtx7F2GV2iBugeXuDQF91bjkhWoyffaAQJX/LlfIrf4/CiL2Jiqm5V+ix+RFTZlKoZkTtU/o30TNDU1P85oIZ7gAejygyy+7CNZjmOG6Keev2XH8hyqoy+wbKGnL3belXxzP8wUerhbJaVXQ2VNK6yOEjja57GlJ0OfAxuRz9IeSP7/S7wdlfuCnJRAq0cdMJWYjdmZEMFFcDpxEHyVQOY2lFROHihorgDwh7m3uKVJ4RPDYkekg6Cl2B3muVDNoGazXcJxEnpNb0PhlLtfPFIQnFXc8+D0ICYadoOzgJgNJrEq/zCcBNE3Sr3+8vt9UPWbgVIBiYHVw2zlasnKVfcCsdWYXvaFs93ysmvjZXVbjZKvUfcGXydUdluV6HeE761Ba/GnbBzS87n6vK65DISFsCD4SeZ+UUkUCuCoTuhUnX4LZ3WPz1lLUfy45vK6WTX2fArQPRxBDSEusi6XOoiHOOcLH5inBxGuzlIRYgilk7kZy3OSIAn9hdoUdvU3uUwl0rRQYsA2moi0y0nBIglVyA+p8HAAN4HrzZDz6Zx03uDABITkX8Vm0h9srJ6n2K6a7Xs9bu20lbPExLgYAYiixHIexHH+tRedpFEUc45e+9B3AxBGFRlYXCuPFVJGJKHzcL6J0EXymRFKFhyPR1SuPZKg3ZVOUyrUsN3RQNylpAQwkNPPXq1RULeO+0YakX0jk26QlmVaVo5KmMfJn+8I4tPcyibsDS3/jIvnrb9Fg0uqtcW5SBk9BZH4miGq3BINXr11qi3o5VA6fAIO/BItTLymf+Xc/m1oAy8n51cBoZRLk2jC29bgtg60xoP1u0RvPPwbFrOV2Ecq1sBJwrpzN9j1TSO0FDGrkySMApEVIVpcFToy7AFFN+ZgWUeFC/Z+BBJOvteIBe4RVeoYGz4swV1XUeCC13Kw4GIN8qDZCXBSifnkijlUTISHFOcpDGm65iHRLZZpaNQEkZX9CjC85svu9yra/jWfI5V6J7MkCyDNRj6dG2gYPgaFmRP07ZXI5HpfWWAmPcDbNLD3T6C1SNyQeeXVJZPvmOF7iSiLBfIcqmqpUFRATm8RJmU3nK/v/uKR308YgtO4wb257UVzaL6bsq5pKCP/RI6TCHkt8RFpeE6XWgV8ocSk+336G+8zdRvUoOIP6duFsDEO0FGgdb1759DvpmF0llWLycgCi518UZPXZEPFsA91QHmDMUcpnrI5uoHrYopV5Mh31uIf3G8ePpF802vLUXrwQyIPstmN5WAbn09/OteEsYZSMIb+a5VbXi2xmQ0sWuJfy39wJeZSmE/J5g2tKEEY+mj8WaqSVu1TJ8dNlo+AHwqcfkKtONpsFq6uTeY9Hkez2/z2O7uOvAQyevjoctjGkZCOncCMzRVPwvESNituAshz7UnmyYuYsW29RAIFSDiLiKjpoE/VI372MuU8bGbQIrtYmW0YXaC7N1h34w1vh4C5HQg2JdqJ8DjaJmt6X/Fu16Pj6HqDsxtKyuVlb1QgxVwVGQEYrCck5Yqjpbjo1qArT11YtVtWJcVXOy2rjep15t/zVd9Mo1a10uT3ZGa05eWzclgc0P+tPkCPPPhI6zCWs0fNuT4KhdS/0Ptn9QbphyQfQSvMm6s+GcNPmmZP8SvW349ZAc6vJDcRyNy//9ec+4DNaFKW45yfF0GLtgoq+WLQWUXpV4nckdzuToJ8PVsKW+2v7XOo8LZDpfVroWc+1r7QO6DbZrmjFIAqQRZMfzP/3e13no8NtpdfAX3WaQ01SAO9yTtx0pDH5zCxXs2JyiMRDd+AERfXPJfNd2qjtdGyu0O+u5R/EipXBtd8WVSbecUOHgwxCTNvHDBU/DyZymlYy1KKP00r9duJTau5/zF0qv13AHLBVPgBj7dmbdK9EQuOvSn+koAd13Psgw5vnhECWYUctW7Ygd64kC59EzEq+PLNvVKXigHmYzz4EV4yMfG3FvezpfT8/nMBofc1sK8ar0mgSUqLBRC6No6sttaQQVBI7tBvgK/cCQwysPoCqO0dCni/SqBhDD86qCUwkt8iLobHrrJoqx8oznXC9oL9CBLw8MwD0tPerhiNa7gKrDJBKZCrnoB+FUhiIDw/RcDB39WFw2dQ62CosnLMKuVXy+9nOkt8FPG4rfXwTkb3aq7C5HjbDRTACUBI7fPJwoRn8zTjBLKR5BeZziZA60Um+5ZnPVur5ojSJZu2wluM2q/Ml+Fun/o1mAGQhXyqeLokTdyIPI8OJsH1vHRXim5if5wAhUBGoNnKmWgx3+kE1xvL0LaKNUtaAqpQwKY4gZ3KULgIvxNnzejSUMNrXNg9cXbT9HG1oIpttobBX6LkYbcke5hz2qenGEUikNB5isZbUjXPkZNs6203e0/+7VVt73JzMdhtBi+kdFY1U4fOMzbx/hopmYVRI4S1x5KeClsU5ByrOR8LjkV6iEW0YXDMuZ0uMx9PN2wdtHuOYsC6nccgyj6TAsYW5zNAhlBLvDUyUDgWVuYrTIrewu2K1bosd5hfITXHvcOvt8rAqSCf9ndrXK22HOvtYRoHadn9eOe5v5fSX2nUVbbSqrxdxgNNJxFTbMy6xzoZF4lsqwemCYmSvNvdRbYpjpopkiZJEDHydxj/LtX+55zcAcWbnGdU+DqgFPQ9PlxE2e3+CklQwDXKhRUlbVoNvIl84dT5+NcIOnGQJf3ko2rfvDB/1+Or+GsF6Gmh2+s2mUVg3Hf+MXp0G8IJjhOQR2i06mdBtyG6noLDOrvJfm9r1Ch+TNLMtlcPoCTIZX0OunwwfNAxsdR22rtvU+QXB0z3k1cVMe3VLE1caj8uH66VSTpIWv/DSfHwf7YAvp4zAam+0X/c5vTG1JSEE5VobQPg++tz1TLGi48mZ9E+tNUjW+lL4utJ2HuApOI4CIwSLM1awAw7Zjq1orIaEXtbEk6Rv+W6yHeKCckAaJGyur5uCq40Uq08aiAbQQq8ExNdPS/AhRcQofLZxmRcRMY1FXkMcYc9HtoS2Xw9qnto8dBoqn2zI5sY7ab9hezKQt97n/VunQR4VMJGN0uAbuYDzkO3n46LowW/AGpy0OIoYd6xP7NY2jeII5/e14xMrSaulttZi53PV8VkNz9MpSWpHlO1cdERyIWcx3sl5j5LWLsmIuSEOipKIrZg6Luv6QijYIqyRzoft839AA//KMxfAOxVA5I3cuONNQlCc3Rb2FVkb0oxYCxR36o9kauCcvkFusumNL0vezq5N9QuidNQj6l6TAFyBQvEsHo1y/nEjs0RA7vhDdDEOkeoX7wzd+7hXu8JKlnLz269+xOkESf/nDifKN+lQ3vSRlZdgoWVCBYu10FGzfAfdpFbYDM2VfBq76rwFbFSPbx8Uicw2eqpEKJffS8iQ/orM5MSP6661CbPhMrW2Y/t5PFsFH53ou0rVKgrLZWVQ9L/J2sA1q3lIh27/fUw1fR3jYLYZ0Uc88YU3skEA2UVTDnpwXeTm4cTaHG25PLmvsK+wa/tk2fpqoA+piB6eQN+qVznVSIxrM/Kr/Equc4hbZC29G6W8lTtseKAmsqstPUQbW/YlYVvcgyvJyPPjXYHjD9fdkkL+j1A8a5kv0A+ayV0iJL6+iMxL+Lyv2RJ2A6IZa6F91LJA3YPRfiusUVbfhGCbJ1aDxdchP31+mpWXdlNEOhTV0Rti+efCnxUzhS4nC3MLwQ46cXwSvizWhhFlo86BejAvyJ9shyJMRDsCRmwbsRvWc5xKuRf2reZfWI8z6GNNPiYjhxuIPSGC6Td0RLdwI2PVo7RmbX4hhaek49aMIPF17PoXrBxH4ZoLGmbKH6F83/61PmKVL2PPvQmrQwxgKZj9I2Fjje04ShpqCvhm+qJvlm/3Kim89/v4wsoWlwom+Bz6fvdOgnLjo3c7DATE1rto9BMNWMp7g1jbQjZwnUHEt3r469BSveLUcHV303cvRregsZ6TX2D2oEqfD7dvmCRXKnrWdgprrHA11ElXKAjex3Xr+3/r0znf7vcFoO70Gy/rjgDoXIWt1UaisG2JliiqiCPlT3DFxo5qrugFf6+OHuPIqxmgs1J8KB7OiVKz2EJbwV18ilpjCwYb4rqQ9FjulXa8ZjXAm2ImYr/xl1UUGA8fnkIEeclQnH2//p/PxjvhJI91nmf/NXa4nx2Qjkznq3fXSnOxPJpH70W/JO07irh6y3UC/5sOz8XxlbUy6S/a6KRljeXGl9ZCTPIouPq1377gZ9kooVfURlExKeUcXospOjh1OE6pOZWNFX18GI8RdICn4rDPDmwPxpruWOzTeBQdBJTSdn7YygGVy//GFLYMvSZBzxX79wjBehtc+XjbAggeMxCtcdJCw4R/k1S7mrmpvhK4UVNYUnRicJlWckhB1KgCf2UQwnD0p7NI0n8pzhzvce6vq4y+Dvx/lmq5aJiW5iwlxy5pxNNFcRYKi5ftpMo4c6e5wsGJ3NxeiQUoC+UcgLoLjn48LzYQl0sN41cNcgQPnF0NszhpvLJ+iWYvBPpaLYdPD37nNHOeCKY1FDifLR6U7eRovY2D0aC2RcedFJ1k4GBalmN88II22MGZanBEh7YOJmE4jpJOhKM7KH4SL9o+x0Qzp5WiYI4aSTQmhKZmZFsarIZHbAdG5+9fvxYaM/uNCGFYmA7GbjBa9igT5fA/6di088kRikw9eWmJigB5dFIiTNtq47qitbc3vWDiRhxQE89Fb1eK/BB9XP1CUFKEblxqN+dC27H/huS+u87OitP8r5wDENIGqllNdYOsr+iOFQt1y4a/pKjG+s8POn0mw/L48cZNc/2V/xsdr8duACa/T0ecaCX0FHPRaFoFeglSXSQnWQOY7Av7Yu4ggmVtux4SO+tTfP2nY79j+Jz1YbmpiFxDA8MLETML38BdQ7DZImNdWjHZ4wW0QjLhnzmhU20jjssJ9QOMiTjUut80U+phM4uH1z4ms8iaTMrEfxS4e1Pn+2GZ8KuE4DTy2t8HRPW4uSbAqhFL+s4O5R//5KqtWIsZbHK62XEyydbq1WWYc/BivOqbwbEAXWOZDVIF9djjLGvOONFqJCEsPw1lloQ7+Wdn18hoiW8fP87T7a+UeRA1JvPQVBWic24ShsL4NXO526HjPYYpyOd9URYJ4erKWy6Kv7z/liEUIO1B5/uWp/3n47vVaDOR7ViiP3RrnIT8qQYa+AjURoBsA2dzccycbyGjoSkQJR2LwalA8BrSS9xGDPY4tq2fp/2HIJ+5AE1pvvubwizaDnuvFAF0Q+hTNcp4LdjQWCXif+wI9uiHCS/IhCKQMmaJCiAbwv1BL9a0wQOFu7QD0ldzfzjHvX2+tkL0HM5tK/zoWvaKpy3F4eGkWU0Pwr2xgcOcrWrM/ms6moPvfZlyvyGqFApxxZ+6Y2mPJ+G6Y/gCljZT7HJcTCfDikiuBaFYBgL78QmzXqlE2khiIon3dbJ+UZRKOVkyDp8Bdoz1GVpPw9Q1K7LxNYG9hPedG0vLOZH6xj4zKEqWxg7DnUK9ukzCvYokDA9J5NjGv4Fd2h6WhklnalpQI3WcX26GaALcfWYFBqai4H6uy2QnsL0p0zWW+20laMNmaVwcd5U6mE9maD4DXCDvqLyuUzdwKlRlTLCqGmymuDqYMhp+eu5dta1v9PXhWAMwJqgELTjEi6cFQvbguTLcAhWqsJGvgo+avm2lRaeN59ZYDIkbw5sv6Ht1g69PPgdUczyczlj0L0MJF8IoRubAgOOnT51oTwTlXXMvBU/M+Pr37f8TIvx4tjCHZEhi7iekCdL247TC6R5AiSBLN3CHFqKyeL4GdNPfnRLiEYIP4A9g69Hb501gyTF/liTJGV1JWv1O6XynV5hYSw0pDo2lqMJa2Q4Z+oIYv0XppQ4xHsYuCl6+fgGSDj6DMBPKmya6KU1XQxL3gbQ6APB1xeokHwk5vYIW38Ks8wM8yiSnyRZs7TcrChgBZE0IQlZDYu0TTE44wfr/x0lwtm/T0b1bYzWg1qQpyS4hqYEDb4C1FKRJfSDUgRC5kCMoNS2WXiXieXXcvkpsByVSjUeYb9kwjNa45/39BmHcsIpFM2LM3C9OqND4ZrmgsVZhDGsSKVmsV5jAJ1aTn2abNVEKbqkeDsIiNj0Z396Fs/MFOYWxjhmHDjBSMfacROBYbsdPCSMYrbl4b3SWI4eBHMljqTXNujiy19BoU13MHz+jB/Dbbl5gGwwJB01RxczIDQA5TFP8vf80wVs9e5po5QMSMmp43JhYuttjFhfGuvkyn8hR9gBDVFtxg+9Jax5kuaFpdehbqXFa092+u7Ya6K8Pxe4vpIBm/mPb16B6k+R/oQKslUCiF24gYuPslwvLvVrRP26qUnsG6o4vt0yV2ZpZZDw6Lk/iHVlmPsKyTt7IzKlngSApcz8t5WZtkYJfWfY76kpCTZuCtWZX7daNosZx1gNrd8tBw6fCneA/p7L9dU0s/z/yVGt174GFPBAPokNekNjw4ibM9YH9XsVzIoMpt0U+zqzzNyvdMqAvtUs81A3xWGbrp9sz0zF9n1fG9JSaNIlosLwQRi8fO+JuP+SxriP/Ck4ViN8bVAa23oKFUiG0L/IVxhuc6Xxg//UxpboZNumYxSn2xMe+JdhQZE2z1it/oWRPFws1Y9pgMrwXcRlr1M8FEzEqGAC5UqA6/ddZtJA3/xeuizXL1PYPlH7No5XovF5ddq+nCK4pk/dKLoH2tK27GCPgdHCDrQmTBp1JIgMbVvzwR3UeaE8rQ1FdWuC13QrF8x/Y6+3XbZCBTvAoCar40x7pS3tFfT0TzdvkdGGe2NYYrD7PGshs7uRxbZrDbWfIl8VSF0zyVACcSQfvSy05hzafyOE8Y0l5ZkU1PRrL9FjSlJBbo2vDkaIDvkqy84j3KFaE+dXB+zMqHNmz/Ml4JdwxclD7pI0tZDfVYuRcdFMOj5CS25o8jUhLdCgygnJWRDuW6cb00nm2czZzMXzVoDKvUBdRUJnCca+BzBfBadYATWlgVFeTYpLBiDkylQEdXt8BeFIPzDlohaEWRFArZrNj/lJV9GTftIupf97RZ8Grvon7+gLubvGjIDrHgZ8gaywVY+xSlQnA7l5OmEhD8UnS85IFTN7tdE4ERZgcGdndGVrpkgo7Wom6Xs8yp05dQ6JPn/A31493FL+BmVGwDJYi4KCDtfRls4xWWDGotSjio7lmofQIrnvV3ZKUHm9xR4lr4hqrH2gNqLl9y2ud0w8QHzwV2wyHzbVkzPmMcchSQZ/Y2N6Kv5paVW2KmcZ7llaqkRzCt463B3fuypGVwQFnwa/y43iIIDohPhZ0hi8dWRg/pnwcfiA8tgwXIqpGCTKtsO1tEuxJZtI/ZfT4Cf/+4Oxz6Knfje7W9ydrRJ+zz9nB/6e73mxE5yy9nP0Kuy6nvPL5pxn//de+1PCh6avN77qqDzsKxu6f4wxX8fDZCPKpaUp4Ip3zD1ln7yXUnKApLw0R89JKJaZlL/KG2yJyz8Zrx23rurvi3j8nQdOJZNG+83oZicKwtjVFE2GWSl64FlNlPiOgCyhvm4iM98ijEw+JrEDeGcvmTpVFVe5tnU7Ve9Z67aiPu8fLT3ZFO9OzjepK9oHdumZnYxxWi5qkspwsFT8CHjVxwW1z/+BftbljlYWqKHOWdqWcYH17LDBVFNx086VjWcKtf2PrkG6/HrGBqL7wLg0xTI2KeYFG/QFq8qE5RKSQSUt51PyjoewGCfN2Sbv5a8Hd+KeTWL0DKoVc1WuZj6FP8vziqf+2nauDG/Aik00Bgtmm9MNydO+cXaTu3jQwsmUAF0pmJS/Ln5HxHx5k8JFHqcMzmbdiXP1sSF1dmI1XPH8XQ4KuxIDKkNFzOAsuZPWGQ75mh/cyyVqRvTau4pFuXubRYn84ZMjtkMqarbMZZ2NQHbRqOHNSX3mNDv4XsBIkxCJ6K5Q+QEfLCcnYYPWYiCU/iygcClSUKFpGSWdx4/8CBlFWo1PFan4ixKy+X3npTlrSKyArCcuPFQ8YYso8/zYG13wfBysHHjGo9QBGtxC/9cnqJtxXDe0Px/eGqPsEDtDfsSvzC1zj3ThpRSaV+lL1g2tdvgtMJVNLxtr4GSd5A/y9321WS7o/mNIN3iM4Om2oY90WhCprU2593cjJqOyZ1ZWiK0n2mbiqAewJKfiVczB/zM9B0D4f+a8Jlrt/7lLyyYj6GFVqceqXFuXWRxNSuBgJf0wvyKhw86jaKIbvO1wfYbhAoovfpmoXFHpjJTVFGsxxPNiU20FYPngrbAttDH4z5+I9fhZ/J9UklPiA6IzpOtMaVU78nlIenn6qBj6yiK6RF6iJTc6mQj27AEZB/k4vwVUoJhRLMeMwyHV9iB6ANTFdRDXWLWoqQZgSCexbISwnkExeMSSCOeIn5wIwicQwYpTziggvwQYx6SAMzmCI4G//NDUHrgQi2W62I2foDgXPIBO4z05IBsvSwJ6LMJ78HWPJPoNoMw7MFVM55HMqvMc7xDy55+wTpCU+OY+rYos1bXxpA7C7ManhkB/6Oxk9WFbvYRUpsdRbPflKmyc94LwOTCEgKk0lqrlIVsALJO5Oti+2pV6LYXar6EOn13KLpIyzZQi4dklG/s4QkeCM6wtWnuyijB+IWwRtPq3NHN08QcimrB0pXwtwRCbxFTZta/nXGtVXCTsx1XCYU2pxz1x4Sf5PRMD0/MUDRSpJUp5JGt9eZT55sEkNINq4kYBelP42Z6qNgRD7MVhnsoB1iMi5pr13Vq5yOq/mKECxzNopMuBa3giuaR4RJGiZ/5Y4fK9tCWH4nZ40pWx5+IBRnXfXrg0Tv1JXzTgfo0AxDH7psPdfe7/lal4GCF9bOithcSAN5GXdUQfmfgVEwockXyNKvk387+ypz2iE6Nzll4I2HL1TMzplt8nD/Sa/7USw1HOd6JmdbPzCYboDj7AGvVhewS9SfxvAAhWrtxJgLzxfBUDQDmKvDl984YQEzU1ei4rv7vK9uDeaFGxUOAne0rbKIoy78Lv7xwppLEbhQJ26+Or5fHsYXLtRAMaENg/45FJpLwCKv2Luc5x6OTTHYE8d02wQYVpSay06F0IEFyvZ4DGFoavcct+RfWkIZvdvy8arrn3Ff0V7k2DdndqrVjr6ZQ9YrVe67bpbbY27Vy+rtzq9q8j5KeP2dls7bCs7xetRQCYZh6ftJhrN0K65fDJQV/O2FX++3iZbAV7OwBsGas+SvHqt+Y8JXMboX98BYklmDcKoK9WZuUztZKyY+6xDUwcKjPINNC23pKPZes29l7wv7AiphOo/DChTOEBoHN0lruNA5iK9a654tLV6lVOlw4ZFxxRln9tfmjKC0dJJqx08kXW2ctV9Jzv3cAJxfxfk04QdRPGu+5FhUiKcQe4OP1+YwT3qVNy9QmhmgwUZXQWyZBfneEqrx3GQ/4QnLl7cK/La5216L31DdlY1xb7v6a6aFU5tlDhwcOFIRdca8tsHTJ111ho5AK315BMfxF1ufZkOAkMnL/lNSr8fRv3f8L/z6iC7MDD5lO7KtNdJ9fr72AfLnQ0LXskSsCUeUipAcnLPeXh7HTDDHoEfj8Tzy+Z/rZf7Qtb5wc1deXN36jixpLiIJaCorH8mDm9JfP82zVe6IjU/ehvDku1u8KI1KI7Z3WV0QNksY6Y9Q9ckYoNV83GuyzUY25WbyCygrdPMLaJAQCCxzrVK6mkxI0vVe6yzOXTKtCk+yH/ueNjlnrtHbTjkDSB8K956VkFV/YhJ0/3GzIxlrS4QMeRyQVxD9VtrF689jZ8+EysDoA+5DAnjWLeMJVFLuZBUUv52cC1pmWGXvIKs1K9Y0PZTwT8ZoLXTDCMkn0f8oXclXVNbS/Mmw3lYiBcWOEzA/WF75ZvhWzYB+EvQm19zbcbTjLOeyr8ir7bb1a5BsptlEiRzrSsQtTb7//RtqT8qGrgY82QwSbC1hU41W0RI6MI0WvVOpuHJ8Du5N7TB1MQryz9t4i3HMtHOeNNLFCm59hTcfQnj6QfX3jpyAnqucpXl3NK50lXJu7FiP0Wc9k4G4X/RaaOqDg/crsaMzl3PFY+8DRMK0sNdbcX0ZTIBln0STSuhKGi1JMHsGTU2gQu9ZzmaTECqBHS2KlfYVNPX3zqaLlQ7qb4+rnZMA0Xo377hp0r9rZCULw82m58BJaWjJ0VhOAtNaURxTS1zLcWPd84d65EUIb8uUAKo3zVw1DjgBGBeH2YXBPLATkiSlRohASqWRhMsCesChuELq5A93QfS4N4mMp5tmFSZc/7tTya5t/+uImubDVMN3M/yTtY5PDJ6cvEByyusiQodTZ2bRmm/sXuK9f+OxPmCl4IlND8TjnhSN3QvuuzxdE+BleEYqNI/DGmN7g1aXxP1gxL1WTfiIW2u9PdHE82hRHaKK4fKkp3RX8VpDmI6iSpmAkTrHd1g0iYTWQLtQEi7qfhxPXCWgYGjIn3dYA0GZWJQiNvJOZvX633rbSTNlvtWOgMZHTMnecKvGqQ870oZdzha3/n6Hx+XB9cx3DVktMf+F5acofISBwGgIDY0MyYhC/nWtYtyhmuF1LefrDAWft0EELFgtMajAMYbtC2tgiTY1oV/BWKje73cATHX6c+A3YSpBjNugmtsQH+NYdZgs7UpchOpwVNOb70e9sTxElDKgzYRe5jtMZTvxf2NfnsbWUKJJojRBiW/N7IEQwwFH8wOQpIjveIAuCBLShJaMmlnwGbgF1TzLxUMp6Wo6Ehe00JxNZSQMGr99kGUPrBUClaVBXlst5ovULxWTmv7Tirb7aRbgA8WJoIN8zj++DhH8qE9LM3iaWnXs2U6RnDAJzaSaZB6MsoXZx6X81XS67EmYVnAK43w6J2yyE/tJ05lsxk79IH96w9dBhRlQolhPF2cPBBvirvwjPw9jYJwJSgKbaroIcs/WOjynnZ6PNB0iXQ8pnWVVIR2Y6fZDCU0i2kKySTkX93bMYnhl/jMwxjQtuhYCxcG6ykFncZ0xDXXtg/Y2oF/+8OFPKAVMUNH9pGW1kBbxiF6bvGrA8nokGPX/dEMOqkj9u/TrtJQGawOVJ6KnLB+1C90ys1nmW8SChR8sZVSe+uGu2hwQfx8CR277jOs1CZcli0WWAmLLipjEDA2XJCMHIHO0utn72FNDL10n2gYuCCSOOnGWznN9tbUnbBSIeVdn6GMcF6J7MrDcZ4VFSyi6/zksPmEFjrP8v1L5NOpzUjL6h4E3G4G9zC8tBTRY4BDMRx78jRJTvcygBDhyYMLtayzEwL61J6mpTr9sTXZfnqRojfuVce938soBfupGKzm5B/GhMkKHwwCoJQwhbMBXlJoHH6IqdHNIA8AG/lS9kvPrduyhpIyJUcx1HF1WE2ZrL1J3ZpyRogj0tlY1EGGqhhdFIYS1qTzjeGyY9ZDiFA+lnk8wMAl0TX7CJYlDE2C1vVchPeq7xwaBJ7ct60nP/Me/uZ8WnH4C6ebDlFv9x01ff4oRtBW/IZmBzLPfUcTNIt4L0Tyo9xr/ptzSkVcZ3a1JaK2t1HL3RlwPc2nhTDMz8gLwN3s38cl5gvllpJApKmzAQuVdANfcp3iVHmmEuQegXuao2tKkGL4XBMR7YFSjGSym6MEZEcIFEm6RFCl4sS8/8aQhR7TtmomKlWcVLyQ1TANL47VbEt/R9IZEnCN7oMDhP4lsqLiCFssi7z4f/kYrZE+Vi4WFR+GYeWWxNCPFms7KM8WaByJkfx1jEPZMbK/4VJxIUHlwsxrAAwN75fsGVELhT3MS+PFVdmkKojHUnEvEXi2ZxSKR0ydzl5kg2Ku3Fb58XUDX/rAic/lDz1rn1x6vjv2S33o6SZLI386/BmGcGwgcg7oiUWJ7izIRNnWtulmO5pkU1b8iA/HJcKk+u0jmC/xjb9x8yPEvoFXUfuJ0ghgt0iShC8Z5nufl4Iq+9K5FNKiuiMGFd+wUF4l7cfiRsyteRG+fKVtoR82yU98bys5ATLcu81/Zd5geyXt2mIRq2Lc75XDZoN3MVRpiATzVX/mKjHyY7F+c1Rs2zTC5MydfWVdTjHs3TAPj8Ke2+9+wTPh/Dv+d2++3lR3Nbxfyfi6RTUm8emSXnZOGJo2nwHTOagLEVPn8leucrE8T782VoB3UJd5Ddt7q+q8HqiBTMj2pRhSw4UxYlsyA/uHv8UESeisDFcY/zGegtN93XH9zd7VXKviOCkS0Zbvulf3qp4zWhnLqZEki6cFh21gutEj6h11/Nr9enfd5/jV8LuCJ02gtXxwhPSBqJ78nhdGAvtm+E2kRQ3KDZj9+sORf4NDnjGVgaaRSHj1FM7+wKeLRF5RN9lxYc59Jjs7O7fNLpURhu+tkLN6uDLxH90g8HvdAbGTcVYPD7qmvSKS5WcJWkBb99ubNraufNviQrJf8SGNgKSTaT8gxOqLVPsFKnVqG2AXOXzNso/BG58UPkq4UPnttZfe0yFzfv0ojo1RECBI76rc/jw4DeSrhBtIlV1/SiixrV9hVS5S6+I3ydEQslt/tWvJ2JzFVC2Am2tO+MJ04CI8LXCOtxKQlikrw2P75cA6uIw/lZEC+pDBUv+8pxwHll0joKtJ6x96Gza9T/cz8q5wrv94HU8xoStmTH1kfcyc6pbLsCZWM7cWPz9N6GlSDk7BJ7YWPoUb6CCylfIaogg/2mjRejmowZ6Hw7VtBoj12HxOjCrP6DbydsSV2ucTDQJ1KY8dbzRcz9Fpln6M2AgXokgoY/DwzGSwE6S664/Vbm+0lneafrKa0hdSZ1P8o1Zo88r7zWxXY/4VtdTNIN8XlV7KyJ8Ar8Yy0VrR+ly7xU/Z4+H9Bk4TU+8ldNDV2eUV7Di5PA3Lm2VsOXA4QodOGdTnd79FWZwqfLgcuIl/9+1N2wf9lA2/KmdVx4gnOiYeveeuS3VzoD8JQjyCG5Xz2mJ4xBofvjVMPeiGGLstRkKPXm65xYZyG+JZRuD3vhL7VzURQI5DueyOxx4/v+O5kdRWNe8Nz8FKnG6sZzfflDxDvpoUlO8ned2JFj00zkfJsMOk6BqxxyyyHQqbfdcKw8VU5KWtVPYhIvRzdOk+BUi96adzbuFuHemMW02DcNZNHdNTCvnljGdwaCkq8AWju0y4Ql4FfIg7xfNz8QFVSRHw8YDRDvi7SFrasqVNXlCdXKOvRDTH9jCkefnBTzwvwWRjrD8VSoMYW7/j4UH0lu91QjLPUAHot0z7IOv9c7LojOArpx5hdvvuTUu5B2B4+ae2Ljp3fUXdqWAvVqKT6ZnJhuGcfbj4FdE8X2Uxp6K76+jtBAIVZVbEBVKYNu57774cRlgBrS8bAgbhpw5NiAfwb/qIpdUxY+sD8S+J/ISUuqQTTjx3/s+hVz+kRHsgqk5dcvxtiGAWOQpR8B3dj8mMn//Z+LVXVwNhzx4GEgv9SdaLkrqKX/nQtIRK/ch0K4f2wi9dT+DYCNnR8zWSrdRQ07rklRqtldxpjJC1o88VyouFXG6IvwrqmwN32ZYtisLRgODcIV1c5DIs8GVimhuaDhk7/jTv9yJnUCZQXSORUp8arcxPZ2eVLLelKaCLsTemuhzqSvaSQdtCmJkArWV4KPne67Nv/2MZc1rmvLJ8e+l2ZTOBU5zcZL+1KYLHgjwpikzZrvGlf8nsfvmq4mP69NLAkOtuJo39J9iWQXx2WeX670JgKTir/aIEhvaMJl+qxO8feuSrejrpLvaxrpY2KfzblWTU+LUezVpTiV1APQkxzqYRUS49rBEYi1k+MnyThCmHKAoBv8WuHwq8MKP8F2Lw+8K9ceuG39y+lwagM6z6S0uTnhTsWwBMtSn9HvbVUw0PEXGNRX4gFBMtcmhE1FISoPEls2LaUZfvoRsapdODNsYPNJhW9LYlerY7K8yngQUqdPcDWnLCk6T04ad0NIHE9ITSRVKFD8hJNbXDyaqjTEad+lNLNSgg8oRZESfmjFD4VQKS5PvLfZB7L680nr82yEdxMpjlOUBD5G5MFiOCnhvjFDeMX1Vbm+woHa1hGj3yXgcHj91lMtP78ZkD6gaHa0H1P9Xf+RfCBpNBk5lHw0R9J34QxDZldma1ACrPvp1k4HVtRPef0RJgsHPF+on8T6kBH4z60xERWDPv90R8a9mB/d8wH7BGfF6FNNSFurlmB3jbPpgat9CukVQjbMkhsabojwp4k9aIPihCnFTWogTu4c6XiwRMhuWeii3iOaQbOZAamMxI28eV+1hugYPPo0yKHox7avDwvmQA0SrYOOVURxYe5CnXZD9xT/TUfa4UpDXNXYqF4xxYVJDMAmgR/2Ab7ABr6ELLWagerL95fGgZn/aBPBpoOdHIwxiY8dMjHTJ0zZyjk1dJHwqlG89Sj+OFoUs0x0dWqXj3//uuu6MnVsuZ0XVGCiGEO+AOi5KTzv0YXoEBnlggeW2KCEjqP5Ubmx04UZsACAyhbEdRPEdLYvPixQfXNDZui6YT9BxaHM3iyQOwGsR5hhD29wX8psJ+re2mItw0pt/IJDCXhYhwN2bskBO3Wak68Ebo2ihHo080oqCRg90Ef+H6HFf2VlZq88jM7NcxgNkdgrxfQFf+XnPBXnJDOmpZ9B7LrPeIaLiDVDx0FYNkhEJDPVqwaN8hsPu62oYCjmGvAC3NTh9Kn3Od9+tvvc7ykLWSMrsdRK1dGLi1GWlBmZJ5mfuLUb9IH6QLvzJsW1vhRPGX5CWFPjxdJ5Vm8TdyAyNb8vTnh4ekAnG3saJCNVt2wtcFt2Z3HS12MSC3hIueLehZOOqpCtIZ6ixmYod//XyC7TBoTyJb6B+sCXhqKNBJ5/2Uk+jRyS33iHOAXHy3tercIlXwYgDwl3XpDs5ThKD6OxshmvqJwTYFdGKRJtMIcljpIrSvyIARUvkGnpf6mK0mHpOiEpTepB9pytdZXt6VtZXpwuL87ayV88pppg7hqbBLTqZWgGisJ5fp7nGZHP1p08bWDS9HTn9kHQdayoHa6h2w7C8OqI5ahiJKEznuIcixYM7HbmBpqZpqTUb6UFDvvBye2JFraXXEYmwZppGZ+IasOV4J7t3SvRXOSh/F9ypuUkzCnvr1WGQ40yRsr54StwEW0pcVoh7WoZ+0Oe5FTJFffeLQnwerm/JKjeVToVwUXBzPWWfkl72g/QeThS+f/tsTp39ARGhI15/+GjmBSAUT/b+LIcsqvnnvR2+U5dDQAEVD7ME6+BxRnFPwPts1aV9t8YHlJ/+UCbMmUYFVzmrvKv2G7cvi6eXyT+QJuMtpneHiQdex/AXxUdbV0TS9R1qaGRWJnIC/Q2p3jQ4iX5EHKEa584+tgqLwi70a03wkv+fcs7smxpqVAv9qVDtdCz1I82f6IC32Qd1MGxMgwHACVBZxgkHFuLb3BVDQlIWp9lStJDBKGv1khfu+vbjYVT/PF6/+j6y3Dooq6hmGUlhjpEBmku6VL6W7pbgEp6QGU7u7ubpAWpLsbpBuka8h5Z/S+3+d7vut6f525Zp8dZ/Xae629eIXd+/HPvOPFzU8Dts6CwPtPWQ5tk/nfR16dPE/lhnQ/+JchsU46XT2t527oOnMs4LM4VKx0SXY7vDIexZtZ8X2mujI1yYumyZgyqKL+LMWE47Nav/C+ksW1M+muEJaWIwxRMEPPpEXCKBHpxO5VeOQSGeGWscpiFWNL0vyQoHyCrxsS0Z4ycgir4C0SpmfzGpaYRvpouxGDt8gVjksrG/ACSTO8kAqKA08/v84JumZMZDnOCxIirIncFyHyD623z5MlGOplQTjNUYAvLXHAIE+71ED+dh75iPm6flNStuTnwYEUQzVSO0yObsFWxs92meBv87BMmT3rSQl47bRFQxK2KWDK7zgWJLFgB9K1zVGnH4RQVA7iGrLql3qlhYjrffQ5Vhn2+SjuzQSJuG9ZkFMrQwIek782kPSxebRPYP+wjJwb2Rklk9Yh6sBFiJ6ziBVoyWmohg5VrN7mF53Fu51Yx3GeIFslBwQNiQQsVKzOROxcVT+aRS6F3TrVCzaXoCO9V6R6VwEvKzPpzy95u7ELnYclplsK/sYkp7bkJ5fpfKiRV0M0UnVUFffgtpWKJ1XEoboJOmJC8Z6Zow411mlLF6VP6q13pNtlVHrlpeJIrozLEQJ1AbNDYn9/PD+ciaatDDowPgLI3truiTpBHXlZLmWShgK+AEdzNuJlWotQ3qT4Wma6XWwq2gZpHKrmWNqpQLGDc05lQzbGJmHFWkeZEEA46YKcMrrHhIgfMn7eFDIA14kUdgG0CLkqrDx0L+kEt0iNDCbk6nCUAzCkURSo5iA4UihzIqexjPtoiVOfrQXnFNprmd1JHXRujg/zLlSGlv6Tgdb+wkamMj+0/p26h4B8wgJCZZaqLwvD2hxnRAITaVH8Xbfx9MSAU65k7+85Uah/M/taKyc5jp82dtlGMFZnIBSqVydhBcd0mv7Fi5YQikhHnH9hY5INTbm9uDPUTuRMTvkFX3rfWmHgiHbvCtuoIrtfWxsHD3zNeCz2gd37otWSKSgh/bTJ+mR9Hbm0OeMm35LWrQZpqy4V9m6r6FzVrg7IkAjjwiuIepaue+A32hbO9znbIqnmvVgF36UbSaLfSyl//kkh/CCGrFAauzXCpLVWFk/lR6SxGYavcSZv1fYrYbt9LDQktTb3B68G2W/RSgThoQggqdSXplzCmcJZOvZeY7WJ6H87R1mHIcZ9cd9KaWja9dAVY3XOoKqK5idyhVoNh//KEf6PonXZgs/yZvXTuHBPTBLXcP+9bdJZrEDlb/iiT6vgNMG350Gm/bWSD5BVv0Ng66/re2SAaNFUrWBc6ACq34aNBlP7WY/RoxuWgPKIQKR5MZPC9IzQRggSB6wqzKJASrrUvxtJr0hn4qAouaUEiyuiBzqxqwNhFgQT1ITeC1E58/9MAe3vhj1RSzPI5Db1d4PLw/dfyLri2RtvvDfuxmwyXtAuQ3xuuQshkNhbbslOnAo9qMNbcGYd9kn3w3mu+JtSDf9uvrKDp9Ul++m8H0bqeL/vcm9nFGu2dLII/tYN90qk9qyajIwXOhPJ4wXE+1rGmw6gBREBXurckDVvfqhXB+SOerxOa78mRTBQ53Bfr6aYRd3+3ktbtv7deAy+YP3FDqmAffI5WfV/So1fZPdPa+O+6YC+37H/vfvqIDmutxj0C743HVmmE56e/eyXUZ/fr0RBqUo3Mtuz7H4cwBjgpDrO4OKX8T04rN+y5NKRK/n8l5LmpLJRa7PhF6EByzBSzi9XIstC2o3BRaRk8KQpceP/lv6yT2JL+B0cgDP1UoTOTSQAg5RH7pKsxgxArpsSt2xBY7D+wXEMvvgu+j8l0hl3PYR05ObEkZxIFwzVFta/d4cjf2fyjP6df+t5ZHyGSHrllopc89NP+uhmYm8dy36h+zxlba+uWwn7CBufNNlyYCn0HQA3DuOSW9KW7fEzq1t259eOaCVnw+E92TUb1iEBzSkP//ss7usNKc7FIdy01ocyo0/a2MAmoOd+JsmdilFIZzZg9rPbJq+2QRduN68GurktW/o5Fd3AfMeRS7+ddiALcyrxdElnyqrfrozN+dyezNnWU+FDlpHo4JsKX8LaT9eEesKME5a7SaiiOYpaZcRyzwg31ke1lIG8/imd+CfhijPZPiCaNKKanzpVPssBDfvj4CUFH/r7gRdhyrxBz6EpWbvoiE8l+LnMVqxFPkph9zSBPh6Z+6ezi2YZDB7IfM8m1o36kPX+zpNn/YunqilZhTMKCZhruboRYrzb6SFqOw5qA2Rasl4SPMfSZzZ1JP3O+3EeXJLjPJHK+l5MNYSLBKHUwvpEsUCg3v+Vd73puCplrRhdsSgHHEkNIR4HT24yLDBCmgoQSevyW5lJNOFVqaXlM4/d39CIv2E01Att72qOdbIoOpN4c9/Ll6BR7fN/9ApTpvO7D02ZJg78mKV2lt3+N4hmxtUnlTuPSR6byFZ7uwt7vrs+toTX0d2+NeMxmWLC9/D6ctGIwKuv12gvbMGU1SQuJ10eiYOLChZE412pvrZEoFddIv7G9rOt+anrh0ABlabYDuDvFOr6rUgJWt2QptuOprnm4wCC4Pkx9fD2h7DuERa8imni8MOdUcRpvC999JXrKUQt7E3YBl8HE7L7dth9JxO8rgw1PeVL5fVUhN5xkNYyg2t69LSnJ1bEgQHnhKOorNJ5zUGP6IExH5zxmK046zBlSxdM5zoxHjzecilPl08v6Z707GLNVS6T6fuyINUXGsOpU5mG9NIeQH1C87c2tPuKznj31jDUifuMsOFiWMX+Nw5yZFfsD/G8DjaoJv99ROL+JTtB2CD7guHuRHxOA4E3JUKiZVahPaIaiQNRzILvO2iXg7fZETIqNsTzw2tcY0x81JGwVGGZkPDq5HJ3DHPZ2AgJREyo/FMhLxaHhxr12ary5CPYP+Hfw02SpuLEAlleUkSFsumiYlK5pyYxPzbKrIcCigJkulPeULer0jPZi/ullKPsPxevnGGAjbBnStYTCy8VMCpN09JojRmahZhiJXs2jCMYOtU1wOMJv/DefFng20Hd2+6zH8ObP5DQUx5pgrowZnXLKsTdCeuJurDI64Z3ZtR0FhZRC0aVtyHcJVLxsIObySIjAYm1NzgtEnU7sjXHAUCISC6ty3YQrv4b9aEkz2ttCZ0LynuE926xtsyqxqLNq9/Xj7hM+tGsF2J/87xi1qF3GsANm3REb6DdzbzjIrTJMUbRkeNMPV2XEfnzSo+YnapZ+tR1OpC3pzdtEO1PITBVnVgYHxvkQI81Trq1p1vJQVhVT1KoIyZpy9J6EOaT2JXWne/xvtjDcSNIcJWPO9GpGVVASVDVI838VcMUwAMbdO0PpIKdSyS8Fqgh3JkO606n4fp31nBOSXbjH4v5P2HblgzDa8M4M16G17NuF2KXlF2fwoEl32jwp/+eaMzcdLkKr/9VaAM4zFP/6zzjAWXaNO75WseFWfF88D43H00Y91s8KmYSawUr8yMNp2FUL6cZLHYT0RP65LhB6LmxHKJsNFQsQvL0AHxWtKE+1on+LYtv70rvWM68fafJp1tDkiUbxJQ5Xc+WztFnuIyWNSGxSTimiaPmfouVO3kIlzKd935yTX5Z0rrsvHAwqlTLhsNHdreHhs4JPMAj8KrSHBPIGCCOPz2iPEKUj4s7C30u4Lw2wwR2BwoOMpkqFKWGsI5cs1oTQv25JwTh349dtgvjr7dRRqXse4xA+iTTHcb3JqF5DQRCrRHhk4Z9Md9KKfiFXqNLxnYL/7RMo9IqQpL0AGgPG1cdYPcl1f69BrqF0ZKN6LlZIOAZP68W7m+dFLNrWB7C6yNFeJT/iQGNE1HrMi5qvkef36ETqrYPHDaeCL85PRv0h5cctiI049mL7yxXD+TQpwoYbN775dIfFLgBqxD6Ylq+CKlKF1Cn3xv51esGwcA7pGdHFdswFrUykbMSpXrImJPlF13vlXd73jpORbHSFGfyquIX3J14AcSV5oD0UKH+N+xPceZp7j6u2xROMhd/Xnld78k6br+aDSnrBzM+hXWHMzQoeuODd32JNNgJm7v6eda066vs4jBm4gVVAezTNtFUgGbsR55p0+DPcDTC6JZZJJ97AuLQkWh30ZU+e25s3bCKsFmIKNnAMaEZiTgaFPWKYSA1ke4OzSPJCJlKw44+1eoLZdBkGaEclEhb6Hr5FlG2+E8nNiwWM5Rxg8L/bwI433tN2CZesDy1QFxEu56X7X9E0ywzLEhAj/VvYRCeNQXJ03/1Iwfg2i9fwcfCZIbfi8qgxfQB24PPsr4sifWFk9hCdKiyjFx6Go9dO6xewT3K1f74+NViD18TEdQZJ7O2dKoLrMj95F1vhe9pVrbftvZf02H9K1dqltNaQ5jAnO9vzEwV7/ustp4NpQinT3n411GGslDbcyDYxumeogMqnHz/3TQ+axHuE6a84wvVeraBOdnCs9z7VZ1XX03yQp93X3/ee11/KvFVMtMrcdba2g/wFNcdtews2RRyvHUfj0I6rRBlq/8rKO91lkLUwk0XDtDGMfmRCC+IN82G9Yc0m4Wqkg2OutIIySDTwkzJOyir8jn3Czn8pOsk+OEKEkPzRPfT22bxHDG8Go3hJ5aPGuf/XAbg5JEDWlripnTxuydPMVeUPFXKJ9P6wmL+pd2xl3uuE/c/fQJaNtnEf0ydGAnlrCGU5/tPsH9cIbUaR69uKoI65wwycaGh3381pc1GC9DBzZRZ2jtd1mNabTgbYbRsHmpEDbk7JKcMe7GmJn9hhv7g0FReKy8gvnGOSC0ejJkz371gUtl49/SfG9nxbParFk5CgJbfnkN5nxI+st47o90zmEv4qITdS1YH/FBD46o000mbFnbxRvn5xbMRA3ZZMvVTTq/ai8tdD4hpZ7HUB58I8y/uhFAPic7vmTh8+NHaL/QRRaLgT4UT2pZwC6NsSVv4VDdIPLRi3UPSlyWyvpD8xyfKMCtxlRHe3HhnMbYt2LYOQt4FkmSsjn2+qqj4oWB2hcLk8gJ65XzHsYbO1Z5s4C+p/TId3fZP+TeDWFvX+OwfYXu4n3x6/965M3o36WImi0eXlxBq6pE8HrzwqhLSbPUGqHnfPGjktpBZymOOiYNJos7zv9j5hSA61240AzPxbNPt9895d3mNEYIjngG6PaDnbxrn38Wr0JEAxZvdDOOTBAEagU76RCMeZjw3cBzyKnmxAwylTWdD4nlVcFVQqWvmkXxL3xB5xKB3tiNZHCGU77aI5GpwHSGqspe1TS/x+Rd978gLXFEj0ET8d7zvSBxCiGpHWUL5C75Msx3Bn+Tmg3A9WbetNGxXWxa+rvroazV/sfZcfAfOzJr+NVJAqDaTMmxEgjFGtzs3JXOcCXZA4ylKbmZJV6sZOzYjX4h1yiBmZ1z+rc3Hlcn/WDcVD/71xKKqkHh6x4sBC49NGh77QJ76TelRoMjappvXBD3wS8luF1E3r/VLhqLt9PchXq8em11FSuK45GSpf5NJ680cO6Z18BlcwN8Kr3DLKIiD72J19Q4HcV5zJMfz4Yz+zuHEtYlRsWCtu5MrpUTPVR7qaLbLvo3xTFJtbwJfcnVmPax8u+bqRZa4G32qyVBppfEi7zKpJwE1E478BnLA7l/+2Ww4lg9+2Uvp5FN+u7jtk7XZWBg1p+YLq461iEwC9YqXJ/WsiVVDsvaaNh1iFC/P195tgZVfDVQlD2MVkAkXsGxrjAwC1dRt+i/fOlLyMnbda7BKQ90knPluTs3iZCO6c83EHuSJ/q9anvpvchLpkEZNF3fZUvHW4ySchOjMvFRG7nBxHzgPwLwZv4q28UGHM+uw/JVtGRsr4EA8WMTBrNvi23qosVJwIaZpVK+lyjeG0BSLPySBClYqIvfJlvVLbrZQA+W2B7D0KwG/fDDisFe+WH9SLXdUo2rhSlsRn1R1sVdy2MhT9/0oUjVN06S4Iec2VO9KMSzkJf+QZPsqQ4fiiTs9qvBRXMlaEY1roVu+miZVpt7d07jx83FNUJjL+XfjIXOnXGVMVV8K1eL7btww5U4/ulAtVdy6fzcoDAQbxl8PpODbsAakGcpEFaozcBUBNF8DafFtbh8bKQ0/2Ju+4EVEY5QIQMKnNWdSsoEuluYdCy4HPoIa4y+Cgg8IaNrVnS+/+CIyL6lRWdKHCO7CF/YgD+WWvZd3EsrPvkB8YuLS08w8Y09OG7FlpXeMNqiBB45212OpTfrUbdnBQYUmYdYn7m1s81iF92nr0qcfpsm5kgA80CVg1hcetKzD4VnxGLLdvxyA6x3hR4PCriS/8yVOBMgX/gUecoOntw0SJtTYESlCQvYAbP56nnzr6Z2NWzgaYCB+C5KuxKf2Vjnm81N+8nBIrut1pW8glENT/dibGCGAdG7OEhE4+4AgXyh3Phu/ELTZ4eh31J6+ZOcDudv7/Pz8tHbyEOfThVEGorrq0L05n3zgv/RINWadROzMXB8gTX1tGNV9pczrdyCbbuGrXNHGO9KEQ/Dpd+dtPguc6xXa/qcaUT9+wfYW+MmTFgi+62be8AmCxspGKJwrowQi0mBespNkyQqOMC6SKy7HCYLYyVkh2km9obyb6Svuv+fRqfxH+e1RFXlO/ZXOb6IA6KjdUc5kRuTMlZUm0UEXr2CnNq8Z/1ai+yHGZiItIi6GEFfwpaO2MxYW3hFLKj9N4RJ5hCHlzQn3I2PoJbpl2owx3Cgu7HiI4N/xUPmLUCL4l+TwYCvWbX9UiW50ransf0c9K5sesrFrV/OkH54bUN/uWCSRdfQWmo4GVHaOsFAELgk64H2QnhIa/chd8iAs6Dd6Sg71PhLeK/u9cCACZ818WyCq5Ca7Mxapn33Z4/wKSTMc6XUfVNPWykt2wpWas4r48cL7anOSsT1Oe7GruiiBdQ78XsAyq8kfFugqGynvauRsbx8lCaJpbFX59AQp89jR0hglZtH/bkxBFcSo37+DUC5bTNA+wJm+efBFPJVVt9rklpV2z5j9040dEEjY6PPTaiatsXmi1avWkHNQxK73d332DFRHZQashqZYvcsmb2SQDWEyFS8KLN9/W/xcwwISgYB/afqNrBk3/cHzE6pnDoCa2Bn8UEP58bUl7ZW081+nFU1SpRf31to2am5b4lU9pjYOOxmU5RZbvg5gNC/qLVxbX8gmEqJfKFF16AtIzB71GvVhA8M//x5F5Eg0rSbPrct3XbryyeKzlAdWlIilNSK89zHv3mNC9a7vedT2VnoVqTQZSIG5ZVH3L3TZRfFRDotEeURgLU5t8rWw3ExH/DUX4n9jeKIt6Tt3Mb7XA4igFpwtifY0D/As68v3e/w8GaRrvO7cYvrzUWWlrMO3M/OG/wJF+y/CG+wRrP8Gik7LtH9pPb2FB9bmH9PRPK3EhRDha0zN+0aH9xHaTFn+mvn/J43Y7dxhJNoMWU6noqVMe35zNpWxQY3RdgROEjCvqgsZYMI290TfIGnK7WHASo12wmVw4zohIThDKIy8UGwBjx5G8VAfDn1/Jppm0fzG65YiCGAmflag9KPw4OJdoAIOUndWWBUVSoDMvypxsHieWXSeM14+wuzJr8vzOR+eSQ36fWxQVsAGPIn2woKoW30tfh9EoUY8bndcW32ZiItm+Gc4qFeQ/kvhMPPGSyRPld4lWYIz9UQIm343uQNn2pfJTPIrr37KHT+bIGH40Zqhd2XU8daTQChuDRXOVt5thyL3tdM6joM9W9PDlmeGXy4nW3ff+uHdOoZwJxIQYy+ck7ClYOkVBYZFOvrhF0sI9tzgtsS5fCaiM4TB0YST2DQZJFd1+alPYaYgLyvS1wD0etPbA5xZvmWn/zrWHAhO+n2W8W2y7eUDrtMJXYCh2jvDv5GiiXWszZtsTIHVLZif2dDkiy7nevFdfjrbEghgAFeJyE7R6zeQLw3TeosHurh6lawOEYLfN6m0YgibIC3jcjQgqtnwnw07stVQNaxrFwWWjH5ltZ58GlcSqJ2T8k7fxHz8sroXlpNNMPv9CF0C7wpKkRRrNBGXaWh9BDdLZBfBMt06/e03tCzodevbytYcZR0UUzvvJH2BGj5ExpyoF9PFgY/HcaItG7/03z5GG7BdsmbmTNAkSA9Udf49ecUKG6K8UvzyAaKAcX9Lanrn6rNw/h/DkJxRT+jKlRCoG/Qc2qzKiLRseyXN5JeyfCeNhzzytBPIRPjaIJtapKEZIbiCjiS2IC3jLAp2m8a05S8leOHGcZisKoTKqqZLtenttLxsYTwOym9ITvfI6lfcPsaV4jqaRhZZs3Dz3fXNxY0IkTVaenb/PBLGnAt0qEdSgJZIu1uIUGCIisejmZtcIv1CXXKkLaMzkWTQ0kxhX9BSPnSldNrHiNspXDHRa21udKHzHcPD0FsV5btAQfy8ISRPmINrdvzXz1wWhUdWDUSV8Dvz8g1EzevXcFJ6Ik1l9WUZnEyVuL4m4nn84nVaklqfJ4NwjReXla5cFb+04X6rPRdNEkp0DU9/aHcDQkc/pAnyuWedtt0Ww/iX8C7fsn12Kf5/kw1D4PLWjNU2czqMXbo+oWdMGfr/FdL0SE13fP+9B17pyUT2P2WKSvYVB9Fg+8wkUHP7iwbxqwvVXr9H4pHflXKl+x29aYvWXO9ekC9N/ZmA1WoXfXtYwlFuadkeybTu8c+bKuEfEE0gTeQJBwL9qEJTWqHSfeM2g56ccdKQmuJlaSTJVbEdko4jZV7CXcstGZ2Dh71GxqPmQiOy0PYtiI3wKifWK6OzOPUnzwijtVeW2iXUWdCaM682ftX+YratEd+2Mx7flrPgR4pXL+rB2YBAxmMy7k8ruVfPg/hIYop5GeBENXTYvpSJLS1CHJ8Zq4XIVy30hfS7ZgLC6N/zOL1i8s6lP3jhyQZE/x389cKVyNAEneeZ//MYWzFOIdEvQq3UZYr3o+RouHN8EHRkvkEJ0QLqazSAql1W+u5nGkqZ+OiVrImv99KSpODCrBBVRmxwQKwVIsSwgNfZb2+zwr+/GGSiFClKFQM+xY19W9io4CYDx8LB5BkiLlR94atJ/S2e/O5Fcfq7FzCZJo50FpXPStaMCM/3nnDdI5l6sEXlHkQ5JJxowg0YpBi8p/8zYhf/IXWfGSdUObGbKkz5vZ9saMpWQeCSLTiHoSm/Uy7lVXGyv2E9tp/04H8Oyrv/ON74gwHyJJ1R1LYKoPIXzHSBLLwR8W2yCx79L9s8MRXKtPR3BnizbKq+7r4UojMHvQr2yl1CyYpN+yRzWojxY7gnzZWqwb8ylel3PF8vzbA8Ha2MOjoSIvc9Sngp4dSAsVpWtAQsXeJjVnzLf9MlqHj+SGMe3mIVNopTf5bKW4VfKq7tDZxc3GLQOctbOPleGmfMT6mxkgeLhn3x/W9xp9q/QbDBAhvCLxH/5wjkmrIh/EgQtZ0RTnuaUw3KrBSw+xvQ/93fsB83hcebA7vvKrfjwZbFj6niG8eS2oJSjwcgF3LX6eV+QUXj8pg8wPH8NaaZZRggoGfBWqJKncobb0vrRu48ZLibDIIqXle5dknrvCeve5WKg7z3CZZ1dQNEg2cDvzMfc6mwXHrIAOr6mpusXOBeozHsN+GfV0cRnRLFoGr3R77z0lUQ1W8EWbl6d9nsJdFEBOHPtpm6PAw/ls+2FO17jNXW/mncCRr1Dzy5yc39aWoOPQLNE34YgfXgCtRAMVVULjspG46NjZaIB16ww9K+/FZ9J4Dvw9PNoO9kKNohg/lJ9ZtXh6o//e6JYWl3eCMCzdGT+LsRIcSMDoJyrd9bWvj6qZ1+UnV2X1sFWKxeJBlJoscqqwfJE2P8f1Pu/obOghzfdXTGyhPZpq8u04w+JTw4PAW90jjLW1qmAB51X1USIkw19xiBLFCb85Kb94yLVySymtmTOahaygtJ7kQWdFrrqVTZtdkKbr+BcuVCBHfu5VDbcavmOKkAPdlsAeXVyQpv/6ZlZPE50+6io4Sir+fps5LxPnIkoGpbmHifzii1wZLC/mDB8jlGXwlJBZYrob+c7O3CDbMqgfKPGIg1Q5lz4buiTUcDA0Ph+hulmgA6LFs6Br73ybG2lWq91LCdjKRyS/lpzc4day32hUS7wBxGut3aj3QjnS096nKuvosmsz7DPmko95LVVDDBlmWrAFmgfE5EFhs7n+xFFostAwTb3MW8MZXq+fvrAzaPKc8lRUv3OhYVdaIedTobXTH0NfalJ+myKnoNsVaLGbEU4caJ3AhnexdnkA/LHEWd90VBe0pHgyHrgFTAUaiw293iAyEGYUI+QVDK1UVnMfmKLuulrCwSw53ZGMJ7mxltOyGFmXj9itH8ecQAjMyFq1pX4CW82aPNqIGOVGSceGnmHpgNC4xNoL0JdYEbli8MKHw5Ap3mED7VDmnFLRT9ykLbu52D9ycOZ93YnUYUvc75iuqd7s5cYTVkHPzuiC1q0GPE0PyQG/c+/jq5s76YSo0dvrNYrF2PuDGaOAdpt6gzxubN8EYbRc25f8hRwy3BCmvrbQkhuoEKWrIEfCGiHJtTd+9tCaKcX4qOIVH5kunzvfhp/UEUo9Xbepjvmzuqg/1m/Dpxf3dBO5ewfm5zh3WVKdsFVr7hc+POjgB9kvFYbHZo8EmladQclB8q/Ob+cYRxWPNq7HpMsFeJ0YmMfrwvn/YQY2GB3L97ImRTjM2tUwyyeYxPZG5OF/97yjKp5othPBPxRNWQfrQGnwCk5ZDuIZT3xVULrhmoJUxgp/Q33vVOgtoKeAKU/khOF8jqeN0vq59JQ0soeR+ngygUeaphgqMyyOpbLE3NFuhXHPiX5TfPvCFxNksJ57dCWnIwDzs//lqabU9V6c90vslq0ohddfVienFnEVRMDSQsBFWy6HUmiVnJT599J+Rzgmoxyg+5sJ3LoYxo7s70F1h/vLtraaBjykjosJPlzr7XaGg+ljpx1qiq/rsBeXDhquN9g0RkyEb8H43yX7OT1U6NLcn8lfqRIyFEUCjKp015t4bJA/JLM3HEmoO/8fu1l1onfmpyVR2ZfAsLKafPaK7fFlWuRWrLl8Tpt0b9oYK7iKk4PLbcq3pb/TPFqN8hGL373/UMIb+isUV1sLKGnvQe/4Tr5tLdMre/+Al+EQvmBK70aoyFAheeNr4LhVczF13cz2156WVIlO9J2pVnyCXkyBFln6+QctAKKWF8tp2e7yIsqHLmHnC4wI3auTIP6XXRcY/sd5zLaGqJJfZozA/S4aTplkf9Op6wGlSiX5PSBjkIUH/zVWz4eE+1g+pM4D2mCXqpHDxZZNqYg9rUyeDUTVNcs5BGfHcGg3bOqpM4b7PzVIlxn0s/oPG3KlUXhurVTwXpLb0HG0ZZP2kChfAFTnKT+dRJrsw4hYkMesgKcFj5QweNrP31Ff1zqJjexRrG1DcPk2FjzUVlh7aHvI104Q94PmfOdL9XgDiR7X9WqiUiAspdjRypXKIBTThAkfvroaOVGhL1x1b+xLxYV25JXutI4+XLFJ+z2o10XizbAN6lCsauQAVJJw+CvvTfMkLrCqBNbx3P6qCs/BaaKGTp4lZh0vSppzr0VQxHMkj1hW3g8gV/yMmdyUu+KOwyChXSmLQQC/ZiV/6WGf47H9nWlpUGW9Z7egnSbIcrEx2JN4ZWMUa/XFQNW29JeN/vaqZUkB0vn4LIxaezFCyOtuSPaoMEyAHuUjKP7+jvQrZREnTR3Q+IyvIzxdUuRKiKapmVQ+ATwoJlEKS4Wp0MMw8E2chxpB3A18/+Yc7k3EwZ3xwKtUxetdUoCFW/UT+IHBjnltzfNrbMiOcNUSAlFHbMPBgVyMVBLjWn4cPK1i9/FxHyS6Rcu6hY7Fs5m7smI/aUqh/RQYSmR+lLWVdcwxqp7/6c1MIMb9/FhjkESJEWi6nAo2GFwKufiFG+TD9iuc3F7sxRU+fAT0CJLtk2kqGaXRKnSswcCiqG9pX5blocC/LuNZX8MtPiqLRnovupBJk+IRA+KAtOfctfBn1AzbhJYFrHLBsbfuyqZ30e5yRXjvHDphuNJqUqcIBEUZ8hKn6wV4n9AO3bupuQ1fuJiWXHiWTvl2qR5Ozuh5pgFZ8aSRNjnoH81JoBMWzKiJKgXvqaxc9RYVlRIbiaJjEgMjzUHgpxR7bK14PwW5ISynTwr2N4lIjig8W+qVH6wtc50mKFwKVIkQZ2dAWXzPAQksor7BAEuvr2kiNiGrt5D4XFts2d6YYziEFBj80mgEkZKAnrOMzxM01CjFxED7zpSoof5n81sy6hZnyAlfCS8RNd9OuERzFXfxnmPjx69/VmGb9j1oE3yNgdFCKlMFiFrGGRvQm+VSw2VdlhYY9BSNlC1GSMA+RH7hW1UZhClxo9CJ8gNzTQcw5bKA/pC5UUFEz2EnPGiBC4EjnSIlOVUT1TclT2lJeMiXTR0XPbu20mSO7eieHUxLrElVXoIhIAo8i38NeraDFQNIWS48AGYB6/WkWI+e8AirSweeVe4A/jSgXLfRnil6AWlm5nVE02zhrMb5Mz3RTZUf7XD5OdLgo7BSXaWZ7URQuK19yEF2LfeukRsXNj0y4jlQfHY1nKcHcXLOixxrdENt0RpNTJeYrFBKLgrEwumoahs0BJsVqzUOSjqWPcKpZgXNiEs9NKmpJDo9AfOYDZ76nPKMzAP1fZTRuddriJe34/SXElf9gruj6fvLFGHhdOC67BqOvM31euwf5uXOz/+5L10LM0yv6Ts+NPT/hD+/Ra+uJuh6FXhlYI/TPvWEkoC8txAyXsOZ7OASa2gOnDYgmAs5SHWMa30Ble5dfOEx/7SrbIdT8FbcaLh/DhFqVLzhBtFvOJEmIeqyZ8hP5eILCH9qJFe+0ceMDm7KFWHokGj6iM3Cug8JZgQ/et3lH+MboDx08XlR6irgkmWizxdNL5PbQq148LgwKyT30f/ffzJKo7EzvhnAq2E9EDf8VZ5IkCDq6jfE9/C4UT1KQFfvRnWEM2ZX5J+sDJOaaFBXAoWJVkFBfwzwlWD0ggP3Hwas8PfqiezpsgJ+0aGBiiKZRpilqqk0E9YqUzIuiTXRglc7qam8evCXuXRNJjVh64qRLBq+RsqzJEUqyrE5oCF4SGwBuZKCgdhdcelEO4RVL2mUxIdGp6WE48D+4oACfmJerLWe4fI6PA/uBtY9132MilmJpimyKzeKFSCFLi5E0kRZPpUaAefxT7wijTpLGlLeZhMWxTdih9qpK9Y2++2yJMgfIClDxmccLkSIrvxf5SFILkMnancoLASa0M5YdClf+Sh3DkvuqjPw4G5+fnFlH8bieRgsJVNUpyh2xHCSjPBelY8HzJuZWRVSU/qNGSjuInoFONZIzcw45/y55jszBBf9ZHfvcr2bS6YvcGXFG5zFLm4gxxuJ7jilrW0wFSB3lcHuwmtRYQ0sTePdcuA5OcW5+/XlbYGiQ1Np6engJXDaKAcw/L5nWLlUcso/fHBauNjQvJwh0Vy+N2/Q3uMf521MFNv7+iCnMyfQSmrVS6Qy41hb30jrOOFLmn0x6irm9vbk0Yrg+uSG6B86PPVstf0p4+3y6Q6H+ybV0RVoyEuADA36i+BTevgryWZ+Nu+hliPTw8V2znyxqerX94lkVxxxWdpq1l+htfeCxwBdk+wPP7t6onN3Key6bzKiBV228Op5mO9WgZ0rUG1NGq8HDgWJz0XfSBlq78F5eG8W+ldYa4FCdxbv9o8YQ1C2bx1Hf2hFCbMy9j403EK9529qoFmc+BPt2Axl7lZaI6W0aqSyfW9ooslO8J1Dnsol67fM9rlLuTO8sZ0mwgTE0dbugCL8WOCyhupC/y4CxZqC8cvsaMq088tuCwaEzomrPQkFD89aEW9a7+7nXk2wbHzc+6OpAQvwKoXWGLSNNPY7+09KoSV2q9/nqxSZL8+/SckIO71MuimtUlwRfziGspbQD+gz93Pb9nN8+bmOm/czQ6FLq9PMnj3OHoxbEfzA3hMDoh00BL5VEFoWhcpsAe3AN/HwmrPSmbojxki9AHKg/eQlcIXf4KTrjJIXsvzhn2cPx4fINvnrxc+k3D1Ns3Jpv1jQknKLg4Fh8hIRgEDaFHHXEp1LdkP+hCbWd2516qpO1sdhu+Khl1Ov/JHTBj3qL5IlokdAWYuBRW8JYuv2EDOIdaEL10T8A4I/vuxw/V8gH5dz8i4GqKhQJm5nrXyZJwVdIojKhsoSPEVBNC/9yVWiiK/fjZidJN5iVdee+mlPQqHOCHPfWs3ld8/DFK/o9Vlhtyn5ndDmyhD6a522bp67ldcWkMXGAwk1kaqzGtuetwUBeYGTHKmiswN9WXcFmciWgM+3cO/SXVav3SZ7YTDc49wiRjP8LTVSbevjdc/Oe5CGyYDw2vk1CJt8qt3zXgvR+ba9hr0kapqWhliGtppRPrY+wvZG930rx8bB4qo2ofW1Drk0VnqCGxYNUbyuoTKLpqkS3XGaQBw78XMBihAed1VZWmCjC2aAuLL4BCq90DDeroDnvLNdc1UDN2LzrMvjfVHdi85B5KBBQ8ploE12iS7RgjNdLiS1UN7RarIhrjbpKJhxgk5PvubPmmbWZ9VDNDxMbLrRV5SZuUW4ZFJaKqhPeyCkFfbgVicYHzXZPMX9N12li5y4Ix4hqThbOCb7NTidnxZXkAkUHlcxDY+VoXUsMnYHfbP1i5avg0e+WnKwhaEBqWrzsB2l4urWw9ujZWlzzcVegLziK/gGuzIi4vcoTAJT109DMrFa+ldQuvvCp/gMApycIj4MLBwaHABSlsirBv6EpLv4SDw0WEgyOE/utmw+Jq52jtZGlm9tWJ5e+DndnN1iYiXsdumQy3f43mmJ9s1dqY/ydlqN517ee4TyWpLu6FYB6J3j547MY1b2QpXYtBUQPs9fE7B2Yfd+enJfpaRJOCk1ep1Bwy2TgtsSst2R3eQul6ysZvT+krvyIjesHLVg2PZ33y42JpeGGPgJrBZLml22E6Eoqk/QVnRTRIpkJ++O2X0dTFVbiqj0plmlxpetWJw5ESXVMg/5wj7VdN88bTH/fIe75tYl42Rvw5zrzR9grWIBIyrHgAUdOtSpptF1zmPWrThTe0uIRMMIWVvNVoNgzz49NxQOCbLE9MS5L3CVwnDfNMlGlpVDoRemd/mm5EGJvTGLLvoiVHHK/Pbu/65uir5/jboh16ufXBakd16T+5QEE2JYIrar3VXbTQj00XOl2GNNabFs/l12EE7eqIGe6EtK/bH/y31vBPREp8vQfx99M6vh/OB5tSOLWsXgJ9FTPRS7J33+yc1N9TMMzj4n5orQN6gF85rvBwHgoMjtFNvikyRV4zQntFcfa7g7L+I+Nz7KfcEg4Z7Wfi56BguctLyo4eN6ylWk/anlpCEsfrY3oNCQBCRbyxoOCthGIS0RzT4wZGpjEX/u0y+3jdXahtDV9NnB0kblwy5Z2zmIkvzcRzjG1K5LuNTp02fq8z43hA8J20MWnwIiF2iJurTBvJDvzmI6UDKRpQlBzrVCFEIw8kIpYXwypjo5LezfPbtbUH6wqEEfW73MwixJd4o64nalyMoydi2it5qs7F8rra5swJnqdQyzfJumLF2486ZEmU5+qEpMNiR/h/k5/Yx82gbhw4uO8W/0/y44CRX0bGyhcKaceAUwzwW4R7D6o5oA9xhb4c3kr195oaTbfjYSRJY1c0ipDagS+jbd3t3e1BaxZr3crqWO7sCvh1S+0LZlGbrEdlAwMC1/3ltz6Pxwfnhw8b11f2oHY93Pnh3tmNuxM3yNnjjst5EgQMDhrdPPy6Krx2CowaD1ruPQ2a3owCPp8DVzveGvgIegmSjGlMdV0euJxfg7zdXZ2cWh483JayKqNYgixCQELtQsfjF1lVBl8UWKqCnp7OCor60xybdVcEjoGZBCZop/o++RFbe+MA16CV85Pl6Y07Aa4LD7ffWQGQq+uNHdOKJxeI6PFKx8maqUEEzcffETET+so0IEWAa1X/9Pnl3f0J+CtHboFn88/FlidQiyxxqtTc9PP1vB2LT3Sggemet7sbiAci9Kfyxdsxy73j4+P7452vXrfluMq+odejG7+9+DOiFFuf3DvAZ97734V/roLcfCBkWn9anw+vz+5czlXPv2ioXX8k99sVBmLaFe2vaextDY8Hje+dnIHdWhcqGsLK2tG9eUl9jgsgHj6tmjfHQFKAq1eQ7vHO1oNRPMSJ7mLaB/DmEML0phlVJwRiq/PIEz+WpV91Asi6XSMdXzk/7yA9GTewI5iKfj4e72/04RUA3XkkLlVUDZs7OD+6eIPchB5BYG+3eLvfzKXesq79klafniGHBzlVl72z08+NG5e2No5OeldrQhk+PvH0LEe9syvR7CvGORHhBizXRxclBiyJ82VAiHfBWtL42dMF5CWZG3wH6DO8s5dexZ7Lurlcd/R1O75Qm49gu94gTwwoXf/miZZ5dXbKz/UJ6HMIoW+O/kT1k+bu8hagrj53atcu67pSUprxyfZnaZqaumzVknxZaHYL1ioc0yLw/mdWjopbyM1Z2Ys3TOiec4FkN+WL0cWqk0vH3upIyTklGaUI5DIq6ogJoomY42SyuAP1GVwINRmOWsoWX0vJzVWO1cRHRjnrZjQDtXIN+/SjrDA/9I8U5NAb6yOmso2Xku86KzULyA6aJz8YYcv4OU4HkiWnUYXw4WFdUP8KHyglN/3TLqpvFkP1yvTrTPLu6/BoBmxn+ouB9wARdfdtYorud7I6KYzQaWfSbFFeNkuVaalfYEUxKdSVBhNt9bOF0XczKrPmNfRxBpFZDpWKuWKWKqhnNhfG1KgmgMQ8P+WNkNQt6AU2u84qjcanwRZeu6RS5VqaavQJjy1vjMTpHXIs0b4Q+uchozDaam6Ma0kL+q5CleWU8KbJ1D18tCGHMlFbSZ0csQZxFHiQjhE4nMq4lNfeNvzXZC+pbjgtMiljVeO5b/QSuf8L/RnZpY4xUzGFp0aOFBq7iVQaAv6hGOS9NwNslf3KWv6sA2m+fToW9AD9d0miJo5n/IlU3yl0SHUF6JBJ/9jB0eQ3oGyggGRLx9Sc1uNuFsi0SHXToU0C9nD95flEAKNvGupx0WUjcfODZ2pEBSRvrreNlXgvDAPgeXepqQBGkgq1lUrQebEdE7DuCkLEtYdjZAlxjD8sfw577bKt1pExuDvw4z15P+sNL4FWpG4XFq+LgRNpFxlLKN6u74c5PPrLbcblFLmZGIdKZgylmnISd/v+HG3aFFusroVPNVp57Am6ZpkCFU7Q0QOwtHeP6wCSvJL9EbyShNtmzYWVB3Jcol/YyfvdXGdVdjHqAX5t+eyWWEju6hU8e9RpFFlfJ/D6WmnG+S2JGGurErGpingBRtFJDKQDGT82BzU4V12p89LzkAXdVz8MG8bA88ooDIoSbsc6EWPC2uP4uIli8sSgrR8fjliVf2Rvxwv4f9BPfCNjblExEqPosU9MdTjY28juNGzPRkuSSEMg/xo2dUkxX5z7xXZ1r6nQnvXXehqCNShC4khKEf3E/356IuIgX/MZ+1U6jWKZuJlYZOTN9pQ2FDbKP5SI6s1Q/HSZP9I4V7LfBTNSU2kQxZgUXmyTQ8HKA4XifHoQa/SQeUZ0mU2krtkF1vE6seA+dAmO252UQZ/f5bs07fKjw9uULVw4Q4kiEyQv2MRBFEOhF9k25GkJjHSMRP08wttFVgX2kLagf1nE+UdOYn2hEHlcx3KHMd5pkRz9jL3EUXX0uyLf/m5XuubO23oAxRZI+ze04eWW1X7imFhmWtXKidwuTnszK8Und8ifbixu4kkZ1I1gfr5FdXt1LB7zlg8NdbZYPFPrDFR2WY4MNEhFtj9QJNff775AnJdASTfltw7/xeYv6LYqWHaerxQoL1x2pn6Cb/RtHsMxf93DXHo9mYlzi57CHt0IwByYkIJZth4Jz0NVIs7z0kD5g3Mhuf0I/iuhg4zJXkEAc8XOLyqSWZ4W24VPOgGsv7hlyQ/ldjpxjjhTxsH4yMKkuqa89qiS6zOttnhdcCxcVhXFI3F2JRYuc6nFFEfhzEtuF23On8b47rIrxQmXl8Skp8jnJQTcUqHEzBMYDl91ObYYlBevilePAt+24MjMD0Vrz6W8xDahVqaAXcaPOgWXS3wYPQlJH8vtDsY58cRh8QYm0ox7Why3cbRQcEQqQulFXYcYI2NQwF2FiZriAk3VOMN1XCj8c4mV1A8UvzZdCQ3mfj7uRZLmL+EDyrlCe+4P5RleF4Lp0HEJ1P2s5AaLHjma69vr5kjcf4pZZwqcZv3wWHK75W+pyp/F7iJbu3h2ngtWdOcToXl0eoNXvDe2bHH8Jw4gru3fydS/raYCZcBfRY91+pu0g3Gy1kRvSqlI1HmRms2hlMyMvMMTOaetnAISe44t1DVTY0gyd4rZGaAiiZmOn5x7R/JuVnakQ6ayltcxYRDZpVqfXA+6PviKjO9zyZmce+/CbROGmRoKtunTKDT+Edkg/18iO7CihPKnyl69X8ag+QAUXgvFMB7Mw+RbhdupS8ffSG5b5+NOoai6q9yGUmnbL7fbbXdk25kPCSQ4ZbsC/m95zf1qtMsTeB1tIwZYwieoT7O9mqrwqfpPGNyhMGOM3WKyNosEDX042r/PHIcy75trIaoi0wZoW2mc9S6U8ecjlMdYIiba/Lg6yR9weIUMLLFctgdRZj8Fk4ja7Xdm/NgdzNtSyLpsC+IaE32TWqwDxZMa6GwpZSTuUi8qYzCYBMrZBT/Ccd5j95UP3OrA2mep8NQt2BX1KXnnI6CyDou+lqTZn8IxPj1yAirqZt7r5bFL6lNJ7lHjOG/nUIFG93RBDJKkco7FTvTrDahGjUxLnWOmTttxpNrGeZGghNsJIZKd9PtG8YWYuHKORfTmQdBYnnUVFMM5DK74Q7dNOv4mju26SylQTueW2CaQ2Kc/zfEi5I360hrlHMk6sIPFa2Md7UzttO18NfKHhyE1HAYq9VXRB3sxBSkmKJMfXr2Tse2N0Rg8b/7xfwfgIS86qITOeYnyfpHkLj9IYr4QlLEn+HVHIN5usxGF/8LUX8GD1qB1UctaaC9pTFTDHXDcrTxmlfsFC6mZxIFqeyl02H1UQ8RljjgmL89rrODHCKg91l4sMnYaixgq3Kb20irwyPsnprFKK7B4p3YGxRMpkqArQvxd+ZFwW310dyFlJKaI9DNUaEtAJavow1qn2HY1x6g7Cr9jrPPckJQ34Qnocbpj7VEMkJAG5QnPSFAGDFYxeTExJBvBAj9NvtSmpKeNxEkWRcOAZb2XMylKLAMVrIpjweUY/XqXiG1QBL7B32y+xGxxwRwCgOpR/FppuWbYYHhV7eMRgnFwH7RvtvVe9mQ3Veo5TGxfHkhaVPBcfAVBAcmW4X7R5leZ4VdJJ8vUFUni1FkNJWUS95UJ1tWU8IFJP1jnbpaWLlWxx32jMHu5MeR4aPud2NispaD71+i9wb9TEwvq5kKZNJLERMZJaCcbZ5uewhGqD5IETEGWTEYjISCbefI/A2yF8bo6KcPNQ8GPvn6V/xdcN2uk3VjuKbqCMOHQQA2c1LL8+rZzDzrxkWHMkxat8MIMOZQDHQ9PK2o4oLykER8E+z74xRi7C8yloLx0k+S/dFLgLT0HBbnGpNHtxBKU2wTYhRUzXSfkqweE9kAMueKE2+Ipj9VdppnpkqNQOyIyrBoG1Td7OY9/FGFfxh3HF8d7kepla8FO3sHaaHNBuhSkzDS5JaXN9I4kxi73+e0evnVvTFFdLnR2jgQoO4py5wUd4vC++dMeG2Qvpo/HecVnW+CDjRPXJ5ZRZoRzF6DlEAfFKCMvt+PfV/zVnF64Lg0xQr/SBI1fU1Jx9SE9zM5s91KeddDI3/g2QcC/piJ3HS0j4wd70qU0IKLQWBEq+aFyapYXc/mvTp49Mv2klgIiS8GZzWU3YJr03/0fuvvykVBK/muM0UIHzMZZSgYZQg4thS7X3dFWeNBWfo1y7kAlGZ4jdzzjjPb5NijxJ1Rjdke/veOyy/FqAmbv2A8N7/ExdbG5s/8otvnyDUYeWVDyCPiSESChuPrXFEkrZu43ZktQdN98oqawl7MghWJJZy/7UUkrjPVXmYcojpIFVDZcjrO4UFM4ojPB4G9bPeCtsK16jw81ofJyoAhUfDsDhf6HLRjpqKu+yRoMySSaMUbdSE63Lq37JOCuzRSHSexcDxWk+y6c7/VkTcJiVS+ghKv1ad8Aah/xXlyVdtiO7AkcWv5n+Bzt4m9/5dbv9zD144i4BB3/q7ujFdOWqA5qdxA4JwE2OT+MITVA3w2h+A2y9XT8pwBUieqXoVKN8giq13Ao2KFWSJsn7Jv9JDFnfSXqx0QXYky4Jvg0oLQ5ROKO87S5GkMw3BaEeU57hEDFQO9/OYPSHkLKQrLh9yVQaB8F0oX17VGEUYdDlAQ81SLMjPVs+GOdpQGUTGH9sXjs8nKjjfFVDt9mhz2JEuOlN1+PiXf6QuQPHNRfBp/+JHRVjf0Bx73h7Kri2+xHENmJc1XX8qQirZ/yiIWQwXUwvv5gIgZW3wNP8+d/kHwkKEw3Trmde0e6B3yyvMuqns/d9YyFdh3PGuGHNif30ULcg5gSO0UfSiS1FS+ACMrPSaBqxkdV5mV7Yemn4kgwm91rn1WLsAIObSvBDYBvsnBzPRZx6mhHw95dHjJGiMHSsNunmng3XeFi0bIsMjif5m3rsFif2UHksYPU7cG+bArvcP5NAr1Eg0024cMJsB+crnhnWQpqxyEJZAasngHqeQhxkHzcdNF6Xq8weZpuI7/0eW3oGcDYvHckB/2OuziKzL9jjK+xkMdvNYoHfm3mFapKDPhO/eja3SjeQnYJPrgyGcUSmvoA5rixZsCm8+YMrweRidxzT1Ysf6AGq54sn8FntGZTgNSYNsabqiq4TcEhDx/hHo3rPv4ghsQ/FO4FBPyQfCzW3sxyMNBxGQCzoWne0/zW8LbyXVwC06y45oLU9u5YBO21r8Jem5UJJx+xetxRf1fzeS12p2iOV5IlfSs/9sUvEjx5Gu/D1srowzofA6z7tiOMQv7sfKWKNdxxaB5UdRgMfFJ45DixRsPXejIkZn1Gva1I3Z7U0kqyqI/Repa+jfjUTOZtxZLmEyJ50nsZMKP4mgzSpfhAd53Hd/eNQT7CYFb5eeO+h6WFsQNKESMmiVB0a9TIfDEciiMVToZB/KaOrkYP9hHlXznnhHfZtrLsDQaFDyghcSf8bBAYLrPcn70Rc3WfbQPIy3zq8x5f99yFkq69/VrbltFypfuUPHYpGbWPDQl/WnKUGAKOdvdVtdN3M1+5pqxKJD7UCX8SLqR4lr1U7CBW5oJ8TuuLcl+AIvTROZ5ZFpL/VDgN2T6Ukr+CYyvw6fO2HSTvliRG95nydtd6SZcFrDeYVr5ny8CCDX4v0acY9L62aSv+qdJN8xUEsFR1EAyZulpkUYxnylqv7L7CWQyGwk9JSLwbMI76H/jBXqgyi9/R4K5/zANGCKP8YkGjpp7e286VlhefTmGsKjl2f9735ZyN2qYYrvpi+bgvuQV4eSb7HCJ7UcV3hzKtlrBajQHlmvoPj7nDF7ICtWsDSNBhyCupf6ypOEf60ENK4wB/LHCevqWCLf7MJ76vfVTVGwBn1Bs8azVu+wx50yh0yEEJRWd8rUo/ftgHGHWp6DyJ/7oJpJwxSF4Rd5Om3/b+7bkBcceTtiSUniu7H7uDELuACOssSYNM+9lO1xzKkDnS87w1OgiUVMPeWj1VV72C+D8NvXe5QB2E5ENqFQfom0spvK/4z8fBVRXupo8hkI+v97L6m88g2ZBUKHqSOIJ9+nxsDyi2itpknmkeGz+DPzhtZF2sBc53EepPsqHzbPa7SD6fXxNvhZHq60dZuNP1bzyPP+yxILsTBEL8fiabzAvnXLf5xLoaPj5VQS5vO54qHtUqhdSzhhR7iySeudvkTO7LbH3Utjq0bXbCGO5SQV5ua0GQQqU/HRlRQCDpeJAGBAnbi2oEcvuWRuOi1zUryGV5S2sVdHEOBruBHoalb31AioMbjZfjRU4QUmxDKeMbA0xIg8/TxRmoxSM+KSP4psXH994ZNDoABl6Qx29UEHWgVwAgj/SnDbwD1hyJ8+TPoPivRz4DSH0L/RtRTzddw05Cjyz/e+MvWN4z4T0fHFy584v/18YfJ2zjr8BrMfKttMv2A9wlQKy9LLmmnwlXlmx2mvAFxzeyEcvMRdNPeJOUceR1LS0Q70hPsGB7slb+kQpAzSV+xWQj7A4fn8b7fq/D5x68aQcw6PBye3w8/ALeeD7p7d5zjToVBj1fz65AnoR9noueTnobixqz1jqewOC7jdkVYdL2lafLcchTx9NV/9Z8h/fD8cbGQYA4+PF4dsVOUdHAG3R3sdy6Rir08+mmeyspaPzGwNv98f7gOO5pvKqj/fFm56h7+fZcMkuoneT0dD4pa9UbDHIVA59bK4b3G3jfnZ1sKEadekOuzu4OUC6uN7aWaVohdh1e4Itj4uPT09bNn5D7GwDD0bV3qM7j9LmBwCpr95PX/dnJ0VZjv0Gmt9st+GDHwVpzaHhYVn1M8ZTsdUm5ol3H8/UtC8T0e4fmxvPFxlZQkU/Ppr7d/gZd/91WlLA3eGu4EbjqpeCqrDZR/RPkdp+01iEo6H0/vVzU6CoMwdVZX2tvf7wrugWW44tOd4Dvz4bLWue7o+xuhr0tIFTGz1vd3cC10A4DfwnI8NaWQbcPeP626uREtD4oCnD68brDzRpyageA/B/K3SosziZoFMTdCe5OcII7wYM7g7u7DQ7B3YNbgEBwd3d3dw0Q3C0E2Jl8u/+ePc/enLnqfru8q6uqC/rm6nq/vP2d3aBi/68lCtFbUwKrkMXzI9dbnqn0c3M165bI35uHx3il95un63c/z/e79XIB5G9Vry/7ZO+3u/3V3ULaSjkB+GntePHdIn5/r553A4T+nu8WvvZVwRd7xJMxV7y+7M2Hz5RfGvh6vzw+vb/ziqG9oK9biLw/3MXHL5WiXrFoKpt0wPH5Cxfnrb8riZA9kj34jb17kP4+cBaovcuH9X87Pt0nY63wIDxvZnUMBoaRSZePeuzunTrdL+Ykan/sXl3sfhXceL+7cdS0vMT6NQmZITvyOyENd/MjE0o+ghZR1GQA2eWewiBr0Dpqws6uDYlvduaOkIfwPGiM3dHpGvwrE9uDNJPUVlivMlhJ3PUI/sfRm5YsZhX3B1tx4wTLy4DC3v5F/qeNrXfI49Z3tgtTnNDy6osxhty0wzf0CI2F+iIEKhjVkHKFjw9he1/vvpnUPMc4DYyDQMoMXLT4PiSwaZpO45phyAq72eDsYaY20V//dI5xnUi4/DF30zNIzLqM03SIUMoUvle5lWtZa2POhcvCw2Q/TYImj4ec9vj1z9YaSzabPpPeETSSX3AdcToLLss9ZGNXv6i/URug5RD+w+sWWjPi/GCfuQhxAQtdKInNWY9bLX7Efa1T64XpS1Him5ORd4OIy/nwONd4UWVtyLHJ7hoZ+nkaF9DalskYRONhWHwZR07XFETEhHyOxbRFL/5P/+sGpzyU+6zTdTz9225XziZ2SXRYuQgTUZYBN8o5ebKoPqfeG9VYAP73OTRlPNTl94g/ZGHApC/fWQiFIWJ4IVBqKuTAY6gBBfHKSeMQFqNuPyBhVsvT/kEYBK4X5J0g5PJrSBtZcdMqdsnPAlqWv56tzNLrZ4gLkqbkBX8/6jlYHQKdE8FsnrFV3ja4fcDCHChJPMuV/4U5Kdgdy4u4SQOmZP8/EHNobyDc/hQRkjH08t2KSJwo05K/ea7opbg12Hh+HRtudTh/XOJ/W7L88WylWLkRIpX7BeHdBMMBXsNqqPeDEFLqORDeFxTpMfn0NZeupko0RDh8XAHRiCRDVCjH+lAsPk03s6kUbAZkP1qx7gYxJZB+LHcZCK9zaLqQd77lTpHT9NfXpGPG348QW1qOxDfMhwkude3plLUknUOnd102z/b9BNRplNEn+9xJWXk4By3+zHiBtWpk5R2MF9e1BsvP1f39UBqwSqOMFxsIUtCptbSh9tz0n2bdOx9E4s7b6APbrFpu8NTfEJBH/hnCUPl5f8HhAizZaQDFn7y1ThsQ1SsVI4rCngVFQ8i7M7Z6p9fhcQWyLJ1X+Jl6GEYt/44NjB5+LpCeO5mGkYe7vzgCvXVMDjLj09ZdGm5NIYQM0dqRCx649BwQjBCJRaexnXKqJY7kym8hvHO/MvrSIBmufeEBY68ZRDYta66Dt1PrXla9s6kMDax9rlbBUeOiK9im9x1Jz7729yAiWHZ609cu8wrGg6RgikKOEtO6AuHwM7cweqNEGZ3NmqP/yNxIfUPRDfrHyItKNoz5M5hKCjFZD3csys+x/wGB/5+hrzVP6v+MAx3WCn/FMvIZOKztQG02SI8KaLl06GHLP9rj0CgrWW625u4fpBZXlsAwWBfvfW3lL19prQC5JDzpNJ0yWXz+iGBn+PghMn14i7UVXWTICdUew7bKAfbZJ6yS+PBoP/S0dajYGUzZxtOmXZdtlQvsbBX4hHIVDqfOy5JHRCAe5EJvD2x34Q7dCgAmgeMD0UYbtGvv5a7LfOCuL//XXJoWp97hcebP7cLIYCstsPK6K+24IoDHQ+Cxa3sI6j/nYQ1vGUfAJvb4Z5wFPMqTIv0+OPB4Mk18UgMxFeiGBIZLZZUYl/u/cb6xSow5ef+zLE1WLFoIXFfMPxs+i31DObqBvGPqdZou8tVzbOho0okrQUOrOtzNHfGyfbGRcHeCOSgotGpBX85ysbP3iAUvHu/mRhDq00Au9vaa26NvfuFb89MCATqZoz9KrPkIKEmrw8PjPTopLXQ2lzdGnOzs/OE+glha3KqyoyoLDpbzbaEjDD9CwQShawhvYGcYrq3SF+QeRaRyF8SbuZeHuXomsFOra6GnxvGqv/ii26B3X9DHKguwD0w+fn/4erKDYaOk2eyClLPbO4qhTEIsdj6AwrMtjo4GEi0faBKa1YvCAaMOHw7C6JvcCSGAKgsWL8lZ2TmEtCgLObHFyfcCwUif9Q6PzAxTf8urcDAXyTEW4YBZuL2n7XCCZu+frClsLZBP7R0y/DMe/tuYShzpunsSW55qAJLu0Uycs469jA1tof5FsNdOzM6JTl3sYfSXZizJ7UaV3CQBzmWJ3Ss2C8X7L7fyOAgL3nKyCIqLEDkU6NELzVgtDk9NuL0ogV2sfkj2ocmaG1KssnqkwRLRCWeO7Ias3rPuOR0TADlcK0Ha2ACFh2qgiR45bSsB2nB4yEm56G4qUZJ+1UUwUUw54tIoDTfUAB/PpYw7E/mKMnWFi3hd72LoV1Od8EneEclwIgKvCCGHoUZtsVld3DW6sBYCPLO4IBW+zJUV1P09/96DtJdfbFUznLUdzC3ELh+GcKBoSZthY6jERZ8/tHwYT/Mui1Lk1vzYEmXo5IflvylOKSEn74DMogyypcTTBpyJm27PuLNk7Rv9X3to9hZmKvlaREno6EZ+9iZmqjOr9mx78YafiQ80W02waZSIko4GJd9aVnGvFFDAUMfpT8u4V3IokIvz2iEWkT72kNMDO/Qzdpw/a0+Ei+ddVtu+apg42RIN4XAwXZcxcwBTVIvnVQHoJ73kbZMrm/CvS9Gjn2S8cxj+rpW/hUjiL8LtqetyrywIIJ3Qt42PbGLbrkEp5cBLG+tRqO1J6nKX+ICGuoQ1wXwmwro7BLc79DGM375sWIzH3RP5k6wR7iMZY/msBsFrxfW1iEUPKDX1FF71quBrTeQNiDbtZI6BhlaJvEO4nnXCvEj7UdpJ+IO4gsquHwZwHmoCn/px9SD5QZ+5GGtDmVsg3EC29KYSroHNfUEH03MceGvssbUOLgRZm8jZj7nFQIGeG1tKC49gJmLdFjKgb4e+w5iC1+SGkOUJqaafrUaZmN2DGQ//I0moc+hexE9bWMYnsMAfpCv0GJ844KQ/6xnvEEYE24Z6wHEg7SMNYu4vRQmggjTM591b1rncNRoGyUsft9Kw1OeatIQNlsF5IKdxb7cGJEL6bsRH20GSNNAQg/japDLUfVcHfXfZTSpOk/GTKAbyEpLF314Vz26Q2F6NaCtkfdXPr0idmP2LUS+i0r2vSFkpnajfLqir5bSurs3+aTpU5v71egLE8ncsfqmmoJQH+KtcKr3p/f1zlK4RWC6evWSd3i5OkO2QOmkM1f26r2rG/iGk52t6bps4gTBudetEtZlx7pHpIP8z2lND3Hee/5A9dK4hwwvJq5z4UAcOG/Z6Q/8zJU+lEQQRMchIWxGl1qF4efD/QZvr7OKk9P4jD0jX9C3ZB9nuLjVbTuM9Z+fb6n9ypmoK1jn/t09FOBsO/+1NLV0lR4zAf9xTGvaO4wvXWlI/TB2yZx/Fn963TiDltsb0teg5PvDTTGW5viQIFbKxLK/LMEk39VrFk39CAYXy2AHLhj52gJSxHktLome05gqG+Yehg6D65S+1Qb2jaSr4acgO1KQFOHWM/74TRTqOhFU/hI6g9PfoOVOxI1deGWCKrz6b5BqVq8n7RGqW0Og5LkAd9u8v293zS5Wjqxh3bA2FKp7TlxCt/1FzHz613wA+kIEdBSkSxyp0AaoQvK/Gde/fyrlPqVtT4s4nfrOhMKnLCIowtlBIgw0ktndLwMLGsm47UbptZEQhbnJRm/kVcsEYH/A7gddbk5eSDPFEgmW2vb/t3p1Ii8lm92Nzpy8zo/RIAq+nJi83aPUHSt8oBxbdNFLXZEwQEEMqNxHfS5NXdhpk5x8Zf3mLQjR5M0kRTyocQvSSyX7utTXkVs6qAODyNZNqbUJNzX0m9e+zfv+keGV/tjt5CZ0dBHtbxYB3fSCHCwr99ob94K6O0KPEOkr7M/lvb6btHZhRg7FLKszkj7XrdlfeC/jKrdSDtcpqWBSGJg2rO/LmKCVoWMa1tQ2QAH0nDCwVIWoTf5qtTFRgiqnofQKCZHK2OlGHDiecOnpkwqfaDbuaaUIS2LmIXII52005tQ1i/BcpkF3Yr9vSimPWc/NiwQ4wdlH0ca+PiBdsznRg5L5F/0Eb2LJ2slQaXG9I5Se2dR85M+MovRacOwkcNAFJtC+oXnecSByTzp2oKMhEzRuiCgiskzIdnEQs12AX/RuRYgGtu/P73zk+4yDqWPkEDhmjyS2W3FcMMf/O6KigaYVXeiDe/r994vXo++acX8gHPuGt2GDRZGL/A2NVWyXl8UwXtsCXwr2l/HLUYIy0OEZFpe9VWDNCvEz03Ju8HXFjIUyBeVsgYOyyeXm14IhCT5fov8m+ZjiysNeUTmwWLv3lelmIWqzoIvGjjBMBpjJoXDeqqSZrG86DNfT1hALzj/ujPFpdf+QrPnhtwqFo9DPwCiYOclGc8tt5VyaxGXzAzr+lQ4c60JIehsZqlmJbjXKHgAMSFm8oaTmKovc+uTx/4bqjbNKDDH9BR5uiTMjeZrRaUs8XNVG+UYNs+GWicKseiigPU0VMmK0NfOiycAn6LX1+SQxBoyoXPubQ2+8fI5UF2R/OPMd0Dlz5rbHzPZsvP9D0NhqLernnJCAMtqfQwa/u6ifUjp26iVF+uOzKTYLhvtBw+ImNle/J8/yNusao5EbgH+T+T+pAP7mU/S/JCMkzMvJiAiza0GWFu4VH4RGznaJ8I3HhPmDdcLcdUMY+P5A08Wh00QlVSPBgMH7BRzyhmY2TdtaY+ke3GSWFJtBeKeXROpmOcZZuQBZLKqiYuiWowkUEzAl7PNFvo0RB1/AggJ8CM8rDUqWqCvnpaOjrWKecVhpIHSp9pwxCsOWuL/jGPrN4OuApk1D3FXNiZc3BTp+jwGYlWrFT6n/Ujh/jOoKN4SvMZyuYqcuKc/nMypGNC69eheAlS5gjddakMo4n84kjzFBgtIg3vszy0krAhPrzfuMEy1MFIDN1CDR1Vun6tdrEyRw7CxzYg6PheUSuDiPtRqO3U6FQTWo+DnLtBse9ovXEKKmgNOHhKjcF0wbyWn5EF/sTmKORqhiFQjYOkmVdNEBTiKGPJVNHlrthzBK1Kloz0wE+nuAFIrja0mtmBU184ZZS2qxjUmk00Sj1PGGp39oKiU3QgLpq2mjprW1YvLGzYwNjzlYt/KRtO/3lDJHJWyISptimfB82a3r8y8d+ufVR3uWcKblnRvl41rpX3PDlzCC00vGo803q3FAtfEGcid77HWiiERbEg2v3akPJclGQtE/9V334Xucm1axUYQbDeCveXLv4d0FfHfFyYNFmuQTAQmWcapzIWpzCFHFZF5f3b5TINFPbUFAPATLStqpUI3yPWsru8Y+hljs6k/5PuBW1Lp2ufVgSU2NB2C21DevtHz2bvW1iWHvoTGbrOLXPq+j7vAEtT+ds0Q3Cns6UFeGhtgGUF8yMyEuAJ6/fUeeEJlialfveyfjzqp6NRwawaGLS3TjWB56di5K1EYJ6smpcvOP1vV88m+NOmZHNiGLYqt+xcfOdH60O0Ky/jHxPJQ5LoTY7J61kcBIo0b1YFEMa5NWOb5pNH9TZA0Rocdk3o2/+lD2kpiv5uNaAP0lx6mJXw2QD+FJUoQQIqdgc11jCZ/L5yZA/r4fCopCCqI1tmWZuG4zI0NOhm1ODoN3+kxGeHRffAboinEZ+s0J/5RvaNPVPhpRklminrwoDkBatR9/voSsKmfrQuTFF0msbGNsQTo0xXZS6qskt402+XBhdILRgJcjpPtb9PqdkThY0ZEbH/Zn07uesuXgVYf2aOVHapq+7xPVTRa3HPYWOPiflCB/y5GZFAlbwAMMIJwtSwWsAPyHbjBl9Keu1q1zQ5INMa4YOKT4vo8CqttcAr+hfsweVET1G67IKFPMbQYuoIfYlfjPimgGPGd6DOQPhhaaOmQ50DOlVI681nVSI2+LEowG1hrjEOgy5jNqeDm2vMUUAiIqg+RDUpGEGeELYc27SKlZxnQ9S6+cQiPmEaUofvCepICwAPRofckM2NRjwJoVvBVURLvl7O9acL6K2x4K+xxsQ8mfTIjUYH3liSuPtZ/IS3hrdEic2zUmRHnR2TQQXxBcIcyaAadEDVzRbpYKDNKMtyrIF5NIsS1+fxfHSPAsdPMGZ/hswBLGGFDffr7nsgHwIikuTJpy/lD3fj6cqhcnJihcWoKQd8rA5lBq8Yult3IDCZskuenFy30C8aWumrFjVZNE2YK421Cv8kXAF8JsNi3Nd0CcUZq1DvWODLnJDJRU2L/GXjsy809cDmzGfoOKkkK3k/coyGx9XDFnVE/00iZEcz19wPozoMrKtcli7iVmCn9W1ia6M2Po62lhCs5qrqq3CqJiV5F2asr/+KdNz8X6k1HPBdh4lQL6rhrity65BaMTOyq5tCC9XO0ieN5W9668lRC4ULcTxSSmy/ztG71FnFRvHK+XK9GA7uKttbJ4iUIiIZMkZfmPLt8NuYJ4qUIiZLOQ8rk2pDyDWArZyEOb776XVE7exrWuFgWcBe+kchPijxHD7NU6jCgM0luMOyqZfzXM+HJRzkZ07/ZiMVJgCiNKlKE2NpQ03h0nJXw/QW2YEfKZPUVP05iz+HWEaihj8mVH6idzgb6vWKmJ0+l6kxpQqsmn/t9spxGjAFnZ1dq1R/7dxHx9TlvhChX6ESezmDaPDWCBM+ZmLJafY7QCrJWcrXtFzF/fE6JH4LP7wmggKLHDAgGU3Bg6YOAqw5FUvTOCrHV19+CDgxDd5SgB4+kW7l8yBi0/IWLiBKAfoTLahlOIzDdQpy3ahYxK7GfhoaV2cP8RQnk0yWobG1OGSbLkwVvh91ihFw28vRCoit+UgDFGLOUX/QoKuj5XHq6uyjrPFzhn/bvt3qKm9/8T5QcEYlrGprR6oBqPPetpjYgMW29AEqL6bcNNN8Qq09FoIS0HcAFjatgCDML08rkMh0y8bnPA4VMRO2M49qE+vdQi3o7/N6OjtnNXqBhdRkVn/SgPwYpU5rse0rY34yyZc/myopx/QKi1rAANkFLGMW9naOBDbN77FON2rtZWusBYd0+/XLA425HQ4KVjJvLObE4fhqjUeXTEwwpP9gU3XmvqCjSDUzscCX1svB5iGA52gBA72BW2gBwDIi8L4ZWI+d4dxOwc2LDSsn7ymZkohd7ccCeVe1evI7Rz5dkNiwrU/BH2TOKyZ9U6O2DW4tvFUMNzYqHb2IcbQvFMUaf1jD/8fOc6BRJVM/IOzB+On0hyXPwAFz4Pib2gVBqJTLVajvBV0+QbTCKnlvVh3/b1G5gkC2miSdMTlJeSnFvxZvZtCGnBg3zKcxtNMLeZdkoW2+upVfiqU4DSikCvEBF/L+sEoJyXaYdQkj6xwfHffW9c84c+nvlzWcSZil+H7VFhcI4IlINNp6N5DvztCdtqstBqxCDobykSKfZ6qaeA6jVaYsVFXam7yfeVNLMoB5vZ9av+lvUBzks/hfDXiyZ/kuvEe5DxYtMtMZE9F2ubDqt4AzR02zjxXy0O7LAptYxA2i9pLFLG1GGDDAh/ucL4ilp6arUMg0RiDlylhZMstbnl9Sy/bpqhqF8SUp/OhVgA4fA5HD7oLzhh6wkH/YUQbqfLwDTU2yu9mQzY2wmgCr+RZ4jByQQE/v7gZ7g33iPnlalQgbVzA2sOkBYY+BP3+zrAjub5q7Dks5jXhy40XbrU81D5VBvKw+OdJC88CIQEUaOSDRGqTh/NU4IGgAAoUslaG33rCArsdaxVbkpE5rmLdvne59VPQNY4UFfI5zWP6q1ZeRuWnNcnnM7YKlPzOcv0KQb3mfeL0v5/QxJHv9UlMzK1eZBXbP+RxgOavRRLG94euLHELqh5TvCjMH2Q+Ra0qNMvVroK9nI2g+4Q2pIHjoVKWy0JCGq8qxPLwLrP3OgMsbyC1brqGZDte7X1Mm+nuUWZGnm0YZxABnAcTkx5HvdOk00ge+LYS39pkIdNiuQ2dokFxlxajQ5svtuK0ISyAcgkomcb20Qhcvw0EM7OKX6214G1rvkwZK8MYM0WrIFA8tQzfJUE+YJ9fhPLR1w0fE8B1JbvVZnaiFgFj07Nql5cZ1PZUuQLxYXAdyjJaS6/mvxKEBQ6WJROUXLl+rQdf0klv5ZlbrN3x4XDHTLk//m3aOQNdtL4NZ6sgd2hy/TMuTbwaVzATVcwwWn+PmFfuXjk+I+5IsVUerCYU5sXPjNY8XDYdM/ytWmXSZ7dcP3XUJpR/gBMHDTv+08YYAN4si0M7HafHX/8IT8gjO7gQhwWG3iQFlJKG9Fyx/2PCPj4H5Sg8+Q/zY5YWM4Yn0HSddDE+lHVUmDjHXwUJBm8UrV8Ad4xKu/2s0LPmT1W2zJyI4zpLu0KdGLUUte5+/0X+J0pQlaBAS6baSW/o1JnnDFAQS3FgYDglW57SaGPxW7FtlzFQmohsEJ3Lerrt0ElWOrAwluSv4lmX+JtuGsIX61tqHxdHNfcbBHLGpquu+ANU2xx8qy+3vts7z2rALq8DWnf3EAtJV3BqTaYKQWjlaGxVcRCyD37iwPI/d6j65JEzi7DKAZr8cLjgpFr9/PX39DKOvYr1k33rk+ullWURZh/dcfvZy7eV+bMjfU4TDKOpH41P3A+NP1enfaxCuKwtln7goLBhHnLSmSrckSeiTXZ8efLjEGD5KOsqRUXrbKGoQ9F/sGGtmBnKd9yyhWL91FiOcFrGyd7L4ToXxbij6JpEcuq02XJK70H9EkJPrAcLYFEQNq5GiaxnYyBZXmcI1mqgrAiWiIGYaAgxzKmbL6hKQnilG1e936tbxCMO1zruuFOnQpEHippVLmrim6WPsQH0EaCTSTBqe2oEXUA+Iudqod2nRPRvnxYnfjTsmUKBYiB7DofhXFQ8YhmTAV1h0hXN5KijOvOCll4CHODixTufps57Mre6PKKuz8cJc0mSysL1UEvnemXbeIVQrHOioKHqOyOISD6gmSgFB7oU4bBK0LB+5NZdz/E+6mhOP7LrrCIFfXGismEv0vFAkwFt7iRfJz3FwoMiZRG2+AJh/FVmEn7WSwIX5kKmTMaIEd+IhFpse2KgIcjRt0pevq1tgGlSUP4JJ6P1gW30BMv1bjFDnYXhvHwKYHhAzWzoWwdtN9vdd1+M7XiVcfLk6piCjUtx9+2i3GYNVZhFSMuiGOQE3ofma1ctbTefcmoizPlvP9m3EDkBBKyY+7rc9ByzoJbeQafqmbMzgZUWjajiiQMF+tZ6LZc9YQraugPcTyFgnaht6MV0BQfQzVCa07Ud2A5wq6QK+dlq7yvZ2SgoXMLaxOvKkPR/4u9nY1v+Uan0ZYcPXW0YmNxrh5zD072IUi+Rh4X2Nnzf5BjcKtRf80EvFvmW1d6JOhMUfAkTRkiGT89J+rHcnEGbZGP2VoSa+h0omJEJD43M9el9Di5a0WeCFjRuYy9NT+dxKmMCnyUbN1NVnBa/MNvpy18k/9aQNqZyovuv4kIJk9lLx17Mtssc9QXkhoyt8qUPjdZ60o2nic3Nr6ydnW1VtQl2pEbYOkzzhZppUwIpMIOFJtQ9mIjlkV3Z7BN8KPp34kIDR0kDinVLL1o2ncxAYq25mqoS4LswM4Gdx2c0zayh6y9hk1y7hyE4HDwkMZYidfT3Teeejg1hr93GE+N6dPTrODqDIstMrm5SWQ8AZxkRGxQqWmlKUVCOsVL5TVN83ddyAbopiQShz+nAEQBOwIU9s6GgtsRQ2b43h+PucDTI2yV5s892+ZCsh1MMv97XRJQmreYA9eA0CcrdYiVvsazxeLgOdEmAvG76UBPjBXmUTKArnlVQ33oYJHbf9S1E8AVRpTzTlUbB80MYSQfUIamybJwmLS4vfUen6RUSk4YJQ8YqMLKLdshl0dbrxYg4QuTxRMTaLP/azL8sb/+8JXectyIg37ZZJAWWXhgiF3cOpLyJvzliCVBvhg+UrNK+PQuZ9HOnBDK2xfTPiNWNQiyGOeQwgm3OPtwGW1ZheYXAqgH8mLPb1/FRE/GHSBtF2Y/An3+vj7bI3NsSada+409qxOEonPbHilwWYNbXZhUxEAKuYUCFU3pWsnuZNZBXjHN7qvHIuB75gDZeg4jw8BXMqNUhj2GsK/jUHbFGj897L77449LCMqwTpjk8ci+Wf661Wdi0JG9N3Om5Eyp8GPjQfriQKt+zYE2IsS1Nksv5TbVWLlNEs67Bd4yG5znpglhTNYfQ2I5YHhFENsv+qEmnoMzFiKoi4C81XNflBl76XM40CaEKgpPFtlGqqtJJwpMB2FRryzQiM6a1Nu0plWl27iRV17mMcugJ/MSaxKziUW3dYTdKUZWttivwiebin32FVY1gdXgLcpZ7asE93G/b+XAAyigNk0ky+jtFL4OgFDmxOVqh8ZOvoweZ+Z/T7vyaKfNB8TxKHftOk7zD1JcHiik+KKQF6m9M1ux6BajRd/gW032XuwN57f6gC6hvhsBp0DBjioCcCIxhiMBpy5YmgWB0NBvrxKi3wq8onSq+72OVxTThIcFnMf1VNLg7A4nmicaxS48Kg5L4dXGn7kKxj1cuvmG958jIqdpqxt/qe55/C9vLg907M/LYpmN4dxucyPkOvpaFIUajtIeDdsIETnGpjJtzaYhdjQhNPFo7baWUydnK9qcOGEt59BGDmY3YFJQio7m4ahXA9B/2QFrTaiZtjkL1R74tqoRuP+mGCJy0bJXBGEC39I20/4yukSZZpvhkl5gkFCWFO19KlHdjYzug9D0dul0v7iCw3L8Bd1LRbMoJW10S6pW/J8p46XaQk1osfYCHayt43qrUT62OWqxggMucmvxNcXmBUk8NFHY6e90/GBsYeyfFVtEtMQ2vNVfcY3ar1al/yVUEhCRsEqasAzvgpd9Vabz4jTHLaIEMpoFeNXVqoIC5uqTGp2H+mSR13WySEkUDmV099sBAQCEqJf8kRJI+j7csBtaGCVQ7p9eoMw+omlvnGu8546Psz7JI8rPWqmgbdbyy6cDQGBtROJvk1PWwAfhAxuDjXS3qSxavnsHshq8zA9X59WxfnswSr3PPjxT9XHYosISZB6i49qRFKSuipaz4Mn709XujmwquND34wGfjSJfwPeeVcQTNYnn/GXDF0floOVmPtAzugU4y5xuLJxvb11dTTs87k0A1W34Eh/aT1a3gXvNWc4xgga4+Nra8H1p7mXW+Z164wjbZvQ2FlrFxH4kp407t73u8Y3qnRlraznNIVc0TxAT6a8ZamrT2qgivy+kxNSPyeZtLUpVs79Rrx/rUmAutwxOeblkIq+x96CLVsSvmQMKGyfnQ5JZjisRgGQtxGkeQWxbbdmw9sHluYRvrc/qWNfFUyBQFFtL1tVmFnPQP1fO5EE9SrJR1reWdiKdxZVbKKLlia5J2xBZvfhrK80gJm95/6ML/iFqBQDVh/St/ndAPUMEm/2DkHy9yaYxp+pUui6EcZapUM7x3B4tZ++wBfVFX43kzFlrwUbv8MWrszOt+BcteLyY0kpT0ZaXco3Tw6iF0YrNZY0PY393cHVRVPlSlrLRLCRxYF+2AvPKH/Jk+Lv4SFDjAd1ysl5VBqYOPaPGZ7VqpCybn3k+ds9ihFW/NZXwdmbuTjTLNgSaoYBtF1S66/EE333sHrvxa4SR/bSsKKZObusuaBl1Cn3vV+0OrQ8pPFLSsyCjjrWO/aB79HhSLrzlSy8fG4qCkA6+PhGmzY276fjV6y5ZFwQl4KwPTP+fPIxguy/rq7yM48oNuKrhz1JpVtb5JuUvFYNEyRzs1UOuoqsRJQEeMU02WofA+tU7AIZ5qCcL1q3eKFc5W5b53/RABhYZMiHsCQmuxuoY7zmcguo99Uzm1WEtuE8PyEG9QkRVqTVzS1X7VohrgAF8K6lW4J1uiK6JdShoX09nFZvE+FHka4tQYc758vckFgyjeiAjfaIryJc3Ju3K0V8Njz+QlyQzPCPaLs5Fh9ecC2+gFgIvrIhdcxp0mVPL0xbLVo4meMbkVDbR07vWRAbgS9d+DIroW4LEFZTHAZM0x5cFIGe6rFDRR/1dXwtcYt1gHVk3LYYmNK9Glpyefo9m+SBYWKdeclNvJOKps76rdoymXOVDJSf6leQhRywvykGmuo1YKHZ8ROWP0pw+AVX2rBhuXHcEzt9K3fB8mjMTnZxd9NGd3VR8BUM+R2nT7xUEraPfIwJSOySSKbqjGOUid+IEwoNel7gFzqCYFvz8Gbik3hV2eR/4uIPGQrqtmtmsbRQM3DH3cziB1dKr5hiGfVMTUgmUIdyi8KXCHRkROfUbb3YRC9MxYk76ijVNnIZTh8KZY2URS1CWAQLcqk/NRvbV76k8wPlqEqV02uX2YueFXBmE+e9yhWq6Dh7LDeUS80BRn+fjCPt6mNiqmcefsHZxeBNdOG9xdSt1NUs1a0RcYcI8MZ4MxNXiFh9IYj9BoqmA49zc6FZRsV22bvtMorpEQk4mKaIXFfkh5KcwpyYeQA7vY5fXPkEyWWgCeLHyiiHu7hkuORmiDIPf6yNpAwEwMqoVWcK+/wsrkkmdnJYveHi8oFgkJfXk31zVZcQNPRvNWx690eVMxQifZXXhxuetTfr0Snst9sIeGB4RLhBzZuXNoo5ls24R6cfR4A/p08kY2c/517YJoezOnymwVR3J9M2ZWvkPrKVibz57pmrWe3TcQoFpX2FkzKzcFzxqLp0RDCv2RXiYo5KN9dhElZnYVcQtnRPFuHHlppOXRed3xCIOfgAVlktKtVyvz+v1PpWMP5h8zOuUVoBE6OdCzzA8e6K03Vc1fQGF6T2m1a0yq4ZbN7sDlIKDOCPOQWw4HZjx3VpWjORSRbXmfIDb9IGPefoiqeOy4+FQesKlp4Z4VPQi0yRg7KSYrkVAiUoG7bdMuky2p66oM4GxkT6W+Ldg6t533qmlJLToj965m6nBgHMWwYKpcperreFYCDNhdZHS7kH3C5R10wkcQXlsB0OwW+DW4ucx80AIdVELLOO7xZLjA6nAIfMBIZsYKkxo+DIt5JaNe+oqmhUn9D01mOXMTAWPMAgvaJoKuxWZN2iaQ26a1C1T+Fny6hxqv1qA/CJGc2J2YDcv7BCgfMKJj+tzxo7vNsZIJ2ZfIofJT8LExm/ci/ri7Iot2T0JTWF57CSj1l2Sco3aTGRGM/gEMfJvSc0zPDACDDipyNtcSyvGzpFk8pMMW99rCsd8VVc9OD4mFB/Y0kRzA2OQbU6J3Py4l0KyETJ63bJ05sDm+4yy17jVKODaQkS0HVpIYUk6M/4h34L4e7N/nn2ngsA9rLLzCJXFcoR92R9iI6wPll9YeZksSlp9s875hxjvf9YHD8vODW7sAtBU+i9noKZvs6LW63cSX8Pl0hNuwFPFh2jMHUEL+YwyLYzzlQokoHK471QlIdQnkNOF/Q+lv2nF9Gvpr//CgyNFuAKpOog6sGjf/k04Tl/hWz3jTTmx19/H8yy0UXxZ3+OciSTKi455rb10UgIo9KDz6Hm4lFVY6WABUJNM9aPlcddfEq0QsrHSNJHECtvop1S8Qh2/U2TIL28+1IZf6KSUuFBuJB3IHmsevmXuyJaP1Wta5lSRSg2PSq4T7vAEhI5tNmrU98t+MYvmjrutnC5S7fFYZuO3yTKcuzbGFWyZRHWiIKnCpJmyVH+0Sb+1cm3UHocxd8BE42tYi9qodmm1UQkeXm8El623uVEXHEaI3+H8LErzecE0JWnkpZW/twJXe+Wkz/rhflJea0RpCS+7hhz3gkS7aJ5Opy38y6bYcMNEwKGKn9wiCRWr5IsXJKOcDVwduomO4fxoPpegrxEfljnndgvyDMlHXdvMxxOtoCYff/qv7bATBBrML35jV8MU5sSqdJGPc3kki25+9iJZkw6qLiasSW+SaAjbY7/mYYpa0AgKHwX0r0+1WIWdCj9pxn9by8Wa+RcckLzbKpDfRFOpr00lBizMHHnuYcCfygPaDqeXMCGHsw1AiIVBqqPmYiGNrlR0uQT8cFZ8rdNlBzqC9bcxJEtw2UZ8+c09f8XUFZdzUtljtE7Y0L9BdksJuL45DhDyGDLRrmtF2jl+wfsY2YTgSTYOKzJK0jF/cI3q1oGIJufNPMxVyp8OVysQkaEV+jppkzQr5Q0mUSxyLnHq8TR98cxGTpcbPrR1EQMhzSfFj9+ylVJjVYXB9K9aYSeaZMaYr52gi91oNOtPBmbcqbr4maOkzPGDso049AtkGbvWy6a6VmL02A9kGYvQM+21vBtzXIj2evBoEFQ6iDTjD6g0bIr38yTY6ZKKNITsnIrPJGLZL07lOU+2pZwic6uZzKALO/WkfQMhDxot9cBpbMwPf2hftgT/ZrVvcnvCu5XqOoJwjTOvQ5AxN1WEewNoQ0EfZML3hkH62cVJjxKfNjdi+DmxsT9mnqbAkGNnAIdDysDL2rm+4ryEm5PFE5ejrKM/58LFtfWRlQs+RyJdo5I+k4STi+vqQnSORIFks6OYS4ZX7vNVEohmgEdVYL4vdD8HRYd/iC8Sf+ENZuTbUYU9ESgEH0OJCPOZQW4dDa6gcKy+edg2ZtneF1u1adoZO9gtxx5GyEvkpx+gJHLlthc2+zf4mJf93ANqyOqmfijz8cxZyexaqGr2bvDiZsf8LXZb/rsd6+rY9vJZ+2O5r9HOO9gaQbc4e8vDRkaidacxbMOaQ85Myu+N6nE8whCuhUCKC0npqUnXKI/+FkXV0DSkue69PUKNvORVtUbOjzV2KZMlGfaUGU00Hck1uXQRirvYmcENMXbM5GYhJaanZ7Bdy9CNl8TxE0irbd2XOoGiMw4Pf1R3fSiJ9ndvCYZ2OdwncNZDztLBcv/7L15t5BHGD+L2m0X5iqWk/w83cdp6q8r9ZMDZbX8d2bk0EX/aB07qzYLVLS04NQhGdru6r8DrapfEKj+ke9cymqNjNaMvSDHMN4hTvmbXY0cdAXSJC2h6G4CzfHOvoLu5PE3TduuJqFbnJcOUfHOg4xY5HX5fmfn05llW72OeKrem2H31bmutx/nwQIJCPWSh6083FuTPbQGPAvpA3E5EhTLCjQ5iuwgC/gRgLGKCD15ODFqqs68mZiYD8qr0DbOBQx+UVgkBAzq70GD1B86BGgxaKujR2mLhv2icdAB0AhByCTaDMvEkekOFPUq5N6Kx9O+FKFDkV7VE8G9kvUDKYqN5uYsozI0Cd+O2Xy7OuDjDd+w66OcaFslwVOIZ4Gd81zQs70Fj1uX+3hk/eP4Jc4n5mObMfvudmY9qtrpn6YoOX27z/p7zdZZVvjw6OsqK8qaXLHhnHtnzjngB1aQnSFklDcL2yic5H/mqoDWKWz99q54mvI6x89Umwm8NjA3bLKK6miuGXeKA9+pfwYJ50qorvHydkFDavB1+n6nr1d3AOEVwJvdA6pdWIbfPZpBpyiJd2ro9ImPqoLYkM+6DoHjFBcVkqaEY3n2lnZ6VcsdKWaaLBDhC9XFm/VEhnxtGg78kelTdz9bzVxSSNBB1+grmkZm7Ca9TF93dokBRUpNJl61MHCVQ159jZL2+Dif2a9nXFq6lcG74zGdTsFO2+dRwmLiCqUYGYUyYTCc9XOGd/tAqh+mQu3DYexoU/lPQORWRIfjYh7QEJbx/W+42ByRWYKc7P1WH9DWR/me1zx9asODzeL9vgAnyt+qK54F13ByjdQAeYL/2Fgpvj+CNjE1MLB9riCOIUQ9atlz3V1IV1+Oc11BL2i6opGfL2r3VrPGtbALuh8SYX3cC0r3uanM+HJjpQ0YYhcr2s8DSZJNRLyP3RPzFlStgCkcva7nzqEunUAnuPbvQ4BtX2BsB7V4e4vOnvvplSf+wmIrrLsJ6Tq1DYHufmtdfGgUv/rd/IF0OqXYjgvGyxxw099RtUeP4g0tf002IfT33v6k8rx63aP2rqWWOTpmCr5aQBwwlUFe7AsnGAkREym+VsvCvQuEygahkZVY4Zdt4sZ7Dqr69oJ2d8E99SltNF3kWvZq2W15mijpQdxAZnWvkAwOgEsaZg6lu4a7wmnyb+BiQ+qmy/kSKVki/QuB20D8zBcj0MyZuI0QA4ald9vnqFRyOcpv7nrroIrkCBc5dQfLnTjTXwH4hD/m4C04IBUPUPCRYe+DGMswbShBv2HhpGv7XAfachugvBdlOMVlACTd+IpHBsC5eYe8guqO4b/JGL4nVQZtk2DCuXkq5YrkNdXC+sINWHjKKiYdIGKrAiscVzU4r8Gizi9aII55n6EpqxxbdCyNiM2YSCpV9Ijhu1dA0+6lMFO/gM4sAKUGAjdbfdlmlE5ihw0/a8Rp1SYYvR0XZa97gOwdji6rlEU0x4C7CfEui+NOyBt0Uciv2cgKjiAqvCmJE239sgjlZoSTqu0o/vgpBI3jzF6/LXAF/bHT5qxhu83k3rKPpQq9WEaeDoytdt4OrmcnjgoJOT+zbOq1tffOsZWnBPX3wztkgubNjWByNhnNyFlqv984F4S86ZWAaRXNKpEBJHOqCgaeCFuJF3SOSWwNzCQDLP7rABMNw4OsRdAFl+6RZasHc7Gblay7kvsxnbNhcHuvwM8OZRH+kO4fxbAVpwGOS3KbTF/iZj9T1s+vzg3kyHZcr45jZUv2rtdGizNBGJ7S35i4Wz0M4e/98NjRK85b6kZmy5Lc6dZxtwD5JG0PmXttTm0q9uLYLfimOUtJ4m0xy4+M0MPluI0emrkQKOhDudjZ3TOc3IHlvOnfZ+MmIkxlss3k4fEI+Ae1P1dV/nsCtU2vSKIpjcBJyPFaCrkrArshRG8lruY1B/GbbeK3oH4yNH6E4DauCqoyHwzQaaNSZznUe6dQjX0yzWF216vNBn1FJrTs8v+sc/0770WI7vsbW8/26m6l9eDNdCI8YlsKHdZ2uY4bs+1D60W7G/97oF7k4KVPEgNUwcK3Nwy3u+2sJGfXMVuD5UoPKUpaoIl6xY+TLGZxpIwAi61gzI+zeuaRs+0qfaEbfZ9fDt/BJVNvvOcYo+FZPaja8zZKTPKbZGTZaTAifw9RvQbYvdOiFj88a37zVtTLiUdndkPZmKVZD01qam2fUr3b5o4Ky9tGyCnqe9ldUxuBDcWF5wLao4q9qVIQcJmd5a/XyYOcNGA24DId+V91chovp9Akt/sci6HBJmGg3GqdEa1sMmHAoFd9weOnVOM2e+54K/p2mJ6JMQaiUTHOUb/veqSskxb+vt73z78PSliCD4kdbDfh5Zt7/3y93d7m01a9fr0XK4ocFmJ6m/L8cGwe+0gPfX/f7onwG+Xp7uj2+PrGQiHT4vd1dkjiJvb1fnF4Mv3e831ZeGm6sfHg9Ow4eryXLfrk+mpp6gSGLfiEtJZrcHrJUgu4JdOyPn0e4dD3xN4U95nNeSf+jyGa77Pu4TvRzRmgiQvqHt8WFMN2MqbX/u2CKqzZnbWIhFVzqw33zCirDXaY18kmENwK6lgXi/jn11xa4lednaGHItsQEj+xR4clx/shPpqg1woGzqP1qP5EmeN9E9zlp7GjnwkiPq1j4HPOMq+hT42xpvVwBNPJB/No57OG0txU4iPpJkNy9WasOA5CIRLnKS21xTq9LlqxRy3Oc0HDnP5rEZ3GDc7vXS7eYynKrMrj4nghLpQiTDailSOV8FnbqXwQj7aXfk2mdmBxp/bKy/W33WuRWXOx2V2dw8W1PW/iW6Y9bFR5c7G457nB6bIJ6azRYoHTnzcb0OZeuX+Il9Wek8zlssczy7g5lZvN2mH1Cqhzf6rJvmstY5Ol5dsI/OOY6zjIK6Q28FwvJ3QrpDbwQWCDbumpX9w3mDMf/iyq7fbm4FTlj7gSCDz0+NfnSFzncYbqtMrfNWfukKvm0yeBHaD1SQaVY/91g8s59feXTTWVfZUpUVkO5qZDeEV5tnzj4M6Ui5nazMfiieAAnITb4hTNqB6J+kW/bg88N6K1mX3vFS1LFP/CqLvttyq8M5wMx1e5JkRPAWyOCx3zYwcc+DzVpvP5GqG2/vkHZ86rTjI9LpaU8TcO3dvaKf3uhm2HQ/eOrVCP124F/bHTYYd5Ea3csCtCftQ+8LyHlwsm945x9851d8WMbvX83IEnLyNz4ybJdc7Td8udub5LffzYt+5dDV1829vkoLPA9eelg2sQw5jaX6sbhVef++Jlxq5uF1WvrbY+H9U8hJbV03mv5Oozvkiy0iTz3qw7IFTpud7pNt87vNotV7iNqgH0qAtgKrT8nQ6BqjeuWr6fVZ3lVa4yR/OFIOKl7Z+lvtVWoxkx5yd01UcwAU753Iy/BbHW1NQB9rKoZXLUiyyN28q/pFz/OSaXLblqYhW4oe3DUn9IDQZPuXs5no5aZj9HeASK1bzy4r43c/9IE3wr7GXgeP+r11EUjBtWkmjqRXHFnr0dC+d06X9aDQgJgRVQIAWWezQI0dxG7AmsLa0IH0yzD5g3e7PlGfYb/NMlxhAw/Xeaa7uG5zaF7om3X1Y2h336bjrqK4UDVQ1fY9RMwxf0Y3AgupM1wsi2D2TQdahb5h9exMB2LdxwFo39DevNx6tobF63De+bP/Nq25W/jvZbNhwOvV83p0PHr3Sv3JC1nQ/u/TcMOA2/fru6dBg8BOn+u04Z8/h5Wup7dJt7oCnghn4N4Orq+P/4jIfxwOeHHtwA+5Bb/RHLIMEHkPAD81RYIA/8BPTSH+lx/mf09NzT3dzF0cjO3krR1sXf+3l6k91GS9mSQQEG+7EBCU/3/g/+uMHfxGNSXH0ANbOjfs8jH7Fa1zYlX/EEr51d4H+Kn+LctzaCjKfmRi6w4TCM2PMMo4inKGA0OHnw2xKpqEGNJjBzXFBAkUQ+hN8E2vNSOK7tdasUEkcn9cP6TR+nxfQvNYvXVy8rNct/vt/LqQ5hIAqMRhPOABRmy2khgAcqsmPoyHb63UOtp4ak2jVWuyfrNEKpLl8zUdjqxp2m/ufh4OeHL37CDVHA+ds6r1HXAl+ri8teLcYpD3upgr1HjcvzsrZu9hzs3UnhqccjIrtvla722lZN9EiGthE95f49/QIH3oApyeFavt2OfRXT+tVjewu9TSsIhOCYaPnt81Mve+sAJUeXBro8qFtr0E24RH1zeSGNxrDWbwANWlLUJesh8sL5mJUW313y9JGL8RYy5tSAHPvnAJvjr41ziWoTc04HZH6QguuP2JXmp/1Fk+4nHwg8wkMhTW6XSu83o2uO0X+O71aU3yU/nnr2EeYVJbvrZInC2dG/XXW75Kp2M0M3+iI/ONr25EG1XLvaDDkRfF83n0SsPmQ3VInExNY0MdNauzX16OD4aeWbX822pvnhZOig4O6USq8p4LvA52b+nQc0W8nv5eS//u3Ffb3zno7Pq92eqxk/Z91C+R4Opm4Vf6vWunY1Dxz+2A9usLP8cmQNlCp87ubztEnKdVaS3dZsWgZp/kl6GhP7RvLRzdAu+sF5vv3K0+vh6kfo1v1+xXbx5AoRe7LveDvXkfq1OTxyEPury389GhbZbGqqngZpEX31J391H3bsu8gBZX02tpLbG71arkxjfg9v3g0r2aEaPavppfoUHAds9lZ4xDx7v9ZeVf/2qvx7k1pZ+9uH9uDBRh/ObnU1pdOg8PkOmQ4GV3WRZQ6baJ6z81M9IJOXoSAjPwMhB7jhp89GeO3Xu5O6vUFr/rL5LXl/VqXgfhDSIPQQMEMTsKMM718SXa2UY2QgPXQ3u529l+r4VCNiIHk9viGbQ/3e0GnWoRbQvBtNfeX5wv0ZE1OrTMHn2yulincWktmdbrRtK5LdwZrG0O0vQRhLav1L2dFuZbv9DZUoz8Y+nffb/gwHES+9br6Rj3+vmJryGHldRx44Upqj+eHhm6ChsNXV5RMnHj/nBlS7gmcjaSmJBDOh7RMSCfE8/bdD94x15tll7rEY6h8Q+kx1MpJPXyGzonSswlWSZENXrYhTKPvh1ZuOitzDMAUC4dzuT4Q1BAC34EUKSH3hko1qg+avagJXuRkLIqyIYrHzIcVKE0osUYXhZaWPVqBOsbOOrt7tBWr/tJxNjl4ves2D2M56M6QEjHDTtkKhf+K5Gz7jJrU5Vf7FqVofumx37vaOw6Os+F5Dv098Be/QzTrUPy4DB6Nm9yJtMnUSvfv6ISJhCfZeikz69pRiZUvkNxELYQw2bwuXQKWT0+QDwC8X6QI6nePZrDliZHGLVLdJz1ZryWbwYHA9GnzPiFeOtb5+HXDamTV8+sc7oJ3b4B36VLHZgN7CcD7u12gadrklddvTbmS0QVf0v1boGkLFMhVna6r8e+t/PVWpcbgM6nt7VXMi1WZu2aou3788l8dkcG9J3RMT13/js45Hsoq03DElzkC3qUTKnO/Obe8Zz86mnza4lKwC3Q63y0CP7FyFKY6LvKhwE4Y4Laz1aUHxAi6ZAxX7Yv+K8Kuq1tpeb4sikHaKBIszGzIj6KbVyzZKiFDAZFfTVDwkyW5QhK0paUZ6hAOFFktFEaxPl83UFJiWQwg2aQQNBxHZnII/0QdEG6w5EJtIRuWXndY/sd2367Yzp4pQQx1w7fr3Ot3OqHllAddsHM8eo6OIdiJOngIby9nOF8WHiL1mNHmvvBCppPHCA1hUGIjkmJ9UVChsmSPiIym4Ka0TJC4RcKBbklgpwkzOdaNkpyAqkBatewdPUpjIUcjoXcMYKgPT5xCQZL+pic1oHDXaoVnAZ0MkgxAekq8v2RxtVjWG/G3/cJ478fEmIffSKo+YXNTIQMv/d7FpyK05ZfivPOPlNAe4v8MhEiwhqtQs1XjyJPkYcIUcX8qu4BR56ABPlj7+NXGa3mc1hoFwYahDFZRJP8Q1GjZTzxjNE/8gN90xI7FrJcK9jkPxDGR+jF9jElJSjzESJhP5C0Yz1LyGgKYmbJ0ImJ8mLijtNCJc1KyDNkIMjCYbOX6lGWCKSWCKXIwgyKR0ZUVSmRtGJ8S0Ef6PMld+IgCxuH7/t0EzjjKYyROAIvZvIsCin7C5pC+1nUjpIMAfJZFMBEhiBzCM1e6ktOn4E+8OMm8PuF7/cHdWGMD9PwlG03gXvJ/BYU9IxkEaHPojsWwglwkMPoIea/oPOvfckpE9FDBm4Cob6BSNfdBK5ICGNA3QTWAIQxEibgTVSfRZU/kUV8OYD+vPkseg7mkIsu4XYAPUiXgg5jfgBdy0aGsDEhje7xVxQgJYxBCGKI9Swqw0Qm/LQV6UtODWKqABKWnAwh+gAactSXnBaER3MbmA6SbiEHHbRp8EF7z6ISWsIzCemgMUgEQDo6jMMhtJ+10/9O87fj/6HiaKzgpf9XcVaI5/+dJETy/5niqJH/H5Lfj6EhA/WkxMiJ4hEksAgC5Zmo6SUjE0CKU0cohMBQkFMjRIfCQI4mkNPiYMHQiAelq8tgLJBgLeQiIQbtUXyW0JJRDlOl+KysKYOBLB7UU5lA3h8qFtRSkUDOjYkVQg1CAMjsDGZKyJIn42Aj0LlAEWB8GBlMgoo0Uyf/Nob0I8k4UJmBOeEkDhlG1StQXZAN41gWhZhGLTFQXdOCHEUcerRygfwyVDW4pWKBnDuRMIRaLTjd00a5Kqn0s7yFDUa2PKqJsg0GnhIqpWrpZ2V+rgjZIrjPxwvkDKmEMD/UgkskbDDmcgjdFFhzCCXMi+F6ebkisoXPUgMvMjfdv7u4aXEJ0nq0weZMs2w4+L1NsgbKZiJFF1kd29Xiegu8lDu82lWq82p60mTGLz1ojWHo6Qo33zzd3jNeVm/lwZPxtV2eZ9+I9q8lZ8XaRk+2axX4EE/lWes9VTg7IDpBPwf2XpFblYQumgBuLcoHrT3EUSGkNjq5HV4vzDqV0QsHeyC8/lwZnN5AWY2kbXzqqdAIumiCbhbrqE9vu1+UrlTqhtWNuHh9orv6M3N93B96k4/BySX89OO6f3mSlYVb5Pl2bJon8+dF1WbrsqcLwXfKZVPXTr4c8RyT8wnDLK3pII/7e3ROlmzd91N4Ww+lyu0n53vZw012qx+ul/5vT8EXHu0BD/fVm38cr1SgQ1cDmM2r7C6ISO5v/LDVkg38TcyMRohIMrKhiAikjsj7raa4okZUJNoSkXznbofTNvW5p8kC5jraZgBP3vfT8UtKuTra/jsXFFB3vzbO7ErxNTsTM2qUoXucarnPNS2Vwi62mGY2DNOFVcu+C7/sxVI5uHs3AkoLeB4VlqMd/ARWKqKRPN2p21jpTt53Y7SAjNcvYwetYqVPhrsoXwXy0Alpr5sKu7eJorqYN/T2z8Jtb9F7D11szuInxx+1cn2Jma/0dWBGrCDwNprgP7gFyFkKIhhwkcKsx8Kfr1gy144BvLgOHbZc9Cn+L/bdMqjOoMv3xSVYcHcN7u4Q3IO7O2ycjQd3DxCCu7u7u7u7y8Zdb953ztw6c+ZM3am68uHOVP26e/X6t314utbT1dV5rqUOYG92OomESHgzprCOWomE/VRUfHDSCm5f0bPOaa4OEv96TP/W0tPPSWDk3b6mZBaQ0ApSiopbywRlz5vCipyMIOcaJxJC5VPzhcnIuX1NyBxv/6utslHzwQ0mEoq7yRtA+L6gna/bv8xKA9T3qan8cjw3NqQvKkuKtgygNnxwCP1gB2FDwdowPU0zlY9RUzA9+6lEY+NMj1HRUQTwsBJyJOXMj1GjIKKb97d//gamo8YTYX1N+iIQoJIjqcR7FxYRTAR+Mk1Oi+oZ5JK14xAIkesQg5rKw0/CTXdHA2Rxo7sPO48QsE6eBeYFt6b4wBINuzufSNxGZon05bfNrcl3StDNgfiwBLiof7rLoOw/ejxPnkS1xVsWe8NNfOVDQSyeBN6TtWf5tvsuT0jkpo1Zb5eJ12FUVR1eDGTZbfWjxJ1EtKn12WyNomhLIsCuE6puBvEVia5lwaG0lhh64HG2pqZ4ZQs/x6UFuNmnQKz54ZJMH9uXQlZxMvo2e57pHzGyTLcL8eumM/YwYcizKD/zOcvNo2WZkuU6Lz47JYf/TpmTm1/thAY7ZPe0B8fL4VPktRQUlSz2rZZVT+nSbXOGZD9PI4CqurjE3+CC0o91I+ZVcHcjtg6/FBSncCc21r8QnKcNmNABNLUd0QAzvGICNDad559O5W7bKKtj19/l2HLO7q7uigW+el5iyEh284VGHli+rYDusdMrHRXhrbYYTqJRgF6wIahbxBlqXc0MxPVNXGxwW6v2TlM0xQR3IR/OlZpC4JubVlerXFYtVbrBR4UXMadaKO0tPm2pbSNzXgOhLvZw0cJv35cuNgG+bkTe3eLAYXzEs2BjeHZOQGeb263qodfWSFtTKxpmnYT441X0YMXA+FC4uPMhrjs53dO+/MocEZOIV9WEt29wGsMutcL+7ec5kfYOkR9E4+P5jQX+pW+j495p3WMXgEEftn+RAqNiTDhRqd9MXhQ17XcQGQUP/Hc5b7QImJ5xeKqARDb1fgrqlDARdLX+gqLfYRGKaqjxf4LIjg9Y6p11moSVPNEiipcpMMBPpGly0RKVglwURWd6mHzMI2j44b+bHlJg9NSEm6VwSw5l4bRx/PUsUWBwAL5jtshjqPWbfcesCS8mo8BV6+/Pi+hNx1WDos6L+G2qihqYG9HsooqKGUtLpqL8XYm2FE5GElO5ppiMhFBNnDI3Iu6iOJemKC+ChkBN3FwCs6fmyfX7fdJRso7yd1MNVeXbeWFi7kVOoixb3SfL+8/kjWDG6Xbfg56XE0r3eNI07o76jxMVk525BnwHex6eFrdPP/XkFHyEyzYEyW1yT+eJrg8zu5O309kpkb2LifupKjBLm3T/FNlciyTKLDxKpSphcrRV48WwoOX+sKC4/bCg309hQYPl46jwPSOo8Cz/SJbiorqe4qKq3uJ/d7+4qNI/0j/qtuKiwv8ojcVFpTz7RQTqvdZFQTPP9DLuh0+BnAmC7+JHT7xnb+g9ZCnc4N+VFpsfR0/GF5tDhyfoMnoeNHgDy+kyMs7C7fG0p9ozV1x9WB2WqAPtqhQbuyTifHpqfFZ4bo0kLqB4LA3ckFdTMgKjxiYJ/fw9RdcNSMhOmL7ezhpkqx8RQR4RBdo+LrsyB3DYnA0a/uCCWTuWKJJZLaNeD6TWz8EPBLmYvKKqcDhYhruYCB8PGnpt4JieDMrnHfPKFyq7WHcHM4ghtSe6261lvLrXZlVY5rJCi1AoQRRZrk4twA/CBthhTBxeo5xXPphXP1tytViQqCPDVCmxi+jMQGlFDAqw2mLpCW6psvfQCebfHpMUWUK8fedKkmwz3wboejQv6/K3+d7YOl/jT68DL932rqHnr/ZNmv4Y3r91LDijKN0Gz0U7L2kQCVh7e5uA2tjsoeX3Zj4hGPH2lC15UyUZrsfJyVI9+tvH+a3lidmn4Y0ORSB7SgJhAvTNIQlVdneE+1dnA7xIGJYnTIwq1LkxYrB2fsjgI6AsKuobvD5H6TxfP/R3S+31djS8cvWYr8/F+MHqX2zxwelPKCLKI4MyIBhmcjP5DC5021qWue+ftxR9IrDaKzLfC5/fSyZ/HC5+snZ5Uv9xuTyfC9Prcql1PEEechPquFBb86k5LnvPb8OJTD89vZe9OM99leXmaG1963xd9Tlunl05mQiOnChrauJEHtlqGdLH6rEnyEyjB6IbjVQ8O05Nlv9CwUIBtz7Yqa2roIu15xAUXHi6uhlNROHLOlFQ+bPEuMuWej8m1Fw53/ya6NVPt2yq2iXJlXZ0eN2mkZkOSDcYt1XvMHbf2+Vfvth2IAa67nWEVtjc4kfKPvX0RvMtLX6+bdZoWxBfOI1hp6EobYGyynhAxALHK6DKDPtrglPpmbrJxkzIl92wrjqU+IzAzpTQ2LhoCQ4X1nXcBSVZb1UxcSdVsfExZaSGQkmOeSY2SQ6oIgkOqA6Chenf2MQLX2c4wsUD9b0VosKw6zYf8oFpDxVaLMa1RQNxMVi7dpORqD8LO8NkxwVRZ1vSM34bkE3rTSnIMaM2eIi0CfSJC79GuFlEhP9JdJbrr6+ycqdKLW5xVm5jGxMHlVhRBeTOzAigNgvwtgLSOHjdFu8LQ4Hs1M7kGj8lK2tGpKuUSgNnzh4vRv00H744cyjePTxA5Fap8u5jBUkEolu6UoMaHhCdmoHrDNrD2lLVDajV4SUOLw4tu1jNWH0JaWBBYI5e8+/nIq6DPpFiwZAzTHgEIstxXuOOHfp/nG1gPsjpFy3WSyFdUisEIohKiOE2vHsq7IW2gcNqMmx+v8G2zO9DEaIjEd6zDxgeI7/MzQSubPRGyXQECHofg7L9pCz3IV6o3S/SxAOff2KsnqnxvCKEwyhQ3y5OCmq/7lycktdn5jtT1l4fm1wF8w2tJoVucfoKdrTyd7V6m7s+7x1yuNytNd8vzHkVcQpyr/D6fLE9yXC8Mt6sWIFhEnrfua6bO/Y/2mFpusJxrfPOwRN455UZ0XUhFy2IOuS2p2CSywIjXl7ruuQGeigRSTI9IoSj8cXd1w5HI2UnUYldWV5LpkZ6St7VA5hMes+S35ZyhyADq9JjtWNyJrde7jqi1x65iMb3hoCK5/iE1rCurOVTEwEMXb8VgJ8X9y3EMODdmjtBOhYYDBKhl1nDijldTTVPziY7nhalXzhX39fwp4iZxO9aCo5ipyBclKqyWqpr38Tm64vswFr9+CjwljayHnZhxXL9XLEoo5u38B278lWQUFq3MHj4VSvU1wGp7fQAAgx6Gi2lmmxzkb6AZGgfLBch4T7Q3x3k8vgQn+bSRFNLoUcgoiE5feCoMbVyKY0tNY2J5hIOpUcuvTSMlLa/xXiCJ90qkVAZzxdRu5VYGZ9vQ/FPT0RlfK5N/jHet/+NeYJn1SrxpzK+8H+Y9p2yVApzHLMu0ex65GJLw9McrC7RiP/erHWJptcjl10anv335mOZiummT6uEoB55VmW84tJwkc3+HMfNCd6zS7R3q4SAS7TnMd79NMdpjs282FJxaKUyil4e0f8pzHKcFtjMyy4Vp1QqM+nl6bdKdPwVTv4hODH+IuhZZ3q6ptGj3PEVjP2AcMkQj2H8NTyThMbTqkomuTQqUB+wBendoC/Jc7WA9rfs420PcQMiXW4vmtQKnHGM99kUw24KwOkLirslv9cB30mAnyRAcFIgJCmFAcOmCJy+KNymKJy+GNymGJy+ONymOJz+d7jN73D6EnCbEnD6knCbknD6UnCbUnD60nCb0nD6MnCbMuIpO8ukgY9oAdjoAVzoARroAe7oASnoAU3oAUvoAY/oAdgYAVwYARoYAe4YASkYAU0YAUsYAY8YAdiYAVyYARqYAe6YASmYAU2YM7GGdXtgl3RQTPRQAHqoKnqoS3ooJgYoAANUFQPUJQMUEyMUgBGqihHqkhGKiQkKwARVxQR1yQTFxAwFYIaqYoa6ZIZiYoECsEBVsUBdskAxsUIBWKGqWNd7Gd2Aie1jcRdGCfvZ3zxSSJ3rx+La/y08ndp/87cX+JE2xL80BUVfMLb/u1b/Ew6yP096bxjF/n/M9f9K3wbLYOafb5tmNP8laSYuzZ1C8kjJAf4HeKSgvg9TtzCK3f43/9f0Xf03/2lu/pv/NEd6IVNtiFnuuIKXrN6bZk/tY1ceKTu3/x8LviFjx29Sz4soiZfwsUt91i1Kp1WqMc1ZzFtvR5Y13vtcnyj/9ma3WBIyq58QDIxy5D9xs8v6Lze7ds4YS0lDW4AF31BGlbYCWxnjiw4fHRXORlk8aaCtgBn7zwwuPXT2bvrZKNYE5k0Nfjh6/PYwnIBuCLEopOYwhkASMv5860cEiqye5CCOihuN5bmNhN+4HwIvfZFQj89bayhHDwJHbxegHS4AIT6xcwwWbeKA00m0XilDw9i3X8i/JCMLxADnq2lnNqDlAzmFA9m85xqnkqvBShSExLZNz1uDzwOuYJMfwTLfhBYN6Akd8xNn9/HbkBXl5d88Hy9GIEMR9p5HGm/EcyiSAw9Ggb4yH3VOlo/74gVxxBn8ujRy0bGgxZJfTV78BvQgT+e2rgsnj7ouA43fRGOwf09TGJ6jsIVDCAUlzWMyRvRClFzsHs3cLC1jJW+t3C+DlTLmqiMeuc4oh0MIiRx+7jGHQ5vLDV1cdUeg9cqNKhwYmHSsd1lDHHiAOKSYJ81clkOzlsaXevjKrTJfj8oXIMzyvqXDvX21i50PfGqgzdjZFtNOIT42VsDa0A68UFdzp0v7y31HdNnRInG3r1AXjv5CR4F4MLy404O6wx5U8+n07wvIEFVa9gEu6InWVB5uNmxdLxqNdsf7H8vaHHY+JqTNLc2+n7i+ukMJHz/ZOt6J4f1+cj7dnkTLuvsbgRGImdTBHk9PIyjoiemFhO6QcLsiZcjvt0DxtH6Nf6QYRq+sIR6hC5b2aOuJlrjMAg9JYvpodLt9Oi0YWFDsgjbHpRDQa2E0jBfB1yYwfPneiI20uv0wPpgl6JarDkyOK/qarotoP64KMIB8r9zqor6UZq4Ds4XXSL2wkvdue2iyH5+CypqqYCKCJYSxwA5I1cGveww4c+4mEFBy4M84ARGXMjJCGQhCLxqat7zAZVR4fiaMi3QlaNB+4FuubXFwswfEPF6c4L0ROs1sb17IYeEG4KcEvHJxHqaIuC/cauyrIShsQjZunw5sK2Lv+3Pf7HNWZjcp41UKNSv7sKOPk2AX5goVn+Gz9bxTGsYdUZpA4Oyzn0UuBfygLrVI6R8SJiWnrHEFElfrWNVcD63cHwwYPkhEitbIKXyroVjMqZMw9+gH+iIyna5f34dePU/SQ2mk7I1JCAwd9mcKeayfty6mMA5ny3VWFq/dhzr39Mq7XNiM9bwHZ2hLKiI1xPCiVDJC31JzTuZgC4vK3J8L2KJbSOWXMmaiBMaI66z3VCDsJizTLXgplhlMBJ4tN9dj6IYTVe9DZq0nxP8QeMU5Nv1i/VDOmSfYjnxte0/1J2eR+KPgZWPO8BqZOysKjoeSGcoCYJv+Jz4VfbmXiwMPtZtqTrsX0eVGn/sOMErvBV8v21JKSIBMvJqiuJfSCQoUoiGRdgeBRvZ/7tgJ7aBMDyZmjSc4bd34jsmR4xJOQ9fdsn5dvGSqFAJGjDcdOE5CL3VBNPo815wEzFHCP4cmDkgXLYSbO8FuJFiXCXITxbS8YgdC7/tPF1CnpIfvanqMpo7HKkblLONTx22rpMd3QELqrTzqhKyFfOppfx5JrSmtMac7Vf79HqYifpShTKdvcHAu/jmDsTge5RU4QJExOXijqW6kNl3G1zg8qDyoSDzu+tjOicJogS4ayKZDl3Y4SeUP3r4xMGUPqEPMz/Mqy+ygVHTeG/1OoawCLZ0EJUfuBZPu0sKulgo1WKmeJBN8eYrksrs93sJsqJfi74DCXpmpn9zPP85FJJ0vSUgDarCyEVmrlB6po8odhdc0ewuJNXMT5Pf51YjcEWm6NVUuxLtU62jV2crNpIgvtBmKZq+0V9dEkRqRxcesMbUJb6/3tQlcpxojhOta/P4CjXXszgFrwL4kk4JVvaslDeetLrjE23E8/A0UhXgXuPla900V5tA0oixT8vL3vD4rWJ8RnMHR5mOIzpwYOY8Dbaq1o0w8/qjrPd877rJ1M5labeJECnKOO0/ODN9oYbrwbpX4yLHELly8S4x/0zv3ArRGtL6Jx+FC2jDliQsjwovSBzL6kvDLVi/qF3QSDh7oVsRKgSQe5nFdw8Z0uhjskKEbSi7oVeTLW4I584P4LosMAcjLErf8Ugxk3rznEv5j4ZAyU5ObZAB9Niqf2reYQPWeN/rOPtUstgQhzd8vX9nxhhXl4GbD8yCqj1p1HjElb/dgR7uXm5qatk7G7h4fyarkjtUxzGoHRshZB6JDVWHknTq86sSKnfCJNu9Iz1251/hYa7nWzs5PVtuKsHXPhte8nAXEXmEzfPTeX+OEVUqYO4BuNS8rEJlSnJWb8FgXw8IJ5+Xf0b7lwFgiI1AfvxpFxJAOMX08UlVi+4FXer4W+lcAaPimg6kC3Fthflj2N9CxYw4wSWgqwiwpagC8oScxZHtNn8DxYo38mevO+2mpHWNilvGOfWjSVhJxoUJSlIccf67UDyTKODkeNkrT/GqndYRAwRJKcke60xNx7h29rxNi9LvpCxcKgHkNeXnffJztnj2hXFxPnd1XNXsRVtHd+EGDSfvMMm3xaIjCXRogW5dBuDFQw+KR5y+gwRiKdSSMq+DR9zz6K/GbvFzfUq1kIa1kgnQqYu8Z9EaoWHGbDVSHzuumFwo7DnAL98K5tk+sm+oW8JuSQrkp+Xx6U9fcAcXz8yWU7RodxX68kmmywcW9YOs774nuaN1vDV6G623JVuCvAZPikoubXAyxs0iEALE/p7k6ay1C0oIBa3Vp8Q0j9yuN76m2AKmIyk35sCVWKKYQjv48rbti8m5crMTH5LLIyBtskpeho0/Nj6Nwv0xxtlaFb/hTEdlGElhIgwiTw6q+pV8VnoXRJp+2HTy5IWPc3JJRAvtaauu6dHl2z5kUSOtUiUbf9fD03k1zVOjleNETYHeWDgckt8oZvREneVgFWFjU6VXTxy1JY0W1DBxvhH3Hcb8N08JabmUIOZiWR23OT4SkJmDAD7BWQpuuctPaMFYxyuSHzrD/gi9rmAYPVi5S/Z0QUc3OALj1w5YQwb5+9jeCeiTc7JrD12c4ZxysKPNLgxR4wJR9TjDNlv6pXMDbrmoxKk+6dc/X0QXtUzje/VqWkuzr/bByelC1eJEOneAPTsy24uBP1VMf/tNnWm/c893hi5x1+wDa+76lqhihtxxhrvXmVunhu7qQp62gJ+e9NItK/0E7cdKtrzHPJUAD9GG+cIHyXG19OfoyUXoZBAtZBiDW2FIhfA1fqPlVJchosMc7EXvKTrxkpRy9Ty2X9Y98QcqIZb9LG5HSrXHqNhrw6lOC/Ga+4J+lRJj/8pYx+wzU/OmIZ37uazxIVHh4443+47aCYm3r28hDYsI5t9rdnuqMohymgbmvoOfauDlP6httywdy6pY54z7XSPBbYUvcFjs2HnCL+OLW0fpHmvuT/K6n3eaMqkaiO/vCwj7hhEuDhyRbxr37ON/u9iUXwofj031iH6DyPDR+QzHsPO2a3LFfVjtGNEh1UWVFlpBXG6wqvDddba+v5yCS9ZOPwWjF1xm+IO4skq2HQyQkcsFmqvuktU7v8oHXuvvEpazIIh15ZDG9Z1OA5punorWk0BpHc5E7lAvFMBmQn3ipugeEIEUKVPpqqHpg/N2vuRNGG5nLiKaXVThye34IIuynCEKpE8WketcTt2Zn+Ii3ZFqtHWkT361S6eRifE4Hwzcp07Sa5fXLsb2KH2a/XCqFdH/Bojo3bs98x0XckRkE6Ww7tXmZGtGry/jSo+AktoFg5+v8wMwMAZTlKxJDyv50UMy6JO+H7M2FLtiijCc5RKq+3/cQXG5i9v195oJZqGkvTOeirZI+T8BGPzbjXQY9iggZkqU2aNrM0Rwe7p6AnTekx8oNSBqjofkFbBRtUTFYCMRgyhZrw0qc+rQ0ihpoN7dE4GkVgCazVWHYHV03O6K9i6SVtrLYTv1UgTpPn4uBCb5s10b6lMNhcvDGTidos8lJsLZBVDN7xmOezD8UyH0l3zJt36gS5fftDJCeZmx3Q+vCs5jTgphyu+Yij+nO2JiM2WOUm/UzMnT0mh/3bgzUP3ytQSPjq4mxi5nejZ4+MOuvKEUX7w43VULpbzB8+V3c8HQluh4yp+WbJxHn9GMp6TnwO1TSqmb5zBwC4Aoba9TCDNTcztUI/t4eEWrNR98qKZR8O9RkSNbUGcDtZgbjQcYQMnil8MVWNNRxVCWZwqsvARC5/ZY+1ZXZwoSUqhhS2j9USJy9NH+QiBkr+/czlX0x3aCniyupqRT+kxIMXbuoijW8Xl4v7KnlYVnOECfX66qqS7Lm5uoflVYG7VgbDMVxD826hIkjpWRgRDKANRQri5gvzAEzu4CFO7ypZEYi7ZPqj9HgClMbOu1aNy18yMy8pIonVatnTUJezhH3FQtfKawUiUb8AAat1xMSHh8BOd+qnDuusDFX+OElAerbaQQyBVwZsovu9vdmK88v/VkNR5/os6UAQOVEhkfNHRC0S4hSvNqmwxbYstjpYqO8uK8MYmX+JRbc15yPbvmNFNnAknPri8FwI2ZndoWgt4i02FPAn5CrYHbpHQSrs74U8CmsK+Z5ZdEn0dk/V8Hjyk+iIf1Xwf1Mfdi19iFMptaIBlK3rN6kNvJPoofmOwgnIk+itRVXwbZrOwi4Z73YaPNBTKaVCAZSSsSdcbmC3qTQXwykNPA74zpIvUmlfZ5EI1avgs85dhBS8XuxE2xDmUyDdhDgjZ4CRDE6s78GM1H8o4rfhz3LHsKUX4KiKKWMvx3XwehNKoLTOe2o6NWSmXyn9KmEZVRp27qFCyTmiIrAZT6QGEJ91Wxx9QIBHv1ejr3LZu3wkkaE9J5VS0ebvQF20TbjC3xb5eN6ms8X16fu2D0rra0/av0ZDxDvwPYiqbPenu5OFbOytAKzxl38qUZ+an6ZUV4Jg1u9I+Jz4F63pdSpLFR6clsrr2OCxLuI5ZZidEQBPAVH5fXZtTuM2Zmqhx9eQeIN2dlzTkyMHMXwKgq6Pz3LJzpLHu7/j0R1FFNZIX0Z3yH9yLexpsDVNLcBcvHiWzdoprud6R30eC7fo0uy/s6kEghlJoGEdhfCJaV0o0N3sn6twqszk+Ti1tgQ2ke56UuZlSpdpLCrX2YZLKh9L5GS/u1dg3TVe+/uw6iVO76azyibBt3+jBlIbjYBQYD02GgQj1SDYsYHzRz66/kN0xDoDlYAEmBNFPf6IxLJDRmXVIlQa00iix4zbfycDU7zeEA34JC0odhQpmCoWNT2VswlZMbhpAdwpzryjiPmC8BDAY3dcSc56GQpnPza+yjtG8GiGnVAUQMW2u5Y5lCkzZop1ujGKTQMJxc0GgRkPuZRs6ZPRIOBXgyy7NO1wUKuTL/iSbxm5JPwafKzE+6JYoTVBos9QxIH+PK1PRJBhnrdsbg06/Qc/VHgLVeBPAGf9mHCGz55PKgB7NzFxQeEoLlS9aGA/bTirif43kPT7K39EBVqwNUzMew1ONqFfbGaEfPgPNrU82NHAc8hJL18jE+sr2X8q7ZWRLkPTfdh1Ll7lh9OeqZkRoQyr3xtf1vtY9T5xhF39W0no4Fr8a/GbNgW9S4mIX2C12ozRbdlXALRPrbzNT+11KskERfKK9HeWKGP1q9bFu0Yau/nXitgenrtdMRhP8v4fm/Zkm2hTHqjQDnyEthTplS9mFLf7nmMqJhpcMQNPkN9HAOUzCOTe9hbH3Hws3E9EfBJ1rA4fzZ62oJRIi2DWeNVg89SGEHmVwzB0PhC2P7klemGkdIORIrj6YUZjgtDinui5BRelLf9KRe9DGalbwxpWtEDM7yOiE8i8LdhYzBSnB0+PokJIadwAJ7tz3HXZTD40xpwlXkTyHzhZbCT3XxSXYJbH1PA38YqsUhxuVj4JF5InMKHMLY/KdaWwXBJOYVFw5CyvxpB0oj/7fu32ith+5P9H5P9c5y/E6KUgPHqh6LHCTf/jG35eS581UcI57t/Q+hO8gSEFa1/OwMwfL7Ip/jtmemvQIameCR1pUo+TzRSPt01QgkFqvdziQShiIi3XyGIujKgX5Oiaz3vD0by1Q2Gf34eHR35+n4MTE0xfb6dp97e1r0KCXU1ehyvuAsJZYFbHJ+MmqbfvVoZRqRQqKcoVnlHqCQksRUZeD/b3k/uYbNRi5zN9PYYS8+KaX2AqTtYZjPzpAqpSkmZH1AtMQqCT6ibE7+7vA1GdvlRtPn6pclbqE8ydWq+4MEdFFlugocinDgVbBOoKch62GIcCIjmqWQobIH/NolULki/OFGeduam/OiMkoFcgSLvUv3x4NyhJbSRBW6390zvuHU1XV3vsj/WvdmD2szwdzFJC3TDDCMXb09zC7fOpa6gkbmkFi0H6cIfDRXjPSzsoLHCJ6tpiVqh5xB0HPVL3+vd+bqkFsUle6aPZu+3gaUmf8uDNfQylA96jTpWd+RUi6lyn0+K61AB9Uxig46HhdOOo+yTzptlU1WGO8zYkYunem+iQIkSb1dvKc2AN5qZMq8L52DIUFmzlXED+ijpdzWwBG4TCfh99cEoWx1ctvoFi3Gl2TgWMXmxwSh2aVy22UWLcSz+L3EseTForOYUFSO/43lGf8eTsphI7KbgstXam48Pz/9mIZ8Yi8LVsmE1N7VPZiEXGP4db0tnItEIisLFPfvbrfhvtxZGE4mAlyjcb6ds5vnCf0de+Nt1M46FXNpnMAqj4e9YS6bjw+t/HSNug1FRzCYSor9ZxEhHf+d8NRuXgmMzp7Ad/x1f+HfiP6veOCtnbNb5xWNR8SRyJTPXfwSy4YY4bSG+J+TrZUutgTcByQ7o8CXiLdk2JAubcpny4ygnPeMLSEHfE4JYIaTzMsaNCP2jwoOh0JbU0YY/rL/5q2ZUzaNJYV46JhtD4Bqoow+33iflbr3RfRc6oRt40hFeyUt+YzCeaAru9Nah2SrieG5kbkUUejbpsZxriOXSe11rK3N/wbKrQ7sxqAjybkW7caTEWID7UD6gXoBT/vtHHEh9uCfzWqIgVBN2pTY69D3IdENwsrUpOemAjuO3T2vn/U6tUzpL1bj+IF+lBra5Rud77sHAkoWGgu77Tr+ZKnrFpramzsvtaUOakKAHVG3HaL/qF2X/K2686h3HXxynjYTJi7kHT/mXUnutEFv7l63v8e++vi+fnTS/9hGeSgJ+mZrU1pMMEHxIuTQrpSY7Ya3b/v59h3z4s8CrlZV2o8iMQ8a38Sv8Q+zPPJ76btRK31EUne9CxYlXaiNSS9W3F9NtxyJuo1Rhi09lrxuJOyhJix+nVr+lh7GeJ7J4kT7HwtlxnwtUn5E0peEPTlEe1WnNnjEXUy7KsGnVi7VyjIIZ6erLp02CQeVKvrwpXjEZ5UrXlTk+5F1YovqFuR15lo80q0IRbnFvi/hekvWRpgIZ5z/mBBMKjBsVVyX/PMTHfX84r49lB5HLv0rNCc7WxyKCyMVeh6cFWf+9KeXrHEmQxQgiT3mIl30dLvDZnxV0siJuqY/VXZX86/7rmxWsrY+l/4cp5YsdT+Ca/BBf4GNqRay1KkkEIo99iJd8Hc7z2Z8RvLEk9qiP5f9X95sTCc9pkEW1zKokqD521Yq4YU7QusiHIqug7lHhtTjjQRkWlIe8KklYH8trSew6LXia7TMv8loc+K9Cxl/Bith1VvA032de+rU48UGZGpSn8K8CfJKhgQnldpj3nlkgNVPBe75Kfd6vbvoXbSuNEgwQ3TM0xwcEENCB7LTdcY83vcNR3GdjGLq0jVwFTqQfyE+zqcPvpcTvDeeeX7endnuJNUWMgULyy3azsCrJrwkIkwOEywF+yQEi5gCRc4Bfc4BoOUCMHCBWDhAnB4iXAyTIARLlAElygGQ5QIocIFUOkCYHSJsDpM8BMuYAmXOArKRCi1KKuPxpSvzpSvwZSvyZSvxZSvzZSvw5Svy5Svx5Svz5SvwFSvyFSvxFSvzFSvwlSvylSvxlSvzlSvwVcJ85kJwEt+2iDbdaMIr0GLH0GFP0GCgMGIoMqnxZ6Dfrotfbop2JeYRjeQgDdQgDfQgDcwgDewgDtwgDkIgD6IgD5IgDbIgDYogDPxAHTBAHnBEHAhEHEhEH8hAH6qIcXtF40Eerjm5VPKnmaw9COsH+mFlmmh1j6AGsMv/FmmBln2Kt3+0YqEOc+M/xjrf2DZic4/H/MKgf5ES2F73/6WX8v8dzKgMnAX6mGY6vQciOVsjOoxlO5n91hqvcp4P/fimI/zt0M82CPnf5W77s3ND3HWiFjNUhpljgMv5TaOYfc/BI/m/hPxL+7yHxhGKekD79d6j/IuxphQzVIcZa4BJNsfJnmgH5x66AyTvX/zUFNE2JNyZj+0+6320IQ/tbHQwHQ61jB+SAD/NXodfIgr+G0H/8GBj+X+6AXSzN7Mz+l0fACrbRVFfQYGB0uGBg6P9zs3/m/3z1C9KSBeBzfe3EPvbTPO+INz1DxY2H1Iltjs6Aik8gk7ROWTXr1/tCYSbZRMKDCf0FQypS9wtGx50SBtI0GNKq2KesHoXUHPEMqXsDGSWtb3coe9h5YPLrxPgQ7gXX/unoAiz8PTILdlABQ5dTybkXN5Km1GzxwRbunWDLuZdoLrv4r4Lmg6nqqyp7v7cZzHpKk3RDlPMfNcHavvQHpmWqaOCI5I7h8g5fHiWiqKV6KWNlSCUlt7lyCqKdWvRlvkr7MH2Hb+7gwYsH8/Lretq7R1H89HyifHtdu8XR++Kv8m1eWNjD4Ht3cs5gyF6EaFiq5Y8LQrLVG1Ld4RiYJ/87gYigIHyGrnIhX6tXGXi7AwnVyhqOc8+XxLUDmB2g2ND+TDWcdsVi6X1GbxeMUkvEGWfrvX3HVRE4DZxhIS72moVJnt5EDQzN6+nVhpULJx3W5lVXS69HUeEHfTuM2UcZ3ZN+FZJW/RXerx0buqdVe+cmk9elbEQDgx6uUb4M676bKhEWyhMgtF7lAtfa7QpWHGqelwKwTh3Ewel0hIBRHmLsWvKVPHnU1YZB5BH3ElwY/FsCxf2+bYAkzc+BdYlfiDzXD9IYspgwdkam61MhEDWs+WSeZNumZDofFuhQsUO9Z2PYTDHEAkK+d2vXe0NDsb4sHTpuXjTRcm1cQr7vl+4oHX6+7x8TiYDa6TGg0a7B+9tA2dand5oX8Dei9pag1/3byliRQcfHSXjfK7KkGLogCTzWJpL3/oY5vJySxdBhYOibLVYgDuoYxMD22k4rnQkC0CSkGKEpEoSxeZBNzrjdcOITaSN0+EOaIL5qKBya3zDqgvVCrtsVc2z4yvCPxMW2t/WuPbnLccSGRIna9oULBISMLuMaS6PlZi5NEk3vt+TM1qFBHD5z99ivdFWwFNty1fF3F6gAbFQLGRhTS4b84Bki6WxGNmwRmoaktMC2Tca8Si33q5zooCEIZdhn8EJ1vKqcEvHwsQMwynm5J8GEmkhTv0FI9CVMNFpCo9F2+7Bgh5X1fWaDvOMlEbF1M6Hsun4JJ+lBxqzXMBb0FaM9t6iEcIQ1aitbYyFME83c4baBfATf7nNqcT0xQqXWxnV3+MZRn9qv6+DP7N8YsMJa2Q5itPX7xrW73nEJScvVYOY30EBB+dS0QKyd3Ya1njdj1TXQ8ujrWN3JPTL1ZJE5QLpgaecjdHVdZO4OK2TIqIHLJ+4QZfa863G2/UKrEyiib8k8XLcKbf5q1/GqsGjfKRk025mu3M5096EjfATvxVx8fveMjh1aI41osJCICE6v2x/feM2dmIWO+2jC7t/hNaChQBbfFhPEZQQxGeW5fKKzc8LOY2jkdliuOv/Mio7iv2/crks3uNNOwubSUcMtiXnBsSaV5X4E9QukJYXTY4uWhowW/ZwtkyCoJzZLQHE3zhj0fa5nt9ZJiGnhC0K2uip0owSRbbG2b8UXKkOoUCpxx+LTX0me+np645Hld62m2nTZiJdcN5jVxS4/HPX4BDjabEsycmex4E1aVihczF1Q0Fm+OHbyLhxbWaY3LE58l2bwpMX0YETEix4DmDhuagdu1HJOz6t++eMpydDVqRVIiZ4tPUbcs0LYSYWuySdqZ4UavS2gSeLx0J0lqUWlO4yM5pjswMCbikchbnyhnFDvzfGei8i+gJfbosYp/HVTy0k+Lsk9mgBjg5GVKNqBZKIWn5x2boWSxrsQc7Jt9e3N0GykUOnCl4DIQ4z3oAmVvkY7LxcNBw2cCUirxSkGcUmBQKpT3lUw+Gus8llFqSrHlmBGOuomxjjCA2ZJRX96RuM7clSZ92ScEjmlBzmBRGnPH+mGVqsZDlZkm7aLEQla5xBLRs/CAtpSm1a18QhmAKRsC79BIpfmxA9E0Oz5VaoLk6y9c6Wr7GtQrqxwb+QbT+vFN7wAETvU8dxCnKrR6tlz7/kLwlv4TGEQu3yv0vvLOkhlM4JoBxE28Oj0zbCp3drIkn1L41TubIt5fAt7+UowTBJ2c1+hBCNV2HL6we/fBghs5Y3NJDcwMPN7cDCMfwkQzpZGTmamP1ycrOwtnP8RISo6dJxVJW+YXnzJJt01d9BrAuEVdU4Xoa903e7U0OylQQsMI5nYojArxwBSRwoWoktq5mSR9SCWQ2N/8MCW5UNznIuUsHflSXV3WcVbzEmmMvUq/YzUhtbgT1Q2HHUNM3MzNTOzv/nHvd+HzWXU41TJc/BJy0pXR6J31SshwNptaf3iZGXq42FSsyBu+SGmqZqbp83Lydze7RRw6c3TcDX5+fb6+e737mpkNCO2tRLc1VFn4ei49aqnh9D2IAfK0AUC7Lfm6X2fXex9L/fJPng+tZZ6O59LRjYQvAoLsR4nXQpa217bHhQUpjr3QH/WhNqemtwbAWdnHkNrQnzvnxdZo6uKAj46iZdv71UIc36fZ7tbbLdzkXMIXu0jKwMn/buZJYrYHSOpI88dfiDtt1eDtuJoO40u76LWmyA/PS/PIrcHBzszs/cJnw8du2fh+57Y+1CmUybG263FWAGHBzq5i4zM54THZU1eZT/XFD/C0cPFTd0KwvaiNyUB11zfH0pqeh7NvvtbC2ehNiiAa4Xg0Wnuz2TvqqrdGRT8I5SrrVK6LfXYzVI9b30+jzrP/RrBeVFHl/kjAQRfvwS/Mj3dwyzakl8aeOOxXHDFWc/u970VpyNj9z+2VDUMli7bKzd5NAwEyV6Qfn359jETBSU0n7lZKdhV83AjAzob+zmYlhOsMYKScuPbynp41OHkm89/Sl3MBfhDjIuDN3JbFbS7b2UIr0zhlbCxsSFQosqb0f11MWu9LrHR9149t00nZ0shIeNmtYWugW+pTJKpitizINsJuc7zRvN+ZCMOpqBM4+b2wCmNxZgdMYFQvlYHF0mSlV1Qfwa+H0VT6dPDw/R9whr0kfrZjuEsxN7G/fz8i0uQR0jgeWT8V0rGelu1BdpaHWsHNllQHkTaU9HMw7JVrur5sx8odR2FZ/7bi+hljKr7ff/jQoGYW0gNvw1d0WKmgaKwhGEbtRwCoF3p0LSw9YeA3lpr48fRAUrDgmRD3SOo/fPo4NrUvlpFwKcd9rPnT0nnhyfoJPy0ZI9AuDP9MGtc22JtTiVF6pKiul3Mt9k2uZlruY185chMwpm4DGS59xE70vH6oYKj+OBMMhOf3mHwfjIkH21kUdsVKxZFCHsd7D49mNMQGZXn1QZB0dc1oES2Sivu4GCSR5x0P1MpIKDt9VLv9lnofIZF/ehb62W9if++lJIlP+F5ULIS3PKcYfKKheWIcaFGqYahC9qfWkiykYc3xTLPLRJKPU8WbYkjvuIB9UdAdWqkKNbHF0D7ueTv5pTEF19qKY/2pGJqCDnb7C3dgsFaaerwdDzsXvvpE9V/4h8TSj1ovbwk8CWOUCA/X1yY8kZn4CfVMrRVOYrbSn+E7/XRgkAybu4FjR1dDy4tH7vxGzrLQM2adpborlC//ia0Twk50sx+WT1j6MRWgq/g2DhCOLgTvtkysy/xAE5GIrfKJBTzIzcfInpUV7PqD3Ug5WxJ/gFQ8eaTgPvJ6NYA3gFFUquWz2iFMHMg/IJIbmNycGq0WHXBGLQgXY1ooj4fuXssnqj1HAszZ3IQwRXH6OUrqHNXZzLgYmbpIt4DpUkqdm5cW0ZYy44xqd8rw/s1XcaN2guTec8YT5gaIHlrD6vs44tLV/syEX56ZnBKfVlB/F76cBkIEKBn4uLUvRmcG3DMMfwZ8QI6CkKIBB2fvryLdUOLn8Jk4/aAebVGzyOHa3vd64G6I1fjf0BSXKIL6Ly+tiZuZP5WnVUYz6dqa6INUFkhEIMk18pZQ0057XpPLu/y1v481Xrfrro/ApRiB29y3q3Q11+3aDHxcQnsUd5D45+gzCSdw15v+HzVP5F7n6zVTS4xhDoFC9P00Xl/0LH+0V+oagzfqfkdnM2TE7prCN6AfgPM97Jw+7H0ijqfhnV66q3tYVsG9JG32ud3i8QSX7lPul/t6dXeW3xpFjLWPgJbYF8jenNCD8Ay7MWEHCMsIxjr+LjhrMRvN3qfznjZKGtGP+aKC0/oXsSBqmS0g4lnD8QhqhiWHe8X9tQ14G8uXOcxO+gZ5HHsG56SA2mnZ21y8OzJy4kOEfzWTd8VG71I/fPJqjToQD+j0OVQ1ujt/H7q+AatgrjW5RE0R6To8kjZ2uTELZ6n+fNZhmCDgvwiK7yordbC194RVfv5aX9cqGi+4Afu+GsfhKuJwmU6GXtz+AjCb7Op9fM7xioIxvOMwHjD+Niyh/e8ew0ubYrNU5tWXf9rUlPy19YmygGKg7oCI+Qa6dROCgddzauHo4wFaqEqA51SPQ8IvYLgmJBTkWWvzbPND/3R0U0hiGzfZyPX+4WXcJt0a12RMbOksZyHro/TpmjIlD5IZeHf77aebqN0l2l/VgmLaJq3oWHhSmJL8kfhYhyrVZUWqGl+ah41bGWJlGpGBjh5Iiv4NQ7RTSgy0J9nZd18eS0yb5/96HjljqGh95IRduznyfoFK17rIUzRxkPwR0x3MmHkEeFkJ2d36J4NpRCxz9ois0LAR1Dg1WB5zPn206PlRegjy/TRQO4WpDcCah73sT7nbswA9fmn1PI9UWsHN0gylWr4lfve5nvuKt+fJ54+SyrY/woZTZpBZeLj1SbAw71y26fLZ42CTyKd/pPYXCd7rLl4b5Nf4sLulVdQK8MufnI5VS6xq2uTJzZQKIFtomkVh0DpJ3v1qOrO+07NygFPQbvgdvZI9cpdIUZu5dOlKRZEKJxmI2/4p1gOtMHFIdQihYBqLoeSLNVGiz0eHWVCRMwALyI+p6fXoqHHAwgtTC/as/Kjyfh2KNDHT1BWWs8xWr7Bu+NSylrrdmYNmsVX2fNqbXIvapxU8OmBz5g+qQ+tZiRIC/UdTU8J3AsksK5ObE4N5BpTKH6EasPvzaE04uk9sNvrRtFsZCaiZE+TMNHQ3I2izZB6cKVTD4yJwv2DCz7fOo4FolHvgX5tDt79EEwyLokOxPHxx5VGu2EcAFKbC6ORdksc6N5fKDaQKy5mCpZmeNkyzTC/zvs+RXx4HDYkeSs9Xtd4nu4PFmQtGh7x3pZ77n8o0fDHUrfZYMeWdwDVPndsCM7wQ/Urtribr+eW7i+Z2AdoK89H7C7XKr9GUsBNCkFsrxaMVaeGKctJdQydN6qb39lm4u7W20UFJsYRE2NEsd343LvTr5/O0E3reGRdf3siNaeaoLR0+PKpRp8hcd/jIgEaXl7kHsRrlHiz7EmsOHoh91rgIGNJVanPuRZhKTRs2l0vI2qpddzhLapTKr1SZK9/2RFTEb4NeZi2hxsLwzhAqjuJJ313u53reyn7MfmDhY/nE16PjNqiCBvLiGZscoJxcmqin6ZMPVyaystQU+aiHP9qJyS8Fs9c7/d5eFK+XJjX9wIl2jJne5FKv3fDvd4lO+SRL2+EWZPjPj1T6GoXXPwUWKy4BMhV8xpdFe+vOH0JDryyIbUv4foGPq0Pp+LAZHfDMhT5uwKBRITttga5Gy0zh1vTzTFNm8TCzHhoiCFMKHfFJk3EZ6ei+qaGO3cJ782pU6eCh7jDhRaKkiz7iRpCx6hg69PGC9CIi7qaTflzBddCiqaXrzlogOO7CLK48+XrYqphg5IgLPRWjUKN15JBT59ESIHD6XfAbOu79G9L0e/rCg2t4kP33yAKXzZgEX+QNTi+gks+To34ON+e2kvlu00p9g2MewUtvqMI/koOGUxWhu/W5wppcCOS6DswLaVrePfZcIhSLgsQHvhzvLFe7bWGoiN1FyXmiFKOYD64dtyRyrM+kOasoD+7jJ/XoFNfWTDsytKiprfnzUrnIHIDGHl8MfqC1bnO0Eyh0aWl0h5uWebl+jrAo37lFWxBFwKl3YMqZMMPP/4Q+052nTKad+qQuh7Ej2z2B78kvr+HwiPPBBOTHJ7aUZlsNmqC+17fPViai0uQ7miYpn/IUBfnjZxUmhk7CJ/b2VxqUaQckwNjUbhqlJOL00nIWybBPpOCsG29xDuowV28GIpdfOAONEgXve2ULUbOZ8wS/OKI+Ef4ldPcDRpyMBeOmQ3LHjdWZNZ4mhq/JQDeJLyvPrWGm9mQXpQI5ra34iojJvj8+kVzl9nOnB4ZESdSKTCgxiHSr8iEdK1LMJlbLg03MoZUiCVb96GmXxt0dGEkhyvbyoLpBy778usRV+5kU0j6DZjYhvWo2MteFIOE5SCvoNmfA74ezW3ci13oMCJt8kUjhbtJs6nPMiSCpqGbtjI2Wq63lNs91cGkunTw76ZHQYhBp7AORUoy4epEGZolH8gZHSLKHaRqtx1g0i7QIqRBNI4gbOnK1Ybf4B5ZWI53CT1QyugvPmCeT914gjgz8vQUzJXp+bWsWkDhZ8Q3v0jHRtjqaC0hHh7c2zB/S2eEqoYipOfn6v6+QG7iYhNiP7DtKg6A1nAc++LjxCUpC1saR/eLLpsy7Ekl3J9S0sSPwXjY8fanqE/9Jud0aIAlWY2gPbNdnu++t/lY66+6xUTyrvmLt6BUlzyKV9nU9paDnhoZexdjCnM2FZ2JNzirTevycJGlQVtyWKlDrOgGlkUsrhectsh+XVqUkrANTnSuXSxCH0txPX8Xo6Wv9ipFHIVcQxN6yGjumvcEypfVF9ctF5dopPYLHXodGKnfv0jfmeONqnFvG5Lq/z0vvR8iiMOUE/viZFrfG3zHYdfzVEslDJ6w77jw79/0O7BkbekX9hUeX70QiKxm6z2ArKKnJ2n44c7ZKVa8Fm+o2bX5o7LKyEag16ibmBB/xFHu2b+2O5NYajhWGltaeZFWFZd8uLFSVdEQ0mr1tMm94GUHYsFuaL9MmnK/XpO2/PsWzLfWVaDYNJrEza7Fzd5vPhtKA6zHl5+rdpdz68QdEE3ccXJTk92vSFvi2xUc4M0Tjr97oB2XD6knTfBkc1lJBec0X1rPmrZI4IZCskvkPVs7RkmoAIbTaVLYkQ77MVH7dTLl8PLxPw0dERhx/uzzEMWZElAld1RygnsNTH0yENiycmlS2K3QwdKE7lrvaX8zVV2FH4M5+obLh9GHBjhkplYGbGIc5hPVUaETm+ZPVSLhjjf3G6HjrufnzwjThjnX+3Fva/ZJ5R3O91YfUJANNlN2xzmTWs/OXuHbJCLgs3E7QjGYUyFxp6bqVpvIyRMotvtLi9kiyjGOR8SHm+wXUmLCpiavbsNVfUCIzBXn91LlqSDa2muibafySA+IHOZzcq/Oxd5Kr4z1f2biLK//xlD0i42BvGvq2ynMKhdjgXJCUOb371CAWNtxQF/WJOG1rYXjGQE0fHGc5auFtkr8oqPEPzpN1K/cWiGMR2QD7ZSzm0xCiN30aQmUkzLMQlAsnu34rpkdMqHpqzuseoZCnDp3mJdDnhaLkGb9uLPMbhMbErbbn24s3vDkIAc658dTX/bQzTNpJIqR1wayPw327vVOD46SM7uZrs0UZ4d6TJJLFJHVX9omRISoSZJDqhNi0+UmE8agqmNqNHXPz1SXh2Uie0VIpDcU1YuYZm7QsoBdgzPj8dbm95O/mtTQ4SksK6XTbLhhTKraC8wwx9/3B8s0ZDtQ2LeFh8ScU7Ecmy5DShbpyLGrDnbv9GKa7G/jmMjh42k7o+dfhXZeLZT62MdQqz8IDqEiRkdFlinTLgh0Om7j43D9sgC72gO8eRs0uSNOkB1DxuvBB3SzqMls7GpLYoXqb8aRMV8fssefMiBFH6e4WAdsNSEmwbbe9N0wkPpenLj3gE7ceymra8mbI1LCSxihKD+yJZMQD2pNwr3NriD957Z49duuvPcebMZqTsPFFgoAi/okb5cpL2UAj9v7JdmFvKYZzz23K9usXni5T/cllE/RqhdiomCRiMczcDyAp5ujtbk5HkARW+CLuEhUbtMV5TrAq8P/ZIpKKFX/7mY/708GGhXC6ZTRxfGUBpNBiPPw4AppL3L9XeeSweu1I2ioyrXuB2BpsdLU0PULx5/ThtC7ciTSWOxLHTq0c957g9iKrQ4NHw+wCW5zE0T05EA7gQ29Nc+2vGngUHZ4aD06G9umxe0wXU1a0ze5/CZXTKpGwJ4QlPqvTHtzDvIxi4SHRHuOMtMhNwim0BDFkx4XS2K5O8BA7hy+B1iPHyntcxNYovEiRO3XH/ONDQVFsJoDsjqy+Dmg6dEBrTyVxbWMwy0WPWWqfJC5wp39HNBoFU05vH5TNI29L3HzQg5/PBXMWZGWiG2XsAFLvZyqTUUnsEHE3AElr4zYR5fPodqI9+zs9EzmoTP2MnV1xaKhTPJ8ykZRkexH/+oc5FkosTJcI4vmJChP01jBzYR7lcDkhMt2bpQA/zJoTdzegsx81PUSpjG8Jl75XA077Gxr9amomuyaY9ZQBoXo5KfjjodpYu02f8RBtw6zMB/K36h99h2hAsR9Pd9DitpYMBAeobizf80zBNjsxnhe/hjwC9jQZXt4mB2j9hzNJ5ZY7CI9sAgKiUnH9+9XRz/4OpOllQvJc2b3bGr/mCJFWa8zjN/mc84GfvthCJqg5Cft1hdWvVt13i+eEV2pk97RGqM649JXVST01+6FUOU5qh2ZBhvzo41yB3DVnaEcPgF6yDbzmXpxo2NJw6wcYknjy/U6Br+NFlJgqxA6g1t5BuiyQtjHBq3NsawTUa97l9BnfTP79vPomKGY847xYwGw8GNrVxb0/I0uGTr2PLY1JhUaRvC3i1YIel5qr7c0nP4Zmf+vwLjT28uzsiNX0RDxY0nGjOtZcuPbPef7F7tZ78n2Sv2u8IG06s8QEwxaTGMTLkbLmhqpjEAFYALEd2lq/69kIovz5+cUFtKNijONoXXwLjvymC+LmZ0/FwqRfIIEuNLVuv3he/tW+o0xepr90bcNNTd/lvYbZfUSbizIii5/6Rl0NGngQDcF6AeUWlXCOGkZxGVMmC0R61W+A+PMrQ/YO6ZqnjPrkzelfMGsGAdv4b9HTPN5pgSBWyNldr/tw8z6jySTB1SR1uZiWHjgZgbhI4P8+YocutT1OZIlguXyCRngvo1Em3JVbEjVdnTaeHmIrTa86SiIYG00tHcEfJHuE6cTyhCOQ9mMQCGZ2tjvhfimuBy2e0cLOsbSGAH34ESiiIcodTs6erCY+/lqixen4pFdZNJsX0KQblMRq5jOCd6OJk+3A/ek2+GL9chUJlAM4JsZ5GeXt1jI6hvAe6xlm67JIYobIlCdtdsqhLKmmdduZcjlXQBfWYWcgltZnUKtLShbHiabddRTVIhyFBa8zJtSnhNOsCdSv7pqkJHvCO5IvN01BvB6vJo/+BXe99RRgJwxbEpfGar/KNiXj+IOw6b9RMj94IsR48XmwNsrx/WKsyHxn57Wm/vVV+uoaqmEduIYryQaJyrtb+/7fwAhQN6/U/v26+qhFUh9DU4MNQkkPDBnlPfP6akvvF2Te/H2XINBtAhNx0EM6UjSLmKWgdvKE1JChh/k4vxicp6SenJa8gNDOyQdJnCHN6WT8NLl9Tc/4iqgayDQUTYuHuD98oOpvEihUCjmMuJwKRS9nJKHEjE3HKYRYdu7KHzJde3JVHinTA5YlY++8nGotDNdUJZuJke/yHU0+EG3DWryd3TbTCLZUkrE5TV6C46H3XcMS+XV9IIaJEkHLaMyc0+2X2p7BoYvtA36XBSnofmqohP7h5r6kjC/wL8NZ7r7usZGNMp8bVZ8gSqUu3gv2MPBZ3K+No0Vf+dgzh9Xxo2odQkDH13TXvHFMAu+toZ9dQ0HZy6exkeyRzbUVFhFYM2ktRz5kVNXyCgbxqTuyyDfRF5Ql4BSHbKsec3F8lSstfkdqbyInh7akR9IcTKGSpmcziP7i9waje86KGVdmw7Kujbf5Rqmz3INm68ZjXqxsKipYF/FxzjVtVMcKlSg7ue9ouAYdRLLynzUWUY/CcwhfF/Az1TkGihJQecrS8XPp5HmS10p/rCE6sOc4+2dw9MczkLsVqW5Lrn9gtJ0dFQIB+xdpaG+k/IDmZzY/jbUNFDatfWNY44PhJY3/0ac2wk/pBAYFgG2FBLF4mqgoGgj+PMDDqLb2GotYtUgG8gUmKEjYmOzijKxU5xTDaRQtTmHMrn8gGgfUIIY42icaFO8dRBEClRyCTToQCipjQSGDlK994xskXevw/fIiaPBiOuZBfL/HTgD6y7vQKOJ7SDGb/ilpZMJaNVuDIZnWh/Dt4bsP6umNsWCFOdzBFXcitSlP2eBpSGJIyhYR7opPgchmeR9A0Io+7d6w4MprtfYPiKkyIzEmVxOJv9rkuXU8Ygk16YyJGlzoZEkr3FEkgAdktQb5KRde3q9fvOEvYZi31WPP68i0avJAd9Y+/AWIiFOm6Mdh0DGSJ2Ug8Ebl35EKonq85s2dUvcpLeIIcP7xJYPBgITFKYhJUwaxEYXYouPUxXloehJrBMfg4VSGOeg0FrKmKC13eN2v1NofSgCOJDIxET9aW83Bxx4QMzb87+F+3ZGsiNSy8cgyGUYvtOAcTjAadyKnKxwzYhl2uBe2N+k++lozUhSHZT2dpEn7/3A7nf8LNnOvn6KPWBvY3Bv2l0RbInVx5R/ceUJcjBUX36FZlbGwAuG+eIjKw7IF6PF0YHR+sF7Jv4SroMGQt7Vvs6xT1j1KyoB8vBKb1+CJATvH4opvAIQaxgT9IeGzZHROAWSxkCx4xlzRfdwJHJXYcs3rM40ErHlB7bLG9RwdsyPhlMkIk+d3G4JGzxK1t4HV2x61+rSEv6pc59wyJdNYKxJ39gMU4qr2DFAQDgzBPHIYoZv8Fm4DLn4VTEP4mvAA/PgSz3U0KYlpsTVSA40nJTwCVQpN8aHYpbZ9q5e57FnKRfbXiMdCYiQzw066wEbgsBxSYISOkVmfnrfH0D2+fqLC3t37Y+uFKSFp51vlNBPTT7NpuQl33SsXkEgOVnNoRjvkIvBnn1Rp/7cWFOGja3qsSWR4yQ/OfDyz5wUTaVAmwYpjp/LAwntFzPViM8z+oGq/mVyw4kdKaEAjmZy4WFoZ9Y2XL8LI+ph5Ynl+r2jtbN39E0JYAnbnQ8++IV/HsnyL42BxIUh0EAyvKNrINbWqAwkwNQDI4bT8gdMvZ2yrNfJspAtvZzoBg1NfyNvYdjZ2+loe9uO1h1rmB+YSOxIdjBa2zB2tLYJHwvxAb/wzw0muOWUBdcBE2zDtkwwx4O6S0BiJyygZrTS+VBc3xtDNOFKLsRycza6uTcDEPaIKWt0c9u0ic4O2GmGo8yY63sDsVsKoafcukG3XvdORLceQS+62SCwRmQlnw0cQDiYU8rnticzurY/mQ0BcB20WE0UbIp2APgtNGgyndMgIBfL8hNFWJiUyeELetnGGWRjBkTZryES9eCpUlEGv5SKEqmJOXKGphVyRbnYy6NlCttdekjmZmfwClp55YlE4FsXY9vR3dOlOdaDkSHTQNTCxbsTXfxbSBZRtXxi4+pj3B6+mF7c4+WR0X8G5ru4+5All8MEhSlzfdMuB/ksvFTJhOIxqmRGP6oeP1c7e073b9LvXmZqevfc/obz0jgY5z+d3DXFabC7B8Fzjd1TP/IA0Q9KkKEJHpWxh2H7BBpw6JPT/5qeTQCY9iPiIPt4B5ADA0fE202h43GDzeRkGay49ogoSmlu2xZ/mZkULWjdkgduNU9qo5na1aSX18tlZXadcEvYm6VNiLhzK5pyhozkJyisVv0NPhih6cL4Idauik0NB0RvbaYUi4oKs0eJMDSF/AAATy5oIC25H1dfm2oJO/t3prZv6RWXymC3xm/W8exYkjONLpqvvwl4iwIapuQN6soo40B39fsg7nrGPR2WOtqJGBHkXqXxGKq7t8ryQU2KzemOS0wkxiRazK1xnzHXoMbJoReUpAFqpl7HILUjhAapfW+SG7nQbI40sdhUspCgT+F9E30bbvH5xXhSHbMkpQ49l5XREiAd9U/sskFm7eqlc2J06MaJifai4EuxGs0w7f3b5iBBfmUU9dRnOzvkC6TAANdE9es39V9/rl07gCzPKUr5HXc+Vu8uV5duUU7b1aP6JS27Z3pmt7d7ahGVLCjMZXoWwSXzArfmYAeNChMYiYnqkxtxFOr4OVxkehYk0QpDIiATZli/9bB69wc7wi0TQ5VBL1/KCEECKO4fM4PSdGWuW2IiLeJQrIjflZuAAeQYQQhI/G56CXsMQy9+N73E3ZL1Er+bXuIcZr3E76aXOHxYL/F7sBPc1598RVgCCOarV3a2a2cerz96Zo8QsVKa5ZUW5/A8K4s/7NLmLcc+kDEjgSgKtSDep5TOlMWNde3ZeVRBiG616sGLsF1Z/TVu8ZcQEIoSCUiWPjk9/8nkZ94CVMldezjWDxVKEcaQEAGzRMm3520G+LXXq2Q9NdUUOcBhZBKAB76Rc7A094XMok0ICrxjFAGi2TZ++rYjBIXJz2W0WoPXjZd8HFc+KxaBNQGjfmV99SwtBTxUbBTFoudPtiqUceOCLDhz4RwQUJvrY9eeyXlUP/rMQ4LxRVSMVlKJD2x1rpHmLdzeTqxfgqPL5sbEtsYoEKMP+smjh1GYurFYJqRS2AuE876DWgZBTW3PKKdeDjUO5qc/2W9k9xhmNUGRe/OzpobE5AwnJ7TLbqF8RNJ+H8yJGVtEF+BgMCr+qf2gnAEOHQwKp8Ts1MIURwpyKUCf7nGqGQV0JnLZEVm3UaUWCyZnw/Prz28258MRn98B1blsVy6b0GL3G3yOtWA3qOej3hzxaoh/x8Rz3JYm+TYmjqbanWstDBUw2y9qw8l3ecfG9Kdc019EpKU4H+lxzNHL9ZOHqUbP4Usb107Wlg+rimmjhBCgqL+Huyl0u+TUAs9wvtKLTSsqqz8eI4el6qHMEsHiaHYTnAhAqsBU6ozUyO7IiAAlzsuG+m8yMpIpzsqk6t0fa2dfgSLLNj4jZgCqTq4PQruNRLmu/R4ZV/DETuG65aR2OXAT0ik3m1id3MzLQC/i2YVvlB+geIopT+fS5USviCoi2k98ZwPre4OQeuWMy03+rz3757x/7Jn+r+lJzzQ0YfQ4G/iEhVEdhJH/aKjYoW6gBhU7enQFoJWEHT0u/BaFGP/gWI4TUzt+FWuufvJF/fSh2tHfEEJfO/+6fv057lq86WA+nfPGSl5uqIwg5I/Fz0V5qPsyLLh64DSUThgzN1afrL+mtAQw+FVXV+EBhm9imUPtNKmC0tXPj+f9ct7zwQ1vOC1f8O8YgCETfwg+FStSHYVBsrq0HNwqjAnVGj44wVY9ddwK51BVHAU+K3P7d6Hg4uTslFAljMDYirASp8NstKLc2pAhD5lPUch07fnz2tGf1+/cSFjJIsi7ftaZAWR0/+LC9O4pb2Hf1OTnSATSmc5jVB6Ohojk33QalbBATsfuub1TC4vTuzjAUGThL0Id9AdHfZGzgUhA1c+zh6sr5oK/8nDtNXQSseqor4dUglv8QXHdNUoG1U1DzbfAp0nmlzCsDGWmZBTuRKUsXTJILgiHPwxXVP/v6e3QmYDoURSDV206qIg4gXT8816kwlfjvuHsZavm1R7/zpLyRsrG9PbsbPkXXr0a/RmKNBnWGuVXjWS235qFcl3gE/meCmqa91AVU5m4spWNMVoxsY7PfDzntOMt1ZZzWi/Cnd0E8v4Kxa9gSStrqg0FMtWxQa6lIXKOXsuHEItW7RCE9+ACaWblUxMiwpkA4oSFhuhCogx9PXMAyXYTwjsQRnUuHCjj5qINcnUuklnXXKgEaKyNRat1MKdBf1eq4T6yMp1ut0dvQXKtP11B3dGmTrnVZDnSnYr5chnJWThTGajQaBZke+HNG8kZPXtOLE7t8/bjduxJwCPDUhswJGQ4TBcJQdoX3txJggAcHKU9QdhjyK+hbM6ubAEaLOLfXNTp+pmDOA4UzBHqn5GHSI2NW5fZdroBu1As+ByaJRHZt8knbYw4kVt27z6pnRbG8kWvMFQsogpBluwzCbUVUEnBa5Yew9WIcl5OpDrCprXKJLttRmftLM8PCb9AMGgY7k+dJJPZ9xc5WxpzgYrwQ7OzODL3TuOt57xopizUYC6S7liJ/Lg0o1mSag9eQb/FxR3/DLeTQBqYy7zxqT3Tu6ARZslohv/Yopoz0m5YKg5IeWsn4/5r8qsYj0oyQYGoJoDYBiNzxADDP/F4c3PGp/HujDckEhwCpNpCQ5QALEWnhUqGLzvQupZhBGuqg5HLcIhgFbXA6ZT6fHnCwQ16AIwkKXev1i4/WL95uvr8xvr9Q0h4Syvi4vMtNjGF0Csb69VD0repeTKg7pqb2b931kvPfoYVMrn7v/YvLO5Ffjg+L+mK1H5BnHjYZgcbJW7j+zd/lLgZGNoRpuGmrrGXYKiJ+iFhWCaFy2rNa0+1nACI09QiiywXw63VktVA0+EIjPbdEIay8n0BYUisZqlpnqeUO+59x3FaSvsfqOsS2TlO/ARXfWhDT9iUbXza7Hyb5MP7Juc/pwm3fgpXe8K4M8PB0KwqKE1CtjZv1WIoaHbn+IL5FJn2erosL83hFQ0IDzNVNPi6yaRieRo3pyJ21Jom1XasaqePxnXE69/cWj90gOr8kHdBbuVxcfm1BNcvXkbFdyV1S2Pz47Aan9y1f/9er7R/7z6OHLw3hvnuYFE2OGreOWx/H5ym1zfLx2C8ql+9u373OkIkrLSprpytPT7C4cGbqxg6zILauP2CjjFj6BDdzOnVsnI/mYfFwOFnyyAQS4AoZdQj/c6pAPGRx1BxdSsKqPaGR8dyxTyHCptfnzm+yDLAf8yNlSVORJrVrv2AX+yBjSdbvBt+87KDaX8gD6S5sWIe78WHBeay8lLezFYPirY47OjDQ9md8pW6pQizRoXdn0OROAb7HCeqeuvB2rNTOnsMWDza3WneBM8j3YY4MQooyW34pNpuCIDUMpt0IT7PRVeIuzAPTcZTkZs24nAKwD+5ETfsELwZ2szUp2JkhvYY4J3TrkHPjft8JurHfqNsqFePkyf97v3qq+/XXvzCG+VMQWVvnHKM+FO75tTUHmVF5TJLCHkpyVHw/Gbt+hJ7RsAR+X45lRhO5PLjQ1mxRkk2wH+LU9iAwhLDlYiiSlVntm2kL7GhWVQiX/SQj9bbO4nQlmn7b8S50Ccz6/aGOPep+TKLcS9MTYrZ8ocGBiteOS/jHv1iOVHucBxPbmAc1eV7+jgCWhskeDSvwfV1/ycJLflOMV9wE9Upcw1RTuZyBhIZMLd6AQebNLZjoJ1viKcRXK75aggm3Pjvbbjd+oGDVsdpM/mVxswywuTUziHMaWGRKoQGpH4xbXRX3GfgWl7gJNl5fQt64ye5BP5RjBUtP0HRP4M7VitlHSwEInY48bbEOiffxVwx62IkrSPgvDWaGaJ7ySdqtDD9ZXhBBtlVr/8A3+36oVf0LjQmm9KOYvA+HP4tcb4OFEfSSpDy2puv668QTn2v/uhm7cDP1W9fVld+DbX3BF3fwyxu5AxyJVQcKI6iekSZolz5wBHprZtTTDL1gBl6BnU/Vc4ImQ6jPEoj2KCc2smfEBFoRUuiD0IxharycZdaf3Qi5QFooo8kXiKV85FoUKD40G8Ep4dvvT+UN25DndCdYsmjovebIK93E+QJHpfT2ZJ0sRjmQcvFnXfj0k+wT/LpKudRkS3npbNeKT2SF4d1paIwws+IK4BlgxVkNkqs+vTGxpmDteVrHU1UQAbmy7PnUGYs+wHUOzx8iJ06H7Q45sRNTLtpaUuMY6KMgoB0Hc2wqcadoI8yn/e+79nce+uvv6su/YyrAWnV1myETLzPRBwXFIh0Rkx0lNU26hURsoewGfCf61hwfIZ9VDdNZxJb43ZAPhfooLACBUknlB3QbnxQjN5igL2cYPcA4ZluN0DH1KgDFKy1QpuKPrTIqcYs9uJWTbkJjTx3iDCaso4HZCdsi10D8uKqToq5KiCzQD/H0hHx5CVtR37sfmpZcXY+NkW/tStr9GO1K57+cDFYFdja7vSbsMnS1NRivXRux1gZyiNipbMiG5RKwbBLsMGEsnHu0R8UbMNDOVyTkUeqM8kGYhwz4aZmE5LNQY1j//hFF2sQ+04avwnCf2uZb7T8ThkDUhyMcdOyCcaotDjY0iIR4/ZV0S0WDP9atpVrQ6FWvAJGijZtbbdQqgaSQsFOZ2IZ20Ik9Bp7ginedZUkIeeB0L3hYXuwd2xjrI/Z8OEFMX6/p4uVRJmLTGQGheyFGyAuCbJtYZVk/QYO2Hkf+vaozxFo/jMzE/1dyUYFDByZcWkmKGfWVg63WREmktDL3iptBhveIYzeLOWkyp7PjqXFDSJEEVwPTATKzkLvjmR/dmc6yAyizf1wOWzFqQCizOYQZTpClFEQpdX6a85Rpbp3pgUUOxT1JxqJFoIQh0CSGSIQP6UrWsjUxvnf66vnmiFTrvsZntIOoSIN2U40MCXlsUXaH5apg2rLj7HJUc6r/tUzCrhDnYH7q9XVR4i/48xCfxRIqHjF9LCwt5eUpKppmYAdqdupbsKdU2Bi/cxlJeoR5eVGR7yB/AjSkFeETe1DxbaN1yycUlinUBcq+paFtyjhbosik/DIp4f8TFp4ac0WhjHZlae6VO5NCIt6gNZItdAcAZ39BE7N9aU3teXzQYamfvgrrZ7jpovMdCaM0l1QO408WVZZVIIqzQjgqYhVZkuwuHASOhiFPRYMaqvZ9joHFNK4JTvQ3d2FP3qEGmxIhU5OQZjR60XItoAkk0DOOtrtfSgMAozTeEvlnk4HGSIM7lucNc1VQ7OTYtOT2KqZVsEAa/yni1dX9F927lSfQJQjoR/3LVgjBkD2av5Rn/AIL0xuPd6rDS/62vHCjl5LFoDBk3fTZPowGpd1b9bfvFi/9y0nI1uWMg0Dgldg/eotWEPqSzdr508q0symzwt+Vuv2wGxSHiULxVi5lB8pk1xSRZ/rdZUJWnU4o7Ij0hMYkl1duV9dOWpPZWvT0bWjMizq8AUszu+nOAVvHwU4I0nCbkQyzC7Oz80EX/TneIOwBlU4N6OZ5uPMWoNwc3lts8pnckgLvbMNmmgaQxh0yEB56DgibHQtx6QEbgsyAsbmR7RIdJBmuW3r2vp+IT08VPy4fuZBlIzamWfVI/dx7QgJ4zzLDg6XhVUNjMTD6Kp1q8qjNIv5mp/yDBuHUXlvcWq3V16c22dy73EEDQLZzb5hszD+fRO/HrmeNH40/uue9zEilEhBAnoUV9PNGhmZKF0mr7PKcaJ++U79xZ31I79Q0Pv6q9tCrSpmA3PrwEfiNzMamM1xMJlLigUhjnDQI4MvOqZIgItQJH6L8NeKWMTphEO0z9v1iBnQmOKT5SSRgBqm8R7kPDdHKWi0tpNE9wcy5yqo7CPrlPulAsgR9i4nOZbt2fbEOGihXA8Nx8enLVnt6BfzKDqyHFtzR1gux8UiUX0STlo4FIRD1g/dsRF4EFLW9o17ihrCbyqdbB6UM4IJIaNGozrzzI4aI4PEMJWTICrWnj6HVjk0km/sP2JGGGNqHUTNn8h5hFBjw6fW38gOiTS6rekJow35iJBXiX+y/LIpd8PXuWvPT8Nmr1zqzOtpbzce4uINd/MhLgcaLlYF4bZunIRIJJJKp3eGk4ULRZQEqIsIWLePGVAlNdGNKxaO++6UzHscbMtU8n3rpCKV7+dzuAKvPX1UO/c41P3C75DQNu6myWFifig2W1kMsWmq7Nl4M4rcefJ7IOxXvqU32Refg8D686drT49yLmDwjo0fHSswHwn5jb/bYXTOe4GiqN30wOmWNzbG2OTcDfTQZhBhAFuKg39S90vA9Wa2s9atS69TXn+ti0NDnvZY0UmitsvMW6CQRK2FwSOY40RiA0wRL8JnsRWTTBObxz1XRtrDc4t370I6pffum5n+dBrB3eKn4WxwA0AckCDbIMlw0iwS8bmJRPxkjgcrT1TbXwbPq6RfdOPld/QE9uJzXTWyneDpn8HDdU5jrk86pf3B8bQ4UyDu4d/F7qQf9Vd8xrCv9S3BQ8IRk+IqTI0Aj0qZeg4xtM+PjKS9mCIPPCpbxSmYHkWKZLLNFORYbXHqs4zETsCim1SRCna2IMVb2j+EV0NrRMB2c4bXV+/Sc9ElCg3EpocobMhWeDu7rXCtPnuE1+AYsVFiqq/PVa89I4vqgyv2mTUfFepHpPg3jIkys54hZylODAouD0cGRq6/ulc9To+8KIsB72tmtUSr2yuPZj/Ii0vNjvFAG1WZDHJ6OEhOTpSW+tXfGrQ8ESIlRKXxNZcvDAjDGVBtXLi+cRGpVmjknBL0GRXGKQIkAgFCQLY8IgfkIy6bf0MXwnrxeRgfwlsY3g6Pwu5NVqiKP1r0xkaGBIcrqdT/vkKhudZduHH1GRYOxZoAPNy59tpgdZDwbWNiPPletz38+7u3bZFZPIji0k6NYYxovTojdfcK+3Ej1kJ7TekabRm2KXBmGJI1dcu8LYO5nT393cKcRdn3BCO1aFgwCIJxc9GwRAAHHmzYRgqaxhYNNBzoP00dx9gmrRsBiUJwttt0M/YLlU99c3jISPvayink3sFVHEZhji//D7x34B/tYJBuee31m/U3qwh/0I0W+XT5Yy9P6V28sponKNBAekwU5uslG1ldO3+veupG7eJyy+C2vm+V/+oqxMWJ2u9X0QA3XIQP4WH9n+111/6DUztR0k4QrFV6G/zw34FPQkztBGzSvldCnaBeU7qxuT84Ah/Obv4NLKKL+OOl6rX7tYc/2Rf5vJGJtfUpjNjzJ3ejzFB5Cq/Y53kz7R097PMupDChdYJ3eHr3bjx+aY/en5AlfTG8jdVb1SN3Oa2GS+gg9Q8UFCpqK4lSy508FmonKsDM6GiZZkPXbD6G0iW6KZWLaE6+vRWNwos7uM3kxNQuxNrFwZjqcidjLmCK+jhhZHBCKGDrwkhQzk61DoOdnk9NzPf+mcX5yQXzOGCelovpxeGH+TEIpDmmtYj9hhhpvNAJXmaZyCN72+Jw0xM5mXgQHIXzo3p4xap6gbA2Qc8Os3oaGc4m9kxBVJvIbQT+48Cx4UwcIxW3awwgSDer+z6C9zG2wkbUZ0AyDzduc1ePvj1zj5DTEDtAowTGLSF9sCYEjiNSByu0RHj19F2Pm+Cmdn2RQrXjZA4qwXESN1a/qR3BDZ+ej1gtQlfw6akI7xsIekqRbm0pMKSYbA72Gj5Uiqib9iwj21d4liWTtYtH1l68Wnv1Xf3kfQ48NyyPKPgEN24/JsPRy5XqkcN4N6YfUXYV7p2j3BzqEQXgMm2dhd5R5jrk7U00stchdR7Ee0LNXud/JIUY4S7w0TLccUntFNxqYru0fHG79vx67d8Hg6c7K9c4EYgwte9qxWFFoRlCkQugNQI0SE5I/VdW7wtWjcsxm5Y1w4Gojh0fodx1vKcp1ZlrEMiiJ/YelVq7KNYeinaIxU7hGV1UZ5JzjRq/l+JfE1vCDkIJachpt80fqboadkXd2g+kWznK8DVXIiyHqZRJD5EH5vuGPtZLxZnaI5UjBVor0XVkBDfZG/pAA3kOi8LVa/TSEZW/zN8RZxnWGtssSeL6F3IijhFgoTaX2+UIB5CQhTMb38RiwjexDvBNkIdvQnnFN7HkwqkKLaCuxZAUi0G9KgdbD5Wt4kzRIGUbH24LKap9Cr0U1tn91WIO4KATW7Ifd29r6ATJP5m/qeQPJGWJb7LNdVVK+MMfzIVAOI6AfAoadhCfSr4nM9eo57cNvk4Q0SqaiL/ANV2ycnKinJYnRTBdcD9Y/ZIsfcevWu8JasdQFM6zx1CzoREF/zRJ/axxl9Qk11gVeaXhB7/FPThCE1yqeB74VjQ1drhR8hoZPOCyQ0pCzlMiQt2SW98TG1Az2gQE05o37JBKcZSYFCn++gt2EII1wsmLWSKOFYL7BYpGAY31otmXBg6UPfLEGkip3wRhaCcFj2LxHehX4GEv84HanRxVjGN3dcuejtvSkBqCzkBqhFY7TosqMrTJN0JJyFplKE5UchwaHr7IokuKUiKIwKfNXWJo6XEeyEHwFnbBpvXPGf45OtDgYvahXBkYqLp+XaKmOyV3aTC7ar62Bvj3OXk4rcUSDwBpLiZDJ+4cLi0Tu8OxLBIwaPhaslycL5wogwVJVbc14jNMVT0EYjrY0e/aVgnczDScoSKjIAdH+p3Mhe0URdng5mQuaD6CgXkEr+xGLo1E2MNb/GIOUUmJuVncnpBRhXI6i269cmkEs0FWZNEcCe2k6AzK22kdwmUWFFzW89QO9DrXBAFV3aPgmthKEUJcfYSICv3oYdh2Qsn/GiyQVCOZi8KYHqf4C8fwngI5SrNzA9BB49J4wDvn6jGYNajEPdkLX3vk1wiHurfbE0AZB+dQQ3LStaGxrdpk+zXoXbs5HEoMEym/lzIzW99zAcVpoSfRbW4nJcMuDiOhTgWbBndn2F9gl7Khc7EnK+V8ijlQsTPlVmugMZmu+FALfi9utr5MOUn7S8Iya0DIYnwV3LK7uKU+Ecdt5k5cfFrITRC3TXZs3hkrzJ5UhXFlZRnQgk4G+v5KG9C4S6uwk4pSGsC2wdUdT2YQRaypFbRinOKBrxmnChMuGCcKMXOOkcShsMPQUGAZmMJCxqZuYqX0XH2mxhifY/UVvCly5rIB5YfzSD4zkv3Yo5plHN7gSGCtoHJn/McGpRA8d3+qHUG+ZXoFrOvmecU+GRCrJwHaO4WMdbO7vnSYJElcYhf2i9PJ7KJIWpymhCQXPpkGTISriWDjA0oXs6NF+NTFSDeWTtd/f41IsoRNepGo/XazvnpZ9J9BTrW5XZ+L/jt2lHnbgM7GUfc2ZHKQTSrjyeP90plxGaJQf3EJYw0iek1eqTCBMApCvReX/jT9iVGEpryMSdsUZJyyfj3TlRNAItXIaDKO8R8NddrDpFgKtXxbsXRpHUjKO+kyq59i6hBufOQKghpwSYm30Wv5DOIyGbhSGACOMl8mJQLMG9Wjq+FM4f5JJ7oSg5fuQn6EeaRQ2Y+47GBqqKngPnDxb4ETWqBCYALCYmhtACHJGz1TsYaaOnE0NEx13h0jtehpHjscb+q9UYm0JD5Fh8tSXMfwF+ylND94UuHLgWWzQkSEWOovbyNEhZ6NIYXChaAeUbsdh9nMzu3FCwU7oVncQ3btUfca/BzZVCxbdQK0/UEzqaDVmmYqg2Jnr393qb58Ye3FyTC2GVoAHgTWTv9Y+0kL2s3M7J9anJtDQsiFmcl/IjvU3O79M1OcvWPIHmM1vi0tgWfCsUA0ZXjvtkSZ7B/WLBY173A4IRUtNPBWREKWf2xPAjQLShbTngrAFytNAW/TwSHN69GjUMeU7UOj4WQCtvimwLY512Jg+xUhdSjn+y+nobLVrx1EGkSO2c8XkBUBLyZHKt54ujie5w1MIRH+sX3lGCrkogX0tvTULnq2gkosQjtXvEmkbAr/yZ4vSSpNrBqmUfRojPdZf/MjHl0gFmHj4uHoK+e4hYooin2L09hNuyf3Ir8y0oR+iRSxe8NHVZSBm+PJCKvq/N//Ol/CHwv/y/vn5Mzf3kkm3+n6+19JHZqntFl7p/CJvswXKHOfaVK9ewy+bNMM6bwWpoLPyZ5e+tZlwC3+vfrz4fq3P9q0x5XUtkQ6V7bxdcizDadS/5ZksK+BvGthGhTg/4t/p/LWnGobSL9+72jtLEzn18Tv6MO7UK1r/o2BEb9Toes2fcTv6JP4KK5T/cxtBK3xFqHRQCGdchUGWa14tzDBYiJo4LocAIY/OlgaHck3WnJQaNHLv4XgyQ9z6iT/uQnU693i+0IsD2ekOxl9BM+aaIyIiUHTs8UvCjRmf+FRD10JzAaD/mbjOe1xlLA7VhqjOSJEBY2lZIxCbflO/fJtpGmun/oG53h0O9qYkQBBh0FCFIeqxwhFBvLW9P8R8jcdAmSGokYA5XHMiBO5evYJpZ4//0hs2KHZ/0KVSEgY8Ut+B58lox3eCmA1ygrboiTwQ8NQ151Qa5JQyC6iB1LbOUDQKmuuhLQKqRDSKn4BIKmGhIDEsg8BiV8AqNfNPbFNQ0Dil3JlOJHl462eumeze0E7TVSPPsDRzJuUK2mfYqdNQJv8cVgGxVigpO+acBjrl+U9zQJH+ufmIx3eggguCcaqwEWrFqLFrwa3veXZIADdSZ3ODMuHMDa7TBhsnuZUoxP/VFbci1ESVE0AcFAWnYPi2BO1b29X759BqkT7C3QC5wstkCFCOGiIYnUxJOJ3Q5r4yntthjR6DSO2OzzrpXypHP8cpuAjpJ9zqaAGqi+fCKPU7WHAu+FnlrZZhV4qZEAu7wxq8XbHTbABhaxaw4gg9pT+hUwmlxYr1UKNvv9GqBZlBDCV0O2DJ9VfEyoRoW+G4mc50QXF5gCU0Wcsogsx3GvzVCXZRY9IeNexfFauaKBbP/KADLkXbtVXT4sVn59FYdgpPIJYgOlp7l8SAEEVi5FBFb9zqKKBgSrKXHKw79rAfHUGBIp3d2ruXiBKJTIdY6KLSkKJMlOwUdOdStPI0gicUkojyCfKBrnVinDUDa39eNAuOrJgrKIGnyO0BuPp2ex4FM+uazxKUzkepRH8W1gmHbNZv9gpRMkXl4RInrOtq1z8ziGLBgQ1xzcUW47idw5VNCCo4p7NoIrfOVTRgKAW2tAqfudQRQOCOtAGqvidQxUNCKrIusg4IH7nUEUDgiqUVQZV/M6higYE1deOyagAxduv6qufrM6F0j42tJ1CxSm6HWZkq7nY2/bo7NQnc//iPOV0SJQQDlQ+IrW1EfOhajCGXHEIMC5EyU0F9Z3t5qsvP8NLKE6cATo0MuAJwBAD1hOq7H6jbW2Lll9U4fZIT28MuT2JVMIW7EEoPh1gxN/bYLEtl8MxCLaiP28T0hmb8MrwoIf3jaW0Cifvqzfrr+6+JakcmSGhj3+NIaEvqC2KJkG45NMbNoqTAxF8EmgM8n7eLwZ5P67jywgbVd7PC2wCrlnsiN/ueT8arKib7wxlW6W7Ooa2reZ1lA0A1/3wgsStcpnCP2+s41pwfmO3NmyOTa8kwkso1NPk1WkTYBKMTKzYDkZ2AGHu+siaVMuoEItwE5O8NTC96KgkEznoUI2gIKYukia8hSFpG/8aw4Ftb7/oBRqDXNgrYpBvV5/dCT4IkIOjo7mJXn2UdKdfPQuXOf+ZOnnpHfJZbyEnwg9AMyq3IJsZLqtIejw4OlbxTNyD4qKwtyaqnqOmLStMyEwNAF999gY11Grffl09tIJHtHGGclt05gsqYTxpaqbtMu+i+fgK2bTySHD5BHtpbViu3gYsnuajaz1xCb26Nvt4x3Dg7gpXJd3jVKpU34aDMs3NISnTWsVSJh+REL+0E4rzyx71ilwWVPGxqwSJLaul48ACsX5ZSm958TkHjCBQ/olW7O0HYRgp3Yki+QbU+QYU9bv1fOBmluzpts/WWwyUq693oqfNKNAnX7TQb8l+cSC2oU+bT2Q78Cg0IPDEmHovGiXjMnaD5lbhEN7r2ZJG4b6jqLVqozw972EmOGGeIe9GqSNTu9BsvURQsJ7q0YtO2ottTI76YtvKDvXJdkGpMQ8w379Zf3Kpdu/X+oOH4dP2qPBAIJygyBatMo/ch+fw7pw3CJ8taycK6BBLliazHSFaUEcUkbgkGMUS6SiDqBZOZMbPDcgUlLWrP9ce/dg+p25mfno3CpHOwNXIAReUx5/5crrE20H/CbJLn7xJV5ULt1zVhMuZDjo76gAbLhi7L6k9yOzx4s4a6T/nYQVuaEUImEcWVxTGM+E/nE6/R6sqAuUSuYHgF2tNLy86j070eHjrbzLr8x/HKtIZD2xaqZkGumi1GQ4OJUoIl9IdQHNyrkkBNWOwR7MKzlZy0qa5lNWJ1xKnNxDJxOnRraYS4JuKYI7gQe2pETFQSRYbDtbS0ExzrO4rFHsBK8OyYyZhrqpbbaE57CI67AM+SpZrTnM6xMWAQJpMY+ukTDdIUSEaSZsWyx1HmxBBfo9WR8FOHNyyHazyomOVd7ID6XGNS1CBMmVJB1xDroBn5/F23dZfEgynHYHSBLJ2E4C6d8STGzE7wpTf0jYE0ele/OChqBrQdvEX4xY/4XMv9Aa+ThZ6s1DBcHpopN06b7PEqRgan4dwsvjmi1vijKo2KzxKlVjcZglu68KjEJNBw7r+YM422tDp44Hx6ejj2oGDJlvYgdoV8SDT7ylDE0s7hhaZ2yDqgGAnghMt2Y2AHCrojHokf2oz69jcJoV6NG+VvWMI3NG3azZSjrjAKbSEZ/jnYE4chAenaZIqvv9hwgXu5nw0AjY2PROpTUyFnV82GSbf5FtNRgHzyrkZnQp3fhczFSmZH9g5FwHlrbPxhyjX5wJO+TB8hg9tcGx4SGjltWdUEjyMTxZ99u+d3j29iKB/NQlUVsI793jj9OXqy2f1+zc5sCyF8nvlkg8bsPitLJ0ZSLIawkogsRcVWV89r1sesxTm75X3UTFKDrugvE3P5AqCg0Em8IiTNnDeGvdw4LBFxofahefId0Ir3dO8gi3XfqNDQL0XOkSwdbYFwYQUq46bJVJK0I0vmuU0otx2G5tfXNgDDUs+ZXuLgWn3zsjAAuejNjBDQorPweZI0I8TuoU5+UloFR/83euIeY/63ZUpbTOfevbR8MrWktLKkKeZewx5b8WUCHXapMTSIY07WHbQ0fCw0p0hzJAqDUCdc1KfPZVQsU4yOd+1L20dIpNmtbkXo8lHOXsJljS3BytRQouCin3BaOC6GNQGrvMJmpkYqkHiiC7O5IZKvmBXdDC25IR19OtrlmDgvB0Xel1okAsnSbPgUPdhrfaBpCKoH3cchWDP2SAgPcEvRo20PahUZX0yay9+rl7/pf7q2+rSQ3yBzK9dPSKnlcjIVwZFiVAXHXYL6TwJR0z7WKJCAYmEEvETxWSDau3L12rbERf8TG6nOA0CeN8srR88o3MKZUiVfplcfmArp9oCCyI+7HpsZBTXYacr4hwnGNfPstc1HFF6ODOUR0RRJT9c8sojvvgd4fsVcdTXzjxGwnDksCYTI8XhUgorW3GXA0AyuOk5D7Ypm9ra+6zx3N/TCnmnhwvDylwF+JBO/boWso33Mp8gSmm3l0ZO0NnZSU5DdiLLP+FJBhmRz10Bj202Mj0oLTs1M7NvDyUimJien5rBW6AgtxcH6H8oPVYDxYw09dDbXOSgR7UsWdMDoePj+czoR6q3ZaCgRJAhC9w2IQuqK8eRPDc0BHNSM9Ozc7v2zyAvqO5tyXd/BCsoVLVtw8ykTKb3+2fC/LscsBEFsOC560sUhmWRTUatrhxymr09KNWsKIogwdRLoOw2DhsirPjChhkEef/+DIlbzQ3PFb3fzNbaks3Y5HPl7Cj7Bf6J1u8v58LwVf5zeWzEHx0VvfKKAWssP8R7I/euSX99GXdn2pIyvd7YLB6lzC9MznhT9Izks+ld+Os0JdL9dHKXsJ2PDsoFV1u+XX3wffXSj1gKpOKi/gIde939qW14NYL/JQKhtXJi48aRjXN3N346ryRmpj5Btjdz7WxoyAh5Q11d5hWvHTsLF9XG6dv6YVKR3oSwB2fReFru0nxWHBokN2EJP3kseLfXeDS1M/6RLiBRC46UPuP9Hv/sRKK99TMM6zfp8QzDbJhx/cWjtTcIKjlgDlvtpEVq8gmxnqLdqku/IVqJ0+ZP7Zucng9Mvd6nU3snFdcKQIt++CbEURRd7d6Jtug0ZJWBrMRWvf8aVZ4w9o1zd/Q0nJX0UHEACZc9XFzLFLek1/ml/AR8KA1J4lDmKsU0CgZLbc6QRK/abQ4GDrXij418APGuFBsGEUKpaBLRai1DWgGbflaj3JLGMVtmEWXrh3+pnnrKf6/4YjYD/r6+S7FVakoBOxw/X0RKbrg7BARECAi9pPboXO3xdevF5USg+WCQHVv8NFhwgKo9/h0llkIDiEt0E2yvUBwbyjneEA8qhSJyox8JrGtPj9WePq3dvxmixKvgvgonePSjj5EEIsC1Mzf3BZVZm5rcqzZugbajvzvR04+Uj/3WlIjC7GAXFC1b9AZV6TguIrNH+ygWqEp8XOaBmGHI9+VEh/oSWkGriTknMq1xwReK6caNC1R71FUZtOCnB/DCNZt3VgetKGdesAmRRS3ObmNiaMQGtjNGWfHv3rMaZu+AV0lAx+OzVcG3RK8Y0RakC+ntwh9bA69WRjvBIA+SCdynOFANfSK8oulKwtDsp3Pze6Fdzc3iwerevXisusv+y74N93oHEnm8P52fxfNSp/IQXsq0ARgbi3ZbM0yUa/bN1drBe1Em9sUxsU8wEewTURsWVWdM6xtox7RwuBqqyAKKHN7qKjBUiZ0sp7ER2nbi+/qx3wwkl9gDQYKhIKi3S2gTlC/o2hKyJECFMyCBBG+fv+WLytAo+OmmkYN1U5oMypwq0X86DyPEqlQKD4yTyggkF335LGKbBUTwVwTxgdg+SjqMvKKRCZf8pTypbhYLRXJwpMkgIWnMnML6JONMYS1siK5PTZk9zipfjWzH3a926SRdVBuvg+jMfn7KBrcHweJkQhfgpnC1bLwYguteugo4rQICvcqRge8dUaSbLoPlQ0UFbcCtUpINbOCESIztxp2fwfPZeXOxwnspDg8LyMg+LSTBkIjoF+RytKtGdAZX+DcngTZzC29uik9ESGzMEmV+TGhu3QjBAneDYHNh00mu+Clf88SHZCOqjwJfjOtz7emBjTN3yap04HScupnyKPDCeGYLo0XL0LER+quigVYoCEWJBWhSYAMrHBTEeYit8osAkM6pCZahKUIgMrI2LsEmJbHTflGJHw7KzMKzLQMcTIoVvhzsCCwr07kdY6jMXp5IqM/Im17VAec1pWn3aRmKI5jLDkSsqnBinCPZitF1NpKtC7AS8abRkQhpns/INFDr331Nku/BFfy5cXglqvXHKc6ZyUUYVr709s19gUJFuveV0EnLgBOhpgWbJUWxhVY51SU88HA2OJFoIj2TrkgpHkLQy4U1xj879RnURyRDCRKGBt85PRkFAzJ4DIzk5M2GYbb2ZwEw4D/Dz5sF/IPUtaxDBZFMpauUqdgAFZRjxd//TCmU7vxUvfcSutFwoTuVpyqdZy4EXX74unZoqfrNvzlssE2m+gqJt886RZ+A7NLcwjSxLeHgF+imUC3ESuqi9yPUolZqT+IesnHtx6ACpW6yH/p05svFqc8jRvu0MdYjJS8nNlqXUlhQLAUZ3idKgSNSVFKQcVFgkciDOzLMbKfDzMYjycWNJNcpkpwbiZb4JeCWzSb1/EZ16Rhe2HBCGvwKim6R/rV3etf8nPFc8MYfFYBHil3LMOBBAHRneOwjgTaIxF0mGJDJL9MWka0n1MF4hDrcRNPBeAyadsMxgoL87o38kgj4QLQQWTcjlUPw0aa30ZNa+IjqkyfMxvmHqJGHOPqW44WqERz5pnZGWmcBxCsGIbGUDU/M5mCjXmxiy45id08X/uh12w8iI3u7AfElpo8HcfUdjofDC4fTHE1X4oNMt6z4WC4LeWPVSpu4RFcrTbqSRLkyWkLcbKUyOsLx78jKWjdDpfSw9O5ZDz5SRJAZavWR4uMbKnkNp2sREpqjGsJdLCtWswWLDBcbF26vPb2ETA0JqEfrR/6ttAWChlrPgSuZBgw+sX5i8Im2BoLY5jEQRFsDQahiMRBEW4Ig74tuCLKtSV5Lxz7nmd0cyEna2/Lc2mx+qmbL24MUwSJLSHiPDu6QvCcw0bvuUL7w3wlyQu51HXjLXV1T6SLLxNzR1Vhji9KxHPl4WlDq13CBVD7pQR2CnBrhYsfpSsaih4YQMBfHopCs09INQ42ZkQR1GjNDZOnxLy6YcfEvxVxZiJFgUTy6WTvwc/Xbl9WVX2vLv6FmKJwILvMW5sZY9hDemU9/IAttIl11Txf+6CdrtFjiQ9nhstDCLBW186/r159XH6yIBU0ekf17p5C9cPf0wr6ZyS95i/zARGKHsvyaMUb4Oe6OHhqqByYXp76Y/FKBRqZbjhdbMQhqMtnC6VBfurO+hExPmpPVUCk4EprZ4aBM7EhtjkoBLaAoRem29cAGQ4WQra1UiJ8lf2QTmgMhcVvhIuPfESx+eKWVV8QSh4BWGCvJp3gwYSEcA5BJfAFuIoVnoHymwvLMnjGsBXmXBfvCwFdUSxKzTdgFSQJ7b8fYBSxCIFZxiMCa6jY3QM6GMLAW4xOYCL2YVgV95yMU0KL4xY/IOp3jBAM9fPfrT1egKxmPaJear3rXLgRdzU9SQsLS1G5Eq+CV5/6ZKUca5lJOC7RoQaWZUNIuLFrj3HBFvKkHBtjJaw+/rr1csblQ9Wiy3PTkZ7NzC4vTuxaCgXiVydnPveLU5OecQY0nwh4htEdtGHhVv/O6eudcffkI7+SPDwvi7FuX6vGz1RvfbHx/UVFJ7eu68TTSYX7sDQ/5PvINStU2Nyilvj9QTlc4ERZh/af7SDrdNJZR1P23t2v3mtnyeD+CtdMXPkyDQ2xoHUkbDAU/m85wtBYSxbU9Pc9/s5xROuXzUowY/U141Wjqjt6CTdaudYGhXCrmxe6wNNke+Nk5Z+WhXN4r5XNFJGiQUPxySQTjRCGTwiZf4AdvLZuQ985h+3G6zXkEA1Q/ziNreZxDymNZp8n3S762QuAMa75k/Olr1K1IbJy5UTt4OjZu24TfWQJLfj5RQS74IWTS9Tl1xUIjX3m6UiyYk0Gt52ioE/IKPHKT5wz/VnBqtUgqiALWA5IN1iAI2cb82oD9tgHJGIWMurKDqJ98UT99qHri8MaFE/p0lyZ8bwL2hOGK7/mCkb6fm+DMlZD1a7WPMvcEWYYFmcUDS4pZPMZDynFQjXPh/yTEjhrn+nUj9MpHX3ikupDew75CGRmRJVR9YO7l5Ngh8+rqWoR9xAQ31qyrbkpiI8+2jIYidKkO0ZXSvKHx5wUoTRIEW3ZCANwx0C24SZjF0ifWCCRKZJhZq2uvTlIYeONiwftNIJQVwVzaoio5B41FunH4KDkBTcDZFqtV/onDtmNGONV84F+h4OxJJKnUq21nklJcY2nLQ85OtOPNse85U+H4LiG38ev5OB5VJvL5is6kYsnP8mFb8qqrz6t3f8CRUn/xNfI2OE8HIy2zowjxNwHlXnJLZjT3seSln5YXSIsJCWPqL753znBkFlD0xET2ewv7oMxMzXPKyVPAv9V++AoPBM0zX2FGweKs+LxDMDuXrkBKrt8/tH70K2t1T9iHP3GXEHLSwnFsjKamULqHu+c0CHW4O0eCVEB4xiv0aYgvCjKHQegneFKu2ODxunmzbP/EfdGaf+3JyIfh+xPOPf/q7saBy6HWZE6u6omrG6cfWumt3oEgaCcG83m8rje1UYKbEGpPDSHbbSL1xZ6pqRmP0ryIEO8tVB2oi2o8BtZh5XbUdrRRZ+/WwA0Jt1nAFlPwzbJF44OQQHaOkSsvng90V9EjFmKZ0Rthhtpd4YitV0Q3HD4Aw5rtXRh0EOazCqrotuoer1hMmxmvZseLn/yW8Wrd48YraM2Uc2XOg0BQrP4Ot0d99dvav49trKJs2WveDn29cjEtC4sktjQvj9hsdiHuUIwyhF1MgQt9hyVlWlCb3UaY3Qoj0eBYsnXBAsrA1FlNmRgyNB0S664X6YGTMCr9YJceWahMIsG1pyetZ8B6ofgs+D55LRxcxIU8dFs4bNRYbVHvhVYxlpIOGQYidoijjxK+CXo5GDvpreQadwhvyMlVHCAhucpvUBFGHeovPTx4eWD9zg2YNrUDmDST+enP9ix6uTkYL+b2Tc16X0zOzypvlvwxeTSScsIHE46agvhJ91o6wZvkRunqTm/0pdYFHUisXEIjLtwteEh/WTrhVMPyaSh45lBtoh7EvzlhlGJekhRi0t/1oU9+ZCS9ZfBPynCCY8lsAWOkRbzDUPHjPxeHChXz5KM4aJ9IhB8U00JxKMsptTTVl4/Xl25qEzsIz2sW5yxu3MLqjpxnfllExhJEyup+lowAj5dghQ/TmyXoYqJ6XqxqNUlvs+ZmYLueh+1rf/NCMU/avunN6SfrjesCo9OgXkvM0t0HW1UcfrUn4edEWaY60Mdea0b3L3rm9hRYdjlkM1y5rqE8C+ETEGFe6GxSc05tabwkUrTnwqgIOLeoNlZfayvI99BDWT2+j/pTIprWgqp99Vvtx8fQAW31rlhNFyKa3m7thyY+u0BR/CgdOTU7N72bakRJHZBtpDPPcOWqnT2sV0j1IdTF5g5G+8Op9XMrJJRNxTMxUU1RMTi9ezfE4W4SjHsmZ5W0fRGadGeHocN1jLUSkrAibFP0eJoMM7tbXKNp8LG722GaGHbbGTABXE6oO83sUWMCGAZHZ6a8ziwOhNnBOg2zY3sGKK2ciu5QAdonhHKLggiZnsoupUY88IvG9e7pIXwydx/zEuroLTGbeH2WT1dkTu8tfho3HB81d4MbTpgVDlcdo6ZAwRKTSnPzNsTpj/46okHYnEDDJkkwdyLICNibXfzZarjUm/OHxqXVNI5Oewly8KrnbQjdPK9CGgSvIC+Mv9adOgnc7OuYykb5LfsWXXFpQq808efD6TJZb8SRD13S3iEoSMkqw1iG5i+aQQFuCen+xFZg+XrFpBoBEMlqzBtogX4A6wy7Q/ugNp2X2lKQZeQSW1osquIsJHwZTkQUYaL67FH1x2NKxmEj8Sm6rmkTbtgVKMzVFKqySdJbPiNT6MrxDeM/0H3zBfI/VBSaSGiHqRQNADxsqS8fDuEFT6x4V5vXVvFBeJUhoRDmPpZJ4AxFQkiS4BMUIVojEXfUO2nhROc+aiS0xnrkP7ay3ujSui/HUM57Owm3T9R585ASE7/HfwUG3ZNBGbU348ko+BK07slohax7MgpxnoxeZL9JkeABJxCRp0djF+BHEYy3rIsOzKJ33L2bVGjXbswi2QS2oU7CierTG+tLb2rL5xFvCTMcUnkgfAV/2kBVG+Opm6gKfjmdEeLVEorri60yhnoOTRQJC9qaYyXTqVyV3SwAnBAH7dtR3RQBYP629wMg+Fv7ypJmgEJexw5wzWgflo+dDbM3Yc5Zzo30SLALt2QHuru78EdEKeGN/1s40yE/OO54dpjTcXPs6KPTkmOJY4cwPZp5E0okJzRc+I4KoFGBifWYcs6TVQ21HJ6GEMdWbu6QCCGGXXzsghAXh0JCJEdIrXatZHmDaGNp+NRkUkeqSLpHdGRoKBB+saGDGXHg1+9C5Ox1yJzO70F2AIJy7eJE+BwzKPDJ208wdfbyFed0JTRixdJHvhgsz4x9A6xoP7Pvtm3btm3btm0bZ9u2bZ1t27bOtm298/++5L3v3tybvCbTdCbTZuU3q+lM27WGwwoT62Jgar9/8+JZEwFQ2xM+B2haHyGUNpXEBO1PmnYyRywkIUc7zQ9Gvr9rsBQJbjfQrDxLUYVilvDi6NwljJPvsKXos5TVarDriwwbUFc069ChIKuANixxLuh0hDVMJH91bPTSkn094xAH1h1OzNSdFdhHUFwmZS3oHsYPPh41PuKCwdD87ac6J3jOQr5DpvELeMn+Eh3Ab2kU73UDvpymb2vLPlBuTg/oyqY5EFlpl1AyAfktGYsgXT8IKYa6/u7XWxAYYwU+lGbigiCp0To2u0LxoCH5SXEKPRSUfUG+4xG/ZbpKMRlQb0Mvt5eB3LOKjO2YS0tIDI9pYuGZIaeOfRBqGQjnvHmZVven7jho6KJawbnGbZjndng9lULSykNBT6H5lPOEj7Mf5z2DUrc3QHHrtz2EaRhVbDGSlRvfOBs0HGEOBlOdEN0eJ1t+6Oe3M/z00BFoVblqPGWgUnc05cIau1d6TjTuvvprKCl2TXC7rdQ28oRFkDHFgCa5jNU/J2m42AmwTKymxC4Fq0P0t7mB7za6xcdy1tMby8rk5+w3Dysl9+mHagwPsMFsK25P1017Ya3zVsZqe66wqaM8Outgi8QQs4ewWJ6oSMa+TD0gl04REkx1uzq6/sF7ksttCOvXUd7HZWjPU4Zt/oyswSJ8FIjCvU5S9z2PfH8CFHZaWd/2vTbD9sW6B3FQ6forlZGp37dq5LIznWIhihEUCAtAmHcCMZcHD3jTxWDXVkQxRYTSOlXNE+6yWEjNR+yX6JodBd6TFIobhPaahE/vKKyERBAbbYFyZClc+3crLB1+sdZbDjcPnKam4/E5pxZRMdpSRBghAxog5nJpQqpW8r5wFan3+rJ4lJxuil4FhaZNxhKoxGweWzYc2BWa9lEBlHWptDueGw80uulV4Ohp0LItSySx8Vl8BR3dAnbimJ69Wqtxk9dj1mo0m7kW7CSvNx5DONj2LZQfeAjp9b9XdUYqYaVgn/KqBPKLTm9oX68MVQ2awgiWd0QXrUXfaHhy8NwG8khMEVpQgW7Sojxdfq8PR8MvkSM1H/e2NztCIAqZV1YR6TBL7Z8oO1yX/nOT/HX4YczQZpswdo1ApZeBL5uD+nGMP7kra8THTllabZavItd/iMVMlD3MBwcT9wt8R24vkrBaeTjimaq+gLUybcW+J+AhRiQVEiK6pdkIw2hcixObPzpEZGxYX6Kz8qijECZV3oZoIiD2fVoEE0UnEFjj4a5DxcWyJQ6HwQMnnFL4EALm12iZGFi6Lxh7CvWDfz89B/tyVtQtd8uuCiiIliSG8cH1Vwj61cyBND9wNpmQ868WTvDHQRgSDrkmDCQcc6x1bFwzIVq7fs/89cU103OVWWahKw0VLKtVy+MuBsi1kd9UQ8FvE+ydKZhQmJFCwgcOGD8oAJl8wA/sjRVXj65UyV3GBPB6jDs+Hk5YgAIoiXIVDWTo3ePbPy3+hvNdoG3yHCz4aaIzhppgFuXL6XMLh0CJjr7HYtWgQbGpd81Kwj5fNCWuXZL01G+z3/llbpOElv5ad0m7XvXPl8k1kVF5wXNptuN8hgfwTXQVgAFiGP0Q2GZhG6nnF00Grnn4p5K2QQQCB8SwkAshAAXs5t+tS898Wf5NVmFa/q+F338aab2x+Wxx5e2ekPBiCry1rbDFTTTYiWasoGdjE5Yj5xaZAGPBtMbzsUGnk/pGNCWkQD3STDIRQ6iaTRwTaKUelCGTeo+S2v0pAWh0COlBdOYLUWtfOaMF1NV6hymLE/ootZr/JPOjM01AYGoM9anof5kkxUKFA+MFeoUyDv1Rmoe5s1b+ahEaozJVPHFMx0BdmMV8+LVPbaluNCYDCudDWmAB3W+EBEPWX4ohU2gL7XNHjSE0TpqFXii/7FMfBuO4MBJPuNEaT+gHe1yCeYa8c3dw6invKY8grgw0bv1KZs/Ql8A8C6Mj0YZBUmg72TdcB/iuQkzPQD67h/6uBOM33wra+8qahopTcVD6dBPcChKrxEiSBnu+PeWsxfwNvvAStDFfqwSY4ckD/TihL0N/jZhvYuZfKeT7iDZ7mUefJjKlOSLemJna9a3dbGY2XdAlYRCpLIHxZ9cFK76zDBlryczD3FxOSHQE653izf41N3eht4ZnHGVC+BkX+Dv1val7dNPWaFZJjpX1YHeL2DEEq0XBuLZxpKhiKmK6sPhvTyJyhUVExnkrnRXYi3wZuTb05ERmzC4Opj9iZKO9lZ8a/k/YPJwOOuuE3aSoEwHTtfZrBUur10c2kjYyJj5a/I9UW+lPy00+KEfdSQ9RO7W8SQ95+6oJbfax36zgMZnsOGtUwd+NJSr6QtnpaJRSxnZbI51b6GNwiFm6lhCzymZ7qgyY2flTyJjet2YiQGw8a2bWHxqDyF1Bj1Tbtba04EkFCjSmkoY2ZqTkoUD1guEcWywnuUO//uBsG7rW5Nc6ZNOdkgA5BGHp5ApYn85bFWS4IuYQNRov+YvTslXGPKu5wAzMXVxl5W2w2u5EzcnqUxeJSYPhTLj0FcTz9vMe14w1Ho3zBNpTpOFushD2+0Ltdy/b23dLv/H2dId6Y+NHOdcCGZVb4SLtk/FlyPkwsj69TaXtdOZKCiN8XuQtKutDpAcbS9mxWGST23M5F10N5Bay63ce3+5y8uy2Qi50heo+MNQ5waxH+vTDp6C1Wp9sftkE9CVcTWcDMFiyUoGr1OHX8pJMlqqWJLzWfw+uZkffa5gVhvtvcfgEiRqTUAS32R1S3vwcRrW3y5fAQNel74uKQs8QA3H16W8wP8nv0EQKjIkGUZOEMdVbAC78JsUXRVspR9OYtk1bxMSAeDW3omaLtKXmU940dKTbHIloMT+p2s1to29nJRl0blpMjoVmSwbNQBsbPdittel99ExvkECWCmjucKlyA3zpAl8WpoacPkRMZRcNQrroVrHFp+IYNkDEEefd7hfNdyQXkVFnR9Xc1PgqdTtEIVIFQChc2UiNhnIxPRhw7U91GjnZtRGfnNoYz7ulyW2rt3fgMdfPkpBZHE9xF1TkioCkLlvV43EzDGkbxC7FGaCw4U+cVRMDfXq7D5naAAaNOHff7Y4cw4UK4/CaFBPejIegkoUXzpuLeYhBoOAhzSnc2NkJGRcXZA/U/UMVTwtFjZ1Cze1V5ffBGQq/3aHV7QLHHSWTFCkN7jfEqIm4I1TOyxPpTn5Rl1Ypbh/ukB2ofNYwcerQwZT8JGX5A0yvGxYHX9bAHkZiiSScrjhWsk7eWb8CRD2UYd5cr/cZxKUXky64L18U2Ecxal5/JUEDFcpMGDpBu+EgKwGJXot2NUrHIjO2yahE0HKAlrcbhkZOPeUQ2nMlgljJ5O9QDVTEaTQ9MLcbraH3yy6LbGkcotgmpSzTFxM3hHMZDkfgllA/lKxkTgIvojusHOxP6qeAps3HEJpUraldJwoQkR99qrQw0Wwr7ZuhqfTVY1uLtBAv9TF0uWJQrZSMqqK0n8VkwRAJPwvC5hEfjVI8hLmwwNXmEWeyojSYeCUziW2QHdRw9SOqltMTT3gYpBT+VGKi+pxQ5KScRVlFhpACINCc0JI4oDJFhYzcGOCN6yFZsVDj+J5DnV6PTGZrZkfb3o+wJKTNWf2XG8nT4NKriLOz93hCCmzyI65knckNuA8W9QLEXdwlhr1puSNNYEDmElm5ZHs5o4cXx3Oq4osNkLw8Te6OBk93Vt8idpS4hrb2yGIbJI9vg8e78ehiLyTPV4NHcd7KBFNTprvNNkhuDR0P34KJhdF0xlci/LZJOrM3Upi5O5dcsLi2vZxIMte4XinIROGzyFIyckRP8dKwuHSjNGLUOXoKeSFQIy8WqWatSVqooTtGwR+XOPiBX3G6c1t1fPXW2vFbKzSYMWjvBkPZ44zzmk6QBgfV/XxL8eMEkMEjRNFdVX/2gjqzmmSAYDWqWXvLeT0bQvaV6tfJ6cMkjJ/PDvulFddIaKTTNUPgmxP4lTXLzolRO5W4vYsXcAJo5dF++ECxhSEl2F9xKpiiGP8SXMLifhOY/i0wdSH8kUxSMvYul4TNPRaI2QX8OmFcpOaMHTe5oZ0sSq/YFvmwlngMl65cu0mxQTgme8I9XMY11oTjubxu8uH0t7Iku2X5cjNQYm6MSj5gu6JWERjFwwvy8oH0snJvmLBCbcQa+UKiBeciGbqFs2iLNOg5estSrhtrt6+VvDfUupa3YwYv8N18lPv9akLNfE9868gYQTw+/1ItT1MDU/2bhnuorrrP9KsobZI5gZqWXmv6uu34oSQZDG+OecPdqaj0iWWn6IKGU6aI2KhYV6/ae58DsH37gDosCN/YliVSptMpi5HsIhHkLp15GaEuNdNeG74jSwJpGaXd0B8SiLg4h7F04060IFWHQ+zOqMtOf16zyLU9LtXNhv7ChvVoGji+fA8/lHobooc8hSodKh5ImOmYLvHML54tnNqpVllhSl6A5iwheBJyOMhj8EoBcxyms+idSEHjNyOiDgO22UIG9bh0k/pflSyKMLL1emqUF1VTzXt6HBuwhUlfxneYrS6JdxxuyooNu2p4Fab6B6mKY8T7vyHSFF+VKokNN3V0NhVAoWHsOmkbXDdrBHva2FpAfjiyRp8+F+x6qKAA8GytSpFoMDOcU+HRfQ0vymhUJ+ilFiirRCZUWnOOGkilcLP0Ejc8vXQsSK1WtKqYXeJbWtfu6RShaVspOOIujQrE02LI4wS3eXcQkLjf7xkLXgHzRajHTbCF+2qY+DIup5bKcg4TQ0tnLKHB58eRpSt0k+75MaCZvyNMF8UQfvoWin+5Iu/yiVafai8tdG6AXkvdaEVL35wvRkHlIJ9bg+00e/bavuRPGyBhj2sgLQ0aY6ZAiM5IGEvWm4flh4gRxbJ1KiwVlLdQR0/8qHEaOf5MOGYCXd6daS5rq+m4rRQ+L83YcT1V4LI1EnNbNwRFpcu5aDRl20UXH2mBMnkBHuDanrnWAFk8WmH87mjB2espGHWktSGUUC9geZodQNET52amZbhqtOKXgWYcFK8TYEGPC5unj3VO5Kfy9nHtuJVBQE+pGrVOkys0QpdVzx9yDVqnr5Q/mbLaGFrk5KJme3CZGTX8g9R3J3+SWdj2NcgZPNyQzeXNgR4+/WVDlyE0w7UNeJ42oSmpSOxE/Tgphh6FhWp0SAdqBtrvBmQmrTbJdhQ4lnkRnx0JE8teAXbTz9VUjWQk2L4tgWUU7skqYCninlXd3YHbku2AGzhrv1JLr5p2ozkrEh8Im2T81V7ZMG6mqDopZFOg06Tr16CIKJSkfpwbCJpstUGP5f5Lr8tZwraM229q0l6jMDm73ox/Mz6PIdkMuWi+xTZ/YQF39KCR0gl1JpC9G9a74EuaxJ0evVWgpqRnWbFN3lfa1EwGIIH4qSZz8nk8hq3dZjooWt6UujZD4zOnuFHWjhJF9BNQaZmMOVtZMeBapQX0PlM1uceD+AdcaUKKPTNVcYVAfThAYEfzWSMiNW4q/xBf8rYcw5ZAAZxTSou5P3O52oyE0M5aGT+qRzYgJFb7kLx/LMWl2eww64EVbWi7eO+W1S05tvX0kRWo0thRBBKu0NvGACFvXQhCt5McPXIsa7xzbRjBrPeQfxP9yayAMqcCLqeZQls0hpNC9adUUsko1sMxtvIqh5UrX4PD2uWWcB0n+OqaD8tP6rbwHJ6pIlrZ0+EwaX4DmWs0EuFav4IJhFm8NFzDNLB+7IKKz6lnPWWAkZp+2VcKh6YZBS721soRKbkmpAa3Q3/sWotJqqmXUuWxlxizBDMop+4nTCc5tDCTjyn1T7nXFOYcpGuXfP+RFPjs7kqKHeZSIH13OWlcs3iCJJ6l3W6EiZ1C9uw0S+KwYAtg4E7GZVqhRMCNJbietcAeLvb8cTeMXaGU3SfFmRPb0h4QRggX1UwFrkztXlAss4HYoa+lS1Cl9nHUG4ue5WS6E40F7UOJoSfLLCyaY1ZIXBAjWcEdTEQtPZe8j+WZ49TiMYSTST4JjFTqeCuxXZ5pIwK3kXqiJC9W0QNJUqRZEWkGy8EHsCQZNwdUMk4SGPWDdFQo0vu4SazkBDQlmMVsff0coq49ew564+kYNKRy3HzIU1f8COzAmX3i4q3iLdrcaeEM5FtTqt0C3dirS1LCQdGgTZKC9/bn5RA/YVmwQOVxA0ONSZc/EVHNH1wUUHUUjmZYVtZCN5h1m2DRJxAoZ1K0kaQvRnSiIMJm2k6YbBeStRgKlPJIV8ESYZ1YIHL7QQ9wdZoYdEYWl/duVyaZQeMXxupYeW47bJ8Vv6joOu+/0VnZTlBq26FrElq/decjzijSSUSLBbWXSDC50jYbaUfxsTGdYaSjYucqSGhf+XXJZHWFWzAYPaLw69itSk0nLxqEpXgafxLytOPHAr3/Rs4EgW0SnOyFeb3zmfVLDbDnZUx1DvJ8PrITEBss6WZJwrNto66WtKJO42TQ5CZa3toCgNtRCw1KS0jys0GctITmIx/G+MnmUYHK5yMoiZnLWtYfZOb7DFqUzaO0ZF4duNLpI7Ot4uCKPScG1/Ss+Sl9b/gkwYN4wxzPdCLxFpGyjvR6It3jyqfWDPSrjmj5rnIagoMu9zEW3zxu0s1NjHSfE+9gZXLu5CPZig5MRbsBZJwBVcFqybFfQu2ripFiF2YM3GqpYeukatxusZghSs1IJ2+5rfe6BUK5A2CVg9klAHO0WrGP0WIGVpxIy4/Rts4kVHW/DDHFzCR8X7GMWDmNwT0JU3DVVR5okE6MF5iJlsSv1FItB4HM97Kk/31EraLPi2uuEmy0tRq6hDn9aZZNyYdKmnyxXK49FZxc/v3JDNW+7M+r1v1NHa5MAzILtpBiFPhjgacrSWIABbNdkwJvnJC+/7geIHNRtruymTOfp6zWaMz9cQSlxxmXyPerrY9ZRqrb5c/H+UJBDkjoYvQ35Hvu6W4lD/xIHdJvwrreqAHRJwogk1wJUqcDvlHRnu2oWURoIbXJzpequp4y9rd//fthKkvpHkpAoLRiIZ2BBgsIof6cJJ+HCmZWAkaX27PjfTrpnL7MkL9eNIdzBQqKQ4b0+KRHIChD/iTB1BKPq2xVq8ki0B3qhq0kW2YgoRYm9p3YSLYa31tgpOWhd1V9VnW2EOgYF46VOY6JEdqbB4EhR2NLWKyF1/mBCFYWaX3Gc9WFNOdol2TAwFTn93AW0clAvDpmsfnumdEGfmk2Kqp/s0YyYE1MxKnjjIjXbwaYgCBAGnMLo4MXbWx4PTsenv6KQGQTrxnpzU+JCCYle99r1FJQfKez6LL9fnfskdMRg47WYH4GJTpkILkdgYotOL7M5jL9mumM2dKoYZCCY4tp+rG5dcB3iUW4cYaXhwW4jP6pgHNFyKCQCvyPmqDi/BxFVT0R1PvxjPZ1yrp1S+ZHW8wh4Fq6zwZVEKz4y7l0s2F580dYorJM2/Xcchm78mZlYQzZBvOmuJAHU+bTO0vcTFbUDWfnTr6yZlrhJuiohw/ZsOMxoiAZGriYQ9FdJbIyJUPGTRTv1MJWlRCLrGSMgQ1lQUg6DlMOkmQUdLOU5RneHQ7f9vd7za9v2Z0a1pPQzPtC0n3QG/sQZKGUzASp9w8E5QgJCAqPc0OTJdkZjiEr/m14/4NfBRUZ/ZahYdGe2kTMHUYQ9cM922CYLszkTOOAOFzL9qnZA2i4t+XImk9PzrxJVa89HSOF1Dkc4MoLBQcYcdNKlm5FeLJ4eLlafANhc6ifhfguHqXQmJHJNl4EOw2ihSTi7FLa98JhnH8oY4ZkKhd+DelxIC538vehFMNH1FaaRYKTdxzhvrxBKaXeo1rgH0zUJRdWPrtADnhdnT1IWWEnBhCS/o7Ba971xMeuN1KeV43Lrsr1CbTReTa+2krZyLlYLkqjtDyOCG95eAm6mQRno8P7BWzl3wQfuqpHU9OtV1Pr0+K3hyBul9d+Bh9pHZdWRS3Or9pEeXActrTQ+vI+bY0dLtpIntT+SC9c0nsoDkYg/RMEYHgv8gmqejztv9/b8AP7rYtDpQK2gIqSjfkZBdkxHQ2bdv+tP3DzvafPlJIQ2HtLuFSLgPtZJYrvBjZ3ewMwpL1pMeMgv09kgoy0nk40nEXQ7xzPNsUIMu4Ptz7oX18xVkmvDpQZu1OLp9uiOeGxiCBWm0yfMpxf+aLOptddEBAnFzAuYtGwHB9lRrc5RUm+BgcZVeJ23IL6dRvbP7pw/7UkKcHqc5JDK2x6knpTO5OqikPiRLVZ3W7QoLpi+/7tzk5HQLq5/D55w0aXjZFcovtwVL0hr6FBq1U8i5qETHLg3V4IhJWTI1TqI2dXbon8UbsrQkFiHwg1vUdtZ+gICV8h13b622fWTF80U8QaA2KljrJ5Rls5wf57Gi7l5pw2/sl6Vh6MqdZxbxPGMd4u3gjkYva1qK31U/erylxoWeSStYhmDYNuorhhBrQ/OW51tL8E1b7l+ZNj21XW5TXMd9cf+afL0LKJEmS3hV9F/Xo5NreuVgeR4dK3HRmjP143ng1uZ5vjp97tDPbRfuLSAiy6RaEz4OSdXwU7YsDCNb2XuqWXwiMZ2SINialFXV+vgr8DkhEpU8Nj0eBZNkCb4Lcn8oBdLYNcnIxe+7Y4JizEjMPUsb38rPOUSn6UP/Sqig5gvQBdf5jDnZvvE90jV+JJKZ2UhwhFOHDM0uE3TCksZ7Q/5yikQFH9H9KKEnb1KvK4ZTrdoyuHoHt5BmXFmYnlh5DT05R3QsON+sV5Hh/OkPtwvwJ3cSmHYT/5Z+iDMFAMnCOo5v4dXMkCzhaXRnMVSuW3SQe3ap7406swcV0YWg437FZWhwyfbag43PqEFvs+oldpp5dcUcDe50NI0oe4PvKfHmy+QGDETa8OQ4Wqbw+YlY4Wdftzc7v+/HCdfuF1nO4VtkRoQaBAPpcnNCizOl7eer/XBCDM+oVgy5lBA56QuB8QFalw227fCXVoMORZUAz0KRxIWvFoBPY0aXQrcDilkdcS0yVDuF2IB7j+DT2twt5qHWWldmASXCL+vKa4BQ6A4lniiD/3hXBmR6UtVcbGT2pPY7pwsfW8XOrePjnL6ntXQnCOsSHvhC6iO5B9H16dRZC+lqZu7n8fJfqw50lcPdkzbF8ET3QlLKlvHw6gG3jo6YZuOY2examNDnqKlved61QQLMuDohtYIy9LxLfL7wAUd3N3ty7nt3a3c8/7Mq00szgrRyKKUWjxMWsHcgLgJFyPsQd3Y2KMxq7NMwdqMULw4AW7/VKPb6Rp6RQ8AHQEqksRdhKn5MF72n2CflzaRGrZ2jO2+bWa/DYx48O9gOsZIbmtuBpTefKqgh1YuTZxVO74fBRqGTR3AzrysjavA1ZiX+rkse3lsSUwqJcuNwdFIgH6+H2EyqYft0mvBRyYt+rIkLr+bg3vZ4Xig/ZlJS6+xKJ1PTncT6PjXhWVXjRve4ffIfpMAK5oxZtWBQhohdueedV0MEDU+/aYt5ykiGKtDSoamxxOdqnIhUdlmp2mCJtvc/fjr4JY6RiEKu+rM/p61T2QkK3Rt/xHpFYSEx7LxYvg6Gx4Xw0cfBjE+t93dYa7cDHwxal7/u3VRvoBo6oVTy9qGMne+d2Yju9nnBw/YuNS9fVKNwOoJCtIXBCtL+xcxTuinIjzoeeoGh7nsz4BbDKkc1dZE9mGmCxc/Eud1V5tLXFL3A9BlvQlTajiVDQqxZxdOoQpl0uISGni6m/pnIho9GaR7NV8vh1+D9a4v1KJYAbgXEkk3n5/BQwKeY9esWGYT5UTcBs4tLWPcGwZqc3Mt17PvlBdgXyrsGPZBYajyh3HMOt/ST4GLmb7Q9fKydt95gGDN0w5uJ6fUoEPA/g0PIXFJKJ79/+ykt3fRYXGFuT1ave7r190C7xHdIIQk7dcRMy3nowrsDr3KlVEM6j5c8l40GWuy/6bazVNoe2w2Im51avS1e4ighBw/BvmCYwRlq2KX7zM82POkYqbk3lw8xnOw5M/B4MidqawlpyNku8RZsmvV6vzt42T01flpTkBwruZPHS+THg8w5fCKhGKw7uAe7YxLn8wuMRE9/fpysh+SkuaupW+flgL1O4qvm4YkWY38QzsJ1hzfUXyAuZFXAWfhiY/MclHOP6EKlJtJ5vajh5XaKqdrY6fhGdZmn+VXmfd2hzf4xEbbCsS2sZ8XsI8BUtwFzS3qe1bpurjTgx19H5ZiYJlg60Ol+rXnXqHMJb1AhjMd8xkt6pVM+dripDCP1fPGbY3mG0IIXZQYvFHZwrFQXAFBUaA4FpCvYyjmReIyvP6tT+I7Rn9MOpueSTxe/UTKwkaaJBwRC9gGRnsexyF4oMbgcqcCXy3kYtzczqN7KZcMMNoEIPN3Zy+uSFCISGqxsS6hWUWiZjt8GsqKkzEnmxmvvV43+vdrgKUfoXGtlqTK54Q6IjhJPJqEyJdYrNclAOdv7+go5wBMah17A+Z7YviMDR0swJQ0ryOZIWdeJeZ2Gz9Fhj/Vl1ZA8VcUmEU1MTJcYTYoOJY9Yeg25kcJbBjk/vR4Y01JDYn040Wh9L8CAXOL5jH3lBvXrrJFvo1/V5knu6fPdFVgZvJz6WFMBHJ2qzS66f882Tu+xykQEVo30dWNqRIFkNV4dzBEDL3bHm16sg4aBHDvQ6GQ6gh0+gkeNWW5dBbw8uv9uFHCcN+gAHOJ/Ugr+F0UWdXZtnGE3B1KFG+ZoBQTIZpfgnewzMHxjdxWs9EWP3eQo4tLc/eww3BGxGIbLU88oa+/EG/uvup4R/Ykfxi0FaHp1eB21uGA32GGJo20FTf8wgWGJMt8ugqmQlHuNaE6Lrzd9ENypUJaxJrJhYPo5Qu6Ri1DM3lESvwD897IOMsCTh6ymIZngxvUwCpnaO33Sbzqm13ihEusr7pj+poKAIgxrTHt/NydVZR7wnFimsBg4b5BgLXeQr6HWZPkyPmKDAsqfGmgLdjIOFp9yyN89FyE+dgNCdYHfnU+cJW+1XeNhvnCLEG/LQ8qfsETn+5G2SQD05duN/QZKLB6dupbAg+UNC8mUiCgyFnJ2P/r08dbm+s3ErvLSLcrRxy/clJYYcvUuP6BnLKdb/an0/FKQbqE4lnEeytj6rsmMa+gtvwJMjaesjtSt+qkaxyPtLdw1i15kcdB6j1rSfBK+H9DhEUmMnSULXr9qz1R+/XQ+hZLCJ5Pn4Fi+JuZb9q0IwTCPn/zo5nnHqlKAWz7J+QZdGFho7y//kB/K9pbOd1mFp/QQIAvOYAAMD/O42tu72TtZG9vfW/cpzr/shji6P9fBV/4LNpu0xI7rXAgsn0LwddpRr1LLntVXZOaF0y7jTuuLqnAauo/vklaTlImU1XTtLfno10lLUATcsirvK+mq+j1fWNb+e2ikC/t92vSF3niTbw/D6dtf7i+XA83dXG/HVDewh6Xieh5iGJk++LRy9LyEhr6uFoFtCTGO32uJBc6GQUhkyCCDsXJVGwC/317f71kMjDTSvZhGJGQAXsIqcK7QtTVOxMMUuJVxEg8imtlviQHdk7wRytFI+YpugEUeEZeOfdvS2TeyC6cThHnnQb36jJFzOg5EUXJ7JsQkQcqOz4kIKjrxD727Q0JjLWc6bIctZH8K5YFOzs6JOvVEoo/L2pK4BMFlNBp4Bh5Oguhw6ChdQhEmv8lmoCZi7ntYolbkcHYi6ZRx0j+wD007p+8aIsY65Bg8zkUzRtliTuOIV99aluiYferPiNkq/oGMzCX74euompzjfgNSM7MvAW/BMwB195cPA38dSkR5lIUYpwIgVUV2HpLa2rty/fltTBieEWGb6dAX4c/9ggZt5MdeteFbj+t/2JI2zLLoDWsHvuATNmiCMnnc2Wpu2+vtr393vZz+fn6Te9vp/uYGEVX9RM0lPvztvdU9yPV4sX7EOlYSBp4PLVlJoL5j1DZmBoAJoKSVQ2grgmiXGKqLmutzP0tte+sunO544xA79oQIaZQiq6opg61EUbFVAFqOCUt5KiXh8slDMV+zSlxGoKCzmJi+lqQd/2RHJlrNQpikXaxhqbvv5muC1fXW9ZXkXFgtKPp9WQw8qSBrRGS6NDVl3TZENtbzo9dNPsLqbxmtuBfnIMKdGV/6uNnNLuspT3Ro7rw0OneVKyPlrLpvwnCAsfEJZ3Yo7uleF4AVXwyD/USnW10aH23p8bI2k8WfppJEltl+IeeSQO34yu/dzMSqIfH/SrgGTg7vp9f6fSzVa201d5U2f5+dv3d5usLtznfKvoxnqJFxbV8rYCpT9wic3NuIq6Ltjk5lEZtZYjPLCIzp/bj5KJFm850nqbljr9c9+T91Q1HwVN3zBSS/3Rh27n1PKtDard366/lau3vqDawjsuCSoM2EtQe7m31ul7KayGE32tc/kqPo2l7T/dqeVCNp6NtZFy5otItZEWx9InNNdp1Ox4GcdnFyEr2a4OsRV3AbDDaX1xL3ZI2K5Jast6gOfeHWyhjZDhzSi/hskanLUPdgOkB1q1fRrM3CUrKbS6l7worlNl0sp1qa+M5Cf9AjT8Sn2bgsAheLbWkVLT8NNWU+H8PcykVdvvUlo7zaQL97Hqvqdzi5u1/Sz0E1o7zk55D9CM8R09N1trB9OkU2J0tZFqmm+GSpwONE0PtL3pdv2rtnfbyPvxDkfkQQ6Crq3wEFPVo2LXdP0rtts1pU95vtVZ4eTj++1+b74H37W5j2f58VnF7hl8xKnL9T2rg0doJemNCtKyW3ysk6T7GefUxupsG7D23Xfu3jdJMnwavMYE9Nv/eQzedu+eBmjaBUIIWgav+snS9GV4t2vD4F07LTOomVlOyNS7vEgyhKD+HFnSiZPsg+qtfYCtuQdpWCdfZIc44BYNsD3g6tWrTMwVD0emtxZiuRkinpeOpZSrQGy2gIXMK8p2Nbyd7ZE3Kd4DWZQ+pKmesSXG2emB5fhoFLOJaS7YnOj/GVcxef2CTzyJF57ddMRIY5ZoHTiFB8nuZ5/QZCSgSos3WV4wYhrijG1KrkRv4+MmhUM6I0i4jn5cb9RGOlsr+CcTZl60Pmfu0R+SYG/sY4Y/ODnmyE8aWgta+eItWUihS0toUrKmyPsU5T8R0c7e4Ese8QBMTVdAHdeYCokiE/DOrWQ5TbANyDQEp8cpHRIkQiAEv/X3/Fp2kgTXYdKm40/9GSRgYxSQnYPm+o9um6Za6aDI5EhyKMSMk5HHP5Iu04nnLdI7slNKeFAvW/wh4NqsWC5VjkIk93isJ83MzZgIOooo6dHoGk75cnJyv1ywmmutFGaJOxIQkRqWPQlQ1XYNnqanq+yJ87/K8OTacGcNSqpD1SaMLkcP1A3a++zWy84eXo0ZMXoMax6CroUYJ8gSEzy64eYcXm0eh6r0QBFkuK1PiBwQtcZEMfDBj8L3j4Lg6JHxg5wvrU5eiRn0DLroyu/eIZJ/Dluj6htdR7Rspe3k0yUEwEgsfkS3s5Gt+YvzBXQOBuzksmS6O5xfTn74yoRN5PNl4OC9ZxChA7toxzaturtqPDUf6xvSyY8kSdZNBoSZXEc8yeIHTHHMFHhlBNCNOHDIkPCKl3BMvQSH8kOJwLzQ46GRFNF/yUeXhRXDSMFG5U3f3RNZlhbrifsQSaqA4xTvp0vb99LdV+EWFxSl792DAp4Fw6WJnhN9MyQfmPiMKE4MQgEh9iEDkVeqKCnxquCUkK7zJXgwSMpYMcVKRkqFtosOq0lJVgiAQlyQH1iwqJh7BW1xxmmkUePpUFlfvCYo2mg30Nx9z4RvDk9csdY0R/hT7eoTI9WAcUf0yRGl1txir0sOzY1+fGgANpClurvBu18vL/eEObOVlpZK8Kg5dPSdWfUfeKCho0s24x9bi4fPqp5Ya9i9R4m47YmzVeF71n9+Grzd9S+Xgau/dEqsft5KGh6deAN0EZfL+njMCzqi/wCG2Y3MlSKzXUIb5R5n+IlUAk6+1Wfvek2+HV1leVSKLgEaUMeTbUMNDc2BE3R4BTBzFbpyD3tp4wjJ25znWmyrogi4rFNmlHJeATmf+zljASBswxe6Bh96HaMIKSAEeV0gJFu+13xYripzOAxkLkEu1u4u2vEDTt6YTdobQTQRqvOrVdj6FOmGr0V0MnY16bW7IkdXVMVUOFIAIIYhHAYQiF+Ack59jtxvJLZ2SC7B9rXZK+3ikVel4vP2IVJfGULGuzzku9TfywPMbQPY4VZnfxIHoWTDODBtXZswYCbzSiGpCn1ZyknIjyV/s2Vj5vsK5q3iF2co8GspGEdadSk7M/EL+PNhnOI+uoF94eoq6jcXTaI/usHAubm7ggzMzwjE0fOgQIr05leEdhFQ+UJzjV4C5CgvC+EPUpzhTDhHks+WmUomNFaS0x5hUmYdLf5ShGLawdMfJyw+Bh25eXpiErMcqnB+tRHlWrJ3ulisE6tSj6M3m4ZeDlGXBvW9q/ejXl5wC4HUy0ZEIHR0SYx3sLBh4ZSSwI4iUVZWVDJyc2GYSlxsuuP4cGS6LyuiSmcGnTCYEv569wf2NNNLNC8jtWR79P+vThtSVCQe/F9vbS8ZAAD2306bs4unjanzPy7btu6V/ZYE5k/s0I+BLSg+QsQL6/q0qXJmcaoc15wkLRJS/sT6E9nKVe2Ljb0kHCGqV8lWAVEOFEpsEse1ygR4ZjCwo+rNxjfzNsvbUG8f80Gapxmvn2RjKzmLkrE9z8Pn8cvnsafZSNPz+9HXvEK75VqsZUxnyoZTSyHGQe4y+2jn9sRLnbX0VeSf3++/6+BrGuZr/jrBR/cjq72t17/BhQ82cg1/Q6kwunWk8K7mVFdULm4yi3U02chGM36aGqwTb4cqe6u7krUWvOAq/Z1RF8vnkVwL047DVYa2S5NK4xJtu5lyqV4rFoWdx7GcLNvAWuqimE8reru42q09zCDlH27k5ZhwxKpxU7m2nCt9umGVKtYMDN5iIIa2oi0xWWSGZcrrGvjy4htjrsm5rLid21LMnxJ33/de+HzVqih189pq+AZbCj0lOu/PJdLL2BPWh6/i0q+XWfbytC8tpDfo3X+42ZMjsdIHnlZOLp6gvl6GhW8AsiI+IbVjPuc/CJB/jfBA7J47udb6XgLXPk+mJWGvZ9fxA6U2oi/hvVXtzqz1kgco+t7YVcNXMzo7dcPqkeXZVHPfULA/EbokYd0pzGJptf4J2uiffExq4GPqotbj9btZXkR/rOTddstP8gDFlr3HvCL6TiFGBpHmU+HF7iFdZdtlGisJzdiinNXKQUoROLl8279rmpX7djk5nIQ/bQFS8vwG2lCq4msrY9LmciXmiJsLYwjM6WDSk6gufGj1xyLG9nYv055vpvpcZPnTpJKk6qTqtSrBuAYWbKu1XAhzP+XZvWOfs9oj2hr74Jm1NBWaIUam3VJtOCLjtlMp5seUMXXKU+tZ05U1qlm0dCRJZk6bSYh22QGiytYc1tohNKargv7LOnMX9le/mB+XoA7Y1/XEuZtrQQ5PSSjWV5uEFPJnGepKhzKsHpPbXUhYf0Bvq0YbKcaFjSCZhgW9BEvrwkSvaU8nGpWPYlFkYujazOXtKn3eNrlvDTr/VFERLzjY8bEDxswolks53F8sB7fmWC8bwMgj/X2+DICAnxhljCW3qSjPUuR/e62uwFu5ZpY3ojpUF6yTI4dt03LlwgKh4UIgdnJ/40857q6xG/T8FioDoQLKRtWJrpHz7dwoxBrfRYOMyr12bkad0HOUZbrSq6RbzcyRK9vWsVVTz6rhujriBLrN0aixQ5O6XFFjDJpvrqmRKyPQdoX1i2xwLRH9W7e0OKludmhF096uWjm21tq53a8U7PZbEkw1YIebfXIo6eqRKha3Lti1cU+L1Xh80NbvWjZzU7sGKE5rV84/s/d9WlUt2y1zPZnR3iDsbdKXZ9RItduJPUs7MjfqR2Y9yE30ZKpJuf2LSfhS2urKdJ552O7SavwXF32Z9sesAyXD3y6sM2YHo7f43xKTXhR2dBaQAOymkg7Mdfrh6bFvzm0ZdVIDXJPRxg8HdP27G5lVrHqwfd/WBj4WMLpqnrXja7y3Ky3kRjjDdrqtlx2Nm6z3WtaVcIdyMNKg3WKSre9w7q/tyE5w9/PgTcT3pZbPrFyq9rE63ietyEAhiW4UAzAK5bonLGUtbZJ85hACbvWK1/jd2Uo5/26zJjm/sVcS1aJ5JEqpGDSB36G20aljlVoWAeU3YGpiYrvZsQO1mDP3Ep3ObIhijn6cMwc8VVf5uDoBd+tG7gRNHQgpY8dCKgRF0IoRos0J27yTG2IqRNrYioHRtiKkcpsjPayhX+oFeL7yhVCgkMQtMs05FaIgtLK0SS01lLpKNuKLBs5A3RmeI36Ul5Q6/vL2zO6eSs5f/QDRtF4jDh4xMEB+DBDgGA7Bhsa+/gHPZf0zgo3uETaBxOEO7sP8j2DIO+MjHXws7qPExjDchTCbrN4m/KrwcrBZYOdf/Totsh0HNDV6onkyYeBYa2Ur3cwBfTNsZwAROfqQDvVxO820q6ftLuQkljsVBQvT1uhAVDACizmk4BUu3EehBC2S7hZ6EOXlTQPJzKVNXt8/Oy7NxmtY2yOT71DtDRMzUKc6EIyIdRxdY5EYoCIaY4aAiCsWluWR++nQ5pwgNEOWsIIhwmCIcokEqRTAa6He8y4KxIh/jCTR1ZCG4g33OZsYnFboxjuJ1EiDIHh1IRAHAmloRgSTOYACgoHVCGMa8kHJIauPq8UcLAGgmFCBQcmPAoU0c4FVqZQpEpI+B8uJzEscVcEPAoE9VeIdkBQsdeim1E2efm+JM0XTYCg2ErdntrOvd2a9zS79Cv9qt8I9YhfKLaZQjCTG1FRKpgjts8PSVCysVgQeSnSKUBxoKKZoGG2viFHxxSk6BINSKhjCO0lsrqaQLE3WTyNR1wNIvj/GK5ZOpCU9QipKZn/JlwDRp45PkY5W2tkK5qWzv+6nOJrmXTv4qxXSSGh/LYhnP5blzSDl6Qz//LurHfyfPgZxwEZvDx7ACNKRSN46G1vAhEq/40V7ccr/bL7vyPq5+Pc2OZV+fEx871Wzv0OuLX0BG37tEKW1HYIxptJ5FpC2Ybl/+M02Trvn2zWuBtjwVZhseccDIq3BZdIENZ/VmUqCJgRyfeGFwyQLMCXkJEIMZVMGTpFykyL+4lQGslRykyJCQBeBBAkmoHEGrrOgKcAGCFrrB+cOK+naA+8XEMJ3GhyiKHukk+2zTKAJki3YJO4f2xxBE6CZvXIMKLJLky/LhiBqqOGRk/x+bKNyQAbd0xqoBbFwP4UIgzkv5Io5k2qPpioEGSfniq1lBqL71cWjg45OP2EANIT12CTqQfqDEzWmDbKnYwLS90qAyn0w0dqGfS6ddS/a7FwafWXPwP/VDM8kTkBsN0wSshwyrMT1puOxEGsUNv31h/f+l7gE1T2A3MZqHENRS/K95MwvTEjh7NESBDBAxEeGEI5QUz92Jolul8ADNxN1acursXLCZrysP4iSQdBnTd97qHDrYwhyTMehw7VDjk0nEBAx2AdDpZWgApGT24oSkMYrQQClDmpIAgZUWY2JXkK5MEQBD+ykHmfoZVwglMMVOuIciwDnn1XH8X5IQGKO1QXb6wIGSCRnnUAnKw+/9N8iauRrsT9ujyRvLirm7Q0LA0EWdJmCGd/cDevH0beQE8xyQUYIZBUErrsh4D3/YMCbEzoEGiy6czgdYMzicgpCT73tfqOGPUHcbgmaFiAfDozeY2hKiJuD/EZxERrqTXcRC5AWND+0WxJVNAfxuHbJJQW6I44XFZKZrTXvz8I0NKG8rvb4LWhGEnQyqm+VCU4jmCo5grFoPCHzYLRKzk7MX7lYItiz4nx+iTfobefJ0o3563nqXDLTy+w6BlMNe2F+FMZsCDphTmV9NGwruqNvLHGGZQGSE2Q40dBW00OZ2NAsWvRFgtCJsf32bObshtMba9YdKRuQXmcgzhMdE2NBQiQhmphxo+h3dBr333GYQw5HQDYOH30U39UiaSZwTIduc6vPMXY4a05WKQr8FIY4jE9oMBjI+Jj/QAvzrNoTN/l4jrgbrY8F6pU/YKyTEKdqsw2BfzvQt2OSPs9NYRiXz9gCpVIhheDArXvQJyYNjdEvxZfkg7isjMOM+rNQHJcmuHRF4bCjHYIU3Eas9X9vwSLmcwm+rCfOF7q90QJNvpkbCN03/gIAYuG/QBKP+SRy7Uh1DBPpp894LcxKOAdgITlMNBqpz5FdOkFX6uAe0mVql3W811QhP0y9IUqMbfLzaw3Ri5unTqPZK96yIxehc7Nluv0c401BOXguFelQV8SVlGBIFTMbYiyonmqOZp78keb+9cpMqzT6WjQ0n/t710n6ygES3+H+oi3w/qztcN/77pTy9ZP5dtB+nvrQ9GJ74nI86UD8hiifW9kZgp77Xsxfwba4r3vzr8OR9XWeRo7/zUYBhouHWmQfm0fv9nkj3kTODw8VPzV8OYeuOYPu8TR6YnB42jQHgeldz/RYE/1gagaxCV/FD1edIDMstYD+NZ32uFfAZBLOTC28i4VO+ZDHTf6Sh/91bGgQzpGXUlBHkEXP/PHn4WAQnRweTt/39frOx/N0uZzHt23Z563I/+vq8PojUPDeB88MIVeI6nb17qB3hs/j5/TFPY7v3VshlocRPOVBTwO/i7UffWR+1F2e701YIYjvBgUVccH/81QZwN3lAtE+hk8mKcUW8mk/Q3lgSTDPdhxqOUTvATo0GP69XFJF4pStF2Fs/CKbpNaILcTvAbq/xI9QD3+nU+Ikx/Xz8/tSrhzOAqgVGL4I2RM6cssXS2sfFVA+DBmV83OyahDcEFEP2fXdLsvTQDxvh+v9YXC9e3f6eovv/bWqnqYO2sMjsy+b/E1C892GV8xXd60s7tvz5XQlLZDzPZ9bRaS8Yn3QfP/JZ+lWr4h3t3kdPfwvM1QOvezgdIFOn8cDF3WrVQ7dwvBxfnbHbxc8Yh6Hn+1zP3/nnce8vhBeXMAGye3Y/Q5rKilZHbYKxcMjtRdh5sXa5bd3JhdkpbZQtc+6jGAlNZddr7/iacgaMhBpSlodxicclbCJYEWTiqo2rdOBdE73twGLU/AbEP4HMZ7agBSGRwBYPVAhr6G63spjmi0kM8Y0VHVQvDlMof1foiO20AnUeiSxFbC69VKFpn+rDXTKgexE/KNIjb5zTVxOlppSj5UP2NlBqVIbgHobkWYfAFYLVGBmrGm4fJtpC8WKPQlVFaZup1y+paGmwdoHfy4oW+AEWh0w5KOWT6UT+P/GLQSRi/3XuG2kKnY01NVYeu20BU7dhp0DUPOlTeYm/SD5vbN6/qK59KAn2BcmrS0NfPO6HoHL6TLiKD+v7/0gZsCxrCwfDra3xzo/phaZK2cqlNRUVFD65reVypbLh/4MF+e3bKzv7zUOfwD/3GAD+3K51IX7X6qt3bmfYQMKZn6r2mey06apzdfUH7CPfQh0OxL4PB3Aguv9gexNqbB1o+bv7mjfWO+pXE7bWJ5+VmoybE7lqpm+KlFztnb21r74G9bV5AXaiA02NLXqW7tRe9dyayqrlrWZR7uYe5o820w2gF07wesxW8GCmc0q5ETYnvqazzJszSvUqFfhthTFurwbKZabTGMOqLbuauB/sj5rtgXJ8byKaFL1PX+XxSjg3tc2Wg+NjfwA/BM5QwH8U/6JnAH+o4D9JX0nUxtn+v8aXXtzuHX9/OV2gQAAoP+vDt0/dU3irNQQA8LITdANwnGPrDsq4roLPdGlrIlvQLrMzxwZcqLmVU+3oCLNUgd4XMbbcdauj0kn9jaBHmNpbFeQq2KQgP2YW4/irY+HxnaQRHX38l+XyWEApPP83ugjJPiYJ3mDjiRB10dpjimcmzLJcv5MRUEgj5tVtIyT35g4mK3bTsFu4l5sJA9PQZZneIfql3cnmCNHaNebvX3lxcweb0aR8Cwz9aFKQo6rTTxqdLBP0VovwpMoGBjnrJMr3+SNu1R4dY0ZLayoTmi6cuTWkU6vI03GqI4cfiRp/vSbwOLiyUB/wrx286QEVwhp4cUPCdPo0GGqJx+rvoTTPW2V+/+OJcJfMnZ1drG31bC1of+fUHXh5/Tq+stRAAIA4P0P2pYupraM/+xf/Avo0Nn+SCBGGLC9zj3u5K2cGQ+EhDMPTbSuiN97LS5MzMOWypkU789o8tQ0l4yQb9/F2/wD1dfp68oscyqsFNGxXvjiwPwnN8toKFEx3TmUhYHkTJedR4W8+zYlNHeHyFWFImwMEcU5K5dkMKnUUhiTJvk41clMcVya7i3E56669i7ftgIvhpXC9gT472BLbxlS9z9ssMHur6LXaAwT+Igb2xoUOgM+U8m/x9jiKMC6DDzaMiu3oDusn0b9t6H/d5TQ/71XY+rhYupkZ2gjY2ln7fw/gkVFXoZj/Beom79E+793+k/Zf2CXMCs1KPDvlxSNp/RtsziltKSVEgWlZGVTSDPJssOlCdutjZU3Uj1Oz3tOHCFPEuEDgc6oP2jPNizjzfdh2sXLdbyaVUIUVD5+1SEBlAeZ80g0yK6UuDOUpgRyFhIZB6kZMNRr+6BoBgRj3kyC1qKERnifShC6pkp5VHEdSKoQqxDIjsqZULpQlgq6jGg9EWXvtRab854d2BU+fYVDPh7nBK+xNGuC4mcW7YFz2oCiURVS54dwX6BG0GlghlJfD7GbwYYIeg5ywJrIkdKOEpgHQQd5YlrxNt4i6EN12OL5Ci0urOFmVM/kJSt4DO7AxaBtsNlW3G4PbtPccOMS/tYPNLSb4VZLcW94h8bYKGX2OOiI4O7j4WD0GVT+ayXiBosXLgNtYSiaircze8ZnFZ6H3wGbVZn1Wn7kjHXHdtcN/iWvTj49NdIIcgKDFdbdGxudiD1cyl+GqGzTEW5n6Qvov23HoRqA8f+11OT/v7WY/sNa21KDDCijN6C7BYc90p2u2+DWozbc7AoYjfuyBkPPzbDSSYkmxt7g+v3Qvhz9bQyRwOBBaeGDb1/8MyZeNr+dAUoyUBDvufGcBA4bDQoj58x43cPH5sMig5woCYTI5yyw9PVl8QKUjeNcprWuNCLnECtjLEcxLrrCws5jbQTXZClVhWNwVUO1M28sQH9feBKq9WJS9BhwTRIJWWm+jmnmaVV98munkk4Sprz1ABp+x/c5sOSDHLnLXKotLaXKqoKSCZEeGOQYC8GpJIjxrWeQKGFMhNiGFy8pMFlrz9zfrJnkwnVsB+J3NPkhdfQTSG8pxsdszV14np2Sjb03hWR3W/wB5/XHeP4M7J1u30LfVLoHQvH09/328CQ+S7d5TJsxElWa4ybWvk+ntUe/aBr21lxDaswDgBhF9rkLekX+3ycb5L8t8T9Nry5OE1Thv8Yi+bsEYP2n2n8eff/LOsPJ8tbBAgjDN6F+4OveuqyW7+HpOlKEc8pZQnVRci4R1xMzxbI9vuHN1WADz0Rnoultr8dtB87Hk76bInl7CtpJUSxyIiCl9SVsqnQ7q7PsL0RCSqUqMazxUcD5GnS1dcd1cxR/0upXcMUujRjQWRVfKEjRWJuhjDcD95NiXGuI6HRJuVVtVEGZpBMzXIThGzjuotVM6bYqfRDm3+ccT3q7r8yKoD0ah2tBhc21JKpTgu9jcPTh1zXaoSjQyZ2mhoRyw/cNo8GFeUhOCWNLePgWEQa302HqyR3EWOk3bLyTCyKdNEwJG9f9E0HN3bjJNBuEG6/Ay4bAKWJL1EvILIJZFhkte6o3jWAFeGPS4oFnyRfnxLN0MMyQgsbpYJCjnSc6Hbp6cc/mbq8fE94qhAclRm1umOeRPc7Yyfia7k3a6Hv+230DL50i1Oy/0CtDAAAg/5VqC9vbuZjaueireDqYOuv+A3xLqrT8AQNK6IvEZ/iY9tJvnhAEqwkjMDULAaz4Na/LzZFK/ftu0w1//ljPX4VUtplTZAkHW858+LsaGVvV1ZR6hIXPtUZlR+moe8XqG9PUz58u7B1GoIkOUhg3+UbWAm7MvHyZPDXABgmVuGrVZFCr2UXV/VA0vgBpZmZ8WoKWGCc8EO0IznvmB3ek/2fT7wlaSAUuPrhs8nwDYW/no2+1bOuUPZ+u+fHxW1xyqKFg08WgAKanZ3XuR4kfTPB+uDr4/gu39ympq848injdoP6ej19z1gpRkX6lS/qJwuzTvVXy49c8nHXAzk3+w5ac53eTXqcb6zpW7tyi2fUpeMvFZg+pKMmgWLNnmlPv3btwZJ1Dr5N5/kvlEvP/J3avfPdmxuL373aavrE9G95mzuiqfmZvGfcdia/3K3gEWw5JNazR3G+19WuC9pXI9w18bYeiXAL2ay77zMx+7MaFe4J8l24deMAQWdJuvFRZoGLft/w+nc2HP6zv77a/p8/mb12aktlaVv3j+TfXefl/w/ferD37a1OBe9/C/U3OlufY781wttT7Z85+fj/L5foAb0YmEQbc0QkCjAwKQPKxMhO2yIUYgLtBhmhOJMkwwZtnqJaiN9AQlrbB9YBzLz7LuFAse8iC3CLBp08AhbVOlglLuwfVuegtH4Rz72DRjdoOQjer//NMViOgOQuZ0MObkxXZB3BT0A2Yc07h9xcgrxVoiASKATls6AYEFOUXFBsSijVOjKBJyU8Ga8UICdUHwfczoK4XQLFcHVlbYkEBNqeLbK84lwLUnQ3ULYiiey8jku7k/KJUbNqFjS68SQAqZGBGD7oAZmTt4CAg5GlmFE9PYwfXIcSHkqMSE3LdhOpQ9NoJ4dAMZG0YdRU+6wVRrA/3YsRspODTLo6i/YocE+5mLKpf0BuySOlVnom0Zi260eitLoTR2xWYSGuDoRt9QEX+4CxZBoZ/DxkYlFALGGwhh+FedPNWuDPPPwI0T/UkunkJGQTMM8Jmnnjg3XtTyxgY0r4ygkUR5q3pAZtXnJFYlJoSXFKUmZdejM0E9BlkhAkavEyo88nEp+qUNrDlJRmpuakYKcEvp1ftA7CM0pZEz37dyNrAJNZARF+piDCgmJkJfd0iPkfzoTh6Ozt80WNxRmpqCWYaXq5XGBb9kYEhK4MNrch8jKEXTGF1vtHDGE9PYMklwope8Jb8xGoK1ph3cXrUfhgYfI3p6KZ8/o3VFGNspnT4Vk81tQKmllJGNFPe8DNiM8UEYgoruIaWB8I/QJ9vUAV6hwEA61ZKRcItAgA=');
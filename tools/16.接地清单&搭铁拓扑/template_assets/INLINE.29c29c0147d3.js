@@ -0,0 +1 @@
+registerTemplateAsset('INLINE', 'H4sIAAAAAAACA416BVhcu9Y27hR3t+Lu7u5WoLgM7u7FpR3cnQLFXQvF3Z1ixd0div+05363p/3Ovf+XeXZmkr2SN3nXnpWdlaUkCw4BB/IjhSqsC4H8LcG+XCZ2xkqOdvZOjEovYugvFTA/xcjBQtekQEFA1MFAQJD/LmZob8/gbmOdESuv0MWEHHwj9a3jvNVB1TeouBtjXdIaOYHqUNds8q2j9RBhTnxNpaF/N6KmA140F5QCqTBc6VzEY+aKN6sjhxWNvOWpsFbcFBuOKpjEgkiKuoId5k4umQwYnCqMDeKmM7j/6PdjBY6br/6SkP7dMGiOTRLOqr0BOqIUIqgAtITJOxkDvjuMGkARefpbDw1/YQ6cKCQcNph8P6PNVjCLLK6ys7aPwQn0+p91rXUgtuernN5K+zvI+BblNXQkSo3iwqamzw2KA4r8mRwxipbyJ0wYpeMCgYhEpljECz3Dwef+ZuwKVtHm/LD7AuWmIgMqEOba27WYerCBVS5WB0i6ZbpCYyv6mct6RAKEWayYV0/ltKFfDcuuPRZwjKpsrME9I6ms0RjQLWE0tnTcH8C5CMDcEPhto5xaoNoHGFtt1+f2JDnun5Ae0H5nXWKKt9LghXXLF9ZR/s66sZ0j4AftPrGKsl1M2L0nASsfN5df7z1lfzwSAlBCB6D1aEst2/Rw0Es7L47YkbijKmaKjQdmmR8bJ9cvpsvxbftk3vRdNJPvj5wPfwG3mRTpCYOC8MgWI1Flj5zoqTwhIh7TLCcfg4NkTg0UbjF5x4hKgRYcwqobn20D1+tEDkimMmarqjfBxmP2T09r545HkwwebXRR5O+lwOL0RuAiz/vgVKnjOOQAeTmEiFIWrWIdvVU2aumHjs3SL6wVaCF0FjUbMDqSBV9XvTWsysuoW6D+zaYePeKzw5hcE7NCwZTBQrHx5wd0fUSFsYNi3+JibVghaXJINNzP9M7V3o86zYKS7lZqGYwbva++fZKk7s/1OL/63uR+r8nHR69//Hg1WD7if0CISJC3E1uV3/e20ZogC+GeClZ67ly6r2AtWkWCFxh9QNNT8UhjwdqvofVE6eoj4rNAGMtgRVRd2SKuAx4Lc/IQuYn3uzquolnqxV7UEfSiDrTf1OHi5Gxn80MhdbG6ioFM6CEn8g9IeTfjSAJQ8JUITRS98BGjS6n58REQb0WGnJmf3HgdfL9ZNltdcIx5jO5JY43pHuB3Z+NRsPrxQ+CTNBbjNg61d5ke9bZPhAy8r5N5j4AfDPXh4Zy0hUCNEWoK5kgzaBpnDm9qjGTam5Ennx9PNm3acje5atYQWl2XU0epp09BChxWBGUzl6PY6V4RP9n9IvCWvlrlwaSgIc3YzuXiEtzXeX+UTR1Kz1xTBTdnnKIkz5m5Mzjt+8CwOLNIHvEWj1a5nv9UFiHaqtTX+a8VJ3Z09biN1L35ZfVGlbuBKQ2PcRyiCkpSOnJ8vKJREP1IKt8x8k8PTyXxnq2d1G3fxUdR90xH5ZJqMQb2Z/Wg1GNOoEKyRYYRCRqdM4p0aBWa0BNpmx6SLkWUJW+mEkueAI7W7hFW9wLzrwZWQJT+o4ECf7ncrRn/s8CrvwTc7BytnMwBAOc/zRivVgKtDBQIiDY+CAj2/5L9+cX805xp6dotcqD7EFU+E++21BcivYOo/5AvXAm6pMR2cF3a70ynxsIfHj71dKfrq4nqwRhjxFjm4+OONOAUuZucdlNhg9ZyWl7RY4FXo4Uq+aAW7uPjudCr/9z0ruF9rl5igc98GNpK74oHUdvK493QNmmT3WOME45wqGpbRJRKpt32RSvPef2h2fqw4umAsLMN9ZrNDdvJGAHjjafS4vAUudbwYrVAT36X/A0rf/eaksaDgtoYvaD0VN6GPLXh02OVwM2sbcV91n7DySB86RVP1gD6yTClqGBi7m2dy0y4Hv5mKerRNznECkd+fd4Da9rpsLnS+sNW/qwV4Q1WuuMqW8tbXcYbHhKGPoGkIYAr903NvokZ8zxxfbrT7VljUk4LLQDnhOOt/9iSd8P8bOUHmbvCjVCbB/+lb5gH2ALj0W1WvnuUFWRaAgKnIRqxJx20DpeiYdcfafBOxVPR427e0czgaSesP4QTbUouC22JNgHJtjIkSVqpX2yYes7rT3glRfEJpfqf/VcA3N9P9Pl5r3DzOYi2OXx8MnZarhd3GBYuRG+/9Ufl3BYsD21w6PXNLmA53EbMKkrCfug3ZbI7o0u76xY8w1puB6njIC4WA9ddWyksU+dYL6TXv3rGmkKBMmNqSlqZedW+k7AMGHI7MpQocGV7eEeQMYq5h9e1Y/rKs0emeSkfLQkGiGjy2KhWZcxJfaj36T2RGgYHf6QBgF9N33XA9AlsUU2rm16iEpQ5dBkclI0ERs0FzwwtwBm7vMDeCpl4gSnYWogLYjyIWEk9iZgoBA8sMBkVHbyTRKm3QzuvmKHDCNsWBsFIphIf+ZX/5Cu0wmLZSty/pEqhg0QriWHVZigMWgehWAAGoCkkwG5ctZncUxcO5FBS4loeoVOOomLJNVobYkFR0InXVC/3sMuM8piQQ41qA3MhAwNjVscBUSa1H0iqsEMBl0FDqP114UdsbtaXQABzMrUsz10n4GPXSJhzVH0VHdfKnjliUrACVxeKouSOJib+ubNz6BAYfL6zMkAjaRorCwdYY0xytVfKin+NXhS1kRkyXQA+Zr+umicQ6Y2pkjXK1/VxLPqO60pLyofnGmFHQHR/Y9XspcEmK/4jQlFUTRbktOLe4UH1QdWwxopRPuEQ2H6B87XLvPHZTMPLYAiVBD/VVAwxyB6X2DG/khV6jB9tZfCia73D3KiEmFYEFTPRT+LH1Pf54KApsj81P6u/xIeZJzDqS/gC7fu+JovsyuH6Q/Sd8/WMm+OJhRbx/xRV0x/BXtD1g6YLarLWD7GkfNIfSbN9Jcz0k3SvUD70yPG/Ab5yUKgCvsC19QSMPZKu/vz9At1HZ9qUKN5ujJPho+v7ATLr/sNE6HHkxPzsO4bWnpwQW2MzelDKA8GT0yQNXVctzNY4+l5DWC7u3JdpEH44MfkxUoX8mqy1Q0aJpNQT45eJBPFJmAl2zesTR71UihLm/rwp+TxXt3rICL6/84OOGcDeCwFTBNpQ02M/6Opb/xcf6X/n49ct1UR1oUd8oe7GF+6GBl+YxU+MvrtszEpjJcDkeeisEtnfcHqH8YOkyLFHDBWirPuSH7Q4pb8UVgzSCeCLFM0E++b1SV4Im31R1+EO173VC7FPPNm+wj9IiiLB/JByPOfpHOb0HuOnwnAejTN/zOaFN63dQ6ziwyrgUxUd1L8rtuWytgH8d33V2MAuFp5uAChyzKNIwlJdpQlb9CfmbGpEWYmoz3zOd/DpvolAzGo+ric6WG6/0Xf+F2OoJqAPIAbS/eCXaNntiiCJxGirkiCyIgzZWaCQvlCVEPMgghCaqOegj+h+i/Cb4JcXhZDcAkKC0alWUBe5Xrd0PT5LUsvcN+TXy/vPet1iTKfb2YvLcLCzrDc5Ft1bVmM3+oNTaDrUhV4oTzSCVypLXsCaOZvRLbTn3MPMfVUidvtGsDmcwukUbcRH3HJdZ4zh74WL+isEa6iRXS7CLIFzBEF+gBROoZw7Aftb78jRrRQ3pCukZKjDol3Lz7ZTDdaL3+l45hPq1JLI8+dbjnNec+vAHz+BK/3Xt+2X9cfZHGAD+GOZCrq7R/gOCQLSiv3Xi8a/xX7mP1eoI62RKDx29DayM0Hg9vIx+Uif64x13e2+iNuielz9/oR0OhBvzN2E98sIYp0kObmYsE70ZwchoU9v1lWeUoNJqVSeITOPBroV8HMwg7ItFVgzV7x8idpuHmJoNYjI2bh6dJATOTone6gQ7HlMyGIVcNeOfG86bbFhwidRcuh6Iuwjxd1dnh9vyrP5cTYgoImz3vNPwxhT17RkEDAHGZIzVCMUnNoMuweQN58PjIblso6njWc4os+4oopNMkkpg1meZF52PgaPvoLsKUK3NJDyULTopm2fqM0T+NBorkyYTroAI3wTlnF1Bo4DhQ4LS4RrmPdubfQpgaA2CV65Ufhr7MG+PkMSPDAfwE+ZhfBemjbB8pOr0u4sCM2sQ4ZnwdcijDs2EMTQ1fyqnolG7YraVO6vYCmSUcejto3fXE4Tn2StONyGRgILD1fZ+3crStcOZky/rK+z96+WWH2XVaa1fIP/iGtyWsfuXfDWQp33lV6gkczkHi7P+8E6BXZJrGjm3FA99xbVfcJap++okNZUhZ/ysWvUPMMTs++BbmslIsrk0rj9HiF95jC1NiQyUOkQkiaosuzQC139d7YhIUY2UvJYYSSUKdZBRKYwcIZFVzMXJ3r873CbPZ82H9ZqLkIFMwU9nZ9OoXOHUPjE9roxvW9HCt55Xymf3k9V6As8fYvC4nhKOhF8ui0YexCiyvkkztjqfn5QQ8nY+rDZYEfktQqNj2jtnkWuCcF5qmX/gWI17RXQipvwdDZuty+MC5UKaolwhgCHtx3PSczn82vXQLdQ0edT0IqRY976ayOBuG7WiysuB78+4MTrjWUQHQ0nLZTjscnwd44CNQ4NyDxXI0siRXELo3SB5dLeNNrMrsN8H6kSzANU6cCvIuSZr93dopApy/tM+lMMjHG+kQmjodhJ3ZmsIltQO0uh9g99MyPOWwgfOcvIHigcO+AQcIlRQg7zBJ4Y7wed4aZKx39Xu1YWOfIjIsG5Bx6O3I73ugQFySkyAYTNgoJPB75trlYkXB6MCzxYCOZfdIs7SucLZEiGMePNm069AcYOhx7FsNVXEYVRK6FDUsrdrfYNlyFfvfIQ2ut1XiGZk765lrDH4ymwmYwl3h8Cejl6ILKGtrVwE5CVfkFwdinQpyRfWmgeQThZcCXjW+3W5gulHfFEO343l7NonphpUPj+imJfN9R39mNXQ6uoXfHWu1ZGRm1mZ4s6HLZFm5ZbhQevE+aPtZQ76ESwLY+YlXfAJqbCoEthNCzoKroQSfXe7KUOeS4ak9eks2wowr0Q+EhdEcXT0DyytpF92+5axRq55sz+ArGdQZ5N4QJFDGqJw+FOuXrGObGgsvCBBmTI7dcfURIPJAgVoMPWY1iYkyofK7P0pwrcQ+CzGOJL7NGfoz5/Mq+KtU9d2CuwsIdyQ6cRMWQS0yLD7/JHIIxDWCefNoWcgNUxRqDg9PBBazXR6edArRpoyo/VIkAlZUaiksZdKx+IkUaQZ1dfptl4Upjggigx96Xn0pk+bFPipFBcala29U9iQDpzB4ZOmuaz53w20Lt402UqlKbHxwMP5dxrR5JtSU0zgx4qKdZ+1oYLmjENr6OhTutxxRiOb//6BBXnxii+I6ErMTLYHJNMVDfZSBSA9XqPTfNrQImeRm2FVaYDXz4yzGfuINpO8K2wVORjJMlTR+p3fMo2b7zqThtK03WuNIbx1oKbXbbV+fyc5opP8teX59Y7zwAMxVcqdVLie44menqUGNczGe9BuApEAGZgAcrxfv4H/Vjb1kOBaUnpmoHhb+FscHkO9JStQhDxZvuORAbxPt/ESkwAEkynUCBj+6xNQmQ9lwatypO1ebeHK3fpaIvo95IxhtaMmJc6XYeKxcMMrxrKWNIhFtrdgRJcN8Ls9hvgdGeyRKQzZc0Cn62aJ4oTGFzBXOM1wOrTh5nltZph8gALjtPsNmvE9h2IFVYL9Ud9MuSW8HW0DvcHNqBzSnnFc43oLVYXo5Cbb7TgRTd6rhVrxJ/LDJ4h26FuPg7Vrg26SHxiIhAKvH6G+H2hEIRtDbZ92Y0GvSwx6H8tFE7mho4AE1VnRwtbM6cfK4XLG/moBSbkFo39d0KNjP5qn9Qxqt87IMy/ZmPZu8YWj2aQilZCLT5uq+irpS3bOYq5WcNpc7fuvBcs2Nh1c9pD0uW9yd8I57RcsGngrVV0OvEqOhbwyvUtXNT1OVwwPebnbHEjanmHdf3IxLJcn+V1b8j17uzR94udgovg8ai8VXLW0pYa0vbO1sDJWFL+8tV9Po6CpGCynOlTkUDtsvmi7mLHdEYqy+z16cEC3ROZP1bwIwlcKJWu2R5P4xCqesgTcrBARwVVBoMGEE3FvhR9UldUamAEKmDQaH8BQEIOPpIq7hePQL4FnWeSHT1wnlsilyjCMk5TsoeAmjWOioCuAqCjBv+oFL8tg5hgEaMh3Xi3Xx+disBMZvLWnNwsW73a3QIwojT55sx4FCZWtJPnEsxFxWFuWq1cjTY+Y5saD4bGYxC3QGe/9L16s2lB27RIqzCslqVuy5o/BHdxwnQUHTpNIM5HDtAFbQMYTkaeeXsobKnBFKsCHAODajkiHcO7aDpdoPODNTYJeFwosRbzPY2UJgHF+GiC/YjpeTe2DhUUYMZiBJveT3i74C3zkCoAvtFeo47YSnaiwLQwpHDSXAtsHowtBHTk4yJkBAl5f4y/bgGkZBnmpm0tAgX9YYD/m/DXYZ6jKA5OdLNpiAumeiQhfO6f7dxwce/ToEPDReo9cWrorCH9tPktv+IiGxKsOH4+gVvFHY2EIrBkotgkrFG1PTbvUJ580zRXeaHoKNXMBfaE8ayFfbHurzvPApzgbhJk4w3NvyV6OGMmVl3Y8eO0yUTCIv/kKnxv8jnbQ1zObzdtRS95Fmj3JC7xDvT35zNeXb3m9cvzGQcBAoL0a79tZGdn9ePRjIjXt0tjQm5foTziZaKt6BASwcuJpmETLplWU0+rW1TdWs3VhMSbH+1nO/oyFhJtusC2NdB6sXTy1HloqZ8w6hb9HpaQbOUqGpwPLf5sFttnPq8L1jH+dXqsin3YBJLSruXTWVcpyrkNbXeaMYhOT+F4U6ZRaTUYTY6OMjgnY2M0xoREfIXmDCqMOqRfuQy++zJkOcxGIZncFjdCzA5d4Kd+Vwz7JWHyeLG0S/UOy5mp3XpEZxOOSpe0t404fQaPYEREcuPeiTWomU2EXHnlJ1IAmqWkfurwSdpBtnHsCCAVrrtGUH/MF575qslmCTJGIXdf66EWtoCjMbRAiZaDsl02oOoEH2vxB2zIpIm5bJ4lM4OKYI5AmE7iWj7vTnNaltJrZ/e0rVwbMwNTkzG8uLDGIWpWLA/Rx8TxL8r9ONCWJazRaHt+nvNJzY76Km8so2VzBhKpKsXN8qy7NJvnowKU4Vy1xps/PFlUYn+fEmaBycURWEs9VCRHm/Kr9tqb66p+6L8J6N+G8fIpcfbi4R0wumSFpQznfB+wxnU1tTYX1WwYqwMMXWMhCE56OvfEyG+7MzyhZxYcbVrpeA9QoYqx4kTDOH6zU0F/Sfn5CirHbZLuxvvrRP6bNMJaScAy9SuCe7L2S0MLWW7357HTCW8dinSLdIEMC3efhuXSsdoWXRu9zCmnCKwDk0auFd+z08rv9Vo+R6Kr7zjQ01LSIPcoo+6fBx44f3+k0oKWAxBfzN2NCAgI4r9MnrOHNeCnrevRsYla1MR4iux+V6nTAS32OvyoeURBhSelqnaSlKROSsqPRnF9WJPL1T6dpaYkAW6JpbJQqlDIsA51qFzmVghaE1mbfvE4y2IyRfEBcrTFt3Gndzact56SdRK48Z1v54j7hn++0Zev/hNvPmedTgHtbINltQkPuJs5d6ju7ZeGSxntxPzWNQTERZfhcm8jha2DlgpfgNl+1tz2CNnUJYWffb7ubf8N5eLMvrO9SWTEXiIvM4G72aancVdo0rKhC8+ZnDEXhYjxl+Jpy5H9uUp8bqE5QqRqPyDiiWSNNGA1kjLEjkCzfitLiU4LF6l+hc9ZZ4yrsmPauAKNpAsA5mmNyOe2H/lA71fclBvDzoSG+TVNfazZOGbXeXM5khXvwPgdDeK3lA03AH0rBeRJM3dQmosWXPrxF1GmjfpLxL0FzgrdkqXEZeJZwcJVDf3ns+GrlUKI5120lSb6gRkpjF71RAfwj88+t1yf2y1R7QzLwjkD8VKASkkRMHW2M4kPxpxclwezGrxF9BuUwE8TH8bRTkJ881vbOpMtk5eWR/tdNGMxIKvlji9d8+1k3RDwBvMUWNjsbWbjvA14TVKWHYBVOHzMgvczQztIe6qSIZzBpLAQ6hHfcilQBbjr/So3TdnHUR74iRXFFyzRQy0vXiE1VZfPrkrODtjkn4eY4XD4qGTHgEf5aWsjhtBdk/HuImgD12s61+OJld1mQ80jOjmCCuU/aoadUwM7Q2qIPLFMgsYkBQDQXOlHYqnTck37WnumhjYDm3XO52nSgN5Nh2MKLc1Kr3SO9yMztikLSkxdcLSai3BvipuKG1I/fUJsxEwEVS5M7IvLE3mUsKp4Yx7jpIZCNT2gGEOiG9NWcqHw7fuOVccbLijwNs8qC+2PpVOhmdnjNJpFpfNUKzVMusGo+ptqVbXZxtHUwE90i5Gh48UyEhr2BQ3gXR4rl/gEelJrV2VxsMAy/GSP6NgSqLEyj7txVoV9uCPValg53UVcVNpX9+5AcbiWFUpPpE5OOjNzwjSmbrtJZR0MnPSZz2q6j74FTuJN6AS+FRKzEVC3Lbi6j9utyyttuLrtwK8zewsrR/EjXZWT1BWyeV6lEuf0LP7lNnU8GQpflq0bFgnky/RbnqB2TwqPFFRBWS0Bqux7bXD72hESX5RPqN62HL4mnn4nbsuxOZKPs7cilRrzFJGX8spzsGJ7O2QKeGlHPiL1LDH5jaZxDB4v4uvfquSw/AcrTDVPVsxX/l3nLS4KMoc7b/6zF5y9sRRTnoEgiyP/A0RDInm4m5B99mQVqBtP3nruc0PSPa1Qyc22E4X+2skrnzmP/SME+o1xFwQ8hpIYscssqU4o/MM6F8AzzPVgjg+08faXtXrRBD70nAqfxAUhec17qmQcrcbr+fYU2TtUBqJjms2kS1MrfhmZ0jNa6srRL3lib4g6QJXzc7EjRz6y4/WFA3cghO9gKb+GnsXSrKfO9tfKWlnUJX5VShUermnCuu2YYAZiLlL3p4qQx9AHSxEbw8WIoQhUqx+XCpCGWwuQ+gNfvmevHHZHDdr4to2TpSGozPW+DpI/6tCSnjqXyb3Rn53+oBlV3vWadAncz/SWxYW6FL18efZ+mL91EFh54JdpbrBwLT8J8LZDd5PE5W615xPZgV3Ng563ei2J2U9R2hSSJDyL1rx7hF3vsguUh3atlB9rgDJ59gJhHDGYunOvhSiZQAOjWJ2MA+3Z6BTKjmcaVyXuSSuZeMk3SDmiITB7oCBkzzXA6NYZgkIcktIX3HWPSa0Mj/IRrAzLshE0k9MSQeGdSEjo5msGULRVHElfbwYFozRgJ+FPDRra0jDgrO10UMiLYUMXckssSSjoTIoFfVZyRmhIQcNiR8C31fNSHgIB9B3abNVyloUscjtMvU92rvL47leMrVbJtbmFQ2OspIzPUPySY5cH7GOroYd+2I+YduZuz87jMkAP55n9spUH8cohw8rrHGwD2ylCLKZdhzYGC7vvc3/1hpGOyRI1V28wJiEUQ+25ElBaU4YaGTVx3U+ZahXEXro9+A1hpMPHhFB/+DI+/A0RWiRwrLceXOgv1T/lqdSUVGT8C38iwV2xJGj0DBF1GMG8hSYxnpnVh4qJlFxbD2NOmaPkzGFHqQbJshoOTdcdVHiTIFlu1oJ4wGWiG0I3PYAzaxG2bX8L7RDECnZ84XtALKSTaI7uuhcC7ZWBm4DwWkbwDDhAf5HcGRd82t2EWo01YscBOOFBC6/LobYlzROHYmZ5/wbEnrAM4vzAzyFYarMGRdfj6XD+Nu5GqR7JNBFxMRB0B5SD5HR1+cU4brd9v+2Bbovobmcnl1BsZPyQ8Xw/8DCvSAaq8k0Oif+uju50P4pRaGD9pAp10pgFxzPSQss00vre9yg0hiMiLk/SOJEC/CIaYe8omcNzlJTkIuseC0mfzveRa1KUh+U1mrcj2duoiM7H+YIdM/2XnZ3XVYfXztB5XpvRuTOnu9bOuv67Fi4fQRWpO5LXIGh4wq2jWU+Ap7QbrDZBXe/vDVKRzqxSDFwHrSZ767lTH6KekaXHpdFQUUKeHwYoDb6tH6Pp4XmbQ5VYwdyiFMatk350IsxTSq5TgplDZ3vjLBAYFGQBH+yn8BFZMaqJye4jMh8u3NkDjMIJPeXBQ0/X7WMygUsmIRM2JgBeTEEwqu4U6GdYLrV5OFYxSthDykdpAEKLrOXt6HZW0HcB3Za20tbwffeDZuJOMKmcmtBtEB3BYs04bWeq3sOFs8NNWwwPj6UkqYjCCJFgVNaONqK4VPitmdnZhfeHjzDz9g43ZoxZ/BHi7gxUIgzDbd8fHohu/DYuCqIYBJ5OH5KyWBY615yGXcQ1u2WOrFTE38J2OUGG2AXQWR4Yuj+1G8iDTOkgdTnBhZiCYfvzOuiKYNurra62gRCz0zAjEPSwdEJk2WszNE0XMmG38qsEN8tGwAX6006/Lzbied2IysmHDPVKqH/sx+3MmuLomiJlQyY+J3USJ9XcTgP3bUuRbbjPqA2lNGNa36WuDuyDO07Tg1tYQeUs1bARxnTm1tDb8yQoQvyZVtWsOr8qI2P0S4+vRCsmklVbiIzmO/4QnwlKl3/BXEspgU1Jw8WAAj/rUIBNoQ2DU6IDwgkZgpCY/YQa5fgfuUVkFk52GoQQM9tAlqQRa0PzkzhG7uwvD2dzhN/Z2SR7h6/teuxcAa6PNp6nMNVEAlcEB5EHqmHlw+UrpKHTBulg+KG3c9qqXFpQz59SzFy23K7dtDNafHSLaq2+HL3PT42QKaj6omFh/rjUwt+iqmr56EbCuolHUh91sLDV6vLxa5FrgF2I34Cn7mLmwukSgt6utfmDvGsFbS6W/233HU0ywcMnBbWCM843l09I/9n1CvVy6TsCrP88HvTicm1+fimtvGxZ4P8tw/AjL4sdk+lmQu49CThB3m6Vd8NAmXdmJD2UN/HxS5Z7Hn+NFqt11NoirEw33QQdlXK7nbbibfIFb4lYjzk/sjnARTlAyK7ftVX51NtdcylAqrRlBtxDzb4T4sv+udF9UOA2X/wCA3mMrrfKOEsoL3WcxcSempJQFi+7eAG3oDFZIEeLrZLt4LlEbxahkjxfzzJNmNcXKAeu4OZbO7vig9FV/pRc0TFW2k21mAwX62gMYKB37lwb8pU4FBT3mKOLwNCJm0xoaZkpPaK4TnCy6vtvWzptDnQpfToKRO8pskduhaamdjo7Yia0a4ekeIIocg6eyVn6ujcTPQTY9aUcz+lL3P6/bux/orPfet7x8KXU9EIn7t/F/r4H/Be78pY/w0eCl4WHWxMzElVkNq1lSBa/8vtF9yaG08OOXPY1VNiTOBDn4dlB2EG13IxILS6NcYUxyk1DV2TTyCDvyle2nKB7s1W4KRKH1TV4whBiyElVltjZ1dtxmY8m9V/FiLme5bUz95lRD3Dhs2OQ5IxlcOQpOyUWxSmnBR7/YFc5/xP0tFmmkR1GXosPyIQcM+XzCcFCPed31OGdsExGMal1i37wMImCV1odWQwsZP1DZzclvbwZ461Og4u6KnRDswYcVp32vmR8ZUaJjgIlVggzqQgrJAT9JOfhG5qk3G6RTOeHfTNtv3NUePbWyQz0ZSsD+ZerX1vUztYZYOusr+ZhD3DS/cFQWfyQAhgzesjN69auPG1WVXtDoKHBGqCIfB18+rqd7TIxM+D0OpPaAEzYH5gmzXN02/b80IIgQWv1nkJsenmmVP9KE1TB89NSqSlRXNJ5JkZykGqnOzS7Nnj1xOmdJZMWdHtAMcHXUmlqPvvIalDaynNQ/BE5n1rSCaZRd2RHBtN2O68WXoYW2VWVlLeIHPh8HWp0cjSZGpdeG+QBwm/4bDHrS1PDkYGJpDGqrc77fiq2sBjq2+xzu36cJoFnuUGu227t9ccROeFvhZkxmVvgZDk+nzvi+wgphBS3qUfOXU4VJQrhwsuiqI3Xlwol+JOTvEYUzHw2kSVac/zOkFt/Z7QOFteQxIqEm6i1Lfd90N5aDOIqkzRD6lCuD1mYyhokln0m8/q4EP9Dy1XMV6inJSFMfmEF5yK/Hbs2JxCtbYjTob7bgpuL0cquWuqrQbij0dUdepEFn+K95avWmPo2uuaLjgtjjgcoJVlQMHSQ/6yZHwkUhPgl9yP7Rz391cF/tjh/pR/RU3vEv+zP76B/WqBfoIgkv9mj/wYG+xsYyO9RXb/j/RnX9QuP8h+ivP5s/Wd80q/WGaD/EK30Z/M/42l+NacD/8fomv82afDfJv0R4l+RIv9XlthJfzNjvw/0T0P2a6A6pP/NrP3Zz5/u2l/9tKL8s/P2zx7+9H786qEK8w9fyP997rbwv51E/o7451nkL8QE+H88mfyzgz99gL860EP/Xx7B/zboV78NuhPif4f6/A78Z7DPL+BjiP8c+qMkC/nzz4ry8oF+kcOm+FH6f6D6C4s1KQAA');
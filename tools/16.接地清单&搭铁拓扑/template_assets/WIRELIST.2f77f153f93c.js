@@ -0,0 +1 @@
+registerTemplateAsset('WIRELIST', 'H4sIAAAAAAACA3S6BVhU7bc2roR0t8QQIiUCIiAdA1ICA0NIS0o3IuCAdKcggnR3dyoN0i2pMEgOSAwxxPw37/v9znfO/1wf1wb3zOz1POtZ6173ihGiiomFf+/uJ0x9Xebef/vBA34tnS0gbs4u7nwQ4DFK4A3cfx4b+FB7yX//3r1nGPfukf73x8xcXJ6+d3TISPiugilAqXAeiCatdRbkZdV6xhUYWclQv+g50m6LKaislAnea2qeCPkFap7s0jwSHBn5qD6b3HblBjrPUL3w0EnOfwCqF+JiJKJQ+cb51b5Oaadv36ZaUVnG1k3fAJPLGJwNrenoE3RmfD9DqhTNz1KgKi9i9qSYXfsZYZ5jLvS1qXJ0nim/IaXB9wCdeSpay41HP62q5fhF4ZjnVEptvcoxaKLRCruL7k0HBGv1r6uxZAPlaN4+CXEO0Hncodd4OnLtUmCw0OtxA0ng/IsS2Rzko+2vCx9eDSUTTjwqrP9sohok0KK/F6qb8jSbxlmDpIqv6Qj37eThqsFPU4R9B9tLhBzl1yg1mQGyGLXu1H7ybtsE5Tj/e3Gob7zgsKXfIxpjxP6TDbCNDNDQ/lVdH8f/tO7BZIiTEWBda8C6ZP/duhbOblZ35o1JHFXpkaEMOQ88JLXOenXLKfaIq5iShhpfl9KrZ8SR6PEnfsG0d1uGuJW9yWWs290cpTBCDmV6Q4/fx2Oi5xvpP+Rv9DP1z5l1DMJpvWOjnpCW/yr50r9tLlFNEl/wnCrdOuQj7ahsjl9tF01NYrVctxI1u1JGYC2hMmf3MO2KjTF5NFVbQDr3wItgMo6QkRLhvPT1xFpDMez9NieSrWyuorT1hzYpjGQVCemeg8fq1kQfBQnp4Mz13Zkbv0FVD1LLpGkeWv1ILfIxSVPfa15yGDOocR/XXqQrK3UrzY4wO/a9sHv/blW7Aaq5FnlfhXUM95OMJ8unac3gpn6UB52Oj02lhHIAaPRTVVHfMcLi8qLdB1atFzW+eaUa7L9EWL8zkRhg+JjKVtwh6cevC0sJmYhDlOQS0oGPoY3lSI78Yt4zMuNGzOoqvqru+tMC228WvHbe9Qfxz1u8/F8eE/1PV0giidTkAFcEA66g+B+u8HT3cHa8c0ZDoqpqjwzpx8NANMu+5E+9KWF2ZVsTZqYnBr7J1T/rAyxF9p1KFa4PnSKQrjrto/w9AyJxNsgpr7EEnhUVMsx9ll8u3y1XImGETE0FbfdihZOLy9TxmYIo5t8kG5kq0LPjVL760WBBJjfw681IdTCkDvOQB/Gztjr5ZWnnM2EdX86vhVYSKQ77LfzxzM+DHGZenh38jcCkcPZ+3qUwl5iBOHXyfVjuRA77pqE+/bUx9rs9k6U3U/Y3doUvLbS/Z4hsX3hNYrAkJpYTzvfRu4S6C96PLfYRR6k11pXn6b/rqRPm5rKJCHrWW0e+eesjC07b9KvODMt/ZRuwQ9FPdm0X90thI07ulNXjyuXtVrmi9VQNYpdRT/oaFz88KuJt3C4ZSBNt6nAdpabr6bDPbQHa8du/yJ9CDdVj0X8wvScBsvHJgjNC/p8UhAn8vnfg+38/QPzvA17ObvbuNlZWHv9/oiI3M+66nsK+RwDhvEf7v5795x+BOydG3ywlIkY8C/BWm/S7gqLPFfrE+mQfl4w8M89i7R4ebkW5jOZ/Sa0nVxAaemWFnD6/xxo6HiEQ6rzWOnGLh57zaPb/QvyqHLtX+rYKfaKBRnmhN0j8L/dA6Gtn9OnXaedDvxMv/4umNfSl6e2FMxqZ5XeCRvn73Zgy+QMf3Cwd3iJM/c6r/G+bpK+nnW+rpK+RIug9afQa2hl9AfK//YG+nEefhUlfIw5Jf6/dojS6Lp39r5a60D1r6BtTf/Ta7d+itRtkk//tufQ1vcHtjyz0MfAGEfqED408RKMO/S97Dm+t0BNZt8jDcS+vc3808PHRmt8J2W/Q7TGPwO216e0PkD86LEUafduF3iFBnzXFMQNSXbcHzgvoLkCx2ytTOgSgCl/fVUrX9YE0v+6BxlJfStxnskOPhpuraUAaEEaOozedu25ustCn56C2P3kfUFdFPS/Qp74ElI/3NLqugJMAKvvL/vIf+HV7AkIj4/yvus5+u4Xd/m2KBF4fgbpu4vzRe87+aOcs38nH26d/z/0vlk6At9Zur4tS1m4QXl2XW/7LRNfAoa78bwf8L9msXaFoL0BZ/8uiteuiaen2tUymTL+gQkaUP/qIBH00f7bmf960drMFuAWNCltDI0jQgXmbIv7n6KsTQFP/61svdCTbxtHc7Ra60RY9HxezlHCchb7eQrsTnGGC2pbemZHUel63AZJxwBrj/hd6E+glvLA1U3TXVacDOmbl4qoGdNPVomF6nrfnj/6xdvMDdPvj8Paq6xZxOY5GoS83uq4RXTfTzpl+PY7oOGn0AOCpI8CuXWZhfF0djrL+6C1/BaxrYL1pkOtM1h0uUCvoZfRNXJxG1liXZIZA5trh9Bnd8enlZByJsZR0sL+0tIeh3x/UJd31j9gDv6uLvyexE62HjLc31xPTzjSgFvQ1LnA/eLPizBdFIvnBDxc9N1Zhfb+sp9P9IgUkhn4n4A6p83+APhYsmn3biGmBnjgDXc+sOI9rFPnegs6uOFrVX7yWxvglTfur/vm79ZqaG0XY/s7B0bNbPuTVOShswe+vk/75OPoC8PvAmpmC3OFVwov0OAsKRQBCToZK4+iPYy7vnS78MeLULtAvPqAjK9AbWYe3R4doHLff51m9dRRFbEfrvZdKH1zX3R51irlKkq+lNzNGHKovgyJAIKxCn+iz30rtYkfvH62mvxcjP1RPt9NCM+WG8u4rJ9Y63hatMZ8MOGVajmVhsn66lbNMQS1FjczRCDepa6vIzOAnOM4uERcfLk90q4xLY7DmmkQ4XD11dHawlwzv82JdGig775mxeDc94/zVanfz3nvicIb7fPKPoeN/hDEyUB+3ZyjooONEvA5Efk0nbMzPOqrkY92b/K9jHCtwMnwAcfs4Emjc9HTnS+NzHVH9eyzUY8myV5USOPJu8JDBXoyvS29m5GTsXl35fWB79sQFTFBGjZFLHQ6ogPOLfsmAxC5g8OwIH1b9UbC3GwO3gdl+xF3Gktg0/NWT6hail6wfiMINmP8jpwVt+AFjr0W0wS/+S9RO/PU39pl/RPP8icMJz/6zaSDb29RKZ/lQbCcbM6sBvxdulSWoahnLJa9R7EYdkreyqxEOoKqN8zf3598REDDPBDKQjscaWU76sBybyRauExjaP+FI/jWooNvhfL9E85ACtZLwaf8HieLTWj7AAiet53/7Gx8OKxAv3pnQnhCHt3nX1ObnARODxrxPxgkDqaiTabglr0NFzRdqxVeqMtpRbIV9ZNNy8BdVIIMFXbAAr3ysLokB5DVv/UcIb+LM+P2EXhhLYkN1Q7+5AUOL0pSfO5xb+WqFbHp9sIF4J04hWmmqu/FhpC1LLay932WiNrmSgI+e1bzSjVIK58+TIG+6V7SjKZOvewQEA1qGUceO/BsezxrrB1tdsP9wq47vvYmtu0xgy6sRa1HhOAz6iTGTAJsJeOZSsJGn1ct+wnlaWSss6SxCLZ+6x1yHID7oHTzwwxNYxrWoh5UkIKAnvL0tKlN+JNEFqm88Ik1xKBhDMirKF7zObkiziX/lsVFG8iiWs9ubONXKSTiLOPdOVvgse21Z8QsqMvUwirp/Or0RRtle8aQiJfkPBq+OJVjrYpTFvAkylh+RrVFAcQ41qWotCyIb3tK3FkDfwPn9RRNSS8x9kRul6a46AQn611JnBUgdwXqQgTTGRunCvPBjUeE1uY9f4UhfczvF2FIIrFK7RqbCbOVRQJbG2LLqnw5C68Jhi2but5VuSh/ob2ZuUcNbrhJl6UfJcSOVKmdwXkTEyPLVm0bc2fdJwese7BFIeyKUCXHG1idBGlEPkweCn+ACRomCft9lCp/SNhe8/KWSfrTPUheTHYuSvFnt/1tK4YmS+sIr05biqR2o4lkQ3OeA9OR7+xGQ5zADxKHk5oNTp569xTBX9mioSnOB1KZKuiu7ZSPZoPcmLyLNxhc0Upkfu5dHrl3Cw/7E0l7m/JnOeNG3Ba2X1oXBiNm4txGClcGvuH5/pta33lOkDeAxS4e9jDONbC+4NzV09ebsXkM0Q3K2nDGXGZkhZmsKGH4JHyn5PDxuL/xMkN2hys/of8s7Yr3jNrPwXCegSQUUzwIU3/UoCMa+UxzTRwr7ZeXaneLrAv8l+jCAz2ismfzZEq7le2eL97MRPDv3F2GFQYknKOtvoUqzbnxhg+5vylEMI/JDNlUCqYnflvVuD39eOPKDhxa0Eg7Zw/yx/sh+Xp3vncH7vfEki1a0rJPEWuOznWSaLKJV6XNdShOJjwreiD75LoAUwdW4r679o/FcgsvHgoJjzanfBlVuhV/qwyRnlg/PVnHqvpa0SKTJirY964lsQrLX3X4gjoZf/njTeJMARvywKVc3Ut2WTzxfCocaXEMz+ccklLg7YwevPIZ/rb60R6CD8jfv/G21t40ptDeM82Nxd1ez9uqSgTb1OOW7QxvFQXbM2ZwGAukXDVN7xWibZf96gUY0syvsxbtcvJE8hrCqILyBhSUbB0zyuMOIEov9YnyhPRWqH4tzeQx642+fSZib9n9OpfXLVRASCBC4u8aaad8aEaZu1KC9M80s6OMj8F6xL2gScs8n01I3zW582owXPK/V41saPz7biyDRIXGT8KMDHM9nH6058gm+20QWhjN0XgMAx1zOUhRiogj4zxzt+FyXQ8ONsoPEWkQcGjh8BzzHPdWzrcv9aNN78alcZkDM/AM0Fbym+kE3mWtctvfP2KPrYmRim5soZcS8SUYqvlhUZvsZR5hFGPb4JHb4SIlbrD0gtH7cb/GvwuQ9vEIY41R3t45YtbFdMb91ODJ5JGWuRgc08YbHk8l1iyuqxFQRUbsnovy143xBqVxHtJW9dHpyhUkuqjHfkl9sqAw6sBX3bZ20d/fv9ibH/8SoB1EDaL024jILWUQl3ngDe3px4fwTJYnXnr02V+ZvKfu52Je1stzY/0XcYtVH6YzqBh9XDstGXMcA6Rct5WU3RAl2aI+iokvcIYcOQhtzq/r54ieaGBYRz76YWTnYJtjzrm2dKr4ZGX7zjudZZ9Pkok/Lp5Mp34/WRckEdgsK3Q7hQwlsl6Jybjp/n2Wnpk988riLUDwX0WioGxChVlyfWFUPq4J+krynW1uycexYHhL4y5RdwqDdxiNqQpp1cJrv77r9hM2XbmQkZuBvr2v/SjyXyPKUtdpjxMBCm7mHgA/jiHBg1Mj3JZsK3CJxUaouHJtda2O0aXum1MpQ6o2obCJgrksXC+kcOoSjw/q5vfkBvP2cV9bH/CKT+WQTfB4SO5KpmrvOe+qWvAIDjTCZfShyl7jKZjDejNcr5/At3FyPh6VIfEnliPstSkl7TskMXCfwaF/WuvFahi5nixHP/ZYiphzElial3a9kTr5PGj7GZx/w4hleAPuSWnlhvvQlGlbwlu5cSCjpizU0sPy0Hq16R2vGRP5GbSE385vHMH7f4NaxFyqyIW2J3azNMUoce5eJzKKwTkIba3asGqsxuia5wnIXVfogfdf+ivifW9r958L9eh3NyUy/tTlq8qi0i3h4nrwpq/pkciRhynC8h/FMkMvBmTGV8q0RfmpiNy9vrbJrf0H8z4IFVN/cbh9wxzYjxVCQLWWsbIZnCMtI25D0yuK731p2upyTcn+0PJjZuu8/e4JHB9+mbkQbAirLdIX50W+UmSyrxE10XkgayIa01nazNqLEMuBu8Mv1+KzboZH86g5PS610Vy5LFXwgHB730aXIWadolY1v6YdUzEYBJ1ewiRqSHfaEKb4B129LKB9IcQxqWclQ8OR1vCwoqqoKEOAJotPtB0i0Aqu/nNCaXrZMUao8GlAbeBE1oY6pyFOcQFPiRmRVf8u/IyoT1+pHZP2Y3SO/5Jl5fYCq9NoDqJbc/zGyagLbiePp0pnaGRrG35Zk4BKrBWGoyg9GtdxEukurZFbhJf70oZsYUcFlzUOJmdcn/COuK2dZt/7vgf0/oIRRjlePr9BSX1ZUEJeTw60XXbWtFZ3qb7n2s9ge+Z4+yybh0b2JO5v71HuR9qXOKMuPHmKLF8TPG2DbFHjec+gZvNoRrXLjjq1KBoef+IVDkMuaBLsjOrXVlI6fZjvXLl99vpdh2WhSGSxVP1j/gW60gq2umzTGlSd4GLBfnPK5tNa5U0hAI8sMxqltSEwFje8Hbw/AhnFGoIZsXWNbM9ElcZ4fWQYYM37IFjCfnhwFr4MTY+rnb83UcgUhhgY20+S083I29IEZ+gsLPq68we94qdaLsQv+qBCUTc7pX2luFVGH7U9dqFibh4x2ZG1wH3kG20QbmmXXdvMiLKzZ+Z1CJoSxRJ+vrY/Nth9SIKWyeeXEXeJ0IfaV5dUMjuDWhRJ2mc5QsjQbM/fDwVp2mYMQiPfvz0yGcwugeayIjvn7jkHxtu/pYzroxZuqv/LKtWVKRsq2tJD3RNZ7Pd7bPRGSdStuJ7Rhfdw38QEv2pdF26S5IEbW+hoI7/73nfwTUiXmZ7yh8frvQRPUuYy/FfmKX+iZvE5qvJkNQ2RV3T8OZnl+1P1nNcHnP8IhwnwBrnzBjSzbVDuGadiwnW9XH981WHzA4W3yjOliMdjYK8PLpHhUdvjjTW3y5HKhul5N75fk+0Q8FqoEFbrkFroP6g0TOnzpKyroYSLdVx/PSCl4ig1ohtwszJauEhl9iCFtmOeu7MJfIpIn4jxOAHNdrevSFgOxcvVFHw/ATT2RLMc170FGpRnmolz9IuLLE05DPYPXPxsFdhyntwwDLeF8mGnv8QRGVN8sE+Qcd/M6EtZ6SfevCvV38AO2doRFsYyokkyu2ridBg57bLJTVp1lRhsGwrt/AWHCxxLq/Z+TjrYAt2PXe2a4BsntMXNzMXKHmIvWOSvhkj6yjq3H5MN6MO7by8/M4m2kae/N3OmTvf+XjeoJSmA5fqp1v0yIWR6f9zkViwPGTTsT2NG4aXzhY/VGGso00asabmaCsWGCm0zjtGNBy7EM0/KP7rCP9jXLdsT1SUVSgxfE5sD1IDDDCXbD3jDBj6XGLpRW/JbhxyfGg6/qq1uQFgYYGwa4ydROtjm8xne3CIPd1+hXNI2NThLGuI4si3GTsQYQr8r66ueOGSuWnZnOeImRe1YyIJN9Eb68DuQjRphadJSyLxtTZ5FS97VSdJu5cxsP3akhoRnXDLh+bYrBOCfduMW8b8n67+Pzh4B4rep9OUE9B2fJ1LJvzWX3dkSi1zae7rnRYLTwyLXxTN58bj1q32Ux8PbzCCH32ozUcfkqC6uYOOGVeWfvLgOqXGS/7TT6QIeo4HCnEnPTC7b7vvGZ2sAaqbi72sc/8fRlbH8TbXfiNmmuUw9j73KVM75DeAZqk+Ekndn3ZuqjVO9gLxDJjsczquYjqoGnOvJrFABVsAkU2sm0cdf8FTZYyn4S9qA+xMbUj1En59QYPiFZtjGX6reFSs8WEzuj9KYb6dXeHniF3a+GrWQadgLbf0WfnIofsEyZs5LE0O1cQi8yC56Jj8uFDFbK18w5gmu9xpZxlEwPj55lR5SQ5mVAvJZMFaMbRSojE/rNU6Tmds8kz+Jw/43GibK2yYWzSuMuxEo7iU3UhJ+9K2VQpDf7Y8rZsz+pvmH7JktvHptIyPNUSDdg9TeQcvMuT/1RffxvQLbeIbQjVpXs1G/56mOsSZwWpL8yv3rK0bds/JP0Gs7gZ6FnFFwOTjfasf4qeAAHa2vdoY0rwJXrLiKRk4ZpWE1T4JmLWF1IL8AgY4DuIhgr4vl/gEK4Zp1FQgdjQxc3mcrJFszPEwCw4Dued9Zm9nv940+CG0kRaWfF2Ar7KgR7y3OpnYFbl1KytUv/BtP1DDkzzHG8aVIzAg90AlX9yATfPxIzdw6KR/5yfN7YcgwlaPvJNnKMTbWnQhi1CIh7b1+u5py1BcPwfABzR4X9BehniyBnCohH3M98AUcf7gKZb3St/56hSCafpHwb1GuEhrKIh7fc1PDtGar8CmuI6+ifiHzJqJb1NuVbM43cZojhIu2/cb0SVUBgaChyEALQVuE2wLg7AOPOz6Wssvh2asQvr3nTTcgDgXUXGRj5YWfnNYKOr625sdygwe+gz/40zcR83WWxO5L+4vN6DbRA2iH9l9nrSSZmPtiH7hW1UNrSTElx75diLP3JVGaqZFrG2b2P7zSf8TnnNRANyxPZEGgqe1OGdHskaJGUGxuaoiobt7D0XQWzSaDvwhzrmzJf6Sx+FcM/R/5dwn3+ubXmjg9Y6n1Z6mN+y1JweuZVRfresa2kJoCMVm/20AJPeihBk0bfSRB4uJ3wT0/UyI+UyWVUDU8jluSc7PlOiDgUIJWByk1/9EIcrSFx9D+s/6OlaXKh1TvJaRVzxikHhMjuN/5pRrfcllQC83MplrRviLu14qcQZ1qHv8OAv8NNZnSytaje26nxJ/J5Lh5dTyRHHNVEK6u1JykDFS/W1nv3euQs47PO2SWLDKIsUkMy+LHPwrKYm+R9N8lgFZKm0wU3bbRS0PukpdEqzMUHLAerLy32/mh+Xj6/p4bMtjTeMdNZaq2fx3byx39dyXydBLY2DxutADVRMDeBi/ddVOMcAS2GwDb0wQz5zmbU6qhXG74fC99Bmir3q+sd2aY5mjNBDMcFMSO9xF8NpZ04ZFDL8KYaQSuODyMpjfckI7rnydrOakcRnUrt2H/y09Zw6kdfWm0f9QYde1qFUTkhxneG1CWIvQ/iUxfM3PcGEFiD7mGQn3eZ8vHtAPijh5YpDnDkrAf+QOIBwWbXfT+m/cpj0q7hkXzi4ZuSODNOcv9YkCQnAiTcFLus8bH9mEXbD7C5sPR9N+ngRtltNmVnW6Z99aWP7/qQFPV5dNoVPIJPHJayM7lJzl/5+bkM+k0AKYuWhKxyAQMeAS7uvasn+ezvH6tiyC0x70fGxFTQ61z5fQk9+9L//ccGSv176KD37emjedD4/VpnwgefOqL/CHOqfsH6uWMt0/NjYcrCvvuR0lukp8wS8ymRGoA8lOgeAS1w7pDiso48mpmWqA/ellzLV4nDe6IyHOLThNvg6NXqq2eLZRzjX7D0+7G2y6uMr5myP7FrBhpRF9nQf1nhxWUZ89q0MHVZvVtldpuTQOdU5TPN4pa46L0sEKPYT98XD55/ogp8/xB70EqU0hK4gBuyRashrktHwrbY78x7pObX9QecBAV/VajLNldTTLolxTy08gCOGMKXNdL9aPQZ/BYWsHleIy5UzfyD7Wff8V54/Y/S9ovmVaaKWY34Pr9G0gYnRqucXpOhY+7rcr78D34exZJZrYenP95YV8oRelExe21O6JvaXML21UfNXDYTAu8yiqh7V4hfYBmT+dneheLMEI/+kwJ7yFsYz8YJtSLfiw90j57X9Z3tcqXXYcAbGcSaUvgOcMbP68f9xo6VvlPnOL7xOUHxnlI4IEk9E0Wtqe32kp/wdY2fSY0P3BsSPQU6dT0mtmb8+DY3zvJA4pAR/PisWlxEpeWCs8WCJ+4DPUl54y2Qcc6UScux+fXysYe0EmAt/HmaYOvaBZM8/FoMeC0D/o9ssCxgAOocY92Cvi2uqAqhcuYoIMoLuiepVXaTeXVXKgRvGgZO8sAcN2B1wGI/8WWv86mYmzYhrx8w4jcCmuMiGuHre4Cl1bJNW89Jk9MV9Yvz9WrbF6T2RrO3FMMCn8gJ6jtUaYbM4MfrfSPOWLralRrXJ8bWJ9ZXuBJ72UVUTl0zPnKM+27OV1r+fXkUOqi8CDkaSZRgH1bX8fC5DMdN3Saw8eBDhPSnZOZPVMwp/15C2Y5vjoWABtEhb2r5A0BNObATl6SGzqCj3uN2MfE9yfUtXOXvQPJLfXI4JGiPtdPGlvJj7cHzA94YXmTNm36vX8t+fzvfDgO+jsmlLo97/jBmdlT/EN6OY/Ou6hqv4dh8c4lU7TFsesg92HLL9MHzkw1JbGnijIbIK2Efbunbml8DOb/CJoTxJdljYttALcPvSSZmSIY3kkG6Ex2qP6u2irCUF7sIbehTn/wyfWnhmUfDY4rp7hQnjwj723Q/mX5NVFLthjar9GAcZVEGcCNm8fTA2933fFt1j86uWOTU1l3VwHTtbt0qLYiKW+qLSy4ZRIX/lQmw4mdBpt6GFxRaoRDb358fBtu7/ik3Ze5g6oecv5dqyMd1+9sRh9vAMx0t+7Ottme4OTcD6XZxOcTS9VYqm0Tc89u+xdWztDK2lI0bLNFgFeKm+ompm7gJWHyPzBLpo27D6Dc/6NhmKl9tZo8ZD5lxGU2Oodj6tjjCAhnkKEQdKmONYgVliXMSe3h5618h4viD6/zKUGJA0fdZdPXHJWvZ6lU4pO1ZclDrO/awAmcF8aYt47O820su2Q3h663al396YvBvyc2bGfq3xdkIUE1kxfCLgQ/67o8HgUQjq1veNOm81HKW3yNFcHg/bViWri2xR6XJiwtn9OQTmMUdFxG24rw5cZNoPtiwOv8tHWnb6IzJLbrf0v/LLR3PDdcRHE+153hq2JFe9Szw/D7iE3/s2kbBvdLFZCq+D+NnpTVF9y4L7uVEUAnPZ0tYpYvuWQyt9Y8lUaG/GLo+fn2X259Kr73sEvpY13kNpJi6pO8gSaPFn3QVTpW14VKKKrEpKYGN31f057R9Y8Z/fJXPQOoYrkU+jLWDkvAp3sbJe0dAZ/yKZ6u8z6z2KtJ89XJPOop5lXypNlmCXPYuaR6FtOr7e95XDkjcJEnEHX1U00Hi+AgtdVtFlZ99omaNF0tbKrpeiMpm14JVZtfdtu80FDsyu3Fghbbn1XV+xA9VchRw8pyJYqFsj1I48BjIbT6ss8QlFN3kyMpt7CAPMC1t8FHRh0tmIP8wESbYhTaXhJ0/cdtd/pxzwx/AqmXGDOmd2x16RhaphBDgHpAns1sqyIWgFwmS1b0iStksQHS14dq0dJQ1DS+t3+ZisYMJZwldoVFP9Thf/2FQEZW3ow/dIjUsy6uTaiCRVW9gk32eM2dsh4/8q1Zpl6CsXvCKNVmopqGf5rkonAqCUJ+GgwhVM8B+ekW5hz3xntQRlIHbV1G/ImaY8i2jWGZqVcEmh5lIM01alSRtPKVHWj9JDf3tBnMsw7UFe9V4WzkSwUOkJTDaWqNu0q9lRcCmeGD1UUG8hsMpaHEcQkHy4qrz99m7ijqjv0qOmO1XFbNlXK+UHr/cOWGGxtaRlxRGft0NYkllENsbd3bVYm2IkXd+IUN1t1InHVZpelqZXGq7dp9W67mBaKuqjAr2cGl+buN9le7fy3CBQI4wLZUEu8zmkn4yCVF406ad4nnSsQIf1uQa9jeKEtjTXZ9X1JIzw6rg8iJ7y7cwOlxC7FJjvWepSggwQQj5UlnVr8Gcuk5ZrBb5O4dSG7uRzpMQsyvmnwUM1oQambsjPeaaQr+RlUgqMZ6u4yafTJGV7a2aKr+lxuZ+wdqA0OG2/mkCw1YkLpBgnWUAfHAQy3AsTlwkrrUkAxfDj1wwYMwAwa+xFdTVUtqm+ZY9Fmg7drK7mvylFIbHXgUt9nOE/Uqh7BGKIXUk3+eZxddJ68aBtRBAJp4XSxI4tNCPOtLAWujvHAGC7gSXeiWr0FuE5hMGshSdXgamBJ5liK2qfGQmIcMSpTy2CbYLvA6SjQcr33nDLbujwDU9KJspv2NOFivnjzG+ufEyMa4vy4PbzBb7mRS7btISh/CKWSg/fOIyh/gbbOdGl1EIfPv9DWCQW86LhlznnngrUKAcYce1L59dVqQBrsKE7snt1eEtEZ3bLQ7W7Zb/Ms5FlnpRnDltwdza7Y6If9+7J8qoQoL8GCiLIy7Cd50Gj0VpopsZ5g9fCPlMsnv8tTAEcLVsFJjLVQmBmYCkN1kwksxANOlGpGUF8N/8ODUTWvblXclKwS+SGQoI2QeI5vCgyYeph1wxG4VfyKCiylBiHfnVwKNNG7fNxY8SH68X0sYl+upN5Ojs9KXmB9ag9LSvcn1tzzd1jlpunicWpuNzKdjYRcrE8H9x40xlnX11FyXEfunqxOzQ/MaEQTI8TYeK2DGUDa+8qBBNiI8X17D9el1nDqa9aXY3XcSM36PQvjiEUDfzMACSLswoUMnju+1p7koI74Akt1K1Y7+/3SngPwydSo7uWqrJ6amQv08Vajgrf2csHeqlaqqHiJdzaIG42OuCG+IQs3oXjayQ3yYX2WkllJ1/rEH4bsMldbe3tKVKjuCEgG9khvbMb2EEOAyisx5R3DMdqjrlMb5Vtc6DXEWJ3Fqg0m7vSBnPz0aiyUYJdpUAZ3jpqbPr5TfWXKAG5nZ3HPhmlOqEvUIw3u8MR8FPPqW8CsDfA5U4ftiqvq3peEk7Jx02FRGpLdgHxCyDhxJ3WLfIq6BhZSrz7R9P47Xzz4aKpy6+qG+ZNh9WCxjMLqoyqEe4KQSlcT5EOJJvKt2ktU6F2XVSaYdquQgmMbcY+Vb8WuKH//jTZFch+wV+nttIOxt0IbvTppIj+GNj9yCXL/Z9/9Qf6iCQVhuoA0Fq/h4Dm3PZnFF7uqfTnsFEMmacCojHC7NifsILM/uo316vcRr6invkr7OlTFBHD1G544964qBbv8JmGqGe817SVv7KAt0tnKcekzS2zP4LUIpeNSFnAOw0sHbiQCXHjb9Y5vaeHpPnbMwBSowW4cyUw6qyJq9MD4YvtgpWfpY8Ctem7p17+JocPqOwNnBPNj+N2an0Lw0s63sc6k0R/HUgS//iA3MdhA1CAD5GRYiktdInBFr7h8fHF7njk2wh6SqhSlZgh4oAdrC68aJgxxUZJjg/jcVp9zfCzelDdXGUVAIRONpT4vZ8rGawpmEgHspFmCDWTwou9k4JbX/aua1MF3q3hqM4+6cghdgKoWrLwZKop7r88qV0AO+YzGHk351FmzJQiZEjJRDgDeNTvJe4rJ7RLIEQ+FPsGtKDFeU5cDwUCO4nd2FLDtcmly/FA2RXsUU9JvmKmMNnXN24gI8mFbLagpm1BmhZcakOtOL1vtPAlCgC08WuqugeNCC0jQ0PMMEPvKNd6LYm9NFPycnDtU961IQc094rMYc9Rb3nvI4XG+O9qW4QqzWt/EZSwvvyyqwZV+6ojRKOfaywFoUvq15AyJqMDSSfz88GuTqSH8gGA8a0m5QMYGjdXmJn+cfSu9tTnZ1LQnKkJRaER0F273bCqJwP1Yn9LlxVorZSAmOveq+PSFn8GVoXoBWzmtMbIMLLjYk+JoeKbSE2hDXRNGfIsapokUFxXvkPvmXtBdqWEpeat8YaAW76mJEtzw3sieWeYg+728qw2zvYTfKmYFhawCpqQi0OKgzK8uJV84p4XxrvRzAldZUZtb6P+DDJ4ZGlEYDvQ2sHSoFvpFCyXZrFC3+4Ydtd49algINOHfA3mrfzOkh7IUsy5awPK2Akm+vIG1oLXTJjyAJg/AvEylACjqw6tmzwmeul4zRpb0rbvRD65YDW7XG8zqIO4rHmeRgGvF8gXXT2c8U4Fb8MDUyKapfWTjp2oEJgiFe7XdWzPPIq80cggac6tmdwI+x4BoArZa8opa4UYHQj7nZRqnZRD9s4b4TKr5gZ11quaAAiqr6qR+qytIAJyUIx3nNFK7jtqWephPAXBfLL6dMCCZ55JCdKKjSygF+zluH7F+j3L+B3GUQW+bF1ahYOFQnGHvhm0TMCobRghfbn/aUtXltledDvtDkO0RWzZLFtNS/289A+rS88bQsG1WXpSt6d3QEx9ChPSm9CATQeAgr9FwcD8bOUfkBBs0vI6Qch5buptjlY+TkaHgX9TpIDy+r+GYWY1RnkAk5RzImVYBfYXKLgJUtsfPrbCPcflIi1bvfkkcK1xVciOCj7VTWeZPpWef6sBUm8vkzHz8R17DmBUgFHSVJUNz691LZhnX3uCiU4TAOwBF6ZkN/9gjnC1qirSAPDp0lTYtSJAs30qUqXZ/h61V5/i/tHBSOWuAUT4xAJN84P3kxnW7lxP9eX4TXdLUM5quLrXjwuf5LkiqsZWpctn+bEzmjM5rw2KT0JRK2TzJmk4+/ihoDJsakN/bnHch6NlURJYWG4qmO7Ev/8yxI749qY6nBnxmvNJbK84sfoL+7zps3uNQI+W92gBqKkKPoJYQlDCkV7RPNbo4+BzTLGp2bzh0UyLc33jD0uqqi4I1UFTvUXziM1N7KiwI6dw808e+eRXpPOC3dYXKe1ozdBId3CyZcFVBAQt60ZBVBQiHhRoHiYw4NfsdrvBuYWd6KkQARe6qMrOdUmrRZHK77Jgi+WRamWyfB7rhLlsFwJJ89fHp8bhpTuxVcHfdeKfGoRwq5lRus8u3g+UbmlGJ375zNEjY+3Zr3yPc2V6mlRGfQ7eQ7svZ8oeSCWBuHUueJB/Tdo9imLzqMvUNkMsPB9iCJ3mYX9ki1Mngrvz4wR4/Bugdjn1Y557iOpqtOqO+Ra7wK2xvYE/BtXD2Ys+Wy+PJOrenxdPE7lMYnz4vcQuEH0th0Xb0LBn53QmNBT+6keiLMqJfN14LlkSgEOQQ70O0VOKkejnt73T+Adhpel3gDmViRFPeb2qN+zNhDJT9GrshiWsfGQMQ+W/DGQyBk28TlWuTb3Z7vx8OR+z/r8pPfs4Zu/cMix/P8VDQAqPaD6HummAHAEHypp4Uj6CeCsz7DqVn57lotx9YetzNLf7vFxRV9PKglvjSGKkj8RQBo/h8dLOhNoALXejMZAy3pNi0/rNrRMibPoTy5Em0+h5q9Tx+50+euLdPxc3FH5mo5W/FwGlVwlIU3gzG2cYVPdinagcCzZl4CgSm56WpRcXwclVambf9r5rjapgs3jSITQN6ByeBSpTXGXc0cEKh8xqPCASiI4hfU0lJOgUM0m0+YEAE9sYLTHjxMuyFM7mauLWFP/D8osRtO4k39ksmxudXNUoBfZpl9wtnMBitsGUq7wuWHDmWRS1cwqhVBTMLd3srpIVT4fivTZE1GqJ2TDnxcMegiafoGBkEmnS5OYUwBJ32YWv3kaklgV+SZ2Rvh5iy2Bu0NFzk+GboaSvJuNhjUiq3MtOtWT1QyjFLlUqCxdjmMW/DXYHAhd/IjNiT7QNmOOgfklDnKFQXrqqdHpOeZED2SJ35IohKlxjv8pivD5aTyqhCmpT1XSRMz0Wnn1K1T2jhmunyrgkmMJKBFJp2fLAQkyNirp+PX3VABmLi93X6xl0QTkNbxDrWucPbDrpM2VNym1oAMQvoGXuqkNUbQpjAVoBbIV30UnjhhXyCoPEYujmgES3YAVEMXCwqlM+fSG9pYpHDnxTvmxKCsh+dl2jz/JSAXPb6lQ/A7KesSnqlAmVlr37VySuvVrhdKK0GXtOurTF0m6YC19EgBiX/m2WZBQSc7PKT7t2Z2o6TyRokAmuSWpIa6HHDyNc81TyBCoHuw1uZ+SkPTyTM8PgcDpZKiwAZykZAPutmNhj/SYLKoDki51nlO+ym22kgn+sRyqNM6e1T8dPxAXcUWprudQlcCuoB4SttZPLKRwK3sN33vNK5MA1fP/+ByCGJGDcmm3LHB9YfWs5y2EsPOpebPDZgd0zYZL3kRONGpkqjjctBTJ7Jw/VGLXGqUQQf49GOJSxcwnL7F4CAG6O46vArisSKisoWf66tN3J7WXuxrnD7hfmxU7Knbv8YLjXR6gcAORvu2IfeCDWIgage8hKOnwNF4qIrFOvD5eTJ2robrh/JEiC3Df/+LP6A3fcjiQZ8lcG7r2YfhJ9A8neidsqhJacu6FEBzLGCNT4Ye2VVWo/L9xSjuE7dSe6X81bF39HWoItA1F+hjx12fTvMZzWx6flgqiPuBruwxAlv7CbQCaCnaHbnNKiEkXq1TWAF0aU0Zc0j63BDJgwTF/0kDyZ3THuHk4c1KvquyTrwCpfwGTco0Nqjouemxb+P79rnHaXDv2YTTpA/KkgvMstl35t2NNVBIhsRQtzxaR4ZVML9cHQHtSEGdqitRr3fOD/T8THVAWM1w1wpoWZP44X0881LaG7a47Btp+cd1G+aFSLDCQH38kx1R0cLQM4QAvBHpJSxcLWHQ7O8RFi+MF1LHBQH5W8b/HLD85SxFJW3AYn/8wMVwb2quGlO36LgZkR50szjCW0MWXrO5o3QrJUEseoF5E2H7QDObJK2DV7eqQHtLndFMBFQ88U9wGJ4xJUYthdPApv37hxl1AVvIn/Ct3+5oe7mQVqv4Jg8CMAOYXBaAJuS5QDCN1nKRRKHZMiXyN1vXS8w88XS351BXoAYEqMv0p9S+giU1XiVUSUlzWtsCLZQBugabBk9QbKLY4X7DWhxU/oVAstkuJfX0JCMNKqW2TOPUx4hXzC2Nx68cC2YoS2bRGyUR0LoCOFx4+I0xJx8lwF+KxuIhYOytyRU4HQPQaEO2wxVBU3+Hl4mR9riOfjaSiFE2mTLCLbC7pxlEgZlfIb8wZbKG762yxFYLfKXiqcUcCBSpVDWnlQSWqyS97kKv97PL9OUGskhojmU0GtqI60E6nsQHV9vcE8BBZiSOnUJcE43923s339Tj9S3BOK/zyUGD709Z4kUxIShOh3RIP1Q07dgvK8xxXa6Nrd83sVrdmGHL9poL/6vS2mOTsr1CAONJgRpi85Z1/2Rw1OAvlx7dLC6a86a4Ixvk82iH+k4vTjZsLaNG1W/8Sm51OHdrvq4K0g9jO7tp0UGQ64jenpltnAJvWwOXNq7zJRd9EHexYN0LXYHKvhhnJakKg3ObC+Ef3xoAG+1GYpRKb8HmlJV1Arvys0CQTQaSSkAJAC2258sq1smQl5eEAnpQVOO8K9kjIBmAPYqeVnU/dELi2lrzdEpcajNPcfU8lyz4sV2ZHsAYiX8q1Xsi0SoWtAsIPZdUa2LGirmlAwsf91M3DWSlbVBWeBPt6JdZD4EnqS6qyS81Tn2xYVF5vt/PckJEQino4nseel1xncnZtkcrtOOtnR98ghvffDua1aOSWkyjxPNjRriBZJ2Y/nspImdSDbVMekLOLknjnFx7jzqzieBNjexMbI5XxB925B923SzWe9phkn9JpGJm/KMDBYCBfLCxRF14n1jmaYuTZShsrk76P+pU0r4WZVkqgCV+OLZjMyY6FGNK1lDwglxBNkgCOwBfCURTIIbeUPiPGmwmh45Os8an8bYykg8K/QFFhqgnmwYWZuNqmLH0M+JkMKnt5d9WGsnH2KVUGZOuO7L8WGsgrMHL/KRDTnRXK0GvA8FQPWfILSmslMJMYYMA/YFD5AVSuGeAhQIbvT3cG9DtjjmNaYZGw9pSqV3ljm3jLAlA6ncoH1rM917mbFdhuQSCKxbxxyzOB894WXRBZ5CbkmJKzgwVDQx1bI7hRtKT17ItFXJcLn4XFqUnobfXWJWWxS5ctBJRr+bmzl/OzOZvSaJPvQ4j3w6+77pka9/EzyQs01LoKJo1uKqfDkVBNzhI9PORgbVu/12zYF5ZhLtjVL1VZQQ2m3hOuU0oJAa0ToD+N/TWUA+eCoOBCEuyllZxnhH58dl8/2SUHyxl3nPYu3sm+bf49xGV68eD0t3Iec46ECukmhHRzQqdL/Irp6tMTdEI2fEyckOtPPF+IBXmjfqlg9BewZudzGnwv/xGUgOYswu8FS5+S2ixZcc+jYndO4Cpx584HjJsBZdljAMpbxzptqopi8GyHNg23OyyaVnmLkkltwlntATJHPdb5kXH4+luBsEDRsEoU7bPEsZI3YzmWTyGoF7zUIzIhFPQljmnWepFxxY0pB68T9B4bIV1Vmt3xzy1GGEtSxRv1TO/2AJxzkP7PX4yC8fpu4+xAca2l57OL7N5h+B92YnV8RreQmuXfMqC/Lf8rq0MgWwCJBiosigI5PWkGWyXLPaRVBtszv9HWTvqWyovzO7Bh4XywCbLFoFlVm/GZxEpC2pCFL5IKLkoJF02Ci1Ld/QWQxxnSLoPtnf/Oe7rs1cwvVe/yaXu5KhTzU7jorB+3olew9cFdvepFDFzGyXLrQPEsmrQM7DcW0iaD7QXsl2ZSlv3EtNRix+TEe1aVrdh92JmBxKbwKdaRKlWY9nBTvbhyRhj+LoPKLnA8LDBwPDEt38XZFOkBoZMdmoPPDtGrvJMDxncl/XxqECp+q+uGVoaRM/P9/dbdk29rU0zGSM21wwg3WA1YlKW9EKIHe37GqykCMzntKHbMLeWoCeP2T/bW8OP4VTge1J0J7bQhtuHmk6+ZodccdkncykmUKAqUANyj6j7ovluoESFnksvdInVYRmg33vGT6xAv5HYqc42weacuvXpL++KrddDiWek7u7UtPq6XShKH24UkNqxHSrNE1TUl+Tia10ayIrAJ0lwlxCfDkpo4zNCF5aAZmmfP5e0ItGYr82m4kQXMuicdbaWE5wfMg1wSQmUhy9mNGfgairFnuzycx5VOXs9U/+Uu6g5ra9BgHMpIVpkM7IiZgH0vdGHRYqYPmyhhUUgvMoKVEg6Q2KKhPyqdhVKU6jbtJvus4xjnmyLgREpvvSbd2X2Kewr5aaxOdpPGCWBlshIY87Mrl94/uzuFKeYvlLFLzxRf5VybpJlHrAJVIU5huliYJdAhTOiJN+pqAN3DbxLXuBXbzOsgswZ3znYVF/m1MBYvul9DQUbIOPh3ihLjs9fv5Ekj9wuYqdeFHEVu8ISxRJPVATrPUOniJzILZHu546s9wOweoe1+l9lvDMh/ZIBF0IINQYtFTZ1flsXD8ijlqf1fsDZEZVZ6cRamJL52mR904hDFlEmEKpOXkCg/q2m2ewMch0E06Tj8bhUqyRdunKKsDeLHEneT42mCNy/wtdUi8ilUtgq4Ps9X6N3kiL8SpfKzFSsmgd52/LxXWpc9fNW6w+b/QijBrrS5JBdHh3jlOm4udruttMZA4KscoZryF9aGgeIf0q7BD713wj09iPb/+NefDZUkqeV3D8arOlRkBjKHOaHeWrGEa1P0qvH6MLZdwc073DmNxeMXQ3MGeObEgW5D5MZTjDBBbKxPduLSCeZr/hZ+1qsG6oKpJ3Foal4NxoatpthVBKRmY62cRl9XFLMUCzdsc3PKilzVNSQkQpzJpuz2OoqNoRlLvRTD6wqsGYdyO+Xjxt8/QYFeyrGqO64R+iU7UtOu3xkF4df+5yhSNvNeyJZAJ9T1gb3mkpJdBur1fmnDQHyU/ov1g/3Y3Vd8sZDjp4w1Tw5udrAvLsdKgJqkUe9W+JCSndM8fpGly6MYopbgPzGmiGyJrKx6GsbycrE/ByPhpYOTwDJpDuxpfytrIOToKXYNd+Wq0xn/3uUYV1V85CLJ1xroVU5Y35gFliQxu2R+GpNTqWswodt2oYZeD0kJjNZgSPfON0tjSjng+GOOUMjhU6KQtIXMTxJropvzBAqMJPQPj2m/x4NFfFVqxexCr4NYAhhadzQO34TPOClxgyxJv35lacvlsSN5JhSs4mUbPuuyp4G+4FWXV2cH55911F7Jcqm49DI3gLmi/inWQIT6cMgwq9ZVju4mh4a8Q2XmvidqkFWLXL4WN/lgiqzs9+5hYdz49wTojry83Z9wxKyeC3xCoYvpWwPGP9WizyBbmBZTAgDLsROPfwLEn/YhUP3JLrL5rN8toVkcitQg70mAvu2gP9ICzPjbGnJfqJmZ67RAujr4kZYauYjOKfNQjkuDjI0X/C2bsJ6iyM3StAtlcasfDbTYI6XwNdG5ySYT7ivRTa9vUWlp+GZw8mN7BSBAwMtxNl/Mi63vvqP5ngT+TpnjyOyj0qsfMTqbABsymXBqs9amzJkx5jYXNVpZOVV+80/VhcxRKqRKeedQ1Sn3VDRJXeVuUlq6Ddj0O2nOCmT06bz4Pyq49wwWyMxGMyhk+P1+19O/jXhwYzgzviUTouMModDM63i5nYvhUSfdYSyunduNY6z90Wjm49nzaoppm0qz5dMA1Plij+Qgp2IvqcqKDnfGa+Lzg92xPr/Tb/HQnJcPZ0biFfFCAc9hnq3ZhaWxoLNN12KMy3/bKVwYfG9y3R7vWittMV+ASdOuH1zPAEsUsHzuqWh7xyUHVt+ZpuPboshJZW7U05ONB5tV0BsLyd5+j5cjXtG+D8SR+sGWgYiBPa0IzPMelsDLIuvU4EivnQgd1zgOkZJ45bsSwzrzLvFoELNr5Kdx3B3+E9ishK0+pkflJz+VyI3dwzTavLPCliRskr4jLShnNiIGf+sTFCX5YCpiQlhCX7BL2x7xPr6XFHvl9NDQooFt9pErFMav5MapxFof0135XXF+dlzNP41EWfLlaPCC7Pe2+p7cZi+9+y0LolSV++r51vq9AGXjum2XzquR/jso7nhacBbwz6hmWk/+TYNF8c2LuiWivBacBFaMSNp8zQZpc3yrwylK1Q3q8dU0FylRKicxQjtQ9hrtQwCT/FStxz7vgu0KgYBIZsAvkbehD6P95olpaE8pAgvAkMC228UrOJyCcsYhqPCAo/x+sJot9Wy4U1jDLLB4Qo9UoTRivTDtbiDCHDkhHN8qObyH06grLQIzxJDHtuPGRx5pJc1PiFy5/ymOas9NRJJxPJYDZdpVnd1fn7kb+kzAIa1+zHfTwainbR+Tx1nawvuHFe3ow2/zien67qJCEUv+LmvoSlF+U9XMUWqkYf11k/IY3/dZJZ8XBb+CnXUkQqj7zXCOoRKn1iiliI5HhtQXN85HAKQZ3CYJNBwq/LTUVO2i7v7zlcdtSBsxfZ4X4+m7mRNRyO+Z58WORfDK4RTKHmQ0qZAP+lM4VelpMElr5r1L0P2y7avlYbML3dGGqN2Ljmzel1fESlg5B8ZWE6kNrp5edSI66ZhUY8pAaua+aTW7N6vvQnk26L/CLyekeCvbtccvpddG6rfCX+z4qEEGlpn00j7qd5cM3Qx13hhBLm7yoZZmcSzS1g4eD9XjNTWJREHyTTnZYiReQeATalUynTrFhZwwyFwxCPlduAvlFDaf25ijRJivuaucSOQtbxclYLwFOXvKGDK1sGrrIiWePCeqZfaGtHcuLZ15MKfOZE2OtORx+FcDD9Hb3wM5Xzvx7/spMW59Fr2b4ZfPd/8F20VN+lXzKgcnenGFW7kivaabuJgj0sWuJHNkEb6bQlM2VZ2BuRPJt240//ZEuW2sYWOoBQnKhMUH5uf0L+09PebcRSiRtNNWxFSHU5DiSMQs+VYdlCtECTFgwg/4Ng2tVjKT0lXSBpwkJIWHOh9gMlgjbawSAsewQnOETXhe6Qnuo4TFoFe8OavGBvhCNZ0/Mbzh2q0mzEJ1gLwhQJAuCb7tzYpMCXaJzSUK5xJu2+WH6yFsWleniyuhk0aSGUhZ9Re7sotVP6wqwCVtHpTDZr6TA5f72hesthBBRSb2fzL3XW84atSc736XxYl6nT7Gmekq/vaSC1rkyHPTpMwZNObGD6muHFdiK5oyVwSaVH0rl45vcw/1SQFXmPoEPmKdxbr7ElgZDhGjSwDS77joemDs6Oy02tpH4MMGHLqyj7hynm2UvfjNXhzzcaR3X+JwE5jbIymxRJP+7/ScXTa/0WxQ+xvJ3UAzDACCjqeibIppc121gM9bWVPk8QdibVIAklXdGp2KvjGjVNjbhc7el7ri2pHdOLAEAshr+ANAf+epmD8PB9RMQccmbc04qfCJTZoDXodo7imRVpkEaOsWH7bjVZLf25TcwYgLe4WSI1MkHohznRhwIpC0IhmOu4r0JuPqrrxFRVCVsdctCxbRZ1RfLMkil2afeZndN7pZOX1IGZmuoi9vtxsu40k9dTdYuKuDeFsrPMweDQF1IVvJ9D+9/t2wQmCRpKKXDH+5gI36++ya2lolpmJE4hFb3N2coHgskC3s3wFFw3ZtnLQdiEAlltYua61GZZLM0JewZbdHRREA4tO9PjJuYAXdf1bYx1RU34HiQORtSsNl7gYVSf8OKhS8/hlUnO0I3U1WtB4CFel85NNIyBrQlj+ovHVCGbBzug2b4ujMzGjiQsW7QPkvGEU9pltJi/7RYBZyvRR+dFe76BbNR3aOV4niM/4Uz+J+uVdCTCcQwu1lG5ns0tfWpCedwafODs0vLMTVfsvylUGlUEkIuqw9GcQVlsiltaS0fyw+0g/j76NtEJ82dTGG8POp1RRXvj9HeeC5DZdU75OlRbJCYNiaxCt7vkXxWvlpnEAtvEe7SkH99nHYAVJIS+luFXj6iW7FrKbBmU/02X72I4rSlQJW3d7ZtQ4/fWwFdWyF4MJIoLWW1fx4WkbOyTpLeYe/SIbWrk/OYdnhM8LktiGsjbqKhXQ0JPmNtEXHTyIhfwEzcB7c6Hy7+RXEWnQqxfGUCVeNiqwYCON72P+jJHd8RI55N+kBjPlOocGaicrY/7dTT78Sl2+VM4evFM7wmq/xzIgmvgUNCZ6bYhC3ogVULWO+9j5+7IOGGPkDic7ZF2V5v7ZJ8xgn1nEbkNwxlSb+a2tDIvdd4NrFVjjI30qxXXxckUWTuFoUH6Vp3dv7Ubo5aaxrA9mDOb4djiiDybpcUrCGzSF5nt8p9//RvJKuZV5kUDYBOh/1CCB6QQUmdk58yL9dyUNlCByiJW9HrwQTOdcfCh1S0p+xqA97q0C2C5htrleo2rcDhKOgvrP3+U34RBgLumboXmlVdrjmQ8p/oQODkF8qIiz+aWrYaujlzGiVNeMmmRIoFYq9UiJfU5zDPv9/ZL15PJTf+z+eZBtFGEuWbIMZWZIllH2bxTJmiBIKlX2XELJlyzYGWbMMZqyRJXtFtiJpLFnSYi9Utmz1u2+9Xu/3+/P7Ph7zx+3x6tznPudc1/V8Ps+5rvPavydSShWFsmVJgqunRwP5b9hzDawZSpnQH16dO5swPhU43Ch9vVi0ns6pp1xZ27zVFyq5sEWb/saluRz/u7R5MCILDRCtO7+umE4cP4Y6DiL8Xj7GG259NnlC/zNGwKpclOOEAen2W78fMonYJRmBAMW71fHKP3sRaq3JBuC6U8e1T9PB/7vq6Dikm+iP4kTAXoBJsDBLewDXTmgx61J9ulm6ZhkmUmoceIr2cEfQ7NZz03vh/zjc6t8dQXaU71X/J4fOupJYUs8WB7rqi8qOS6w+FB/JffVN9HJnymvWqhYw5eW/434l8zHuuXC2TQ7g47Q1GuVWQLxrUyfcK07Uisv6UNVSOGqdZad29ceqVZ8ePmy4UUwkGzlgWNO2Cyk5CjVMcS4BHRYPZmTcxtu8rG0KbB7DWAOqh47C00O3tsV8nldJ30OhTjAiWBJiRk6m3ywgW7/5dr09hwFr72NA0zzG4NlRjN3eDXmzFjvMsZrEuPMmvsd9ZYJUFoLRWt0s/71d2CDkV8vhBidYZPoxR9XZ2Kh/YeATP18RFpHlvH5WK1sHZVW4/Gs6icPRR9KRGTuk78yXo15G5+ZaJXrOCVg/yivk2/uEO5SEGz5rVVUWD92Mo2zRH5ACSWIlvFblpR9fF3y/0PfWVDraHh/v/ur6vdUDgYoI1cEV9eO/mILIHVa6V8BUAA1ydEaIpfzY09WD6fLzpS/kFyP6Q7SPN9XuBp4WdvYnCN53DgF0Ew87sBrRZjz0+4dH8D+fg0fwAhKfGeq/D7N+nVtebT8oS9r5QszTsh08rz2pviPIRtlaloSdjID6Vlerv2ySNK3fXQtK0JPFemc9b5LUDCz/WU/+JvUyWZFnEIjCNzO+nqd2Y25VPNrjH9HSvGW8lCaSw5alYh/kx5mjQswR68+lA35wZdH6hMpBuasM76+Itow1cj8/BXxH7iXYG6yUbG5N/ur0SCWrqo/k7KmCTHnwPC9TZ3tXUnX2cuHy0I088A1kte3maO28lP7B8Sui6z2ZLMIT2fRdp+IWiuW5xkem2zogG/NmvfLa8rdcq6vC5aMJT3Sbnmg2PTlCd4vUUIPS/nK3G0BWT31H5rcf3gkNYg1lcwOeB8+0G13PU/F7pyEV8zKFasg76eKolQV0XYWDXSmcXaaTUCh9oRejs22hckr4LdLNfv1lSqXiuQPMUUs+ppUPLrf0eJeXixVGP4xMH4yYOBrvjAmf/98vGFHw9PKVVAYIgGi9ya8fVo4wXisXh+enCtR0BTgNbm13eGbb228oGewZf5N/e5Sz/fQpqu6EY3VBU90ROqeUMo690jpN4Hm68VHsWoHNj+MTCxf1nIrq9eeH6euiya0nneAUi9jbb2pbmlvGzt9Wf0Q7F6uUnym/dtglhnjBB3hALvD1M66sS3M7eYxMSZgaP17Tc9NyDuO8BX+SMWgZ17i6IVDiOU/U2FIHWrKy56j4VtuWBmP2fKo9Th/kkT9K+cG/SpEAtb+dF+XZPZqlu8lyI/L2mt+9WHniB8wtqTflLUHBP8RzVPx+zriyOItL66nk8beXVBEUWNNIKpwk4H2yV6IUcHsPBP15h8evPOEhsU3omPHGKVA/YJwqgOZ7WzdOvHE0jvKQXEMNkEBXzpwfOjBKF3W4Urj8ce7UAEVoQDjXU1m0zuQp9Xhy9zzv+7Z2dihFfxluQyr4ZYO2D/vQkpqrXaLiB3klSslUaLCwBVYRdaXwahYeeNDiLXBzDAxlHR6/KooZBpRuSakCdRHjZNMz8zUIKzyAOPi9UJzPeuv3icsx7KQAi+1txRdq0clOpOWG7+NmHNzHf/jQTe/FowxASp3449i8HPVcbdyQXKQDp/NKsdDol+CkOSLzYT5HSTiInsmABYWbMf6lbzYWQ3uzv0GdVC1r9eJFDxaAcvUex0oeLSyraaLeScCAhAADmmxrv8sUDh72GdGB4CkUvTo5cP7mP2yae3YouMWoziBaCNfT+egUeEjDKOJ7XDgcqytLVzNU9WF1s0mO0VuSUUSBUzd/FxLO3zzm4ZFymJgEwC/4QaOGjCJ+OdYQMFPkGJvqfWVI4K+oPW6+om3Zje5ZQJbsSozYQHZPwlLXiydcrq1KbMLG5GZwsDbhAzWtEGPI9JLb8Fhc3YnXl1pPvgAEBVgTMiX0AutVfW45zDxg4HNbx8I5bMj5EE356x/MT84PtbVT2brZxQwYiSqcRMAKuGs89Z0feUpT9F2M7DxvM5pmaH0+PvJz+NSZ5eVVmxnaWJiP5BSMn2p4JUYkQ8oWb4HKim4ea7TXPlxEFC/FzTXP0bXy8vFhxpUPZ+4jdepbid1xzYDpc48D/2ZXSb/iQeTNQTB7Q9cHbmZWVA7xq9bQjZRPAiIRaT3homjdm0Z+R8ALbhuEYjZtqKcdYOXKOpWtvt2Bzf4WmS2Prn+Swnpr0AwyDuSA5/OD/OjBo0Bb4AfNYZsobWk/+NV65JRodco0wy21XoU3WEkgduWsTptrqvos71oWdxpr8f6P+eVvHKQgFUrDFaLDFbRbFFT8RN4CFtgyZiEm8ha5onUz9v7PAESC2O0149uQ2HkqKtSL2Yl0c3gcwEMnFjGnMMhwDmSYHzIMeq/LcVJNk346KWUi3MyudzmGEIhIuOEPthzOGb5wA4hr8w9WRsw9wWlnYstIjCW8NigEvxyI4hOdiASqV3uTam29fsmHlFuA9z65qJPSZtat3RrYMub/QysT/5uu/97N/otI7Hzyh3v3ao4sTe5ckzK1L9t6/ztFqHJU+LWodf2yfq1KcZRMF9uEOMU8nOBKbs+Ytyzw90lru1ip4jfcYXHfVVQR37O1fAY8PGDGYjPg+MPN+bb2BtZlMD1mZdm5JGn5dOinvN7uRTW2UBPr/H2DONqsh3wrGvLc+d9dVjSnvyY1tT8SLV4WgUnEjUHqE4xkamfKgJA3qG9gFbPV9lRZR7gd3WjA9RUM+lBp7K/mPeX9jPX8m8OtsiaNbKTbcNQ6FvD9xKCDoq1m1dax89tavDpu9qkpOrxWZ/ST9R0zLok9QgJvIXbbtQHWs92t9kgwd1jwyrP/BZ+SJo8R86jAofNE4bcX022Tjy1q2Z5kuHW8PmGAI6Gy/kKIljfjW3eJeHnoOhAEf5W3MITiJ4rwIX+8NOVvCSMF3PdObXwNOEY5QA1eNPOeN/OcTx48T2SbuF/yRlz4zfjVC24fZuInIh7c5b5F7gQCcfn2qoN4yi3jqFtyDIqp86bahSpEkspmvkmn6FvQDAKHMnqe81K+RIba7CSNZulxst6KPrk5EIXUEQAGcqWtOWiI+5lWFv73wOt7NwcvIj3nseRRfYv6se3AR/SDFy/9/Zvs5tquHPjg44Mh0xa4Dme7WTe6jf6Pp4TGrbBzpfv+xbRZCGYtWFGNkipx+DWFeNOY7gZLsYJoWlpNvbgcXLQuyrFRoutU//di+fTlkemIjpNrbynJNyPVc3aSPLWJybceDPuTuQjBci/0GCm79wNdy1jpdfavaqm2WDIwrTz5ino5H+f1Lo3pjDCl6IZcZGCQU4xigN/2ULv2QQVJMFd1qZPjqSFM0Vw3X5U5Dhgy94YWG6UEDIBNLnHMAdHhItotIh3Jt3z8AG02wTmipugV+SJwKeal/+b2x7XOIF/J/WF/LN4A8frpxc9+BTq7p2nhIlSAzibAHFJ0tNgKrFMcuxWFssuLGNRYheIBKECvvx16JztFBXMCf+QbbAFxMARvrykY7uBgizu5suQSfnqjzW7mnJhAiAnxAl+Q9frKIH3dhVT8ttXyotbM5w0bqkluQZzNjRGOMysTcwyhwqb5raO8Q68z/f/lP//Gj9wRya2A9+r6HyRM3W8+v8yKu3WxT544gbllk6ixyJySfMt4Ry2BZiAnIBmggLNSpt5vwy6CAA5wJ6DDxORbru6DGwNGQBBlPud3Hxe0JEX80vzteSb++aHdjvUCnOP0xjTKko9DTPHIYdjayJdVC6zE9uzczAs4/he3v+RIO93nDaQ88Ls98CXi901ofw6kn3GACAa8fv7A718THmuwrrhPqadi52vCzwFv1OcgpvT3A6yLuZ/xwOwUerH4XPr7kcmIDtqFPsSfvmf/xA3slVMcYsxch8Ge9O6EfWRDwVL1lZpztU0mdm19gRrhyTdJDULvyvWpQwBdfGLlXzn1oUUnS6W48YctJEtlXQhwO9bfNjlg9x4mZwcOTRaIa/6XbhW2iSrb+zzSvUz+9ACcbrKNqv2n6ZZU2wBg9MJv/idcs5tHy/x3wlEGniBZiGi3YgC4qlZ/S84g9gYQstnXpvsU5YEZqtpg+p+2Yhmjlny5wDNkkHFlEBbx8cGAYi1DcCZrTsouRZ44Dfj5QJA/LuRZJv7KnL0bTMGnG6DK/0O1/q7UDcZBkGiAPUpasAbcbrKaoXt/qo25sPpngDHxj2QpWapywsVRXFqLNXD0Tzrlioc6V49uZt0xtcX4Ozbxqsa/epgqr7g4SP5uy7e+W3lD5ITftshbGf+KgfKW6HIHDZLKnIaSNEC0dFOq2i8lt+t4s9E7nV4uOCA9OASMYaZoee29SAy6w9xnZqm/ONj/WiUDRdSQVPAdoEpeAFXaiFYoJSjgBIe/xafxdFfKoVdSzB05nabYqow2m671RjDoRN7Wwek+Owk6ygGE9j44eY94tHPbFLqutPpLRJ84rjIXmvuYzKqTtrJ3fbN4orz6MVegRcikKBAxz4ytxUKGcdHeD0SqkQISOS7CAOeVPA3M6ed1t6RXApAVgLJ/GZnU2Wvp21MHVrDvFAWMu7aAAYTMiK4kz2wjzTzTVYnlMsqiabk19fpcOWzAAkABV5HqLm9kCNbiylG5MbZFN0CMEmpnUZ1NQptZuAlvsNJrsCxNabMWuPEHGrAwC2fvPejzjiV5l7WV6o/qQMcwJlLPrKq37lNe5eK3rPbCb+ZdRCKlo/eFB5bL1vxyn25z0rwq6IEs8wc6avRP6zwXABjHMBu1pv62wWYnf4G0bgDnDXJlRr9lqIUH626gGCkdTG/LPAdu6wO2u/vizFUecbRxJnbeDDs/FNHOx9SPvHHDtTKF7kZkSJnrmco/B/5/7kO+7rOWrnv83hHctp/XsF619LHgZt19SHtRpXjmRSt04xPiKnMgsafZcMKf0eK74MlLyeB1bb/jBKZX6/vrWXUDyAzBsRy6Kn4jtsEHSGpnZWKwOLf9DbxrZVvIEDe9cAtSwB55243Tz+wlrmVb2InFnHTn9j0e96w4YWxKxENWR7FuHTE548MfqeFt36dI86RKxTrYfapct+nrJe5VO9cHH14O9fDkyYb93GaCbhYYpRfIjtjoXFhKGKqObV6ubPTQ+0HesckOvNN07E8KmeHASrdaz00nRWer8kq5xF0BlaqX28fuyjrHmy4hErGwamMjCa5hAC3ay5gSc36KeWgKxt3t49Ncwxi+SNnezJfFhBfp9rFezx9ABFeyVgBBKykHQDrXhMpgx7moUTD/XhE6iHGRqrLy36XyVqR89trHZZck/srkumxbRWcQW7uOI02l9ED+ZjEVPRmRXU280C/XxQaZKxbleucmvullouwt6cBVQFE8Wll9TdrUXRq768t57hWi4xszsFDHGDNfYnsqxn3ovwpbTQ5tvFSzZEWB3RL7gW5Lg/xr9YEPSr88peCnm6/Hksg+l3iUk18FPKrlT5nQX8h8OapU9zGGKndf+YXYyHCKBZV111nsP10qKnTwHrcuxqdHBw6NnRGuyWleNiF6DXova83sRrwWqU8YrFYYv6ITNLTdJPTkcLhmQL8VJcBw27ksRUfOxWeDeyyzYKoVHPs8Bd8H/Ngobr55l10rC8QMwKQzNvSXYtH0N5UXgk2g/Cpz20cYNq4bpWOvPo4W8s6M/3o8+rSZdBUd6sdDLS4v/AmYVDCL2qLLpWRdUkPYHfaaetXAx9wTyAcQkftYNtkTNc6rB32zL5Lxv6NZ47MQP+EhsgjfOdZkCwsj0xgZ2ueqC8kHilg4mGHLInJV63F9yes/Wy6FJY1OJuTkjEJLPYtq1iRvkWh4ad3oc70LBawmy0eaAFkCjJsrxdBYbTzINQ48+fkEmS5gCC5kL0Gu9MHe0Zi7VoX9erQj6cyK63ktlz3Y4RltZ7/BEtXutLDDDs9QyM8k0VDHw0maaovZvu0jp9NI37UyiEJtsbtX3t4I0aju1UlmCN7p35ND7r2sRmrrtfaT5Mvns55GS6jgtQl4LfYCVlRIvIjuW9+9rObAISsFz652MJUs5ddlp7tV+QzBlcz8AeSGq2+JOp9mFbRj3eWimu84xdX7zGz2vwmuvtaP6DgrONSO75m0tcXF5PftBQydT9DkoJTEZjvzaKUCEUCc2xFNvHtiPx3+R+slY/0AclqPDUOOyEi3PDP2/fTGpvDjWWII7S5uSOERmJwzVNROOVbIbp6B23u+qWb6PDd6eOe+qvYeG1wjO1xeaUxq2cLR8hit2Y7QMva07EhNZJWx4EqleMYTvJZAAUX16IgFQK6/5F4N07IunF1VoYL5L6R3LH40ZU4LnxeTf3tJM8LqBnAJmNcFujZZ9qesn+yQPbY0h4FIoyGyxGg0AApNlWjcsFh/6mG2TrJv5BapnKkU6Lt3I95YmRn7ntuPnJOxbGltUZq0KyYFdsGWVSaKDabzYykmYYgSuWD2leoKsvnISB0+X0d4iXGFQUvArZAlbRuXa7GQtJt7ngoAVivPkFmuAdMyP3oMRppQZDpfT6tzc9uAt7eoHXaskMf5kQ1TOAdfdrnEAH6Wp0BaP2jWHFrw00by5/K+qS2ORs/4/RcmOiPOKHht98flDwWkwwxKRS/hNHCXciVu2S7pctf8MgIuUncm6yab5GqxSHW/4MoAOFe7Raw5LYzBcEIEK/eWa3VKFMwbfkrkb41jyz2YN1KCW0XX8dHVjnyAVzq8pCH0Ulxa9HxfF7+SnRoEeGHuD/KMwEXbo3ONHgwbwv1n5mioJ6fN7oVTtNIoNRS983gaSJMC2Q22y/WgUYGvbA88sgt6bAYtmLKZG36J+Wlg3Zffi+jIlMuniCSx/3ussFQa9/fTpbK7NctL88k9jm8m4kSoXzB6Nk80llu1UvDC8Ycb6QVOFoAYTtpiyTJEDd41IT4ivRg/rehjc4aaB+2xUug9I/i+qB1KH6u3zKNDAqgoeh299/bDLe8m5eK+bdyQ2ZUYuwy2gnLYgI5aGSvSB10gyIQe5nHmyzGjTe4eVeVPVQCre06kreN4y79+yN0XWdjx9uqXfcOgkAbIkBKVjfEq9+1X1R71Om5yAMbqsLz/JlKJdBNN6bsn3NCAeNdSijyDs3rQfBeqQ07NuN+aHkK1aH2WjP/kq+foHKN5QprHGz4VJHiBenyHQXAzQApmWggzAg8TiM21v1tVBSsVEw2CF5ihmzwrvuKJWIisQM1VIP5YuHjOmnnqOi6DhzGHkdY58SmlUGM56NZHOECOjxiQakUbtvJg74HIy2W/ylj/fZjt69yobUviVBI/EHyv4k9mqYKb6gYs/+SMLvaZFk6BOaPe9C9xPaMfUi+I1L90xKTOssV9ApDidWXHbWGUgXHURREw0O8CgBJI3e786PpPNWfVsRR9lqi1U7RzM/L0i6ahd5Nc7aInSdQyRCGWQ1YvYHqfPGMnmgkm+AfHEFC7BLAuAveu8k2RFkcBECSWfT4VPi8wqOyumUiZWBhtr+AdGHlX1M7DE85DIru0RAdD/Q6i9tj4irZFN7ziFzD5+37lekaGL+E9hbMudBS2ZgobxTDBaFPlPGf+NWfspPLsnSDMBR7dBJ76C2NbDEN6UMgXc33ryxctnhm0dd+Hl25AlovzMyVYP5/iDITk8VACPpfwGhyWOzjzRe9PHMsDD2NMjK0n1zU/MxV/H+Z4NfehMof9Ux+i7XekhLa8CbiRKREdLqE9wHG+/iOBWcOZlRmdB9iOQa65evXLHnjQ8SalkCS1+sbJGAmzDoxJRbJV464x5x00kd/5pJ6zeNzKiAWYhKhHjgVmcEpPhaibMtEtLMbJHlc5YoqGl1atWLiLQPS+46DMc6OVHU8WlokzSoB8wjOKjLUqa6lAL7L9rcflUo8mSOAmlR0YPsUCTX9CyS4q3CbkyIw8S+lGdyutrQC3ED/JnHzG4DvDLhTZjJNiMGgRlYXONDIL7l72hs6U5T2so+SgdXlNRFjqJQHaDUE6ZxNVC2LgxE6MqVSmy90ki8ueNT9VOPN2BKhUM0ZRAylcf8G1OKz8SyNFwrX+Aod+SvlvEkdJTu1GJAI3SaoTYDcnx2WUWaqMHRE8EFOzKH1RXk2/WYBOlJ01i/lcwg8pYQRP8GidOJ5Un3ia5dl7k1tFD5h5/oazXaPLva6d2PyJeF9daNznYjjXYKXVwchxb0nsrg3PVaPkrHlo2LJURQgLHT4yC+Hu/HzOMgwR7Zp+HfgHZwx4mIlVv87qO7+hDMuUAdBgHsB0QJanNTfeCW6nMTKKgufhWZZ+3y0/cCrZ9xEu5UcD/T6ybmqPElEak7veXADHrnCqGuAbbZ+er5EL9NAORe3eZaKiHrkGI5Z10vjf2pa13V9U4Wz2xtNK4u3xzDJB30VXtM4qart9SW6p91DRF3vVPtgusVzQdsNKt0DTppg6EL9o0EbHZGqce+XG4zV+3ZSsWLugbAyGwkbKF4pLOVyDAHTURxRUx+0LeW17y1QbalVelGwa67zmwG5KrgVoQ2yj++RKZ/CCkKSpd4UWlJIJB5NCi/hVXeJCy6uyEH+unQUgswOxdPak1Z6+y4kvpqEK0UQ7k0kHqjSLXOTwHafeVws9t2eS7+dALO6ex8nruFYX0OmwWG/CWA7LK53fBr/16b25XV/oQeulc/oLNe/mZOnx+8iV+yVxWE5Zzqj+9zOZvj7o0hMAINyMWXFjCa7x+RcrVu/zgxWXtClqXc49o6OmZ3UBgnumZPZk2cdioUv9I9P2LaWv+L0l75Z6iSrKg+kys8k6Tmmi/zYGQomOcPRh2Wfi63PeYMy6Xb14f9nfKYbTe82Y/v56Mj6k2lFTMLzO+1laLphtBPSnqDNlJsq0IBxNEMZNIu+m2bv4EY+nTNhRI9EsBbvWvBDO2pDzzDrGO4KBMss6piujebFnZ03DhaNPr7mkjet8unhYEZr19FpvgUHo8/GY9hMkY+GgGcs53PGdPAD3gDHsyd7HrsicqBGp8lJbnlM4Toe21bm/fpLCqiMcy2h2SytFBxH7z9mcafhurzDmiJQPqSGFao2TtHP5ipyZYtEj3R7AG8D9MxK1Ud9keVrE0Cz8yiKbn5DzDJe7tpSUVDhCjbC4LqzR4Xk8M3YWID7rEAD83gXt/xa8DOaGmNoi6fWM68PXHxpud3iWX7ffuBTxQfdO+7FlUqj+72JyLBn6UpcOHsNrFsub7fz7bhMz9qQi2U2oNtpD8fXy4g8tltht3QG9ArjNDWowPOfgpV3Y8Az6GYdO8J2feh5HFLVtN44SdWuqDyuuM9sF65NODNN9rSerFbmOMLc4npEw9ArdEqqXIBjCfTMSLY+PGWss8zUnGxrvCIzSBCuXte22+vKA2cazamrL2ePtI78V9H5rqXVqp+hwh77qym8IoxavLwQ41Y2ePX2g5hExYWemHidEbcJoVURZ+f/Oawwq3T+zSTNwLEqo/uve9w4b/eQGDa2TOopaYHZEOD/6P5W6YLYGzwqKVy5SFTCNes+vb2Z+3l4jqjveu5E4FF3w+DVA2rRZVDYWqwP4ghX1fj/PB5d2YDKmPaELQnp7pRMZN/6Oq+gn9njBoDWvnfRU87vG/uspPpJT66epZqaMXy6DZ9qHx9vopw6evcYiyhwpE5yXYxWyykt7DC5TvcSXtSTvK2sXt/h2OT/1l7CNfpaC/2R0NyJL9edZ4QT+wA3u1gSAOP+55jmbHMJ0Qi+yIczx+NXRmqY3mVP70SKl8xl+5DsZJZac2zZz2vQlOcMeso8/sO2eFDMYy3AGEYUeAbceObxnQZ3s8wBDHz08d56illFnjJbbD4rVWpFbHsq4qv28RaGr8Cn9FtmjLaJA1xyydgsPF1HEg54F94Yj/h5TyxgwQVU2yB1T2jIp/WBywXtCrJlIfc/DabenBs9bzGb1fhS1b7DE5fyUFadXkJ/VCj90pYGT50e6/hJBQMQYZ1p+A2deh3Rbp57rdOriJ253eUAF3xyyzVSzPcrpLn98WSfFduxEPv1C4tGNX7D336VX3ha1l64FFV61+vY4cTc46k4ldvKj8/vdVt4kuf5Xxm0WD3j/bPBv3vvsn2bDZ//zG38a/E/CWH7Jz9YnQm8KYLKm50qTF8ySF4aKxppFqUrKpnvpqoHDFkzaedsKGdGQu4g35RulF1TkhNdzfoY7a+L9T8+hbGl+KW6mzRZb1iZq5eG18nRQpwEVuBtIP27vIzZi/uhPlBrOKnmLG+rwUrepdaOb0LwbNGxV9X2eOFPGM0TNNkB9yEF/yAkcbpR5kY1/nq3Tx0eZzpbCfO+ez+qZTaCuVo4y/rjPG7iU4Hd7c3tWFn/Xc5nk72MrE5EVx3wdZpDswSLmYay2lH3s0wDl40AB0ERJua2e2cN1dR3uIvlzgLLjHLsc6JTEeWfN3Phxr2rpPtpbEx9wWixniR/9Mwf4QX4CD8iVn7rMszVNJkUk8VkVxYzo5iDEG5d1iVDuqQj8p/I9LaOVgIfX3hRIBC+dkjnHIda4kxxoTBfEIhZEuh3kfafzdHa2mgDft5SJiAeS1pcMiT8xblLbQf5+0d4dZL1BlWJZyrNwlKNzguZmsWhn+BK2Nh3eOG/2eB5bCx5A9Ylb2vucWEH10LuQGoT8TsFHsZmylTWBa9Oog2MuxlEaRWpkSsPJ7jc+LMXFBDPz6aI9XrRn1xvOjdk1Ab6C2waiCMv2Yp7aO9psFGn9uTC4tlO7WdfPtrVahwtQlTkTB1ZH596ixefRXf/qjAQYz6GlJegmCsPYANgr3QrmYnbFGbwy0Enq8LRysCfVhgyvhT+SDYPcqtAagJ7I756POwqFniiDJhhJN0sxaAwjwwvZnPliu+68kpOKZZFbfsitR663QG0sbv5Kbb99Ii4HEBOAWnBMhfcsjlEt/o2259r+SWGJNVSHgjp/eJJpLTbL5rdaYZVNlt3KdFAaxzlDMfT8r2IyBcHKQegrcDi81UERars2jNx/ACqb22/PXikvevzhBIAWBg9gHOjFYpH095UtPrmf1WU3T+dCZjAszmW9nccOE6WyRNzLCoDHYofD21dmhLLHr6qBlU9CfhfjRYmvMAY2OI0lOprhXsp34n5+SaL2w4mdgzvPwhew3odMO6vpb1HZKpLlsrKdzya4yRJuJhMnavYSaKuisSQNBej9RSlFMqXoZLfAv9Lgpsw/+fJl2XceWczY54+8S515foK6XxHJfocSd8N7rV4G+XRWxW+4ZUP5TEpWmQg2N0rsTQEpzgz/0kg6MPfEVsrH3efA39SqMlxYGfDVxb4i9XSIaYIx/A4ACtDG1Q0PqEhuzvCMgCZbAUUEFOD/BlOuaU5Q2U3oF1q0Wv4AR6wHjjgX/k+ekfv00oEg3Lt/rYzVcbK0ma5WMNAWF/OxZy9geMwrpBw7kBQ6FApVvv24u0wDElz5cRK+ERw79EVAbWlPxYvJ2Nn/ortFzGmzFoxaRYxLxqMN6eyhL8TfDRyndIHXtczsju3Rkts3GDKf3rxGDM/bUMs5S4T3ZRzuxJKvELeKmEeRUfasw+MT/s21N5NonIzrbYcFptUOXhjFJLzNPrk79GxdDLvqrinvT0tma245omY9y/9DemUIHyT3Qf3yDMdcBjdFJ1jsg0tU3Kr2g61tnPqIGHk/ThX6trwuCBK1NYL+oOUlENj0wAhvelolxhsOe79YnqPhdEmH2PMTxjyUWhV88iUQIh2UPpTVrxmj8hHd8LKDH9ZyUc7BTv1ndiVCM2c4wPtYSkoY69TStELbHjyjKyb+xCKKcyCIuSE8EoF7D7VyKdVB05FHIWxRvAGIOD9fv12qDetTwdOWJ3JVlwRkHE5RWP297XZwKyMZti4PhOjUlr7S1fDWnjmt0gtQUFZ6Exa1pQs/kk1JDWG9YhznABXytsi4O8jU6oGqXJywWS9Gp6KwvEUi9PxUKt7iIHsGYHk3wRz6s7PYc38v17BmIQjWx9OJ6RwHC8wF749fkQMAJejBsFQc9oYsZw179e+8CZf5h7rGufu3VkxIN+PAA91/PeM/uXBC3rR0IF6pLckfR4oA+tmJvUDGhtduBcBrWxe7TIyZAE+LAYyNkikMbo0ng7ci3QRPws6DX+LMFzP9ha+zIpFQcLqoMpygS47PiLO80Ph744YNdpaKSuL7L1QuUtoW3DV4PcX/T2IXbQoPEkzlM9m9JA0DA9lety60QMlG0u5gai+1LbxQN4ArJQthF/S/mZAZYR/N/smIqzTd+0QDJkQSRHAthc3WknFYJlnOgPp9qo1YDx4gDIaHFFqx7tp/73bi+wdv0YI8di5+G6TUMBggwMn1P4UWAxvbDx7LB+5p/Qlf9ylZVv3zxdDMTMlsRVFBnih03ox61gwYuuLho1Ky6r6GN/lKuSjwB1fRlg5IdEhDm4MunyTa1k/oxA6bV5FZdQIFP2JoFBvy4Rs3bhVCRqA7DJXiZW9GZC4uBa3acIy0wwsRa29cOyzIbrjlfC48QPtKWnlCarmfWa8BjCXXFrJ7sphFqL/o6iYmtTr256vmwiwEq6ChisM7ZjypoaBuXU2gpsk3yMv3+HAVQpcd/akYJgv4Zb0fUqL0m4AnnZFYABHWR4HFmqV2GSn6aRF0UOwUa0Ie0Zk0kmp7l7ueLhOjndtC7LrydHMsb+E9qwDSGx3aHm0oopCmm7+LJuSgS8UOiy1+CfUVwGKpMn1vMK5VefsTq8qCKxcQfTCzZgyq4r5V6FZV+9dc/O/J1sKSdO2Hjz+opEmlOKcDopldSoUolTIhPbIT+VUgu7zUd1PTmfVc2zOd+pa6rrinm6WyZ3UlVYpttYXTGI3EAF6Jk1TZJMmq7V/KVUT9fi7UJ3zh0UcSsNpx6ZseI1dp5d499VzUmvDfIKDJ/hkESw7A3va4gc/uiIyGaeNRx8qqgRH74kTA5MMoVgJ/7U4UDDeJ3YiOS+6aX+4z1GGnSCP3JLVgBZ+t0XbmVw8AZ5QWRmBrzXTYCygwIJ4SZs0IumWozyUQQZgKEZYyIWZe0DmXODCCb/YW2vRBwQOBfnkaf38byRi7UOq+u0tjKaJYr5uviknPQUuI4QbA+boGgFgs1R3lwTyCBEa9NBRRN5PBj1/aYPYXUNJfU13ku/CoOuynbROX4hPoi2OYMEg6vXl6d0nWhUZo/jUnbItYC0QQ6PKpLw+Vi8SZaMdU/EMyw7jg7qh/4QsCPpDzF27IjGCAIuRAMljsk7Jgf64lz2IJus4ZMMyeVUIdLOrJ8PhLaWRLmwQByycrFnCw71Cd3JaX8xPnpIlHnRZDeUuiDifJyDp5NjkXa+PSure/fL525Kpa5hKYYLiCxsAKfG3QdgHTu+8yRkVSc36OsUMV62evE8RK8zbGsmbKntzs0+CRUnGQgFoCPqXnfkkkdXxC3CiUnwZFuo3i1IUBzoyGbD5p09gK9Ja8qgpQWMKMo4DmiarKkb2X7wCO4N2lBuKmXgbmiaBc86AsvxxVvSMPBdhY3sZCbbKuM/NwSAyMgN2QEas5u3qASkkw9C4LPtX6RmYQFanOv7QRigDsNLbrrF7xXCJo5ZvPk5Es75eOEZBuOm8zrgulghA6l0h1bw4REf7nPe4H7+NDqiVK9/V/3SshXET/Z8F50cAcqkqkZCFByAdXfsD9eO6/jZY84lJQsQTzIxTd5U6c5SogTLM8LMFSXgGKOHj9hi3wXAoYG3LDU1ccvEODgFwhOJvAUv/zBr444T5ER9D5fFYD1QPL1Yvoflgp4bCcaQSrLa7isB4PfKp6x6WBxPllRG5qYLJqRIwosRVjIBVv5b+Fnv8KmLaXgbNkrKZfOkwlLf3C/3XO+MtKFiYNNz+/CKNyOVyRyA39lN7ZvSjNEMywsa6IDVQNRjiKI3SZCEc5zzlhxZxcyyg+KBoIgb4eU2t3WwFs2i64UKR20tOwWH553lzS7QGKsH8fVrq/7P7/2syhsZlhRhakR+WGlxFS/hETEdScOJjZGAZVcNQjSXMliA5lXM++u85+V1OQsGzY1BiK0tpo3VTUul7DZ62o1x4P6Po7nh4XKxrXFl1WOpWSJbW3RxudpXVusyUp2Jm0FFw5+/Lk8nSx8GjXyEzqqvxxlbnzq/8/BaX593FSc/Yo1/2/AgqQrk7n5SLtAOlK57W5Tc3znEji4/Hu//NAx1ReTxht7h9kgRSJBkADoKcjyPDDx72N0/jjIBhGMd/XOrjKhp4G+GVnpUbQ+v7mNyoqNDf6DD1OXg8sAOP6LxYVbxms2GkptVku8Djz9RaPwmV8XauE5k8xCwBBZiXGgQ0CvIarc2T6XWpFe69I6UaC5NlDTBoxB9C82VLocGfGhuOJicxxFYdUZuDjw6hOeaAGL2ZWBRB5Sy2MRzsNUKFoIFSGvjlyn10MA4X+P6D4tzygIewOC1iaEAeWJnx5X8iouIpj+/px9NGB172v7ynf5asAXh9ABMT6P2cXBE9JUMXWn+iqfvoe6PKMO07DIhLiT4kx9/xqElp1T8p7+ZvGFQGqYYoBE4DZpf9nyiY1N/Q6n169BrhK1SLygPp2jntV1vVBetVuo2RedQpB7GMxObbo5EsBOrgyr5kKb7bz/JTpvfAirZXE2df7l75U5H3L+tJGfnRBO6W1v4iZeWl0JpXq7TlLvdxxKkoUJ28ATHa4aPQL3Plm58T9iL+XLUyn5Ph9ihlQTPRU5QWMfJduho4TLDn8CDSueAY0XjL+k8MAY8tG2QX5cR3G78MCmkbM/RqAMaGO12PKqoPVZb9qJ8MoDE62J/mrT8nAvYGIzjhmbL8r1nG9T67D9Hx+pigr+392/BO6Dhn+hADqJIwdADHPt2fJar3kMD02AHJFZDMKkO53NU2fGXvfFU5CDvDXtHVz/aetXsbSgWmLJda7C7u3cSVAofuyFqFIJ/mKnB572VQx7NKLEUGYeZdamzDQ72O+odcpDH+vwlA0mKLqf/57nkzrpFG+cKUHiAmAtoivWo9W1i5o8e2ye7obIYpiU/Z+vXbu+GJnyu9j3zBx7LAAi8CxL1Z6wJyBm/3C0oo2Z+4MxGoEq9BbJf++rHl1qqbFTb8kSdQauyKjViNStfoRlah1x1vqjojCpm6+n7jTnqIf59+Cf+mnD2i/5uqotnzXdXw03eKlel2ypkkVNwYYr4/0TiTBfyn2hpcfxKQW2ol/MQuhlRDH4U2PXfGQAWvisOAlQU/jIcl50df7KUqvNuaSVaNltSeJOeXNbHj43YwSS/7GT9PTqHoInsnnsOqk7sPUYUkmeCei5/m5ZGNZXbaJUgsWq6tzNU1+pIZPvZSbe47Lu8znBZX03dWFSvsPFvx0u15T82+W0A91O5YcnS2hNyvpLuGaMhRD3trZ5CUrvXqkwimU9tsmpQHhJHuOEw9Ps1Dx2/TmLVnejSxhFx/jlx1jc3WWjPTC/7PRvUtBRG/81gB67v6k0cw3UCmqVtPJFgEdcY1HmL3A4CvSz5y2gcgsDC18VbzuHkelQsNGs7O94Q9FqIZeeOZVoLvcG2TvsoFzPv0FyfjIBoSKxXXJEqyirFHAjRP42qrnRHsbvROOkv1Fvzh3Y3Acp3XlcMBcbap0aJs8d9m9Tfe9C7n3rf/Hr0tg309Ei3lIZHEr3QK4TZzdp6s/hNBbAoVHS9amuj4bODvHaX4dwP97SCD9tJSoc/2HaF2Cji2aGe9alagtwzZhV8fEqUeOBdj5eQt/LOwdvR6Ni8f+OKs2QNDBC1HEg4Mr4XR0eg/ANLVgGVgqmKbmxr9bIgq38/GDQtkmOM2140SInRg9qczyC/CymNZIRkvLtUOx39YkAubEgUr/Y54ey+EVKt5qdHpA32CqXCEvCa6t1mo2qygP7etN1qNJHTmJ0l3sTNawkrvHmy0uRYgxhUDu879wxySsq70crjlAYh93szTWLLnxWNr7rGzoIXKKwTSmE128ZZ+LFS8Njgjc99hcHZGbRliKKtTr5/tdip7K63w8jwV+dVxnVUSuDxRcSxhyN2JhBV6QIHVZtJ7hlH9JF+/ybLFidbHc3epg2tHT8I+n4qnRSh1aQWLYCOa+eeyQPlk6eooa3nI4nEnljc2bWIAwwqWiIxt43LST4tw7PIPs7L9t6e5Zv184debawuhaaeHhRgn9Qhy7b6mt0t0WlgpYgpF0KwoyNGBrp0x2g9d+7zCfGXlrtJbazl2fnTf79kT9D8kkpW7Y0lj9m7F7O+Yv76nz76i4HFFs+Ni7vVhhcOKfiN7hIjYfAjsgm5w+eznSlnmSviiIyajmiSrrSu5zjho1tMBZghE8LqPQUlnwdovIuWx+5o7xlpSsLJGhwFTEbqCAKQRdwlOW+blk9yMiM+7hN3pDtsmFcWPDop2hzGxVXcokox2k/scwcewNT+43blx/jUMcNRqhoRh1NrDuBbSIf15z1VmYEqNoPkVVRzAI4PoL6lZTJu6LyCVjAcE13Gzg7G+t1cUO+VIsxvVmRFDq/Y2ZAbk/5uP31GEj7iuonTnVCStbb57OlO1IAcIZXuW4h0T1GVHxPToPRLp6ddQx0QaTZv7esz3zvLnve9BIQBMMyFJfYXwqKOUd73J/iynPWnTN3t3Djb+2ZvyyepQ4pfd6mg74Lco8BZq26IZdUBq7Ku5P2hJSjCL4wUkZq5auFqGeEutM/jSpTuEq2vI+rh7BKJPe5iPT9WuBW8f1R9lczoier/9+rqP3bLRrSMo10tZOWnAkDKBMnwwGIibC6zr0AYaoJCtWU1f1WwjVTY+iKbe3f6SMFNkQRhVdc4MNqaaeuicWPZxGf8j3NnyL2eTen7gj0hBEwDDesVsvkH/+mJ19srDu61G2KHQAIm7Ed+2xWtyAy4t7AUpgbRz4gnB4NAGOM4Ker1/03yWf+omw8yZEwu04TF3VfcXxR027QmQgdOs4aPzyh+tBRCLg6I13UnD/CY590MMLYzeIOLbU6XsIuxbEZftkHNB2HqHnmoTj9uohNv+Jyubis9/03HPaK6XcW2ranlPNzyTT1L3tO37o6Kai4AnGcoRlt4v3VsE+8kfYZXSC42Wqo7rvTYTi40fx2iOtaErQpdE2nb0LOWP3lr4mCsXVqOv2mf4qBlZ1NVaLF1oF07c1MvtF+karoAL8AVbHeXxpLRb6hP58knSQptEnDn2NQUmV7eUsNua+GQvq2T84Q7ubPGvBTuuY2yS2BjFPN38heukJVH0pnR+djlxJd1CMEFMa09RGXCQDAi0qzlL7eWtdV2Hz7oXp+oybPgPMD2HKuNihaLFMIRL7pJWtDEITkRajiJqivnilLpTGf8i2YYwwgHhDTGpOODOfa4N3GLi1Ert2m3YjYO+lSbhn+8Yr+TfTtaGAxnKItXzSZeQmdY7d0ht++XCb8OgzENxB2UYZTAb0ZXhGuiXCIvQxrNHwGuLaJdUTAHs+5oWiQRMOu73/mfC3U4d8UFoiUCL1dE4zZTEwaj8GZWOig3NaCOQ+27HtbwLIBWVpNvLbnRMTbMVaS3VdlkYc5+tNmsWjCeK4FnEVYn4sIPVUpVMAIwyLE6c+wxhVpJZrOBKY8bO4Z62OvNRo8UzhnAxtaCbN1TgGuBhHzc3Y7AlLB8HHn//K652XtKC4jjUAhm0iDn2GwUgRyjUsCV+PWqItp+k+4FksWEnqUlEOQHzwMaJB9+lWOIE3rSqqEBVSJhQBXsMBtCcagumxtr+mi3atne2irh7krn5LYrVtxOJ+329OB6b+FJ937EqlbAY03/PVxZfN7z5/DPqG22LembMW9yI1vHWaY/VydY94sre6FrUy77zRc+P7J+5VpOsDeJiKSqy6rfwlgdCb48/EV/WD+PKO7WTt/awuw1V8lLk+L6P5fDr/tv85A4+Ajs1fIbKu/hZnKp7qaLX3NzPITnyqEgmxcTpm6LKd8fXezXltW3cZTf+Vsek9luDydmcn/ulG2k7pl9+9d/aufPI3+jJ2JmjhMTR8MUEAKVKP4ZXrYpNcKhatBthDFb3g0fmokXx12A6T6xE33mnCdlSHhWo3EkXKgoEbY7h7qxtv5HXYa9zghScJ4xOBzjM3vrUwogBR4WckRMCiACVdfwJ1W/rXybMdXPzUaFhmvuzY2w/dJTOmdmzHg6ennZPrdCsufy45bcsVJajS3u5wMovHle8Bv+hQ1+iHtN5IcYDV3zS9WIC2CbQTm95tacmYftEnee05ByVToqFx8GIGP7pJt+zy4S4fJxKC7Rezm0Q6OIXBGhryVif0VFJjx99IFxjaXLFDBC9iS1jS+d/5sZWKacujgHgX5QCh5v4O51wQswMsbPNXnmFY87sO6XgHkQaTH17PoyQatqouZiJX5JxjCQ7ama3ULlzzpn+p7NeokntLeicupmQF2AV9NUxkrAgA985HpMDNuj5oPtGwqyGFur96+SjK1U0N+C9bPhh4KuAeaEFVIixarGcDo4QUUUjt2hq1QJZoFstz1JTEZgfeNSnRnF6a8dY7xzZJL+p01MR1xZopSp6DIq1/gSyWiRWXVawhuh9M79haBXtKOYoovANekLFA0EFkIEEPKwySoYPPAYsB8145agD2fBXoGQXPySDgvFZC3TaFr3s/FMlEBltCxj4fm/h+FQ8sn0f859e6FeBdmh/U6HpLeJp0XfniHZgu1tRvOtSmAAMReudxXDD0U15X97ga0x98HtP6q1at4DsExK63wIqbb/uiGPpP4PfGOPOsYYYbgiHUhQn1xS+21XorHFIWbR4jUxG9TN/ayGrIuVmvviDdnZb+kgQvjHekhi3HvMsHMLzceo7Lf0Fx8h1ViDJZXlP4hACvW3jsdvZ2tmOdksluueodOwurB0sXKk6b0siq1aAPZ2B9Spsy+DGW+ppj0uqWN/Ju2/2qF01O2AFcDLAAQlZVyUbAEizWhrna+fDFVOYM6X5byMLSABOIXhVYpj2FlOgZrCz5IIu3jdsdmpUoPVkSnN1gECax9hVqbEzrUvhCwtrsnmuccNy4ElfwR0jh+NSC0dp5LWiN9bbvtA5bK/SldpM/eWZKm2gfouOhKZjnEOfp/VNIC3/vRVOsGRgpYbXMlutHoYNGpNuoEHc7n6+otcVONgSTyIK42TOMQQXBKtT/t7+FoABzIiOogTY5jY3CIITDhex8NQKXEkNXzSajSQ7hGvGTb6eam9c1WlUfq/U/TRBOBwYiXYNW37BoalrjOoe41nzNvk9UEbSGzEeZR6Htz3iCFY0+peZhaNCl4nZ7x/bojmVPIjfGPiABd0pGI2sij95xitXz/ro6+Ofnsv0zXTEYWxagAL++EqODo0RGYeANvISjRBjbpFif8ee6rvnRtNABBUDESaVhjwCIj3Sfnl4ySUlB07yz3XnOTskUA3zxRRw3+fHnw33M6G1OWax/EkHK8meMwK2HZ05bBVnUuoqkAUr7irlQU+SuPyVW0fvr2uCfLaD7cHGcvJGrR26fV5zLxejhemXKTXB/6E3xEcCAGzAEeK+YUmPVN222rJgDs3fvZKfujfNURq3uv6kWf93xggeI9h1cgpp8eQHoodzflW89xsLSyDWUqAzEb9NHLsm2cwnYFom+1Ebo7Ch6TG3hQzwAG/77/E+WmDbXJLOVuhX73NVsOUo6eu4ilnVSXw9lOHvIz8bbLJ+5+07hcQnieEml4t7sc3z+i/NGtJMLd3Is1C3a3k5Ei7yjN/nmnGTKQLqjTdO60SXStOm/EDq9jvhPcHJe2D71K/CENXidDWCYMtEQGB28IpB2Ur9w5GQtQu/HmhvDlo8RPDQjy1KkMbNlXePHDvRsW26kr8jhYl5GlmpG8QUWPRGXvHuOBHzAiTa20Ef2mNKTXR6LAnZ1BkywXOxRwCUM3fFA14tA17uvLt8RUVwHLaE0VQeRi1TEgHFBlQ5ezAHEhcAJLVVAGXLKiNA3GGSOGJkATDDL0nWb5SAp2L1gFna72uSBFgeF1eiTSDgglNTo4FNDfLmKpp9SZSQ1lV5W99T0ckO/E8N/HbSGreSVqSb7arMBQ9duGpjKbb9ywoKNLTWQtjDGSI/NcbqJfETMtAu80+AT4EsEuN2k5SDudSc028oiPeNpolBDdlkwG56ckVGibRRcuvYwAuBeHs3CAK8mT1QfsNOMBbl6FDFLkDWXzvc/lZQYueiFZ7WNlpPdPupXGorkOKXnyn1jAYzQ+95JVC773bPPONCfisXTX1V2XDjgExqCPs6PpRqC4SHPmKV4neOvUangPJu4hV7RIkUaEnTXxoSzx6eaa3N0ldj2msSJLzBGUhlB0b/HxB4dFcfQEGKHXoPUSTjzKCch1uxdl5FaqwQ+fzVvttTsOxgmK9YOUUoCjNAtXBcrAhpbNitjclNeRbzLPQjui6EUh9cWO6/ZX6gSt+WYbTKjJoNnIgPFjAEynA0JXXmFFMCxFnDXNRojVe+kYBovjPYDHJI5lemJhBwk6zIk+LKMObHBIB2jp2iEaJ3HBT+O6pnhVzktVR3lZv/2atkoF0nsVQjLXVnnRjODB7PsZXPFxVjTL/XtPbkh7dMqXFJsWZftggQnayRm/wsSY6/vXr1IWrxTpjUqqWxX4Qbb5XxppdhYhZPZhFdeZMPA0zLStVUSMhz5F1jSj5a8UW+DbhagQk1+FN9Tak02KpDvYGWL+OR2vsf6z2m5lvNsiI7zpuNK2ir012S/3UHKAXitFJgSDQlEyJq9v3NtW5k2mfuxUBLV7HSYzNo4N+F1AdHBODdZuucalvtsWIguXOy0vVvnO+5CTYHsyY+4z8BCXDAbwfgX/FRfelXwSebaVqWBKd5f2PDCxpbi8Z9H09hlryF+HOVil8UifsSscIRexF5LqhywQV4E9/+y6VEXzYYwARW1VqG/aka9GoXeyE2fkcqKLFllrBt0SItQjcZ9UOFcl7mW50+DDjBw5csLqYT4ACwME2DwbWEZay47UvPTXSDvG+vK9OrRmxpDUsud1hc41k5FcdhAvvw8yikjiKo/w+HuHMGEmKcWT/uM+3NaiJMaanplXnBYWZnAExINLsoICriYwDCFBU9tJuxoPrS4afjPbAvEcj2+Fk+lcoWNZr8+dm6ggOhEypIC780vP0qsBYAGejDB0gCYI/ryoTQJ/sw0tznMgfk++qnv973JFRkwrrCanDNASoLBtu815YnN5t1yy4HU0O9QgiQ2/WSvZM8V7W/Rsr4qvqPMl2e5KG5XSkqrgXg5P87TNuA1zPlpJ/1soyKZ1aqdnuVjaTP7nMvHfPTYOIA3it+TLnKVD+pLoWJMTIqa/G4MzuBtB3bkmow7PDvs7a9mSBkOzT20GKbNmh119NDZmEKbJc9diFTUot412RP4Ke0X4KzhuHMx/oSrCeHL0pK0v5gBzb5XRyPPyhvGGBXqx/IbP7pU2wbmUX/4uV/TGc6wfMdRDa1jRBj6xiC4IOigjVO08a5/3TWZDXi54jlZzU8PlB67+e7ePPsQY/pt+1TUwVUBye/FqpeWFE2V78wxm5GZLXOR2xHs84wDr0HsJMhghZeO+g13NNH60aynXi3EDcuNq39N93VdKVoniYL/Z4lL3ixz2zh+zMboNKrjS/TTe03K2vJeAAscaV/bSvFmKSb6QEodmqwhHjTrRGYsWsVucnGjRxKpotT4PCq+N+zAjB+9VqycvlDZkaoefsyL5l0zO8LA+WbiSuWTZO+wWltzC9uVQtjdIUW63hD6K28bUxZbXlxD0KXcgJQqALCbfpxgQ64FSGBsY+yFJZ+Lj6FnTWT/8tCAQLpeQSxZwJkA8A7cPZwM26R0334nOwjaqxqAYAmnauqxo78Vw2Q7ax72pnHDVEqqYVrih6DNd6WXpLkEUvss0vfnnoUQKmIW4IBS3sra7FZ7yH1dPecMs5KX7OivxWLpM+DH20AwiXSYyJvp4x92y0Qf3JKMHs6MA0+DpJtvAb2LswEAtfYxHAaA7vDlQ/5MAvjz+2nVi/Vl1x5dsIQ8bCcc69N1LgHEjfwYND8ZQ8oSB+UA/p62eMoEfWE9RAq8flmjuTsQUFjDg8I9Zqp/XggkJNSwX75wt52uoi1mft05WJPDoKgtYYC7VXfnCVO9wQ1E8LDF4TNnKKAAUB4jE9F2Zz4sgvdPYcSysIrV3kuv+wECPjyjqp1qr8VRkCne0NjucLS9JO9F3PmtUhTkrXRa98KETCSnxzVg6uiCkqHNkDMfnoW4M/ltDOPI9SaSR9KP3kwShyq+gxZGukKIY+32SVml358nG4ZB/FZjOhL0EsXuQLQ2vrZvF942KrqUflVbDpDV4U0CV0u3yJ0LAUv8Zys3bdwjgOhs6nA02fCQ9wN8iS9OAn8Pdw6cuvMxQrEDleWACAhxZqL7OYyDF5rsth7zBtA5ndlSBLyxSulpMiYM0gQle67f/oZbw0ESBOu/JKB3Xqo3/uijOeLn6qalHQLmjG6nEmzh0RnzlucaV41Vs89yP76WSH3ND4KaLUvxvjfkvMxcI9PMl5BXxE6rmDTvxHEl1UojocQBN0/EQswBlR89W6yS/rZSY0+fZp7/3derJP6CTGVg1jaEnvfzkAG7hTS64x97ouOfd313WXlf5Z6TuJXK8DpKSHgOIGtlZelEnfet0J7hZqN5VAc2Urkn/B+vCehWIZ4bpPh+VfrWEBIa9YC5BtfNNlmP8u7kA+N4N9seRdlsGONV0WAVKqGGFZK5FhjPhzBY7szZ/YMDuMWIHDrCeJebo8O84rYiuzoigNaEBp0XA+Dau6MXa3Yep/qZOJnoXJUHN4i2HyDvF2TZxNm9DF58bJza6uhb4dei8113sTPVkE0B9P/0bs2leL38f0DaNuAYekY6zHyIspWgxq0T/aJaQZ/sdulKiKC1dcinvG5AySRcCglthjxs4R3qGnFcS3VSSYMHi3yfdMPOObsufxowL5wyz58yvze4+6wraGVp1TlnX5ezf838irV2bMiwxI08DxrmMh6XkriVYBlr83zj3QTaq2wuVU8pPf4WYapLtrTBlb96Tv1+TX4b9BUd1UnwH4mMl6J+xFwuMNZYkn0h/KpGKH7IkGtykjH4xHHrXO3/j633AGqy+d5AP9GghI4EUEB67yUoKB2UTqgJHSmioUqRXqQXaaFEilKkhR6QSEeQXhTpRUAUkI4iRUHwvi/6ff/f3HtnnMyY4WTP7p4953nO7p61FDP26AI0b4Km6kgYSo8XZXQzKenxasqnUt9E0yNL8NhKVNSrc883XUXnhRPqZvuOW9toJT2WFUWlGghHpndnhH+SOG7qpcA+HXsd/7CmFHllxzZgCzGhuKvwyEvMxvm7/sXEXiWTltSukaatI/UdOBseCO0R7XS4DCEgmijdg/D3so/bgRArpZZFXx7Nwwg4005iMzJCfCGUc4XWjFJxCcvSy9eT6Y6P0Pd7ELd8kGc2fXMKiqpWRd+LA3ygtQDitGti6sU9gQDRAmNgSKhuOUlPcGeOMNWEgpd5R/XLCnqVfjandtE0DS2scTsE9kJRSapoblCYVQDBVqcGNwG4jz8awt/nLtjrfsmbpVBziv2RlgE+ItP3QZyXF+OiujcpgYjOKTlzGmArglNQw2rV0ulPRdcsiyhI7+buacf1CurPIpY+BpZNTKRcieIi5ivXruhVWgRa/dT4afFjkoSwHUSwlx2e0gVAZK0LlaJEniNRp25bOuV9AAVuTWd+/hL4pq2N2KSzRpBAeL53/KgePPHCTK1eUobFNB9Ecja5PiRBJamguWO2nJ3YXhDBxM+cp2yzg2GuIKN1Hz6d/JaJdLhV3sDxeeu4KSkRr5OHL71OIm7SM9p6C+/FbX0x67Rjt4zNnNLQ+2Cc/2Eit39ias/ALGZ33xUxi7DLdYUPT6S03t+W1dOur1dabu4vL0NO3pDaFBe1Eb9Qb1OdIUB4xUaMfLzr7rM3bvNs217sxLJpTLRNcrDdLqAK5sSYM0h9IfKEguhZJqkKcwttr2kT+deCYArKvnTRK6wXMJkkdsDgXSIzrP8pKePYrnO0z0YWeb/dOlfnUL/lDSveKanCOTFUsXiFWC9MhLxIxuI3MSMZsVaC4iVOycu9B1Idbim24Q9QKOEr5ULYD2NyDHYQfkEsgIHGxt98URfasqlvEqsWUqugqEHkEyxNd48YSQstQs3PFx0q/IHkx5IT8zsGX+vyJflRNuVgbu5iWKHCsz1HxwJaMHLNPVFNrqgQMIqvvYqzJcOHo/0exMC8N7YLgj+RNyw9DaaWzs3gpLSRp3pcoAD5k4tSJsEQFe6MhnMUz2C6nrjzBrTDlZxr9U34ShEaIkb4Dy6fb06zPG+yYCYtvTRkCLiM5TVa1rYTyYPiDChLeca0w+GdqxeD0jlunjN4Uhevku5td9ls9kbz5tUxuheBX4QSEGoizL74+GfpA8QFKbbt1HkZHIRX+AjHuL8KrC/ac1bTliTp6ER4uvN+YGdiPv0Ag64VCtDNOofwBF6kN5deWUgju7/SHzaV068hm3cfq1njGgFHsjXzGIZ0BD55g7iVp5SUhCggrD0NwgWrnjSndl49ZlV/m5m0hFLj/ZuwCoca+gS5bOrV0spd0UGAnubim0YAxT5xtHFkjC3iqmTPRj/wNT9xaXNjsbXdlIs8jan8YvbafCKEu+a2P2PegEYqtjuMH2lrQOlaZpXvmWk16jMrGWypVYBYzPr0GFikPMoPIzC+aajrImUPi2oGvof8XL+em1E2jHSDlXyMNQS8lLz3cupJJ6QSfH6Aa6/C1Ez3qGPjUAW+kA+t+6afNvnOpzb0Q4KKqTSdIXUmDgAod0u8la0W6RnC0JVKAVbney4eW65WqbPGtRPax8hR92jNzJJYB3ANgrRTmiaCHWZVPBVWrP86SIB9VRHB5vVvHJT0QXPIaogKv5Mhdep8i8SjOrg+XqpzrOJMG1SKAda3eKP2R/Uy517AdbBLgssbmQQrcRNwA72i3BU7yPqSvMvVb44OYRVUmjyUZWw4Z8v1Hkl20sI9/XTsLIpY83cQmWK6rSJdXoYgYfLHm4rYYViQKCe97QI6MbOcdkFEhAgWJHnjkS3jk8GLb034oq9GcfdkPsRHlPo9EDCcL77T5NYmTedEDbqm2jQdU2oPi85MYRc0c/gH6Jj6bwyDsZLN7P1f5V0TE2lcvJ7SUpMRHX44AdoFnuPvpq+ybBXp8zKEgYUdmSaK4DlxP9enWg56toUUAT33ACU6nEU6Dz3AnfvSbT3MSp5hCSirQ5etqutzLgkQs/B7BADLQQlEhUjZJNXSPvBpAXuIhi4c8K+MsaniqEvTM34yD+oiB92dtqGQvZE0+mkfNW1j5mwCE2nlpSFzfAu5WD3U0E21tAGUtYD0B8kCLpCAV6PqtXHcAByyE//GKf22tdOTufZh9r2fdKJYeG5M+fv5yNUamuUaYqOabsALr/y8c5UkQUdaoIW7fOj7l3H/dbFfTvesZ5sNrzGJiG3rRVWJO9qap5NR1zCR1lwassO3vLs3Fzzt8NFxvR/d5qoKN+FrfnKhBhhoOdnqpyYv6uI7n7QVt2Y+TI646sc3sOHEdN9dKaI8ZE1E1yo2cxqqpwQEi7Nggy1pnRSue7Cv2SnZnHKSVgx9pEW9YjLFIXtFiRVg5/6Q+hLlrhZD+tLdlN9pxcchPxNJLsIN6PMveD2GrgPEQT7ggtc50nWiwtqECMyY3EZNQquRx02NTWHOD/u8o1w0Efv6zHE7ysE1Zr2NgLAo8X/CanVwTNYMKrRI4dk+5d7ry4ADqxlWArggcv1qutpWZXEmAiUC9/0Wj6zuX4NkEnFjG1CMJEOC+JZ4IRQQwM6y19csuRkcaoBfEPn2mgbvFFNRUWYNbqysGE4ojo1qalp6vMHkdBDRTSiepcrCSDOJYJLJ6EzwEUDtxzIbLHOPuW1MwEYVL+MsDLZi7iuxtYwtdUlJ9k2uqhWFQLQL7mVOzRPTS0L4/zyxBQZ6KyrWLCKvibb3RNqdNdwEQmUot35TkcyB6mX0aiF3VW2eerrEfehTBdT3S/9vfeeFIPy/bn0VTZfBfZ0RuUACbkmtF6WjlL41v1yCSM3XOC/Izt9csVqjvH+vLyw8a5tDI2vTOgafyeWCZiGbpHysgVwFzGtMPSJ9aqZxBHNuklJHW7M8yqreFy9mSplzkth/YdCC/P4n9MtX1H63ufotyEvN44Ega28Iei3Xx+jRXw8EFR4dH7cobfnCfc91ny/dMzJ1flKGcQpuhQiW2JRn8BMOG1KVDxzX+QNesDy6JL+ebr1gK6pbRyu4+n2O8oipI6jv3PngzgQTf3M6FsQNkRN8vYuH34TVXnuObTtLXoY8gJOVSiH8AfRXDi5dNnKIlmVmFVUhJToPe852pT2h9u0gqeIeb4h08YweK5GerAikpsMlxW+ire7843PfO3wQEmFsGqIMJdUoDDqO63od/oLJY5lXC/e2ZapNaWa72a9D50vrvJaxLD0MtTu/WBByInB8p8vJsxNKIuc8O+n96x/Iz8ZuIJG6cEuvmtbm2Ukhhg8lSh82Xnd9iHrgQfdE60KNG8cQANSLgg8/nePaH2Ea2J5YmP59bZhOY3CapSWogRxdJKxCQkJXkptgqCnqgrYlySQqbHj8i73uXXX2t2Rrp8rKzdtUkuBWWtlDk4t6+oASm5WnboEiELqJ9vD4jZyTf8K5lCQ0gegDAY9dnmUU3wxwvU6c6bsN0XxSZ4YZ5QDoHoRkwZPcKU6/gTsdoScihF8HemLmt00E4CH/wn8zcYoGuYCJgXstXyv5EKCppnz49JgbzO5m3be7jBfSeLarclljvZA7fa6irdbyq2KKLbSdJg/ML7eGFipAAKbJBcTaOf3cUC79psJGpqlEU5SNx0Z/63g4l418XTjG70HfgMuvaUGTmLt9+KwgK5L/r+XvnC2eGXgf3z+ZYL6lT8UpTtzs+7XgRZfu7tW0dpO2+uBWrsGq4Yvw95Izsx/NDfKBfx2vEki+x8WqNDQqbqUIe3+Z/8QU4cpMqXdv4yOHxqpRJGB6KW9o1omKuKY09SS82DSYvY+vfq8LlWxbfN+Iv5N219bguMDc7/fTcGzadl21My+8PWfDer2PpYJx7NoLQ5Z3xom8WGx6c0G3DK9tGFfPXlPwnz0iqTi2NiLYbtwfkMnkCsAMt/NB1rMozkvufBfeh4N1O97XmArmTQAsXXY+8tGBvN/B6lM5aehfjg9NJ4JdC2F6Bu4JOLsf3AopUlgj48CqbUkI3hGSxDeQdz3PD+exMUvtV3sfnu+Di4nw2NjZDN7ffI/PjRkGJ86q9ROkN+f42vEoZwRl/16HXkjHm5/nb+qI0DdTcQr6gCVKTdgTENQizHi0y/dHExT4j9J0TNSZ0gBKFygAJuvs0Ob+1xrjdv1cMEfAgzLkSJn60ISJZYhRWf+SjrguIhQxc7QZ/H1TzPp0/yT3XqZSai4fYrFZpfTBpyI57z/mEhip+g+gcCP0egIxWB8Uo1kShU1HSSC9f5QRvKRrim+494kFPhbUAXqOAXsOgMK2D6fGgXWoRdJyvCY5qUPpcGHgRrgBDO8c4IVZ5O8FovHMHYBrb00+oxCLuur7IMHLE+z9xa33eOuEYZBrW7Wb53YgkXcTR5BIEtJ1/ZzTo1pqwTJSxVAZfXlkVKMvLqHOK+tt7e+HL3tCfrqWXIR7ALHB+zFUkwNHkHQ3YNQcpuV9dpeTAdC/cLNjpHdlwqi+XRLczGkIHKwuPntU0Ph0fUx2gV2qcQ4ZhQ3lTten2lp3VH0g8TH9dnmNpFQdZWOhSkQHGph2J2YmEByfWHJM27yU32ZPD1rk7jKod3WbwLdjbINqHylIaF7jPMGFUxfpPv7w9Ff6waViywaX42tizPOJamvlbXR17xrL4t6k3Aq/aXPndz7F/j6aOQAK/zH9O8D49d4pG80T/L31qfnscIe4O08jI8hI2zGNIZCzWLe1vmTtV7b46oTCNYLpzWy+IZVelI0fLgHivbHzwbLhwHfuR6qoGRDexkBWPtGtAPF4DNU9V3hCsWJT3Vgyy3POBECrOTzMZrOrhvLuCWOVbXQkwLD7A8Pus7ETkMzZ43dFVCTnf2Nz61h8eCABb0ksWEKa+lZmMHnGoWW9vEWAkznr2JCQMp3Qzox/EawX1eGPS+j6mScvnZ/7Fl/WKnGNlBuXIQOw21DwaZnHGutEdGMQ/hKOurKU7HAZqVfvn4XJAEa/5heDCcS9HTgaNbESI/Iiqd3HgLM+OzWCE7a2vJ8oi6ZPWQwDPJfO6XYx9e8bbwarqVQsONqB0O7Il0KmvNYy1rnbrD1n8ruZUVK6qK1FJZQ68wFo+JyoXCU9WRnHzA6eMHDJ2bJxAl63vKEXcHh5U6QuH2Om6Aq3PeO4U6c1tQW7zIIdfhs80k2IcAxSAoN8IET7MbTvb7h1EYpMzv1aMhAia5Eb0w7gMgFBfJ1XYSlbDOA8DlQE8+isTKH7RybeV/toRdvO3yrJKKLiug81vGEBxOl1j039rHdJ1mJPex/L2Mz+WNd645UEQIxcYPwr3/pe9Dr03jBjuWn7Sm5zh/L2oDBN3BGiuGrlRF+B8VlDXGohquDt0SRZ253BD6oaxSd1Jc4BfpH+ZStSMgNzhx0JF0PqgUFQazq+CeZGa09/vvkSPT3XlV+0reTabpEb2qTA5X2OdJsI9iF5Zu7B/PjXWXNub1mNNJJPFLBfI8xlvyYWTIKJId4kKTIfC0twTVTc9aSpFRnjJgseJylJvU1UgsD/F6LLrWf/sVdVnY9g9fuHdUtt6+LrMeb+ncKb6atRV6gE3OhFTzyuut1BrycobAgBAlayxq5CUz+5p//xZTNNoudtYugsVXdizPOE+Do5+9MuJc8sa+v6lLRhd1EvXp2+PYji3tmh4Y5lO9upmDBLoi9J8gGAlRLFme5eLpT3A80djKs3hS+QbIMHhm/u2L1XOdfq2cPeMrQyfYpZPLF4XYB5LKNk4HXB1EER6HejwrM3mVeqc4URD4Y4CeTV6OrEjcGrQYwWiEnbl9gnMTKGy5pe5R+AaW8J7cy8IirbuZgwNsYMNO5GX/LyHrFgRcY50l2itAktm9lLG+aqgN5vSHfBto9JVa9p7BfeSv8Ojreidq/HYOnX0KLtW7Hy48i7M8IRzaT4EcyfpvuAphFvGW7M4et2XtnxVBoBa3g99M5YXohVqW3ywtHNDVmbEo/BoNrYZo46yq1XdVbHD2N2E7YqJK7MTl56tu/qFSTg9EERpy3UvPkmEfhC1+NTfnhTI3mXiMYUQCo2Fp6Ec9v4J83A3ofbBOJiICd5yhk377sLPvi7iYliflZjQPcXrFbNah7jiXR1ps+7D6ugWfq/nd7AAGC3uLZFJbc6By1z0jGHicc3cR0U8+6cp5MkR+c/ePnqfUORyrP9a/uvZgp3U+XWyixzQ4sVVXUBdrBU3jbnVxX4IfRlVnOPp0zeBavC0e764qNWa3ninJ3z6bfEpgYvz86ucnq0FVXqOFQQ5wEIlNsFveiI+zlY9K2B+NmWyBVjn4xF2X4z+CFv46OOy4f34/Qdi+8rNQDLGtN86BA88PV06ans01PwXRXvtv2sRDat+upLhqgD4vFbPy2fK8lA1suDL3/dv8FgcnOxL2zKoGx4yVDgayfd+kah0MTHi2buBRw4Jk2CmrYz9f2WiPF3OLs4w1ow2ae1lyiZPmryW4bVSWzqubFf+tWKcaOaLgbVIee8fMsZm3GLb9UbNW6v02376HA4IaKKV9YD/wnPQsd+KpbyTLETyLuFh+84eqU5id3W8zDjzQeo4X3kranSY/Nbd6XTnZIzZ9iH/UgJRGmVgtFwiw9jn5sqAaKR+E6RHp9t7lRRiREuXmlESIl44V9WWuZpbouxNTBpNqppewHqQix0LPYs3Otfs447gciJQBQh/8jXfNM6DkXomljnn3ZHu5Cm7Y7Qla2t73sS5HseBbsLTrPD61Rz9+mcIPxc9PiiuCy/gElYSW2QPYlFZ40wwRipjjXwsCh5im1EGSGrho0mM8xJmf+vxccajf+jZ/o1T+rZ25+L/5PjrcY26lNXBldCHfNs1elxOGEieLcnNUtJ7emymGAkyLnXv1kgc7f35P7xpB6YBtVcc0eXbvwifSUq1a1heyxh5UOafPdAOBGbf69R6WmuAGKx0Q1h7+hUykcGR+a/PXBoTQjDL0EV3x4t7fh3lTBnzipdadGolNDcio2qG3axuyA4bVMNTsh1K1IDhyOLiVfHinAzvubliR/WszG1p1fwk7Ft5N3OvgBbNwDYehGW0PxJ7tns9ec5DpW1f2fTOT9UqFjfJRlNAEmcGUANXKGHbG/o8E5xoBksj32gK10rFKqqvztQKfE2gcusoIhwaYxhVGPVsOZP0nPeGTA9+XehQjbTdGZlZXYDuAYhw1FNM8uHb9KffP15uomqUUWj4xTixabd+VPNbbGZQr+tZVwh/b+fKpNLz+6ynmnHC2r3MVIIR3d3AG93tkGZM+vOP81+NuMid+YTJel++V4w0UkyI0t3xtc1ahCygQERa3m5DLnu1BcvMfXvjHc/df9f+0z9DUm46k5YVsQIFa8QEJoizr4t5GaPqr7+q1eOTsPa7305z8iqV0uXOlTZwv5v1ivuqQnbmNADvSoAeiU8NqJpYemqjJ0TuHUz3TM5c50dYavVByspiEONAo21bmiMPWt2Im6Mtrf4z6A1Rbx8WwIbVw34Uf9aV4kYt4VOYV3S/2noXPWvhkUE4Ta367a2ey7dqrqN7w7PkRKI4bXwELlnBDpufs7J1+BG6eesSrW1hef+FWJ3LNjUhmElDcK0o2VLjT7t8UsYaiXsX3sMlAHsDyNso01/ff+H+FOWB6IMteZQZfqw/1FPG1CvK94CWyvjKX1PfiuQD1068Ca8TtTznnzQqfEz0JxmNVJPhWSm3MuH9oJGPwspFt88Cf3eUv3i52dKSWHeYmxj81KkcJNJfQQGLrHGDh9XzaXoKxjgO3aEDKuWroEG4iUNC3om1eFqm0xqf3+X4alUe24fvsjcKS/bcmYXwzg347XY9XfO5Z610snAXOTjLdCEX2GLkd0/rBdiDiZF5VzpKDafUg2WjhkNL0+Z06+vFQpXNeg+oo6sG8YXxI0Z0j+WM6gcwBXEGYJT0cyDzNd5dMeWTHpDQzFUuAfoKQLo6XtyC/Gw4WXUiCq6FJh43bVNx22tWPbyiCfjnqBfaaQprHLowcWhJrom5v80BF0vFBZpzNMUxuQO/NuQ2uSyYb+wPjiuXysF9I6wNbn/fyI6Gf81xVKw4c6/xv5fK8HXSM+sZMsCYpEw5AX42fXdUsbGX/pv/reNkX/Hj0vj90saT/A4noOU+ZWaOm+Yp7TUuNdJRNZVRg761eI4OfXDAJbqXEeEhMX51TBJixio0e7r/jNTqQJM5YdvhVjPXqziB+TrlVaEftXIxrr99YA+2g6sbR9gKiJEgXKFtVW4Wk/loE2D72mfmqpUfk47dr5r1U/6OIBvEKFd0bSybH6DJaNuZdJsVdMOpP7RUKVQ+It9IuChQaJI2M9k4jCxAQjdblx7jQjhoDJUpAdox0gk0Hc5PvDVLALZgxHRN7C6cMQq20aUFkDt2ApuUVnFjMjrEll1/o+IMSCyRm71iGV9HbWril4HR+4YarirWv4TTEIGAgNxiTgA8MS2k4wvgGEIEFO762FVUoZtbT7ofnaLTwt/TSY9IDnziB3hz7LNGPn208+49kwRwBXPIfP3EvlfA8HGChx1q4ShwLxqy6PdT4wSvHcuB0jfe1fdRlvHknyqFRyd/0rPrW7R4m4iJ0kbbMIpQrffhISn6p+IYrOLBErV/OYuXvpAJWAJWPiqSs8vtuTnW/oBs1erT33ImPl1CbWrgl6J2TpB0Z6ngvFJpynR4rljwWOVAsUdJz+ogxjjUvO+LoklHbl7nHseHeP8LVzfb61vwNkHQ7HIZ22axpaj5tzkRb8bsxV4LVFXTzFFedEsRRGuearYEhfp6d57WkqXLgfenVsiV3faejOMjVPG2H4vpLTf00/DziC4oqgMIYIl7HCDrgO52wbLw0aJzJy0uCKwfo0JY24/26/dk3pKhCpaN8JWwBBA754kpUxZpY0nHRZPAMzDcPRp68tx+Nolq9jMEg09p2+kiPplyRJ9uFTdFUkjkkbzofHXhGS1DbP42n1a83jWiCGLPD/LwvEhAaeAQAckLQlpJYPTSuxW3fcgVepGmY0sttY5ytIG6Pu5NOXrLSF+FatN/NLqHWkX2005BZb9O1YqEdIiFr5e5Ej3ao4qIjrz5MwGm2NdC2na9Nd45aG04OF3xp89AulnZu/KtUlem5KiySCvh8pyIROAhtGWjbv9VyuX3MLLQiDIgnuVU/M86z7iPzKbdlnWE2TRNUo+V/oSGU7zq1Ju3xObeG7SExguSDh4HN7p7iRMyvVdPx07nmSPffwqBGJScK9mar7HJ/tSr0ZS68crZax47rgsUx8sjFUT2usO5pGrxInC4w4+h1TTiY9JCXj5SVvWLCCEAeXVyZGPmOsjRhyTPsaODcJmZ+36oeeRJLs97BcnzCN0G8v+AdSFICmmVbnMk49wAoYrmsg8v7bVnKJO9lWUz5XJ3AT/OpYIK/0nbg8WmZ8JH1HY2cHw92KzZh5/LGKCjo9Ht8YrTzCUh1z7XNTWFM6mb/ZkhrKPO7VPU1mwcLZe+FRnKcu2jwrnFF3RUvZZ/LE50ANiushouPKHsY7Jwc07JDr6FFzKBTVsBEKCcCYaobJZHIvgFIH5ssWHGdOhOJNt1c/eDg68X8SreCRnxcs+QQsevjy78W+v6uTMbLFXUfdHjAkQO0euGqTjLgi+a2zklzUXr8DyzMSd16j573lsjPKBpZ25XNLMbfcRB4nqCXxLY418MqmmTp3TTWHfwzY3bxvbvf6P+a55ga2UqCR4SUb5uTGGk2baXFZHBJejE/q9tnFIaLliYC9mJ2T+U8D9xV/PSxoEDd+XDTbqphFasTQ1TJo1atr21PdHH2D9cSJtM4yGKbD8JsEojKA+S83mvZHVFmIacQGEh0lJIramOVLOYm+uL2kZhVFF84NIxC5dma/2bKP3P6GlEKV7gKIaNdmZA0qBzanLcEm7vreK6bbqAE4SBMAdq4DC0eds17o72sY/cgfce4t+1uVPJhAenAr6vinI3qOHo0in8/ywHnT8nwsFjd/VIZO4Ftr/k2+53vL6UuBilcU1vl6bEtC0PLHLCMyyYRLwqbqubPzsVIVOA5BMf+ccQh+oymAnnW6XnNnPPux/E/0j80ijhgHcUKGbs5dOtZOG2QGfyUdJ8KZnnon8vnxxaZ6MH1V3YpX+r7kUWG6SyZ+jXRbpyurpBorAJx2O0sSrgj0jwg+QgXsBMsEs/5gkcJkUFNVc2pvXSlc+cGJIV9TXprtetyo8kMc5gGMdYDuOu37DIXmGu9DYQy+i0RcXW+fFOL9s2coext+D4dc3MLrg51rU/289lMYyaFLQl/gBUv1ZNfTcJy+IWRnHKPkdHfhcPrTru34a/VR9fXUT/WECl1FBUSmAJd+kWYd0uEr1CMORiynb/WxZDvXupUMSadKejas5ViESNrMv98zY7lhQtrn9trHdPI0IUjz9L9r9yKi8ALE4L2Bha0Dq2khE6wnp94Lwrl2diqqcHv94vv+r0SPnJxuYsSjhHoywvoHFhZkADe1D+H5a0N2bj3Br0EULrDIA6BWxynr0eEqLWs0nF1OHAZh378WdDKVVd8EzRPOxuJEoteYM5Qk1b7jzrrnzr7rzrrMf5JVxI+mUx95pWpTjZy+JHDnI/IcS5rMs7xW0/jr9mJtZQTXnDOkNkvhlen6+GJXfbORB3pndxlMqTW9SkoOtQdkiq27csvvCOiB2YnBNBBJYj2G1Km05tC9t5tlMCqg7qLABR6aGUn7dI5BlT9f/dVoPevSX7zNq1s1Sc13lK7bOo+La5RUBp4cLJ4w6ml+CXy9Aj74Ef7j5U/eQsryM8qYTMvTc9xxjslXlpNMfzJHNEoHj8jpGLFQavX9KRMt2jY+q/g45T+YraO11barnUNbGRagbc1mqnHr2cM3Hjq19yvS4wtU0SjCqetLA8Wm4fSR+otKFGr9eH3gt6W7Cml4iGcceG2KF5HRq/ljm7flfXL1WPfLV6XdBtXtFo96e8r7LBcJGv0Jaz+vsPnbA5uoE07qojPb0YQJbcoFHaL8SdyBo0SaoRts47vSpcKlZXU9U4ZhQAd1QPpHnN2RT4tdZhb1ZVSAoeSpG8PeslCK0RIx82wMbfwzMsTCBG+o1sVvOUo6qU9/pTdJYA/dl7Kgda+pxEd4m5xpXJW0hnuXa31vLECtUNZo6fIjbTvTyFDrqArTvNZGCL2f/ETlFH0aFRHgw4DIECYdvu98apCsjT8iZzJPRleBlbSSFxclWPYcfqdf7V23K6RdvHtu6P0bPJ/ZfCwZgajcqYnPHW/epAOOYyvT9HYm8fqKlNhomxBXGLFM3CbrcnrhsF8ud817jL301DanobIYi8lItl6c4BrakBuPaPsneVWQIGwrHt3jf62DyG8NSBDex3Bx78vPiiXT4t4YZyAmXfLjYiBRFg2k4L8E4mrMf18ALKK4n+LIMmV2/hPJvDSZD/amb2SJxGeh8mLQWtWMR0PnDD4CnulKaDRrMJyjVik7ltQV6vJ2YylarId36cVybxC8xa8UruAxxwivpurj4sXE4J70t3B6IHE01/0zXTrvddmKMZWpXEyEY664wV2aj57v+nigY31hbFyEDGnZTRQMRv0LCe3lYW8Qw2aIgkx/0OmDAXwcrXiq8ZAjjl0LqqqcZeBjxvsCWKuECx60KbLjIUAAOKYrdgqv8jhXwhAVlSJUU8at4G1FEWBXFrwLTbSJUAlX85S6KAOTysaXNw7eN+/IojM6RlqoNGeJPikuJPMe9sRwV0XAkqLBAlCBHkrFO3YMV9YG8i7JNNsyepVZm/UrRNn64QVIX3pTHSiavQ8X1JeydXD347/RMTo0b5bx4LN6N7geGCpsMvkqamupbkjuYVzCIy+FVFmsx7A5tuv2P/e4NmlSIIC8H3KD7YCJDgBTxI9NxU8+ATm6tn0kDfAmBScPKI142bdxolxR+qJ8+uZzENZmfBKtmjRvTopsN5hdQQAZGSO/GoVJAHzIAHR63opfrcFVObjq5EehLJZHQNYy792t1fY1++57Tk/mh+nWrz0Gtuk+bro51jt93TXkQA8sta636ZraFwEFZ9j7dUJAaqIK1PHo5tPtlWiBcxmK/4vMOzDErVcZTBaaxZmQq69sQf2p3mstvrQjDURqdBiKhHIGB8YF9k9cRXZXADJX+JC9lktkgdcztxwGwULYAfBCVy0tTRSWPwSp2N5Q5386SFZCmxZno4Fu0C/2hw0YOTEXRcAMQVSg2O3SAz273pUZBi5j8Rg69lGE4Z330y3zoPuDkJ6cQXJCbf4DoEB8RXDezrRf3j4UX9GMsygMcgSZokvkdNtwlZ473te1mcOSdFUYMQ0HJipl5XgiA6tgZKzdrPvFZt8NwJqb4lkdyJe6rRfJUj/nOnkzdywr6GfnSHXo+XeQFa9yU2BWfdBtHrwgW/UndC95kNUxZA0p5LanLXTca0+KucRq/TvXjQ3MLqOCM7rKw7fbnccYZArMAD1M3zr+FV3PmoE7pFQCs+32arQeS9zm2svn17VdexB94qCr/4lF/xhdN7rwN7OPmDw1UdSuzO0LsRZJQnYS83jxSE4BL5wv2rNQgpETsfR/Eu5x8YrdWpAO9yCuxfkk2PJNGDYg0DN+nlKv0lVIiC2r+a6ykFFuptBw4ziOSjDpHWqkGnoCIf28hnfrH6eTzIHXuPl92h9ZE2/9fM3CgGft4F3tIVDkIW+XsInZjFRgLZoHpWdBNICUD+X7d1yA+htyyNmhA+EI3+3G0/XBYgaNi8b2aa9sTr4QedbuYTWW95rhXE5vZy587VKTVOXnJYp+00DWC3KQOF9G2/q4vSEt0OnGyQ9/daCNPRDqwmcdpm9TrO3vDtW2UGUtjGseutE07fRjABO+39N1qR4ZUHg3Q/Tjjg6Q5AapadLQ/2NNHykwpAxtEiPkA2a7vI/Skm7HejetZ5IsC1u1ntLPi+iFo1XpXWqPhVoBV8ViR1Dqwl4VlW/FFB5KaKKKxACe8A3DCisDG9ZuB/8nVHRoz9bRiRLrRAJGM0G2lKdohuh1EPdA65bc68B1krKkjAGN1eYNl+v4VVv0xbmyM/rGU2hrpxt2QkZ9xqO+ABQbspon6y7ts3TlICw3/5Q6ouLw3gsV++Lr8pSoEYlVQ1HrpJYmX1bnG9Sr26ms0IGWNwOZ9RHMAC7lPsCZuSoquwf6rccV4ihUTN1oYkAbYxIckLi4OjAA4/5Qm4rpWNrTeXaxwyimOht/nkZ2ZAi7onNTAkLJ/LPbZ5OrZCeSqB9SVU6YAm9EB2Ew2YPeYY7u261FnbKYoRjW3m0HH/FzjDGWpIzaz/Ks6FhytN7R/zOExp4nOkD0g1b+LYaxZsiMxSVgbqsOGFlXe0nCD5Toyfg7aoIlRLW/4VJSpeKJEduZABmkrwcOtjBHjprLP9mtoYPS2tOPdD38QlhYpxvdG0pAf3LjGL5pL05lTZzayI26ymENWS6ukIwRshmCAVa0Rcdw9sjSYYifE334LRRFPzxyPHDor0eOF1LLwL0pGRT70TzE0pd3deRJwCbXxSP6tFTQzBqpnbhhaeWTT6TpuEqOR8xIiqpBOCfiuWy8DpnqO03NHjRagPyynhMt0mthJ4Xv8ZTqWDi+Uzc6dp7MTmzCke5wZygp6z0DG/4nn66Q94KFGuqaXDMAMXIni6uYtvUKP5K3FVurzuVQt+L2+vJwZ3A7LwwkQ1X1vNwLsM52vnn3CHMQTlUw1DyL5i2ckJfBMHf6ohMSe1wy4nC8w9JdCgaqqZGQa7thFVj4bPJOkbUF9P4WvZxOIFGGbVIZifxEu+K4vSQg/+C6qGa1gkFNFgtZ1JulxT01jgJNm7vYfeY5fV2tPtW2nzaM0ENe00k9KMiTTHw1hxtjC/nhQOb7jry/kJnM3wgwbEV2oWcRepbw5viGf88wUvlo22jy0bLFBLyGiBHpCBZRGy8F76JVJRmDX3Vj/DSNgbAdC8uggbJht8Nle9B47QVvzeFuLhtQIILfIiVVEzbWzQ04gV6pdqwHC5cUNtr/SWszi/yL8Zu9hHWRB0DZU9ftIGv2EGxdzR5rtn9FzFp8DRm8x4MyQ6OYtpPcKNMVo4sbk2msSURemzWUz3OxSDbTrl2CxK4UCIuW6SNnJP8KUSHHtG3fxLbdLasPhosAMHlOOxKLAAWzePD/CD3xhRG1OPRvJ7qBZYuO4n2ooDUdGhAL0QtVrH2rkzqSYZqsIy3tgSn3/mTrSDbTevEuV/0V6p8y8fpzU0C0r6XDk/iyNGvrdcGO2bNH4T3oXM6cnc4RhJJes/IVBK3vkWJDozAJ75YFUxgq/V6HV+4AyRCF/AEIzkWW/YSYiTq7sh6nhYOkwdYKrdFcbMmm99CedEW8m8oHXQcfVuZmK1yFcRmQHyUh3tWDfS3oBJGTDL57L5cVawI0+GBp89nbu+QL1G7vpg+hCNPE3RHw3HoItlS9UKsLCaIHuoIHuwLy6wvibqm/cTDdMzrSHgafmjc6tv3PfHqD8c1q7I+ql+6oN5Rpyz5nzKOtW/S6rWBUYw6YBFlq4v1a6I/KaZhXkrtxxW/AstiommSiuJPAMpFBjgVS6QtRbSxJKNEu0oIsbLDS82R1dCQVmPw05geDCyiKWUfpnGMtZXLaKSaNUDVT7vbKp9NKVx/BhvNRQDpKOZCQn9C6XHe974WKB1AEADuMcQ9y4sOJuMNHfGj6IYxdmkSi3GqjYh1TlU0IRdFzr58U3ff1sQygfdtrbj1NtNu522DGJLqFShJ4j+EVk8dlyngI8+j7ugsu0OOdw70VoEriPtzg5Bpuf59lgeGv0ZNwQWIciOW+OvgybBItCkQWE5N4MxsqpGZnG9YHej/34BgHaQU2kpSFHsd3DyLKQiGx2uEfXgdRtb8AMLBFvYPiV2CxTH+9lhLsqf5ON4wbgpNjCBXpWKhFiIha+RuRId852o9ehAvoSSCdXW08ksGzMWv/DHhpJrTWkMcuoLIfn5UwdS33RHwfxdJoTSmODmg7lZcc3tuZMKb+EQBwKpBzc40M96MzMkOJy5eEkIxvMDBwTT0Af0k1kV6UeIWZzlxUFnZ7x0zjLof3qiI+Lf89If93/1YRyh/l4LvcafGaWQds4/OXqsbG/Yc0Ij7ZxqNNzK4GALXTWl3d7GnitX/5dM0WFb8V7mhtzH1kuj3fXC2a0f4kK+cncfm7IPKJVeGR8cizty/hqKU7j/bLN2p3YBHkXz2anCP7umdv5bbvBZSvivgSeVvA+KXY8mhPog7olMsflqENMzV2QkzYvg5MwOdVMRiEb0cZgcHNMMOLrcwRAiJAfq1UAZH+6S5E+Zc4hvRGXnqwOFh4lZ8UghES4fFXJ1cWl1Nw3y49P9ceCNpko34mMm3KQJujfwVCivv+t6y2adIdCdv3dS+voMSmyNUawBNaz/S+xVEuGZlJdl9FLhTwT78cFbvXR/KObwKVbQDgXWcqvQlLEUHCwWi5/FHGG5sYvtpwy52wktU6TlzIIlNk4QtRLszPLlPDNhssQuKERZvuLFkAOcez7eRrBD0LK2RG2ZJUAcE2h/HNOlG6ull/x6Cr8LJ7q5KqB6KoPYBpI3nQAyuXKzc2YJFYyaQLoagRgGp25/5OoAOyg72JptDNHsv75UjAOG+kMGeUZW5bu+l0t3Txd6MIXxI5pwWYdoxWNQlxi2f6PZ3QE7lMHMsYE+F40Yrt9wwT0XDS+uP6B+yUYCT5jhZ7NxJDF/FDDG3T4X/i6oYJyofob3r3XuEN59MEXEVa3+RT9bivrUM92s0UJqeDr/GSORSbOw+kjiHz5+uPuR++WQXswvPomtGaOIZn8VMvDJgtOEL0/T3NbGIbuwdBUqoJxoNNUkYbDvE4imi4z2kKqWpY22awVx3LzS96bnvfUA4xek6FtfDu15Kuidhrg7Qik12UpLEnj8pV0FQ1zV/IRVlXi6/1Xm3cajaffUZ4jXQgiQzN+nHPd8hLj03JbbvIctcK+huGAtXaESjBiNpf2HGVJVgBwPqffl08VmWXFtXKYb89LgMXaC3iN/LLJUe0d2ddptn0wHBA5Kq7fNIhordZ0J4QIdqPByP0K5hZQqeynSUZgcNQVXGMmTJnr/dmWExJx9lWNx+HjYsv+bkzCu5NMzmkQouFm4IhXXICYdRLwq3W3nPANf/f+2ptfLqvCnfqoks3+25cME4rq6OqaesE9IM/w1oTiJ8vD8m8uHMkbgiVQsQ7x1TFz2PpyIX8VLk/jEUUpE2nEeO5B2Pu2apYteTiscfeO9+2Se/3yq/KhV3LKLOrXKJHVxOJjclQN/ueNnCpZjzRVs6svbYmhcTLzp035CEuZXZurCQUfwjh6MH9Kn+EjnKDDQ5ZKSP8xzkLdGfsI8PLzFse3y7CsWQWXrQfZJ9sUktJSuryp/Zomljo5Lqd0jWVgys45etHSOZrGTkwt51IgEzkW1pkp6LKeI2lCIetnAc935fgWvsvgEEhEdrY01FsMl+2vG/Y9Brw9sDDAVL8UNgjCkGuGUC3HAUvCUqe+3tx7VY80SDCooIafYHznD/fGAhy6IJI/Q77kX7mrNr38USMQyFmBGs/ry8MtdDyiqmCZWBxzxbieeBeDqrb2XNDiva7uqSFo4JXJ78qvQ3GK2lrxBzO+12G5tVYIslItsNh0BnT4RdbVMSmqE6EvZtnkVr9vJ83kNPCPfSgraMQLV/mo8V9hM5QGYyAOLFexe+i4DvXnRL5YgDpWnuXpj8xno7LmG/yEnBg1ZCn3f3pgJZnb03befYDFLgPIokRMwp09QqAH88epf1+qZIIejvdQwI1OFatKur+g6TcPE0TTlNaO5ZMtEyLSRBEe9iVPsf3NpXJze1y6iBWU/m100ZMtuNVdLk/eivCCTHFgNe1IPkyyOte05ppsHQ/gyZvO8RPKVpjInR5WZ1XZdOR1IB7qWuq/SbEgdslb6kz/U2yD8VlxujJfnRpcF3CCx/yrCA2hYlGBmjI1oR59tDRcV2hsSNO+vOL4xn5dHvAd5k/G4VnfrY+DsNyv/YWP4Q6LKduCCotpmhy/pGilQxf7w/4APx+AAxAxXsQ8ofrjsszxJ8WVRKl/cEIENtka5glAvrhcA+dM34pFKsvHnJPKKNIY51p90lLBiBKQvHZECqxR/ivdol30BXBdR/0m5tQ0Z7/hjSQZYbmjSId35nV/H9EM+BC7DrY+HLe5eV4A0DgNY+XSLRJkAtfZdoqlMhmW/pzGv6ir7MJPRueekFoBSoy5NNw7gshvrT9uc1Q7eIr0X4l57tHv/WzBz7amcoCVRC88z+w31kijDj5fck27l19qUhTDV1xUtB28eNDV3Wt0TasPt/eTzbp9LJe76LY/ud6XxTOzUGqDGVfq+wyUXlrT9QXC5ey4Wdbau8vG0XQFkNIIGeGIQ94C5FqdmPCQjtk5zREGJ+74LWfuTuIC6b0SXc+OK7iVJ4A5e68Mv5DjJrEHizZT/zL+a89D2nn9AEjXYLpYG5jmtYMSV0XfAzes2FqYNIrUQHCe38QXhQETV+tH8dJdE+u8Ge5oFyjkxwht3N46rGhp5iJpnm0fLS6DDyz+Ugyg6juxSYadYNpr0SJN+QC5mWyoc9d0qZR0ehnlvjL2AXz8UkKkVvd64AB5tnR6djL40HmWoTddblZr79W30XAHYHijDv0TdR9pRZE5PyE4oAKvvKO19Yhz/37dPp43Yigw74nl0a4+Y6sdzeIAfilubJB+1vHLGzRD7tK/fBZWnSUfAY9sJr9Nx2yHJGMvrj8MH/LKC7dct8mYi/QZnUQrY22P+t9iQw/OjwTzXw69YDZ/OYGlYVvxEbUjoR5Hqdo2zQIE4lNOkoYu1DEiQfFjbAUAZqt2wviLV0oRaiJGvvj4jOTzJKVMf+8v3WYwhKwWyeuG8ttog/wwaFcjST5IpmNHOZnXbVkPI1AMIDI1AJHhAxvX6F+6LaN+1H3MvVdzSyNpOenknE89mFIZ1bUASOY7cSC8ApE4OxJwV7oHwpcLYLhAKf7oVFRJHhbT/DaS08SdrU/sZIh/Qk5p1nLuZILFkUmBXFjNJpV4bk91ovqsgM9p3+fGfYBXsZ08p09ncMxZtKVCAYhCeqNq524f7oGS7K8O2SfxeHeUw0/A6rbRCiyVdn0/MKH1pdQF2mFy779VKKXhviq2zaaynkA2HFWxhj+aicgUQ3EKgNV4WtqPh2Ene0v7RwO/WPfjrWOHB2lnNZVElxE/jEbPDJ5BC8L7lL0uC+NxYJZN9g4IaPCZBr7Ut5oGlpZvUufqfdwEn7Lv3dWQuKyumvtIrgQ6rB0c+aT8DzEViTkBVQ/0vTESi39k0ngaPwHF1MSKxWY2KfU1ey7b76+tuB4GuWkZ7CzfVTBAXuOqB2vW7cjKOFaO8CSOkiFJdif9L5YPSdB3UGmyzPlUXXv14AFs41vHp3P2+/rG/C11CiCTSFK9zx+nwPxA0Th074Cf5i8d5ElXdgjEX97tx33sZ2NaddcjNkmoQ+WTFe7rm/C37UNWAQ+KuH2/9IlClkGD8i7cy2vClfjuk7xMMcCNzj1VdjjRuNStpq4hWjUFkMJHJSAPgYOpwPEbSnbhAA9BqN4vjVUgF7PDKl8PlBc3TEaXnpUGt+byXC2q+hQK0uk9RbT53eoGAE+Dca4PgID2cMOfdbkgE8TxEwHwjV/Boa1lT+EvG4XwNos7hucspd1RP9u4e9+c2tXRSInICbhtKU1nRw1uoMl85xpms3iRZBwOLtB2YIEmHtU6FaQZrDUlh3DZXnNyIYPsjTyln1YTwQlbD+K/0kQobpH2fnMnw+5c4+BEhrgk7qrSPKF27K5fK+4GyFfEME6q75aHdOrp+vjUqKxuTzaTiMi1M482tUUqq3pL/oLg06uGknDTWUPTe1y9OvwL6OB+w19LTzMC/YLHvqBZQnFU/doQ3oyrU7raeVCr5TEOgf2Z/dGhhf5r1Xax7TV8BELlB0PAb+dbPWWfAAtUupZ9/PFvtjW2KPpkjLb/SyGfCP6uRutFVR3pdK3k/qIp09qlMqvVS8ccEhQGT8a1zjiWso60XfDxVl2JM5Pp51Yjj327xoXL454D61Ezfg/4xxauBwscvwCdmVNsBfy1Nb/C9arInlNJg7UUwpG0XQqZgU6d+uktXciqZdvtUJFImjUbKNf3kVTs+I3IrdhP7/F2sYZSXRM5mYAlLvTKHRRnaORIGlBM73XQ8mVYyth4kHd6vkk20H71VKmrWXLZaH/N0oo7cfzdX7mr1r24f+Y2shbxR3/3K8bfsWXZPXUv1RYPlLYj5QtIBluEAC3Sj4tyeb+07v8rKZUWpEqde3yz3ToWBRbRbM5yB9w0/1Pgk33fw6AkHVvUnB/J15bvJpjBnqaNr9Mu5P1x9JUh1z8QC/+7OeJtQMFloAMB1FWKzT6TwgBSmEi+JvzeKhAX+LNsHLM0AJTjH9gk8f+WubuyREZp1EmQxpEljVMa7Y0Ylrzc2bfoR50waRap2Rs4ORusFRF5VomoRfLZADyn7qsLv8LhEYVEdkk0czHWgRdwc0WMsdnoxsSi50GL17q6V2Vj/U/I331X7thbphJRdT5P5vpTXW/QKHR7f+Sz2b4RsMiHjEI6SNXBwn1vZ1zHvXEywNg9XrgsBcRi3zQjXcF8yrn+S4v8YN4cvJ/7dk8WbmVgtbj/0zYxs4y2NT1blieo4OuiSOSTr/6W6lRTu5Vv/Xr+OVs6Rq2py2k3E6hvmsj+ezc5Z8Cdv+/PhWyR72QmOtO32rhLh75/MX2qtNbFn4p/42w8M9bPHy3jyxdX58n4saX1mDTj3z0PM4dWKLFa8MtQ1b+5CkFqxHKSxa4SwB9Yj5jJdmOHKopfQmUmwuMExgYAsm/AgV8yJf7fnDt0uOW34J+rk2s1RAVVvOGCoI8gp0nqWpFK4hzANwjSDmiaCJb4vzplXyv+9xSHjIfJOWjMX3JoIZ1KEweg0uAB3cz4pVg9dBQQkoRFLPAFlT48TZJKNhDB+rPkwoRJffOlsZY2Nb9N/VqYHE7E9Y0MQ4n/yTMO97ipTvosR8FHn95M94PnAAc1LcrLypCrmFpxT4jgKsBMB4L7MjouWJEZHKdWiqrBLT4YstyCWDxunNy5mRs3JcWQQVUe7lRR+fao7oKTNPxVRI3vg7hCr32oWZA0w7/1WMyql/89U2nJfbUPVuIfOCviRD1L/Lnw/w5WDmuaWdq/SbeyvUG3bXUrGXr+166oqWOI6Wb+oE10aMfxW2IwPbNvIhTtrhYcRK4dTtCbejH3ou7RsOV6VMG62PoH33riTisWq6PpK02OeVUqQTpPj/n4f+Imrmb8jElqu91YzVYiVfcVLsFi7xb6y5UXVhevbNNs5OjlObGg20rvlU0qFq7vm6yY6A3wl+2trfckmpEMTrMCfR0ifN19dE1qc7OMMaSOsVP+Q9my1Po5Aqv5rt5+QgCj4NarMyYbzBCMces8kSamvlMSj01AybMcpQjcs0u2BR+mrVpqJr7j5GyhfseKw7MKeQ6gBrFKPn0hAHVtpTTla6e2ZS4+/PxWpY7AenikwXqjX7GTmv9zIUfV84davb86zn4k8D7NBczUh246Gj7E4RFUG8U+ARbE20kHluJOVASXzTSNmZnuoen9dhq8LRU+HOPzoG9gZbSlhW3/21u8XcxYJ03W7FRoocLcBqPW3bN6k0KtZoAltqJp06OZeZ42dE5MGNSobDKoCOYxWJruhl5Jt7uiJCydLpg8c9D/Tt3JWZkUQ+RVJUDDSe2Iqcd1eaufa7zvo8b+KNtKw8Zxg0/IpzNBUYVG42Mhp0gKG1iyNIFLveCgZReSOOTs1K6fu71vgfkDZ+isboeO6odsvyk8j/98YfRM86OjO4LgL3TSaCwUcokk3lUP2iPXTODSLCC0YMRpHLgIhDyI+uPGVzzF/KgUWrk1DNhzWRV+6ptvRbjwdbfdH1iZbdIyJct0U90B36dp5pWb23AOuOEuKM2exgz8Qbpw+/k0JmrHBFD5OxQWe8K3aJNldERg4Gmxqh3ecA6bHtZPl8a3R6gFPikHY867qTwx2NXPIlgM+1v3Xg3KJ7KqQ7fDXhmcOmTG2ewsOBpE9OCXNW7JiZpELYZPPZRZC6+Ial2K8brB9ojM3dP9KCKLlNH2Ov1mxMPE85/Lm8eKNu0C8olpsi9APbg1N16tx80FV2nD5NVjmKeyuvlnHsrJFy6x6o+0vguNpqV9WaYijV/dsh2lz5KVJx4MiqfUJSOQb22/8pP/onlufNbIVSRQe2ytVVa5VRemhX8FEF3+1rn0snew8K81Us10BBbPHpabbUaOkPfYudc03g6k79+i80ngW/qXN+bXKY4FN4gkpdMlkzPR7IgWLm0dVe3OTG6X0h+KKcp6l/HOouzUmVOmshDt8Efa3sp195X0msY6O141vpEbaCTTPpcyq6fGrcSS3gk/K8KJa0jSOKeBoxWThlmzeQr6ePD6cRDIdY3v+tg6Mmb/Nm2oFlITwrBTeG3rMzkughd9qehFH7MmDGuBN8CEhRXUmfDp5h8MF8M4o/I5bY5/TVz4bte1sr4OxJm0N+KrqKYCapMSb2wN6jJLY1pLmGDPnsD9vzfRsQNQBAYm9k68J1QhihWxjf3IeduJ8bmgWK84gdA+nUF1Gr2luO5D71HyGLuC4jmk8FKMlO7Z0+EapD4SpReWumTosCa4QsutT/vZJgylKQmMQXuKstj7aOew91UerLFD42lvr0qClatnXfNJ7L/qX9ZcXqfwFfIg0j43Sv/mDVg3yk+XhUecqOL6GilPzT9cf0by65+RtEj5cjmrTGAwyzxVgRYvpHFcERqtJNRM2+X3czjPnF8h1XbRuDNXTiUifFeULy87lkS1PONT0VVtAH1Lqjpd54q6TAOoYKTGq2T25NGo7q08OUs/G3KLucXXXzc6QvoUIwPYJcfBBz8ys2Mzo+HaHwy/hXFH5XPbNHH30d638fCCAbrDx9f2StZ+kXrzSnVvI6Zu/rp22dih62RmtTCXUhuTAr5vWXTlEK50eMSIcb2s9WjNv9OuLUhl1XIh/tB0Sm7thd1Rs6iWhGdVVa2/PDFu4zp1FLtfmpUD3Yyz+M6+rMO7H7VlK8h3dVR37nMnAPZgYsUKzKl5p7n5a3PzEMwNm9mvnL1m8zuslRdxMI3OvHLLWNu1Oe7v85bbhz6PBkUuXZS8/EVRqRvCG6P5tHWR4gq9aIaHnXnI9j6PSi8ozW/y9KGTrJbd3MCUmB0TXkjNiJSdoutQ35x/eMveLvFLCMSj4N7K1DzxFz76XDvhu+3mrz8ADUuDomb3Eyqc3dJfid5xItUXCH+qXNgi+WX8x9r8vNYB0HiQqNlw1I02AqWe0ltfZL1M6QuPHN7s5ejxwt6psZW3Qt88IBZbX2pggVhOxWpRP6rBzC/0wDz6D6tL5uVaom3eW/jHU9jru2mQPrVEfcq+jV6PUdgYkhBU6LuMX4nJMvXJsCkPO1fD1y2j5pRjk0EVDcyJPSFZu+DR7KjjbcMxTd3yxjJ5n9ILc5SWPu6bpQsEwKRwPOAuMm3uUgwKLH3f7A9F7Ko4HXJeJtJ1qqzE8Og3FWOEfoaH+q3FqHrveze+wnbLPj/PrSklSQ0s6GEZsK7umTWMdTQVgRZ5cIUAdSKra9TIpFAsrYRplxRjM1EeyOBhTuxNteKQtbBPX1X+aC4L4fVln7gF7gY8J0q9RT0rOx7bVXZJConsu4yTVVsu8FFSbNnrzG86CuPpo/VxH/zNralnoHuN2/z2hb+SjE/+6MsYZ0l1d9rWA+BUbU/DR1MMRl21hNvcbG1tN7sjWw+//hSzRp5EdGrqsRDs8lsN/cnf20dUjsAXXmtMTIGVlH9FH1PZxaOayvuj3hVcBRaiLPXJ8yMA1C02a1SQxm2sw3BcAhJ20iv0QedniH0IbezpoReQ85cfqa38MutCV3bwLHu4LQ9rbyRP5h8kr5IXU51vQvHkW/Aa4suE1J4ZJgwsQOC7I9Qbq2EcJmmLvWIi+cSSHkuKoS/+4brTmcnhglZ+ePZaMiG513dPSPu251jYGIkqU95VgAJ0fSB+5FplFdB8Y8Wbl/hl/ODC65TQC3fmU1ramB8s0RapTxTtUHs486UvmF61uDYaWpZ7UexQTUjf7InGhfeRuz64eC7P0QPrHZuAZk4tmmtfAJ5oWbifuFUhIe3WZpxELDs1y0Dq2ADraOKMcgrCnybPMBtZImiyKI95GQSpZ7/YlufbkHR9G6EhXVUOFvdC/cNMunCLAn2v70X4JhTx/7D1HdBwNn3fESHRQ5To0RK9RVslei/R1uqiRRCEJYIoEb1bLbrVrRai10SIFr2XJTorCBbRv2vd9/O873vOd85y9rCzM/Of//zKXHNdU31DtCKU9avAW4d61rEPbHGAML3r68MGFM77yQ0XMje2On2/OcTHRne4p8gbVJeppv4IQGNBLBW20FGyzfEtWYuJMDb+F7s3Jxv63ZlMwvoSCVD50nlZlbxPYqroeJ+6S1mRiT/JsdKP7kjrK4IirIEWr7g4Uyy1FCosn2FRUTlg/mfIq9KV+PbZtsp3VDVq2jTxstYplnw0SFYkH1J35f4MFD+TU+GOjNkKxhs0C3q5jHlumu9irCmracAo4qFA++a9T5FQ9nCW2siEyxAxkfpvBUmwacqCSWHSUAdvjkGu3bGPbb1ky7cpKyhVMc+rI9J6eWudTk29QG/fQeAFwC1L22VV1s2NVX2uJehHLxntxHR9olIbtvnmZ6cfttbu5+zd8/XT+ES3wIej2VLwaJ1H5ptJzigHryXwTmStsvtbrUWmrzeB7B+pkAy8xVgdxNGnN5DEmdKguYcnjwnEWnB+uqCJHR7zKri6YuFvNIxA1BfexKh/Sj/kTQDpzm2io2+5uEZ0gJx/D1PaprmytwEklHOCN6yO+wnKPa9BN/4zQ3mkoq2wQrdPQN/sNHZhTtuUTBryz4k2i/oCrdOmsh3lnZ+lx0zCIeTz6mDuvlJIxoTaVRtUm4Lfgg5vQAPzwB0QZc4bEOztpuwi9FJqt34bqP2ZbvMzakm3qAGnN0tuNi98El0dEidIhf/q0m2jF7Kf2eG7xtR2/3zbLFZKena/aFH1PUeOx/r6wwJZkrPEo/qH2/DL+1aLTz4RjMxnyL/zn/80IUU+6KglVce4vUt+RzxYI06oa2ugyut2rpqFtw2b/ydhUMuvkap0QnIGPE0psleZjd232GJJE3wDuwMalUNhykVaJGdqemFRhmbhv9uYRqsaVfRP1OOXiL9+bBN4wIz9eErovuorTphM+PvRZgWxbVAw3oOlnp6wXtCtx/SHFh53Nwt7o6Nsip3eW+HenjH++N25Xxb7Q+fxIwrFSV3yXXUP7l0S+r5yzP2W7aXUw/qZyqqojAgU8zqKjgBFp4ZScVpJwKZCTXt/UoVgmKA775P8WptQN+pqOJtbjn/DkF/5lUOMjEfyT5BHE3JqqZFPWqUpQGozkjfePQYHSswGza/b72W6DX1d/u30Izn2rFxNaL8indpJgVjyyQR9jIv0Do4GsXhZclDhMqApVDP0dEy/wjDPdAuFienO/WVNeRRTLtwAiB7eCoO6vIY5vnnNmYelfUfNARvdQVt/LSLSUtUtHVqn9bYcFUuoxaT+EjxWLkPs/ig8y99djSV/pkIDr4NvUu/x4Ox35yhHzdIT5sd4VgXn+ie9FF14KKaQSB1UHgCuPxeSp4SXcN+eMFL5QlpY7P4y8lMb7MBnR1+RANe3GyYLNAWNvvXxdUXWKLj36/FKzkvjefi0RdMh7W0xGtbrpUEBpFcDi5CHco5SyjyIAsnG3QAFXuyNLLXNCfJUu9OmeZG7YTu7nBEN8gXt7im7uH/75V2wxtL54pQdOGNlaM3pvUzZsMkjPowYmbBdJgBiCiAOZMJvFsmqRiJW01OS15G6FE2v5OBt46tdkro/eRldsErzPvazwEvYbvu+OZu4P/iSNIErz4V6jCrbyhf96lumPABctluOXbNr9HvVX80ImcfQz76hVO6Hs4+mkLXGdS/04/BOqnZ3iAMJFP9Vzqqj5YD4PMgshY2BTMo4bvO+Ve+FvFUnKuKNdJrlUysY9WfV1+mVCFcFZvyjAgXKQ1/zo8f0rLgaIWFHsGF95g8LRj2dQTjheARk9MArgozlseMdVqWfbGQS67UqCr1tiT3VbUOlbfjkZNjrZHiabGSbmcCnx0x+GWqxPPYJ1nDnVnHfROdUVis8JpPQkngQV+77Lm1Q5WuYZooe+al6uB/LLZ+9/hJrSxCbUJJKTqygioZh3EOBlE3DuE3tRJXXtJY8AYk9k89aHglYjqWPiI4fqIeXnfh0n509t7H6atP0OYMsTY11WAJonMTc4jViwZv/EoEdvvkN3c+nv4vlPXwSzkwavqZgs20ZalOuyPy4rHXusCFt4bojMzm6SoLHm2UfoN6sMOw0EJ0MY4EEoeGbh+yrMRmebUVSnqEgAzP0XuqxcZUVw/qjdX7LlOMKPNcw2tulki3PRYku1kqwDi3OiTa/w03Z/LzodjQtM+8de52l5XxpQ5ya6IDvFG5WE0ijoE5U6FCFN12qM2a9qWvlaVw9ii5R7U8cmqwW8ios0qx2LFqzGNA8Lj0i3YEcck/1Xrv4NnKEVvj10Z6PAVZf3hjkPvHha6Le31wZrnYZM7TBsyCvskb++buG+Oon+Gi21vvrn2IOC3JS+UmW2wXwpdgsCSeCXPUk6CRr6dQ6MjqyvZ5aarFZag0Ew/9a4KuL3ptNUTnHx7GM2br3KGpY4+HcXKJ3CCgxKN6hA7MP2pIY+KzlTJXb+6h6b40fktPzDzlPCgQMTia43moNrvCvG/IrvXoZBWhb0XVtQSUE9UohJTIalBgFClbdp4NyU0MdnAltz0Yfqp+KDN7lcX7xs+pF1PDPhwChOv+E3/XdoakQVRG2xlyEEQhlmD2iqSRSdcKOP8BNocUcGsletJ6rncCnWNBk1k4axN4dyC7HmPv7eU8h+xK6i12Y5MyAKIx5XAFzJI6ps1h+ZeDXCVy4E11139cHJqXZq70ljU8SkerPS4T84+QYs+gIsu5pSpEWM+E+J8Z5HpT2xNnhmxScDj/rntNK3P0/nZOoJ15uDrt4BUejepztR573/6wa/lF4Bcg/IoF3+HHXTmezeS853+sWUhcYBDCgiX72cFjNUJg4PupN0tODkPxXwd05BdJo10HmKQS7mKmp9A4OBJsLgrljoYKM3JQIkH/l/nm13vgVt4U9jwhE+RkMSyGVRXelvn+92Ujl9H5J5/w+a7FV3Cz8Dd4nOanN/udtRchjKCTMYz+d5uMs7pON0PpxnYYiAavx6fUDba1Kyq67fI1Mz2O4e6DcPSw10c93Z96rMgWKhxQvsXloWRYVMAc2BXgt4wA0SHuaZlXrtVjJDB+2nrH8Yz6+zy+2AHovY9vqvjEhWijrbNSRaf2NHr6itYP9UaIuOfkXr4woD3cbuKxOrvA5w57KRfFQra9KrqTB/bXhrW8WnaCQVk21JBcrfIqj0UQIcvN58q1PbtyfmGt29I2ZZxbWex0qhgHlic/YgF9V5i2Xi/PzwQCTyWKcnRaOL7Hlnm2XbC6pBMNYLsnakW52yq/N50r3fGNwfINiJLoUrLefr+FsIkjqZBmqkl9hThHhj3uFpRYOZB3FI38Na/TfMUl5r1byNTYxhd5wrFw6gtx7ThJs3ZQGCnV1qWhuAu2+6jBVIRujr6bmATDJ7kDJUKs0oLYR2Ev2ppTjFn5lfz+eZcPPyq/mSmrUqi+LruiaUM+vgbZZ1m+7VxWJoHF+HoESKVWLAqVCP5u4eQQowqaf78DJLWYP3S7Rv/Z++L7hnmZJhMaWS3tsaLtt6LtT8XtS5SR6x+B4ESt6dfpxktSe6mZN7cVtULEDfws6zoR1UXE9SW+WMvrdpoR6tsrwsRZKJ1r7dxezWmyCaxp9fy6EGaLcMG/nuL0luxfM9D3sUmN0hW+efOZhM8cy3wuiT+o02slCaXPDaM0VC8YHHpXS+FcGhqpq2UKqeE1T2UqtBn/ZOXDwYLjHeqoNVZ/78pXbTwM0YNuhG90BOKpRwvGd69nq+OOX4FGyfw5JWQaUNO8Z3V26eHGtPTukpLGJ8gkEtN/O+FFfhIFPiEHnIx+9VyaxsqCQmBu3GHNNtMbLI3X8pWDo5oZ7JfSe/O8SakBSuwpGMR414pqhu/e0Ow3nZBzeloSV8/R8bKc9uZ+vxZh7b+JEVwcxfNRKpL1qqK3wijbVNEWW1GSu57d7Yo5Ppjy7VVlhGGALIeQ5+WGGBp2TkwmX1dhGCq8JBMFBo14lYWtHcOnGr0HM3YHMct2ZZ2UR8mFxioQjbzd0LE7xFTsxp+ZmuysSb5H8jZcPOrbsyb02GJgYUay0fxQmG+FAFQZTK65MyWrBlZZCpdst9Vb9Ctc+7pycPfzF8V9LerKqDcx3xhC66j+Yc6VuwAAwQg+2N1EUWTZsIU+6A5/Izd367mMgH/ciQtYhdPCMy5+VvORxRDrq41Vm71/TULRwtgrHD3xlOo2q2kBWPa0BTTiDeZrVgGlrR2KG0H8vI5pYjD7g7cRGv3uyTaJP6ojAXAvJUItrYyBFhDnJxw/CI8on9HTXxk0pEIsFnAY9E1z6vffgfVU5EcMaFEDpCk7ZMyTFvyVTPvyy4pOhuhZ3fDGnbRP+gZMEdrO7kuZdSYSHG+1iXnvl35H/KdoH/yP/t0p6INGfv8wfy5twm7HKifXsl6h+VSMupiD4CE3gySyitKcgeUYbgb2OwBXSEZ51DPJDqA3n+bMJfnYTFqn9kwzG8x6nOm97Rvza0+Pi9mG5cWlRjkMnO2Y/4hFnaZahF6RlLK8CORR789Ra2uwyGgvdsEcRTA6eHU4zn0Wn7bf2fX6PIL1iqXwVccfj+1DTxj6Z40C7Q729S3jH52PFC7Q3DLWVXyXbvq4kdXhuoffcUpbufAzGreCpQzzDKp+o5wST3jO4c8/Otxku9NnMu/y6m2YbD+dQlyISJeIb22Qsf7OnlATsXcY8cq8GczYCR0DpLSmU0aaJpabB3/x+/OG8tt4HdWFO1vEXXRE9kzRh1P7P9Z/yVmhL8Jl5+UZ3KRITN7hxNzALqXPVTd2TN8Zh1++0Dk1D/FGFrMVBOln+ZuE791n/M87e5mkH+LSFq8QMGiBKDdK0VKvz55jLfv9c0tsrpKs2UtICTbxM5cqR56RPVXyVYt7MAgpGedn3cb3+BKPl4l8z5Fd8NccFIqv6W1Wrmc/nh+U9PvXVah/6e3mvGy+xIk/aqjgyihE1vfRs6e0HoLmzrdIT3mE64DoxeepW9/WC4y2dbILQp92BT+VmqE0cX1hSEGq7rRu6reu/WR828p/Ascuvg/dSSYoFV9WGvNXZUxHSVd5bJjxCj6ZOzb95rHrbLgbHDrC8COytwyyfe6QZAgrRz1qeSgd3ZOdKM1w1pJ28+JYqL3oZfj8jfnbD5Aeu/esK5A9ufFzHTj8HIoA301IWNysn53z7LAeqXkRr1/2YFBFMfWVKI55YBgrOTH7xmZKfmtqg+9ZMkDxt1UrQYeKPSZr0klAh3fML/TYGt50tZ98Ea7vfj0OvENcgy5flOU6VDkXP3MqNHW2SHfGaTBW76zV64y+ldJId8MS3rbsrFZ1YxlJa2sBQop1c6aV3fCh28wx4i7nN7Fhmyi+xV0ezzyy/UVvb2r0u/4Bjh9XBSC5d8T6OUqDRO6A2wB6heM/f7O80W43ApOsPaV2gljeFDJNuhFUh3r72A45nD65+7rpmx9vH4DgGVQvXTX4NrL3F5kgKdcSCOhIDXaApcXqNIm/8sS4ipkfi1BmDUqRVOywQ4VuEa/IpZe3SEczes3V67cSSULDniHpyIfynQ8nV4Abjjr9d07zrmrWDGJiL4ev81rin3OmHurd2PBqfsvqGFRo6jkFa93mOrM7p2cc6Zx9YAKg5li4L/e/h4BvpdLE9zLrX/j8WuBuTDVUrMtWJfrV91zyISwRPhDovasg9iOvVSGtv/bPqoZDfbP1R+qLHVOGWIfXm29CXmyaf+u67eOZDyq3w3Bxed7ClOKT7ojvL3ynzPD/4m3gDczMP9mJUdnvhq+HjfzrV89wBbDxQQB2wQt95Le/EJEqCak/0z/fynizmpTyxt/TCnE2ZKLXvXM+nASZme54f8sScpkCd6yrLOF6yqrg/gdu57wFQIyDJWotmNRmlXLuROv0JZS39CdbfHsB/h3sqsw49CYU90f3+gC96FHljjoD/6/2vUtJAqVhMKVaf/1S3G7aadTv/LrawdDxN1jv7xN0sumreitPekpEuU7gEOvcJvrB6fFPiyRjfoZ5TamxWQznDTuniVC1b039rPSHP+fW/uriq/+efjo4/v0aO9ZMQ83ydhgczqFztc73YtZcdGWuS8B6VZOuR4kFIlQNlDoHiHNq7HDLfxnJ5n1+iI4tmqbIPtoJ9NkbazsxMB4oCcJ5zc/ksI0l7pXDY3zELS+6PsiOlQEAAKSSB3/FNkkf6T7IcWN6jOwcOXllcGlb8n86hTYaur8+O5F6HLRfotES6sYe7cYa5bRb4WZ8suF6j0swL3z4dV3cKjS1ssGUgKss2bb1bFj8EsIy2SFczC6zzVD3icJgPh0uH2wHzDU2Rbptmz82vRgosBuJCj7N9fRQQjHytJ4Yc+FVNcjDdWp5nEQflUClqs+XaDg6dGBydoOEOC/9hF/ozKGeXpw6TvluX4XcKvmiGxJALKfAS+LDA1EsHP6nqVskxmRJqtM1Mc3zwb3Gf51AB4kvizc4h31KYM6dei/TZ6Jc+uE3EOH8XELYSuVQ3dlsKDiEFCz4+5RZkvIYnyM1hMzkf0bo/kriX3a/fXMSBcUBTh1BG4r4He2/P5ZQw4frPMKtlqcCpdZXsgcCyE/nF7EhNLPzd7D0ZWiuBwNAY2b55gL5rb5W6fDmiMMQeCuMoMj/Kk/GPxCowSLIpYS8xIArN73hqePDOs4a7F/qar7KuT9lrXmux4/gAdkBHcHAvGDdZfIE+Pj/WIZw0x9PfQ+BFrxnn76zztUF4qN/S+0aW4ELVvUSJhZ3CVhTf4vhfFdSClCD/ZN3pZpTJNvGJrnStl4tRuQgdweA9uG61FqddiwRz45dbraE4klUCggej7AsJXLJnhdGCCoRE+1RkUzvER4hFLkiEoYre3G/vi1+bt6PozTbHjrorAxpLcOAf7M0aAipahqzwEIwRLdIS/js0tWXo7MdcMntniBPpJjTXA+5MOSbLRtLi1tJZyexq1Dei4822M/sfPkOJNzeVmEDuKPHjHaWQIw7mzarKliJSlPZ3++CrEeRpuXuil3YIa7cuuaZnPpDa/mdNahKumS39N37EBTKq6a8VHFRjxYT8+nnV8Ii68ILRwm8rEsc/Nund1NN0Ne7kt71N0k1rEZ7NsCNJ1Y/XSZ+xkEWlyk75sdXvv5hZOnUH59qUEVbf8+0fhXD0U34YUXrOHQrj0f1OCcz1hPKACZdJpG8ij9WrKLTyDDCiXDNur11K344om8zbL3bMOlwtGX4G6NK4RdqqsexWa/Rjc67xtKowIpMWoYiUolbBfjjkvKpGwZ6i7xPV0UEhifcalQBabUqZrFRkTBnctlTRCduqUZLtDuSUkwBjMhGMU+yX9/tqPoXTSh5I5uVmR96uAk6Zo0jDk2Wu8jA4h1s9676zsuDiWk/Jkon+hN9Zcd/JPN/RnPYJIoXz3+9Z5CF8YBCAugvfpeAEd4ZwmtN0NSNuTQxRISP5wJ27JW9OecEtc/EwzqJjhMPJe/01id+6bDzc4BgccFAbOHgrQkZUoAFfe5q8koYIsiQ99p6CP92hL9k6r4hjAI56lork/BYGtzurSvjZEXN6fVF5bdYf2H1dTBVwdS5d+ej6cHu/NaniA/r6csr/YrHJPNxcOsnNv6Uv3vobKVMiM7XRNh6Qv01NEA8HOEPOmWKcjwdnaltV2mdIuYUH+E+9wintjLXOaC9bFFYlcROkaDTSs1l8IlzQN5GjO8SD1OB8w9rvlOG8wO9o2bzZbcPwjfI9IvTeHbXgILQVUx7jAjr9Zz9DVbx5i9CVHm5EWu1tdOGiunlFWHD3Z1MgdmrycD0TcKW0WNstFvUDXTY9FGP77XUEZdBxr8KfDf2gSGNF9yctQR8Lg2uLPeyvNi7Dz33KvjczCpVX8+rAVq81ClpQNGsW4bPpiIFDjhJz349mhTZCXHoxOHpBw1+ppD+SBN+BcNug310ufGsduk7jRCMIfrSz9YV26peftV34dPq7G0G2dz37syDnYMi4bex4a9S54V/j5p28uhqWKch79XRrWVp4psgCo1Jnt4VuvuglflD1uiKboxaOI7FRaIqQ7gnx9QnMGknPU1qZ3N7M49h4v8rgy+FImksj18zro32U4WelezznR3ctmEJ05eqqEk1Ieqb1F8Ki4+NTfvjPktdducgc0Q+fEPOqcxM4xVcV6UZ62jEdY7PhzcVG1d6S7Ft2Pqec3ODvDuSWg2B/7+k5Z0kuMgxApTvsZRpVhBFBgOz2hGB5j0WbNTKHFPbkmVS8q2cpUP1Z0oqY1WYEnxaeF7TNHS08FaYRp9QnnV2n+OBs1YN5/EhnCBcmGblC29Dkzfrxcnrov+2m+8dh+haP/PZqaS7p5voRPEc6yS7N6ska9Ww3zz2v594qMqY/uHqVK0kp7IFT3HaMXiBJ+ver+q8nUMPwRe8AvQoVONsV52qTFDMbhLugCsAaFUYz1y/ItSSu1Ef/AIaTFenDb6bAzNgW0qSsYooEcIa3H853/qPHee9xVUscSvg5d/dxtQOfb+La+Q4+F9QLc/QCc02S4gt0YT++Ng1OOJERpu9GWAi+Dy3SBEnGncOU1HYO5KtIUo5et9d8pW/HlI3aVvxKXBRbplptMFv/5LBtpbStH+3F4DaV3GrddpwWxiWjLXxnT47R3bay4W4OaIGp38StLdvzkC8GX1GRRJDrBao9F2mxsVvWdjRnBE/8L/A/0ZoM2/6c+rh9takPTc6JMyNwtNsGkDqDrbjN3/no19oKI9JcSBE33f8YGWOzfJ1UzGSuP0F5lmjqMv/Sc1yNV/VSF7Pz8d7O9saGw2W2HmnbQ0JXhPjokv9OdQg7LiNR/PW5z/ViwAKaO0ehiltI4fFPsq5mMxWytXFz/Z202NyGL7vFE0/r2t5BucOY3cPxQV1AUkgO+J/ix1+YSD2giBGQM/KLIs15E1VV/Od+cvNwNX8wDsBex/PKXvYWztLqB0frhnHKr57EnhRJ1lMVn60jzuPA4euGoxv6w1Q5Z7MFPp19Ulagk3f1tHZDMkSw/N2hgKiY2i/PvA+RJ+q+28Otg8Li4oVmp0Uh2hwm3kHMHZubrg5yVPVs0dMP6b1KznkeuvXg1pGtjvdE+/NJ3U5MZsAr3btrfMn1w8HHV2jd5I/gY6TZDzqCH/e+Gb5b4yIny6iK2z1dPPNL0l0fL2Vgv+TR+WbFqSaeww1rKrp3tO8MMW7Xz6+Ouh/x8DlcpdT3WCdtr0s9TXKKbaDqUfRwvZD0b6KCO47cBRKPNJ3zlXL3da+ttVeHS9tdWfSFWNOojiqUHxdEkIvbvjc11J/gPQe0x3JB31QkBmXrEPeiBhOLcieZiLfqd8B+pDSYjNglUMLogUCOUMQGq1UJc4jWVg2FXm3Xs7QDp3ddhzh5mBs5yzlu5z1FJsozHlsTWLjkY9C9QL17YnYBnt9XksMpMwu1jRi3RdTj5SLeTimDLe+aW5RVF35z1K/YH8JYbQOKDyOpFZi7j8a1MYIHsqatu6avTZGTA7S14G5pc8kJY8brgJGE6LMmcmEKftHanMwSnKg2IT28s4MyY8NSY2DaFHLKyIJzTMEB5r/BX/x9eQiRgm1uWjYTx2eJBnttOP4llfwCRjE4RkF11feiFtyNiE9NaxFS+qfXpwirS4upRyUHuYGcoaOmtczPNEtn3Rg1g51OUy5nf041/9tF5PO2W4RwxF2b+rOpipE3FBEnNW7sjW6cDW7shRRVXOWAJDSohT7rW971Rlv4MoUWJGHOKijnvs3yqShJnqn8HhG4RQh/L6vxJbLdv1UiUR9EoQ8iH4t4KF5A9doKUbekrNcGrsTSbtqLPXJr0HT4T2DZxi10ixfPBlv7OCmF9TGKGAwiN5c2L8hjO7N+cP37F33v+ynuNXiIiw6Ydi2P07lQwqEEVdDXnhKw9w99qopennKR55IoploxmcE/Y5uP869dP1znDDU/al27VvF4mHmx9yUCHFxR3Eps1vbwD2zB8ZYA+Hw1j2O3QMI8FaZVkX+zSqnJCfTlSZI84xlKj42iBA6ooq3ROJprOjVEBj4CcwslXO+H3bwieCchFtGQAtgHlz+fU/v+HWLSn4CSaEteNs9zU3zdgFHozf+JXyNzsDn14jZ7hUPRe/cuJPqVhW/m91Y7znLMjca+zTBnBFbciTI3ZG04pW2pViMek5qJvODisv+1sXVe3ykREPapmFo9+G+or85I8cUdKBjrbPyEOYnLCiPFl5HgANQ5xS5RxUzEw1nm/iVjgz+AdlkS1gQJBy1+QZ2QDHJ9nfYK9jsdx1BwBWVNL8Kj3WSzP+JWsG1X7ux403jBHJ/7hZTwasGz15UIOcu89OvWz/eGN+QZDv09FNB9Yqb3IbXwZ2sTezVbk0M//tGTzS34BXeMuAvOJbm5DXTkk6+tYUns1PvXIzuKejayF0Ntc2D3JdteeaKlZcTbPmXIvOZih9pO3w1FlHMBUY/+wDH+TmfXu/B6loKmogW92leCsqPmVKcUqFFEGVa/8xTqrP5iA6pLAfus5XHvFrlYOlH/ncNwlQHlB1IN8WU+C47ESh5KYRuvLdVkvSxygMhGhuhw6BHVNl3Gg2HILvWXE4Wn7P2ikxTPlYL7uDFEa2J0J6vPjV3TKD+E2xw1msBdhPgmOJTIbXVCXMi2sKPt3MINEomKLJsVYLR1hUh9R5kcqN8c0OFiJFhzAaIge8lN6Vaq3Q4P+v4Iw21n0sBXmKPkXeraHoXU9SBpcL3q5RWNYnZsJ7JO2SPPUdRvW766HWn+Q3EDmJlD8hELMaSI9PnymMcKUMAe+73JerbqWWVqmGdq7r0tftVf1Vo+K8zo5Gon9f2ML/7iLfc0c406zwJjlWmy/FJmY+mz70nXeQwpEx1I+Nnp2HmCdqGKWaFk1bvmOdJjw9K4wuNCh6n3Ql2ZHimQ56njrQc3q46D5Huxhs7/Y8F6kwXXtAUVUYJs4DKmuHoJXcG18QX9nYzYwveeZoXvnZYwi1F2ESfNwZZNmGwU1sDMU01Qoka8nDy6ikcPcG0AjNYVPvN744z1Y5Dn4kTl9nohZY1A7a4nAVI/ILBEsbbEwz7RufA2uQYPUE/sjnT75E4MuQaOgwvi7UBRxtmfzCN1X7W1Z27XgL3+Rt4/C/g1Z0t+TLscPmHsKmabN7NHKqz2fSpm1UEDVCsKNlnP41g0SOEwok25sYgSehgpXoi5nYdIr0VI7WbPdv7wfd/X/eQunvk2fSWtJbPsjJquT5E6/Yncnn2YO/WZhPjfj2mws34CtKwco7fQ6ZQ+HFGvceUf+Wn7MG7y8FpFMTrr+mRdTGgf3P5618JsfELH8aLJJULaAdu3ZiP9NwpnZiJRqjtQSq5ZcuWSSensnI8D5tcl22ityjKAYZksumpGDe7nWq3bRYKccxneE5UdnDpaRBvLpcfDyhZtQ7wWo8MHa4Z/FF9tRJ4opzRV3pow+TvFcronHwWGW3JfFAmt7pUwnbkn8ycHhfzV/ejZTK2aqOejU+sLWHSet+HV0ZOh1rLk8Ez2hT3KEEsBmaO6Nw8U/10nwNduxbswf1+C0Y3u5qCuZnqOEjeHSsTbGcAPPfAv8TxeKDUH3dylUYQZYllwwMLRTIlO3DSGrd5Bkh45udwU/miCeOepcDZqIVgMEBsg92QZzU55m01PHb5X/QKSimIv9vHZ3w1tsTfXjwAk1025quArHf+7oV8LcdCpAJzUKC3gCyX0KZgT3je6vd5DAJ2HtA1VfD4QMzDHPHji7G3BRq6/VkFQpxVHfcyf3ojpz13qK9IFbGxcMkfHxecyutVhcJ5nuAeApbDO0cuz29uOGGLMsAyoekp4OXso7Yfz04zn1YYDFlLBMynHu7+39en1rLADZEt6AByIuiQ9Wb4e6VKGwON+cWoD3jYWQLGivVoLlCY2YOVugGyxIj/9KgMfD2Gock5o/QsxhGGSH1+PYs3e10KUGnW7OobJG8+H2iQI9gXeUIxOL4B38mMr3tebeaTsN988PAOfiFuvZU6YpPC2Pl/NAmOmGmd32ai/emK7AVmEt9dUwhysO+xVetQntlhP5TlUUq9P7fXEQ/yt93Ejn49Ryo5t2XyOgs8ThbsDheUgBRfn6nJM32gJGj0C0HpeLCK6UYCbUOu+bL0G7ER1d6u/Oll/08le+3PeSSQvK1EId16Jb+DE+mlxn+h0gVph+L8KlGARfv+mT6J/2LgXIEby4LOh5o+6SY8sWvh+6040ykDgiZ+9LQrcTQApjg1I8fTfKd4cvxZ+wNYwtww9iTxp3pU1CIBxW8kDLn1ZqpKM3Ia02eZ0vGuORR+2Nm1u4AQH7H26WfWqDueNCBmWs3+hadYiQcOut2rBrK+8cGJXFCLDx6VpphVcwiXjceAda5jHLFCjGbKa1vTOs4ZH06yzQvlFcFwJxqY7ti3xOgp+T7mJwomambWK0QpyRHAro5oy5w2q5nP8iyVpqW+30ZRkUdMT971e9pG6eKqP/lwbf9buwOUrtDa3I8imyf2vPRSC7vvV8xOGYOFnMxsB5NLhrybvsO7W491Y3Vsy0p/RRodIwKFOc5DanGZXdysVGVe2btvitYYd2N5cn64XkB6+V3DHltv2XTk0Q9jP9BL8kbkKjhmIpupbE/tdrX/dlAid4uGF1ZGeEjAvPoiWk5nv5S8Z7Cj6V5spRzeLhQ6y6b+NgalVwSmzlEJOOVE4CeBZqtpwut/gJSPStKbzxzdtFX6KYgCcErKrUZHnxyNtsxWLjNWCa/8irzJ3+he5/DcZVcWWfer+Yy4/Tn0cetSdzPZ2eMDchJrxC3/tFumJSi5nWuP82YCpJTKjDLFn2bU4uFozfKPILhnpf4WvGJRhRYok6CUvsYxIOWNM4CjqS3R3S3V77X7QXlR2C2wE62aLsjXLHH1CfNKLKhUZAfBhpCLAbBlcqcaFWegwoth7a4cLJmYD/yuC68FaIHSFnkM4M1umumKLFPPE7LBbXxXcRGHi2Tk7507X5TmyHXMlFh4s+Epfa3/3VQ5gYMK1BwZPzP86Wn9PpMqG9ZWkpKXsrqVwWS3Fly4Bs0Kd+ylXOt1cKWLnUCfJpap0d3QoSQ+j9Ia/frYhCQ4qs2JCknCUqgCmePz6kymI4q5Mt5Lo02Y6RFuCfWUiabP0N0CpmjxrWo5pMjHcX3XlwzyDM6jNbKtHNxVQTAnaSUbEbP9D+rkYMRCKOLSxt6gOQybo20y0AULhBBAKIac3E2DTO/DiqxQ5GVlksHuKNFozWvgejKbiXcn1yPPkyWuinpdpNNitZTl98NC26CqAEYvc2yNKZvkYNU+zmjROqzswjOtpvDWjXAAYgedZBljeJ1J/OB0b1K69ssMc7OMfLWLz/c7Cp7uQY3qMkRxBgOTgZ7Q9LWyy6Y0oHO0DZM59GnYW2dRlZBEAK05tJ+9sKaosMYt2l+QWmabA36j2uiAGpPLyNrsVSTh7MSq9idYSenztfplDXG1MoM/vxv0XHK+7e+ypruy1F0tsn04+UpIXrmcG18LMz7d/JX9xLWf5W0NRhc9E8NGfkFcy4JquXiLtuf91xPwDaC2eNKtRUk+mt3IFropFRwa0l66kFURGP/T488MBCC12+rKkDPmGYa1JCG4YSyhlOCRsZWeEzqJfeTe8YVY5u8v1CzK+FEuwQiYDqkrHIaQnuDpUFWcTHRzFuTVFwYQM03RsmbymKQete912HIzevcqaYgabsfdj2dCry2+4O8wX1uQ6OPrWrZ/v4ZckzHpaCuY8duQmokiwo5p81ywhbARFIPIfzLE7ORxe1+Ks/B2qUFYcbnR6s8SkUBH84lmzonMPxLG2/5nJYfnflam/+LnbH+QqQCll8fgDQcILuwtqkxkITtV15pkeoCEizD1f90/2szXBd6hvxzuaG7tmPuaayyidT1JmnFmff+Bbu/Jse6XuYpKsl2oTyrvFUjvSPUevIbHCJ5DYnkNWhTJxParv4cDJgztciff/GpYjDZJEWyF0LadZPffYNb/OhmQTuVUuZBozFTjwb5oKquBTHI6VGmq49Vg16fIxzpKoyLo9xfFyuqh8Fcxf9Mz9bhCh+0/pQ4oqlAL1ZnwAvKEiHVXaemrEKPoHORvB/eAWGpSCjm+ShkyJfdxPqJcwhG2Ml1bMLQ1WIbxOflCQ421m6P7ZGl9J8W1fAlpziX4iyJ+U95xBA9Z8kshZFn1uBN/bLUUJLsrAoapMJXuENd8TDLWqe9xCtj8FDtpGD7JFa4HtBW8x8/Uim/01w1qQSZVWcs/ET2zkylovjQoZbyVqpM4yjTWyJozXa6gS27B+cH7ltqUPVpskVVF1g4qt1ZLKoj6goZzERTGtW6qEsOGqsqHG1raU7Iy6W7AB2aPESrvbVGgehyIXrDyoonr5K7IkXVdX+cUmEeaGNhk2X6zShfjlPotVuTOc3fB2cRKxwsVIRhp9ItuLYjSB6UH3aIXOD3PBsK4gNME3hG51JwLdnxFlLMyCy0tY8MF74qRrUqXpsySsYu7yogU1p+QoTjj9IKF2Szp9tVfmboXWYfBAJLSXlaNGV2mFRkmeqZeFIBU86oIf1N25NSXdkQftzdOLtaislgxQcXuVG2XYo7qw2ze3ciu+czf2Y5mjOarl1+thEgrE8uhpj+IGTFaX9mMLckAdNxPB2WspTviYl9odeCFy+8RIPq5WtKXEBMot7IkoBXdmcZV9CfgiJ81fnNb/HSd4kC04X7vKwv+e+pg2Jv5NjOYLR0R/P6s4D4a2iFyfXFmp8dhN+muphUo9tLZfggfxL+xaLf/amk749qXuys5FknHz65rmY4d3UF4vFg8pbXsa1uElmEgRQldQVJ62sSR6SumOPXENCExqkxss4nZCuLRridx9oUOrbv87vG72NLv2dF9mwoLy1vC66agSSgKpL10oRYYMXB0oCfWTo5wN03RqEbl9x0nrcpLlhSFLyHHPZrjNyk4MRTnouNN452Bo8h358Id+Y8MSMWBqyXHZEgcILuy+UE0Fonc28OINJcjI5EXBsmnaRgaieBQ3jLVeVXph97GBADOdOsVG1qeyzKuZfMa7+qv8SFCKBmz20+qO80tBIJFU3e49ZqHSEE/REAfr2BaHqLrBw1VUb4oeyHxlbTzHhkcOzu5kU5zFywQnctySL8Yksk/XOwYafFV8o55yKhv90I6emwhrgZV7iu8Er/IGw2zf9JzXz94NXd01YyNmlAYFYdmE8p9ttbo9bPj1RgeCvafeSqM9teNs8eZhcTffpY0RKCrDT9qWqPgDATE2WKdgr39peVihd1S3wdnzgTUN725jR3bGd8l3boLyqJMHsjezSd3SMCDECqZAOZbk7TVWryubC53YESSSyYWqWuWYe5DghK9WLJBQerU7WtTCUnNwx3xA215TCmW+V678vn/4f1HqInAjB9ki84e/NlwSrLFGcxc5JgmLpwAvIfE1JEn06q5qZ2tXE2ZO2vgFKlKOzb8pF3Ts9k/utf7AW8XcL3QndZAtNb/Nts86zDVJJlSdF5tCDzY/bZp/Tzd29gEuIm3n8Nfy8KP9DwKJFJvrNi6DUvsGtNdfRKXp312MuuQHim7ARHVNXO40wXtNcnJF3cZoK6PvfUvXW1jqEd1QCq2sgfZl386nb+Ty8dkpwIOYXH8Rk2ZkdzVbB4uGQXnDWWoplF+4l3JvoGrz73O3XkItx0zu3W8BrS2egFAf1jd7OQ8GIr0mSBI7Uqy/txmXll/PpGWTJAKQ/i0N2ktTUprqKLiOy0wOg0UH18wgYA1dTWxulkggi/5kCGL3SHeHfEjy1wI/WN368NwNclV+pRtfeygdiV75gE9NyTfIFp+vLbCl+/NtCzLCHB3EOLNhKEINwoukKIb25utRgNfFigFUvliLq2+OnmFq9BFAfT6+sAuVfNgQTOhIuQGT1y2erpQOwh65Gx6TciCgfYXdM5G9uv6oz5ElsFX6Tj/lBuLL9+quxkQ/LSm/LarXTJc98FBxCbCZ09EQ6h3DMFF5nOUxlLeEpRainLvC5qEFLrdx79ZWc0as1JLCzzf7yMKgCOaeF9E2AG2q4vBf77+9+2WEqoOO9qxrbvs5scWtmaXINjT40OJXYL2ir0/CLuIDFAs5mMOjbT9R/dnSyYwWS7cDh/ex6S+lWGgZoX4vDKvlgmfXG9/7hR609kT65byj+KNhKiPLwUabmHGRFTmQKn3/1lU9H6IiyCRY0+OqciIcxpXktu0voVCQ8ROd5BYpn8DKwrU2uWMURdz4Zn2C5nlAWqnvxUyGyzFA4bLf/0P+yFGbwZJQ4l/8yq/TgM48SoNW0CzYvyl48DN+7tPKDvFGIwF0UEoAInH6BbS4C8G2SQsBbcBAuovrHa9Uc2jTOkFHfwsWXXGgq4Ugc1rSXNAGZ4jGHr8ysSZsXHFw/21o/3qGj1WFyL4ddH5rqOfMQ51/w1RQ2SEbyipurruR6D+xUDwutHGdpqy+0dIP9G9kzTEXisjCpjaN917dpS7Ls3XaGFp/P2TBZOscfFO1D5Q1Kx3KyasTpgkFoKwzIzIDLfwzXj4BbW2rIr6w9+7qztdU6AqetkctVLp05dhPadKlOVB8Ayauu4jqeKOa870gA8qZxiIysD977/6AIu8nzKj5PIqplzCl3Jh/4FprJh25kuWnVOdCVEojntIZP7tBByTOT5CtxfMYr5hpoW5HFhmhjQxPkNtNe2vcESG8RptMhz3wj96T44mlyLMZuno0chifQ507/ybSTn2km29UTXMWjsgfrvdg2s2sAB0Ef7e1x4Wu7vq2JgKROrx7qy+DlgQYJ6fzmYy9HcZ2NO3Ii5sRf7ah4q6e0CTTumXyMSdmXh9oQGCU2/QgDkpzsQPbdXWYmVpdwPDg7V31J+xYcz4+5714+I8kZKtcPvqUnKxQU7XwOKS4Emy+xXUK9yZobuwictqeDfs1S3ZUqOxY4OT6Ki7LIKXeoz2PzQXLZ7m87nf3e59DX981k9i2qTDtU8qG1egCeKquSqZPsNwoAS6Wz4R9PYzHSrB8vB8HSw8ryR/gZzxsBjts22cflBayaNZKSiyhllNjn32+bZSL7Nr5tzXz+Qvyf82G9jKWRAN0sa7oHwPOtKm8/SE+YTdQFqDbolxZq1e56AeEB29Fq1C83Q7aKgASz34D6ECkXa7vI+E/xCqwBc1/5OJ5nivX7YD1CIkTHD62xxkktwGTK0I8YR2IC17dzRya6G9COv0khgpUv/Yq1byYYfI8q4+r3g2U36jxPQq2jZwVQ8vlynczHAmsCM+bInFCV9d/dzsiGaTIf+Rs6Sv+OfzcBZc6uM+00fIJYvaFeS0MWV5aMdue7XH6uJ2T9wGlOyjFPb4J8htlkU/n4mlRWBuhZy/PgO8zscRwul7A5q/VipqPdWehnL3r24LcKR0kH/izMZ/Qpb6zPkTj228Rbzv8UWkDpqQLefqd1lleQJU1MhXJxIJVPVjFPlrFOlrCDptWYnUZStuGfJXNhz5XmKy44oaZXJvYpHowjTaywsjTqBcP7vepPjYaLDcQFJBnawQFHBhfuxys60t9tewAsrmXP5hwdYc4+elw45NlBxd/yo27tyiMst7eYPkRj5ZB4EM1PHf5BNEiBr6zGfF3LKKt+8bKKgsZiHuWyyz1qmIA48+kQ5+3TJB+nUnPfqCPvdr7D4csLqDXPMNYRng0lzMQxr0at11XC8XMt++pZujtnS2Lv5S0ehX380mP6MKu4ZomA4QwcXCntfV69RNOHMOXlhYVon6TfyCQYI/IRKFe33dc4uI2eCFfum9uOaTeo5zljssHxD1B2cSGLrjigVhKg0fzx64gAsyk3JJ+PN+cTaiPbcP7QWwDJqa7uJxfxLUoJ9BLC8QPbmGE7bJaKGq+fa0JdONl/8Utl1WRhXeY4iZdQiedJk5LQwsNQ3tkjHxnFI5/1k0PlBy2owEqBT5tnmSL3RKfvvCunIXVRcsr9Hs6NO97IxNJojSOsDkvMfKpkvDMcutU2yV3TPq5s114AgfNcob6sopvpDoLGwYZcFCeYhCj2rT1C/8EUJG533al8Xc6UI2KNFssHHbSLOVV7O4sieVQUfcHgMGNoR5x1f8CMD1fKgB3TyzSy4w1oVftvRl6Cyv8G/Ob+0lQra1tsh4xXciPo4ayBYdtv+P183MU/LOIK6AMj3Z4NFzvZDlC1fz7abHZSjiip5ouWAdKHGrGKUd74KBqZ9k6gIUO9ynbMmh3J4x3xoYm3z+1IIqjYZ7LUJ9U2fkSrVAvZJuutyX0GuzgfegPRM17bK8zUMTqVWzZZE50fbNAVvUw4JScatWlHQ/L39sn0MilQ1VpS1pFANbIHyhBgA0/xf0naOAghoaKJZLlHriioJo8MC0+cw9ici/dj3LD57Q78pnX/Q1TMmWUSUaUxPS9+5shj120Wh2FCBM6C0XMt2+pAlJkEahtc0+4HketXYfCSJkw82mWHP1jxxS/yXWT01HK5IRBe+VJAsm9/ONTpdxmYS8CfVMtWPoypn5XrbU11kbNNqDH0Gvt9fk/fMt+16udd+IyPwXx2RCa3q8vLm9QdFf/2CBTEGQy/aeuwiPgF4/2wlLSmw+09INB6voqDcFwzx+8Fq0Tzlef3rSPJVtImxmv2PyCiSYf7wx092prjP6watpzJI9jcyZKLK3ZGrgW9YJyDrpwdUxM+I3W7g6lhVCt3Ra9KG0ANGzXabzMUTxarBOEYY8ndOHO9oJUxbGffU3+kyMLRwEkeMoabjYFNHueUElXx3zTNaETBVOn0aHl908sgJ8/c42sMePmQFlZsg39WbwyNU2Xq8redL2J10aq8nSN6vOXZuS1uab1zcIztJH2u+H1s1nZra4ki2wG2DYj0UEY/0CRZrTdq60C+yHnDIaBxX+ouo3RVB5dP3bU2noy/CtK/xVhBkA83uP1nEgk81SGz3JZ3aadXVtsZU9bxsWOqZsSp9CDwXfN6akZIDAYlooz2KNp1zJJCnsKtF/C91H0Q2OWfaboegmDZCBR7GtlpdUPzd4rJg+wkQ00skaTp6X6CbOTJ9RUfZqhZxr7Z30grQy0dknkNBh9ZT5mkiv3g7RZeqSJoQR5OpPmslR6Vf3yo/AGTFi3+BN5oP7Kzu4oerIlAKCK6CBTa1eg8R5hNgMlECfifNLmk8Pqrjn60sfC1IX8MjB5gcz7iNLjFTuz+ZqhuDMdgk03rTkI7Y4i3Gp/+4RyZD9XgOQE4fI3gN9K72HlwL2DzfF0jql2keNCgrcPD0d100DgSmM17TCWE1PTnT5gELbNh2rK8h4N/jsKu5XsAD7HTJN3Oz4NRDN1gii7QMmdIPCyDSmx62pWxPnfXjy8RxJMXodH1r8CGxSdunis3jqS0ExN67lw4hmS1X9mcjZLJzU1/QprCMBx/cDpWv2ewzXSh7ciBiuG+iR+EB89F8O1cjuls6qmVYzsi8lHse5cMSs9OqCtshnWOhnWAMSyaTH437TQaXFoeZRB+v3UYShUFcCRfwswGJemrRiUF4pdQySoSuFul9vFPfLS+KYJ88u7vgO2vU3ILklzdGQJ/KejMMMto8z34z8uXg967lEYVdNx3OgylxgAFjTdmEyFukcBRZdOKteH8xvOOBoAcqOFtiBHqkGAxyvdOQUEyhJXNSvWT1DKz/jZdIAQotfpItdvJBnLHSiWz+YTqGXM/A8ACWpeA0iw7hDrJ7JBexrBTfRfFddUMGL6leEMnP6Qt1fTo0VEXiWS3xT3N9wpUNyN1gNTmfhGVnEp/ZkRff1+fU/1ULD4Rk1qbarJuHlmyoMJEGXCjRZD5oqNAG3MHgv8P20cAESYJxooRvLhX8W6ilUMTdDWIO92UyofxQ/GDOVlJRDYiZXqyGAxt1fxP689VBqdPWu4Y7pu5uLk0HJD3h4ZVzW3HdNNHkz8/JPacPMNzrUH1n3geUC50g6A1s2IoYPRvBbqGgCfehtGsz0GuWszRm3NVr/dBgB/dOgZvkXm1RIQX5TEWoedmxxIh54A5TBxjm3L+lVSGWMj9tvP3EDrjUFbT5LgMXSzrOqirPQunkL+t3/9bNy/E9Y0lE0Hv1XNkvjncusDAYqyFlwf5myvm/I539lVHtkkIv+XjM1qadrN1QjZhBzJbfoqpQOROLae9HUzkWbZljhwbCE01e0ebZs4VaCKCF831JrifIzkdE4juKaFOV86hhaTahFCRnmINQ9SnZFZXUGt734BIYzG6NDdUqzRtX9FuzswZjpmX61G49NR75xC7rMJm4dQTpioFKxpdy+LqHbP0fM8yYQ+H58YvCwbrD8p0FonL/6PbzKhmQAla/FCygtB11M1KkbX4pxW3ef8/5Qz0zjKLtN1LLyhatOdeUDx+1jE+3qdbv0nKQFnwv2PZo+678b74m0bCXRVZP1dc57tjT+hPQH8CRJiYxTIspGhvq5iNkBI+/FmpJqkzZ+hacMdPagjfFo2Y0HjVNl3eNfhoeXL3pd+TtgvEujSOOodu4Bx3yl9mMoaH8pd2PhExPGpf92WxFUEt6PVtDvvDGvtkDwZMrB4rOpTaOdLhgOgEQf8L47diACbtMoE5HhGKKYVzRiXdJACsme/mRdnIk8cA8SN8LoUXLmLzln4xHox0+NKlEeMvjREPfrG7czn3EWoJbDd0d2zt2+aKUVeGD2qv0DOR3An8N0RT7kDmy1iCI+hIhKn1IudJu8BsEcy3vAt7s8F/dsfVkVKMBEvyoKugLShtUXS6YfR/qkEkVT/nV9HtvQH+eMm9M+wU9ZlrPToK6Pvc5zQHT4LFd9Qyq6chyLOdJLJeqQ2lOyt/mw/ucsT8DtH0X8N7sb35tuv3LcfN26/3OtjNbkiS657H0l7e6qWugPK92Ji7dk7XGd3EA4uaj9X2kbnNlUoMeptaaP4G7H1hZRsNX0VI85v/7ie3WC30WLqz2jd4Y5C0OTSC94XW1IkXHfSWC911Qc8mvNOsW/ZMjhL3nKoeHtsB2275INeCpmSUPx/QSUog8DQe+i7w98fGVQJAyAgTTJvZQwUWAf+yWOyGGSD5h+vq/z0S7qL873AeoSuyj5m6mXQPxWWPqaFmmuIbGCWwL8AQdrxX8sgPOn5Dwy9bMeFYkU+oG8sAYqE5fBaLtXmTBxEi/M9LoXuhjfN/sieODVvH+/9cQeVoY5S2ZmI/3RJM47DjWARndifJSQF3raa2da+zxuM7EVl+ORWHO/bebTN8HlUm4feuE4fD0wdHjFd+zAMXj2V46f6jH6bNPEnGsT3OB2oo3H2a/bAKW/7z9PB3X6M36sHUb/d1mYjf5DCzl3kIx3BItK1b3ztKN5NSLHPUOlr9kspttLpw91yc7Qv8nDUPdpo7u8X6cXtqaL3a1DLHskNmLTulDUNcZG8wAhjvz3e0e1UtDK9VuVyocz1IvtwFfdwI+twCUoJVP/j8Qc68WKX0sbZNqAFDIDTusJZx8yfYCxcr+45HlZvIOg6TOSQTL7nZq3F9xs2R7//kE/WNnVLVRtLYf8Fm3+actR6bZdCZVPEdVbRJT0J4TjniGp+jU+hnt3quFwyGBZcoA7NDPF1CvmMx299FeENXTq9sPv9cGjdXxHQxCdCZUMmVwqZLudcRAVw7Q1TXWWHypjO3xCTpvw3W7bB64VN5HLG6JPpXO+nQfprjB/nig9fGd1gTPKVUODknlbQU81LIoobmDkqH5zkLXl4beiVi/Jq8n/aYaGcWSg6mcMYLXpZzN3CprFO9Ar6Gn3SDuENR6D6CgnCu0eHJZrDK/1alp/Mvh+zYHL68obi8UeH0R+jbbVbJ2sXjQgtjNSEovbVpauI/vU6GMp4Y+T4na7Rx4LPtkUqL9z/IfT13yl49dvDjfeHPP4TFllOq+nQ2T5pIge+wX5VjFXy6iAFtLLTsY30PCSUZYnOZ/yLKwmWC2DdSQNBMfV2Qt9+DVQ9WXDg8gdk/iWivebBQob6gopZOVpKjvOxvbUAklYn3drlLJLcPxIcS/1QbYwRGaBilX5ndUfHw0f5gQasmSqvBOJz9kVu8W+KXGopfLhR9HJXdJWhymeg4i4Dy2MXT+yEbzK+W1Selp2sok9jp8Q7ivzwuASHqhzquG0fRdHNsjwVFYwFmkLN/CvyoRr1InZBh8MXf0pKrTsMTbwh/Bu6g/FyAzY9AXwLu8dsFh/OhNuQh9UkFquFfOa0pPnZ8P6SUbZIvE1mTw+0L10wL2Ai2cwY3v512+1VMZI4+SLsvKe82l35WciV14ilturHHD23EYF+jZKz8UotKZMhlNOEJXRdhbiDBnAPrwcan0wCmqHuR/RF2Ou91/I3V3qaGLS2eFlp9zxrRC/NItttNBa/BdpY2+vRVnoEkTGvUIzyuIqDmJEYE7IDmJChN017Mk3xzVQseSv9zwfVb/WOXuksTnox4vUZ/gqsUnSKKj9HfrXhfuFhyNZ/qFvXAH9ttn3/7OkzNm7tidfU02rTy7tSA0Rfm5DfEA97e8jqGnwEOMuO17rJffYHfIITVwM+f+19AOmPBUTmEu08zSZlyEpfELjcpu2DwKQDzUottdzZ/b7bxyYQTm2lXW/cPRK3tWmAnxGFglUyM9yFElpJEy8vyqIkjk1UvDLgPxurjhuzQOwstWClnO+KtjG2tquFgubpTIGC3S2V8Ci6NFZrksT9t8pfIMcvoh6qbQkYRwPlX//0/A3e5z10w7L+kCB754eKUzTpJi7KUP9wmrOwRHlA6eQJHWi9gGIq9g/4dLYER0ta/UPN4SjKWnyZhrgXHk9GSOzVzHVtsriKF9qZJVEWfToD31sopV3dCpTfQFubvlFx2I6TEeUHuXNKRGW4c9GJp9CJJ9HD5FkKin7F1TeHjzBVbatubug9qDpetQufb/DsQfGpCvw/Mr46LMpue1tRQilBGVrBAQlpJQZEEKRDlO6WBoEhBCmREoYuCUEkZ+gYOkQYGqkhhlK6kRYQ+Z4H3/ec87u+6+IPjPXsvddecd9rr73l4arU/NHytvdjAJJNmd5NCWUruBLWzxqmahm2ULyVVPxWZmZbqGn9YaAyizvVMHmgXmH6ycTd6j3GclGuQt20CqeAYFkzfcRVUaOhFY1RmtrMwdrswYLCmCnsOSUp3evmSRpByri8J4KjBH8KBz2OsablndIConmubFyxOD2WAW5lSHo3BMq2/pjls2tXlvrE3VrU6WJYCDiq70neDTppfkOrBJ3T44qns/vafkHt+a7NbmWXw9vQkGtw4jiZvPL2TreowirEP8I9WY9+lnaeTmOsY2jer97WDq+qldBfuCYpV/jnOvFIS1f8pbDsJtZg7S2Aa8TKJA5rqIw24tVsmATR1ZbWARYPX5OeFQ7B5+R/+OKOp/zCWXGDBEkyTZchubSEV9bOTtwwtaT7yVzzhrrx0moaXNvGYERr/q4s/aJzPkI2MwvTq9BoK09qMECTn+1sam3BNnhgndDu5l05gL5v6eyc1M4jxz3K0cJPe+cR50oy1nioRJCXQJXaqLRzqIm7O+15x0filVfM1Feo5EY6V/tJKHWLIlNYRBcVNLpqFKWhBzcI6RrTHmbxbHDmEr6s0mG7YhX+6PEKQaLMqq8OnCftHY+t3WC4AqjQm0lcosBPAndsfV1znDUrdNsjSTa8rdisrgNrlk6axr176ZN0YruvQDHyi9l3iwUpntg6W4iRqTFgBRBdZXXNgo+iIrzFQ5jnk3Wj56i8RjfFm+ze3sxDkVS1OFcJmNTozmHogVgDvo0ze663ig8W1jJBTU4sauGGeKT4c9Fg/Duv7fr9W9Argvck88p5XYapS9wCY3nzsnjNrKNGbjZ5ere9b+qcrkKV4HYyfHZ0MqW1xn617v1I05PxjZFqH+ohBxTB0ayjrE5+BinScw9uvU1+VsSi7GZk8IImf/bkWGiBAVZZFmeJiGkQX+eZpxq936amGMWALHU/tQp6RElDcefPV5WDe9r6cFy1egtg+j8UzVkCIgGf0HQ5mbJBxCy87N/BhQ4Mdx5k0EDTkUSxmjdkt2yjyWMbpr9wuTFHjOc0Tn7CrF36bt/77BpyyeXeuydDtfsfPwc5IF7DupLVJ2hqbSLG6m6qv4clIGLqT3CIHXfCcEyoYc6+6yeMLbWfEKboD9HxgLHcW/7lLH6zfFyJxAryVioeJSMfhytSVEOWPiIeDBz0FFKxMEsfBAPU/aDqVuAHxJHYeKrjzWiLNrXe8WFUOa48I8HZeJYZ5eSV3xhMwe7KQxbedtgtD2/J7i0ojJjSwNhB3+4LYmTysgTMkgRWqdnnz8ggCRT18W78WRsHbB1s/hu/ns6yveimHDv2CSsKs38+i8n+zNkBGeAmacXTbLUI0oBBYGf3fuohrvKQJISV55iwzswNyK8GxoKnbZu6+Q3646xl5L80zDbnol4fremfeTnIQxSjVwy8nK1N9cML0k7Tnuv7a/ZuEL1mYRokvj8xzTxWgQ9GkQBFpW5NHPbsqE46i/omK2W94iqZdliVmITSAsQXPvbVT2NpEVv7yrM8v0ia955llvqBRZc0eVhM3CIVi2gSC8GatJ8M8Qd5MkS8SXTn5Ge5A59rnU/NktocUxUL0890s5zOUc0Ln+TuiVIbzeqPaJmx59K/siSjHCyorFYanzfUEnq10s4aoqpL8IS5DLXHSsOw6ytWyJuyqVyPIwpbUFOd1QqpCpcQW9Bqlk78+vFlSfQrmprIN8+TKRV8xEjW+2XgDfFhXHkFNaG6OQiZXsAVUiOCiFJ4+GQ3BO51KPNhThm5uM0gQGCkzcLYDvsKYdJ9QrjMXwjSuBbPxLje+f0pYtyINowsOR6WkBCT2u3p8HRFte52sZ5HcYoQVVxE0KcnJzia+B1f6pvghh24KCdg0WeFEd6nZLrddb0JFv0ylm1NCQrPTH8oZM6zmqsuBlnNDbUO18Z7BrwnfuZinf0IXdo5Of3Um4bvBWX97eDboyNmDovfILWzd5jvnJyyyz9abtrntpZ/ZDYLGdZRyLpyD6GKTbW3sMcgg6aUHwHGt+AsNQeaX1nsOHZMgOkJ7bZHKdI6A26oe8kKUFC1dAJW609hxOmZvrzuQ8kPrjZBUmuTyfBbu5FAqGhNQw5KcuKbxsRptFC218Z7BLzvUXZJaj+FXw5rmFaptLpMFgY4hHwepZ2rX2LnTX+K3U/NuMth/aveCtHu2WjKa/AalsGCml4SHYOXYMKyTI96yhJ8by1GhGH3j7WpwctYaVh63tzPTTY2Xv+NBRljF46QAGLeSe61SVMaUWr+FHZaLe8gyXbBnjnMQG0xgkjg7sgALbu+fXxZkKH4Jn2gW3Pgh1/ddUGGc97ZauZVMRIvp+k9TqHZ7e/KWlYzjWyqS1FBPzQz8OEN0e4BSFj28oEdWUGZq/Nw8tjDhfGTb8+jnp1JMbGb21ir8WEAAuwzYEDmlRnB8J52W0zNsspB4v78jG/bm1/kCQ0N+KrVb9RkSTS9FbqJ4A2Ad74YVW99IevICQInlg/qM2MAvlizM84sPH2Q0rSJ1/8SNonfre8w9K27Jm47OirEl5G6nOsVR0/op6Co7AjJDqXutG7df+TZiUdS/1yljY+RDpRKBCuoe3yyZO0RFW595bi+jITjxOb4A/OWvin9uexrnQJm+Xq/u0tl4NC4B0CO00RZbSa8XMh9ANbdoZ/VZyZeyZJxD/mYcUuMnkUe/uE8I7SqNhuV0kjACoHWdxyp4wNdv2yh+/1FIsXkfejg5TiBvHIBF3XaEgQRc19ad3enYXcbPmC3cuHdoZ+SfUc0dTe7gFU4b4dihRuzdXUhIgUSsREj1WWVJixAoi2TbFy3ulr2m0kYAQTdGxGsis/Ioy0AVP1BmTmiWiy5SCzGvE2t+5d/Ah2K8XiCpnqTsTxCgTjGIoAYI7+JiFnxBCLu9knfyA1Z++uANiRTAqmagL846/opQ7I5OEjW6tkcKGPaRtZqe+oDwYh7hXCZpqPvt6cpOZl4QtHCsoDhmwe8h/2rSyWNbn4X6xhfMcI0cA39oYb9XiVZClr1mxUPHLvELGDrAkkPlrMemHlbsYiauCxp9AqYgYu/9OSDOn9PqCFm4Xkw/8y2ySBN2TJmxs9l93Kn6uPfhMlGeEkzE1WlRWUycPrAsqc5XPpTamjAKou5XjD3QDxge4YTdbODsRVBhv11NF3lRzinOxUk0WJxuujc8hYZKy7H7Yin1fwwV07LCSRWY+mcTuvXukQ9HUcPxJ325l6C5ToQKBBlqoTmVZOP6ecTG6RHQzQWa/AxacTL4eE4YuLFTt+sfmptmCGqbsm7vF3FnPkt3K3o8ajfzF15FdvjshqlD4+61JYGwUxRfttYsMu23kcLI/5auzG+S/FGd5pSt/xmAqBtjo40QFn2dOBZM40r5xINfyVbw3tGL9brqe0RUTOoUpxdRpCz9MzmfdPdh9LJroJ7xaS/q54WiE+0HmKknuxaQ7vwgPAG5qbp7Idc9zj7gM3O+hhQTADt8KwPBIIasNmhaE5U46EurfACY3m8wh2pD67PacsaBYD8yApouStUxbxBCO8diyvnPVr+ymVWGjCtISjEaFB9hxM0HgughRy26HxvfY5tVat6tVG25VGzj+99bThwByfDa399733TKls9XwxMaxNSkdwJWOxW4HWXiOp6cU3lZxraPKNfOua22q0jsY6n9hH6u/rys7GNhDy00OCUVbHAdXGCT8nCZ08JZGUgD2wPeKIoIihSMZ5F5wcqxjLB/B1IFGuYScRUI2osv3OSseh9DNX1CIDBfMbYlvgIYUiPSVabG/Z2b9dYRNDYCpENFkNaabY9apLNI7HC8E4vou5OFcsGIalsFtdCqU4SMst/DpflUGYWWgECLkdmGroOaMCfoM1B8cu0X82+xwqYiVk2zP7IEuhAQi0G3v71xRsKH8wvgsrMmBKtk8dDYXLgS+2h5bMSsF+XLFKtz155cigZqKFLUS8FsrQTARrV6pWx7/M235nfBEvx0TKcvnu0ikLKYqyGJv89094TWn1gRTb201smTvMJPcT3TYnrk7JabVE+vWWzU1EebcgakpUbkBoWYFEQiUCa69fD2yXFW5XRpRwRmiuQoMWzk2+5yGmBK09olKQDLQYKczrqxN+/xs6m+JfpKkt42ha646zMpyJnpdw/jEnjmQcoAXDpWyzDR6Z2z+av7bdcC0/UKXNk2zWnHi4BiRaWoB4xJQ7Ter/jXp3X5KPY20pT681vW4gGPxI1K9XNh3/xiU8vTcto3iuEt/trynVuXDcnAYKMXjV7EWSsWUiLeeGTZGxZzUUJYLq9YVXfyjRivPGWoJbYZgW/Y4eYmabB0h0aYgMBWXuriCMxg4dLOljFe7Q0UDBSkTA/E1/i7+B8p0zIByq5h8YpyrqLpsyb49+lgDqJWOaDXGw0BD3wKblSi0QnDUPjAIQpRzVl/o7bJSflrO9i6j0OKDEXlqKAD5PdMoqgQ5EeT+iMVzWvMfNGyKjKfhPVM2BAJibdNnqh5yWiaUiBae/s+q61PWJ8sFasUpGadJibofxOtgPpIsBnajg35a2XeEM6w608vx8XlOHmgprpK0zp+n41vT+HuoAaXU17PTYPT8kvr7yvEz+1nzVVVSY1Eltg760zsWpQqbDx2mWU4Mw+rv5XqsoHQpMHLkN4LGy1jaqUjPyseQDk5iHs9b/sjRU2gwqnKwmlezWseSxCYQALFai+y/a6Xv9Xrhg3SdlleqeR0anCxtOJe8K/GGvpmATfqSzP7Du/Uzbz/gDEzdhVjXjaUm0fVgKBdCWB9G4B4AO7ktL3nDyIP/f6I6JWw3qjMhjKLg1BE8dCep+xPnglWp/YI+NgyJOlT2dAwFlrMK6zWmgH9SdpqBIg1dhHizxkb2io2PKoZOExnd8j5ixGH3Vw/f5OKylXDJFX+lv8rxbhyBXaKqDJuHOFqpEft4+xqz7s1Lu6dJftfiDdY2qPD3FxoYq1bueQZ0vZdJLUbM/8RVGkfyZon1125LcU8X+wvB+OH22f3ZQe5NN+V9RIUQjIn/GQ0ofEuZm7j56Yc6mgiQZAPEpIBnldv357j9dk/nPgWjn6j1XSozsrnQf4vbtpX3IAmFRX2tirFg2XL1LThn3WM1WIA75BwNP7NqD7M0fqq8XYfSr7XV/txziS8V+XMnCF5gEVKh8Z4QvlHFFQe9G8O7NyL2NxPUDyfPFSlOpB3DiD6muHq0S6KxoQuS1KtiuQNjBxzeEJPS7LmVuDf+eKlCNirG07Ntv/+lcLq3zKgVdFDXaXNPZl7b3mq8jUZFsf0tTykcZKh78VmWkKIq5ggr2+pKGbfiktYSfZBDMyNhFt15/jcYt7Y1I3hUD6iekCnFMRKpQDOhMiVnXRAupxUJUvVw4O3AUp3aGVFtSuP6uA3b4GX1BEl+q+4kmBHjrwWNADNKu8r+DvKRwjk5X+ghQ6pn6ki/2qW4NfOPUQIu0RHmeR0JGVjS+e2lB2RYxj/2rqNb6qmBP33EWTUJZBB+WhtPdDoSo2QPyXdy1tgXNa0deiUDIcF4BjAhhaV5pKm/64QmR2M0mElpyp/98le0IHSFVm0t7PhKo4NYxedimXUe01sZPcEmCzE0yeP9NviLZfWLh2wypDAqZ62aKD40SowwVSU8qgO1JdEW0fviJEYBOgOER5iIx6wYjA51EG8Oy1mhrUqaURD2LdV5if1aTlsGLaivEuwx55dH284C0DUWFVnRL1IzoR6iqP1UWWJFWZpMvhPOlKPOndPF2GPJaml5Ia/F6tjvtynRU2nk3k3Ln0yOhgmuzVqkHj6p8/EL5OFnSSQpZ+ioUolSXBhqbf48thqwaA4yQqADb22F9pZguCaQBMJDSSrLyqSqJn/8yvKx4LsRDVFtNMUrDnjXsqLNgF5+wm0Yn/r1zXHQHASWksCezfQJ5ajrqfcw1/u6qYq3wletUghV9h0zB2JfHexVS9scZdkmaiSQaiCYax0lBLw6tJDdPcETxXhB4vZfKsX/q+EZt3lbHWoHuYIKm/cXXyD3835SRglZfjlPOyev1lwIZHVcsPCwPyumlS/zr2M8n8XlE6kZ79vcDY1cmoZ8ut1MY8ttsC8dCvkulOJS51EllKvIWcvLVv2+A8tXDOepYQ2bXTdKa4o/rd5y9bvbzUP7hpvUrsuhIUaXDGHEUvMFz70/ZH1qGANOxJrvrzly1ZysuxynnlANPo3fJtQrx0k/Kwie8yuzcafiNBt4PI6oPvqJrAV0xbbU0yK7paIWsyOlg3by718+Obeca7QVNwnlU4ZyOM89ZhrtOAXLCXzWrjc2LpJDdIQa+ojkjPwqr0kcPZ1fy0l0wP0pW+chU0KlEy8oLzVDZwWQV+NOCr4/VNy7d5bt7jFR0l/k0c94j6g7EE7M9lCzmCH8IKeHnb08iDb1lNlt2iyMgNyM8Ry6zH++l3D4Sq2xEP6t0cnkZ7jejaZXLZrbU4mlo/Iw9gUBvbjNT8wFQhe4146lf7DayW3LUOht+7e8HvuQQLGUgMhjBDaBwRXFr6erDJgTvh6hvri3oqgmg3Y2BJY0SWZDPmBWefFIcuffiqqPigVh6BlYNvpVpMTvDAkoFIpv5INfrVeF2o45PdpUGkVrlj8D/Npc37RQl8ywbt0YvcAuCBpuv1kZ1D7rRHR50iLtr8jQMDBqjhgIqHElL5yCMGLwRB9NJUnioXDTRssyiGBhH/JOeQCpWWWy6YKFS0o3e+rVS5ZICWJXOIRbbSOc224tstFJudXNawcyN7hV4Kwdc88KVMFFwe8vZtDv37gWJ/wbxyQbDfAUE0mOI6QQerVCBg1pnf1K8xQUxpKgvrFmGDz+37nuGvhXRZXntn4KrKkU1X0PiQ8jNi+u06bcDDvPKHLuqg+PMUV11Q3EISHPpayOVYgKQ50avbVJVJKO1N+ynEfaEfwstzuvVW0Cw/ZcOs7N3C5mBrZm8BMi4+GIb4W0fJJnz5MG9tr+aowkvZum2AjgO/ybPevHGd7eknsNa+vaZlWOUmsb575uOGgDPD8XlW76IH2yenWyqvOiPXWKK44TGpdQDLj44MLpac4CIzXhBqAgGvcRtZk+2e7+Gi2O81ehvmN/g8x3fRO6DgQk8BUv3b+FjntX8r9II/qdj1Ob9S1yJ4Z7ZMBqnLAktwmRk+xzxNJ7KJdT+pamJw2tRmIizByPZvbjxZk8nxZWlPGqMyAo0uYOXoudhjEpcztnjYQXHJcSsN/0P5OnzoXSePwrXHuo7m8nDHjeytK/PzY+T9Ujyd/VKV6X5vwtLC7Tb00x7N+UUu1lTz5J5+bqp9cTJf8rnyMPGP9uTe0U4G4w9DYZ5zGhoc9MGqRMfm8/e487EWNcVnSWso9EzeU+/fu2fH81g/ORZn3pOddgnNPp2pat5ZVeFBFeVWHVV1TW5dsic0tRwRYyd+cXx5Ullulx52Gk+tnjIq+4ldaaXZGJpRLwfI3xFA/hYZy+pkP7JaJLuePKEigrpVbZMzfyGC14Cqii8M+R4+td9ux8h87LJmKFEZeRUafCj/hoUGWKCHTwn9G4r6Nwcin5oAIH7YTvo6pLB41eo73fGP+6/qxoP5zPRNr4oaUULyRe7GpraCTUmmqu1Xoe5VbCC90Jpm+8YRDzuy4ERtHuoyHC1Ud5Y/DqxpOU4p43+4r939kJctjFjjlpzjewDcPadcBn7doLSyi3Z0Irzv3PqEoccGvIPjktHubDzDqrXQP5fg3N8OQ4xrMQApsQ2f8z1UuB3s4JtLez8XajjndfzKDeC3AI/E+rQ+SXN91oZdOuWKFNunnWiOONvpqQVSKHYg3hmc8bKGyooptxQ4MsUTDA/X7XQkkUCOuYtrsRGO3DzXdVuP4SpB4f08V8NNzDe8WsvtpcdGHaePtZdg1PiUk9dZBnZiJfPKJV3UmQBXmZbT9mYaKOAaqD1J8VLgzs50fW7SUufCWYpetgqY+urhqpT5KCx5Dy9p6ZHZ5Kc4yQ4lvHSkXpdrFJa1liN6TFSKTjTda+RQ59ldsdaDp90fRNuCXIwO9GtivPrFacXsknyFlvWP1z770mmtwfK2xb5wxo0AKtgaZeFRM57P/o281RZz0RH2Zk0YzXTAgHLv4SQ1Z6vtmTLkats5jLjXSOjUVvzCiyzawPu46/k1JjHOQeNLKANiAz50fnoZPpwY4Nas5uH0mNGqyJ/H0fjGtMQ6jXUc5sq0+gZCaMdv1rFllvamAEuWllgaJ67eYSz/KGisQ8BDa26jbw6AIoElDVJegYeakUWKKuZ/mlcFN/7MFiu0r3Scd5uzm7+mB6mChsjE9a+0sFsPtuwSsTxnGxH6x5G6/QuwJ4mwpLQYnCh04Efsg7zyBy7DtBdx9Guw/INlAOxbHrySdZyPqHb6kX3+PWLqi67D8Lf+N7zGmkkdpP141FrMxJOKey6xlZI5pFPXhXOOz4M1O0++ba1XBuiPY7FD3IJJRaeGyuK7zH0NL05lOpUA8TlAfM7COqSmZZX+gy1VeSnq0xGsvv/P2Kaj1RDELChuQXO8cgns2UpQvad96aHsLuFQwy3xEZnEGClmByNCDO5DhuHxYaNBVxZdMV5SLEBVEiOrpWBdkHCbPM37r935U8GoVXQuvOqyJl64r+3PY8/SIfjjSwp1Lu/HlhR1bL6RIbIJl5RxcLzU2B3vxrsPBD4oGiuXeQpdde32nWM4DFXxBgBXrHje77OyZGynYdjdaTznhtnBDQ7/Wv/NRqz7742+o41FFa2un2Cj8vgofYCjNQBOsYpa6BsXDhUZ3QazZCRzurxOZmyzPGIl8skg6JOrF2QIjmr8pZvqNI4KtKAJQbewOrSBqTDvnoNqOxwK5h1C+dG0oUC4PDRodKXHRl5oZltn6TaAUN1LRm3ZfNGYTS9C34ZVD52vet9jBc2Olle9OMtu/9iMTEyDabqt1f7mJC2QdVQEZ5ANo0qKaeOxE8D7QrftUbqvt9qq1vur3HHnoMWm4/zY+Lxe9dHt889CxOdnGdrS58s983V7xufPwwfPj4zPd/zWCQ7fnHR9jK0UcZcvujEm+Fvby/zZTcO6j1Z/LBPUP58hv/bYjT8t8RRWXThzSBCeXMh4o+iGyhdXMxTXOK7KMvJxNSZMynerv59DaJJgGIDkpVp3xTvQ9P5p7ite83y7M6d/LDqM+LiqdP15XXXFrt30ljVzM56m2y7VwtwvkSep1Ww2rt0z5IR2wBKmB5M0refPBtPIfZaYIqcatUe0N5u/NdUobEdjhcUxRprSSDAJuZdMaF5/s+Mup9SUhhTtel+E+aqJ2188T32D3y1K19oZtNRC7eThqiwGp7i5uYbCBFfwzn7Snu1UIzUOID5dDTLU3Pu9+yK2RDLHPJrK/mT3nHRv7OTb4OAJj8iKmam1iieFw/S2WWuk13N2ywZzBTcs5rQwvH4vUqfOgorUMIDY6UB3XDYpKRaOv6btuT5/Xcgt6DzhSxYZ3ZhfpNaYXc9RB3GTDl0KVP3eUHh1PY13YbTR5XXRgiqcZ0ZR0PRx6vnGt3mKGgvEOIbOyeNBXJWkjN1CriCQRutCir/QjqYhWaVKZXkeEo6CWdjuQlQvOL3ouP/3Tq6EHoAnihPRRyE3iRXMrF+KNulJCj98bc4fWP6nxULWEWBNf2YfiogmQI7uX8J9NsZccTJSdsvYJx7qq3UmyZ2z1QfbZo/ec4UbhRIbKAqbje3Rzizc7FaY01H28MUplLTmCp+PVRI5rxnO3kY8iaVJ+dwR+xNzavjtZ88cwrCx/KP7gSb9FqDRhKSSUgy5wa6M/Xq4ZLXaZ9OvSxoOOtrSJc/JXsvan8xVkZnYcZJER2rWW965bL7AY35EJwkkvMqTBpUoH22VGOuFpw2cKJVj3Q/bU6g1ypscSwYM9GGfbJ3tWfhw7ORE8ayKzQiif/pCh8ZXNMB/Fde7DB4VJUIis9W6f+GIKA5P4qrfXhqqftuwWj+ppDPXKupnOlYB92OxM0Y7epxKBeNzWo63Bhe5FV3JJiHW8cFhkpjCifs4DNfd5cJp0TWo5I+vNHQcqqNoD7vFX3cUkuwhdOdaM2v4NFSCaYj2rBV0Modw5glCCCDo/dY7nyhSBUwZJSjALp1MWGFm+9SA5v3EOhLIvNRHC4Y7Q4v0FWMtQa5RQdN2GNcot/rPrIbMo7w+PQqkIajKgp5z7ZCjlC+jfu7iayqT03HaPnYE+gaeJ5k9gTmsHa1q3XJWZbnamzjA5KvuCPoNrzLOm36P5TWjN26YHozlzVurIBYoaKWuXQ0fk716/OyXC/Iu/BmP8cIAg275V8DkS+WSmyHuCUPSSSfIs8OJJKfuO4f6aAB9LYSPY6jBLg3ePKTqkOFPGUdgfyKjg6XzKjNiDLMHkmOok1RW5s4iLZ3ufLGW3xjCKhTW2X72GV2s31lL4dlD0l3ARgC9UZtKPemi6Vn9mG/bJUWJ6VQxbwAPmADcViEUT1H/UUKi1vhITCet5SX//NcWZCF63MqyibykKSYHLx6fhwPqLq5iOsbQrYABzO3pb4MDTge6vXMVTJoiTPZ636CwB3OHZ/M6bRCFNL85p5ZpFaEE8R7C61rckzuteElaoW08pk3Zy5uOJkOLI6imgfe/7wo57OCImBBfSJY0fBK1KImuyZIVDQYQNnk2f9Zc7lIOfTJYe7Y6YrdZ+g1XQ9osszXhTIoIUMKFfvrU/CczQ78d9/EpofJSGpIsBp9rBOw9LIJmP3XtfnF1KdRwqY2od8cX2GamSJr3tEov+ipx5hkJztAZZpSTxWSAMrHBi4uTE2koAJUiYFSuiPFbACCX7BTMu+10cs2PxtVxoVMvSISKGtHGc3b2O6y6OoPB61K5NPnZK7XXSgY/0aXp1fgRjgntMukv8DlfX7SPIy5tcas5RxhMYW9/q3Rr/lx7rljVQnrOWYxe6njnvXfmLXO4aD4XKwKpppLL1Kej5HkaPqcDVi2gkjeWwUJLN8WH37ahJFR9czqqY2sAtsvOaD9WbbqrRMYE9gBTTL6HDnADcA7p4BTFPXZD03USiQWbTZfQBxmG5N5s+oh44vo2BXym/sCcWgdT9pdv4spy9YCUjmk1+tPn513GdaKTEkEhjZ1zYbkVD+D4rQHk22ySePCoEEjHHK7dJ3TdoYY+3JPMoKseFq+rRMS0qSnfocgvw73NQDhnzFCgPGmbYswDhm92eRl6mc5iKqPsLteGkiVHBL2qe/72oo/azZ+lt8C2mivNNIKBLvuZQMSOr1xFiYh/mf/BXt6cLdQX0jHtRVhM0Ml+yTlAaS50sz1mxV8hTX01aFUTxdF/LhjmisRx91iFQqtvdpxOp7HzmHg7VzFLhM8XN14Zm2fe42nD5wmDoqnlsq7cc1bVrPJ6pTtMV2sTCUBFgeX4A5E2/ELvNHr/p6vL9NEeXCSND2YcP9Nq0+9ViMw2apMHuVl8jxUx83ZmqdOPE8lD6pUrtuoo/IsJDop9SJ3bBphWIRHxDdNlyhIR+IUHqGoAjTQ6780EAKhgV6YVn+c1FH0EHvM4qTauo8wGZO1t56vIoisBSBSlfalS7ja9NXHOyjC+w+VJO5TDsS790dZ059CopRH0ciU+jw0UPQYKA5DiWuT4CMaOkQnIpLtXJyB8qwzjrkjR54keA3JbH+tjHbclYGyXLZZZTlAvF7mdv0y2omcgg9N0DfhIL6lRpQSncPo5AJXeaMNH3v3VbeF81LTUCwRPvj1jDOXoH02Dzb6oa0db9L/0ZI5bWV6diJpuXoUcbBah3KsqhPCIV9zvORgV/Irt4wSv16vg0hT1q6kubQ5m4BUo6x/Vw7De5b5vq28Ui8k1YiF/AER1TKV7z4QlzXV105V48j3xYmfDc8I4VLK+H1HIG3MbdYaSg/O1Xp2SmcJz+zXxBkY7U+26sBuheyar7K9NtfmnyQS19Pcq+Ldm65cse7VZtgOUpFnKnMxNhxmvK9ZiXByxayF73QbsUOEEgN07dQuCl2Y8/owtoO9myjz5QH0zpNPfzU7DYHMAwKj0AEYVlUHCqNUR49U1xZN00GvwEmA7NIsWuK7MdIIFOQqjg5v6nYIdnO96P96QI+NeY9F1pQfSGKdsrjxJ7MLWH03dzb5v3W+uGNe38qFg1AkUp1qJLoiLI7E1zQ57dqhQAgj3CpY0qvRdrmE6p+u9aOc3yXIz8kN4XyQd+u5q6AD0p7XGcjtUc4cvHUYdRDFJDB5f8gFWtRv69aJnQ/aqgvtCsjrVk5f4NNBqfrDBrfF8R6vb0yoS4H2/gBw6gVoakiIJBw/fwUYL+jgBQFxAT5q2tgAUt7kRD7P0ITVvG8gcHLvf5dkcqCkjhuAhs5HdcjRKwGr9Luw9Wqd6QQBnd+XhhKK1ZUGODtPExl7D+3vwc/eqpSrwbfduQBQ7mKB8X012q7Yc5wsExChfYg6oaDy+KoZj45v89H13cdvx9B13QqW6NKRRdBldXaeKIaBIjYcCvQU1YtDg0ZW3eOFvAAq5XUfkz212pBpz9fQszvyGpDuJwONSHzf4xHUDxdKgTy9XpVWIVyAEpgHIb+RdDzRaIcLvigASTUQc70NtRhpGLO29r1LBaj8NfMkrVKOVchRWMmO77tNbPtskUSKn99LU05XHC4o+kM2kT2mAaW7Hx+p9oa9dRQAuDsB4H4WXR4sHDVIMsIfyjl+BPS1d4TYxTPZCMZ5M6I9jmlfpaX701a78F/eLqzRd1a1KmfntFyec9/igHvMJQYODfiOt3HGvvmdLPG6k79D8DfcmyoiRRemOtSuPLUA3wKErYZpVsViKIcQU6KXMNq5r0s0ptEAOEhdQlgbGLcznNvF2qDp6bDdP0HhFm7BLlBSXFo4LdaiiWPFUSFU/aI3n6s78jzRn4606PANcNt5PyHuFCv2Wwxlbct9DDMKrutxL/jbXf9Y8z+qkavn35hpRV6r6ID1/pVxi2QBgO/dzASmcbb3v6JL3yRpTAVMljLqKYtIWrETjwMt3WldWZR1twVgGzD2ckvYln3Js/e7mH+ebnoDpQhrx7beLDuesnKZKPb6vMX/w/Y+eIpMAPVetJRopif/v1b/yjQBhF+voRyI/Qcv1ItaplqWOA4KxNxiMtc++Itv+j/x1FCVY6nN7t9BX8P7GLmLq3iwIhZ0uT3qjio4n6I+2GWtmcEx7vLv/d9xYBerjCwgcGd0AozLW1qcQmmlIBnZV3+mOBIzrskUI64/wX1eSGrjtlx0uT6O+6Gd2p5KoLzo4f52sG6V4Wy2pefXDHds0AwY6lmFfRNw6YMMzlOgjLbF98yafX0JNa7OWu9H3nU/wLNMVeOzX+0AVaxZZHAZclCbdtIOrb4NRy7D5LTlOZzxHhcDWc/5MN2LfiNGFe8PR+B46CpeaEXRM0FSHYRO6de9aQR7kp4wtgJ+F+Y5dkLg3xu1PqMsKwsdEJRUf5MEfkOtnD9CdBQuPA8js4PHjH3Dx9dKEUixNgpbYXsXD2aakh6/TbLVOX/EoQKsSZDMnP2TDNBNic/AKY1JHwYJeR1PknzE/srUHDW8ba7y9DB5n9gViU5ctVC459ZPWrxW5L1k5NfmUdO6afE117aIvKBLG+9xsUY48sgwy4Z/Q+ZtUWFPVE+91ot8VPdTdTRtKSsqMvFWXe4fFTWtyt+LBbH3Sgw8uP3prFyJGRmkDtobi7VSxUZFd0AgDqHAOuP3gsQjl0lAacq3bldxhYUDsLBuJxiVkVB2PNla6fbBjnjMYkrVFISQ9bIeWNDQVtTwGLkyP4lPGBgpGczd9SPPBC8QI9tsul/m7hbNIzYN4gF6leQtIjeb+Luzz2KLSxYXZuwLpsOpfZ0u43iPnclFpHmKwJh4JaRIicV5wnwMgoaVzvziFdv0ukMPrtBdKI+F/HyC4uG0OaM6NErA1EEpJ3ViO9xBpgwmLvlFxVJ3Qfx7t3jYgZsjGeM9OHXAasSNkMxcu2qmf1SEb4PURqgn8tPcp82a+Umdw2+vt+anEpapv152+q3x3vADJ/0mxqUlzkhtiEHN4HPeVQrKcGvWMovOnwRAedTa3LZvD5Wc5+JzcUGqhbCC4MckTa8RC+OMg7OeVHjm4uQHYfGMjsuhws8PgdL/PxyZO80YlLKkyBgc4ayNdcOcNLltzU7BL2T+7ryCf27S4j+O8ULgyRswalX6sm+o0q6Rvxacdm/HPVIHs5gCAjSSqkTb02sOq42bgjzklDLqXBxgYD2xZa7c87HofvwmyngzbrDhctLJres1rJzDGNAFe7HQoolhxty1NGZcqTbbnstcDsUohzHLa8KZ+vpwO4iqnfRV1UDFthswQRbn7gpXNFNoDqpSyEcUE3tgb0aILIEsC7XMtb6/bbwFAWmAYLgc4Y5QlBYHDQnFx4hlhLOJILGVCrpzVnrRqrQi9AESYaiDC3C1gaoAlNcTgvMAKlnCeWTlFKs7T4eqNH1U2xEVlWNHCMj6FGzwnYyDcNJYlsKs282JSN65ilTjd9fE+3u3D5bl2URcU8eJNty70FAj7EN8aihgHC7JMOR/UnRWh7sexXwh1wc64l7qtaF2t050KwdnKJMGJvrs9/1n6PTtVGbs2gKivX+pKUV/dnEcNWqt6nv6qm/2SJRgl9FK2rwoXklHkXDET0JNCslW6ZFAua2sHXgQGKH2UeA8ZZdd/gmrCTFADXqY481hDvDW36aQB6uxkIsVpDRXYatRXa4EYGaUL2Bq26CtAxm88NUFMVYKRXxdA1vTqeq1afiVhfRx+36hfCrmspG+2HR7ExVFIugtkfX7Cqv99aFIWgt5D+29hv3Or2UQYjA+AV1IzudXqXvDahUvZ7ffg25rpH4klNrEboSFBLzCrQREI46orEi9pmcZYv16Cw6jdKCbX7g5wKwPp+2HcgXHOBBK7v3iO0g/SgxWfb3iNr1+7gWnNRn0wWf/DLivhT2LO9dJkmu5AS2ynQni2WJv82Ou859+8+eRvvazq50VcBp+0WHvl6Yp8zOVx59d3xHg//bZH6dECkHfZAHnwWZHb+bd3qRaSXAfpy4BwND0ApABkAvz+xSVqh6crj/Vm0srJQqr9FUxp7qV7vcY6NUniYuLyJNuxjr+5+qs3DhLYy42+Sq4a3JKzvx/ZsjL68UOJY9F84Y0iW9ZwltALgAkEhjF5kbysGuArAGkKu0k218nYhg3+zRVZf+j40i2Ga4KpH6xkXxTBBfqBGRAFi7j8lQwBJG5R83GQzKWdFM0qX3JqG4CZ/x54h0IcT6Ruz6BCWrv/zWaDqLkr15aB9YuSXIBJobudfq1AJtZvyebzdF2r9nUibqAQ8wRzWur27P+V/JKqrokqFWAGkigulMmQ1CmgnPfzl1tyqide3Byvmz9/8GMn1tFWvFnsvmzl3BRUwnNd6eZyloiZvvPVuk82mXCkLVXiPfBWCT1FXdToUBvH+itP4uRbwe+AcZuc6A5Du6QzZ2yNAeDQ511d3lR4v1A5LXwm1KERwBwAWnDuUAHZCIWkF93xkoboqTFNShx6yihiIqTU3y19C2fkd/Y9c+Gt/XKR8dZZR1IbvgPCoVKQzwuL6XqK/cqCymmO1Kuq3m9u2lONd/slIetfXMxz65y2gPo0OMyPdMumqfEP0ueEY5ans11BWyrN6WRdjHFLHytBSqJJLAFJ6N55o6ThWVRUttp3f43N4CxDOtQ3g6bhtSkwtdU+CUMcFiaea9OKfXy20Se8d2A9+bbcd6cjqi1W2Ax8i+YrECSyhM3AnOwPGBBoYOItZ97OlKcY36wrx5ih4v7Vs3wvFOnJBL3HznTv7j036SZ81Wdt0U5talU/i1RI4Q0LiPaHVI3g1Zqic8HXrpwNa6NVMq6VtTTMjcke53T1oW7UKDTuY0aVM/lsEZcDmtzzjErEgbDyAkftxKIlfY4DFEJS/6JF5HT5cIukwpZizGnlJaeG6b6wGTwAV0zuVQhv/RB7hZ1FXy5pxktqoJj0AoWF89YSuD7Ay3iY/8VQirN2gxTF79Y5bEhjjFRvUZc21uAyMtqdb872cTmXq7eK0Naw/GOvQCozVrk/TfDf9xPunCj4LtCX3Z+1YJBq3fElDL8YPHUfcNcubfKDtNfiOv+3wn1iFl6M3V86T234T3lbdzneT4kAcm+BxdstGHV2rMsgvDMdw6qq9esG9f8MndCUWGon2H58DnDqnBLWDSJtzDHJcnuyHw2xzqm2U5WKhPde45vXcbVXZ/5Z7s8pwNqeKPzLfal8N6r1EUtwuZKney+yqvzdTM02F9mWWf3tJ4sIRS0B+oprdR+FDKTTlXOrHXC5KZU4olYdnKUvABxa8tjbE8BvBocAfy1d4DYFw1L9L3N047uiP/Xnj7/azcUKQ6r/JQQzFglk/wXIoz8GIKVbr14aZiLrytlLvrg4r6Q/xqk5VYkBOBXSpK/L7AM7pvxHTSDgTJDt0iwo6DsXBDD5mdnI+nv/w86p56gut3p988MfPZ8RX6SrwEbkvqPTg/Wr5TMYPtqabMS4FqjkIfAE/N81L0ogg+HQ6kEQHNsS67AV2aK4T3RTt+eVUp3wjPCSKv+DzRVna0/rbAUbAf06qQZtT21eso5qUqJbXWp/eoGOAeqS6jTfk7p92eg/6tXPbNpPz06e/huB4HcMbw7NdgCoUKnZngZwBR5nNKFOdX3y2mNaVX7V8uSljxFxVTIS4Xs+b2S2OPZs2TFdLazObeg5Ijjxi1bYQcG25tsL10JcAmJUxgkaag1Fg1O/b+e6FYbGpQAece4bzrX57j/nHg0ANiE/f9FaPDKydE5n9FClr+xRgDCvA/yXnoroQY4YBwsjP1yVF+HmBRpWqtPcekCMtIg1MYAM7VGIFlcHVRkH8DUH+ssLHG3sq/HL10AMBLMMFK2k8C4uElqxcmgKLzk5+lxK0PXPmBFGCV3febGSeVlCZiAUvPQkVV031RVgU/yToZ9cMXLvWaZvS8DuX7awYj3x7VOsbln94tq4j85PR+NHGLk5hCnyNnI7euoD1PkIku9h6KqFZlW+jmK1zHyB5iZJrzjj61//jD7ugF9ZwL3pYQT2NQegazTpdJX4nLZQ4SowaIsbfrawVR1aCgqyJw7yWcsjsIs2GE9waNwYtv93nVY/3vScvfoLXk3gtgOQ/PwLngeVGljS6EUD+alTKK9pv0rJGuo+oHW6VyE025YkNOsikaaEk///B0TYu3LaAlGeAEB1tQ6mK2lsgRYO3wBOSm6Me9PxvwOBULsGV1OkqOLwp9mUsPRPxfpzCq/vdYlmyVM6OCwW/cOoup6mIuqROccVu1NR+dElEGz/1DzniVPqCgEf6ygSwpv2L3W6eFKPO0AoUehiCn1P0DDLM1K7y3Gt0QDSfLP2AX8jpl7iCrJIaBnYpcCS27uMLV9rswFACGS5gliZqstEX9ZKtWUd/+0OGRoGJucT9ks8NROk1wfveGe2dO7dqcMb1XxhV8UhoT/f33glSfB1LdG6H/ieg77dVVEDRaG8tRBM/acxokv/nKUsSJj2FVj/PWMptAYABmuVlvduhaDjlNgrXeKeC9HZ0f0Htn7FW3cHd2KBD1DDLd2IHRZAQwNyJs+PgaV4N5FYbpMXNC79QOL6fi02kqEuL4TsQCt1F4jbU/UJWGnDpRQceJvSoQIEeji8g1yUvvW/20HqEFB+hy5Y2EX7Wc/CdfOG2UFliXf4hfdZZ4z8XBTxOtGTf4gdS8KGkzzXki1MrfO4ejknRzcdXxo2POMQrMbf2Mky/m04AxFuAIiB1NHgIrca1ZPbY7voGu9gg2euNvrVYsn9fJYOz9kt3tg/88HO/Em2KvG9pPb6nqFOhd5cLC8kBJlDjvfORSoLn7OxsrF0NVxwhUe5KW0oMpj7hbacUp4k9bYHl+GAJDVH/BDqUZVm/c8KbkesmMlEbIN/UQurfhsaDXivRU+Bdfh4ZbsdVJJcMq1XyrW1g7IeexRp1LVYhtxjoXsDE9bSADZ4HdjgzyWdArbS+t9jhcz0Ha7KlnQPhz8fLEBqSmRqN5tqsPxFM+Jhzwc5xISfplBIe89kZ8k/mNk20b3oJfiL4agmxn6XgEVdh3aKlcTcN66c4WAXAi70RhvMki3khpw9W+SRmM7fJ7UoJMLnHc8gE0ln/xHxBHIe+Vn/UxaGslXEmKy/8YkhsXxtZ9dNYjfwQauwaJcGH2K2s5Cy2LRHl0UVRx1/b/RWb0R5nD/vGRtrYbVqQ/cTRQh1fw98PlSwEjEOB/yxpWSHcyFl5i6bZsADF3orUD78igjU45WW9w5Ag0uTHugemb1USlMW1Nm6OSkK5cOxM+JbgYXE/GthFye1FMwk0eAjcN4rmWBFm22gE1i29YnbIz7Z6zkRwgnWidjDU/sI733wIoMPkXkAsZOEzvhoclKcrGze2l7/EYLhHQXY/0GfzYhwHizgiphiVf6oRjR/Fqk1TR3bW8umrufw9dvcmxKjmMXBdyLLrWGdWeiZhmQAAAGgch9jNx0HZLkJelilnHFqsDAwONZbYIcZm3bxrFcYEZMYxU7GXR8Vg+RRiLvgPvlcc/9TyAA36Rye5hnz+rvumnZS13Vg9w7yI5RG8sgeCj7lISOlZGZ1nN4yiTL+obnR/il5B6sjINuEffk72dbf4EOhLyeWMim+rEZpwkctkG9mC3LPFFBByINCTdytpXP6Fw5nVmPQXNxc8cdDZpfpbZeNSZH7w5Sjz2JsUeJggJxChb/h310yODnMCPqUvqpkAQGy4NwjPWz3Mhr4xPJ5ahtskeOtMtQjLM5ADrnzxzrKJ4O+N6Ze9KX4N2Sh+7yVZZNlSf8OtlN/Lpvc7qyGb0TZETrcEE+3o32l+MCT+84VrYRY2G1zaHgqxtPh8Ic4HkY2zwUZUx/Rdekq6LBGB554raGGrXXGIzqAdjGAdtOHw7zd7mJkl81iKeqRibkP8Kbb4i3AOpBQwD/3TYZus7t2+/IQwyAAT5hJczm/IUfW+KDJV7UdywOQDP0DkGSQzN5IqvF9ydMsL2iWrye6aizZoTSno6xuc7n2OgAbjYe/r8R7CLbF1Nfp1eF3ezbfp/tWjndkcVlXf6dCZGtMbmH2xDUD+ARTJA3diTytXOY8q7PqIj4LeIYhe1WB0sIgszXJTyiEQKFbOo16vgLqgpg6uLSvg6oFbVbAcbw+IMHOcImO5SZ1PIU01kI80AZRLaZHCSSeh2bD1GB+T1KHDXd+EjzB3r4BkOPNnVw58htLU3HKqDOwuwF3p/mMWt54lpK6kkJa2jwX8FUA9ck4t4Gs4/JbkbxyEZckEV3hJwzbHg95Cec6P6XtuG2n2FRRSdzfO/PiiGP48n1lKvzP1TsvBc2Syk/rSD9gJqdba/zhhUMSXExdF/cNrlqqvtY214J6cMTRSdJue1TW+LMEm2HuQ8w2ztiWmf3hrmeTfp77gs6i18H7U5hWONrf0Uy+XDKHRX+cDzxPc+RSGxyfG7h9RtkogN7yqPT6zkp7vwuv+g7j7Lr/d9BQ0x6pJ9gGeA9v1/iLQEKC/5xIe/JO360rwA3giljXHBguGbo6cJ9RC2PLyBi/zCAN7scclNyMYzVjnWwduLtKnbxnwusE/VD8vpUBdmt4nbavCvcuI8E5b4aqJETmtiq7Kw8iknjyPjF+V8U1y4D3fzveVN53U0IAvYdnG2dGVIvpaMmSte8vfO62pffVwjR6hXBZntG8Wv11W8TmUmzEyAxNWGRSbG/B7MkHzQWaMo6IMdlLBewvejlO+Umyafgr5UaHf7ZPMvYoPgmmqIcfPEk+QU4fTVBXrzCWv+mKC75FnAa/8iYGdwpmOt483/W85e/hYAEE6q9xqymtfHsh5O8pc1nhrV933X9q6u9XlJRGnW9KCOs1Z5pXGIo269Eg7+n76/EVT063WPSYYx+wRAn/0zhIVEeZ43QngBdIc7NjzZ1gB+C21yGhcdvWqGCj7Vef0XbD13KFvG+SPLqhjXc9nC7tho/n3C+CXIM3sPQW7Ed2UDmc7Pphr9GuLsa7PYQDC1AoaQEykx3yyOutnhLZ8kcuiN2sz+FS6t57rmt4TjGuTm3oGSK4EkistMoln2SBrVnAPMKW4s/4IG0U9bibo+8bZr8gs1qZh9O87xYfTls5T6XN3lWSZuZx4fkvWWn/Kxh9yDSf9p5WDuxIjX4FaAH5sdwrUHj5oycK0CJ99Up1pykjJexIdmPXvRnxGvQSUaJrOm5yvDWjMxHt4Lu3UvIh0qnq7v4Bb6DBSyumVxoAmvXgdECWpB3+wMLs7/EGOvW2xDbGzXduf7hSsIx7w9YkeRy80Poakr/v2BFEaryuR0h0p4Eo/uy21rHeODbtdF67bnQz8uCXuColrATfMeNlM6AH5QeSuSpRNraeygZDmDkQXyvFCeUNeVlo2tru+QEk4XpGku6icVGMDRWuIb6wr5YNZ7vtM4oh9fIwlzlc7Nz+H1jOcVoeoYcoBFFgCYCNFeg5KmWDdXTmNx2V0EtTN+2q8AG89fgMovvxPos+2IkEoi2jcgi7d+DNyphUHNiN6KD6Oso8Hu64/0uQqDVDXTOlhPWKsOIwrBi9YOU3Ve1hd7/8kenPJBEF1V7ntu/P1oztYsHGCG8uC7XtOv4AcZfh2yV9543PVKtYdM9hHNMWLbeV6m/LvUb+QBzVp8n9qsG1Fpt5kee32j7zhWAQp0TH+t+GmLmcn9CUIYCcArZo+K6zE5gu5PKBuG8nsFTybPTZvDRNLSpve+ZHOOBc+zIb31HAdIybnEqu7smcb7fhG7eBXa70yW/wOe/RXHRUvPt+/znHl05Dce5FSRog0LBH0Lyf4D2xY/M9XJw82MVaFsv4zb396yebSk14VHsXTZ3Qt/sPdu+r8Td3foLVpYTwAnl1kLpsucmWEJTb32UlrKAhv0n9hkK6b4heSgrWRRO+6usZRnzDZZgGXDe5Jd/SiLTE07eXY2hwn7dz/fkANBQ1O+8QYZcKxNoEuc0v3+ZqnjfLJAY+C3VV/TZd9pMpyB2ThKQGfFkkcViDVOpopkN5Scct9ZGqX7iBiGJ/TpfLFQHaAy+RRdoQ5Zntbu0iC1otK5aAyZ7fv8DexEnXkDsoEoPo2vyiXvDtul5JTb+avt4uBkOhK9T2BN3c8X0tpMRTdFeRinHH+Wk8W4r7By3dlHuf0ZsdvVcXBBadUb0kBrFdQ4cCCo+SVjVEj64neP0evTMTqMR70RwPtsivKfm9IeQMM+T0fqqRVPVBon6f0c9NLqlrsTfEtYsVbFD/Zih6QNs0elcDybn92f57rBL5SXFGv5QepTS9JUk+v/v0FsHJzcthXLm1O0/zu3HnGZq50m9/njrc6WdNyD7kVIATD9HQ55Mbro5F0Npq8lg6Shl5vf7xi1Vt+ySSrAYA1NlNmCsfGmZVfo84fQxUMtPmP1PObxclFdEnkSNo7ogroxyqtYgZmbkb5mhWTpNvPVhbzv6Ak0s0SWCI4xurNVzVm0Qg/YQkhJ9YrLPwgX+F8u1b8GUtj/0r5RaiSRZ/b7rE9ko2rsqHxMOLbXmViDvhPF1wQGmaV8D/IapZYtT9KmCEJeTxuknKB7fHrxK7pN9tTXVs/7xpdgd8dhnQHxADhwuQCcrfo2lr+bRBqZx08oTsAVmfQIhA7FF90B95ySzX+Ri1JDf3V+5dV4Jpdf1MrinpLMcqvfBOYhE1cqHNT07uT3B9/SsmuZ81SbUWfxzuqKNzSpGHdHTJupq3UGz1OUO7Snf5ulWq7y81fsvRAJVlo/0HjG5apaWN/WrR9h3r4kOotMSP/dfxtCoMOntvaJxU9fu42LyAjVvYWFuIFOgf1e9i8wTcvkB7bBwfUdlWkDH1Cw1zyPxKSCRfzlIx805lqbvGAUvnVNmNNs1EpMEZYodr49NUawlW4I7WOl2rGlVPXsLlWUMeT/anZEjAji9bhODXmZVMkRiU15YW9ck8qqLNh+tFl8L1btQwPVB7/vL7217JnOG3QZ86MKe5LIIS62o/klP8lXObOBgF0sMFwjYtYz15hgvgBjdsNW+mk1cGKAmIW4vy6AQZTvPOuxUFjJ45fpK4mRAbQP/tXXfh16AKZYkAz3H9I+bhWva4caN7YY62NFbqNZVYEoOJfRm17/BfBTYP1FZbTEytF6QJ3Mb37+VeCQzqkv5Et27wozAmhHwalfP8o601nMeWBT0mD95JD3hPl34fIVA0Cv+A5J24iih4aFg1AqetiVFJ47mSoEoCcS/VXSYHdC7/XMjymCC1Xya17VBI4VE1bX7lg2tYztTyFv8+NaPSVQ234GwRe9Eke1GqKBItm5WK4rqll4xcaQ67+5/EqumYSINU/lGyqEm3Sp5t/6r4+MHvsRdCGigRWj2T4R6lm7nqP3pNEtxY1WlMG2/53eMzFhX+eC1Bl5DE6oPv9ecxltlvlZezLm64fewh0VBWWVbMZbl5YaKLdNEp/aSkdpluyLV7r/EKFopDPt95itW1IrZKf+S/MlME6bxCmB4wnHR9bcDENF/Py7wTT9TopEGmZWZ/00ReZdS2gd/CMJXiKd+S/B8786ifOZHE9Sd6L5m43KT4D3OhAEVKqPD+cVwRSdHf/bvwU/zBn32vtMze2rKdWnYaaND7nJJmPUkPDTplXWX1VX0RaVNyb0KqoW/hSj2aeUYb5kPyEi5H/cavOyYrtoYy1OQ3OHMy2FXqRQVFxBYGpUIKfaNrCcmusJEzM8TiRMH37KXzsqQ7yqWXgV/KpV2szaNe9zA7eRDPNr+VNkv6eluv/cfYs374pQl+yV9BmS0TY4xJbUE+ShoSB00/ZeD0s/uBWm7f6UqznU3NNwzGRKXUIOzr6+BdfJ9pJXlO/SOxZMdxznXw3ERfYEQnXZqhYquH/P5aV8IbZCFxWlM1VasOzogmzNH01pLOrYuL35HR72BUQRTSgXB0Ua2jYE0gq2lF/A6UnbOwn6i/9TfTp3cHA97iijeWDJLXIFXUS4tPTSNlTNuAZLb+WLk17T3IPqSCATih1Cr/Kb7a6KSgVFRDhFiJjfzkEI9IKS1iTZ7fzNucpS5sMNl8kKbMJgLsYFrSeAi+97B380UEwJQFZNcERmewOg4H3zC/H2W+6D1yNe5vXIFBIyhOhXIzYlq5ZLNS810Z7/HnZf23+yoJjiznfEuwGkmIaWD4f2R9BziV/f9/KMoMZc8cZB2O7ZSQvffKysrIPMchiaiQ7E3IyMExkr1C2asjO5vIHpHVEf73rZ7n+/yu/3U9l6v03Pf9Ge/xen3G630sjtSwjYpkznpVZHFsmu6+qW6ev83AmKEeT49plKCaLukGNywCFErvjWA3w//sogoOvDsrjpzE9efxPsulSmLlJxOIcwuSmNmy2cj/OhdJp0afWWFoW8Upw7jQ1Ch/JyB09hKOOH2PQDjyD+CNkLK3Mic/HwtGvNycqzQFP7Irg7OlBXH+WCFgoGzboLaNtfq2VezAG941Mpp0PEk7+G7OxBQG3ggPVDXN2rtwoeclyCPwL9oHqfW89OeLZ3ohjM8swMvhzTMZsPuzSHzOwX4K7dOlx6VOUiybrt56A9MIo2IWpCcxaPx0P4OgxDr2/JrNXZ2lBH/320qKoAzx7tUOAGwTGZOGL0J/TpNrlk+4ZUZ6at+xXdNlipCinQmuLmgs09GioE6+wi+Lfz0yFryHbXaNPFr+hSMooPGNueNRg609eCpWmn02ciT21/jXS+Pdoafew6xWVIc5guYnTvdv2Zex6dNgsorrjEbH6hktTHOelXd8YRsvOUVW1thy2h/adLx91wPga7XyGqupxP6U07dmqfED1D0mUzXCvvxntwOjllttaEUKHCPm82CWjGd8+0d+xaH+lDgZwmrYUlk5DGEMawjb2DTerO3vqBXYPhhR4JIXj+urkzgRoKPjqBYDz5DYBr06P+UpfuOirZavlTx9XVGpvWYI/8JJ1IOlMzGha0Nox6iRqGOXiMndKJOOx4gPeTR0JObKTTcvc+wL9PkManp9sIv4TsrLcH49+Wj2fh/GJWLKXuONHR3wDppISnmYtCimbMIjM/LXuw8R+4u1EVLLy+HuzeciCjRc/6cBwJB9yfE8Ctgnidg5fZnnAOmC2dx8cLursPhgApjHGHAezSggqcj5tI+Mk7dILgVXKWflnF94QMUPTrRiag/YQgi7C/BtAZQ/dTshtqHP511h+YQLwNeU79gErHCXZPVJ+S8JQeMmGDkGdvSSLv1t+Mur5X0Yxwg6huGF8R7YzJbJOF1dr0k/3Bn8su1UTHQK6ynBC/fmdBL3XSeXUv5r1+L4dXTPT1/Vq/J0p7/qeZktp6cNoXf3KS6OmEIX5zMbGqVtVghvdSn3UZyglMBGKwswHBtxUUjQHFlqqZXLKtouAhO3TsMJjrxtnQo52WB/7SeABIsei6MiwqNc+3dmA0beHPNHMf4k/330wyrqA3G8Zo3/U8kQ5fPzoQucnkGvvnVpeoJbjwQvMlL1TZnq1M2/av4MUCaZJZ2Z19FIvoE52I1foJC1yYlApZqLEUI3+2gOXF2Ko9894x2jGdAk7cE3HImLOnvIX1L75ltpAQAxu5qv7qNnYr1kxot/m02hdUcfJj5dD6jZOZTntfpVA5hEPNq52P8ItmNZa7r9coRC2hMaiUVTIq/XjK1c4ozUso+MJWHIUGcguC4WJ8+3L6L9pet4GqPLAbs2VGQwYmJ2VKE0u2z8tJvAhHo2HLmgsRln0bqcc0AjL1V+8aj3Zv5x9uBdFiiEQ51xYble/NRYOLujX0HRNsIDVeVmlh0hG3r8Y5ZT+2vAkh9GGjfOJLHLXNvX/eUCEgh5NQ/kmMsa4aBgQ5b+PvOwf4qPNK/OuVAqJXsBskeG4Mv3t9K4afSPJfQL2jEGedjCQ6zoGKgx2xH5RKK0Pu+nD1kqNjhjigTjbj2onXL495KXQT9Zr/EiBAXblkom1MiPk9czXlbHtbJv+5Dsd3fkKhOjI0qPDIOrHGT4FjuaOIzcg9vV53JLTw3EOKoMVbJaOYO17INj453BuiDZ+mBpkOw+Ph1gXFpyY4bR7zslDU3Sjirubu3dstlPyqXo0Fwe7HUnOfZOGc3MZlv10vDVMqxqqVV1i0r7MKo5SGjdg+S9whF8sEKUxg5kACMmibDsFEqlyBGWU5cIxhNyUwuOh2J0JOkBg6SmyhuTKSmdH1WzFoK1xyHFhZxvrz2A0/wRE2i9nCB18GhgO6DlIJDpNYSaOH3n4KXR7LjHrP39XEiozYGpEdAskdlV42WV09ZUJE7xho7SmpmpmjDV2zD27vTCeyj1MbtkyZM6WEQCFt1GMpwWUEXKD0x7Ozn/rrfEjroDgQrE+ymN6I7z7NOklVCCaIqTaSEVL6iAicomZ9wKjTMBTI9wTVNmJfQDEgDZfIzAv6mSGiSokJckwIipfBvSTBLjuK/TZExu07LISPng2S1DcWY2nCIembjpvMQ4kskJcwUJsa+kBqiXpD32IsjBT/YiHp8e5MR9bs9OFH6c+BkFviKZJ8uFcCvs88Q0q/7PTxyBZnYYdhd4fqd6jKqzYLxCp7pwxquF9VcSeW3gXdjOrAdtsuNsJvKrLV/Y6GfnP6//ssHNRzK9ou99Qq/BiiL0EF8iurRfrDJ9v6+Olpkt61xTaSBb+MuwY32PE+8yq/qf49Lf72UVV8xHTI2M57AMPmp+6482R26ovhvh+Tieznr99h2vRHwkFk37mbZagpaYeCm957zGw6h/at8l3tccPqnxMPol8LHVu/Tj4GKDjWP5iPdpcYTfaZRJj509qT0WnXyfttqYhpi4Bz8xCco3Y0Bzahx3ccE2K0cYkSycWpYVcejOfDOcWxK5pVo9In5aHOV3Yma3ql6A1BobpuNS3fwcu/LI6QGJgaiyG1jIgz0F/OOWMLfInb6dAOUiZatqaqFzBdQMmbSFN2c0pveIQU+b5MiK+mrJHEaeMnyJ94+i6Us2sruD4F98MOuUWxPed5kBmq3HvcAzLHWoYOG61r9W+xPgudZ4a/jcb3n/CLXuNO1t0pikSxqti1IGfg5CjnjGMX5lkkzOa5RVzFj8oiHNHKg1s600KnYLZUr3ij5yyLf0YN8heuq3T9faZd/BuQEpacIgZT2/aIAq9XyUVYxcfEC4C7SE4oKwEBif1VM1eHXOFzfnZQwTarnpTfxAqd0fxnbdAilIaKOAjbUfylJHb9lgZoBTC4lPv2IOviZjEZoh3CnHvV2jNSlgc5vT+3oFlQHVj33ufP7AjQTF5pd1ooRbis1ExcIe1maR4StchJFhavR0tRP6XeWlooRQRw2DwdraojP7Jr5IIHSWIeTLa24TumUmllbVyDzgZBvjoWDwgicfUJJMrpNeUpV/aGn+vY/8SuiD1HjyEOzVEaJxBcUM/s1Bngohr93TYv9HI4Ie2l6j1WfFQ/2Ea3Jxp4FayzbeVJPrkAFNzfFVAyY746qO37XvIi/LZSi/D3ofdd/I2jGm6egy0lLjtoQZUw996ejKy3uMpxUib4i9CHpT+d/O9dWJwqAu230katj0V/mCfDNeS2dpSv2y7V4cPqjq230xHcfTQVa4G+SE2p1v7Mxcj/uXfrtk9XU/AiKtIrLtYAksLSKVXy6FGAJPzrBP4l//DCTcbg4y5IfZgcG68RYdDZ9SLrPNw/6e3zpZCb9O50ek/PuvGgnmHnSoRNCE+M/xFpTVUpCaTxERQjmzjLHKtyJeA3M+zS/Lse2zOXTHw/rmAyZ7TOfE70xp3JVPC/JW7fJrUrQHQeETfqTfX9iH6xvyjS8Mewe0p6Uun6WB14u3w17AAAjXFio042bNaTnxnD0e8NplUediLB624/f7LJyS0YwQjaQTnnA0iEIHlJzYaV6DwAPEUJQtJqsAsiYli7MMgs2wlOXAEMllLJ4jJswE6ZHoCvyzkrYa4+VBE1VQb8ygkY/nOvWLspStl1RcjDS5JosQXm9CLLoSyasGCRFX41dZ3DSbtpd7Xsnh85Rm2BpwAPK6n83BG8vP3Lv9UdDI+Nxq8itetZWynqA+5t4ffUxDXfQhzBsUPlgMUpjZ4pp4eyG0TUeNiDLUXUYKgWfn53XSGMggRZDPalQai9S9FUqyQkgYGvSKXISb5B1Yu0pIZ/QX2sPa8e3tDbTH9BbNnTt7ysS98990NKK71957H3fefqKujI97iO9BJ0l/cT5meJQ9yM0asWLgTVc396Vu8QtmJYZu4mt4QFNCZX2WWQoz1gaeNmK9edxPfuKRdfcA+als73OdUBLUeV3oGkf0XYH7RrCagKvvllrbIy+d69E98ZV26XyRjnRxKU2ull3FXU8FazLckcuZcFZ/Orp0fDrIxUeYazk3DEVE/3OOagZIJVeI3GN/Sgl5dKOTaZDRX0dO9HhIsz7MamowNgVnp5R5GISjiD2qV5QvjVhJl71bJDHPP1GUu4EpUcCfbhENhCdyKkHB5OEFDL+3asIyM5VvcxodJ1UD5MAxn2qddI5/gIK4sNnumRIvPL/BUQWyL+DJ1Gr5+qF62Us3m/IuxOvCe90Jzw0gEqE6oCpZR/qrDlBXaycQ1NU6UJenuw0kWbcQ4qLGE1M6igtwG1Rk3++rS+n+EQQdL0E0G9idog/kt1pYBMgIgDzy7t3Y5NhT8euRZe97UyKUhDqOK+g+3Y/4athnaeq61d/zCP8LeNno8gvh5Rxhm9me3PwY24twS4DesfBQ5896Rm0+Q/Jsp7+iCbOYFtSW4N8NkIBFJbTp9D1SNacu9T50CL+NvxJjr/vAxsRLa5bmxQeOqkQQbIBSqWHqVBnAf6+owrIjcR2kKosnbjYJKhtxX53eUj30e5rUJRJIbkplzxWisBynoGcWdhFuHrdiYKi2y2DrsGi3cZcLngwBC64tdUKfMTGMNzZXU/zRz1vgKVs3XXlBE7YtI+WPZ5cvyCqthJynr/W0wQYv53hT0X4RIKUiuM75AMtJCFUBUjkoVzI2GXnTc3qLiyuMRJ5nYegyb5n4UafGk2Ue2dDi14fPyyDwZK52w6ma9ve75gpEGgzSUwvyzaqNCM9E8VEYuC1par6eImtqZTwhsLH2MPWB8w9zgPgy3KYNsTmw4tqxbDiuEGbB8+paY6Sncv6hYB2XOT+M1PWztdQCBjMd3/iDU9+ZBGeqPsCge1P6eICZqNla35zcbxvTAVru8rbO6Pi0QlKG6abnroZcOnIVeZ/kWJw7+pGALNCd8z1JNRwZhkYq7N6Q5Vxcn8nriOYuGYRjrsozDcBJAyIuLSFUSdFeeQVtE18yORFjs5RFDXZNwNh+C1R14YuV7fyjZEsL+TOqzxVAocTtmK7J6babsV9PdHXCqjpl1BflZJWLX4Wiw5Hzl6Z89MxCgUlBgJOSZwOx+ba37BHzEssZqnUy6uPMTgHMa4bcw+8tk9N3n1IJFcTJw06+Ylon9jOZdx3vh+zNpvj6+UD9xZHWZmHZTL5J63uPr4s8TIQ8doqOhgzUQQYwN2PpJugI9WeaRiwG6am6s1Pe3DSwccX1U/kKC8njSrEfGm/RBpBUlpUoCHLb5+hLUVPnN398pgG62NqhCa8lJkQDiHMhGoub42/hXPI3pK4NRRn++4KQTDFfH2hk3p8gB4SVDSHP7mxkd7b+ADusEga54e5D8tNRjbx9j0qBefTN2UYMEYGI3VFGvM/yYCczTXUiXc+Vtxh9MbWDocffL+a1daGizZmowIbzTA6xU4JWXXg5SeyDTIOo/Q2phKGHV8uOjrmVhQPteo1PRuwtT3TCh9pUt8fmV/7aZCpdwU0YEgrzkLPJimsLtqDiNFE1P2wIg12nDUU8/pxH9RQB+Xkrw/+FlfNl83tf+TcmbSTjTBVqYE4aI4O0rHy0xk62z5uBFNuIa3jTA4+7knCIAlVJb5TwpPtqrufcnhW7BCX/HpF5quuEuu/BJPM0VD+4/4cZWVj8a/afJhMzAEJ8q6dVomQspTlynGI3cMGB3xUOXuhNeKBl77AIdWh0/DDVSr8d7ThAX9drKiO/Viz+28Hh9vWVlGjtEzh+RBLWibWFHuPuYFFVFIZiqggkz6cQTChLySvUK1cKLO/q5tDRB6yzQ+feRHfpIDRyUMmR9PuTNeMPHPvg5iyPPkC+TiuU3pBMPdZYI4wMij99pqQHCiWbnwslS2FoRMHCgokVsSDr0wdpW0dho52AaFyD6FZ+I2BaYruOczT6/9+zqBf81DGRsfHBtH9eIAY8oFaSFXvYEMmKwxfip2rgf2eMFqV9OAbEnbdBUSYnIxQd9wLhySEG/0aeJLo6tnOz5I+d4tTNkbux7cP4VsHGGGYWVrUOuMaArPKTJ2sOz2LDsME1P6HOfLBrHFcifYH/H+a5EFk+Rv3y3DJ7mp7S8enZHGKtwhlnWJidK/ioYqcMNRwiH9gACIbKV1zIJmDNkwRCqEXzkk5L1ZWTasWDhxrwTerkc9+8zgnuT3wKvr246Za9LAKJa3i1Wrpj9LcNH1/+wpwQh2HHte99vFFWoojPrP2W/XpG4Y6cEVHKNQ5uEpHcHFD2eeasSxFhfNb7ljT6w6zrb+mZZ/7f+UWpGmTIbHYWuPOFA/cMlkSehPvOtdC28jtze+JNf2SD6ejaLJnbzD1rk1UMC294PBvvOb0tDgZM2MnNgrbM9J4nR9l395OL63ivEyQ3ydpZm4WzCJp68Tat2wSvnxZO9Nq81YN5dOcon5SwNhRpmAdP+2VWfKuXXkt40N5u0X+3lHTYJoOUiWiYgoU1IiWz3jFIcXkQdthSDTDv6WdF3M6yFu0R99DRHyDQe6S6nLbrtQIJNALl74Ho3YIwXdw0PfToacyxaN+zy6ZZvz/nEptPxLGU7+Zyf6Bux7uu6JIYHzArA+GqmJXhBf1mV/SD9utbRr7032JeWVqqKebvBqptrQX40jkbkQ50hK2MGIrxQNdO+Qta4dfB1d5PJYwQCQCA/NgaUHRlfgwDAsW49eKz86Xeym3Y67i71H5QM9+uybcyC45qW3pfO/nW3mMvYsl9PYApDWGlObqcnqLEEofzprMsMAEYHZWplr4Yd495qAJEgrxxDPAzSMTZuIEWHOEY2+TJrNp5bKGF+zrYAv05fdXQiPuCg/1trpWY/Re9jwIrkVB/kaGWA+yHrMU+TKGRTMaYPrnDuVopF6fDX2clsvIFiEWJM++6LGnioo6WhELGSNTZRkQnfk3MCZO54XORZa/WaFGOKmOlnAVOe60/ouyMlIv0bfjtPNvOERGLX26s0tjRu/sISVDYLur0HZ0aGhodg5kMH5ifeW7WO+nhDZf+Vfz0VnKDgwxNErm2gwmHSnLUeIJHSm9x+EitXzHJGHlwuhFx65Typ8hvxMdQJG7LLxeIFfaD+vuIOXy4uXCHzesexg8f/Zu8Q81tLxolYtGfBnm2A0wgPqhm0mcq0jOsVWfDVWR60Uw9q1WRJr9/d1uTsN1yGRD8VPpJ2AOX/au8tiCjHZQ6aZdVDA9TpyGg5ScsROjSWNp7egLZTJgTTPC4Vh0qWh9pUmnyonb4bcmlb/mZQgYjnGGAkezphgW7ioUgct86Zza9SpXOdufHGKp9u4Ma0+umq80dWF86oYhcfHd6mNhbL+N8hpEpIY2uSA9gMrAFwCdD6/zHfOiL7IE6Cf9bd8pjvxpxBLnZ9CjlI8QJoc5eUCcv3oegaBetxA1m3+ZJEwy7raBonLzUMawKewnL4PvIg4RHm06UUIuCPjv2a42S5vprRtoBvHjlpCED88/Fgx3ODywA0Ie9e3HSAAiXFtj6ijonk8Nbr0tfzbkkVUyLPhmlAcb3+De9XnPONSw+N1mgsN5sjx1bCAyfGUoPTIlU0oTxU+sLkebRiuafL0JNSdGqTR/ZMXxWj3H3yH2bzRxZ45/ftbmZpz4wUOF96hAccFunkXOI6ho8X3lCR8W5CJTK5/Hi5Ysw11kx11tJ2KrLjhlG61yzXQGgm7WBCkD/eQrfix85BN++tPJyxMwf5y9trkMnSUkWnFtNDOTY3C+YwoRF0XIhhDR/Cb8XFHgZD6RKH4jid/3MJMpjAP48+zaX/GHvU+8uZBC56fRIfztixfzx55X4r0Y3gqKA6Pc/DK0KQaluyHmQoT/MCkRQhVlQNdAlmjhccAi7fXMlZsTCYimOrjbm5b/JvTChuCjmZdgQmv2AGoQo0nf2p33oNLstaDaDm1ENaQXR+FSeNMIBfQbMo3gfx9m1ryi19f9QHM/EoilIoC58A72qVBmFWwkOhFQc3Pp4f2GSPWmoAoIx7IN0vYGSuAok+O4BVXMA4g5BF9ZhrzfkoRJpekAM5kGb4iYTNIuRjomQl8tm8e4NQqgkqYFGW7vFtHsYKBcufwO6xpvLeku1rXTiNys1ZcythGVC8gwSQRX+cw7zyzBUpChlgIyHQmSMucVQcy5OvtSsr9VwosP6phKuYveHpYqxKfMoFoAonQQ1W7tXdnrrFs95E3ny7hfMmmbmVXk0SyZOekQsiRAqpaG7z1fwkN8C7coUYvNMXs+YXfp+USv8ChDkPOV8nFHPN8piQrFobWKg27AEaqoBTNxNc82XfFMlBy1yOclgx/0HpBBoMUjcJEAhdTFsscNyNhmX0jl3P95X+M0kQ9iTuJqMtE5uLihp1YnYkyLUz0fc4IJy5oDg6ruO1tu5GCYGnpqHac1u0Sxk5A7sCyWEr1+i6Dy8u6ifU+7oW2ndvQFPJtT/gy8ZNDJ6fFMk/Q0JfFdAsImVRzCGAkhfI5xB7+ZiWCucDGh47KeXR1JR5EYscNoZ9IkiWNchVJ08o3AmwZTB1mnR7tuL8zgNDIJAS9c/LyBXtSC/pS1GsS40txHDTcjxzeHo1awgWFX3H2C7n9c36EEnRZ82f048XzEs/e9ZZqZRa9BQSJXatE8YjCLQgFn9a25rmlKKz1u79uUbxWlBczM06A5YZK+LlAfAOFdoLjn5Oj/wTaLzbxoNCC5X6pd1c1ehQG4E2marz6t3Hhb3PMv7ZFke+wKjZvjaToYpblISGG4e3+L3cpD94fnjUlamYfMY192TSV5q2jt+o1+VbAim7yanFIiyu0mmXaVepqI2DPuauXl8uJRTV3S2n5vn7kMtTZlWT7zq0qz9crt5rWsu4SXtIpU9zdGC+rccBRZ9FwBu0HCFaRn6qGn9FhstlEyjtN30c/Dv/nX8TnQ1/CmpGwfMYEa4rMgrxiQfD3A24RWtEnYFhsthWMWwNlCc/AOAkOJs9W0KDT0HbZ/2ViWL37WJmFAtF46dUgIgNbU+VxxcpXgosEKBhT7iZSZOigfwZzVINcALFwBeiJaCjfB+Bshhq1ME769oDUhNLMhBIKCJMRMBJtYHmNie4Jn/2ff0ppNt7ZHb/0zWsLvFiq0Qqq+JmNhpxUR4JaGpk+ZUJTsId4nqjOmwwf+gteaM4esJ7Muv91h8LL7v/S+U61JJ8wSmK+ZUKs58oMHgZxDLTL1e28suPZLLSk66CL8esFtB0uBzItZzNys5Jxrvd2xcp+ylUbmPpmzaJPXK6lnF62xfpGQEXJ35AD9dj25uuw8gYWGr3Kxko/RNfqrkax2DLTdBWGGVsOt96IhQARy9qJh8nQ2Y/fxLzGX1cvXXQU83EwX5RKxjzDnO3IrlkwBcEBgOw2G2WNBXYl9+mLZ4DYmrh3jz8JZp4WOpfM2/UBZ9K38NULg9srkUYlVXZgApOkFQazVNNRd8V0xGLGjS/gTqA+mlu3rJsr6/78ccNgTNS+tGZqfsYE0NTYjwgFgtAIRLsvJnoWCtWT2zYGAs9QB8pDirQB4adPybeJJ4ec8B977EozCnpxI/fPGLysndGyZAxH+79RDGHvcYuvOdu1M00CW0dDuBJyyIpFl54CvWhlf5zRKDBkEiFew+jJKAlgqmw05JG0yzFjqiPl8/S6x/A7qBqGVWt1qrnEt5GTiVfdvfY8XcS8UFrMcCs7N5SSMC8+ShJqAVhunAqGmBtBle8GXFlTS1tuB5O/yypNmik9zh2kJvM/7RCadH+ZMCek9dszBLDQCmayh0Fm7pFb2mNC6pj+ShbKxMeJn75e4JMT7d4knUdepYIMlsEybS76Cj8LDEvkZf2IsY4XWlVcxUMA9cE6MkpBoFGmKolmJolH0o6LqAV0NDy70C5We2CZVC26Ch0hkAJNQGgk62fGix24pwsvxyC81Z8HDN3bPiieMbcEtEF+L1q1Kz4kFchTPsGb/RwysVp0iFL+5MBdf7Wr6wqXpc/vm48ODeR37i4IjorqLSiaNM/x2v+8PH6s0P6aSWzXcVnbfDAYDYlP5KULf4nqbVaTPPJ/z9tdmc0c2Zyz9t4oT0iKyremVIFnRlfe5zptyOubpkTqXkLBgBPNQCPKQMPGR92qxqkmW5f4GcXsmNI6KmQUqVDvP8/cRAZrDn5CylegrpKPDUyavuk4+XKxjKwE1nIXokL0XYn4XG3Dw6qozHueyxXzk1yJ/DuHYDiNQ7VCw6Hn/OsrXZ/Nnf8VsoK6J7iaYjPfzP2hIXl63Wd7nYKVFws1qIpkDyZtwkz8JJVFJCLPxm0SbOlP5wj7ksobv1ov0/IhFgNY7b/HHnNR4u9+BfD1VEgIrdA3HCev2J0gEIL3yVmmmrU/v97SB1wW6oS5EL5XRbFr9O837kBupC9XtrFwtGvCmTLBYr3K65pl24/PPHsgvhMuveRCQtNKgr6z1d748KNnGwzgupQtLBRUwk5tc6vh20qHhRg+IWMujW+xF/muszODIiFltyxmTg7zfn7xwCS/JGVff9EIsvASC4njcf+m1B+cSjzERPnxnKIvcnEgcef0UqCJxr4Zka8/z72RHoc5UKL24B+6DCzEZP+0VQquItp33uO7168cLig3EH+6kInza9pdKN2+lDyOV7AtC1SRPjzbUCGQog6luzFPNyouVMFiHUa2x8HvcYdqEJB9ms7nIzsfIcnDux3n+STnbMifqt6InsTGaceFN9L23MTQ1lA1+lv6uk9/+7Soqr5n66vVQSGyBUDmCMeHnCBqaD+Cxfk8mdCvmt8Vs2qOTSm6zYVT7jP2WQwHTZQ87BLejERpEB/Pnxk1XaAA6K7uzYT+zu4PN6ya1YQpTJrb0KebcFUATcOeR6OLI+MPB/6fLfb28ACX6cvtIo458067elF1rlIHPrfO+xHf0A8PbHKDdw5Sc9gLg04CNxB6Yw0SPlKseYNCIxVAFEeEC8EY1Q+BP/0ao3MOo2RLphVeEAyzVqBt5hrxWksNxCqyYOBk5KqZj/Q9CBkGlLYyT2b8wMLWqbGMvkRPycBWKmteGCeYLKhpnNI9dluRyCvB1RHU8ROTc3LvCCL/eJmlaxPMF1CWqA/Jxoqdz8Y8L1CfuPBHssnyI68FVoU6worNouQnnMvhqN36gPkzPNGqTvbQkpQ7le9LANKlSuOt4VNiP4/u0LW6q+2tf66U/P3isyvxhpOk2xLZ367dPWmRwQ5EOWEBTeYjJlSRdGnvJCyvAhzer711tGVXmws1kh3ndnTPsqDvzh8uF3o85tsAPOnAC8oDgi7QzcWPsYIrzcomStO9uxOPCO7BhgT1RLn+60mOUYWw8lnz189PYLrv9dR2hTMsOVjhaoxe5HttZHzeG+v0pYN4uSPxBIWB4PZZdV7zq4Tm37LA5yib0QX44T1zNzBVdLlobl37J/fqnpCooTiuezuJda34eEHqysUn/YCVDunUkHC6lvO7hPLfgs7nKF33qE1PIrP/AKn3hM0q7y/p7qO5t6PUFc0MNHttbgLb2nicWlnF24frnV0PxYN/6NwTwC0Q+UK4g7e3wUsW5R0gNGtw4qxN3Wb3k4xYuJ/isuMK9XD0oizIT+Vd3dzfyxZHCyWCjK+K0rW06PtBIsHTTB5JdTIr4KdKPbZ24te0bZnITH8R8thlZOVy3/tVvS1pFfKwEnD/SSKJZCb7cFiugxOnyYzs4R6XwjWST9a5xeYou5Nv3Xnc2RvyoS5MnpUvuPVlpoBrs0nUDxt+Gl4dCA6qujL7OlcWucepGHt0zejJ8PwzwwDEXAMNCIP8RyuueCp8JrFwV0WHGXGP7eOGeHpOm74zDsj5DFj5WNoD+WzTVudb5ZKRL4Zcp6uDk90Zn89PvZcRFSlRVTcgcgaqvIQl7ONOoVDol98NDHntT+Phf1xT1KeT8vbnLXD7OfcsQ7DyZmAhAK+F1RKjNPWK/WZrnq3nIlWfEmdA1SOw4MJnu4PnF5bhTfftpiFF+8/vj1716LrMHJPtqQJnr3qsTpSbPNz9HdhF0l3S0fRjmD1EdNJkYZggYwVMXeeOwmlR0t5xID1q9I8Pb0xWI6ynMzk6Ez2yaeIWbfRSUWi8RcFs/6z3CznN93ZNYqOEBVx9oz05FfM9/GvH6dna7LnLpPy54eRwspaBEWTrwvGWwyXLVpJFehGdjxanpWZMKnmsBAJ8K9YNYYSF0rYWEx3CN8f4S+XPy5vBHF54RNfOGoGnBR7rNdVaQZndpqkwGqSlmGO919sehbk6QveLLnzRUTSFWNSo5ZCj/csCpOEY+fC9ssddtzvlg4Ic+KkyCYpWJGn/MtoTn88GiQ9WKgBqLf3mb5zc8fftpP+1t3wkp6yUI0EExv5sLHDppUbh9+N/hFbEpbF4PCthcj+R2YpURFUr5tutn2wW1uommpXqO+FjnozjY8ouQcCbq5vOe3mxU1bMkc5makJpZfXt/W2Hs1BG+orgBb1kPuaxPjuvhFg94jxu7DtOse9wVVpa26WxvjFQ3b0x9q44lot7o+QxaqGnmopl/Z9WBceD27E5ADCbbj1+r8aEtHrrj7MFbwIHzmX9vbf7tdc90uvNsnNYFdwGO3gH1eZVMsDsiykVqGT3siwusEEMJEN+bT1ZFmWZZV3l0SiMMtKxrfhrSjo8GaE/bZrulw3fCvxctPfro+aafk0aGVzP7b7GRvcprkWYMTZnXLkxfCw75Ohn70q9nYupSgKENP4b0W5jq/fEGfD9NV0UNMZX48he/EN5Yv7ln4G5oT+ppAJJQ1LSdvcQxsqmLTCz2VBy9jqZKT4rBoLySvAGdG4SxPssSATRISKsjZnd1fzZfgkx7RVtyw9Xvs6fAzrzuzd3oF3I7ujVU30QygiazO8tbY01ErHebayF/E6HYgQfeUBbYzmU01hqfarnuP3fn+tWULrRLVaCufqfjLqNl5XWTS8Nnl/XlPXT8UiyDmOM8Z32ptAy2b8rOlcFcYb3SFrtbDm+qmn25uR0dgu4XZXCFC2Hz4Yo3knqkPhqEt4A7j75nVWX3NWTZd+YVbdanOH6oPFXM0IVazwwPJtEn+UvnMxtycRXIWVSu9JOHytjehxza+/SLvnjA5VPm4fW24FC14JvXisF0T9Xu2EU5l8Vhv2cBc4R3cy6m9eyHC/OduS3FSQeVL86nGijG21U89qRp+XTDEoY1op7NZgPdBo08p/tgXA6ydkVy91KGZDKUuSU+w/8OE65rMRtCsheBkAqp99dmOMMqhh4ZVh/t2c3HtJq8FueWd6uVKq1SzWChOGC522Rl4mfqk9BT740yXDh9Y2nmnjiEJU7HBtFdoqlD0r2KbShs/8T6gi4Y2Vm4M1i0OYng1jVxSTtP/6Otn98JT6ovDvm/s+jUIQlvVOur2VEd9bMxSL4bkgUef85AjJ9Y8C6AufiLXc7HzQ7qJ9nHyyajOor6JL5n2iLHZjGPAxirYYRlDh5XWMZxVKNWsVrScuM4AGjmORnaj9UeuN+p86LhZ+49UPXS9U8didGltI67zwnTdSKCQLTxfZoAwObcaCtJlYfBJQ99uJL8f0EoCYAgWLiYDREM3MjWupiGMNVN40yYH4p04iDIKqxoDAECQLHjyNkVFZdm5yv/MQJqfavIeKNcMrvthDTft34QqLp//BXiJ74x1LPASQ55VPkcvN0h11++TeJ/KC+ULGz9EroStd64wPOr5ntNksTZmOczgTTk9CIzCCKv0gfmOM1maVOqU2vlhcOmmvedXE+PCe4XHNgcU/LjUlr7paByi7xU/j7RVO9XKZ8VdCVfr/hjcvp5zQCNtWb5iUE1Xd3+gzm4A4xLLdG+VYH3tRXy7qQbFM+cyLWIsjW86QDyWhO99tJnbu0QA4ShrVALwN7hGqJF+anQh7m9FSKZ74ydPI6+Klefdh9E7wKQZCzom9NLFaOzknY/qT2axwYpY4HuN6eBnYJ7dOX8qOkpVlne22MfWdD5nEIiTh0n7F7bDxQDOBB5Yfn0Y72lI1k0nSa8ZE57bJBDikyOQszA+Rj8WJvvRclCY28PwZCuuCKeiZFTcyhUZVH7a2adC/jkBj6m7a5KZX8CINkSvXnDEJoM2XWBXJ5vDSGIvxMvUC+rC8jR+wgwysJOj2FmuuFz+zwS8O03mMHAE6KLdsApp+x5/HsN67lxxbOcV5jKc3OhzlY6P3Y7P7CD7JboIhnADIAFGFgS9wqyYR37QE8jNQaraZOUoIJLbsDliubsBNTA1sKLmz6J7xSLPKhRZIF5d5TdbL/LDD3fVx+R+qLitx8oSabAQXJeGG7N8Xw1SXgboumL0IhQvQ6mXY9uH0erpKtHU+0mPre7RsigSLNw3zyOcX5vBC55vVXQxNbfJPo8+DuBQ4tToTvKv8LgFEiehzofM2Tg93AdLt750O9E8+aRQcdQWPwq8gcs0HCsPy4C+foYS9/BeIro8ctc35I8W1Qx9mNu30CZjoiKGTsuZvRFtFeS7QlYjMWywcSTSqVwyUCkp5EHPz8jVGCDZGfKkpmcN1E02XGpb7tSOcr/QbfnW5lCkZf/zt6NK446Sh2Z+4StJnH544Qf4tJuXoF9JDBKXDmhCH6hBkxtRDZN0m5e2Dmbwqow78Ttdfs+Nf4oomd0yGwdCoUtFQaN2NK0//ACnLpOpN16L770v4PTQgMxkMPWZM42hcMigm2nbJzGPkcs7Vqb0tWa+a1XYK1hL35QvzPpl9gGBxggRPl9X91iFZBYBeJIAnBb4yQ//Pn4xHDtd7gRMu5nXltGbe8VIcDa4vGSMXVLfWA9InSBkIqpzDyxVvT6sjJRtiCGERzikM9RtMnpsMoaMqYVW4IlVSu+W/UbuLZM4lARc1i2znwk0QohI+boKxrbJ5dia2iw+A7f988sVlvd8/NjBTTRE4x29MJSLR1JXRfDW0ivmUWlsMGqDCNNoRMUsuJRnW9q8V2KZIsXBra6+mIe05qMveMWrz0w4rXMPF2M9V3g7tUkI9diX0zozA5XgQdP7M2Rr5RUzoQVC5JavaynYQzF4kpgS1PHPUr3XlvhYSd1QXTHMc6G3SExmnW2+eECbkbc6wozOLkP9l6qzYFKbXLGtqcsirrupnu7XqjnVugHNuvnrWxk99zjGfqY7l8iHVBi9UfCSMN5g6SkNCDI6/5Qg+KmKoTKgQ3KAfefom+Ygnba8eNUjzPuRvGVRdFiqE6ZvI1os7ANS0zLWFurOpYltckW2vqoJkifEmkDXnFQXDSypON36UA+/aKYH6EOWtBAr1W9gbcvL2tjAC+P0Okdxre2RueZj1Qc0O1OWH3Mauy75BZEc4F/fVHTT8Kykrbvv7rlSbemIaYQPSj5YcIAfXp5F0dUqPxrqbDm4K32fwd5YblOaZP+bs2hsatMgLCH5Rd5gC4/OzZKO/jdTSV8M3kTZJEZlf4DtF47BXST99qnD1mhT/Z0TTiASFXFjB1SqlRk3B4Aueqqed1GKj5q2aeshSlei+t6Ak093iIKgu0Yj0FkaLNXQL/kj7zZthP6NUvC8pbdiWNRIPCT83YTBOzUvz/b9e/NrXHY5ybSjt4Ien6BndYzTej5Galn5rsCKKt8cJt1F9BONwnUlG9Q7yecbJu5kkJjFKG66PpYayLMdf7D4THM5TjO/XHO5Q7LWBZ7oGiefX+XyuQ2uJDmp4UDmjuAKmh+uoz25dr/kHu1BiX5e0WOSLnx46t6FZssa0gR/HeLUbjXPR7I0u/eIjoavFFs6k5ugqtJD2chMmRggtvIZIyWTIq9va9DJOfDYvjC0Rdl4iCdFXd9bT7vfV0f56/EiW8SwEV2QmzXVksGf6xjkPzChNleXTK7E+7K2dE0jbdF07v2Ouyl36WAJg3dGjJkvpfujf+KfVEsdIbYUra4HCdnMtnjBgq5xDGhqdKQXniZwM0nR1AEh2jbWB4vmjNDfHzksb3qhiEhW3Hn+YeHEbWFd8AT/6iMvt7Ot9H74Ncl1DW4inKbnl1XzYVWXUrD4zarXmi4rpPEp72V4RlFUvBirFzzZC77/aKh/TJa7Tn25Ue999+R0m8tQ3YCCJhZ+RXJy0fOTAALAEOHiYZuucSuB3Xn60T+qM7Q7C2ftqJ6fl5aZwreDS/AXB40CeINFxa4A+Zwq30pGqgbPblkcZz+amB2krkVbjap/ma9FkJhOWIzTVOpCMNTOieqU4n6h9eqFKnU7Dnr6UQ2MdBaEW2G98LuSS8vGcIcv21bP1Zdz1G38kiH1GHYZ+dqVQZKigPjTYPXlOPX8O61EWGNrx7ejzMKNKfxDddzC6y/n+If6KS2frnLh//ey1s2hskL/7abaq2pVydalSRVBuOHD2xwwei/u+MOGYCAIYx8mWHwXPVR4wEyTbr+rkK1e3HUHGSBFa/+nfM/+6rsM28vGI3E8ZaNyqdTaKp+vGt786tUjJpuPlCfIx8qu+szJ8fTejUY1r0eYKl9ySL6tvfKuZK13hjhs1dxL1WU7ToFIA5pR6NxtcDk5Nr6E1BxOG+WFv39UwshRa+fUMAwuqspQ/1iZesRl4MAMSUftVs7TmOYxr3hB1yDVY2Ap0gytds/RsjErnP3D96vm5asJZoGayyHBialahtN25IH6y0pOa5VYBqyWL9uAhXmsfVao/nKOvo1fPrhDu2bgtWYy0kRUIuYDT06HG6K76SjysWQkvU5Zg6RqpNLilu56qag5j6TVfKqRC6lGbP/cVlsWBlstGrgjjhCGcsiD9c0KC4Qft+YhAUMwfB3h36UDfJi3CsuM1Tvx+LZvfHQHLbicY2Djh4G8UUetWTw9JtdiLpro7SLMx3Lma9mDX+WTJ0Czaj3Ts1kpCwgYts+QSLfAZSvsK9G5ZoRDwzYt4h5tDWJWBoFJA35zDl7Bn4WDdhshGsDXfPKbn57Mmaw82zDparbk8fzkZHsrX/M28nVBHCfyk9V6VbVXIVq55Gl4uromuvGFlb47ecmwts6JiBLQDoMfpV3SA6bcFPnXTk56o7l5EfknYo9+l924RYsCD63umOfrGwqkPs0S8cRlqACuM7g6vC4os6yOJiM7Y3GnBoZuhQjDgkrIk7rHfd0Bsyop3wy5pJcRrhe2iQasbQTT6X5icDEXbszM/ZwxF56cC452149o3YnEt+Xm8lEdCDvnUK3lNyvFQ6EVWiy6XttGJLkh//oo0Z6mOnEycli9aK13jjADy5mhZeiUgwfPYGQwigJf9YMIg40cFFVev/mNf6Sfj7c8wiNmzTxBzUUwsQ2J0WpsWjkUY1Pm4GZgG6mDjPCMXcBgycjUC/WtcFfgkpzenE+eRkdMFMu/rNCUwRS4xZexiGf88e1HbkMYnMnwSbBtl1exszvfdFvjesfBdlkt7maPNK+dMC8DTw1sZvfAcT4NS/NFZSurjJwFy+ALH4AVcdgtBSkt5yjZ+EUC1sbgBNjMpejY+DB81VVzNbX8tYvGb4gfQUKN1vy+s8cdNkS+mbq6OqXi9rkH/khyfW8obE3CdzgLINKAyXGHuTkPrhoYqnMx59ov2r0K1FqO08p/Eo2XAV4WjECt7Sv6iMesTd3URI8OtJry9nPXR/OV993+ZwwAR9MDTZb0AiY2vviZwXLcsGzjKmMtWyLTPczrmLcfZl2LJ3o/EmVgASsIpXDICLirG2vv8lxrufjZU4avlg43VerPBN+mm4V26RBnWN4ztAqhW/HSYgxLHcLcXoyT5xuK6T2umQCe30Q1/V58dDmGhaJxRTlVzWEuDhvsioLmpDGUi+js70BYEQTGcP8uMvMv9AU//HanadMWSduHrTMjHiWmB/nZVGgxR3X/+qZMXSqIC8Z7DxYadHGPb0OmaQUn9+qVFB4MuiemYQ6ELxi6Ea6pz+oYcWy2fFE6UfGNrFwPqBHq3RO/E2vqQO6QGiCkO80ucs0O/jdcaWpiwPFTWmRwkq96FQ8jE2/8kPBa61fONdCIahmIDUY037DbrQwN2ont6QFvwABviLV/A4zVf/xW4CPG1tAvU5ogH80u31gpIUCqFmZBz9svI5wAxEzTPOTCgE4q6qtHUjd1mJldKvrfiEGeIjwMRty1GiGf83ueNPeH6qytOQv0m97ffQbQycjgxIlikdAKTRYNr+WmphXtgo95yAGuskZNgAeNe/FOANbHyqW9/FuzBhO5Xa8WokETIu48Hfv6w6zAsMS27A2eBGEuyUSTZTKHsICbutNszwkhcFpOqkl1oO/DUQWbqkCoJo7PSzYyTxHNUKfJUGO9tTZhwWDP8EJJMN+Zk0kBLoEwQ42qtprmsyobLApZwP+P6xPBrJS0uC4XB6WryxfrR8/i9mu61BDGd8K4wNMOtiOWhAErkFBEvecaCNlYAMi2ryhzGlnpBX0MqT5UyZlMGRzEFCaRvv5BJ0VvOAfzmGfM5DikinI29nXMNyC5IV9LeyIqqAA/hAiuR8xvDFHcKFxY1H2uvZyjbeOXCXlz7MV7HJFOyveDvnZFBCHswiHSnZ0xaPYDSMxdhU3XCDKxm/53AhCkF7uign4P1e/fqujgzCSZxIF3TRYdsgrl7X4X/+5Lj3D8LuJhnU5m4PoLXVlOXwtk4XHZ9gFvz0MHeaVJZWYRpgrqmPFh/aUe7EfFNH63P7YHhA+Hl9YiiDsTXFB7h2/8JXNDC1yZWiNjA4/i3g1+eTg5/lOXm9QhM4BUl5m7SPnIC4oDOq36rU47v/DeIPUPein605gMgJ26Zg2GljaIVg4uY3U00GiDwo6Jj5GhdysqgDETP2HKqdfkYv3qBZ2AVNcAT3+WbQzlONQpKQyQmRurJUqztAQS3ENZN7iEaHHZKKYwrY/2r8/TAz5PcePc5+n/4/PUjlk5BsuW699Ljv1kzyMf5sfOOpQ0MuFd4YjOy0T7x5Xcwp6jP56ejp29W93ZkVl7dNh89vMxeNrl+E5wQcvp7NOTzrMSRkmdQYr6lizkAFtZoxy4MUZqIHr0eeS5dBErF4Ao5fJbQt+N05Yauzt9z/4S3k2c4ZfzXose+2tFmdJeRCP1711rr7OHob/R8DZMZ1HABrF+HtLQP/VebDQWfalEn0J6pZ1OHWiZHDVYeNAERSySh9S2A3vGRXHDLbY1YtU84bxYIZEGkH3JY1OvCnNwM5OeVw/8ZSYDuFO29ecUIC0I/7Dt8HJLyBN5AKRQNJhC32gQPC3uwipi2g70VG8nrw2vhweQ0+pxcK9rqKCgqihels2SwS9q/p+opNa+H41ehwPNr4hixMJPNHJwmkus/+CNb3VY2fbVobrCpj7a8xxocPQ6HBjNYTxC8caUwoQ+/PerUzNL69rY5xfGrzxroq5zIYSOm38dXbrxZgK876RxMTE9NT4W/PVXUgOc8wuo61uRBP2qZN8sLwDjYeFRklzLDyUrHg1QC/zvo1r5llZ7Fa1f6KVYHxIke+UNGshrZmVXZgcB0/vbTL2ef88kmlfYvWkUr2scnRlnkP9LNrwFEvz2HCK+afAqLBzRbMSRQDm4bRn0huoWB3kyt+fOV8I6Bf0Taa6okftXP/2EqxK3BeL+Nd0TriLn3DykLndZoxZVPwpuOELM4brYorIOdvhJv99KRK5IIk1e/zLaKWoU75NpIauqwXa3CgXmfwMMBNqkqa6BtmDtVUKoKhl6PBQd+xbLidEaYcSzP5KPgkuo6WNQpx5Ja6HXgECvqgRMgxpndbLatzoD0GPYYxik6LNgP0Cc8B1M2dnWmjlahox2eoEGiNCgGi02YG5ScmxCgsb+psdlOJDegoMkENZzqPPSjD9PEukYMPkXq6xNDxvCPFupancMHBFAchzPy9Q2qAmmHKtzjP86wxXmVrg1t/ZhewRTaETnSXD4JXrnhhQI6NTc/a2CLcYh2ndcHsPGAVt0Ge0GHmbV/nAnoPsZq3zJ3+jc7wqOkDwwQjrrAAA1uM14L6NsaPV7m8SNqZ5VPMWKciwTEA/v58A1OlCP/obDb3XKQD/jLqQANmwLKwcmYwDzaoL5iWZIinAG42plngbA0RArFW45X58cd2dfZRvXNSJ4EkH2H32GwqTostgh1eI/tlRJX3tfROfNQtWFe+mLtWvFHFG2iKZgZIzy0X23uRwtmpo/1oumntQpGQsNCKSF6/se0lavV9wM6oE3VuaK6OB4WV2ogDzkI1b0Ge4GUJxUBR83VGiflNhwkxStK9XkJID5xcwFAvVqHYdAHKaBl4ZFL3rxTnpBx70K10ZtV8Ug8vnIt6KJ90KpHTDzFxeyZaiv/M8qGApujtStSabusI1IbVrmOmZZKhMhT82Z7vFU6Jc4j2262VSvzisJVZnmkzmkBUB0Y9Eh/+R/IIajgVCmuVyIE+5vOUfZpRQnBYiSkLtO8gTG8kGvBEsuAi6vt145z5+oTDXdOUI+W/hBihYN5D/OAbx4g/y1SK5yrxJOtwIjQ6tq0Zi175yYoFc8am7xOR+mNYvVus1D8MbquMXXN765xBMx1XQJk7ErZvyH3o2wCxN8erDYBj9XhvjOEJMDIC8+xYwedXNgngaUAF7oBaC2+DDnIA3Zf3BrGxLAqVV2NwKxXaDB5Q5hioeAnzxPv5NJ/QnclO2mzpKdj170rzb9be2OeaG+bxtqa5/yTkFaoSB9tKIur2ao2mIBUr61RzdfrZD06d+gf6XNlDeapz66yNiO5W4e/J/ODn1cB/zvwQ0758XcBSHAh4RHMOl/4e5OruMImf+o9uuvT866VSnZbvEMUhgnfP7ImQZey2zTTwviTROWTvrc112pe649U2jJu07edNvwFRRgC5qWruaj58n+QaQa9mNk/l3UKGUbTGrWV8sznP/nVa+/kGEATx4R4gHMkA7M67FTezcVMzxDHQ5SldxnWsshhFwOWYM+mdCNx+K4zTrnCsCbxQFvZmCzZXCB/7G0nakHWYPiogZFhdvyrnNxmtFrVqL4aYtf1DJKYtMBsLqXj9+9OvWIF6CFcukonJSiYtL8JXhGODxsExW3kpe3SGowvGpuaNVhB8lHqubrB9QSgEiZTyrjVT5xvzoQfH54Jr3WUm5ZLpv9D0mJ49S/qjTV1f0CDwNGq19YSr3u7ETb5Vqv3YCaMqMaPT9gGhbmdTJQhJ6jq0TXS6N/BG34LO91Oq7dEqGtqln9nnsNxXtC492ZdpLnjgjWFNSW6de9lSTbLog2BZB26cX7bfuOI/nCRa3nAWW+dZxL+6bS09t7nbmwb4BhxU1MgiI2mvmD2tb590YosntwlwCgajeEOXLaMJxITDtMnmUbCu8WzvC7URHFghU+eZJzI3QkBqnKhWnUoOq3hyc2wX5OlyHoR++ei89cjKjAkl15WIkqVIuvZ5fJYESvOpoRUTigA+C6sa2vuupyE4YtecKW1TJeqTHzoa23V8311gxwkINbsErdWaqgPfAoq/fq1IoPynSZyiF5/sc3yib++em6xbjhGc4wNyeGhxmvoMx8ydb0i2BZW5zGwVpYL3qR0RwImmikX3LzUwTvxS6t4L2Bd74iHp++51RDaXeG7bPiegNHBAt7EG/zPn8M5gRwEdFF2mrPui0fkl50qSPBYZs9sznTz92aTDcDO9/K+cF/P9jVe7UEoko+fApBCsvLPnjJa1DiSPCdxnmGdOr9R18RnfrRd6ZI3bH4gejsiLLm9dr5jcF+iCUr7jurx6o5QtV5O64NmayVqJ56eV4YEUcA/FJNI/+bg7Sxk/FZr4ju2416wLwc8FmkZx5xDT/IUE53DZEPx41XH8cxigN5QRUMCEl5fV68UeVRIzSN/bdKIUHnCz7m+FRDdezWnHn6iVzlns/0AE5eCC49qJ3I5tw4Zvleg1TlwTTqUfUnwq8nwo3U0Ls6a+Bgo4IjfuisTcW8TyDkpecMYWG0+lkIXc8F2h3NUYgnHMgmDfB81b/8Pw6S/57OhYP7ufAfRSN/dl32oTrIEIZXcy3kNwh7tNY/zm8Ma3PylmvIeayZI9SctxPakPlawZmaWomF/VM9T/DQlsB3hxtOHcUiqOQZFSkfaM9sEeKe4yVipXVNicgcEgMYAOOoH5XarIBjTjSdS+MUakQ/v9FSTIxK7BEahicbwL9TAQiC3ZqsCgRcHvIYIOx/xsLdJfn25cPGQt/xAGiXE517oKZ623jNoC7O9wKH26JdhMJjeHI6Ie/JhQNespKEfNZfq+0GyT0peKlY6VhTIpC18QKci5Iw9a8YEyhm1Z0Q8LyvLZhilAjaTYqW9rIPvohyMzG5smaw76ICLrPEZbHKSNHi2y3fne8NwadNhzqve1FqZxDywiPNj+oWP17KD+IlEX6RPPSRjMSLoYBXkzC6Z+hj5OCwE/Mrpp97rdpavOV9e4n5QepaphMzgC9oZRRa7SZs2n93KjD0FG4ayWKsXRRVECPxWJt6/z4dnjgDqyRuiJ5bK49ixUJPInLMcbsHrX/tcxmaodacyMRryMuZnSV8nTtVz8GfMr6TgdeUgQETraCZtX7qaIMrW2yXrjHhJncID+DXpbGPuqsET+aPmzCDwF7fnLbMpCAdUIsWfC7MHZAFU0gcvD+AOXpX2p6diMtmcdxD7B6tTXW5fO6GuwJJOlbhcGtdvhlO9q9tPrLOpMpJ1KTnEWoCY2/F5TSsk/CnPH17OaWHEDSytYXBKqPwTeKgkAOIwvJRSx7ea0TU18fHqlmxTifO23UFjfqC3FKowiZ2I+dL+bHxEaH6y3FDsmhWNUt0duLuBXa5xpQ1PQxArQ8VHmTA0+1xAwqKSd9FqYbrIPHD4OoYMDfdCdbXAGzzk+nPhmmoGcLRnsHNt3kyxRV+2PaAWTLdFYcBHgu79B+nGvbiPVVDFBiaJrsEaQoKAqzX33iYF8DXpYmyzo9hKDbIArHe+ZLmx3n+IW1OtTwI3j/SXzvmefriYewizEWz4wmrV87XxtRmr1URN1DpPyaGNqZsDNZxQ9ezALfS5uhBkxr8n2gASfVmA1ilqmweUjVPv4mhHd4FsPOS5+nASFUx7Q7V6b4ufn7nKYLlYhf2+Z5oSTohVNJieHT1xhs4mQGOeTQw8bEvm7rT3LNBWXSmiiXdREHzoskvMJq97f0o7WlKRNn5+/fe0Kux0DePWtB/9damB4U8QxwH0LRGUP8Z0nbO5GxR9QK1fp2JmI97pAmlGF5p2lAo488XXA+YTdLtdw3e3qqx65kiSP2vUtnNoTIcXbEBS9hqetOpsR+A8FhVLL8mpgjjscGkU5pS8EJz3+nhfumHono8vAE29l0nycJjxRyh4rwd04YM1UpkWi19LSRf8urnFREP1RzlSFZFU2CW59/eBG/B4wycKaJZ3O2qJ4p/Bldoyrwo6BpkBddZVZ0BUFYjap+rb///6HrLuKi6731YETFAEJROpWSAoWsAQZGWkG6kRDqGRlBUSjoHBKQZGHrIIRXJoWPokG5QJBQEnnPwvu/f9//ieTM6fD579j77rL3Wtfbe67oUV6THw1O5+KJj+3J/4Ap+8ZVr0xj8/t4G+tGiSc9RY2Zee34G7LpSYTtMX9RufzF4aG2qW201Vk7DN4KlLlQxW/PHmBswgrh7V2lkvNePYHcQ/vTeLojOE1o6vuogZ5JTNisvtx1FndHBFn1kulS8qvdZTEIfa1rOIUxRYmxda5RarOvOGpHRCJBmZ5ft3Av2UBJdW9p2tHRHOQ+sT99Jc691Hl1nv02OETijuZ0BIDDATNmBUIJVRS44MQcbkLN/pXbz8baJdkd5HO+9lMkDVolBK2C1Bq5H8jLBkzBj0e595pBYjpnL/+uZTtWzuFT5LOSgRFUBYRhqUWXI2oUs/JngHuRW46h3Dmzz+XzRsBqjCeeKH//Flp2GbxrLp003lBs2+lpaTJw3I2bdyKAPRi4VVq8kw7k88UV6s00r6D2uCL6YfBvUg/91OeeaVOlxdVgsdS0T/JlhcpgXRODZegoXnu6Q1Uuu5ABCfiD4QQSuiHA5Z9zSyg2tLe0ScM4WdDe4RtOBf3oTyVB6fEYo6g4VY63yBNKrYWlZZF9j3pwscZWaqoyNzyu83NaBzu820+7NKUlW6NSVT52t1DJ/zJZKd4eDJ7f3eQjHjp6M36attYzO3b4Fepffd7Ian7yby8X11duZNid5lUoC6YvlQME+9bT2uJV6HSpo3P21FiQvO9jXvGzSS1Ve6m2+tfwLupzsf0DKzBBgt78qOjN1EiKHmqPXlwOr7DOG+u/zAMn/PB1UUucgf1cZDwAAVlMTrCRMdU6c6JHb0H9i4JpXV67msoKttl26euGCj5CXirHz+jKAdHCcdOiXX8ZBF52njEQJ6kda1IHhcNgqTSA17djsiViCSYDmaqX/AUOG7Haaj1hXgeaBrB4aGzTcqdj8pQAOfHcppVaipUjU5OmNujYfT3dsT0eC6oW9EJ3arwhBr6f08qzGqmj4prB8sn6ZsQDgS31E6t/ztCFdhqKWgU7n0aYdzzumm43vjn7T0UhOez3QepHGAyzd2wsU+gyOQFL9dwboeXLzNFkV8xhzXixZ6gVdoIcNnDx1Hu90bL09lv9KHPuuJ213XlHf82EwJ6FasBdI1R6ZGD4Vu+gPHENdLk3xLDF9Fo7HDTt8K8XEwGWP629m5HhZOI2WYlR6M55BpOVBwWbX2ke7F6P3vk7kpj/ROrXSv47os0k3G2Kp8gRSQmUkNkbCzJlarEDSCIYwgiWwq4CnSAs890vrMvurd/l//Tp4p5lBiNZkclhntPs9j5R1rChI62X7NPFUa6LSxePrhGiKqMPinAXtsOGUpo2jwLMD+864w1Iq93iP/oEoU8DvYAcIXZFDvs4b8hRdAALSJOtPg2mrWnkfjukVHpOrUSecU2CAAFvl6XPGnCjM9ce3UkVSR03BeeOZPHh4Q9+neuqcJWfsPTQ/glmKH/kboiG66Kw3w51da0QXJyiYq6IgKgBCtzA+cok42zFNPdUhz4Lo3AUVZdrHmpJzQfW3rnXwPpy2jFrMm8JsGAOg6u/ER1CiiH3P2qNTR3PWECJaKkfwtQkKbXYCEaYfAFFE9grAjDzV8E0GprypVmUQpaHB2bk/tDF2kgNAcRB6fac4gm5hWb1bzqjfWSUz7IT2wOxEu5cCnnju2B0E72g99Bf7j57yKRKlYZYaYURlnabMn7YnQxdeseQhDMbFWS9nHmRNzcc491Hn0bVrZLnlIg/HvkWlukFtWKrGFLJSkgRh2jRW2ZGp4ak5N1yHwAsxG4TeXhmDmJindnVukG6Q1xJV2AOzBbzVzxDbNxK46HWjWJAupxWerJrQw/uZTZWd7YITE9INfmIF6OLYxLqcq/Q7iKxTJMIu6AV9CP8PSnAIXSGPtAGyc6MYy7e9WrN+FF8ihwvsgakTUD9e4LQE9wtEbgJdRoAOMsz2TfjL/+ky4AN/Gmfy3oPHeXAOoTQsP/jEqCEfpsZ2i3FgabKpmvq7suB3RpLsy2gvCzp/Wc+qVgVyA5us2OHPCZpzqfhQURWtXxG4HcJKjbc4H+G7d6wIwMm1FGVbCwNsecnEyOXe3VqWuNyLE82Ly1qsmivjSgPqJywC8TpOP+uisFW3b+beIjS6fhV1+ID/jtZbAsAn3DAIJrJGSoSuPfQv1oXtbku/BWBp7KQ46+CPFiKarNz0padVKFz+Pm1qUD5/+QjRx/ykDC6HuAxwpwCacIp3gXzohQDk4w1AmJ03T/8zEEVwXdc1e0Ayddq6uK4mm5goqSOn8QBodLHX7+ICuPn0iDo721F9cC9JQYvwVeHewt94Cm40J7Am4z8HgIj036U8cfF5pkHLPwIgEFhxXGjFsPOrHyjGd0+C/hnyj+kCTe9a95LDPn70Xy82UQCEL6w6ckHZMtPxIhKQAA+btvawxKPz18V5Y86hKoAeBDdg2iWW+9Kf5PqOuAHwK2MjfGQ28ncVfViVKRTc11ejglQQA1mmN2wwzZC/vqfQ9t/Xe0HABEkGlkJ46ta96AxwFzZ3TmpnaEDJ2PF5BxnWmz74qm66ea27o8RdIMVn6BP2lhhsNBS2Qv/nwmAm6HUteoOujyel5TptgfOj3eA5alP0DeqCdcCNawAryyrPmKquyKKgG+YpWr//NfSjWO7Yt6H/sPYVcs/0voRu3h7QdS3P3cNDLA0o+XXhJXedzMi9ZotO7ouwfmz/0N+VF7+TOGh/ApoSQChMWVWFCQHyyJ4nrCkBnCn8DGOitODmmX+WpjAQRnkFrpD3k+FdYONpl54BedidwdI7bwAMrKnhi2T5JO6OMuqiU892AJIDyRfGp4RIExPXjXgnqvn46YTMPXztoJKTmXaD0Zu61DS1gPNemrcfjmK3bUi4ymIPQzKWnw9nNDlsIFrPvW/PDMVnMhSfaVNMlSnunJ/snhutgCQk50WaGQfpKo0bY68fp1IKw16xZmtG6Z7GGKzBAePt0gsmtfbzN392bNkS8HB1f3FzQN42PZylbiq2SVp7/mhRbg3k5UJHh/f9Dj4nI2/6WcAnqKEb2ilLojMHY2HGt4yVEVvclkWVq1L20Zxez4I93mOkSasgufOZubxRnqxfkgA1uc2Q1s2QpsyQ9oEh1PiUh1lSAmQy8WUJdm0vxG6UA6+T4euP1s2UrZ5vg2J+9JdoFP3snmZzhDpaKHVIT/AzrCs4RuY1jJI+PEiQJEJGSjIc37MMRy4NsHhHfwuvsa6M9mmFHhiHQwrfBVagnY+/owivPYBDOS5Kr1OS4q9CIKBe7GQIkwUkXExbjNPvlkVfhJhd7xtVv3U19ec9LB63deXxrV38I9VXXZo0X4kelczNBFoyHzqowog4KfGyDU8G62ELPDFoBGOMLZe9D3jRRHglgROvVUyH1LLkjajry2iiRwpCszsvcX6uW5eslnbaXqJwj75MJKWzaSm8nt+Yn5aZ2yCyaK1uv+52RxMldpB3esmiFawFurz0JYAXiZrYW5OmEquUfwLKqPOeLIv/uu/BI+uH0znf6u6/glowc1k32v+rxg6qSdqyzhD/y4ktda+HY9Pm1/2gQ4XSz5ROUXpOx7OXrzMHm7fb7ZlvHbCvcr/Zalg2bg/62EPGzpmvVCa7/Z77ueCzT5s0ZFe0WyyfQMzCaFtGq0i/BF6F3DCkmmTOjS9zr7fwW596gx1rUcdSpeN0HX6DIupg3bAxM9u3bjHfXrqWEGPtep5hOwLDGnGDztInfoFqxtyOG+ZX5fDX17ClgNHJGnMRFcc8DIDO7mjMHhyIrt33QJRU21r7Vy9PHaFZldnGb6aOMKIVMs2bz5hm8I3x6wIUEZo2X8pvplT/Mf1KPXbcXyJX2dZSYq2WaDbQdmL8tHGBje6VmAiBJ07H93uFsOOIU4zV20Dh1SHB6rJiER52bzhE1YJz+q94BHkbaX1r1/dbLg1zM7pzDJxqkq0xgLU2QQq3D/Wpj5boKxgoTDmaYIjRQ8IpyE/XWH6kOYoUZPOkjQ8XI48grQ//jbUQqnmnvRuqT2Uh1iupWDUJT290sZhl1bEsuKfRK+YXxSanoKEr7gdb3CZOzLmKzXMvetipYgdSMopGrPeAIjU4Gv24e/2gKO+coqgefCe0atI5vdhF1z+MS+i90OrQ+mJL9QQFNgZ5p1sOaV59IUpGG4/uLdhw1keMwqS0LN1E1aTxrNQub/GtHdx146VntRvzO2wv9hapoGHivOUFVzVllav+p7CjSYy86q+AYvQq4/pKvLtgEakM3LL6cfUPjw5U0x3iplTaPZzBdmP/aO2j9JiD7rrnvRhBudjHAlZvW2lia8T1XCnyReViU4bAurGhVNQRQRcN0Wgq7Uyjay+HL/63yHGcCP3TYhzBH/uI+n3HF0LSMLrRVMKO1rBJPcLA95f51Qcv9B/rxGzeu0E+kZauuNl0fURQFJPWH+f56hU1ni5J4EenBa/p5iRUfca1nXzIDuoMzLRtPsuo78XWyLqpvX9FqEXDTCncWmzH/AZpmLEgHkwRTNB1R+fdUt3Ml41MhH/BE8Lp76ULtjL+T2tEdiadYnIzb68aKdTI+vnGmWdw32WeecYZK63t2QkrSIwNS5l9jF8g3+uwKVU/MUGrLPOu9VrDDw/Kn7k829K0fPH8HrqQIo8la7Mmh9Km9YNeITeZJPhht2+noLmhBX5dKMdgKvb/JSll4iBoBzVrLVqhuzP1tkXVC9YW06WenRu0ppJNYpSzHVX5xbw8bDfgEEJmkcAfBiIPemwKs1SszLhu3YqlC+ad3TF/6P4s4i6zx21QV5F3rkR3rjOWnGNlOsz/CTWH3NaU3sceUOYZLZ1r1flBJCHwPGHpc/5afGOtkV1HYOajOq0gfp723q/UYvEV/eWTQekJv00aZ5OgwZ/UV1IfPuWVs3UKb4X/v+yuujLUYpUKQQxUgKUe5pZKPaYqV/7j36ZnuFvBt9Mvbkm92fj1Y0dq2E+q8kZ+kEJTHyQRvFA8eZSsqQ82JmB8ACoEs/ObP7BqmCy5o7/d1I99FWaCPebTw+Kx99P9FbNwNOenyH/5T/Uf74qWsBwx91BpTAD/7O5LFwizh7pOyk4F/06PuCVHHLlIu+zqUOhiy2Hf40dkxISvkAtN4eNa7XYzWZW/nCGcoDTI4DWw2E/7vEvuEnM2XE34RdWPhymLO3+ANEg1Cb6jYgqRrSY9EWZffm4tl7GYawlHHcvoOIwnx6RcRECf57cWtIRBUsN3t0FSw5PiXYe3oh2HC7OvXe/idUY+/oMYl8JD2hXsVec7tHNn0dK0XoVYTbcE1YAlZ04BH2YpPL3jMjMbik/oiz/xJj9UMvr2KaTw1i++xVmMcrNsYnINP9RZkU55itUIIleXLYeVbvObXMgT1cmkvRuEBfyglQvXNhm7DFPrD39EHAULoQzfYtETCpbdqstStIvQRplReV4/XFQLC2scnwZgcjAjrCASzQdKCERcv4cDrc+4PYcOZNRNHGUmFKcqpP81QVWzTo8O72oIo4NDHYopq7UpsDcUV7R05Bwhi1WOz5T4kegLCkjdzPAjcQMtOaK2LRK6Obsr/jrtxqAACf/8Y/1vLOR86THHwhTEMhQgHW55ah5KJ6ua4n5hZUHPuQgH/GL+Ny2ImoKqbQeEIrAv+Ba3DWDQUYo/ReEn+8T6acwywvFiiHZZDV8rAIFpUOQffS8mLNTR1D+eO+mWq/IwOp84CJkrKxOtVJB6Ecj182UJg91tV8SxSXZ+xeS79DSX7IcbZyjG9DcCqy2EfGGT4oTLCsfPf89rGQmTgRyagB/s4djdgH02IMfUGVBYqa8sjzDzXHkQH1M/UsquEIGj+GMPjMTxeWD85UvtqcMiVhbPWapE5LIWc7kItXx0f/xdPFZX0D0FReHTOBw/Oagz44s6h4WVXL6LTfVFD5VG/JpI3R3lREto8a4abVONycC1b2+EbONi1vLY3EFVp3vCK4KumvTgSkjT1KfHKKcREap3ANbQJP7krkwaXG0E1FjvO9okF+NiSgsjVDD3dWepK1BM03RJZRHu/TF5/XaPWMIFPWLFTZAeEXVuKXQN3rfde3rWhbnONPFe29K7GrKOR8lWK+vQxp1lCJpgqOH47ZqSiEtQqPqz6YUBJmMKRK07sA6OQr+RUdayL9j2+z/FzDWVl3YOaYTAoY0aFWVOcA3VtCfQDMOPrd6VDyLHQaLuN1rZeRj1CK7IXOMFy7bLLmD3J+/fia4CNlx8op+6u8uJ5lH3F6esvhw2aW30QH6vPjG+MHUn6kEfYSG2eyOjCX3/LmVicgBqyLK91GplAZp8lMwAdLcebmf2wOpVfXgR/+sx6ClXjOHvnZIxET+XGxOrqU0WqERI2KTyvqvGoRg5K0wnATFBc0FJh04TpCOLm10NejWTLonqxyNzTRy+UqxU5Heif1/kSCCnzzZ6bdqrN3GzV3ab1UdMMUvTSp6/ejSFc5ZO5vR1HB8S8vhoGXf/AXMwRZc5vk3HVMVJLJ8r4ndCo22RxzbgiCf7oycfU8F3lhH+NsxkUdOz1KGR+VBeHxj5nSjQszBLJx2mYplZxQQVCDQAh0Zq/yrgJyuDmBxRbviOtlWVnRTn4miTzOhXtjvc8bKqebIPmGsAJMnMZqU60U93v/tfynGQ0qekL/EZVR/gnRo3s4msW0vMYck4fYep/r5XTqZ9lonBFZ9vXLUACS/d7gAjN48F0YUD/vV2vNyJADNQEsSUAN+sYe6LkUR4TH34wS9Uu22Nv/CK4TE/25VL4WKUnlcuarmZ4/gvGmPBxtjUvaYgAVdd027Lm9bA2wSVqkackOjJ3PSI3zpnB9x/HGedVkc4XcNHLsjqyVZGFhH+HhRf72Nswsfk3v/L0Y0N4JtlHBTUj7FsVe/5VSeuiI5KT024hK4g88u2ZdX/5qatj6Wo0q4OGXzi7Wa3TZovyAW1pzIck7u0vj7peg1CY0hHk9OsptE+ekrKTWVI9WF94kkgrulPkgVjk3cp3WbMocGudBIcRd6isB0YQ8VN1JL6Qax6QcXirNnCz6PqWvs/ji2Pt/0kW7KLiu+uQNOeUQJO+LSo52gv9ymKwKpvfSo+E3gM6tDBJ6FBdHDIygUFvtyb6ItADLVoxNb3fKXajXr5t7mJUQTO5MQ+nHaPWL89x5Z3xehWvx1xo8Glf0rieeOKXT8qKUcFqljdk1YHveWOBtsy6BFk54DHvTPRot7jD0CUwwkqkSX68nDF3uc9GBf76vcxk4TMgz9ieZHmkaBMGwCuVp5ruQHh3fNGHPvdFq/XT5QB+2kL5xnA0RX+0xwdrogDmgvGxFywjcfygXpGVqVt5kCud0pkqqaRJkIAVXHkQDGI42JfJ3jYxBs8ykbcaR63dnmATIfg9KZ2K+R2BusNC5lfIQ7np7v16kt6mMHrb1fYolTbeuBFTRBjE5MgudVYkAcptl4QK3MlomFOpZJRveO7IjCadz44Pd+9CjnHaXFL9/ep00y0aScjpjc/h8vbl8aAPItpH2jAi8NZVCBhdxq6P/8edWhmxOJp21g2UVjDHPc+8jJNl7GajHWkLVgRxyzyUyDvzOuuIIxylqMyv1GWh13fDWLgVsSFRRFSgPcA93aC5Vxf5uQ9FNzz9yxQuV6mAAyjuNygqPFk4r7IL3o0LKtjffPGOyDmG6pRVI9R3bwpHiTtt35ka+HoVoLiERCXgCEkYAmSsfUS2M6rUQ2vN7WSZe7FTrO6Fi+3La6qEetempj/oOqzzOfMcxwURqNFWX1QG+JoodAhnetmNK6XUAJ4PAlEFeSWllZ1rXIy0Viu/czuy2b3CO12Cg/yCiEd8WOLFT/XqTnSzcFtvuRkylqE6bGO+wML7zlsTuEG9wPCtTddVGE2EBpm4YgfBud2Cmj1CPvwXGNjbhn8cJATeQ4ac3A3XqzmNSHWenurf6X2FKQ1voRZme72uiMxlkk49QGIYq9H7nVD8uwOcq/hC5lD7T8QXl76/QgFqlIBOUnqTZcGKU4Ip6YXc5D5YcW09fZ5f/uf6IxP5NRXwdoG7xvMB9xPrZVzaAAwpSSEzOIzB8HApS9JmiAzfVL8FVC+zj7hpkWr+lMSS1garv2MK7z+PFKvZSkzmHfVZF+cgVeYbAqwu8uA31n4pmBP81fvWQyEYzv8bJv0IJzQOWXHXLfqk6Sms+t+Lby6ikd+we+ci9CgBJLfNKaxBibxu5+/r+lpydujFqt2egRLxRJwQOx1/2iUTTgCzIby3NMm3rsVczGvR9tPt8LrT4j1+5YK3gqs7lddZaEtcLKy8WIZ/KHFBeRT/R387HeUti/jIQTz8udf2ScE6Wygr9A0pno9rK7ttlBThNmO9p1uxUyd7IztPTgh9nKDnjJ9bjm835jBMlSQ5BOJe6tH4fZ9zWhvTUtV3hUhr9/6hXnXMz3vCjowM0nVtkpP/KhC1nFX3Fw/fpWaIs33Bjsn4ZQh0dUurTC3v2Z6CPe7BS9bM0KvxRdLbDy3Ig8S3uAjZvHhO+N9DmPxlCQytsHpnRwCK2bHieZksBaGR5MWdufe3/pB1mzNZ9kWuc8obg+sGQ2txR9JScTWH5t+euQFkqvCmAxB8pMeighTKTG9y5bXOOeDW/AQTegXFxTRwiBF9DXLAM4o/ipEx+erUQEfGCg9veOReRLgDg8q4alWQlSYjNiU2x8U/Rkf/WWMPPUuJ/0VxJCLmW8UA6+3GyR38aZIYu6mgae5xsrlC3DnLZ0BgLuPfhH3w4Fc1f3IdgO3clYUzn6JHu0/V8V4JTLDtK9xHbE5Uudm5mtloq6xoqUlZ3+BDzX+cX4TV0BOEPu99/zm16yq6oHQRyoNosNo5m48dk5JKuYDh6fGIytOpPQ8Dmd4ibO96LKCcPe164pgSoBRTi5aB4dgcMw1CrjOX208vejJGSAbIZXmiOOjxaYqO0kbjNdUlJ0YPql51jvqKqCuzS0mn/+zp03F2kT71CUIZqcPQMTv6b+KZbsWBrIYBmtNTWvqk1D5RBkKAqUjLyM/Fsq8qRCT4sjv5Cf+nApfr6oP9EvRZO8U5nnwIsVCm8d7PDNyWqvDbiZFEcRmYoKKMIKJ9in6IghE2S2fOdgcJjCiv/2rv++PXoY/yjDooSgc+uql47M5rAbaWwxC0bWilToUomLWMOqX9F4sITBG5t0T/Pc/PK4Vzsalvudd/bRksP29f/YPVcb94KoQOM8kY9JEyHYbiA1dwOtYTbIoMM8oZn6pwqcEA0CeTFhlHggOVV5XEyykokxl1x1H4wtPj/XpRQ7oMcf5w17czGmEPGevAOCN5G57oJi12PZsqFxCKTZlw6tYhsVd1cp9aSBncMIuCAT8wYquumL1lB3NtiSvPVZoT13ZKqSCFFdbxIUpqzxXlp9YR1r9pSY0edqXiu3rNPbjvhHlBrZMi5ERk4ye/bn1c4xEVQna6TF+HLkq1fREleLaa5qRGoH0SQ2xjxGvqZfd5NeiUk/d1bm5EnZbyBLeC3neqKhSmNv1Of6VlI8Ng6o04hz/xNulN9da7XZq51EFiKy28KPLG2vVoyW+3F7V0osTFO793cwGV7WCL0HhQzzn4eTFZ3Ft3c33a4zjX52hVH5P0HnuDKc+FOKlFNV3vb+o4Bc2bHT8kwlmQsVan9GeJdYOTuG5tu/eLobh+PGgFEEQQSiJ10+9HcbZTuOzerreqsk6AN2cnR2ovO4ibk8lTNlub0rIfcR/965rb0FHWBPlra8soBzHJ044Vpy2rzNT9jiIRAGYhjwSiXgx7ZkGQzn/M1Txb/203bnCpxcE+HNBgZaAeavqCHcK4c2o9yoQxapq51o6EF5oq9OS5jB0CiEZ6kwDRcxfqpUynzW+35qiL9zgGGSKbBM8sgwvcvitT3u0Y2wum7hI/RK+04aIjXBoDHRduhcggly4fSF67hjNqNB+SZGWUAYOk0oUnt3Rw3k3TteKvrxQ005Nr/pN3HS/e4nQoe93XnGBk51NKtEyvoNqbk2OW8N677mINxySR8snqDBEn83iVFOzvxK3Aj1tZBkoKPZYtrZocuexkDQ26b8JytKgx8Zr+KkhvNJBrm8BqJl1gVPcsrSuLAJ+i4pP0LrB2M6KZtezbEzk9KOW5Ue4Gn+x8JK103TV3P3u28ROfYGUcrRTPoTL+E4BxyM1ZmbmoCyvQc0DK4OMhziiF8KuupFFmhGskTXiSb+DRcwR5zvGvZWTkekRLv2z9zb1YwZp21N/1mwKVZGvtOUkhGiWli4ONhwTtnSCi+uWUksq+lMQj7mumnLpc/ulU9IeDz5euR0IMl2d73AvLptU2kNwoVlPOyrdxX9jbqRP7wEbFaGWYHUtyEOUtmZhkRFbHqioJtAGoE0uasNpbdX+D7ZFhz876Hzn85otdCLdk3VnIB14yLBug22em0Jx8ug8tHv9O1ZTk1zBhOKWPOj5WPTzTal6mmeUhPV1+my/lMrUw/2yrZbHQKb6Iiyq90ifwnPN+Ecsaz+zpdiqKQFuRE7nQY588CYm/6r/dXKr8jKOsLE6IcVEzWcU5YV8krtF0wunxBSzo8O9mNRdB1zTiT2nQ9/B6uhzTlf0b2nXmKlfC9uOZkpQZBbPX83VvS0czAWHLlgLCzSOiFm92QXuae7LAhjJ4m5vyaRjut/vTw3o7hpznr7A4vEs4erH94YIO4H23ObDFKXu1/K2XCGT9z2E8obNrSiBVyl6l0yGb8YgQTtlq4JrLhTBRZ0TY9Qnuc8JiTFsVa8wfR3dQaNJGeBohv2/MWjcskRokpziIgxooUS9N95lIvaO86Qagwq6MeVD2g5VlFJ2P2/5yibSPE6BP6MtLxbGy9Y9+WIYl6QJfCsAFZczegvyI6g+Mnezh4c2SJrj5H43ab8TdvU82Sj0GLc2bbrFY6oh9Mt1x/j1+XUbOfvNsM8vzb8va+3L2h8vVJEy/XKFHN8PWlEQAtUbddw/OX9fno4TLLx1qE/rOV/Tye8okwK3gTBXVcllfM39MghuoYIUM9JlK1qVckS9MQ8DhIB1ZKWS9QWw4SIc24l9hPgPQ0upltcu0DQu6JahoSiRCYBuZyWM3EOIxN0XypVSFv68Hoa0FjyIpKJh2eQPWdx2VMFpioYA4cHnQdz8jx9xP4mlPWbnm2UPqGv3s7pbmiK6BHQLo6+63QEFJ8/DT+1iBfjQT0K3rSict5nDDmji9i2OZ/xEMm91WuZNNHNIFNKTunnePhD5eTvmc5f0/c+6SpWg5uf4dSbEs8JoaVZTQhlPSxudptH1yIPDnXOZhFq/rJnCl1JsNEw48Lu2st7i/hHJZmZ1PqPdsSNjpbe4YsrfGe/weSDzMbA7ZHKc6jibtu17+0/6ogb3+8aFKGzF58bvOge/J1Iof5DrM+Qf6NWLUw5HjAvPXHdTixNBZomYD9NGRVy6N4NntdlkcFDqaLpg+eyWy2wkuICHwlWjtX3SI8of7hIn8nmvteh9O3ao24x8nBdzTErx6WXYmlcX1RT1CKJp3UCtEjepRWFCG391Q3mO5T2/65ieVOmSWTjy5HE2n7kuZ1qobRF2t4JvdA1Me0jMuJz3igL5NHwtWGAm/24GWjC/3b/WXyntt0my/ZUKE8H3aef5IFV5YULfNSGdq78mknTXrXoQEZ6rLSnQsGM+tiuBwckice/FyNllAcuNOridF5ysKTwwILtF85L6riVVv2cZjYT+tLmG207b16Kb3yuEddbVYlgDo1/2BToZCFYfUEzGyFtviwa9HKSlTZn1KhKPbxAjbyStbwBCy+JvYgp/yTw+wWGLQhuwd4TuujuyE03RlBoWRmJei/6ELpUHngVZ/5qjO/VDdYiKoYQwngLaQscNXIETsXwB3J92n89vforITD7N0Qs8mkjUXXXarUsKLP584IemYMgRRnvV1SMsxcitSFPQXvb419GpH9Ahxmk3up9ctByRdEX8bCxGVfdX68V6dqJZEQSGfYGmB/b22ZyVZC8eI7Og5pqUUe6eQ0/XtEZktzbCjdhdw1bF9UZkiXq35jh8T3qrrzEVprsvlrmx9ukehGGrR9d3TBVKpFkNCWmrR8tJP8dxqneNtpT0uekYCShOGABtP96gDHoxiZGomUWRSa1QMCFwDia6BPp9gf1XeW5SHq6+fnyjOmTHbG95ELJo1YDCJywmZ/c5oxbL3XChMKgfsy5P3ywxEIISN+53TMBmjEcYOUtZF7MGFPqtNspQ2xUyiUv0ZXKPdCqc11L9qeo+oGW36X3E/5fMGS3jOvb95KZrxOMom1hRw3XxR6w6l/0TOyGNV0aduwIfZcE5SBUl54yNpILkYh8J77kpos8eUcSmDLNFHdjFcSP3V8VinHIGkhmWhWz23IJdlztFXV/mXdOx0t72S2zDa5RJ5MIIdt5MDWfkj7wL5er/CFjg3rKWcULrOx5XwIwirse+S7qXptSkkCk1dJ3BVWImE83j+vLFVlV+Gaqxv6VB+rUvo0NJRyq8zjWAV8PXjKUuSjFJU58KwxHeIYdPbXf9QnvprPMncYtXnYyV2RLU7MTagHzV2szkC6LMEX4DDpUcBnc81h6ymalagad0DLSkb3mRsbwaYwpSPOpM4UhxLQq5Hds89pu9Zah+oM8QHjO0ewDHoFiaaIxZDkiixxjHi0TzumpSAQN+lKSpSMWxj0yX3CRtH6aHEDIHv2j39NPWw60BnXYiysr2PFVf911q+f/pdS2KKzfGDHxQXldE2acmLb2EOWuzokHxFzfi1mmoV4ywF88JMyFbAeaJSJyC/m/rpQSvIDFt0tYbiaFLA8zJXhnAwJN8Ou7H3KVZf0JuGjW39e4SesjgfKLk1dWdzHMmberqMkYzftUqjoY3O8+/k+ev2bl8HYMJ3+90jy+VljUNkwleEoaabrpdI2yiCJSrVivrcKp+fAlT6hinHPl5vQW/bnxShzJgx3RoWetWnhZNggnn9Mhy6S2hcR8rU/nTS7ifH7PQnOb8omUrfMb+yxMLvBKLKMFB1OeHquEkOvMz72qOfrgZLaQqLyichhD66t0z4e/w+FSCYrw8pv3FaMnyDCVZ9DnCpd5AZi93tMUSI7qvkX78fW37/WmUrDHFmGQ2WeH3h8qW7meCRk103qKUs0iTEZOsmjgWmHZN4lOdaCqxZNp7FxIEaveXWMT2NTQoiL3rgrVeD95NpspvctbWF/qtz0p4FGn4jo3EXuIXHrvATTYNDd8EcGt8XeuW7ZHbMjNGLG5vPISp9MmOWEJVTD1a7gU+4IwiEz+9yhlQMg2/WfjxD1d4oO81LjNXmUdJ8GOZwtv/cU9iMZQYhhhlLtd+TLyvqhXwVpQxdvPRyPqw46nSzkbpg8BCLGq0H6I/5DlNI4h5mO8G3Urhsi0dmlKEpKEKY8UZh18utVQMYHKGCopi6XwKrpIb7b2KsvGhiH3M2SitGar9JZ0V3bP7RshoZsVdXiYLnilo+s8UJLCru8Lxlst3ngFWAlgvGdsutQzggysFA4DGp24aZkDjwHKgsdPusafC7RWjcRNg+vReyicqHdgU4/oaUPutFnaAQQPL+MK2EbxdvtfBR38fA/ROoPnfD7A+hRK1pCoXqmhItfgQNJOR54oFECPIegrqHiSf8irLqf5ZDFg1cl2LhzqXj7C4RzRy3XoevVof7M/+LVR+p+6Oj9Kd0N3mieeXLa/Wz4qw8jnP69fkp7VedaN81yqNk3aTx/QYTSvUuds/iU4pSEwOULrq+5nh+ASPFfr82TRgVFMTe43Yc4u9y65OQ8+84KqcOANHqO1mb4ribOqHrpqWquwFid94lLE86g+PE/zDZNitcpj4jF6pRY9x62JqHgjynympwEuVzitk5hjzzdZO3irHA0HtxX5WNbGMAP/KwWfD3sqU41PVZJwdnvF0T+PtRwQ0GMp8kVOzy7/u1/xoG/bLTDdTxBjY2J+X7x2hFvsnG8Z5HPjTmA9SCQ2twh7zWCVtFtSoHi0jW3+quytqlEvTYDgiOuTeM/Vy+ClJU3O4ya3Y5VCpRam/YFCUI+7d/2wbqf3DP7HtZrPMaGdn7qNEuCIFh5Hen3jFl+y/zcV/ovZLv33jdHVFjEBYnW2y9kcdhf+UKThaxCBPFtyl56OB9c6pE6zdkE7vE2jafI3dDibqBuUSBBLQtW2W4FClO7lw9wP+Hy2Z8C6zjCzQwft6U2YF+vU+OZjOgBZ6SdVbBs6JqEUESVjPD2HKVKrzG5Wd2DFPtVzXjTzWjVyp89dip5c1duieFkrMWdAcdpFVeeq7n06whp1HGmYPOpQchMELPJiqPIFcGbydqa1I8NwxwqhfawzHzJOmDL1Cbhxbb3RYsf2BACEx5/c0jpOjcohEQKUTddBPhrk3cNmutuW+oDP6s/S9R7Y8MU8u5FgIaVzhj74CoGQ6Xi8QlkAhmDPAaINf7eXznn/TiypWRmCROQ5SdPOkglfnnL7ifVfae+oRTJkaMPaygcieRw9oU7FgaiMxKqlEvaJFJnfzNKbj5vsf+9fJA2Pq3x/kMLU89K9ow+tUck/LUNb71rJn9UyqZelT0QezyxVhmw7Ldp84TANQ9fnI2LBCfX5XmO8YFzWo32SWbv8MIYOpUF6ASfnmX7W0mlmAhjaaaIVq/2Ks2GHeIm7YPG8DwiTMQEgFuiFv/utV6/0XjDNZ8mH6NQa0+jWREdddRXCC1PnR7mF1cse/+e/18AwTklxn9hQaVqMk10k4109yImloPJnb8vMTRTR9ry1jtOBXV6gfiFSLC8DarBbjcN33CWxWjZTqpSeKdAPnbLdpXicTfRucGtwPlNV4aWX/OL8NstdPgbkzIGIT8S6cc6gPUyYLANdQju3H4mS34pCaYtudvZWLgLPgX9FSEtdYU0ti9wYmdvs2YI7h/a8KylBr/S16h549ZGwk5tfh0IbtuvxGXid2LnZdwBzbizGfPOwdbi6W+zuQ/TO3QsJ7YUj5/Afh06z2zbACyTcVvI533YD2P2nfA9mvgt6ISVINgBa1mzUO/zz/svF+fL/NYiZzqbvgOKFz9VISaWim1PEiAS+Anrn8hF6ZvXzR4FtErRP4Rz9J94T1qSMbMIobzFWUcln1SReavkD6bI8ffUJCSIrcsNYzpipP4wVg27puqW7luzLUV2D4RZ6dZGxHNO+vloxJj90NzGUuaOQlo+e5AYf4pb0OTGn5k1sjdfxM5EFYqtsNRbkd19HhCZwVC3V/FPHpYNTeNzE54u39X7ax2tz+Hu1vAeAigHEThUNP1ddaDocey5jNz2v18Jtr0kS5Rw1VroH/X1PTY99z61CS+vJdEOJrqv0h3a/cZDdkWbmECICtTSHbfjFrb0A5UkU5INUqJ/0W5U95W5FCDOMebbk0wHo6Twn0LtUWF0gbG043OaF08qe3/TrTFNXg+XMum4DhVWOV8LBJmGHrWhaRFvfOlYMCKQ5j5ajAW9ZAHvNNDS3t598tjSh7sz7rY0OoZfCGi+jdzzW7WMyPipvfLUouuzrwOwCpmyJtQaMwmYXWO2FklrC5Jph/SD4Z08wn43Zjt/3ZHiuMHOK3bJN4WfjhpCjCyvtob9vvT9w6Tu0vteiYXNZiIDX/k/oJBaaZ8cl9IGt4/J0if/e7TCYnng+LpwBZbwrfqZAkgf3amFthy8lWBM77CN2giPc5Bd5FC4oV0/N4w1ElSi/4vJhFGn+Mh9xuADDM+68Sio6LEUhxvf2VcUIn7dfpjeUKu5/dTzXKgYaZqoYjUSLUQZOvjaSDlSclxrc1ux+8ZBapApozjQXYDBUcdz8uHKYIOtsflUD82XTrQH3ZXG5vuzcjMWlhT2LbpF3lf7jC6heYyAD8Wja6GXq7kEzD0Am/DtllmJEFkqwCMO5LiuYgbblK9Q+3DuxsaiEPZ2n9k0btQaBlgl/gIdm3Ycxx3srNxlbSqQ/MA8YqC3jkbTEpC172T64vpH5YCMmU4ldb/AHgP84w+A7fBhe5LvlvfbruQ2qD8zKKG6tGXjK+zwydMqm9P2bdvK61DxKklu+oP6iSeb8WEZEp5Zr2HWzrCy9pYsbs+BzoXP0zkaL722nXFO36VmR16ErkSFTN99mnL9lZ6abWL3epibpq0kVFjAW9h2OD6QjvrG5FpT0f4Ksn+Z7DHPSD+qD+Y+HeH/tIoVdHFT1ddNfhfTP7lCw/wpmrdeWzrrC5B3wQA3VXy0HdVUghfCeTFTYiRoEjrR9xiNvZFPFle1P0i/j8nLb2+CMW6/lwmaJauyaEr4z/Fs4tOT/H0UVmBsCNtXXSsu4BhTwOEp4NI6xPEQUJ7oT1I+7NrJtNqFSpF/RMumM1X5dz0FDn+cYt2e1e74Zot8I0vuNBOsOUFS/7BuEkOBadk9ftfm9MvdsS32I2fO6S+oqRX+bzmUu2JdjjCrHSU7um+E8tqXDPU0uTXgThVOHPoFgYcrZyqdTAMdBO2f1AI2TUWhFPRMdjbEb/wDhjh8RPgADm7bKW4+9JAvM+W0c1tBBON/GeoyBn9sPKpzQkPN8Hkpbs/lYaewpNuEEadW+XoEpMsHTj+yuxKsgtBDFTHNXxg/Jvscj6d+4qX3LhPEY6Nq891g/Op+rP+iH8w5i12PFZ1tAdWyAyRn03vDWP3thbtrmaPGsSuz5ympn+7L2Kq65tSfIPrPP40vqOefX6NGGK9vd0h+MS6VvBEjefD/9Tjr5ji17X6nnasbFx0gWP4LGEUWK/Ss+41zBAJ8bZBLzrxPXGWOyIJQTTfOfRh5f6oH7ZGfeDrfPgg6zlYEkRbmmogCet4HuPW1HJQwkBsAqq7vVaRz9T3DQbn3edb5IV7OjxCweiVKvjnUeyiTcYQv+lVfAU6nJDtWtzfcmDu//ea5V/8bfO+S+vQrVqIM+foupPu0TGPaMMXyZYRch8Xm7uLWcSI/pkEa2HUEW3z0DPNSSnpRq14UZelhe1BMbgp7Zf9CrlC8NVOTtIlQdJnwambcDCKGZ54sq/leFun1mE1A/fjUZvGBk3SeSBd4kLQoe45VkeAHh9Dv/r45DV+ih9JNw3ba55YvkyS6687GHwf7wy9TRuBBsljOTQlMuFhQibv9QKI8aF07GYMuW8nmus8LRdhlHZLuYiVwFnHstRk698Is1+Mln3u4eRwF+esaWA7DDGKvxpaOPLncCsmTBQgpec1+PJP0Qr2rPHAShVPw8OtIxs1X8xXv1rgCRIJg/+jK0cLGXBsQiop8OWgTlzYlycwR99EEB41Tpja9fjedyjQcXitzEfJeaMw69afzMZL2oMqlCZi86fj74m/G+ZM9CvcFqdlBszqXBaYTcC+dB1GBOfouqt8Qik0BqrCkD1XvfOsWiysqOqYPDWx/cbM/k6keekMOKsoPAfTUiVCnLo8FEtqs7He0UmTwSp5TBMAOneHwWLSiaXQomT+yJGR2y2xVLTjtufyCZ2CKfCKNPIpsRZf0wWaA4WWLgf7K2BJX6aSABJ9CT4KKiDBFoZICkV2NBBEmh4BjRkvXrR8MQFQq3JGEG4vcai72RGsHEmzxiR5EZd4hQNvH1HmtQLJq1n7zRXHdPriNorRjD2OAyljl3Ugj1OhN/WyPIecWGfbGHrYbJSlixLccDxQNTPR4WAyd3HM0hTNrhykJlu8xgVK8NzoPlyoOvnjHx6O98PwGatHaRS3Y8ZZCOCi7j/I0XaAUmRTGjEdBE8dpfXiFJ1Ar1SYTpmVveD1VzX8qYlBrqGZzps5V48XGM5mg5Xra7adT5cS7kjdJtfsSUbPnhx33mmY2mwoI5L/xkTNzN7/2svN2hurqZLPU+l8JCN5CMZO0ZPDAewCAYnK0Z2pZrHGeuYphiHRCbOXZWNoifHVW3vlOawQRR7p3/NB9i9OafmmctdGX2lH1+bOd+scUfbj7cglLa4YGQyWNRq44hxrsirQiTiHg7zIGHcBBI6ppGG1bhzxAZn+kuJ9Zr46I/JQbO8xVpOT/Y5NRI0PXnfexXVnH38Xz+1B58xU/9HaGR8YCMSWOj7lCHsPAShnSohxCTwhHzDNAY1aokOVqkOMtkYooV5N50k6ciE+mZWCDP1wTDKfMyburOZw2LGeOfu6r4ps6qAs/l1Sa8uf9I0bj74qVOfyClZwsNLo3SwgjhxS5/KOo6WJ5vThMlVl10S1+vvkuu/IAHrR1iqEIpZTp9YhgvKcqOhKEtsG2B4CEsY+cNzXIRxKMcwr5GPwAToJUfbv07k7qo2+IU7kRlHuYMMuBeFR1Xd0hPZdMNF8CqGhI/UF6UhSunnG6MDyskn94ZTwAL3exWHtH38fppZllhn6X9Lp0qtYOR3hstdOa4KGMEQo1KqgVGv3S3qW/df2D6xenbY/CPLpLaoN6hCeS4mv5Of7r8iTzsgB1l1+4RI6FTuwFp5mV/4p4dnuGee/I1pXMMYSn67wnmuuBNSyVpy/Tzi/x5yMZc9T3N90XQdhc0rEowG/DnIMffZfBRjZpaQovq7o7mOGyNQ2VMUAfYZkb+JkBUHC6liJ+tZfkzmalZVIhII+AVc90LeXNDzoS8+UULJQrwTMBGDO8iaua1rl9GnTOfKsbufryIBMGfcqowMvZl+pqSrvWPlwYEsb1zF1H/oVVhvd19eXShJjbWW5n43+nvHopK6llLYLns+KVME6LmT31Q7iAA6YWkHVochzapVBv98NV3PuiiSDcrgv/EoT3P+q2lEZlQd5hZi9mlE/l2VhOQAIIx4MPdBhxMD/Unv/Ftl57U9xDF1O79L2EgLE2/2TtkJ+rQ64Gb66Ua7B1RSzwOIXYiqLmePdXFSJ8bjGY3/fauBUf65hSjPoNMu6pKHIx8DbjKebmSs5RDImB+3dRhcuGDoV/08J9n4pwXhYP3URcnwGPD6nZzyCiHJGsb3BBob45NVvZXmY9anyz6D3ADszXVC4fqmdSWvbRHzXMM195Ve1HQZZ6T8n1EkCBO3yCYoe1O05Iog735KUrVCgPwHuM/YISISVSD4oCqFWfuUhvvaXsI53KEcrFW6SgtVGsgsjQ6lgqJvGSOYnJECDYgyJAcJhz1Pck3DKqUB63Zo0lWU88Av9APX6ef4TSMNpQ35gqXuOXMBmMyZpMa6BTC/G8VPONQz4xFCO8wYYcsCTeCPoYVRfl0R+AWzJokb04QFVSIuiRu0VOT6WA6Qboi1ql+TzOKVVVYwTjpQzY+1pAgLuaQj4/vFNqMF2VQntK9x9MRseOqHGF1FCZzHfrQEdPkq8SqYOcANWcaNACBhTDgNW3h/FZsnUfxcwPkss/R9LomfULAj9i2NsKTB8YAu/GWek02yzW7zBAme5cmjY7GKIaraDJdnhhFhXgV86rnyK+cQcQF2TSUbIiMvHwJUrKJGw6dPAbRdrW0OGRvcnt5EWrYEjpV5qna+C0kfjyqDM5t3Lv1bOtTgsaHl8VH0VOvShbMn132SWWVmJqZSzPpPxJACIgaD7IyKq1NLAfxvyV9pGiwhjQ36aoHTyM91ozhX7VVx+4Di6YJxb/XmK08+9vxg0M1x9PEPm7T/4jPQ4fL8t6YKaeZHm4UjDpO4w7fuY9fWRXPtxgbIxl3FpinJZuy6ZjVeawwABBfWu+BqoF20Hz6CbTyMdZGxhXkOe9JuMJsSngxyLBrgsHgAtn8RcljQPH09Zel4bPIYTBV+lP7APjod5LixQjWPlTE9KPo5o3p6b/FnvZCXat8Ln4Xhrspqyr72VyRZ4CFJj9hMayCvhqEZft07kdM31tr3C9PaGWiIW8Yn77ZbnA6lvICGX+15OE9isVRi5CscEBqHtBbs0rvOHKTjo5LXYvvzG1ePJ5VS0vv3vKtu+PcuyFAnvqyavSmVbiMCL54DQzpifHUV8oIKsxpjUkjxaec535eQzAQ/7WcneNamTd7qTccMeiSiqxuvlT7J07SEOASSrjHkcQwW1O+o3/8SomIqIYyHb6o6Ic3cGJIpfnzr4RJlv2fZ8e7b1WeP/MUOFxR1aC9ZOzQpq0825DWLU1aRTtkyD9CrTKZ+mAxRcQAbO6jieG5JRIlUktZXSqYHCX3a0Rv8aMFThAv6PPFxlyZeyHuXPC4bPn9uRztlQLjdORM68c+Jn4VkrM38mtZTYXOEEEb15eJvYp3Xbd/tKbtWxk2mppw8TC5N9IWp+udyOytOtXhMUgzQ3+qiyM9xMJOZggnjdUqPCnCrc0xQBO10GtQVFQOpjz7hOKGddiVj3HYv50lNlJr+SMtH+HHjgU8Zty0ntyDzkfPypO2LyKCnUwfPDcfjKfDwbVRzjQwvlxjFLVMXBb7Y74jhHKMIelFXg3Z+VYj+U9RtdzTEChd3E0OSvFi7X4WTzZDNoYOj/CvPvbEBF2c3EZceITSfUZYrI4r6MsCjm9M/qz/dH1Py2cj5aV9+fdgGaZZJLG26Vuv8Cg6NHwo7/pHre1dbmSdrkdWMofjs8b43E1P4OGAMzG+I7rHJIrN4zccUuumvmEnMfdkg1O0fu2HWOvB09e0xyudkK0zWW57LlN+UuTmVUFw/bPJkzyOWB7mh25recbkJfJej9Dftog6weVk8wh63KkeEvrf9zE6Ofw78QlTxMcoV+AUh8BdcZVoQcBFjDfPHLNWUckAyZ6Yqa9aax8uwecknU4EXuVHTmb4bYrDAQ3QaM/yd3GDwPOKxP6kMZ6Oguqm2Y7pfOdvubAKPNxr4lUM70u+yWx0Ir45XoO6TsWqb7P3ygrAOuUsYojVXlP9NnLuYcKLn9JlCROBpW6CZffvXJ1XaOL/RlVxvmzh2gkqxvzbFKye0xdvu7PfO5EqQd0yxipOEMPO+kVvj3QW8QxdEJPNgZ6b8EBFZBLA+MJsxL1sHsL8G4iGFsSdFPZt7GmxHdPFilAmkUxBm3vpfr4ItrHZHjKXmSMACLAbay4/zWJWkam+ZLQ0w2hC0eNW90295nGTBbKZtmDBt7WCCQAjP/fGCQ22Zq3FyGeIf2RSQQzpndfkFvaYfKZhUJ7y+frSwaBjDXx/h/hPZZbvlXi3pX/H7cqew1L6uOGQKD1HJbY90uMxTxbphfKBTx+3oZdghh98V95HxihWrtrehXl+1e51F8im2+s2tk1iHKFRv1ARBZ1XXHfzJVMLdr1wbHQYP+ikG6bXphRQJINzyFMLFvwOD7A1Lt7oVuk8DM6XmuTfcm1K8Twbq8Gf/ZJl4FW6cbEWwHmta6n9r+d9NEYgPs3Djj/Hrt9Hcz45/SObQYpSnf8rUMjhuul3rnh1/Cudp0Cb1P2xXajQs6kSbvBVZjRXR8HVigZn4IGHvwxYAr9RhIfDW7frPHAucCx8RfGmAFZNuFglMuqk8lKg4PD0cx4He+F7BT7FJjy4xMn+cDFekLgCLSXhyP2qujxGNyqpYnA0JysJy5z6+h2qsRWpdHWgbnkGkvuxrVKhEtfeP6qGlZBM53wutxgpp+NqBRZ0rWganpWEfR//kdhlk7Xd7fpcjpr9p0z48k7LVi6GcRdVK+f6kf/NhS3vqK6Y2kuWQWXUlZZLxxjaLk31exyLFWMxSnijD5ljQaZEz/ZHn6b5ka7mQm8KojYIo4A0PdKv6SaS5FACfyHA3jaGQRorQomuWVDnp/ZMsMQRZxEhUaeVblouLvxqN1VDb4z1E3hM4VgC/KZWWuuUtt3oB4ClYm9kFDnRkf0+k6O44MZ4dhc6R/DNzJr5wSCNfBdTW5yeCzUm1LUGKb1/+NSOxd/vPmZT99p6Wkhc6NKhSyFh/U0Mejyn/Fab+VOV0qN64id5LhU93H+BSUYyZppLLxJafNzaW6VOPQ1y+xbbedivaK8nolDRfy+ZSnI9GTpmdHu/9zLUocbO3LMt/dd5rcoOJs+5gtUXJ6lssNtBBG5rlS7PSI82acJkzgb8hl9/5kVVG0/4cq9JyCxrrXieepEWwFYiFTEbp/95J8LsVNH2uvm70S+2w/RDSmJkzVJA/VJ6UML8Rp+S0zWm5bEvkF38jF+2a5phw8K47MeGybyZ641eFEs+hHW9Dn68nFMVSrauY5ftRC0auDUusGAJPm5ISWoUh3nXiVNqww8dWDpdStY+hj27JlSJKruGjhzDHHw5+Nuo4oaH2pfyCLDUekpy64hYSlcKFvWtvcLjudzfu2F+HCKg5NOCj/B2+Y6KSnjeW3wvYHJHG7dZKiOhE9QSafT7uyujHQo77IX7WGQRfu8M8V7OUzH0TWAxiD29DrhyUzHW+V16dfegOe6e86khy+pDenmDHuPkjftrSp1tcURKSsN/XnTKdPj6LqSJ0plg3vCpE1uTv5wn9ADhBRfP9Z47aIW6Aw9r6HRkk37Gx4XdKUyvY6GPHx06vLLau1aNoTlX2aVHLyoEoVdv1KEO+mkCmnWK4EP6MtbxRiYyed9kyw1wVpouYGx5JYOlUXHUFvmx3PQ1PZanpUvzEkBYuprhT1TnpKRq23xtat9ckNgofwjyIHTdhCR2UxzhFx6nirLoECBWpMd8z3KCsuZrk2p8EBxQcs2OQ9WGJU15PYMKuhhVoDzDJUV7Y1mxmjShyg2JZqhHgq0APFXAJuMDuMHOCuRGWv0uSfdhHdc/Nkw/rthXYM6km2r2vEhzL0U8L5Cpbfdy2u0NTitC0DyTKHXt4o+ALPKaeWWUXHBoqn39+wx3ykCvU7LPP29jKP796X5AwzWz9HinnjgsgZKOsEsKENFkJGaiUhyr1Yz9rMyiKmehT1/4qempk0Azd0b8kVDKcHbeuj6ldfTFi4WBEJ7D31VMEwmyFuxTVxxqVc8igGA49TPO6hS8BS+Dnf577LO/Oy/2Vx3IEECvLzxf/LLXwPm+s1oirSnAWXj+5ZYWeaminYEtTZlPcVon1cuBX52NO40xwZXycCxdjTis8tBS09TfelkQOYRWcVigEYqftoqpoXQ7XDCmWB3VLGf/pteFwTSsCyWPyVZt8NWzs83qjwQleAGr0DwemNkK22at7y6ChRMeHRe6FneqoCZCGOinEK1MLLeX8S7/zbj/eDVL/1EivPqhQDapp18WKWdUyoO4anmlbGyqnhNrdmd+KFb9FX2uETbuF6JPcFyeuOqkra3zq9ABkUHia6o+jvFMEEgaJ8XVlIvael3jKPi47XpxbleUl+1mQwOCq0jX5WNRu6eHXkfxmn5sRfbIRrYc0im6fc/jUDz0bqsRuQzeB9551PaKgsewnjdipsawE+wTDMQehcMjS+mDX/8fWV0BFFXVt26ggCkoLKKWkNFKC0tIxwJDCMIzAkEOXSShDNwwpOZSAxICgIh1Dd0kNDdICgv+9GO/7ru9fy8W6sLz31D47zt7neX5gWPa8pXKaR+QAGSvwp72Ea7r1HxGjucRlnIRtIydlYqailMDPnQ9FUYhwuTfbym5uL1jcOBHOh8CLtv5Vm++/XcJEIeP0lFYlI6iNb0h9X9BJ1rseS4DM93xcAh6B7pcUhTqDJ5MYvTfG5F7QzEX90QuIoDHDhTC4JsEpA/btpZyWVxCg3xN0z1JkQ+aXluBP+ArEYkv5HK0MWAN8H29+ZVYPVWtEAn0WD2zqnESunCoJpj+KgXioYLyM+gZmmOSpJOnOQnxf50GFUPzv5/gcumHfOAo7sUFtDIPAcGcdHYskB1wb+RilfDrfFX5EYUZPv6hePIwVKuBB3us56//aaHVbMaPThwvpTe5EvxxrifC9bZ9y8PVjWQZ0NU25xC5nzDAbUfndcnO6q93V9gBKdw6BGJNbCHOZ4ye+vYcJwgeuJoUvPG+J17YSsTPudybcu6Jes9NaSzLK9YpXeFeiJ59kcHH4LRczNk6f2mCxuB9XUk6Cr/U2TfNuKThnipczrd+tVXSmiryXPd0DNx64QShSrcO8bYuiMIO1J+ZKbb3fXM+NrinG/uhs9DZMRbegzjViqhfVec11WcpF5KfL+LKn8xWRl2eKSb8XMu5ikz64ZAZDmua+BN6EoRbCx1ribnhUJeIkncuCWJgDLMXeskH7dxBwrmNxC2OcxMu0dlEfja/UuSA35b25OO1u8GpNk5i0IEF/x7DkbGOzLXrDWaGtsVlS5F0j1leKDhY+eXu5tebGD2eeGvin9zUlXWGzzhDnvKTa/Bx0sCpcYuBeh/LVeex8zd1KBogDYWwoyeiqYPZ04tU8IZKuH09fV+VFHK2EuPjsffC8FgPIr1v97pqi8+coOzXgMUsccMV6ENekkrwOvRWVzrqB3kUbr8ymc8CW4SmBDNQMpYYLJCelvzghJfzrs45nYlT9ZKN54AUHsex0MXNtesDb1kxCCREe0uOCxZLXHKBJqHt9ECtf3aYDH/mBZ85fBPC4nJAhE/o3pHF9ohT9ZIlL7shzgUuYvPzID48GwkdzZhZJY/tFK/T2dhKPyKXLTcmPFR84KI3XlS9RdhtfWToT3ceNzAG8t+cZPA6ZapSWmXaO0HGx8an0qs81GnuJ3BFFHzRTfz3Sh1JV5oR0gBcIC9lc1DKdvIz7debvXekf9YSbynNUUPkfo+HnY+8s/0TKD2TvpBpSJwzHnDGFjDJmK0kn29S+JzG60UgAq4CoInmzzWtqeGxotwbZYGrQNLQK865EnzK1upv9R+sAPicmE0pWU0hNSrTHG9PI1/mB4TB8ptsiZbke4QorXK1hMXxIEAik3uZ6G+qN6LsYUfY4UCZEin7QjX7xFjI2zftAstW6ELtVKhrzvfTs1LOJT5ggQuBqByjVGO3um8VWIaBAzA+NZvveJCIATnaJ+Qv+5LWnvmdvjWK8NozyOI6QIZk/0TePL/5swz0NGZq4CUxuuyhFB1kiwT3/rCwqpF8rPUWU65NekwhBSyChind+jBgFaU/p8GgwrUgeM4zjTvrT5AtVAuYtIVAVJTFwOl20CTvz5SYuWBRoTHQe42VWyLFTKnpvPu8sf/hXDAroWo0o+Xi/BT4XaFSwCUZ/KwGVL8bTJt0eMytMcK96B0fhgzUH5o0olhAokw49orr0nj/9W7Pmn9cRVEAmzBSTSa/Veyp8a8s9KOqZFzH91lHM983GalHn6NUeChbH98bMQV4pbQL7GHAxtWo/7iTMVwlaAI3TFQMeNUwfbl1oTLjG4wmD9dKFujyPcwyBNH1t7cEBnfpYwrJnML5nv6tyCkqfbV8QW/WZ1YV4FGsoG4pUxEk3iNk5fgUTXO74862c7x9XNaQpHPg7FXAP7odY4gwXKd87Ein2+AxOfOFbPIUTjRd6gv/beSug84+rXCDamE+CrOOeVqYK3NxHfBWVbWNb5y46MnSgqAjgbC0Bs0W5U3r24F4O77wRMFr7EFkilf+ZYO/mcGCObs+/4tEA1F5s87XmgeT1sx04juNOgndA6qPWEWoC5v+sjfCZDHpC17slnEqexvwqq4taQ4W2nk1s1TEJsL2rjlbwQYdLL1ToHOaNnBWQ6yH11AamGa8duunpEtfAzbaGyUtui7i21ix5p7VVBNikvsS3JjF0Fc+xeXVH+fi8w7cry23288B+Bm/Q5rGvYt4uBaq6AM3KuuD342SSULD22IfZWCFoYd0t3Dzdw37InK/u/NzRKOJHW6v9/Hapyk54mtxqh5/ro54/Yrhigcdh0+e0noTcrOoTGNNq7BXAFHamoW8m0Mwli+UlHK20Ex86UerG4FkRGbt4RfSDVmmI0N6qjuc9O7Pe+E+CH0tLTYZjwyeCDOPQ2/yELytXmC4y+1t6cmibQjKBeDdqnfieqdO9qRbCP3Lh0nfauNd/jmBsgkeELx21sN40HKWZ2Q+hDCbzss1/u1XKp/udvhjdInkVhvdZ1uPm5SYf5QTVGX/29AfwvlYx6TXOU03YM2HnBS3lnECFnjMOSHZDUkRDWnzti+SIleP5To93s0QlTqPH5fxOu8ODD23RV8ydNe3CPim0Bl9B0tABkbbpS1k81ZVfDEZawmqdDru36IBxf1LIwGM5pDKgZXOZXpnQSaLBqKPYZlYE0nYdXb8AcyBESTU3yqkijrW8woL1duE/XiGf8PdIXS1x9BVm3un5RbpinSW1mF2HvQwETLkTt5Xj6l/zzkf8LiNMVg3iM3CPuGJHS0w2e+HnoDvcVAH8Nbv93X6kSuIwJ6A18tuV97XYGlijROelhB68rynt0lAExl2viOSYKY4he2D2gKcMZzC199TE4/WbcMAcH3DRZVfHv6fir2zz2dPfyseulwre61Y2KHo0WL9gFCWPvBdcv2DhNnU5IDte29GSRTgTjHQ323PvC5BHppkIMHe6vY+zrC+0rPLVgkFsU4KLWdbD4CqP3TLiUYDlOyFoVg1Wm8sNH9MBaw40CDrJtC2rmA1vBcDQ02MgOB/XxoSPMrU+I1K6MQLzP1P8L5S7AVoWodaQGz4EvDPObDoXymmbr7ufdMrG0gK1oBlHA9jfS3k/yUg7tvPTrXTP70Fp8jZJoa2zreGW+EW63Wf0fRNxFZEnWCOJjWCBMqMlvp/DlGHGPS589O7MIg1PwWZLWvyGuO5S/uO1UoGBOfpSTMvqOcQfUXX+ONue+4OLWTgJHC2bfPZ0KRqQUc+YDW+ioC2m4rx4nwiImS8lod/r0rJwkfKrv4tUFaQUp72vKW9HC6boqVGt/rTs8ir+noCAkhLUZW9YztZ/nB1aFalmfI7c+3oM2T6+4yBydKk3gZqq3KU8cM3CgTJHkI8HedcQMBCeUefz1yCOhj1nEPafZTkedOvaUKeYzObiRq7cZxvtqCDBnjXRIuJJgKG8UCyeTyJFs9NFzXtvAjrzKb7Y4LVik1nIWDTbJl+4Y9W7/Ssaw+UJVnZjp6wLl7YBlU/gLJGIsEn4KErVQTaayNxtrPg/WqyObWPhR6ORtbz2b8X3dr9UVPfneCf//NxOx//fIvmpHw2GRY7GzSyGxKDwOCoCllYqEdZyfAOHeMKjaoeXQ9XvEgC/5H+MC1cMMm+GDpUbH4XC1/DqCe0P3yTeW5sfzT4afTru+SKyvf6MX5/JzTchsSe4M2DdxjnF9c58ZdtCMR5WzmTUxAS1Ew+IMcVMFXB66WfXvBHkO2CaCHpEH32rz/PEMZeJKKQTccWjOBKYhTvA5ewQpRIJA+ymaGxCN92pTtH5xiupBKw00FeKSXpulEnz+Bmq9vCRRPBu8d8pDT7VjUHtYLYKfvVvBOP6VPhPzG1uSkcxZj0kRtSDkcGm7fN5VAY4wI//BsgM2HijH/oDJzPJFo9a88NxDHUS9PvdFNowNzJ4qSqfhPRNgIP7O5GAKidgOFE9jhLzzbbtG84BeRuRTayWyvO7hLVPwzKnLbzu7u4V7Um9QaGCRhIMZfcE44h1RrKNhngrQoJPTb+bGCUFf6U+6CW+XKg8sBgC90LAbc1if9ZSe1SN5xGkLGlv7c3tuE2/vFcOkohWx3mLUlSwD0JUzY5Hvm+EA2426aRpvqzhWGMcUVBjID0aEu4rTIj2niuvzMFtrI11PNAVOXFRuZ4t2a5e41ENIU5sfPS8Nq9oVvqtKNx0/zWv+aDGqNqg2PjEpx29r+HmyMxiquswyALC1qQxVjj+bGoHLid4yITuzdqjVsE/pUwuz3WcA0hrfBafpTw0eqq29vKXbOsnKqIXyNV94S72Eg5QYGfyzm7y+onOAwvy/xF3z2odLUZCs2TojicWcK+36E61YrzCUZCFlI59O2m53fTDtT/m2k3oP7IQNhCeptC/lYofpYPVkohR7Cnr6gAu9apbRxW2u3PtY1gRg/uGqxtPFXO5m4I5SQEJNQPqn1OdLj4/nX1jIBPZwyMIqzjVg8c5EudUcfR0Ln2MuOfCHwurc+bBgnU75mikxrzOyVXfYrJbWBSPL9p7x/sdj+D1ftG9R8aQRYSLSWusmIcU2RIm6AQgg5qZ7q8nnX+2HpEE63ecXLlMzyhTy6Ziz117vtbAq/aq4CLgQSUCHpTYtcv/mZbeUnyuUUs46IPLhkHPubzQxkUwBzAEB/Q6NW7Rc+teCAmmk26vObJsOxcW8830gComGvWi1951MFEsaOStoaybYCCxzmOc3xX7ZWB+LNs+N3QUNhgT8jNOgjbHj4CN3FB4u5RvvQMrrylOXY+LtjXpOM8jCrPxQgBxpxNBZ4RgQCWUtK/8tbAF9MuBX+PQgtq2SSkdzTJZumzEkZY6+v1LCDOTrk8+waavq3iuKBGMyE+Ksd34LqE48CHL2Cy+Z7b8BB0Mvd45muXM9lElOuNqSx0oZB6Is6a8LirHD47b4/c/jUdBzcFmnwDNYqjfgLHS6R4DC2Mr2IaMcZBMaAa2oCDCpSrxTVAY0G/8I4hu/z40PvZ7pgrPFSgBozbkHgWCCPBVLeQ19asBoRodaC5MaYNFKd0eD0Qj0R4Cw9Sigr3KEkK6kMPhuNhduErjtUZM77rY55MITzKVtgC7ArzqAtH6+QvW1EK7kRLea3ouN9oi0PPZwrPwPt/B6S7lpLAw94mme0eU1xns6wsT0wKMhHR9fAcW5Lyv6N/Z8vwoGisYMWLD0v0yQj67drso1Ky7uOpHbVFRUIDcfM/1TnYbEnIg3vfRbOkd/1LF5hF7njzJS5NUp8ZXd1HOR45UWXk+4jFYD1+VrZSprZkJs298mIkCHvsT8k+dQIBzm2FOcqVWrrqZz3SXRk/3h37Xd/5PhlWFoqQXaDK5UNdVLDZKDL51A00+anFH3Y3oqFHaVWzvERyyi4g2Odaz8OCf8lg00lIC8cb3BOHZYHMuG1OOwN/AdF/nzUpnO0X94UUd3aWxp6olWxuJR1TS5b/S1y/F9nw+nxk0wmFcr5z5ArsRRqSRiSDMOmoK2H172Ss9LrW9LtC6CExWfLP1+Q9qblSTtdvvXkWnvABzjndD9ve/+6DfcoWS/Mv6e9FuCshWS8qrF7E8V7EvKDRppAJLFM7uXDQlNSiwtfAUSJ4PWxxbSLe0XL2DgR9kyVwJkPD872w2Ni9C4ZSFPB4x+pk1fmLEy/2ZuVC542JBX1nb6E2HkwR6gaProhcjBTSZ8n+qFCBKi6djwyOHqd8Af43PEWyLkLkHJ/3K1dY73lDlHn9w+6RYwX6KK5LumkDJMQfJXwTs7o0ermWdmPj7RzOPT0A+W7m/nWTQ4RqpE7XbKTRT23AbseEBta/D7BXMnmhOpzhkkrKa0moSiKqbqz1sNb1tTwZirApqHpjqODy2i0yVGDdu50+iq/BvzacPKFWZjMlp3lx5+PJvi5Kq4NHk9exnURd/8/AcnAf+N6XuS7HoJDERA+3ssjkH16VDcmCQkH9Y9DbZwCBbIsnUu5pbvl5WA7qQ5Hn4+NJvcPWdgl/Nr0Rjqf2RK89z2kec77dtJ71Zei4xc7tXNNN60kfTK35C7bFG9hI24/h5e3NL6ZmT2pGDnqJeJqk3Ld/vBUlM7tl08JjZLo9V3tGxtBUBlidZ9kqizrl/0JV7gi0kfTLPpmj5k/LyYhHnwQm8sJT2qZckcbZL+ZJ/Gbe6G9Vy+kuV+cbMoPa9SSTR6ZLVWwUJyiDzsZwtHDyct2BbQrU/1COPav/cX9kik25xgefYQvcbVjJ+QhnxzZ8o62nqNNEbqgBNOvb8BzZNU3GY9VpuTckwoqveYrHeESOHLBsjiNQJKYvjAPV5YHVqnH448xySjFUf44i9I2Sk5ko4JAcX1zImKXeaScYquXUQtmIYlwO87JVAo9sgPWXEyDI4/4s0OXHJ+P7+trOUYkltYkmoq12LY9/f9/TmVol55H/Fot4JlRlUX0Xk1cpphh9dOlgzKnlsbR9db5P3wnNhNoDFpbDQhMH6/ZJRecL9pJIn0TcP2FESEVHZ1ZHQbNQ954HGr9DsdTUdi8kVLzeeRZayQfBsOkJQwxEPvtlIddJoXue3ltXTSbNd6vHdqZHAuy7QzbvyridVW5JAr49l5UhDNf7AXwOKBJE6jVkeG409Fr/qLJbtk3/10vklY6m8M7FIkqQ+EaJbkfPVQYsCj4hlBGC4bBTSVhjDfRAiG/xqDOHu9Acov9tYhfIsBbeYnh5jMgY/l+FcuGblMfAwA8WcOBDZm4tJBCsRrFdFMAVO2ukKuEa5g9N5eNa8jF1dJcCLEtLoxqJcdjbHFOzEYgvE5hme9OOmzKAuHLGcs4Vcq0R+B/nBAaXqk0k5ZOEB5/+zYtmAMt6Ubnp810mSabC5Lhtldu+2RllVtOqpoe2BCNXs6eOuZbDWDiyAYJMLTpbA/YMsHlQDdUK2GIZN7dkU/YnUv63eSCub7TOsfrbQSmfD5KTnv7tyV1jKt/ThuWbhwLrObCKeIaO+AQKTyQhJn2GC4/VY6+jPDTQiDhR6hLzW7oa0FP7bfZ5Pk9bUDmYqZS/YjVFiS4X5Qlr2vySF0Ij+LPH8FqFWDtJkzvgRPQ3c3c2UYjRpiRd99vwCDwsilcM6rOWB0eIN5Kb3XnGWQbzBE0CxCNsMTiF7K9iwRJup2Nzdr3/qTdasShZ1Di48rsypcqeZSLA6G2uRldpDTQ4WxWLD4yTG6bf3aTmSvNJKXG/iOXwM0+W/piQw4lmjM3Y5lJzVIx8D+3V2QN4cGDuWgieJGAJIgJ42ZYCJf1FW/tZ4U0XR968OL7zMSoVv4oV99NKZlI/86515hlnKKkB5A4lqgVfP3QCRiZM8n0XS0cUrAaKiwKEFisrv8szGemjWuomOhcfSv2Kx8V4WYB9wxPeEJYRHIs5Z/Id47wUrIhUrFF/GN14ihIa6aVJJl407xCx6kVNo2Sn8NQPTZSpAv+sk6Crtj55wAW8nx6uNu0Re4nmzyg+2W9xntCoosnYpGlpNgogfe7tAOVn7NTTa575br2ftA/2S9zUdXRqDeoO2xqYLRqvotsemC+1Gk5NjUheNHqt+Kv/Zx+K2GGVFcp27c6/fMA2NYWHryGkaCbjvRZJIMTmV3fYAE8TwZlUyYuFBFvtAbtH3YLwDZIMu6YWyEs1Lf+69/iGhn7vBeJcqcf342xUcXJ4fqEShh5cRsWPe7m+5KmjY9P+wxAI+zKKO86I+xamSSwGXBkDir5Jbl0JowBo2Se6kVjXAeiv5+h5bXr8YZnfGJ4Cx9bKRU9X7gl65j860d1EQztTn0dotfr/JaRfFk4jb9nFqgPnG5/wkAQ3ZF4f2TvVJv5zmEgL2J4mRcwsBrAfWk/H1d+jOFNHlYX33m22MlhhKouvrP+B/noBILdEOFTPo/Zmf5F+qPRkCvOv9+i8zq4m4C9ai5TvTQ+Y7sVdPiHga7F0KB7qUjxwzDIgKQHmxnwtLZ1j3w4+cEl3eNo54u7Ju/Owv+ZCxKjttznYN3gEKudpMIHL232WJXGa++Obx5LLRTU/2SHGkJ6+6y5Dzml/HiM390e0rb0rYv76Y/a9y2taI/N4wTPh19feLRo/VsnuoxPVg1WPblk52Ynt1lqv8GFsnznSiCqa2owuJf6ntpK/osSIu6gnP5ZImThg48rOCZLCW6dvLvO6+gAWfwyvYbTq7FTfq2MnNZp2UddUPWw5V/RgIqfvL8zjeb9GbixRwnKpOWtxkfcXX6z+gchYJkv31h2mzQnbpb/fjuhMK/a17p7iixa9LNlJAnU7/5VhdeK6E1YZaT9fFivfOEeVOjKxKemMtysqVNO3ZRk/G6g2Mlf7tWy4Byn8sSyNZ2sOW03UV4CuJaWX67+8Djd1w4VB2sfuQxQ7ajVzQbsAb/pG7fYxZ0vnpiajMn57d3Lixs7s99dJjMLfCfhxV93F5rOt9hlh07QSOtnqzJqXMfGtZZFTmOdJL8Rku/x8THqDMdHxS1WIYy9haMVyLrYBR7ZDOvBrNpdKYQju4v2YOD0TKDswIOMxkaSSWbTm0d9ybTM4Z1fS/8peSdaHQvwlxObb2G01lCY82O9I/5xHEjo3D5wvKMVaNvd/mTTXejVGyKa23yNqoeik/KaBUDfhCs5ObTPYfVrvx/gwBjcXr3lMlj7O5CKkCH2J9/SWdDii+JiCpAnyX1K0f5jTlma16bLfCLrqs+XUBc0e8A85dBc9rMSo/8lFi1g2Dp6k9e8F18H4EI9z8VVeXyQ3aym36zv6J6LRd/2Gx8aT2B5JjxCllRw67i143KKCXWf/SQqZXJ5ALavA9TOJM2ax8rj4/rYA8O88Uljoxca2Y4Z0axIbf55YqsCcXPxoeXkMU1EI1w2vs9p14rFnLBwGXekA6097Dv42jgL9N2sZaXcRr45aq0Y+Y+ekudaUzKtUTKruLYLvnHXcXD4F2B34qav8h0TQ5JNHBuALNRlz8vmikpj0/PSih57WQ3X75O03CPsOnF+8Z3uFrvkMTryFSarU3dguuev6jsizrlG6wGsQdPFB2R4tRPRC/IRZfO4/jddYSeWrW+yozlJR7peqOZ0dGL9JWHCN0MCFrFUV3hTYpiPbNqlCEewGfhuY7VKYmD6MV0LDyvLdvfW8vLlx9eXFR50rhmIW7J+guFpQ9dBxYqqamENXhxssV1O8aKH0coM3J6cf1jLgdCH3uWjIaAOLY57rz/oGZ/bk/VDv7R6Kza5zJ0iY/DTOfsfCSPXCFzVl9i+jys/Xjmc7sko6+C3XrY9Ak/NygqXyvcCOnVaslr4emMlVAwzHvrsM7oWgDOrImrqPd8bdV3PDwi/8t5UrRmbQZbDzegwIOStZPuVc7Agb8LxAAt85Nkspt7mknL7a0/DZezKco3fkxv/RfySpyEaP4tELDwxnD9SIo0u7bdKwkIFGtT/vTT+w0M44h/QXdHuBf2AYC/kXe3RR+qy/ZqG7gXXVAKt+XXqvrHwybHQ7Z3h54u2yIudr9OXMbXdBi5CcaOxatcdRl+KYF0H8JtnPYVMBci9kcTuX37t19nA06hf/0n1jS40mZy3oQ4TnLfFbNbxEdN3RoX6mYL7y7/8gaUEK8vne5HO4ZDQyApdnqUcoesl8y//v+yI8rXxygOz6s0M/SWRVUWGDh7Qu51h53pPa+q/FZvlrGLARY+lJXBmDwXulMbaP/obuzSVKDJ70hNv1BEpvi7GmzSJySV9xm6W7nKTB8ovNIG4az7GE6FuytZn/vuwwKJ2EzIu9QJyeGR56Wd/p96YS3H9R62dna/UTxleHps4WJ764rxT4s23AYWKy+3n8Wav+/E75Fw5PHoGVWuLPb86o3dzupk8I5FjOhUiiaROfmN5Lv86ZUdfLj3cRN3ueq89u2Mwet8+m+Fo/5j2xPFRl7vl93w30Ni69vTCkshDE/N5Kv8SHPsT9SZWW5fTZV/MBMmcvdvfbVHDbi5shisc+uy+FWUHAKcUkw4y+Uf73P8qHMsxqRcrIBabduKrE3l+tobcx8kOd4zcDH6tctBsdS76rpuS552WUXyfv1Uzawf1mazPiqluRrvnHPxQrvs6x+XYa6mNGsSny74qEzYyRfea+OoDyYTPDN7UT7pKkCTQz9CtETt/zw68G8FmzXNPmXOO3Xb2jLPsPV55gaP9sI+19N6FHG+XQRcy97Fs/PEf+BEfGxN5U5KqKVAf7Q1Pj8nr2az/Izus90fCR4916Nmn6Gz8OJ9jf6zqpmnZlN/Jclm4Pu7N3EM1r5QHoNL14DAThEY4CfD3ZG9IK+LN7WtS3jdhiI2SXdFvjcRTDqk0cWBdfb2Ko1ODMLl4GnoB9EKcpEYz6I7hTAAp2Z/b/QdORUYJc7Jz7+eHY4cE/2839akqkC0T0SJ0CojQnMW2Jy84XOuOGBcy1b9Fz3FJvTknyyIKu+woTzvjTLCd+rBKlRa2n2NLCHj5D2aNk9PskhzNvGQFUYWLUKUwOxnWElyi9YWTrd3iPRN0do6EYSLCDxKdHF3utxmSqFV1rPDIq0sVI2Kq4GhwMhb5z25EHk5i/qqSy+Z1aSKhaTZ4LI5rEzEWv6chEysRY2F/DuntvZxwYH+9p5cdQtafF8tUv52O+lAvf6l3uqfxhaUd4fDn4uoOWFYJFnhKe+J3FsbbyOD1RFgLkvBB7SxMo4hR5rpFGX8iPGN6fFFzum4bHnpMRhSRN8yz1zvo+S5dTsTPWZKyrk05mzVFAcBszCBcAEflf45PtSBVVYy8RqHCDkRGcjcXRDbc3TghY3OGD3aZj8tIUh04E6J5zbYb1q0rCHsjy6PLBbSb1MmtWKmK5noJj0yaf32vgzuhV5GYqihkau5WqdTyOKMpFmT+Fc51i67crEHVQEpbNUPpWdguPHG0uj1D/4rUb7+b/kz07nN9emCe14GEVzuvVm9XCFaip6TJ5GvfMpE0NrIH0UZN9Ht5G2RqZ2+DJDKyaoNXA1OnzhuZk1yVQ6v7BwNND3WxWSaNHomGDiyLRau26Dl/nASvLQUQW4yj8TasNKS3FucdRG7ZdsEDDHk+QEORBupir0HdGgYh+5RVlvX8WDp9aXSt5bcZ1TVA7bGSHVpI/1VogprrF5nxL7yqGxd1ylQEsmIVxGYMaYzEUXvjdMY7MVAo3luaqREY868LO/z1zmJp8+w4pQy8w8viyStK9s80nd7tFsPGrntFH8wyn0zSqWx1PobIVnxz+oLiVWY3bmckqx1Z14fYxbuxOb9iWMKNUEme2KQsIHbfGfufQ0l2bjFYI85JFi4M1Mo2f3d3V/vT7CKGjIk9JH9Go09gokbNNeFTB/mlnBqaMfPY4wy+8QN78UyfmKd376bfiQLvWLkNiI9ty7JyXB9N+UP8UE3ETlv26ZPWM223UbV3oLnY34wMtNLsM50ytunf92rZRPlwCiRK+cgr3Yog+TO7pIbJ/ODQwJxsCtFvS7/HX6HZcT/xDQB+OecYn7M/shemUvK+ViwmXEJZ2WwG8I6BIEMuyufQHmxMsOPIgUBzMOAtnpAua9NIBa2NCkxIVZzrri3Wtn9pnJAOFMOmrXZwWmc3mTFOrBVkGHEXXrPbjSE3ikGKlEH8p/hv6eKIoDj67PEmBYBl4n6PtGhcsEiEkOcKRkIwQXhV6TVb+2pWLcm1zxPVWiZfAJp99Ifof+rlnQyCVD6T3ei8Q65OXvbyPpl08talK+/3HXcEyor1M5MoFycJFG1W6PvJz3Q082XPejHs6nnVd6La90tyr6Wxvug77RUOj773cNZd34aLYcfhe8yD8X5PYnzl1UYXi4A3xIHkpyp5QTAwjFIXbFZOcImmB/5qPP8t7j2x2iPpTMLYqrSeHUMhxnIZw/wYNYGrpEvHu+aUJWw7W0A269M3Ck3TtgEQRTKFMMaEyjegTznA6RaCGPgHzO2OpzjZjelJGXf2CRWvl/w3qGujy/f09Mlw5douHP50QHk5B8t1PvpqrVzGf+dM6vmKO1s/Gj0z2YU+xn/W8/r5TKHVFHWlrPFT9fMyMnfOmxdhQS9ttXnvHCLJf53K7lD+ArD2BoCUbfoVF3E3AstXaMLanlE2zBjjzghClN8CnHD3a7zX8YkY8IH+Fg7pqK+LtLg0/l3jXUGzHSbdztYsadT0NnV8fno8fgtesuEN2dXShN0GYItPVAWL/t6rydAdFnmuICgd/rKPYn+6jHiPfg8xNkdrtSfo/a44Adk8FsKe9EhIDYpSQVs63HzalQrsfRJCnLDdeV4x+Jb7Y3LX3NXUAPOTfCxtMq79x8ZIFAXpW87NHYqz71UsDpqaU3rdxWfutqqcDALJj1vH4Dj+llTAE27EnPtRJE4b0uNTsl6arw457KJ85cA92c58RY2HgFPAV2K1gU+c2fwj8epdVhxx4Qw1QnmH/sFnwyOWUG2Ei3wyfooQFwM/3LvJ6VhYWAyP5pYeD8X7oAq+9qdedURdccWc6fDYP0HJuOVHzOvMrPg0QgT483POHSaBmq8y92yT+bwer7eXqgabqk2MVTPvISFs298iQfuwoLqQEzzNGwml8NDQrf1g7o8qJhxKO0W6ClWHxYng5WQlc2mhYl0Q+O7xl4c5FKRjjmWjkmrVlOv3R0BKYtJiXJY9UEbyGqsTWdiJo8UNW5z1zuIv9kWzO9fxom1Kvj3NgIbqDYxgaFi2RUjEEyoRa3ryD4MBKbYYhZUjx2+oE4DDphzIUgv47HVNvsX0DUl+MvOn+MQqg1xIeD805/S7JtwE+YMgUeVN04MvBj2VkkUpeRWIbzcE9kEssrRbe1VINu2breCN5Wd1Vy70jVkLfLQ0vv8bGjODiYAR2tTxTYerOttTlNxsxyFth8/leV5FfIJymieKSw3wCRg0zcVo639/0oSuVKTVVGQehg+XeZ4Li+PwDmsfMQ0H2aXz409woY6Ptck+E8YntzgDU/XAmiOLnNYMbcgMlTJ5ZUJ2/mNTc0O3cCUnRD/qTq7ZqfaIwfoDgs9E8U3y30EGs+45h1/uPVUr6BGUDvuQwUzqWjrMoUrTnR0gHKdZi3dYEgYsfpdN6mEl6nhbCx1GuA1jW4BvR5YB6iHz0CqNwmcYtLy8KxvPN2M/RVO9eYy4XkUwGFqQZ4q0Wc/eVNdLhcEAjKI79vHjvAmXhAmvLKcAjQPwKXX3vkb692+KVFJ+v361GMIEzzGw+rbCw8E4xrMaX2JOaPWcp35IBvmarBTWez7oH4TPdAWL4FdX3Ud+emt7WBxgXb396CqEgSp4ZjmiqMDCS/ntFbD5CadGRFmombES/wXDB78baOUuR1AYz5JTGoB3lBXKhBW6NL5Wpu+duc5MDqjZ7z0ll8pgJovhNgCK+FV6S1gbY+ZAsMbP+n6VCpL7pu4rrbQoY0bjg2fYohYAbqxC2uBBvRvhalelBamcNoik2f8DORbfJa+HSrz1XhcwmfyYAgIDxMP42UA68FF/NtK/46R84OAmtwMPtbNsaaQ6DRRwh4rYgGjHmPJUqUSvdN0Ajnlms6f1MJyCgRunOXDa4mB6/ngUumFEDD58X1PdGSV9qJ4RAzwL8iWQ8TEnay0qC8Dz2G6bKALD4zcvCQfrgSuw5xA4UDx9YgCMWuPyj8/bJDZoDERDg8l4amdmRVnzqB5lNAIVRXCNBXxBsMdbR04afh+GARQmWJaZ9JfMX1aNGYUjRY4DGemdGeGwevLyyOIboQteFNJLClIU/Sgba3zCnBlnS26r91a6alK2pkAMxmg9xqtIe4ZjwMSgMufZWyUry2Jk2xcrwEbyoa6Lt3DJn43Tyxw3x0g3uA99AuT0k7bnvqm99qkodMdzxsjqsdPQtu1AeAIyGHqOdB8B99pvldjtLVPuTRJZj39udKe9uuE1sDJUY01lIeJFOoCvrXoJisFiFqjojBEugt6VWB5PUnlgwCzHyCAseCCtGQMsCJivgoE8OPE7yLsuujWjaTty5C1wfG6u6HwOGzWfwMy9eADscwaMivaLFV8JeAXdYBngcgRXe9fnXgiW7lZihDKzxa7sJfEPsNp5e3UnYbq0Ap3+cgHWWGxQZuvyyRzuQyHJIfFpv8ElHiZ9zqSfOuFTv7wHJYHDTwrVUdme2474vf+kf+THF0eGKre351VJQoHGYM3e17t+H41caIo21gn9SSYGNuNASvTWnBggUt/ANz9CVRLT0XoYSxuAhRPp4lhXhB7WpG4gWHKgWtRMYXrXXumicYaE70Zc9SmBZ26V4D8taEaHCpgg3PXjYtjU4z9oFAfXfnyrz2Ix5fq8Uos8tbLwcBXsK+E8chk4gPiADiLQp5Vv/9Y80V0/ouRo8q5k/uVTA5U/CW0CHxDkRofziWam0uD+Wq+gafqT756froZeYuY5W6PwA/wkznTpRWYZrv7iUzifHi6deKK7dALcMLapnXLQX+51A8qoEZ5bUXnStn23JXgsa2G0DckrmoYEFyNPWBQFbJzrkZYPQjfMzkMgI+fAlPIIgUn2Lq9cC5tj2JiSTlFF7jId0T/Jpov/DEOvd8r6iYm2rDijLUfNvzbIkSzSD2jONjFleP9W4IDAJPCS6+sR4WKuVp1cw7jyRKF35FVS5EWGU5gcUH3LplBtY/MYxZ95ct+nZ+CnZ5wC69XQE8wmnQI8z8EoeauhILeoSmT0xlm5QbJQyMoyV2bLYefNDF3Ij4hTYqWdCc3Dl7o1ncfPB72wGJR9PWeMPVI9prXOTVCdBOBdVqjupOcmiiWz2tvwZGVO8TY+2joswHxTVy5PQaCvQ2PtklDc3ng/CsQWpyQfWFU7EQOq5Nbzc+AxZ/S8+7DdNN9q5yp4YLA13fa/E5mB4wrwp58CBtHMkA68qnyVg1DMVVVvJ5AUH0o6JLhYcFHOWyPv6MbPo3PTNQOuyG8+IG4/YRqdEeL+ikrPKXsMdSbN8C7Ml1LHC5qXjRpP7fBSsn5ZLG0fluZjxONeSVEv1ctPdrJM0EPrDZ9rNU3d3WZHPN2Za3c1WWZsXlxTM4ROvDD6BMNvsMfU0pG2rLQiRhC5jj3rssESPK4C0g2eyS+uaWzzLpKCXzVOTPtPAxoWMnmy/MnW6MX5/pc10uQM+lG+RPHyHDKY4DfyiIHJh14zYmyBj9gkYMt10j5LInnHsvxC/oj7+MYAC+7JvCGL+gc7DeRehSOnKjV9x2XcLO7qMtnNcaPhr4HUHZ8n7diT+KM2b/b5q8qmyidJgQcvPHqxOmT7uUEVr+iJti7J0PKmcX18xOrlNDtlKMnWDf2EuMbpP3/uG3C4k1utDqTxG/aBRsKOUwINCDY+llrzgVj79CrKdy32VJ+VnSqUWllX18l1J5+Vk8Dw7RBTMcvNcr9fcCOjD+Nmm5WHx/f4BCJmpRc7Ev1nf4KscbydBjp+be8a9NjOMur2XnG+nTeGzefVuJqL6kHu5D9O3rf7XPUeVc2MgtwQcCifTMXdaJeMQ4l6UgBp4i5Tmv+bWOcN/Pm42p07bw0GDmTlLmUFqFRCy4K8FT0x/PW4/NmoXOn1QL2J0+yQt7ikEKWkpvLi6OPVXtLd0lxavhvoBoIF9hvX/SZCEgP7iYS2HhAwlhMEdW9WzhJYVaiy15VPZJoscrPuXT8DQQAUsYSOi+vMDTbNSnS2Cqyn5omR4BpmL3UQIODy1TJ3ba1ueczBYyxnaFhguBoS7wgydehXV8fFK4HV7m0Iqootyz/0UqC099UKabt4OsxAJiVE002D9oQVf5PvlKX7Xdsy+s90iT+uaYLIC90B3bINR2Yc2vfeTl/TaSwxvPGErQz1XmncN1vaSCRtoAkVHJ7in8cnlPEOm04bDYwRqr1mD8qp9WLPdXJkn8hNq4WQn1C5V5k+Z8bv9SlcmAnOaSsH/8kZ4/I8G3H1bmtJ6GWkmfQCpAzvIU3BZoSYs8wJOBHeBrcwZbh91v2w4OfMsl+R/yyWwly1SkEV+HmJ6wz9H1SguBsiz284mAsBj1XuCwpeNaqRKqGgtvWEGs8mDgTsTpRBUWrdr0YPpcaRUOLpplarrK/HTtw8qDD8cbAz21X6xV/J9Bty2tFedIvwr+zqev8mPgB7qycmt0FtzPMb9fdec+od4scyC5ClKlZtc1frmT25ZZX8fVtjX+daUHR8Vjkzi10rPHxFHCtRoeh2eNzQAzROra5ifyZdR6lrFTBcRFGDtjCQXBR1LUJI8XRnea1eflbRJSyjocXJe8yCiGRXYf/ClYcF8V1OjORc3pEIRAbmMXjrWb+QOuNEurFon4mvfQQxJEYi2NZjic9KG/WCwyYgTMdQDDU51vzWq/BxJYL+qMid1ybYlaPNXL3elGVaoyv8v/ybf06rnm3Rfbd2T/O9WfNSqbWfPqc/859uvKLSRG+n0XOFbpuUiSouTkcUbZ1QEuqia2gES0jYTeZyPojXyg/pT7Gd41/WM/Z+SuftMuwXxZ67gPsaqrXPrrwH4eEmaBz+7/zOrm67KzG2BhIMmhZ7OQfe6VhL38r9Ds5LCgR8wzKfZzwz8gh5cQVrWLGrn3KijIu0R9shlplVaFIp5Ksp8GM8mbF8mZ78y8PecMTCSHMkuASavGQyZ1N6pIWa3Y+mQBHfNVZgzrgaXMlVgJnVvhY+0SDGCp8lHugAyBVe3Xg6s9TIPMDh3XwwhGEQSdGHnSo6i0F4LJa2psVhldze7rSpn95V+hCeuqEsdopElvJop9SxFofYEhqx2E6qrVPv0mnPiEHKiVvCUtdmbLMZ+vDsIaVBq9MZFpkB/8slRuUjVnI6KJWyt0TEWSYVScuRvvtMTKAw3CSGSFeeJZbdTgNrM8Nk6ht/bca73i88MfccLyVAr6Y8Bb5nRRQvE9TzpwUV7gRS/nq9protGoe05f0lEt6drDTLi29D7D981b400W4X3wYgUj7gG2z8Pp6zf63Fs4TlMm9XZ+MV99ZG0fLrvHC3XG1r6mstRwwpCFuUkMkEXwZT/4SuWnB1sIs1t4GCcyM108xhLg2tj0GQKFHAA+ML1Gq8WXC3B8PxV8lViMeFSc+ErLCjr9CwgSMzKVq2AnNlM8iMdsfpF/Ib1Gu8Krt+mtUC21nX3zdvDNkcUX2ghIFxAH9pu+Yla+ex/FI8Zc7iaffhi32Z67LTxdhc1tN8Ue5aoHF+ntwscYqyhI4MhVj5zBhNfZ1TQiV2GzPFuSn96WrE8i806V2EZ/32t5QczYot83MMQkzyjZdiYazY2kBkt4eSlz+NmuvuYvr0Qik9aedA9N88DGTYV05Y74WmprNp/93I/6WcRCbDQuJszHgyxqP+vPYri6rdEH3+nwGJ8V4uOxE9u62BKvvcNO7MH0mQYXLJC8Rqy6PvWgjJ/yNBasdufX/U5f0phlf5bSYTJ8WXR/2vp0SWWNgD27KIpDnFkkaUN/7/djAMOOQajAzJIDURDeknNGXHop33qrVIASfF2e54oVYeyI5/qlKLK/xfJLJSwMPSdOPf1tdhSW6bUg8ImWbW2bRpfT9O0dg1+Rjk+zDtNasdekOGFlE7eXW+Gtr/jne4oUgIFwCbJAjZUb+/G9cBe9wfbmAdBfBsMLwHXuYo5PSENni+vrghiawcAXLgNfyAW/4NPwY9VIRx5ZhJYlUoESdK50bpVeVzo5ZycNQ4vOyQQjaESdFVMmNBq3mBNqg0JZgMDogBTw3BwBz41rPTBUaurZo09JvT2UvUx/UQOxtG5/rtn/xhtWjjM6/XrjZ2DMazIZgZpTGmYQ+xS/4rvrgawqbMj2t/jFi4+o/yEOXmYW9gOiccUTpzVNBtZpzi3p7iurXBdoPOHl3K9PMYqA5TeLW9BE7tM2YuiI+8v0WXZgKrq8O5yv0+JZ0B3bcuMuKee102Euq5JzRnqQQ70XyuQ1QtzsvEoRj666KNCLNm3N9BQ4fOZSWquiOEjoN4ueRASAIMLBMohNIVIH6soK0hoW8tHHLF2gp5Qu21QiOw88RAA6RJbmruLs/lrqvABLRDWLq3gn+foz32JRp4floummOkdtkk48xcWMb2aOMpS3Js1l7IpHaWTStHek5GGSblmxVcWy+/q/vGQrGw0sY36ht3zSGB+4ud4X7C3IKcaOqlu5/Zpp8BnHlQz48817LyGt77WPKtWdcRmsYHxygjsOI4FDQWSOrBK+clea5bJDl7N11J1u4t3UQBDlGwIEUZK+uo3pNX+CKLXliU+k1kXAR1oxWJwcVZSPZm/cJ8E5kHsHWFS9Lt7GLUnvburiNv07r2nz0o+R6OhnAVwwXcTkr/uxvykQ//toieUPV1UJ8hVfMmN3T74iSceKH4Tbl7LxZQ1zDC8uMdwcz/ob9vmjuk/nz3U+I4pf4/02WnUfFjoA28WofyzgpARDFuit6OlIjDWnJTrRUnpUHepTsZb/EnHaUY+tqes9l//4aCVy7qf2it3W0hnviJmakEsRTbu7is7L3cmwYZPpCMn5CMls6yG5qyvhMiINl1c2nPf4RlGFu0kH3J5levDDYQabw+yhGi3jXQyx/bexX9cOybCGffqAC/bc6tgZ658RC+Oka9nIekQAb7UU1TM15FYf+5P0kckEWAg/F0te018/MLs/S188TyftBxkGhjdSyzzQ3Bx9exwTVBcIYlM/ByTbBVriULetZHcZvHlwkbgv0XeW6vdlQ7CQu0ZYV+5gmJpzP0Rf5rruXTwQw4DsaZ8t2gGN6UH6lRoHntm+fsKlYX9wyYiauYKvsZeei5Z5d0QfMouAcY2KT89kfbJ9cROl9gx7+qqollSdVqYqiKfxosS+5eFvFO/Xt9rZ6UDGXNKWVwwowNDl00p6cJhrOduN3eQXmfAtlTujWKFod6yntff5vH3QiCdYwO6urLNZXjllS09HNmaYuhI73TZa13X7yED3DRCM6N+gqqSaxopJsY0Fs/7UtsCVcUydia0vLqu5D+zPN8Q6NxTs3oIDDkS1KtwkYOiYfbn9v3Xm3uOO51inZKt4YWlEsYhwzJ+tTuw/bfpgAsSwBklm3JUw2rkHJlRCNfvK9rtl/QYPCgdDiPfffTp3HoVcp0Xi3k2h51NGwrN5M8LFFfPEjriCG7ybuKyc3JhGz1C5RlCVVxCusNq8eLsob2c9U7wWoeYQRtBxMRrAA7b6sUg2csBP1DwW50tiXQW59EyYauln4i+45hF7qtTFyJNC7cbKVlUjrzu3jViD28+U8UPHBKmYmgsuglQveFbUi8uQ0ctvpxYnciqxrZ3TH52Llvdov1FWsoQMhVZqWAb4a7UWJw0YCj0nkaoHsSzzTRO18Lk6lkWn9CKazz9J2LZEwt8aAbqxikJIt//HMLXy7poJTeQbmkiLbxF85uA5+RN+gk5+6SBcFXY8YsGlkYs3IXNt/ZiUgx6ygUNCUqKLLdfJvMe2l101KCsz0EMmNG9I46JEKYhXXaDa8Z+E2Yl1OD7ovU7it7/DwbxrAO2fQcC5RrzOKUOlWHBH7oCUXMrkWJVbDfYQbwFkE1LiGGQVDiqN8XeAyAUc51NTMtXzmHXa/zDTnV0MofAhk+E8au+GFrdulN4rGraxsJB7fgPFs89UtieX7pXT/f7Y4fexg77CRfGj2y+fITOKYO/aZPrhu3XTVcMbN5j3xtA/qn5ZKpwLWw1cONKvPZO95zU3mO7rnftmZNxUNtTyx+jk64bzM9Z2FwHL/No1hxL9oqQv5xx4yJiezo9MWn9iFfyJV1DggUNRK1ZaKmtoPO9HlXKG4ouSz37ZQ3W+GL/xJjlnxn7knH56D+0zR+14U2stgo7RTNFFnxqzYMacDzQl75cvLBCFJuRtHiJDhDxN9eMj96Sf4HFRyIzdaUALseBzE8ySU1h3uAxPRG/GstlztTIMeLHS5v1cjHx5g7tTgdBDnrVbBRzrpYIx8z6rrAUpEUYvxpJ6NetJlJYUEpY+kyiZ1/fu0YfbhczRRIz1gSeGmYnajv4srsEugzpjziRUtFtI4S1z//zWn/ntbXtabBWXNttFvcbqaIprBMglUzdyCfqu8qCHRBqOEaVIIqvG+EmAxA0p1vWFlp4Mvbji3+kp+k3HXvXKr/GoA1GBuyDtt3m9shVB/4QLFXgXEIdosshiEyvwiDKLhs9KPhrS7aPb2PpRJqbEV7Ywvhv3PfOr2PZk5kJo6XtEWSBpzvW7lvLlvTrwT1SIoMTWn2VK8dq59w1Pd91mf/Gdd0tXRSIZXs8DOxrThEFQgEXnTZERqPWsQovqDW58ZJGOIfvLvHbC4hrq8lojuYDTliMKETRycUvD5VOQPjWzG43hu6w67MIDYhh8YtD4dibJl/wFDBuTd/jIIRMQbN/LLvlDWFDyVNqFoNPOa74QZnGfH/BIdIFnPc7R0LbxvCXgdSvwAp7ztTqM8m8GAPd/fAVijx7zZmu9DB/5Mb1IColldxMnR99MWPwZec7rsOOY6Nbor67cQu/zPCt63EtNejmZVN3GJLVnKCZdoWPfy0Ag6V+Ql+c5alZLeJ0V3Vo5vw7sk8bwI81i9yixjdjPUpZDhiPnuwo0qVE8NMyAN3EB21rcpULeaOl5c7qaJ6+Mvd2UbuDmcjT9VMyEC3QMH6fw+6rOQ19hAsSr401NxBR2pgNnge4LLY6CsRA0Cpq+UxTEvLlt4D0Id9SGBt6qIHXi0lg0jm1YjfIQ16QpflXC8aGzVT9471oMf1HqJOZwgEKTW4ISvImXKYjieNCk+3Gx3TSxpz3Xyz2s4BT/wGCHn0d34pvWQOOO7TOG8w3YUuB1tDrcgBZm4szDwVyuByIcnfh7oOt30WyRTGyb4cHTsvdJ/Fd3K2uUhAyDQrNdDz5w/Dnh3St61CpG2YpRVgJJlsGDs9/s0BLCTK/fdOfGWdR3pamFRMMkxovNQ8iqP9qL5E5g24FV4gZWSb9IejCyHcdywswZEvvvtI854waKI4u6OJgXsKI7GuHdMv7h1egCogpLfcgwwoyrAaF49I2Gv1006dF36hOQasCg/WN5eOQvSiGAphZjYfp+YwbQUQLoobm8QReO/NaVUt6BafoSfhWxi2b/XAyW9lwu9BiYQb4Nj9Pm+xpo+3rDuQm7vOK5nJASZgZ4KqMkefyHXOiyHySivo98Vd+86I2/zi4PlkkQqfwd7kns452/fP2cuiQ5RXNxH/pYjSVKVGSiL0bH66fl8tkwW5+n5BAsK0+c4dDAGJOn0SuctBwqiI4wUBxyrf18a4oM3M5xITzREPCwVSE1n5+UnF/zw2GrQ0X3njge3xjOK61nRSHt/lxcbiU0g7ePmZrzTSlcFjQ887mRzHhYZtOINue73X6jvJJDJLrMw23dcetXRK3UmVj0/9mCUTZqmfMjS3uNcRUR2h04qlzdhj3oTc7tNfib5ZLQ0IoA1MGLV55VwEYwdA9CkdHf89h6OkyHWwSB9cOs1DJFngzM2X304OTrDUyLLoanxetSHED1OWaOQmuX90pXF2NPSEL5/LV1e8qGqdPhZicA5iFh5B257+3LCmEzbXQbd2Dc8skJixPYIuzHzlr9ZLd1ji9VHdFP8H6TOjVSgUcXe1vThLepuk9r+xcnZU2L8/7eQ660g5zijzyJLM0WwkyeFjAO7tuxZVEXXepA33nLkdcDyOWORwAXvES6rq4bl/PbCOYwAz4QRy1RaSUQIyZGAbuYqJRpBeMh3g3solKOT514/XfALhKI35tqxy2ghyZAwwlo2cnX0FihpH2byFLpTBEz3ddJAvZ3xJhdHUCOHJq8bYY6Jza6NAcC5ghzhpKxHryD+nm2PVdCKCIRD97kSrzW5p093ae4osU2Soij9ah9dZLn8RESE9I97atLgHiyRyZc+1fu8QDYev/u3F7t2XH3L5FuAH7H03S6fQB6ZYNY/zRMdNri8NaxyN7eZ1YE8agY4Izx3SfWwdBSiWDANJi4sk4CLVWFYzne7cMs0owIAUli3FoZV/7RKjB5+pLRj7j+9N1WCZODaFy/Rmi98S/G1NrHZO+bVH/x1/rmcDlMXaLKqZA6KH9sizi/tlhxVKhTaCXg0J+sUgQ5J2vnfVWJ0LmH7eg0qXleFL7hRBdsLNqWWJtsvzw0wWTa75ku1wT8K5Gbj5DLBn4m+87YQ515DFXGfngGGeRrHSHDd7xDUcHosYc7N7zd8BMFz/XNpczhTHkRdqfpOyeiC87cNtvZs1heDbVZCEtGNyUS5zbDBF5HSexQk+jvGGGhs0yJMrGzu/KXN7fRbMRSFrf4PvA/+JCDx2KlxJUzPx1bPMCIzj8rGOjTjRe5Hi2qO8PudioKTMAgSc01CPp+YV/8+Z0Gn0hNCp4UmHw4A68v1C1fj67VwwFBT0KtzED0ofn14JYzCpOEhzG/c+vpJc8buJhFojeGSMiiRHXp1798JKdpbU5Tnj7T6u4pf52kFdgCR2uzXpBlwJtaBPFEVB42889Ptysil9HSTUH4m14LVzdvg1TJwJ5V9DU3IYk62pBEh8sEbCMYUtHzCoKHKMf7zG5lvTN5AjDgMwjgM4QZYV/IXtXot3acgamk+o1mAXNDxDkxE2fK93GI2SxBhsTbj5JFY7bAuptQD8WZRRruWRpwOs5n47FGUuIw1cnbbfEST6faRY1FZWhyC/jP0PNAnNWAsQDBMQh8xqXB19ZsXGuhcwvowoc4+GwGvZBuAxhvHIRAG2ctX/LNr8QTwet9o/z2TlMC6kMAcAKMY7gWeAH57gHdV8rjF7Q2uB0uZn9SJewjGvVQ/SyG68w4ZeidtLuHPzoaL92C6vUNNZdFl3xmhROPchjWL2Tk5MB9U5dKWAwfD0/7l4C0I3oDvVyawkM7goYYkt25DxkFW/SrPireVLp4Sn/LRvoMvG+p4+YUHY3QfR/G72aUlQvoDhBr5oG/IPHUUokFOzECaSsGhhPAPlAspThFH2FI06jFSU7SGPjGXUi3bM/R/Of3MzX+8gMUwLIg53FsjX5H1JE2Reaep2H3m+j8B6+85NpyKBMOI/wOkQVekwj3tBdfvr3H0QNM76x6KVjNoPttJTc6WbcP2j8GLFC7uIXoMnyhlX/eLoX/moP8yVIrg4cnn3siHB17oZdvx15GhDSwzkwL4z/GJ/rm3MADcrJhfMVFV25vmIZziwHT1PHL8Ph4akx1T+kbeii09Ltmipzz57vBV65wPUYVFpr2pLmWmA/d4heisl7pv3nAvhh6qTfxDdMbY6a9Fr3MH1CW5R2G97QXTZV871MxOtbvMikBb/M/0cxAQTNQIkfWZ/l7ijHhszznO+GcspvbKxZxcm+ALrSgOpqxnZ1M0Hq3ZtrAWtEBriWMz4fTNEorChljee6bZAvu3e9guWjDgg6lPlOxAZTeMyDCdPRQIqXvWXW5O7PfnaLTyE26ik4Z00RAUlKSigPBgpYsqnxdTCkRC4ZsVIy5a6NnsycX0L6gLns+JqZBmZODvnnwzksRPAQy0JFf0xpgTwM9dk4YxSSfcvw2WSuGrjptsIMYllHeeNG5Mg4eMrfDiltEN1lexBHd7ij+WMsSwLOjbyrpL5Cc3F33/8j6yrioou1tKVFRBJTuVOlGGukSqaFDukEYOkUllO6WkB66hxLpHLpLERhKUEJkqPcc0Hvv//d+Gz6c4czeaz/rWWuv9axB+bul4VH+sCrmEYDEdHn0qjNxZQ8KnnM4AKQXIpvVIWOB1rQp56RGEA2e/+Bb/RSwSKWM0NjXwIGxo3n8fRP/+eUuyYBSj2wQ/YpYQLUFem+dslhLMo7BTJLBhMoCuqy4FFsS5zn23n5dBRDppgGRbvtWpmumNumaA+CrC+aERHM2L9cS61+3/NSqRXF9E9Md8fjauNechWOACh9pr1sRMfIsKbVch/j1FUpS6F+FfOSJdNsJb6uQ+M2g8h4VZYLT9qF191LF24ZZ5e1pZZjiuX34mm+I74LrPuzJ/jjc+j/FORBtxtrb4TFp3aBnyS4LmfNey8rhqqvjAmv3DK1Z4FT+nGBuzoZPyw04xGEnBdHcSW3JoKBDKRc6JQcptPimZDflX3rWy2LCqorafirPZUoOXuNWcbqUB0FE/Ym6c86f5JZLimUo3edR1zfGFDLYX9OMkEp+0AcKoNJhGgd+IJUFLAFOGEc3HGXtrM4Q4u5dPPIQ1g6QjkmvkJIvMWsP1AdBHgu8OC744sSTlC35ZOb/zVaMksAzuD7uWQv29Lbwa62dzCZP/yTkZiXJUOqWd4gASzPMVCZl+hr+JjgwvRjXOyXyBGNmVMA5dwBfszOBuGYGVXIH3CHV+oAIesEUEDt3B6yDsqmbI9VhHiISiMjD29cJ5u4xtal76lqkfbckf3rTOQ8VNavj4VlDrHTG3DK8opPp8RXwfCfk0E9QBYqi0qcAQn7A0Uklf3+lqYnphDaO1rPfUcn1deCjxrE4HenvUBNXIYHDGK21Y9206Y2854r+1lB2vxxHE32nbMrNly3CjambleXvH5VIXk3rONczFKVZRCfMtFkdyf6J87Eoo+GOl60V4W7OzrZAGs1r+wer+lR/8lhfKcy2u/cTcd6cSMAqju+DTEo5gNUG/HR/pNjUFGZX+PunTiKBQC+saW6WGZZ6mmxhzDpo1etEKv0YCtJ2wNy/B7nJh2ph0GLct7B3AAI9/GdGurp1RoKFFbi6M4hk7IFucKn5jmdJcA5a91OJLVAhXMjD+n27ME81fZNs0tM/Cs/DYdmtJY3PJBMrW4rCe7rtOsg/cr0jEjyS1qdAMWirrs0CBh90LzoIwJDSZxkksB0xYTOHJcDLLCS8WjfQecNquz2YpqAUPaliDNHqXgdCCPLy5/0UYXY9bk82YsNx4r14bIZtTbRZMgiKS7Z2q7mJkItf1Nd9aIwReffJWXd6UlpxtJ3UOXIwZG1ojQZ5kFsoC7ksMT6Cjt8jhtvig0lF8J8Xgysjw9E+S8oPFYDz32JIqLsGAKHdb6ppslscNZ/TlagvdWeMzK0fNwtUk21t988ihyxiEHkvIt5VCNLPAiBaL8odW9AzWaAQP8NYtYdNqGuBAp4/wdXFGJXpdoOZEriVXXBAS2PZ774QM/WJYRB6OSjfs3RIzq4Dw0urfhw1dIv2BD2f+kYHNIrEmyGIIP6XKzbs8rcPVRLzN3T+rWeE2pMo3fSkw/s+UXgr6WErV+ORP8o6o8GGp0Sibg2C85EBNFqnaNreIlsPNVxvP4hCCutpImdw3CDFmZOVH/fa8lQcyQqh1zoEwGK4RU66HZ25MApOXCkEBN/aoqjmChHq6U42ng5cgPaLx7xZpQ9B27IbK4HFnpdEuvl5VAc/1nRHTBI3fYy7Mc5Y2SJEQMlZDGVVSerMF6RKw/eOL/vSrcf48re2qKrcbn8jkqoDLEUOMDcH6IYzdmjj3vLOpxtjfvGn1JvWFoZfYxuDHCbZTN0hjgnFv9ATr5W/LDE31YqUZqgXYU/cwga2pgAGUoizAPyKDurq3bQgf7mykjhSyn/qCBuvn2xLNhdGloICRvSYbminn04JVOUcP0UWWNXkIuDEW7Zvv5UgPGgVM1ixs/6Jk81ORrtFyrh15gsBb/2m8fX5qB7+Vq/DxK/D8MQJUIch4cLKrVVcdcu8OFjor1KSpfZboZ5rEbShW88M2xy/HXjAkORu2SkClG3eU6WWqGKjQhjzRUlknn+9zlauwdt/Twq9TOfE0ILsHTBnayVvN+Y3/ZyrEKwzEiqXxqa0QQ5FPEMS8KgC9FjB9bG5HUm2Ede2UN6d42phrePFQBck4Uk9dJSyskUYWOtGaEkZ7LR/66XhtCuy/Pn84+28A8VYYSd2OLS4HyPlxdfIBTsPyEbm4olj2/cyJ3q6vXSYk6ZYwbMEbJymsp0Ahhe2PlA0aNvHtC93xj9NQhRa3pfQCwxdj+AhzNcgfCb0Lpc+BHdzvgZCWQJ4VD+xE7icKv886SVx8YlW3ulsyvSx2w+XtLYU6O/joVeyO4+WzUu+hrdtfJJ+ywP2jKphgZOywcGGQl/B/DEOK3CGFfkLHFFBzqH0waOkxmoQZ0hlZldlyZ7jFJ6CHC0C/jhyRosiMLKg/nanYMLfeTzRFxIGWTlPkbFPC3KempJk/NIVJNS2ONVNn/7NJ53N9Ir9A30dodzLu3a9Twta252YfR/8a0pAjRkzSbTiN8mivLY6HvaN0yfOyuULCuyI2/mcHoTdi8epuhefNonxHsaBLeqxWn5k3LAQdTK67rTEx9WEWkAsywk/D3JicTf7URp1pOR28Uf7rmqAFsqX8jJyhuTnJftjM/nTre+XkVOcQvWVHYXrxabijAvz1BzbLN9KKOQNeHvWf6/LhwceeWybipybTAdM6FTUFkUCVu0l0p5h9q30TXfZaOLE+Qv7fCaF29h2dx/9KKwpnhwea87isNHCnhiOn2u1vJZaohhDzlNsrmsqC1zXgHNPqYJ/9Kg3CrqFbcruEggo+vFpM57Ppk+fR53+yf/DR3yW5711LW3SSaLj05b3apSC/EpJ5hYo6EOhdBXjnydve+kOQYL8+Xu4W09113PV3/yTDBHKKn+i0YCqrN/dClDaW89vxANHCwEnvAi69TsvU6/DXmE33hWSBeDJh70YVjduWVWkgaacfTmYQNhCJ5y81hq5tZX+YYtCaSu9f6s3o6rszlG1kNbB4rD6owckE4L/Iym44qtwJRFHkwxlToWCujzDSav+g0cL+QcWkC0rKCuyKdNCZUqGE5l+cYHOjK4uvmLedsH/GjepuTIlv7X7gd/zxM58AartpPw3NKpOF5Utuy/qEzu97FAvpJJZFEzshfg09SCbVjasa6dViqnh/LmCSbkxc4pgUTZvwVZOrq00m4SjHujWGt+65Wk47ZGhuVHAWZ59nP78GMvTG5PnBG99Ibp8qVhH3OfgQ2vw44llBKNTrqRAjK2IaNOJCMnjm+nFSrHtBFO9z+1AGmOnYuPeRlrEIryafd9GRNxUxgbxI2/Rv9oGvZf/effypyqiWwbRdYWsDhkfF3ltAr0n8EShjIBXngMnMdVIYNmEzcnrI4W1DK3EK8qyYcr6CwdZ8h8WVVMvAy6XLzNjnS/FnY4vv18eXTYYXQZMbuvWiAMHpnC9o83GRvV+pcw324uzqMt4lweUL8TDNYqOlt23gs8+X2Ze9lyWs9eLNbpPiz7U+aDNEfU1QJZdZE7S7sgybIE84VWYD9WBnTzL8tRm6x/vNLbC713iAp+2ip+KIyLzJh48l6MmylB6L7vVk7OwwicebNmuwaZ+4e9Rz68RkTRilvwOa+t5wCp2ezo5z/z+uua5XL2IabQLImJK0xiyYeXH+r2p3q1p4IAala6Eknc4wt94pWCcRYXCp1qlgRdFAUwMHmGrVmU0q0np+/GDSVREtvi+p0zjL9f62FoAjPUhSCsH1m/CLjZx5Dfn0pXm5EVfYE8vvk//vombmCsISWJ4e9MGDF3J8d/USLRsitN/IRN0lVvmes0PkEG3PFPqWdldLx3eoWIG8VPTxYuHYwIJToig+qUlomCW0+/UqtZZ3xktaOcKxB5kh/9TJpswFBfBNIuMwNStztW4f57tYA3d+c3fWpB1Ucwpfmp2tNTit9AzTG+UFOoLZUfR1x3JAV8SEOh9vOd7CHkesFk7/IBmvU96s6kaT35XkVCBMZdi2CNgR+w14F/9slaKecXDzM6XApXSDWg6BYm7ruaR/YptkBA95PklL3I1FuwW7a90b59pQqxOweORJ4QXFGEXFD7fypmPqsU5kAPGjwnSwy5CHc7xST7Nz4tpp36Sf1W8tPQQ56ecI+qKqL3vhBb7jz/rx/kDIHpfRRv5C4+KjaFK4qVifiHQmpv75AH/ELYU6tCCvxGZ3wxl3nUvhaUundUWsb8CP9/aiG5tuuu8pPIQOWO0cC5A/ui1/fdVWgGj9zgGBPUVGQ1YzQ+JCxszGByYvxEJdIJ5ouYqAnY1J9TQlmJDWwQ+Up1R9ZdhYJeJZ3dm/sCnXaMjFNfaDbggxxo68VAlvFQQ3cyA8YtdsfLoUk/913L8t4J1oBRTKN4gFoAH7CnQ/lZHbZYENzi2M6Qis8sLYixQTwz1QAIeQd8Zs7viprPKJMRLtL7M9sPBdDDcpcXFIMRPHvNJz5R5iXbVL9/6uPX+SWWzjs+WBgk7Vs5G09N4XhAPj2vfkeWDR+VCO/fpgujCyyEq3Mzues2/o+c5mX8hr8wQ+Lj3cjTNjKMZMuT/u7u9FWP6lpfaKw92b2CzwWp1J1AUJRV3qRdk9XSYToEfePKgZp3ac4KE4tUVZdqOGEMNzPPD68115VyxfTiwByDG6kMxuxsUeUW+pxfDYvkeXNM2aQCdqzSfdQsmXvk/4VBYzjkrguWUjG7z8T/j4AzmCwXreBKV8a5vOZ+h3lrkaRzZqCvYJoP7i6UpWKHiwXkQBbmtb2MfXslkQLht5WQ0On0rqPY99DfXm89TWASnv4jEfFtDdyVTWWYRWWM9TVp2GgaeDnhITcOLA6mHSxTk9K35igUu3TEdPwczw7TdIOWZk15qxlvmaCHxf5mjqfxtQeLCwsgFzR7wpCA1NZE66khNLbldOcNj/UlIl78W0sKvCAdHCbliDwT/GeE6LR3QR5zdtT6vFrs8B7G2sj8/eT0buwCKor0xwLZUKrBPlRoTTBwUXNPPSubNSNPPWtn7IZD2+HXJw+n6A5Yj9KQzNnukE5qZ66JxztLRpdjA8krwZzd76VcBgYoX6ERnWFu/iz6rGFwQhYxuPorzhjVeJHs4GZ2Jbzm5ZFr5eUKv9+xluO1PosKNiIXrgYeJj88vnBiXtgSEcl906OWXHFAOnXUkh5BfQAwgx1bOrViqK6vO95wRMs6ddSu3XOU6mBmlYTCCL/JP6/i7QCPtBH6JsW/IU7DHYRgc/MfqDd0Jqgf2fAnYc/zY/ttL/zldTE6BY59H3/yd1fgsTYP621AG4Y3FUUoK6wPLHP4eI2tY8UXJkNLlGNP5O35kDr+pvgNmd6Ei2SSKQQY2/F1keOln9xTg68jxc8VrxXTL7YsvdNSmLOQF6uoe9Bx8ojzXwVxX6DEKhdmes0Yy+mGzO6s7SaZD1SgqwQCUA1haKtQ4C95/r8i5sYDtxkDYsqs1nt/2sb/7dtwjW2yp2Fzc7qCxtcYtbTrhWRpUjbyylB/dTFWqFUwUUNTEpM2B9jqHbqEk4Ul/fC2Ty1l93yTy3ulWqeJRtcDUAWWDbK/STwGwu1XfCVPISLFeejMzpu1vmv8rm+pmnDcLuhADjE9kuTnlGpFUxH3MuJZbWJ24h+mX06uHKueO9Gam0urjmgWPRjL3Xl8t3BDuJjr1/Ybevjf4t+V2CR49uQ8VuXz44i79Wm92RmsU73SxpLgwjoXvOeW3g3FqRHoYXBYI/vwbCvifq0sR4IYR1PHI0pUqhD63EZniuLeXE3zjt8JLkoNu2diSFG5VPdln5Fx3VQqCrH3OLGGY0Q4Jf4wrP2Ox2+jPaM3TdRc21kmIbn0+/7iXr1jXBSqihdKUl2jiaO4TVXxlU2vk0QbcySjpZ+n8lWIx8fX5jrA/ZLTGijfZP5hBfZwZrsDKwhkclAC4KZDU9gBoz+jcySn0ff4Fc9mdw+qn5St273y5Tq64LbGc6V078FwmliRE/9/HnhZs9WR+RGKbU1RKdUPe+xMh3XwjojtLHi10gFTaiOI9V8mzdI0oVMnWgaoEBfxJJFiNgSh6jKhkQBTNp7Wy3YSu4q4Xy4qnHUi2BssnQv7J13aSTL9EFKW7rALRHPDvBAtYlWydq1ARuBGbEQOxbq1vZ+/dsKByWLghpK3l5U/UQ9aKkfRUt+fazMAqDE5NdFoDFcF/B0TQgh7XOTIC3xiV3v9ETsURg0/bDTWbTnzAJx2L8d9/qn1be03i1vGttbb2/AY8mlAo8wco63sczcfYU5Omr7qb7m+Vbh1WC3CsD6R9pv/5CjzNx7IrtQIFW1Xmf35F0wt0XRXLSIviFQq4vYkHu+NEpIoPjZDCqYs3kllmlc3ok1Nh3Of2kbW+9TpSD++g/6O7L1NZMooHYtfY/weI8UOe9nSHlsPHilJZGB+fAUgYLpefCmbQItd8gQhYPnEpmSXjfzSc3XSrloIEXUBlyFvcob2CBVRHHqzDStqFYI1cbmQ8QFMsBW7EC/J3fmg4Xrb/eKNq6MFiH5tzoNIKUR1hfeiuDR5xIZmWLl9CQ9c9Z8Cufo5EkcU3tkHuOmtsEYWIndjDVcSD4nqew4Ew2ANSSh23m8HoJ1eGK2/eAL2WI8zBYPJQmbRQ2GqjhG+C272BgH+gfXGngb7euWf8xTdzzG9AKLxb/FK8yQyyHAPD2FcOFEbmCJv6eIBiM0hNdznHRhAXGqFlpr3V6Lu9Dgu/DjUavl49ZQ48ZXj1lOb/eWrik38t6kTtXTO9wCK4A6RhpDyq989TSQdjQOVP3EQqd1hCNwBJ7YA7g52S0aaMXUd7gInuShIgNRdffDP5C0hMGdBJt/dobqv8W56oJwbyQkijBsAN7kQmgL+0d5xsNz1sN/S8Ic6nZSlN6Yd8DXM3BoBI3wPTzRqA8KpR7tsQ/Kg/n/mNAcfV8BH2GqLkbVeBB9DIUt7f7fqTv62cWtFUpzle2F67g2FBgsWgeGgg6k6miG4SX1fQ9Ac85cRA1Nh9JkkKwUN5AoIVz8amB12CvyUNILsAd1hKaqiQdFYJQGsQa/upYpvmhNmYqZCmYWxjo2APRhA0OtAtpSSLaNmdWKYXeDpgJ4r4byCoMOMogbT413XnAGeFT9eAdjFdaUr+R3WEdI/SXLr36YRnMlPfFYPofGSwckj+QFVuV53YUvHjnqdbqUtBG6VgzThGiYwnZMfKxmgqqaYiy1UFG79I1pYjQtqDSwG6pSY+u7mt4KJBBlrfu2S6DOA7/aVI4RncAPnlmqeYt5rvcXJ/cWNzV+H83foBHqQOiz1Uf0Jrga7x0zODLMV0ET3m+b/sLQxnYj5p1yKpocuhs/SAku09zgyOMwRGzbPbgYMio0u5S4OAM0SCEqy7hbKwSfNQLe01WF/Xc2daSTxk/L2nzYL8N9PJhwKLBxKy+DTYdxtxvPXiivY/AQHg0/J1lnyOR6PJ5pZ6Kuw7PekGPgloOJ5siE9dxuNGpc+dL/QoO1KZp1l63ETaLS2+xgpGFYkHYTrlcj4V7SwuLT6p5uc4UUrjYBJPV1pmMJrRAnzDPpuaUIRJDgM4QxiPrv5+DeCQcbQY0qHAvgg03QZedjQVBVM/3xnePtmfhn20U2zz3TRQFjbVD8Ds3ujfCT/hVr2/GPpW3GWcGpwdbJzj+uLeRTrAgZiUC2wf+kg2PwWo87dNZN0HmB5gwjgoPZEBOtyr9JtDFz5JB1mn4JG8uPnnK/6ZfzL2JONbVsTDxnGehf2u8cWURmXdpS/E8OnWYmnx032hVl8F+T8u7Cg6sEOxKZlJscCWhuE8xvq6V1AyB4vZb9lMZobkwLKKy6U8AuLlz7/O50u6XWKo8Qm6mUZF3VnXfSv8111SosKon1zZhI5kOOX3utGPso8xXcIphBiI9YQZt109evxNMZ90a5GRPyhBhENSM1sq/feIBtIMaLiH4BsRM1PkgZFJ3ENFKMcj6LP30v9RgIAso/vj3rDr5J8CG7fsIlsqwAx66vRPi+eKDDpQdj36ulpwNFMJ1pbZGQmSD1uCHF4EOvQsNlXqb6X1hCbfh9LeL1HM+5yeDancpinq6U87rG7GYvfSn0HMo3cX9hsa4fRK+204+STV//Wf50XoNGrUqO3xBKewgaUpADGasUAGtR918ntTGG3teaLiz3WDQ8CLp/lTFt/ZHVGVb5DYDEnMihjN56fajrk70AOc+eJ59XJJcv156++bjky2AAWrK+4fntNp9Pja6K9bcU1iHBrxNzz7UjX6yIpsgJc+pZ1NLzZS8sOyWx2h1NWfjjUHC7LJ9G12gmqZ+4anmh0DJqIeiIqnmwzBrYE1IwvcfVZFVOixFu2wCuYbbqEYrZVjVVpCElbbR6j7ZKwPtLaOadc+luetrowol1OY3zvR5fujS4JztGt0O074TjtYnAkOfvMUMGz+Vrmug+IaDXpucjGWdlF2K1xQS0m2T96cDICdbqx+T+/fclTsnLI7cEI+LQhYr3cUqdNtHnjPDCzUBC+xRJ5T3oICLJop/O71pSsN1deBJ2ljWQOVXHnO+gyqAn51bWTkPg6lzL+q+RK3F/uqmLYF/7OH3xntAhUD/GvKbG0BAwLnyFEAUASQwOUu3aTTOX3CVSBuqE2q/wiFC+xvpp//njNW4qhEsjTpfRmLKTDWx9Gskb1KmtDqQPv9J272retUrWvey8aUqYvpmDn0zYeaA19hZ1SrLZ+SGOOAyBOwI3LXxQngq3vNVRw7n0wvqmeYwIrBqRALpuyko2k7GTbjz/OFm/F9qDb5hPcPQ4/ynBQlQK3Vt7D2YgJxnAOXlmBZLTG8dYOHsvYs4W0bpnjrYMtZN+1VjQ29JN5VvzJ9eIFcCcf5Od4t+hBLlKn0zLSTu9SNWUf5PzwNbYwmOPO39ds2cnBwJr6z7QSzgqV/su+oPrEIMHegJ7xjY8XRLwATL8Ne2jUEdU95q4cqyplbo0hv9gb14WkFY7HfMYOCYwTDTNAIciYler/Xcts7a+iE4l1Nsp+/9X1zNI3jPJv4+p/zdhTviuEcrDQH58837+LfgrKXkhDXEa7/YDAJ9J7O43l3VZOEzRU/tp3wHPL5dP0zyvB+ZVtQl1zOIRzdqbnGzhUF/7RSLCEedsDcKkQT5RUK/Ru3YrP+p9Y1MhpAoDIoRzO+VIC0HeHEtmuPyzlnt2UqOWpSP2HZyqlktKnrw8Jxu+LT/9Dx/X8xECXt1bwy9yO5ukOaSKSwDhFyAYD7wMyuSuWAD6wDvAz/DR/+z38k7MJvQtEf83T+8sUeWEn3oS1TBAEeSX3EZjbPduHyL75O7cRi/gCyMx05+b/j1b+Qv/AouR4qdgug/Hli9NuO1ASI/wBTMxbwRlcj5WmU2FgvMhoD+ospXzw1bXr3/YRUeXn1Cz3ASFaKScTDzLqWYli+5WLjIQ0eytmzREr0KK2kN16OYnNMxf+HLjO/EaF9GbkwSftEihOyfxYOxJjH7QaQNSso66KwSwrOWho45qJUEPiFYLIhFse5E3wUDXh0N+CwIxMIlx5FIq1qGBDwloa9Zfv4G1WN+pfE5ersrxQW2kdGxU1YXNA+FbikTWiZA5HpC6P+hZVgOBCZFgoUZWbO8enfLBNjoIscWFwZYQwYLB2nX/CZObwPXmYUUEN307p85crS43AlMqBqlJWlQsBbrBoAPpUx6OFEJZg0lsXcvN8p6Da9KO0JVcYuyB+UWGw9elS0bVL/NFxleFC91087w/93t2mrjy79KtZTsriJ8Ot407MvTcMN4vK541/QBeC9rE4Uo4eKFqar/Od0LIulyJMQrp7gAELtNZRu+vQhn/QYGrDfKLQD73IHNfGlQ8oC7yYHfDOdI1Fd5USqslYGpkys11cs1y0UJRPHqSurokUjL+Qi7CEivrJItX/jtYiLdYETY61WLWo2lfgwCrW0enBwY+qK7pTGbLDnR0W/e+Wm+4UsLW3Ks0TK3C6wejSYz2X4kx8jA0FkgbCBYfECQ/T6Qlg4zOV8B2GH+sBaj7MgmLQQg3Kerp+cVGOgCNy1Tn3yIC/tR6/A1Yu8s2d3oV3uzVayKVs9iUy6VtDesXIzmtI230SbEEyaiJkrBodlbhEkXF1yldCbu8XE+RApyOEaxo7LgxNsZtOhHIOQPn9+pJufTKJ9oCByBfVuRosycNdGHamJskpwUxtP/8zrS+fVUsXRkUg4sh4R8ctII1+jPuRC8ka+sov2RZlVrBiy2AgInHNaa/rayefSw+ZCHWrxN34p/pvSOYW2VTC89iXCm8Zl3/ONoMuwWUv8r8Nb2ssfADaE259OLvA6Ffbm3B4BQ3E/UnJKhrKn0tfxgWfov7L65tCYOD68wRipKPOWiKLYArkGawS8FN6Tabzz0SA63tpCpewnxxEGXusAwSBfHde0xPHEECNzsl3J0FElbvSgw1OeaYNBuJhoOxb0vY9J2Z1LDYToxZ9difPeJmX262jMLlLimDcFR/PPhrnxpCaxEcv9HwFdFyKuHuvL+E0tdqUXmb2zUgcB9L/bjQl3rQKMFpPE4WjfhuEbUTNT1IHTF+iE5zFpF2AgdZFehRYi3tP9+vI4JulxE+nLYfKmlqic85OU4z8ataez1Dhnuw4ncSH8Z4LE5/jzKPqRX+oXWMzNctPafOd502LlVNEBKn6nwqIR2eKoIubVDAGzerRBQX5HjCOttdPZtOk/a8/7if+ldr7W1kvIOK1epUcuNoZx2tKhx+IojWN5UZeNWGV5TjAGymUPFnJxwS6sYV4YHmtu5LAheDCWHjYW6pCHT+IXr7+6xwW4JWWvS5KFeCK6XpbswScDBCRQe/O+VFYgRkxA3VnpNXFtnN4q7f9dLVD+gyU3nuGKnNhvR7TZOQUWK3l+3Pr6L7m0rnm4rrO/PlFw8fVxjaC7D3Xa6Vb5neNqca3jxfl9q6DF71HQUerKUnHgzIuuoh+V7U12UMM3o8CzyqGGyucmGIaH7O6a9rsOOmKTuNov4G6VF/+pFuc4GjB+vPffxC9PLx++ydLdCanyOxe9zwPARCSwbNsRmH6dI9TLvrsHlKzeZjwRLT+1+M5m04hRUaiq9oO7QV7jfxF3NxCXuFkQIq7CpI31d/3eCBQU5yecEq70/ugEJ3OsUMyHNZ1bimNF/yj4k8kphp7UyWb/yBFtcZSGXZVRxTaBoL6B1pGSHN/AIGurw6A94f9ED7XlrwYb0pzENLv78CDdWCpJqgGUE5PPLx+q2TJ5HYQ1TrZcity7zg15M5yLvvVfy1Icg2J6mtltRJcsb6HVq3jw/BYPPXoNfJkDpCaz1svCeG41BsMBweiQWzd3y1U8rk5CBmBl/MCrM0QUs99arPwVzOdkHy6w/UZiUl/U5X4blX7HxiGZ6hRjffHM8FxzCYeD0XA2V4pKHL86mGTL6hdVj6rH2zFZ7petA3D3L6nlH/sp6xjnILL4ZVDMV5B/B1ZXPAXQyjGPr2NM59J1gkk1MXO2YHFInWBC7XVeLHqXZh6dsDbGRyU6wQp48Dqvp3deEoHlh83uoL4nmQb9BiuKMFz6SE0YEFbKYEfF0tJVzW6jiMNxzwn2203MTZ/KqJe/LuSil+KdFfmLKMsd/dvyAi7W+djaByXFh9WcHGtKOi/g05RYJog8EfognNMD8cZnWKCWhUKKxsW8weIU73q5sh1+wSFH2cuwCbdjhSpJ4mEP4x0nWZOBSmJdraAT3VTtPcbnRHZgJ+l1HMmrgKP5uHZa5rndtzzupWSKDNTI5/o3/KZJ/LraUuTDHk7XP6TxrGQo7FjOz/zCS+8tPzKWX93HgaHxk4J+ltihR1slEe2V48ZrxtrSWMYOfOrS5AuO4rkKoSfXgBC6Oemp12f0lX99N5FMzoGKJ7L23mD07AllXievVEpjdY9xElkGV+733O7nWVo0BiXUGNMDSRscg5G6wtI6GVe5t3USoruoOou1+ZXgejAL7BQzdi+4vx68cNDjBi/SuUK9B9lwv/O451tAXMr3L5JfvV5IX9ADMI5bzvYq4/ReC6IfqrVuXooJtXcAryBpk3HiI/gGY+IqjRCerZ/y4vWHePkdbxBq853oUuAcO1aqq2g1AlyDQM6WIxKI3Z8gJ76XGauEPL2+qgEi6UPsvG8RMwhguf7dsoj7HKC3NiuIfxuCr0ZMLJG/37XeX9f0imu6/ffSQD7AVgFuNAtGzl5mZm3aU4Jup/uZb7amVtlH3sG2zlgRSn8Ipvlot+ubwEqilqcEoi8V0jUYVT42/yeRq6Tp3S2YNCiYMBQjnAxDndlHyvgeVw/2fURTR8DN/40UAWLLlyaGk7zERuSAQ9G4ygSivAvv0hE9QrSgOttbFH9XS5RvK2WxYtOMwBmiJ4xo3k+jY0Coo73ZuWO8V/MlQGSQKPAd5LIROuZdt5tzRTjeegwAE56Qh9Yvf6INQv/bhw7xTdBvexFb1cuXhjUXJPGBsJZyrPBv92DK/DyFaZc11vX8WMHT/W5fs5ET51L1UTTRFEK51R6E7ttnDWP3z+0xBisz1o2SYVuAI1Q6k/P7eX7CJLd1NZUmlX5EVB4KynlXPX89cV2zAFa4y141erUSDBcdkg8ukgVbneV8WjcgBMe+rE2T9PXfuJqv5TCET/KdzIVdlQt5XeKOCVVZS6cPwQ3iwM91rhS+IdjjjirupqRZX/KvTkOXt9tHjdSsGXwd0xfGmU/Rlzim8RVovkidY2dJcMcBq+tJn32M5zO8ubMb4D43Y7HrpWNbdbd0YRdFuUxQ/5SXp3UR1l/cLs40n+aEoVmlcJ9lFp04oRJeyo0OlciUy6lTU69RDeewJ8NBE5meYjnlLp5vn2SFN9gVZpY/6JbkPKX1JKH34NSSOZ1N1v7ttmmEaBEkjsCfJ6MfkSKMY33pcd5qLzo7ZfHc6lstCnbaW/V68YglLxqUl6t/8jIC2SSXWBote3fokCFfV4vwfDYl6XxN2RbPPAU6eqUptthRQXJ71LY1Rvh2/8wceOP5Jvd+uCDkPBGF3d2bLbWfG8L5kerLjqg7Cf2jFYhuwoaVRcl3YUvDxvKz5fRq0iyxt/UVIx16x+XjlGy3D3TqD1vSJ+cerpdPOk1JJmtEHX6LbYuoxdCOer+fababRZLW+n5CbxIJxISd00cDKLL36wY1svZmEf8TTEZGlwgS+pvUCPvlycnzOHWv0Q+lk+9D9CdXrRyMGrTN4ZLWV+OhR7vHRQufzIIoC0BuCT2Dg4qMQye7A7eomfvqCW7i1YUxIfhQrfaqv6aL1cnViBlZIO4Q5yNKjAz8MNcL8jH8WH5w3oy2k/l3tDnP1rcWDoiWEa0jlG4a8RGhYMlJBkDh8k4fDPN/3Ivsxso1+y1npROOdxWwbiB73YhXZtfjzx8RT9F1lu3+ic0EAs/7fiHEcQxwpKWrewnZ2c4AztE+I2XnzsZCIW65SZviuwk342AnDNaXh6ouZF5AiFYcFjt7u7UXnBlePrnbpp1zeL8ciGf5xvZHJHJ+nYX+zt4L+EICT+qm+jx7C82cnFbAeO+RSkBsRTybfYE92qewMlbVY58/+St/652FK+JlmK9k+rgP4qvc/KVPJ9ja1OsapvuLUWJMs28ZvUNKTnUVExSr2jYlsbpn5sA6SmIqS1hKvmksGzhI7E2lNKPZahluX8ZdM5FlbW8lhboGWAZfU3/Nn8KxU3uwAaJk4OedexEK3EvtTXY488w4P94xQJkfXWs2yZkYGRALFeWGlxpSxjoHcn+k/tHJQH+spzu5ZGXBOiJsbhhcEhFtjshjAPwWzudIyrTb3TPKxhM/pAIqcz6ab+fkV/6cizYPHLtkKMeevfP6YuP+jKSONZOfp7lzeRCkKIAo8TeGqxqaCeJJkG7MhBZJYDbdLSAulf3X5hofwQtWv7ebhRfIVfw0ySzQ8i6XRHYWNw63NvOWY8bx4fsKeow/wWwHm0B8qoiOw0gM73bPILJyrtpXIqZvmgV+6AYnMOrJfADYeX7KBzdsrpoxHhgZ7M2p/SBsn5tJ6pYZYrHG8i2XqXi3eRZNeNtGtjRs0i8nh7OOP+i6jirPNCuH02VDVcfj5+GtRPVwEr1NV1UTiG1mkJeoUTvDCe0gfD5NZIsmHBSbHO2gYVVV+9cyC34UdJWfGu4Fz98hNVaMSSe7yWI4GYwZWP88zxBWszEpEhyD4u5QsKDV08aButD6qric/s0h9hMi4A8KoYlqUo9fUjx8vtwekqRpm2FzTpqixTNiYWYyS2xa5imYNAj4PPU5EbZLxMIURSBuMnjZ/g9QBSGUe6wNEy/Pn+FSjhFyx0Yg5XibMLKAEFrlhXqsw97n2dMbDGtahk0LWoxsr0z6GgozqrDC2VGHyYW59tfFpQ1V0rOqSVVdhlKLMFHLeSHxnMXDtFd59s7WVqfSPuVVZ8mWrweTxYpfDgqes9oxzubUdTen1FA3z5Fi4AMYeVUi+rZKQsZild1CdEqJdDjKOrWEU3bHNv+BZByoVcg9tUpZ1S8FT8sahKf5N2IjQs+f4myfybi2cfIwMQuZNW+Ca/mVVXWUFG5XYSFZmMJlsBniH3oTYcmz+IEZ1n5WMgg7VmfyeBAPmIPAUHb4TBQ3aZHeBsfLcKvjr40edtmZwEJ+A5U78VeFbAlj6aTN7H9wM23bkHw/wWezIOXi5WE2hmjlneimTO/lKd/E708fjxptIymiNnvSJx/Orsj7GEdT86ozEp/26uOuOtMPCbDfJtm8s8zS3ad977qncS/UQtmRiQTKvvZ3SOzzMNAEr2up5en70AkjYpqC9aZ+coIDm8iuuniHKpkbh7t1Ujw6uZlE33EhXb+EUYCdgalfSuSzOhhB8bprSa1eNwkd0BSTOItuXDVj8LIQSPGYpZR2F2+JkYMtjQM6y1jTn7C605WoLQ2AVYDct1pSdVnXNEx8GFYb8VkvDXFW+y0i6ah/9FfaRTN54h/7e6KxJ+T9no1p75cZDBby/D8blVSd7gzaHZBRwDO+DgouhkknxqDUmDwEwvFJDOMD295e9YNc/yA3mgF0wmrARHnHzEp/evlLK+kCXmonYPSypfhHNVcisK/hR4YVVYPwGo7wZO2IerACOY/h/1/LAWtz0C6ilmYbgu/j+Jpa528/SiEW96/+hdbbb31PV5CowRvmy+ZTxgJj0J9BzKDL3hftI0gIZ3Mk0e+RxRRILDS3d07isikILz2g15OvCjIccg2B6ELmexhOXyos0W6LtrTeSzYPbBJdHQX1RmHhEj04CnWppJqa3VNXBcgJ2WVeXDKhgPvkm9pveA2A3Wgst6m1patOAqTST6v7AygX1xcAuFyB86ibj+l/f2ItESMaRZMjLhPO/Wjx/gOCxOlfd4mr7K4L08EdcA6iktJZUHYKe5Ym8C4AaPYJmz7ZHjTUXU/3T8fulj8niQss7upBFzIg6La8SXjV12jfrFWGoUBU+BhY1tz5MjywD0IReJN8DUgQpNSPqPtNM31iRevtRE7kYVQsbfhEVEW8KYOQETfRP+SQ5Lz6aKFMRXxlZfkkXLzjPMlkMD0Ac7C85FhNxqQGPyD8NpDlWeBRscEWvFJr/K+hutH0oOfB1Qhn20eoz7lsbuEMJf/RY2PfJVi+nd3/VxaVktXCSDbgKfHygsHClK61PJOJSC86YUYMqO3a9LB/4yGtoJnZRlRyCPdHqsocbpekKke5BIiav9Z6gs+TODeaKlYX0UfGB4/Gwhe0SANH+7IArLzyO7LvqHK3JWMsA6u+yH6Mabqpf/PmGMDgT07nenlcrK18/V7kQVr8ErtzfLsnLkPf8iIdN23+9tVomGXl8LiAxZW3vuiCHzeiE2GvQDmRfJZ4/Kb4H5mWEKfMhMrHe9FHnHErlP3pSjiy6vpmmEIG///ysbKKg2Ig3aHZKZUBLAq/T9Ja7kvUHWfPanSja1/62fhQ45yqEfkz+OJ/ihIDgEoQx2Dxld8D44Ov4gJJl75HfPrBU75v6y0HugypLB4yH0ydjPZ8dTaxtvRlVxLVwvcfbH6htUVZdVPyJhFVhpKPDs68z917Cg168SXuqKoVuUOMJNHgwo9R2bU7MaWGVHmUnqsnzkd9oIZhq0IBFcxf3OeQ7vNNSUcuT1f2ZlhdIXXEWAczNhGnNwlr8Esu8gxYWFJhryyy3YVHzUbLcMFi9Pg5+ArmMcRBlt53NU0Jt63el2wIm0a81b6ViVgUW7XRhQ0FObAFuzdiT1OEGtzVrNkwMGwpuW0yCjfnUh0FNX9Y4TFhIstm3kpE77NTfr3XmNQhPNOlHzjD1cWgTQo2cGUvsSQ6MuPayWfN+R60ppyTI2s0qYPInVb0XuHq1Y7cDu0HvHGjJXC89tzHHPvbyyynpHQjIHkB/OvzaBbK+ZgkUBWnV6uUAPByqyaL3nbFjquQkPnbsrsqdO1a7XItEjBNRMRz8qIq2HF/HHJrRUDQAvi7mT9LTRl9GAzkXDeYu9Sb0Uqpj4vHYmYGe/J0jh+DQNzfa9hvrh4C3qRSo8Q8Cb1wpHhaUlXNIC0AdncC2F2y92bbGcMscFxTOvaKnv+KrZSQuVIHJMeXjMViJqP3II1zfxmOFJ4L8Tek7KYgZ3kCxJRnQEx5jmuwYk70+ilybCx2Yoo8EPd/k9/fI/qAJSSHD6SJrH0DnbDfKcESYFkIbUItxjNdku2zSJ32xqEEG8Rmk5o8rzqo2mpAAKLA3wuRv4DwAO9K3UYrHJTBlH1gZvx59jmaedMTlFRWgmlg0ybC8on+jMosuizx2kVhUEBObFXXPYvtmdCv/QQJ8WwA0mq8eKIPeI4se5OkqsUPv2D9+2aRaC4gC4GynxN1tdd1Swp/AbwMF9K0qI7dLhx2WGnZLy0TFu6tG19FRARiPLj3Rp/sliC6/nW9cy30U8pPtG+GITanFWLcc+sIbrs2cGqUAXDG6G3HqHao2ZIx9+AOQUttw3Ftg1KO5nE0yZwCAfAVKtYJOpATXTqlY6ry2MfaN98jNrFNaWMmojpVHTlyvjOG2RcUNTLrUk0UxEnZdR05DGVstAXt06hxEXq5JcnAmXXA8+DyvNZS96Ee6V4VrKsYOUzUslHuodeSderCXsJNXFtPMnf7QbHGrOmqeWc0qKoY+IGoz5CIkYx1/8wuLHekX4wQ1i2udBjxOnaDbykJaoK0UxMnsEAU+8VjuV6qMwW/dBZjFEjiusLEl7t3NQ9lABpV/qedGPD8LwyXaH9QkI+3MhkToqycWslVl1BGL7t+rhmgAnuDHLq8hBWuKt63thhTYnwReavQLbNBh2nVCR8vGNdhpYds2bjqZumf7w/Z+wzrpQsq9EqKL+xHlS7JsOH8IrcwCoxdOuOiZ6boAlsN47okZMIQFv90IUfkUgpexhTI3WerNImhSD3ZCknUKyG7tI8hR6Os7n7GRKnjyu437mMiTjTuzcTL0PfWdKTojEE5/QJFFTsKz+VSZboxK79LQGMnHrp6wlWYYa89JklftO240akWATnJ5HPxeSldMgSHuJY9mYT/xCrhUPcJAzyMomxBVVcn43/XsaM4HtkUtflL/k6pK9sjgs8B1RwYvcVnL+AV/V1teXvmbDs9OauubNZEI5R3CTAIP/9paKjM0gXLgyP1RhiYb+sDBh3gb2hTj/CoQb2HpBgw/yIKcfcm07KA/KE+2E1rwqA3d9jUXcJSWf5QYvUVIJYiBiiHOLBv6ExkYCW/Co/uH4FQEnn8/cQ5L9vfmCSVlPqxtgVkPTPBmSNLaspJ6UgjXmOtHopKJIz/T6tuntvAB4GEoOmtKAKaIfTf2dUBootEIexu3q9K4SpRuH59DEEMZjVIrQkdyIWVmYlPVt2eSF/6dd8ZCeUElh2bWisGUcRVm13wBmEb3wQnUQVA1hsfxoYXCOst/mp/lgI9Vdxr2vpTLUh0+iLGQrb7wRA87cKBNjYCvI2IJI5je6lGCQdbCUKz2IGPgq4KN28e0L/wqFF/9C0L7HQpzhGHHVR9phuIu7GVHhaGb6rvhtlYoGbYliPkAnat4HEn9ja+lnFbHWG0ubnl6S2tdMAACgkh+5gXhvt1Fj061afsxo7M/9P8da0I7KDuM74cE/dIadIlsCmvJ0PAo2mzKd1zIUZKwEL9nexHqoyaJjRSedwh19TCHubFYSrdZY9esoqKQleV5eftuQq2sBiJkDAyDCKeKFDVLo2WwSLaC61ps0wkPkYqafUiGPD4o4DHHx4qrGIeB15kwKMXNTkAPM/OpibvkIC/8UpNty3nStV4CO+Zbpt9STbYnix4z0JkcdT2zPx9CCt0twtapnhQLTi1B6wdVRsUIWgoTD8r7zAEPD1q0JZzdXM1hPfl6uNGrLIkZ884Zelgn+LN9fT5VJ/Lg7AfsThVP2KdNjeMt8o9/fQZfZ8UVkY03mwseGbY+aaxc7LtKO67t94lj3Gr+K46tH6+XsTiUjRVSmCN/3L4qaiQjUfXJS7uULgA68dHw8fikOVM9Z9vDHIHt/FI+XGaFa3tWbhrvmMZ1R/wPuQ2vwxNgtBZrNJyByXMHxmT8mDg9a2zY3BD2hmGowY+b4tPdDDAkeSSMlqCAUR9qYCfku+1vx+DOGnPKyqVc2JiMm8zlYzdhteUZ/s8nErFb9qmVvxCKpWllEPVD2wrz5EqYOPLHrlCMO+LncGwC4BdiqQLIp1yBGrdiFIV4MQVG+ELrt1mZg/H35FWNF14cqXHzD/9vonPJkTvIbiN/CQEkwQehJ2jLqpK+ZcvnxLXQcjmFXF+MNighY31PrcR4Q/mUsCZMQzQIR3rdcj9dRhKlBfTlOvWXlxT/G14TGfDYzCW6YCfYAj+GLBeMsB6rXpey9hc95d7x180RZD6uB5/3nR0pGeTBr7RcMz7Wd5Y8UtxJTPIsiirjej3Cw+ltfMoqI07Q60b2HVrhRaG6AUHdUhhWqHh5Hl6UBjGOn95wMb7ICOmKf1o7EUGpMvfvbuq1UcH4d1tiEg/0Ds7v18ECuizC+HouF5J3JDSPcVJvsfPJOcy/XJAkhCgiR2TNxRFWKXSfdTGrofc+8nsPjTaAnievDp4ej797+mJ1znE3inLdHgt5JLUiPRoexlZAEbH4AWzMscI32KxpbjwQXtrutsdDivEScHc8mX0nBA9Z2PyFB3w9ukwWFK6xK91A1ZMdCLRWODw2L6RAw5POFVfdsqP05W9+mX7ghtjzM2O8UifkqlHgQdR0gK1B8mpt6keJIqwO64uCfHLcpU8wXCf7pHJW2of+VT53Xlxec0+Awg9qrsMEaiYJ3APGBBf+7xeSCF2ClRCzMxNAVS5a5X1JRAKX7U8Z3JohNhX0EYMGb5liyPI/XV2y0rcUe3B+sqIChImBGs82wnv8gkpudz9tfJj3eAP+8lpe91Yc8ZhtP6P8IE7e2NuzU/Ygm6NoV9td5/BXRuR5STv00/G7oG8LtYFOGwJ4P0CGewYV3es8bnYqiMiiG8tpw7RnLLB+pJrFNzAKVHF+zVuRRhhiJmFNeWPZADd/pSRdrFOlh7j86Nka7+ah2iPsir96F1TuiAxUZyAOihPYOBKVLExCG+ANZfZBd+DI4cm5dB9mJpuYjxgEnTV+Jx5L0pEvD3PcK2r5bdOHmqWfvsEV5dqbayS0xkhbjY7MfVJ4IHoTVZvBgFoVE+jHNcxOhFoNX25mFYi4h191XhFcneHwgM0J06qFI+qeaYOgBfoc7hthQgKoLezZ2Grpa/vXYY2PI4YAkuHDT/8+/0lmDbA81g2nZ0tijD1c9ah7ZPY9cnjIbhqH9tWT0oA4aoffnXYs9QQpUzL3fX8mp9zmuiYrIr0HhF1BszA4u+oRYN5DepE5tLiw2rexH3KqlwFZfNUKAqxYIx9RP984dLhBiU7IpKK7Uq+ceYurYacQ8o73MUx3LUVEMX7JXk1omZjFtZK5tWsIDGZGZX2e1SJPLob7SnQzdLXQQ55Qe7qi0QVT4WvtBWaHgLncNbajFRyl8wBnmYSgRROn9wBU8WuLCs7F2k/8CW0bLc56BKq2za5Yfv2asIWOBu4U1a8a0RFj/RWYqvbJtkeCWPVDhM2rHKZ9H1fYY9yOVlzzgjYshwOna6qkQb5dYe6jBZfgHJrU9LZkX6zUQA2u5+9tYl+HBXHUDIsg4tAjSGNvC/JiPyjy+2wMZKVWCZumghkT16+nqOztrAdvVoeJME/sVu9VSqRV3eL7jR9/MP9WTlbIGALCUOAGweKoARv9PS7fZ/WcDTcahvTcHS+6gMOss6n8pLFHbIPsNw6N4KgZkmVTloPXab6BlDkEX2DxZbfwieAA4GbZDXYJmODWCMdhz81uzl4dyJurygTZWzCSToHF2VQMIldOLiX3ae9dqabO33GqK71Wb4VWA4MpvcOzwlImGopRVDoRDKxabM9ZjzSva0grpXVxOhTjHn6B28f9Xr3419NqalhngCQcMijN3bKoWwHyu5beXmuYs8SIdETpmHZlsMLlmwO4Y3RK6egXSHgqnsw78fMb294Ta0tF/KZS+8cVfNqHYAWQRisDGUXXZd3yACdGeAKeZC2A+plVHbKyJVw0orD9+uTFI2kVH7ZpE2UnCaxTY4hrbZHOrWns/Q4Z1Qz+4+PcUWEPA4yPR1BH8Tj2MUyzWV2k/WDaxm7sdYe3qbBQ1JOntdy1PCB1+FEBLFIH02n40p53fHH1y7oGeCCiq9c0DgR3YNHk4RUfp11dLddm5Nj0MLoMgboMsLoMID1aJLu98OIERH3JpWJlRI+14TEQFYzZVweAZxKPpQ21FVFW+invO02wAUGwtSQYx70wl99KVB2n2peLx7OH/SKuWxoJMt6eR/2LpiRMXrA95TxbZw+z0LRGBKeneuHJ20F4kR1yPzIZXvpyjWYA+ApEahMw/OOw4TA8q0hgsjjXt3CUIL19tktj/FLB1abMCnhebll/cnzHmmMVcSqf7E0joFnvaOavhUV+3PQDvFs2g0WXBMlAX8yvucjRcp1WIis2Z7FMhM5d82uehrE5ZJUKVZuo3V0pksadhGpa8M0fdMCwWiRW9d/y7WhcLAy3TJm+z2SbFav5B3sxbhFe/t0dxOARo5Onoew/eP5b8CpdM70hgxlilat7gWyRfk5GdCjRSHy6gmJ6ghJ50Zf1W4Z/Di06Dp+g04s/oG04TG3gSHq8bot7mJ8GhWdFA8/oRQDXMm83IuXFtYpHrYqJhGl8z7+CTZdBs7eJoAvZp707viUHJa5IQN0fUMK8QC8b6pN7m4q2tdwhVUJHvYFQD4PD79SV5OYs7dsHi8dK+4UV/ouJhHCapMxynKarkTt5UlfVy+bgyFrhxYWJeYyDhrkF722HD6XJL6U5Gg7ENzsgMhRv9x7Qo/w0MquBCVsrhuXLM+HHFtmEDj+9Pzwkk0gnmkIj0OPXqAUlJdViUYLm+o1nOoUK/l1dvcRfagBvbvutkyzHmzl3D6C0D+E1U50s8wAyk54MxeclNKgM9SCxa5IL5AHhL3ZGmJMveB5YrdxIZckG456tenwrstwyn3vWwskGwAF2ytQKKSdTMfxMQ2bUzywXDkk+UtmFj8lW4MkwRDB8PZrONLq6Zdo6052i5acUWmY5PlO+KRvCKuV6FqZNFSlnsR2fjViIorH76mpO8Por5ya/5ATcy2pHCwQohXintwCTzTOWKjhGMpFeu67wDzT6xLMab8xxZq2oFlnNfExc+YnVjjJovEhPglot5X+WqT0/TE34sTqd+ej1COlk99XRvJUomEp6nUqUdb5rQQOztaWZ/4tQoC7SLa+D3ia6gtV7S3Fp1B2QforppMnojSaw8N/hfb46Vg7URdPGf8PO2vSzAAiaffuuRazRB54JijkI1Zitek2P7nTUFFaM6KiI1Tm3m2R57TP6qioRLuqHmONVj0azOsyba0k3Mv7cU+p1Gn/cO4nGZk5mWDNuEL2WDEmwLsylmiV9JZvacvLQ1XE2bGtrncHXNL319xJspsM8ddvut4H/Gb74qGo7VP6EHehJxO6kK9WVqzjwuaCceyA56n/qZYTdC4/HiDcRs/GG8/N9nI0Fep2zl1TK0PaoShgMpZ20CJjDgBObongSwBwdMZDrImDLb3hZXSwx+Jh5mtL+HY0q/00Y/AaKXhFS++IKgFpxeMxOOsYXJOkZHvvWy/d7ALj2HRydsbj/aKUozO1GEhBpkxV8h5LeWA0y1t55FhBGFEdMSmZIghNQtrTywLHRw8lZIWIZW6yIkpX2WMIcEn7DkRL1Bi4eKsDKLTeBxBtnt7gwzP6KpquFCWl7hPF0BjyywuwrVE4SkNSV6LtE3TUrC1HziVJjpTNc/Vk1+JQfme/IUD2v/h4OFQ5xYfoKkqYWWJ4j0vy/CZrqmtZ2ecec4tc6Kh5W46Cy0bBBQ6m8r7vMXcqQ7Al6n2phh3hiVXMwu2NUD48k8AtA9TOzNsZI/BpGSGi5ShDtCZ44wVVHOPY/H8x9n4MwLkgMsklXyrsGUPcUb8fxO19ng1BMz/l/E4cmxwbqLTMqzsztUonS90hxf1y1Hwltq+NMe62EhOxR4o91vSrhD43/0PuFAOKuU2+/NSSe4FmKq3QaQCmRRcd2OMQQS+iSqd+07VkxMeCwh1/gu2/rtg+eqVm3tD4OHaBUd2SM3T1pPWMt5797tDhjywqu7CvOzGntygrRVBVR4vww2iDK6EMC/O2MSkXLN9Gf+NdTPYP4SYymoSxMLhSrvIa3uYP6RgAVv78esinS45tFbdg6El2W1dNG21/d+H55V7Db2eiOgFg85gwiJ4LaXuYLi/6KpbhbPvLxi0ZlDBoQ5MUvFBfcusfPAcHfXwu7J0zfhp2+DyU7JauulQu1MbJysQnJjub4UqzKMpjsb3kjrnhzLNcAeLPk62pUuJve0bCn4/WznnZWp5BwlNLMt5WKzhyuN63YzBnvBmH6Or7u4OZsZFraypfl8QlFYWINbhf5t+IYxE81Lgkwn7Sd/ApaXO6jCjE/begrj74E4w3oi2q5g0GKJHt+W3CRS3yBJQcH+7qKCsgXRSvzM4P67gok1vnJ0lq5SnaEwXcDr4LdBmNqt+4CDr4lxEMfXra+69yc6EKDH+fdWW1Mv9qemWyg3dp6PsMb5qjv1b4SN0STqoAsCyKUjq77a+ssac4lFXS7mks9BlKTnytD065nvyYIKfB2fBEhekfJfpnbRXnshYH9Pamszb9Cl+1iCh0cTj6LZfFXMx6nhVTmh3nMtxB9yLqJXUjxjtfhhDL7j3e4u45gad2q+uSPSVK98MokYd70ZXWjEEsTZdR4Q9ZCTZeXSu6/1oy+0AzjWbma2Esxy+7S7Z1dLPLDdpB8sKDp946fIGPHUaK//tXGhuFRF3Qp0t5rQfWX99UyPx4x/byUPUjQ4J7oHdzQL8kbMzRWWoGvDaskJ6V1/7AtuuV+8Q+g+qLWKuFf+FD/YVqD0Kteayeu6c/RYPIyFM6aK+kHa9vTgeLGh9/o/lvDbhMtML99l7RqEOC7nH6ZK8QTpfhJYjO5KmVycLDjWi3tTGpW9D/x9ZbQEW5te/DgiAoYqCEICAOoAwl3VJKCtId0tLCgDSIikrD0N01dDOURSPdNUjIEALSMNT3PAP6nt+3/mud5ZrjOfvZde9737Wvi62+8nNu4SN7xmf++XFuyjNfq2qYWJ6ErQ1G1hgc3P5KaxzoQbPEwIIX+K0tLa5xQ00rasfCqOAYHWW9JhYLk6XIK3wEuJSXYYi19EcMcDAB84TwG64ZJPgqZE+4X54CWEsHOfq93/p+6nE+ZAseODy8ZZi3j9DwR2CQVur6YUhdC07Po5zl9PffI2XOU9cgpDpT+OSWDLuRsMjbOJdn/vPJDfkl0IWeb/WzxcwxSJxviUSGpzq32X4/12JgA1bwiVgsQX4gPIv5PYNizFDl8PXJfdxhHkwso4k1fKRN0HExk78oak5QpJaCodvcPSmdJF9CVN70zjQd7ToGqSHjxCZLXxklA1w3lv3AIoYT+4dHOPg9QcObxMYWJe8LOJVJ+5gBcsHmvezDQXerXWSaCFoasFX+BIswL79A+b8vMPiDoEqu4sbzpqiPWDTyNZfjSRZ6uAfNMUN4jjT5qsGbJ449e2/lCsaPWMLxPT8WbFwZyIPJ3s8rfAIspawTgg36LMd/QDT6A7Y5zbpJ6EYZnv88L4mbuxMHsJg6xlFg8gEEwXPLXUmUJ5G1ZQDkUDZd1VnZSDBYL1YR5DVA5HIyid9HBj9JptEPImlviNw/SJi6LVaVkH6Iw5N0ic1Gmt3qgQNOxsf7OWS8vgFECW1+fgo/3zaJqZ8cfjN3WMzU82S1GV7qa6Z3cHiZTYvDmeStoe3z44kYW+lE/cKNvzMGFr8FB+ht5nZRsn/c1rOrevBFZS/JMk6Hyl1hjCdj0UBGoKVReQ3aQ5xBI88nuu34zTVt2CfRW6JJfwduJEj8VS6d3YbzgcsLkVsXY+gxlc1+XVarbtsxT+xb1v10RoV5BkYKSPKPROXnacRDrWQjefA4+5D04YMa9wH/hV6QlJx3Jn159jjjma88iepgSYl2oS29O5f2fQHu8hgtXVwL/0k+YFSe708dT/67U1GJj5Kk2J7ldAO/1dUMRwvSRmW2zcueOBYzDEd/0b6/R+yuJp8u3BXuD9ipFuRVlRTjN4VcHwqqM1MhocK3L+6l+fEsqKLhzWJjcLzrTx0X510NnRVyhadNdFImI3JwGNXAInCRJCVr1Z8F4UIE1GXcHV8kMmDKkNJCKVxqdoYM1SzloiuUwId8JoiCuxmCFdUHaablb3ED4nJihhUXuzdPHR35clvGyQAthBJvZQnmDBXLgM0MjAeO62ybw5/mzNb9Zp6s2R8n1l43NrxIFIgyKFtU80R7VX5Q7Cj04/ye0K4KRXYa93Bble7id5Mh3R5dmoUcFf/JgbUDQvcUEDptJ+jzPN9AVQSs3TiVxT8scN50X5Nz82jRJFEFEHZiq1LeS0BDj146ZvJfr6XYBGNY4OM69L0zQO+bQZQ1/BnA3whGWag59mR8pt/cXkyfuhqr3N7edY/ss3e5w0UZ65PQP9O9vnVLut93vmb5zfT3E8SQPcI8LFcptMdVvwjdeS5CQc6HktQDccgkBiee+wbUcQfWCW4La45sIxVDX8iOzQLGKzKvw2piJtbVsJFP2f/BO1V/8prcoC7bqJsUXlc7EgMOuVcQ2Zw+tm1lOx0O1LzDPJpsii3xllXdoa/7s3/MJg/ll41T8zNvsb5v/VgUlPYDBC4Fs6fNqT/yapjLi6zOeN6aqWNJZ9xyYzjsGdlUkuPviCZndiBaRJnnpMSuGzGt+PU42yotgFwM2Dx4T/UN1rWvLHZQopvfmhbVopb77U3vIIM5k2mmSk0LLcZUudgj1Z/6aLSUfTaJLku2ieFEp3Ma65rhCRqoLKhNOhzcB1EvP92IFCB10dR4H8xpz2hxR4Cb64NmeQFir5wzen/qqwqjKmnZD2Sdty9B53Vs22Sp75vf8+qP7v1tHBVDO19UuvuLANC4IOJk1/YfRBl0qKdDq8flhwrjBMH/hizfkdjReR2MHwcTimun2hRwcMAjSg2ucyXT9s1uvpssd1fXcD4A3Ly9a9odmYH/74b9tCybSeC/9Ug2BG1sE5ovbLBAHiyoaw/9tDBjGRQyZ4oQUfkfcBqDmeKvXwRnCWpgtYGBVysDt5KWmtRaagF0DZjmL+ryyIMPbTEw5TulIIwmOxMMyi7ahoXzxDtrDS7q13ROx+Ior1PzvYthq97vP3tf0xs90hoEixrID408FfgqMYRqU9Iq0yMLrbMfSsGCWBPfgEP1wM6W4aVrGrCfW/ezspv99L+XKXYW7Ot7XGi9fdG08ZuoMAHbgbG1riFe7Tu67xIlrR+9G2kaR8fPWdXUJlcMb/I21sctBo5aG6pHpHi5zRhIzpGOVcME31TWGg4Ox/BFeApEbWF52Iq9sL+2ZGBTpZiJr+nFY3LPH8QbqocBzYYMGmu7VjqshjZW9TafgrxxLiBvHJocuRQIwv4aKv46ul+90TxAzYK5/0HD3WZIU33MwpClWciYOHjEeLo7izrUz9bP73UtwQoO+OzrqhDjE0dVilDn0AqlPL9jdzPVUk+DSalYgsBvIGTqh1YX0jELk4Km1iif96ehT002MwPPy6WYmhOhJpsPP56VexHOUrYkBmSNzvK21Me9DBr9qhU1CrT7XufDw3vi22GPTucwBnP9BpxAr+pa9HAsRiIh0CZqFIQ45rsVfFOIIp/k0CbI2XVvfePmid72xP9FVqRaaTvv62usaukN3Zv/ulIHumLBdmWUtKgHTfrsjx1he6zqgYCUHSVoFVDAoKKtbfomDXK5lUrzS9fIgm/W6Syhq4qEEV8eU5mQguU71UiNgL/PAutNf+Qd3YXwBYPnI0ggKsVknrfFtfYd8J8NKPOvk6YE64cVPOyILSS9RR7EU8UBEqAHM0BFWuOtTbxsnjwy8ZfrKV1IL3089fVtacu1FkTL419aXj9Gh9+YPXPfj/GYTefgreaRSq2LBedm1lPaiLD8YbiSf+gNWIDuITzVHAtfgSUjOKfOo9U8mTkV0E4h5y7XMTutrId/i/Jb3+MDVOgj3gG18XWZwigtJtwTAbb8CXkSycE/THMhAYodW3OiHFqRbS9fmtk8EhEdX741/Tm8DVN/qDn3gugknyNOKeJJVdVfs0P4ThmbA6baO2wRuIPVximWhnlJGuIeho+KG0fNoZ+ZdqEyMPt/fDryezx1GJdjfoX5n+Wb6fvyKlJ/v5rS0a9v+/DEnl3WCcrKWcfjpDKM3/bEnlGO/rXs7/fDzwquHLOEmx0N8GtpK01f2I96oqLrjycIdqVjkh0I9Re5N3LlDklDA/i5td//65t0FTBWfnuoWd+dP/kGbUFG/q/b+t/PEk+q8egFgTs8KiYdNHFq6ygYSIRkCgRPWMKbvT+y+O86vMccnRZz/rvsozTT/Qc+V7zFWkeby5GTUiBvVMYTYwJ/9fEUhrKT9TAGDhYbwEJ8m29/+WhkZ/g+IIDA9RST4y/fqQrCJvfrOvUkRcoSXX9qz6hD/yGNcqTgejN0r4cM+aA3Q4fMDE2+lQfru18KXo7swOVY/PxWzHAOmD/+tcMk4MSpNb+0Zlwh87uyecL+tckF2Y0/+72f+ZgDfQdC3w5inJSF/IkWaS75+wasDLT57ViCVlXzztJs0cyIQi/NuzVj+P6kXE5w5mzha/yQPMI2hg5BapK/5hANo79i845lTW68tKcXJbBKGS07S1a2kL4EfxJ//cLfDMNFgGVSfc1djflWQ1uNQAw9fFwOvIqf5MxiuPXUZCNZv+mM47HJXlX+7iJaWxl8toVhWnWgGSS4qMzq78gFuZX0H7PRwYuSDUGPadH9CW+6wXM0LHW9WSqd7xZ2H/R9y5/YUW/nRj9x05NMhxnN2SqLkjhPH9mXJpn2ZUw1Onnvt760/e1SbL1Iw2BCM6PPN3gqgmvz3o2Zx52T9KiYe6AH6nUydO2LNkX15VoP0v78bwmg33DGIvSvXlX8wx9Dnvcg52UvHTI4/zVh4eCi7LjkqI05ewHiuPyR3WWnPWim5hs+0HMQ/badMxVuRC9o8N8ajwW1nboR4hGDuypBd93p5S9QgEgTKLogCh3LlHgj9bEUv9Kj9U+h14+vcz7z7w6+jtCfkowTs2IHEfW/4Z6XjwHeC5bOSDqJSvMjHUjFdFvqaqETb24JdLbnm9aSSxMJo+Ylo+6lOoEbUv+Ptghv+St039tAfPszBaxoQgrWUVMEYkK0yGk0QrqzoiD//8kDHg+UCPKRxv+5KeAvljwMGs1q8CFSCpryKXfGbUPYna6UhzYtPYiEtpKBhXO3yPsAcwesSLF7CNbvaZLlxt/2y7+rq6dRpehSkgkWp6ya/DbI2udov4DkRG7Gk96KiSxFNnCSTLVm/isUw1tSKryt+tEmmMDMxjYDnCrI0VrlFTaV/+cxs4kzis7a+0+lCOWtSr7jEryy87JQKBtY7GZjrpSCqRyFtmhYD2i5FuoRBAnsZH3+iAdsH60lcL861xZvbdXBFnVSBuU4XuywNY2PD46VWq2W85HNUyPrnRM0X2bGw6zIx2XAh4GvZHVT03kdQTAgQs6fvQtqg1JXj8MT7oyDb+9tQ4Z0NXRt1WNTKrOW9U8xN8YTiU7dp0aHdV9Kk4n49PSl81XxNmxohZqNHhIe+6NGKTAQPq76DafWANRdjyBDhSGn/NrD38HNbtJFTisMS3J8aLu0zMZbE+7gI7vGf0VGNza78haDKTAZoq74DuCbG/5WmjlyeXW9oWkLB5Z+oc2576enpY0Jv3qqb2I2A/3hWJTGmL+PerEAL6TNNyV93BkcnMlR4NDtQ0RaDOlyq6Hfe1Ba+S7zm8MR63L86P6y94MaYIVTBT7UCgLCNXy6USFAWgm0NSV7y5u8pqWcAPh8MUSIwoCNcl6N39TIClkRf3QCbP0++ZjUsrQuYkzGqX6+K68W6nbNWOCOwFh/YfUYbkyyWxqPgx8pI9O2MttlKOAt/lH1qcWVf4aWas+F5j8TzTdlnQ637p2P9pNDw+VUPKKAE6SyBNgQLBupnI5lmW/Av87ZJmbOvRoZRB4k6BwolTRB5XXYFXLlXt6M1W/TYfYMXyIp8kqe2k8xUiDgiL+KFATtMx1R84K7YoGsw/LnB/zHDy46n/Yb2hWz6N9tsSmIoBedRnwRXXhwr1wgudZT4pLdYDK5uupq+i6viEFbz5CiEHsCZ/HX7GqNxOeVvvK8ktaOBF8Z8qy3fzmoxiG79yqnHzvX0ZCNKcLmkpViKt+9et1u+8FuY2PmlEd7OooH3c6Q1yAPnCakE+LugR5VEYI/xfpijJ67mtcKCdvFXzDb1LK+mMK8PsB9olLwIDBxqCwbQJpGDqIe+o9IJUFV4Uxt3U1ZyGGkKbdStOar5cm2fJ4RwSi0jqNm1d7VTF7r8p82XL8fenq22/g9yIFZTpgbeSSlpa1947ldaV8+brnEYytDKfZAl2qnTXC4eOg4aNyeaPA42/6TODVE7x2r5pu8KLTQeN2JOY25hrEml8i73PLxB/xCRAmXaTEWpq8WErsPXB/Dx5khffr1XlasVyzDiQRi+Y+tdAtfSHrImtooJPvekF3jLNkV1Nzc2P49L7ks9OnZpIw5qQ4VoUWaUcyMpM+naxJJRLRwrUGDly8fXHFeS15Qa4Vqm+0Qp3QzpChOPVbH8xTM8VEJ3HZCFCmsyb5k+ChuvWJVvkvazft94fvHE6+7NoIx/RGDKEZ/N3T2thPbuBPLhBPbmBN0wknx1gXepA7edhF07XhBkl+5wrS3q+diT/v3bNjMhE+ge2OJNQli78bIUhqn8F0RNX2V6QpNa1d+eMJ1aZoVwvZ41b2E7t42cXSLWk22Rk7jTrVD2Num5FaprKGFr9rx648GCdtlJOJhtXhfbsEHH+PLbud6e7fp4FyXaV0uMy3Fd+geuqiJZyJBnPikWa41LwB611RQ0/59Zyrd5aT83UzXt88d2b0ee5d/vtj2Gm97dXETyY/aMLOnnhjXbbL2wAncxSVfZVAsiGwQe+rhmz+Nu3IdynHnIvkq67Xvw9XJpnMZvFdDxgjbVtsxF3YTiToTnq56fXg9z1tkqrdasUNJqH1HjZMtZE+NAQXsLfGQUSpNCuY0L8o10EMx0uxH3VZvCm+Bk4eVmeeBRPDQhy9jseuUg1Gd8YAhTXS9AcvwZDRiXjmQkRxcWmkZ1IqpbAcZ3ZDoea1zS7S3Y5+ynDLf8dQmyAMXknnMdDFIICYofJwK0rcB/0skEkxo5O4EpQLxk0yVeioesfSN2ph5mmkHq5f68LZQ+64Z6iP1KIGGjZcaShrKesPef69YVDujIlpTkePMKeN01HTX+prMxq0AElyah0Lzy04Kflif1jpqfxaPg+mEGhlJWNkHNVH0vPiRZ3NeyCvDCfa/GM79jh64SckigkZ/NRzmtyCMRalMtEUlvDGnq8PsvqMkzY2OhGZNux0yTl+42QWjsFTcNk/CSlvK+vIKwKvY2vUh+IGom3VNe+mqUera3hot417vj7ZFRwrXY+LLlo3WCwyum/BDql2k0iGMFopTOyZCWmwk4Hfw9rm8n87VqskQTcY0Wr7Fhwg4ybpftRQW+dawUkz1ollmbaxBLr/siCW40uMjyx0j/3W9/eZZjELMae2UEAirypWTznUGGNun/dOmZAYslbp40QL4QJw7P+Sjubt4UTdi+7GQiReIsX1bzDVewIWIKgpLm7mz7c2AQ3YPpFAH2dRpptLLv4y9+H4HW2vW7er+nmvnldQa8o7D7klC8A0xHTmfkFBdvXda3bjkj+9+zi0sexrEVlsmxmBGRNUxXHrzHpN8YrAzk+7d2syLqt3DBzd7BmPKm9OS1koF8/uPYi3W07xPt0WNjwkTTxY8RLrJKl0WNr4N1owv+X7qHh11ajE57o81p2tiFTTxiClHWdfamfPPHdxkF4R8fO2uDsxiGZiFJYpu5d2uo2UbF1rFoaqkoaJXafp1IpWmkJe2MiUVllAiPgu/+xKVv9Q1/U30mCCwDh7zYzZnOfb1cm4NNHV5ZvtD4EwiyPylrNYBC2fg5Y6w7io3aVJp6RIgxFlj2j/B4nD45I82rmSaGeD3S/MjB4Rgfsfh76Bfbq0sFkn1K74Lelrv6iPGhUBJ/t8mbPiC1BKTPKP6OoXt4Wjp+ofBk0OK5EHQwgCw80Wgc+cE+XiYLGVeAzeg1hsadtdGYxp71El1viwvZ+0WKpx8saTNNycanEj5o2H5c7bO2jc/P+L+9VsPhDwO9OpMEOVXtsoVNdZF6klVFpx+JMy71plEz5c2CJNMuUeitYB/otF6cLQa8KcnzDZYao+n08SDojL5k7rBENrCjWU2RUKuFNet2y/49OnxYmRk0fOHLKnfsw4G3k3tBDub3udAKbUJ0lDhzHOGOfv2i9J9v+9HUQsReE9A89ylgO/YhCUz3mRO9RqwmNvAfDao9zeWfC7qfLYx/WUAl1quTTiRliLqJwS8n648zMoAT7lehGDmTWBfbPDCOt9UiHktV3O/6EJyoFa+kj881rs2f9MjyUo9PaWwNGTdILoS9V47VAQN51GZUANRe3lyaGorCa2bsnlAlI5KsSw1yIe1xc+b90ZcG98168FsamL0Dve7oi/fm+C8c1oibu1LNExWWV71Zs2ihCy31RUWgKwqMbKlpsKZ1ElFobb36JlHyD6eLN4qqwCfrFtiX5nn0Easvmv2JCgy3TJmeyVLpXvYl224my/AWRFRX5rUCE2CQcc0dFUTPqt8rMtu2+mwO93IXreSoNKV9MnUecuTvGaO2v5Mam13dZTIWj0PmEni+hczBbYSDQhtN4N15u4wYMuYduUd7tc3d5wjQtJNkGTpLvVK2WUEA2bp4AI4jIKUytL09S9ZCpjL2NfuvfJuwvcHADXKYAGyLFnZCG7FZKvJR7KpzATpLRKrBOdI29sov9ODrflVQId7+rX6XObhjM4sWNDjK1PvuZPXXsjqpD7emfCOvdeOxStuo/50mVOJd7JkYZJijXmOridPWoQxZaQ+THrN7ZWTgArDwRjlyu6auXbEOB4WyUPEcHRIVAvEdisQICWHNIGouzim+/dYlZQBEY5XrXZReCUD2RPmhRbKbZRzD69MdcEXhOiBeVtmvjJast+Q4JKlSnCrfZh3FG6DhVIaWSb8lqBatS9ZJBBdIeDssRhwe7zNyEnKOQuFeCjqsdVxvJFnj6AbS5RHydg23KTIgDIPu0vew8sXkC67hMLyIUDe1pOgcHd6d2ibwiPSDAYgPS7cW9dNQoLXcqsRrYAlWuHyc5NR/rIrjM0NUrkDJtk9YQg2hMv6MCf8DLCB9XcKLfcjtF5zmAfhQiKVZOORgHP509t48IhDsSF1W28NNL7nzj21C90MzplVy4RBvlEzEh0CUed415+WE/Mp4IlKIKqILqU8SfLaK2+CL3GwuWs3YCmfxx7imFIxzHw2vEj+g9XKAkROCHPyDVgg4/tRCHTNSV4TQCdfxlldY2OXtPaqT++nQWy+3EksLMVgTdPUMBmPLc7EWnThm4Hsywd5JkIiNNXS+5g/VrYIouIoNcSYY0MZxHPF7wsVVV29LFeU44onXwQNDMdjptAKxEyc70wo+LnMsbektwnotuAnLmof8xk7b6zuPvamjuxBNivY00k8QzYtVQ+lhkwqUve4hC67kP5SCIxn1RTqanilmYUZSxrZItVegNXA2JCQnTnFtT7EPLCL1AlLdsNP2zkzoqPzK/O6Dank3u50hPzMd/1kYh3DHxcQBhOeXm1KBBFREf3AHnS4/KS8r835JQHWTpVXyIdLzeYG7IEcmcIfKTsQAUB8jfZZlKL603v+uPbzr1GujRmAN9HwR8MPM0aVf3BNT5Ke2g/whflUQBAjvc2FwQQvUdy/7+hdfnYxUdm/hIGoD75iUwVsTTbtw/OMveogjLg9C7ou4VeXC5No0pkMLb4C4XGUy2bf8TkOgC7Yxk1g5wnvoPVU0Gosv4ZJaQfV24Etd/baEVtwzEyEyVLn0Trr3Jm5I20cVPDsh1YyP+AJBDLWnOEe3pgS2NsfFOV7Oh5eJ3WIjG+VDMkRSpzGbeNDt7Cmams2Y7SpmTF3tKdffBBEwwVVQEYAAzmhnDJsXWkwoXISLEsxWuyMtEBITwMN4gOVpwy5GRlShwm/wbYRXZ7HeZcJQtks4JJa456BTQKigtqxd3gRAtzwMF442JgXPYmaHLHnVbowdingJN4ujkjvUXVuEhLfSfod8gnDGTXcTbo4oskEr86qH6xsIDWcHjd5DfkCYl90YZLchdB8vm+h8s1bATRcQEUXBj51Is99GYJF65XgRuvxAkLezy6v1u/n2748qmg4QmHu1u+l7uCjEfP6wjdD13QO2e7MkMHQ2hKZy6v0LjY5h9pmZSxJVuFlOglr/dbfPfBXKp9zmNK9LzDxWIwQvpAaklMXV4AtX7cTzd+abUx24syArCTKL8uA9A7JjM6KDWMEPanneMPPhNCeP9K6kRwLLCu46pos2dZxyBo0lXh5kdxeuWDxunzS5LQSsJHSVsUgBr42ibrljXT1cHoPR6XW4WzgHruZLoguA9c0ZzkgywI4spDBHHX9oVULZ5a1uowsxWziXBhbHqRSUzp9LquAaFCy+lvaed9qaGBzABkZXE3bERkM9ygsWj4sF5zGcx21rxdPAqWkQZDE5MXhQl02ral+qvHwP+3QuQzMJxHqXDZ1xXneID9/+bigW/5I5YHqrTOQonwIxyXeXCK1H/8TCW3gg0mqWYodHrmQPR199XULZ4PZGMHLl51BHbS7LBPkS7ycWDvyeezxurjRN3q+IfDdUKffuLtBsQ3ivsznUhkj68XwxBYMHFjg7bSFN8THmNT88ePfXURHm4yQy/Ygkn1vp+4+XP0lowh69FmolH7kM5FeLImtt63rR7sGR6XXJmJUunWC257TYlg0Eq4EGW70LqrRpzwYVwZaSXkfKdqp+/Nt9dPj+QRuVaoXRBTUUQmZNI7+cik2BpN/qkB+S+ooO1+EXScVwy9bhxg+yxwQHKYLxQG1B5VUx65Jo5eHrSH1H0e2V+1UumCQ4vjqAdnbqbMoB/gWitheUcTpFGf8bn7xjUCDRRibQgyOR1oxsOGPgQ1PiXGa7mbwyvTe9guO7FXcbH09Lq4fpcbMY1g0nC3qY0uqufn+rTgacGSexyvJXPOCM1EtuLobWD0kxN2T0F+9kDh0wCvuLDaMG8uRBAidLVeomAuIgfRD+OyU0W0lBsShtcySJ0f/oPV+CLcaLObXHheENnvtVW23e13xAjuvwgAWTmZPXrVOtWjxrTDX+ezHIGDG4xzExOYioBgkP85nf+AFLmDlBBP2CvUu72EsovhOJ6F4AkwWUIi8gEK0BBXiJVosQAFIpcShK6h+c178ku087zjoPdmGnEEUUAVirumN0EYz/cXAqcnsyqt9GJeRGgxSwEIkesFSCAKminAQE/EaWaXAroTu0LKFLcui0J851dMa4rEFvX4pq/xgsY/y44ly04m6I9yFB/KSHNUGYzFGgW4yWy0tr7a83ood2OOmcr+wHmHtvRV/e2ZafTSl0m3HcNyU7CMW/kXXFs+9Hs6b89uaQ+avITN2jieIoIv8hVMRLvQy/+1xQVc+JoCpx/wljM0SUjkk9SIIgSdJvKY2KGVjBYK/vIR1SFMuSa1RWloSALfn+sts2m93qTAp5YUnfPMFq29tVppOuzgcigrzaG1rA/YnGvzXcnN0099Wt4zr0gL2R/0pKTvEbWWYzX5T+cdp0+u31XbZ7MvAxYN+vqThU0hSVb+9znaqQr4IXILLywtbAdT9rrXsoiB66unS9uS4qJT1QPzn4RTbDUGbrq31m2nFLlf3fGjtkDz6tEfrL4nfDRCxdFUhfvUMq3xdP/2u7fPd+HUEj4roGKOLQP3NRQcZVOIVebidjdVWDKOtojb8S7xJe7yqpWx/oX6107QfotBqq5yX/ad1VQlu6kngL01sENC1sCuPX5oEBA7CC6sjgGWquoXQP4A0bAahheKXpOMFeLfzqxBdPeP1b4qvOV0yJP8k0I+MtM30rsiyAKFk5Phylhvs3SpexNP/jcap0/aVfyuE6M1mUgtPSghhbpHdQIMIrkkpzW6XDWczL/4FsGmiGE7mKJoAMa/8I9R5mkorQZBovDuvTBNV7Q0xSq3PZEHgOyGdH/wgpDjmiKU7cB9zUjQ5gf3CsnTiZ0jYuOyd1tfu/N+mR1+bDCR85m6g6y1evbEEIfIH7CfzH7fVP68E/IA82PNVjAZGMFT6PkWk1xDxDnufHSaCXpJgzuz4+1FQt4rJCOR4CviC2M2Vk32xzG6NGc2RMJt9TXv15JSG0g/rX6IcOZm/gsYDk9PWWoq2TNfk9sDHWOax7hroMefNbDlj4CbfkbfHWN+LZaaum95mvfEJZhe038GfY4eRJJPhNx7583sXuax9SOVg0BnD7/ZbLBHE1FnpSLZmU8MVFiFQNxZPMOGYAtHaeCHbhPoXiW1Dpuwx0aIVAjHYYGXdpZwHOO3VE/a8zy6MffA/gcDOQIn0G1lfXFspR22S5c6zGqVgPPZOg7r8ytiqze1XtpvTQstCdbksXi6QacQR1Ukh7FmctagutwpsLdQRR7kb9OCzCZhaj0SJ1OUNEgW/J9BPTRdvWZ5IK6pfX2TuetGLNO3Ns2KloK/maBvwUu67V2qdiIkfekG6b/GukUhJcy1rqksg60Qn4yl0+/olN/ftHnS32NROvudOG9FowmPLe4+aftPN2VDmsh+/fKGQTUR0LHnJHfDaWFPd91l/I0mHNM2OtFNGMFk9RPWAIqLNQxPVXbqMccVUPs6hMcSMTPyRthM+BE2Gtllmgp1sdVab8LraAa6pIdrF2QM7tIKPx5Xau1TPlSpBgLF4cgzPE86MuT60XpmUlUlwTl2M5bgTgk1W43PJP8jQ5ZOs059E1vOvh0EbDws0iw801TwAmvp8jYe1UzI5cR2RWFoxuplwiVA6KzsWn8EYYiqXxhbUvODPsylcsYwH98b+aUWzQ20q68NrehD6vQcVWGguepDuAvA5a+nz/OiCJyNBN8EpG/Fup0O8mQleqD91M6+kZWtKsWIB9NJqUwrdvAwl6ZmhWjA2bUhlacvAVCfgo9VmPnoKTxgGUx3DiR2q9MgkHkA99cWDqM7N3lUtZYASv+Hn/gVpGjzYQgn0CLSpiXdiKWKkllc1T98ObXpkBieifrK54eTyiO2Bv0h1OlEEdKrnRGvapWmTHIGDhouq9JBXRUcIT32Fi+b018H4Wu0MMcm4Hb5f/J44IXi5UphV9iFkgoQ+wiKC+0XVOGSx88kJN333pm0QF/oVoti9WhHZXV/wfQO/+WXxdOBKXTcTV0uA+l7xkR0ejeX7Li/ZyNCRnbRZWWOd2mxxWRddJ2SJujrqjarXLPX+ISSWrTDd8R6rzUUBX6pQjq3ilgq7Uh/Vd8CyHobE1QuYzQEHIXjDnIc8t5pv6l2eje7kik2+yklB18pxa8xpwzZ6CpkZPGhA5c+BoJtKRORvOnfUIpa6DK1TRAp+/XK3NJTxC5P3FeD9yNZOem/aFZN3J486NWgSxiUorpHkrbHQ7KmPfIbfxo2Gc6p4gEhmgoqxdEmIfPiQHSkelhl8nJYChrjf1nG1pU3k+o4cZ/LamlaLRKwJxGRIFzTwDbpHdg475tdA9d6asNiKJ5t6GFchEDUcnV9q2WUYXwDmashxLZt6qcekJOKBvWCUAxyTCsRAT399LLulitl9wL/slzmWIUqhurJKb22T8xHyePgT4CMPsysMJ5ZtfOBpbXEtDoItm1tTZd5FrtAsNuApVCEGe1D1iT6eBz6Z3iiscxER/IVC3S36RYgTNHo6MAF1VAm4Gn0JJsCfBp2AGHfqikKGwLvY3qA3hi/uRhjWCqtCEdbvLqi5rVBt1/Zt2Jy/AY/gSbZVBJwgkGkkxa8zEd9+/hoKwS/qYYI/PcVi78WuJ4n3t7lTDbeCYFRDOBagiBCVGIC6K49K7EC16aMw6dzTCEag1QwKaMXp/PW/Hhi0J+IM9c/9U9HEjYNz2EK15AftDbu7uwn6JGIadoeGWcPTUXfI61mvaDJa7+rIFQ2YPPtFlpejm/rtNJPxt4IPOvU1UsJ6xo08t9ar2YVVjcyF+HiLTYuVfWRp7QUpqkdLIZbIw+7p5lqh1bEJCsfRh3M7ysVX/mSUku0Zo/7+3NKaQVut2JCWnJf6c+QPWeqL7+gQsXnPrg5+9J4nwB2jcH/4iwdv02mvpEiEgn5v/AXpisW7gkULmVOXL5hQPq6kq/Bxivmla9FXBaOIpdgonNh+paru/RHf4bm2mDa5+Gix0PTdvAFVwfKxTa/8UWvMyc8HjoBiDRtsuff8M++imj7clNvxkSPnAwhBkvylJEQu3ExGAv1t7pHSULzpY3PVqt1x06htiwiDPU0ZZPuLfqQpfNCM0/OPAHdEWXhXxcZvTsevWbD2LFX7k+lblvRwOXuWfPo9HbOhPYuoSTxXSh63K+JZMFkGJj0t98MH3BFqZXE5gfDLtyxl7VhkRgBbu79Fk1cdQq3Si5zvYjr9QqQSdvdDzrult9mAf8FnhyvsLJb85c8CKN0HH2qj17V6/zgRyA8nunsuqdw6Z55qu/2hOVB1DFCf8aqlIVrKxV+X6DRs1VEplQ7XUw+1TeYPWe1BcxFrSTLYKg4x+FncOwfw7sor6EICJqRWVTGd8Mv85ZOCYN0LUz2UEDfzexMg35JtxQbQ4XhixxjWObhJ9xIGtQZsORjUggpp/Wo3wpR0z8J2EmfRe5jCOWGSwQNr5/WBlChn/8//7SfRdt7A2uPIvBw/jHTlZN1359SmBd828FtUFk87bkuJnNXIa/lUucQCt5Wlqn/Qkuk1X/AdfGsbVh4QWymU8V99nvNBeJJGvY12gDjMY6vS9Cecr+qc5AU4SVuV87W5gA6iGoavRHlRjyVUR9cLZFU/Lgiv7S+kHUYUIvbKeaP3tzA7opjlmd1XwHid9ce2kg1YGSQhRtFX1aJbXqhShjq7wLlzygDNxJ0D51YZ6bUhh4eeP+tipzXUcZXAxm2DsZG1eFVtSiQTONFHkoJRWQIxmQJRmeG1H8xFxTVkvaNbahs8tPs9d05fsclC/JgDr59b/BUHdYUr6dm8PrYdPDlloCLOmZVw1F9nKLJnTLqfzygaCBxciPas+/gvic0Z0HxjDgHM9tlEqIOjslZ4GJYtb5FuduL1SpSCmQNKhwStpidXlEvgoN4ImH3BhrOmUW8s+0Hcfo27vjQl9N15LCGTt0F/9gb5w0MZidVHxXaGkqzVig3yJd0u3J9xSu5uuM5d6g3Kxz1h6c4/IhkZWO8AifhUdB3wajNkE1XdEP8szl8RVE3hE/5zByHRzQJ7EnpRCxYOBdMW830LJOj/M9Y0wnv/2ly85tC99PPeeqKc/C2VEYXekcwDEEuJamVvzexXQmR17MMkQOj0NReeXgDvcFYll+Nb14Snse+O729fKETrpi6jx5OLyfvb0oQw+DiAJRJibo9rFO1kU0Nuvf55jAnHlLT6lMnimKrW4et4elmlc63HnQIGqLbuZAnoktqxKrePz7JZlxErDw8DQy/A/+1XiegMRe52zzZc1Cxqt1FDktWYBhfaFoCCP4xLWhh+bgSAP+sK2lO/UPa4VLzsKiUfRjwS1TXZQfl26mhueJY0CMUUhI+fRUjxodhXUcCksT9dtCPEff9nPpgB5sNmw0XRxu29ozBrMDAMQu+/Y7BWFNnOEV4urSp6KbcV88HdA8QdvnR42jOawoAkYZatWgwqe3uVkzIcjhEYs+ie7Z4JPo3DPL7ChYB+Ol5pJIS9QH41eqH5vPJN8NdGO4tYIjpRJyOl69XN+i5i7He3SzWGDrXjY/YZuvZkk8GwLC/gC0kzy8KgchDeLJALgLMr72FXKWA66UZKrcGHQ2WiNKLAJnsMClZypn8lnsYEqu7VYHFL4qmljY0c6MXJAJ+AsQAfkoe4yK48yJTLjz9i6SLagzNCLlue9+QelPf+LXdOOrcxSFhxQTxeVTne5OzoyOuI3lPXGZqzsDSoiOGepnITBLn6ZOaWOLLFdVIbtw8fuub+3YXEgOG7gAKsHRtmorGaZ7M+PCi9slHOo7Ey1VXGSP0UIfBvE2isfAPOVaSMxfIt3TSuvni+6AKBKHAbVx+0QVt7huvN2a0b6rXzvcE8A5W1sEgL97xOajoP+CAumPBrvGof1p8bo0R2jr/+cIRJ8LopVsWeLuqsC0jJC1vlmrJQn8uGEIMmCg3ymNyEE88XCvBAqlnAav7azIBAmZQSFzanSbvzjaT7JK2/TEFUZbe+IZajsTVUDwe1V2DEtTNfpIGfZKrv0fMPL3kub7O6K+DeaB0+AzKvEVs6nVFrr8L9Xe/GBVgT9vXqCt67C36Hc9IuKv/QRQHzawa88v/ykcmhPqVJYkRD2s6ZzIBWM0CrIS+3LbnDzn+QpB3VYs3+52HwP2S5/Mpw7HkGcVul9Eh/Aed5UuiV/5YV0IQ+5HZt3InHPe6I+tK4xtyESIZYBllwbQ3uFODLRRvH0sumcZHQIAHFv6yqStLD24p6mA8/Kghy9iBgM+O0NgpxYmOC+Bl03BtE/5aALPXcx432HqN/kYIx9/Q6Zn1h5MGplIIJv/oykTryzmVKt1ppLiun38Et0P4eSu12l5/9D/fucAvGcMPftmzTFfU+6xDmHSB3/rwSOgDZa+uaBMNWZSBzX+0l66ZeWmS1UXCOkEYiO7WHSWHANiAem9Q1Be23L2IPW9UwYDSZdjEdT2jwQ3iSNkZfGgqqDu25m6kOWcax3AsuTBOiG3KtTTgYrGbmMBHcldIZWrSwZJkXeqXvY/+9ZP/EEdDjlVFSqd8ZLBWbmSJGK4AFFCtZiCTmyxTg/ZBgP43X4T1NsDZK0WJ+RPNm+JV6RkphaRiY01L6jpVPnbOEVjqPMShnF2h1qiATuHsZcve6BbIeqQo6HxKKwktr9hYaT80n8MLUp2t5EbKcr75Opp/EDhRnjtw3u2li+itO2Z4Qb1lzhIhHgQ1kz5V6k8n2KuUzNGuQ9Zo+nJnVYmWb0MJFzEz3p9SjduQ6dDhUgKDthyXdFVg3AyzztQB5PMjmdvjR4PYPDjDGa/IwQwC9loKp/vhIek0uYoSYI3Zu6SZbPGwtGAkd6Vmoz/Y5OmqTpFhIlF+QWYWFNC3mTba3IcWOl0N9JLDwJFLvc7uRy8jIEiVpuwgnYZFvT527G5Q18Q+1kzR3hnDuPPsbXzXeVksXT1L9bLi57SdgDMbaLvTp/bRpM+pGcszrpeMhGA2XKMwVqj7gLD9NVYxRr07pcnMwXKj/cPiaLQ6y05pYsPgnEfKoRR1D4KCYxdDxLZvfx5KVzD2oKK2IocN9tSYs9M/Jl9leyNJ1884b3UffY2HfPwfkyx2zdHcekDzQ/BQJY/OHVD4XIDH58lYgJ/3fGObpC8Md53sZji/b54L5ZgQw+Vpg8sv12ezOKkESf0O9GTng8HXoTKroeYdAzTmE3/3h7jKYPjKXz1nmW8kyaRNxpEh9XCiryXM4lki+a6ZoTh4LA0bvPJU2g06W4LJ0aDdvWRTdKXwWC1tTFaUz1I3BIUp4Ed6/F5UGF++Tdku5IQs4/qspM5Aoojopq0JtdaOoNQu/gnUhY6bIpYtXkuSvyM58e3zCoP6aXtDAcVEtkc+/ax5Qx2I0F11RAmZ1tL1Pf1Mu/gxEC8Wutt37dZfqcsE4olHUekvhTT8jOSE2s3jycmDqOYuajJN0RJXYEhsOZ+goGEcU610YjDmRpK646dEVyqO66dQKqN0J3cODBNvbYhpB1go6w7jkBaxW1rY3p/pesCovKQw1E9uC6FHjuM6n/XWV9axsHro5QlqbZCV8KISdqPlEKPleaIohe/PFmPrSygY+QN/NsyrRTQw/VbCdyRJPUGWa0LiwLY3Yds8uHJiKe9n1rqFUg+FwLH5kx0yB7cbYAhhXsAcRq7WJ1H6cF9ABzQQm2mzrwQJE1F2PuULoTjlf9BZ1Tf2O3E58y5l+pLU3kiUZl0WNKhoOHUuKaipfrx4a314oJrZu2+kIUTqObiD4AbexnQvOqQMp6YDhGoh6bKU3FhmuPT/LG+5JpQvF1wtERcOx5pplP9lDJt97wbdrIc+vPYMLT3n599/1gICdc7Oj5ePJp0XBO+9E5tZeZcjVLnoLm2zpDDa5S6RIKTs5UFPBFwaP81KG3vA6JuidR2mldIdAqtNZoVfBYTG2ot1MO8VD8mCUVVCvf0FNP/I2w1l0/qa4XQp0Ypg5wf1omfaL2H+4b4KroFM94/WNxSsxSxdUM8HQsuh4fwa4YoCzpxjeBOKk4/RraC4qrUp2Hl9xsLmu3+9T2CTcvsW+MU+WH+DhoCnkZWC1mgL9AfjG7uyWRtRLemAev6yk088afp9DgGhQ8jTpfBYcn+hGcHeUGJSkrlH3+xSAmK99v7k2lRYmE2zyx49Yuon2ScjJ4N0MDplVs4RBIXIl7lzoB0rKf0np2MCf8okFXHQhaOmKhyDLxvTnsQc49ExKs/NXrOOv6t2ozk2qwQ8Kqa0RE1mr/Wxw5x/YfDq8ptmW0w5EP6n50nBTc+eAY8674RO7Q7/qJ+zBJpV+4cT9CQYNPCeIm8ozk13sZg0wsU4Ikl994mCTU7wcXAPt7ZmtD2B3MLh0JBjTFD4eAOmlJuypufF79+p0kc7kbfL7eA7+/fYPhrjsnop9zLyWF+eYRDPljxKepLJXT01pcCM1RM1fCX917ogHhXx4T6S2fZbTpHOVV9sElgZu/jM4R7pksQsJyJUUIFcSjfXt7hQoMKedlrBhW92rKMdfNTCnHFOCMqznRf15DwELPD9zR06B7DDVDLibwYX6fLMr+CCJK1eeN9EolS1wn1S60Z3uD/FwYCNemAzW+lWycdnxUcXrraxejPaVvA0H1qv2DzbewwoE2fyYm8IlY0zN3/AnrzFX+lwuUHlhFHNiJ4Wonkb09HTUfypm3lsmDm6P52KC7EhrP0RKCsnemVjybevAvkgxYIZRBeEvS4uaEJl0B9PP6Gb7YobW3cTvUgl9yocCjoL8MckI38XpS/vOwNrvSCcGaa4++2DOraUOGCK6DEQJ467465X4UCus22gFeW25koIc9My/clzQ1bnfT2bFd55QaMntEMHFgjqDFE8XHN4+i500a+M15uxn7nFtzBhalBWS4UZ/8N7RwMeMJWhukAqAWXn7zBNX+S16/zXLDr6c37e+aIXfAByjgotPHEKGPgZ9h7+/607vQpFsIzzVV8aPrppdLu7qmWWTodEjHZN704SsyX49G7+YXFsjc7x8ungsffyep9p9XI92hfCr3jfEXNmHk/WbuPpwgtPToAFq1jj5GVQsMPJIR1FagxZNU+TOibLmoh6n9HKoQBzXCStvRFNpHE3IRPHJHWDRwXEYUjULvD4dvH4kcRcZDGzAS+1EmH3TGXfj0dweqqfLh03B+zEWGV815MkedxwM6mmMZLcK2IqRcgg5+CSZCDNpOj0okB9EF5/8/grSjz8W2Wp8PO/9GBCoQECgmmTvvAvCyj259GwDf8635cy/zc0cgAOoOPSw48cVh3lUYL4xsF3MJ1fG+L6f+XUeDvSoQBhiN9KgmvmROsn5wl2OaOYmCaEQpM/Z+ATopwUM3Q9kmuGtIquDcj72/c4EPTqS7jPNOnNTOlUonlEuZ/aJLDahI8Y299nY3i7tk3wDzVzDgmzonYAau6vvuNwLxxFPRK1NqKenWGz7lbHpID9mItH7kfF3qGtaZqZNSvgVOMeBu2eKlhWR2pWXc6LIAQ+mqIXgk8ABW2445+QJj2NX6YxBlrov4FJDGy/GcCPFZGCAKbbzYKT+rTwYu0P/QmQKf6WXPctj9i8MavZLXaWG7/e2DECif7HUC+y16EYtWdgbdMbw5Zn8/Gs+96m6vaSbAHl5Z/HOjei2eV8n2PJGnne4/TzvrKs7XuBsogekqAPk6vxF+zkl7eqrc2EnX+bDzcj4ii0raPLDlhU4v6956PAj5tYN9CTFxo4rDMHGX8DYbuSJqfgRWf15jBPHVJcxhTM6ysGXaJbMWT/WJ52Z5xZjx9Cz697u9aw2rrqtmKx46Sjg+IRW+6UJ1VIp3/olOP21f4v1hWSjTj7JcawdX/HcitQGGPvgqdp1F9J3MWPQfUkvYAIRIdvRZpOdkqsaGo9cKFboT0RM23uwckCHNN7Ixwtv0XUlnF1WiKNy7ukrDy05JWR40HBuFSpL4SlBeIWY1+IacWY4WKT1JKz73kCi+/JHy3vBo4qA01sC+IZ8/QhGUXmTGZSvfPyk+hmPBAQsXIIvqJnF0+OeNyXsxzUTFSf8T6i/VMPvYCxec91MQaO2ZOFfkgBwroDr/fI/EnXfsp63Xyj/xdrtCwDHpQpwXLS3hk67kKbAnRv3+PL2rXHZWUDXSeury/CBLAw71gNQTr22Oc1TA8qF0bu19M89hMdc3aUiDjM7qvzSojYIumpv5CGOCn7I79U6ahtD+hLlO2SOlRljQrIIfdeMwGdeasURxX7EKsFnkNp6BMlWis3utg6LYdGSjxZWm9RgvxUQ6uqAF5XlQaystSsUUx+OmVMY4b4hbXw1/0m+hJCSwNDo+O1WE+oZNNsA8w8BDeoYPQkEiHPH3bSxHcQIw1UJptBxi7BSD02Jcusz0GTbY1TpQmYG3S56tkna6Fp7GEMCJi2079L1gdjwoNua2skkf2PU0YaesHNFzGupuFGckup7bxCxexJtPiGwD1mohoKb8AmSfjCGbZsJhiz6QVr6HJZ/G5EY0H8X+EtMv6jhG27j9aypU/PneGGr/sL0dfI6P99WPNXv/5bchtuSunztmUIIjsfRY7PAwnr8NdXTH1uiEDKrtcFYn/u5Jh+oys07ezvmVGnbGMBH0hFPSNYNog44Ni7ESR6zvuZ3YhOgJ8Volpu9pKc3SG/cJrpyo+0FZGO41CHUdZZhWV5UznDg16yES2ogee9XFh+jztLwz9BC6BZgMk2vkMX4UZ3VqjWAtWoGjJa+mP5QpOR5VO0eq5LhidtmyI3ai5aoZ5ELo1SW6rEpWW47Bv2mDgTYAENvp1al32s4XxVXy+OzRw6utn/IHnqU47cvTFI4FCngOpfXXZBtBZRn0p14W/WElGY3HMNZ00IiUENm7s7KBBlFTeCFIsWateF/Y2S5/PJwD+pls6Ac6Udb1026iU+hRXL7gAbYkk90uv2XzYRChHgWl7Q5HBuOCztR47iBgQXOjlK605MHxMGByx8wbjjagJag7piTTxyU/5eLXcwLIuDszqtFGHg71Jk6qCZ+5i28nxQwwcCM634bZa+LrhNNwaQ0tvFf35PSi1oEHPI5oVfE4YPPznKxofzIvlJuut6Zfkh3Hkb+6kZglj8sJSDt3iuWPCeEN424nZHwTltaaG2UP/38wdpsjrcKPtRf36XJvfh5RDF0t1wyeoe69O4HBKDNwwZpPxp1riimzzH4K3otsRJ/bDJfAwkG90gYFXJYLH4CG8a1EocenNMMlH8J+dg3VqyCMAc0utF0Q0FYmYnfIDbyOyIFfMBWccrHif3yv3jEeSpjTBfdK/W7f/j5Bdnqns9jT3BM8WvMXd2I9P5U5RZWPw1SjkKWJDv71k4YSkSf80T+ROFG1eOzuBINdqH6mR0CAYsj4Dj2VYrBsOa3diWJv7ETEy0GyiYB9dl55MW/hMk1Yll8DZp4d6y7w1c8pcupLnQIT9bgcM8hrIA7s7+xyU1kb+mc0sWF+0cknU4iEzlfsx+heKIq78+d97o4GMfWN+weKK14Jk0TiiQa4yGNZow2FTOmsaifcepJIzbTaA2msnlzNp/IntnmGFWiiN6U3C4qMGJ+iwG5B5Jqe2zVAjZf0FnCZhclE6RMvJWp6pZM/5czB9odMW/w0Z2B8rnLo4FQy/7SNMOtQmB3+NhXOnXZXxcRvcdWv3nY09dmME0nyjl/qc3N6zKkvFK909F4lcr+Bxw1SrHO0JNHKenGfmW3rQF1EVG4vFPOy77MnBnzMwX083bHZbZdGf4aV1Q4ElUCpJVg2WVUZfj3xe2g7HEEL7CZOOBmGjj7CP5ndo1OV74Yw/+6hZFegxfGpK4eX6YyWPEk4DqU4eIdGC0p/tuc9bH3jmbzI9n/84Ht9NTg/7UfvTD+abViw5MgcPyuRwa2QILsD3VNxYF5ew7otTTwklCzW8IQRYhqv6KcK/X/MlsIwjLBt/yOi+HCm9aqjiBtJ5Wupc366gZfAsMbm/InPu8a+llffZ1Ir0KR9YkQonDVM6AZhigyvnqQ4ba+zOqNWBS+tnRkdbOZ/QqgKVG4uy2A29Xq6eF60xAy+PxZEcN/nNOuvFj7FUQ2n4+t1rMizV1nNTzZh64m1lT2wlNdT+xDGjbA3HWC5oHzcWOsJz9wG4x7QPqoFVCgGVEg3ng26jDN+9OJCP3pn8GTLWBW+sy/5BT1MDlA+Vq/9+Q5eHXuYM4BB2Rq1YV0JvhfPO4j6k4bHzDdxgfq12ucgWvUwSa7lG8WIQFIMOfJRr7o108E/6KH7/5PdD/3YcgkgyIZ243WLWrWAMA5rIF298xqfXX5SYJm7vgINhKdNa1fTlrvfbbZYr7w1I/9dfEwMNnCrjexTNT53p3xpHekr4nAB/60DHhlVW8fivmC5s9WOf/wH2qk4D0XMs7u88TCtZgm/OU0j6lYpnYFB9B0Isaz93VfLGKpD6+rbz++6iA83ffY+WMqdP0NsGhmgOk+svmrcNpYS17uvKizNqVdNzX9vCLzK/ZnTHXYK6BdOl8ryjVf8Ph3V+DBJiP1U+DYYa9d2l+xTLJO0hH8OcsEgiPol1puxS3A6C0ReIkIwzpX4jdOkA8nban3JlxrhW4VCuy26KgvWVgbdMRUKn0BI3AS7GaKgMsK3DRmik/NQqZ+U3mexr0LuPAsAaUzKHOVOlIAjEEK7eeVCzEqGBd/pz+MBDQWP44p1YOT6hVRX6ITMj+iQNrHhk/2Hj28qjalrmIwbGLnAFkFI79e+B0k2f1sLyBGRb/ZbX3LjGsqWK9mcDVGpaEQOqILUwPyGEq6uFirqqt6my3DJ64D33JV2LEF5jSHrcUnTDxYkQc8h+zOnY7sdD57FjfYcjZI9fl9MSgrzD3fClgP7DeW/5mwNMWAwP4+l502vhxg4eDgn8YUSRu9GvbqBYC7+tQQQt/5ABvS2GnV1Up6D96XAyaGmgw8VzaxTY/HI/8q66nf7zZl+B0pkruJd0BexwTybR6JzXm/v6qoJTcgFPPIAOSs1L5ob2OLLeQ10F4Jx1JxF3T+eWNiXSzZAPpdXbHehDCbRU179X5gFFOGI+xUhWc5zVC+O2zCKEInUdVaAXVy0miGMzK3eUHAAXjudXhz+C7VXMO8gHoMszXeKGTP/XpuFXSxZ7x+2cd7MWVZIgEmGHIq+FAv9kdl2EIwvaXiEMNOwTcStordvPVgTYEbJdy27r3PjwuIhUk8qA8YwnJaRUzWOyTuCXAPCKTj5puKEl11Pv54Kr7aMwASX0ndex564tfen0fy8C6jPDpdrBX+5cnS9Rdf7yFH0gwvudV6vNzDwSPxaLiu9kJ93cI3ren0z6nQsZtgDB78m9+vt4D39oghTfWX0oIoPz2fhSI4k6hYgaSO68KOwFKAz2TLL1N8u0t1q8QdJLoM5vEiKLoJJ+A1VzxfVEGDzQU1DF2fs7JqwmfuX3GqvCgZrtYWV3Y3X0wv7ac3Io7Fe29eHmISjm+JlfmojJvKKo3jklewWuXb3rSvxEcUySUfRdkFUqFAMRxgVeq5fqz9kaS6ZiQtu9S59l3cCQlZSZphgzrS+1k1+/A2dU2RoQY+divAAvFWoiWy9KHkzEmFPy3D/wgBp8uq3vI5gmrv69lp/DvylZjmC/Xn5/FDfnRs2h1ijV96qcs5rgZ7f4yC+7J5aFZO3ms7NpTlYSwrRi6EtbSwWTpyjTwGfJkutWPWu/3Bq9x7UrqkKxa2BYvSgbQnz71FDf9b2Jh7dmu8mRSpZLzc4D8+CriDGkbBOdIFL7uQfMMIY1FdIrPjj6hkGV4wf6NrjSclzVAebuOLGRYlf1J1xsxHOJ6I8fxwHV1IODWuKs+wT9RlqRCaCajERuhYD0ZrpGdlIPztYzT8sYquF56gnpxgjnH/zYRdVxs8wt1ERMrlHSScojbjupjW3MFNFvMkmH2Fepr3cItVI2QEoriA/7ewMfX7f27Xt1iGqRheNydxqp7QF8oJYCs3oBVlIySGV7vu/1R+Qq3+MXGD72Jd5jU+8IBEGDxolFY+5bEN6+1NWszT+2fVSZVSL5y4hWdxdwZpRZohIedFn9EPWblL0umr5fmSafvS+dGoT/mbRywhPJ7SRR+LWWrp/qeq+1n/E4JTlr2LVPi2sU1I1iBQvbd7zEfF+MbmO/2RrTm2rneDDCWjD9ioFsCm7l0zICeOekWEFa0vDfiIxi+nlKmbtkaLofXy2lvzglOlKmPUJcCmSImaT7g8nBfdthdknsCNKSjl2VZJnlF3+iglUYS/XB69VCx5xeIqb9KGVmhGNI96Y6Emr5nPB2ILm9/LgO8V1rI1dW7hp6Vk+XGeQI76lqr/ptoBx0Ax63je+elA3OftvOnb77hb7a57pX7HOoy0x6W0ewVltpUDk1S26ukplX6CJyZHQZhKlwA9bLjB2/u9Yc+1LnoHG3MnVVHGD6YQ3uaNUc+826Y30Fq2iu13CR26g3HQLY7p24eWJa0tjwRFqDtDNl2iFixs07xPCU9hAS3zOLFn5I8Z8RUCO8/OGV6NGwVeeyyK+klQIf8/uv4DKKrleR+HlShBUJAsoCQFZBGQtAKrIjnnDJJhl7yLZBAVEMmLCEgSJOcgYUGCgCTJOeccFsmwpP9ZvPfzvb+q9606pWA5c+bMdPc8T3fP9EiUMUDlvqF8bsAdRgGTl5BSG4BzIfn0DeKfIyivEN8df8BEoNHceCHTo6PYasz3PBXixMRTsQeyt7dn57CVWLzg6LBKYM+efoF/mWry6/2/5x+kZd5dmXWsl+HNahcfs9MHuAPpsfzTLC6vDBPZpy5FY3kn2PLtBtlzkEaTQV8sT61G9+y7s/Y2fVmWy8r9si+sOCKl5Hwx/j0OsX5yuy6nnsWQ0dOoi2XmR3xVHMJuVMdeKxGYPeILyXr+D4h/5Hu2VigLqmpJFG4ZDD8MCT0YK3zDHj092uXrSEYn62COzKoJ6ks3d1TURvkK0UEx5AVSpthsGc1VdqgosHCZ+/BcsY5xcqb2rn2se3RwRllc4gBXNlIavR4+KdcG+cv3vWAQvzJHHNnPYYIv+/tKr2Ksq1ZnhiMs1d+eA2KYa+FsMk8t3IwFdPtZHW+faeGZZD8CcAqhrsf/hRvMABFUebgBafTjJwB5mMOukHN7gkbKgeStoggG938Owf8Q1bq9uBUpX0U1J181QvKmslfRfe/JK8cfWrZ+h8sHflNupSzP6kSzavNV+Hmh210TctOJnr6rRU1/kxKnvbCZaRyMP6Im3LFe/L0rbKcLYDupGf8NjCVLkPB/zfqWFgbXwWgIG3jIQwLAnYzByWavpeVN2aMbmkaFbB4x+CFNfxCOFj4nGoKnYwYPNyGNzNA0Pg8yDqyHM5q7yFXOhsPWXEA8m/z80fXSMGzUcSHD7VzierJjVDS2aGuqjAv9HpuKW1X1lkG7JXULzsi3b/O5NpAQkphzmWODLub/ZnKo3S0BrAC4gfVjiGHcw/ZUGVPTxgFGUAjJpLFhzAbANNdMWH6P3xTIwGJFbCFwUDCc6yNWY3QJ2+ZZaJqjJCPYoiOdxabmSqsatn5pTflS03w8JT93v9Ys+q83Xemq9jeACoevl4qsQJubkPxO4vMbdACzNicoNBigK8s9KKtX7fd7Xy9zfr+1pPEFsrWi4kboz7NeGe+tx0WBBLFM9tOTe5KXT8orlNXhzsOhWwGLJIYRGBfahzWsfwZJDCszyfJeQ56S4l+0HisFbRBHvevOuMtWXi7/1T7jLoJr+R7ftM6fVkDHVl4tvoUAaBqkw+e16936u8x6tmLZ99KKFT/y0b2N8M+E8L8nZvJSipZgPAIja2grAIPX+NBlDMf/DemnEq5W34TF0GV/vPe7Td+SoJCgldnXv+Z8vadFcx7foVMK6V6vtcFMSR65Ec0kmYLNqQ2TSGZ6x+0mr5RxX1O+JkDJi+le5pSnvUnbgkYrw8Wo8aqK5RRY/Atqg1xOcsIu0y1gUIdq29oktfHyht/Y8YbhrhTxuUKK1Y2u9PfAypOtmT/MK7HtNMkdYNgFEBLPUSrAypm8O9jXJSFreDC7La06/TzGN2XlxUp/bl8U7Yxgk1OH6f0Po/JFD4ohe41P/iGqHDdt4Ot7mQm+f/6m3nsANqdrXzLOXLLeM6/jfJPn0xHzHITeL2kg6zmPEM1Ba0LdxJsVAxuZGflG0rXRFaV6dwL4YqYoE4O5bb3sNbeoaBmayagJFLBHbmcyqEXKkG0hhvKHc+2AHbr8POiCgTTZtjvDjrW8Ujqtxl1h+K7XqEkaYLZtw1rBzdbfqUUY7HVZj8DjsI+La2RHZ70Q1PvvDa6Y3JrcyR70C4/L2xeZwMcshg8yu/nY6shEOQFCbJup+MlXl2IZW9Zz+HYpqi3AmzUItPaNAs7e4/YjH+QkLpFb+PGwrFp1zO89BHrmio09a2H91YPsXDmswkM7ujJt6ywPSAzYGEUROa2e7IyA7tiBnKa+fMlTP7cDDe4xz6UAc6CwLHvOF8sEZ6vOkkvS2On646qlkVSvDcfvEcmCNns94hW4BVAliiJZwNChm5eCzR0/P9DKBuw+FNh/0uZdz917Rf/DD7kc+aNNK/6y/3sSs105u8MBQ7vSgBFToroyJLWiFQeHpzs0Xhw0FlKVF8lDEHQw3FEpNdbtstMYd0pl5HM2vaZH0AVkXkocsp9UdRmamPXqI6ZqY/ykXgYW22HMfAHfVdwa1Areuxx6PUwwsJF/cqqGf8p5Cmp7BD0gD8m/8DqOllL3K1WZYbyoHFXub3sN1h+Oq0rvQ6X35dD7xnOl8jkhZy6jcx5GF9QuV3ZgbyiK/nVxV2jK7I3iClJRXUe+sGazWs8UCdjch7QU2u+4mgJC95ddpMGxmuCleLyYRWNCP3bAFjHn0ckZsrEBiJucyFU343zMNPsSsh/EMduLWoy8A3q0GZZhpS5RGi9KZqvPPqLSRPt8/1JnUznse23ESEGq5G7xy/4dnOUAKLGk7iwmbdBA68Da8dE5YJqiCf+JoZWyR0xiZw3eU0I/iF5xTWA9Ynkwk9Ay0Iv65KW8NMkaJNEhScblUX16rAfxPgCTP2dH5cUzccfoal3omY0SH/eaXF7dPqleVRrnjVcdwnmS2EEu6SJwAoDHW5eyElkuu1E1geCHCyfh2lttuHc6cEZ0MuZzWwC7ynCd+SJCvp4Z60K8+LA3z1se3QmwuIg/n18IC/06UXA8XIJmhySSijIhFkGuyPE2oWTmWCiJdTYcrcSoJnWhZzRKdNwL4Ibuq7Ngy9gy9/wrgwsCXYmLVyfWMOi6ZcMP8HWNy6gb01gyNMypPLQU6EqM2gDpauRYGQ4dW9ubss42XRJvHDVhk7ElFmRD1WImzmZgVQBI5EXOBcv8DUhmJsJ7ItLD72LYQFdWG823kMjg9iY3j/8yH7SJ731cz3XuKwIM44Xw6Y7X1Bfd3D8INwGQ1t0av9UBpnmWB2sBGR/htjnzg1kXGaTISNrqhzD1OOzlUEY1tK2TcmRd+wMad6YvrPbwI2O2LmgU6v1JiGkCSBRIYvAR5E3pdNnypHrpsU2/whYNWsFvh2kEbQlyJRzrlks2krlNSLwYbbo/byBaq2f2vUyWuJ1OO2u06Pw6xZ4VKqGzPYfxQbbmML/vAZbyNg88sEdhl5Tkaa42ct16IYAeX/Te+KuEMTYbCEJu58bndxNs0WFVuVM987qzEdSQfZXQe1cwWGgGIBcAWXas5bDBAm9dQlmAIQxfsr8VNNOplqvDVr0uzgf4xXjuWwiMxPIi6PDaODYVdmsv7OXRE+BdJ6mXDHhXfsaNG8BOSvWcAn8Z2Hx3NwNFktGv/sb3an2pW9PqWHUI04+DriJtE97YnB/hLGisiZXj34HLyGJ9WvyUTQyiCNn6dUKso6T0Crznnj8CfTpkxvBK3/o3l9LtCbD/QmbbsJvpbaRI1i5u+KTy3R6374+6UcLzuVaANAbU8phdQf07GA8Sx5UAK6SIkECQZP91IhlspW1fW2xVemWBNuHWFqci1wyNI64mk9gs3eTIGoKsLCMePAC7wADsMpUfrG724oqh2NdhLyzChrZM09j+N2TvaCQJgDYk/6KNYnnhHA7TTtQcwCt/+h5S52LIz5lB7nBlwl0TwvKD5S42R+WpbYzXk7YrB8+BKoejsk/QWy/8Z379e10J7QPpcABxefgeAuSo5uTHSUr8+V/NTnH+wnY1Zf0Se9WZOV0mAOJeEmDoD5scYtZzZJlxr6sxH+Dp7yqprTid2Yy91t94mul3rL1GXfXVXq0GYfDsSMCGRLO/ojjVnnHj2nODrxLlGE4YiaQbxrm5dRwgLPNsdFUAYXkJ4ZgQH9w5ALVt4FJdHXW3L7i9Gs4BUx4ivXfkqfQ36QMbTTzPMfn+RthlNdLwGfsEeGqqfXpUETv4MOCziU8SLmcmt6ew/phhBn/0M2Cyp6Yn/g0IAgJXc94vDGDFRawfcPMqH+AlxIvE9QdP0P+OAiBkooWz5h9dhVLJIr+Lup4OM9sGCLmsRthJ3Ztyr76qVdynjY/RM8ied7wQ9q93+yd2DmC6BA01hpIcYEN91r+sOSxNdh6VIY7N3v49nuj1raBjr6xCtWlmP4Uoyv5fji0TLZS1vracMXGVMJ0A4GFcUARvegLcvGFkvjnnVJL7WF+9cPix2MTRNForPqW2xHvbP/8+0ug/5+nZHZXXrEt27FgFC3Z0K1PyRTNSygIEspKFLwNmm0/Er8FSa5VNc2q2tdJTlgLkL5Yvd45DWtJfye7K2i/dXv2ptJv4Ec5eYhsBDLt0ZfA8tR6E47doXGbBjp0mQA2jqnOxx9krVNtm9ikP20T//3yvbbT9IxvWyqvEcxjAnSpy+3rGX9z3G4j6e8IFMB1HNZJP6Qsk2O5kf8mwkAoaQ+5gNbhEcT4x9/Z2a3eMKtaAIKupYZR/tdjLOcWvzARHNrOePi3Zs4jsEzYNPWR8aQKn+ttPQJo2JmqKJq4v2Ts3TYCHb7+tBLjImBKvY0gNhXLhV+xJV54tOP4mwOIGIoiO6KAnCRfvKa/8JePYg66KgCIlyElTXQVJAI0WzuJ6m68/F3YXfOcwZuQknJoS5ATYkSQsqgaaSt38f1C15/T+5eC9K3cv4/1ggIccv0SxbDZ7PP1rfTKAVh2AQJIMb2f9g9/F8wFTZWtZWmjruRcLqOCU4xdVWZGVFne4ER2nB5OOYPFjUuUZ1tLks/wX53Y8mnvC5xEkgCi00+cUCOIMfPn0o/wxUZ8DRs49ncEA61iRjrx/VrTT34IWvux3DrIBeex9jamloJrHGSFXOtChOh9LiT2nQk0YblBiDzoZ+OF5ivQHxUEYaza2WRqZS9YiWq3w6OSO4Zu+A9vs97YTFS5wXAfqRQGMTptSZ69lSAWQkNS0+hPI/pkvcoF2qGZyY1Sb0mTw3fGNevjYTUG3AZXWn9HCOrAc9KVr9JB1F2UWhOqa27ThVJlpFIUIqqykmfSTjyYpGmekIKeRa7KHWNLVb0CF6BUaAVpi4pSN6a+ok7hFHxzfqh3Yt/3EFaxzwmoS9FZ9xUEux7wn4eI6WX/UXfCYSuHB2cJaHaaaa24WOQkT4CrpOC5rVt2Y2TdxuRc12SnJNLF83x+t0i25Mr8HeuV2ji8kS2KIXI6DlN/jcUoS/W30dZMsoKbBFZZbTIwpa1Q9mFAiDujOEGMrj5H/mqEPKQkk0pV/afajaBaYkfd/SElHxQvEAT7GDzPHWVoL10Zx323Gd+BG7wgncL+xg0u5lckbzr6tktpq5vn6FHr+yPl6nluRPdzSVHISLMTaprBxnba4h/d8Wo99er6X1TazuWCAscBKYUyc29mfAXavvUpmi/SuAFlkSHQQ9f/JVNj8XS+xxpHCYS0l+IV+wotX3SUdVGM//VENroVOHaSfaO7fOq4QpNKNOdd79fDS8aJVoZ7c5W6uvk+huYGRt9rGR5Xaod7ZtKLeaUnII70BKxte8P5yR+oPe6IgfxIyXEs3vLsA4dMIKjdwek1bccdu47qcrAN4saRAEqdJKfee9kJXRoxCIxo8IJkaFEbM6DXMrFff3adKW8W0HxOoPCTGJYx3B3xkxVSgfpn/eJNw0CS07hCbArn3MAeiXk5fyMLynfKButCg+gJlJK3joxuLwHZ3ZzUOUn2vF8W3qPBVw+38Hv7Z7abj0K4XSnVcuz3LVZS95/lPVamVHq8Y8stAHcNftoYs3w1Z/gDQCWAe03BVGt74rNXhd2JzpyzflJOoYE9IzHainHGzUVw7PcuNEg1Kl6TEV+mwRkeDsHmWOffqGrpyUery21cKcmP8bl5Ef50xbz7Wq+cQKAjYlbEvcNY4/TyzC7swKj+ZQu9osgbsucccn7qoVXe1RPO/tNzq/T3QK5PqnyTwxcawG3Bs6pLoynRcnvoFwEpOhc83CTqjFmhNc9rN/cSCHRZp/NHaxlCw22k/gC+yBMqPBt2Yd+JItgIYP79Zcv0oLCztI76M1a6KxkS6KiZwV13ueg+Z5JrfACT2reSK+mHUuDVz8LB+ikIUP0mG52yatsuPyq+RrdKh6b18RX2Rft3sAf6l4c9NZyuIAZs4gtMm//p80YCT1FC1KtvIDPQqvFBMVf5VI7Lh103/jVHSOUqbxn7Q2HwvO6r/y7ORtfDDH2te+pYgZy+41ihz9DZdrt+p34041la+XCIE44TnfEi1gTOO0U1Bmge9DeLJ1WL5mySGuZQ42t9A+OqWJvOeg6L+HFzg/ed0qEeUq2XEp2VNquczZ37lvn1xFrYdEuoGeXiBPFN9Uof4j6yYRaf1brVh6zNJtM7v031hkKzD84T5Pr1HhDtS+Y44v/Ti0ePBC+EpKmkKrON+nJjtsYwOB/sNUl33y9emAybutu5nBbGHAYNeL0uF3+LtLyMhWWcObyAr0rD1og5MGWT4ooz5W9cG2TvIP4YNbMjF/OK7/krbvvbv/l9K/pwvZZ+1clmm3wtqaHDtyMdDcJEgHEgriPPpLx89tsOb3Peruxd5N4hY5TnTxDpLb/WuRi9qk9sZo0MW9xI3Ftlb4rLKHHejK0zNhMwc5iKDHbjbe3D+x8vNx3Ykk2fkVb4p3RlsbPh5Lida9IHSLckzgrRxz8faHl9+S6GUJgAf/VirV/2ZDcfY7oy/JBk0ciRfZGOQJLd0Y1BQT0bDimAUZCzttULfCPJ2IQykE7jlZN5TMi+owbF/D9OhTfhXB1npESAGBIgOwUXPFsi0LvPua+RKTYjefdQRcd4fCDdpDe6hKeghm/ADdaYmy/SZVkPe9YvF4E83BWMl7tF+yZuLCrpb2p0QMvTe/Mjg+OBXr+EXmdry6qrk+0WcBGs0VZlPSP7pRjgJ8jVyUrPN3CAAT19Je9VQc1U3DGm39CwVzrmVmDvcGP3YSXx5Q442O8G3jYEAd6Qg+GdR/VjYdTbX6QEJXx0CXJrlPqmtRNDXpMwlmwZkf8BOBZfPxmjovWB98rr3U4KpG+2VIvuyEBO1vWXwzJwZmt3BsbDjwhztE1B7/fQDS6dobGfU+BesDfyf+rPs3zLKwXH2r954xzzfttW84y3D7ayuot1R8JoAIH+cOksXeoajlMUqCs/vioarUd36uzXFMjzoGlKFH4jC9X4Muwg4CULaCK71dy9kEpo0rE8xE5F4TRu6/2Ffz7wsxAtyBKyh1m4KY6DP9dNByF1kApmH3Ubks5p2siRuYf44J1pRv118kNgJjpbaeXtslfJdiROKGIldZJWDEpV2n5827WsCh7kUy7pEhb0HOQWaODyC3SnXQzzkwoWpXSJbrT78WSUZNaJ50fbcpYbu08pTw6kbFORjNFW11bkHPeuNgQ08Z5Wdsdh09gIwzlRfdndJYvgV57zvGTpcxqvqdl6I1xk1EY9lvTr0yT7+G3n96XnzF3bhT68JlPrSMu5xiIbfTvYRCzReIySHplgmbVcwg/2GpBUaoBhkEm7nF9JWhWeBO7pB7tP722TFssGJ6QQvsba0Hi9EIdmXaISg8BSHThpdTkelmXGqd2vjNDZyV9H/3sq+QqOqNDHN4Q4vRlRBlrVvp64cEfCktX+bFC//7P2DJOEsN+JHYC3Cd1IuRU31TACXNcoPQRJyPEJ62UvzaN/2q6Dl8pkweSPl8qN1LrT1sFsWEZQm0Ao8pQIrSIGsUgGX1Qw2CH9EVk3IGB1qxGpQL2bL2jq1on4tRaYhHu52HvjwCcUEjK3Ph7TmS15SZj/NCE3LU6KyDMJeHBK9ZU2M3GBAKkTd71lcJUXdm9KHT/iFRn6NHM1sJl4rTaI85xnZpRI595Vc0x/UHmHRf9lL9fD0555nFY/dqj4AVnupstNhpqsRivEZsCS07vORNJDReZLqkFbGGV9tnUZtkd/OdaPusW28nzQltbwUU78Wf+fU+PbcqfugZCI2fB3Jm5XGa7YaIfZ4LiTr6efP3gd4BoM/dWIWrE1SrSqL3jfFwjHcFr1S6xEgvRdDYIvrUz8tQrpIOy4EiarblIzEhouUqhM/Vn8wYt3ibnW9zrip4SdI1GglIJ4D9R26+DmmM27Rm+LznndlX0diNmSQ2cR0ruoD2pSi5fWXjwP3S9ZCWjEZ7bEafTQlv2OLhF849nuLGNAxJ6maaDml+ATknmVCpvBNujNaaXKAwYsn/v2vQCvws90lzX2pzd2h+J+CPrQxi7AKfgmWtLrcTolT4vJjpcv+W3WJZSb9km9vT5Cw9i3EvxfVYtaIJbxh9RJ7L6Tre4vOHJvQUctH+SLude9OVKrM5dncysskVL525M5LcJvrTd+H2aX/ece/sknpoyq9GVH6h/RvUe5f1rQo29BW8Av+Zc0n0pv0tmtkw3fFZn7OC4TSfrHd5sr/uFH2WHuWseR9ex3te9GjXpXyF7QlkMZ+ydCXhIotifLso8TCAScK0Y+z0h6bxT6mo76xcIJW+nJHzqhgXzG1MbdUgsT8ZOp2ytGfGd6Z7gwpQuynM/KeuOQWylPbxlG2K5liEf5V89XIC/l773e8Cb3Wmxg1WPh2Clty8SAMe+DaFmnql7J8K5tTeum0JX+vL+7MqX7kgZa8usIY/EJ9WRN7aTHHEeknoH3Z5UQAv5lNZs39Ft8LqxTcSDR8sskkCK97OvSROckEvcFLNz5aEs0nFVWmdowbN37qfkWWBBi1LCqDzDe8CRVaqF8Llhm4nWky+nbyPXNQZCqOMfc/7XOLfhXatRUWtQriMFfOKD//z4ePyB599Iedul6fSvhDa3BHf8061UqXatTaJL/x6aupjovk3yqzFoFvQOpeRmxg4/4lTaOY5jxO518JdWfl/wrMZIvs4+RtdHrWaGOhVTUzNB+6WcZHPc+6KH6m1hYBxzAa07IetMbtFwtlUffO9TP0XleYuW4yeqdFIe42myC0yLcW8WpNmIY6iOlAtYh0z+YgzxjWXVPs+aH2e79lNHEey+mj0Bh3E/epzqllKgqNNHj1vbeP/1ZIv7Osa6SlwjGidf9Xm5I5tpisefiY6ghDHzeOJxvNmzt72utNh7WvTVraUuOpc1tymyUYzBmnz72GyWXrp9keLxvK86ljSwIYfqFMwvS54F6poxDADll/JvbPfH7Do74aBn0DSmYu2ed5sUhTkhdvjMou5CruqdYNcGvrZ88hN+oO2MJI2bsGWGF8axxaMYMN0Eze3IvowwPqtyAhIVds1v+PiR/Gog8ZbY7NzFfDDTkQO/s2GRdJRwfguZC7X9ZStYy0TFJcS25sR2bkOfoLMoNjX1P6fbD3wRY4qMUmHl1/9xhbHyHsxv16igzJm+aLvffpqLGXg2faEpukF0pjzDR1Y0asTfN/YkssdB618a7044Zitdya6/s3lshX2JMRAt4fRF657ojfG5nSZqa9kagexypu4+NigqYQYQtSXu9Zf87Sc/RrRKu9lIEed2SkkD/vj8RvC9cLCj2mrMg1Q6QclDf6ZasCP+7BN0hh2Ca8sEUpU2sUARojHVQ5jhyCbpWegIVfZApHWxI4cO8dOR7KXNMrL1CIRNJV3YOrGcSHuHMLqNr2iLzqqUHf+fy7AT/WP3cYI+e65GFpNa/fKBXT/zLjTNGwkuPkxODXJR/kerz6eRTHQ1cQJ3u5jvx8rXoWdDr6JHdXwFBLL/LktnJt7eIg53kJEy17gMRHp2wA4bwyQorVQnOVJo0th86tY0zhs4XMTIH/XhRdnWWae7PP7LWnuaCd2V2OJAWOpI4xuqrPxaUDOZjkt06q8uhqAcyPZUt7okRLTN3zg4aUhPpu9vj0Q365H7FrgxG+y7S2a7pGPyBCuLEWnjBBOlmYrKJLQjPwZlMjTdnOhi2jYVDDGHslsTGLQt+7ZgQIxVbuJpe2kNFMOhgk/1ZxJdntXF+cfwDFJqDKPE5vgZTkPeAMs/28UhORPNfW3rBlPwz6OcZRSWFlcT5xEzu1bOWVQHv2BOVftsMlSE4tZgtwrAX4gNJX3U/wNXvm5JHTWtdiJ+nktOXWvUQjl4TU1opAyWFypzVDFznoNhJYLhD23o144ng6FNPt4S/+JI5qeOsy9Q8Dmi16kxSTt0HDv36/uxtMV1WH8LEYPmzU4zi6Z8wSJJMJl+PIqVUE7F07IrdFMtk4kk5UjtoC+OdMjRmM+N02toro9r2pX1nn4awWBA68ZUJ03fxNys1GfvZM8WuJZA61ISXZtYqOD9oRXN2l4UPFAXrDqMV+zthr8f4wIhgfQ3aNA+dz29lqwa6ecagI983T2wcR/UWnDKrrhury0KJPL2d+yOVolMfzRlxbzIJbpspYKFV0s2cpD7Fuuz78+okWzFnyZ/Zq5qMNnxoCJNTL+eRkx3maCIM7VuFPvXr5IRF1d7Bl6V511vrqDOvSGl0JvZCH6pn1oqJl+nrl68WKi+2fqdEuGL+WNXSq9cmllcN2qRArmYceTyYjSUHRbD9qETk4zR6MtnVZG6z0lfoDmZcaKl4zF3BptyTm8hJTlSP1+ZRxU3MX4fY4jxQQOXtQopYLoZn0MLNi4H8uJ6fLdpzKeKewknyURQrZBXrtz8Es1yuWfONDqKMZqkgLVlXvcwenxqhxrk3qe5FYB5vizhfW15MGd6/FnG98PaSoTWLjU1VLg7OrJctFrk7SVm7YYkyido/AkVHTX84/KKejDz0q/Rkthocb9axG/YpVuJ7/u3rbAv05yEF4j+BZW1tbeyhhfHdGKKKDu7NvVPDsPnttfLV7u92ixWx1yJf48kqnz3RC99CYhOJ/lb3ZK15Z/CBP2AlbUfzWI0NwrCF4iSIyDlhAv49IxbVYtVefwkybMSDNmPIyJ226CmY0ZqJUdc1QXQ5ahGz2ilFe+qGYeEHM87elgZATXdUsvyqfOID2cwbGX4k8vVlz69DLw2nd0EUeuv2p2StLWRyyT6galeJfs2FNMTuIAjTc5F2j7ex4Y4dK1vqAJb8g6/N2084WQtxBqy2eRPvAmzdOx+T/1ZT52q5nPjnsowi0x8gRqekAymIgR2yCADSKyPVt15ZXH2VzK9arIbFOMCVp9N28KZSkICS3ZY90dwQMgM1Xh+6WPK6E0sU3So68Y4jcNHmh+8Lt7cdF+Ysn6G8rImIEhdvE7V0TM3aX10q3mM/lZkvpql4Bhi0hZDU5kIJdtSfhs3dMQnBNXlYpnUhG7ksiTakYr2w7kIM5PGlbwjM8tqsZUHDqJj5hR1PmRl8Y+b/vX03mSFDO6PrhpHYwI1Nne6tK1ZGgY+bje8V6EZ4U6N491YONvSKDW487Wgqfmm+XHtJ2g1C3+8wNmu4//e20luh32++VV3zq/ZxDmLXQ+z2VHun8jnOmKNiypFXg1xf3BZKIU5IZ74Jz3J488XwqmNkv505qaBLTXVZu7lxBVyGIrq4kTeiWSmg+FJLb34pWF1C92Blz15tbKIvSWOul+9ZRio+SI6v9ZPdOKRkNskrwn5jIrw0s6yq+7zziFxqotJKmZOaVwFad156p4Zzmmp8pffKZwgWwcQM5pb2C5zFrkXRVFQ0xqmlmgXX2SgLfXzN0K6PY+yQNzyNryJSTQpSDt5KQq2/aczTmcL/vlMrnKtpHrm+x5yivGfCpyhP7fNLi3Y3OqnknmFaa3GjHUFUnMGhpL5RoFMgYXOOLRwBKCgEFbxkhVws5YpV/nSHyNeWlsXezZGiIQnBHqLV9wVQSz58W3pQUqktJE4IlzNlFe90Wr+qpOV/1+IUAjbNVABYWF1iAExmbBa0YpXac0f1lpFJWo4yNDCxhcN/KBUpQ6Egco1dDah0/+XG1hCe+tEMGCqaxpJj4zdZ3Pbrz2Ym1zYLlEBnM/XXgoedsoV3ji4eqF3TjP43G7ljpO7bC7wrYz2JyNa2BUbtiR33xWBQBpnGlmNhg2zHO0nDOdM23kw8LmESAljI1Lu6P99Fisn+DxIRq4xOB2e74cdlldeveBGm/yUfeeH8FfpqKGNSHSn5crc/phtlTXzsPIg31dIRwaV6/w4mZXjAcbQH4sFH+iTKoTl3A2WcN+eVo3Fokk+Ne5Zi9cdP1f5caodOkyNAYo+TB1IgtXNDpU7xmWLr2yS/09ZNAZWhxR9etfLuOflIh8clRLfWE8gknQFbY0JgwxtF/Jm2+Vimr/yVDYa5QlU/aTUPk2vOpF0MPUstN/RXGX04dsA470ae9FgL0HA7oOQOlm4/A/1bbfXsw58/zcXc99vIgi67KaWPkumZBtEml7hzWrgcH4S0Bdn2Knr/mmdUspkPLCpg4y6vl7r7NnxTCH7xlCSx35tpwTtzX8BiFsfMGuw1DlzXNM7Yt6M2kT7XEbftWYj33BZy84oFxf8aO+xBCRDWGehg9aswRfMSfJM+ccVNHi7/p20CCAn8SZjj1mRmFJPPB6V4ksKc1Pbpqyej8ec2LGpCTkBdGqXA1jhLAnk4NfYr3l09pIo3Vcnwg/yt0cP8QEJX+IFsd81gllOsrgSffQkQsOACUmKyMeFtgH1jWUkxjCiEJJBpGZUeNGrMGH9HjUgmCdegt+99Jr7wooMvmosgQtMio/Pz5mfKYQVix3Oarstd03UJN2s1TF56pZmAae4qJCbad6UwNy5yVFJjSu3U2l1Imf6UVdXUwFUzJbOT4dyYlErlSEyLY1/6ryXz2S/9kvj1WP2nULh33qz0lHf7po89ISSNfYw23fC5XvlrRM3Ktiz1eGYWfbgVY11xlHCoJ1Rr6pg/2K2M99WP4OBanBJjtG0v8Tu1LjRUgmp1hy69mVtIg7zQhp+dWX6FDLBPC7ALOIAE1zueUIwVyb32HjZv4nl9HaeaE3BtCPYwZNeYKPlJP+sicczNWi3kiutXI0mYWqRmxzvw2QNNl1XL0pj4Ae5zlEqpqu8etRDZIvW4fbKkmOEKSQsDBW67AAgeeCAUopOTcNDxTtJ9FKtdXiMwFDu+3G5P3PfvVMwhSdiDr6h63AVrW3D6wVRlZMxyUsysCNq0k5V/kQ75gGogmQ1X6gEEIc65RQfA1CdGRE7R5t3KEsAPJkJ7BTeskU0ja9IhzUrdUUvMhGNAHjddgKojWKV3Vfs54A3tSajnw99C4srXNA4mnuJUpdrCyuXyBTdnB3S7X/2ivrfX2QEnunSWr5m8DKFU3wHAnAj8ZMMiVqw/m7JeMD9FK212aInvG7UR+L4a/jNgqA41YgrNSMnO3F1kWy/MxC6XbZXlBl0JvyGL5o7ueuFaqLGoNoRoFdWh489SqAAFTyKob6P9Mi3moQCrG61FdtHbEGaspuNIICjolzqig7SZDkffdh9Fa/CmJcwWJspW7YmtpBSn/QiDyC424LB8i0DK8dRLPKfjoiNJZDaL7TILbAOBWnVuBcC6mrQrP7OkA5r8GmP+UwweEVGOijGSLrDkFCjhTfQBUoSdDHUVFBA/MnAYprqQptianYLz2i+XQANZ3vc/qUX0aZ4lFf4f3AfRnBaDBF16AsgDgo0ARaA9sAXFx4UOzv99dx5ppxrxlC+P3Ci4MsWJTRp0g3ErXk+ME+3vPqs3/5KhEfbHAzarPNA5GZSf9xkfIuP7ZmHjg/5G8o2GouH01trPBlgaGvKnpqQraVOccMlhaAoycokpHQGq8jDBr2cY3oQfhRERt7B0DBP9PGaqM96QjmmRL43O9CQpEdCXKURtEOidVj+l8JDgBeTBbKodwUo70DVpuvQJ2FPtwlXNPFixaQY5Xs/UyKoGSuOQu0klptJqGhY8Ef0SubUnFh2vB1QcbOET31bmELLCpMGUA8Lcc9sWCL8Tx3Zmy+hZc/iQFfjl7S4rVcI545V/NiHzprpRPc+Pffo8mdg45yTksILFOKsvZQxBMYG6Tf1PEe53Qa65f1IhhTk4OuoF85qZJyKwinwXMdkmofqOVsjp+8NpWxoMMDSoth5tVAF2TH2cBZKFG9/LzfcMYVn+GGlJw+7BV01jGtqwm4aLVe4UVpIK6QSxe9bf2DA2PoQVDI++ZSRjSFYRCdEjcuRbTDIpxWWhg73GjKVNYma7KVwoqU5iJz56LxMf7f74/NwRpwOBBJ6pnfY83CSATLkSRa5ORxcPPlM9taCKTmh+b+dBA9Yc/N+pZjrodD/KqXd2LllMgj7OtBaZijg2PcdZj+ZkOrxx38uDZVgsTOTobLLr3kx3FzWeS8Nx4d3/VXOtb0d1HSC/HkkOKbuqmwKas81nfAAQ6kxnUFI0c1Wb175PyoJ6TW9PsBjDse8IILIbNTesY+skiilB/+xNbOW1HZtyhDxU1+gVZHg8Y/Nd3JQ5qNGTlAIE1M4jHq86y9XTlgnAl5c1ty0HFuYDFSfoYIW+2+s1YzGLX243vN8KBd+9EOEH8jV1Kw4VE6uFoEnabjUa9QeeEy1haAZbPStmqu6OzAT/e34UkJt6fgfo4n1TTUxu0Kb+XTMAmkFI+4typ+Aw0MFLsH8I/NqnN4Y/dZlR+O6ktGXI8qdpfnh/gd9qxRVUpNGyc6eWglCMkMrOW5smYYJJzm3ybYO/1GeNh0lOEshvFui0qu6ClV3Hmw8h5aCKCa8Vifn9GcrYP9SlaOUaq3WmRDfhu6qHitgH7EnUDrrf6e3gO6RXLFvYPARE2ClIxGmjIgLez/1XhJ/XAKnyeS4PuSyp7egGysAbr536IeZiZ2m/QzpXk9a30kLGbywc+fyJ6uFak6H9FXAxi8KbzEFxZlsCLdSM/d7PHKKPw0jPgko2emuCDvBn9Fy4UTR8OPiqVlVZQdnM1JTdl+fJQAfPKJWevReFe1J9z/BWR7yAZX2zajzLwiT04INKxtJzNFdcTbGCfkORtuvN74FvEAX7tiFOxLLr21/gLEYNFCcmgfO7tp+bs6XCTaqUQQva/9WWVCpWXQhUNPVXBsfz9OWdfAdnv6HozFgMoUMzozzQ4a4kgO+zB3KPoiZuMKIsOVnrONcNPcnbc0c9agWXuUJFf2Y3ux4LR43S2QIkOGcwcNqd5LAPuaAjo7JgloLODvFRNGfA+4IXAjA0ARi8xLlghApgJhaxJnEydlcCAg2wElwRXsJHedA+BUue4ishv0gSylLmegORuqfjmCn6iH7Frmt664M/Mn7uXgjLgJ6ZyaIo/mFsvoVgB99ZFem3vbDhWeF4bQ78BlXFx4saKgTYjZHhULnmE7pS6lA9IRtWNMxWvZF3wqhd44tBIJDBl7w8dBqRGlBY+DNlAmFRfjj/n8aAOsmqRkWZjqIdaL8SFvelM8+W8S500oLSsv/sIyts3IUeRVD3TyCtY4C5uZqn2+X7x6hZ7iPIv3tD84V4Fn70bTLVJm1GTP80BPCWOCX8Z9rJn0LDGV9Rt4ID2JcVECFufZMpLMFVZX0liWDd7hPIvO+yMIe9Qe3giei9+kY/JoktHf3N0tYxDRAxIE0hTMPfdLb7BMXWcbMhxBTY+zMMjRfuhgtdfOsZWC5bsENiavNasovulQSnciU47onTWAgsDTrklQje76VFlvbjauPcpJZ4gTyGX25fGIyS2YhWx0mkGfpp0Z9UP3witrAd5L31zOSDy75STCpcbnMBebA2JrKCXFPbRcUhCS1jBQgOtWrQ/6ucpvS0TRLMhOkuXqRZosMmn2IIcG2Nf4KJjib/blw1LlzWVhVwY7MWmkjrH2xi/DxU26BmMgo8HLzWflYpmnS7LQtT9Xsprm1LJv0LwKQImGwz5rk1tSS2J9vBKFSLVzN2jCZRYX4n7s7j3am0CQSIpII73xbOcARv0JpU4CBK4ynscHL7vf0SWJM9uWpUJLKXj3TuecIhb/An09InZLrVczBGJJLPMzWImL6aCQnkO13xjnBHh2up8+zdlCmiq/VltC73opn81lxFUIJn0EdgyYdtep/RGVQhQNSL/S3QGhwWyxqJOoi0q4p891E3P4Lp17CSve/CkvfHC9dhu9tj0ChARogqQ42Mtfyc1QbtdsSBFR94ObHu8QEUXhnixKZ9OftwRXN7gk3NhBqE3+YPkfn1UWC/d03iS1XCC+H/33R+6/Lg0TJ/8MUOQTw9jSGo0P67Ld7rW1dBeNr9ytsmypozRnbjeGnq2nPw8yNvX93daHT+/E4a8uHxcb1A7LUiBIqmDIikkL8lVb6qdrc9AIS9pCOA2KZ3vXjpyFLzG+qqXbVx1E65bB03yraJjJD2EmlLh7fdzCiSBCRBFcInfbxLUYuo4DxLbX+5Pp+drh7KxGABAnZXCCYth6NX04IPQB86ncuWv8QBSbP+HAgVPVGlz/GfzA2NZAWJNF/UJFqSwkqbQmitqspW/bCwQzD3iWl0TZxTo5BVbruL0ur3rfWxb//XF/5t9FIKr8HWj1NDqKfSBk5oVMYP20zxUWOegovzVbo/+qcdRSeuJ2BBaF9IxA8daIMc7sFltilm77/pRSM49Fv4B1P5XbCcfUiNskUsA1jDeivSqZd+X00sgtQ6uo1SjWMqUlgbTHDbRuBqN1rfVqno9JcFiFqZ8kLx2UHlRtf6CxP33J7Dox1lMKj6xBBFSLquR+cx/NBfX0OHnP/mZPjZPn+aGvS0rKk74k0MCO3YBeddC1QxMUuk8vIckjqGZQfdPzWADNBEHsGjerFJelyLW2mRv7IEvXjObjJq8Ey1g5k1MW2c16g9wTbqnntxUU741QczaK65ItDy4p3GZdZPon9KWFLVCY9jbicSaHPt4HVg732GrXHZU9Qzpap1Zm5saAF30kZr/U7d2X5bdXDmGT8+v6SpCI/3+VWdOq8ZpGGfUZAu2OKRN6KiXOcSvbAunrcKoMcUUH506k5h712C0exSnOuSn7lezcB4HWmxZSGHq7DjzkJoWT6rhxDsja2SfQ3k2oZZPuS80S/yw8Y3OjTcNUuZ2DrDQZ258dHCu5dFqbAVbBiZz7B2hfK3U/1fBdjwlLANzKYNu/0Lll0gSci411yFxwe59x/62uHp7nAy3ealngZ5zuVAYMOF8WblvYm8IchfeWI2abCtXNcyqeeqaWppWEDM/36vYg969e5rTeGb3SHM7BXMp/3jZcDTUeJDZnKVO+xC7gqb3R3WOR/VsClp+/y5rYA9mOjjMEOZlQ0o+8CmvV3ajOTd+0zym+FQ7WCsyhT0w91zgTGsoAj7X9C5kXH7fClsE1cUvYGPH03edvli+AtuB4OdreYKIUmaNDduVrmZUNK0+nYm4WrBWcAp7qaEfXVC3g8OnM5H/lFGVDw+lyexuayclDMYWhhdPxpDR8Uf9t8xsMtA0cDtS0Jif3Azsii7c7jKPkiON5Yig7MwUm+pDSmZBX1AIO8k6SFxgDzxPa9JVGo99UvH482u4l/F8S1Hs0r1uwgNaGxwfPcpuV6ApuJYrBjk1uwlh8Q28RJ04g0B8wXMdux8DXhIqdiTmTmQzU4wYXrNczOTHHkDkz2LCcNLSsr6+We7NRNziXvcO5fGQ1S1++7eatVZqSlJJ6HacoIiLfRvfivpabXFtWW+kon95bfm4Byp/NrRAyRob8BxI0+ijK/kdb3gtcceb8Hd3m1F3NaOrtiBmjI7kJFyv2yKDwLo7I6VYd5TZ2gdiFOwfz1deZvUxBHj7bueqobE1OPYJAVehQLsRkwkvE71HddATGJub4MCGVt/xqbDXwzffWfzeXwoSTR6r/hE8O0AYDHbPAwJqWkqq+Z22akXy8te34Yf+JNS4S00mAqvzhXOx1u62hisyzPUIyQKr3l+pSbW/uJYj2o9/f6yXHH52LC/gNDeVKHVeQpu7L4X4kc5nqOW5XDDccoYKD7vBzznIz65qe2E4aqn4xZ+vXlWY3Hyx8DXmJD1Yx4vQ2rLup2rH4n3NvZUiuLCRzf29D1tJUbSsXHNQHKOtJ1QjnCEJ3S/w6OxE4Fxg1tdh5WI6s6Erpy/KBFxsrM+O48HYMiGh+L6tj6xL0YECK2iMrZMIa4WbdBpuphicSyV2MVMAuy4CWd7FfILIGoKnimFiM31oTB/hYrz5goEItJDrsEz08wFjVaecjGm3qFHQC+xZ8/R4/fxH2GxRu8wc/fdt+UaCz20KQMbSNBGijrziy4kfvfoAwVVHOy+mCEfL7wSkxpTkpVLkmUEULPQgLRupfv44WAH9XzXlUyO/rwCB4w4+J0V9Vv1bBVoqZu0ukZwDaxQA+dRYSt415873UOitu7XRE8bP3O9Dsf2vrLJW/MOU2vfNDeKNjouEILn94flT97z/qx7seq7HEnLJNLQi6TfJTPHf6sGuaqbgsMRFMn6gt74c5MMIPAsWVNjLZDRIOriZjCKvF6Kw6PAsKH8HGc9EkTSwXT0fLwvljnp2tcPB6Fag9GtcUKUsrKotHdxEKaRN6rs/3D1bNX903mZEPyL9RuJOXjfEYNHqWdCjEJdLALZ+YSiWXY/4pYmJWnWX+6aBCr0nHJuOvRvGT1VahOr3DbMR2d9fiP4qxiO5dqPlp3LGMVMSF2Y9S2/teizPbOddty++XXj9OrJ6QddHC1LyPHYsoaIZDvsRKnm0V515SVtQXryvX3v9EvZjl/2t4bYfOZreVvQSsnBmI+P3aNuPMNDK01jVRKsvRX3z8GdpPav2x4PDtd0lw4dDNaKGY0F+uhXYmuce3/cd7KAF6iUyiykClvNIqYgv02Fbw6AQWGDN2+dpwpRMbmGpMTvmpdAS6FmZlAPefvZnKb03rBuJIdTB9jwUq+7taRqWMtSsbTVtcr4X1otIKUeeWsYJNWHq2nibqNGfZlrn1iGmsNnUp33Fq4nql+Dsgube0LaToz7FPOUA7+pszbYHwFLCFAK8K1/frM+6Kupco7/mqaRRUoHfTeGzPXtCy1yhS5kLl2PJKXiJU/DAMk0jJ7LeRySW+KSZPXhan2uxpjwM6NRXiohcCmv7tlPYXTS+ypSzdcDx4wEZ+99aymNf6Ekr+zNiDcCbV79XVkStdjUrYuXn4EKPRRjfU1Mh7Y5Q5H+bcYm6qLlzSCtnWssiQHIILqrdqfH/VZ/2vHwUlYAjnsuu1nKdImlPxVvoQCYt9o0S4odF3zdxx+o5ohB/r9UetaY0OKZWXJNOeYq5vlT5RcxzB3OsxPfU+J7RUEJnq7WHrM2BuYqfpKeNYsYsebYBFLneOoiKrKRWiYLxMbbUKanhd6wTV7MC669vJB0iAKx9yhEzivOVgJNXQjmrU0W7/bvbJ6mO+I2Z8Dq18TvVHiox34SjDcFUdc3TfZjxrXeINgVHnnhEh4RU8He2QKYOfRwWj2reNd8B3sEX6fAJ4VuOlfVjZdctvIQwO9UUdFV/+HpbKmzp6DEX6wk7+iw6a7cfn9WebXDVW401iG/McmMd08kx/p7eJ5lu0K09SbfqDpgN7xm+RuP685GkmJND7QTSVlL8RbOaOlOeUhEH76HF6vAtHs+NvjTzsTQ48ADyA/xpWRKUlACGiYCffpNyRJ/Qbj/M/jUuDtBGasmgQiFLnOee4Cx2kh/IcS/2vp3GlzXjtrmFHTSlIQu1AS9Jb7Odw1CU2a2V1L6CRSD0F5134IjDqo0jJaiZj631I74hPXvqxCRnmTlLhPeYJxz9Of12TTUtU3gOY3AgUUzXD8OYfKrHqciEbvd8k4R+kGr9jAu7kzR6vXdDMUw0Ouvp6LmksNrX0Ltf6FQItLQNcK0tJyGrca6Sv+2Dn8BBEvjBRuKfgtRqXW9/kdNr0cakoQ+KEopwCcwXM/mYNkY4zJW1KpcKiGhZK/laBhjzv0QtcYVGedlLBwwJNejRHhEbv+gYfRYHV6PlM4z/jmMC7M4OGClYepy5Hi2KE8BXN1CXj3nAWqw85K43WI/A/Rv+QDebJzd+dykJcOXLX5Q9RpP8eE9Kzr+CTjFVWJYmE1d0FOL5ipt511xAaUrjo6g2Lge5mNhkYs3EpW/TN/iQcRwXsCdafn+ss3tW5X0Kh1owiX4fiC1gyVuFhJA+xSU/LwNZJMPLt/bBHqZyL+w2ogD45YHg8kTktxjtkjIl/cY+7amx/PUvWFXcmLkTOyV7Zcm69nVzW3IPe+ibPjc0XW6uv4Yrx5oWy0JhUc+OHgNcUR/xyPobdsnHWET31Y/sU6NWaqL1WIFXyxXR5w1DYKQMOOSXKXkTXag/N8taKpgkn0690/rxlEoc/LmsD7UJPFGTS2qfrf+07T2IWExnvO1xmeBD+0y7cCM6O3OoYc3RVlsCBF1xvj71KzLCX54JV3them/A1WAwn75qlc+pb2G+VyG+WWEBPOUTulZVpWA+05Vb0nFqLjE9wPTmQu7OEwJl6s5eWWge9nttEVxQxCMYAoR92IKM5Z8Th2GJFX27EX0N45DuUxzrsDr7P97HfoZT6O4MYW7qigPa8TWGqIF1qFXoe+XbWuQE+aA6HR9uRnGbw1XDQ1k0xZ/q/ncyyUw6KdSiIV61jJrmWpfWYZMsq5GCFPzFbdIrjSaGghVDtONRNlocgTZ8jLUl+X0o7BN115PT7eaTXUSErbKMi03mA+shXQNgAJPC2LZJcyM3b4Z1Z1iz5hRIAeRGKVdZKiR8qPzIPd8CATIAHmD8HdH41Fh/Ls9Vvh3WN2I2jvgDUaieSgLMk9jcmKzd/8/v7tDE+ee7U+MLubXMtygSBV24UyWHZdsYA4Hu7RYeQWF8T1gX3nAO5dj0lVQfMkXEhHZbhgDPYq+CHk0Ti8pRpBXwc+exNhKab/S2TNqBHdFJT4wSskEoc5uwAaOWBkbN/k1D7Zu53jc49mEFJARNbwNQIfNhWXT/qIrukG4NHvDB8qtxPUES+1/5nDB1QmIUpwtqM9dzCv5IIRrYkFuk8n5stNxarevrlgmUAd/gc1Ohz7Rg4nU6r0eW3ecX/UkTmPYU6ilMDFxImj4cIF8aDSv/HGOvpPTsXcdYlr773cAe23wIWPiGxX5OHo6v/Krk59yE2QhQDmL9wQ9eKnqvVXLks4zKZWECQ4JCR1I1zIlwDfiNnY4MZEtdnpLmE8guD3HbMYZgvXBjzYW+mF54rA6U5U+ijLtEzSVOOUJdyAbKCvY8VgG9LDTQyCoPcFIcUEEL7N/SgSw6X8vyV/gnVnpfSaMKM/gbRkeWMz2+l+pHiJ/TzZ6jPFXfyKCXJ7ivDjEmSJpWNooRI+KSoqwc0XtKZp1Ux6MWtZRzPclf4Sq84l40kFP9+21381oQ6OsAKn0ghz7UN3/nNr3+wBdqdXPYc+jsoTrMZO5RTAK5eMtQhMPeOmE6AUiOvSJWHsCMd107XlNFpYUPDQV5jKAWB3OCfAloBgrNqTTXwbJhiYp+bYMN5deS3GEJQA9et8VbXAOQFJH0VWxXcSGyuHSC9Qm/LQ7jYUm/ENx4+vEN/xr0JAbv+Vfo4xeZnjBODVxLbk7Zm4YmCfIFSkFlmmjFfVoIM9jzv12AD75BHMMVXfMLjT9vOq0bdmhmrZty5QRosgcpyz+2eKjiRn4+/OaKrk836XEIP7SyOJfAsSAAtbNVxGJjvvHKMRno9RiNYjrU421wrB04I+WJv4L66sLoAKqQiN+jzkt3hCk51X+DCWo1TNYMMH5OY5bfuNf5cWMt/gn+KmZBn7HJ3RNw2f3+DIpNzdESZaf/KuBUYCrn2uG7gEskTyopJHE9TwiWNW83UCmQTH5+74kdAWjs3whqaVdzALPXjdiiECsxMXNY6XJQVwN+grLt+bX4dDJ+GPn8IwE7TbH9Vqp7Ak5yVzHIbUtwjCWHcv3vD4MIUDtiPQdihhPb3Nu+UxAaEy02Y5SPF+WFw4Q7cvQ+fXnBUSj42hhHFJQrIVgj/9CJpqIc9QENjbPBpbKXVvaLqwOGMkr6CfYwKRh28xN9NnMBbcda42OLhfv5QrDo+biEiO/RqZAP5An+CkLB/2RK2Ak464MA/DBXQvfQ5GNjZiV17qdnYzNuTRwMT0fzjYLKuooFd/6YvKsXx4m1+zd22ZN1Ue3B87bfUvx8ZJEi1i4wu4I6oKshYBKxfkE5bapXwIgY9m3Ssx7/9GeGEtsS8W98jfxciNMOrD2cce2lA3aNtApOyF7Y8CxlVmoHr0b0DNEH5ussgAeGJZr0rMZD/8xI1AGtr5ZnxzhTQy3TXPDM2C4wr0j/ucR3Q9h4p0dAqQgCfodqI2ptRGvnrazLttQwU5OexfiHPzMQbNsrT+iOcbqGZRt3F0JP5XzJJD2jMra/P8fRSOJVuOumDOSr/gTh9bzK2+kfWgUGEhjkCsf0vG5a59hKvqiPi3BVnUVqmnnlsE0ruK7rmQhWVrYDn+0q8U7TkVfOlcuB+f1wYGBMWk45m6DT+V3tnPIxp88djMFMC/TiHjiA2v1tDP4amBfhF+Dk3HHQsr6+FEyYhU1+WlqxnjfeFmaDfrV7RxRMX1V7FV1fanlJ7hwmX+kx5epEX7X4aXSaE9CPRDBVElhbh5npW7ct884t144shc46/+jb7wZerhGTKFNWom91DYz7iTxVSrhTzYnzr3Vx336iOsNFQmK0Ip8r5hGVjTUsPhIHSUqyrt25DLqu+eio4mfEhjOsZgcnwgxSbxDfVnOYc3nygkm0Aemq/lCpjXvgvd5Rmm+lzFRrKej0E5rmu889ZunqvJpRR6MFxkZhB+OxQd+3Ihxr0ad3WHcFzqRNlxdTDRj8QiZO9z+YLhtt7btOIQZIwbUl9FV/rVN18OIYaVKwAZxdR9ZfnnnakFbajrdMiKub30f4W2H9xKLGPh3qXvSkMUdwqtx4TobaxwdwKkNPgyV1aeacNawfELNvZbOZeukajncwfNadnWWzOJyUumdvr5OYhEmWlvpcjr880RZMwvYQVatBsZ0EjpGoQzW6mrNrgZjVa1FsQ5wjb/CUJvuLKZ6oYVDPZJUmoUoZw5+b9biOeFqyByM4CoV00qRBsuyVgIFkzdQbySkdemox4npfizLr9HnxumHpuubZ2TL0Zu1g3wuk51NXt7ahJuv54dG8nvFPIqeKT2kwF0zIJ84LsXWFO1JI5MQpoDhZGmPW842EIiOuYdm77jk4HKqAIhnfLX3yMmb4laBaO3S+QhumM28naG+0ytv5EzqP1HLxymNrOZavWHBe18TgWTdA6x8o1k4byqtn9T8Q0ejNulCkyveEu0a0NTGhvlQVDI3HihgoJdBg2Fl1lQxL5R0cY5q98oAZnlMciZFopKtKH/q2bKg0uVucnB3cv93ZAJ3XhoFxR7qbx6Djdb0pfu+GmtnzFg+15X5UAi8kta7O36frbmDPYXriGwgvD1RevxBADk7sJOCCKSuH9AworJNsZ8zO6ub177GD1tgqRwArqJy1Tkm629uIw+liinYFnSC4vD/Cf/2wk380uq/dkelUHF+V1FVUPyaAY+EljQnxj0mMIhGiqQRMWaUQLhUkAimqpzv8/5H15vFQfu//eJFUSJRlSJLtZd+XIVRCdmGsg+xlZ2xZU9lClkzCyFK2sWU31rLvZN9l34mMZRi+961evd6f3+8fj8f06Nz3uc+5zvO6rnPO83q6iDl9s0rxiTfo+NTKQ45yIURKN2P4SUc/0Fjm49FJEeYuBIJJuI6I3viKz4CZsIfuSyS1S1ynkW6B5JvYphpsXFzVP83a5rwiIasdL86pSEg1tW888M1qwwBln5FHNtnwuquRNXF+TxT4UCDDiq/4eb/bCd9m9VR1uviFitny59pU0ggAfncT0xbHWvMMFd6Bh+IS/VaBfhBKietxrjEAoH33JTMk4TDGtfrM17NDCeNccaUY4gMVYHQXDYD5geqaD3d9p09CF5eBTY3lDtL7CxpZk+b3JBSrh1e0u7sbAyNdgtbUI7t7Dcb0L+UFRvJf4PSNRZgSJ5WeOg3Fi3K48gSvq8D7FB1+34QYXLo0T2hcmh8xTCXdAUymkNwgFUeRkPPHJLWmHpf8Id7kmpPB3dyk4OKeEikKv297XM5t7JgadcotX2ABVFzj4/L5ADieTOK8Nh3pJaKkUAR4uwKRP8RvUaOfIWrbMmMnZK+87MEYnRSqLNr2x0U87S88eNbtdLjdj4on4TJsrqFUar/DHeRZKwmR6cJU7LPZFs/YCW48Wi74Vm8xG6Po4v2OpfLdM6p57WNx6+r8n87dX9Mbd7NW5lCphYz4VKXl3SG0H1K4ZUzUmatLRMa2f8ZOZEPlNWMZXumvyaoNKgSyPP65Gw7nu1bgxrZHgVLWSWo/uhRqeGtoTBRcKjq2ZtgjR/fgc6PuL/3CK1xEXL6tAuuHZnvIJqUvl/5LDN+WRezAV6LsgDc9va08gD/M/jmlP69jy1kqKvg2G5fkLrnLXnVbxFmRE1OjTbmVLkGVLkEt8x3CK6OomvfMYbD+nxLq9vePVgRzFqdb7dOHgpr0bcYGe9kvfGYDAicAF2ZrBu6lR7o2r11hXCEFAOHxnIKErO0Ks/z5nBX4IsVT7Jc5tu/wPIawYp3pIc+hz8UOSFvRgKFG1rz5PQPAAla1I0Jo0g8r57fDICPjygaAjfdjDGT5sEs6NvEl3R6MxeqR+83W9i9QvhlGMd8Xd1ZQm50D1o9rFfGFHIZDWFsUyfLbIKRjWi22OLRU3mDiwATtZvcwai0r4uDeyhtGxPr624m5L6DYy0m21s2iXoxAfUJgqZBz2eI4DTKwRqow91+dEwbV/9VQQikNPUqV7LuUu+0a3D6E8jbPE73dPeQTl5arKPAa0/+nXM3m0yLqrKcRE6CuyktScZeu7IPLr5pSZZnGHwgJjKO85/LK6LunfNTTqg/Z+euS/pWHH/OG6doME1c9+OI10bFs/tbC9qyg5I6SJ4LTm7m8Tezj5hPoNNh8j6R7qi/jwUHbT8el+ukEXpu1rsRsRiofI8h9lLnHZNyLswJbWI0hvoka+RfiLaszt22Z7k61pioUXah/2NbPbDB5rmDmpydzsBWuRHrYhu+HHbc97bKuML+sRFx4NM5cRaY8eOFS6KYZTnf5hZT0bp67+K9Fmx++PWxOz5whhu/or9C12QNZ2H4hL1rK6PoVYTCXEj457uIluz2efrnuTo341Fzpa3hLWR/1dwalPgLqdCJeJRJ4FHWWTVc6z9XJWMnPLo5Jm9Lyz8KAlumDH+sF9v36ml/5HaW58DmtmKTQuE+qnd6JjGuvIXKladhhebx3v0SppmlbB00HiijMS9iUhQ8cDPQjGZFWYbLBLL5PuK8mc29ydlHvT+lRbVqbZ1eSy6zj5+A4vqZA8AhEzt+Xtv2BrIvtMCHv48cQw8R2z/WaooeslvO9zALklncnv33ERb0QMHtquT5gGwOz99N5f8UTz30lphOK5yHuRH7O51KGyqd4f3Dh1nj8ez/iAuTZvF5aDL+L4IDu1XraHo+SBGrZmGhZSTzbJ7qcymM7bqotHJaVFrGZwej+QtCsoghlwVIZ2aafkibk0g8Bi4Xqp8UIucQV/wSrs1AXh48MqtDoruaid4qLtSvXIpPr4xFYv7E1ApruELxzhtYFNnnKyZZ5bo3vEMwKeOD0ozO7hxzPJvUR/Ir4b9FWwGfYJD8YMLNiAabWRlufat7aMttm2BF5Px4h5ktI1h6ygYxelmazDHjzWx3hzu5tIy26DPnMIkGXAvMaK3mweAAEKvxr0VSn6WBUHz2CZZ+c4XYStJaFZP+m9QDff0bpkX+d0smR+D3KorGXaTRRLmbbtYXTnJJM8X2FiMKzfBiP317zSzxrEZypGuox7PhO9mZhjTglA38oifYNBYc34GlbECVmUbtbBCyJS/7kbabkh8NgcWACdnWRsElfneZZn9clya8DBJdmNZNHjCGhV8Urnbok9FaJOTmZxZBgCbRYKBIZXXXRcK/yR/iSpIGrPGlXeDl50+jW9PrLc0VGUVvGo/BXet0EmdPGOdyGA4yWnJ+omcKWeaV3f9EvcD/B5hDF4GGP+RzEDVskHo4QXtZ2Lauw/dLkCzUEngbf4Lu6sXuALq4bvXCoCqs+eU+Kgsa9ZyIZV/4VlCbcUiTsokUXieVne6Zm+Wye95nL+D1QWo074ubYipW2weBUS9t2HBGONNtfm/BZd6A6C7fNVud4aPfNju5W8GDHSKkb1Q4e5lisEFmDtVOEXJ5mTvNrWMN8kpMKHyQzYR0f/OjEBNdmvxyNHjGmC71Kmw59nw4WRs+VZfnzUqk856a6yonvRSWjaluG6BLOup4+vU89UTN1kX6E7B4MqGjcHHfsYNiyJ26igTBiQxi21a0ECyOmA2cQV6oYr+XhWzT00p+oIjyPFUe5mHe82kJjM3rQ135QeJdKp3Rfn5Zkd9OYTHX6gu3l2YnIWvbL5o17zY9cv1p0ZtuF/642z81gk16XX5L9NDwiVdal5Ynx/IoDKx2ze2mR/3vYiq9oM65adqj3EbEAn4T1aRDZ//8BrpeaUW+aQ1JljRMCddIKR9sPGt8v6iGngGUsPZwc+EpgaVfq+SXmUhp5M9LMicoPN5La61tVTcHq3KZq4BFtqkBSnn70kqSeMGgC08Ga5jBEckQh/1aUiOjOi5eFXy8TmX8G31oda6Y2CGtDMEYKgLy8CJBZJo1FqHi+jZaNtBimKb5zdnD7IUTXHOYMPIEbfELMCf8i3OctxTgXM5ALC4JrRQtcvveBlSwIWG/nRQ2wcAcn+MXeUZMyJ2b7cy/t9htO63icZ+4PjajpX59U0H2f9TkXozME4IYWdXZKLnT3kcPC6eE60PAfW9I8u2SL/Uh0mbq++/383LVq/3zq60vqRRl7zRVEvUYqzaj25jPe150L5gFvmgEkP/ln7ZZHSZadaLFv7KQMekSay1xuiilZHX+9wn9g8oa4d6xIqe7iBosl+Lklu4xz6AxB/zxdC990sJqN3uOjaWYCL4vIogEV4WZbyu2CyKIjBdiYtTl3y1G7rV0uSxXdOwvSyKLmvfa7TzQXtXXkHTjnCjc1NamzssJverHsky7KgaLwkMIcJP5Trs1OsSDfhK3dvJVsDJSG0bJxr/2RK+P/DFVf6ukbhnb95qHeTwDYrVylRlLIcjnesoTZJyMLWcBB9qXPVYhHrDyWt3EMf9ii/H+/WFH+qpRSpODHraePIQIAOD3WWdjTh9juXNV/xUzOYaH/4zVu+P4G8rkkYNBuMB0kFqZqeTImzCdh6Z8TxA4RcP3nbptnpQLfFWa2KayizuCePq0y0FiWeYXcNICk/tFGIHg+9UELO0n8XJbWlvwPC60FhfvuyHiPVsD10XTR11cAxnx4fjodUOOlawqzSw4svMNIUbcr9OYadcXt8AFj2tC3ca+hsPr5q8F/aGyMOIjc3VZUDm1RxQshl+V3N6QBQ+GbmX8bLOSSZpwOw/i+b06oNh9KD8amIZxrHtk5RjwkVhlCtf+6A17vkX8dZaWm73cPUmibi1WNk54snK0+6FMquN44suHoLn2urb0mXJGYq4sgLpzHztaOYrLlCbeGm760AO/vawUrGpb6KX2NFV869CKxMh6vtYTYamPWS+NZjSNghb6dhfRcO8DSjoBDwqE0ERTj9KB1C2SuFvlYweNEIg5tHZ9ZwQs2uLJppYV4eTNHJSa7tMWTITTsm4MGVBPWtrntklZGlXeznnRhtN/z2Dl20SsNod4Izb0Ryzu0bXjjXOPiCt8aSoDQBF0NfeP1Ia9/Ugn8obMHG81b3SgWoF5gKApvM6NrRoU1h4CszRdtH7Tc9E2tWMQiQHS3ks+c7Xyk0uzVFQ7yXTsfrcOqAVQYtzbPbVNo5MPbQ2kRvHTMZWLyaYRs5mrIQn6hmMRmIFALEfqEoGLuDAfwcQ1agtreVRZXVLjb3RrqXapDtT9K17Hz9vC4z+RjkMhS/WZL2l5fdRJLV/ZdgRgQWr1j2eQzuWX4BShlg+sXWyTAN4snjjr6TaDnpenNjaaYOj5o3wYAQfA/S73O/PsCCL+ABBW7vNlyL+0q0gLos8pdFwBKhm/mtAPBQOyWCY5BFegyhLkU6HLVh3Aokl3+Nwo5m7nyqofP97Jz6BWe/FiJczI1Y2HfhBkMTlg/4+6UtEqP71yJWkT5a1Zk1wg7KnzCe4fvZZtUF5BFOT122xb8cgqB4jWZ34jUlRzJ6q5/4G5LfYeTfN3b+otPljP+7QQJXIuzuH27WGVonS9adnDxP5JjUl/BfEO61oKmDU2FKy/GFf1+X6pyWPhy3HyvghE5eHGWfA39maGCFK41u3Mi5s32wq7nob99IaWQ07eFtDJemu9SZLyEMF9/o1lk54vBL5d1BQlpLC62n4inwXlJfWP10l2SNq/KI0PHc3JVA80NpnyXUv0IFdAc4G4yS6muYpp3grYEFUxCh4ZvjT/LVe3X58WRezBbzYyv6eUZyZYvNDPrTTSE97zMn+oMqTXopzsqDGCP5nY2UZrY9xNpe5w1SZ/7sis5n1+9w8M8LLYvwlV/JmiMm/H9wBIo3f7p0pXnlVuwOiabl6pwkwp0rstpbow3AV/0wpVoZDcr8vMep6JrNfCID8i3g18O+wXhPoIQQxJ9SMX7r33Mjbm276R4/vEdT+DM63pRrLlJu3tN1+L5jXvZCEWO7BpNSgY+DjLtA6N6VxhWUn/nwz33oL1GAisgx3WkEi1vU3dk6yCFm8S25/q+LFZxYNv9MeTU+or47NY0yO3wVMzQEpBhyAmLC3+pvKTpJ7FAyT98MZ8199h1VdcfQbWiSMoseutgtcj9WjcvpqvX3LCB4lYiePMN3JyvnhfUwHVZ3RUBH5DJBV5nvqhUF0+CbOxVwI8/uysGbuzSsBaZCjipZneM6YlXzW82KM//nPjL12SNUxv0bCWkEGRmJ2dvBXdZ0WnthMSiIJ/I7OKq8inkhtpvDpuluCSZIYUJjg/1wTZJWU3xD7ml6sSKLVZCp24RsmiwFKOZuVmJvfCpsbfl1nF6TGbVKz/ze5Y/KkVg4E0wpCn7bMfpt6LaD1ZHJIqs2TVKlJP9sR/VpLD0ARqQL3z4OnmLTJDOtJcumsVS9ritf/JbrqCTITLZv5joQmvZi+Otq1sBJJw0pTBMyOYzDUhWCcEVPcv0u2xKlj9ett/DvHaJB+ZsXWUg7pS4M1WkrbtnLFzciv22LmdkcsJTwrjYolJgwraQF9vL1jilGmBIrecT3549VefWDozJcsQHSIpb2i6nO9wZ0nyatCU9BFOc1EbYz+LQA1Ybyij7jC4SPPLcX6qqdwLlQHamX9c1QcK9dP+bF+O70y+4rWb7X7kaB4y+kWwDuHA60rnnfgiCV+++O7lD3Jlrj/nKN5P/nT71d8qZt8jxLwQtJPaP6ZJVK62kz6ZAqe4+cdxn9+cgQ2f9rHUP0FoUbB3/f1vXT9/8HMaJlLqtnC4Wpy3hNlxFxxuaGlnZLG+847PPXwWYXmV3YWmDk3ubfQhk9HQk8+Rew8fcNmDwlQHLxZBqjziR08B4LSVkDYIWvUZ45zyfXOSszsR8SVJ2ZAObx1bm+gYVd3yBbKfLlL9YOrs2CLTdMrrYriTdWdiN7PyCc+ZlzdByOB8PqSj7olOiNimNFcNsT7Cw7weN5TKA/Byy7fTk+QDVpRhVTe9Elqlx0gGtadPXqksfTXAtnI+Af+96+IzP9N2EyEnBVqJ5wgJYkjHWzvKe+Q9chkZ8aQvI17xTu2sicbsfumFVU4g549uqFqs1GfQX0olOpxrFDTYkwjOGXG2peAmHKXWsLnJyksHLM5RsC2Zyhe0e+awUMyglKSspbiBjaD9xGR5jv+dfyztJVxafzyzXUWs4CUDMMLNki+CdKGKLBFw1p/Pv+4HX5f2CWJwN4yPrRkkILOiJcTLkrEJOEhXI5LCxdvjDfeF56xSlGDvr2M7Ow09CTkz3r2N7yR2RXU2pcVLHnZ1ulVV66k+mxR7By9niD7O63phbEQjG40qCzgqQeseD1VgztEpb2MJgrSqok7iHUlDCOIuMod1o4vgAW5KOZylp/V/dbFdLROm71RreNsadyF5AScShYsYkWbennqVIl3x4rbW0amJhoROktRTTf8/3adfFzPleZV/BQdeqbg9G3wh4RyrIxHRvGLUaeXewI+OS1UNsyMae+BmkxalrBUkg38vOpClZkbciuX+zpAZLbufdt/rx+qVmJnqI8qpSm2nrXrK054Bfg77VSOxB3/5AdMJfpjgky8uzdugCMIPtGSodZ7Q6bSLkFUJRQvb3T4Q0THCvTr5AKhxUM8fHPAD4SLxugpshE3fjhbJiW56ZjCE5T6kTFQ/brIIOsgYwS3F+ly6Ak5SEpn9IbapBJ77CESvhlrNo7Kj8D2swE/00BrCFGaf3bUaht8rpyE+zhhswLO8GpO8DQGghpPE9A+GGjdH83QufTKGSjB63EZW8lZrziQFr3rJJQ5sNo89G0g76pm8rvPw7jNlaC0ruV/hX5PMVLKQeAMBGiP2UrHE/KEaWr/TWC9WPW9KLWI0fuLFBK/u7KPugyVA+/DliO4k4u5ixcZbvUqqQ1YFMX0Fy0SSuNcFMJtkkZdEkdNbOjyBVl2VL8lNOmGdl1XLo2wFSwBgFbV/NcgttmC1vccr+S1ue7GcR0tijfaWypGQ1ouzE20YaK/WG6d1Nr+zkB/I2wBoWGCedGFr85egedG7U6mXttInodfbIkTGIwcDQ4p3KzG9WKX7NnDNKL2MgX4ABdEgRFAJJa9L+u5IIwFZnRiFZemjuq7KilA81f+kbXm0ZuDAvaMlzPr57cpf9y5N3I1NsofuiSUrTLUYzlYVjt5CZXHZeCNMeUQ0YtVJaA5thVbPJUA0yYe24mhO/MZnw9Hq5etdYpfj4/EmzsgWEfOQvrzRjwpVzfTQojDP+pJcUHrMiMEfjomu7/KkiSNkxY5FkNPNlB1g1wLhhlFWMxespl0v5866nTitwV0W7rRgg5OVNUjJ8MINWygjnEzzjKiqZtBpFAFgmQx4/pfIeUnHLM8nKNmeGW2hdwSeQscH3Dy/1z9kX1u328/fAsK6krmjrR91tEaavKPsKs0/p03WhYSsPas9VDSpW2Xy4O6JDPA990enK2/77aDSj0xXN3TYfyaoxb2FxxqPmwL/ghcdUBpnkX44HEFi2jp2/62J+AdwSPDyzGgk5uCKTevRv+6oECwkqof5CF17MBfBCuhqGaIQUbqgXDwEciqqYOAhCaraZM+vCdgo+a8F60SndcpmNe2qK1R50Wbs1E076sLG2o8aos3Nh4YHgAwKsMFnUal46XRPH6Xu+zzHvXusmlQ47DUFEWWqxmYsp/ZisdyO/9/TfcKzqjcZeIRFNUuZY1S6DiGPE+DckkLXxVfzhIwdPE9tz84KKO78wbufVrRDHg/SN34v2H18P4h61FqWMuz23zwo04PJJBd/R4rIcc+rvgNHex6iwB2oX87cuRx9ixQzvv3Dd/yF53O3yI6Yz0N6SN62K7tbHAE7lHW3uxPh3gfBRUvgXSFbfj/GSUFsyHy+2VUN/g/LPbPmGWtmlCOfOXj4Hx11aXRkLbU5ZQpr0InBDmYFf0Y3TFyoGh9VYzvTb/4jpvyH8D2uQtA3SEEL3cjCqnexyvF2mgtndVzAreyjKMsg3dOvnWqHJn29wpYlRyewbRgAeXCV+NCplCjA3bZzXpo0du5DwdcuLDsnxpQuAz9hjrXVLJow/Y8n85vinB2pUoGM42i7Eg21iM7Wl7sraMqcP2SUa9DP6y7286LBVIsoPoC1vi8cBRT/fUpqWmXcmy5QkWezG9AzFKlwR61v7lTV7aozHV9ajNMh4lXzctBbrfvyYNClgfC23Jri4+8v97bzrtzUH/psoJZPvZLqwafGdCKBtIkeWcBApK0iyOL79bqkquGcrNjFgvAPkpXV+EdrOc+S7n/EvCRdW47FKT8YEP37r8KM9o9oj4LLYw42AOekHKfUerjSlHSqRSEvANhV1H4Bnq20MobfG30zYG+NfgwxGM8DFSDwBhqbG6Bi3ItZZ/BapjPGqcFU70vN+EKBk0mcEzLmJ4wMrry/cQk6+K5zFeyzdgr5zaXc6DAj+ZR978glpmBJLw2FtsS7nBGURUg5cAoRUtelVdONtu1ZFnV+xctmdYy7iHaRHlNO4Zj6Lv8vSKsUmf3fANd8uiDUKwSGS5ELmaXMxXyTXLU9r27YyRwQDfbi0P2135XyRKhNeQ2WFFN6H+ZLXLVc9GJ+1KzX5dTDYyXJUsw1SkSKkOSckGZfVhxHf1bR6mfBsGIgPJqlcIgdfijr76mZ1jdmLsy15jMQcDLGK2f2lAJNFdl3jHUSd54qvDbhWwdLPl9d+5RmZIBDZfkgMfaM2XQYszH5gYa6r+KwdHTqtwl2V7M4qMwQoTQ+QxcE0Lc3kg7y8Z4pZA7xWG4jVRmklsrFQwdilqjDsVDZ3WXQq6Fb+OtdbW33wffr/Xg94Bm39GPt5g9GgDk61DNGR3T3NNxc5fWEepe4rN1R7VzYaGV43brgB7fWtR9594X6htpSmZuadxDK15spZm0nJm1Pbdf1W8pRx30qszH5UUoAtmW0zWWyN7KubIKpADcavWmebOs4achE+cuNVAq+rnJ26OK4BL8yOEWn93mtMPpGeiu55CPwb79WagWBRl4FPh5oQCcJh3XQJ2zmQ5Ks2wg79P6ASdqel3SqydeHyb1gxvkGkZlafrQVDXCbOnOe3mDPNFLVdmrETslP3mbaU+kuyry4HggFBAzyEN8dViex8UnbN8FAUSm0BIuaUdlmCEJuXrP6qG4hmOEvdb3drNog2lZ9wXPgsQZNOecRcWrCh9B5X72CjwNY6Vqmq7dru5Bs84PHWwvCaGtiJgX7uHxxgOICSoKr7UiVOqj9dxlns/g9grPSfJG7bPmw9g+MeDUqpk2eh9FlP+zFFK8mKj+L45iJJyfJGj3q+QMSfkYkSWu5fFBR2mkx4hD9M9L1zr0z9MyOCOztAWZOmDFkZUq5JCCv63FpQyYqQYvF5c5H389O0PjF3mmDj1aJK1/xfky0VbEpwk6rVXIYQ87cnr+3fOOJn7/xb3wAwOChdfVPB+sX8kiMtYSfFTBPD4/ZN8BQcf3d5193GmVUXNvrnOsAa6dGNaVwhbNmVd5WlDDwZ7r6XzrcBTFzSTmMW8dMfMd03YIwtIgv5Q73KDNxA86Lur4Ct6DTpW4/1XPIP+TU3oeqPyahdwnyp6e6NKgjWkeSR8rUVe1KKWUy8EqAsiu+T9scyt35ZQdXOXclUa3pj6Uxb9Bi3Bjf0JrdONH01aygTFD4PZBsspYAbE0nPHspuKRhCerrE0J/6VL+NuOTbgli6rYHUEmSov8mcotBHGrvtSvzLij8nRlaoBpHdbOM9Y8e9fh9wakZPOjEW4QNTtKGbZoKL2qLyDnRnW/uV1DmpMl7J9TTjlT6K8YSmd6cLi/hdnlobuhwPTH3TpxWjlZj/ZejvSliPUv5v/+3PTc/XtzuzE2YfXo6NroqtcWD+Sqvuwe94kUP+ate6Vm4ZcXdz/a36cr9VxmaUcvOjf+t9WZ7dM6WneCmQ2Rf76Ao+GnK91rNS1tJkvrdTusEm7Md6xz4FZwPuVgWb74FLvvRPvFcLeKuTL/zh/rZhObVtpJXIwMhSsDHNLfOpiSVZ/wpSZZWlvrTG7GDfScbnSxNLwbggjSU/LALTKtPyMbJQNaOncoxIPIzMkGgaJ0l3Tflt+V3unZGpO6FD13kk3vNc5DU44wYauuZzKz0nCOuWC3srxWjeRx1W518sRdhaZr07/KbD7Mcm7lkyZdWXvBG5khH+ZLZVqMOI7VDWOvymY357o1su8zJ9V6nFZW18RECnMjI0gGThfsqxgiUnBU3wNkSZBaZLT9By4Vi16uLMNBUhzWAhpkaCUuqLolFKmoSLFkOk2+vP3dl0ds/H7jNAIetri9klhkuSCdMEUc3uCfTlL9A5aSe5vNon0zisiEUS4jFDIdB8MvAzr8ZjBkz2W7Bw21IsOXQAKhbkc9kV7Xe9bJiLhjhgnl+6JkMDAZtN7jqU/vpL8ph8sQDx/WZhDZRSKr8NpeWmX5tUw2ub8GuYDaFmiehmRaghoc8F629i9hfRL2USzeOnCfVlWUjs51EIMfzAzY+ujXuL4KFAd3YlNyZ4+zOzWBcoMMFQ/647G9emXoClDr7Vlk9vpey4mMqlScvsDlmT1HiXZ3NQLEiNm6yjo49fTu3EZIWfHRR9iIXC4liVif/5e04Eq0vnYmgRVnT4FJ4pqactv56S+wZoqoNjKGqWp6RvR4X9Php7oRiv1bP1kwjlpq8VXyc6cAEkWKXnbp2u6V+wtLMHWlfFAy+5rz+4bW3JvSdpERGhck5jEQ48MVIQg1kTupHN4N9zWwPmUbdJfLuF1v7KXOGmhlcKFFb/efyavAMz8PoRLZqZD9ShRnmuN5KoczRkSEgGj8tPju68hsaVaVO7G43VXTCdUlMqvNfUdLav6HUN3JXl65j3Mu3ElFxwbs+59IHZg0xdRnQQTrVkjUh9eTq0ZVOPAsc/D0oAjD88JQ3q0n8TLDvYnW3XjQH/vp0YRx0dH4T5xpAU+VKebg03TmJlg05xo7S8Gw2I/IBbumI02U/yMaLDLRIvE5W144uRj2Yn4GmbWNXSYX28v6UnbvRngksyIywuWXPzJRylQneaFWU8r+DcWDZ7afcLm7Oa79SuOy7SGQYKwYYi0H6/jG6lnErdSZEV5D4VUvPwmJAJf14xY9IEkwLlBWqYh4seSpxz7pY7e4JrNQuvhsDcX4UAn0ambozA7OnEHcWBTL/PBLgRWnnrTl3O/PbtYvGh9ckuSnbFq//TGDAcTq4xHDpD3N+eckmbegkO/MUXld7Q5FfYFCw3/Ojjp63vJ9oyVqNQ1PzI7O9wMfDFk2ir/B0ujumIB+3RssG4whKXiEzJD9PA7ILKqwtocZkwc6Lp6OTpk+S2ZMb/fXFLgZ/ODXIoKOXs9pqlm4PROQThEH6wA7z/bqkK/KfC1YZirgVpGfRD4BGghLjz5KLbs1bxpTRxM0PnCxLGQE+NYI4oE12i/3QZ9FEI4G/pUPRzktlWU8/m8nGRBbQOsHLuT+NzBWIUzy+iwhZD7Lsolj3B9QYrIiE6k7RZuwT8HEUhACNwwNUKdkZLfsgxwNu9JfLdL25+9L6WfwkurGBn+/Zei/IiWHNvgbczOnHRM5eZBaEmZU9I/o4VClkTUd3xUfglea4b1NhYhA+uWiO4lyVdIqJVevmXUG435MT/DB2Cs4C77UzBJgaa6cNzCTHfy/Q8JOX93MpVndl64ZUJ44kNR3f1c/oU+Yxl/zgHKM9Sl10vf7H57BpNVmWSxV3OhTM5LIb7Jocmc0jVQROvNlf4rI6tbnuNQ3BshZuX8LtGIlAIYyQS4kFiiS+v9bj0d9LV34lnfpzGiXCEMIs1geoOsyilU64BCqALr+/Bn7K9QYAtB3tm9Xo9xGxDLC4T/3/sRV/4/pmanMQDyqXYHmdgRppDfj2m+Wf6YY7C5Cz/3UmG582TaG1g1qSmJ3OZYjgIZ1FhsyF4isxpuYPyCQ2PGbpQ/0jtLqSLzLebc+AwGCktotrBmtqoN6zfKo3D1WUEB+GwdWCR5p4OlWc+6cY8fTsiugCsl4xYBHqT3UQ3Pydh9rj074TL4E5rW8XNaJO6r2J1kLhR+o7DWy10TCawKVTYVIh9DTjdiVr7uOqWtbFzl8/EUd5GVUORNdA44K9owvCCmWsz33x2BXoA+O5uDzFllN3KnRmw2/ZNQGPgFSJaezztXe/c/qxTzjAEbyiJNue3YayZ556QJdWqtXPuovdtZRR3NbAE/3k7onMz4G0cKFBcr6IInty/jWqEIpugcY1E7UHEWqyY/Vm0gUwYCSu+3E+WbpZguLwTeR7mzwdeS1GcQr0Z7+Sa2F0swEOK+9zSs+Zu5lwrwn1Dx0ysaZh0pdz8sVKr7Lcr5sMUPjKoFJnYHQ3LSI4INDg5yhyv5iVrJmC/ER49RgeSdf89EhyiWK/6xr84MqfrH07U3GofDsqTX6cKp/B2XD8R82Z9YVfwsKA6nIjXXp3XLtPu/GRTCvfjFdWKJjLLNT2FS+/MU44bji3tnJejbnAizddciav8V8mrYou+RkB1NDeMsYcCg+cw4pgHIQjeN8xlVAop3gmNUCoxzBAMlJ37u77Fl1rvHb6HHBeKkKrzhcHgyENrZ1O+H4aOkH8b/qipuNcU/tc2E0zYq8O/0hcORxvXe1aaY/wuIRxAWdHa5JrnEafHJyveAT1lVYjv9IV5YgST/bFOaoOzOh/TYRV5OQlTx6XAtDsjXOTuBc8T8GsFWc2qrEzQOwNg3FTouRXA7VzUJ18PpWmiGH8D1o0Vz5T2f9BUk2/zBvDAzmrP0bfnUPTMtZQ92ZXGo+X3ZqOrHF7dslTFcP7oWaxu50NQXv8XTjwdeTX2ZPMenSFixCXBwAEXl5oiDrwmSXUhD2TFMnypCkknNfrlReFXrEh2OXq6Z+pB9GlectQLsaU0MTNQDzeTY46Aqua3hPCyQKX8zSnUjoxgENRFEgHec8B8xcKyMZydPYt6NT2tdXhoHTYKwZvAXCaikDLHigh4c6aJJXpnl5YHgCSsYxPT2xFQK+YLN6+T72PO/Cu7xeI620JFfrvUHEvwGwp2XCCY/SdivixgMIvCfZeDNFLI+luwE4Vd/7ipN2r4A5cwYIhcsXbMXbC2wJMLeyJ4vZipcfpbtYE6MSKiOy6qmgaz5xUcDOYK/ewNEsQtTcxfiZgtR/g5E4551r5aSez2rI1+wDVX88937KHYOOuL3NWhSL3Y/K+sRiQN6W0JGNe8/sm6FC6Nnq0vMfCJ3lIwjpYVaiOwNLnOY0RSdXGs2C5p60nPFybMl+H7j41g0YzFa+8sj0IO8ONhmtLdBDRuhZhhriqDAN6Pm08V47TSlalLkUY5pdkdJmsmVzd199weGtnZZYYtVcUn2tfp+uWR+DJQYWFEh6O6WWN1/pZtuMgrK/BduXVs+3u+j7cYYvXzpcOumSH5RpGBfGWivmAk1NeRvRw20k3TE/nkOw1m+PFjE1hwsm+gGV5hWPXnwoRR3Sct+hOSBmTbccDxjo6mHxHnhkXeUEbB7tiw2Dfb+DrjUUIG30KwFq4edvdK14DMzxp5Wa8uq7K6bdyhvtv+KE3Yr9qdpZ7gu54nj5mSwg7lSKWOD+J+Oif3amg2u+OKHH5fHsKVSoRoLGq7wR0E7tYTsF8mQahN2umTuM3nq6y1vM0woPph7ZaqdPqdkfZEocmVF81cpquQRiyajUBfHJLx/8Jriwbs2k0Nv1y1z69AykBZqNHcP0lfdz6F28mXMKsCXdcz+yD65Nd3+3yREMTjs6tHk4NggLH0N8Dou3P6jlbicx3RJcAqv4FW+U8OhvNrz+IDJNDwWXUnlKaLYjyRGcjmATQ3PEn+612l51uB/x1l0kAYoLZiXRntqTYpo0D1iSCHUoaEdAEXedL/TYazDPH4dmHNPUqpasUnKWar0YkEzwEfG6DWNMDsnj611k44C2DAof05t4C18XtNMBEgJIrBs7pkEYJQvdEEhqIorf3DhrJhhkjNF/9KpbQH34ynqbi1g3wesGNCstrMf/eICqQ/PDq3crGtJzjX5vQxF/PSer8FjIJ7PRK6YjZ4gWTZlGyWAHuMaStzDzWcuFYO2KULQ+lXUm25KKRbqDKqRCee5p8cfs5t6qDvKzosc7dgLYxCV6Oe99d9Dvx3TTdnKYVql3qE6HzivFldWLoCXk649YlL7kdX9jqPUx9dNdSt2BF17yaUtOfAIjkhRwmIOBZ89ou9bnM5ffi7uLMpPiDQ+UrypH9WeCuXaTfHpJhCbXRM9OINTLcH9z65uZ21k6/qap7SXrHYEPZTU3JiAS8QbTk2ggJD1fNd2XTk00lwXZGaQ9tB8WroAvNVRMAahckJqhK/rE73lRFKqh4XDIDEHgASWKmowfMmqLv/eT94Sl+ai9HgjaUCMtt3oIylbznR2Ah15XWfbVcxF/9lBGUtip5R6bE9rCS5NLD9ROH0Ftmvz4jHACaLApj8mUfjMT0GVO150LcYGyneCBWT91kwTJs3JfRtnMo0RK5bO6bmn0JkMp2NINVQmhqKcS9QbLWatd0fWV5g40VSgFT5dndl4JeCPx3dFAF7nqkl5T/4B6xn4thERWxnujHG33WJvTaNZv9025OvO/tI1v/GdZLrYIgJYPLAtaUBLY+IHxEjIgOaHF9pezz498ktA9bCNJ1h6OSmQK+p2syX4f+5L0EgAySP97r9R2A98rsb8wOUFpa1ddieIoS57HrLLwbuMBK4SeybHM0Tbt6Boz0k4/96P1ZOVSQYmNJTeIW/B0NzU15gzgFnoudzHeg3Y/8N5566UZHzFoP7B6YP1ZD/hnkCuZowXTKaLDqdAqI/sqekbpbwNGmsNaXyxKwoR3k3qEpik68CN0Em5NzBf3BR19nhi66hvQQXblksWwRmPMqFySAiWMVSRJfXIYEE6MAHFzAnk57lX8oLhFmm3MIa/RrOpjkZoQuy3lXoghX6idJweh1p1SdwJ3fLIRqBh+yGAOmnlH99AS0QbC0el0oEtUIzgQUfGp3ALWtbHnzCz9BZWPoKw9kPuKSO/UdDtIf1Oyv/N0zWp4IqOCSAWxvNdGCIB0zdN5SWSeodvZH78EFQ7CfrFHKqXHYL8SfEDDelYvLsBIImi69/xv1lNeUsqn0WaHkfpVWunqQd7TLPf9c8TI69g3MQeHOPh4xtuE/x/7yZA8wL9FKigPjc7mFUYdBZrxVt+ZcGNlLrRgkR81ehuk240ZtcuE3riMd6KeIgYiWA/h+auYquJwicEAbfGy7SCcWm150PwV4WgKzacr4U/Lj1xI/wnv4PXBqQ2FgAsZsbPtJP+uLa9T8pSWUmAD49jL7qkHesv+WWb30qLXJdVa7rveLc6D4L+ENL59/2VgTYW+VJy6lD4SrQj/rpfOGgt+3uCjXnbxkojt0dsj4g/WVjZ/ArLshoEdt+y+HoPpueuXmcSHxglMPd6a4RYt0o+8bezikd2LK1IfecQiPjaVhTTyZi5RMb4IYmT9ILNiprZjrGFWsJkFPUenmqpiulBek3FhUy7eII60NSZRKCrjX/kvLxwHN4XmJ2f75FbvzIzxffZXX59jj3d//k3FABJ4466jKhshebZvzUWUcKIwsGE/xlIAguxRbeGxzggnMoozRYeTU8fCULGnnWKYcv58yi+WUyxmhy9jet3L7SRAeEzY5M/BsF6y6Etf6OnbUnQEt0s201I54dGRtkyrZOBaIjhrrzP8680J8Qp+7hZlVA4Hjcf/kmAt0s21w6dGcNnQH1txdc0hZV2FyNmvjO3/JrMtmO18kbAfua3PUceXr8vS6t0eJfe9gXBtIt9fdnuqXAOqh4o4IPhbYM9TL56kIWPWs/WSJAlQsUeNno7cJR+Lp/7OHhwsRBzJrILez9drnU5BW+H9S9MzHi5NR12cUGiUDaYcqEMR4dfrzV0z7+6QN3jcgkYYB05mrPkcWbr7GKVxuE9vy04VSLQD4wVUWMdBFMYl5AKc8+AqHUCUwkrvkGG+9fXlT6N/PNzqwdJ3dszH/tbfT+Aa26B/cwuWk3GR6d9waUb/t2ukxMmNIFyjzq0AdsPu1b1J5U1iR68B+gkgOALnbxuNI3pSf74PpiWNWO/STRap7Nr+Jyja+ny+nfEhFt9NlAdCyFbjNM0xS592/6gx2wl3oK+NVEOz9ZEA2HI32ACL3QK2fneD0C1BE3NBxS+60UvxZxL1h5ihJZDcangEd2VDt8IYtCmH/VrYVajvN+UVDZJMDqwIDMS/lw0+r5O6/LZ3p+YObl1GaY0ufX9q/c3II/IakjkO/6fr0z41l7NHeSCsoINvqedtUCxif2ndzwj+ZaqOE9D+EQEu1J1aJ7OcQTs0EVbrnMF5wDds7zOQfQE3a/JtHGNbwINHXFOeeNoTVkFsc9shb9XcPIzoQb7Usplu+rjqEqZXaDL6REgJrpDEzPEJy2CN5nJLHSPFwrQ2DONwurgcX77VHbPD+yIvgr1Aa4Hiis7jJHB8F/oo3t4AehKqd3ZY+uKQCTXPvw0yxaCQCB9ONIP0GCWZSyYzWPnS1vCbP8qtaVnPhbeK+WAZKKJlUE08vqor24YS7Jl/75566zGlbFPOT85VWf92tSbUzfeGRQxUMPCbP002neqZGV9t/VenS2M2aXEw5gWdsigGUyZHqIgpyE9uNSbHlsjkal8RXrt7BLziTW872fUsIzq2SQJUV1YcLMwVZ77WhRGS4SouPIk1OiWCgNkmKck7nXCKyxsx3r3HL8CLyP+vYaEqrDZJGbGj4hD1H3KMkNn/C2hJUnI587m+jy2or8g+DlZC6DyadUfYiFYo+/M354cXYf1e3CBnlMJ8fRJ6tLJB8s7li13EuX+ao/keOXxJDDLeNNUnoUWRtH4vgn6tjNYnNUQ4qNsv2PGuIyz5Nvhil2rvxyMd5beVd2isV0NiY76FI/uhcEnwNGXyfqTKKw4nNXtoJnuatRf8kin+oQSonekOtc5Sf/tFd3SbqWeYlcWe2krETG0WwyhiSBR+oHyk2OS+t+aDEH6rJB6rFo7wsdCpmbe3OJraLgmyPoZSkvFH/WWrF1JKmqDkwPEbuuG9n4sI726DAxguJemUAaY0fuXRK4YNmXpEKi8G1X8wD0ehz+u+CZigY9xYReSt/+JHWZQFm3xxcLO1Nic1g2I2KdPfaXzIz6DUKaiEJMngDBZBO/SNBTSxUdd/7mod876gBMBs8M+bhJUdhwFN1Zj30u+RhS+KqIs7anXS/Vg9jWyWf7YO7vTLcDptowbD90dgf3J0UMtv05Q2X/eUs7+0wAHpN+b5/+tLbk3pWc/8V+fDoViZBQH3xl99jQfEpFcFHb1/WhJpHi2UHCpgbwWy4qlKa5NVVWc3CYwCJp88njETvLuoUDLeS+Pm3Hr6v69fOQMOJ4hEBLiH0EuD3yQWv/J/VeZRZHp0nCawAa8BIHd4I2WxsJTe5OJoXWhqQit4WUK39mFR2th5U+D+Y20ST4Fofg+PbI3g3EtTityLFwT9/m299aQY0MIEi1Ta8wHtWWu3S5GQBbCNWluRUHtivMe2NvcOii43Wugc29TXIfaOZkw+tHNmth9zz4D104j+6I+QLL7RLVaGVvxkcDJaa6agHf7m8GKfWSAiTejnlvNopFdObndvzrGTfx4jTWcmaG9hckjAFMXKhlIekLB5c5GDE8WxzQ2m9M5XnSR1sCpapLranoMOwpSnCAuQN+d+yY/dh5PBKxkgMhGX/zyx3Iamr9031enfF/SsWOpIhClPX05q97q0bnXHwh8PHjN4PWwMGLrfW9So6uOQWc5T21eu88GivTq1Q3dYFe+FKM4+4A0cOZSE8/TaTbuSOGmwdKH7gvRT9tFK319Lr47uFrPjNHX/xJVy3x7fH9XpmQnBb9HzEFgRs+PCnetD5E6M07GGeub9Rir8+iPdPDKwNSXeEBJOQl99ItW+v5JWqGou8e5b05+mD9otPw4F3ZVzlHO4e1iK+0sPifNsECcv1ikJSICFX7u0Pn6wUtaoqySwSqvwwHLJZUqEXq7JLVKhW/xiZ9HkIvSxuaW0oTnL72f3rkxmvAXFYqnzKXbodY/ZhLkTjkmUvIYqs26YhjwCcw6JZ/Z8RUrT4rU/P4Yt23+F2+HV3GWdMzppcc+VUGJ1v8gSUpbCwExFlPxUSt/cz3zb/XG7jSOU7nyaqjZYOb+S7m+4AsnSYiu2RH2KvkpkINxgB/19SL/2dPEdfgjJlm+qts2X7adxPUmpUa6AAFQQHUmPzABkfOWjvmDiv8SP5J4133v6kNzkzWP/qQTvQ/rC46H1z2AvuCzzugb+tojkNhXWmqtOnTGBCz2ZK41eCTRfq6MFkRI4A/vTUAYI3SxVGKQFEXLbDvwM8snif3E7XK+fCNtNXRQKDuyIOu4Bzrma0u8j95ffro2O1PiB8sEopAT/FeOZT/d3sPW0I+e3umtU2vQBv4aCuxc7FEuY7nqHRLj/RRNAes3R0bJv+Gip+ASIBVzd0x+r+9a/XxrFfiLpKgInBaxYuNJpgbkN1S+l04uXzqcrj235YNCs04Gm1PerZ9OxLSa+5qeWXVIdNlcmNCr7GgGkgVddPubLcalX9bhOwfHISRvSPZqTcsYzt57N8xS891H27u37gSjDnlEZ1frEy6hf/SMKgXtmaO7/vSgBTAiJx4w3klWGzHTiGZ1vzXh77xmkohqrujsfbvEGijKLojrMw/EahcypNSia++b2Tq5/tmwu7tA2t39XDN5OPKUAa/f95731OqgjnTySD+sqCriv5MgIuSVE+KOhUzlxJF53Hu9pMeHlyyPC44MWKnBNJgsqfMpYPyKUfxJVA3/wP1ZLeK7C6THMLL9mpSboNXbRtFhzwrvc2PLL7Ik+a5FqHz0R09lQ+2T9ZOVXEHl+C9cjY5IHqsuKClb0/vL2BvHkbSEbto0YCT2cFhktdAA3V9mjt0esiy9ouB50pi13og7L4fNTV6zwQ/rDMfh8CR32jl0/R/nb5EG7ppCkBnV9i337UJLzxnpeTWiNyW7IujoGX2gLwrn+IX2DkOsfLnDr3JHOzebHLhWQwM4ufebFBjPrS8K3l5uLQhHlG+DUWSvBI2834GXiZZjD1xkooJH9BuNv+ET+nMdsSbSNAyu0fsGizk3Zhboehw4LnEvD8WjkPvANAq4gVAq85HKWkUyWnE1Iib5UnDSzLX6s8dn6T88GL4qlIAnxOHbgUUmVwIFnApkK0BHJYH+/FdrC3XXLOWOcw3OSKQEr8vW8QIWYQLy3O7XrOV+7h5lc1EbdCIhZWYMnxitwlIZh/xZ9qlpIaNDCYaI/lM7sq8jHe3oIWW9HdlFXBW9tQ+sDzJcbz/NQ6RXPTu9eXoG7zc+Hjf65/C8DdrL85OK0iqLpCaVz8DN6Q4GggsZclAJh1G426jZ+WreDChuLy2kECXI3hkF17qGexz8jaZra75WjPKe1l9RRYCCl0x8LPqp6wjPjz6w3RhaiOgQkbLRn7+GiT4cfOJiF+S3PDBNzDVapzYcCyTPqfPlCerv0gQ18lDil/3Xq08SaAfXtnMbEarkGij6GnESvLAFL3XjaHUmDQ2/RHrWH3+1COhdPskxm+dfs8MQXbZgC5soUWlKrAPrxsX8HNhYkN2eipf2/AmL0/32zDapFhF4u67xigGGrGkQ9uG9QpjaH7DRfq+ETqvzzCyz9s+5eabM+G0CSuDFRI5Zkfr4VTPFXLXN49eFM91Yao0+P/wGvSps4Sh+Z79ep55cI6izmwT/Mtzrylkg3fZVZjClxQ8VO6GR8tKzs18akdPSHOZq04JKOtPX1SOR4jh+zhRFOOSIJ2k+J6c9d+ae2lCZstRZ2QpZh1t+U3NoR5J2B8iz1v99mreKmimjPr5P0QtC26N7//V1TTBu9wpCqeViC0CXv0lK3wiPVfoARL2zVenGV1t/l6Qr9Ohe2X2Uvsj8BDXU/GMmPUvR8sudyZ8QmTIhYu5C8iS4r1Uwht7Vdhz6HLqj+06c/YF2Sy53jN2T8K4YymqJA4qq14t3FH3OAWc4E7fq9829pMqazlsYpABEzkTBjIDva55n+287o/S5Oy8PTgezLM5cOme8grmM6so+pg/vPMxU9JgZ0F7T84BN1tIwXRwRXtXbpPuKSbsrP2u3Dod0vcl0HtqoPey7/mzP9/uxJTQA37O8NllkrxdrMmNoT01S9P5DP5bayfL7TRcTffkTOfzo9/X3LoEOqFAClkhowjbl7BC3z0qzp3pbbfpUg1X3qGeRidLzE3m70Yq0EVt3tS2M4rn65uI9iC6SH6zuMKfQGuKzs45iPymjfUaeFpy64Vdj6zuBtI8QAu92Chnj+Qx2/1ezK3xeHQ2qMjN7qGTZYBSO7U7WWnnDtJi7fjS+1ieTZtMPoW+dePAPYGuc5iiWrIPVqHv2q63j4wZQ0K/twDAkJBblTkMGzyZfSOGBCywEQifhimQhYW2Wb4zFAmKp4tjNF6lxUYT0zl9gOVAp+KMX/Xb81p2T7rGnesGKz4uvzC1gm8IUzFandV7LDQiL8a2v/3xykhrbjb/2162c9KWe6dvVzhJVcKKdVqGPnLM2jq3RdIC+k65oXMZlf84JXwA6MzbuDOGaGI7yN5uJ7DUoouNrmqWmIf0eJRkASsAUqcEWO8A0AepKSbleDhdLHT/iCpD3szbGsA7l0Vtd3kHiTlgAsVJtF3lN+nsTOaDA0K7rYTM2TWSYHm+7s0vqyX1uuf7fnRiEk9/PDT3tk5N/SmO4JRkFkva1vPgkOomoEoCwGC37nHhhRlg4pKAiTPnAhrXAI3TqoEsCbthJY7g5aFTNNK1omdMjY41t/vMx/E7fKwTPbwS6zt89dcdTC/D8uzKVWo3Clmumk1tQ5h9sn0hy1aIpXKG5IgLL9KShASf44t2q/zEasT0XgpeaMAi5gZu+Gc03pMzmjcmxhlE36cBQpCsMFqDldGHbkDvh5peVjO/z68lGjL4Dp30aax8dYN3fc5kt4rwmnzaHKup2sLxHbFA8CGviTivMO9LDCiDZW3/Cac1gOBh5jCb5IjCW1tRlrlbLy07MbsXR5NGGC1nPmWELb/4RKJbMYa+oq3T7Pl/mJI30K0Cv2mDyqPuzqeHYuO3XuQGncQq50AFnGb4mOkb0hXROm8CdV4WPJTC9ozaqMEnfpa+xV4LUtBLWZWnKsBeMpwQ6StQn98pVet5YpChI0JdcWUYVjA/Zk212QInnJ+t5iSB32hZFJ319NrV3qmk5GmslHO2sz8jHL/WhjDcsXC2I5uMJgkUB8LhGPElTvjwY878MoLuWZ+6lLFdt5NMxOObArvCDleDgzT7CpNuUU7G3W+PTlj0zDWJ1+wGnB6rusXNQtXm7d0QpPQYvk/lSNcE5pLsW8i7FdVjwiPDLytBMxVpPGCs+zTT+6v1mE1mAXpK0Scp9UcHfU5YHOuWv3y+jg/+Kab+zml1zexnqacsHs9iOxQIdo4rjn/KKnUZbewSysnpMPhRt5kBzljPNRGe5CNBs1dIXUqzsvG5GsH5xpU7zJU3LBx+TXGT8vYaQcj84a2BN+yv3ijcxuQkvf10J0dcJsyCaFrAlnueTVZeIu5hzFgYy/ftWqyjx89dRC6vchApFAJ9PsTEnqT8C62VzCghxcR8PbOq4toqHPvAivoSq8dlo+uRuNxV/Po7Vr9Ix0BSZYiLz4G2/n6bubc3SyX2aU+hHZ/Lt4+Ito9ao8azrohre6iOvVbTEQnDQWOqX9beuQfePlwWBdFDJatwL+mYsSPg/X0lq9oG3VGzDIElc4Xfa5ebXvVyTJoo9EV7qcbYPnoSlqmQVZHAFGyFMxjQge1YG3LvS1qMXslRX3LACX19JGPm74otNTJ62ASeExqqSfm7Xvw6oHgGsffzCWtRXqtiObfDR1hVhmT4m38x5PrxGgeRFzMDQ+InnF2Engey1U2PzqUCP73rkZJLfWKD1GWwPxRZ7Ct85fmU8AkgtJn8JCwm4XbaG5n9DYKxzZWTQm37KAhhNUBmMZzaMrJuFHbeoumweEm/OzRAuZ26TAvcWtSgztIcEmNH8jj8A1IvIavtRfeee8UWNdnH5v1iUN3/3D6S1tueNTWoR7XdwuL9Wcm/BBMOjfPbsBQpFwE6AVaShuwrFVE50P0aDmIxLFiPVpPp76dI6F/L0g7LW+k5/IYyGX+qiod1+e8t0ROKaBbZ5SnuzMB3FezWIu9FKuwsaRshc+1mIid2wT3fDwrNRO0n7jcgCpvtFaXwOgfbkLmVq+4Fbt+4iJ27ayh05U70UVsXBq4d7mzP/InI94WBNICaZQcVLP77oOE+Sus5msUj9J0hMbjBOHjQhqyH/8ChhRfQBjKJ5ooyzEf+SJlbAe/cHuSx0JRSLXWxOKtJbTDzXDtj+G9qJAgkobWj4y9CliYeIZGeaoeRYvcZMcPHMEdYbHJNocuWwxA2uEnxx0sxTUPHCxLwnUVtI229xKjfR8eGR3TPOmPVLB27WR3VBtt5VD7MT3nnuIBbet4exUGPHsxS0FT8iBgYog+4GlcNhdGwfor0AVOnkZDbBa/FMovElmLEMvvKP+n0KhtGflw0pFoEEq+pqkSRh4KmXw1/SOy40Zt/ZCnFyoOlfYH3zGeIgZEK0CZO3gQnVJtSxfbIsRlr/tL17KD+I9DlIKDL19qu004R0PzeYZuJAV90tj1z6VuiVtn91y30ArtLvMXXhljBc0WxpSnPHDr8ekSgj0I+0xWu9q9Ejp/BhK8CSPjWIyZ2m8EAA9z7bISKXfRJT9KSwS1eLnr7YYIoxrGnblT4vEUiG07ZB+kYinAMG3tuCGTK+o4DiRIBXier9J+wPoYTP8Hd7E0eje+GP16W38MvH9Uv2JvSJqmRDepY4gQmP6a+Px0sf53K43SfPjtPlMBc45VoZtFZlghMcaKWfiICSHtl5orbdHUe0Bfuj6EfAdkl8rig1pnEPoDkbAeS9hVdCRSbXXchzIJZNG975NK1XCgyDxqXC12QHOiVv/pJaAox6JpDiV/nGdiumxaM/Un9Z2YEcilJiy3SdqXu/UnzrjVCqcqVdV7bZqU3lHLrA/GQKmmRT4BgpJgDkGA2Herf5DqIa+3TCkHw+m7amuoqmIitrvqWA64tEKaYYiP8WThAzLgfHLaXuxnocmx7RpFYWdDmsoz8N/oeD8mebbauhNuEQzTpY2hRGVvz8zIEp7i6nuFIsvFVVhvmsu/N/QwbGYwp8rVQnSkc1I+M+Gwn2O71MlOl8WXAzuoUaqesSj/AaSs/OS7JJorN4aId5nnxNd7ZzWgvGfpflHUXM8erK0MeInjx1U31+bxB02ZGX2l7+eW8SpYKTjM1TAa1FwvI6N/NSKwWCMLjxUStymydbndnc7+9KW/ts/7oLB2mUTowOVX41dKP+WDT6PRsG3D9qcKKRUl7hrJMmBcW4PVHwP3/P7a+O6yppnlbRUBFRVC6oEhRWugtVEWaFOk1gFKlQ0JEQEBUpLfQIVSpoQlICQgoPQih96b0jnQBge8c8Hne971+33XxRwjs2T27O7P3zM7cE49oI6YbBpHHcMAbgeT1F8gwHNcbOxLY0/MYMA6iSq3p5FiB8u48Wml9itOuCE/3ZAmNOR+RLdEXkbj0Kp+YPxfBnsfkx7DoJ5waOi82olmXQIRoLLTUccgrwbQBCrEqzL/uIKVPbQ7WLmTqYQHAnn+z/cnS1pd3XiDYOZhcQ5B6TzZfywe1+afFGxsElBTVDTOeNxdjPr4zHPaVxYKkIVrxxOYyVtX15G2RdCbK/rnMIFToQmWhtFuEduT0VBfdUU1I2ydk7cfxZaUcDr/C0Y8anE7T+zkjmLtSliNUebuhsIrPypPR1j5KKUQGQ3KJ8koj6MARf9ANNH755nQVsMhC5S+tb9J3NW+N4zXrcgltGwsfLsonH2Ce/FkJmj24tJ8XZPIbDsmiKQ7hTl57gYvVdCYrKbS+sjXI+ly1ydpZVtp1m9/+xtxq3zjkuyM1Ccyqzh3UJVx9K3XHusM7oxeEQuQcGwvF+Dn/yIjhbida1w3fxlqHApYhGFB3G/sdzYl/BsxhQgUBYqYL/7uMAKlT9ntY/8GQ946UWIQtPjOl3HBodgXp0MLE9Zm8bflN06a7s6b+pe4KwcG7y9HrH2hJBctfskX6ckSBNpgFNBgAg9PfN2zyMb9KeWOW6EuOKzBWY3lBPHMwgyXuFb6YkvZRRf05rdfJZInNr/LFolDtuX/EmfyOF2JRz4KB1TxSErtoga/R/6BF4UXZolHDFCsST3T335it7KP8gvwbXIFmZqA2P8fYj948L485vWHJS+NWsxZ9tBLupO2fUuNrc6QrlXj51OFdqLTFhspuSW2TuGCrOjwonVdoPAQ6rxfn+jS9Dwl6/NP44fGfmnrH46tmZxkelkR40N9MYsj7LTlq6ntMrjFQ9mkWFj1SBF2algS2RVORK3c6QZbAlpMguca7r3+dETQNI7zGRXZtXtb0zUPUUOaGC2bi4wVjK09HnwXfTlh8Dlj/HgC4lF4PFxQoqSM+LbhwxhnCqbbTQFjkeik44jTTP6dooK6WEk+ebaLvKwBfiBQgsBY/Ild1gCgw7emM7E3a+Z4rKbhxdNiOoqxktn9uaB1E7Rl1OXuuSdrTc8GkK+Zz0zXr5SH/H9YxOQciLXkjGuUi261bdkkM35ZUOgctnwxPTXDkLR3GWU1ydoOxvmNdZzcaRcGPia+6Udb3W+BUrlvY2YPSwvgAwd4RzPG1Oa4CHtTcWiOs0783HBe7ICgAj/wah8gVMRya0HuhUM+IQwd2ljSpmB2PfDrQK7ptvMr2ntnMdiFC12rZRdhsKsKsNBpP7BbjqdvvKdTcA0B0Xizff5gOsm6TaLnHFHxPaJ6yZZFa1i83FivM8JKaQcq94y/3k1Tk3+E0zDZJ2LAanjLuz/vM/qWzRy/JtRXFunUpQ5Qqk2xUCbTLBbI3GxUcnoCgGHrRQlXf6ys1r0vO1juWYaiEaVOAs1AvW1ozZk2Sbmvqywe55BIe0AVj5xjcuPBxbCSOOgnzHVV2nsFi5p/7gaZ+YmwIXzLDNwDmv7Asyg9cLeXTmQGDqzdp/xNczYZDAw2nCP5yDwEd95P2XPbjZKpQb+5l0tOSW6spYa8EtFK0ayttImS3svf3Kuw3clx2NcRNDAdYAK66xin8PGdXA92aUg5+brzP4Xn11MXf9eKo3QD1siTFb1x0a5kU/iLb8WoSdd7f2up1kvV1215isVERIxxM3RsovuwljPnXM7x3Gg9BUq+XOvU24rY7s35oE/FTVx6Pu4+oi/fqMSOSJGaKE2S2L8z131t3Y5n/4fkgxHilTu/gff8yfVivm9W8hB8gnFr5gEXAfZWmedppuU2Q7yS31v+FebhzcsXzHKomDM763QcOnIx26oZWQdRGUS/Kfl8Cr8U+F2mxWQXR4QeKyb5FcqpbbxSLbCsksJktb1+KSTYP8nDMb1s1izn6xAoypcCt/8M+0XtI0IzG5G3eH57K4vUu2M3OagKjWhI72Zsoy8koTWWfz0yQ5NkccgazuJm8uhYi/paxHXuYfR1pP83tUNRu2PMylVMN6K4yt90kkfLOcub4TrbXBD0e9BWRXjUHDGV+Z2Awn3tLffFB2p9TMotL1sNZVJJLwudgMXIO3CGP5ZV70JjlzdmWqkK2DpPETeBx+8X3YD0ZPO8FHFs2y5ItSDzW85dWS/kpZyXeCgptZvjxz5fww0ET2xROmfP5gv6gYFLTYFvP+VKzqWarhaL7rBohtw+YO6Rpn4Zd739KUguJeRaCbh3Uyks4zA/xdWv5UzJp+U5oHoAwHvbAQ8B7ZFWJgnzZS+BFstxFt8cyBqlT994Di0l1zlpc4m2TFS323WdMFSAJCa7tgCTcyBCNzYwAJYEMkIQnBnp+4Yk9oI+g54LFxxBlpvsfPceFPgEmBBc+rNF43DZdexgw10cAUeSPv/ijXVQwyOJSbg0vOT03DWIp9yTnbaZkMVtwC1Qa5iuik0IQjiEAKXr4OG809/IbxNEGGE2IBdLmVR3aBTe5+XGajc8hub/FIQ7G3vFqeJgxQ4355rQA6QI29fUbISzKH2jr/Y1k6FnlgPOexZiVQLyjtSZQ10wbCahEAcDeVoZca0b3rtN8pf53DBFeYk5NiW1/yqz7F7Rq2O6X3o8C+YxEQ25PL67hf4ceIqsbqHIH5RoH1ydXvM+VHJEKqtdeyNbaN+gbGLxX9e6bbmrtdt0tW1XYEBi3eC49TYfBp8SbmN2QRMbbnNGofGAx1KIgqtA3LVpdJreIHRu2v/O96vX7P11RH7jne+Y3qT4oRbLVSU7XqLp+Nv9u1lSH0S9QMVosK/puvwDHWFKk3KByDdm25f8129Hn2zZz8TleuxKvQ6E7u6+PHvzVnzWmeeM0lJMpNHsyiETrICwNqaIJc19d9pdBa+rfFnWRT16/0dL7UUwdjdghHEdqLxWwb5cKc0/XSTZTCVZe3EdC3JleupHc6SZdzYgy45e4u8jfkFfMhjfBdLL5IzBVTDvXLBXm6+/X3MysQwV8MTMrWswbwexK2pr5TBBojcwAIA8va98IXtp+AW9OQobACzjpV4Wi0WWisZ8J2a2ZPnwbtjLUnrSy5+yujs1UYVDumoP1ya30lM/5cFhtvJpeDI3xYmR+liJ89EgyhsnOwQbQrvdeIJYcXDlKQmALpFmKoD+Y/ef+3NinokUdwt/DdHnbobAJ83t+p2F2aSm/AGzK5Y5Y2cqaLHx7ZlPcAGwKyR+/5saofy2/fF8r7bkgT8ujgvKgp9/RQQJPCNoBgxTEiE7Dw410Y5IdLkKNE1jBaug//zHjNp+IT5Bncjz0RxQWPmZ/kYPAO17MQTiMXbL51LZZ+nBgbXyyqj7Zd/CgEfsifGjgrk9o7FXozn6alP/5dzNZD0EN/xAM+urC8k5x7KCrhk+yGsA4u0ki9sKlrVIRyo3xDvJB2WZycAlXkBqVBt+icMCbqMaHzsrTY8FgQf8fHbnufbjICxOtaVJV0rLNgE2d99yaRbfleTv254n22NY0d7kypLVceZtA8OS3MuzGoN6twezqlIew+p7SQizlYIvcpZuxD+78OgkdZyA47nyvVNC/0/Zu3lveFk6XU4kZekqz90fBoqZW/iw/AOJ8/Elp9bdWfM72J1uHhGmWL8KxD7yHkO8dVpdlTn5se7+cNsuNHaFzfUub33Nk17V8WPWIgzT5Dl72XWM50eVtf+Z3qpl+Rib9AgtF/bi1OpvGpDbs/Bj1RrSH6vjKnYEIjxke8QLdJu1uAHm11RKXNOLyw/oQkNemX4qV0ANIz6qPTaK97/pz2m7+lmqWVXE8HpnpYDtUvKwc39hF7zl95TIY7JPttXS71t+oY/tqYT0GJkVipjLJqBTX3nljDvb7Z0uzUP0jDjjij0ew9mDf0Zc1x9+nZa6Q3ijubLvUn0HU7kyGlV1NvUwxR/k8ryOqXxdU6yG1i70GZik8r6nMrwgKdM2OGXG0e9MPIS0Wu+dWMwJ41Y9twzy1NePqdLzrGG5+1HzqafqQmndbft2Uenpf6OVJDx91M5puKy8wj++IM7TstTzEWadWQuq/IyhX7r+NsP73rg90llld3XGPAmsTTaHpCnIr2Xs6p76guJ03f0k3/xOSLqEyha4adDUdHCvJUvg3XggAqiyqrPfMT6O78VjhKQxUKsjs8mSEErp96sb/BHfz/3upyh7I9OF4QeuKM2hei8xP+OfdO+LEc+wXkR6VEQFWI+Q4IO3j3nbwaaf/RoWHz15NdlaV2DGiFp/2NxKesm1uoHvqmn8YS1n3qlG0Yu/lYeIRuXS5SfqJA2ziQuwXLrt5+/PjvT+41HGjUx8qQFe4o88mGRixw4S/b5S+DXngSdKwsM33KNmpYoRMZI7u7h5rJ/krhKptnIEG5ApVjNfr3ABejPHF/JcJ7n11K7UT62UCl2EdlD0T3nKQW0RpZS1GdbnnY2+TbGsks0W/X3YxeW0UpaX9qdUyga7ifVs+sACRZa8r9CJms3z/YQ2BGj95BGCXt+2tO6ueLJfNQS525EnPif57ZfhCplfLRSG32kO93vnlpEvAPmv/3YWyyV86yo9g8fLLP7+lPd+BzYjoM2YCEIwAVFuXhckHrYw+/s4lAAV/V2eJT+0Wrdlg5FdTZC1+186+2smnf7L3w8tzoeV2RORf5g+XL8y9ueLfoLq63GHEp5Q17PPMott8s8ydrneOsqQ1oMIOV1Q62A87hTwdU5tlGERAVg5FG8fIx3sCwy6Ywieoi7k0om6SX7MQuCzNqsS3jcxIbJTiVbZTypserDDE9v6PlZ4KEpu+mTNihX8pb5YwM2yXYiMiN3zBwq/ZcEvUqAUr0O1OsrQxCuXxiL+knBBP6bme2qzEoPRpYUzFe56EQ8/UI4S5Kkjxo6bbW2Shg3e8Wmo3NqM798tbFj/jNol36JnFtalBv2O/++LQPdb7tkU/7HqFb7GXeKZvuSH+MlxUJ9hBtWPMMdIacqooKrCifVKbouLak/tuIjL3gQFMk8dQJ9DcKenKz695Vyo/+exBGNy69cl8urypRxhI+vlRc1adleSVMsygARorDp1dfC+fiWBKGmB4mNpDGzPkkbhXNzx23jzx4jFVQudXlkSS0RFYo2GiTyDC7scSGaOwmYXFj7cd0k35sNvuudWXoqOXX+91rwcmmBMIr11RxHusst2OvBm+HDVrymL1I11VqGIQGDQtiv89hwpcPxodv6VtBxaXFjIq1rIpLIfE86XJZFWgLKB7cparbGgL+HRaS/m97y+k/2EfoOcB1hVi1mBBcV+JfCarAthn0YjIMYgwsL9yhAn5IqPGbiVEliU6DbRy+YXq0Vr4ng/BS+zs7dvSVH+qkXN8YO2CgSitec8wY4t9akORsSi+2hK2w10+8nDQ4Hv7Z3pxOBDGCpjAHNNGLII6h0RWZrVYNRkmV0iwaKzk6udPUs3MPidcFUzIR56vLQV7CdS9WXeqjC6beKkjN0puPBohVM1x32JX2znsKXr4MzwkLegAQRHeuuW5KuWuEq6gnKAeUPbcKWah+orJnYP7peELsCgFOw6wsodFkqZ6uhlyQ4PzYTqCjSwJM2AefTFopvCnd/TVAPFxiT/d6xelwQJcI2wiSjMvH/nlc8SOvXk8v/09NA6qaE9PvuCES9PsTjMTJSO4T/PhsQs7671i218WCe9lktcZmh8zf7BslmcXJLON/bHSVUHelsZ5/G/dzLXn8AUtlwU9vMy8BgM0eit8TPAg2Q/oNNhNYeXHp10i/HWsTxfjctusIpEffr9TWWCnJc2L/+rTx473FV2WjjO9VQPk72Gx738Wr6nzUeYkeuGI+e+Lbi9kSWWGfGHq+skwXdNoS3wOcZ/3M3+t9kc3XbFzVlZjrAvhs8qUek5zaC8pBsT93Bp+ADeKIpYKPdbU5OwA6/V6avW3uAdJmMnfXir3qJl2W4aW3S5N71/PSoT9kl3a7FdvHJyftGs6VzIyfkK7R1OZWGtvUE9ZTlHuv2Z6IwYYxsPi4L/FDOMF2vTSNVBca2F8bnIxpYQulVHmJGIKeW+P48xTjHd0UTjMFxSnk/tgA43h4bTyB8xcE6ELaSSfUK+WUVQwVRR4XZdvQjcHGDIPPX3dnJ0XwsU3GTkv9rK4WwzXd7Ut+FnqU6xaPc9fOWyrk/wT5rxMustJF8mjYfj8IhRGPgc8hXOPMXjsFughHBNp5c2WbNmadT/uy6/8FMLtOGsZf+X5zPV6jCVw3D6fPMorjpgipJmDkcvZcARL+ynVozFBqKqL//KL+hz0cFN+pcaG8ILWLS+c2Ew7FQDigWDhPtTRmSVmCzZsBhs6+/3lFd18kqEHYOrvIYC1ahacLf9J4D652KU80z+cwRQefvnFG9FT2QjrPPPnhmZp9LikkXWDjm3t8dptIh/ecqGQjaFX9jxzfdO8mHFBDpSM38yjDTDAYsVwUqYhX2FNo1wHfXArrwcwKHZAg0JjjakJfUiT+FGXuHjtbrkgGAl1mwSwKU6T8RmpEex0TH7Xce0EZuLj3xh2Oap55saOJZI6MRWdU3pRrjPkVANB+PHPQz7/5KNS5Tz4mytwY16LUv46PcrybijwEnE2M5ATT4IXhdpYTx2QujKGT1+FaRBNV2dUoRHSN0Dtcz02mJCdlumUwfGuTEhLvOYwtaiLQjIND2jhC8hd7wje6+vXoxizMstvE5sbVDk5BKyZvDt7lKWtfHBDq4vQZ4BRuBA85gJa5k7gFSzQ+3E9zdOwZ9002EHLx8PTjkJS5xbnWjpObgA7cVv6tKCmHNUszlgp/DGLWRBdM2hGhwDDMLwNzfC+p9M2sB9KmfLCZ1Sqm0E7+U7ktfDErQNOpzA/r5/lKHtnQyQDD/OoTRYxcyEDlXC/76WHSZr69FilpFs7ai1b0080y7murwbXUKpUYGoAEzLVtT2BkeW8zYfXIq6lU3Q9rfaZZAtvFA1STWsj/lqR6LaeVqOeGYcPAsl3utMFwNqEUR+f5G0ecoYIurdwWtdUYmOoAQv6SGwXI1xJrj90x+qnURxYu6ejod9C8QumV8dW0+BVgXiYDVsJGKBNZl6gHr0zVfjNa5UH7fbpU2bdAwE+L9tHIdpHnkLN945m62uUPUSyTT7JoiIOmJTlfk8Sdf1EcQMiFZIVdfcXhWixZsrDS7Ah3utRXmtXiGi2aF/TPHgws1+7exiWJU3hEFS99l7VJFqPYl//3vfd0H1krzxPD170KI9EgbksWiG1gSVA1SIgggSsJpi0+dNPDj74S0ngxcz+2seJq+EKS1U0B0TaAdoZKSzuLCbks8+vBuDHay0CfWVNvTmzsJGPT8spdSbNzI3hzOgful7icSVixyfNdDHpXwLJHT4JuKKqaE/9fkmAbL1f97fI13STWEUrSYn9urvbohcnftnly/ZHs7yk5qUS8688HiXY05gd4Zr1tPbiQxUprhBOJj8IruCqhbhE+vjOsqUCP7yoI6cU09mJ12t0baVF15LG8M+n85uCWywZI00xr3VkUy0O++sDejsmxjOnVUO8W3XOh8d0IazRjyeZodhO7y7oj8Rp+2o7e1E2X6mVieFZvJslO7/SxsNFDpaQ3UDxgK6kGuLTWI1Espnr73lb1g6O6YGDzc9c7xmY7n+UlejFA2x8l6zAYkCJRp0rgRs6zvFRihzdUr5s2Hfn+U9RUI3yUObwDYStcGx815s7YKitNNAkUl1vQ1HndDoe1Wvpw8aWf5l8a5uCSlT97nIkiW1qSouvzewzjd5q+eLh3nGCrN6b9xNRJ4Lom9t6BDED8hCvfdPCX0e3f2+5ZKGA4v4WPSc0lhOqLVXChiMKmhECy13zGjDvTZj2r1oFca6JmYe8C+aAd2PVJrhsHLtHFbELWhJrzC3hQfj+/j3PGuAv5t25hxWhhJxQYaG7uk+gO3lGsnLkDeE79B9p9JEnw5mO1/teuCRyMCUpQRRXjVALHvJi/sHAwucF0JlsG0GAr5PatthFtzUcPNrzxMeNtg0vUCadYl36N6XKk6wP4kumHp2VGf4O8qvxJbUFLMKMasSVeWtApDtLGR6Hv0bCwZsUGKC4soNXi9X+kWIEp0ptKZeTyeKv/G9my9lGZbRk/c8e7Gmh85kupfiG8LizPgMWxypZtCz7j63ix+4utJoInxgWzfeCdHLGrAAyNodqV+jp7TGrLoufwdsij9aauZ42heQ1iGU8viZC3+MC0FJkoZVFM5mg9T/QHLWoFRMvMh7iA36VXaIMT2wHoKVpzOIYXXyZiVMMTsU3FMZnsfZGeb6H7hfJ6Oj2B5RKto30TMmnOGQhRCqKGc+SqHq0cEzAEN8oFI/rlchArpZc+SawDD4gGnjA0YdQ2EdGugfhf2mtHhMrA3PEl5T3nTQ6AKGYpSlV9fwC0JbPrcojzgJaEbu/Iywm+cauRb7ujSZYzwlix4EgG++/y6/GoqiTGx0fH7lj2FHqQ8J300LbaxjAlmxU2hypyKrq30iSuqzblcJCtlY/4xJMxrxeBXDaXvsP4xtroqpFYkAvKbYBQPGW6dtbuE+KkPk56LhRu9CwMsLRbmCifphV+G5VU+CKUir3fLqKqUciM/RZyWlRkY14Yge699+fCtWUHZimM9+xQ40OgVNVDkxVYlmLU/kiHRmFPiVdq8rfhlV5gKmA1N8UaFGmE9V3vCt8xrX3jRUbogIsiw4/39HgvQewPqB1jVM5TsKfRv8+1f8ZbdXlU+R+0B0kY0M+2gr0+Pxscb47xSwakplUZOevM/aKGkX2jRoHjVRvv3SptPF4WcbfwvRltaxyQ24WOlCkMvEHOhXaaXNNArVS796SmEvzOOuGOaOoAP9EZWxNctGIkgjH1jU/DcrkEDyLRcZum0Lw+egXapQ5fsevxFk1z6LSSLn4lj1xOyNzknU7y19ahRwdMy4Lv7qgvTZT86jSzLYI5GVJelcKnTR+gNR4wziKVlpSWO2PWDivNEyZkxM6pgUezVrzsB1YzDk1+bUnUYNP3e9Ovqpq2Kc/Z4UPeYYp3L2MX3rNnwa9G38diWdBZuwuKQAWVJW0LHImC8pAR5YOncfMl/zxgcLpkOLjP0ug8xM5eUY+QJfQnOutgSRL/3SZzIr0CVxqVUECaOgxEq/dOctLhJwRWgI6s0DiV/s9TzoYrt0d/dgtWtVHCMkx7NMZv1eV/dAoHVXVdA25POQf3ke4llf7YgvKFFPVZIFcdvELWrqwJ2fUf9iSf7ir4rP0poiTILavuAwknunNwOf+hjRXYXLxJnQ6MWB+1QZ9UFOaPAq1k2GYXR1fWQIbm62LJd8MPixMP85v5zjRYLWVME9E7G6gMUSU5a6UtCinss+w1W21xtXVJhUrxrf5UJvnWONhMq8Gnd36wmIvFdkHW3p1P+0D3tQolrFvdU70GL/x+kRz6kFbrYlY2HiCndN6ze1tNLA9V6QCfM6f0rm4rSA1fQ4xoSowP0SH0M5L6XB7aEJzX/jBP1nCGxNozY2bgsslZyldUZ4ThE+FTcEQ6PGAqdseTIU2O6UilNv0lY1uor9WQccGdyggvWxUOZV8jGf34rqseM/jBVfYTzyWdyG/noAi71cTLim1E8s+0Lmp1+36VClZS6AVOp8uburhBsbjAigtbCyqxYw+DXKyQ+ZLnGQ2q7or/gOPncHnjspIkRn2/7a5RtCnpKetK3ion0S1m4m3xTrOp0NNPZDM7s/+3Q3Ll9STzPSTEIpJmoKhJVd9ofD1fu0OL5153yMAn927rD8P05K3Kwp9TGqnQfV3+9EzYhD57hMBTh2+rVB40buarCfJay+8iL/GI6avd+XnJRzl40kOl6RzZtFBS/7gRir8r43UmJ2E6EeyafwIHWumf+oq4v2iPgnh4SrlXep7obVcbTuvIvqlj9IaZTmywn/Nxik2Z8bBuWEcKnSP2dWHw7WkCuIa9H1tYPE61TjhWkj1iLLI3HjYuogW8UzxdVe8rGvj7pqCi26kWDYAFo601nfyvyes/SlLE9crWln2T3wQJBP26HkF3lUsV/ISuJpzKR37xtLXIoo0vdCl3LsDOm31u3OPZPiU+nXabLJbPuqMosh4WgbA9O/BLL9xd2uzlMmftlY+dGZ4K+PUKXKEM3WqcXNrw1r2ld+l0KJNJaMKNyNaFB6bEzpkTB/AUBzl8vfNBwC5a6l1OKDLjePGpSmVBOeORyGrPu7Tq3VWfQ0Rk+7XvuytM4/0QkoX3lj6vxN32hwQ20fvzsS2+0xsQ94AYssFiO1VIiReFtkIyrru/65u/9YEzgr5yb1Wfb7DHImvUdelONZPciQApiztwj+Ntr/+n54kZQYiRnNA13a/KCCz2mtWSM51MThSWgeu9s+uIFZeQgemlBrFCvbv2/Ze4FcjPbrB1A7eP1x7I0//NGwto9Oba63q/AFRtx8MeIKV8URs6afPLniv/utKSmCspdx9C9Pmnp7c38nfprL4ve3hc1runc8IK5sNILfwX+IPK7xGrn6/OT9hbghAFYTxWKwoNi/cHszu3Z1T+CIMJlCe5eZaHo+8vE4fODc0ZKEaY88D5jUnIhwc1/YchdTPDbM++e0a+ZUFQTKaYPjYVbA90idwPZjbIQ60WoWpcrbxv+u7GJ9ikVVmss4+gMi+JA9l21sevbbTkA231W4jhASaITycgbNIEZD1gg2kPpgEqnyqpCRndt6QjFHDY376bAqP2OJhaPNP4vNethw/8/F7dE+SogT+nS5SfY15LR15Bwxoms2gNc8EDzQ4jOY/YfJGTvJD6S6Od2oM2sNJZgdFj9zeGKRx2jjiRxXnLkRfeUvhmKBU1C8rI7E4YGvV2TBKGCSTMpNceH8cOt7R6NpE5aq4bK2SqY31ipkT9FSMhN7an4O1C5t62AKzPMuQi7S4QlVQXHZaXWBb7qG/ekpkdHujOW5XaOCV+4fep3mmMcyu+suQvDJMX+fAFzS3LXzx0xzss5ydY0jjgrnrzzY7PQS7Fx7u3JtQJyTxAx3oSJZ/iW9ouXtu9bcdiTU+ROxxv3YmoDxmX+cuTzl1oP5uri+6/771wzVZZZTqfjjTOJpOpvYidFb4wkVUtcP7I5g+y5F+0uBRJn5PxSvJY2F+feM9yPxgetWutUq6CYs60zz2bgVK9vk2eicXu6e6Mn+92Xqx4ZkUa1nVkOCgjUlJcpMwwb+enBF2QkWpydkUBT8O0zKIEqEIWqdwZN8azAroydV6XXRO17310zPFqQ6tnrbNc9ZzYwoGFLrRB/ro2C0WfIWKFwFVY8RIENOGMXj9dJYCzaMCpWgiq2701Zrevx7TJFpBsbezQVXNSpVRzep69PmnlCST1VTCSIBtuscSTWzOZ+seWNAyYFoEKGkNCVhfBazY46e3o2cKEhdt3acLhEhVL+/t/BS7auJ60pvTqih1XHbwbWB3QsGFFCWcrfFzfCNL2LugM+qorfY6d/SJoXuGVBIpgoErEbEWggXMmjnArCFtQ7dfbq38SojIANnTvpzxfIE5349aT9P0Txm0YOqsbevvTugLnr9u7rz5RXKmVtJm/YcdXpi6DVb06lj/KixkEU3bDhzAouRmMJaROl1SAgrKqA4VxGJZrUUPWAEi7N7ewZ8l0bFiiW1FB2tmQGXzW3/PAC9VuwGLuBW8VLW9l5GIODD0iHuguJoZsfCKbfwCReZfg1iM1bOgo98vg5mXMWTVPmPDRTgyM6I6o+x1x+kDvoRzW8MXwykrw60zdnsUgiU/KCPYtcc9tTXBLTaO3oTStIGpSMMR89VSkoOmL10c2stsCgO3SkV1ftFj2wNuxpGg1RSENTwQoINcOLvkL3kN/P7xYGVPVolo+cv4UvJCj7FVc4RdNlZ4DoOSStyC17UPe+EG/RC7jplqp6LpyphLooVmw50qwHovRRMbszKTe65MJaEdaUoS3woywMy/1dgvQr3qAqMYOSmxrUe1aJyRrx0CAmUqd5Uz3eZVjlLNrKrmtoWe7TQ1V9dzLgofCJfJHDNRBdEwS14V6B7rMNA2CGjbOOyleDRc7pnDGMhUTiU/VSOSDR9XOS2OxNgeqdpUlTjE2v+qyszCGb/aNH5sWXcxvHB1/TjMf+fpy2YWZ5LRwFM9hvIJnPpLrxBEokVeweOioDMc7bzs0hI4BSAtWP9CS3C1G+MJcs/7YX763noj2WgQSGsyhQ5E7lXlswFQK6sNDBu4s+leRehwVfQO3Af4yxSPpMRWm8yaTtnxMNrxUpSo2/GAzPUQRZvmKKZyYfl0ec54Ei2DOOBwneuxlRmvMR7VRXkN5lWHSuJa7y5riHj3VmP3ejCBUkpbGnUZOI3zPeigHn9wc6T1OJXpk9drF1kwTUsRCWf6Xnqe7MJOeWH5iXGL+2y88LS+oVJkv7Krh3lBlmH0ghUif7q6ie++piiAtoSUKcuo5leZnX0Ch0/T1dbU2QkGMoXmJitaHuPmujLD7cQBTcj3rDeYPe/KUX77998arHusUaJWUvb6maP1u/hHMqhRhfK/iSnL6sH423k9KhlfabAh/ACEGaYRFehlS8NjhIDlvVCLVlw9b4Vf7HSVPq1/9THoYbxmMdxwA6ymM/GuTB10zzifDNTdecPraK9sZ5vg0rYk3Y5q5BGf1m3Qgmn/snI2nosVmbyPFY091SjdBDFz8tnw89JnNbBYSf0R7JTnGsHEUk7ZU1oo6jNaqJSUGjcykwl3a/dxDQWReRSwvR2Zq7JxiZrDdKd3qu9/dOQuhFBDmQu+gjdZKx1Y4QmMuJTHFm3tl30dXIdoJo86asSDCTCkJ9BtyLNGF2mcZxI1JafiHiTRMdWyPgE2nNz1aX5LQVzl4eRK9DnU25XltZNtQzqTZkJE0EiCYSO1rncjC3vBE0rhdjAzyX2Zy6nsYoRH+RjXdU+UthLLOFSiwbfK3pnYGrBxlSuqHdmjBHLDbRKuwlDNA6fiTGQNbGV7o/6ouaJryyhgo4XGOfiQLFI+KLqwzFtR+e5fFiq47jc0ou7AsUlQEwIGM17hn7XJJhY6SlZsSVwSf4S58Mjf/dnOwZ+EixEOdteNUD4Pqza2v2jU5DKG3E5YDDDMbsX86MR/aS+amz32K/2KI3ZPO80D6ZYN0PEdtbFScw40twUMsB3bj3wtNh33e69GRYw+ANANJUlFrKW7NqYN4yLFsXVQG4XrILLAS2zfefQzeGgCzGr50Z5beVd/o6psaqZ7O2W6KkGpNEt+x4JQADX6YmaRjPO1vEnCIq9umHZWikRJzHrcbHFv/M7XcexCxNAEU8D1uCyl7M1ICJwv99tHBO6j5vGXt/JwujBxiSpqCVR1wrBHfsnRSkSZZwtnWG0E3BXvlX1tX8FuPQIAVwxJgWJsHMYVOrUeCoWjNxhqama6cw2aWu3Oh+EztYM1rV0tBD8wLvsMZuQHHnP2fj9GDd/cffLkLwe0++9I5ezNmQSRGirGXix4c4dFyXDP4r+VfMiuDvJ6+kx/eqzyfp9l/75VYi2NmpDn99k12GdFO8dIQLMMu7BnZyGiE+D7p8T6UbbSNlBhAdjlc7mqTX3Mu+62Oe3sB518WP4uM0M+i59vkGH/fXuUbTklaXHtWjyeJV51to/Zz3i3r5Jz08W1e/1yRhZiOvlGYop3qTBB666li0ib5Q9Uh6+9PUgwbkfEXuh1L9sxNRasEe0TmJfSVGN5076wd7zpBb+To93AWhOvsJRn0Ef2+7lZz3qxL06J7NdsTl0LIkcT90CGfmi0Peo7luatRaJdlt9USMcIFKStf1ShJ2RhTZqI9+VOEi6voKFFCZqtXnnvtFEQ+LW/5dbM5nP+x9GbeeXfCHY+OkYOaCKeJ/Zt67Fopvc/rk5YTPNmKhW6g+fz9Es3b1t49C9Rt29UgqpFPD5aWd8c+JJNMOmAxpEPdpPN/H98DITOMYuHt1g05Qj+odcGkH28ajSzfs5AdkI9eNEm0rq9i2qX1i8mTZzpUjKSHNR4CdYiSf0wZi7WUdOtL3bVKmnswwIlRwln77+8zdfjXKDRSNY1MlaDeRT+8X6n/e4zO1RvIk4oycOsVOgeXsizIv3e4cS3bEQ3MF4V8nV7YHJY1xgRJKherDm/+jHV7vhIc5ZwpD10r9nSXgBtf+DwWDZG9Bp28WwnNHokqmbWfXoaq40eC/60uMqSqKpty0cdZ4OztwPWs7hZa847/y0a6K2cGi+EJeVlWs6u/XdhrsdZGoD1vyUya9+CVUCyvban7kYOybE+dSUtVZ6faM0P+VCqPBmS42ppLnC3F6tnf1p03Kh/45HnlNbYZYOxV4Nwejoyc8K3Bo1MfYbDJcZvROELEYXmn6Z+7ofOVcu3ysBfWL3GKQi9ZvAu/UnQKvTapVit50JsBpcdhz3ZOO4ul/piwdxZqGe4ZMjNyk5Hz6io8q8hyj8hT1On9n5SuYbrjhK3BHv8ZpCxQIN8L5tDY8YMAbyfyQv5IL7AbyNRIKiKmod5Rj2B39xsTXsKz42GL7v4bXmkakCcmOJYjVfZ0eP7AzLYSCQ9eSd2IXRogh7YlE++SMu6zmSJgS4Xsfm2JM63f23eyhU8VnjNBvFjBe96oy1p7LXTPMxF3m4dQCGCWBItF3mHKhAGVCEgXu+dkZ7T+ETcGtpjuvDlBfza6+rUMVwD7Ro6aM1/dTyCmonjJtlc+393tMRxo0RaZiJitHJ68XrsuOhes1H/kZVrrajamvnUG7H5dDFTD1fAkmFbRweuW/21jwVO7eN1I87rErQcDWUKl7vtMgNb6LHL1xcCVO64aE+kZO4zSCtG3qPoQSvdyTEYMk4QjsoQpZhcNdnIEvC2R81F1VCF2TG9DCmz630eUL+1eqwr9eqaRWgNrhwz0zn1ZYzbuYTrjPF1d0rhlL/TVKICYvuXpJCeCDHzcu5V7eHNDtHdZlg0aOuNDspvz8hcO2MtdQx9fEqCU4v9/A+38LC/DNrMrHHQfDHKU+ZKgPzVj/xzsCSOvBdSQWYWk9N6UzOXr/3b4VdmiJqz86MzgAVRRR/+GTgR9hWbR4llwwVVVTX0ZiROLDkIw+0zxS0ecbv5KG1SlkdX+PN+ri1R1kJVVDI60i9fWtQ8PH/45/qk7RWYE1XO759HTTVPv1itnrt9kzS8OvLb+38m191cZsrXaUOJLyhxTfyRy7weBeFmVNEXQ8ZC5f26k/mTvZPj9ZP9k+PJk1lzrKqr9x/KnGE+p2nKrs95bUf5+O+HCfyeTLOLf61GV0EAmiqLnTE65+B57yByEA7B+3wLUd47RES4molLmMIre6XQojUlo1i6wUzG5X/cBz4qSxco+sF0ALvHCmHVXZm09vFOP0JXa0J3Uc299PiUhPC5MWorpK7v4XCS7t4sfk89+T8+lOr/3lWvu059U0ppmsj7CuTSjNhBsYfj2rNeL1s2a8UM1l7fAYZ7toeJldfQmIjw75hOjoKzzSV5urkOHwRVNxvEOGlHFm2Nh/bTqM1RCTqcE9Ql/DOM1t23wAtrJv8164HdgZVuyj9NhJD3JxVrkaxDCl9QnB+j3op2UZ0VZBW9qkZaism7cgzM1R+N+yRc4iv/95XzmR4jQ/v3PlmIXVhqNdKfV1I+9VLdXQaJbTF5S0f5oSxe8oVFbYrEqf/4a67H9RGyY5iE+8GOl25zIPkYH9FjQ6BAS8BWd+zTXvXSablQxxQLnVR3g1L1k43mgSHV/+Nv2Rgk1ekUXvoSn4/H1lQV1Q0/PW8uuB875hGN9FFaoizXrvBnGEqFqCuOT32oQuYzMSPPcyBLygvzDWE6Faqun3MgTo59/V7feJdr67Pqj5QwdDmIvyyI1Ql9ohRSiOpTDsQPhHPus5WhfmtfGm4byoS5G32bxUElErufRvV/dHAevNbFYeHW6qmN83rZXFVrNqC8ePjghXLPZlYdgYFJnMnQHSuNzj+j56DGGnPdSyf55seFCc98lweWllhsPG/xOymaBbNrkgpA97qgmDbfN/1NipIy9xMb4nasy/TL/gxnUf2hKFkPX1aVIYJm1/ETxGcct/Z1QupZAxhOzHtz7XqxVe64m2DRLBdMOlEiXsIl91xiaH8T7hGDEO55FzRhJL/k2C6yzDvMwZN7kirVBN80BhLipxOwJqlaJOGBH5bTDxLbNBeTQi2SZnheSJzPxbPvd0I9TVJdXiZyiCb1jlLiFJfCVOK3whMvTnx3Yf/uUtislH5POEnp9GqkVJbKHKpDNai5KFjSqgKnLq19Ga3ff6LPWnHJ3UXJcv4QRSOC5WllLotWTG3IbD9tDzGmtAlfBAuLAEe3jKN3qwunFatosD5pblu+vQ9wWInlbFwKuju/0uL7LHJogNVnTyipTSjp+1lcEHDu/mk1J0oMtUicmci2XL0FHKgvH4XIZx8+UZnfzu68G9mnAzQ5u7gJWh89rHoF4CHFLM3+hHzi4nQWP9U2ZqIA8KrK48JWHiJM/auNzcDEN/0sRx4tUnMVfwr7GXM3oqSZcuhlF5Ne5WWtgUUY8NOzqDWgeD3pqigOAEr5vdiUDTLV7v0j4WqxNxnB+Sbcmyz2P1ZIIi0Qz8USSRYKiQBkJUSgq8tNAMPRVD7jV+tPMDdhmZ+Cw/8Crcm6JAWb0nL2UNx+x1HwdSOJcORjFqsf9crVOVJ8Mlisf2is3YG2RSK+v/+75p3TV4dfA3CibHS2Zgc2PpL4YQc2yKNGTMtqlReNhDOl+1VAVJIpuxZhI3WGQxPZwlGvodGe0Fjg5/SDrrpYUSGx0Gs5yG9mP/XlXFnPAUjD8P2Ke8av2/jJJJOUTNB6Q3dS4N91mrBvQmNd3D8DL0k7xEBW+F5DC1t+UO6QiinjGeZbWv7FHQTOXvUF/UWY59NiP2Mk8CR94EnQl0eUsFcvobGWhhqHK8zdGyjV7CXMY037fq9IuuplAB7c6NuIfue+4M7AzyG6reBdSUjTCuYbnVjcXPKvmThvk19Ojm+unOwis7WbyZK5AM2e3Plq6geWPwiNDRaNDjlLS7nUfIEiJKI6GPeOqPlV7UdZs8Yu5bBC2ryjt6W8DuwujbSJn9KdVaU+kf7DddAOklHn3m35p+Kp6rACU5N/msxB13ue5PVn2rdqvbII2OSudmxbU+gYXrB6PiZMTbZe1/MwIw6hSJ1bw0NOz30ZgXmPa2D4G7ii4P1LHMF+han8JpgJqxMFCR7yeK59nOK7z/DwWsiM5HtRq0lK+cDTqp9gfVnM9yWPLYNzX/+lXGA7bIJlUBd/j4Od0wALnwYA/wxgYLGniPwnf0r5Jolziheb2gWF/k2I2eNlQ2C8prQHZNTO0scYH5D0ZXutkeNbV8EU2iC8f43r7pYwHdcbl4+zWzJ81WhCiKjh0MDwvaqwb/qpbfpSpfGWf5MgkliWtk46hxJZFK8yyUcJ9/ShyuJDOsIMbMoyDlOs6vXhjzOq3+WYbLK8/Wp27uqMkOQQXPaBVdCoCFi5GV7+6V0p5iDMbZe+nGjC5M9PJqcDAiFBfsiSbnywVrQtyQIDq9lG+p9hps86liw2q1kXVe8w27iRRIVIMm9Odckf7W8kcA7ur5kaaXV+GOxQK52dggTZ7kfiNqufbJU+Hlh/yujpKWOGSjUolb6XW/D4Aj1E0QXTzKgQDAtfgKEWtKIUrnr2mdD7PU5eh1gGzBQmPucoZgdack9yZHA2x0kkKaV80RsaMH0hv1nrxWUuuCVwo+T64Fsq7Ab97HKhPPuHnCna3AWto93yfOZWWXhngzfhO9nktaCKxPPxCitVNNDALFOKRaug/BkxcyMsp9CnBdgQj36fjukLVgUXjEPBXV5nxXQEG0VSGzkuLVLiQOne0z1/uYBGSIDED/bipd3Sx5R79CWFsGYK8qTeFtf27Awvlg971JTdGwK0GhGrAtqOvN/fMFLgOuapGZYHWc18Skj5GFdbjcy4NG9thgIzXOM9ojpAvjD2ykbjlKuwuG291UKVkj4OAYlnKhOWT59mAcs+nFEV1r9fjAoTaQepUjPRmjsWTtgTXmdU9do7BgtB3eg/w7e/H61ZxUcm16MRuNu5NaLkpxSJkjSMruLwM2/m221ipaRTUnugvf7kDqyEPIz6g1W+GHvhlYNSEZ0jsBpAZ/WNeRi5vA136ONTaiHStFdptacE2Eshl5xVLZzxLM4+T2QJeK92/jbko9DVPtK/rXTC0EpOhSGaR4loeDgznzLxU55VJ2c0P6Nkh6WiREypk1eV97di7SmlNZqiheMj2X9eoPrCZbNsT2amZcGVkx0p3Z/jXs/l8Aq8StijzFngcvpmmMrAlCaiCbnawH/8QoZ8bZ7bg+sNDC3+QQZ4KvCeIuRmeu9EspdUbOLrbAMMdQWb9m0blEE+xogmN1tFtCayhs++vwEXGLix2Au86O9p5f0G9joxNe8+pj2hxn/cSRv1yjTpFn8ZDsBB76hzLLpKaBdyuDHYSKoW9tK3HzXE+dEda8MoVq2c81fE4AGRqMtTIJEjSDMMMsL/4+G+i2frJPNn8mNQ5NduKeil5wwy4+8Y9897dMQZ2v+6AgDTDyn/fw0v0my451w9wtG0DAhNvap6B8w10MrmiBOvdEB+P+/6v4MFo8ADLcaqMGx4k8QBkez8X4/qwUCZWfn6DZc9Vg/EWrOh9qKVI+esGNxtmbjfFuIn/NfzBTUGk8OjM64lq7SqOJ7yskU4qUp41VdQUFYoijiyBiHW5GBAY2fOWTDDe/M3EbjiGSDuB5m5OP8T0BYQGUBEI+/AFJotpkc5PxZSienpnNJrc52hTfdSM6KZH8tTzSn7/kdmZRB9Va9mpwo4bRqL47OWMBmVj5tlVS0/u9fdd7Le3R5Y4g/qIW5lBg5ss9tZTwEB5Y5HkbzqYvazPEh7lMKTZy5laG40ybg8yTRLRrM4Dztob6gvp5QRg/d+pHZlNwyGAYJbsqBVrrDm9lsX+7VXImP4nqhAr9kvu43lWVJDdirzaOyJp/PUdk2Ndx/pK8Q7S6Zin7W0bNP0pYGl0R3aIu9Qp3EDZ4m7VHsmEYgAtqXRimOhb95hA12KSk1DygpNc13K9788yU84iQo04a7lVZt+FsYToEQ+PKJzz4dhl7k7typnbQFFLRpfdbcbC/yKeiBzPmBGiNytqjqObwMbv5b4JH/zmLN775zNFzvtP+7O+DtWCSNPti1Rj7OX0h+xykHM0xGK6ZqiNwE9A1c/0Qx1O2COuJ2waCjLopPrHbNweF7QePPGxjrSGu8bViJQXkY9EqF+0knNlZ1eoQNTkJ1HyWbD2VGjejOLkbLwPcq8NSnD7Q4fWmI3kTey83/2PwPq1ZE1M10TqQ4fNFNXRh9P3p/TnAe7P4wsWXouCaIl64x7T1OYUTL8ntPW7AOsX/XT12/1nRh9z3yYjrhzEE0kPnJj1IC5y0iZMqktN07kqFNBDyzMg+HcdUcWNH1ScDCLyK4OctNmdnUsfnkRT+k5msrZdos4CJ+pHdEHzNTac0CnqzY1Zmq5AIqePfueqIvGHDHQqStV6WP4i6w7MgIUtq4/OLsrbjwxLfo8uEocgM+c19QwDLhY5Xc6Ozdj+U7nF/3P5LKgqmP1qi9YBYxBF8JZ1OduKLhA/oS5mBkGpdHjPMRHRLR1+zlaMHz3Bit2mp5LIoHhtvnd2WIDek6+EBEoPi5zkCkV8KuOwMNBlr9YiBBPjkUAoKRypg1YyG1zGZvlcGk/pfgFrZfUWDD4uCt3Jfw2lK3zjVMrgO4WwqkNFpUo/Yq8h0vOmxsKHXCszvI45TbrDRU9Lug6YRKeia8cWfTJWS/AbelIpEAKhWsP9eqEqA2Lbmv9TkdUfGBYfKnGRrJaud9W3ZSW5DyJ+TzCIcI6kef44HXtctjAowQE4wZlmevcajADrNSoIzkviaF7JbhAxUp8oEjllBOnGo3DXLACywHww2NLvRrVrLQ3U5KcTVLNYvixH3+2i2Zi3uj1FfEv3utpT1RsA2NrW8Qz9GeY7W2/kcB6Fgr2fw2+rTCo/mBycClkIlTy0d0NhbTojWHiaD2KE/17FYTJzLsh36w6dec1piJGnjB3/QT2TEljK2EA/jSWcQYSsMlJGCA+6alMrmhE7vFTK0B7I4UFbpjKNPAKt+qr7LKm7ToZHthYTnkZAGjdudtcu9cHCwCsW3mPoqYG+OJg+IHb5LVchTXak3nSehngiJXd73gDY3YV7I1MsclHneRHHF6gLyVKT/mgA4FSCZKP2jB3baDkspfETPlS49RvZk8+9ZObB7548rFdqUvB4SO4C/WZsO+a2Q86abH8XbxKZla/exZgfQp2eRHSLUq0Sewhz58DMtB99SxhgzYz9a0cnC4EQLvttDh6AZ1h74HWGp/Q/f3CdVdTDSTEhrm8XyF1miVEtV+bMCSCROkjQvGj5k4pnJyCFmcvsOniymvL7Nqld0hgFVIboEbAevOyAGDKuQRlRvQNABvfFNBOxrQEVLFyoKBu9ihcT1phWU2o+HTa1JDZVX8lUTa2mf2okxIr1cX73fRVvTNEn7msDAwZDVKdjeZ1trY4LYJVFAxGHAI7nwtVXfF7N7aARrpc8KNUiAmWuvKZs7pYEMkChCjIJ5DEbKa+HviKV835OQxWXqnqSvWxqYmec2D3Ky/VZKVfFy8H1RGvoBPuniEo0z+BYU1VUUMwIiZUBLGc7n2VkMIBIUoZ/kV+9acdKyQnFSN3RAxnWB+R2l57Lx7PSJXU+5R3oKoyp0DWkRVQAZAnDEl5A3o/55psI3RJc32UKGX6HC8bkArnFXP45ZvCsg8T4Ox8I/3K3M9LOGv7j7/q3xMmg85ZcXV1DhIF4Bfnde6eqojrsczQaBZWQD0AP0v8iswfJNuk+0s7aN+uPY8RSaS5g9ENKBNzimnleh+qT37oFrAzlYh4fgepbhgwoQxoF6Oo9sjWxlbctOCZonCf3VoNVmYuj2jtlUjVBw4FfslnReS2jj84I+gu0Zc255V6gF39G5zbL4vD0zLLqeq4KJyOQKnuwbmARlDXeAC6RkwhP8mn9LHDHZd22qJPrNC9A8YKtjlNU8Ogi1DjElC3teIsvqUjcOmavBQBRg0n6Ny4p2BTYLESFskGtfJDfEpl1xiA5tz6ncUPoFRc5ODsb4DaGyIHmTlrShVgz7npsscD7ItPenQEVkFjEgtxKesHpWTAOffKzEa9jryh+nfQwitcunxeCB2Otz1nplmsHjC77pI01jVzJG4WN2/jLi1E1Aa8a5/ed7j/5wBp9sLyj44/q/HqBXS0c96z968HpRTf8M2j+DRAsgpjjTktNpKgu2BJCbn3qe25+cFjqiC716/DQYnXe20TJyVMBK0vzV3MKqIIIX++PzEztEpL+8GptmiYTu8oQlJ07aZZas+gh9gFd2ZhFQv9F839g6Pvg6r79gyYrXeN6c63CBDM4Ge6b+PRJHeojPqM9V/Ipx9ZBcdEF5eBVSyan7ahN4sL4zdy5Q8CXopsvYRJoCMaWu3uKE7koaU4zDom6fOblGOuPUBA/uyrnNKD/WjPXTmNbh/PnAE/3nbPSGH4wJ+8/uI400GEyXU9H7NXyh/zm74EjVshtcLXhPhus//BUOsNTcQLR2XJZQMKs5cmDBmL4s9+nR8BMifzCG66ECN21MDgegO97Gb2gU68XrdrO5x1kMgK73v0SXY12k1MMV5zMXb5AJPF522vMRd1dAsCxii7k03ReSy7hE34nZiOIzhqfLNqMRCpQ9ONCbLvsbfEfs2O/XZuizbN8PJUxAzIX9Lkf65jzu+pTnpoNe7ebFKgYnQ8kvE99yA4fSzrl+x1ehRJU0Zrr2eaycFDK+Y4s+nS55iCKxulQjrL9JWfd8hxHYV7XxW5eflRIzZMXT81YgiXZPeSUjuwVa9wH0ZYL8M0Fgtqaqx7pFmwKksbLq4b8q5RqShqA5rJKI0Abb8UlhK99fCU9WNSB5N1vK+N/Zn4UOc86MZynsoNZ8RtaK6Ud+j7mX2GnhcRQ/3KnS9titl/lzapzdUtD17heQelqj33V/yvan1egI2/3cQTa5zGNttFjAn+qXlTYBE+7yc7flEOQi7DL4zVkz0aNs35M3mUMlE7kdRbcEc5JwM8FEgjm6Rlg/AWQXhA01kEzUCC4J13qdxqD39HcpJXJwzPTU1zJ7K9yecZ7PjW1tS4X1KZkwRmurxrkq6pCR7dqVq21b8K04+yygH+ipvSr44LcB9UqTCgpHK9Vlfj+QnQfMt5jp16mVP1hToHDxVZ++Qptlu0Ls6QHzb/KFX5oZFb+6lANiyWk4h9duqKMLHyfXe9q6sBtnoumOMPqg7aei4O4s/hxipRDo0yrHQN/kjjvO/s250QLN0vAVp4xT3GpCBIgL0ROSCOmZopYb98Dpy0m3DuhLETE9OyDnqtLvkJy+drBR6yYjnikxEFc/1I9+0N+QrZVGehXnUtM4oTq5AxxoVw5GzSHAdLUhBtgL0g8CxFs1TTJ2BuYCS1AJQqpkV6Nmp7QOMJ6xMp9wvxMzzmYKXZcio8H5a4+51hAyOCFN6DfRA5pMPqcxp4rTtrAr+sq41u9w9fXJXYdsSER4ZqI1DVrYrwRDBPz+woKq79VpfCmrHZKhVa8CDrkRHW8bw4mqR/Ot2La2ne0mbZkmy8KaP7Y7827n2YX1Kj9UPiEHwm2mWp167hnuh2SXZjmeTm9sJUkNcAOSUuLT6ZUJDGNu+HXcThZdAkhlzDLYzJ3MnK+6U3ZPxROAo4ZWP7jWrkrtIyDW71Nj08PUAptC1ZXzBXdAPKOatInQnrEVKm6zTQes33ur4upJQcePFydaqyCuoRMrGd0B82VsbaT+QcCwqN54z1XFRXnz1BYgwisTeA3mPhtGGi4uNUKVwgep235hsw/jZ8T/gWFDTriT4toPHkrbIaHkHM0OQ5ak4wY7M8IihimUwfe2o4yF7DnoJXeSozCHCs6nkQAjpXDVyT589d1lTqWohDGndpFV2k+wlCTg9jqOJdmiRNCQW5bBse5tHw4JnkFu+CYPAWWhAcQKkCn9cfC27icAcC8T8pRrUXskmNLZzVDYNArgpmDuB4xlGLHnlElpwe0Lw0VLFchb0fg3BTU2tcA0LfeGmkKmO7GKWWa77Mp5dn9TXiNi8H2dk7RjxuIcFWjlizz5nOPIIQQfS3bYOwlQYy3LOU+b7OSWtBYSTTU13KYZlzpqvkaC44R5pMjCxWQO8qTL6W9aYec1mFQvo0CCdgyrC2M5MBcmoydDfFBc0AXe9+Hb63dwNqrh9FfBGYYXkSSsUjgz7PRgw1VfeGl0s1iSY7nU0+JI8qbLk8dz6xHcB3bIKf7xO+4AoOKPGOz/N1dl7IajdUaL7BuRLGfbVgeykPq1cNHmCPXtFCvL/sO6kuP/k7DtmgUIugCBJKAipA8AyY98SPX3/R/9jlqbwO51zZN1YLAo75cuCYJ9vYYKV/DIFmb0E4UQdlD7DvtAC40vN+Set1NvtnysncJ/+Pri8Bh+p938/WZumjQgjJlj1kmaEo2RnbDAZR2bIvQ7Knxb6vYSYljLGGLIORkL2RPXtkFypb9v85o+37u67/dXWR8s45533v537u95zz3A/anT5lTjdPEs8VEzr1XCUAAr4B7676teqM9w/90DJpQC3QPqH/8TLxAjeQsTNWShS58AXK5GyXbWngQ0zmE1VlLA9S1C6/DNqYYnwMyEqVMMszZCwY6p3J0G6e7PuTjEH0izduWfUzvkPybtI33ZOr54j0lUm2ihtu4/5IFq+JXdBFBDHkWUx54/DdlOKY0j2nT+759W3bx8Cnz5DIaQBYHD0+iPDqTaM0SpvoEbW5mPRTe8ze3FmoQeBUVIBT8aKBa6rP2n32eW7MjtE4lQebznQX4bHKqE9D2N8Ts7RggveUSFETofhXH1+ZQBXnJ0z71Zzy4hWOaUIxbbbMEORITBJxUIq2u7v45PCZcQ/PC8JAVHAKe1XtnBsv9LazFv2xKroDeeggr8KRKChKkez/3OfOW3YPxxyb50rufI9bFPr2eNpNPhSFs6ZLmoHmH1YQjV7F0my0MN3VONnM7G4Pb0ofX9WLvXGVMld6VoOmxmyWlM6jTsUIxms8Fp/NEAdNr5Q5soIRl4NcsjTjjrR9GiIVBBXQxcyYvo+x4VLlCr7mlVHQoz0xpcfpKFWabOBDZmM7chkMsx+faG2J80SDq3EiditCb86gIYk9h8n91eveAkE2uKZEeRB76IlM0A5GLzVWUeKL25VOu4DP+UIOF+XWzjzSmTHVA99RbJyz0JmBwyQOywPEPqB3fOekj8ZaT33ExljL7Z2FTV380MKW2ef0DslScRZqfavKlDUTgk0zaZHQA82ZzYyJ6DYvZZKjD6eQTWCYlzJw/aFnvMCqO1Niy1XpV7YGiL3BcxoHdMimqaZgsdm4v+YjwHFJRYvAcfOeb0Ibmpv6UGtqTlYyq9ZmjhNKqbHVngasZDY2tSY6hiKePGgINk+yJKJ3jDlULMMt+POJRhza6tDlN1P+wf5xeAfo9Sn0g1TyB/y9c1KyPTdVnnU17m3EU3DLQzqyMtNjMaxb0uEd8xDkjOneQqTDu9tiKJGzw4FtrU39y32IeX+D2XU/XLzV2VZgolTsiqIaz316QcTl/1sCYSCcAyxRKDKTVdtT5i3F5etQ6eUjH6oAFbRQk1FE1/LkyN8KiJ6hmT/v3uaiCr1FnF5EjSiDj+N/PahziDhSIiC7uwr7/KhKybFPOMOHBXwaaDKiA/bNUrv1+RrH9gRGr6Iy3wmz7KJ767NTL0LJv6NKNGmJDQ+9cApGesD3aciMLTQquReS+OvBa8gCOu/ctTuFz517vSSQGJT0Qu4V+TyLvTE2YY+SbQUMauiD92vTXjNMRfzvQfk+8FM0bhL9r6ar+mdyZ81ohJxeEcGai9GcPPK9/CjErv6xKWaWP4UaDw7fIsaBN/JyiHjjxUd/azuAk3zpb9BsV8s1QJh9/y4ZdWqPgimTrZgge5rtMh6VK6LB7muv4vU+bXm3zEL2W25+rHug+vrIpAjqh5Tz1TuFq6PpHHtPvK/eFqH5sJbJq51kjsCmJxY/WwmRlBLv4Rr+t30uZBR0d+qnv7am4jXRUbyAl9P/8v3J+SruVeGE7+4qPn5ztcJoEFGJ24PM7Vt0W1sfA9QfSsz61zeHM5Z7ztDy2MCmr/wy0M1CvribChrofvnmAvrxZDOLXemhjslGIuZsrIS+yN7ljxc/+j/deyEfDg9/NxVicDVZ7gYwOnnqCnjkdlvl5TFwoI1Z00DipruP1r4Lo0zKUPEz0BVKrOpSlx3KrawHThQvl0oE3fesgIMngQdvwOqAB7cGDx5eYo1kmLGxMCMki3k9fFRcR3X4EOeUfhwkMT5i5ArYnoU3xaLv+/OSn3R1CzJVZ+M60lrVlJcNBjfNy1WODG6o/mzPqMsKiDcDn31433xcqvBeyGTEBXRxzMhglz+dWOLgOhdrZms1CB3v0ksS/mpn7XddpeRr9cnvFklkblYYPJqJgimxGE8QPz2qxBaSek6x8pl1eFqb3A310vXu2pgwQSd7YeqRnPzC74GQUyyljq6bC7n/yeet2hFmTgQMHdz/9ShZRYhkD/j7SXfe852e/YWt1duiNmMR42Trb96mMhv2bYZa32KYtPEwKwi4tjbua+e483t4dcwfrIKP2ROhSELMYWnQKwCmkVMID8TP9L6tZQXcavDB77qTqrw/OIUC8Wu0LpfDVaHb3MMmnIdaVr7FMGXjkT8EVhg8b4v9U81Ql/k75sG6EyGn6Px/AukyEEjrY3tCHmY0vrJ/HsdDsSXQ329LFC94icrnH/3zRJ7VA5Ge3lccsuJvcMyXY2v474P/f6/n/Q2ndd9XxLTWBXS1ruHTbSRb3tayDY76/fXPN10cU33jh9JALzEItg1teZNA8XpSC7U/9Nq2xAxSyFXo7kB7tdtcXUG3brWUze/L6VPPpj7CThVdew4HArHJrlYxqUTnLKXIJa4yQ9Bs2Qo2bXnYrDpmzAWYYH+Re67JbxByRRl1aaHp00AiXPw6KzrM+zD/6KmDd4yVhnuh7W2lTx2zhO/S4OSOImjZc57ZhLN29xfTXxd/U651OvGHg2uyOL67rdTD/2bpqePw52ARM8eHuJs7OOP9Z/ceahr/bC+rU7J1cBKNbJzLpKHKhDBIOLqCr1z7C9whlBdlPufNosxlcXJNlmp/41GVFppSXvm4LHems79m6sD3ScCtHVeR3cKmjI3uGszlq4X3vbndsovL+CObt8vuKFHTm1kAP2mkyJlz9Tzwvxmeoky3tHYrN9SgbwuZkvwtS7ONmDvkj9YgObafu/WV3bSd8kcHDm0zlS0O5JHuMEaLJ9oHQstxM16MDetxHh4nSgGdbYNISsd4LZkRLc9OdODXqsuohzWoadVkVFECs8x44NhBb15nUAnMMOM1Ut48lvuyRS88wwx508P6ItUGEQ0M7QKGnnxIKgQG6044Hktg3TJi04ggRYfOnN8vmYTEv34BkRYQunb9qECRvcPSGAhJT7OyZFl8wWfir/e6xEreYfQH2fDzINnOEfFh9COxiulTerEuAN/uMtZxz49UUl1Zyb0oX71aQhhREz76tyypRyL036G7F9ScvkRhZU3vz45EVue2di4bVXpOufFpCI5AmEbph6tBMMtiS2TdetiAFN2FQX2vPp+3yOo5pnk4YqJzueajqKe4ax0G1UWidAtLq4v1EmH/HqUSUVJodfgO2XDVjv9WQ1Qrldf30U75Ab3dlfVTc7Wlp0cky1EDjeeQqOScqUL8/QHwBWMRV0mbNouhgOhCFU9cypSIq/SyHcVEgue4aG37t61vb7s1TN2bZ4DLioilXUa3LbdoeYJlgp7ErBVK9wHp5ZqUr0C0eSKK00eL81eikmQHt66PQZikCCzD1dS0VJ4wBKxFfLfTFdmDedu/qb2tXv3F9iATsqZ6kLkW0MTgLjtBYdb5Ye3V59Uv05saDF9trPIXAM4vXYrPE0vReyUuVQFED8U2l/rJ5J7IAhLv1w87Q54EqOfg2wdRXces2IX9SvIgV0o9Dah2BpnztpdvQ+J32G1nRvJEqA7OfRpD3lOt35u9Z2NmoC5RLoUBaR/IOfUbap67eryhdDZjME2Ju/eyk3W0SnN7OtuMOjwP1JEV+Oeqf00NP6DbbJUP21H1dBR7N+vynpOLialGe6X+STqJ80DSaU+WGJbc8nclBlhm4wjiznz8KAFRaxLeH1/a2zJMOQ6/orwszptIXxIxK2vcIX6XJJxkAOF0sjZi3bK6pANvGQG+a0Dq7QETB0Wbx5NnllGIuFBjbmb8bPH+24LWa6NdbnHT1nBk35SNlVllsnhKSXESxOYtW1jZr3eZXydBEksPHRYe5SgkUQlYg/HS+7pF/PnKPbH2kJcpRATCIOsnMmVgMSt/2BT5+xG/p1jW/yTYoINhL7P8GGtiZJudVZo+ZLhlNNdnr73p+AWvMFGP7sC28joeD+rhXJObpxx0mHJynFwVR6H99HFVDxE3NDo1Ric/8qQwCQz3z0fNeNYdKDuNkMV5FCFCOErpYnJ3PpqfCob+f5KG7yPTq+M5q9YkadO3UYfErHD6+s/xlf55iYv90/+mDD/MK59fxW+Afqrfyyfm7ejx9VH3Qn5lDIq0/yH/LFFdj3/SxTMgXXiv+CdBU7pfEv8/6cLu9j/pYn0LyRb+E0gXq6Nxhr+uAnr7T+VX1H99kKTaM98I3n9P6gYg6vp8N0t71bYe56Ng8om60yMZGzM1GEuwV/nguRzPIwY1tkRz1nLeAcHq8aINUZ0HtZb2c7H5XA9qp+YHI5aTJrbizqfOY438XudD9xwi3vuCTiMnd/vwQFrKIYg58zGD/VfDNM+BBh1Gm5eYqeECdYaUa/d8BdBWI4DaWFAfbn1/PaW5urVMYKBzxqins8X7aYvkrNleRSDLcB41besj4xWKJy5INhPwuqsTSK/KeeLiNzljHeXGu67Jr0k/eUGaskJgyrIDwoRWyXohNgjBGbXDKWj7nZgjj4uvDJQPVHVfV/JwWNLjo6DwkBtfSoDimV+CUrzi7deXR0pu7PZxwMiZal//JLwuqFJyNyx7BQjsXDJ6Msk7Ik45JqQdH44avqf03KWsUXhZb7MGYjDTP0/fsfxQvKIyL0VK0H7EJHGx2Z1iimi5V+RObbqt01q/QZQD2ztkpZkyoknsT/Oq8mGpQlZz3PuXKiX33yHteOWShOg+RGApPAw8tgdTmFY9FHdQrWmo/fdRK79vp7oGmZLqQHgvJVC1/aAAIp3FHm/7OWJ25yjuezzfpakUlLSEJRD7KLN2Q0tSyWLWD8c7Ph5jOn+AwN6RKaKjC7qNjHTrNK+yLa1+0fIvoyFhyGobiRn4wYB8jgZm9Nvw08ilPi/FP4HgffnwlUMRjzgtcGTBUZ3n5odTn53e5yVsHuszOjXs5kx8n//nvcHEdI3DAtwnkkTcrukNuqsnZx54U5bKHplpueWp0GlX1YR46n+/SbzWIqn0m9A8mtcKQeYMFrG712QK6W7Hn38gxEmSKf8lUOX6z37eQtLbnwf42pqTG2xwtWm491juEti+rylXAeAtgdoItVNi16FYwQsRsUPgq0b58lbe7Jfk9mQNknlOUekwQpCB+4Jutt1r/Que/dwCh+UUyxa3akZoP86NLO78HMqxvo1Yskk3GzL8WqvSnz9v+kPNbiX+5qbktvvXVcWD6PPXuPhSyNOJPOkwBBxZ8zl+pIlP25OjVHvWyc+AP2Bjft3fgzP/0ZSMJyerl4Nz9M1NoSGUkI3F1A0paPJXgAljz1fxu4nhfrhvig2jCu2m/VUTHXwP2sdOXsjr2Ut/+pZJ+muBhYlP+NxzHh+ycHwypJNQR+UTGIavqHRwxixfU/YJrC4zZD3SPOKzeevRwiMhgzKpo7B0fUFWprLN+e8Z2s1j5u7JFTPdDC50o9X51pLJR0W21nLKIn/UuAzAWVh2HswNGSKZK7/2NRjYVJ9JTUTsphO26a57JdqeNMNomKktEeLu0W8/Zl9vOZPRh2jVp3jjbf++9eSpAiKh9p6ofQCvSzrHNtPby+0bH7XpT72UG8Xku7gh1z+eqcSy3nzan1SHzFlhhTNNsXAmjKCtvRyKwDnIzrKACGMEA/xUzLXvfZs1VdfA3jWGbugqTaO26zNQwP/lETc+5DLae3526Kr4ry1DaO61qpPxVDFB6bSjGM9LfcgJLj5PWW5ocvxHPPrJ1EdtZpa5L/PLlrAbs8+djvUZmlDa+I2ozH3qowrQ8/OEDdDnJ2Vu3FBzr3mWFNVn1ZpEmd3X0nr31KvAMyvP4BTrLwMkw9X6IHtXqe555G5foGacMZhVthcok6In6uF7Pj42jZXtRMJq49MgrRY+T7mr1nM+Fudfdrt+5/OjegWlp0Q/DXudObjB3Mg9LYb+o/XIlyvicEv8Dc08YlYNd1my+uSFvmIhSddtjsyW9jo1vtjkwDA9jI/AdNEOuzGm3RjjY6f9vh9Wj8x3lgYyycrpG0L4lDS58gHVyRddxflirmoWnx81KShFEq8inmq8QiFfobSXcE1DejL2a37B3ZfsZa9AsQGmTzzie82EQh8bNf/4ko/y2Cr5yiWP0Yguhe3NmT616inGXrzr5VEoAmMMEEJPXba7JR1CbDYv9z0ymNT5QDBC0PrzI6KSo4dIhkfQ7JDC+9mhlvm3t5M+1BFq54YfSY4fLaRsidc4cWuk9Ii3KbY6noF49ejyfK3OyzK8S0dn8IoCnGmX/p6rReqt5o3tmvW1429YFshCBs9VPosMpAYSSEIkmU8ub5LSin1HUx+7cgHfjURDVjobr1pBXU6r67jW9etObV+KCXKnHXmmn+tDNk8nu3Xi0T5ExLjicqwP+7JVJHBQyCbap4oabr50Ab2+JdUw2/wp3jweh3LeFpUtk7kWshQZN0dscncXwr5CeewR6kwHoud78QlRMIQ95oKh/TPN1pdpp/OfIweAKB/5cmKkNtW3N6oeiXWWhR+bQpINzpn2qjkUgdVHPDn6kOtnsAFdx9OIV9eojxuxsuV1xbgxQFsd3YFgLU6N3Wv0bhq88soWaXLcJrq2U4fTyjpQxQ1lMF1MuHJ69OWzx1HT590LRQy6yfvRGpA5eBmjWwwQ7NjYx3Kjfh2QuRF/2c+6PsdsPGvf6bAdj5YAX3QHBfee+olZOKyyMesJSoQXbdG3HuMyJbX8oGrH6MOTJ1ybIxG8pks06KytjetPaaLFprKvsINewmxhJ2Y/zQbvh5svZV5D+wR0FXBzo1FDPB1xMMLbOSbsZQ3oJjy1qJl5NpdJnO12Fbenc5EUJXHDd+DFjbbMh/PdEDYpucaYoR1u12/zRhvzpsCfH/PwjfmRnqjBH8CPanQN/VWSrPZcn7/GV1NdrWUQl2uSYbpmsX5hfVE/+9XBpQlKqOnPGIsM9m0flhZYeRM/eUoLoPFMj4mL6axs32G0vIifjTWrf1D1mEC4pxZEyR1sXdXLdIcjYDCezNJHfN/TezxQg4PHDDTUqgp/Z5QRV/ye1gI0SG86nRghvOyVY+uAWb7d9Wnyo6Z5JMtOe3a7ypDAR44jefwSLneYHHVN7rCLnKCGn1V2OgmktoZv7ngRdx3dcyY+7PM8EdjqFCHQTunYOQaDp3uusN1vC29nGp1Wq64c52ouxjE4sg0vTIRXyUczjeoXRH/MD0r1iXxUQ6gywpnbmWkurfv5eeBm3t9Uso0Ic1J/LXDihoSH7o/bZqt3Pzfp5FQPnZSp/uJ//ZSJ0ga2/dTsmk337fjeft5AuuQ4YZ0uHsiYzjdSpw3GnLnI89BMc5VgGUDtApL1JWYjtykXLc+qIfn2gHV4Mxg1L1tNPSxAvdSyStctqqPLDD5d9v6vZ/dcDqnxWPpGP2XrKpuwIBffQh8SAUr7tgD/nwHFfgEy2HTym0mxQ6RWtUhG8PdJDuMtJQpKVlOFL5MmjyObSEOD73vT6Vsg0tIjix8eejrbp6Kqfrw7x2/6afhtq2ofap8caireZH2UIRKSPCAzqzdJJWDM7YlM4Cdn9KotumbCHXy/irnMSHJ78CL1Fh2SsfrDuuXkyPDPm1+eXucqBh8UiNrSwHvnTPvnTLuBU48dySoOL5IM+OG7Cb70Qdu//QZnl9+9mx+77hMsFOlmq6o8OxmnQmO48cN5G+efCVYtykERyTytt6w87xXIeF1rehVekSwHXd9nuS+uaP8F6TpIU0CYW+V4LodhLcD1Cox36iG/bJ4byGkpFcuEMmWdHtbgATavcOzYmEc8hx4mr31Fpdr+IWcfnrsPt8k0mpWzl/hx6OPrzKD+r4yBcIDuL66vilYLP3SosKqxd711R43WNK7qdUGv0og6be+wonybsR7F5tbLgE/6emcGOlkN+fJkaIB/f/tUV48p2Gzhgy71LHTcLz8vjm+4m7mSFYM44ECtxadRasfu8V9y0eVLG17k7iJTjApyQWIrDCj42uXdj4rMuef6i6vWqpBhiLS0HV0KVriKAtuofqkGpMDmRe8IwZKi7HSiEq5xQ0/NvQ44caE+fJUv0oNT0uV6rj4DQkaVJ9hM/XLmJfBtMK3ZJsJLKfuezw7xstTasdMT5BKFv6ru2C4PuucevWng2VEZu2p1xQWqf7cpsoAqDTiooBLGO6DrIL6+ZhHIXln95fXAodm9I+Tl12nZVD1E1HnKk9UzKHhxMMLVNUd1VSCBmDMKZeag1HL1ndMnAj3LgswWOo0uqBAwVQLIjhc9eFZM2bRLf6tfKPtomNDif+5QJo/TpGuPh2FLYLMLP6zePYTNxsGwuf5naZ+5tt6CGu5VxsVjq8MHs1HSUvaLEw7xO2e0Y620Hmr9a91EGyJEqUpsae2gSQOtqvBHP7k73TPSw4TJPyo1bni2nrUIN5H9zyZtJHvuXQFdCzllGlEprXFDCpg5yx5clRCy9baE67Yy1a8KTfArQqmARpjX9DDXXyTq+VVMruoH8JLpYcL1Qpey4iqTF+C3kjT9YlggSNELJOgAK/DyTlaOPg/CSVPVw+lNtp4916RQn6eg3Zol8yP4bAb8rg+OezkLBG87WaYybMZG1QNm0hBfqI/MRSk2xC0krPDfyEW9kozdXk+m5VKourPG7M8s6aK2UF+ux+QqKKnDg8gujEuFtAbFsVRekNTRtfscdBTA4KzNz+kPdZH9cDtHlfMS6+2bQgIlcgeG2UdF1K1Qv4853eNcmT/puw2ANzXDblBXW/Vl2cs7auv9Y+NrQwL6Kyb6uDJB16QFEyZJgWt7/pDDQHEV7QMmKN2/wYphtsf5cxw8euFUbow6HSEhPDfOHbMs0sSXWRfpo+jYf79xMHsF2euy9mrN4y2nEiZcKnTJMW6uMKh57L/CMb/YNJrVwgqDZNFViZlbYL1lruT4IG0BCDNC2YDnXvclvYTzTfmitxz7nYBPckbCjwGz9nuZlx2h61u4t3KUabHx6+RShzZb4h+4SIZbPzxnbvfgu1LVC7RCS+Hj+Bz/FnFK3K/gGNGgTXC0vp4LqJ64tpgF07gFeNLCyMfXer04Oy1wBUgLtQoulIxAiZAi8CsJ6g6iiY2EXgUlHLFvur2EDEfkwcG2jsqKgyus5iGgcTjIGRgkfVnATXveXuxXOEya2b3IgINIXn8In42DY6+tywa5qNNgfJPx7NHKcuO3OqQw1cXItNM2abWo71s4+bCQsx5/3HzZI8nXcQHIx14DQDAz3ybVKC3ovxU7ltZ4X8qrttqIicdeHEClk8PvSZp6HQZlcjw9PMzddUtLioLBEWqYzGGgC06wAO4mhTtU+kr+iQEQm12pmpXjAYOS5JbVyqeQbwWVKJIzRRwEPegr9M4kZh4tPApjJxdQomDKPCpQmBHIynKJhC8Q//eFo1K2l0xYgS2fMAD1S4mfzARCfXCwPiZLS3Kcl7Spwa1aOUqF3IrkTICFs+W5dVNYjFlZkuDOBYVaBj9T/UnYqnBNaqONYf/ivWKmbv+XPoLmpZ+06xHKqnzNNRV91OzstCQVckEK2VeGZsYBwWtaJGUvPekQb8J4tVLy/Cgvh/vb39h6SHJf41Timg23BcjPdEH4mYKX3rtsFS0AFNr4Ol58u7V54kL+UkgpbLw0x3VRKhk2mwG764PhXvYghSGX9UhL66NA5gF8Ahos6ZqPQWydvrt9VMy9RDICGV0zlO8XUqo1np9zJ57quH7BL9LclCJ1GjkmdQb7dpOKxDl+/bIPOjm4briB5LG+n8vRGaxFIo8NToA8SjO26a1N/zJAYhYvLGCdWg+joYfZ/lhAIcMTBFvAXotJAwCy5kNBgsgOQFi1SN1YK7Ib/yzxIlZ/0HpyLf7Zr9J3gC+DgtZDFnuj9z9zok83xERWnJCUtueYdOiRFsylKIG9y/5z0hRWAdeDTgDQ2n7tS+I4Z832x9dIpIcY4LVnBsBiDCzUKYAE0hgYkEmCqv+L6jbcPYUwKLjIZhz0G4jeQ7pbca7SosMRI/tvLnSab4QfGfSPdbJI6q3jwVEPq99qLOi9yYMLFMRlvMw8KqJKmzBrYHXIWvAElkowZvfCLLL3M7Uiv+mbBobrDY4cYitRCPnFfps2GWGafGTgiCIJW9PTXJlxiqLN2xXuoFrwP+1S1jMSSRwKlFmcklKqMPoykTcfjdLlKybAgLwmx/rUZX30WBclZsz4Vm1RdqAG1MK+ZP86H2TNbVdyqLt1dbR503DvwQMtfB5mxsm9n7ERybfJX/We5ZS5SgA6HBq65AFATA2rv27KucjlrgxbULHEooCfv1Mo/6LOSZXXKyY9/BVghsCbdFmYvuKjpu/X/bXQ0NsA2ez2GlXmV/kO8j2BO4uSuEME+OpPvGQ6DCZV/0ZkrrNxb07LI6q/jOWRKyKoWRMb70FBQkhYQF2tcTWvWYq8XfQdsPK+r93tYejAl9G5fNpQANllOS0l7grYX1c+2pfwCgbsZL0fhkq7TvCdI09297avpQ33SDjvzb95DiyNF5NngHhalJZfJErhzbti81gSPY5L/W9QlfxXZz1VH7EIgAyulJhyUgrDytIvvgB/7gqIqvkIE9bTNrhae929mGG6/02JHZlASkwZvvwFBEpiFsA/QjiwLn/nztghayqCVCssUKLp8i/V+tlRHQHYtjZWyOEfks6EIlYutH4Ek2KZDU5eNOCTTNWFUZntbnPxn5ubjVS4yKVMKVc+Sb307fmYgKZ2AZy41oHhlOkCb+5UP1hwoJFybd8GvSzCm8Y/EvlhqEIma64z3Nmp16XF7q8IMPQT05pYKLFEPtZyLpBBSgHJxLKHf+AIKIIOkjNC1VlpQ1kLbMP6l98Di+UKLJbjsf9ZLA1GNdVINDdDJnjNCJYpAyDbBwXxAGrScPTK7rg+yKGiAA2Ev1LWtvZV9SBW7UQHLmUFBVne/dnZBcsr0lZsv3gCN2bs+qOXjpRsvIRPkL5bgYEFt1syQ2dtM6pEhuUr/560m4vqPUXAQl3k0OPiw1ORfpswONvNmXjeG8dxv86ubXVU5S0k5hURgMktECZVOa7x08ehmF/ILszlncoBV5odgM76mHWL7uyb+IOwAsK1NVThx1Zg7jCQF/Gz1dH7UYLuUM9XpeU8RKjfSkaTFqPQnLvIAqkktjrVHeRRUngY0ByGh62zdJnUlXyPXpNV6dkLieebHPJLoYP9QY1I7Ipxr0lTCfz6b6xuQkEizX8MaDdjMlJZbVZFjb69mo2d1rLqJ+4gTlaJiqF8DEjBhQAFS578jdLKinkAa0Khr5khSAHSeuFST68p8o8+izhoa/uoKYzpXKp7hfqSrZNWRuVaPr9zVtKh5OY/XAgel+GIFBcfxTESf2edisrqB9fMxMdvDitweNoNGavromk3HzrEtwT4TfC5qM3Wl0OZXPMkdNLN9xep50vC4n0FMC8JLyR0XKdpTD8yXwo4yHYXobPoXw0byi+IsHCr3fZXoQ3Ol0tEB4ZLDY6M8Yb6pAWWcJAVTdEkI5JFBakcsjeez9Z652slZOlf7ReBdYfa4omeHHvh2G9zhpLLJ/uQw2dsMLXBul84Nc7+Ecy3aKPLgB1ZkjbwIeOePyXrPjJnnKTCBJaMKz2Buc1l5WsgMvN7RpXGR4O1pHpA5DvLDK9phbLQ4W/8sR+tjnEAZaGgDSgLgdNPtbtq9xN6M/p9Ypp4UUO2dPyYuAY41AkYehUYihv8Y57hc2hcyhGm4ARmj2lnFUCJAQTxZBGM23tafCND7jIa65jQ7Z95I/f/xjkctD5ENm8z41/7kxLJfgYHxe9gIWkUQMMFl8KXNdfODcw9BVLModigezYzenPeJoiTtMnhiAWYggPervXI44qb+PmP6nR7CdNHJES1PfkWSywlG6ALI5GdQ/dldqbGGvUt8Te4caguAG7aQFLYcl/4Xjg+9ER71u5zPXTBdIO50pBAmOjBc97Nwukj8wDxrdUz9FTGfr0gLOw8IyDaDe76FHAvl/EKZOFQ65HHB0tvpkKTywDx7naPJ9hfvZxLy6tKNsUP6vmlVOoC8RpeQ4xrsVP7ghYm/Frokh9Ap/xaGAFtcRfVnpbWnw1Y1CAWJUJ+DcN60SAVitC1Ot38VYPuVb990NTssPn9sCODsK7gJ0LpgRrXmMrX8SEm6YEC6aN99o1tNlNrFW/abD7Xl+q+2LXNdjgKKyqIu6LjGszp8koy0XiYvpnbb/VqOMtV5HvOfzSa3ycu1kxAE4pGk8ewyCCRC62XdOblV1IVRddnHhL/W9II6MiIk3CRhtrLT+b3SAvbyWViP84f3uxqJBxuy0zca4OC2gecIYrA9nSnSFziggqw2DJfjuYGGbAPX1gvl/zQNVQro0Hrc958+/aJf6gRyHaFmW2Pws/TokfwMQvw7c7qmY8arlFn161Lfm1K5UGlImwnM4Un/9/gzl9+5gqEJ7Clm9c8kQbb4hONzTjclYZx8FU5/82dc0+tevHOg7dytXcJsUOyPK4rvbhtLR5XKmxsfF6w/mycPhbY4mAhn3vxU724Tc+9J0LZtwBttvBmg5sI8/uSgW4rpTrdh59K6B3jD/XBwrLePoAZJu5PQlxbcSrCWHHZOhyqob5NH1uiTxomBQ4bAIZdpMMSebCZGzC1EVmPhaVVRP+1KQAlFri7ZF4Lpm4L8DLeUgo0IFnWCZZCWXLjfr4BPeklCkFQMPlyEaX8OjMc2ioBVmrlxQGsNNrz+t1/GVkH5DBDxPid46eq2RE7IYm9ONPqGOAjGtZfg5Jlm+c4XuCT+3KT9dINtKNb3iR/SX7Un1YmzYeV/oJpP4yCR2jQI8Wv53t30pYxnEB4Mvb7LsLvg+E5M7z59iszWclVrr3v6W4slZ/ddU2w4ZUeLDlzV1ym4dYtbqkynqmX2vOB/7sTCKOY9tCZnp+8bL2nihW3b5589mLF1kSRzxu0oeYuS1abNMvW51Fj77H7TmOIQAvtxcwvPX0voZOoV3JWMbsiyRKK0Mh5czQFyGS9to430ZhtJ6V1RSdXGQ8RCE+Zp/rkGE5/vhPTg+gLoGuLI8OOmbktJAR0s8FaXyZvtw4Y3xjYWraItJ0dS6x/3Xo/FZDGrPSANDbRjeVhAqk/vhf0WbpudEPxjUOPiWBaHNWhNj6ol3EA5t6KEKR5aJE92pIfGVba8Trte9aBAk3K78Yx2vGaWPW4kZFnTlx8FRctDx29L/Tg79wpwMDen5op7L9sTdCbkzORPWWTUntVly0mmPJ/Ll2/8KT4GelrD/xphUijE63ArwiTM26Kd8tB0QOzn5342lvBd+3t2uwnEIa/kdbnHNx+XxatDONVAGfDQ0DWw8nI6MRCgjNnPQ7gIg/jnVM22Fo1Xdh0KDkMo58r5cZU5rmwlKk2gFuTHmUrWomZ5Gb63DusAcO0wYAlTtLHTmabV5Z3pUILboWU6o/nXsLG0bsAYFS3W0m4aaIKwwgYEtpMvwTJRaI7ulxIKAUw8fo1GorgEkQd/9GL/zs2p+VH/vF/IJ5bK8/tyQKcbhMtDPPPIcfG11kRLiCy0Nf2S5CULVLha0u5/wMsNwEGN8gHdCchkBrAU3TOel21zJreI8R6CcyT6UuD7mcny36RRrHrHLUI3RMChsf/rk5DJmtGFoeJliGi28qtkJJ2iSfF3/Ga1o1sVAP5mSs686JV1cBWjcksNaXshGvSvCxDXyB48/bfFVrHQbzyyFOYIV7Zj0km6HZCU/0PSX/bjexLdQT2p9gyJtf7C6yMfae8Ch+CnKHng+VexhwV2F1yrsp1E12URwdtWC7vG2aW6DsLQzxy/eVMlzVkDle3c/Jrr7SUQMnI/O+ZbiT0KChhiYn6KVbAeidgYVvPocDU3rmjVQWzwh5GghoQCbVKSkk26n8jwfZFhj6wz+oQJ61Mwt4cVcJpRb4GPsb+reW7SSD6Y5E+9AAM7+jGTr/jEMdoiKuBll3smdgMhadv94FZCjjC20NtGbRRn7kI3+ZJ6PsEs7ZTlj/7eLAfz5pShgSniIVHH3ry9wyPtNPAE+ZNW2kEc1D8Epg24FtDfaojJjc20f4xSHjQ4X7exkHcChw+pVMuk4yOI3HsFZ0uHGoaXsh+goQhs+uHUPhNkZwARWIzLrajqH78g/esAFeA2w6cz/HechYFJrHpIlyUSEvdjtPfZxf8kTAiGVzEYUefwhEwyE1umXZzGzXEI+FyfSajXJzJVRA0h+9fF1CS4DtjwnPv86MOBaWUQGpximmOgEsp4Q3PIqPlcz4MdchkzwSvPOjlYFHDUYLSLhOQ+CPD7rkObVdOpsXGh1L9tkMB7xzR3vzEHSy2KJLbMZQt075GiIjjl2Cw/GX17yrag1s7eD2fu2DDOG3wRNNZtNU9t+lGbrkA4oa9WnaFgckPN8eYeQD2mP6NBmCGdOHylncf/0UPNBHDC3trTwWGECwrXcg48mW82+ZA0i509OqaLIWI4ptC4V4rR1n0re2xm0pJ74+J/G5R8DxoUuJmuwihrK2TPXYxhZLUpMCNukV7Vln5O+SSzsRBWrUYzeCHNuQwHYAGaYCUJh7+tvxftgJgy+9QlRvHbEDsHfP2rwl6W+6syDE+vi4txNljoiEOLO5S1vewMEoQvyeMq0GSUdKNtYL/Q06BYTCMYFaJKud1jMaJBTiBVpg12AVkitPgnTNlRhh4d71nyE9Gdl04zE2AigkN/T/YYLcgpVz+TiEZkNYO+eLvmIXgkbS/8aKPbUsUWskxvsgneAz8JOg0ggtMnc1DFQ6k3b6cQxlJyXrKDE/N3Kz4uVVwauCfvBetBORtJwBd/VbWwD5OdNA91zh+8KQUkEQm2JI8and+7me/erqVtHSlomJrK3mPU6FKfq3gwExfigI7YMjx2bS3f+Zi1bF31i8WIgWRrILSEnxKNwdpTF8z58TxvzcZpBl5XUdDC9/VcfqsbC8+7g+suJgiGV4f+fRfQn/fefppnsDmXTIYgQCIja9gyAO07r/LDW73MQDFDeKcEb35gq/I/+VV09ahEICQe48fEvL2+IwTLSGhOXIIefydneo02Qve0TogezmGlGqO5+W0iDuANkBqdqKARANyV3YEqyUvTL6IIoVoy5F3jjbBueZut5X9XNYIJAZ03fkpd7YSCP00IPRN2IFs9d8f2ni+IKdzEMGQ0XdquZXlSAqwARUvUiCZ/kgy/nCnSgFi077cQ6CzHGAs9/ICRzAr5OX4t6DY/i52L86Nh5QUhACZ1IrTHwTFEkn7xNPwHuqscpANiiZXZXfV+rGoVn4cQf/0JowicZ/1oinCkbH1jBhIrnfeZS7+yUU8CCPVQ7AEAWAhAADrPGj5l5f3LFCVuW4CqCvA0Ec9Cn4LROYZM2Dro3nSSBUs6LWCenKV3hckivtpvLJscwGvChBZmoDIehMDRcRNzTRlskK6KFOIWWoD/BVHwEsVvI4JG6beLLB91G8GrpNRgr5XzT/JAIqA8TB9vuL249wRUkQnUjFTk9I2gDT7hhuk/Oe/Z9V+PMZRdI6DLKmnjgobPgS91VjQo9DXbGEVKIRNied5hT4qIkMLF84Ul03oqaOl7gAzRSDpUktlZuaTnR3gz9u+Uv0LD7R6U53tVCM5KS4YDgq8wCcriioFmaRua5FtH+tGP+UTooFd8gX+NL1LdX8EpX4ZnMc2xEBqOvd2j0l4QP/5SkvS9xpjRdEs9kBN56Zx86eas0DuzX6PzF5xSNBE5l/43XLEJwWWqIn0vyDhJl6rqgUmy0knp3uORkY9BRUzK+/f8eMFu3aC+kLLgeWV8iv6HykLbrArCqx0n3xoaeWCkm4xMoyP0xXwpL2U3MMZt4Bbe+f3uI6hAIB1tcLi+KWl/2XdOP48TktlWL8vqdNJLu+T2U72ieshz2gO2tSer4hsXyWLJEb63LDqb2oAThvWOwz7ceTEX8nQkzEP302fAQsHa8hTxsAOKLtPjMBThxHKfsp/yAMEg01sW35kMBBPmEspbrI3fsNjE+BG+bQEExpALeC9DxutiKaCXqFbO5KqOm7nSvdSkbJnAM710xW36gv8l3P31ABIxoko0ViCm/rOIbwWfDt+5v3V2W51tVMGm080mV7PjVTyXZGwz5sQ6tnkUs+mOfb3qiV0bFmvmSJaaeyt72lfaqGBb4fPvH+Z/GMqeqgx7fsoMBVOoqs7oibXHzoIqgYYZFgeFWkx7TWYuegEHHof6zzDfUJAgoIpe1Ahq0hWiAaTwE8wLewZbXAbDJ9IrJsWd5EWsVf58uzZeO2Sbii/tLApNNk0bqiau+sqbac8p/H9+YK+YIiV7WELw13MrHcqbQEtNdqBIhHj3duVqlk+Xtblcn+hmn76jeGXxZMT/7BeoiCyc1HskinCtQReh6sAQIow70yieaI/G/R0msSCoKaMDCrVX1ZeO5esj2T4w5lRyT+u6G5zjQHEB0lEHoVhwgPOpEL4799JXHqZLv7eYmh6ftmSNtfl2X1MdRfShNYGMxL9IEzozDV3aLJ73NDioVvWZLpEcJ4ARtzp4/ySFSbQpye6UgGLamhQ18OWIAAKSs0sW3UpXxg+kz5edf5dLqpVAEdAnN40OJMY14vfrnj7+hk0uQBQ4W5GwJ6+rSOCGzxq/zx4cxkts7jGFtHNb3gcvD+VuQEF8KUfB0Wk1kNZIMz+3DgUEotaJoNiWNkN4sAd/dHmXnBHH305FVO25NLfSghlH+vmpzj2Z3hNZg+um1+DK+ljY1bzxdlui1j9/QsAd8+XcQJ7252Th1zwBKA9DEB70pB/qfYntmgit40g18upRCB8m7UODAtwKgeEtHzZkTTOoYr9GQa9HjxrWhm1a/m8CYOVvhsZqHPUfm2qy+dN97rMjOQp+LT9yzTObhuN9yfJsjIvAOtsX+WRqyylWQEQPbdiwG8RP1DeZvv5UY+SI0Zksh/Qpj11ifpICQHFM7OwM1aMwP8FUUGBnIgqfX+no1xjTttR8fyZszHtCSeof6eYyuR5uFpcWnXSRzAa18BoNLoBSLYiQE4JA6HNaDmvqFVF4lwpUGQiensvvD+PhmI55vNXHonYrfQOn4hWysNIHWSzZui0Ne2nH6wcEH6Qbz/IN09dg6zvfyzCKnJA3FWLXhi0e9S+8pujJHMuTfn+3VrSQJbWxqKWTbfJsipQbHZsrQGqo/zVMGWqIYDmRfWziOKUbPaq61QWjdli7IvJvBawq1851G9HjFh93SJcOf5lnm4jW1v/P+WveIZ1hM9xG/PaLh3z5IRjFD/dRLYvlq8rvfB55kvVFnTml7NZi59+9OXFRK2rXw/GOCMKrp5aN559UJUWWh9ytSKj3i75s1BHxWn1Z0z78kSCfws6kpKrnEEZ+IwnkPWP4Y9E7/YwRUceeZesv7KyvRPxTWmZxZaZ0fJcp+ebSxHnUudVBBgMWI/Y3BnhmQvhyR+uceKxfIbSPVdccJkctFgTIIY0Zl9mZyV7dBn7I0LViQ98U/us8lczI8ej6KdP2R47E/oudOBleEjdwa5q1qO9fedVYDF3p4CLZ6Vn3zbWDCMiaLyeKMfF+rB/leT/saYvY3u0/Rzo8OCeiTQo20WmMu0mWomPX09F6bIUF1whfxWtd2TgWIfimyoBNUZVC3t9FlJ/wUuohe/Z5n7B4m7i/e2g58Ez6182c+p7Dh3tWyxphWQDNXOmV5Qd7CMUNi9npehHi+4dEY7441G3/nGeqqllKQI0Z2sKGT3nU1ODrtDw58x77aHxbZwL62y6b6GD/HSk6jGvkJ5ZBK3DFksztC64dnOtKIRw7c3Q9sq7l4rbj5UOJIielVUTWc/2xlsi+b/w950sHNqNsXsbE96TIeSmdr6ConzyuLtKvAw2Q+Yu2Pr34SVi8cD2UsJsLvVky63J59pgK943Xz/gWZ0RqHRC8eX0WI8BxhOzpj+U7RYjFYI1xtBhYyFaznL9ZBnSzb51Ex/wYp/fCppkmi1WeKVLci19Glq99WLLIGtzkHVxdXl2dhN7luvbzN/h5IgDru9ydAfnmSTfPx1YaJMyGxy4I3j6TbHYmorx9arv7hWT5tGPRd2Si9hNGYCPQZ5bXI1C1ltmP7wM4Nkkwmgo5Oq4+gDbFscXdxWN2k8tLxbYGDaVnLYni/2XFN9qRSV+KB4Y+hxAR2YxJdX0oOoVoV+F63laoJhb54ec1wKEznqjdM+W07xqtHeIWTRcT6l9tqT3QvgTwKq9FH1XO26w5ePxC1zH7wTGVZ2sUn0pK86revn5ss7KSlWuQjLKwhthjwhILyhWXWmxKmgPGVfZD/tqWqJs5xwJKPJ+dFh/iJa9nBQ5pT1s62FDGsqibsB7plfxrS+1T+NlqEWzMQFB67/RdINQjRzLfNUi9a+n1pqygzfYAHT4a0u5gl+A+tOTzkQeZ9j8ymVFVtzj8tyGziGj/Ggz/0XnN4ppKDVWHEHqNJuoLUrAjkuq7LvRMdUhtHdB9MNroioflenYukcvd8TLyWek+F9COc0N+Oa57QpFSe7oW3rBH8v8a7N2VsUBdCxTyD41labPkfifSNQIz/LWlZrv7sdW5xnH0MM+PnvtR09cyCtdpxN2DqQeYyxbLw9Ztv3GmDPleKdhGCpFXlmhsPXQsJ7KiUZmoEKh78BJzkTEh7ra6ZG/daKvT0HG7jPnhx1p+9/JaiDJNbFDPlxiQYjnPfsSyuFjnz6tge3dv83ANwCYzMD3HNE+XEFd8z25BWGgXcXX0fZO5719mjeQ5DexQ/ZcXd/1qiAMZfRpQw8cKI8PoduG0BpD6NyVT1VSd4Pd8zJ2v0Ym+niW1niV7S2AsFsB1+Uvar9uutj5Ue957XVtMl7WLgFfmK41Hu+fjzJo4Fs9Zq0q1TPyreiEYdkW8jz1T6fii+0MFyf+9VnTPV/MH9UMfbjHeKERsvGTmSOhKkkkhKuCvrmHrSBI+/T5SXQ1vSECbF/ygwEpwByCEgnlKmNSyfBJbYRYmQfk07Z66Oqj366tK0XWmU5NRT2FuM3pFakvpjzBVstL+v+wPIkijj7LO7nnEGW1q2+Zkn6HiLeM6h07D+iGDgiDftQn0IfvYeaRGsh6jnaLnKjGN7AvJ/9/+jzanpfNBSZIsZsBxG7USotHcwuGCgRRJtjOpGbqA65ioBjiPrqiCiF1/qYUdrxAxIX91xirGO296s9zXjv6Nm6DbsKpEfHSn3G2b3e2Yr+L+n9M43IZVHkvhHAdNsoSJ+K0/Y5RnlChYYsziHGRGy12q4d4fik4uV4qXTTTnjaCPIx9YBE2r3gBNPkq4NEx56lsafbF498nGoubo/2LmWZaHDvA+pxTfMSlD4Q9qwHKGMT4uBkdpQhhq/y1uce2L8J5RiijmqWXqk2eE8LCOlOv4RFXgBPXmTgT97h98oaEx5d2YyN708/AaSf6a+Klk35cjWJAshcKTJMzvS/GE2ROs10ORS1oSccITPcjtFz3u7mJuLVrmycf7j/ppChYHU1juZaiz0lsGA3Jg+4JRb0HJh6ZyUnEX4r6ZHY+lO5ZI2Sa4yIHaAyoAXBnfXCLyhOtJi8JJBolPZlrLB++Gld7sd3iSCPYY32Hga+C3VqdfPM36KTIW6xuZ7u3HatJqqyLJJsttXqxK6IwJraQ+JbA3kpsNUEs2riadRueqolQtChhVHZtBEg6wjWR5+X9Z4pvKhuLQcQpPwQWqqYxNv6lWduD2ld939SCX3TgXSlyKgX6OydrMopazJoJkNl0vUJq7nIGlRc+qdbq2PpkMuVKW6L5zoL50XNg95hzk+fUmjc+ZhHjsqKw1Skn+fQZe2OrU+fJDGwRuPQsL4h5AOvACv2tgSDbbvylyE8GLIFdKnhIrCOsr5nFSuH77RukuvbrZqFe3bhvVg/ftRqJ2oxFXf2swCx2RWJZDwFmTaTAz4AaXx+UiABXOUL5Ns09nRn4TymFSMpf3kBCOvuOD+nvYDuGQ9tC2BIQXv4GM5K+VikdR1rEZ6/5W3IvKMZT7yCyJWifK9e8dB24JS3a3YF7I41/jeswT31+kYJnlTlbSS/59Wxk+9AlJHZnOSfyNJ4i1sIhGy9mdS8b4ejfP0Plaxvf8nHGtFfZoSjypienLWphSWn8bONXVSdv8AqcLndEwbZiGtAoi5aB8/O9X3ZUwsyPc3tajVSdahzZMZdSP9LacCclPsZKxKV1pL58hlGsCeGUoF6poIQKZ50BnVE/UAmkUpteZsqpMps3TDEZIeBzidGQzWUe35T4qHo0qut8MamPT1bw5Vl4qgCTFICeBjjebDCZZCtp+uLr6p3/VOgaehZjs00RswAG6pNlxvm9PEVIPWgyVIQ0kzhNzzY3ZcsAMmdKOR8vTvWxtTK77ektLuFTn8raClZJjpLmvd+KJnNF5MMtvo/FaqCFelpkZoH0DtL7bYDebyV9pegVqCDZtGcnoBZemusGQu7OxYx0/tfcM5omRMSzuiIw6e+9Tphz9a5fsK/w/DW6Kg84R/9rUyUXfhk2quIV9uYq7O9EjSSiFgMfdfIsuh9rn/mkiZKeyZWRT7OgGhf235/jIOeaRofPhCx9iJ172IrWdy3klgLI4vh/jRAG+bzX2wT62Q+WJFvK00Coefh6ljZ6Le0t/2nENwk64K7vVn2JdTt0LX0Ewfq2xLoRIznNU2bh23eJdl+raLdfahric3s7Z4yIntL2IVUfJJHQw/5/XWSgXXlr3GH3JWB5OPboWDtih6fOA/z4luyb7+RIJVmvaeJXG5TZQDJep/1X38CuW1ozwKHjvqsQY9NmHuRzPTl1vMBQav0lR91DGan7odTaSXLjH3qftj2m6YB4WoBtBCGMa9qxDfFZqO1X9GWL67AFQ9Ofb+ovAlm1+f7R9VUBQyrXKXDxigpM9re6yJUCUdHOey+OghWqmcxyJqDi9Ep4BHW7Z20alTn8RdSE76H74pTKQVjtcy1ypkxhO0FH+lfR4sKGe2w5m56jYYK2vwqLf7xJoFowOVAqjRDWDErVGIaOv7N7nuCSJeSy4+ADT/HvkFIQgTkxkpLPuiAMqmPSgUv5HPkhYuLBPb16Uv+Z7bKXYSZFDgt7L+XxJ10daNni+MrVyzy8r5whFKfMONUgiv03Zhj2ZqP3tyCHWZvvfOhy4Mnr9RCEIc+Xo4dXRj919EY9ZDqF3JUYSW/uBSwPrM/uq/o4jA7Dn2cEEGNYbZDq8yqASg33lK8XOFMPW5ve47NE6+NCTLqypQNs1WWwbWlCZmCamEnQqn4mEnprcJhg4IzITSd4XTUfq9JKIj81myF918SZUhmqeoUbrd/FWgz2z3m4Bj99o6bfYny1h7qj+OqaKswid2oe64LRGPj5jhn/uDS3u5NYkyBqY0Yphw4nhjhi6M/50RDRYcQQLRuAlJ9AunFoe2KWKbCViG2kG8sNkfdZVX9bo6YipgJlItAPe3NdDpJ8gBLw5pIiAPiNqYUlQuHp8aumFj5zui2Sz/1P8m1edYsceYcEgtcGCF4J/nMTHRC/202AHMyLqJvLiDiTrYLNEL8LWokccTs26dqIU5dM6bsMgSbrfcBV5tM3fP7qP1B218AWYKx1H9t4D2ZQzag6ltGfe8Xy5o/MCckznuJOvBB13pu74REiEpteHxpgyYJ/XCLQ2tlmVOHZocebTGcFNjktbzvuLuP39Xo2hCGRPq0NlEgpM3DilVk94F+YJO9uDl3bL1EibxFwLHivbvL5UbnS0hvh2xG5NsYv4sqf0jouAtfZ/6ajNQueLUx39YemCXCsrdTyyscluS3RKRsTVjuznWkOSTdSUALl/W+U9gSoTWLDz/klBObCqeEjfcYjCYyFvShHQklRQwlF06dPkr3i831TlURPCXCTxykJOeqUmX/WngNRAhDOLfNJSw7yPza2z4Mg4so9ZeX3VRil3z89LjZ8kc+W3HPq/vKDWh84x2ScCcdyy0sM++1Eg6c/kSx563TIbl+bqQY8d2SvGQugjjKp2thjLkSOJJDe85fCymkBGTKWd6T7JHzbC/v01hjUE2GK+GLjKjRYncYD4xWxTPtl/8smGkoNyGDQbTgqppblPHTt9RLsmQVqTs9o6IG3cvwOJU7564v8k99LxQ0W2UoSWq+QWf1qKQtW4/0qTFCmZG7IHbgR4FboZc8/gFZ/u/Tmkdmk940e0zw7QHrzAKq0UU0FCAXuqF4zUM41UgmEgULKSEVVfvksdG0j23mOa+DTiOSnTlm+B7wT88wFWPnlGyLAoQWAQyeBh94itgSj1EgdsNhE+VG5uS1m74pi66oOjb6vO12fStWHDKA18DPwIVbkdTG5Heky+Vx2IDl0jY0KuYoHcA2ge6Tdv/3U/mXPTM6Aivztx5tAKykeCaxZnKKq5POV2ysrE0zUFNK7i9xIBkAPt29EmU76BoMz/n8u4FNITHmZXvTCY/bOngsjxQSM7POVB/u6Z+XiYxRl/fhC33S+/Rp9pGSPfm+9tq28jso2fEjd5KanmKoGPK68ktORjZXeO6LwRHl2q0LWXZ87yWIpTwSG+7foGEuFAULbyT958MzxoebIp6Ra6Mk/VsLa8UAu/sVCesUYb/h4bIWDyQgR0xz+fgMlKxhhbZI4ZWObP1wdni6/UrKrmIpSY8GZ27rFD8z660noXegnGrxY0IfU90m0TmZLmN3wVB0Xu1kCJKnNUhl31ScXB29I2NpSj2iVIPwCNmbSjkwX2IclOpDEdKvyXZq844GVCu8tD6//gjSQ3qZ7TIQdAlm5/CPpdr3sbeMt7xiObaw+5jVlmLFxzR8DQRd0+sQfa+wezUe/r2DxuG0895OQNO5wxeSpow9Lzmq99r6A/HQdiVi2sTIbSxZPoQWwnBnRWySOd++IpfSWixfDLmRkSnbEHt7OmEpUlcS65UJAXqkyw/lzRp0Pwg5wapUJjHeO1TQVxfxooXQmEhaKhA0nAE3tCu2/zMQS16FcCEEk95W2SULencfbRjUvf4AgGCpGXj/jxmjMoL13euWvPIa4nUsH/cHXdwbRTFuSN/Vq6/5qm8cQ7LWANb4Ld343O4Rg3+gFSesZRrV43I2a2oqa3r/TgZ8wf49gDmCcLfOP1MF+9xZy/aVwqlN52xXUoAqsOBxA6DvXTV5Y2j2W0kuW8jpFO/Sg1sLKkTh6L69tNz9y2kdFxHECEKU5kZ/MWAFF/gaCeLvH2XOkMTZtEryHMon2/uRp+xKgyLOnQTdpqdmRsZEB8/saR5BdezGC+Sniv2Rc1y3aGXLEjLfuZ5aKyjtOAPRGTF+MXasHfnJwAkuqgG1EB4ItoAMvKrohOGtp8AgyW68/neH/vvVBX2kredWr1rRjGukUxpFajvvdPw3JFsu+3Oi2MWEKZm+Fw+OnoXu9ETTmBa7hihJfgsutPHZy1ffzO9r39HgtaK2AFdj5vK6Af11Q+jEq8/5V7UJrb+4MCSmS3cEV2XC0qbpW/KLeRy7k+oSQ1Bl0rKJE9HPJXiRiBUgwk8nAhgNIMHsI1CWuMkBZR+REnEn4Q/SqK0ee/Pd9kSV8+FL4hOUJ5dRY2UtgW5UOjV29/goyjotv0T59zh51zMUfFTUj5K4evXKOGj50AVmgZbU/tEbc8LY1b6moXQk8b2Fv6NlIGRcxW80c8Ph8E8i5ph+KBZo7641KwVsnDMJuwElcZveNrX9K2DX56TsFKB7j9k/EFxnibqSebj3PDSpjKrFllS7UN5BhvO0nI+irjed5dBMRbP4GTXcJskZtU06PxGcn9ZS/DiA/sarRPr1iIeuHLOpixs9HNDfZ91RLTqjv3mLkZhlWTIdeLxw81v1gm9/UqKPlZUq02dk+475JG3uz1wH7vqo8J+yJ80fPnCYlga7mC8I6uiyg/4jyk0o0ZNb5piILZA13zEftCyAN3Ia5+lrY/h9bXx0XVdeFq2AhCIJKp4TSHUOqSIcKDC2Iw4i0MCAlICqhdEkNIEinA9KlNAMM3aXEDCEgDUPdc0D9vu/e+9/78+XEnL33WutZ61nrSYOye33EzrmrRFq/FcH1lg1TlpZR0l4eRKoeXy6t17A86v3NOOYOD93arzqyPR/lZv35qyEWWUT2+Q49Ss14x7AYnKMpUTioZtxVtQRp/AMSGVFfCyA3mBjfaziAiE9Sm+7YVNMzCL2wKFZNLu/t5P4dbFXrOJSPQzTUBewftWdcYh67vjef4DNNENPIa8NtB6rB8z3knKEUAwUkXwcSR4W6xhGPUzs8A6ACUcomL8ln4Q9mN/TGCFuC9rdl3qElDLStc0gAhIAF7CEAGPfT0CVX+eDj9RnlV5kDEFyBQPiH4PKkd3vMp5jJNDhgBHw1e55hD+r2hM1r/0S2X3P+/AdUlb2tMkgO2yarRRkS4wXkrV9usP4cHq4p42rtmtQvceFvT7APeSUFBkceYJwtngkEZn10YBY3QXskAdGWoC36QUvwDhLxWbSziqur60i/wcWe2xG3bjiPDDwKWD4EIUGydk8ybIuFx03gqJBWHFc/8+zTr7Pk1kx08kxbhNrK95JWGU+ZS+hDnsi5Q23zbA2B95JUYjFUJS4Ly2wxmp6j/HcGPV5wT1bju5j7xnI9VVQo1fMxUGO3Xb8HjvOZSD/NpJX2nBdCWa0ajo5Gz3V1Bb0p2z7UwQbT22Hn70tSFUcMT7IBRkQdJPKS6QnQQOLuh3/ENImTEeg5wMN9VErLBNv6PkdusxjFsrkIGNw4GmErOwvOehvPE1gwFlGxsY8AkApH4ocNblSF7PrwJWar8Feac1s9FYJEBffqs2kVDNKfYCp64p89vYG38B6/Mj+pa97mtYvgw7OW7iilEnJ4azbdCxveBGzmndFZEpkcDU0aBBvDmHyMeWnzZlvfg5/mmNcAMMBmXMrTOubp3CEEzCw3LgxrHKVoczImqGPwNkHih94ADUtg3RpF+V8w4Rc4lVn9+dpszllKT/y0OqPAlwYp6ypLrrOpPlMUTHUoF6hFVZ5mZ2bkHDhf4PeKWCeen0qsPx/GwFzjQvVlKPk3dmK6m1VQCzu4QKORkUtRJvC1F8IrPPvAlpA+8koYXWQVUzMysDlgOTh8no8DpqlwWkc4s5Bf1Z2Cz3Rxe51nbDTerP+Bg5gLOPDiutGHI9Ttxyum8DL1NgEsmP62DwI+WzPyQzO9R2Hcc0//BfdnWf7tTltCeVtIitveRa/vh0o+k5TNPMdl68pHwirGpaxRl7PdJeSp9slcVYmlDxxQelKm9cF382N0s7/wWWNN3ZeLTWMRXLJmF/jiNgbztpUoKRp+/0rW8sr5Kpewga/rUIESIv5oWY0nILhk0vNy46cP0lFCpoUMVE/ZRSNCllPU8CvElEDY8nIapvqjmfeTgZ7zwQhD4GFm6zrz+X8jg76J+EremCBPWAHt7YPYbKWpSiiRi82q4w6y5mFLHwPf6eSsFQvnvJXkm+34s/8zN2s3eMAZnK8jZmNfoLft3Gifx0cqE4GTiN14Irv6NMdppdkYuBRhMjEkw0pWJoAblz8+kydbXfTFFFFkPojDU3YTfmz0fb5aeQaW/ifsGPKJxmTj8VGxd9Hh8v7AqQaVtvOPpowo6WNZ/V/iHZ2S8t4c5gVBPf0PDva2Q+kOJaiiyce4WLvXIoQyrZgrM4dm6KPCQQdyP0zvXpx2Mr4hRwA73Bq+pbOgs61I+rkvdGMx32q7WJz/V3tCVIKy6B8w1pyFvmJCd5vTcLN5MEMchOnimTlTKRmsO9L97dQA1La/EKdI2rk5IE3n4bnX0Nx23oDmiBe2uxrauGcvL7rF3SEXPHLfpUeY99FPnzQU5SCA6H7foaj4MjdAX8k2sy7nZvwrbtP7ogvnUssFZ905PGe7ial+nwvVkthCR43dLQkEH4S1xAUc2WWhqWDRCA49PIsvra3cKBxmyC058ngi1HscY26ps3g3LdiYPmhPIVhFtwaaCIZyZ+c0JC//TYsGmUVL7crBvn7x7qUSrfE908sAYL5XOYWCm0pTeooZbsKAYROfzBGQ84BtTc7oT86evTSJVJtUBm2nK+fUP9t5zl5zZOrxzamAFDk8oezv5g0GnhMVjejfFvbZmONSq/2tporZ4P5CcdF1pgFtiok+f7sm1p/0gdMBgMsYJN/UUADALdkhhCeA1Y+07eCivfQEavPKjY6ItMZaTCg0NNnTrcfEjUPPTxrBt3dza4lbJjBsnjEHOn+5P/Dowr7cRXFP3yG/+4hF+eMFilpQs8jv7Lu1Vy63bsUjxN/rzu0aIId+sWO4fg1R/Un/V2aqILVdnbwmtd9IgPng4Et3gVioRd8klEJAyc4C1JcB4qiADE69ud0ReuvtkIO9DZjv9lIgKA9jihB6EstC5FTOhsmWuEuRMAmCzWStACqKWuJJAKl2aSpXUGsmNQqqRQChULtdzh8QM9Gk9UwUvAeAYvKFCBj4OBFcXKxi0WCKiLi0tW3xtTlr2aNm0ATqvhZyvAiHfkiORpmsxqarl1788gVCVas3Pjxo8FzJzoTH5s/KL5Gmu9hoBUy/ES4FwrBy5k4wWngBTuEOtVGNrzmCw86F2QbNm+58LP62UDwod2Erl0c66N3Le0nnuQ63VE0HwihN6NLP83nOoGDmlilxl3G9lC4qS+lK6VCIl/pXvcIR7h5zWT8RXIQIOOSzOXjhPWXqSObVJYi5WZ/BJeZ2K5nfhXrb8LTEcN82ZYSFeeLqs4Mrb+NpqfxfNk+1ZKG4Gruaqw35Yb0K1IHI/h/KIo4eFmyVMZw9/9IRaedtH1shVuXwL515nwdW+e3vrZVwtDhXJrS5NbdT7Fvlo38XixYOtMfrDRZi0qXBrf90U3A2Tnv1JRS43Ukp0pHqZg9yncRHyDFGiIZKYmYvhFL2dx8AIwZ+WMB5+qXMOSPTqd//GXQKgD9LrA7+WkBtTnaH6ZK96Q73vqRNlllQcNvDwopwIPoTD60IR8YO8eTSHuR1EG9pcXDfjoLERIEzGns81dFINBqcPyV2M22dZ/P2oZbizkERVhtGciuUMExRczb3K1ddV2+14rG720JL/JLfGxHcPbfSrJqv3ZqxtInu1Us7vIKiEaAsuTKx9mft5OSjiuOQ14y+tkfO5xl4b9HOpCSuMVZI5qL3fwXNubXwWJho1UlmNpEw3lVeTgSPXg8BvMrqhaKdJDhCVAKBbqGNZIXQLIlC1l8p5a5FSpK6Yce9jhdLLv8uhuguPAifO1IqhcR0hP8dFqgFr+Gz+rARk6HQmU2Wz/kzeHhOg/HjGnX9xkTCaQX0XXINSsv7A4+w8N+6FXDh36DH+TXeJxx3g4gsLKTG0OcyYpYP0dV5h/6By1c9j1s0REqadmfi2KaOilgIlMXuLz4LV0mPOs9326hfd+SmIhM7yvoa90MHsz/DJnuTtSizyr+Ak3IrCqNAvR+s4Y/tim1dINYzJpydNhd7LfHvzLIM3fs6RHZocGQ4cZIouYvUlp2Otua+Z7pK7VDg4ONeGMoql/ksfXw6yZ6ws5yruWtaH7XjC71oruUjgduMHNjSL8qqkbC/9Z5Yx53HYC2j/LchzT1zpLalsxG1JNvnN+82dK1ydS6bXDqVvy5PrnFzNp1kE/r3EXZU1sHhDeOb4ITNfLsU+ZJKleW3QTDEfIT6fQFwgmSBXaBH7VkdA+gssPHGgI23obXfCQJYE5r3ITFRkK2tda6Z95CI06EMyiV30pfDb5yViZCiaa6OQ1pjJmYNoXMWDjwToICQSWXNP42lCABzG/+pPjVCth55u+Kr6VkGWm0b15wutp8U39L3DOiXdkKMp2criCLTEKMaPHb/tIcqudx+3W/+L8yYwdgYPhYws0D6sQniwlqwuFEswT9tHVDt5IHgO1hrWKrfxt6Tf3rO97W2/dY1ny6isydSWkvfSRR23OHa9vj3EgEw2HwY5n4st1ttgpv3/AWWJDVklaDeDfwIMmYNrmn3KO0vXJ6AdrIDgUoCqKQJ+G6GesJ0bYdwwNgvYG93rL262I4FL2THj9Av7YYYY2fbiLD/nUgfOYHoiu+eYDiZHNkSEbBWvSs4nd3EBjuSBuHSrLnv64f8VRyv83YZV+M2ll9/Y0cQj52ohifzEt7o5LWLBWd0iVNlPed78R1AFNdIRS341IX0Owcw3wRxk33b310/m8Uh+OJBSfmnQdYCOB0xJbt48HDVHFJWmgjOplQW2TnMRxpbdcYsgalrrdeiJoPfDW8sAlisc0h9wXe8CtFDi6oRpfgcKXS9pNn3xQitUcLgSSr9MPMSE36K/UXzoBjGtfKt5zwfcxS5PPcMi9K1fK69YiH+nbpfhNsl5TVSYHwCGhiSQKPLFt4PH5NFncxT3eX85AUg1LEqL9QlzPB4M80DF+EpeyHWBhrBr47FedBgr5dY31eQSBoCDJjtBU2ELMff+bWg2nDpjcrNbUaxCsqycMqGtvvnrWe7O1xvD6jnEhzadObuFmFFd/6+Pky9YXZep1TRzvAkp3bIdeae/3pDQNlHRkXkZTnE5F1BafE93b8r7Eexhz3VxAW+NZE/nPehQwjbiVjqJbkXZUQsOzxYZTEgLo+eNniXafE1zLaR9J+mfdsMGRKix8TqMVmexVvgu5zo62fO9qMje5Njpz5DyNvSncIBzcjCHESNnzFCLzkRe+QOSZMRY1vGgzRDoRHJvm4TJvXmYj4CuFSBpx5mbJWhlo9ArUExX5DEcPj917xOZwhLE1Kt+LN2qcYF+8akrdyynOGuyeo8fvtaqfUV401Fm9XgRurBsOeaNQumH37shf+tx/ePJXjJXo8Di8sWIurB0hPfjeWCIOKbgeUtpmJKZ0awrQmzruzGPyLKfW2beFOraCn4HpFNFHP+pzyG9q/uOG9HAikrIUjXM8JTOk+c96zKAQxSKM3Ok6bJmrygSBX6aSQQAIHp39dALLLlphh3ifmfPlj/riSO/dyocoqco5RePWAW0csN1AmWdsOAVQoHbLPNKmV7gvSF7wmIHjpUjTgFg4AbYlHj2PjqaICGLRiS2WrKMOJHRANYXeZaN4ov/MdGwAEbYb0TcrCVyrTu/1/lMqos8UP/87GnJ/RqBwSKNc/wgTjSIYCfXwTB2XVALb3EWvA1rDEQA18zDMRTvPrDa4XlJt+X7kV1z7K4CHSlPKELcY5mfUaXrlZDoIR80CvVEPELr/Jf+BQ9kHrSzOb/c8FkScdga38kgWoPcDgffnaCUeEk3XuxCAoglt98nUZI8R+FNEqcMQUuynv07HTrRGDuIphHBitmW50vJrT/R2XvA5ESyB4hZwaiV8B2uRFHeX0/Mxpg5tS8XchhPDAPIP/ZqoQ5jWckrsD/ZS3ZASNne02ZTX6ncPtGMII/C0TwRaDIG9jcItV0UpokawWC/81iccr1ic51Dgbf/9GA6/gD/nsTR0WIJvZ2LzFdNKSXZLsmysgpE7vkL4Dz89oCZ0snxGzM5a/6ij6QBPwHfotjBip3uMEsoAjlgEvHSJwWOfII07pu+186+vlUOvYLxOm5uu1S+DuclLHnoEESGXMI/egCaSAqtM4m5kzRMsUERb46sbFAaZYpLB6VbkP+OXDirTWzqkGqF6Nj5tD1ivKfNgx05LOD2TpqOviDwekk//jmwQVSSm3eF/s6+1m0h7FWr42RJOT/ITZc0TYP+Oho+2fZ5ghNsktvbs6FnDXFV5cM2R+KqbOPW11p6OuL4zCOBj6lScvQ9YUxdibMQAx1UhlZjqvRcKEEjQCb8XOl+Lv1kBvWr5s0HI4MD8/cpsBwelv5SzjOh5Go5dsuOXnwHufPChGDtWowK+rrRYmDHwy1y8uSBL1DgGlRsHYfBmyE2BenizJ75COeOR1DQFm2hu00t8dMuOb2HvwK3gI5LnvP2vzBrZ8vTsDA7/avUnXyC0JeIexIduNvE6bnShWFUF+wqDb9tKcbvTdC176z8swt0p9lNuH/uVb/ojJZZLbc9tVLDjZ2kS+kJ3oO4q6jWxmioFAv3ebeGthHIQPbTx0VWUHDujQ+oCM/zT7mEfZT/UimMusID4GeM4j6FDSuCNjnr1xf2QFwWRXlvGj9ESoD3CEVvMMUy96LU27AJ3DcsgK8ERy8etY9oGCPpBmJLv6MsHypHjW4fFVphblgcR1wyJNqyM3rFViwRMwd8o1ar81GWgmU4Ih7XR98kneul3dp+YmpaIk5SucrCgbw49KFJDY3PCeyuviy5Wy3+s79yHzV9WLhwWWGIkWle/VxiB4aVL4w8MvZE7RXtz8f/Akj767cpUZwWSQgOMeQOS6P0nVeSziWTcseF6kRtH6wnQi97eCjNk1Zeq3stWBeko1PzpjKhdRGXrsAwLO+i7LxCWwrlXBqi7RNTPopm+7KZRFYFT/ybMxiYLnFhtC8d5P1zGn+hjv42zwsDNs/I/Pq2OvxQBS28Er0tjvctGU/5mjlTmdoYCQKK3wsKTeqkv7yh+IgWnrPwHlvBEm1asqPZz53ksooxV5yetAgTZMqU/uV+W4lqgSMDM4l3xrivrjV7WL4JCQ/RT6RTQ2IRoVlJ26OgCbPd88AqbfKrplBGPBvo8U3nuda5ijMjZ+ut35bfid9YvbGWYaI95WMKoMLK5qUOJAIpOFF2VIPGDyJuBpmDOTwprGtKt/iUILd9f4CMPFLgetZZEKlS9xtVtAUOdSbXeT/NLudh4seT2KjXQ9z6HmQ3fcpMlPp1nIDvlXe8fmzV70qmZic/q6bBhiXDgpO+QvhPpGk99iya5TBMpxTzn30Oll4eGS4rzJuugtzsWD6w4sAcw+6cGkZSUuP7asqK8xFizvFypR7DMX30TJXwjEDuB/JZbef/EvpRR+F2/smaGfXicjUSEARnzqiHyquaHGUUUSE4qqkmAzV79GgcuNqhUV2chzluGFuUyxqceY3oiB/4o6zkUKZk1sJ1K0yf8q2xE8rnRY7a22I4bPdLIe9FFFrr5QQWy8UNftzi7nGuzD6Ey4djlj2vUxwT9UIA04IAnJNiDWVWcXTQS+SBoGS30sKH1MB8NjH9HAp5dzUQ57gaM8WHkuhBZYepEcZ/+MnjmxlZYqprBzWPvjuQoFvtBWWYAr7Ce9DfD6bOS0qUSRp9YkBbYWaYWFDhKWp94j82dm58vEX7LwvssX0T5R7I78bpEYUN12xAKfEYShuIHl/0S7hzleDIBKmAAf24sItV6iuEVGL9P76oV8hlafNWyGcyVbXOHcnZakeJe0in/GWra1Q4Uv3273CrfUZgmRXa20rTUbOym7GhHO1U/odtbKKBbnl/U76ltqt/MAsJ1d1q5ivEKemZ7Es6tU9Z9yvYFMYeD9UGy2Q2bvRUpmT3W5Ky0gzxL0vNL3RMt3NMiHgJxD6UTtofEDzVrVkLtfhrw61PcfBrpT2uD/fTka/LU57bW8m8LSIS9Y7kOL+3LjQhkvWm8fuVudnuOUsaW8OpZwa7PvkkEmveeq9VEhmMr7xq7LVKghoMUh3piqioW9DDS2Xh4IHmto3oaIvfyzSPXK0uJfmn799X+KZmmPMGdMp10r+3Pq2t64yB3KifY+ArUAhZ21eMcmyhK4x2Xfks2QrGQKVboI1B8SKd32UcIuL8G8/eipE/CWhq9kqBlcCZ7vbGY+WsPXX0X0TTcjg2YKEFH5DUV1nr8FWilrY4J1NrcqMh7gIRS2PYMBZ9s7rvCr70V5R6e7G46eIi2i+k+5yVdeaLnhSfVB55RPq8naxou6WTB5wwEtlOaD/uY46i/+Qnq+oB7xy+40ibj0vXsJzU1E2Ql5ui+YGUdvGRHtlDZuDYH5ElXrBiMEG6sNusbIuXjhNdu9eGkLl77Ei6Z9RWye5mcgdXlQqn4bgZErE9wS+VXgqFQiOZ9pTXikqT9bNzQO+wfKUoDWzOcMbxb/vkBRy3Uouc3oM55ObG7PPSFtTk9aTvfsRb2WLE/wKSxhrVXTcYaw7LlolaN1+/FWSP9SHmJGqZKs8wCjUhyt03clggbp8fdgFCO1jWr6dD/VxPz76WJW67uBAF7r0akcQOzNNymid+SM2dMpM6qfCMQkZY6Ka1ADxWKD6lfzon7S7qq0DmmQK+Kxn39Cf1et+U7/5kJwDIYDXfbwYbEPi2V+zbEg/tOewnGzmYDzuLLUpj8oLmSrhfzHY2vk2ZA9ex0kWjFE41V76JlDo9+LRZ3FdvdVQSErFpvyrs7lYc8rXyn4156Sn3v4G9TjtJ6ayDZzNHKWymkc5JaxnX97zz+OOaTn33GnFSE5Yx+MM8Zj1pl+EYmaqYguwJ2yVxCRjvBBiTwaQabwiRRXBikkrghp1kP1+dKvVgD7dZYvg2qWHeitGZ6YwCwnvvihb2YffdxE0cOIydMrjk80Lxlj6vIcMZFtpoJ8rs/lrqubcpHKr9MjqOlJW0BpK7M7PahjlkJCaNakP2F3nVSPW6qnYlFIkHlMjuaKChZk55dR2srz8/W7G2NOwmCpuC/gP93qHHMNIIlrKtscErxTnFhj7Dl7Lk3YGmTJrhZY8eLHd2vkuxCBmcufCjkNtYiDj+2UZcF4DTSL+y9RVcJ+vz9V+Qy4ar8/rlHAIi0hHjLmCWkjbyis/UC+JMIwV0d2CS71w0TuykjtWtYK5Efs3OK8M+BNRdZ+NVBLr00HqvA92EdE6U0Gi/ukV/KKyt2C5gJOSS4SAj7vw6taGeRfnB87+irU1AY1vo9QSgTMrd10+Nfo2dVfwhIzr0vuATMsbTeQAPAfiwUJjLynsVPT9ovCx7Jk9UirvupnsRIyls27CGQuLcc75sDl1XRq2BMQITQXoygGzyyXJKpYIBkARndm72pDcqfnQIwKxos6xthHsuOyY11ERP2HrNnzTYght/CO1omm5g/cJSR7Pg61hiixzO7OGccnBs71lcEKsKSLfxmhccUJy6ueiKrwy572jw3OLBFu5Er0XHWJ3VjqYRAn1poK9k+qt4UDkV/QbsqfgxCRfys7l+d3MQTvehVM6JE8vZEnZ9IX++Ia+aahdNBD6iWuPcBASwr0eiY/oDhyPIO3JX9Usys2yjP0F+QUcCM2mqccGMaKde9aRkMzp1YK8S3SISXUx3HhwBdduF/aV3qcOFYX/qWZgIhtP+IGvfIkP38tVF5UHS5Cd5jLQO8USg7sTnRS4rfFQxCN61AkPNv0vhxlklHIWVnypBQsHkXyxPG61nwd22z4Et/VW0CGgX5I7UTneH3j6RLQwFc9DhidBHmwHJNpLHPF4QATHr4FI1z5SixFQsot0lJ6oaTuBVTfwBvTtu5mtjoH3kP+e+B6Blh2FSt1eysmQ8LakwPXPcFeHfrlp0/iXQKspF7jxtPZmezHPCYF2LJDVgR+TLaFHAaZpzoXRobbVtbx/XdwNc7Cx/S+paGzXdPVsYauJ97FETO3Aly815d1heURZABQ6zajD4oDr3lHVwMxCOlOUinZh4TMLIVgjfv3Z1pS4NQRRkcW6Nhw/Eje0Pqc+uXCnCJK573x7+kQFw5MEjVRlmnr8sxKFvxOT11nSSV++e7f4297Fxh/hMS5Ernzwn+GZ+0XTLS5ULqJ9Ow3FLWUxcr8+GYfpzpSIrr+yPT5SRnrYWOFQ73uUNmKzNvcmGge+tXesma4tep5Xz0/vWhW7NXPsfcM9eVUW37B0HJJ7TwrmYihzZKY3t9yUe1g4FD5zvNP8YDpCqbR0Rzl1f56Ml9MQf8Z+Gv153Pc3deroG+rs32cnsS8ZZQxPTica31dtOFWxNoHSO6yQnv2MaGPNrlGi2GEkvCG7G1eQI5vCtnclNKXmR0/27+9ddiSJUePHydTcRuZf3zblrHVRerJ+KkJZLEYHY9gD07YpVcaNSHR26bfHAhHwRy8Dn/RUfJV+hpHznxhXTPPfgFL2cUFE+vTyi62gBxahtbwPGee8FAFbKB0x6sHmsNqTDfxiJ+jco3USxpqar5KS0bJ1Y/m2PH7P6ltckhMqDOhzj+SsNzXe9N7u8uieN+5VtioMb6xRzOxtcemDRivGzX/qGVOjTQTWYHlQjFZe+BErRATxGfWSEEPr2f5JBH1IEoypWYhpOhb8UqNkrxx5LKckZSvV/34hRxXm2kx0Nz30+MPdhkwXqdv4LO/Rt009bweOG1UkOrJnuzVNizHZJaIvSuf3L8J7Si0nTZCBlO+XeSOey7WlavekwraI6kzgBdEMbfPGu7/t6nMgbg93V3vo3TkzUwQVrDWGFL7fFKyg04EtX0OKOgqnKJWIoPPemTsVeDXsVNTeF6IYswbHe564CKtxuMJrRVy9v8s13U4V2rusCSdD1Z/u/l5BcLNmQ2G2t5Ci+CR5y6+eyDIqXP2kEcwjOIXF7VM9clGnf14/uGr8cfc8UjcmVjsxZ9Cc50k4vSRndqj57ELpfPKk7aJVmhH5+0Lvkcaz5gkS+IQ30YE+Hq9aRR5VlH/Jb1RwopLnu8Dl6V4242y9tce999XEgGR5YdGUkhCav3XGNNLMwJjefUF7UXKC6kZ7cxNwKARJtvQ9zrWYv5pTvNdy4O4Z6fNaCZeq9NQjlE3yCeAT8Jt2lXm0bip2rpvbEUqZOaJxqT/Dx5tZwYmrSo4XQ0vUAA+TD3gYxjnKd0q43rTKLzUt3WFBHho5uYm1eSLZfHlT3cr8GqHCS+kMKbJX2IRJkGvu4hjXygSiKYUIXXdX0S0ruR95QQkXQJrd1zNwDAAPQZrdtyj3P0hx6cxCD7vT/NpnBn8hMbBQJBwvfWbg2jyC2wNeovJCFytFlK5u53EboXmcQhfImF0jSDHRZN6R/bvBkMGOdiMmI3lweWjbt/9zjVymtLOK3Zy7psEJF/4aD3KtSEBohopAtDOnV05q5uWdFh4LimsYJLHcQP+wieFzZTvyjiDNgXyujUG5i+L5e9YNxfCAT3XtPmwbpYymhnTyiYhVssNonSyE3b7J4Zj1wK6Fz/glV4rb70l9MAo+jdsEQBQS5awpI7vl8eCqst3lWVRI2DlJaCijY+AdFsimsiMF1rXyLfykA6TyyCakyVupoH/DM0YPlwp56oEAFkEIp3MlgIS+45SizIbQhL57ApKeMtSSVp6MIEEq9rRcwoatj9AtKJ8jgNcaLvI4/eHLSWROfyYCubOSd9axOhroXltzeoiT8oqFOT2oGOB/lMqKVcXZVUODvbcpxQhMtjJt/iWnViz/06AUVg1J32f6onh5omfn6adgnJTuIHbcZGzM9KX2mRG7D5SC6bwv7o6llo5S9shcGSWI/spr8xxAyGcMUNZTbI+SbALvuZh/5LNecvIvqvueY2wU2xqjhC7LaQs1uNDqtEAo6wTRq1uzoeshHtu/fGWPdc4qU2l6yflV1f6oX46zrYN2rFI3t69A5vS1tumC75RrLyhH3eYb+NPCq0YXGHO/ck129VbXF/aEK1D1IospCge/+i6n+/pVEscE5RDqSj3offdWpFQsHdSXUUFw6djlem7eMo8TX6cMDpcX/pyhB4NWJQe7+Zg2Vzt6IPhoWUvFFVNbhDUCNWtknIJ9BU+lXsw7OJl+GXbrnqP5tTR5L95NiglPhW4VetobJAm2IAVFe7h8QbaRvOZBYI6P0v5ozORgeSvaU04GUU98TuvIlhaOkA/dVE0JwknF5/oLOz63kE7JKc5p7sJUm/NbrOsTW2BGlAwFhCnAmeaJ/SnfOgAYccAMksUuKmOQHx7sL93rZnGT9RGyz2Ckg8f5C+HsGOlyqUHadU1j241/Plim4L86l0LYGOWRl0P3gVXYFPrZadQ2iaxa003fHUkYWprTyGB1RfC5s5buKKb6Qy+eI8L9WXTyOxyersRR4/n6A8opUhGK3c19DFyyq9eu7Uve1SXy2p5zdt+LUHvLj+uVHazfrr0nv658yVSziaG1ScPsaDTqueYcNJjenU0xJSjTyMCkH/TAFzcX8xZXi4X5e+tMWjLPFlqwSRAjeTz1+5QPuSKN9uUudD9Wp2l+Fu9eaH9LWu+dKykLKJVSJ1btW2MyonO4VjgupSxU6keqQn4OJj3R2e+rWobKgJQl000dF90gaLWy9nzOa/8eYR846mZ0x0XElVgnOIdEyc1o/DdYcltHx9MSQsnT5OdsHUbGJCe+p5Z9m3DN5TqItV/lGZBynAOblyglFp7NATt5sjputjObFmrw/OdJ1WsiJcx+KVoDes6A9kdwvm31mpN4ZA3Y+GS1VixO+Yuhorrt3Vl7zAhOjTlkGIhrQ2IaIdGMCrpfFzpN40/SwmpUYFoY6fvy02JLVnpJPB/VziuqVvy2ydbuCF3gNmPLOocaUTXklIfe/Z+qY/AZsySnkwQvAu3FSDQaYPai+UKUe278wa9gXzAnqKIEnNn54OFBOuCp1ZAbNeQnlfmwlSeeCK5DHk1EF00RRWeCw6EAdry78ITXsLFYU92GPm+PUbBvLJ28FGQWbVCh+voqrzsM9pfcJfsj9lYiHWHtJruqmss8q38PTVnuh1z0AQ+mfYfiFkL4NHD7wCrQLBqA4PrAetrxcUQq83JeQS7vgrMNmUzE+TRVH2c8J/LFC7GEiji2XD45KdjapGB7nHTZ938JOftx56GJQPM/obz+xUt1qPL3zJEkUSjAUiWhgO0jFX+swxoFntWG+GfQj8nRqJcgN4DxXUoHZGKvHsaWbQrDX7h3Yzxw3vXzRTWaMcvFpS152ckQgteg0NLh6CYzTRaeyB8XwYhufQzjVf0JnL/RBC8zGnRASlySbr9+9JwFzKRqaHjzonmh4Lu/+pyV/m2x2s5Qx9AG6gpLsJHpS9p5rkPdhg9fhLHL92GNdsEyR0XiAApWlMXzfQLVCANHaY0aqR+81+17+gkdy3MVbuPQMCwpdrMcdafJVMVgvHlYcqonAuU7QZerdRALIyscsrZJ84+G+ag1D4+eiEu1oq7mF6hi2ahh1ieyoL3J7uOmhTZoxUqOJl+Z0E1npiFkuaYL97Y1vegtPpL8oNXq1rTdLK0jno6lQ1pab8P7sIgPKtTZNQKAD2TrAMufjG8EHLXBe/0kM9sveYDcpMcMM+Kvy96uxbhIOecXMdfTjlnasflV5l4++BUCdy/TTzaPaWJswxo7KlmtgrWGFWQOrzcNWTmr+ASY3pqA6FVtFT2vZ6jg1k5KfhRm/0/okhPUDHXP3rAI90eoMGTXSFJM9KX9j2RodmQC5WKrbf+ak3/7qdDOrgGD9RbNyPHlw+WfpzqjwBMXkTl0qowmYc6zGZKMdOSplY0LrwhBvR1HbdZl19oZuAtmojzXEXhf0f2gvDrVAJq+itmQ/klQ+XMcAl2ZZSH8I4jWyr3mOq1zYJYCYD83qe3Yt+kh1PELHg+HygGz26xf5HJsZTPbc6UZqdasDPLcXE/WfP3XGdgpz/qNYOa0/aX8S1KwSU0RxV+T+jdmLGB5w1XeomLrvy7AMAtdZQPNranbzfekPLscYOYlfXo3vDkcHPr0A64GQeCswW3h1JJsCqxYxaSVpTwXtTQ5ZUHHmB0TWdGWHGo5OlgTcB5ipVHfYxFt1GDkwsA/F6sNV1ckgSja0YKlWGoEF+CSBAHr2x7oTM3qYv9rhp+O9XUa7b77AH/Vx7/b7v6OILWaDp6o/a9qBAH8vOPccH03yyGBJfuI5NR39Vc0RsPFriqo0FFmiQxqZiqOUMWrWGMKRSv+oPs7AkQIriP0z8oczg5TupeBQyA1JI0lKFgmVGRHYXDBronJlNlGTLg6F5UDMluMC69HUlz799VkOWCanjXzVUWinAW58c0HJWtl94es91UXI2/WNBrrMgcvpzxw5GZtA8I+FbmSCfp4mrrGz705F+TUNu7VpLUtElli2C3TtnuVg2RVv44KkPZMFz7ks1MlJq+vBjygoTE5H7yoviGuDLbwQZrV75m7gi4M6g44bU+T5srOpWdv/x7ZlWAI1JJjxlcEFNkaDgjLWdgaxTrGo2ra45bNfJ8twmgj8l9s96u7KKRDOz0/Yn3dVCLHKICoQVx1kcbbrG4wLdF9FXFWRsfSjqSnfqrd2Vrb0DXfWCm6Z0Hy14Z2LM0IrSSb2oWioMwqqdXQ1U8dFYdHLUoD4xYOPB1Sju83rGiD22ZUT6oWd8AanWqysD6VaM2eWp92AGBSf2PHqX9viUz377hSYevDXjQKSOx3+b/SmfPcbl6vbkFVt3kRUmD+P8bctcfekWXm5q0EIgElUpmIAUKalr4HP90pjDGtDEjomufL5ss1sI/CFU4SCD5J1lJnsNBioZnu7fgrN773oIRzBKl6PDtM3p0ioOIunFSsLIxTxCwu6oruGtATbzG2UtwSJ/5r0AHXI5H5tOj0uZcCQU+gLIprfl2oIvQQn80xzPqSfdy9nNw22Xvk2lk260E9z9ueJW6PDSyJjXtLvySWng96tGVxfIfdlphudBBFevXoJ9c2Tsk7Jrc6H+tYm9/HwHvYMIAQnjAV1Y3eFeyRNShwaRXiiGYLglAFk4/RAs+/l+r7/Kfpmf3UDNTVb9d4z186JhgmF6uXjsVZp+tfEl+H1kB7vLax0Z5ukZz0J6xm2xry8h3K23SDOSNgt+/PkrtI7VB+T/7LcYp2rCHAWp2mHdjkAmETk+FqxrfW4m8mBk4H2DaRz7ty/kRePo7Bb6v8raaiLwJ3pSPERPM+PFrNbZUq3X5F9bweauC13TwKdvHPClIR4ZBeRzXoZQXbEjdhlQRwuoMny+xJm12lvAO3Y01pxQcWPzOQZirEt7Vbp+kiDPyrw/NnTgaJ0MdeL7FNHpBINX9hXISwlpHFOUUqdpT1LaFz+weDHoB1Hj2RB3TKvFy6hc44mBAAnIFQP3e7a+1YtlIozh/CBtYzTN706w9MW8B4hqXMaTY6wx+AR8AIdk5yvHyuwOG1YCajKd7Bg/r0IFwNOo+edPATdJSCSU/1pAo+vQiDvk8ORhmvhsE7yhRkE/u6DmEmbCWiip8a2GGac27hoJgu671RKZOYUeOmsJAGmjH5mPrq1r4J9SSqtseYSobOIq4mIG414beo5V1fMHZUtFoK+jb/NJYqEb1xEyT1K74Lg4N3QpJsxVO51X5u4mF9KdrHAJxcL+DJiuCTd+RlEwELYhtMPv+Csx0JXnjiaJ/wPHQwYSsTBvVaaFlf2v9a4jdieW3Dff94OT1JhuLW0uPOwMD66C0Kj4nwLWyH5MQhcS1B9PZdSjGnfJBfzU06PmS9qxff5HvU3zAteXhd027HfVOfPn4E894Ums4kTBK2H5Hix49rzqTnY/mtwLVJVuvqvll465Ksyzku/FNYH1Wo8+tNJQ6WewsR3NmiNg4pUt3RqeeNGrvRu7zmcVfrcrCyS+v11QXV9j7WJCntFTlS8Gg/AccU/6vNfTJJnN+RH+oDNMzAoRkCLUUCjkMP5eSK5KkfdD2/Sy34VcgrWcEXGu1J2axVLT8Y3R5FZobxJaPhsfrMLXLTxVlmqFARH5HKJybmDES/m6IYfwy0EO5xg0jRbiYwM7n+vNlst7qLvic03Wu7ybEWvAP6nClmwL5Dbsqhlf9peVGM97XVVnBqCjxW+xENCmxVO1MRlJPYAK+WcxrxE7DXsHadNfjktHSunRrV7vXg6WL+5eVicd0ZsOZ/jfF/otBpo6STPJ6tazuipqiQtXauQsJJ2c6CeuPJChMaSXcENR4YA+wfuoqQXVOI6ITdcXKuAAQi+POUKfvuHeBclLsWt5sT/obNK0DYjAUfhxD+/wS9wMdPspjvGhoLtCF7mrGJbQ4w7bJslQJeJjmw4fe4tLzusqdYC0GNlKFMWBPNCWnKthN4ZhtSu4ceZQmgnjsiOP2JL1qL3+grNNBrTkobdGe00xEzF7qzi1R/F0sMLjwITye8ijO+rvRLD8nX7SrB0nM2EpIJoO4+cErKcwxKtcLrSXkREbb1scH6gYCf+cxCyMdOSJn4zmHMY/I7hvC6ms1IrvbSE9ZV+jhBZeZd408R5b5XHJaGL/0INP70ypnL3gcwIxVCWviSANXqpscudzP908Zdoudaoghnp2cxuVHEYC/HafP/WBpXObXGx0l32DMzbeRF5bqQEpPRoUdlftLi9fQJ8v6zTvBxyYlOnea2YAK4TcbpJICurmn9BpfAGwYFV08+/OEHYgT8+e10+rGF9g+cSjbxMygvS+BLHLJEyiXnLdUUNWLRzpWf4QjGlWbjgQULBA82+aYH+84ySGdKcDwnaUJBlbVJdOwM7TN2zZ+9E/1jKXpGsvfWAVWZCoQMi+DTOmkez05uQiFXSft5Z6LHy0DImS8BbLb3CK5n9KfZhg6JloNbZwT1IqqECobSS2rXXvm3c57ktIe7sNU5ha1Fn54UOa3I7whZ91mbGSEmNYVwOiIn78uI/uJSVFCcTZY48jM4OEWqaBMWPLNgl06hSWnLBpjx0RwTOeuN1KOlZWiG+3MEnxVr6YDiJ4/4/zTPXrqWrs3EhKe/ZD/bzWQg9yM4U0p/GzseXJaD65qsnue3N3ntLfVny8loTCI/eESf7nC0eOarRhZMheC0daUT2kU23GU2yZ7QMyvP6pAHo4anuCUMoTgZEQEAPA8HzaZ3f9gXFJjsX50Vs7wP+fHF3r8VVyaNBhYt7E26Y8TjUv9hM8E8iitQ40/TrOwVYC7+HTPfw7XwiPGNh4XqMwuk2NOuOYoVHP8+x+u8A8ax5KEbH8u/sTsQj703urOjYx8JrEzUC2K6ScCpholVE1CWcVHFNIH+dIWPn7Rz81oIbe7Nw1grOZM2vZy2fCIgNL1v+CAicPQycadrRv4zd/pUATExX8Ci6Hholxhdekhzs6YgmvcFq3ys/fteXK9qma/Zi0nJWKvcy4d5ne27vdgxdjkMu21a6eiloEdXRpEfTjhWg2efJkE+bgTRS7LdsJVRzXi010M23jBsg23Wjwal2etiBN06FFIhMUHho4AzJ4x/ppgJ+BsQzJzxfGCa7XMfwXUrHsHZQ5Eefa46vGHeSet5KuASBwGXaBlpdPm/2qEpOrOzgof7m2EMzMvh71Z03jGi2/k5lMXKVESSVp7XDhCYza74QhW8KLFwD6KNmnAmXISAlpHZuUp/zi6Cre7CwkGpM0tAEPF7NOy55tx9BB97vPYWE6uWxHc6CMmDqcz45yCnzG3kCEr3s4tuQlkE10tFSrXNrRkz417sRL6DlR5vCbQr+f6PhZkdSjVx415OuHzo/fODwDs8scej6KlZ/XTdabVh0LeAV3u4GgD6U6+/XTOvOYcIotFfnQ369F1tBbA6NNfYBRTtYGD42EON8oBBPYGL7gMXqfPRQ/67YQbvSiP3FsEr1nqSfgq+9D1Wm4kfz1p9erWU/gkUgU4BHzw1BpVkWZjiI4gDPjOIWgPbTv6WrF7gH4LIudk6S3A6HumtAqxxJaim7sCMePaNDfFsfuDmsfDH8t/HxsHLQaI9j51g7y9PIe3zfLdQ5N/esS/W6KJxW/t1TO83LobdT7fHiPv/pNla3XDfPtKqIsg0rmIWvyVzuLN4d/hpN3yViXAsgfiKitUx7nmm/1SSxTHkiyXfubCjA+vqIsJdua/19EaRqNqV+WMaXBVDHeGRuOMM6UME9E1yJ0pztVVUTbWEAIFpQoJ81FTCDCSC60Ba3RSsPW3Z5nnBTZsbvFrOYYdHMfRdLlKnqc9Lcgmw9MnwduTyh+o6CfFtWIHUVU6lRT3kUcesN0nqDLuDTWZ2rCNYMVuK4XDwKZJT8AO5WeZ8QmBdyS0SBzFHgt0elHIesO/AjYyGrllHg3y5rSUNycu25ySNe7E6/Yo2VmBGjI9QOF1bdrIbCONXRU0l5zb4foVXFZUtL6oblOyO0BFvr1i4FU+E71DhNm+JhtmnlU5eciqf7cwGLMAfjmWUzPl7dCjrT+k0aXRdLl8Ky1zcGn1A3tyA7vk9A7rc7czWdZGg85iKtOD+QrEpOpVlNnubzMI/ZK06EY1In4iSs6PKj0fvX/y69qoFPYqs6tGFApeq7WS2Jn63/ujEZ8laMgRy/Ww1FWwbM8QY6c6yPRDQkIQmb4a1CAaw+pOq+J6zB+mN4mDq1xYIawmOOIuk41kn/nW5tCX8G7rwozM758e9+vAxV5AzfeK8uTaLxT+uPQifw7z5L3ogZRbT4ZCSzovTBu035XcO55WcQPXGaTDD7YBZbqo5gvedC4uerOSLLv923iFw9AMAW0UC1HQoyspZwMZcY+NUr69K7HYOBuNgfq7820RAruNxrEPh+DXXDzzaMo2QzIk8XJvCcpObFBBeJMsZUkGb8121kXVi0nF5erJbRkkyzBgjOlaMKvPDreUyXH6xe4HxsDOVk4Bb6qt8LtCM71XC2TgaIbi6/v5+E2RZZCMk+mO586O+hDoRNwTXq28rFXKVS8ahHEsEht433gi5C2B/gqxGKMhqXJ/rJF7V+/OTKzP/6ysJPJKEe6e9dmJ9CQ/oV/pPL9AAzsKeZ1rK0W2jfn/gT2b9f4HdDkUu9SUGd88ely+fTvGCAIjtZntIaZQ0V850lnD1AGF2yLF7n0uFgJJkDDJ8VIpVEH9bQamG6WqqgoWNDchjYz6gf3j5kRwdWyQJElUTLAzOqrD7GTT+3WAAHFXRGCMcR/SjA7LPpCYdfnU/muOa9rI635NNQQmYsMafjpoYvweKzUu7PQ9+3aEB4g3zWwSWzYB38SSogIj0ifs9M4CC9r02RrBChBrBV+NW/KX77u7l/HOmmgqmjRn8jHSs1DgFXM6YI+dVRb7Ni/VgR04sVVtKnGx+PQC9iDcqawqqx2YLBnMRkv7MDcq+R9+pHoQetTGbaTpx4W+Kea7pX9wdnCNqj4UNWMaRfQo0nid1WtsM4sh/osjmp9u8c0tH78a0xWOT/KFof4rOCr3DTtLdm5SSl0ylJxjUuxj+vMbSmZ4Y2AhVhXVashrf7vQCDe/uTT9dRYrAwrK6X75nimrC/PspRZkuaE4F3n4ciK4cXFgx7b6RlWZtJj8kKUaQtiDwYk5NqGbd2mFkCEQO2AzVL00pcSGptTnuctihhJhd57kaDkdJEmNXVePrfL/mppzI8oROKanchp0BPjm5ERaFowTvx5VWeY2XD/Vm77kxGOYmu4T/9FcIGYE/SoWO5m9MtJBZnqcYQX+SFB+AR09bxJgUeg+Ynpd7QNwqg3OqulGhZLUacX+HOT1ZewQ+HXEyr7RIzTFGreLazwhcVShTBMMLmqyadiAC5Kvx4485Mt7DGu+KDKUWmMhOXVVWtWd777S4lu1N5Z/GJn5Li3HJTL0Xie81Hbh/xK6edicR5kV8hxFColmoE+8DjU/OR3mt2n0UrcgN88H4+rcrLAt3j6lMI9HTrWBdXUZ1Grme4gdxnA/3kiEAp1F5LtlXfqNGLb2cvGUIbAs4zxTYarRAi0b2kXXCetlK9EADBNeEw2dBqic47IEdpfrGOV0DDrdZ1uIIJIpae1V2LZq8Kmq5OI9rt1iIf0MtzokcjSS2H+NZ1IsTeTvSk6DSjEQ3t2rApAdhsREd2TZB43CejkAAwNp8VIiAbFN7U6T1waDzAPiYUZrF7//AbV2aRvatfmMZUj78oEaWAFgloX89DXdXmGfjtT+yxjK8fwy52fBGZ2aPFCt+piNcXupzjhYcmpEcjfq4GhttnViXK/tC81jgKhpkBpxMCTSg+TPJqiM7K2g4nWeWFrDdeaAgqYUBVDcab0DTvhdigJ4dDYNj0nlY//76Gu95C/G1TeWTSR0st8Gut5ecxKAKaR6fjoQ5DeRrHxn26a9D/gSO1zZ99+Vg2s0EeheTM7vQRb6HXJHhOTdsz040AWC4Z3jaD+Vscz9sKctN8GEpxUA19Rf8/UlEmbU7if71MgmSB3Lz2eV1v5KqPa4cw4/dzjlgfLlsHxnZT6qvY3WC3wZ5wUcvi9fsWTdEtrrDxwYYnJ7DjOY1u5v6JpQHFUg7gwIfmULfMGU2uxT2tes9KDPuJMjcv90qXLq9xC39mid1P/YdKjHDMRWipzelTeZSpaXTEzq7MWiytIpJ6rtMm9hnYcsGbFQOSJCBnGJWB1dbl5BB2c6XgRetTgGzCL7rY4Gj7ZsvI9Qzi9Qdhfdd8zxE7Fx17ZZUE1SXxuvZ7AuePel4C4fNFryU1NMxGAA7iMb3e9UMur5zHyP7LDRnmf5OP+HiRvDhkhEqsE+LZbLSx0i1PZxOqQopbLCtQCjXUK7dXGXqrVEDy7Ur610VD2l5rPj7xlSEEtFCbZ0HM6iVRxQ4nQ65p3qTmw8LD4Dl/xgMLD6sSz0aWgFOJPPkjLQwuo3gs3nJa1XI85X1mlPNWPGoGy2R29NvhMRGIOvZNOGEAF0VtbX4NQps4EG3PkZLpkMNACwF58FKPeOMtH4rhOtlJc42hUfk3b4C+P8oc80BhTYZUlj4teKtI+MfEQr2+Uc791dMpFFhVSKqTKj1tVNZWMtfubrB0Kpk0aJvq7GmW13xXcUyIpJU2zxUW7mCMm7uUm2ftUUphJ7+VrZ7xhjqHBohnKmVfWeRdgF31wccWGlADRjqHV98Tv3hr8ABT38e00T0kkoT5PDgSpKO8iE+4qziKPn8C5UYbcjyzSHx385rylK4iHuZjqPh8rdaCg3yRkAlrJGbwLaUZ6dk8h7RP2tOx42P9Ih29um7hSoqz8p92+ViCTHOrPL+bvZpsTlCAaVl58A6N4giT7k4T4vj+kUQ/RJ6k0Pbdc7km8nU1gOUtZSNAzXSJKnf8MZGy7jHl+lVu8GrbtFXyx8O816mopSLLAoIiWlsyr18YmjEbp5z0EzPjHKuGLK93fktVjwSXKD9i+1K0F/A512qepuuXnDlPdbY9Ytxv4nBcyWd/rdzVriFnHfyBagS4ITiS8zsQPIoFwwWU4Qh1QxOicuzKRV+druziGukC60/tJMeU2QiWgiuUf3buVSv6PduHSGT6qpCmYup5t+e8DgKeQxcpio37zEK5B63Wu697Xkf6yZlwAr5KlzrnEqbqytnbX73OO3RIN670BrBJ63PZ5UL2CnaRK5glrXWzkZgkz3UwuoYz9In2D8tPEDwBLK6vF8a02iCtnlRtlTW7u9BV6/IyuneQSJ+EiEeGTlMqgN7ElPXuvXamDDwAAFO4sYxQZyEpM0ynq8ZwEuFJ9/qBEObgT0x6N0771vfUPHbbinVS9Sv3o6cgd9t8znkbFvnuVnAvGElpeGSN/Rkn0rBpeXeKMBnuzFHwldCT3+3Swda2o3pfBwOuRKdwsX8f5vnN0Lg0KoYoTbLPMfTi/ngieTxcOhXwCgWgcU2yuvAwdD4+G8AktxRX6EnVDuuTszzGpvT/Nq1yXSjcfZlN3Kf4usaK1evOzR2o4cvAmY1BbhD0CoLDzzlA3CDoD83AAtTNETSTxQ1k0JQ3yAxlOX3FyzGrHGOJX4m6Ikrgdk0h0UXRCI87BR5vA7gF8+HLX961U7oxm7y455ZWVZ+k8K4IYnO11hIGXX5E0Gt79PT3WoVP9unJWUqd8l5+FYqaEr0oQeCVHL6iy6ttPxxo2Y9FV8+F2XVKNjfmp22yizM8do2WMlHNzUFLyAYEgo9k7YXWdi1JPujXQLlQ9NevhFcDTn0kk+fqO9WdZH3hV7xpmy+V1elVz+LZu6o+DLJa8XfMaZST3DDNzyhHjBnUVod2UyHArKvyOX9myWb3O0Sk7/3SwV1vmyuo8wqyhkClqDfpaMQv1GA86AAfNzSROo2+p5UkXk/5TC4f/Fmv2gFZ2PLdPX4uxpLJs/zWW4Oyi7xSyS1EDC2pcQ4rrVKJa0EHg+OUVC+lylLpch9Kadm7jNFbk0NvFBPxdfx8FE1tp61r2/D5nUeQ8OoK4B/ZOvJ5gmnd6f5CFzKp/i+Mcno0XtoRTJ7UfVqgKixIzxsHnmEUx5wCcRH3w79UFJc8Zo0ht79S+Vtyyvvle0wiSe1M9QwBE4YjGT1O9rkKsnQTGJEeTk1UKngxnf1I6zAWTPB7F5KBeQR/qLPEZja8DMn5eSTsaO/TsrmrPd+gyQSksPw7OsI9gcuPB5dJKP0AGK5cWBA135AakzIJk75FRKTxKtyaEhM9yQlMS14WfpxNIlsb/B4P1i7FZGRvFECfNbZs6SjrpWwJiW1p8/TW3T78tA7xfyDuwyoV21Xzpti0pXUtDxMQRgyp6Mp7AgOmr70lLbvs/ZaTwS1ZBQjr1vt27iXszSCIogNc4No/Ah1+x6pAYx1hyIIkmkiyB+BF+Ug9N0KuuOvVo9E/x137XwnVlusV78rAJy/qNAqkMT0ffoNdtzr2cFB+yQR84RU9vErN6/LfPY+xHGlWab2Zs+MG+ezpSsHG8xTezPmpv3KnfNYXy098PxY8brmaP58TGXT48WklvSO/D7h+PHtaCtieW5WGNzxIO/mEdihFDeu8xAI41pymrcx9+S/G3zS+lnDZy2pVujJaH1bTWd4zJDenY3vU0cCyvS2r9DT5/AqpKeus5dYM0WtfUQhvj0WR1ofi+BsU172BQIXs5ckPdODg9MZX65+t2jZQteGJPMbNIU/tSFhoG373nLoXJvgdvhwVUBsbKTQIvk/Tfcr7sBZz7MIxEM5WKFLI6AWOvb7tHupYULzQclPHwcwCzzYF+ihGQLnOae2NGKV0TCRZwH1TK5B3Qf784YGkjHpBLZmgHXTBKwb5cmYtRPnS6lEyhCh0zje2sfAA31+tmpNF7oLwKrFOQ2K80D8atwfcOje58xAczo8N7rptG03jNTsEYIrkNWf0VcBzOUBf5YSfZiqe353JFZvAd5Rdk82US2Q9qTm3cDWkc0TNH4d3HpXAUMM/Km85SMw1JtEZQHORDzQ8MaUBTyvG3DVS2M/4mvDzTHpCgDWFqLhTKP2IY0JgkQHn07pDlu68wEyJx+Mu+o49LCdUJRDKYmpZzoHO975S19h14CeeyvEeNoc73fSp23kcE7S+N+PJWcBh/EApj8SZxUws0fO+wGxomg8MG3hYPIlRiKulgVTsStx79eQseGgclABWpt70TpTtnZLClOyQV1eiM+NwtWnTzoQG7srrmXZkx160ayHAScZVDVFLVrHNQkgJMvK9rZiOinu6LrVoe8/EiOMseGzsUaQTwyEBfhwJQgxw4VfwLUvlNtc4Bsm0TmcR93nTQhsFxtaWHn6laacLgFaxYTYCDwPnN2fYeY+/3TGP/nljpP8fGp3oYDPlItheDOrFDt0k+YLfsvW4OmnyE5bp3WnHVSBSca2KkZDuIhpG3rjcIS1/YjUgJCF5WdPxXz48OSpdH10cW9F5Su3ED+QTNjCZQOELDPhmVWhXlLfWCtwz/phyxeRMviMu1feqd/+PT++G9+zRWJkz8JjVdgzBnhT9MK88eMa/uilSvcnWyYKYu7WDtnG9O6c2noyu3l9DHmqr9wOXiuQuQhXDDJ+N8iwZ+t/0Wp76X/Ezhw1JfX0mHRVQUmPdVUVO1ZQYd0gAyEuZC3/gyey6gJDhZ+8HetfBS3AHcZpznU4FRTI8kRhmogGBZNpUA8j5MXnaMiz2/omWirdDUrC4meT7C8nPrGO+ZEXbkTEsJ7rlXm8Z8lIm6hGq7IsGgFghc/akFuJ3MFmiU58Vk559ehz54Nnk1qSpSb+D1vvAdRUt/1/q4ioCIiFXqQqvQmYUJUOAlJC76EoIAgB6SAqItJ7MYA0gRBK6AEBBem9gzSlJBCadKS+5+Dz3Ht//3lnMo4zzD5ln7XXXmvvvb6fZbe9/vVLT5Hd21Of6BzwP9H9VdSq8Kp2U6QA3qypZ6LRX6qD0WDiAekifz1BADqLHW6S2hYxvPfoffjUK3dHxaiLzZltieQrOlUjf4vtIm2nF6RfCwFO4JYXCr17rafDF54R1+79uguxltGACbGjtzK2uWhLnb7F0IK8yjxmMnQLV/x4OU1nJzZ7U5bEfL6PEXsqqAPYFM64gfqcecQUr0+F+ItKHP1lG/W0Uotu7NPwsRG6wLWnKQJEOzkz1+Qzo8ElC/mo80ppxASFgCbK6bYMOcDvXG/dYgQs3FFg7VDg8P4rx3RFgZLvxBp26I5KhWNv0o9OoYsRl1wCry5V5mU8Z6Rfra2U/UX9Kn2wvpyP/Di6FosuBD6p2BObIpQv6WR45Q+qB7iJqnVG3XoVpYxucCHMDDyNOECVF+e8jAK1C5Y0Fya8F6oj4pxDazfVfwRCIhO6QYHWq0dlkLULbhQdSHS+IN7kuHFwi/FDGFulPqi/5K5xHBZ/5P0Elewa9BF3lGMZZFy80rnfvyzbgsHwzIFqm3glkQPZ4DDESotx/Lads9leorhhxq9u7PY9bEldVV/UfjFJ7HAPTeR8eDgoLS6gfib4bHrlrgjXFyAZOOzvfyPe6vQFtuO/i+Pw94qdJZ5GqolwgKrtU1p13RndYNQjNm8827LOYeJlKJEWqAbSr24l+0S97SEjReMvxJ/c87ccTe3nKL9FMgP7km5T2rj+7RjFzBmQdpvlX2ZNBAje0+dAUFsrarjSgRCKVNX0XLPwjFhh7TY155wiU6Yn0Uk94caPTPWIA162Cze0VrJ2apMl9nAkZu/yqwDz80D+irBrjOqLJRNXEH3cTByyBEKvBv/FmNCdrsTRn5dquQ15XPkPowdoNZS/ct9VmKvpDIG0cZO2oEL9tbeIv8Odh6m10Yb05+yS69V+wxpIl2IL/0OaIdrp67YALjI83HnxbIQGei8Wk7A8bDcV5qD7bJy2Ln1w9drHnqkxtGlgmfoMNG8jSuHqYOF/aJFxKRoLQ4+RJ2wCZ4CdBQjxx54zkgeIESznHFztNRdzPjeOCz9hQkDITF7U5BUOKkxCyXT97m95/ci7SGYwFVV6kjjw1a8DaUJPFIgKcKQqiuMnTx16mHfRFF8bekDUFJ8W+ohn7jlLvEEtSev3ow2+d3QktALKbhrFDbtEVBWJi6tvv5usbj/4It3Y0HSpqMgszcRCSP72aMmiLrcY9TsNe9GLIdOPpb52dBCH90xZWz/nQtoc1MuRBcucO37wF30jdF/lodaw7Xu9U06BucC47RECgSPkziBWsPNSB98djroKy8Ayx0+ELVfX5y86Ruan+4bQ4e+A/gjfR834eKd1RKX8H8qbKvlHsEdFrvwFm2tyxTSWqGi0BHjN/1nLmrkNuNRqniHb5wbI5wdFiuHBYfSO0NysdyEJZxTJZylPU73VttBw940YAgjZWoo71uMzuSHHbKPRer9zcOrb/s+b1fTxFf0v9JZqKUXpSh3Ox/dwxGfvcoO+tUO2WXQQW+OtwlHtxo914y5K/t6nMuUV9DhtnX+klr3UlUUglT6xCLDva4BBkGk1UTK9Qv7L4uIEvOzf1lRn3KEOfYg1JzZVHbAD2zMr4APfOhiwgsPL+f+Cz/buj7uhilTTmEpsOTUCDBj/wu0c/n/a7aOKDw9vRv3HeqwHgSFn2G4p4mrZ78Y/7sY9wV5VBhJGf/hFNZOKFCLExRwQvxwHPe7YT7ILuw5i9Y95rkheoDzjD6tDUz84vyv0nDIiQ0pGsEHq6rIH81HLNpmNusuTfSVMDqmqwJ9bBK3hb069pny/HFnu4V877il5PDo9jq62KMOkdnN6H03ZZg4kTL8rm3+MnHis6ymOxvCIp+diTkPkYFdYI1lP6bEumnldP2we5ODmmqtYuUslFWU/I7Q4MX9BTR3CbHeJ9sz/bC582zOPRn0rGXr8Ruj+kbk9J7fajnTYiK79cxFkjqtAZms1a6cOSTaUOufGhBpH/3mdd9D4HEUNfmbtVDVagq63DNp4IjtPfG7vkvYQSM8Zf1G5JHHDfOfFiWTI1/8yo4luT19XS4R99Nm8R/Ixoy4qM/Cq83t3h8Ucf20ikaKquQLBM062GGcP1G8v063DU/Z/ONcd7ckPApR4zfz7ko3URIoQck0pLqkd2v/Q1Cns8usltLRzhF/p/gOPX8uB2kTePg3Th3FxV0ZlTiOLuA0UgF4NEQ3WIPjf0x6a6KdUeB1Tc6OO2WTI6vkDJN9BkbxhnJKcgRu/EXtllfLstNWnxhOzGvTAmJxrzpX773blxe5Db+/u0dW2mH8WMti2JdTdMKz72Y/9iESTBQMmEn/vo567tBnyvxTeHz/VEuOnb6mZeF/dzHv2pth4YunaqnwqiBRnDC7TmEm4l+o6wwr5BylePbqk663Pa6q3elG1/s5fmyi/O1S46vbuZaYG3sltJO27Ya6zSZxG/uSnQWxe7JjZ3RCfVI2gquYBWLy6IZfF4EfAeq86h7rDF7N0c5Ke1cUfbc9NTi8sm798e248Iupkyh57zcQVW1LYqTBZ81jXSJxIX9jGluuMAxk/0h2UEXtQ96oU2+NB3fl50rLC6ZKTSY0kcd2IXpOQyHmsOnbmPwjrNfsxqcu/Zmtoq0uXNB8Gqokd/5itwRr99wXr3gEvGJUXovdS538fNp4Ti0apN9oM14dKyrD+fclqp6KRl1A5Ca1chDjUofgXelCcvZ4QmlZJv034L0pZNfbW1z5aSPIIcDmgETp2UuNurwfzMmHB8iIwKwAtE4GWVayquZJUrBKpPoviK6dCJeappe+OW8/V5D4r2nkqc+BGlPz9YMLPz/GiJ+36A1OFp/GJyxXdw3aS869PfV4sRoeRJqiYPRLfOshMbwiCuI4y9q0uXjCsvWJnN+m6mLTweM39AWINRs364D8n4f6VizPbrhL42YWtovazDRZxHbWQ0VR/AQqPZQuCp/E/x2rFD7d8M0xe548TTn75qQtyeFv73hnTwE0r8xj/9HN+Xli4ug0w9fuFdyA7O9oylFKZJg1NGf2vUsd127bsZQ0brpIjU/9QPYLEJr3ATRb4e9L8v0LkI+cbA0T3gsT0RLIkaVk6xxig7GUU4InCZOfjnEvstBi1I+lOe6Kfjl0eVzqSupYEcSZdwlbG8Is1oc+s3Ljp2MTCNwxI3rcwdLa0mcJXt1g1e58KewsqrtjnLAt3Y7i3elt8BT6F7Zi+WJAJgyTqCf/dE1dJ0tGiwXCFtUJl9+0yhlJHmdXJs2k+ygU/+gBusoRctfzObylVzbqyKmDM9wr9YE9mwP9iDy4q5RZ1pUjlqzUrQao8a0fLpjHoyPkYzCsFeGhtyw9tx9S0/smxxiK9Sq5dveYDoeZzWIxTLBdVNfPxd7YwDNYcftC84/3dXH5PiAsuof5PQU/iiEjVSsnQnFV11P77hgduKiN7Rm0jS7kvHtIJkHaHqT4aRKtult0vnnAwi0sSFaiHUOdQTqixCUGXKJi5TPI6qcRyvF6VxxUm7rp/z3F0obfjShGw0SwM03yWV8pd29vxRewUxTiI5zrXgQzteA+u4meoeuF0u0TACn/3Vw9EoQm5iq70NpJSWe2M5qHjdNLlrllowmqZMNUCY2mcys75/5YhZZ+t+YOqVbLcnY8irQwrq8PLaDQ+P1FmC7Z1+tzCXd07YBDvQa2WIsnwMAVxYPOQ1y57tweEr3TlL4aNgWf5ZE16kJ2dtFiHknQ8M6+d5PEtfnY6bEHySxQCDpu0s+PtlLCFxO4Q9yAHmQffimj72LFDzVxxum6Kfzf3cMkISG/bc+TGtk71S1epJpZe8Nhnt9/LlsYv8ASRkCt2PUvr/k20+aAagQDkP2fp32veiVi4e/3vmwbdvQ4kC0cvE2wNhyft4LxdEta0sUmAde2HNLfsdnzJ+M+bTmXtX5w18L/AclZsZZREE8IYBxv202sZ+CKXUMrfr++Cm1wem/4iaE2LMbfJZKoAlUHCILfDKcHE+eL70GSElxCQrrezRjaHgQfW7Ob7HlMUW48fmr+UPWcodcw2bGczPvsAumDHeLhz8wNewS2YwPaZtbRyjUhfPEJ3Z4fKEGf9inDc8zVoT4JoBzbD5+3fkudX0JyRvilpOjKy1K9ybP+y0Ja0Ntv9VoWe+55Q/7Qh0qOtxhV734BNvHBjbJouxEnKGLGmpiavTGrgh5nzSmLpxv72WpT1exZNZOe44srpcTkbXHj3ZfDWIrGDpaenelGa9xzlb6SCRQOgWJ/MeDLC2flgVU0ZUVSkl5Z4pxvL3s3F+PwBG0eWXyHJixYgjhDwG2UKUbzWHTajMCxfcPWYt7tzn+5S8teop/Of7zOBZTyMHQPIgoLFkFO6O8qhyMe4KJxJDC6OTBxNKSduY30nHMiKi9MPsC4GbHuTYaoFA4e84TtewehfMcMXB9rUn0lWJipmGveC14hKvjxwI1dm+SJ4WFqjeSmapoYLcT17w21PSI3NQ6DQfr3sPtUikJVK3/rzRVX2TBR5d0DZbdnQaHZ7ywW4selzg0Gk2gBy85ciKtqHaU1UBkj/tO0M2enyC6I1DLrLuesBY86IfL+D4U9UBMkvdfdvTHknJFSzd2NjqEbu4wcGs3R27FJiZqIUyY+H6OmwLVtZiUsb0WMPjWE/7Z7zDkpYk8nPXB0lCzJhE6/YAKW7naQc1EwGgJsXov2T7qT6BPTju7zZ+F4Mp6Fjrrfu8rv07oHoKY+yxvapt75sd09EZ1DkMqFwzLTQ8kBTB85krNn7boU+kKI/e5nljeDWd46ODQtUxm/j3irm2vut1hBqQjKiGby5RO7fB15H6GheCf7UxtdXmU/Pxr+ybbNOLkGBliQ7HaGacfVuRRWo8hCq0WzPb4FJQfAX+mo0t962WsyaXo9q25pqKt+MrvHY3++sv3JnSjy/N0Cy98aC4ItvvzIryan7pa6RE90uqP0KW2ubhCXTVN8RegI9iA8OjenHD3ZCZ6QAJ/J5MCgj2ewiOwUzbJp563qUxLZSz1eOYMfn61Hye4IQN9Skm2bxBkrpjBQofCl42sx1MS5cmv2G3N0dNrP498tHi1aoXSoPZwz3nzKFhEPwa6rMJi+alJ4pCbSqUaVySwi3NlnNPtqhrrYWKqcSa9WDJzbjo1/LOzd3UmazYn1CYGPpHKUH6w/5QsyUJZFqN1RWOcC1iUyd+BDhdrlMRMWnTr73um5AJtgRzIxVXvPaH/XtGJxSSI3/FXWLjvZ0I2Pr2e0Du5BJMhrK5aYbvXvUI/L4GHltnxDALcUs6iYsmqjEFQTL4xsHn32ycq9+sK29xYRd7B+YW2okpyvYlXGYv/SQwmEhUz+Y4n8VMUYWTZ7FLdykSw0dtvqJkjK0jQ53pDiOGwpWSlvTaLF3cXGVeSo94vTVkL3qGtQ2JC5DVjqG3uYEWjnaou++jOky5xPV12cheq8yNMGjYW/8HsG/kK4znIJu6FNco1vH51/94VkjMF3EWHZPqFy4Pjd/xJ7np2P4ITHQidOSvvX/j2vY2dKhsjY4G9oZlt3Y8m0ITMuG/J2o62LudH8fMLg7y3ejoQYFjK/LRGcU81yivM6NtKk7SFZWKWYexhZC9jYymcvfieIJ9s38aEgiGrKz25dXouhkF46vTWyny39Twb3bO1LNJsg68pE5zWH+syjThDFbf6GdQ088meELSz5X4fSmFER7io5z8bN3QF4C3tI6fKiuIrJhpe5caY1pg5AWtrLa8jnjhJGx/N5do1CTe+QX9F/6mZKalFDlGTDwkh/HNVdytrnXSNBm8xHssxPvGI5I2+v8BNeSU3jbov4zhNN5+VxUUhDmFTvbkkK6qMKC1epfluxPMDQGDAf5vV9LcPrxaYpUL/v0Fg4N6R2O1izI3qLX+xSd7IHmYoAHGEmozu7G1hgZBmV0Y/d/M1fba460G41TeYT41Kv95HsXa/OZiY36bOjaAkPXckbOOJFfiKUH+6SZz75YuJyNCOZ8u/AlDhZkdQdhOXBNy+YXuuqDq4PwniybsZzAQlGgYtpaaOSSEljRxIBqRq30UtUdCYQOgJG+ITs4amvztq7zXuK+TRJYkKPJSZGdVZWYIJ1r5VJiVNsyE9v/UUWNOf/Nd+7l3ht1uwIhm5OXQno4QrJ3b6hMqrlxj1z9hbIqvF7N3p/VYmRZURm92M0ekk1+o8BbRs06ZOaN0Y2F9qs3Uv8dKlw3Uz/kyFWjZuep5Dm9fYCRg3EzKHzO7i2iwgreBNd7w3Bj71OCvKEeuNMSPWTGGhKRyA69XSXWBIuXx3orb+/GyOe6cjwkr4uzMLgFsprZY2rYdzsKHKyGd4GRdY6GsgDnl7bI8r/N4zmg+lUWebxItfggHWzpnWAzgoROCeCWWvefyq18wnw4LlNcu+zWVoxSM81CqLDl1ymCOEA3bge3ovsdImyu/ViTZw/0V9uJ7jNptWek3yBn8gJMY8bWADlJEROZHjAecd46vu6ECrEwN6sYUh3xvIIv0+eW2ve2oBtCL9wn2pUTqr8GHZHGLagbGtPU5Hc6PTPG18amtcDu8K+N1xsVPH8NP/A7MHsU/mbyRcmZWGKd6I2pDEc+l/YUhHuFdndjCkJo6oL+qoopsYsjhVR8I/G0Z00t7eBzl71p+48/V7r3bhA6FlTIp5Gkg7jMXU45CddEXYXqH0uB7wdtfxIIcrtBeVa5hIM+oy5psXcahHoo76avuW+PtGuv+Btb8/hTu9BJtsUoUXIzdV9oIm/MD2P2/o3GWepMm9BpI1O/NkW8qxhUfzXE2ZoNsq3jRAdqmVj3gII1DiQ/V6InLjKWFpmkxUSHz+N4O+A+Duw1O5KhnPzdmT3Dwx2xIrZa+IEfeN0uaavFz2veX+l6Pe4idqNrfxhGhqT4wTbTC13MP8n5D/+o+fFF+hHx/w7pkMGCfXz1B6fiIj0qNoOtXddKCNALUJaJtozcG+RAJwjw2NFjfZxhC+l1LjyfwDP79hede3IMY4em2YGPb6ueu4leMumRxmvvQm6XRY6JHgjnNLL2elADDyAnITUL3B+Xzucq8AmYzQylLPqx1tFD06DZ8ELj+aCJZf1YZHjPgiN7sL9qaSObJvDgYjG1ewbuJ+Ns4kRQa1PspNXvxcmP/sFzzEQTodvvYpRzCfANYaskvXYX19ZbHfCpnDhvDVjrAiXDzXuQ7XuPP0lOfavfwftpbVHWfvcQSfGG/UmP/7Mra+rlueJW1PJE+1ZPG6i5qcFpp2FjNw+mV5TznPL5P3VfAt54FX/3QjatpkcJEAEPq874zK4sC0zwvHL0UTgdwgzwvlgS4KbaLXisiPLXtTs746I1c4D3j7cJpW8BcVdFWWEcBOP1bx2lzRlydcIb8N/LbiSHA+lSxbzGYwgebjThGB7j9+ez7JT9ZhyZZY+C5ffKxstuFLGCuUwyNVNXLedBUizla8Fcx+xfoWNbygLmklMYwk2v1EfUJJbzfV37P7/QFaQcO4YF+bUeoSRmIYeWXdinYWMjNGAoS0yQOLo3UIN6xvtFjIZ0aC9yMv+JokaLN2Tuz1pkcrCwVS9u2ACGB4LoX0rfazgmkxD9NJhCoQuMArSIjnrvV7f+6nFefwuxISIz/55G4r00u0S5bHzqebG+TUo8qx7FL3NotTHNwtPEXhBt2bOkNLOMgWsZm04/HridV/0u+mO9J1riVtqt0SBy7iJLkNXVivYmXO5OernfUZhXjGrtrTco3wtKFDA0/dWJnQ8dGqEOJE/0JebWeD8PHsWjfOR/9v8+lmSBX6G5EgbbCivjNQeojsOV0IU/7w323vQG93CYZ1fWgwdUO/OP2h6CQFVKln3Xjkt0WywYfKDZFoumBxr4wxrY8CrQ0MYzGH0UQ87agFSrV37uR7n4oj1Rx+UPq5g7qD1a942tTkeLGhPOn8aEmd1UWMPSDsMWdgypHX6TG9Zkzwbz41ccRA0a3oMtPdv1P80eKDhdBffKLpPqmjS0ZciVouDS80vkttMYf0o5Hj8hbrT9cpkg1U82qyl/aWYodRAlCPbdiBHM3XyrfNY0o3UxpSPKUmNcGf6IfVdywOHR/FJE/F15197u9yXrDSuu50pNIwQCgGBTZazxZSNVn+m1xhvxaQ+oxN8Wwtlek6rpes8aTG49GRyDTn3r8rEZa0wz1rKEGTGLrHzc2Xv/NIDEVMfqZ6agWNVtcB3BUiOHw9F0aHtBgExzeznej1asL96C1IdpMYfnu6ramI6IVDGqGFUAfBvfSNLiw2+2353xjZoIAYJ+on9eZiUldf9GTPF1PkfVwpbPAgH5TqXDb6vNxhM39GTadyefX4Y7LEb5s+QklLjXT/wZEvjA+s1WZA6RYI/mXi4TSpgBohgnNF5N6R2xBpM6IRmu5QOf1hCmynNWj/sxb7DxufT3D0GOSwTjgG/nwYUJYV7BlkH4fmPLOpCde08OGQyPAPb6VantzF65Wv9T7ep8oMj9lvJjI1g50Yg8uJx+1+B8H/NxxuPLW7aO9gofKOVEfMxhxul+mHPra7B3f/hbqxDt1Pl1AjfY0uotjZg/q/3aFsCx8JbrZW35Vg1/TAlUu2njqG7Ntoz0CVC5+RmRznywwbzotnZsY12Lsxz+aVfMO9T6QKbx9IV/7BxfpFdM6y6VSthIrELrdIxCK4HpGlUqEOaiRl4r4Dsy160L+xfrbUPz6zY4G4zQA0eO0Ts+rUX1bQPhO71YiuN0mvccuzx6d1UlS6MWX+3GCilrts5S46laa0mxi8XqVKkfzGOMCzPUSrssHu3YunUyXlG+Gh4WuVpQyt3T22Hwbe9yQumT5v9oAWYJt5aeMW3c3wPpMDqMoYbdkNwGcIUxwtqJpf7v9G1gaenxmHfMlKutxlE2PeH4iYKShzHRB6KcNylcw2SDBx/Lf4DE+0H2dvoa7jz8AUlkgMYzxsjdbUK2D2aFph8EkrEzQe4P9hazbuAFau++ctyTD9jHsF/SSL+oNpv58ga1oPc9TXUOoSdas7OKA4VwRnB43Kqsdsj2yTOMKN5iLKy/Ou7l7mLD+2JOh8BdZH8E3z3eV5Sd+iocL4dEHCwnXVey54n4uvj0r5ZsV727IaNo+/ZI6WPXRWtP6yv9BLsL1mSvu3JfjuiUGaFfnzhGwwI8Si49ukRFlTpYvN7Imm8eCpUaYa95H5GoV/fKJvLag5tRrVB5Vxzg2clNB8RL7MdJ9ekS6hQy4jemlGF6QaeGhmOMnm9P3xy5rMEali7YffdPDTouUdh+hTLsSnbMBfoRlMA4/nHWpZM5j23Z7839icCZMyulAJPbXO6BrhFsx+4Z77GE7UKypPWdXqTPINkVZbZdHnX3O/3Kbl+TnkbYnE23y9eBeHmcDtuZ0iVbApYHctBxlQv7Mz1MhS35v8Tt+EGW/T46PA8SwTduLWTudnxJzevC/L291Pu/JznVkhMvFnQy8nF9LAxL59CygeWmx3sJmXd8+X1yBfleISH6AMY5/oGdrY9xSPd71+LQRGRPWQVPZTVXl3mBxMiO3jfvhS/kfr3VL79eEE+7MCqS0+p7ONJg8PVIeW2gwe9aPuvxSni8r8enL+2xFNp8L77Rc5kkSYo00QGToXV3fg17frJF+GQ5WOE5KVWCi4sUQUfXtkDQdpIymXUFfvuuTmOjbgWPjtHhw75KJwd9MqWBlV+Jn2eLAcnNG47nGsMc7ernns+D5/opX4vlloq5SjyXnOknBBDNq2aET26V5BVztwMuqMqjjY4Bm/WzE7st0ErqU1/qwPQwLUjP2rR1ZVE3jbEdrE48VinL0jGkwfYxSr76vX1Zr/e9w7RxTiVi4n6BNcSh9s4U25/fp+bqJn0jNAd/Np1dg0+VjmPC19s9P3Nwq0d1V1RLi7VoF82Z/4E6fj+VcIV/P3U2VBM6Ftuf6ad7l2uXj/ct4FoQmDXI8xDnmZl/uDTDk/2/1WLq0X4wHWTDiEiR+fjoLzkyF8dVr7xEobQ124FrfyYf99oCru/P4DXD2AxnJf/9BhwnPx0ccbYQCrgtG/R6t8PXE8M5lb9VLtkpOtJDgorkjIQMM7DOpS4gbODPbBQcmOx3uytT5k4yw2y8W9HfMHYnBULJClnCYlX/6NEOw9pv8v2DRLncceG2nRJ+AOgjMaU1iyLCb0QpxmDdf4SmnU3sc+vX9u7TyIfHHwYjs+GmWy9jsLJ1BHyRxRkLbSrrvhR0Z3fpFNpHWYQhH6f60V/FG+0YEU4va9eOAjX5Sz3EG6RbxGmL7weD9Q//aNTzP9Fi+FsSFuWqYeMyz++y+X5fxsVkOuaB2CC1O1sRaqPsQcLKlFVIbArRLHIrkkw0yKk+h0TFmdMLQZgzZUZHvzgDLJPnvEWg/D0fc8LRTvP8zr2au30tgyJJ9clBb9k8RAe9CvL1dvbHk6hXbdATJvk4k/0S18LQ0z3fMpiixbaW089TNBN0xzKAnuSfU4GPUBBYwx47Q1z0xL25JVpeLvAqmosotP1GmTDVCmNZXPsd1nakDsZg5G8JLx2o5qvyt+ro4eNPRgjuu7TYArk0a0mpNxzw+SLbAxfNcJiovxiOw4d2udaCIxnxS2J85zJCVfhCVqRrgGyyDqT9L2Hioo3GAvsZFUTEQFtxzf5z+pb8+LL5rvy59kFfrlh+vRhifrR1aGN8Dl80cRh/DUbej8BcM1JeXW0JKkFnS8RbhxyMzCTlPXNxWYxKK85xTGXu32ZetucwpkmhdTbMw3APRarsEoZ9aWNbH9Ig+AutSSe4t142fqlOWQrMYxZYW5pX9bsHdzjDm+2QvxXOJeATcmae4CY9f9QWAd/B+wuBpMESpO4xU+uaDP+yc+EdOQP+Xf6nEpPeY3i4FTX4SK6dYcKrhtcr7w3EdZABuFosaDWa1o0MWDzGrAMw1T9k54CZhF62G8boL9ZqVceWiE3zLOZ5CwFFoCbiwJinWrbZMOavRngSB1FOGT2IGGNnibYHwtq/dTxCIL31cLT1oy+KYhq5pWkjWjGM6/5CMOce2VJ+r8dMHO917korDjQUjO+wQIZl0eOkpMAHVvQuwOw2vW2qMk8vVD4gHs1pdPuXnaVZfqJgcYF56qAHdjk6QMvYcvrxLaqSpKdgXL0sFNbIUBCx543oFhTETbZFi+pAd1ANEAqX74LScKgOAvYuvRujt+6vRzLfTw4YmrCSvUOEbHAo7gJVNyhj5fguyuhSfkJJz2uOCBpvdjMhpU03EsQp0Lcg15hGJhTefHLL8ODKGfmxchYIUe/xW/wdJLaXl65/h+DkIuIQTtf+qEJyzVbhmdeVyYmGqHNwqHsyH+EL08do8rZCEkRP3eeF8DE9xsAI6mFIQqK4qw5jZPd1KdVRC7lUeKXgNwahbWUqynkGzV6LUuVGsCz7szVMT+GPIS3PHrlhBztnHIS6spyqQpQqRYWC/Xxo+5lhr2mZzFywXTpvM1/0rVK90N1bMfbXm9JcvR9f7vkcdl66cmfiTr9zbULp17r8cW9Ow7HisicVfFa7G17sBBbhJ7AYz+HKv2Ll1j/y2NV0UT+ogpnaX5sbVmpEWlQOavdQBdvuUrA5wyKZB69FScR+CxTBK847VAYKazd0WGejesy+Llopl71qDnFx0aEttnz3O8SlrhxzX4jfMYuXeIvXxz6HRD8WDbgMQYFxB7PtC4fdWM1CvMVZZsOUWx5X+PJSAmdLszqcS14wQZB2OYVa/y2PRPZrhYQgW0d/YPYDst2yD9AC1aOVrs6dYopjW4qYLuwo9fFr+uzoCVU2Qcfs+6QGcWcrS7SsymoGUYrXpGKeEfV4el8M7WnLSE6zGDaE/bKz4x2WsIYsE2+mbP7swt4XigGrQX81Sutd1qPmENVeDeZ1ukpKaZ2NiSMm6DAHRoNay/3klpJSNTcThV0TS9KahwziZ+zg6H4JWzKNGeLOM4EUMMfip0Wg+FUvXTurDAE8BTzwYGjP3CJssoVGM9Kinwb7BoOq7235Il/8LZqftRVZttJarryib7j/YIRV8e4O+bebbPT2vDL+D/RHBcomApp3B2IDLjv4aF1vz1v8LC3OtudZXzyd5lhSDwS+ft0pXrC36VKl2uvvRclL1Ukje+oIid9+/j3oRsOsytDJlAr8QplujrD5dsv9Vr42NeTB8SsaXxvbz4ZZfjkmnav7zH+37aCObeTB9hYh5WGq2gS783d/KXurLIY7/ecHGejy9pMeOfVkgAdOL76BCTwR+/OQFrL91NflNx0NECdRqs8QPyJQ1qYsLRgjiu23ykSofjOWIndUa5CQ3NPGN0NsO0AifbUFGCbWvE/6/2oVXcSS0yA6mN6CIIms9apHNL2RFpxMINpx4+4rsORkgv0Ven5EpqJoXPhF8cGVDO3KEnMblk4qIShXpELFIjG3Uyyv0wMQIOKRkFeuXlqt9iOlP8l6eftyApKPvDtsxkPLDtbIXLYytXxUfGA9tFXxLRkxp59ZxCRLm29uI6wdb0NKY3qtl+uK2rPK6vywUUG5NsSzhXHvpe/zr3l6qSq1El63fzAw3B3qGEM/gcOS08MxvuukAnCpUVczXw+NGYWgv3IWJt6shqvXeIGZHyyEHbXnOA8/X4a/dA8E37k9EZmDTvUTxlVaKHrGHiPmpJhF9Xf+jDOE7jthutpvs44i1XDKoDLAC9HujiYeXOtXhb+SQkIx0FbfrowerBDOIc0NBeXURAgqk7MNibxCFageoyMWfPfKhtw/8iwh1QjKz4eBCwgtMYTafPWZt/6KQpKacBPd2EUFTF35eK1WRT5tTeNA/Xx4T/jHR8/1bgdUtms3sCWqJx9FvwesZW9GKPjGBIG9byOz51WzPLv4zWjAi2FlhIKhenB+hiGIeIsvR6ZOcfHBTLMg6Mh6qVBFhN0yKNXeVK/2XR7+IQj1MOUECpgFMmte/X38jyzyV4aIV2ABHIyENiC3QVv+AZVOPc4hIeJr52D6OQeGjMt/IkwI1lKvofhMqJWx+0WomS51Sd6ZEpOI/BN8UiTk7NY2qUACSHrpuvKKak3apK5p/IqdO3q5Nj1Hg+p6HoIfxVYJU/o0p+AeMVzdwQjz6Vsu/QwNeG6yzNBJALoG6e3XL9D7jRGLZ9Bzh9WmD2O+rmfwuteHb66Z8HaEgB3nqZUKN2eGfnxoOu9Nho25EMnfo5B6voAZ7cPvER0yn0aMvjW/1N+ueZzNJhkjJzJxy/fIBkEc9bzIt+3IjIum+jcmQ2H1Pr/FtuAtwvlQ2urq6MDlsWu/Yu0aHdFq47N9HEJGy9OgEbyLnS2II3ZiL7X+mdVxCr90wRUxoJWE4E9mqxBV+iSRckNQvhM3BkZqIm/d8tIMHr1P0YaSFTm+hogF84dQJv3Vd/CAF6EOyyAzF/LaBs7/tzUd6e51/gK4DzCHhNNkWFCwmJnvmNt9iujO0BSmfcio6VGOBmypK8UNNgJ0wm7AhxX3xiZsdsQQMP+QU8f2YBzPYkQReWVo68rS9dn3GUqb98+BU2/pA7zTdxhLABV+GHC/fxggZ4wPnghZj/t4JMLdcJMF7W32VyF4sKzde+nLLb+UIKhYVTsEiJMJqguGjKSpCHEC6rVMATz59JahEz/w2Rxj+OwLej6GQKhLdGcKPQdNPJ+n8DEWzFTHBusmATMnhJmfyIb2WoDjtblBhxiNBFhLerNX4elOxuGDM8YIQd/Ec4a//GY3JqM+3SzrLHAJH+VERNggejgQGuN4E4sImktPfVPkh2HnA/RauRsODQnzI2+g+Bio9gQS8PSZkNZN6FnlHS0r+t92zY2+ZGyX8tI5h0zi1+0Q6I3adBuNtAyLHqx1xJD0EhAN/z4fDAqgMXVgev4iDt6mJRUtkcECdSiO+Ylxqlb6MW3EP68E4ZVKfofEBZl2b8Pf0gHZkmPYsG8wGhNtfLMFOVgX6D1qodXQYv3pBH6OkR+XotRZxg66RTB6iCPmfS4lQG4aY/up62N+3O2KJOZUei4enPRJqdeFNtUXx1WVwtTVFk5aEgjSpCbuY7S42c2EkapmMgRgdixyZrgLODmzcapqoXlf4Su6vg12LjSf0vqHTIaXW5GHvzPrXYvsppcHgFcSVOO3d+j5qAKp+kGbxdyNAVUEWhyaYlWubqBkGigQjsAz+KBdnVLXnu44KLtm6fYQO02esy/q2CmDFC91mvR+7USC2L1CyIWp/qc9mH3rzYdn/fno3Q0IPokC0gURf+e7gNSpD7kUOC8oe3yUi0OZyXzcyqzvUiEOQf5juxbkBZPtSXyMobf3Zz9DAp6jvo6qHaoyFR8snwq24tJavbnmlvofd0HwLWSfcCgToH1KfZcX8ckvkwPyqcZKwpfUJLcImzO3s/wtjMDgkx1pIe2eP2idv2VLsFR1UrSmh4R1eXrDnsGy0nMwUetM/n6Lpz0sU0hS5m8mQyPJ4jcJr4Yfm+v6okwmdalY2+b4PqvkEu4GWic8LI2WC/5+kepBGhM1qlCWBqNmYPf2asHAEW/Yjk8wr6WryMMkxNLERdIJOrVVyQabkD9CTzaS34LSRFNsx48hZ2f15YK98/QjNoB5KYyy9sveIgqDmgRm/y8C8GNrb1O6MEiuzGet+IlM/6AgsiKFMP6OQlI4U6Gtwy/UiNnkfVyxegtStWL36guyimukrl0fvdRb3pt2u3EW/OcywmKCOJMDbAVYkjme92GVeJJ+66mXHvuZsNKd0UAGBEEngIwhllVo++7luSVKnits7/RaxAV1DYbngEC6PFHQC/pOEG9WwfQwAlzBFKy5V0WizfvERZtdPAjUZnoLib+r4LoYdf/NLaA5Ly3YHC/0fQxvLqZwbvzze/+q8jBijfT3qmOZLxupBL2TpCOYqvdLqqszgDhS6NHz1JLR3xoTs325ZoHVUYWDbEbeBiYMKbTpKTrPYO3MgyuxC/6t6Ptbx1Ffg6qUqCvicb8GiE7s7cxgnh5uLoOGV1m2FNXDlnMYWUdsQ+USJXtHlpw4pX8KrLmOUAgR0Ki1MpEEHGMZ8o9GWy7i13kgGbCbfuyGM+gpa1MRG7r7e8TdXUAnI6Fk+8qX5oyPNwpxne7e8qHY1oIGp+B65iF4/KxdpFlxYqt/zy+d+VzEEjbAsoG1CT4PBGN+4Wq6RnNU4rECJvYUA8Ms82k6S0KulotRJ1evIb1EwP/rixwOFdw4Qoe5e0dacC2LJQrjZymGfGMO3TnlYL3RpIuvMmo0dHVbXoDsjsuujE9wQ6OtVb5mOUzsROK7n0ZU8YUKiO/zl/qsC4yOHCOIfTzKoHdunk/TQHbi2sDI4FW7yafMvw7u8jekzjgw5pA6J55Gh2wONEKSWT+fuMPiAJfuCqQzFNmqgVB8KdQVnE4ttKnz8v4RNnyCj6MQi4lggLJHQpPuegEZHeM5u55wCSCjcwEyuqsnXKW8EEE80l+eguN8Pgjg4fci1d1WdAIVx1hAfhNbMHm7iPgXwIyp7KuDMuI36PW50R+2ygT1gFjP6TY2504X1pt6yYuCsuU9mGt7bowPYI4cVcDSYtpH/LdJkfCKXwJV3K4gC6eTBLmx/Z4qna09IxlTmDGAkpZRg1POCKmlTCZE4SYdVEWsGgbKX7fKXQFi2EJIQiHHmvHm+duBCAzrC179l/N9mobqFjG5SnezVFyf2ko+ed9e3OCYca6U79aU8r3YQLWGrYqSwnaFMI2I55+WvQor6y5QqSvyJ10zEaYteerqspg7KW7jmsqU+piT2iN5ReKR+omN+UKnBwv33bpKUpODd3ONu5xSFh3tw08iFcSWuod31DJ0ILQ/QjnrsPsvCfbkx3Ht1Jx1ydUTpdWd1uthee3cuMiyZWqeE4iVjPafO3dT1U4ta0vq2vuedLS/ymlNuv176cBm4XV7n9nY8uMkDp3C2FA5GffqT8JvfegjP44O6VDkhMpJHCLRha/KVGYE9g/6zMODVPCN62b89gLC5bHy0AQdYRcujtRQriUDDRXXxVxJ3a9smnur8Toxk+4yKwp67QFU7X6BEYasNjWvlPGNJB+oKqiXVr9jRS2E2FILOilol0xu0ZYkRc/zE31j793Lq28JYw9+eYBydyoMf12mPKOeFx0VjHjvxn+k1Zbpr/COrA/0RM/f5DJG7noOe0gQ/Labw+3hjMuXD7zyucUu7HgOzzxuYe/geRgJtasOr9TwKKka/T1IFkgvUvihwPRV2YMZ7nsurpoPkQjng9S3qJvUleJ4Mr8lkqIMfgtmmU3ly+7RyyRBDm8x96DU0lSUeXRkXmNvNJzVmdeEsqCwwvYsaj1F1z0vg4+X7VLrB3/v5Ad0Eqf25MRHgyfE612yut8uUXB+s51nN7cYxFoP5rfmTk+ULJnU8bENXvGFJvrF1O4Z0pPYpU+aJs0V3CTyjZm79s5kHlMndaPMvd1v3uqrFb8i/3wmoj1NB0KdOmjHVY3grmULfrhMr5k78oP7Qe2cfyOD6bE86WQ0yFZej/juKFWtZtDxpW3nHNprCDvfk4/06hkOkFJTueTTY+Mz77Tqd2pDQhK19tO3vu1cYt3XnCAXS+OM0GpqOgy1OY0Ivp2m+s79J0K0RNRULbJ+I7320uvQ0cbqB9d+7J7fqd29EdF+uc29o4M8dV5RuAju4+E7/M20Maa2jdijh8NDw8ajJyjEjUzRQ7QW7rCXb/CRxM6jvulJ7FtJpW+piMhiatpKIxrqqr0lvqC9dD0JqVvFO2r43ioXqWHeiD1dqW9o+FyFwBzFfNGfyqthX/2+LB4+2LlW9mBbpcbk5iJ06te02RC/cASjkohUftvmnqnxOTuHybuLUea7ITADRNHIK/zDt/etfJ6xQy1iqPLuhf+l4cThkJFiQNatPLdErs82tvXTPVI2BXGI+l374aRMYu2apELCFbo1ZOja+9UpkBhp+ilTwnUQiFAv96cixhkh2yquTFdaBxl7tqjWgMxcr+CK/gSJ3bNJ+GKUe60yLdGznpzj1TOtbHYTGAWo1y6pVlrBFQ6EKVn38b7l0S/m++4ayt4Jz5VA1gbfd+3tzivnXu4dMDj0aIvB0dvN9CwlpgqpxPyQYOvf2KYKLJNtlv8LX7yeCsG/IbOb78vdOJ/tsPvmftq65xrTAJB+1qvDjIbX7J7x/pawViGtCEQcLCkps1UkggXJzwI/nB15E2OVf9Zj82ye/1npC1m6Xo8vvOEMP5bQT57ByoEIo3Q9ikOd6b6gFDRRmrKspK6i78mMx+hqqC6pbvnZmYS1AYdysOe0wxkOboE6TS/4mZMV12JmTPUcYOj0QkzmepKNOtMLy27I1KISKvqHGvD42ihibtV/+E05kMScaLn0R59BldqBNtOByvzdrcS6m7J6jsunFInlwDy6Q1URX/l+DR6VkMf+3EXuB1SMlf1ZYOgAlUd4pbNn4RajgJHx5LBGsWyMvQwsjFmHLMo4NpfdAMF/nLzTWKR2WFVf6YAroEjn+3SYhPYqFzhUec1dqu8wmNKgp7/EjTmTXxVBcbYGZcgIc1dkFg5OdSx7eJbZuTz9rM98W89935AmdIfcUG5Q4bto33WcyS1FR54w2Va1RiSqICbkyr8FrOFEloEHTMx1Xw7I4PN9LM8ugSvjyXtG3VS7K6ZBMDJ/KlyQN5m6QJRaEuKA05rPVib7haUA17fLbiSxArnSDa0n39y1fiuc7Q0/vERXj/T+snQ35GcoAzR7T+jthq+Sz+iq2GWEo5tSHezYb7eFtY4oscqMLfFMFqhhujGX3v8vhpVuBDwRCQoDMdUQUbj3SNVvpx9+AtPv0X3ZTzruza6nTXcgYU/SgTQyCJhuddcjEqBYJSElaOJQ9I8CkAMLzbW/M4+KQvwjCQzFcysWP0i8lce2JznWSavp8aCB6GcX1oUkrwbV3EswKPGY177L+OosI/FxZ4eaaeN1e6DgImD4ZS1gSO9RtzvmsVVp/QfiDpu3c+edkHDN30KttoKpmxmoJjwEiS/7r3xxc5QR3f+RL3b/Y8gYugdk2tlEbVB8+UdPRZadAg3bB7fOX4SaCFPnCRzP3sGp/Y0uXBkNFpHevkvkPF+AqNUtnUqNodejfD9sdiy8iru7d9qgwePnJqf71b/UXW8giYqpklVwnv8Xtl4q7ppY5f/ZoBNsttiNKaw6mJwanyA2HC6s/X7GH3EgjH4MWCgIWcsLDdW9PmoSugxnex2iFke2H9DqFHn+VMYnX6iB9MSj/OUUcd3q5pHn5h/tw0u5b2vvUNsNeyAYMgOG3F/AL4xmaGadCvXsXR9ROkifuXna+97Pj6BzJOOBZP8WsPogH3FSMTd/cMf5pY4iLqBlac3GtF7y5zcjJ8UcGCQgAScaEFROEttLDSKqH6aYcCA33PY4oaRJJ0mkcRA9aro4Bf57oUje5SeKax1ReAnyDs8aieT4aB8nxXhYjr8ebsE3qDxodasZe/9hTGNQkHrs0OMU5vHHkU1Nu0OfohnW2azBNXnRqmi4hlT9joMJYP4pd1K9T/uMruYrkjcNwtHTQMTjA0Q8U0cHQ4VEvI4g+P1fLa5/CtNfd3n9xunu4kw2cSD1vkmE6tZtfYUDQ6T+JofGZ+f3CP4Qth2eHo9abYl2homl/lPP/uYLtGcJrf/zjge5qBk9d4+L28q2Ro+jp7tqTy7xCndjfpnXwYL8d3E2vqYNvLS/gYsrEmqyfD0gorHlmGSmg5p7tKJPQ5HZ1Jya+BjVXCbnA39BTk3XxWx/qnP8XidLBJvV4Meu+hIOw7qhgKfi81YwJ6JKe4JUo1L51Wh2wjdMxF4TqpKlYwifP+N15XLbez51cZof4L6BRI28fuy6J1zwWqZzW7jh0W4NkPxoD2DZY2/xP8ZxSL7a3L7PtRSZ+Q1z0KE3+mhUlIWN7W7nOeEBbPZAfiT1cZKAcAzDwb3Bizdicmsj3TeEqZSVXffIC1JkJLZjGh51VDdmINpZuEwMfE/Y+6Qe/1nU7VFyRYiCyhPCt3qFNOJLonzA4yaf74TlSiTlCr6FiGsbcA6MNjiiz5UeHMk55W9SVf98rrX4edI53mfZzUPEFyNpKbT3CNHstUbMP2/2adp8p3M83ie0NkYRasg/+mfN+nF9s+nqil4TcJHSc64hrlWPMhEqrFwmY6e9Yw0cStd5VOLGzGzPP/fVjW4WCpcemqpK/5hE1mbNuTpzK+1LxHtXj1v7TZFdcvIX7hKFyNZpbwbZPtok5uacmVXcLIRLvWunESjPT/ItqHDIXjh5JeR819b8p5m1+fBuq+FWKv25qTc1+vOWpP/dhUgKiMhxXlwsSMEdBTQlPthu2I3XbbWxki/1QsDbsLZXhoL9uJzU0wPpC5e2DRVODO94XEg7YNmSuRgz92R4FwetHG4OILQ4O8+9Ll4bNbIRHTLZXVi9fffPE4f4PjM3mpTDms5SMvLUQY07V1I3JS6Qp9IX5jdx7/eSY3kE362ryZiRBvfksLNXVKh+asoZH8xnNr08sokwvbnOs7gV4Lc4kWu/dKOkV9x0UY75o1wwu9yv8NxaiUhMhetUVp/itcKwE1QJaq+30Vfnk9nbuEOaRqRao/LzIMpFpghyNLvbX4qwAYnn4sS5O12YG5xqopeBtCRo54pm79OYiuvAFXx3wz43oj7LkMJ/zbCoJZnQvYVQS3NMjxVjSgyp6FDt1oWYBJHIvT9iB94ubcJ4aemdcOU2SfxAaXP+NuZ0KCVAVVKr4nUUJkhTsfmTe1FeD4rQCzU8kFnaNlpPZVh3l9z+NxRE8NYi+IEfFggbERoySmHYwfyVCIZLhcOoWhSud81gs7d/h/nXsbdHjxk2UMPKJxUInVKkUg/6uG+FKId53IqJADVvTYHcG6YT9SJJsl0qt1305lcaTQ/BQ+4AdnpMQbxZbwGGGw8k+bhinnWxYrWm+aV/FBj3hGgRhM8ClE00GHAx/ZzQebiGDTCBZmhE2PyjvliBiWxYyT9X6joZUFMhnW6JlPblbqaquA0EBVbXqfLYHS3lxqBiF6pL5JdCc+MtSWsVjaiY4q2WfUnUGqleig7Sl8VYMcMmmHWuRZEui1Lo8L74NeGw3MRx6uj09wFIdffv6bV+7DgKOA79cyBzCF07oOOMw2Ac0OmJWoItQECQ698AV/9AKsdjqpxXgtoHPqzxJ9wlbKK9xtELDR4WaxrwjM5U0zzPE2aoziiyelbd/FeA3AdiglzA8q3GNikKUfx395ramzqOlcIvc4YMgAkQblYZELAU33S22WIOF35SMciQoiJheiW0hcaZbg7D9L1c7cYj3Vaf8/6QQGGQcf1snkYz8inzweOHMdE+YsUdKDoZHng7yFVcuEJq08Nhk+0fH5TJVx4bE7a6DfN7O7qgBx9MOnUwmC0+XTm3rhf0iMa49m17yVeaXg8Jofb3GcnUKnoL++M0Drvkhi1fBA9f8NOy7TjwstOC66hdmKdhY/db4CKvVzyHtIW2cw/4GOIwWLVkmVZPb/nDvh+XIYoaXQ4xsGY/vZbSL/CRnE4DtnakmoOCdkOHdkz0oidX+4XbeAXXQXC1YID5Hqmub0x0bYtRHGun55lE9TvbluVrKPTV1TJhvTnG0jivh7u/TLQVCfrJYbeYbIBJvav0lcLZBvlHFmv0ry4MoVqyIMp2vi9HUGgTSLqZbebl66AFRocrYcRerWi1dYVFo18SicjoA/eEAZBY+Qyni6QNATe5L7TVEcEDP/QKn+lLEIG6YHy2tEL3t1g7USPS9PCH0yydBnntoMb+MV1s9KMEcBeikyG05T248cX2lh2BBl4/JozB+1ZMWK5S+T4v210cR7v0aen6+baOp6cVbcVfg5gZnVdGDdtK+560lcrm1DUHgbhQGgWsB3fnhdseKKrE+MJBRl6O8UZ+uFRQPoa7I1Jldyn+cC/xpMumUPoCdTgGC/KUWq278sthFUX2dFsBZA5HO+l+tOPAh2v5QRWWkfx0JT++DsNd1dtiENvLwyzT1EwynouwDGnIqxN0vnsFQTj5NZNuml5zgL8mFL5hsHcPGF1yMxWmZbNXX5H/QVdreKApCp86BDaUqPk48zz7ACv0o2p5/UVO70N7Dksz0mfxRHkVxufo3EWv2oL8wKXoePVMT4Qqr4T+aIj5uKXUyAu9xcj7mSbL0mC3Eeg7UqDvKNWS0CF3uiB+AmS+0T8OWYEIUiDX9R0o2OMof1lTKNfqHaVcsLXuz9BcCb0uQaunNr4h4bYGsB92lrytEtZXYm/ffAvBN+D6h4oFaXONuD7bWjMQpAwDUesvokfsBTxdBvWrn/zRREMvxN8IGxMdEF6XpendW/ST3N6jFrwbU/tjXOY7qg/4jKIg4cGN8oyV8FfpvOlGjgD86z8bdUvkYcTctGyVIi1bbGO59bXnWtoYw2DJfmItRl/gCUIzW/tuwAj4V5m9OZKrKDSl5ShgUK6L69SCJYERZNRa8rDT9kae5HnRsHHi3PXQwoeOYRWewbzw1CqHjEWk/8Vrkf9spgnjdDsEtUF5nF25dxCYuQxb6jsB18UIR4uH1JqRFirUmM4DFPmQHmzMzpi3ScJqfHMqQhPfOLo2QtKQbhaYENgoB6YZNUCaQVgYdqewVP27iHlnNJCrH1Reiad1yCsmfSWYtmYhfuXdNqu76ABeYWxVwIfxlWOxXENhMZNlIOAB36mppWMNZPcEL5MO7em3lTSTWS6Pve+Du4W7XQmNO+lQthmbLS1xr3nTDGudJe9ANUrjxsJtPFvR36JvU/5F93KD5yKEcwko64eGkMoie+6tUzIKDGCZjEKtVFVauG+lwq4kNrC+9HivYfM3c2qHHxFatJhC4QtSuirJOu6wGJ4nimfKfA9PbhpS3TOeZelsazdAmJng7e53j6TQUu+hze62cJf2dhiEgGepzLmmwWrC5/GUZ5qA7rBSwVdnRwXDLz80/JQp7CphIznTL2mcETbpYAOzS4/H0KxHiT6o36/+v4/ru4E5e1j1m1k6Lu4NrJ/kDnLgFQcGeKWANa5OmvWKUu5y4J7hHm3rzqfEg8X/Pjaof4cqUh0ZbfvnriydyI6OtlUQT9xpqLhWUYoC20UAz4osOXrBH9cHpGAtbnb5CfuhNBvbZOsVWvElzserug/gX/snq9ZuDk9sECVqC5TbyhyEkjBA3HSc2K2ZNGVM4ybFknhTfQ5Wjfz6YIz+u+1Wx1wvPfui57rNFrbDW3d3lcNGYuteKfhExwbdWoEkrkAWZO5f9ZlPK7Mr1PD03t4wDpC8tYv0OTjWqdC3+TPO5LCXO1Z6R1boJ7Iu8MKjkNWgGJrzsU9aCRLhh6uro2MsjKkF4/Jp49cJJjcIuhWcXhczepYSbpQO5DMfQ6mfuq/4089kFBgVeMs42ITIKP4xZm7uU3Xi5IhcZYyhKbwbHGET3AP8OII1gH+XEsgZoLcZoS+LBX6Z0d+f/X2SWHhbtqZis1DmmR458L4IS+PCUM9CUQsth1mnA25Eju3P1yOyCoWBh76k5iO3q/eTm5otxw7aCx4VjMlwLqRKXID7NuxQQ1niJpU73B2dI09FjShUsHT2vBNbOOksKXyMVG6pFL4j7TE+PiGDepxpoqlkh05ndXj32zjTHo33z/qGHY4LYwj+z2yYuic32CxuEAyoCCamDY4lwIurPUrteJRaUBC7Q/wWukdTHGweeeitd2lluGzT7CORHWbyIc3cUaH5CDlm3tZoc2yaNaTfu3TRoHLRBPiVLsaFe/N56PXWUmhqivNbE+HFiXm9xwiOzs+eeo/4fxtnFb99QOdgYb10KbRnyU9veUxhtc5bYqngtp6cZiLHsFYhXOSu1+uV7ZIf7T/EyXTJ3j3Ouk5vdDi0t39HIrUgfSraTJYXcm3ixNLw4xW79EkXT7rqeqUiH3Lp9m702WJf1k5c/PnDkeaLKwr8wCuOI7gnEGv5TCbPlkwqlcibKgMMRpgax9Oc7/sGOPy55NOzxHZ7XNl+Pfb7t1w480GL46IbOmLn2JeMN6YfLBenI31G1r5oco+baEGcRLvf2MeIZJnB2IfUrqD+vJbUkoTNAjs2OVay0kN59mcfZrEPs9KHne/jYnZ/4MZfbJ665XOBKpVeAQVFh78tk5t5ntdWek3eFpooHDs0zR3yBtaaCWslEPxO+U3r0MS/k8IKg7rc1p5NuKmX9/wxvVDQI8X3YdjhOT+y7oBcPjxsm9asvXsSeE2FGyShEQqhETahPTmTbv8fX98Z1VTXbW1DUZqihA4ioNJCFwggKtIVpBOqCCF0hIQuICqi0ktAIICg9CZBelOkBgi9N6mhCEjv8J0DPs/73jvu+Mbwh47hzjln77XXWnPttefEKzCXzg13ZaLg6Nxc1aVLeuiluRUeSPUhjni2cfPFOp8uQvD5eJdxwKCH0UPPnvA/rIL6Qe94HeZL6fV5VKPiN4bJDf8wpO/5e9zOex+xVxX11TfTJmLDHG7EVJ/Nb4ToraoR5Kwu2Wl/vXcgfYdkp4TcMLypF6Q1quDoyqDyMqWAMmcFRPO+VCGukylap1J0H8j6hJyGVhau5ES1tD8c8FwfX0XYZH5zuU5Q9opLlq/TvWdC4Ez5sqmsVKEz331gpDv0HLC/Sqm98e7Sqe6MD9yupNhwWf4NVVmL1RdbK4eCd0U94f6t350TsloHn4kPrXu9Y6CCP35a5LxkVI3JwUf6LTq/fWu+LTgCw6QNNW5gnSmY0LDoVIO0JdZdR+9ZckMbPa55rQT7JtOW3ffJd2xMxm0j4qi8WDGPS0X60dBBjqJipeSzqTu9GeJjMB1d/oFzMeDMZlYJqizZNpJjA+mERJ6w7ubamlv+KhN11i+nQKYNh8+y5aqHBd0Sd4bCOItclZPP3kxTnb7YV1r2oslN0Rmq5MytVjLVrnKwKDw7tbM0OeKtxgA7W9wH36NAxldxqU92WPm0srTPYauoqNb4uNY1l957TLbBRkYecQ8oajorCb2fGJgb3pPtC3lCX8LyLeu1HhXJfJKK7NQtCbT6zbMfp+aqttt2K7o8BnYuXYiYSojrCMxufVvwYCwsfSXcWeQaLPpa+ODtqbklE43Z7uKD31LXYK4+ffzi/g+InWudGdaPme6zlRLzTaiUE5agFn7AD6j7FRY815kdohI1dpp+MmuooWj9OTSt3EcpCXgdXO7bB8S7G1nVpu355oCJe9BxbEmtN19Xc6WS2egMew3y+fkWZjyHzEpSieqv6vneI6K9gq0ir0F/s++7DJ0pe63EFmeVCVWOYnqiGMz45E+d2UF1k+6n33wbf+SW3L9E8wMROpe5ptFoEjejdWXzINqO+V5RzufEFm5TX7IaSOHVopdLpgCSob5JFUJdVMIG9qztc9GmD0m/8G87ic1ypgGefNl3SILpNxclL4jeqXpy0ZC6vvefmzjzyS8ycFDrS0Bcpi86RBkq4L/W2b1x/wpkCTam2luJfjsz94KC+FWq4k9wKN1ZzjUHmlW2/i3X7XBC3WNTtgeNAmn2W/ylnNbKhlfu1FTEnAztSvTL/7N8JTt/Ra6xGDXunC5n5+dn8Qp4InQV2X9JzG/nKJWcTKtFwKmNvRXZX/aSpZLX9k7XQQ9Sr2cRaWo8HC0ATx6nP9a+4gkEkpDH71UxX/+Qs5+cxwq1ZOyTsxdfqQcSYzJ2fwsgpRSSIVtbrXzjHNdXec6UwGn65Z9vXBX+h2wOkv7RdOpODch1bjplTJZ1Zp83UNvDn9dUaO/eR5QSXUaOwBlm6EVUJjRzbMB7RE6PM/wkFa3B4tsEnBhNwV4QAac8P+1SIPuNrZDt7VekYmspfaLIf4l2c5O/DGUkqR8A3thQyLpG9rf5TdHHeovbsGExyUT/rfYFgyE6kKMdlLWMp9y9nLW7axsoB6aBqxUvBYnzhQfaZ43FvDAEsnIYnTKRBF1h3vK5R1up0JfpH5UgiQ3TvI81dKVBgqC4KJ2EiPDMTW0dmk04ffOfYPhrdhXD2ygoN8iI8bdzWqny9H84RO1dDyiv3j7u2mXm5WHf0h+Y5B8C8r5yWTF9FfivcJzfYiTfpz26SJL5PQMxW5WBibc4Z9uHzxG+ZSMbKkrAv3E40KwQAZK3s7j3PiKooiaYC8436G75BuD7h3VAmoFICW1dThW92+xiGPCNI0nwd4MoEVN3wD5aBGIKSBUJd3nMBEcFbZ7v7jRuHPwsTQ/s/8/Is1R/X3dKxmYj/7AgI5bO77VQURHwyiOPdOSXPmVzA8gvahJ4rEIvzUe6eJUx4cqvOcdqntxQGZ2SjJYjsd8e2Ue/vRumGyZy872N7Xua4xfQYhGYleRcC4+y0OmGz9Ygk8QU2CA9SI7/76TRcedv7ofHfmgOoTH93BLXhG9kjtQuBPBqeIX/18idDyvjhlrytllgmo0Hq/kUao8CT97ZvOZn7ayWsXco2I9NGYUJA6bJYy87UM4dzIunRXAt/+Nje9Yubt3t1X6MOKzmAsBeNOvxLJVHHI97BYzTdm/Yz1XzvKs2+GTmv57JjQjn+SfHXE1sFEpbXX0NMs4dU17fh2sPIxEgYQVXBBcpHtulRtoz05D8HDFXDqNtHw8XpNIJESoNecrrOL7AcSaaus0gIC44SxStIcTKQ+1w04DD36JessBZTkNue+AGzwZLL+52H5CdcAZ8KYJcRJeYd2SU3eaSfyroFI7YCA79zhkwOug5uGCSY8frITxwo7QP4nOIUzjTuKmIDsjnPQ/VM+wmTJwx1ifXeiHB57Qr/AwIvj+efZpQsQ1ohhzTHZaUvK7j7gkp3f7pUWXWa7es0vrdT/cUpLBwdvwBNNdiRs6vsqlxriHJVPAhJjCH+OzTsx9fxdEaN9/FqvcBLt82jNYZ/ntAzaI7MXO0DQKfcG0Jvx1yHTzavJGRIwdsaTiau5dsPHl+YjqJMmDUGC+X9owiX39Ib90CJ+d0IQAAIHy4+WXTHN8/fC2sxHA5DYMAAIjhZrV42Wrkeuq27LwwDF9nFzkDfJURddZ2Zh1xTZAmZl6dIJ+ixqCXLL0MpDG3Qv/HDOlpvwnIDIgupYZUVoL/tMruvQOpjLENG/7xDHOADBhmnAUfF0T4H48bJpLTatPyG3gfP0y1rrKtZ7A+WSyCL1xSLzv+ZYGcPe361957b3qCgE/jMowZvrQx85YV8ANNSZorrRRJhdvwkO+c/iyi3r1mhW+heHY6G0aHm5Lggqa9QttpGpxF+g/LzJry+VcVbE4aOilaT4amSeo5zWpJRF5w7vkwHt7pL30m6prHE9Y9jx7LwptmPtIvxwW+fe4zZmXR61+L/3TexuCXbajnBen0sbHxWzreWJXzSnbkq+gLKufjP7DGkkVfkxGJFne3Tq75k748J4sK8GTZQ7THrUievtTUFP+J0kbz1+9QyQvS2dNPLEizrbEqY5rVAob6gx4GgF0zSOsPe5DlaGN4LgZcSC6OFurIKNko0pe9hTj97iGwVvJO0fXeH2RsslkpxG0qrg99W0kkKBm29/fLm53NE7nJvVhpJ95UcFTBSRCV5/5dKUorugmYV2f/8H0zOzIsLt/7A9vvyjkHigMbijcodfb8HPkzIwpt9df47KoQBLEx6miR3cKU1mJ7u8/AAjM0MYv0Vn2Hs4tReejZaGBizjDE761Id9d7i+7uOcTNvmz67F/uY724xjqJ2+VMp7tPvV5d77PpvP30aOtX7o8o572jwLURVSMrtbC+q2s+F/xddpNShC0Xz2DjHbM+yUYJz93AStDGXxmSZO84HSGcpgHviBaNB8KiFIq7ElnGLhWyIUPL71VWPjmfFDgOFqxij34HMp5lLsAqkVxAEub6DvaHPnlj3u/6sN7zV6mX0vO48Kgs3UNc+eC1f0IxeOn4Tml5oc12oslVhQl3cGdmxVRZFuqJHgGg4zzwTUwcA6bHl5R7b/hSnvz/LjltmiHNDgzLiQGmPF6y/4+19wDWnuMLugNNSd7jq936HIA7kUvrvOlalo6zjBt+rwKRnveUvpcYQaF234kxQGrEqAUc2nv4fSDZ4UZkHWF5weWt3F+TLwtoSta0ipA00oJHujOV/h9PXASeSPGKpdejp934TnYiO86JHc5RWKj46efJf0WrI9RZLvxf7zoHjDw4ftcQCOAIHOWUf+uaZd5QRH+f6sjQ58cnk2mfKy29MZ1/5f7qVe03mu5yypTS4Y4/9N+mSfb7V6Uwk2k8i8Z5P23SmDngHxJ4iWacSRL24SIz1Cj6moOTQ7O+xt3reYk/mxHJZ3/boAH2Spq+Gf6d+43U/YWY4pLftvFLlj2BWgROO8e21vSCzLkQq01CTbWsTmwT5mcMapyIYhiSXHv7O+jT0buV0YXZNe4znQ9QVEcjDbV+O0KFLn0IJimP7jSHFSScTnyPjXZ7fcZ4/4XqQVmHSe2ui8J7zNz5Z00ruXn6z5mHDKZ8gobkxwhkx/Cnpw4fZKJW2Z2AvjgwmzOQLptsNkdEUeuyci1mrIZTBIyOdoWQA9BT57uEdKmJQP3Oys0QRj00oVomLaNS10EhTdDSORPddIOkSSl4C3JtVW/rNmeypphn12Wm8HKLB44aaj+cvR+Wz0XbfR+xRdo+yCzg3m8jlEi2C9qgpwZ/tZROBXaP0r8PjsZKOB917JwiND5GAlnQm2+o+TXNBgZC4yJ2Zf+dS1fe+hthJ0uiXwH3GjCctl2wOUbXe5nA+R9ipt1F3tKIX4Eg1Q/7g4O362tnr0WkoMT2Dq/rsfvfbdo99R6kBTNXfinidMFKuycxJX99+WPhzpTfaDlKiSGjUoSamV8JlekdpyxP/m/PwvsutVVZhlKbb3J3s1deNKB2vsovwasIwdq1wPhOsG0B4vIRwPydiospoLBErKazttDTE5aOK2wtwaojv4Xrn8hTSneOvX0tlLBsKTPIBlb0tOEn/PeS5hTBwx1ArNaQt84LfNjQZan3RhxIamzk/02HJDCsllMuxxIdOuMHUjQ/6UtfF3APtBFADngG5jl2rMSJgkzHSrhwmrV9WNo5bFgcAaR1PfzlONNNlHW9H2YxZZ6tO12/xtxK++m5vOqwSoLXPuLoXOhi4uyohgQZ1qvjgbYj2ZCywUNXIUWV7nJvyRdKZIYjTjeKuV9+nwuC3zi7oc4q46kaS10qvq6Bq05tdi4rd6ueo02PbKjdGEm5k2UsY/HLn3ZDlAnn9vof9uGyrCaLT9m4V4+J86uIfdPjtiMPVEwz+rd311b7d+uJdWcFPYrhUeueZWSW8VTf7E7s2s9SS0w/gO37dOLL5oqLHmSaOW/gtl9pEcO10vBRU9c1RJ7b+QrbJ1vjvaoUfq0jbGIztPsS43HbyyCYrGMV6imdjewf5XpP+VGoJ6OMF+5y33rq4dkvsOgvsJSxd5QpX9oVjCrZ77tXeeoVy4fSl1SJalnQ7CNjhmlmG0WtR2acy+//Q9bILNCEzoSqWNxrDDR0eweLNodtmO5ltivZp4GyCnDkL49ZbaQdCdbZqfoTe19JU9C5eIJcfO0mTAn9/UsX8HB32APkRL2CQm75ldI5w865bqKRw41ZDte5yPfkAyBppWdl+5Sm3a9NmE3Ir+wIxovMpcZqEY3tcyf0ew8vPILFZzaH+74mNDZFkscTOONV3XXuI3/p//TwhmlXv+Up5khInOLoE5W0OTueHVFOLl0mar8666tKTP57gNY5p2UURU6Plle9iZhFQ+fQ+IJLsLO3+t4yOXMvcLi2wz3JkPHDL2c7chwj/KnQMNe8MQqvBJknvuFDexwdVyLa7tVd6i419IVFv4BheJ44zSIuN3WN1DHwNl2ZQkz0hlq79Bb9hN/auglzmiNvUyXiVJ3A5z7rpE/38MitMhZm6OwqNXwFi0bDaFSeNCy5Htjdm0JOmS+97K3Nyf3Q21Zte/U0zu7GUUbxrpLZZHJvnV0hdCKl914Kg8hTTpOoU6JzQEpIoTUX3mvdGTTc+R1p+WXdXUeDvVhfM6PwomNLj9pYRnqe7h8vv++IDFsHfkytTYYqhi9mnkf3pzPNrQKmbA/PpkzNJFIju6SQMjV9rjKCK9XCaKjNq8chd7z57tn1bv4cSF1Wj3xcyrNwf3fOsEjJHiQoFW2pYDOGhyuR3aksnDBnOxVH4IxTreNGFxatzS2aJ74fskAu3sN67d6R24m8BTluoANmbGUwTXNaqXf/T0zJk7fnoTvrvc/oy/TLX+CxvvvrLvi04aDGtlo7r15I7UDasmakWumDbTR0j6N4S2miUC3Nuu7mFv0LedVc1p05w9W5SCJNQtJ7A5Ze4e4MvZLsXo4h56oc6XcFamPptxOFun6moQZulVaqUed5wWjIOp4b1Snd/J5WDCzUtDtJ4ntUoioicYryrs3e+O8Iz2vSZdOa1jzbaFXdcO230Pm+VJG15bOzz+fG6V/t0Ca7fFsZ3Ch7deUe9LPx6qPIyiaGUTe22ZDhqY867mWve35Je9ZlK/9e7UEFzpgs8mO9HK9OcH0Zrv4zbbgqZ70QcM/fs486Z5SNOrlyCHldIA530ppP//A2KrteH6L8RH6J4TeS9kl9F/ugfxX/GfBWGXRKG77IgcXsuMgauRe7PyYee8F53ZilQrYGRTRt197hWRfPrmUR34L2YVkfvWvCqajdg+n22e7Fx9X3zjHEd7VZ/EjV3LgvlTH9NGJ47XHSHWAT2Ha50nOb3xZvXNFpWG8083TloFxial7CZhmo6eQ8Jxo6EbVciNil4J/xmgPMEuSDLqsVBwiZC6GLxG1+t16HOnpab4HUfJP4sVVshtYjiqbBfIu2e14Vcxf+cF+lbTDIbMkx8/rZHf9HalF7kCT7wbqlMepJyshEwlU/HoJz2efKo1nPKu4xiKtoVxPbRdesxZdmNaedrIQ+iHqdXzK6kO/03NTTikUgWx1sOIQzGMR1umUfiSmjeFXY/aHvu5S/PU+BD9paVHgpp2i3+kTNMJ7FDK9q+YsQR3/KOpj2HUzJCNMNhRmcez/TYZ+4O3ObgwHU5R2E3ybt9aGcV6iOZXGv721no4cAcNJ+xpsqK7JOOk7XDAh3Qe5zJvXmyq8FiRPDiuS6m5v8VvYcHV6PrGa0dP4emsDeZAg+UaeXWFeM9RUCUIKrEdbUAtTpGnLXgmM2kQjjo2ihPBJ7whzjkqBgeFku7zSd75Ip9YwWRP6YvOO+PMOxgkZEkjGVMBDsJJoak+KNJcEzyLZ6vVJQFTrEhiMGtQKXJ9eNigB1EQlY/N+Qfw7p+4HQaESoKQgkSuq3CD3TFTayzijgbgEiXaVro1OvHe5FuYSuTN1KBbVs7JU951TNc5AgwMU5zWgZ+4QCES+bfbjeEL1B+n6mXyGHKaH8jT+9BJpLqsWt7HOPv6SHupvfz25FytZ1vi+ETAEZSbONUbbmmMZ7CRLRVWPAuiCTkr4ePueWBPsd9Vy5YKiWC4yAoarMs4QAH/P8pNlxKV85a3ePN0jOwz/b4VH0M5ZObBfXNXd562XwJNgdJFSwh03mB1/u2wneOcMMjl/96A/MpqUx9B59aR8+8/ddHjO7UTaVmC93IiWiI8MGecDIjbs3kGV0JJhrza1ytCc1aWqBnt/8bGJCYjbVzh4jbgrKS26VQzGmvI4LyRx9Sz4DF0+byxV666XVkkDfGXTrDN8A1WqTw0vqQLXad+1UV+52nnH26WLBlNQhHBfQFwImbhTT6G5sCU4u8XZKOiEM1SoMg86plsMjppI3J6RAldjbweB15JHPT/TyeOzm1x5X36GZ6Gfw4CBbwJc4l8U1TfS3TBVNZOrLBKyFV9U2WV+kJw77Vzmcm3m32Bo2C+VAqdY1DH0QawVAScPQbl/VZR/ofeY42WgO56TgtHJ6H+Ve81JxEWGP7C5zmgkkAHElLZQibF6LEDtTG2s2Ox/Ihg8XhhQOzjXjO/sHI+vNDqrVY83gDBLopj6OceWCbwMt26GJylka+7xBGx5bX780Fd6PRWU8Neg31re8rYjihgzwjEbOHMXNKKZVVa1/fqoo4jQbZnibOijNc986OFKf6b08ZStaNR2Uucbr5bk2atzsEgPWYL7QbxHj99acIxT5Vz9nAXoipZPQsOsxKHtSJ2GKpddOPL5FGzjt0cCLxDX6CRM7ld90GwPpq5jFlg3Hp5a/tBjsD8b6bC7OARsLAAkG9GAhq+dPE4QE11Kaz5M3kckgE2DWdJd9b1nHZyw+gOfKM08UYMf/ETZj+4jijmP3Zzm+wkYZtXmd9q2OvA+QM04COeOApLmXdk7fgCtxAvamH3g4pXjZ1/DWfx/9BNzQSwy2A8KvwD3YAbYfPKPX2NgeiKFdnH7E8vkja3yXGqVppRrga/HpdpNyaNrF8mGB+7gk35S+e7RiIKhExmoOgOSmddLYlRcmVi+8LBwt0xJlwpEmPgOQ0+ZDN3ZX7STIDPX9eW157K6MNHDwmSoNTrz95pwtew7s+YW4KkXIOSsZADs5skj8WxfYZvwz5P3mdKEHZ6xur29XSJ9WMp/1csukHPJ0wLEH6P38ESuBiQ8rx+5omDuXfkYgC+K9twEw1NVGqPjIjxS6cL0DWz63p8YW1G/M8H7JLBLy9aStmvmGEopbhd1VacEqSOWwZzo4KqXVBcalpd8zhrQCjN1caWGqEkrRiSXjOZQ7gJHxv4EmT86h8lgsQWW/8gqXPVoxzA7mJkJ1oOF2Vrbx6Xa2SiVBUQ9h1t2Lyfp/+H9TVw+h9jMn9ngDaTyonlIEDatcnsFWBkDg/4q74v9Wbxu/qee1ZfPYcTOYmUULloaZBhLLYywD+3taevV6RpFmvO2SzyiCuq8LzBgeWDZe8kLcCLwyxAgiesE03H+EYTvoBNGK1St09W5VoLpr+yOqONUP2h6AE/cyrr7MR0MaKJGWZydL938JpFyTJ2fuVAuQpWtz/Xo7kC6WfiworT5TRIZxbbcycMPDQroeqxIiqPGPrqyztgZ0QvBfXVluBnYX+ojH6nSTO1d+a45R+RHpJL51HTwx03ZMDMrnXQ4VveNk1QgEEVTgse19BPAJ5h+iDewH/DsjfA0qkKjwNT1wuIfgEZuOy2xuw1e45eXPbRCVhYgTr4/HDTT0+PEwQQL+l17V7BOP0JV9UggmTFZy6NbAlskdmVMDM/7eJZ9xvM/HlYrSc/LlWqCx+ffkzE5oxX4EkXDTG9DBriWYL+yTRgXyUS7+ZkWMaduyFpCH8kRcPIXHkoXg5BYx7pKmxoaL64qRQnmNEDGMH+n9GFBHXSVGin9evQj6iX/9AFVR5tTKsHHbgGlw4C6+KqvzLqOZxCibjW0Fh6zZszvSeEiR7gzFvxpbC1C/Gx5GVsCvMJZHNsWTI6TGWs0RU7kuvdk3QnDL3E3AZ9sDn10aFSIkchPf+dnW1BMxCmqJncRbwQ9szeCEJcmOqxfBpF7V8cYtrv/JxHEXAc4pzLVxuSGEFjFGSFGgz6gUpAZ5yLgZ/y3q0wRdKQ+X5WYFm0SedgBLtDahrtOzCadXWT1WLfxzGwX9PcFvndcypITH7rqxJgZVOFVn4miW5+b31B0dNxxHvs/ZHBZ60aR/GORyLNSRDA6Q5Z8WEdmtG6tGW9dP8j33crA61Ob0jmpyOrASnzpN/q8WSwWH8JO5Zr6f2j05twvJzN9uegxDlULp03f1ozcU9YWakqLLsijjpMa8Knzmtnp/WPzazey2oJlDxmVPSToFKRS7b5wC6f6VFu3CZ90AgLgU+0gRQIjzCMTpOIJV7neL5PVWYcXHTrMpqVDb1RdbgkPkhiEVg9m7B7YRct4KuSuhPRK2sDTWwUyKZrlFOw/JplSw94PzK71EzN7J3ZY2f+8ft4D/gziDhWmbvOoqypW6/zb858cgcvU47cFEO9wh6x2fGrXnPpJbuTJ7F/8D2faH0bnf/ImpqNh5RdW0VVTEMAbbJiwoBer03IS4e/ww+zVY1P9iH0F2PjTy8pjMLicEE+ercoe2qLD03ZL115j09V/khgPrF5C/Hjidnz/MqW7Ub4op6X3OaaRE0V0u/VZlfkLAYpL5YmZBESS4aefXoWyI/VxkOSPsLxn97Esl5KfOCGFDnbn1W8hf4YRrolISujaz025Uo9Rzi9t2p8N8F4YeOPe6/ABQ1zUPtEpaCxmAFz1oZ2o2YbKy1Lmb33QlJ3Gdn4VRh7PkAObs29z5LHPp3W80VAp2loY1PqDcPjgBroW04wRxq2ngUMjdq0nCz8PPbUwZdo+mFkeEd2UMhVTZfYM84Bnt59BrKFNoMgy8TnbvIxCRnGeypabmKHVouVuvUzUlxRi3Z+QPKoszTnrL+mefi1R5nf+dxOzLZr0ieBIFynuKgI3Z62m9okkyu9ODf+qKoCa4Ab9b19tcs3kDmQbnTDVNC62eQ2YkyTizhyqWOEnJsE8UAe9kCrZFfwSZjLhAmc7rLRkfrmuKRYaVRw48QMcvPR0l17C9U6CWP0gnzrg28lroJpzCzJes/pgCDXrzuLczVRD0K4Jp6wb94wHXdtlfvyIHoinGK0xWWNo61lR7N9Fr5/DezrznU8RH1G4UrTkdl2H/XnWjQI8/OaRd+lFZ/yNNVoddzlm3t2FxZWCeLv0Tm0mKMyA3ncqldH+1gr7QXANy/9Vk5sqQma2A/bPZNaFPCX789UBG9lEs4o0E5kROTjLy+K+y/uY1D9+ejEuKORDKv7RdIJC3Wu0zOr1yyZQwB+UXCrwG/b1oUlOeQNth9Ki+X1Vz4LipbNfnJEDMqqtZ2MQ0djH/PkytRvshQX1ITtyX/jYTF/VTA1D89jceYi2wBAGDDAYPXQXpyLREik74c8ydchHPPiXn1yUpHF4zSJPsP+CzNYMuFeYDcVlic7LQY1pvjKRZ79dUVBaTQc54Taem7WkwtIBnn/8wL3K/avHYuGbQ5+msmOAkypO7xpxjISdoIAFE+IJ4Gp/MZ0CQwVXFRqvkwa8EKUGDmZebeU5E46W7nxZexcVacTOa2QBBbuPorZKgQqj9TzqDcli3bCvcMX7ZcqBfU9LmILngGaYfaZb9E+QyVwHgSs3C3YAHFyZRtleY+bnWLP8Rbg01B+mEXLkiaETCQcAA5FqL69dS8ZmNQH7NCebXoPasCpWQhicCvCryH5iz+/rCX9aw7KQkcKghHxRstQLbwj6ASWHbbcB7crH/H5KKuOPGztqLYFuY9X7NZyCfy8lu0tnYHGAKWE1rFKL6jkVtdgm6fbkylMUueGZeiIxKtGHUYXeESvvRhVx51fBkY3oqrCqX4v0QfdbG6I7vrwmlHtp8bs5LCj7vzvBca1gqXmGf4i6aXy3QgyybYX3W/TjfcTbEsULcbR3Cai2l4WheAzQU+ANHcxugc43zwxloB+YMv832H9zZ9Ol+RrOADMiebRA/mg0m5YVFVxVamFY/QzzIis8lQVeI5Ht809/b0DzSX2aTaFoZfXBjVU+BdNmKtLvBSMbe76G5zWxo9vzTYMA4GpDcV7Cegnk6rd6Qhpoq9r7LTeSnHQl17hi92VvfVtAKKjJ6NF9DXA8GhN3MUF2MIc7vplozyg+hXN+uyLpOQd/cSVjSY918/OejGOAloJcTry6ubPqPRJCFf8h50cS8kVfc2AQjjp33I/NcY57uDiTCk+8u8r07EqwpzFuvXuJRp7kPYTmSvvFJtmxyX2ZyX8BChrBfHTZ0c3Ay584l1fcu96GqS1zv1owueJVz1YYNfmBvZ348QZ0i433eEbyUtECqhNVkvfPrMnGY7o8PZCas00/id34+zxhMQmQ884WMp1nQ2Ej2mwitV2LE9Z0LDl+8K3fOo64y8783k3zc4/mZg/X6MRg6qK4Snzti6n4sI3PG0ZZCmsHmRwqQ3Ui6pDyXX3LqVYE762zsDdAH7AfDCebo/1HO3jjItSERP7k897yLtfYgb6W6tUfXuUnjSm8/yy6HmuejCKmR1oqxfYTvzMMq5SzlI97W4rPK+mOkfRQkICH8l81OxcC7eMV9dvmsOhwf215m6rfL92++uE0WyUkaGSYbsi4LBSnrE3cpOdVDHrK7Ptfh3B+I6duZfpSpL46CSrAXuson732kbs1Ydj2AuJwUC+TPrVHYvO+KJe9tTFKLvQ9S7rVdhfQ2Gi3aFsWyOmh/SkxxpzEZSnP6fC/2b2F8pI6jNcMjwhIAVJoMYJtixxmaq0FMHpHUQUTJ2MqiM2a1tRWEIO2gRIx7kzG+LFwP9RmlRA9K/I7UfWnJ0OhtzlnIDEX+3Ue4e3KIvxVt74Uh2C9Q0xwzjkQaZ0ULlyaFWfxT1WeNAOvZkSlX/tazSQnY3ReztNpPLThumVVCgqVkkmM8xdlvLYm2ZZ4H8HzSqGBzTPYlYBX+UHwOOr4EyQRhU/WaC9H8Tp8PfHqZglX+crd/ZcB5QqORWWXCAxUQ2gEB8FpS4DBKGCTR2WN7mZ3dWzwWlf/dazvaVsTFCN5/+eLiG16y7tZeOYStI6iW8ZoukHM+1QYrVFRCTErNdy57PXJX1JDeAICIPXncWTV7H82XswmSFpwxjziOz+F51/+MmfEo0TG6l93MWGU7TtYPqmGvCp8aHg1Ehoi8yS/MklwtSSeZhI0tVsS50cUtooW5wYv6AlEzzLg3TcJna7BdCISdL+8l5kfLjy1Bx8TCR6Q79oXnSk8nHUNPDBOO+7VQAmtHspATANfOZGZbrxUI8f9SiaHtWib4Ofzx4rVdbmFUJmC5kU632FqPCy/yguKoeRUfCQo4CBzEWB/QA8ChvHKaAg4pqbotqovZGmBqXgs2nKn44u0KjWUvEgO111C+l0xe6jUf+dwNSZMA5cBDcxWu4Fq5WJ3SybDfzvuqHszyY3+yCpK3ubFjYrPm92yDOT1cC0YnJ5w3ylEdTPmVEtTMAjFAfPqr5V3PMIPd7VgWfCv+TKjXhq9mjbnF4ZQ4maFJZGwW975tcIqHAhQlFDZ5mmgoomDrEAzArpkzNCfkYw9n7+tLECOpJLpJVPVlCRIb9iZ1JL5TAnel8da51isFEpDfI61Cfc3xWZ8F/ms4Fm9z9eQen1Bvo0QarvS7ko0AMTIP/TR4GGGfl6u8WgDrXRxp0+hrTkghlKYH9xszA4inW8K5gMgfdfuYP4OUyoufZFjCpeACCS6YqYzj7FkrKenP7w3E2d/qGEtNZN4E7HIcrDP93mYbwQYQ3oEEyy+bYkB4DVgkrEZW98vzGT2JiISf9KVBwgkJHeaOF5C1xpJ7282UF68PsXWIdUUWfOdEkv1M2SB/jrDBDC2gXQVIybT4nCqHjYcvFwUHkTr1Refd2wnUqYK4OisMZnAYEBW+aZXzLQkVudRPxWyqy+0INp0qFaBnIkUtHTyujk+7tFQ33vnsR+W7DqUYB2taoScrSUUlXHyGWeR3vpDgzzN2NiYplMEpraTGDhx3MBYBspLS37lz8KsFIr1LzDgL+QxbtlaJxVN/i1caCRI0t+ppHMAuGKqCjTwvthXTopLmAeVQm9GXOFA8mA4kwNhj0IJjppEI4/JooTH2neeqrPNPjk+9QrT+jc7BlzESUQD6izbP9BcCJuOV0DPLFCSNqI7f9gBd1kawXv3UynsOlD3vi1wDyvq/hLd6nzRiiiYem437IEgF+c9zEwKmoKbSvTxNbt7rt2gseVgG554pY7SZvXVm6jy8PtSKyd3FquSl89ku84pwsPsi4Z+ShY+vj6iTE87QgBUIJcnG420kDGwjyWxC5vpdSTMvcBUfnVIUJnYWBB4XfaI7WzKkBMNBFXH2L3Les08Mp/gpjeb39ayikpt4/ZD0gt+ENB5gtFu9dOprKiT18FOdn1pK13n/V2axQKoeYwanl0Ar2SPM6dXaLO8DA3FquMyStnq9KNdaoV47Y7GrgRJbSQ7KNT8D9WZZ8WA9sSla091P7eQer4WwVNMZGqSck66r+ePzJkB2snopcXjtq+WHf1rPogQGTr8UII52fVMk1wWlgaRGOsIF0nACTppgzeH+R8277bebGo1Gwoboaty8HwqvfLzWZFQDO1vXTzRxuXsKzpaTyH3bzFfFJsRPekxFNzkq39lj/Ul9EoTF90M9RCwQZF9mVIkMQtMbDCMe6ZgjbIGUzr4KRORoWPpX7qYQrs05Z88UPdoZ7NWz0UWZkLc8AYysAbN33/KSaQ3n6A+jZ4wuOVDCjwb6xs0okLaLTjfLycDwpvoC1TiR67LZmTl4V8VMaVRQJdaQEddS+nVdr3s0pjjiuGoEln89I08KSPX6Fh7ikztXWldp3OWXrNPWjK/m4BcLhHunmAuwTWYQArYL9qmXJWBQcs0lXDhtPnOX/nmKT+U6buIx8rD6ZG/aZCMMfwUSPfedEsLKB+feP4rXNvJ2manz9LpuMmMnjloyiuYKlbflD6qdNXf7dHxGmyoC+MHd+ip0X6yjkZUmnMGg/LzB+fOdblVDTZ1AeF1/mNqZ+Qv4BG3wE7pZQ2cM9YSh1ssARH//T914SV1ZJA0n7DQb5v3pNAFYh4AI9tJm+K1sWFb43u9AZ/cGXqSQ488YVCrkPfh0wI11YvF/j6vfPATLYP4sc8XEewxtIZbqDKUq3m1r3DkflgpEdGaYC740oYHEws/Bx8GWn0+EY/zrsCswQCwFLHcj9D/Zfs1HcwDDyzuvg3G9uUHozTCnj4ykzrhXVP18hVnUN+Pg3I0qlNWc4nwZjqj78UkigGVU4P/W/9nM4Z9Ydvc4L8tD0ReqwPY9k6n2R2rPYs20XRKd8+8sh6aoeLxjQkGjkLUPLoAs5vqr01qbfy+je7yeVviUzO/UdtZr5Oefui5m3r0b/hYeD66YFFf/9jmFOwjJM/YTqjyTNvZIuy1fbrxm9BCxv43vUaX/X1BnWO/Ti3SenxDXkZfSvVpFhBBLi6rU2rpKHZ3CHcE6e+Pvuh82eMsjJbZYUmt7hvOED0IpsGD5d14Qkv47MOdvUCSLDBLFAknWlJI6vEjVVUCXClEQs+LcEWuhjUqMzxdY/jid3fepOQY1zhPJIvYMFHh6ihdO6/Q/rwu2FIpmS/X6bCJe9PsPfwrMSZLV2L0HJBvCK7KvA2SFvQIy8/9u70ahXrJ2RIvEwUPYTXkQ98KMqWe0vFLiuvMLD/InnG3qmr4fIqfC5UI8+kzSXz98Fv3w4vkAqTHaDe+uHw8mAOMcyFWw136dKIp7svxR9PLITOes4e3cK6se+kt/9WvhZlPm5kkdpV86MtLD6GADSuiga7yr67Om3xRVl84/rs/Et0HgZa4tDPylRfrao9iuPbImxfm+ZCnLP9/BK+sP0+z1527QMJdXB0Wv5jn6yRLtWWMHC3tbsMNXG+WL/I3nK8lDpMbiK7zumtP72nJsvZBMr8/samOAt7g2dt5Ws7REq0qeCvpSxHARXQK+REd+dkdptqDTffZSlc+PDNsb10aassOGewiZL7TNtJeQQbzLkuZWkSLHN6I1qhm6diNq36VxckI+Bafw05HrGVVqSTUqOCzl0nV25FurdpLOKVKOXGttb+z6HLJ5WsIcFCTWMqNZRwZl7yY+eEsT/FdZg924k+5rooLexENVeQhLvEqbfNo8oy7nyKew4bXtPH92NVdWmTH0LQqGq2J3NZLvZv2S2ZvKvdeQC33j/wXVdCujUg34iVX6r4n+j3bdVOVVLWi20dAddOZ5WRzT3Sa7F6voLcG9R8OjxAN+A+GXtjbyrO2irdDgHrg0Y19+TqUcuq3qdeXLFCXRp44aFIaxWmcht3rqkuLCs0UzcoFXt9IwArLQ8Ddbg1TiN9muR8/4HU6kihwuGzO870ji4HtqdcmIVjB2r4MVkxVJZqhYeq+OC+3Y9rmVCx2/FPCBi7Z0pfKVdV7RZcLmi8Sksl8htZKlViHg5R502zM8Ce/jjws35FEyu5z6X4mLnJ6qdRdRhUX5xFZzz/eepnlF5wibJQ4CFx5Wj1BfTUUlKRt2jyItFViKC3kB16WdIl3ktxL1qvTyPZZ3hWcouqNVL218MaDbZW/maMGw8Njn81G2rtdZFmmv+GzWMb9iidllQJeKbDtBvZq6arz9NgqNhFUwG2Szbkks5FpGGClD60pcCVdLnkhKLFhkucJJx+5KH3F4D0g+fZbGycho31rUR09n4jLX2vAl9O1sNs+nUv2FiDUO4iJF2jOLHGCn8g41yqhHa+YoLlJiw7GvmPJeDGrX4tk7ssjK9zmZb2o37D4dZn6X2ZuEfo+otl9TptlGQXfZizYUPk1y+qhiZODZ7NONj32Oe64FFGDOxVf8q4EM8A+xe092LOKUz1TuudHF0uGsLzIBZiMAWmQLtzv/DgWtYESpGziMPlqd0TKK5HUZPyYfGEmKdFUdsWu4PHqGtkJCm4o65tavoGEbB+2fiZXuSSay13Qi/zIWBKpjBuhVqNPm+4RfBCAcu+KOHEC+AkjJr9aMoRBj/oowz8Uc640CMf5Zm3c1g7WlU0HdvYy+faPYzIBLKkC+ygjmq50fb8XjR8/cyjFNQHNHjdVC7aTrV1/u7TanXryeUW3zjoPEOoHc8E9RenwxCfDEpxgH3w+jELEKMEoHokGmqihxq5wKEvzdOp25oq+viweDxGeGoh3g3Zebuskd/n1XilEsfrTxsQN4tKH4M05zwODXF1E3FL5q99ToO1N0/fIDqyrt996bM84vKMIMGf7huRCQFz2mwBKrBC8SjviKpeGKwakFHNtyiz6/cYCTG7vLHx3M/kBc9J7oQ9zU22N6EQOHc/Xp5x1Ue+SabhT3Riwkp4odjX2FgimBuonotlRnIdYQMLkF+Paqnj1rzZm+TdGRzFgZm7XwannF3MuDWJVBRbvCK7PjlxD3SKMK8wszghrk37AkLxAUyiSmz1I6+Eb0fmrL2O2tIcad2nwnPXYuM8d6p+AO/7bNm4pLgLFWHjiYAmurCqzIomxT6xv08RfYAG+k1o5/RXO8uDRpSs/o4lcQYdy5H9YKxHX+jLTuTotnRIY6EOQca73r5jxvWocIiUS25MdXZZ9wRB5UWyWj59kXufMW5ELWb7mH2YwGj51WLPq+wfxpPvOuTJbZlbEDXudVLb9jak+QbXElHAAkfznMpOVtctH4u9ZBkexFVxvWmHlzOd8nxdA26WB2Buiatyjh9eZFLwWJyYLPSkRWgh+BrJcvJDBeoOQIAJqrsJmkq7YvBZyiBawuxABoP0fo8eD9VJJcg65HWZ37v4M2PBWgDriK12LEZLFnjA5AYigCUbYHuUmObU36AU8baARGo1P2b8USli0BG9jNrB3aMtlUPjVg/P7wjq47maHHgZ3pwBBs5IB89AxNJZ+9mwE482wegKUBUCCum3TaDsgHXb3WnqUM1eSqWx1wZ1uvmiV7FTxfDsVYdsqRoqCVHgVfs/zH/QMhwNfjLvPxsevaaMYc5W2mRR0tyOzBcEJFbyn91D74u1jvP+TD5scHixnXaaK0MYmt+ehlCA+um+kE3dkE32tQAdBdk/wJtFx6+BGFV6hgsfdlZPdOgWoQDAK4FH4rl3qfySzJJLRNVLzJo1QMOucIrl/RBGmgKeaWlfSIxrePTrZ2H8C05h2KO41JAm2ZfRQF9vB5n70+jWUUexmbhQeA6fSe5lQVYy7I7d2ZaW46a7lvuXADSAUkqHSrbfhoEDQjWYUZhCNdmbC3WNS8QVlQILvzyPu2OFZF0YQlwvBGn+qnIFBQR54bVMgU6F1kxsnLQ5YuzwwrKFR965V8SuvHEyFvvVGt6vqVg+dNp1rHD5r8uQ8gF4JyidN8bvXRRXhtO727+jmcW5nZiI83B4NtmKdLLi7zmkzzqkel+caqBSIaJXZQdrP/BpBzm/wEWY6o611iM5vDL147PrjsPYrrvaG6o2YpC3Z/dFKBJ9YHsx6n6t8lYYzT0/O5a4BcJcO1loGhNCbUmCBnVguW+L+bt2QwqJWGPT0p8z/YZVvaqG4dubvhjBI385yNMDyDXUGLXfVZ8XZsm9fW7xlHWhlnR4s02SqioMrsRdHyz9bVOy8sUKVV/UaQKp4wNV1nrqmd1eK6SnmsxHrdZudHF3v/4+r7tO7gdVjuH234ClV+hJPVkxnDXfmO43P7V0Jpqy2KJ0dqyWfwWLwwO/ARM6zmYHFHXJhalufgRTSH5z6C9Vzo4utAquU/cEiJua2pgVnALPRtjOATRwvDYQEQR1tZkBvWhZanddo6zka0BS6sa4pzOfC0QrayjVO0d7weFfj3zTrLeJpCxI2ounfN1D2RLPwS4A1eliNRwVy3rpgjBz2f7KPfScHwIvF1xbcpONv4JQuNKD7yHDQ+6yt3SVuNHsa1tiHucNOhNYCKGC7wb8JHgdxax3uR/r2vFNFS+oFNNdR8qj0t1PxYW5S+FLk2n31pqUA4D98MbyuysUCf1PeeodVvftb3kgLvlZx+fYJjSZ+VsyAWZOI+ZIXUJSl0kofznlMB/lp5R6dwc4CObLVqlYGRXtY8BsWaGMv6ka4JrEm8G6QE0NMt+ZMfEOp/PqOVQNeUpLCrcffLyguFAGF2QZGuLLpWEJYSQFjq1GuXy4uCSrIXu8ons99Eqk6Xhp0032IZ47PocPr1w4qUXuFa/iIJ3pdoZ+SdbpgUag949dYPAkjiTqlgmDUBYTe1OaiIrv3SmiElHR43CPassrD1YPFd4AouIRVB8kzVkCnKzkwpGZU1hqrzCktigPFU+NqreyJGVTWAEIwZrnJLPj6ADnz2ZCbSS+eylfxvBmur83i3qtd1ywQDpsE5THAqXHsEacbbKmke9Li41EKBiP58rk0YPASHGQvNdLeOWpz9e2Bknh5mrrrz5HgjcFOAt69mWj+JsLvGLI9rIwAYgwFgzMeUR7kUSjNYaEDS30pApAQm4t/+i8gQ0ROBBcrNlZzl2DdCxM28mIN9xC3A/t7M9vVFlnz32zhMLpqAdEhTTJyhqeOzfwfSctPSpjM4unNHlgCLBrugjctZY251eClULP5N2PhxlPleBrOvGe60E9L4MwmUYyh5kyBl7PQPcGSp+3oFl/uNq41afK1XPspQjeq4h8Q1ZoHrcas2hfedhgeVnn/cypsmIAMzhm44vvk+7PDURjjxDMyQmvhjdHmXGyXdr2Ojabg7RoyOWvhRdFiQ97mMj5O7Nl8UrdjseXtyx554kGvy8Z05u7+LB01mfaaODOPaqypo5dCU/lRD6Z50a+hUEYEUrFhrOzLXIJC2drBj98ssrhIZDGIpf/PDN2Bjmag3NSUeyyiRNZNJLRNnVnp4DZ57uXTG0IO1raZooiI+0tb3A+C8P4B4OJbzKqYWpITdKE5VAMYmFFxWoGwNLLbPwnH/bMPrZcnURSaT4rEq1fm4k1tdZFpax7WkJXUNcCmcgphgHKjLTkFpSAFRKsRUe8uhr47oNrAPNijhulDXq4ES0WkKTgYIkAAUkp5+soyvWnQ/slxNMaMABiR93SohuIroUiEL4leSowFbWgA8WaduS9WVXuFWiQOSau5eb0XwQhj0JsL3A/4fvYv3yvhGI7w5PEhkcid482ue61shorFU579yCLmXB2awVb/P/+Ui+i/ZkOtQdSWmUhVsdiZbMFFS//1VygmsJxtYkBTPG+LB8S5cJ5SuS2qRDcWSLSqK8N44e1IIzW4Qku6nxrQA07VO8UkASBX42sKncl12VT0SOBcCzAkEaGOm7UFTrU9dcaeeqLGJyIbh2YOh73cIGpIJdu8zJZVqDhpIxRQe+YhsybATWTS1+CsOPb/dnDxqk0NYE1XIho4wFvXTALhrUcvYWqtfPbC6bvs4puTbAyv7hY6zN0NUESFhEdznWeIZz7oGHfnY3W5rsF9cvd1xeKvoqvRqcnvLdneQR7bTwe8w0YMIBQOrwwoJooxBT3eenBfF8lhWQBJz3AN2mtT2Wow93Om+2TvuJoqg98oMTUYM0wn+8gnLgl5HvfzGCnfDZSWNXNPrucfbGCoJPhU7yz3AL23lmlC+gWNAHv+Ohl+CTzo+owY+o7iYr2Kkwsul8NJUIVIyu3TSwFhp0vl87t0ChagDZpzUoMY6sbXUdcTgjcKzapbpKAUY9ayblQ6FVrdirq6I4CvDCxohYE2K54rUxSYj2RGzyoQ3UmOL21dpMhRUB9WR2p2J8flLyx+nH/VW63WI06JC+nvB+3pYEm7YX+pELCd3ClhSko0FPClq6zl4VPkHwDazgP1utoXu8n0DwtmIahUp599rmP9lRIAvYm9tTJKtquwkIkW0qRCADa6mwbLCD3+3LBwqF3jbHqI8p8EvyPESEKUegrEL7N6+SpCRF379gdA/CDjkNZ9EB+ijoPed+W+FnWZDqy69SQNQlogrFXIKuuVFlVGQOdNGqJjiR47MOM0MN7iJbtX8CgS/YckMX3BP7q8Q4BeZ5+BuAnfxOoJPfHKH/vHIT/rSZi9ayHz2/HaBMGSPuQDrHNccg1reVb6LvQK8CZDH/ecHXhU8nNP7CU7DtOkppNRYx7A08GOSZqzq2MojhCZJqF3mNv/A4Tko331IEaro5ZLZ86j0KVvHnwOwOzdKChRJkAHl2B1qcyCN7BiYaCe4pacXcLeHuG8SuL3r101wBxeHFx9X25RT2zkaWLEIKJFpnUhaLGncbuv1U+VWMrOJFuGa5+l4IAkftE1T4XLWqdseoOfZrFqPZZzutB7ZXjL8yEBbKDrTymHm++EkL2JWrqfGBILcfqws9W5Vn0HKKMI2C6e2jvMWnD5gjV4zjxnwZPzlKBJceg6uPTCPQVfYS33O66aXuib83WWL+odWxQtWRblTGjcX78UUR2DCyiM3NNUx2iNeOvUTFQrEldQxyGkEYY7h0tqNDJATBIqAf3oWddJSFZqUKzdZ1q7EibBd1LhJJgw64Vs87K5cC/7J3Fm4vezAwp3AuWrKg7Ulw+0pBzMDZFJ8qAXYRws21EkrC5slhws7RQu7P/0OLPm334FMg/RjEkmEzKW7kmaOd812He4fVUi6dlHVsLWBmvazblxtYAX85LjNHZj/QCbYF8+vz0EiI0nA72/y91Xojni51E+8qO+uu54qT9zXFHtsh3EXVjomTAFl1vw1Yjm5ucCj+YunwUM+BGIKihgBQjBmBInIbkU+Oqh5dhsI4jVF4Iw9cv2l39Bd1GOdys/Nf69/UAs0WLshbnlFfP9gSjYtZR8GPJH6BqqMZSP1tHW0gYlXASbeB8eAx2peusr+76ytLzTOM1/iGRSBHIq2BPh26vLlP+N4uyTlMfD1zcr+bKsbcsSvZ7NBU9isXOOF1z5i72yonc+smn903ncSk4DBHf3vs0lpesmjB5/feanL6u2a0Ebd9hzPCOSjZGaQfWy2sD8bYjeNwdW9d9fW2dgUrLurF+naoj/ZPHIOQfDjp7G1XWgZuigBSfaq5NFVKiqZ431ISjizcSW1juY08/zjgJSWuPy88teCzyxTiDo0OtObcDqb1Vum0m3Guuf/1buUolFvy7+8uJIaAXmTX8gV2GBxzl06A4/byAvy49+0ImemXt6gU8mpWMjSFagP8NjMrc8cvMtopjRKa2zGvkUdSLIEHfsMD8n3O2AgW16EP7zwCC813Lf3GK93G5ULrTbZqrQv8XBQ+1VzSegJjba9SQuGRXvsPGmcqjbtF6qvSpRmvRFxg9kP9m0jejyo7Cn8pVyedpVufeXBfa1sbQ99I3sGph3NCT8XN2VxZlXPlSsGrJK2hJUL3TK/DixSmcb4P4SdDW3zet9k5KLKSeaxAfPvFnvCZl9yXYnfxTXc7Q6Lmz827tpu+vQ4Vb4nCksaW4bK14fAijGKUCmgq70zwKSyldZ4cN2IShqUTPqnQVYV9i+td+LGiECb9dNgJo8vJm3nnQGHgoMRjdOz5vezgzn3NacSXkcfo2mQKfSpBlHLe/fksZc5FWFpna54kWIlmMPNONSSXyl3Z9uMXpOrGA9OKlPQCBa9GU5bJEbLcEkN9heDO0d3RhAybIFncUy+wgJZaQvLR7f2sHL7l95Mc+y58zsFwvy7rA4yuHdvhImdjJchRa4QhksELD5E/DifNiUfmOluKPauB1IKFPvj3CbSeaxH8YWb3WE/t9HFdcNEk03VUwOjTSG6F31VZiBFosXvBHNH/Gw4rI3o0z/aBTDOgL2OrSTcFkMTCQ2x+F4gKxW7x0U2XHK627BnsQG7Z+44FsZD/HIvE0uGjeLWHuWz5idM+l0Ytk7L404dnkgtuQyg2Ex5Q+Vg5VKapDzzwO1VYk5dpEGO6YuiiGkkZhnpmL2yV6OMnTpVKxFdGzYYAHali6c51YfFTYDOYAKLn8CqTGBX9+Umwjz5crk3CsSj1kZaqW+5stQCsVfGPSTyn7Nh1elIdrFWMPK1SGjPwMhyzR/gJaJbJDCawUz1aUTReJ6sf1QNFEwJpZbB/aNM7wVzw8fd8BIY1HHJhP0VOj3T9/KPgnMz/YNrennw8DTJj2OnFO+ciBr8Hd4EikLJoWo3ZxTRupqEfwc/EABPg4/VFC6iuYlMEoFqbbb/6jBgHRJewGhbrwzFsQvWi05hNSWIjY9RYLQF3hzLviXVC/YFCFSfDkWdaHiVet8hinrFrFVGqBFrDCCQQlrawYvAhHApgDkqS/OTl2DD/KTnC1sr6ZmKQsGJ5kRNielG0xcwaS1DIFl05J0rP8upWkQqAIf9M7edhnNaBHEnTdCa2Sb/1+RaA5MLWR9pbdiLW058Afv/rQeeXoFysouWk951r3nz4vWRu/lpugjDX69K5Ozq+J6RZ6lhfD/QF5ew2TMzXvEIzG3K6cX4rjJl9DRNJPjHoqZgIz+GfVL0f731odHlPBCctDfe0q13xjgasQFmsFkJOd4HM1j8DDbrsVPpvofzCyNdquduf0jmF2SrkQx3pOfbv36B0Zgwm+SYttQb1Gohaf4g47NXyxNTNOtpYfEqDhbG/cZpYtcs2nsIJdnrq9sTFjfekrJdOYsoP3iiQCnd2VlZlNC345ji8pn96oAqahLyxFn7R2JPfssyRCV+/dp/vIdSvObKeDHUJnPt6DGc9vbQoj/MaVZ9W+QQNnaQcfr3xCJeJd1MsrXyiS5mHx4fvUczELAWh1Jnzq+EUY/4fSFkxDIh7s3HU4B6N0djwL+3d7c/PEfEP2prhDncygIcQVnmOOC1ZrcUdaagMr1rbf915I9J9DlhKTZn+IGvy6hwYituhiUsW8LjUfzd2nw+OkQSH7nN1f0ZQy0F27zgh66iGSjuLHaxHnAXAMN7wmRDzA1D0VLSrwbYr65xSogIj5bmUJVmjgFoesq1xWkGs9NaqnUr9PhEvWojQMz6LOyNZ8UC+3lhhOWSAaugnj0s2kItrWrBtWhxRC5LFK1pHP5WwSEVaizuhs4dJfbayG7AEQcDt2yOWMY+8F2VgvBNuRX0Ldxd6B9lOcoyCNlkat7E7gVvYlU2sfjNxqQ4IaGvDV0jDbZtpburvaMM6p7aQ4mLjmd/cbmMXVkYJxp6CO8F9Rvffk9J5wfTMaOGQAleo+uTRYoKxPAnacPnepN8I0jOVsA2nPvyZGV1wj1V7Tvcj5pvkl8fetMRrCMEteeYhBU5F7/rWzoDGSGBlpFhXeaq5aN3J5LL22OrUnKHSbjLDIZR1lnlgxfEUydGxMgyzxo/OAdNmajZhEk/Va7rae/67sF9fmnPQFcB88FXBXYwgVMl3h1Dd1/vLm3YHmXQeXu6fGxTUmhr8Kx4wEbQq/kPLbSKyk7CXGC73MOF9xDmrABSSHzzsfwsHhLPE1D11Ei2Oz4IUlnqmRPSh1PuKig6S4B4tX0quxFNGkCoW+coolVJ3mOog0XVwXRVWEu9v6ShlLI14dmoRAdWp2V26fgs4gR1UWdXfvQcPI4EmV/1+YlRWP9lFfvUWyGLfOHiev+zRY8Xf/lHMqoj+f/R9RZgTX7vH7AtCqKgdImEEpISAxSUBgmBMZASRyggCAORFgVROqVGqORGIzFKRDpGjgaVGjmkS+R9ng31+/u/73tdu7wm186es3Puc587Px+4YG/x5jngUYgfK7+7eTr9F8cgXhR65kVZ1TCHq1aZ8I2zLy6tQ/XzXngl9k2rnwxYpFhStTUgh0BzVafvLQzW3sS9Gkj9YmunhfK73yJA+bWfLr/3yRI30sup7cdjuSk3/xxOieJIYrpnoTsZPpSMAF48fEmtm0gP1OnYm3hU9YMw5te5DrQlMA8ya4+abm32aSX/m/j1DGXxyOE9TsefcwbJlhe32NUdLT4iWjJ1hzIRbjyJkh32wH+1hnIf2nr84O/fuowSXJUJMHASve5mlx9Rf/sj3BA+EUnELi5Swq/eF3dUBT7+OI/RVuJHToQR5c0uHJ0hxR3AE5NVXWqInH3uWOPCH6SBzFMOT8FyFWpaFmKnS+ym3O+YBBniWZNUP2wsCI7IvrDbs+67aXziur0FXqo0pvzNAPVxWi4lARUK43D6rGvCTx15EiGx9OWFSWnUthcn4hLNzDMn9othuuofELva+dZ4myf5uJFuk0R3L4uS3lXZ8XWu1/ebTxFW8tiO5/RRGBfND+jfa7hz3ULeVsKLIb2/8Cg6aC2ma0LoEYvGk36Br0MZDop6KmZN3hDrEdEuYjNukJpUUqtUUhug1Ihv0FlFnn6dzSdTpoRsklTni8XpsLe8Tn8Q0Hj3emPql5Pm1qXUqD7Tq28HSJ9GLwdgxcouSx+O9pjVavhiVbtoK2ljUlk+MGSYSGGdWHPx3iQ7E1PBnHGRqo1DVL1toqZlIvbm+IbJLvi3Ob3SudH9jG/Cp5OwXl6zTeLvo0Ztk0pOOvbHb/LYJ/1c6J4zdpdtpiskNYXGeEnFFvdipnqzF3sxFUG72a7nGD25NT+3s9xqMe9zX3Qpyu14XaxFUFn/2Z/e8it03Vlgl7N0CwTyCiDuPkQ2Sf1WUuut41sfEYzANbQGPC6lZOjp5pw0tdhlc+EppPfs2fNaOh5JnKYLzsCNMGn+WD0UejFDH1SUSTp7hb672/1bWXCGhdwQ1+ZcBed5+QXuKXZhis7BD90KOUv+xZLfXl1z7LnH+QEhFX5B2UYwtJ5eX9Wjj1PTy2ve2p9UhMnxcv30n+sOBc1drKhlxrzCDMtKJpInUpQE7P9qZWwHzIuIYeJ9HodAtbeInp75c6X77updVYE4ifTzDQHOCInG5VEk4pvPUPtRi0SIhCE6FlN7EhE0nGCksHVDZu8YzdU2IjXUm+8zxyx7jd4a0UtxhoW7V+T2svC5k4+SO5SwOLaXO3wrzsLoFDGPI9XHVZaqI2aTuR00GzBOJrj1mQOm/qtgxsKznh1rxMSBrSLXQ/LRbXkyParDnao1ZHY9U3GcCxv0xQEfKanj4QhGgPF6SN4BqIbj78+qxqk9epgrMuc3RGY6yg8SeGCiY0s/zBpwybWGxsOSXQ4DCo1/LLSbKhPI3d2+AbkFhrI8m0DgYgRsCCrlRoiEkucOAvUbmizxEzQPMqHG0A3ADNn3uMy2vLvGTGQEAxZboQm0ICaaNRzB8hFlpK4hEqGK1C1Yr6p/JemU3wDd8aZtYvxcaThhsX+KiJpNIrjFZt9PXKetd8nkmCSNPeHoWzGnFXd5EiwcGwnDnel0vfH5aCrgCxx/1Ap97y3eZFPDEQvBGJKIwQBzLxS0Bw/L98iIlXyV7S2oczOgw0j0AdJ3h5hBxrsZi2lykGosDTTyqiyw2SJXYf7Iv/blRvpnysBojteULR/OjT+vgFs6YKt/6vvvDjGhgcHjaSlEzHab5RDgt/5LZqr42CxzrjcpM09UibGwbCNaCcfuxtULyUxyMSbxog87HHf6W8oQqszZ1ZLUcAPLh3ka+Rdy61ug7D8Gh4m0rSQ6bmp8X+xvP656Ko/rhJXYpItypQin5fT5EsqsYHLjC2VZueWKweYujr6BE7QS9WD+NYg8+pwL12hdF3sKz8Bc6PRum8H3196q5co0+01+x6fGpxgoHLBzfD9L2qqyqiUcrrZHo5NYw1a5YdAzZeVz1xXIxpFq0qZ8tTFXOtv2EtgH5mqwld55jMP0i0M1u6iHvxfb+H4nXJ4OfSmIjxTU8TDjrAhoidV1zLQFRHP6gGmesJGyJuXMxva2sR8EN0t8W/emmlYfumNIr74Vuv2cLeWy6cWPILxZtRA1i+AZBC/h6U0S+YTfCXK94R/3ibht14IHbc2hISn+hRbLhBih7EcR5tihrfEHapylEkqAEwDXxFmq7oTxRJByQ0IzfUvyPkpHecCWSNRxxBWtsAebK0/vBk513c1Pd9bJsfmV066+ychkCKbx4dXulleCI4aZOIQrrnXb4MqH/3UOZKh2Z9sFA17fkhwDWOTEAPnUaysN1bfcNowfmBeTdJK4HY+oSCG3TNtsVQkWOPWvgP9OJNirBthhP47DATtMEQ4i9sGhL1JC3GIA7/mmnzB+nUVdSMnGIbh+9qHQjJ74IfHxrq7YRkVPRpFw6WvWlioKOFi2rQwHZ77QZ4AbtYbzt4OJBa0S27kfoxqx0dpKdvlgX6CWSOZ8kbsURoBc6x+sbI/rSC7ZbMSokfa7hG5BqS9RYGfpN7M0LGr0ljRcY5wl50vEmSOGM8bOSnbLpBZpVNv8CALyJ5gIoflsauviOdme2PJYiVBSnPJ50etIEeN9H/0y5Mk877Q1TFaOjNFg/9CVxjdq0iW/yfTaixtAjOg337HUMat2jrMRN3TdQHbaxzbGo9M5sKlIa1noE7Y1inDpBXGIxCkBKTjCw5pT6eor0cyHybltCdhfPi65sLBiIhJvJ22ZI+1LRespSizqOzBj6Hjs7+cDO/RuM0jaURVRUrtFHCNMWmP6Bols+QCMij8GNx7P0xOcSewNTM+BiSRYQZ1SYgoFwHwKweN/ei6m+UnwJ5d1GYvas5FENDj3E0FEYLUWL/3Giir4O5H8dm+kekqy0eC44SMVwgWZDmTrY1IVnY5asVzDDQ7Xc5trk0yPG3s5DJxBxmnpnMf6YltDDORroYbYqVKFhL+ASrrJkJg1EnbMS2cytxk9rKgTkzUoJMTfOQ/8zsdgdTnMWhabHvO7bhNb9X6qPdupX+to3jqsaq79QGI6Xrcw1ZSq6+NPyTWrCbWD7PgVk/MJ1lDXlKRCSR8n7oHXMgisd+xx9QukWrG/qRsq9iliySHf7Sl0qhBk9dcb2oshzMMMYpFq6NY9/pBpt6YchbXI3SbMzwamP0WLRcRMn0uYTjJY8igftgtx5pKKBsnGiBFG99sx0B/AOoFVeyJD9nLJEGvda6vBg+Ngy+afgkkwxEd7jWnR/dxMtnIFO+Xj8dDK/Fx0g7mFu2cKcuzbOLby8udwaN/5+GO/xZxuSVDaTdpdgCtMb+4rp7XG3x06EC6ftmNmouozzPAck5RcV0leOxAFxCrjt8/pAKtGCb7sYt6q8276TwqlluPCtgIILxUORUsqddqQAobd3fxl8orCXoqc6qVoZl2Fo8IgsHR1jAoJbj9yeJeLRd/hb/pN36V91CyKX8xFH4gXVBd3aTeLZjolE+s9Ky06ix3TXwWCkAcfvSn3b3WKd8wKUK/aiRfv8TuYQ92Blb+1rC5oLfLm6b/jRNpcYpaTvRPZ6qZkPwnKpKREpLyoIBI65/WscRdYNVFMyvd2iNdljg6VpZgIItQfpONPUB4UZwKj7dApBhbWLx+KMq3coXlhxaiqzlaDZNd2HW4TPxF85L/OI+zh6e9JOQjcbzEE9O6hNJt0LMZAfb31Z6CePFE4qmgI3kxCpKBa1OEaBMGbSawQbxQ6ZU06PfOFplqiycDzRJ1ii03VHidAiYFYcK6GOl/jEd0MhdWi1CxCwFA8caiS33fg7FhPiR8yObMgAZl4RpQJ0q/zgU3WbmLvyBd9v+0y04efVFZixRFHVqjf53hg76xG53Fw89q6shVbn9W4iknG6IqBaKSHvVIUkccu/7u6wVWC2FG5OMRmcuPtJS//Zy8FM4sEnXrpwqo3p6PPiwUDgll/InjF+TTgyCYamgePqsOXfYaOHLVgurx7b1CEtrxg16Cvf/BKRZC5PsVh/eYCGfvXY9PyJo0gjXa7biMY65poG5xIToxg9shv/RUHfzEaF9vjW1x2o9+/sASEsm/422vIwk5skwVG9gE6fuxLkTBIcVWIAoHso12bK5ziM8Ph2J0gq+MjfGuvI4kdXWDMOhZ465kTYTHV9XHFVCGPbmAndGY+wlJryRmHPiza/X2peGTqI+C1+eRDTRgLQbwoIWLfOVg/q6xCLMM16bHYo3kLBsvVOVxLes8AY6eAsSa/L+nqWzXfwC8mSb/6PweY9HbAoE30OBa0faynurDPq+8lQTuArar7xZPBb/0D2Cmm5loQIUGEYeCKrF8bCR9hLJ2zI5s/ZJRLI+9SDzgW5Ne6bpYO7fZ619gKDM15xN6B2VYBSy0Am/7u/5lsy4N8ZcZO109EKq4VqDXUGTgvIj5neWzB5qFq+1LwuIWP1qjc+DPZWGCynjmFFOzA+kaxujX2srTj4DR3CDrfWPStoc+A4eLLcS5z++HG6Av4xk+e90pSDjSJuFbqf2FGQsOjIdNgWjWvkBL8wXNKZ4MjKu7PpQczootAkHs3ZU/PWdeOK23INVdfCrt8/ht9EmPprIZ/voCgo3OIcGCYyN4BfINb6R1GyKdil82VWI0Lcvd1BmBWsp9l9LDHYq0a/Z8kXf+wR9/Dr909NPG62CWHgwgzQusKiSoxhIDwBM6l5egk78QQzmFl3HiTwvGpHnfDr9nCT+em5/yX0t1qSUsMrPbNYNUEXUNGjG2Bx9LTcxRgUUQbiAiyQns6Rr9hy5CRb51qbVIjg88iAWFe6XjPw3pc0+lfXTfxLcGJ21ZUcnIn9B3YZbCxjSpGVXdiDVLD4tgcVnNAPAk+a/IRdUAygTUnNlsBa058G3vDEHmbtFujXLnWIv99ZHJp+Azy4OwGICFV7AfTgGNvBiud6cCJqCXLHDCMqHPDbUW4+p1Eght7Bc3zsntH9jx72QTRYq02yyIV/Rd5P51dK9bWX775VOyyiLzcNcg4oYRg1rS5uW025v4Jb1CKNwZeRXi9EtpFyNb68bi2ZMQQK4Ri5BYL+o7sCJzh26SRSXj2sU1k0JyKnWC0wungOyxtd5I8PGc1b/Z0Yzj7svlvPP3A0ovW3ZBGLS30hFo4E3gwYnzoYFkPy9xvX40nqXlPO4nyudkJRiiUsXJJveOSigVenFIxXKc07T1VnHnVgRFN0IfQTeu3/AcecbbGU6fuOEnRRUUNjvO9paSvlnpXLQUb+BZUw3c0HInlyte0zMf6m70PvVc8JO9hU9p6UGxIoFqXG2j2S+fDxCfLlA6ofDAKY2RpY0wCXuqMSa2MSXw3i/LkXippRp4otpuquNm9vRO7zyCnPx+mtl7xhe/28VhqZ3Oj4qDnT8QfdNt9b80RtDpO136KN+Gc8TbDvKSN8G15j8n9qPkS8XOhczstSf6sM4x0bnVf+TARyQuDplcO0EZacyDIvPr6TJECPlIhE/i3rlM7jJ2xWiUotWtk5bdMjEElmfXbUZvZZjGBpJ98kCTyZeVdzpIBtQ+Tc8V5m5WAUYWDtlR8HP+IkRy/v4E0btr1cSnK3np0qlU210BseqKLI17Q1tQEuM/Wa4Yb3scTAhjR1/2KhQmizs1NTcrLjQJwLNe/Bu0KXkO1r4esFUMLLwrlhrSB/+Lf17w+2QjcGZVzgvC+qKeOnRM4gydcyJAdb/mQkNG7cdeS1Im9N/Qm0RucTuDX/DisAavTcNX+3o7pdPDy4UVCJGosPLMRKG9ufVZJbWVCScUwmyR6kvuO66dTLbGpKVgul7TNeWAm0XaaJDpiEgnc6zSuvgj5FM5vEfYyYz9+Ub4QxTeypBrCPI5au9SYa7OEWzIVYQ/p3AiPdfB6+sr2KNCOQiHyHqoky7FgQqSSCU+JoVkcZa1hksNFvdN1H+r//4asv/yRcPZ96KgSi5ZreQ4WQzePqpdFr3m9aGqyNkiSPKSru6kxj2ydb9ZwAYEBXbDQTkslPyknJhdgiqTEU9HvHKztwbycQYZkZqe/O24i6s/T+gZMzNTqRPyJpHMvZb4UqDiirvghEfbB2/fTJDdMYxrcN2YnftZyuI6dSrq8mlW5bxlwMnypwLNVJ4/VxZd8hraEmBGizqWN8w1UHJ14jQFBlhHE9xY5c2Crjffp6OJaIj/tkk87JtHhgh52Z1fkaQuz0UgiMPlzELoPOGceXcPp0YkMzAV2YkUkdxvN+3xXYioI19nfxnLGZ2rqljaiRNlRHM/EYKnpHkiinJZQ/qB8JR4xv5A3wiZ02K+3q1s8vduZMXE6kg64DeTT5l+6VCSuMB1p/fWh8VzqBKoU8KHPvaDGu3zpwHAC684MrAQ1Xs8kJmeInRTVuXOBLmt97oDGnAOb2EKsb+HdLJZ8tzHWwXgl/6z9f6MNFbxu4/J/amOw2WxjVk16qnaTIZnS+pszo+QO0JKUarfHB9vlG4H4hAZhXSmwDNkD3LNxZCDXlwrUXMfBVp7Zx8DsnsKtRMLDr8yYEEgy4XffdksvvW46QrAd2u0tjo/xUnzXwjyDVJ9RARGNkrkRmpaIqQwI6wJZNxKOczTUriUNfDSEBMd0AGP8vRQpF9TwkRAdDwRnRWYLUneIGeQFl7pz4y+j93X+JFS/RaDSfIRHzXlnNx2uvSHkwAaNCL/Wn0c5aoA5FlLIKu1cdCKCRv6dHHBk3ApiRZO9z17tqGUAMwYUmT0oTVl1uDDI/FtfrzA3WlkzpeNxlXzEiPxcy/p6WDe2it/riPmTuv4MMdaFA5zUsTDJTKeTmoDvxcWEOppMeAAt9VNGIjhsG0b3BY2uvrBbmOKGGcwci22/bmdrTzWGC3fwRRmHH+VBkJKOtzNyRGKvoeP5RmhjO0BeoQTyUXIENJMNQcA+rOGAYVvqmGaQQSQIqBfAry/Bvtth+hd8K2JRiuMoE24CRpJSrQOdM1UZPp6j1ZfLpUk5uG4T4McHcm1X5DzGHki0v1uQbXJJo/YE3FQZRZtS48zKeDus4Lw/BgUOzRJEiFxnx/95Yh6wRQ24FuLQsnG9y2KUM+p41EId+wKS6RVWUS11woiBdgv5dTcNnbC/iCXfm3/Bz/gdi5kNHRxneTtAQLYSmjVcwRPtioUOpDO+lHaajRrFNUsD+sObvK9V5OkkrbYrIF5jbo/NIqa7j7hiFV3rNwlgunEcEjNGpLpVeENAovPa1i4Rmp+MgjySBCTTZA4BZS9buTZRc6Uth/LfqCjpzCIio6uLn15QACugRZ6cc3kPwZRFeGnu2DMWhTGfygowxEEbvPWbimr2DFnI1O/+N4tN0luhF3AQ/SBbNwNA12n0rzgrr0kfwSI9Ilyg5Sm4woqUiA2junAXrKJLPahfa9Ow2TlExksWQN8trqxwaYke8mReJ6W9vnXOVzXnUzarkf9Nt+Vxu2jiUEYzPJeekTTzlGxhvXPrwIYQfpR+tQR4a5alSIj4um2Hb8v/bJdxpKgjWjBerNX4eyTG/0nH9YfBaD/0kwK5hthZWol2MO6VSK53g678gYD25kuzt0aDto7QGjZdQpvtLzWI4WV5JGKO/AdtKR3+nH+00dL696bq6AYNR3ZQSXyKLboiEyaGeJKUTIdieSlyXuJXG/U0unWrGJK/0oZ0vvRXAPNslCOcNBu2vK/bJ6wd4B6XcreBMQtHvJsjE4I1RwQ2cyEOlMLh45KJayEvRa76n2uHHEohRwaLPyTTxv9KW4B7O3G8xsyxmGfJML8QyJ86gZXOmZ5bL37XMP0ZtTKM1AWsJppa4plXOrGjNYXUrUnLOtkKXMWYj+hIo0xpA3H8D9M4dN2+HRa91wrJVvmb8ibYtEIyJ7BrRPGFJX01Tu3Brk2Iz1QBEo+hm0E9kE2EQ78dN5ypunTg9K/1WnM6nYv4OL9whOZOOAceySRfQ8ur2ZDOVYgfkaO7BshrA6gOtzfpPGqQQRNvlhoi6L/ydiJkgIPmvz2RIXnwbTvyy+43R65NN8UsuMesLuwBSLgqKvZyVaGRugEs4ajkHekkVJXmN5u+9YHQjVGNVIInVRWv90zZvgK8Op9IBwhAH7alfmUZkU+xsPiZNTlHGTsG2aozgS5au/IvpFxRv/L9Ht7YWdluGey3/p/DhuuPyZH/HjraCN65i1hMdeXy58WPR4q8oh0Em47Hjl63WwC10XcB7e6xideVgOGe1tH2AhfXplvYd10ADSzrfc/cB46PMhwuxPN9RtvIzjBddu1/YlrsNm30vec8O9jofpzbGliT6UAQ0ex1OnBbQfp37SmvwW1nI+6mienm9RYzePX36do7wkRvpmQXA/oFW5WVX6mRXPsnXFA/a+H6o0LR5gl1XYPi9ERG8YXbPZmtvhspk1I9ro/5NU8lqke51IyotrX430TDLKFZKTFuYmatVS/3noGcCjClD5VxYJOwGKlJuD67u7DTYT/dcCoeMen4qR0SY63ilI8DKVLx057Za9SEkcOUM+vg/z2z4Yxk8803z286AV5Xx/KRuxEgGX1xntpGsVQ+Hn1c5C38g7MACnim8ofKBGLCOXEeeKSCSyiO/IfIxzsko+gwXx0DaBedGo5YqWy91P82tv9nFLRz2pHcZUp8/nnFR0sXbLU2rGTXMIluHeerfUqSDgcCnADi8Mck6gcMtyYnBjn7j6HAzujjR8ldoKgUnNtNs3mLYbl+SKy3spW5h8t7dgyusMiZt4a/rDwbUPbQ476BfOpgt+vTM9NHOsukfNzOd0o5PcocoN4NR1PvL7YvbDvR8kriP4iCQbOKMJ4xJMo5ytqhOmdNgxg7u21/R+84WPBGxIm2Elz8woCJxbL6DPEctYBubZv22s7pudGWT9mZG1kH0Xuty5DrIa/QSSABhXRnePrsKL7Mm7mG1cGXKYpp4J1voIOK2aitK3SBbW3pyzlfwqPpxFgn3yDC4ChwW1DSr173ayMMDjuDxoszSB3c7ke8L6zEVPN6WbAOvmrltSFGcjOtykuXkWM74vKYhR3X6SREN0thtTT1GG4Km70YOvpvuAZHOUeZI0hXXAmol0pUfyfBoMd1qingt+bNGUDtSz/0cAUjhf/OXAVgrjY/IXedEic8r/hq6YqtfgqD7g0lxW5Oa9Ief/rnsLmKgSybHBJjYMB4DEJnFmFk8q18zapIGm9aji4CbkLbPSd8zPZXiAkBZ11PVwLDL3G6aHrh1OGd32CwtjYaB9TawTmuL7udPJJcLEYjbybn7DPGydjbTsosgpZaIGCp5S+qI2VCI5z/GGpaUZKZD6//y0MxUhRzYUIkkwkEC0ds9QUY154hYPVwYSW0Wf87xKYoGsLMQKykobr9LgTalXvAHE3z8EJTv/jE84pDy/As8Dz9DRZMvapyhCN2Tu4hirOETvnDJJejJu55M/Q2yTYE1O8bBG/NFydHJsfxu7SAFDqCqrDw07L9O0m3BDnkYTaHRfAt8DGyGuJUodOgHfq7teFJvZuoIRLh4SjrM6Ry1IKJR1YHF11ee9IxaDjQqF7d0Tcw30+QVKnfWS6382ZAj6FceGJU8Yye+01P805X30sTstBfbBcpwz2ioFSkVjgPDmElqP6dkk7mDw3uDxx7jd6Ez/tufJ5U66nko9uSGVSPD0AzqKvV3dfPs5IaLT+qZ0KzZO1iOiR766tDx8Ff14MMYfnmHa6wJBtU+llYjPur5Jy2cOeprqs80TZ7tkmAs8OS+Bi8yYeAm7xA0KXITx44dIejVf7XcaGIh/2vs2MBODsVNX0tHSdd/rhkWlFSmUVEam0Xv/UEm1ntJ0O7idq0ZcL47gmmgOSEuat+mtHQHEDdKZq1VmjYiwNz9a7zNPewHtd2mtHjryXFxHN4B3xKhwxeCAL25+NLa2mn9yoWBF//oMKPBlmgbYALUX1X5CrsjQXi8HJT5o9HoIo0MpZ5p/otNRC/P7cYp+qcrLli1+4mSjK5D0uxotxY/1z6z59gs8uNMAK2pBsbqrpVxRZ4mmSnEyyIqcSN3SEk3YYlVv0n22ExYQWaB48MFDu0OePJ9VBf/nvPDwKWJkoQ8f7UIeDJRAkkc3XYj1RbZqwvBTOJFaE1BAyhdWgvhOZbe8F9j5qLyQPXlh18BmUxl3O/ym4o+/3eSC7/nleYVMnd2NwaOcsmbOw0kFtSeQuwi13fquOMEbNRxvMHU+olRt99OCTsj7rAcPs8y+Pf6mhr8dtKsz55ghfpxgoxgOaAW1jKff8f3bGbZWzW1mjyiLsCVBykm9rHc15CmWMZGUR4szQWQc/BNHpooOZw+LkLbGS5C/gv+jQlhwkf4KPj76tbmiDoU02bbYehQ8D1U+LlItdI/df688U9VZH+KwFZ2ML1JXcvnsQc8o5BlhcMvaQSz+XOec+LqX0bSwVWf2xU9wf/ERxg2C7rWR6WiMNrxG31DvH22Qeep+itWFpH2O84vHwINoBtW03JEbvBJnb5j715YPvLWrcmLwDi8IRiJ0EwaRVmwx7O3Jh5USEqbx4w/gRX25A0z5YdDisA199wITTTB2Z3izIgB2YulAjNIbTNBeVFt6xY4WTCeLkPPcJ+GwZYnYBxFGI2kZPn4YMgNPmwpBVWSzpcAzTCUrpzFQ8gDm/J9QbV58hmI0pf9dSO8LgU9fkSHfzd/Rxs0C+dqy48/dcObet1E/CuLU3eA2vKzFicAOvv8QIGk/S3oOxwjVqUWPsgpFtz5X6SbolSxMkTrM6kH1r3CsvD5tQeiw1hN+vN0J0rg1aKYags6jwP2qzOXh65203Hr2byPbLC/wnu+kOKnEtXoAwnePPu0Ur0gVY1mjw6n1dtDDA3H2fMtLlUvNph0V6z/N7IkjqDeibLPVZJtx2mVV35H5szTlC+/NPOaKxYhz+ZyJSY2WuyGO7NeRsEYCGTfLRhbcA6NgkQudppEIf4dwAm5p1M+m/gD5iSncHihp55J3MmR1a+IGBIOe9o50RVhaCjiMdtJOIeM7Ci1Dcf8EwjA0uAIwauKW5iwazJ3+8bbCnZoc/tE2NtHi7vKruVOriudcC6ovcC+aPI/6yRsNJdwiUZ/H+Ni/mOa048z7tAaBiRulf/rIwiwOHJ8wlcbNiuPKz1YxGyTNI1ZMFkg064Ht5g9KjRzW9Z5B31OcQdGQM0ZG1+YmPbiuv/W2hDyOamk7vSA9nFqHpClwBvbl1XkuF2e9xUV/vz9fnWotbNYrH8pbYE2MQyNn0s338p102+JUHXzVLV/v5koXCwyA7ckiGrvIgzgLWl/AFqao6qvWbqKLbZZH6vX9samp+S5HbPDFvRsdASiE88zNh8jFrV/rLWkV2VwXmY4QUheNyUAOuyYUvqW7fdk7PWxfH6+a2oSFm+NaeDlR0eFwoSYSofYIOBCN7JzC0alsA6TSA6QAPzpqEkwl4m/B2wZwvZaDGKLv2xJrNnGkeG8t56WzpmkxvrlBXkViiu155y8Q2cJwoSC3s2uYG7LWKL2STS7X1Gc1fwt6Mx9r5Mri8sxpSh8005x6fmLarJ//iU67WAe0iK2S2Q3UuCz+1tVOCZXMbvkjYFDZh+t80uZowaa+MPCyLP2/2P90prW45bC5Fy4CYdExywKamCLjrb8kmHu3izQPV/dnHXu5qwo5QkEYWDbN0xwc0Dt2RXrJThm9tJiF3qrs/nbBywIzv9ZkOoGEsyWCxX5bGNCc2ZtBe7nc0hIvP3bfX8L9zfq1lQpredLpJ01jV1rJvs3DMwiqvmxtT9WMGP7uEHK7tPP6D5aZ1iOj1Qq2q3zdnkwbr53M4hTMFaEYyC02EedGIsOrPtwpgreNSPD07OEeCleGMvUW3BnzjTmJ/WHjlr0s/OIQfc2LDpdpwbC7qRu9/Q6BNSxglKSRVD+XKX6VpW3t0ZJ1HrViHmN6nGfTHlGuNuotumbXgt5OXl5vfx3mrZBYA7Xmcw5XrAmlJWcyZPT7kCQpfiWV/aSPZfUM07xPoEgluW4ai/eUujlaiXmE0OaqtY+N322GcR7ijJYEimK2fGXR0jc2AK/zDa3wc8ujmMbK1rfi/fQ8ENdtQZgiCSYU9o9Ev2DeMcjkQLxZexBzM3nXJ/bocOkNvCb4q/0xv4aX6TulzytBSMjk+RYkYR33MRzIsAKxGmpQKshIWJnpYn7KqwoJTE6zujXr8tr54Mj5ncTV+eFngqK+IQ26G4ZCeQKs0YeV1beIi2iQlFRCKwUL3ZCXaLU7L0dLZEl7vUfGywA/s1HXXh0CK24qXehd0KmNSrfI+TjUg0HVUKW4k2kdLMVZgHwcv3jyAFTHm3wI8fNpsQyboB14F814l77QgSkhlzNDpimJejy+RuK0iv+6exCvho3vt3p08T2XZbQaT6KHQhb3dnY1WoIDwJw9eG3Htn7CesU14Q5hMRgXL5fawioIU+8TEvEyJPYDzFkQdlzDSj5nDdiNPVMPpRQfOa18bQFQiIdd3A29FJW+2d7zsrDTd0Jsh/26UIqQfRT+iiiEWSwKtOx9LE08yov7lfIGS19oVS8vKzIiWngQe5+FCbHMb9nG7ynabMmskLvdbfp44eCUp7au5w8MHocbMSiKjXnb1X5g2zgY69L8kXTFIrcFrZjFTKvLXUEVRynPY+k3rDQmPAXYelBSO6ZyU/KUYfaSTpb3g/a6X+3FSODLwu6UKY5GgvqPdOn1++docXcPzSTs0b+ciT6bR0BFwBVKC5lMv85j7XzZdygGd24zhCZuxLDetuMZ8QHgz9NaR0FPYtN1tqJg8L4ZE1FaGArPNpxsgxvw21TsnJPib0YLk0kxxhB4aJKSN0OrOHVSMzz7QDivtG93uwm9ErzbIjHGZfx1y4cGo2PcDKiGbV2jpnU7m500PWeOBVF8Z1v1RKhWOTT4OgKcnRtdLHH32Sl5vpEOqOMscEWZSiEyD8cDZstOUC4A236dI2AidnpcVTTB/6aygudjfGclVS6R0kVu0UKP1EINktCS8GKsghTBEZgteb30Ix/L3peXGHpvqv9MI3emEcdfY+Q6pHLaR54CjLwJMCZEZ9+QUFKob19Fqqs2qFcl6z5FRcdubyg1L9R+er4Z29eukG9e7X8u1hgdcpWHrwctODgLIGFopeEO7L9CpnAvVa1mo4xN9bOe9u1Gkny/vfIyVLS0GnxV+PvNv7U5GfpLh4w4rB6TcTzHu/dmi/CClT3lxtcUwCnHRm0JgvR011ThgQXIO4sK7Q/wmHhzm4VcgzF4IuzwuJ/QfUOljMeQ+GczMg2cCsXOuKcwAfQsRbBYI3jUPP79uFcnkrCyCq6w0R6YgWwAGCAA5QPGIery5wduYNGKg9poDAevVp/ZTRQgkp20chwJQGcfBLYDDUCxhcdKrRYs5YRNnGAawZnEEGakEegn0xL9x9uoovpBnXpY38VKJgUdOCJC8/4tL8xTFN9BK3AS9xnS1lsuMC3zRSfUJlqQGMqjtqNmQSZy8ldwk/uBd29jXEKTEYhK1oAHS7MW7G2tG0NlbSLfXy5H8HjXmvewnF8bcAMwYsAkiTZzNg1AhPDXiFBCTplqX8pF6YEJKrDsb5WwLfgOD/riwr+9ni5Mn/qR2UhFGD7RMnZtkrlBh103VLq48+qe9i85o85bfieRq9RdfK5CoElZJYR5ehujrHDRpdp1ol49N+dIAwLONMb0NjqyA0sKv1GRKsTEfHb32Vx2I62ZYk+wDpnvJ+DQFD9efV4ziuur6QQjPuLwb7e4JMATP+ovhIUR2w8MXUiTaLzeS6+TtOItzBBUAhyiZwaf8jCpi2QNin2G19tks8UvTkotdnx7d/qgidtV6VK3A5BjFNgM1ADVzzykED1GXl/PZJhAf3jL+bvkHr7Mc5uubj+SY9RzifqjIbjYAlooArjmJRw6Bay12gusgDh+c0D/atzZQVw1suEdkdLt6zHJUa67BwtMvA0E2gdGSD1pxq6lVPh/+t9zwfKZlZ9K9VBWV2cIlyovlJPQhkTPLON4B9nlFH2mn/dbHHejkFtMN+Bs5VoHgEfuWTZZ+c3u10ZDm/f9L+DRiAu/EK2HB7bpLx2AcYjwmCjkWXX0oeVsRWZKoidSGHxaXNb+SRut/MdhsfvOEoowJTCf8Z5uPprX7umON/Iwrzlo/ia1eCOSQawBWuh0xzUDpiQ6is51iy3OXfthtBz/NTToqOo3g3aqt5dwA/YqsNuZyQKmzozU2UlGDHGMtn1Yx0H2IgDD5xcFtix9lqigqIyIKPhGQuSutdDh28bQydBwQVGyvJIxLhdPj8YPNzE8dixo2L8mwCyQ9syZWyyEfl6fpUpJxmdQ0MVtdnuxIJ7bcZMer3zxcAim/O+nHOFMiCYe53Ax95Q8fjMSAhCVeTKvZnXYsujxzCutkh5q2+CVFaTgE2/im+i2AT/CftmVGV+zSw9F1D5MAal6Y97xuEwFsOMCbikVAPcektO1XHVDgX0qR0hOFpWoLuRoQNxuwH2Amf+SMkU9pgc2Z0fGQAtAlb4OgqVeU2o+8vyxSfVF//4MFYdZL3yXVBOxDB5cicppt6n7yPOKrquoAHGMtepy2nG0dpy86MxMLWpjVKr37/czQIj1dnovernk6PVGTNdRyILcbnHCy2lQ8x7X8PyX1SteIsEVUN2aozws1ZO5i2x0oYOn1NRMyNtZLv0WS+NXJINVZwFXu79vTeoV4Lf6o5NDL7PYR+V3R8u/nsg6TlBxtWlvHaC0fpygEx1QTE9CEgpktHHUmwOy0vvjD5AnOgvdZ22uIwHIShbI/W3DHSNw8dtcyD+bYxd7p+2hZfw2mCkYT33uJ4nGf8mkaUIJ5wXwdn9I5u01ag6r0T1Zh/moAfOgXv7f2VrI8UEJ0VuNAHgX4+da3lmMuUgEsnnXZQlIv7qV62JgVsYfwMqCoP7LCuJ1lTdtfamiF/ogzkLUhdtg1pxs7jpw/ziMAfaG5zM5FyYqIGIsQr9SNwpYYDVyrWVaPmv7k0M9ld+RlSwjU0vB2yce/b3K6nw2EO8kGFi28wh79SozQq/cUe6ti+XTDUU5kfLsLCPoDsLfOFRwL38l1WvudVVLNPW2KBL5OarKPDzAWRFiZCE6emLbntZJ/W7N4MgQ7wbbKHjnLZjzHP56LWiyUEp9sS767+nBkth+dR1jJlmzlI9V1QfkiBVkDvt8jhoC3PjtS72Ta0/BxQZjwOk+2+qivg3LipcMQ50oO2QAYQdIvhXXebmeIoRUX9IW/auRKvc/7OVFeS0IIf7291iajaOUTWz1oIgexkMoEPRJyKWl+q4udPi3jM5i0EqOJZU2RXA8/cjRyJm5rrbin7KX9Sq2NRw/vAUutk+FL2r+2vgk9bpupKuemEpea4LwIOOJ0Ed6+LnYLKTmz5p40qyXVVpYx3SBDABRNvw2rCnMBgJs6xs2Vi+Uv44AhGDCPMd3CMLrcQUy0GuF9f7qd+EHPqBZGNRcr0M/wpcQNkrcYm8bTlP8ko+sK87x1rX+kRkoF/1evAedcOMUucq0gUgzZr1yER5nNFWdXlXaEKaOXvYKtljUJZOY8A2J1XRIcDhFcqTfR6ZAh+707b5/afwJn9mT+BGgVE96YvqW/yTx3/uSDshes1vDWkwccs8+FfmTFJwGX6mxTBsvw1hBzYtdR0P4vA4oSNcvjt8gVuXHLCZu8K+cqY2RQWTWi4/P489zV0wcyjfWHgW4rHCRe7JZ2rsMC0yR37jDy9ZHEVMK6e2G2HPvZ7sR39y4mbT1kSMGQnMQFQXn4QCrXPpJzWHcQV+0PHcusI9R2Z9WkjSbitNNiwby97/8pXBswAFvVcVhru/429LZ7u5Dfs3FX21EMYFCuVzB70Sb7RGzMHjKYzhgdDsVRmM4aA1nEViWx/hduya86lMMdWx7Ghn8l6wH2/sVxzWL2rmHcYKu1eiSyTS4eR90M1HH/4WA5/vd+TvW3zZUJ8oiqeHwteTlnA0rV+rledPkpU+MCpf46zV7Phvhthl7GUEfsVBtdNPFjQMIO9kmjifWlxKUPFaTbc+Bp1aObenYWlC6u/FOtAJm2aXT308D5/O/mvpiWNzTOX2zG7KG8fFNWeGK14rY58D2WyjV2m8kTlrZcrzOf5qMDat42DDIiI9qaLEpHMMeYsEnAa0MYXN57OjN4aYPUZuno0jWZrSYPwToeuPM3e3MglaDbvtaGIdrrmO6t0e0f5MSnxKyr9sFKuefHA77aP9eZpy+6VYV0/ZQk8FeyDWnq3V5xu2wo1NrwKP/E/eVudq1sih/3SZPPI3W5yX8jDWIjqnlqFS80rS4RdJpgnlJNNXOOtaW85cepvNyydc61NDcWPViQ/7kFo7p/uVpwzj01q6KjAHOgpEZM6NLuGSbEr6ZqNZP+T+Y2p8EaZFTMcPllFtg7ze+ttlBTZ6uC4Jmunq7SYn1Nx31f7kt5RcjdAfU0D6ouWr+iuRjjeOFrZTjBM4fTdVWTFkOD2bVYMT1iTkt+1TsxI2S1t9jDmXc4ysZm7yYSnQ0kIwVForvezppe/eYpGvZ7+/6QKYyqFbCNHyv9mF2OWrF1NR2AW8Ul/E/kEGyd8n2t1AHb+lYthb9KBg1dnFH9NQftd422Vg4muzPOOQfVrz4pk8KbN6J59/s6FvcBF3PZXzLWwQVPWtwOrSF631Utf0lTtW8EkxO+L80hUGLlak7Bl5Eg2WK1HxweuFW7PkEX9V+iv8rnzZpeX/3W1LyN5XURi5ImxCiW/VGy2u5iGZBZHmS4IwEKMb/BOdM5X9Qi6vBdwFUBxbKI1lT6If2E9QSwX2fgUZXmsndQIE74g1wOaKwjAXPn8rjJOLGnV/bi6hhN9sun5VtPBTjNxvSNDrwPt1fWxJwXeGg1qjh5rLGjlyFGrVBhb3x/gAgRtFETLKJdL/+BpDmvc0O4FnJIvoz4M5ETV81LWajQsdifGUST6At74krIdX6jclt7H28As3isYWsv9K7GRhOWRSSPes/DlPSCmol+AIva5vSXnBFHEvDv8l/B94aPXtJueuW/38p0iT5z5ZfaVsLbbSak9ErPKnItxcpwNR+apOiURrJxadxSrL8AUfxsaD5/pCr3zJ0Q4hotGaI6tn7yU9ufSd9Js0MrJI2NyfB8fR0waxewZImO3gAknyv8ZBTeWb4TEmF40g4k17HyeDzFAR22keDGsiK2AKZwCJHGcJZhs2uTSnDkBQjaO2N7zcHif9L0je/v3DE1+wGfJ7Ob5/Q7foGUHSuPqLv4GCW5tU7ZdHtund1NlxmKhP6Z2Xl1lg9wQrSG/A+OD1qUouieZXfFSn27C/FTaUFxSdJd+POOMOtGi8mA+GHk3+sKc8a/m299589qVL7Rsil9xcw+k+Fa60tdOHgHtAgbjzK5MJyspSVnnd/SNBNGWSjAwnuVhyFoXj6FxwKb/8Gm4PqOTWaNOWCMwISES3F+gEpLTDu63KSO/bq+HZPMYbADqn24/LNF+7AsSsbxLflsIxDCvL79pWVWwSPEHQ509DoHyrr1+NxHweMDCpbzRpVF9F2hrCq5wfNn7nVT80HssZKzSn1iqBNiZN5MCU4KNVzIw6587MX5IwCkWATYt4lLi8+9uoj+iIoLucEwqD6f4e1Xtm8OmX9rBFL8pH+RvzUjeOBAPXVpf9ylJXi/ue4seUdL5KatUb59fnvwkT3VBlgMfhNXQU207YM19n+IkeNApOUbn0puPPfjm+z7GsRhdgprQery5MpPuHSKfSRCjLJhB3jr6I6JvnOMt4UOmYVmvXulsriXIj64Jtf1yBbLeoyNo4vlJ0ojh271cWnSarNF6xee8UZvXYRJOolvPwbL+kWYM3tjEn/95hEdE1MYlp06MRUe28r7f0Fp94ChHgPfr0cm5blWW21Oswp9EvI3kcqE3fUpnFH1MMMaMwIejPdI2WVWd6XQJkJjrSgIGpOZdzgBTcBzhw/RRfupK/s036AZeQiet1+nUPGOBc7RJ5N9+dA3mK9GsLxeye8gvyF7ZvCfL/QtJ16xkSoc/YcEatiG0GyvJOT85JivUM9oYf3otvRXBAUdrxUCP+ug38n6uhLVaRByxxCpa1m+2Avo+q72QxOLGcoUY4AoQaLn5yv+slmtBWvAlRgaH1/csoT0pMW5jZq1TrantEC+eUwuXdD43TlGFMXN0sfTdVQiExHhBYHSC9yKeYbkCNC0DprpU42N/hGcq031eH+kQhkXKi+5lFwVuFivob7IUNbLziyf1nj95+0q22dv507SqzlVxz0ItQ6ashlcMAlSI4TIT+HVbemLN8mpoH04tcaAKbbOfE8zlpcxvaW4594e5OKiVeW+7S5GN1Z6IaX5BNV732+5jhxzet0vBgGut3qjyPmZF7IhNTuBusXD+r7a4nDphXamtvPzmK21vwA4LASXL0ENAdHDwPQbhdZX+x83CyQSDFnqeG0VmoVUHlvgT4UvI2eRnDOTG90P57WztqMYaLPgfdA9OvC4EuefgvmqNtK9ZW0Q/B4PtmvRGfZY5eP2Wwi3etjDIqebgkH1RQsIJAT37oF0a7oWX7qHXU6WztCrvh5yYd6zcuLhXkZVwkU7CxS0gUiBzAm6nKBewzuJ4YWapL5HcqMUlvWSdbHQwSd8RGp/SUOi5HJEjHKl6JHsGqfleTEJgHoaU8oU4XLVKgEN6iXkLE7V5ZGC8EsXNHjxPO7gI2Upnc0cr8nTgUP+UkEK95TeWOSPG2TOjTYMpGKFrxIKR4/93GQrV4ykoosHRrSomre4lqa0ofVm+tZc10S1VIZwIgT6boGGmtWcfhJtIBHIbl7nhmorwegG4iIBQ4xoLPwOHC8MCDYYRfeWXXXCMO+AirF5+KYyPFCbB392YGSyr2Tp+/sZDXfowFz/O9myH/VMV96fyj8yGy2j/4Pt0JeySTLsKiycU47XZkFDlAaupCvd2FchdoSulmzmnaB6qaF6fIQRyJpprAm+72L2q2UDiunQKDn9905wV9OgtJrjGOFWbgfWSezAklpY1bbNOxbnqWnvhteDBS2DTxhkE71mOZ2eipnyFkpcfqNLzfBLpJ5Pi0i/xom2MrOJ4V+AtJGCO9Q8JcyUBJl6aMbikZHcWdIv8IDT+VJV+/tYg3x1ncB+XXaXuhmnDpiE932qoQV1FB1c7BvizKf3bUDp/CK0/FcjHxMFJnKqA+eoj5dfg0tapmNRJMXF+vfW7aOloc+DsishR/5MCTzz+iVjLYB0oYhwkEXvGEBXgwWCElzYQKr32SUQJFgJV9b5beD5/hG2zdO8+9ynNbxho+uAHb/+5BXboTcEPHlliz5Y8TvDuTjRomcn0H40UzPwg+DBW0O3TVzpg4sMb4dnFtIFBlcNzJlRi+oqbQ/R8K6GGjVM7Z+HYucSMB8F9+cLxCpeD5QLU65CB+WV+/RNtVr7qtLp9P202bJYYvd285T6W6X4W6tL9IfbkNgcGnbRRVHk/p2LPLqLB7bytYbQOG6CxgpoU9+/r3e6aXap/21O4GDHaLgNunLUmjjZaMvvYExOhikuluf3AYc9QU5Ln25ueVKYZt7bMwUo/5ImyAAGYPRqZ9lzezbR2hY+yx/GB7NQKeZHujrrxBw6kvgwdblHqnmC8x5E1O1XKpWAJAZtk6IbXu0bqanj/bHMUXQ9S3SOEfC/mHXUHU+DbGQPNG6Dr5ZISKZZZJOYUK4b5/CAEL31f7YbOI8s+vfmc+eViUdo5lkJkSy8dFkluBAsa5gPEXaTpP607wNtYkXjfVJDNSUdpXqf/K7oVdUyWDx4/TqUeL3P7PaArJQRoudK8Y1qMX2cy+FJu5Tls1vXNDjYZCJqFubQH1xM5rqakftv+wqfaDdd+Dc41kV8aCVnwLNP9evW8Ir9c8vCQgBzqhCwTPOmWfKhrcr5OB+bTt+3bizBD9wTADJTyukM8rmCY+kVqe/Z5k5tf6YXXr5JNzlHZymT3v4ygvz93+oOVAfS7tRl/r/TE5CYX7DUFYJ3cqs6qzusKlWFObcvOChrsa4CPvf/JPUGfqrzK+Gj2IXw2TKXJr7mXQ79HcbEHVxy7vfurTZ/s8sjZbphgG+z7y3zFJ17XHzp3e53k3bk/+LMkNOSISI8YB7eacoXndYr9CLc8T0AZtkV+yvjq/z7GtDc7j7cnbG5jLsYzPZbisjOErp85aBc3LavJNBLxKMYUnQShrPaqPT1Yl5H39P1tWGrPcaIidDEjA9Zd6OEjq8qJ7RyRPf7gkufnNc5ElVzwg1gvk+dzNdV5h7So4CLhR1kEZWqO0awF0Yn5rwySXY71/eXUeopxR5FibO7tYoV5alCmMn9v6AmOAKvGT2kM+lDgtKoD4l6XFnBhZrSyxv4cCQyrClBGFahkdf3AiMRGIqF9LZEbc/1q+xuZscJ5KWn/vAU/YadHGSlRvDm8i8VC735osU9bvRTCA/MEE1+m9/sCngo3DA7/Ycc8V3LtdmiEB+t8DNge1i7tRyXPNxniYpMzv1AsTPuDZdWxV+LHlzjE+7PE8H+amUKTOs+7D/4B9IUgEd2Ly+08TI+3rzwLccY3UgPaNUdJS39QSIlgYw3z89J3AfQV9S+eNGNGPxCO0CcEEjE4Tv+WMi4YQqMbPAjm7eSEZvpivTluBFPJ+1i4+GXSa7nyr1Ga1QuYjQVbGeD6rc35a6UtxjjGZlwEbxt8n9J8SezhljJdndbzfgOyyQGeYB1ytel8cMQICE9KG0JVGbyRoBkCdfESb6Sukn9XaI9gQAgsITypwQTx0SiRzIeBVOACniBrRAbyKC0yzovF50IiMqX1Lykt2qQLKvlDvYCZXwHGFtgjzgAiKbKparMcBPz2GmRgzRsNMxnxYyquBXedeXevvP7dLEKje0XLNWc2aHAanQjSM9g5HykKodwvRSdQH6fjxYPy+KGS3vOfPBL4tGvuZzE4Aj6BzDW1QamxL5EF/iZ17ufy6lA1t7gHQxSfB+Twxeocq0OSO+wY9JnGlUURNTuRPe/SM+oBf0rexbuANHcPpLO3vwKUd57Vbnd+Har2FjmcZhxmWrfL/T34OULgDEcJHdhDbK7p5bkQy9iP5ltAZQgffLMANs7Ggr7QNks+cMXTFZ9nNqPdVp9p1YjLKuQt6Gw08Afpqbk4ddoxFsF9wKaFxgZDYkJIgkcW9QGQu0LAaGkIh8t8+/JBGDgFBxfQx4BDAH2u7DnKqpN2Jw6xXCGmTb7nv88Y5Ysaqz8Jyu/HBkAE1hvgHC+Mla5L1VkqmNktrnJ11NJ1hj14LO3o+Mj684Aj8D12wPc08cNvduepdmOiH6Z5+/tXUxpH8yMihTPnUWmpTWlEhGNCd9zrvN9yJLvA8GoTDrAMfpFtdpnt1eeoUC6tj6Ki/tLngUi3wRC6Z5n2f/t9DKTzn/fGHTiIzOjlJMFOrKvYW9CvWd2V8aOqrN9CASL0FhAhqSrlguAWzxDDbsyu5Q/8Q+riK4VmliJhD/Q5u1aA6UzkqIBXL5WcwHGemeiQG/0s9XkR76bp/UDmVmtFp9gte+UQaAjwTXeq4O+E564Ak/Ceqyo0gz++T3FOVW1gIY7dWK+xETRxWNOZEbzQzgWpLjZMmHm7kfCKivDD2G1TXHYBb1FnncFb1y21uClKP4jErZpnGknNQqSzoCYM3p69dGEhR5wO2BtAGTXh2Jd5X0tHFEv6+wxmjVdrCD5DS0c4216s4nr52R76kreF/n8KpniPGJfAIuNjrQKXmlc7GaqWgxPJ1egCVGHYmWfW7Lfk58t+6708aV/1veMEoBOEGLLc/a6nfuUy877XTVcIhlOPYIJb858z7NacI4PbzmqB1CXtn+TpCtX3nt2pgrF7b07j3LkMyjDU7Zj1SPqHpjsVNEqplXF/5Bs4lnXHLINOknEE/J4Na8VFl2NdPz2yExetmVYSBbWa8DuiXupc5/iK9Bj4JpNvPVhX2nhHumbKoGMdqgi3s2OcLPw9UDBFdnT8o3Dp69/r84SKMPbgTGnASqLIDXY4omMOfZvi74YxrUubeFHQrCpMDp8C6wnYdENBKlmSboDQZj0KZt7lUBf+p1aysv9zOCRuAjt5a60sy8zMHPr5TWisn/+jH0sb6EKe9gOxdIPUunf7Z1/8bk6tjS2j9qKq9NwI1PQCFMtmw5WqpnzPljWaGqS6/1qdt39LUghU+ZHyqQ+oArmGE3A4sJEuAZH5wHtgCZqrjpsDqhlQ4LEFyYZQg5gBa/OcL9IWZ6J8XwvheypV6UppZpbSTgAmIyJHwJQ7b1dg2AU61sLZbVTc3XTHb1Bst+jWK4Vkti+LprXDEczDcx76XPotXu+aK6rk+yWdufPTPyIeZ2vND5gncIFstt3Z1yIG26VYmY5OJdff/5atpy4IXJr639uMhJe6FAH9iIB5QVuAn1FRVQmrkYqIFcT3GCEI9d7+qnTC6tSzz+fOZRwNqiPdMS+NT/tBoEx1kXdUhJ1mtc9v3IesOp8Oanxj0li6EJ7/edH7SNHYeS9cakZL7VDTkM2P8oKkwpPOdPKvT/KeMRoE6byOCPADMjltaz6goi4a83DB8/ReD1sY+hL54LZkGecwLAZsU00bXsz8mNqBEdxHXX/EUYpTSpVO+AShKaECUbRPhK/kyRgNDOn1NTYKPFkd9BNPXraqcRY8P/zmfbzpfHY+b1VnjUGSa32TibrltpMA/xZdCW66g9NEU9GkPkOAdeG3n39TBfa2V6jOVsJWuJXduf25neDeCamxjjiX2YTcYC1edD6qEvgOpGvzKlfsKTNs9QJ+OMLs761NMuw55JoFM+3SfgTRV3xks1HyBhTEO/3AIHnpyRAl4MYlADcunqU4eGM1Sj1MEH9jgx2wcoW8im2u36TtBjRNaa/eDSWSbEc/BF2aLrb9u5LBoJoJAZFjrQA/yg3wo2SW4wAvb8iyHfOzMozNrB4w8jrOwU+AyN6HXwDqqk6hTEBtxwqb8b228iymLp6ws5bZxRnEjAPasrPyleXdijeAxouGA6o3nRmMRQuDnwcZuY/0sNCTR3OdzlB0gjk1hwRzAs6w1Yx58KBlTQrEJqcVOKH9EyxFwS2BwP1KfnL9A2gGsTfcERU5OZAHTf0gJC7uv2KwdVUj0Dewrvm9bA/T9gRwwIhHZBCVjyoGFjIYWMhpJlYzbMjQdgJk5RJHyYZi6td0QMp3nfjt7+eiGW9b/oxwHk84d8spdFBsW0T7afMaR9zYWTCsb52CABaCpUhmOXy6S+I2cMwSLwMWNv2zXFrg+m+4kDeTgC970MfEALMVXao7OGXpu9t3Hl3HAFm/JjP03N1Z2YzjhfBDwRCvA8uLJ8JhvUVeusUW3+v4MVm5BYrBrLs34rM47RzlB8HQYoECl3mQfFhafGuhi/sJ8jraZ2cWPMPdVitRBHjoURH47gQE8PEOsVvog0/yMpJIqy/LmxQ/nA+jdLEcrOtix4Sx89eLLMc8DJIXvambVQAIUx0gTFusWyuvHQU2PyeRp/AQDTBnY4UmcsTDDx+ETHEkG442Sy0Ob0jX2Pxe2eZSK0iRBdbueDOjini7OlurAgUt9+2MW5Hq+aleF/dcuOWhQU0n2wVunde7znqRJkaYhO5tfNoJOGR92kqULPNzi4y09CCmZztHS7PJTCULVD9my5ChbS3UsNXiQ92nWePdl2H+T2L8n3EyRkOgMK6Ne7kytBIxOwevTx7sdhK2PPQa+7veCwmuOkvo0vG6koEsxblGeiHQaeAOXP3FY9FZwteCBHTAkxAqQFvQFDs0ETZvnbpGLGAiY4e/4UegGiusc9CTzSJOnfDqouBMZSFRIlT5c0LWYYu4a3vFOnZ0GpDxwlgHnc+tdbveVCxaCEbDxmenaK4qEQEmDs61HrMk9da/O33KSil5+ZGYd2To05nR35bFy6i6zhkDVGczXNcuHiFQTUMjnA+dJTV+nORF/YUq3MhKiTLQHWgVd5qNaJ8SauoFpOyokDKh4ngFS0cpbwUwmXhgMs4Y9M+75EjnglIF2hIYiZHnJnPyY2LkgnVO/tTFNF2a231XRpqf/IUlcVHWA3H4Lfk7pK14FkYepMcjHp+eSjxEJTnJm0GCrTjheNRac5oI34KgvdJBAq8w6VifflPcZLYpd8RQcb976/9h6y+gomq/N2DYwngIFZUGJZUaulMaKQWGDpGSjhm6RKWku0GQZugckBCJoYbuUmpolGao9xz0eX7/73vftWbhsPDMOWff+957X2f2vq6rqTgQT/nuzOouIo6TI2HC/ZcK6qrVtRnWf3guz2NAlVHAUU28NLpGV++zMOpOZyOmXplCMx4Pbfw09dSvg5eZtTdbkGpyLWQedAkboMpH0CRBeSFFYH/YuSb2uqlveVlxooPDmFY3Fg/9NZWsydlxhmafG3fam3In79qpdRjU/bCCpnueeDllKID3kn8MCBtIcenL73rJ779Hiq++k6TggD/zNO4WFHs/gX/FQWVz7414dBHTrwrOuFXKiphOJRxTNP0lVxH8a1ZPfonLUoGyriYP4F1rO9c6iZ6RW/HTughEm4tEhWLqxVbJxYn8QQr28oLmvi6tHFCu2OlmjED8XylGdRwqi//xHcXhMDGBPMyyImCPW3AXEP3TREa0Hv0AQt4gAECLxR7dMEZns9loj5dwkuZPOuqJdyi0S1Tys0X9wVvr4lHgBnYhjXZ+HYKRrazE1PJX7k4sj2gDn2FukB1fkWY91gJETVMAWfvNRNwKGpBNtI0AxZnkRwKD/uhBvA/hueRCdxFYP61txwFV7RTmpspruyd0GAvL/5KmoMgoSKWyEmF1X1t3PvynrqilWuKqlnix7eqKqGpUK8syuN9Pi4w26kn+PWPGIgZsVg+n3K6CHVFmY7dZSa0uQZhmnID5SbW9zMZY4vRMAukdwKYsLx3M6P6QCY35suCq93CCbBvleJfqely0SAWv3I+ChV0nGyFLoLreoCxwFauFukQH64rk7yv7X4IDYOw8N5le/BXKW0pUq/oVJdWSFEnhTnfImQI4t9lWJMil3tD4wFzMZ+LmVZOpJ+mcVvEVzX52dtrDGhM0Zo/HFpVBPQAivhiw8XH6Q6y576cuIpfQ/V2/uHIgkCp0EQFg+M3zWKift2JFunq7zwG8O5/D3l1ltKc2r4EznDin/f/6J98z3JhQJ9OJuigrhEjv6HGYxlCMYkasWbAH2Ci8DFjE6PxhOZcLI0zZ8Ol7TiBgmGRZGuiJByi0j/d8zrx8Uhh6EQsu8BqXZ0D3fH/GExaeL9uMvuyO8UdU+jyguFBC/Hb4yVFSJJBZ97om7pYVcV4zFj97VZ1Eqg6EPNDHLshjcLpG8eU4HVcitorfvFk8vt8b9eiy39lLYg1huVXBRbR8qbpI0seJGRyrZbFeZ6l88C83vtbhMxaxUQDaCQKFc4Towk9QW3mAFNmtHV4iWDh/utHDfOTI4MScgrN1QEuxLOOoa3HD7Gl6+nqVmV4vHtMLYytQj/gCP4go7xnIgzLpyw3KdnI7xldS8cdqjBxrJ8X/oley9ZIDzPDIDzRDi6DP/YrwrZBNvL/0/EeGpFbCfdceVe8SOzN6NCqT4BZJGS9CjBsa1YyhTkB5wb19HsvhNtySAMtPMQA3CiNCXELI0edJ97VHl/gQ4RGT0y7exkIbQLCKq2bfvkurAwfVoa1eOGlADydIFUC6KRPET8CK3sN+NqluQhYjJHkrPcg6d0aWCy4Dr52VomOih3H0i8W/t+l/VOl9kAWlDmpOrnYTOr7NtdMb0fI70qYt3CfQvj6w+lUjCp1dJZZvGGxRTgfEm3Zx6dBFszXQv2voGRRyHf2UCESizF6DpEYJbovFZs7BUX01Ytaf9CJsPoWkf7zILW/1O9zlBvwbe7S9/z7cruUjXz4DS4N8FdJ5tKOdvcvvVPNrxCR7nMd+060Aqn2tC67uN6U/EMjuCVulnWMNvwvGXggqtRPvV4nTamPwvcbx7LIiLruOIUQy6XeqQQQyn0Xq9v8SkfO5eco2M77h5mAvd7WXHQqj+2jR3AExWd/Wod/08e58Ci7wp3GNlJroVhymT2DTltYh6rGFV8aHT/Pjk/TKVJ/vdezOKB85xrf3K7KdpqW/TbeDhgHrYrYdaKqYc5UEho6/ULLxc+OS1wJqLVDPFAATpeJea59uJoL5Xd5GKUxY5H3i4UWsWbXhNnAHbUcTJMwH4OPVyddAQt2HhILZ3f2RU2irmGPlny02KvLi7z30U1+8jxcVy/QzNYa9NbdmtIqDsno7t79vMI7jIpXmh6FrjpOx0OX0J9aZC9ncu2/3eSg4mc86agtWWU5LhANLb95Rh8sQiOyUuAZtSplXpHKI5VcUtANptPyQJK4izQYMoL8esaXbtXpnd2oZ/ZT7vEBv/pfDn5cG5dR8qU8bz+X25of2H98i2AzRd3PSGDkCfAu4DXRWOIoLo5p22eT8M+pSXvsyAWQJvQQSiKVi6GJxxmgvQhQwgptwrxmX4dniK2OoC2BDfqB0Vlx+AtiQeS0HwJRcnPgLRiAOBHvMZzL22HGBCpqAMurabQGQRQ143xtCahAKnQEqG5B5iiOf2agHyUFrWIFpwre06kmWB1FkD7IyOhYiqr03OqisUeOM34T3iNvfecNWfB4o26e+elx0V99+wlzW0RWjUtO8yvzR1OGVUDDuSjLD5qcbLJ66KgHkbsTn+/pzxhpqps1rW7E9BfngF5M990ytU7fOhbfq7BmNfcnDaeWbDpnWw1dvoVq9OhdqBtnsz887cqrnhfUeYrQeylqD3Nxdz9BlZL+V36/7+/E79gk4pvrzp229HQm57c+PMQgsLD9jQVudfNpY73TBqLb/0ZEPnacIng8EOw9p5XwiHMJMHRZ5STuGKIuSIqvutV52qG6bOxgsapoYZn4VIiaKDZ78tGuWyd+Ryf9GjSJ8/2V7CIwlmDaAKuieCYVK+Nv91NS+QpVA2gCzA6dmj9hDc9Pp6ysJTqs7P9roVqdPkpseZCCLKvsjGhkbiOKoDWKAyMpNtQ6RtgiD9p20dfMoRQFVDJEf9+V1CzNQ9yKJJ8DQRqlwRKo99+SmE3qV5iHuA1VdhxuCej28fy+j97bjiXESnIVNESiUd8YDwNsOP6mxv3c5FZmZ3lYW5vOJpYaoVYC4ET+nrAjZr/xCoCPzT1tv+JsunB4GfgR4LPYbe97CMQFml3UYWL3UiboEBM3ZRkjsKd4xayE1PwzCyiAPat/Yc0xQACUGmJ1oP5rAegLIQAkvzpNvJCoulS9479wyRjfIVReM9M1r9YtJxwWwtQpgxPymhzVS+B60CRC1CWh8Z8AtuAghfrzLxhPPdN1xJdt7jsZ653QooSvzKm9nRmraHPdFgYaYlcnzi4flMHfoT3S2yLLLG91wAOrtrWgBL7cYbl9ZTKZsh6MqKPnyBZ/KrVHouFYMu4ka+9xCi4ynEjsvT76G+rQToKeTbfxDdK+7xnKkvNQw/CdOmjT8cTTqHX0kLjnXqiAvLWpYozvunbRFcH2W02gpxBAjW4u1j4HeAeCrl0CU52Now+PouxEK0QofuDFrLi1pJXiDgZvZkSReeMxxIy+NX5HpJg+6Ii54THUCI7LLkApJLLhMQxJC2/uM7zAZ+Yq601YWUGR6tpubYScrNXWvwMma9SVT1xuC/NbCLlueYa2/nuATOkjRDXKLCUpr5ADgV/PxoZPFooFCYcEZS2i2VwCLhaNFxPK0rGvvayMPi9mXKVSUwYOBShbCo/qf/h5pQhmguHB8v1h0eHkQ1RCnAT0BEuMBvRIEfzBlaP5mkMzaWCK3GpsP2+s9dqUw69yyvJBxACedlbxKNM5WHDWBkiNwZcJNJN6VDfdIEiETyFOnxm4+/kMzYDhP940aLeCFc31ezqbtfsJ3pgXfO4Nlz8LGH3YYc73vodL6xB8HC6Vwz7IL9BNI27avQsT+/iDg2Mf3DiJdoCPGbCwvJim6mPaBEyNB2ZhXxGnHoBweJm3aCgIJgjY9XK1JQbe1SG9cwhg3oWKqLpSRSTvqv2l97uhHzCkCfDSGKqZZpPlFXNdgUpJJAkSp90F+Q5nbFssJ4TzLsmDF13rLXHjuJ9XhY7YhogDnuu8FiE87FZwaWyrUS4z/mKLb4nGIDpl7xZrv675Q4blLUnQ/edQVcfKQq7fMOnTaVIlBRAvYBZqjWW8lcoB94PUgv4rpW9+oVq6Y34bQzxfUWjCIZ5mGcdNgywu6yuiUv5eA8HiYKqBhPPPBzYkiUWbLDTH2Pj1XKKkwgNMxHut9FFjR12QdeKV8ctLn2ymXQ1Q4jwBkTVMbVQH44tAD1tedEy3+FU7WMveIq27fSbjrLKA7zTO+M5wnrIsR0uupaNPfRLiLp0KpfXoqVDROVKhN54uFcfWwWcMt3tluaayfF6TNvbUHEo0duDhl8KnUYEZqbjwBBpYz18PzU0tJkfyVQ6SfqQoZxDxMfs4u6NSEKS79WtFzVVjKrCaT5DKq09vcg0qHWtvkUIXvN+Wsckrl1VQE62RRJdf766AlSftc+FV+JrERu+TPCRVGnW6EOJ2ErIqJXhyv6mkpQizXe5KD8jFacBlrkADtJXxZK9RJzOMo0GMtUpH+JVHyb2jnPMS0yGAIYQksBNs0c68Jg2ySADFxdPDUC1z8bCkYywta3uzf4891mt9kRkqGzy49v2YFrKFjZmQ9osqrSmP/aIIs+OD+7rpSAQFgfy8JByNdi1nlHu6OTO43IHla+JscAaI5w51h2s4n/Aq9K7D7l3La9Zrm0Ij01DLLbSrRxtNbK2JiqQrprrrjo9pvn9InGQ+QloEciLKA4cquuK69so9LkgdKWrQ7oYY5tDY91W/tvNvn4/nuEHLP9jNQz/k5R3F1ZHK9GSINp0wRiEt/u9j/BX2XyKbwOyVrX2hF4lk9g1ghhZiQca/oG+/jvn6fTA7GrcGOLeJqp+XNVuRA2UpP2Uk95GJt5vZ6eV08x+FX5NckuqfyFVI7QGVOA0S+39LmSZ7QrHTp8qjHHE2nY6vAFQc/YCgrkrtGyfYJzgK8guGQT3haekUR9VJdggQqomnbymaRi5BIEfJg1JRh9asr8jkj0SWa4mNKGoWxzdlFJX6bUpDPJwlSN1mC8LQ80zV/RKHeId8VbBO53In4xhS57unC2dhYwV9ZwbptC/3x+AFhhEeM9mOq1Pr1Yu3NAFbr9YGpICDSUFEW1r/kfWhpph8/cp1cxH958KmbBixelpTFdc957amBX2H2yryBB6LgYoPDGt/zuO+Lz2wK7mMcABd94XvAI0jEIxjHI0jMI7j8PRxOF2BwAEdhFgRn+ELNeVjQZu2atquVOkJXzUON6n+sK+V4Zn2BYaHJKBlV3dAbdcGvvhi/oi0r49WPZ6fdO2jnGa0SoCztiG98QNRFck3knwfPVC6Fg0YUDcOYCnfOESEeV2jNzvZ6Jn8ZqEhgBoVMgZor1c9FC5J5XcbCOq/sWW8ZmVvnTcUMdNs0rAdfnE4ArjZnFMoYgzlZWy9fzOaheyxQOaRZRFO4LBa82N6shmoUiJPDtBCfeM8GbkpHrbx7lWUMvLSzYOBPOqRClrA7dRSmPlqbDjgwDWpicyNF2rHmB2NWD1GCVCruXMHMuIHJ22cxR9QGD1eLRgI7166Sruo9XNUikt8inPBgWXdA7ap8mcyBEJDKb1maK31gKne+haZB+v16qLrFEQiHfDWozGvo6Ffe+ZsAff0uE2A5EPOOugev3uncVflAJhwlKbTwCkFj5fKDJUr3tgrH0uSTQeSvtubQTSV//yj5jkz5DqpqDEE0Wjo6zDR6sV/Jy5SIwe3cQv2DvKOm0FQIYsa3Qs6WuidCR1w8C/Zz6j35VPCe/zwXEOcHywgnuv2tCD7IYTLlOpi+L9GTszijMpIJgeTrjlcQm5qg3alP5eHHSOp20X2O/6TwZJ9yk57TfpWWAXfqk56UCyfgf4Skpc847eVNmjNRbRnJO1KQyHX44cCDeikIYAW+j58QNh+NZWa9SjJkWjSLfNVmoBwQy+2BBWkgUYSHtVWh64qpJlY4uM0T1e8gk+pvoELuRGakqnuxbB17vwyvem5/gNL/uGXktie9LmL/8ymTKHEN3yorcK/Aq20EOHrLnJs0KZihU59hqTpAHkhSTtpvKBjlCTY3ckcn+fiTF5db8PLrfRJ0UhV0F3CngvHw/drQlnklzJ/2RtdkYgJ0RGglYa9M3kI+0bkExZxQ0bg1logG0wU4u/vlM2pP3TSPnNZNoN43JwfM/ixq3IAuiIDkr/FW92XrTn+dmVwtDEjmDkDGGg30ouniwPvnEKM151oYkmcqr8YHlryG/Y33agAP8Anq3izWbJzcMZyXn8AyiEyIDDONXOzvZa/Y2SNRV7DuQSz29xy9/gzY7UOF3BZrSIIhdlYjEK5cw102Tr2//mo5Bbs4dw0oF2WruUr3HoUXIsvEGsNCL5Q6MdRUhgvEVCUbEjuRkvESO7/hsoVm7le7RFJGFGEn4eczVl9+WIfV35l5Ix2HYe8RyA1+kkBbxSP7+bs07GrwH+IvSbmkYWbydVXy7uVxijo6mV9HC6u5ZnQU5UDpumxpDB5/SyWSHiSDj4FlVS/fhte+hbweuORQMrtN+iIBxpIMNr9R4sOEZwYKSBmpjMAmVEtm4MgTHJVIr5O9rRTvoCeOYcOjFL4ExL04LEmXhPB493sE4nrBYawwf4E0qgHRvXrs67Bpp+t7lE9UakuaNrqvlHsl/qa8GMPTnyCqPZrdbNtEsL6Gq2KWsBHwlqiqNnyr9XG8n6PXiIpYCfSjhJms1sH7ryP8wQWxP/E8KcD3NW68yumykBrenQr7qaurYaULm1XsqhlRDpc9ZfVrU4IxSrFjtHhlgaPdbi+71pXs/eaZta/tEThs0Xt0YA5DnKfTdKuRaGP03FV+tVSvSQgxrl4jir6k+pnJVsdDKFAm9DpUlepR1GWxybSkBuzqfl7uastIhVA5FSBozllCY70N3WcgImfFcBiEhbFJDtRts+eYuUb0h9TZ//YqWPSkgJPy10C5zbd/5DY9Im2h1em9ZdVA2X/3dVYyjGMm0Gbk/oprHU6grN7nzL9i04PpOq/8b/PM79z+wF/tT9CJj+8gPPOtgDRRhfqyBV9RLNiY9eIhcsg1OwWGpQL+tzeo+N3/E5SY/wQrblci/OLMO+bUWxpFXJqYhMtzPA9EE6d7gmpC2CF4P7Cl9irkc9FMv/uohkTFj2yq2DCDHqNE1Y9IJ+X76t9JR6JFGvcC2gEvP8KDs/TlAimssZ6wZcRU/lxi0dqcrZzpuEKO7ZA5a7owQT5VwXC7ttQw8mdvQHACklq/VW/t905m9HSKgpu1fwSE+oyiexSlP+peW4L8Z7VjlyvFe4twFJWR2kih1FQw3zf6dZjNaufrOx7MYPA27pTurv+8FFlpgs9iDg9V8vfx7/BQXoRAXBFQbXTi37QSFvu++rTldei0lRX0W3pRWc92hKlS2mzpsh72fcclE8CATvOfQRKn9Hm8Va1qma1yhgOjUBA5PNrYj8tah/jyOLIVeV2YSuJEPFrSsY2vas62c9UbH52kkXn8vQJi1Dk571/lBFz7QDFQ+FZW13YnKUqa2qSm/9yrMDC1cSgpgu5791TZsf1mHluU8eXB7C191nkL1IxJe6UGK9rNGxmKgvvqClrw9sKkS19AU3SDpYsJ4XsuIKrxvCsf9ePCtH+Qo7Kdgy6mj2SnXjnDyuTBlBnzaKugsp+Fkhg6R9DNmYK84NcBR3O/yPRvR44A6CU1xuZlxy5l8XAnOfvnMIrJ1WRoKnApzsv05wvMp/CxGpgRs+krXfNZRThR6colk7pI4Oq3akhV2VotC2EhjeH0rhYMH6ncZ1b58COnwUh2Yy6Xk4bfyUSi5qHTqtdjPZAffesgRwzHV5G2pkrmsxBpEQ6LDqy42NCslWl+FHCo9z+N4pPUcNjlCWaGa3ioT1wbvx9TXo1dhMRa4XxhKDQTSzYxuniomqbKTsp/dkYdSFf9SB4ogSOvBtN09u4tlJHSyMEQN3XTzCKASrxUEwvy5iUSA+bZEuqG6oxgzC1Y5s0VvRzuAaDosPs7ab6h+U+PG8QDvzO5eblLn12yAC/4DMEgr1fpPzi1rUQ3XglQ3HUGu9aqGoOGwU+wYpmvD3b6vi/1lUEJM/ghbLiEp1MLwXwHXvuM9fUrMiRjaIdZIFVWoWQC1XWibGCLtmi+DHAur5xAkwjGaiwda5NZHW29kY+uYlHtRd4/JruTRZZfxH2NEvICV+uPnCV4Ez23yIdokcySJlipnN+eAR6eq9HXd2mBAoP5jpNG2/EEKfNRbkS5+T/maL/wLda1Me0kKkmh/DUCrX8VMfVUBeOyI+uz/DjfYWT5u7XkQLZq0/daHqemFTcibOI8Dz9EDRn/GBRKIz4o7MV04ISI3rS6ozBKxIcoMub6mKvTzCQteKs4TbMAjJJmTEOjq2HLOwqT8xCLs9NXFtDUx2qbP+k99ev0dLN15umordz1hksqIiyDV0RzjjmMXpGx+YC3IuGufrfqXoss+eD4NM/kzo93PGmPf6oWsG5Z5g5JFEGNvKvb1xqM43jk74PVfe7vFu8qeaGqh9riHcGjErVve5GTWSvUyJ3sghoS3gTFXr81G54A2zXlx4o5zi0K9gBQT73BVN61XyE3uidSSq9K1XJvVc91kNVynYM7OqfnnXT4otkB+AxaZGU0m6Cn/OZEx3Jx2datYadgUC5TKK0tgatTf+twsIBdTMF4X9R4jS1fPAlmJI/MK+K2Y2AwbM78w9EcnsndsWa7eavfHQ1GXV5fLpAiFHyMjWlg0Hm0bG6OmDVXPHslyw+DNPI4O+haZWTEWF4NHkUpWQmPen0C0o1aKBDv557fsAHwTTmvY3z1aMlkAaeYlfExcNoaUvFk2EGZJEIl0KYIiNgcY0B+igTwqbX/SvJJFzWLCgXgA3Z2b97TAVmT9uEgyNkGkoGfXVG1gCamZ5d5pnM8drSJAEJVGtrPJtvPWbUAh+XfbzRykox5nvtLvJuWIVP5SzCNMYrViAW8sfuQlOv02tJ35F511+VxUZXvpC0W/31AtZRLJgDP5zIpkvpzxv4e1w9NLwq7TllCl05CSL19d37qHbmOZFajJbg6tZszuTBb20msz66nBAPunw4DKhb1m79OKdRZn5ZmAYXTNITR57zc5RrqQLmlRPUmZPhq8GSQnrgLh8gyYZzUTQDg6BEmltI5OqzkeNPUp3mtex5ymi3OQyLPUqJCTvMlLhIi3+kBlfX+Bq7e5A0Az2V1BDNcJ1ISJJ5b+lpcGMCbpNhrwTRCY8bjQrpCT4sZdWr83ubCwwKUeVzla6cVqErSe962ex3IvZl2oDbdc85EgQlpZKcs/vYYanS6rrhQlveTYi89CKwcp2jp3Rq/j+gGTQ07afPUQLaqUExrfTTaxy4osjsTHZIygsQGVvrDowDMEbnJ4g6HeMAh7vCejsd3gAC2QeqwRKvSxzEydZWsU79Gskkxg8vqEdY8fBo/gWM/gOfngMBZMxz6PnjSfc8sswP01XYsXF/y8JngQhPvwRHZnJ+DvC+X44pqgqSbO290SmR90mqLeio01se5vegdqZqPxgN0ioJhTl1pUWW/stbnYmds+fwtvGuaJZSHEQh5br9HiBfY6RQTYqlyAOQoGxMsrTZivyKogVV4agg9BwpWqgQOn6xSPznMoLk30QGzqiEyT5OCaOCqMTbbFUv1+SKwF0oQRCNMIOnxU5/lKgyHvXO5X2VmNOBF2rbBqKn81hsq+gBnLHUxUP9eNY+e5nL9h1HFMgEO8Xq133LAICnJ+PQ60VNVTLk8Zn5xTYtXfotzorMyLVD4ghvxjQ5ZmDojdOFtGf7DOor8jgr10uDrQSQ/knAqmQ64AuWbLEnwYsWDmQYzTQyAXcrlHeOv3glIWTzeMkXLO77N1SxNiq6St+ftTP2YG2EUtKZXcC4P4jPXVwDEkMNQzWGp+RWL0dKXdTMkklPnXufuTDdLFJDYgn5pL25u3p3iJ84auai5yDKcb3Fp46nmmpA65EgI0WJPrOVkVIi4+PoUkqCoxTlBgc0v2TpVwYtXFK0ZgpUkIZSC1F7Mzrag22q8pX4Zrg+m4M5BZ8Zns/geKv256sn3uWzWs+LvzzQ3zEhXtLfTeeT4Ary7vK5H/izYSF45d7Efwx8wGjbZZEhRwsZJhkrNUY5lfwdQ1245ANfcJQeAW5AHzfZGWTBOKUpSzEPjFOOeG5CxTa5ik5DSGzJ2ZcTE5mGKkiOfUeupd7TVB3nM6VRB8mTwfw6N6r52I7oQxKi2P5pkYZoQ+U7/FMVNV/xBwADDGpFVHvZEnaz+TyOrHRsacCCe+k4wj9hZVXXS0rxBZJe8mwuhuiAxVDAOGlWv3sWCHyss1s4TE92bkWorAx09/6ZNz0cqg7K7WK2dSob93A9rB5fbQNlZ0kvfIvipg2m53bYPEXVQMMPZGrhy8m4k3+j6Dpcwj+4COQxZxGB1Aqy6Bx7tYs2F+/RmL/Jt1PgsiJhgnK85nqZ6eK7zLT95mhrMQKmw/c/Kcn+fQT4CY2LZ7qKfnjzhbezkdbDDxoDs6L+uS0s95o/Jgm2vPgcHjqVuhVxGA82xx46DyLeDZSkA0lXxMroqAC5+HUK5TkEgThhtI/bIx6NQ/yPM0rHwJ6OjyrSmyW0nSFxs64GEPLz5GffrV3kwAZ7UYAnK7nx5grOYgfcqaVvKWK+r6YvFJ5lDck8nJmUAxGjwPfD4DLIrpih4WDzXs2d3fSoZDz+7wxRcPEdLQWIlweV/Sv3pXRgjfr5/keZDppGP93kQ6WXZeGHacSti82hF9rHC2x97wW7dmExvrxeyF15XZgZiEgpT2xu3saz3LjiS1jXpT8iwPtF19zJFdWgqjPJ1AbBFyQRb3wtZnify18BWZv3wsGGjULsXQR7Nidee4qHSFWgTez9BJMYBK4sXH1sGcqqY3U78Zfng6f4zJmPYimqfi95gltneo4OuKr+M2N9cFmsI3ttodG1wPyXCQrba82ePQHaEaVZ1F4DZEv6dVEmmfl/+Ttp0sZ8eiYwwFRb54kTmsFTOXjlImtFu+f2HNcsGE7BmZs0JsNXnNaWGpufvHayfCa9oSIoQTiQaji3ozt1VH5F6y4aOm9VLY+3MSKe5TeVWV3Iukn05riX8QnrU+Zu2ybjaEdVqTxWmHpbPonf52CTo8rnXn0dfinKO8e/3BbeTJN2wT6LAFtCUIhorYvCBBw5l+U2J5X9MsmDuc8YE9AD+pdrQyr+3Yu9A4MRiFZIinBIRjpYOveoxxvb625ofRR2jsZ/n4urW4iavM3KsdW062MnchjTFxt/Lz+5iqX2qHvbThiLUxsnfWVVDMM4pKjlcimr9W8gaRSFHvOzTYQG+dk/6TDXTqnSv7icCeC/tpN/SaKz6aGBOrscGRj2Xk8LAH9wIkrO0Cmum0EDGlp3DAbh7CV+pZUrP8cbj0eLsIH7UxImAA/h37cUHzj+qtyix5AVlcVkIbCfBH2SiUNWF3RDUSwEc8S/uvgELi7356joMXImO1yBJGu8lwcBQeq/bT8PlrOvsGJDExSpM3IU7CfbvWQHQfJBhZ/yO/81K5DD03h+CDVu2rQW2E+Z3CJ2xuQwWB1/cwjjpzVZWACG0AjhPd/peTVjvPQjkdY2ua4f0j/aIXQ7ivKMEXYqbeU95E1nELD/8SHB8N50yrQuccrLSYLxE8MIycTyi5/l+iu5myM+mdXyornFw8lpLdqMFq/rduv0m2vZkCJppnShAdJU4VH2yaHcGfRjfGKGmy+pLfviuq7DhXYXwHLur57o5PXXf39HdrYLGymtuvp92UEpu4LSwG3pmrgXrqN9N38f01QlkSKXWK8EZ0QeQtwviXMgRGa16ZysFN9k0eLIQd/PjV1x19UtKsq3IRrP3CNiarM9nHHnZjR2Gbhk6yj6X0j6Vs0WKKAD4ymv6nWpTFJ6F6c3XjdcywP6j21jITsFVf/iHvpR6OQX22A5LKlJLGyDaKXLTSfjsoXJa0UtZZdurvdUFk32DXyvZLMA6bDogjgCKZsWLPzhnE3mgt2NlaHr1Szgh/oNs2cLCqMhmtTAQbIB9auW9+fWzhewyeGeRAWIhv+EddV6zi3EBHI5vzZog+TRnLCGxngGIjEgCiQTYK5KyIvZrlGymiWpO0JkhBbGPf+YFIs7FE9SAP4ayp1GVUWE7GW7TBphh33B/L5ASw90VbPRvt6q560hBlvUg/CcnPBxnonV3JlWHWEysJ1I5bIQeVXHdGfWb0FLWkXL93pxh0qdf3y9sit/IdT35gtLnm97Npvni6s7L1Wi2WBf5JHAaxsWUx/S74gnb2OM57FAy6hmmxW6K25/Z44RYSUlr17+x6T1Px6zdXPm99zyYNawp4Xt5zJ6Br2wuENd4DV3hW7tKNXRPhpHYn0+QgrfpD3XeQlfMMwzax96h1G5KdP52lm3/PT5LFdQo+UWko1wEA7yiRHKBn11pJswbAvGbkd9Lq/TkO/qarBOvlLfo+iRVbOBARH4QVT+qCyQiS7P3xfaz/Sg00SPZzn/x1cn6RgS8pBV3OMA7IW/H1qiP1qs3mN46dUur5rEXuXX21Hxa8isjnwnG4z0bv7oP2R/uLafELca+C5482XGOYstdK/CULp/ff3e2ksZI4Q6jPrsGfb6kfTfIGj81hpSS0M3dILrH0F5uA/nISesR1qHrdI+zEaKncdt+RQ/7dbzlgLAhg24gn2UA+WygDHwTSSE4AZvtkkoTlaM7mP70AmF5xjKggK2zTxym5rDHbgma0JQ1SBHOtAH/uaOm/fswae1jeS2TTGP5TDVtGgG4qipeImpo5vvjs894nANlZ2ZdoLh3POK3kD1+kuIj+1W9I7insUd8BjVpeAGdRO3GoK4HXXwYfbyyafxiv/wEyzuFNCrJAlzdWviGXzfTRh9E+yy8eQ7r9dN+NYXIQk5B1SMW7MBXyH2R/UxWJyqZmQwcnPINfxSqJuZO7UpCKBlgUv2eN21Ly/bxLCojsZEkVa6wVAzXeF9Mcu1kjLoHmeDZCg4kiFM+o0tXc7jz4nKa4HPHirvJ8wQ10WF2sOGAlKzdte6D17gMe4jAIc1QwQ+x4IVicdliDx3BfxzQ2WNeRNXExGRRD9/z5zoWgMPziPqYHLncNwX3JQP2vpuyd+xS9thdSQBxrQq9UnXBah9a66gv4XyopUYF0xL+nPuvQjuTeXlMx57cH9U4x+WYu7zlodM840YZnbuUm7JiLVfNW/sVVSoKEP8cV3BqnFCWtTOo46KzVVa8/gzXDJ2u/NUluv98GV8xAmy+g5g6wqj7XBu/nK3MksYI8DJwcbicdC//82RKbyC9vegOp30Vymu2qKgK1VK9TDQggg/KX7LaJoDMwnzEeW9tHeIFDKWKdylZ6ada+hWf+jMVXjtPsObTOKYsMyiLuLsumQjDKjleChVKdSi0p7ywinxk+8+uD37FAravMYQlpEi/RcozW+dtLhEtTbUjqz2bYxHI2KxxUHHr/HtLTTJsVQSNO5WMiy+PHn1jUjUU/6i3rMwirANrGA2SHDkC55dpxx0Ze2gUtrkHbWDXjMVOpMTvxjruLEp3CRDPdpaCrCfK9zDqf9ssMunQ+Sxh0/TKcVJyIAXY47mfPF+bwTn8Y+2UsS16ZX/C+ZTgcL4/3LsW5XAmsdk/jMQoFk3c6P4MRFhRhizWjTdv4Tjs4IudFHCagxY9ADrDELNC9onRFmTLKQqMfzVLS+b97J20Oc+hOCbKy5WTX/H0XrTaOxykGkJJs0bXclvS4i1K1zZnGuFCBDqd+kENSQNQhdhN83SDqbHmTr2r6Wj69KwDUXkKT0GN+BHcSqunN0Rpx6BDbd9yQdljw9Ve5sIqzG8M8z/reytfZoj6V36ufZnz0s3rY1ruE9X+7bLRUXMeAvGMWnjoz/M0fHMzcmWUtbsU7sBibrwowSsYvyEAFYkXuDKxomfD1ClBCfyLlnEkqTbwzGtgWu870Do5PIprmK1BbrGP0/JtXgYzW5FJGAvGYFFiSwA4PBYWPr37tgQcWpetvxPhgRaZuWF599H5Bebi3EdT6fy3zyhm7CL9Ipz5x0Uh2c5kU8y+TWlMZHKXKyg86SIrdhjkeZK9tn2xfYEVO29yctgv7wqwvf66em/0U3QAn5kCJoojV9SbOzzCbpEX2Ghs5wuyhs8/gGJpgXlCvMqZees9F/s+w0ku+KpBaxNxmddymQuTmImroDWB91Vsg1UPVQqwvCUvYmLqhidrvMWe5+OmnP/jxSp5HbpG56QwM9+vkOhv6a+Xmw4xWN5WranFmKnrb96jMEcJ1dxPk8C609t30uhO6dIN/B5MSWzxc6HEQWw91x5tzpRtWK83zBgos4S8pTsUPk/hkuSaE3OH9ickvwqFLqfzYA2agXJRGnq3rh4mT5vfIEN4KzSs7Rq7noZ+I91tYXcPIxr84cNw5V2UTHX1AGroS/jctiPs+RdYSVzqYRJHn6gXc8ZNqRyhIzjkmK7qUP7NHrRbpKc4bMS0MyV8gseRE/f7pRMsqeVIH9HV/O4EPmEgF8bmNZrWPJFrRzHc3KlDJtoZCu0VrK7puCATUTigUCC3YDaoiXsKtYMoF4QtyccCBaSLYFqo8Ixm7FMoYNOVLJ1HF9pkNTiCJvLRJwSDIK8XqMmmG64i0bHzMKmW208wXhWdL+wX5UG1uU+3uDrQkeCIbiig2oKupG8e24pP4DKTOw5Rgb5GIqLAiNFKY6clZlAEE9/OR3lb4/Bc2cdfRDAGk4XYc+vw5CuU9TeVqRpRIpiWbX7eauI1fD/KzXvFEAWNQNcr7lbhdmeOOsJXQHFn7Nf13Hu/r9AFGKwlIzkCdjzvrp3FEeX4rpvHKmdDj9OdsAfioQEsvz4PIU/0m6xuLtEgG1QIZ8ZAUWkuh85LW008RXbnslT8iMbUhx/Wb4m99kuqneE9bLDEVKjYUsEXdxhVbAB7F6nIn01u6G66hw0/7ZDgkmdIXg3+ZEjVpLMQEi6Fd8E85nuN4+XjOvIQKboAgs4sHDvhGWJskSH0ik0r5EykNuqdoY/bdbwnHtdDLgh/sNpjl0teNEmf/YObvq8r5cJBgqs+I7MzXrgKd/h+OahQJj5CqMywwUlU+7uLaozLt+7sVM7K1Nah7xyqN3LRoXgyz/DcpcJfTlAnkaiWLqwIpBl0lU9R25cx0Sb7KzZ0Y1UlexLbl7Plnv6NnFwygM7bdFJwpqjW+7YxVy/+2VrRP+cVfHOPntk5+v0nM3z4xA22dp7TBL9ptwjSBN5/XyOevb2rdT9NzcQ0iS/6kuMQemDuYHAez19C3viX4pDkO1M4dtLtzoBjS1nVvywsJ8kHt0llbWmBSl7rD539cHpb2c42il45rRHFj9lbui/8hyDRlXEhpaAwSvYmJ8T+7hkKyqp+jVgjwbfAji/yFrOJ+7CREf0XtX3m6464RkT0ARzkhc6pYoWTYlN7rL4dkuZM4/DiT31VtQ11V1JbDwTlv46uqo+S1uYNIbOG8rFx91fp4YLxcMFYp6h6+EHvF8HCU7H1PZH3gxNWk90P4DeVu6TG6fyYFQxrKt6NcU4oqjm94jym4evslY/tAPApf64oFXbVLpDWxWnleKuN0z9XaPxMaduR7gkSiAtasYfmRo23XhoP8X0jXNbL+9UoZ+N3f4Uqp3M4nyVk+nKoStFIy1lwiRbfaLGfGmn8JCRXKMEjgN3xbc4tTT/omTfRsrR3aOjePdJlvaPKpUx7o99TekQD+ortwjr/SfheN1Y2NV7sp00UNAq5PH9T8W2QNjStaVgrdsvcGLEtZBIaqkf27/DK5QDQH0aF0NvfEtQmSAT25Ih+sLcPUW6cx2nQLxqQnZx3Q/55MiPt9rUzO7asGcc4eJLsryuSRvvZibQT8YWA3d7kuOoN8sjt83WjlxXz82kBWEF9UNVSY86SJfywq+xSpm1x3GVko4Pi+mK7yTH+fxptxNEcuVR3z/SYQv7OobandLWjbEBFzV11Pw7HklBomTfv8iOv0NBpOnYi/gzL7Nq8Bg67p6QwJsylrpv7ve+qDvoWwOXrSoZ7Lt1P6hTgTV717KcoZDqz7lE45mSouB6CAyGhreKTyZRl+u84mY8Rxspujq816AKo9l+WaEcCJg+WDYv0ICppL7gpRm6cMUttZb1o9p4DU7kmHhbZ4pdtaX2VUvnDCJHm5/kWYwc1EjYjcFAZ67qCCacOoRAcLtyhBy2PqW+0vGq0WOywKqQfCk304m3XARtJkbwkMFvrVj2RdxyqusYArOX8T3+ZmgTU9HRxQq1hRuYI4kJFeIa+FLYX9IiSG7POcnQnwO+3p+BORQZL3DIWqQ4Mi49xq/xDo0L7fi93rcyeUpsUuPlFI98qGhWXUuBPpt5NWgiJE0TIiGsHi6lBhJdQPFHwfyMYf4+VeLkcs63x2oCu5hWw5izMtC6M67cyzbShk+amLB1CZoy4jxJh8qT5DZyElGyMsALeB4syLdi0/4610xQnRVohvN4sAktt1x358/uXHmRZGWK+4IdosDF0NlJBD7O9n9eyt/L/ocV+w0H5uBinNRIU3iCIaxOoIT486qa6/aQwb7+ikB5i/3w6s3oeLB3nr0FNwz1vl3H+j/ppxrsl3IIVVPxyEhkD/IyoDQdky2wKJz18HTob+fjuGYvwf8xzv6P4c+eHbPRHHmIuCnEROhGIi431QNyoSyqlP6Rr/4gFG+fPUj5z0FexL/Dk/z8H/h9S0E/dUSPbofx2fxk92/vmtcpc+BRSEE6R/6Nqq6eT5OokB8J+Fxc9cjUUiA1qLQJQrmxFv/1A3bH638u9Jpfq7TzHE+S4h1tmbtEEzcmwTvJ8r5Y/sVng519GUPyPiYOMjx0CYbYh/DXy1x51+7YZebY/6y7YeVV1PEGBe7Rlnrgu4a0Ui/bLJKcuyUbzLtyG14LUuXxnUQ4Ipf+sPOPTmD11j5jfAl/hYe6ae71y/c2yT+/b9Ofr3r50gGYA0TZk2zuOH8mblQJb7ZAj8leIfkpv9sKO3g1WUNxZWDsyubd8UbgtKAPcSNPksV72c/Iyq8+mL5+EYDx+ee/Jpv4IHh/p+ZRZVyAotv7mztx9q7dYIi23ZT1s2adbZaGQtK238pqfB9nSil6raWLneCQ07T53599N5f0MHEc+cEdfeG4GebGiW/czeHo3L6+Eqbev8as3m6GBjVjKEB1ic0FaxHCcRxEFsaNb/Ud9WNp2bb6M6lslgQPTGo3zvswLmZX5Y4I4p0hJoQaUmj40It3JbcSgzuRmu/WK3mnt8Ly9hd1PzCpRv5dil/D0iX4ujzDqD0E2StEfD1YwC2dgZssiAfzYdNaXCyjsR8JaJT8J8GlwZm5h2KZo31l7SPHRvND/kVnXtjnM+rmebJieKV93+mVNWOhtzphsyEvRxWyIvTGqRCDrxs0uu4+Etfx4fa7MQQWFmacJTmIGSDGqL0qiw9fiR8oaigSvGb9eMigZk5asTXAKTl6T+PgZzfjYOo8WqAe+X0e71tUvuFxJEeDbusKjCT0GEMmWaTHmhyla4OyjpMist5xNw/2VsJwYXHVFAcchcjBuJ6tNkAvA5eZeXHcQnhtYS/2yQ/fxT+P3KQva6pDwqcC7iUFQn1CDwnfrLSFx3rN/tQkx6kSyAA595cuXtvV6IhnG9hXq4HOwLHRlSekfZVcYxI22ah8cuv2Kw+ROy9cAzs59FYhtiATQ78RNO1B6mA9j4FpYcLbRq3Cyw0Dpx4eB438IihoeJQfOtEOUtxI6vXcpN37L6kFuOZ/jSoTtsATIUEr4tI9UMQb9BzxRWB3eP84oeSZ5SaxbxH+NEhL0v+dNgTCmYFqXIFxSkGnucucV9AE7rzUcBSSNq382+SdwJqBWXNphMYcfrEYut208v7bjkwWQBfAPyxpWm6L7GDjR1Mk9jF7xTRTYGPJOPlWN50M3pSGPay2iQ7IppFFUhay2NJYwz1Kpuvol9a+1/k7gJ9zlt8JhPLsXoSTzwpmmDpn6b+/RlUfe+kjFif4Vvcl8vfHRzJpolptrOWKauMGLZtd2tO6+uQzugHmnbh93DFEikiKzn4FTk/u/RJkLt8n4meufTEn8NpRQng4/R6OaZsinnll9PlnponkUwzPWhR0PfA0zy/REXOgK0lltXZACuSn5Yu6bfpf7GtQUWpRevnG+TO/VFgM5t2qDo9d9c6rbvyaasLwc+JsSRTqxEsk7Gf4c1c74VYrJL9t3VTZRzEovl6cPGF18Ci3PWNAK2DVf6zyJFJigA+0I2Ne8Esbg4Pvpb3hGeR0ZLkgkd4EDKsW5VT62as4B6ZNlq2UClUMViBydkVVzY4OesezuCiIgNYkNToxraL+VFTwKp2BlMrZSIw3ff5KjBzJ8uTBGU0gUg1ySzlmyKB7Ht7m9heVMA31dX8NKIrzIT2EeO+fLKRD+SJMscF7/rlrUfwO196IutQBMFZepSEB2rtDI+snVW1+YCudPET3MRx2SNVKRpmi/7XRr6/WeKXl0yovgC4JD7jdngU22tRchmumcbNL7bT6y0k/3Q7N/rWx+HPExjm9vLFI3jl0zDzXoi5dxuyL5BYbtxkUJq+oG33Cfjm4Tb+uh5eMC+RypMruZqeyUl3rA4UAjXw4gNAjsojJSy7xKugrkxJh3XzTG7N/4yqCAWbOqS5+ruGreWo2+DX8cXSEubb6YwwV64qXydTwXKfH/FJGnP6MLiMSEjL+JGq/ZFdD2ptQ3rJ4MPwmd1iDzJUjIwvkzhQfcfJZA7GUDgyzFvwrWnlBzaEh6atmbdOqzjtltO/TqjX+ML61W+9/Sy3x8DRqNQjBLqEwODGcTJMhuLTYu6YkTQ16ZKxPtqGdXBHhubonETOBOCeiKH3LwK6g7Vtf+BKdKp7U/Z1a06aMFRYodGM3XgTWTDY65XbV3d5rElEeT55hjYrbBvgTFeXf4BmmteiWrtRV6gR7m++ny2fyoMWlc2DrgMsvjk6box5bIVHRON3tPr3O7rMmwduy+uTniDFN1UtIwt47p5mb+PorKrO76mpjF8vIVKfgtTZ2kfKKaaNlI2qhawF4Dr1z1eBgdPbBlhmtUoRpLR9qkVgdbRtmJxJPbaK8Vc5X1jOrSIi67pwK46vD/K0BNQEn2uErrAV2fC7eKJjhYOqUxuf2nFzqdo+qoZXglRTQuI2RYg9SXID4GHB/9I7KQZqF8/JK2F6Uvybr5BBTdFqHCMt2OETicT9QAgkdK/O4j7WVbkGqxfHR8NKUmugeH6bIlTyvc9AXvn0dK2qbNFOB5dRJoA5zbqz8pR0A/ACd+mc5xFtCyvY1uWK/pfTIVCLazuXZezjwNkQIxPIq+irocUpm/EVKUIYll4kj5faomdNavs37PMb7i7IY2z9EEKe4+6ZAPzen5lt4Rw2J7NVpCaPD75C+VgUyuat7LKcOlRDWwHyNRjxEkbu12A8fzDiOWtWN/AIYfMlc8s33RE4puCDiLuOznNqH7AbjM5TRynWwnYPhR14LI+nbBnlAgi0yLLMs4xp80VDC19KG18vsSsPRT9st67t9VYLoWsy+TKK4/yo4EZz/qY7IElj7gWywWfyMA9dmRnnK0Lp3brLryleFN1kFXylkj2dgQ14mzWW2f2lyd6XzC+kp+ct6/0slaakXoxL1l+AHry1dgTw0nO49Q8S5lkYYDq59KZfPmWPhjqP/jXfyIwt03rPbb2IwKnWCW/393G7TRf6s2QaFb3xN0P2HheCLsnASarfvDIKHQ8tQ6jP5EzYRx0yrn1F656dnty8mNFXt5vc+Z/5Z0S9echuw2i9x28iUnjQJ3neeFkfx4PW9lMZ1AcdcFFHd3H4fbsY2KptSHEu8VT1xB/78W7tvl25X+Z+XFBN9JgW26ETK9hEiPXEMU/K7gYpvoTmRZjzBDh9abMtLuFyqK7f3eRlIGaQSjHrIKGn8VeFNXXXT4JOvgvazdpog7nYtbDOMdKrfGkrXi+qoErqCMRJvjg1exxxM03YdhWkTZAaUrKd4BnIThwyXSFjcJ78BrY1x9PxF29raC8K/4+nq0uLTRIsQolZ35N7AWS62gE/KRWM5Djbw12te82ofZRP05MXC1R11yl+NM8sDlXzKMhd5+fvk2vrw0axEIVOAk+/412VioPnDgPHCgHeYDJ2a2Y13Kqpyu2knm/2d871JuHpwdQGgmgZ4Hvse6D2uPLJmbs4BNQQJv+GGQhmd1pYbmq1eJyf65C6RqC/RI6+zdYKu3v9/BIFAc3080nfo02Tot18MwHi+tIN7eug+p7Fv7FcN9LREvzhCRS56yCIcI5g8yGLhym7X82limngCV/Q3B6fril2WKDhs527rH4b69Pbs+XmN9vAt3MOMdzxCQs7ybgfotadLNxCp9Wyjje42BGbG/bU3vHxzHizwQ13AVw1K+HouNL23GMQqevKPbvGE056hZSRhXuh2g/szU+vIxi6QcQ1xZYKdWfJlfp5ahpk7X6HGY2bzCxEVTmctEebZA2J6BH+7dd8Uem2vS9uKEP6AP8Lkv6N9bs5RdvX2EzPL2QJp+a/FK1t7gr4BxNv3TF8gmwil8YGN0OD+iBf3d8dBDKftcSaOGHdheKostjbF+iY73Z9p+ueIOFzXmrpxTBXA2IeYXifISOe2NcvCG1yu8rxGSkT5qGOakJHNrPNHSpHfBB5vfvQbWyj5hKzrUj+dMwj7IYkQrnxUhHY08wmdf7qyoH5AIyD9xhUPc4F0dj6k6M+Izb5G51fFgN6+ELhZPZdip7mvhnE7QFp6GacdDmI1c4cqGL9/JqHqE0gkaDK6oj5IIaD+Q+AKT/6KmTSuwp2rr9nZxdevNqNzWYG0OWZXW/skETfApgbbmFm68JmYQtxB3ygoPf/9jOdVHZdPQoJOoDn5uwXhuwVieKEk2+v2MyFwPxQoZx7c5HeI8Gq98RlFdTZJxbb/s4RBLuoOiV1vDOu8aCVdcGUlTsafDdqjWigFkHTYtrbj+GlGqAlFqF1FnRjSn3TcA7BLPzTnVAOhZgHtIrUIHIXhhHZl8lbK8PWM7xIqCPVuQmJVwSgdkdZLOLZfGrK15SMVJYy5/cVzJ6pkrRQ3NtHFW5/SsJz0B2evIVeg1fvrEoWZ8w7S+P6GmHkCWjiHz7ALcV+Xa+sOmOfNYUroeWC5miWRlwv58HbU32JTCKt3NtZZDua/ldzFB63JrS7jL+m442k+TiqjqkGQy0iFANre8A9U58v0LrPOL2gQtstsYMxBrhpJJ2+boperU39x7ltcxeY/fY7H4eQfCM+aYiioVl3wieNJjz3kwaw1cvUTMjwHk4kD+RmRKyMUOalckZwJsh6z58NbzJBKfXLzaaJf++iuy64enWVZBTPxENY+QgVsm90jznnE6GmWT1T7hfPkK7CPbYSn+qIepDwd+6Vfm+0JjFf8jIdxu+sVKRGy4gcMNSLCJxxzN0nPdu6jhlyqMY6z6D6w+zzM9tXc69rIz3IRK3IS4Lbb1fes/iy+40LSKl12lFXYXciirqy1M9abIQ00+5QcK4Jbag5Kn+Q0RkWjTyMVqmjvw5pgIZdNIdCyqsSZeDhMll+soEfXgaor299fZ+2st/Ypi3erGmw9SeBy5MmT3D/YXsxeSYX0q2GMzRcQiqCrUnDWQjwB84DQiHE0fqgy14tR98rhTn2y7+04WLeAEhaTImoKN29Ou+1I2o87fJhgOH27RdH/0zYJDNrpYLdcHk+UhqV2Q1EKjdW3L7CxYZ7baBL0AXNWWonZxlWpAJTUjI2rcSXaP8guhVc0PlkjdfyjLi78OnZLdkoNDYqiCJ1/g9cJvFb92FReMpRfUJGbD5RF+kqpAmNpFCHii4+8I1JBIpiF2STJCDq8IPpj3fZKFX2gxTEIWgXu3mwLTwttMnl8kCSAb+ky1iQxYVfKzcGd+OEQAziREF6DcZXInQHhGv9LwykfJN+GUo8rfJqhrHsi0ss2kiVMJxjOoqc4R7G/aaeVHrbgCTkcvy1A8CcUvevQUeTVo1iBqZbgj2dGVE9xZJHQ7cJeBbRwtusPxN4BBWR25jPyH7+58y4T9/F4VPKm75wwf5kgVjGWVKcbk7CvClTeHCy+oLatRo/0K2rgtNCp91COmhCxRklxnFGPHlc530ETIWHbJsO02/T4pTAsfTUMktvrZ9yB1OgBySeXueK7pdcbdElQdQNIN5LN5dZNwRo4vvXz/nKbPhRjGBISlmRA5z4tIJQrxuqDdbEPBl/kktaXENXmprTjwux9axaWDfJmDdqTYgnxxCa/vZ88JqxMSV0fWol2Iv7S2ZaQahOS3Tsrwm83Xb/MM3wxkIXgygGRPh1gyDyTLg8ZPLfwdFfCUTjCeTnDpy93gxX55pDHTg7FVxldzkbpDFj8OluY9NrlT9B2F5iHleLf0BOMJAXhKD1R+eoKx+oKaX+bCSUXJvrc9jS/j0f7WDLrEWGtE5+5MhzobZMMyR7M+KbIq2r46oZp8+C6LYPysalVpkYzdUws4kxW8mPuAoupPWFOLmuY5b2zV/tBPptZWy87N5a/HM7rVrE1bc0/QRAnhZWUftLul5x6w0FJNpiZ06KFd9VK/dw9qGjqrI0K1VPYucQQJenjkdPYrBogJbd/hSG6mg9Gt0Cox+1GU0sf7Owpz3mHWcOW5FP2p/GBsNUlBuzT8a0woFesoeUbVvAnZRxk7NuCiRskLefZUt1y19sxObZuvR0078e1JW/GOEn3Tpj28767FTL60eg2oAlctKaiCNkWiVt4JbsldBif5jOvA1gpXNg1f7O+OCAXcsQcITFQn4HCRvP0BKvUjqdrcx5vh6NXu7n65Nd0vIZiSW4APSPMOqaeppzJP6X8sMgfCW6aa6KnWfES9vyE2EL543OjOLB4Z2trfczRBWaWVfMM8eFoeCDWh5XLvpDEtGtOZ1UQNiSYD+dYDyPJnTlccB5DgL5HTpoAdtBaPqVQLxY0ix7+92SQEfJk5QzJOmvS2Flw5ABcpZ2kVKR5wmQxSC/nM/XHCwJOPJCEkI4MXIcGHhVxyYIpqCNVjuK1F5zIXkjXfEW49f6VcieJspzuKhH8mGxIUPCmvJ37ILoenHkNSS3ZgwGgvga8XQZKHDfGr1CAkdhHDapZG1Sq7EJ8ZPAsKBjYFHBpUNWHf03p3S27ab+Mpq1Vos1/ufOYW24bl4pjTDBULI5yJmY5P9DSOBgUrdG66vrSApx/ybitQaWV+laqe+MTXecXRtkl/99XUTXOrxpqXlBFhNPspHgN22VJb96feLqxumQ8uq4/K2FqCRZ37dRtlU5vFfkpkbAYoauN148hbxq/q3T6PRfEIpGWCrIZM0F6/STjCqBdZKVLBDt9djfeyYZ75mrrYm7/Ri6xz99ko6l4zyCHlql4ObxghE2TU/6hgxyB6QOTiE1DYNknHr4sndMcQm+UnjRnc6mmpJgLc08Uq9kNhItW+9YAuczBnzQghd2U8S/voezBlTv8CUqbX7/MjqRdRHtZlny4qpLfuwVFktxL/H77eO57q9/0DD5VVRCGzZJW9OWSU7JFwcMx0jOxxSHYqSfZeByF7ZGQcO5kHR3Z2GecYObJD9Hu96N378/7+fo/f4+GPF3W/Xve4rut+Xvd13c/r3MMB1PYUm0eABQ+VV92LnHsnM8GlDfjB7MaCgVKLlLy395CMlMVFBmVYvYuZXcFibleRZtF2eGhBQHXH0TO8ddB23bdPqJ9TbNUDHUPMfLYIbns2iSrQO/sAWSS6eDoR30KBifDFnyt+r1oCtQVaHjQTjTE6LHYHmiC0zH+1Pgq64r2/rW668zBZNWt+XN0nSZi5Zw5Z1JN4yKSbi7BFuxdmofkuJC981iQ9n3x72k/jPT/f9yaaKsOco/Ebq7+Bjf/zSKcYX0sWomCKrapGJWteMTTCKhRzytduBVgZTXoeQ0C44B9U/tvuen+AIbDjNPDaOQ9M7g+v+yvxS+knctjveQsYz8l6wClRS2vAK6bTd/z8uhRxdre4XpxPwzT6+XZ7E9+/53a1GuO4sb/Plir4zOEy568vLl+f9ys6+vFnrWcsiDxc1FXK8rUupSMde6cjS0Tne34lmzZmL3RxE1V7uIFrtU7Dyx44AgjA09M4v3/ivCQWl7dOM9zS/alhE+Fqojkc68o8Obk1mi3T+Ui89Bn8rY74ef5x8ge64rmjsjvKOtyMRHSVrq5Xq5tgw2aOxMi1/fQ7F5G3pywipz50wn182L1rgaZueEX+hXREd7ouZK9rOnIXLZOOl8VOIUqbDt6Oxdm93yXF7PqKZMqWzTq6BW0tmxjm8dutD02GyDIX9ax0dnjAktTZxiS22y34PbSa7zbYtd8b8Vnx498ZxXN+5BhFjXH5eVJyQnH4Cd3yKg4X2h6/F666fsvKo1EJC9ZGm1/M2EKcZOzcee3DTD4vmQxezc8fQNX7GjGk9TCk1dvfFxtlAQydBLX3W/uzVtEk4Zhle6GnRjEToRwDG1mGnRVfujxsGzeHUOyjt+gCqyIQB4smT/WldixqSCuGUAMpaiVpLyv1Zp3yB2K9zut0900tlDfepSYOirAKiiYnS1MnS0OTpQ05Y5/fzau4i1OyLyyrpseQ+QlkKd2npdZeMjnATwStlbx69Y6hKMWtagi/WmF5KxzHaTyfFmTDHrkzmysWqesscGBK0XUHZB4zEOwcYv6uOZv0cortlb7UnWHDNRpkuKtCJtvo55cehYiBq+WNQtTMgg45/lIehwyhdfavXv6J1sUkGY5IWilctGjDB3vLnPXybvMe2jkbFl2/V9phJ/HVIcz4PHPFKyXawC4hnE7afTsBMIumFYm+9W95wDww2qdLA+kAvO6O+/pQbSX8TMPN+qOu0QvXJ1NImwWu1r51eGBsFbrEf94q8A3kD/GYCeytbz5PN62n3LDGCauTarWk0Hu0nee3JKuasnMbNP5mgi4HHXgjC367973zHFZa7bzGG7nCv437IlJox8x3DTt5jZm82e8PqlV41KW6bsVbhtY7K4VDQwLEsYdnaHSc0Cl0zv8bHXSL+R9qZNlhFWG3PYXGmBPuH8sFfOoDOLQ+I9wr0NxgZjV5dfBhL8TPjwUCJg61LWUJ0BpIay4ywe1B1vjZXCYw9gcMm0UbJN1/yA/8P4q+bbRWODTZXxxb5Ru0vXPU94ccF/8IDfLSWtaU0oae8OtOWvbeuma3cBV1mGkG6RjKlhbq7JoONYBDAzPCg4SP1AO6LkGwU6kJBCrCj3ys2JWuKcRAoEQTEjixR9qn6VOsGqFa453sD8OuSrGPhTDNL0cszkXDwXusnKRQfZo9GIy7Z4fuQmYv6n1ZfVVZo7DzTatkXdjJ6Zj3Vd0ECE08lULwvdtxG+6dYNkC9MGorhXUPiO+/HqGkFwjZz0kb+tKzP+L2jeqvGPiU8Fj8Kv3ya8CXwX+QUFk3oNWTL9qd/wq+Sa9bnMPoyrW5KB7L2gtPuiVZVNBWuEIpqFYVKCiCvj2gbNuzOm3F5ReCafjDYEuqcPeW+jBRsBIYZdN749PkRK4ueywL2Ygz11Fb0GD2Skh2aXT52CWIFEwzJcWDax1nN9RVwfx9cmfn68RFfGSm+hUl5VUKLpfe1EhP6Ly87mrq8I4GOarkN83HNuEu+7B+87NS8k8zzk3Pwcst1UVkUtvhcAsZ/56RwLL3WRE/wFz5g6v8Rcz2OMuro4Rrch7vRXtmlasz93z061WBaTvAr9mKh84nhcTK92ajih6zzEPuD7NV95iCqdkpeGasgorkTEfk/+UKmYWzEnWhfT9c7ShtW/I1gcYuh01kXSWj49Soi/vrBST4StF9BeZKzc1rB0lEU68fqUs1/tUwAoPT1VPG/+pv7ooyhbM0u37jBcYu7XA7PXu15nxQk524AuEgBdUhHXPcIVBJG4IwP/yFyMtF3KFwKNjoTyH/Gh4m2W+QQxIBxobNtX4VEz/3N741aJNClhH3XA9/8UOpHpzemVZY8XnqKn6qi7ztd4eMgFlASducqrnwnmbDSoUMpvQ47pnTdr9UMtxh9xgg3joRz/9jsIGhZmm1vcu/v+UWCYAhCu+8m9UGMz3yz7RMJCh0QwGnQKWuUfa8lZsPSkMa2Lid+kf2m07+foig80x2vm64oLe3+Jxg6sCh1I6txoF3VXMpltie+Gop+z0YJUZkweVxdz4SuGERb/FnOKeLTEhqb1i58pPKy9OZeakxi2Y3XWPBIbV01O6wLxSte/9R9Izk12JCiq4a/vRhvH9SQfdly2TEd8W+xTXwr2ku8HEBfDku04ZHlZargQDGVEvMMcw0qsCGIKHkc2TflV5r7E8Mu/al1+11yd/fZ4l/Vl/QEY5y+411G/x+6jlCVpHoZT3gSoMUVIcuSNYV3HvnFV4pkJF2HHiwGxEfNy0hIiseT7a7vLXOMtr95t0tbeyNNi0sSY/9VzhPlYz2k/hrhLD8A0jj/Ej4x+/Wc0MAECGOBZy6842R/q9XMyAw3fI5e7kS+w9mO14OhsSwLxmCqnVKuovbO+XhZXt1Y48NYw+2rgXsSe1Gd65u6nivvogHQ5LRwA/qum6wPMOo2gFzRsHd/4etuAHq16Gi1CYf0LnRGNwTYcCnoc9GyFEH7LmB4D5gTy4h2l1mcYYtNmOUyHUcns35n6e7HeFwy4lHF5WbCtRTGNOdlUINbg2FxXusO4qrj/gT4tGN3XWnG8jC4rkwmVpP/LJZJd6eGXFUMb23hXrsbZ9ykYOftKd0cHOhboqH4IeuJ2SDZjBjG/6fKEk5pg3ziMg0pl0DTrkEd6l7YbwXixvlKGe9v6AM9TqbMtxd+cfB7aabIRnhj+4Sy+rUHyqzjAvqpObnKeVj3Qej8UJfY9OPS1CXcOyBklACLje2kOq7yLRKGW8/4dEUQBfHGg+m0Lg8Zyfp4rUfjtEThIw13/vjrm0iwyNvVXeqA3oLJkH7/snyKJVSnUoLkY777t644aLO68ANK3nUZqPH4PcnexH9nJfeRNSz8tgxAQt+tSccjki1/hilkazFTsrFHEVJ2dCWYqdmykjKNAX+UKuWWXoA7orKkuupYHL4mPZA6ik9LbdR+AFmdFy3lFUnT+M5dHGign16rCyX8nc0aPL+6oU03FBrG8uAX22zsSEZ913l/3dZUZxfbyn4Fp1PMejvupQRlVUhOM0X9Zh/NQ53jpyE3e62q/82gPTc581HxjjRwFQCfzlgXFB/YSOZO5c5bp0nDSq/isGEjBdXdCo6cw14c476V7Kb36+VljIpKlpYuN+dOGoZbdZcq1RT3KtVo3m7xa3El/CvfyVp6XTLyrvOwm5f195/t544Et8pQid1995XoMkrp3kYa5FTy7cuO95rVIGx1JinGFf9NUh8pCUub7u66q+KKdIqZP6COd01q5sY1rZraaJ5SLv6un4CUJDpvVb7Gavf7wzJwodJp/SlMO/HGarie4cmtfJ2E4ViPYGL0p6BmplVgm4JGBTiTk0aVeT7qZt9R+JViVi19htAw+GDYRYTy4cw68scr4Uzpv5bl/yNgyABrG30v1uT380M/d4QYpGMs5WF87ZcX3ljZg8x4xq8xLa+D5VGZCwALfwQWSy0kfN6ikT0fT9yY/W5wOrQn1mo6dLAkzu7kGuhGwvZK/FBMCzfQCeTd4inBuH+K2fw6qelmBNUbuE0zONjzunAsE5ZRzQZCZJp6lHyuQ1pW+X1KgouC3l8P64HptXHzoS5hKlim+i72suPOqn9Xvx9i567uJlLsjMkksH3MeGvU6hO1l3PBkB/IAP9JBtnfPnwXB+0smWlwbNCXiCnSSg0eEUkkTw+3KowWcZdkq2mzEXlxnPRPmwrCs2x1IUKIfVUA8Ce/2VDHOr9rBO0xazbXXKKJuFzxxHTvoq8/v0Tg1WyxO/5LNAmrJg7pLC/UpRgX31FHeqQaS6c7XhlxpRGH1Lcs0W8h92JgeKLHcSDEicUN9hZO0gOb9PhVeUKyQC3qmFK5L02Y/WpJGvaBOwER5d5HXJFDQfrhH+Lf5jOCLXI2fcLo84C20IW9VP53OSNAZgQJVcDu+DA5Hn8VbkAA7xJTXOkx7t8SG3iOD7vjlSmURWZPoKHtP4roSEmYHknzoFIAt8fNCfWxqMl1oJ419SxWZiexQzkx9/L00Gk60k5Ri3yJp0NEZRgtipStlhe9WKMmcrYR0xPv6HYTZJtEQJue1BmvBvap+yHY6WGy41QqMtHfBuT5pZw9nnlwfC+krFePgp+sI4cqSKUn59Dwvy6eS1adoMcOW3oi9wtrI1Yh/Y0EkAeY37qTRCT0OzCzN3EiA7u4ViRHHRCpHed41hYAqUNX25uu/9dbtitc1KofeTq8Rkv0YC6XCtwbSytLslGkpkMNoJVRjWsFf40Ukdotxz8LpL6pQ34Yil6Bm0ikj6tW+Dc3BXA2ke4xEYzbyNjVl5YqXZS7Oay9ZKuEHuAItZTCt3AFV2pGpK5ymDmTjb9tb8CtUmr0Wd3itRt6UYXt6vwM4riogsiJ5aLI69mwMd8EvoQDfAE0RR4iqA7Ay/K2/88Fk7BmsYp+Rwcte998Oz8ccKDBB31XT6qI4hkRS8sjwDymdvpfgNiFSwzBXI7oaLNpjpmW1mWcMXUYcJtNbKhMyC8dZFaR1/Aoi/bU9YDZi8h+9n7cjPL9NrejZ/DZuC20ARGWnlgutRixq51IDoyn4G79ctPX2QDD+tBGN9dvkStuPkbhyb1+PrfU+97/kMOCcGAjC973EKtBuAG3UNCgnC3RQ3EfyOz3gdinonQ9BMoWimoqJEk/zwYg/YdE+S18wUYliFojHuFimDl/e9UIbuzGR/hpCOsWvjlwksfW4c0HzOEXLpP1CcFIPxO+S5EmSHfiOgK3vnasG2NVpO/1FEwEJ1fO4zW4llz7iU3KflmEodZ9fINCifv0ajAe135gonM6+frcmIuq8vhXVm0a1qblTMAjlmLVkiHac0an90ZGKL12R5K9Q/gBQ5XVVpfNys3+f/BBvkB4l1o8UgfbQGX/upx9rWqFUPa6FFqoeIrp1yoP0W1QxfvpslIu4JWbWSNuAoTyszb5D8MLTi4VRsB0gkh8/ej1XV2SuENiATclN8zm22gY1H6f+yuHmdUEosakx8nOraYjPxTufDl1dyT/RjGioEbCoePRfBuSNIEWwFzjasfSRhLLmiCF5uNnEAYYddVzAl7/bIIQpFfwFs51GgUHp638ugBQAqD/AW6fxyCNvxDuaFNxZ+6+gqQhiNfLxaUCJEyMzPmQwfSIK7MqP47ZUu0jaiaiNM+jIThfXKklJUaYHJN/tV2F7Y108La/Ek7nnU39yThahjPhP6rokvFxVzrzOUgWg3az2wyHSBxsXa7Odk2VbzsbtJd6i/ssdaHC/ebTS7kcXlFrL0UtlN1uAn3o90baHIjJzy5+vqArZuxo8q3PlHXMgPqzkryWk5ZrTiaP9wT0zn1HKTAnKNj+FUd7Bk6I90ETjwvwlyN1Saqup7+Sd0MDQpJIjSO6ggtHoQlgzAfExQvANw97fFlHuKNg6OUieZsC+4kLo1nn41XJugQO+XD4JZmWum144A+3LM/OQ9NCqjvdwOzDHmJPz3mhvHv9kvYHLiawUkAt6WKJdnd2WRxvonm2cAY5fo/i6bD/szh8h76w3UdLU/HIyH9adudJShYz/MSMTks/+botgeBnq5dEaIBanpj07rdWP6HYQSv4pqufsi6fc6DhrZxhrnFD2/xkhWV4PfDgoLHWhNsXTVNTkt521GX3NjeyeCyqbjHLf11BzemYjGwOMYxiRBdNDalD5jqXuGHmeS30BXRYdbY3fVmk7frie0F0LNaboe13xLM1oVqJ+tOjbvCeohaSgXcldJsFeRTGcpaVihlLr+DYDTD9QLygvn+jsahgXgmz+D/imVZn1tnZgM8e4PoFZ6GWUXqNbxulv7PROwbwAC51k1tAKFxW/YWJmtJgoXcAKe6rZZSZCfdGxmYdACofW1RVcCG1YT39JTmp6lB3VK9Qkxt9rsn1aOzpUONDXXR9mwptBQdYm4PbaOMwA2sI1K0YTv059iOLNJbDGAVuys8RYfK0jbWltKexpwEEUmnxBsH9XYWl+I4yDJVQKLYEl9C8NJpzQvk4OR5gRvqH7VTxg9+S4FDM0u9xbo0dxua1OaqnRX5ecIfNv1fkLarROylukcPSvcpQr9YFHxYP7ltXO2t+Vac7h9AGNtbAsNBYTz4XoUhyaeC7Cxjab2FrODra9Gb0g9nGBUNfzQsZoCUlFEsbd/TxL0G7pcHK2QsVBOYHtbJqt9PHqKo2RyQK/I+5dDX+huBacEUzEkceY94MBXfdZGVz1TtAfZdhjnJVlurCbTCjI6GbIFyy7jiT5s/LqQ50zSclYVP9NkVMT9yyE8B9BV+4rx8/aYdk8HPryxcRJrY2aS/b88GiKWIP9OotgyVTHYul6pTAmfWbV3bZyGwLL+hrOZCTG/zChtdWz1s3FF2M9hOJ/Fn3yLVz9IhcHn0o8JsPx3JVtsU6HHLQqqxkwTyzFqOmuNb47hhQTCtgeZTWpVLTnMv4Mcc7wa4myL0iDUFursLub312XYxywNnSfJTNBNLxWjv5+ru1XDdHtzu+FgIXrKQ+57Atc6ND5DpsJ9PUrs0tGPhvOELGnqzpNGX0bhj7lu4/Sl/WBVAaxFuYVEtBKxAkEk3XSnFo+FM6pja17HfCecUEXWLTIHagpo+VwjoOWojOt9KO16vpVJmKEOf9Z8+8KWC+wPwcz1E64Z+zIry+sg+RDdkY63CtueodHIoo0t74y0pWos/90UxHK4MWhk7m8WztB+3sj6cIXf6rQ9yfKDEYJltawTUeDkewd42ImFNe2ZaU/eR6K4e/sHDRs9u2I4X1wEhFKDrcpD6e0nRRuC0Eo2MF/G+vVX3ocghfe49xXTyIs355ep+Eo1umT09RcPYcljP3M0WJi1scgmb2MBewG7Il7RWJbHBKHok1OB80JXnFZ1iGnjy4HdOmFcu2OoMvkDCWuwtRSbaE/hTTke+OIMq3pyMQJQrQ27Tx79d+gLSoQBe20Na8kSxq2sfDIaRNUmXDAENsvpuHOMomAd8t7bbo9zK++J6Uf7j3apNSmMyne9IWVII38fw29XJCQaK9xfvn2+gcaJM/23rSj2S0mT+Ka/cDFzLA2hTMwhUcddkZ2RzL2+h5pzU09vFNQWDvXPGfbOhsQWEMyBNzdO8maEfv9lDH4ZjITXHPzoPXqtwIQKP+Ea1riEmzKb6ox0SDtTwW3Clljbcs41dCLEWN5TNITckLqmjNWJOZXKxKTFt03d5GvHa0Q09c2ASgeOmTlB2Xm4cIzbNZBPhyIqNVaVAItUx6o49lElzXsHZIwlGJDQtpefls41u2LCZhovT6LNtkZaI0m/bNWb7SdjKy2oRLG2/bWwrLC3v9WwyZOYx9KAbiznThKizs/IPk4RpM0WGmEK7XitCb89yqxGWeOREz49s9PIrSImHszSXTb8yTEtvW/px8erqbZOlsVvilZ+8UZw+NYYzllqBUriYiRPaYf/Ei7TA/uLCbnhwfVOAG/4ZV/s9ZIWG3tjkYTAB6K4F/uxDTMCCOGiFiTCNoJ9x5G/QZG16jJtHEHoylXnwvnyF1KdTju6X/e2xNwipjhxT+uy4yH0cieNC4f7sYYYzwXhsZH2FN40cBoQEfLBoZC/X2ZdQMI5tCRfs9VQdQ6dpMMG1haOAcs17LlAjYv/Gfw3g/YNgvcNm3g7iA/uCsKk9OcsSSldFz5nm2kXe5CCFDgYFPFc4V25UDj9bLQ6cmzmGiYoHK3o2O4l8gAJf3BSrLhO4du0yepdYhq6OIeLzGTGPZlpk5P1ei1J3DbSRxeGPVShSzZws45EIdKQvJNwvWBLTMzUKH2gkP7yBvYPKyo9K3sqPJ7j24YShUxMMDEt5wndHb28JAJ/pwIa7q+PC/o1FtskwLCC7Fk5Scot7XBH8BayiY8Anb80fI6Xn7s7U/mA3qR2fh8sj13jubfPZsz5rPjHcVxBw9Q5/jrjKcw0YV3RAaaNu5EofpjPId+4U+kMbGHkMr+2R7/3IB/FUfQQh1May0eH1pJ3xkwpyzsvNOIyoBnXKi9GMa52J4Z2t1jBHZztw1qW4Ek3FRr+VCBge1odRNIkBC2KaZ+mFDfgWHVXDu2mrSXu1g86gKUZbHkMqSpHO2CsPBaqV0jcDXQrIDR9VGCR67Mk3bQ3e6hfswUfv7R1SwNLlFBTjotPLr8bcSgiOyru7flJduu++U2Elnl5kWJ3VnVrQ/K2pfHatvw9uIMjWA1o6EM/zY02xe45cRR2wGn94GmgEI5lwYhmycbVrD2xNt17THQZvFPBA/IrJMdtmPy73AhiFoeIdoNZWs/FiSMzMhaHzOSbJ4stLxe6xd3U5rW8+7fp6HXMPyzGdy/hDHeMR9eT2IHZlkGV5DECUoJ0xchcMjh3AEMabJjvCmlpxGNkVjufCBpQT6awfZbRpJTIO6XiDj+zWXanFQINKnodKOGW+hJwvvWzuchde+MwMj/0d/bHGUN/1ncNEjxF8Huz7a7xOfDmvbrbUZ5W30NdOrNVZ5SK/eX8yan7oCfiR25G1zNJ8SchseQtet1b0xriuCkiBDQno8/rlnm0lV0gBJcFeTQZBn6eHqfXK/kITIM/wzpPSJMYu8DvWuFDCubBV0jiWF4XUR/xYlZ/vuGVCZLEtYa6hE7YIGsuJ8ZHKCLaciEsq+VhPWqdc+oQT9MY1UtYHREjFYsKdydn/C7bIcez4oMmL5lLtQ+dHtSHGYOz/NwORl/G7mQBIjy2ris691HP2hPdaINZULUeddkjK/da42tbgOmaJO6Mq99nUchBjhEFqs99mThJvEfXXtW0LvTu4HN4o05lyc6KKf+pgwEMiNdPg46SoekMXswnoK3HAYwpdD/CZK6BpRaSN3vLqOivTgrNg+YXMGC6i3WDHY/ONdXyzFtyPodQGqwbUlHcOpml98AsPTDHvssqyJvqQ1mecEeylD3GlD+O+CIKLrIK6lmOwTn95gG2o9dXAMM1jkRQ9kI/+ovjoEeAFh6TIzAcJ3SVva6NszEtCpiCU/Fge1ZcLQg9z13CQ1ezhV3T4xDYiALMiZYcj1XqJqgOSQZbHMWTC050DLGL6t510RNkbIIdIg3sl7KD8hiNwTCEEkkBFpAwFnPopxIeVNz0rFGXqHMHzugqeEBrE8VdxAAoBvl+nTtskrUT6VNJd/GHJVtNvNJDioI2kO96qLe8zldoO7Ic9fPDFnbqzL0YBYGdPNRDkHrWX6GFHdWzUMeqZxn/3SbabMxARdXztTs+933MJ7byEmXC6fafSASvN7t4bCTgsD4I3R8sr4Wjag/LsRGLUtMDJjJxQlM5TQiTNGgVSPgHuHuKVEgI3cy1D/nOVhY99lTTnWUI6nwjQdU3WUxfoadlC2RIrALfREq6jRmqx78UBStmGdtoK13oC6Pb1oPFLwMguSdRGCUKuL232KoMlLLqrwJjSLIGWb9Tqe6mAJaNq3sNueEbDCbr2uW9V37nd9T1hPQ6zDnug7+Lmyl1bRk/bLhGFNW4qjBDvsT/SpRcT6e6DAzDESwIc/dQx1c4uI6pqFvowaoxnqIBtpmDDgCarQ8eN4jHdvISLbQuDHL3ENLJ8jfklwhSJv6tNhks2EBdVorQfnDVWCFgO4+WNQxXn1a7aQ5gwX1TkWLuzUpBgcnm9AzL6IsWmPa9OF4nAMQMm9ZS1+lHFyWzhOSHhYPlIwJS4v5U3+G6DVbf4bFqrKuVeskEemt95dzt/egGMwErs2I/iI1za8m5+dbqjoa0bXbAzqncs5qZOKxs4mqiPc5EvRswDr0WaFySGXvA/A2s2+vJK4Av7wD2cwZY097TeCUUIsoLk7NOZvRFH8CSV6aL0pqK8weMexjS1BmIaCrBrBkWns9dW34bMDAnTqH08uP4VZvw4mVpS9s4+ovAf5tVQZWVdHzWGlwyHF4y5CvzHniiad6lhNOhZymzKyX+aVeK/tE+Hfnbg4FBxsjEDjxM8lzP7+Qe7WeBDcx6xUU/U8YN0pHxfZ/Mdpq1KKdnULvBHHqDuWhSezThEkhmnMT4TMVtKRf/o5W9fza88LbSxlN3p2biI2j8r3GunqP6LrP1TCFYuVJG2+cBnDm65S5XYARdRkyEYlpEvNYt37dDqPyhcjst7P0l9mAztYlWzvue14qSHw6hiMWLuuQmF7RaworNyZ5/d+fXWw+d4MqruewoResolRA7hHo8VI5ELpQuxBnTSnkdO2lbsYYsuOMDMdy/+6VQyi50MCfJJXf+ZfaqPk0AGEy48wI/uFzEQC4cItFt2mhC0+Ztvem+t7G6D+lyd+LZ2lomFrflV7H+/MaB523bfp5J6gFGE2UfcDQDwLmuMMOfTQXYupff4SIvec8d3zLrLvH/tmPWJ6fsdGHf/GzH211N6G8po3r8C3/2KQFv2Qw7gW9xwXQLK+/yAgyE/OA3CkAWzocRq0cuR9aXNeTwx5QvUrF3z6KCrvNrCxwYkbVFx2aaoZ82HSKKnNub16niousnYHkjho5UyHDXa5kK+hWqdBYnFUxHrwZS0MXyPRQaP4HWCl18JDYR03afHC5iF89iwKCdTscQcx+CFo1khBRh7fa+OmBqrqKRU7z/yxFEbiiq7JQCsk4mIb7rO5MgQGohL99f6kyJDhF921AZQQNGAhvEFN8SbQ8ynjrjPma/6JKmY5+XyIBJyymlrEdk6+A7gapyY7+Q96lwBCPitkzqwPupexjw6HmNCtm3r3Q3edUGK8ZzHfcH3S5FKP3LJfwSSZ7ExyloHFPf2z14ThUkIY3RmruThqAchpYH6OOkCXO01PTzEfwFpwymDCOQXSe51GdVpKgCABiTeLnMQ+jya8VZa0SAtmursNkNQmAUWqEjXCbQbcAO7RqoJC+BzvpL4AVKb32uxp/jtWY8ocZ6zfLO/uCZCABKk/UyuLpNMfj7bOMAKoVWdJMRoJE+UQ7QBmBXCTLHWko9+4eRqS7779j7Ln1Ewq20zI7bbqtSmMZIM2BBnkQERuYfRg0rLSeZJISWemHzteFRpMTlPkhCnirYcsfQzu9FHLkekrPb9BbXPCEC2LY3RUEK8JxSjdh+uQpzwq43eDqUhDrs66A6vm/tXc6rX/GvnPKCs8zU45fz0h2LUKyOzIwBRT0vK2jL1CRgkdA6kKzTFvBvh5hLBjVHz4s9OO+U4dQPfXdt6GJUfWye5BQkcTp6so7ts6kmaeKcoqeDUx3I0umkXEtuaKTDD7SuJ8Y3JH8HEBO+0EiufiumSce09BIe2YPvcpymSiLi0dVe88x5OsCcmooH2WfxhLTT0QqJ7qNBt9PXXWDpCMoFYD9NwEH9urcYfo2jeCOn9FkC8YV420+mb7Ok3YaYI8NJhGOvryELI4JvxTJJXcnVSGf5+N0rBPglZXnqM84EugIsGWYsvoc33BfBz8NWA1V6uC30zvh/k/Udijfi2IIpchxAMpGd4mtRz0Xc9lZGYPFLNjZmnQYqsB+tyYj5IzoDU72ebkXHcC+RjWXasvyTCK/Ma9sie1M7uGusm2tiZRXFwu6mFCiwga+EmwuJL1sC70AUz0u7JceGnPnHG1ty+Z8V/zaONfS1eOjBBMw1QWT1sIbwCfooAOQEYo5dILPA/MEekGLqi/ern51Wi0tlfQ4BxCytZU81yCuGqY7dU7QXpN42+GaJuXuiKsDAEWaYRMjyzV4IXZN8TnlJ3WctQbr8xxFTAHqRSTh42JrCrr1BoEzBPJhY9zACJ22UHKvI3PtPW14c2GllCNC6j+pQPO/iSD2tjsId5klUPW83SdzXhVwpltVmzRVkxX0z1sXXmQpSdB+Z+j3LHDCoRlTitXEZAkuan0VTIlb8Lt88AhXXdJwIph+kptpXaxiiUe0XXVe/XGCNVeEwbZnj3JorfVefodEzBaAHNPJlEZIcnIHiawh8O88BGlJg+fCfOcA/FqUrOx2ByMsLHL0QWolkumD+fYRTGv7xODLY52Ep904lRADXgzRwE8DYonSgH7OqsQ3Jf/nCvXnXPl5ERLQfodsz1YVL2HA6Isd+P0P+NEzYmu5/b3PU4b+ARHQD3h8EMPL/Y9QWTFoGI8ZWJOvY+wOStqxXmC+54eDV7qC7OQa4m8Oecj3IYru/K0ZBV11/t+wn9ce53NpLd84z0dPlf/hgMtWRKqErktBQSuy88FmDstQhrUGvyp8WAEqksbZMrcihsS4h1ZgDWlr9uNCnDmFrolCibzzokQlRbACjfhyYg+HYi9YeiwFLHMnejrJj6dPPFVT6bneSkJDsr4+t8r0Vu8+IRqrzUOvMohdmShmui8a6hfX1bgwX1to9A95Ee6xfSnRav1fq3brnC6H0dZ6ScyFTxtqA+/89HOrlL44V86WPXb7WgRzao2DtVvFjVFcFw08ASJHt/yclI/ANGrzhpUpiBVibpvQP3s+F3R7nBRvEFq+AFTpm1JPdqdDIIYmQuyfX3qfb/15PUzq7TFlx8os6LI+4Jk5BGjZuKl2E17WCRmXEe42YodnLARMbBx7vd6tYmLELduhyWsR9CXzT0aUJPy1zZQiWpVuK8ie5qNqxxcwnINuVmYYvu+pzFG1KJV/NkyVta8XrslFV3b6G5Ht7eLWC90H3+BxYHuWei02IGobWE7Iaz1LpAHiUx8L2mmGh9RPjVuP28V9BsIfxlWN3+abpGTrBsOVSIA56k201TlZau9+Oy8/zvrwIICXw8oWHjHkBXVa8khfF3XmHvPXzmo2Fk/0MjbXvu3XU7r1LR1hUmAwDKEtJ4rF9tckaUtQbkSP92J1/mJDVrvgcbbDZijHh24Fsq/CF0ifV44bt+7Bsgx/m/etuOPlsxK5/j1Ee7wUDWlmBGXnyN8tJrUF2D9tXsSubh5gmLOQd/PF98/JCZYuWQggMqfegptaHwF5/53GNd2g3tYerijJud5LrPbQyw6OirJmRMuRCGkamee/5Xp38Env1CMhznUYQSnkPV6GFG5TF1v1qqiuO7TOdbhh7+WFh2SnXHV13SSrN520l2UGllv4RM0rqevrbIYifWgvnLTAvNhNvfK9zaJI2lnfStrBULd0JWmij1XGxe3ktR3W0YMz72lYj3wInKlwjHR/a7LcSQyXcPS2RHYku3OinRVF9ZrVvWLAgAlNA3+3Sqro3WA4U1HHDgj8+WrCcsjhJWx5LPX5FzBtTf+1Y7NOmu6eQMZh1bFRc8dsh2oeIeXN1n+32rTSfoXiymGgwkZEiSVQqPlbIjZUegLFpmxvBSm5LObeVhSrBFH4EQ7cKvol+xNCYwCZ8SmApKueB/gUVJVyW0iPwTs7DwSU9TEdXkIM7v607tw0b6nDDfLxraFqxmfFt9JSfSGH5LjGGARXymVU9e8ri89KUZmJN19+mw2u68xY6Hviqpo61Y4tXqifJ56ml96PC2j6rwi7foPeq8/mZYx5CGhIRbtNc63sYbcokX832g5XOkJ8o0YTfYdWNanroq7D2gNVXdM7Um0Vhl49Wb50ObtxDmRg+QWl5Usb2PJNxgaUSdzb4zlN8Ivn1i1VC3ESKzpR6sp59gCBWPc+u7geHfW3x3K9b9LULg9kHDSTJC+LCXnX1hnQcq53o3hENBKXDKEvrOKcEQ137G177e1/c+SfYq2tUs4g4U7WsUqO3gq1qf1kOGRcVKtM+K1N1goNh+vFcsJlW63ius4SvzKr6aNmyyQdVB+fYe55i4+7ckxrIY25hLAwX03evsbvkYuqCuDjwzSRHqb0Wa0d2pOOBk8J4XCeFgxSdI/XkJPuAqaZ4WmFPTLBXybNWKxouSrIv27sxmnmy6bGaboypt6dNi0NjOs9aG+FYvhSnvazUdJKYUkwgpvzbniBWM6+ir6ubjUw8TV08rW65nVUsxNESgNuCPYAN7p3QluxZKP1kaplsfH0I9WOxK3zN6tUr9kW7Wf6XPeRGzny0XJmN7EPG6u3ddhfS4mzfvon1qAvezm1+Hdi2/ZDSZLS0dZyjhkXKZVqx4tUzdVyW+iOfRHaptzOHLst6T5ZN+LWQ6vxpb9pJy8PV0/EsSokRwLIYk9skTgUstZj3S8A+fsxBDHCUN6pTMwui3LkFnt3g6ifRqMBwJGotzr2cUgL8EDp7DSu5i8nLU0SpVZ0u1cuMVDQQ3mfIUPGQNceYpdLT1YgNOQeO8HL8m8unE9MrnjY5Cd78uC5fTfqueQ6Koq+1RFgYp4YulZ5PDXwjzkb3JrblXGo0Wc94u1XqKqAvExfATzC69vbtfbByje2U+s8yvOkZd4G1dy8aOJ3nH9/OL5eElTg6eItYDYXGjmhQtgMte4DOGVPRwFhu/7vqrOCqhyHpuJY3rZ6uytwIVGvvbhUXHhLjSMbIRMFSL9gkN11+IGwlen0IcjT8qNGlIr9R3ZkL5Q5YCLXcCXHDjQ5jzrFy15qzziwfze2LC92qXrF0z9eSRXvUvdivKBiVDlUQ8RPbPOjyAeQnfN9J4T8MO6YaHUjvgTqS1teaFrfFCRuWE59cH0H6HF0w92eujWb3jRfW3sE7wY4+MWXPzJ6xK31yEYP1tf+2CgsQOH8Cvdb6oq8SrR6eYTUyjecdz4woOWGUu+eBgV6AIdkmuzLvu5F2iafjXfyJWwDAR6HtUaXqAngMpCME9BqnHoOBcpZPSgymoPikAAfbXT2cSXtUO+Vw9GT+/DJF4ghkT950jRQ5st9xx+Mt7qv93WdSuBgpHR8P9ro81TRdGPOJk/EyH4N6w0ouls9W86BziJm/CIEPrJs4I1m0Zfp8Rd4QKZk4HD1RxDYgA8Ar9ErX/3TzzB1mVLgU0EXYiUNTBTg0xoQjgWVqrn97NwzZ2clat/tYedrF5703DN9J0swqVEluq7w6d1/KmfM9T3dmchODV5vfr64E8uvTbl4b5npHF0y4V2mrodWvhd5u3ispWZNv13l4mj26fd30csAt8mF1v59zx9MG8faBjKqtHlZvG8ryxdBg1IGrUM80fr/T8pDEh0DgmKcwIzB05cuUGXOIUNmdfwf9Fpg2DOrdyeTllB6WrBQayhVtvWmyfucUWxRLicuSegTMU0eLmqRlmu7O8xgXsQf8ToVbzRcnH4KJkCtbmenuDhod3jmM/Z4i/sTXp5GMns9SivoCKyGzd24iKgRLPRaDEQNM5Y0Q6mkos2ASgvuUsfb1JWDFHkd8scKEolwyx5kml0O9H5YWgnhve/pRcmxEK/JPM2bBZERhb7cdHeQE8VHdkXrJlaZbpbgCUb7AHBNXXKX6mCMULuKnSdkG7fanxXn4hcQ+Pz+HJJ/lr8xvlHDm8kJwjxLxzGxjA4xnG2/YUyYhSr1ZhqMVMt7RAwKiTy3RSBtszcKrBQxdHRg6v6kavQqC35qxvFGMOjvWjQ6e7s5tzCZRAna6BGIgdI9cP2FBfPSp9yty43jPvjBGaIYTNC+jxEvIfPSddqAYbma76ONKUOBJPZFs8rF5llGk2mQveergr/tFjYfdlMnYL2uKszSENgvimKfeUkORdXDTuxR926aF6EJZOZ6tG8eris3JRGhkaIiSw/uwtiW4p8UtRCGeffxxJzz8pCDz3afFkEVK9psIp9tRo28Gb73/ahHB1IH7yASjOYAx9/zE2xTEil0ehtCNUE0Wgemv1ZD4kejUFTD9dAW5+fGVlNvYwx7NV8TAuok2n7veh3IlVxn1O+6qJr0+KT7wnvOWR2DlbG9RiJuFsQdo0TwC31Ttzb2qA6GaR+AmX6FOjWT3Zeyk1OzAo5HG2qK0dDk9Ixpcp++h5blZIZ7Zhernorgs0Uc+toC1flWUZ0ySmO5Enoq5++wDOyxgkm7TKKOtIeBCa0qNBLUVCsFdymVgT+wJfZcx7cVhjm/AH7vz17FVeypnBfOe/OuYlabXcU05mWHApAH1WGyoQsZCaWm3Wxre+hdLfrewyzzL54Yi4aPvGPt9Ny4E+SYGtRTxZYY5BG/nhtN7ogx6wVSsnOkIGgUnY3YWVLg0oK/jgL5OQXP8n+AWfVGx50SnIHTTVJP1gFXTxCPR+C5NT1DHPQEdX5aaip6sBa3JNOCLmcZv23ia7SVKj8s+k8ZlST/y8WSvK+pO0x1nRi2DWrUEmBIqlqcL4vinIH8xRsbFIOhoPM3g96KW1BlPjKJn2y5exd0gVjrvkWMZv33dVvNIsDx0DtQo4A+ATVg1vY2/nSKgt1ELpiS0J8ouFT6SU4fDZsfMBn0PF4ZQNqY9b7mvgwSERJy2Wu3nOMFyd1Ly8bp7q0oqiO87urPdbwoGUdFc9n7Len5H9RfYhqM//dy2FTOgORxn6jnA48ZC/b1uDPahAB2cYQKwWu+f4E4x0T3AFQt/P7LBo4l3PmOZKjEvcSYOIuF0RszA6nAcObZrVbr1s64A8P9Om7J8sTzRZMD/Y76egvi+m2XOH45kqxECI3ipiJNwg8/NZw6UHL82vb/GoIIc+/iy6hl6z3EnG38RrInweGbJ/zAeoVMej2q3QoAxKCwh4O+O7HYi6/fPyy8i3d+68bsMMKVOpoIrg0W+wb4G6REIsgBvW+Bg+oygshP8D082EaIqzUUc50NhpbXyIAnBn8JWLaGcVZ/SC4H6PKjA5BuQj1ppehzXWMBQx24mncY/HRbmPmeb6brYVmh5irhCUbWr55fGjhdIPYu8j773hh64YSe5Hmtgh7Z3GsgnpckvqrqNVS/a2VAoPp1vncutvHRHSq8IvZPIzNroamExZjg5aJnGUrL03mYMzf6Q0q3EbqdSQmCpJ3VquEsMlyXxyMcZ2HNujSHfVLKXF4QDC4bkYPZpXLYPSOJIY1Ro0sEUGF4sHsU7E/XVgsHSBqQAosnV7Z9xEIsnI7hT2MT7NgyJX2OZesANFFlIU9jLriLjFtkHzfQX77RrOoRhfScXsCaiyg7OEfeINf7vhMXndkHc9uCNMeF50imzZ7SxU7UEorhCLblUuNBsdA/ydqCQsRRdHxU43QSxkLw5Rp6xk0mztZrT84Yvkj2jWK7VO9eE8fRsckc/l4zclTeBrtq4mg0GNC556isgEQ8Auy1JPT3Ejin4qfOzrvgW5rd4CAJt3qqEjp5Mnt/H3xfFfSFCQEsy+rxUzbG+q397uycKjFAroQ2kOSIY7CHKVBbr644lXWloFMLaD7pzN7E0GcUy3snteX9t/DYBe+iR21hQh4djvEegOp622qPmtdAH4YfQK2e5m6ora1mdmRmpYhpaRuwvVUjxeJ2aDFJEGoAlKIfD6GtdKfPrC79Eeu0tWvmhYj++/FeVWdfv1n4HoMg/+j9m9ZsA3+U4teEe3INH+nwtFafG4H1rMqWuV/H8x2gAUNqoUlwbEDLP45pvtjXHFe/ZmvhrJLdvFuuO7jtxyawR7raYOHKByboKF6M1GAVxJgeDv4PW+rwUupG6y7Y1rZqux3kFooYBE2zHRrM3nzQ/eI4k7+sOD7cdKjCMEKCYHzqXhEmETmX07VPIJ6+Kj1X+1cPy/+ghb5PkniKFTAyOJA4sksR45r4UjmXBhGbNBlH8HTxGMqaE4P6/hWQuFFE0z4iY+ROarAeWKfD3zuboerPp3yaUDsI4PeAR2JEpLvVBaM2Rhzf+UXkwT2AGkN5WAUTFsSIG8keY/o/u/p+v/DmEvav5ny/4uuJDTyFT8a2VoPSdxBdqAhiQGA8nl45gAcZYIykqMuOZYx/LvdqPadgVsNm8oFQNyZO7pbP+02jYLLkmNg5CI9Gs3wDe3ogn0mrve0/zjcEelfitd7Ig8ofKnddVIYhJh6KxFAyWv+uJ9gz75mwjF6ZPrEpkrK22e1F2XzMsodfD3rE0MpwkwSFkk+o37ikHvO13xV680dbhV3Nl+zG/zyifDERNHveX+xDPO05a3mQIsyMuxLtdrEqY60UsUu39lW2oJuK4Jh1xlOjH/C3+eYdlfqIwJfaPYaUxSCWxcW0a0o7N+a4jf8ISBuiPzENZWO5jGJNx6txJZvFGxqOALDBwXIkSNn1M2/nkIIvldZH3MS8m9JjaxoerKsipfvC06fQLQPW2R+j9oLrI345oybxWaW2pM1LsNVvNcf7OHD7ACtVwj/bPNGQJOMscHue8qZeBJDZET/iwbXxJ1bXNRr23895q1ryWstq8xqN67YwthR/ZrcTW/UTBKQkR2dzMSsuRZRtbs95E0UlRlAxkr3h2anfPY49q0phtAB5f0Veg3eJRe6vvt+gVl6M8P+aCZ/ZO873ZOczoQ2speyiMZsnGyqwdsBb15BsPEVqzXcQn14O2VTjgWou3/9AVmX1eBib9yU9LmvAR9slJyfllJ87Gl96zvT8bGtWKJn7x9pH/jLFm5Kjhwg0uqNgJhAMwyVBJKl7WYsRALGd/Njc4RXc5HhnxjCUc4ljC1pj2yxCB/wgvsftZCRHY7kH2zqhIgKf9Pgh2ltR/UelotNb+a7ZxJCNb0y/I4h7Byhk3YH2ziyEGNOBp/4aVVsUZLDK0X/wfXKw3rbVYmHrqeWjj9ApW8zAc51aQ6oCXAJWAhN0XOGyb2op0SDxTkXVoynkgTFdr6WRhjAi9Or+CJaQJrWm/iFj98vorljD+TU3QNKVYrGMa3hDfHMPn8qn5TRHZUZJbv1mHAVpVjhWDuhnxxYwJgDSGyJcu5U+Np67Q3VAJLlwxCxgfiwZaZyrI1PO5svCEIpwuVIBteTE9P6m5dM+3QejaqSZD2QaIEtog8e3RJxJFMod8M/c6U0GYCjrC/OovhA4BIbRvyNZ0jA0uS/IReIuAXBWpW85kmCjWvj/bUeFz5Giu2n4JspNkPMW5rFOr/WRWrDKgCUoVkICN91ddFX+/f2YcaxKn5CAQfo8SGoPVM9Er7UkZ/OWsACkDDOKnrbPohioAmdS5c/NzG9hfzWCxSuMqipNL3fJu7t33765EZP40GzZD1sQCna1W169dBiTJMbFYztH1eIPhNRyRagIKg1OiQ8oDOLQrI9yr6vdO1nK4CQIPS0RWmVeA98W0DdWlaOKpUtFPi4mFuBG8jXxLTcoWmnN9llYLgoIypEUVhf396IbXAlZNsM3vSH8E8alDS5QS01tgWFPyVDf5t2MKc5r3/vDeHdZupHpltm65k3GJhW+HhHgBqrC3H2vYtKeSAEEVRDmAOQWAsrs3ABbYpAa8qgFMb5FKXgUYT8orJru3r/T9eunKZqUk7fp0HzXXEO1/yDs3NzP+MhaaHF9WCLZ0DV+Uu+/JO0YJx1w8inERkKvQJex6oibrfbCoJuzycTKregZkDp0hpGnkc3oKks7v0eYvOFosRX3QmRldjqBpPAeqOCZyf3eOxncx1cRi0fhrjER19Z4S4I02QGiKqj2gQ6m/HYsnRmd34/UujNvmB0/Nfebyei5vSpbXU6eGas9MPhpayyHbqhR9P6OeYiL1DpL4LnpCnW1AIf7d6Qt0U347GiYWN39f/SFFjv6SEia2WuXRNNm93PEkxSfKCdoEmPRwc6zljWBUW7duWUIc+WTR1qsYqTwdqrJWwB7mFZAA+5xC8oyF/2x2lCMLHy0BD9P5XBsRvwrotL8+tt3v1uqKn8w4csj2TIfKWnj0UrRaB/LNaaIbQZZQ52Aiz9Tezatb1hVCbleTtEjE9D0Ox5Po9qx695TMkOTOt5r5HN73MqqhkW+KftM4SwE2bStbt9qsc1vlAvNg5P356I4tvxfDEt4zAe4U90U7WXojoPEZ7eXuGYFya1sSHowTj0TesIH5y0Scrlrtz31MR6/gAlLbIIscwr3/gTKnQ73mEu9zvl8MTOABSfLzgC3d6+j+ideamcE+Vmz+viaIYvy1AlJCXMm3RB1Z8YgwRPlCtkjTOUMcmrunf86w3lNAHakxfwlnckXZQQDcmQEtjZQAc4A8nv18ivhe5R+665/w4kSwNnUjpu6YjuBsPMzaEqVg7HfTEA+YyxulqGUqVNN0gUfAxZeS18MZ+l586MEkE+P6EY5J3ZA+swxAPiL2ZbMAy9NKgQfWqv/gcmLxJHI94ZoyCyfm1TPdJi2+XTzLhBKvkENWb32DjAjpPAOu5aO4FyIheysj/ovI27TcOEK6vnIU4KfLlAHDBVx2WzCVcTt97HP22EG0YqoAUeJwTr4R/x1mlLqpXMKwKc0K4Dz1JUrPinl5nPp4jy6UaCjsiDdc4sd78DmhyamybuPs7HOLinmyozwX8CJWHEz3PYN/sTwTw3XIvMUXvpOr36prnlIljvrXl9KdgcRPR4Mhy3uv8citO8HSuI63AkFa+8ZjmVFTR2lAs8dy9XCrWWY+z6bAzRUTd2WHdXB+AdAWHbX89Zod+6m/16VnWPXxoCd37sniXGk5XtUJsvVYHy6fDJ8/r/0XpViGhxUjtPbI7VbtH/i4zkTIPBKES1kbnHON8BvvTz2GL9wNSTeOJaOz7cpfykGWKuKkpvfuHSUMHule4UfwcFN5/LoWcOBXwmF+7NO4s+58fFBndVx9PMPza6V+ykhQOUJC4vbGl5nLIfiX1Rc1Z/VK0gOORwSOTegM1r0qmlp1H5f4py/7a3zthkwPKwxCdjZzmG5Hf/Lobmm5fH/WtKGX4pIivomeBkpzCJk0HPXscuMkPy/JJpEGvJM+xEkGmwAXqmHqQS2aoPnyvisFCj8C3IFc1XQ8y6iYKtldetShtR499w7SuPjb+pwKxadYhLdYlzi4U0qZocXzCvdiFLuquwBM6oDgT0YUZqHrLqx0ZSZmnR3f9WPIIDJEKFax2Z+t7VnLr09BYJaxVn5BFyglcNv2X95GD5uxheAfGcVL7hzH6XMsSJLKgwFfN6KHz91XthSaXYjRXY4AYCUuEii7siWInfKHbu6y1XM9c9hb6DHnIJk6rD9+qF5gPFUjRV9uTvkW8CNLrFMOvPdjfBqpBRGbZ7lTA8lJr+ZPajb/LHTgp0iLayg8a5J3OCe37dfKgbAYkxmIfbUwawxd6/xFtMBw5EoneXiH1NASYRx6ti60O0vXefdYxJBdYhP0HRacCn+R64l3kCxFaaiDrOHFslECn4jB6iB+qQUV3OPABlL63ngqw9c5cKim7y59eYkw4XTnf/mnI8Viwpik2D8RWt2e/jh1+4QitS0XXXhPjgfOPCuknuxeTsvjjFkO9nx4mvGRGHZuZU0V78pOf3JH4ewyBbAjMdh1U1xl87xYpTGqDRIaTCyHrBv53E1GUKa7QfMz2r3EzOfYhf+yxTJrzhHS/LvPo+e6MhXmaGae1r2wcgYTFhX3xxl59iJMZixNzwLfJqIjVbZbDZcPVp9BonXZQV5npZdf+woYXFRvsjOheL4duLbdcEpbfyw7cuObtbQMYukKbGR//Kr6TwpYh2X4WThGRq6bl9KqDawp9l/+bT19JbwOp8glt3CctJG+EsXaBy+o/sg+jB5siz4Qr8Vz3kTwDzuBUT3rv3TtHsGDj2b/39Soxqbx0Af++h3oRrh/48p69p1kxHqd2Z0Eqkkpts8bMSJ5K0oxtuQ80V07mr7TLjcnkOosaWiW7szYg0+9P7q2pjsNq6jqRXfvvWUo0pGz33ZrEkU/u5ONONjk542ZMGL/LKNBm4ZOVnayZgFkUuZeokExVxq6o8u0w9LwYRjQf8xtt8c2v9Te3PT5HX1ELW/0uFm2u9EYTbjHZN0TdBrSRJ7jljKecqmOCCfB82oPjM/x2wjzL4IRzZPnyYq1RrJNeAqBm00FJkgEN5O+vfNO7UO7Y46XgmqK7mn2v/fVT8O1/B8KeMNLTAd/USVOqE6ygZVQ36fYQKMz0sod1tXfF5RnpJjENUjnmbec/4ci9YRMVhScdxURcCKXoo71WAbBjmuJuCWWa4EcDPuw5MS1HI2D16IIPERvnHxSinzNnbKU8Z2ZpGnftsrtPG4f1yHY6+tHBZ3jBz0R2pgFtUIj4ymxUZkcUwMyG5a1J0POqwV2fC6HwoeNdpsAlp7qQV7hEjzx2uwj5CMN0dXyp/kQjFTPIXlu1dEKwdvkMxZgMsOppxeX0Vfutt5lpWXtkoTgj58kn0whX+tKi0AiuPtjwYarLDlcqbrjTBD3m75SXCa26Vw20vNrklL39aH+TzoGG30MMb6hC9OosoKq/BJhZ06O1D8cEqcMq8NJnN1rYL4eYgd4Ml3b1ixEF/IC6rY2A6ibc3SD9F7WrM+bRZLyEhFCZgEIglv6xDa+vsSpAtLZLkU1cYeRxgD9fQJyjBbJeOifEpRG7O9IyX6t1I/CLD8n+5dick4k/K+0X/SYPTaoibYGTESmNiC3T+qXVyNURHAst4cKqeVC4SiQMz7xsvr/HxV0LIQE1XFCBg0WcFPeVToDS5NpepQ6R5g487KsLA11zv3+C5R8O8zN9dPJZSyU/P53/Vs1ku4qs6/0sKP7EdhKx5ypuVLpt+SkyRxyhYVynIzXPTmHFPmuE+3d9v+5omM8tNBajbltdkIoC3LLsrSXMcDoJvSedIx+ZvWD0yE3fj3mcgznxbtV+1X46ckA857VCB89O+5YehuA2XJZRKdkwA0LvQXfw06PpLv+kAEDvvWJsgDPlU0sfZWFk4BnXitgM411w04hvjz/dR1k2DxMQkLiT8ud34s6HsZ21X3O9S0Wkqiosi+2WiXAPPX/ABcIgTuxe6LWVx/YQEMy0rxQZpiFCUEJKbpZRlRtiajzTVUEt/pJBVzK7JmXUVg9LVHwWLtFnqHfUzSR0naBf9+UtOgDd2v/oGGBZ28MVvrGNYyV7UL1IIl7Czuftu1RLb+9GnnApOeuGEI+RZdD01rO8uTWzcPr4bh6uSp/h1sGt1UAv/Gg/M1GpZT+d2bUsKrlQioCxowqkSJkFiz4p/ocFWs+Ah3MtIJkVPAPCZTP+6X0TN7tavpY6XvR1UJOuSL4t5kjXg8dpHwaov/A6wav6msw6ehp979V2z8idWVHBZUpmMkgIG3Ok6H1lcCTooFzhcJyoVubR6vQWWYCV4yia1v1HIn7/dj/SwgO7FKKXWLp+IcwJAJw5KwAR27RJ2SV14xcDScqEO3yrnqGxF05ViJvc/DlCW/53R+0+RLTIwqtgIp++HQJJCAX0OxSlY6xz5CrkCPsslujG/cuMiE3Ofi+2/rk/2HvLaDiXLaFQYIGT4Cgwd0TNLhD4+6WECS4uwUPDo2F4BYcgjsEt9AEdwnBpXGHZrqT3HPPefPeL7Nmzaw183rV19XVu/yr2rWragsI/7svBgj+WcYvWWlpRPfkonUbx+04kNi/0Vsbi6aFZjP5xP7E3q0cp65mZ6qz14zmJ9Zd/bnSKE1fQaunS/3r3/LMLEBTU8NKYm0TbFJJ1qXPzHNzZaTbBIcSEWMFRW6uPPd8WSpeEIS53eRqvtXcsYhm2RAwxQx2eUqcMYGp8I7mvFz1U4AUdO7oujDp0/xSZo3YhEWIrsElDeaYJuqmNXtHb7FsY4FnWFIWcVbDoXWy1K1GN4NsBrL0E/8jbsQIU939+6ThD5PvKe3GroPM8JC5QN6smplmblZSVczhxwKFCsyhdO/pAvT0v1aZ6n9ox03hNFaswHKv3bep57ywn9TVhHGo9UGnAQ9MK2yQ6ZsV0DguGxfN6IQX+qBVYRiV/On07sntG8eR1x5dfLzI4NwXxshMETTu4YkcBMqvMg9L/WOUXzm9K0QRE9LK8bsYsPol8FTQmee8Ez2IvuCtgLnkP/pYkN+1ZYeXbdICHv7yvIR9qyuvQZvcJ46bS4Ff+2BQL383uNeQ7pCdnKotFY2+QfvZZqQEZ95z1QTNjixFr3jjFDbDYNktYZepKN1EmGXWdtdxrl0Nnh0DQ7+VRWbqjGG6jNILyUcKwIWP6ztg01+mffMq6EqzRdLOSjrYDDPJX+ykQ+AeSQLnI2nGfBWoMoaoMkpLU5AI1cabWDicxGiaht8X0ii70+9Vm8YHJNK4+4sU9ZccjpI1oToQcAhSZ8izN/rhLETCeAigaBewZdWzPgYHU6gZj041mJPF8ei13cYOeH2mFPICXxLozQClAwVevLdBkRbR0UclalRBZrPac3y61Lv6UmXs7epQ3uTIxksH6K8SIX9pNqz7xIkNxwywUl+qq6M251KM6Xq5G0oMEeqA1IWNr5ApxXjTF9aaoraB7zGLY3WzugdnANP4ZT3M1loUWBVAmt6ZcaVt0QB7ukgad+6JlHIqa85VFqAAspApN6pLmny+c85QRzys6cdq0vxJUvzaCIexA66GpNyRZxeLouWuWt7bhYvnAwD7z2zD5PGRLR3kk28PnqQLOZHkeOuQbeBLivNf3p3RGhb1gtYu6CTknVYoaDOGoJ1OeWph+o497eyiWtZpuxCDQOHkbOnLUKLx6ECvEI/uLbJFwqJBI/pO5DRMIunQBI5u0DctMdSqxuUR6YsCmjTL3VP1y+SSOIzyqWjoq1hAJ4HPqVtImfYHAOxtW9vdFU2+EDHckyoO0Lgt4WaQfEqp83SoHyQNJasnxkpFi0sBmaWt1/Ogunw1nSi2mWhq9tH1/Cm7Y1C9o1EP/SYqMk2YTfp0a6Z8wJVue+MmiRn2Te3LjgEDA8H5gVoHLX7xzgFNqpJvW/swTchklEHsY3dk+BRTL2ta9U3yfDq+MzVz8nUa5ct7PWM/KoLYfJowc/6ITdMDsnRWp8gciWkP18xK7ljnQariNikcUnZdl5KKEm8vw2cs0kpkhgDZP3ptSSIFlwzvPCZGo75SNfXjW++t2sTfopNW98nbvVjPddar+cEoa2UfL9kPU57YRNh09NHlN6oIM5J7AdMFQuDMBpTgFPJ/xzbd3jlHxUvAbxqt7SHMnwIlA2EGzaDFOLFJswmS/dHFa8sCY3faomoKw+/wMzVGibNF2T5U1mRDZtMxmGyQkt3xYmHL9iakQWaqcIQn0C6D6fp0rSF/VdRvsupyUhKloKHzkwWDmudigoa6w+rn6sf4998K/JaeGvCnGADnm2mOZgvU5wqcHduI2YSbzqar5beAw6K0KT0Vtfua4c1lQqE1w7VPc8ipQuS3uhoaWXYXzHQq2daqFGLxs+Jz6tZuPLvPrVaBCrF6O7R7zDR0TdZ3G4JqwK2W2GPKple1E8OcUzokGBbRlgTi9qTvXJTCSpP5I+etz9zG73Y1fAAVHkKve88/sEQv/9KEDLArjN+6LVlTdzK8fxtdZ+YwPeAbgnV9fkPpTsjFf/lZ5CVibM8FmazL1/Wx4vSY+ARN02dke83SGp6hMySI8ElCHLsbqmDifOpR99r0mPXvID+t8pHAGhkwg8vACUMKcixI6m/pY+NPpawb7xJjl/UuAHZb8dBK85EPCl3otCBZxC6qbcdtqNpperiwterbqa4Qn9si69R7CRjfTKfOcyjPltoJTkqLbua7iAt76dwPYJ+8VPlBWxZiSHww8mjvbCluqE3zFg6mfY08pk7foX6ANaQlrp3+csPAQ9FT1TtyWamW8Mu7l06duc6DJtlAKZNtM+XQmQRCZyblFUzLLwCsEZflot551lf668ldGMVZX8XZoO0PocuM7rkghtafq5D//LxEBCnGgIZ3uaUZSvILAWZ0qA+vUoK8Jkb0WeQHc2Sqzd9zZILNmQYlWXFin38iWtHNBlnZr+5HkTwmrUGWMenSXe2K7EdfEDgN/WtlcU0Z52RXGSPiOwNMdhMpu3/5pXXdot7bwlhZ5Iu6s5jW0u2hDb3SJRwE0lacUU3XHPuXeqfoxxzTD1wVLipiug2hZIMsd+xVqfn77alVOipmmntZ4/t74STwvjvcr+oXFQyuIj72XYAEX/9FBoKBhbrGO9BVrd5tI6xCVo1zbs7G3IdFJUPz3t9tMw2R+5WTPsRwSRkktEcQRz364SAjnvAtrXL4SpTbpyHQ7PwvUfbf+uO34yfjBjhhhldg6rGWfcpBJbMiAqekAcTPYSsjWLeBczUKdh4BNh3695LqhGtih6HhApOlvEYBwfarFuvfvzWGTOo+27ewKNsVMMeM+bbgsJnud/Nk6C+NZL+pf+ngbBj7KrTXtMxV/rL35CmVpGkL3TPCt7+dXgU4PjIDhSi/4a1338SktVAy+2XHYo8t+vaGnfm+fVxMysIGUwjoGACtuDmMmK1xqwSVgKH1HgkgTjcKNzIM5ty60zZJm2f+tW165/GJDzoEst5CwkgtKqnzL4B9hJoV4CyZSes7X02ctJ3JZv7rygXzSRPNNYtIlplbUPExMPw5/uAxfv/kwC+9Oq736UQwSliKDUou8DmX5CJDWyzPFz35cwdswo2b/lu7DiOUAPe6Z8sXfLL6remmPPa2BYs4/IAbuP3est6lxI9dWxq+mKBxJq2sGPLSSfbtuwNd7SmA0Nbd+azklEym2cF7DFNrwhpw7nwZ1b1NQpIPtt2SKA4OTwY6+YWtjT0n16ShDm6x+pz5aq7iFlCxsD3zXKb9zUQTbBFIeN5XtiVcFU5+KDyPaOrNeCOwYsbpAFGXVLQ1C3UTt0Le3ZPyTytTc3ZM32DGnKlqF8laOcur1HyJCL7IRd9Va3h1Jkt3+El5ZgdLuxTtBxMCAi8YTlPb7E6X1Po+xiB8G/2TxR9+LH4jtS0NrT/0dIlzxeQgHqLrOs8ujIvCFSSkoj0FTSQPibk7L7EnlJ7m+8OSdQzkL6zmd1KHSR6oZjgXKNnp/YOLi2l3dFfn2n1djf4ayxVE65p/sQszE/Z3jrHFg16R3TmhlaJT82r+LbKi0jVIWYwA3NKYGr28aZEzW7kBfr07AfFJ0rBVIfveqXoHFSG2QD3P0rHOg61OQVmHze6GOnk4gN/eFuO6brwLd7TYYgHhK27s877ClvLYZqbj0c1G7O+kDM5Lm66WL/5976q7peFr9t4A/9vvS4M44ONIvD/XBsv7M1OvYxbfOmveZ40UsAZWGtWwOYOiU9LZSuQ6LGDqnfq+RMSVrMIUQO4Ay2Gyk/5pMymgJSOXWFJZGSxf4ODjub4JzvT2KFTYJLqajPisn3RuYVl2L2BekLaYAeDdMmn+dWf3SL2ZL6k8Pm0adnqKzbflpClq9za60KLRNHrRrNxeo05r43aO2PouRnfaNAt+Oh195cX47LLeu6IWhw0Wp5Fim+jFWpj+iXRrkJn1+nf6Jo11YmX3xhllwzrKmXSSmvLmUpP7/ZhnvjJs7mpjXzOcx0ir2gRwSF+Ypf/FM/PREbRhErPYRwpNuA9qamtJIZ8Tf2Sqz2B8kivThG7g1PClvEXKRTuoRVTKPZIEPA0dItC/yzbxU5bKoW+6GX0RwV2zjvwU3Ct/OyTAKPPjP2UBanZmS3Yu3SNxX1Zw24KlqM9a8rR9OP+cFuywZeClPNZ1ARaXOHlSvLVkVdgvgo8UmQYWR9R101T9AqmmvuJo10qOlIhdz6woXOJfGulZ2uzNST12e+sJatNo83PblPLlO13C5aJz3q3pWDqxfuNtkZOz+q043f4XnnkTZZ3oWj7S6/XaccZhpeMGyZqswog9mW2KmNYB+6Rc7rxGYPp0KcCJ/hn6ycif2mN93JQrrP4jV+NY4VKxODhOTCRj9zOmUMDgdxPKspaqcg8HNpTAxI3Of9imEOjclabMBsGittllw5/Ad/bd0zM3w+1YWeuvY8oNN01fx7kJrhxMJg0tRtXC5kjJHHSOzK5IJXtj76ZH7n44mIr/ZT3KccbJcFpjyz9tEmnogignZpFux6O5JWEEJpIydWDhzAI+pPJWvVz7GyfBkOwfRj0gHDpeodHeXhI4ywy6sRUaJwiIc4HJLv+eYfdlIOa7iOdW/H+4DJtLoeV52sr+mv5iiaK/AwkuMENcfFtkH0vH721Ae7cRLKXGCimgggZzNht7EIkctMDf9lKCUj/Lw8zUbMcvjg3wQVceyNeeoJhFV4Qzav2SwBnyObFHNKX37LdDd074r+4VLNsAX4r+pZezl35xLbTa1UbyyBRdo6154q2nbc60IFFjPC2B5ib8M+MUfehMnnnKVLF7/ra6zUvVeK01Hd0Ap3/6Yg0Q9SapTk9zlVLvW12voiPlL7tjWwY4W4kWdgWLzcv9a1bYP1hAvMRy6TNOlTBDetA0gvhbGiwb05owdTZVGMYwpraGNvww4cGvFHNqjUfwo2vfv10UOu5am/hLfkqB0CqC/RUSQDu38y8Ugb/u4ArG4myVzCzXP3NB9/9q96QmPTfejiSWjAZAaTBw+sQ1oozjPt3SaDiFK/Un5UjTGWNzyEF5SOg6WQB34Un3r/narfeROqOErzqLd+/HpsEn6owhbF6nSxj7JhO0o+WvOehJQ/j+3GX1NSI7K20UksDEdaQRd1Sm4HIk5tIbkr/xJWXZrZOl/ZWkgezbH36Pl33cH52Ztn5J+EgHvwYV24CaTEHF6c7rL4SFaixBmvF+PFtJPqmnrAna/ygl/c9VPDTvEb4U6LfzLyyYnzXiSWu8md8uCfpHCZVKv4QMqXqmwp2PSTFK97bVK5m07jdHBDsKplD5uCYQyna0zq91iSOvwG9kT0eA2luJXRHASSjpEZOilai04Qn8c37FU2gkfG4RpOIhkFI9UiyoDOy+OkunW1v2M+1HjDv4GHWI1QguHqr/pfsjQr+HUEu5XrTX0ukvlUhSjgHoa/DPCgd7hfCh69vLn8ut0w9eE+7N4v/i6XirE/Sq0KSvvPTT2p29a7yB9dB5ii+pLrQje/iecdpJ9V6dLeUTadfd6aYT3NEqmTv+pbwJhUUhiVIP9KoepgThw/e3LiMU/xpnGqBXTrG9mhl++P0m7S26GcDn739p9YCuEPxGULBBStmv8n5qzdwstAOvwK29OcpOMjNaMzAM5joIHWo6Ndb1miF+yX0c7W+TaytYp0+hQ4YJ9IsFlvSFrvO/+F/jtBL29NIiD3H1nt/QNHCWeTbeUFEMHs5rYC0O6Ltqc9/MkaJfg0WbEgYAr/5wU/G//if2BatXVNgvenL+Zr5M8nPrV2sX0AP7bK3/G+Mt8mnK66di7fqK71V/FnhYqBV2HDK+KIt4LSUa69IZXXvqZgXnXeWvaAAQgGESjvuymDqfWFMp8I2DYipIyrUHtsB/hS7wrbU0vFPQelOcPtZiCJCD1duLy8/4lpiw6NTtNxoygSZ+5ntZQ+VNBNk00JCxqYRhsd30Id2/zvWY2lXfuT4XGseuEM9oSPjFT560Z+FattOSVfcayF7e2Q1qKoqZNYJVfZIvaQ/+NykilqHeDuwPlrVLcf2N9C52l/1NsZHiDnK2t+bkDVfP+jOsTq1VVzZNv/oJvQe/e9LwybIks6O6tZR+aS200bXsgUdwB16zA5/xcI7BMbKlZ/B6qMm1PU9ToFqjiN5wlexDaRfko/Oh0b02SPYH/C8jnbCjQZmEf9v1dEKYcmZz2brIF3HGcLSxpYcdw+NDVw1HzS9ZvVUlMBVhdna/R9kzmexuWkcls/9wqBiFhgOzXXyxuYhgX5ficLFJgrWhmLxytLnojCNjwxwjeskVDju45oUNzCc9fEmFck4pjS80T3xkShskworHm1A2S76KpJ0avuegF/qNUWAitrDb8bnnfxAKNnSRcxqKlwgTV4ybD9+cVTKeQnCGrs0jnrbGm+uZAX+lQvl3KhhOgWKT75T38R7fkqFd7PRbyBK6KhnNp/DNwb/n26p1+NoM/GMZEmYO8m8H7WFYOxqIv0xKhiWYqfU2j8N0iJiLRJ52tfdcYw21/DmhXxqjARWz/NukZCbzYI7EzRBBD8wU1Fq6N0UF00XNK/Y9+fTDrFaBf9+//d0OLLRL2Rw5WJ78MfH4W6dNa1ElAY3P5fpS06W7LyZ2Ai3sRHlp6m9kqQq0NBZYaW3tKtCk5ZODiSGD401tzbG/RDlb6JujVZSbvkq5Ri4U64u6cxeha2g0NObYwbSYG2abTLOCh/g971KaoUNGyjXAO7vC6uLttK/HG2PdrVv6gOHd2WUt0gCw1d9obtgZdqubikn/oUgbWkAO90Js8aL+81CLffYh61Jy6PuYgr6PXdNKON2txRrIpNFIyq/LG0DtzYtOq88yImlvrWGCzyuhisNPKEEpkRJhy6ZkwZyxbi07ymedqc7YwIqhixq+yoPh9MMcn1cwNP6J+sUvNP4vBiwnULGgIVAirMtmELqF+91b89DeqmV3HFfN/8VcCnsrE1y6/P/iZIqDTOLLbSvj909/z4lzhJELv5Sj5N6zgJhvcbYEGMhBIeQ+upMNvKwGe0iZUlGZQxLPnAtkSrGXho9m0AXDvSeevfZd8l11yQ379uRccUtG8HogJ0XN+e0NzMIGZrEG3kdhmKyccmvJ6ih+27dKdyzP8COxGF5+MnvBenfpXIF8kWJ42HYyIBKULg9KL+lMxgiC7oELFh0c+iaWeqEbeF/O3bKIyxrOyqPh1EWljxwZ8qkysEMq95ewUy45ZIxUAj5PN6rTdHn8jJKik8UwKWhyjGewk6cqPzy1V6ZkTbewfeSJRaQReCZpWAEpct1889eNPlgFtoHHb4JuDX9dxzz3YuTFST92cX8pQO2+EsUvgfrQn+VnLHU57F+ZJXOV1tG+3HjW8Kw/8rZ58SibmlfqeNYILxwshbOhkUlFTT8Tse7EloSkpKmhK0TVNLAU+2Ll+jxl4io8Ocv/PFJk5vv0JW37duUqRYuTgMkuLnT/MOm6qd3x9RDoks3rG17rxBRww5l5/t56Xz+LxoJV7tP2hzd8qV9GL+mP1RLeBrWGy2mRPxdb17N6CvziRd+uYFJQKuYiD9I2Ob+OubypsFdnNcZc5s3vUhm0eGP0U9tqkJOwPV2+GWBr+3Tbj1Z3ZfL+4OZzBwW2ro1d81rVU6oitMR7OkYFvkLlx1dOJctwzNavtp3saj+Pq+RaWBq1ar9qiqYYaaKJntQiDniZe7JezL1uHHj/nosHZoby8dN8mJbUrDcBXE6Xsp1zDhng13P4aZbggPKS4VjmGGX2ZeZqQR1KUNMXO4PJhkaVKtZc7ydktgElpTjdAzwdJWumBWFz401fkFE16ujGKRPKYdJv7i8rxHhG3sFonPrtJB/DJkG51/HP7V0Ev3vYHEZJujPALh0jDRw2DX6bdGxLXCCZoFV2J6jhdLocKeKcXPPMNE0SXmv1HdhFzU33HgtjXXzaAu4xHiqPqHscEJOSabeSqJB48wn/JHrkGCJmd6wTBshM95pJqYjT6/lO6UsOJ3jsg3KLl+ZRFC/O/LPVquTkNl2vbEzAZOl19QP8W9CORRRlFF7FPiMqzLbsF/sSu766z5ia52jTGr5r4tNwLwhNhsqDC/LVpz4JruXELboqz8u/2nMx1rj5Aur6PvTxWvPN1LJFCMt3AVPDpkUemHGI3oAQW9JQt/W5kKlBXm5S4cIVCv0f4Aqj+aDeJ9w6LiV94ubGOjQNVQMTvqpjVFVBvSV9o/i61e4DzU47lCz8FvYe0nS/bZmp0fmpT5gMSdqXVgiZ5jrnIBqnLGtrlYcomFpv5y6CP8p7NqeFY4UbYt0qjSmU8d/vx/X6hJUxY+/hbeVKmOiHIfIbOV0pKobx4bbVNd/EhcPMmmhaC7Vr275X+FWBpd538Tq1VyuQOxG/24WsB0hhln8Ja4XIHWTF7/L0EHJ0mwU55fW/mni429nK8r+8fbgqFXkQ8b856HjYJfC/PVmxvixlK270f1h52BPxv9UWeagUgVxod1w1PNz89IeAH252tlYg5CL3W/73F6MdV6X+tw+Q+yzIgXZHkW2qCGTHHZr5oR/EuA7lNFKP565hFrJyd07ufxO7ArEXud8R8bu8FXmY8odcrOw1XZzJC/Y/nLU8fLU9v8/KejiS4TrVftgi94NcYz+c3mw9XB0oP1wsiDxiuFp5OArLus6KOPcF886IBUP8H44KH253d1buHlTkERDR4GCfMKU1Ubi/fZ5CHw8bdjMPFzMnuzc2CpZ21s7ssOh4UMDjX9HPctxQiZjg4Ib4H8FR/WfR/x56yeZha5ORYemON9MGXlmpA7sXyU8Laeu6UzZvlizO8hGHP0fltgpIaC2eAiDtSkyUTyx1xWljdA28RmhHtvn22sEmCBcFEPXS/ItI1BQrKvew8Y+7UjkJTOVwGXp7k5uHyQq1g/v9Hw1hNweHMaTFTDL30jVqlW1VEges+yp38xq+zWoCZ30xvgndAhmkcjWaFYoppeefHvpifvo59x8u32U9/GyAVCWvFCWV5iXNv5HCKeZemX05YTUCMZ+p2JyM8s9f3C8fveEOf17GG5OofzLal2M4MhdqnGkHuvLbA7imaDHotMQkMteR2tvlzxhXVhZcpiEnmNyvdg4liuhkfRJYm9FTBWJ26NkNkk+mF3/jcWeIXtH4vDI7RpiqtSH8o+0yMfZqZNafWWZYU/VKUda0v0JhdaPhNMg3wZdiXOhB6omqyvbZCLg4bGnhtNTdPtDhtqZQ3l3JpUJw38eBPFi+k3n8BJ7pcasQV/XtZQIFhf2crhDnoUulMfKYsSIGZlAWCvG5uTrRR0ZerOshh7YfyklprNkkJNbsPm0u94ujhVl17D71Vz8zerfoU9hE9gzu32zsj4DO6TtaPe6GI+k7BB+eGAoI82H5Lb8ttRvNDDAOihMc4LryrOYyn0Ny533cdgcmLy0kY6xJsmor4BqWMS9lCDL29cjzvkRsNGA8ICHZS7tSV65quLJ3On9gPo+5xB/LO4+NDdhbWb7eTbgGn8uzk+dOTi1P2Su33s1ETvkbgpc/oqR03JwZXfYJMfpVCt9nW5zfYQNDtpfVBpofvGjMqrxvaQBmTj7V9ho7hyRXQUD1qMtDTT/jxUoXMgMjyDEXIKeyCE+j0t6qRFjbmjvJ5NrjWnRqJTzijeXlx4JnbvhcUkSZgVLmI5xkjco6u61Fk576ic0M2m0vtNsWDc55OEb1hwXtF4NSC70qBz8cPfPqZD5zMs6hr/y+sPbMq0p7W7Xy++mJ0Y9yefYsFkCT3v0Fqkf0kvqKS6XfbBt13eizJ+CFYnw0sdQmXwTJyLzV/qoV76UvwghV4KVrbe0V9Mjk8bycE91Fe0avSr6SKMiYhlvsvWodOkNG2qg2uR/O7A+U9ZBHjMHdCAWDX4EC7rEHOwiyUUp4Khl8XhqaFymlzu0cPMKP2dIwrJqSOVTs67EApxOIQPErkSeEhCsiXI/8yM8KitNKgg+ePI6djLkZ0fpuykhdN9eEHxc1Zc1qTMTAW3JuMALx0vxUtnj09SPvD/LzE7CKzSQ295AMjd8XLLLsSatvilKVtJdYBU3UMkPRP1d3ZTsc86lIg7dHEAImG5cWUpob2iWrFnjzryqEhatuRhKmwjr94ca+roIW+e3bgGKaeEVCcSyFN6LjpvcBeMVoiLJU5CHnkSl71MqX31SVfdY3bgByLQTJbtgpbi+BBISMV7cnUXh8XQtDT9NoXzX4hNDOoss7VNAxdTb9KMIIxQaW6rJbjhljosnpQOJLW7bsXbY6POqOFC+naR2WXucJl2JMrxRzJ2WmDtXG7tYXkLO7CEOcdiAZBfKHbCI3b3ZOhNDzz7RWMuFLTukiRQ1KRrk/+5h9WWQK2oY45aklaxEGSyfltK1uFe3u4bKT2Wt9GlKi3Tdg+oIhfa+LPZX7lQeQ/JaERjEVXhYIEo+4936LyX6TxuNFo+ocQbP2ePYVte3QZwDVgeF8ISD5BRNOvuEHLiJeatX5UkDCS2ac3qWINaIWKtXxSsBTwlH06K0NYnsfE9PLATKVRSHBXFR0krjSNuuRbA62n6t5zx5IKTi8UO7NN1RYnyPgkbQbcCyJaBcrIZTrbbPi3+aSWbwkdIcb8TrNDyI8IgJuXGHIJtCJRyTixtP84DTtSRyNoxm1AKSdEAHhsih1+6gAiS+ocfJHPnBZZlEq9lkA8C6JIix8QiVlsyil+iwGolSNTdquj9y83pz+oLScdPLkY53xytEeK8ielDBUqgqbN20KA2p0hn2SHNRW5cxkulFJ0L7IeaV5lYOc6Fckn2hTBCCwZRhqfFwyjvU+Nwopmwn8iGHgI1wJkO09UKfKVSwk3REVZ6MJ0ZJyU7RrNohydH0J1/KHULzDUgGyB+7XfEDyT1UaRT08RjUsKWCwmOpC0gk9cH0O11IdLInzWolG3gMXdXxa8lMUZzyDrUL+4BVO+Fq95HEUczyDpVz+h2e+JRviuYL+FKxnKDgVt93rdwGmfBDR8XyROKoNbBrZKwQiBqg/eIoy/vkugOYrOSD5CAUn/z6Ai8ifQnWeHJBwjILTex+wBguOkwOenqJUK38e+VuWCG+efPej0I0RiePawc4HXCPI4kBEkeWg/sldQC2jPwXqEQqQ9i4A0dKfQrGPHJB4gTJuehcg6eif7QELnqGo9dwF7MPK2bhGsMwRiXNYIsea+Y9Zful0LoRW0BMiOp8oEod4hTAILSawViSO7ic2jdwtgiUHRDS3UURFEBa8QWA0gYhqmsDy38LOD4GIdrn6Z4chH6BABwSCbAJENAKaCc0P7DPegv/NTEfk/5EphRHc/6lHuV9AWy2bKRLHAw0/gohWB4vEURxgQ98NQvg4RPRTlEgcAxgbbxQaBEJr8lFEJenjP1ofd/YoSNQwRiKbx/Ipg6wnohUOnRibXCqi7IlCYC1jAgXqC1QgrUIgomUCtEdpAIk8qOOmCoGSjgnQHoUGuVDVehQCBRNfQgdWKqJljmycQzfNBwfKBArDTNk4HjMcGtk0REscuoAEbsYUUcVMxexXG7hFj6QDmoPVs6lsnzEMeSCVjJsH5EbpZzPZETAMXCGVAEMDgB/fvmZNrcLQ2PBEjsixzHbq5v7gTTkDzdQa2lJiGtkWZEtghVi7HNR3MgzqsZyhwHTCHKc1DMIjmqFQneYGJDli4pgZBmmgzlCIwYJOmMAew6DNs+oKsRKDGYqXbphqSiMDHN8zagSwJ2P3ba5k6sh0v1/vrvEuKXdAuEVlE/wKiFkyyrl8Cwo7KPcs0qZOxk6sC3pf2/q3IYcMj4JYhR9cNm5a5GM3O1llLg9Yt9Ees3Rclfju+Wx1nr+O7Q6pOYjMqh1dQmgOWPua7f8E8ZNf3hpv0py0mRzPJFznh/26+POWAq2mDZTIgID1jYSwJWZ0CpWyIY6vrZqB1QeiWh9kIotbjH1m76/IKUJeH/Y/wHdgk6Z9YpzBuqaY9Huwur1lF+Bld60w0r/bUdpaD9q4xV5gr4Ar1nMoC9R/gVakwpJ1r7/V571a0g4JuOh1Zvb39r/uHEwSEGExHF0iDbLib7pJ2Trsr0z2vzhnX7l/WNVC2Jh7UB8xnFvk5S/Bu6Wjk5dzNDF9DSAiZVQMlAwdIzQlPG+SjnfCYyz4DO9+s3H9bM7sdPi0NIME/SCEPaVCyJDP0el47u2cBOJkQdPcnFWvPQP1hF8TKmJ30mZiGYjtupoXPfh2WD2s1FXDfIbtefzUTrRcWwAbOM1K09RXAKBVBu9HinqxgbixkqVlVY3TUamVxqzN7H9cGPCqWeRxosN850olBpIyeoJ1x2XnyR1unIEY+a361lBeLwE5ErrPYQYKUBWbrRGTGa+2g7YEu3VmCmVZ61zs3W0rrRYfc2Wf6WkyXkj6tuk13NUCD78A8uNcENb4hqtbHM/UnBjQxQLFEphBSiro01wTxNWUQUqj5O4WhwwFsy3Ii5WYpjxm5DCkohlycYtjWJgTK5G0QEGtziDNl4PGoFlI9TRMedzrLCAAiII+RHvtHj6XvXtzJbc4TbyjJ7gFxjsV+0pAQ3X2jhbEiNsXVv4ofShh7926zz4IUk9QG2buxPOYeUGnC5kl8LPMlPj8GSDB2otGOlS62WXjPZesALVUvZ5oSdROPMNbL5qhT2TFOJ9lAst24pmgqcJjHRrlHhV/iY3naPASXROcoP5JW0tSITP08UBVZ0LBrHZR7cR99ZG/O3hpZ/EOFVGuekKf3zjvvNihP5fKF75R3Su7UZlRuptoDsClIRDs9WEs4FG0ZYFmwO1Ovz7nOAkqTwp3Zx5iG15BJaP3sUW34p0oh2ZKObFcYxK5pMwwiilKEgflW6ZESLC/SnNgHSNhYmbKcwYVARrD7+9a8AD+E6IUDGm7XysP5MlZlnwJD3AQftxDFMxK0MgZtk1y92NvPjIA902ppLh2F/fNqEbMeXGlulnhvhd2NiEVhcYo8W8LSrFqiHjQyo8K67f7oyBeJCF3Vt7eSl9iBqwEzYTN72yf5wBOzimlbs4pRzb3JFSn9Fe8WqYyqe0FvGNaZ8B8Vv6O9acHQkcxpiITtewhZFixXREqni0GQhgVzysmA28KtXfY0Svi1cW7loBDV++rLV4T7twGqZ7P1/s8wU4gCk4JpeTLy/ZTIboZbZLbe9UoiMbwg47Vcx35edpQzK4uksFzO94Excwhazsc28eYwVdiKeSCuz5OjxZfd4nkY9yUOxWgBWZUKrH6u3JczjdEOhWbqtJWSid28867j26R0eOcpRaaUTM3nvLvo+7JP3EvXzxlzm/4oJzOgP/Q8FyPsj/r/ZmR4bXp+SR9qbtdq9dlC/h6QbRqDFVqj0OFHm/nhD8HkLYbTCXbjBvBNajEUILoLPARkA6uolJsdg7nKsqLcJljo1OjbSkBxO8EU42ZkxDb7mnFMyygSpVI0uNBR7EKdBSLx9Mso0pFG7uZRmg04kYkNmWo0Ci5sLxdfV4ngnogTY/H+DZDBW/5C5NJ2kAJIMVCM19R95nsuJbUp3zN+FTn8ogey1IqxfkSQFBZhItuKZXmOLS4KiYcs7IISViwqwQQV8ekVlAWQeNYSsVsUR6hMVsCSLXWpFGaZTefmolh5S2LSHxZmnu0Lkr+znphVLmW3a/xbNSCYwypi3mGvDK9nT4B4zpi4lJLuH3G6MrjGmtfP1luOBbSfLWv6/3DMPUVfIMDekaHb7vPYdd4W1brRVCllnAbliTJOUY6GyqIST6LuCBXLcCKJtHEKDq4tpgYVXacG2ecxppGw2JjGgBIr4iPozOkpsQsiY9j06em1KyWFo9QiA6WTCVGDa/mxlGjtaKhGYBGTIJGoNH/mY1DXNmgIkg4SuW+NS3CEL9/hBt9HN16TI9TGjIJhxd+sts242bBsyuUb5C1c1afuXN2Ys6fdy25E1rvtMX59jQh85uylz5IOTT2x4byq9AJUFMY0SDcHHphRpvD/NxwqlvMFRITqqxfAJ6lXwBX2h28VIiQVxdZm88FoXXU68yQxjH9/uhl/EZVFdlGL3GsTA9Mu7P6rugfT9UUv9ciNo5RO+Q1cNudnTj85FdNFE+Qx0PC/DDn9P3rglS4LfdFbGtW7LtAm5NWuGyPwHddzq6tx4/s0SVrliEBM8/oggZlCIGcT/ZQ2mYoiNkluYzIcuOpu83Hzq75c4+NnBO2tynEuMj8vruuP90kuiIhyEo/TPe33+jxzjg1DnK4/cZ7sEWgurq2c9G0EKmcVS/SXHN3oKtLNeF3456NzuS4HjEwyQDk4lbLV4zmSvssPWZT+l7ap6kcHsdCD4lmnuWuaASQ7Jev095AQQ8KnBHc5E3bkIC8QyKTmDfyaHVauzhRtjCz7F8OD4i/6A0bjm2HHxxw7LMPyLq9xAg0jsSVKMgRSqDAKZtvetAdPdHeWqAXub9e738ntTDubezeLkBESt1wcn03fp+tvTRhQXEwtIF7MHzJZ3vn0TxT0FJfwiw4xJYj9d1l58KMSLiHXHx2a7zGfaPqVqX7adsZqKsAFG3PgxM21LBuMIzmEd3tXFDN8UPbTDX2eYxuJWnZc/iSXvpRxEI24bYFyLbpbRBzJLvwBzBjXhyoXN6jqNppw5tR7gBFZIiogmKQ4iHTb4qPN7bSyMcxx/eHj52O+9TyRYFnHHjVgfzK9fxbArj8eur08miw8+C2Qasig28+avmHkm7WrGfUkN2DgXqjnwOwprWCTJc0TE7N4eNcn1iWtaKXMrmadHmzWrBFD3IdMfGBdB1xBI01dz5gxgpQo1ua865eS2KDo0FLYk2hPFQyrY645BRYR6zW4xVeNC7v5hVvUq5PcuHV8MHexTuermMFfapTruU8hh0nu511vKA5BYAzol3IHwdgwJ0uJqNRKx/VCTME0DwuLMsTpkErFIgH4CrpybQB8GLMy/PsaCIsbuIBeJMxTuv2OgJDE5tTMWNdSzbPYvkN1Zw9GzeJmZMSneqQrCpFBibbjdWHnBWlXA0JGG5KpiSq1ziL0kU1pDdGvkS+MuCjK8U50UKzoYEHfjwrNLdy1e3UOy4df3QUILlc5DOT/ZJV2bHIh+LKtPMNDQnQOUq/fDedBe2qxthScbganisWfzo3TB/FZ4d94OQcITes2cv1JhZ31TK5vWO2vfY7NlVHijKdAhJ95fBQpFdpjJ1w7cweuRom1+wh+/k+c86Qj6g6Zu8U+nQll4YjWrm+3+HOySV2cmYuEvWYxtvbHZnVgLx6t+NBkXmRDCMvno6z/f3xmlj+BpW9Bq/LyBRs5Yp2/1zvGxrAzoHj0VtVfLOgLGO/h7spS5fcJn8NLfw8Ey0W3sCf5Qgp35AEMHe5J/vjP7UKuj5f/H6w4o5xJ1hEKiFyWUrstC+6PGr1xgaOlZYosLw3q1ZchT/wZ2tSOlZl2Y498tZDoAwbcnxe0ZG7iHDNzUjeVP/pVTo43DdPIkdV3s/aDj+/dTpDBWK4k8DuD9epc93IQoOmlda9Rx+RsH1o23EFmLZlN/RodAG/BNT6Qgovug6K6NG7gvqG5iIjR9tRcq4s+Pw825/QuICX2UdXEMbrREZu3dkflHHfxd8WIhXYl8cYMfsW3ZDGpS/psFa7gnKH9c+TWU5WDMvJ4x6Yp0nKg86tCrAgn450LHVPQ3yqxVZUFWM+8o+Xc4ZkmqxZYzCNf/7ID8xP5R+nSeXPBTcpkIZPKJBajkOfJ+oyzSzqMiU06jIRGOoyubAHFkZUlwmE+XjqMkCovy4EmlQVJGzMTsYdheTgOe0I4Mj8pHTpXvd4zDj+kzJ/7jl2zjuyIBnD98FuQZ3UZm6JZu/56dwTQ3pSVfFxel9wepWtv5BHia3lU5AYm6XAqBMfFCNU60F5o9/Di/wGkCDyOGj3igID9TsFxo5a0AuaAOjzDasrjunlY4lAaPyQiaAX+eGYXSqvhB9LHH+jwAjn8RTcPRr8NOhDgc3+GF+xoiET8CVm3fmto0GM5NPyWAnPfLRiQTRRlthgVLZYxKb9p5k8WMgtDGN1j1jQaOng415nZA2uQPT88McDzhmryq9SvyV22bMkyS1rdVsqh04YgRz4+V7HvEIqOuAJq17Wkph7bbq9EYvB25cn1oEXK0OPEjja7uF95x5F5YHV0MAl/DSaJNA+Y7VtTH6G3JWtzJYb2RJjdMo0pdhnHbsnN7r7aUSyxR22sfBbLlJQJWMLvfRXpKrlWMdvR4W7dTfxP0W3crVMDuyUQY8tkWeiBlqduBox9MwpPFqW48rrN3YcHrmuqOpSGAirFK/RguTZhQ283KjXrjMOQewiou531z23u0q3W7jkLhXCiW2HHJ93BNvmm9ysNnZlRLIgC6OFflfXZ+LKtwpfKlCwbZsbhPdBD5xXobPXaasBtnP4zN4/894If9h7mFm6Ms8e54Ts+Q7pNL3kzivaPihGkteHHEcpJAckmqrVagrTUOOblbk3u2cTAHIPrp/OpuiGwE0YCza4/AhQucu86EUZdl9JEtrrkCYI9e8Z3xgNtAx8x8FAY7IgJ1ltsCzJE7/Rv7Ww5XdzKPR1WlvKPQqy+06Jqln7DLm+XUtYrej5qwoW4et3x4OF4uZf9cM7wkVJHty/PLZ5pPhOekHMYFKCWXlwRtLXIS+H0BX9kgf5DnNbzv/Y+mQwz4svXViGEQnCp1Pe8fNcMXCv38fjRPxsAGs3u1TPXgztBcQrB3EqcFyEF9NO82yvLeKok+ND3WHWvs9t05P2i4JLMY+r2bOv3yiffNyHriNYaFNXp3BWVchDU8VNdaNZQ9rIISjXag/ZcmpftWuMNEPlV5G9+y49fkqZ0ZTlhbU2XOTph1Sq8Co6+HKx153dleBlLSpiGvnnvF/2v72JvGixmLfIYvM/EgK00JCnWzPebkgIDQ1krgl/3ArTX+1a8lO0WrvDJe/Lz9ZKs16QCdSkfxIKeChnSesXvZGyHAqu+jGtYPW120/eRI5LUGv9KIQxDpCfoOwy6NfK2uXEA/8BObUyEZvr2VxKQg2hND8HZ7cJvpkTjqu43EaJD4h9WzZoXXNkd+q1n3ul0A7kvOk5/8nu/Ezb4R09Eys7OcjdXnjX787hfBM97qIMWYSeqT/v+aPdhhu3y4As/Q0Ejh9w8C1bTBN8TdPpAlQAMoMaYaHs4A34x6bXESLqWQme2whdPNgot9aJZPceeeF6aWKTFwcZpcP0ZEE31gdpNie29cVE/l5Y4DYDyF7qRbF1J4F0VhZybM3V2f1FiHqGf+ZBumgpJX5W+iyT4PcO7PxrlAcPDytJF7kIn6tnZGjU3esRr6Ud7r9KOrJf6XJ7u9o/kGs+69zONgKmEq2vfumrUjhjyosL4hBJQZCZaUQ6CnbEWvTzQhq9RhnZWX+1uwquUBrEIwTwthYUE1PUxhzKn8ztr94uiFZjmXCfDcD1iC/dqHAgmeTwoJrk0EB9OlQTVbKNQB0apSCdfFnoI0aBv1NNgV8MpMBn5KDADzeRiD9qSfoiPByok6gB30Mlht9DpYnWQyUL9Q1IUKoYyN7rTFJ+pcAviEM3iX8FX7UdKvskEs/ySSRXGgW+FK4Ddz3qet13N4QeKjP8nk/ZZINIVYD0R1UAPISq7Sqel8wl18CP+IwmFPhaEOswQyn5r/FUWCZQ6uG9Tv4gSpUKKUoV4L0oy3iBKAtQ9ElksO6TSA3UJ5GIL59EdsEKgfmOTyLXiJ5ESkILfDPPKsbSSoFlEv+atGezbw3aAlhrxJ9Ewj/poXoDbcAj0VJA8qh1vBdmT67K7wblvgx1yQlMirLEicy3fpacrUMYrcOCJmWdxvOaBUhBHOnyuJ/KkLiRSjF9LveVaK5RsKRQlGTnCWKinbkvPA5St4muFzyjnxMRUrNe8gebsjzRY4foIIJyx6N6vZ8UBuMkFbx3jHxYo+iN+QROsthOg5hn29GeE8twegaU9/6HXx1jey0DkrssSzafrcuewiXSszqxvT9pfQ737AeZPfrizzbkS8TFXvTGyJR+w+nH8uDNzx++lClybeAkY2qslbu+bpCkPeGbL1cJ1x6Soc3MxlH+/NMoSE4wSq6rs4UAY3mm/QOzcV/GEGnrMIA/P32s5SkHisw4yVcsl3m53tzcZ2ihHMwTjx99ynjO/miuUkNCZQiUgi2CKKYvlWR95HfauGEqtIZrr63HSdGpqptGWIX+xOD+YmzY3t59y/797PIxsLpFNVMq/OJQX2SK6XBgyIHQtrGIh2G3msPG4na/N6mG4+FYYgsU+C3ZhW2xV+LqYiKy2p1I0Hirz+IgJC2SvaLcJ+azaJds4Oh81goQU+TIKvXDlQJZLmYN5XuHR1XI2kqQR5kpzCNTk98ePbCvouk2TZWWlTeOpJLZiHxMaaMaK26jCDmy5XfwNMEbV83yYQ2WRui+DZVO+hE/NpaD6tBiYkj49ststb2LzcbPW+Ys/3G/o1bfzeGLjI6GlTa6Wx7+B8FnBvWlRM/p6mQeu52OrIQ+kLqwmBW82Tceo3xNPWG/z7CvQgzpDF1JJ7Li2o3mdbPBj1mtVswZQuPWKqoRD3r2qey7SQgPs4tOzjDaBosvj/V2a7xXlGICiDTHyeaTC2TgJSLUwyp2wUcVoDpkm43RHPfMH/vjaCLn5zo+gKij/+Uy/uYsWQd4Kyc88//mTL//R0ezoDzgw7styPHb7fxxwDnmE9ZUF7LBdJY0ugyZvxz+/9Dx/A8d1n/mqjGiykRI+WNNGeFTP7OIvk5yIWuCFgvUugD/+vWXG5w2PbHXRnehK4Z32NbYsVFDdxEuRuLPm4TPUK9WSnmo2W4FxkoeF5801ZGuf92a5skOUmD8YvaaZFZMabBAfcNZfsPZmmQ7wAKbCZs8cGR8n2T1OGjoFCUJ5QmTMoXpG9oHi+OmXonHSYVPmGIpNTIligQ/qHji5JwwiG/oBg91QwFPmWKpNTJligTjVDypKNUVXDw3UoOHJFCTCnE6iwltkjqdUZNQcJmU6TTIFIsE01Q8X+WcuIhvHAcPnaJOrTtH0uMxxTJoZKoWCeareMrlnHwU3+ALGQpCS6J/xhTLpJGpWSRYpuKpl3PSKL7hGTKEgJ5Ej88Uy6KRqVskWKviaZVzMiu+0QRNAQUQMMWyaWQaFgm2qnh65ZxciW9cQ1NgJNETMsW+0NCt7eTpF+xR8YzIGeKRunl0dYyPzaGRaVokOBSXRL6fRRv5wYMxQ18vAIxrJTj83SM555hF4qduKJ0+3uBaLvQ381FTbw2G4oZzpAUR8SjH+iLcjRksCoHqu7/H76vBiP4VgSvTbIAMkf+tZ3KO7VshpF9//Jcx/y8BHl901Nw/+r871/91QAfdP2K5ZJpt3zVjZFgQ8f8OCA7HISzOYYWDav7x53doj5yySGzphv6/CZB2cKMe/H+2YMowzjHbR/9VTORRDoxMM0LB4RceyW+OWLpXdUM7azCC/hsABTzGQqZtqv8vYw/WYCRYENGNcihkmn2EAjyT35ywdK//Z4CnPoJhXA3/Gwn+vw34Au3DY5buNd1QKG6DIjb8UQ6WTDOd/wb8zwBpFkQ8oxw2mWazUAC0d09Zujd1Q0f+CXgsDK9Ykf1fgv9/CnglOOzgkfwDOnV/6IZ212CEWRBhjXI8/2/A/wwwXIORYkHENsphkGnWCAV4Jv+ATuqN/wb8TwBFSGTmH5KFSzVrz/qQxnb36VDGxmXkIpIh5p/e7SjXREwv953yL3xvbk3uJ7YK2CLOXZJuPzaVGId5Nr89l9+ejwTr0XuJ2oUjkthXNEu2V9Fhz4Fgnru+t1iy7iR+P8XC8lswO46LoLHKfsVSFvgVa4sUyHaxULEZddiAPFzuNGjfdr1g+IfL8v785sesiAxzXbc9hOCfjKUavKWXm/RwcGSI/wuMpRwwxtKkDH1n3Jn6wxXlKQiWLyDDcNnCXmDX2/ogqU4u2Szv9Zxe/XsadkN45uxoG89BDtlpXAKJdFGcmkBcCQV4VMQBqh6Dt/B0mkdfyC/kp7VfdRKwNF2hWXyzWwCAOjb8i+TEvaL4LNxj55xjjtPeKt0fjx5ipdR2hwzpVAmezGO1UddLMEfts2M/k8FqrX/rXtGytJATrXlKLXGt5pl/NB9zifZWAHJX6H9t7M/Sqs+qIX1SsLw2QKnIRETkbdvfaeV6hl3Zzl//8PrNK5FpVTLWqA/rB05mr4yTHsqfe7ja1KoNYEeTsuCVdBdoR+t883R9Zfx87rhw5IZ/eOP8BqLyxoql497N0T+ntNXfp/GFGmZpGZ7cdYng99nOte1ZrPKTsLXv1gJMO5SG86jz4GFsgj5iSAUpKMVooYo3CTyXunC8a4+YGjVtfkfyBKME5eV7irkscHTjYgkTaWKxv2fexcjOfBAqRULp+enMnjt72bLU2k3I9ZS+u+NYHWfNeanM6yDjdMM27/yLg+i600Ltw69eHa9Kwbt9SwDMGjamQrYZdjIk9/LgQTuKD72JDD4MDDx64Xv0hbsE4EHSyoyHx8nT+sntr/Q7uBq8vB91VLjnQd4nu0FWPoiINkDOw+t29kTjHs2orOzDexXtTcUai2qWDH/Bfd7xXg/33CCYv/mp6mGESmxjv1G+EWPU4AwmGdcVRIFC5263cENeJvnzVrJwM2rPuGwzThNiHKBQEwfzgxERIEdJv4O/6mIORU8FLRbnBH+3f3OXgN5Km/29l7b9StxhvvBLdNOn7qn7VrF3zRf1lSMKkx0f9TIE4JnKsj6VKxsYpbWqPjihfQgiQKugnyhehswv2tynyYjqZX2sXJIpn7JTHiY8OzyRDfFHMPPG9b0P2vYqoR+7xOdQXQGDzuBwJtmVZuyNDdJSUaamhPnos/TuZzEpSrNE9B/2o1qfKC4vzvOdcct1TgkQWF/S7+IOBFetYpfcrEneXxhSxF3S+sI/zk+dakI//yljXQiOiA4IPUscGN/le12nZnJwmFB66nw+GGnL/2k4XzZVXlxo0ooiWTuqX8ZVvTC2bDno0N2k3s9PuNVWw5khpuy6G6UcbH0OJtpJHLt8ptHiZV8i7I1a5/um3c/brWW8U1+iIGhob+tw2iKmIkOa/L0CY5067xeFKEpOTVswLvfOgE0kc6OPtAKOXoHbT9WDIYzG2LqdlnPnTnR8/9Xu4XFnq0IyOCGiQL220nNd8uUwnXo31GiV0sv2yvujImF3zFp6IfFPiIE3xZHW/fSm64gc5wXIQvADpjqRhAExSyqGD8Co6olsg2/jhg66bbX2ZCHkvv0C/lMBchxVLcwZCIEZfj3k2SRYfhxyQ87Dl6zU0R4uopXCfNSkb84vFnczZAA+mkZbGvfDzKL19MbE7O9QHQdWSJhjLA/0XgCtt+PPYuYzqEtGl4T1s6TwVeiE3LRJWJOHNG1ZRAT1xJ3tt0UD9ceQ3S04wgN4F6pJ5/yTxh/4ZsdW4kMkQCnqpacJJpPzpFzm9HIFFwb07yhfZrsmrRAxJp1KiO5Ke8xab5mvF2+UJsz5n4OEdhhPHuulhYMVNHYn0KFDLsufve1pLVAWeVRLwFV3eXO+qQYglcIAyKWhIN4ffDd4AqjjQA4OdxPCV1/ZlZp0uF+35H7jy0j6A5nBQOAle0zTCS94WCGW6TtmYfcXWxWel3R+0++e8D0qPjM+16Oz0DgNWJjvQC9e+qTT5t9sa+v1mYeX2p6kY9mbYym7q5AtkvNZuztFRUazVoeP9Ddk0/MWKy9c+cmKFSkTIjKlnCb9XPpUIusVw9j0OxS0KZ+qfKSLaWTOtuyL5QBCNARnjp4pYbGVjz1G4480eYOznHejbbyr/V+gfALm4LfgNUEMcrX3FLvV5iIkB+dF/dbhbpKp0doqFl6Ws51WfgN2BgVzSmqQpGb4be8GtkhnVbWeztOaAk05eOF2v9/bIlconDwUkaGRUviWoZWUGXvQvM0+MchuSGfGIqguuPvwDMGsxvv5yP6XjaSON9ZCqbwuBJaaaPbWEtdWZBoUS5qtL6+HZsxVY8u1IrqzNXzNcUTelOmTfOswLGpHQTM7ycsLdOnSfTTgnHHgHSFx/ePejGJ/OWN3qnmirY3RNEk1j3SEA6G3SoKjB5OZKQi5aRIc4IfXZFazxxNcZ46iFhTUgqKmp2ziroy2uLcKWmqqgLT5zmdKHpLlU1QkOrHjg6aFM3oRBuevrc/nrMfjewSscWXkih4Rd0/C+eo3bRM6tZ6s48QQGD9yb7v+Ljq9JBInmx2wei5pjHH+SltGQvXqTZFHNWQjfL6XObtARYqv213FX+NRV08rvpVl/FuXr9OiB/cIO5ku5E9a0125MD+MxDiohGOByrBS0XorI55/3XMmH2xA3q3IfvnmeFh9dFPk7nx7RSxA6L7NbzeaJq4nY+CjgBCHVnnUYewnbW806hC5dsTd/f09eO3zmzPTxT2WZLkTKQTPCgMtHFt/IizPOZ+CkgIZ6f4fFnO0Ekl0oHwM5F0/sfMSdFc65LGGuq1oXtGAb2l69fokAxcIqVEdQ/Ifcu1sEe5bnHfayc7uz80nfpBUGqcbZKRZ7SnQuFMKFRt01cRpW9m+2ZLxesOOfqsi3za6RUOol5H27Pm4GrtH7cEe7laen6uTr7mto79b//KZqFx87ukM9ab1TqCFJoajP07bLpxDyeuTPh9bOyUIfKLf9VrKtT/Z/dZLrlySl0tYMlIqL1gjkbuRbL98qsSfjMPWmPyAzUZfY+nATcZOjpjibGZr3+QEWNAvo6qSJGs+18JZutfJUWOJssxbQ/kxar5xf5hsLgJnixUTG5McERKRTMa0PqYxbfh8IYvdMghJdwNuQ+D0FjtpaFvekP0jWTxFjk5f1XsMkjCzkY2GSJxBFuLQcSY9dWQGDEvqkBLJYOqfJ9wP5S8QSx4voASKGTR4+bEWgPG1CNamC7I+i0Yv9cbfffDIVn2vGvt/sPMWoJk1zaJu3D2ZuE2Sibv7G5eJu7u7u0/cZeLu7u7u7u7JxN3zxu58/38v9+zL3Rw4sDlw2LCqqa6u7i5Ws6hV8NAesrSEDYajrl2aZwy506lpHk4WwKuGYLkU/p5670sM+TFj70njJTCZIHMC0Lfc9rhHoCVMFHVnH9rHyVppAPdLKjfEXGcP6tTbpe/NuveDbXqWYSFqyL0vyvRb/F5nD07T27lCx871QCkf025LRDepLkJUtw++j5Tzxd8TRusGcnojHrACwha88UsgmRKImLyh/rbfSMv0R79sGDE01ghHOHw6VlJOeu2+EbygzglWbuxMZyF3QJ6UjBs9k/K5/kmfeIt2nuLItPbjodiIdawXVptD1hEFzKt4n76+nlixrAyMnciN3bXcvi/7fO8JZjhseQh+T+6WP5IBbFwarRTPXd9oTZ5H+4pLdUH1FBTpBu7M/ayZuzYvMnvbABLsHV63pL8PnK7EZvs6mehNXfgOTnbz+4k8uTtMzGF8j28SeUILRfrWa5ZvNG25O/E4MzP+UtNUVvsxr3MoVD0ts8gAw5xZoaMOMuWCROZaxMpXMFS1Hg47hW4ncy71SFxyghhO8BEgoidniaJMNpr/qU8eZXCuNkOM2Bf4CySQEsvqofyRTZ5541cezATIj7MRAIoABERILrXM0dq6GtHiMYMB87XLiWvovivFteTiGv9qTwcdVLg1DWbGhhqhbU1y/EKbp52srsjo2tnzzE8zeRocNYbAjcuLhOA6eaV3I4++1E2b7tzqLpzDgA8uwyn21hgw7e/+lgEPHei72QmwQdoJHzqU73BArNJDl1vwjhH4H3QwV2Snw9Ypfh4CDRxsqdJWNR3mdSL7YmPp4b1rBwMDr+NeuWJdpFpURHEJmj3GOAT0mNugP29j+j4D7MtyeXXDb2Y6IKybry8k3PzhFtVdDaAOrobGzqWee3Qyedse/iyOF1nlPgho2Mr8VgMz3voDd5fZhNAxjOpui1nKhZ9uTBgirMS5+kIHldG73p19Gzg3qFYQTsSUXoo8t3Ml/OCyYcY/mEtUcOpp4Whp8TTc8HqN5cff/W5v+Lr3NoEM0AE6gvG+1YzYvXtejOjF+oQizmvhB8YrV2sncdKw6cZP1r+HLQOoN8kiyhEwyw8Kck+VW0CaMncnuyHAXu8wrRiPqaLI4vy6UH8Sr4nRgpoI7o+aMoKqNIugy5tJcQY45+/DFm7gywskYlcis0NilOaHhYGVsQdhSFyUp4LBkgTCFb4zlwvMP9aChTcPf5M4NtEPKESMh0RrgaOL667ktY6mi0uXXhG0DzDOmINEq67BDJrGVDQPY4hrpeoVgJtChZpf3X0xCAtglY8KeMANRCDbQTMhTjpiBLdgHcaRqM4998wNGLQ0tA1jjRs3LQ0IYlwWiGBc9Y+gXP8rm3/1bYEILXCkwga2fQHuaFTIBI5QMokCqhMBOOozgRVI3dLCU+pUv2Qiv0rzpSmpCSUKtSt+dX6vKVBNWzOvdoaV7SxrhvF03ggd5g8uDE6ESJ6AZLT+U/joI7wFrAQbaT35ZV4fwSS6BazFNWaf71mlp/Cn7HJ65O4t/qF5ESTFDIXrjD7fHf6K4OFDcKKerJ5EO7/P97nlv36dmd1xjQZAoX3VBax56AUsxY3U7jhrJ6BQf/EpPBWrtJ7EJqvP9+CjU3gLVjk9CXAZPYkaB6DQ3d/NFC2yu+PEDh6CDxEXsNDs0rrjxo8egoPsgUIR9sBfEeb/kn90oQitEobCBhegEPfUAvq8eeZuXKcFUAjOEii0QjAw5tL0483rDRrlCFfiyTKNQ6GPOBVU2NaeoC52aEItxa/94/1Dbt2lYEDA4O7eiUhSGSfk+vLSIKrN+bJjqIwlEsCrDtyjNaebw/kN0Z6afArWnxRKxO/l/PmKRZGyl5wGQfm3HviBQpAgIiJP/nj1GUi99lOxutwc2MxtbSOHi7GJZx+nbYxUs/69AIc6Gqt4E8qQT7GSfdZc1apuTRN/y1Xew3nD8k0mshncwXkjgLP9UmAz/3J3W3ORcFRLuWerwebZfoNvyzW2Zeq+rHLyrcEqZ7Q5hsazksBHQks5zqxRFNJn769yv1GKtvOkun95Irt/i6TmksL48bM5TbJI07hapVaIqNKzQEs29l3tu0T3nKIfAUOMmDGFcQTzbrNZHxaVFeZu+bgNgAK27pksCyzsm8nnIT7KxThxS5eUWAJxCU4iDB+Ixik3aQVUPWseLF0yIqKAk1y3onLFhe/k0oFAtjT5ey47wBRv1Lls2lnWi0KPOwju+VrSzeJb0rLZYFSq6UdHCSKG2ARj6M8mVnlObez4QucxqmQ8ZkObhPrFW7vco66TaGNox0ABt8cRcasRswABNqg8g7hrMtC1jSHwg+/0IuhzAnsCvl9eudvux1dufX/oD3Sc25RCr9lwXDRiTRJw5H3gXA4PM+7WOezbDQtzcye5jSzBQVBMkg4Z06POcnLiMh2aOmDJSZ8Tx9+COlzJA71l1/C0VdJYc4MzKyesPta024mqaCHnbVn7jqTH3HLa1ABMgdTf8pRxf8A21HtBuV3Psap7uPWv8PGZruZCtan18AC0abtWllniloBAhWdll7eepahVE5RN2E7UpteDkbUbroGi0vWSFjLQdnY3HfYw/w4vnh5dkSdk2U0wuDyeSsUxE7UcY2ZAKiqDSn15gOWJ3K6Mnw+zZuPjj7mG0FWQ6Fm8VZAx9lrQRDYj8NJ6SDyBLLpVkFMRA/DCjSjE2XfYWtBySjA84iUoa/9BUHaBXxLW/ol6huBkOiNQEo3f8IizUlZBJPFqQdFa+qEkiPTBC5sDEOOs0fGIDdDZBeAQV0HCM2pBFc2HoSQKcPCIEYMQ43RPWEuHmHbE7/5uVMZqBF44F4YY1wmKR3yLae2vzF4HiiZk7Y/xnd0/AgZPQPTvBJJBKAkHGnYBbq060HmLf1ZCxSNuywc78USXFYDrh/SehCQD71PDgfHVv7NhQfHODECh/QLiTfT4TvzZsU9Tc9y9Ya65qnlT8K1ohMiRlbpZMBf1JhB5QREJgu/RL7c1JuE3Jokk0tVuY7ew3PPT4+X/2L9VYyD0+zQ0EPSqs38bOoA/T8H0db91B2ucTZIoaTrMkCSGSyFLPpKj9f2b6YZ+U6h2a6i3P+mb7GNT8im7d3CSXOXR+oFQtSZSRUX/QcYgydTwGP3TgCxYNzT2NhOrrf366jMG/JgQYO56Gdsc37ILyMcXvedu1ZZIpoG8rK1uSpISHr1Gxf0WabX1lhdLJ8RX7BKDHJC+FNdaEyUELvkr/rfluC892y6F10KuNWe26BHis1lRITkPuJJPICOd9el6W5HTKO3c0ftuQZFc8cPTn9BYzBLyPro0hy4jB7inPAe9hP0RQZzbT2NkChRanS/LPy/9+4viE2rH2VNEGq9P1PKanR7Op9MrjhyRSiXx7neHd1Wh8dBetPz89c574/PRI7kn2Y4WtGGY7ZHXP129FZtHcnWpO2KQYaTihMN9M5xyaC4AnIrJxp+GeWS3aqClQYQsjsQcvKZkGzepeZVrRiHUWrympQ1DRmLcCoQs8zZPqTY31P4jUdQRN6nxloEjUYMBI1EQ8YQsir6nTKSn7SNRIlp8poX380Zi81CxOOFaHpMSRO6TEjYDRmL1MrE4sBm8poWzu0ykDr9HojDS/7rOXTCRIh4ykXaJxeKMtfx1LVozEsONJmRJ4Pjb6fy7M3UGIQuaUCwO1V+hJvm3/KNT2T6mxk+rxuKcsgIHJLYvFEijyWewqShTcHXsRkFFOV2l0CgVw8fBRNsJpW9F0nsksUV/nl/xo31wrX4PJstbiSTT2tQtREMVI14i/q0xhCqBjSNB/GdYAmzMD+8ncdWLnSFs4bcjTinGgCCGAliyrdWik5btohPxS0WEZ7CfMZoPuoMhXcHdF3SJHxZ0T5hQLXvidpgICdU+mc6XdqZqdi1YNnxod354sK/OZIcHEpRhqO8D7X//fSE+Wy+gYh9GXAZihz5GiftXjPiRSAbPn+pWuuoqaTsWc58tXpuRU5KEYz0c7pwyHbpYedrc7yuak+zk6Aj5vs7nZhSkG509XF+vVqSw6Pm83IncvZLmLBEUQF0IXNRdCDyixUbYpaz6HL0X+ecZq3uRX1VLAK0rM7GAj3JGEp7dCkjYsZ/1jcR9+Ntk6XTKwz8yIZEr8H8r6yFJcI/QCCv6KKoWHK4KFda6oWhP5UEiNQGpoLUgoc9ELqhxpI2bdD46ZiOjpNBEeDZdiCrRr2j6NhaapNuEm08xxft0qhkS8pty8nbj8OXJb4H+VoOXrUUFGYkE0I4vvzE9ToJoESClNnL3sxMxG5oq8YlhghzFfnHnGu2rZnDridogp6Wwy7dcRa0VL2PGjmyqt36Iy6IiID2au1BCUyq/3UTgV9S18cBs/h6fuilwQgBzcIYLHBe40SqxfZmDRRI8PflX4qR+yxX9d/b8m1KJbedc7e3oLHeO5h4us206QjeuTpu9Om2yGQifVcoDd1LPdkP5UB7ypoyhelSYhbEnOqVxbkiVoBYjenYsh3bUaD6Z5fCY9FTfTRT83r759TgM7YjvaLfmX7iRB9qMntOMh+WWsxk1PeF25V8MNKk25dP+6YVHIAOFugsM1tHu9mhbKcEKSTIdhHrJZXNvEJxdSczz1w3W/NgpXEbtdfZ5JPqmhkPe1+1zI2uMdktKjsqVY2dj6nkftt5MTCJOPvUDPdd0aOct4VSEIf2+fUScBHmIab+HkKsdqcCPs+PuhbOUN43hkkgPcLqRkoJtKyfiZIs9DSwFXFSM7h1146N8vkdeZ9N517kbIjUmnlwu1cOOSczVg58aU5+BNNo22tVvgH97IpnSLUyTzu3ATOZCkhOZvk4Z2IDPHQLhzTuHXMvA8YBr4r5/8QtU3Avv2bNgHG2T6lO6q785u+tP+xPasBcTVuRVouqbCoVoW9iFMJ52d2bvmZvAFcTb1DjI0kcuKENwCBVRpnN8RiYpAwxI5qSl+Pjz/E1K1D1Ks9nPzlJAahTVOE1fWqjL80NdfnZ+fuj1T0YOoOdB/zUyYwZzmu8LCPakBH13be5o2J0J+5shb7vTfX/6voEjZypH7/1mfn/uWc2WZD1LtANPr4XXhtGx5kpLY5Dyk93yLXSbSWHHm+bcEhrOsdivDsjxcPVMlKikty6+sfR08XOvdo78rVwlZv/13BzC4+mklPd3J9rtXt/GROOGpDcOIu94Xqc7+AlPlvu5k7snLyUxhpZr3AE6/wB43hJVTm7uerwWj6tOphyixMD3U4Dy8lHjzw1Q6rPS9t1UOa7GnwR2xUiX/AEPh+86DgmBSsMrNBCaZ6lL0XBNtfQuL2cPP3Lx7M3ttxi/HmsO/pz5iZUQ8/PdPZz9JsrR9bxbWNDKBXN5HZuR+7p9eFlgkTvKzldCKwyJFX3wFUEkab17OFl4M1+MTyeSmBOXO8rZ9Oam+sr28kTcCiqFfH7dHQNolqYJusDL7WDpNMLgjBb4jhBTdnzW7mIaMhnhRVPEZstKDRCVmcVleIPQzLWUHZ7OUeyMA56LEuwKto/nKGL/oM6lvh3uLUAmZmJrh17rwR32RpeD3ZiBJ+bS5IO874GogCBa97k4Swn/iQcf8hbx3umwkrPzclR7m9b2QraWjVD9Ef1FXM61srPSQPPDpO+jRsaPwcLdcZaf/0GIYI+G6GmSjcugX4+HnqJPNuDnrHmK5TVUOt9uOkL9Y6TZIURck1Hp9eJS2eGKAhdX3bvWg47p3qnNGWOiBas73ddLOO2+6y/Mh1SjSl7+uoc1LmJp3PaioanUezjp1UQy8/DTJYWdG1o9tRhwLY0X9s0fYJYtQ2UIKv7yNuu0KY22rGUV0kEZCfq3J0P9+NNlMDMeYQUWzDT0wswtWpm7rlxexEnSveiez+TOrHK0Ppxdjsc+SbN1N7FYsT1xT31Vx4o4e8RtGChlTeEJyRdyIBruM9mIImNbgW2fUZw8fI4QRqobGSHQ/K7fkLGWGKAD4KDg7CaYHBKikIwd5ePec+PsmR0O794W7SAJhCzLxu3rNOmiJzSS7b5FLH13CJeX2sdFiiYqv6KRqBcvkt+kAMrbfVjEB6djQnzu7DAs82d/5oRjhkoF9eTMEdLb4+3C+nm8T1TpEX7dh70HojEv4kz/ZsndbAiOxQLwNz3sQTwhdNkTYeDGYMr5Nb8cJBXBK93p8L29zs/PEanaTtPRSweKYQLeHE7nJPNaIymqaT8fqGZPaIig1Pa0wDzXdHj6lrLuBuTeJg5IVZL6dYN9yGvjLjlzWXkzfyyG5qs5S03/sNXL4gGnVhoQMPO8vl8jlWqJ86CNd/vxqMypLCFw996xMLHj18z5+sw3fAf9m4FQxhS9zw8QJ02Mx7orATnj293meH8+pKWGCeAPr+JKnSpXMqO1USZBt9nx0kT6RBtfl34ZgELPzdv0XwYoztYnCKuA7k/9OWz6Dfh4JpOH2U0tjvHh8oUI+7NSYIw2YGY0oQvqgm1hP8tLuZ5GRAMBjQSqYdipqap3r/v6WokWd50Ibh16d/3a1ilgSZySqn4ui3S0yIDY+GwMnF0tXocW5diBiWOjt3/3fJ+vGaH/8ryAzm25mwofMjo2vt4bLzgQyMTBX7wroo67SEgk1cAbjY218OQlhMbNGBOPmzL7lYN+o0fE0FUyxlRRkPtr+1Cvd+l4AcCQ3dbM+vYt7rF7Lru51yVNXI0wx7v5pgFfAeW1CAZrEdpJJ9f9xoYbynNU3jjfgQWDC5TAw0X6o13zQK6p7AGaa8Xs43lt8csiQFbTd1vGt1X2Tt147I9+uSLVhNxIFz5ZxjcX1Tn9bzKqc4bfbFTnDL7pqCr4Xsd6xTqoKhzLCG+IxXBS2CmVVBUsHMUz5dhksce9CyBqUdiQrEFILFvMsid82FhnNUYjrIslIE01y26M5toYz7Izm+ONwUjyx0tujBbakAUybnDbkP5u/nfXeJ4drXCMn8eG9DUPpV42sjledGM038Z4jr3eHE+jMZp2XQzThvSvWWZjtNjGeIG93gJvrTH6cCRzVNfs/+lZr4sh2ZCGNscLb4zm2RzOsjua40m+S2kqvRur/v7HKuF7FWatk8CoIbMuRm9DmtIcL7UxWmRDZnZaPyP7j3Y4x35njufRGM27LkZoQ5qXdPj28P/2Czj//x9SgxtjZFQIYcuf1D9qfmpJyhbtWhVdFo6YC58mBEj1gK4re0Y1J71fwPuBdzb5IjvuVj3y5A5c5yL1gPO8I13l3i8DCQ4Fj6uGGqCzQpHPsAmae3DfW4buobOgUdpp9eefx7UizVC4kb87Zwud8IbMeiDl3RMLcbzGx4mjcs+QOBOKnfBGz3rg52W8S4yCw2ZRoNU3i7nZZEue8CbOelDn3asLHbcFTQf+HUG/g1d68PqzFjQ9AJtVgs4dS+GcLXfCmzvrIZR3HyZ0jBM8LQyXVYLBHUvlnK10wls666GYd18qdKwRfHWjCyVHs1jD0rDANEPjnEIE62GYdz8qdJz2dw58Vglm+4RW5DEmNzL9oT1gvZa3fdbDNe/+Ruj4NHj6AD7rGIsbmdE5W/+Et3/WIyTvHkX4mCpk2ggh6xibG5nZOdv4hHc8zhvtiUbeq3osXt73LkWtSFxI+Al2gUPgX6iZWFRMy//Nmhl2NrknG5z8q72hFXZ0sxi4+58ibAduhUr/RWjcWcqIxk7w/zY+L7NXZEbrfzTg3/fzJ/8Dl838Gzbz+IcxM66g/YI66fxv1i7bZDT+wBn7P/X8T0iz+/8ESTtLdHX0mfhvNu+fgf+ziDl5gI0gffV/xWbCvq0ZhA3u/9Hnv45XE/4QQz9N5P4/l8/7b9ruf3Hg7/d7oBEy0oAQa4ZDOMPMm23izjtx4/7fA1h9zLoEPOqUyh13S+/6ecASQLeme4tmadShVNafu7yQr0u6GHzgwhf0f6QEY9Ima1xAQUCEwUH+55Qgyz+UYLTihGy/AMZWxgvyFO2mIBE1WiEKHXH0CRgj/VRh1+ywa3EaDkwrRzUCjZqvv5+/mB+09At8SWfiLJqb0wyf01UmS4s6YVDAPPSwz0/pQjO2QhCH0vPf1eG2603ShFTa+vv7/miMcyic1ClPzxGMKL0wSLj8bWqFMHvkd0FhcOXjBMhCkw2sYCQ8BONCtMZj7dSx2PopXiAkCMrCC46WYT6/flp1Of1M8YR8IhJdP31BUi5dgA8ICyYLBIG3CPPyHYzvh+u2IjHtaM9kyfGJFt71m/5JBE1eX4oAVrbh3mWpw36hypNn9ruUIpEFZ/AGFA3YRBgKji9WIvNabAC2t2yriq4f2R7pVUUZ94mGrZY6QQTjTX9VCRQdno3KLD4P5UnrUG8omTu8t3nizvaOLil4vo4dOb2Xqiy2FVXtA2sRoA2MoDGZrjOZXAeCZrRm/8KjeqmJl8kqwPh0gMuW6pNTvPGOYqCtsSmvMIlNUXJVM+l8KyL6z68Yhf33oTmbm9iY/H+uFg0CviG8QIKAdGODgKD/j27/av91l+ilxlQsHhtGD+ktIOpo+4psasR1ybrp9UzIbUPld/PZnGRmFN6MuzFPxxRikzgZmYigdlyrg4BAkeq+4md6MAml4hdk9uXYoCx+PmZQrqUsS/aOly9Rz/N7PI0aERkr55A2SjJ7//wQJYI9tzFpgizu3qXvc78tNkz4PGo+7VC0fYyou8vXx3N1Lh/OAQQ0cU4E3yKMEVVDVxYBU5ABGX09QsmNzaT7L7LOu7HpsAKW2YzZLEeMJVc0kXlGCQUwy+vsh/6P4GkkyKEyDEt9CQ85i0Ga3rnGQv7INnMFwkySdRjB57Csx1twHCgMWFgiXINCv73pzySCxhR4hTbB5YTzMz36FPioYhM+ihyECEmaJMsiV/mTFRDqFYcsz5Llsm9AVhDE0N3iuqG5Nq2axnSuZbA08diradu2TZeb5E8pK3a3ianA0otdttGTmsq98yXTjv19ttHdCqsXKQUaS1X8D1zjmyY27xJNCxUeJN1Aw5/zp7jcEeNNsmziWHFMBaG67l1KZ4SNTi9okNaUpUXF2A3KnuHJuW9RbnsVQgpkkrijHiEj5jCNNt9/QmVCiBujSbFBrw+MAm1DQgxtJGSwwr5TpFkHEZnCwBmUPS7dX+vy+eF2en4evu813IcCsgGezp830AUTqLwip4OY3q9TJX7ejwo3bws1evyfm7FY7J8p14DP15KZdwHK/CJRhm73u/MGCobu98MWOyKvXWh8RGv3HDJ1CI4bDfvIH7sZSFFWXIQ3K79PRsI40SihtgiXCHB4evGcRHxayV0D3UKFv25Aa6aueJqfDPl/D7LcP3I6+I9EzZEfbINoqzlpoF7NzIf7OfI3OLSgcD9ObQmV/V6fpg2slvSm1mJyneTNo0wy/6VEC/4YLcP05O4Wi0JRPWI8mqZvhLNJKoiOaicBNN5FsaBylkAbndg0Iy5cD5+6zcodK505Z+d3iZdHCfOMujY6C7rFTZdMfFF+UhC69Cf6jvMWdTH1OjvsEhQkLcdoImgWFHwztnm4W5P0cD7L/24BKL4fFHWULObPEg9jwlszXVCNSpgMvYxnba4jCqOSx4CkkAbujkxWoTwieQicDjvvfF+VfH4Ss8fjLrGZTyA+m4jycvRAZAnt6eIiIK3sQHB2KdGjINta75xCuF53JeXdHdTiDaWZ8kS/8lvN3zBPztYvjXj8caYT6ruSN9DSLWxX/sevm4FBi8nZogmHdcOm61X23euaKa+R4hiDCLbrA7MWGNXOWBr0IIiOBV1HGyKuMpy71SfDSW1MTrLCiio4DIGPPBBdvgjNLWUbM3LkrlGuVmDOFMCf0B/k2R7OX0avnDwZ7lSga5SfACoFH6hPitL7lIeafC5GKAsdth/PzJRS+1Gbo7dQ4h4Cn0OfWGGP8RXbWmRel2Cfvn5aYmEP5YZBLWTAKKJBij8QgED4G2GfbNEUcg5W2wjhB4eHD3q3sfYoO1rdWHtxggYBGgkTMqUk7t7filgSQYZNZZv64FN2jhOiwtyXjlN78aJHnuOH3Fangm1ACj3yrXtU6LxpMVt+q77uveqAqUCGLi83PJTzsN33XEsq6iWMUHGR3tseXNCsRXhtNRUaj0eGcHx78ms0nGfDxL6kgeSYYHNMUmGdVENhEyzyU1b15V8VumqNNVbZDrzFKDCtXEE0/eB/wtJRrpDFbxyp/HgVbFS9mm5aKjO1H9Um8faCO12OVHj9nVbLr4v3t1f3+29N6MsfFZskRE8djXV1Kb49LWVFgHCWCJmYgf1SSPQPOB/FOrKeCMxIyVQPDNeEs8HlPtdVsApBxFsZuRQax2t9ThCbM0kyXUCFTBixNg6R8twat6pO1eI5mqw9oaUpoztN/TaxZ8i01e86US4aZvDYUsWcCbHe6x4lxvksyGZ/AE57K0VEslTVyd9q1TlXnkTvCuaaqAbWnDnJJKPRCVNosu64yGazR2zfh1hjtd58OfKTzBK+icbh7dwGdFW+sHy1DaPL6n4a8lBVA174YOhJrkH0q0r/C7IX6jlvonFv3EWsiJFAIPDpC+I/JgrP7NzJmSwQEBVPcBCMfycKJ3MDRxNjJWdHC1szp38yRdGHjh2ZZEIx/DZD7dd3BaxICQT1wow2nqxj5+dewFiYsxjjZLSxyBYZ3EITC6Sz2qOqCsP0ml5PTVg6Hg6wczjsos1ALCJyPCUiIqK8LOJzwe+r5/Njxxf49Xlq5/d1r/d1N9OT8fF55gb4OGX4Oqj5Ah73vM/4fW4Z+bWqf1yV9HwdxPq9rgA+N/66lvy1f338tV31fE183X/dyvl9vQF8FTd63j9y/J57Pm9jv14A9Axfn4DPlZzPj1i/rw+9rwM5vzmGr+uez8udrxfkj+udz+M/O18Hdn7Ag7+x+H2cyn29PPt1WFdXJ6d8fY4Avv78DSa25/NY7/P2b3B6emwcPW+ngK+746+/gVlo6XPcn5/vfEwAPj5mvu7+Tk45BnxdygG6dj4W/gA+/+TQgyv3bvT8E7EquJzf59fHaclEju3XS87Xvdyj3bPf+0jO59Mx4FML8euB6CsO1PLkw+9zA/D5Dvi01Oj5WgF8/CECPPq957gUDOx8Aq8BNl/Amt0sAO87jjawR9M5APGuLGMFwc6qd2/Vp2t1cfZjYKkyhCAmh9+F7WaRwHLWwK1SsMRWIRBhunzYoxq05KoYyqcK9PyNDYaAQfDMyW3pvefz5frr1u/T0YuN5uvF2yXpq5WTrqZawNXJr646QKfltSik6pqDcev+B0LLTtdRsncLUU0yW1N3lmDilbtmwchyQmzvm4yS0rsnLFHcaO258NYVVptIhId7Ol3JJVnARvvpnruX5jObs1N7e7UB6W89duHnTh7bmvSJg+Y2IFfatq8gw0XzRvr00SfE7Cncz5gLhJTDJ4tAxvkZvIeE2dnjDHSvKyW6RUqBE62vVb0B/owtiw5/XL2z5P1o2RdP2GcJS2xaS4Ru8YWXxV4WjpLh1TwmWs2FZtENipiNSwv4Jfptn3dOPKi6zofjdfzrvUmtVuiybr/Vi5jatBfSUtxRi9irC/qe5V8Ey8IonNuX43HAbPK3S8gfW9n0T2ynW+kGJ6OMzqs2NdUGz5f7+JnbW3x6UwyPZqAVtna7YYbABSCpOPDqY6AGWJXssKXt3zSrz7UH2tzRIQTAz+YcdHNDEc/FFFZ/AFl4SZ1TCIYNxUQY9m/v4BGD6NP/peWq9BNMhC1Ex5bLuJ4Jxc0NESE1FVu3X0QARklObHSIrdhrjlHMCrEGU5Fvybehwwqxjgv36uroZGFrqx+mhfEhmVHDLbzSpKd4w9vki6DdhM+DvyrV8FLuXHNFPPqlA5ey+iR+ytYPfioIZioRxDmE+N2tp9iKWsu6m3Fm1a/T5wv1e2mPD2dvyNvG1HQYl/AxH4vcWg3eLM/D9R5Rf4HR1nPxPSfEIuY+AU5bMNSA7z5Zm15LnDp6Xd0XPvo+xbGNE0TAR3rM12TxR0SdkEzeecOCC5KdktKJn5Vpq2+bM9rAGvB1/ka91/3tESybBNsYFYH36fxHlPcE/5tp5TJ4Uc+G27M9vQK7JrO/t4m9qtIgJQd/lkf1nOMkhV6CM5ZZdnNs40XIrTnrUHBBfQ/AxvLtwk7uoaxL0jZ4tTaUPXMRwJeJgH4UYSiEnMBaG4+yR79DnY6+cYpePyw/PTrprBGGYP4Wjd7OBoH4eyNGwXbg8zqF5m9+WvPzh+XQ1r7gWGGMGmYQCrohbsQ2sr7kCHqUOoLqPwhbr+Sc5qAhhf92pYXOwc7x8AK+ok1w0AcMCyclN5lcnDuNAgulOVlug315aswtIUxVcUX4fh4r3PxZn+Sgy+fm1tF+LPxkg+jNyYb1zGbvp9+NWyXIPC+G/gtZOwhuAeEXOLTUzdoKWNnj+MM+gu7t1cCtZXZB61vu427Rp65O95t9TRbEh8XfSkuUFpfh+fn2977pGuIZ/5nZQAqp8LJgKJ+5Uont5hZflYEd2zDnR7uJkYX10fYAwgHDvs+Uh9+u5fssE3FIld2c+1sr+/YkBG1xZvvtPbgA2jBiULtJK1qTktHDramb3y2ovEF/bZaBYX0gOEv71NY3TnOt3tkMByVzv911pmD25r3c2RiQtU4/zmqr0lV96dEIcgjC1k3F1kAXkbi859l+FKZSx6imLTbykueOy4PgMU5kbQ+ibDvVFGBD60VLrLST4ezA1g/Sdq5N7Hvtl99jLEjaAnANBq1bRKkOPQtilxeKfkc/4igvkvXvq7X0mlJwhOhHCLIcKJyipgNUnvNbWyYPhgh88Cz7wUlZQGWayKXDiKlEHtw9y2GpyDt4GAvDSIDiTgrtUoPrmh/y5eCNG3YZkdMIWNV8yxSmMR2hXWMERLKj5wk8Mi7q/i6H4U0Xb5fgxdOF5p3JBXfO22CdnLw7S4W/EaC29168zTB4aHOFmsVl3U7I1wdg6/m+8dvD/2A6pZ/MszPLpDeEa+PltyJpVrguZGBtMmHVtT0VI0GiQENwhQ05jTxgX95L+Q7auuq7qs+8SYh8HjtVw3LUL/jxXJuR63/ZfJEz+wucWvNr+xRUbvaIjtbp2bnkYx7dGUUFYSx1Zx4Jq+C7NPJF8yY5KttL0rB+XfkYNxsaUeZPbFKs+MhvzESuete+rgQz4UDXYWUXjJFSMm9s2WGRkqKMvgtLRB1jMnLOuUzJ2vQB0iF863w2NU1LRKYlXAwl54d4zUC5w9HpyUmPJVwjbx9ZcHpDzcpTCeZGiYpeLNENzoGn86UzXqvJkM6tW8l0cyLWLYn0Kiuu4DamWhtEeP7J8iVPNSO4ZooojwvRSRA2w1oDWXer+knrbEzPljSqX7q89JNYtVuuw7AeLV2heDvsFwNMSWvhznRlWlthMDBW3rmXb9CIyAJLuNP4BRVHmzbsI8e4pcPYBMeDB/1jfhuKJQ4coz7y7VkNAfM1WnB00jA+VtLut8PizQdvwn4dV88Agnj8SjaKR4R7qQiKc4PW6CAelKuOaZm2lpVCby/hpjeAd5t+HE4BkCFn7dD3jTL5ZAIE/KSZKnaKzmlf5guVjMMKelNn01f5E1G1RK4E9+lqL5Ad9aEkGnD/0oDfn/AWVNPAiGg4JZYj/Gqg8Yoc0r/X+jGzoFe9fmVFN1IH4AN/kvZDVzkZ+pFTy2gJIXzYDZAXc6Ht9F5YqefDZ6dPAjw+Y0mMDEEyA9QTsAhQOPhircOIF3nwV4DJJpumzsq/2SUi4bPLPIkisR6yUg2LCSw6LtMl8ji+prCvfpWUXE0dRclu++eJxU1otjWQ/joZMrsKfppBVCJqxmBzRvj+HIunHo1iIMgsFAQZE7QJsO2LR8lC1u+vKEYJ/GuOqsXZlAvzH9vW2fp4juXVwIDoCza3hAuHbfPbHCDrAxHIL6PC3rybII1fRLmb8EK1DStKZsT7u6pb7tfU7IT3WNblfnOumPwWBRm9oj7ld2Lq71nhpeszDPC5bhtaJs5Algv1jDCMulDbF/t9227O77DY0WgUhAuUIcGymOzv698d1bWtE3llFRTEvMDxXI7+lhg3XQ4Vc2EpmAKRH5f3Q9AConiEFWSJb2pChbU5oXRgpINPHlpe4RK5X0YVDYdn66F2DMhbhpxL5hJXRMsESCkRpeG3Cz4UFU51tCQn7bFAWuYll7cFWCPiKqQPERyr2iv9adgrIBLRUlAY0jlRscvEvYdV+lYlBlLUsSJINTEsSuAh4WYLKsmw4oWArIb8S20kDJ44wH6JYkeiHbcy8eW2se/IyKwb5jDtyOL2xWR3l1LK9Cl+tQ81aJTBRSjovvvtprAL8GHxE9MGql9Qem3iPaaWRVDu0+4J7wdMOwMQ54pCJCpRHlHge36g0QVOn8fssQo0Hmyrzg5Bq9mqy7P9FjKT14kcnt+s6Jbv1kejR6ffqlutrXjOfHqtGE9akTpZHXQgjHApE0mlvj1KX26q/gnAxuTX9vYFVzmd53Vh1m9NU7qPPreWyzlBTVJu7McPZyGszbvKpNE+CCBtSPEBXGPy29OLQxUUG6c4vbZyGOPwAmk0zxEs0fTG4Q6fHkQBL9/d72fPt9qKH9+y48PvxxdIxef33P1Z4GdG+6m+TuMP9Bg5A/Tt+fuiJqU4jYNIoT5KRn4An2nuT2SeJ1iim0RKYrLYnuLnFxA+njDUenYTC6Cw9EbPcQsO17zfAbz3nV03jCTOCqFjk5+M0i9HeEJfm/NsSFsMvOqEZaBC6jfCdlAoW1xwBqYF6nh9CKEFqCQSAzQQh2a/CjBBiwKHed/ze3ARDFqW3sx+brkg6+i5ad4EOkHGKRytTaqOwCZMx0iH6ybEjP2Q8caoMUkOn/sROr3lkUC43I+N/vQz5SX3sW+7ql3vnjI0qlVzJf98QaQN7xHoqSEJrxe15yrA1uU4hknLzha5khi5AtGF9Vx2exCTjudFI7IN1B6wkgWUCp8nra4IfYipYtszr2zWMaN7bI4ERorS89nUYx9gE4VO6xjCnw2349ETiWIUDG9HwieYjtpSJkgITUpS9fG+9HZMNg2q+ai4GfkNsEx78MylBTnIgRLw0ZRh1zZjzwZAbZkgE/Pbu4Y1T+NGcTMYuT4n4Th/8ZbIhsKkkSPYYVsJIY3iicy9hcJcJlNyy4tUKXCN9VAe5zttLQmuPFKnOG/N6Ub8SbDqAcg5XPVXcaO//u4OXb06pKYbZGt2Kc4ibqui0w8JIWHAb+0x8C21b9oWyIhzeDbSnlXVZnT7gfUS08qogET8a/8Kfh7lWUaqDZo2A+lsM7BiRV/GBcPBSupQop61KiYMKlauZoumoGviWNNUUVNMneMg/3tiAFO7Fw/I0U2pOSI0Shw8Kh1+qxjKESJz3LZ3M81zTRaVHXvTkl4VYQieL79bulMIjfXFc/HbAB9wBR9GHX5mk+iSZ2vwg63HbWVfDJ56+ZwMjTH2Y6gMarzaSv9MtvLV0e85SSrVZiIr9UMVC8oUSyxaO+nd0heGKlcEhEm22Yk5ambsObuy+/CNSNYqKm83lKlRJ07vYZhMw0x/sikj8DTHrS7QqQwwUKbJoroU81DE69/TWrM98kzEpHnlHMZBGgjvXEQhqO3MaClSgl+YUTjw+Y1AJEjcDyOSh1mBF1QxyuiZZFCiS9ogUDPvA/2cYtNQXoQLPNXO+AXc2pOQAj594WcUdyuyiykFcQShQD/Ir+BxjLhrz9DtMEeoaiYskwwlqQiw9iOebaJJ4ViGPxLjqi+h933cbvw1HCUgHCUEIyPheN/7O45vsFBwhgq1m5BtXENJTetl7Ohb3EZyXItjpHeXRToOYsy4gkaV886Lw9iJ12VQbKykHQzn8cEbafF3oo9fjZheG6x0Bpp5nKyNpuYoeFcw2iH4wggEHui/CxmJAb3D4X4EQDsGwUTrnYOHNYMRzi4FQeA6e+3+4SARlbL/IWIe5QgalAa7Rnidps972yq9AsgjjU2t/oWbCoUChEYp5wOo807/sYzyaWL61VFhVSIn662bMDd0PX1iwS7WfKSVjRaLw4AhoWKaGn7W+GdbolF8n8ny/Gpd1NN0yX9OJGOnUXw9x0Wotnk4XRw1EGZY8NBRFoo+WNzV1FWaxcDg79cdDyLUU5OCLL+bVyM4h8Ey/GQwfG16cBt9GbjWaIFtAh5bZFC4vOw9hZgsn7c7D4XMcjV2vbzh0rK7b7uzo7PpkBlJhNULNt/6ESUizGgo5lQBfvmtlPGNA3P6dYxA58rsgXRqE89Ypg98QtMFjoDHC+6qOqAxoKOUK7TaH0EZjNtotk6IbPQ1/HfQDXYUWJg+rgAC2mNa0nyb4MBorQoTZSp4UU43lQHkwVZOtgcRtyVv3bVyx6kiZKb5OV7r1JVuS1vbEmr87JIVnK88mXpS0XBGUf6s7GC+qrJSBTVnrDR0HIY2KydR8agXSm7X0GFFBurDGUi/Ly7VVgzGlArDVCjnFgbZ3qmqBCLh0fwcvi+OAEJiYPJxj6EhrLLzF91CV+9AGDeanPAvPZXF1EAKfxRmfxQK/106YnHlTWfJHJYMiDmQAW7/Wl+QLBmccPCF8IksVwNHbniH6AN7gI6OnU7USMOv2IWEjVtHMbLHuXWLaT5gb2N6RgyzWqjz/WA0vZMkBaMMMtv0+dTDTbi4xa/83wk518GSZslbtmsWV4dNmgU07OwQqTMRfRvOwWli+UIE+T4gONhNV+ypRxFaiTkbQlJJSU5TMhCqiFyBXMf8UePVGsQctQcPfPh5OQ2BYPHJHedtCt08aZDLsd4PESGp0Ei+DXlvzmfZjF3m47uEYnHBIxAonvASQ9cqlGQFejXoYy7HY+TEXXo7gBtf5VkxJyzaIGhSZ+5UrzIZiWE2A2F/fcgtJF+Kk5PLk6dfv2j5BASmOSgaVhWdWJRgYBSCx0oJBVYZ/BlV/74R7MrgsWvHM8WSH4AqPkbDMpBd/Nu9jLfoU8kn49Ry1PZYLoU7FLICku/+NS+ZUlDiBHWHJ+NWfFt92YJYoNRSBLJhwyxcif032z5Ax/LQBHenEjWB4cquilXXoVgr6rJRmYfbMx/aU6pA2D8kA7V4Ag/+/mLrLgOngpCIaRsAawV5UfdMaIhD+g5/eGmkN9u3oFvUVLGHkAWCN8fJZ5tg7izkAhgwXFu6487S7RPGrFutM0/nAQdZ6JeHh0GTODjau8hf/hdtz+hTa1mWsj9azmOvUTPBFsz5S47KaSwyXWXVLmq4NsIQpzAFRt7S+coirGixC58QREFF8GF3s0ltZXMUcHgnnWPhcFKpRBKmlxikl1IfM0kbesjxFIyJT9U4Ug+U7xK68JqYopmwDj8eTvPy6DAPCUxY176V+1sEhLzOh7c5fzYbQ4R5psUU38Y8zr/2sVnEeJUZUTbfGyhPNTbEXAnKu4Ge2oNdWZLGMtGlJZ+uTsqnG0kfYggGnRxvPKJ3KOoF7Z1TH3uxsDx62+zp6qyCgPooApgyd7Ldn36qcGhVloCF8djiqd0qheVYDYiej+ByajrxfhCGNhb/zqRQkpR07ll09nJDlERjnIVE4bOrBisTJrKkn8NEym92ZmAr3nPxg8oUdXz95u15/t0U5bQc0fOjDZA2Ry290rfipk8vzV1lzi1iXSiZk6SUcJyGTE+nZHWCToasT8imXeeHUio78a0R4ao6VFU+i/4tS6K2rR20oxRkxEI7dXrEdlO9/dQAzEa77x6YTIOh08idNjwpAEwuEdg+L8i1kM7x83tzsPIezATCSBsh/GaDPpq0N9NESy0GmJmyr09ODpLuLjM6DhgN79XtTEat+HXypd1UWK3uFuqyFDsFiJoVnGpnDFscJlgRWGzLyzhxk49/55EuTu3XJqaEmkU4dDUQM5ug0pvSqbXKSqe77+uaXjQ0hhld0xGPjto7jlYY/dOf8Yrm4zG/l3O+Ptzj/d74hw85/LBz2ri135mgxX6rzp5VbTIAuPwHlCbGWsXfFKuMJAi2h+ZJftGLPcth4FGpZ1cwsCM0EDaeY9G0Bm1+2MBu0lD0uY1Y3qd7TmV/CyCYuHquv4oKHpGf8o2WHP9kS+oxYD163wPKmv2UH5+gY/kYMT8vkHRcEMWKOqyQeQv7tE5vwOGHNMJX5aqdAurRr7eaqeuaTIjUJpNEqDarCDZRsIwB0Uaqh5kmbKPsXVXo8rQgDDGl5RENGVFHFlRkabMCTHY46WMTOgSM1MygIQJV+PjUY1iYSMijEc0CZaf+CDoo5XLu4K2lxsDv9ceL1hGDRJZoAVuy+k55KCqHOE/KvXDCAvlTc3/qMowUvfIM9Qe74+9juIC87KW05EDe5mfMJlAh+Ye2Zjx8Qq932H0IPk7BcU4Tkwm4gOJV24jhFM3Nxh0Mdm/TL2eOYPjYeBty+7TkmBRAUzgT/qtv+FXbhYua9cpMh/iyRZwBVxpXexPVon14kJg4hHoXK2MWBcPpWAnFSAg9RcRNtWLtSlNooI2cHPqwLgluFJ7okauneYguEd7qlgXfdW21iXPOjwY8Pqkja1LQpWhqNzxpqSXe/UcNC3vwJNHqi+xBj+PXPxNTv+wrHOW35jk4Ag74YE/wemVsgkBIrGCJM2n9h3NM1WDcAiyExi7G3RcvxqXFG2jQxUzValf5dWVv6Nk6hGZh6zxLvgrA+/sWvaFUzI46KsUKNMCq3zrkCMw+W1WGzpqu9zV6eTVVgR/R9UXUK+PRdXuuako0zdm3lWYnwWE8MeRdvA/aSrCr4XrngSiV7Gj7XUkya9QXhKOCsRGfZ9ouISCfmD6jVYpGucDINFuzKjy0I6gyGEOJqLaDxlPpanaj4tHX4SmGem6lEZD2vmF8m8YdqVYmiq5fhGI5Fpb7SqzBXpAo1fs/m5d0Spm5e6o3j7lRg+xOorCOiB2O7GGJ97c67CK5kwJKrbjhhk3q3dwUfqHxklSr6fh+/unksGWoLiM4MknSCVHW2Twsr0LTRk0HC6Pc3Do/q7e66gwuM3bze5hCHdSrVEPg4I6sGMGlKMiSP+lKP+uYceAU83tJmM17e6jLKW0vimVi7BcUt8aUhTnsKdBbXIVe0JuDT53MV1QHzmrdyaUBWVZlH6nELgzy7+M/+cY1rNjftiGHuIafpIhMmBrz3vRi09GefWxebQeo7wyEEa6w2AsC2ZpG99SS8X+/2WXXlZ/iu6dqMDsoOXfi3aj2MJMH77Ra24B+EUVum3Mm/ZDgDVDqj6fhdWMtshVyfHmgfPVsGZ6FWYWkwYP43vpUgUZulDjp1wljSc0FQfXiAhKfviQXmTZm+VHra/xtKRcK8AVq0aXxgWcLX/gT0NuLYYGswVQ9TO/4LJMPSb7obl/l+ufDi1OlcejGc2Khc3DzUO0HL6EZBscVDTTKnMmDg1swrWYr1Yz3oQKi6iT9+BweT+xdhsGYK6oWWS9c5J5DckftWE56L9AIPQUaetJ7EYWgVXxUGFk+Sf2EMHYpzX7hZtG+kywUwfgLcoDyZhbnlhupUy6stvdpDU2EF5tuaQenRzVLvZZnOGFiVAD6ophxL0lywT3wTajE7Ur/4/Z7rjx0PV/tcGWUVbc43Gi2gqTWqsB1i4OH2d0DNiptScHy+y6LhxofeFf4qCBkCAxxJV4veCUJ8WbF9OBvt844pRZfzrs7h1pB28l2qoCQQfWVa9QjcNS+3dGrb7ibgHVcCpuMmSZyozSwtmkp2EDlzWT6qDPwYaWN4goqcT7wyHBt4sLL8yOG38FlTO7rBSkrR975J+mMs+zLy2G+tBYov0gIY5xOOkYt6F0gHW6dqqIwwd6P8BYZxQlj6rW2tFPfY/Dt6JfD2hJ1BpLnCFWxru64eYDRdn6Cs5lzGHypUtLY4AWsD40sFtSOhP0WPOY8FTf2C6OzdJCDNVUy5PO8aKxXLVEjs4ZXdBGrXbubXY5GC5MfhidQF+OIq98S9uJWVrczacWy3bcVfB9nTcoLR7O+olEE7idfq4ChVButfMdj40TkLz+VjWyc/A96hDzCAtl/ZHVEL10DKDU3PGg/wstE7eymGbU+7CwMNPSv3mpqsZsYCyz5B4xfBmgP2Ye+U7SD3B/7Bdezwee/aSSmVE06NNAT/srCUOoggX+ONp2+PLquLRUvpHb2HJcuH75YJgxTdWVnofB+ML8sPqIqcfZYyoT9qU/SHq2wOI4qI32RwZFaL8bNDpXDTq6ePhE1c1TYub0+lLvREdpzzHtK9vpapSCQzRPJQWe1cLRQUbWhoHnjtJFaqHMypITQTuaiw7JKhPmOy+E5bD5P5C7k8isvhWDhEY+Wgsgmi8ekFctXVidLQcjH+ZJGI4Q5vAC4UN86AT502BNqMpg04OBNu9r5TVsXkn2hps1dSxeEvDqbKchraCOEcb/KQ1+V7cDuGUoF2XT5Ennm3PvOS+WrFrlfgCERdJvGFwwb+S7AsoWdWLcP8RcHm6mfMPkIAVG8qtF2UIQZloBCKuaoJVi/dZ4BxqU9sPHhO9sxCGebm62KK2oEIMPr6W2hefg3S5Zl6uykGzzo3AH1vVSu91pCIZUKatjtT4GbeJEj7STLWwE7g3qwIP/OKjwB0gTJXwXNfzyKxddnx/xPTAjKzLyRiBcvj+ELAqlfFrPuSAZfg03Uelp/X84pR00Vn0oOOVqSJ4T4UorEYZDoGw7AiQpBpAg4/2wg9mfUWCLxHxYmlLbjt9HIsEX4TFvoA5uAbOdk/hGCqbLN2wsVZGwU8WZtaTCkKkQnR2UUnNRdhteMJTmKLpDOLWWkoc2IBhozF+m2s8hDrTcxHB3X3OFbviTvkIpLNu7cm09/DLLH7XFq57WUv71Yaev0sP3puMBcHW3YE+lYnwJ04vP+WKB4sj5+gOV6TEfiRHwMfHSiE+62gCZYLlZMV74JeQ0+PfD0AE1nGuIEFcFstbTjLt77kTcnrUCL1f7NCgR/KDEDVsO9QLTZ37s+OJxoDKmuI1Ex+WiV3adngz8E+0UwNIVWCsSOTXulyRdUhB1XgCwTVMTRRaQUkZUTCX4aClcZljhGGgJlog7EsO/bo3qmr7qS6PkMWzFhREtVB67C3I1rsD8GaxrzIHoEb/23Vh8Z16jTK+EjWy/EWETqntBj6Ie6YgKBwQYQ3zImFY/NhEM4qnS/qgz40QZj0EMgSa7Wiu+xP6MNmgvBsJFK+NnkSIWoEcWN9jY3+OlQ6JZaawv2zYMySJYvryIbvT5FuNEmpIO7vZubczV/KDQgKrR6U3DKkWzBuR+fv2JdoUrYuXuYlMmN5whuxo22jnCcW+7gFMvgDkEq9Xkesbx3G/v2dci5hPsNaS4GzlcIhdQXBYZY2+cdgRsTjPFtpp4b/YrYDBoHwAhRDn/NC08v7UuJnOt0gWeOnmrr2Fa3mfX7Pt1hdvCoDA4SZ4Yj2IrElSWwdSnDfRhV2qS+l9VyelObPcNgV9SJhX1S8sAdKYWQ42C5QsIxQyw2LE0uJgCOLXj9vtAhN50/+7Z/U3Lk3krQ7ep0mRjWjNOizb4MMOvyfBg1Itd4u9ZW9gpNM2ntEPPE3IO9fMKVV2NpjsKkMKL9hElO0eVA7iC1OXAADhCExlnlZZQ5SUsDpyTgEdrAzkRzREg9ncVfj4lFm5i4cu82z0OGVsX+nTPlLmP7TvgJnMXz5J/077uA8LDiZz+uf6s+JdfuujyfVqOqwMVw5FsW8BnbzaAPCFf4JN1xszwTPFkD3du8a779TRRi9BIneTY5d/M4b2+UTNambXkwbclREo03yptCwCpjyJZBuhpry3rLm6vUR8tm6tSwmDqVRXNfn1Noko8qMLgCYqhcURl874WJE7YMk75+fViKJC1dAQw6Pg4IZnkEK756qFs37M++faJwuxSiVNf4ZpqldK9+vTdhz9F7KKDT0v0s1ltf62Wsn4iQU4kSxpsHxnwJwt2imxl1T4eik88lJAnCVK3ykexCEzwm5w4adN8lLXQcnRupvpqYtVuhV23ry353lzn90uWOwPKkr+LmzWmLJ+6gBm6EZPhnchZ0e9slVE4C0WVngIe9xoHfega5uLVIa8WV51xc6gZBqIlQxyvTPMZggSCaMI9peP4QpzvzFuOTWCzOYezLOnyupMH/z2TgZT+Zccfs0NCPYc3GkUXx53Dw8N//FwAxQM6/ysTJxHVt6CDsBiwPccVxQNcaudz4kg7ls7aJ53gwwkKuPxh2XENu7+5P6I1eCYR3ZK4i8xE6x4rTi0YXP8ZJVC44wx1qmv1RD7izEmq05+jUmMfoDkzMRX3n+o+n1aMxJqIAYpyM/TYxJK7d7tjsGjHaHY8tNqgtE2Igmh+P79EDgYgI35l3yQMRA+ZVAAjVXJC+dqLBEVWICb271UZy3fg4ryGSi2XKtPFgF88r1xrxUzG/4Re3YNTV7bu9nUd4ajBaY2CPs97LiacfmPZWsN6tswo3SbZfr1YZzIJvrcluy4I/Epq7Kt9QKeTMYqtrTzrO6qIjt2QKrotYbqdmxk2Zi3ffCFU+KU2MtRs7/fA2/60eU4D4UU+chmPthmhc48mrrs1gMO/r9boUWbd+//EJ4zm4YEC/dWpT3lrTDRq7GvhkTov0vPemtpz/9AHAaQl/i8bo8sy2+I5m4EJyFeYwU33jdr1MdWWR5BIoDg3VtpA+Jmo0C7ej2nABFeeH+KJVcIfVD3YNpLL4mIyjOSY4vW/Q1MKrzL5tjJAXFJEIHvyiquHyS0I+17yDJGbCWCnViIeJFVLDFVk8nuwWbw3XZMHeZH0NrzyGhaF7NEe0DzVh48DExBjAL7WiArrlUMPl0Hh67V08iHKZj99gctV3QDfSltYzmX7GKTjjmZqIMSzPp2Z3C84bm+On5z0sdatafoieOuJ1y/MNgQqOgcpP34GKYXN7oEvdHjdmraTWSPauzF20x/17dJ3aYtB05lGJEBHO9HA9rCJMObLtyUuKzPKbUyC1fFtT5iNEwQAM4EPdOoCfa+A7nQ9sL/VnHn+WlxdxZmP26syGoE2Zau3hniAKvwg5m5pTYJ4cEDNeLYJlnMdCWkcP6WRw5tgVkNFMQAzoWpywSGZEVq5ghhQwgMjnth/Nh47mihc8x6fR6kNCtfYxnnjORcy5UNStntllXO2paQQ2Zh0B+UX5nIO4eHE7d4c7BEQMCEzM+gFkCBAQ4yVO45oQIlQOCgE5TwrIBENADh8BMXz0WK1ZGggTnh7lLS/fuBcWKpuYLihdV0B4abSH36V4rvRSYMMhBWQ4TwPTS4TqupJf6TR/reBjas3FcHJiBilc5wr8eJft5zUvQZvrZQ0NVTFLBBDhX+15NDIwEf+z4uyEsXlBNUg4F22ci/ICSDRn4iOg81tGaGnljQK/DUbWL01IFarzSxMPlyY8aL+2Y08LE47W325N6BQmAknnNkOECD67/eGW9lyasmvaq2cXLc33l3xlCunRrVCh0K1GCTx/t2XipveYLxxcBODi9gTZbtvViGea+OHu6f0Ruee4m9HoqYWa1AMf6g4iNzXe+7s1G2vZDYL9CgJE28YQ5HlsvRO1cIiIESLJzxpq7XjzM0G0BqY7+lrLorrVCI1BzAF5Al/3MGqCasxnGfV4Ke01HuyJ4wDn3SJaVU1bMBEQ6vbPfA9MjO2Z+8XIr/zj8/kqgNtg0uF7JwE7O7iht1/UNHcQogUUEdBs6txdDUKbqjhS3UnIPCxIA/O1hOPlT3SseNBpRQ7zmhBdL1qvsJi8GyCxOQGOYptvoZvDCSurIMIo8LDhkWVh8t2GY6eqhbUjTh7COCem8XmwbhSU0AnauS+VQaNFOuX4RUi0DAm6iOiyx+PUVJL7jkTcxT4+mwkygBtIo9Izawd0mFxbiCYXBwLylEUAHU1udgiTmx33B6PR+thfIGE59fcXD+i4aI91yWbd862Mh8PmooO3qD3tNPa3ceND3ETc/LfatKLeXHROPCbEI3njRZKHvVGIwz8DF6bfb061bJvdpq9h0barge/1QcPbiLmJlCiB6a0zoLJVY4wl5twsJUFjHhFsPUG6VklgJhwBIfL+0Sxd9Dztc20kymmuCPUtnxflt0rx5CeWe5XFxciVIOgtXQnk5a7NTvcLapFFkk4ezemvj2u6n5rTz2b/+r/+UfOZiTeveQi4QbS8fzRvsgtIOQV0Im0o0v3jlpYLIAaJgI7RlmNVmOQepuNofNwyOt4/7ihSNMdcLkwn0t43Zxx73NvmVngmq/ePeye8OUqga4aYse8f7zgHfNq1PIapbzx8LCowkaM9uMeI321VfPNSf+Zl79HFZ3t8MqihxwIIXQTkBdjOzlLnkt/jF/4oDpsTu5ErSMAPf6Bq+ASpbT32WM98oiXiiLYH+RFT4nJ7QEBOGqq1MFk/XQ3oVmM5Dy8gL4JIwBnvpok2q0EE6goLJaFeO7V1zr02o1BZTiKA6LsAohfOGd2b+/UpJBwv6GEfszu6A4SBik2iAGLLMoDYvzhMEoWRlBbzQ7iADJTqzHT9721Gb1m5MejRkgJi1jgzMTNuEEEiGEDoFF/Yz+l33f1Re92SYXwbK17HFu70qDdnkPN4f7Z4tfH7FgWoIL34gTKAX2uFBLSj5Mb4n3kDWc2ZocSmGNLzwDRymnMUWhLxNYBYJyHrCeCGGpnzAGfHcIcXggolO5/tM0mmGtBrBGTGoemsZRIVqGA4fq3xDBkmgzbnStHmofYAYqwEEFIIaBxHnzKnBoQacCUX955dvzAH3+zuLz7MTRfy+O7LJ8fhVvh50W2niYYPqbxzFCbzhFAMW/0BvK2lfX/3yGoegYloe/bC/SNo6NunCXGNHZvNvK3bBzvsoY8rkXHuj/xIT08oSSp6e1/j+yvxjTc9QCTfyGBMldZx9h+FiYuMtfj7h9Ophu0eNjsz/Ta8gxitm7q5LGLOiZ5zkW+kmQqtWis9WAkwjzgth3pGxjuDrutBnjZ9TXfS7kHOqo/R/W78fPtW9zOgy5Y8bBdAGOLz+SP3dxyFx/TczvdUxwRrDEMzussGhOmBIHBnPIZ3Muuv+C+HMSfIIu/q+1db5VMandbbB+RhISW+GdmTFkn2TdHy3IPTGEHq9Vh/04CIN3fHQVNjmrtHMwGZwsGn5TSN7tByuRpAzDWn89LLSKJ5c8YaREHGBOCW1egC83Ntybc2uaIBdonG2/KSsPSeK6UXTWHmd8FMV8FnJSRnKb/L0PiNuaxlfiraLlNo+cRJYJqpsOVNt8DEGuWs4ZtrnmgJXw8gglgAYZMAIrd9HYze8OSWN/Bfj9m3WjKhkSBMXcbZZnIiNn4alDBmXlMaPsDp4kU60NubCy2vJJHW9NtkE/LBK17TLGLFZsxU1AsVGcfjbPal/gx7OCPJb+7bvkUSIU3ExvSlSPXDtBCU36L1HVWxJsJt2vOe+WvxSjdPdIAbCLzJ8wN83had94DUdbzbI6DbHGn5Kvz7B79vYUpAB9G7Ot5G7aMf8XqzYyJymKODh4s+rPo8RgbfISvMDHLfkrnFwwZTXnvoMAxCJBf7VkiUA7OvDRTApxqoqY8bmoGJ6SmAzrd4TSUwcSRMQJdFtuZ6hzAR5aI5UssAIt7c6c5FGvWd3vhpL+Ohn/K24vRcuH7/0ZnQpH5jWYdpYpLJOdMNQlBIj/6Il5imXCIamB4wNYE7lb1FBhRA5DPqf7evM+c8c/HuvFMZ4ffn2pGCuumgOZ+8D0xkBLoMyw39izH1e8W6AWc1XdbA3Appa2hwWdVAoTZL7m1pdworvR85KIBGYsrTK3EzqESrczBwC2+1hA7j5PfWyYLgOa8VfW3EMkLeuC0QFBY1hbh2ly1fk6qRoiWMLCA/YAUQ+gWQogsIaTrV70Dz6M0F3KHr7vllKYCG6IlP1qjcAKt+dCdzbu3VDccI8yVMjD3lZghRgUuHEjxRFAyhb15li9zodTkTwydIztktInldd2CickAIFe3F6LueFAquax76oMETO4F5V2MGEOEigJgKRbPhCSqhMlcJIAKkgMxVAmgwTQ0kma3lNdDT9s4cRmz4xSn3PZ0nmMOMQRSoY1phPnX07Qr4QgMsCMPF+pajNBAxdnp+cgs8eE0/u0aUDET4nBCdiAzMEhExQ/2xpZnFh9HYP72anp1zUO2TfXsDpUSY+/r9nKbrus3uV6O/ihHVfEIFdvRpe/RA9FxgopcCaKQ/0vzCpKnTrOipQDVddaRJdCiLisZJrW2tvT56cRLTYVWoGYhQM4BQU0CeSwygxYSWwmQweHo0sWScpcdtoA8qSVs8ym3rPElaV8T+6VE17WrDBBCyCciQJqAT2Hyhe3o0z+wKyK9pAjK5fHpcOMyFxXRyLpycS+7jPT0uuXElIBcX7AJFvOke6Fcc00+P13xCfb25X7CKrKCbFnnHyyvAkcrW/Rht5ujdUe66VOdLOnz7BRNq/zznyd5kANcOKCeqvOGDCPTWl+p4U8tkVefPpPFzmjuGQK26jhevwCwJwoZCvcaQjyhkqg8nBSg81kceRarTNCMer3EHzxkjbxBlnEooglJCoWFC4Qdid72C4RIXGgYuT/EnLigkrrU9M3TVZb64YwAKwpzYkjAmgcTF5JxQGEIU1KuehNNZ3QHPCMrczE8o+CUUhg8on79d3zfmqsm498eabXbEBxHqF1D4yu7LsNhyhPpnU6D9oHtPPXs2qFP1gEJ1keVRtrhF39cjJM2BPgkoUwanQGKi83TOceGJ0oOCFYz2nf7IeBTZnlOHH6FD8GziduktCYy20AhmDuU52BIKAuN0MGYSzpxKvaHT4Xh7WveNSyuCFR9FSSjIjHOY45tN0DcaxzPW9Raulm212R6fBhuPxjar137O5bCmMZ0Ur8klE+iQUIh51AHL7N6R9YW+zJYet5WyYtRBgaQNR0woRl2ML+cNZhWeBDAW9ocfsZbuUDHZCOvDu4ILPSehMFdCoejon2P9vRdrRiW+uoP65wUTlc09j2skO1gwoTDhfv/KLIYjb9QkHZg3oUbkGWe7QLVjeENmo0VcHCkxyRRLC2+DpsnW+iBFDAJWRS6Wkyz6dq9C5t8OkIivsO/cexsvlQUXLrUSCqM/9vXglKeVFVTcsqqFUMHCEx/1C9Ks+59Q2FAVE6cooBfCsrBDCbe1YMnM9gKP6sUxf3RCl1HckeVrOMGMmzDre82U65rCGEpe1hVmD1rZNzOCIMgzfgHlVpth4wL8M5ORoMcNOUHNscoxlL8ok44b8bxWXJ3HFWjUeeUrG8lsWxMwzF4mDo0QpGDBEVSSo5mp1g0XuCEHj2YElNesjHTeCg2PZMfNeW8F3r4KZ6VSQcAqxZ2AEJ9fpAJKL3rpVoXQ4cvJ62MOdReFcBi1qpi13mDcJ8NNTcAwtGch6naa3iYYW6vwQOI3jF8OTJDP9QQfhMZUcF8TMHzqs6AuzvbPqwm+CFzB149f7vUk7q6WMaGQfH2v71YIZwlFNwaUG1NjzpJGqLlGyIMy+h4fyXSNG/Q5jARteC5NUcAtBYQKsSWC2XgSVR76Dl4uYGxMFbuQwExFuv7tzNnyeL2YtTRnQhEKAsoPPwmFvgm1FBjfuuPmF9cPLUNUfcqFi3TrACGNtYh5yXtcpb+MJ1vNSftzbumge+vO9OZp3CCAiSVX/MYn59ZP5jTmuPp6Ed8lAUuuWg7dYe360WwOy55zlhdNKCh097535zwoIgIL66ILlm9JXBdJzFbuGB3GFc2FW8gkyVtj/AXfCUtcfMX8xUwJUgnHR14+01tuXyz0aw2Nh9bWH3sO33d3z/G43vPVonyuju3SurFe86Tz3H48nX4SSTMaD/eGz3YRVw0W56sGOrc8MiY/rlE2O1WV/nV9EMcafdCNkbi8+ReC0ie0e8jnh/v8PBcNah4vpJj2xCUwfhN4OX6tirPf6v6m6sxO4/m8NzVHZHht3MyEp3q1VvPuwdg3L7lhrJ6tXpNIa2AyV41lzKr54i67M9mBQEIPZPag565qaD+/weDSrhQXbet7NcdSLlBBM1GRVIoT/D+az2uRsjlm30CFpELVSZuagDg5og331PoFpRejOQRNRmA/Hk7qz9e8Xi+9nVywyulxw8KNyc2rAGNLWdgq26OvEortg7WrKhWobq9CUGiVuDBYWBH2WvfrrdmR+PSJzirMulu7A2sdrJ/0kRzjTQGL1ntYP/LTeY6rJxw5DLKMkYLqycNarLtfhhPSChxlGXLx7oOaX+pP+3ONrWI7u19FCAZL4g5qHHwLL1i3fAI1uNDlhWm5sJrUa8XKStI9IqtoVesYQbgJJesf8gnTCeUbFkcKTG5KbVvOuuu5V98M5LlVv2W/bjFWs+86+KXEbI2dn+5V8bG2wHaJjEHNVcWvRhTU7HSyS7YPjGBbbrcG2sVW2VXNp0yY7CrxP1H8za5t56eaRtTnu6uBgcrXcDq9lmJQdaYJpjofmbvglc9+xR09HWrb8sjKZifSiAW9LSMvTIwrcULr5IQ4mpwQc9UeiiUmnEsyeUxEd9E03E/bpW8P3HGOOh/zcNuMLavNh9ycFMZFwFvUzNegpAaJ+5XT4rTlHJftMWx0vg00NRVtZ3wSPglgivrmwYPMByc/RTizrXi4INizKmIKxY3tFAoepyM3Riv1Bv3V3JlPmvDMySPaVi2GrVQLXpy84HH1KZK0q+cDjYIPT0Gm+fzQYvCTU0FQvTEE5wnh6T59s/JCwXeyPaha5d99iNvk+qOLF/pIM3lLQqKDYLIBc2EClpjwJivQmLz4bkEQStJwqpdyPedPUCKXvX3RrXmYQMdWrWn1pgunE/UNepH8pgxbhLDfHGasyxvudWNEkwyQjDKMOge7ZBzWrTWS8tAnrMpETEGtbpyIgPY81Z2I0GTKBUqa51yAa68cmKCc/OAXquxqNYABei4HkyKs3jPtSUTEnvMNDJdGLBitY3JnchGkedLp3aM+sVzOTq+uDxc3c6VStNREf2123cHZhWlrcKox+2tadfu+q9G6g07dGdbSCAFDQqJLUncEkVp3zpvOixYcPkke3hH6FluGeWuVdFrcismOG+8cus3ahZ9VOa30C25dhKO4XGV7x3N5ag9Th95MSoRphxSz0P7GSa9Mh7VckxXIfiduweYt778lYfTdxQ/5xhsjZc7CtcGJOYisBe4RlsyyNwkgBiN5dW7Cvi884JbJAyMN6bbnAdmSGsYdx5n6cfKWeN/yskHShTeMc9ZYQffiXf1VaOT0Libzy7hp/XPJXPS62nmeH+/Sj/4VyKW3g/bPdCyGsZQRXZspa1IKSS4nxdMNzFE+Yp0vio/yZWoynYG1PLOc4iECve6al/M3Ka+LhS0T1Xywrfl1U5so+F3D3c4z21tvGfU3buIWNbjbmdqFe3heZOCJKRS8fQzc3svhd0kFs/trKm8EihsezSxD0wuL3ODih/nAXCH3Cl3S3/hUjUf4hWmmhAhdcPtkBUOLgNVyBbLCNGYXK59lr0C2X62MUJpq3LJWZgE3zAj2YcFxof267sUbvb8iozQVZH09MEs+blnVo05q+27HyBcmrJ6iwLHrqfHHDUHpWFk0eDKlHW/V2iHJuzgxhHgzOGnDC89Rwy676lUGVLjhGcccv9xlSu50zBsm5YkJD+xvuJGcmHCW3+ir9VGgcR60a4C5lddcaMw9RniPJFaVhtqMCYXGQWGCG3ROCvDqhBoZlPfCDxIX8TWgti8nrkvaDNPclwwnmTElTnZmIEpgo3KQQABPEtbC3GtLXEt4aawmSxj7aG/L2DJEM+DtkbtTYYprK7BbboqCsY+gnoJVzlx8CUu4FZk2UQwJ4Vr7cOMj6NoJ9ehnNDshHF2EE13r7y4gCRc9l6s/6z1+zHEBnsty2xlclocd7LLuOLf29X7NdW1qYR3Nux/XqyGZG4jyYD43m8gIVAm1anDBl7MD9xGDhFuLRzrlpvCjD2B8VyAJW4ldRJEQ1qmYugddpuAJtd3h71g2/F6VJOCtAWWymlBjnrCa1YOlEZKEceJILr0UJtDIV7w1/XB2uajU8xLbQMMUKfyKR05Du4nFP49BJLLRTiSsA7nIeGseqNsc3MdR7ZNyyByUHbA/9XW5fUDOENDPgOo6mhlH9wtT/rxXdYYOBO4/mBMSxzs+xboJTJjr9pdhw3zcmHElb7MtjPq9bDNb0R8kh0tRZAhwCAq8A5ZQaCKPmvGeZOKy44TrmRmnlmAMESGYGW/C5eAUrk0jZibcBq7jphdL0fW7kxmD9x/0jmmN2p23YC42ZnNXNnKBLaC0XEBppIC6nm54yy64mf4PKIeS+smkLoELI118+HCq9U5eznCOV1CF5ZKCc5XG+pqpjaQjsmUzzmxJJXVrNzrX3adPu2crH7e1NBYas8cnDV02ejIZcaCSmcjS6YVqk8OZScoDlz6lXmY5HNmmpdP3Cze3qy47eznaQ4V+YaVq6em3euq69qf9dluDUkxnlNa48+VX15y+HERt3Gtt2HJHEETB9HVAYZPgZj7uBZR9FVCM/28mj9xAst9fnxs314kghoCug0xoClMHqrMqdyr7ZxuNWi6DhIkxH4ePeZslbGcWTAGlR8rPTd4VuLZPzKgKXPZJ0EWfpGSwVkDNgimg1opcRiUF6hYUrBYmbQpcKy/LwImbOdT3QYdaL/VncRkvUdS9r0UWqyYmITAdCdU0TqdNDUoKMKiYmZtLgcsBXD8nU7Za32msvJz2/NmxtR42Nx4mtlxma2VoiWLUpS7QMHThejygXDdrG8WwWjBJ1vuJ6DfNWjfoIfFZ8LBmJHtOqQUjfhAw+Yaqy1oCNpgsbIg2hS2SmbPgwmSAEowh+olv4wVRG7WXtGsYxqxd7z8sjREDypEc0cSZZmkMphSU3Rhk4Vvjx79xrrB1LLqjbtI8GB9amtitPkQaKGPpRWsQiGsPHteFvaXt76V1uaVJBGUWRukQzLn3krleKGEdZkmHSVzTX6qejGRltP14f+x8htTeI9PhFKOGHAyEo0oGlwUju/ET9cjX8gsqJpkNqOklQeFlQYETf0IdBXOK/A2Z3VU7keYIEsyMlYCi/0d2LzeyRhtN8eNIGKmMbc/96mhEt5rZ7WRKs5Dw2JWWsmKPp2ytzxkyzOkGiV6m4pgWrvULkw5Tj5dbpVaR58a8QhHSWZ9r3bJI9VnNZBj1XevoNEo3GrcusHf7xZnVVM0ZSRkKmW7IMWr2/dIOcy1ciUnhZRRTpyehUDSgtiNNZZrERcie1O+lP42tdGndpdgSxkWQje9NG1d06bw20ua0060lAz15KK/ji8KJN+8DyvITm/5uxqvGgpon6ARtN5RX0C2gj+e7Va8n7nLIxp3pDdKYFfRosYp51ZYIqIOtMYkF5sa231jcvcXdW9yDxT0Q987uBq+Y98S3HWaP22gPfXU8F7DEhFQ66eAxIWm/dFsjuqODvk1OiE093TMRkQL0LQ+RJybGu86FvV7bZACK1zCwyOlpOGWyW+40JB8MWl3lgUeF3ZGJy+6wcDDiUioY0SA9p6xEhIl7foNIRBpzxmiTmDCmzM6oItlnvJyUBGilOb+AJSbNNCerwGTs7pdc3ycmxTc7uYHJsOp9pu5guQysHl1pKpMlGyCLgPUaLraFCa8JmubMjinhHT63qaXXzUbH3HxOyrDicT3UiWoPscjtPQWEBil75A5pQtHPOW7he4nrofC+HJAIb0GBAzKh6NqEYqgl1MprvsQkshWYy7XA5dBIKNgFlC5fHNeys+HbHNIIwnTI7dHdqw4o046EbmpPFdTUEUro1uHS1wPXJAeCspRN4DLJCSjrNQlqXuQNKBOigFqNTYmjxHW6NXxgL3FvjR1M+TN18sz2UMP6QEF3sQPd5yeO2MA8ADOgdxaKIi7J62RwW5bG2UZNinWN25vXLRIT3iRMaiCaps8DivaiakpC9TPuJycm2gsT8SYx0d/C5HgM7ntob461HTql6zViMkJXjdNdXBnPFMl9gu+flzxOtNkdNmtnT/PybxCwqNb0jTc9d35Cp2uYJKHQNKEcLKLAXYMQF+lOEOA79cr+GOsDEx0wmvrdZ30Rv9Sf5ue6k4Ia3ObQsX5ECMPa/gmFMyUU4qjDrxiqDvfH7mR6SrhfamGTwlcHZfGubpIuA2N3/NQxIkhcVu86bPREqZOAH8sOU4qxgGQoxmfAD/d678iahg+BHiZRrRX5ImeIwNqkGtdeXRah6qSuM4yJ9sEK7tFNarvAgOumtHWjW1u18PDQi3mU5HJDXlBIG+ZiIOi6CUe6Rs2xcCQvAV47PEy55zUqoBymBDD5hDTgQ4KhF18SDKibHXW0BbOjcGdXzulmV27omu2coGAH/2xmKXDwBwUO84RayVpLl6M/3GZunHzG0R/M7ECfcaAnLpw8oByR4TdWBI7IJGCCs8g6f55xnCUFa7GFtRinkqDA2rJhRxfYZkw3kgDm1rCCJ3DnuofvHCZZq9nSambHz8yOn5kdPzM7fkxGv1u7LTjN5eVqkTlX1a/4YSCpYKLqucWUy89FbbRsDjfT62VIPbI91n3ZHlR1XdQyAtHefFiPfasb2xzc48VRnZg4F8m6jETo8oP+lFuY2lUvW7vu64D9vqnHUGDLVHFVC9TzGEsiQvLvy1j628nY8uRyMOGIGDUdt7XDCuUghtvX1ioAPRQdzKvgyQ82UXuMymwPzGxPB5vxkEVi0pXMPfTEhC+NI6e2eDoE+s/eK4i9WXR1sOPp1ZpL5Xtu+Da8vZ+0YbS+4XHxxKQhWaFQIdO8YJjNaV12YyLCuD1PVyUfiJ7NMVB73938TtXztFXygeTJB4Ot57ZtIDIc9bxVkojw6t5sogUm7TEVi+B5C55DSYqwpc7+DoM4aOdoDicHQXOoMAmiGwLK5SeDR/jyG8FDa1huh+WiHSokR0rM3YpEhNuNY9pdOZ3zOFzsKvtBxlsZ/ZyvnKUUCACvyjCWTrhDWiVicJ21KkU2F+u6u5IHPPc74cTp33Dsi7bZa08ouiYndFg8cRFmEhd2SVw3Ms2uelDgmEkKcNPAbXgbLJG9EDBn4HKaDMI2sh65+E1cGCLpeqg1xESWwSvXQZiTTELRcwmFEBkn4YSJa0Xj7lJSAN2kgD5KKDojKVif4ufAoMDAnFCrhfceO7EcuW8adBn6EorwlFBokbHFWoexJSnAOgmlq6rKLLczdoJyLRJQri8SukOcCdxbC8VeeVL4YnDNaka4ZjVzcAU5A5WL64NyozvDy7yfsLnEJknQ5FZ9N0XTWtZsAwdZ2jvK/XNnTrgt90MCym3PgHLfIqDctwgozRVQbg8ElGYIqNW4pW7x9IzXzXmY29Ld6YKn083tpwau00KXsThDCtdp4famRNfsTQXU9YXbLQpcZ3W3KRO4Vl4zInZbV+X5XOji4tEcH88mDH5BiJNAQBmOBOVJw6DLIi0B5fddnY8ruZ9JObKF5cmLNonLECie/E4cuDyrklDLjZcBhGuuaCfU2dNcJkxcTpSiy8/zgctN3d22b7kFplckl5k1ugX+yqRwosLN6d1dbzgqRzE7QkLl9k98fDuLUVJ79yq2DlshMAc59uN7t3nV682Fun1Mm/zEt4v26BmdQ+JkHJjwfmGiddKEvwgTsMjtWKwz28MD1B6wxESCIEzAkpO3Hiyt9oAlJ7QXJmCBSZ/szbB/79YI2U3OpEd2k1gd2SUJ9aZ2ah15jDgpeBMyawoZPF1nGlMoRiX7zYO8p7v3++OuduKLg4rF57CJs8z1r6c573kmdUoSPKHLSDyef7h8/X/liq2eh8CwOPHQW7A0sSqgpjl6KptDt4BykkgoiN4dz1PHef/AFfrPtp4PhrlwN5zkVPweYSYxMVA3l891ZyUinKz74kieLh5sc/qd5DQjLaDo7RDAWlTvktXc9KoeNzmSgOs+vUBWE0hcK66ZhSWYiar3J73aW9M1pbR396eLQ40n/hf3J0JFky5w0kb+usb9secHd9F2M9n2h14STBpbQ6Ns0Ec1ufrHaMI8XkHfHMJMXIiYUDBNKKJQQJmpBjeWjUtcS9dk4aLLr4pBgd/0A8pjLet++NLiksZoAUn2p2d0tWi7TDygaJ+4zkLmU2rgmqxdULPKEJT6BQWrA5enJyWirpebK6eDWR6Ll3lfMKGWAr/FBi4TUVn8xGgoVJ6aCAImBxXUmsYcXgoKPEWkJIMf/BLVanbj+re52ZtRaF5vFN3W2tytvIXLLe2gwBOeAbVjqLVjyLySuHvqzGJF79EwfAcmAuVeeQvPWe+f7traMsJcrdH+0C1LSBsXBRenT5zpPn3hJUARvCHB/W1nWGsFjoGwX2uEQ6D9WmdbDa42ehAkXgl/dZMpmYk5IrgkQTY1X+myKdzxVdNhHTUu5N06SkSM3fdrbQUZ5fV4JKD9ymxg7NfzBVH360VDZffr5ZWFzgyFzdXsA0R4vl0/sVuV/xqym6v2ER34ymhDV/3y+fxhyVotqLxl+hcqQyFoR+Xpgbta+6CMaPJKvqFTJd8blEXl+g5aJhRSJxQcA3qEoQP6GSnWPl5+NdwENdwENdzmzgs3C+Nv+83KOIYeguBmoFCdGyujW1MJQQ9fEJYE/QwzjN3hopFeNZ+bmBdQ+mhA54bpfIMIm3SxHEgo0uaEYk0n6IJhavSk8evqu0M3by8P3eJ8OsXkk+tn3Q1kFi0Wyy+w7UlFQsqaVKd+jbbLLzBxEjI2mF3t6WmH2ZXrutnVrcU1I0MUPhjJBDWSCerozlyv64lpjAEZejg5tR0GsbsCvT/MZpRpbMv7xeuyW9Y9MHlKWtDku7QcqYDhkGc+6wk9X67U45HT12+QXrqdCnP1MJRwjiKoGVg6mflbFN6UCdrbrjXR7aArNc5j2q3zjXYH60iddsdIKOgedMeAoz3akkrs720vt3soHXx4MZcULyZJIkC9ajxMR9m4+J+b6VIGjOYxqQvO2XiyLeLe2PaF81Tj23UdchjydBoNWobQLGuWUIvbodsCl9EwobabvsKPD883q7SMQjJsEIS+WlG+wtaJaz3zq/XMP1hl/gCxuz/98W8//ftf//HXv9VG7u63j4SZuf9gE+2AwhzjFDWWs39VjbxmJpXnvNOeUJjnNeFhqtJjlGl5F52SCPqDRH5oNyeJmSlc0pspXAe7XdeY5GIUZ3xdIKzmrMQUZGw7GtptKoXkRzjVS2X88XDreRHHHeU4jPV7KxRf7qwJv7pENNlTceXF2vYBcsfbdEnnh+jGZR5L+DMI560Zi8uQ8fjLeWeaR7fC3B2p6+aJJc658sWAr97gGw/ijn3uzuGq9O3m9xiPIZGdfBdr7CYLd2Fzt8UX6DQe64swbzx28QVBa2wSargmfwAX6Vm+NI6axwM/xZW0/KuJxA2fC6Q+Umtlk8SVnTtW93D2yKgONbMgyytvAWW37g+6RAuDJHRHusLdW6iRoWmZQd893Zl1uUTggN0+P/1qqgqHZJ/XTgY3WTat19j5XXPNFf/x7lP3cUKMGw7A0RfGHQC3a3Nobjp4mZoOU8Z582CqKQbSa67FA03Tw+PDPVrKmDcdkoDXokzS2x/aGQ2grU/VXmLvCBcaJwUjknBNSBLUTGjtzPW6oJab63XtVWFQSbJmfVtrwVgXT8XUWNGWuX28nJRPH1p0J2yzhWnG55fcI3/xQMLCWajZuv5otkhjQvKdtcUOAnb3urYFaFKA2Am1Mri1dNv8snFGoq8FXetVDbdpTXnp9XH76fhpi0OCSdYEmLbprcLcEAwK3OBL6M6otrQOuHRxsl1uXAct3eZBa/ZSIq1++BV74BJtxXVjQp3KK64IE9f18YpzQOBybyKhlhsnvcB181u7sl6yYo6wP8ytn80bTkTjsvnCLxLnzUfjsXNTrEtcW9NVG7OTK0xGkWi/pY3U/vcmDs2XtEZ8muJZYtFdupEkqBnNgpqeXlyZ1dnDRmfvapff6OH4MU8q/3A7e9GWfATlqa99QJkzntYumwso6QaUyWJAORcFlJE2oJBBX63bFaB74fIIy0yn3y44vAPXQ2HZpMseCwpWY36lTArWDjz3kbjQbdxbicFy7mYrU2O1aqxWPPIR3HlgL6GQKaA8CJJQK4PJYIICZ8yAwj9uOx7HCV482Z9QKwHvh+kBW9svvOGVVCGV2gOWmPBkYQIWmDzemFDbX7xfmrjWgiZrETcWmw8KLLyXUGsZHvJMXOg2eqyOrqbDujCvZ+2t+XhuKZjwylVC4Zj9yoci1ieM9pSgn6+s+/CgXrTntdeEmg7cuIB8EpS4t6rkC732gctBf3titbtENdFJBOAtY0+NscV80D+ZvDTEMT4iKLxhL4XMbmlQoJq3J74CEwoxuPc3hCUm+k/vlHMyD5q0fUBp5YBag7pwL1xrGJ6ul2FMUaXUgUaUDNRCNoC20d6FfEGtXGbyDwpWAhfyNw88ex0y8ERgQq113fQgClZeTg+nle1IHnUOAdycIag1o/d7k+0FXYyt5AYVTipdYMXl1bMkYPuB12AD100RglrBePUsKLgpQlDbZ7yMnBQsNz7zkbgm/m8eeB82cF38F9SOSpZjTQroCt26sJpde7nQE2pv4wovaQrT9jlnJWFaV+SsJD/ymJ6T1ZRPLYelWDwiobSf25iK9rBf3/rh4ebPzQNv2u6jMsHaLHvK5fbXHxBhEx2F5jzTdc8nYAYXniNO6OYt3sYJRGj7VpNhW9tM/yGZ6SsdTYD+IRkPHyYUzAPKo6xaOA4WlCRlaaHvbLXgYUGI1B2fTzViMnnDVK83ZOu2wcSMZkkNXYzU5+NX7sNxUDZjQpR3tRCW8vgBEuIFZVgrDAPMtMz+LXbTK7vgAhcLLibUbs39x+DNo7oJhWkTCrMkFNILOuOJ5ZAWkSJRwSxQnQ7uAKN4zeBZQXYGsgG1w9jUbU1cT8FZYdZYK9ihObND01R+DRlay6013DRQYQe57fidbDqy7E9qC11tWzh1tHX6CAqKwjX2f+HzVqjJtm/oN7Z9a8AnEYhlBDh/F3JRI4mgV14TmR6x0db5hKDQLXEhbELBXdCGvd8vXEIpTFDtVX+ljkFBk7KKpvMBUx1YmJ6m4+5pQs/+2nJvXRTTdhE4SSd3/DSgzv4tXwZKCpBrfzo9mpnw9HDce9x5be3jNC6SJuHy83ZIgEQ05cJaupto75bNp0ezPBUvs0f5tNW9wFqvfUAbBzV77sI1e+6Cmm9lAXV0D0wHx4+sLwcd3dXpxoyWp+2Bs4uh9+qUZ62rxpaXE95p6I7vFNl3oDQcLGkzyUkRBgh1zoHBYK+HIjmgxnMbHz/OhgDndq6e9XzYpjbB/rlZsFv2/d3FL/Q5Vfzf3f+qH/m5UGSo2kE5KE8TxHuHmbe+Ke5hu75nonb3y3DeZNRZNR+nK07HjxcitK7VDuron2RJ6E6F8TF4Hj6ck29zR/igJuAYZDwUsTjaM7FOKHKvhCJ5U4WWZ6Z0Gz7Ml4gITglFcAoonSKhVCxwqVhAEWCTAhV7Xpur0Ftu1B2ECGs/r83Derd6Z5xxMKFQIKFQIKD8+JxQS4H3FQKX8TWhlgIPQAQuo+7rV9AtIYbkJEQV9Zw6zBn1adFD2d705uHTbU0gUUHg0E2hwqGTAKZblaAya9/EhU8rhJflskIHFMwmcPgx6o8fv6fa7i3FPToi2mfse6dHzFW+9Lb8aS8vHnW5+Gdntj16KJrWmIfu4dOpBoZWfDpKdY4mUNFBScD2xR59kbiwekJh2IAerMkOMFniwgYJhe8l1MpwgAyxLLjUH0vkFsId744P7ghcsOTpjoDeQZXs5LqTjrfHB2Bm+02NmtAvNfTw8Q93EDdQPwA1nqxN97s4PN85OlaQD19r1JHOBBnbXZ+tkJ/BMiwNYOjz2ZO1HcjzSEGBx+QSarl9saPhix0NX61qvD0jbo2VoeFRvcSFxir65fy74QHwbO9sM7dT4Hy9rnt5DH+vUuj0Hj1PWLzow+4r3Eh855yQR1ovaXM0LmTc3a0gw5l2DMQXU6w3UCMpbWvlAmrn4TnXOYFrvXfOs0WBy1NE7xRoFoo2s6Yc6DdHUzeHE/wwYDxQlCzgncEhzelo7xqRciboegd9cv48/7pxuLzmEvLxmktCXTcs6I9xQPri5LIIcyX64l18Eb8M18AEquHiBuzi9zC1xFtsHPSG65rRmZ0TqmwcZmcdgLpVyUFjvhsryQ0XapLvhgvCcTw4SbLJrmY6Cj+OxO8OxBtuoY5UpmLDpECHWqAU0/X1TYPgMp59mCSPNznekHSd42WSFFa5KSmqgCQUuz4J/Wh1fbDQzxbaOSgHTHDjXk5CMYUk1E0MN7xbErgHN+xvbM5zw7PMQYHnXBNqRxuvfNzqlUSnsaCgMHb26Ch5XPWt2UpkjIkENSYSFHE3xTNBZmYuBgjXHLTfrTfrj70ZAfr4YQKxoNA7CLu1pqBOjYZ347UIN56t9k61ZmPSf+GaCCcoUu+Q1s29glrN3BpYuFYznuhPblaLLbQ4Pt1bK2ytZltodrcdEuwo8d1eZpn43NrEzBRScRU/tr94ITBcATT7TN36/UcmDUnZ2tGlnjObegrqBkXzxdrcpcqiYG3OU+iH+y3ivHRoOeY776Mt40C0t2PHnDzvjn4TQRScDVqOKMn16ZmBWgRctGjtkGo5pETWU3XO2Nph1tphZo7Pv4ubfJedCsoP7qbb3Bk145yGU41j8i0SyIiigzhUD6rMN5XDdsf1vV0Y6kOsi5KmBkAw5Z5MQq2Oboti1vImxmi72lByrZ5FBoIhL0uMVynfvEEZbR+gru5VTvDhkI9uml3qz7zq6XfdWiEruA8/TPQ8l6q/haT1BAYFTeTD4ZYJKdyyY9a6ZYegtnf/4GJZ+wc3ZM2Seeyuz91Z0vOQudB52OEAirkDqx40JXkCykSra04bLiYDlxUZErqpPTChWwe9W1uopXBnKfCKWnDj1aGEWgr3OyfDCf792A/bpq9MOx5MMnUnutZeNA5BOF964uPRKuclcx736tqju9ucLC0JjszA5eASdMFvVV03FQ0XH2G+IPHRZQQLK8TCC8GMYDLi+yXVbMH04a2EfZKKG6ILphsP+n70xgpP4iD/cyy7bnc0SzZVmYShL6JaxfgJtvk5wiyQVIv/6EaDuev4DbVUJS7b5j8uHGl19JKrmVqqHyUEt53YdBNP9Eikat5oyArdSZ7u2MtMzmWXa3RaQV6bULJk+Y80EfL2hLrQZ66aBq5dgS1tvrhkvpgUYLKEwjoJhcoJdWng0qaBS5sGLu1qa8nMLrixSIlcsbj6lCf+Hg4UhE4w8+jTU4Se0YQDY6otI9z261UpCGQdT2Hcp1JLxr9Qh2uf17JNG6g4LRQLkiwnFFAmPHn9vHVub9OgpU2DlkyDkq4lC5/VzQh+i1T7E8Ne6uDc+5rS3jvPMZezRfOGUTgeO3EB9saOghs7Cm44CrK2gIscN3Yn4obLmxCX/hjJine5G86XXReBkZ2jmqpNDX19xP4lncnoH2OgRtdeOW9RaNt69nvugAeYMTC3uXnPJZERnl+G4etUP6XzA/O0fWx+BZkgzh5UbUXmTIlqCbizEc3CLf+ahdvMbBb8EHTIXv21q80sKUy52lsdDqInf9YpI7QPTIx6VQOMZZ3+XJfV23hAKbefLBEOsiCNMf5gKvCv9RI7vTCac6oKKJwt9eVgEi63bfqeMSba0wETCtsk1CrL/Zn+boIXI1dIYLU126DCZfCJJxRcx3A7Q4fjLaKFmh0OseficmceJQpTmQWnoJz95Gsw9X67Ph7hQUGVoUztb+SwPFGWRJy92/UOZpjLu2Y1VLc0eTXvNlBhsV8+muoniUrlbjWvgYB48a25JACXe9g9uq+aIRccSWR5Ay/JciyJAEdN4DIhDWlhrkSFtEI9sYcTFz2cuJYuY3NQ4OwaUDp+QmHygDI4SwbzVE7iegpOY17DTwJOYV6ZS1Q67lynYMFLuO0auKGD9abWeojckfPZcmZqcumrdEMZhFoPndtoTnvdPpjT28r+gCkNTBYRzTc1KzWHyyiFOPGCURQQ4VvNt0F1V1NN6N5BaatT2zoFGq8BP8rXZZ5jroVFxcSqaS5SSU/zJnVo1BysRreA3j+a3FsFj063F61Kq9T4+kUhCUbY7C5uTfHRuwd9qIQyWxZayIPXwq3ZJQFwu3vSUV+E24TCZxOKaBlQOlNCLbeZ5cajyeM2tMsLkjwiQ0LhBAHluZCR/MOOqUA2gbHHJi43zCZWYQ7+xDXSv9fz0+i2p/dHztPj3t1FozcFbBsjiyhhBrsTfVY6GL/h84zJuub2/mDfqFux+oHG2JYhNttD2r6lXokJ9xEmWicnQLM9LKx3ADEZZHtgZnv0W79qIVNigqok9ZgYVML03NF/woREyR3j4OKdFibtpf7M488yVixt/Cmp4M91v0ovyqBXBlkKKfjRR8dl0fzV2sjVIxYjmCreyWOpjWQEd1d7mCXa+27hvKn2MFZyQmf1K9bDSEwYSt1CncJM6Cw9HQiNkibaC9O6NIPbmx3Nfub9gjSfFasBVEaBqKFAA2GFCU9PTBr6xvs/fU802fnizs7vb/xIadklNyy6FnKaolirFbpemOZx+IwosF3iwk4JhU2SAqCJCxkSF3olroe6HjQPPyYFZ+8jk68cwpYuY0XiWrpMLdI3oXFIxqGdUGszJhyJa63Dg6yBy2GXktne5KhJCh7XykvPDwr08oRaLei97+/WVzMcteyZUybiZwSOdoFu0LGLGcd48Onq5nc95+2+XcBjtF1fN015nmuoGkNxFX6o0aJxA60TChVDHbplEIA6ScAxm7V3tQjx0uil/pTvifEcaY3RsyqONcOshSZ9Y6bDu/WsxfG6nomPtNCzDJCGlXcO1rCzOXQNinMImVAIlFBwD+gCdHvW3eGJ+mwK5rIQJ/xgAoF6M+MG4iMtBL89dNYbltAkhFxCyIRCoISCe0D5xmJvdo8Tc1NLH9sBqxoYqHzOPqEgEFC+YJVQh9tcQ13VZjMCNNc43a1RDlF1CMtGneYax8DV/LpmpCJCNUiiN9ddDVVjOI4+C9Vo2fhLDdWj31bFFWwR7VdQPJSE5okKJRMK6RMKsXSz3GxljVdavvmSVasUbVkNQ1Bf0WSouvvqo9NwVsucI0oi8J0XsUYi5hZqtPVisaCIcM2F77gulN/DzMuFus7zvjGWaJg09s96L86iAipU7lWlcNuawIsRdECvfLUzRQeCoBXTZD6yARcmow1i36OWISQzQ05Qk+oEFOFR8nFXL8jysk5AvS5u4SjcdS2umLE6YZJ1HcGShYmKjgiqHNIh7K4W4KXPxsNz5nRlEERKFby98BO4MLUomGIwCYVOATWRPKAwVeJ6CjDA+wetCKGbVm9tbSphHon5/uF2wd2Toy1Vsb6+Yh3rRIUfByqAcQ2Wzh13v8fRlv8Yr4C5u+nHLt7PqpV7fUKlRJjxCI65PHivBxw7GKjbby86+N3DYXPBrweiYG5Kvt9vG4OcJOa/d4I8rs1FoBjC6NKsIt5jQr1/XJuvhUEB5r9/3BhmghoC949bc1shyMJsQjWHie8fd4ZZEMAHYqFaCfYTBNBF9497T8CrwGWnCBgVPu7tBmzDZXZsCzBiZXv0Qt8w20hMGFaYWHcFp4b7SkkALjPuZrtxJOqQLfWAHEkckvQt9xGzPTCzPYKn+AP2ASqkviy0nySRb0okME+RgJntkfRJJAiQmEhOR8uOoeoHNvRFHoSCPLdiRvLqOAyX/hqgpILe7E1erO1bpvnZHN2uetV1lE1EmKhnVdxERF/0LJSbiLDKqP9o3vFmry9NtfCWZXKjJSrESh/jDmqIxn0gEYDbBiY3sF/qf4U6tSn7+Q3UTjrA1ErhZX4EmSVJJxn0nSrk2WHAZKdf0EZBk+W/+rmPZdwvetWjw+Ogthj/wtIz275Pl19rU+RIh9oS/Mg0O6Hw+OIIrnvNB8Rkh7GQhK2HcTM/ccGNt4VTrBs36M1OcoqFyJasPNR54ZEhKShwwoidWS7dExfWTag1GKe5xLWScUiXXrPKcfgGYQ7VhGLgJdQ6FMdM4HJ8JBTeoHKAKidRu29CHa5ZRgvXHLX49P5oAk1Awev+dGDc2DLgf7o/8Tnvze79w6/6xVKFvR6OuhkPbVVV8j22VxIVJggo/TGhjpkpEr3Z9V1XSysCxoYJRZyUi5ly+YkLJw0oM8SAMjlJKCJAQiFDQuHlepbvnuEt3r9tL+Nx1nJyVu+1jjtCw10ebU5NbcQkTQzfhFJb8efc+3Bqf4tU9kHcaelE20gnqJFOV1sNdG6kC2slz/FxW7NH9XBSU8NcUMvGMRfvde2M0V8/wFxNN99vataZDyc13dZNazcxDQ95d4RHvoMgt4MSCgkTCuYB5YZIQi0FVscVrtkcT6ijMDMUervCWzHpjomOEfMh2je1WfsFZ5jEhOMIE7NOYiJe6oMJxn5MfPz0nu0RRDVjpH/Zp+76lkclkgxCk1ZY8PMUg+EqTANo3zK1TE5QTqaBYRMT/IUJw6ZMwIz2DM0qHHcDe+kBJ/RMEOVElFCuUJMXSIis1YqZlbSCUEkTuoomYCkUoNmerrVgapqY4C+Z0KOJST9Z8PRIYqK9aPp+Mh7Bb9hJE+1VBBl8ApNb6P2SsLQdaGZ79J3aA5aYtB1feUtEMJI3GtVv0G3Rmsmwvt6CdWKS5tKbk7FLSlpX4gDtVzzgn+YkagjFcSsCMEhiQv1+xW2QwKT6h25Zcp7x8KVfenJjMunRtzWGN3XMD1Q+rtMv/SA28UbXIQ1Ns/LNmcg5nVnmSirV7LF0YdDoJ56tSwrOo47ETQrws6TghuOR9/USFw6QHoTlb+AymCcuD9ok2BqNAT0Je1yYMunClEnBQ60pfdfzS0nStQY2eabM42Ob9fOjjWNHs2QJuuiikIzBKKFWXgaZwGWUKPaF2RPZQ63ZGRSCgo1/R47iwOWIjeoY9+jOhGIkx31Yhysoce2nty6gcMpOq3h+sUqox4XNEhc200Igs8X9Yx07hN+SoyqTD6WVzscHzFIim0Ks103PYfrqJrlP0YASjsawyzhFgyrbD3qS2ZQ+FdQ8q5xQyJZQx23ZwXnGk93DhdeXHWSvxrJDXE12GHIJxaD9zgXbN/pgyTIjcej9zRYQKk7In1vkpcnz/xifu6bPSadrfpeNC6hv0mFXDL5+8e6bxxt+tlKgy+Iib/LTBnfZUPFddd1xoIcC6MC4A/NjBGHQsIi5ix9QDDvhrj5Y6C8Wau2/ov2DrvmyHlBaPqCwqD7vNztskGgiMA8NJu6GPSUKWwvdOWhHCoNPPOlAqmlhImBk7dlt9f056w6zlpYbKRy6+XLahdUUqvXbx+X1b+BuTi7IkottV+uqXNPsewbuDrhSNEXQTkNNJhp06NKE0vSBCw0T19Fd0jGzdnKKkpsdWUX58qQd0LIXajoknIvngsXTRPlxEXHW1+6oZFvMBePXTCNDtsAQCbHf8AUzhyQdE2vcDdrQmzsXomCuyyYUGo2f9d7YYfbK3rh4IMaIB2QxvV08xQr2UGmdMsZG6t+UKHzD5DcM2W8RO28qT0mGIP4WsfOxxClimOFH7cY97XGXe4oGhikqIZ4P2r1Y7HtKYpD/AM3v6YoQ8UM03xhMzRVjcndoGgYYQU0E1WBquT2WuE0dEMd+Gcsq2u4QG4y4d4+qUXV50rmQ+HOuazn2yZ0JkiKDwCK5TOhMKFgmFBReZz4lcfc62Bgl5sh8kg3GQ0Lh2K+zpLeZw5+T4Je6RwLqcqfmej2rcV8vN9C1Oz0oBqCoX68BfU3nZelTcwuCrktMkacxBzdfriSCKQA15uBq8ZKD2+btfA0f6A6CImInFCF39Hk/VdRqJxH4CInYycASM67Vzg/GP1ozukOcP5ixJejecFuyZOjbgb0EJm/4FV1Q4qzoUAmF4SNg5IQ2RR1WTjoYcwFlxZ+A7jBEEgqHT6jx5XbFylaBe29xn7bG4CtWXBOFmwNwp8uRyzxpJneVOmi5hVF7YyT/4VPO5z0KdRBUOm7Mo2W6NmdeEEwojD36W9RALoqd52lXADuJ0N7BEMNeU12zpNcELoNBQOEAVkCpv5PBjTuvCYUiCfUUrAw8QpYU6M+SgXuhgcvD1wm1uvECxovhz1siUfyt9IC5m5CkrSL84hu4vGIXUG6oCmrKpiTUmdjURUpcdL6gvcmJAlo78dp2cc+kxswh99b/VcCFdU50XpGxPTApu/2KH4dss3vGhzd5m8DWplV1wVrlza7b/NqJTf1DwMxmQmfV1C7KHNbsBF1gunqdQRYfM7eKsikIvlSeVuZ2bstIJLbLTa3OOKloRp7e94qmsMS7Knl9xbyp2YTgSwgeqbYZBsLlvcrpeP+ab9FeZ6KcACtoPxJ9edLiMjdrxy2Gszk9QdhkfCXge+ZcMQcJtZmDBPRgtbmtoSqmfO7EcPyiw4fzoBh/c+l9cLmr6UWnrfBoUUJdV874yVe4M94EHy92S6TppF9Nzdh55eDZNe82qvKqJypVMPBnI7/2oGqorjOOTM+96wbLbMWm2mfhaW8p2fD2/kedq0ryr9zTsdHCtJYwCPJMVkI3FhcUYmA1lpsxqbjRSp3e23AyCGpkOH5laqC3b0+UVlnIuoa+G98aLS4bW3M1TteppeEsKEZHTe8HZ4FkgQWlITbkADY+K3OCfkF4YWVfmCggXBMFBP0v6KkUxniBMjbHYTYDB3VMceKJLpnNEISk7GyGu9kjoR/vi9nsc+0Er6m82Qkz1qQLuRorLZ9yS1zcOk8oNAtoa805N1Dl0Exx9PWYp07j3RSTngW0NsvakTTZWXdyN9kTSu8Urhn/AfW4mArH9HnscrNuXfPkR8jD+8EBZQWHhFp5riHPmguHoMkRKCjPs4qTarTUlh9VGyfX8baqUVaEzS5kQpuackJbC0U2fNq4B90SSrpxTQ169HMulTSHbGe8rXIKAiA7zuSRxl6+ykN056kE9fihVkcH0tApSR+Kf1Nlocza57WYJXxtCZu799Ico0ciNA1VPO9kj32t3i9RKBNwKDf3MvB4zWi8pGOt5zksHAfd+UH/lr6ESiedvGJfJhQ9IKgxX0IdXVOP4PTpdLVc12aKontN1tsrfpLpd42kD6N6yQPQ5xndNlE3DnVRA+/fb3+9PX76uD6d6p+CCsNNQkH76XF2dW2hDCOByzoBT4/NiofaR7cYP1UefhnWaK9ejtx+2GBWS3oIbK/oDQc2fhM9zGY/RG9SPOQar8gN+2lGPEcuLtSby0IFjGBZwPCFAl7WflDACFIJ5tRVwBh9BYxRst7cb1p69edfGCgf1hu+1Rbt53S80Y4vV23HvQV/6fa5YSHLJM4Fc4AXvPay3m5VQhaK12cozJyYLWcY2gWMQfXWkYr1Lr7DoMm4KRS/58zhclnVM2Alq0JxW/sEKcrk6N2giCCaFNnlwmWlsYILfQIXTl1wIWngwtMLLqJD4F7XqhZcxJfAxZgouHc1CeGyOFrico+ngKFyAUM70w+vX7jKvrbbff3znBW7c4rkFnnhbaw1n7AAt3DEbsoCCII/opNb1IVKnFc2J+0D1B0SiprquUVR09US3vaIngqsSQeNGYdgAaP/DsfuZD15Noe9D/fTyJiYDvdaPE1QhsUP07gwRirC9X0BeyMtoHbBhoYFDF0KGFJ3x09TKi4gdtdNI2O8Ht6gjL3AwxuUuX4+70SGTt/m8C6ApuaMlQUMY3eT/sGNaz0QM2W8Jfqlm3amJXqrm3Sm5Rc7WJhjpn6c1QvYOxPXsAUb4hUwnKmA4TYFDAcpYLhCAXstfaSfmfQiAsjKa8kd82TJeFvAXsuV15J734WI13LltWS2n0QYlgvYa3kDByzYvi9vfO/cTAj41fmg2WoOlg33eQrYym0quhVsK3fDiq8F28rdsN5qYvuJppl7AX0kafhFLGkzaBSw7Z1mab2qYSXTJOJHQ+NHQ8PRUDKVhe1LP0gaP0gaflgqycEEbatl6+fDlhveoXzr58OWG+EF27pPy63wgm1Hg1liJbbv+db3fMuJoRDxAi5t9Gm9n7TeT9qljT4tK+GmJH4mMWUNC7YdJK2fSdprr+W1Ga56CW+NdaAKWGHv73Dc8mz/Wrmp6uDVrq1KWXDJQzfZvq3bJ9kNxEowT0KJm1ncSDAej0oKexAWhVUtQxf6PtXQJMD3oo6Xm86i3jpe1zVqF7bxvPiejoQFUT4kqCfut6eaT0p/C3PzgFUi3oHN+r7Rpvq6JlufAOYz5m7PN4mZrQnxmDFG/RiPkqWawz7BbMYQ99uoYkwkVU5U4/bNj524LFSQIZPKDx25LNQQLl5TK5/T40R63ZPRuGFeNG5RjTubrkP7JY8IHY63p3UPjws+7RUcKcH0r5G95fo8ZxmrQzfN1rtca9KQEJJL2xSS3woLmPNIEuFMnGDOfwnGSqzQRu30AsYXzgJGkacC7l2Xt3NkmuNL9qPjjL0Qn1E8lT8YsL6hwbUfn4aDXyNxc8alX/CUl3RwHzQTzPTyqFu6GRFGNro0iEHc66sERSwkMYxI8iJoJhe/zyPioJLEGY0K2GMz+5HcM7PuDAsxJ0pkT3mChvkgG6SZ9e4PP9KZKhzuphN9uoV3hBlMufMEmz2swOZ8MXprXR909IXbL4g//fPS7KwHAwb5EEcvJdcer+3TBvN7wYWi2gScwkVXSbQpXKxxRhXH20dRcOoq6pKd762YIdw/30xwsBFTdc2hUOrp3b1pIGZicxTs9X7dt6P21SwNc98srVu5dWJ0GL2a7KLuJ/mw2mLKzwzcEmxJcAkmSZDrxwK25tNlhJpwYLccpQn2Y23Okv6BPff9u/DYa5OD69PT7GCc5EHfVKFObz7hr+8fZrMroCaYr3WKAsycqM71HvT5C7ZTbVisW7b96YE2VnOOin7Jcl4SQKgwwnik8vNnZvN6wA+KKJ+fkoOxYmm+ZKUcMKVEntfadd0UKx4wGvWIN39K9m1KYfZz3nY9PW6ea85pLO5jWSYDNxfIeJIymMGkyc1NKOoxJhOJzXlGLmMCkCgwsOmjt1XYzS0iwBk/RWB2Pprn4t34Oartrp9+BjfN300N3N1vL9Z00OA1cxm6wBw4ic0BUcBw/gKG2xYwXHT9sH5051A+qC7Lpf4MU9rF6yoSxTnc5+skBoneOWK1peL7F50oCJq9nASDT37p8jRMJA8ajOT5DcfToG+k8UzYD9I8wRLf1iYo+265wUZTfviboMHFUYqBxVF+0pqgwSWTaBhHtT2aAUpekf/V6fvXn585WpIwujA+XFnZ3LAIEpwv8xOVp2HGUNDg+MxvhJ4Go3R4wYxxtYC3tZ/HR7EJytYL3HHa+GI3QcN6wayFF+Qn0wka1gsabzyXp8oe7jNKgtHjYabGzBMJ9ticJ5II54QCRhcUsLV2w9PmBdvateHX5YLtLWimotDSTEUB9mGvMQvKwPYBzn1GCWwfyhofynTDunbi1JJZZgEjahWwt+ANPLNgWwuaNLiORK/nqbI9Me6qTUxY5tD1JFFDQt+ImqUdSOaeoJBnLEceGq958jSRJygD/JbIJXN8HY4T4nZUUhSWxyvgZe0GKSETtFCHi91EntckCuVVDRZyywtUBZmfI3q9Sm9yyqf7mVmG3P0yFElROlc8ZNzNGF3l4pU5a9G2XIZk6fj1Ey9NCyYRMCCsCCWrepMzyyofVEAPvpBcTbgOYRoIE3IbM2152L1gIiaHNjASIPGgVlOjJUUrqVvWBbZ5Ie+1NcveRuTnQxbyknrWvLfaO6xheqJs1/wqPvUPyuObCwNPkZg/BNgs/O1Js0C1FPSkPdbQW66H0vlYW0oiiAA6a4uhFjUYYYhsbTumNettYc+dsNw9ijcLfr3bdU/b2sKFBuW9gWzZHNC+2+zeoGx1mXtdFClheDrZeK36rSEbDuX8SdrqGju4rJ93j+YJiwJm7EzsBSyZ4OsafOpZtVdh9mR2joMAv1GnFFPY6I+CzdiUtKHKZhcXaYC9/XpV6s+NIdp/9MvBbibn/oZRrLCC1XT1BTokKvc7+psFJr2oX+wKvUot0hWBCV6wgFABK2Khg8elV5T6+HbOfymWYfePWsNCD7JxAk7OvLLTX/O4uFxrO5+wCPlpp8xbhF8M3j2qetzlTO8rlisyZ7VdVcN+yfBRdED/X9R0L959432F2eSe/3ekgL8UKTBLQopvZDi7ef7X6+uKRMsHW3gLOE3pW6bUl9X82bne1phbkkVjTD+/UQ77lf4H7OLiQLw56CMRyzD8sJgvn/9/QCo+Sp5WolT/285Zzwa6bIiuSN4LWERB1I/NJQbR2Scuxvv+r74upT3GW4LvIiZdRrU97A2JIXL8CCczVudJkVmdXy+4QY2gYK72FAoYHqIA7QoqzNbf8LpKQYUWQgWnIhciQVLgYwCiAAEKKkKMUCFAQQW4v3GeqEfQ+JZBUuANDlHwKnC1dC4BEQEsfeIiIjoc9GZlTKVQxokimieh15QNPW84fs05kwknBpnnG76UGF3Y8pBbMRUcUZ+CGY4LLlwucL3YXAhoFkbHpnPxy0hy46jur12YlM354U6ocLhCFW7ww6HzezPNhZ3yrlkkKgQxF/D6awaQeH9sXXdytv9N2eib01JNXvENflVYsv9v+ERKonJ/5WWGPpe9eSnWcalaEcOjaecQ7XZ/+tk1NyPDhYwDpBT/9Ynqjb6Gua79VNW8Mf+8kQLn3AQec2565dihx6TinHLOdn2pbj92yJh924AybxH7xLkhh8IYQbGft3YkNksEDj2jA1ihisDxI+poUYbEQNIAliw4D4z2CTrfJEt5T7FEdN2SQl/NrnnQpPAA62ke4f9vstjVfAuLTQ3+MRboIo01buUnC8bl84RkB/Q3/GvhCsH/3ZD8ZnRLI/rQvJwIzXwK6kfSxNJb55JX5hhyf8PnuYoB4N7/FX50xBs+8hX8Wvrsb+FX96HUwqBPNv+70ffNbqUUTAJSCkZh7VnAVgUVjqiI5HXju2LniGSD6Iq1P5LjDaj3Kx8uWzrla47Fy9/9SD8OlTvenZt/b0b4GaZe+Rg65wdE7VoxinQHvW8AU4c95pzeg8K2lqDgAhy4NizOeSEoNmiK0Wx2L0p7y/UHuuFHOsHRXnBZrwOltFTs5bVus1TvsDGiBQl4WRjQvIIZuHYGXvDj9TdxPS15diiburU3/HorKVTSxuWaAiPXTGy7VtAT2Zi/csPTk+aGZyE9gW2Mp5U6l75JxI2M2Gj0tLnRWIhgTVbA3iRuvSe72jWcwKZ/Y6NpQkDMTCkJI3uCuTeTYEbgzNmZ/xVsExliZ8Qrb/Pf42yKtlEnaJsulgUnuvgavpZyc88htFxMmIrpZiGCDLGATe/Ekt6oI7l5qLMQ8RZ062TZhCMqiTD5K+AJ2qYvVZmKh16DSOMjQeMjQcMVZnoVJ+ak7bvBLNGCiFmaJBG35tE5AK+k98xJ0rYrG+8mDfeYUj4eF0yw77NmwlKc4AoRK6BJJQO79eZuXSQQtrdg6wVsmTMlSy+3yUki/eBzg0HDpB8FvDXTtbBdrnGce0HM5F7mces9Zh4PScyUnWDOzpvd/YeW71Nu7j+4MycFjKVjgs32UxBpnmCTAPOkXBLh6ZdbFdrPrGH8dBrvNHmaNH+w4jG7bqPE0pIwBkoSE5RxlzuV4Bm2AJvjpwVszTm7Aku5ASvoFhJ0sGR463ScXd15MG4OFto4Q1LAuDmo86D8qF5wH2qGqlI/hfu5xj1M0+1q3MLu5MG9B3+1YJ5pUMCfmewnDM3jKYnMOTqR0bEpNW+qFPDeisfTu4nN07sF7Fn6MWhKPSURXn0tYO97czs0ZnM4WVSKbKNS5LCvaytFFk42kszmz9ZC8y81+OH6vJI7fYJHFg7eF+a4sXqr24yXD6b2qcao2QaNbueaN1nyEmYBe6uyNpEKpY8FyWuFkxKP3xawjzpmCR3Cm9VygHn8NmmbBVxiey/k8dsgYi5NFrCVu5lZ2o0fVA1PMhbaB2fBZmbjpTlHnkR4BK6AvYC8dFaw7ahvWP+6YNs437AC9ugsbsf7cDx0LmKpCOe6tsu40/2yJ2QelpRwaowOGxuPHzcm2zqjiaQbHAI7o+mSFqRPuZgVJNgO08bc3UlsO9M3ptB0YPsEwF2USmwzqQQR6+kCW5uYkvCFNj09Hpvk8jY5OvcSRwyLl+19HWO+/LC9Oj+UHO84XJ53ffJVh9qh+gUPaT2cHg+YLor4mFzOxN+JK1mfBZtgzcVTsO5qGQtrlF2Iqd6spNNyE+IjpTooH5owPvKsIoabwNQnyJ4K9oQubkIVkWevOSbUpG3jXaMnfi0RRrD1cfvp+GnL6jJJnaGngG1gmPnAYG4eFSIcBNFprbdh21uFfHQxpQaSpY8upiZ1YnNHvICh/NOlH6J22m5mZsc6FL/29vAxzpT5i4FgNluCNK+rpyasa1bANpDPTF0z0W54/TSINCxvWsAwHvenVe2/LDltndlCxrp3cwXJ6/uDuZQNBpfjh9v4P+db5u5Z8uaMWsDQrIC9pH6ybFrrAw3v3RXamAIKGOG5gBk6o6P8CGq4E5BEWFKngL3cc0Tagm2HeMMlQ2CbKnYFjL4uYCtJyxt2BdtasF1YU7ULq067sJHZVMhLlvx0VsDWfUyFvILtlWeFvIINLcc7SxeP5nBaaWQnz3YJG4zX2d+gZWfRdmn9oF0+meHYmjRYcqrm8tph+2SvndmwJLCzvorheNp2Vmwbm9IKjAw85G5YszHBXC/2zw23QR8Om/VHNyWqsA34BYXWWcl8so2a1x4VgUxfISlYUQLuGbgTImDAqoqO+UIVNrvGPJu4tpfMVVbVV5pb3bghL9RFjfogi3culWvNRVgRaCwBN6xaU2ZNBHD6ISSY1VTD4i09tX/mqapoby1grsOpPT03Cdix0vpB0drZsm3bCSJwstTO5m1ta0OpwJ42R5YyJp7MTYYcQwU8QdlLbbdn2rlNmATGsA2Wcx+Z5qy3U7Ax8AoYY6yAMZwSTF8qYC+g/e7Qzr07zH20nttsozUfhVIS05NhKpspuwuFIiKwU0dg15dzv6UgsCfCm+7B0hR34DXz75WHCUJm7+uwHjZXtRI3AUJNrKSmkm0wMBWrCtgTscsLnaVw2NqKcOFa4AlsN+QWpq6TBBTYE2G1s4LtTCUibhAJ7AbRwqQl45cyHV0qZ5fGC+GRd5nuERUIPm7TjVSmG8NGToTheaJpKrAGqYy53sRHQCkC470p/0GfAu1XHVGasLcLWsJGjvuaL2bS7P8Waf6bGtuvf+KMjPgbzuePp43tdxv4Flf2Y4/A6KLUwy7KhO0NOPcGtGu1hc+jBYa/hiQ+jxbYyj3jcr0QsXLPrqzc/nOqWLpF8GJmZyuBvTo+bpiylyk3x3ABY3QmmNnB4fjwDF8KXPMxpuumcO3Eu/DL/KUPxgI7ewjsVBEY3dvrCzPTT+kiZASIAnadLmzX6QKjd5WZmwfdC2kM8wJ+MiNSpN1qfmnCfBKxfS5sbyi7QSpsbxIbAJd+wSuw7zIbSYSNLkt1bCRZmofDE5vLpgL2ytvdxqXPrAT26tjMaumjlMCWiNsdjpsyK+cPph55KDmzy3eBrV1nLAdViFinn9kNpaX/hC2wV9KugoTtBbQp9dJ8YT5MBJ6lC1ITAW3pt1aXNkid1LlwqHGeHp/jGz9m+tf4Zua66/1JkRykN/cnfW80Nj35TW2BXbQU2A0PvQDjnFJgS8RVSZGA2vVyArZebrfr1V8v3Jx30p6XpWzWLiGH3eaPV9ItEbMIYUeOdZGvfuE5s/550XrVvbW1M+Mk0QvFAI+SvHxTr6tS335BKxlh442gutMem3YfWdcMR1sYzv3zNYtapDjW7zYTlvDuuHHueNqp8BMXbwLr438dOz+c3yWTcnUVkTe/76hA8KImpif3xGPuwTyMGNjcPAsi2kWuifyIoPamxMyd1EoeVlANzt/A2nEsCnCWSp7WChr5Nc8kYg7/6VFD37mKho72yVtYoQlqiqXATm6BLW0vdwQno47ATQ3e3um2OXcN5VvgV1AxVPslTzsHqqmnKKpQrqCSamtRdREC40oUBAaFABsZCpjYx/sr83L19qgKaFuHrS+QFry48+ATwaqKfP2LA8+WtwDv1uoo+sbFh+PwCnhsV+QSOsZp3c29jsbVsKRoY2wVhsaB78ZaPzN117RfvG14DyM5ciEgEhSjkEAQShKc2ESCdBOXlaN6XpYsmLC5qJJV4DbsCFkYIyZRObn1M15gKKjIsYRqTWAODAYqxkaStSaAsoFqPkL0DYvKFVQKq89RVtqWyzkdN3g93ZUrnOOmWfxWu2t8wPIKLpgofkM8R8VI2zpx0IY+UvNohlyCpxwWYic2fbO4N+a/xLY+d5yxGxOb354CbDw0wfTGArbKGy9LbC+JcZ7ANl+wChjrqwCbvtxtdTljQ9cWuPXguQcvPHjpwdcevPLgm60V8ObgwUcP/ujAmtss2Auo804W+2ZHcNRKNdj327W5i3Lx7tCez6XHGvJ863qs/Rkj7Od61J5mNeT+Pd+8U7VPsURIOjEHKJjw1hPPcxVMONm7u486eKk/w5nPl+Xwi37x+sPlqK3+r5xc18sEMyrIQ5mFM7aqxHNR9rjPFd1emfQ3sWRZ2sISmyQ6rAn7F1TsFro6yQX1ru5BoSLMq1d/5SHYJMCMrYDR3QWMvi1gdGQBw8oFDEsUMLQuYGiYYO70vOqvlxEQ90KauBey/MERYV4PkfU4ccSY4Or7xNt4RVrY7TRjVbeCClvGoJi9GhQvK/tQDv0/RRedoWHp/Y9HOIUKRkVadJpQvf91taRJgF+7C3jjsWHHgg2bFTBULmDvf3z+ObH5geM0YQvu0Zy8KTocnglOZt1awNYU5lDX6XrhjGa2wk4s0RchgqeCUgBmUwXs+mJj9vU/3Z8uHoxkGzOPifJmZn1CYGcIga0cM+7TJ212ZwF72tynL9jO3zbm5Fxgm5NzBWzlbrj1ntiMdwE2B64S3DCdeOp0ER5abltWKxeF5mL31KHLggSdYb9dH4+MQwU8r4kUMBZjKka3tKjcK0kK3ABJMG/NFXBjabMeRsGm0AcNIn5F3Qv8gR8Ttbwpa/1xV/+iezg9Z3Zht/ULHfgU6XyXzGpj+ucwW32wwgsMppJFYATON2RxG9yFCuIsqbxYxpNpV3unkcBch+0fNvczo2iA+aEwsM3B0QTzMuH+tH64Yv3mBDOkFDAG23h+5ml1vo1unv8rjREcChgdE2BzHGB/q+fUOaISGXIVGpbjjCfdEpshOsHeFCZKBXbraZtH4xOb0+toz8Mvw+b8aNiL7YcNUpNCBnq+QWaKijkAqFJ/2D4NhnOep04wA3qAF96CNzxtFtg3jPP700bbMwj/BWx6PrBhkcTmdk4BeyLcoCnYiAEJ5mpy7ISXLjT3q3XKqkEoD42NNW/dkazkzry9gL0deP2pYHMo3p5MYaNEdsNFUjOjKdheEGY0NNoHjQRrIOdXkoCDKiQwV8kK2Pb9jNe9A9uc4A+wOeOdYO+z5jx2YM89tjmum9jeznOvvCk+FkSWfjwsGcS0e2hK/ScNM2kFaZ5uSWyuzQN87YmsmNz12pW0kWBl5lRRXnFg9Kr8ZknccFu3XywmcD27G0aB/en59MyzpfGujznj9epZokyu4jRn/sOcHtZ+5KweGPGA0gVcOpg1v85YPKhIAfw33kJxx0u3uhpbC5KU6dIFDIYJpjfW1lCyNdaRrRluTVGsJEtvPnS7Zz0QWlMo4GuCzRXkgovZsYCxFEgwv/gWcEOGEo+lvAo2EvkCxjL58Phwr8o6Ne3RgvFK85RjRVu9wGraDgWH3mh7K6fccXAE+MDhnOAJbH7DSGyGigB/9rS/ePBXy3J5v32c1Hmcl/QILJx9p2pv6HRROyFfE/CCUGkAbwzYww4CCSQC8Blh3zT8QJzgewy3W1Vd+UIb9F3bnfrTc22E2yg6wpRKLlT2qV+cSkXIy5owXjWpyei7Ct8rCNq/J+0Am+Wp5qHbGT+nJvYaar5+WmX4xHz2XN1txkgK+SB0kQ+kA7z1Ym8pSGDvDHY8T0U310LHfHu7DWQ6v5BP+i5V2/q2O+6Od5jmbrvOgfPBLbp1AcPX7p70Gh+D9bo/1VIUTBgvwUwQEnzdOSJmORjY5nT4fvv0a/N7xL2CjSS0gLljsH2yUlDpJMAuLGDPjt+mE5vZbAFb65m7/YFtjmkmmDnM3dN71Xw1tANs5A4wzJREmIgG2Lx5OqYy9Vm62y/w00ICcoxB+GUbyu2xlNYQdxTgR1rvawcYeVN8a8aGV75HAX6YBOaPUYpRh2kD3FGFczKp8Ztx2jV+v9vqsVLMccwJR3Xii2zNa8uTGUHYPbFYGDY1hQSziOqWL6sVTE+AtcATm1WGE8wPnVuePSiYlt2GdhvPgYzfrVlXw5bT2JoDPsH6Qsk8PC5+2PC0XYJpgoMerV/hQktB9noZw/CGeRLgbsb7w/bOfFjU1+2Sgcb37rrze3P+8MtBT9xfYFgH+VlDCiuWUA3Ulku0/saIJ9zjBNhwC2xDWa9DalmC8LaRwDn+xiFklnelLXp6bKvaTbXVShOEzbHJxXf5ccU2Nh5XDJHuWc6cT143fskVfeNpsV9zRlxKnTk3Wc6+MWf1pMlZvYAhZwH7zph3TlmTzrzIe17jvqTXJlcNnmb+tlTKKHMZb6EChQwVvZjqFYHarxu/LBd9Y0yytnFrG/teM7chUknu5RYwxC9gCBZgk3SpeEZLry/I0yM3/LnWKSihRSGE/glcLmwTmVYRsjkwW5DBMJAn9KEFAxkUCmGYNXCnkGHsQPbGMJ9dgqG5KlHAMF2CubNewFaZllvBic397wLu6p5NMLP7AvYs+Y2+YMOsBQwDCtyuOjdiBW5qAePhbjNJxSlIi8o54nh3dBvs423rcYNAyRCkKo1hiAJGBxYwDFHAMMQowZiFxQwIrVL8Qw12jXnTvHBGMvVxr6SHg1SpBoZ+onJjXA9UYlMoUGe8x9EvplCxn6GuKFF5XElwMbKuLdHrdmINK6LAlqQ/rlTsQYH+eoI0v2S8Iv0j6xgZhTRCanNU+RXp2TIzM1oFHtqvvOjmWs4r+oPoP0J/zhP+kv9o3CrBdKEAG3cpYLhGAaNHE2wt6Q59B7YxwKf3RzkeHCvAZt8+wG4XR8euDobKlmfSFAF3vwq99tqkwACmRyJdOfwAm1wtwGvuHxbwomaZYK4LCxgRVmBXGjjB3MZJMKezAobDFjBCagEjpCaY81aAzbm+AK+5jitgZxNh41OLtndnfHGt0IBfJphfOBLMi4oFjChWwBCkgDFCHk7NvTku9m57q0rt+jNUan/jCXuzaEuiTHcSzGEXYBPXVF39N0k2/TKclVDEnYQCOwlbL+HcSRhWy4A7PrxuBVBbJ4DAToC5FaDXjMzkttdLIRwpgUvK/YonkR+Eam7w9osb5ruBayroaXaYugEXCVOax24R9fMFh1avGYJqivXRaBRgI32AjaBde5T7gWUBY2zF1ySLHWCDfdo+Mjvs2gC3dVAt4AkiGM6JzRBcwHNLe4bBX7ARhhLM7acMZaQxmWpTw0DlTNUdrpYdo97oQv3dsKtmhlF3aK46uobAjmQBI13vfK5fwBhIBYwpp4Ax5RTwHh3i8/OCjS3y7rjRyzhINVT3RqscChhg2kSX9koeOD7tG/snORLd6j2JM0AlmOcPCtiLws9iBZu2CsFZFaZgH2DCxDa2EhFuiCYR3nAOsDmkn2DjqYHNXYPEZo2WBDODTTATnATzy1OCGbYDbEpBJJhBOsHeJuar1oujfDx/Df+eo5hTZMnT69N6fcykJSIqtOTcShWfPNi67MnUMOnu/aDSeQZTdGtc7ox7mOYhi37J06Vd0DMDRmBXxSbAxvH0uqcJAFsT0oWJkbLRykGn0vlDkqUdz+U0tg9NuW5XVzavOejDDmaoza7bJNemxg5RTHmvcUNjZMvPSu7msc44QIWROSehYD5hYeNSiU3Ddd53NJUtuEk1VlbRBFbirRaOMEpOgxD38ZwtjQ7oZsFsi1n/3Ukdeak/7XA3/Dvszf7a3fmL1jsVSWgvo1LCZd5s+1GK6PyR4sULSRIrZtIlT2emVQczHb4MOcL3zLTqYKZO1lt1TAETzHwswfB2exl/rPrwfamYV3W640FfkrACO7MIDLMIu2ktEYEdEYGdfZo5iSgdNJcXguPck547+Y5fr5qu7uSxwOx5wFy8+6Z47c91g64THTO7d8on1psa++VJ+uJ4bgO1i6YbNE3wwVhOOQcZBfbCEpnNeLLtg5bc6fcT8sxmt06e2ewe8oykfiyCSs5Z44k3d5ZnwzdcVBPx3pyVH7OJz93LkrCknWNctPlnkONeTXIx+YOwzdXDwDZbC/32cXnN3S6Bf10pC7non2uXKS0QDGIM8NHtgowRXcBYbSWYy58CxjSRow7Qggw3SGRszidy42lwlymx0y3fHbp5e3noFldl2LgEyFVMK/xguwJGINXrUJzOC663KO8HJjYzsQSbt9DDGVgWuGB7qflqQcH2AnL7L7F5mqiAMREVsJdk4d2J9WaSCF9FKGB0wpOy0BU/BxYwAsJ6u42j6ut60Axw4NeOZDKa9W59ulpt0TRejOCiIrBVyBIuPWaUgVBSCn31L/8wJz40XLRlDi0KcQyugSnm3AEO0RO+/OLh1yzokfjXLGqQ8NUE/moC/2YD4ySdm43X62aC/o2n37SevuCWvgqCWXkE9/jGFUL+dslOz17EaBmwLXVRsb0o+MZ5Q3vt4XpcGVq9ccYwRHLkLz5YaUTdSq+nSn6A6xQztZ6g2oJq0NDzHxP4PE9X8Hl6LuFz2mo742XYwL34gJw0rsE42+nhAy/enOqIHegW0SZUnFNF0bAB44O5W7ZWRbfHNdeY/TWvShy69dY4RxDgBscHo7Iwby0r4B6OU6xueWxashrnDGYU63YKc4ueu2/W7fywnoBvJuATdG4n6DDB1RUy8b2doMMUt+AfJ+RhKCr4X2DyAU77pDxf6JUFTk8rcAa7exX7Msmz+AbcyR9w2kFX766WXNfUl9guvlmdjWuY/Ic5Bho3+nQXmGIEfDUBv/FwfbcFnWnxJAzTgITYj1EhqBjALv8VBm7nKunPqMAAB9+ENxP4DeVM/HYC35SjDnztPsKgCZ+gowsaHt+sh5OO8acBbvVV/VFP/9rrq6e4PP5qAn/CsfTMlpdnzWid8puP/3Fkg3shAzYWCwMcGX2Bc4U4wDlNRy+uzTxY4C2iacJNGlDgU/iMUgWfUarAGaUKHIuPohfr1g1wbx9zTUFVc7zsvE2cpM1lgwJnfrXVzTVrRh2p9XCTfqje+gTuBNykHw3P3hWZTdYlc7tJoQ5mvz2WuynlLaqTF55DdDcPOWLOdGq7q+GHY3eyrifkPZDv38A+EFv7S1O0b4E9iWzOHqUlzJMSA9xGJtUmg/YDPhR1Fj1P1791hhRfmOa79L/3RWkQHFbsNqeljTyS4q42eXf81J1sPBI2XnXpovOnsPGsSxHQbHqED5tqbgP+RM/xVZsBHz2nR6yWNmSKKbrhEAbwHqrd5Npch+4NbBhAPXGNvcVBapTOG+BYs3XBcsLmMzzkOlB5qAUvcH7UG+CbCfyJvuDNm4EO+mKAw+wDnAZW3030RgPnHYjATQc4+0PxZcKSvEJRiHDNNsAnLMN7vt30kOFDQwNxmKu7f0N0GDGpmCp+A9x3tnkBd8D3IbPhIzoDPqQf4BNy8vxHwefHqgHuTd/wKZ0B3zuluao74ENOBRSz7RJRrFl6p2yW3imbJZyyMOVplwE+0Vm8nzLgT3QWH7mPKGkT7HXDuqkDcVhmgEOpmIOmiPvI11wj8g3EfYxrrn2MM+8MFzpmTzx7kGU3B/wJS64m3Gk14fYsxxrG8WGoWU2402rCnVawfBGeXwUH+IQ7+Y2NdcNkcaAzYYSbCSPc0HOeoi44F6Kvd4PH7xDnyyvDNQqdi9DxvUv9aX+uJ65tw1LZ6+DlFu3Pu0d3tWCdcJ5IKnAeyC9wDuGTnnZAR2vz/WTeAEkaLs0NWcz5u4JvJvTEN9NZwqnTZre9O5oSLZvdB0nJz0ubXb7t29V21wNq1sYJX3yA3wVc6mJpPsAbR1/47QQcCe9Ah+YvfJcTdK4n4AhmA30stQuc33oG+IRe/NZT8PmtZ4BP2GE7YYfthB22E3bgOZTCt5/oR27sFnxu7A5wL7+q/1j7z3ae73zt8ecTfjKfkGe5QzyTnCpwdge+5/M27z5sddBLf4YK/496MvnyvHka/1Mroq/23FZ+OD0ejk4H8eaYOZO3vM+Ced6mql7w5tZb0buD+APcy9p+XtfqJn77GfYLeNOyllWB84NCwNuFxxfc0m8Xd5gXk87yF6tXu5zgu/zF+WkjfDfOAo5xli8qW6sJ242+oOKiUMBdFAq4i0IBt73SLvl5pljnuHW9KHykQgXfjnrxtaMs4M6a2oJkFiD6elTRw/VIuuv1eLrUwnXsAfZXafB4fQT4r95eeHWGcyziEqclahOdTGGQeH0EtJOn2dpPuNnCfyXL9DsQ776RDdnQqV3BN+IZCC+c+S6QhcTNQfIC5zn6Ameg0xVoDL3ENTt4Bc7d/AGOzhzgGJIDHLpOv0NxEc9stPHMxhymLNQmCrPPeMRqwPdSmeuvia9yE7V/DXCvddNM0OcptYEOQs4AR8gpcPZkwk3thQKnZ/2YtcsXxnjfxOpvymQUfs4D9UHS1IK+fTiQtPYhr5xjJhyxfB81sq6ciAk3Jkw4ovZAByNTpweHe+ibO7mh/tAN15unk/GFYMTjIv2k0ubb1/bh5A3EqqRFgZnxvZRjwnC8OD/QmTAQPyoV/AbTyACfkMeNhZCzga+NHeCO2w5MJnqZH+MGfPRygfNr1wCfUKKdoMPTmoUOv4QNcDjP7eWm8x3PQ5wDjYkOM8c4n2c8aFmIsMTaAIeAA3zCq7gzN+BPCMnzoAV/aSJveMmU/KyENtCBVw1w6zj6OmnmRW0sXvGYZdAR3NIXfIq+tYPw4VD1odN334lCrlhDkdFHojfw0ed5LtsOBU2dGP/r7cPuDepTdKxHif6EhXmVLKWENMUGPnrp4Zkp/AkpffQSHUhZ999UEFPbCV/xQUz48JWiow9iKmUBXdRDp+ke8sFNT0zbMSn4xJjhJ/0ipw9kojMxNkwgW6ygU6Ht45gqacOnB/wJr/NxTHQmZPRxTBXOJ2zm45jwJ+TkZ7giPz+tCr5xadRBtxgxsdye+FjbQMAJwo001T5m5ZeBAoeWkF2/hbyuHwKOcbXvn5wazs7RnmNLQnjdrlgve9CEA05EJiTmSqnXtAu3eTh9ghrZcyZaqz0keDi9n2g/oRzjdFHO5o2y3GxKP/bI7YnyDcRp/lTShlExZRjtD8ZtCw3Q3nxSaRZvFcbS9x/Xk8iwdtHGLTdjsNnAG/AJZ28nTNvStKkprwYVeWxAFl8bkAM+YRx+FhnoQx658lTAsFFdTHlmff98yyGcivIBwf65MQRu3+MLXJH4Gj4xwDH+grCbtyQxK+QHMqNZirxC4AnkCUPzY1jEhgmZV1NEpiSZ8LbVhLetXO/aeUY24cPuYVjlrd6GNrnQQ0beeUSGuga21VTYhAe21V/YVn/Bob8ms4ZHhAZF2UuBTbmLWeBvAxVGlqAyJeGmDmaaxI/Otkp9pVCNXXiaCWlBF9d85AgPJNDL/YKOrynpDRITlvLTktL+id7005JdJsiyfl4SNnsz+42Liv1Hve6wmNaLW4T9wkchJe6wwXN/mm3fID5hBD99ulVITJ9v0J8ww8Rs+QYh+nXa08+YWpLAoYqjmRmzt49JDOgTA4cTaWS/0+L7CXZixaOo5ydYwdHBRU4/wQofIUjjaorGRF+Z6VHz67Suiwk6Zu5dELbX1Dsh4JTX80GXfs58uBiKcUmjidE+fYsBSLgTspmJdzE1X0x1wGpKjolB6uddVT41nU4bFXvcIKYrYeBucTxXM+VjUzP3DcdOUIFw8SKkTp5vMLkIrjpBFq4a0RauBy4Bjxcu1464nogDcrxUp68JHt6yREXim695Bc4vlwXO8w0JN3d68+Uv80zkAIec5aUwngca4MQvT4gBrvos42tKpQaHubY2vCG2q407FncZS0OZxvH2VdR2mmw8Fi++cM9xRfPfI8iLoF7Owjga3j6CF6j8Nfx/eBAJuPHwxUwzYC1vwJUaQZTxqv34yXZ8mOHi7iNzxqBzwcl+ID/FFqqSbX2xoHx7mxJBqiDcDDJgPJOXK9QytMa4L3DuRgxwaExutWa+a5gADhwm9GQCOOBPaYD5ruD7vnQ3IV4fgiwPOYy+H85Tq7Xl42jBUZS3NSopjwPbUjbvrhXS/NA7wMFyfX+45zXpgPJqSB66KP74TlpdXepP+/NlnH+oNdkyJc36z+vD+mNfI4dsuv+2qeGqyoZ1U9ReA7eBAJTTa2QIGAMuoiD99cdqD0lIfoYvTHwv6JoeBB3wIZRKd6u4POmPIXv0vLGku3s/Kiq6w7pDbXHAhwLgiKhRgFmv7wB/NFPcEC53r86z0dqcyMk6zmaKHOAgP8BhsqFwL/DHETPKNVYxUxcXAd1d5ijcC2JD0V3As8KsKexonjdU6cnar0trXl4pcPZUgbOqUIHz6PyLFGPdywcz42UZXz73bFs3Xgd6ZpGJJ9MTbk5KFzhPPhc4M8EC5wn6hDfMpAY43GeAY8QN8L3Vt2kPE/DbCfgXwLP8HvdgsgJc08HTUErum+utpB515Hg+tNSX43nSPguJ8Y7PAIc0AxzWTLjp3QHu6ZgJsODz3PwAn6DDeCr81XzN7zeH55tVhqj6a+xELbDavqIbFdYQGwd+2PUY8H1BNklIPyiUmGbFjh43qAfsxsgZ1JECDfhIgQqck+UAR7Y8wCf48gN2wefuzwAH/dQWcXPAnuDKQ34D/hQdJMjJFQnDQGXCltziKfi2IJv6hMvyAX+KPvpKUprF/UAF+VLq1Fr/2PAtk6SiDS2Pz0MTUexuAtfrs5nwjQ23GAdZMKaG2m7wmaG4G+D5RqF5B+PQDiVX33718FlfIWsVy7OHaws2r5Boj4YLyEEsOGEgoxcHZNpUuz9w7wGZHTO7mSIMeD+7maDL0FT4cRdqgMP5BvgUfVhkwIfyCd8wsZHsngbrZsTo4GbvQBjd3utDge3zDb9ACdcrvmE+KFxvjA3d5htnLdn2qyTPiYwBNKgHe0oMwAZc50tTdOlLZhtmoAsa2SGAFmxOlgN8olMmPHLDHYaBzkQncIdhwPfWUmnw2klkWYTUpHGBTCrBKvBtSHin1rvBNe5Aw6uzpU8N+FPqoPMHfHR0wndUXzXjJoTcUdFSdM/sBnBzZFz8RpvaCGc6sDDpjEtGR0cV8mDggTbX9+cfwDR/UA0/zBmUJlCHTZY3LtLyM8/Agslz+WFO3tvp2n+QM24WNyodhR9e3fY9L/6rC8GuPOpAbVP3mqFWNranifBm72b3/oFrnUEDLqOHH7jWPP8AKYcfuAo9/zDRwtwgrhU+XxT83mZp4WSWXMMPxg3S5uZpiNLCvNpw/mFCG7PaHlpwa2P4gev88w9TPMx97tSj4WbNQIouOvxARxl+mOp5lVCr/TNb2L1KM98PyCZMhAp6LRjka28Yv0EY91d5sJkXrzFbqfNJ5AlPUSUw3ycb89Ctyic3XhbzFm8xi4tHnJkH3CkZzVwrUTDxJRXOtYW4mWzP1+hhX918nM2uvtC+w5VLmkz3B28/xiMwtXkudJ2qhLb4vnRdIn5spee/3t096wKz/ix+rhuK4kWQrOG5v+5+OIuAHtI3Ze1AmL3Y4QcW0yg/mIE//MDxPfzAYTz8wNH6+poPZt6h1ZRkZmumtDDeNvxA1xp+YFQYfmBU0JrNnkqQdRfELmSW3EUafpjt664dfpgSdUkjDi0Y8uIHZaOTP3ittfDxzOMHhIk8dztx4kTMZ5M8uJVdxJ1wOAUd73D6wTucfuD2er0XGJ/BXQ+o8ZTkE36nUMQYX1SaT9lzPsmDnqTTQROSTrhdXEDApFMEWk5JupySdMLtxMN6l06Nmi8mYp4/bI3F84fd1A8YJXEYcgLZqhDk6byDQPyScP4B7n7+YUoF64rB3A7b/GGKxxI8dGKQ29+DREuY6PwDjks/PbD22oDMhPn8A4Q5/3BXd0Oea6yBAzYHfexwcsF8RgfXccL48AuzkHOrKTfioBpa8NPW+QcIUH6YTXWn+fZ6boF+GH4w81ueO/UmbK7Q0TEjufle3tU0KL9RuDZ86PD8w4T1fJQVj3Y2oVk7NRh8oBQpHyj1w4JV04q4NywjGubADkyekkOueKZhTQrsz4ft08L3ys2CVtOJuqm7ADes2BeixFklF7HzBxsmooV10fiBIhUePkCqhQ+Q8QN46Dr7xKQfwvLZyUE9FmUcfvCuIlJ+oMUPUwZh3Bx4sCxhBtQ39GBQjdj5RgM/GUpaH1jjB5h2kNamBmFclsmrk5qp2KjGLC83sONX/PLDRKRTZjfVAbOpDvAJnFSaCC36YcqeZrVexDW7bsMPUx42EYyUzk2NkxumVYo5/FaS8WLaWW4oURwNUicxCPDA0rgfak8s9iqFg0hypo6BQ+rjLukkdRAZqNNo5x+mWkwKyp2lgRTDi9Hg9eNJZcEd5yrLv/yZIB7+VnKic6jYKz+LgQDbz5mjn5E5x8x5kfmMfKinmd+m4IR+NGgo2E4reFuLIQVZ52UQmsuz8w9TPc8cpBgcHyHOhGDw8w8w7vkHGLJoPMkBGg+EOFbZIzEka4Odm0+ZwLzEfH7QdjycHAcAa7pRKR65yJkZzHSw1cLP6DDewdY4PqPDpAdXEfmMjdyQdotgU+s3NOfsf/5hyqCcfM4tYJXzD9D//AM1tTXaz+hTvsPKxOcWMM75B2Tt5QfzCeD8w4Q9zLmrc4sJe8y4JXVuAXucf5jQ3OwjDS2YaZ5/QDp0/mFK3Gai+2bNF+9U5qvIwIPx8fzDlFTMZ88tpqTiqcJziykjtlhhn1vAfbIo/mJKbTiVGYpvnS8Y2E7F+dnUzDBjnD+TmurU+ZT55lOdygA98OC3o/MPU53Ktdy5xZRUi6mRsZjquwX67swDvXT+Aftdww9TMdIk6OcWU5pzhXRuMaX5ckrz5ZQ7T0XDGXP9gTnXTucfpvS4nvIrbiOcSU3pcT3Vg9cTPdhwdVB4NFcTMbq5mtCj4ebGmdREfzR83eTcYqI/Gr5Ecm4xqaB1Ud314Lplu+QZyCB/YW6G5O0Uu2gRMpcVWXVwFt/A+IXOfVrLzD8iXh0e46YZ/CWOFdz/6r6wbXZ919lfhuPkG3Rznm7UCWX8MB5RHrc17dlkVg4dKHLfsvxgSnkOP7CLzj9AuOEHTtXDD1z/Dz9wvJYfzAAYfmAPDj9MMW+meJhymIWU2Rg4/zChufmaPbRgnjD8wBlw+IGz0/mHKeZT1p1PmWQ+JdWcM2BhPp/kwVA8tJgyu/mQNbSg0+cPOo/sNdd20NQPxksWq1U9nAt58+lv+GFCBR1KnuJLSfPwm44ZI1ppH4jfE78cogpxLedAg9lU0FgSO4oFE7q+f1irfHL9Q9AwJytFo61RBzmYRcSelsEWjbmnYVYnhbhZBww/0ILDDzRL/rAxe2M6AmzMJcMImV06u7m20uv4Laxoz9++XHur6fQNizINUnMIGtpmmS+S3nE2ZmNcJ0+ndDMjXcUIagUGYfmZ7PwDzFl+MCuq8w9TLab61ywikpROmoLUaMJv1jG1UnEgFWbRMZnmwjxvPPBijM3jQzrisYYU9TGu86G+8Uqi294YyJlXV4Zf3Bsp5zN9EKG0aUxF8+EXUwVh+MUUGh9+MTXcz4eLmES83BZ+4zBTJFoYY5Fi/WSywUjAbJZ1FoIZYclb9fEJBtK2Jbt0QJ8TffhlMf0Lq0Sc2+zB/PzLYeqX5R5jfGiz3De1O59/maZ2O8HHvSFTqM3Mqx7nX6b00QN+U3yaLxNSz9q7qTYt39gYJGj5tsE34z3z+jcHm7Z8VdjNG3LWTgvLRxJGkTADDr/Mv0wpuJjq5NliqpNni0kTm2d8BgmWzDTGX6a6ZbmbcMDZcjfZZtIxricluGYGM8h2PSnB9aQE11MSaEk70QvN1ZSbNTroWXtI+A3voRSJhT9hGf2CrGlsA78pWbJuQID7+Av4jL+AT/lFZ3YnqOmXCWr6ZYraYpLaYpLaYora/HqKmn6ZkE2/TMg2X01SW01SW5Haq72E2gli0sJmS8GfPJnrNw5emEDP/ClmQn7ouahfbXg5Sux2OZz4mxqY7Kz0L4J4GXO/hVPpXu+ifUAfBRRPBsbHrLIV83B6Ll9jXRULlf54pjGSD8ZQCt168/2249bR2VtrrXbaXIUz7NUdZm1X0xqTQ33ySuVjB6hGUoazMZ/vtR5j2bNP/enBt0evR3vEhWgP0VMAZugF/Iru5d///o9/+f8DUEsDBBQAAAAIAIdO4kAtA0OdKwkAAP2cAAAPAAAAeGwvd29ya2Jvb2sueG1s7R1/T+NW8v+T+h287uq0lSAmgQChkMqQpKWEH02ycNVdFZn4hbg4dmqbA1RVomxY0YK0VF2u7C5Z7WlX+0tbLS10y0rcp0EnnbDzHe7ZDixmif3IqlUcJkIkcebNe56ZN2/ezHhe/0cLRZH6J1JUQZYG6GCgg6aQlJN5QZoZoK9nEu29NKVqnMRzoiyhAXoRqfRH0ff+0j8vK7PTsjxLYQSSOkAXNK3UxzBqroCKnBqQS0jCv+Rlpchp+Ksyw6glBXG8WkBIK4pMqKOjmylygkTbGPoUEhxyPi/kUEzOzRWRpNlIFCRyGh6+WhBK6jE2ftrq6ATnPJoOzJfUQE5ikNkuFGRqIHS0Py+IaNKmAcWVSmNcEd/pgkhTIqdqcV7QED9Ad+Kv8jx6cyFMU8pcaXBOEPGvkc6OEM1ET8gyoeAvJn0mBTSvvrlufqXmBYmX56cEXisM0KGeSBdGZV/7BAkzBQ0zIhQOhU18zCkc1h1hXNY7JVmjnBpOxTGHTKIO42EE8Zj6BPxBGeaDVvvjRmhBQ4rEiSmURwpmMcKI3rr2prF1My6/d5rIXX7vsjp/CwB3yqO8ICHeJLLzW+2OsguiVAxkE4KIBxzjNG6aU5FJ+xwnpo/vE4tpQeB5ZMosHTWJcOXq4NVQ39Xk1XCkJ9LPnOrF0WWtk3/YLweWr98fY9g261+CTabjbX/9ak7WPjQq+8a9Dfvzh+eD6K/Lxt1nIQKYIAGMO8junvG44tGVBePRlQXj2pVxc8Oo/OaOxoZxRaO/WjLK2/puWX/yyHi17Q57CuQbUiZiVhLx8f7G0f6qcXPduHvb2Fo19v99tL9DXQt/4Doi4/xWPQ216m6oVaiBVq73ZIurSYPlHf35ilHexwwibnH061L15gOvFpi2xvevzbmztm2UH1VXX2BKuvfxcv+CLap3tvVbd452y9X73+HxUNc8KBXppozyL0e7B/qrslGuuI/m+bPqD9vm4H9Z8QI0dp66gpiIniy5gthKxhbO6la5eueZDX6RSVDTaWffiOYG6Dis6eto9ybRcWf5+tZ3YLS5XLsysYkXs6z5YjPYgDtl2IBJwrY5bLFmN0lqXAwRcXGvYptEbUZlD1ta7gvE8gvjpxW8QODlzhVQX36qry8d/fbCFap66ztjb90VxMA93vjWHaSypz9278hY3fK0nvGIsY24vOPa19HrpermniuIUTnwwlK99aK6+bM7ll9/Nh4euINgC3LzPwTrgmlqHgPqq2VP3q29Nu7dPg3ovf7XJA7vTkFv+Fv7g/J3N8mbfj9qr+Cg+088J6D7a4vEaZVex0DVG9T9bAZUv+Wnq0NXP2gN0Pz+1/xsBhQ/KH4rYPCnGP2g932vM0DttwALQeuD1v/TtD4ofb9rjB6s9LPgq/N1pKYX2/pkPAQPv7U1N2MS4OE3Zb4hL08Eq30yeYMwvlcE2DWu88elKpnpbDif8FSI5pVaBVicudbG3aUUKDa4u0PxKTa4UyjuVnRw1+JOcXfXQnFvoWhxirtLKVp+2r13K7t7/3szz5eZZHLec/ImOTl58t2pCLzsZe+l5fd7lE62glznwAd3T3wrKkL3IfWtaGSX+QKX38pi/+gGqTa54bazAYInKy7J18u4Idjt0TObx324xLRyXEFd+rab2gdpAqQWSYm4w6wGbJEOT7bMVJlvlm/jeSTz/MWbHcZNndopxqvF1gw/9wjFNXvVvO+VgkPnOjDu4ecbKdjLdsyr7wi3qKVFKi5mjH/9rsAQEeOeHX/rEK7oMymkkUkLrONdbZZRSADJhRWo2ZTQgFpjOStT0OmEx4vrcDKDkIvj5lCqQc+rPvoqYeuNgDzgPgaBk0MUNBRqwK/eEbXd/JrmMU/6id9jkJIuKYl8jWGGcC7rrpZuzCuVvOk7Mh6BkrFk9SRsLp8vFYyZmSkrvo792rqyzw3GPXn5BW82OCR1rIXcMccjwqOjyz9AFy97Qh+lZrbakpPe2QqmHTZn+BZPiRZoxd553PI1IS8sPAVl9mfKdp2itn2Q0Qo0iAeZrha7YWetHM9up6i3opEmO+tuAFgwtQbEH5PArwRvbMQyMWNn+r3ct1y7ZFfQzXrLVHx6jRJwbzUrcWyVvlZqPXgasMNhJOx3/mJqNU3jmgwWdpUgqYHHmupmyf3L/ZcbGT7pC5h368d2y1DVGJKpwXVXU6XbApWSkFwpKEbQOyipUvCSDR94RmCUmsrYYS1gv4IAfQasgFUR6eGXBXjiKFo0BnpykPkU2CDfyR6ws+SmorPGtYWcwiMpdsrhp0rY+DlPl0lRR567ubQPkDhHBw32cqgzhA48d2wSGH90EpwNVbic614DqYYT+liAzD4WaGzEKJyvIKe2gB0Kz96TxbWaV2ahEq6tolMcHyOjklzlzRY+JQzKM+1oPQsBNa/25je3+ZLg9zbjTmBNuzydo1U/qiBMYLyN+2qXHlIHp4LlKw2IVLqMUMGqXj9ZgXwkzBB6ffhp7NC/eXza7kPf5CROaC8SEO+xDiP4ycjqKiD0vNvr4BKlac4LdWLYI2YUbX/ApJ4cPekFMZOQ4NuT2+M+EbziEfRMnIL2Bfg+d7b6UHRmPoajFaHl7EzXbTZEwgZYVrkbWSHAGITL06Yz7ZH0yqOFPm3GHESIfOHXdTghw92kLGPTyGmcmOkbOHuqML4pM5PsY5qqOMnbtcps1k5zsLuT97scKLLnQtjpsLF7xcoIIiIIu+liCg27LlMTFdR2egGcxZgmZYIsh0+hh49Mh23PMJzF2rzKxmduBzX8Z0LbXS8rScLrkczrhpoaFVsdCFUqK1UrnQIgMNHJKKDIYqaQQ2dmo6+vY6ubJThQ9ahH8/gh0+ZKhFwD1rT71pDsxkdeja+8i+oQ9ma3u7Hb2CfBlOkcgCDvPgLCdefevpQuJjgYeWlgI5o91Kjv5YMG9CPKRhgWvxnzS1Th3Et/rRwAeb3XaXek98yUYvJTAgLVXItfTORFZ+dhxYUdwxj+IWJf0OpKDzdHvQIOZb1tZ08ySRbya7Vdw8ec6sIScqg4gWmAUntd5PV1APnWmSgaq4VUZ+/5RyhRLUUjUaJO3T6LCB5rtMweyWc31laemx/FD3YHe996ZicS721nMeOy2+ZPzaGyMEqyAwAwcrJYUGgRESZARP24E1lnOhGkoUi0Pg17MFeCgdBIz73zAqwDkwj+0JlZ+9XSqgD7H5EI4Z3Qr3GV24fLOy1UCIi35hAQqH/EVQ6OrlbGDt+iqkWdg6h5Sfz7yJ57vXw/9BArrH7Xk0+HiYv7WnzForiMCIgKGxQfKgKxt54ULgo6KmWrIwWHBSDhyFG/XCiOR6/r8G3abbr4mkK1eNfT3sHO3rCVAt5vakntcW8c53y56XovOBK+1fupyWPGJT41kbtmsdMku0aNiWYqa835oPOryUrLdIRBbVa4h8MoJ5GLnvWjyDLFldMp9fYa1tOoJ3tzvsZXSFWPw7mQ4duEnjMnANOhS20jpxayOX1euFVMc3te7h4kAcVG2FrIRSddpC3ePGf+DHJX0HsydZPOIHtd8GXtpGrm5Y3YRON8g+HNs3h1kR2XqaUFkqaMWWfhj2Ly6Lzd/Y/32hZPFmLmz6Z9VAcPPu9H4k5UKTG7ToFSwc+YraxR+jxzj6LiI/mJL1NhGZvzql582u/qlRbRBzYuMBW9FLsKst9JTWJKsKWxjR4RYli1feFtuX9tizMrVNfbaEMTqESDdKZqesWWc+95EuLZYWAgpF9cTTIbKCutYpqAkFeRYLq/hgdzmMRcSFg8fBpFK9OKZx91RzCTcukexpZP2qxNKOjS4V9WgmFsb2xpeN5gP+FICqKjECWafinYC18nFr+T4DvbqPFqcOJFq8dXnwY+llZMCkTyMot1AlBMlvESXEfsK0oq/7t2kFbg+Lt49ITNg0Zu5CDFoHsU/+ebgEbBeUczmVBxX9eBpmq1tbQNZyNTvj4C8vs8s7RlCotDD7xhzBkYPE5a+sOcWkSUxaBcEo1+AKBvzaprbiZ9WCO5JMVItaZruG98tdPy8Tpz3EB4J/bQq9zjtGHsPMVPoodMSgT2JtH6WwyMsAmquRYcu8jIhGyMktCAqmaetB5YgvmIxdM3VG8gcEOF/W9dMphAoUunZXF497WqVTjdesvqvEtV+QgT2qPYaZaP8pBKpx/ZamJUOMC2DRWdBcIS+YfrMRjzy3EEVHANbCNVWFl32H1qfOsL+SJ++exzLll4OZzdlohSRc/csHnrUcoz3IQL2lkEYIWhS+ijG0aBvlVPN/7LTmLHcjHkoEsnvjB6ssBaOm56eoNBOFyZGHH9WhQpuoPdRzS0BJ74wFIJjBoUzfLECmapRIuOJXsj6+mBh7x+1x1oactbA4EfsTE4Nz+GF9GdRTWBVCfc9MwAZ4lKmWijPqhib1i6ddZqV6u+xuOKM7pSPdVNB5bz3asgi4WvdCG2kxbDWhLq9e9yZIRJvaVMppBKUdlj22NZyK/oEdmJMpiepu7Ro/1Z42DY6amrwEHwUxV7eoW2B1f3uyHpGxMKb0p94Kk61iYlKqQepmX+94IJxX24fsEEJAvkmHMrUxmYrpOOeMEteLqB60npVndEnukRSbS3p4ukDb3OUjBnV3lEhfVhC/SEbxRln0ReQL6SBu4iw3l5heAhtDbXiFWkJ7cGgA4TEvIepbyYWCUCJUJkVmEapTxFEW+gYPq43Rui9F32F39NP6KE2xhijUf+vDgnPENk0T0GaBJTYB9INkcqcYHmKP1oSp4MklPlsJDdeKANbn2Qmo0ZZ/0Hj4yPb0fRUhov+VSmMABhVmTiMPhiITQfuoFtQbEfgeIxw0Dx6DGg+Ekzl/Mi635fMgjYo6CEsTXec5AmA6h2ZAKpaW+tv3oeqd+Bxamj71exzuFKO4xDtrQ1z8Ahr0y+fZj1ZV8j0iHC0WHpSEKnCMjV/+Ri1AZ35pm4M1s0Kus6+dAOPIlm42CblXVyZKvQtjb0DIm+a9siWQs93/FHA20Amju7FWfzvRHxi94naOnk0OvKO/uERR3tB6NkEPdtRLudzDqfny/tXjq+UMEfcrdW3VFLRM6mQ6nehKcnkctPLWUKUOZsfrEnWhQWm7CeJKCpedsueNjIOJKVeg2uePxejimPVar2VT4rXQgLeS8y4DIjsQSGBHnDChIW+QpnU4w5Wb4zBk/WMDm/WY+gO+CViuFAB8cCUr1+dRMlUUrZo/Vn3UjSXpcDcSRKTNRysiqY58Nlq1hwGkW6nThyOOAB+kNVGmRaOuZH4bhsEAijCMXdCVCo6oU4u8uw+Wq7tJPBYkgO8r5BpWcqStQIBAU0xgzVC6qxboKxXa5jmJ8dxBmJFxyJXB55BwchI+zOS7IOFicWeZN/pMzUKumpFFksFX7zrea9zyIDnogMjSTvZ8pInsk85Kx8FukBZUolVqZAYr5GLSQd54o68SYKVdr7JoqxkeJEhCQ7ikOAWcpSG/waW7sn+tS3rM/Y64a47Fv25OT2QlDj/UNGs6o6ynOv2opEsKUig3Ni8e8W4e//3YJnlf7IXRpsnFE+kUvplsycrClD/W5EJ0cdzb1Qp/TZrSLHCh0zm53g+shm6cxrwecFter8nU8ULomGp2MF3U2azCqfNGXccc34NaD3cOPQNAo4gBf5AkCQVvMSVi4icBHZ1+sqhqMMaU6a6VGDTLUcjRlKUlzFBF3LHvpkqvhcdeKDMZqmLxe5JtUCzscZRZKBQR39Q5rJ2AmBxLhpqYlBMuq8kMyi9wQTvElgqSoKIpY3deKRt+fR62yagSfyKBLv1VPQOPTMfC+gwvghc31DRDNaazWTBdydby914msOqg86suG4anygnpA3eW9tnN3Evbi9Xb9bCjLS4wHkPntvOhh5fwc+3S8kg/RlSBJDL/uA9fZ6DRmD7c6dIgAHX05M/sWHcdloGyGae5p4oF0v7Y5vm6Z0AXEOme8Gx7mjRvimkIs88dvkr9eKNMEo7Lyo7mwKTeTsjl8KM58I3a2ur0yoH7W7C8jIU5HwCAp2s9E7XFe2Zyy4M+NIbkLyQDKsSK063T7sBUtvue/uWnfgvZF3BtJ5cwxHlFLGHK9XWuOivmIojW6IiAOc7k/WokTe7Bz053A0m/WbWyp5sLyUjhd1RI3A7rQv6WnwQRjtcXvSnBcYkqePHAIhBxmDEBXGYQOJyYEaIu5Rxd5f28nndaJnzy0Kr4kJ1A2Wsg2VCFj/ZBqDg4nJAs1I7nq9pS5PAqQAUOnxaYiy3V1enMtHUX3x5n7jbnq9soVZHoJ8ER6imft43bDOES2zRTdh8/w880tB4z1hWC72boh4WPFg7paie7VFkZKk7FNPgno8+iA6ie7Bg8xWjwsKAGZ1lnQ1y9Vt7Zr3AmS4fIaAwNW2/9oLry59ZHRuTD8GkEH9LWd+UV4NZjVUnEosjcXZbMilryYFYuq1BxegQO/1sy6ggVx8UglCWUkdFIUbpYHY1i6P3gz2pMlJyjbuB5OClthVpjH6NFQP0avnCd2skQlFxz6EMHBKHlRugbWYrNoJBlwPf0eELJTgvAnVXbESX7dQWpeuwlJVA+9iXCAJ1ChDNYhX2nEBTPT7GwNAOeo8hJhv7PpEuqjG6DEJ7fz14uv4pN9Cserfobra00KlUvVafW9T+xqn9k+8b7og7/Vy8wYSwLCkj8CwGvpwSkP/siDu3xa8/rcFUzT2VzAAlIOW4FswOor6duAb+V0kEltcYq8o4tG8vf1is3FTkwThqb0TdJKPuEQvwiKJCwTyqZTXXlWSyvp30S4vu9bWxfZkKBMKoD668RxTsWqQ4hkUcGBgQkLHaccSfPOIqPpDBc1wybF+YxU840axPZmaoQbUFZkXbLpRlPsr8z40D3hHDl5oa1H46LXIM/lDKTQJJHgD2N7VQrK4eelIGCpuNHSY053PjsO5DPFPJplfUm0fC1ws0XbjIupI7gbrG1bw+F9lM9f6XodjfB2/pGBNZ7EzO5C2epODQLWLPSGgXI5W7nMLgtdXEawlTeSQgzVhcsByZ/mCZHKk4f6mjpL9OOc1Of3XlJZ0FaZihbsaHj6ZTxl9MhSWes+P4pIMR89uxtIEFyqdyjN4nW/3xqJSYb9elZh2EqKUcDfwr5s9XaCAK6+c49bJrJljOB4pqyeo7wP4I+7iTIl1xREzoGV8gP7Cf3wR+bkaVR7rUgq0tFjM/VGtumBHS3F+fpHeZvr9sMGbhfEvFsDZ0Y+7/HaVXRELDsufUY7BkJlPpS6nfPc0VPged9ocbVsbK91Ag3VCNzz7W3E5C7lrpYY98ZxJl6fO0fiKnUYugF7vnfo8wdDSWaitpvIAuyENdz7V6MkMJAiniqsMwToA/rkuc0IQLadYH1xtGpo7b4glGwKOdPCaNNWNq95HN7FKbu1hg0UW51dapVrMNo1aCTltjTqszvTDJuX16Y9mwFl0xb4REmHDdw574gsU4JpYzrbaCllUdlxn64XIvWSCg5iPL+F1aBdvQ7Djw+d7Xh2vZiLQVhVBkQdQFLL4IsafAxlC7c0OtYOseRfpTebtgTECfPVsSdvuBexBjRiBtGLUjtJpYQuCQGMUJGKryzdsftoGl+r47lwqMa3pQW0tpkW9Jq6FmpMlauVF087O2UV1zs4uqK1lidpHEHyDlhFT6PRzO7pEKlMyfO6tmPstJWZ75PC6LOuwCdxFWdOX9cNQ1/aBAl7hlE+KUB8FAuOBY5ZJDV/Rvx3CkCC+pW+HMIifEtzD88Le2MqB+deDmjuP89v7h9ISFAQE8p9tmL7l5bEj0j0sGH1HfkcYm20gF1zMWUdmwD7IyNMnWfZ+lAo7VvOgrVVEkWGyGT4q5WozdcnDqIVwkVSXtSDyrZ+Top+w7YBzm+KxB1hj0U+yrPUjtKuKXRdMy+6pwU2A/6ZA/BwTRYyOh9IoWzA/bZz52I6KgnAmP6dEIa+QIbk/V6uNgs27U2BfJrECSKD3E12IewvcS57At1e2tiV7H5YFU3LFRtjp11Vi0p2sonHD/T1yZ9oxPkvAwfGO2Ds9fX/kIh1cVm7CiCrxPDBZOWxh43n7S4aU/udyJGGUWcNXwhMTW12dMWPade8l+QIoc/buKdj6e9YTXZ9yvpC0P2UsdflnLvH+ONAagx2N7W30rWTNbSwdmP+OXJMzw8PLh5IuJAQE4z8L/VzH+u2A/J1+6+gR6W7h7/RXDS1azfmHGCkL1GFUkdZ/stfkqh0cv8N2VgNFrdKDP1P2NNagr7jRaJxwDHl4tF+ZlPSuM7h3SVKBIWtzYIJ0Az9c6nZ0Ozu9hA2PPU+v68z1EcRi2D2rtfBXK7DK6QzvYeuN8yHLP3ntoATNJyXxeMxUInjb6J31/hXNR7mLgS1j18E1W7hJatkpRyiDiWEf6y+Gn26DD8LDfP3kApEi4csjrqPeUbekYQGZD8pPWvhTggSuaS3F4iuHwPjuslB11cndZw2tsxzvby6Ov7qCPa+uwZYR5BPAvGfBvUaZUYlO2/YV5MRgnZO4ysmlXylcE1wMxn+gz/G/p5DtJwo7v83goG8z2L5xhy6EAfQlq1TbTj+mQtcN0XwuqEFqAGbnqQ8gZBmbAYwpn/EWPNNfXGGrL8DQtGqejL95c3+VqzjNta2lEa2lKIAgGh6wypdUkgfOyDgk0oeJLE7j1EIMw4M6pvm0GMok3p0m5CdNIJyR47P6jpedAgZMqQXnyyV6Bcq2fp9may2FssZJDzuL3i1m4M1u97ZXXEquGnQKCdzpAm8I7avZl4rgMS03UzbTUNxHSTebLPDq41p+yC8xHVL1OlcuwOrw3jkZSuxSfD4ABJ+tg5OHO6ljQSazoT5z5nGfj2zvTr1a3dpQ/P0rU4NHPu5d7+S3t9xpPDVRX1u3irURVk53byRUlF0NsTLG9f7tEmzdA/Mx+QO/Gf89x+x/chwYDZJ5mKYPHN+T7QvOUojSxubBK5tnixbvMJLKsF2RDtrM6FAK7ooISO4s+iuMpvpRC15Zyp6bNoX5BfoVrqRHbaXjm46q5DvDPV8Pbx5gk82DjNBIm5iUOFtWOCIHSYoaKrEhMWn5CEPbuvSniEjlEWBp6iKDFIvsFKmMW6OqQ9iKQlg0UFVUsfroAQnrtBVSKtE4VdavBYfu2aIbOyf7ql9d8jREP2Kw2LgVSqWUIvYdyZlAKlow8M2O6aClpeZlLBA3CQOBkcYlVp4XUQfkmm/701CUdq90MqSF31YWNUbtHe5erX19696scH1gPMtku6SedDBs2dJ8SHzY1gLVUpnaT91g/kX2/dx8IvtrJY72imcMai6o3s6iMw7Hfeqt8v/sSRD/YPvvfIdVHaMxxsOAhMBAQBD83Ozn+8nvI9Ab/5OftplwdsL95qcZwOPXENnpX7OtldhybZY+KejPB+brIrkjerCv33il+O5f9FfgLm0XNQBFcAJIR424KkHFy+yere5QImWgCm1LhU4fmJv1C5MvkeUm3qElzdQrOii0Rck3prS0pVUTODPEEUc4U06vWx3z952mtrGMnwRp72wSR6e5holVdBCdPsPYGb1Zv2+1VpzEb5vZLxXrxgNQnIxew4eotGBpdmaiCZAPvD+ZV12jP2C519sq5C9MTkrSI54K0G8nTwOySvNmjGF1371GARs5Ahtt682p4l0T1p9bJw5wTVO8ShpYtYxltGHXitvvbw6iE89Qc6WLecJP/dj1wpui/bfJLYBkFPjA49DDDoj9UKstZmvjaGzzcEp2tTN20PnG4nDCvDQ068MUhl3SHyzfLygnBSxedHUnmHVeQ7CmHAQNh8pqzTdypzaI5l8II7vVynCl3N+Yxg5eBDuU1+CD46fi87QdJeGCtMmG8yiO1gpvE40eJ2PKakJTakLEriyf5gjp8nQwAAkZpIj8WnJxXFFf6+sTJfMoa1ZqhogJZUeeBIF8LvjSCd+VI+qJEmuhsm0LCfcW0BlFnV267vT4i8YuMuM1lMWybMWvM4gXOpr0oEu3AXBY2co7tfjehnEhLEqbmXrBl63qGpq/xYmOSEZnln1GqKLx9HSKLCIobJFO22quJPZJTp9KPxbOaAGD8DqTtB86VpvgkZHD3gr4shlofT7WQwtXGmX6VTKZOgV6xUFiHsq1e7KWA9UmvJnaXWTLF7EM0k/NnH4q7/Ob2QZ4ftDnr7nFe+3sgZxnpJ/8ovCQMmb7gi4yiLqrFOycoaUc0Xl7+DHN3DK8DOKGiJcLPw8H1w/PlhLN543Kvoa+LC6MLpje0bS9ME99gaV7k7XzguMSSkEGEgoH4p/H7VuChCB9yJMP4f5uFP8A+Ofo54+E8fDEbcH9GQv9qvT3aOiH0sY/Zb6vuf+kDPEXZd+Ska2hgr2t3V/19XvUXLE8dJIN6kfjP/RR/yymb2f3o4c/pA/HAm2eP0ibPEhj/iL9jbg/pQ1t7Y3/TlzwMypI9KFhANTvDGNA/yzu5OBoa/3/MQz9S6f9Yb47rP+eJdoDuJ8d4a+G/u4Kfxiq8LPYXxzjf1KP+Yt6qBnYv+56/0kc7xfxpW24fw4If+3L7yHhj77g7MD9bwHi79C/h0o/oNV34f63wOkvi/G3COEHdMse3P8WL/wOfZ7tjIhPBwHxjg8SAvALNOvfDcpfqPgdT4W79Mvmw+ohhvkdLwwK7j/jsf0dXmTKUKXTQ7fFHmb4r3hVdP8PHvvf4bllZA2NpENAqLpBf6/9gVfP9h3PwUzf3thI2dHe3MbU4W8Rfrtb+4GANgf3603bf78AjRm+izqaGVsb/2XSBlzfoFzCQkC0Pf7dU4T/LPY9/9tB+f01qx8ADaNwv7909Z+MRvvF6DyYP9/YcjAzNnb863LD0tdpvx2HhUBWoIF4/Ivi0b/Ifv/6l/mw33cM/IdP+MMvueNvxf8DGJt3z/D2BgA=');
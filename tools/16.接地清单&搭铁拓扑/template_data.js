@@ -1,8 +0,0 @@
-const TEMPLATE_FILES = {
-    WIRELIST: {        filename: 'WIRELIST.xlsx',        data: 'UEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAZG9jUHJvcHMvUEsDBBQAAAAIAIdO4kDHfLL5MAEAADICAAAQAAAAZG9jUHJvcHMvYXBwLnhtbJ2RwUoDMRRF94L/ELJvMy0iUjIpgoquHLTadcy8aQMzSUieQ+u3uNCF4B+40b9R8TPMzIBO1ZW7+3If951L+HRVlaQGH7Q1KR0NE0rAKJtrs0jpxexosEdJQGlyWVoDKV1DoFOxvcUzbx141BBIjDAhpUtEN2EsqCVUMgyjbaJTWF9JjKNfMFsUWsGBVdcVGGTjJNllsEIwOeQD9xVIu8RJjf8Nza1q+MLlbO0isOD7zpVaSYwtxTw7Jx/3j+93z5z13/kxyKZ3JrUPgtc4qUGh9STom9h8TMmVDNAkprSWXkuDMblZ64ZWly6gF29PD68vt/EIZ9Hv3lrZX+1rvSNG7UIUm4tNQMcRjU3CmcYSwmmRSY9/AI/6wC1Dh9vhzE/ODn/RtX3jnR/J7PuzxSdQSwMEFAAAAAgAh07iQO7RhW5cAQAAZgIAABEAAABkb2NQcm9wcy9jb3JlLnhtbI2SzUrDQBSF94LvEGafTP4oOiQpqBQXFgpWFHfDzG0NJpMwM5p251sIrsSVqyLowieqfQwnSRtbdOHyzjn345zLRP1Znln3IFVaiBh5jossEKzgqZjG6GI8sA+QpTQVnGaFgBjNQaF+sr8XsZKwQsJIFiVInYKyDEkowsoY3WhdEowVu4GcKsc4hBEnhcypNqOc4pKyWzoF7LtuD+egKaea4hpolx0RrZGcdcjyTmYNgDMMGeQgtMKe4+EfrwaZqz8XGmXLmad6XppO67jbbM5asXPPVNoZq6pyqqCJYfJ7+Gp4dt5UtVNR34oBSiLOCJNAdSGT01GEt8b6dBlVemiuPEmBH82Tr6fF8u1j+fi8en2wV4vP5ftLhH/bDLTp0JKBWyYVaTtslMvg+GQ8QInv+j3b9WwvHLsh8UIS+Nd1ip39OmX7kK+z/JPYI+EhCbwt4gaQNLl3f0byDVBLAwQUAAAACACHTuJAPfUNTUIBAACEAgAAEwAAAGRvY1Byb3BzL2N1c3RvbS54bWy1kktLw0AQgO+C/yHsPdlX0jYlSWleIB4sWnuVsNm0gWQ37G6qRfzvbon1cVW8zTDDxzePaPXSd86RK91KEQPsIeBwwWTdin0MHreluwCONpWoq04KHoMT12CVXF9FGyUHrkzLtWMRQsfgYMywhFCzA+8r7dmysJVGqr4yNlV7KJumZTyXbOy5MJAgNINs1Eb27vCJAxNveTS/RdaSne30bnsarG4SfcBPTtObto7Bax5keR6gwCVFmLkY4dQNaTh30QIhkpKsDNfFG3CGczMBjqh6O/pNtrOso1l2w7M2KiloiYMyxLMS5f56QUOa5X6wnoekTGmB6RPGEfxqj+BF449C9CJ0+3Bn56xHZtKx7eodVz/8CAqIi4lnj+oRH1H/X2z8i01WdWzsKmMf6X7s+KTS+sm0BBt8XwA8H2h6n+QdUEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAADAAAAeGwvUEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAOAAAAeGwvd29ya3NoZWV0cy9QSwMEFAAAAAgAh07iQBJhXb/80gUAC1AoABgAAAB4bC93b3Jrc2hlZXRzL3NoZWV0MS54bWyM/duS7cx1pQnet1m/g4z3RcU6xUEmqcwyYp8iwsrKuvpwzaSYmbQSRTXJTGX10/cAIobPiTGGb9+60P4J/9Z0uH+YDkysBcQ//q//80//+nf/4w9/+esf//xv//Sb02/vfvN3f/i33//5X/74b//1n37z//p/fv1fHn/zd3/92+/+7V9+969//rc//NNv/q8//PU3/+s//9//b//4H3/+y//51//2hz/87e8Q4d/++k+/+W9/+9u//8Pf//1ff//f/vCn3/31t3/+9z/8G1r+y5//8qff/Q3/8y//9e//+u9/+cPv/mX/0J/+9e/Pd3f3f/+n3/3x337zEeEf/vIrMf78X/7LH3//h5c///6//+kP//a3jyB/+cO//u5v2P+//rc//vtfGe1//ssvxfuXv/zuPzBW7k/bxZePlhHvdLX9+9Mff/+XP//1z//lb7/9/Z//9Pcfu+ajfPr7p8M4//R7CxQm60+/+8v/+d///X9B4H/H4P7zH//1j3/7v/bhcof+8LeK8x//8R+//Y9//+tvf/9vn3vRJuj08Pd/+Nvzf//r3/78p5ff/e13v/nnf9wN/O9/+ft//sd/+SNmcVP/d3/5w3/5p9/8p9M/vN+eHp5+g6Yd+n//8Q//8df233/3t9/95//jD//6h9//7Q//gqPlN3/3//vzn//0f/z+d/+KI+Px1v7n/7Zp/9ePjduR8p///Of/cwv2Ax+723ZhD7J1/Lvf/+2P/+MPz3/4V9D/2wmH31//v/u+bP+N3fj7sR/9v7lPX/ej63//y9/9yx/+y+/++7/+7fnP//r/+eO//O2//dNvnn7Dbf+PP//H9z/88b/+t79hhy+/vW1Bf//nf0UE/P+/+9MfcdSff/N3f/rd/9z//Y+PT5/Ovz2dMZ7f79P2GfL0+dGPD10+P4R/Pz90W37m+vkZ/MuO7n77+PDzjtC67x3+/fzQ028XH7n//Aj+/fzI/d1vL4sPPXx+CP/Wzq1mAavDvnP4lx86/3Yxc1Czfwb/8jOn1We2A2P/0PYf/NTdb89Pp3v+H/b7J7pOOFg/AuA/GOC0NHbisbH9R33s6e7xMv4v9fv3H4fYfvBuWffP//iXP//H32FFQu/7kTicj2MTR/6//25bSM//gM5weG74fwKPTfj/OHz/iq3/45/v/vHv/wdy4fefxLMTpyPx4sT5SHxx4nIkvjpxPRLfnLgdie9O3B+JHx8EpnqM9uFIvDrxeCTenHg6Eu9OnGpS/x6ihi3sSZKybf6n3yDzx26eZM6fAyKT/kJkl/rbi8zWFza3TlRKQNQKkW3V2w6o79zQwkrPPwIiol6JbPsubW9saz2IxXci28er98PUY3bT1G+bZerlAHgOiBwBL0QmU8/mNgKd+oDo1BMZU88NLWwNfrfzIyAyva9EjnO3f/yNba0HnXoi28drjw9Tj9PTvkZd91U5WQAhFs6VQfuuPAdEcuSFyMQCm9tg1EJAakz7fnwjMixwQwurFgKiFohs+y4H4BvbWg9qgcj28Qp9sIAzxMICCLUga8xzQGQOX4hMLLC5DUYifA2IWiAyLHBDC6sWAlJTtct9JbLtu+T4G9taD2qByPbxajtYwCXUwgIItSCjfw6IDPaFyMQCm9tg1IIjZ5mub0SGBW5oYWXHfjhyrqn6sEBk23fNBbZVD2dB3olsH6/j92AB13YLCyDUghwQz45cZNF6IfJhQabiC1trLCeV4MhFVr1vAalR7xP63ZGT7MsPRy6yL69EjvO69/DGthrKRQ7adyLbx2sMBy246l9o2e4eHE/Xep3zHBA5bl+IZC1srbGYFkdMS0BUiyOmxRHTQuQ4rx9a2FZDMS1EjlYPWlBYLbSAUC2S1M8BkcR9IZK1sLXGYlocuUjSfnPkKkn73RHT4si1DumPRYxI0sK2GoppIbJ9vMZw0LKVrgsvGyJirnIUPgfmLIN5GUwYzZfRWMMxM4G5yvrybTDjdDK2tMi6cAXmKkvP62COs/mRI6OxOrlKJ++D2QLUkX3UgTJwpeOjUsQl8yj0rrI2PW83FkSZ6yCz7Q7uxMjufgkx3AhjtH2pke1T8y3EuUrSfg+MpUtgdIpfBxMdhZ2trNh39v0QoA7goyMUiitHrCVrXm6yQjxvN2/E0a163HfnZTAzRx7DHTlzk/T9Nvpp+yuZ9T0w7sj78jwis41JOnkLndwkEd8TUwfvURWyZKWKtWcbuqVTYOQwfzmRmalie/XjqpxxVYGRWfw+9qX1VTO0H1o/AuOq2Nc2Jjk230KAm+T1e2JqR46qUH2uVLFArWHdJIGfT87cS+a9DGamymO4Kmeuckh8G/3U/vrK53E8q5zxlY/Mrkr25C3ticzc+2C2CNV4lITidCWJ9WsN+l4OneeTMxc5dF4GM5PkMVySM37BQKYuGLilRuBKnPHsIbONoI76Pf3exvCqE3X6PpgtQLuXdVSCSnWlhMVs9XUvZ4DnkzMnYV4GM1MSYsjS9HXEqH1xJYxTSrilPuVKnHElZLYRyHnlLe2aaHsfzK6kjuujElSpKyUsZGtA9zJVz6fA2FJGZqaE7dWPZ4kzroRMKeGWFllm60cYgSthnH1Gj1+KvKUA0sn7YPYAtYwclaBCXSlhEVsDupdD5PnkzKmWys9rNjIzJWyvflyJM66ETCnhlhZZZutHGIErYZxtBHYqYWN14gsXmS1Au591VILqdKWEBWz1dS8Dej4FRq7fXgYzU+IxXIkzroRMKeGWGoEvXM64EjLbCGR4b2N41Ykr6QHafaaDkvP6ZsCGSNVyL4fIc2Cs+hzMRMlorzGZksDcV/7v2fhtMEPJ2FKR7yWHfwTmQZbe18TUCeHjLJ8YOau+D2ZPlmo9mkHtukiWs5e3D3pKCcxZEuplMDMz3o+bccbNkCkz3PIzM864mcDISv42Rll9PdTc7/beB7Obqbk8mkE5uzLDirf1JbP+fA6M5PnLYLb9kUPty2isTlxL6ESS99uIU1r8U54wzjxIKr6OyPt0yuDeRmvt/4Ok5ftgtghl6+gDNevKB8va6upRsvv5HBiZ8pfBbLsT7qCN9tZP7fV+jH1NTB1pn2tY2Bc5nr+HOHaiCcyjHIevgwnH2NtobAMSj++JqWPsqAo160oVy9rWoxxXz2cyPGJfxpaZGH6iRTUxgTExgTExzrgYZ1wMmeOx/3meYWMbkIkJTCXYUQwq15UYFrfV45PlkDP3slcv28/y9uuJD1UPcjx+Ge3Vjy9rjFHMk+TqtxGHB8n3saU+5WJCZDlQXkecbQRi/200VidPchS9D2Y3O1OCynWlhMVt60v25/nsjF8AkJkpYXv140qccSVkSgm3tMhyQPwII3gyJYyzjUCOuLcUQDp5D8ytmGOuoH5diWGJW8N6kr16Pjtj3wYMZibGY7gYZ1wMmRLDLTUCzxVnXAyZbQSyjr+N4VUnnis9QPvNx1EJys+VElaora86S+2L6vM5MLLPL4OZKfEYrsQZV0KmlHBLjcCVOONKyGwjqMXn87zCxurElZDZArQfFhyVoPxcKWGF2vqS/Xk+O2N3KQczUxJiyJL8dcRo+2JnFMYpJdxSn3IlzrgSMtsI2q+AP52wtXpxJ2S2CG2BPzi5rKv9DZFq/3Snp/kIyWy9DGhiZbTXqCxRAmOJMphhZWxpkWst3+f0R2DMymB2KzK+t9HaermT89J7gGanlQtq2EXCbIjJkSP5OUJyVfAyoJmc0JN09HXEqAlwOYxTcrilPmUpkyJL76+D2Q94Gd/baG293Mkx8B6gqRxUuys5XhCf7vSkf3HoLCN7GczMjcfwxHHG3ZApN9zSZk0m7cfYu2J0MXodzDaCi8zB22itCKc7ORW/B2jqZl3/X7yePt3Jmf05QZLPL4P5cGM/oRntbWzi92ti7uS89y1BemL4niDz5UP3hY7Mnkui4i30cpXdfR/MHmF8p3M8+6AcXeWQV6wne6bl4pB9lzyYmSeP4TkUGPcUIPcUIPPkjHsis8+yHL9vY8x17LmnHqHt51EUauCVKC+TT3pd9nwJkBw4L4P5EGV3A0Z7DcpFeT++2JGpxY5bWmST4oxLIbONoF0Nf1y7hf3X5fJ9MHuEus44SkGFu5LCIriNSCfr+ZIgOX2+DGhmJQSxZc4Zt0KmrHBLG4NZccatkNnnVMb3NsZXvbiVHuFUJ7GjFVSnKyssYKuvk17xPF8c8usCMjMpbG8dmRRnXAqZksItLbJJccalkNml2PrF1urFpZDZI9Q+HKWgPl1JYQlbfZ2a4z13ny8Buqv03KGXAc2shCBmxRm3QqascEsbQ83IZ5njjFshs41Av4d+G+OrXtxKj9C++D1aQYW6ssIitvo6neRy5PnikJ/+ycyksL11ZFKccSlkSgq3tMgmxRmXQmaXUqvP51mFrdWLSyGzRWiLyUHKdX1HYEO06DxJ7j4nyFJlQBMro71Gpaevr4ExK4MZVsaWFlmtBMasDGYbQatHPqyM1urFrAxmi9BOA0crqJEXqXINZbT+MOk5QI+6fg1mJiV0pKkyYrSBSz/fBlNSQmST4oxLIbNLkSPzbfTb9k32/30wu5RacI5SUByvpIT6uf2Kcz9Knq8Jktl6GdDMSggio/o6YrSRSz/fBlNWQmSz4oxbIbONQH98+jb6bfsm+/8+mN1K7fnRyrr4v7K6rb5OZynsnyMke/QyoA8rVv2P9taTxPiamLNcn34bUGkJgzAtgWm3gvfD73WE3r2MSv1zBUsR5OTzfohQ9dxRC+rMVbKwFG2T1b7f+UyWAJ1ktl6uhD60yLR8Gc2tI7PCEI1xK4TKCre0j0n3P1L3boWBtiHUAvRphY2tF3t8eXSzRWiPXB+1oFZdaWE52zsry59aAtR+9blDL1dCEy1sbh2ZlsC4FkKlhVtaaNMSGNdCaBuCnVnY2HpxLYR2LRXiqAWl5koLq9HWWftR56cWh+zS+EpmYoXNvZ/jKvF1hGiMW2GgssIt7WNmJTBuhdA2BDk03+LO1bzvE/U+oC1CO3CPVlBrrqywHG1DutipJUC+hhGaaGFz78iyJUDuhVB54ZYeW9bYH9cEib3XAW2DkGl4G429Gzu3sJstQruePYpBubkSw4q0dybr6vM1QXKovAxoIibF0HwJjHshVF64pY1BZvzH2LvGeL4w0D6pYvYthpBZeB/QFqId4UcvqDhXXliUtv3Vh+2frwHyhCE08cLm3pF6CYx7IVReuKWFNi+BcS+EtiHoFelbmgV96cD7gHa1Y3wHLbd1jb8hWuPrqwmeEySr78tgspXR3KZOV7HEmJUBDStjSwutVhJjVga0W5G9exutrRt9N8L7gPYQEyuoWhfJcmNh2/uSHXoOULsD93ElNpiJldCPdPN1hGj74lYYqKxwS/uYWQmMWyG0DUEn/C3una5hA9pCtNrtmCwoW1daWNm2Melt0+dbgmTkLwOaeAkxzEtg3Auh8sItbQyydz/G3jXGvTDQNgRtfYshzEsP0d5ocvSCynTlJRSv9p6MW4LkwuBlQBMvIYZ5CYx7IVReuKXNuXkJjM7862EIWpW8jdbWjULvA9pmod2IPXpBbbryEspXfSr++ZYgO7sQmnhhcxuVeQmMeyFUXrilhTYvgXEvhLYhtAupfaF+S7PgXg4hJvfFbqg7V15YmvYx6U/9tjh6ZWA/Ux7QxEuIYV4C414IlRdu6WMYJ9x9Un+MvWuMe2GgbQh6mfUWQ9g61kO0H0Mc8wW168oLy9u2v/pSkOdbgCxdyEy0sLn1Y1oC41oIlRZuaaEtXQLjWgjtWupY/0wXtrZuPF0IbSHaj9GOWlB3rrSwNG2d3WS+nm8JkorrZUAfXuw3L6O99SQdfU2Mi0l7Ix6+p0jC/EiMu2JvuysZ9FsMYSnUQ7Tf0hxdoZxduWLF22bwJvcanm8JsksBQjNXbG89mavAuKsA6TeM3+Mu63IXArkrQrsr0f2WuvG86iFaeX50hRJ35YpVcJtBfa3Q8y1AdmtzQB+u2iX+vlx8Ge2tJ3MVOnJXhGrB45YWWmb1R+rexTDQLkaOxrcYwpLoEKJuwx3E3K9vCmyInfrlHPOcIHv90oA+xMjEfBnNbfLUS2LMS4L0VUTfEyR79CMxpmpAuyqx8DZa26Ashwa0hWhffh1VofRd5NA9q+PWmX7n+pygOjr2FHkZzMRU6MdMBcZNBUhfh/N97EwblZkKgdwUod2UHMJvqRs31UPUkI+iUMiuRLHWbUOyd87cB0hf7/EyoImpEKOdUHfbX0eMtjeuipHGYpc+1ur2PfaPCIm91wFtg9Cru9HY9q5dv+3dvA9oi9B+a3EUg4p5JSYU1fbmmXuH7F7bYCZePEQrrT+1BMa1ECot3NLmSyb8x9i7xni6MNA2BL2OSxH0ftz7gI5ej1JQxq6ksNJte6vPkz/fB8iWNTITKWxu/VSOf0oJjEshVFK4pYU2KYFxKYS2Iej10VuaBLfSQ9T4jlZQxK6ssM5tQ7I3At07pOZeBjOx4iE8VQLjVgiVFW5pQzArgXErhHYrdmZha+vGzyyEthDtmvaoBUXsSgvr3NaZvoLn+T5BstsvA5p4CTH81BIgfW3Pt9FRiQkf81NLgB7k7PE6Ym+DkPXgbTS2ufJTC7vZI8zyBRXrSgyL2taZvnno+d6h9ruEfQl6GczEi4fwfAmM5wuh0sItbQiWL4HxfCG0DUEvzd/GAFs3ni89RLtTd8wXFKcrLaxfW2f2+qz7BMkp8WVAEy8hRh1Nn2eXwLgXQuWFW9oYzEtg3Auh3YulC1tbN+6F0BaipuioBaXpSgur19aX3iF7vk+Q3N95GdBES4hhWgLjWgKkh/b3sTNtWGYqBHJThHZTMua31I2b6iFq8T+YeljfH9gQvT/wIHcsngOkQ3oZTBY1mtvUqajEmKgEWdGZIBWVGB3V64B2UTIvb6O1DcpEDWgLUUl5FIXCdJFSD6xdW1/6rrbnBFlxM6APU3aHbbS3nkxV2ps6Cvf18NsINJa6saWFNi8htHshtI3hQRModaOvinsf0BaiPVFxFIO6eSWGpXUbUwu3T8Xzg0PKvAzmw4vMy5fR3PqxK7YEPdZB9+mFO1NeuKXHruV//9iPGFsOjNcBbYOQy7m30di6eZRu3gPUbqEf7aDGXdlhGdy7lKl9fnCoPWu1j/5lMBM7HuLkdgLkdgiVHW5pY7Dr6bF/DXo0O4y0DUIOi7cYQVLrPUBTO6hUV3ZYzPadllX2+SFA7auKTz2EJnrY3DpyPQFyPYRKD7f02HJU/0iDeJTbza8D2gYh7t5GY+vmUZbc9wBN9aBkXelhVdu6tNcFbn8KWK4g/JRDZmKHza0ftxMgt0Oo7HBLj212AuTJQ2gbhBykb2EWTvpM43uApnZQt67ssLRtI9MnuJ4fHPKljczEDptbP24nQPrc5LexM2UnfMyXtgA9icLXEbv2ss3tvki8Beakmt8HtM1GZejxxIPydWWHFW7tz+nJTjwOee6Qmdhhc+vH7QTIc4dQ2eGWHlsm/sdDgHRSXwe0DUKfBn8bra0ffdXie4Ca4KMeVLErPSx0e5eS1M8PAfIzD6GJHza3jtxPgLzyIVR+uKXHNj8Bcj+EtkHoI0lvaR7sTtuAdsX1E7SjGVStKzMsbNugnioP90x+fnDIftA2mIkYDxGu2ALkiUOoxHBLG4MvawHySwJC2yDsio2NrRtV+36YhvaYxsHL4/pOwYbIef70JNcfzwGybwwGk72M5jYoS5gE2elmQMPL2NJja8IkSGf1dUDbIPQNTW+jtfo56wsY3we0hairvaMX1LmLfHlkKdz7ksrrOUAnO9MM6EOM3rD7MtqrJ8+YBFnGBOisr138HqCTJVGCXBanaBuY3S0IIc535WNfcN4HtIWo1egoC1X0SpYX2uc7OQCfHx062Xs4BjSTFYJ4GgXIZTkUZDkUZAXIZRHaZckp+W0Mu47BIOsQYvy07igLpfBKFqvl3pdewj06dFKjLwOayQpBXFaAXJZDZ32B5fexOzWwIMsj2cXy64i0y6q8+LjeHq3VT5DFfrYQtW4dZaHEXsnyKvysL6R8fnSoPZ+67/TLYGauQgx3FSB35dBZX2j5fexOzWFw5ZGCK0K7Kzlzv4V+gqseYvbr+EfUyStZLKVrUGd9K+PzFkcvOHwZJDSzxfbqKZyzAuS2HDq3ly/uB8/3tM9+zvJIwRahbWB68/ot9BNs9RB1kjlmFmrrlSwvv8/2Ps/HAMk59GUwM1ceI7gKkLtyKKyCDoXMCpCfsgjtrmTYb2PYdQgGVz1EXecfXaHSXrnyYvzc8nQ/SJ8fHQrXF4RmstheowqyAuSyHArLoENBVoBcFqFdVqXF5ymLrTWsIIvQFqKlwtEWSuqVLVbdrTP9tcfzo0Mn/UNOLwOa2QpB/KQVILflUFgGHQq2AuS2CO225OLrbQy7TaBfuvcQlZxHWaikV7K82D7rzaDnR4eCLEIzWWyvUYXUCpBXwA6d2/vqPs9ZDgVZDllF+zpGvw2sFrHPzPIIdtZ7P0R4rIv/g6yn9c2KDZFrh7O9GjRAJ/2z5S8Dmsga7T+TlSCTFSCXFSCXFSCXNaBtYPI139tobKPS3Hwf0BahffNwlLW+g/HE8rw6O+s94ucIScHxMqCZLO/JM2sE6bsjl8vfBjTuLY0t9bFgxnfg3H7wvmfK64i0jaIWrI80Go3VzVnv5LwHaHav/Am18mLl2xBNJn3TyXOEZOdfBjTz4z0FPw6dtYr7NnoqP/6x4Meh4IfQNgo9JY2Oux+5yngP0NQPyuOVH1bQvUvZr+enBEnavwxoG5ks4F9GY3WjFytfA3Nuj0Tth/C3AZUb3zk9Tf0Yn6ruz/pjq9cBbQOo08dn6ngv57Mk9vshQk3icU1DGbxywkq57a3+Fvj5KUDtrX/7Xr8MaJYzHsS1OBNShlBp4ZYahGtx5qxfIL0exlD3eD61pAhy8L2PCLUr04xB2buyw8q4op31cvj5ySG/Zz6gDzt1wOxj+zKaqyOX4/0EOYRKDre00NL9j9B9kMNA2xAkwluMYMsZI9SuTOWgzl3JYSlc0c76I8XnJ4eCHEITOWyujlyOM0EOoZLDLS20TO2PMISzfqv6OqBtCJY53sv5Iqve+4hQuzKVg7p2JYelb0U7t+dd9qP++SlB4zb857JG5sONCv4SYrgcxug7Iwv6txGo5PjHfFlzJsghtI1BVqy30W/bufakwz4L7wGaykEZu5LDSrd3KQfN85NDIXMI7Yfdb+XQ/ZJiyLXe18Cc9Wm2bwMqOey5xuBynAlyCG1DkBXrbfRbvZyvMoL3Ae2TMI7f46UAqtqVFS98z/aqsacA+aUAoYkVNtegPGWcOetjyd/GzpQV/5hbcSZYIbQNQS4/30a/NYCzvvzrPUCzlMEfPVza2Rmtbq6yiD5HSo6Xl4K2wd1Z1lR7jc/Lm0Sd9VVb34oajmpTDy9H/o9EeYlT1H6o1a959mXrrZp7V6LzvagtSHsV5SGDcOv5FySFull/dQFJgZLlD5IIzSSxvQ9tJP8+/q8VpKDzTWYJjhiqOeKm+qAlUn2uoLP+vOm1qG0gcicEhryjs76ACoZIbTFuddSLIRS8i0XudMeiuO+zZAgMOeUnn6K2vRKBX6q1ekpZ5D2d9eYeDJFqhriph/cscurclqH9MIEiUmEgUMTW6skyEYpI7TEqx0QRatulolD/2guVTneJqiNjHxmyiFQYGRSxtUZmZ6IEJUMM1QxxU4suVyhY5hxKOURqG4bnEFuro7M+tQ9BTrUjQTSh1l1qCvXwTa5qkUlOpUwilTWxtcYXNDnkFVDtTtPkHwxLnUN+V6ei78OQdRaJFILo+4vgidQepGSLIdSyS0Ne7571YVEYSpRUCUgkUtkQW39qyKFkiFQzxE0tuieSQ8kQqX0YslzCEJurp7M+tQlDTs0zCbXv0lOoj+1FPfj7vuH2dq2zXPBIbQO8+63VqylMSCZG6fMgU46zEqmmipvqgyGZHDrrz29xUiK1jURvOEAVm6uns74ZBKqcmqtCmbxUxVK691o5uktASgXKqqSitgFKwuHc5DGCJ4dSSpFqnripxhE8OeS35WpH95TyRS8E0d8FwBOpfS7qekwWPdTKS0Osp2tkZ30ZCAwFql1XMplI7UMLhRLbq6/gyKGzvkEEuUSqOeKmFl1yENcPDiVHpPaByLGGXGJz9XTWt4bAEak9SB304giV89IRq+veX0lnFgUqOCK17VUqZtlefQVHDqU8ItUccVOL7o4c8jsOpztS20DkOgqK2FodnR/k/AVFTk2Xu9Mv3HTYGL3poL+3fz5Fys5Mg9rGJ4fglxTDNY0QbRLsK9UKVZrCB325C1DQNKg9C2y5G81tF325G9QepGQfU+mEqneVShtjhqQMgiGn9PmCl4L2nTreSoAgDxEEORTyaIRqgvyDQZBDSRCpfRhyoL2lcZyDoB6kvdZBBKHmXQpiXdwOCHshBv6euWvUl2rCEKlsiK3VUzDk0PmhDsB96f1WHTVD/sFgyKGz/ij4taJvw5BlH4JCDL38ey9qn4paCEXQVvP+++/+DRly/gcE/ud/3Af4n06nj2IYpdbf/uk3f8V2LEn6pgukjVMhbQjte+IXCSFI0MIgfX/k2IWWD+rym6aFm+qDQYtDKXFI7QOR9Rte2Fw9ne23Voman4Ew/cv0YTXcey3dn5cKp0DJgYXsIbSN7+63eh7DEkeg+gqmHEpLHKlmiptadLtUCLtwfhQKCcRQuyk5TGCKzdXT+VF8IoOcmptCxbs05VXxuf00kqacCilFaGqKQI0wmHIomSLVTHFTiy4OfpxODiVTpLaRyBEJUWytjs76aC1EOTUXhXp3Kcpr4rO+oQNrX6DCGYnUfiSGxY/tNcIgyqGzvr8Dix+pJoqbWnQX5dBZX3mBlHKqTfJ+8MKXQ+Ycvkhtc1JLlZyZUPAuRbEoruGd2+9XmVFOhTusJ1IfKSWzhLWP7dVX+LYiUOFe+KCaqRS+5mYfCnLKqbP+/hiqSG1DkYHAEVtrIGd9CwccOdV0iyrUvUtVrI17r7JvyCmnkipSH6rCeYpAdZZcOZVckWquuKmHd1dOJVektrH4+sfW6ulsL9RIszZ3hQJ46cqL5POTl0yBCusfqW1857D+sb1GGNY/h9KJilQzxU0tuhx0SCqHwjdMg8pJFWLoyy6QVKT2yajS+JhO51+477AxWtXaSxxOiXJFg5ooGu1tEuVI/Zq60odqvhVUhlJwM5QguVx7reDbMOTL5rdqrUGY5PeithjVg/hB6btKoTPL4+ruoi+OeMbS5haDH1K7H73tEGJ4AgUo3GIdVNPDvmscXj2NzxVkZ334YagwDPhha4vhd1gHtcWow0T8oD5e+vEa+qLPJMOPU+fgh9S2U3XXdz9lf0kxwrko9HTRF2kgf9hTE8RNNW9BkEMXfbwOgkht4/AEYmt1dNH3IyCBSB1jiCAUyktBXkxf7sr456Xd2akkiFQWxNYaWBLk1EXfxwBBpJogbqrwF32fwY/6YKfkWIIhxtoGYlXtaO0x5M4VDPUYZVkMofRdGvLy+KLP0SOFnEqGSGVDbK2BJUNOXdozvfsRA0OkmiFu6uHtcm58sKiLPpENQ4x1PP73zrHIsbXHkFMpDJE6xhBDqHmXhrwuvuhJGYacSoZIbTslk4NFjq01sGTIqYsuVjBEqhniphZe1gKkkEMXfVQUgkgdJ5eC2FodXfQJRggidYwhglDkLgWxEO7dSdZDkFNJEKksiK3VUxLkVBJEqgniphbeBTl00S+nIIjUcXIpiK3V0UWfu4QgUscYIggV7lKQV8EXfUgTgpw6+68ZBrXtVF1b7gNDBnmMcBnn0Fn/LhISiFTzw001bZp4SCCHLvp4KPyQOs4t/bC1OrJfrsAPqS1G+2G4CELxuxTkBfJF34sKQU6lDCKVBbG1RpYyyCm9lQZBhJogbmrRPYEcuujbJSGIVBbE1uro0r6+2zVCEKljDPGDanbphxVv704OfvhxSovnl4KO+8T88RAhfxy62FOt1VHT4x8M+ePQxR5sreg1I+1mDdMohfJLOadaqKOsyy/cVNgYualwsWddT4FyWQOKuTRaaw5CLgXKc2lAJWtsatEtlwJkY32tsYZj7q1aq6OQS6OnLUZd7IkelL+rXLp4iXzRJ3SfT4EKehhqH5fk45cUI/lhkDZ8/SPq3ypWE+Qf9GwK47joo70QxFDbQKwiGq19D+Xi9f0YY1YRXVDYLgWx+O3dyZEHQU4FQYT2cflt0xDEl7sAhRvcgbrozwm+p70OzrjXfQLkxjGcOdWWrc8VMEAXfT4V6hhqP47HrTHJLVS8S3Wsivuey4ILdU4FdYS2ffLUYmt1FMQ5FFY+hy76XCq8ORW8OXRpj3ntSuCN1HGyKYytNbBLe0vxTkEYqWMMEYYCeCmMRXLrTp9KhTCngjBCWRhbq6MgzKGLPoaKpTBRshzBmFPBmEN2nQ1jpI6zTWNsrZFddAphjNQxhhhDRbw0xqq5d+ero1PBGKFsjK3VEY67sTjso/96ujh1aaXITkEZqXb24qYWXobxoz5X0EUfz4UfhjrOLf2wtceQ1RR+SG0x6gwoflAQL/2waO7d2c2Ii1PBD6F9n8LZi+3VVcgphy76qCgEkWqCuKlFd0EOXfThXAgilQWxtTq66MOjEORUO92JJxTGS08snnuvddmyHzxY+ZwKnghtw/NTFVuro5RHTl30+VRoItU0cVML75ocuuhD3dBE6pgDzCO2VkcXfQoXmkgdVYsf1MVLP6yde3ey/MCPU8EPoX1cIY/YXl2FPHIofHke9ueij9ni3OSxwrnJoUs74ncrcOaUQqiwHLrcZC6hjtRP1aFYXqrzgvriD9ZenArqCIVDEgUWW38qzqEkzqmLPgQCcU4FcQ7Z8CGO1HG2mWxsrZFd/FHbEaOoJv+Yc9dfuHOxMXrnwh+1DZSLG9A2PFsTR2vtuGdcgIK4QF30Ydfvp0C5uABddPivFSqKSzH0Wdj3ilHjn4tDbb7KuCvr94p30W/Yn0+BCuIYahte+vVyiBLcMUrtUHLn1EUfg4U7p4I7h2wG4I5UdsfW2umLPh8Ld07N3aGwXrpj8d17lTM43DkV3BEKw/uSQgRxDNH3RvL3W4Wq65Cwg8FSii5jhSVSYRhv1dr30K7nR4yi5pZQTS8tseKueBf7S/Snq1PBEqF9eH45EoIETwzS90futMBToPQhVSSYU0GdQzYBUEcqq2Nr22l9RBUJ5tRcHcrqpTqW3r3XKvE+r/SvTgV1hGbq2F5dBXUOXfSPtEMdqZZi3NSiS/L8qM8VdNEHOOHJQ7U5/rwICdBFfyUMXQx1VC5XHyivl55Ygvc9l6UHC6FTwROhmSe2V1fBk0PpHEaqeeKmFt09OXTW6xZ4IrUNRNIbSyFbqyMrESDIqeZaPKHKXnrySvxifyP9dHUqeCI088T2GmDw5FDyRKp54qYW3T05dNaBwBOpbSByzMITW6uj5MmpuSeU2UtPLMVbr/5E6NUpHd7LaUDb8MLPz0d7dRU8eU/JE6nmiZtadPfkkD1vC0+k9oHUT8e54rG5erroU6tIKKfmolBUL0Wx8G696tOsWPicCqIIzUSxvboKohxKokg1UdzUorsoh9LCR2ofiARBRrG5ekqinJqLQsW9FBWqcn+a9+pUEEVoJortNcAgyqEkilQTxU0tuswxriQcSisfqYkoNldPSZRTU1G3X7iRsTF6I0P/dMvzKVAuakD7+I5ff3xJIVzTCNHmQJ9o/lahSlP4oF+YB+iiY32t6Nsw5Db3W7X2PZSv1N4TNbeEKnmVTjevpC/6EDIsORUsEcqW2FrDC7fgQ0cXfZwZmjzWRR8//p6oYC6Fkq+KYI7UNjS5aQtzbK2h2RzCHKmj/eO13w1l91IZS/PenVyXQplTQRmhbZ/kWENisbU6Conl0MUf6B2hWmL5B/XdHD/SLlz09wPQw1DbMGQNhR621jAu+gw09JD6qR6UxUs9Xjpf/Enem1NBD6F9n/wuRQgSBDFIDT+coEKoiz6Oi5TyWMGZQzYBcEbqON+fF4GjtXb64k/2Bmq+GKJEXqpjGd17leMJmeVUUEdopo7t1VVQ55C/GTvtz0WfrIU6jxXUOXTRx2WhjtQ2NpkepBtba2SXJ6GQbqSO+mU1RNW8dOaV9UV1wJlTCr0UtO2Tr4YeIhhz6KIPs+L8RaqthtxUsxb0OJRWQ1JZD1urI5sv6CH1Uz0olpd6vKC++tOjN6eCHkLbPskpGicrtta40vWFU1d9WBJ+SDU/3NTDyzGC05VTNlrkD6nj5HLpY2v1dNGnsyCI1BajbqRK/qBIXgryQvqqj2sif5wKggjt+xROV2yvkSVFToWH38YONUX+Qfzk61gtQJFTV3+ANFDtzEJTKVS52CmYInW0LaZQJS9NeSV91cdWYcqpYIrQtk+eSmz9uadA6fcaSCVSzRM39fDuySlLA6QSqWMaUBBbqyebMQgi9VNBW3Wc3i5287L56k/3BipYYahtR8LrLUOQcAb6CIL1e7zt7OpP945QTQt77x+U7/SQPomSszu0kDpOKbWwtfckRyG0kDrGOObN/S/ciNgYuRFxtb/sfQqUGxrQxNBor5G5oQCFC/JAXfWZ5O9pr6/6pPCPSOkMvBZ1nPBPaXF/bLELVFs3xR0K4tWad8+iuSb0qjP6fApUcMdQ2/DkaPuSQoRzU+goPDo/qEqusanGER6dj5TsKjz1gdhtpNFaPdmMvc9iiCCUxEtBLJt7d7KYQxApzshLbdp06GN78MFP9LiyznzNlHz1860o9o68SeFtsYuUDA4+GCvnDVv7QMQpfJA6xhAfKJmXPlhW9+7s5tC9UyFhCE0Msbn1pM8vw5BTabEj1QxxUw8vRztWtkTJqgRDpI6zy5WNrb0nuckHQ6SOMcQQqtqlIVa+vTs5qJAxTgVDhLZ9Sn8AIETR1ROKGKXvkKQakohUU8RN9UG/wTo+V9BVnyiHIYbaRiJz/1atPYZkKwz1GO1pfFGEK6OlIla/vT/JWShySh+oxzJH6EORzj4WOgK9L0lYOHIqpRGp5oibKrzfVwjRr/q0LBwx1DEDmEVsrY78pUeHEG3RF0WobZeKWP9Wd1d/gvTeqZO/gnRQU0ce5qp/pReOnEqOSDVH3FRjCY4cSo5IbUORdRB5xNbqKDgitIeoLBNHqGqXjlj5VndXfaoWaZQoWQKQR6Smjgi0zoIjp5IjUs0RN1X44Mih5IjUNhQZKByxtToKjgjtjmplEkcobJeOWPxWd1e9aQJHTuktKSgiNFVEoPUVFDmVFJFqiripwgdFDiVFpLahyLkZithaHQVFhHZFdU0qilDkLhWxEK7urvq3fqDIKbz2+Xj3C45ITR0RaJ0FR04lR6SaI26q8MGRQ8kRqW0oNb88HbG1OgqOCO2O6qR7dPTwC/cYNkbvMeiT58+nQIWXtwxq2ysV/SUFufp19whS47/q32H+VrHKUPxgrTD79P6oD/bwNYE79VrUNhK5dn+r1hZDn/p+L+oYQxT9wq2EB5bNvTvZKShyKikite1UuvAOYfTS72vsSx9UgyP21RxxUx+KnO3hKFFyvoEjUsf5/Uyj0dp7klUFjnIMcYQSd7XUPbAM7t1JKQJHTiVHpLaBtWvNfWRIIzb3rmQZgaJE1TXRHguKSDVF3NTDu6JESbJBEamsiK29J0lFKCJ1jCGKUOMuFbEObt3pk8JQ5FRSRGrbKU19KGJz60qfa4eiQOkzsVBEqiniph7eFQVKHwqGIlLH6WUWsbX15M9+TmKIIhS5S0UshHt3krRQ5JRO20tB27jSk2ghSljovCv9EQ8MOXRt9473qfyeKL/nEELpb1mgjP3tyuxnyKO5T6KsD0grBulUrQ/iDiXy0p2X0Vd96BTuEiU5D3mkpvII1N4HeQ4FeQ5d9UkKyHMqyHPoqk8uw16g9BlPXGI4pQcCHBLapqlONuIOVfHSHSvnms6rPwH64JTXUgOaqgtR5NyOpdGhoI5QWxm5qQYSPDmUPAVKHy+FJ6eCJ0LbnNQ6LZ5QGS89sXqu4V31GVPkmFP6h0uRYoSmnghUXyHFHAqeHErro1NBnUNJXaD0FZ1Q51RQR2ibplpERR0q5qU6VtU1nVe1AnVOhdt+g5q6C2E8xxwK7hxKy6NTwZ1DyV2g9C/mwp1TwR2hbZqmpzZU0kt3rLa7O7nYhTun9ESCtCM0VUeg+gpp51BQR6gtj9zUgtd5Y79QQfXlUPIUKL0hAk9OBU+EtjmpuvaYY4+/cC9jY/Rehv6w5/kUqHC/aVAfomSWvsQolmIjSM23expQeRqb6nOeTwEKnhKlT02/pdFc/a7TiPVTUSipVwn1yLK7xnfVh5ghyil9++BLQTNPHsTzKfQUPDFS88RNNY7gyaHkKVD65DU8JaquKPYMfi9qm5NqlYRCXb30xNq7xnfVZ7jhySlf+Ab04UmjIKE8ShDlUBDl0FW/O/se+5Ms/5Gg5M47DCnmkC+FYxK2WaozjJhDUb40Fwp3f8z6MVHV7X44IcVITdURqMMkqHMoqHMoqXMqpJ1DSZ1TIescCuoIbbNUFa2oQ9W9VBcqc32MGEnnFB5N0G9NBvWhTo5vJF2I4mcxh4I5h676GDKSzqlgzqFkLlD6OC0WzECFExupbZpmV4qPqLaX7liRVyZc9XFKuHMK92PMHamZO7ZXXyHrHAruHErunAruHEruAqXPtMJdoII7Uts01doleYcKfOmOVXrN5/VRrMCdU+FkR2imju3VVVDnUFDn0FWfgkXaORXUOZTUBUqfc4W6QAV1pLZpaj/+FXcowZfuWKbXhF71uVq4S1QdMjzdkZrJY3v1FeQ5FOQ5lOQ5FeQ5lOQFSh8ohbxABXmkdnnTq0zU4Et5rNNrQq/6IC7kOdV+Kkd3hGbu2F5dBXcOBXcOXZVC4jkV3DmU3AVKn86Fu0AFd6S2aZpeq6AsX6pj6V7zedVLI6hzym8cD2imLgTxSxWHVMq3tDtJnYcK6hxK6gKlzwRDXaCCOlJ72tWXP8c18+kX7pZsjN4t0cddn0+BCteZg/qQ57/9GEAdKJ54Abrq88Df0h5d9VHf74lyfbFDOSG8plBXfTT2LVE3fV70vahtoqonsYcqf5V5T34n4KbPg8KeU75oDmgqL0Sx1BtRynCS56GSPKeCPIeu+ktzyHPqpk+JQl6iKrk+76sMas+92SnvCYX+0p7fDLjps5yw51T4m2aD2vaqdmrf5y8pRkg87+imD2gi8UjVDbCxqaQHUfxcQTd90BCiSO2TW6mxjwOG2NyD1BcyNERqC1LVrqQXKvWlIFbzvbuqDPfuIMgpPDWrhdygtp0KT0eO9uorKPKubncyS1BEqinipha9ZmYfyI/6XEFJEUNtA5EFAIbY2mPUxQUNkdo1V4qJIhTkS0Us2lt/+pwhFDkV/pr9oPa98gfAR3v1FRR5V7dW1ewTAEWkmiJuatFdkUNJEal9IDL7cMTm6umml2I4SQWq9kdMofxemmKJ3nuV4wemnDqHZCK1DdBXO7ZWT8GTQ+EPcY/daZ78g2G1cyi8SnBE34chdxngyYNc9Y/kwROpXfZYdkQQiuylIBbiNW03/Qk2BDmVTkektp1KvzANYYIjRul7VMcgc4lUc8RN9UH9WhLLnUM3/zO1g9qnt76Y3DuHoxREFn84IrWLnq53KKaXklhw18huJzkDQJJTSRKpD0kysbhqYHv1FRw5lPKIVHPETRU9OHIoOSK1O/I8YnP1dNMLYDgKVE2JpBNK56UpltetV/2hO0w5FX5pOqgPU/692QCqs6DK+7rpI384NZFqqripogdVDt38j9aO6LuqsVoxm0IMTUmYIrXHqMs/cYQaeemIdXQN7OZ/tPbJqZRNpMLIkEtsrZ6CIIdu+mdlIYhUE8RNLXodu/vkYr1zKF07kNqGoccr1js2V083/XU6DJE6zsVB0PlufXtiZ+T2xE0fv31OlCdRUfvIjofel2qtgZmgBN30jPytqCGoNrXoKihBN/uztZGSUG8R0mrrvahdU53bxBPK4kUine9C6azPXcGTU8kTqW2vwo+2U5igilFqxm/6UDBUkWqquKk+aNd39bmCbvr87mtR20hqnfpY7Kq1x5CLWTji7uyO6kwvjlDyLh2xLO796QX4+c6p5IjUtlf+Nu8UJShikNohv3SoUE2Rf9DOR/W5iq6vLochRtrGoQKRRmxuMdwQoX0uxroiglDxLgWxKq7ebvYw6/nOKa+QitoPm7FT+6GHxc5jBD0OJT2kmh5uqnGEDHLopk9Xww+pfRhayVZz9XTT285IoUOQ8ieGUO8uDYWa2J6TPN855dcLRR0PGxryGMGQQzd7SrI6aob8gyGBHLrpT+9giNRuSCofZBCbmyG7oitqDzI1hEp3aYjVcOtP//gtTkROJUOk9r2y+0EpSnDEILVDKYtINUfcVB8MWeRQyiJS+6FW5SdPRGyunux1+sgiUhJEsgiV7tIRq+Hq76aPz8GRU+lERGrmiO3VV3Dk0EW/HsC1AqnmiJsqesgjh1Iekdqnt87zdMTm6ummfxgajkhtQdojeuIIle7SUaiG9U8Sw5FTZ70b8VLUtlfhZlABNbggKfSlP7CEJFJNEjdV9CDJoXC1QGh35GcjNldHN/3b03AUqLp+F1OodJemWA33XuUeCEw55XfAi5qaCmHkEvJrRel7VEPcj2iYYqhmipvqg8GUQ8EUoW0gekrEWYnN1ZF9yV7QbrtmVBSh1F0qYjlc3d30SWAociopIvWhSKYVl3Zsr75CLjmUTkqkmiFuqujBkEPBEKHdUM0u1zs2V0c3/XPDyKVA1YwcRZ1+4XbDxujtBv1b1M/nQIVVb1ATUaO9RuiiAnSzP71dO1SiwgddVIBc1ID2NLAT02iuYdz0gfr32sM9yChHxBBK3VUqnVgO9+7qzsV+9MCQU6FGGtTMkEcJhhy66QP232qHmiH/oF/fjV2s4WpF+FrBt3Hoz7/fqrli2H0/GOLu/NQQSt2lIZbDrbt2KUJDTunTGS/nE6GZILZXV0GQQ2GtG101Qf7BkEIO3VQBDJE6Tu7nWjdaaxg3fXUABDFGp2aZhIp36YlVcY8nN6mQSU4FT4RmntheXQVPDiVPpJonbqrowZNDYakjtI3DStkwFTf9ahqaGKP2prmUBQ/F8VJTKKDtjQrnk1P6PQbSidA2PFkzv1Rr7XiQxBAF3fTvW2O1I9UkcVN9MEhyKEgitI3CrsFH19XPTX+aD0k9Rs2E2EHBu7TDorh3VwG52DkVruxOpGZZxPbqKwhy6KrXTRBEqgnipha9LqX2gfyozxV001dEYLVjqP04s9sNo7kHkSICihikUbU/Ygpl79IUS+MWz96acD45FW46DGofoN8YGu3VVzAVuvJ6doRqpvyDIZUcCqlEaBuHGMB1A1trFDd9gQI8BWrqCaXv0lMoj+0VCeeTU+EG3qA+Msq+Nk9hgqjQVxBFqonipprAIMqhIIrQNpC6PcrrB7ZWPzd9WwJEBWoqCvXxUpTX0Df7c+aoi7yikvURJyZCH55qr/YB4tTE9hpg0ORQun4g1TRxU4suu4CVzyG7iMbKR2obiP6kDhnF5urppkcERAWq9kdWPhTAS1GhSLYXIuD9lyYKezKuL3cTMEVqZortNcJgyqFbSChSzRQ3VXSdPphyKCQUoW0cctELT2ytflJNS2qLUUl5FHT+hbsOG6N3HfR21PM5UOHUNKhtp+SuypcUw/WMEDV6/5OIFar0hA+6ngD5HwGr6PvcymH4Vs21i+r4vaAtRvsOSASh7l1l0Jm1cXV3szdVnAMVzkmD2vYq/bphANVZcBT2yH/dMEI1R/5Bv+swPle7EH7dMKhtJLVAfZ6URmuL4b9AGdQWo84LogiV71JRqI71aWrkkFNXLV9eivpQpF8oI408TFDk0E2vQL5VqKYofVDWqB/1wTa/+m6H16K2oUgMpFHqSZINeURqizFd51D2Lh2F0tjeaXA+O5XWOVJhYBDE1pqcIMihs17fQhCpJoibWnQ5/uHHoZu+CgF+SB3nljnE1urorNfC8ENqi9F+sC1JhJJ3KYhlcfV307cpIImcOvs9oUHte+U10mivvoKi0JX+cheKSDVF3NSiuyKHzvrYPBSR2gZi9xtGa3V01nM3FPUY02UOFe/SUKiK7dUS57NTKYVI7cdeMMT2Gpr/TanUl7+pu6imKIWXKxakkVNnfbYYjkjtB1utUcwjNtdILAgkkdqDTC2h3l1aCjWxvtkCeeRUul4gNbPE9hpbyCOHcJF7vLhHHpFqkripRfc8cuis7+KFI1L79NrdhtFcPZ31QU446kHar8tlrUOpu3QUymF70cf57FT4ImlQM0ceJThyKDki1RxxU81cuKRzKDkitQ3EboCPYVZH4XdCg9ono3JRFKHIXSoKhbCuz0gjp9JiR2rbK1llcL3A1hpZEOTQTV96giQi1QRxU4vuSeRQOhmR2oahzznigo7N1dNN34CCJCK1BxmrgAhCdbsUxAq4dyfXjxDkVBJEKgtia/UUBDmUBJFqgripRXdBDiVBpLZhyFTAD1uro+SH1BajVXVHQZdfuLOwMXpnQV/18nwOVBA0qG2vwk++R3uNzRUF6KZveflWO1SKwgd9kQtQWOQGtQ3Eb9KN5hrHTV8f8l67uAeZ5NDlF+4tbIwq0je6QJFTuucvBW37lH5nl6LIifhrRanxX/UJHyjiDjVF3FQfDIoc8r+nV9GPs/t5OTf6ro78udhjjPYVmGQRitvVMndhAVz93fQaFIqcSllEauqIQHUW0sih5IhUc8RNLbqtdGEkyRFDbSOp0zwdsbU6So5IbTHaD63EEQrcpSMWwdXfTd+uA0eJkvEjj0hNHRGozoIjh5IjUs0RN7Xoso8/ah8LSo4Yap/fsUrREVt7DLnqw0pHaovRLuvFESrcpSNWwdXfTd/sA0dO6VMHUERoqohA9RUUOZQUkWqKuKlFd0UOJUWk9uk1RWytjlIakdo114ouilDfLhWxBq7+bvpaJShyyl8HVdTUUQhTO78fpDgdOXTTuhCnI1LNETfVUPzbiPG5gm76VqfXir7PrzkKHdk7nypG66kOGTGFKndpipVwxbu3Vz+dL04lU6SmpghUZyGbHEqmSDVT3FTRgymHkilS20js8jvMxn0wxRi1O9NfcF1QMC9NsaiuePf6dAlyyqmw7BGaiiJQfQVRDt3re6eQUqSaKG5q0esY3hMWZyaH7vU1UkgpUttI5JzzVq3VUVr2eoz27KAkE6rdpSJWxNXfvX5ZBUVOBUWEpooIVF9BUYD0qxIoItUUcVOL7oocur+Tb4egiNQ2EmmFIrZWR6YZFw+kthin8iyKUPAuFbEo7v1VwP3ggyKn9D4nLh4ITRURqL6CogAFRaSaIm5q0V2RQ0kRqW0kEgOK2FodJUWkdkW1Zh4VXX/hbsPGSCl7r28nez4Hyt97XdTMUQpjFw8JckeDKkdjU02d17IBCo4GtY1E7jy+1Tiro+DoEKMd0OIItfUqja5ef9/fyTcBcORUqGUH9eFIjr8vKYqn0QhSE4A/GHO8xvpWoZoi38egyKF7vW36WtGzohBDT2jvEqN+9CqKUPAuFbEorhm51zfIQZFT14skwEtRM0UeJSgKUFBEqiniphpJUORQUkRqG0h9N/dZyYbJSFnUY7SHZ0UR6t2lItbENbB7vR8HRU7p65ZgiNCHIf+xyQCqr6CIURoUFJFqiripfVAS+UftY0FJEUNtI7EbQmEYSVGP0R6RFEWod5eKWBP3fZb8gCKn1CMUEZoqIlB9BUUBCopINUXc1KK7IodserHQkdpG0u7lMI3Y3HrSty1hpSO1BWnHqzhCVbx0FCrn9gOWz2u6q1P+p7rOg5pKCmHkePhaUdoMBEkM1SRxU/ugS3IoXTCQ2kbiSx1bqyMTDUekdtF18S6OUOkuHXk1fK+LOPLIKT28kEeEpooI1NhCHgUoKCLVFHFTi+6KHEqKSG0j8aWOrdVRUkRqV1SVjChCjbtUxDq49afvWIEip056GQNHpKaOCFRnwVGAgiNSzRE3tejuyKHkiNQ2Ekl0XHeztTpKjkjtjqa1EYrcpSMWwq2/Vg9zqXMq/D71SurDkcwPrrvZXn0FRQEKikg1RdzUossu4IrBIZtenI5IbQOxP6tbzdXTvT6SgKWOQYqa3q67otZdmmI9XPHuW8lFU4HStyUim0jNTLG9+gqmAhRMkWqmuKlFd1MOJVOkdlNexbK5errXS12YIrUFqRjHBe/2CzcaNkZvNLQfg30qClSokAb1oahdz+xhvpwHUGNzRwG61wdwv6VQ9/p+z++J0hPujwj5z4vHbu3apKp+S0Hu9av+96K2IHWyE20okleZdQuFtF5ePuMHGyY3rIGDmmrzMEGbQ0lbour43Y8TaHMqaAtQ0EZqG5w+qgVtbK4jMmkjtQWpy0jRhpJ4qY1lc++urleYbU6FX0reSB2PJaYaW6un4Myh8DvJ0VEth2NTi27LYYDu/R2sgzrO7T4M+Al7qL9bRFqROsYQP6iHl35YM9e47v3dqzenwjPog8p+Qgy5svp6HiFqd5Ifhmp+uKk+GBLIoeSHVBgG/LC1OrJf8sEPqS1GHSfiB7Xw0g/r5eruvv2qj/njlJ5BX843Qts++R8RqfbqKiQQgxR0r68+xbkqUbX673uNRS9QcprBuSpAeqvytajsLMWQNRjOSG0xZpfrN9TGS2esn/sc1UFAZ07plSKcEZo5Y3t1FZw5lJwlyp0Fyp0FKDgjtY2tzjFcB9laI7vXtxfBGaktRp1WJM9QLC+dsaDu3dWtDzpzKuQZoZkztldXwZlD9/oqOuRZourQZZ4Fyp0FqD33uodCnpHKzthaI/PHmQ4h2psGxBmK56UzFtjV3b2/CvTmVMgzQjNnbK+ugjOHkrNEubNAubMABWektrFJQuN8xtYaWXBGaAvR3tMgzlBML515wX3fvk1hnjl10z8siMWR1Ewa22toQZpD9/quUiRaouTqBSc0p8JFiEP3VzkZIdFIbWPzxZGtNTL9SwJYGwnt3mtnRRrq6qU01t7V3f3VT2hO+dchN0IzZ2yvroIzh5KzRNU0cHF0KjhzKDkjtU/48VtoJBpba2TBGaE9RB0VR2f3v3CbY2P0Nkf7Tuwz0QIVvh4Z1ETaaK+hubQABWmRqhP7p7RAubQA3befie+hXvEM2uc8RWmjtUbm0ga0h6i8EGkoqVeJds+yu7q71zd2Pp8D5Yk2oJkz7yo4cyg5S5Q7cyo4c0jnG8oI7fMtF2lv1dwnUU6w70VtQWqBFWcos5fOWIq37vQdpnDmlD/2PqCZMw8SnDl0r1+nfUv7c69vHv2eqOAsdSjrLKSROs73noVwxtaaRPUOZYR273WAiTOU3ktnLM+ru3t98SacOXXy32wOaiYtRTmeHL6mrpI0D5WkORWkOXSvL1qFNFL7jB93GtLYWrMYpBHaQ1QaijTU3ktprM+ru/v2ZQ3PaE6FbyrvSc2ksb36Cpnm0P1NliNkWqLq4OUZzakgzSGdcDgjtE+41AyQxuYa2b2+EhSpRuooXqSh+F5KY4Heu5OdQqY5dQrLI6mZNLZXX0GaQ0laolyaU0GaQ0EaoW1oen8P0thcI0vSSG1Bpqc01OhLaV7H3+t7UCHNKf3+56WgD2f+DVmIEqR5V/f3NcI9h5BppOq28NhUExcM8XMF3fuLSUeobSS1jvEE5jHUMrKK0DGEZBVq7aUg1uN9j+WUC0FOBUGEpoIIVF9BkEP3+oJUCCLVBHFTi15X0Pvk/qjPFXSvL1vCwsdQ20jsPsdorRhBUA9RjkUQ6uqlINbe1du9vnwJgpwKgghNBRGovoIgh+7bzTdmEKkmiJtadBfk0H27TbRHhyBSx8OfGcTW6igIInQMIYJQRC8FsdCu3u71uTEIcioIIjQVRKD6CoIcutdvb5FBpJogbmrRXZBD9/rWTAgidZxdCmJrdRQEETqGOAp6+IX7Fxuj9y/0xuTzOVD6J9VeCvoQJJPzpdprYO4n9STXMd9SJL0h/T1Bfk4K3elt0teKtA3MVrwQwr9AGdAWoj3cIMJQca8y6oFVec3ivb/nMlB+N35AM2HeVRDm0L2+1BHGEiVHCJQ5FZQ5dK8XsXBGap9wLalGa01icHYIUZdB4gzV8tIZK+rq7l7fA4kkcyrcJBzUTFqIIpcsX1NXSZqHute3Y0KaU0GaQ0kaqW1snmhsrVkM0gjt3iuGSEO1vJTGirq6u9cX2EKaU/o2RqyMhGbO2F5dhURzKFRUo6sKda8/RIQzjxWcOaTzjTwjtM+3HGhv1dx2R39L9V7UHmQkqzhDrbx0xnq6d1eZu59h4SxQcj8BzgjNnLG9ugrOHErOAhWcORWcORScEdqnu779+LwAGSOvkd0HZz3INM9QKi+dsZzu3VVAOnPq+lilw05BGqmZNLZXX0GaQ0laoPT9kUg0p4I0h4I0Qrs0OXUi0dhcI7vXVyUi0UjtQWaJhvJ5KY0ldu9OdgqJ5tRJf3ELaaRm0thefQVpDiVpgQrSnArSHArSCO3zLWsMpLG5RpakkdqCVGLI6oiSeimNZXfvTnYK0pzSO2VwRmjmjO3VVXDm0L2+CRGXjomSzEeiORWcOXSvr9rDKY3Ucb65OrK1RqbekWeEdu+zPEORvVTGQrx6u9d38UGZU/4FyoBmyjxIUOaQ3oCAsQDp2/lgLFFjqvbZ/pEgrdYhzCNdtepGsjmlhS7EEdomqVWCkmyovpfmWKF3c5W9PK05ddK/V4ZsIzVTx/bqK6hzKKgLUFCXKFPnUFDn0L2+tg/qnArqCO3qaqaP6h5/4Z7Ixug9EX9PXaD8R4oDmpgb7T8zF6Dwa+1A3euPub6fI6XqIiQnitcKtY1NLrLfqrVG5s5GR1uI9r24OEMhvkq3Rxbr1d29vxQtUPi6+zj8l/OgZtK8L0+3EaR2KEnzUElaoo57/aP2ujq81zf3QRpDbWOTkUMaWytGkEZol1Yln0hDIb6UxmK9urvX98Y9nx+d0h9awBmhmTO2V1fBmUP3+qa5b9VVhXrQN5Qh0TyWX5AE6EFfEAdnDLWNzRONrbU7fkFyCNFuJ4szFPNLZyz4q7sHf1Pao1N+/3FAM2chSB1u+xn063kEqf1JzjxUcuZUcOaQzjeUEdqGps8mIc/YXDtt3t+L2oOMfBdnqMOXzlir9+5kJpFnToVnMQc1k+ZRQqI5lKQ59aBPwyPRnArSHHrQl8fBGqnjhH9e+Y/WmkUVD2eHEPXNhUhDHb6Uxlq9unvQF8BBmlP+zcyAZs48SHDmUKjWRle11/d6nwbOPFZw5lCo1kaobWy+OHqM4IzQUbsoQxW+VMZKvQb/cCc/Z4Eyp/x3pQOaKQtBJKOxNjqU0syplGZOBWUOpTQjlZWxtSYxKCO0hWi3J8QZyvClM5bq1d2DvxDv0amQZoQ+nPmPcEKUkGeM0neoFpJ9McJFCKn6hnpsqg8GQ/xcQTq7WAcJ7bPrScXminHTlQkrIamjZTGEentpiDV5dffQvkL9rKQfnTrpwxO4TCQ1VUSgOguKHHrQF/RBEammiJtadLlrigt5h4IiQrsiv5Bnc3WUFJHaFdU9NXGEwnrpiMV39ffg78N7dCr80ndQU0cpzLg84nWhQ/oeAygi1BRxU40kZJFDQRGhXZFoxjUgm6ujBz0PIItIbUFK89HQ0y/c1NgYuanxoEf28zlQflNjQB+CZGRfUhDt6WuCHvS9Yt8yJR1+T5Q7G3td8+3OBrQ7k1P3W+roQd/i9F7UT52hil5l1RMr7drlB38hUaC81hrQzJl3FZw5lJwlyp05FZw5FJwR2p3VKvZ52T5G3idRbmbBWQ9SZzzJM5TaS2dejj/oC5GQZ075PY0BzZx5kODMoeQsUXLRgTxzKjhzKDgjtDuTjpBnbG7O9M1NcEZqCzJ1hlJ76SyU47rswZlTwRmhmTO218iCM4ce9N1JWBsTJTUAnDkVnDn0oC89eq1Qx/lmnnkM9Q5lhHbv45wtaYYaeqmMdXbN44P+ZhTKnArKCM2Usb26CsocevDrjbA/D+1u3D6TUOaxgjKHHvRGE5SRysrYWiMLygj9VBlK6KUyltnV24O/A+fJKf/JwIBmyjxIUOZQWhkTJQsWlDkVlDmk0w1jhLah6a9asTKyuU9ivcl6P4KQZqS2INOrRtTQS2ess1t3rdzeu0OaOaW38V8KmjnzIMGZQw/+XpywPw/tb08wzTxWcOZQcEZod1Znor0jOGNzn0RZqOGM1E+doaheOmPh3buTX3nBmVMhzwjNnLG9ugrOHErOElWHLp05FZw5FJwR2p1JR3DG5hrZg75bB85IbUHKu5zOUGUvnbES793JNTOcORWu9AnNnLG9ugrOHErOEiWX1lgbnQrOHArOCO3OJIPgjM01sgd9mQ+ckfqpM5TdS2cszXt3Un7AmVNa5WNtJDRzxvbqKjhzKDlLlDtzKjhzKDgjtDuTZQjO2FwjS85IbUEqVw95drlb3wXZGb0Loq/yeU6U/yqnqCyt2mtoJi1BD3rW/5apWm8+FsdEmbQEPeiLeF6LOk74xwmtWmtkKv69oF18rWUiDXX3ItEud6zNq7uHq2Q/pDnlPzYtaiYtRJGuvlaQvkNyEQZpHuqh/aSM0pwK0hzSCYczQvuES0q/VXPf6cqlfXdgrQepI0ykofBeSmNx3ruT9Ic0p5I0Uh/S7IuVGMatMUrtkVVoFWncEa5N9blgyIMHQ4R2Q1JEwBCbq6MH/QoDhkhtQcqfGEKdvTTEWrx3J4cNDDnlf52wqA9Dle37YfWl2quvsBZ6V37bI4V60CvX74kK0lKHcowir0gdJ5xrIVtrZCoezgjt4vNtj8sdCu2lMxbj1dtD+7vJ+z7BmVPJGamZM7ZXX8GZQ37fI+2Q3/dIVHCWOpSrLjgjlZ2xtUYWnBH6qTMU2ktnLMartwd9QRacOWXX9gXNlIUgvg465I9KVFdtIfQPBj8O6dxCD6FtHHpHDgshm/uMyXKJpHKqvadG1kMU10tPLMBbr/aGqcudU/Zb+4JmnjxISC2H/CHN6qrvdZ249xUBy6HHCuocemg/yt1DwR2pbWzSEdSxtXZH9cMcoS1EeRVlqK2Xylh/V28P+nolpJZTQRmhmTK2V1dBmUMP+sIrXBgmSk6ZUOZUUObQg74bCcpIZWVsrZEFZYR+qmwrrf/9d/+GCuv8D6fzb/75H/dj5j9d7lhzVxcP+pgDPDml38K8FPThKVwLepTHukzadwhX8B8QVpC//dNv/ood3e61yrUPRHmoB32JE0Q5ddVfff1I1MOtjn0mF2NlU2ytvX7QFwYhu0gdY0h2bRV1VMVSu/chaQ5VpHh2gBhumoohUJGDmA9oJcZDJTFOJTFOJTGkttHJ4YRVj601tCSG1DHGUczpF+5ibIzexdDHGJ4vgfL3CRT1oU2WoS/VXkM76Y3Qr4m66q23b0XxqPlem3p4uQT/kagH/VtEr0VtQ5FD9q1aqyd8HTmuxfcEfC9qi1HpKY5QJK9OTScW0tXdg76qCY6c8iVvQB+KfMkbQO9LTMKR9/WgL0uCo0TJD2GgzSl9rQ+sOfSgj5zBGqlsja19aOWF1kgdY4g1FM5LayyuW3f61BqskeJx/FKbpo74mRZZX64FR4my81Kk3JHHCo4cSo5IbaOz1S/ujjvKMcQRCuWlIxbTbSb1cU84cipkFqGpNQKtr2AtUW4tUPp0FTLLKb/sC9CDvgQImcVQx6zYcwbrIVvb0PTFPVgPSR1jiDWUyktrLKd7d7JGwRqpllncNHVEoEUOjhLljgIVHDkVHDmUHJHaRueZxdY2tOCI1DGGOMIl1dKRV9QP+molOHIqZBahqTUCNTS/GgxdpVOWh3rQ1yshsZy66k+Ucc5y6kHf+oPMIrWNzq802FpDe9D3uSCzSB1jiDVUyktrrKZbd/q+Flgj1TKLm6aOCFTk4Mih5ChQwZFTyZFTyRGpbXSeWWytoSVHpI4xxBFK46Ujls+tO31PFBw55fcAB/RhTZZQXLCHIHKZi+sMhx5ULa4FSfGYQRZxUw0kLH0OPehrVpBEpLaBeBKxtTp6sBfaSIwKIoZQES8NsWru/cnkwpBT/ocPi5op8ih+Lyl05Q+QV1dNUYguA8E655D9NVAoIrUNRA4iXEGwtabM//Zroqa3aU+okJeiWEVXrw+PciKHKKe01sFFO6EPT+oAuUSg+rrqTxaRTE492Htsimqm/IPhCt2hB32iEqZI7ckk0wFVbK6B+J/5KmoPUsfMMZvOv3CHYmP0DoW+aef5EiiXNKCZpAHU2IKkQD3om3S+1R6VpPBBl5QgvYn6WtFlfj+vyEOQB335yvsxSPvFr0hCRbzKpDOr5pq4hyc5U0KSU0ESoQ9JfosiRNF0+5q6etBbNHDEvpojbqqR+FlpfK6gB32tCxx5qLZc0ZRD4eQ0QoluMYW6eGmKtXPf9crPfa9gyim/MB/QvlPH219fUoigyft50DeNQBOppombahhBk0MP+iYXaEqUfA38lij/QcUItc1I3UURS6iDl5ZYK9fwHvT1IbDklH4D+lLQNJ88ShDl0KO+qQSiElWXUvvB9T1RwZ2H0vmGOkL7ESg/m4IzNtcs6ldoWAQDVPkg6lAeL9WxhK5OH+2tJpezU0Edoak6AtVXUOfQ451cgUFdouTuOdQ5FdQ5pNMOdQGqaefi6JD+cS0IJLTNUo1LzKFEXppjGV2z+ahv9kDSOaXfPyLpCE3NEai+gjmHUtIlypPOqWDOoZB0hPakqwmnMzbXyPSLTjgLUNkXdaicl+pYXVenj/olLNQ5FdQRmqojUH0FdQ6lpEuUJ51TQZ1DOu1IugDVtFOgQyHpCO0HQR1tog6V91KdV+eP+p031DnlP7wY0FSdRwnqHErXJKTaNQk3tQNDZvdHGsijviQEohhqn14JghMbm6snzVPkGKEtRnvkVRSh8l4q8ur8UV9SAUVO2eMJBU0VhSiyxuDq3qGkiFRTxE01cSGVHEqKSO2K6mKPWcTm6ikoIrQrmmYRKu6lIq/KH+3NJpezU/qjD5y7CH0okoMPF/Zsr5GFJHIoGSLVDHFTiy67gCRySCcXOURon1y/oGdzdWTFAZLIqWu7RXTMpcsv3M7YGLmd8ajfHTxfAuW3bwf0Icor5QHUEN1UgIKpQZWpsalFN1MBCrk0qG0k+haMtzQbqvu9oC1Ge7BUFKHcXuXSxUvyR13JoMgpv5kxoKkijxIUOZQUkWqKuOmnihxKikjtiiybxkCrp6Cox2jP2ooi1ONLRV6zP+q8QZFTIYsITRURqKFpV19TV4/2DppMSc58T5SfpMLYHjVzXivUnhTHWzTIKx/Zo74UBolF6hhDpKGKXkrzSvvR3mdyuTilyfdS0FRaiGKXEaGrJM1DPaoPSHNKoR8JStIYahucVAOQxtY6HJM0UscYIg2V81Iaq+venfwi5/lyccovzwc0leZRQqY59NiubvfLr2+1Q20x9A8GQw7Z7CKtSG0jkcmAIba2KdO7p0grUluMunwUQ6iTl4a8ln7UV7zAkFPhdEVoaohADS0Ycijcex871Az5Bx/1eSwkUaIkTaCI1DaUurL+vDofrTWOR33nCxT1GO10Jo5QCi8dsVzu/clXa3DkVHBEaOqIQPUVHDmUHJFqjripoj/qe2fgKFFy0QBHpLIjtvaeJNngiNQWY+4ItfDSEevl1l+7jtyPHDhyKlxTEJo6IlB9BUcOJUekmiNuqujJUaLcEaltKHIGxVLH1t6TOyK1xWhLk+QRiuGlIxbMrb92IUlHToU8IjR1RKD6Co4cetT3w+BsRKo54qYWXa4EkUYOhe8ZA+XfMwboUX98j2xih9uk1KopolATL0V53fyo32IjmZwKogh9iJJJ+pKCBE8MUtOtz6NBE6GmiZvqc+GiwaFHrcax2pHa59a+rBrN1dOjvhgYghikqGu7h30Udf2F+xEbo/cj9HGL50ug/HWrRU1MxSjHouRrBakRuqkRqUyNTfU5NxWgYGpQ2zjkeHtLOxhEjRi1O9f2B9BFFArjVUZdWTxXwEe9xoYop/QK6qWgmScP4hkVegqeGKl54qYaR/DkUPJEahuH/NoEnthaHSVPTl3b80DiCaXw0hPL5d6tnBLhySm9/oQnQjNPbK+ugieHgidCzRM3teCSCz9qDwtKnhhqG0edVT6vxccoewy5Nn6PPbW324gnVL9LT6yQW7f6ThV4SpQcahBFaiaK7dVXEOVQEEWoieKmFtxFOZREkdrGISUVEoqt1VFKKKeu7VduIgpF8FIUC+XWrb+z5+qU3zYa0MxTCCLXvDhBORQ8EWqeuKnGERY+h5InUts4ZAfhia3VUfIUqGs5F0+ohJeeWC23bltB9nltfnUqnKAIfXjSa6kvlxAlJBSj1A4FUYSaKG6qzwVRDtkkv6b9vOrvIiEsxZIUxgpIapuUOqGIKJTDS1EsmWt8j1dZcLHyORWe+R3U1FQII0csUsqhYIpQM8VNNZJgyqFkyqmr/qQTppyy9IQpUtuktB0SVaiKl6pYOdcAH/0lPVenwquvBvWhSo4v5FSI4qYcCqYINVPcVANpE7OvDbiacMhmFzlFahuHHLYwxNbqyGzDUKDai3REFIripSgWzq1b/dUMcipQ+l4YXE2QmuYUgeosrH4OBVOEmiluasHlWIEph2yWYSpQ+itHGAuUrvgwRmrPqdIuqlAeL1V5Cf2oMwNVTvl9vgFNTYUonlMO6f58q/1ppvxzIaccSjlFap9dub6FIjbXMWG6oShQ7RU6R1O3X7g3sTF6b0J/Sfp8CdRJn2x9KepDlRzRX6q9hug5FbpyUwMqU2NTCy578CPtQTA1Qm3jkLu1bzlGJcu+zr4n6qG9ZVtEoUBepdTNi+hHvQUJUU6dWmWw7xxEkZqJYnubS0upEaSgIIqRmihuqs95SoXgSRRDbeOo7/f2UUIUW6ujkFGJau9kElGospeiWIm3btvtw33nICpRcqxBFKmZKLZXXyGjHDprin+rrpop/2Aw5dCjvynpMBBb+0ZrDeNRfzSHlGJP22TULQ4xhNJ4acjL58d235CGnApXfDdSM0Nsr6EFQw5d9SQOQ6SaIW5q0X3Rc8hm97WibwNxQx7j1J5m26cMhkjthqaKUBUvFYXK2d+ZdHNKpw05RGhmiO1tDn2xcygZItUMcVOL7oYcSoZIbQORPcRqx9bWUTBEaotRK6bkEKrgpSBWytXdY7unyxxyKnyncSM1M8T26ivkkENplSPVDHFTi+6GHHrU90Mhh0hlQ2ytjswycojUFmN2r+iG6ndpiBVy704GhvOQU36vaEAfgrRywJWdRwmGHEqGSDVD3FQjCechh5IhUttIfJVja3WUDJHaYtSESg6h+l0aChWyfjcLQ075H3ou6kNR7daeiTDkUYIhhx7va5XYQ+E8RKoZ4qaauGDIoUd/wdiIvg2kTiF731jlUgz5nhc5RGqLUfsvhlDtLg2xIq5xPerlNAwFSl9DhvMQqQ9DIYkIVGdBkUMpiUg1RdzUostRgvrIIUsALHOktpHUXVIqYmvrSN/cDkWkds1TRyh3l45CSewvGLslSg4cOCL14UjmB1nE9jY2ORN/TVBSxFBNETe16LILUOTQo77zCopI7dN7/P4fWcTW6uhRX0gGRU61gvOYTPe/cKthY/RWg95EeL4E6qR/Rv6lqImoFMVEBSiIGlSJGptq/ny5C1AQNahtILKHbzXM6ujxQQ6J90TNRaEoXmXUfSic/cVigdLfSsATQ3148kVvADVCX/QClESxryaKm1p0mb4ftY8N0gXrtag9o2zVC7toKydMcX/2ILUnkkwodJeOWAzXTj/qG7qQTE75HdYBfTiqvfq8dBjt1VVQ5D096pvYvtX+NEX+QT3DQpFDF3/LxKC2gdSl8+d5abTWMB79PW+D2mJUPoog1LlLQayFW3f+nrd7p/wr9QHNBIUgtev78L9eRpC2P0EQQzVB3FQfDIIcSoJIHSeXgthaHSVBpLYY7UkaMYQ6d2mItXDrz9/ydu+UPmiAZY7Qh6GwzBGovkIOOfTor3kbfTVF/sGgyKFHf83biL6NxAqk0VrDSIrY0xaj8lAMoc5dGmIt3LrTt8phkXMq3PMe1FRRCONZ5FBSRKop4qYaSrhkcMhOIjgTkdoVWYk0mqunx0dZ1HEm6kEqhjhCpbt0xGq4dydfh8CRU+FNfIOaOvIwIY0cevQXvI2+miP/YHDkkH4JDUWEtoFoDFzWsbnPmdz8hyKn5pd1qHiXplgV917lQgamnNJvL7DeEfoQJUfXl2qvroInBikoXdWRap64qT6oc4xLBofS5TepPZe0Tkox/HuJQe0x6tCXXELBuzTEorgG9qhvvYOhRFUK72dTKCI1U8T26isocigpItUUcVOLLkcJFDn0qL/cQi6RyorYWh3ZkolUIrXHmN1tuEfBu1TkRfGjvvQOipzyLyYGNDPkQYIhh5IhUs0QN9XEhSRyKBkitQ1ETplY7NhaHSVDpHZDtRYek+jhF24zbIzeZtBfmT1fAhVuMwzqQ5Ff1w2gBueOAvT4JNnwLe3Ro76n73uiXFvssI76fYV4rVDb4GrZ+rwajzHKy069V4wa//Qc9YDid5VeG2Py7ByVKP+N16Cm8ryzIM+hJC9RMqeQ51SQ59Cj17oj1DY4UfuWOnrSVwlCnvc0l4cKfCnPq/SnOzkxIfOc8oJqQFN3HuVJXwH4NfWV5KVYso5BnlNBnkNJHqltdPp6BthjcyXVVZ//hT1SW5D2FxRkxUS5vPTGkrr6e9JbrvDmlN+qGNDUm0dJ3pxK3px60rcuwptTwZtDyRup3ZssS/DG5prH5I3U7q3WCPGGGnrpjXV29ffkL1N8cOqkd3NfLoOaigthJEeQbw4lb0496ZsE4c2p4M2h5I3UNji9tQtvbO7zKGsq8s2p+WqJ6nppjxV471VOsMg6p/xKckBTeR4lnOkcSvKcSvKcCvIcSvJI7fJEC+SxuU+jpCbkOTWXh7p7Kc9r8yd/F9yDU+Gr+0FN7XmYYM+hJ33pGS4yEyW3+ZB6TgV7DiV7pHZ7cnjDHpubPR0b7JHag4wqXVZMlPJLbSz3e3d1h3K/qEXOOaUvqcCCSWhqjUD1pSPDgulQspYot+ZUsOZQskZqn3DJJlhjcw3tSccGa6S2IHUZKNZQmS+tsXrv3Un9BGtOhT+jPaipthDGz3MOpaWSVFXdo/saSnDEzxX05O8dG6F2RyMpWL6lGLJ4QhGpLUblgShCab5UxPK977JkOxQ55U9kD2hqyKPowYfEcigZItUMcVONJBhyKBkitY1EjiEkEVuro6f2fRYLbFJHy0dDj79wW2RjpLJ+0u+Cny+BCmesQc0UDaDG5ooCFBQNqhSNTS26LAc/0kiCohFqG4nEeMsxLIkOMeqYF0WotVdJ9Oj1+JO+dg2KnEqKSE0VEWiTKMfo19RXUsRQTRE3tegyvVDkUFJEahuJTD4UsbU6etLbCe+Jml7+PaKuXppi7d17lRMyTCVK5vilqKkpDxOSyaFkilQzxU01FF/v0kj8jDSobSR20TBaq6Ow3g1qi1FHjCQTSuilIpbZrbtzneI+L/UenQrfSw5qqsjDBEUOJUWkmiJuqqEERQ6lZCK1jURv3yCb2Fw9JUektiB1PIsjlMtLR15SP+kFAdLIqfCU/KCmjkKY2vn9eMCC51ByRKo54qaaueDIoeSI1O5IDlk4YnP1lByR2oJULoojVMVLR145P+ktFDhyKjwsNaipoxDGHTmUHJFqjripZi44cig5IrU7qpt4n1ffY6DV05PfwQ3U/KyEEnipimVy77UuSLjkOXXSu/Q4K5GaqiJQnYUlz6GkilRTxU0tep0N9pHg+sGhpIrUrqpSgarYXD2ldCK1BSndkk4oeJeOWBS37vRvFCKdnNLfHUARoakiAtVXUORQUkSqKeKmFt0VOZQUkdpGole8WPHYXD0lRaS2IHWdKIpQ8C4VsShu3en9Hyhyyu+qD2jbp7oFsh96X1KI4Mf7edLXcX6rUM2Pf9B/FDh2sMaqPwp9reDbKPR9idDjHT3p+zlxCU5qdzxuV4geVLtLPayIa5ef9C2b0OOU/rYTGURo26e73/rX+wOovvQHmbhmYJSCnvQ9nDCUKMmX74kK0lKoWpT2owvWSIVjD9LY2ne6smaPAWlOtV/SHd09/cJNiI3RmxD60MDzJVDubkAzdwOoEbq7AD1d5BzxLe3QU3sx3j5Z3xPllxepQ30l3muFiu5CjPb3Uj7VJaj8ijoU0au0ewqF9tVK3kFxHXq5jE1TUR45iHIoJNnoq5w/aVZDlMfyJAvQk659EMVQ2+BkNt6qte9OSaApxiiq/fFdMYVqfWnKK/onf5nfE6lmipumpgi0PZVBf72MwAWllPJQKaWcCinl0FNIKVLZFFtrp0NKBajWChGFGnkpinV0dfrUXg+4Hx5YDZ066R0uZBmpD3dyYvlS7dWXX2uMIAU96esFsRqyKx45yChuqg8GTw496TvxkFGktoHIJRMyiq3V0aNOxntRW4w6MYohVMhLQ6yiq7snfzfck1NX/ZvfMERqZojt1Vcw5FAyRKoZ4qYWXQ6SH7WLBSVDDLUNRNIfhthaMZIhUnuM0iyKUGUvFbESr/6e2mvmmEROnfxn7U+kZorYXn0FRQ4lRaSaIm5q0V2RQ0kRqW0gcgMFithaHT3pMwxIIlJbjGkSoS5eGmLt3LrTX2timUtUHRi7RyQRqZkhtldfwZBDyRCpZoibWnQ35FAyRGobiN3jG8OsjpKhHqOtgpJEqIuXilg7t/70ZV5Q5NRJjxsoIjVTxPbqKyhy6Km9524/GnAmItUUcVOL7oocSopIbQORGEgitlZHT/pWLSQRqS1G+8ZEFKE2Xipi/dz7k72CokR5FpGaKWJ79RUUOZQUkWqKuKlFl4HgVORQUkRqG0itUfvhAUVsrY6SIlK7orpdKopQCS8VebX81F4lx1ORU+FMRGhmiO01tGDIoWSIVDPETS26G3IoGSK1DURKHxhia3X0pJOBJCK1xai18iDoere+/bAzevtB/4Lzc6bqOv/jTFRUNlTtNTQzlCA3VNQwVJtadDWUIDdU1DaQOvw/cqhaqyM3VNQWo/ZDDKHOXaTQ9c5r4Se98w1DidJVrqgPQ3of4EsBNbagKPRlZ6IK1RT5B60mqs/VLjzpe+5eE9W+KKIp789sv1eobVLqoBZTKHSXprwYfrIXwF3vnNJvnV8K+hClDiDKo1z1S5OvifLLuqKaKQ8fTDlk0wtTpLahtPM9HbG5dHtxdAzSrilEEkrhpSQvl5/0tXVIJ6fsHXAFTSV5lCTJqSSJVJPETTV1QZJDSRKpXZKelGqk1ZNffBe1BZlLQp27lMRauPXXnufZDx1Ickp/vodMIjSVRKD6SpKcSqclUk0SN1X4IMmhJInULsnPS2yunvza7jgf7TspySRUuktJrIZbf/auvuudU/7bvKKmlkKYsN45lSyRapa4qcYSLDmULJHaLdX5hOsdm6undPVAag8yvcBDtbu0xIq49acvMEQqOaVfQiGVCE0lEai+Uio59aQvPfxWnTVJ/sEgySE7n+CkRGobipb1b9VcAzHTuHDoQdp39JJKqHeXklgTt/70+xdIckq/hIckQlNJBKqvJMmpdFIi1SRxU4UPkhyy+YUkUttQ9IeKkMTm6slMQxKpLUj7KkEkoeJdSmJVXP096TstISlQslRDEqGpJALVV5LkVJJEqknipgofJDmUJJHaJVWhw+WOzdVTunIg9XNJKHqXklgYt/7s1ZfXO6du+voBWCI1tUSgOkuWnEonJVLNEjdV+GDJoWSJ1G5JbwvVSKundOnQg7TflxxT6fQLdx02Ru866Bs7n6+B8l+5FjWzFMIES4EKlgZVlsammju3FKBgaVC7JbsKH83VU7h0GNQWpBWOYgml8SqXTqF81neiwpJTehX4UtBUkkdJkpwKlw5jj5ok/2CQ5FCSRGqXJEv7W420JIWz0tjFLUi7vSeSUBsvJXn9/GSvkL2enPJSaUBTSR4lSXIqSSLVJHFTTV2Q5JCdUF5rvPv86jey1Vw9men3orYg7UpLJKF0Xkpied3605fWIpOc8tcSFDW15GGSJaee9Nea36qzZsk/GCw5ZCcUWCK1DUVuViKT2NomTX8cAUmkdkkVRCShNl5KCvWzvT/2enIqXDoM6kOS32gdQA2urdX7xdPX1FdyxD1qjripRZdLsx8xus4vHDHUPr+eSWyunp7057KQRGoL0n6IJJJQ9C4lsTDu/UmRjUxyqn0ZvM8uzkmEPhzp9H8poPpKicQwRaXljlSTxE31wZBIDtnpBJJIbUPRl2Egk9hcPaXljtRuun4iIZJQ9C4lsTBu/dmLfq8np/xG+ICmkjxKkuRUkkSqSeKmGkqQ5FA6J5GaSGJz9ZQkkdolzW4MnVD0LiWxMG796W+KkUmJklUAqUTqw1JY7ghUZ5pvWO4cSssdqSaJm1p0X+4cSqckUttI9HBEJrG5ekqSSO2Sak8kk1D0LiWxMG796RuKIckpv3s3oA9HOv1Y7jxKyiSnkiRSTRI31VBCJjlk84vljtQ+v1bNjubqKZ2TepA6g4gjlLxLRyyLW3f2Subryal0cUdqKolAdZYkOZWWO1JNEjdV+CDJoSSJ1C7Ji1k2V0+2ZuLCgdQWZFonnX/hlsPG6C0HfQf08zVQejp9KWgmKUQJkgIVMmlQJWlsqqlzSQEKkga1S7JidjRXT7Zmvh/noz0QcEylM+rmVSptjEmS/IYkp/zqbkBTSR4lSXIqSSLVJHFTTV2Q5FCSRGqXVEvV5y3WMdLqKSx3g9qD1JyKJFTXS0mhAm+PQO17BUlOtRL68xJ8QB+S6ky5t39JQfS89TVBYbEbXTVFvotBkUN4cG88rLfv6GvtwzaQKkL31rdqLUN2EY80Yk+7oVowxRDq3aUh1sTV35PuMww55TfuBjQz5EGCIYeSIVLNEDfVQIIhh5IhUttA5AIWhthaHSVDpLYY7Wk3MYRid2mIBXH199SecNqPGxhyyv+MQ1EzRSFKVXd7V0gih5IiUk0RN9VIgiKHkiJS+/QeUwyK2FodhQuGQf1cEUrdpSKWw60/e/P89ezUSX+dhysGUjNFbK++QhY5lBSRaoq4qUWXpfZH7WJBNr1Y5xhqG8il1igudGyuIOYZCx2pLUjtiGQRCt2lIhbD1d3Tk6y+yCKn9I0qMERoZojt1VUw5FC6WCDVDHFTi14Ts08uDDlkkwtDpLaB1GmegthaHaULOlJbjPY9gRhClbs0xEq49ad/zwCGEiVLFBSRmilie/UVFDmUFJFqiripRXdFDiVFpLaBeA6xtTpKikhtMdrj2aIINe5SEevg1p/9cYDr2anwM65BzRR5lKDIoaSIVFPETTWScCpyKCkitQ3Er7jZWh2lK25SP1eECnepiFVw609/roAscursP1od1EyRRwmKHEqnIlJNETfVSIIih5IiUttA9EXDuFxgc/WUruhI/dTR5RfuL2yMlq76tyqer5GSJeClqImjEMUdBSg4GlQ5Gptq5txRgIKjQe2O5Mz8VuOsnuya472onztCkbzKowsL6dbfk9RycOTUWb8ZhSNSM0dsr76CI4fCUje6ao78g8GRQ8kRqd2RnHXhiM01jnA6GtQWZPoF3wUV7tIRq+DW35OswHDk1OlO/5wHJBGbSWJ7dRYkOZQkkWqSuKlFt0uGsYsFJUkMtUuqr30+L+tCkCSpB2lfEByvGS4ocpeSWAjXTmP6Jb9hyTG/UTegmSMPEhw5lByRao64qY3EHTmUHJHaHUkQJBKbq6dw0TCoPciogUURSuGlIi+XoUhufEBRwE5yfCGPSM0csb3GFhw5lByRao64qUWX6f1Ru1hQcsRQ+/RaeTTGWUGSo0OQWjFFEqrcpSRWwtUfJFXEPb0hyTG/sBvQzJEHCY4cSo5INUfc1EbijhxKjkhtA2k/q+dax+bqKTkitYuu84c4QqG7dMRiuPqDI0kROHLM7zIM6MOR/gTsS4oSJHlXetfjW0Vqjvxz4aLBIS01Xit4zYk/fTkGW5D+WUBc3LG7bUamjyNdUO0uPbEiru7gSY5BeHIseCI09USgdSZp+zV1FTwxUvPETS24jAPrnUM6u/BEaJ/du3E6YSqxuTpS1zDkUHMt+YSSd+mJZXF1Ck+yFMNTwuQKAycmUlNRBFpvLsqhIIpQE8VNLbiLCpCeh2HKqTbL9OWQOocvQtuUnKu6EVMofJemWBy34d3dSbUKUwlzU6Smpgi03tyUQ8EUoWaKm1pwN+WQTi9EEdqnVw5bXOWxuXWktuHIqWb7aOr6CzcfNkZuPiCnyv3ndUTEzNSgZqYG0MZopgLkpgZUpsamFtxMJUhn+fUaqDbLnzkVIJX+XpG2KWkvMhVTKJVXOXX1chqm6vqEphIm1xwv1xFsaiqEcVMOBVOEmilu+qkph/T+P0QR2sbhP7obza0jPbHDEYMU1WyLKVTCS1OsliseXgou59Dn6zVhborU1BSB1pubciiYItRMcVML7jkVIJ1lqHKqzTJzyqGQU4S2KTlXYSqmUDUvTXllDVOyrsGUY15FDWgqyqP4FfqIUhMeRDFSE8VN9Tm/Qk/Ba/p2BfDESPvsyvH4Vs2tIz2zI6UYpKgmW0ShKF6KYuFc8SBK9h2iAqbv3MTiR2pqikDrzVPKoWCKUDPFTS24p5RDYfEjtI1DX0oLU2yujkIuEdpitAkVRaiJl4pYN1d3UCTTBkUBa2/82A9CKCI1VUSg9SZ9fa0oBQVFjNQUcVN9LiSTQ0ERoW0c+qYjKGJzdRQUEdoVVUKKIpTDS0Usmas7KKqIvIQIWFjvSE0VEWi9uSKHgiJCTRE3teCeRQ4FRYR2RXI9BUVsro6CIkK7ohqkKEI9vFTkNTMUyciQRQGT1RBJROjDkD9bMYAamyYskohRCgqGHMJuS43zPcXSsf1IULDGDrex6W0YWGNz7fRFKZylSG1BKg3EGqripTVWztUdhm/17tUx3SlYIzS1RqB1VofcnsOw5lCw5lC0FjA5ImHNoWCN0G5NDg9YY3ONLFkjtQcZd6bEGurkpTWvpTF8r30D1h4o4BmL1Ic2v0F7JVCDC8nmUNBGqC2H3NSCuyKHgiJC2zj09WZQxObqKCyHhLYYbUKPim6/cHtiY+z2RPtd2ecZK2Dn1u+nokHNFA2gBueKEnSnXzZ8uw6sJI1NLbxJCtDNX2I4qG0osvC/Vd/V0U3vk74XtZue5NENtfEqjzbGJOnXtc/XgPlVxYA+HPk5awA1tuDI9+isRw0UkWqKuKlFv2sl5n4k/ahPHjBZhF8L2wajewlNsbM6D+2dwROxPUodMJJNKIqXolg4H3a7IjKbHAu/2LuRmpoi0HqTKfp6HVEKSqYYqpnipvrgKZmKmOwGTBHb59hOTKP50JmbOkSp2whiCrXx0pTXzxid7BdSyrFkitSHKT81hTB6tMIUoxzmQO5qIamINVXc1D4pBx1SyqG07pHahiIxkFBsrY7Sukdqd11BxBIK46UlFs/VHyzZZd/NMf9V2IA+JNVu7Un55TraW19yGMOR94QdkisaOIqYlD7fIyb7BW8plj6vhQQjtk+6HMgwx+YandnHSkhqDzLNL9TLS3Osqau/053+JTjkV8TkfPtS2MxdCOPuApTcRczdBczdBeguuCO2T7tEgTs211wmd6T2IDWFknUopJfuWGxXf3An8wl3AZNpgjlCM3Nsb31JT8i6AN2173r2DEbWEWsrIze18DK/yDCHbH6RYKT2+ZV9hCQ2V0/hR82D2oK0v0YhklA2LyWxtK7+IEnGBkkBq2NjnzhIIvQhSaNgbSTQOpMZgCWH0pUGqSaJm1r0dKURMdkNeCK2e5JLCHhi86EzwbASEtuitOsCEYVKeSmK1XTvsD2KzWvCgHk2EZqKItA6kxmCKIeSKFJNFDe16Hf6qBnyKWJykoQoYhNRbD50JlMCUcR+LgoF81IUi+reYXuUlKICprd4kVKkpqYItN7clEPJFKlmipta9JRSEZPdgCliuylZY5BSbD505ilFbI9SF3HHlLr/hZsWG2P1cPtp+6epgOm59+U6oJmoAbTRyQx9rSgFBVEjVIkam+qDWMZrcvah/EjxgVlKjWhZ1Gg+dGYpNbCfi0LVvEqpe1bWvUP7O5zXgOnrjiCKsT5EyVH4pdpbX+6JQRoUriRGX01U+KTsAzQ5FK4kBrWNRG/jvKUg4UriEKT9lT/JJhTMS0ksqvuc6Ledz9d7x/z9KwP6kORXEgNonbkl7wpVllXCI1azFD7plhxKlkjtlmQ1gyU210BCKTyoLUj7hYpYQsG8tMSiuvo73bWXZnPNC5gkOFKJ0IclmSCkEttbXy4pQCmViDVJ3NTCyz4glRxKkkjtkiQIJLG5egpPsQ1qCzK9KL9HbbyUxPq5+oMk2S2kUsD8Tu2gZpZCFLcUoGSJWLPETW0sMhJYcihZIrWNRG8CwBKbq6dkidRuqc6QkkqogpeWWClXf7Akt0xgKWBWOg1oJikEcUkBSpKINUnc1IbikhxKkkjtkmSgkMTm6ilJIrUFad+qiCTUyktJXk9DUmnnehcwv/d3T+rDUjgtEajR+Q3aEaVB6bTEWE0TN7VPuiaHkiZSuyY5lKCJzdVTOi2R2oK0gYom1MBLTayTqz9okgtT5FLAvGga1IcmmSGcl0IUmQFcigcoJROxZomb2lhkH7DiOZQskdot+cUDm6undIlHagsyTyYUwEtLLJKrP1iS6wJYSljdBd5TDlcPpD4shWQi0HpzTQFKyUSsaeKmFt41OZQ0kdo1SRAkE5urp5RMpLYg01/43aP6XWpihVz9ne7sjw9ft1BS/oa6ltCHJRkbcontrS+XFKBwyzzFutPi4HvsUvYL+eVdJnGkttFp5Q9xbG6Ds/vu74Xt5mr0x2Xw4RfuSGyMKIE5OYk+XzNWHX9m2MAm7kZ7G54E+Zr78q+qUqzgLmHmLkDB3aB2dzJHb3m/9fh+L2x3VyusuENBvsq6By/a4a4ifl5pBExr95frgGbmQl9uLkB37dfd+w59q75qaRzdtwPDLcXwcvn7WuF3TePXK3vnsBSC6I0dSCK1SxoxxBEq6aUjr7bhyK4GHwLmhdWgPiT5CWwAbRrdkveFv1c6xkhJpJokbmrRXVKA7vTPM0MSsW0oohCS2Np6at9l7LsISaS2GHVNIJJQSS8lebUNSXYt+BAwvxYc1IckmaAv19HexqbfUWIRDH3d3WqQtESsWeKmHl8WhR85vr5kEJoYbBuMHCPQxNbelciEJlJbjGZRPKFKXnpiJd36u7uX3cLJKmDBE6mZJ7a3zjyXHEq5RKpZ4qYWXQ4VSApQyiVi20hkaYEktrae7tpFOZOJ2M8toUxeWmIpfehQpg6WHNN1EaclQjNJbG99hWQK1J3+ghXnJWJNEzf1+J5MgbrTvy2LZCK2T/FxwYUntvauPJlI7TFqiZJkQpm81MRSuvV3py/rhaaA6UUNPJGaeWJ760yOCKx5DqVkItUscVOL7skUoJRMxLaR1PzuWQJJbG09pWQi9nNLKJOXllhKHzqUJIclx/RLNkgiNJPE9tZXSKZApTMTsaaJm3p8T6ZA3enfckUyEdsGI2kCT2ztXQmFMxOpLUY7qCWZUCYvNbGUbv3d+V9bfXAsaCI008T21pfnkkMpl0g1SdzUonsuBSjlErFtJHLtAkdsbT2lXCL2c0konJeSUnHtf231IWFymCKZSH1YCtfiBNrwXFOA7vRvi+LMRKx54qYW3j0FyKYYuURsG4tkCTyxtfVkspFMxLYg028MH3/hnsTG2D0J/1OeCfPLvEF9eJIp+nId7W10vuglSv968LeKVZrSB2UfftTn2j7o41+vRe0TLFe9b9Xcg8gJ7L2oPUjl5HHJe0T5u8qmjXFLcoQ/XxPma96gZpZCZ8FSoMKpaXTWNIVP6u804SlQ4dQ0sG0wdptotDZP+qs6eGJXW4zpO6weUQEvPbFKbv3d+V/z3EKpzuCJ1MwT21tnckh8vYauwrlpUM1SiO7JFCBbrpBNxLaR6LKBbGJzG4itnNBE7OeaUAEvNbFK7h3qAxlIJ8fOrabeL1NfivrQ5CenEKZ9m7ZHgSfv6xROTgNrosInXVSAbIohitg2Fn3gCqLY3OdN7zdBFLFd93TdQxG8FMVCuXeo39xClGN+Q29AH55kinBy8iBBU4DCuYlUs8RNbSSyC1jzAhTOTaR2SX5uYnPrSe/owxEpCSLnJlTAS0esklt/d/53Vx8dC44IzRyxvfUVTk2BCpJINUnc1MPL1SgsJUqu5JBKpGSCP4vb0dy6uvM/vDqwPcq4jSGWUAEvLbFKPvRXubnvFjIpYLpgY8kjNdPE9taZn5kCFL7AGH01TeGTnksBSqcmYvsE+wUEm9tI9NfeSCZSW5BKSLGEAnhpiUVy6+7O//LqY8BEJSQRmklie+vLJQUoSSLWJHFTC++SApQkEdslyU7itMTm1pV/zTSoPcgslVAALyWxSG7d3elPkZFKAdNf+cESqZkltrfOwooXqLDikWqWuKmH9xUvUHePkixY8ogdZ5grHlt7V7JsIpVIbTFaVSC5hPp3qYk1cuvvzv/26mPAgiZSM01sb53JcYprPIfStTipZombWnTPpQClXCK2S5IoyCU2t67sQhGaiP1U09Mv3IDYGK2F7vzPrybMv8IY1IcmvxYfQBueeUrQnf6t0W/XgZWosamFlyn+UZ9rkF/ljVC7J8mTtxTk1krXPefei9qCtHf8HLPpCfXvKps2xjXJbj1fE6a/x3wp6kOTzNCXam8z5Ite6it80zSwpikMpq01++TBU6DCN00D2+d4nFc+V73R2oci0wZP7GqPUQekeEIBvPTEIrn1d+d/3fMpYMETqZkntrfOauf3Gfh6DV2FVW9QzVKILocKJAUorHoD20ai1RCyKUXx720H9nNNKH+Xmlgit5m78z/x+RQwvZ2EdCI108T21llIp0CFG3qjsyYqfDKkU6DCDb0Rf59jS6cQxG/oHWK0RwkknVACLz2xTG5Td+d/6PMpYPrLWXgiNfPE9taZp5NDKZ1INUvc1KJ7OgUopROxbSR62kE6sbl1FS4iBrZHmdVNTyikl5pYbPcO/Y99bqHkJHavT4xBE6kPTeEigkDrzT0FKNzQG501UeGTLipANsWvx7HIFxTwlIL4/byB7Z6qOpB0QhG89MRCuc3cnb5aDVcREZN6A6KITUURaN25qAAlUcSaKG5q4V1UgJIoYttYzlLMwxSbW1eWl7iOILabqn0RU6iXl6ZCTX2n75iDqYDpb7ohitSHqNqv/RIB13tsb6MLJ6hA6TfKuCon1TxxUw9fhzEv9wJ1p39IExlFbBdl5ye29q78co/UFmP6MMATSuGlJpbLrb87/Rsg0BSwoInUTBPbW2eeTg6l8xOpZombWnQ5UnC5FyDLA0gito1E79chm9jcurKcRDYR+7kmlMJLTSyXe4f+1yWfAiZLAZKJ0MwS21tfIZkCFZKJVNPETT28J1Og7p7kp1TwRGwbi6zv0MTW3pUnE6ktRrsWPKx5t7v1rYidkcuD0539fcmIqaWCsqVq72M7riZfE+S5VNSQVJtadM2lCHkuFbaNxJ6iqebWledSYT+3hDp4kUu3O9bKvUP7C5MJsycxCppZCn1ZLlWUtkeWS0U1TSm85lJ9sIXH3xw5HiyvhW1j0Vyq1hakJct+DnwvardUR4zkEqrlpaVQUeO1vsedfr7dORYsEZpZYnsf27En5JJDKZdINUnc1KLXzHxcPKToeKpB1io4YqxtJPoVxVs1t65SLvUorTwRSyiVl5ZCOY2XaBznDpYCps8+vRT1oUl/T/GlgDa8kE2hM78PEYPhbTfHXf8eMbs3ESm/N1HYNkI5BmAv7HhIMVJbjDZ6kYcKeikvVNl4YPc4A5AXsCCP1FQegS7v2BeSzKGUZE6dkC3HYFAXMIF+RCglHmNtw9MXokAdm9vgUuIR+7k7VNVLd6HyPunLoeEuYPatR1FTdyFMO/T2NQzyApUSL2Ap8QIWEi9QKfGI7RN/PFBgj63NXkg8UluM9psGSTxU0Et5rLJbf/ix1nG3IM8x3SssmoSm7gi0zmSVgzqHUt45FfMuYJ53AUp5R2wbnn6tCnNsboNLeUfs5+pQVS/VsfJuHZ7sD+3d7gJmP9As6sNdOxPvGYUTXgrj8gIVLh9JtSsTbmqDCSnm1KXdc9h3FVcmpLaxyC7CE1tbTyiNjkc8Lh8da08kS6KhuF7aYgHeu20/d9/3HYkWsGCL1NQWgdabzAQyzaGUaaSaLG5q0T2rApSyitg2FP3aDrbY3LpKWUVsj1IXfeIJ5fXSE0vw1uHJ/oDb7S5gwROpD08yR0gqtrfOwsnMqbNe9XyrWM2Tf/AUkipQlhDIKsdaQuyHL3Q5dNYLWeQWqW1apqev0y/c5tgYvc1x0hXh+ZYwtzWoD1u+Bg7gp7oS5WvgoErX2NTDyzXwjzwWq85GLEmIT0+juXVlzt9TX835MblOv3C/Y2NclyxM0OWYV9IDmuTWaG9D9NxKVJDlO4Q1QdR8T/sd8i11eWo/aPk8iw1sT5Lj6ektdyVHAfxxv7cY7c8IiDnU4Ktl8cQ6vc3mSf8cF8wFTN8O8FLUTF2IIgfJ1wpSexTOXmmHTvp3tGAu9CirNTIvQOGMNrBtdPpmMJhLUez3GYX9XB0q8KU6Vuk1UTh45QtUqAtYnUj3gxLmCM3Msb31FZIuUCHpAnXSv7kDdQHzk1yiUtIx2D7rlnRs7aPzpCO1xajDVnIO5fdSHEv01t1Jv+OHuIC5OEIzcWxvfdW+7/aRcg6llHMKp2S5XQpvAfOUC1BKOWLb6PTHKkg5NrfBhYvIgf1UHErvpTiW562/kz6CBHEB07oSKUdqZo7trbOQcoGyX1VXX+2iJHzQNQXIfgZa0beR6LvCYCkFkWUKpzRSW5CWDJJeqLKXlliJt4k76XM8sBQwTy9CM0lsb315egXIH1CoHWqSwiddUoBSLhHbLcn8wxKb20j07j8skdqC1EBFEkrspSQvw7GYyJUXJDmmryRBJhGaSWJ7G1rIpEDpDn2rvpqk8MFwogrUKeQSsW0scjhCElv7SPxERWqXVKbFEkrrpSWW362/kz5eCkuOBUuEZpbY3vqqI4xnKofSmYpUk8RNLbpnUoBSJhHbRqLv4IIkNreu0lmJ2M8toaReWmLZ3To8tapgnztYCpi+kgTJRGqmie2tM9cUoJBLpJombmrRXVOAQiaR2gaitQossbn1pD+6xnpHagvSziHHVDr/wh2NjbESWTt8vgWsvYjm82p9QBNHo72NzRe8RPmzCbVHZSl90le8RPmzCRV/G4wcSW/V2odiK97oaovRfkslmlA1r3LpzMq69XfS3zpCk2NBE6GZJra3vmQCvqaewoo39qdJCtEtlcbn2i6EFW9g20j0BXuQFLoKK97Afm4JdfTSUqi1TyoAlgJmjyYUNdMUooRsCpTXvmOPmqfwwZBMgQp17oi/jUWOJXgKQfTrvveidk2jVpZcQjG8tMSCuR1cp/aow+d56RwwrfVeboOaWQpRZAKQTA6lZCLVJHFTG4onU4BSMhHbRqI3iCCJza2rlEzEfmoJBfLSUiiiT/q8BHIpYPqWC1giNbPE9ja4kEuBCrkUqHDzduxS71IKjR+1441K+cU+t/HJAQB1bG1BQn6R2mLU95OSXyiHl+ZYMrfuTjqbMBewYI7UzBzbW2eeXw6l/HIKNy7ltwnf437LlMNbiJVyjtg2Oq1NII7NbXAp54j91BxK5KU5ltGtP/tGAeYc0+tcpByhmTi2t770IMHKGKiQcoEKt25TsHBKi8HE8Gvt2a5unI72kwfMhSAh5UhtMaqqlpRD2bwUx9K6TeZJv1CEOMeCOEIzcWxvfXnGOZQyzql06zbstn5/hYwLsVLGEdu1SXLDG5vb4FLGEfupOFTSS3Gstlt/Jz1QIC5geosbKUfqw5z6/1JA683VMUqDTvoXE79VrHY1Ej4peQNPAUqeiG1j0dMCPLH5sJN1T2lPQ1wzEtuitPeMSIahml6KYsV96LBOk7xodKx1u0PwROjDk0wRNLG99RWWxkDpi0WgiVTTxE09vF95BErfLYFV0Kn2jT0XQ4fCrzRGqG1WWn4fXV1+4Z7Gxtg9jVZ+f7oKmLsa0MTVaO+TaTmVKH0i8NttUOVqbOrhzVWi3FWg3FWAzvrAxHvt6e5qnPxEFcrvVVpdQol+0idlnm8BC6oYa6aK7X0uXVWgTvqNA1wRa664qcd3V4E66V8Dfa34xxn+zKjRe+tKhcOSd9WEiyzU4EtZoU4/6S/CIcuxIIvQTBbb2wh9DQxdnUJeMVZzxU09vLsKlE4zVDnVppnGHEJRKEs/lBE7ahdXqLGXrliHtwGe7G8w3i6OtdvJ+76/FDRz5UEwNrm2+lph2i75CWvsUZMV4vt1+/hgDy+3ZCHLYwVZDmFAdnUxYm3zUgePyEJZvZTF0rvt+knvNSGxAqbPhcEWqZkttrfOQmYFKsgi1WRxUw9fk7MfUj9qJxt10r/EBlsMto2lCiTmFFsPQeSXH8gpx5pysYVSemmL5fahW9k72ApYsEVqZovtrbNgK1D+xdbYo2YrfDCkVqBO+hA8bDnWJprSHLKCB85IbdNSq6TIQvm8lMUSu83f6SZnfcgKWJBFaiaL7a2zICtQIbVINVnc1MN7agUqyXIsyHIIdx+lS9gidkxTsYWaeWmLdXUb4Ul3C7YCFmyRmtlie+ss2ApUsEWq2eKmHl6mDgthoPRNi8gsUttQ5OB9q9bWkxmHJQYprE2tyELhvJTF4rri4eCQMy5kBSzIIjWTxfbWmUwErjACdNKH/nDtTqzJ4qYWvpYdnrQCdNK/vwZZxLIstrae9Pt2uCK1xagdEUmoq5eSvPaGJLtvcQlYkERqJontbWwhowIVMopUk8RNPbxnVKAsG2DJsZYNPFk5hF+hy/sDYIvYNi91/XG0df2FOxcbY3cu9Ivt51vEZCJeiprYSlHcVqLc1qDK1tj0U1uJ8vVvUNtQZKBvNdDWk75o7j1RTbi4QuW8yqyrV9c4NuwyMGIyBLhisJkrtrchBleB8nJ49NVine5lMf1eu9QwvzTMwWR8rxVsG5/MEQSG/Q4CnZoLRB29FMhauw3wpH8OD8mWMBkgBJKaCWR76ywIDFS4+TQ6a8FO+vUhDIZowWCgTvdSvcMgsWyQrW2PgkGn5gZRgy8Npjpd/wYbDAZMjkEIJDQTyPY2wnCTY4RpWFguGawtl9zUPhhkBSosl6S2sdTVw+dJLe1iuLsxsC1IrQ6yUKK2Xlry+hsLpV2CXAOm90CgidRME9v7NNbe71PwtaI0KlhirGaJm9oHg6VAnfRra6QUsW0sct2MRZGtrStVjbMaqWMMsYRqemmJFXfr7qR/4g255Jh/ETmgmSQPYj8QgaRABUmkmiRuakMJkgKl79OEI6faksWMcih8wTVCbbNSWSmqUEovVbHcbuM72R+eu10dC6oIzVSxvfXl6RQgv/009qeZCh+smdln90caB36WIzsBU4y1jUSWd2QTW9s4vOwa1BajfectjlBILx15sY2dlssGpJNjwRGhmSO2t7GFa4tABUmkmiRu6uFlJLAUqJBOToV0cijcIhwd/twVCumlKxbbbYAnfQcXXDnm35UMaObKg9ifyko9oWiXS7JvhTVXIbwnVIDCfYzDUDyhQpCQUKS26Zh+qX9F/byUxBr7IEnOmpDkWEgoQjNJbG99hYQKVHh+buxRsxQ+GU5QgTrpXwfDukdsG4xrYmsbiqYlriKcaml5XP1uv3AfY2PsPob+ia7nW8Bc1oAmskZ7G6HLSpSXxoMqV2NTD2+rX6J0ml/TeNs0f15MpFDhm+KBbdNSJ0NxhZJ5lVg3L6txprLL84D56jegmavQV3AVqOCKVHPFTT935ZT9xAWuSG1DkSX0rVpbT/rC6/dENd+iCrXxUpXXz3izgtyORFo5FlQRmqliexthqHdDX+EXGINqrkJ8XwPHB/te6K9JIIvBtsHUDVhmFFtbkCDLqbksFNhLWSzCW68nrV8gy7Egi9BMFttbXyGvAhXeUjj2qMkKnwyyAqXzDFdOtXmmMofCJeAItWuvJJXMQom8lMUyuk3gSattyHIsyCI0k8X21leQFahwK3DsUZMVPhlkBerkP24a8Wtng60QSycPqyGpbV7qxzQiC6X0UpaX21gGS/9+DEGWY0EWoZksttf4w62K0BV+MCQXY99qj5qsFN8vLwIVfjQ4dmMbjMwHzlkpiBqHJseacbGFqnppK1Tep0e7cL85FmwRmtlie7OVTloRc13Emi5uah2E3ArUSf+SGFZCYtto/KzF1taVJSh0OTbXhcJ6qSsU3yf781q3m2NBF6GZLra3IYaVMFAn/XIByUWs2eKmHt+TK1FyfEIWqV2WJxebW1fJlmNzW6idl7ZYX/du7a833W6OBVuEZrbY3voKtgKlVz2QRarJ4qYe3mUFSk81kEVqG4qUMlgI2dp6Omm1hsxybO4KBfTSlRfZeEhNVh2cthwLrgjNXLG9DTG4ClRwRaq54qYe3l0Fyn49BlnEtrFIEMhia+sqyXJsKuv+F+5gbIzdwdAi9PkWMJc1oIms0d6G6LIS5bIGVbLGph5e5vlHGgmOTjkrvSaszfPn1XvqMfxsZmDbvFQeHC8x7lGHrzJrY1yWDBGyHAuyCM1ksb3PZt1/2Wfga+rKar9vRTVZKbyMBLICFX4+PbCYWaO1jcSMv6e+mnGRhRp6KcvrbBxockKFrIDpL09fiprZClFCagUqpFagTvqXqL7XLrVp9UvENLyT/ZWnCnZMEeZZ2CM9GUIgqS1GewW4qEPFvVQXqvKT/5Wn+4D5jwkHNVMXogR1gQrqAnXSP3wEdQEL6gKls46FktQ+67KOvlVzO0rsLiTc9SjTJRKF9VIdi+9Df7JbyLqA+Y8wBjVTF6IEdYEK6ki1NZKb2liCpkCd9Q/0wBOxbSyy0EITW1tX6hqWSO2up5pQWC81efGNV7DK6QWaAiaXuVgbCc0ssb2NLVgKVLBEqlniph5eJhhnskCd9S/xwBKxbImtratgidRuqeZU1kHU00tLXnPDkp/CAhbWQVIzTWxvgwuaAhU0kWqauKmHd02BOusf3YEmYlkTW1tXQROpXVPtiWhCIb3U5MU2NMnX6EimgAVNpGaa2N4GFzQFKmgi1TRxUw9fk7NfECCbAnXWv9ECTcSyJra2roImUrumOvZFE2ropSavs6FJljNoCphAWPMIzSyxvY0tWApUsESqWeKmHt4tBSr8PPAwljqp8NovBAmWSO2W6qaWWELxvLTkBTbesm3fPd475l/pD2hmyYOEm+4jSpvsYImxmiVuah8M1w+BSlfoxLax1EmFltjautKSAdcPTk1LrIdfuHmxMVoPn/2PygTMXQ1o4mq0txF6RiXKXQ2qXI1NPbxlVKJ0ml9vgWrT/GksQHb7+71C7Xk1eQHGA6r0VVptjKuSbH++BSyoYqyZKrb3uZRD9mvqKnyjH3YIP+qWYN9jME+1FCzo890P+hzCfskBA3/Ejll7XBYfUDgv/bG4bnN61l/0wZ9jwR+hmT+2t75CqgUqfBcZ9ggTVWeIPR0gMEQLAgMVniEZwY6zzswLQfQogDmn2lEgAlE9LwWywm6Teta/tQOBAfPCeFAzgyFKMBiosFiSaoslN7WxBFmBOrffZu46sFoS28YiNwreqrV15Zcfxxiz7/wfUD4vNbHEbv2d/Q8CbaFkOfU33A1oZsmDhMuPEaXtUbAUYp39pZIpWDAXg9W1N80Ry2nG1r7fsnAjzUhtMaZ/9+IBJfXSHMvu1t/Z/x7QFkrM2R+9frkNaqYuRAkJFqigjlRLMG5qYwmaAqW5gfwitc+wnPGRYGyuruxGEDSR2oK0q3FZB1FSLzWx7K7+cH0vBRbWwYSN65/9AIQlQjNLbG99BUuBCpZINUvc1MPLJcCP2slGBUuMtVuS0yMssbkFCd90DWyLUrkmllBRLy2x6m79nVt67gJgybF7paCJ1EwT21tnQVOggiZSTRM39fCuKVBBE6ldk9zigSY2t67sm2hkE7EtSp3yRBNK6qUmlt2tv7Ne8EGTYwrBEqGZJba3voKlQAVLpJolburh3VKggiVSu6W6HNiPWlhic+vKvtWEJWI/tYSSemnJy2782SxZiWHJsZt+XwlNpGaa2N4GFzQFKmgi1TRxUw/vmgIVNJHaNckpAJrY3LpKyURsizJb8x5/4W7GxuiVwVm/uH++Jcyv0Ac10TTa2+BcU6JcU6LCt44J84uKRLm6Qe2TLnfn3uIchW8dD1Fm6+AjSuhVhm2Mq5PDEuoCpiXYS1EzdSFKHXf7GvO1gjS/4dG6sUeVYWNT+6Rcev+YhJeV7rWwbSg1wZ/rYOrJH60b1B6jVB/PVo8ol5eWvKTGOihjgyXH9Lt/SCI0k8T2NoshvwIV8otUk8RNPbwcb7AUqHADfmDbWCQIcikE0YR8L2qL0bJaLKHWXlpiPd6GdvY/evbomD45CkuEZpbY3voKlgIVHoAcnTVN4ZNtcvY8gKZA6Qwjl0jtMyxHLTSxuQ3FnqKEJ2JblMpI0YSieKmJhXPr7+x/9ezRsaCJ0EwT21tfvuIFyJ/7HvvTJIUPyvTCUYDCw/kDO04vF7wQJCx4pHbRdVkijlARLx2xam7zdtYOseA5FhwRmjlie+srpFKggiRSTRI39fCyVsFSoEImkdonWFQjk9jcu5KKGIlE6ueWUDcvLYXa+ux/8+wxYP71/aBmmkKUoClQ4bxEqmnipj53rilQQROpfYZFADSxuboKN44GtQWpGJJLqIeXllgzV3f4q7Z1ObKnOHLJMX2BLE5LhGaS2N76CpICpb/c/lZ9tVjhC6yxSw0LZ6rQpX3rhFMVsW18dZLhKsjW1pXaR36R2u3XnQ4xhxp5aY51dOvv7H8H7dGxYI7QzBzbW1/BXKDCV1dhj9JXVwkL6lKf/vqzESyrC0GCOlI/V4e6eamOtXWbzrP/cbTHgPlvqAc1cxeiBHeBCksjqbY0clMbS9AUKJ1hJBipfYal7MLSyObWVbjBNLA9yri5fcywp1+4c7ExVv7q1D3fIja63VeHl4ImllIQ7eprRWkz4JZGrLI0NrUPuqVEhcJqYNtYbB0cra0rVf1eI9litD/uIpZ+4SbFU7hvcNaxwZJjfrN2QDNLHiT9qYQRpk+B3Jj8lvYIp165bvseMR3ej0jprL8Wtc+6q4vDkzyEO2JH/6IO9fVqHXwKNfjZ/3xWwPT+IRKMsWbq2N6chGeLR5iGhQwLwZK6gAV1gQrqSO3q5GB6q+G3/Q5vhRzD26JUEFGHYnqpjgV36+/cXrn2ed34lDBbGwnN1LG99RXWxkAFc4EKTwGl/Q7mYrC6qNsnAVlHbBufJx1b2+hUP3KO1K6/Fgkxhxp7aY51eOvvfJEkx3oZMC+fBzVTF6IEdYEK6gJ1vtSNhH22sV4GLKgLlM46zJHaZ73qrL0rJB2b+1S2k9mOwR2xo39Rh8J7qY7F+aE/OaKgzrGrvjMeCyapmTq2t86CukAFdYFK6gIW1AUqqCO1q5OchDo2t9GdgzpiW5TpeomSfanOy/rTWV8xAnUJs/WS0Mwc29vY0qkuYF5ojz1qF5Phg0FToE7+7qcR/zjDzLAQRF0jwUjtrmspkwxD6b3UxPK8Td1Z/7wbNDmmv71EghGaaWJ76yskWKBCUT06a5rCJ4OmQOkMYyEktc+wrLnIJja3odgLbuCJ2Bal7nSLJpTZS00sxVt/Z/9Tdk+OhWt+QjNNbG99BU2BCslEqlniph7ebi2GkaDwqMuAPV2gicG2sUgrLLG1daWqIYnUHqP2RCyhFl9aCvX6WXcayRQwvwM8qJmmECVoClQ4XQUq/Opz7FKbz5BgMZjIgTpi2/jqTMN1kK2tq6CO1K6uznkHdfd361sfO2O3PuzvD0bMLhKL+lCnr+b9UkAbnbmLlKVYpM761wy/R8zcRUqn/bWobXx6hnur5jY6y933wo4HgLhD6b1Iu/s7luetv7P++cPniNndxaKm7kJvwV2ggrtAJXcBC+4CFdyR2t1p3tXw21wmdz1KlQniDhX80h2r/NbfWX8GBXcJkzrgpaipuxAmuAuUrZnVWd9z/ZOQyLsQLLgLlN+IrGDbAGVFRd6FIHoAIO1I7QfA1B3K76U7luiHGRArcBcw/XMacEdq6o5A6y24C5RfPVZvLdj5JtkAeSFakBcouxjEqklsG6F0BXlsbXsU5JHa5U1PeKi/l/JYo7f+zvaHJu/vEiaKIY/UVB6B1luQF6iQeIE660IOdwEL7gJ1bg9ofVxnVrDsLgQJ7khtMdo772TRRAG+dMcivc3m2f6S4f1dwKSSgTpCU3UEWmdBXaCCukCdw5oZsKAuUGnNJLYNsGqwj+vMGn4bXVDXY7SXjIk6VOVLdazcW39nvYLEmhkwPcThjtTUHYHWW3AXqLRmBiytmQEL8gKV1kxi2wjrXEV5bG3DC/JIbTHa+wtFHkr1pTyW862/s/5BTchzzKrwgqbuPIo/1Vdh2i6FvAux0pIZsKAuUGnJJLYNUM4YON2xte+3ZCeuVUjt6uqCR9ShgF+qY5Hf+jvrPWKoc8x+s4q8I7UP7be1X/txifKO7a0zGdvXCJ31b3V+K2zcQalNLbzsw48InfVPc+KihLu6DcUvStjaejrr34yEJmJ7kNoV0YRifamJBf2hQ5k7aHIsaSI108T21llYHZ2yUxY0kWqauKmHr9tL+7ECT07ZA3LQRGofyvH+OJKJra2ns71EoLCfajr9wt2SjbG7JfanKO8DFjQNaqJptLfRuaZEnfUe9bfapfKUPumrXqCCp0FFT6O1jeSsv916r33cgrSbvMd0OqEEX6XTxrin+r5gPwaf7wOWPDHYzBPb2+gkc7+mrk5nrQahibGaJm5q4Wup+cym8bkGne0vGVZ4meE9yls19yi6dsIT92iLUmunaEK5vdTEkrz3Z3/L8P7kmD2Y/lLUtld3v/WbjyFMuLAIVFj2BtU8+V6eQjoF6qx/E/D1OBhZO+HJg9hTq9DkVCvwxBbq66Ut1uAHW3KkI6kcS7ZITW0RaL2F1c+pZItUs8VNPbxM9I80ltNZ/zogbDHYnlZ6lhqt1VWyxRhFzW2hol7aYtVd8bDrsnDAlmPJFqmpLQKtt2DLqWSLVLPFTT282wrU+UGqJ9gitg3GLtBHa3WVbDFGUXNbKKKXtlhoVzzYqvtcPGE5lmyRmtoi0HoLtgKVriyINV3c1OO7rkCd9Y/PQRexnFxsra6SLqfmulA2L3WxtK5eoUvuMSG5HEu6SE11EWi9BV1OXfRdcrjAINVscVMP77YChT92eVzsYItYtsXW6irZcmpuC5Xy0har6er1dLY/x3Z/cizZIjW1RaD1FmwFKiUXsaaLm3p81xWos35lCV3Esi62VldJl1NzXaiYl7pYVVev0FXXmVwLHUu6SE11EWi9BV2BSrqINV3c1OO7rkCd9ZYedBHbRuOnLrZWV0mXU3NdKLCXulIRrn+uCmuhY0kXqakuAjXGdBEfqLP+5TEshsSaLm7q8V1XoO70PgB0EcvZxdbqKulyaqrr/Au3MDbGSmP7M194C5Fh9i6Pl6JmukKYoCtQ4bpwUGVrbKopDDVXos72Z76Og7HkCkHO+uTve8WoHZrbQhm9Sq4zS+2Kh7XQbmQELNlisKktAq03XwtTZ/pd1rf7QTVbKbzl1vhg24mz/hmx14q/DcZteVfJllNzW6iml7a84j6d2zeen2eus2PJFqmpLQJtooItp1JukWq2uKmHd1uBOrdvCvchwxaxbIut1VWy5dTcFqrppS2vuGHLrjPOjiVbpKa2CNQY00roVLJFqtniph7ebQXqrD/Pgi1i2RZbq6tky6m5LVTTS1teccOWjPD5/uxYskVqaotAjTHZciqUXGOXmi3/YDpvBcr/mEMNOdvyIMmWU3NbKKaXtrzghi2pFmHLsWSL1NQWgZ/bcirZItVscVMPL0fejzQW/HkEWU6QWwyWbbG1ukq2nJrbQjG9tOUFN2zJjTPYcizZIjW1RaDGmHLLqWSLVLPFTT282wqU/wWOGnK25UGSLafmtlBLL215vQ1bdq/w7FiyRWpqi0CfTrnp//U+dIavt+QIwkUhgzVd3NTju65AnfWtZkguYlkXW6urpMupuS7U0ktdXm9Dl90rPDuWdJGa6iJQY0zJFaiki1jTxU09vutK1J28bAa6iGVdbK2uki6n5rpQSy91eb19uuhTKlgLHUu6SE11EagxJl1OpbWQVLPFTT282wqU/22vGnK25UGSLaemti6/cDdjY/RuxkVPus/3AQu2BjWzNYA+nbYWJiok18BK19jU45uuSOnfnnutMUddIUjQFai5LhTTq+S6eMGN5JIRQpdjSRepqS4CfTpdV6CSLmJNFzf1+DKYH2kwGLNcCkMXg2VdbK2uki6n5rpQTS91ecWNXZezOnQ5Zj/tfSlqqsvDhLUwdGY/fv5WnTVbKbzbSpT+LTrYcqzN9H7T4y1Bpzv9gvO9sKP54w80Liinl7q85IYuu1m4hZI1M+kiNdVFoA7JpMsp+2sF0EWq6eKmHt51ORV+nTbCb2ORC2Vo8hiYNsGgybGmXGyhnF7a8pIb3dp14cWxZIvU1BaBPp2+FjoVbj+NXWq2/IPhhsb4YN+J9tcwPm8WDuyYEMyq1FXQ5dhcF+rppS6vuU92EYa10LGki9RUF4E+U67LqaSLVNPFTT28J1eiTnZHYww560pBgi7H5rpQUC91edENXTKD0OVY0kVqqotAn0/p7GvuTIoirIWM1XRxUw/vuhKlr2fHqYtY1sXW3lXQ5dhcFwrqpS4vuqFLLpKgy7Gki9RUF4E+SNflVMouUk0XN/XwritR+peyoItY1sXW3lXQ5dhcFwrqpS4vuqFLTpnQ5VjSRWqqi0AfpOtyKuki1XRxUw/vuhKlfx4LuohlXWztXQVdjs11oaJe6vKqG7r8UsOxpIvUVBeBPkjX5VTSRarp4qYe3nUlSv+0EnQR2wYjZzZcGbK1dxV0OTbVdf2FmxobIxfop4s+Sfd8H7Cga1AzXQPogzRdiQpV8sDK19jU45uvSOnf+HmtMcf0ikHcV8DmvlBSr9Lr6mU3fMkUwpdjyRepqS8CfT6ls6+ps3RDfuxT85Xiu69E+dlrxM++UpDgy7G5LxTmS19evMOXDBG+HEu+SE19Efi5r0Cl/CLWfHFTjy+D+ZEGgzHLBRbyi8GyL7b2roIvx+a+UFUvfXnljX2321BXx5IvUlNfBPogPb8ClXwRa764qcd3X4nSP08CX8SyL7b2roIvx+a+UFYvfXnpDV92H+rqWPJFauqLQB+k+wpU8kWs+eKmHt99JUr/CAZ8EdtGY9cbo7V3FXwxSGFzX6irl7689sadPClMsR46lnyRmvoiUHsf7huGzuL5i8GaL27q8d1XovSPKsAXsZxfbO1dBV+OzX2hsF768uIbMyhHE3w5Zs+wvxS1H5H+TH+IordRcLXhXWGPJAm/FdZshU/KWQknrwCFp1sHtg9ForzFKBd9QvO9sF15RTne4b2iol568qobs1IR9xua8ORY8kRq5ont/VgUAxAVKTmVQhSxJoqbenxPK6fC/fgRfhuLlKHw5DGQ+nJzAZ6IiW3xhFJ66cnLbXiSDuEpYFqVIZ9Ibbt1F/KJ7X0ej09RQZND4VuTQTVL/kG9i4Z0csj+qhaWPlLbQOTkDUls7cPQl4tDkmPzpQ9l9FKVl9pQJYcQVAUsqCI1U8X2PkZT5dBVjx0kFKmmiptadFkboMoh/PL9uA9QRWpPhWMrVLG1dXQJqhybqrr9wl2MjbG7GPri7ef7hOkIX4qaqEpRbPELULjlNKhSNTa1GTRVCbpczdXAtpFI61uNs/UUXI0ghc1doXpepdXNK2x8fWdXFAkLrhhs5orttfN+RRG6OuubIb7dD6q5CtHdlUM3vYB6rei7KjlJwpUHwVokK+V7wuauUDkvXXl1DVdysCOvAhZckZq5YvtPXTkUlsCxQ82Vf9DPVuNzfRfa22E+vzQe2DYSmQ24Cj0lV47NXaFqXrryyhqu5HCEq4AFV6RmrtjeJ+p4Mviau/If6o49arJCeBnJjxj+oq+TRmYx1p5Zx32ELLb2gYTEcmwuCyXzUpaX1ZBll4G3gAVZpGay2N7HeJwIyEqQvuAZqyCxJoubWniXFSBLCshyrM3z568yAoSL9uOAsBYy1DYrdXo5XrLfUC4vXXlJDVd2HbiF0muQ4IrUzBXb22TKCgNXCfLHIgfWXIVPuqsAJVeOBVcO2UUlXJH6qStU5ktXoXq/6J+mxCLoWHgZ16COe7UfhV9SjHBp4R2dLvoOZGQVsWaKm9qB4KYcCtXViL6NQ9YYrIAe46a/u4QhUluM2g/JJpTJS0Mspdu4Lv5O5JtjyRCpbIitvavjMoFcSpC+BhaGiDVD3NTC18zsRwlOUg4lQ6SyIba2ji6aalBE7KeKUCQvFXkhjYNWFlgkkWNJEamsiK19aKYoQfo+Xygi1hRxUwvvihxKikhlRWxtHV30rbVQROynilAcLxV5AQ1Ffk5yLCkite1VepvdjUAfnVlyKFW8pJokbmrRXZJD9l5kXD6Q2kZy0mczsNaxvbqyP5ELS061bDsuefe/cHdiY/TK4KJvoX2+D1iQNaiZrAHUGP28FKAga1Ala2xq0U1WgIKsQX3Iku+A3uJ8aOH8nqi5LFTRq8y6T5W2vpcSshxLskhNZRFo02mXe6kvv9obVJMVorssh5IsUh+y7GbS6L0GEjIrUHNZqI+XsryGPl303cmQ5ViSRWoqi0CNMWSWQymzSDVZ3NSiuyyHkixSH7LkgEJmsb26SrKcmstCfbyU5TU0ZMnOQZZjSRapqSwCNcYgK0D645xvtUdNVvigy3LIpvm1oteOtmn+LHnDpJz0FzVYC9mhepdzFirjpSxWz7VXkCXfwUGWY0kWqaksAr03vcAIfeGvXR4pyGKoJoubWnSX5VCS5VSQ5VCSRepDVp3+RBZK46Usls9tgBd9RRhkOZZkkZrKItB7O2r4mvpKshiqyeKmFt1lOZRkORVkOZRkkfqQNbuddI8qeSmLlXQb4EXvikKWY0kWqaksAr03kxWgkFmkmixuatFdlkNJllNBlkNJFqkPWXWtIpmFenkpizV1G+BFfx8AWY4lWaSmsgj03kyWQ/ZsGJZBUk0WN7XoLsuhJMupIMsh+4s3OGeR2ialVnNRhbp5qYq1dRve5V6+IoMqx5IqUlNVBHpvpsqhpIpUU8VNLbqrCpB+543LC1LbSGrd4nUFW6sj0w1HTjXdogrF81KVF9i4uLC7F/eOJVWkpqoI1BjDlWCAwm82xy41V+GT7sohm2e4cqrNM5U5dLron1+AM2LbtPRbIUddD79w/2Jj7P6FfkH+fB+woGtQM10D+JmuBAVdAytdY1MLb7oCFHQFynUFKOka2Ieu2dXgA8rwVXZtjOuS1Icux5IuUlNdBNp8Sk33NfWVfmE7dqnpCuFdl0NJl1NBl0NRF7EPXbNLjAeU0EtdXmajR5lC6HIs6SI11UXgp7oClLKLWNPFTS2863Io6XIq6HIo6iL2oasmVxZD1M9LXayx2wgv+mc6oMuxpIvUVBeB3pteZqS+/P7goJqtEN1tBch+M/xaA96nWKK8VXMNxJy/J6o5F1mon5eyWGNXrzg8ZOcgyzH9Ux4vBX24kiBfqr33Zaq8J+yQfLX2rWI1V+GTsg8/6nN9H/RPe8CVx2rT/HmdESDsqlxPQxljbdMyTaytfP733/0bTkvnf8DfCvrnf9w7+U/3D6yrDztsV4IB859WDOhDkP74HYa8M33VP05VHxBKyL/902/+ij3F1dNF/4ADDHksYHUe2Mf3PWJuLcaSEzasEdv36XhkIcHYWvutb1qHLIew11NrmIRlhrHWrm4Rseq4fR6QYY7pUY8MI/QhUOYJ/tje+zrOA/wlyF/HP7CWYeGTsg/IMIfO/ijPoLaRSMpAlcfAnMkiAFmOtSyVxRBV9FIVK+0+ffpqeqhyLKgiFI5FiGJr78lEJUhfN49EI9ZEcVML76ICdPFXu4/w20D020WoSlF0QYUqx+aqUEwvVXnBfbr4y90fHAuqCM2yiu1tNmtF2PMXWZUgffU6ZBFrsriphXdZAbroNGMFdKxN876rUOYQsktOKVBGbBc/Dk5JKxTRS1cstNsAL/5q94eAhXMYqZkstvfOxs5TlkNX/Q0cXJFqrripRXdXDl397bgjegt10be/Q5YHO/tjcoFq3o/KHn/hhsbGWIXs73dPmCsb1ETZaO8zocoC5L8SHFAZG5tacDMWoMeLnG5e7wN11bR5S1QQFmLNhaGUXuXYI8vtNsyLv+I9YUEYg82Esb13ZsIcetSXDn+7HzvUjPkH/TmE8bnaBf0lP4Qx0jYOuVqEKLZWiCTKqbkoFNFLUSy0q1ecuORYe75/DFgQRWomiu29MxOVIH2DOUwRa6a4qYX33HLIphmqnGrT/HniChDmTq4e3xexZDFE7b5UFur7i78z/DFgQRmpmTK2tzm1i43U1TUkF2M1ZdzUwruyANmz2XBGbBuKHMFIL7ZWT+Ydrpxq3sUVCumlKxbb1evp6i8MfwxYcEVq5ortrTN35dBNL1SRXaSaKm5q0V2VQze96oQpUttAtBiDKjZXT0mVU3NVKKOXqkKpfdVfpGIlDFhQRWqmiu01RP+KK3QVfpk2qKYqRHdVDoVfpo3o20D0WS2oCkH8cjBQc1UoopeqvNBGVsmhDlUBC6pIzVSx/aeqAnTVd5cjrYg1V9zUwrsrhywjkFZOtWnmScuhBz27Yh10ql9bykKIYnqpzAtuKJOBQlnAgjJSM2Vsb3MqR8fX2NVVn6OBMsZqyriphZeR/KjPFZSUeaigzKGkzKmfKEMxvVTGgrtGAGXyOBKUBSwoIzVTxvbWmSsLUPiaa+xRUxY+6cocSsqcCsocSl9zjT2V1VXyCzX3UpbX5ZAl16KQFbAgi9RMFtt/KitAV32FOfKLWJPFTS28ywrQ1V8XPsJvQ5G7/Th9eRAzjsXQqWb86OrpF+5mbIzezbjqX+N+vk+YuxrUxNVob5NpiRWgq76v8VvtUKkKH/TiOEA2y68VvXa0zfLn2SuEOl31rePvFWublDp0RBVK6VVaPXm5jf5k/qAqYEEVqQ9V/n1XCiN9fY19ydc3UMWumipuqvkNqhw66wtroMqpoMohPaQgitA2JXVLREShGF+K8oIdomReICpgQRSpWU6xvU2lewrQVWccpog1U9zUwtdBvGfCj/pcQcmUhwqmHHrS93VDFaltUmq0ogr181KV19hQJQU7VAUsqCI1zSkCNU+av8ipAF11CuCKWHPFTS28uwqQXEchqQhtI9GzwVs1V0fmG5IYpKjmW1yhgF668iIbruyy4ilgwRWpWVqxvXY+qHLopj8QgSlSzRQ3VfSbfvmGtHIKA5YvoyCL2DEZeJZia3WFH1LXTwR3DLIcm8tCob2U5cU4upWLHiRWwJR6KWomK0SpVWEfIfLKoSSLVJPFTTWDSVaiPLFIbSMRk8grtlZP0ZVjc1conpeuvMBGt3UG3CcQrgIWXJGauWJ7G6O7cii5ItVccVNFT66cwoBlL5BYxLahyKELWWytrqIsx+ayUDYvZXlpjW794iJgQRapmSy2tzHKNCGxHEqySDVZ3FTRk6xEyaoPV6SyK7ZWT9GVY3NXqKqXrkLlfdUnL5FYAQuuSM1csb2N0V05lFyRaq64qaInV05hnuVyCrKIZVlsra6iLMfmslA1L2V5ZY1uZQWHrIAFWaQ+ZIXyikAbpNsK0FXfT44LDGJNFze18H4pGKCrvwp8hN/GIvuIZdCDpGtBp2ayHu7Wty12xm5b2JvAI2ayiprIKqDNpkzE1whd9Qulb4UNWbWphb/qz8l+TDDZj9fCUnJV66EvOX28J2zuC3XzIrke7lhbH7qVI/I5YsEXg019EWi9yTzBV4Cu+ssW+CLWfHFTC598RUwWFPgiltKrWg99uS8GKWzuC8Xz0hcL7Ip3uuqbDeErYMEXqakvAq039xWgq75RGb6INV/c1MInXwmzZyKrg5xfKYh9C1lBapfmvlBHL315rX266jt94StgwRepqS8CtfdWHMe+ki/Gar64qYVPvhKm7wJGfhHLvth66Mvzy7G5L5TSS19ebsOXHPPwFbDgi9TUF4E2SOkL62GA0vmLWPPFTS188pUwez9u7Uf2lYKE/HJs7gvl9NKXl9zw5eevgAVfpKa+CLQJdV8BuuqvIrAeEmu+uKmFl6HgaiNAV33JLLKL2DYWuWXwVq3Vk18cJmouC+X0UpaX3JAlJSOSK2BBFqkPWTJPX2IUd8UgNQ/YI7n/A1fEmituap+UfYCrAF31IT64IrYNRfYRrthaPSVXTs1doZxeuvKS+2S/N4ergAVXpKaJRaDGGE5cAbraD6prl5qs8EmXFaCrvsMUsohlWWytgSRZTs1loZxeyvKSG7LkZAlZjunNtZeCpq48SnAVoGsb437rEolFrLnipppB/UIMiRWgq77MFK6IbWPRG4XVWj2d9bISFRdjFNXGcfi25OEO1fTSlVfccCXVB1w5FlwRmroiUDsfXAXoqq85hStizRU3tfDpAiNh+l5T2CK2jUbOClgG2dr70vdtQhexLUibsaOo0y/cytgYu5Vh74x8CFjrdj/OXwqaiQpRXFSCrvpixG/VWYlKn7QFMECWD68VvTy0fNjH+5ag01XfCvhe2C6rTrsiCzX0KqtOXmejQ1sBAxZkMdZUFoGagiArQFd9fRtkEWuyuKmFd1kBuuoLx2CL2DYWu7QYrdWTGYclxiiqGRdXKLOXrlIpbq/fesAT5Zp/wRWhqSsCtfPBVYCu+pYpuCLWXHFTC++uHLJphiqn2jQzsRzCe1iOj8fAGKmf5xVq56Urr6+RV5Wp+249P5wcC64ITV0RaJMpx+zX2NWD7BBUMVRTxU0tuqty6KzvCYAqUttI5FsULH5srY5MNxw51XRLVqFqXpryyvp01TdIwZRjwRShD1MyS19SkJBUDFLTgB2SYxWmiDVT3NQ+Kfvwoz7XoOuDVLpQxVjbUPSuP1yxuaIkV07NXaHwXrpicV69YmrkUIcrx4IrQtOsItA6k66QVQG66gtwIItYk8VNLbzLcsimGa6catPMFdAhzJ30iPQitk1L++5MEgtV81KWV9boULIeshwLsghNZRFos+myAnTVB+shi1iTxU0tvEwdMsuhJMupIMshvHfQTlekfu4KRfPSlRfWcCUdwpVjwRWhqSsCbTLdVYCu4XxFrLniphbeXTn0pEsxEovUPsGyj1gE2Vw9mXBklFNNuOQViualKy+sT1c918KVY8EVoQ9XMk04YbG9RqizhDUwQFd9+w/SilhTxU0tvOwD0ipAV31VEVwR24YiZ0uoYmv1lFQ5NVeFgnmpikV19QpVchxBlWNBFaFpWhFonUlXcBWgq76hCK6INVfc1MK7K4dsmqHKqTbNPF85hFf12xJIas/Qupw9ptX5F25bbIzdttBXJT0/BMxfZVfUfjDa3yKu9jaZ5ip1pV/RfKtQpSp8UEuPH/W52oWLPqv4WlTMqtARjm85xb9XkOqq+RZVKJpXaXX2whrd2q3AgCVVDPaRV3JIf3kIUXwJDNCjnj6hil01VdxUU+N3bcfnCnrUO3hQxVC7KrmF81bNFeSs365BFYMUNVeFanmpihV1xYMqu7A4O5ZUkZplFdtbZ55VAerPcu7LD1wRa664qcKHtHLoYg/pV/RtJPqbPLjyIDGvHJvLQtm8lOWl9emq7y/AEuhYkkVqJovtNZshrxw6hyWQVHPFTS26pDaWQIfOXgkPah+ILG5wFYKEvHJqrgpV81KVV9ZQJZc9UOVYUkVqportbTI9rxxKqkg1VdxU0UNaOeQZgTXQsTbNn1cWCdKfgmElZCjRLqcrlMtLVyypa4BwJZcycBUw/0p4UPtuHS+HcLIKMdyUQ/62pgrVTPkHw8nKIc1YeCIURoGUYuthwmQcMORYky2eUCovPbGcPnQrJ1J4cizlFKlthHfhCpDtrTMZ4dfUFd7eJ+sYzlWM1VRxUwsvn8P659BZfzAKV6S2kciZG67Y2jq66svI4MqxuSsUzEtXXlQjp2RxhquAhZwiNXPF9jZGdxWgq15QwxWx5oqbWnh35VByRSq7Ymvr6KqvIYQrx+auUDEvXXlVDVdyJMFVwIIrUjNXbG9jdFcBuupbvuCKWHPFTS28u0qQvrILieVYm2eerBzC5MmI4MyxFkvWQtTMS2esq/s47d1aD+eABWekNmdyjYJzFltbVzI+rIQJ0usdGCPWjHFTC+/GAmSvSYUxYmEgWArZ2npKqhybqrr8wo2LjdEbFzd7t9ZDwlzVoCbpNdrbGE1WhLTo+1Z7VLLSJ01WgmyeXyt87Wqb58/0SrFM/HvF2qalzjLHvLqgdl7l1ca4LJnB54eA+R3BAc1chb4u0tXX1JXn1eiqqUrR5WLpR4qOP250vGyFKsbaRqK/8n+r5jJ5tie+i9qCtJfViCTUzEtJXlefbvrCMUhyLCQUoZkkttfYvAwOPYW/GFM71CyF8J5QAbroV+CwRGwbiv7yDpbYXCM564uWkUmktiB1DSCSUC0vJXlFDUkyNkhy7Kz7/lLUfuwcD88v1VojC45SR5IPWPNINUXc1KLLMJBHDj3qz7RgiNQ2DOkbgthaHZ3154oQ5FRbNsUTauSlJ9bR1Ss8yRIAT44lT6S2AYaqKkQJphik9uisP/qFKVLNFDfVB73+HZ/rkL7ZDaoYK6tiawVJqpyaq0KxvFTlBTVUVZLu50yociypIvWhSn9pgKwiUGMMrhw665MPcEWqueKmFt2zKkH6GjW4IrYNRU6gSCu2Vk/JlVNzVyiWl668oD7d2lmPrhxLrkjN0ortNcSgyqGkilRTxU0tuqtKkL7JB6qIbSORUgOq2Fo9JVVOzVWhVl6q8noaquz+38WxpIrUTBXba4hBVYBuiiGtiDVX3NTCuyuHwn31EX0biXx5B1UhRjhZOTVXhRJ5qcrLaKiSMylWQMfsj4DhooJUOBax/LG1zaSsLbg4d8geJoInUs0TN7Xo7ilBekZDThHbxiGHLUSxtXo6+y/WAzUXhQJ5KcqLaIjyqwrHkihSWRRba4CaKhDl0FnfbAVRpJoobmrRXVSC9BVqEEUsi2Jr9ZREOTUVdf2FuxMbYwWvveTsIWBB1KCiqNFaA3RRAbrqSxi/1e6UqPBBTZUf9bm2Czc9Dl4Li6JCT0FUoOaiUF+vMurKGrzvulbZzw8BC99+DGob4N1v7XUxKUxw5bt001+XwBWp5oqb+liOVR1cOXTTH5FAFaltJHrn4q2aq6ezPpLxnqi5KxTIS1csoqvX003vPcCVY8kVqakrAq03O1OFvrBLcraALMZqsriphbcVcHyuQ3pLDLYYa08s6R222FxRki2n5rZQLS9teUWNqbGLiqtjyRapqS0CNcaQWQFKtog1W9zUwrutBAVbxLax6LU8bLG5ukq2nJrbQsG8tOVFNWzJEJFbjiVbpKa2CNQYgy2HwsXF2KMmyz8YzlkO+R9xrPFuI5HrLKgKMcIy6NRcFerlpSqvqaFKdg6qHAuF1aD2g9G/sB/tPzUVuvJHd0aoZso/6D+CGZ+rXbjpD1ewBjLUPhC5ewNVbK4g+ktFnLAI7TFqqTre/ruiUF468mIajqTcgyPHkiNSM0dsr7GFbArQzV5CV3vUJKVP2mWFQymdSO0j8RMVm9tAbu1pnP3uDjQ5Nk8olMpLWV5On27+FrqrY0kWqW2I4V5tiBJkMUifCH0cDZcVxJosbuqfNFkOPXpdNaJvI/GE8hhnfQIMqpyaq0JJvVTlZTdUyYGEvHIsqSI1U8X2Npd+BRigW1BFrKniphZeTri4XHfoUQt+LH6ksiq2VkdJlVNzVSiXl6q8pIYqmT+ociypIjVTxfYaYsgqh9IFBalmiptadDfl0L0WJzBFahuI3akdrdVRMsUYRU1N3X7hZsXG2M0KfRnX80PAgqlBTUyN9tp5NxWgs19QDKpMjU0tupkK0KObGtQ2EP0t51ucDV//RpDan7kq1NyrpLqxLq94SCoZIVQ5llSRmqlie+tM8vdr6gp7JFej3wprrkJ4GcmP+lzbh5veuXotbBtKPQ/1+XOXNB3Ble/P3BWK5aUrL6gxM3IihSvHkitSM1dsb/PkrhwK99XHDjVV/kGvqMbnahfs944wlULp+z+RXo6FlTBQc2WomJfKvKo+3fQlT1DmWFJGaqaM7TVfYSV0KK2EpJoybmrR7zRxkF8Bu+lvkWCN2DYWO22N1kNfkobvxyBtRT2WVzeUy0tPXlLDk10GbqHkxJY8kZp5YnsbnaeWQym1SDVP3NSi+yroUEotpzArsqtILcdSajk1Ty3UzUtlrK37OPW1oUgtx5IyUjNlbG+dyTzgzBWg8MqlgTVn4ZPuLEDhlUsj/DYUOYLhyoMkV07NXaF4XrryAhsHkowQrhxLrkjNXLH9p64ClFwRa664qYWXkWAVdMimGYugU22aea3hEF6BJNdDWAuJbbNSC6oshaiel668woYr6Q+uHEuuSM1csb1NpudVgG76yllcERJrrriphXdXCdIfR0EWsW0octGFvGJr9WTCIcmpJlxcoXxeuvISG67kPAlXjiVXpGau2F5DDJcXAUquiDVX3NTCu6sE+Rttx4CzKw+SXDk1d4UCeunKi+zTTX/YC1eOJVekZq7Y3ibT88ohf53t2J9myj8XLt4detS6EklFahuHHk3IKjbXMJIpp6am7n/h9sXGyFUeTMmp9PkhYMHUoCamRnsNUefha+oKeyRCvxVWrlJ4y6oI6U95Xyt829Vbm+nPE1aIFqQFqoU6LoX3KKRX6bUxLs1OWwFL0hhsJo3tbSbEBqQ59KhPdMIZqeaMm1p0d+bQoz4mCWWktoHIEfxWrdVRMsUYRc1NocpemvJKHAezfZV171gyRWpmiu218yG9HEqmSDVT3NSiuymHkilS20Dq+o05xdbqKJlyam4KBfjSFIv06hWm5NoHC6FjyRSpmSm2t848pwJ01UeKkFTEmipuauFdlUP2V+yRVE5hWuSqC9nlWHLm1NwZSuilMy+zTzd9yw2cOZackZo5Y3ubVHcWoJu+yBrOiDVn3NTCh/d7j092TIcMbYy2Z1h9Gc8UY3OLcvM3ZY0ohc19oYxe+vJSG75kEuHLseSL1MwX22vnw2oYoOSLWPPFTS188hWwmz+FNYa8DUYWHWRXDCKnuPeEzXWhhF7qYpndhnjT12pDl2P6ys6XgvYD0n8qE4IEW94Tjh+57kF2EWu2uKkPRb/ZH5/rkP4kCbnFWPtQjkHgiq0V5Kyv74Mqp+aqUEgvVXmxjZmRAwmqHAuqCM1Usb1GGFQF6KY/T4IqYk0VN7XwfvJKkD9+OsLvQ5EocOVRkiun5q5QSC9debF9uukXtHDlWPi14KBmsjxKkOWQ/QF4uCLVXHHTT10F6KrPMiGtiG0jkZyGKrZWT/YuE6QVqX02KoiUWKihl5K8zoYkWXIhyTH9zSrWPkLbXt391h9rHEANLkhilAbd9EXWsESsWeKm/snjuvWjPtch/Z4Xlhhrn+FjEFhiawU566/vYcmpaUI9/MI9jI2xclhn+fkhYO5qQB+uZMn4koK4qhGkTYM+0fGtQpWp8EG/25Qg/QXra0WXVPi8AgxBgqlAzU2hdF5l1YOX18iqytN952DKsWCK0MwU20tCMOVQ+FXT2J9myj8YTAUomCK1m5Jz9lucDM+psYs12rkplM5LU15ew5TduHhwLJgi9GFKMxNJRaB2PqgK0E1/hoysItZccVMLL4n9oz7XIX15ONKKsXZZuv6N1gqSsooxipq7Qsm8dOVl9enmb/d+cExT7+VhQFNXHiW4CtDNX+89Omuu0ieP0wxXCfLXeweszTMXwhBLH914rx63aWkV6/HC4gFl9VJWKr21QMAS6FiQRWgqi0AdaUFWgvT2KhKLWJPFTS28J5ZDZ32xE/LKqeDKIRzoclEGWY61WKIMpfVSWSq/9QXoUOZYUEZoqoxAm1O5Q/I1dXXWbwZhjKGaMW5q0d2YQ2f9SgjGSElKMK/YXD2Zdqhyaq4KNfNSldfVOEJkhFDlWFBFaKqKQA0xZJdDN30/MlSRaqq4qUWXgWAldOimr+KCKlLbSPRBalxhsLl6SqqcmqtCybxU5WU1VPm1oGNBFaGpKgI1xKAqQGe/vfRArLniphbeXQUovDJrhJ/klUdJspyay0LRvJTFwroPUJ98Rl45FmQRmsoi0DrzJdAhXaOQVoSaKm5qwV2VQ4/6s2yklVPpu5GAJWMebG4MBfTSmBfZSC+pLmDMsfAShUHtC8jxcgyX7x4jJFeAbo/yRRKMEWvGuOmnxhw6h4XQqTbJPHM5lP7q1djTPU/HnBwvLx5/4fbFxtjtCz1FPD8ELJgaVDQ1WttUWmYlyE4q32p/ylT85JiZfXp/1OdqH4KpEMpNBSiZGthPTaEKX+XUIyv12vXTzd/KHrBkisGyKba2rtxUgG76ol+YItZMcVMLb6vg+FxByZSHCqYciqaI/dQUyuelKS+xYUq+B0VOOZZMkcqm2Fqz5Ktf6Aj7IzMOU4zVTHFTCy+fQ045ZH/77bWobRxa475Vc/Vkut8T1XTL6ofaemkq1N83fyv7o2PJFKlsiq01wGAqQDevhsf+NFPpk7b6OWSTDFNOtUn+PE8F6F6/RoIvhhLpYgol89KUl9U4hu2K4tGxZIpUNsXWn5oK0M3fyD72p5lKnzRTDtn0whQpmV46YnMNxHTDkVNNt5hCxbw05VX16V5fJo/Vz7FkilQ2xdYaYMipAN3rm+Gx+hFrpriphffVzyGbZJhyqk0yfTlkCyl8kRLpYgoF89KUF9UwJXe0YMqxZIpUNsXWNpV+RRGg+zvBYIpYM8VNLbybciiZciqYciiZIvVzU6iWl6a8ooYpv6JwLJkilU2xtU2lKPj68Bige32XNUwRa6a4qYV3Uw4lU04FUw7ZQoqcIvVzU6iSl6a8koYpu7H06FgyRSqbYmubSjcVoHt9uzNMEWumuKmFd1MOJVNOBVMOYebkDA9VxLY5qQyQ1Q9V9NJUqLTv9V3KWP0cS6ZIZVNsbVPppgJ0ry9IhilizRQ3tfBuKkD3+g4znKiIHaeXZyi2Vk+mG4qcarqPpp5+4R7Fxug9inv9Dc/zQ8L05RAvRW0DDG/5SVHMVYLu9dLjW/VVrtInzVWAwgtJBrWNRM7ab9V3qTrd65uB3xM2d4UCeZVVTyyiD93KCOEqYMEVqZkrtrfO9D01X1Nf4fX5Y4+aqxS+lpw9J36k8OEvhozwe15JENjyrs56xwCynJrLQlW+lOWVO44RO1k9BSzIIjWTxfafy3IqySLVZHFTDy/zDFlO2Ty/JqrN8+damELpxSqUscNtVtrUyiqIOnkpi7V0G+C9vvsLmRWwIIvUTBbbW2e+CgZIf7SCRZBUc8VNLbosEVDlkF3yQhWpbSD6HQzyis2tp7QKOtaEiyvUy0tXXlMjseRaBq4CFlyRmrliexujuwrQvf8scOxRkxU+6bICpK8ohCxS20j0DRKQxeY2kCTLsbksFMtLWSyoe7f+IumngAVZpGay2N46c1kBColFqrniphbdXTmUEovUNhB/y0+ajeSKUWqH5q5QLi9dsaSueCe7NEJiBSy4IjVzxfbWWbi8CNS9v0h67FKzFT6pL2/DOhioe/2dI3KL2MQXm2ssduLD2cqpuS7UzEtdrKurV+iSszJ0BSzoIvWhy3/JmcIEXwxT+5SuMEg1XdxUHzwFXYG61+87oIvYNhiZEKyEbK2uzvq1BGw5NbeFsnlpi6V19QpbfjkYsGCL1NQWgdZbsOVUskWq2eKmHl4mGskVqHt92y9sEdsG46UWW6urZMupuS1U0EtbXmXDll9jOBbuXzyRCgP88jBaa4Ba7KLMYoiCwvvOBtVM+Qf1WS2Ickh/fg1NhLZR2KPdo7V20F7qh6TqMercebgGxF8fX/rZGbtroa9Efk6Y+ykq+anWGpn5iZC/RrqwIag2tfA1Mx9lcIL8bygVtY1DYrxVa3V01t9Pvhd1nAsxhFJ5kUGPd15On+7t7dEJS4YYbNsrycIvKcbJFrtI3dsbiQtrith7zZw9EVKfK+iib3d6LWobiCZRtVYMzJksiXDE/TkGEUeojZeOWD8f+pMrZmSRY8kRqW2v5LwGR2xtXUlHXyN0r1cB3wprikJ4yYAf9bm+D1opwRFjHaf3485EtbYg9/pKIDjKQcQRKuOlI6+ecUzI/MKRY8kRqX1oEgSS2NzGFhIpUPf6Ck1YItYscVOL75YCdK/vh4UlYtkSW1tP91powRKxYxCxhJJ4acnL5tO9vSH18c6xZInUxBKb29iCpUDd6xtMYYlYs8RNLb5bCtC9vmoUlogdJ5i5xNbWU7JE7BhELKEYXlryghmWZBlCLjmWLJHa9srPSWxtQwuSAnWvKxIkEWuSuKnFd0kBumh4SCJ2nF9KYmvrKS14xI5BRBJK4KUkL5MhScYGSY4lSaT2vfIFj81tbMFSoO71XZKwRKxZ4qYWX0aC01KA7sOlA7HjBNMSW1tP9/r6Ryx4xI5BxBJK36UlL49hSX70DUuOJUuktr2SMhJnJba2oQVJgbq3J6cqWJMUPumSAnSv7z1EKhE7zi8lsbVGcmlfW+wUHJE6xhBHKHiXjrwoPt3rbXw4ciw5IpUdsbVGli7BA5UcEWuOuKnFd0cOXfQuPBSROk4vFbG1dXSv7yiEI2LHIOII1e7SESviQ3+SA3BEjFPyUpu2XdB7YMgafqICX7VqwRW3U/5nmoti799rU4XHseVKPD4wWYfhhNhxOumErYe+5Il1OCF2DHJ0cvqFmwsbYzcX7IVxjwPjrLzUpuxkfKIGEpwECnMmS+u36ovdf69NFT9JiR3Ym8Yq2nE+P6XkIFLSvs+CiBQUtKtEObHo7WPTF5s9PwbMfo0PTwy2De3ut3o/50sB1dtVby99TdTpvj1Dvk8VTLG3ZoqbKr7dlqvPFYTwsja8FrYfdMcfO79VawXRl93AEndnC9HOaqIJNe1SE+ve6g77LOsCNDmWNJGaaiJQvSVNTkVNxJombqr4QZNDUROxbTAiEZrYWj0FTYR2TXdDtWhCUbvUxMK3usM+y7oMTQGT21FIJkIflsQ1contrS+puZBKAUqpFDE5FWAhdCx4cyh6I7YNT1ZheGNrG5z/WrmwLUgtkiIOde5SHGvhQ3+yWxAXMIEgjtBMHNtbXy4uQEkcsZZc3FThgySHoiRi+/zWBPNkxebq6nSvL5XDMuhYu6QRWah3l7JYEx+6lb2DLMf0K2jIIjSTxfbWl8sKUJIVMc8yx4JAhyBQ7pfgJEZsG54sMcgytrbB2ZkQ/ojtQep4F3OogZfmWCf3DnVBhjnH9E4lzBH6MBcuNghUZ+ks5hQmUhTjYoNYSzRuqvjBk0Mx0Yhtg9GvcyCKzdWVzho0EdpitNtvogll8FITS+XqDnktcwJNAdMXw8MTqQ9Pek8fJzICrTfpCyeyACVNxJombqrwQZNDUROxXZPnE5urK8ybXJRAFLEtSvutgohCLbwUxXr50KFcKkCUY+FWxKA+RIWE8jApoZyKCUWsmeKmGk0w5VA0RWw3JYcTEorN1VVIKEJbjHbTTzyhPl56Yg1d3eHA8OvCgMlBhnwiNNVEoDpLmpyKmog1TdxU8YMmh6ImYrsmyRRoYnN1FTQR2jXV6fSo6fwLdyg2xu5Q2Dv8HhNWZ8X92uiloA9NkpNfqr2Gphn3NUL3+huSbxNMdul7xGS/fkToXt+N91rYPumjZPq8MEwzdK+vs3s/BqnrNxGHInqVX2cW2m0y7/U9Z8/4s6vmV8+1EEdoJo7trS9ZXyAuQElcxFxcwFxcgJI4YtvwJMhb3u8grgepFUrEoaxeimPp3Sbz3l7u93h2zC8IBzQT50FCxgUoiUuYvuEOGRcwmXNkXIDu9SdEyDhi2/AqWZhxbD1MZN3L2DFkHLEtSFULIg7F91JcKtDtZWSP54AFc6Rm5tjeBucpF6BkLmHBXMDcXICSOWLb8CpbaI6tbXCWtzBHbAtSK4SYQ6W9NOfV+One3kz2eHbMfjBb0Ic4v7YPUULOeVe4Oqqjc58onOWI1aXI2NTmzi3xcwVd7eeyFX2XJEGwMHoQzJrnF7EtSnvQSTShoF5qYtFde40OZVJwSguYXljinEZq6olA680zLEDJE7HmiZtaeJlirIMBsinGOkhsn2KZEIhic3VltpFNpHbb02tGVNRLT6y6qz94qgTdD154cuyq37bDE6mpJwKtN/cUoOSJWPPETS28ewpQ8kRs9yQTAk9srq6SJ1K7p5It+YSCeumJRXf1d7q3l8Y9ngMmSzY0EZpqItA6c00BSpqINU3c1MK7pgAlTcT2GbYKbAy1ukqaDkGqrhVNqKeXmlhzV3/QJJc7SKeA6YPi8ERq6olA6809BSh5ItY8cVML754ClDwR2z3VisWrCDZXV8kTqT1I5aR4QkG99MSiu/qDJ8kUeHLM/yZLUVNPHiZcRgQoeSLWPHFTG4x7ClDyRGwbi14QYdljc3V11r+YhNOTU9NvTC6/cGNjY+zGhr738PkxYFf9hcRLUR+2ZKK+VHsN0WWFrtI138BK1tjUwss+/Ij7EGSNWLusyofPpBrN1ZU9Ef2e+prLQuG8Sq0Li+vqFaklKzNkOeYXfgPaBni2vyKWggRX3hN2SOb8W8VqrsIn5XNw5dBN65HXovaR6A2nEAO7WCeiXShUsastSJ1UjsvfBTXy0hHr6IMjWZXhyDEvogY0c+RBgqMAJUfEmiNuakNxRw4lR6S2kch59C1NRnTUg9QJRRyhGl46YsXcBnZvr198vDjmdygGtI3M38CTggRH3pO9vx1p5BSmSdam7xFzbSmW31oaXR7TgqugBzH3SC1SW4xKBNGG8nipjSV00/Zg72J8vCRMEh7nKlLbXqX1j+2tMzlwv1aQBj3Y2xgLa7kVwrskh2x+sf6R2h1VXlASmw/7KBgsEdvnY6yiYgnF8dISC+hDfzJ1WAAdC988DmpmyaOE7ApQskSsWeKmNha35FCyRGq3JNOBJZDNracHfXslLBHbo8wsoTReWmL5fOjPLyUc8+9FLoS2nUpLINtbXzIBSCWH0hLo1OlBX9WIJTBg7s2h5I3UfgTWlQGzi81tbOH7rLFDe5SZN9TKS2+sp1t/D/ZGxseLY/4LpwHNvHmQkFwBSpcXAXvQNzdCXMBcnENJHKl9ymW9Q8KxuU1kui4ktkWpg1aWRRTPS3EssFt/D/pCSCyLjumFCc5dhGbi2N76qn3fj1wkXIDSqhgxv+gImItzKIkjtYuT/YY4NrfBpZWS2Bal1jURh2p6Kc4r7tODvskS4gIWrhZJzcyxvQ1OZgDmHEpLpVPxajFgLi5A4eussWO7ubHKcan0IGYfZzhSe4yZuOsv3NrYGL218aDvCH1+TJgc3i8FTbylIOYtQMFboNIpLmHmLUA25a/HwbVfnX16C0HwPYacCd+PUar1mHBXlNmrhNsY9yYLOLwFzG/0DmomLkRxcQEK57jRV0vecI5LmJvzLpM5Utvo9I0Ab3GKwjlu7NAWZZpxKL6X5lig9wnQSwaYcyzcTBzUzJxH0a6+pq5SyjFUXfmP3ttQXBI/V1CSRGqXVN9UMb3YXEHCrcSwP9NbiVcU3EtVLMqrV5zVSv6+c1AVMF8cCc1Msb315TkWoHA5knboQd9z/T3ut+vzLpM+Urs+GTxyjM1tcOFyZGB7lHFqlNURNfhSHOv03p8+ZwpxjrXHzHa7OKsR+hCn30l8KaB15uYYpUEP+pT1txjrof0QYt8nmAvR3JxDeH/cmNU9FM5rTj22H+vuFAQ6hUyQNMXpzbF5AqJKX3pkJX+YNTm84NGxmwwUHglNPRJonbnHACWPEZN9gseAuUeHkkenTg/6SlOIjFhdiey+IdKxuUhU90uR4Q7Ag74xEyIDJtc0EEloKpJAiXzSu0Q46zmFCRPhyMiIyTkAJh3zX3UH6KbJjYxkqG18YgYC2VqDw27LQQOBxPYgFUXWUhTuS3Us7g8dyq1iqHPMv6sZ0FSdR0nqnIrqIubqHAvqHErqSG3jkwMX6th6mElXR2wLUsejmEPlvjTH6v7QnyxCMOdYMEdoao5AdZbMOXW63dfhuS8/SLqAPeiLLpF0jgVzDiVzpLbxySECc2ytwfmDFAPaQrSHy0UcSvelOJb31R2Obz/tBUwOOqyWhKbiCFRnSZxTUVzAkjjHgjiHkjhS2/gklyCOrTW4II7QLq5WtqO42y/cTdkYq8r1u4Dnx4Tp+F+KmplLYWq92FPpa0WpGTg9+AsmR6yq7sam+qTu5I8UPkgaobah6BnvLQXxx6BHjNodDKSOd7GFon+VZjfeGDhElBmErYBVt/s0QxahqSwC1VlIsxGmqHRmi5i+kvJ77VRFCwZ9x5JBUtv49PQAg2yuntJVycD246BmWtyh2F+68xsCOBok/+HOMd15uCM0dUegRpfcORXdJSy4cyy4cyi5I7W7k0MX7thco4vuiO3uKoq4Q6W/dJfuBvjLQ28B05svkEdqKo9AG14deVwlAxSKgdFZWyX9k8GTQ8kTqd2T7CM8sbkNJFz5D2yLUhW6aEKhvtTkxTxSzC4fbwGro4PLI6GpJQJ9cPrVEM5mEZMro28Z0xefYn30aMGdQ6cHfWXpa8Xa5R3vssBdDCLT9D7B6kgQiSjSlxK9kMfeywUu1knHwjpJaCqRwEJiwrzyDvuEXZclHhI9WpDoEGLJ/ENixOqKcD+aYTNikhmwSWybr6pxRCIK9aVEFvN9XvUmHSQGTIaI9ZLQVCKB3lnIxIQFiQkLEh0LEh2KEiMmawQkRswlEjvmtUhEyb6UyLK+z6u+ChQSA+YSCU0lEuidBYkJ01vgWE4jJnuFTHQsSHTo9KCvskQmEjtOOxOQrX14ms5IwIhNl1MU+UuJfiMAe+/LqWNhOSU0lUigjzJITFiQGDGX6FiQ6FCUSGwbYS2AlMjWPrwgMWHTm9E31PJLiaz3e8f6+k9kYsBkurCcEppKJNA7CxIdO9vf/6reejD9qgOJ6MH0yy9U7gF60PeJIhGJ5URk62GHZK1FIiasvdvzuJre/8Kdlo2xOy16I/H5MWCeiAOaORxAH6U7DFhwGCjkjpx3vqc9d4c5Vl3075n2WrFiHuYg5jBhl/auCXGIGwKrPLxPNw385akB81/7DejDoVwlfnkc7U1hnQj2efqaoLO+qvlbUVUEpuiyCz/qc20X9IdEcMVJ2V3JmeWtmivIRW+MvydqumLeo65fmmLtX72eHvQtb8g2x4IpQjNTbG99uSmHrn7KG/vTTPkHQ1o5dNWBwJRT+KJAK79AXfRWPoR5rLkw3AdYCkv3CvQlvRDmmI7zpaCZMA/ivzEKPSVhDNWEcVM7HDy1HErCnMKfeTNhTiVhTs2FofhfCks3CNqXSPsKBWGO6QggjNBMGNvblHqGOZSEkWrCuKlFd2EOJWFOYdmxcnyMt3pMxjzY3Bgq96UxVvfVK3ZOzuMw5lgwRmhmjO2tLzfmUDJGqhnjphbdjTmUjDmFSfEccywZc2puDGX60hhL+TbOBy1uYMyxYIzQzBjbW19uzKEHfe0arjdINWPc1KK7MYce2vUarw1JbQOR8gaXG2ytjpIop+aiUJMvRaW6Xb8RhCjHgihCH6LsT8imKOH0xSg1D/pWDYgi1ERxU30uXG44pK+CwNUGoW0cssrAE1urn+TJqbknlN1LT6k0f5BCH54cC54ITT0RqCEGTw4FT4SaJ25qwT2hHAqeCG3jkBDwxNbqJ3lyau4JpfXSUyq/9XcQ8ORY8ERo6olADTF4CpD/bfrao2YqfFKmGaVWgB70DczIKWLZFVtrIMmVU1NXD79wY2Nj7MaGvgT5+TFg7mpAM1cDqCG6qwQFVwMrV2NTC2+uEhRcDWwbi61/o7V6Cq4CNXf1CzcwHlirV6+nBz3DwJVjwRWhbXzhUfsQJKhikNqhcAmYQj3oy0++p932c1eIdfGbGoPaBifnh7fUUbinMWLU2ObyUE6vFsUHL7khT44syHMsyCO0jU/u2XxJIYI6hqjhJXVOYaelIoK6gHniBehB3xv5mmK1ed+vIqHQY9lh8F7U8TA43jl8QGW9dOfVN6ZBblnCnWPBHaHjTu0Dgzu2lpbgLkA3LSy+Vay2QqZPHu9I/KjPtX1IojxWEOXQ6cFfxDmGvU1KlW9iChX10pRX3ehPlgCYciyYIrTtVFoi2d7myWqu0BN2SAofuAqxrHpCogXME80hW9+QZ04FfQ5h72XFQaIROx7Tog/l9VKfl+DoT0YIfY4FfYSOO8VEY+tP5QXoqg+2QR6xlmjc1MLLMJBoAUqJ5lgwFSB/TGP0+NM8Q3m9FOUlOETJiQGiHAuiCG07JccWVkS2tpn0LAtQyrKISTRkWcBcXoCSPMeCPIdimhE7HtGSZii6l/a8MEd/fi3iWLBHaNuptEqy/af+HLrqT/+QZ05ht+t0sac29AXM9TmUFkmngj2HsFtydYBFkthP7aEUX9rzcv304O/GfXAs2COUc4+tP3XnUHLnVHQXMHcXoJR6jgV5DkV5xH4qD7X5Up7X75DnFyiOBXmE9p2SxRcrJ5u7PVnsvkbqPuQeg7VzHDe1+O4qQPf6WwZcjRDbhiJXR7jcZ2vr6UHvhSHDiP1M0uMv3BTZGLsp4i9gDZhLGlCWNJrb0PRN418fE3WvPwr+VlhJSp80SQm6159GvVb4KCkFCZIG9lNJuLGwyqRHv/mATJLrh+fHgAVJjDWRxOafSwrU/VXSEpKINUnc1OK7JIcu+hwHHJE6Tu9n3TxaW0f3Vznxvx+DVDYeLzQeUYMvHXmdDkcyNDhyLDgitI1MZvVLCuGFc+jndK9zCEPsqRnipjZxMowf9bkGXfTH71DEWNtAanapiK0tyIO/G/cQpE4fogjV91JRqtD1vQ1Q5FhQRGgbmVyXQRFb28jsdJSge51DKGKspoibWnhXFKCkiFhWxNbWk/2yA1lEbAsyVYTSeamI5fWhP7nAhCLHgiJCx536rIpDiJBFDNF251Ff+QpFxJoibmqfdEUO6Q/4kUOE9mHIov9WzdXRRa9pIIhBimoXiJJKqK+XnrwGPz3qm2fhybHgiVD2xNba8+ApQMkTseaJm1p49+RQ8ERoH4YcsvDE5uooeXJq7gk18tIT6+jqFZ5kJYYnx4InQtsAw3tWQ5BgikFqh876K38kFKkmipvqg/6dyfhch/Q1n0gpxgpHHEyxtYIkU07NTaEeXppizVy9wpScNGDKsWCK0MwU21tf0hMuxAP0eCfrD1QRa6q4qYX3nEqQvh4RqohtQ5HOoYqt1VNS5dRcFarfpSpWyNUrVMkIocqxoIrQTBXbW1+uKkH63RVUEWuquKmFl4HgYi9AF/86a2DbUGSJgSoPklQ5NVeFGnipinVyG9+jv6/40bGgitBMFdtbX67KofBD+LE/zZR/MKx/AXoM6x+xbST64DdUsbkGklQ5NVX19At3IjZG70Q8+huKA+aqBjRRNdprhH6qStCjfyUysHI1NrXwllUJetQX+74+Dmx3dfwC861aq6egasQoaq4KVfUqq55YeVe806Ou3c+PAQuqGGsbn6waX1KIIIohanfCbdmwN9hp6fF77NHdeY8XfUUG1JHK6thae53UOTVXh3p6qS7U3I86pVDnWFBHaJZlbK8Rak9fU09hQRz705IsRHdRDtkkQ5RTbZI/71YECGd9u6E0sF16rf/HGusJBfNSFYvqNn2PulpDlWNBFaEPVXqsItEItM5q5/cpgKsAPepZ6FthTVb4pMsK0KO+yRO2iG1jkfzFisjWGogZf09UMy6uUDsvXXl9jcVFDg64ciy4IjRLK7bXCENaBShUxGOHmqrwSVflkFfEI/ieCm7KYyRTTs1NoXpemvIKG6bkDh5MORZMEZqZYvtPTQUomSLWTHFTC++mHLJZRk451WaZK6BDKh2ZRWiXXrsjOYXqeWnKK2yYkhsrMOVYMEVo2ys5ErH4sbVNpC9+AXrU18Bi8XPs4u/HCZSuoz9iqIuMH+rY4T7hdoHI1hravT/VeohRVbY4Qxm9dOal9ulRnwuHM8eCM0LZGVtrYGEVDFBy5lhy5lRw5tBZf9UFZ6S2ockXPDiFsbWGdlHvSDRSR+/iDPX00pnX3HAmSQJnjgVnhLadqgPp8557CBGcMUSNPrwzP4XCn6I/Hv64mvdgwZlDN/2JEJyR2udbxgZpbK7dxiwKBmvEfmoNpfXSmpff6K/W233KYc2xYI1QtsbWNjKZaFwaOpSsOYWdlmCwFjAZGVbHANmEQxux44TzlMbWGpuphzRS+/xUvh5y7elufZNjZ+wmh/6q/zlhZq2gba9qpz5yrVprZJZrCbpcRce3TMmR/T1RlmoJOutjx69FbSPTl7y+VXMN7aI/4Xgv6ihenKG8XmTa052X4Dho9do+YcEZY2VnbK2BBWcBwh8UP658kBYxuXqAtYBpqkUIf1342CW0MdZxxj9SrVprcKYe1nIMsYZ6fWnNa/oT/szucZ+RaY4Fa4SyNbbWwIK1ACVrEXNrAXNrDtmEQxqpbWzqFLnG5jY4Uw9txI7qRRtK86U2L9+hTS9Gnu4cC9oIZW1sbSOTpe9r6if8NfDCRnFWm1p4VxT2wf8aeMXaZ1dWXjgKUexMCEfEfuoI5fbSkZfkcCRzh9RyLDgidNwpnsTY2iZR+oEjh8769j+sh6SaIm5q0V2RQ+ebHI/IIlL/f8beLLmWWEmunUsN4L7DTfKQlFXVh27fTEITkMlMmr+98OR1RKS7Y4M//MhcRABYGeh2h2boW5jKEG93pFetYglyamzCJZdqm330xK14Ry1P8viUJ8eCJ0LZE++OSO7JoeSJ1PDES6N09+RQ8kTq8iRzeHni7Y6UPDm191T776Mn36OXJ2lheXIseCKUPfFuty9MVQ4lT6SGJ14apUsr/p5akTyxqMuTLG7KE293pOTJqb2n2k0fPXHH3VHLk6y8y5NjwROh7Il3RyTPJ4eSJ1LDEy+N0t2TQ8kTqcuTrFPKE293pOTJqb2n2j8fPXGP3VHLkyR7eXIseCKUPfHuiOSeAqQHAzU/kRqeeGmU7p4csi6u+cmp0cVcoTv0oicKNUuRupT30y/zU22Zj564rR7tq9/XtSW6Y8EToeyJd0ck9xSg4InU8MRLo3T35FDy5FTw5FDyROry1E//3dPLDw4twNihhR5I/vErYO5pQdHTujt60jwlyD0tqj2tS6N08xSg4ClQ7ilAwdOiLk/99Iun2hef8umFe+fRvvpdXM2ngAVPLCt74t0RyT0FKHgiNTzx0ijdPTmUPDkVPDmUPJG6PPVUJ55qI3z0xM3yaF/9WK55cix4IpQ98e6I5J4C9FvP///69UJsiOKlUbyLciiJciqIcuilfmP33nH/6ppepnYz1Etth4+muGUeDayfXL0HrJHPsWCKUDbFuyOSxPlLivPQLwUrUSxqiOKlUbqLcuhdT17+0aVfzZCH9p99e0SqHy+991gpCrG6QpJStS0+ivKtcz0ZXeK1wilRjgVRhNDCX3/Qbx36cyrFd1EhVHLFWMMVL40elIb8PVXhVfOlXHlRCpWxAKn2Ekbq0r5dTdTO+KjKd8+lqrOUqhwLqgh9q5JuKlO8P/rSs8qhZIrUMMVLo3SpQplyKGUVKTREXy8vR7zdkUx3OXJq6Jakqr3x0ZTvn8tUu6cpx4IpQtfzcx8OyhPvdvtCRjmUPJEannhplO6eHEqeSKEZUkZp4t0RKA1+ju091d746Mn3z+WpV5L05FjwROjy9AdpYpni/dFEzyiHkimnXvWjQH+LAaVWlWSpKKlWDYekwjNY8nh3tCzJc2wvr7bKR3ncTt/C9vKS8hwL8giFBpY63h2RpI9qiRGgd391MWDJXSrsnvvlzqGHfuF8uSOFpknvlDve7aa96i/f1PhI6t49MjDWtvnojFvrDvdSP7V5b1mtNhwLzgihUrJOKme8OyK5swC9hwU8sTEy8tIo3pMrQfqmjTJEDA3xFxLX7Q71qt8rV4pYSFPb7Hr84OgCjB1d6NP1x6+AuakFoYFpXbiArrzPYgmqH4q8Pzt/7Rq1rPSfJitA7/qq9z+69CsTLJ1CIWG5Eai9q9o8n7LqwQ326L76acZ7z5Qrx4IrQltXBEYwCfWXFKry3F2xrOGKl0bx7sqh5IoUmqLvN/1nqmNyxUK6PntXtcs+uko7cZ28y5VjwRWhb1fSTX9OhYS0YiHdwLDkWPUZpvwfX37piwV/j5V41zObSiyWdsm6P7rline7kvU8SYP/lbAB3aerR22kj7J8s11hbceFomSsDLIIfcvSVynLFoHRRk8sh5ItUsMWL43Sk62A1W/W3X2ULWJojPRH2eLdESvZcmxvq3bRR1vcad/C2mr+4ViwRWiXWrw/YrmsAL2NJl4r1JqxiA1bvDSKl6e9MsuhV/uxtERpFcqYF/Xypg965Rcx9ErXRxKrNtNHVb7hrsSS6bRGQceCKkI7Vbw/+tJVBah+o+z+3JcqYkMVL43iu2suxaUqQPWLWPfiK62IoSlytyTxbkcy3+XIqeFbVNV++qjK99wv9dtQ96qXKseCKkI7VbzfLQwTVoDqB6HuFSpVxIYqXhrFu6oA1c8X3YsvVcTuqXD5LlW825GSKqf2qmr3fFTlO+xSJS0sVY4FVYS+VYXpikA3MbgKUNgUrxoNV+E/03wVMJtqypZjo6cpzaHqPpndKsGIoWf6sZPMwo75//yv/13Lgsf/qBeA/vs/ryD/8+vxvZWugfT//dd//N+6XoleP5Vyf7zKkWPBESGUIhlZ6wneHZG6uld1aqEeoPpFkHt1Kpm+sZqwV61fdVXwt0T5G9ljUdLJJYwBrw66V6fSi3e7OtWJMn2UKceGdRFW++djfvke+6V+9eJeu3LnWHBHCA307wRKhYT0YiGjH970m8zLHrGRXrw0/lMGipq1AvSm30teroiFx7Bc8W5HSkOhU1tVrz84vgAjS/JSJVPqH78C5qoWhPbJRPDnVISLWkV0J7yEg6aFtah1af7n/Yn7e6zDux80rbIuUZLk/0ylvOoa5V+J2puqzfMpqV59g12mZDQrU44FU4TQwBc/gw+FBFcsZPR4/d7Bvc//mir0qgvGvyXKh8RUrfq+/HvEf3RZV+vud8ueV/tVV9Rlj9S9jPtY+Fq77aO2tCPXV3xLm2NBG6GdNt4fRsTHX1KkN/0KhLLmRSVrTgVrDlmHlzRS9w7/95Jj3R0tq6+Wv7sta7kQsVaz89Gab7kr2Wz18epYsEYILfv1B18hhlJCtrGUWw/I2FTeiI2RkZfGf9oUtv5vQPUd0PcOLkssC22RsadSi3dnIfYDJQnbj4y1ADzK4m77FtbnMMeCLEJXA8PIyPsjlqdYgOqbau+dWa6IDVe8NIp3VwF6041duSKGpsijW654tyOlScypvaraUB9V+ab7pb7b9d4zNRo6FlQR2uYVgW5iyKsAJVfEhiteGsW7K4e+9BS7VJFCU/T4v1zx9ohUXyB+77Ua/Rzby6ot9VGWb7tLlky3JcuxIIvQtyzpp1od8v5oojwWNXUFqL729N4PlVfEhiteGsXL/9Xq0KHfeoBTrkihJf4q5Lo9IiVXLKWxvavaSB9dcbPd5ZUrmSDLlWPBFaFtYhEYwVxWgOrrNE0WsSGLl0bxLsuhL/vGyG7vJrG8kOo1TyzH9rJqL32U5fvtCitzeclyLMgitJVFYPSmywpQGgWJDVm8NIp3WQGqL4G8PwuVWsTQFhlnahTk3REpyXJsL6t200dZvuN+qW9FvNe9ZDkWZBFCA2U9UGMg744GuqkAvetr2DUGEhumeGkU76YcsmVBiXJq9DHX7A69vOvcV7NWwOqLDVf/3hfvbz840wBjZxr6Cyd//AqYG1vQZczXg+v+6FRzlqCQXQtrZ+vSKN6cJai+f2714OXjH91eNEUGm3/23Y5k4v+VqCFeVNUW+pRcb9xmd9RKLkn9UuVYUEUI7evn52r9n1MRvhgMcao60uF/7bKGKAYfDZH/+3v/34De9CygRLEsNEQmzBLFu11IEuXUXlTtmo+iuLPuqNUztr54cyyIInSJCjnF+yOWPM1/+QqR/Fs9ExWOMUJZfowRoHCMsajwEJa70LIwhQVsL6/23Ed5aV9uP0vy9eZYkEdoJ4/3pzy3F6j65qr7kFWJ5ljS51TQF6D62qV7xMo9Yjn3eLcbZ89ADZKk7s+AjI61sz568933S33r0L3ONTo6pl35p4ZQKVt6hCLC6OhxakIXtyWN2Bgdean7LRhyyAa2EuTUyI1/Lz0ClJYeCavvB1r9K8Zqe3005lvwMibdXcYcC8YIwVh45SsUEpyxkO753/p+lVLm1KseKP0tUcFiKko6oCySuqcI9fFuV1q/VKSyjBCKGE+hSKt99lGa78VLmjzXJc2xII3QtzQ/7A2lBGsspTsgTW6kRqLxUv9jUOTQq79xI1Q0JJoX9a5HJqWKFDplfFxYVNUu+6jKd+KlyteLjgVVhLaqCIzOlKei1iEO6bftVX4RGqZ4aRTuC0aHkimngimHquckYqkihk7ptBVTtcU+mvJteMXzBaNjwRShrSkCozPdlEMf9mMLX2+khipeGqVLx9Xa3qGkyqmgKkDac2WK1GWqtwmiqnbXR1VhB15frLKmwWtUrvHPsaCK0FYVgdGZrsqhpIrUUMVLo3RX5VBS5VRQFaCgihQ6pQeru6n3H5xsgNGTjfq6FDUVMDe1oJ2pBYy+NFMJ+vKsWlirWpdG8aYqQEFVoFxVgF7sVbN/fS0M3TK+ck5k1fb6lFbvvgV/qa8wMVmOBVmEtrIIjN50WQ75XLWqPVT5//mqYv1f1yCp8qKCKofSXLUiPk2r2nIfTYVt+Zf92szXu2PBFKGtKQLdT74ADKGqB2S3+teu0XAVive0cii5ciq4ciimFbErrbpCkla1cz7K4u569F99IYellWNBFqGtLAIjmKeVQyGtCA1VvDQK7565Zt2/f707lFQ5FVQ5FNOKGDqlF2xiqrbhR1O+Va8BULrvj/VyuE1qwRShrSkCozMl1F9SqN/6zr3KKhY1VPHSKN1VORReP16loyX6YxP/7OAdyXzXLOWhhm9RVRvloypupjtqqeqlyr+XgO+OBVWEvlVJN/35KxSiD0WZYiFdobADXtQw5f8Y5iqHXvW95f9IdRid/O+zilWFrqi9Dl2+GPCS3msAMVX75KMp7qU7XpmSTq6kciyYIrRNKgIjmCeVQx/66lMlFamhipdG6dKQGv8cSqqcCqocSqpIoVPGZ9xFVe2Tj6q4lx7tq2/wsJnKsaCK0FYVgRHMVQWovpbiXqNyRWy44qVRvLtyKLlyKrhyKLkihV4Z3+sormqnfHTF3fRoX32dw71nKq0cC64IfbuSbqoBkPdHLFfl0Je+4bVMkRqmeGmULlWorHIomXIqmHIomSL13FRtlI+muJke7atvdTBTjgVThLZZRWAEc1UB+tT3IpUrYsMVL43i3VWA6vsV7g2u2YoY2iLL4VpW8G5HMuE1TTk1hN+z6vcPzivA2HmFfvnUH78C5q4WtMmqdb9b6MuKAIVlxaLa1LrUpdsvdPw9NeSlPmyvqkJho5v/vbAI0OdDHvN/dUT0yjhcEFe1oT7l1e+06dbPxpQrx4IrQru8CqUEWSyl+zwsLFZRQ5b/Y5KVKBnx/9HtRVNkQfzPvttVdOFlyUMN4eKqdspHV9xN38JK7cqVY8EVoa0rAiOYjYEp1HhR7nqm/9oVGq689OTKqepnGSpLFjG0RepYsnh3NMSys2Q5tpdVe+WjLO6nb2FtGfjbsSCL0FYWgRFMOuIvXymUry0WNWR56UmWU54UJcux0c8cBR2qsmTFWs6I3cVLZtWm+SjLN9YVT0aFyizHgixCW1kEnspyKE1ZpIYsXurSkyynqsEyz5QsYvcOpiXe7VBuvCw5NoyLrNoxH2VxVz3D6lvyS5ZjQRahb1kytPw5FRJmLBZyq1C/oYTDILEhi5f6P5Msp17qQ2+2viCGtsjdGgZ5t0NFWY7tZdWe+SiL++oZdrzAcvVNyXIsyCK0zSwCI5gPgwGqz0Xde7MmLWLDFi918cmWU2VLnqxKLWLZFu92qGjLsb2t2jUfbXFnPcP6L5H8dizYIrRLLd4fsVyWQ+Gduas+w5X/ox6X1cLdofr50/uTUKZIXaY8sXi72xH2WKuQpvamatd8NMWddZdXT5nUvfLKsWCK0M4U749YbsqhZIrUMMVLo3TJljLlUDJF6jIlVawhkLc7UjLl1N5U7ZyPpnx3XaZ8beFYMEVoZ4r3u4VhunIomSI1TPHSKN1NOZRMkUJD9LEtU7zdkZIpp7amPn5wbgHGzi3890gC5qYWtDG17ncL3VSAgqlFtal1aZRupgIUTC3qMiWP7T+/1u2OFEwFam+qds2nnPrwnfVLfUrlPnL/8StgwRTL2pni/W5hMOVQMkVqmOKlUbqbciiZInWZkrV8meLtjpRMObU3VVvmoynfVpcpWRuXKceCKUI7U7zfLQymHEqmSA1TvDRKd1MOJVOk0BB9bMsUb3ekZMqpvanaKB9NcTPdUcuULHfKlGPBFCE0MHzTTCgkmGIho0IfejT511ShqrdM/n+LmOvzkNbz/0hFjZ7/9+Y4NPFVv2zuX13U1VFr/Lpvij9qA32055vs6gXZ1ZQ9x4I9Qrs84/0hRvr7LymSfsVBuWNJI814aRTunhyyH0wsT06966cyKtucetWvwipRTg3n4qv20Edfvs8uX9LQ8uVY8EVo54v3R5e6rwDVW/jXI/nvQ4xVoWEs/Kc05O+pIfp0ljCWhIb4UoN3uxlJlFN7UbV9PoryLXaJso3Wh2NBFKGdKN7vFoZhMUD1tnATRWyI4qVRvIsKUL0J/F58qSKGpsh0XjnFux0pqXJqr6p22UdVvhN/qXf23qteOeVYUEVop4r3u4VBVYDe9dmpUZDYUMVLo3hXlSBtb6kihqbIg1uqeHdE+tJfMqjxz7G9q9pBH135Lrtc+WrDseCK0M4V748m+vjnUDhw/yA1VPFSl/6uL6vU+OdUtVdqUa6IoSnSG+WKdztUFSKTfLlybO+q9tBHV77PrrDyOFZeORZcEfp2peeif06lhMRiKbeO8MmK2LDFS+M/pSUlK0D19qj7QFKyiKEtPgbybkdKY6BTo2fv64rPH5xhgLEzDP3a8z9+BcxdLWjnagHdRHeVoHrLyb0z/9o1alfpP81Vgur9Effi/9HFR1ehkOAqUHtXtY8+5dWn77Vf6k0D96qXK8eCK0LfrqSb/pwKCapYSPsMY+CqzzDl/xjGwPWPXXy1V0a5UsXC0BS5+8++OwvxMXAV0tjeVe2kj658t111l/G7XDkWXBEKDSxTvNs1D6YCVC+03h+dSirHrNJ/S5S/VhKKennXk9uSx4hom4yYJY93R9vqlcl7tf/VGArpfJDRsPbqR2u+ny9rMk+UNceCNUJXpfz7S0IhwRsLuXWA9FN5IzZSjJfGf0rH/b3/b0D1sse9f0sSy7r3779PLtbdLiQNhiyjqX2C1eb5qMo32KVKpolS5VhQRQjtC9+hEAoJqlhIN/AlLN5XWUNV+s+7g1KVIF+8L+xS1blAV6GUsHpfpXRb9rJqA32U5Zvsl3op4N7GkuVYkEVoJ4v3u+5BVoCSLGJDFi+N4j2vEhRkEbtk+dTF2yNUkuXYXlZtoY+yfJtdsuRRKlmOBVmE0EJpYE1dvDsaKFPkXyJUR973Z6eGQC8rTV1OhakrQHXyeo9YoyIxtE2G5Jq6eHe0LU1dxK5HYIWQqas200drvuEuazLDlzXHgjVC90pdY0hZ493RMumcshagcOq0sJFg4T89wQL0FhKM2NUQeWbKEW93S9LM5dQ+v2orfTTl2+0yJU0sU44FU4TQwDRz8X63MAyGAQqfIlkVGq7Cf0pDauZyyHq5ssmp0cucvhyqkwUZmmo96NgoS3KrNtRHY77pLmOS8mXMsWCM0LcxP9AIpQRlLGV4rXOcNX5c/VWDIrGhjJfGf7qyANXxxb34ckYMbZGhprKLdzuSeS9XTm1dff3gQAOMHWjol/X+8Stg7mpBm+xa97uFripA4ZcUFtWm1qVRuplK0Jt+zv0f3Vy0xMbBUEgwFai9qdqTn7Lqi/v20b7art8fsjLlWDBFaGeK90csm7NCpHCcsahhykt/02/G+XtqyEttXe/tLVUsDE2R3vhn3x0Nqf3ZvZB/JWzvqjbZR1dpI+5f8v7lWHBFKDyLf/4KRYScYhHdC8kUqWGKl/ofkymnypR0cplybHTyv6esAFVZkscljGVdndInDvfJ6qs20UdVvtGugF3iVa9KK8eCKkJZFe92ZwZVDiVVpIYqXhqlS7dVTjn0rlNqiSIlnUtFvD0i1drQcsqxoVtE1T77KCrtxf373b8cC6IIoYUyaFRO8e5ooDzNf4lQzc73XvhrY8OUF5+SyqmXmpfu5ZcrYuGRq+GPd0dLLDMrmxzbq6rt81GVb7Gr7tLPlVOOBVWE0MCwZA+FhKxiId0PKatIDVe81P+YXDkVB0DHRjczuxyqvpNpr5QRuz/Bkla1Wz664o66W1jx5HEvV44FV4S+XenIUplFYASTUJVZDiVZpIYsXurSkyynoizHgiyHqvNkaV+yiN2TVGTVvvkoy/fWFU+G+ZLlWJBF6HqC/MA9FBISi4V0lz/0TY01CJIarnip/9FPltb/DchmmhoDvaygyqGHvo2xTJFCp3S/iqnaLx9N+Z66TPmywrFgitB3WunZR6UVgdFPnlYBevc98CpruEr/eZ+IammRIN8DL+yeChz8QiEmvCw5NoSLrNowH2X5prpkyYqm0sqxIIsQGigjQZni3aemAlRtvvd4ZRWxYYqXRvH9FF+dXKYCVBfvxVdWEUNDZO6ulQXvjkjJlGM7Uy+/fp3PK74hObB41H/ea//HyGkX/mlQ36llM9YgRkM1tyJVtZJe++vglrNxrSP4tBWxCiELg38MLjyA/xy3O5pPf/+K3BNztQk/JFmVyJ16R64GSF/CnHPJHKm9ORIdzyawGM1XGwOb4jxAFOdYtVuGBogjhxaJV4jj7dEcX8tH7om42kefxXGz3ZGrATKuQJxzSRwpNFMy5M+xkGSNhYwq6dcVId2ITWu81v8arTnmeQJrzo3u/p7XIlVdKMsBZB1LQ+d0atymtKJqa3225vvvCqmT2ndhMqAmaywNFZNnF9Z4uzs1WXOqqqQT2yhtavP/tQXj+M+uR0XQuW1w4SFEroVgPrtFbshXa7XLPlvzrfjj1/gKouuBQq45l6yRCs2ENd7u3krWnKoqSeYi2chNa7w2IsjA8ffxn01VBBkCkWteWnGdJivbnKvclUcf2ebcE3214z7r47b81hLJF+hzLukjtdHH2x1MO+MvMZS/oBKx6ltx9bfIKQWjoWr+Osvg0EIRhDz0YqpSYdgkd+8oTcDahp8Ncq/enVohpWow6FwySAoV89OrWExyyGK6Ui8f2g9IQXIzBXlt/K9ohTCnPnQHhAx0zD/zFbHqRBnokYChuK6b6qu9+VkfN/Dd2oosEwD0OZf0kbo/V9c4g/GTtztYkufUq67b4c6xqnn3xhUUCeicUvDp1OOXfb/h4NBC/fQnMjCVo08eTJK795QqrI37WaHv7qvqMt9AoXNJIanvDLTDk1hOsshyhuuYgs5ljc4ljU5VaTIAIi/J3bt/TYi83ZWvYkI+OvdkQqy9/VmmHwCUTJnaIdO5JJPUt0xJDmQkgW5oculUVUrWEUhJcnM45bURQeqB9HMqDqeOvelJDJLQsazPub2+l5+ctgCSzUH1lK9nAhf0LWqnbwGjc0VLrWgSlVJxcUPfujYiuL5AJX0Bq96R4spf5EL6Be6JvzoPOKbfix8aVA1l/Kj0C1zyx9KuUcZeMojFhPQLwapSssSq9MucjFo1IwYuDKWBetX3xdZIurA8kq7b/fy86ttGazoM2BOTtek/m+TJQAeuTvOFzYtzySQptFJG4xpGQyHJIwuZVdJvCoTHxOnXP8Kjc8mjU49fr7I8gEhyaKKMWMhJ3u7K2+MAkcTuj4Osa17qvOBs0A8VquLS+chF55JBUhuDvN3NSwadqirJYToMJi4ZdC4ZdKqiyjgPg+SuvpeOgkLe7zZGhcSeK6yzgLNCPzComsvDBYXOJYWkULFffwhL01BOsshyuh9e3vUN+LBIbs6HvDb/9/5iSi1n1n9OSoc9GGNp4aGEMN7uYuLg6diTwbO2/mdvPB/owOVNJmp4cy55I3U9UGkaJNDhkjanqlIyN0MbuamN10YEaQ60OVURZKKFNnL3DOHuYd3uYFEbS2nsibba+Z+1+fFA1V8WANDmXNJG6jvdVD+mPRLdguTNqYd+QhbaiE1tvDYCBG1O/dYjYFgjhvbI6Ilk4+2OFa059sRa7fLP1ngU0IHLWlipOJeskUIrZQ6AMt7uYEmZU49f+s1gcBY5WVtgpeJcmuecqqjSBogkt0k/3u4mVjEiHEsV556YrJ3+2aQfB1TkMN05l0yS2pjk7W5mMulUVUlyCCYjF0w6l0w6VVFlqIZJcqGJSEne7iZWMfJAwCS5+wOhi87a7Z8V+pFAhZQpAEOoc0khqXvFeB4aCkkKWcitF2RUh8LIBYXOJYVOVUfIqASF5C6FkmVwyPu32geH5O5dJQ4fPzmEAWSHMPrpvXIYuOBwUVcD70u9GlDX7W5fcBioxy/9ZFk5jJx+P2UNqIELDgNVUaXvy+Hi0ETJ0lK4bncTYxou7rnCn5zDPHhyMkPq9xNBoXNJIalLYViAhmKSRBbTlXp507dSQaJz1e0yDUCic0lioF51DwWJ5K7eDxZ5v2tftZKZoAbTeznreddErH3+cTB98DDgFlKqBovOJYuk0MC4/QvlJI0sp2uVNTqXNTqXNDrl3Q+N5O5JxL3Fut2Vr2JkfoJFFtPccK0ya8d/lsljgS6xIss0BJnOJZmkvmXKY4hxlUCHSy4DFVOS3NhcpAhSj9oTBqqa7fPg4tAg8YExlBXo5mRvzj3xVhv/szc/HXj80m+kgjfnkjdSW28EuqHJW6CiN3LTG6+NCMGbU97hyDfnRoevtHPKnwKkHbkre3vtpQlXW/+zOD8fKHFd5lU3iHMuiSO1FUdgdKss5+q1pBAsvf1zYdNbCBC8OeXf9znqgeboySryzYt51Q+Uwpdjw75aq63/2ZqfD5Q1WXPBmnPJGqmrmWsy5gYiFJKSjYW02aqSuMW6JXJh3eJcmvCcMgPIP8eGgZV/TlUT5OmBT3JX/q3+UpG18z+L9OOBChkWL84lkaRQMelSzHa83Ype9IQf2edYNhk5CYsVqHPJpFMVVeY4qCR37/zlkLe7jdkhuXsx6rD2/GeHPBi4hQxrFueSQ1Ko2K8/hAPRB4mOl/IxUP4DyNWf5OYgymsjgr0/BMsW56qzw7LFuZR+Tj1+6RdsIf3IoYc6O1VdbfXP6nge0A2tkGH2cy6pI7VXR6LjJXVOVa1kdMdQSm6q47URofvoyhKIc6oiyGCNZCOHFkkFMP/xdgez0RfCHBv6xdvrTw5fANnhi770VfNf4IK3RX17k+6qgXMB3c6gLVBp1bKwYW1dGwFSwgUuJlzgRo9zrAxUyZIBvPwt7noKemBTc7X3P2bcazog0BdZYc65ZI7UNuNCOUkdy+n+ty+qroRbhU11/q/ViZIrlXLrfztEpZzM9JVyi0OTJCMr5dbtWYwOuXDm1RpPgJqrffzZnG/2qwEyQcOcc8kcqb05Et3SZM6phw7gMEdsmuO1ESCac64a3mlwpRPMkduY4+0O57kLc849MVc7+bM53+5XA2SahjnnkjlS3+bCaEmgG5rEOfX4pd9xBXPkpjleGxGiOecqhkzvMEcOTZLURc7xdofL5px7Yq428Wdz3OnPyPp1SzDnXDJHap9zJDpeUueUf9XeqNQ05/+aR0vnvMthzrnR5Wuic6qeAxlckXrk7hmso2Vt58/mfM9fIWVuhTnnkjlSe3MknptzKi5RiE1zvDYCxJyLnPQ1zJFDk/RjZUg63u94/gTAmXPjCVB1tXM/q+P2fkbWb7uCOueSOlLf6sJwSaDDpZxzKpojNs3x2ggQzUUumCOHFkl7II63O1wW59wTcbVdP4vjnn5Gtm8Nqxo6l8SR2ucciY6XzDllX0+OeY7YNMdrI0A055x3OXLOudHla7R0qoYuWegh88ihg3rW1JSr3frZHLf03dAKKUsspJxzyRypbcoR6HBJXKDe9RQY5shNc7w2IkRzzlXDZWkGc+Tufb2U8XaH8wcAypwbD4Caq2372Zzv7R+/9BvRYM65ZI7UPudIdEuTukC96VuDoI7cVMdrI4KMctjOBepN38IDceTQIhlLMVjydgdLJygB23t7+8kJCiA7QbFvg3up9+MZF7wtapdxC+h2Bm2Jegu7ucUNbevaiODaEvWmR2ulbXFokJ5Wl7d1v6MlbwF74q227Md8e/N9feVbj77XiFD5FrjkjaWhmVJInXuFQtILBgF71Wm3ki1iMq3UywUBUwGVf4F61QkDHmcDZT6BRt6eGuWpqWFzYdfTsHvB56027md/vrsvfzIwwJ9zyR+pjT/e7uZFf45VnWSvAoGRk+6CQeeSQaeiQWJoovQTDPJ2N7HqLsdqUEjuucLawZ8V+ja/QsqDDIXOJYWkUDHpc6Qgb3f7okLHagEg3QWFidPvKoRC55JCp6onJM2QheTunc/Vy7rdbcwOczGybHmrTfzZIXf6t5Cy7oJD57R99YVli9o49EKiQ8ce9THjNdxc3QWH5Obsx2vdHj0UxqDpVEXw87DFoT3yECHnvJhXXbMi5Yjdrauu2r+fdfkmvyouExZ0OZd0kbpX7OpfpBxvd1+mtYpTaUMeCnvV4R755qUlf0696tyPdCMW2gd9vN3tq84UzfDn3JPFS+3mzxp9y1+RZdCDRueSRlJXM8MbbkMxSSSLmd0hIwGyzrEo0rEk0qkokthGJG/PmutXwEGkc09E1q7+LJJb/1tkmXUh0rkkkhSaGd/yEMpJJlnOrVYyMUMluTmA8lr/b/LmVD3AYcIjhxbJMIUM5O0OljPQuSfiam9/FucHABVZnnaIcy6JI/UtTlaCGEoJdEOTN6ceL/rZOngjN73xWkdI3pyqCGHiI7dJON7uYNmbc0+81RHA2ZufE1QD5MmCN+eSN1Lf3vTld4gj0S1N4pyqWslMAnHkpjhe6whJnFPv+uI6ZjxiaJDMJ8g33u5Y5U0eVwyUzu29vf/kmAWQHrO8vEgNy1vggrdFfXsL7w1bRLdUfdQ7/AJV3qQ/ytvihrd1rSMEb4GqCDJBlLjFoUXyOJe4dbuDxYQL3BNxtek/Jty7nwxUA2QugTjnkjhS3+KkpyvfQjHJG4uZ3aFfWQNv5KY3Xuv/Td6cqmbL/ABv5DbeeLuDxYRbxTT3xFtt4c/euM/vEh8v+hVr8OZc8kZq641Ah0venKpelWUDvJGb3nitIyRvTnmHw5tzo8O5IQ+UPwU1Xi4O3TNGNdnivde+/SyOm/tuZ4mTKRrinEviSH2LSyMliY6XzAXqdzhXWbWa5vx/kzmnXn7rr1rDHDm0SD8lj6GS97s9eah0bjwBaq628Gdz3OfPyDpJw5xzyRypvTkSHS+Zc6qeJ1+brFpNc/6/yZxT3uMw59zo8ZVzTunrEsg4UlfG9bis3mrrfvbm+/vqobA2cS55I/XtLUxxBJ5rc0p/yxsDJakpjde6/CTNqWq01BbSyKE5sm5BtvF2B/PxFr6cG+7VWu3Tz9Z8M18NkBoi25xL1kjts41EtzRlm1PpNGxVanrzf03enHrT78SCNmJoj6zWoI23uzGestDm3BNttUs/a/OtfGmTGkKbc0kbqb02Et3SpM2pqlVYmJCb3nitIyRvTlWEHriu4Q/iyKFFMkpDHG93sCzOuSfiapt+Fud7+ceLPnkQ51wSR+pbnIw72AgQ6IYmb069azQMk8SmNl7rAEmbU97f0Obc6O81twVKv1EVWUcMnTOeQh0ma5d+1uZb+dIWlpPOaUfWCzzvpPb5RqK7NXkLVFxOkpvieK0jJHFO5eUkuU2+8XYHc/9Q5tzwL+J+/+TEBJCdmIQvZAxcELeorbhFdEuDuEClhFvY8LaudYDgLVDe4ZVwgRsdzoRLVEi4haF3xi5fvdVu/phwv9OWXz9dWuNk4JI3lvbtzcfJUEzSxmK672sUkCVuDZSrtOnN/zd5cyrObyvC1dV+0rXuz5qGF+UCN/yruNrtn8X5kUD1kfQ4xDmXxJHaJxyJbmkyF6iPsH1btZrm/H+TOafe9YAPCUdMcmSlGu93czxxa6Rc5TT3RFxt0s/ifCdf4nwn8Nu5JI7UXhyJbkES51TaCaxKTW/+r8mbU9VsWUlDHLlL3P1dFLWiXLe7Ndkbi2nuibfanp+9cQ/fJVYDZNGNhHMueSMVmlnryVBIksZCblWSVTrGSXLTGq/1/yZrTukn0OCMVGgMnPF2h3rUtyrd3SLXnHvirLboZ2e+j6/Ivpz87VxyRio0E854u5uZnDlVVZKZBc7ITWe81hGSM6fe9Tt9II0YWiPxIY23O1aW5twTabVBP0vzXXxFls0lEs25JI0Umpl+NSgUk7SxmNkdIdOITWu81v+arDnl/Q1tzo3+XtNbokLGEbs/0boeqd352Zpv4av+smaDNeeSNVKomBSCVOPt7tL01ryAVZ1kjYRcY3HTGq91iGTNqVdtDqQRu/fzssXbHasmNRmmMECSQzGdEKqr9uNnXdy0z5D6UQvock7bVxvtRaFi8ev3FtHxojEP96pv+IAwYlMYr80I8ujUmynXvzb2pgt2GPPSUpo5Va9aSlCII/dcXO3Kz+J8617PtKyjIM65JI7UXhyJ7q8ozrEojtgUx2szgvQhxDkWxTmWxDlV4mQRDnHknor7+MkJCSA7IXnz9WPggrhFbcUtYnZrDxrX2FNvKglYErewIW5dmxFcXMCSuIAFcYEqcbJ8KXGLey6ujgGOGfeRzgr0244r4wKXxLG0vTgSs1uDOMeiOGJTHK/NCEGcY1GcY0mcUyVOHn+II/dcXG3fz+LSHj981/OHc0kcqb04ErNbgzjHHlqrmuNWraY4/1c7F6uhcv3rqMhDPwpck9zi7n3NZcm63cU8XvSLqaHMazUeAFmdfNTG/GzOd+8VWbIcKedcMkdqb45EtzRNciFcNMfSpjlemxFCygXsoR/SgDlyG3O83dGyOeeemKvt+dmc7+ErsiQBzDmXzJHamyPRLY3mHIvmiE1zvDYjBHMBe+gnc2GO3MYcb3e0bM65J+Zqj3425xv5iiwNhTnnkjlSe3MkuqXRXMAe+lWbGC7JTXW8NkNIizBcBuyhbYI6cht1vN3RsjrnnqirHfpZHbfxt8iyz4U657SZtZlb1F6dlxPVORaTjtg0x2vdojjRBeyhn9OCOXIbc7zd0bI5556Yq8362Rx39LfIsg+BOeeSOVLf5uQBqHOTUEwUx3JGrdIKhdgUx2v9r1GcY9XjsouFOHJokcz/dUi5bne0LI7FNPdEXG3Wz+K4o+8SK7IsZyHOuSSO1NXM8Jm4UEwUx3JutfJjylXcNOf/G8055l0Oc86NLl9LTKceL3pYjSUmOXRQH4zp2rJ262dz3NLPPgpfnf7hXDJH6jvlwmdyQjlRHQvqatX7A2UkwDxHbqrjtfG/+nI55rmE6SeVoY4c2iRLNyQdb3c0fwLgzLnxBIi6z58coQCyI5Tw/emBC+oWtVW3iG5pUpewpG5xQ926NkP4EiVi4dhycVndut3RorrAPVFXO/Zj1n1yWz8j6zvya7wMXFLH0r7V+UQXionmWE7XKibdKm6aC/8bkm79a4eoEU4MV9ItDk3ymW7dnsWEvXjgnpirjfvZnO/uqwHS5TDnXDJHap90JLqlUV3AYtKRm+p4bYYQJTVehhbVW0il5VDH4jZJx9sdLSedc0/U1c79rM6396VO5hSocy6pI7VXR6JbGtU5lk4uV62mOf/XtEhZ/zoqYsf7MMfiNknH211M9Z+sUmumW8U098Rc7dzP5nx7X5F9efnpXDJHam+ORLcgmnMsmiM2zfHajBByLmB2vg9z5DbmeLujZXPOPTFXG/ezOd/dV2RZgiPnnEvmSF3NDBuDUEwUx3K6P14+9BuJa3UZinu86I851BefBC7moYet4nr9fm0DYJMcmim3a8W5bnftqxiZJJGHLKa5JzZrM3+26Tv+iixrYth0Ltkktc9DEt2CqNOxmIfEZh7y2owQ8jBg9nINzJHb5CFvd7Sch849MVe7+bM53/KXOWkozDmXzJH6NidrgDpZCcVEcSyn+yMvOMlNc7w2/jctOB2rhkuNYc650eXcoAeqSpMlBFLvaWm62avd/Fkgt/zd3Iosky8EOpcEktqnHomOFw06FlOP2BTIazOCPJFYdgbM3lQCgeQ2qcfbHS2nnnPjOVBztac/m/ONf5kLixfnkjlSe3MkuqX1ZR3ypNRbHT4Dl+ZAYlMdr40QKfcc8z6HOudGn6/cc6r6UZYSyD3nRmli8OsnBy2A7KBFf+Whci9wweCidoPnAmbvyiRb/hKWtnyLGwLXtRnCcy9g1eU+eAZudDkFBurxoj9kUQIXhw7qdqu5OnA45t6Xn0pUSFkqwZxzyRypbe6FctKoGbD0UtDCpjnW4WAuYOk9DysEmiT9UkvNdbuj+QMAZR5uPABqrnb2Z3O+/S9z/TRcDxXMOZfMkdqbI9EtjeYci+aITXO8NiOEnAtYes/DavjGnBeTzTn3xFydAJzNpWOC8KMhX84lc6T25kjMfpUHBcOlY9EcsWmO12aEYC5g6T0PqyYbc15MNufcE3O1sz+b8+1/5ZwM98g555I5UntzJGa/BnMBixMduamO12aIoC5h4bWg1fKNOi8mq3Puibraxp/V+V6/1MnGBOqcS+pI7dWRmP0a1AUsqiM31fHaDBHUBSy9XWW1fKPOi8nqnHuirvbxZ3W+2S91sl6HOueSOlJ7dSRmvwZ1jsXxktg0x2szQjAXsPR2ldXwjTkvJptz7om52sCfzfkuv8z5zu7LuWSO1Lc5GXbrUCUUE5coLKd7P4ojNsXxWv9rOscMFfEer31d4EaPr22BB61e9H3d89J0jVnb+LM/3+vXp3zlc2HIPOeSP1LXYxoOp0Mx0R/LaQn1Apn0Rx1Or+KmQP/fKNCxLNC5JNCp6kY5t8YmgRw6qG+rudq+n835Hr9Cyv4F5pxL5kiFAQZ5x9stJHoLWHpRIRRXnS9PXb2oELjo0sPGQ5ZQXHKZStOXKOCS3DOX9b3/Z5cXZKcr+q7FP9ZXKfspjLtsChVLn71r4qnOiIWlS3Odhn1thrAJMGP+inpz4fn8Z+wYz+Z/RW48Afc0rM9b/kSdb/srDaWhUOdcUkdqr47E7FdbuqRw6WWF5qa6FEJa9PfYonozhFTlH4PbqPNoWZ1zT9TVlv40gtbvToQzTf0NFahzLqkj9a3O1i6pGP9YeaLqebp/M8JfR52mN9agH403/agsvCVM5g1oc2z0979XLomq6sqmC4nH0tA7u4mvfrziJ9p8018hbbNwFSaDatLG0r616ffl/LmqTqK7NXlz6vFLP7ENceSmOF7rCFGcY9VwWWvDHLl7Xy9lvD2jiX8Yc2z416GydvPnfPMtf9Vfnm3km3Payj8Nai/Oy0ninKpaecIRm954bfZkP9xXhyPhHHvUs3EPAW/k0CIRgjmOt2c0weDNsSfeait/9ub7/aq/tBPenEveSF2t9D1CKiZpYzHdG1GbY2/6ixR/i1WPGRhK0x/dgEhimwTk7VF1e0cTTJK7F6OpV3v6s0Lf+JdCmauh0Lk3/e435B6xe82uBx4jJm93A5PBQH3pF3dhxCQ3M4/XOsKnfgkrMs+xarYsZSCMHNojMzcyj7dnNBki4IsYShnfA6XCarN/FhZOBB66LoYw51LOkULNZMiAL97u9iVfgfo1vt3zsg9f5KYvXhsRpJ+hy6nSJYsJ6CJ3dfR9HIUu3u5gJV0edvhy7slIWTv3szVu70fkx6+wNHEuWSO1scbbHSxZC1S0Rm5a47URIVhzKlsjh+ZIDsIab3ewbM25J9Zqj362xo38iGzvbEOuOZeskboeTukuJBvvd7Q3/V2Lv2RM38GCZGNpUxuvdYQSIuMV0i1xOjki3cihRTLtQxxvz3C670C6kbsXI6Pjy0/OSwDJ0v5R39Z5HwnKWOCCsUVtjK373cBkLGB1WCXL81K2uKFsXesQ+jM+JSxQ1WwZ2ErY4u49zQ3Aut3BqhjJyBK2uHsxKqz25ccUe/HNe4WU5ICwwMkTV8uPRaFi4RvcGugWhuPKhFWtZL6BMdZqGuO1GUL6EMoC9ltXKlBG7noG7w9y5di63dGqpjKxQNkspjtOldVm/KyMO/ZbSHmcocy5sfa5njkoI7VVRqDDRWWOZWXkpjJemyGCMse8r6GMHJokYw+U8XZHs1f2YIwYSukxWo3VZvxszHfsVfEu83IBY4GTQQTGSG2NEegG6lhU89gqpqlHzUb3Jxw55qUV14/wVfnaqQVOP0uBtPPS6mM64hoOyaGREgwOebsr/1vf5AmHxJ47rI352aHv3qsb5OmCQ+f0Y1xwSGrrkEA3MDl0KjuMnHQrHDqXHDqVHZJDI6Wn4JC3u4nRIbHrSejnUxOx9uRnidy4d8jqL0kxSHROFzGQSGorkUCHSxKdyhIjJ6kDic4liU5lieSu7peugkXe7za+6zSDTCR2FdMPg1qsnfrZIrfzHbI6LKxZnLNvgYZGYluNBDpe0uhU1hi5oNG5pNGprJHc1f8SDRp5v9sYNRKTp0E11gb+rNF3+dVhsshDMjqncycsktpaJNAtTBadyhYjJ+s+JKNzyaJT2SK5q/vliYdF3u82fvqnEBpDMV1nlVj7+bNE3/RXf4XFqHO/dbEBi8S2Fgl0C5NFp7LFyHWPrLWNc8miU9kiucuiPPCwyPvdxmiRGIrpHleLtbk/W+QJQEes/goL1MDJlACJpL4lhlfuFtHxkkWW01RN1r0CuOxghRq5sLpxLll06kPfN4cFKjE0Uh94SOT9rrw/DJgYyV0PQz96ovHxk9MXQHb64r/sU1/m6Zx0V2lc1FbjIkYb5XGojUagosbMSb1qSA1c0BiopHFhaGQn0fVolcV1e7TQtitlcXGXxS5HLdYpwDEZHzwq6JjVX9KvNS8GThdesMjSvi3KnFHHngvocCEXAxVH1MjpzgwSWa2OmiQ65UlUybhKQyP1EAcavZw0oi7sKqYHZrVYJwNnizw+6AaWRel+WHQunIQuamvRi0kWncoWE5csOpcsOpUtkru6v5NoJSPvd5dGi8SuYrrH1WKdDZwt8gChQ5bFfjKuqsFi4GTkQi6SumoWXmFfQIdLFllMU1Wpnjo4L67SxlHbutb/q6e9dUoTKHt7IdKOFbnacz85Qtbx9oj1O7wFaXEopntNfdU5wNkXDws6ZHWNPErw5VzY4C9q6ysUIwM1JkCnsi9y0xevdYOSL6eiL2Joj9QTvnh7xIq+yN21q6/a8Z998VigQ1bX+MLz4ZxaRX6RQsXSyw8L6HApv1hMUw/9Fq1adobCHg/9rSRMdV5cUhio3/r5NuQcObSxk2WNkbw96y7jFdYrxFBKjxyqsHb7Z4U8EhgRH/7DTfUmV1t02rdTwCGx6+FKYySBjpccOlVy+txpjZHkZs7x2ojQ08j1nxgjnaoIklUQRu5qkA+SvN3BLHUhjNilvduhxuoA4GzMTwmq5nImhEHSufSeo4VtjXk5yZhT2Ri5aYzXuhNTijmVjZG7+tqN8XYHi8aIXaX0c6HGahd/Nsat/gj50F9HgjHnojFiqNqvP+iqFJsCEh0wKXOqOlRGG4yU5KYyXhsRQpI5ZX2NHCN29bUUg5mN9zvYm24TkGTEUMzY06uy2rKflXFf3yGrb3qovYYRKHMuDovE9spIdMCkzKmsjNxUxmsjgvQ1xkWnojJilzLpFyjj/Q4WlRG7lHUxouz1J8cngOz4RN8nUsoS1/l9ia2JbFHfxqSjKscW0C0MwgJVwmSFVDkWOf0m8FqNBC4MlYmypWAl3uLQSOmDkrhudxPtWai8W9glsQ/4VGLt4o959+pb/XptSBZKkOhcenFoYVuLqZz7nFFbgFXM7Ah5JCDRCyvZ3SHXswWJziWJgUpLylXa1f33ukOiFxMlErtK6Q5XibU7P0vkFn5018N/VObl1blweLKorUMvJmWiU/VkyUMPiZGT5RUkOpckBupDf0ULmUgOjZRgkMjbo0f1fQnIRGKXxG6bSqyd/Vmib/+rv+ShRyY6F17fW9RWYiimG3BlDhLRqbS3S9jjXVY2cOjFJYdOWQZBIbGr8yUYHPJ+O6wvmu1Mu9oIieRQTt9Wh7WLPzvkVr9DlsOeZq+QcBi4jnxRmBJJfTsM685FdLyUiSynqbiIWaWNRcy61v+bjIUImi4wRuwyJsdMMMb7HSwtYhZ2FdMZosZq0342xp19hyxjUjUYc67ekXMf/KGM2F4ZiQ6YlDmVlZGbynhtROhOuh6uWneumjYVk4yFoUH62hiU8X4XE5URu5T1ckyV1bb9rIx7+w5ZyrrMlWTORWXEvpVJT2HhSaDjJWNO5YVn4tLC07mUeIGKC09yaKQ8trDI291EexgwUhK7HoYe1tRibeXPFrnfHyEf+vsoSDznvvQtaEg8Yt8W01hJogMmjU7Vm2xkbMaqhdxMPF4bEeRxQuI5ZX2NsZLY1dcyIEEZ73ewqmifdF1ZAGfkUE63Q5XVVv6sjPv9W0hZNECZc2mFQurbmHQU8o5Ah0vCnKrRQCoFYZGTVMASxbmUd4GKy0xyl8X7dAGJvN1NtGcBDoldpfRIpxJrc3+WyBOAEfKhv9oBic7pe0mQdqS2Egl0uCTRqbjMDFhcZjqXHDplnY9EJIYm6pE4HPL+aGFcZpJDOZ2n4vDtJycvgOzkRV9yKYeBCy/bLerbYRg6FzGaKBlWe4VAxTXL4sbQua6NCDIi1NAZKFtslLGFXT3tG4N1v4OZ+Mq6hV3ie6RQY7WRP2bdG3f7I6TFhLHA6aBeabewq4XhVZ8FdLyQdoGqOaTn9WsOqbFzcdOY1zTk2PrPUY9P/UIgKGNpaFAwxttdTH3QXA56oIwcihnvO1BltW0/K+PefsR8+A+VvLwFTrd8UEYMVXtJygh0vKTMqVLWU8JSRm4q47URISSZU97XUEbu6mtfoKz7M5q+7QLOZjnbBcpbbdLPyriT75CPh34dF7IscCnLiKGFj6SMQMdLypzKWUZuKuO1ESEoC9Sb/gQZlJFDg0KW8XYHc/MwRg7FjLN1zbLazZ+V+Za/lPVjwM3cW+KkCcgyYqha/MqwRXQjkzOW01RVq2ftlWbkpjNe6/9NI6NT3tlwRg4t0n1iLT/W/Y72/ir9B2e3YtZCVJXVNv2sjHv5jlh9I+sBZFngUpYR2ysj0QGTMqeyMnJTGa+NCCHNnMrKyF3KxAWU8X5Hi8qIoZh+1FVZ7cnPyrhx74jVN72kWVkWOKk/kozUt7G0YCTR8ZKxQL3rZwSx/CA3jfHaiBCMJUpPD5Bk5NAimUwhjLc7mK07kWPEUMr4gJUaqx352Ri37R2yjEkLkWSBC8ZI7Y2R6HjJmFPv+s3UEEZsCuO1EUCagxW+U+/6/cnwRQzt0dEOwni/g0VhxA7Cavt9FsY9eocsYZ22K8WcS29geCO2N0aiAyZjgYo5Rm4q47URIShLVMoxcmiRfjsHnPF+R4vOiF3Oeq+iSVa77bMzbsk7ZDnrMpcz56IzYntnJDpgcuZUzDJiUxmvjQBBmVMxy4hdxuRRhjHe72DRGLHnxt5/cvIByE4+/AeYXgKX3tm1sK2xRXQbg7FEpSxb3FC2ro0IrixSIcsWdznzXdm639GSs4VdzroYybL32m8fswyQO5NZtqaywEVnLG7vjES3MTlzKmXZqtVU5v8aVvjrP7saKcsWdhkT85Vl634XE42xTgdjtds+G+OWvEPWh1TluAXGnAvni4vaCwvlyH6izhdXOV2ruuZ7ssVNYyGCdHWtPtZ/3iJITWr5sbhLmTzJUObRojJil7IeXzXJart9VsY9eVe9lMlKEMqcS8pI7ZWR6Hgpx5yKOUZsGuO1ESAYcyrmGDG0J7yKHXolCpvFjI/eq7Daa5+FcUPe7Sth8jRDmHM1864N/LVEqT3ZwvbGQkHyaCPJAhWTjNxUxmvdpDQsJirNZOTQop6BrgYjx3i7g0VlxFDK+Ii2Kqu99lkZN+QdspRJH0KZc1EZsb0yEh0wJZlTMcmITWO8NgKEJHMqJhkxtOclGOP9DhaNETsYq8322Rh35B2yjEn2wFjgwlHVwlC1cOyx7ne49AV7CdOD8dpFL2wK84q+6Se7MJE5Vu0Ws5jIyF3K7oMKcoy3uz1VTE9UVy7Wwcfi7sVojtVu+2yMW/JbSN+SvQcuGSOGmuk7g+s9BqGYN/1EBkZFFjNq9S6PEYwRm8Z4rf/1TV9FhjHHqqsliWCM3L2r16jI2x2tipEVCoyRuxejxmqvfTbGDfkM6b+88/IeuGSMGGo2DtGuFsIY73e4mGOO1Td0yHoIyshNZbw2QqQkc6xCyAwOZeTufb2U8XZHq2JkVoEycvdiVFltts/KuCO/hZTnGcNi4JIyYjtlvN/hojLHqiNk0IIyclMZr40QSZlj3tdQRu7e10sZb3c0Nw9l5O7FiLLfPzn4AGSbaP1weClLXFC2sKtmMqJXlq373cJ6n/R9gqhxMWDVEZ5lixvK1rURQmTXuBioiiDzQRlb3L2raWzd7mBv45XLCythC7uXosJqq33Msd/cj3fEqrgM6BAWuCSMGGoWP4MYCgqLxUA9wky2sCmMVegWheX9+s+mqt0yA0EYS0ODZNCspce6PYp51d+agLFZTD94aqx22mdj3I7fQnaZ10MCY4FLxohdz5IcniDFeL/DxRRzrPpTEqVGxVXcNOb/m4w5lVOM3D05Vorxdrenvn1KzMIYuXsxaqy22mdj3I/fQsowBWOBS8aIoWZhsRiKSYvFgFVHyOwKYww3jfFatyitFte/NlYh5KFAkrG4e18vZbzdxbzpW2dhjNi9FDVWO+2zMW7HO2JVXOYfGAtcMkZsZ4z3O1w05ljVSiYZGCM3jfHaDCFPPeYxxyqETAcwRu7e18sYb49oyRixeylqrHbaZ2PcjnfEqriM5zAWuGSMGGoWttChmLRWDFicxhhtCuO1blBMMccer/qyJYSRu3f1EsbbHa2KkUkFOUbuXowaqw352VjYtb/qIS+MRU5GzzpaXByqlpceXlJaejhVXRHGxcjJ4Fbv1F/16q5Ns5uX9qafTIRGx6pyMjBhXeLce1qWEEOfdbKoztqFn3Vyq97NrJrJ4ASdzqUXqRe2txkKkqcCS3+nss3IBZvOJZtORZuO1alse1jZ6Vy0Sex5ctYG/WyTu/ibTZkHYDNy0gIkJ7m9ThIdMSWnUw/9LgfMgAF71TdiIzedSzaderzqd+UjOcmhkTK3Iid5u1v4pjstDLEBG2/U1tysvfvZJjf4HbkaIDWETefe9HGETGJ7mSQ6YJLpVJQZsFd9JQYynUsyncoyyaGR8kBDJm93C6PMgI2P6YnMj58csQDSI5bXh8xPJTNwOruWy0VtXS6iWxpcBiq5XNhY6axrI4AMvLUyDVT0tjg0KLy8s+53tCQuYePzCyqutvfHLPzgGUBHrhZISyHOuSSO1Lc4KaY27qkYnx8DFb0x2vTGa7f2yFoE5iInK4MaPhd3mZOTiEq5df8WT+akGkAXJ0+AOqsN/tkZTwFuMWU4gDPn9IsFkGykvp2FfcUiOl5KNpbTVJQWsDQLpqDyPEFjLE22CNBIDo2UBw4WebvrHvMvYOOjg+qytv5nlzwf6Mj1BczynMGlc2mFurC9zFCQdEitUFc5o1phSZOwNAsGLsyCgcqjKZtw5ZL0FWzyflc+2gzY+ACf2qxjgbNNnh105LIpjyNsOqcf30dmktrLJNHxUmY6FTOT2BxOeW0ECFnoVBZH7hInAxbE8X5Hi+ICNj6xpeLqdOAsjkcIHbnE+WL0w7kkjtS3OOkwTIMEOlzy5lT0Rmx647UOUEbCNBi5MA2SQ4uCON6+hQuzIDl5AFRZnQCclfGYYMbU19mQa86ldxQt7NtZmgZDQWHkdCpKIzal8Vq3KI2STuVkI3f1tahHsvF+R4vJFrDxGUM1V7v9szkeCXTkSrawWXAumiP2bS5kG4GOl7LNqSiO2BTHax0gZ1vkQraRu9TJKAR1vH+LF9KNnDwCKq0292dpfgJQ0qSzkW7O6ZsJMLWR+nam5WCIJNFtTNKcitKITWm8NgJIc7DAdCpnG7mrq0UplPF+R4vZFrDxWUMVVxv5szjf7Zc4GQ8gzrkkjtS3OOkweCPQDU3enIreiE1vvNYBcrJFTsxga0DuMidrNZjj/Vu8kGzk5AkQZ58/OU4BZMcp+jbHcha4sBxZ1LezkGyL6DYGaYFK0hL2qo9SHY0FLkx3gYoJuLir+2VeLo3rfjcxJWDA9rPdZx0iHPMPkLuUNRRcOjdOWK9T9xo4F7V36eUkl05FlwGLLp1LLp3KLsldLmVhAJe8f3Dp2H4s/ay9/dmlHwA8XvXdDnDpXL3p/v4WMMgktpdJoluaZDoVZQbsVX8+AYnpXJLpVJZJDo2UPoBL3u4WxrwM2PiIjg6ytbU/y/T9f8mU1RZkOlc7VZdJbC+TRDc1yXQqygxYlOlckulUlkkOjZTJHzJ5u1sYZQZsfBZEZdZ2/yzTzwRKpkwDkOlcmjFJ7V2S6JYml05FlwF71V/JQGI6l1w6lV2SQyNlXQSXvN0tjC4DNj7moC7rAODskqcEHblcytMGl8696dv+McoS28sk0QGTTKeizIBFmc4lmU5lmeTQSFmcQiZvdwujzICNT0CozDoaOMv084OS6duPT+fCF18uau8ylCPDQJ1vr3K6P6JLL6wqL7mCxHQuuXQquySHRur7nSCT97vyUWbCenpTmXVWcJbJA4WOXP0hjxsy07nwauGi9jJDOUGmU1FmwKJM55JMp7JMcpfM7n6+jWZ1QndplMliJtaLEJVZxwhnmX7WUDLDxsS5uJgltrdJotuQhlmn4pujPhOnX/KF3HQu6XQqvTkqFPamb9BHhnpp6b1RC0OXdRapzDpYOMvk6UP3bf0EqJxmIDOdS8Msqb1LEh0vuXQqu0xcculcculUdOnYu77nHi4TJi861gv8C5M8F5lfPzn+AWRHBuE3SQKn792q9c+ivmXKOqqO7Bbw1GWiPvSdIvU2t8WNM7t1bUSQetRZa6Asa+rAbmFoTw+BHFDX7Y5VmSCzRgkL3PjFENVWRwnHHPzy84aKLDWsHAxc0sbSttoIdENDCoZg9XYH6XxoY2lTG6+NCPKf0OZU1EYM7ZFSKs1CKVkbi+k6PdFWpwZnbX60UJGlhtDmXDigW9S3tnDYuohuQfLm0apWsm6GN3LTG6+NCL/0rZUw51zFkOUtMo4c2iRzCtTx9i2cPPfIOHJXMb3Q0Fyr04GzND9CqKr3HHqNBpDm3KdOLBgjie2tkRiNlEGl9hWrnKayNZY2rfFa/+9LtOZctkYObZKqwhpv38IFa+SuYvoBVGt1DnC25ocFVfV+EpY159J7fr+I7a2RGI2UroA1p7I1ctMar40I0Zpz2Ro5tEkGIVjj7Vu4YI3cVUw3Wa3Vhv9szU8F6ofJZQmEXHNOKaQaqb00EqON3YLrGYE0p7I0clMar40IUZpzWRo5tElkQBpv38IJhwGSHIoZbxtTabWxP0vz3X9Jk8Eb0gKnbxSCNWKomuxisYTk7dHCoMypqpOUhjmN3FTGayOCpAdmNKfq87j3s3pMaMTQGikFvni7Y73rJ0ShixhKGe/qVl21dT/r8v19dY10IXQFLukittHF293AtARxquokjy10kZu6eG1EkI6GrkDZLA5f5Da+eLuDRV/EDr5q83725Tv86htpIXwFLvkitvHF293A5MupqlPP2NfICV/kpi9eGxGkNfAVKFsqwxe5jS/e7mDRF7GDr9qgn335Lr76Rpa68BW4kdpXF2I4JIaqxc91LqLbmJSxnEG9j5+DXsrITWW81v87Pgxy/SeUOfWur/nCGDE0SLoFIyJvd6zqPlluY0h0buyk7gPj49cPzkIuyM5CtJ1/fImci2vsW5w84n+O5bi3Lqb7o765Uvrjr6O09pb+V9vz9/GfHeFdNy7/GBjaIzPpP8ftUYra/9fAUEpPl+qrtt6nRHv88v3549V/RyRxL/rxxT9VzVjcty/fTjfRTUzCWE5TVS1ZDkEYuSmM1/p/kzCnQqJ1ADTIX9zp+x1MfzsDwhjs0t5TshqrHffZGLflHbG6Rp4lZJhz+kEVCCN1te8PIcEIdLjky6mqlKyH4Ivc9MVrHSH5cupdP7SOBCOG9kh8JBhvd6x3fa8bfBG7fPU4ob5qr332xQ15h6yu6WfgGvnhK3C62IYwYlthBDpeEhaoOCKSm8J4rSMkYU7FBCN2tScY4/0OVt0nzymUOfdkKqvt9lkc9+S3yLI+g7jA+ZqxMTT0V8o0LyeJC1QUR26K47VuURLnVBRH7BJna5BubwcrccJBHMtp7om42nKfxXFf3iVW5M7ilXHOxTmN2FYcgY6XxAUqiiM3xfFaR0jinIriiF3ievlwdQvGSN7vYNV9wkGcc0/E1eb7LI479BnZv4z98cu5KI7Y1dCUcQQ6XhLnVE3oYS1CborjtRFBxi4sHp2qCDKlY3Jzrl7aD2Omc+9aHAQGrCunc13txs8CuWXv5j5ex/s+V+Y5FwUS2wok0PGSQKeyQHJTIK+NCN1HV3sg0Kks0Ln6mnpJLaSgc1FgwLpyKrC252eB3MN3c0ugPImY8wKX5jxi26GTQMdLAp2qWslzj9UluSmQ1zpCGjqdetT2WE8iO8L1RMqZOsSFcl71W7iRes49GTtrl34251v56qN+GlbqOafvO8Eqk9RWHIHu1iQuUF/jpPyqFMSRm+J4rSN86je2IPUcq3bLKg1jJ7nL3F0sxPH2jCa9B2/ErlJ6DpBce/nJUQkgOyrRXwCrXAtcMLaonbEFdAuDsUQlY4sbxta1jvD5kAVfGQtYvbopY0wZW1w2tm7PaJKxZWxhB2O1Qz/m2Au38R2ynjVfWAYuGWNpW2MEOlwy5lQNLzI0VY6tSk1j/r/pNez+365JxejH/8pjKGN5G2W83cVUONkKwxk5FDPua5bVLv3sjFv5jlnO5DlBljmXnJHaOiPQ4ZIzp7IzctMZr40Iv/TDhkgz5x6v+mX1cEZu44y3b+Gk/+CM3MFZbdPPznwvX1WXxw3OAhdWIQvbSvNykrRApQ3cCjel+f+GVcj6z+7rtIFb2NXV0i01l637XUw98iHNvFL7RchLbdPP4nwvX+JkaIe4wOkbmWoVsrCrofc5u87+1+1uZ9IWYoWT5FXYtOb/mqw5lU4mVwA0RvIH0rwUPdRFlpFCIW1eB8bamZ9d+fa9XMmiGq4Cl5KMGGqWjrdCOckWi2mnVSt5djGbkZu6eK3/N+ly6j2s9FeALmwkxzXhwZoXpi+ewJpT1aheXaq+2pef9fnmvcqUdS/0BS7pI7bVR6D7I+lzyn7iHPaITXu81gGSPaf8/bGY1chdiSLdAnG839HsKYC5gO291Xb87M337OVNVsnwFrjkjdjWG4FuaPLmVNVKVrYQR26K47WOkMQ5ZR0ObwHrDl9p59RnOKFchaFzehbSdKu9+Fmbb9irg2QYh7bAJW3EttoIdKcmbU7FdCM2rfFaB0jWnNKDdEgjhdboy2lINt7vWOYeyRawdq/Waid+tsbtegd+vOl3WMNa4JI1Yvfn6XoqsR7h7Y6WnDlVdeq5/CoNqUZuSuO1jpCkORWXkcQuazICwRrvd7D0WunCUMz4sm7x9cBpx//5X/+7Tjwe/6M2C//9n1dD/+fL47rzX/9Ri9H/91//8X/rBvZ8+smekrQ4dkitENc1/Fd6Y08TXbqeZ/5llVOj/arDy2vYRK94N07k/W2VN9vkn3xKdauoPVBdPVT5taJefXNfB5eodbsrpQdglV2Bqi8V63MC9VV78GN+PbhR78ilzteQiQv5tbDrUbq3s/Jr3e5oIb8CVXXyFeTi+DhBm7cnaXPK3g8Ha8Qua93Rl1Vo4/3RnA995iCO3L1X1Fftv8++uEnvkNU3PcZeVUOqBS75Inav2VUKfPF2R0u+nKo6yYqtxsNV2vTl/5t8Bco6GsLIhebAF293c0w7dBET7eqrxoazL9+hV9/IUA1fgQv76YVdVfP88lKSr0ClY5AVbPry/w3z1/rP0dH6LjjoYmFoTXgRbd3vYsKOelEoZbxjSXXVxvusi7vzjli6ZBUNXYELb/VZ2EaXl5J0BepXeOvjCjZ1hf+VwaIOGtd/jlbXa8v3xwu+WBqaI1Mm0ou3uxh7rJBeAes6qbXaeJ+thd35m//sz+MRuGSN2MYab3czk7VARWvkpjVeGxG6h67BGdacqiVCsEYuNAfWeLuDRWsB6zqptVqGna35zvzxpj9ahFxzrpa294cTC0liaGY6vlpANzR5YzGDsv7AZEZueuO1/t80ODqVFvcrANqjX8YDb15MdZ/0C9LNuXEMpuJqW34W53v3iiyLXogLXEo3YtfzGd7kE8pJ4lhMd37aSa/Cpjf/17QIcepd3x6NQZIYmqPHkvDG+13P8MvijV29sp529VUb7rMv35WXr7DGD1zyRWzri0C3UKNhw+ZUbVhXQ69RDnlGbPritQ5gayoMkI5Vu2UfAWPkLmP3GkAYb3e0+rxNj31XTZFo5ES8KqtN+VmZ79yr6hITKeZcHBuJoWpxbCQw2igPCJQlSr+NCM7ITWe81hHS2OhUHBuJoT1aASjj/Q6WFo6kUMr42ggR9vqTt4IA0reCvOm720tY4sI6f2HXs3R/JGtftm53+0KGBSpl2MKGrXWtA6QMC1h92saXIIsLzSld63ZHixm2uKuYnnBUWG23jxn2yj15x6wM841Z4sKguDBUTYYYCPNoSVig0tpjlTaN+f+G/Fr/2a1O+bWwqzUyKEOYB7NiakRcGIrZ66rt9lkX9+Rd8dLlG7PXwIVzj4Xda8Zzj3W7oyVdIdYvfctJDYertKnL/1eH95rB1n92PepN292TV31rBltcePqgy4OlJcfCUMpHZ7GmV+3az764tR81f9PpHeNh4JIvYhtfvN3Rki+n6rMLMqnCF7npi9dGBPlP+HKqInRPLl/k0BxZssMXb3ewR5i/FnaV0kOX+qr99tmXb8of9lu28BW45IvYxhdvdwOTL6eqTtJd8EVu+uK1jpCGQ6e0n5FdpNCYkReXTeji/Y5lbx/BaEjs0tVJrLpqo33W5bvx6pou86oadAUu6SKGqsUXYUJByRjL6Z6oaslCEsbITWO81v+bjDn1rrM2lBG7nj8/uV/3O1icwGYx48PAqqy22Gdlvg+vvpGlApQFLikjdj1NYdccyknGWEx3RPxc9SptGvP/TcacSjlGCs3RN3chx3i/6xmFEUMxYypWYbUHPwvzjXoJk0EfwgKXVojELmG+pOftbmDS5dSrvtCK/CI2bfHaCCCNwQzmVH2WVhIICUYOrdGBB754v6NV58lMiEHRuf3p1GvtsM/auA2/Re7ZcQ2NgUvaiKGhv/6gn1vF2p5EB0zmnKoOkQUs1JGb6nitI6REc8pSBOaIXebECMzxfgezYiCOGIoZS1LNtNpjn5VxI94hq29k24FMC1xSRgxVe0lDI4GOl4w5FXON2BTGayNAyDWnHm/6CX8Yc27kyFqFOBUXjcQu/f38ibe3nxx6ALJDD/1wUHlLXPC2sJ23BYxulcVFnVIFKnlb2PC2ro0A7i1QcYxc3NUez7R1v6O5/0q1wA3/Kq625seEe/P9e0X25WPikjgWtxVHoFsaEi5Ei+JY2BTHayNAEOdUFkfuyhGZ/GqIDBXN4lhO1+qJuNqkn8X5Tr4iSw4g4wKXxBHbiiPQLUjinKptb48t1xBVc9uq1TTn/xvmtvWfXQ97J1uNlAu7xEkFIM6DpbltYShmfJOxplpt08/Gwl7+zX97sSz6WJqMEUPV4nIkFJSUsZzu0KqCpAyUkZvKeK3/NylzyvoayohdfS3bISjj/Q72rutNjJHEUEwfEaix2oKfjXGf3hGreBm+kWOB0xPJel16Yd/GtI9rAbmIDpiMhXC6UYIwYlMYr3WAJMyparcsnGGMHBqkTzKM8X5Hs684gLGA9fOn4mojfhbH3XoHrgbIKABxgUviiO3FkeiASZxT6YXpVaspzv81iXOq2i3LZ4gjtxPH+92cKC5ge3G1IT+L4669A9fjIfMuxAUuiSO2F0eiAyZxTlW1enBZ0xq5aY7XOkIy55T1OMQFrHucG4BE6ecbkHcsDL0z3m6jGVcb87M4371XD4V1ZOCSOGJ7cSS6W5M4p6paskrCWEluiuO1jpDEOfWufQ1xxNAg6RaMlLzdsUw/jAWs9au32pefvXHz3oGrg2TyRcIFLnkjtvdGogMmb06966ti0EZsauO1DpC0OZVOj1cAtEceG2gLpejTBW0B22urbflZG/fu3cjS1mVeIwG0BS5pI7bXRqIDJm1OxQmO2NTGax0gaXPK8gTZFjDpHNhzqjpRlnfQR+6eu5Ju7z85JwFk5yT6q2blLXHB28K23hbR3Rq8Bap6QtZLlW+LG+LWtY4QxAWqIvjKZHH3vubMtm53MPNfxhLW/lVc7c2PCffuG/haRfnCJHD6OmHtBBb17a2rdrWzNgIL6HYmbV6p+JLNKm1q8/9N2pxKW7cVAO3RnwKpTFv3uznVe7J+grcQrjtHvdUW/uzN9/kVWSZgJJxz6e1zC9uKC+XIvFEHk6uYW38Ih3xjaVMcr/X/6sxYr96s/2zqPbwda2FXuokQiPNg6Sh5YVcx3Q41VlvzszHu37vmZcxXJO+BS0MksW9jYdMdCkq5xnJu1eqH88pcKCM3lfFa/2/KNadefut3/tfktiKgRUGZFxOHyIB1a1Rc7dDP4nwbX+JkOkWqORdTjdi3uK7bGiMJdK8mb05VreQsA97ITW+81hFe9RNbyDXHKoTMnhBHDi3qJFlzG293tCpGpkgMkuTu/lVZ7c3PynwDX7vCMKs5F5UR+1aWco1EtzE5c+pVx2woIzaV8VoHSKnmVLVbcgnGyN27ehnj7Q6mn6iHL1KX9n7yVFjtxs/CuGXviFXxMJ05F4UR2wsj0QGTMKeqWvKIwxi5aYzXRgRJduSYUxVBZgUYI7cxxtsdLL3/8VbKeGeOKqvt+FmZ79mr5tJCDIvORWXE9spIdBuTMqeqWjJaQxm5qYzXRgRpEJQ5ZX0NY8TQoNHXK8l4v4NVRTuNLg5pRu5uXpXVVvyszPfrFVIGdChzLiojtldGotuYlDlV1ZIJAsrITWW8NiIEZU5FZcR2yni/g9XRlUwrUEbuubLafp+VcY9+CykjOpQFTsYp7M9I3St2PWrYnfF2B0u6nKpekLEaushNXbzWEVQ0MsypuDsjhtboggKLfN7vYO+6CIAtYvdOkQT7/ZNjEEB2DDI+sH11dNkKXEqwhaFm6UNNC+gWBmGBqs8PyTNUwhY3hK1rHSEIC5R9F2INiQtDe/RNsyVs3e9g73qIVMIS1jmv3mrrfcyy374/r0daZmF4cy56I7b1RqAbmrw5Ve+UklrBG7npjdc6QvLmVH1JZvfl9bxCHDk0SG7DG293sOgtYF2Yeqsd+tlb2Ma/6RsY4c256I3Y1huBbmjy5lQ9Tb4EWbWa3vx/kzenPvW7xqGNGNojzw208Xa3JmoL2F5bbb/P2nyPXh0kSx9ocy5qI7bVRqAbmrQ5VbWS1RHSjdzUxmsdIWlz6kO/mhnaiKE9MkxDG293rKgtYHtttfc+a+MGvQNXB8k6Ddqci9qIbbUR6HhJm1P1wpQsyqCN3NTGax0haXMqvRS6AlzapALwFopJs1vA9t5qD372xo16t7J6SB4seHMueiO29Uag4yVvTmVv5KY3XusIyZtT0RsxtEeWsdDG2x0rplvA9tpqu37W5nv66iCpILQ5F7UR22oj0A1N2pyqWslWA+lGbmrjtY6QtDlVixIZZjBMkrvy7f5xE3jj7Q4WvQVs76324mdv3LB34OohmX7hzbnojdjWG4GOl7w5VbXqll5LPXgjN73xWkdI3pyqCLLsgTdyaJA8OPDG2x0segtYt0YXk7UhP3vjrr0DV/3DqsS56I3Y1huBjpe8OVW1CqsSctMbr3WE5M2pihDyjdwm33i7g0VvAdt7q6352Rv37x243tog8y/yzbnojdjWG4GOl7w5VbWSSRf5Rm5647WOkLw5FV9XWxE23ryY6C1gW28fPzksAWSHJeGL+AOXvC1s520B3avBW6DKmwxT5W1xw9u61hGCt0BVBJkfapxcHBok036Nk+t2B0veErb3Vjv0Y759+Da+6t9l8pArcfoCZZ1JLmzrzeMlb05VrWT2gTdy0xuvdVeGtx6s/2zqXb+CD9pY2KVNBmp44/1ZjPReHXIt7G5fJraP2pufhfkGvrrGJzYUJgmppxbwRWrri0A3MPlyqtp8X8VBF7Gpi9c6QEozp3QzD1uk0Br9hjfY4v2O9T4+4XQ967CVsNUYlVY787M0376XNHmcalb7cC5JI7WVRqDbmaQ5VZWSpQKskZvWeG1EkMe+jv7Xfw7qM7yCvbh7elw+oM2D1ZvnZE0Ab84Nu+qtduZnb759r8jyYMObc8kbqa03AqO/ZLKq92WFYDHZWNjUxmsdICWbU5YmyLaErTRZ8pzSl5egjhS6ph8kdVbb8rMz37uXM5ly4cy55IzU1hmB7tKUa07Vj47JI4xcIzel8VpHSNKcitIS5tKcqurKcw9t5NA7/aSqttqVn7X51r20dZlrIeJc0kZqq41Ad2rS5lRVSlZ30EZuauO1EaGf7Ks5GCKd0lUzUo3U1c/yLGOE5P2OVfWUxwu+nHsyQtam/KzNd+4VWdqJbHMuaSO11UagG5q0OVWVCstHclMbr40I0hxoC9SHvjYMceR24ni/o2Vxzj0RV7vyszjfulfksI50LokjtRVHoBuaxDlVlZJ1EvKN3BTHayNCEOeUdzjEOTc6fE1uTtlbUZB2xNA7XScdJmtTftbmO/eqvyzakG/OJW2kttoIjE6VMRkrEqfewxefLWxa839Nk5tT77r7hLSE+eQWqPAR7VUY+qaHXJH2+ZPDEUCyF6tPEcjwXNICF6QtaidtAU+lBSotIxc2pK1rHSBIC1SSFjGTFij/tHel2uLQOeO9vaqt9u3HXPv0zX1pk1UQtDmXtJHaaiPQvRqGyBAsamNhUxuvdYCkzamoLWGuzSn/rDe0kTtoq535WZtv30tbZzBXkp/OJW2kttoIdK8mbU6965cV1MS26jS1+b8mbU6lrxxZAdAcHfVqJbnud2vMPnyFaNuJ7bP25WdrvnkvazLXINmcS9ZIba0R6HZqsJrYQrCYbCxsWuO1DpCsOWXdXRNbqEdYjQQqbLUXha4Zn0XSEbJ25Gdp3LZ3I0ua7I8gzbkkjdRWGoEOl6Q5VZXqp/PKf+QauWmN1zpCsuZUbY9lEQZt5K6ulv0Hko33O5rZR7IlbA216q225Gdv3Ld34OoiqSC8OZe8kdp6I9DhkjenYrIRm9p4bQQQ4bVpC62x1TqssTBJEC761/0O9q5fRgZrt2J6IFNftSU/+/J9e/nyzdqnc8kXqa0vAt3C5MupN30LFNKM2PTFax0gpZlTcUojdvmSwQdZxvsdLGZZwrZZVvvxszXftJc12c0iy5xL1khtrRHodiZrTkVrxKY1XusAyZpT6e3jq9FoTnj7+LrfwaI1jzZmRs212oefrXGz3oHLmgzusOZcskZqa41Ah0vWnKqPPcsOEslGbmrjtY6QtDmV3oW8AqA9Ide8lGgtYdtcq/362Zpv6quDwl7NuWSN1NYage7TZM2pqpTsRGCN3LTGax0hWXPK+htTWsJWf6+JzSl/zxdmNnLone3E9vWTkxFAdjKio0ElW+DS20YWtvO2gO7V4C1QaYxc2NC2rnWAoC1QulIva4tCa/TLBWpiW/c7lr4oXrYWhVLG6YWMjV+1Az9mGSDXJcMAdDkXdRHb6iLQLUy6nKo0k/Vfpdmq1fTl/6tbhVo5rv/setjrCRDGwqSrmWDr/ihGP4AMYyxmYN0a9VY78bM3365XD/l6/8u56I3Y1huBbkHy5lTVSla18EZueuO1EaH76OpweHOqPix3H/jgjdjOG+93sPfkLWBdJ/VWO/+zNz8eqB7yFeSXc9Ebsa03At3Q5M2pqpV0K7yRm954bUToPlrenLIOh7eASWEYJp16edVvvkDakZOnQMXVbvwszrfs9ZUosl7DQOlcFEdsK47A6Naema9ureOsEK1qJYskiGNpUxyvjQjS10g4p6K4gElhEOdUiRMO4sgdxNWG/CyOu/ZuZnWRLNkgzrkojthWHIGOlzLOqaqVCIY4clMcr40I0ocQ51QUFzApDOKc+q3fTABvxNA5Y/zQhKuN+dmb796rh8LKxLnojdjWG4HRq+IDCedU1Uo6DN7ITW+8NiLIf8KbU9FbwKQweHPqt35vC7wRO3irrfnZm+/fq4fCysS56I3Y1huB0avBm1NVq7AyITe98dqIIF0Nb4GyL6PBFEdO+notKXm/o5l/KAtYV0oTrnbnZ3G+ha8uCksT56I4YltxBLqhaaB0qmoVlibkpjheGxG6j9bSxCnrcHgLmBSGhHPqt75vGvaIyUOg3mpffvbGzXu3sr6sK6xMnIveiG29Eeh4yZtTccdNbGrjtRFAehr55lQ6+18YmpO23F6M2YewgHWd7tpef/3goOSCbOetX+79x5fEBW2NbbQ1MHrVxslE1cMkq6W/jlq1t/S/vvNOlHX4P0aArq4uFP8ZqRf7hol/De5pvr3+qn36Kd8uyMVJV0Kcb/rrOx3uW9U/DQxVCz8WlcrxfEtUeK2tsenNK+onXP2fQ4h+nxi8eWHJm1PpzT9d2tU5PaZpwtU+/ezNN/P1aNuCsn7xx4/EkjdiW28EusOSN6eiN2LTG691gOTNqffkLWA9wP17cRL7xn6iA/nG0q7O6f2oeqsN+tkbd/HdzPImdUO+BU5PxJBvxFC18K1NDXS85I3FNBW9EZveeK3/NXlzKrzq1rVFc7S5GCG9mHf/GruIdRerttqen7VxD9+tLG22D3j9FThtB7QR22oj0PGStkB9+YFJh5ve/H+TN6eq3bLTwEBJ7kqR+7QAb7zdzYneArb3Vtvzszfu4Ttw1d+2Aa+/Ape8Edt6I9Dxkjen6pUsmXSxLiE3vfFaR0jenErfa9ERroTrKWkNkV5OFBewvbjan5/FcRPfzSxxslPCOBm4JI7YVhyBjpfEOVVfTSvdBnHkpjhe6whJnFMf+kl+5BuxK99kHELC8X4Hi94CtvdWm/SzN9/JVw/1nHk9WPAWuOSN2NYbgW5o8uZU+mKLrtX05v+bvDllHQ5vAesOX1nnlH9LBhYm5CR7dYar/flZHDfx3ZElTlb4EBe4JI7YVhyBjpfEOZW+lrBrNcX5/yZxTqWvJewIV8b5DOfFmH8YC1j7V2+1TT978718eZO5BN4Cl7wR23oj8NybU3FBSWxq47UOkLQ5FX7st1uN5nRHr0TzUqK1gHVhYu3lJ+clgGzbrQc6ZS1xwdrCdtYW0J0asi1Q9Sx1S69uq+ltcUPbutYRgrZA+Xt4apxcXPa2bnew5C1h3Rr1Vrv4Y7a9hK3+u/8+w2vikjcWt/VGoBuavDlV3mSVDm/kpjde6wjJm1PW4dAWsO5wZl2gqrqyKK/BcnHonT7aUG+1Oz974xa+W1khfTn5ErjkjdjWG4GOl7w5lUbJVampzf81aXMq/WLU64qA9sjcUavJdbtbY/bhy6ONwUO11Vb+rM33+/XrBLLexjAZuKSN2FYbgW5o0uZU1EZsauO1DpC0OeU/qoZ0I7fRxtsdLGoLWCetaqst+lmb7+NLm28CXgKXtBHbaiPQDU3anErfufu6ajW9+f8mb06F79ztAGiPvksa6ebFRG8B23urHfrZm2/jy5vvAV4Cl7wR23oj8NxboL70naSY3chNb7w2InQfXRPS38d/DupLv2wY+cbSLnG2B1i3u5jqPhlOMU6ymOaejJO1RT+L8318Re4p82ooxsnAJXHEtuIIdAtSwjn1qe9Vgjdi0xuvjQDBm1Of+rYjaCO20cbbHStrc+6Jttqan7Vx/36LLO2EtsAlbcS22gh0vKTNqQ//UsKu1NTm/xpeNE3NsTyBNy9tdPhaTTr1pTspJB0xdE4vjXV6q/35WZtv4uuBkUM4aAtc0kZsq43Ac21ORW3EpjZeGwHkKcQo6ZTnCbQ5l7Q5ZYM6tBF7rq026Gdtvouv+vejsAbJwCVtxLbaCIxelcngL9VAp6I2YlMbr40AQZtTWZtzSZtTMduIoXPGR4ok3R4/OSsBZGcl+n7NSrfA6cFzvfS2qJ22BYxedW2JSi+9LW54W9dGBPcWqHddc1a2JUwKqyVloFK2LQyds/0wzuujtvnHdAPk2nzLHbikjaVttREYnRq0BSpqIze18dqIID1do2RqTtLmhYVsC4V96qcGa5Bc2JVtvezTbKv9+Vmbb+LrZ+F8y/1wLmkjtdVGYHRq0BaoqI3c1MZrI0LQ5lTMtoBJYcg2p770tUtoI3bQVvvzszbfxJc233I/nEvaSG21ERidGrQFKmojN7Xx2oggPY1scypqC5gUBm1OpbltYeicJ4Nkbc/P2nwPX9p8x/1wLmkjtdVGYHRq0OZUVUq42ritSk1t/r9hB7D+s+tREXrgupZimNxY2tXVtuFet7sYs488YykDa/s6SNbm/KzNd/BV/y6TS8mHc0kbqa02At2AsG8LwapSsi2BNpY2tfHaiCDNQbY5Zf0NawGTwpBtTr186pkF7JG7PwOqrTbnZ22+g68e8h3Aw7mkjdRWG4HRqZJFtQEIweqwV0ZuaGNpUxuvjQjS09DmVH2J+D2boI0Y2iP1hC/e7lgmH7oC1lVSa7UpP1vjzr0DlzV5uQjrf+eSNVJbawQ6XEo2p+qHxruh1wgAa+SmNV4bEeQ/Yc2paI3Yxhpvd6xoLWBdJbVWe/KzNW7cO3BZC8t/55I1Ut/W9DNqf67uItHxkjan6hd0ZXULbeSmNl4bEbqPLuHQ5pR1OJItYFIYcs6pF/vgCZKOHLqnhw71Vpvyszfu3LuV1UNd5pranEveSG2zjUCHS9oC9aarW2gjN7Xx2oggPQ1tgbIfGoY3cldPy+QKY7zf0Uw/hAWsKyXeXn9ySgLIttv+C26vidOXeOqYZGFopyzMKtvW7W5mXbxPKTW3Bezxol/8Xd4WN7ytax1C99HlLVAVQR7X8ra4e4ZcT3NpW7c7mM4wZW1RKGR8bE991d7+mGevfgBQeSZdWLNa4pIvFoeqpQ8ChHJCogUqvbS9sOmLNeguTL6c0o6GLVJXR0unQBfvdyxd0EAXKZTSqzy1Vbvwsy1u1Ttg2ZK8gK3AJVvEtrYIdLxky6loi9i0xWsjQA9AnMxCc8LHErvV945eyeWxqvMkGnw5N1ZUqq0262dtvqOvyDJqQ1vgkjZiW20ERq/K04tR0amqVT+gV79hVCQ3vfHaiCA9iVHRKTs3RJoRQ3vepKJIM97vYFmcc0/E1W78LM637BXZ1/yvgUviiG3FEeiWpnxzKosjN8Xx2ogQxDllJ4cQR2wnjvc7WBbn3BNxtRE/i+Nu/RbZl/2vgUviiG3FEeh4SZxTD/3ORCQcsemN10aAX/pdC0i5yMkTC3Xk0CIZiZByvH0LJ/2HsZKcPAE6StZu/OzMt+yPd/9Ry9fXwCVnxLbOCIw2yuCDUdKp6IzYdMZrI8Cv8Srkmt4iJ1WBM3IbZ7x9CyeLAzgjd3BWe/GzM9+wlzNZ92JmS5xMNVjuE9s6IzDaKB0FZ05VreSoCYlGbkrjtREhDJBOPX7pe+igjBwapCfQyDPe72j6dTwwRgqljDeVaJbV9vtsjHv0jlh9I30IY4ELbz9Y2NaYl5NGRqfq8873jRyEEZvCeK0bpB2NcdGpLIzcJUyeUAjj/Y5W3ReSzLknU1ptw8/ifK9ekeXRhDjnwonIorbevJjkzanojdj0xmvdk8mbU9kbObRHX5uGN97vaNV7MvEh1Zzbe3v7yYkIIDsR8Z8ifU1cmNYWdjX0D+K/zkQW0C0N4gJV/SHrhMq4xQ1z69qIIPWojEvUpw40NUQuDg0SISVu3e5gj1/hVezFoZjx1VgyRr7VZvyYaoBcmax+KtUSl5SxuEvZfVCDMN7uFiZhTj1+hzOsVdoU5v8bUm39Z9cjptrirp72IXLd73Ls2zgr0xLWT5Fqqz35WZtv3KuLfDHy5lz69p+FoZ3pS2QW0A1N4jxa1crntlXaFOf/m8Q55SmCTCN3iZNcR6rx/miPfZ8bzJG7OmY9z6qsduNnZb5lr87x1chb4qQPa/24MNRMbiPTvJQa8VcDrvV4LR8DVpWSOR5jI4ubxnht9uE9AsZGp3KqkbuMyQAEY7zf0V71eALCiF3Cul/UWG3Dz8Z8r16d04l7dSLGRudikhG7qpamMwLdxJRkTlWtZDaBMnJTGa+NCNIeKHPKfi4LORYwKQzenHL/EEcOvTO+fk7F1S78LI5b9W5mdZEM3xCXuH5mLr9INWKoWjrpX0DHS+JYTFNpAbkKm978X9Pg6JR3NcSRu7paugXKeL8rGs+yAvdkAVlb8bM47tdH5N/6c58Ql7ggjhga+kgZR6DjJXFO5QUkuWmO10YESRJkXKDCl382hwZJykOcF+OzI3KN3PUA9FiruVZ78bMybti7gZVrXeYaJBMXlBFD1WQ9g2mNtztaEuZUzDRi0xevjQDBl1M508ihNfrVHhDG+x3t8aZHDxDm3JNMq/34WZtv2h+//RdIX98SF7QRQ0NjphHoliZxTkVxxKY4XhsBgjinsjhylzhZN0Ec73c0LwfiyKGc8XXvmmm1FT8r8/16KZMcweDo3Iv+BB9mNWKXsvu6DZnG293CuIB0rNI/LCDJTWW8NkIEZU55V2NWI3cpkxpAGe93tLiAJIZixisWYuz9J+chgHRz/dt/ePQ1cToKlLGFXcbCdLaAbmJIskClJFvYMLaujQBuLFDR2OLQHv0SvTK27ne0euAlGSvJArcfHd/rgOCYaoBcnDxTlWqBe9PvuIA4FoeG/vpDeC/dIrqp2tDarSXqbRwAXXNtLf0XN9WxDh3B3qpcK5H1rxOTJWIl28LQIukXmPNgL28jma6Kwhw5FNPrGc212oSflXGn3hWvh0UeTihzLo2OC9srCwXJswllgYrKyE1lvNZNisoSFpQRQ4ukX6CMtztYVkYOxfTko8pqG35Wxr16hyxl/Rhw6fgeOGkAkozU3hiJjpeSzKnf+plV5BixKYzXRgCpKFLMKfsxDKQYMbRH1tPwxdsdy0pBhhG7dPVBmPqq3ffZF7foHbJ8yZOGFAucdAN8kdr7ItHxki+nfuun5+CL2PTFayOAVBS+nLLv5IcvYhtfvN2xrBT4InbwVVv0s6+wj//tPzdav6Bjs106v1oYqiZbgFowrtvdwGTLY9UzJI83dJGbunhtRAi6EqVvH4EvcldP39e/yC/e7mDvevYHX8Tu1jW9asN91sVdeUesL3yXd8ojvSJ3bwDyi9ilK60WCXS8JMyp9I7HFW368n/VCRnp5ZR1NHQRu3RJr8AX73drqvd6glpLDueeLBZr33325pvziiwJAm+Rc2/Ett4IdEuTN6eqVrJAQaKRm+J4bUQIieaU/TAWxBG72hPWirzfwaqiwiHTnHsirvbdZ3HcnN8iS0MhLnIujthWHIGOl8Q5lcWRm+J4bUSQ9iDjnIoZRwztkVKQcLzdsaqesnqDN+eeeKvd99kbt+i3yGEdEjn3Ruzydr+NeY23O1o6CAlYdUcvuNbejMVNbbw2QkiHQ5tTdoCBfCOG5uhhA7zxfgcz+9BGDMV0M2Ri+/2TYxBAtpseP+/GdX7i9NO0NbEt7GpgmNgW0C0MeRao9G7HhQ1f61oHCB+8CJT9Hlb5WtjVnPvjV7rW7Y71+D1OEjmvBW6fZr9r331MM0CmTY9panhMXNLG4rbaCHRLkzan0npkVWpq839N2pwKn5dZ5V+tkWkV2ryUrM25J9pq733Wxg16d2NF9uXI78AlbcS22gh0vKTNKfuyjFqNrEpNbf6vSZtTSRsptEaGWFjj7W5LtubcE2u1BT9b4z79FlmeKyRb4JI1YltrBDpeshYoe4MTtJGb2nitIyRtTnmPY5R0bvT4NQjCn1NVmq8lAzdK0zmutuRnf9y3d2srsjxh8Jc4SU7MccTgT+pfa5J1u6MleyxkUO+6MYE9ctMer83/vU9OtSRZ/zkp3WTAHku7Hkd5quGN97ucR/i42sKuYnoPqMJqT34Wxo37CPlbz9IhLHFBGLGNMN7uaElYoH7rKAZh5KYwXhsR5PGDsED91k/jQxi5q6fv3uGLtztY9EXs4Ku25Gdfvm+vBPNF/+/EBV/ENr54uxuYfAUqJhi56YvXRoTgK1EpwchdPS3lQBjvd7QojBiK2S/6ayd+9uXb9fLVZa5Ff+KCL2IbX7zd7Uu+AhXzi9z0xWsjgvQz8itQMb/IoTm6mocv3u9o0Rex575qB3725dv08iUHsxgPExd8EUPN0htCQjnJGIvpfniJCxBy0xivzf+9D2Uw5tRDP0SCAZEY2qPvpoAw3u9gj9/jbYxrm+bck5VH7cHP4rhRv0WWg0+Ic07P3bHwIIV2xpeqF9HxkjiW01QNQvfex0zmWHWbPE5/i1w4Ss6lyXIDMhn1ejjlGYdM3u/KV61kGVZnJIHby/z4yVEJINtzhx+rDFyQuaitzEV0S4PMQFV/uM3MyRxdNgMXbAbKLZTNwA0L3BoEqkqT+aicLu5K9PXAyhLzo7btx8wE5DLlcavMDFySydL2Mkk8l+lUOvcKlXr81h/eg0svLrl0Krt0Lrl06kt/fAcqiV0qe0RUl7WZP7v0HX91R5fJ5cyHc8klqb1LEs9dOvUZvtYiVKoq76Ns4JJLD/qun85CWhJDG2UMqDF23e4G+hMBiSymufFEqMra/59VpkOC8PttH84llaT2Kkl0C9IYG6gPXenXjBlqVS5lbkJeennh+CVQ7/qODrhkYWikvsYDmbzfTfzUb56DS2JXMf1MqMU6DThbDEcGv8eTsRLSuWSR1N4iiW5ishioaNG5sigzKiw6lzLSKc8laHROewwynfoMhzELO8isM4CzTB4UdOdWd/QDsmQ6l2SS2ssk0fGSzEC96UiHlHSuai9LC8h0Lsl0qkqTVQNkOpdkOlWvXspwgdQkhz7rYJqZdT5wlslDhO7cx+/wE2IfziWZpPYySXS8JNOpqpVM4JAZuTBXOpdkOqWdD5Wk0EZ9gxYykve7hf5IQKJz45FQl3V2cHbJA4YZWX9gCUtY55JLUnuXJDpechmomJjOlXN5+JGYziWXTrkF2HRuWFj7EaeqbnKiBKfkrmejn1e1WecKZ5t++FAxZdaBTede9DMddVawsL3OUJBsx+s90quclp7OCgJWs1zIzBBU+rXOfXJpUjnYZGloZDipW/e78tWnMnXBI8tpbjwVarMOIM420ylF+JWWD+eiTWJ7myS6CSk5nSpN8pBhoI2cdByS07mUnE65Buh0bmhYyelUtUFmdEglhz7bzpqfPzn5AWSHBbpir9wMXLK5sK3NRTy1Gah0WpCwdFoQuCAzUFFm4ILMQKXTgoWhx8b7piQ1P+tQ4ZiagEymvikdMp2LMontZZJ4LtOpdFwQalUTnQ+0gUsyPWg6LliFXd0v43Wtgdb9bqE/E5WSgRvPhMqsw4WzTD+BeNhb9yHTuSiT2F4miW5qGGdTuLTVDFzZ9EVQ4HT4qWkzUOnAYGFo5EMGddj0JqYDg4XJQ6Ea61zhrJGHD92rpVGeamh0LmokttdIogMmjYGKGp0rjTKt1nSZqi/ZBI2pNF211HQZuJFNnC4DlU4MFnawWecPZ5t+SFE2ZfkGm85Fm8T2Nkk8txmotDMJ1SqbssCAzVBesOlUdYakOGw6l2w6FY8MVmnos6665mYdLJxt8vShO7caIA2FTeeiTWJ7myQ6YMpNp2rO6T3Y9fzXUjZUqzgZWmDTy0sTplPhzGCVdSVTGGG9FH8mMF86N54JlVkHDGeZfgpRkWWkgkznokxie5kknssMVExN50qmJBNkOpdkOuUakJrODQ1roHWq6iZ5AqnkroejH0TVWWcLZ508gOjerRbIAwedgdOXCurQYGGoWnpjyAI6Xvq8RcDe9O1gSE3WarwxZF2bEUQw5kj+a2OP8KWOC7v6WmYgLHVCMfamIzgjd5Wze+H5s44Rzsr8rKGU9f70epygzLmx8bkoGCOFiqWvv1pAd1QaTFlMU+lbOENhD3sHFdLPi0vLVade7GPSSD9y985fecfbs+7Sn1BI7CqlnyhNuzo1ODvk0UKHrH6QuQcOAycPIRyS2jok0OGSQ6eiQ8eyQ+eSQ6eyQ3JoY495yyFvdwvfv4JDYpfDHlrF4ddPznQA2TFA+IWgwNnXHZfEhX1LVD/1vvBFdBvf9INWdeAasKRxYWPsXNc6QlAWKOvryrqFXX3dS0gqW/c7mG7YKusWhVLGWzLUWJ1DHLPuyw8r6smVfKqsC5y+txXCWNpeGIluYRTmWBRGbArjtY6QhDkVhRFDg3S2rbluNbiDJWGzlPEjKCqszgjOwvwgoYT10Hs9ShDmXJjqFrUX5uVEYY5FYcSmMF7rPkzCnIrCiF3CQobxfgdLwkihlLde+qmwOlQ4C0snD/r2AghLnIzqSDFie2MkuonRmGPRGLFpjNc6QjLmVDRG7DIm8xNSjPc7WDJG6jLW3tVYbfXPxvw8oFLM93Nfzr3oOSOMEfs2pp+RwixGopuocx0mMaeiMGJTGK91gCTMqZd0qrIqggbpjgfGvBz7NnNMY46NHaCKq137WZxv7Utcp+8aG51LkxmpvTcS3a3Jm1NVq35Er1rVzu2L3BTHayNCL9Gu/6yN2/rPpiqCpBKWHywNLZJugTfe7mLsp9jgjRhKGZ+zVWO1JT8b4769Qz5+h98F+gqc9AMyjdTeGImOl4w5ZV9cDmHEpjBeGwGkohAWqPChtIWhPS/6fc4w5uVEY8QuY724U2O1IT8b4669G1jGfJv25VwcHIntlZHogElZoPQAAMqITWW8NgIEZYFKyoh9K5MchDICHS0qI3Yp237y86s24Gdl3KV3yFImSwusQJxLwyKpvTESHS8ZC1S9wWCdA61hkdxUxmsjQlDmlH1vPEZFYmiQzPIQxtsdywdXDIvkLvPdDk2y2m6fjXFPPmPqURyMORfehbaovbFQTg8TlwksQAIVjZGbxnitWxQOj0OEaIyFoUHiHcZ4u2NlY+QuYz0h343VkfnZ2AXZyYf+dtQfXxL3oi9c/WlgO2WxIFMWqaCsuVbW17obXVmigrLG0CDZrf5ztLdjJWX3Ysajrspqw31Ksrdf3JXPmP6jW5mT0RPKWNy3Mnks/zyAjufDYhczqGiM4aYxXhv/K/X4e6yHfRH6Pwa2MeaxsjFyVzG7ieztV+24z8a4Le/21UQmQzaSzLk3/S0YGCO2NUag4yVjgYrGyE1jvDYiBGNOeV9DGbmrr2VNhizj/Y5m5v81MBTTpWiO1Y77bIzb8o5YxnpyvKYWGAtcR74oCCP1Lcx30k10vGSM5QwqGiM3jfHa+N9gzKlsjNxlTJ5kGOP9jhaNEUMxPTSpsdpwn435rryM9eS4jDnn54tvv0jtjZHoFiZjgYrGyE1jvDYiBGNOZWPk0KJx+H71C4zx/oimZyTIMWIoZjzIqqz22mdl3JB3yFImWw8kmXPhm8Ab2zsLBYW1R6CiM3LTGa91k9Law6m49iCGBsmoAmO83bHcPJSRu8x3rqqy2myflXFHPmJ+6CetoMw5feYwLpLaGyPR8VKWBSoaIzeN8dqIELLMqWiMGBrU49nKMd7uWNkYuctYzzpqrPbaZ2PckI+YH/4DhG+/nAtv8mlsrywUFJIsUFEZuamM17pJKcmcisqIoUFSTyQZb3esrIzcpaynHVVWm+2zMu7IR8wP/XVGJJlz4UctGvtWJg83FvheTkqyQEVj5KYxXusWJWNOeV9juUgODdLPuMEZ73c0+zZ1jIuObc/x337VnvssjhvzDvz48F+OvAqTTbd9fziGRxa3FUeg4yVxgYriyE1xvDYiyAOEnZlTWRy5S1zYTfN+RwvfDN7hUEyXIqn28pPjD0Bioox1mVw1Bi7tzBb2bWysj66CKtcW0U0MygJV1ZKO/2ssrbie4q+of4tcyL8Q9aXekXQ/2az8W9ylUdZrlX/rfrfx90MqX/m3MBTTk6VqrH34MfFeuFnviNUPPXEujc6lEXMVt9foBSWNTmWNkQsanUsaAxU1kkMr9TNP0Mj73alRIzEU06tU1Vhb+LNG3+dXf8kDWBPfi3PjTO2SXcPnovYWQzmyBPjLKKf7odJCHi4kI0sb4+e6Nv5XMqHGz0RFY4xwdbVuW6GMQIf78N8lT9h+5nupPfrZHDfyHbjMydAAc8696LdmQR2xvToSHTAloFP1HdR9mHc9KlBHbqrjtREhqHPKPwPQ5aM9+t2l8OalhBfXGkMx42vONNdqj342xo18N6+6pvN3DZnOhZ3cC6lvYdJPmPcIdLjky6mqVM8Ny1fkJHUx7zmXBkynkkNSV+dL+sMh73cL9cnGpEcKpYyv+FWFtWc/K+TGviNWb4XFS+Ckr/5UNSO1VUigwyWFTmWFkZNqQaFzSaFTSSGpS6HMK1DI+93CpJDUpbDHOFVYm/izQu70O2L1lqQPxk3n0stvC/t2mNafoSDpdEx5TlW1wrhJbo6bvNZN0gZhynMqCSOF9ugHmyGM9ztWHDeJoZgRRo3VHv5sjBv9DlldI2s1GAucftIMWUfs25iYx8BJoOOFT9kkrKoloxRmOhY3jfHaDCHDCJQ59njR737C9oAcmiQTCpzx9ohW39lw32VgpCSHYvZZVpv4szPf6VfnSP7DmXP6RSJQRupbWUoyEqOJIcmcqlp1S9dklzj9uTGMlM6lxAvUm361DCySQyvFDizydjfxS2cDSCR2fxY08Wrff5bohwOPD/3dMEh0Li1YSO0lkugWagMxUgbqTT/oh7xzrmovKxtIdC5JDFSUSA6tlDEKEnm7m1iVkicVFp3b7xcePzl3AWTnLvpbYiUzcJ/63aaVkgvb2lxENzXYDFR1iAzKZTNz0sFlM3DBZqKSzcWhlTJ6lc11u5tYlZcpoGwG7onN2t0fU/PBI4BbZKkhbDqnx0uQSWovk0THSzKdiuPrijemxHVtRJDHoGbEQNkgWEPpwtAgGd/hzev5YvrhjRyKGct8GUwfdQZwNuYHBfWsSN1gzLkXHSCgjNheGYnRoTLQ1Gi6ymkq5x9Lm8p4rf835VqgrLPhjNzV2aIe0ni/o32lXHPsSa7VKcDZnB8VPD50lQJzzqUXzRe2NxcKCuacyubITXO81n2ZzAUqmiN3mZMxGeZ4v6N96UIZ2UYMxXRiaLLVdv6sjHv+jljKZGUMZc6ll2AXtlcWCgrKApWWLiveVBb+V5IE42OgojJylzKZsaCM928dKIsnOHPuSbbVNv6sjnv9W2TpS6hzTtfUGCZJ7c2R6HhpZgtUNEdumuO1ESGYC1Q0R+4yJzM+zPF+R6tHX7YTMOfcE3O1nT+b457/FllaCnPOvejbI6CO2F4diQ6Y1AUqqiM31fHaiCANQtIFKqojd6nrEe7adkId73e0UifjKdQ590RdberP6rjzv0WWYQHqAiejKsyR2psj0fG+9O0WWJw4Vus0EYDNgXPVcZIb2Bw4l6a9QEWd5NBMPR2ATt7vRtY1O3VZGIoZjdN5r/b1Z4/c/HfI6gh50uDROT0GgUdSe48kOl7KwEBFjeRmBvLaiCAPADIwUFEZuUuZTCpQxvsd7fHhP1WUuCcZWHv5sznf8FdkyS2Ycy69LWJhe3VeUFLnVN7RJU5zAhnoXMrAQEWd5C6dMsdBJ++3TtstYjwldhWzElQS8PUnpyyA7JRFv4i5NAbuRb8HrDJwYVuNi+gmBo2JShkYuNpTyLKvNAYuaExU0ri4q/9lviuN6363sXJDsrc8Bm6fla+1tz9mJSDXKQ8adDqX9hEL2+sMBUlDa15c5cwOCYdmmZMOhs4Q1QfZREWdLO3SKbMwdPL+rH141S9wT3TWtv+s088G6kGS/oBO52J2EtvrJNFNTdnpVBxkV7XG/LiujQhBnUewgbCOYFZhaJC++AhzXkw8N1scyhmv1uiIWhv+szOeCnQDy5kso+DMuTQxLmzvzAtKzpyKpy8r3nTm/5tGz0DFdCN3dbY8zJDG+92BX/oiDgZPx55kW237z+b8bKDMyXgAc85Fc8T25kh0S5M5p7I5ctMcr40IIdsCFc2Ru8zJIw1zvN/R0rnZwlBMd68mW+33z8r8UKCU+f7h1Tl9zxBWL6T2xkiMFoZ94CqosbgPDFzcBwYuJaBXzkc7jJrk0EzdLEAj73ft0z5wYShmHGWpx9r8nz36CcHjQ1/FQ+o5F/aBi9p7DOWEZYtTVSvZ49R2fsWbmef/m5Q59a7viYQxYmiQxIcw3m5hJV7agyGTHIoZ5zRqrM4Bzsb8sKD6RlbeMBY4aQEyj9TeGInRRmkhFppOZWPkpjFeGxHCWOlUNEYMDZJegTHeHrGiMXKXsR5x1VgdA5yNpbMC/63Et1fn0lhJ6tuYdFS9KykVE4SxmO6IEiYbFqRY5CQqdgbOpbRzKkokhjZKLEjk7VvdZUGDtCN3fxbUYW3qzw6587+F7OeCb8l9dS6Nk6S2Dgl0uLRAcSo7jJz0Kxw6lxw6VVGl9zF2kkMjZeSBRN7uJtqjAIfEUEoHEYdvPzlyAWR7dP29gBo5A6cfVq+Rc1E7hwvoBgaHgYoOMycLrnIYuOAwUNb5pXBhaKM87KVw3e4WPj70RwrL4eJQTI/J6rB2+8c8fEtHAvprAnAYOBkE4ZDU1iGBbmFy6FR2GLng0Lnk0KnokBja2It+vpS0uqBbmB3OYjqb1WHt+88O/XCgQvZzwbH0zbkwli5q6zAUI49CLWBWMbd+EK7mw8WNBcy61v+bfHk9bMeEnHNsbK+XtkDp+hWZRwydMz5BotpqS3/W5vv+0iYrBqRe4NQuco/Y1huB0aviA96cqloJB2+R8zkwcMmllxZzj9jV/VIpDKC8301MG76FoZixcFSLdQpwtuhHBdVfPbGu5Atcp/1FQSKprUQC3cI0gDqVJUYuSHQuSXQqSiR2SZTnHRJ5v5sYJRK7JPZopxLrDOAs0Q8Kqr9kgkYqOqe7aEgk9S1xHMNemmtLsYhuYrLIcpqqWsmUg1QkN4dQXuv/TcacisaIXcbk8YAx3u9g9ktDGDyJoZhuhgqrvf1ZGA8AOmJ1jcz8EOacfYwDxojtjZHogMmYU48P/bgxjJGbxnhtRJCurtfb1382FY2xsMuYjEYwxvuzGMFgjNhVzF5Zbe7PyngC0CGrb2QIhDLnojJi38qkp5BjBDpeMuZUHikTp99xju2CcynvnIoWiV3dL083LPJ+NzGOlMRQzHhJXBOvdvdnizwC6JBlUWZiWHRO3xaEvCO1lUigwyWJTmWJiUsSnUsSnYoSiaGN+sYMSOT9bmKUSOyS2GmjEmt7f5bIM4AOWRJlJoZE55JEUluJBDpckuhUVUryGmNn5GTsQiY6lyQ6VVFl5scughwa2b2/tg+83U20ZwHjKbHrWeiEFonvPzl9AWSnLx89RnPhGbhxYs6F56J2EhfQLQwSAxUlZs4lBi5IDFSUuLir+9fbjShx3e4mJokLQynj0wgqsTb4x0x85ylAh6ya94OxJDqXJsVV3LfFsPJcRAdMGj3c40O/Sb1ycZU21jHr2oggWVzrmEBZX1faLezqa5lmavBc9ztYGjwXhmL2XybxXrv7szIeAXTI6hsZEmrwRGGSn+HUc1F7Y15OMuZUnAJXvGnM/zclmVPRGLHLmMwpMMb7t+7r7dv1xNdQGbhxbKO5Vvv+szg/HChx8kxBnHPpc2AL+zYnj3gtQBfQLU3iPFrVSvoNqRY5iVrTXuCSzFiajL/IP3JopEiCTN7uJn6MBeZySQyldKaoxNrQnyVy198Rq7tkvoZE5+KASWwrkUDHSxKdyhIjFyQ6lyQ6VVGDRHJopDzvkMjb3cQokdj9UVCJtcc/S+RBQEesioeli3PhBdx3UluHBDpccuhUVUqmYiRi4vTncJCIziWHTv3Wd2ohD4mhjZ1Ba+XC291CfxIwqJJDMf3YqcPa9Z8d8mhghvTfmHl7dy59NnNhW4mhHHmW6/R6FTNrlSR6aY+PJNG5JNGpKJEY2hgGU96+1V3SGRLJoZieKFRibfrPEnkyMEP6r868vTsXfgu0sa1ELydlolM5ExOnv8CCTHQuSXTq91gqXqmGTCSGNoZM5O3ZozomQyI5FNOOVWJt+s8SeTIwQ4afNXl3Lo2mpLYOCXS45NCp7DBxyaFzyaFT0SExtDEkIm93C/NoSg7F9BJEHdae/+yQBwMzZPidk3fn0scdFraVGMoJo6lTNUr203rlBKbEyHWPXBwS0bkk0Snb0yERiaGN+qoIljW8P7s0ZSI5lNNrELH4+ydHMoBky1f91WVe/VCL08RJ79fh6KJ2EhfQLQyZGKgoMXMuMXBBYqCSxIVdEiVYSVz3u4kxFReHcnrNphJ/ciTzO519hF9qCFxa2Czs22I4kllEtzFpTNXSFx8rF1dpY4O/ro0Ivfq7nso6kgmU93Ul3uLQIq0pnHlN66I83zUFLg7ljJ/+UWl1YHAcP3+HU4XP8FsNiZOaIfNY2t4ZidGjUk6tRlc5TdX7mGTRAGcsbTrjtf7flGZOZWfkLme9aLzcwxnvj2jRGbnLWT9D6qw2/GdnPBXomI9P/ToCjJbOaR/CGalvZ121q4l1HLOADqcPL5SxmKaqUrJGgLLIySNQU17gksZQWtrJr9IujdJGaAzlfOpXvCP1yKGc8SlT1Vhb/rNGngvcekzqBo2Bk/6CRlJbjQQ6XNLoVNYYOakWNDqXNDqVs5HcpVHWU9DI+93Gqr1kLTSSuzTup73a9Z818mjgFlPqBo2Bk/6CRlJbjQQ6XNLoVHWELBOQjZGThRc0Opc0OpU1krs0Sq2gkfe7jR/6AjAsErssrlelNBdr13+WyKOBjlj91Q/GWoA6l4ZUUluJBDpckuhUlhi5ING5JNGpLJHcJVGiQSLvdxujRGJXMVuJtes/S+TRQEd8fOpngpGJzoW38y5qKzEUIwmNedGpLDFx442y1xOITHQuSXTKvn8YK1Ji985fixveHh1qsysSkdxVTGeNZmJt+88SeTYwYn7qcQskBk4WiBhOSW0lEuhwKROdyhITlyQ6lyQ6FSUSQxtlwYU85O1uoeczJJK7iumv8VaJtes/S+TRwIj5qf0Kic7ZT1rAIrGtRQIdT6MhFZ2q8UFWB5gUIycLM6Sic8miU97/yEVyV//LowyPvN9t/D3egn3lLDQSuz8NYvHjJ6cygPRU5jN8i3ngwhfDLGoncQHdwCAxUFFi5lxi4ILEQEWJi7t635Nx3e82JokLQzH9KKjEn5zKfPihQvWXrLkqFQOXvkBkYVuLHi9ZdCq+62KF6/6q2stio1IxcMmiR/2tH7urTFyF3Xufs+K6PeqUZsXFXc9CrwzUYp0MHAfUDx4fjJifumiBRefSMffCthZDOd2CqydqQF3FjFqlj7wkLloMUSVj67gtlBYtsrCr+9fCclnk7Vn3cMq9ol3F9GShFutg4GyRpwcj5qdubGDRufF2uasFNSsuaivRi0mp6NTjU79tpWbFFe5WeRnikIpeXkpFp/KASu7qfnkYalYM0caJ6NVVNSku6v4sqMM6FTg75NHBrRskN+DQufDu0UVtHXoxyaFT2WHkgkPnkkOntO8xmpJCE3suW3nI26M/42hK7lLYxyvqsM4Ezg55cDBifoYfFvgInJhGHpL6dhheqFhEx0sSWU5TNSfKXIdEJDcOvde1/t8kjP/ZVE46cmiRvnEdScf7XU762NLCLvPdEFVWJwBnZTwm6JD1hMt4gLRzLn0z08L2zryg5MypqlY/nddTDmfkpjNe6yYlZ05lZ+QuZ70HX3nG+x2tairrQAyV5FBON0Sd1Y7/7IzHAreQ/RxcVYMz53TDjzQjtVdGouMlZU5lZeSmMl4bEeQZxALFKe9qjIzk0CLpFmQZb3cwNw9j5FDM+P5VVVb7+7MyHgKMmJ/hJx8+nIu7BWJ7ZyQ6YHLmVHZGbjrjtREhOHPq8amLLjgjt3HG2x0sOyN3OesJWJ3VZv7sjDv+EfMz/HLAh3P67nukGalvZdJT9XLgAjpcMsZimsobvMB9vnaHXGMEVpXOpcHSKe9+WCR3db8Mgkg93h+1/9S1DVKPHMrptY1Y/PzJYQsgO2zRL8GvwTJw+qH5srioncUFdAuDxUBFi4lLFgMXLAaqclEWXmVxcWikPDIlcd3uJvrDUBIXdz0MPQ6rxTo8OObip58wVNUliWDRufRRiYVtNYZypKNqn76KmT2hbyypVUriPnXXUskYuKTR6+b9D43krv73lcu6P2r/qT+tDI+znH4cVGPt+88aw+HApy6EodG5N307PrKR2FYjgW5iykancjYGLmp0Lml0Kmskh0bqFzciHXm/21ipIWMvNJJDOfsxtc4Fzhp5eHALKU8YNAZODxmhkdi3Rk3rmhsX0QGTR5bTVFzNrNLGamZd6/9NzkIE21Qj9chdzrqzuWlY9zuar4rgbJaz3TR81hb+7Iz7/BlSv6IUzgInDYAyUt/KZCCGMQIdLhlz6vE5ltpXf2EAjVyPRVzNBC5ZDKVJvsAhqStfevpaDnm/W2gfk4NCYiimS9HRs3b+Z4V+PFC9JdMSFDqnR9pQSGqrkEA3MCl0KiuMXFDoXFLolO65oZDUpVAUY+jk/W5hVEgMxXQpqrA2+GeFPAXoiNVbffp9PVxQGDgRDYWktgoJdLik0KmqlOQ0sjByPSytLHQuKXQqKSS1U8j73UJ7WzeykBiKGd+jpA5ry392yHOBDlnd1c/Fcuhces3ok9hWIoGOlyQ6lSVGLkh0Lkl0KkkkdUnsQXANpbzfLYwSiV0SuxiVWGcAZ4k8KOiQ1V1d5pIYuJCIpLYOCXS45NCpqpSsq5CIidOlIfYTziWHTj0+9d13GE3JXRbthb91u5uojwIScRYyfsxUHdYBwNkhTwlGxM/wRdmfzqUPCy5sK9HLSRKdqu6UZwYSIydTASQ6lyQ6VVFlDIdEchuJvD26VEY2SCSFQvYSv35yPgPIzmf0y4ZrRgycfpCpZsRF7RwuoBsYHAYqJmLkQiIGLjgMVEzExV3db4m4bncTQyIu6iqkHztJxK/a/B8TEZA7lOcGDp0LL0gsauswFCP5VYczq5jRDSkPM9cdwlVN4JJDr1vMw1XaxmEoRvqz8vBeSFdZHdbO/+yQxwO37vIJ8cu55JDU1iGBDpfy0KnqTZ8QQ6Uen/o91TWWBi45TFH1K6hrLF2lbRyGYoJDUlchPWCrwzoJODvkcUF3anWD7LGQh86lTwoubCsxlBMS0amSKFxNiCvcrfbCQaKXlyQ6VX3ROXKlNSSS20jk7VGpIJHUQWKdBZwl8sBgRPwcPwbKlemXc2GXv6itw1CM9DkGU6dyIiYuJaJzyaFT5VBOo+CQHBopt2ubv26PHg0OZyHjrQaaiHUYcHbIE4MR8VNfTkIiOpcGU1JbhwQ6XBpMncp5mDh9VQN56Fxy6FTOQ3Ibh7zdTUyLGlIo5InDOg04O+SRwYj4OY4OVh46F96l/UVq65BAh0sOnarelFkaY2nkZOKEQ+eSQ6cen/otwshDchuHvN1NTA5JXQ47TzUP6zDg7JAnBiPiZ/iK3y/nkkNSW4cEOlxy6FT1pszScBg5GZvh0Lnk0KmKGuZDchuHvN1NTA5JHRzWYcDZIU8MRsRP/RpWjKXOJYektg4JdLjk0KnqTTlFg8PI9UO9NhfOJYdOVVTJfuQhuY1D3u4mJoekDg7rLODskAcGI+Jn+FbRL+e0U7HJJ7V1SKDDJYdOPT7Dd4qucF1acbLMQB56ecmhU1WaZD8ckts45O1RKXmssEEk9dTh+68fHNRckG3y/dsqExc+e9bYRmID3UKXmKg0IW44mxAT5xITVYnYn+379+aiuav/9aSmb3cTPRGbugrpbL9PiO+/6sjglIgX5BJlFvjjS+KiRB5TbCUS6BYmiU5Vd0pO/DXWqjibEWPte2d9yfn7rjTpi38MbiMxVN4ysat0kFinAWeJPDLoTq0hRBoIic5FicS2Egl0vCTRqZJjU2KqVXHSY3/LtZc2QmKM2kmyMpHcRiJvdxNTJpI6SKzTgLNEHhmMiJ/6OSlIdC5KJLaVSKDjJYlOpTkx1SrNiYlLw2mMKvmPTCS3kcjb3cQkkdRBYh0HnCXyzGBE/PQv/33/5Zy+/e9P1TxSW4cEOlxy6NRvXehjMHXMvgoKaehYMuiUvscW/kihgfoFEv8c97t99sO3/xrY/THQ+bDOAs4CeWDQEes5luEDWehcEkhqK5BAh0sCnQo/3Jrq9KGv+EGgl5YEOhV+8rMLu3f9NcpCoJeijwH8kZLHQAXWQcBZIE8LukdLoKzrINA5Py1taiswFCPrj7/EYI9P/TJfpKCXVpztLBKXFMbSwihK7up+X5TydvdockjqKqSrrA7rIODskKcFHbG6QboVDp0LL1s0tpUYypFokOhUlhi57pErN5CHziWJTlXUIJEcGim3kYi83V2aJJK6JHYpKrFOAs4SeVzQEavispqGROf0DeCYCkltHRLocGkkdeq3vrcAeehY1V0Wm1DoXFLolPY95kJSl0B5/GCQ97uB4T1RjaGY8c5ZVVgHAWeFPC3okNUNsoKHQueSQlJbhQQ6XFLo1ONF30QOh4H7/ArbCuf0Z/qwrXCqosq0Aovk0Ej9QiJY5P1uo+5rMSGSei7x5SfHNIBsh6/vlCmJgQu/R9HYzmIqR57mGkwDlRIxYDERAxcSMVAhEReFFuqH1Uvhut8KUyIu7HK4HUtf6rTgmIiA3KE8fXDoXHRIbOuQQDcxZGKIFjMxcSkTAxcyMVAxExeHRuqLqNDobQyZuKiDxToIOFvkaUH36uPLvwL4/SVwsnyoGXFRW4leTJLoVExEx6ruUquaEVetuo0pEb20lIik0EL9CgIY5P2OFRORGIoZ7waVGfGljgHOCnlW0CGrGzq5r7UdEjFw+r4bOCS2dUig4yWHTkWHjmWHziWHTiWHpC6HsnSAQ97vBkaHxC6HPZ2owzpPODvkoUOHrG7oMpdD58IW/4XUt0L/rNr7IjpecshymoqvW6zS+rNqMYIsVmsJs/5zRNBvHKgVzMLQIElwCPN6qvZawCwKhYyPyKuv2vifffF0YNT7S79rGDnnXPJFau+LRMdLvpyKL1GsWk1f/r8pwQL16t+i1u3eCPNikjBSB2G1yz8L41FAd2AlmDyQEOZcEkZqL4xEx0vCnIovR6xaTWH+v0lYoF71AA4ZRm4jjLe7OUkYqYOw2tGfhXHb3xFLmAzWEOZc/YrJ/cAIsxqxvTESHTAZcyoPieSmMV4bEaSmGBKdeqQhkdglTA6DMSbyfgdLxkhdxnrNoGNi7fPPxvwwoIzJ5hbGnIvGiO2NkegmJmNO5UGR3DTGayNCMBaoOCiS2ynj/Y6WlJE6KKvt+lkZ9/QdsZTJwwRlzkVlxPbKSHTApMypPCySm8p4bUQIygIVh0VyO2W839GSMlLPlT1+cnQCSLfdX/5l9e+BSy/JLmyrbBHdxKAsUL/1jex1ALawYWxdGwHcWKAeX/ryXE1ki0ODekDjiz/rdgcLwhZ1CevKyLD4qO36MccAmTA9hascC1wUxuL2wkh0E5Mwp6o/pcNgjNw0xmsjQnfS1dU1ka3/HFR9e+B9aoYxlnZ1tszwNZOt+11OUnYrpaOostp4n5Vxd94Rq298N/ZwLiojtldGogNquDqfTOEs9aGMpU1lvDYidCctZYGqn71xZeR2yni/oyVlpK5SujaqrPbZZ2XcjHfEUuav7Dyc03PnWi0u6ttYV+3qqD8PoMMlYR6sKiWlQVjkJBPqICtwWhryLpT2oR9vQd6RQyMl8ZF2vN1NTA5JoZD9SzuP2qGfHfo2vrrLF5AoTEdUeUbhkNTWIYFuYHLoVHYYueDQueTQqfq2J3/v5q2RfjCybncTk0MGuxz2k6B5WNvxs0Pu2TtidZevKB/O6StXcEhq65BAh0sOncoOIycvaSAPnUsOnXp86Rd+Iw/JoZHBIW93E5NDUpfDzgZ1WDv0s0Nu4ztiVVxqhhWLc7qAgENSW4cEOlxy6FR2GLng0Lnk0KnskBwa2Rm0Vp283U1MDkldDnvuUoe1Zz875Ma+I1bFpWZw6Fx6dW5hW4mhnH4Kr37ACsapqpVwmBAj1z1ylYdEdC5JdKqiyjSMRCS3kcjb3aVJIqlLYgdRibWLP0vkVr8jVsVlToFE58IXSja2lRjKETmQ6FSWGLkg0bkk0akskRwaKWMWVjW83V2aJJK6JHaHq8Ta158lcvPfEaviYVXjXJRI7FtieG3nQaIDpvE0UHEzQW5uJnhtROgn/UpOrEMDFTcT5NAi/U5IKOP9jpaUkbqU9Xgvyl5/csYCSBeYXw9fxAQuKVvYVtkiuolBWaDSGcvChrF1bQRwY4GqR7X78jJbA+Xi0CCZU0rYut3BgrBFHYTVvv6YY6/c/HfEx5d+gXcNlIGLwljcXhiJDpiEOVVrFumwmu5WtaYx/98wKq7/HPVIZyyLQ4tCjq37XU5SxjodlNW+/qyMm/+OWMpkwIYy58JGYVHfxuTRrg37AjpcEubBPsJboldh05f/a3ij0PrPrsaHvpcaCcbCLl3ywCDDeL+LefmtH+2rl7wDN17706GxtvJnbdzvd+TSJjWENueSNlJbbQQ6XNLm1EOjIc2ITW281gGSNqceb69hYCSH9ujpE7zxfkfL3px74q2272dv3ON35PImizt4c057svZ0i9p6C8VIsFpJrmK6Ui/6gWt4Y2HTG6+Nf5WsryXI+s9B6YenkW4s7NKmAzS8EehyPvQrD5Fujj3RVjv2szZu6ztwaZM1NLQ5l7SR2moj0OFSujlVlZLehzdy0xuvjQjyn/DmVP3kqjQb4sihQVIMtPF2B4vaHHuirTbpZ23cyXfg6qHeR1wLKWhzLmkjtdVGoMMlbU596js9YY3YtMZrI4B0N6w5pe/EgDNSG2e83aGiM8eeOKs9+dkZN+4duJz5Pu3VueSM1NYZgQ6XnDn1eOjCFtLITWm81hHS1ObUh362ENaIoT366iVSjfc7WJ7ZnHvirbbhZ2/cq3fk8hY2a84lb6S23gh0uOQtUB/6BRrwRm5647URISSbU2/6qSF4c6x6R1Yu8OdcTDvHnuirLflZH/ft3drHl3/l//urc0kfqa0+Ah0u6XOqKiWbE+gjN/Xx2ogQ9Dn19SYTBPQRQ3t0Jw5tvN/BojbH9trefnJEAsiOSN58HxC4oG1RO20L6HYGbYFK+4CFDWvr2gjg1gJl3V3WAja6+5r8y12g0tvMF4a+GW+1ld3bW+3Nj8kGyK3JwrzWJYFL1lja1hqB0akSrHYBIVi0xsKmNV7rAGGKCwH0UzWQxrKkn5cu3u9YcYZb5TQ35Ks1bOT/z//63yXl8T/qsyP//Z9XuP9Z1fne4td0+f/+6z/+b91A/vuPMEROBqrasK3SvlXpYr0OSBbR8XS+gqtYK0mUGhgzJ+NbvYATuDddXdTKMmDVGbI2g0NWD82U7QIyjre7jR/6zWS1jVsYSum+VHW1Rz8nnG/kq+K+OHkLXEe+nglYJLW3SKJbmCw6VbWSRQEsJs6/OTxx4awylKZfJQOFHrPeUyWjBlw69/jSHwSATHLPZWLnnvPwe09/z8Pxia3LDYZMchye4IvX9r5IPPflVPkKWRe5kHXOxaxzLGcdOTQzmOLtbmPMOmIopRcSmnXYq2dR37t4ESXVgSjn9HvyoI7UXh2JblZKNaeyusS9yxCGAdO5qM6xyg55YpBt5NBMGXCQZLzdbfQnAElG7rk77Nmzu+/dvLiTBxfuyM0k47W9KRLdimTKqWwqccmUc9GUY9kUuXsXr9UJb3cbsylyd+GaZWXiPLcVZIvJd5mUIS1w8qgh4UjtNZLoJiaNTlV/yoyLuS1yMgci4ZxLc1ugXrV2yDdy9+5fFnm7m/j40rf9Id/I3YtRi9is53zzbXzFESlQFzihoI7UXh2Jbpd2DhaX31T9HUte/YQy1HlpVXsZ6aHOuZiBjlVxMvTCHbl7py93vN21j9McsXspqq427OcE9F19VVwGeVgkN0dNXts7I9HtSc6cqnFH0gjOEpeWks6ldHMqLSWdqt8plzfRYpZzLi8lyaHPtiuUd5yMxKy77vzXf9SCdD7fPsstbvha17a+FtGlB1//puohnHXoxlxPc/kKpcUcC1zKsYDFHFvcvYuZY+t21z7l2MLupUiOvWNDn0X5Vr9q6zPbVYII9eFxUXt1Hi+p+6ZqAl/q7KVAmPPCqvIyAdboGLhwdhIoe1GkxsaAxV1b4KpyMlzUBLc49Fl3qRrEfj4b/N7p31NN3yBRQ+M7uZlqvLb3RaJNJF/f1NGXF5Z9OacdVyclq0FdtejLC4tDYygu+2J5zzOufBxntXdu2LsFjy//OYT3xU11/N+9OhJdelLnVFxErjp0acXJ44xc8/LCrJaotIhc3L2z1yDpwcqZTHvIMXL3YjTHalt+dva9d68C19BUzmRWQbo591s/EVELyoV9a5QVTR1WLqDjhZcDEvVL38aJEdNrVbX39WTgksVYmi8nQ2m6Qa+1SaAeD/0aBMhkVHRZd5jKrH36Web3Zl5kdpnXcwaZzoUXCRa1dRmKkb6vvcEqZhiPLr207NK55NKpKk1WbJj+nEsuncouyaHLOpi6rInl7PJ7uy8uw0rGufRJ1ndiW5kEhqYgM1BRpnPV/WEp41yS6VSVJoM1ZDqXZDqVZZJDl3XHq8za0J9lctffnfv40rezITGd0/e0YZAltXVJoMOlQTZQ0aVz2aVzyaVT1RW9ULzGKLh0Lrl0Krskhy7rx1Bd1ubq7JLHAN251YAwYzqnP9EGl6S2Lgl0uOQyUNGlc1V5yXMse5xLLgP1S9/jBJfk0EhRjZmSt7uJH58y7WKiJHaV0nVWibXXP0vkgUCHrH6QmEhI52q1ff9UPSwS21ok0PGSxUBFi85V7WWeh0XnksVARYvk0Eh53mGRt7uJVSnpK2h0biS2yPz9k3e0ALLj7PAzCYnrx+gaeMrlor5d6tde1Bp2Ed3SIDNQ1R899lzxag2bOZncSmbggsxAPb70gxCVkovLMtft0UR7Jkrm4lBM96VarIONY0r+Tqcf+gmLSsnAhcXrovYWPV6y6FS2GLlg0blk0alskRxa6QPr6oSTxVlMD4JqsU4KzhZ5nNAhq+YyWsBi4PQFAyQjsb1GEh0waXQqa0yc/lYAktG5pNGprJEcWtn9f40QNbKmYDEZZzE9G6jG2lKcNRZkQ2r4uv3fzoVFzqL2Fr2cZNGpbDFxyaJzyaJT2SI5tLLHwmWRt8eDGi2SQzE9farFOjU4W+TRQoesmveTcVUNyRg4GU2Qi6S+LYZ3oi2i49nXGdeJQMBe0jIncFX97pKr+khGVqzDJo2Bsv7HzEgOzZQBHMnI2x0sLVYXhlK6L9VinRecLfJQoSNWN/SGdFl0Lmwef5PaWyTR8aJFx7JF57JF55LFQEWL5K7+lyNUaOT9bmTUSAzF9CymGuuk4KyRxwkdsfpB1oNIxsDJaIJkJPWtUXIai1QCHS6NqIGKqehcjbxSLaSic0lioKJEcpfEzqI1pPJ+tzFKJHYV0/OrWqwzgrNFHiR0yLIowwQsOvfyS9dB8Ehu65FAB0weAxU9Olce5emBR+eSx0BFj+QuAZ1GyyPvdxtff+kH3LDbcO7J1rGOC846eaZwiyxPGnQ6p1+rBJmkvmWmGZJEx0s2E6XHDtg6kuMLaTDHax2h+lL6vF5uzJxkNKZDloc2de4sdbx9Cycc1JFDMZ0umoJ1NnB25gcI1UJ5huHMueSM1N4ZiW7ih75XB6sax17e9NVPSHOuqh9WNc6FV41zabI4gEaWhmbK843pkLe7jVUpmZyg0bnbuwXE58dPjm8AyV6jYvczwvXN4vi0V8ata1t7i+iWJXsBi/YCF+0FLtgLVJXm9haHZkoul711u9sY7QXu9t4BtVfHAsds/ODZwYyt3+5b2Ri4cGyzqL1Pjxd9Ovb6Sz+fUtm4Anb1LWlrVA1Y0pmCahZVMobSblnEwTVw1QjxX1kZuFt56rXOCc5eeZjQHVOxZX6AV3IzK3ltb5FElx4tOpYtOhctOpYsOuXZBIvO3bJpWXQuW3TuVp5arHOCs0UeJnQ/V2yZnmHROf1yP4y2pPZeSXS86NWx7DVyMtUjPZ1LYp3KYp3TVxMw6DqVtUau53vVWucLZ61+CFGxZd6AVnIzOXltL5HEQaJjWWLkgkTnkkSnskTn9Hd7IdGpLDFyvT5SiXVscJbIs4Xu5ood1j3OhXXsB6m9VhIdL+amY6+/9K1emDkjJ0tL5KZzYSsZqIoqUx0G3VBa+pBh4Ko8mb4wdXp5JWGfnXWUcBbL84bu6IodBl1yMzt5ba+RRJceNTqWNUYuaHQuaXQqa3TuNtetudO5rDFx48urNT/rIOGs0U8bKraMWxhknUv5SWovlsRBrGNZbOT6yb66GPnpXBLrVBbrXJo7ncpaI9fznGqtQ4azVp5EdDdX7B7Kr36BVnIzO3ltL5FElx6z07EsMXJBonNJolNZonNp7nQqS4xcz3MqsY4YzhL9HOLVTh4h0TndP2FdS2qvlcRBq2N5SZQ4/QpN5KZzaUnkVF4SJW7MdWvQTZx+UyTmTnLotp4xxOfnT86AANkZUPiSw8WNpFzXtvYW8dxewKK9yAV7gQv2AhXtRW5McbQXuWBvcei2XmipvTrSOGbjZzr3CN91GLhHeNPHwvZCPWAaZVdB7T0L9eJqNJGZvtIxlJeEptLCKVAorcbPntyW0FSejmKVjqG8MfWq1zpsOHv1E4nqF5l9apT9JDezktf2Ekm0nSjRsSwxcUmic0miUzkrExe+7mt1UTe2WtFpd8mGRC9vTL0qsY4WzhLT+UP4dsRPclMir+0lkuh2RYmO1ZMki67aVK5KdHHF9Vrh6iZkopcX1juBev2l31BXm8rAjU5feegxq7Se95ZCcs8H1jpROLtLxw7hu9o+nQtbkEXtbXo50aZj2Wbkgk3nkk2nsk3nxji4bDqVbZJDp7VszcQ6RjjbTGcNb3ImgeHUuRf9FGCtWhf2rVOmq3oLyAI6mfQAv163DJR9UAqZyUpxeEAW8loH+NQJrF5qDlh1tZyHIA1ZHBokY0Od1a3bM5o8TBhBZyljhFVjdWJwNpaOFfTrm2DMuRH5euQgjNRWGIFuYRLmVBRGbArjtQ7wqYdiEOZYCZN5H8LI3XNjpRhvz2jymEIYMZTSPtVXHQWcfaXzAv22Ofhy7kVfFYEwYt/CdDGBFCPRTUzGnKr+lCccORa57pKrY5F3zqUljFP11feyvoRFcpdF8YO84/1u4+sv/QIQeHRu/+6czzoUOOtMJwf6TXHQ6VzUSWyvk0Q3Nel06lEfJL1/Kgg6nauOkzUfdDqXdDr1eNPP10AnuUvnvVKwydvdxGzTudFETc46CTjb5HHBLXKY/pyLNontbZLogMmmU4/wtp1Px6rfZBKDTOeSTKfcAmQ6NyysgdapKk0eSGSoc4MSp18/ObcBZOc2+mXWlaGBS04XtnW6iKdOA5WcBqz6TUbIchq44DRQr/r5pVK6MLRRxvbKz3W7GxhdBu6JyzpCOObnVzpn0O9fg0vnoktie5ckuqkhP0O46NILq36T/oVL55JLpz7DB85XYWij1h0yvZgs07knMuuI4CzTzxFef+kmAjKdizKJ7WWSeC7TqSjTsap97764EEq1l2GvlrOB+tT3PCMxGXQnk/e7hVUpmc5rlF3lNPdEZh0WnGXyRKFLrMg+c345F2US28sk0QH16a6dYwhX1ZIpsdZBmRNPSM0QVSjYdMo1QKdzQwOnzkDpd+BBKctCj3W/64xZRwVnlzxP6K6t6sveConpXHRJbO+SRAdMLp2qaslUCJeRk60MXDoXjnQC9fitGyO4ZGm71OT9bqM/E/Do3HgmVGcdJJx18rThFlmmHeh0LuokttdJogMmnU7Fcdax11/6ZWuw6Vyy6ZRbgE3nhoWVmU5V3WQOgFPnRmnqtM4azk55INFdXJFloIdT56JTYnunJDpgcupUdOpY1b4HrTV3OpecOlWlyRgPp84NC8tpoNIMSgw9Nl5vUpl14HCW6acS1QCZViDTuSiT2F4miecynapqyTSA8TZyMi4jQ51LNp2qqDJ6w6ZzyaZTVZqMfchQ50ZpKrXOHc5S/XDi9Vf4PqUv56JUYnupJJ5Ldepdf/sOTh2r2svIBqfOJadOZafODQsrQwOlH06CUmLosX5+1GWdN5xd+qFE9UYYbZ2LLontXZJ47tKp6NKxqn0YbZ1LLp3KLp1LLp2q0mTshkznRml3p79//eBY6ILsWMi/XilxwWljO6dNPHOaqJIlc8Ff67W2dKqlR61/i5xLTaW9hF9Tbw6t1E9Q/TNGq9rLVPCvyD3RWScPpxT9/cuPJypyp/01ePyxIjsXdRLb6yTxXKdTVS2Zf6AzcfqdSNDpXNLp1OsvP+dLpQ0N/x5vE1WlyegHqR51lKY5WicVZ6npOEO/JAVSnYtSie2lkngu1anHb/1UBKQ6Vx0ngxukOpekOlWlycjwj1HalaOyXEOOxnJkaodO557orNOHs04eUXTvVgukhtDpXNRJbK+TRAf0TUsKl3PUS6vqy+AGnc4lnU5VaaIBOp0bGlaOOlWlyfAHqc6N0jRH6yjiLNXPKyqyjHCQ6lyUSmwvlcRzqU69vuj3NSBHIycaINW5JNUp1wCpzg0NS6pTX/oJOjgldiV8f4+M2qxDiLNNP6mobpOxHjadizaJ7W2SeG7TqfpY1P2FY8h0rGpvK93EvevG9u+xuPooyj0qZDIqGim3Md7y9mjhm84W0EjuoLEOHs4aeTrRMasjZOaBRueiRmJ7jSQ6YBppnapqBY+Rk4kCSelcSkqn6gRXngp4JIdW6nvlIZL3u42e3BDp3Ehuzco6eDjr9NOJ6jd51KDTuaiT2F4niW5q0ulUVUsmHaRl5GSKgE7nkk6nfI8Bnc4NDWuMder1RXc2kOrcKE2l1tHDWSrPJ7qPK7LMPJDqXJRKbC+VRAdMUp2qaskMAKmRk6yCVOeS1EC96Ru4IJUcWqmakKO8322s2svAB53OPdFZhw9nnX5CUZFlbINO56yCfxrYXmcoSLr/L6OcW4fIUAqdXlpVX4YY6HROG4mZ06k85JJDK9OQy/u32gedzu11vvzkeAiQHg+96EeZSmfgks6FbXUuopsasjNQ9fEkH3IDVzp9yA1c0Bmo8Hvy3Reb5AzF1GGfjHiVnIF7YrNOHY7J+eJHE68v+oUBsOlctElsb5PEc5tOhZfLUq2q9tJvlZup9jIAVW4G6kvfUFYj7cLQRv1IeY206363MMv0Nj6RWWcOZ5l+MFHdITMUZDoXZRLbyyTRTU2p6VRVS0bkGmlDtYqTMQ02vbyUmk75ohQ6nRsauBoKVNVNniFk6NPSZDX0UmcOZ6l+MFGRZZ6CVOeiVGJ7qSSeS3XqXS3AqWNVe589A6elIUO9tDctDEqJXRkqzz8ylPe7hVmmc+PRUJl12HCWyROJW2SZpSDTuSiT2F4miQ6YMtSpKNOx6rcwdzqXZDrlFmDTuWFhJahTvrBCgpJDl42FldqsM4ezTR5MdOe+vuhPqMCmc9Emsb1NEh0w2XQq2nSsah8mT+f8Tbepje+6SoZMFoY2at2RmrzfLdQ370AiKZQyJjiVWOcNZ4l+KFHdIIMGJDoXJRLbSyTRTdSOqO1JCFfVCpOml1ZcmDSdSxadSh876tpdGmUahEYvp2olHEQ6N3JbddZJw1mnH0dU5DBdOhd1EtvrJPFcp1NVLZkHMV9GTiYIrIGcS0OsU4/f+vW3yEpyVz6JJujk/W5j1V4Gfugkh3K6ceqxjhjOHv0c4vVFP/6NtHQueiS290ii25jS0qmqlgya8Bg5GVXgMXDhG58j9xKOald5aKdUCyJDuBf9NC9EOvckL+uM4ezTDyKq4+RRg0/nok9ie58knvt0KvuMnAwr8Bm46DNyMmwjM8mhndJb8Mnb3ciqvhQDn87tfT5+cgwEyI6B/NO69TuzxiWfC9v6XEQ3NeRnoKpDZPys/MycjGjlM3BhnA1UbfmltLIZuKGBS9lAxdF2cfdnQ0bbRx0zHLMTkNnUU+bKzsBFmyxub5PEc5tOvb7oZ4hhM3I+2iYuZWfiLK3g0+Mmn07V19F4kq7S0Gvb2fNRJwxnn34MUR0nq0f4dC76JLb3SeK5T6eqWtIT8Bk5Gf6Qnc6FRW2g0oevuzS00ufOUEylpVSqxtrAjYdCs7OOGM42/Ryiuk0mH9h0LtoktrdJ4rnNQL2HI/dQrap+P+DXuAebXl6y6ZRrQG46NzSssdapqpvMF5Dq3ChNpdYZw1kqDyK6jyuyzBmQ6lyUSmwvlUQHTBNooKJU517r5a37e0Ag1bkk1anw8esuDI2UrqrVUIiVZXq0JzJx1vB//tf/runx8T/qePe///N6dv5nhfs+hajC/t9//cf/rRs4UNIPusKgc9Egsb1BEh0wGQxUNPjN1YM9qx8mTeeSQafCh67ZF69Xb2nlodCLyQqde6KwThnO+ehHEWUzTJnORZvE9jZJdP9rh/ylOsSpx6t+7ApTpnNVfZlakY/OpQWtUw896MUYSwyNlEETMnm7W1h1CjOmc09k1hnDWSYPIm6Rw4zpXJRJbC+TRAdMMp2qDpGZEDIjJx0Mmc4lmU75Wz9g07mhYc2YTlVpMvBjxnRulKYzZp03nKX6oUT1nkwDf6zIzkWpxPZSSTyX6tTri34OF1IjJ+tMSHUuSXUqHu2t0tBKfcESOerl+NYVOp17orOOG846/Uyi+k3mH+h0LuokttdJ4rnOQMXp07mqvswX0Olc0ulU+JqLLgyN1AEGNr2YqpTMArDp3N7m60/OgwDZCYK+E7lsBi7ZXNjW5iKe2gxUdYhMBJWcmZORuWwGLtgMVPpqhC5tozOUU7WXeaB0Bu6JzjqOOCbnazizeNETLeh0LuokttdJ4rlOp15f9LPD0Bk5H2sDl3Sm0lRDTaChtKGBE2ig/FtLuiz0WI8qMm++1gHI2aWfklSn+UCLwiSFo0tie5cknrt0qqrVTb36Cy4jJ2MaUtO55NIpn+/g0rnk0qnHL32VFglKDn22f8H6tTZjZ51+FFH9JqtqpKZzUSexvU4Sz3U6VdUKI23kwkjrXNLpVHzPe+iMpDOVFqbP56VpjtYBwVmqH0lU78lID6nORanE9lJJPJfqVFVLltzI0cSFT+kGLkkNpdmHpZGjziWpTtUbAWX4Q446N0pTqXX+cJbqhxSvL/pJRkh1LkoltpdK4rlUp6pa0iGQGjkZoDHwOpekOuUaINW5oWFNok5VG2RSgFRyh4G3TiDOOv2YomKGgde5qJPYXieJ5zqdqmqFgTdyYeB1Lul0Kr3z/ZUYGqmnBLVhWfe7iXHDErjxVGhy1tHD2aafT1S3hRHXuWiT2N4miW6q7uDqvO/VqapWGHED99CP8SI5nUs2nUpvfV+FXdkkTz5sejHZpnNPbNbJw9mmH0+8Pn7Jgh9DrXPRJrG9TRLPbTpV1QpDbeTCUOtcsulUPBtanbHT6eXENyLcyukBRbOyzhzOHv1gojpMxnV4dC56JLb3SOK5R6eqWpIAmDIjJ2MxstK55NGpitodfE2GmDKdG+m0pkynsk1y6LNuoth8+8mhECDZUVYDfIwNXLK5sK3NRTy1Gaiqlo+xkdNJrGwGLtgMVLQZuGAzUJ7jtQBanOS46qwjjmNyvoVzkEf4YG7gok4Wt9dJ4rnOQKUT21Ct14d+gBc6U3n3F7brsyiByjq9tKQzUPoqH2wSQ5eNdzWrzTpuONvkmUR3bnWHzDk11L45F20S29sk0QE1XC2AUrho00ur6stMAZvOpeR0Ktt0Ltl0qurWY+k1JEOnc6M0lVqHE2ep4QTjoT8TCanORanE9lJJPJcaqCjVueo4mfEg1TntXqRooF5HB3P+XBxaKbNTrWrX7W5itunhRjC1WacNZ5t+JFGRpYaw6Vy0SWxvk0Q3NaVooKJN56r6Ms/CpnPJplOvD/2ocq2GQmlDA1dDgYovrQRulKZS67ThLJVHEt3H1Q7fqrw5F6US20sl0QGTVKfqjSaydK0lbqhWVV+2NJDq5SWpgYopSm6TorzdTaxKyVyGAde5Jzbr7OJskwcct8gyDSFFnYs2ie1tkuiAyaZT1SEyA8Fm5MQ6bDqXbDrlGpCizg0NK0Wdyktccuiz0UZNzjp0OOv0k4lqgUxA0Olc1Elsr5PEc51OVbVkIoDOyIUR17mk06ms07mk0yl/5Q056twoTaXWEcVZajjHeITP6b45F6US20sl8VyqU3nEde71ET6om6ovGY9FUSpNh0rkqHNDw8pRp0qqDH+Q6twoTaXWCcRZKo8puo+rV2QeQqY6F6US20sl0QHTwOtUVUtmImRq5KTjMPA6lzLVqZypzg0NS6pT8aRo1Q191k+a2Hz/yUkRIDsp0g9XlM3AJZsL29pcxFObgSqbMj2WzczJtFE2AxdsBqpeKusOvjxVii4OrdRNXm1c1v1uY9VeZo1KzsCNp0J11hHEMTnfeU5xiyzzEHQ6F3US2+sk0QFDcoZwrw/9UDF0emnFyRIdOp1LOp2q0mSkgk7nhgYmZ6DSd58u7Ho2+u25arNOIM42/ZiiGiBjGmw6F20S29sk8dxmoNI2NFSrqu9DbeCSTY/qXzQCm+TQSp2tkZy83230pwLJ6dx4KlRnHUGcdfo5RUWW4QU6nYs6ie11kuimpuQMVNTpXFVfxmQkp3NJp1N+uAOdzg0NKzmdiqcKz0tTqXXwcZaaTkfC57HfnYtSie2lkngu1amSJVMQRtzIyYQBqc4lqU75zhFSyaGVY+e4dPJ+t7FWt1J75Khz4+FQnXUGcdbpBxWvj/CB7Hfn9Mdo6jszF7W36eWkFHUq/RZ2x5v9pm9yhU0vTz/PUTuWQMUvpVkcWqmvBGDE9WjVpzKrw6ZzT2zW4cPZJk8oRn889MekMeI6l2yS2tsk0fGSTafST2GnWtUPocr6BTa9vGTTqfhp7FXalZv3l98g04vJMp17IrOOHs4y/XyiIofVkHNJJqm9TBLPZTqVvjHz3bFyGdZCziWXTrkEjLPODQlrtHWqSpO6IT+dG6XpaFsHD2elfjpRkcOKyLmklNReKYnnSp2KSh0rpWHv6VxS6lT6JPY7MbRR3xKB9OT9bmF26dzod3VZ5xJnl+Hw4hG+LOHdueSS1N4liW5pGmudii4dK5dhGeRcculU+kz26onLpeQbXHox2aVze5e/f3IqBMhOhfTRrnkzcMHlorYuF/HUZaCSy4DVL6rKcqOmzcCFJW2g0gcEF7Zxue53C8ulr2gD98RlHVwc8/K3n25UZHm04dK55JLU3iWJbmnIyxCtJEkO1P4kczJDQGaIKlStaAPlFmreDNywwHkzULrWrllzUdeT0Y+hjLG/67jh7NLPJF4f+uUfcOlccklq75LEc5dOlUuZCOEycpIDcOlcSkyn4mc9V2lX/8szUaPsut9t9GcCHj3eeCbUZp1HnG2GQ4v62bb7khs2nUs2Se1tkuiWpsx0Ko6yjtUWvc87rySBTOeSTKdcAhLTuSFhJaZTlSaycYJS50ZpqrTOGs5K/UCiIvse5bdzSSmpvVISz5U6FZU6Vkql8lDqXFLqVHWFjPBQ6tyQsJQGKhklhh4bX/OqLuuk4ezSjyOqATKAID2dSy5J7V2SeO7SqZIkp7AYbCMngzJkOpdkOlV9IVEh07kk06kqTeqG/HRulKZO68Dh7NRPJSqyTEFw6lxySmrvlMRzp06Fn01OlarP3Mp8AaVeXFLq1Lv+aDWMEkMbRRFmT97uBvqDAZXOPVFZBw1nlX4aUZHDutY57bM6qf1Naq+SRLc0zZ5ORZWOlcow1DqXVDrlEuDSuSFhDbVOVWkycEOpc6M0zc46bzgr9UOJ14euKZCdziWlpPZKSTxX6lS5knkAI27kZIxEejqXnAYq/QD2Kg2tlKcf+enFVJfKmAGZzj2RWQcOZ5l+KlGRZREGmc4lmaT2Mkk8l+lUyZR+g8zEhQ/WBy7JDKU9dGWFBHVuWFgJ6lT1bEhQ50ZpkqAfPzkXAmTnQuHLhgIXnC5q63QRT50GKjqNXPi55MAFp4EqCzKEl9PADQt0GqgqTQaPytPAjdLUaR2KHPP0w09OKrLM9JWngUtOWdreKYnnTp2qX/KU7WXlaahVcTK+1aAbuOQ0RDULcOrcsLCcOpXeMbQKu4/g6rKOH84u/YyiXPry9sO55JLU3iWJ5y6dSr+VHCpVKiWhoDIVJ5lSZ30Rk8caKlkaGqmPRE2g6/5oYvqx5MU9t1gnDmeLfixRFmWOQkY6lyyS2lskMZoo3V6fDwzRSo8vgzInfqAxRJXSYNGp+K6vxaGV+qEeaPRy8vjq3Mhszck6bTjb5JFE9+7rQ786DTadSzZJ7W2S6HhhnxKilU0ZKTC+emnFybMIm85pMsGmU2VBRmskpXPDwhpfnaqeldIwZzo3SlOndeZwduoHExXZ17Yfzmn9au+5qL1TLyc5daq+IVZqBaeRk4yHU+eS00ClH0pepaGV8gAhQb2Y6lKpFGQ690RmnTqcZfrRREWW5TQS1Lkkk9ReJonnCepUyZRhFDIjJ/McZDqXZDqVh1tyaGUabnm/25htOvfEZh04nG36qURFlokFNp1LNkntbZLolqbUdCr+SnKoVVmXbIFNLy/ZdCp9V9QqDI3Ur5VAanoxdSAk4wpS07knMuvA4SzTTyVKpiQBZDqXZJLayyTxXKZTNokhMx2r39mU6QkunUsunUrfFLUKuxJTegouvZjs0rknLuug4ezSTyPKpQxUcOlccklq75LEc5dOlSSZdiAzcjJJQKZzSaZTvhrFOsi5YWGtg5yqnpW1HPLTuVGarIM+f3IeBMjOg/Q0rZwGLjhd1NbpIp46DVT6HdaAlXp5IEtp4ILSQKWfSF4Y2qi/5Fj5ue53C6PLwD1xWQcRx/z89NOK14eeeMKlc8klqb1LEt3SMHGGaNGlF1Yufd4MxSWXoTRLqErPUNqQwPQMlK+pKj0Xhy4b84QmZh1YnGXyVKM7t2TK3AOZziWZpPYySXS8JNOpKNOx+hisVB6J6Zy+/ld7zkClH0he2JWYMgEgMT2YvpgBh6SuUvr5U4d1ynB26EcR5VCWXXDoXHJIau+QxHOHTpUc6a+aMEOtivMJM3BJokeNH0VZpaGV4aMo6363sfpUag+PHm9kttqs84WzTT+EqMjSH7DpXLJJam+TRLc0ZaRTZUnmQNiMnCwxkJLOpfHVqfgxsVUaWvnwxey6322s2nfWXSMwbDIeyulKq8Y6WThr9OOH0ujby0/nkkZSe40kuolJo1Px13RDrYqTIQUaQ3np9zoTl34deXGXyPsbHDG2hnAP/SZleHTuSVbW0cJZp58/lE55/pGVziWdpPY6STzX6VTWGTnJE+gMXNQZORmjsO4hh3ZKOOjk7W5kdapw0OncE511uHDW6ScQFbkz/hoQoNO5pJPUXieJbmnKTqfibyOHWhUnwxl0enlpkHWqdvryaEOmc8PCWsQ6lYdacvdHQ4faOl04y/QjiJIp3QGZziWZpPYySTyX6VT9UKIsTjFjRi4MtYGLuRk4SyrodC7pdCr+NPIqDb3WeaQ662DhrNNPH14r5n0ygE7nkk5Se50knut0qnTKkAedkZN5H7npXFrOOhU/i7tKQyvl2cFA68VUhoTVrHPjmRCZXz85+AGkBz+v+raLkhm4IHNRW5mLeCozUembLAJX0mVoLJmBCzID5RYqMwM3LHCgDVSlibivyTNwozR1WgcaxwT9Cqcer/r+Czh1LjkltXdK4rnTQEWnzr2m30UOtU9OQ2l6fAKlxNDI8Gncdb+bmGWynOaeyMQZQ/xh5K/v04fa7fQvC9f3RNgQG7hkkKXtDZLoeGH5E6K9RIPfpdXOu2tfv5h4rz2y0rlk0Kn0GdxV2GVQuqqG2HV/VCqmo4d7YrDaeE5HP4KoZ0dmHKSjc0kmqb1MEt3SJNOp+LPIoVaVjtK/kOnlhbVsoNLPIi8MjZThHC49VvWo70sC98RlZdvZJQ8gum8rstQQLp1LLkntXZLoeMmlU+VIalVrn1Cr4no1eE1dcOnlJZdO1SscsmjB2OrcsLCmS6eqNFmOY7p0bpSm02WdM5yd+mFEOZVegVPntH71HqBF7Z16OcmpU/VFWLLKhtPISb/BqXPJqVNxrxlKGxaWUy/NjwfhlBz6bBwPqs06Zjjb9LOIsumbzS/nkk1Se5sknmdooOLU6VxZl5yCTeeSTafSVx6swtDIcNa+7ncTX+u9g/f5HBo93HgoVGadL5xl8hDiFlkebqSmc0kmqb1MEh0vpaZTJUmmH6Rm5GRYhkznkkyn6tVHGaYw3JK7bMoyA5Mn73cby6aszmDTuSc26xjibDOcVdTZ0/05gk3nkk1Se5skuqUard4OHaLVL3TK0w2bXlpx8izCpnPJplNuATadGxbWQOuUHjfCKKnryeiaa2bWIcPZpZ9EVP1lWQiXzmmfYdIktXdJ4rlLp8qRPGFwGTmpPVw6l1w6lSdN55JLp+IvIq+6oc+27zL4+PWDU6ALslMgbekfa/nhp0Vus6mdzSae2UxU2bRxdsPZOJs4bePfYxvTW9tTaW4zUfVsyJP2rxh1lHbP0I9fdcpwytALcqfSe3DqRxbJKam9UxLPnTpVTmV59tdYq/oVTxmV/xa55DREtXd6/iOWNiz8e7RNPVZPSHDqUUdp6rTOHc5O/XCiRl150uHUueSU1N4piedOnSpXsqKA08jJ6AynziWnTrkFOHVuWFhOnao2BKfkDqNunVCcbaZjDP9xqo9fziWbpPY2STy36VT1hIwbsBk5eRZh07lk06nwDvcuDI30d7j3/W5iJYgMGxhuPdx4KDQ168jhLNPPJSqyDGxITeeSTFJ7mSS6pb64TdGqUlIryPTS6tf7pN8g07kk06nwFvcu7MolecL+GYNlmR7uicw6azjL5IFEd+5r9YfuVD5+OZdkktrLJNHxkkynqlJhnI1cGGedSzKd8kMcjLPkdjZ5v9uY3nhwL6e3t5qTddZw1ugHEqWxNz7X4I+cdC5pJLXXSKKbmDQ6VRplo46cjJykCXLSuaTRqeoLeXig0bmRTGu6dCrLJIc+66qrzDpqOMv084hqgDzVkOlckklqL5PEc5lOlcwwwCZOJybIdC7JdCrLdC7JdMozHJMmOclwtVnHDGebPIvo3q0WyHoLNp1LNkntbZLoeCk1AxWOaVOtalyRZILNVN59FsGO06ls07lkM1D64itkEkOXjTcKq8w6jTjL9COLaoCMaJDpXJJJai+TxHOZgYoynSuZ8ihCpnMpNZ3KMp1LMp2q0nogvcZj2HRulCZOX35yJATIjg/0Q1XlNHDB6aK2Thfx1GmiktPAlVPfnAQuOE1U+I3V7gu0UoLVejYUE2UG7onMOmQ4JuiLn0RU5F5ccSEUuCSTpe1lknguM1BRpnMlU+bYStBQ+yQzlFZv87qPyrUQCqUNC1wIBar2KDITVIIGbpSmCVqHDGenPInoPn6tVzrv7UCCOpeckto7JdHxwgwaoqWf5Ey1qtWo9BuchqgysdQMmqiYoCxtk6C83U2sLpX9AmQ690RmHTWcZfp5REWW7oBM55JMUnuZJLqlSaZTJUm6v3YqoVbFySwFmV5eSlCn3AIS1LlhYSWoU3Fxu0pDn426a2rWWcPZph9IVAt8q/LiXLJJam+TxHObTpUlmQRgM3IyQMKmc8mmU9mmc8mmU/5SGzLUuVGaOq2TibPTcHzxqh+DRIY6l5yS2jsl8dypU3m4da72zjKywalzyalT2alzw8LKUKfiS2ShbqM0dVoHD2enPJ3oPq52yPgGp84lp6T2Tkl0vDTqOlWuZPRAnkbO9y2BS05DaTb3YdR1blhYTp2K50OrNPRZTxgqsw4ezjJ5OtGdWzK7zKtqkOlckklqL5NEx0synSqZUivIjJzsIZCgziWZTqXfP+7S0EpdbmDHEsp5HYcFV59iuHVuPBRqs04ezjZ5PNG9WzZlsoJN55JNUnubJDpesulUHVrJmvuvsVbFheHWy0s2naq+kAkZqencsLBS06nwZaZdGLqsY6nLOnc4u/TDiZo5pdfg0rnkktTeJYnnLgMVd5/OlcswzDqXXDrl3yECl+TQSn3JApnJ+91GfyaQmc6NZ0JsPn5yMATIDob02S6bgQs2F7W1uYhuacjMRCWbgSubMh7XOBu4YDNQfqJTNgM3LDAzAxXPEgI3SlOnddxxzNBHOhPRrxOAU+eSU1J7pySeO3WqXMkcUKNtqFVxPWZd/QunXl5y6pRvGOGU3JWh8gRVhq773cZa1gpXGRq4Jzbr5OFs048naryVBSRsOqcfsf/ToL5t6pfE/3kQ3dKUoR6t/lUW27BJ7v/77/9c5nhtRJD/rFOg9Z9NverXf0KcFzY6fCWjU49X/ZFa6HNulKbJWIcRZ31+YlH6ZMKBPuf04+vQR2qfjCS625K+QFXh9+NG6HOuai+ykIzO+Yf/EhW+86kxNFJXichFD1bfOiQjBGSSQznj7UWqsU4Xzhr9CKI6QvIfGp2zDxPAI7G9RxLPPQaq2u0encsenUsenYoeiV39LyM9PPJ+NzF7JIdyxqvK6rFOHs4ew/HE65vszODROX0dABpJfWtMoymJbmNKx0DZMh7pSG6OprzWET71lT0Mp449HvohZIyn5NAkeZDgjLdntJB6xC71XYwqq4OFs7Jw+vCqCwcocy4pI7VXRqKbmJQFKiojN5Xx2oggYyqMOVU5K30NY86NOWvNgE596U9QYMwkdhBXRwRncX6OUOdxvlN8OPeu392FZCP2bU46DCsXAqNb+9G7OuIvkbKXH5FqLGx647UO8DbmlSsCxDlWEWSugDhyaJAMQUg13u5o1X1y7ABl5O7FaKrVQcHZmJ8mVEh/4erh3EPf6gxjxLbGCHQTU6o59ab9AGPEpjFeGwHkwYEwp6rZ8uhAGDm0R0RAGG93MPvlO/gidi9FfdVW/+zLzwOq4mFx6Vz0RWzri0C3MPlyqmol3Q5h5KYwXhsR5D8hzCnrafgihvZIr8AXb49Yb/reAQgjh2LGa/Ji7PUn5y2A7LzlXcaGmswSJyuoSrBF7YQtYDRRnusaEgNVwmREKmGLG8LWtRHBhQUqCVsY2iOllLB1u2N96duAytfCUMoYn9VXbfmPGfbKc4EOWV0jJuDLOXvNHMKIXVW7L9NrBlu3O1rIr0R9hU9dLW7qYgVGBOnoyq/1n01FXSwMrZE+gS7e7lLe9fU46CJ2l662amd+tuXb97IlSybYCpzUH7JIoWK//iDdBF0EuoFJl1NpwbEKm7b8X8MZ1/rPrka0xcKuZ0+WYdDF+11MveImHHw5NwZ31VZ78LM2btRvkWWChTbn0jS2sK03Lyd5cypOYyvcFOf/m8Q5FcURu8TJ8A1xvN/dV98eK089xJFDOeO+Kqvt9lkZ9+Qdsx4WXym+OpfW9gvbKvNykjKnYqoRm8Z4rRuUjDkVjRG7jPnKYzW3g1XviVkYYznNPUm12nOfvXFj3iVWZKkhUs05fY8mRkhSVzt9OuPtDpakBcqmdaw+yE1rvDYiyDiN6cypaI3Y1RpZkyHPeL+DVd9JOFhz7om12nCfrXFXfossNYQ159Lp48K22RbKkacTy0anYrYRm954rRuUss2p6nBZl9Y6P1RkdDhPQAJlTwHsMej1FHQwHSVr1332xq15N7MaICsNeHNOXyVGtpHaaiPQ4VK+ORW1EZvaeG0EkOcf6eaUdTSsEUNzZLZCtvF2x6q+Ew6+nBvy1Vrtvc/WuEGfkfXLumDNuTRGkkIzZYLEGpK3O1hyFqg4RpKb0nhtRAjSnKr3BskaDNacG929cs0pewTgjtjVNx1MrdUG/GyNu/RuZjVAOhzWnAvHxIvaWAuFhAEyUNEauWmN17o5aYR0Kp4Rr+Z0acmalxatEbv6pntYrL395DwEkJ2H6FeklbXA1cX7iqOGyIWhar/+oLvNyrdFdE+EfAtUGiMXNsStayOAp1ug4juHFocGyRNWg+S63cHqoZd+qUQL3PCv4mpDfky3N+7ab5GloRDnXEi3RX17k2KgLRQj3VErkkBVd8g6qZaSi5veQgSpR81t6z+72dkbS0ODxAe88XYX86Uv7UAbMZQydlcqrHbkZ2G+ba++6fXNNXRDmHP2y3vINGJbYwS6iSnRnMrGyE1jvDYiBGNOZWPk0CApBsZ4u4NFY8Qu7927aqy24mdj3K93yOobXz2+ORfex7WorTAvJglzKgsjN4XxWjcozGmrok1lYSwNDZIchzDe7mI+dVGNFCN2EFY78bMw365X38iSFSnm3It+RBkpRuzbWJrMSHQbk7JApWXIijeVhf+V5MCo6JS9uFxrx4WhQbpUhjIvxs3DGTmUs8+x2oaflflevd6YLoeeUOacPkwwRmpvjMRzY4GKxshNY7w2IgRjTnlXQxk5tEiGHhjj7Q72pa8/QhixS/x+xVhb77Mx7s87ZBnrvcOax5yL8xixvTISHTAlWaCiMnJTGa+NCEGZU1kZObRIBh8o4+0OFicyYihlvNquE1ntvs/KfIteyvoxWMoCJ88ckozU3hiJbmIyFqhojNw0xmsjQjDmVDZGDi3Sr5GBMt7vaHEqI3ZQVpvuszLuzDtkKZMVN8ZF59KJ48L2zkJBEg4LfKfivozYVMZr3aK0+HAqKyN3KZPRB8p4v6NV/8lGACOjc082ZrXxPpvj7vwWWR5OmHPuTV8qRbYR+zYn5WBnRqDjpWRzqvpDVm3YmZGb5nhtRJB6YA3iVDZH7jIngxDM8X5H+63vbYI4x/bi3n9yFALIjkL8l9g/AqdrqfK2qG3GLaIbGsQFKmXcwoa3dW0EcG+Bit4Wd3mToaG8rfsdrZ4wmT5KXOCeiKsN+DHj3rlLv0WWmbcyLnBJHEvbJVwqRrqjRspAxX3a4qY4VqEbFIbK9Z9NZXEs7RInQyDE8X6XkxYkC0Mx46xEFiTvtQE/G+MuvUPWRzB91Y/CJCWTMVJbYwQ6XMo0p7IxctMYr40IIdWcysbIXcakHBjj/Y6W1iMLOxirHfjZGLfpHbKMybyLHHMuba0XtlUWyglJ5lRWRm4q47VuUUoyp7IycpcymVehjPc7WlRGDMXsDxzfawN+VsZdeocsZTLhQlngJBUxn5H6NhYOQxbR8VKWsZymqlaithYiq7SpzP83KXMqKyN3KetjDL6GtmrQNY3KZjHj7Vo6LtYW/KyM+/QOWZ0jQzaUOZfGRVJ7ZSQ6XlIWqPfwrQurVlNZ+t/7y0a1dlz/2fWI37CwOLRIP2aFLPNorh5rEHKX+l6jqLPag5+dcaM+6v6qH5+AM+fCCzGL2jsL5Uj6YPnhVFw2EpvKeK0blLLMKe/qOsBaFbm6WhZlUObl1CMvAyiUkbvUrydIjdUW/GyM+/RuYIWUAQDGnNM3ZWNgJLU3RqLjpSwLVHpX8Yo3lYX/lWUDssyprIzc1dUyFUAZ73d7qv86i64BFMqce7LSr4342Zzv1iuyPFQw51ztGNdDc1UQ6ojt1ZHopiZ1Tj1+6SE25jRyUx2vjQhBnVNZHblLnQwLUMf7Ha2+O0QUQ51zT9TVVvyszvfrFTksIJ2LC0hie3UkuqlJnVNxnCQ2zfHaCBDMOZXNkbvMybMKc7zf0ar/ZDUHc87tzf3+ybkIINmEVWR5tirpAhcmuEVtxS2iWxrEBSqJW9gQt66NAC4uUFHc4tAgXRaXuHW/o1X3ieASF7gn4mrPfky5376xr8jSUohzLr1Ss7Bvc1JOnUQuoFuaxHm0KI7YFMdrI4BUo6a5UI0sjqVd4mTFAXG839Gq+4SDOOeeiKut+1mc7+8rsi9QfjsXtgGL2mdcKEfyu5aUq5zujyjOC6vKy+qgvrIiFBeWmYGq0mTGr2Xm4i6Z95keLr1S6YxrYShlfLuMrDJ/1y79LJFb+e6u1zd9cQnZ55y+Y6qWKovaS/RyUvY5FSU6VpWX2RoSnUsSnbKdNBwSk97nhnzdnz2qzwIScpbTA61KrH37WSI39zOkzmqQ6Nx4zZbrzUXtJXo5SaJTZUcyttabK94cQ/1/kzGnKkL35dUiKCOHFsliBGnH27P7kjFyl/mVvWqsdu1nY9zaz5DaQhhz7uWXfmkjEo/c3hmJjqguMHo6FROP2FTGayNAmPacyiMlOTRIBlIo4+0RbHyB8yUeOUYMpYzuVWW1az8r49a+Q9bDJhMtlEVOpkUoI7dXRqIjJmVO2c8cIsuITWW8NgIEZU5lZeSuzpZRGM54v6O966MMZ8SuYjqZ1Vlt28/OfG9fzmSWh7PACQVjpPbGSHQTkzGnYpIRm8Z4bQQIxgKl2YFhkRjao18GBGG838FcPIyRu4z1+KrGard+NuZb+jImAwCMORd3A8T2ykh0I5Myp2KSEZvKeG0ECMqc8r6GM3JXX8tkCme839FikhG71G+nstqln435Vv71Lfxu3m/n1CtyjNReGIluYRLm1OOXfnYWwyK5aYzXRoRgzKlsjNxlTMqBMd4f0TRZkWTEUMz4ujtJso+fnJUAsrMSfaNqJVngdFVZyha1VbaI0UR5dGvtEag0LC5sGFvXRgDp6dpyByoaWxwapL9PUsbW/REtGFsYiunZRIXVvvyYYx++ea8c65H2Wu9AmHOqFcJI7YWRGC0MwpyKObbiTWP+v2N9drUHxpzKxshdxqSmMMb7oz3JGDEUM77yXJXVNv2szPfypUyqBmXO6duUoYzUXhmJ0USJhhxzKuYYsWmM10aAkGNOZWPkLmO9yrvMwxjvj2jJGDEUM75eXI3VXvtsjBvyDlnGpGow5lwNz2sOvVoAZcT2ykh0wDCTrXKaSkuPhU1lIUBQ5lRWRu5SJuVAGe93Rd90VVkT2cJQzH5YrL322Rg35B2xjEnNYMy5cWy2hJHaCyPR8ZIwp2KOEZvCeG0EkOZgVHQqCyN3CZMnFMJ4f0RLOUYMxYwv0NUcq7322Rg35B2yjEnVYMy5NJGR2hsj0fGSMaeqVrJlr8ViqFVx/QxfT1KdNwYuTW4pqh471ZJ/lXZplFpBo5cTv9hncSinnyrVWNvvs0bu0btbqyN8l/bh3MtYu67MI7b3SKIDJo9OxcxzrL4qXV5ehkbnkkancjaSuzTKQwONvN9NtB9Qx/BJDMWMg3rVWHvys0Zu3DtkdYSc3CAbnfvUXwrAjEdsr5FEB0wanYoaHavay6IYGp1LGp2yz6ghGYmhjeP9xdejDIu83y30pwEayV1PQ2eOaqx9+lkjN/Mzpv54FDQ6F94ptKi9RS8nWXQqWnSsLMqqCxadSxad8u6HRnJopKY+NPJ+d6lNCLBIDMWMrbFarL372SI3+B2yOqLH6esJg0Xn0ltPFrbXGAoKO4ZAfen3amNudK6qLzM7PDqXPDqVPZK7PMrIBY+8f+tUmUMhktwlcq3lxePnTw5XANnhik565TFwL/qGixpUF7b1uIhuY0jHQKV0XNhYla5rI4A8l7UqDVRUtrhLmQzXpWzd72i/dY1VxhZ2FbM1Vjv6Y+Z9ctvfEevR7TGZmRe4l1/6VnUoY3nfyqSr6i0oC+iAyRiLaSoaIzaN8Vr/a0iyUI1sjKVdXS1DBIzxfker3y6R9RSUObd/C8pn7ezP5rj9v0WWYQC55tzLeBM816EL24oL5Uh/1CHLKqZr9aUHBDViLmyKCwHk+UGqOZXFkbvEyZwKcbw/KyorU3gjhmL2s9xn7f/PxvyQoJ4VGQVgzLkReQkj9S1MZ0ukGoluYko1p6IxYtMYr40AwZhT2Ri5y5iUA2O839FslQpjxFBMD2Q6ndXG/iyMu/+OWMLkoYcw5170Ox4wNhLbGyPRAZMxp+LgSGwa47URQHoaOeZUNkbuMibrHRjj/Y5W/Se5CGXOPRkca8t/NufnAhVZWgpzzqWXUhf2bU6dINe8IDsUwPDoWFRHbKrjte7MNK85ldWRu9R1mlyjC9TxfkdL30y+MBSz35F/1sb97Iy7+w5ZzuSpgjPn9LUFJBupb2VpeCTR8VQsjDkVz8cyJxNK7QEClzSmqOF8bJWGVuqyAxq9nHg+trjLY09JOmrWzv3skdv77tfyKPsOeHQu/SDAwvYivaAk0qmYeo7VglgWdPDoXPLoVE5HcpdHWcTBI+93n6YDsoWhmE5qtVg797NFbu87YlmU5xkWnXsJJysL21sMBclUi3R0Klp0rCz2c30Nc7DoXLLolK086mBlFYY26jEOJHox/jBgOiR3PQxdadVY+/azRm7ubxr70bg6AhqdixMhsb1GEh0wJaNTUaNjpVEWENDoXNLolPc/PJK7+l+eQXjk/W5iOiBbGIoZ78wWjV8/OVgBZAcr4YfCApe+smZhW42L6DYGjYlKB2SBK48ytZfHwAWPgYoeF3d5lKemPK773caqlUxUlY+LQznbdPyqHf4xHQG5RxnvKx0Dl9JxYXuPHjB5dCql4wo3lqXrWndiUuYBsjJylzJ5QKCM9zuafY0ijBG7jHX3aurV5v6sjCcAHbJ+37UfA46gX8696Zfr1Lp0YXtlXlBS5lRURmwq47VuUVLmVFZG7lIm2QNlvN/RbPKEMmIHZbW7PyvjEUCHLGUykCPLAicrPRgj9W1MXdTmbxEdL23+ApbezbKwqYx16AhJmVNZGblLmazpoIz3O1r6LNbCUMz4xS/Nstrdn5X5EUApkzEbypxLb0Ba2LezsPtbRLdRzdZyM1BVLTlHqPPMxU1nXlX9cYY6a1n/2fXwn/itRcni0KIe0bhfX7e7mKqoDKBIM6/UaI6aq0OAszk/KajIMg7AnHPptbuFfZtTJ8g2Lyhmm2NVL3nYoY7cVMdr3ZtJnVNZHTk0SToG2cbbHawqKkt0qCOHYjoz1Fnt+M/O/Figfqpbhj44cy58aG5R38pSsnk5KhbJ5lSc0ohNYbzWfZiEOZWFkUODRASE8XYHq96TnIQw557kWu3wz978GKAih7WIcy/aH5jZiO3FkeimJnFOVbVkvkWqkZvmeK0jaE0xSjqVzZFDi7SmUMf7HU1/tgbinKpfRelu1pSr/fpZHTf1Hbn6qNN4LSOdCy/+fJH6NqctxShJouPFUdKxPEqSm+p4rUMkdU5ldeTQpNHZa4bj/Y6Wh0lyVzm7F8e/ag9/duYb/XImsz+GSefCOzYXtXfm5URnjmVn5KYzXuteTM6cys7IXX0tCY904/2Olp2RQzk9kN7z7PPXD05KLsh22PqO5z++RE4WB38a1Lczn9pSOZqNfxnldEfoj5z9dVAtLJXvwhKVhDV3CbO1SN/vevr4mKjKiy5NvdVu/JRrn7+4Ze/IVaYYgTfnwjKysb24UJA8wRDnVFiTNDbN+b8mc05lc+Quc9Iv/4wVrf6Txcu/IrddlHz+qk352Rx37tOcPjUwFzhZciLjSH2L01z68yA6Xhglu6DGojnGm+Z4rf9Ve/LvuR76QtE/BoYGiQ9481juH97IXf67HM212rqfjfn+/vVNf8kOxpwLm+3GvpWlQTIUFHLNqceLvhcNwyS5qYzXnitzyjsbzsihRfqGD0jj/Y6mDzyUOVXdvFtGfv6qrflZne/fq0zpS6hzTt+GhWQj9W1OVjbINQLdUM1IDJJOVaVkbQtx5KY4XhsRpB7INaceul+FN2JoT68j/r2E7Nsdq+op0SCOxTT3ZIysbflZG/fuXWJFluMZaHPuxZeSjW29hXLkIYE3p+IQSWxq47VukB9IxgBJGwtDczo/ljbe7ljVeb3cuDhoc+6Jttqcn7X5Dr4iy+QLbc75pq2pb2tpnAzlBG1OpbekdLzpzf83eXMqphsxNEjSHaMkb7e39OaT5i79vSTQqa125WdjvnUvYz1dXs8KjDkX3rLX2LcyGSowQIZygjGnYqIRm8J4bXSiVAPjo1NRGDE0Z7xda2Ua73ew1zf9mlRkmnNPMq025Gdv3LXfIssQDm/OhRdGG9t6C+UEb4H61LdhYWIjN8XxWrcoZVqgPtUMZjZyV46sU40ljrc7mPmHN2KX/+5dzbTajp+Ncc/eIetZkdEbxpzzt+s1tRXmxaSViFOvr+PRvPoLwshNYbzWDUrCnLKehi9iV09Lr2Bs5P0RzHYxMEbuKqefUDH28pOjEUB2NOK/WFWPn3F+6t/UzlgoJhgLVDS2uGFsXRud6GNjoJKxhUlPM8XW/REsGVvcVU7Pimqs9vPHHHvhpr9jVo51mVfdKscCp4vLWu0vCjWTR7KmsnW7gyVfXqU0la3Cpi7/15Bg6z+7GlEXC7u6WSb4SrBQjH2jZeXXwlBMd6zKqs33WRZ36F3xkiXPI2Q5518G1dRGViikR4fruagFfggVZbGwKYvXujVJllNRFrGrMT3vrNzi/Q4W3tbTzbmc723VvvtsK23O9efWYCtysvlAcpHb+OLtbmFKLqeiL2LTF6+NAPLs1Tpx1bKp6IuFXY2R5wrJxftdTPRFDMWMYxTNrtpun335nryyy7diL86FrdiiNrZCIdILyC6noi1i0xavdQem7HIq2iJ2NabTYmUX73ewOBQSQzHdWpVVm+yzLN+JlywZpJFczj30KyqRW8RQs19/kMcaUxeBbmHKLqeiL2LTF6+NAFINZJdTD/3VjVobLgzNCYOhl/L6pj+9hqnLubHSVW21Fz9r8w17RZYaQptzURuxrTYCo1f7wVuTmFNRG7GpjddGgKDNqaiNGJojyyeMibw9YtVG+b5VgzZyd/vqq3bYZ1++DS9fUjX4cu5df/8IaUZs64vAaGLw5VT0RWz64rURIPhyKvoihuZINeGLtztWdZ5w8OXckzSrDfZZG3fht8gybkObc2kqI7W1RqDDpcHRqWiN2LTGayNAsOZUtEYMzZE+gTXe7lhlTaLBmnNPrNUm+2yNO/FbZD/Cf3EunSwu7FtbOAxeRAdM3jxcdYgMO3XisUqb4vx/0yrEqSiOGBok6zKI4+1uTdVTOIgjh2J6KJPh8fGT8w5Adt7hv0X1Gbj0osvCvo3JM1erkAV0E4OwQP3/jP1rkjMxskSJ7WUWcO0ji/Uak/Rj+t19N6ENyGSm2b8pPKsdEXR3EPU38xCRwMlAIsBXSrSFDV/r2Aggl1GrkEAlXwtDd2RpVr7W6Y719u7/Q5W4faLdq2g/Jhog1fbu/0NVS1jj9PcP66G2qB9r+m4ftHk7SZtTURuxqY3HeihDmoXLiNrYGPqjG8XwxvMdrLx1Il2rqsqzwL3wVvX52ZsX8RVZHqj1WLs7F9ON2DbdCHRPkzenojdi0xuPjQAh3QJl675a9a9uX+JkUQ1x3o75hzdi0oxOkFV6n42xPu8OljF56MJY4PptuuuOQqaR+hEWnmiL6HjJGNsZ1Je+6VpPtNXaVBZeG5QF6kvfJIQyctdYP6/kYYyn+0KjMWJXK52JaqzK77Mx1ugdsoxJD2EscPKshTFSe2MkOl4yFqhojNw0xmMjgvQHz7RAfesP7cMYuY0xnu5g0Rixq5XOBzVWBfjZmFfpZcyXjXfnwpsui/oxJgOFh5k3k4Q5FSdFYtMXj/UQpoeZUzbQ0EXsGmgZFGQYz3ewGjxZ3GJSdO7Fw6wK8LM2VulPkSWFkGjOhW9aNLb1FtqRR2ftOIZo0Rsbm954rDuUvDkVvRG7vIkPeOP5DhZ+PaYxNNNjq2lWBfjZl1fpdafIsha+nIuLD2K4sp6yr0cdsoynu38py5yKtohNWzw2AkiyY1Z0KtoidtmSMYEtnu9g4euejaGZ/aRYhffZllfnb++6mIWtwPV9shYepDayeLq7l2Q5FWURm7J4bAQIspyKsohdnQnLRJ7vYOHr1D1yl/O9raq2z7ZYknfIsiWXBlvOhV/1bGyjK7QSZkKnoi5iUxePdXfSTOhU1EXs6oxcJ3KL5ztY1EUMzezfKXv7zbYHIKufdeOwdCXOV/WLyrbW6e5fSK5AJVsLG7bWsRHAkytQydbCrs50VlwzSdla5ztYmgkXhmbauTy33qoSP+YWIJfVbV5XBlnOhc8FLwoX9ud/Qgm2iO5h8uXRKuNlvKoEC60VJ3r+GTml6nEWWrvXZ7Gf665aNS4OvfTH2TrdXdQfK68l46LQSM9l6rCq7bNDluQdsEZBVrNw6Jx+GLqKskXtHXo7yaFT2WHkgkPnkkOnskNy1/D7CnKNQo9pkjhb6TtBJVYBfpbIKr0D1nDJhUGicykRST3fXVw/hkaSQTbydEmy/kEWkpvTJo/1a5Mtp/TnOZFvpNCZHuU1afJ0h3LlyDhyaKYHVmVV7X2WxQK9Q5YsuTTICpyMHzKOFC4sz5okOl7y5VRdlcSDL3LTF4+NCJKDmCGdSr5IoT/SCB5yPN2hsi9yaGbstaiwqr3PwrxAf3sfba7HnHO6coEwUnthJLqPSZhTWRi5KYzHRgQZawhzKgkjhf7I8w7CeLpDZWHkLmH7Z1oV52dhXsGXsG5zCXMuPdNI7YWR6D4mYU5lYeSmMB4bEYIwp5IwUtdIPy9QIIynO1QWRu5qpicKzbCqz8/CvIgvYbJ1gSnROZ04kWGk9sJIdB+TMKeyMHJTGI+NCEGYU0kYKfSnnz3rEcbTHSoLI4dmxnd9VVjV6GdhXsiXsLDyd05/zgDCSO2Fkeg+JmFOZWHkpjAeGxGCMKeSMFLojyylkWE83aGyMHKXsJ6+VFiV32dhrNE7ZgmT6RoZ5lzKMFJ7YSQ6XhLmVF2VDDsWHeSmMB4bEeSVeIY5VRHECZaJ5NAjmXigjKc7mHrHIpEUGulEFV+P3+yDALLSWv/ZrnwF7qH/IFUZtrAfYTJOtSm8gO5g8BWo6Gtxw9c6NiLIdZSvQEVfi0OH5DYuX+t0Bwu+FoVGtk+wx2+2QgC5r26TS47A6cIEutjaVheB7l/S5VQNplQalV4r3NTlrw012HplX0f9ANXzmqKyK2IyOLDmMV1+5dniMDzjqjTRqsA+TowPVuHdg7f38XRc4pxL4kj9iAt7WCFeMsd2nq6qHwHXVcFc5GT+qj2swI1xu1pD8qXWwmS5OPRSn/rw6O2E/Y9FXRbXPaMSq/A+S2R1/jRcvhx5OBfep17UXqK3kyQ6VbeWTFaQGDmZGyHRuSTRKU8i5CQ59FJSFg55uodUf9EUmRiovnBVWTX5WSUL945bgyYPbDz4AiczCiZSUnuVJDpeUulUDWr3dOUjuTmT8tiIIK9E7jmVtZG7skZmBHjj+Y6Wnnyk0EpfjAqrmvwsjIV7ByxhckNBmHP6Q6sQRmovjETHS8KcyrkXuR6RSyxyz7mUe05lieTQS7lr4ZCnu4v626/IvUD1havKqtbPKlnSd9waNLk+qHQu7Jssaq/S20kqnaqrkjsf02jkwrPQuaTSqaySHHqpBRVc8nyPaXoWkkIrvUBTiVXBnyWyzO+ANVzd5nVHQ6JzoTRf1F6it5MkOpUnUHJzAuWx7lES5lQWRu4SJu8ZQxjPd7Q0gZJCK/10UmFVwZ+FsczvgG/v+ndIEOZc2F5e1F5YaEeWSvVprdXOvKr0xGNrUxiP9WuTMKeyMHKXMMl7COP5jpaEkUIrvQZTYVXBn4WxzO+AJUwuDMKcS6tNUj/Cega/EhWlOYEOlxLMqboomf0wS0ZO/OOB51xy6JQucLHUJHWNvSwNYJDnu4d+J+CJR+66E3pKE4nvv9lgAWQFu943JTFw4Vm3qJ3EBXQXg8RA1UB0R7nMXNxIunVsRJCbqZaZgUoFe8Ae+vsCJS5gUdziMDzb2fK9yv9j8gFyb9JReHNOK9Vabi5q682bSd6cism3wrWj4jz5AheSL1A++pV+i0MnZaQgMVx8T5DXLVe5tyg0Mv5KTXOvSv+zQ98fqGHo+4JLlHfnwmb0orYOQzMy5vXAW820m/r9TpnVawJd3My9EEEGGrkXqDf9YQH4IrfxxdN9oZ9hSblaaWz/sfL3quPP2rzYL20ynSP1nAtbZYtCL2WY66m3Tvflp8TzUHVJUrFAGrkpjcdGhCDNKX1KQBkpdEbma6QYT49QZh5JRg7N9MBqjlXxfpbFCr9D1sjIpUGWc0kWKVxY/JRJaCf5YjvzqvSv4OArcnKX1ColcGmi9NZuNvywSG5jkaf74nVA4ZAUGukrVodVvJ8deoVfvwcnazo4dC4sNBe1d+jtJIeJShOlc3X1MvHCoXPJYaCiQ3LX8Ht5F6KFfc1E9dygLqt4P7tkhd83T42GPGfh0rmwTbaovUtvJ7lMVHLpXHbpXHIZqOiS3OVS7hxMqzzfYxr2yRK1d1l1/dkli/+OW6PRba71i3OpdiC1d0mi4yWXTtVVSQZgbo1cz1TX1SMvnUsuAxVdkrtc9rPtigaXPN99TJMrKbTSDzNNyKr1zxK5IdABa7jCIjRwssBAIUFqL5FEx0sSncoLGnJzQcNjI4LclFiFOpUWNKTQH2kEtnh6hDLreBiSQzPjI5MqrAr7szBW/x2zhMmdhBnUubBPtqi9sNCOzEEoG5zKwshNYTzWPUoZ5lQSRgr9kccKhPH0CBWFkbuE9aQgwj5+s8UCyEp1naBLWODC8mVRP8LknqyKYQGzi+tt5WueKV+Bqruop5KLq1kycjp71ywZuOAwUGGfbFGXQ7mzS+I6P3uoBWRl3eIuib1eVIlV+B+z7iPsDrzr/8VBonM6WjVNLupHYvh8xCJmH92iR4tZt1obWbeOjQhyN9U0GaiQdYu6Rvr5MiHML9MLDwgjdzXTTxcVVpX/WZhvD7y9+9/sfX04l77wuLAfYzJQSLvQjk+Tgcpp563V1csiBmnnXEq7QNmsV4Xfau0af5kM4NHb0fSFRVJoZWxCqMUq8s8WuRPQN2mNg4wr0s65sEW2qB+JKe1COxINk6dTOe3IzbTjse5RMuZUSjtS6E+YJ3l6hDLtEEYOzYzPfKmwqujPwlj2d8wSJg9iCHMuvO26qL0wbycsJ1c786rGrbmedmxtCuOxfm0S5lQSRgr9kTU28ounR6gojNwlbL86qT2AszBuFHTMEibzG4Q5F95IWNRemLeThDlVv1L2/GDB6oTY9MVj3aHky6n6lcjnAJgRiaE/+uMGMMbzHSx9NXxhaGa8e6wZVoX8WZhX+yVMbiYIcy4JI7UXRqK7mIQ5FYURm8J4bASQ+w8LEafqZ1hdGLGdMJ7vYOlXr1e0g7Cqw8/CWKx3yBIm9xqEBa7XQNcUhaUjqb0wEh0vCXMqfZ1/hZvC/KW3P/pRNyiLnHQJSUbuctbT2dVlJBnPjw790Y/y4DlGDu30+GqSVS1+dsaCvUOWM7l0OHMu/VDowvbSQkNh4eFUzDJiUxqPdY/StOhUzDJi6E9YJ/J0x0o/wfA0KntfVYqffbFe74jlS64MvpyLvojtfZHogCnJnIpJRmz64rER4I9+FxBJFjm5dZBk5NAl/eEXJBnPP8WThRuSjBza2Ur7/M3GCCDbGNH/YCxpgdPnXU2Mi9o6W8ToogxULe4D9ak/KV1Lj4UNZ+vYCOBPskB9fstAl7CA6d56aQtUWoAsDIPz6GuSufGzCvBjrgFybTJtQ5tzSRupvTYSY1SDNqeiNmJTG4+NAD1E11OoEi10J2rzxpI2p9IyZMU8aKuK+6yNZXn38u19/JPp1U9ocy5pI7XXRqLjhRkyRLvZSCDd2Nr0xmMjQvAWqO/wQ6ErAnokdzMSzZsx/TU9Bmzo13SrwvvsjdV597K8SQLAm3PJG6m9NxIdL3lzqq5KZjF4Ize98diIELw5VRGEwzxJbuONpztY9ObYC29Vf5+9sUjvwHX9UrHAm3OhTlvUjzcZhtp/XECHS9o82O1TyyhoIze18diIINeBadKp+stCq9MWhv701jyX/Ot0x6rB6+XGxSHdPNpjbA9qvlW1fvbmJX2Flh7Am3Ojsr8uEKsSUltvBLqnyVugojdy0xuPjQjBm1PRG7FNtvF0x8renKsvK6+7RL1V0X725pV9hfYS4NO5+qbmCr3EEduKI9BdTeICFcWRm+J4bEQI4pyK4oihPzJP4/HG0x0ri3PuMeosFVcV+Vkcy/YZWv+wFgnnXHhDe1Fbb6EZeZqiCghU9EZueuOx7lAotUOE6I2NoT9ynfDG0x0re3OuviO57nr1VgX82ZtX+W/vX7Jygjfn0gOO1I+38N5MaCclHNvpAclPOHJTHI+N14aEc8qHHAsT5+yPnWDQMbsP8KQjhvEZ9buaq/L8bI41fPezzMkcCHPO3fQXJPGMI7ZXR6IDJnWBijlHbqrjsREhqHMqq3PuoSU61DkW1RG71G2T7us3eyaArPgO//8buPqaysp3PuUWtlW3iDGwMg3VdJmopG5xQ906NiK4ukBFdYGrL208d7zUJUyXqZV1C7vUdb8l676qnD9mHSBX17fD5aSyLnDhvexF7c15vJB0q50x+tEcW5vmeGy8NphzyrKkpst1IddQy2QEY96M3wBQ5lx9oWDdAGquyvqzOa/9a76UnsKcc3f9ZF7Nlwvbq/OGkjqn3rTkr1puhWtLdfVSiNZnSQI3VnbX3Vn1XaDuD30zBjp5ceikfncPOnn+6aq8wgvcvjD/qir+bNNL/RoPL/DQmORrtElsb5NEdzXZdCq9VxCuqq5eyhzY9OaSTafslw4gkxj6KLHgkqe7g3VNwaVzL1xWaX926fX/27v+zyoy07noktjeJYnuanIZqI/wWw3hsury5WkFmd5ekunU/aGfUYRNcldqrpnxynDY5OnuYrbp3AubVfCfbfquQA2HPApg07lok9jeJonuarLpVMxMx+rq+8lzjS9kOhfKw0DddbceLtnYJjN5ujtY1yRrDjw0nXvhsvYAzi59o6Aih2emc9Elsb1LEt3V5NKpL52p8Mx0rK4+PDOdSy6dun/ox88gk9wmMXm6e5hlOvdCZm0MnGX67kFFlgkeielclElsL5NEdzXJdKrGVSzBpnN1+fLER2Y6l2w65Rpg07mhYc22ToUv/Ky2nu8MXczWHsHZJTcSemjr8uWhDpfORZfE9i5JdMDk0qm3D/2vUriMXHhkOpdcOpVdOpdcOlV9kOcXZlvnRmsqtXYPzlK5xdBjXJHl2QOpzkWpxPZSSXTAJDVQ9oPWkOpcXb48ppCgziWpidItRyQoOfRS3wTDQojnu49Zp3N7nd+/2eUBJKVHRfaHZ+CSzoVtdS6iuxp0BuquHxUumwGrq5dpuWwGLtgM1F2r3JK5sEumzAclc53vHtZFySOscjNwL2TWXsMxN799Q6Iiy9OncjNwUSab28sk0V1NMp2yXQHIdKyuXh4XkOlckumUFYqQSWwnk+e7h1mmcy9k1o7EWWbYtvjQD4ZDpnNRJrG9TBLd1SQzUJ865cGmc28f490E1iiBCwVnoOzvdmCTQdFJrYKRmjzfXYwFZ+Be2Ky9hrNN35Co4ZAHNmw6F20S29sk0V1NNp26P3QjETadq8uXpz5y07mUm055UkGnc0MD17WBqs0IeaRjvmVrGLMeeVkEfddew9mmb0jUcEhI2HQu2iS2t0nitU2n0vZBuKq6ennmQ6Y3p1Rt0wYqy/TWkkyn6trkiQ6Zzo3W1GntOZyd+sZERZbHNpw6F50S2zsl8dqpU9GpY3X18uiHU+eSU6fKaefMlXpIUOeGhZWgTmWnzo3W1GltPZyd+v5ERZYlBZw6F50S+3EqGVMfjQvt6CRZb2EG6v5HH42YdBmub5C3D/1uGpw6l5w6VVGDU+dun7oMxrPUuWzVuRdWa4/ibNU3MmpcZCEOq85Fq8T2mUqiRSStgfrQj/NBq3N1+SICWp1LWgP1oZ9pQqqSQy/1U2jQyfPdR5/GMfE690JnbT+cdfoeRY2HrC2g07mok9heJ4nuatLpVF4aOVeXL2sB6AycVoV4nDpWYWUih09y6KbcPNDJ093HakZmPugk99yMTra173D26JsTNRAyScKjc9Ejsb1HEt3H5NGpuixZUSAtIyfPf3h0LqWlU3G7L7Q20mk9QUNrH3e5KWDTudHas9TvP7/YH7og2x/SN9n/cktckNrYTmoTr6QmKknN3PjhgWuA/xkv36Xm1nxZlLih4b9SE1V9MKmJG62p1NqHOGXq9x/frHizN40h1bkoldheKonXUp3KUhP3JnMgpDqXpDpVfw73/F71v0dj6KTMo/8Zp7uHWaZHeyGztivOMsOexof+IxlkOhdlEtvLJNFd9Wk3hat7TB6L/4iXVZw8NSAzRBXqX5Gq1mSyh022hl7q0hs6eb77mFZDiXuhszYgzjq5SzEj61feodM5XQL/dVB7m95OsulU+ABYuqjaX5Phh0xvzjf9EpU+ANYcOqmTO2R6tLopwkTr3AuZtQFxlum7FBVZZg/IdC7JJLWXSaJvniTTqbClkC6qZMrFQ6Y3l2Q6FT7/1Y1diSnTMFx6M9mlcy9c1sbD2aXvTrx9jG8SXY91uHQuuSS1d0nitctA2aMc06xztR6VmhkynUsynUqf/+rW0EuZ+yHTm8kynXshs/YbzjJ9U6JkynBApnNJJqm9TBKvZToVE9OxcikFM1w6l9Y/ToWPf3Vju8T0ZmpEZVH2v/GiXriszYazS9+RqMgyHHDpXHJJau+SxGuXTtXndJ6XlchLx8pleGI6l1w6lT7+1VF3Mr2dLNO5FzJrq+Esk/sRPbgVWaYOyHQuySS1l0mi46UnplPp41/pqsqmrDSQmd5esumUW8Bi1rlhYZWbTvnHv7otuTO0zKyNhrNL342o65dFO1w6l1yS2rsk8dqlU7W0l5UGMjNy8oiAS+eSS6eyS+eSS6eqNZk1MNk6N1oTp7ff7AcBsv0g/0uS78AFp4vaOl3ES6eJCp/+SldV7mV2Kaexvee5u4rNSOnGdeXn4q6ckmdALYPW+e5jtBm4FzZro+GYoTffjajIMl9VhgYu2WRre5skuqdhtk3R/MNf6aJKpiQBZIagMglBplPhw1+NoY+6uQ2X3kyNqBRNlZmBe+GydiPOLtOWhX4REy6dSy5J7V2SeO3SKdsQqMk2XFS5lGGDS28uTLaBCp/96sZ2Lj1YduncC5e1yXB26TsRbx/63VK4dC65JLV3SeK1y0CFj36lq6p3hv3JGa4+1JqBCh/96qDopAZDYvrFx1ozcC9k1i7DWaZvRZRMqYwg07kkk9ReJonXMp1Kb2+mqyqZUl0hM729lJlOeUrhkencsMAlbaDSJ7+6NYxZX7quf2qX4SzTtyJKZrfJXaCbc0kmqb1MEq9lOpU2DsJFlUt5FsKlN6cUnphOZZfOJZdO1cDK0gwPTudGa6q0NiXOStPOxWhzKXUuKSW1V0ritVKnolLHSqms4KDUuaTUqVIqSyqkp3M6YJhyncpKnRutqdLacjgr9X2Jiiz9wJTrXFJK6kep5MvfYjM6Q/49UuljX+mi6q1EKVChlJc17iO5NmSpU+ljX4mrj33JjQSp3l6W6twLqbU3cZbqGxgVWcopSHUuSSW1z1MSY3xloofVQIVPfSWurMoqAFZDe8FqoMKnvro19FL3RGHT2/E5HLOucy9s1q7D2aZvTZRNud9g07lkk9TeJonXNp3KqyLnyqY8rWAzcP6hr4SlD301h27Kgho2PVr60FdzaKZvaZlp77/ZDwJk+0H6ObPSGLigcVFbjYt4qTFQpUfm/yo7MydTSmkMXHh6BqqSSVK8np6BG8nExW2g6i13eQxUagZutKZOa3vimJr3tIehv+4Ap84lp6T2Tkm8dupUdpo4/VQAnDqXnDoVV0ShtWFhOU2tJafOjdbUaW0/nJ36HkXdTXJvwqlzySmpvVMSr506lZ0mLnziK1x9cuqtpU98rcbQSf3iXc2263x3MSeoh3shs7YpzjLTXsb4MVpWLHfnkkxSe5kkuqdhfRui1Q6LPBMx6XprxckaBwnqXJLpVLUmUz0mXXLoZdi4Xee7j3ElFLgXNmsb42zT9zrqPpJxQ2o6d9N3G+ojXwv70SnjWtXKArqnyWaI9qm/3Aib5PrX2vrYiCDX8a/xykH90SkJ5hjhykNf9azz3U79IePzuzV4Ts5meuLTybS2F87GfA+ijEkPYcw53cSFMFJbYQS6gzf9gGdVIqudxh4aDsLY2hTGY/3Sm2YujAXMPuEPY+SuXHs2gYmTp2c0yVgII4ZWek2mwmrz4CzMdxhKmISEMOd0BCGM1FYYgdnB52GAr0DFDCM3hfHYiCD3H3wFKmYYueeRXqsWnu5gMcGIoZV9VVH7AmdfvnlQvvoeWA845+p/Sp5HGsKIbYUR6B6mKdGpu+5QIsGITV88NgIEX07ZQCO9iKE7+g0+5BfPd7D674LnUUF+OfbiSVYbAGdtvktQ2rymvzsXtRHbaiPQHU3anIraiE1tPDYCBG1O1S8NPI83tBG7tD2fhjWe7ljRmmMvrNWGwNma7xqUNXnvFZOjc+H/axvbWgvtyN2J2dGpaI3YtMZjPZJp4ehUTDZilzW5Tmjj+Q5Wf8XwbBfJ5the29tvdl4A2c6LTn6lLXBJ28J22hbQHQ3JFqikbWFD2zo2AshA1jMtUCnZFobuyFq6rK3THStZC9gLa1W0H5PtzSv7t49PWdTCmnP6vfV6sC1qKy00I/dw5dpqZo6GTNv1YFvYlBYCBGlOpVxbAa5ck+UZrIVm9MeRK9cWhma6t7JwfKuy/KzLa/fSJXM7dDmnD2boIrXVRaBFpBxzqn60/3nKgS5iUxePjQBBl1NRF7FLl6zOoIvnO1j9/OfzdUIXMWlGfVUBf/bFKr9Dlq++B7hwfHMulNKL+vGlexRVSy+i4yVhHq3+QvR5ICCM2BTGYyOADCEmRaeiMGLXSMsdA2E838HqC1fP1wlhxNBM54L6qnr77ItFeUcsXzJfI7+cCztZi9r78naSL6fqV8SfxwG+iE1fPNYdCmuP9cqmoi82dg201DXwxfOjmZRgxNBMj636qnL77Is1eUcsX3JDwpdzN11SYkIkthdGogMmYU5FYcSmMB7rAHqhSDCn6rfIn++IWuIvDP2R0/AVWtH/jUJ+EUMrvTRQX1Vun32xJu/elS95ssKXc/ZrEfBF7MeXeMd8SKDjJV1OxUUisamLx0YAuQzocqp+CtV1OTaWd9z+SI2F/cWFYWzGw0S1VdV91ualeWmTJwa0ORe1EdtqIzBGNewwxnB9g14DhnmRrU1vPDYj9Fx0vRTiAvZxl44j0cihR9IMEo2nZzS565FoxNDK+NCUKquS+6zM6/JSJvcclDkXlRHbKiMwu/h8h2Nl79RdP98PY8SmMR4bAUKmJUo/uA1h5NAfaQbCeLqDWcJCmGMjYVVbldxnbV6Xlzbf/HhzLmojttVGoDuaJkin0lb+uqipzV+aFiBO2XjDmmNjvNcE6dQt/I7Jaux1tj1+s/kByDY/9Fc7KtsCl7QtbKdtAS+1Jepd9Va6LW54W8dGBMmTmh8DZSVVeVtYzrZ1umOZ/cq2gA37km2Pqs2P2QbItckTBNqcC+/DLOrHWijPFtEdVR01SQYqLUcWNq35hYZsW6/sy0jL/YWhP+Et6nW+m3n70LoE3vyiXnir6vvsjSX6U2RZ4MKbc8kbqb03Eh0veXMqeiM2vfHYCBCyLVH68T2kG7lL3PNDuB5u63QHy97YTHMvvFURfvbGSr1brMiyXoI355I3UntvJDpeeqc6hIvi2NoUx2MzgnQI86Rj1XExDHPk0CW5n2GOp2c0X0cuDK2Mn4zVKbLq8LMyFusdsq5cYkKZc0kZqb0yEh0vpZpT6dcM1kVNY/7SNEU6pd+ahC5S6I5UBdDF092XnGjOvUi0qsbP1liyP0WWK4Q155I1UntrJDpesuZUWv2vi5rW/KXJWqL0y3fwRg4dCmnG092b7M25F96quD978x2AiuxV28O5uI4k9iNO5pvaHwntJG9spsfjFteR5KY4HuvXhv2scB33d/30PcSxNXRI1mlIOJ7uYPVXtc8PQCxIiKGVHhSdHqsaPwtjyd4RS5iERKI5lxKN1I+vtIIk0fGSMKdSvbYuavryl6ZEc8ozBL6cGxnCgi1QqWBb2CW/JzP1VkX52ZtX7m8f/veJ3w/nkjdSe28kXntzKr0xsy5qevOXJm9OxZU/MfRHfx8Oecbz3Zv0xszCrmZWGqqvKtfPvrymL18yAyDPnEufLljYXlhoSJ4UKNWcqh+hXz3lDmTA6urlHZz6iHHgksQQdKzyrqDIPWLooyxJ4ZCn22H9+vLzpWOudGxksKh8/81eCSAruvXnwkpl4JLKhW1VLqJ7GubMQCWVASuVMrylMnBBZaC+9N8lSuXCssp1ujuYVAbshcoq2o9Z+e6VfQ2G3P9Q6Vz4T/bG9iq9oaTSqajSsZiV4eqTSm/tK2Tlagx9lAmlsnKdbpX1g8uWlQF7obLq+LNKL/ZrMLzOe3cuqiS2V0mie5pUOhVVOpaz0rmk0qmYlcQ2Knm6OxhVOvZCZW0AnFX6LkENRq+XrgcEstK5+or1871Wb7IubK8yNCS3dj0rVztjPLQ2q83ogNXVy4MJE2wIKjNPbbwEqn5t8LmPmGC9sSGB69RA1e+4PDdWj8yFYcD6yaDPyir6zyp9Z6AGw8uLd+eiSmJ7lSRakvYQKgP1rt/IhEvn3j51OoNL524P/T4dbAbuXb+aBJ3kng0sjzw9OvkIb6FvmlGRtQtwFulbBTUSvn59dy6KJLYXSWL0UW5ViHSqfgrs+Y6GR8fq6n39Grg0vXprMScdSznpVMxJYhiwnuNUZW0MnFVy96BHtgZDxhbTq3NRJbG9ShIdMOVkoGJOOleX39PUlSTISedyTjpX7clMjJwkt8lJnh6djDlJ7rXI2nc4i/TNibryvjnWc9K5KJLYXiSJ0Ue5b5CTTtVlyTMLSRm58KB0LiWlUxVVnjTQSG6jkae7i5bbeEQ6NnJbs7J2G84yfUvi7VO/JY2sdC7KJLaXSaJ7mrLSqSwzcToTIyudSzKdyjLJPSfTek7ydHcxynTshczaTzjL9E2HkinPG8h0LuzOLWrv0ttJLp2KD0vH8gLWuaTSqfoZ3ecnNNLSseFgCXUqPiyJYcB6gpK0/PjNZg8g3ez51LEtk4ELJhe1NbmIvmU1Wk2xiUrPysBVHkk5XlkZuPisTFxavy7uWQA1rtOjk+lZubjnZtRjbVwcM/LDdzcqI2XVAI/OJY+k9h5JjC72nXgNBDw6lTIyYKVRphNo9OZCRgYqZWTAQkYGKmXkwjBgvbZSk7WVcDbp+w1lstu8xhYmnUsmSe1NknhtMlAxI50rlXIfQqVzOSOdq/ZkNGp+Xe09p9LKSG/mFjOS3GuPtRtx9uhbFuXRV68fziWPpPYeSbz26FSNpy9ew1UV54vXwOm9WvsCgarW/Cm5uI1Fv3jL7Fq8rlZ6JEZma07WXsPZpW9IlEsZNeSkc8klqb1LEt2D9JR0KrtMXFi7hqtPLlNrySW551RaGcnT3cXo0rEXLmsT4eySOw0duFzKnQ2Xzj30Ow61+7qwvUxvKMl0KstMnH7VFxOsc0mmUzkxyaGX8mCud0VCsPrj3+dFMBLzqZUeck3J2kI4a+Q+w9Sov3oKjc5FjcT2Gkl0wKQxUPZ3vLU5EC7r7VO/ogiNqb2w8xo5/V1FPCfZHvopCzaI5OnRyficJPd8P6jI2kU4i/SthhoJuccg0rkoktheJInRRxkJLF2dqssSDiIjFxY8zuUFj3MVNyx4yG1E8vToZBRJ7rXI2kE4i/RthrrysOAJnJRsmFdJ7T2SGF0UP/DoVJ5XE5fmVefSvOpUnlfJoZeyr4905OnuYpxXiV0Se1ml6VjbBmeL3FvokGVR5nKkY+CCRVJ7iyQ6XppWAxWnVefq6mVgMa06l7MxcWlaJYd+SvLDI0+PTsZsJPd8O4jHz99s7ACyjR39llV5TJx7XNTW4yJGFz0bA1V+hKtZNXMysOUxcNFj4Cquz6qLyx7X6dHJ5HFxrz3WdsYxHz99z6OuvHOc2wGBu+n7lzWtLmwv0gOGhFzt9Eikz30sbHwSch3rl2ZnfiFvn/rDvLWkWe2hS7JuqNxbp2e48Gby4tDMdm36WRsEZ2fcReiQdeUyCyH3nIvOiO2dkeiAyZlTaTduXdV05i8NT731yr4M2yyDMDb2PNKsDNfp2YosI6qYWBha6bHVubK2DM6+fF+hfMmtBF/ORV/E9r5IdBeTL6fi0mVd1hTmr03CnIrLlBVhY8ybqT/zsPLvqZW9sar4z8Z8W6CMyXMExpy76U8wYlYktjdG4rUxp+KsSGwK47EO8K4f9qqdtHWljVXH5cGIHGNz6JHcyZgUebqbuT10tYskI4dmOoomWdX1Z2Us/jtkXbk8gqHMOX1QwxipvTESHS/lmFPRGLFpjMc6QDTmWPVbsgPGyG2M8XRHy8bIPTejxqp+Pxtjkd8h68q9FPh0Lr1lv7C9stCQ5HRVdKudvqyojI1NZTzWL81LD+eq570ouB5VcObc2J1cDzSn4psPqzUM0PhohLqrkv3sjnV997R6EJaNzkV3xPbuSHTAlG5ORXfEpjseGwHSZxA/nXv7fEhJA3fk0CW5yzBD8nSH81sAM6Rz4xZQdVWon9Wxmp+Rw3/NfzoX1RHbqyPRAZM6p6I6YlMdj40AUZ1zNeZBHbmNOp7ucFmdcy/UVWl+Vsf6fUbWf3TBM865qI7YXh2JDpjUORXVEZvqeGwEiOqcq6yTtELWkduo4+kOl9U5t1f39Zv9EkC2XxL+SD5wSd3CtuoW0V0N6gKV1C1sqFvHRoCkLnClThZmpW5xWd063eGiusC9UPebLZKvtFGg/0JYWRe4qI7N7dWR6K4mdU6lcntd1VTnLw3V23plX0YqtxeG/oxlBZcn6/xsRtan9aBbGJrZlgJfVdsfp0lAnmu+sAxcFMbm9sJIdBeTMKdivb0uaxrz1yZjTlmhjEwj9jzUSxhPd2+8aocxciJeFiVfVb2flXmJX5OErIiRY86ld+kWtlfmDSVlTsXpkdg0xmM9iql8W1faWHVcFtJwFpqTObRWlYGKVdziMD49ymquqvOzOZbwswPhf96/nIvmiO3NkeiAyZxT0RyxaY7HOkA059jbp34cB+bIoUeyYoEynu5ofgMg25x78VyrKv1sjqX8jBz+CPzLuWiO2N4ciQ6YzDkVzRGb5nisA0RzjtVSop85LL9XxzfmUjOaujDn3AtzVcyfzXnFX7ee3FuYLZ2L5ojtzZHogU3mnIrmiE1zPNYBojnHquPBHLmNOZ7uaDnnnHthrir1szkv56sDMpHDnHPRHLG9ORLd1WTOqWiO2DTHYx0gmnOsOi7LQMyW5DbmeLqjZXPOjVHW51wV6mdzXs1XB8Ki0rlojtjeHInuajLnVDRHbJrjsRFA7sR6R+DLqfqv0uc3X+DNsTHga2npVP2D93NjmDGJYXBGSaHeqko/e/NSvrz1mue6NGScc9Ebsb03EmNYZWquXeYQLnpjY9Mbj3WAmHGOVcfDytK5ZM6pvLIk91rd92/2TABZHadvrZe6wCV1C9uqW0SPbEi5QMU6bnHD3To2InjOBcorsEq6xaFH+oZyrS3X+Y5muVvpFrBxB0jSfdfewTHpALk5mTVgzrlojtjeHInuaTLnVEq6dVVTnL80Jd16aV9HLS39Mbe4y9zzBAhxHs1zF+ace2Gu6vWzORb1swP6L6gw51w0R2xvjkQHTOaciuaITXM81gGiOcd8yJFzzo0h54MuUG+f+pfIEMjWnu8Dzbkq/s/mfIegQsraGOaci+aI7c2R6IFN5pyK5ohNczw2AqQd5tCj6rlMq1Dn7SV1TsW3U1drl7r+DIS6q7r97M6L++qBTBtw51x0R2zvjsQYWl+khHDRHRub7nhsBIjunKuey5IQ7sg9J8rKN57ucH4LIN+cG7eAqqvC/azOq/uK7OvLb+eiOmJ7dSS6qyntnIrqiE11PDYCRHXO+ZhDnXNjzJdBp6o1Wa7CILnnG0HVVeV+Vufl/dtn+MvKb+f0s0z1kaFF7c2FdkLSORXNEZvmeOxkzrmqouVSYI4cutQz3FLG0zOcrs+hjByaGeWeOqua/ezMC/tyFlaWziVnpPbOSIw+ykBVNfftVHovbmHTmb80vLOzXtmXkd6LW5iM9DLmwewNIggjhmZ6KlNfVaWffbGU7wsvX3Iv4cnmXPJFau+LRMdLs6NTuYQjN4Xx2Igga43aNgn9ySUcW9sZ4/mOFo0Re22sivOzMVbwHbGMyT0PY85961ctMC0S2ysj0QGTMqfitEhsGuOxDhArAMeqApAFNGZFcuiR3Mmo3Xi6o8WdksWhmb6BnpLs/ufPeaPkB7Jy2/62MnL22ddBbYwNYnRRbpC/R8qNDWwZG8dGAF+CRM4XDf8eXFI2Ts9w9iAbHJoZv0ekzqoqP6RZteWle6VZ3wfXlP2XyCVnbG3vjMToY3DmlD/IxkVNZ/5Se5CNV/Zl+INsYDLSPw+ycX42I/XS/w7saqY/6afCqgo/C2Op3iFLmMSEMOeSMFJ7YSQ6nk2LMVp4kg1uGgsR5Ab813hlX0d4kg1up8yj+ZNMm9krqyr9rMxL+VImxSWUOec/NT6wvbPQUEgyp+LESGwq47GWET5hPi61uVrh92heeYSJke2hS/osG6e7mbAXMrjLffdY86yq77M0L9FLWq9C18ToXJRGbC+NxOhkd+EKh6eZU3FmJDal8dgIEPLMqTgzEpOhXjMjz3ewmGbErma6flJjVW2fjbEk75BlTEp3pJlz0RixvTESHTBNjU7lqZHcVMZjI0JQ5lSeGsntnPF8R4vOiB2cVbl9dsaavEO+fdo/VpYz5/yfhga2d+YNJWdOxamR2FTGY90jX+WPK22sVvmdAGtmZHPoUZgZebqbCav8EQ7N9KyiaVYF91kZq/IOWcrkypFmzukb9n8d1N6Yt5OMORWNEZvGeKw7lB9mztUqXx7jeJiR2yjj6RkurfLJoZnxO1bqrEruszPW5R2znMntBGfOJWek9s5IdLzkzKn4LCM2nfHYCBAmRqfis4yYjPR6lvF8B4vzIrGrmX2SVWF+FubVewnrNq9LgzDnkjBSe2EkuotJmFP5UUZuGuOxESEYc8qGGilGTIZ6GeP5DuZPRBRm5MS85NjtN7sfgGz3w/5V9P4ncDf9CdOaGBe2dbaI7mRwFqg0MS5sKFvHOkB6lAWs7lVxW9ICZ2/ARCo+0VZrGJ9e5Km52g04JtvNtwyqA15SBy6aY3N7cyR6YJM5p6I5YtMcj3WAaM6xWoRIx2GO3JUm8jGRcbqj+Q1Q2baaaW7cAGqu6vSzOS/mK7I8kmuavDkXzRHbmyPRXUjmnIrmiE1zPNYBojnHwibx6PjGXGpGUxfmnHthror5szlW/N3PMufl9c25aI7Y3hyJDpjMORXNEZvmeKwDRHOOhU/915CT25jj6Y6Wc865F+aqGj+bY8n+FLlnYC5Nbs5Fc8T25kh0wGTOqWiO2DTHYx0gmnMslmyr4xtzqZmUc869MFc1+dkcC/fu59un/dto3XqBk8zEAoXUXhyJjpfEORXFEZvieGwESO/PrEttrjouJSuec97eGHIuLgMVdyMXhwHq/NDnXFXwZ3Ne5lcHvH67BS6YI7U3R6IHLJlzKpojNs3x2AgQzTkXN5BXxzc5l5rRGwDPOefGDaDmqkA/m2MV3x0tc17I3QIXzJHamyPR8ZI5p6I5YtMcj40A0Zxz9Zzzrf/V8Y251Ewy59wLc1Wpn82xnO+Oljl5Hx5ry8AFc6T25kh0vGTOqWiO2DTHYyNANOdc+FjW6PjGXGommXPuhbkq2M/mWNV3R8ucFKQwF7hgjtTeHImOl8w5Fc0Rm+Z4bASI5pwrc9JxPOfIbczxdIer8ZPHJWZL5/bm7r/ZQwFkeyj296/3P4lzc4vamltE9zSYC1Tap1zYMLeOjQDio97bDlTap1wY+tMLCq5L1umOZXtnZW1hl/y+GHm63avmP2YaIPfl9Xfigi+2tvdForuYfDkVtynXVU1h/trw8ZH1yr4O31+sRFvcxpgHi8aIHYxVkX425pV85ba4qLnx7tzNPlY3sL2y0JAsf+pt7RAuTY4Lm8ZCgL6rr+RAijllX/mEMGLXUNtO1zrd3r/1V8ORYmylsRcTY1XoZ21expc2mQOgzbmojdheG4nuQso0p6I2YlMbj3WAVHSHDr196X+fQVxoTu6C/0TKvxcHgWzt+TbQKbIq9LM5L+OrA/IwhTnnojlie3MkemCTOaeiOWLTHI91gGjOsXq7VFIf5sg9j/V6qvF0R/MbAMqce5FzVeifzfluQEX2ovvuXDRHbG+ORHc1mXMqmiM2zfHYCJDWkaFH1fOgztsbY74MOhX3S1ZUDND47XfNuqrRz+68kK8eePF2dy66I7Z3R2IMrQwYHnNORXfEpjseGwGiO+fipxTWpWzSLjRjtwDSzrlxC6i6KtLP6rySL3Uyl2PCdC6qI7ZXR2KMbFDnVFRHbKrjsREgqnMufox89XyjLjQT1Tn3Ql1V6Wd1XsqXOnk/Eeqci+qI7dWRGCMb1DkV1RGb6nisA8RnnWPVcd/sCh0fQ74mTG8tvgW+Wnu+DzTpqko/m/NSvjoQCjnnojlie3MkemDTs86pXMmRm+p4bESQWQR1gVO5kiOHHo2H03LG8x0tVgaOjRtAzL39ZssEkJbgX/oXlpVzgdNvdtebOovailtEdzSIC1RKuYUNb+vYCJBmy8DFza7FXeaspFunZ7jwcbzFoZnxR4rqrGr1Y7a9saDvmJVtXs0FLjlja3tnJDpecuZU2uZaFzWd+UvDrsl6ZV9G2uZamIw0U22dn83IQ6ZWJguTZlRY1epnYV7Qv32NX4S6Lg1J5lwSRmovjER3MQlzKs6O66qmMX9tMuZUnB1XBBnrpczbSRtdu2ZUWVXnZ2Us4XsIS5nX3W/O+b/dlFlie2ckOmBy5lScGIlNZTzWAdJaZF1pY/FDXYtDj6Sqra2SdbqbiYuQxaGZzkJVVtX5WZmX8KVMLg1Z5pxO2HiUkdobIzG66KvH1U5T0Rgbm8Z4rF8ajTkWd0rWlWyMeTPZGDk000s8NVZV+9mYl/ZlTMYQxpzT7zrAGKm9MRI9oBqtquzVTlN1VVL8/2PHyRrxn5HTXwSplWSIen/of5HUftfi0EudkJB43scv/RYTHm/Erpuhh1w1Vn1+1uhFfA1YJ/N6vDmXNJLaayTRgpJGp770r49h0bG6+L6vr4uHRefSE88pawwSiV0SfVHJ093BuiZ5lwUSnXtRDlS9flbpRX1FDktL55JKUnuVJLqnSaVTUaVjb8ZBpXNJpVPVmqwA4NK5IWEtYZzKSp0brWl2VqV/VurbAdWP8Fh0LikltVdK4rVSp0wVstOxuvierlZ2OpeUOmXzFIwS22QnT3cH/cZAdjr3QmVV9meVXv5XZHky4XnpXFJJaq+SRPc0ZadTUaVjdfHhcelcUulUtSbPHLh0bkhY2elUVurcaE2y8/Gb/RdAtv+i7wmX0sAFpYvaKl3ES6WBqvGQB1ClZ+bkcVEzbuCC00DdP/TvM8rp4tBLmchqBbROdxffvvSjg5WfgXshs7Yojvn58H2MiiyPDMh0LskktZdJonsa8jNEuz1GT68kgExvra5exhcynUsyA/UIXw5arW1kejOe55Dp3OiiZmbtJ5xl+qZDDYc8eiDTuSST1F4midcynaqrkkcAZEbOZ9vAJZne2nt4f2I1tnHprdS1y9sccOncC5e1rXF26XsfFVmeFnDpXHJJau+SxGuXTtVVSekBl5GT2RiJ6Vxymag0y5JDL2UOwyzL093FuniZ+iHTuRcya2/hLJMbEDOy/ioMZDqXZJLayyTR8dIs61SWmTj940rIdC7JdMot4JHp3LDAZVCg3r70nxnh9GVrOtnWTsPZKbcjeowrcphsnUtOSe2dkuh4yalT2Wni9G8R4dS55DRR+l9UcEpuk6A83V3MMp0bt4bKrB2Hs0zflqjI8uxBgjqXZJLayyTRPU0yncoyE6d/lAiZziWZTvn6BTKdGxZWgjqVnTo3WlOnteVwdur7EhVZnlVw6lxySmrvlMRrp07VVcmTEU/QyMnDCk6dS06devtKCercsLCcOvWt/8iDOZcYhmzsgKjM2nQ4y/SdieqAPOMh0zmlat99UXuZ3k5KUKfqqqT+gMzIybMCMp1LMp360q/TIj+JyfAvizzf92vNLmFt69y4J1RmbTecZfqeRA2bVASQ6VySSWovk0T3NMkM1EN/4Roynaurl2cFZDqXZAbqob/TDJvk0EsJhrUtT3cX66KCTOfGpYvM999sBwGy7SCtmktm4ILMRW1lLqJ7GmQm6nPMQVcSlMzA1bjJQ6JkBi7+ZFbgqj2Z3ktn4IYHpmig4geJF4dRGymsPmvH4Zic774tUT2QBw98Opd8ktr7JPHaZ6DeP2T+h0/n3r70vXL4dC77DNy7/rkLfJJDP+WyKj3X6e6k3xb1yAzcuC1UZ206nHX6zkQNiFwhdDqXdJLa6yTRPU3pGaiYns7V1csDFjqdyzqdcw/Q6dzwsNLTqbo6eazDqnOjNbVauw9nq75FUZH9CfruXLJKam+VxGurgXro5Ickda6uXh5qsOpctpo4nbJglRz6KXM8kpSnu5NZp3MvdNbGw1mn705UZN/se3cu6SS110mie5qSNFBxznWurl7GFzqdyzqdq8/gye0BneTQT5nRoJOnu5N1WfIoRnY690JnbT2cdfr+REUOj1Dnkk5Se50kuqdJZ6DinOvc25f+Ow90Oqd9rA8JBepdP6sCl2wMndQ3ByCT57uL6TNCC0MzY7mnc2xtNpwt+o5EjYPcZ3hyOpcsktpbJNFdTBYDFS06V1cfnpzO5aR0ru5pedZBpHMjm9aT06mcm86N1tRq7TecrXJToke5xkX6AavOJauk9lZJdLxkNVDRqnN19fLcR246l6065x5g1bnhYVl1Kpcr5K4s7QeF+qyNh7NP352oEZGHBXw6l3yS2vsk8dqnU3VV8kDHSihyPSLXyMKnc2EvIVC1upVNANj01pJNp+L+0OvW1GntP5yd+iZFjZ48ueHUueSU1N4piddOnaqrkqc6nCZOf+EdTp1LTp2Ku/GhteTUW7t/6MobayJyV4b27Cg2P36zQQTINojCz6cHLthc1NbmIl7aDNRbmnETl2qVwMUZN3AVV+arytHFoZ8yIdR6aJ3uTvrjuEQGbtwWqrM2MY7J+cGdjhk5/LJ64JJOtrbXSaLjhQdoiPb2pT8fXsmZOX+ABi4kZ6AqapDJPlzpFGzyfPexplqZWmDTuRc2a9fhbNO3JqoH8qCqqfbDuWST1N4mie5psulU+gZKuKi6eBnemmkDl2SmoNIYEpMY+iiqkZg83R30+RoqnXuhsnYczip9W6JGw5+aH84llaT2Kkl0T5NKp+qq5NZGYiZOf6oVLp0LVWeg4ldTFodehq+mrPPdx7ev8MNwgXthszYczjZ9V6IiS/2GxHQu2SS1t0mie5psOpVtJk5/BBQ2nUs2nXp/kxsbmUkMndRHKlKT57uLWaZzL2TWxsRZpu9eVGR56kCmc0kmqb1MEt3TJNOpuiqZ0pCakZNnBGQ6l2Q65RZg07lhgSVnoKo1mbUx3bI1jFl3URdAtd1wlul7EhVSbkfIdC7JJLWXSeK1TKfqqsI8G7hv/WAsZDqXnplO3XWTCS6J7TKT57uLsdRc7TQ37gmVWbsMZ5nciugW377Dj5V9OHfTer4+WLKwvc3QUNdX121dX+hc7YzLSl/ozFzf39w/CFxKTb+2/NQkd+mUaQwTLc/31VuhjJwkJs2ox9qHOHsMmxXf4afLPpyLHontPZLoPqYp1qmv8I3OcFXxG52BS0kZgoYt99XYNfz2jc51ujtYmSG3Kix6tBc5WfsKZ5fcfHiKLLcZJljnoktie5ckOmBy6VR06VgVALIJhwnWueTSqbIgCY4Z1rlhYT0tncpOnRutSX5+/mYTCJBuAn2HH8oKXHK6sK3TRbx0GihzVSuggJVTyYVyGrjgNFDpO50Ly/m5TncH/c6o/AzcC5e1wXDMz0/fhajIsuaq/AxcdMnm9i5JdFdDfoZw0aU3Vi4lo+DSueTSqRoLWQxWfobWhgXmZ6CyU486WtP8rJ2Gs1PfjqjIsnyEU+eiU2J7pyReO3WqZMnwIkEjJ5cPqc4lqU7Fb3Wu1tBL/XGkWget893Ht2/lkKIe74XO2gA56/Rdkors711/Ohd1EtvrJNFdTSkaqPS9znBZVQ/I5gd0hvYkk+sjCIlK3+tcHHopkztsejBPddh07oXN2ms42/QNibIpw4HkdC7aJLa3SeK1TafKkqzTkJyRE0+w6VxKTqfSFztXY7vc9GZybjr3wmbtMpxtciuiB7ciy/0Gm85Fm8T2Nkl0QA1XJWcIVzblqQ6b3lpxMiXDpnPJZqL06zB4fpJDL+XOR27ydHexxlRuReSmcy9s1q7E2WbYuvjWjsKmc9Emsb1NEt3VZNOpbDNx4bud6fIlgzHThtZMA2w6NzSs1ZBTJVX2HSHVudGaroZq0+EslTsTPcYVWXIBUp2LUontpZLogEmqU1lq4sKXO9PlB6ne2u09fKpktbZJUW8m23Tuhc3afDjb9B2KiiwzFmw6F20S29sk8dqmU9lm4sK3O9PlB5uhtViwODc0rBR1Kkt1brSmKVq7D2epvkVRkWXFD6nORanE9lJJvJbqVPx6Z7is4uTy8RT19vThgnnXqbdv3XPCvOvc0LCkOpW+3rkau/K9n7Vi8+s320OAbHtIf7msbAYu2VzY1uYiXtoMVH2gTpYftSbKnCzpymbggs1ApQ+VLEzGnxrX+e5iZYhsRNbjM3DjplCbtfNwzM0v356o21GGDTadizaJ7W2S6K6Gx2cKl77gGbiyLlMpbIaoQlVuJip9wXNxl04p1WuJu853Hz3HodOvaly76qydh7NO356oyHJ3Q6dzUSexvU4S3dWkM1DpE3zhskqnLOagM7SXfoY9cvoVw5psF4d+6k9qQajHq2HtefTKYwh17oXQ2nw4C/Udioosty6EOheFEtsLJfFaaKDS943CZdVnH2Vig9DQXhQauPQdz9XelaH2htk63Z3MPj3cC5+1/XD26XsUFVkKJfh0LvoktvdJoruaEjRQMUGdK5/yuIBP5+JHbAPnIpCg3t4QsR6jTlVrMn0gTZ0brem8W/sQZ62+WVGRvW75ci5qJbbXSuK11kClb3mGyyqtMstAa2pPN3vxIE1c+Jbn4tBPSQJMu95M9uncC5+1BXH26fsUFVnW/EhT56JPYnufJF77DFScdp0rn5II8OlcTlPn4tc8V3vop8wK8Bma+R6/gbAeo8698FmbEGefvlPx9q0Pevh0LvoktvdJ4rXPQMVp17n6Pkt4jDoXPjsUOpm+57kwdFI3aGHTg6WPDi3suid6zaTTbG07nDX63kRplBsNGp2LGontNZJ4rTFQUaNzpVEuH2npXE5L53x+xNPTuZFP6+npVA2u3GR4ejo3WlOttUFx1uq7GBU5VC3ORa3E9lpJvNYaqKjVudLad/o1wNDqXNbqnIuAVueGiKXVqfhNz9Xalae9dBGh37/ZIwJke0T6dmPlaeCS0IVthS7ipdBAlShZd9QeUeb88Rm4sEcUqMpSyavSGbigM1BxqyhwozWVWhsRxyz99t2Kui1lkQipzkWpxPZSSbyW6lRJlaUapCYufNczcElqaC3tzYfWhgbmaKDidz0Xd+VozzCqs7Yhzjp9r6J0SjJAp3NRJ7G9ThKvdToVv+wZLiuWLIGLk27g4pc9F4d+ymjVomid7k76I7keooEb94X6rG2Is0/fqyifMmnBp3PRJ7G9TxLd1bCzEMLV15Dk2Y709NaK61ucD9HApfSMrclchTmX3JVQ/dBbicnz3ceabeWqoNO5Fzpr++Gs0/coSqdcIXQ6F3US2+sk0V1NOp1K30MKV1U25WasJVHgks0UVBqDTGLoozhCavJ0dzB+KCxwL1zW1sPZpe9PlEt5RMGlc9Elsb1LEt3V5NKp+A3BcFn1fSVZwECmtxeqz0DFb64s7krNoNOjvX3rD7UjNZ17obN2Hs46fXuiIsvbQNDpXNRJbK+TxGudTmWdiQtf+AyXn3R6a+kLn6uxy2Z4bnoz2aZzL2zWDsXZpm9jVGQpymHTuWiT2N4midc2naqkkycYnpuRkwFGcjqXbDrlGjDVOjc0rKenU9UHmbiRouSum6MTSZdBtfFw1um7E9UDWW9Ap3NRJ7G9ThKvdToVv/MZLqseUmGu9fbSg9Op9J3PFXSXnN5MrjmdG3eF2qx9ibNN37wom/IwgE3n9G3j+srnon5kSjL9bQCvXXqw73e5w5CZxMafrq5jI4BcRr19Eqhv/U0lJCEDoDv6YUsseHi+g+Wqkhza6bF99nX784uNnwuyjR//c4bEfev7Q3+9N7YR1kB30Rc6iQrCGmthfWwEMGGJCsIau4TJWv4/o7sdLAl7bqevRoXVFsUpwerfpMNOnX5i8S91ac59608TQxixH2G6O/S3QXQfkzG201Q0Rmwa47F+qc+MfaFNfev72P+OVztmtP8+51Jj9l+e/zsaw+CMZtRb7YCcvYVtkm//x4zbH+eiN2J7byR6wJI3p6I3YtMbj40AfW9fQ/2vGkOnojfHxoAvb059638bwBsxDM5401C91R7A2ZtvFNQDTaYC5Jtz0RuxvTcSY1jlWfX3HM4faX1V01sIELw5Fb05lrw5FT712leLwekhVm21LXDWlvYO9DPA0OZc1EZsr43Ea21OxXQjNrXx2AgQtDkVtTmWtDn1rWOIdCOGwRnNqLeq68/evPh/+9YvRMCbc9Ebsb03EmNYQ7o5Fb0Rm954bAQI3pyKCxJi6M+Y2dYEyfMdLC9IyKGdfaZV7X425gV+Geua8Lo0GHPuoW8ZY0FCbG+MRPcxPdicisaITWM8NgIEY05FY8QuY7JLgSUkz3ewbIwc2hkb2ppkVZmflbF875ilTK4NygLXN8slFsZI7Y2R6HjJmFPf+pPy/xjhpjF/aT1MZN8CixHnquOS7lhFkkOXZGsGznh69Kf+Wvr5U6uYGMmhmTG+6qyq8LMzL9Xr0rv4W2kWONmNgDNSe2ckRh9loLAMccrGE86ITWc8NgJEZ85VxyUf4YzcxhlPP4ULzsihmbFxoc6qBD87Y53eMevS5X5CnkVObl9YI7e3RqIjpkxzKlojNq3x2AjwR79+gkxzrr4iJV2HNXIbazz9FE7uemQaudfWbr/ZEgFkWyL6TytlLXDvut9b0ha2lbaI0UlPtUAlaQsb0taxDmC/sFPOAla3q6RIOVtcdrZOz2iSr6VsYWhlLAQk0W61O3BMNECmTL+1AGXO3cazlE+0he2VhYaCMqeiMmJTGY/NQZQZAcocu9m3TaCM3EYZT89oIh7KiB2UVfl9VsYavUO+2QoeypyLyojtlZHogGFqDOGiMjY2lfHYCCC3PYw5lZaNC5Ohvm7RWoKs8x0sLhsXh3ZGfzXLqkA/K/MqvpT5svHmnP7fEuZFUntjJLqPowfXSNQSZLXT1Lc+aGoJsrBpLARIS5D12g5RHZd8R5axvWuwn5eDcMbT3UytUkOakUMz410RdVZl99kZa/OOWZcuD1CkmXP6hW84I7V3RqLjJWdOpaX+Cjed+Utrv09uQuSZc/UBXJlB4YwcuiRK4YynR3/++BcJm7uc9eWos6q7z85YnHfMciZTCZw5F94RbexHmrRTO/ypHRkJ5JlHi3lGbDrjse5QXH849lb/hP2cR1BGDh2S01DG0zOa9BoPM2JopbcrVFiV3WdhrM07YgmTK4Mw5+KKkdhWGIGOl5LMqSiM2BTGYx3gS7+WhxxzrITJ5AJh5NAhubMgjKdntDAtEkMr49M7aqyK7rMxVuYdsozJ7ABjgfMdkEX9CAtvoi2i4yVjHi1Oi8SmMR4bAeKjLHIy2FBGDl3S3Tw44/mOV7WCuEWWkUM7PXLqrIruszNW5jOkbhDBmXP6e254lJHaOyPR8ZIzp6IzYtMZj40A8VEWuZBm5HbOeL7j+SMRzsihnf3MWCX32Rnr8g5ZeSa3G5w5d9P6DdKI/UiTSR2PMgIdLzlzKs6MxKYzHusA8VHmWH6UkUOHOj3WKp+nZzTpNYQRu4RtFx/33+x+ALJSWr+5WMYSJx0oYYvaCVtA9zAIC1QStrAhbB3rAOlRFrD4KFvcNdTPS5OaFtfpGU1u9xK2MLTSp2VWvFe5fcwwQO6rs/a6leDLubRYXNiPsPAoW0R3MRnzcNEYsWmMx0aANC2GC6npTB5B9Shb3EZZDCezK5yRQzP7quxe9f1Zmm8CvH3r90ohzTl9FiPJSO2dkRhDKgNVK/zVTlPRGRubznisX5qmxRCh+i1XAmVsbqOMp2c0nxafWhlflNI0q3L7bIw1eYesK5e7BMac05/agjFSe2MkOl7KMqeiMWLTGI91gDgvOlYbjLJQhjFyG2M8PaP1xHdNUsgxYmjlhbEqys/GvHIvY3KXwFjg/A2zRf0Yk2Zq5bGA7mES5sHSanE1NoX5S+N7nOu1fSG+MocxtoceyY2MJxlPdzNxs2pxl7K+MTTJqto+K2NJ3jFLmdfRd+e02kaSkdoqI9DhkjKnojJiUxmPjQCpKFtX2lxWxvbQI7kFoYynu5msjNxlvu91VVb19lkZi/KOWcr6NljLD+duWgfAGbGtMwIdLzlzKjojNp3x2AgQVx/OeTGFNCN3DbYvGHn6KZykI2ZGcgdnVW6fnbEm75jlTBbvmBmdS0XZwrbOQjvyzMfqw6nojNh0xmPdobgnHEJkZ2wPPQp5xtNP4YIzcmhmfBpF86zK7bMz1uQds5zJExTOnNMfn0OakdoqI9DhUpo5ZdN1vfWyok1l/tK4YHQs1tErBDokJjAzejP2tyRIMmJoZbz9ocKq3D4LY03eI/j2rb9eAGHOfet3+2CM2NYYgY6XjDkVjRGbxnisA0RjjmVj5NChkGM8PaMJBmPE0Mp4K02Mvf1m5wOQVdL+X9q3wKUPMi5sZ2wB3cVgLFDJ2MKGsXWsA6QlfsDi1sfisrF1ekaTCaqMLexgrKrtY469sSTvkJVjvf/FxUfg7vobq5VjC9sa83jJmFPpQbaiTWP+0rjGX6+dHdfd91p8LA49knGpaXGd7mbignFxB2dVlp+dee1ezmQ5UPPim3Pf+k1UOCO2dUZg9FGi1eJjNdNUdMbGpjMe65fGxUcIERcfi0OPZCENZzGcPPKQZ+QOzqriPjtjWd5dLGcSE86cu2v5BmfEts4IdLyUZ07FmZHYdMZjHSA9y9aFNhafZYu7xtrW+Ot0N5NWHwtDK/v3N9+qMD8b8+q9jMnzE8acqy8rdkl4zaBQRm6rjED3MSlzKiojNpXxWAeIyhzLysihQ2Fm5OkZTYYPSUbsEt8VlC4/quA+K2NV3iFLmW9+vDkXdhgXtRXmzSRhTkVhxKYwHuv+xNWHY3n1QQ4dklHBtMjTM1pYfRBDK/0mifqqYvvsixV5RyxfMmEjxZyrTws9TxLIMGJbYQQ6XhLmVBRGbArjsQ4QhTmWhZFDh2RYIIynZ7QgjNglrB/caqxK7bMx1uMdsox11q7lonNptUhqK4xAh0vCnIrCiE1hPNYBojDHsjBy6JDcoBDG0zNaEEbsEtbnVViV2mdhrMc7ZAnrNpcw527jHbr1ECO2NUag4yVjTr19668r1bbHG7mpjMdGBHms1Oeq1iub+g6fg1vYNdTPMwqEeaz07c2FoZWeWNVXFdpnX6zG+7prZHqaXb6cs28MYkoktvVFoOMlX05lX+SmLx4bEYIvp6IvYuhPWHPwdMeKvohdrfTgirDHb7Y8ANmWx7dcWj3DAlfvhz/fcSVsYTthC+guBmGBisIWN4StYyOCCwtUErYw9KefPddtXAm2Tnes9CsSC0Mr2wR7VOl/TDBA7kuuDL6ce+iDDr6IbX0R6B4mX05lX+SmLx4bEYIvp6IvYuiPP8FWdztW9DVbGXe5JlgV2GdhrMI7ZA2NXBqEORc+s7ioH1+qot6FXkTHe+i/INR2R8CyMV7WNMZjHSL8XEuIEI2xMfRI/wQSKcbzHSwqI4ZmxpdiVVmV/WdlvjdQYyP3JJQ5F1aJi9or83aiMseyMnJTGY/1KCZlTkVlxC5lPZ+tWZHnO1h6jD0NzAtlVWGflbEM75A1NnJpUBY4Wf5jViS1V0ai40VljtVlSSlUC8UVcCrz1yZlTtlY1zbwCnClhzzekWWpGRm+2u1YGJoZv4euWVY19lkZC/EewhobkQFlzo035riyX9RembcTlTmWs4zcVMZj3aWkzKmYZcSusZYHBpTxfAcz81BGDM2Mb2aosqqyz8pYinfIGhuvxh6B8x3FRe2VeTtRmWNZGbmpjMe6S0mZU1EZsUuZPDCgjOc7WHyWETsoqzr7rIzFeId82PYussy59OHghe2deUPRmWPlLMyM5KYzHus+JWdORWfELmcy/cAZz3ewmGbE0MzYedA0q4r87MzL9nImxRacOZdmRlJ7ZSS6i1GZY1kZuamMxzpEUuaU5QceZsSusQ4PM57vYGYeMyMxNDP+NEeVVbV9VsaSvEOWMrk0KHNu1BfrYUZqr4zEiJdW+Y5lZeSmMh7rEEmZU5YeUEbsUia3MrKM5ztYVEbsUtZVryh7/83OByCppEtZt3nJKGWBC4XZorbKFtFdTFkWsKhscUPZOtYhgrJApSxb2EbZOt/BkrKFXcp6GaPKquQ+Ztk76/IOWcq6zaXMufDp4NXaXpm3E5U5lpWRm8p4rLuUlDllY11Z9tSj8XHDa1wqy9b5Dmbma2Jc2GW+n8mqrEruszLW5R2ylMnSCFnm3JiSOTEu6keZNFO7HwvocLpHUpsfgcrCeFFTGI+NCHIdtX+fIuj2G4SxMfTHZ8V1umPZ5Apfs5WhXX1VWX725bV7+ZJKEL6cSylGauuLQPcw+XIq+yI3ffHYiBB8OVV/xPC8vQ1fxNAfebojv3i6Y0VfxNDK+PsL9VU1+dmXF+7lq3N2TYnOpU/fvxPbCiPQXUzCnMrCyE1hPDYiBGFORWHErqF+9glhPN2x4oRI7CCsSu2zMNbjHbKEya2GBHMuTYiktr4IdLjky6nsi9z0xWMjQvDllI00EowY+jOmsvUE4/kOZtoxIxJDM30xmmBVZ599sRjviOXL9zzenUufMF3YVpi3k4Q5lYWRm8J4rHuUlhxO2UhDGDH05yabPMgwnu9gcUokdnnv0VVjVWWfjbEU75CPP3ppyDDnbAeiNoMXtjXm7SRjTmVj5KYxHuseJWNORWPELmNh0cHzHcwyFSlG7GCsiuyzMVbiHbKMyaXBmHPhDZdF/QgLX2BfRMdLxjxaXZU89WvzPrRWnBSS/4xcsuhR3/UDFMg7Ytfwy/oMecfz3cUP/RoQLBK7mlnPR027KrvPElmbd8QahlCcOVe/H75Cr6U+sb1FEh1QRx1rfaeyxcgFi84li05Fi8Su4ZdVGyzyfHcxWiSGZnooxeLHb3ZFANmuiHawUjFwX/oj7TV5LmxrcRHdxWAxUR+62Vm5uLgxe65jI0KvCa77rSq2RH2GHyZYHHqkc1QpW+c7Wt1vkqCVeYEbP2ms6qr+Pybgh28SVGS5qaDOOZ3VYI7U3hyJ7mky51Rdlax3YS5yvRK4PNUsGji9PWEztCZt1SS6KPRRJnao9EZudktAJbmrmR5wlVhl+lkia/ke1Mef8U7rNQyQ6Jz+0ygkktpLJNHxkkSnssTIycBDonNJYqBs/KGR3DX+cmvBI893H8N/WCwKrYzlolqs4v1skRX+iPhHN/ph0bnx3hEfhYvaW/R2kkWn3nTTBpnoWN2Ckh6Q6Jx+nx+Z6FT679Dm0En9dx1I9HbqquT5jGR07sW8WoX9WSar/yeZ/ZhdKelckklqL5NEx0synbqnB6JjNWzy+INM55JMp26f2hoykhw6Kc8+uOTp7mF26dwLl1Xzn11yY+ApslwhEtO55JLU3iWJjpdcBsqGFZnpXI1bP3DWM9K5JNMptwCZzg0LV0w4depLf50A6Uns+c7QSba2A84uuWfQY1vXL9M/XDqXXJLauyTR8ZLLQEWXztXVh0elc+lR6dSXftkPKok9j/5yyNPdw8cf3XWEROfGHaEua6Pg7JK7CU+RfQfgw7nkktTeJYmOl1wGKrp0rsYtPDGdSy6d0uUKVJJCH+WmRzrydHcwq3TuhcraLTir5JbCU2R5UCMtnUsqSe1Vkuh4SWWgokrnatzkYY/npXNJpVNuATKdGxZWejpVrcmzHOnp3GhN07P2Ds5OucHQY1yRw2PTueSU1N4piY6XnAYqOnWurj48Np1LTp26f+iCFU7JbRKUp7uLWaZze5mfv9niAWRbPFo8VoIGLshc1FbmIrqnQWaikszA1bj5czNwQWag3vXL7+VyYeik3PY12a7T3cPoMnAvXNauwjExP7n1MCOPt5SvqQMunUsuSe1dkuh4yWWgPrVWq/VsuKrHn/G7B9fV12QbuLCeDdS7bn/BJS8OndTlImTyfHfRl8U1ywbuhczagjjLDPsUfx6yjIBM53SRVns/i9rL9HaSTKfSrsEK9zRscvFw6c0ll07FXYPVGjqp/6UMmd5O3WGyGIFM517IrC2Gs0zfh6jIspCATOeSTFJ7mSR6/JNMp9KuQbioygFZaUCmN5dkOlUDLq0hM8mhk/rOEWTyfHcxy3TuhczaYzjL9I2Iiiw9gEznkkxSe5kkuqdJZqBsXDHNOlc2ff0TuGQztaYpBZvODQtc0wYqbRss7Lo1utyRxexn7S6cZXILoge3ZMpTHTKdSzJJ7WWS6HhJZqCiTOfivkG4+rT+8dbSvsFqTIZ/WfRmakjlDsM069y4J1Rm7TKcZfpWREXuG2QtgJxLMkntZZJ4LTNQUaZztXAMD03nkkynwsbBJ6nLpcTCLMvz3cPs0rkXLmub4ezS9yIqsiztkZjOJZek9i5JdE9TYgYqunSuXMoDH89M55JLp9wCZlnnhoWVn049/ujb9chP50Zrmp+1zXB26nsRFdk39j6dS05J7Z2SeO00UNGpc+VU5jU4dS45dSruHKzWdhnq7WSbzr2wWfsMZ5u+GVGRZQ5BhjqXbJLa2yTx2magok3nyqbML7DpXLLpVNw6IHbJlOkA0y3PdxezTOf2Mr9+sw8EyPaB9CdES2bggsxFbWUuonsapttEpb2DwNUEKRNLyQxcWNQGKu0dLAydlEVGuVynu4d1TV5tBu6Fy9qPOCbmV9q0GL+pwGXQ4vj5qNooWMf25mLrUv7UZ+1WS7P/+m/nVZBkzqfVwCV3fnX19odkWj0qV2vopwSDPG9G/4+nnpCLQiPjn2/l2fhV+wlnab7pUKkvtxUS0Dl9px8aSe01kmg9KQGdqquS8ggSIyfjigR0Lkl0Kkskh17KUEEiT3cXk0RSl8SeM1Ri7SOcJfpmQw2XPFQgkdzMPB7bKyPR/anWQ+YlTv8+D9Ii1yNwzROQ5lyS5lSWRg79lKGBNJ7uTiZppNDIeO9JpdW2w1ma7008/oxsXtOlcynzSO01kugepsxzqq5KvlMBiZELEp1LEp3KEsmhl+PzcawxwlUli7OV8d6lWqyNgrNF302o8ZLHLVKP3Ew9Hts7I9HOcuolLlmLnDymkHrOJWtOZWvkLmtyjyD3eL57mayRQitjq0yt1ZbA2ZrvG5Q1mdJgzbmUe6T2Hkl0D1PuOZVzL3LBonPJolPZIrnLotRbsMjz3cdkkdRlsUdcLdYmwNmi7xTUeMkqARad08/BYu1Cam+RRPcwWXSqvoQXZlBynBGQdzzWEZIxpz7DF4VXY+iQbuhBmDfj4rHcJId2xsfAVVlV+mdlvh1QymTBBmXO1Rdl7Qs6C9s7Cw3J7Iyiwam6LFna4alHbjrjsdfOnPLBRoFA7hrsMFfyfEe7P/SnHCGNHNrpgVNnVdCfnXnVX4MjSyg4cy46I7Z3RqL7mPLMqfQ24rqqqcxfqv2pT42vV/Zl3B+6FQxlbO15qNeahKe7GTcPY+Qu8z2/irLv32yrALJtlfD3yYELH8lY1NbYIkYfPcsClYwtbBhbxzpAMBaoMiYPhDK2uGxsne5g0djiLmPdXzVWRf0xyb698n/8+ZT8ryQLXN06NjEubK/MA4YkW+30UNRl9c153eQ1MS5uOvMIyZlT9SkLeSLAGbmNM57uC03v4T61MhYBqqyK87MyVvAdssambwMWcN+R6zn54moBsri9M28pOXMqOyM3nfFY9yk5cyo7I4ce9VqPM+PqcAeLzmYr4ztA6qxq87MzFvAdssZGLg1p5tz9LhMJlBHbKyPRAZMyp+qyJB7SjNxUxmMdISlzqiKENCOHHsn0U2vGdQEdzM3Xw2xxaKb7ocqqED8rY7XeIevKZcqDMufSr0cubK8sNCRZXUvG1c7TZXVX18zI1qYyHuvXJmVOZWXk0COZmqGMpztYVkYOzfSNocqqCj8rY6neIevKfcX47VxURmyvjEQHTFnmVA3P87MTSUZsGuOxDpCMOeVDjWcZOXRIn95QxvMjmr6LjyQjhmb6DlVjVXGfjbEs74iPP+F/Qr+d09IW0yKpvTASHS8Jc6oad2HEpjAe6wBJmFNZGLlLmFwBhPH8iJaEEUMzvQBQYVVvn4WxKO+IJUwmbMyKzukIQhipvTASHS8JcyoKIzaF8VgHSMKcysLIoUNjz2ItPXh+REvCiF3ee3TVWBXbZ2OsyDtkGZP5GsacGwvVtVgk9WNMVjD1K4ShmSSMzfRF3XWfBVOiY3XtPeVcV1X7V4FLEr01LSkwSZJCD3VHHTnH8+PSrXDALEnuuhX6mtVhld9nh6zRO2aNQ2fyNQ5wGLi3Dr0kEttKJNDxkkSnokTHskTnkkSnkkRSl0QZKEjk+e6g5zMkkrskdjvPEu9/frE5ckG2OaJfVP3LPXIusbEfieP9pEvz32JDbrHbGUOhU/U/RmM9d6aXurFE+Vj/e0S4xlpmlv+M832hHz53djg0062osarbT2l3/+PFfd25staGMed86mxqL8zbScICdde3H2CM3DTGY2MMZVnxr/HKprIxtnYZ67X7dQPCGM93O9EYMTQzfo5HlVU9flbGor1DljK5NChzTuvevw5qr8zbScqcqrlFF5R9UdOYvzTlmFPZGDl0SFfQMMbzPXzRGLHLWCeEGqui/myMlX+HLGNWZ9//OJeSjNTeGImOl4w5FY0Rm8Z4rAMkY05lY+QuY7JsgzGeH9HSrEgMzeyFVS1+FsaCvSOWMLmbkWLOJWGk9sJIdLxPfc/87zFcFf/d1WtSwrTozT3+6B9Y/jNySWNsrVfsV1Q83Mihm3IaFnm6+1gXJbb/N3L1T5e9wtMErEr97JPl/FPsbvPqAnyS472OCZLH9vZIdOvRnmPZXuKSPeeSPadq2EUP7JFDN8UK7PF09zHbc672nfoterVXZfvZHmv7p9i9Ul32nAtv4Nz/EPsRqlvUWFWS6IBp/nSqhqSXYysbyfGmQubx2Iggr8Qixam7/oYM1BFDh2Q2gDqe7ljv+mE45B2x5xtAhVXZfhbG2r4j1sjIlSHdnIvCiO2FkeiASZhTdVmycML0SW4K47ERIQgL1Jt+5BfGyG2M8XQHi8aIvTZWRfrZGCv5jlhDE1YozkVjxPbGSHTAZMypuix5DsMYuWmMx0aEYCxQb/oJXBgjtzHG0x0sGiP22lhV5GdjLNs74uOmv22BHHNOf6oBDzlSP8JSpU2i4yVhgbJvyUEYuSmMx0aEIMwpG2n4IoYOyYMecyJPd6waPXkqYlJ0btwcMjfefrNFAki3SG7+V1L3wAVvi9p6W0T3NHhLVPK2uOFtHRsR3Fug7Jfiy9vC0CH9WlaJW+c7WBQXuBfiqjo/JtyNJfxTZLm1KuECl8Sxtb04Eh0viQtUFEduiuOxESGIc8pHHOacGyN+LYbgz6kvLZkq7xYmt4FmXBXpZ3Gs5Lub1QFfPt6cS+JI7cWR6HhJnFOp+l4XNb35S2/2tdVaPq7Xjgv5o78EBXNs7xpsuaPhjOef2pGnMKSRO0irOv0sjcV8xyxpcnci2wIXdpIXtrfmDSVrgYrpRm5q47Hukk5wkOZUdVzWzpDmXEo3p2zWhTlil7l+DGq6VQl/Nhfq/Jv/ZVH9KaA/CJM5YntzJMa4yk1ceychXCWNzAK1MlncNBciyK0Ic05lc84lc4EKVdsKiuHp3qi4qsrP4rx0r+v3GuAWuCSO2I+4UGaHhlLKsZ3WWzWADD/EkZvieKxfm1LOqVRmrwBXksgFYJr0Zmxlilwjhma6FTVW1fjZGEv27l4Zk4kZk2TgkjFie2MkOmAy5lSss9dlTWP+2mQsUKnOXhF2yrydqIzYa2VVjp+VsWbvEXzc9Ot2UBa4pIzYXhmJDpiUORUL7XVZU5m/NikLVCq0V4SdMm8nKiP2WlnV42dlLNp7BEtZPyS5/XhzTn8JpSrtRe2NeTvJmFN1VbJxi2mR3DTGY92jZMyph/6sGBYixC5hz2/4YVbk6Y4VfRFDK/3M0VmxyvGzL6/Za2RkRYAUcy75IrX3RaJ7qNGw/nAq+yI3ffFYRwg7/SGCf2ykr2Ojy0PVZfbC4rrZ8RQj99yM+Lr/ZkcEkO2I6P1YvgKn93vl16J+fKmJ2t1fRI9m+NvfhMUF42puCFvHOoR2qBaMgbLUqARb2DXUoqIybJ3vYGmNvzA0Mz5wr8qqQD+m2N2r+LpLpEiBssCFp9jCfpyF3cdFdB/VbOVYotIaf3FTmV9qUuZUXOOvCH29YY0fqLQZsrDrBugHj5qr8vtsjjV6X1iZk/dAYM65lGyk9uJIdLwkzqmaYZ6fJfUsWxc1vflL42bIeu24kLQZsrhrsOWWRrbFeHKtNUEu7iCtKu+zNJbnfe0lrZ+SXIHcndNRxAxJ6kea6sAMSWLE0/cdkW6O5RmS3NTGYx0ipZtTcYYkdo1111TcdAwXGvNsNvNihqzK/KzMy/dSJrcJ8sw5e9zCGbG9MxI9oPGp5lh2Rm4647EOkZw5FZ0Ru5yFPOP5DhafasSuZnoe07mxiu6zM1bmHfJx00+4w5lz+jkzKCO1V0ZixEtp5lhWRm4q47EOkZQ5FZURk7FeacbzHSymGTFpRpVV0X1Wxsq8Q5ayfkSumdG58KXDOvTfpeiPs7BntYgOqBMoZka201Rlvxdni5vK/LVJmVOpOFsB0CEpgfAw81ZMPJ5lxC5j/dxRY1Vzn42xMJ9DM756uow5V9fxvCRAlhHbGyPRAZMxp7IxctMYj3WEUJ6tK20qlGeL2gjzUHW/i1gYI3cZW6OmwqroPgtjZd7XXSGlDMGs6JwmInyR2vsi0fGSL6eyL3LTF4+NCLJoQHXmVMwwYuiQZDgyjKc7VswwYlcr24/L3avqPgtjad4hS5h0EMKcS8JI7YWR6HhJmFNZGLkpjMc6Qkowp1KCkdr44ukOVZcpdzsSjBya6fyTBHv7zf4HINv/0KmufAUu7Fct6sdXqKUX0V0MvgIV33ZZ3PC1jo0Icv9VggUqve2yMHRId8orw9b5DpYybGGX9xaqxqrAP2bYW9oF0K1RGHMuGSP1Y0wGqsqx0EwSxmZ6HOK7Lqu1KcxfG9Yc65Ud4ZbedVnczphHi8aIHYxVQX425lV7zYm9kuGq4825ZIzUj7GUYyTmUK3H8BWtlokhWnzXZXFTWYggtw5yLFDpXZfF7ZR5O1EZsYOyKrTPyliN9xCWMq+g35z71hVRLTwWtnfmDaU0cyo+x1a86cxfm9LMqXt4kK0AMtbXzYV50ZuJyohdzfQCW+fFqrPPyliMT2VaGmNedC4qI7ZXRqIDJmVOZWXkpjIe6whh6RE69B4+aLWwnTIP9ri9STVbi4+ndvq0Kqs6+6yMxXj3r0LKOhbKnEtJRmpvjETHS8acysbITWM8NiKEidGpmGTE0KFOjpVjPN2xYo4Ru7xvN6neqsw+C2Mt3iFLWK9A15PMuSSM1F4YiY6XhDmVhZGbwnisI6QUcyqmGLGNMJ7uWPVQkdFDhpG7jK0Ht2ZYVdlnYSzFZ0j94BkyzDmdQvAYI7UXRqLjJWFOZWHkpjAeGxFChjkVM4wYOiQi8BTj6Y4VM4zY5avXdSqsyuyzMNbiHbIyTDoIYc4lYaT2wkh0vCTMqSyM3BTGYx0hZZhTMcOIbYTxdMeq6+x665qfkGHkLmPbDKsy+yyMtfgMOX5Cfk2JgdOZEylGbG+MRAdMxpzKxshNYzzWEZIxp3ys6xMETz0SFcix1Iz+TiSUOTfe1JZUe/xm6wOQbX1oElWqJS6YW9jW3CJ6XIO5QEVzixvm1rGOEMwFyp9DZW5x6JGbW6c7WE1VvcBgsgXuhbmqu48592Bx/hTZq7PEJXNsbm+ORAdM5pzK5shNczw2IsisXxV16FB6rC1sI85jpcfaUyuj9tVcq7L7bIy1eXfvcfP/kr4/ApeMEdsbI9EBkzGnsjFy0xiPdYSUa06l59rq98aYt5JTzbkXqVbF91kcK/TuZYnrso+Pt4dz+oGDerot6sdbeItzER0vefNo2Ru56Y3HRoSQaU6lN2DW5W68eSsx04ihlbFloZlWFfpZWCrj/Y++6/ez7emXhJHaCyMxhlNW0rXZGKJlYWxtCuOxjpASzamwb7WuY+PLG/EnYy1Gnprp3qqvqrzPvlied+8qwbrNlWDOhd9UvT+I/QjTyqE29BfRAVOGsZ2m4jswq7UpzF8bdhrXKztCegdmYeiQXmitH9f5biamGK8JzYwniiqr0vusjPV5hyxlskDCwtG5qIzYXhmJDqgjgRxzKr4Hs7ipzF+blAUqvQezIuyceTvRGbGDsyq/z85Yo/cQljOZ9+HMueiM2N4ZiQ6YnDkV34RZlzWd+WuTs0ClN2FWhJ0zbyc6I3ZwVgX42Rmr9B7CciYboXDmnP2cAhYfxPbOSHTA5MypPDWSm854bESQmxDLfKfi1EjsUibb5pgaeb6DRWXELmV9NTo1VgF+VuZVeimTmhDKnIvKiO2Vkeg+JmVO5amR3FTGYyNCD9L1eIayQMWpkdzOGc93tOiM2Gtn77/ZBwFk+yD+N/f3wCVnC9s6W0T3MTgLVJwaFzecrWMjgjtLVJoaF7dxts53tORsYQdnVZ0f8+zdS/jKM98BCVz4mNWi9so8XvqVudVQj8Rd/x+gvkoRsMdN/zK+fqgscOEJF6i3P/q2Sm1nBe7pt/2uVK5pM3DVnkyvVQREbnwPSebP96rNz169gK+R8XIbjV05y5u+nm/r2N4iX9V6okXHokXHskXnkkWnskXnnn7jb1l0LltM3Ph6i1qsUv1skfV8j3ONjNxB9RR8d87erYBYYj9iZSKrkm4BHc/ela0CIWH192Tr7Y9r6JCejMebC6nIYzOElDz1GAxY9VyqWeQim0OX5PZGCvL0jCYLP2QgMbQyPrSozqqqPztLpb/+ZD6cOed/rdbUVpk3E5U5VuMpdwCUkZvKeGwOYlDmWIWQwYYyctdgP980UMbTM5q0AmXErla275W+V7l+VsaavkPWlftiE43JAkff5kGWkdoqI9DhorKAxSwjN5Xx2AwRlDlWHe/BvBIZysihS+ICynh6RhMMyoihlf3u5HtV62dlLOk7ZF25TEHIMufizEhs64xAx4vOHHvoD/Ihy4hNZTw2Ikh+Yl4MlP3xPYyRQ4f0Zx6gjOdHNPtzcTgjd7XT46szY1XrZ2cs6Tvm4zZ+Vfe62+DMuVpfPU8UyDNiW2cEOl50FrCYZ+SmNB6bIUKeOZbzjBy6JI95SOPpGS3kGTG0Mj4Fp86qXD87Y03fIcuZPGjhzDldOUMZqa0yAh0uVXROxSwjNoXx2AgQsixQMcvIXb5kVCCM50e0mGXkpB01VsX62Rgr+o5ZxuRmgjHn7JkHZcR+lIX3ARbRAZMzttNUXZYs6DA1kpvSeKxfmxb+gRprufUsI4YOSapCGU+PWKYeEyO5S1knoSj7+M3GCSBZV9TYyLWVssAlZQvbKlvE6KSoqGV+oOqyJFtK2eKGsnVsRJBX1tMsUTbY9TRbnAz25bSkrfMd7X1MfBdWzhaGZsYdpM5+s3Hy4RsZNTh9H/BhFrjojM3tnZHoPoY0C+HqsmQpC2dsbTrjsREhOAtUSLMVAB2SWxnGUisSDMaIiXg1VrX3cWL88AK9hkbWFcgy52znuSbGhf0Yk2uvYnoBYzjHG4bXDYIs83C1NpDmYIzcNMZjM4QMNtLMsQoh9yrSjBy65E+zdXpGk1bg7KmVnlbUWdXcZ2cszDtkOetl6Moy526fMhBwRmzrjEDHS0vG1c7A0pJxcdNZCiGXCmeOxSXj4jbOvJmbfqgUzoihlfFdDXVWRffZGSvzHpzHzf9b/v7h3E33SeCM2I+z8FGfRXTAKI0NDSxKc66uX9KhdrJi2CAyNRdq7NUc+inpjwnTm4kiiV0i98lXpfhZJOv1HrAaCF9JfjgXH3HE9iJJdMAoMmBRpHNZpHM3/WoDMtKxnJHkLgXPZStE8vTsZJhFiaGV8clzzciqz88iWcR3yBqIvjnWLOqcfbQBGUnsR6Tcq3jyEeh40aNjqYxbrc1J1F861nNXf2AsUHF5SQ4d0u11KOP50Z9Uxi0O7Yyf3FFnVZ+fnbGI75jlTKYXrFacswcknBHbOiPQ8dLy0qmojNhUxmMjgNw6UBaoqIwc+qN7SFDG8yNaVEbuUtYpocqqQD8rYxXfMUuZ9BHKnBu7odfNC2OktsYIdLiYZY7l9SW56YzHZgi5ByHNsby+JIcu9VhfPYYznp7RwsxIDK2Mj36rsirQz8pYxXfIUiYxocw5/S9tKCO1VUagw0VlAbvpR29REpCbynhshgjKHKuOS52IkoAcuiRrICjj6RFN/+4Yy0vHRoUj4j5/s2UCyLZMPr2YC1zYl1zUTtwCRj9DLZcw/Qfv8raw4W0dmxHcW8Lqn3SfVxnlbXHokafaOj2i6f/llreAvfBWtfox4T5Z0Hfguu+8oAtc+ozQwrbiPF54rK1m5lV9yahCHFub4nisXxuWIuuVg7LnEbyxNXRIHh2Vb+v0aMbesIO42Uzr10yrSv1sjOV8h3zcdPKrKfLTuWiM2NYYgY6XjDlVVyW1CYyRm8Z4bESQoa6H2nrloKIxtrYxxtPdTF1oK7kefjBGDs30aTVWdfrZGIv5p5Ayl8CYc9EYsa0xAh0vGXOqBkLGHcbITWM8NiLIK2EsUPrrOEgxYhthPN2xsjByr4VVPX4WxqL9KaSvQj6dSw8zUltfBDpc8uVUjUOYE8lNXzw2IgRfgYoZRg4d0rkVkyLPj2hxUiSHdnqq0BSrwvtsjNV5h6zBkeUTUsy5ZIzU1hiBDpeMOVUX1R29phpkGLlpjMdGhGAsUNEYuZ0xnu9oOcfIvTZW5fnZmNfwFTIsGJ1LxkhtjRHoHiZjTtVFybjDGLlpjMdGBHkl5sRApTmR2E4Yz3ewLIzca2FVdJ+FsTJ/ChlWis6FTyZ/ktoKI9DhUmm22hlYKs0WN42lEPJYhjLHYmm2OHSpVwysptfpcaX6j9lYd3i0F0v8Kr3P4lifd+DHTf/5G3Ojc0kcqa04Ah0uigtYmhuJTW88NiMEbwHTAcfyw7Ex4MueU/c/Ihn2iGF0Ojf0kVbl91mb1+ilTUp+aHMufaJuYVtvoR3pYL07uprpsa+JJ6xC2Nr0xmP9Wl09IN0CFZ9p5NCh8AueqZ24CnlqZxXuouzrN5sggGwT5Fse+KUscEnZwnbKFjAG1JUFqpTJVdVDbXFD2To2IvhDLVFJ2eI2ytb5jhafaou72tkqq5r7mGVfLMxnyG8ZRChzLiojtlVGoOOFdUiIVgMhAw9lbG0q47ERQV5ZWbZeOaiwDlnYzpgHy8bIvTZWNffZGAvzvvKaF2X6hzHn9Lfya4t4UVthoRn7+ElNjKuhvqy6QUKWsb2pjMfGa8MbnjGEFjn1RFsc+iRXUOXZOj2ihQ2QhaGV8a1BnRir7D47Y23eIcuZ3JVw5lxYgixq68ybSUuQ1U5fVVbG5qYyHhuvTcoci2vHdSnokowLlHkzac9qYVcrnRKqrOruszIW593BUuZ7IF/OpQ8bLOzHmb4LV29SL6IDRmkhXswz5+r6ZUegPjUSw/bQXes/zJepufD+zOLQz5B73kwUSQytjL1dFVnl+Fkka/Ye1xoIL7S/nEsf/1nYXmRoKLw3sxrq68rZ581lkc6lT42EsDkj2Rz6Kbc9MpKnx9WnSZTYJbLvBxVZZfpZJGv5DlkD0UXGdatiEnWu/i9zrZIuDE8+YnuRJDpgzEjH3vQbLlirEJuzKI/NCCH5AqYfAMNzjxh6JIUSlPF0B6v/9nselyrhAjbqQRVX1fpZnJf0D3uPEOKci+KI7cWR6J5GcQGrz9Y8jwjMkZvmeGyGCOYcu+vqGuaIXebC84/nO1pU59gLdVWqn9Wxnu/ApU5uGqhzLqojtldHogNGdY7VdfX8ciU51JGb6nhshgjqHLMxhzrHxphf14Hcc8o/kYLkI4cB6mvSrKuS/ayOdX13s4YoVHbO1Re7npMA0yWxvToSHTCqcyxOl8SmOR6bEXqUrsHGWiVg9lc9UEfuyrrnHsMZT89of2Rk4My5cQeIuu/f7KMA0n2U+x/paGVd4JK6hW3VLWJ2VW6VqvECltQtbKhbx2YE6VGpS9gf3aspdYvL6tbpGS2oC9wLdVXDH7Pum4V+R66skxkd6pyL6ojt1ZHogCnrQryojq1NdTw2IwR1Afuj+xJQR26jjqdntKTOuRfqaoPhrM53IUqdLAegzrmojtheHYnZ1ZB1jkV1xKY6HpsRgrqA/dFaEerIbdTx9IyW1Dn3Ql2V/md1vj9Q6mSqhjrnojpie3UkZleDOseiOmJTHY/NCEFdwG7h83er5xt1oZk3HcB61q1m+qpeqKsq/qyOpX63WOqkXIM656I6Ynt1JDpgnDADVlXv8yqhVpjruqa78NqwObZeOq9EBx1p582NQecSM1C3P/pJdChkaxihXjHrOqUK97M7VvfdgXLnFfm3c9Edsb07Eh0wunOsrqv7yupgXdd0569N2yjrpfNKkjtvLrlzqsoDmU/gjtxrd1Xon935bsDjrm8jIu+cq29UPqdBlQcLu67sfyRPantzAXPAnpvBCtOj1VVJvYmsIzfN8diIINeBFaZTFUE6hKQjhw7p27RVHazzI1p9Pvm5R1A22xn/F6r5VqX72ZnX93XtcpvAmXP2981wRuwn32Ss4IzA6KNEgzOn6qrkUQVn5KYzHhsR5DrgLFBv+gsscOZcSjanbvqFcYgjhtEZX1FVcVWxn8WxrO9u1hBJRyHOuSiO2FYcgY6ntwnEOZXFkZvieGxEkP5AXKCiOOeSOKeiOGIYnfFZORVXZftZnNf2NUShJnAuiiO2FUdgDGvIOKe+wm8qfBOb3nhsBAjenPrSXyZAvhG7Rvp56sMUydMjltlHpjk37D9re/vziw2UC7INlJvVA4mrLwc9d+Sv9V+43I/50eZv3jUxu/rczt9HO02Fbyt2Y+2tj/VLdf74VwxQf1b6fB3/jtgY8P8uKGNI++rj/47WMDq3scOo5qpiPyXc2x8v6yvhrBxIXDTH5vbmSIyB9XfrYjz9Ydd/1FiwtamOx2YEeTzCnWPhrYLGrtGW1P1PbKYmSQkHawwn7ai0qtXP0rygL2lWB9TPlNq+ZpRGbC+NxBzS59sc6eZUTDdi0xmPjQAy1lDmVEw3x1K6OXWL6UbuEjdKfTVXJf3ZnNf9j/v4pvg1F/yleupcNEdsb47EGFh7wKVw0Rwbm+Z4bAQI5pyK5hxL5pzK5sj9mOt5Wc1VhX42xzK++1nmpFKCOeeiOWJ7cyQ6oK8pU7j6sbfu6n9L7+amuhAhqHMqqnMsqXPq9qWfWsNsSe6UdFWgn9Wxiu+RLHUyRlDnXFRHbK+ORAdM6gIV1ZGb6nhsRAjqnIrqHEvqnMrqyJ2yrgr1szpW893PUicTGNQ5F9UR26sj0QGTOqfifElsmuOxESCYcyqacyyZcyrPl+R+zPXcpvNlVepncyznu59lTtZFMOec/v4CKgJSP+JkwP42gA6XvLGZpr7GE31NlsSmNx7rl6aCIFBv/rG97k+3lsR5a/pPQ5grSWFsOjVUWlXpZ2ks5fuySpqMNqQ5l6SR2koj0OGSNKfqoqRqRC1AblrjsRFBuoN1pVNv7xoBdRy5K0Ge178oBXh6BDP5EObckK/eqlg/e/OKvoYo1N/OJW+kQjeRajw9u/k8GCgGnKpLksIS1shNazw2IgRrTml2wBmpKzvkoQ9pPD9iRWnO7aXdfrNpAsg2Tcbfo7IWCFyQtqgsbZ2e3TRpgXrUED1zJW1xQ9o6NiK4tEAFaYvaSFvnO1ZdZz+wrqGrTFvc86BIit1Qmv9//9//n5Jx/z9v9//j//X/uF7/f9XrWbQ/xZGbqObDwGlpUA+xReFq/vyP/5RyEx1PP4xTqfXfduqG/L//n//H/68utz66dtc9FFiKVy+P4H9GLjzaQmv1ZovcG5Vwi3se82tIK9/W6b74epstqOPFPzej6qo4P86OpdQTTUcfFp1LiUbqx6Lc4jU/hmbCUy1S/n53tzZTjZfQY5iEBepNf+QHwpwbM9vy5lT9R7c8YpByzo3WVF9V6Gd9LOO7t3W7y/Mf+pxL+kht9RHocElfoB76ER7kILmpj8dGBLmNalGyXtlUHXyeimGPjaE/8nhFuvF0t5K1OfdCW1XnZ20s4TtyaZMbBtqcS9pIPU8H192JnOPpDpakOVWXJIMGaeSmNB4bEYK0QL3pPyPBGjl0R98xgDae72h1pWIf2UbueVg0zaokP/ti3f4U0jeVb86Ft97eFoYr++MfUGig4yVlIdqnPhOhjNxUxmMjQlDm1F0/PARjjo0EWbOkUw/9oW1oc+z2Nr6noP6qMD/7Y/XevX3cx88jXpeIfHMu+iO29Ueg4yV/gXr373z0VU1/6bXPEyDmyUTpu7MQSO5KFUklpBzPd3/sPoA6x8Z9oOKqND+LY/3egUucXCDEORfFEduKI9DxkrhAPfQz8Ug8clMcj40IIfGcenvXFQXEOffQKRX+HIv+HHvhryr1sz8v58tfKBKci/6Ibf0RGKPb2z5XmqNIcKre3hQL8Edu+uOxEUFeicRzqn7TQcoL+COHDsmwwBtPd7DozbEX3qo2Onvzir68yUgi75yL3ohtvRHojqa8cyrudq2rmt78takucCrudq0I6JC+uwxx3k4U59he3P03GyeAbOPkITdeiQtcErewnbgFvBQXqLqdJG0q4RY3xK1jI4K8shIuUW/6zepKuMCNEedSJVDxXYHFYXjGn6bLo+5e9fox5QC5OS/lAhfNsbmtOQJjXCXBa6pM0d7Ht+CvEYM5tjbN8diIEMwFKppzLplzyr5uVyuVdbkHcVWwn8V5VV83txdzd+eiOGJbcQTGsAZxTtVVeT23rmqK89eGuXK9clyHfUgEKcfWZKxXsvF8t5PmytVMY8O/ZlyV7GdxXtfXEHlVd3cuiiO2FUegexAeciHao/4W/nltj4xja1Mcj40IIeMCpW9kwRuxnTee72DRm2MvvFXNfvbGwr4D1wh5UXB3LnojtvVGoOMlb07VVcmaDt7ITW88NiIEb4GKM6VzY8RX2jkVP7OwrlduA824KtvP5ry2rzGSyQurE+eiOWJbcwTGuEo0POOcqquSNRPMkZvmeGxECOacslRBxjmWxDmVxZE7iKui/SzOK/saIukoxDkXxRHbiiMwhjWIc6quSpZMEEduiuOxEUH6g2WlU/VpUklqmCOHDskFVDmwTncw849VCVtpbIyxJlwV62dvXtHXCIW1iXP2MYK/1gUS+/EWPny+iO5CmivZzqDSx7tWa1NceG0Q51Rd/vNDFN4cGyO+pkqncsaRw/DMn4tXdVWvn9V5UV/qZAGHlHMuqiO2V0diSAk5F6iojtxUx2MjQlDnVFTnWFLnVFZH7kdd91vVVcV+VudlfakLC0vn4mxJ7EedjFi9w3MnMMa1e3DdxXjMBeqhvymA2ZLcNMdjI4JcB2ZLp2yaQ9I5lsw55VugmDSdm1ug4u/tN5sogKwU17fzK/UCl/wtbOdvAWN03V+i3vX/Psvf4oa/dWxEcH+BSv4CFvwF6vapv05c/haH0eknk3qruv6Yd29e/D/qb3KfZ314cy56I7b1RmCMavAWqOiN3PTGYyNC8JYo/f5vJd7qNzqkT8NapqzzHc38w5iHG/5VXFX3Z3G+BVDi5HENcc5FccS24gh0R8MqJUSrqxLBSDi2NsXx2IgQxAXqoV98hzhy6JDcz/DG0x0senPshbcq28/evLavEZLKCd6ci96Ibb0R6I4mb4HSv9GCNmJTG4+NAEGbUx/hzZ0VAN3RHRxo82aiNsdeaKuq/qzNS//SJv2ENueiNmJbbQTGqEoa1fokRavP4zzP3vDG1qY3HhsRpD+1PlmvbKr+WFHWZUg3trYTx/OjHf1YBOZJx16Iq2r9LI4lfQcucVJvQpxzURyxrTgCHS/lW6Ae+tMrEEduiuOxESGIc8oyBd4cGwPOai5Ruv0Je2wMg9N3oT7eqmQ/a/O6vrR1m9eVQZtzURuxrTYCY1BDvjlVVyUctJGb2nhsRAjaAmVLQHgj9zzUSxhPdzCzD2GODfvqrUr1szfW8x24RshL8DfnojdiW28EOl5Kt0Tpn5HAG7npjcdGhOAtUOmTeisCOiSrNTzfvJnozbEX3qpOP3tjMd+9LG8yzyPfnLPNsdr1WtjWm7eTvDn10J/vgDZiUxuPzQ7pAh8PuMjJghEJR+4SJykPczz/FE8MI+XIoZ2+jzTXqkI/OwtlfP0d4fPTH86ci7lG7MeZfrinNk1SQxIOixK2M0YirUmITWk81i8N76KGAPZJYBjzxkaSrJkyUFpGQRsxDE6nhWh7/GarBJBtlfhfsb8FLmlb2FbbIsaourZAPeq//Z7vpkq2xQ1v69iIIK+sVAtU8haw4C1RujNX3haG0Rm/RKbiqj4/5tvDi/gaIV9KBi6KY3N7cSTGsAZxTmVx5KY4HhsRgjinojjHkrhAJXHEMDrj208qrgr0sziv4muEfDH5cC6KI7YXR2IMaxDnVF2WrJWQceSmOB4bEYI4p6I4x5I4p+rHn57nB2QcsUPGVYl+Fud1fI2QxKwn3MO5KI7YXhyJMaxBnFOP+qzq81BAHLkpjsdGhCDOqSjOsSTOqdubvi0Gc+QO5qpGP5vzQr6GSJZVMOdcNEdsb47EGNdgzqmccuSmOR4bEYI5pyxLanGy+o0OjemNy5J1voPZDQBlHm3cADpXVnl+FscavgOXOFnHQpxzURyxvTgSHTBUAiFcTjm2NsXx2IgQxDllIw5xjo0RX/qcyilHTm4DNVd1+tmcF/M1RJIDMOdcNEdsb47EGFcJV+VACPcI5cDCprgQIIhzKopzLIkLVCgH1tVicMa7D+qt6vSzNy/my5u/I/BwLnojtvdG4rU3p+qyZPjxkCM3xfHYiCCvRD0QqDd1gpQjdw22PEOq9F7nO5rdAJgr2UxjI5iaqzL9bI61fLdYQxQKAueiOWJ7cyQ6YJornarLkuUuzJGb5nhsRAjmnLIRhzjHxoivudKpmislKPyRw/CMR6aaq0r9bI7lfHezhkiW3pgrnYvmiO3NkeiAyZxTdVmy3oU5ctMcj40IMojIOace9Xcsz0tXqCOHHsmkjpTj6Q5mNwCUOTbEirj332yeALLNE93JLXGBS+IWthW3iO5pEBeoGlZZNZW4xQ1x69iI8NCPGpS6wFUMcVPqFoc++Wy5Tj+Fk8dNuQvcC3dVrR+T7p0lfUeuDkhkuHMuuiO2d0eiAyZ3TtVlSerAHbnpjsdGhOjOuYohTwq4I7dxx9NP4WQE4c65F+6qYD+7Y1XfkasD8kyBO+eiO2J7dyQ6YHLnVHZHbrrjsREhunOuYsizAu7Ibdzx9FO44M65F+6qZD+7Y13fkasD8lSBO+eiO2J7dyQ6YHLn1KN+tfr5UYS8Izfd8diIIBmLGTNQD/2aGcyR25jj6Q6WHnarlcZeiKvC/SzOq/saIZnSIc65KI7YXhyJ7kIS51TdT+FhR26K47ERISadc9V1iQF15DbqePopXEg65164q6L97I6VfUeuDsjTGu6ci+6I/biTe73em0vtSLQqxgNVVyXjgZxjuKmOx7pH4c259cqmKoJcL8SxNXRILrQWmOt0NxNzjq009sJb1fZnb74BUNcvT2p4cy56I7bPORLdhZRzgfoKnzxZlzXFhdeKEEyWgfrSDyZCHDn0SBIS4ni6uxPFOfZCXFXuZ3Fe3pe4sEJxTn8BuD7A8E5qm28Eup9Jm1NfaWlJbFrjsREgWHPqS5dlkEbskiZPEFjj+Q5mP/aDdaVjL6xVvX62xqK+A5c1WVwh3ZxL1kjts41Ex0vanHr71HiYJslNbzw2IsQnXOL0GxNQR+5SF2ZKnu94da1yp8AdObTTA6xFeFXsZ2le1pe0sKB0TgcRqUZqL41EdzFJc+pRP9np60lyUxqPjQgyhJginXr71H5DGbmdMp7vaDHbHNtn28dvdk8A6e5J/YTm8xBVtgUuiFvUVtwiuqNBXKBKnDxaKtsWN8StYyOCiwvU25fuZZe4xW3ErfMdLYkL2AtxVasfM+7DC/oaIpkMIM65JI7UXhyJ7qhGq9VkiFZX5avJxU1xIUIQ55QNOLw5NgacG82BqsuVoDVTLu66C3pak6nyowr1sziv5iumLyfRmGRmWk4u7MecXHuVAQt4Lc6jxV/TXq1Ncf5aHcOaKtcrx3U8wmZl4JI5j6k/hQRvpDA4PcSqrar5szYv+UubLyY/nEvfJF7YVpu3k/ItUTqNYaIkN7Xx2BAitw+0BeqhC1YknHNJm1M3uwkgzrnRmvqrUv3sz+v58ternmtKwHzpXEw7Ylt/BMboyuyM+TJQD92Igz9y0x+PjQjBX6J0Tw3+nBsjviZMp2oUe0K8OPgjh+Hp57aKq1r9LM4L+lo8yyIO4pyL4ohtxREYwxrEOfVIP2S/rmqK89em+dIpneGgjRS60zPc8sXT3Zm6TFnewRe5176qRD/78jq+fElI+HIu+iK29UWgu5gmSqdqICT9kWjkpi8eGxFCogUqfd9jRdgY82ayMXKvjVV5fjbmNXwZ66xdU6Nz6ZseH8S2xgiM8QwZFqiP8DGhFW4aC68NxgL1ofcEcowcOiQXWjsl63R3x35iBCnGVhobE6zOjFWan72xfu8Wy5tcIDLNueiN2NYbgY6XMs2p+m71c0GJRCM2tfHYCBC0OVXfAn4OAGvENtZ4umNFa469sFbl+dma1/BlTUokWHMuWiO2tUagO5qsBepj/BjnNQdAG7mpjcdGhKAtUB/hrbcVYePNm4neHNt7+/zNTgkgqcfKm/SzvAUueVvYztsCxqjKXV4LyER96G97l7fFDW/r2Igg/akCIFEf+uvTlW+Ly97W6Q6WvAXshbcq8o/59uk7AeVNlkrw5lz0RuzHm34dqgru0FBIuEDph5agjdGmNh7rkQzLx/XKpqrbUq9CG1vbaOPpbiZqc+yFtqrKz9pYunfgun5ZsEGbc1EbsW26Eeh4yZpTyRqpaY3HRvsh2ZyqXkt9BWvk0B1ZW9eSZJ3uYNEaW2nshbUqyc/WvG5/1I8TPT+cYc25aI3Y1hqB7kGyFqh35ZBt5KY3HusI+iVoTJJOvYeV5MLQH8lFaPNW6vch5Z6vpeTi0EyvHGQN+Vk1+FkYC/XuXgmTOwrCnIvCiG2FEeh4N1284bHmWPox0YVNYf7Sm/6uCIw5VktGyUhkGjn0SMYFynh69kceLjBG7LkVNVZV+NkYS/WOWMZkgQ1jzkVjxLbGCHQ8TR0Ic+qhvyaMDCM2hfHYCCAe4Mspm9Kgy7ExpXFbJFA3fbbAGht7ba0q8bM1luvdybIm6zlYcy5aI7a1RqDjJWuBSn9+tK5qaguvDdqcitocS9qcuv0J38VZl/vaWxXkZ29etZe3nnO5N/LpnP322l9LL7HnK7tawdKRp19bC1S0Rm5a47ERIVhzyn7UBsnmWLLmVA2hBEW2kcPY9Hymc2QV5GdrXrVXSJmWkW3OpTdrFnZZC381toAxqpLbmCM9Wl2VLAMwSZKb3nhsRJAhxCTplP2mO7wRex7pNTvy9Ij1pW9KQBg5NNODq8KqEj8L83K9hkZWPhDmXBRGbCuMwOhiEOZUXZWsxiGM3BTGYyNCEOZUFEZsI4ynR6wv/f0QCCOHZvpiRNjXb3ZDANluSPgzuMAlYQvbCVvA6KILC9TjLeyGLG4IW8dGhB6jKzcqwwKVhC0sC1unO1ZdZ895V7QStjg0s82wryq+jxkGyIXJEFaGBS4KY3NbYQS6i2EBEqLVQMjjtTJscVNYiBCEORWFEdsI4+nRmy/9oRcII4dm+mI0w6ruPgvz4ryGptu87hEIcy6tGBe2FebtJGGBetelM4SRm8J4rAcxlNLrlU1Vv/vmv/pdD7HAhcVHovS5Am+8tGt0+rmj4qpAP4vzKr46II95iHMuiiO2FUegByyJC1QUR26K47GOkMQ59a5zL7wRQ39EaxXU63THcv0wxmaaG/rVW5XfZ2+s0bvFitz3wko456I3YltvBDpe8hao6I3c9MZjHSF5cyp6I3b1R7b0II7nO1gW59wLcVWBn8WxTH+KLMs0JJxzURyxrTgCHS+JC1QUR26K47GOkMQ5FcURu/oj9zPE8XwHy+KceyGuSvWzOK/nH/UtY9st/nIuiiO2FUege5rEBSqKIzfF8VhHSOKciuKIoT/BG093rOzNuRfeqgg/e2OlPiPrbh8SzrnojdjWG4GOl7wFKnojN73x2IggSy0s/p26f8qqHU84YruE4/kZTN/kwSPOuRfiqhg/i2PF3pEr4aQHEOdcFEdsK45Ax0vinLr/0Qcv1pTkpjgeGxGCOKcqgjwhYI7c1SEpQzBV8vyMlsw598JcVeVncyzdO3KZC+Wbc9Ecsa05Ah0vmXPKvpILccSmOB4bAYI4p+5/9MOfEEduJ47nZ7Qkzrm9uO/fbJQAsrpb/xevUi5wSdzC0NE/YStyAaOncpvUVmSi3vVPXsrc4oa5dWxEqDepn5/aNVsGrj4kIo7L3eLQJX/MrdMj3HvY9A/cC3VVpx9z7pvFfEeunJMOQJ1zUR2xrToCHS/kXIhWVyWFFNSxtamOx0YE6Q/EOXXX3UR4c0wHp6bMQN2+9Sep62G3OIxOz8xSyH1XnX72xmK+e1kj5AU4GpPUjN6Ibb0R6HjJm1N1VXK/wxu56Y3HRoTgzan6RliPJXdOVgR0SL+cBWXejvmHMceGfxVX5fpZnNf0NUTSASScc/oB83qvbVE/3vQdp3q7bRFjWPU9WUyWHq6+JCafBYA5ctMcj3WI+kWTMFlGTlYgSDpyO3c8P+LdHvIAgDxyaKdvJbVWtfrZmhf0j/re5PPzANacS9ZI7a2R6C6mj5CEcHVZwRqbm9Z4rENka4Gz0YY1cs+jfSUkEo6nO1xdqtwkkObci4yrcv3szmv6iiy3C9w5l9yR+nHXt9XVUSQcge5omikTpZvtyDdy0xyPdYRsLnIh38ihS2mu5PmOl9U590JdVexndV7WV2TpAdQ5l9SR2qoj0B1N6hKV1JGb6nisI2R1kZN7FklHDl2S00g6nu5w2ZxzL8xVyX4253V9RZZsgTnn4vqE2FYdge5pUudU+meVdVHTnL80fCJ5vbIvw5YV0OaNjfFeU6ZTt4f+QgCmTHJX/q5nkj7nql4/a/OivrTJwhvanIvaiG21EejxStqcitqITW081gHqp8/lwY16IHLyeII5cs9jvZTx9AhX34paTi4OypwbN4Caq4L9bM6r+jInS2+Ycy6aI7Y1R6B7msw5Fc0Rm+Z4rANkc5GTNRDMkUOPZL2NqZKnR7hozrmtucefX+yeXJCUaGVOrvAv9QMQvssSzDW2MddA99TNJSqYa6zN9bEOkMxtODPXXMy5Pj3CBXOJe2GuCv9Tzj3++O5A/ci7TC4w51w0R2xrjkD3NJkLVPjoZF/VVBdeKw/tf8X+PHR35t8Ru71rrf6fyNlD838j9sJfFe5nf17dlz+5AeHPueiP2NYfgdf+AhX9kZv+eGxECP6csgGHP8fGgP/3kZcouxlgzxu7vY+i/fmZ9/hTtfvZHwv87m35k4c2/DkX/RHb+iPQ8VL+BSq8R9dXNf2l1z6vHpB/Tn37Oz2NoT/6qSrknTdjtwHMOTZuA/VW5fvZm9f45U3KF3hzLnojtvVG4LW3QEVv5KY3HhsR/ujPC8Ccc/c/+lP3SD1y6JJMSDDH00/hpC6GOnJyB6i0KtzP0ry6L2kSE9Kci9KIbaURGH2UW+TvMVpdlUx5/xjclBYiyCuhzCnLEhhzbGTJmiydqsuV+griyGF0utfqrcr2szev7SuklCTw5lz0RmzrjcBrb4GqS3ie6uCN3PTGYyNC8OZU9OZY8ubUp/7gKLQ5dnsfm/vqrwr3sz9W993b8meF3eOPc9Efsa0/Ah0vPeQC9a7v1cMfuemPx0aE4C9R+qYyEs+5h+7uYsp0zG4HGHRs3A7qr6r4sz8v9ctfKO+ci/6Ibf0RGKPbM8g1EWHeDNRDrwr+yE1/PDYiBH9OfeuNBH3E0B/ffO7zHSx6YzONvfBWNfzZmxf6j/qywvMMhXnTueiN2NYbge6BDhe8OVU/TiZXBW/kpjceGxGCN6eqppX7FeLI7cTxfEeL4hzbi7v9Zj8FkO2n+J8wPgKXxC1sJ24B3dEgLlAlTmqVEre4IW4dGxFcXKDqw1zClbjFbcSt8x0tiQvYC3G1r3DMuJtvPlTGyRBVxgVOl1B/HdTVTf8UUWomefOLutW9/zwNwBu56Y3HeiT9PYN+5aBK0nMEeGNr6JCs3+oBt053M/Y/iPWAC9gLbVW0n7V5ZV/a5JEDbc4lbaS22gh0P5O2QEVt5KY2HhsRJI2qLgjdsfGGNW9sjDfrgkDVWz1yD8AeW8Po9BpQ1iW3qtjP2rysL21ez6ExmU6TNlJbbQTGoMo9Uo+3EOxh38pGtrG1qY3HRoSgLVA20vBGbpNtPN3BzD58OTbsq7aq1s/aWNJ34NIm/US2OZe0kdpqI9DhUrY5lbWRm9p4bESQ7iDbAhW1kXtOkJVnPN3BojbHXmirWv2sjQV9By5tUu9Cm3Phq6mNXd6eHxV/i60kax4rvcWzLmlKCy8Nb6v2dT51Wx5eyDa2h/7IHIRnG0+PZuxbCUg3cmimB1fzrKr0szAv5UtYT7nXHQVhzqU8I4UL+/M/ukEFZSS6i0mZU/7bXN3WNOavTGsRp/QvrmCL1HX3SbJCF893X+xvRmHLsRdZVoX5WZpX7yVNFmuQ5lySRmovjUR3NEkLVCi110VNa+GlMt6YHJ360L+3gjZilzZZV0Mbz3dvojbHXmiruvyszYv3R31k/nlagzbnkjZSe20kuqNJW6A+9HfAsRYhN73x2IgQvAXqU98HgThyu3zj+Y4WxTn2QlzV5WdxXryXOHm/AuKcS+JI7cWR6I4mcYFK+UZseuOxESB4cyrmG7FLmyx2kW8838GiNsf22u6/2SEBJEv60iYTQmkLXNC2qK22RXRHg7ZAPe76tmXl2+KGt3VsRHBvkdINhsq3wI0R51oyULc/+jGIeswtDuMzdqZlVXKv8v6YcIDcnNxaMOdcMkdqb47EGFeJVlVbiFbmZK0Ec2xtmuOxESGYC5SNNcyRk7Fezni+o6WUW800Nm4AFVc1+VkcC/dusVJOVroQ51wSR2ovjkTHSynn1OOuX06HOHJTHI+NCEFcoPQHpeGN2M4bz3ew6M2xF96qNj978wK+vEk/4c255I3U3huJ7mjy5lR5k7sJ3shNbzw2Ikh/akm5XtmUDTi8eWNjwFfWOXX78p+C6tbkLtCEq+r8LM5L+BLXNSHrt7tzSRypvTgSPWBJnFMlTp68EEduiuOxESGIS1R6xjmXzDmVzZE7mKv6/GyORXz3s8zJngFSzrlkjtTeHImOl8wFKn1gYV3VNBdeG8w5FVPOsSTOqfp6qAwiFifOvfrEwr1K9rNAr+tLoCwHINC5JJDUXiCJ1wIDVR+Qei4ykXrkpkAeGxGCQKd8zDFpOvc05mvadM5uCCh0bNwQOndW8X4W6BV+CfRtlLtz4e+N6rPf/120/hiUgau9rwWM4Q2rTDYzqJv/tGi3NgWG18p14KHn1P1Dt48gkBw6pLN3FXbr/LjSD/1sA8yxneZemKvq/WzOS/xHffD9+SZH6jkXzRHbmiPQPUhzp1N1VbJNgNQjN83x2IgQzAXKRhzmnBsjvhLPqfQbzN0ahmf8oqPmXBXwZ3Ne5dcYycoA5pyL5ohtzREY4xpyLlAx58hNczw2IgRzTuWcI4cOhS8RpHGxOwA5x3b6qsYdIObefrObAkhr8vrQtOVc4NJbOwvbmVtA9yB8N7z+mtouK5V2Cxvm1rEZQZ6UNV0G7O5/dtrYZe55WGqyDK3c7vod3xK3ODQzvt2ryqrCPybbm28DVLJJDyvZAheVsbmtMgJzQJ9HorZRUrRQjC9sGgsBPNfWK/syqtvC1Sy5uGuon68TxkIw+yF4GCN3MFZF+9mYV/Z16V7OvTkXjRHbGiPQQxWTLGB3/b5sPdnWZU1n4bX6q/vIsoDd9SulkEYOXdK3KWCN57tHlq2QRgzN9CSmWVYV/dmZl/3lTGoQZJlz0RmxrTMC3cOwGAnRar6ROwnK2NpUxmMjgqQPjDlV/Zb6B8bIoUPypIcwnh7B7D12GCMn4lVZlehnZazjO2Zduq/835yzGaA+g7ew0MNa96/THS0J81i39L2c1doU5q/Vb9ZCmFOP9OGSwI21A1ePifKfY+6gGJu+idRa1edna17E1/XL+hqJ5ly0RmxjjadfWwtUtEZuWuOxjpCsORV+YbQ7faVHSDNvxuUjzZwb8lVb1eRnbV64V2S5QmhzLmojttHG0z2oKdkCFbWRm9p4rCMkbU5FbcQubTI9Y3bk+Q6WtTn3QlsV5GdtXrVX5H5Ucmf5zbmojdhGG093PzUWlo6BitrITW081hGSNqeiNmJXb2TjAdp4voNlbc690Fb1+lmbF/UVOaz5nYvaiKX7E882nu+OxgWkY/ZHZ1iMEJveeGxE6OfIdRfi2eaU/ScX1iLEru74kp+nR6wPfYcXkyS552Z0dqwa/OzLC/XyJR3E7OjcqA6vYcBKhNR1X4ZvAyxg9FByGnnGZpqqi5LZCb7ITV881q/V7sBXovQPryGM3DXS8tBAovH8iPah73/BGLmXxh6/2QgBZBshN1/vJ05/krCULWynbAGji64sUPd7+Kbi4oaydWxEkDuwlEUqKFvcNdQy85SydX5E+9QtwFK2uNfKqvo+JtmDJXqHrPtZSpVKssDpQgXG2NrWGIEOFx5mq5mmYpItbhoLEYKxRCVj5K4OyZ0MYzzfV3pLSba4q501u8q0+KjS+2yM9XmHrMvwCg2NSTLewrtrC9sqC+2EJHMqJxm5qYzHukdhXlwXOqmkjK1dHZJxgTKeH+3EJCP3WlnV3mdlLNA7ZF2GrI2QZM6lJCOFCwu/jh2bCcbYTF/U7UN/saKeZOuiprHw2pBkgdL/JK8H2QqA/ugP2EJYaCZ9eGRxr4VVqX8WlvYDdFEBYc4phVmR1FYYgaEiCAtUFEZuCuOxESEIC5SNNIyRQ4fCY4ynR7DwYZ+nVnqvQufEqrrPvrw0rwSTNRF8OXfTKQTCiP0I03uyFveLGF0MxtjOoKIxctMYj43XBmOBisbIoUeyWkWK8fQIppmKdQcxtNIzqxqrgvtszKvyMiZDCGPO3bRmgzFiP8ZkoCCMwOihRKvVfaKiMLY2hfHYiCDXgaVioKIwcuhQWHfw9AiWUowYWul0UGFVap+FeT1ewiT5Icy525s86iCM2FYYgdHDICxQURi5KYzHRoQgLFBRGDl0SNbPyDCeHsH0HwWRYcQuYd2MGqsq+2yMpXiHLGPSQxgLXKrGiG2NEeh4aW0fqGiM3DTGYyOC9AcpFqhojBw61LMZd/FDMzV8MndCGZvpi9pvVD2q2D6LY0XeLVZkmQQgzrnbH/0WB3KN3NYcgQ6YzAUqmiM3zfHYiBDMOVUd7yy41GD9QQ4d0hUyko3nRzS7A6CO3NVOT1KSbe+/2fsAJOVWXbvcViUtcGHJuKidsgWMLvr0mKikbHFD2To2IriyRNlQl7LFXUPdqz1m2zo/ot30m3ClbHFoZ/tEe6+y/JhmgMyYPqpgzDn9LGsl2aK2xryZtB+82hkDEZWxuamMx8Zrg7JARWXkLmU91ksZz49omqwwRuxqphNCk6zK7bMy1uQdsspDuZugzLmbfroHzoj9OAvr/EV0wDAzJio6Y7zpjMdGhOAsUNEZuWuwZUKomTFc6Yd+iAbOZjPdiiqrwvyszKv3UiZ3E5Q5d9M3zaGM2I8yGala6C9gjGf34Lp3a6GfqGiM4aYxHhsR5DpqFZIiRGNs7TIm62kY4/kRLWUZMTQzKl9VVqX5WZnX76VMBhHKnNOP0cAYqR9jKclIjC5KNCgLVFRGbirjsREhKAtUVEbuUibtQBnPd7SYZMSuZnZ7wu9Vc5+NsTDviGVMbiYYcy7lGKm9MRIdL02LgYrGyE1jPDYiyEgjyQIVjZG7hlrW8DDG8x0tGiOGZroVzbEqus/GWJl3xDImPYQx53TBixwj9WNMmsGsSKDDJWGBisLITWE8NiLIdUBYoKIwcpcwqQAgjOdHtDQrEkMzY5mtxqrqPhtjad4hy1jfBdejBcacSx9mXNiPMlUPZ95QcuZUXZYUi7WNv1qbzvy14Y2X9crR8Zv+vBuW+GwNPZL5G8p4upuJ3yRc3KV+v16ssvvszGvzGhy5neDMOd2LRJaR+lEmdzeMERhdlIHAgyxQMcvITWM8NiLIdSDLAhWzjBw6NNJjrfB5fkRLWUYMzex/0f+9qu2zMZbkHbKM9V2wssy5tC+MmFeNt1VGoOOlJAtUVEZuKuOxESEoC1RURu5SJstoZBnPj2iP3tm4hg8LfGJopusnmRc/frPxAcjKaA1ZORa4eqt8LXuuK6skW9jO2AJGDz3JEpWMLW4YW8dGBDeWqGRscZcxaaeMrfMjWkiyhV3NdIdVWVXbxyT7YEneIes9vb4NmGSBuz3k0QJlbG6rjEDHC0m2mhlUVMbWpjIeG6+Voa55MUWIytjaNdbyuIAynh/RkjJiaGZ0WJVVsX1Wxoq8Q5YyyX9kmXM3/Y8GKCP2oyysPhbRAUcXrjuknmWJis4YbzrjsREhOAtUdEbucibzCpzxfEdLS/yFoZkuoFRZVdtnZSzJO2Ip68xdWeacfpwHxkj9GJOBqsXHAjpcEsZmBhWFkZvCeGy8Vq4DSRaoKIwcOqTbrhDG8yNaSjJiaKZTVYVVrX0WxoK8I5awvgmWMOf0j5IhjNSPsJRiJDpeMhaoaIzcNMZjI0IwFqhojNxlTB4XMMbzHS2mGDE00zOYGqta+2yMBXlHLGHSQ8yKzn3o56+gjNiPMmkHOUag4yVjgYrGyE1jPDYiyHUgxwKluVEV2cLQH/0xaQgLzZj4Wi0u7hLfCaHKqto+K2NJ3h0sZV5GfzgX39xc3NZZaEgmYTzIAhWdkZvOeKy7FMroFCE5Y2Poj5iHMp4esaIycpeybkeVVVF+VuaVeymTdSCyLHI9J1/zJ9KM3FYZgdHJoCxQURm5qYzHRoQepOtCkWaBssFGnpG7BlsGBtJ4vqP5+9rIM3JoZ3x9T6VVvX2WxqJ8xtT/iIM0527paUZs64xAx0tTY6CiM3LTGY+NCMFZoKIzcuiQlqtwxvMjmqYrlBG7lO2fZlVvn5WxKO+Q9TCT4h3KnEsLRlJbYwQ6XDIWqGiM3DTGYyNCMBaoaIzcZSwsP3h+REvGiKGZsX8rSfb5m70PQLb3odlTxgJX/31pex8L+1EWfiR8EaOPPjMmKjkLXN1wfRNf8+A/N5f/fPU1W4bWfIO3ZsvFXR5lFCrz1vnRx+BxYWhmfC5LPVYRfsy8T1bqHbIGQgYWHp1Le1gL23sMDUm4WpSsdvqy4kf0A5c9hqiej6G17JGtXR6lHXjk+XH1ySMxNDO+Saceq34/e/QivwZCbjF4dC68q7aoH43SwyoHFjB6GCyGYDEbnauLl6jIRufCcjNRaVZd3GXR903W+dHHZJEXhWZ6DFRiFetniazoO2KNg1cIn87dPuRpWavNhW0thna6B9cciFwMVLToXF29rAlh0blkMVDRIrnLoiy5kYs832N6SxaJoZnxiVPVWBX8WSPL/A5ZAyGXhlx0LqxmFvVjMeymLKLjheVMoqJGXtVYzqTXSnriMchXjuuIysihR7pmgDKe73bSbsrCrmbWQ1mNVaV/NubbAWVMpgQYc05vcOQdqR9jMlCYPQl0B5OwQEVh5KYwHhsR5DogLFBRGLlrpGWVBGE8P6Klj7AuDu30MlaNVQF/NsYqv0PWXorMgTDmXNr/WthWmbeTlAUqKiM3lfFY9yhNi4GKyshdymRShzKe72gf+j54FXkLQzO9mlBjVb2fjbHE74hlrO+C63EDY4HTVESSEdsaI9DxkrFARWPkpjEeGxFCkgUqGiN3GZN2YIznO9qHfl0dxhwbKykVVzX8WRwL/Q5c4mQWgDjn0tKS1NYbgQ6XvAUqeiM3vfHYiCDjjckxUNEbucubPOXhjedHNH37Et6IoZnOVxVWJfxZGOv8jljCus2Vac7pu1FINFJbYQQ6XBIWqCiM3BTGYyNCEBaoKIwcOqQTEITx/IiWVozE0MzYRhNjX7/ZTQFkuyn6Q6CVYoG76c5mKVvYTtkCRhfl/qiFf6KSssUNZevYiODKEpWULe5SJlNPKVvnR7SgbGGXst2K8avK8mOOAXJj0kMYcy79FsXCtsZCO8FYoKIx52Kpti5rjKv0sWbKREWLjHpZlLIWFnl+REsWiaGZXqNr3lVZfrbI2r0j1kwpVwaLzunXSZF2pLYSCXS4MFOuZgYVJXprJVH0VL2d2hMKEr21uPe1uEuiVPeQGNpJEomhmU5olVhV+VkiS/cer5IoVwaJzukHYiGR1I/EUG4vouMli2ynqboqWR7Up5NDa8X1bc2d6MCF8iBRMRV5dZdFuSpY5Plx9XJNtWZZFFoZ77Krxarnzxa96K93Wr2g+3IurDIXtbcY2gkTqlPZYuRkxJCLziWLgYoWyV0WJRos8vxri6TQyj4Vq8Y/S/SNgJLoNd6Xc2Hna1E/EmXOqn2UBXT/UiaGYHE+JTeXMTw2Ish1YO4MVPRFDh3Sr/jCF893tE9d3iHtHBvTviZfFfpnb74bUN76XmDF8OVc+oHIhW3FeTtJXKCiOOfq6iWZkXzOpeRz6mPMbddQ1Ht5qzH0sXdGrtNQ6a344xQuyV23RKewWqyq/mzRS/8aB7k2PAgDp19yxJOQ2NYigb5dk8VARYvOZYvOJYtORYvE0EeZp2CRp0cPLbFhkRya+eqHllqsGv9skRsBHbPGQSYdWHQufdN7YT8W03omNCTJg2LQqfwkTJz++h6S0bmkMVAmANlI7hIgaz+I5PkxqJ1sV9JCI6nrbujEUY1V+Z81cntgRKzNuVV0rinVufAFrC9Se4skOl5KRqeyxcQli84li4GKFsldFsOqlOe7j+nxSAqtdC0nEr9/sy8DyKr8T7mwysXApe9kLezHouR0LWgW0B0MEgMVv/i4uLGgWcdGBLmOWtAkKglbHDqkf35dabfOd7T6iVWZXCrxFod2ehpWZVX4H/Pum7sDI2Rt6VneBU7fiqxn4KK2xjxc+m2T1U5fVfw8y+KmshAiKAtUVEbuUiZLPCjj+XGloX5fGJoZHyhXZVXmn5VxL6BD1m9L9VOUU+W3c/qWFZSR2ioj0OGisoCldcuKN5WF1+qPEiDNAvahs3893RaHLnV6cK25To8OfckkhSRjtOdW1FhV/mdjYXugtu88yZxLxkhtjREYHdQFay1RvgMWjZGbxnhshugVwDXUMBawaIwcuhSSjKc7Wt3xwkGZc/tK77vq+LM5FvtPkWVGxhPNuZv+bSGSjdhWHYGOF5MtYFEduamOx2aIoC5gUR05dEkGBvMjT3e0UifhoM65F+qqoj+r87K/IsuTAOqci4sRYlt1BLqnUV3AojpyUx2PzRAylsi6gEV15NAlaQbqeHpES/MksecbQOfJKtzPyljdd8RS1mvS9WRzLiojtlVGoONFZY7VZUltUnvT35GTJ0vVcoG7pcedN3e76buceNyRQzdlUoRGnh6dtLsBGUgOzXSaqMcq3c8eWd93yBqwsKh0Tt9NwqRJaquRQIeLGgMWM4/czDwemyEkZZB5AbvprjyUkUOX5P6GMp4e0aIycs/NqLIq08/KWMt3yPrVy7CodC4tUUhtlRHocFFZwKIyclMZj80QQVnAbKyhjBy6JDkNZTzd0Wr8ZImHLHPuxXOuSvOzOdbvT5FlHsBzzjldOyPZSG3NEehw0VzAojly0xyPzRDBXMCiOXLokkxCMMfTHa3MyUoG5pzbmnv/84vtkguy7ZJv6ehf6q94fVslfCmosY26BrqnQV3EgrrE1cD1k+N6Wv8zX74/7lJzt9u3PGX/PZpDN+U2/884PTppd8X/Dg7NjDcsnifP9z9V359S8IJcpMzrEBk2C7xKaGwrMrTjBV638zQUMmT/iJdVImXkITKFldv1XxkzAxDJ5i4DMlXCJM+Py7/rP9TDJLnnG0JFVjl/Fsmav0PWSMhsD5HO+cKlqa1HbyYmZMBiQpLrubSvoXsU1poRu+sfSsEZQ6BLoh7KeHpEM/VQRu5S33ekOqt6/uzMi/5yJvM8nDnnb6I3tXUWmkm5F7DojNx0xmNjFNOEGbC7/ngxnJHbOOPpES06I3c56+ejOqtC/uzMq/36/rKtNt//OBe2VRrbSgvtJGkBi9LITWk8NoYxSQvYXX9YGdLIbaTx9IgWpZG7pHXCqrSq4c/SWOh3zJIm8zYSzbkojdhWGoGOF2fHgEVp5KY0HpshepT+u40Ze3T3v+lubiMtRIvSyF3SekGl0qpgP0tjVd89LGk94/53S+X9j3NpdiS1dUagw0VnAYvOyE1nPDZDBGcBC6V4dxxdknHBEy00E52Ru5z10k+dVcV+dsayvntYznrGXc6c81r8/Q+prTMCHS46C1h0Rm4647EZIjgLmA02Jkdy12DLQhXSeL7D1QBKPCxDnHtR0lXlflbn5X1F7hRe6pxLC0hSW3UEuqNRXcCiOnJTHY/NEDKUWPQH7K6fbYA6cpe653fAYI6nRzS7A2CO3NVML9A13apmPzvzwr6cdQovZ875p9rf/5DaOiMwupjWIgGLzpyrq5ecQPHmXCwEAhY9kkM3ZWqCR54enYweyaGZ7fvi77ffbKcA0iq8bpTne6zWJ4Hzj0Q3tfOYmgkeE5Y8Lm7k3jo2RjGsKQN218dFpd7C0KOx43Hd3+VsnR/RkrPFXc76kSm5d6uy/Jh7gNyZF2+BS87Y2tYZgdHF5Cxg0Rm56YzHZgifL1OHbLAhjc1dgy2TEqTx/AhnP25RE+bi0E7nqzqruvzsjMV7h6z/7vHi7eZc+C75+8K20ryd9JBb7YzLCu/SdbwpLYUI0gIWpZG7pMlcDGk835d6+6NfdoE0cminCy2VVoX5WRqr9w5Z0rpNPuRuzoU15aK2zryZ6CxgMdHITWc81j1KD7R1qQOLztjc5UyeGnDG86Odm/7mGpyRe+2s6vKzMxbvHbKc9YS7nDkXFpM3UltnBDpcdBaw6My5uKu8rmuGDbnnzdVHAnsmuwYDEyY5dFO/nw2PPD/CpV3lxb32WKX62SPr+Q5ZHuXSsTBxzj9j2dTWozcTPQYseiQ3c4/Hukcx9wIWnZG7nMmkBGc8P8PJsxCpRwzNjH9U1PmySvWzM9bzHbKcyW0JZ86FfyNrbCsttSO3yN9zuCiNzU1pPNZditICFqWRu6TJrARpPD/DBWnExL1Kq1L9LM3r+ZLm1ffNuVDJLerHmX8V5H0Rs4tBmodLn2bu5qa08NpUAgQsSiN3jbZcKqTx/OxRkEbsaqYfliqtqvSzNJbyHbKkSUxkmnP6ztxfB/UjTdz/bQAdLs6OHi07Ized8dgMIVNHbZmEDt3SDuXi0CVpBspCNFOP2ZHc5azbUWdVkZ+dsWzvHpYzWejCmXPprYCFbaWFdlLdFrA4O5Kb0nisuxRnx4DZaGMZQu4abbmbYY3nO5zV7JBGDM10K+Ls/pvtEUBWausvIpWzwOkyq/JsUTtlC+gO1mc05RapJ1rikrPA1S0nOwW1zxW45DFhyePiLo9y+eVxnX/qZs+I17K0RC4O7fTDUkVWNX9MvruX/PVbvF5/By59bGhhW5MeL82Yq50xElEkmxvJl14bnnIJi9IY4pImMiCN58elplpucVc7ayNRpVWVfpbGUr5DljRZ6iL7nNOKD9lHauuMQIeLzgIWnZGbznhshujHynXj11NuXerA0lNuceiSjAuUhWimHnlGDs1sf2bq/V5V+tkZS/m+9HLWycv6G43JzKpm4YzU1hmBDpdnzMBFac7lGdO5OGMGzAzUk++pn/pfYTAZ2rk9JElhktzzDaHJV+X8WaTX/CVSVr9IvsDpMgMmiW1NEhgmtR08+gIWRZKb2cdjM0TIvoBFaeSutJFbHNJ4fobr9ch6yhG7nPXlqLQq1M/SWM13yJLWba7scy58sf/9TmwrjUDHi1NmwKI0clMaj80Q0iNMmQGL0shd0uR2hjSen+GCNGJoZtymKq0K9bM0VvMdsqRJFYZMcy495khtnRHocNFZwKIz52rLUq4ea0zn4owZsPSJ5tUcuhkefaEZux0wYZK7boe+avVYtfvZIwv8HtjyKPcOPDp38594bmwrMrQzbsUr1zFjBiyKdK4uX1bvEOlcFBkwM4BHH7nLgIwWEpLne1Rv97FIWdMouecbQkVWQX8Wyaq/Q9ZIyNMWIhMn1RUefcS2Igl0vJiRAYsincsinYsiAxZFkrtEyn0DkTw/ehlFkkM7/VRVkVXkn0VyJ6BD1kiIIYh0Tlc68Ehq65FAh8uLUefSdyM74Hwc+mujtIDd9NvzyD5y6FOYRnl69MjcYxold7nvTBFpb7/ZcwEklUH9W4yX6oELj8NF7aQtYHQxzKIBi84WN5ytYzOEL2ESZoNdzhZ3DbbczZVo6/wId9P/bSxpi0M720ffW9X9x0QD5M7kfqpEC1x4t25RW2ceLk2Yq50xEGnCXNx0lkIEZwHT73tDGTH0qOe069kFYzz9dKGyOIUxcpexPq9pVvX8WRmL/o5ZaSbXBmXOJWWktsoIdLiozLGcZpHrieca2VqshKtP02XCwtfGuzl0U25vePSr8vfb4ZHc5XGfelXNnz2y5O+BLY99b1wjAY/OpbcVFrYVGdrRcLXqXO30ZcX3ggIXP4oZuCgyXF36KOZqDt2Umx4iQzM2FUMkuUtkr3k0IavEP4vkPkCPWImUKQcinQvv6S3qx2N4I3YRHS9mpIfLIsnNSZTHZgjpUdXu6UpstDGLsjn0yX9Vv8/PcFJRQNpsZrzTrdKqxD9L4z5AhyxpndEr+5xLH3l4I7a3RqIDRmsBi48+ctMaj80QwVrAojVylzWZmJBrPD/DBWvE0Mxbr3rUWhX0Z2us+jtkWZOYSDXn0t8kN/ejTfT/LTeUJs0QL1ojN63xWPcpTpABi9bIXdbEPqzx/AwnI4hcI3ZZ60W8Wqvi/WyNFX6HLGs96a5ccy4VBqS2zgh0uFjNvQUuSiM3pfHYiKFTPibIgEVp5C5pchtCGs+PcOlthMVd1nbv4b1VoX6Wxmq+Q5Y0Wagh1ZwLe2KL2krzZuL0GLDojNx0xmPdo5hoAYvOyF3OJIPgjOdnOMGQaMQuZb2i0USrQv3sjNV8hyxnPeWuRHNOtxhq2+SN1I8zfThidiTR8aK0gEVp5KY0HpshZFZDogUsSiN3SZMpCNJ4foYL0ohd0vpyRNrjN9smgKwE133SSrTAhdlxUT/SZCopZwuYPZSHe5UBCUvOFjecrWMzRA/SdReWs4T90R/QrdXj4tClTpCrmVK2To9opr4SbXFoZvx+vTqrUv2YaA/W8x2z/lBX6ko4cy45I7V1RqDDpTxL0aIzNjed8dgMEZwF7I/+OCWckds44+kRLTojdznru1SdVVl+dsbavWOWM7mf4My5Wj6sZ+l129XsuLCttNBOWDqudsZlpW/yLG5KSyHkUpFoAbPRhjRy12hLO8g0nu9LrW/y9NrwGhpkGjm000mh0qoEP0tjnd4hS1rfCFdISHNOPy4HZ6S2zgh0uJhoAYuJRm4647EZQsYazgIWnZG7nMl0D2c8P8Ld9D1qOCOHdjop1FlV4GdnLNM7ZDmTLsKZc7fwUaKF/UjTfzvAIy00lDItYNGac3X9MrS1RRnDSjdh0pvzvUVkH7nLpKw5YJLne1jTh2gXhmZ6ua4iqyg/i2Tl3hFrIOTKINK5tEO5sL3I0FASGbAo0rks0rlUGKzr7+HIItncJdLXmKGdKPKpmfX8UZFVp59FspjvK6+BkCuDSOfSp4sWthcZGkoiAxZFOlfX3zf39RRARjoXRQYszq3kLpESDhnJ8z2sUSQxNLN/HFaJfxbp+wA1EF7gPZxLj0NSe48kuofxeRiw6NG5+lNCWUDAo3PRY8CiR3KXRxkteOT57mX0SOzyuH9GVkF/Fsmqv0PWSPTNsdY1zsWpldjeJIkOGE0GLJp0rq6/x2RlpHPRZMCiSXLop/4LBEzyfPcymiSGZvqJrVNrFflnkdwJ6Ig1EGGB6lz67NiD2F4kiQ4YRToW349dAbu5uv4ekyXS24siAxZFkrtEyn0PkTzfl1VFmKzBsGwlh3b69hOT77/ZhwFk+zDjF5KYkoFL3zRZ2NbkIkYfw0MyYNFk4pLJwCWTCUsmF3eZbAXXcJXJdX70MplcHNrpNaaarA2BY06+c9egQ9Y93W0uk86FT4+t1vYivZ2Ukquhvqz4hmzg4moncFFkuLooktwlUmYwiOT5vvw0ty4MzfTtoB5ri+DskfsIHbE8+rL13bn0kFzYXmRoKGVkwNJDcgV8un5f7gQuioxhRVQVkqu5S6RM5RDp7USRxNDM+PEUNVkbB2eT3F14GglZUVcB8u7cTf/vuPZxFrY3GRpKJgMWTTpXd2Lf3XxKrgvrfkaT3lysJFdzl0l5+sGktxNNEkMzfb+oyNpfOIv0TYgaCFlSQ6RzaW9nYXuRoaEkMmBRpHOPd93CrApkXdhBpDcXv9W+mkM/g8fQjE3Rtdp5amb8VYyarJ2Ds0luL3QPayRkJQaTzsXJldjeJIkOGJ+SjuXlTuDeP0JKOhdTMmCmAJMrOfRT/xYHKcnzo5fp164Wh3b2OVlbB2eT3F/okGWy21zLHefCpsA7qb1IEh0vigxYTEnncko6F0UGLH0F96mfMljwGJqx+wEpSQ7DNf4CRVOy9g7OIrnB0ANbIyEPcKSkc0kkqb1IEh0vinQsZ2TgYkY6F0UGzAwgI8ldBmQCgEmeH72MGUkO7fQcrSJr6+AskvsLHbJEdpsrI51LbzW+E/sxKe3UGyAL6Hj6i1v1ln6g6qqkLKp/yMicLLvxjORljahybfX2R6Aqqiz9oJGtoZNyz8MiT49gH7oDhHwkh2bG7zSqxto3OGvk5kLHrEsPix3n9O+QsWglhSu7/4+MFCwS6HDJolPZIrnx3mOKINcBY3xlX0c2Ru4a6vUGxXVzwxhPdzO3aIzcNS6rGRH28ZstHEC2haP/SFYTaOCCsEXthC1g9FCeJJV2gXq8f8pCq9JucUPYOjYiuLBE2UhXii3ueaQpbJ0ewT6+ZX6oFFvcs3cVVtsFxwz78D2FGhuZwyHMuSSM1FYYgdHDIMypuijhIIzcFMZjI0IQ5lRFkEkPwsg9j/QSxtMjmHmHMHLP3lVY1ftnYdwU6JB15dJDCHMuvLW/qK0wbyZMiauZeVHhwba4KSxEkO7UlLhe+RTBH2KLex7pJSwEi8LIoZm+8VRYlfVnYaz955Vr7kCYc0kYqa0wAh0uCXOq7qIwJZKbwnhsRAjCAmUjjQwj9zzSSxhPj2BxSiT37F2FVZl/FuZ7ATU2svqCMOeSMFJbYQRGD/uOu8YBzzCn6qKEw5RIbgrjsREhCHOqIoQpkdzzSC9hPD2CmXdMieSevauwKubPwrziryuXuQHCnAtf/1oULuxPWCUuYPRQRECYB6uLkqUrhCVOl9W11g/c+ALWNfqYJmNrktfIOnLopDiuleM6PboYJc5mep2iEqtCP0tkGd8hH+/6uVZIdC5JJLWVSKDDpWnSqbookQ2JkZNxhUTnksRA2ehDIjl0skd/ZSJPjy5+6n8xIRPJPd8LKrGK87NEVvAdssZL5hpIdC5JJLWVSKDDJYlO1UXJeEFi5GTeh0TnkkSn7nf93Cwkknse/SWRp0cX7V6ARHLP94JKrNr8LJEFfIes8QrTqXNJIqmtRAIdLkl0qi4qTKeJ0z+WhkTnkkSnHu9jj/GyBInkNhJ5enQxSiT3WmKV62eJrOk7ZF15qOucSxJJbSUS6HBJolN1UWE6jVyYTp1LEp2qqDIpQSK5jUSeHl2MEsm9lPj5m90UQLabovsBNZ0GLmxHL2oncQGjhyKnFjaBigubyIWFTeCCxEBV/vvCZnHopFx8LWzW6dHFJHFxaKYfATKdflZZf8xEQC6x27zmEEh0LkkktZVIYPRQxgESnarhFK6eiZnzTAxckuhRfUOyMnG19jz6fCau06OLaWGzuOd7QSVWqX+WyP2ADllziD8TP51LEkltJRLocGE6DcFKoi9sMid3YD0TA5ck+rXFhc1q7Xn0l0Rvxu+FWtg8NdPXrBKr/D9L5B5Bj2pJlDUEMtG5JJHUViKBDpckOhUXNuGi6uL9o0yBSxJT1LCwWa1tJHozWSI5NLOXWFsCZ4ncN+hRfXyE/3L+dC5JJLWVSKDDJYlOlZwwnUYuTKfOJYlOVVRf2Kyh2Ej0ZrJEcq8l1pbAWSL3DXpUS6I8zZGJzqW3Zxe2tRjaETt4KDpVKxu5KjwUA/ehhTXmU+eSxUDZkgQPRXLo5HhfdU2oPN9jWp/ck6cBJlRyaKdvPZ1Qa1PgrJE7Bx2yNMrAQqNzUSOxrUYCHS8lo1OlUa4KGgP3oX/bC43OJY1OVdQe30sTNJJ7Hv5lkadHF+1ugEVycjeoxtoWOGvk3kHHLI0yj0Cjc+HT2ovaWvRmkkWn4rvsK9y4+NoNWe9iXwMLi95esuhUfOd9tYZOyq2FMsObyVMquctizzRqsfYFzha5eTAG4iP8r/Cnc8kiqa1FAh0uWXQqT6mBi1Oqc8lioCyJkIvkZPhXMvL86GOcUsk93w1qsTYGzha5e9AhKxfldkYuOpcsktpaJNDhkkWn8owauDijOpcsOpVnVHLPo78k8vToot0MmFHJyc0gFr9+s3EDSGv+j/Df0IG76VvD9cGlheHS0geXFjD6KLNSrW8CVQMq9U89GBc33kNcx0YEeULU20+Birs0i7s69DxX1/S5To9gSdniLmW9uanKatvhmHhfvjdRiSeDU4kXuKiMzW2VERh9DMqcivs066qmMn9tyLL1ynEdNtY1Vy5Oxpppts6PdtKmzOKe1auy2h04K/MthMeHroyhzLmojNhWGYHRxaDMqbgrs65qKvPXJmVOxR2YFeF5qJcxbyYuUp6aGT+epMqqxj8r40ZAD2Ep64XPdW1Q5lxURmyrjEDHC8+3EC3uwSxuKgsRwsToVJXq0m9kGbmNMp4e3bFkrWfZUzMvlFVFf1bGsr9jlrKebJcy56IyYltlBDpeUuZU3HH5IjeV8diIEJQ5FXdXVoSNMm8mZxk5NDOGV7OsqvezMpb43cFSJlMVssy5u36BB8sPYltlBDqeRsPyw6m8/CA3lfHYiBCUOZWXH+SusfblB0+PYDHLyF3N9PCqsirVz8pYz3fMUibbB1DmXFRGbKuMQMdLypzKyw9yUxmPjQhBWaBsrDExkpOxXg8znh/R4vKD3LN6VVZ1+VkZi/cOWcqki1DmXFRGbKuMQMdLypzKyw9yUxmPjQjSHyzyncrLD3LPQ72M8fQIZubxLCMn5lVZ1eBnZSzUO2Ypkz1SKHMuKiO2VUag4yVlTuXlB7mpjMdGhKDMqbz8ILdRxtMjWFRG7qCsKu6zMpblHbOU+YbIl3NRGbGtMgIdLylzKi8/yE1lPDYiBGVO5eUHuY0ynh7BojJyr5V9/2b3A5DtfoS/fg5c2PxY1M7YAkYX+2F8TTe1+ghU3UdS39fmx+KGsXVsRHBjgYr7VYvLxtbpDlZz4PMipabFhV3Dsk7LrPhdewDHFANkvsI/PAcu+WJrW18EuoMhw0Kwx4d+vh6+2Nr0xWMjQvDlVNzrXxE2vryZ6IvYa19Vk599eeFeQ+MV2bdzOoC1ul/U1pc3k3w5lfOL3PTFY699OZXzi9zzSHPdsfrbwaKv2UpPJ5pfVZCffXnVXr66zevKatXx7VzyRWrri0B3MPlyKucXuemLx0aEkF9O5fwit/HF0x0s+iKGVnps1VdV2WdfLMU7Yg2N12LfzqUdj4VthYV2ugfrAeZUXZUMOyZEclMYj3WPtFCphf16ZVOxfF7cRpgHi8KIoZX9hsd3FdlnY6zEx5V/hP+PRWPypIvGiG2NEeh4KcWcKmPyKIcxctMYj40I4hrGnIql2OI2xryZaIzYwViV2GdjrMO7fzU2/oHKb+eiMWJbYwQ6XjLmVF1VWCSSm8Z4bEQIxpyKldjq98aYNxONETsYqxL7bIx1ePfv8RH+XPTbuWiM2NYYgY6XjDlVVyUb68gxctMYj40IwZhTsRBbETbGvJlojNjBWFXYZ2Msw7t/NTZhnehcKp2/iW2NEeh4yZhT+TlGbhrjsREhGHMqP8fIXWO9Sqi1UOTpDhaNEbta6ee2rjyqwD4bYxXeIctYt7lWis5FY8S2xgh0vGTMqfwcIzeN8diIEIw5lZ9j5DbGeLqDRWPEXhqrDxWfjV2QrCjKmK0VExeMNbYx1kB30Y0lKj3HmmtjfWxEMGOJSs+x5qKxPt3BgrHGDsaqxj7lWH3M2NaAZUx6+Jd74qIxNrc1RqC7mIw5VVdlz7G+qmnMX+ur+35lX0d6jjW3MebBojFiB2NVZZ+NsRQfV/7h/zlZnxc0s1pl/7W8ksKVhe/3N9DhkjA201Ta70itlVgpAv45LqvbSxJD1PAp446KTsrz4z8xWJTIaGhlbDA9P9rqE9+/kcj6vPtX42AL/qsxmVCTRLa2lUigwyWJTtU8GbIucfq3fpDoXJLoVNoY6dY2Er2ZKJHYQWKV4+dMZM3eo/r48H/Kq898Wibql+WQiaS2Egl0uCTRqbSg7HDdWl28yIZEby9JdCotMrs1dFLWBchEbyZKJHZJ7ITWTKwK/SyRZfzTOFhZUN8A+JVEUluJBDpckuhUWmOmiyqJPSDXChkSvb0k0am07uzWNhK9mSiR2EFiFe1niazse1RrHOT+wirGuZSJpLYSCXS4JNGpvOxMnP63BCQ6lyQ6lZei5DYSebq7GCUSO0isOv4skcV+hyyJ9nGE+vz/rzKR1FYigQ6XJDqVV6KJ07+0gkTnkkSn8uqU3EYiT3cXo0RiB4lV2p8lsv7vkCUxLGycC1+Cq28J/Nf11iKBjpcsOpWXp4lLy1PnkkWn0lt0z52USQsPRW8mWiSGoRrXrA/FKvfPFrkn0KNaFmXnF/Opc9Eisa1FAh0vWXQqr08Tl9anziWLTuX1KTl0Mljk6e5itEjstcXbb3ZjAEnx8PjQvzcri4HTj4LU+nRRO4kL6B4GiYGK69PIhfVp4ILEQMX16eKu4ddN0B6D7mKS+NxKp42k4q12BY6pCMglyjodEp1LEkltJRLoHiaJTsX1abiomkd8fRq4JNGjxvXpam0j0ZuJEoldrewl1q7AWSK3DnpUKxO9yLg5lySS2kok0OGSRKfi+jRcVEmULcJa2gQuSQxRw3c/urWNRG8mSiR2kFi7AmeJ3DroUS2JcjMjE51LEkltJRLocEmiU3F9Gi6qJPrGW+CSxBA1/NZGD8VGojcTJRI7SKxdgbNEbh30qJZEeVxDonNh421RPxJ13/xvsZ1k0aPdvnR++Mdobex3r2voHiVjHuFdN9T/PQJshHkrNXoyFfyvNNPPKn3+1Q7AWRi3Cbp7FdKrwptzSRipvTASHS8JC1QURm4K47ERQYbwXzWETkVhxNAhuY2rdgit1OhJ2kPYbGYvrKr9szBuCXT3KqRXgDfnkjBSP8L0p92RYSQ6XhIWqCiM3BTGYyNCEOZU9bvXDddeHFKMHHokSwAY4+kOZt4hjBhaaZ+aYVXZn4Wx/O+Ijw/9DzJMic6ND6pd3UOZQGovjETHS8ICFYWRm8J4bEQIwpzKwsihR50bV4chjKc7WBRGDK10NqiwKuLPwljpd8QSJlcGYc7puzkQRmovjETHS8ICFYWRm8J4bEQIwpyqfksKIcPIbYTxdAeLwoihlU5jFVb1+lkYi/qOWBceVo7OpZUjqb0wEh0vCQtUFEZuCuOxESEIcyoLI4ceiU9kGE93sCiM2KW9fwtQjN1/s3UCyKpu/+uzj8TpJ5Qqxxb2oyysExfRfQzKEpWULW4oW8dGBFcWqJoUhascW1xWtk53sKRsYZey7WPsXqX4MckAuTK58poVE5eUsbm9MhLdx6QsUFEZuamMx0YE6VCtFFOHbI0HZWxto4ynO1hURuxStn2Q3avwPitjdd4ha37wtT0aE7U3/bAEsozYjzIZqVoqLqDjJWNsZlCf+rXYKsZWa9NYeK1cB4w59aW/hwRhxNAfaaWmxXW6r/Pzu3PoWp/USjFg9S7E2trU2bFq7bM3FuQdubx1m1dopJpzahfaSG21EehwSVugojZyUxuPjQgy4NDmVNRGDP2RmxnaeLpjRW2O1VtWW21VmJ+1pepd//oQ2pwL/3rd2NZbaEcWPX/P0aI3tja98ViPZdj7CP2J3tgY+iM3M7zxdMeK3hx7jF9N1XSruvvsjcV5R6506yXpSjfnbqGkvhPbeiPQ8VK+BSp6Ize98diIEPLNqeiNGPqjP3gFcTzfwaI4xx7jF0tVXNXfZ3Es0jvy48P//7G+m+XPtxH68ouJkthWHIGOl8QFKoojN8Xx2IgQxDkVxRFDf3olcXUX3ni6Y0Vvjj3GXyGotyrDz95Yq3fk8taT70o459KyhNRWG4EOl7QFKmojN7Xx2IgQtDkVtRFDf2QWgjae7lhRm2OP8ZcLqq2K8bM2VuwdubRJPYnnm3PvIhfZRupHW6rZSHS85M2puip5DmI5GTnZ0q232QKXnnmhNXGFFSYp9FEuCSp5enTwU3+6AktM50bJqCqrTD+rZC3fkWvQ5JaFSueSSlJ7lSQ6XlLpVF2VLPGgMnKypIBK55JKp/QNK6gMlIwXjDp1i0ad2xt9+82OCiCp4WrsZNYvo4ELRhe1NbqIl0YDVVcliVJGI+d/35O4YDS05hbKaeCGBT4nA3X/0l9uryxdHMZsrJMkP9+qwD/mJyCzOZ66fEIGbtSeF1VT7aL2Nj1eyM/VTjsvmzKvwaa3VpxPtYFLNkNrcgfBJalr9OVxU5m5zve13z51ux4W2U5z455Ql7WDcHbJbYZu8fHh/zVZ35U158klqb1LEh0vuXSqHPlcG66qOJ9rA5dcelR96xIuA+VzbaCy0ZetqdHaFjgbTXsHY3G1stO5ZJTU3iiJ10adKlOSKcjOxKW51rlkNFCWV3Dq3MirNdc6ledacle29wykNmuz4Gwz7Ch8fMlshSenc2nbZmF7naGh7sI1FLVvs9pp6TVtSBpAJ1sb9cg61q/V/YzabwvU/aZviEEdI1yDLVeAqZXnO9q7/mYeZlZiVzM9g6iz2ic4OwubCR/6Z2Rw5pzO+Xg+ktorI9FdvH1qLQppkQs5mDj9alutYEN7SWRsTZ6BEEnuMrD2Olfy8fTs5EPqO4hM3EhmFVobCGehYZfhQ3+IDkKdCx+SWNReaGgnCnXunuZUxypZZfUNn84ln07dPlUEfDqnf1KL9HSqrk3uSWglh0Fr62qz9hXONsPmw4f+fRxsOpfSk9TeJol556b0dC7adCzbdC7ZdCrbdE4TADadyjbJPee62qydhbNN3354fOjPycOmc+Hbf4t6vrBrEqr3ENfpoTI8HD1UXVLftFdreDiSmw9HHusIyZpT95vO0MhB58ZUuKZWp771t3GQgsSex0al1ebBWZrvMNQIyUhCmnO6BMATktQ+BUn0qH5+yFoBD0jH6rJksQVxztUDVwRjQg2cRMVKx6mKKhxkOldvhMugIQmdq/akeIJPci99Pn6zvwPIdgT07ejyuTje8WVvHdvaW8RrewGL9gIX7SVOrJS9QEV7gavfAusPKjEZAxftLQ7D1reeZOOjNgyO2QjI7cn6APacC8ubRe19hnbkNq5kXO209RoIWRlUMi6O91Ql3jrWrw3VYaAen/r/qZV4i3tOlGXMu/PQnzasdHtqZXz5Qo3VhsDZmO8a1JXLmhrGnAsPvUXtjXk7YddmtdOjno2xtWmMx/q1yZhT2Ri55+RYxni6g0VjxNDK+BqzGqty/2yMewIjpP0pA4w5l4yR2hsj0fGSMaeyMXLTGI+NCGF6dCobI4ceyWRQz7QwLNHYbGV8ZVmNVbF/NsYdge5fXblcGow5l74GvbC9stCQhMO06FRWRm4q47HuUkoyp7Iycld6WMGeLjRNi7OV8WaPKquy/qzMa/+6clm/QZlzWo9hYUJqb4zEGM9gzKlsjNw0xmMjQkgyp7IxcuiRNIMk4+kOFpOM2OW9+6vGqmI/G2NZP0J++v/t1i+B2BLFvnIIZcT2ykh0wDQvOpWVkZvKeGxEkLHGstGprIwceiRreCjj6Q4WlRG7xPeiU5VVWX5Wxtp9hPz0P9et75easuph76xeD2M4I7d3RqIjJmdO3fVjO1guEpvKeGwE+DN+ReO6VEgL3Je+aYIFIzl0SXoMaTw9wr3rrxtgxUju2b1Kq7L8LI21e4csGWGJ71z4xeL6TZf/ut07I9EBkzOnojNi0xmPjQDRWeBssOGMHLokAwNnPD3CmXo4I4dmekGuzqr0Pjtjfd4hy5kUQHiaOXcLG5UL2zsLDfX0fiUBFiBORWfEpjMe6x7dorPA2WDDGTl0SQYGznh6hDP1cEbuuRlx9v6bjRBAWkp/jo9bXINYzgIXPhy/qK2yRYwuurJAJWULG8rWsREgKUucjXUpWxy6pANTztb5Ec/Ul7PFoZ3usTqr0vyYZ++hfv/0P2L9CJz+5ns9zha1d+bxwtS42umBiM7Y2HTGY/3SmGYhxC06Y3uXs95rum5mOOP5ES86I4d2elWuzqrqPjtjad4h64P2cmnIM+dScbawvbTQUN92nBtXO31ZURobm9J4rF+apQXOBhuJRg5d8ufZOj3CmXvk2Wxm3KYqrQrvszRW5x2zpMkoQppzqhaJRmrvjETH02j1PFvtNBWdsbHpjMf6pdlZ4KIzcuiS3MzIM54e4aIzcmhm/HGqOqvK++yM5XnHLGedvOuB5lxYg7yT2jsj0fGSM6eiM2LTGY+NAPGBFrjojNw12F1arcmR50e8KI3c1U4XjCqtiu+zNFboHbOkdZtLmnNJGqm9NBIdL7299u7Yl77PVRVawOrqpfatTf7AaR+rZgvU25/wVmng4rtrgaurkyIPEyc7e/lcu2Oqswrzs05W7z28FVLmdMyb5Hi7Y5bksb08Et16lOdYlOdYludckudUludcfHNtjUb3Nctjexi1nohVXtXnZ3ks4p9CSrECec6Fjf9F/eiUlK5PKCygw6X504Pd9Y11ZCIx3lDIOh4bAeQykHWB0j8hwyKFGLojOYQHHk93rDf9YyykmmPjUw4qrQr0szRW8R348el/A1q/bGTlXpJG6rqb/kdGC9IIdLgkzan669M1s1yTOqQRm9J4bASQy4C0QH3qtzRgzbkx3uvBFyj9XA7kEXudalWin62xju9elrXehFmPPeeSNVLbVCPQ4ZI1px66tQhrxKY1HhsBgrVApVQjhu7ov/Ig13i+g8Vcc2y4l1z7+M2WCSDbMhn/sEFrgQvWFrWztoDuZ7AWqMd4c4q5trBhbR0bAdxaoN7e9PckK9cWh/7oE7K0rfMdLWkL2AttVacfk+2DxXwHrmTzYi5wSRtb+9GmX/arOTK0k7yxnb4qnXMq2VZbU5u/Uoe7psj1ym7/8abvakIbW0N/pFqCNZ7uZt70vxVrbgzYC2tVqZ+tsZzvwGVNLrBWIx/OJWuk9tZIdLxkzan7+LzFyjZiUxuPjQAh2xKlW+nQRm6jjac7WNTm2AttVayftbGi78ClTfoJbc4lbaTQS3k8ItN4uoMlZ06l59pqbDrzl6ZUS5QuUuGMXOgNUo2nR29sUYNcc+6FtCrWz9JY0XfkkiZ1LKQ5l6SRCt2ENJ7uYElaoD71236YIMlNazw2IsgdiAkyUDbcsObcGO4r4yHPqUc9Jp/XvJBH7nlwdDlSJfnZGuv27mZZk9oE1pxL1kg9X9jVP1jj6Q6WrDkVFyPEpjQeGwFk+CAtUFGac0maU7d3TXBII/c8NiqtSvGzNNbr3c2S5jskH84laaRwYelv8UIzSRubebooqfyRbOSmNx7r1+oIwptTtvhDrjmWtDl1e+iKFNrIYXRGdaXeqig/e/PK/fGpb6oh2ZxL3khtvREYoyor1npDIASrOUeyBt7Y2vTGYyOCvBLeAvXQ9R/EkZOhXtMjz3c08w9jjo3uqLeqx8/eWLR34PImSwl4cy55I7X1RqDDpXxzqi6qd+/WMpLc9MZjI0It7J8fNDDnXMWQewjmnBtDvvw5dbNFFASSk/tA1VVtflbnBXz1IFQAziV1pLbqCIyBleFCyjmV1ZGb6nhsRIjqnKsYkpxQRw5dklsaSxKe7nB+B8CZc+MOEHOfv9koAWQbJeG/XwMXzC1qZ24B3dGQdIGK5hY3zK1jI0IyF7iKIUuyMre4bG6d7nDRXOBemKtK/phzn17uV2RfngQumWNrP+bCXkloJ6ljOz0et0f4+vBqbaoLr5VUqtlyvbIjfOuFwBsbu7xJM5Vy63w3kx5zAXvhrWr0szcv5MubrODqMffpXPJGau+NRHdUh6smyxDt9j5+HZTPucVNbyFCTLnE6bfVoI7cTh3Pd4/qdxXlTYuaLVc7zb1wV6X62Z3X8xVZ5nO4cy65I/XjTu7RquRCM0kdm+lu1kXJMqOWlqu1qc5fG0qC9cqO4Kt4iGNrlziZipBzPN/txJxz7IW3qtLP3ljKd+AaIlkywJtzyRuprTcCHS55c6ouShZN8EZueuOxEUHuH0yVTlVFIIkCb+R23ni+o0Vvjr3wVoX62Rur+Q5cQyQdhTfnkjdSW28EOlzy5tSbfT8C3shNbzw2Ikh34M0pG29oc2yMN+uBQN2sLsRsydbkJtBVZVXqZ28s57ub5c13KT+dS95Ibb0R6HDJm1N1UbLigzdy0xuPjQjxEedcxQgZ51xS51Qs5dYVH9RVyX5W53V99UDmcqScc0kdqR91WhnhGUdijKxMzFieOFVXJYsmuCM33fHYiBDdOff41D83RdqRu0b7uZrHQ46nO5zfAsg358YtoFlXxfpZHSv6GVnfYIY655I6Unt1JDpeSjunsjpyUx2PjQhRnXOlTpZAUEduo46nO1xW59wLdVWzn9V5YV8dkDyAOueSOlI/6uQBg6Qj0B1N5gIVawJy0xyPjQjRXODe9W9xYI4cuiRzNpKOpztcNufc3tzXbzZQANkGiv6abpkLXDC3qJ25BXRHg7lEJXOLG+bWsREhmQvcm33LtswtLptbpztcNBe4F+aq+D/m3Bd3CGbk0ea1gII555I5UltzBDpcMheoaI7cNMdjI0I051w2Rw5d0i9LVNKFgcnq2E5f1xhmedJ9VXF/Vpd2AMJfeKIxSc6kjtSPurBICe0kd2yn+1llsiydapGyWpvu0mvDewXrtU8xZCGErGN76JM8AKCOp7uZrM65F+qqbj+r8+K+nnQyoyPrnEvqSO3VkeieJnVOvdkHz6CO3FTHYyNCTDvnfMyhzrkx5izrAlVXLKZrmbm45xtBs65K97M6r+9LndzfUOdcUkdqr47EGFhZElVpEKJVkSR7clDH1qY6HhsRojrnsjrnkjqn6oqlZ1BHDiPUp1Vd1e1ndSzuu6OlTqYNqHMuqSO1V0ei46WsC9RDt8KhjtxUx2MjQlTnXFbnXFLn1O2h9T3UkXutrur7szrfBHjYb7xBnXNJHam9OhJjYPvmu6YfZF2gYtaRm+p4bESI6pzL6pxL6pwqdbLdCnXkXqur6v2szkv8UidTE9Q5l9SR2qsjMQY2qAtUzDpyUx2PjQhRnXNZnXNJnVOlTsp7qCP3Wl1V72d1XuKXOgkJdc4ldaT26kiMgQ3qnLrXv9k+70FhwiQ31fHYiCDLhdp6Xq9sqiJIv7FIYWvokZzG+pKnu5n0oeaADf36oKva/ezNC/zyJiMJb84lb6TQy1v4klVoJj3n2EyPRl2UTD3QRm5q47F+bXiHbr1yUHZjQBtbuzr0fN9AG0+PZuwzm0g05/bevn+zjQJIKrUaIrk/y1vggrdF/eSbNFMbYAsYHZWbpB5yiUqfbF7c8LaOjQhyHZVugapuyxsl5W1xlzdpp8St8x3N3jEqbwF74a3K9mO+fXttXx3wci5wyRtb23oj0P0M+RaC3aI3tja98diIIOMNb049dP8B2hyrrxCLXuhzLk2XAXuhr0r3sz6v70ufl3TfziV9pH70hY2U0E7yx3baQV2VVCs1X67Wpj9/bRVX8oSCQecen/pPmlBIDn2SKRvmeHpeaigIAvdCXe0AnNX5NkF1QNYCmDGdS+pIbTOPQHc0mQtUzDxy0xyPjQgh85yKmedYZZ7c2PDnXMw8x17oq7r9rI/Fffe29Ml9Cn3OJX2ktvoIdLikz6m3Wrc/rxOQeOSmPh4bEYI+p6rb8uhF2pFDh+Smhjae7mBRm2MvtFXNftbGwr4D1/XLCEGbc0kbqa02Ah0uaXOqLkoGH9rITW08NiLIKzFbOlUR5EEGbeQ22ni6g0Vtjr3QVvX6WRuL+g5c1x+WKc4lbaS22gh0uKTNqboomaOgjdzUxmMjQtDmVEWQBym0kdto4+kOFrU59kJb1epnbSzoO/DjU/+4DdnmXNJGaquNQIdL2pxK35xb1zSt+UtDMbde2Zdhi3lI88bGcPN9gkD5bwKgNGBr1y3QE5oU4d9V2J+1efVf2mQWhzbnkjZSW20EerySNqfsazFINmJTG4+NACHZnIraHEvanKohlOUBtJE7aKuC/azNq/qKKc9maHMuaSO11UZgjKoEQw3uVNRGbGrjsREgaHPKRxrpRu4aaWkHSxKe72imH8IcG/qfs63+N+Ss7YJs68T/zTFxrq2pH226ivjbvYnuqKdbooK3xtpbHxsBZLz/FS8jeevWLm/yUcz/xHaCt26mL+qFt6rnT+lWf60Strz07y7/UhfoXPJG6urm84od0ni6Lz9Jc+pR/+n03No/RmvTmr/Wn23xOmzN8+8Roa93DPd/H265NV0f/O9oDYPTCyzNtqrlz9ZSwe//w1l/w2J2kzVSP9kmdzm8EehxSN6cCkuSbmxq85cmbU5ZksCaY8maU2lJ0q1dt3TfhaqtavOzNi/ga7awAqD+i+VX2khttRF4rc2pOEcSm9p4bASQuwdzpFN5jiQnI73yjOc7mulHmjk29Ku2qs3P2ryArw50Bl8XiDnSuZRtpH60pWcbie5oSjen6r1vebRgmiQ3xfHYiBDEOVUf0bPCrSNc4qQdPNxCO/oTFhDn2AtxVZ2fxXkJX+KkAxDnXBJHai+OxBjWnjGu2+TvMVqJk1U1xLG1KY7HRgQZcGScU29f+lDHTEluJ47nO1rMOMdeiKv6/CzOi/j6/q7c2xDnXBJH6kecvyOQ2kkZx3Z6OMLf2HZj05u/NL0h0K/tEOkjC4kbQ75mzBRVv+uKzCMn94FOllWdn9WxhJ890F+qgzrnkjpS+5wj0fGSOqfi2oTYVMdjI0BIOad8OYGUI3cNtdzRmCt5vqPFlHNs+FdvVZ6fvbGG78CVcjIrwZtzyRspdPPun1lIzdz004eYK9nOuCr9MhGmSmLTG4/1S2/6ayCYKx273/QtEIhzboz4yjinbvpDFkg4Ytfw7Pa56ln7G3Fey5c4eexAnHNJHKnryp5rLlQCPD0HVWJBm2Mx3YhNbTw2I/QIXQMNbY7db/qWP7Q5l7Q5FbURuwanJwHJt9tvNkwA2YaJ/iNzaQtc0LaoXb4tYA7rs97yFqjkLWGf+nv3/4zNhbIut2Zv6/TFoY+yj1szZ2jmFlaZC7tGqm8sdVgbCcc58+a7DZV6Xs8FLjlka9eVPbup1AuNhAddoKJBxurboa687+grzWDQuWTQqWotGCS3McjTfVHRILFrnPqa1WAV+GeDvgtQV+6l3c05pf5ao0Uq9A8GeXr0z+fOQN31q3z1yAvYmz5pIDDE7CHjbBqoL/1oYE2mCwv9QwZ6rDf9LaB6+C3suRXVV2X8WZ/X+qXPC7ybc0kfqecLuwYJ+nj6tT6nHl/619vwR248+9axESHI4isH9aZVLWyRu7rTM93VH+ji+W7nTX97CrocG09QtVY1/NmaF/o1RDKj49HnXLJGamONp7uXadp0qi5JVr+wRm5a47ERIVhz6v6l/+ALa+R21ni+o0Vrjr2wVgX82ZpX+TVEMn/BmnPJGil0M/wSaWomeWMzPRp1UXKvwxu56Y3H+rXp2eZUfZJPphh4I4cOyQUg2Xi6g0Vtjr3QVmX7WRtr+w5cIyT3J7Q5l7SR2iQbT3ewJM2puiSphSGN3JTGYyOCdKaqg/XKQcUpkq1d3RGpsMbz3U605tgLa1W6n615fV9DJCsqWHMuWSO1scbT3ctkzam6pDBFkpvWeGxECNacylMkuZ01nu9o0ZpjL6xVxX62xrK+A9cQhXrAuWSN1MYaT3ewZM2puJp0LK4mHUtTZqL0j8QwZZILHUTy8XR3MC4niT23oguTKt3P/ljfd8TyF6oB55I/Us8XtpaTPN3Bkj+n0rtzN8duX/qeAsqBwIVEdKo2M58rUvgjFjoIfzw9OviutwEWmOSemxGB999sqgDSTZUvfceqps3ABYGLwoWlNcoCRg9lQVSbKoEKf0nW2Jg3w0tDviXKpp3ytbhroMVnCVvnuztp3gzYft68V7F+zDtApk3fyoQ255I2Uj/a9MatSi60E1IvUNEbw01vPNYjmbw5ZeMNbY6N8WY1F6i3N92DqWxb3Otsq1L+rM3r/ceX/7305925pI3UXhuJMaoh3Zyqq/J1yrqq6c1fa589rOXlemlfSIWQS4E5NocuyRUg33j6qRmpHaCM3HMzOkFWnX5W5sV8XblMBcg055IyUntlJLqLOk6YIZ2qq5LVbhUEi5vK/LXaHxhzqiLIygzGyD0P9Uoynu7uWMZCmGMjY9VbVepnb17O1/X7yuTuXPJG6seb6McESaD7mbQ5ldaWq7FpzV+arDn1pb8XAmnE0B3ZRkKa8XR3Jkpz7IW0qtPP0ryYL2lSZSLZnEvSSP1IC58bCu0ka2ynhyM+1ohNazzWL03WnLLxhjXHxnivjHPqZmsbpBy56x7ovQRNtqrUz968nH98+X+kft6dS95IbZONwBhVeZZgjnQqlt+Lm978tcmbU9GbY8mbU17Lwxu5y1s/I9Vb1epnb17QlzeZEJBvziVvpLbeCLz25lR56xv0utHxbCM3vfHYiCCTNZ5tTkVvjiVvTtWfhcucBW/kDt6qOD97YwXf3SxvfS9cQwRvziVvpLbeCHS4NE06lb2Rm954bEQI3pyK3hxL3pzK3shd3vqiNN+qJj97Y+He3SxvMnXBm3PJG6mtNwIdLnlzKs+T5KY3HhsReoiu2xD55lT05ljy5lSeJ8m99vb2m10SQFZu+1+l1t+VGRe8LQpXJmv2Wkqu02NM5Rapp1ugwv+kJuxNf+egdrlCa+F5F6i6fcV3LVQWdw398y5YLS/X6e5gFd7PWE2YC3tuRfLurWr9Y94Bcn8y9JV3gUv+2BouTCZd+OPp7l7IukDVWEp9VU+5zEkdA4MhqpipTAzUh37kBwLZGHoo5TUE8nT3sK49GCT32mAV62eDrOhnSP93wPqPNzOdDJLaGOTpDpYMOpUNRi4YdC7loFP38EH1NQ7oodzoMOitZIPkXhus6v1s0Ev8x5f+4Cdy0LlkkNTGIE+/NuhUXZJkNHIwcjInIwedSwadqqiSZUhC58LjMFDVmmQ+ZlO29tpklfRnk173V0i5yWDSuWSS1GUyfPA5NJOykc208ewycsGlc8mlU2/+3xNpJJJKbyyrJPdaZdX3Z5XcBHgaNXkKQaVzSSUpXFh6+yc0k1SymaeLkgkTaUluLEjXsX5t0sZXNlUjHVLQueTNKf/AC1KQHIang+mCpur7szduAjx1QJ7A8OZc8kbq+Ya6lu9Y0PB0B0vWnHp86VIT1shNazw2IsgUhsWLU9mac8maU7GOWFGvwekhVm1V3p+1cQ+g+1lj5Pstb84lbaQ22ni6gyVtTtUlhWcguamNx0aEoM2prM25pM2pWLavITxoq+r+rI1bAN3PGiN5ZiDbnEvaSG208XQHS9qcytlGbmrjsREhaHMqa3MuaXMqZxu5a3D2k2QV92dt3AHoftYYdZvcJXtzLmkjtdHG0x0saXMqZxu5qY3HRoSgzamszbmkzamcbeRea3v8ZrMFkBXr/u+B9f9sxgVti8KVpTXJAsawSmrXdkugSpyseevptrghbh0bEVxcoKK4wAVxgbq96ycNak2yOAxPp4Y83B5VyB/TDZB787Vk4JI3trb1RmCMavDmVHnzteS6qOnNXxvWkuuVfR3Zm7eWvDmltz6skbrSrR/Wqq2q97M2lvjz+vU/+urh9nAuaSN1Xdnznl4tJUMjYZYMVJbGYFMaj3V3kjSnsjTnkjSnkjRS19BsF5KPKtTP0ljNdy8fX1p4QppzSRqpjTSe7mBJmlNZGrkpjcdGhDBDOpWlOZekOZWkkbqGZj9BVkl+lsa6vXtZ0nz1/3AuSSOFK4sPNgIdLmlzqrT5u63roqY2f23KNaeyNueSNqfiQnJd7yWubyadIqsmP4tj4d4jWeJ62uVC8uFcEkdqK45Ah0vinCpxclFYkZCb4nhsROgh4tt265VNZXHeWhLnVFxKrqgHcVW+n8V5jV/iZJWAadK5JI7UVhyBHrAkzqksjtwUx2MjQhAXKPtIQu0wr25fQy23Tr1LsM53NL8BsBzxeOMG0IyrAv4szqv8EtfT78o455I4UltxBLqjSZxTeaokN8Xx2IgQxDnlkxvEkduJ4/mOlsU590JcleZncazfZ+TR5hLnXBJHaiuOQIdL4pwqcaEIIDfF8diIEMQ55QMOcc7p4CDvnEpLE1LXTdDXpPlWpflZG+v37mXlm5S3mCidS9pIXVfmRQBPd7AkLVB3/RMOPN/ITWk8NiL0AK3nW6Dq59qerxfSyKE7+gUB6OL5jmZvAmGWdGy4F2vvv9kpAWQVt/8pZ/0bunHB2qKytXW6exmsJSpZW9ywto6NCG4tUcna4i5rsg1R1tb5jpasBeyFtarLj7n2zuK9A1euyWxUuRa4ZI2tbazxdAdL1gIVrZGb1nhsRAjWAhWtkbusyaDAGs93tGjNsRfWqjA/W2P13oHLWlfxfLC9O5eskdpY4+kOlqwFKlojN63x2IgQrAUqWiN3WZNBgTWe72jRmmMvrFVlfrbG8r0DP7709/yQa84la6Q21ni6gyVrTj30pzzqsbauaErzl4Z6e72yL8MG+//P2J8luRIrSbbojLKCDDIakZL6OdlnzuLO4Y3/mfo+CjOqKoj9674Ic2C5wWFgV0+1gI3Bvm5nmAshP3RhUA+3xV13QC8c9LFW1ftZmpf4Jc33SZ7OJWmkNtJ4ukcrSXMqSiM2pfHYCBAyzakozbEkzalblEbuktaPSJVWlftZmpf3JU1qSmSac0kaqY00nh5jKlV9vWcTQkVpbGxK47ERIEhzKkpzLElzKksjd0nrJ6RKq5r8LM0L95ImIwlpziVppDbSeHqMqYSCNKeiNGJTGo+NAEGaU1GaY0maU1kauUtaPyBVWtXjZ2letJc03xt5OpekkdpI4+kxpkFaoL70+yh4qJGb1nhsRAjWnIrWHEvWnLrZ1ikeauQua/v5sQrxszVW693NsiYdRao5l6yR2ljj6Q6WHmqBitbITWs8NiJIZ+oTW6Ez0Zo3lqw5la2Ru6ztJ8gqx8/WvGYva728Wat+55I1UhtrPD3GNORaoKI1ctMaj40IwZpT0ZpjyZpT2Rq5y9p2hvz6m30RQLYvoj91W7kWuGBtUbiyj38JXyNexBhWF5eom/58YE2Sixvi1rERwcUlqt5jsQ2txaFHejfXon+d72ifqramx4ANSh5tX1WRH9MNkIuTDkCcc0kcqb04Et3RME+GaDUJ9C16TQIQx9amOB4bEYK4QOn/4VTJtgLsvHkz0Ztjb7xVTX725oX740d3UuHNueSN1N4biTGqIeGcyt7ITW88NiIEb4FK3oihQ/o/jsg3nu9g0Ztjb7xV4X725tV9efNK+8u55I3U3huJ7mjKt0DFiZLc9MZjI0LwFqg4UZLbieP5jhbFOfZGXBXlZ3Gs3DtwifNq+8u5JI4Uupn+eyA0k7yxmb6om5QlmCVJTWs8Nl4ZrAVKlmKYJEmhMxIeucbTHepTUxLPNsfeKKuS/KyMdXsHLmUya2GOdC4pI4VeyiDU5+xCI+nPIgKWftkkYJ/6Znx9/S1gYXsyUJ/6kQxonB2UGQkaebpHM2p07I3GKtLPGlnJd+DSKPcZNDqXNJKCxvQhrtBMyjw20xd1v+uP0yP3yM3c47F+bbLm1F0/ugZrxNAfubdhjac7VpwvHXtjrYr0szVW8h24rMkUA2vOJWukttYIdLhkzSn921Y4IzWd8dhoXzpT1fd6ZVPVaZksII2toTsh1Xi6m/nUtysxYzr2RlrV6GdpLOQ7cF1/b8Ow+P5yLkkjtZVGoMMlaU7FKZPYtMZjI0Cw5pQNN6Q5Noabb98Eyn7fB+7YGMZm/B6A1nBVo5+tsZDvXpa1UMM5l6yR2loj0OGSNaeiNWLTGo+NAB9atiPbAvejSiDOOaUwUzp1+wg/krG49+a+/2bbBJBV37o2qkkycMHcov6Y06+k1yJlEWNk5ZlRbwgE6lfXCzVNLmyoW8dGgKQucJ+/KqXULQ5dkistZ+v0CGd3QGVb4EYwybnvKtaPOQfIzGkhCnPOJXOkdjkXmgk5F6j7h14UzDHcNMdjYyijOefun/q3hzBH7kqT1w0xmOPpES6ac+6NuSrXz+a8pn/8/MhDGOacS+ZI7XOOxOip3MnIuUD96o9/Qh25qY7HRoSozrnquZSwUEduk3Q8PcJFdc69UVcF+1mdV/XVARlMqHMuqSO1V0di9FSiQZ1Tv1/y9IU5YtMcj40A0VzgbMhhzrkx5FyiBKomX+kYZk22hgHqRaBOl1W3n815cV/mvIb7di6ZI/XHnKzo8JwjMMZV+gdxTqUlysKmOH9pLRZ6jK6hriXKeu24kI/w/sDi0CPpD2bLEM78w5hzw7+Kq0r9LM7L+RInV4iUcy6JI7VPORJjwII5p6I5YtMcj40A0VzkJK2RcuTQJf0Jb6jj+REvqnPujboq18/qvKYvdVKMQp1zSR2pvToSo6dBnVO/WiFjtiQ21fHYCBDVBc6GHOqcG0O+Zkun6jfrpWPIPXIYoD6tSVc1+9mcF/ZlTmYXmHMumSN13aHh555CM2lxyWbG6D/1rUyYc+5TPyFfW5cBC5tgkdL3laGSQdFHeZ8QScjTfe2f4SOVC7tGaq1ZVWGV7meFrO87YimU6QMKnUsKSeHCPv4lVXYkOl5y6FScN4nN5OOxEUAeA3jeOWW7H9BF7Bro4IvnO5jtyCDlHBsJrNqqvj9r802A0iYXCG3OJW2k/mjT3U8sVEh0R5O2QOkuATKP2NTGYyNA0ObUl/5DHbQRe82PNVPydMeK1hzbW/v5m20UQFaMa01a1gIXrC1qa20R3dFgLVHpTdXFDW3r2Ijg2gJ1/9K7tbwtLntbpztY8hawN96qbj9m248X94+fXy/FA5e8sbW9NxLd0eQtUCHb1kVNbeGlQZtTKdtWAPRHqvR6pq3T3ZlozYO9sVYl+9ma1/VlTS4Q2eZcskZqb41EdzRZC1TMNnJTG4+NCEGbUznbyG288XQHi94ce+OtKvWzN5bzHbi89Ur1msbhzbnkjdQfb2FJEtpJ3thOX9X9Qz9XUQ+31dr05q8Na8j1yo5Q/Za9B8ySbG3jjae7mejNsTfeql4/e/Oivq5f7k94cy55I7X3RqI7mrw5lZaS66KmNn9p0hYoKYEgjRS6I08OTJI83X2J0hx7I60q9bM0L+dLmhffP84laaT+SBP3tY4MzSRnbKZHoy5KBhW5Rm5K47F+bZLm1P2pn9WANnKbXOPpDha1OfZGW9XnZ20s4jtwjZCXbT/OKfWv1UtSW20EOlzS5lRdlBQl0EZuauOxEUFunyrb1iubevzqH8BAG1vbaOPpbiZqc+yNtirdz9q8vq/rl+kAU6RzSRupP9rSo41EdzR5cypOkcSmNh4bAdJWV+hQ7UPL/QpxbA9d0n+txDzJ8y/x5BarintxVzt9XmrtnyrMz9K8ei9pYR3pXJJG6rqysMuFa5IiMTkL1EP/nRW5Rm5K47ExiCHXAvVQJVBGDh3Sf6yBMp4f0ewz8lDm3Jtsq9r8LM4L+BIXFpLOJXGktuIIjI5KsHoz5ydQURy5KY7HRoQgLlBRHLlLnKwzIY7nR7Qozrm9uN+/2ScBJClQ4uQKa5oMXBC3qJ24BYyOurhAPe66v14Zt7ghbh0bEVxcopK4xW0ybp0f0ZK4wL0RV/X5MeN+vYgvcdJTiHMuiSO1FUdgdDSIcyqLIzfF8diIIN2pZUnozi2KY2ubjEvtRHFsp6/qjbgq0M/ivIovcV4G/DqXxJHaiiPQHQjPuBDs9gzfrlrcFBciBHGJ0m8n1TNuRUCHpA6pmXKdHt2J3jzcG29VoJ+9eRVf3uQKkXDOJW+ktt4IjI6GhAtU9EZueuOxESF4S1TyRg4dkmbgjadHsOjNuTfeqkY/e/NCvrzJehjenEveSKGb8W230E5KOLbT41GXsN5fvDbe8IQjNr3xWL80lN3rlU1VtyUC8o2tXTfi6wXAG093M6l+C9gbbVWjn7V5If/41TUxtDmXtJH6oy287RbaSdrYTg/HLX0mb7U2vflr7W8n8YRzrDouhSvEkUOXZGaAOJ7uK7V/CaxSYGGX/m5Gqrffqs/PyryIryv36g2NyZozKSP1R1kouUM7SRnb6YHIyshNZTw2XitzG4wF6kc/Ywtjzo0k4VumgfrV73lBHBs7iKsq/izOS/0S1zcD3wb4dS6JI/VHnIxX7UyGZjRYVW+BSlslC5vaeAXvtQUqanMuaXMqaiN2aeufudR8qwr9rM3L+NIWajfnkjZSW20ExqjKPQJtTkVtxKY2HusAcYJMmNxlyDZiMtIrz3i+o9XoSTtINOeGfvVWBfrZm1fxFTlUAM4lb6T+eEvzJInuaco3p+wTwFiREJvieKwDRHGO1YeMw5KEHHokdxiebDzd0bI457bi6q/Nz+IuSB5cFdlKgMS5uKZ24pronrq4SP3q/+j9R/2ENbd62lwf6wjBXMKq47KG/u8RAl2SB///jNMdLZlL4d6Yqwr9lHI/H17GV2S59f5RV+hcMkfqjzmZM/4tNpPEsZkejtuv/hkrxJGb4nisXxvFOXb/1A/8Qhy5jTie7mhZnHNvxFWJfhbndfzj997PzX8uTX4+nEviSO1TjkT3NJlzKnxiuS9qivOXRnGO+YhDnHNjxP/5rEvU56/+7MH/jtYwPj3zvj7kfj6qRj+L80K+xEkZg4xzLokjtRdH4r04p8LqpC9qivOXRnGOZXHOJXFO1SjKzApx5N6Lq2L+LM4r/grZN8PKOOeSOFJ7cSTei3Oq9pRetyswVRKb4nisA0RxCZPFNBKOGDokp/GI4+kO5vohzLmhXxOuavmzNy/4y5tcIRLOueSN1B9v4RFHoDuaJkqn4kRJbGrjsRFALuO/Ym9uoYhLvR7jveZJjxmKuG4MgzN6rdqqRD9rYx3f3Sxt0lFocy5pI4UrCz8ilJoZHbjG4d9jsDhNMtrUxmPdHy2qoM2pp/5OMZKNGLojBRKSjac71qf+RDVyzbHhXqVVgX6Wxiq+A5c0uUBIcy5JI/Un17yCS+0ka2zn5aqkPMEkSW5q47F+bdLm1FfSRgwdkvjQxtMjluUsvDn3xluV6WdvXsuXN6lj4M255I3U3huJ0VN5aCHbnKqrkuIE3shNbzw2IsjkgXRz6vGpfpFv5DbieHoEi+KceyOuyvSzOK/lH7+foQxwLokj9UecjBfqNwKjo8GbU3VRssSFN3LTG491hLgoccyXExDn3Bjx9Xhzqi44rCbJYXz6tMyUt7/ZMgFkWyafMpaVcYEL4hZ1XZh/ois1EybK1UwPfnq8LWx4W8f6pZpHlW+BSo+3haE7uhtRE+U638HS8y1gQ75aqxL9mG43r+PrRvG1ZOCSNbb2ejtdd2UlW2gkOWMjPRb1WS5J3Uq21dqU5q9N0pyq3297LTEq1VaAS5o88yHNm4nSHHsjrar8szTfCihpMkJINeeSNFIbaTzdOpK0QH3o7g2kkZvSeGxEkM4g05x66odpII3YThrPd7AozbE30qomP0tj4d6BS5rcVZDmXJJGaiONpztYkuZUZZokAqSRm9J4bEQI0gJlP0EIa+R21ni+o0Vrjr2xVoX52ZpX72VNVrqw5lyyRmpjjae7l8maU2VNLgnWyE1rPDYiBGuBss+CwBq5nTWe72jRmmNvrFXhfrbm1X1Z89X/zblkjRS6mT4J9BPaSeLYTg9HXVVIN3JTHI/1a9MqMlzI41f/Xhrm2By6JE97PNl4ekaT+6TKtoWhlfEHzboQqar8rMxL97pyWWIj0ZxLykj9USaXjqUIge5hMuZUXVSvk6+FDVKN3DTGYyOCXAeeak7Fem1x6JCWQzDm7cRUc+xNqlVVfvbmpXsNUVj2O5e8kfrjTdc0EEdiDKtEq0I7UDnV2NoUx2Md4ecu0yvMOVYdl1xCqpFDl+Q0xPH0jCZzAlKNGFp5k2pVj5+VedFeVy73JlLNuaSMFK5M8hW+eLr7lxLNqbokWRwh0chNXzw2IkhnoMspSxDYcmwkCMvrQH3pr75BGhvD0IwNep0fqwg/S2Ol3r2sEZLbEtKcS9JIbaTxdAdL0pyqS5KnLKSRm9J4bEQI0pyK0hxL0pz60j9fgDRi76Xd/2ZPBJDtiTwku0ta4IK0RV3Swp7IAsag6g5MTY4Be/w+ZYutvAXuU//M8z8jFmru1Jh/IqhjhhuzZsvQyuNTH8glcXFoppNEEu9elfkx8QCZQ/0tdjh0LjkkFfpXs2VoJCReor70CwoQyGAj8daxcY944iXqSz9KX9Pl4kJ3oIsX0MEsf2HLsZG/Kq0q87M0L9/rFpeFG6Q5l6SRCr2ENJ7uXiZpgfrSj7lDGrkpjcdGhCAtUF/+efKOELoDad5MlObYG2lVmJ+lefVe0mRxB2nOJWmk0MtYtYV2kje2M8Y+eiM3vfHYeG3wFih7swXJ5twYca5NAnWzuwBJx9YwPp0Zmm1Vm5/FeQFf4mStC3HOJXGk9uJIjGGV2wSPuUDFWZLcFMdjI0IQF6g4S5J7HepljKdHMPMPY84N/yquSvizOK/zS5x0FOKcS+JI7cWRGD0N4gIVxZGb4nhsRJD+VDEQ+nOL4tgaeiQXipmSp0ewKM65Mcgqrkr0sziv40uc1EsQ51wSR2ovjsToqYwHMs6puqpefnG7ZHFTnL82rSKditslKwJ6FN5vW+e7P5/6n77IOA/3RlyV6GdxrOM7cA2R1EwQ51wSR+qPOLnRsTQh0OHSI86p+ksM8YuliXOfiqEgcCypdKp+HkFuYTz1yKGPupWJJOT57uKnflIFKoldd8R6r0+Tryr2s0OW9R2xHIaqzrnkkNQfh2HL606i4yWJTn3pLQ2HxGbu8dgIIPcSJk2nLGfgy7GRM+uZ59TjV4tLaCOH0dmvUqpmP2tjYd+9rJCyY4XUcy5pI7XXRqLjJW1O3X90LwneyE1vPDYiBG9ORW+OJW9O2Vvn0Ebs0tZPAEm3z7/ZRAFkBbhmeHkLXPC2qK23RYxRlbmwnnWButtfQpa3xQ1v69iI4N4ClbwFLHgL1M3e0itxizuIq4r9mHCfXtZXwslQQpxzSRypvTgSY1glGsQ5VeLkuQNx5KY4HhsRgrhApTe9VwQZa86R63xHsxsAyjzcuAE046pqP4vz0r7EeT336VwSR2ovjkR3NMyUIVqcKRc3xYUIQZxTNuD1hFsB+nLHgC973liaKVdjGJ0eYtVWxfpZGyv6vq7SJt1EvjmXtJHaayPR8ZI2p/JESW5q47ERQfpTC5PQn6jNG0vanMoTJbn33qpkP3vzur68yYwEb84lb6T23kiMUQ3zpFN5niQ3vfHYiBC8BSrOk+Reh3olGk93MNOPadKxoV/zrSr2szcv68tbL3auC4Q355I3UntvJLqjKd+cSnXAuqipzV8aCrf1yr4MG2/Mkt7YGO8lz6kaQ3kvCvbIvd4Dqq3q9bM2L+orpJfgn84lbaT22kj0eCVtTkVtxKY2HhsBQrY5FbU5lrQ5lbWRw+j0jKbaqjY/a2MB372skF51fzqXtJHaayPR8ZI2p750CsBiktjUxmMjQNDmlH3UANlGDP0JG17rfAcz+0gzNtPYsK/aqjY/a2MB3y0+fvVXxTBJOpe0kdprI9HxkjanvvSioI3Y1MZjI0DQ5pR92ADaiO208XwHi9oce6OtavOzNhbwHbi0+WbJp3NJG6m9NhIdL2lzqq6qt4Wupwq8kZveeGxECN6cqgiyOoI4cuiRPPJrU3Kd7mDRG1tpbO/t8TebJYBss0R/g73SLXDB26K23hbRPQjeAlWjKqNf3hY3vK1jI4K8smqAQJUFWUeUt8Vlb+t0B0veAvbGW9Xnx3x7eBFfI9RPTK4lA5e8sbW9NxLd0eTNqZhv66qmN39tWEyuV/Z1VARJKHhjaxtvPN3NRG+OvfFWBfzZm1f5df2+mHw4l7yR2nsj0R1N3pyqq5KsQb6Rm954bESQVyLfnKpd3+CN3MYbT3ew6M2xN96qMj97Y/negWuEfDX5cC55I7X3RqLjJW9O3e13FeGN3PTGYyNC8Baoh94ZyDdy6JG+J1UPuHW+o0VxbKaxN+KqQj+L8zL+8as/wYgHnHNJHKm9OBLdgyTOqSyO3BTHYyNCEBeoKI7cJU4WLhDH8x0tinPsjbgqzs/iWMF34BLnK8qHc0kcqT/iZLzqne/QTPLGZuZFhS92r9amN3+tzYCYKR2rfsuaFRlHDj2S0/DG032lt/T7QIF7I67K87M41vAduTogdxYyzrkkjtRWHIEOl8QF6qF73ZgpyU1xPDYiyA0Eb4F66K4svJG7vMn9DHE839E+dYegKu+AvfFWZfrZm9fy5a3fYlhLSueSN1JbbwS6n8lboKI3ctMbj40IwVugojdyl7eQcDzf0aI3x954qzr97M2L+fImHUW+OZe8kfrjTR/lmClJdEeTOKfqBzrX52hYea/Gpjd/aaoEnKpfu3gNgHQjhv7IoCDbeLo7E6059sZaVelna17Kl7VQwDmXrJFCL2VOgTKe7l4mZU5FZY7d7Bt8/5mDigBMm95a1EgMHZQ5CRp5ujv4qbM7Jk1ir8Mk+5TPv9k4AWQbJ/636z+BC/4WhQuLHz5fRPcwKAxU3VVSXtZjbnEj7daxEcF9BcoSptIuYCNhruwvbYGyYri0LQyjM76Vod6qWj/m3dNL+hohmZhqtgxc8sbW/njTwqhSL7STvLGdHvvHr/4pNbyRm954rF8bpsv1yqaiN28seXPqpnMvvBHD6IylkHqrav3szUv6GiGZ6uDNueSN1N4biR6v5M2p7I3c9MZjI0LIN6eiN8eSN6eiN2IYnfHQVm9VrJ+9eUVfIyTLJ3hzLnkj9cdbWJ2EdpI3ttNjX1clNQryjdz0xmP92pRvTkVvjiVvTt3sg/JIOHIYns4N9Va1+tmbF/Q1QvLkhTfnkjdSe28kxqiKj/owXohWVyVZA29sbXrjsRFBXlnrkfXKpiqCrMvwgGNrr0O9nmw83c2YfghzbOhXb1XSn7153V/XLxut8OZc8kbqjzcZLjzeCHQ/U7o5VRcVliXkpjYeGxHkOqDNqU99+xHWHBvjveQ5VZcrawTYI/d6D6i2KujP2rzqf37on+pCm3M6jv86KFyYzLWQ5o0kaU7VJfWswhIutPap741XORCwNG160E/9rA08Ensd+SWQp8c9Y+/KQiA5NNM5ogKrZD8LDHX9h/9B7c/TuSSQ1EYgT4/+hcnSqRIoHCZL56JAx5LAROkPYMEgudehXwZ5unto9wEEEnu9D1RgVe9ngaHE//D/O/15OpcEksKF5YKORPcwJaFT5VDmPzgkN2dOHhsR5JWYOZ3KDzxyr0O9hPF0B7MJGMIcGxOweqty/eyNNX0HrhGSBzZmTueSN1J7byQ6XvLmVPoh0XVRU5u/NOWZUzbeSDPHxngveYH60B+IgD1yr/eAaPv6m/0TQLJ/UtpkSVDaAhe0LWqrbRFvtQWqrkqe/JVuixve1rERwdMtUM8P/VmHEre416GmsXW6g5n+EhawoV+9Vbl+TLcv1vQduK5fVgXw5lzyRmrvjUTHC+kWotWepNxN8MbWpjceGxGCN6eq37K2gjdyG2883cGiN8feeKty/eyNNX0HruuXxQC8OZe8kfrjTYarlpihGQ1W5Vyg6qd4XvfwYY3RpjUe6/6EWXK9sqn6abTXAJDGxi5pcjPXPuU6381U/S0c0o3tNPdGWxXrZ22s6EeLH/5Pfj9fziVtpLbaCHS4pM2pqI3Y1MZjI4DcPbUmCb2J2tgYuiNWYY2nR6xozbk31qpiP1sLZf2H3p5INueSNVJbawRGRyWzkWyB+tY/F0S2kZvaeGxECNqc+nyGD+etCN3aU0sl+AvNaU2PpHPsjb4q2c/6WNfP69ORgj7nkj5SW30EOlxKOqdi0hGb9nhsBAj2nKqfCfW5khi6ow9AWOP5ESxmnXNvtFWhftbGar4j1yNO5gVocy5pI7XVRqDDJW1ORW3EpjYeGwGCNqeiNmKXNnl0QRvPj2BRm3NvtFV5ftbGGr4jlzZZu0Gbc0kbqa02Ah0uaXMqaiM2tfHYCBC0ORW1EUN35FaGNZ4esaI1595Yqxr9bC0U8h/6RSJYcy5ZI7W1RmB0NDziAvXUHz3FI47c1MZjI0LQligtNLCiJLdLN54f0aI4596Iq/L8LI41fEeuh68suiHOuSSO1FYcgQ6X0i1QURy5KY7HRoQgLlFJHLlNwvH0CBa9Obf39v03GyaAbMMk/G1m4IK3Rf3xFt5IXcToqWdcoOr3Dl4XDZVwCxve1rERwL0Fqr7A/xqg8m1h6I+8S1nz5DrdsVLZHbA31qpGP2bbdyjkP/RvOivbApessTX0Up7hVXSHRkKuBeqzlumvQwpnDDad8ViPo5Y1Vb6tVzZlf4YNZ2zs6o3cNJDG891MlObYG2lVoZ+lhTL+I/zR6bdzSRqpjTSe7l4maU6l/eR1RdOZv/Sp3xSDNMduD32gwxq5nTWeH/2xH/essm2109wbbVWin7WFOv5j/Iz6tXeKXHMuaSOFfn6EX88OzSRxbGZ0Uz8mhmQjNsXx2HypFGQQ51htTskcCHHOjQHnxnKi9PtpsMfGMDo9HcuO8neV5mdtoX7/CP9zisbkAZi0kdpqI9CjmrQ59UzaiE1tPNYBYr45dnvoP4VCG7nXkV6+eLqjuX0Ic27YV29Vm5+9hQL+QzuAdHMueSO19UZgdLRvvGs4apMrBIve2Nj0xmMdIHpLmDw9oY0Y+qPv7+DhxvMdLXtz7o23Ks7P3kIF/6FfxYQ355I3UltvBEZHgzenojdi0xuPdYDozTEfcIhzbgz4SjunKnulX0g7cq/Zq/lW5fnZW6jhP8Jf1H47l7yRuu7P9Hgj0MOa5kmnqpr0N0zXRU1x/tq0mHTq+RG+qb8iXB16Xc0i37yZuJh0bNhXbVWcn7WFCv5DvzKIdHMuaSO11UbgvTanalBlCY5liXP2i4z12a6AJZPe2M1+bw4ZSG5jkqe7h9GkY29MVrl+Nhlq+g+tRWHSuWSSVOglajme7l6m9HOqPMraDx7JzfTjsREh1N9OPT71A0iQRu7qjtxJyD+e72jRmmN7az9/s28CSJaNNUTS0bIWuGBtUehm/FzXIrqjQVyg6qpkcV/iFjfErWMjgvSnyoJAVQRfqCwOPZIHWHlbpztY8hawN96qYj9m208o6z/CfzIGLnlja3tvJLqjyZtTn/VDEK+PG3gjN73x2IgQvDlVEeTtkEq4FeFKuNcLgLfQTHjzNGBvvFVpf/bm9X/dd7IiQL45p72sTzIvau/N20nenHp+6K/Dwxu56Y3H3ntzqiLIJh28kdt44+kOFvPNsTfeqlg/e2NF34Hr+mUihzfnkjdSe28kOl7y5lTtVfoDbl3V9OavDauS9cq+DhtwaPPGxoCzLAhUXa4keZUFi8PwdG9kfflTNfvZWyjsP8IfaqIxeQ4mb6T+eJMrr3VJaCZpYzM9qA/9LAGyjdi0xmPjpXf9PgGeb5GT+xXiyKFHchrzJE93uLrtW8llFsYC16Oj4qpoP4sLlf1H+FvNH+eSOFJbcQS6o0mcU1EcsSmOxzrAI4qLXJgoyaFHYWHC0x0uiwvcXlyV62dxrOlfIsvaDTOlc0kcqa04Ah0uiXMqiiM2xfFYB8jiIhfEkUOPJJOQcTzd4bK4wO3FVd1+FheK+w/9eADEOZfEkdqKI9AdTeKciuKITXE81gGyOOdqxMOSMnA94usZF6g4YwauW9MZs6r1s79Q0n+Ev0f9IcexwkKSx7a2CIzB/NBHfO0wr4YGlx5t3tzzQ/80tbZOUnNx1oztheQLXI/6chgouyPw1Atct6YOq3Y/OwwF/sf4TYfrCpGDzqUcJLW1SqBtpRx0KuYgMd5X8MdjHSDnYOSCP3LokS5XMXvyfMfLs2fgtuZ+/2YjBZAsIOuOlgdzmQtcMLeoq5+v5WstM9fp7mbwFqi7fRml1pmLG+LWsRGhB+i6DWuVGaiKIMvIWmUGrgbHH36Bu/3qz8ZU4gVuzEWSeL9V6x8TD5Drkx5Dn3NJH6mNPp4egyt3Sk2lIVRKu4VNex4gpt16bV/I41PHG/7YXuhPZd06PZq56w9JQ9tspneF1FcV72dfocL/CH/Z+Otc8kUK/UufZgjNpIRjMz0O6WMoq7FpzF+q0xvyzalPLfehy7GRHnzKJepDP+kEa2ztVb5aqx2As7WwTfAR/q/x17lkjdTWGoH2kaw59bA/88I0SW5q47ERQSYNaHPq86abfvBG7hppaQd5xvMdzfRDmGNDv3qryv3sLZT3H+E/Gn+d06dBLTYX9cebvtuA51toR99Kwgzp2OdNv3gGc+SmOR4bY2m/SAB3kZNHF9yR27nj+RHvphtRkEcO7XTVrNaqbD9bC7X9h/4bDJ5pzqVsI7W3RqK7eEvWHHvYX6LDGrlpjcc6xGe0FjgbbVgj9zraa4rk6Q73/NA/uYS0wHX6qruq3M/uQnn/Ef6m8de55I7UH3d9aVdHkXAEuqNppkyUflgS5shNczzWEbK5yIV8I4cu6aMScyXPd7ysLnA9PqquivazulDZf4Q/avx1LqkjtVVHoDua1CUqqSM31fFYR8jqIicLWyQdOXSpx3olHU93uGwucN2amqtS/Wwu1PMf4Z8af51L5kj9MZcecyS6p0mdU/HN8HVVU52/VnMFzzinasR7LC8zEEcOPRKvSDme7u7E5Yljb5YnVaifvYVq/mP8ouJ1/XjQOZe8kdp7I9EdTd6cKm8yk2G2JDe98diIID7gzany1oXV8kYOPZJNFXjj6Q4WvTm29fb78Rd7JhdkRbf+ntU/7olzb02hl3f/zF4D3U/XlqgaVHmH/j/iRT0/9J24/4ycp2CK+rjr2vm/R2uXyl4f/nPyTO3UVYnz/9V21gbT66z5+1EF+yn7LsgsavUPi6z+e/iTRVJ/sk/fHf632E7SyHY6WtaYuKTRuaTRqRp+mSqhMXCS3/+TqSiTrb3mt8qsOv4sk8X+HDbdYoBM55JMUldKrrvsullhkqc7WCgYElaDKsOFjPTmckY6l1Q65ZkEleReB38lJE93H6sZSVwkJDk00w8JdVil/dlhqP8/9Icm4NC55JAULizsjaVmUj6ymTkOaVol10/DGEH0/1fsTo20vY/XraFD8rBE0vEC5oVqCkNY4Pqi1FtV9WdvLP1fIsuTB96cS95IoZuyJY/c4+kOFnPPsRrU7ud1myP3Iiffm8bT0LmUe07l3COHPspDDip5uvv4WT989ToPQSW5q5keK5VYVf5ZYtgK+NBf/4ZE55JEUriymHwEuosp+ZzKD0NyM/l4bEQQ/0g+p3LykbuGOijj+Y5W7cgDFMoC11el4qrGP4sLGwEf/o9Kvx/OJXGk/ojz4i+1k8yxnR6P8JZCNzbF+Utv9uVqqIucDDkedOQudZLayDaeH5dqC2eoc+5NHVFF/lld2An40D+FQs45l9SR2uYcge5oMufU4zPNnOSmOh4bEfruvuZciHPqU/+RCN4cG+O91ilO1eWGdQq56y5YU6lmXNX4Z21hI+DD/wrr98O5pI3UPuNIjFGV2/zfa7gC9dQvkuGJR25647ERIaacc8+PpI4c+iQukHE83eHuMeOcG3eAqqsy/6wu7AV8+L8q/X44l9SRQjf78Xvdmliq8HR3My5VHLt/6NMe4iIn6YWlinNpqeLUp/6lDJKQGLooa1KY5OnuYl27GMfcSQ7N9NNTFN7+ZvMFkJXt/hdLv4ELCheFC0sLlQV0D8OkGahKDFmkl8PFjeRbxzqC1hc1aQaqPm++5rHrnitfC3sdaM6W63THut/0e1/lK3D7zLtVGX/MPECuTe6oetYFLmlja3+0hWVKaCd5Yzs9HuVNShd4Ize98Vi/Nnlz6v7QCBBHDj0Sr5Vo63QHK3HCQRybae6NuKrdz+JY4I8WP/RPjCDOuSSO1DbfCHS45M2pb70maCM2tfFYB0janPrW/yWCNWJXukm+QxvPd7Cszbk32qqCP2sLZf6H9gDanEvaSO3zjUT3NHlz6vmh/xsEceSmOB7rCEmcUxVBEgXmyKFH8uyGOJ7uYFmcc2/EVb1+FseiviNXB6T4hzjnkjhS23wj0OGSN6dql19mb3gjN73xWEdI3pyqCDITwxs5dEi/6gdxPN/Rsjjn3oirqv0sLpT2H/ovRhDnXBJHaiuOQHc0iXMqP+DITXE81hGSOKfyA47cThzPd7Qszrk34qpmP4sLhb0tYiHOuSSOFPp5C2/nhWaSODYzh0PSAQlHbHrjsX5p8ubUp04zyDfHxnCvdaVT9yrDX5enWJ6Quwanp10tBKpYP2tjRd/drIlSYkKbc0kbqW2+EehwSZtTdVFhoiQ3vfFYR0jenKp8k5IL4sihQ3Ia8yRPd7BKN6kmYcy54V+9VcF+9haq+g/9Hy54c04H8l8HtfXmzSRvTt3v+ns0yDdy0xuP9VAmb059h4J7BUB/0vPNm8nTpHNvvFV5fvbGGr67+bz5n5n93pxL3kihn3GaJNDhkjen0j7zuqapzV+atDnlMxvSjdzVH1lvIt94vrtj0y3SzbG9tvvf7JcA0sL7pn/4VukWuKBtUbt0W0D3M2gLVNK2sKFtHesAQVugPrX6KWsLQ3f6ccTH2jrdseIkGbg31qpEPybbPdTx9S7I6wMV1pxL1khtrRHojiZrTtUMIPd6TZLroqY2f23S5tT9qV+0gDdy6JBcQCXbOt3dyd7YTHNvvFWNfvYWCvmb/9/c79255I3U1huB7kDy5tTd3tuFN3LTG491hOTNqbv90je8kdvkG093sOzNuTfeqkQ/ewt1vC2HkG/OJW+ktt4IdEeTN6fiLElsauOxDpC0OXX71h9phTZy6I9sRSDdeLqDZW3OvdFWBfpZW6jib/43gb9355I2UlttBLqjSZtTURuxqY3HOkDS5lTWRg79kaU9tPF0B8vanHujrcrzs7ZQw9/0nwmRbc4lbaS22gh0R5M2p+rp5qXbuqjpzV+bvDlVAy6PL6Sbc2PA1+LEqftDK/haUq7WMDzb997uVZmfvbF874GsIZJdCXhzLnkjtfVGoMMlb07pZ7HxbCM1rfFYt5+sOaWfs4Uzp543/4XgxPk9AGuhvU5hqbvvVaSf5YVK/ub/8fiLxqRgSPJIbeUR6MFN8pyKcyWxaY/HOkCy59T9ob8uAn/kXrNkJRtPd7CszbmRuqqtavSztlDI3/QT9sg555I2UlttBLqjSZtTURuxqY3HOkDS5lRpk20saCO30cbTHSxrc+6NtqrRz9pCIX/TkYQ255I2Un+0hfe7QzsarT4kFKiapWRFh9mS8aY4HuuxTOKcqhHvx86VUBBHDj2SuhZrE57uYFmcc3txn3+zXwJIpr8aop56rw6UuMAFcYva5dsCuqPBW6A+69u7r9sB5W1xw9s61hGCt0BVBNlNL2+LuxJOrqDErfMdLe1zBeyNtyrTjwn3GWr5m/6EE7w5l7yR2noj0P1M3pyqm0lGFd7ITW881hGSN6cqgqxa4Y0cOhT2ldf5jhYTLnBvxFWdfhYXivmb/kUNxDmXxJHaiiPQHU3inHre9P/UII7cFMdjHSGJc6oi+ES5IuzEeTtZnHNvxFWlfhYXyvmb/wvW76dzSRyprTgCPaxJnFNpZbKuaXrzlyZvTt1vmlBIOOfGeHNdGSl5Hlc1sDAMTt8jsp78rEL9bC1U8zf9jwukm3PJGqmtNQLTmpS8tTAJ0W76SXikG1ub2nhsRpAh/K/x0sbuN//ScYdoLnnzoJW9EhXiAtcPTfVXFf3Zn5f9FbnbXOsT55I/Ult/BHo40oeYPx276+8iwh+x6Y/HZgQZSfhz7H7T7yUg75xL/gJ10785gj9yGJ++bVVcFetncaGiv/k/9Px+kuMY1bvc69hWE1/Ug/gIv3PZDTV300/HwZM3V2up7v91k9VnzROnPxUAd95c3bNhkRI4ubOxxAyUfVQM7gLXranCKtzPCkN1f9NPCWDudC7lHilIldK2vj4QGomZx1aG0e80dTpX+SNfh4JS525JqWPPm/4BDtKRHDrZT671/OPpvvq6KuHgktxrMyqxyvizxFDr3/RfciCR3MxDHtvmIYHuT85D5+LzLmB3/QU2SAtckuaYP7UgLXCdOctdoOwOhbvAdWuqsAr6s8JQ9dtNCoXOpTwktZVKoKVaP7GGCVhKRGK8r+CPx2aE8AwM2D2tPcmhRzJrYwLl6Y5WuSscxAVuK+7xN5srgGxzRXezSlzggrhF7cQtoDtq/SxxAat3r21zZWFD3Do2I8hL6wEYsM8v/d5ZJd7i0CNppsSt0x2tZkvZPStxgRtrIMm4R+0MHDMOkIuThxbEOZfEkdqKI9AdjeIcezzC167WVU1z/lqbQmDOscoV2cGBucB1rnDKDJQXIRD4tjUVWJX9WWAo/2/+x0u/D3Icqlp9rmNbXXxR64pPvdXQ4KKv0N5DPyxZ02ZoLzr05sqhvG0Jh4ELDgNldwQcBq5bU4e1W3B2GLYUbOsBSUhuOuSxrUMCw02qIFbjzaWVS8LuOtNDoYeNCh171h9Zv87RUBi4HvSVhk7VPCo3BBQ692YerVL/rDDsB9RfjL72AwqdS/MoqT9StRquIiK0EydSNtRS4xOQGG8sCOSxfmkU6Jg/uiDQuTHkS6BTd/0gBfwRw/iMzUJNviryz+a4E9D9rDtQFk0w51wyR2pvjkTHi+Yci+aITXM8NiPIogNPwIB96b4FzJFDl2RlgLULT3c0vwHgzLlxA6i5KvHP5sI+wE3/DArmnEvmSF331GviIuF4ursZtTkWtRGb2nhsRgjaHKuP0r5eL6wRQ3fkboY1nu5g2ZpzI5haq2L+bI0Vf0eufJMOwJpzyRqpfb6R6HhRnGNRHLEpjsdmhCAuYF+6wQtz5MKNCHM83dGyOefemKtS/mwu1Ps3/ewGzJHjGGGpyWN/PIlu5BeB7lZeajp3+9I3p2qnM7X31Hcf8ZgL7YUdloDldYo3N0Z9PeYCddO/tsKcGbgeOs2+qurPDkPpf9M/l4JD51L2kdpnH4nWWp9LkTILpXrgolZyvLegkMdGjKTQMa/RkH/OJYWBso5BYeC2Cp9/s9cCyEp2/eRbKQxcULioXWIuYI6uPFBKYMKSwMUNgevYDOETaMLSLtni0CW50ppA1+mO9rzpe1plLnF7c1XYH5PvGap/+38ImCPHMaoJdB3beuKLultxAl0NNRcn0MA9nro8rOwLXKoTAlajLgVSZV/ietQ5gSYqOvRBGbksE+izCvuzw1D93/x/tX7RmGRpyj5SW6sEhi3d0UX2BSxmHzneWRDIYzNEyD7H4vQZmhtDvgR6a347IAkD17eDCqyy/iww1P433RVGEjqXBJLaCiQwR1cmJQgMWHj/dmHTX3hpePytl/aF1HtEsjeCBPTmkj+n/G6AP+dGa+qvyvqzP9b+sx+jzesOgz/nkj9SW38EOlwqH0K0WufI9FbL0sVNgSlESEDHKmWkIIfAwHXKrAR0Kgt0bgy2Cqwa/ywwbATc9H++IJAchwpPQR7b6iLQuvJT0LnsK3H6Vw6YRAOXktCxcugfmAjNjVFfDmNrckcgCQPXd4Q6rIr/7DBsC9z8D7h+n86lJCQFq3L5VRqGRsae3zUYmEHZyDD/o58TRgY697zpv1DBqHP6afHaRAvUXW8P5CQbQw9ldxtLUp7ua69rEg4iyb02owar8j8bDNsDtQ583UdCFjqXDJLaGOTp7l8y6NQjGnQuG3QuGXQqGiSGHupHg6CQ57uLWSG59wqr8D8rDLsD9mEuKCQ3J1Iew2Wk38dcL+r+5ImUDTWXPiAYmqvhkYccss6bi9WEY/db+PXF0FyaR721urieIa8pBukXuKY0C6vwPysMuwM3nT+gkNxUyGNbhQRaTVboXFToWI2SbOVAoXMp7Zyq1sKTMHA95utJGKibfsgbBgPXrYnBr7/ZjQEkdd7TPn5XBgMX5tFF7ZwuoJ2m5WjAktKF8bYqfevYjCCJWg++hN01oevJtzj0SD9fUfPmOt/hYu4lbm+uyv5j7n2FvQH7iCLMOZfMkdqaI9AdjeYci+aITXM8NiL0EF2pAnGBuuuDH+LI7cTxfEcrcVJPVsqtdgbXV6UpV+X+WVzYE7BPS0EcOY5RFRDr2FYTX9SXGyfN1VBz9TlzWbzWcjNwNT/IBgDSzuOmB1/A6t0fCQt73lx48CXqpv+uBIdvW1OHVfKfHYZ9AfvUPxySmw55bOuQQLvJDp0rNzKYcBg5f/IFLjz5AlVR/cmXuE4cPvkSlT7ykrhuTRVW0X9WGHYGbuGfZb6cS/Mnqa1UAi01zp8Bi3lJjjcWcpDHZojw6AvYXRdCyEFyuxmU5ztc3QgSD9kXuL26qvXP6sKGwC38t8yXc0kdqa06At3RqM6xnI7kpjoeGyF6jNazL1B3/a4EzJHbmeP5jlZXGp59geur0qSr4v5sjjsAM7J+GB3zJjmOEZ59PIZe6QcPap9lne+2Hzp/1UZLwGr6kp0DzJoMx0tAhvFYh3je9O8OsEiJnKQGRJFDl2S/BItLnn4J1wau+wIZRu61GRVUpftZEOv7l5DyTIEg5/RLwlBGChf28S/6OUtII9HxvrV0hTTH0u8MBKz8hCedN6d3Ciw6VQeDRXKvw78ecTzdXayLkgcmLJJ7bUYtVhF/thgqfdtfgEVyvMfhjMf2zkh0h6Izx6Izx7Iz55Izp7IzcuilJD8yj6e7i9kZuddm1FmV7Wdnoba/6Z9HwJlzd/2GKDQS22sk0X0Mu5qrnabSF9cXxjsJs6UH0AILWeZU+knUhaE/Un9AmLcSvoCyKDQyNtfF1/ff7JwAsp0T/S3X8hU4/X5D6VrUVtciWkTQFSj7wfN6uC1s6FrHOkDQFaika2Hoj0yZpWud7lhB16IuXf2dUNVVpfwxvb5Tva9/8QFdztnvBMEXsb0vEt3F5Mupu37PFL6ITV881gGSL6eiL2Lojzww4YunO5aWfPUEW9TBV5XjZ1+hZrevhMOXc/orZNBF6o8uWULVOmQB3cFki80Myv41CbrITV081q9NupyKuohdI+0rx3UBHexTfzUJwmYzPalqftX+wdlX2mTQn32EL+f0Vz7gi9QfX2HhuIjuYRLGdpqK0yGx6YvH+qXJl1PRF7HLl683Qm/SfDhbGR+dUF9VcJ99har8pj/dBV/OpccXqb0vEj2cyZdT0Rex6YvHOkDy5VT0Rezy1ZnBNX0YleRrtjI+IqK+qsw++wq1+E3/0hC+nLNf0kOCEdsLI9HjmYQ5VR9TlwcIZkRy0xiPdYRkzKlojNhlLKw4eL6D+U+4Y0okd7WzPk+gyqriPitjWd4ha2yk8IMy5+wTfVBG7I+y8Awj0PGSsUDFZxi5aYzHOkIy5lQ0RuwaaekO1hw838HiM4wYmmnvKqyK67MwVuAdsYTJvhiEOffQT7VCGLE/wtJDjEQHTMacSiXYCjeF+UuTMKeiMGKXMBkWCOP57k2aFEldrfRMocKqsj4LY/ndEZ/38N8v386lRQepvS8SHS/5cqquShZpmBPJTWE81hGSMKeiMGLokP5KIITxfAd76sMdUyIx8a7GqgQ/G/M6vcZGFkRIMefs3VmkGLG9MhLdx6TMqbosee5DGbmpjMc6QlLmVFRG7FIm9wyU8XwHs//bhTJiaKa7IcZ+/mafA5Duc9zDX4cEzt6MLGML2xpbRHcxGAtUNLa4YWwd6wjBWKCSsYVdxuROLmPrfAdLxhZ2NbNbd/xUHX7MMUBuTB6wlWOB+9F3k2CMze2NkeguJmNOpbX9CjeF+UuTMKeiMGLXSPeKgWv7dQHdm/AYWxRa6WehZlgV2GdfrMI7YN3K/p7LT+BkhoAuUntdJDpe0uVUXZXEqylxxZu+/LXJl1PRF7HLl9zGSDCe7+6kp9jCrma6H2qsauyzMRbiI+Q9/FHIj3P6HV4YI/XHmPSwNqcW0OHSG9ABS98BX9gUxkuYESQ1aq9+vXRg6TcXFoce9VCvDPNo9atea867sHqIvbTSZZMKqyL7LIyVeF943czd5hUSU6JzuiCCMFJbYQQ6XBTmWF1VTybXVSHFyE1jPDZDBGOO2VDXG9ErAnokF4AU81bqw/a9dl/GyKGZFqrGqsQ+G2Md3v171g9Iv94kMOZcSjFSW2MEOlyaE5360XIDvohNXzw2AkimI8Gc0t+WgC1S6I1qgC6eH7H0LULkF7GrmV65qK4qsM+6WIV3yNIlqQ9dzoXt+kVtdYVm+n67bsf61MBqpi+q/pP29RaCLjY2dfFYvzS827xeOSgdaPhiY+iOXCZ08fRopf6d9/U64YscmumhVV1VX591sQjvkKWrb4E1HzqXdhN/iG19Eeh4Kb2cqquSAYMwclMYj40IIb8SpUMNY+TQIRkWGOPpDqZpCl+krkb6YlRYlddnYazBO2INjcz3yC/n0gOM1B9fYWcqtKMikGBsp6/qM3yIOGB18T0g191WHxgInFKYIz1ofXJf7hI4JIdO6s/qQSLP98XXVcmyGxoD19euMqvwPstkdf4SWR6nkOlckklqL5NEx0syA/WjP66N7HOuxk2mVdh0LtkM1E/4kNVq7bL5OjdCpjeTZQZuK/P3b/ZHAFm1rUuQkhm4IHNRW5mLeCszUGnPOGDPu+4UlsvABZeBqtb6SXXleWVm4lrCRZXSRKX8TFy3Jvn5W8X/MT8BmVL9kSYodS4pJbVXSuK9Uqdq3pP5qvIzXFVZkPkRTr295NQp/bEeGCWFPopwqOTp7mBdkjy9aqpN3F5l1f1nlWFz4K4fHoZK55JKUnuVJLqnYaoN0WJ2emM1bGIcJp1LJp3K2Rm4lrCy06n6noJwUEruujP6vOZlbQmcZfq+QfXAn5u/ziWZpPYySbyX6dSPfuYYaelYXbw/NgOXZHprNRlIa0hMcpvE5OnuYV1USMzA7V3WLsDZJbcKXiJL0YPEdC65JLV3SaLjpcQM1IdKgkznnnf9Wj0y07kkM1Af2hpkkkMv9SmNaZbnu4+e4cjJwO1t1i7B2Sa3EmZk/dsN2HQu2SS1t0mi4yWbTsVp1rGSKVUfZDqXZDr1E35SfzV2Jabc93DpzeTMDNzeZe0gnF1ym6HHtoZD1g9w6VxySWrvkkTHSy6dqquSmQqZGbkeEdaagQtvUQTqR78ohcRk0J1Mnu8u1sXLgxyJGbi+dH1k1vbCWSb3IF4ih0emc0kmqb1MEh0vyXSqxkOeXpAZOUkWZKZzSaZT3/o9HMgktpPJ893Fp/2OI2QGbi+zNhnOMsNOxF1/bR6Z6ZwObr2Lsai9TG8nyXQqzrKO1bCFWda55NIplwCZgWsJazEbqLtuKUFp4Lo1zc/aajgrDfsR9Y/Sr/sbUOpcUkpqr5RE37xJqVO1mS+PAOSnc2WhR2RNts4lp07VI+91KKCUGDopsfDg5OnuYV2TXDtcBq5be3H5+fFx3gn6A9m2gRbo/4icuRzUxuUguqfq6N8j5ekZsRo2eVD8Z+RMZaTqt3bktv7vwaGTcvp/xunuoWf5/2Zu77I2Iw55WS2mHQutr+DSueSS1N4lie5pcunUt35F8D/iRdWw6WMzcsllCip7PFBJDH2UpQ1U8nR3MKsM3F5lbS6cVXIHYkbWH0yGSueSSlJ7lSQ6XlIZqG/dpYNL5573pww/8tK55NKp+ua/TLGjMXRS7hu4DK3oUCEriaGVUSnp3Fp7C2eJYQPirr+/DInO6ZX966D2Er2dJDFQUaJzJVGeSZDo3Bi362n6X5Hy9zqQkd6a/YhOpO72ebeBHWTW1sJZZth/sE8qQaZzSSapvUwS7zPSqZLUc881/MjIyMmMB5nOpYx0yivM0dg1/CElvZm6eMls5GTguouambW3cJYZNiDu+puwkOlckklqL5PEe5lOPfWrN3AZsLv+ECxcOpdcOuUSkJiBawl/ipJM6ZdRYJSNYcT6LlSVtbNwVhm2H+7627JQ6VxSSWqvksR7lU7lvEyc/gotXDqXXDrlWzZwGbjgMlAxPQPXranT2mA4Ow27EPZ7eXDqXHJKau+UxHunTj0/9AdQkZ+Bu+tnEuDUueTUKV+Dwmng2sLKT6fq02UyNSNByWHMxgcD1GbtLZxthg0I+9lK2HQu2SS1t0nivc1Afakl2HTuedf3DGHTuWTTqTzbBi7YdKp+yVZKUtgkd7BZuwtnm2ELwn7sDTadSzZJ7W2SeG/TqfpooG7Oxqsqm7LkgE1vL9l0qqJKNiE3ycn4r6zk+e6j5zg8Bq7vCsnN299s/wCy7R/9SeCyGbhgc1Fbm4vonoYSJVDPm5Z8lZuJu6unshk4papECVRFlXuobC5uY3Od7z56jpfNxO1t1hbDMTdvYR/CfmsPNp1LNkntbZLoniabTqXNvHBR9d9HvmkQuFBvBsrfioRMvzgtn2rzIFD16/OvWxAwysauO2PvsvYYzi65EdFjW8MhO8tw6Zx/EX9ge5mhIan2a2c2hPNPz0asyv0ekWvmQ2aGoEIhM50Kn54dHDqpdzQ0ejs1ptJJeAxcX5XOs7VjcbYZtjXuurcMm85Fm8T2Nkn07ZNSM1D+8dl4WeHjs5FT6dAZo8qyBblJDr2UbINNnu4uZpuB29usvYazzbAhcdd/jIZN56JNYnubJLqryaZTcaJ1rKZG+ZYSctO5JNOpstA1/ZXpkBm4tsCVUKJihr5tTTO0dhvOTrkl0UNc/ZC7Dk6di06J7Z2S6IDJqVPhA7TxskqqTG2Q6u0lqU7pWzFQSgp9lFUv8pOnu4M1orKewmwbuL4z1GVtNpxdhh2Ju34EBi6diy6J7V2S6K4ml07F/HSsVEpGQaVzSaVTOT8D1xZWfjoVPkE7rg1DNr6fojZrm+Fsk3sRPbjPu/3oecV0LtoktrdJogMmm075R2jjVZVNyQLY9OaSTafCR2hHa5vU9GZyagaubwqVWbsMZ5nciuixLZmyykdqOhdlEtvLJNEBk8xA+Wdo42XVDmt4dob2euCubMJCKFD+GdrBXdkUZlpvx3McM23g+qpUZ202nHWGHYm7/jA5dDoXdRLb6yTxXqdTcaZ1rGxKjYXcdC7lplP+IdrRGPqoyy48Nr2ZnJuB28q8/81mECDbDNJfii+ZgUsyF7aVuYi3MgNVlqRcqN2gzPWQXFlXNgMXdoMCld7jXNjG5jrfXaz5Ti6+UjNxfemSmvfaZzimJiC32W1ewwGbzkWbxPY2SXRXw0wbwpVNeR7CprdWnMx9sOlcsumUf4x2NIZOarDKzRCsbMrSDDY93NhVUpu123C2GbYk7vqNHdh0LtoktrdJ4r1Np9JEG66qNrh9og1ckulB3ULVJ6G1YYFL2kTd9SPWcBqidjap09pzODsNGxN3fTMOTp2LTontnZJ479Sp8EHaeFkltYdkzbfeXpLqVK2TX7dY4ZQYOimJhwTl6e5h3Royu0Bm4PrKVWZtNpxlhh2Ju37OETKdizKJ7WWS6K6m6dapmKCOlUvZ/cBs61xy6VT8JO1qDZ2UvQrI9GY8zyEzcHuZtdtwlhm2JO72PwkV2bkok9heJon3Mp1KH6UNV1Uyw6PTm0synfrWoUBiEkMf9fvzkMnz3cMsM3B7mbUdcZbpexbPu/2LQl2hc1Emsb1MEt3VlJmBSp/DDJdVbydKxYzU9PaSTafSh2lXY5dNuXVgMzSjizhkJrGrmZ5OdIKtbYazxrAXYT8LhgnWuaiR2F4jifcaAxU1OlcaZdKDRudCrRmoKhKlNWSlt5aWQE7ZW42wSexgs3YZzjbDVsTd/nqhYjoXbRLb2yTx3qZTZannn2tNg+okcrIegU3nUlI6FWtNYtf4y6YTkpLnu4s10cnFw2PgmtLcrG2Gs82wF1H/b/S6ekNuOhdtEtvbJNFdTVOsU+kDteGqSrpMepDpzSWZTrkFpGbg2sKqTgIVPlC7GsOIbefZz7/ZBQJk+wb67wjlMnDJ5cK2Lhfx1mWgYmZGLnyiNnBBZqBq1SLbNyUzcS4zUSlBE9etSYJ+1l7DMUEBuVSpiyDVuSiV2F4qifdSnYofqQ2XVR/bk8ddZWjgklSP6h+ChVRy6GXYDVrnu49xSZu4vc7aZjjrDHsR9e1Qm28/nYs6ie11kuiuhvk2hUufqQ1c/Ext4JJOv7Y44YbW9MleD9FAxc/ULk5uDs3O2mg46wy7EfVpT9fpXNRJbK+TxHudTsUP1X46Fz9UG7ik01uLH6pdrYkAPjnX+e5jzk6PN24L1VlbDWedYT+i3tdxnc5FncT2Okl0V1N2OhU/VfsZuPSp2sAlnaG19Kna1dpOZ2gnPjsDt59sa7PhrDPsSNTyzXU6F3US2+sk8V6nU2ln79OxqhTlZsSj07lQdwbK35zEo9NbG0m1UtSp9LHa1RhGbP9hks/abDjL5I5Ej+2zLtdlOqefpqrv5CLktaz647Lvs6uH/zaADpcyk800dbdP5FXVucI1Vxcvq1G49PaSS6e+09KWGPooSww8L3m6r+n3KZdUNefCLof7CqW2GM4OuQ/RIWsYZPCxmHUuOSS1dUigwyWHTsV0dKyuXSplKHTuRy++PkESMRkJpCNbk9Fficjz3cW6qrZ0cbAYuI6mz8raZji7DHsRn/YnBxXZOR0O5COprUsC3dHk0qkaDrn3kY+J09/7h0znokzHnp/6e/SwSe6y+Tp1ISN5uvuYZQZuL7P2Ic4yw2bFp/1Ce12hc0kmqa1MAt3RJNOpmJiO1eDLgwEunYsuHavmZF6ES3IblzzdXcwuA7d1+fibbSBAumPwqU+RmmQDp7+mXom5qJ3LBXRHdfDr2yeBig/KwNWwyeiXzMBpF2uSDVR6UC7sUinVW+XlOt9dTE/KhaGZRzcjs+ujNieOCQnIJcrTBhKdSxJJbSUS6B4miU6lhAzXVA7l2uHQm0sJGbFOkesJV/m4MBl9PinX+e5i5bU/KRPX0dRl7WCcXYZtjk/9eiJcOpdcktq6JNAdTS6dKkn+pAwXVcPWN/c1vJDp7UWZjlVzUtTAJjn0Uio2ZCRPdx+zzMDtZdZ+wllm2HT4HN+zv8YDMp1LMkltZRLojiaZTsXEdKxGzZ+U4dqjy9iczNVwSW7jkqe7i9ll4PYuazPh7DLsOHzqB3vh0jldG+FJSWrrkkB3VAcfT0qnnp/6sYxawmZOUgWJ6e2lJ6VTFVVuDbgkh05K2iIvebq7WP+WIVyVI4Ebuww6ydZmw9ml70hUB+RmhEvnkktSW5cEuqPJpVN51eNcXXzf3GuSdS65dMo+FACVxC6VcuPAJc93F7NL5964rE2Hs0vfmajhkAUEXDqXXJLauiTQHU0unaqLklsbeRk5WWcgL51LLp1yCZDp3JCw1kBO/WgXkJ3EMGJ9F2pa1pbCWWXYd/jUL1FBpXNJJamtSgLvVToVH5eOlXFZIsGkc7facHkt71GNOPf81K8gwSW5KzFfm0Fe8vToY1WjrxwskntvsfYSzhbDhsOn/eB+hXTuph8uw5OS2FYjgdFFeRbhSelUzsjIyYQHj86ljHSqosrVwSI5dFKCwSJPdxfxR9pu0bmR2JqStZlwlhl2HD71u1NISeeiTGJbmQS6p2l6dSo/Kp2r4e9Jaj0qnUsynYqPSmLoo148ZPJ8dzHLdG4v8/k3mz2AbJ/A/j6h9tidSzIXtpO5gO6pjkdlZqBiZmZOZs7KzMAFmYFyC5WZgRsW+KwMVHpWLuxK854GJDOftddxzExALtPXsIGLMtncViaB9zKdSk/LcFHlXCY0uPTm4tMycPFpubhLwOv8Wam5To8+pqfl4g4ea0Ph7DHsOnzq317WDPt0TncS6mm5qK3G0EzfiNf9jJx0Kudk4vTfQ+DRuZSTTpVFyXDkJDl0UhbVsMjTbbFSWyqCWvMEbqS25mRtKJxdhl2HT13TwKVzySWprUsC3dE0vzoVH5bhomr0Q056e8mlU+lr0iso+iimodJbySqde6Oy9h3OKn1z4vk59umvTIFK55JKUluVBN6rdCqnZeL031iQls4llU65BKSlc0PCelQ69avfWkJyEsOI9YpNs7K2E84qw57Dp34tFSqdSypJbVUSeK/SqfigdKxuQ5mwYdK5W32X9fUJV2Vl4Ko9WTXAJdtDL8MUy9Ojj/UFvddwsEjuvcXaQjhb5D5Dh6wr7ztjJaRzX7pNiwclsa1GAh0vTa5O5YxMXHpQOpcy0qn8oCSHTsrNgNmVp7uLldjBonMjsTUlayfhLJPbDR25ZMojGinpXJRJbCuTQMdLMp3KT0rn8pPSuSTTqfikJIY+ykf64ZKnu4fZpXNvXNZ+wtll2HT41C8Vw6Vz0SWxrUsC3dPk0qmcmIlLj0rnkkun3AKmV+eGhfWodCo+KoldWd7PBk3M2k84ywybDp/hz4WezkWZxLYyCbyX6VR8WDqWH5bO5Yelc/lhSe4S8PoQRGry9OhjfFiSe+/x62+2egDZ7oAusyopA5c8LuyPRy1P/y02FLJytdNDkb7aHrDnp/4vUq16Ahc+mx6o9NX2haGPsq4oi+t0X7r/2kEteRaHZsZHRiQbv2pn45iNgMyifikcFp3TTeZa8ixqL9HbSRKdut/CLzWteD1iZVGWIbDo7SWLTsUvjKzW0Et98wgevZ3skdzBY202nD36jkSNRM/UXLt+OXfT9RhEEtuLJNFDn0Q6FbPRsZyNziWPTsVsJIY+ypIUFnl6dND+xQ/ZSO6y2MsmzcbaPzhbDJsMn/oheGSjc/q+KSSS2kskMfoo90xt1a12msrZ6K3lbHQuWXQqZyM59LKHnyuccPE5GWcz49NwqrE2Dc4aubPQA1YDIRM+NJL7P//v/17XC2k8tpdGolt/VBn8uiiANufqh3zlo3L1CYHMSUWOSdTbS9qcSj+QthpDN31Xbp3uPmZrjIZmxlaKWqtNgrM17iR0zLLmFeMXuWmNx/bWSHTr2ZpzOdmcy8nmXLLmVE42chttPN2dzNrIHbTVrsBZW9g6+NT/VECyOaf75kg/Un9ESlZhFUpgdDFMmU7FOj+0VhZlFkPueXuhNgxUqvMXhj7q55jw5PNg6dt0C0MzPQSaerUbcHYYtgw+9Ycz4NC55JDU1iGB9w6dSiVhuKbnp/5vHBR6cz93mflq+zRi8hZJlfcLQx9HDbAeex6trkomdaxeAtc3vbqsbYCzS+4V9OBWZFmTw6VzySWprUsCHS6tQ52KLh2ra+97+xpduHQuunSsmpOlJmSSu2S+PsiRjzzdXcwuA7d3WVsBZ5fcL3iJ3G1e4wGXziWXpLYuCXS45NKp+FWBcFE1bPI8h0xvL8p0rJqTBIZMchuZPN19zDID1wMvifn9Nxs2gKzUD3/RFbggc1E7mQvojgaZgYoPysDVsMm8WDIDFx6UgfrVP5QolQu7VIrqSsx1vrsY/8RgcWinZxOVWNsBx4z85p5Bh3x+fsuivjIycPoPsLXaWdRWoodLEp3KEp2Lq511Wd3JJNFbS6ud1Rj6qJ/Mg0RvJq12FnY1s+ZodVibAWeH3DHo7pVDeTbDoXPJIamtQwIdLjl0Kj0hwzVVHsr9hzz05tKkGjHJaiQiW0Mf9SMScMjz3cUaUVlz1GoncftJtXYEzi65bfASuXOcT8hv55JLUluXBDpcculUdOlYuZRrh0vnokvHqjlf7azmXjOJK9d1uruYXYZwe5e1T3B2yc2El8jSAeSlc8klqa1LAh0uuXQqrnbCRdXo+2oncFFmChtWO6u5jczUTErMwO1l1u7BWSa3GHp06zbqNldiOpdkktrKJNDhkkyn8oPSuZIp8yIy07n0oHQqrnaIoY9pkuX57mJe7ZB7vSX0SVmbDGeJvhNREuWmRkY6F/bDF3Vd2L/IvVB7OwvoHiaJHqwuSlaHta+6WuM+IYT5a5Mwpx5PfZcGj0Vy6JCsH/BU5Onujv3BMh6KxN77qo2Cs6+wm/CpC2v4ci58vWpRW1+hGXl81T74aqaHIftia9MXj/Vrky+nsi9yryO9nnw83cGiL2Jopbur+VWbAWdfYcfgU7/1A1/O3TQNUU4Q2woj0D1MCebU81P/pw0JRm4K47ERQRK9NtnWK5t6PMNv0S9uI8yDRWHE0Mq4z9VYVfxnY2Fb4FO/0QxjzkVjxLbGCPRIJWNOlTFZf8MYuWmMx0aEYMypx1P7jSmR3MYYT3ewaIzYe2M/f7PtAsi2XcKfYQXuod+cqhxb2M7YArqLwVigYo4tbhhbx0YENxaomGOLu8Z6FdacFNfpDpaMLexqZTsr/lSxf8wxQG7M64DARWNsbmuMQHcxGXMq5ti6qmnMXxseY+uVfR0xxxa3MebBojFiB2NV2p+Npfr/R+7JmhV/nAuL/UXhyj7+JXwUbRE9UsmYRytjsnqtWXG1No35a5Mxp6qAlwg1K64I6JHcyLVQXKe7O3WhsqKtleLi0EzP7vIc+6nC/GwsVO+f+v9KMOZc2Ixe1B9jIr5W9gvoHiZhIdhX+NhZaK3Gy8uzwCWJHvX2pTcvJJJDJ321v053F/1egMTZTDtWiVWQnyWGqv0z/FXVj3Phw4OL2kr0ZpJEp+Jyf4Xr8Xp+6hqwSrbAJYkeNZYAqzV0sh9T62nnzcS5kxhaGV89UYlViZ8lslx/GYfObm6U/DiXJJLaSiTQ4ZJEp0qOjBemzsjJDAeJziWJTj2e+g4ZMpHcRiJPdxejRGIHiVWenyWyhu+QNV4yD2I6de6u781jkUkMlyaPE8ymPN3RkkOnakISN3BIbj7+eGxEkN5UGbde2ZRPefDF1tAd/e1MPP94vtt5ar2JmZPYJWytVDXpqjw/+2INPyJ+hv+5+XEuLjGJ4cryioVEB0zKnKrbqB8S11wAZeSmMh4bEYIypx76KRgYI3YNtXweCsZ4voO5eSgjd5nvy1FnVaGfnbGM75g1OHJtyDHnUum9sL2z0JBMgbW9tdp5uazgjK1NZzzWr03TolPRGbHLmVwAnPF8B8vOyF3Ouh11VjX62RkL+Y5ZzmSlBmfOpZ+wWNgfZ30/XYmBmTG1s2aKi4Iyp/LM6FxeZzqXNAYqrjPJXR5fLx4aebqHNGskdzXT61XR+Ps3eyiAtCJ/hP81Cdz4UPA1/PV0W9TO4gK6i2GyDFS0GLjnQ//Fo9YogQsWA+XDXzPo4q7hl2d4aVznRx+/dEOtZtDFoZ29xSrmj8n4y4q/Q9ZA+EozcOHdnEX9sRiq9EV0vKQxXFV65q3Wxvy5jo0IMinUMiVQaf5c2GVMmoExv1A3D2Pkrnb6+aSJV3sHZ2W+wVDK5CFU8+evczddaCHziO2dkRgjKuFqAl3tNBXXKYubzkIEGWw4cyo6I3aNtTxX4Izn+0KzM3JoZ/z4mTqr2v3sjAV+xyxnsu6GM+fu+mlwOCO2d0aiA6Y8cypPl+SmMx4bEYIzp3ywMTWSuwY7TI0839Hu+tEH5Jlj41s4aq4q9rM5lvUduMxJR2HOOV2HQhypP+KkmVqsLKDDJW9spqlahMisXTVBaK0uXkYXjzlvLz3mnIp70as1dFLuceSfN5NK8YWhlbGroRKrYj9LZFk/xuuhf4ECic4liaS2Egl0uCTRqftdf6AGEp0rif0MuZZQkOhckuhURZXpHAlJbiORp7uLUSKxg8Sq4s8SWep3yBoHmd8h0bkkkdRWIoEOlyQ6VZkon72ExMA9wm/kBy5J9Nbi+3irtY1EbyZKJHaQWHX9WSKL/x7V50N/3B8SnUsSSW0lEuhwSaJTdVFhOo2c5A4y0bkk0amSKI8EZCK5jUSe7i5GicQOEqvQP0vkbkCHrPGSmR4SndPvuuKZSGorkUCHSxKdymsZ52oa6SpqTafOJYlO5fUNuUui3Fp4KPL86GMs/chdGtdGgD4Uq84/W+RmQIcsi3L/waJzmhuwSOqPxVT6keh4SaNTuYwgN5ekPDYiSH9QRjgVywhi10jLmgnGeL6DuXksScld5jtJXpXdPv5iz+WCbM9l/Gnide/+o/57xfdmQhnRGC5NevhvsRUX1o28jEP387qm/xittbD0Wr0B/2u88iWCXO9/D+4aaTn/P+P8aEd/LO9/B4Zmel5QX1XRn1Ls9sGyvyNWivX26fLlXCjVuzlc2Yd/WLaBjpeMebT0bmxqrVKxR+SfM2XikkWPmt6N7dYui2uGu4JBojcTHneNoZXxY7JqsWr8s0VuBPSolkVZgCPrnIsWiW0tEuh4yaJTZUcWI8i7yEl+/mfkkkVvLb0d21E3Fr2ZaJHYwWJV/WeLYWvgoTvRsOicUv86qK3E0IzI+ffRTKtOhXy6qFTIJy5J9GtLhXy3dg2/p6I3EyUSu1rpek1TsbYFzhJ97+D5GB+2WBOqc0kiqa1EAq0nZaJTqZC/fTiXCvnEJYneWirku7WNxNCMfkUJD0ViB4lV758lclOgR7UkynMFmehckkhqK5FAh0sSnUqFfLqoehhIwY/p1NtLEp1KhXy3tpHozcRMJHaQWPX+WSI3BXpUS6IUNpDoXJJIaiuRQIdLEp0qOXJReCZGTqZnSHQuSXQqFfLd2kaiNxMlEjtIrHr/LJGbAj2qJVHGARKd8098NvVHopeATXS8ZNGjPW+64QmLgXvoz1HDonP6vT1UGU7dH7+yTkKVQW5jkae7i8+7fvwXE2rgulbVZ2NV/WeZ3BoYkR/65XrIdO6mv2eHFQ6xvU0SHTDZdCrbDFy06Vyy6VS2SQ69lMIM1QZPdxef9x+5KWAzcHubtSNwtsltgxH5oW8FwqZzvlHaFLp5T5WjN5NcOhW+xN7R+trtg3TIS28tmXTKPkWJtCSGHspaAiJ5ui/pftMv1EKkc9s3EG+3v9mzAWR7NvrxuhIZuPAx0Ma2aRka+v7qm/FaIlfpETD8vfzrKr9m2cA96+ArVzYDF56VgXp8+aZ3au3zQ3e6ymtoL/wFU8LqQdedlfn2VpsMxwwF5GK7vmEtsjhufNXkuo7tLXrr0aJj2aJz2aJzyaJT2aJzZbGHnZs6azg6O6NFb+75GO8oqMXaPThb5BZDh642ZQJBejqnJQu8ktp7JdHxwkS72mmqrsoXsovjvYVEDBEk/Wu5E6jHtxZ+Na8u7ppXgzqP9rjr901qYn1pZywx1VltFpydcUfhZXR82Xpz7pakEbu6GB6OqR2JhgmVzbxclawVMKGSm854rF+b0i5Qv99yJXBG7urQ60yNOZOnO9j9QzdRoIwcmhlPBlVWWwNnZdw/6Jh1Q8ttiTRzLj4FiV09lIdRvXURmklZxlb6ou71r5uvAwZj5KYxHuvXJmNOVbflrQkYI7cxxtMdrJqR5SqMkXttRoXVNsBZGPcKXkLK2ECYc1EYMVyZtAJfPN3RbvpFa6SYY1kYuSmMx0YIuf8wLTpVIy0PdQgj9zrS64HG0x3s+QjLzU0zKqxK/rMw7gu8hAwPMufun2FL5kYOPUxvNi2gA6YcYzNN3VOKOVYDJg88PNycu9v/fsOjc9VemCrJXR5ltDBX8vy4fPtzamQeObTTl60iq+g/iww7Aw/9sy5knnO17fQ6eWFJQmzrkUB3MXl0Knp0rMZd8gwencsencseyaGXMr9CI093HyuczEPQSA7N9Fiqxqr2zxrDlsDD/+zqdnNOl2GwSGprkUD3MFl0Klp0LGejc9mic9kiOfRS922hkee7k1kjObTTSa8aq9Y/awwbAg//n6vbzbnwDbPGth5DO92DVbw7FT06lrPRuezRueyR3OVRlmfwyPMnj+SkHRF5/5t9GEBWruuTqKbVwOlvaVY+LmrncQHdxZCPgUoeA1bj3vPTdVvUrBq46DFw0ePi0EuZxEvjOt19jOm4uEtj382qscr7Yz7e0x6A/kkUNAZOFszQSGqrkUB3MWl0Kmp0LGt0Lmt0Lmskh15KQQqNPN19zBrJXRq7HdVYOwJnjb5t8Hz4f1zd7s6lNysWtvUY2ukbkdPqamaMhE4RVQ8GrC6+V30rHT1o9uhc9kjuEvC60oNHnh5XnxY5i3u9HVRjVf9njdwi6JA1EjKwyEbnwl9cNbbVGNqRaFUmhmgxHb2xrNG5rNG5rJEceil3DTTydI9pTkdyaKYnZ9VYWwJnjdw36JA1Ep3h1w0Njc6lZyOprUUCHS5Nqk5Fi47Vtfd4rGR0Llt0Llskh17KkwUWebr7mC2Se21GLdZ+wtli2nTwP0u63Z176M884dlIbKuRQHcxaXQqanQsa3Qua3QuaySHXspUAo083X3MGsmhma4rVWPtEpw1ciuhQ9ZIyB2GZHQubOMsamsxNCPjgCnVqWjRsbr2Ho+VjM5li85li+TQS1kXwyJP95Bmi+TQzPhWkmqsXYKzRm4ldMwaCrk2aHROK18kI6mtRgIdLiWjU1GjY1mjc1mjc1kjOfRS7hpo5OnuY9ZI7tLYT1jVWLsEZ43cSuiYz4c+9KAxcPq+NjwS++NR3wGprfBFdMAkku0MSn8kGCtVx+rqZZsThaNz4d2MQFVrPb5XdtfmeOLkgQybHvNLvxJfW3ILw4j1kkRd1k7B2SW3E3rQ6vplsoPLwCWXxPYuSXTA5NIpLSagMlAP/SsHqHQuqXTqJ7wvFRp76A+SQKW35jcGXAaubwxR+vk3uzqAbFdHP+1SShMXlC5sq3QRb5UG6q7r6XIasBo32b4up4ELTgPlFio9E9cWriQup4l6+E8uRK5bU6e1hXBM00/uM/QQVz/kcQCngUtOie2dkuiAIU1TuPrUy2sZDqne2vOhfwcFqc4lqU7dv8IbWas19FI/Xgad3k5dlTwJKkUTt9dZOw5nnb4tUZHlqQGdgUs6ie11kniv06m6y4LOxOmHLqDTuaTTqRqMfqzxERpa05oWUmNrQWrg9lJrX+EslZsPPcbVj27z6gekBi5JJbaXSqIDphx1ynYVkaKO1dWHede55NSph34GF9OuYxVU6jpIjZxMf8jUwLUAnXhrm+EslXsRPcZ1hZISkBq4JJXYXiqJDpikBurbf+0mXtZDf4sDmRra64G77tz6BEGgajBCpnprKVMDZSspSA1cX5tKrU2Hs1TuTPQYPx86epAauCSV2F4qiQ6YpDr1oz9vjkx1rK5eluxw6lzKVKfqYSqphVQlh05KMGQoT3cP/daAzMDtZdbew1kmNyhmZP0+AmQGLskktpdJogMmmU6Vpe7qlVOwGbkw7zqXbDqlnzSBS1Lo49jTua4JMnm+e1jXHp6hgeseambWDsRZJrcpXiLLAwEyA5dkEtvLJNEBk0ynakAkSSAzcvK0QGo6l2Q6VTklGqAzcK1hSXXKfuMDCUoMQzY+Aas2a6fibNO3M54P/SA0bAYu2SS2t0nivU2nss3EhR97CJevi2Y8PGNrsuaHzcAFm05p/QCZpA4yaw/iLDNsVDz0xxUgM3BJJrG9TBLvZTqVZSZOv8uI1HQuyXTqqT9iApfE0MnxrYyVkzzfXawEkXsCHgPX94Sk5uNvNokA2SaRaiqbiVOs9nAXtrW5iO5qmGgDFW1GTn+YvmwGLtgMlGsonYlrDZQaqB+tGMrpwjBk4yGsNmuT4pibj7SToT+ID5uBSzaJ7W2SeG/TqWwzcVouwqZz4bEZKF+Kwqa3FqqUQNnfd8MmGzvYrF2Hs82wNfHwX4O/PQKXbBLb2yTx3qZTz6f+unktgtJlPf3X5BKXbIaothaFzcCF3HTq/hPeYVmtHXTWfsNZZ9qU8N8Tvz0Cl3QS2+sk8V6nUw/9NilsOlbWpQBEbjqXbDpVrfkOQmgt5aa3Vonoj8/VGoasV+M609Y+w1lm2ozw3z6+PQKXZBLbyyTxXqZTUaZjNfxebIarr1pBPrRca9rMeYWyOHRzFBXrkenXVfGCSHLvRdYew1lk2ojw3z++PQKXRBLbiyTxXqRTZcgrzXRZT/3lX6Slt5fS0qlvXT5gjnXsRz+gWtsHAau3EaSIxzPTmxtJrtlZew1nqWlDQr+Yj3VQ4JJUYnupJN5LdepZXzW3t8nSZT11PoNUby9JdSpuH4TWhoaVoqm1JDVw/RxWqbXZcJbKHYke4xo9eQJBauCSVGJ7qSQ6oIarj3+FcHHK9cbq6uWJB6fOJadO5edn4l7vNyRqoGyDCYkauL3T2nM4O+XGRA9xjUq3ed11cBq45JTY3imJDpicOhWdOlZXHx6jzmkf8RB1yqdLzL6BkxGD00TpCgtOE7fuEM3T2n84O02bFLopAqeBS06J7Z2SeO80UN8qCwtd50qqPHmRqM4lqU59PvWdTUh1zqobWHWs7pGwQApc3yNi9fk3G0WAdKPoqR+qLauJC1YXtrW6iLdWA/V86sqyrGZOHr1lNXDBaqJ+9CvZZXVx6KW+F1U61/nuY9SZuL3O2oI4JumT+xQj8jP8RmHm5KFbG3+L2/v0iGHmXe30dd100ww6vbEauKDTuaTTqbqJ5NkMnYlbcyVXSIFKH95cGEZsL7M2Ks4yfTejrr/b5FP0Gbkgk9xeJomhSdqppVGKJ3MVXHpb5VJGH6npXHLpVPr0Zmjsof91jgT11vzOqKdo5NadofNtbVecnfqeRkWWtQXm28iJCyQoub1TEu+dOpU+vrnCdWMlVS4fUr25JNUp14AETdzSsBI0Ufq5QEhN3GpNpdaWxFkq9y3GqNSPJq42V6JGLkglt5dKoiOmWdepstU7ZNd1IVUTp/tBsOpcsupU/Pzmag291NFCkno7dXfI1cNn4tbYq8/alDj7TDsX+v4ekjRx45e+rvFFkpLb+yTx3qdT2Wfiwgc413WNqPJ4qQImUM+n/l4csjREldZgNVHJauK2VmtX4mw1bV3oL8zBauKSVXJ7qyTG+Eq243HqVPoEZ8BqvydMvd5cSlKn0ic4U9Cn/kwVrHpzdY/Iwx65mrit1dqXOFtNmxf6JSNYTVyySm5vlcR7q4FKH+FM15U+whm4pNWj5lxN3PKwnqiJ0u/MwGriVms6A9fOxNlq2r7Qn3+D1cQlq+T2Vkm8t+pU+gxnuqz0Gc7AJakeNH6Gc7WGTur+M5LU2/GbAzoTt9VZWxJnnWnfYvy+4logJS7pJLfXSeK9TqfqEwzy0MICKXJh7nUu+XQqfIpzxbxsSizY9FbKpnCwmbidza+/2TMCZHtG+ouBlZyRCzYXt7W5iLc2AxU/j5I5WVjWcjdwwWagfJlay6PILQ+ccgOVPsa5MAzZmBdlrv2qnY1jcgIynfrLjdCZuKST3F4nifc6nco6Exc+xxmuX2uhWu0G6ln/qPEqCjpDVJk4KkkDFd73XtTBZu1anG2mrQ3dw4TNxCWb5PY2Sby36VS2mbjwQc5w/clmaE3fs4BMYuikvqEMjTzfXfSboubayK1bR5Oz9iHOOtNmhX4ZEjoTl3SS2+sk0X0NWwspXvrIfOTCJzkDl3T6tbkH+Ezc8rDmWqfSJzlXY9fN0RudqrO2Ic46015F+KXTr8QlneT2Okm81+lUzs7EhY9yhutPj87QWtpZCK2FjzAEKn2Uc2EHnbX/cNaZNil0LYfsTFzSSW6vk8R7nU7V5wjkA161ro3XFT7LGbikM0XVFSmyM3GenU7Fz3Ku1i6fvf7V9Kydh7PPtD0RfsH2K3HJJ7m9TxLvfTqVPrgQLyt8mDNwSacHrclWPucFnYlznU7FD3Ou1jBkvVmmNmvH4WwzbUvodx+RnYlLNsntbZJ4b9OpaNOx+GnOcPnx05yZCytbxr0SSsoiLIZ4vjsZP825uPcma7PhbDLtSOivwcJk4pJJcnuTJLqTaRXkVPw4Z7yu8HHOwKXE9Kjp45yhsR/9oUro9NaqfpU0x9o2cSvNNT9r0+FsNe1MhB+2/Upcskpub5XEe6tO1UeFJFHw9IxcLxCvdSb2EZxLVp3K+wiJWx7W2jZRyWriVmti9ftvdocA2XaCfoy4cjVyweritlYX8dZqoNKsG7CSL+9klNTABamBis/QyC0NlBqp8N5Z5FZrKrU2Mo6p+p12O/QnuyA1cUkqub1UEu+lOhWlOhY/0RkuP0lNrWlu1cIotBbKlkjpMqvm38htpdaGxVlq2tXQJwSkJi5JJbeXSuK91EClj3TG6wof6QxcsupR40c6Q2vpI0YBq+lc5hFo9bDjJtFcrR2Ls1bf1njWpLNulWs2gdbEJa3k9lpJvNfqVI2IF6X5uuTxixnY20taA5U+07laQy/151ZqmbTOdx+zT4/3xmdtgJx9pl2S0eby6ZzuzNRnUb5J/bEpW9b1a5wL6I6GlW+ivvWzibVGWtz4X6p1bESQ66iN+EDpih9z7OyO3OOwxtMd6v6pUxyy0LkxwpqFtTNxtubbF5WFvT2xrDmXrJHaWiPQHU3WAhWtkZvWeGxECNacStZIoTvSCKzxdIfK1px7Y602IM7WfJeirEkxhLnTuWSN1NYage5oshaoaI3ctMZjI4IMOHLNqfgJg8WhQyHbQjMx25x74622G87efE+ivPknML+dS95Ibb0RGKPae1VXatcHu0KwetzL6GOOZGvTG4+NCPJKeHMqeyO3yTee7mA535x74632C87e0qZC+Mnwb+fC35ouauvNm6kfFXxdGUGcY3fdl4A3YtMbj/VQ1i/cvUaAOMfq4SBrITzeyKFHsgTCRMnTI1rdAK/h8Hgjh2b6tD7Xai/gbCxtGOhXNDBDOpeMkfpjTD+3h+UIie5i+lfogD0+9K12OPPmauB9zyZwaXEZW5MbChrJbTTydPexLqo9XRMKNJJ7bUY0/vzNLg0g26UJvyK9ON7jtYRcx7bSFtEdStICFqUFLkoLXJAWqGrNpS0O3ZQ7pHJvne4+RmmLe21GpdWewjH3ftLGg377onIvcOlfoBd23U7/Io+Xyr0FdBfD8iRR9kG0Sr3F8VaqGm4dGxHkOmq2jNT41NOVH5Vmi0OHJH1gLA6fLO4qzRb33lgV7mdjqboPP+z941z6L8WF4co+/kV/fRjKQkNya9cDLlFRGVubynjsvbJEJWXk0CMxD2U83cGe+pCAMWJoZezUa5JVbX5Wlgp4/SwKksw5/S0HzJWkritLOUage5hyLFBRGLkpjMdGBBlp5FiikjByMtRXDsIYz3e0mhZDkpFDO/0moxqruvxsLBXv+vUlGHPuph92gDJiuLKcZCS6j8lZoKIzctMZj40IwVmikjNyl7PwKOP5jhazjNjVTBdX6qyq8rOzVLrrj5/CmXP1ftrrAhfOiP1xplMEJkYS3cfkLFDRGbnpjMdGhODMqc8P/SY9nmXk0COZwZFmPN3Bap9C1GJmJIdm+mpUWRXkZ2WpatdvlUGZczd9Aw3KiO2Vkeg+JmWBisrITWU8NiL0IF1TGqZGp7Iycq9jvWZGnu5gWRk5NPPmYVbF+NlZqtj1J93hLHAyZ0MZqb0yEt3HpCxQURm5qYzHRoSgzCmb0ZBkxNAh2ZtFkvF0xypjEg1Jlrg1R2muVS1+9saC/SWyXCG8OXfXb5NDHLG9OBIdMIkLVBRHborjsRFBhhK55lTONXLokTwPYI6nO5j5hzhiaGX0V5VV3X1WxuJ8hLSfhIEy5+JSn9heGYkOOLpwzTpY6gcqKiM3lfHYiBCUOZWVkbsGW/a64IznO1p0RgzNjLcPxdnv3+yCALJdkO9e2VyDWM4Cp99eqyxb1B9lKqMWIYvoLj708xvlLGD1qwWS/VVRL244W8c6RNgDCVR0trhrsMV9OVvnO1pc7S8O7fT4qrO/2QT5TVW8/pYMnDmXliEL20vzhqI0x7I0clMaj/UwJmlOZWnkLmly20Aaz3e0LI0c2ulmVFrV3sfJ8ZcF+gypf1QDac6FTyQsau/M24nOHMvOyE1nPNZdSs6cys7IXc5k6QVnPN/RsjNyaKffMFBnVXyfnbFCnyH1b0LgzLmHvqmC2ZHYXhqJDhilOZalkZvSeKxDJGlOZWnkLmk9rXHFv7rc0bK02U7vW6q0Kr/P0lijz5Dhv49+Ayd3HZyR+uMslNWL6Hj63MMDje00Ve/OSlWLBxq5qYzH+rVJmVN3fbLWgn8FuIytJfoS5q386scXatn40sr4sTwVVrX3WRgL9O5eDU3fBGsJ4tyPvicJY8T2xkh0wGTMqWyM3DTGYyOCLB1qpb+utKlojI2hQ3LHYF7k6W4lGiN2tbJ/llXpfTbG+rxD1tBIBzEvOmf/hg1jxPbGSHTAZMypbIzcNMZjI4J0CMacisaIoUNemoVWorHZyvjEluZYld5nY6k+15+FgzHn9D15CCO1F0ZiDKfcupgUncrCyE1hPDYiBGFORWHE0KExna1Zkec7WDRGDM2M34dSY1Vzn42xMO+QNTbygIKxwAkFY6T2xkh0vJRiTtVVyXMfjzFy0xiPjQjBWKA+9XNMeI6RQ49k1xezIk93sGiMmIhXY1Vxn42xLO+QNTaS/jDmXHyOEdsrI9EBkzKnsjJyUxmPjQhBWaCiMnLokcwGUMbTHSwqI3a1snuQ3T/+Yvfjgmz3w/+/LXHhQdbYTlkT3UdXlqikrLlW1sdGBFMWqaCsOfRIbuX/+ezTHSwoawytbJ9k94+qtk9ZdkGurOu8f64WE+dPsqb2xrgF0F1MxpzKxshNYzw2IgRjgYrGyKFH/ijrHne0qGw2s32U3T+q2D4rY0XeIZ9P/RO4f9TdFDh7lDW1V+btJGVO1VXJtPQf46qmMn+tV2R9pd3v+ntYUfvfIwJ6ZI+y1Ew0xmsS8a+PsvtHVdpnYyzH+8prbKwkuxqTZAyPssb2yjxgUuZUVkZuKuOx7lJSFqiojBx6JPcM5kWe7mBRGbGrlf2jrGryszIv3Gts5GZDkjkXH2XE9spIdB+TMqeyMnJTGY+NCNKh/4odylnG1tCj8Cjj6Q4WlRFDK28eZVVtn5WxJO+QNTZ9G6xHmXPpUUZqb4xEx0vGnMrGyE1jPDYiBGOBiklGDj1KjzKe72hRGTE08+ZRVuX2WRlr8g5ZgyMPKWRZ4IT610HtlXk7SZlTdVVWlfVVTWX+2jQvOmV/q4YnGTF0KDzJeLpHLwojJt71SVbV9lkYS/IOWUMj6Q9hgQvCSO2Fkeh4SZhT9d0HeUMYaw9yUxiPjQghx5z60W8fQBgxdEjfssCDjOc7mHn/34G9eldhVWyfhbEiHxG/9DOKEBa4IIzUXhiJjpeEOVXC5A6HMHJTGI+NCB/6GUU8yJyrGLK4gDNy6JMUPlDG0y/h5I6HM3KiXqVVuX2Wxpq8Y9alh/Wic3G9SGxvjUQHTNacyvMiuWmNx0aEkGZOWX5AGbFrrPVNlz7dseK8+NJKrxPE2O1vdj4Aycq9jEkHK80Cl4wtbGtsEd3HYCxQdVk+MS5uGFvHRgTpUGVZoNLEuLDLWI/1P3eEUzMmvpLstZklXo1VsX3MsRsr8u5eDY1cGYw5F40R2xsj0QGTMafqsnxmXJc1jflrb2lmXK/tK6kYPjMuLqfZOt3NVDifGRcn7tVaFdxna6zKO2ZdujyoYM25VJYtbG/NG0rWnIoz44o3rflrw4pxvXJ0XO/WmhkXhg6JinqYrdPdSpoZF4ZW9lXZrertszEW5R2yjMliGsaci8aI7Y2R6IDJmFN1WWFmJDeN8diIEGZGp+LMSEzGes2MPN/B4sxI7FW85liV22djrMlHxC/9bTkYcy4aI7Y3RqIDJmNOlbEwM5KbxnhsRIgzo3MVI8yM5C5p6zm0nPH0SzhJRzzOyIl7tVYV99kay/KO+fzSX56GNefC7sei9tK8nSTNqTwxkpvSeKx7lCZGpyw/MDESQ4fC5sc638HizDib2W9+3KrkPhtjXd4hy5hUIDDmXDJGam+MRMdLxpzKEyO5aYzHRoQwMToVJ0Zi6NAY6pVkPN/BTDxyjJiI1xyryvxsLJTvX/odTRhzLhkjtTdGoruYjDmVJ0Zy0xiPjQhxYnQuT4zk0CcpWLH+4OmXcGFiJCfuVVrV3GdpLMw7ZqWZzOmQ5px/UripvTRvR6P9e4z2qV+8rw2QcFF18TKw/xk5/VIjijW/tPtDV+yYLMmhk/o7hNDI8y9DKpmO3AtcUyqzyvGzTNbsL5FD1eZckklqL5NEx0syndKv5MOlU+VSahe4dC65dKqW9z261zQJl+TQR10PwCXPdw/rqqQduAxcU+Ly/jd7JoBsz0R/bbESM3DB5aK2LhfRPQ0uA1V9f13ilcyA1bAJVzIDF2QGyv44olwuDH2UWKVyne4ORpWJ26usTYVjWt5956F+A0eqKah0LqkktVdJonuaVDoVVTpWFy/rMKh0TvOk5thAVWtSpsClt6afZYBSp8JfUDT2emNoVtZOw1mlb0fU9fvj8u6cUvWW3KL2Kr2dpNKpuip5DiItI9c39zUrwqVzyaVT+uF9mCSFPsqjCAp5uu9VvyFqgk1cX7iqrHL/rJJ7Ai+R5QqRlc4llaT2Kkl0vKTSqZiVjtWw+dMyXHwyGVsLWRm4lsDSI8Ssa5M9LSh925oqrc2As1LuGPQQV2R5FECpc0kpqb1SEh0vKQ1U+F3CdFX1O1nymEB2hvbEAmZap9JvFTa3yU9vJssMXF+Uyqx9grNMbib04NZwyIMHMp1LMkntZZLoeEmmUzE/HauLl4yCS+dSfjrlEjDXBq4lrPx06ld/cxXpSQwjNh746rJ2EM4uuc3QY1vDER6bziWXpPYuSXS85DJQ+s1mPDUdq4uXpytcOpdcBkq/mQuVxNBH/dtpPDd5vntYFyWyYTFwTanL2lg4u+Tuw0vk8Nx0LrkktXdJouMll07VeMgDETIjJw8nyHQuyXSqosoDBzYD1xZWYgbqS/8ZFE4D162p09plODsNWxFf+i+cmGudS05J7Z2SeO/Uqbv+ZiaUOla/5hnmWueSUqfuuvUEo8TQxx78pZKnu4N+Y0Bl4Lo1VVmbDGeVYSfiy//Bsr6YZvsLSSWpvUoS3dOUnk499RuBUBmwL/2/RmSnc0mlU/alNqgktlHJ093BrDJwW5Wff7MFBMi2gPzvDu+BCyoXtVW5iO5pUBmotAIKWGWlPCZKZeCCykC5hHKZuJbA7EzUl/8HzKE1yc7P2ow4ZicgVyqPn5poA5eUsrW9UhLvlQbKtusqPcNVlVN53MFpaE8sVIWSqG/9gTs4ZWvopW4i1lJone8+1lVJ3VRzbeL6qtRm7UucbabNC/2VANh0LtkktbdJonuaEtSpp37NEDID9qV/HAaZzqUEdeqpfwoOl8TQR11DwyXPdw/LpSzj4DJwe5e10XB2GXYjvvwvt+6fziWXpPYuSXRPk0unHg/9gDJkOvf8Gp9NumY+yHQuyXRKv0EHl6R2ecnz3cPsMnB7l7XPcHYZNiO+/C+Z7p/OJZek9i5JdE+TS6fC3xykiyqVPSBLpTeXVDp117saLomhj7rGRl7yfPcwuwxcX7rOsbXDcHbJbYgZ2f/Yp/5Aw56sySWpvUsSHS+5DFTYcA8XVS5lOkNahuZ62C7jeGAGKrynubCdS28muwxcX5S6rH2Gs8uwGfGlP7eA56VzySWpvUsS710Gyko+zLHOlcyw+nEuJaZTbgGZGbi2sFa0Tt0+9Te58dwkJ/eG2qwdhrPNsA3xpZ/kgU3nkk1Se5sk3tsM1FPfYYRN555f+scqSE3nks1EaS9hk9w1/q/vm2Oa5enuYl2UbGVAY+D6plCZtcdwlhk2Ir70Xzog0zntZr2xuai9TG8nTbNOxVrTsRo236Fdl9XDm1ym1nRrFS4D1xJWZgYqKg1ct6ZKa6/hrDRsSHzpsx1KnUtKSe2VkhijK1v89dGuEK3+pUs45Ke3Vk7D/oFz4SMkqTX9cBGUsjF0Ut+uQX7yfHcxfoYkcVuZj7/ZCwJkGwf6Pw8lM3A6uJWfi9rKXET3NORnoEqSbGeUzMz5ozNwIUET9dAPb5XNxaGXPfzMzHW6u1hPYN83SFy3Jpn5qM2KY2YCMpn6tIZM55JMUnuZJLqnSaZTtccmi1XITJz+l0Q9OQOXZKbW9JEHmYFrC8tpoKLTwHVr6rQ2G85Ow47El/5DBJw6l5yS2jsl8d5poD60mIRT5+pfZGRWhlPnktNAfWjNBqfk0Et9MtV0u853H32NXMuhxO1t1nbD2WbYk/jyP3KozwdbJiebpPY2SXRPU4Y6lZZD4aJKZg/IlSyQ6c0lmU7VtCCtQWbghIJSp6rWEg5KyWHI9p8+eNR+w1lm2JT40vfUkZrOJZmk9jJJvJcZqHp4vtYESE3nyqZMy7DpXLLpVAWVCgM2AyeWYDNQX/qD/rAZuG5Np9vadzg7DZsTX/rhDTh1Ljkl9cdpX9qVKv8Wm0n5yWaG+KjUueeXfggESp1LSp2qG0QWYVAaOOkplDp1q+Zeb0soJYchG9+5UJm14XCWyV2JHrcaD/+o18O5JJPUPkFJdLxkM1DRpnN19ZJSsOlcsulUfKcztKbPddhMrem9AZuB63tDndbuw9lp2KL40t8gR4I6l5yS2jsl8d6pU+VKdgow6UauR2Q9Qp1LTgP1o59QQYaSQy+1HoBNnu8+5vVQ4Pra1WZtPJxtht2JL/0AB2w6l2yS2tsk0T1NGerUp30yDzadK+sypyFDnUs2naqo8uCGTXLoZQ//KlV4urvoiY7UDFy3pjJrg+IsM+1i6O8qQ6ZzSSapvUwS3dMkM1D2GINM50pm2EtwLskMlD2KIZMceqmfQkZq8nz3MdsM3Nbm8292hgDZZoK+3182EyeP2NoZWtTW5iK6p8FmoH7GKuFKgpIZsOeXfm6gMjNwQWagPn/0O3MlM3Dh2RmoWKosDkM2EkRS81lbDsfUBOQyZS0Bmc7d9CewYJPY3iaJ9zadSt/HXeG6sdoelacrbHpzYc82UFUWSqLDJlu7xl/WvZWa6/y8Kv3t3ZpoE7dPzdq6ONvk/sZLZBkP2HQu2iS2t0miA6bcdCrs2YaLKpn+0Axckukx4xdyV2voo7iGS2+m5gvZp4LLwO1d1l7D2SU3JHpoK3K3ec1ocOlcdEls75JEB0wunUpbQuGqSqaMLzLTm0synUpfyF2NoY+6Pw+Z3kyWGbgeeJ1ma6vhLDPsR3yFH8N9OhdlEtvLJPFeplNRpmP1dSB5lkOmc+mh6VRZkDzHNBu4tsBVbaDSV3IXJreGyqxNhrNM7kT02FYH5DmAzHQuyiS2l0miA6bMdKosyeSPJVDkZGRh07lk0yn9gC5ckrqGX64Jmcnz3UO/JzDNBq6vXGXWHsNZZtiI+Ao/oft0LsoktpdJoruaZDoVM9Oxci65BJfOJZdOuQXYDFxbWJkZqG/9TTc4DVy3pk5rp+HsNGxHfOuHWJGgzkWnxPZOSbx3Gqj0vdxwWVXayfvEkBra64G7NNSH+AL1NA2Q6q2lGsUp/5YvpJKThFedtddw1hk2JL71p+ag07mok9heJ4n3Op2KKepY2ZQKCzadSynqVLYZOLk3MO06lb6ZuzCM2Phom8qsrYazzLAf8a2/6QeZzkWZxPYySbyXGSh9dwfPTsdKpjzPINO5JDNQ+q4MMpMY+qhvq8Iiz3cP656Qi0JOBq7vCZH59TdbQYB09+A7/M5y4JLMhW1lLqK7Gh6egSpL8lQsm5mThVzZDFywGajS4Nu0iWsNfHom6lt/WrekJq5bU6m1c3HM0C9ub/QYVz9kVCpDAxelsrm9VBIdMEl1Kn05N1xVvWXh023gktMUNCglhj5qlVsZGoLVkMoNCZlsp0diPINVZm05nGWGfYnv8OuxX85FmcT2Mkl0F5JMp9LXc8NVlUyZ2ZCg3lyS6VT6eu5qbCczNBNlBm6fmbXlcJYZ9iW+dZ8DmelclElsL5PEe5lOpYVQuKqSKckEmd5ckumUp1Q9PENrI6XWbJta0x9/RYIGbu+0NjDOTsMux3f4EdMv56JTYnunJN47DZTt3+ER6lxJ9X2+wCWp3totfUN3tYZe6g/bYb71dvxRDJ2B2+usvYezzrBB8a0TIFLUuaiT2F4nifc6nUpf0Q1XVd848o2+wCWbKag0hgwlhj7q5/wgk+e7h8/vlJuB28usTYezzLAz8a1vL0Gmc1Emsb1MEt1VvXfqGw0hXPyObuDKprx3gQk3RO2B4z5CoMJ3dBe1y0yPlWUGrq9JV0K12XCWyR2JHtuK3G1e/YRM56JMYnuZJDpgkulUvV38+uk3zLOOlUu5erh0TvtYe0KBSl/SXRj6qF9vQmZ6sCwzcH3pKrP2JM4yfeOiIstaAjKdizKJ7WWSeC8zUGEHPlxVyZRyADJDcz1uKzEDFb6luxrbyfRmsszA9UWpzNpyOMsM+xLf+sYvZDoXZRLbyyTxXmagaq701HSubIYlkHMpNZ1yDXhqBq41rHWtU/Fruqs1uTlE5/ffbAoBsk0h/VBM6Qxc0rmwrc5FvNWZqPQ93cDVh3Bl2VLJGbigM1LjMzuXqNK5OPRSZoKaadfp7mLdFXKP1YI2cX1XqM3abTgm53fYkvjWJTdsOhdtEtvbJNFdDY/NEC7VnAErmb6BELgk0y+tygppDTID1xaYm4mKTt+2pk5r0+HsNOxMfOv7+XDqXHRKbO+UxHungUrf1A2XVVJlYkaGenvhsyWBeurDB07ZGDqp9TkylOe7i/XeqSy2kaGB63tDbdZ2w9lm2JP4Hu/SXPcbbDoXbRLb2yTRXU0Z6lRZkm3kWtmGyypOpjbY9PZSigYqfVV3tXbpFE3Q6e3EHYTE7XXWdsNZZ9iTsCyATueiTmJ7nSTe63QqvqcSLqu+zRMen95e0umUP/eQnYFrDWvGDZS9Q4McDVy3pjla2w5nqWFv4lsrA0h1LkoltpdK4r3UQKVv64bLKqmSNcjR0F4P3KWhqs9EpW/rLg691Ic2ctSj+VIZOgPXV6U6a+PhrDPsTtgnOaDTuaiT2F4nifc6nYqLIsfKZo/I5Qk2nUsp6lReFAVOYsKpU1VzCQen5DBk42GnNmvn4WwzbE9832U9AZvORZvE9jZJvLcZqHoyWv0ZLqt0Sg0Bnam919aQnE7lGTdwogk6A/Wtn0+DzsB1ayq1diDOUsM2xbf+KQSkOhelEvsjta/tSpb6wm5qRybI2rpNVHTKcH2H1HeOZFsQTp1LKerU0yzgKRo46SmcOhW/sLs4DFnftiqzdijOMn0bozoga0TIdC7KJLbPUBI9/mmJG6ho07my6Z9JSJcv448MDa3Z+8+wGThpDTYDZfcGMjRw3ZpI/fmbfSJAtk+kH3MsqYFLUhe2lbqIt1IDVbKkyK+6JXM9JHyKBi6kaKLSN3YXh17qsrp0rvPdx7gmSlxfu+qsHYhjjv6EbYpv/eIidDoXdRLb6yTRXQ05GsLFr+wGrrT7UzRwSadfW/zK7moNvdT9POj0dmpxJVdV2Zm4vc7agjjrDPsU3/qxVeh0LuokttdJ4r3OQKUv7YbLKp3yxKgHaOCSzhRVH8c15a7W0EsdLOj0drLOwO111lbFWWfazwh/iPPj3E1/uaa+57mwvc7QkK+HVjstPX1rN2C1ueabCoFLNv3SPn/1I8iw6Zy+4wqnTsWKZXEYslH661xbew9nm2GD4ls/hozkdC7JJLWXSaI1panWqcev1pV4cpIb/3y8jo0Ifcdz5yBQlVMyHcIcI6BH0gyU8XQH82Ywq5JDM71zqcZqe+FsLOxBfOuHXWDMuWSM1N4Yie5iMuZUNkZuGuOxEUGGuharoT96n8IX27p8SZkDYTzfsbIwcmhnW3L81N7BWRg3GDrk81t/dAPCnEvCSO2Fkeh4SZhTWRi5KYzHRoQgzKma4kQJlJG7lL1uI8AYT3cwbwYpRg7N7FOstgfOxsIewrd+6h/GnEvGSO2NkeguJmNOZWPkpjEeGxGCMafSlEgK/ZEZE754ukNlX+TQzD7Daovg7Mv3ESrD+h64Jn34cq4+8P16x2FJQmwvjET38Vu3FmuPZjXU2OeHXhceY97c50N/uAxLTOfSosSph33dH3nn3OeH+oZQ5371c7nIP8eej7FNps+62gU4iw1bBd/6OxoQS463PCzy2N4iidYTLTqWLQYuWnQuWXQqW3SuLEp5AovORYuOPR9j0haLv3+zPQPItmf014rLYuDu+mmfEruwrdhFtNgwnybqOW7Ya9ao7Fwcb67KxHWsI+gbzbVkCVT9jYHMS5WJgQvlQaD8R2UqEReH8RlLJFVXGwLHBPxNuwbh3xUDF9Wxub06Ej2wSV2gojpyUx2PdYSkzqkabHnaQR05Gezr5qm0W+c7mt8CkMZ2mhu3gKqrov6sLlT+3/r1NWSdc1Edsb06Et2FpC5QUR25qY7HOkJS55QPOdQ5N4Z8CXSqfhO21ysXB4HkMD69plBzVeKfzfk+wPM7/A/mr3PRHLG9ORI9rsmcU3VZvp29Lmua89cmc05lc84lc06VOXkywhy59+aqgj+bY5nfA1lDJAtt5JxzN/3UHJ50xPbmSHTAZM6puiy5h/GkIzfN8diIIB3Ck86p+slPr/UWhx7JrhtmS2/moStSGCN2Ges7UJOtavizMhb63b8aG5noocy5qIzYXhmJDpiUOVWXJUsHKCM3lfHYiBCUOVW/pSsdxzRJbqOMpztYVEbsoKyK+LMyVvodssZGEhvKnIvKiO2VkeiASZlTz+/wBZx1WVOZvzbUBOuVfR2lrO//61kEZWxto4ynu5mojNhBWdXxZ2Us9jtkjY1MAFDmXFRG7I8yubnrMxSpHX/PIFBVd7/uByDHGG0K47HuUHqgOVXCpNsQRm4jjKc72FMX4ZgWiV2tdBSdFqtQPwsL1fy3/vsihDmXtlQWdl3avwRh3k5KsUDFxSO5aYzHehCTMafqL8vkemHMubQEccqrCJgjdw1PPzbVXBXnZ3Ohgv/W72rCnHPRHLGtOQI9rslcoKI5ctMcj3WEZM6pbM65ZM6pbI7c25z7/PiLfZILsn0S/+/XxN31Q4b/+tkYLu3Dc66BHlc3F6lgrrk218c6gptLVJmzlUji3Fyi7vVNtddZ/X9lePrZ8Jpynx9Vl59S7oJcnEwa/6iQXuRHccS24gj0sCZxTn3e9Hb6j3FVU5y/Nolzqn7zXR6g/z0ioEMyLP8zTnd33D+MebjhX8VVPX4Wx6K9I9eyRDoAcc5FccS24gh0vCQuUDHjyE1xPNYRkjinfMQhzrkx4v/cIknUp36kAvrYGEZnzFcqrsrxszjW7N3NEidJDnHORXHEtuIIdLwkzqm6Kiva+qqmOH9tEudUFudcEudU/bK1FFIwR+4yt1uefH5UWX42x9q9R7LGSGLCnHPRHLGtOQIdL5kLVEw5ctMcj3WEZM4p341CypFDh/qxtHKNpzuY3wBQ5ty4ATTlqjg/i2MF35Gf3/6fyZ8fzkVxxLbiCHS8JM6px69+VhQPOXJTHI91hCTOKR9xiHNujPjy51T9PLVMXPBHDsOzK+U+P6pEP4tjHd/dLHHd5nVpyDjnojhiW3EEOl4S51RdVW+cX1cFceSmOB7rCEmcU1mcc0mcU7XWkXkL4shheMa32zXlqlY/m2NB3/2sMZJJAeaci+aIbc0R6HjJnFN1VbILBXPkpjke6wjJnFPZnHPJXKBu+r4yzJE7mKta/WyOBX33s8ZIlr4w51w0R2xrjkDHS+acqquS5S7MkZvmeKwjJHNOPW0DD5MlORnrNU3yfEfzOwDOnBt3gOZc1epncyzoO3KNkUzQMOecdRRFOLGtOQIdL5lzKq8syU1zPNYRkjmnfC0Ic+TQIXmIoJbj6Q5W4sI06dxe3O1vdk8AWRGuH7YocYFL4ha2E7eA7mkQF6i6nWQ8KuUWN8StYx1BX/lf45VN1V96yXRc4lZrV8q9boeUuHV6NJPEBe6NuKrYjxl3C2X9t753CHHORXHEtuIIdE+TOKee3/o1KYgjN8XxWEdI4pxK/yvUEdAheYRAXGgminPujbiq1c/iWNB3N2uIZAkHcc5FccS24gh0vCTOqboqWTRBHLkpjsc6QhLnlM9xyDjnxojzURco30SrR93iMDzdHXnG3apUP4tjPd/drCGSKQPinIviiP0Rp99F+LfcUHfhGol/j1TNlXI/wRzjTXM81l1K5pzK5pxL5pyKJcG6XoxPPzLVXFXsZ3OhrP/Wt6dgzrlojtg25Qj0sKaUc6ruJ19Xrqua4vy1SZxTWZxzSZxTP/r/vsg4Yhidzg71VpX62RvL+R7HGiFfVd6ci96Ibb0R6HjJm1P3+rzH69oACUdueuOxjpC8OZW9OZe8OZU2mtflYnTGL+SpuKrUz+JYznc3S5xs6SLhnIviiG3FEeh4SZxTNVP2LcrNk3VVU5y/NolzKotzLokLVCrB1/ViePYzZRXqZ3Gs5nsgS5wsvCHOuSiO2FYcgY6XxDlV4sJMSW6K47GOkMQ5lcU5l8QFyoYHUyW59+KqWj+LCyX9t35DGuIC17fMlQFVfy9q682bSd6citvMK9z05q/9GbPSdaWo4xyrELL6waqS3OtQX82gHODpvkt+9Dd8IYzY1UqPm86RVaafjYVa/vun27wuDcYCJxSMkdoaI9A9TMacysbITWM81hHsu8Ew5tjjV3+MBcbIbYzx9IwmExWMEXtv7P43eyWAbK9Er7yMBS5tTy5sp2wB3cWgLFHpTbjFDWXrWEcIk2Og/MP8ZWxx6JAUKpVj63QHu3/qD7uUssCNOVZS7V71+THVALk4uUKIcy6KI7YVR6B7msQ5FTe51lVNcf7aJM4pH3GIc26MOOfIQPmWGfyxNQxPL4tVXJX5Z3FhL+BbbxmIcy6KI7YVR+C9uEDFjCM3xfFYR0jinJpfJ7yMwBux15Fewni6Y7l+CHNu6FdvVb6fvXmN//z+6XuBz7a7c9Ebsa03At3TlHBO1eJWnqVVuK2rmt78tcmbU3FzckVAh+QCMFOGZuJM6dwbcVWXn8WxeO+BLHGy0kbCORfFEduKI9DxkjinPn9Cxb2uaorz1yZxTnmqIOOcGyO+Es+pul7Zt0Dikbtugx5lTbkq4M/mvMovcxIT5pyL5ohtzRF4by5Q9kOtSDly0xyPjQgyhdRycr2yKf1SC7yxLRnpZYznu5UaPdmwgLHA9TWpt6rfz95Ckf+tn5CAN+eiN2JbbwS6pynjAhW9kZveeGxE6DG6RhzenPI/MoY5cjtzPN/RsrnA9VWpuSrMz+ZYvc/Iv/05v/WQcy6aI7Y1R6DjJXOBiubITXM8NiL0GC1zTj31b8UhjthOHM93sCwucH1RKq4K9LM4VvEzsn70FinnXBRHbCuOQMdL4gIVxZGb4nhsROgxWuKc+tFFGcQRQ39kJwWLE57uWNlb4Pqa1FuV6WdvrOVnZP0PNHhzLnojFvpZ776FVpI1NvJyTVJa4gFHblrjsX5tWpo4ZV9jgzVi6I1+cQPaeL6D6ZvOeL6RQivjvSjR9fk32yWArOrWj1iUrsAlXQvDpcmauXSt092/oCtQz++wklzc0LWOjQh9QzPJAmVfEy1dC7sG2rNsne9gz7AhubDXQVFdVZEfs+uTZfuI+P3bi1I+zgIXdbG51yu7WoEunu5oSZdTpUsWtZVdq7Wpy1/rXw7uV/Z1RF1sbKeL57uZm22/V36tC30dFfVVBfnZV6jav39lyfqPCulc9EXs9cqWL54eHZRZrj6LEGKVL9mVhS+2Nn3x2IgQ0sup6IvYzhfPj2DRF7nXUVFfVYeffYVi/UfXTfDl3F2/o1Mb/gvDlcn8gfzyVlJ+BSrtZK3Wpq/02tc3wWuZv17ZAx19sbHLl9xY9fQKzdQ/8L1GQ3rNZra/8fr5WXX32ReL877y58+HPHj+USGdi/lFDD38+JfwcZ/QUFLGdvqyblEZuamMx/q1OohQ5lR1XG4xPMICJwkLc07dbFkLdeSuTOvHjqZaFeBndaFK/9EfGP5HxXQuqiO2V0eiBzapc6oG1j9/sC5rqvPXJnVO/ei79zBHDB0SsVDG090bvwGgLHB9A6i4qr/P4kKR/vPRba41iHNRHLG9OBLd1SQuUDHnyE1xPNYRkjin0iL/kxg6pL8FCHM838GyucD1KKu5KsDP5kKV/vPRabzMORfNEdubI9FdTeacilv+n+SmOR7rCMmcUz7kyLnA9ZBfwwOBTulnupF4Tt0/RxWjAqsSPwsM5fqP/tPBPyq2c1Egsb1AEj28SWCgYuqRmwJ5rCMkgU7F1CN2pd7rygPieLpj+W0AdYHr20DFVTV+FseS/SVyqAOci+KI7cWR6IBJnFP3+cO21x2PUoDcFMdjHSGJc8qHHJkXuB7ylXmB8l8L6sYwPPsV5uNvNkgA6QbJz4esav9RKyPn7NNkVREs7I856WLVBAvoYQ3iAvX8ucm2dolb3BC3jo0Ich21wAxURZCVdYlLnLRWmRcoqzAq8RaG0elWJOMeVccfMw6QedO/pIU356I3YltvBMaoSolUtXeIVqMqHLyxtemNx0aEHqMrReDNqewtcNIavDl1s2+cQBw5DM/4ZJ+aq0r9bI7lfPezeiArcJhzLpojtjVHoOOpEZhzqq5KRgzmyE1zPDYiyCthzindN0e+kZKR5hS5zncs9w9jbGdwfU3qrUr2szfW9aPFn5uvLh/ORW/Ett4IdLzkzakaD9+dXFc1vflr1Ti8OeUjDnOB6xFf/py6/ehPGsAfOQxPl4cqrgr2szhW9T2Q1QFfnDyci+KIbcUR6HhJXKDSonJd1RTnrw1rk/XKvg59twXa2Ba6E3zxdDdyf+hzEr6cGx9KUW1VtJ+1hcr+R/8eDfOkc1Ebsa02At3TpC1QURu5qY3HOkLS5pSPOMQ5N0Z85Vui5GEDfcTep1uV7Gdvoa7/GT+ncV0ZvDkXvRHbeiPQo5q8Jcp/lbevanoLr5VMwTzp1PNHfxoa3gInrWFlEij9QiW8EcPojAWyJlwV62dxXtFXB3ruXeKci+KIbcUReC/OqftDfxQTCxNyUxyPjQgy1BDn1FN3jeCN2DXUUinAGM93MPcPZYHri1JxVaqfxYV63r6ngoxzLoojthVHoHuaMs6pGg+ZeiCO3BTHYyNCj9F1I0KcU/UlyNdtEYgjthPH8x0siwtcX5SKq1L+LC7U+/aVH4hzLoojthVHoHuaxCUqTZXkpjgeGxF6jJY4p3zEYS5w0hoSz6lYfBPD6Iwf0xRxz7/ZNQFk1ff4YUROlYFL4ha2E7eAMaxSVVcNF6gaVq8FFjfErWMjggx1ZVyiPvVnEkvc4jYpt853NL8Baq5MXF+Vmqsi/ZhyT1byL5G9GAhcNMfmtuYIdLyQciFajYdMZTVXLm6aCxF6jJhy65V9HT7iMOethVVloB71XfPXqRf+2BqGZ/RHzVWxfjYXKnr7U8KaLJ/ORXPEtuYI9Iglc049f8KvGK6rmub8tTqGyDmnsrnAiZGaLENrt4f+MB3MsbWDuSrTz+ZYy/dI1hj5wvLpXDRHbGuOQMdL5pyqq5JZFTlHbprjsRFBxhrmnMrmAietwZxTX6EiWNhBXNXrZ3GhqP8Z/0u2HnPORXHEtuIIjGEVIXjMOVXiZMAgjtwUx2MjgrwS4pzK4gInrUGcU7dPnVSRcuQwPGOLRSfLKtXP5ljPdz9rjHyz8ulcNEdsa45Ax0sp51RdVVigkJvmeGxEkLGGOaeyucBJazDn1O2hv9kDc+QOOVfF+tkcK/ruZ41RWKA4F80R25oj0PGSOafqqsIChdw0x2Mjgow1zDn1pb8BiPUJMRnqayqCMp7vYH4DQFng+qI05apkP4sLdf2Pfj4G6xPnojhiW3EEuqdJnFPPH31PGZMluSmOx0aEHqO1snTqS7/QCnHEduJ4voNlcYHri1JxVbKfxYW6/sf/brHqHCv6wt+uNIaOynZHvQEeWknaPNZn+Azzamxa85eGXeb1yh5u+0EmWGNjlzWZhZBuPN/N2AdXkG3E0MzeVlXoZ1ss40fEH/+Lxc+nc+mjJgvDld3+pa/tur3hy9tJvgKV3hZYrU1h6bWvpRTmR6dslwPCiKE/moYQxvM9fHf9KXgII3Z57w9eSH59/c1mCSDbLNF/n6yJMXApvxa2M7aA7mIwFqj7R9jlWtwwto6NCHLnlLFA1dQrXClLnFAlLlB3fTuvxC3sEtcJq+KqMD+m2her9+5mdcAXkYGL4tjcVhyBjpfEOVVX5YvIdVVTnL82VNzrlX0ddWvIYgfi2NrVIalnoYznux2/AeAscH0DqLkqzM/mWL2/RO67gYXbl3PRHLGtOQIdL5lzqsZDxrXWIuuqpjl/bTLnVDZH7uqQ3NEwx/Pdn2wucHtzVcCfzXmV//zRv6LEZOlcNEdsa45A9zSZcypPluSmOR4bEXqMuIpM/Yk5x9bQIX1XGeZ4vqNlc4Hrq9Kcq8r8bI7l+4zsf5T5+eXc+JLrNR71QcpFoZ/pL+AW0OGSOA8Wv6mzWpvi/LVhIble2ddR78/K26OYLL013QOBPqfqz/tkisCUSQ7DM/Z+VFwV5mdxrN67B5VyMp0j5ZxL4khtxRHocEmcUzUQfYde9wnmSnJTHI91hCTOqae+2w9vxK6Ee12WQhhPdyzXD2HODf2qrYrzs7ZQwf/oBwOgzbmkjdRWG4HuaNLmVN1LUgVCG7mpjcc6QtLmlA84vDk3Bvy6faDPqfgT5ou78m3dBeqtavOzt1DA/+ilwZtzyRuprTcCParJW6JSNUBueuOxjpC8OfXUbT1oI3alm2x+QxjPdzDXj3xzboyxeqvy/OyNNXxHrltb1k7w5lzyRmrrjUCHS94SlbyRm954rCMkb075gEOcc2PAV745ZdsusEdM7gL1VlX62RtL+e5meZN6Cd6cS95Ibb0R6HDJW6DSfsm6qOnNX5u8OeV/Awxv5NAhfcAi4Xi+++P+ocy54V/Eff/Nvgkg2zfRD1uUuMAFcYvaiVtAdzSIC1TdTbJAqwfc4oa4dawjBHGB8gEvcYEbA86EC1T6w4CFYXT6ca3aqlA/5tt3qOZ/dIsN2pxL2khttRHoQU3anLo/9IcEoI3c1MZjHSFpcyprcy5pC5Q+LSvp1uVidMbiVb1VmX72Fmp5+2YCvDmXvJHaeiPQo5q8OVW/CSnLAngjN73xWEdI3pzK3pxL3py63/RD+xBHDsMzvkSj4qpKP4sLpfyPfjIC4pxLb7wtbGsutCNG6lMKq5ke/XrH1Au4xU1zIYK8svaX1ys7gn+uABMlW7uSRCrzesKt891O2lle2NVMd1iVVWV+VsbyvUM+f/RTSFDmXFRGbKuMQMdLyeZUXVU/DVhzr6uayvy19beUq1C6XgpnjlUIcQtn5NCjoIynuz+VtLK/izQjh2b2yqo2PysLBfyP/v8FlDkXlRHbKiPQXUzKnKrxlHHH/EhuKuOxjhCVOVYhZKyhjNxGGU93tKyM3HtlVbeflXlxX1cuazUocy4qI7ZVRqC7mJQ59fzRH5iAMnJTGY91BO0Pkswp+6NmCAuYZCJmx0ClP8BZ3Kt+nR2rLD97C7X7j76XC2/ORW/Ett4I9Kgmb06VN9kmhTdy0xuPdYTkzanoLWDBW6BsdDBFknvvrQryszdW7d3LGqGedq+HALw5l1aQpLbaCHS4pM2pR3i3dF3TtOYvTdacShtbKwC6o3+igzwLzeguBXQlbD1mNduqJj9bC4X7T/hLxW/n7H6qN24WttUW2pF7BMtHp+7245vINnLTG4+NG0MSBLOkU+lrbwu7vIWliDcTV4/ERL8Y+/mbjRFAtjGiH8usPAtcMrawnbEFjPF0Y4Gq7Jf90TK2uGFsHRsR3Fig0vfdFrYxts53sGRsYQdjVakfc+wnlPM/4U8UAxeNsbmtMQLdxTA1hmhlTFZ2MMbWpjEeGxGCsUDVh+HWfHU9EWopsiLslHk7URmxg7Iqvs/KWKF3B2twfPH441xURmyrjEDHS8qcuj/D123WVU1l/trwEZL1ynkdutMBZWxtp4znu52ojNhBWdXwZ2Us9Dvk8yf8/96PczpP1YNsUVtj3kwy5lR9dERSBUlGbhrjse5QMuZURZCJF8bIoUNS1dcCZJ3uYFHYbGW/5fhTlfdZGMvzDlnC5BmLB5lzMceIbY0R6HjJmFP38Bb2uqgpzF+ahDn11P06+CKG7sjEA1883Z2JvoihlfEzS7rwqLL77Iu1eYcsX1ICwZdzKcFIbXUR6HBJl1OP2ox4fcYgwchNXzw2Isgra6W4XtlURQgJxtbQIRkVCOPpbiYKI/baivqqsvzsK9Tu9u4PfDmn3cOESGrri0B3MPlyKvsiN33xWEcIFdm60KaeWkohv7wxfc7BWqDCOzELe2+tiu2zNVbk4/J/wh/u/TgXZ0ViW20EOl7S5lTlviQL0ozc1MZjI4K8Emnm1FP3xKEtYNIYtDkVv6G9uMtbz7KablV2n8WF2vwn/HHbj3PpqxkL24rzdpI4p75/pXyDN2LTG4+1N/s9BYhLWFjkE3tNkasGgDGensFayIXVBsjC0EpvdKuvKrfPvliTd8S6pbtN7lf9OBd9Edv6ItDxki+noi9i0xePdQD7HRz4SpgsCJFoxDa+eHoGk0SEL2Jvff3+zb4HINv30D+Iq8dZ4JKvhe18LaB7GHwFqu4iuXErwRY3hK1jI4IMYfkK1D3NjIELD7RApWXIwjA6vdaRPPutivuYZ4DMW/iTtsBFb2xu643AGFWZ8GqHMUXTNxmgjY1NbTzWAcIyZL2yqbQxvLDXgea0uE6PVvQNvkqzhPWdpNaq6D5bY2U+Av+Ef2j7dS5aI7a1RqDjpWxz6p6sEZvWeKwDJGtO3W/6Hf2aHVe30R+5u+pptk53sGfS5tFGyqq2Kr3P2lifj8A/+kOzmCSdi9qIbbUR6HhJm1P3p5bGyDZy0xuPdYTkzSn/5A28kUOHxi8Grnzj+Y4WxQVsn29Vg5/FsVAfgX90oQZxzkVxxLbiCHS8JM6p+sNxud8hjtwUx2MdIYlzyv/SHOLIoUM91MsbT3ew6C1g3ZgmXJXiZ2+s10fgn/AXe7/ORW/Ett4IdLzkzan6YkN/kfkaNngjN73xWEdI3pyyAYe2gPWAL3uB0u/74ylH7EretcWj2qpkP2sLdb39nzXSzbmojdhWG4Ee1KTNqUoG2RGFNnJTG491hKTNqagtYEGbU7cv/cQYvJHD6IxvLaq4KtrP4ryyf/6E/0j8dS6KI7YVR6CHNYlzqt4uCvlGborjsY6QxDn1tA/iIOHIyVivVOP5jmY3AJQFrG8AFVe1+1mcF/glzsvtX+eiOGJbcQS6o0mcUyVOdm+RceSmOB7rCEmcU0/bqIM4cjtxPN/RoriA7cVVdX4WxxJ+BP4J/3L561wUR2wrjkDHS+Kcqh/ZkW0MiCM3xfHYiNBjdGUK6m6nct3t3FjEr7xzqq5XoiLxyF23weYZ9/j4iw2TC/LCW7Ym/lF/y+IbK0FcY3/E6Ye5/y025Oa6nR79sMPVWIvrY/3SsMOVMbk1/ntcLjoka9r/GadnMBPWwS5hPXO8zpH1bZNzql2QGvv1PyiNnKwS/rU6wH2KP8Lk0uGLQPcw+XLq+etfnunWpjB/rZZ9/xWv42HdhjC2hg5JfyGMp7s7T52Q/zdjPTaqrSr00wz5+Ahl/K/+XScSLXDSDWgjtdVGoPuZtDl1f/hPn3W4qc1fqwMJbU49ddUOa8Q21ni6e2P7ZLBGDK10sqquqsvPukLx/uv/Tfr4CFzQRWqri0B3MOlyqj4g3/fl9Rz5jxoHclMXj3WEpMspX63DFzl0aKzW//kk6/MdLQqbzeyFVUF+Fhaq9l/911bkl3P6DxTIL1J/hKXnGInuYTLmVM2LwRi5aYzHRgR5JRIsUI/xO9KXERgjdxmTt94wMfL8iGZ/LIkcI4d2xl8EaZJVGX52xlq9Y9bo9DsJ17XDmXO38TmVC4M0YntpJDpgkuaU/nA9kozUVMZjo/2gzKlv/V86GCN2jfRa5a0U4+kRy24tCCP32oz6qvL77Is1eocsX1aePT6cC/+N3th1Zf7Dgg10vKTLoz1+/Tf9u7UpzF+b1h6Bsl8EhzFyr0O9jPF0dyf8PPVrK+PGU2NVfZ+NhRL990OyHxnmXDRGLHQQa0We7g4mX07VXSQlBxKM3PTFYyNCSDCnbKChi9jVm16VL188P4KZdmQYObTTzaivKrrPvkJl/qtvQcCXc5+yk4QJkRQuLP2ZfROji/0cvgbi30c7TeUMY7xpjMf6tSnDAmVDDWXk0CO5UDzEeLqDmXgII3YJ6+WaGqsy+2yMtXiHfP6Onya/xhDGnHvoT+lDGbG9MhIdMCVZoOxzmEgyclMZj40IIckCFZWRQ4+kwIYynu5gNX6dRdf4wVng+qLE3O1vtj4AWSGtQ1nmApfMLQz97Hvquv6aG9fp7qfGqkwLVJwbFze0rWMjQo/QdR21XgyUpUgl2sKu3kgzpW2dH8HMfmlbHNrpZtRXVeXHTLuF0v1Xl4Hw5dztQ9/erlRbHC4tzo6LGJ2USQfOPF6cHRc3nflrw+y4XjmuwwYb0tgaeqRVDaTxfLdj7uGMGJrp1bg6q2L77IwVeUes7O77gLPjzbm7UDBGam+MRMdLWRaoNDmueNNYeK1cKbLMqV/9ggCEEUOH9CdMIYznR3dMPIyRQzvj4aPKqtw+K2NN3jFLWd8GS5lzN/3SKpwR2zsj0QGTs0BFZ+SmMx4bEYIzp6IzYuiQzAZQxtMjVlRG7lLWzztVVuX2WRlr8o5ZyrwuuzmnP08BY6T2xkh0vGQsUNEYuWmMx0aEYMypX/1yIrKMGDqUsoznR7CojNylrDNClVXBfVbGqrxjljIvzG7O6eIIykjtlZHoeElZoKIyclMZj40IQVmgbKzhjNw11nIrI814vqOZekyMxNBMJ6saq8L8bMyr9zImZSuWH87dVSyUEbs6+Lq7g+UiT3f/ki+n8tKD3PTFYyNC8BWo6Ivc1R25j+GL5ztaXHoQex0V9VUF99kXq/KO+PzVrWr4cs7eeocvYriynq7X8p6nO1ry5VT2RW764rERIfgKVPRF7hpouYvhi+c7WvRF7BqVfYJVwX0Wxqq8Q5YwqaQgzLm0G7yw11tpCQut9PVfFNb2TmVh5KYwHuv+6MoXK8VARWHkrpGWvR4I4/mOFoURQzNdjWuCVbF99hUq8t/xdd+1UHQu1s/EcGW5HCPRXUw55lQuoclNZTw2IoQcc8qGGo8wYpex8Ajj+RHMzOMZRu5qZ+vs/jd7HoBsz0NX7ZVjgVOq5sRFbZUtYvTRsyxQUdnihrJ1bERwZYFKyhZ2DbXM8pVk6/wIlpQt7mqnL0fS7F6F9jHNALmyvg2YZomTyRPK2NpeGYnRx6DMqZqsu6fXVdX+4oo3lflrw8S4XtnXEZWxsWuofeERmkn/5toXerWzXdzfq9I+K2M53pdeg9NtLmXO3XSXAM6I7Z2R6IBhZlztNBUfZoubzkIEsV0Ps/XKjuCDXVPj4q7B9qlxne92zH3NjAu7mulnoqZZldpnZ6zHO2Q5k0vDzOicrlGgjNReGYmOl5Q5lZWRm8p4bEQIygJlUxqUkbvGOuQZz3e0qIwYmhm/SqPKqtQ+K2M93iFLmVwalDn3+xWmRmJ7ZyQ6YHLmVHZGbjrjsREhOAtUdEbuGmxf5IeBic5mM2MnUJ1VrX12xoK8O1jO5NLgzLmb/+BEY3tnoaHwOHMqOyM3nfFYdyk9zgIVnZFDj/S/UbEE4fmOFp0RQzNjK1CdVb19dsaivEM+f/XtZjhzLi0aSV1XZhsfoZGUY2ykLyn7Ijd98Vi/NvkKlH3XDvMiudAd6OLpDhZ1EUMrve5UW1Vtn22xJO+IZUumO9hyLpVlCwv9q32qdbqjJV0hlj1csVokN3Xx2IgQpsRARV3kXgf6WpFBF093sKiLGFrp2UR1Va191sWCvCOWrr4F1lrROd18xLqDFC7s41/0uwMQRqLjJWFO5fwiN4Xx2IgQhAUqCiP3OtRLGE93sCiMGFoZ/VVjVWqfjbEe75BlrO+CZcy59AbZndgfZeGjpovogKMLV7jaqgpUVsZ4UxmPjQhBWaCiMnLokRSqyDGe7mBRGbFL2XZx//k32x6ArIb+lEurOTFw4S8jG8OlSapWioVWgq9EPfXP2WpOXNzwtY71EIZHWKDqRhWv9Qhb3DXSr0/k8rVOz2BaplY1FrgK11Wv5NpnFe7HXAPk4rwqC1wUx+Y24nh69FTyuhItxLpFcWxtiuOxEUGEVBkdImRxbA3dkQuFOJ6ewZI45ypc11EqrrYCzuJ8v6Da9HX+p3NRHDH0NG4Oh4ZS0rGdHhLdl0HKkZrmeKxfmVLOqW/9JU9kHLFNxvH0iJU+2v3STPtXX1Vyn32xLu+Qz18tPzBDOhfej17UXldop3vAZ9pqp6+q3kl8naHgyxuri5cl739GrlZ8/Wi5wiL/vL3ipD1oJHdplMtHAvL8uPzwQ0rNXe30A0VFVh1+FslivWPWWHSbXJ18Ohf2sRa1F+ntpLxzKop0LIt0LouMXBBJ7hIg6wKI5Pke1Iong4pHILmrnY6jIqs4P4tkBd8xayzkJkNGOpdEktqLJNHxvvVvd/D0c6wuS4YMORk5edYhJ51L86pTnx86PSEjE6e7uBDqXPVCZhYIJXcJXROP+qzq/eyTJX6Pb4UMSxlyfPhUWffJY3t7JLr1aM+xbC9ywZ5zyZ5T2V7idHMQ9pzL9shh2Dpb1V4V82d7rPh7fCtkr5HWtOpcej6S2vsk0fHStOpUWs6Q4h2FtOOx0b7oxYPQKd1fR9KRek2Sa0hgi6dHqLiaIYdm+lrUVlXyZ1ss9ztk2QqrT+du+jPASD9if3T1tV1dRMVHoOMlW049f3QGwNRJbvrisRFBrgO+nHrqN6sgjNglTNY/MMbzHax+Ll6GD7MjuaudfjSpsqrkz8pY7nfM569+WBOPO+fSN9UWtlXm7SRlTtVV9YP9ugGgjNxUxmPdozQ3OnX/0I+pwRm5a6xFPZzxfEcz9VBGDM2MXBZlj7/ZVQFkxfmz51nOiYFLyha2U7aA7mJQFqhS1jcnlS1uKFvHRgQZ6sqyQHl6lLLFbZSt8x1N96TK2KLQyqje1VgV8ccke6RKf7S5jDmXfu1lNbc15u0kY06VMRn3SrIVbhrz14YkW6/skU4/09MRmtPrqFSLrenP+cGcX9toTf1VzX/25xsDNVKybK1J8uFc9Eds649Aj0fy51Rdlaxs4Y/c9MdjI4KYR8YFyv52FBlH7sq4tVy/bmuI4+kOdq91wSsHcc69EVdF/lmc7wTUEPny8eFcFEdsK45A9zSJc6oWJPKchzhyUxyPjQhBnFN5qiR3iZNbB+Z4vqPV+MmVwlzg+qo05apaP5tjST8j+3+VPx6Bk3VCrSQXtRXnzSRxTj3tIy0QR26K47HuUJoxnapUkZkGGefcSJWVeE75jzdBH7nX/FVvVZSfvbFy727W9YfFSeCCN1JbbwQ6XPLmVF1UWJuQm954bEToW/saacyUTmVvziVvTtXKLUyY5N57q3L87I01e3ezhkhC4hEXuOCN1NYbgQ6XvDlVFyWjj3wjN73x2Iggr4Q3p7I355I3p9K3o1bQS1uPnuZbFeZnb6zeu5s1RDJhwFvgOvJ1G2OeJLX1RqDDJW9OZW/kpjceGxGCN6fSl0Zf+jO+oLsmSG/G9WOCdG7oV29Vnp+9sYbvbtYQyRMY3gIXvJHaeiPQ4ZI3p7I3ctMbj40IwZtTtkGExxsx9OcusxDWJTzfwbI35954qxr97I2FfEeuIQorysAFb6S23gh0uOTNqeyN3PTGYyNC8OaUDzjEOTcGfKWdUz/65gmyjpjcBZJvz7/ZNAFkmyb6S3yVb4lzb4vaeVvAGFVZb9SbOoF6/uobo/V8W9zwto6NCO4tUNFb4IK3QP3o+8LlbWEYnU4N1VZl+jHdnqGW/9W3hKEtcEEbqa02AmNQgzansjZyUxuPjQhBm1NZm3NJm1M/47PJV1ZCG7H32qpIP2sLlfyvvnELbYEL2khttREYgxq0OfWpvwSLZCM2rfHYCBCsOZWtOZesOeU71NBGDqMz3nPVdKsS/ewt1PG/3zKU8Ba44I3U1huBMawSDLNkovQ9QIgjN8Xx2IgQxDkVt0tWhGuopcO1LFnnO1pNDLJ8gTKPN24AFVfF+VkcK/iXyNJTiHMufe5rYVdHXzfq6n23dbqjhVVJoGo0pDSBN17T9MZjI4L0pqq39cqmsje2hu7oP0bBG893O8/xJs2aIAPWF6XaqjY/a2MBPwL/+r/P148N2+olaiO20cbTHe2mH6BGvjlW3vo5fg0HvJGb3nhshOghul4Jb07Vv0e+3ma1mFwYuqNv50ObN+P6kW7kLv29e6nGqno/G/MSvwan27y6iERzLv28xcKuLobfYl3AGNAwRXq056//p1Bf1VTmrw0bk+E66q8yXJk3Nma2a3AgzqksjhxGZ3zsSMVVdX4WF0r4X/9H88fTuZhqxHBp8RsfoaE0SbKd9ltDIbmAZCM3zfFYvzaZc8oHG9lG7hps2YmANJ7vaHWPyS2AbAtcTwGqrgr0s7pQxf/+SBYg55xL7+IsbK/OG0rqnKoBkac91JGb6nisBzOpcyqrI4ce6Yc3oI7nO9pTv5oGc8SuZlZuq7Kqys/KWLqPiL/6n9RQ5lzMNmJ7ZSQ6YFLmVFZGbirjsRGh7+v1aHMqKyN3jXVYSvJ8R4vKiKGZXlqJsq+/2SEBZDsk/h/Zj8AlZQvDlUn/agm5Tnf/gq9ApZJtYUPXOjYCuK5AeZFVk+Pi0Bv9vY3KsHW+o93rS6grh67bo1IscOP5qNqqID9m2her9o5ct7RM35VpgUufBlrYRptHS9qcitqITW081t0JE+O6yqayNrZ2aRMd0Mbz3c5Tv6kFa8SuQelHnvqqSvzsi+X6CPmri1/4ci6mGbGNL57uaMmXU3ERsq5pCvPXJmFOxWlxRUB39DNtEObt1N0uy28YC1xnv3qrcvzsLdTsv/5X2fXbAjaNRm/ErjszLPxDO8kcm2m/2Ry5aY7H+rXJnFPZHLnLnCzOYI7nO5q3A3Pk0M74tQN1VrX42Vko2H/1PzuRa86ln7Zb2OXsdW7HIy20EsrrgMXyenFTWQjRtzXXIOuV74YaDzW2dimThSuU8Xy3Y2U6jBFDM+PL8WqsqvCzMZbqHbL+t6pn3KuLMOZcWuov7DKWsszbSVnmVHyeEZvGeKw7lJLMqfw8I4f+6JeSYIznO9r9SzsEZc69WYZUFX4Wx1K9I5c4mQYgzrkojthWHIGOp/2srawQLYpjY1Mcj40AIdWc8gFHqjk3Bvy6q6EvUGk5QuyQcFWIn72Fav1XP5sJb85Fb8SuS/MpkqfHoMo9AmtO2ddAq65e2LTmL03p5tRTf/sD0oihM3KZsMXT3Zm65eUeQbKRex0TnR6r+D7bYoX+ElLWtbDlXJXarzrq4z4Lw5XFr3cvogOmNPNwNRJSg8AYuWmMx0YEGcPaMV6vbMp+aR3G2Bg6JMMCYzzdrdzsT9tgjBya6WFTY1V7n42xQO+QNTSyvwdjzkVjxPbGSHTAZCxQ9cMFr3cIjJGbxnhsRKiv1r++Fs4Sp19ZhTRy6JM0A2k8/RJObi5II/dW2vffbIUAsq0Q/fvMkha4JG1hW2mLGH2UCafmxUB9fehf0Ja0xQ1p69iI4GmWqPo4x6vaUrY49MjzbJ0ewepNz9dmStni3iur6vuYZ98s0TtkjY3c0FDmXFRGbK+MRAcMeRbC1WXJTQ5lbG0q47ERIShzKs2MK8DGmLdyi8bIvTdW1ffZmJfoNTRyk8CYc6k4W9jeWGhIwiHJnIrPssVNY/7asPpYrxxe7SmEJGNr6JFXZ+t0N2PikWOzlc4HeZZ9V9V9NsbSvCOWMbkyGHMuGiO2N0aiA6YcC1R6lq3LmsbiayU/61m2XjuupH4/5HVGgzO2hz5JM/UsW6dfmvFn2eJe1au0KrzP0lidd8iSJvMIpDkXpRHbSyPRAZM0p/LESG5K47ERQToEZU5ZfsAYMXSo84Ml2To9YsWJcTbTKaHGqu4+G/PivIZGnrIw5lw0RmxvjMToo9zamBidqsuStQEeZeSmMR4bEYKxQMXVB7mNMp4ewaIycmhmr6yK7bMyVuQdssZG8hrKnIvKiO2VkeiAKcmcqsuS4gPKyE1lPDYiBGVO1Q/SCYcsI7dRxtMjWFRG7r2yKrjPyliVd8gamy72uNP47Vz4dd1F7Y15O8lYoOp3V16fMzBGbhrjse7RUz9uh3kxYXKrwhixy1iYGHm+o93qPzNerxTrD3Jop28MnRir4j4rY1neIb8+wr/0fjuXlJHaKyPR8ZIyp+qqZMCgjNxUxmMjQo/RdQvCWKDigpEceiRZjsUHT3cweyBCGLH3wqraPgtjSd4Ra2hkWYRp0bkkjNReGImOl4QFqn6g4/XOhTByUxiPjQhp72O9dnL6c3DIMraHPsnAQBlPz2b0A6xwRu7VvCTZz9/sfQCSvY9yJsuBcha44GxRW2eLGF2UaLX4CFRdVT+0r1QpZ4sbztaxEcGTLFFp8bE49EiaKWPr9AiWnmSLe2+syu1jlv2wJu+QNTZyaTDmXDJGam+MRMfT+wPGnKqr8ifZ4qYxf632p6bF9cq+DpvPKsUWthEWYkVh5N4Lq2r7LIwleV94DY08giHMufunDnVt4y9ur8xb0nagLFBp8bG4qcxfmxYf66Xd9ad+3h3O2Bp6pA8MZBnPdzNx8bE4tNOzhc6LVbSfpbGy75AlTZ6ykOZclkZuL41ER0zSnKrr8uXHuq4pzV+b8ixQafmxIlzSpDCENG/H8rWeZQt776zq7bMzFuU9gjU28qSHM+eyM3J7ZyQ6YnIWqLQCWdc1ncXXytIBs2PixmforycmUo0c+iTNQBpPjw7VTwu+LpZgjZzI11SrmvusjYV5x/yy32aDNueyNnJ7bSQ6YtLmVN1OPa2sRQi5qY3HRgR5RENaoOIihBx6JBcAaTw9gsVnGrmDtKq6z9JYmnfMkibzEKQ5l6WR20sj0RGTNKdKWliHkJvSeGxECNICZaONTCMno33dNrDG8x0tzo/EXt1rolXZfXbG2rwjljOZBODMOTWLZQipvTESHS8Zc+qp/6iCpT6xKYzHOkBchThWnwOQqgPGyKFHMiwQxtMzWpgaiV3eO4oaq7r7bIzFeYcsY93mdS/BmHP63IMxUntjJDpeMuZUNEZsGuOxDhCNJUyGGsKIXUMdJkae72glXiYDPM3IvYpXY1V1n42xNO+QZUwuDcac0+8ZwBipvTESHS8Zc+qRfjtwxZvK/LVp1ehUvSknsyeUkUOPZDmNHOPp7s74jvt1u8MXqddGxNfv3+x/ALL9DzVRvgKnVPla1NbXIrqDwVegvvS/FGtOXNjQtY6NAKKhVh6Bsn8HKlsLQ39kIV221umOZa2UroWhlVFDqa8quY/59cu6fIT80JSGL+fS5/IXhkuTKb8+471Od7Rky2PFv6pZrU1d6bWvy23ocqpmFZ8QF3eN9Gsz8OXN1IXK5ARhzlW4zlYVV+X5WZzX8NWm3FMQ51wUR2wjjqffiwtU+o+hdU1TXHrt64hDnFNZHDl0R57vEMfToztRnHP1Bd11VeqtKvSzNy/jvz7GFzW4BPl1LnojdnkLH9EP7aSUYzM9IOkzw6uxKc5fqs8piHOquiP1DWZI58InvROlv5KJvGNjr+mr2qr2Pmtjgd4DVNrk+pFuzkVtxLbaCHS8pM2pqI3Y1MZjI0B4rjmVtTmXtAUqaSOGwdlnW1XfZ20s0buXpU0eTNDmXNRG7NK25oErZ/F44+mOln4hJGCfN/1CPpYjbG5q47ERImhz6m53K7KNXOgPpkme7mA1KuH55tywr+lWBfjZG6v0jlzeZCKHN+eiN2Khn/DG0x0tenPs86bfroI3ctMbj40QwZtTPuDw5twY8Ot2hL5AfehHGjBNknsdHfVWdfjZG4v17mZ5kzsG3pyL3ohdV5aebgQ6XpomnaqrkuGHOHJTHI+NCPJKPN4SpStBiHOurkQqaKhzzm8EqHNu3AhqsMrys0HW7t3fusKehdf6xLlokNjWIIGOlww69fmhP4gBg+SmQR4bEYJBp3zEYdC5MeIr9Zy62f+mwx85DE/fBiqu6vOzOBbx3c0S10XGEudcFEfsdVK4WsGUydMdLU6ZjuVHHbnpjcdGiODNqXrUyZMC3sihP7pARcbxfEerYWklV8dhzLnh/1Xc8+MvtkwuyLZM9AM1//hMXBDXWBTXp7ufQVzC0rOuuRbXx0YIE5coH/D/jt0eA/7PhEut1fXKg+d/R2tyG6i4qthPGff8SGW9vkcIcc5FccQucf6wS+34VJmo9LBrbprjJbw3lyh/2HWEbu3rQ//g9H9242Opl9obd4IarNL9bNDr+7pCKw+eH85Fg8S2Bgn0iCSDTqWHXV/VNOiv1cnuv2rEncq559wY8ZV7Tt3sH9aRe+QwPK1XxVXRfhbHyr4HssTJrI/Ucy58YryxS5zWdX26o8U504PVqMoT+D/GRU1v/trkzSn7SQlMmcTQHX3jCgnH892fp37qHL6IXc30DK7Cqlw/C2NN3yFLmMzPEOZc+OHHxjbCQityc/x7jFXX1P287m/4YmvTF491f5Ivp2yg4YsYeiNbuNDF0yOW/awwfJG7fK27WHVVsX7W5RV9DU3n7DU00OXcXSvMfx3YdWXp0ebtpIkxUf5rj31VU5i/Vn+/HhOjU099YkEYMfRH72IY4/k2dv/SMhjGnBvzq4qrMv0sjrV8Ry5xVr49P5yL4ohtxRHoeElcoOwngpFp5KY4HusISZxTURwx9GcM9XqU8XwHy+KcG62puCrSz+K8ki9x8vBAxjkXxRHbiiPQPU3inLrXd2LX3LKmSHJTHI91hCTOqSiO2CVOJiJkHM93sCzOuTfiqjo/i2MJ35FLnMziEOdcFEdsK45Ax0viAhUzjtwUx2MdIYlzKoojhv7oVApxPN/Bsjjn3oirIv0sziv5rw/9tQaIcy4u/omho/f0jCPQPU3iAhXFkZvieGxEkOUMnnFOPfVdGDzjiF034mvGwxtPd6z7lxa/eMQ5t/d2+5v9EkC2X6L/blzeApe8LWznbQHd0+AtUcnb4oa3dWxEcG+B8hEvcYEbI84nXaL0Lih9C8Po9DJCnnC32hE45hsg9ybPEnhzTmuYWlIuCheWfnypiTGqXgSsdpp61L/svt7vtTQJXM0W0t5/Ri4UBqG1x12/qQGXHAv0Up4plYTrdF98XZRUVbDIZpobt4TKrDL9LJO1fLdYkeWmhUznkkxSe5kkOl5KQqfqqoLMyPXtfSUJZDqXZDp1/9L/WYRMcuilfscENnm++1jT5+udCJnE0Mz40JJqrOr9rJElfoesAfNV5825pJHUXiOJjpc0OlVXJSOBnEyc/sstNDqXNDpVUSWZoNE5vfEhM1BJJrGDzCrtzzJZ//fgfn3oxxyRk84lmaT2Mkl0vCTTqTzBOldXL48HyHQuyXQq5yQ59DLlJM93H/2mQFI6N24KTc0q+882fW+gxkMeOLDpXLJJam+TRPc02XSqrkqSBKkZOXk+wKZzyaZTupuCxCR1uZRJDCnJ893D7NK5Ny5rJ+Ds0rcLatTkuQSXziWXpPYuSXRPk0un6qrkKQiXkZPxhUvnkkuncmaS22Umz3cf9Z5AXpKSe0IzsrYFzhZ976DGSx5LsOjcTX/nCytYYnuNJLqLSaNTeYJ1rm5/mVCg0bmk0am8giWHXso9g5zk6e7i14f+hyc8OvcmJ2uv4GzTNxQqsn2i83lzLtoktrdJoruabDpVlmSqQFJGTpIXNp1LNp3KSUnuSid5OEMnz3cf4xKWGJoZH7LQrKy9g7NH32Aoj3JpyErnokdie48kuo/Jo1PlUSYLeExcWsM6lzw65emER6VzI53WHkGg0hqW2Hub97/Z3AFkmwT+F5rPwCWbC9vaXMRbm4GKc2zg6hEhN2NlZeCCzUDFrFwceqm7CJWV63z30e+KmmQDN+4KSc577SkckxOQ65TlYiVn4KJONrfXSaK7GpIzhCtNclmVnJnzVWzgkk6/Nl2xVGquti6ZMqFDpreSZTr3RmbtKZxlcuOhx7Yiy2hApnNRJrG9TBIdMMl0Ki5jw2UVJ0sS5Ka3l2Q6lXOT3C43eb77qDcFMpOU3BSak7WbcNbILYeOWBplhQGNzj319/lrGbuwvUZvKGl0qi5L7n/kJLmxgb6OdZeSMr6yKfv2MhKQGDokw4L84+nZilwmjBFDK+NdJTVW+wZnY765UEMjdy6MOZc+7bSwP8Ykgf8ttyN1Qn18ZjXTA1F/JvW6XQlfflF18bIQQtoFTqh68ypQ9fvSr0HhkI2hi/pzFZDI833tP3pNkEhMmlGJtWFwlui7Cl8f+iezkOhclEhsK5FAdzFlnVNRomN18VIsQaJzKRGdqtZklQSL5K7hf5UMiTzdPfzR7wRAIrGDxNopOEvkdkKHrCuX3IBE5/TLjpg6SW0dEuhwyaFT0aFjOREDJxmGRHQqJiKxa/BlmoRDnu8exkQkhmbGRyo1EWuX4OzQtxLKoSz+4NC55JDU1iGB7mFy6FR06FjOQ+dSHjqV85DcNfqehzzdPYx5SOzgsPYGzg65gdAh68rlSQaHzvnPTDT1x6F+MwxPRG8nSXTq/qV/TolHIrm5hOGx7lEyFqibfskHMyc59OimP6WNvCPQ4R7jvcRrBwBzJzG0M75Vo3lXOwBnZ9wm6JDlTBZYcOacfj8ecyepvTMSHS85c+que+5QRmwq47EOoLvBmCidqt/4fk0iGCP2x9jreQjj+Q6mm1zwRery1VHE1+ffbMUAstrd/xr3Gbibvm1awha2FbaI7mIQlqibfkGxjC1uGFvHRgSZNMpYolKSLe6PMnlGlrMFdLiUZAs7SKuC/phkn171V5LJqrySLHB618MZW/vjTIaq5sUFdA+TMjbTVF2UjBeUkZvKeKxfG+bF9cpBfYV5cXHokDzyISwE0yV6ZdnC0Mroh2ZZFe1nYazs+8q/PvyPcesP9iwbkzBSW2EEOlwS5lRdlCz3IYzcFMZjI4LcOMgxpz7H8+V6/tSsuLCNL2/lZpkKYeQOwqpmPwtjYd/9q7GR4gUZ5lwSRmorjECHS8KcqouSugTCyE1hPDYiBGGB+tIvFsAYuY0xnh7BojFyB2NVoJ+NsYrvmDU4kv0w5lwyRmprjECHS8acqouScYcxctMYj40I8kqkWKC+9MuNMEZuY4ynR7A0JxI7CKti/CyMFXuHrLHxleKnc2mrZGFbY6EdyZ3a71rN9FXdvvQGgTG2No3x2HhtMObU4zGq3TUrkkOH5ELxFOPpEexb30PDrEjuUrZWnPoUq9L7bIz1eYcsY1LuI8Wc+xmbo1cHse4gtjVGoOOlHAtUNEZuGuOxESEYcyobI4cOycwDYzzdwR72K7sw5tz+PZ3PqrfP4liUd+QSF9aLzt202IE4YltxBDpeEheoKI7cFMdjI0IQ51QWRw4dkmYgjqdHsJhq5C7/fQNorlW5fVbGmrxjljJZTSPXnBu/XbdSjdTWGIEOl4wFKhojN43x2IggQ43HmVPZGDl0SJ4ZMMbTI1g0Rg7NjPfU1VgV3GdjrMo75tdN//sNxpyrH/cWs8gycltnBDpgchao6IzcdMZjI0Jw5lR2Rg4dkv7CGU+PYNEZuddmRNnjbzY/AOnmx83/EPcZuPRAW9jO2AJGF+XJXkuQRCVjixvG1rERwY0FKhpbHDqkfyJWytb5jhafaIHbP9EeVZ4fkw2Qm/P6LHCPh37htpJtcVt1HjAk22qmBySuHhc31YUIQZ1TWR25S50U9VDH8+NKU7YtDu2MvRZNt6q9z9JYoHfMmiElAWqGfDh3s+Ib0shtpRHogElaoGK+kZvSeGxECNKcytLIXdLkboY0nh/RojRyaGf8lKNKq/L7LI01escsab24uZYYkOZc/Tv2qje4ElnYH2fhXZhFdMAkzcPVZUm8qtNWa1NaeK08j2opsl7Z11ERZK1RlfXirsF+7TCcebCwpb8oNDJ+a0KNVf19NsYi/eXCvUx7OKdfsEWSkfojTEb43wbQ4ZIvNtNUjaaUIPAVObFTn0EIXNgxDpR+7goGGfMafBkoKOT5vvb7j6ZAFW6Lu+6ETl+VWBX5WSLL9o75ddNHMNLOOf2rC0gktZVIoMMliU5liZELEp1LEp3y4YdGctfwSzRo5Pnuo94MkEjquhn6BlWJVaSfJXolXxLlYQyJzt2+ZYqFRWJ/LKa5k0R3MWl0Ks+d5ObcyWMdQXcIMHcGKs6d5NAjWQjAGE93sDR3kroa6WFTY1Wdn42xhO+IZaxTeT3tnEs/O/Ag9sdYmDwJdLz0o2OrncbqsmTAMHuyuWmMx/q1N73vocyx+00/LY0sI4cuya0MZTw9ot3162ZIM3Kvzaizqs/PzljEd8ganL4PljPnojNiW2cEOp6qQBXnVP1quzxcoIzcVMZjI4LcOzDmVL0H9roAgTBi6I/EhzCeHrFsWCCMHJrpyVWFVXF+FsYKvkOWMOkgpkXn7MowLRLbCiPQ8ZIwp+qqZL0HYeSmMB6bEeQOhDHH7vr+HYwRQ4dkWGCMpzvY/aabfjBGDs10poqx599slACycltv5jIWOP0UTAlb1B9h4Tm2iO5iMBaoMtaP7Cvxy1jm+h6+uFpTBk7vypIYqM9v/cJUWVzc6/BfwcriOj26+NBvC5fFxaGZvqXUYpXzx7x7es3/dbv354c4UQYuWWRre4skRhflmVUTZYhWV9X367LorRUn8x0sOpcsOlU/sinJBovkNhZ5enQxWiT33mLV7WeLLO47ZI2DjCty0blQ3i1qb9HbSbnoVD3uJMeQi87V1fd9vXLRuWTRqfu3jgUsOjc2IFdKOvWrXUVGEsOQ9R2jGVl1/9mlbw7UaHSbKyOdSy5J7V2S6HtHO4iMdCrPq4kbX/RdLp1LLp3K8yo59FJue8yrPN1d9FsCFp0bt4TKrB2As0zfJiiZsuJCYjqXZJLayyTRPU0yncqJ6VxdvTxMMb06l2Q65RaQmM4NCysxnYqJSez1zlCXVeCfXXIXoMe2RkOmM7h0LrkktXdJouMll07lxEycPsLh0rnk0qmcmOTQS5nDkJg83V30WwKJ6dy4JVRm1f5nmdwg6MhfN/9br+fTuSST1F4miY6XZDpVt1hY9yRO6zzIdC7JdCqve8i95tLKSJ7uLmaZzr2RWXsCZ5ncOOjIJVOeA8hM55JMUnuZJDpekulUlpk43Y2BTOeSTKeyTHKbzOTp7mKW6dwbmbVfcJbJTYWOXDJl7oBM59Ib8Avb2/SGkk2nakDksrCYda4uP5QkziWbTv3o/gMemcQ2mcnTPaR17bIKwTTr3BuZtZVwlsn9ho5coyEbKJDpXJRJbC+TRAdMMp3KMp2ryw+ViXNJplM/umECmcQ2Mnm6e5hlOreX+fU3Oz6AbMdHv4BTMgOXZC5sK3MR3dUgM1AlSVaplZmZk/VbzbOBCzITZVV+2VwceikXVSugdbq7+HULv6YcuDc2a2fhmJpf3H54iSxrDdh0LtoktrdJogMmm05lm4nTD7nDpnPJZqL088mwSS7n5jrdXcw22Uxzb2zW3sLZJjcgusWK7EugL+eiTWJ7myQ6YLLpVLaZuPGZB24bhMtPNr21+mKiJB9sktvY5OnuYrbp3BubtcdwtukbERVZFhvITeeiTWJ7myS6q8mmU3VZ8jTHTBs5WW8gN51LNp2qqMEmuY1Nnu4uVjMy/dciKFzUG5u1vXC2yT2IGVknF9h0LtoktrdJogMmm05lm4nTugk2nUs2nfrRi0NqEtvI5OnuYZbp3BuZtctwlulbEV+3p6zvIdM5XZPU216L2rv0dnS4ant2tTPHI7zttbjxRuU61q9N3vw64o7Pag09kuzCesebqRlEphBkITk0M964l72er9pLOCvzDYdSFp6NziVlpPbKSIwBlWhQFqiH/ng8JlNyUxmPjQgPLTLrfcn12uY+v/XrvMg2b2+kCTd4AlXu5L1CuGNrr7eAqqudg7M6314odVKAIducS+pI7dWR6AFL2RaoqI7cVMdjI0JU51z1XJYAUEfuSpTXT3og33i6w/kdAGfOjWCqrvYJzup8M6E6IJkOdc4ldaT26kh0T5O6QEV15KY6HhsRojrnquey/IE6cht1PN3hsjrn3qirXYGzOt86qA7IigvqnEvqSO3VkeieJnWBiurITXU8NiJEdc5Vz+UxBnXkNup4usNldc7t1X3/zR4NINuj0Tm61AUuqFvUVt0iuqdBXaKSusUNdevYiJDUBe6rvmjzOiOWusVldet0h4vqAvdGXdX7x6z79k2B6oCvLAOX1LG1vToS3dOkzqn4Lsa6qqnOXxtWluuVfR3xHYvFoUeSkvWkW6e7mbiyXNzlv5cS8oz7rqL+rMwr/1Imaz1km3P28ZyqBha2dxYaknC1tFzt9FDE7e3FTWchgqw6amG5XtkRfsNW9sKusX5NRSjzWL/hbYmAvUm1KvPP3tJegH6wGd6ci96I7b2R6PFKueZUfC9/Xdb05q9NueZUrOJWBPRIP+MAc95ONOfYG3NVq5/NeUFfGSc3KMw5F80R25sj8d6cU/ETNeuypjl/bTLnlH3eBU83YjtxPN/dieIceyOuavWzOBb0HbjEeTnw7VwUR2wvjkQHTCkXqLgyITfF8diIEFcmzn3+6Hdc4c65MeiswgMVq/DFyZ2gz7kq1s/yWNF3T0ueVDTIOueiPGJ7eSQ6YJIXqCiP3JTHYx2hLv/1EYUHnWPlTvY84M655M6p20M/EVvV+GoNA9RLWFVXNftZnRf2pc5ruW/nojpie3UkemCTukBFdeSmOh7rCFGdY1mdc0mdUzWOsgyFOnLv1VXNflbnhf3XTf8iCVnnXFRHbK+ORA9sUheoqI7cVMdjHSGqc6x63olwzYXIOnKvg72mSp7uaH4HwJlz4w7QrKua/azOC/vqQKjlnIvqiO3VkeiuJnWBiurITXU8NiLEp51z1XUpUuCO3MYdT3c4f2jCnXN7dz9/s4UCyLZQ9Ku3lXaBS+4WtnW3iO5qcJeo5G5xw906NiIkd4Erd7K6LneLy+7W6Q4X3QXujbvaTDjm3Y/vOFQH5LEOd85Fd8T27kh0V5M7p+qyZP1U7/Wsy5ru/LWhPFiv7OuImyiLQ49CYbfOdzupPgjYG3NV5p/N+V5ADZGvU36csy/21lbKwvbmQkMyS9VWymqnx6NW25IRMMfWpjke69emh916aWOf3+FrZ4EbY85nXqDiEnNxGKBexsjD7qcK+LM6r/JLXbd5XRqSzrmojtheHYkesZR0gYrqyE11PNYRojrHvm76G6mYL8mhS7KMqd2Udbqj+R1Qz7rAjTtA1VUJf1bndX51QK4Q6pyL6ojt1ZHoriZ1gYrqyE11PNYRojrHqueyQoM6cht1PN3Rsjrn3qirjYCzOt8tqA7IDAZ1zkV1xPbqSHRXk7pARXXkpjoe6whRnWPV897JZ3Wwer5R581kdc69UVcV/lmdbwNUB+ShAnXORXXE9upI9MAmdYGK6shNdTzWEaI6x6rnsj5D1pHbqOPpjpbVOfdGXVXuZ3Us7ztydUBWclDnXFRHbK+ORAdM6pyKn7NdlzXV+WvTAjNQD/0QI8yRQ49kDYBHHU+P7qTPfy3uugH6BtGHXFXuZ2de3pezsLR0zn7VDktLYntnJEYnZWLG0tKp+J7B4qYzf21y5lR6z2AFuMZaLhTOvJn7t37aDMsT595kW9XtZ3Ne3Jc5uauQbc5Fc8T25ki8N+dUNkdumuOxEUFm/tp2Dh2K5tjYZU6WbTDH8x0sm3Nub+73bzZRANkmSvh3k8AlcwvbmltEdzXMk4GK74wvbphbx0YENxeo9M74wtAhT7l1umNFcYF7I652Eo4p9+vbDfXDp3JrVcoFLopjc3txJLqrSZxT8a3xdVlTnL82TJbrlX0dPuT1gAvcGHKW4YHyN9przlycZLA8535rK+GszvcbSp2UNFDnXFRHbK+ORA9ZUudUVkduquOxESHknFNZnXNJnVNZHblLXeewqqva/6yOGwTdz1LXbXIL5dc5/XmAWqEsam/O20nmApUKghVvmkuv1UVDPenWa2fPw9sFi0Of5J6uJ9063c3Ed8UXd0nraU2lVbl+luY1fUmTOhT55lzMN2J7ayRGJ+UeqXVlChetsbVpjcdGhPRGQYhRn5OVzMRkyfY21nh6htNPq2KWJHdZ6y6rtarUz9a8nC9rcumw5ly0RmxvjcToZHfhymxYcyp+znJx05q/Nj3gnIpvEawIMtjr0ebt+GwLac6NO0TVVaV+VuflfKnr4nDNks5FdcT26ki8V+dUVkduquOxEUHuRUySTvmQI92cG0O+BDrlNwIEkrtuhP1cWSX9WZ3X/aXO901+nXvo5+/xhCO2V0diDGzIukDFuZLcVMdjHSFtea1LbaxqWP8E0eLQpfCA82jxfZ2XZrrDmm5Vqp+deT1fznzf5DdwkpRQRmqvjESPVFqUOBWL7xVvKvPXponSqVR8rwBXesiwYEnizVTSyvIAaebcSFoVV5X6WZyX8yXOt01+AxfEkdqLI/FenFNZHLkpjsdGhDBNOhXFEbvEhVTj+Q6WxTm3Fff18Re7JhekuyZ3/bThPz4jZ+Ka2olronvqGZeotGnSXIvrYyOCiUtU2DRpDB2S/v5PHJXkrZvpa3rjrTYPTgn39eE7DF93/9OoyEk//rX6wdb23kh0D5I3p1Lh3fGmN3+tz5T9yr4OL5X/W3qkP50Pcx4tm3Pujbmqz8/mWMR3D8qczAnIuMAFc6T25kh0vGTOqWyO3DTHYyNCyDinfMRhzrkx4v9cUSbK74P/Ha1hfMbPE7w+5L4+au/gbM43GMpcr3j+WQxcjemcGsyxtb05EmNcJdq/Vw8DFRaUzU1z6bW+ZdKv7SupjyL3+vzqOdyxPfRJbmkkHU93M2nLpLmDtKrRz9JYyHfMkiZrIqSbc/pbe5goSe2lkeh4Kd0CFaWRm9J4bEQIOyZ9rc3Vh6QkMSGN7W2k8XQ3k6WRu6S1fM20qtHP0ryQL2ly6ZAWuJBppPbSSIw+hkxzKlXdfVVTmr82Pd2c8joZysjJWK/Zkee7Pz7XYnZ0bsy1aq6K87M5VvAducyJE5gLnFBIN1J7cyQ6Xko3p7I5ctMcj40Icif+17jSprI5tnaZsxKue9ztZHNsp7k35qqSP5vzcr/M2X7J14dz9m+lUEdsr45EdyGpC1ScKclNdTzWEcJ+SV9qY7VfIncjso7NoUs9wa2k4+luJu2XvDbTUTTbqkY/O/NCvpzJXYVscy46I7Z3RmL0MUyUTqW6uy9rOvPXponSqVB3dwB0SIYF6xFvpZKtlVxmMU069ybZqkY/i/NCvsTZfkn92bZ9qCGKI7YXR+K9OKdy3U1uiuOxESHMk07FupvYJtV4umNlcc7txd3+Zr8EkK7t7/6PiPVPdsYlcQvbiltEdzXMkoGK4hY3xK1jI4KLC1QStzB0SFbZlXHrdMeK4gL3RlzV6MeMu3kh/3X3f0GsovfvxBHbiyPRXU3inIp197qsKc5fG6bK9cq+Dh/yeroFbgw5H3KBinX34jA+PfPKQ+5Wtf7ZnG8IlDl5/tZDDo1JasaUI7Y3R6JHLJkLVFqYrMua5tJrQ929XttXkn7Xq7uOPsnIIOtSOH/Tu7n30qqKP0vzUr+kyVIB0pyL0ojtpZHoodJwtVkSwlWvZSPjPwY3pYUIYZ50KhYC60pex3rlmTfjWVtLk9VMd3tkraZblehnc6zju8UyJ1M5zDkXNkwWtRfn7SRxgYrZRm6K47HuUSoD1qU25t+3x0TJ5tClkGw83c3EMmDTjCqrCv2szMv4Uib3JpQ5Zz9tWaXbwvbOQkOS20i2QEVn5KYzHutRjM4cq9JNpMAZuY0znu5o2Rk5NNMpoc6qNj878wK+nEntAWfO6c93QBmpvTISo4tBmVOxclvxpjJ/rd6DtVGyXtnXcf/Wvx+AMW9tTGxrmnTK6kDMksQwPONXw1RcVfBncV7mlzjfJ7k5l8SR2osj0QOW5kencgFAborjsRFBJg+IcyoWAMTQIRkVLEV4umO5fhhzbuhXb1Wfn715EV/eeml63VJIOOeSN1J7byS6p8mbU9kbuemNx0aE4M2p6I0YOiStwBtPd6zszbk33qo8P3vzGr68+VbJzTmlMFGS2nsj0T1N3pzKdRu56Y3HRgQZceSbUz7imCidGyO+Jkqnct1GDuMzZjXJuPvf7JUAkoLs6+7/9FsbX8YFc4vamlvEGFd/xCUqrUoWN8ytYyNCeustcLUEkXu23C0OfZJVSyXdOj3DhbptcQdptV9wTLe7byqUNKmQapoMXJLG1vbSSIw+BmlOxbptXdWU5q8N65L1yr6OmG6BC+kWKK8C6zG3uIO5KuDP5rzKL3NyV8Gcc7/6b8U1Uy5sr84bCjPlaqcHNv2eSceb6jxCqgJCiHpg9fr8mgSRbmwOXZKBQbrx9LxSvakhjRya6Ylbp8iq4M/OvMyv5uX+h7PAyQd6oYzUXhmJ0UWJVoXbamdQcYpka1MZj/VrozLHas0n0wyUkdso4+mOFgu3l2Z6VarKqnQ/K/P6vpTJzQZlzj30H0LhjNjeGYnRx+DMqbggWfG6teLk0fSf47qaS7OmR/VlBTSS22jk6REsfEdfmukxV49Vpp89spbvmOWx05n1wN256JHY3iOJDpimS6fyky5yMqnBo3PJo1P+vIJHchuPPD26GD2Su5rZe6yy/eyRtX3HLI++kXJ3zn6nDflIbO+RRAdMHp2KOykrXrdWvntIrtsQHr295NGpWsXIbAGPzqVVjFNpd2U1hiHrgdekrIr+LNPL/pLZE/ZKSueiTGJ7mSR6+JNMp/Lkmji9FyHTuSTTqTy5kkMv5c7Bsoanu4t+T2BZ49y4J9Rm1flnm74ZUDZ9y+XuXLRJbG+TRHc12XQqp6ZzlZpy+bDpXLLplGtAajo3NFwJAKlOxdQk9nprqMwq+s8yuTPQY1syZeGAdY9zUSaxvUwSHTDJdCqnZuI+ZQ0Nmc4lmU7l1CSHXvbUuCzydHfR7wmkpnPjnhCbn3+zNwPI9mZ0OMpm4JLNhW1tLqK7GmwGKq5+IqdvoJfNwAWbgYqrn8W9ZhNtrtPdxWgzcG9s1u7FMTc/fYujKieppmDTuWiT2N4mie5qsulUtpk4/d4ibDqXbDqVbZLLuRmCZZtspofijc3aOjjb5P5Ct1g2ZWkPm86FL503trcZGpI1Y+0KhHDxrYrA1ccU5PJhM0SV8qu2wQP1o2+T1lNzYZvU9FglU6LVRLua6aF/I7M2H84yfYeiZMroQqZzUSaxvUwS3YWUmk5lmc6VTFlkQqZzKTWd+hlvMlwTKWQS28jk6e5hluncG5m1BXGW6fsUJVNGAzKdizKJ7WWS6K4mmU6VJFmo1qeawmUVJ0s4yPT2ksxAWbEPm+TQS10+11J2ne8+1qCG3GQ7zb3RWTsMZ53chugWK7Is06DTuaiT2F4niQ6YdDqVdSbuESZa55LORPnPbfZgbJLTm8k2nXtjszYizjZ9t6Ii+97Bp3PRJrG9TRLvbTqVbSbuIXMLktO5ZDNR/hf23drGpjeTbTr3xmZtNJxt+m5ERZY5DbnpXLRJbG+TxHubTqW/sE+XVZzcjLDp7SWbTlVrMhiYasltbPJ0d7HGVOZ/rIKce2OzthjONrkPMSPrp75g07lok9jeJokOmGZap7LNxD2lvoJN55JNp3704iCT2EYmT3cPs0zn3sisjYazTN+NqHdmZDQg07lYbRLbyyTRXdXxQn3iVNwJWtx413IdGxFkBYJaxCPUW9myXoA5cuiRrmSw4uH5jua7R8hDcmhnfMlINnwef7PhA8g2fHSxUNICl6QtbCttEd3JIC1R6a3mxQ1p69iIkD6NE7jPb32UlLbAjUzhLk+g4vfhF3eQV9sHx4x7+B5DZZwXkYGL8tjcXh6JMbQSrjIuhYvy2NqUx2MjQpTnXH2USnIT8sihT3KplXLrdIfze6BSLnAjmCZe7Sqc3fnWQ7mTdR0Sz7nojtjeHYnuakq8QEV35KY7HhsRojvnyp0sguCO3MYdT3e47M65N+5qc+DszncQyp3cfHDnXHRHbO+ORHc1uQtUdEduuuOxESG6cy5+hHF1fePOm8nunHvjrnYCzu58u6DcycMa7pyL7ojt3ZEYIysTEebMQEV35KY7HhsRojvn6isQskBD3pHbuOPpDpfdOffGXdX9Z3e+OVDuZOKAO+eiO2J7dyS6qynvnIrvZ6zLmu78taE0WK/s64jvXSwOPRorw7VICdFspYrHHbnrDuiJTR90Vd6fpfkeQEmTIhXSnEsfqFrYXpo3lKQ5Fd/tX/GmNH9tkuaUvRePbCN2jbVs02GJwvPt/lc/eA1ljr3Jtqrkz+K83C9xsi0Acc5FccT24kh0T5M4p2I9ty5rivPXJnFOeR0Gc+R25ni++xPNOfbGXJXtZ3Ne29dH9ORDDTDnXDRHbG+ORPc0mXMqvrm0Lmua89cmc07ZiEOcY2PE12TplH1DColHDKMz5lydK6toP4tjZd/jWOLkCQ1xzkVxxPbiSHTAJC5QcXFCborjsREhLk6c+/zW/zeFO+eSO6dyNU5OUljkPf9mKwWQbaU8ZUIveYFL8ha2lbeIMbS+skxUkre4IW8d6wjpU/sB+/wO32sKXHAXqPjh/cW9T7xn7QAcEw+Qu5PBhDvnojtie3ckemRD4oVw8Usyi5vuPEJ051gVBfKUr7xbIa5M+b//5//3//7v//n//t//5WS5Tnd//Bao2TJw4xbQtKvK/azOy/uaM30j5elcVEdsr45EdzWpC1RMO3JTHY91hKjOMR9zqHNujPky6JR/9QYGyb3eCKquCvezOq/uS12XG9elIeuci+qI7dWR6IFN6gIV1ZGb6nhsREiPu9ClGm2ZcOCO7b2O9pLG0x3On5qQ5twYZ3VXhfvZnVf35c73UZ7ORXfE9u5IdFeTu0BFd+SmOx4bEaI753zQ4c65MehLoVN1J0gSQCG51ztB3VXlfnbH8r47Wu58H+XpXHRHbO+ORAdM7pyqkZDLqs8rrcua7vy1oT5Yr+zriPsoi7vGWpZwVZOv892O1RlQ5hc1bgA1VwX82ZxX+WXON1OezkVzxPbmSHRPk7lAxawjN83xWEeIDzvHPr91NwJJ59wY85V0TuU1JjkMUA+zqqsK/qzOy/xSJwstPOyci+qI7dWR6IFN6gIV1ZGb6nisI0R1jtX3sGU7AurIXVnnS0ye7mh+ByDrnBt3gKqr6v2sjiV+R66vykkHoM65qI7YXh2JDpjUBSqqIzfV8VhHiOocK3UyIUIduY06nu5oWZ1zb9RV7X5WxwK/I5c631F5OhfVEdurI9EBk7pARXXkpjoe6whRnWPx1w9WzzfqvJmszrm9uq+/2U8BZDX5l9x7lXWBS+oWtlW3iB7YoC5RSd3ihrp1rCMkdQErdbK2rqxbXFa3Tne0qC5wb9TVfsEx677CpsL9S6obqHMuqiO2V0eiu5rUORU/c7sua6rz14YF5nrluI6H7rzDHFtDj3pdweXJOj2b0U+U1aNucdcN0Ctlech9Vcl+dsa6vmPWTOn7KGhM0vKmvwNaX5hf2B9nUs/82wA6XlLm0er/rGT+rppghevW6uolan0UM3BJY4wqUw80OvfQOqrKhYDVxUk+Qyebw5j1abVZtfzZphf8FbLvkOtOQwY6p78zA5mk/sjUzy7CJoke/2TTqWzTubp6yRPYdC7ZdKqiBpvOPXSpAJuO1cXJQh42yWHQOprarLL+bJO1f49ufS/fF6BfzsXcJLbXSaIDJp1OZZ3OZZ3OJZ1OZZ3OPfQZBJ2OZZ3kMGg9AanOKvnPOn1foHR2mys5ndPbFslJ6o9NmfOQmwTey3Qqy3SuxkuiIjedSzKdyjKds0UXZDpWF9dT6TWyyE1yGLO+dpVZ1f9ZJrcIenRLZuf7khk4uTDIJLWVSaDDpcx0Kst0ri5eFmqQ6VyS6VSW6dxDb3/IdCxnJjmMWQ+pyqxtgbNM3zuo8QiLIOfsx4Vgk9jWJoH3Np3KNp3LNp1LNp3KNp17/MhkBpuOZZvk3qdm7RScbfp2Qo1Hp/tKTef0p88gk9RWJoH3Mp3KMp2ri+/b+7p4pKZzSaZT1ZqsB7GiJYdOyiQGiTzdXfR7AvOrc49RwGpq1t7BWaZvMFQPZE2IFW3kZHkGneS2Ogl0X9NM61TW6VzW6VzS6VTWSQ6dDDnJ093FrNO5n/ERTtH5/Te7O4CkjKxfL/IlbeDsC5Nlc2E7mwvorgabgYo2A1dXLwNcyRm4YDNQ1ZpkXyXn4nJyrtPdxWgzcN+/nUhqs7Yqjsn5zf2MDl09kHVEJWfgwky7qD8yQ7m5iI6XbPpVZZvO1dXLUx82nUs2nXINsOlcRZWnU825mZMHQc25i3u9O1Rn7TGcdXIjooe3Lk2eFtDpXNq/W9jepzeUfDqVfTqXfTqXfDqVfTpXUTuvrgc2fEYu+CSHUeupRX3WLsPZJ7ciXnzKMxE+nUtfnFjYH59yy1bFuYCOl3R6tKzTuRrYHhGuhFJUubb6tm6gqrUw2TLq6/AvizzdXfS7AlnpXH1PsYdeddYuw1kntyI6dv0WXHh2OpdmW1L77CTR8ZJOp+qqRFNt1X6TG7vr69iIENTxlYN66HoeMys59Eh/uAUZyPPdzlP/ZRPqiL3eAWqsthLOxrjf0BFrbOSmQwI6p9/1wGKH1N4YiY6XjDmVjZGbxnhsRAjGAhWNkbuMyYMGxni+o0VjxNBMj64aq/2CszFuKnTEGpuwonFOP7APY6T2xkh0vGTMqboqWakgx8hNYzw2IgRjTtlII8WIoUP60IQwnu9gVRS+fqYDKUYMzfRpFVZbAmdh3DcYEe+/0kGkmHNJGKm9MBIdLwlzqoTJwx7CyE1hPDYiSH/wPHMqCiO2E8bzHaxWlC6M2HthVf6fhfkeQQ2N5D6EOWffFkeKEdsbI9FdTMacqsvqe/NaAMAYuWmMx0aEYMwp+8VcpBixy5hcAFKM5zuYiUeKEbua6TtPc6xK/LMy3weosenFzDU2UOZcVEZsr4xE9zEpc6p+4lXWQ1BGbirjsREhKAvUp37uEs7I7ZzxfEeLzoi9d/bzNxstgHSj5fNDMrucBS45W9jW2SK6j8FZoMpZP7OZZosbztaxEcGdJerz/8/YmyVJDCNHlDfS1JK1mY3Nj1pqtaT7n2fCWXJEpLuDqF/yJYLAYwAM5DY+2HJFKGeL2zhb5ztacrawg7Oq+o959h22Bt5f/OEjcPoDNjUzLupXmYxUlWsL6B4mY/Gi/NkjtFZmJWrtpgROHyRqeQuUjT4k8uLQR/358Zos1/nuYl1Uz4bXzVCz5eIui2v5k8nyu0rzs0TW708hfX1DY5KgWrNAIqmtRAIdLkl0qsYhSIxckOhckuhUlEgMfdRfHYdEnu8uZonkrpthK7Eq87NEL98rpCzGmD2dS5+8WNjWYmhH8r5+LWQ18zQQsg7Xghe58R3l665HKoao4hqp6FT99rasJMhFcs/DfwWDRZ7ui7ebAZlI7LoZOoqmYhXpZ4us5DtkXbksNrDoXNgwWdRWYmgmSHSqbq0gMXFJonMpFZ3KEsmhkz36SyJP94hGicQuiT3gKrHq9rNEFvcdsq5cxhUSndPHd8ynpH4lhvcYFtHxNBpSke00VW8xy4AhFcnN5xge69cmY4GyDzIh7chdYy1TFPKO5ztavX/aTtYS6Nx4alJzVcCfzbHK78hlThYdmHMumSO1N0ei4yVzTmVz5KY5HhsRwoTplI84zDk3RnylnFP1ZXC5/zFxkrvugx5lNVeV/Nkcy/3uZ5mTnsKcc8kcqb05Eh0vmXOqPhkhdzxyjtw0x2MjgvQHS51T2ZxzyZxT9Vnf9VyyEo8YhmesOyquCvqzOFb93c0SJ8+7EOdcEkdqL45Ex0vinKoPoXihvq5qivPX6o0IcU5lcc4lcYFKRQMxDM/4WzIVV1X9WRxL/x7IEheqBueSOFJ7cSQ6XhLnVBZHborjsREhZJxTWZxzSVygkjhiGJ7tTPnzl20WQFLFlTeZkyrhAhe8LWrrbRFjVGUtqKeTQNWoesItbnhbx0YE9xao6C1wwVugHiOhOFMuDMMz/mhDEu7nL3stgFycPIZDnHNJHKm9OBJjWIM4p+pNapm/a4lbVzXF+WvDTLle2deRxXlrSZxTdb0ybdXDyYqK8enTKq4K+ONM+cMqvztQf9Qj9zbEOZfEkdqLI9HxwkwZomVxbG2K47ERIWScU/VRK+l3PVWuK3keaj5OrtMdzP3DmIcb/lVcFe1ncazsO3KJk5IJ4pxL4kjtxZHoeEmcU1kcuSmOx0aEIM4pzxGII4ceSTNVx63THSyLYzPN3YirQv0sjtV8t1ji5EEW4pxL4kjtxZHoeEmcU1kcuSmOx0YEGfF6qAz9yRnH1jbieLqDZXHO3Yirav0szkv6EierDsQ5l8SR2osj0T1N4pyKZdy6qinOX5vWOKes8ELCEUOHZOVHwvF09yZ7c+7GW1XpZ28s5TtyeesH1WsuhzfnkjdSe28kOl7y5lRdlaQNnk3ITW88NiLIK5FwTj1+wrcVFrdJOG8mi3PuRlxV6WdxLOW7mzVE8vgGcc4lcaT24kh0vCTOqSyO3BTHYyNCEOdUiZOJBhlHbiOOpztYFufcjbiq0s/iWMp35BqiflBdGefcq06otcv8Q+zXnAxYvfW6gI6XxLGZpuqqpLhExkVOZrR6vydwafb01uozi9IHyCSHTspjHKZPnu6LL5mSC3jQJIdm+qFCnzCrZD9bZF3fIevfI+URGennXPrMw8K2FkM7ctOjGHcqW4xcsOhcsuhUtkjuefhXucDTPaTZIjk002PwbPHr5Q9bKhdklbn/fXHi9L29f9QPeHODZiOxge6hp2Ki6tbq2/Uar3+OcN1acT0gF/dfkXOJKerbt/42wX+P1tBJS8XYTEjF5tBMJ7xKrJr/lIpfL74xUONgjzCJSxLZ2lYigR72JNGpuqju6JIYOZm6ING5JNGpkihDAYnkNhJ5uruYMvG5me6bSqzy/izR9wBqvGxV/Hpxzh9nmtpK9GaSRKfqokImRi5konNJolM5E8mhk3JR/1OOefokkRya6VtFJVapf5bo+wE1XvIQ8e91ac6Fj7I0trUY2pFR/88YLaeit1ZcSEXnkkWnciqS21jk6ZNFcvcWq+4/W/TNgRoHeTiARef8+bSprURvJqWiU3VRctdjUUyc/t8n5lPnkkSn6vuTsuphPiWHTspppCJPnySSQzN942kq1ibAWaLvFNT/XculQaJzH/qVBjzaENtaJNBdTBadyqmYOP3PSFh0Lll0qiz2enWtxbBIbmORp7uLeVUkd2+xdgTOFn3boCzKFAeLzqVVkdRWIoHuYZLoVE7FxKVUdC5JdCqnIjl0UuYHpCJPdxezRHJoph9DNBVrd+As0bcQSmKvtNftB4nOpedTUluJBLqHSaJTORMTlzLRuSTRqZyJ5DYSebq7mCWSu5dYuwJnidw66JAlUeYQSHQu/I90Y1uLoR3JezzaOFVX1SvHqjIi17f1xWE+dS5ZdMqHH/MpOXRSngKRijzdQ/qlP4nwvwN7bkUzsTYFzhK5c9ARa7jkyiDRufRkQ2rrkECHS5noVHYYueDQueTQqeyQHDopz4BwyNPdxeiQGFrpSxaHr3/ZsgFkWzb6K+3lMHCpxljYr0St0P8jN+SZuNrpgajvrcnzVj2fLq43vvtYvzYYW68cVPiic7eGHul2UCkL7bj5yrvFoZ1x36q02is4Jt6rbyh8vuuP1kKacyHxFrV35u2MHlyzXc2eq50e0eyMrU1nPNavTc4CFZ2Ru5zJqgJnPN/RsjNyl7N+xFBnVfKfnXFfoGOWM7mj4cw5paqAWNSvM+ki0sybScqcqouSxzykWeQkbWvBC1zS6K358NeCt1q7hl/6CI3ejj5CIPFIoZXx2QeVWBX/WSK3BZ4k9o3BZ89X51LikdpKJNDhkkSnssTIBYnOJYlOZYnkLonyLAWJPN99TBJJXRJ74VSJVfGfJXJboCPWeMnthUx07lV335CKxLYWCXS8ZNGp9C32Dtet1dXLuCIVvb1k0an62Sh53w2pSO4a/+cPwkMiT/dF+c2AXCR3NdOTn2qskv+skfsCHbMGop+GVi46FzUS22ok0PGSRqfqO2IyoJhRE6ffT4dG55JGp0qjzEvQSG6jkae7i1kjuYPGKvrPGrkz0DFLY2f40uhc1Ehsq5FAx0sanSqNYWFMnP7RDDQ6lzQ6VRqloIJGchuNPN1dzBrJHTRW2X/WyL2Bjvn5ru93YlJ1LmokttVIoOMljU7VVQWNkQtLo3NJo1P1s3ISFRrJbTTydHcxayR30Fj7A2eNvolQAyYTCTQ6p790i6WR1NYige5isuhUXhoDF5dG55JFp/LSSA6d7CXtmrewNPJ0dzFbJHdZ7JtFl8Yq/c8WuT/QMctieMJxLlkktbVIoMMli07llTFxaWV0Lll0Kq+M5DYWebq7mC2Su7f49petGUC2NaM/jV+5GLhgcVE7iwvoLgaLgYoLY+TCwhi4YDFQcWFcXLa4TncXo8XFHSzW9sAxF9+4h9AxKxf9MTVwySJb21ok0OGSRafiuhguqjhfFwOXLHrUuC6u1jYWQzPpM1FPzewL/7faHzhb5CZCD2sNhDyZIRed008x1rq4qK1FbyZZdKouSh6dq9ZY4ebFa5FXD6mBSxZD1G8JWg83q7Erh6xiXKf7mnIqMtrVTC9hsiy+1f7AWSI3ETrmZy3Qz9cGic7p51YgkdRWIoEOlyQ6lSUmLkl0Lkl06jNJJIY+ykDVs80agu5hljibGR+qV4m1O3CWyC2EjlkS+3mJ9eKbc2EfdVFbid5MkuhUXZTMk8jEyMnjNTLRuSTRqXrl8+2MTCS2kcjTPaBZIjk0Mz5grxJrb+AskRsIHbPGq7N7SXQuSSS1lUigwyWJTtVFyc4aJEZOVnRIdC5JdOpLvygAicQ2Enm6e5glkjtIrJ2Bs0RuH3TMGq+wJjr3+iG3KeZTYluLBDpesuhUTsXIyWXBonPJolMxFYldw/+cqZhPebp7mC2Su5rpEddUrI2Bs0XuHnTMGi9Zz7EoOhctEttaJNDxkkWnci5GLuSic8miUzEXiW0s8nT3MFskd7BYGwNni9w96Jif7/qzEbDoXHhjalG/EsO7+IvoeMmiR6uNG8kxzKjkxjvC69iIIAvEv8Yrm/KxxvTJCOiRvomDzOP5bif8+nVjaGb8VogmXu0CnJVxq2CEfNc/SYAy55IyUntlJDpeUuZUKQuLILmpjMdGhKDMqayM3E4Zz3e08PvXPXz3yt7/siMDyHZkdGO3lAUu/MtKY1tnoaHgLFDpW6IdbzgLrw0TY6DS13s7AnokN01lWWjG1dfbhIu71PdaJGn2XhsBxzQD5M7k0RzOnAsfF13UXlloR6L9Z4yWlbG1qYzH+sZPypzysa6Z8alH+ol2OPN2XD2ckcPIbB9J3qucPytjzd8drMVMlg0ocy78+U1je2ehoeDMqeyM3HTGY92l5Myp7IwceqSfHoYznu9o/qVuOCN376yq97MzlvgdspzJ7A9nzr2NhfQq/KoYWNjemTeUpkansjNy0xmPdZeSM6d8rJFn5NCjMDXydAdz9VBGDs2MWlinxirWz85Y0XfMcibXBmfOhf2wRe2VeTtJmVPpl+v6qqYyf21S5pT9FC6MEUOHehHiG3vrdI/eh/9i3XMrvYWmvqouP/ti8d4Ry5cUO/Dl3PhxypVipH59SarWRwhTM2FWZDN9UQ/7Z916xl+tTV3+2qTLqfqMotym8EUOHZILxaTI032hX/pBZySYY+OzYaqtCvGzNlbrHbi09RLJza73wEkvMTOS2moj0OFSlgXqRfedoM25unjJhtomCVxS6a29vWnSQCW5TerxdHfxR3eUoJIYWhnflFKJVYefJbJY75Cf7/4Pbl/vzoVqbVFbid5MkhioKNG5LNG5JNGpLJEcOqk/f46E5Pke0miR2NVMz3ZqsSr4s8VQ5r/r1wowgzoXvgC4qK1FbyZZDFS06FzdgvLOB1LRuWTRqWyR3DX8vYCtZZDnh0XdBEYuEkMzN7lYRf3ZYqj83/2f3r7endOtH0yopLYWCXQPk8VARYvOZYvOJYtOZYvkLotyzyAXeb77+JMsErua2ebi4y+bKYCsMNfNwcrFxPmyuKidxQV0D4PFQL29jNv1uutrWQxcWZRnqMrFxMniWbuYiXrXTbdaFhd3Db+9fbBOdxfrq2/PWKXiwq5W+kFJJtRHFfTHVATkEvvG4LNN4FKpvrCtRY+XLAYq5eIKNwdMJ3pYDO2Ja1h0qv6GTm5VWHRuPGFyXk2UbsRDJhvDiHVeq8sq9M8uuRvwNBpytyIhnYsuiW1dEuh4yaVTn4/wgfpwVcXJegWX3t7jRW5YyHSsmusBvjRBJrkrmZ5zrebVdXr08Ue3RaBxNtNRVGMV/2eN3CHokHXlneYrJZ2LGoltNRLoeEljoGJKOldXL5MYNDoXlsdA5ZT01lJKJko/egKZ5DBkfekqs7YXzjK5B9GDW8Mhcw9y0rkok9hWJoGOl2Q6VVflX3IJV1WczIiQ6e099G+qkJOOVXOSu8hJcpuc5OnuY/2UmMwU0EjuXmPtF5w1+qZCXblvATycC9Xjon4t6udmautmEd3FpNGj1VXJhI+HncRpQQeNzqWcdOrTbMMiOfSyp8S1PvL06OKLftYSFsmhmZ4FNRlrq+BskfsJHbKuXC4NyejcQx+mq/BY2F6jN5Q0OlWX1V29RgwaI9fz08VBo3NJo1MVVWYmaCS30cjTPaavUSO5e421V3DWyA2FDllXLrMSNDoXtlEXtbcY2hE79Y7gamdeVUpGb62uXuZeWHRO7WBKdapak7kQFsmhl3Iajzk83RefLZJDM33naTLWXsHZIjcUOmRduSwGsOiczhLIRVJ7iyQ6nuYYLDpVVyW2kYuR6xFZuehcsuhURQ25SG5jkadHF2Mukru3WHsFZ4vcUOiQdeVhYXTuTb/HB43E9hpJdEDVA41O5ZUxcTpJIBmdUz1IRqdqMCTbkIzknsd/rYw8PboYNZJDM32zSDJ+/GUvB5BuAzz8n12+AqcPXmVxUVuLixhdlCQri4GKyRg5/XuTshi4YDFQMRkXly2u06OLyeLi7i3WNsExGT+4l9AhP+u9vOeitqbUxMnyCYtsbW+RRMcLubjaaSrmYuRCLgYuWfRri7m4WkMv5RashXGd7ouPC+Pi0EyPpeZi7RKcLXIroUOWRbk0WAxcR74mE1gktbdIouMli07lXExcykXnkkWnci6S21jk6dHFmIvk7i3W9sDZIvcQOmRZlAcEWHRORwsWSf1a1H3EqhgX0fF+dLsLUyobaqwuqxeP67ap55vMye2FKTW0JwVoLYyJsn+Zq4VxceimzFtIxhAs7I8vDK306qu5WLsDZ4vcQngaLn+8+XBO60pYJLW3SKLjRYuOZYuRCxYDFywGKlok9zz+fLxZo9B9TO9yLOz5XlCLtTtwtsgthBHx8SYdRC46p/MuLJL6tSi5g1Qk0OHShOpUfKcqtBbfqUqcdBGZ6FGrNbkjkInknkd/OeTp7mJ0SOy6E3ryU4m1N3CWyA2EEfKhlSAkOvf6ou+yQyO5rUYCHTBpDFTaF1/hurUaeJlJMKGG9uQWg0an6keKZBMBGp0L++KJ0iWmduIWhhHrQl1l1hbBWSb3EcZoPMIfjXw4l2WS28ok0AGTTKfqUVWGFatj5HqpudIEMp2z/W7YdKzCyvoHm+TQSzmN5ZGnRx/Te1WLu/dYmwRnj9xJ6JCfD/0ZeiSlc9kjua1HAh0weQxUTErnauB7nloenUsPq07lpHQuJWWiwptVa2gxZGMXVNOyNgvOOrmj0KNbOkPp4VzWSW6rk0AHTDqdymkZOVnckJbO2TYN0tKxCtsT33V3IC3JoZchLXm6+xjfrnpqZi/y8y/7OYBsP0cflSsvA5d+nnthvx51bahnnkV0J4PIQNX9Jctbza+LG581XsdGBHllOUvUQ7OmnC0OPZI7pKbSdXoEe3xIItSSuDg00/OG5N5n7UUccw+QK5NLgzLnojJie2UkRh+lh1UwhnClTJIAytjaVMZjI4KtDpDmXMWQZyNII4c+eaKt00/h5FIhbTazl1Z7AWdp3DDokHXl8tgNac7pzlY9ki5q7yy0E5w5ldOM3HTGY92jsNStKx1UTDO2hh6JCaQZT89mUpqRQzPjcjTPan/grCxsIjz0E4JQ5lxSRmqvjMToY1DmVE4zclMZj40IMc2c+3zoNwaRZuTQp5BmPP0UTuQizcgdpNVuwVkatxQ6Zl26XBukOaebW8gzUntpJDpeWs6cynlGbkrjsREhLGeBinlGDj2SiRN5xtMjWFzOyD03o2lWVf3ZGEv/DlnG5MaHMeeSMVJ7YyQ6XjLmVE4zctMYj40IMc2cq573OsPHxtVz9EluZTjzZl5t4UWakbt3VhsBZ2e+W1BXLnclnDmnqzWyjNTeGYkxonKH4AnEqZxl5KYzHhsRpD94/ghUzDJy6JEs8jDG0yNYzDJyz+I1y6qaPxvzkr+MhYdG55IxUntjJEYXgzGncpaRm8Z4bESIWeZc/eqNbMFgMXMuFNuBysnG1u7VVel+Vuf1famTZRTJ5lxSR2qvjsQY2KDOqayO3FTHYyNCVOdc9VxWLagjhz6JWaQbT3c4vwMwQTo37gDNuirWz+q8oq8OyIQAdc4ldaT26kh0T9Pa5lRWR26q47ERIapzrnoubqCO3EYdT3e4rM65vbqvv2yMALIqO/zzTuCCukVt1S2iexrUBSqqW9xQt46NCEld4D4f+uGdUre4rG6d7nBRXeBu1FVFfsy6L5btHbk6IA9OlXWBS+rY2l4diY6X1DmV1ZGb6nhsRIjqnKsYPmGunm/UeTNZnXM36qo0P6tj/d4dLXWy+kCdc9rNerBc1F6dt5PUOZXVkZvqeKx7VA8McjPWo+W61uaq514MLG6jzsNldc7dqKsC/ayOVfxTB+QZGuqcS+pI7dWR6HhJnVNZHbmpjsdGhKjOuVrrgjpyG3U83eGyOudu1FWhflbHar4j173nxcGXcw/9AxekHbG9OxIdMLlzqi5LHnxrR3nFm+78tWM78KqskXSBSvXc4i5z8jZvPWGu892fH/2Eej1gLgzN9KQmT5ZfVaeflbGY74g1NjLTI9uci8qI7ZWR6IBJmVM53chNZTzWET70R3nhzLHquTxT4/GEHLok8y2U8XRHe33ovi2ckbt3VpX62RnL+Q75+dB/SoAz537Cx4sWtnfmDSVnTuU0Ized8Vh3KaVZoGKakUOP9OPwcMbzHS2mGTE00wuQpllV6GdlLOM7YimTMgbKnIvKiO2VkeiASZlTOc3ITWU81hFimjlWPZc8QpqRQ5fkNJTxdEfLaUbu3llV6GdnXsbXlfd0e03+cBY4mdqxmJHaKyMxuijRanNytdNUzjK2NpXxWL82ZVmgYpaRQ4/0w6dQxvMdLWYZMTTTi7JmWRXmZ2NevZcxeYCCscAFY6T2xkh0D1OSOZWTjNw0xmMdISaZY9XxnrL4DsDqOLoUksybyUlG7lbZ91+2RwDZ9kj4y6LApX+TXtjW2SJ6RIOzQMUsW9xwto6NCKKiHj8SlbJsceiRXmll2Trf0VKWLexqZn1BR7LsuwrxY5YBcmWduZwXAxeVsbm9MhLdRR2ImhhDuJhmi5vKPEJKs/XSvpCKK25rLQvcqKyu8YE5DxqzbXH36qoQP6vzar3mCX/a/3YuqiO2V0eiRyypcyqrIzfV8VhHiOocq5770/7q+fNgL2fejN8B9bS/mhlX1feJZl0V4md1Xq1/PvTffGpt+3YuqiO2V0eiu5DUOZXVkZvqeKwjRHWOlTpZvZB15DbqeLqjZXXOjeRVdVX4n9X57kCp84f/b+eiOmJ7dSS6q0mdU1kduamOxzpCVOdY9TyoI7dRx9MdLatz7kZdFeRndazaO3J1QJ7KkXXORXXE9upIdMCkzqmsjtxUx2MdIapzLG6PrJ5v1HkzWZ1zN+qqMD+rY/Xe/Sx1Xgx8OxfVEdurI9EBkzqnsjpyUx2PdYSozrHqeS8/rAZWzzfqvJmszrkbdVWfn9WxiO9+Vgd8H/nbuaiO2F4diQ6Y1DmV1ZGb6nisI0R1jsVCbvV8o86byeqcu1FXhfpZHav57mepC8VB4ERwbZp8k9qbI9HxkjmnypxkRL0DsOJNc/7asGmyXjmuI650bA090l9KQFHA87MdfeMSD5jk0E4Prz6eVKF+VsZqvkOWslAUBC4oI7VXRqLjJWVO5WQjN5Xx2IiQ3nD7di5+Lmhxl7RVPK+iwJuJn+V6ambr7Ocv2yaArAYP/8EWuFf9icvKs4VtpS1iDKk8BlUNHqiYZ4sb0taxEUEytLZNEpXybHGXMrnSyrN1fkSzDwhUni0O7YwfzZJE+6la/phogExa+Mu1wEVpbG4vjcTopAwFpDkVM21xU5q/Nn4qYb22r6SeJqUEqhpucZc2y7R1upuJmba4g7Wq5s/WvOT/fIR/XftxLvyuxqL20rydMD2udnokcqaxtSmNx/q1YUULEV5jprG1S5k8XyPTeH5Ei5lGDu30XaqJVtX5WZmX8KVMys6q2n6cS8pI7ZWRGF3sHlzLBPLMqZxn5KYyHhsR0ooWY4RP/yzukuZ5FsP1knV1CbMjuXtnVZafnXntXs5kFOHMufS7tQvbSwsNSThIcyrnGbkpjceGtLCiBSrmGblLmbSDPOP5ES3mGTm00xugmmdVj5+dedFezmQKgDPnojNie2ckRh+DM6dyopGbznhsRIiJ5hz+suI5k7CgOTcqLD5BBiqva2zt3l0V5Gd3XrWXO7mt4M656I7Y3h2JMbLBnVPZHbnpjsdGhOjOuYoR3JFDn+RSkXA83eH8FsAk6dy4BTTvqiI/u/OyvdxJLQZ3zkV3xPbuSHRX0zOJU9kduemOx0aE6M65/CBJbuOOpztcdufcjbuqyc/uWLh35HInSyvcORfdEdu7I9EBkzunsjty0x2PjQjRnXPxuxyr6xt33kx259yNu6rhz+680C93MnHAnXPRHbG9OxJjZGUiwjOKU9kduemOx0aE6M65uFWyrmXjzpvJ7pzbuvt++cOOyQV58d3PP9dS/O/1D+i+sxLcNbZz18QYWXOXqOSuuXbXx0aE4C5xNWfKY9p/j65Hd6mZ5C5xN+5qA+GUd98vvsvw+fC/0ktcdMfm9u5IjJEN7pzK7shNdzw2IkR3zqXvBHTXN+68mezOuRt3VbGf3bGs746WO9n5Qd45Fza9Gtu7Cw0Fd05VTsgy/M9xWdOdv9b3T/pKu+Np/6Q59Ej/pPR/xhV0O+EDXs/N9KPg8+Pl90sV7GdlrOo7Yimz7ZOrMZlSozI2t1dGogP6I0oKl9ONrU1lPNYRwttvOYR/Sqi5y9lz0QdlHi19sqs5NLN3VgX72Rmr+u5gOZP7Hmnm3KsuBf8Y2N5ZaEjC/edoZ15WSjO2Np3xWL82pVmgwvZJd/xSJokOZ95OTDNiaKaXUE2zqtPPyljMd/9KWbe5nkici8qI7ZWR6IApzZzKaUZuKuOxjhDTzLF6x1EmGDyQkLuceZrxdEfLaUbu3lmV6WdnXsuXM9s1+X5xzn9kpqm9Mm8nKXMqL2bkpjIeG4Mo/flXmQhUNEbuMiaVEbKM5ztazDJiz+I1y6o4PxvzCr6M9WS7ssy5ZIzU3hiJ7mEy5lROMnLTGI91hJhkjlWSiVokGbnnsf6/rck+3dFykuVmVFnV5GdlXriXMpmysZY5Z78dirWM2N4ZidHHsJY5lbOM3HTGYyOCqECWBSpmGblLmdSwyDKe72gxy4ihmc5VVVal+FmZ1+ulrNtcWeZcVEZsr4xEdzGlmVM5zchNZTzWEWKaOYb/23lerJBmzo3KamWbUznbyN2qe/3LxgggeYovddKByrbAJXUL26pbRA9sUBeoqG5xQ9061hGSuoBVQkvPS93i0CWZFyrb1umO5nfA/0Zu3AGSda9ViB+zDpCq+9BfD4c656I6Ynt1JLqrSZ1TWR25qY7HOkJU51h8glw936jzZrI6527U1fbAWZ3vIXx+6CezoM65qI7YXh2JHtikzqmsjtxUx2MdIapzLH2do3u+UefNZHXO3airwv2szqv7UifVC9Q5F9UR26sj0QOb1DmV1ZGb6nisI0R1jqUvUXXPN+q8mazOuRt1VZif1bF6736WOpnSoc65qI7YXh2JDpjUOZXVkZvqeKwjRHWOxWpg9XyjzpvJ6py7UVf1+Vkdi/juZ6nz3ZJX56I6Ynt1JDpgUudUVkduquOxjhDVOZa+E/C9er5R581kdc7dqKtC/ayO1Xz3s9RJ+YOsc04/lVHl3KL25rydZM6puirZGKh3AFa8ac5fG7Ym1yu736/2L1B4vmRr6JGsI3i+5OnZjO6W4fmSHJrpp1h9sKw6/WyMxXyHrLHxCvzVubBpsqi9MW8nGXOqrkqKTBgjN43xWPcoGQtUKsBXBPRofCqcZdw639HqStvJxUGZx7vJtSrXz+ZY08/IeoXINede/beBGturCw3JglrvA4RwWR1bm+p4rLuU1AUqqiN3qZP3IZFtPN/RPj/0N4SgzrkbdVWun9Wxpn+KLPMB1DlnVSvmSWJ7dSQ6YMo6p7I6clMdj40IMu/Xtte60kFFdWztUicDA3U83+2UOrkZoc65vbq3v+yhALJC/NUfTgIXvrD4vbCtukV0V7WjlXWBqgERATVhLm6oW8dGBHllqQtU/UWecLXELe5S97w5VubW6RHM7oAyt7irmTYra9xblevHdAPkzmT9r3QLXPpQycL2zjxgcuZUpZtcFpyRm854bAyjuICzQKXHksWhR7J2wVlqJjyWLA7NjKcDdVZ1+tmZF/N1Q/tzyZtz/sWO70XtlXk7SZlTcYZc8aYyf60mKJQFyvIDaUbuGmu5aeCM5/sGqfGTJyjkmXM3M2SV6WdzXstXZLmrkG3OpfJtYXt13lBS51RWR26q47EezKQuUFEduUud3NJQx/Md7fPjTX61DOqcu1FXZfpZndfyFVmenKDOufDbhY3t1XlDSZ1TWR25qY7HejCTukBFdeQudZJNUMfzHa0GUJ5foM65G3VVpp/VeS1fkXvd5Ntyb87FrCO2V0eiu5rUOZWfS8hNdTw2IoQ1zqn8XEIOPQrmeHoEszsA5shdd0DParrGVYV+dsYyvmOWs/As6ZwmZVUBb6T2ykh0vKQsUfqTHHgsITeV8diIEJQFqn7n4PlZEWscOfRIZiEkG093sPdX/YM8KCOHZvbGqkA/G/MqvoxJDzFBOqcrIIyR2hsj0V2sP2V6Hig8/TtWlyUPBVAWOVmB/ityadL01up31iQqNJLbaOTp7mNdvNwN0Ojc6/v42qhmYFXtZ59e2lfsvkfWrOlc8klq75NE9zX6dOzzQ/+PHD4jJ5kCn84ln05VVFm84JPcxidPdx+zT+dufVYpf/bp9X51IayC5Dh3IRt5bG+PRPcs2nMsZ2PkQjY6l+w5lbORHLopcjGp8nT3MdtzrmrlfkiVbHz/y94KIKvT/Z+Fvxc37K1jW3uL6J4lewGLuZc5z73ABXuBirm3uGxvne4+RnuBu7VXGwDH3Hv3XYLqgixWtTYGTp9TKxsXtffp8aJPx95fdJe35tIVcA7du6xmNZcGLvn0qLWN8rxw11QaGvt46NpXWRm47NXDVme7E5qVVfyfvfoOQXmVaQpenUteSe29kmgR+oMe9cgTotVVyVMDtHprxckKD63Ovb5oL2t/JnCfH/oXvzDL9tBPEQ+hPN2drHByWfXQE7inG0SF1pbAWajvG1QX5BohlNycZnlsr49E9yympWM5LZ0rf31HX09o8OdcSkunYlo69lFF5XP6wqJzOS2dq872zaoWa3fgbNG3EMqiLOiwSG5a5LG9RRJtMSWhUzkJIyd3OyQ6l5PQuZyE5NBPGRro4+nuZE5C555uB9VXWwRnfdxH6NjVBX9SfXdO1xGslqT2Qkl0vJiWjtVlyZYEptXIyWIPo4ET75hUA/WhfzWLSdU5/T0FaHWq+iALFuZW50ZrKrU2Ec5SudPQg1yRO89ZTr6TmznJY3uFJLr1qNCxrDByQWHggsJARYXOfUtrUOhUVujcaE0V1gbCWaHvMlRkuUJMq86lvCS1l0riINWxLDVx+h+kyMvASSeRl4GKUp17KuWv+x5anctanXtqT8XWTsJZrG83fH7o7xJCLLmZmzy210jioNGxrDFxSWPggsZARY3OPVWFS6NzWaNzT+2pxtpSOGv0fYfSKGs7NDqnf1yEdZPUXiyJg1jH8uOsc3X5suwjP51Lj7NO/ehchWXTsaciYnl1ri5OFn8snOQwal03iM7HX7Z8ANmWz3grjCtm4ILORW11LqJ1hufaQMXn2sjpv2CWzcC9vujbgjXfBq4EyJNLCV3cswB6XKe7kxXOPQbu6b5QobW5cMzPh+9AVBf8EWhxY5pdx/b6vPX0CLQa6gGI2Ri4mI2BC9kYqJSNAXuqJpZF72vMxtUeRq0nQpVXGw5neb4rUSFlQanJ9UFuyuOxvTwSbSXlnlM59xKXcs+5nHvOVd9D7pF7Hu5ljae7kzn3nHu6C1Rf7SCc9fk2w+fH2JNfk6lzb/ovO7U4PojtjZLozsZ0dCyno3N1/b3AXNeP6dS5lI5OVWudIFdrmEzJoZsSrJ5Z1+nuY9zjCdy+mnzUjsJZp287VAfkWQHZ6FzUSWyvk0R3NSWoUzlBE6d/0Qibzj30CwhYGx2r0ZByFTrJbXTydPexmpH9xHrG2TSjaVlbCGePvs9QIWVmgUdyc1blsb00Et2hmIOO5Rx0ri5W0gLWnEs56FS1FnKQHLopp5GDPN19zDno3H474FF7B2d3vsFQHQiPM+SmOx7buyPR/UoJ51ROuMSlhHMuJpxj1fWQcOQ27ni6+1jNhIQj99yMJlztDJyl+fZBhQyPMeSmNB7bSyPRHYoJ59jnh/6LX+2kPpx7f9GtJCScc9olzJJOvb/oF6cwSzr3VJqvxxnnqhcyHWC6JHdvrzYEzvZ816BCyqSA6dI5HTY8xJDa+yRx8OlY9ulc9ulc8ulU9unc047Z8ulc9kkOw9a6NRtrI+Dsk7sFPb4VMjzGOBc+Y/Ug9etTpqP/KOEEOlz4kGOiHvp7GshOtsYpApnIYyOCXAcyMVDv+mEWZCK555Fewni6g729aEmGBCSHZrrUF2Eff9mTAWR7Mv53et+BSx8lXtjO2AK6i8FYopKxxQ1j69iI4MYSlYwt7nmoaWyd7mDR2OLQTF+NGvvLpstH2irQHwCrKTNwYRdtUVthHi4JC1QURm4K47Eew/B0uS50UFEYW3se6SWMp7uZLIwcmukHGBVWhf1xTvzw6r/mxG7zujQII8exqRVtHdvq4Yu6P48X3VOtj9Cshpp7jYK8vbpYqV9qXkzt9X19danmxURFaYyKbkqwKglCM3VR8mBe82LgxlCou9oKOLvjfkEPW0X2p8sP5/Rn0mCT1NYmgQ6Xki1Q0SU53lDwxmMjQvAWqOiNHDqkX0eHOJ7vaDnbyKGd9qrGqpw/G0s1v/8b2/eHc+k7uwvbKgvtyPMO0i9QURm5qYzHehDT/BioqIzcpayf9tYEyfMdLSsjJ+rVWVXpZ2deyn9++H+xfX84p58CRJaR2ioj0F1MWRaoqIzcVMZjI0LIskBFZeSuoZbiCFnG8x0tKyOHdnoOU2NVm5+NsYDvkGVMLg1rmnO68sEYKVzY27/JSNVz/gI6XDLGZgYVjTmX1zjnUuIFKlokd1mUKQIWeb6vPlskh3a6GbVYNfrZIgv5DlkWu831ZOLc2/hE44VBI7GtRgIdL2kMVNToXNboXNIYqKiR3KWxi681f/J89zFrJHcN1vq0qWqs0vyskfV7hyyNcmlIRufikkcMV/byb/qpfqQjiQ6YPDpVlyXJXWV3aK04eT7Go4u3lzw69f4adjJDa+NZcdkMrb3o8x+ePJ0branUKt/PUlnj9xjXqMizMaQ6F6US20sl0QGTVKfe3nWTH1Kdq8vvR7trgCHVuSTVqfcX3aWo/ZXQ2tCwpIbW7BaBVOdGayL18y+7LYBst2W8a3FdYUkNXJK6sK3URdxKDdTbQz/KWlID9/mhf9hTUhPXzxtXJ6s4DNTbQ7+FUVIXh17qzVEL5zrffayrkifb0hm4G51V/x9z9JObBE+R/SkocFEnm9vrJNEBQ46GcFmnt1YDJ8s/dAYu6HSqfjJIvkcBnc4NDczRQGWpt61pjtY2w1kq9yJ6jCuyr6afzkWpxPZSSXTAJNWpLNW5unxZdSE1cEGqUxVVOEglh15KMKQoT3cXs03nxr2hNmvT4GyTOwtPkeXhAjOuc9Emsb1NEh0w2XSqBkRWd8y4kfNlNHA6U2LGja0Fm84NDStFnXp/0f+Twrzr3GhNpda2wlkq9x56jD8/9Q0dSHUuSiW2l0qiAyapTr099G1KSHWuLl8WLKSoc0mqU2+f4YF3tYZe6s9YIEe9nboqWcyg07kbnbXlcNbJfYke3Yos6xB0Ohd1EtvrJNEBk06nsk7n6vJlwYBO55JOp6p+FA2YccldOlf9uJKTp7uL2aZzNzZr6+Fsk/sTT5FlTYBN56JNYnubJDpgsulUDYgsBEjOyMnMDJvOJZtOuQbYdG5oWFKdij+Cs1rDmPWl61RbOxBnm9ym6MGtDsgCBJvORZvE9jZJdMBk06m6LFnJYDNx+kYFbDqXbDqVbTqXbDpVRa0MLSZc50ZrKrU2Is5Sfbfi81N/JgFSnYtSie2lkriX6lRdlkx9kBo5WS8g1bkk1aks1bmhYaWoUyVVbkxIdW60plJrI+Is1XcravRkGYJU56JUYnupJO6lOlWXJcsBpEZO5mdIdU5bw5OuU1mqc0PDkuqU7ylCqnOjNZH69ZcNI0C6YfQZfhk1cEnqwrZSF3ErNVAlVaaukpo5yYaSGrggNVBRauCGBkoN1Odn+OXNwI3WVGptRxwz9cv3LCqyPP9XpgYuSmVze6kk7qU6VZfl02+4rOJ8+g1ckpqiatlRT0ihtaFhSfXW3t/02ipT71tTqbUrcZbqWxc1Kj79fjkXpRLbSyVxL9WpuiyffsNlFefTb+CSVI/qD6qQSg69lIuqknSd7i7GJ6TAjXtDbdZ2xNmm71nUcPSj9HW/IUWdizaJ7W2S6K6Gx94Qrt59kZsM8663Vpcv8zPmXeeSTaeqNd/ZDa0NDStFvbXXd/3SKFKUHMasL11t1m7E2aZvWVQHZBmCTeeiTWJ7myTubTr1+am/PASbkZP1AjadSzadqqgyzSM3nUs2nfJ35mDTudGaSq1NibNU37mofsgyBKnORanE9lJJ3EsNlG1mQapzdfmSypDqXJLqVJbq3NCwUtSpak3mZ0h1brSmUmvz4izVdzgqsixDkOpclEpsL5XEvdRARanO1eXLsgGpziWpTvkGOzLVuaFhSXUqS3VutKZSa2/iLNU3MCpyT+lrMXUuSiW2l0riXmqgolTn6vJl9YBU55JUpz71O4ZwSgydfJe5Ho9GPN9dzDadu7FZmxJnm75z8fmpP4qIFHUu2iS2t0miu5oejQL1qX9Zg3nXubp8GWDYdC7ZdOpTvzEHm8R2Nnm+u1gXJWsyJlznbmzWbsTZpm9ZVOSwijoXbRLb2yTRXU02AxVtOleXH1ZR55JNpyqpRAN0Ojc0rAnXqSzVudGaTLjff9k1AmS7Rg9ZvytFA5ekLmwrdRG3UhOVpAauBk4eAipFAxekBiquooEbGig1UFFq4EZrKrV2LY6Z+u1bGxVZni0g1bkoldheKol7qU7VF2RkAql5N1xWXb48BECqt5ekOvX+pj8kUZkaWhsallRvra5NVviafu9bU6m1t3GWyg2QHuN6715Ka0h1LkoltpdKogOG6TeEy1K9tbp8X0xDe0lqak01QKpzSapT/kY6pJLDmPVcrzZrN+Jsk1sWPbg1HN0mH3S/nYs2ie1tkuiAyaZTdVkhRSPni2m6fFlc6i2YQHlSwaZHTTad8k+5wCa5y2Zfleqs7YizTt+zqHHrNpdO56JOYnudJO51OlWXJcsjZtzIyYKBGde5lJxOZZ3O6ZBV+RJi+gYxdLI1jFmPvNqsfYizTd+sqGGTBQhTrXPRJrG9TRL3Np2qy5K1BzYTp7/3BZvOJZtOfdY7eM8fI0JyOpdsOvX+qh/Ph03nRmsqtfYhzlJ9s6L6EWZc56JUYnupJO6lOpWlJk5/9QtSnUtSnfrQrQM4JYZO6qc+kJs83130ewM2nbuxWfsQZ5u+WVGRZQFCijoXbRLb2yTRXU3rp1PZZuL0k5iw6Vyy6ZRrgE7nhob1iOvUj/7gIZwSw5CNtwk1N2sf4mzTNyuqA7JOwaZz0SaxvU0S9zYDZX9BhgnXubr6sHw6l2w6VW9My4M+bDqXbDpV1yZrGXQ6N1pTqbUPcZbqmxUVWZYrSHUuSiW2l0riXmqgolTnyqloQIo6l6Q69V4fEfZV1LmhYaWoU+9vuk0Oqc6N1kTqz1/2iwDZfpFuY5bUwCWpC9tKXcSt1EQlqYErqaKhpAYuSA2U51ZlauCGBkoNVJQauNGaSq39imOm/qRNjfBTXIGLUtncXiqJe6lOlSxZ42v6DZdVXJcA1wBDqreXpDrl5SOkkkMvx/q3dPJ89zF+EnC109yNztqBOOvkNkW3WOPhq+mPc1Ensb1OEh0wPBuFcPXdB9EEnd5aXb6vpoFLOmNrsv5BJzn0cvw12tLJ893H91f9eHhNuaud5m501hbEWSf3KbrFGg9fR3+cizqJ7XWS6IBJp1P1XCHrI3RGTupHZKdzSadT8QNGobWhYUn11uJHsO9b0ym3NiLOUrlb0WNcoycLEdZR56JUYnupJDpgkupU/NRYuKy6fNknhFRvL0l1Kkt1Lkl1Kn7OKFzbaE2l1n7EWapvWtSoyIIFqc5FqcT2UkncS3WqLitMvJGTdQNSnUtSnYp/wL5auyZemT9qj2Gd7z7W1ctygInX493orA2Js07ftajIsnRAp3NRJ7G9ThLd1ZSjTtVlyXqAiTdx4ScYApd0emu+DYt1lBx6KfcYbPJ0dzE/FTl3Y7O2Is42uV/RkasalXUINp2LNontbZLogMmmU3VZshDAZuTCjOtcsulURZWZCjadGxrWMupUnnGdG63pjFsbEmepvmtR/ZDbDlKdi1KJ7aWSuJfqVF2WzKSQGjmZ2zDjOpekOpWlOjc0LKlOVWsy+2HedW60plJrQ+Is1XctKrJMcJDqXJRKbC+VxL3UQH1qBQCpztW+kSxskOpckupUlurc0LCkOlXvIMnQQqpzo7VnqT8vf9g4uiDdOPrSXzL49/fEBamN7aQ2cSc1Up/66ZB/xssqqTJN/1fkXOomquTWf4/W0EuZPv5nnO4uJpsp3I3N2rc4pejPi29u1HDIagSbzkWbxPY2SXRXfTFN4eqyZFmDTW+tOFk2YNO5ZNMp1wCbzg0N/5eiiUobDYkbrWmK1u7FWapvcdSoyG0Hqc5FqcT2UkncS3WqLksWSUiNnCQVpDqXpDpVGuRWglTnhoYl1an3V900/N9Tayq1di/OUn2Lo0ZPZnxIdc66+4+B7aWGhmRi+M/RTquvT0PLIgmp3lpx8tQOqc4lqU55LQmpziWpTmWpzo3WVGrtXpyl+hZHjYqsRpDqXJRKbC+VROtK069TdVkiH1IjJ7kFqc4lqU692efSIZUceqkfdsBqyvPdR785kKPO3eisXYmzTt+6qHGT5Qg6nYs6ie11kuiuqibkqFN1WbIeQKdz9d5myFHntJP/iq29PvRzrtDJ1tBLnTmgk+e7j/6OK3Q6d6OztiXOOn3vosZNFizodC7qJLbXSaK7mnQ6VZcl6yN0Rk5WDGSnc0mnU2lvN7U2NKx11FvzN+cglRzGbKyzOtnWhsRZp+9a1FvGslRBp3NRJ7G9ThL3Op2qy5Ksg87IyVoBnc4lnU6lt7xTa0lnak3uSNgkhiEbM7farJ2Is03frqhhkzUKNp2LNontbZK4t+lUXZYsibAZOVkqYNO5ZNOpmhL0QyndmIz/ysrQTC2dz+3Ao3PjplCbtQVxtun7FDVsskTBpnPRJrG9TRL3Np2qy5IVADYjJwMHm84lm06lD46l1oaGJdVbe33opyoglRzGbKzDovP1L5tEgGyTyH994SdwSefCtjoXcaszUJ9f/usL6bKKk3wqnaG9oDNQceUMXNAZKH//pnQuDmPW84rarK2MY3K++n5HDYesPJWcgYs22dzeJol7m4GyHwGv5AyXVZcvKwVspvae5756rE2UpVM91i5O0olpuc53H/2Lp/DoVzXuCtVZ2xNnnb6HUeMhSxR0Ohd1EtvrJNFdDY+1KVzYlk+XVZffd/g1wNAZogoFnYGy30WETnLopaxLVaSs091F392HTTbT3I3N2m842/RNiRoOuULYdC7aJLa3SaK7kGw6VZflK2e4rOJ85Qxcmmo9avg6RI/FlZsyr8OmN5PeMkvcjc3abjjb9D2JGg6p2WDTuWiT2N4miXubTmWbidMfikBuOpdsOuVvRyM3nRsa1oTrVJbq3GhNJ9zadDhL9Z2J+vir3HaQ6lyUSmwvlcS9VKfqsmRZx/oZubB+OpekOvX+oh8DglTnhoYl1aks1bnRmkqtTYezVO5M9BjX6IVV1LkoldheKokOmObdROlnhiHVubp8WR+Rqc7VH1TLTYJ1NHIyHNBKDv2U5QAzL093J+uyZDXDOurcjc/adjj75N7EU2S5QiSpc9Ensb1PEh0w+XTq8a7f2oRP52rgwjrqXPYZuFe9veHTuSFipalTWatzozVN09qFOGv1rYqKHBZU56JWYnutJO61JiqlqXP1jQjZs0SaOpe1Rk7mcmglh35KtiNNebo7mX06d+OzNiDOPrlLMSPrz08gTZ2LPontfZLogClNnSpPMnBI08jJ+MOnc9mncy4CPp0bIlaaOlVRZRLH7EsOo9ZrhuTn2192igDZTtGHhCyfgUs+F7b1uYhbn4Eqn93Va8TKZ+T0t7TKZ+DCs1Gg/GmmbAZOr62SNFBxhyFwozWVWtsRxyR98z2LGj1ZxSHVuSiV2F4qiXupTn3YIxukOleXL48CkBo4WVnqyShQ6T/vmkMv9eaAzhDtS3/MopIzcDc6az/irNM3LWo8pKfQ6VzUSWyvk8S9TqeyTufqW3S+hobL1285Q6e3VvuvMjMgR50bGjjjBqqGVh7bIPW2Nc3R2r44Sw17HF/6YAmpzkWpxPZSSdxLdSpLda6kyoKLHA2c3LmQ6lT6z7vm0EtxjhT1ZrJN58a9oTZrP+Js0zctajjkuQI2nYs2ie1tkri36VRdlqzumHEjJwMMm87pTAmbTvknL5Gizg0NK0Wdih8num9NpdZ+xFmqb1rU6IVl1Llv2V2qT/y9kdo7JXHv1Kn6TSVxBaeRk6uHU+eSU6fe3/SnOeDUueTUqfd3/YQspl3nRmvqtPYkzk5946KcyrMFEtW55JTU3imJe6dOpb94TleV/uI5ccmpRy2nMjvAqXPDwspTp7JT50Zr6rQ2JM5OfdeinMoiDqfOJaek9k5J3Dt16u3zVdY+5Klz9WOpYgF56lxy6lS1JrMDnJJDL/W9ZCylPN99fH/Tn7JAhjp3Y7O2I842fc+ibMq4waZzySapvU0S3dOwwRCipf8CTldV32EID7seVfuIldSpXLuQQy/1w/WwyfPdx/olCLkq2HTuxmbtQpxtcqviKbKsjrDpXLJJam+TRMdLNp3KNp0rm/JYh9wMnNyxsOnU+5vunSE3nRsW1nzrVHbq3GhN5tv3v+wZAbI9I/3xn3IauOB0UVuni7h1GqjoNHDlVGbIcpo4d5ooy6xyGrhhgU4D5XVQ5eniMGb9SKcya8fimKDvaVtDJ3rIdC7JJLWXSeJeplMlSR7TavEMV1WcLP2Q6e2FxTNQlVKyFEOmt5ZkOlVLqLQGmc6N1tRpbUScnfpuRfVDbnE4dS45JbV3SuLeqVPpz53TVdV/DsqSAafeXnLqlH/SHU7JoZf6yddaQtf57mONaefelcKwyXaau7FZGxFnm75bUZElF2DTuWST1N4mie5BWEJDtGzTWyubkgWw6Vyy6ZT/wjhskkMvZb2GTJ7uLmaZzt3IrI2Ks8ywm/Gl/0AMmc4lmaT2Mkl0T5NMp0qS3NyYbiMntyJkOpdkOuUWINO5YWGtnU7FD+au1jBmvVLoPFs7D2eZvj1RHZCHBMh0LskktZdJ4l6mUyVTrgoyEzc+eH4NLGQ6l2Q6lWU6l2Q6VVsTckNitnVutKZOa+fh7NS3Jz6/9OfY4NS55JTU3imJe6dO1W+Hy3Y7nEZOJkA4dS45dSo7dW5YWAnqlG8hwqlzozV1WvsPZ6e+SVFO5YkCTp1TqjZyF7V36u2kSdep9DfdHa/vkOIkF+DU20tOncpOnRsWllOn4qZfuLbRmjqtXYizU9+qKKeSEXDqXHJKau+URFtITp0qV73KXOOGPI2czNFw6lxy6lR26tywsJw6VSMrcwjy1LnRmjqtXYizU9+qqMjyrAinziWnpPZOSdw7daq+PyR3GpxGTsYNTp1LTp3KTp0bFpZTp97f9RtVcOrcaE2cPv6yWQTINov07apyGrjgdFFbp4u4dRqocioVcjnNnM+9gQtOA+WPqPXAuzj0UoJV9bJOdxfjw1HgbmTWLsQxQR++VVEJKlcImc4lmaT2Mkl0T8OkG6KlH1tNV1XSZXKuBA3tJZl+bT5NQqZzwwITNFDpL7q7NYxZF16ambUJcZbpOxXVgW7zujTIdC7JJLWXSeJeplP1qTl5qwKZGTl5poNM55JMp2os5NaATOeSTKf8jdWabe9bU6e1F3F26hsW1Q95roBT55JTUnunJO6dBir87W+6qnIv6z+chvZk7v5XpLJTby05dap+PFzuSzh1brSmTmvP4uzUNzYqstzpcOpcckpq75TEvdNARafOlVOZZeDUuZSnTvmeOvLUuWFhTbpOZafOjdbUaW1JnJ36vkVFlmdKOHUuOSW1d0ri3mmgolPnyqnMMnDqXHLqlP3oBZQSQyfDJxbW+e5ilsl2mruRWXsRZ5m+YVGR5cEfMp1LMkntZZLoHqSnokCFv/5NV1V/ACbTC2SG9sKk61T6JZTV2E5makY/FIPZ1rkbmbVZcZbpOxolUzoKmc4lmaT2MkncywxUlOlcyQwrqHMpM53KK6hzw8KabZ2qkZVrg1PnRms629YmxNmp71RU5FC2OJeckto7JXHvNFDRqXPlVK4eCepccupUXkGdGxaWU6eyU+dGa+q0NiHOTn2noiLLcwXy1LnklNTeKYl7p06lf3FOV1X/bxgmXW8vOXWqxiJUL84NC8upU/4eK/KU3DWHrx9qEZkff9kkAmSbRPpz2iUzcEHmorYyF3ErM1AlSdb1KkUzJxNbJWjggsxARZmBCzID5R9/KJmLw5iNjz+ozdrMOKbmh+941B8aSakEm84lm6T2Nknc23SqbMo0CpuRk4kFNp1LNp3KNp1LNp3yDUTYJIcx6y6qzNqmOMv0vYySKTMVZDqXZJLayyRxL9Op9P+w6arqZxblVoRMby/JdKrGQqq2KlVCa0mmt1Zb8nJtkOncaE2d1vbD2anvUVQ/ZGKDU+eSU1J7pyTunTqVnSZOv2sFp84lp06lnyxajaGTcvfXlvw63T30OwMuQ7SuLdRlbTucXfreREWWxQcunUsuSe1dkuiehuIzRMsuvbXKzx6R65kELp1LLp1yC8hP50ZG8TkoUOH/m7sxDNnNylnbDmeZvjdRHZDhgEznkkxSe5kk7mUGKvwpbLqqkhlWztTeen68hr+2b0Mf39/1Nywh01tLMp2qke2l8YqKBHVutKYJWrsPZ6e+RVGRZVTg1LnklNTeKYl7p4GKTp0rpbJIIUGdSwnqVL0NLRuHcOrcsLAS1KlqTUYWTp0branT2n04O/UtinIqBRecOpeckto7JXHvNFDRqXPlVB5j4NS55NQpzyw4dW5YWE6dyk6dG62p09p9ODv1LYrqh9ybcOpcckpq75TEvVOnypUs76haIicrB5w6l5w65VUjnJJDL8fat2zyfPcxfjxstdPcjc3adzjb5OZEt/j5rQ/XsOlcsklqb5NEx0uPRU6lv25OV1XWZWaDTW8v2XSqWpPZCjbJoZfhHZZ1vvv4/qajhfmW7TS3t/n5l/0hQLo/9K3/XlM2A6fXVx/gXNTW5iK6B8FmoOqNK1kbKzczJ0VE2QxcsBmokinFW9kM3LDADA1U/FBu4EZrMt9+1vbDMUMBuVNZheDUueSU1N4piXunTsXPEoWrKvdiAU69veTUqezUuWFhOXUqfvwkXNtoTZ3WLsTZqW9V1KwrowKnziWnpPZOSdw7dapcydqIPI2c1Ahw6lxy6lT63+ZuDb2Ux43aWQjBakjlAaAm3cDdyKxtiLNM36uoyDJskOlckklqL5PEvUynSqaMG2QmTj+vA5nOaR+rGA2Ub7xi0mVr6KXcOZDJ093F+DwUuBuZtZtxlulbHiVTrhAynUsySe1lkuie6jxQ/4wVotUP7skaAJneWnEyr0Cmc0mmUzUW8nQFmc4NC2u2dSrPts6N1nS2rW2Is1Pfq6h+yHMdnDqXnJLaOyVx79SpciV3GpxGTizAqXPJqVPZqXPDwnLqVLUmkwwmXedGa+q0tiHOTn2v4vM7/EnWp3PJKam9UxL3TgOV/hsiXFVtFskTMZyG9mRhwaTrVHbq3LCwnDpVJVVYSJ0branT2oY4O/W9inIqz//IU+eSU1J7pyTunQYq/WNzuKpyKnM0nIb2gtNAferOGeZecuilTApYSHm6u5hlOncjs3YrzjJ9S6NkynBApnNJJqm9TBLd07SQOlWS5ObGpBs50QSZzqVJ1ym3AJnODQsrQZ2K2wv3rWmC1l7E2alvWJRTebyAU+eSU1J7pyTunTpVTiUX4DRy8hgAp84lp06VBRkLOHUuOXWqWpNrw0Lq3GhNnH79ZcsIkG0v6B8BltPABaeL2jpdxK3TQNXHY2WBLKeZkyWjnAYuOA1ULaQyO5TTwA0LzNNARaeBG62p09qzOObpl29sVJ7K7AWnziWnpPZOSdw7daqcSsbAaeTEApw6l5w6Ff+tebWGXupDR62k63z30e+NytDA3disvY+zTd8gKZtSKMCmc8kmqb1NEt1TtVQlaYhWNuWqYNNbi3/WHLhk01uLf9a8WkMvpR6BTG/G31+FTOduZNamxVmm72yUTFmsINO5JJPUXiaJe5lOlUxZfiAzcjK+SE3nkkyn4m5uaG1YWNOtt+bvxcEpuSvR+4bViba2Ic42fa+ibMq4waZzySapvU0S9zadqretZVGEzcjJIzpsOpdsOhXf3w6tJZuhNf2pWsgkhiEbb8WpzNp/OMv0TYqSKTc3ZDqXZJLayyRxL9OpkimrIWRGTtZ8yHQuyXSqJoTnzx7hQYiYDP/KSZ7vLvo9AY3OjXtCZdbGw1mm707U207yAAmZziWZpPYySXRP06LpVPyf5nBVxcm8ApneXpLpVPyEWGhtWFhOvbX4P82rNYxZZ5HKrI2Hs0zfnSiZcjtCpnNJJqm9TBL3Mp2qP5uUWwyZGTm5esh0Lsl0Ki+aziWZTvn7NUhQchiz/ZpZOxNnmb59UTJl1YFM55JMUnuZJO5lBir9SXO4qpIuRQxkpvae58/auU1U+pPmxT3n0kpJD1b3hEwXsOjcuCc0M2ur4SzT9yNKpgwHZDqXZJLayyRxLzNQaRs+XFXJDGtmaE8oyAxU+ovmxaGX8uSP2sSb8d18yHRuL/P7L1tBgGwrSH9WomQGLshc1FbmIm5lBir+p2/mJAkqMwMXptlApa87LAydlCm9XK7T3cNy2YvhlcDlMnA3LmtH45iY377tUYkpNy1cOpdcktq7JNE9Dc8/IVp26a3VhzllaYVL55JLp/yd53qaDa0NC5xsA5WdetTRmky237XRcHbquxHltFfj6wrh1LnklNTeKYl7p06VK1nP6zEoXFVxslTAqbeXnDpVX8+WDIRT54aF5dSp7NS50Zo6rY2Gs1PuRvQYl1NZFeDUueSU1N4piY6X8jRR+iPecOpcOZVZBk6di38TmjkpdmGV7aGfMsVj2uXp7mQNqnCYdp270VlbDWed3I94iiwTPnQ6l3SS2usk0fGSTqfinzOHqyqdMm7Q6e1lnYF704+4QKdzw8NKUqeyVedGa5qktfNwturbE5/fuhzBqnPJKqm9VRL3VhOVktS5+re/sJg6l61GTiZyWCWHfsrMjCTl6e5k1uncjc7anDjr9B2M0ilXCJ3OJZ2k9jpJdE9TkjpVmsI6GjkZfiSpc1mnc+4BOp0bHlaSOlVRZQbH1EsOo9aPMJqdte1w1sm9iR7e0ikDB53OJZ2k9jpJdLyk06nSKUsjltDEpcci59JjkVP+IAOZzum1IUWdivsKgRutqdPahDg79Z2Kcio3OZw6l5yS2jslce/Uqfinr+Gqyr081CFFvb3w52aBin9utjj0Uj+1AJsh2rf+5hVS07kbm7ULcbbpWxVlU3IBNp1LNkntbZK4t+lUtulc/dFeWD8DJ09+tUsU+ljf1pY7GxnqrQ0La7p1qkY2TLfOjdYkQ3/+slkEyDaL9Ne2ymnggtNFbZ0u4tZpoKLTwJVTWTMqQxPnThNlFspp4IYFOg1U/HOzxWHMtkvoT21DHBMUkMuUCQsynUsySe1lkriX6VRJkpu7ltBwVcXJ9AKZ3l5YQgPlH6+ETG8tyXSqFmTpQ026961pgtY2xNmp71XU1CDFHJw6px/prO+CLmrv1NsJj0WrnTb/phuiUMrG/p//7/+98gL6eKxfmvQ59f7Qr6dDHzl0SK+gVst1vqN96AQBb7OZ8fFmNVY7DWdjvh1RxmS6gTHn3vTDOlBG7FeZ5MN/DKC7mIyxmaYeukEFY8SmMR7rlyZjTj3sH0pgjNxl7Pm9NAjj6Q72pk9TEEbsuRX1VXsIZ1++0VBfl5QHA/hyLvoitvVFoHuYfAXKhhPCyE1hPDYiyH1TjzDrlU097P/eIYytPQ/1Wud4upuJwog9t6LCapfgLMy3EkqYF/4/zr1+yJyNBCO2FUage5iEOfXQi4IvYtMXj40AwZdT7+/6+4zwRe4aaRkWZBjPd7QojBia6UcqFVYbAGdh3CXoiCWs27xuJWSYc1EYsa0wAh0vCXMqzojEpjAeGwGCMKfyjEhuJ4znO1oURuxeWG0GnIWFHYNvvdUgzLk4JRLbCiPQPUzCnHp86UdOkGLkpjEeGxEe+lpMis5VDHmERpKRex7sNSny9FM4aQbLGDk0Mz50pFlWtfxZmhf8lWUy30Gac1Easa00AqOPUgDXB8xDtLoqSRZIY2tTGo+NCPJKKHPq8aZffYcycjLWyxnPd7SYZsTQTI+uGqtK/WzMy/kam64B17zoXDRGbGuMQPcwpZlTjy/9AC2MkZvGeGxECMYC9dDpBcbI7YzxfEeLxojdGHu8vJy3S34hq7B1S/DfI6dvXP5jUFnYALqDJixSXowNbPkaxzrAh7739K+IvT602vrvwaFD+oNF/zPOd7i64aWY/d/IjSnjKdUKrtr8kGq/kIvToixySRy3A7biCHRHkzinojhiUxyPdYAozrHX+u2U56oL4shd4p5PwxtPd7Tszbkbb1Vzn72xMJ+RddcWCedc8kZq641Ah0venIreiE1vPNYBojfHfMDhzbkx4L8rW6Re67d5nzUj7dja812g+Val99kb6/Pu5+f3pxQj8OZc8kZq641Ah0veAlX/I/E8Dv8cFzXFhdfqyjZe2ddhKxK0sTH0R1pBuvF0t+Jfj4MvcpevHlwVVqX3WRjr845ZwmSmgDDn3vRbjFjaiD3fStcd+R/jdEdLvtjIoOodFfdFbvrisX7tQ79NjpXNsdfa4H8OAWPkNsZ4uqO91kcjnpuBMXLPzaiwKr3Pwlifd8gSJkkNYc6lDCOFC3v5N/2IKZSR6HhJmVNxaiQ2jfHYCCAjCGGBkroKukihOzImSDCe7lDv77qqQJdzY3pVa1V/n62xSO/IZa3LiN9H/orsXLJGam+NRMdL1pyK1ohNazw2AgRrTvmAw5tzY8DXeubUQ798C3vEMDpjx1q9VQ1+9sZCvbtZ3qSjyDbnkjdSe28kOl7y5lT0Rmx647EOoNvsyLZAfX9KhQpvziVvTunvMEMbqYO2qsPP2lisj15+62+0Q5tzSRupvTYSHS9pcypqIza18VgHSNqceq2PgD4vR9BGDh3S3TDMkzw/opl+KHNu6Nd8q3L8LI41+1NkeVSDOOeSOFJ7cSQ6XhLnVBRHbIrjsRFApg/km1MflRAujtwl7vk0vPF0B/PpFt6c23t7/csGCSCrs/UOLW+BC94WtfW2iO5p8Bao5G1hw9s6NgK4t0D5gFfCBW4MONe3QNX/bjxbLnsLu26CfmaVfHutovyYb4DMm/7xAbw5l7yR2nsjMYZVntP+M0aL3tjY9MZjI0Dw5lT25lzy5lT9bZx7I4bR6dOqrYrxszZW7N3Lz2/9/gy0OZe0kdprI9HxUro5FbURm9p4bAQI2pzK2pxL2pyq79i6NmKHdKui/OyNlXt3s7x5tf3qXPJGau+NRMdL3pyK3ohNbzzWAez3cGp9C/15/dH3FjBPsjn0SGa+Wt/W6Y5WwyfzB2ZINtPc8K8JV7X5WRwL+G6xIssVIuGcS+JI7cWR6HhJnFNRHLEpjsc6gP0WIMQ59vgZH5S6li6II7cRx9MdrYZPEhzinLsRV1X6WZyX8hVZKhmIcy6JI7UXR6J7msQ5ZV9/rA3JdVFTnL/09UWNwFzk5I6FOXLoUq9K65mEp7s/NX7yZApzzt2Yqwr9bI5l/FNkmZ9hzrlkjtTeHImOl8w5FVOO2DTHYyOApAC8OfWoT8g8L0vwRg4dkikQUyVPdzBfKuHNuRtvVaKfvbGO78h1x8idBW/OJW+k9t5IdLzkzam317E5dN3vSDlyUxyPdQQtbSDOqYoQxJFDj3rzfiUcT49gqfYO4W7EVaF+FufV/Oe3/tELxDmXxJHaiyPRPU3inKoVSCYgiCM3xfHYiBAyzqlPfQcECUcMHZJWkHA83bFywjl3460K9bM3r+bLm9xZ8OZc8kZq741E9zR5c+rxo3+CB2/kpjce6wjx4cSxx49+sRfmyG3M8XRHyw8nzu3Nvf1l1wSQVd/fXg4ELr35trBfdfp8VW/mLKK7GtQFyj8hORob5sJLdZKtqTJQ4ROSg8viQjN148taWGtc4G7EVZV+TLk3lvI9jhVZHq4q5QIXxbG5vTgSHTCJc+pNN5Aq5dZVTXH+0iTOqfQ+9wqA/oTPA63z3ZsaPplTIc7D3YirOv0sjsX8U2RZpCHOuSiO2F4ciQ6YxDnlHyIfVzXF+UuTOKfCh8hHhE3GeTNZnHM34qpaP4vzkr4iy2MAxDkXxRH7FSe3HmZKAvfenIreiE1vPDYCyGVgpnTKB7yWuMCNAeezZaD8LkDeMeqVv70eyc7JW1XrZ3Fe0lcPvIxDY7IWRnHEtuIIjHGVJaF2mEO0uMSxsSmOx0aAIM6pvMSRk6Feyni+o9XwSYegzLlxA6i4KtbP4ryir8hex705559SrgskthVHoHuaZkqnwpcBRrhpzl/76l8GGK/tK6kY4hhJx/bQpc6SpY6nu5kKJ1MW1JG7mukBVmlVqZ+leTlffxvX7xFd14Zp0rkojdhWGoHRR7k5kW1O1ccaZUDxYEJuSuOxEUFeiXnSqfBlgMHJWC9n3o494EAZMTQz7lJVVrX8WVkq+H+8fHtzLiojtlVGYAxoUOZU+DZAjQS5qYzHRoSgLFD+bYARYafM24nKiB2UVXl+VuY1fGWZzADIMuc+fmQk6kOTC/tVpjMNnka8oXHXXTcv0syptDe5sKnMX5qeIgMl8xmmRVKXsOeNy9ooWaf77qiNErkDkWNsprkxZWimVW1+1uYFfGmTyNDmXNRGbK+NRHchaXPq7UXfFMTsSG5647ERQW4wzI5O+ZDDnHNjyNcc6dTj+0eKXwgkd2Xcug/E3PtfNkoAycNhmZOQZS5wydzCtuYWMcZVbpRKuEBFc4sb5taxEcHNBSqaC1wwF6i6XulXmVvcvbmqzo859+4lfJmTjsKcc9Ecsb05EmNcpYcw51SaKhc2xflLw1S5XtmXkcV5a0lcoOzzYRBHDsPT65GmXFXnZ3Fewpc43yl5dy6KI7YXR6JHLEyWIVwUx8amOB4bAeRGrLkyBdDJuKbKhV0jLQ/Ytcqt8x3M/cOYX9Twr+KqLj+LY/HekUucLNPIOOeiOGJ7cSQ6YBLnVF2W7APUKrcua5rz16aUc+qhX1GBOWLokNzPEMfT3ZsszrkbcVWdn8V5CV8j1PUga7d356I4YntxJLqrSVygfj7ksiCO3BTHYyNCSLlA/ei3a2GO3JVz64GCzyXrdAfL5thMczfmqjg/m2MF3y1+/ugfAiPlnIvmiO3NkeiAyZxTca4kNsXx2AgQxDkVP6uw+r0R581kcc7diKsS/SyOdXx3s8R57f3uXBRHbC+ORAdM4pyqy+r1/LrjkXLkpjkeGxGCOad8yJFyzo0hX5nnVPpizmrsug36oUxXuarUz+ZYznc3a4i6zTVZOhfNEdubI9EBk7lAxcmS3DTHYyNCMBeoH/0OG8yR2+QcT3cwvwHwfOLcuAHUXJXsZ3Ne15e5UMs5F80R25sj0V1N5pyqy5LxR86Rm+Z4rCOEDwitVzb1oR/AgDg2dokLT5Y8383UhcqDDMw5d2OuavWzORb0T5HDk6Vz+qMRtev1TupXXPi0wiI6XhLHdgb18ypXBXHkpjgeG6+tW/750QJFgXOPb/2gBtyRQ5+kGTxb8vRTOHmUgjpyaGZcjqTb4y9bJ4B06+RH/4q+nk0CF6QtaittEaOPMi1X/R2o93fdiitpixvS1rERQfK0lAXqW/9Fs4wtTIaaS9s638FqnpRwpSxw+2x7VJl+zDZALk5uFohzLokj9StOOlBbzKmZ4I3NjOF4aFLCG7npjcf6taGKW69s6v2hP7kKcWwNHZIntkq1dXo0E72xmeZuvFWxfvbmFf3nj/75Obw5l7yR2iccie6BCkHCOVVXJeMGceSmOB4bEeQGQsI55ZkCcc6NEV9551T6TtVq7ErfTg6dKatYP4vzir6GSJ66Ic65V/1GQa1vC9tmXGgnZJxTqYhb0aY3f2lKOKfKmyxe8OZc8uaUTbuYLold2du9Vm9Vqp+9eT1f3rpNlgIP56I3YltvBEY6SDQknFPRG7HpjcdGgPRUEkK81mPf89MLzLE99EhOY6rk6adwnUvX+MEZuYOzqtLPzryUL2deBDyci86IbZ0RGH0MzpyKzohNZzw2AoQ50qmca86lXHMqzpHEDt6qiD9780q/vElHMUc6F70R23ojMIY1eHMqeiM2vfHYCJC+TpU6VJ+T81xje+hRyDWefgon9z1yjdzBWVXnZ2dewpczKRjhzDl9YMayRmqrjMDooowTpkenojJiUxmPjQByB+JxxKlKNZnVMDk6l1LNqbisEcPg7H7XtWJWaX7W5vV7aZN1GdqcS9pIbbURGKMatDkVtRGb2nhsBIirWuQklSCOHHokw4JVjaefwol/ZBq5g7Iqyc/KWLd3zFImlw5lziVlpLbKCHQ4fexBpjkVlRGbynhsBAiZ5lTONOdSpjkVFzVi99o+/rJFAsgqba3FSlvggrZF7bQtYIyqZ1qgkraFDW3r2AiQ1rTMyaVUpi0OPfJMW6efwvmatriDsqrIj5n24WX758+bbJZCmXMqtta0Rf0qC1uRixh9lIGqVAtU3NVa3JQWrtRzbb2yr8OyA8bY2DXUMunV5LjOdzPv7/r7ITU5Bm6krBRrH1Wyn8V5XV/iZB8C4pxL4kjtxZHonoY5MkbTtbZ2RxY3xYUIMdsiJ2kCd+R27ni+e1Qf4pJbH+7IoZ0eYJVWhfhZGqv1DlnSfGfkw7kkjdReGomOl6QFyh6QII3clMZjI0LINqc8TaDMuZEm3NIKVPp5p4Vd3jp3VVxV42dxLNm7myVOJi5km3NJHKm9OBIdL4kLVBRHborjsY6QvhocOvSw7U6YY3PoUljaeHpGk/sEqUbsoKwK8bMyVusdspTJNAFlziVlpPbKSHS8pCxQURm5qYzHRgQZw6rXQn9yrnlrKdecSr/ttIJe4npC01yravwsjiV7d7PESUchzrkkjtReHImOl8QFKoojN8XxWEdIP+4UOvT2pm/oI9fY3DXYzzsneCbh6Rmtpz/uQi7soKwq8bMylusdspT5zsiHc0kZqb0yEh0vKXOqqshewa+RwLpGbirjsRFBbkHkmlM515xLueZU2htZQTE8+ze1P6oeP4tj0d7dLHEyfyPXnNM3dPD4T2ovjkTHS+ICFXON3BTHYyNCEOeUDTUyjdg11JJDSDWe72Dv7+EXCwM3/OskWRX5WRzL9o5c4nyH5MO5JI7UXhyJjpfEBSqKIzfF8diIkLa1Uo/qgx7P0yDcsb2dO57veP5RFDyTkEM7fSeJtM+/7I8Asv0R/fW+yrbABWmL2kpbRHcxSEtUkra4IW0dGxF6jK4JtqbJQKVie2GXMZmEKtvW+Q4Wsy1w+2z7rAr/mG2ATNzYlr46CnHOJXGk9uJIdE+TuEBFceSmOB4bEVKxnXpU35G3bFvczp3Hi8X2czsrjGZbleRnaazbu4ufP++y/EOac0kaqV9pcpPX535SM1Ig1s5WoOpTOcLVM8nipjNeQndI3zFEsjkVP/ezOHRIhCLZQjNpaQvcTbJVfX/25psA5a1ripVsziVvpPbJRmIMqwiBuEDFZCM3xfHYiCA3EMQ55dNbLWyBGyN+jQ78eWtpk2RhV97284MmXBXmZ3Gs3rubJU6GEgnnXBJHai+ORMfTTIK4QEVx5KY4HusIaZMkhIibJItDl+QGgLIUTbB6IFnYQVlV7mdlXt6XMpkNoMy5pIzUrzK5dMyRBHo8kzGn6qKkNcyR5KYxHhsR5JVINadyqjmXUs2pul6pfiGOHIan1yFNtSrfz968xq+Q8sgEb8696q8tV+G2sF9xOtYwFxqSzEauOVWX1bPKNTnBHLlpjsfuzTlVFbfcsJgknUvmnHr71D80gzlyGJ8eZTVX9fvZnBf5NURSvsCcc9Ecsb05EmNcgzmnPn/0JyBhjtw0x2MjQsg5p7RShjdSV47IdWKO5PmO5f5hzLnhX8VVGX8W57V+jVCn8XoscS6KI7YXR6K7mibLQEk6QBupqY3HRvtBW6BkaoM2Upc2eQ8N2ni+Y2Vtzt1oq8r8rI3le0cubeFp0rmojdheG4kOmLQ5Vb/9IdMAxJGb4nhsRAjinHrYd2mhjhx6FBKOpztYNufc3tzXX3ZLAFnR/ZArrJkycMncwrbmFtFdDeYCVeZ6UeAat7hhbh0bEdxcoN4+whq3uGxune5g0VzgbsxVHX/MuS8v9ivnZFaCOefCU+WifsXJeNWzyQK6o8mbB0ufA1qNTW3+0vhXAeu140LSZ1sXhx7JVFST5Tr91IwMX61xi0Mz44e2ZXX7qkr+rMzL/VImYw1lzr3q++D1QLmwrbPQjqR2PU+uZnokojM2Np3xWL80O4ucXEpNk+tS0CNZ9eEsNhOckUMzj5411FlV72dnXuKXM1mc4cw5/VVzKCO1VUZgjKiME5Q5FZURm8p4bARI7wCEEPHrGovbKIvhZAlGmpE7KKvq/azMS/xS1rcBHyK/nHvVb3XAGbHQQ0yMPD0GNBgLVNogWa1NZf7a9M72emlfyLe+74EcY2tXd8QEkoznuxl/gxzGyKGdHlzNsSrHz8JYs3fIEiYVLXLMOf0wHnyRwoW9/Fv4fOQiOl5ay9jOoKIyclMZj/Vr055WuJC4p7W4cAtCWYomywqMEbta6SVRlVUdflbGYr07WMrkboIy5+JSRuzXWdgbSQ2FNGM7fVmv0Rm56YzHxmvTuzXhSvxdFiQa20OfOkGu2QfSePopXFjMyKGZj14U1VrV4mdrXrB//nxIJQlrzukGExKN1F4aidHHIC1QURq5KY3HRoS4nDnnb0RDGjn0qQd7SePpp3By2yPVyB2kVSV+lublekmTa4M059K32Ba2txYaCtacSv8KtsJNaf7S8B7bemWP9fu7/m0FlHlro7Ra5pyyD6NAHLFLXPdas60K8bM4r9ZLXM+76znEuSiO2F4ciR6xtK45FR8eiU1xPDYCyDpTG/9fTn2MyunqNrwRQ390esEEyfMdzP1DmXPDv4j7/sumCCDbFPnom4HiApfELWwrbhHd1SAuUCnjFjbErWMjgIsLlI94mQvcGHFmXKDsCaH0LQyjM4phFVfbA8eM+/Y9hMo4WVNrqgxcFMfm9uJIjHGV+6TKtRAuZdzCprgQIIhzKotzLolzKn0ceV0uRqcf1tVb1eJnbyzYexjLm/QT3pyL3ojtvZHogCnhnIreiE1vPDYCSH9qpgz9yd68NR2dmjBDa3bzI+HY2L23KsjP3li1dy/Lm2+OfDsXvRHbeyPRAZM3p6I3YtMbj40AwZtT2ZtzyZtTNYpSMUCcc6M1zbsqz8/+WMN3byty5/Ja6JyL/ojt/ZHogMmfU9GfY/UhLHkw/q8aN+fC42ag7AERax8bQx/1A1NIQp7vHmaZzt3IrMr9LJPl/VNkqU0wiToXNpcXtXfp7SSXTn3aL0DWe3Ar3rz6zyDT26t9SUkWTK3OVVx5+IZPcuinnIZOnu7LqnAyqMhNcnJbaFZWMX8WyYq/Y9aly2MFRDoXs5LY3iSJDphMOlWXJQ9XMBk5mUSRls7FNw8CV3FlkYFJtrcxydOjk/YhW5gkdzBZFf7ZJLcBOmZdutysMOlcNElsb5JEB0wmnYrzK7G5PvLYCCBqkXxO5fXRuTEJrkLCqRpFWaVgzrnRmmZiFfpnf9wN6N5WZMl++HMu+iO290eiAyZ/TsVCkNj0x2MjQNrkDD2qTU4ZcyQd20OXZLbG9MnTT+FkzoA6cmjmpgisUv8szfcDPn/0K+eQ5lyURmwvjcTopMzWKAKditKITWk8NgLENS9wH/rpKUgjhy7JbARpPN3hagBFLqQ5t8+3n79svACyjRf9P4tSF7ikbmFbdYvoroZ8C1SaLxc21K1jHSC9dxew15/w5t3i0CMxUubW6RlNpqsStzC00jktM+RPbQMckw2QG5O7H8aci8aI7Y2R6C4mY05FY8SmMR7rAOmtu9Ch+qd3eYCsXFvcxliKJgsqjBG7N1aV/dkYy//uX2W3TMkw5lw0RmxvjEQHTMacisYce6+ZaH2H6XpmqIfLdPUyrPWcEih/soBEjzpmOj6nBCpteC4MIzYqSE2/qvbPMn1LoGRKRyHTuSiT2F4miXuZgfrQL85WqbAua+Zfeu2zX5hzKj5hBi6Z89as9kcWEsPw7J9Sfqq0P5vz+r/MSVUDc85Fc8T25kjcm3MqPaWsq5ri/KWxMl+vHRdiJTWSju2hS/ruCxY7nu924mNK4MYtoFlXdfzZHYv9p8jyIAV3zkV3xPbuSHTANIU6Fd0Rm+54bARIT5ipR9+6VQl3bO9y95y9UMfTHS6rc+5GXRXuZ3Ws7p8iy/oBdc5FdcT26kh0wKTOqfiN1XVZ052/Nmxvrlf2dcRvrC4OPZLnOJjzYD7vYqp07sZcFe5nc17d1z0jD7cw59xD/wCsPryysF9zsmTW5/oW0AOWxIVo77oAY6UjN8Xx2Igg14GVzqn6+pSYQcqRQ4f0E94wx/Mdrf7fWxYcmCOHdvpydJ6sgv2sjFV9h/z8+faPG/04F5UR2yoj0PGSMqdqILqn1+MclJGbynhsRJBXQplTn/rDqjDm2MiR9VTpVPZGDqPTj/PqrWr2szcv7MublJtINeeiN2JbbwTGqMoNXhsoKVr0xtamNx4bEYI3p6rfoaYj9zzUyxhPdzBvBplGDs301Twbe335w8bJBVkZ/i1j+O+PxPlvQzX1K8w/jdlEd9EzLVHhgaSxFtbHRoDwQBK5sOXVHLok4/I/eVzsmfR/B3cp68cGdVbl+inLXl9Y03cX6zbpzL1uJzhzLjkjtXdGouMlZ05FZ8SmMx4bAfq2vrrzr9gdq7X+e2Ay0v+XZGlU6kGkjVwcjPlFjUlWvVWdf/bmmwHlTToKb84lb6T23kiMYZU7+D9jtLB/0hc1vYUA0h14cyp8qq8x9EffV0ameTPZm3M33qowP3tj9d7jWN7kAQjenEveSO29keh4Kd+cit6ITW88NgIEb07Z310i34ihP/oDPvDG8x0se3PuxluV8Gdvqc7/tmr79cW55I3Urzc18h/VUxLd04duxSPhHIviiE1xPNYR9E1FJJxTD/05LIgjhg7J/AdvPN2x9A0VzJKkxL7Oj1WPn3150V55JleGPHMu+SL16ys9i5DoHqpV6ArUi/4G+z8HN32F14ZEc+pD/+kSvoihQ/qGAYTxfHcnJ5pzN4lW5fhZnNfsJc4q7NcX55I4UntxJLqnSZxTeHR+3lOCOHJTHI+NCEFcoN7HWF6PEjBHbmeO5ztaNufciKYpV+X42Rxr9o78+fNjhfbri3PJHKlfczJgmCEJdLgkzqk4QRKb3nhsBAifUogXEr4L3hx6JM9OSLkYTp7EMUuSQzPjy26qrCrxszKW693FUmY19uuLc0kZqa0yAh0uKXMqKiM2lfHYCBALtsjJ6oBkI7dRxtNP4WRWgDJyB2VVip+VsV7vmKVMtgewsDkXvlfc2NZZaEduXixsTkVnxKYzHusOpXdsUojigjO2hx7JuCDNePopXHBGDs2Mj2xKmr3+ZWMEkG2M6F/3lrPA6bPWPwb1qyw8jIR2Qp4FKv31Sl/VkBZeG6UFLn3jsWNkaaGZCufSFndJ66VHpVU5fky0V6/ZK9FkPoY055I0UntpJMaN6YkWotmnEOs5ZGHTWQggy2o98K9X9mWknZGFyUhzZ2Sd72b8DYOaGheHdsbfx6ixKsTPxrxaL2PSRRiLnNTgSDRye2ckupcp0ZyKzohNZzw2AqQFbV1qc+8/+nZ1LWiLu4b7+fG1Jsd1upvJecbLEvtqrcrwszWv1cuaV9avzqU8I7V3RmL0MeSZU+92VUg0clMaj40Ichci0ZzyDIEycpcyGRc44/mOFj7w09hBWdXgZ2Us1DtkKZOlGInmXFJGaq+MRMdLaeZU+hOIvqqpzF/rb1/3K/s6bKhhjI3JUK+5kee7GTePuZGcmNcsqxr8rMwL9VImKyiUOZeUkdorI9F9TMqcysrITWU8NiKk8iz0KP1SRvf8suZTYwwnjwOQRk7kq7Qqv8/SvEb/ennpx5rrhoI050J5tqi9tNBOmBqderzr9y0xNZKb0nhsSAtTo1Ofn/65/46AHoVt/nUFHS0nGuOhnfEeuTqryvvsjOV5xyxnXlK/OqfFDB5BSO2dkeh4KdECZbtqcEZuOuOxESE4c8rHGpMjORnrNTnyfEer8ZM6Dnnm3H7/6rUK8LM5VulPkeX+R7Y5l8yR2psj0fGSOadSZb0uaorzl6ZFzakPrSnhjdjlTR6W8RjC892b7M25G29VhJ+9sVJ/iiwzM7w5l7yR2nsj0fGSN6eiN2LTG491gPqBkecVCQ+Qjr1agQpz5C5zz81AHE93tFd7JxkJR05uAJkk3/6yIQJINkTqZpFJpZQFLihb1FbZIkYfJbFrEytQcWFb3HC2jo0I0p9SFqi4sC0OPZK5r5St0x0s5lrg9rn2VtsDx1wD5OJkNoA455I4UntxJLqnIddCtNcP/Vn+Wt0WN8WFCEGcUz7ilWsrQl/vGHGucYF6r48jP6dmpdzinm8Dzbgqxs/iWLH3hVUHZFKBOOf0k9X1WLKovThvJ4kLVHosWfGmuPBaGUJknFNpdVsYOiSjgoTzVmqrVApeCHNu6FdvVbifvXl1X94kMrw5l7yR2nsj0fdJ8hao6I3c9MZjHSGtbqFDtbpJ7YOMY3PokkxEMMfTHS2ubot7vgFUWVXkZ2Us2ztkKfNS+825pIzUXhmJjpeUOfX18irjiTmS3FTGYyNCSLVApe2RFQE9kjsZxryZnGvO3eRaVeVncSzdu5s1RF66vTmXxJHaiyPR8ZK4QMVcIzfF8diIEMQ59VF/ePq8HCHVyG3E8XQHy+KcuxFXpflZHOv3jlzi5LkJk6Rz2k0sbqT24kh0vCTOqboqeexExpGb4nhsRAjinHrYph7EkduI4+kOlsU5dyOu6vOzOC/ia4i8dHtzLvzxw+vC9uZCQ2IEhYBTb/UTgc8JAXPkpjke68EMRfd6ZVNv+ok4iGNj6JDORJgreb6beX/oBiGeS5y7MVcV+tmcl/FlTm5RpJxz0RyxvTkS3VXNJZhzKpsjN83x2IggHcIDpVNxkSOGDunmKMzxfAfL5py7MVcl+tkc6/iOXObkyQnmnIvmiO3NkeiAyZxT2Ry5aY7HRoRgzikfciSdc2PIVw3nVPidw24MwzO2qOXB8v0vuyaArPge75nz7YDAJXML25pbxBhXny0DFc0tbphbx0YENxeoaC5wwVyg7BMONWcuTDJYzdXOwDHn3tP2wXijYZlzLpojtjdHYoxrMOdUNkdumuOxESG9/Ra6XjHkobqybnHok1xqzZfr9FM4eVKANV7WwVoV6mdrXs3XTOmF3Ltz0RqxvTUSo5MyFLXGhXDZGlub1nisI4QP/acIH/rfJXDG1jbOeLqDfeguIJQRQyvjIUcTrSr5szIv97/sA/a1uL07F5UR2ysj0X0Mi1sKZ39QXQ+Ui5vKPEL4KaB+aV/I27t+sQjO2NzGGU93M99vMiPDGTG0crOsVY1+duaFfDmTGQLOnIvOiO2dkeg+JmdO5TQjN53x2IiQPrYVuvT2Hja5FreRFsPJRAVr5NDMeCjVTKsC/WzNq/iy5jX3u3PRGrG9NRJjTMPk6FS2Rm5a47ERQW79KgBCh/LDiLeWHkacCj9z3kExPDf5VhX62ZyX8WVOhhL55lw0R2xvjsQYVwmHZS1QcY4kN83xWEcIP3C3CSH3LOZINocuyZXiWYSnZ7SQbcQOzqo2PzvzAr6cyeMPnDlXHyN73rioLa6F7Z2FhmQk4Myp9Cb3wqYyf2l6EnHKHiEgjBj641vK63QLe6vXPA8L5sfcjE6PVZKfhXndXsJkNoEw56IwYnthJLqPaVFzKgojNoXx2Agg/cHs6FTNjiHFnEuzo1O2TQZvxJ71q7eq2M/evKwvb7478u5c9EZs743EGNaQaE696V+K4PmR2PTGYyNA8ObU25t+PhSZRg4dkmc0TI083cFcP4w5N/SLuMdfNkcA2ebIm+R4JVzgkriFbcUtorsaEi5RD92zKXOLG+bWsRHBzQXKh7zMBW4MObe1AqVXW/oWdd0FfbuquCrGjxn3YMXevayMk0kc4pyL4ojtxZHogEmcU/V5RpkIII7cFMdjI0IQ59T4OuclBNpIoT9yO1fCrdMdyu3DGJtpbthXb1WRn72xbO8Wy5s8BsGbc9Ebsb03Eh0weXPqTf9cENqITW08NgIEbU49HvrZNYgjd+XI87MGxPF0B8vinLsRV2X5WRxr94789aIf8oc456I4YntxJDpgEheoN/2HBZgjN83x2IgQzDlV5mSmgTlyG3M83cGyOeduzFVpfjbH+r0jlzlZhWHOOX03vIqARe3FhXZ6sr9mqCoCVjt9VemZcmHTWwgQvDlVAy5VDbw5NwZ8rXCBsk87YMYkh+HpXutUWfX72ZsX+eVNHorhzbnkjdTeG4k2khLOqfr0gKQDEo7cFMdjI0IQ51QW51wS55R/2gHiyN2Lq+r8LI4lfHezxPXNcN1TEOdcEkdqL45Ex0vinIoJR2x647ERIHhzKntzLnkLlH7BANqIYXTG9q8mXNXoZ28s5Lub5U1mDHhzLnkjtfdGouMlb0499C90kW/EpjceGwGCN6eyN+eSN6fe3/U7xRBHDsPTD8jqrWr0szcW8t3N8iYdhTfnkjdSe28kOl7y5lTMN2LTG4+NANKd2jQJ3fn4CB8HWhw6JBM1Hik9mOuHMOeGfvVWlfrZm5fz5a3vhTVPOpe8kfr1JuNVP/3zIDBGVSZlPJc4FbURm9p4rAOkzyiHCP7hYjyYsDl0aExt65GE5ztcfdZZng8gjhza6Q6LsY+/bJcAsu0S3RKtTAtcMLaoX2OasaVsEaOL3YNrIEpZon4ecqfXFLm44WwdGxHk1qlUS1T6/NbinoeaxtbpDhZTLXD7VPuoGv2YaoBcnAwRxDmXxJHaiyPRPQ1TZIiWcm1h01sIELw55QNeqbYi9OWOAV/6vLXXb/02TCXcag3D09OZJlyV6GdvXsfXFOnbJR/O1ZcYnrcPqnhb2K84GTAkXGhHmkHCORVrgMVNcf5a/QAoEs4pf2qHOHLokAxLrW3rdHst/63kMgtjbKa54V/FVYV+Fudl/NfLQz4MjIRzLoojthVHoHuQEs6pmHDEpjceGwHk/oE3p+KXAha38ebNZG/O3Xir0vzsjfV7d7O8+WbJh3PRG7GtNwIdL3lzKnojNr3x2AgQvDnlA458c24M+JooA6WrO7KOGAZnvF+g+VaV+dkby/fuZnmThyHkm3PRG7GtNwIdL3lzKnojNr3xWAdID5OpP/YQCHFsbpNwPN3R/JkUysgdlFVVflbG0r1jljJZbaDMuaiM2FYZgY6XlDkVlRGbynisA9QX4J8XYcyRjlUEWZSgjNxGGU93tCq0JRyUkbuUdeprllU9flbGor1jljLfIflwLiojtlVGoOMlZU5FZcSmMh4bAXqIrvkMxpzKs6NzaXZMlNbtEEfuIK7q8rM4L95LnPQUueZcFEdsK47AGFfJbDxHOlVXJZmAwo3cNMdjI8JDd8fhzrnHl/6lLrKNHLok6waeJHn6KZy8swpp5NBM90STrUryszPW7R2yRkdCwplz0RmxrTMCHS8lm1Pv9qP8cEZuOuOxEUHuQRhzKmebcynbnKp3UaVUgDhyt+I+/7JLAsiKbd2PKHGBS+IWthO3gDGsnmyBqttJBqLELW6IW8dGhJRsgYvJtjh0yZNtnZ7hPqV4KmeLu5rZZttn1e3HbANk0vQjAJDmXJRGbCuNwOhjkObU4z18/35d1ZTmrw2V9nplX8f7l/7uQM2Pi5Ox5jP/Oj/aSaV24EbWyjz5WXX52ZwX718v+iAEc85Fc8S25gh0T8M8GaI9vrQgQbqxtWmOx0YEnyfXKwf10HdaYI6toUOdJEscT3czPt0i2Zy7EVeF+VmcV+8lTqYDiHMuiiO2FUege5rEBSrtJq+rmuLCa4O4QKXd5BUBHZKJuh5J1unuThbn4W7EVU1+FsfCvSOXOJm9IM45/SJcbUou6tebbhTUruQiOl4S59HqH7GlOEHGRU40/Vfk6i+g5Pas55XcniQa8pBx0U+p06CTp0cn7cP6yENyaGZ80kmnzqrUzyJZznfMEilDBpGBkw5CJKm9SBIdL4l0qkTK8g+RkZORhUjn4s/OB67iinCIZHsbkTw9Oml79hBJ7iCy6vezSBb5HbNEyj0Nkc7V5+CftyhgktjeJIkOmEw6lf6Rb4WbU6m/ND29OFVzoMyVUEbuUia3EpKP57s7H1pMQhmxq5m+MzT3qnI/K2N53yFLmWQVlDkXlRHbKyPRAZMyp971mxjIPWJTGY+NAHILYrp06s2+bAtl5NAh/dISlPF8R3P1cEZO1KuzKtzPzljdd8xy5iX5p3PRGbG9MxIdMDlz6u1FC05IIzel8diIEKQ5VRFCnpHbSeP5jpalkTtIq6L9LI2VfccsaTLpIdGce7cvXWByJLe3RqIjJmuB+tCvMMAauWmNx0aEYC1Q+q0kZBqxnTSe72BZGrlLWq/Dkmlff9lDAeTluNxwJS1wqTZY2NbZIrqTwVmikrPFDWfr2IjgzhIVnC3sGuvnBbwmx3W6Y0Vli7ua6Sd4VVZbCcc8+/L9hq8XfWyDMude9c/cK80WtlcWGuouXPVtbTKvdnoo0jPIwqYxDxC+bbpe2QE+9JeRKssWhv7IIzaMeazwnsCi0EhPYaqrSvWzLq/nS1dn7TV+0OVc1EVsr4tEj1PKMKfS88e6qqnLXxoeGdcr+zLi88fi0CHdMIYwj5ZTjNzVTie8Oqsq/ezMS/ly1s+hy5lz0RmxvTMSPVjJmVPx+eOL3JTGYyNCD9LVoXpoXK9sKj5/LG4nzaNlaeQO0qoWP0tjwd7XXtJkokKiOaef+sS0SGrvjETHS86ceh+7CdfA18PHCteN1cXL9FU1duDqG1FyZ0Kkh632RDhmS3KXAF/feLovq8LJg3g9/D8101E096oSP2tkud4h68q9XvtyLmkktddIouMljU7VNrP4gUfn6uplwODRuTSHOlXvqUlZDYvk0Mse/uvmwhTK093FnI3krpuhL1o1VnV+1sgSvmPWQPRSuqZQ55JGUnuNJDpe0uhUfLfgy7m6enkshkbnksZApXcQVmsbjd5M1kjuoLEK9rNGVvU9rF8v+rY+JlXnkkZSe40kOl7SGKgv/RwustG5unp59oJG5/Ksmjh99EY+kkM/9RkVCcnz3cu6vSRxMa2Su0yu2VnzsYr4s0hW+jOkPvlCpHNJJKm9SBIdL4kM1ONL8gwinSuRsrZDpHMpH5360YuDRWI7izzfXcz5SO6yuJ9Wq6w/a2Tt3zFrIGQdgkbnkkZSe40kOp6OFGo/p+Lb54Grq5f7Hhq9vaTRqfiW+mpt5zG0Y5vbyEZy9x6//7LvAsj2XbQ6L4+BCx4XtfW4iFuPgSqP8nRZ6Ri48th39rW4l8fABY+Bev/+lrui8nFxG4/rfPcx5uPiDh5rp+CYj99hO+FF/wwPHp1LO9UL24tMDa2V4Rr4SsjVTg9F+qhmwMqjTL/wGIKKn6o5AmW/lgeNbAx91L3tWhzX+XHtn2FxXNx1O/RDsayO37UvcNbIzYOO+WW/KQ+NzkWNxPYaSXTAMK+GcFGjN1ZX7485obn0Q3wBq+ZkFoBIhr0EPN+D8MjT3cVv3d+pWXVhcjuoxtopOGvkdkKHrCuXxwRodO5bPzNUewAL22v0hpJGp6JGx+rqZW1HNjqXfnM2YNWcpC00srmNRp7uMU2/OfvUyshq1VgbCmeNvutQV+5bAN/O6ZuEsEhqb5FEdzFZdCpadKwuPqyNzmmBiTnVqWpNymhIJIdOSqoiF3m6e6jP/khFUted0K2ow9omODvkXsKI+PItSwtS0bn0O0YL20sMDUnmY2F0qr7NIXbwhONcfVqzF5n1hONcesJxqlqTCRoWyV0CfEbl6R7T/IBDDs2MXyBSj7VPcPbIzYSOWZfe9wb3cb6dix6J7T2S6IApGZ36sN8QgUfn6vLlvsCc6lzy6FS1JjM0PJLbeOTp7mL2SO7gsXYJzh65ldAx69JlNUA+OvdqvjGrkvsVKQ3VhwkX0AGTRzbTVJxUiY13NFIAuQxMoHxlB0h/MbgwdEd3kjCBejPv9fNkzymKKdS58fEwTcDaGDiL4+5Bd6DEhcXQuSyO3FYcgQ6YxDkVxRGb4nisA6SvXH475t+VRLKR26nj+Q4Xf7/jqZ3OaXVWmwBnZ9wp6JDlTFYZJJtz2Rm5rTMCHTA5cyo6Izad8dgIEJLNqfhTOavf6I/+AjayzdvJ2ebcPtt+/rIvA8j2ZfRn18pc4KK5xe3MLWAMrCxP9dgSqGRuYcPcOtYB0rdlA+Zfc61sW9xG3Trf4epKZbqqiXJxaGebbT+1V3DMNkDuzB81A1ffjX+ewmtlW9ivsvA5+UV0H0O2JSp9wWFxU5p3KTyOrFeO60hfcFjc81hfj26Vbet0N1PZJgMDZX5RN9lW1f/ZnG8RfL3qP+Qh25yL5ojtzZHoriZzTsXfXVmXNc35a5M5p+LvrqwIG3PeTDbn3I25KvjP5nxXoMxJRQNzzkVzxPbmSNybcyrOk8SmOB4bAXyFC/2JP7yyuI04D5bFOXcjrsr3szjW+N3NEuf13I9zURyxvTgSHTClnFNRHLEpjsdGgCDOKa+5sL6RQ4f0ky6YLHm+o9X4yYqNydK5G3NVsJ/Nsap/iizTNFLOuWiO2N4ciQ6YzDmVfjdzXdU05y9Nc6VT/kuXMEduk3I83b3J4py7EVcV+lkcy/inyHKLQpxzURyxvTgSHTCJc8o+2lU7KOuqpjh/aRLn1OMrvI+wImzEeTNZnHM34qpOP4vzYr4iy7MsxDkXxRHbiyNxL86pOFcSm+J4bASQG7H2TFJ/7Af4kHFsbSOOpztYFufcjbiq5s/ivOSvyF5//ziXvtWwsL240JCsCajinIriiE1xPNZjmfZMUoQXvWNhjs2hR7L4Y5Hj6Y7mWy9Y5MihmfFzCbJn8lNl+tmZ1/LlTN7pQLI5p/t1KOJI7ZWRGH0MypxKH99d4bqx+kCXrM21zRy4+EGzwPkHxOCRl3cJeC5l4ZGn+7Lix3cXdzXT98Ozx7eXP+ygXJBW47U18nxt//5InHtsauexidFH85io9PndxNXAy8zxX/HqfQVMraXP7zYn4/9/FXqf7z76w+v/jqtCO2N3Wj3+YVfl7cWr/a/XkeP/98ZP4pJHtrb3SKL76A8tKVr6AG/iyqPchfAYotqCGKnwAd7mdh49WvZI7uCxyvrTvFrfufHdsVf9uTzko3PJI6m9RxL3HgMVPviZrqo+oST5DY+hveDRqfDBz24MnZTc/58YK1tktIPFqvHPFn0joLKxZ+qVjc4li6T2FkncWwxU+Bz224tzZVF2i2DRubQ8Zs4/h93cRqSH81UW0yo5NNNXrbNqVfxnj74tUB7lfkY2Opc8ktp7JHHv0an0+d10VeVR8gwevb20OjqVPr/brW0shmbCx3efm7lZHKv+P2v0TYLSKM970Ohc0khqr5HEvUan0sd301WVRpnooNHbSxqdSh/f7dY2GkMzUSM5NHOjsXYDzhp9y6A0yv0Mjc696ZfF/zGwvUdvSJP/P0c7bTvUiemqSmN4xglBpY//ikHDp3c7KPqof9qDxdGD1f/ESTjMqeTQTl+zzqm1NXC26PsHZdG2ad5enIsWie0tkmg/yaJT0aJj9Qm/XmWulR3J6Fz48G7Cqjl5UPjv0Rx6KaehMUVrTddFwSIxuRtUY+0TnDVyM6FHtTTKrIRkdK5+w/e5vkQyEttrJNEBk0anokbHatxlRYBG58KHdxNWzUkaQSOb22jk6e5i+PDucysjqVVjbSecNfqeQ2m0fZy3F+fC3ltje42hIXmgwpzqVNToWI273F3Q6JxWl5hTnarWZCxgkRw6KamPZOTptuif3m3qaqRbEYmvf9nEAWSbOPqbgpWLgXt8yDRRubiwrcRFdBdDLgYqfXq343Vr9fkr+bReWQzt6epfFgNVrfUAX5NhWVwceulT6jrdFxXLxsWhmfExDPVYewTHZHzlRkLH/Hp9k4GAR+eiR2J7jyQ6YPLoVPr0brqsGnlJbnj09pJHp6o1maLhkdzGI093F7NHcgePtUtw9sithI5ZHuUWhEfn0qS6sL3H0JCMe02qq52+rDSpLqzf0EgvTY8z66UdoT4NJDMMnPF6N854upsJ30WSVnp4NfVqP+CsjJsGHbKUybQAZc5FZcT2ykh0wJR6TkVlxKYyHusA6dEldOjxox2HMja3UcbTM5o8ANUT6HMre2W1SXBW5jsJpUxueyhzTv+hG4seqb0xEt3FZMyp8MNaHW4a85emn9bt1/aF1KO9P6c8dUlu5XpOWae7mQonEyyc8bIwMuMXAjXNqtI/O+N2QMcsZxITzpwLP9XU2F5aaEhuEcyMTtWtKvPWPwc3rflrw7NliKC/y4Ek87YeX1obQ51z7w/9lVSoc277Xv3ba9X4Z4HcCHgSKIkOgc5FgcT2Akl0wJR1Tj0+9XtPEEhuCuSxjpAEOlWPHnKLQCE59EhyEuZ4uoNlc87dmKu6/myOxX9HrtTzfZdX56I5YntzJDpgMudUDYgMHMyRm+Z4rCMkc05VhGCOHHoUpkue7mDZnHM35qriP5vzbYEyJ1Uucs45/cMHLHSk9uJIdE+TOKfiowmx6Y3HOkDy5lRNytJtZBw5dEjuZ2QcT3ew94f+oiPmSuduvFWNf/YWNgJe9ads4c255I3U3huJ7mny5lT0Rmx647EOkLw5pfsfsEYK3dH3YqCN5ztW1ubcXtvbX3ZTANluihYxpS1wQduittoW0T0N2gKVtC1saFvHRgBZsWvfJFGebItCd2SWLmvrdIeyv8GqXFuYyJdHyreqyY9ZBsh06QM+dDlXv/FsG9EL2/sKDfkj5WqnR+LrdXy7+9qGqnVtcVOYR9ArhTCn4hPJ4q7BFvFwFtp56MMvpJG72ukeq7Qq3s/SvMKv0ZFFF9KcsxKv1rSF7aWFhroLl4yqA1Y7T9KEgzS2NqXxWL82SXMqVG6rffQnZJk38haNkUMzo6ZXY1W7n415gV/GvHJ7cy4aI7Y3RqLHM02LTr09dI2FMXLTGI91hGTMKR/sWtBWBBns695Cmnk7H/oXysgyYtKMOqui/OyMlXt3sJzJDIAsc87//qSpvTJvJylzquYtucuhjNxUxmPdo6TMqTwzkkOP9EqhjOc7mquHM3JoZzyhqrOqxs/OvGQvZ/JYC2fO2UdaMDMS20sj0Z3UocDM6FR8/CA2nfFYB0jOnIpP++tC0CF5PoEyb6YeG2WZhzLnbh4bqxg/i/OKvcTJFUKcc1Ecsb04Ej2uSZxTURyxKY7HOoCOJB5DnAqP+4tCd/Qy4c1byd6cu/FWpfjZm9fr5U2mI3hzLnojtvdGoodVBwQJ51T0Rmx647ERQCZ9eAuU3K1Y1UihO5JG0MbTHSo+7xMT+zpBVgl+9uV1evmSS4Mv59I+1sL2vkJD8kgIX07FHcjFTWH+2pRoTuVVjRx6JEahjKdbWV7UyKGZ8Qf06qzq77MzL9K/XsenAa9nJDgLnCx9WNNI/SqTW/s/BtBdTBnGZpp6r28nPFeEeA4hN43xWL82vIW9XtlU/fGv3DtIMraGDkkRBGM83c3UhUq3saY5t58b3/+yFQLIamt9aC1viXNvi9p5W0B3NHgLVI2qDEd5W9zwto6NCPLKmhoDVRGkQ+VtcdnbOt3BorfA3XirKvyYb+8s1Tty5ZvcWfAWOOlm5duitt68meTNqRpVWWjhjdz0xmPdoZBv65VNVQRZGuCNrW288XQ3k705d+OtavGzNxbsHbm8yYQBb87Z50sgjthWHIGOl8Q5lR5FVrTpzV+avDlVAy5LF7w5NwachXag6seopbWaLhf3fBfI+vZe9fjZG4v2HsfyJksJvDkXvRHbeiPQ8ZI3p6I3YtMbj40AYZ50KntzLnlzyn4eCdqIYXDGBpR6q5r87I2Fe3ezvElH4c256I3Y1huBjpe8ORW9EZveeGwEkO5gfXMq/SxOc88ZshLNm3H9MObc0K/eqjA/e/PqvbzJygVvzkVvxLbeCIxhlVm5SoAQLXpjY9Mbj40AwZtTPuCYJ50bA770JUpLd+gjh9EZt6uKq8r8LM7L9xInczPEORfFEduKIzDGNYhzKoojNsXx2AgQ/g49duhFP6wGdWwPPZIFpEqBdfopnHBwNpu5mSSrLj87Y/HeMcuZPLfBmXPRGbGtMwIdb9x1192LZHMqOiM2nfFYBwi/sbiJIJMMlLE5dEiesaGMpzua/1QjlJFDM6PDmmZVlp+VsXbvmKVMHoShzDnd+cJjJKlfY/oGQhXci+h4owdLGdtp6uv1Qz7ejgKA3HTGY/3a9CAZqPoJh+eSHsrIXWMtSuGM5zvam35hGcqIoZmeVtRYleVnY16719j0B2SvMYQx55IxUntjJLqHyZhTdVVyj8MYuWmMx0aEsKQFKv1Ww4qwM+btRGPEbo09/rI3Asj2Rj76LqCxwAVji9oaW8QYT4lW02KgypgsEGVsccPYOjYiuLFAxV9JWdzG2Drf0ZKxhd0bq1L8mGMPr9drbKSHlWOBS8bY2t4Yie5hyLEQra5K5iQYY2vTGI+NCNKfetxfr2zKRromxYU9j/R1H9ecuE53K/ZrHDUnLgytjO+8yKT4qFL+LMzr/Roaf1pEY5KKSRipvTAS3cUkzKm6KnkegjByUxiPjQjhD2H7tU+c9BzO2B76FD4ovs53O3WtsiDCGttpbiSGuqsK/OyOZXq3WJ9kl8UeyeZcckdq745Ex0vunKotfxkPuCM33fHYiBDdOVe79bJowh25K1Oen1GQbzzd4bI6527UVSl+Vuf1eqnzZ5GHc0kdqb06Et3TpM6prI7cVMdjI0JU51ypk5sW6sht1PF0h8vqnLtRV2X4WR1r9RnZ/wr97eFcUkdqr45Ex0vqnKobSh5ekHXkpjoeGxGiusTpfAN15C51clMj7Xi+42V3zt24q3L87I41+4ysv0qIGdO55I7U3h2JjpfcOVXu5CED7shNdzw2Isgr8XjiVPxhocXtzHk79piDpY4Ymul7UNe4qsbPxliyd/9qbOTRDcacS8ZI7Y2R6HjJmFN1VfLsAGPkpjEeGxGCMafibwitCDtj3k40RuzeWBXjZ2Os2Lt/NTby7AZjzunPt9XGyKL2xkI7fc9xY2S101cVfyZxcdNYiBCMOWUjjcmRGDokRSPmRp7u66x3S6Q/SDFyl/dePjXHqhg/G2PF3jHLmDyxwZhzyRipvTESHS/lmFNlTEYMOUZuGuOxESEYcyoaI7YxxtMdy4t1GCN3b+zjLxsjgKQa+3rVL7uWscAFY4vaGltE9zEYS1T6CcvFDWPr2IjgxgJlBXLl2MLQIf0CaSXZOt/BTHwZW9izeEmxj9ogOKYYIBcmj0YQ5lwSRmovjET3MAlzKv7K4bqqKcxfG3aL1yv7OmykIYyNPY8090XW6W7FH18gbDYzvKuxqsTPxrxcrxSTEhPGnEvGSO2Nkeg+JmNOfb3ou7I1Ka6rmsb8tfG3RNdr+0rqkyK9xFxWII3toU9yKyPJeLqbST+13RyaGb/Eo9KqBj9L80K9pMnqCWnOJWmk9tJIjD5KtNowDtHir1AubkoLEcK86FR8WlwRLmWywsOZt2PpijwjhmZ6RVZjVXqfjXl9Xsa6zetmgzHnkjFSe2Mk7o05VWkm44U0IzeN8diIkKrp9drmcpqxvcuZ7WGFZupjGpKtcPbUTHdFpVXNfZbmhXlJk9sS0pyzN0rqGX9hv9aknXrvcwE9VGluDNHC38t1a1NaeK1cR5XR6Trs81OYGdkaOiRLBrKMp7s774/voMy5/f7HR9XcZ3EszDtyifNqGo3J40oUR2wrjkDHS+KcSp8zWBc1vflL01OIUz7g8ObcGPD1NOLU93gX5sKQcMQwOPvPh3xU5X32xvK8x7G8yX4DEs656I3Y1huBjpe8ORW9EZveeGwEeNFvciHjIiebCTBHDj2S1QMZx9NP4XoSXM7IHZxV8X12xgq9Y5YzuXQ4cy46I7Z1RqDjJWdOpX9y7Kua0vy1KdmcSv/k2BHQoTBJejOes0gz50bO6upWNfhZHAv1HsgSJzcLxDkXxRHbiiPQ8ZI4p2KyEZveeGwECIubUz7gSDXnxoCvSTJQ+qkm2CN2Jdx6uBFtn3/ZEwEka9ZXfSh9tXldWWkLXNK2sJ22BYxR9Wf/QCVtCxva1rEOEP7hKvbnR3+Xq7yt5nK+rdMdLf3D1XMz3V81VpX4MdE+Wa53yDImlSSMOReNEdsaI9DxQqKFaOFfAPuiprEQwBMtBQj/AtgRNsI8mOdrpVgIN/JVvVXRfvbmlX15kykc3pyL3ohtvRG49xYoG9aq2dZVTXHhtUGcU48vfS8KmUZuI46nuztZnHM34qokP4tj3d6RS1wn8ZoinYviiG3FEeh4KeGcCv+X+vZJbHrjsREgeHPKBxzenBsDzpUtUP7vq8g7tvZ8F2jCVVl+9sbavbtZ3uQxFwnnnH7+vcrtRW21eTNJm1OPL/19IeQbuemNx7pDcStyvba5iiGGYY7toUsyLvX4v053M3ErcnFoZnRZnVVdfnbmxXs5k0uHM+eSM1JbZwRGFyWxaycyBPv81nscztjadMZjI4J0pwq29cqm/N0wGGNrMtQry3i+26lHj+eHOSQZsauZXoLUWNXiZ2Ms2DtkGfPNkU/nkjFSW2MEOty45a5xgDGnHl/6cXsYIzeN8diIEIwFyt5xhjFyO2M839GiMWIHY1WJn42xXO+QZcy3RT6d08/9Y14ktTVGoMMlY07leZHcNMZjI0LaO16X2lzFkI7DGdtDl8K8yNPdTJ4XyV3Ouh3NsirFz868Xi9nvi3y6VxyRmrrjMDoYpgXncrzIrnpjMdGhJBlTuV5kZwM9ZoXeb6jxSwjdjXTHVZjVX6fjbFG75BlzPdDPp1LxkhtjRHocCnLnMrzIrlpjMdGhGAsUHFeJLczxvMdLRojdm/s6y9bIYBsK0T/7aWePRIn613Ni4vClfUSe92R9ebMOt39C74ClfZBFjZ0rWMjQNorDtzXa/hXmsWF/tTD4jr9FE5u93r0WBya2c6JX1WlHzMMkPuSoYYv58anHC4h8EUq9A++eHr0rycIPncEKvpiY9MXj3WA9EcmIULpkiupNWxxoTvQlaIFW8TQyvgtZJkQv6rmPuvywryuvG+Bawyhy7mqO2WVhjByoYcQxtM9ninBnIrCiE1hPNYBojDHsjBy11A/P7JDGE/PaEEYMbQyfp9FhVWVfRbGUrxD1pXLlA9hzoUPGSxqoys0Ind1PdevRvqSoi42NnXxWL/0Nc6HzlWvZXsVCUZu44unn8IFYeTQTHdYfVWlfvbFcr5D1pXLygRfztVvzD/fccgvYriyl38T78gwAh0vZZhTURmxqYzHRgC5jKqdw2W8P3TZhjBvTWt45FmgdOsEyxixy35PYuqtCu2zN1bj3c3yJhMevDkXvRHbeiPQ8ZI3p+Jbnuuqpjh/bXjLc72yryO+5bk4dEhuZxjzYO4fypwb/lVc1dtncSzKuwMlTjIJ4pyL4ohtxRHoeEmcUzHhiE1vPDYChIRzKv5Iz+r2xps3k705d+Otau6zNxbm3c3yJnMzvDkXvRHbeiPQ8ZI3p6I3YtMbj3WA9J5n6M/X24tsD2Km9ObGiF/Pacg7p+Jbn4vD8Nw8Q1btfTbHAr07Wj2QxRnmnIvmiG3NEeh4yZxT0RyxaY7HOkA051jdsFLqwBy5TcrxdEfzGwBTpXPjBtCpskrwszjW6U+RpQMQ51wUR+xXnC7QeDgh0QGTOaeiOWLTHI91gGjOsUq5fmC4sgnmyF1Z8vwwhmTj6Y6WzTm3N/f9l10RQFplv730kyrLtsAlcwvbpdwCuqdBXKCSuIUNcevYCOCLXKB8dSpvgRsDzrkyUvq1iEq8xV13QaeHpNx3leXHlAPk4uTOq5QLXBTH5rbiCIxxldukKrgYTZbeemNmYVOcB0i/jrVe2tdRt4Y8N8Icm0OH5HRl3DrdzVTGyY0CZWymuXEDqLgqz8/iWMN3ixVZrhDinIviiP2KC3NlaCilHNvpy4opR2ya47F+aTTnWP0hkz+frOu9ssTmynW6o2VzHu7GXNXpZ3Ms5p8ieyX37Vw0R2ybcgQ6XhIXqPQJ/3VV01x4reRAleDrleM60if8F7dJOQ/mcy5SzrkbcVWpn8WxnO8O1C3jldy3c1Ecsa04Ah0viXMqZhyx6Y3HOkDMOMf8JwAxV5K7Mq7XpbW+8XyHyynn3I25KtjP5ryqr8iyoGCydO5D9zJr02thW3PeTjLnVDRHbJrjsR7KsHeyrrOpD53Z4Y2NoTuy9GON4+lupRJOFm0knHM32qpeP2vzov7r7VWmemhzLmojttVGoHuatDkVtRGb2nhsBAgTpVMfH/ocCG/k0B9ZP+CNpztY9ubcjbeq58/evOgvb16AfzsXvRHbeiPQPU3enIp7leuqpjh/bco3p3zEIc65MeJrunTKdz6Rd+SebwN9qKxq/SzOS/oSJzM5Es65KI7YVhyBe3FOxYQjNr3x2AgQEs6p7M255C1QL/qzf/BG7t5b1epnb17QlzeZouHNueiN2NYbgTGsEg1VXKDiIyW5KY7HRoQgLlDxkZLc81CvTOPpDub+Ycy54V8S7ucv+yaArPwe25/XFZa4wCVxC9uJW0D3VG+TEheolHALG97WsQ6QNrwCFrcqF5fFrdMdLe4uLw7N9BOOGqsi/ZhqP17JV6rJrQljzulEWk+Si9oKC814pq1mehyiMDY2hfFYv1R7U7VbCFAZIr2ulS1wI0OYb4nS59JKt4VhcN46mGqrCv2szcv40ubbJT/OJW2kttoIjFEN2pyK2ohNbTzWAWKeOZbzjBw6JBVtPUqmUfnRD9zD2GzmxliV5mdjXr+XMXnMRaI5l4yR2hoj0AOaZkanojFi0xiPjQB9T1+pgURzKieacynREqWVBLyRw+h0UmiiVV1+1ubFe2mTWwranEvaSG21ERijGhLNqaiN2NTGYx0g7ZGE7lSEHsrLLyZINrdJNJ7uaL7VAmHk7oVVRX4W5mV7CfO9kR/nkjBSW2EEuocpzwL10K+v1jsA66KmsfDakGhO5URzLiWaU/UfI1I4wRs5DE/fp5poVZGfvXnZ/lUb4c8b3Ug059IXDhf2K06X43qzdBH35jzcx4tutcEcuWmOx0aEYM6pjxfdFUKqkUOPRAXWNJ7uYG/6sRwYI4ZWehpTY1WDn42xUO+IZcy3RX6ci8aI7Y2R6IAp1wKVyrR1WdNYeG0w5lQZEyUwRm5jjKe7O9EYsXtjVX2fjbFE74hlTC4cOeZcNEZsb4xEB0zGnPp4GT+Dcy02yDFy0xiPjQjBmFMfL/ojvDBGbmOMpztYNEbs3lhV32djXqKXsZ5pr6GBMeeiMWJ7YyS6i8mYUx8v+g/CMEZuGuOxESEYc6oiyOQCY+Q2xni6g0VjxO6Mvb/8YQvkgmwL5K2L9P8zlrjw/1yN7Yw10V10Y4kK35xvrIX1sRHAhCXqvVbK5/X7vx+J8weQRKVvzjeH4Rn17/N69v5SuwKnXLsgNyc9/ffqQdhi0GXvHwPbmwsNSWr/52inh9+eZ/85sGkuBJD+/Gu8sgP4P7TCHFuTsb7u6P8Z57sdvwP+N3LjDlBzVYKfzbFO78g1S0q1AnPOxZwjtjdHogOmnHMq/DxMX9U05y/1bax+ZV/Gw37HBObY2s4cz3c72ZxzN+aqCD+bY6Xekcuc7Yq8vzg39mOuOxApR+pXnP7M5H8MouMlcWynqZhyxKY4HuuXJnGBsj9Fhjhy6JBkLjKOpztYeZPnOWScczfeqhY/e2PB3pHLW9cTa5VzLnkj9etNOgptBDpc0uZU1EZsauOxEUAuAzOlUz7e0ObcGO81Xzrl8y7skbuyt+3qTFm1+NkbC/buZ3mz3ZH3F+f0JzWQb6S23gh0uOTNqeiN2PTGYyNA8OaUPQVCG7FroKUZpBvPd7Cvt3d5xIEw54Z+1VYF+Vkbq/anyPI0jAXOuaSN1K823xtJ7SRvbKevKnojNr3xWL80TZOBkrUB2khd2kQHtPF8x8ranLvRVlX5WRtL96fIncFrlnQuaSO110ai4yVtTkVtxKY2HhsBJE8wTTpVn/SQxzGII4cOSYUEbzzdwbI35268VW1+9sYC/imyPJoj3ZxL3kjtvZHoeMmbU9EbsemNx0aA4M2pquBCwpHbeOPpDpa9OXfjrSr0szeW8U+R5c6CN+eSN1J7byQ6XvIWqB/910dUcOSmOB4bEYK4QP3oR3SQcOQ24ni6g2Vxzu3Fvf5l0wSQld66LpW4wAVxi9qKW0T3NIhLVBK3uCFuHRsRXFyifrRHJW5xWdw63cGiuMDdiKty/5hxr9wTeIosUz3EOafdrOfJRe3FeTtJnFOfP1oXVcateFOcvzY8maxXPvVbnj0gzlsbI85KIFD17bfnrbN6rlzYdRd0MHmifK0q/SzOS/m6ZSQmxDnnv9TU1F6ct5PEOZWWuHVR05u/NHlzKnzA7rk/uutcjybrAlp/FYIyejDm4YZ+9VZV+tmbl/LlzQvvV+eSN1J7byS6p8mbU9EbsemNx0aAMFE6ZX+kgHQjdmWI1EfwxvMdLHtz7sZb1ednbyziO3J588L71bnkjdTeG4mOl7w5Fb0Rm954bAR40fcSqxgIHXp90XewoI7toUsyLjDH00/h5NEOGUdO7gDNtSrRz868jv9603e5MEc6l5yR2jsjMfooRUe9HxCiRWdsbDrjsREg/BxQClE/GySTDJyxvY0znn4KJ27hjNzBWdXnZ2dexJczmQngzDn7H0s8kRD7lSYTU+1MLmD0MThjM01FZ8SmMx7rl4ZPRsbr+NFP7EAZm0OHZCcCacbTHS19Ark5NNM3hmZZVeZnY16+lzG5NBhzLr15s7DQQfgKrQRfTkVfxKYvHhsjGOdF56rbcikQRi70B8J4+ilcmBfJoZk+rcKqJD8L87q9rrzb5K7Wq3M6hyDDSIX+wRdPj/7JIGFOdCr6IjZ98VgH+NblCcuYY9VpmQ+gi1zoDnTx9IwmrWBGJIZWxvcnVFcV4mddXq3XlYcSzblX/c0O+CIWOghfPN0dTM8dTkVfxKYvHusA0Zdj2Re5a6SfSy744ukZLfgihlZGEouvt7/shQCyvZCH1BY1HwZO34soXYvKutbp7l/QFaika2FD1zo2AqTpMHDlSzK98mtx2dc6/RRO5qZKsMWhmY6ivqp6P+bXm5f4deW9JnI6DFx4SlwULuzl33QPrDJsEaOL3YMrWs2Igaqrkmev2gKJ3EfvLVzt/VfkQnkdWqufd5Hhh0WO2WVRolXarfPdxw9pBRLZyqA6N9VlleJnl16vf9VfBT9PC8g953S7FblHau+SRPcgpZ9T2WXikkvnkkunsktyl0u5E+GS57uPH5IdcBmovcsqz88uvYYvl/5c+eZc+DTXoq5ePt8QSEpvJIl06vGpfxeHpCQ3J1Ie62FM0pz60l/VRP4lTKRAnWN+C0AeOQxOr1SagVWan62xfu9uljW5q5CBzoWHy0XtM9DbSeKcyuLITXE81j1K4pzyoYY5cuiRfj0Cyni+o33rb7rAGLHrdt4nWlXmZ2Us3ztkKZPpGsqc0w/NY9IktVdGouMlZU5lZeSmMh4bEXqMriWxSoJ1pU1lZWztUiaLCZTxfLcTlRG7lO2zrCr4szIv80uZdBHKnAtv2yzqV5k0g9nRm0nGnMrGyE1jPNZjmJLMqWyM3GUszIs839FslkWSOfYYfxKk02NV6GdxLONH5Pr74Of1COKc0+/AIddI/YpLD5skOl4y51Q2R26a47ERQe4g5JpTliOYHYldOSLDglTj+Q7mNwDMkUM7o6pSZVWmn5Wxlu+YlWudv6s+cE7/MBDKSO2Vkeh4SZlTWRm5qYzHRoSgzKmojNilLOQaz3ewrIzcpaxnWVVWlfpZGcv5jlnK5NqQZc6lLCO1V0ai4yVlTr1/6Gc38fRIbirjsREhKHMqKiN2KQtZxvMdrC5UOGQZObTTD+Zi7P0vmyaAbNNEP2NTxgJXB5+nz8qyhf0qk5GqFW0B3cVgLFDR2OKGsXVsRJDrqHkxULYS1bwYsPpE3nO3a3oMWBS3OAxPP+ipuL/snrx7Df9l/3kEcc6FKm1RW2/eTPLmVI2DjH5l2go3vflrw5PIemXb1R10aGNb6E7QxdPdSNZFDs2Mi1FfVYIfp8Z3r9PLV0+3XM0Cp/soyDO29usrPIAsovuYhLGdpnKiOVdX31MPd7tSVNGP5PPWXuvvzp7TChqd02dtJJ9T2SY5jFk/RqjMKsnPMlm397DVcMh0iORzLhTbi9rL9HaSTKeyTHIz+3isezRueFZu60qbSuvcwiRvrmZgzINlY+SudjpXVFnV5GdlLNz70ktZz8Er/5zTZ07kH6m9MhIdLylzKitzLuefc0ljoOq3Pjz/nEv551S2SQ5j1smuMqtaP8tkSd+DW8MhEw3yz7lQGixqL9PbSTKdyjLJzfzjse5REudUzD9iV970UK/84/kOlo2RQztjz0yVVbl+VuY1fSmTZ1socy5sdi1qryy0IxN0vduz2nkaCXliwAMLW5vKeKxfm5Q5FZURu5T16rSU8XwHy8rIXco6pVVZ1elnZSzmO2Ypk2uDMufSIwupX2WSrCgNCHS4lGRO1UXJPQ5jkROz9f5c4JJFb63+90TuXjyxkLs0Sh+x8vF89zFrJHdp7KtWjVW7nzWywO+YX/XPms+zPTQ6F/YsF/WrMT15ejvJo1M1EjJi8EhuZh6PdY+SM6dSqUDqGunnQYEwnu5QWRg5NNP3hfqqwv3si9V9hyxfncrrScU5/fwNnlRI/fqSAUbaEehwSZdTOe0i1zfwdfFIO+eSQqdy2pFDJ8evWazZk+e7j9kiObTTQyUWH3/ZWAFkGyv6k3uVdYHTJ7GyuKirg893aTlcp7t/wWGg6saSRbFSbnEj5daxEaEH6BrnKuwClXZVIiZTeOVewF7f9U+xaztscRicXp7UWhXzx9x7sOLvbtYQeZUQuFDYLQoXFj+TsoiOl8TFqwriyE1xPDYiBHFOpaeUdbnXbSjNwJg3k42RQzv7B8tHVexnZSzru4OlTK4NieZceLBc1F5ZaEdU1IPlaufpqoRDrrG1qYzH+rVhblyvbCoqY2OXss4OTo2hmaxstjNmKM2yKtnPyljX96WXsl41r2uDMufCg+WifpWJecyO3kxKMqfqomTAYCxyMnvVChe4ZNFbiyvcau3SKH1E5nk7WSM5tDO+daIaq1Y/a2RB/6RR1vp/r2tzLjxYLmqr0ZtJGp0qjSHxyM3E47HuUFLmVFzkHJtvYq/8cyyLI3eJ69tNxVXJfhbHur77+VXvDT4/VkCcc+EJc1Fbcd5MEudUzr/I9YBcA4v8cy7JdCrnHzl0MjxhpmjxWWW2M96DVI1Vxp81stZ/0uiFwsO58G7ron41hsJuER0vefRoOQHJzQTksRFB5jo8ZToVVz5iO2U8P4JFZeTQzv4zDY8q2c/KWNd3zMo8eR8Fmeec7pWhKiC1V0ai4yVlTmVl5KYyHhsRgjKnojJilzLJaaxyPD+CRWXkLmWdEZplVbSflbGy75ilTBYUKHMuTZak9spIdLykLFA//tOvfVVTmb82fRMkdOjxE96lW9wl7XkRgbMUTe4QFHHE0MrYB1JlVaGflbGM7yEsZaGKcy5NjKT2ykh0vKTMqboqGQk8YEZOno6xwDmXFrhE6Wfba+dytYZeyt0Ni6kZ/bIGNJJ7bkYsfvxlBwWQ7aB8ywN5JV7gQmG3qK3FRdxaDFS0mDm3GLhgMVLB4uLQS7nhy+I6Pbr4ESwu7rkZtVhV/DEXP1jqd8gaL5naYdG5sKOyqL1Fbyfk4mqnr6p+9lnurcrFxY3pcx2br32e9uohJVI61JV3i0OPpHaCMe+O/X5Dpd3C0Ep3Q4VVDX8WxkK/u1fC5MogzLmw3i1qL8zbScICFYWRm8J4rHuUUsypH/0wPnwRQ4fGOsV6bp2fwdQ7jM12xr8WqLKq18/KWNR3zK/6867nexLKnAvr3aL2ykI7smTUFthq5+mq+mHsGjHkmLdWVy/PxLXeBS5p9NY+6y84nscCHsmhl3LxyDue7ov/1tsSFok9t6ISq3Y/S2SB3xFrGOTKING5tNyR2ksk0fG0g5DoVF1VkBi5ING5JNGpLJEcehmWO57uLkaJxJ5bUYlVuZ8lsrzviDVccmWQ6Jz+50jVd4v6lSiPirWzuYAOlxx6sLooaQ2JSG7OnTw2Isgrsdg5ZQONnCOG/vQqtaZOnh6xfnTDF0nn3PhYkmqr6v2sjSV+R64Rkoc1aHPOvpEAb8S23gh0vOTNqeyN3PTGYyNC8OZU9EYM/ZGpFHMlT3cse88M2hy70VYV/Fkby/wOXAMkNxa0OZeeLUn9WgsbYKGdpI3tPF2VDD7SjdzUxmP92jQ9OhW1EUOH5AEO2ni6Y8VHS2JopcdW06zK97Mv1vgdsXzJDQVfzqVHS1J7XyQ6XvLlVE4zctMXj40IYhrTo1Px0ZIYOpQeLXm+g5l25BkxNHPzZFmV+tkYy/kOWWMj9xKMOadeMS+S+jUmA4X1jECHS8KcysLITWE8NiLIdUCYUzbSWM+IXSMtD0XIMJ4fweKC5tx+Zvz8y94JIN07qf98eX4KLm+BC5m2qF9vYWZcxOipPLrWw2Si0qbl4oa4dawjfOtPfZa5gL3+6AWXusVd6p7Hpcyt0zOa3PaVagtDKyNjZXL8rCL+mGqAXJncVFDmXPjHqsb2zkJDwVmgUuG9Lms6S699HmsoS1TY21oceiQuoMybsV8ohTJiaGW7nH1WdX42xhK+b5Kv+suY5w7CmHMpyUjthZHoeGF2DNHi1tbiprAQwWfH9cq+jp8vWcWRYmwMHRrJwcf9db6bef1Q7zA229mvZ59Vip+VsV7vmKVM7noocy6sZ4v6VSYjVevZAjpcMubB4nq2WpvG/LXhgXG9sq8j1tOLe06OZSwES+vZaqbD3axnVX2fvbFE7xbLm9fVn86lAm1hW3HeThLnVBZHborjse5REudUFkcOHZJUxNzI0x0sVWgBu/FWVfjZm5fq5U0SBfnmXFzUiP1603UdGUeie5rEOZXFkZvieGxEkA5hUXMqiyOHHoVFjac7WFzUiKGV/aJWBfjZmFfpZcy3Qj6dS4saqb0wEt3DJMypLIzcFMZjI0IQ5lRc1IihQ2lR4/kO5t6xqJFDOzeLWhXfZ2Ws0DtmKevb4Jq+kWTOpUWN1K8yGSmkGIEOl4w5lY2Rm8Z4bESQ60CKOeVDjecQctdQywM1JkeeH9HiqubczexYRfhZHCv1jlziZPqGOOeSOFJbcQQ6XBLnVBZHborjsREhiHMqiyN3iZPnaojj+REtinPuRlzV4mdxXrCXOJm+Ic65+DhC7NdcWtZIjK7KUyvqa6c+vvU7zrXzGLiv+quU58Kl3nELXHpG8ahvD/1+GfKQHHoZbPJ0d7Hqa5nFMHM6t7f59ZfNEkBWeb/KRFE2A5dsLmxrcxHd1ZCIgSqbMiBlM3BlUwa4bAYu2AxU/eixRC2bi8s21+nuYrQZuBubVbsfc/OLBX5HruGQZIFN56JNYnubJDqghqvcDOFibgauLl8qHdj0qLbm1yIZsPr1bVlioJPNbXTydPexrl6m9krOTTOyH/ZVFf3ZI8v+DlkDISHh0bnokdjeI4kOmDw6lbPSubp8eY6GR+eiR8cqbPBIbuORp7uPfjvAI7nnZtRj7QecPfqmQQ2ETCjw6Nz4mtH1DFtvISxqr9HbSRqdyunoXF29L5Xrunpg9V5FNnprcalcHHopU1c9+KzTHaxKfHn8gEUPdzO51h7BWaZvJNRwyG0Imc4lmaT2Mkl0T5NMp3JOOldXH1ZK55JMp/JKSW4jk6e7i1mmczcya0PgLJO7Bh25hkNuI8h0LskktZdJouMlmU7lzHSurj4slM7FCdYxnxmxUJJDN+UZEanJ093HunpZtZCa5J5vCp1ga5fgrJFbCR3yq36n//lpHhqdSxpJ7TWS6HhJo1M5J50rjWGddC5qdKzCygQFjeSex5873et099HvBmiczfTdoBpr5+Cs0bcXSmO3yV2cL+dew87bwn49yh1Y2zgL6C6+6i864rnVwz30M1koQoiN3YB1bEaQBMWiyJcO7FO31qCM3EYZT49m3uU+gjFiaGUUeaqs9gzOynxjoZTJeoLMc+6hv7GJZxtiW2UEZhef8xzGnAof2FzUFOavTOueU/WTpPJAB1/k0B25/zBT8nR35lu/FwBfjt0se7U3cLbmGwhlTZ6yYM25aI3Y1hqB7miaLwP1pd8MRKKRm954bESQAUeeBepFf8MR3sihQ2+SrxDH8x0tinNsL+77L/s0gGyfRi+wxAVOZ6zKtkX9egubbovojgZxgQrptqihbR0b7bu2QOEXgJ/TvrQtDv2Ru7msrdMdrDZQZa6qfAvcjbbaFjjm27fvHVS+SUehzbmkjdReG4nuadIWqJRv66qmuPBa6U/l23rluI6Ub4u78k3agTmPls05d2OuCvyzOe4CdA/KnKypMOdc/cLT8x2KjCO2V0eiAyZ1Tv2Mlfx6UKqZcoWb5vylYYVbr+zL+NHrQMaxsSvjJJUgjudHM/pAh4xz7MZblfRnb173lzdZoeHNufQoubC9t9CQ+K8Hk9XOGI/kjY1NbzzWL03enIreiF0JJzMpvPF8B/vR0YM3x268VfV+9uYlfnmT4gXenEszJam9NhLdUb3Noc2puioZNuRb4sbvJVx5WTuegUsuvbXKFJl7kITODQus5wKV/ih+Yded0SW0FAffVbyfZbLC78H9qh8mf54VIdO5JJPUXiaJjpdkOlVXJXMXZEZOchoynUsynUqfp16NoZMyUshLb6WuXR5QkZjOjVtCXVYFf3bJMr/HtiLLUg2XziWXpPYuSXS85NKp7DJykkpw6Vxy6VRFlcUFiencsLAS06ns1LnRmjqtGv/slBsBPcYVOUy2ziWnpPZOSXS85NSp7DRyMinDqXPJqVPxExmrtU2CejN+ayBBnbuRWRsAZ5m+S/BVvwvpk61zSSapvUwS9zID9dDNYEy2ztXVywQImc4lmYF66K8HIUHJXTIlGqZbnu8++goMm87d2KxdgbNN3zqo8ZBFCtOtc8kmqb1NEt3TlJpO5dRMnP4jL2w6l2w65TkFm84NC2u6dSo7dW60JtPtz182bwDZ5o3+HnM5DVxwuqit00XcOg1UfTTzedqoBA1Y3ZCy/pfSwH3KnFwbA4Gqf2wWrpQuDp3UQagEXee7i/oDw5Wei0Ir420hlVi7B8fE/PEthhoHGS9IdE6vv/YDFrWX6O2ExFzt9Di8PsK/wwaurl6eXGAxRBXXsOhUKjYXhk5qNQSJ3kw9wMrKBY3O3WRkbSmcZfq+Qw2HPwD9OJdkktrLJDE0SUFR1WaIVv8mL+OBlPTW6uoliSDTuTDLBsotICW9tWGBs2yg6vNycm1wytbk3tDUrI2Gs03fjfiq33t6nsqQms4lm6T2Nknc23SqbMpKDpvO1dXLMwlsOpdsOlVPKZLCsElOxn955Pnuo98V8OjcuCvUZm1YnG36rkaNh4wbbDqno4aJltTeJonuaZponXpL86xjdfGS6pDpXJLplP1WLVwSQx9lTsc0y9PdwfjgE7gblbXRcFbpuxE1GrJrAZXOJZWk9ipJdE+TykDFNdO5unpJJbh0Lrl0Kq6ZxNBJ3XmFTJ7vLta7JLJyIS+dG5eueVk7DGeZvg1RwxEegJxLMkntZZLoniaZTuU107m6ekkWyHQuyXTKVzlkJrmdTZ7vPmabzt3YrC2Gs03fh6jxkPsIqelcsklqb5NE9zTZdKquSp4esGYmTn9YHTadSzadymsmuZ1Nnu8+ZpvO3disLYazTd+H+Kqv+/sTkHPJJqm9TRLd02TTqboqWclhM3Jh0XQu2XQq2yS3s8nz3cfafZDFCzOtczc2a3PhbNN3IGrcJDJy07lX/SsJPAIR2+sk0V1NOp2Kb4ateN1aDZw8jiM5vb2k06mq62WiwlTr3NCwHmudSm+GrcYwZGOD/3ndfLz8Yffngmz3R3dC//2RuGCzsZ3NJnr83Wai0pbehrPkTJzbTFR4N6yxKzefp7H/iUNVCSKPIv8buXFPqMzaZTil5uPFtyIqsjxGQKZzUSaxvUwS9zKdyjIjJwP3X/ny5cH3X5GqwbDUTIMxNPxfaiYqS/U+jNZUam0znKVyL6LHuCLLUwekOhelEttLJdEBU4Y6laVGTi4fUp1LGepUej+sW9ukqDfj9wZS1Lkbm7XZcLbpOxJf9XD+PInApnPRJrG9TRL3NgMV3hBLl1Wbe/IoB5uhvZCigQpviHVr6KV+UgMzrrfjqzB0OnejszYmzjp996J0ynhAp3NRJ7G9ThL3Op3KyZk4f0csXn7QmVpLM65zQ8OacZ3KUp0bremMWxsPZ6m+O1FSpTKAVOeiVGJ7qSTupTpljxX/jFdVKSq2kKLenK4qWEWdSm+JNYdO6n4oUtTb0RFFgpK6Er0fXNRibTicLfquRFmUR0NYdC5aJLa3SOLeYqDC/l66rNLYQ3KlCTSG9kQ2NDoV9vcau8ZfpjFY9GbqvRJZveDRuZucrA2Hs03flSibVnU+XpyLNontbZK4t+lU2uBLl5XeFEtcegryqGmDr1vb6QztRJ3O3eisHYezTt+WKJ1y3yI5nYs6ie11krjX6VR6VyxdVu0ESr4gOb29pNOptCfUre10hnaiTududNaexFmnb1yUTqncoNO5qJPYXieJe51OhbfF0lWVTVkpYNObSzadCm+LdWPoo1SlmGm9lfz049ze5etfdoQA2Y6Q/t1quQxccrmwrctF3LpMVFo3A1cyZWYpmYELMgOV1s2FoZP6vYCyuc53F8um3GG1bgZuXLo8Bb3WVsMxMwG5TbnfYNO5aJPY3iaJ7mrYPQjh4roZuLLpT0GBSzb92uK6uVrb6QztRJ3O3eisvYazTt+QqIlWdlOg07mok9heJ4l7nU6VJrmsqk3CZdW+izw/Ijm9vaTTqbhurtZ2OkM7UadzNzprr+Gs0zckvuqLnrYb9Opc1Elsr5PEvU6nSpMUwNAZOZnWoNO5pNOprJPcTifPdx/r6uVhBJOtczc6a5fhrNO3IkqnPBYiO5176Dfs/zGwX52yhv3HALqnaa71aD/6dAOZxPrbfX1sBHgZ7zhdRWiVl+u1zdVnPOSC/3tw6JGMC5ZJXkI38/qin7+FOXLXHdDt6AJZuwlnZ9xy6JjlTO51OHPuVRciOCO2dUag4yVnTkVnxKYzHhsBXvS3L+DMubcXfWaHM3LXYD9PTXDG00/hpDCHM3JoppNRldXGwVmZ7y6UMpl2oMw5+xVSKCO2VUZgdFGi/edopqmojI1NZTzWL32NypzLysihR50e3FldHX4KF5TNZsb3o9VZ7Q6cnfkWQjmTmHDm3Kt+eBjOiG2dERh9DM6cis6ITWc81gHCfzX3hTZWM6M8GSHL2Bw6JLMPsoynu5lv/aUGJBmxS/w+y2oD4GzMdwnKmMzpMOZczDJiW2MEuotpYnQqGiM2jfFYB4jGHMvGyF1j7fMiT89oMnowRuxqpesyzbEq88/GfC+gjPVdcOU/jDmXVjJSW2EEuodJmFNRGLEpjMc6QPhnodSd1x9NDqQYm0OHQorx9IwmiQphxC5hPbgi7O0vWy2ArDj3P9J+BM7mkJoUF7YztoDuYjAWqGRsYcPYOtYBkrGARWOLu8baUmydntHc2MKuVrYp9lbF+jHFALmxbpMpFrgf/cQjjLG5X2P6xfV6xF9E9zEpYztNRWXEpjIe65fWM7fssNTjYriQ+Ii/OHRJ1vdayNbpp3BBGi8LzYxKQtOsSvKzNK/ba16UmDUvvjkXpRHbSyMxOukPHylcqMsWNqV5gLSUrZf2dcSlbHEbZymaL2VPrYxPaaiyKrvPyrw2/6od0+cpAMqci8qI7ZWR6KFKeeZUzDNiUxmPdYA4NTqWp0ZyG2U8PaPJHV+L2Ro+tHKjrOrtszIW5R2ylEn1AWXORWXE9spIdMCkzKmojNhUxmMjQCrLQo9iWba4jbMYTqZQSCOHZm6mxiq4z9JYlXcXS5o8HEGac/plQSxnpPbOSHS85Myp6IzYdMZjI0BczpzLyxm5a7Cf5x8sZzz9FC4kGrmrmXaqc2NV3GdnLMs7ZjmT9QXOnNMf04QzUntnJDpecuZUdEZsOuOxESDmmXM5z8htnPH0U7h2cj3DIc/IHZxVzX12xsK8Y5YziQlnzunvfsMZqb0zEh0vOXMqOiM2nfFYB4hPII7lJxByG2U8PaOFJxBiaGX8dpZmWdXcZ2MszDtkGZOYMOZc+InFxvbKvKGkzKmojNhUxmPdo/gE4lh+AiG3UcbTM1qYGIkdlFXVfVbG0rxDlrIu0Vdx5tzr2N68MGQZsV9loh61GYGOl4w5FY0Rm8Z4bASIi5lzeTEjhx7JIo/FjKefwgVn5NBMD69k2ftfdkAAWT39I9VnZdniODrlZx379ROK50V0h+ojpiKytu4DVzeOVPX1FlnmZIDq/c7Ahfc7A/VV3y16fsaofavFoZ/yPF3W1unRSf1qdq1mC7ukdRS1VnX3MdHeWZx3yLpyuTRYIzet8djeGoluPVtz7ktLREgLWH2x43mYIc258HnoQH1pkQNnbOxyJncIpPF89zF8HHpRB2dVn5+deRFfzvyp8Z3cdMZje2ckuj/ZmXNvb/rtS0hzrq5WnpcgzbkkzSkdbTgjJaN9rQdwxvPdxy991x6JRgzNjN9F1USrCv0szcv4GgaZwJBo5KY0HttLI9EdytKcq6voif8aIEiLnEzmkOZckuaUDTesEUM3ZWQgjae7j6+f+rlxWCP33IxKq9L7LI31eYes4ZLVBNLITWk8tpdGolvP0pyrq5CZCNISpz/rBGnOJWlOxemRGLopcxCk8XT3MUsjdy+tau+zNBboHfKrPhT5vEpAGrkpjcf20kh061la4vTzcZDmXF1tWNOcS9Kc8uFGqpF7Hu41P/J0d1JnWSQaqauRTljNtCq+z9JYoY+I9bEul0ZuSuOxvTQS3XqWlrgkzbmSFtY059LTo1P1Z5qS35BGDv3UGxq5xvOjl+nxkdhBW1XgZ20s0ztkDUTfCtcNhVwjN7Xx2F4biW49a0tc0uZcXa2sfpggnXt/0efMeiMtcNWerJIQx/Yucc/3NLzxdHezwsndhHwjJ/4136oOP4tjsd4x69LDyuZc2MV6J7VXSaLjaXajenMqV2+Rk4yBSOf05oRGp2p97brquomhkRx6KTM0NPJ0dzH85EdjaGV8fEgtVmV+tsjyvUOWRRkHpJ9zSqEKJ7W3SKLjJYtOxWouYLGacy6tfE7FxxVi6KPe75DI893DtPKRunf4+Mu+CSDdN6nPfzzPEuUwcMHhorYOF9E9DA4DFau7wFXuyNxVmRi4IDFQOvqVh4uS0efTyzrfPbRyo6bThaGZXgQkDx9V3h/zEJA79EfOwCWHbG3vkET3MDl0qtx0T6/xqkfQcFXFyTIGh95ecuiUjT4kEkMn9SNelYjr/OhiqvYWd2+xKvmzRZb7HfKrPknimehcskhqb5FEx0sWnSo7MsfDYuJC9Re4ZDG0FjbHVmOXxeeRgkRvxcsRpCK5e4lV2J8lsvrvQS2JXkg8nEsSSe0lkuh4SaJTlYkyyUOic7Wgyy2IVHQuSXTKhx+5SO55+Nd8ytPdRZ2V4ZAUGhn/8aHzaRX6Z4ncDRgR68MSz/cX1kTnkkRSe4kkOl6S6FSW6FxJlKuHROfC02mgYnW4OPRS8x656NHS4+nCDhqr9j9r5AZBD2vloleHD+eSRlJ7jSQ6XtLoVNboXGmU5RManYvVYuCqPVlmkY1sD/2U1IdHnu5OxmpxcXI/aD7WbsBZJLcMOmaJlKFAPpIbZf46ttfGV3XrscxfLTVXVyEDiEnU2ytOaluIcy7ln1PVmqy/0EbuGu/nqQraeLov3q4dsygxtDK+p6nWaivgbI37BR3yq948fL40WCM3rfHY3hqJbj1bc+7181MWZFhzrq5WnqFhzbm09DlVUWUOhjVy6Kfe0dDG893LtPaROlirHYKzNd9GqHGQeQDWyE1rPLa3RqL7k6059/GiH7SGNefqasUurDmXrDn19tCosEZuZ43nu5fJGqmDtSr2z9a4IzAi1psfnmvkpjUe21sj0a1na86VDVlwYS1yMp/DmnPJmlNvr2mGJLezxvPdy2SN1L21j7/svQCyul2/MVG5trhhbR3bWltE9ydai1woDgJXdn1dC1ywFqhYHCwO/ZTFtibIdbo7GaQt6mqklyBZ1j5qU+CYaoBcmizIkEZuSuOxvTQS3Z8sLXFJmnNftfX0PDFUqq2r7bjhYSRQsRhYHPqpz8Cw5leVnkYWdtBW5ftZG2v87mANhKzv0EZuauOxvTYS3XrWlrikzbm6WlmFoc25+PAfuGpP1sla2RZ3iXu+S+AthpNlph4jFyf+Nd+qZj+LY2HfQ1uXLjEhzrlQxS1qrzK0IwNVbxWtduZVhWIgc2HSDFFl4ay3inJrMvdAI1tDL+WugUae7ouP6UcMrYzvHKrFquzPFr38L4vSQ1h0LlkktbdIoruo8xAsBioVB4GrpU8mD6Sjt5eWPqdicbBau8bfk9GbSUsfqYPEKuvPEr32L4ny3AaJziWJpPYSSdxLdCrWCuGqYq0QuCTRo8ZaYbW2kejNJImkDhKrej9LZInfg1oS5ckKEp1LEkntJZLoeCkTnYqlQ7iq4uQWRCZ6e0miU7F0WK1tJHozSSKpg8Qq5s8SWfH3oJZEWVYg0bkkkdReIomOlyQ6Fbc2w1WVRLl6SPT2kkSnciVBDr2UYFgUebq7mCSSuiT2yqtrYtX2Z4ncABgRq+Z9nugh0bkkkdReIomOlyQ6lSU6V7dgqCycS5WFU7myIIde6jtTsMjz3cf4aEPsoLGK/bNG7gh0yK+qS12jc0kjqb1GEh0vaXQqa3SuNMozI3LRuVxpOFftyQM0HlHJoZ8SDh55ujsZ32ZYnNwPko+ff9mOAWSVvf4Wc+Xj4kaJuI5ttS2iexRLxMiFEjFwddvJSJa4wIX8C5TlTVlbGLqpy25pW+e7k57GVSAu7tm+WqttgmP6ffpeQo2D3HCwRm5a47G9NRLdoWwtccmac3W1Us3CmnMx3QJX7UldBXFsDz2VwgXeeLq7GdNtcffeapvg7M33EurK5UkO3pwL0+ai9iZDO3KXVEW42umBiNNm4OrqQ/aFqGKn6vrQWsw+NoZO6r46LPJ8X3zOPnLPN4NmX5X/Z4vcI+iQNQ5eTXw6lyyS2lsk0fHC4heiZYveWl19yEbncjY6V+2Jb2QjOfRTbhp45OnuZM5Gcvceawfg7JHbBB2yrlyekpGN5OYsymN7ayS69TyLJi7Nos7V1cqTM2ZR59La51TMPmLopu56wBrPdydz9pG72lmPiZp9VfKfrXFfoEN+1dq62rw+QgVr5KY1HttbI9GtZ2uJ06v457iKbq+uVhYjWPP2crY5V+1JOiHbyKGnEg7eeLovK2cbuXtvVeWfvXEroEPWlctqBG/OpVmT1N4kiY6XZk2n8qzpXM4+51L2ORWzj9g1+jKlwiLPdxdz9pFDOz3imn1V5p8tci+gQ5ZFWT1g0blkkdTeIomOlyw6lS06l7PRuZyNzuVsJId+SrLCI093J3M2krv3WHX+2SM3AzpkXbncYvDo3Jt+h+MfA9uL9IaSSKfqY/EyYphWyXFyxxTKY92llHpOVcflERwTKDn0KEygPN3BvvXnfVHzEbvEdzOaelX5n5X59kBdeXjsdK7GUFIUzsjtnZHoTiZnTmVn5KYzHhsR5CZEqeBUdkbuGu3nJwKkGU93sOiM2NVK33vi7Osv2yuAbHtF/9Sx0ixw6S8qFvarTEaqflRnAd3FYCxR3/rnfpVlixvG1rERQa6jjCXqW+/ByrLFoUO9MvFj8Ot0B/vSnz2vLFvYcysqrOr9Y5J9+aZA3WrylA1hzkVhxLbCCHQPkzCnHj+63Qph5KYwHhsRgjCnbKThi9jzSC9fPN2x6hN5nUIXB2Hk0Mz44Lwaq5r9bIyFfcf8qjviOfthzLlojNjWGIGOl4wF6jv8KNK6qmksvDYYC9T3j9ypUEZOxno54/nuj5mHMmLP5tVYVednYyzhR8S6JdyYc9EYsa0xAh0vGXPKvnqAFCM2hfHYCBCEOWUDDV/Engd66eLpEetb/3gEvsg9N6O+qi4/+2Lx3iErwySrkWHO6Uff67FjUVtd3kzSFai4hpGbvnisOxSeFNeFDiquYWwNHZLHrHrqCM2YdvjKraivqsfPvli094WXL1ld4cu55IvU1heBDpd8BSpOiOSmLx4bEUJ+BSpOiOTQIZkv4YunO1j0RezZuvqqyvvsi+X5iFj3g8+HziVfpLa+CHS45Mup/MhBbvrisREh+HLKBhrzIbHngV7zIU93rPzIQe7ZuvqqCvvsi2V4h6z8kg4iv5xLvkhtfRHocMmXU3H5IjZ18dgIIL3BI71TURexjS6eHrHi8kXuuRnVVeX1WRdr8A5ZuqTihy7n7Gs1WL+IbX0R6HjJV6Di+kVuCuOxESEIC1Rcv8ihQ7KqYz7k6Q5m3rF+EUMrfTEqrGrrszAW4CNi3X4+HzoXhRHbCiPQ8ZIwp/KESG4K47ERocfomsqQYU7ZSGNCJPY80mtC5OmOlSdEcs/NiLDvv+xyALJdji9/Iy1wSdjCdsIW0F0MwhKVnjgWN4StYyOCC0tUeuJY3PNQ09g63cHMe2XYwp5bUWFVWh8z7Jv194hofwddU2LgojA2txVGoOMlYU6lJWxd1PTlLw1P9OuVfRk20JVgC3se6KUrxEpL2FMzPa+qr6qrz75YfI8Lr/vBZsRv58JPcy/qV5d+qKK2ERfR8ZKvEC1sSq3Gpi9/qW6y1YS4XtmX8VY/yfbcbQhja+iQfiGllrB1vtv51C+KIsFmM+NzlmqsKuuzMZbfHfKrbqznS0eGBU4eTeqZY1F7Y95OMhaob02U2uRY8aay8NowJQbqW3/BAcrIoUcyLDDG02P4wsbvwq5WetzUWNXWZ2MswEfIuiXcmHMpx0jtjZHoeMmYU2/6RiqEEZvCeGwECMKc+gifJ1gB0B/9oUwI82ZsakWKEUMze19VW599sQDv7lWG+S7Ht3PJF6m9LxIjnr5hWh+mS+H0L+YhLLRWo/N8t9WbmoFLE2VsTWQj65x7f0kTpnOfH/rxH+h07v1lZLvmYdXgZ68s1Mc4P8L/cH6T4y2PeZLH9hZJjNaTRcfekkXH6h4MFp1LFp2q1oJF58qi72St0ei+ZoupvfEmv1qs0vxskfV7x66+yNKN9c+5D/2fGIgl9itWJ0o8spDogPaTMUhPx+IX5xbHuwu56K9NFp2KX5JbraFLssxgQvVmdMsdCUgKjYyP7auyKs7PyljB9wiWslDFOReVEdsrI9EBozLHsjJyUxmPdYikzKmsjBy6JFkOZTzdwZIyUpeyfoZXZVWen5Wxhh8R7cdbkGXOjefbq7BBkpH6NSYTD3KMQIfTTESKOZV9Off10L8gQdo5lxw6lR2SQyfDnMnTo4uf+oENJB45NNPPryLx5y+7J4Bs90R/+LEkBk6fBEvionYSFzB6KE9NJTFQUeLiRtKtYx0hCAtUFLa4a6R7qFmOr/Mdrb4K2Xl1cWUscONT6iquavxj9v34RkDdwDKVQ5xz+uuYEEdqK47A6GgQ51QW51zMvnVZHTXJ9NayTHLoZHhkCdHqZwJkDYLMp3bWU7NarIL+bJFVf3ewBkIGFhad06/vwiKpX4s6PdYkuoiOl1a9gGWPDDgTkMc6RHLmVHZGDl3SN7Bq2QtXGpa9RaGV8d1IVVaF/1lZ2B14hP+D/HHuVb/pAmfEfp2F/bBF9ICqWcyZbKeprIzcVMZj/dqkzKmsjNylTGYkKOP5juZfH0eakUM746f6VFpV9WdpLP07ZuWZPGQgz5x70w0JSCP2K011INFIdMCYaI5la+SmNR7rEMmaU9kaucuazECwxvMdLSUaKbQyfh5BnVXpfnbm9X05632ba22FM+fC8+Wi9sq8najMsayM3FTGYz2ISZlTWRm5S5mXBKvLHS0pm62MnyVRZVWnn5V5MV/KvPD+CZyIRZaR+lUm2YokI9Ad1FTEzOjU24/Os7UrtrgpzF+rO9b1VsF65bwOfc+4dsACN54C1zOlx3z71r9YwPxI7tK/fQypIv3sjZV8d6C8yZMPUi1wwRspXJg8M8MaT3ewZM2puiSpmWCN3LTGYyOC3D2w5pSPM6yRu8Y5rGc8P6K9q334cm7Y13SrQv2sjdV8R/760D+ygbbABW2kNtp4uoMlbU7VJclNAG3kpjYeGxGCNqeyNnI7bTzf0ep/A+RKoY3c87CoryrJz75Yt3fIGhy5o+DLufQvxwt7vrJrHkGehVZkXcfs6FSeHclNYTzW/Umzo1NZGLnQHTyA8PQIVs+Ia95bpbZz2zSrZDlruyDdI/nw/19NXNDWGPr58m9yh/9H/ZKN78l4piUqTZDNtbg+NsZSruNf+TpsxP87cmPE/29ZSzH9Nvjf0RqGp2ep53yrKeUv4liodzcr3+RB6d8rpHNRHLGtOAIdL4lzKk2RfVVTnL/WM65f2dfhQw1xbO15qJcxnu5m0gz53EzPZmqsKvnTDFmToW9Hfvi/5iYuGmNzW2MEuovJmFNlrO/Na8D+WeNJbhrjsREhpJpTPtQwRg4d6qFexni6g71/jNL54pBj5NDM9s22muP+ooxleseswbFn/qsxmUWjMja3VUag4yVlTtVVyRMtlJGbynhsRAjKAhVnR+fS7OhUNkfuYK7q8HOysVjvftYYySM2psfAyc3/j0H9itOPpGNd83aSuUC96ueuYI7cNMdj3aM0PTr19un/OtARrrEO2Rba0bcskWyOjRtAZ8mqxs/iWLJ3N78+xjcZrzSHuMAFcaT24kh0vCQuUFEcuSmOx0aEkHJOZXHkLnHyiPg/cVzekjg20xd1I66q8bM4luzdYomTmgPinPOPDTWFbr6lB0lvJnlz6uNdH6yRcOSmNx7rDqWEc6p+eEwmY6xu5C5vz0/20MbTM5i+mYWEI3c103mrqVb1+NmYF+1lrNtcqeZc+LByrYv/93yzVUZg9FFu4P+sHjr1YX8bB2XkpjIeGxFCqjlVv/ckHJSR2yjj6RksKSN3NdNP6KqsavGzMhbsHbOUySAiyZxTsVjWSG2NEehwGgzGnMpJRm4a47ERQUygWnMqJxm5q0OeZDw9gyVj5K5m+nFPjVU1fjbmJXsZ67tgJZlz4TvZ9QhzSjICo49yf0CZUznJyE1lPDYiBGVO5SQjt1HG0zNYUkbuaqaf80TZ61/2RADJ03wpky5WkgUurGSLwpWlLZEFjC66sUR96h+61rS4uGFsHRsRpDuVZIn61t+YqGlxceiQnq+lbJ0f0fQf62olWxiaGW9ZqLEq1I9J9urVfBmTx0EYcy6tZAvbKvN2wry4mumBqB8v7unkSn0oY2tTGY/1a/UOhDKn6ueWpd9Q5tx42ruuA+KcerzqB79hjhyGpx8XVFzV4WdxLNa7myVOhgjinIviiP2KG3fV1ceq00JDyRzbeboseaiDOXLTHI/1a5O5QL3qT2TCHLnnsV7KeLqD+Q0AZc6NG0DNVR1+NsdivSOXuZ54ryuEOeeiOWLblCPQ8ZK4QMVZktwUx2MjQpglA6WzG7wRQ38kIZFqPN2xsjfnbrxVMX725hX718ebfKoP3pzzT2U1tdXmzbzqXyrW80iIVh8FlXkACcfmpjce67F81S+hYa5MmJiBOGIbcTzdwd70XUnkGzG00jeRJloV4WdhXqmXMK+rX53Td7nrkX9RW2HeTBQWsJho5KYwHusxjMIcq473enPNMDDm3MiRNVM69aq/OQ9xxDA+YzpTc1WGn82xVu9+Vgfk0Q6p5lwyR2prjkCHi+YCFs2Rm+Z4bIaQWgaplrDOgiWOGHokXjFH8nQHc/9Q5tzwr+KqGD+LY8X+FFn6CXHOJXGktuIIdLgoLmBRHLkpjsdmCOkQxDnmQ46Uc24M+Uo5p17tY6IQSA4D1Bel5qooP5tj5d79rA7IrQdzzr2m5Y3YVh2BjhfVOZaXN3JTHY/NED1K12BDnWO2MMEcMfRIFhHkHE/PYLJIwhgxtDKmZFVWRflZGSv3DlnKJCaUORe2tBa1NRaaSQ8kAYvJRm4a47HuUVzfAmbpAWXkrsG2Ta11ekaT4YOyp1bavCh7+8sGCSDbINFvu5aywL2p2XomWdivs1C1LWL28Xkk6iEyUFWSeNW2uOFsHRsRZNqoJEtUqtoWhx7Jgl9Ztk6PYLbTUs4Wh2b2DyNvVY8f0wyQO5PBgTPnRuRrtoEyUr/KZKSqzl7A6GJIs4DFiXFxUxmvYYbwiXG9tLE0MS5soywF8yx7aqUHV5OsqvGzMC/Za170AvvNuU+t52CM2NYYgR6ntJStdgaWJsbFTWMpRDCWMBnrmhdXhCs7pIJFloVmbH5FlpG72lmzijqrSvzszMv1rw/9Zg+SzLnXF/2CG6SR20ojMGykNAtYlEZuSuOxGSJIS1iQRgw9kmkDznh6BIvOyKGZnmDVWVXhZ2cs1TtkOesF8pry4My5NDGS2hoj0OHCPlYIVhclNVLthyxuCgsRZKSxlAXqUx+BkWXk0CHRDmE8PboTlzJyl7CexdRYld9nY6zRO2YNTt8Fy5hzyRiprTECHS4Zc6ouSgYMxshNYzw2IgRjgfrU919gjNzGGE+PYNEYuYOxqr7PxrxEr8GRLiLHnLPsx7RI7FdZ+DjWIkYn9Q7BEyMbaiw/fjhX1y+z23/F9tKTfwhre1EQyajopj43I/d4vq/enmywvhFDM33NmnlVhJ89slLviDUOsk0Lj8696pfB4JHY3iOJDhgfShzLHp3LHp2LHhPWI3zNQ/BIDN3UdyXhkee7k9Ejset22D6nVGl+9sj6vSPWOPTz6ppBnUvbJG/Efj1qYqMcINEB0xwaqPiYQm7OoTw2IsgEg1UvUDb5QRk59Gh8cfAaGCjj+RFN3wVC6hG7munlW3OvavOzMxbwHbKc9Uq6nDmn/8KD1CP1q0xGCsYIdLhkLFDRGLlpjMdGBLkOGHPKHoQgjBj6o++3QhjPj2AmHsbIoZ3xJ4Bi7P0v2ySArOTWP7Wu2TJwr/oJoVK2sF9lIcsWMTopj0W16AUqbpMsbjhbx0YEd5aotE2yuEvamtGYZOv0CJacLQ7NjN93UWdVwh+z7N3r/K/6ZNTztcGZc+NXoq4eQBmpX2UyUpVlCxhdDM8pCUtptripjNcwQ8hzaeXZeunE5IIrzxa2UZaCyYpYWfbUytisUGNVmZ+NsXzvCy9jPddyXnx3Tt9FhTFSW2MEOlx6IlntDCwaY3PTGI+N12olAWMBs+cGKCOHLsl0UDPjOt3R6tlJxg/O2Exz4z0fNVf1+dkci/husczJFSLXnEvmSG3NEehwNc3Kwyvmx8BFdeSmOh4bMZI6x3zMoc65MeZrnnSqOiZPczBIDiPUM4Cqq0r9rI7lfPez1HWbK+mcS+pIbdUR6HAx6RyLZcB75GTAqpwLXCoDEvaqf90Jmwy7SUSe7k76TQGNzo2bQm1WFX+2yVK/I5dNmfyRiM696vffMYcS2+ok0PGizoDFRCQ3E5HHZgi5PzGHOlZjLhzUOTfGfCWiU6+v+t/FMEgOA9TPFqqu6vazOhb33c9SJysu1DkX1RHbqiPQ8aK6gEV15KY6HpshRAnUBexVfyUd6sihS7KsYfnj6Y7mdwCcOTfuAFVXpfpZHev5jlzqZD2COueiOmJbdQQ6XlQXsKiO3FTHYzNEUOeYjznUOTfGfGWdU2/6CwYQSOxKup7cVF2V7Gd1rOu7n6VOFhCocy6qI7ZVR6DjRXWO1bjKHVV70Ouypjp/bVzrHMvqnEvqnHp90S/PwR255xxWdVW7n9WxwO+hLHW+jfLuXCzKiW3VEeh4UZ1jXx86m0Fd5HoNuZICjy7ORZ0Bqx+sey53kYnkngWsFOTp0clP/aQjPJJDM9sUfPxlcwWQba58yPxeKRi48LGhRe00LmD0MBTqAYsZuLiRgevYDOGTZ8JsrEvZ4tAlMVrr3jrd0eqGk+KrlAVuJLJk4KPK/2MGAnJz0lGYcy6ZI7U1R6A7mhIwRMvm2Nw0x2MzhHSonlhCiJpSOg2ubII5NocuiRGY4+mOls05d2OuqvuzOd8CqMjSAZhzLpkjtTVHoDsaC/YQLqtje1Mdj40YoWAPIV5f9V9noI7NoU8yGUEdT3e0rM65McyadFXWn9Wx9n+K7HXCw7mkjtRWHYEOF5POsWyO3DTHYzNESDrH7OkQ4oihR/I0AHE83cGyOOduxFUhfxbn1X5FlvkcOedcEkdqK45AdzTnnHN1WfIhrHpeWZc1zflr07PJeum8FH2ahTo2t8k5nu5m6krlWR0LnXM36qqCP6tjmf8UWW4uqHMubJItaqvOm4k5F7BU361401x4bZotHavfuJOHVJhzbgw5Hy4DZRkMf2wM49Nrkk6WVcafxXmt//Wh+zgQ51wSR+pXXHjfLrQTzbGhvp9eozly0xyPjdcmc45lc84lc07Z51xgjhgGaHyaRNVVAX9Wxyq/+1nq5NaDOueSOlLbnCPQ4aI5x/I6R26a47EZIqxzjmVzziVzTsXCfA0jBqifJtRcle9nc6zxu59lTp6hYM65ZI7UPulIdLzwAYcQra5KHsqxzrG1aY7HRoSemK7pDVWBUw/9LgXmSmJXksgF4AmF50ew8ImUhV3N9GOEGqtC/WyM1XyHrLGRWxPGnNO9gXrXYFG/xmSg/mMAHS7mmkfLsyS5aYzHZgjpEJQFLG09Lw5dkmagzJuplBW1mB+dGykr5j7+snkCyEpw/be2Mhe4YG5RO3MLmMMq/aw3XhOW1rfFDXPr2AwhQ17mAuZDXtkWuDHkfDIJVHy/Z3EYoJ7R1FzV68ec+/CivnKuZ97r0mDOuTBLLmprzptJObfaGaMfzbG5aY7HxmvDk0kK8ao/vw9zbA5dknuscm6d7mj1a0hyo1TOBW7cAGquyvWzOa/py1zPwMucc8kcqa05At3RaM6x+GTyQW6a47EZQoYSOeeYDznMOTeGfOWcU76JBoHkMED9/Kfmql4/m/OivsxJBYmccy6ZI7U1R2AOq9zJmC0dixX44qY5f22qwNdL+0oer/rr/zDH5p7Heinj6dFMzDnnxg2g5qpcP5vzmr7MeQX+4Vz6Dt3Ctuq8nZh0jmV15KY6HuvBjOoce6SPYD51qdNkqfNm6mFKbkZkGzmMzHh6VWlVo5+lsZDvHn596P/OId2cCx/BXNTWmTcT6oDVTF9UfKpc3FQWIsjjLaZJp+ongWSWQbKRQ4fEBBY4nh4Xqq1AGLFLWGeECqvS/CyM9XuHLGFyM0GYc+nbBAvbGkvtPL9lifkxUPGZhNw0xmPdI/1MOYw5lY2RQ4d6qFeO8fQIlowRu7z36KqxqtzPxry8L2P9ZHpdGow5pz+mUZXbon6FhQ2uRYwuyq0LYx6tZmvhqtZe3DTmr03GnEq19gpwDbUMC3LMm3lNxohdzXQmq7Gq3M/GvLwvYzI2MOZc+rm1hf0qk9moiu0F3BvzaHlWJDeN8diIINeBHHPqU38NHJMiMfQnCOPpESsJI4ZWxjcwVFjV42dhXrSXMHk6hjDnXrUeQY4R2wojMLootwdSLFBxUiQ3hfHYiBCEOZUnRXLokDSDFOPpESwZI4ZWxucxxNjnXzZFANmmiH63tIwFTp+IStiidsIWMHqYPo4euPiwuLihbB0bMUJtnbDX8E7b4tCnXoG4kK3TI1p6WFwcmhmfmlNpVckf0+yT5X7HrDTz/ZDAhbdHF7WV5uHSA/5qZ15VeHd0cdNZCiHzRk2M66UdItZmi0OXPM/W6W4mPuAv7nLWDzHqrKruszOW5h2znPlOyKdz4QF/UVtn3kx05ljOs8hJNtQn8NZ1dS9ToZaw9Am8xaGbEq3my3V6RIu5x6u/boe+H9RjleJnj16vl8d+zuFT5Kdz6bl/Yb8iw2PkIkYnfY1LVFrjFjeTL1xqD9LVIeSeU+kxcmHokP4KDJx5M+kxcmFXM/vUqxL8rIx1eo9gKes2lzLn4g/UfJL7dSZDVc+RC+iAobpOVFTGcFMZj40Ich1Q5tTXx7d8XqUeJAM39qDWSuetRXPE5AbQZKta/GyOBXt3szogEwGeTpzL5shtzRHogMlcoKI5ctMcj40IwZxT2ZxzyZxT/nha+yNrGDE8o+BQdVWUn9Wxcu9+Vg+kSoE657I6clt1BDpgUheoqI7cVMdjI0JQ55QPNpKOHDokjzqYJ3m6g/kdAGfOjTtAzVVxfjbHCv4psiw5MOecfkQPJQGprTcCHS55C1T0Rm5647ERIXhzKnsjhw7JMze88fQIFmq4haGV8RtXKqyK87MwVvAdsm4VuaUgzLl6F+l5DxHGiG2NEeh48dnSsfxsSW4q47EZQi4VC5xjteEvtypyjRy6JMsHnPH0iBafI8mhmbGtodKqPj9LYxHfMUua3JaQ5txrSjNiv9K0gsdDCYkOGK05lq0l7lvyARWBc7EicCxXduTQT1lNYJKnRyejSXJoZjxQiMmvv2yhALItFN1IKJOBS7/ztbCtyUWMTo5toOt5rba9AhZNRi6YDFwyGbBocnHop9w3ZXKdHp1MJhd3mew7Qk3+ZV/ly3chKie9tgtc+objwvYmPWDKydVQj0U26c3V9UuhUzkZ2osmvbn4dupqDv2UyRcmvZm427K4y2TvjKjJKuaPs+sXK/45Yj9S+SAnnUv/YbuwvcnQUMrJgKXHmBXw6fpl5YLJ0F7Y60yYJVOtk4tDP3W4oDKEexuPm9fUUw+li0M7+5ysrYCzSd8v+PrQX42FSefC714uai8ytJNEOpZTMnEpJZ2LKelYTkly6Kc8VMAjT/ftlVOS3HU/7EVWyX8WyX2BjlkiZbqASOfCB4oWtRfp7cS5NWAxI52ryw8Z6VwUGbCYkeQuA8Ekz/eovsaMJId2+qp1bq2NgrNI302okZCHc4h0LvxRyKJ+RYYN0EWMLsptg6cdj/Z41Xc76n30xY1qYx3rCPp5qSo2AvV41d9MxiTKK0GPOme4jbZOd7C31/DTDYEbM62Kq12AszjfKihxck9BnHNv+p2EqhMXtjfnDX3pB66hLmAfP/JICHWR6weFa4SxKDoXPhYRqBoNediDTm9NH+4xozpVrcmjF1ZGcvd5WJsIZ52+0/D1qX/LBZ3OpZWR1N4mib5xo82E6Q8mwWbkJF9g07lk06nHp97bsOlcvS0j0wl8Opd9krv3WRsHZ5/cXZjjqxMDfJLjDIZc5LG9PRKzdcl95GLAYi5GLuSic8meUzkXndNnKbhzKrsjh0HrG0+n1toqOLvjfsIcXf1EC9yRm+54bO+OxGw9uEtYyrzI9QCsedS55M6pnHnO1X89S0kGe85le+Ru7X3/ZQcHkO7gfL7IAJe9wKWFcWFboYu4FxqxF18YM+fJGLggNFAxGQMXFsZAfdbPaj7vOtfCuDgM2vYB9bv2Eo7JCMh1ysoOneRGMq5je3d81cFdwpK7yAV3ziV3TmV3zoWJdA1GdzW7Y2v3qVibB2d3vsNQk4Q8R8Gdc4+vFxm2WhgXt/fpLYX3n1Y7PRSv9Uvnz7dxPdUsjvdUPcGsY+O1L+MP5K75tgqMwH286Ps49QyzOPRJulwT6Drd4d5e1C4yjh1HMz2pyPL3XVsAZ2vcJ+iQX/aJVVhzrtaA50GENGJ7aSQ6YJIWqCiN3JTGYyNClOacjzakkdtI4+kOVyPY8+B1j0Cac/uq8LuK/rM77gw8RZYJGu6ci+6I7d2R6IDJXaCiO3LTHY+NCNGdc9kdOfRJch4Jx9MdzvMW7sihmVarCVfbB2dp3GPokHW7SBkDac6l/e2F7aWFhiRcVQ+rnb6sPEuytSmNx8ZrozTnfLSRcOTQJ1lAII2nO5y7hzRyz82otCrrz9JY+3fIkuYbZ9/O6ZedMUmS2jsj0fH0FoGzQMVEIzed8diIEJ0554MNZ+TQp/EBpGv2gzSe73juHtLIoZ2+TVVa1e5naSzwO2RJC7WBc/rpR0gjtZdGouMlaYGK0shNaTw2IkRpzmVp5C5psnBAGs93vCyNHNrprFBpVbSfpbGy75AlTR40MD06lz4Rs7C9tdBQ33fX7YtUC1S0Rm5a47Hu0mu05pyPNlKNHPoU1jSe7nAuH5lG7pLfXVZrVayfrbGi75hlTR5wYc053ehHqpHaSyPR8VKqBSpKIzel8diIEKU5l6WRQ59CpvF0h8vSyF3Stqn285e9E0BWbOv/D5e0wIW39Ra1lbaI7mOQlqgkbXFD2jo2IiRpgYvSFneNtm94rfMdL1pb3NVOr0CSaj9VjB9TDZBbk6ckWHMu/Zn1wq5L+7e+tmvmqw+fLaD7mKx5tC/7SYIqsldr05q/VlfpKrHXK/s6bDOqJseFoT8yKrWirdPdyut3eLNncWimVx8VVnX4WRiL9Q5ZQ9NFxDXQEOZcFEZsK4xAx0vCnKqrkokJwshNYTw2IsiNA2GB+h4fvbz6DWPk0CFpBsZ4uoOZ91rNFvbsXYVVDX4W5oV6DU0vkEuYc/omZC1mP6RwYS8pwQh0B5Mvpz6/x/7BdVHwRW764rERQQYavpx6vOknieCLHDqk9zGE8XxHe9ftNghzbHRHvVX9ffbGIr0Dl7deI5c355I3Ur/ewqcbfkh0vCTOqRrWkGjkpjgeGxEeugMPdc49vvSf+6DOuTHm1/hAoFN1xXL/wyA5jFCfVnVVhZ/VsVTvjpY6uUcxRzqX1JHaqyPR8ZI6p2og5KqQc+SmOh4bEaI65ypGrziXFKgj9zzYyxlPdzi/A+DMuXEHqLqqxc/qWLB35FInHYA655I6Unt1JDpeUudUzjpyUx2PjQhRnXOP9xfJbKgjt1HH0x0uq3PuRl1V5Gd1LNs7cqnzqu3HuaSO1F4diY6X1DmVs47cVMdjI0JU51zFkFoa6sht1PF0h8vqnLtRV3X5WR2L945c6qQDyDrntJt4RiH1q05mOBQBBDpcMheoL/3iIOZLctMcj40Ich1Y6Jx6fOkOK7yRQ4d0nxZLHM93tPiM4tiNtyrNz95Yv3fg8iZ1Crw5l7yR2noj0OGSt0BFb+SmNx4bEYI3p7I3cpe3fqZYyxzPd7TozbGtt/rc3dnbBVnVrbvE//5InHtr6tebf+Wrie6oi4tUENdci+tjI4KJS5QN+H/Hbo8B/z97qTG/C/53tHbdBb3t8vx48vlS+wanhLsgF2fVd3Mcon/UdXBjAtehT6P/Mc73ENZH+p/fE//PiH196lP8P3ecJMF/7Tipc/614+T6IG92U0bmf8bp7mVdvjzgwVpuRqVVOX+W5jV/hbQHk88XclMaj0GaXCWc8XT3JjoLmP6YC5Q5VhcalEUuKIucLOtQRu7KkOc7Dsp4ujuZlZF7bkaVVaV+VublfIW0he3zxbk0QZLChYVNk9RMmh/ZTI/Dw/bUoJEc7yNkGY/1azW3kWNOPb71a1wQ5lyaIJ16/9BaCqlGDsPTY6zeqj4/e2MR3938+tStAyxsziVvpLbeCHS45M2p7I3c9MZjI4LMefDmVPbmXPLmVPZGDsMzFhQVV0X6WZxX8iVOpm+Icy6JI/Urzne7UjvJHNvp0f940cUCGUdumuOxfm3KOKeq31Z1dwT0SGZaTJHezLv+BiwyzbHhX71VhX725mV8Xb8sGfDmXPJG6rqjfHc5NZO0sZke+rooGTVoi5ykFyZP55JKpx5v+n4wJk9y6KR+FgAuef7p6mXth0xyVztr1VSLVayfLXpFXwMWnlCcSxZJ4cJe/i3VAyS6i0mjU1lj5IJG55JGpypqeGhxbuTSKhKcqtaCTHL3MquCP8v0Mr9C9rp6XRpS0rkkkxQuTOYlPIDy9DQp6Y+iwbH6ylbXQtc1ISMjJ8sAMtK5pNKpjxf9mC8ykhz6KNMEEpKnu4918TIWSEhy9w6rmj879JK/Qsq4wqFzySEpXFh8/iTQPUz56FTOR3JzNeSxEUEyFM8xTpWwkHvk0CGZpiCMpzuYpzCEOTdSWCbS179srACy+vxDbqnyFrjgbVHoptxvlXvrdHczfLE8YTH3QnPFee4FLuReoN5f9cvZlXuLu5JGOlku1/nuZEy+xV3t7FbD179ssgByiXK3QqJzSSIpXNj/z9i/JUcQK0mU2F5mAW18VJHFMY0+1N23n5uYDchkJu3fFJ68johydxT4w4/MQ0QCJwOJQL1S8oVmQvIFKibf4kbyrWM9hskYL7SpmHyrtWuk5f6AMW8nZl/gXmRf1fbHWfOdGwDdg7pX5GELcc4lcaS24gh0uJh/jqVv6Oirmub8f8OXOPS/9pVUx2ViRLJ5c2PIuWYJ1Id9KW5Nn4Ebren0WUX+WSB3Ap76IfM/BJLjUNX25jq21cV/6sZvb+OCr+7XWmU11Fz25e0VJ/lQa5XQXnQYmvu6y7INDp3TTiAJnfI7Ag6dG62pwyr4zw65KzCG70s/XguHzqUkJLW1SqDDpdnTqR9dCNbyc10T7yvo83996NunaukSsM83XehDH5tDhyRD4Y2nuzuPsbVy3aPQRgytjP6qsKr3z8J8U6BehJT7GMKcS8JIbYUR6B6ODqwkdCoKIzaF8VgHeOjbACDMsRImSzUII4cOhfUJT89okrUQRgytfPaMpsKqpj8LY+HfIUuYXBqEORc+Jd7Yr7GwWRYaqslkrbGWM4/3+Tb6enHIMuc+PvWNSMg859Kyxan0sf/Umn9KPFG1gpCxhU9GxaB1rqjOqurPOln6P+n0Wu+dHO91PPR4bO+OxGw9uHMsu3Muu3MuuXMqu3NOP0eMudOp7I4cBq3Vqruq5s/uWPLP0fUf4f16d85euYFOYnudJDpgmj2d+tAqFIlIjHcUko7HRgC5XTB5OlVTkHCYPMk9p8k1E8AYT3cw+yp/JBuxq5Vez6uxKufPxrzmryvvNq9Lw+TpXDRGbG+MRPcxGXPqpi8RwxixaYzHRgAxAWNOZWPk0KFOjmWMpztYNEbstbGPv+ypALJy3H+6tT6fYZw+fCrFFrUVtojuYhAWqCRsYUPYOjYCuLBE6YunlWELu0ZaFh6VYut8B0vCFnY10xuzkmIfVdsfUwyQC+s1D1MscOHba+vDJf9sbm+MRPcxGQtU+ChWx5vK/H/9i/n6P/s67voaJpSxsWusn5dRMMbT3cqnfr9jTYoLQytdSKiwqvjPwnxboOYGuZdqTvxwTishZBipvS8S3cPkK1AfOlPXnLjiTV/hf0OKBepDf+sUwsg9DzXnxHW6uxNTbLYydqXUWFXkZ2Netn9/6ZXDmHPJGKlfYzJQtdMcmkk7XQmLxhhvGuOxHsS0SxJCVMd7AX45gTI2hy7JaeQYT49oH/pMQZKRezavyqoaPytjyd4h68rlCQtlziVlpH6VhaIttJOSjO30VX2E1+VWY9OY/2tY4q//7ADvVoVCGFu7hMmwwBjPdzsxyYihmRdJVuX42Rhr9g5Zxrww+3AuGSP1aywkGYEOF5PMsWiM2DTGYzOC7HjUUjH0p/otHJSxuUuZP8d4ekT70NoIOUZOzGuSVcV9VsayvGPWpctYI8mcS2tFUr/KUpKR6HgpyQIV50Vy0xmPjQjSHygLVHySkbvGWpQiy3i+o8UsI4ZmxusMqqwK7bMyVuMdspR5QfbhXFJG6leZjBQeZQQ6XMyygEVl5KYyHpshZKzhzLHquDyrkGbk0KUwMfL0iBYfZeREvTqrWvvsjAV5x6xL70XoWuE7l5yR+nWW0oxEx0tp5lScGYlNZTw2Asi9A2OBis8yctdQywMDWcbzHS1mGTE08yLLqtY+G2NB3iHLWKjJnEvGSP0ak5FClhHocDHLHIvGiE1jPDYjhCRzrPotHJKMHHoUkoynR7T4LCMn5iXJPv+y7wHIymj/tcivwIUfHW/s11nIstBQyLJApb3FhQ1n69gYRbl3KssCFXeqFpeVrdMdLCXZwi5jPYWpsSrKj0n26ZX795f+zGWtPgIXjbG5vTES3cdkzKm0VbWuahrzfw1r/PWffRnZGFu7xtoWjKGZaOyplb2xKrfPxliTzysfP8PFB9mnc2GJv6i9MG8nCXPq/uHfn12fuvrnDDGN8Vj3KBlz6kPftV2z4gqADvmsuE53rA+taGuBv7BLe28raYpVrX0WxoK8Q1aKyaUhxZx76P5I7VUtbG/MG0rGnIopRmwK47HuURIWqLAb/NQf/cayWnms8x0sphijYVj2wqrWPgtjQd4RS5isiSDMOX0vDXyR2vsi0fGSL6dyhpGbwnhsRAhPMadihhFDh2RU4IunO1bMMGJoZXyJjWZYVdpnYSzHO2QJkxUThDnnv+bR1K8wGadaKaZmZBzqPVmBqu9wkdZqL3hx01e4UPlPrDoClRKM2DXSMu9AGM/36H089PcXMCeSu9rZP8Sq0D4bYzXeMcuYdBHGnEvGSG2NEehwKcMSpS9jwBi5aYzHRgTpDowFKhkjtjPG8yPYp767AMbIHYxVmX02xlq8Y5Yx3/P4dC4ZI7U1RqDDJWNOxY8prouaxvx/00PMKf9gIZYd5NAh/WErJBnPj/6oeRgjJuZ1Vqwy+2yMtXiHLGOdt2uh6Jx+BAyPMVJbYwQ6XDLmVMowUtMXj432Q4Y5VV8/I52GL3LojmxgQRdPj2BJF7HL+qoO1FZV2GdbLMM7Ytny3Y5P58LX7tYHv59egZaBwkOMQMdLupyqq+rl1XUPYUokN4Xx2Igg14Ep0aksjNyVGWuorwuAMJ7uYDcJhvQidTXS50XY7S97HYBsr0O/ra8eYYFLwhaGS0ufuVhA9zAIC9T3V8iwxQ1h69iI0GN0jXQJi5T+ykhl2OKysHW6g8VVx+IOyqrCPubYjWV4x6zBkRURlDkXlRHbKiPQ8ZIyp+qqZEFZObauairz/w0PsfWffR0xxxa3UebBsjJyB2VV0J+VedVfg+NL+5tzURmxrTICPVRJmVN1VZIrUEZuKuOxEUH+E1kWKFviIcvIyVhzXlznZzTN1poZF/esXifGKrLPyliJd8gaHF8p3pyLyohtlRHoeEmZU3VVsjCAMnJTGY+NCEFZoKIycjtlPN/RPFuhjNxrZVVnn5WxGO+QNTi++Lg5F5UR2yoj0PGSMqfqqnzxsa5qKvP/TROjU3F1vyKgQ/qlY7X6WOdHf+4pyxjvtbIqtM/KWI13yO9v/wXTr5tzURmxrTICHS8pc6quStbXyDJyUxmPjQghy5zKysjtlPF8R8tZRu61sqq0z8pYjnfIGpyw/HAulNA3Ur/GdGeplviLGPH0De+1UZWwb/3tVDhjwNHct+4T1dvxA5dSL7RmP/qLBxw5dFNuJGQeTz9dlNw2mCyde/rtWn3QVR1+9sli/Sl2eNCR481e5fSNx/b2SIzWk72ARXuRk4UU7DmX7DnlPzQKe+Ses2etTnh69PFbfzwU9px7+v1TtVdl+dkea/en2LIgQDHgnL2BAkKJ7YWSGAGTUMfqO4377e3X2CEdnavZRJ7ZEOpcEupUtSZ5BKHO6ZYSstKpH/06F2h17H4b36GrWqt6P2tliT9G+VsfxdBKbiYlj+0dkhitJ4eOZYfOZYfOJYdOZYfO6ZYOHDoVHTp2ry/hXhs04vD+l60VQLq18q0/aVYOA5dSc2FbrYt4rTVgUWvibvoqc6Vm4ILWQEWtgft8C1/WFbj4mcPFYdj6yatCq9g/JuWdOwJjfL/1FzohlNxIynVsb4//NVoPSbkaaizb8+Y+oz3nkj2nsj3nyp5M55WWoRfZHtvDsPUaU+3V9sHZHvcYeuC+v/UlAthzLqYjsb1QEiNgEupYFupcXb9ssCEdnUtCncpCnaurk/UFhDr3GK+HX4/7elYG7NWz8l6bA2ex3EEY4/ytX9YOseRmWvLY3iKJ0Xqy6Fi26Fy26Fyy6JSNei13Vs+7D09PNy5kA+c3BSx62Opsb2loetZ+wdkiNxX6GmtgZOkGi87pfVbr2EXtvXo76asVVkNPlyXVUa1jMyd5guz0sNrJ2jcNVA2GTKMQG1r71Pf4IDudq5/dkV5ALDkM2/5hWZsJZ5/ccXgauL5HrnsOPsnNrOSxvT0So/WUlQH71sUE7EUu2HMu2XMq23PuqR5caelctkcOw7Z/WNYewtmebzR8f2v5BnvO6SMV2Uhq75PEwadjH/rGbOh0rI71/XwNLJLRuaTTqRoLaQ3J6FwoKgPlNwdS0Vt7WgfrHFt7C2ervgFRPek7ZeUkuZmTPLZ3SOLg0LHo0LHs0Lnk0CkfdTh0Lq9fnfN7AhadG0WqOqyNhLND322oyLIMRGY6lzKT1N4qiYNVx6JVx+rqff8uXb2sBfCYjK2FzHTuadt0TbTO+V0Cq849LYrVa20unL36DkSNjPQZXsnN3OSxvUUSB4uORYuOZYvOpdx0ykcduenc06pzWXSurk7uClh07unxKxa//rLnA8j2fPQtV2UxcOHTXovael1Ee9WS8B8xWo2ILG/quRlaK06WnfXcDFzwGqj7h3oor4mT+76WsIGqa5P1ZFldHMasL11l1r7CMSW/uPnQg/v9PTYF+bgMXJLJ1vYySXS8JNOpD31hDS4dq4uXLIBL5/QLSGqmDdT9Q3+PAS69tfGtlszQRNl79OHyZWuqtHYgzkp9m6JGxVdAX84lpaT2Skm8VurU/V1X23DqXF29PPvh1Lnk1KmKKncInJJDL/VOQ2byfPfx/jE+NXtZh83AdZ6rzdpiONv0fYgaD1lNYLZ17l2/la3KlIXtdYaGZPgx3TqVp9vI9Zx1DRx0OpemW6fuH/pxfugMXGtYKepUnm7JYcz6iaI2a1/hbJObD30flU25NNh0LtoktrdJogOm+dapON86Vlcv2QSZzqXcdKq+MUvubMgMnIwYMjRQH/qubGRo4Lo1dVq7DWen3JLoIa5RkY0nOHUuOiW2d0qiAyanTuUJ17m6fMl4SHUuSXUqT7jk0Ev97TPo5Pnu491+Txo6A7fXWfsNZ52+KVHj0Wl/zR7Q6Zy+Dw/zLSn0U+6JeuPPOt3dTCrZSFN1STKJ4tnp3PtD149QGbgetKuDWA8F6qFLQ+QnOXRRJgOY5Om++M/6vNN62fkKB5PknpvRjKzNhrNC35Go8ZJ1NBQ6lxSS2ijk6e5fUujUt/3sPBQ6d3/XLziHQufS89Kpak0cQSG557FfD0qe7i5mheSem1GFtbNwVujbDzVecuVQ6FxSSGqjkKe7f0mhU3VJsq6GQuc+9au/YdCxZNApH3oYJPc89MsgT3cPP/XSkYPEnltRgbWpcBboOw81WvJYgUDndH2OaZQULuwj/HbbArqDSSGbaaouSpYcUEiOG1DwxWP9v8lXoOwt9fBF7nmkly+e7mCuHcLIXeOy5lQR9v2XbR1Atq2jn8wqYYELwha1E7aA7mEQFqgSJg+PEra4IWwdGxH8KReo2z18h8/isrB1uoNFYYt7Law2BY4Z9u07BzU2vlAJXBLG1rbCCHQPkzCn6qJ8qbIuagrz/w0Ztv5zXEfKsMVthHmwLIzca2FV95+F+eZAjY0vS76dS8JIbYURGAMl828V8iHY93f4ks7FTWEhQsgwp273L7klakpcETbCvJksjNxrYVXTn4Wx8O8RrLHxRci3c+F1qEVthYVmgjCn6i7yZ9gKN4X5/6YMC1TMMHLPI81n2LqAHr0sbDbT/dVnWNXtZ2Fe3JcwWaLhGeZcEkZqK4xA9zBNiU6VsPAMIzeF8diIEDLMqfwMI7cRxtMdLAsjh2b2wqoyPwvz8r2EdZvXvQRhziVhpLbCCHQPkzCn8jOM3BTGYyNCEBaomGHkNsJ4uoNlYeReC6sC/CyMVXqHLGEy+0CYc0kYqa0wAh0uCXOqLqrf2X7dRVglkpvCeGxECMKcys8wchthPN3BsjByr4VVuX0Wxpq8Q9bYSA8hzLlQSC8KF/b2L7pzXTtai+h4yZhHqxQLxshNYzw2Ikh/avcqXMftoV9ahlUHW9sY4+kOlo2RQzOdDvoQq/r6bIxFeIcsY/K8gDHn6rX9VQNeN32Vzgu7OhhK5wV0vGTMo9VVSbWBHCM3jfHYiBCMOfVhr5jCGLmNMZ7uYNkYOTQz5iZVVhX2WRnL8I5ZgyNLXChzLiojtlVGoOMlZU7VVUm9AWXkpjIeGxGCMqdud/0OEygjt1HG0x0sKyP3WtnjL9sdgGy7QzdaS1ngkrKF7ZQtoPsYlAXq+1s3bEvZ4oaydWxEcGWBut31S0lL2eKysnW6g0Vlizsoqyr7mGUPluIdswbHV/eBi8rY3FYZgY6XlDlVVyVLWCgjN5Xx2IgQlAXKPo0OZeQ2yni6g2Vl5A7Kqs4+K2Mx3jFrcPr5yPX9w7mojNhWGYGOl5Q5VVclAw9l5KYyHhsR5D9r9bH+s6maGIWDMra2UcbT3UxWRu6grCrtszKW4x2zBkfWFZgYnUvfM72wrTJvJylzKi4/VripzP837Hqs/+x+x+XH4q6xfl5u1cud63Q3k5Xxoq5merqQ5cejau2zMhbkHbOUydoMypyLyohtlRHoeEmZU3H5sa5qKvP/TcqcisuPFWGjzJvJysgdlFW1fVbGkryHsJT5ivHhXFRGbKuMQMdLypyqq5INT0yM5KYyHhsRZMLDxOhUXn6Q2yjj6Q6WlZE7KKt6+6yMRXnHrMGR5TSyzLmojNhWGYGOl5Q5VVfV8wn3PtZVTWX+vynLAhWXH+Q2yni6u5OVkTsoq4L7rIxVecf8rk97Pk/aUOZcVEZsq4xAx0vKnCplkivIMnJTGY+NCPKfyDKn8vKD3EYZT3ewrIzcQVlV3GdlLMs7ZimTKQjKnNNPCNXmx6JwZem7OhfQ4ZIxD1aPMrmPYCxx4eskApcSz1uLm46rNXRSMh8rEm8mWySHZsY7s3VFUkX42SIr9R7WsijXBovOJYukthYJdLhk0am6KClGYDFykmX1jpDAJYve2nva61+tbSx6M9kiudcWf/6yRwLI9kh0i7EsBi5YXNTO4gJeWgxUfDktcvozYmUxcMFioOJLbIvLFtfp7mK0uLiDxSrVj7n4w3q+Y9Zt70vNwIVXABa1tejhQi6uZuZFhb3JyOnHoWExRJWMredioGLBsDh0UiaImlHX6b74bJEXdVns2U9m1J+q3s8WWeJ3zJIojyDkonPJIqmtRQIdLll0KtYL4aLq4uWhDoveXspFp2INsVrbWPRmskVyB4tV0J8tsurvYa2B8C3MH+eSRVJbiwQ6XLLoVCwhwkXVxfdtfZUasOjtJYuBSmXFam1j0ZvJFskdLFaNf7bIjYAe1hoImSeQi84li6S2Fgl0uGTRqVhVhIuqi5e5Eha9vWTRqVhprNY2Fr2ZbJHcwWKV/WeL3BvoYa2B8I3OH+eSRVJbiwQ6XLLoVNznDBdVFy9bfrDo7SWLTsW9z9XaxqI3ky2SO1isnYCzRW4X9LDWQITVjXPJIilcmdwK9eaGH57uYMmhU/HNDaG1+FmPwCWHHjV+1mO1hi7KIxhrG28mOySHZsangnRtU1sDZ4fcP+hhLYe+s/bjXHJIauOQpztYcuhUOZQHddWK4ZLShz0ClhR6UB/7etVotSZjfz2A4TC0o9deHx5Y2POdoAZrW+BskHsHPajf3+EnVn6cSwZJbQzydAdLBp2KH5oLlxQ/NJc4eWqiwvCo7+lDc4t7Hvtl0JvxOwEKycmdoA5rU+DskDsHPazlUGYIrGqcS99TvzBcWtp6W0DHSxo9Wtx6C61VlSsJiweit5cy0am49bZaQydlAYhE9GayRnKXxn6KP2usHw04a7wg27Txn85JXNDY2EZjA680JirtvW04ybP/vCXONUYq7L01FzX26e5i0tjcQWNtC5yysX6KIey96W8N/WsNhHNRI7GtRgLdR8/GFC1tvmXON98SlzT6taXNt25to9GbyRrJHTTWvsBZIzcPelhrUpWZAhqd+/E91MZ+Nfr7b5vogMmjh7t/au3zH+Oy+iWoGEES9L/Gf/Z1+GD/9+CuwZZ1+/+M891OXWlPkdcT838Hh3b6oaUzaO0CnJ1xq6BDljPpIpw5F50R2zsj0QGTM6dSWdGXNZ35/6Y8cyq9Z7ojPI/1Pxcvfbq74+qhjOFEvTqrmv/sjBsDHbOcSQUHZ87p1/3826B+lYn6fx9Ah0vGPFh6B0y6qHo4Sv2Dh563lyw6lTa5u7Vr+J9fE0fieTPZIrmrmb5otVg1/9kiNwZ6WGscJNlh0blkkdTWIoEOlyw6lTa500VVFdtT0ZUesOjtJYtOpU3ubm1j0ZvJFskdLFbVf7bIrYEe1rIoUzssOpcsktpaJNDhkkWn0iZ3uqiyaJvciUsWPep7PUCfkw1PQXIbizzdXcwWyR0s1v7A2aJvIpTFzu/rdoZF55JFUluLBLqLyaJTaZM7XVRZlHkcuejtJYtOpU3ubm1j0ZvJFskdLFbtf7bIDYIe1nrV0F42rJ8jsnIjWSS1tUigwyWLTqVN7nRRZVEeB7Do7SWLTqVN7m5tY9GbyRbJHSxW6X+2yP2BHtayKI8W5KJzcUVK7FdjqiJIdMDk0alaL8qiC1UEubki5bERQfITVYRTeUVKDj2SccFahqc72Ie+pR0LUmKXsn5gyVLm/S/bMIB0G+ahM38pC1xStrCtskV0H4OyQNWAygOplC1uKFvHOoI9GctZwCqEPEHrmbe47Gyd7mjVjFTOJW1xz82os6rpj2n2zsK/Q1aayZXDmXPh53Ma2zvzhuyNoP+I8d7r6PMqAtJCcw//3cfEhfkytXbXZRw8etSnb/FnWRg4+yEX+PTmXvx8Tv260V/E+nZHiZXpBmLJ8a6vWnAd21vkf43bRt/OC4uOZYvO1cXKjV9PvdSedAnZ6K3ZqEOiY+nncxJXHyntqfKSDYve3tOPDGh61lbAOT25XzDG+fEmjxtYdM6/P6epvVdvR6cxaHWqdMkiBclJjvcWFPJY9yglolM3e9MQHJK7ZkJxUk/BdX5Eu+mXbcDdbGdsQqqzKvzPzrg70DFrdOTa4My55IzU3hmJjpecOXX/0fkAzshNZzw2IoS0c+rzU8cazsjtnPH8iHbTr/SEM3Jo54WzKvPPzrgX0DHLmVd+784lZ6T2zkh0vOTMqfrtLLmT4IzcdMZjI0L9hvTzAxSTpXM3+/4gWCOHPsn6AInG00/hZEqANHIHaVXVn6Wx9O+Ytfnkhd67c0kaqb00Eh0vSXOqfptKRgzSyE1pPDYiRGmJ00/yQxq5a7RFPqzxfMdz+bBG7lm+zo5VxJ+lsdLvkCVNFnaYHZ1L0kjtpZHoeEmaU3VVMmCQRm5K47ERIcyOTt3sM8ZQRg490t+GgzKe72g/2iEYIybmVVlV7GdlLOs7ZA2O3NFQ5lxSRmqvjETH02hYhDhVVyVrRigjN5Xx2IgQlDmVH2jkdsp4vqN9VuH9PBXDGbmDsyrZz85Y13fMGh3pI5w5l5yR2jsj0fGSM6dqbpGnBJyRm854bESQ/uBx5tTnQ3dBkWbkZKxX5cbzHc0XoHBGTtxLnn38Zf8EkO2f6N5SOQucfdFCVXEL20pbRHcySEvUu347fEkLXN1yIrcqgMDpjVkiA/VRHz97TpoSuTj0UrK/pst1urt4v+kXqJTHxPXdpTarXj9m4IcX9TUcsniDTeeiTWJ7myS6q8lmoKyygk3n6vJl/GHTuWTTqXpzmct07H7T99DAauL0dUdYDdzeatXvZ6te5Nfo+Zrzw7loldjeKonXVp266be2QqpjdfWy+IJU55JUp8qW5CBSNHBtgTNuomrKfb5H4PRla5qpVdefnbL47yGuUZHFHzLVueiU2N4piQ6YMtWpuixZdkFq5EQDpDqXpDql34gOpaTQR129I0F5vntYt0aQGbi+NVRmFfxnmdwV6Mg1at3mdbtBpnNRJrG9TBIdMMl0qi5LZkDIjFx4iDqXZDr1Yfuq0Elup5Pnu49ZZ+B66FVnbQWcdXK/oCPXuMmNBJ3ORZ3E9jpJdMCk06m6LHk6QmfixkdHrrsRuelc0unU511vIugkd+mUiQzZyfPdx3u90ORTbeD2OmuP4KyTGwkduV5Pk8jQ6VzUSWyvk0QHTDqdqsuSgYPOyMmUDJ3OJZ1OeVZBZ+Baw3p+OlW/hiu3JJ6f5CTXNTtrA+Gsk7sMPbo1bvLogU7nok5ie50kOmDS6VRdlgwZdEZOJmXodC7pdMqzCjoDJ9eGHHUq6yR30Fl7C2ed3IDo0a1xk4cPdDp3r98NfZ4/UIGS2/sk0RGTz0DFCtS5XIE6l3w6lStQcuhlEMnT3cUaLMkR5GXi1pBqdta2w1kn9yY6cukMz07nsk5ye50kOmLSGah6eq6+XjMa0tO5XII6l3Q6FUtQx+53/W1A5GfkZO6A1sStrorWz79sEwGybSL/qbf6SWPjotbFbbUu4qXWQKUaNGAlX5YANekGLlgNVOmS1mrSjdzSwGdopPR5VlIjt1pTqbUJcczVT9+pqK9X8H2FwGWpbG8vlcRrqU6VLZnqK1fDdRUnsxysenvJqlOhCF1toY+6T1opus53D+vekGuCTY82fi1Abdb2w9mm71GUTbkr60H66Vy2SW5vk0T3Ncy8IV5ZkkkLNr214mQhAJvOJZtOxSp0tbbz6e1kn4nbZmftQJx9+jZF+ZQnFnw6l32S2/sk8dqnU+VJ1vzwmbhQhgYu+fTWYhm6Wrt8ypyB/PR2yqfcjcjPxG191hbE2afvU5RPuUL4dC77JLf3SeK1T6dqxSb3GXxGTq4f+elc8umU5xWeoYlbHtYz1KlYuKzWJNt1vq09iLNP36gonzLTw6dz2Se5vU8Sr306FQvRcF3FSSbAp7eXfDrleQWfiXOfTmWf5A4+a/vh7JN7FD265VNqK/h0TleSVYYu6temNPPvA+hw6eEZgvkXona08dr1uoIRQC6jXvJMlL3JGt54IeiP3OSYVnm6g9XgPXvFrErs8tVzjOZf7S+cfXET4imk3L/w5VzyRWrri0CHe9cSrd4hEqK922cgMJuyuWmMx2YIGUQoc6zGWhZKUEbuGuxnF1DG0yPah74vAs7IoZku5FVZ7SSclfl2Q115t3lN51DmXFJG6leZ7rUhx0h0F9P7/gN2e9PvNIGz0NxDf1gUM6Zz+v3l0OjU7U2/QAQandPPZsGmU/VBPKnlYJPc802hNmsD4WzTdxkqZCg4yPFWx/TIY3t3JA7uHMvunKtbT1atcOdccudUduec7o7DnVPZHTkM2nbyvP1lPweQ7ef4L3jWb8UZF34wprFfnd/ynKlUTA3J2rFmz0B9vOkH8CoTF8dbqsytY33D1J3wPO1V2gWsQvRoXnNQpd3inhOFK851uqO9/+h7virfFnc108khCXer7YBjwgFyaTKKNX0G7l0HsXJwYXtpHjCsUVY7PRRZGlub0nis/zdKcyxLI4cuidNKtHClWdpsZrx9SqVVzX+W5hsDldzyVIc0597DQ29h1/3kPzMY25FbBInm0W6f+uYoJBq56YzH2lkoCNZ/DupHv5oeecbW0CEZFijj6W7mfg+rlMU9m1djVdWfjXnpX8ZkSoMx5+LcSAxX9vYvaW4k0X1MaeZUVkZuKuOxEUE6hKkxUFEZOfRImoEynu5gd12cYWYkhlbG23lUWZX2Z2Ve/5cyrwVuzukb7jExkrquLOUYge5hEuZUFkZuCuOxEUFGGsICFYWRk6FeDzOe72g5ycihnV47qbEqys/GWLl3yDImj2skmXPxWUYMV5aTjEQHTM6cys7ITWc8NiIEZ4GKzshdzsKzjOc7WswyYlczXWqpsyrMz85YvXfIctZtsny7OVc/xfG8EkOaEft1plMEFo0kOmBy5lRef5CbznisI9zGXHT1CInm2EetHJ67hIcZOXQpPMx4uqPVhzt6UXiFw9RIDs30LaTOqjA/O2P13iHLmchAnjmXvt9wYXtnoaGw/nAqOyM3nfFYdyk6c8wHG87IoUvqHo8znu9w7h7SyKGd7rFKq/r7LI1Feoesb0yXYh7SnNMpFHlGau+MRMdLeeZUdkZuOuOxjhDX+Y75Ah3OyKFL8piHMp7uaF4uQBm518qq7D4rY23eIUuZpDaUOZeUkdorI9HxkrJA2atd/zGuaipL//s842FmdOr2o19fBWPk0COZOGGMp7s797sulWEsceuiJNfuf9kJAWRFtX5Yp8QFLohb1FbcIrqnQVyikrjFDXHr2IjQDxE+0gJ1f9MelbjFZXHrdAeL4iK3FVf19zHj7izSO3JlXE+8XI0ETrtZk+Si9uI8XhIXqCiO3BTHY92jUFivK23q802/NhXi2Bp6JAvryrh1upvJ4tjM5Lbiqlo/i/OSvsTJagkZ59yHvm8E5ojtzZHoLiRzTsXH24o3zfn/psfb+te+EH8uQR2bQ5ckdaGOp7sZf0rWZLk4NDN6rNNkFeJnaazWO2ZJk2uDNOfSpsjC9tJCQ5LctY+12unLytLY2pTGY/2/UZpjWRo5dMnXJOFKs7TZzPiQn0qrUvwsjfV697CkybVBmnOpYFvYXlpoKEhzKhbZK96U5v+b5kinvr70o2BINHLokVwoEo2ne/xqjpRaHIlGDs10TqiyKsXPylivd8hSJtM3lDmX6rWF7ZWFhmQkkGdOZWXkpjIe6y4lZU5lZeSex/p62kMZT3ewrIwcmhlVnzqrSvzsjOV6xyxnssiFM+fSSoTUXhmJjjdm92skoMyprIzcVMZjI0Lf12sJ6VRWRg49klsZyni6g9XwyRYFssy5sSuv4qoaP4tjyT4j++9Wf9+diysRYntzJDpgMudUNkdumuOxESGYcyqbI4ceiRGY4+kOlvYgF4ZWRn9VWVXjZ2Us2TtkfVWt19l35+I6hNheGYkOOLqwks2prIzcVMZjI0JQ5lRWRu4abNkzgjOe72jRGTE082IZUvX42ZkX7eVMHqOYH53TTw5hvU/qV5nKqG3jRXQX7bvcMEGyoYGl10AXN535/6ZnmlPZGblrsMU9nPF8X2l8fWZxaKefP5JnX3/ZFgFk2yL68m05C1xahyxsK20R3cckLWFJ2uKGtHWsQwRpgYrSFndJk0V1SVvnO1qUtji0082otCrDj4n25bV6JZpX1oHTj9dUoi1q78zjRWcBi87ITWc81qOYnDmVnZG7nPlSZHW5o2Vns51++KizqtPPzryYL2cyByDRnLvp+08hjdheGonuY5QWsCiN3JTGYx0iSXMqSyN3SetpjUv+1eWOlqXNdjopVFrV32dpLNI7ZEnr5L0uDdKcCyv+Rf06Cy+ELqLj6XOvHmiBqquSu7x2+xc3lfmVJmVO2ccoq6xeAdAhvUkxNXozH/oJolrwL+wSv9tz/Kri+yyMFXoPYA2N3EsQ5py9ixZZRmxvjEQHTMacysbITWM8NiLItFGvz6wrbSoaY2OXMbmRYYznu5lojNjVzNZY1d5nYyzQO2INjdQgMOZc/WjICn1lIowR2xsj0QGTMaeyMXLTGI+NCMGYU9EYMXRIv/EYxni+g0VjxNBMD5tOilV6n415fV6/EC0VCIw5p69tQxipvTAS3cMkzKksjNwUxmMjQhDmVBRGDB3ST4tDGM93sCiMGJoZ342nxqo0Pxvz+r2M9XpmPcacS48xUntjJLqLyZhTdVVSLuIxRm4a47ERIRhzKhojdhmTTVEY4/kR7FPfD4XnGDm00/1QY1Vxn42xLO+QNTZyacgx5+JzjNheGYkOmJQ5lZWRm8p4bEQIypyKyohdysJzjOdHsKiM3NXOepqosqrLz8q8eK+x6fXnSjLn4oOM2F4ZidnH1YUrHBaLTmVl5KYyHhsRgjKnojJi6FB6kPH8CBaVkUM72yfZ9182PwDZ5od+uKOyLHDhSbaorbFFzC6asUBFY4sbxtaxEcGNBSoZWxg6FJ5k6/wIlowtDu3sH2XfVWwfswyQK5MJAMqcC4+yRe2VeTthXlzt9EiUMq/IFjeVhQhBmVNRGbFLmTwv6lG2LqAv9P1zvLpyzRr1KFsc2tk+yr6r0j4bYzneIWtsvCRDY2I2PcoWtlfmDSVlTmVl5KYyHusuhSJ6XWlTURkbu5TJnQxlPN/NZGXkrnbWrCKPsu8qyc/KvG6vsem5lo8yNCbK0qNsYXtl3lBS5lRWRm4q47ExiiHLnIrKiKFD4VG2OjyCxSyb7fTwqrIqts/KWJF3yO/Hjxdl386lRxmpvTESHS8ZcyobIzeN8diIEIw5FY0Ru5JDKh8kGc+PYNEYObTz4lFW1fZZGUvyjlnK5NrwKHMu7OIvaq/M20nKnPp4H5+NvHK/qrIV7+nq+1FxcfVx3cDpa/61fRWoitopcbVWO46LQy/lNDT6xd+/dGrG4y1wfW9p/lUlfpbJcv1pOOQBDJnOJZmk9jJJdLwkM1Dpyy3DVdWtKLULZIb2etwuSZAZqPpal/VIWjLJoZe6qw6bPN99vH/p99bBZuD6qtRmFelnm6zkO3KNR7d59QA2nUs2Se1tkuh4yWag7ppMSE3n6uplZQGbzmmuwGai9M0zSE1y6KWmLmzyfPcx2wxcj7zarPr9bJNFfkeu8ZDVOWw6px/aqg3LRe1tejvJplN1VZIlsBk5mftg07lk06nPh37BJ2w6p2UCnDpVX4LTtq48QYaSw5iNDFGbVdqfbbL+HzZ/wk9wfzv3rj/7CZ3E9jpJdMCk06n83HSutIfnpnOa6khOp/Jzk9yVnM8zMTzydHexJhZ5esFj4Nq22Hz8ZQsGkJQQ3z/6JRaVm4FLNhe2tbmI7mqwmaj04Axc2fQHZ+BCcgbq/q2/yFrJmbjWcCVdSQ3Uuz2GS+riMGbjHQmqs7YWjsn54P5Dj27plLsbOp2LOontdZLogElnoNKTM1xW6fQnZ+CSzhQ1PDlXa+jleA/eEunt+G0BkYHr20J11nbBWSf3FHp0S6fMC9DpXHoX5sL2OkNDEq72tFc747LSozNz/ugMXNLp1/b5oz8KiOx0Ljw6AxUfnYu7bo6eWVRnbSWcdXK/YYzbjz4ToTNwkgT15FzU3qa3k5LTqduPvm20FkIr3tgkWMe6R8lcjCALQJgjhx515qw85OkOVhcqzSAPyaGZXtCpsdpKOBvjfkOHrASUS4OxwAVjpPbGSHS8ZMypbIzcNMZjI4L0p9Y1oT/65drwxbYuX7LZhScgz3esLIwc2ulhU2G1aXAW5jsLJazbvO4lCAucUEgxUnthJLqLSZhTWRi5KYzHRoQgzKmKIFM3lJG7lNlCdJ3uYN4MUmw2s0+x2hg4G/PdgzImWQ1jgQvGSO2NkeguJmNOZWPkpjEeGxGCMaf0W9jhixT6I4OCDOPpDpV9kUMzPWqaYVX6n335/kD56ntgZZhz+pYXZBgpXNj7v8gw1YcMFtA9TLrYTFMfb/ol6HiGkZu6eKz/Nz3DnKoIslsMYeSuDnmC8XQHy8LIPTejwqquPwtj8d8hS5iswpBgzoUvxlvUVpg3k4Q5lYWRm8J4rDuUhDmVhZFDh2TCRIbxdAfLwsihmf0ysQr4szCv8r9/3uXxCmHO6S4vMowULuztX8K7nhfRXUzG2E5T2Ri5aYzH+n+TMaeyMXLoUU9ma5nI0x3s/qa/dIVnGDk00yWypNjPX3ZRANkuyvi0K+fEwAVji9oaW0R3MRgLVDS2uGFsHRsRZHKuZWKgorHFoUf+FFunO9j9LWxjLu61sSrDjzn247V65VjfBctY4OSWqxxbreHC0lNsAd3DJMyDZWHkpjAeGxGCMKcqgsx69RRb13t1SJ5yNSuu8x2tZkUxWzm2OLSznRV/qmI/G/OyvpqXS69ZEY1JLo4d78srjJHaGiPQPdRgtROymmkqG2Nr0xiP9f+GSTFHkG7DGFu7OtRDzVlxne9o2dhTO2v9orNildhnY6zDO2QZk0uDMefC6z6LQgfjc2wRHS8p82hZGbmpjMdGhJBkTuUkI3cpkxU0koznO1pWRg7t9BSmyqrIPitjJd4hS5l0EcqcSw8yUntlJDpeUuZUVkZuKuOxEUH6gweZU1kZuUuZrKGhjOc7WlwtLu61sqqyz8pYinfIUibPKChzLikjtVdGouMlZU5lZeSmMh4bEYIyp7IyctdQy8QJZTzf0Wr8wqPMubGtrMlW9fbZHIvyp8gyD8Ccc/bTMXikEdurIzEC6jILDzXH3m/63Q9VTAeuRk6Sol4ZD5xOKUhBj1ofyJfRwIPOuXpVLXh17kd/iAIrFMfut/Ej5Cq26vKzWBbvY5x/9IUliCXHmx8WeWxvkcRoPVl0LFt0Llt0Lll0Klt0rl6xkhoX2elctOjY/Tb2f9RiFetni6zoxzj/6I4ILDqXvrVmYb9iZUKrna4FdLw0sXq0Wvv1U/9a7yE5yfHeQiLyWEcI72kI1MddP26FRGRr6JCs6mCOpzvYx2cqEZx7Ma9WzX4Wx8K+I9cQyQwBcc7FeZVY6Ce08XRHSz9YFbCPd/3ZM3hjc9Mbj3WI5M2pu/4uKbQRQ3fkLoQ2nu5YH/ZN8Jg3yaGZLhCfE+3x9ofdkwuSiq18yR31r7fIyTrn3waFC3vzHeXUjOdZoj7tLYj/McK1r/S/7itRFUEWHv89IqBDuuP8P+P8MGY/zvy/kdsm2uOtNgpOiXZBLk7uKYjzXQd9uynEkdqKI9AdTeISpT9+BnHkpjge6whJnFMfNuAQ59wY8H8W5pHShTnssbEr3zo5NOGqfD97Y43f3ayEk1SCN+f0+QdvpH69+QZzEx0viWM7TdV7oyQfII7cFMdj/b++OOn/HNRNPz8CcWwNPRprwaWM50c7dqVwRu5y1ktZdVb1+9kZi/yOWc5kdODMueSM1N4ZiY6XnDn1/a5rBTgjN53x2Ihw0x/E/a/xv83VV3XJUhHW2B76JE97TJM83c283/xlgeZEvkqrSv8szbcDSlrfCNcNBWnOJWmk9tJIjD7KSPwjRqvFsi0h+6qmtBBBJnwoC5QlCJSRQ4/0Qy5wxvPdn/oOJVGPRCN3cFYl/NmZ1/nlTKpaOHMuOSO1d0ai+5gSzanvd/0WdiQauemMx0YE8w1ridOaDNbIoU+aQbDG8x3PExbWyF3tbLaaH29VoJ+leRVf26dyo0Cac0kaqb00Et3FJM2pepNoSDRyUxqPjQgh0QIVE40cepQSjec7mr22AmPExLzOjVWNn5V5yV7KupJYc6NzSRmpvTIS3cWkzKlS1sut66qQZ+SmMh4bEYKyQEVl5HbKeL6jfX7r2zrgjNzBWZXhZ2deq5czuaGRZs4lZ6T2zkh0H5Mzp2pulKURnJGbznhsRAjOnPp86BdVYGYkJ2O9Fo48P6KZezgjJ+41z6oGPztjod4xy5msCuDMufANo43tpYWGJBwWIU596Y9TwBmx6YzHukdpse/Uh72LBs7IXWO9nkJLGU93sNuPPhShjNxzM2Ls/S/7IYCsrNa335axwH34l2w0dl1Z2BAJ7YQsC9TN1kVlbHHD2DrWgxiMJeqma5wytrjnoaaxdbqD3T41XBlbHJoZ1a8qq8L7mGTvrM47ZiWZTCRQ5lxURiz08N9jK0kYG3m6JqnyIYzcFMZj/b86grVgXP/ZlI80hLG1qzvyuKgF4zrf7bybeBib7XQzKqyq7rMwluYdsoTJMwPCnNNlZW2BLAodTO9NaKLjJWUeLecYuamMx0YEuQGhzKmsjNyVHLIqgzKeH9GiMnJop58Cqqxq87MyL+BLmRfT786Fb/B9LGzvzBtKzpwqZ3InIc3ITWc8NkYxOHPqS385DVlGDB3SNx9CGc93sLu95Q1ZFri+KDVXlffZHMvzjlzmvKR+dy6aI7Y3R6IDJnOBCl+AWMv/fz6PpzkeGxF6kK5HEbLNKR9yqAuctAaBTv3oL5zDHzEMz3gjlZqr6vtsjiV6d7Pe4+J19btz0RyxvTkSHTCZC1Q0R26a47ERQcYa5pz60e8xhjhiMtZrLcLzHcxvADgLXF+Umqsq/GyOpXpHLnMykeMB51w0R2xvjkQHTOYCFc2Rm+Z4bEToQVo555QPOdQFTlpDzjn1bl/FBYHkMD49ymquavGzORbs3c0y18udq6Mw51w0R2xvjkQHTOacymsTctMcj40IMtbIOaeyucBJazDnlK90YI7cZW6vrkryszrW7d3PUtfLnqXOuaiO2F4diQ6Y1Dl1s+cvlijkpjoe6wgPfS8F3Dl2swcFso4cuiQDA2k8PaOJWzgjhlZePOKqJj87Y+HeIcuZ7Pgh3ZyLzojtnZHogMmZU9kZuemMxzrCQ1ekcOZYOZOewxm5jTOentFkcQdnxF47+/jLDgkg2yHRN9OUs8AlZwvDpfUMcGVrldvrdHcwCAtULXK93F7cELaOjQhy15evQPmMVr4Wd3VH2qkkW+dHtFS7Le4ytnbG5Jn2UUX5MckAuTAZHAhz7v1Nv52nCu7F4dJiwb2I0UmZb2oXMlDxoba4KS1cqww2pAXKBhvSyKFHulkOaTzf/XH5lWaLQzs9wCqtyvKzNNbuHbJmRqlsIc057QCUkdorI9HxUp45FSfGFW8q8/9ND7P1r30h8WG2uMvZSpBr3oCyFE3uEBgjhlbG+xpUWZXlZ2Veu5cy3yP5cE4f6lBGaq+MRI9UUuZUVkZuKuOxjhCVOZaVkUOXZKqHMp6e0YIyYmilZxU1VoX42Rir9Y5YxuTxiSRzbix8rlsOxkjtjZHoeMlYoFKZtuJNY+F/ZQgxLwYqzovkLmE91ivJeH70JxVoKx7a6WJKlVUdflbmxXp9isQ3RT6cS6+oLWzvLDQkI4FnWaCiM3LTGY+NUQzOAhWdkbucSTvIMp4f0aIzcminO6zOqvQ+O2N93iHLmUwASDPn0rOM1F4ZiY6X0sypPDGSm8p4rCOkRX7oUFzkLw5d6vxYaZaiySyFZxkxtDJSQpVVzX1WxsK8O1jK5NKgzLn0LCO1V0ai4yVlTmVl5KYyHusIUZljWRk5dEluZWQZT89oQRkxtLJPsqq4z8ZYlnfEMtZtXjcTjDn3oW9KwsOMWOgfyjKe7mjJl1N5hU9u+uKxEUFmMzzJAhVnRXJXd2RNBl8839HyCp/c87BoilW5fRbGmrxDljDZAYAw597TtEgMVyaJCmE83dGSMKeyMHJTGI+NCEGYUz7QKMnIXd2R2xjCeH5EM/GYFMldwjoDxdjnX3Y+AFkhrZ8qKGOBS2uPhT3fS1eilrF1evRQxqEWHoGKxhY3jK1jI4IbS5SNdBlb3GVMVmRlbJ3vaG6+jC0O7XQ6qLAqyY8p9ul1e6VYF+acEwOXtqoWhiuLGx+L6D6GLAtU3K1a3HTmXQpvDln/2dfhYw1nbO1yJrsLcMbz3U58c8jirnb20qraPktjSd4xS5pcG7LMubD0WNTembeTnDmVnZGbznise5ScOZWdkbvGWmZ6OOP5Ec3yFXlG7mqn814TrcrtszPW5B2znMljFs6c0zqg1h6L2jvzdpIzp+qq+hlwpX+99LLiTWf+v8mZU9kZuWusZVzgjOd7/HKekbva6YlMnVVdfnbmxXt9IF/mbThz7l2XKZBGbC+NxOhkeKA5lR9o5KY0HhsR+sa+dNeacV1pU1kaW7sGWwYG0ni+28nSyF3t9ESm0qrgPktjVd4xS5rUH5DmXFgzLmrvzNtJieZUdkZuOuOx7lFKNKeyM3LokX6gAc54fkSLkyO5y1knrDqrkvvsjHV5xyxnMnHDmXOmFolGbC+NRAdM0pzK0shNaTw2IoREcypLI4ce6bfnQBrPj2hRGrlLfs/zKq2K7rM0VuYds6TJdAVpzoVvf29sLy00JOGw3HcqSyM3pfFYdyllWqBssLF0JIce6bvSII3nO5rLxzKE3CV/PztW4X2Wxuq8Y5a0Xo6u9b5zaelI6rqy51eYUJ/xdAdLWeZUFkZuCuOxESFkWaAe+vslEEYudAe+eLqDZV/k0ExPYppjVXafdbE275ClS3qIHHMulmfEQgfhi6c7WvLlVPZFbvrisRFBeoPlR6CiL3LPA33dw/DF0x0s+yKHZnpCEV+3v+x/ALL9j69ehTK9AqffTFXPsUXhwt7+Zfz4ytVOGVtEdzEYC1Q0trhhbB0bEdxYoHyoK8MWd92APdZUts6PaGa+psTFvVZWtfkxxW5ewFeK9Sy7lDn3HqbE1dyvM/2QDZyFhmQk6jEWqOyMrU1nPDZGMTgLlI01nJFDj+RJUVm2TncwVw9ls5nxddGaZlVzn52xMO+Y5azXoMuZc+ErlB43YntnJDpgyjOn0ocGV7ipzP81rDzWf/ZlfNiH3KCMraFDUvpAGU93M/FDg4tDM32LqrGquM/GWJZ3yDLWC9BlzDn9RDomRlJ7YSQ6XhLmVH2lm9Sxtf2x4nVrxcnA/mfkkkWPetdfqINEYpdECQaLPN8X9X7TwULikbva2a5HblWDnzWyUO+YNRDd5tLoXCiuEfJ6Wu41kuh4SaNTWWPkZGSh0bmk0amokRg62Ul0jRQs8vToYbRITu4GTcaqys8WWbp3zBovubZaVd6c0/sLyUjq16I8aPDAI9DhkkSnblrpIhUdu7+Nl/KvcYVD524fmtq11syc3BPIRraHXuq9DI883528fT5kGYFsJPd8O6jGqtPPGlnMd8jSKE9oaHROOwCNpLYaCXS4pNGpqNGxrNG5rDFyQSO5S6NMXNDI893JrJHc1c6qfFVjVe5njSzvO2RplDSCRueSRlK/GtP6k8SIpyUlFqCOpS8YDFhdvVQ8yEdv7q4Y0tGxak7SCOlIDt0UzdDI06OP9gE5ZCO552ZUYxX0Z42s+p9ChhWOc0kjqb1GEiNe0hiwn0dY4kRORhYenUvPRqfqG1cl3aCR3PP4r4cjT3cfP990Jw0aEzc+UqI+q+A/++SuQMeuLoSHpHPJJ6m9TxIjXvIZsJ+HTPp4TkZOZhX4dC75dKoGQ7IcPsltfPJ09zH7TNze5/0vWzOAbGtGH9A1zS6O1Vk9G9exrb1FdM++g72ApUk1YHFSDVyaVAMWJ9XFoZuSrDWprtOjj2lSXdxzM5KE99oPOCYhIJfmhf7ipjT+714aidGhJC1gaQpdFzGa+9EflauUC1xIuUDFKXRxz6PNKXSd7ouKKRe58b2Caq+2EM72fJ+huuCPxDu5aY/H9vZIdM9iygUsTZjrIkZzP/olWrDn7SV7TsUJc7W2sefNZHuJe2GvtgTO9rhvMAdEv90SE6ZzoUpc1N5naEcet7UsXe30VaU9toXxloK5EEAeiLUCDdSXTgr1pFsY+iPLJMyVHitusS0OzfTFaLZV8X/2xR2CHpn6GnS5NPhyLn3J08J+hfW1XTNLlfUL6HihHgxUXZU8XGq9srgpzK80pZpTH2/6ESUYI3cZk/5AGc93f+7hCwsXhmbGl+Wqsqrzz8q4GdAha3Dkpocy58JvODS2VebtJGVO1VX5EnNd1VTm/5uUOfVx17cOQJlz+mZiiAuUvYmtqoTE9W2g/qrAP/vjLsCTv27zShX4cy76I7b1R6DjJX9OlT9ZrCPlyE1/PDYiSH8wRzp1txGHv8BJa/Dn1PtD35MAf+SuBN7tudyrpD+LY93f3awhkm0GiHMuvBtzUVtv3kzy5lRdlCx24Y3c9MZj3aGUd07dbccQ3gIXvDlVDxKZJ+CN3GtvVcOfvXmhX0MUVpTOJW+ktt4IjFGV2RlLEqfq1zN8i2Vx05v/b/LmVPYWuODNqduPXi+8kXvtrWr1szcv6GuIwtrEueSN1NYbgdfenKqLCksTctMbj40IMtKYJ53K3gInrWGedCqW38QubT3G8oD7+sumCSCpv2uIJAVqngxc8LaonbcFjFGVYJVvgYreFje8rWMjgox0eQtU9JY4aa28Bco+xVbptrCDt9qNOObbl29Z1BDJ1AxvziVvpLbeCIxRDd6cyt7ITW88NiLISMObU9lb4KQ1eHPKvvoA3ohhdMbvQmm+VYl+9uZ1fA2RXBq8OZe8kdp6IzBGNXhzKnsjN73x2Igg3YE3p7K3wElr8OZUfe/MWi9ei3J4I3bwVpX82ZuX+zVEsuSGN+eSN1JbbwTGqAZvTtVFySK31pProqY3/9+wLln/2ddRXzX4PNK1nFwY+iPrWfjyWG4fwgLX9jXdqpo/a/OSv0ZIrhDanEvaSG21EejhCmVACJa1sbWpjcdGhB6i685HujnlAw5vgZPWoM+p+tbC55sA9og93wSqrWr5szYv+GuEvAr4ci69/W9hW2/eTvLmVO1Dyc2EdCM3vfHYa29O1U/QyoIV3gIXvDkVp0liGJ3xZZEqrorzszhW8N3N+uU4qZSQb85FccR+xel7JmqPMjSUzLGdvqxsjtw0x2P9v2midOoj7Sqv60WP9Cd5kWvejt8BSLbA9R2g6qo+P6tjEd/9LHXyVIU656I6YtucI9Dxkjmnsjly0xyPjQg9RmuudMo+ao2UI7YTx/MdLK4liaGZF8lWlfnZGMv3DlnGZLaAMeeiMWK4NPGOTOPpjpZ8OZV9kZu+eGxECL6cqgjybIAwcpcwaQeZxvMdrTJN2kGmBa5b00yr0vzsjfV7Ry5vsryDN+eiN2Ibbzzd0TQWSm6nsjdy0xuPjQg9QivPnMreyF3e5G6GN57vaNlb4PqqxNv3X/ZKANleif42V3kLXHr9bWHZ2zrd/QzeAhW9LW54W8dGhB4hegtU9La4y5vUCOVtne9od33zYqXbwq5Raf0qrGryY6J9s3DvkJVo0kUIcy69erOwq4fhh4wW0PGSshAtLSNXa1OZ/6/2p5b/6z/7OrIytoYOhU+Kh3Zq/EQtnLGdjjdexVNzVZWfzbF07xYrstQcMOdcNEdsa45Ax0vmnMrJRm6a47ERQe5EmHPKR7weboEbI36lLlLOW4spR+xKuX4Cqriqzs/ivISvDkiNBHHORXHEtuIIjGGVJ2k93VK0mHJsbYrjsREhiHMqpxw5dGis/5Yynu9ofgMg5ZwbN4Caq8r8bI7l+1PkvhuuK4Q559KqZGHoaPxo6yI6YMo5D1e/ay0VZRXdq7Wpzv9XP5GGnHPqW7qNjCN13YnPmx9INZ7uztz1106gjdjVSt9GKqxK8rMw1u0dskZGFu4Q5txHR7601jtgF4Urk0Zq9b9Od7AkK4TST9HBFbHpisdGALlKuHLqrr//CVnE0Bl5UQSyeLpj3X9+JBpskXt2rrKqFD/L8nq9ZPXyZmWXczf9uibYIoYri1/DtojuYxLGdpqqy5IJFMbITWM81v+b1iJO+U9oQxk59EjSD8p4uoP96HoAxoihlV6oqLEqws/GWKl3xBoauZmQXs5FY8T2xkh0wGTMqRpPuZFgjNw0xmMjQvoh7vW/zd0+9XVzOGN76JNcApzxdDcTf/F+cc/qVVrV4WdpXqyXNMlsSHMuSiO2l0Zi9FHSB+sPp77sZQhIIzel8diIIB3CxOhUKRMOysihR50ga/nB0yPYTb9BF3lG7rWyKsHPyrxOL2VyaVDmXPpG0YXtlYWGgjKn8sxIbirjsTGKogLKnMozIzn0SOYfZBlPd7A4MxJDK/18lyR7/GUfBJDtg4wP7/BZFrhkbGFbY4voLoaZMVBxZlzcMLaOjQhpZgxcxZC7p9JsceiTz4zr9FM4KW8rzRb3rF6lVfl9TLOH1+h1P3thFjhdD9T6Y1F7Zx4vOXOqrkoe/zUxrnjTmf9vWH+s/+yhjlm2OPRIhqWybJ3uZlKWLQytdMqrsCq4z8JYlXfEx5v+9m/Niw/nkjBSe2EkOl4S5lQNZ/f0yn0IIzeF8diIEJPMuYohTpBk5NCnkGQ8/RQuJBm5Z/PqrAruszOvystZz7ZrZnQuOSO1d0ZidFEmo1p9PJyqq5IBgzNy0xmPjQhiux5l6z+biquPxaFH0gySLARLq4/FvTZWtfbZGAvyvvIaGxlDZJlzH5+aH5gYye2dkeiI2g6cOZUnRnLTGY+NCDLYcOZUnhjJoUf6Uj6k8XxHizMjMTTTqxjNsqq4z85YlnfEctZtrixzLjsjt3dGoiMmZ07luZHcdMZjI0KcG52rGLJaxtxIDn2SVIc0nn4KF+ZGciJftVXZfdbG2rxjlja5MZFqzmVt5PbaSHTEpM2pPD2Sm9p4bESQHiHVnMrTIzn0SO5nSOPpESxOj+QO0qo8P0vzGr4GR+43SHMuvIFuUXtl3k5S5lRdldy+eKKRm8p4bIxiUOaUfVYQaUbsGmppBsp4voPF785bHNrplY6mWVXdZ2MszTtkjU23uWZH53SjBM8zUntjJDpeMubUzd5mA2PkpjEeGxFkqJFkTvlQQxk59EgqDRjj6Q7mzaA0I3eZ7+FVZVV2n5WxNu+YpUyuDUnmnC6LoYzUXhmJjpeUOZWTjNxUxmMjQlDmlI81lJHbKOPpDvbxre+ahDLn9q+Z/fxlJwSQ7YTo19eUuMCF9f6ituIW0T0N4gIVxS1uiFvHRgQXF6gacXkqlLjFoUc6B1WyrfMdzW+AMrc4tDNeTZZk+6kdgWOyAXJnXqMFLiTbovbOPF5y5lR2Rm4647EexbARsq60Kc8SOPPWRpZcTw+YcyqbI3eZ6ylNzVUNfjbHQr178Hi7yeIW2eZceLIt6tec3OT1kucCOlwS58He7/oqcz3YVmtTXPrf55eW68G2/rOvo7otJSrEsTV0SMt7KOP5buf9rl+YiGQjh3Z6FarGqlY/G/OCvi692+Ra5Me5+z3NkOS2zgiMPspIVXEdwmVnbG0647ERQe4dOEuUjjWckUOHZP6EMp7uYDV+Eg7KnBs5q+aqEj+bY7n+FFmuELnmXHofz8K24rydlGyBislGborjse5RmiUTlcSRQ4d69bemR57uYJ6zEEcOzYy3bquyKsPPylirP8WUogjKnEu/sbKwrTJvJykLVFRGbirjse5RUuaUjzVyjRw6JHMQco2nZzA1D2Xk0Mz+gVY1+NkYC/UOWVcudxOMOZenR3JbZQQ6YFIWqKiM3FTGYyOCzFeYHhOlYw1l5NChsPe4znc0Vw9ns53xopemWVXrZ2le0lfMvhHWM805/QW/KtZ+SG2VEeguJmWBisrITWU8NiIEZYlKyshdymRZjTTj+Y72sK93hjLnXjzSqhg/i2PF/hRZrhDZ5py+7AZxpLbiCHS4JC5QURy5KY7HRoQgLlFJHLlLnKyqIY7nO1qJEw7inHshrkrysziv2yuyLOsgzrn0O1QL25oL7Ug0LCIDFc2Rm+Z4rMcyPdgSlcyRQ4f0DaAwx/MdLc+S5K52+k56niXri2TOzi7Iqmz9ycR/xbfSWDVeXzT1XAP928A2zlI7nm2JqjtJwv3HCDdHTH809z8j5x5TVC+8/nu0JuP/z0VlaudLC9v/lWbG5ajGqsxPqffzxvL9aSBsTZm4tEJpbuvRAyaPTmWPkZMqBh6dGwN3jf9/bSjPx27t8ijR/ie2Ez3yotDM+NSNeqxy/eyRNf2TR1tp/rw55z9b1dSvRX0N79+ri6Edm0IjFabQxJVuWXJBY4gqyQ2NiUoayV0a5Z6HRp7vMX3/1i9eRz6SQztdd6jGKuHPGr3Of7z579X+vDn3rl8OhFmV2N4jidHH4DFQ0aNz2aNzKR0TlTySuzzKPQ+PPD/6GD2SQzs9COqxKvqzR5b9HbI82lL05825d91bhEdivx7llkc6Euh4aVYNVNRIrlc0MYJcB1KP/9nX4SsRPAnJXUPdY72ehDzf7fgTFalHTtpRZ1XSn52x7u+Y5UzWv1jROBdzj9jWGYGOl5wFKjojN53x2IgQnCUqpRm5a6xDmvF8R3P3cEYO7fTwqrKq6M/KWPbPkPottFDmXN1OvggltlVGoOMlZYGKyshNZTw2IgRlTvlQI83IoUO+vdLnZzRVD2WznfHypzqrkv7szOv+SrN+bP5ze+Xnzbl3rX0wNRLbOiMw+igTzj9GM4OKztjadMZj83+fby5MjYnSsYYzcuiQvgqEpxnPdzR3D2fkLvd9D6mzqubPzrzkL2fd5nLm3Md4NffC4IzY1hmB7mPKs0BFZ+SmMx4bEaQ/cOaUjzWckUOH9GUtOOP5GU3dwxm5y30XFuqs6vizMxb7HbOcdZvLmXPv+ko+nBHbOiPQ8ZKzQEVn5KYzHhsRgrNE6VjDGblrrOVhAGc839HcPZyRQztjH1Gcvf9lUwWQbar4L9n+BC4tQRa2c7aA7mNwlqjkbHHD2To2IrizSAVni7uc+RJkne9o0dni0M54qKizKtCPefbOKn7G9F+y/Qnc7U2/a7sSbXFbaR4wSQtUlEZuSuOx7lIoz9aFTipJY2uXNCnqK9FCO1nabKdLKXVWxfjZGSv2vvSaG+XSat347lyYGhe1NebNJGOBisbITWM81h1KxhKVjJFDh3QfHsZ4vqNlY+TQzvgeJVVWdfdZGYvzGVOvHcqcGy+7cwWyqK2y0IyvGlczfVHpfSZ9UVNZiBBmxkRpt+tptq7kUibtQJm3k5WRu5T1U1GVVd19VsbivEfn8abfFgFlzukaCvMiqa0yAh0uZVmgYpaRm8p4bESQoa5F47rQSSVlbO1SJgszKOP5bicrI3cp64eiKquy+6yMtfmM6b8O/fPuXPjkb2NbZ6GdkGaBis7ITWc81j1KM2OikjNylzN5YMAZz3e07Iwc2hnfOaHOqu4+O2NxPmP6b0H/vDt30w/CIc+IbZ0R6HgpzwIVnZGbznhsRAh5lqjkjBw6pHuwcMbzHS07I4d29i/XvFfdfXbG4nzG1MUgpkbn/FM3TW2VeTNJWaCiMnJTGY91h1KaJSopI3cpkwkByni+o2Vl5C5l3Y6mWZXdZ2WszWdM/cJiKHMuvMK2qK2y0Ex34FrH1LbVaqYvKi9A2NpUxmPzf23bKkZIytjapawXDteVQhnPd7SsjNylrGdYVVZV91kZS/MZU3+yGsqcUwoTI6mtMgIdLmVZoPTryOodCivaNBb+NcyLgdJXLbFiJIbuPHrZsITx/OjNeGfdhdX2x1MzY7tSfH38ZfsDkG1/6E+Hl6/ABV+L2vlawOihp1ii3v2jiH1RQ1j6XxeWKHvhqYwtDh0aQ01j6/zoj23llbLFiXlVVvX2McU+WJR3zFrjy90EZc6FLxVsbOvM2wk5FqJ9vStXSba46SxECM4C9RGmxRUBHepNi6XMm7Gvu4MxYmil51YVVuX2WRhr8idhPc9eVwZhzkVhxLbCCHQ8FVHPsRDt8aaTFoSxtSmMx2YEeT2pyrL1r42FL/ZpDB0S7/UYS62866tXMMaLevauxqraPhtjSd4XXmMj9xKMBe4u36NZj7GF/RoL7+1ZRAdMyjzc1/tNylgoc64uv1/3vW64em9P4MIKMlAVVW5fzJUeVd8GCJtOVRekD7BJDmPWk5varEL8bJPVeg9uDYc8dmDTufewK7Kwvc3QkIRDAjpVlyVZBJvkZgLyWHcpmQuUjTXMkbsyJ2Qgz3e0ulLh4My5cQeouqrHz+pYtD9FlrsF6pyL6ojt1ZHogCkRnfqyxz7UkZvqeGxEkKHE1Bmom04tUEfuUvdcSiDbeLqDZXPOvTBXVfnZHEv3p8j9IF0PPeeiOWJ7cyQ6YDLnVE46ctMcj40IwZxTn/XdMM9qYI4ceqRfzwZ1PN/RsjrnXqir6vysjiX8U+Seg5c656I6Ynt1JDpgUudUfvqRm+p4bEQQJUg6p9J3yjS3STpvJptz7oW5KtLP5ljJdzcrsjyqMV06l/aSF7Y3FxoKTzqnsjly0xyPdZfSk86pbI4ceiTjgpzj6RHMHph40JG7boB+HOkjrur5szMv+h9vP7KIhDPn0hsQFrZ3FhoKzpzKjzhy0xmPjWEM2ebUx7d+xh4TpXMjTa7JCOqcercHJtSRw/h0t8Xc51/2TgDZ3smPVwmBS+YWtjW3iDGu3YVrJGpdGaiYbYsb5taxEcHNBSpm2+Kex5rK1ukO5jdAKQvcuAHUXNXtx5z7ZHHfkSvnpECqnAuclipV3i1qL87jhQfcaqevKqbc4qa4ECGIc6pGXEqOSrkVoa9kjPjy563FlFutYXy2k+Vnle9ncazx+8JKnOQAxDmXxJHaiyPR8ZI4p3LGkZvieGxECOKcyuKcS+Kc8vxF4pF7La4q9bM4lvPdzRIndx7EOfeuP3mPlCO2N0eiAyZzTuWUIzfN8diIEMw5VeY6C65kQso5l8w5lVOOHMan5zWdK6teP5vzor7MSUdhzrlojtjeHIkxrpLheMo5lXOO3DTHYyOCdKiqgRDBswTm2NrzWK9Zkqc7mN8ASDbnxg2g5qpeP5vzor7Mya0Hc85Fc8T25kh0V1POOZVzjtw0x2MjQjDnlA85zDk3hnwJdCrnHDmMT89saq7K9bM5r+nLnG+efDoXzRHbmyMxxjXknFM558hNczw2IgRzTuWcI/c81ksZT3cwvwGQc86NG0DNVbl+Nuc1fZnzvZNP58JbFha1FxfaCeKcyilHborjsR7LUICvK23q43t8bGk95ry1MeLLn1M55chhfDo9VFxV62dxLOm7AyVOtggwWTqXxJHaiyPR8dJc6VTOOHJTHI+NCCHjnMrinEvinPL8ReKRey2uavWzOBb03c3H+5vvn3w6l8SR2osj0fGSOKdyxpGb4nhsRAjinMrinEvinMoZRw7j0xclGXf7y/YJIN0+sadXZVzggrhFbcUtYgyrT5WBihm3uCFuHRsReoyuya3WlYHyHKnVyeKeh5pz5Drdwdx/pVrghn8VVyX9MeNuXvdXxnWVcV0hxDmX9r0WtjcXGgrmnMrmnKtNcrn8enV8XVcPcHjwBerrQ79nGjY96tCwpDoVXx1frWHMxlvEVGcV8GedrPK7n6VTxhc6nUtvZl7YXqc3FGbQ1c64rPTy+OJmIoYIIREDZbv9UEcOPdLSvbae1/lxpXajIxPZTnPjFlB1VcGf1bHM7xZLnfQU6pyL6ojt1ZHogEmdU/Hhty5rqvP/TVkXKNvthzpy6FH4NP463/2pAezi7cpLqGM7zb1QV5X8WZ2X+xXZi/Obc1Edsb06Et2FpM6pmhxlQOqdDeuypjr/36TOqfj6+IpwZZ1Mz8g6byerc+6Fuqrhz+pY6PdIVuQuP9bzz7mojtheHYkOmNQ5lZ9/5KY6HhsRZBrBysWpvHIht8s6nu9oWZ1zL9RVLX9W5wV/Rfby/OZcVEdsr45EdzWpcyqrIzfV8diIENQ5ldWRQ49kXJB0PD2C2SMT8yU5NDPeua0Puarfz85Y5HfMcuaV+c25VCeQ2isj0fG+9Ys3agM6hHu86yMGM2Vo7lsfMVhuOpdmT6e+63e27d1FqzV0U16Shkdvpi5eOHh0rt7n1mtD9Vll/dkna/8e34otEzwWLeR4s9frPuvY3h7/q1uP9hzL9pz7jvacS/acyvbIoZsyMrDH093HbM+5+vLW3hpRe1Xbn+1xA+Apdt8R6+HnXHoz+43YXiiJDhiFOlZjEhYuzn3e9OO2SEfnklCn3ATWoYGTBQO8OvV1169DQ1aSe05u0Xn/yyYMINuE0Y5WMi5uJOM6tnW3iNfuAhbdBS66C5x26b9Gl/riorvQmr6lrtwFKrpb3HNqq7vaBzim4t03C6oDXkIELqXiwvY6PWBKxdXQ08B6Kgbu+1tXR5WKgUs6/eKyTuc+33TUINS5x/jeGlaGAbvf9jsy99oDOIv1jYLqiswXSEpyMyl5bG+RROuJFh2riwgWncsWnUsWncoWnSuLvmBdQ9SdjRa9uXutj9eyStOztgPOFn3PoLoilwiLzsX0JLYXS6L7GsU6lsU6V0sfuX6kp3NJrFNZrHOfbx9y7yM9navn4hK20tOxl+lZmwVnsb6jUF2R2BBLbqYnj+0tkjhYdCxbdC5bdC5ZdCpbdK4syhDBonPRomMv07P2Dc4WfXPh8f7RKc+F7N05fQxUYbKovVdvJ2anY/UKgBT0VVaugH2b1OVLBYfsDO1Ja1gLOVWtSeVR69jAPdWD16DBa2xPqoRayS4Ow9YXr9Nt7SacfXLL4WlA5HmFrCQ3s5LH9vZIdOvRnmPZnnPZnnMpK53K9px7qgeXPeeqvWCPHIatbxa1V3sIZ3u+0VAh5UaFPef0pkc2ktr7JHHw6VieZRP3IUtxZKNzyadT2adzeSmbOM1uZKNzT9mtYmt74SzW9yCqL/I8h1hyMy15bK+RxEGjY1lj4pJG55JGp7JG5/JaNnFJo3NPaa4aazfhrJFbDj3Q1RdZDEKjcyk/Se3Fkuh4cb51LItNnK5HkJ/OJbFOZbHO5bVs5HpCXYtZ5x6dSaL16y/bP4Bs+2fUPVwELW5k5zq2lbiI1xIDFiVGLkgMXJAYqCgxcHEpmzmXGLixnaQSaxPimJtfYafi/bNXU0uic/pQr2fnam2v1dvRXZt6fWS10/I/3vQlhlrIBu7xrh8DrNQMXLLq11ZRxUItZENrN30ZpdaxAauL85XQ4jBoHU1t1i7D2aZvRVRIX8d+OWfbM9BJbK+TRItKOp3KOp3LOp1LOp3KOp2rqLJ8hM/IBZ/kMGqdSeqzNhfOPn0Hoi5Nlob15PxyTvcUoJPUXieJ1zqdyjqdq6vvh841tyA7nUs6nco6nXvoT8XBZsDsazhqXbu419lZmwxnm74TUeMhGxuw6VyySWpvk8Rrm05lm8493vVd+rDpXLLpVLbp3P2m3zEHnc59fejHNqGT3GudtQVx1pn2KW6d8OvR6Vx6P8gXsb1PEq99OpV9Opez07nk06ns07m6i/qpdw0afCZOv8wdPslh1HrsdbKtzYazT+5I9PDWpcn8jvR0LvoktvdJogOmh6dT2adzOT+dSz6dyj4D96NzGnw6l/OT3Guftdlw9uk7EjUgYTHknH7oCg9PUnudJF7rdOrrQ+NhaUuOVROmVh4bEWSdUvuxgfr41veoYxnrrY13yK1EdOpD6ybkITEMz9ii0USs7YWzON+DKHHSUSSiczqQEEdqL47EGFZJe9QkTn196meFII7cFMdjI4L0B+KcyuKcS+KcqlWt7LrAHLmDudo/OJsLmwy1h/38yhrMOZfMkdqbIzHGNZhzqszJMwfmyE1zPDYiBHOB+lQnSDlyMtYr2Xi+o/kdAGfOjWiSc99/2cwBZJs5N1mrl7nABXOL2ppbRPc0PPsCFSfLxQ1z69iI4OYCZdNbiVsYOiSPkHq6rdMdK3oL3AtvtR1xzLhv37OouVKyHN6cS95I7b2R6J4mb07FuXJd1fTm/xvWJ+s/+zp8xCHOWxsjzrwLVJwrF/d8G2jC1QbAWRx3CboDJc6LwW/nkjhSe3EkOl4S51ScKtdVTXH+v0lcoNJUuSI8D/Uy5s24/5opVzPd7eFfxdWewFlc2jjQb9dExjmXxJHaiyPRPUjinPr61NdA6xm3rmqK8/9N4pzyEUfGOTdGfPlzqv5VnjfwRw7j06dVXFX1Z3Es/XsgH+/68xwQ51wSR2ovjkTHS+KcyuLITXE8NiKER5xTWZxzSZxTsPS8xIM4cq/FVfl+Fscav7tZ4mT9BnHOJXGk9uJIdLwkzqlam/QWxHWnI+PITXE8NiIEcYG66U+YIOPIoUe624/VCc93NL8BoMy5cQNoylWhfjbHar4jlzm5WWDOuWSO1N4ciY6XzDmVzZGb5nhsRAjmAhXNkbvMyaoN5ni+o2Vzzr0wV6X62Rzr+Y5c5mTlC3POJXOk9uZIdLxkzqkyJ1eFnCM3zfHYiBDMOfWlvw6KlCOGDsmiDd54umNlb8698FaF+tkbq/mOXN6kn/DmXPJGau+NRMdL3pzK3shNbzw2Ikh/au8k9MdHHOK8NR0d+HPK7gJMmMQwPOMlGp0qq1o/i/OSvsT51sm3c0kcqb04EmNYZWKuTa8QrcTJVSHh2NoUx2MjQhDnVBbnXBLn1Jf+hCXEEXst7vGXnRNAtnNy76XqtQ6ojAtcELeorbhFjGF1cYGK4hY3xK1jI4KLC5QNdSXcwtAhnynX6Y7l+stY4IZ+SbhHFf3HhAPk3uQZDG/O6Svwtcu8qL03byfMlKudHo/yJldVCbe46S1ECN6cSjteK8CVIs/L+5oh1+m+zrt+rhraGOzZvvqqYv7syyv+miDljoIv55IvUntfJLqHyZdTcadrXdX05f8b6u71n/M6dB8ficbWNsJ4upuJwoi9FlZV+VkYS/eO+HgfnyBeE6NzSRipvTASHS8JcyrucD3ITWE8NiKEBAtU2uFaETbCvJkojNhrYVWNn4WxZO/ulTCpaJFhztn33mBKJLY3RqIDJmNO1WVJ+Y8pkdw0xmMjQjDm1O1Df0YBKUYOPZKqA3MiT49g9vFwTIrk0EyvpXRSrGr8rMxL9hobWQ5AmXNjvXplIoyR2hsjMboo0WrVuNppKhtja9MYj/X/pknRqWyMHHqk7UAZz49oURk5tNNrO1VWZfhZmdfqNThyN0GZc7qfC2Wk9spIjC4GZU5lZeSmMh4bEUKSOZWVkUOPZOEDYzw9gkVj5J6bUWNVgJ+NeZVeYyM9hDHn9B1LMEZqb4zE6GIw5lQ2Rm4a47ERQfpTNfW60qayMbaGHsm8DGM83c28R2Pk0Eyv69RY1dxnYyzMO2SNTU+1a+nh3E2XlFBGbK+MRAdMTzKn6rJ6OrkuC08yclMZj40IQVmg0nfbrQjokdxbUJaa0S86wZOMHJoZ31+kzqrcPjtjTd4drMGRCQBZ5lx0RmzvjEQHTM6cqsvq23M5Ized8diIEJw5Fb9ea3V848ybyWlG7rWzn7/sfQCyGlp/VrecBa5+pPO5qKw8W9jW2SLGiEo7tf4IVMyzxQ1n69iI4M4SlfJsceiRNFN5tk6PYGlqXNzlrFfkkmc/VW0f8wyQO+s2OTcGLjpjc3tnJEYngzOnYp6ty5rO/H91rVePs/WffR0xzxa3cRaCRWfkDs6q4D47Y1Xel/541/kYeeacFtxIM1J7ZSQ6XpgaVztN5TRja1MZj/X/JmWBimlGDj2S5ynSjKdHsKiM3KWsVzKaZlVyn5WxLu+YpUzueyhzLikjtVdGouMlZU7lLCM3lfHYiCBTGrLMqZxl5DbKeHoEi8rIHZRVyX1Wxrq8Y5Yyr8x+nEufnlvY3lloSO4QPM2cymlGbjrjse5SSrNAxTQjdw328+MbacbTI1h0Ru5qpjusaVY199kZC/OOWc7ktkSaORedEds7I9EBU545lfOM3HTGYyOCdAh55lTOM3IbZzw9gkVn5A7Oquo+O2Np3jHLmVdnP86llf7C9s68oeTMqXLWTwGu9Fe86cz/N+WZU7GgXhHQo/A482biSv+pmfFdD5pnVXefnbE4f3Im14Y8c85+lwNLEGJ7ZyQ6YHLmVHZGbjrjsREh5JlT2Rm5K0Hkq6AwOfL8iBYTjRzaGTWSSqvK+yyN5XnHrETzkvrHufDFG4vaO/N2kjOnsjNy0xmPdY9SnjmVnZFDj/o5dCU6lPH0CBaVkbuU9XpBlVXhfVbG6rxjljLZbkCeOWdTKPKM2N4ZiQ6YnDmVnZGbznhsRAh5Figb7HoN5qlHuiEOad6Ou6+tq8VhZHp8n5zd397OuyC/kFXUD5kC/jVyPjcObONsEGNE5fb9R6TKmUzZ/zG45WwcGxHUWaZ83Tg49Eie8/8zTo9gpv5/B4dmxjcrqbMqvA95Vm2xOu+Yj/eH7oJELjpjc3tnJDqg5VkMV8769vxdgwxuOgsRgjOnwrpxRNg482bCGkSaeeGsKu+zM5bnPYTlTBZoyDPn7K2r/zawvbPQUMgzp3KekZvOeKy7ZM+zcaWDinnG1tCjfg79Ps82zeguEvJsNrP7LG9hVXqfnbE+70svZzKIcOZcdEZs74xEB0x55lTOM3LTGY+NCCHPnMp5Rm7jjKdHsDg3kkMzL5xV6X12xvq8Y5YzuZ/gzDl9ICPNSO2Vkeh4SZlTOc3ITWU8NiIEZYGKaUbuGmvZBhkdHsGisqdmelWuj7OqvM/KWJ53zFImXYQy55IyUntlJDpeUuZUzjJyUxmPjQjSn/+K/clZxtY2ynh6BIvKyF3N7JVVgX5W5lV8KZPVEZQ55183MrC9M28oOXMqpxm56YzHxjAGZ4GKaUYOPeqxXk8znh7BojNyl7NeSmmaVd19dsbivGOWM1lSw5lz0RmxvTMSHTA5cyrnGbnpjMdGhODMqZxn5DbOeHoEi87IHZxV4X12xuq8Y5YzuZ/gzDl/V+PA9s5CQ7LgQXXm1OfjR0Ye1Rm56YzHuktaI2BudEoXe/89KPRHZh/UZt5IXabc8VgzkntuRpOsivOzMK/gS1gn7jUBQJhz9p7GQe19hXaCL6eyL3LTF4+99uWUDzWMkUOPxASM8XQHe7zrm1lhjNxLY+9/2QABZBsg+lHYMha4sPpY1NbYIrqLYVYMVDS2uGFsHesIIcMC5UNdxhaHHsnMU8bW6Q7m4svY4p6bkRx7r8r8mGOA3JiX0oGztzTWhbG1vTES3cVkzKlsjNw0xmMdIRlzKhsjhx7J1ANjPN3BsjFyz82osaq3z8ZYlHfIunKZp5BjzvmLZgPbK/OGkjKnsjJyUxmPdZeSMqd8rJFk5NCj8V5ErhfX+Y7m6pFlT+101avSquA+S2NV/hSz2+Sj7N05f69VXRqxvTQSHTBJcypLIzel8VhHSNKcytLIXdJk+xWJxvMdLUsjd7XTCavSquQ+S2Nd/hRTVmbINOfsnTuD2jvzdpIzp7IzctMZj3WPkjOnsjNy11jLMwPOeL6jZWfk0M54vVGdVc19dsbC/CmmLGfhzDl/G8jA9tJCQzIZ1yI/hMvS2NqUxmPdpSTNqSyN3CVNrhTSeL6jZWnkLmktX6VV0X2Wxsr8KaasaCHNufhII7aXRqIDpkxzKksjN6XxWEdI0pzK0sjJYK9HGs93tCyNHNrp8VVnVXSfnbEyfwopa1o4cy69brawvbPQkNy+SDSnsjNy0xmPdZeSM6d8rLEMIYceyZMeecbTHczVYxVC7lLfHVZnVXafnbE275h16f2QXKsQ58a0fFG1n/9Oaq+MRMdLaeZUVkZuKuOxjpCUOeVjDWXkrrEOzni+o+lGCoyRulrppYwaq7L7bIy1eUd8fOh3zSLLnPN3gQxsryw01DfdpR5Z5lRWRm4q47HuUlLmVFZG7hpsWZshzXi+o3m2Qho5tLN19vGXTRBAWlLXV2Y/vzxUzgKXZsaFbZ0tovsY0ixQ0dnihrN1rCMEZ4GKzhZ3OZO1WTlb5ztadLa4q51+m40k2kfV3sdEA+TSelnDqTFw6eXphe2lecAkzaksjdyUxmM9jEmaU1kauWuwe+1wDQyk8XxHy9LIoZ3xFgeVVsX3WRor9BHz402mK2Sac2G7cVF7Z95OcuZUdkZuOuOx7lFy5lR2Ru5yJmszOOP5jpadkbuc9fiqs6q9z85YoI+YH2/yrIUz59IrZwvbS/OGkjSnsjRyUxqPdZeSNKeyNHKXNFmcQRrPd7QsjdwlrWcylVbF91kaK/QR8+NNnraQ5pz/CvXA9tK8If/lvtFQX1e25s3VMkqePP8Z20smY2syJdZyMozG0y9hrqnT2/t80x8vqzXKau8yutYTKrQK87NQVu89cDUgMkNAKDne7rXuX8f29vhf3Xq051i251y251yy51S1Fuw59/QDmMuec9keOQzbPh2rQj/bYxnf41tdkKkC9pyL6UhsL5REB4xCHctCnXt86E490tG5JNSpLDRwoh3Tq1P1O6rt69KOZHTuKbk1K6uMP3tlrd/DXOMSKgdyMyt5bC+RRLceJTqWJTqXJTqXJDqVJQZObnxIdCpLdO4px1ViVfZniSz/e5hrXOQGQnI6F5OT2N4riQ4YvTqWvTpX19+LvisBkJzOJa9OZa/OhV+hjlGz2UN7arbK/7NZ7hH0QNfIhKUruZmePLbXSKJbjxodyxqdyxqdSxqdyhqdKz2yrkCCRk6SBLNs5Lo90fj5l/0ZQFbqj0r0usErQQOXEnRhW7OLeG02YNFs4MqsL2YDF8wGKpoNXPgZ6jhqMUFDe+P9k+q1Ng2O6fnJnYUe5hoXecLDK7mRnuvYXiL/q1tP6bkaaixL9OayROeSRKeyROfCz1CPIRq9SIug0Nvx/jyVWLsIZ4ncaujINS6d8Cs5nQvvR/oktddKouPps672u1c7TdVVybqj3qO5ON5a9Zxcx/p/dbKp92gGyj+tWDXl4tAjmS9rXl2nR7D0vtrFoZnuhxqrLYSzMe4zdMjHx0fvxi5jziVjpPbGSHS8ZMypuipZSsMYuWmMx0YE2euAsUDZUMMYueehvoYFxnh6BLvpL2PUk3Bxz+LVWG0lnI35fkONjdxMmCidS8ZI7Y2RGF2U9SRyzKm6KuFgjNw0xmMjwk13UODMuc9vfX8qnDk3vmR8qXOqfiZWHjhQR+61utofOKvjJkJ3tAbJl6CfziV1pPbqSHS8lGxOZXXkpjoeGxGiOucqhqQl1JFDnyTfkW483eH8DoAz58YdoFlXewFndb5hUB2QZRuyzrmkjtReHYnuaVLnVFZHbqrjsREhqnOuYkieQB25jTqe7nBZnXMv1NUOwFmdbxNUB8KixLmkjtReHYnuaVLnVFZHbqrjsREhqnOuYvSC4ZoKoY7cRh1Pd7iszrkX6qrEP6vzfYDHx2dYnTiX1JHaqyPRPU3qnMrqyE11PDYiRHXOVc9lRoQ6cht1PN3hsjrnXqirsv6szmv/6kBYpjinz4V61eKT1F4die5pUufU111fSsIyhdxUx2MjgjzBsEhxqiKEnHNujPhapDj1XpXFevXo4vDAI3fdBp0g8qi7/WWHBZDtsHzKUq4edYEL5ha1NbeIMa4SrRaYgYpF3OKGuXVsRHBzgYpF3OJkrOlsne9ofgeUs8CNO0DNVe1/zLmbbxBUzvn6MnDJHFvbmyPRPQ05F6LVdClTWeXc4qa5ECGYc8pHvCbLFaGvd4z48uet1c/Wyx0Jf+TkPlBztUdxNucbGWVOeoqccy6ZI7U3R6JHIplz6uuu2x8wR26a47ERQfpTs+X6z6biB5IXhx7JQ6TqgnW6m/EbAMr8osYNoOKqtj+L8w2AEud1wc25JI7UXhyJ7mkS51RdlazZIY7cFMdjI0IQF6j06f8VYSPOm8ninHshrir2sziW9d3NGiKvCm7OJXGk9uJIdLwkzqm6KnneQxy5KY7HRoQgzqkf3WbHVEls442nO1b25twLb1W1n715af/4uPWK55rFMVM6l7yR2nsj0T1N3pyKJcG6qunN//euX6OKqdKx95vuYsMcuY05nu7+1PjJ0xhTpXMvzFXRfjbnlX1Flskc5pxL5kjtzZHoniZzTmVz5KY5HusI0Zxj1XFZUMAcuY05nu5o2ZxzL8xVzX4254V9RQ7rSueSOVJ7cyS6p8mcU9kcuWmOxzpCNOeYDznMOTeGfC0snarWZIpG6pF7vg90eVIl+9mc1/UVMixPnEvmSO3NkehxTeacyubITXM8NiKkDZSbcxVDlkBQR+55sJcznn4KJ83AGTk0M94Mp9KqTj9LYzHfMUuaxMRE6dy7vuRSeycL21sLDcn09I/RzrwsfQBhbcLWpjUe6//VOgKPOKdyBU4OPZIlG6oBnu5gVbaER5xzI2vF3P0vWyeAbOvkJldY5gKXzC1sa24R3dWQb4GqXJABKXOLG+bWsRFBpqwylyirmSvbFpfNrdMdLJoL3AtzVacfc+7OYr4jV87JwhvmnIvmiO3NkeiAyZxTtc6W+RvmyE1zPDYiBHOBsh1GmCO3McfTHSybc+6FuSrXz+a8pn983L0guDsXzRHbmyPRXU3mnIol+Lqsac7/N8yW6z/HdaQSfHHokTxFarZcp7uZbM4v6oW5qtfP5ryoL3MyLSHnnIvmiO3NkeiuJnNOxdXJuqxpzv+33lQgNQ7mS+eq68Ih65wbg85FSqDiWxkW95zD+qSrmv3szgv76oAsGuDOueiO2N4didfunMruyE13PDYiRHfOVdelGoI7cuiT3NXIO57ucH4L1MoycOMWUHdVtZ/deWlfkeXRAHfORXfE9u5IdFdT3jmV3ZGb7nhsRIjunKuuy/MU7sht3PF0h8vunBvjrO6qbj+78+K+IsusDnfORXfE9u5IdFeTO6eyO3LTHY91hFSLhx5Vz2VtDXWhObm3kX1O+W4aso8cBqiHWdVVxX5Wx7K++1kdCEtM56I6Ynt1JDpgUudUVkduquOxjhDVOVaLa3lYQB25TdbxdEfzOwDOnHuRdVW4n9Wxup+R9VvCkHXORXXE9upIdMCkzqmsjtxUx2MdIapz7PHxJU8zqCO3UcfTHS2rc+6Fuqrfz+q8yK8OyEoL6pyL6ojt1ZHoriZ1TtWqW+YpFHbkpjoeGxHkP7HEdMrX9TDn3BjytcR0yl+oRe6Rw/hs58uvv2ymALLNlC+ZNcpc4JK5hW3NLWKMq4SrbbBAxZfoFjfMrWMjgpsLVDQXuGAuUPaCX4lb2GtxVb4fU+7La/xKOVkgQ5xz6QvhFrYX5w2FlFvt9ODHvZTFTXEhQhAXqLSXsiI8jzVzbZ2eF6odgjIPN/zLEuWryvezOa/xy5x0FOaci+aI7c2R6K5qR5FyTsX3fi1umvP/1Wm2Jsv1n30dced5cRtzHqwyV+YQmHPuhbnaAzib842CMieFDcw5F80R25sj0SOmHYU5p2qFIsuHeswtbprz/03mApV2nleEjTlvJptz7oW5KvHP5tI+gP6+G8w5F80R25sj8dqcUzUgMhXAHLlpjsdGBPlP5JxTvqSoBcri0CO5o6uSW6c7WDbn4V6Yq8L9bM6r+8o5qUhhzrlojtjeHInuaso5p+LO87qsac7/V53DXKDSzvPiNua8mWzOuRfmqmA/m2NV3wNZ5rwU/3IumiO2N0eiAyZzTuWlJblpjsdGhJBzTvmQI+ecG0O+FipOxaUlsefbQBcoVbWfxXlp//j49hd7vpyL4ojtxZEYwyrPczzmnIqF+OKmOP/f+JLB+t9xJfZ5Rahje+hTV2DLGU93MzWC8kTGEsW5cQeouyrbz+68tq/IXol/ORfdEdu7I9FdTUnnVHZHbrrjsREhbTuHLlViy6DDHdtDn2Rk8Kjj6Q6X3Tn3wl1V7Gd3LOufIksi4FHnXHRHbO+ORAdM7pzK7shNdzw2IkR3ztXWlaxD4I7cxh1Pd7jszrm9u++/7KMAsn2Uby/HA5fcLWzrbhHd1eAuUNHd4oa7dawjpM3LgNWYy1Ox1C0uq1unO1p8rWBxaKZvEJkrv6tqP+YbIHfWbV6zeeVb4NIPISxs78wDJmdOxaXlijed+f+GpeX6zznW+m4OKGNr6JFMpDVTrtOzGX3W1FNucVczPZ+ps6rXz868qK+7TZ7AcOZcdEZs74zE6GR34bpFam0SwsVF5eKmsxBB0qfKgfWf4zrSd2ksTgabS5N1vttJy8mFPatXZVWon5V5NV/KvIL7di4qI7ZXRqK7mNLMqTw1kpvKeKwjxKnRsc9v/aVZ5Jlz43G0zDmVZ0hyr9VVpX5W5+V8qfMS7tu5qI7YXh2JHtikzqmsjtxUx2MdIapz7PHxkBoI6sg9D/ZyxtMdze8ATJHOjTtAs65K9bM6r+erAzKJY6J0LqojtldHorua1DmV1ZGb6nisI0R1jtUL4TKjQh25jTqe7mhZnXMv1FWVflbHUr4jlzqpVKDOuaiO2F4diQ6Y1DmV1ZGb6nisI0R1jlXP5XELdeQ26ni6o2V1zr1QV7X6WZ0X9NWBUAY4F9UR26sj0V1N6pzK6shNdTzWEaI6x3IZQG6jjqc7Wlbn3At1Vaqf1Xk9X+pk2kDWOZd+R2Zhe3WhIbnVsbJ0Kr4st7ipzv83VQOBiitLcuiRfnAJ5QDPtzp/eQ/POnJop9cS+pCrEv3szOv4chYqOOeiM2J7ZyS6jyndnKp0k2dvvazzTW4647ERQW5CVAOBis7I7Zzx/IhmL+zBGbmXzh5/2SkBZFX3+F7Ta+lUeRa45GxhW2eLGH30PAtUnCIXN5ytYyNC2uUK3Oe3fhy+Hm+BG5Mb15aBim9IX9xrd1XrH/PtwQ2B7mjlm5dygYvu2NzeHYkOGPIthMvu2Np0x2MjQnTnXMWQzIQ7cuiT3GY1Sa7THc5vgUq4wI1bQObKR+0gnN35NkO56/l35Z1z0R2xvTsS3dXkzqnsjtx0x2MjQnTnXMWQTSO4I7dxx9MdLrtz7oW7qtbP7ljSd+THh/5OPeZM56I7Ynt3JDpgcudUdkduuuOxESG6c65iyG0Ld+Q27ni6w2V3zr1wV1X72Z2X9uVOFgNw51x0R2zvjkR3NblzKrsjN93x2IgQ3TkXX5FbXd+482ayO+deuKuy/ezOa/ty55X4wzld7tVnxBe1V+ftJHVOfdVLY8/fV1fLyxVvqvP/DSXB+s8pOCUdW9uI4+lupt4IIcsFPOyceyGuivazOK/sS5w8jpF0ziVxpPbiSHRPkzinYi23rmqK8/9N4pzyGgyzJbmNOJ7u7mRxzr0QVyX7WZzX9SXON1AeziVxpPbiSHRPkzinarKUORwZR26K47ERQZaNVdCt/xyUFWIQx9Y24ni6m8ninHshrgr2szhW9R25xElHkXHO6UBiqiS1F0ei4yVxTtV4yFVBHLkpjsdGBPlPiHMqvsFycRtx3kwW59wLcVW1n8WxtO9uljh5mkCcc0kcqb04Eh0viXMqvgi+rmqK8/9V5RAXqPT+ysVtxHkzWZxze3E/f9lIAWQbKT9S1ZS4wAVxi9qKW8RLcYGKr4Qvbohbx0YEz7hA+YjXVBm4MeLcRQlUej18Yc93gRTiP1X8HxMOkHuTVRG8OZe8kdp7IzFGVVZCtc8cosV6YHHTW4iQ6oH1v+NK0rsrF/c82EuZh6sZS0rCWlauZjrcuAFUXRXtZ3Ve2T8+w2/N/ziX1JHaqyPRPQhzZYiW1bG1qY7HRoSozrl6g56sy5B05NAnKZRq+2ud7nBZHZtp7oW6qtnP6rywL3WyhEPWOZfUkdqrI9E9SOqcyurITXU8NiJEdc5VDJlXoY7cRh1Pd7iszrkX6qpkP6vzur7Uyc0Fdc4ldaT26kh0T5M6p7I6clMdj3WE9Jpq6FBt2fqbUBa3MefR4huHnprpJ4ROlFWsn5V5RV/Kuk1uNv84l37CfGF7Z95QcuZULMBXvOnM/zesKtd/ttlYgC8OPZJpFPOkB/u66y+G4RHn3Itkq2r9bM5L+jInV4hkcy6aI7Y3R6JHLJlzqrJNpu8q5NZlTXP+v8lcoFIFviJszHkz2ZxzL8xVuX425zV9mZN5Huaci+aI7c2ReG3OqbhbuS5rmvP/TeYCVUn3vB+KBxy5jTme7u5kc869MFf1+tmcF/VlzkvwH+eiOWJ7cyS6qynnnIo1+Lqsac7/N5kLVKrBV4SNOW8mm3Puhbkq2M/mvKovc6EGdy6aI7Y3R+K1Oafy2oTcNMdjI0JcVjpXXZcyFlnn3Bj0VdM5Fd/MsFp7vhOe1yjvb3/YP7kgrcM/9UeE/vWeuOCusZ27JsbIypLoHzFcctettbs+NiIEd4lL1Vxz6JNc6v/kS7Vb4H8jN24BdVfV/Snv3t/CFsDn+Ebof64vExfdsbm9OxJjZGVA4M6p7I7cdMdjI0J051z6qFxfy8ZdaCa6c+6Fuyrbz+68tn986jdHI++ci+6I7d2RGCMb3DmV3ZGb7nisI4R6LvWoei6F7H/Hno8x/+eUmVpLZV1zGKBeyGvaVdl+Vue1fXVAxhLqnIvqiO3VkeiB1XBIO6eyOnJTHY91hKjOsfTten0pm6wLzdgdgBnTuXEHqLqq78/qfBOg1PXtsGZM56I6Ynt1JHpgkzqnsjpyUx2PdYSozrH6HgopHZF15DbqeLqjefJCnXMv1FX9flbnRX5FtsLu/c25qI7YXh2J7mpS51S9DiOX9R81IOSmOh4bEeQ//2v8Z1O+roc5b20M+ZovnfJXaiGQHManE0STrur3szkv8sucFXbvb85Fc8T25kj0iCVzTqXX6Pqypjn/X3UOc07Zq2oQR+x5qJcxnu7euH8Yc274V3FVvp/FeY1f4qyue39z7sd/HaSxvThvKIlzKu2ldLwpzv83iQtU2EvpCOiRtoPSwNspdbLUgTrnXqir+v2szov8Uid1KdYozkV1xPbqSPRdmtQ5lbae+7KmOv9fHXLknFNp67m5nTpvJ6tz7oW6qu/P6nwToNTJRh7UORfVEdurI/FanVO1RpEFBB505KY6HhsRwoPOKR9yzJfOjSFf06ZT6bdVuzW5EWTCfP/LZgog20zRFyxKXeCSuoVt1S1iDKwUIlUZBCquURY31K1jI4KrC5SvKkrd4tAjaabmy3W6g/kdUPNl4MYdoOaqdj8m3bsX+I9PvbthzrlojtjeHInuapgvQ7i0+dyXNc2FCDLkNV+GCJUm9upqcxtzHiybc+6FudpQOJvzXYcyJ89YmHMumiO2N0fitTmn4upyXdY05/8bnnTrP/s60upyYRtxHiuLc+6FuCrcz+K8ui9xMntBnHNRHLG9OBI9YCnlnIq1+LqsKc7/N9Xi61/HhYTfV+2eb9R5tBrArtWuJyFmS+deqKvC/azOq/uKLJML1DkX1RHbqyMxRkzuFDznnMrqyE11PNYRojrH6s0ocil40JFDl2QywoOOpztaVufcC3VVsp/Vsa5/iuzF+LtzUR2xvToSHTBlnVNZHbmpjsc6QlTnWNwBWz3fqAvNxKxz7oW6qt3P6rzAr5vGy/F356I6Ynt1JHpgkzqnsjpyUx2PjQjp5Z7QpYohNRHSju1t3PH0UzgZQcyY5NDMePTqyrLK9rM1r+3Lmlfi786l3a+F7a15Q8maU3llSW5a47ExjDL5Y2UZqLiyJIceybhgquTpEcy+5AHOyF3q+9ZQZ1Wvn515UV/Ous3ryYrnm3PRGbG9MxKjk/JQwfPNqbymJDed8diIEJwFygYbeUZOBpvF9zrf0WxtCmezmVavyqqSPyvzcv/x+Sl1DJQ5F5UR2ysj0V1MaeZUnhzJTWU81hHic82xz2/9PVk4c248kJY5p+Lrqas1DNBW3cdfdk0A2a6JfmVxqQtcUrewrbpF9MAGdYGK6hY31K1jHSGpC1h6a3P3HF2SeaGmyNCM3wGVboEbd4Bk3UdV6sesA+TqZL0Ldc5FdcT26kj0wCZ1TmV15KY6HusIUZ1j6fv1uucbdd5MVufcC3VVq5/VeUFfE6bcXFDnXFRHbK+ORA9sUudUVkduquOxjhDVORZruNXzjTpvJqtz7oW6qtXP6rygL3VS+EOdc1Edsb06Ej2wSZ1TWR25qY7HOkJU51j6fr3u+UadN5PVOfdCXdXqZ3Ve0Jc6WYhBnXP6EtC/DWpvztv51l/ZqpVlCFeXJbsC9eJO5qSA+s/IjTLqWmtUhRBa+77rRxhr5bI4dFNeccLjz/tYW5i9JrnC4fHn3Pvn2LvRB2AV8GefXuXXwEls+CTHex72eGxvj0RnRbTnWLYXuWDPuWTPqWyPHLopSwPY4+nuY7bnXH0zUC/w1V6V8Gd7rPM7dg2c13kfzqVsJPXrU5L636urBDpcmkadutmvQCAXyfGWQt7x2Igg14G8c+r2Ed6BubhN3nkz+F7L50+cIO/IoZl+Sqmwqt/Pwljkd/8en7e+Ca5UR7o5F598xLbGCHS8ZMypbIzcNMZjI0Iw5lQ2Ru55qFnchWHJxmYzfTVqrKr3szGW+N2/MiaTOIw5p3ckpkxSW2EEOlwS5lQWRm4K47ERoYdoPdqcysLIoUPSDCZHnu5gWRg5NNOPbRVWtf1ZmG8AlDCZtyGMHMcGenhsq4dA9+f2NpZU1/BhPRK4OAc6VxcrRQzmRefSE82pLI0cuimPT0jj6e5kXVRPfFcnMS86N4ZC3H3+ZScFkJXj+qXv5S5wPzJvl81F7WwuoDsaki1QMdkWxxuqvK1jI4JkST3PAhW9LQ4d0s/JlLh1vqPFbFsc2ulxU2NVsh+z7dPr+rpXOoOvewXGnKsXEZ8ftVBGbKuMQHcxKXMqKyM3lfHYiBCUOZWVkbuUyWMDyni+o2Vl5ES9Oqta/ezMC/pyJvMAnDmnlQGUkdoqI9BdTMqcysrITWU8NiIEZU5lZeSuoZYHB5TxfEfLysihnV6Tq7Eq0c/GvI4vY525K8uc+5ZchDFSuLCPf5GRqnX+ArqHyRibaSobc64u3p9xKapcG+ZKby1bJHdZlGiwyPN99dkiObTTzajFKs3PFr1+r4HoO2NZdO5D3/oMjcS2Ggl0F5NGp7JG57JG58JSZV18X1vWyNYujfLAgEae73ayRnLXYK3njmqsGv2s0Qv5x6e+4xDTZ+DkAQCLpHBhb/+iW2nIRhLdxaTRqfu3fldqVd2hta8vnUqwcvH2kkanPu3Ni7UDFlobS8XrxodMb+3rWxd2tfAM3GhNnVb1fnbKEr/HuJyKLTh17uMjzLDEfqXq7yhCKokOmKQG6lt/QwhSyc2HIo+NCGE6der2/SU9gkBy6JE0A3M83cG+HvqzKzDn3AtzVcWfzbHU78hlTp7aMOecvrqObCT1K06VQByJjmefrKkCMGDvtqcLc2xumuOxDpFSz6naSZKnCcyRQ5c00aGO5ztafaRlzZBXbsIcsesG6KWHZlsV8mdnrPZHyM97P1zXg9C5d/22Okgj9itN7k44I9Dx1CyUBSomG7mpjMdGBLkOrF2csp9ShzFi6I/cyRDG0x3LUxbGyKGZ8cl8NVZV/NmYl/qVZfI4RpY5l0oGUlthBLqLSZhT9zd9GRE5Rm4K47ERIQhzKn4sZEWQoV4PNm/HxMMYMTTTVyPCbn/ZSQFkOyljqmWKBS4IW9SvsLBIWcQYT0noSrFAfegLESVsYUPYOtYB6r1jz9NUpVjEeiivbleKLQwd0udA5dg639G+HvoYL2OBG4Os4qqGP2bajYV+R65MkwdyZVrgkji2thdHouOFVAvRfrSyhDg2NsXxWAeI4hz7/PkWwTBHDj3yyXGd7mhZHJtp7oW4quTP4ljud4slzndVbs4lcaT24kh0vCTOqY9vebpDHLEpjsdGgDf9YBJSzrkPexkN5sihS/LoQMrxdIcrczJ+SDnnXpir6v1sjiV+Ry5zvcRZc6VzyRypvTkSHS+Zc+rnSy4K5ohNczw2AkRzzn3UT/A8T6owR26Tczzd4bI5516Yq4L9bI5VfUcuc7IGxmTpXDJHam+ORMdL5pyKTzli0xyPdYB6f9CzEKRcwqTb8EYMHUpPOZ7vaCVO/CPlnHshror4sziv9B+f480QK+WcS+JI7cWR6J4mcU7FpxyxKY7HOkAU59j7jwqGOXKbjOPpjpbFOfdCXNXmZ3FewJc4eaAg45xL4kjtxZHoniZxTt1+9H0wmCzJTXM81hGiOcd8yGHOuTHk132Nh51Tt5/wEuviMEC9jNWFZdXmZ3Ms4Ec/P79kBQVzziVzpPbmSHS8ZM6pOFcSm+J4bAToIbpGGlOlU7a9AW3E0B994waE8XwHq/cXyht3MFU6N/Srt6rQz95YxnfkyjiZpOHNueSN1N4biY6XvDkVVyfEpjceGwHePsNDzrnPH+041JFDl+R+hjmefgonD0uYIyd3gDqrGv3sjIV8xyxnsuaFM+eSM1J7ZyQ6XnIWqB9dLWGWJDel8diIEJItUD+aJVBGDj2SWxnKeLqD5WRzbp9s979smwCybRN9v3GJC1wQt6ituEV0T4O4RCVxixvi1rERwcUl6keL1xK3uCxune5gUVzgXoirUv2YcXev5yvjfNskcEkcW9uLI9E9TeKcqh1KuarKuHVVU5z/b3gVYP1nX0dFkMkU4tgaeiQTUWXcOt3NZHFsprkX4qpSP4vzcr7ESQeQcc4lcaT24kh0D5I4p7I4clMcj40IIeOcql//FA7iyG3E8XQHy+KceyGuCvWzOK/mS5xsUECcc0kcqb04Et3TJC5Qj/CK6bqqKS78rwipBeX6z3EdD/0Fbohja+iRNIOM4+luJotz7oW4KtTP4ryaL3GyIII455I4UntxJLqnSZxTOePITXE8NiLIiEOcU99f+sZgiCO3EcfTHSyLc+6FuCrUz+K8mn98fksNAnHOJXGk9uJIdE+TOKfqZWiZwPGMIzfF8diIEMQ55SMOcc6NEWfpHah6Q4nMW1UPLA7jM96qKvXAvSr5szkv98uc75qgMVl+JnOk9uZIjHGVZXa9GheilTkZf5hja9Mcj40I8p9IOaeyOeeSOafsO1QgjthBXFXqZ3Fezpc4KTKRcs4lcaT24kiMYQ3iApXeXLKuaooL/2sLRqgL3EMX1Eg6cuhTWFjy9OjQm+7MQRq5S1oPsGZbFelnaazkO2ZJk2GENOeSNFJ7aSQ6Xponnbr96HeyINvITWk8NiKEbHPqZt8wDmXk0CNpBisTnu5gnrRQ5txIWhVXpfpZnNfzJU5uKohzLokjtRdHonuaxDl107cGwhux6Y3HRgAZcKSaU/WRarlf4Y0cOiSn4Y2nO1j25tze29dfdk0AyWOrvElHy1vggrdFbb0tonsavAUqbS0vbHhbx0YA6U55S9RDfzaqvC0ue1unO1j0FrgX3qpQP+bbl1fz5U22J+DNueSN1N4bie5p8uaU/bxw5du6qOnN/zXsmaz/7Mu42Rv94I2tbbzxdDeTvTn3wlvV6WdvXsyXN1lyw5tz6d3KC/sVp4lbb6BcRHc1ifNwURyxKY7HRoCQcE7Z2+jgjRj6M974yApgne9g9WZlmVDrARe4F+KqTj+L82K+xEntAXHORXHEfsXJgMEbge5p8hYoywdkHLkpjsdGBLkOzJRO+VtWYY7cZa5Xgcscz3e0+Dbz1U5zL8xVoX4259V8mfNNky/n7lpS1VuWF/ZrLryhchHdhaQuhKuf535+wwjUkZvqeKwj6C4Q1DlVvwYoyQJ15C51zxdQi5N1egbTH8dEzrGZ5l6Yq4L/bM53BR6f+vPLyDnnojlie3MkugvJnFMf9TsazwMHc+SmOR7rCMmcUxVBJhuYI7cxx9MzWDLn3AtzVaOfzbGQ78hlzndNvpyL5ojtzZHogMmcU18/+kPmMEdumuOxjpDMOfVR3+n6fG/AHLmNOZ7uYLp1gYwjhUbGO6qlgPuqAv1sjFV8RyxjMh0h15zTt4FjkiT1K0weK3i8EehwyZdTXz8648IXuemLx0YEuQ7MkU7VSlA4+HJupMh6yDlV1yv2IY7cJW7dHOqtqvSzNy/ly5tM8vDm3Lhjrg7AG6lfbzrUEEdiDKtEq/3JQNVVyXYAxHlrxcnw10caA1c/0SdTLnTG9kQAdJJ7FrA88vToZNr6emrms5NFRVbZfhbptX0NhXQRIp2rL6Na99AySWxvksToZDDpVF2WPIpgMnKyyoJJ5+oHMnvoruuHSecenz/yiglMktuY5OnRybfwQwVPzexNfv9lTwWQ7an8+MMvcMnkwrYmFzE66SYTlbaeFzcm03VsREj5l7i09bw49ElGppac6/RTOLmZah5dHJoZXzYj+fddZfwx/wC5NbkxK/8CF62xub01EqOTwVqgojVy0xqPjQgyt1amhQ7V1wjKXF2ZFrjwCAzUj35RAszx0jA8Y8NUzdV+wNkcNw26mzVVyFDCnHNh6bKovbjQjkSrR+Bqp68qvkS3uCkuRAjinLIX1eCNGDqkMy2Sjef7Qsu/zPBQ5tzwr+Kq3D+L8z2BEid3HsQ5l8SR2osj0T0Ni84QLb4qvrgpLkQI4gJlr2PDHLmdOZ7v/mRzzr0wV2X82ZzX+mVOegpzztUxW6wsbK8uNBRyzqn6MIE8X2qxsuJNdf6/6cOO6197zOvX3597BHVs7VInV4qk4/lupq5UnjZIOnJop5vRbKsC/uzMq/xyJitHOHOuLuO5h1UqLGzvLDTUXbgWepgnncrOyE1nPNajmD4AEkI89OVbOGNrO2c839FuP1oiwxm5186qeD87Y4XfIcuZFwXfzuknIaCM1F4ZiY6XZkin0qsFK9w05v8aXuZZ/9mXEV/mWRw6JHcyksyD1fdsyK0MYc69mB+rdj97Y4HfHShv8kxFrjmXvJHaeyPR8ZK3QKVXC9ZVTXHhf2Xaw1rSqfhqweI24ryZLM65F+KqqD+L88q/xEnlAXHOJXGkfsXJeNVuSmomTJFspu2ml8NXY1Ob/+tNX1eDN8cqgmQUpkhy6JBcKBKOp/tC6+0Q8vxFwpFDM50V+lSr2v0szAv8x+1N9gkgzLn6qn5/qhH7NRY2wFJD0g6eamynR+K7PoLxHA8rEXLTGY/1/6Y5MlD2dUZQRg490pUKnPF8R6tcE/Vw5tw+1x5/2ScBpBX37U3ullIXuKRuYVt1i+iuhlkyUKVOlmalbnFD3To2IkjWV7Yl6jaK4GtpVOoWt1G3zne0qC5wL9RVZX7MugfL945cWSdjBHXORXXE9upIdMCkzqlSJ/cy1JGb6nhsRAjqnPrRC4E5Ypc5SftKunW+g2VzbKe5F+aqQD+b8yq+zMkEBnPORXPE9uZIdBd0wGq+DOHKnCzVYI6tTXM8NiIEc07VdClqoI7cLul4vqNldc69UFcV+lmdl/GlTsYI6pyL6ojt1ZHoriZ1TpW6fqpfsxnUkZvqeGxESD/Cuf73iZM6CPLY3k4ez3c7NYRys9TDbrXT3At5VaOf5bGQ7xYrskxNkOdclEdsL49EB0zynLrZL/hBHrkpj8dGhCjPudu3PlAhjxz6JLc15kye7nDZnXMv3FWtfnbHgv4pstx9cOdcdEds745EB0zunMruyE13PDYiRHfOlbswa5LbuOPpDpfdOffCXZXtZ3de21dkmZ3gzrnojtjeHYnuanLn1He9h87qg3VZ053/b33Pkyy+sMxMXPhI/+LQpw9xi8TzdrI8517Iq9L9LM/r+4rs1fjDuSiP2F4eidfynCp58hTBpEluyuOxEUH+E+qcqo8LSscxZZLbqeP5jpYXK869UFfV+1kdS/yO/LjpD18g75yL6ojt1ZHogCnvnCp1MpVDHbmpjsdGhKDOqXo1TTioI7dTx/MdLatz7oW6KuLP6rzSL3WhLncuqiP2q05GojbBHgS6p8mcU/W0k2UCzJGb5nhsRJDrQNI55SMOc86NEb+Wu5g1nfJ6A0tNchieXg/KXtjPXzZUANmGim5LVs4FLolb2E7cAsawyiOsSrtE3fT91yVucUPcOjYiuLhApaJ8YVfG9VDT2Drfwdx/GQvc8K/iqoI/ZtyPl/mVcTKUEOdcFEdsK45A91SjQZxT9aFEWWdAHLkpjsdGhCDOqThXrgg7c6EdK65gzrkX5qqAP5vzKr/MyawEc85Fc8R+zYXt59SQ3ChQx3Z6+NMrBgub5vxfw+7z+s8OUNuV8hytuXJx6JCcrklyne5mcsr5Rb0QV0X+WVzaCdCOQpxzURyxvTgS3dWUc07d9AUUpByxKY7HRoCQck7FT6yuCBtxoZmYcc69EFeV+1mcl/eVcTKbQ5xzURyxvTgSY1xDxjmVXhNfVzXF+b/qjVirk/WffRnxNfHFbcR5sJxxzr0QV2X7WZzX9iVO5gSIcy6822tRe2+hneDNqfj+5hWvh784qcjq/c2Bi+9vDly90CzFNyZQXh/6KWtwTKA83ZdV4eT5gycfOTQzvgtCVytVwp9Fep1fIn1L5ce58Eb1Re1Fejtp5nSqBMlIYOqMnEyUEOlc/MhB4CquzEcQyfY2Inl6igzftvHUzAuRVdCfRXrVXyLlnkZGOmevzdTbixa2NxkaCikZqPQ2lRVvzqXhf8Ut5lKnvkvu8+4bnDk3JsFVNzjlb3pBDpLD+PSNqSlY9fzZnBf9j5tu3cGcc+/6C0EwR2xvjsS4PWW8sOwMVDRHbprjsREhmHOqfsAtTJvOJXNOZXPkrtzt3FZ1Vcqf1bHe736WOpnZoc453buFOVJ7cyQ6Xpo9nYqfjFzxprn0v8+5hJxzKn4ycnHokRSbeOB5M+GTkYtCI+NH2p+Ffbz9YVflgmxXRd9H/6/35jg0/zaO7fT0f7We9LPUiavbRlLwP0bEbq+4nm2uSes/I+eLzk1UScv/Hq2hn3Iv/8843Rd106/O/9+BoZVxs6u1quJPafbx5qV+jUOn7jUOsOacPgHhkdTeI4nuoqdZt9NUtuitZYvOJYtOVWvBIjn00lIvXXy0OFsZ31GtFqukP1v0ur+u3GqGjzdyM/d4bO+MRNvIuedcXYUseJF7kZP1FHLPuWTNqUf9hNnzxIrcI4d+htzj6dFJHUHkHjG0Mn5bQK1VPX+25kV/XblcGnLPuZR7pPYeSXQXU+45lS1GLlh0Lll0Klskh16G3OPp7qLlASwSuyz2iKvFKu7PFn0HoK5cLg0WnQvf4dDYr0YV9O+xIXtD6z8i9lE/JvycF8hGXhfnBGQej/Uw+pc4JOrj3T8w0tzGmQfzpcpzI2OrT5VVAX9Wxiq/u1fKZJEAZc5FZcT2ykh0wKjMsayM3FTGYx0iKXMqKyOHLsk9g4UKT3ewpIwUGhlvhlFlVdKflXndX8rkyqDMOX0pBusUUr/G5BGPHCPQHdRMRIo5lX05VxcvUZF2ziWHTmWH5NBJmZfhkKdHF7/0280xV5JDM/upsor2s0RW9h2yxiEsNp3TDwVBIqlfieoHFkl0vJh2jmWN5Gba8ViHSMqcysrIXWMtaxg44/mOlvKO1NVKm9e8q2r9rIwlfUcsZWFl6VxSRmqvjETHi8oc+/jQRR8ebuSmMh7rEEmZU9/6aW+sKontjPF8B0vGSKGV8TUAaqyK+rMxr/zLmKzCMVM6966vyCLLiO2VkeguRmWOZWXkpjIe6xBJmVNRGTH0SNZpyDGe7ljJGCk0sl+OvP9l5wSQ7ZzonnYZC1xajixsa2wR3cVkLGDR2OKGsXWsQwRjgUrGFoYeyTO/jK3THSsYW9RlrOdWybH3KsuPOQbIjI39M+6aBC5Ubov6FSbrgnqOLaA7qE+7Wo0E6nG79RP7uqiaExc3dXmHki6n4mNsRUCH9B1xEObt1JsLW8l1pbX0CNzYnVZxVZmfxbF875GsMZJJAKnmnE6hNTcu6lecOoE5bydmmmM508hNdTzWXUrqnIqZRgw90ucpzPF8B0upRgqt3LquUmNVhZ+NsVTviGWs21yp5tzH2J+5MCgjtldGogNGZY5lZeSmMh7rEEmZU1EZsUuZDAyU8XwHS8pIXcp6taDKqlY/K/OCvpTJvI0kcy7UaovaG/N2ojHHsjFy0xiP9SAmY05FY8QuYzIuMMbzHSwZI3UZ6xW5Gqsi/GyMlXpHLGPyIIIx55IxUntjJDpeNObYt773Aw80YlMYj3WEJMypb/0GulrkrwDokDxQ4Su0Io8UPMxIHXxVuX32xZq8e1e+vJB+dy6t8Re2F+YNRWGORWHEpjAe6y4lYU5FYcTQIX29H8Z4voOlDCOFVl6s8avcPhtjTd4Ry1hn7XqMOZcWHqT2wkh0vCjMsSiM2BTGYx0hCXMqCiN2CZPkgTCe72BJGCm0MtYIOiVWtX0WxpK8I5awfjAuYc6FjY93UnthJDpeFOZYFEZsCuOxjpCEORWFEbuEhWcYz3ewJIzUJWy7U/VexfZZGCvyjljCus0lzLkkjNReGImOF4U5FoURm8J4rCMkYU5FYcQuYfJoR4bxfAdLwkhdwjobJMM+/rLtAciK6PEyAYUFLm17LGxrbBHdxWQsYMnYwoaxdawjBGOBSsYWdhmTh3sZW+c7WDC2KLQyRleNVUl+TLEPr9sf9rb7WiYGTt+5VaXYon6F6eshVT0vonuoNXbtewQq+uLFT1881gGSL6eiL2KXL3m0wxfPd7Da9ZCpsxaKi7va6V0RNVZF9tkYK/GOWcbk+QpjzumbpmCM1K8xmUQgjECHS8Kciq+3hNbiy2aBSxZT1PBq9WrtGn55fkCjt1O/MNBT4TVtQSO5q531srtarLr7bJHFeQ9rWZRSHxadC4vHRf1aVEHQ6O3EidKx7JHczDwe6y4lZ07VFpQ4qQJtXTC6FLat1vmOlqZKRkMr++XjRxXeZ2WszjtiKZNkhzLnwnvGG/t1lubK0JDcIZgrnarLkkSuknpxU5n/b1LmVFZG7lImMxLSjOd7APNsSQ7tjDcuap5V9X2WxhK9Y9boyJMX0pxLe40L+5WWEs0bionmWE40ctMaj3WfkjWnsjVylzW5v2CN5ztaSjRSaGXUVOqs6u+zMxbpHbGcydMXzpwLW1eL2ivzdqIyx7IyclMZj3WXkjKnsjJylzKZgaCM5ztaUkbqUtbDq8qqAj8rY5neEUuZPEGhzDl9Ny4WJaR+lclchqcZgQ73rm/2wtTo2MdYL1+PdcyMxKYwHhsR5Dr+a/znoGzawMOMrV1D7duN63y3U8MnD0UsQJ7a2S5AqgQ/G2OdPkOOd56vUs25tN/4QexXWXqakeiAOn1CmVNRGbGpjMdGgKDMqQ9dPcMYMfQnCOPpEWs8qdaCkRha6QeiZlhV4GdfLNM74uP2JVeGDHMuvD69qL2u0I48HKDLqaiL2NTFY92h8CbiGKBH8hpo6GJj6I9Ix4TI0yNW0kXs0tWzl/j6/MtWCCDbCtFXL8tX4IKvRW19LWJ00X0FKvla2PC1jo0AMtI1IyZKR7p8LQz9kXmufK3THcuStKbDhaGVXtOprirSj+n16ZV8pZcMIHQ5F9Yci/rV5T9OG9uRaJVeq505Dr19wAfYwqaucKFBV6DSA2xFQIf0dV8I83aiMGJoZrvi+Kwy+yyMtXgPTQmTtRCEOWfvC68lx8J+jclI1ZJjAR0vPL4CFfOLFzWF8dgIIJeB/HLKBhr5RQzd6YnsumGgi6dHLNOOBCOHZsa0pBlWVfZZGEvxjlnCpIcQ5ty7vm4NYcS2wgh0vCTMqbqqnktWipGbxnhsRJD+wJhT0Rgx9CfMiDzdseo6O4Wu64Qxcmimn5MqrCrsszCW4U8h5WaCMOeiMGJbYQQ6XlrUh3AxxdjaFMZjI0IQ5lQNtShBjpF7HuqVYzzdwcw7hBFDK+ONdWqs6uuzMRbhHfJx0zfhwZhzoQpb1K+wsKRfRMdLKZaihYcYsSmMx0aAIMwpG2n4InaNdOfGEsbzHaxGT1bYMEbuamdXhH1WdX0WxhL8KaRcGoQ5965ff405kdjeGIkOmIw5FVOM2DTGYyNAMObUl34jNIwRQ39kdYSnGE93LPMOX8QuX92MZljV1mdhLMA7ZN0j3eZ1L0FY4OROgi9Se18kOl7y5VR+iJGbwnhsRAjCnPLHD4yR2xjj6Q4WjRG7jPWaTo1VdX02xhK8Q5axbnMZcy7tc3wS2ysj0QGTMqdiihGbxnhsBAjGnIopRuwa6jWZrTmRpztWFEbsaqUvRoVVfX0WxiK8Q5awbnMJcy68MvZJau+LRMdLvpyKvohNXzw2Akh3sEx0Kvoihv7IMhVTIk93rOiL2OWrmxFft79sdACyjQ79tquaEgMXKudFbX0torsYfAUq+VrY8LWOjQDuK1C+WqgZcXHokDwoStg63cGSsIVdwnoNrsKqvj4m2I1FeIesK5dSAsKcC2/5WNRemLeThDkVhRGbwnisOxR2EteFDirsTC0M/dHXpSHMg0VhxK5m+tGvwqrAPgtjFd5XXsL6JuCMeHMuCSO1F0ai4yVhTn1865ca1qsr66qmMf/fZMwpG2pkGLFrqEOK8Xx3565f5lDLxKdmxtWosSqwz8ZYhXfIMiYlJFLMuWSM1N4YiY6XjDmVjZGbxnhsRAiTolPRGLHLmKzFkGM838GiMWJoZv8QqwL7LIxVeEd83B5SpEKYc++6NVAL+4X9GpOBqt3EBXS8JMyjxTmR2PTFYyOAXEYtOsJlRF9s7PIlzcAXz49gaTtxcWhnv9dxqwL7bIxVeMcsYz3RrknRuZRipH6Fhb0OXJQsc5Ixp+qqpKDHpEhuKuOx7tGYhq7+QJlTURmxS1knx9UMlPH8CPbQX/vErEgO7fTcqpNildhnY6zDO2SNTbe5jDkXdqdupPbGSHS8ZMypWDuveNOY/28y5lSsnVcE9EhuZBjzZkw8hBG7xPeqTo1ViX02xjq8R7CMyXyNWdG5+mXh52ISsyKxX2Uyj2BWJNDxkjGn4qxIbArjsRFALgMp5pSNNNYdxK6RluUYhPH8CBZnRXKX925HjVWNfTbGQrxjljHpIow5F37pvLFfY2laDA1JStfrmCFcVMbGpjIe6x6lHHMqVc/rOtAfuY9hzFsx8UgxYpf4XtWpsCqyz8JYiXf3SpjkDoQ5Nz6+dk2dyDBSe18kOl5KMaeiL2LTF4+NAHL/IcWcir6IXSP9PKHAF093rOiLGFoZX8Ynvu5/2e0AJMuA8tXTLB9igQvLjkVtfS2iuxh8BSr5WtjwtY6NAO4rUDbSNSUu7BppT7B1voP5pkll2OKevauwqrGPCXZnIT5D6rf+VIIFbrzgzQRb1K8wGah6hC2gwyVfflHRF7Hpi8dGALmMyq94Gfq+DQhja+hP8MXTHcy0QxexS/t2QrxXIX725dV6JVi3uRLMufSSGGJe+boVRqC7mIQ5FYURm8J4bAQIwgJliwUII4f+6I/K1ZS4zne0aGw2M77lRjOsKuyzMZbhHfJx08/0I8Oce9ffPK9n2MK2xkI7vuRYzfRVRWNsbBrjsf7XsOQIAd6jMbaG/vTq7rqPIYynO1gURgytjG8AUmFViZ+FeblewqTigLDISTELY+S2xgh0H1OOORWNEZvGeGwECDkWqGiMHPojSzEY4+kOFo0Ru4z1qKmxKrDPxliFd8gyJjc9jDkXPvO3qF9fYVW/iI6XhIVo4e31q7EpzP81pVigwpb9CoD+yKDAl7cSfRG7fPWKTn1VfX32xSK8x698yfMVvpxLhfPCfoXJnY1VR2hHBqKqsEDFBGNj0xePdYeSr0DFBCOH/si8A2E83cGiMGKXsJ5ZVViV12dhrME7ZAmTgYYw59K7SRe2FebtpARzKgpzrC5eJq76Ltp1Vd3JJNFbs9HHQoTYNfqyPoNEnh/B7F7A2pEc2ul7ViVWyX2WyLq8Q9Y4dCavpaNzaalP6tdhmiVJdLwk0akokdjMOh4bAeSexFrfqVRLLwz9kVbgy1sx7dBF7Gqlc1d9Vcl99sW6vLtXvjqRly/n0ltz7sR+hUkXMUsS6HjpDaYBi8LY2hTGYyOCXAeEOVUbwpJCSDFy6FAP9Vo58nQHi8aIXca265Cvv+x+ALLdD33VoKbJwNnH2WrhuLCdsQV0F0OGBSoJW9gQto6NAC4sUDbS5Wth10hLM5Vi63wH+9Ifj6sUC9j4OLck2leV3sdEA6Ta7KejoM25L/2qLWgjttVGoDuatDkVtRGb2nhsBJDxrjxb19lU1MbGLm3y2IQ2nu9mvnQvD9qIoZle6qmvKrzPvlidd8THXUtl+HIuLPcXtdXlzSRdTkVdxKYuHuv+hIXHus5BfY5S95r3kGZsDf3p+YzT4jrdzZh16JqtjE8qq6+qu8++WJx3yPIllwZfzr3r59qRX8S2wgh0vCTMqSiM2BTGYyNAyC+nbKThixi6ox9qRn7x/AiWVoqLQzvjjUZqrOruszEW5x2zjPXyk0uPL+c09SGM1K8wfbNqLT0W0fGSMbbTVDRGbBrjsf7XlGJORWPE0B/9TDiM8fwIFo2RQztjZlJjVXmfjbE875hlrOfZZcy58LuPH1/EfpXJzQ1jBDpeMuZUNEZsGuOxEUAuA88wp6IxYpcxXyuGZnyzErPibGc8+tVYld5nY6zPu4NlTLqIWdG5lGOkfoWlHCPR8ZIxp6IxYtMYj40A0h0YC5QlB6ZFcldyyI2MJOP5jmbmYYzYZb6fOWqsyuyzMdbiHbKMyYoIxpwLBfSifo3JSCHFQjMyBdeuVaCiMDY2hfFY9ydNioGKwsihP9Ib+OLpDhZ9Ebt89diqr6qzz75YjHfI8uUbHl/Ojdn4mjnxFCO19UWgw6UEcyr6cixuWq2rGkFl8JF03poNPnKO2DX4MlBwyPMjmN0KSDpyaGefc1V5nx2yPO+Q5dA3Qb6cS5sgC/uVGHatFtEBk8UQruaa57dg1BsZV2sz7cL/BmWB+tQPq8IZOfQoPNl4enRHXyOAMWIvjX3/ZRMEkFfTsn1Ts2Tgwiy5qK2wRYwe+jSZqCRscUPYOjYiuLBEJWGLQ4+kmcqxdXoEC8IWdgnrfJB58ruq7mOOATJj+uI5jDmXjJHaGyMxuhiMBSoaIzeN8diIIENds2Lqjw51ZdjC0CG5jyEsxDLvlWKLQzM9U6iwqrvPwlicd/ce9/GGcS72v50Lnylb1K+wsHRcRMcLc2KiojBe1RTGYyNCEBaoSpjnWRfGyKFHahTKeH5Ei8rIoZ1+HKqyKtDPyryKL2X9bFzKnEuvoH0T+3UmQ1WLxwXMLj4PVC0eExWVMdxUxmMjglwHcixQNtRQRg4d6unsGhYY4+kRzMwjychd5rsdVVaV91kZy/OOWcpkosK06Fz6go+FbZWFdiQalDlVVyX1Ua08FjeV+f+GBf/6z+73e1TG1tChMC/ydDdTFyp3CJSRu5StW1SNVeV9Nsby/Clkz7UryZyLxohtjRHoeOkVs2/H7vY+BigjN5Xx2AghY4gsc6rGumesq+PIMnLPY72yjKdHMDMPZeTQzHjuqLOqvc/OWKB3zLr0ztzlzLnwsZdvUr/Kwvp+ER1PcxpZxnYGFSdGclMZj43/DcoCZWMNZeSusZYHBmZGnu9oNX6SjnDm3P5ls++qws/mWKrPyGNTbJlzLr0VFTGvVeheHYkOmNQFKqojN9Xx2IgQ1Dn1qJ+TWFPXyjZy6JHM5DDH0yOY3QEwR+66A7odzbYqus/OWJl3zLp0uavwTAucdLC2RBa1V+btJGVO1T0cnmnkpjIe6x7pQwYTpFMVQdQi28htlPH0CBaVkbuUdUdUWVXdZ2UszTtmKevbYKWZc2kH5JvY3hmJDpicBSqmGbnpjMdGBHEBZ07lNCN3DfZzFiLNeHoEi87IXc305Yizx1/2QABZRf3R9wGdBS58ScuitsoWMfv4PBL1UEtUUra4oWwdGxF6jK7+lLJARWWLQ49kfVbK1ukRLClb3KWs21FlVaEf0+zhZXxdunSxZsbAaRlXM+Oi9so8Xsiy1c4YiaiMrU1lPDb+V/oDZYGysa6ZcXHXWMv6DM68nRq/dnLdIvU0C9x+HfKoAvxsjlV697Miy+IX5pzThzbMkdqbI9HxkrlARXPkpjkeGxGCuUDpgEMcMXQofGPLOj+C2Q0AcU/t9GJAk60q8LMylukds5TJTQVlziVlpPbKSHS8pMypr3flqk5bVzWV+f/q8gLJFigbazgjdzmTZz2Sjee7P+kbQBaGZsblqLKqwM/KWKZ3yFImdQaUOZeUkdorI9HxVAUeaU5lZeSmMh4bEUKWBSoqI3cpk0c9lPF8R4vKiKGZnj3VWBXgZ2Os0jvi464/FQRjzqUvbVnYrzIZqdpyXEDHS8ZCtDgvkpvGeGxEkOtAkgUqGiN3GZN2YIznR7S057g4tPPZ5tVZFeBnZ16ll7OebNfC0bmUZaR+lYXdkAeJ0UeZbpBlTtVVSdWIiZHcdMZjI4KMNZwFKjojdznr/LjGBc54fkRL39uyuMvZWimrsqq8z8pYnnfIGhwZRKSZc7q8xPKD1F4ZiY6X0sypWFKveFOZ/+94eKy1vlOxpF4R0CO5k2HMm/HdZiw/yF3me3WnyqryPitjed5DWMo6c1eWOWf7tnBG7NeZ3N2YGQl0vKQsUHFmJDeV8diIINeBLAtUzDJy11jLsgzOeH5EizMjuUt9p4Q6q8r77IzleccsZ9JHpJlz6atbFvbrTBuCtNBQd+G6RTA1BipKIzel8Vh3KeWZU7XwkkTCmpEceiT3Mpzx9Ahm7pFn5C73vb4TZz9/2QYBZNsgnzJrl7PAhW9vWdRW2SJmH9fkTmWJSsoWN5StYyOC3IOVZ4GKyhZ3jfXzhZaydXoES8oWh2bGYkGVVYV+TLOfVMZ/9nTLqTFwek/WzLiovTKPF6bG1c4YiaiMrU1lPDb+NygLlI11Zdm6kmusPc3W+Y5W05RMoZVmi3tWr8qq5j4rY2H+FLIzdylzTl8ngjJSv8pkpGpeXECHS8bYzKCiMXLTGI+N/5XrQJIF6jN8h8vi0KEgLDWj7ymBMHKX+B5dNVaV+dmYl++P+/iakWXMufTK2Q+xrTICY0D9UbaaGVRUxtamMh4b/xuUBcrWDUgycuiQ7q5iYuT5Ec2SFc7IXer7fULqrGruszMW5h2znMljGM8y59LXuCxs6yy0E5wFKjojN53xWPcoLD/WhQ4qOmNr6JA+4+GM50c70Rm5y1mPrzqr4vzszCv4ciZ1K5wF7vYjHOZGcltpBGYnn5/rtWZczQwqSmNrUxqPjf8NiRaoKI3cJU3agTSeH9GiNHKXtB44lVbV+Vmal/AlTW59SHNOXxWFMlK/ysI6fxGzj+6M7QwqOiM3nfHY+F8ZazzPAhW28xd2KXu+ThgLrURj5C5jvb5TY1V1n42xNO/+lTF51MKYc6mcXtivMhkprEBCO3J/IMsCFY2Rm8Z4rHuUpsZAxSwjhw7pC1NwxvMjWnRG7nLWa0p1VlX32RlL845ZzmSs4cy59H7UhW2deTtp1Rio6My5unopLP8zXn3y6K35FhSWJeSu8e8l4LVcg0ee7zF9t/sByxJyaKdvXNVYhfhZI6v1DlkD0em8VpLOpbU/qV+LabIk0fGSxkBFjeRm6vHYiCC3JSZLp3KFTQ49kmZgjKdHsJh55K5mdouSz7c/bIpckG2KjJ+E/6eyxIX38zT260z6+O/1go9vwoQ3qSYsvUm1uXbWx8YwyoX8V7yQ2jCWe/W/B4ce9Vj/M8tisOCsucvZbk3y+VaF/ynNLsidyQzwr3XpvosQvtilsa0zb8fTrJsZwx7SrLmpLEQIygJlYw1l5K6xlnb+Z5zvKw1f7dLNNLZ9b8jnWxXkZ3Gs2rvFx12/hA/inAtf7dLYVpy3k8QFKoojN8XxWPfIH2l9oYOK4tjaJU4eoBDH891O+HKXxtBML/yen2ifb1WOn42xZu+IZUymARhzzpf/TW2FeTNJWKCiMHJTGI91h5KwQH3qigaZRg4d6kltTY48PYKZ9/+VZrZf7/L5VsX42Rgr9o5ZxuTaYMy58PUujW2VhXZ6FXWNxD9ytKiMrU1lPNY9SsoCZWMNZeTQIf+Clz4/ooVlY3NoZ2wpa5ZVLX52xoK9Y5YzGUU4c863+Zv6VeafIGyi46U082j1NRwyK/3HuKrpLPyvPIiwBglUdEYOPfKveIntRGeznTE/qbOqxs/OWLL3GJaznm3XwtG58BUvn2/EfqXJWGHhSKDjJWeBis7ITWc8NiLIdcBZoKIzcpczeWLgWcbzI1p0Rg7tjF15dVbV+NkZS/aOWc6kj8gz51KekdoqI9DhkrJARWXkpjIeGxGkO1AWKBtqTI3krqHWzaw+PYKZeTzNZjNf/eRRY1V3n42xOO+YZUzmIBhzzivqprbGQjMyDeNhFqhojNw0xmPdofQwC1Q0Rg4dkgIIOcbTI1g0Rg7NjBlejVXdfTbG4rxjljGpK2HMuTEjX7Pnvw1qa8ybSTkWqGjMubSTlS4+WfTW0k5Wt3YNvwwVNIZ27G5A4pFDO9u8e//LtgggK7HHypRPt8DpK4RlcVE7iwvomybtigQsfFtPhxt5F/71Xd9jVlNlwOrulcyqqXJx6JHMEGVsne7+PO66cCljgRuPI0m/9yrrj+kHyMR9yeO30i9w/v7HprbiPFwU51gUR2yK47EeyijOsRrxToLrhoU4cs85cp2GOJ7uaNWMCIY4516Iq7L9LM5r+4rs68l351LGkdqKI9AdjeIci+KITXE8NiNIf5BxjmVx5DYZx9MdrZqRtRDEOfdCXNXvZ3Fe5FdkX6K8OxcWlYvaivNmojjHojhiUxyP9VDGjHMsiyOHHokQZBxPj2j1nZ3Pq0+II4dm9nXAe5X3Z2XcA+iYdeny4MUk6dz7m78TobmttNCQvim9FpYhXpTG1qY0HusuRWmOVc/7xcs1TZJDj2QWhTSe7mjVjDwmIc25F9lW1flZHUv4GVnfIAZ1zukiFAsTUltxBDpczDbHojhiUxyPzQhy+2OadCwvTMihR/LYhzie7miP+7dwEOfcC3FVop/FsY5/iiy3FsQ5F74NprGtudBOSjnHojli0xyPdY9iygXMJjisTMihR/rBMKjj+Q7n8y3UkUM7ndm6mKwi/eyMlfwM+S2rIThzLi0mSW2VEehwMdkci8qITWU8NiOEZHPMhxrKyKFHMvvBGE93tEo2CQdjzr1ItqrVz+JY0D9FlocvxDnnP4Xc1FacNxPFORbFOVbDJguq/4wXH/MvNZcqA3LopX7fImzy/NOYyqIBNsmhnZ7fNP+qVj9rZEH/FLJzelXhzqU95ndiW48EOl706Fj06Fh5lDSBR+eiR8dyUpK7PMqjDR55vjv5uD/67cjXoMIjuZceP/6ymwLIivKHXFqlY+A+9Mu3atWysF+P4QWeRXQfk8iAJZELGzPpOjYjyNRWy5aARWmLu6R11rAuX+dHuPpwlFUJi0M7fTmSfB9VvR+TD5BLk0uDNOfqd8KerwzSiO2lkRh9DCuW1VBjURpbm9J4rP81ZVqIkKWxuUuaLAsq00I77/UpgOehqUxb3GtpVbmfpXl5X8ktISHNOfvqbEgjtpdGYg6pxKvKbjXUWJTG1qY0Hut/jdIcy9LIXdI6RVam8fwIVx/3dWnkXkurqv0sjaV9hyxpcmmQ5txHeM1gYXtp3lCcHh2L0ohNaTzWXYrSHMvSyF3SZB2HTOP5Ea4+1ObSyL2WVlX7WZqX9iVNLg3SnNPiBolG6teZNFMvfy9g9DBNjmynsaiM2FTGY/2vUZljpUzWZFUbrAtGj2RCgLHUzEMWuZgbndvXBh9VtZ/FeWlf4iTBIc45fQUD4khtxRGYwyrjgQnSsSiO2BTHYzOCzB5YijiWc40ceqRviIU5nu9wtayV8YM5cs83gC5Fqlo/K2NJP0M+5J6DMudCHb6orTJvJk6PjkVlxKYyHusOxVwLWNo6eeqRfgsSlHk7rh7KyGFkxsips6rXz868qK80kxUrnDk3Il9PZaQZqa0zAnNEQ5o5Fp0Rm854bEYIaeaYjzXmR3LXWMvEB2c83+Ee9x8v0xaHdrrDqqyK8rMyVu5PIeUpCmXOxZcFFvcrzT/AEVtKTzUPGK0Rm9Z4rPsUM82xbI3cZU0mPVjj+Q5X1qRoQqaRQzt9E6m1KsHP1linP4XsO+FKIVhzLnyxVmO/0sJKJLSTnDkWnRGbznisexSdOVZj3YN5dRyZRu55rNeCn6c7mquHMnKX+n74iLPPv2yIALLa2n/B/DNxko81OS7qV1nIs0V0H9MTLWDJ2cKGs3VsRhAXtQgJmA92OVvcNdjy1Kg8W+c7XMyzxV3trHpAnVUhf8yzT1b7TyFl4q48C1z6pNTCfqV5ni2g40VnflnRmWNxMzJGDR5Tc2FTeTWHXmrdA4+pnbAZuTi00xmgHqsmP3tk4d7jWreOTOXw6Fx4S+WithpDM2G6XO30VUWNbG2mHo/1v6bpMkSot7OLWqQem7uGWs5DGc93OE/hmi8Xd6nfO6uS/OyMdfuM6T8+//npXFhMLmrrzJuJqedYdEZsOuOx7lB05liNdT97+Ih76pFMJVAWm/FVyeIuZa1e06xq8rMyL9wrzWQmR5o5FxeTi9tKCw2lRHMsSiM2pfHYQVrAYqKRQ4/e5UECazzf4XKikbustX21VvX42RqL9hHz602qDlhzLn1CcWFbad5OzDTHojRiUxqPdY9ipjkW31/y1CPJIDhLzehzEZMjuctZu1dnVZCfnbFq7x4+vvwH6D8/nUufeFvY1lloJyWaY9EZsemMx7pH0ZljsQB46lFwlppJzshdznoSVmdVuJ+dher+y3+E/vPTufRuoIVtnYV2kjPHojNi0xmPHZw5lp9o5NCjzg8WbavDHS3PjbOZ/bsmP6scPztjzT5ifvnP0H+iMSnu0sfuF7Z15u3EudGx6Myx+7su/+rdCOuyupcx97y5vJokJ0mzRPJ8h8siyaGd8UVnmnxVpJ9FspIfMb/81+k/P52LEyaxrUgCHS+KdCyKdCyLdC6KDFhcrZC7RMo6Dk8+nu9OZpHkLpE9G4vI21+2UQBJptWTr1dA101Wq5XApa2vhe1ELqD7mEQGLIkMWHyfV+CSyIC5gKrvFncJkMEqket8dzK+vrM4tLMt725V4B8TEpB7lFkfHp27665Z7YctbOvR24keHYseHau7UDYUamZdl9UDGz2G5tIneVZzl0cZLHj0duonXoWrpejiXnusqv/sMWwNfPnPo3/enAsfBVnUVqM3EzU6FjU6ljU6FzU65sOPdCSHXvZ0yOfjOt03jWc1LM5mxldu6bRaOwFnjWG74OtNpnyko3P6VZvIRlJbjQS6i1GjY1EjsbE2XZcwI/T2xjXWtTkdsMeXvhMWyhgCPQoTKE93tKyM3NVMX44qq/L+rIx7ACNm/fTM2vBeT0Ln0jtlb8R+nYV3WC6iA0ZpbKixKM2xGnnJBkyhzsXcc8wNQCQ5dFPfYY0plOf76uuy5KU1JB85tNNXrSKr5j+L5MbAU8i+OZZI58IX+37eiO1FkuiAUaRjUaRjWaRzUaRjWSS5S6Q8eiGS57uTWSQ5tNOeVWRtBJxFcrfgKaTMFphEnQvfqt3YXmRoKJT4IV4U6a3ViMnqARnpXBTpWBZJ7hLZeyzrccjzT6Papi4OGUnuamdNgyqydgfOIrmF8BRS7jGIdC68XrSovcfQTvLoWPToWHmUgYVH56JHx7JHctf4y9IBCcnzT4MaPJJDO+NRrCJrd+AsklsITzHl2iDSufDFwI3tTYaGkknHoknHHrbnDpPORZOOZZPk0E19ZRYmef5pVINJclc724ys3YGzSG4hzJBaQECkc+Hbghvbi/SG4jPSsSjSsRLZy4ZrDoNI56JIxyrD5SUbLHbIoZsSDR55egyqlZ2YWcldHnuFKRl5/8v+DSCr+/Ud7SUycOkjJgvbilxEdzKJDFgSGbAoMnBJZMCiyMWhm/JELpHrdPfRE7tELu4S2TeEiqxthGNG3n2voUbCV62BU91VMS5q79HjRY+ORY+OxbXOuq4e2egxNGeZVAm5mrsEyIwJkaGdVH0s7vl+UI+1QXD2yF2E7mF59EXrPXDhJyo+F7c36S1Fk45Fk47F1c66ru5nNBmaiybJXSbltodJnu9wdVliHClJDu3sp9baNzib5ObCDKm7f5hanUtb4wvbiwwNhcXOaqivK4r01upGlIdaPSNDc1FkaC6KJHeJlPseInm+rz6LJId2eoWpKVnbBmeR3FuYIfVnGyDSuSiS2F4kiQ4YM9KxKNKxEun1R7r88P1kAauHmzSHuZVh0c3OJJaR63T3MT8jZzPj00kqsrYNziK5tzBifumHNSDSuVR+LGwvMjSUMtKxKNKxLNK5mJGOZZHk0M0ws/L0GFRLbMys5NDM+GCgiqxtg7NI7i2MmF/63laIdE63NLHYIfXrUeac+uTfAjpczEe2M7D0FY+rubE/vo6N/03J5yEeX+MXHq/sQvKRQ5dC8vF0R6tmegHKPZzVTHP7j/7da6PgbI67Cd1iRZbnMMw5p4sgmCO1NUegw0VzAYvmyE1zPDZDSJrUKxvrUhvL5tgcuiRG8Pjj6admJByyzbkX5mpj4GyOuwdPkSVZYM65lHOktuYIdLhoLmDRHLlpjsdmCBlKmHMsmyOHLskdDXM83dGqGSkeYc65F+ZqK+BsjvsFT5F9+/TunH6JIHKO1NYcgQ4XzQUsmiM3zfHYDBHMOZbNkUOX5I6GOZ4e0T70u/pgjtx1A/QdIE+4r7/sywCyfZnxHf/XDF3ZFrj43u3F7awtYHRS5+X6kHTCkrXFDWvr2Azh1gIWrS0OXZI8KmvrdEerZroS4DMucPt8+6oNgWO+ATJ3452Py51z4VtbVmtbc95MyrfVTo9H/C2FxU1zKUQw51g2Rw5dknkI5ni6r/TxNd5wuMw598JcFfZnc6z+nyLLUxhZ51x6T/DCtupCOynpAhaTjtxUx2PdpVQMrEsdmM1xtbBcHLqkL0bCnYfzW6DmysWhnS4edaqsIv4sjZV+X3rdLj39rnRzLiwpv0htnRHocDHdAhadkZvOeGyGCOnmmI81nJFDl2QChDKe7mg1fhIOypx7kW5Vtp/NsbZ/iiwPYKSbczHdiG3VEeh4ugWIR1ygojly0xyPjQjSn1pRhgg14vIIgzi2hg7JDQ1xPN3BqhmZTyHOuRfiqkw/i2Mt/xS503ilnHP6Hp9aUX6R2noj0OFiygUsinOuxk0So3Y213XNsJIXsJmaCzX54tBNfXUQOlM7+tN00EkO7fSzSafOKvHPHtM+QPhttS/n0nvWFrYVGdpJz7uARZHOPb70h8Yg0rn4DHQsz6fkLpG+uxLC1WVJ/kLkbGcvsir5s0gv9yuk3KuYSZ1LX++4sF+R4c2Hi5i5IV3EXOrx8qKT3JxLeWyGkC4h/RzL1shd1nq4r7kK6cfzM5x+7hLWyKGdvhxNv6riz9a81C9r8ryANefSi+8L21vzhuJEGrCYf+SmNR6bw9jDdI02rDmWrZG7rMkNBms8P8PpJ8Jgjdxra1XBn62xzO+QZU2e3rDmXPqCx4XtrXlD0VrAojVy0xqPdZ/iDOlYtkbusib2YY3nR7j6Fez1lqTrLoE1ci+tff9lQwWQFeVabpe1wKVveFzY1toiRh/Dsy5hydrihrV1bIaQ0a5cC1i0trjLmkxDZW2dn+H0s15lbXGvrVX1fsy1by/xK9fkRoE15/TloFpoLupXmvSwXuhZwOyhTDr1VEtYdMarms54bIYIzhzLzshdzmQSgjOe73A1gLLWhTPnxoNIHm7fVeSf1aWdAP36RqhzTimoI7VVR6A7mibJ1c7Aojo2N9Xx2Pjf8BpdCJHVsblLnZRtUMfzHa7UyRswoI4c2umbVZ1V9X525iX+4yv8dNe3c2ErZVFbZ95MdBaw6IzcdMZjPYjpwbYutbHquCwSqyJf3PNYcw25Ts9mtBSEMl7Vpb6nM3VWhfvZmVf3del9H1zXhjxz7vamPwWBTCO3tUagOxmtBSxac66uX2bEKuLWdc2wguFhl5pTBTBJDt3UtzUh+3i+w/kdAZXkLpVrBaMmq2Y/m2Rh/xRSnlIwGTj9/SGIJLYVSaDjRZEBiyLJzfTjsRkiSHOsBlueZpBG7nmwV/rxdEfzmRfOyF3uO8tVWtXnZ2ks4mdMfXEQ0pzT98vDGalfZ+F7BBfR8aI0NjSwKI3clMZj43/Tcy5g6SWDdcXok74Ah0zzdrI1cpe1vonUWtXnZ2ss4ruLdcP1RLwmTefSg47UrzXJWKwrCXS4KC1gURq5KY3HZogepKtDmB4DFqWRQ5fCV1CHdrK02c4YOpVW5flZGmv47mJJk7UsUs25EfkaCaQaqa00Ah0uSgtYlEZuSuOxGSJIc8wHG9MjuStDZPpEpvF8h3t86ZMD8yM5tNMrCXVWxfnZGSv4p5CyZwpnzoWP7i3q11maHkM7qeoOWJRGbkrjse5SXFI6lqWRu6SFMoDnRzjLWEgjd7XTZYJYe/xlswSQbZZ894OS02Pg0jueF/arzefHBYw+BmsJS9YWN6ytYzOEp1rAKkU6B66eV6otDl2SZirT1umO5vJL2uIuaf38UWlVnR9T7eElfF26XFulWuIkIWt6XNSvs5Bqi+g+pvkxYVEaL39K47EZQnpUD7UQwkcb0tjcNdry4IA1nh/hUqot7mqn00KtVWF+tsbqvWOWNUkRWHMufafxwn61STu1FFlAx4vWQrhozbnapOghufKlqrcYNphMzYXqbTWHbupOH0ymdsJLcItDO50EKrLK9bNI1vQ9sCVSHsIQ6Vx40i1q6zE0k6bMgEWP5Gb28Vj3KD3o1qUOzLIG2cfmrrHuB9R1i8AZz3c7nsWYM8ld7vfSqjA/S2P1PmPqL6lAmnNhSbmorTRvJiZfwKI0clMaj3WPojTH6m7tB9B6zpFDl2Q2gTOe7mjZGbnLWee9JloV5mdnrN5nTP1RRzhzLr41dnFba6GhlGoBi9bITWs81n2K1gIWU40cuqTfQQRtPN/hsjZyl7bWr9qqMj9rY/k+Y+q3GUCbc/axQ6xPiG2tEeh4MdcCFq2Rm9Z4bIbom/vKISxPHHt86W9vYoIkhy7JIxTSeLqjZWnkLmn9AFJpVZmfpbF8nzEfcm2Q5lz6ns6FbaWFdlKqBSxKIzel8Vh3KaaaYzVBhkKA3EYaT3e0LI3cJa3nYZVWlflZGsv3GTP8AuXDufS2yoVtpYV2krSARWnkpjQe6y5FaY7lpxo5dKkzZK1EeLqjZWnk0Mx4g79Kq8r8LI3l+4wZfoHy4Vz4eNWits5CM8lZwKIz5+7vmi0oA5yLHgMWn3Pk0M1UBvD8HFQtJ7CkJHeJ3C4pf/6ydwLI9k7Cr1IGLtQBi9qJXEB3MT3mEpZEBi6KDFwSmbAkcnHopn4iu55963z3Mmbk4i6R/ZySjPypQv+YkYBcpMwW9ewLXNoEW9jWpMeLJgMWTToX3+W8rquHNppMzWkq1SJmNXcZ6CUj59Z1vsPFdzUsDu3sM7Lq/LPItBkQfm70x7n03cYL24r0dqLIgEWRztXysZcI18jW3Lquq0c2ikzNJZHkLpFy2yMleb7D1VuJ29R1WTW3Lu61yCrqzyJZ+XfIGgnZx0NGOhdea13U1qM3Ez0GLHp0Lnt0Lnp0zMcfCUkO3ewZceUjT88x1dsBGsldt0O/TKEzaxX6Z4/cDZgx9Yc14dE5/cB0VYKL2nr0ZqLHgEWP5Mb6dF1D9yg647829vga34VxSYEzcuhSmEN5ejaTnJG7munCVJ1VlX92xq2AGVN/VhPOnEtfprqwrbTQTligrnb6suIHDAJXrx33kKxJNIUVrEr63JxkF0SyOXRTTmMO5em++rysIXeJ3CdfVf5nkdwemDF/pLCFSOfSZ34W9itSX7moVxwW0QFj+qV4+h6g/4jNVQ6JIjwOQ3vhXSwBcwUwyebQT93Wh0qe717WZUnuYh4lh3b6Ia4pWdsBZ5PcM3gKKU9qmHQufVH1wvYmQ0MpJwMWJ1Lnsknn4uTqWDZJ7jLZybSeiDz/NKzBJLmrnd07/35qj+BskhsJTyHl0mDSuTi5EtubJNEBY04GLJp0rkz23b1mV+eiSceySXKXAQmHnOT57mXOSXJop1ewmpO1SXA2yZ2Ep5Bhiepcqv5J7UWS6HhRZMCiSOce3/ohOEyuzkWRjmWR5C6RMloQyfPdyyySHNrpifBZ5O3tD9s4F6TV/7f/pF/iwnfFNbYz2UT3MZiMWDCZuDIpS5D/vCcumExYMtkc+qmv7vxPDJdMPrfTc6+arE2JU0re3sLOxbd+RPBf69KcC99V3djepDcUTQYsmnSuTNqCpy9s3kCC/VfsZhnoWe+fNUg3h37KfQOR4arsm+j+d3DXDdFh1GTtJpxN+pZDjUTfHdelw6Rz4fOyje1NekPRZMCiSeeySediTjqWTZJDP3tW/Od6p4eh7xtPbZiczYzXANVkbRScTXI3YcT8fpNrg0nn/Nuqm9qL9HaiyIBFkc7VyMsCBJOrc1GkY27gv0dzVy5JyYacTO14DdIc2unUVpG1e3AWyS2GJ5G2cr29BS58XXVze5XeUlQZsKjSucpJeXcSVDoXVTqWVZK7VMosDZU8P8Y1lJPNoZ1uRlXW/sFZJTcZRshv/+m425tz4fWOxvYmQ0NeTnZDfV1piydxZbJv738WIYmLJv3qsklyl0l5GMEkz/fl5xUPObTTua0ma/vgbJJ7DCPkt/963O3NuWiS2N4kiQ4YczJgMSede3zrN+YgJ52LJh1L7wro5tDPXqms52Rqxnddn5vZfmN1ffbyLya5x9ADWyMh14bnpHPv6UFJbG+SRAeMJgMWTTpX1x9y0rlo0rGck+TQT31hATnJ893LuqxOuks5ljzObT8Vf3urXYRzanKr4SlyT9xXZAh1LpaVxPZCSXTAKDRgUahzOTWdi0Idy6lJDv2U0YJPnu5O+n0Bn+Su+6LTSCfZ2kY4m+Rew4j5/S7zP0w6967fzPRvA9ubDA2lx2XAoknncmo6F0065gqwhiV3KZDhgkqefxpWqQyg0rl9ar7/ZccHkO346EcfS2jg9It5y+eifn1KR/99AN3RlJirnca+7/otEP8xmutXJfsa+n+TuhCiPlois2GpWxy6JB0qc+v0jObiFoZW+rSk4HttLxxTEJAbkzIMxpx7T8qIbZURmD2UcfpHDJeVsbmpjMdmCJnwahMn9SgqY3PoUs93XNKkZvQV9sq1haGV8TNp6qw2CM7OuIvQHaxpR7Z84cw5pZBlpLbKCHS4mGWOZWXkpjIemyGCsoBFZeTQJbm5kGU8PaN1GnHlsjC00hmhxmrD4Gws7Cp86zdmwJhz6UG3sF9l/oJxbCg86FZDPRLZmV/X41vfD1TVRGgvzpbeXJ4tyaGfIggeebqv/j2lHjG0Mn48SkXWdsFZZNhT+B7pzLXnu3OpLFzYXmRoKIl0LIt0Lot0LooMWExIcpeC9TrvmkN5+iCSGFoZX5ytImsX4CySWwUdsgZC5gpkpHN632MOJfXrUR7sWKkQ6HBxDnUsa4ycPJyQj85FjQF71y9gweqFHLopY4V85Onu5O02drnXxOrci3VnbRmcbYZ9hW//5cbbu3PhbRyNbXWGdlJWOpZ1kpuPRB7rwYzqHKsxl0cn1Dk3xnwlolNltZ99yyA5DFBvRWgiVul/Vuf7A5WIkkFIROd0EwSJSGprjsAcVrmVsf50LJsjN83x2AwhRrD+DNiXzkAwRw5dklcFkHQ83dHqSoMy58YNoOaqyD+b405ARy5z8piGOeeSOVJbcwQ6XJxCHcvmyE1zPDZDBHOOlQZRA3Pk0CW5x2COpztaNufcC3NV05/NeeFf5qQDMOdcMkdqa45AdzSacyybIzfN8dgMEcw59qFvY4A4YuiR1FUQx9MdLItzbi/u4y/7K4CsWtffoSxxgQurlkXtxC2gO5rEBSyKW9wQt47NEC4uYLdbeMdF4MaQ8zEXqPiYWxwGqCc2mSw/aoPgmHKA3JzcWzDnXNq0XtivOv9qmdiQzEH1nFvtjOG/6w1VW2OLm+rCpb5pLVQPuvW/I8abLs4q6xaHPukXjVTarfPdzveXvpBTWy2BG/eAyqu9gLM83zB4fOtnJSHPuSiP2F4eie6qvrQCeYGK8shNeTw2IkR5zt3fwvpyXcslzyq8dbrDZXchXK8F1V0V9md3rP47crmTUgnunAubZYvaqwvthLwLVFRHbqrjse6RvmaCrHPqR3+gBUlH7PImy0YkHc93sM9P/eQcks65F0lXhfxZHKv9jlziuti4JnOIcy6JI7UXR6LjpZwLVBRHborjsREh5pxzH2/6GT24I4c+yT0GdTz9FE6erVBHTm4Bzbaq2s/SvLQvaXJtkObch5YOVc4tDJf2/i89E1zya19lAaOPEg0TpUerq5KRwFOO3JTGYyOCXAeyzam73qswRgz9kYc/jPF0x7p93uSWhzFyaGa/Lqki/SyMlXyHrKGRDkKYc1EYsa0wAh0vZZlTdVXd00s/hJGbwnhsRJD+QJhTURixjTCeHrEe+skmCCOHZvpiNMOqRD8L8zq+hsZrtw9yHBqkE4/hMnSPBdnE892dWhc/P8yRTo7VJcizA3bI8RJqR3Id6xDfX5qK8MP/ba5iSMogo8hdN9zzpSKjeHo2M75m5LqRIIjcczMqqCrxsyAv1x/f+tObyCjnwm/bNIYre/sXTU1Y84a+v4I1x95v37IQgjXn6vplEoJJ5/RegUenvu/6Nl94dO7zTbckINS5+uEguToIJfdaaFXoZ6FexteAyFMGQsnxdkfG8djeHom+Q6M9x7I957I955I9p7I958qeZCvsOZftkcOwtVxJx8+/bJkAssJbf5qz7AUuPeAWthW6iBYannCB+tAv4KtkXBjvqUq8dWwEkHSvxAvUh36YqPJuYc8jfc2LJWyd7li3H30bbKXb4p6bUWF/2Sn59G2FuoOlgxDmnJbklYCL2vvydpIvp+qqfEWy4vWA/eieKRx6cyH9AlVB5VkPiWwNnZQZHRJ5el6TzF9wSOy5FXVYFfpxyvz0Mr4uXFYIcOhc+rzYwvYSvaEk0aks0bko0bEk0akskRw62XPeykSePkgk9tyKSqxq/SzRS/q6cJnUITFw+u46ZCKxvUQS3cUk0anHt8bD1Bm4H0lYZKJjSaJTWSI5dFJSDJnI093DH/2gDDLRsf1mymeV72eXrPE7cA2aTBVw6Vz4dHxje5ehIRmPqiRCuOzSW3skl44ll05ll+TQSdksgEueHkOqC1u4dOyFyyrszy5Z/Y/A3/p94XDpnBZpSEtSe5UkOl5KS6dKpShHWpKbKxoeGxHkgY8VjVM/eiF4GBJDh2S2gjae7lhuH97IoZm+GJ1Iq7A/C2P1P0Pq+9chzLmYfMT2xkh0QB0oJJ9TcQlKbArjsRGgx+h6ZEGYUz7UMEYOHZIZGsZ4uoN92EYwjDn3ItOq4D+L465AR657WjoKcc6l130WthcXGpIUgjincqqRm+Z4rLuUpkinYqoRQ4f0w2Uwx/MdzG8AmCN3tdNPJU22qunPzlj4z5j+08K3T+fCj0E0tncWGgrOnCpnspTH9EhuOuOx7lJy5pQPNrKN3DXYYaHJ8x3tRz/CAWfE0ExPs6qsCvmzMlb7HbHGJlQLzqVP6H0S2ysj0QHT/OhUVkZuKuOxEUHmDUyQTmVl5C5lcnMhz3i+o/3o3hmUOTYmMzF3+8vmCiDbXNGfxq0JMnC1yH3era21yMK25hbRPQ3mAhXNLW6YW8dGBDcXqGhucZc5X0Su8x0tJdvC0EwnhiqrAv6YbDdW+R2xXrGQD+tDmXP6TXIwRmpvjETHS8acSmuRFW4K838Ns+P6z76MLIytXcJEfKVaaKcWIyK2ci1wL3KtivazOFb2swf+w8K3m3PpPc4L25sLDUnO1mJktdOXFc2xsWmOx/pfkzmnsjlylzlfRsYL1dcUYY7t9FW9MFeV+tmcl/OVcvLkRco5F97JsKi9uNBOEOdUFEdsiuOxHqIkzqksjtwlTpZESDme72gf3+E1vMC9EFdl+Vmc1+4lToYS4pyLjzdie3MkuqtpsnQqP97ITXU8NiLILFcLk9ChrI6toUf6eTao4/mO9qNvREXKOfbCXBXmZ3Os3jtwmZNpGuacSylHai+ORMdLr+KFcHVZMv5VBWRO5rTavAxcSsRwcfadX1UZpNbqp8Kel2mw6u3dvnQ7DlrJXYm9mtFVS5XtZ59e29fAyVwBn84ln6T2PkkcfDpWl9ULtGsnBD4j11XTxcGnc8mnU1/pzSurtefx5ysK6/Too90W0Ojh6qPffVuozyrmzz5Z8Xfsx7f+jC58kuMUhjUnj+3tkejWLcuwdHEsZ2PkQjY6l+w5VT2XOQDZ6FxtKslCHdnoXM5Gchi2XnyovSrrz/ZY+/f4lr3et7nuMNgjN+3x2N4eiW492nMs517kQu45l+w5lXOP3PNor9zj6dFHuwmQe8493QRqDxX+/+f//n9XTf7xf9bn1/+f/48r4P+rGvLav5T1bbCUkZvKeGyvjER3Rz/3iXz7perv/+//+j/+v3Vx9bLKh24DYLb01oqThzdmS+eSMac+fjSPkG/kNsZ4ui/+40dfQYMxcs/NiKg7Nk6iqOvM//V/1Jp3DVKJ6tmWogKnK6uaKxe1VbeIEU9ui1L3T6r6Nq9KlJS61Nq3fj9BqQuc/gp9LUMDVeokdUvd4tBLmYZqhlynny5e5u9St7jnZlRd7RAcZ8g7txGeQvp6JXDJIlvbWyTR8dKcmcKFdx0FrO5BWdbAoke967tfodGxai5oJPc8/pwzQzPfP3pV0JibUY1V5p81+l7A41vfRVUPurtzSSOpvUYSB42OxQIwXFZdviQIPHp7YSIN1PePTvPIRra20cjTo4/f73JzQaNzr5ad95oxzz59K6EGRKY7+HQu+SS190li9FXLPcyujtVlyZyP2TVyMgvDp3PJp1PlU6ZF+CS38cnTo4/Rp3MvfdaewNmnbxzUwMlaGj7JjVXNOra3x/8aPUv2HEsbaStet5YnVW8uTqqO5UmVHLopdzqejTzdV5UnVXLPzeikWhX/WRq3BTpkSZP7DtLITWk8tpdGoluPT0LH8hSauDSFOpdSzqk8hZJ7Hu31JOTp0ceYcs69qh7uVeif7fluQNkLKxty0x6P7e2RGD1LKedYnjAjFyZM55I9p/KESW5jj6dHH6M9517aq/r+bI+bAB27Bk4evsg958LvODa2F+oNhR3tEK4uS1aIeAB6a49v/XJaPACdSz6d+rzrpxDxACSHXuqbuTGH8nwP6v2WFqaB62eVTqVV+Z91+vZAjYcs8KDTuftdv2sG5SK5vU8S3dfk06nsM3HJp3PJp1PZJ7nLpyyz4JPnu4/3u+4/YIWauN02971q57NPbh505PIpT234dC6tT0n92uxb7XqO1CfHQjNJJpvpi4pfHr9a44yPRAz/K9eBAjFQH7objEQkhw7JpAVvPN0X+q1fVQBtxC79PbiSgF9/eQMMIHsDjP8S4C1w+uavSr9F/QoLn/VbRHcxGAtU3Uby2KvpdHHD2Do2IrixQNUSTibsMha48coe1zOBuv38SGtlbnHP/lVc1f/HTPviJkF3s4ZIOlqZFrgkjq3txZHoeEmcU/VGZFkaQxy5KY7HRgTpT6Xa+s+m7nqfwRsbQ4ckfmXaOt2tuH4IYzPNDf3qrQr+szffFShvcoXw5lzyRmrvjUT3IHlz6v6mv3QGb+SmNx4bEYK3QKXv81gRnlNkZZo3k8U590JcVfZncV7+lzivG76cS+JI7cWRGMMqj/raeQnRcsKxtSmOx0aEIM6p+5v2CBlHbiOOpztYFufcC3FV1J/FsfLvyCVOnr7IOOf05RE84kjtxZHoeCnjnKqrkkcGMi5wD/3IVS1UAhdWmIGqbzeRBytketRhYSWjU/UrA3ILYRYlhzEbq3adP6vaP9v0LYHHQ2cq2HSuis+1uL26AJ3E9jpJvNbpVNYZuKjTuaTTqfqWEekldDqXdDqVdZK7dPbNozqr/D/r9D2C0tlr2ssTdAZOykTYJIUrS1+3s4DXMtlMU3VRMvkiN8nNSZXH+n+TOKc+Hvrpb4gjd3Xo+e7FMoanO9j9Te9yJCC552ZUWJX3Z2G+B1Bj0zfBEuZcqPC+SG2FEegepsnUqSyM3BTGYyOCTGFYdjrlIw1h5NAhuWMgjKc7mHuHMHJopgdXhVX9fhbmRX6NjfQQGeZc+LTlonBh8dtcFtFdTMY8WjZGbhrjsRFB+gNjTmVj5NAjmTphjKc72P1Nv64IxsihmZ6/1FiV7mdjrO87ZI2NXBqMOZeMkdobI9HxkjGnsjFy0xiPjQjBmFPZGDn0SBbgMMbTHez+llYl5F4a+/7LLgog3UV5vMmllbHABWOL2hpbRHcxGAtUGZOFbz3GFjeMrWMjghsLVL1Jue/+62FQs+Linof6Ol3G1ukOVt9qLI/3yrHFoZnuh+TYd9XsxxwD5MZk+Q1jziVjpPbGSHQXkzGnHg/9XCqMkZvGeGxECMacysbIbYzxdAfzVIUxcq+NVbF+NuYVfY2N3CQwFjihaqW4qL0xbycZcyrnGLlpjMd6EMNScV1pU9kYW0OPfOURmsk5NpvpfNAcqyr9bMxL+TImswOMBS4YI7U3RqJHKhlzKucYuWmMx0aEkGNOeXJgViSHHvVQr1mRpzuYi0eOkXsWr8aqBj8bY6HeIWts5GaCMee06kCOkcKFpWpsAR1Og9UWV6DiwmNxUxgvYUQIwpz6eOjnjyGMHDrUq/IljKc72Oe7vmoBYeSucek7XY1VmX02xlq8Y5YxuTYYc25sxFw9gDFSW2MEOlwy5lQ2Rm4a47ERIRhzKhsjd3XI6ufV3w6WjT0106OrxqrMPhtjLd4xy5h0EcacC9uRi0IHYz22iI6XlHm0rIzcVMZjI4L0p+qxcB1ZGVtDj+RhgbUiT3ewrIzcZX6/WKxC+6yM1XjHLGVekH07lxaLpPbKSHS8pMyprIzcVMZjI0JQ5pTvVmBeJLdRxtMdLCsjdynrB6JmWVXaZ2UsxztmKQsVmXNJGam9MhIdLylzqjYT5EbC+p7cVMZjI0JQ5pRvV0AZuWusfWLk6Q5Wb8uR4cOjzLmxsaziquA+i2NV3pFLXOfv9ajC9OhcEkdqL45Ex0vinMriyE1xPDYiBHFO+a4FxJHbiOPpDpbFObcX9/jLHgggq6j1s6slLnBB3KK24hbRPQ3iAlVlj3wIsTJucUPcOjYiuLhA3X7Cj2ktDj2SJXU919bpDhbFBe6FuCq/jxn3YI3ekR8P/Sw8xDmXxJHaiyPR8ZI4p+LTbV3VFOf/qwusWpCs/+zriAuSxW3EebAszrkX4qoKP4tjqd4dKHFdT3CqfDiXxJHaiyPR8ZI4p7I4clMcj40IIeOcisuS1e+NOG8mi3Puhbgqxs/iWLF3N0ucrHWRcc4lcaR+xcl41bskQzPJG5vpi8ozJbnpjcf6f1PCOVUzpUyF9Yhb17vx5s1kb8698FY1+dkbC/fuZnmTDsCbc8kbqX3Ckeh4SZxTOeHITXE8NiLIDYSZ0ikfcYhzbow4t0kCFcuBxWF8xijLqvJRtfnZHAv47meZ60J+TZXOhaIbIa+lzjbjCHS4JM6pjzf9knGsTchNcTw2IgRxTt1/vqXbEBc4aQ1LFKfqertOuwaxioLFXeK6aFBxVaGfxbGM736WOLk2pJxz6cdIFoZLkyclZkpvJXlzqq7Jq7jV2vTm/6vvOkbCOVW/2vlcpUEbsWugZVAgjOd78H70R53gi9jVzIqiuqo6P+tiCd8Ra2j6Flh55lz6sYoHsY0unu5oSVeg0i+erWBTV/rfNUJXb6DLqQ+dNqCL2NUb0QldPN/duf/oW7rhi9zzqKivKs3Pvrx+L19ebT+c0ySs7eNFPV/YNUzILm8k6QpU1EVu6uKxHsG0DnEq6iJ29UZKRuji+Q6WdZFDO73IU11VkJ91edVeumQGxmzoXPy41OJwaW/h5+kW0H1Myjzc+12nNTzIyE1lPDYiyEyGDHOq3nQmKy+kGLlrrGXegTOe72jVjsRDijk3VjKi7ucv2yOAbHtENyJKXeCiusXt1C2guxrUJSqpW9xQt46NCDKUpS5QPuSlLnBjyK85pAQGym+EErg4DM94K4mqq6L8mHU/Xrk/HqNNPtQCl9Wxva06AmNg5V6v10VDuJh1i5vqQoSgzikfbKgjhw7JwwPOeLq743cAnDk37gA1V1X52ZyX7mWu5+Blzjn9hEM93n5Ibb0R6I6mlAtUTDly0xuPjQjBm1PZGzl0SN9KA3E839HqnaPyJIQ4516Iq7L8LM5r9xInOYDZ0rkkjtRWHIHuaBIXqCiO3BTHYyNCEOdUFkcOHZJRgTee7mDZm3MvvFVxf/bmOwDlTQpOeHMueSO19UagO5q8BSp6Ize98diIELw5lb2RQ4dk2QZvPN3BsjfnXnirqv3szUv78iYdhTfndA2DiZLU1huB7mjyFqjojdz0xmMjgnQHaxOnsjdy6JBu1EIcz3e0EifPGUyUzr0QV2X5WRxr9xH5oa8oQ5xzSRyprTgCHS6JC1QUR26K47ERIYhzKosjd4kLGcfzHS2Lc+6FuKrPz+JYxI/ID/1cAcQ5l8SR2ooj0OGSuEBFceSmOB4bEYI4p7I4cpc4WXIg43i+o2Vxzr0QV5X6WRzL+RH5odv7EOdcrgbIbdUR6IBJnVM1g8sdXzV4uKzHQ7+Mvj5PGriwlRKoak22tlAh8OrQyVAh8HR38Uv3lzB9EkMr4/1XWhpU8X7W6BV+XblM2dDoXNqpXNjWoreTLAbqpj9XC4vkZgLyWA9iMuZUNkYOHZLbCPnH0x2smpGlKJSRu5T18D4rq+8aOCu7INtC8V9CTtyP/s7Iv90b2yhroPvoyiIVlDXXyvrYiGBzZqJ8rP9bOiRr7v8ZpzuYm//fwV3KeupVZVWtn7Ls/uYlfcWULv5rxXTO64Gmtsa8mWQsUNEYuWmMx3oQPcn6QpvyoYYxtnYNtUybUMbzT+3IK01Q5tz2KXd/q2r9LM5L+uqBbKhCnHM6cSPVSG3FEeiOJnGBiuLITXE8NiLIffhf40KbyuLY2iWup7V/blN2h5/asemxObTTs6ymWtXpZ2NezNely7MWxpwLP9LZ2FZZaEc6+I8cLSpja1MZj/UgplxzKisjdymTHEKu8XxHq3akR8g1cminzauyKtHPyryOr5B9G/xze/L+5pwuOJFkpLbGCHQPU5IFKhojN43x2IgQksypbIzcZUzmHhjj+Y6WjZG72ukHoyqr4vyszCv4x0O3RJFlzoXvn2xs68zbSc6cSov/Dvc0Yv2Iv264/4xXnzIvRfXFf0dFJ/WNpfDo7YTVf2OXxr6tVGOV6meNXs+XRnkAQ6Nz+ssLyDxSW4sEetyTxUDFzCM3M4/HRoQeossrHm9O5cwjdxmTYYExnu9oOfPIoZ2xfa/Kqkg/K/NKvpT1BLwmS+fqa7qf37MBZ8S2zgh0H5OzQEVn5KYzHhsRgjOnsjNylzMZFzjj+Y6WnZG7nPXcoM6qFj87Y8E+Y+pvqiPNnLu96fvUII3cVhqBDpikBSpKIzel8diIEKQ5laWRu6SFRxzPd7QsjRza6XxVZ1WMn52xYp8h/cfe72/O6QQKY6S2xgh0uGQsUNEYuWmMx0aEYMypbIwcOqQ7sUgznu9o2Ri5y1gvM0XZ+182RgDZxsgoADk1Bu49lNkL2zlbQPcxOEtUcra44WwdGxHcWaCis8Vdzjo9rnEpZ+t8R6tHi5QItfQP3BhlNVc1+THZ3r1wr8gyD9QEGbhUtC1sa87jJXOBiubITXM81mMZlo7rQpvK5tjaZc4farmdzqbLMMzNdsZHZNRZlfVnZ6z957X7r73f6+fLNCvD1siitsq8maQsUFEZuamMx7pDSZlTPrHVntZTh/S9Nki22I4kJZSRu9S3UlVW5fhZGWv27mGlmRfa78596GdP66G2sK0zbyc5C1R0Rm4647HuUXLmVHZGDh0aH7VYEyTPdzRPVzgjdznbVtrvVZCfnbFqnzG1+MLU6Jw+lqGM1FYZgQ6XlAUqKiM3lfHYiBCeaU75UCPNyF1DLe0gzXi+oz0e+ioIlDn34plWlfpZnJfzFVnmbohzLryy1tjWnLeTzAUqmiM3zfFYj2VKNqeyOXKXOVllwBzPdzRPWpgjh3bGtopOkFWDn52xUJ8x/YfC7+/Oveu3zSDbiG2dEeh4yVmgojNy0xmPjQiSJbUhsi60qeyMraFD+ioxnPH8Uzv90FrrEHKXs/0EWTX42RkL9RnTfyL8/u5c+CbkxrbOQjvSw9rwT9GiM7Y2nfFY9yjlmVPZGbnLmVwpnPF8R8t5Ru5y1veQ5lmV4GdnrNNnTP1uSsyNzr2H/ZCFbZ2FdmQk4CxQ0Rm56YzHukfJmVM+1niqkbvGOsyNPN/R3D3mRnKX+72zKsLPzlipz5j6Jdtw5lx6w09zW2neUJocAxWlkZvSeKy7lKQ55YMNaeSuwQ7SeL6juXxII3fJ7y1bSbSPv2yJALItkS8vrAMXpS1uJ20B3ckgLVFJ2uKGtHVsROg7+3rC1BMtUFHa4i5pMjA1O67zHa1WcS2FT7TA7dePH1WGH/MNkKvzYi1w7/qhs1qLLGxrzuMlc4GK5shNczzWYxnSbV1oU9kcW7vMiRGY4/nZjv4YVaVb4F6Yq2r8bI4l+1NkKe1rpvxwTr8oCOJIbcUR6HBJXKCiOHJTHI+NCCHlAnXTb+2tefKpQ9phiPN24jy5OAzMaEfnySrGz8pYsXcPH49vL9Y+nLuNF/Su2QDOiG2dEeh4yVmgojNy0xmPjQjBWaCiM3Lo0Ciyrg7DGc93tOyM3OWsn5HqrKrxszMv2cuZLOuQZs6Nu2UpI/WrTD/08e+5HYlWi8gULTpjvDliurat9yCk9oJHb+09eiR3eZQpCR55vq/qrru1mDOJoZlt+fZRlfnZIsv3jlgWpYew6Jx+hzISj9SvRWkGEgl0uJR4gYoSyc3E47ERQa4D65NARWHkLmGdMCvxeL6j5cQjh3bGNxhq4lVhflbG6n3G1C8+hjLndFMVykhtlRHocElZoKIyclMZj40IQVmgojJyl7KwpOT5jpaVkbuU9QJHlVVdflbG4n3G1G/ngzLn3sfrRGuyJLZ1RqDjJWeBis7ITWc8NiIEZ4GKzshdznqsV5rxfEfLzshdzvp61FnV5WdnLN5nTP05YjhzLr0ourBfZ+kBFxoKD7hARWnO1cTeD4traPGAcy5VBYGKIsldIqVawgOO53tQay5+flsUHnDE0EyPgWqsSv2skeV8R6xxkCuDRud0TsVsSerXolw5HnAEOty7rlCxTHHspu9b+Y+Bzczzf33XzzbjCefYxyisLv2oBohdwp5FwBdPz+7IYxC+iKGV8W5lEfb5lz0TQFZ4P/odYNeVl7DABWGL2glbwOxh33JXtBKWsO+HVChlbHHD2Do2Q0gmlrGIyViXsYXJWF9XWsrW+Y5m4kvZ/7+xd9mypTmO9F6FCw+Arnvt6kVwQBLgVRMNNP8lgmwssQEI+Lmkfnu5ZcHCfZtZ7DizczK/Cs+ILz0yPPZtYffi1VhV8ccUe02l/k1WtzDmXHpP5MK+lYWZchHdxfB4C9Stvqfo/h6HMr+s4uQWqJkycGGmDNTrs34CEhoZFb3UMh0aeb77WFcldw08kkM7fdHqsYr6s8dU+d9kjoNH5z60KK25cmF7j95Q8uhU9hg5SSB4dC55dMrHHx7JoZeiBxp5ujX67QCN5K7boW9S9VgF/Nkjq/yOWZcuK2F4dE5fUIBGUnuNJDpe0uhU1hg5WRNCo3NJo1NZIzn0Um55aOTp7mLWSO7SuKYatVj1+9kii/wOWVfuC5dX59ILqwvbawwN9YSyHoROZY2J+5LHODQ6lzQ6lTWSQy8l9aGRp3tMs0ZyaKbHQDVWUX/WyMq/Q5bF8HB0Lmok9q1R7tRagL4S6HgpGZ36/NRvyMSz0bm6+p6errsCFp1LFp3KFsmhkzJvwSJPdxff33W3GHMqOTTTU7NarDr/bJGbAR2yxqHvjGscMKU6Fy0S21ok0PGSRaeyRefq6ntElkXnkkWnskVy6KTM37DI093FMramzOuaIJEYWukbTyVW4X+WyN2BjljDICEh0bmw17mob4d66UjF0I7cMqgsnMoTauSkPaSic0miU1kiOfTSv5wtRcsz6qYd9ViF/9kjdwfuPMpsD4/OhVceFrX3GNqRcYdHp7LHyMnVw6NzyaNT2SO5y2Pn0ZVmyEae7zHNHsld7fQoqMfaEDh75K5Bx6x8lPkeHp0LG9mL2nv0dtKk6lT2GDmZ5+DRueTRqeyRnIz/8sjzPabZIzm007eDaHz7kQ0bQLZh8yUDURoD9/yka4kqOBa3FbmI7mQQGagoMnJhpRq4IDJQUeTiLpHyLK6EXOe7j1Hk4tBON6Mia5fgmI9v3ErokJWPXnEELotke98i5UFbD8jUUE8p1y1dE2ug4ioncHX5fW9f7VVCBi555MXPwdD9l6r/V2uXR+kjPHo7cbG6uKudfhyoyNonOIvkZsK49q8nqb2Qkc5lkeS2Igl0wJSQTmWRzpXIvreXSOeSSKdyQpITAZxZw2Cl9erC0Ew/y1Rj7ROcNXIzoUf19vXkpeObc89P+vlmTKzkthoJdMCk0ams0bm6/JCPziWNTlVrMlsgH8ldGu/LCaQjT3cXqxm5t6rsCNx49URt1nbB2Sb3FO4iy4SBpHQu7MotauvSm0kuncounath61lqpaRzyaVT2SU5dFJuHLjk6R7RT52hoZLYdUf0HaMSa7fgLJFbCh2yrrzT/BoHSHQulB6L2koMzXQHrmB4QDqVJTpXFy8LNTwgnUsSncoSyaGTcvGQyNM9ol/65UOQSAytdNKow9osODvkjkJHrAsPyxznwjbAG6mtQwIdLiWiU9mhc7WbKI92OHQuOXQqOySHTspkCYc83V20XwCEQ2KPHdZOwdkhtxNGxC/dnkAeOpcmU1LfDvXtb1ipkuh4SaJTJUcmrtpVDa0VJ7kBid5ekujUx5tyeDKSQy8lGCTydHfR7wVYJPfYYu0TnC1yM2GG1A/ywaJz4cO1i9pb9HZ01DGdOpUtRq7npvVMdE7t1Kv/IWq2yNbQS1kLwiJPzyHVZRIskkMz/RzX+bR2Cc4WuZUwQ47vxV3PROfCNyK9kfq2KMOJVCTQ4ZJEp/J86lzJlgc6UtG5JNGpL33LGDKR2OVQgkEiz3cXcyqSQzvdjEh8/5FNHEC6ifOlXzpQqRi4sBe3qJ3EBXQPg8RARYmBK4nyRC+JgQsSA/Wl3zxUEhe2kbjOdxejxMWhnV6MqcTaRjhm4rvvNdQGiCwOING5MJ8uaivRm0kSncoSnavxkocnJDqXJDrlow+L5NBJuWMqE9fpKVHfkVvTaeD25eJ77TScXXI74i6yDAdcOpcSktTWJYEOl1w6lV06V6Pfjxk+GsPFJ5exNVnBwCU5dFLXxJDJ893HVC8u7GqmV7uakbWTcLaYthvUDyw6l95StbCtRm8naXQqa3SuNPYctTQ6lzQ6lVOS3DX+vsRZg9AaU8W4MDQzhlw11u7AWSO3EDpkTax9a3CJ8+5ceofjwrYaUzv3e1m1UF3N9FVljd5aPR7lsYCZ1bmk0amskdylUSYuZCPP99WnonFhB421P3DWyE2EEfJL336ObHRO35xd26mL+rYYqsZFdLyUjR4t1huhteJkGoRGby9pdCrWG6s19FLueFj0ZvxuwAOS3HU39EVrNtYWwVkj9xF6WCsb5ekCjc696WocHontPZLogDruSEenssfISaEDj84lj05lj+TQy5CNPN1dzB7JXR77flCPtUlw9sidhBlT34QGj87py8vQSOpbo4znrwfQ4ZJFNtNUnlSdK9tdhK1no3PJolM+/FjikLuGX/qIdOT5vnorQJGNxNDM+NkdtVibBGeL3EnokJWNskiARefCVtyitha9mWTRqWzRubIodQBy0blk0alskdxlUSYuWOT5HlKrQGGR2MFi7RKcLXIroUOWRRkIWHROhwu5SGprkUCHSxadyhadqzdnhgWOc8miU9WarEORi+Qui/erM0jk6e5ivY1cJghYJHffjKTix49s4gCyTRz98suSGDjdpS6Ji9pJXED3MEgMVJQYuBr2XilwQg1ckBio+oyFtFYSF3c/+lewkrhOdxf9XiiJi0Mz/XRVibXZcMzED+5I3IXsJy1rjcCFp+Ki7i/sauTXdd0eLCl0KiskNz78liLIc6t2vwPl4wxdjIDuiE3o4ukeuxf7gXbocm6/XfNR2wZna763UB2QjiL1nHvRb6VE7hHbaOPp7mfS5lTWRm5q47ERQXoDbU5lbeTQHbmVoY2nO1h9BPh+RoW1gPU1aa7VLsLZGrcaOnBdvzyQYc25tD2zMHTz6Zd9bSvdvJ3kzanszbm6en/srcvqXqYZM7bmj73VGjopXYRLbyY+9hZ3f4erxdokOFsMOwlf+qSFRefS7szCthZTO/d3a5WDq5ke9WzRWyuLMrfVEjS0lyzG1oJFcuik3PCwyNN98f74REqSe2yxiv+zRe4QdMgaB5kFYNG59NwjdX9hKxF5uoOlRHQqKyQ3J1AeGxEkWzCBOuUPLDz3nBsPrKtXsOZUDaHIhzVyGJxekWruVal/tsb9gO5mhfS64cO5+NwjttHG0x0taXMqayM3tfHYiBC0OeUDDW3k0B25leGLpztYfO4FrK9JrVVpf7bG+r8D1xts5cmBXHNOX/zCYoUUevn0S131YJlJouPZS3uYMh3L4pyry5f7HFOmc2nKdKqiyi0MmeTQTQkGmTzdfUyvLi3svhW1WKX92SLr/45Yw9DVxzUtwKJzqdwjtbdIouNFi45li85li84li05li+TQTRkrWOTp7mO0SOy+FbVYpf3ZIuv/jljDIM9/WHQu7Lwsam/R2/nU735GLjpWlyVr93ovW+I+dWMPuejtJYtO3Z71fX3IRedqKSeDBp3OvX18yXoHT0RyGLbObfH5+SObMIBsEyb82HDggs9FbX0uou+f5DNg5VNGonxmrhcJ16RSPgMXfAbqoxaS94vl8rm4+/Hnwmad7j76bVEaA3d3W6jP2gY45uen7xXUwMnDvPJzcVxN1JNxHdvb89ajPcdiNq6AY6BSNgYu2QtRUzam1j71R1IqGwMXs3FxGLa+WdRebQec7fmeQQ2cPNxhj9y0x2N7eyR6uKM9x3LuRS7knnPJnlM598jdj/bKPZ7uPubcc66++qDXlGqv9gnO9nwzoT6w321yhfPpXFinLmrv09uJPh2ry+rHxnVZmEsj1zf0xWEudU6/QrxqxUTVe+p9LvXW7ibBJda51yd9dw8mVefu2lOxtSVwFst9g3FTfelH1pCW5GZa8theI4luPWp0LGuMXNDoXNIYqKjRubt8Whqdyxqdu2tPNdYewVkjNxJ6oGsEZZEIjc7pazF4WpLaiyXR8aJYx7LYyHVpvfLTuSTWKReBtY5z+uVceFY69WG3CbLTudGaSq2dhLNU326o0ZN5BlLJzdzksb1CEgeFjmWFkQsKnUsKncoKndNv5oJCp7JC50ZrqrC2Gc4KfS+iRk8WElDoXPru2oXtrYaGpBqrmnK10+7rsmQpjecmW+OdhWckj/XfpjWPU28v+l0OyEFy6JHMVzDH0x3sTd+YhNwjhlY6QdRY7RWcjXFDoSPW0IR1qnPRGLG9MRIdMGylfjp1+xqLumuGhDFy0xiPjQiSmFjVOGVDDWHE7od6PQR5esR60/UEjJG7967GajfgbIxbBh2yhkYWgcgx51KdT2ovjETHS8KcyilGbgrjsREhCHMqpxg59EhTFTnG8x2txk9WVVBG7t68KLv9yNYMINuaCb8vGLigbFFbZYvoLgZlgYo5trihbB0bEVxZoHyoK8kWdz/UTLJ1egRLSbY4Ma/KanfhmGW3sAXxFX5eMHD6xu5aYS5qr8zjJWVOxSxb8aYy/1vNjpoW11/2WMcsWxx6JE/SSrJ1uptx85Vki7tvRo1ViX825vsAFVJuypoXb84lY6T2xkh0F5Mxp3KSkZvGeGxEkP7AmFM+1EgycvdDvZKMp0ewmGTk7ptRY1W7n415gV9X3uuZ69JgzDl9fR45RmpvjMTooi8WVztN5Rxja9MYj/XfphxzKucYOfRIHlDIMZ7uYC4eOUYOzfTKTo1VmX425rV8hfT1/c25ZIzU3hiJ7mLKMafqqmS3rhaL66qmMf/bZMwpH2rkGLn7oV45xtOjOzHHyN2LV2NVgZ+NhTL9S3/IEDnm3JuWAUgyYntlJEYfQ5I5VQPaN+c1YlBGbirjsREhTItO2cckYIwYOiTXiRzj6Y7l4pFj5NDM+CYJVVYV91lZKsv1FwyhzLmvsLu1sL0ybyhlmVNZGbmpjMd6GFOWORWVEUOHRDyU8XTHysrIXcr61lNlVWuflbEgnzE/vSa7OafzFJKM1N4YiY6XjDmVjZGbxnhsRJCxxtrDqWiMGDokTwsY4+mOlY2RQzPjdRY1VrX22RgL8hlTv8sbSeZc+sn3he2VhYZkvqmdqtXOvKw0L7K1qYzH+m9TkjkVlRFDh+RGhjKe7lhZGblLWa9hVFnV2mdlLMhnzPDDjzfn4qOM2F4ZiQ6YssypvF4kN5Xx2IgQssypvF4khx6FNOPpDpadkbtvRpR9/cjGByDb+NAfA6ssC1xStrCtskV0H4OyQNVI+IJxcUPZOjYiuLJA+VjX8mNx92PNBeM6PYKlBePi7ptRZbUDcMyyL98mqO/Glh5CmXPP+h2h9Sxb2F5ZaMgnxtVOj0TMssVNZSGCdKieZesvO0LMssWhR/ptBjU1rvPdjquvJePi0E6/FKDOqtw+O2NNPkPqj5LBmXPRGbG9MxIdMKWZUznNyE1nPDYiBGdO+Vgjzcjdj/VKM54ewWKakRP16qwK7rMzVuUds/JMZm04c24sfa4eIM1I7ZWR6HhJmVM5zchNZTw2IgRlTuU0I4ceyXyALOPpDmYv3yDJiKGVMW5qrAruszFW5R2yjMneJ4w5NyIvY6T2xkh0vGTMqZxk5KYxHhsRgjGnbKiRY8RkqFeS8fwIFpOM3L14NVYF99kYq/IOWca61LsuDcacS7+es7C9stCQ3Lu1yF/tzMsKL0cvbioLEYIyp/K8SA498lX+uoC+UM9VZNlspodXlVXBfVbGqrxD3r7Cr3B+OReVEdsrI9EBU5Y5lbOM3FTGYyNCUOZUVkZuo4ynR7CYZeTQzF5ZVdxnZSzLO2Qpk7sJWeZcXH0Q2ysj0QGTMqdqQLurV/LXFuO6rKnM/zaU0usv+zpSKb0wdEhe3cCTzGO5eCQZOTQzvlxRs6wq7rMyluV95aWsy/M1MTr3rG+zw+qD2F4ZiQ6YlDmVlZGbynhsRAhZ5lRURgwd6rX5epTxdMfKysihmXEDqbIquM/KWJXPmPrJE2SZc+HlzUXtjXk7yZhT2Ri5aYzHukdjjK6xRlnmVDRGDB2SGxlJxtMdKxsjdxnrR/e9sY+nH9j8uCDb/NDfCfi7+goP3yR5089h//3AdspSQ64sUUlZc62sj/UwurJEBWWNoUOyjP6X0d+OlZTdNzM+X6jKahPglGQfT75TUPOiTCNQ5lz4VHFje2XeUHhjcTfUY/Faddn9W/D/IV5XXb88c/4xcsmjX5x9hOWfY2P1Cz9BqDf3Ud/GeN+Jfx3tXTm4TqvPqsXPPlmw97jVeFiR/fFEjvc68o3H9vJIdOtRnmNZnnNZnnNJnlNRnmP1GzSyFYpsdC7LI4dR63lY5VVZfpbH2r2Ht8ZD7isko3MxGYntfZLogNGnY3VdtrBM11W/aiZDi2T09pJPpz7sQ/vIRufuPjXzlzVM4j7rMbnS7eKQjWzvcTZW0X4Wysq+x7cGxAqFjyfnolBie6EkOmAU6lg9aUQUZtfE+Q+9JS4J9dbSx+S6tXsBy2NqRmdfeHTu7r7QDK2S/iyUdX+PbwntVdN1jchQcnN65bG9PRLderTnWE7HxKV0dC7Zcyqno3N3n35aGp3L6UgOw7afX6u6P9vjFkCPb9mT5zHskZv2eGxvj0S3Hu05lnMvcSn3nEv2nMq5R+5+tJc0nu4++k2A3HPu7ibQ3KtK/2yP2wEdu+zJkhD2nIuTKbG9UBIdMAp1LK92nKvrD0tV55JQp+xLvfFwdCwvVZ3LYp17fRo/QaNiaz/gLJabBj3ONTBhzUpupiWP7S2S6NajRceyReeyReeSRaeiRcfymtW5bNG5stgLTbVYewRni9xI6HGugek216PRuZiexPZiSXTAKNaxLNa5un5ZHmLx6lwS69RHfa3i/WIT+UkO3ZSFIYoQnu4+ZqHOjaJPdD7/yF4OINnLqR+2lSVizbaLG0m5jm3dLaL7ldwFLLoLXHQXuOAuUNHd4tBNUVvu1unuY3QXuFFbqbvaUjim4rPvO5Q7ubvgzjl/3bapvU1vJ9p0LNt0ri5fBrgyMVy+vtrxT5Gq1mTJXpm4WsuZuE63Tf/Acq18Aveo6niu3YOzT24xdOzqgq9b0diVszMXeWxvj0S3Hu05lu05l+05l+w5le2R2+QiT3cfsz3nHq1bn2ur4GyP+wkdu7rg61Y0JjOubkvVJt2i9j69nbApvtrpq3q23ZXaAlgc7ykkXojwpF8Di9QL3E0/7oTUI7eRx9PjUp/0my+ReuTQzHh3gU6htS9wluabByVNFuuYQp3zz/00tZfm7SRpgfrUVzEhjdyUxmNjFOUmhDKn3uxrraCMHHokkymefTzdwV5fdYMJypwb37aq4mon4CyO2wUducR5MfHs3LN/luRjYXtzoSEZkN9URwMVzZGb5nisu5RWLU5lc+TQIxkXmOPpDvb6pjc+zDn3wFxtB5zN+Z5BmfMC4tk5fe8F5klSe3EkuqeaShDnVF2VlAVIOedun/oVoZg7nUuPPae+nvStt0hDcuilLPAgk6e7i9WMcJBJ7r4Zzb+q/c8WfYOgQsriDRMnOd7ocMZje2ckukPJmVPZmXPZmXPJmVPZGTn0UgYGzni6u5idkbtvRp1VpX925tsBFVImMThzLnwlSmPfGvWt9L/ODekbAJB7Hu9Fv5MOqUeMtxLSjMd6FJ9fZcWMx13AXvRLD5Bn5NAl/W5WSOP5GW68Zena/ECikUM7nYcqrar5szQv+UuadBHSnEtvtljYtzRZGcCZt/OcnDkWnRGbznhsDqJ0CM4CFp2Ru8ZaZmw44/kR7kU/qgNn5NBO56s4e/mRTRVAssQvZzLW5SxwoTBf1Lcy/zbw1I6mdaXZaqcHospYWetWni1uOFvH+m+1P6UsUfozgpVlC0OHRHwJW6c71st7C2GOLezy1bOYCqtdhmOSvaStCB0aCHMuCSO1F0aiu5iEOZWFkZvCeGxEkBsQwgKVhBGToebLRaGZaOyumRavxqo4PxvzCr5STNa5MObcsz7Ua0mysG9lMlI1LS5gjGeYFgOWpsWFTWPhSsOjbP3pvBC9VZFkbO5ydr8hjSTj6dGMza41Ky4OzYwlpTqrmvzsjIV7xyxnvvJ/cS5lGalvZWlaJNHxUpY5VVclzxFMi+SmMx4bEeTeQZY59faqNQOUkUOPekJbWcbTHSxmGbFLfE/vaqxK8rMxr9vrBwr81YEX58KHFj4W9q1MRgpZFtpJWeZYzDJi0xiP9SCmBWO6EEsPKGNz6JHeykgznh/h0uJjcVc7K1vVWRXjZ2desZezXoRetxNmRufSKn9h387CKn8Ro49JmseL0ohNaTw2I/Tz4+oR8ixhulSGNHLokiws4IynRzRzj6mR3OWsk0KlVdF9lsbKvGOWNLk2SHMufNSksb200FCS5liURmxK47HuUsy0gNloQxo5dEmeGZDG0zOa7kdAGrl79+qsiu6zM1bmHbKcybwNZ87d3vQdPliDkPuWFmZHAh0wlWarncaiM7Y2nfFY/2l0FrDojBx61E+i9UDj6RlNd7/gjNxjZ1Vzn52xMO+Q5UymEjhzLj7QiG2VEeh4UZljURmxqYzHZgTpEObGgEVl5NAjeWggzXh6RHvRb5eBMnL3zWiaVcl9Vsa6vEOWMskOKHMubYAsbKvM24nKHIvKHKurl1yojax1Wd3LmHne3HPUSA69lCkJGnl6RIsayaGZfhqJxtcf2RMBZHsi+hXQpTFwz/pF2zVZLmyncQGji+EBF7CkcWEj89axGcEzL2FJ2eLQI61ky9k6P8PpkrNSb3GPnVUtfky9VxbsHbJuXnn4wplzuuCEMlLfysJKchEdL6VewKIzxpvOeGxGCM4CFp2Ru8ba8yxc6fOLfn8JnN21s1v+v1bNfnbmhX05k3IWzpx7TtKIfUuTabdKttROyjO20wMfnRGbznis/zRNjelCojM2dznrZTtXJbGdsF+8OLTT6nVurGr87Iwle/fw60nfFAJnziVlpL6VpTwj0fFinjkWnRGbznhsRgh5FrDojNzlTNrB3MjzI1x6ni3usbMq2s/OvLIvZ7JigjPndHMJcyOpb2chzQiMHqY0cywqIzaV8diMIENdC8l1pQOLytgceiT9gTGens2EheTi7pvRLKtS/GyM9XqHLGO9quHGyKtzWtXBGKmtMQIdLiaZY9GYY3EduS5rRg0Wvbm4jlzNoZcyVLCYmkkWyaGZXvyqxarNzxZZwHcHy2LPv8uic7odAIukvi2muZJEx4saA/ai74GrXeQVcGZe+Nuw87/+dFzJi35Hde2ULO5y1qO9HnApnK4QsCghh3Z6YlNpVZyfpbGC70svaXJbYrJ0LtVwC/u2JrMLFiXeTpQWsCiN3JTGY92luCoJWJRG7pImS2xkGs+PcC/6fihII3e1s11JVnl+lsYavkOWNBlsSHNOy3NkGqlvZ9oOpJHoeOHlmkRFZ2xtOuOxEUH6gyecU7d3fbcn8owcetT5sdKMpzvY7V0f/TDm3P4ddq9VkJ/FsWrvyCVOJgKIcy6JI7UXR6LjJXGBiuLITXE8NiIEcU75iEOcc2PElz+nahTlFWb4I3d/G8g0+fYjeySAbI9E77wSF7jwbFvUVtwixrDKk7TeN5KoJG5xQ9w6NiK4uEDFjFsceiQXWnPkOt3Bbu+611bGAjf8q7gqzY8Z98b6vSPXveJFd+CSOLa2F0ei44WMi9HCmmRxU1yIEMQ55SNeGbci9PWOEWfGBSpm3OLubwMVV3X+WRw3A/rCvp7eZFMAGedcqLwXtRfn7SRxTt2e9LsCazG54k1x/rfhnVrrL7vftf5fy4XLCLyxMXRIlmtIOJ4erbzqDzog4cihmVFLqbGq4s/GvNQvY/L4hTHnkjFSe2MkZh/vBwpzpFPZGLlpjMdGhJBqgUrGiMlQrxzj+REsKiN3tdPqVVmV8WdlXuuXMqkmocy59F6thX07k6GqheQCZh/lcQFnIVx8rpGbznhshuhRuka7lpIpxGt4s9birtG+v7uQZyGaFRHIM3JoZpRXKq2q8bM0luzdw5ImowhpzqU8I/XtLKz+QztpZmQ7d1clA4+Zkdx0xmP9t2lmDJQlCKZGcpcymTrhjOc7mr/pC87IXc6WelVWtfhZGQv2DlnKJD+gzLn04vbCvp1JO8iz0I7uxCDPAhbzjNx0xmPdpVRl5xCyVoc0Nocu6e0FaTw/wqUqe3FXO1tpVYufpbFg75AlTe4nSHMuvV1rYd/SwobWIjpg2htJWLTG65rWeGyGkCTF7JgwfdMTrJFDn+SxAWk8PaLF2ZHcJa3b0VSrevxszYv2siY3HKw5l96vtbC9tdBQyrWARWvkpjUeG+M4HiLrmRYwG25YI4c+6e4DtPH8DKdvCMAESe7evlqrKvxsjaV6hyxrstkGa87Fd2wt7ltbmCG9oZhrAYvWyE1rPNZ9ijNkwKI1cpc16RGs8fwMp7tGsEbuobX3H9kVAWS7Im9eXAcuPdYWtpO2gNlFWfjUYy1hSdrihrR1bIbwCTJhSdrirsGWWaikrfMj3Iv+wENJWxza6ZJKUu29iv5jqgEyafqhvkq1wKUd/4VtpXm8lGmrnTkSYUskcF9P7z0k12RYb9sKXMq+hEWR7AW6KbccPPL0vPrkkdx1P+yWJ+9VlZ89snTvkDUQ/fC8BgIenUtv21rY1mNoJzznVjt9WbV/IaumqgMWN5MvhQjJF7DojNzlTB4mkMbz41Jf9Y0CSD5yj6VVXX6WxuK9Q5Y0uZ8gzblQuy3q21lYUi6i48Xk83BZGrkpjcdmiCAtYFEauWuwZWQgjedHuBf9UnpII/dYWtXlZ2ks3jtkSZMuQppz6Y1bC/u2Jk/yqt4W0PGitBQuZRq5KY3HZgjpUdUB6UqiNDaHLukmLaTx/AiXqrfFoZ12r4+5KszP0li9d8iSJoMNac6lTCO1dUagw0VnAYuzI7npjMdmiOAsYNEZucvZehRdjw0o4+kRLa5MyD1WVuX7WZnX+KVMHh1Q5py+elsvay9qqyw0kx5oAYvKyE1lPDYGMRRu61IHFpWxOXRJltlQxtOzmbQIIYdmOiM0y6ooPytj5d4hS5msc6HMufFqw3XPQRmprTICHS5mWcCiMufq6sNa0rm4lgxY1EgO3ZQFGzTy9OhkzDxyaKazRDVWkX7WyEq+Q9ZAyIoJGp0Lr5IuaqsxNJMyz7H0BrwVbiae/2k05titvjbyfjKsHZMVAj2S+wPGQjP11aH3zWBN4tx4Iqm4qtPP4ljM34mTqQHinEviSG3FEehwMf8ci+KITXE8NiOEh5xjt/rwzP2IQxy5jTie7mjVTBDn3F7cx49snQCyKlwjl7jABXGL2olbQHc0iQtYErewIW4dmxFcXMB8xEtc4MaIc5ESKH+zbCXe4jA+42MyknIfVZ0fUw6Qm5NJAeacS+ZIbc0RmON6f5/XllcIFsWxsSmOx0aAXhRcI12VQAhQI+0JtzgZ6WXMo309aTswRg7t9OCqsKrMz8JYvncHK2RXF9elQZhzun1aa5RFbYV5MzHVHIvGiE1jPNYdSg+3daWN3d71vSpINTaHHsmw1MNtnZ7N6PDBGJtpbmSsiqvq/CyOJXy3WOJkToE455I4UltxBDpcFOdYFEdsiuOxGUH6g1wLWPogx+LQI32jDcx5OzXXimGYc+6BuSrlz+a83i9zMqvAnHNpjiT1bS68RSG1ExaUAYvqGG+q47GDOsdu9VPg9/M1co7cJud4uqOVORk/mHPugbmq1M/mWM535DLX1cWaLJ1L5khtc45Ah4s551gUR2yK47EZIeScYyVOOIgjtxHH0x0ti3Pugbiq18/iWNR35BLnlfiHc0kcqa04Ah0uinMsiiM2xfHYjCBCMFk6VuJkCQ9x5NCjXlCsdQlPd7QszrkH4qpCP4tjGd+RS5zX3h/OhY3KRW3FeTNRnGNRHLEpjse6Q+HdXOtCBxUXlGwNHQpby6Gd29u7VMCYKmc7/QzUdUlV6GdjXsaXMQmJp5tzz0/6MMCSktzWGYExVunx5lh0Rmw647EZISSbY5Ul4fFGDj2ShwcWJjzd0aoZGUA4c+5BslWNflbnhfzXk74vGuqcy+rIbdUR6K7GdHMsqiM21fHYjBDUBSwuKsmhR/oZXLjj+Q6X3Tm3d/f5I1smgKzw/pSpvNwFLrpb3M7dArqr+s7EKr0DldQtbKhbx0YAWeTVEy5Qdc960i0O/ZHTJW6dHsFswq2kWxya6fWDTJSfVZ8fsw2QG+vJl4vJwGVjbG9rjMDoY5goQ7yojK1NZTw2I3i2hQi+MVWrksXdDzZXJet0R4vJFrgHyVaF+lmdV/N100lHkWzOZXXktuoIdFdTsjkVzRGb5nhsBAjJFijLEogjh/6EaXKd72g1fhIP2Tbb6aTVbKsK/azMy/gKKU9fKHNOX7GrRcmitsK8mfRkW+30QERjbG0a47H+07TPFSLERcniNrnm0W7v+niBMece5FoV6GdxXsWXuJ561zTpXBJHaiuOwBxWmZTxXHMsiiM2xfHYjCBzBx5sjsVX3xZ35dr9XgoebKGZKM65B+KqQD+L8yq+xHnp9ulcEkdqK47AHNYgzrEojtgUx2MzQhDnWPVb1u+YJMmhRz25racbT3e0nHHOPRBXBfpZnFfxX/YxTkyVzj3rx3YwVxLbmiPQPU0PN6eiOGJTHI+NAPKwQcI5VYWriIE3cpuE4+kOVqMnC3HMlM498Fb1+dkbi/i7yNIBeHMueiP27S1sLKeGQsaxnbvLEq7e87pam+b8b8NuyfrLjvCmn8iAODZ2iZMLwFTJ891MNufcA3NVpZ/NeSlfkWVqgTnnojli24wj0D1NGedUzDhi0xuPjQAh4wIVl5PkLnGyewlxPN/RsjjnHoirEv0szuv4iiw9hTjnwotwi9pnnLcTl5WORXPEpjke67GMy0rH4ks5d12SSRDmUjNaSGGydG5v7vYj+yWArPq+eT0QuGBuUbuMW8AcVpmCalkZsCRuYUPcOjYjyBRST7mAxZdyFoceubh1uqPV6kTClbjAPRBX2wfHlLv5HkOlnNcDgUvi2NpWHIHuaMq4GE1mqnrGLWyKSxFkJCHOsfhSzuLQI3n4V8at092fLM7DPRBXdfpZHIv5jlzivB64OaffKVqrykVtxXkzUZxjMeOITXE81h1KU+W60sZiBb64K+NkJoI5D1fvWBEOKefcA3NVr5/NeVFf5qSiqafczblkjtTWHIEesGjOsWiO2DTHYzNCSLmApVcFVr/RI/2IFMx5O9mccw/MVcF+NudV/deTvv4Lc84lc6S25gjMcb3fksBDzqkojtgUx2MjgKy2MFUGKq0rF7fz5u1UJS/xkHHk0E4/K2Wb8laF+lmYV/MlrNvkbhcak+VLerqR2gojMMYzvCQQo4WnG1ubxnhsRgip5lj1Wx5fVcOtK7mU3d9ayDRvxudaGCN3GetnkCqrGv2szAv5unRZ2yHHnHuzFw3wZCO3lUZgDqnEQ5o5FtPMsbp8MfSPsbn4tPPm3ABEkkMv9ae5YJLnu5N+Q8AkucvkuiFUZJXsZ5Fe11dISXeIdO6mr5LDI7GtRwLdxficcyx6JDaTj8dmBFGL+dKxuGO5uPux5o7lOt3RXD2UMdylvnNcnVW1fnbmJX05k0URnDkX3h+0qG9lYctrEd3HsHMSqFowSYqiHOBVTWc8NiLIPQhlgYqPOHLXWEuVhDTj+Y5mW2dQRgzNjBf0VFmV6WdlXsuXMrk0KHMuKSO1V0aiuxjTzLGYZsSmMh6bEUKaBSwuJ8ntnPF8h8t5Ru5qp69HpH39yHYJIFlvlLR+cHJdEriwLlnUtzS5vetD3gvoLoY0C1RStrChbB0bAeQyKssSlbJscddIS2FUWbbOdzR/aaHSbHFXO7uH2VeV5scsA+TC5NIqywIXPi68qK0wD5eEORWFEZvCeKyHMLwSsK5zUFEYW0N/9KcWIYznu5248l8c2un5XTOsKvKzMC/bv56fZJENYc7F95QsbqssNNRduBK6VpGrmR6JqIyNTWU81n+alAUqKiN3KZMnPJTxfEcrZb26uDqEHCN3tbPNsSrFz8q8Xi9lXqx9OWdvwq0F48K2xryd9CRb7fRIRGXe2vuzvie+Fv6huaTRW4sfgVutoZP6HeHQ6O3Edywv7rHGqszPGlm+93iVRrlzkHnOpe8KWthWY2gnFN2rnb6sqNFbyxqdSxoDFbOR3KVRHivQyPN98VkjObTTQ64TaJXrZ42s6TtkaZQZDRqdS99IubCtxtBO0uhY1OhYLbB60XZNX8hG51IZHrBqrgf4aq7K8MXdj/91Gho9WlxqLg7NjHfvqMcq1s8eWdHfeZSRgEfn0hcKLezbo27fYbEZGkoiHYsiHavbUNaWEOlcFOmYG4BIcuim7vDCJM/fjao8RvF4dG6/B/1VlfzZJ8v9u8he76ExWbFGn8TQ0edfysBCJ4GOF5+SjkWdjpVOKXyg07mo07FqTuZP6CSHXkrawiZPdx+rmWDTuQc2q8g/2+ROwIysXwqC7HQuVO+L2ientxNtOhZtOpaT07lo07GcnOSu5JRbFjp5/m5QZSGJ5HTugc4q/886uUdwF1luOOh0Lukktc1NAh0u2nQs2nQs56Zz0aZjOTfJXb1cFcR6ZvJ09/Hr+TnIdG4r8/PpBzZpLkhm0IpsK6DE+adcm/rOTblrf/3eQHc0yIxY+L6p5rqE7GMzhCwF/ileya1+4fVezT9Hbgz5XwTGoPZNVf86Wrvug34k3C96Pp9qL+GUhxfk6qSnf1cxfWMiqSO1VUdgjuv9cP1mE0w/7v4Pg5vmQgS5hSAuUC/6WgrEkZOhXsp4vvtzq2/Fv+8RlJG72lmn1VhtEZyNcR+hQ1aySRdhzLlkjNTWGIEOF5MtYDHZyE1lPDZDyC0IZ47dasNsDeblBM7I3Y/1UsbTHc1zFsqcGzmr5mr34GzOtxjKnNwsMOdcMkdqa45AdzSaC1g0R26a47EZIphz7FZvCHNz5NAleXz8SxyXbI7N9FU9MFcbAWdz3C3oFsuclRKfT875qxBNbc15M9FcwKI5ctMcj3WPwtKkL7WxW32Jr5tjcxtzPD2b0a/cRM4598Bc7RGczflGQpnrZ+Y1KyDnnEvmSG3NEeiORnMBi+bITXM8NkOEnAuYLSYwW5K7zMnSBUnH8x2ukk7iQZ1zD9RVsX9W5zsCpU5KVqhzLqkjtVVHoDsa1Tn2bj+bgLUJuamOx0YIeXDjOReouDYhtzPH8x3t61nf8QJz5NBOi9UnXFX0Z2Ve9ldImeihzLn0hCO1VUagexiVBSxmG7mpjMdmiB6ka/qAM8du9ZlUnyfJXc7uTyPZeLqjVbLJCgHKnHuQbFW8n815hV/mZDqAOeeSOVJbcwS6o9FcwKI5ctMcj80QwZxjZU5e/sQ8SQ5dkjsa5ni6o2Vzzj0wV5X62ZyX82VObj2Yc05Lqr8f1NacNxPNOZanSXLTHI/1WGp9g5QLVJwmyV0pJ+MCczzf0fI0Se5qZ6WuTJPPP7JfAsiK7he5N0tZ4NJL7s3tpKWG/JWGbqeHol5Llemnnm2ruSFtHRt/q8uEshawSjdZj1W6LQ5dkmmopK3THa3STdYGNVEGbp9uz1WkH9MNkLuTpzjcOZfdkdu6I9BdTQmX4kV3bG6647EZQm5HuAtYWlIuDl2SuwfuvJnszrkH7qpaP7vzkr5SXa4Q7pzL7sht3RGYAytTUO13pXjRHZub7nhshgjuAhbdkUOXdNaFPJ7vcFmecw/kVcF+ludVfcnzGvzZuSyP3FYege6q7mnDXaCiO3LTHY+NCDKTIO2cqo6HKZMcOhSmTJ4ewex5iSmTHJrp3NDnXFXqZ2VezteVyyyNfHMuKyO3VUZg9DGkW6CiMnJTGY+NCEFZoGys8ZQjhw6lbOP5jvb1rB+QgjNy9+rVWZXoZ2dex1dIWfDCmXPj/RdXXVTLyUVtjXkz8ekWsKiM3FTGYz2IaatrXWpjcZNycZeztQ7k9vI6PZvRr4GGMr+qBxNklehnc6zjO3KZk4kA5pxL5khtzRHocNFcwKI5ctMcj80Q4dnmWHxhYHUcXZJpAY+21Ewy59wDc1Wpn815OV/m5AphzrlkjtTWHIE5rBINT7aARXPkpjkemyGCOcdu9Z3A90mFeZIcuiR3NMzxdEerV+FkzkLOOffAXFXqZ3Nezpc56SjMORe+QKWxrbrQTjAXqGiO3DTHYz2W+mDCmiRQ8QFHDh3Sl7pgjuc7WpmTRR3MOffAXFXqZ3Ms5ztymZNHOcw5F80R+zanDdW7FlJDQR3bubssyQiU4OSmOh7rv03qnLJPXiHliKFDOhfBHM93sGzOub25lx/ZPQFkFfir3DNlLnDhdYFF7VJuAd1Rm5trtkxYyrnFDXHr2Awhk0glXcDiJvPirqS7n0zL3Drd0cqchKucC9wDc1WsH3PuxSv6yjmpZGDOuWSO1NYcge5oNBewaI7cNMdjM4QMJcw5FjeZF4cu+XNune5o2ZyHe2CuKvWzOS/ny5xXci/OablSVcGitua8mWguYNEcuWmOx3os7cENc47F/crFoUsyrSPnUjP+ffiJe2CuKvWzOZbz3c+vZ/3GfuScc8kcqa05Ah0umgtYNEdumuOxGSLkXMDSjtfqOLokz3+Y82bqHRBy52O2dO6BuarXz+ZY1Hc/y5ysamHOuWSO1NYcgQ4XtrtCsPgSweKmuBBBBhwZF6i0tFzcxps3UzOWvK4Hb+TQTA+ubJ28VLV+FuYlfQmTaRzCnNPXyDFJkvoWFlaUi3hsjO00VQPhK8rV2jTmfxtWlOsvO0JtzMpQ15JyceiRPjyQah7NVqYwRuxqpodXlVWZflbmtXwpk/kbypxLKxJS38rk3q4aIDSTcozNzPHUqrhqgNXaNBb+Vq4DORaoaIwcOqTvd4Mxnu8rrQWJ3FtQRg7t7I1VeX425jV8GZPpH8ac0/cOIclIfRtLSUaiu5iUBSo+z8hNZTw2IgRlgYrKyF1DLUkIZTzf0b6etHqCMnJop4dXk6zq8rMyL95LmXQRypzTN4lCGam9MhLdxaQsUFEZuamMx0YE6Q+yLFBRGblLWacHt5RDO1nZXTur7lNlVZCflXnVXsoksaHMuZRlpL6VyUhhXiQwxlMmYZTYgYrGyE1jPDYiyHXAWKCiMXLokH4IDUnG8x0tLz7IoZ3usBh7/ZFdEUC2K6I7aWUscPG1tsXtnC2g+xiyLFHJ2eKGs3VsRHBniUrOFnc565Ues2yd72j+MmtNjIu72tll2WuV4McsA+TOfD8kcOFNd4vaGvNwqTZb7fRAxLduZU724f6xBiyEDRoDFTWSQy91PV+pF6KVRnkOQuNsp+8GTb2q288avbivyVJKRKSec2GyXNRWY2hGN2hrtlztnDR6c6U7aHQu1AIhaqwFFode6lsCoNGjZY3krna22VjF+VmjV/Bfz+9y50Cjc/Z+y1qnLAxXFj4v3kALiumYwoVqYMXr5ury+86+5jmkY2hPX7GqR2HAqjlZnFRRt7h7AWtW9Wi3eovJEnVxSEfn9tsnr1Wzn3WysL8bD4kMnc49v/eC97pA6CS21Umg40WdAYsPROeyTufSPua6/L66rJPNXd2814S05OlupnTKuhA6nXugswr6s05W/R25OiCeoNM5fUrAJil08+mXoe5bRMfT2xaTLNtpqq5Knm5VqmdOxg3J6e2lSdap13of870t5Ca5jUye7ou/feqSETLJ3Tejj8qq8c8WuRHQIWu85GEDi84li6T2Fkl0vGTRqboqWYfBYuRk3GHRuWTRqdeb/oYHLJK7H/41w/J0dzFbJHffjFqssv9skXsDHfLr+SM8KZ1705UKkpHYXiOJDpg0OpWTMXIhGZ1LGp3y8YdGcuilPEcxs/J0d9FzGslI7r4Z1VhbAWeN3C/okKVRVgxIRueiRmJ7jSQ6YNLoVM7GyIVsdC5pdCpnI7n78V/ZyNPdRb8boJHcfTOqsfYHzhq5idAhS6PcYdDo3E2Xt8hGYnuNJDpg0ujU7VPjYVJ17rW+xu3+YYZJ1bmk0ambrk+QjMTQSVkTIhl5unv4pV+JCYmOjWe/uHz7kV0cQLYj8CEXWC4Dl1wubOtyEd3T4DJQ0WXgyqXciuUycMFloG76IkS5XFh2uU53D5PLgD1wWZsHx7x84w7DCPz8ITc2XDoXXRLbuyTRAZNLp2q68CVruKzi/CkZuOTSo/q8CJnkNjJ5urtYFyXrx8rM1UxzD2zWHsLZJjcausWKLGtE2HQu2iS2t0miAyabTmWbkfOHZbj8ZNNbq6pHFoCwSW5jk6e7i9mmcw9s1k7C2aZvN3w960vWsOlctElsb5NEdzXZdCrbTJz+KjLmWeeSzUS9ya0Nm+Q2Nnm6u5htOvfAZm0knG36bkPZlMcObDoXbRLb2yTRXU02narLkod5rYDCZRUnDwrY9PaSTac+npNNchubPN1drIuSxwRmWuce2KydhLNNbjfcRZYHD2w6F20S29sk0QGTTaeyzcjJIwo2nUs2nbrpxSE1iW1k8nT3MMt07oHM2lA4y+Suw11kmVsg07nw5ciN7WWGhiTlat8uhMsLWm8tFiehvSTTW0vFyWoMnZRpoIqTdbqH9Ka/iIHE9GAPXNauwtkltx46cN1FsoaAS+eiS2J7lyQ6oN77cOlUdulcLk6cSy6disUJsY1Lnu4eRpeOPXBZWwtnl9x/6MBfzzdZwcGlc9Elsb1LEh0wuXQqL4AiJ88ITLLOJZdO5eKE3EYmT3cXa0xlPw2Z6dwDm7XHcLbpGxEVOSyAnIs2ie1tkuiuJptOZZuRk4kFNp1LNhOVihNyG5s83V3MNp3b23z/kU0gQLYJpL/iVbkZuGRzYVubi+iuBpuBijYjF4qTwAWbkQrL2cVlm+t0dzHaDNwDm7UbcczN97RlcZPHOmw6F20S29sk0V1NNp2Ky9lwWcXJ5VduBi7Z9KixOFmtbWx6M2XTi5PVTA/FA5u1y3C26VsRFVkePLDpXLRJbG+TRHch2XQq24ycFyfp8mV46z0igUrFycI2MtM1JZnOPZBZmwxnmb4TUTJlNCDTOf3UYr1wsqi9S28nuXSqrkpKpto2WPHGWybXsXG3BG8ewV9rrKpytYYeyeO4CpF1uoP5sqnWO4tDM3018vrIe20knI35bkONjVwajDmXjJHaGyPRXUzGnHrRugjCiE1hPDYCvOmXdiDVnHv9DF9+HbiRJHyVMlD17m5Z/cMco97fAGqudg3O5nxr4etZfy8G5pxL5kjtzZEYA+v7ACFaXZUs2aGOrU11PDYiRHXOVQxZnCPbyKFPcgnINp7ucH4HwJlz4w5QdbVJcFbnOwnVARlMqHMuqSO1V0eie5qSzqmsjtxUx2MjQlTnXMWQxQ/Ukduo4+kOl9U590Bd7Qmc1fnGQXWg5+BrQoA655I6Unt1JLqnSZ1TWR25qY7HRoSozrmKIQs1qCO3UcfTHS6rc+6ButoAOKvzXYLqQFicOJfUkdqrI9E9TeqcyurITXU8NiJEdc5VDFkAQR25jTqe7nBZnXMP1FW1f1bnWwLVgbBKcS6pI7VXR6J7mtQ59fWi72rBs47cVMdjI4LMIlikOBXfQ7U49EiGBU86byavK8mhmb4aecR9/MiWCyDdcnnxX1T9DFwq6xa2VbaIMaDyRK2t7UDFUmBxQ9k6NiL0IF0TfykL1Et9+OL+3VeVa4EbScJ1ZaC8sKg1yuIwPuMnqlRdlfnHZPsIewEv/iuqn4GL6tjcXh2JMbBBnVNZHbmpjsdGhKDOqazOuaTOqayO3KWu+63qqlg/q/OKvmakbpOrkw/nojpie3UkxsBKOGSdU/WCknA1US5uqvO/Ddtg6y/7OurzoZ50bEzGeqUbz3czfgcg3Zwbd4Caq82BsznfQShzsjCudeWHc9Ecsb05Et1VHTCYcyqbIzfN8diIEJLOqWiO2GXOi7lwodkc2+mLemCuqvWzOZb03WKZk47CnHPRHLG9ORIdMJlzqszJahc5R26a47ERQTqEJ51TtUXqOUcMHZKUrLVJaCWLYzN9TQ/EVcl+Fud1fYmTggbinAvfLrOovTdvJ3lzKtYDK9705n9b370iaw+Yc656HtSRQ5+kGajj6VYSN70Wh2YeLE6qWD9L84q+Ll1KGUhzLmYbsb01EqOTchdjnnQqWyM3rfHYiBCtOVcxRAtWluQ21nh6hgtblXfNjBtVn25Vp5+teTFf1qRQgTXn3vSrweqFgYXtrXlDowvX4x7WnErbzAub0vxPq737yQ+Z5tjtRd8VAmfkNs54ejrTj7pjXUIOzfRdqsqqPj8r8yL+60W/mQPKnIuJRmyvjMToY3dhKXOq7iTZaMdjjdx0xmMjQnisOeUPJChzbjyQ1orSKa/gYY4cxufBHFkV+lkdy/juZ6mTNRPUORfVEdurI9EBU7Y5ldWRm+p4bEQI6pzywYY6ctdgy02GBxvPdzS/BSDNuXELSNZ9/si2CSDbNtGvJil1gbPfzKuJcmFbdYvorgZ1gYq19+KGunVsRHB1gfItqlK3OMkT5ts639Fi1b24q52eP1RaFefHfPtkBd8xK9/ktoI056I0YntpJDqghqunWwiXnm4Lm85CgLQkWX/bF/Jan8S8fwzCmrc3EmW5cyquJ1drB3dVpJ/deSVf7rzu/nQuuiO2d0eihyy5cyquJ9dlTXn+t7EKWH/bVxLXk4tDn+Surslyne5m/B6oyTJw4x7QvKsy/ezOa/lyJ3ML8s656I7Y3h2J7mpy51R2R26647ERISaecxVDblskHrmNO57ucNmdcw/cVaV+duflfLmTBTTcORfdEdu7I9FdTe6cyu7ITXc8NiJEd85VDOk63JHbuOPpDpfdOffAXZX0Z3de95c72T6AO+eiO2J7dyS6q8mdU9kduemOx0aE6M65ihEeeOQ27ni6w2V3zj1wV4X92Z1X/+VOOgB3zkV3xPbuSHRXkzunYm2wLmu687/Vh0BV4usv+zpibbA49EjrXTzuPJovVPG4I3e108WXPuiqYj9LY1nf117SfPvk07lnXcugKiC2l0aiAyZpTsUFJrHpjMc6QJVT9+tGSHPs9VPfyYqp0rmRJ2t96VR9/bsMI9SRw/j0aTVXFfvZHMv67ufXi355ItLNuWiO2N4ciQ6YzDkVzRGb5nisA0RzjsWNr9XxK03ubwBkmzfjNwCUOTduADVXZfvZnNf2Za7z+LqpYM65aI7Y3hyJHthkzqlojtg0x2MdIJpz7PaiXy6NnCO3McfTHS2bc25v7vYjeyiAbA8l/PJ64JK5hW3NLaK7GswFKplb2DC3jnWAZC5glXNSsZW5xWVz63RHi+YC98Bc1fbHnLv5BkDlnHSgci5w0Ryb25sj0V1N5pyK5ohNczzWAaI5x24v+t0AMEduY46nO1o259wDc7WdcDbnew5lTupRmHMumiO2N0eiu5rMOVV7UbLOqFcL1mVNdf63YVm5/nJcx1v4bOTi0KNeU3Bpsk53M3FVubjrBujX/uQJd6t6/ezMi/py5tsnaEzm0/T1vAvbOwsNSXLXtuVqZw5FeOPC4qazEEE6VKvK9ZcdIb1xYWHXWNvSZJ0ereivZ9fKJGAPcq1q9bM3L+jLm9zUyDXnojdie28kuqcp15yKsySxqY3HOkCcJR17velrf5glnRtDvlLOqVgNrNbubwPNuKrUz+a8nC9zvnFycy6aI7Y3R6IHNplzKpojNs3xWAeI5hzL5pxL5pyqFarMJEg9co/NVaF+NsdqvvtZ5nzb5OZcNEdsb45EB0zmnIrmiE1zPNYBojnHbi/6labIOXL3Y72Sjac7mt8AUObcuAE056pOP5tjMd+Ry5w8gTFbOhfNEdubI9EBkzmn4hsr12VNdf63aWXiVHpj5QqADum4VAW+znd3vnTKgjiP9kBcVetncV7Sf73od1ZDnHNRHLG9OBLd0yTOqfhS+LqsKc7/Nolzyl/CRsqR25nj+e5PNOfYA3NVrZ/NeUlf5nzr5OZcNEdsb45E9zSZcypOlsSmOB4bAdLLA6FHNc3JkwnqvL0x5mvSdCq+Hr5akxtBpsuvH9k8ASSL/XLXhcZ1bZV1gUvuFrZ1t4gxtDJgVRQEKr62s7ghbx0bEZK8wNVrELI6K3mLQ5/krq4Jc53ucH4P1IwZuHEPqLuq2I959+VlfbmTwYQ756I7Ynt3JLqrIe9CuOyOrU13PDYiRHfOVddl/wHuyG3c8XSHy+6ce+CuNhLO7ny3oTogtSvcORfdEdu7I9FdTe6cqsuSWrM2UNZlTXf+t+Fpt/6yryO+Lrc49CisU9b5bic97QL2wFxtJ5zN+Z5DDZFMGzDnXPrS/4XtzXlDyZxT6Wm3wk1x/qepNFh/2iP+Wt8odr9RgpwLzcmNjWnTqViOLw7j0wWYzpdV3J/N+Q5Ames217POuWiO2N4ciR6xZM6paI7YNMdjHSCacyy+OPdFDj2S5wiU8XRH8xsATzrnHuRcFe1nc6zsO3KZk1sPOedcNEdsb45EB0zmnIrmiE1zPNYBojnH4otzq+Mbc95MNufcA3NVu5/NeYH/9fLW779dOedcNEdsb45ED2wy51Q0R2ya47EOEM05Fl+c+yK3McfTHS2bc+6BuSrez+a8wi9zsv5FzjkXzRHbmyPRXU3mnIrmiE1zPNYBojnH4otzq+Mbc95MNufcA3NVvJ/NeYVf5kJN51w0R2xvjkQPbDLnVHxx7ovcVMdjI4KsKeqFnvWXg0ovzi0OPZLnP55zHiy+OLc4NDPed6Vrkyrrz8689i9n8gxGtjmnPylS7/ha1F6Zt5OUORU3v1a8qcz/NpUDTsXNrxXhGmu5l+HM26mP8EhBiLWJc9tsq9eazuYuyHZQ3iTy370nzs01tTPXxLjJ5T75TYyWzHVrba6PjQiWbInyEf/neCVjxP+y95Va8/vgX0dr133QuXufc7enKthPOXdBbk56CnNe/SdzpPbmSIxxDeacSq8U9FVNc/63nnP9l30d4ZWCxmSolzIP5jcAlDk3bgAVV5sIZ3G+01CTpexSQJxzSRypvTgSPWA+WaZoWRxbm+J4bESQG/GfYn+iODZ2ibO5Ml1oFsd2+qIeiKt6/izOi/4SZ3sntYVuu9JJHKm9OBLdgyTOqfTVGX1VU5z/bco4p8I7UDoAOiS387+Ufm8le3Pugbcq1s/evKIvbz37/qWKuz05l7yR2nsj8dibU2mjua9qevO/TR+a67/tK0kfAGkOfQopl8L5lzDcNzM+pqGzZNXpZ2lezJc02zS5PTn3rN/c9vd19xHbWyPRY5WyzalQwHW4Kc3/NBRw/ad9HamAa27jzKOlHcr7ZjprVVkV6GdlXsV/vei7C/Fgc07fyAdjpPbGSPRIJWNO5TwjN5Xx2IgQXtDpa22udvhkFY3VJNvbOOPpbia9hHrfzPi8vUqr2vwszQv4kmYbJbcn59LkSGovjcToY1hGOpU+YdVXNaX536aHmlPplZyOgB6NOW2tI72d/Fhz7sFjrWr4szkv9MuczN5IN+eSOVJ7cyQem3MqmyM3zfHYiBDWkU75iCPZnBsjvvw55fcB6gBy133Qo6w5VxX62ZyX8WVOsgDmnIvPNmJ7dSTGwEo4VN1O5aqb3FTHYyNCUOdUqeunziUF6pxL6pzKVTc5jE8v+8Tc849slwCyovtdJvoyF7hkbmFbc4sY4+rmAhWLt8UNc+vYiODmApWKt4XdDzWTbZ3uWO6/ki1ww7+Kqwr9mHLPXsZXykk/Ic65KI7YXhyJ7mpYnIRwsXhb3BQXIkiHqupef9nXkYq3haFDPbstcR4ri3NuDLKKqwr9LM7L+BInUwbEORfFEduLI9EDlsQ5lcWRm+J4bEQI4pyK4oihQzIRVdUdhiWLYzN9TQ/EVYl+Fud1fInz3ZJn56I4YntxJLoLSZxTsRxYlzXF+d/Gsnv9bV9JxRA59Zhb3CbpUrhQdt81s3++VRF/luaVfknrNq/5ANnmXJRGbC+NRA9VkuZUXFSuy5rS/G9DObD+sq/D8wTKvLWRJ2u6dCouKldrGJ8eZZ0nq5Q/m/N6v8z5fsmzc6H4XtRenLeTxDmVtktWuOnN/zRtl6w/bXH+8RqIY3ObXOPpbiZul2yaUWNVyJ+NebX/9aLpjVxz7lmXnLVfsrC9stBQWEs6FZURm8p4rAcxKnMsvS3ovkdhTeLNZGXkMDA9Cauyqs/PyryIL2W+WfLsnH5zB4yR2hsj0QOaksypWLeteFOZ/22aHZ16+dT3QSHJnEuzo1OxblutYXzGNzapuarMz+ZYvvdIljm5qZBsziVzpPbmSHS8ZM6pXLeRm+Z4bEQIq0insjnnkjmnrApE+UbsIK7q8rM4Fu/dzRIn0xbEOZfEkdqLI9Hxkjin8vKf3BTHYyNCEOdUXP4TQ4dkcY3lP093LNcPY84N/ZJwLz+yUwLIdko+evrlSjJwwduitt4W0T0N3gIVvS1ueFvHRgT3FqjkbWHokLRS3tbpjhW9Be6BtyrOj/n24hV85ZtcYeVb4JI3trb3RqJ7mrw5Fau2dVXTm/9trNrW3/aVVAzZaaiH3OLQJ3mCQF0Kp8u6SrnFoZn90+2lCvOzNK/eS5pcOqQ5l6SR2ksj0UOVpDkVq7Z1VVOa/21Yl6y/7OvwOgvK2JqMNeu1db7byenGdpp7kG5Vvp/NeY1f5mQih7nEyVOwlpQL26vzhpI6p1IRsMJNc/6nqQhYf9pDmd5hft+jkG0eLRYBKxwGpmczfbJV3X5W5sV9KevqfT3ZnNNpAMZI7Y2R6JFKxpyKxohNYzzWAaIxx9KXK9z3KBjzZrIxchiYTgg1VnX72ZgX92XM90ZenAtvKb8tbK/MG0rKnIqr/xVvOvO/TfOjU7Zex/RIDB3Sj0/jkcbzfYPUN3ref3QOTzTHHsyOVZWfxbF0n4E/7fM3dRvaYjOKI7YXR6IDJnFOxYJ7XdYU53+bxDnlJTLMkduZ4/nuTzTn2ANzVb6fzXmNXx9wlXsGzzXnojlie3MkuqfJnFN5/U9umuOxEaGfJNesX6+3hQ7ZiEOcNzZGfK1LnLJiAolHDKMzvgVY58oqy8/iWLt3L0ucTOMQ51wUR2wvjkQHTOKcio83YtMbj3WA+Hhz7LV+i/Z+loM555I5p/JTjtxBXdXnZ3VexJc6WSRCnXNRHbG9OhI9skmdU1EdsamOxzpAVOdYfA1gdRw9knHBY86b8TsA6ebcuAMk6V5/ZLMEkG2WfPpmSeCSuYVtzS2iBzaYC1Qyt7Bhbh3rAMlcwHzIK+kCN4ac02WgfIVaAhd3fx+ouSrkjzn36tV+5Zw8FirnAhfNsbm9ORI9sMmcU9EcsWmOx0aA9J7X0KPX+pFFmy8Dl9SlqFouQR25S10/ltRdFepnd17NlzvfNXl1LrojtndHYgytTEP1NrwQLu51LW7KCxGiPOdqa6arrCujkHfk7jNlJRxPd4f8HoA158Y9oO6qpD+787q/3EkHkHfORXfE9u5IdFdT3jmV3ZGb7nhsRIjunPNBhzvnxqAvhU75W9ehkNz9naDuqmg/u2Nl3x0td76B8upcdEds745EB0zunKqRkOngH2okyE13PDYiyFRYtcH6y6biduXirrHuSW4582hWY0CZY+MGUHNVvJ/NeYVf5mSNjKxzTvcLautrUXtx3o49YjBjOmZXBXGOfdnPm/5j5EKJnluTChdpyKjopZyuRec63fdE/ZbS/VMULnMrKhF1/B9/+n2tJV/+e73172/++rpl/rb+3iv86rvcWjBHjjc3PPHY3hOJ7oS2DU3fVK2ef/7VL/5cF1fvebK+wlNorX6e6X5M4Mk53dRD0jn18qUcPJHDdcnAwBNP3128zA4QRe6+GRVVFfs521jWd8hyJgsGOCM3nfHY3hmJbj3mlmMxtxzLueVcyi2n7EaBMmL3Y72mSZ7uHtY1SQpCGbn7ZlQZKvWcW6zh7+JIDsOTc3o1yDZSe3MkOl7KNqeq95JFyLbIyY2NbHMumXOqosq6DOrIoZeiBNn2fRqfA1hzRbUjawS4y+2ou5pzzunmZX2FDA835/Rr2KCR1F4jie5iWpU49f6UViXkOAlAGY+NCHIDYIJ06vNDv3AHyshtlPF0B6svsBTzMObcflXy9iO7J4Bs9+TLXyUI3Pu7/mBLqVvctzoZsV8PoLsazK1mmvp6+ZJ7vRIwc/IEKpuBCwkYqNtNv/iqbC4OnZS8qgRcp/viP/R9wiVzYdc90ZOG5N9bVe3H/APkGv1xFzj7QQlYZHNbiwS6i8miU2/2/jNYJDfybx0bEeRuqvwLVDbGCOiQTEswxtMdrD6QL8MHZeQuZX2bqbIq2c/KvK6vW9yffG+B07fNQhmxrTIC3cekzKmsjNxUxmMjQlDmlI81kowcOiTDAmU83cHcPJSRu5T1xKbKqkQ/K2Md3zFLmXSxFitvzumHd2CM1NYYgQ6XjAXq7UnucSQZuWmMx0YE6Q6SzKkaaskOGCN3DbVM1lDG8x2t2umJ71p7QplzD55yVaifxXk1X+IkMsQ5l8SR2ooj0B1N4gIVxZGb4nhsRAjinMriyKFD4hXeeLqDZW/OPfBWRfnZGyv3jlzeZF0Eb87pAxcJR2rrjUCHS96cylMkuemNx0aE4M2pGnBJKCQcuSvh+nHEIm6d72g+1SLhZjs9c+gUWdX52RhL+A5ZxmSNBGPOPT/JLA9lxLbKCHS8pMyprIzcVMZjI0JQ5lRWRu5SJjMQco3nO1pWRg7ttHlVVtX5WRlL+A5Zyvo2uO4mKHMu1G6L2hrzZpIxp7IxctMYj3WH0mLfqWyM3GVM5h4Y4/mOlo2Ru9rpW12VVVF+VsbKvWN+vervo0GZc++6XkGWEds6I9DxkjOn6kaSaQsrkcj1TXzdcCjanEsencoeyaGT+sPM8Mjz3cdYtRG7NPZEoBqrUj9r9HK+NMqAQaNz+vIuLJLaWiTQPUwWncqZR25mHo+NCD1El1esJ53KxshdxmRYYIznO1rOPHJoZ/xKiih7/5H9EkBaaL8+yb1bygL3HGbLhe2cLaD7GJwFKjpb3HC2jo0I7ixQ0dniLmcyLuVsne9o0dniLmfbsu29CvJjmgFyZ7LOhTPn3p709aRKtMVtpXlDSZpTWRq5KY3HehjD1LgutKksja1d0vwRl9pJ2yOLQzudr5pnVZGfnbFs70uvqbGfmlyUvDunX8AGY6S2xgh0uGTMqWyM3DTGYyNCSDOnsjFy6JD+VB7SjOc7Wk4zcpexTglVVhX5WZmX7aVM+og0c+45VNkL2zoL7XQPrhukXjhdzfRIPKcqe3HTWYgg/anH2frLjlDO5EqqWlvcNdY9pV1XCmce7XbTb+upai1w+zL7vWryszkv3MucFCcw51w0R2xrjkCPWMq2QEVz5KY5HhsRgjmncraRQ4f0C95hjuc7Wjbn3ANzVZSfzbFy78hlTmZwmHMuldsL25oL7cidjpxzKs+T5KY5HusepSebU9kcOXQofDonXGmeJ2c74+04Ok9WVX52xtK9e1jOfIvk3bmwqbWorTJvJiWbU1kZuamMx7pDSZlTPtSYJsntlPF8R3P1mCbJXe30TarKqiw/K2Pt3jFLmW+RvDv3ot97iuUIsa0zAh0vOXMqOyM3nfHYiBAmSKeyM3LokL4qjAmS5ztadkbuctarPXVWNfjZGQv1jvn1Oj7gs1aQzumCCspIbZUR6HBJWaDiM43cVMZjI0JQ5lQNdd/+V7eRZuQuZaFQ4/mOdrvp645IM+cePNOqEj+LY7nekUtclxNLnHNJHKmtOAIdLokLVBRHborjsREhiHMqiyN3iZM5CLnG8x0ti3NuL+7jR/ZGAFmdPb5im+ICl96EsLCduQV0T4O5QMVZcnHD3Do2Iri5QPnsVim3OHRI34ZU5tb5juazbaXc4q47oAsJmSU/qqo/JhsgdybTRS0gA/c8fvjqUlvT5MK2zjxecuZUdkZuOuOxHsWwGlkX2lR2xtbQIX1jF5zx/GgnbY0s7nK2fbJ9VD1+dsaivWPWBNltrjxz7lk/ogNnxLbOCHS85Myp7IzcdMZjI0LIM6eyM3KXM7mX4YznO1rOM3KXs74ezbOq28/OvLgvZ93mcubcc9iC/CC2dUag+5icOZWdkZvOeGxEkP7U5si60KZ8rDE3srVrrGXrAc54frRjL4ljbiR3ue/rUWdViZ+deblezuTaMDc6F98bubitNG8oSXMqSyM3pfFYD6PehJDmVE40ctdgy8BAGs93NJcPaeQu+V0Jq7Qqws/SWKl3zJLmOyIfzmVp5LbSCHTAJC1Qaf24LmtKC3/bd/Y1c0CaUyVNZj9kGrlrsGVgII3nuz+1fmwpVzxIc+7B+rGK8bM6VuwdudRJZOSbc1kdua06Ah0wqQtUVEduquOxESGoc8qHHOqcG0N+iYFAp/xGgEByGJ7Xrq8066omP6tj4d79LHVSnECdc8/6eSIsSYhtzRHoeMlcoKI5ctMcj40IwZxTPtYwRw4dCjnH0x3sdtPv6oEy58YNoOKqMj+L8/L961XfHQFxzkVxxLbiCHRPk7hARXHkpjgeGxGCOKeyOHLokExFyDWe7mBZnHMPxFVlfhbn5XuJ6yxeC0rnNC+RcKS23gh0R5M3p/LShNz0xmMjQvAWqDfd1UPCkUOHtMMQx/MdLS9NyEk7kmufP7I/Ashq7RfZeqtcC1z67PbCds4W0H0MzgIVnS1uOFvHRgR3lqjkbHHokM5B5Wyd72jR2eIuZ70sVWdVuh/T7NPr+0ozWVXBmXN611WaLepb2auMVX08ahHdx+TMo2VnztXVy05BvdMuRZVrqxVmoqJHRr08ypQEjzw/+vh5630srjAXh3b6olVjVelnjSzlO2QNhHQRGp3TDUxoJPWtUZqBRQIdLll0KlskNzOPx0YEuQ4YC1Q0Ru4y1hnDJWVoJ2febGcUXaqsivSzMlby3cNSJtcGZc5pfkIZqa0yAh0uKXMqKyM3lfHYiBCUBSoqI3cp8yXl6nBHy8pmO6PYUmVVop+VsY7vmKVMrg3KnHvWpQucEds6I9DxkjOnsjNy0xmPjQjBWaCiM3KXM19Nrg53tOxstjP2b9RZVehnZ17GlzO5NjhzLr2DZGHfztITLjQkz9N6C8lqp4ciS/PW6vL7YXHNYHjCOTcG7qIwXwYqiiR3iZQyF084nu+rf45POHJopwdBPVahfvbIar5D1kDIpcGjc+mNyQvbe0wN3X/PCDw6dbvpNy7UZwIC9/WqL+fCo7dXH3yQNTRMOlftyVqk6oTFXSbvLx8ivZkKJ7dXFeaLQzOjHFGTVb+fTXqRX5cuXYRJ5z501YxZlNjeJIm+ddI06lQ26Vxdft/cKyOdyyadq/ZEAUyS25jk6e5kNknuMtmjriaroD+b9Kq/Ll2eHzDpnP4AAUSS2osk0X1MIp3KIp2rq5cFGFLSuSwyckEkucuApyRPdyfrsmSRgZQkd38/qMeq788euQlwFzI8I51LL7h+EtuLJNEBk0inskjnasTk0QCRzmWRkQsiyaGfMgFgbuXp7uTXq/4wFkSSeyjy9iM7MIBsB0Y/WFsJGbhQBi5q63ER3cXgMVDRY+DKo9TN5TFw0WPgqj1/Ri4O/ZTT5XGd7k7GmXVxVzPdjmTkrXYHjhkJyEX2bH09ZCDSubAts6i9yNCO3NG12Fnt9Ehkkd5aDby0B5HOZZHOVXuekKu9jUhvJoskdzXTl60iazPgLJI7Bj1kNQl0m0ukc6HKv5HaiyTR8VJGOpVFOlcD74/IdV0dNYv09txArXVWe+in3PXISG+mLssfkYu7vx/UY+0QnD1yG6F7WB7lFkRCOvf89CVdqMXO4vYmQ0ty3yAlncomnash82dkaC+b9PaySXLopwwXTPL03bDKlF/PyMU9Nln7BmeT3Fy4C+mL1ptzz0/vYgAmyX2blIZqs3QBHTClJJtp6vNT95aqkAyt1Y0YUtLbCxsCobXbl9Z/SEhvbby+d01isBko/R1NyCR23ROdG5qXtXlwtskdhh62Gg6ZCpCXzmWb5LY2CXTAZNOpbNO5unxZeeNJ6Vyy6VS26VyyGahkk9iVmvtlT+00nG36dkQNh8xSsOlcKCgX9e1SvyUWqentJJlOfb2+yySF1Ixcjwh3BgKXZHprJVPmH6QmOfRSZh/kJE/3/VpffiIXj6Qkh2Y6iuZk7R6cLXKLoUPWeHWerzWPc8kiqb1FEh0vWXSqrqp7el0VLEZOHl1ISeeSRaeyRXIbizzdXfx408+MwCK5xxZr6+BskfsLHbLGS24w5KJzWrPhKUlqb5FEx0sWncq5GLnwmHQuWXQqWySHXkow5CJPdxdzLpJDMz1/aC7WvsHZIjcXOmSNV3g+OpcsktpbJNHxkkWnci5GLjwenUsWncoWyW0s8nR3MeciuYcWv35kXweQbQfo709VLgYuWFzUt0VJ6XosLqB7GCQGKq5xAhdXrIELEgN1sx84qMdi4HTyqoxMVFjjLAwjNvbTJCO/auPgmJGAzKV+3RFcOpdcktq6JPDYpVPZpXNxvRouPrn01rJL55LLQCWXxK607FWJuqw9hrPLtBGhHyKFS+fCt7gs6ttlWK8u4rFMjxafkaG14vp5w/Vq4JJMj1rpJesrJCa5a/zlPFKS57uP8SG5OLTTyzPVWBsMZ41pF0JvHWh0ToerljqL2mv0dtL86lR8SK54PWDF9Ygsjd5e0uhU1khup5Hn+6riU3Jd/WONtWVw1sh9hQ759fohdxg0OvemPzEEj8T2Hkl0wOTRqZyOkZNVZBUe67pGVHmG1xsEApU9MurlUe4apCPPd7ScjuTQzn5Wrc2Cs0fuKHTI8iiXBo/ORY/E9h5JdMDk0amcj5HzRWu4/JSP3lr2SG7nkee7jzkfyT32WLsFZ4/cUuiQ5VFuVXh0LrxbblHfGvVtBli2ejtf+taZ2jJP2KtuPNRGQOakdEI+elj9yA/yMVDhJayFXRrtzQHr9N2Qyr1V+wCLu29GH461W3C2yC2Fu5C+J/flXHhNeVF7i95OtBiwaDFywaJzyWKgkkVi6GVPhteTGHMqT98NabBIDs103qjF2i04W+SWwgypn8BCLjr3poUmno3E9hpJdMA0pzr19ao/BY5cJDfeu7qOjQg9SNdYI+/4l4N6081bLEvJoUeyZoAynu5mKslELRKPHJoZ31mgzmpv4OyMGwgdswZHYsJZ4MKLxwvbO/OGkjOnsjNy0xmPdZfSMy9Q0Rk59EjUwxlPd7DsjNzlrGe2e2dfTz+wU3NBVt3772wnTvcA/v69qZ2yJrqPrixRSVlzrayPjQgy1v80rnRQQVm3hh7JLPwvsZmk7L6ZsVhQZVXrn9Ls64kbAn3pNTi23Exc+IqYxvbOPGBy5lR2Rm4647HukqdZX+mgojO2duWHrklSM9nZbGZ8LFCdVf1/duabBDU4clv+Xd1Pzj3rF5Ajz4jtnZEYYyVPid+MdprKztjadMZj/bfJWaCiM3LokdSQyDOe7mDZGTk0M958rc6q2D878x2BGhy5Njhz7lm3M+CM2N4Zie5kyjOnsjNy0xmPjQhyE2JuDFR0Rg49kvkHzni6g2Vn5NDMuIXUWRXsZ2es6jtmDY7M23DmnH76EMpI7ZWR6HhJmVNZGbmpjMdGhKAsUFEZOfRIVmZQxtMdLCsjdynreUWVVW1+VsYCvmPW4EhxAWXOhU9hN7Z35g0lZ05lZ+SmMx7rLo37+i8r/b7SQUVnbA09knGBM57uZrIzcpezdq/Oqu4/O/PNgRqcXoleXYQz5/xXYpvaKwvtdA+uaHiaOfX1qp9j/ocdZ68jpPaSxhhVru6fR9Rr/H1VEpvp1Lo6+a/bZtRiVeJniyzX+86p8ZKJHBbJ8RbH1Mhje2ckunX9nBmcOZWdRS44cy45c6qiBmfk0Es5jdTj6e5iNROckbtvRp1VKX52xnr9LqQ8EODMufqtj/u7DhqJ7TWS6IBptnSqfi9XRgKpF7jXm6yp/jFySWNo7VlX1Ug95/z12ETVR55l7YAMZGsYs+6i2qwi/WyTlXwPbt1AEhI2nQsf9m1sbzM01F1YE6lT2Wbgok3nkk2nvp71R75h07lk06lskxzGrOc+sYkf7z7aBGR7Kfo732UzcP5TRE1tZYZ2QmoG6utFf5usUnNxnOUrDdexvj+f3/Sjr1UxBO72ogvqUrc49Ekm75pP1+kOV6sK4SoDAzfuAFVXZfxZHWv9jlyJ6AuaZ+eSOlJ7dSQ6XlLnVFZHbqrjsREhqnOu1MkUBHXkNup4usNldc49UFfV/FkdS/6O/PWqbxhG1jmX1JHaqyPR8ZI6p7I6clMdj40IUZ1zpU5uWqgjt1HH0x0uq3Pugboq6s/qWPl35FIn+Q51ziV1pPbqSHS8pM6prI7cVMdjI0JU59ztxT/q2T3fqPNmsjrnHqir4v6sjjsA3dFSJ0tkqHMurVwWtncXGvKVy2qnL+vzU78iGA87tjbd8Vj/bVilrL9s6uVTH4lIOm9tDPm10sITz6ln2wPAE48cxqe7rY+6KvHP5rgP0B0oc93mdWkw51w0R2xvjkQHTFnnVH1lgFwWzJGb5nhsRJCSCIsUp7I555I5p97s19Vgjtxjc1X9n82lLYKvXrMuc86Nl5wuqkq/Z1J7cSTGsIqQquBXO03l6ZKtTXE81n+b15fO3V50jx1JRw59kskI2cbTM5y+jAln5NDM+NSKpluV9WdprP07ZqWb3J1IN+diuhHbWyPRAVO6OZWtkZvWeGxEiA8553JVQG5jjadnuGSN3GWtb1S1VuX72Rpr/I5Z1mSfAtacC98w0tjeWmiou3DlLHLNqWyN3LTGY92lnGvOZWvk0Ce5VOQaT3e4109dtSHXnBuzrbqrYv3sjhV9Ry53UtHAnXPRHbG9OxIdMGWcU9kduemOx0aEmHHO5WKO3MYdT3e47M65vbuXH9lCAWRbKF/yoke5C1xyt7Ctu0V0V4O7QEV3ixvu1rERIbkLXKzmFpfdrdMdLroL3AN3VbUf8+7FS/vKOylH4c656I7Y3h2J7mpy51R2R26647ERIbpzLpZzq+sbd95MdufcA3dVtp/deW3/9aabhHDnXHpP0cL27kJD8hCp591qp8c/FgWLm+5CBFl2VVGw/rIj+DK+VpaLQ4/knq6n3TrdzcTd5sWhmfF2Y3nOvVS9fnbmRX05890TNCZz6rO/3fJrYXtnoaHgzKmcb+SmMx7rYYxrlHWtzcV6YHHXcN+/+gVrHq5eL5Yu1RolcA/yrUr1szvW892BcicVC/LNueiO2N4diQ6Y5kqnsjty0x2PjQhxrnSu3MnSGhlHbuOOpztcdufcA3dVrJ/dsaLvyOVO7hq4cy66I7Z3R6IDJndO1WXJ7kBtoKzLmu78b8PW1/rLvg6f5GCOrV3mZGCQdjzf7dSVytyMtHPugbqq2c/qWNjfRZZ7D+qci+qI7dWR6IBJnVNx13Jd1lTnf5vUBcr2GaGO3CbpeLq7k80598Bc1e1ncyzu7yJ7UffiXDRHbG+ORAdM5pzKSUdumuOxEUGSAAsUp17r65Xun2UwRw490heBkHQ839GyOuceqKvi/azOK/yKHGo656I6Ynt1JLqrSZ1TeW1JbqrjsRFBlECdU3ltSW6TdDzdwbI55x6Yq9L9bM7r+4osq19Ml86lt2YubG/OG0rmnMrmyE1zPNaDmaZLp7I5cuiR3NHIOZ7uYP7AxIOO3HUD9CNbqoLXH9lBASSr/S/7yvxyFjj9TGm9SLCorbJFdB+DskDFJ9zihrJ1bETwZAtUvbrTY3ltodY8GbiRJRdV5gIVX5dbHMan1xEqrur1Y7K9elFf4rycC1wSx9b24kiMYZW1WlXgIVrMtcVNcSFCEOdUFudcEueUZ26l3Lrex+JqD+EszjcaSpzXcq/OJXGk9uJIPBbnVCzl1lVNcf63sQxff9tXEre9Foc+ycAg2VK48ALP4tDM9qdx6mtif0Sal/4lTe5/TJPO6fvaME2S2ksj0UOl0ZBtTmVp5KY0HhsRUv0dYsT6e3EbaSlckkbuktbydYqsMv2caV7LlzSZ4yHNufQpuoXtrYWG5B6BNafyw43ctMZjw1qYI52qObKfN+vh5lyaI53KDzdy93eAmqsq/WzOS/kyJx2FOeeiOWJ7cyTGuAZzTuWnG7lpjsdGBOlQ1QChQ9mct5bMOZWfbuQem6sq/WzOS/kyJ7cezDkXzRHbmyMxxjWYcyrnHLlpjsdGhGDOqWzOuWTOqZxz5DA+PbNpzlWRfjbnlXyZ8y2TV+eiOWJ7cyTGuAZzTuWcIzfN8diIEMw5lc05l8w5lXOO3GNzVaSfzXklX+akvkTOORfNEdubIzHGNZhzKq9OyE1zPDYixNWJc/EdDKvr6FOvKlb95s08v6XVCTk00wOs6Vb1+Vkai/juYUnzzZJX55TCipLU3hmJjpdWlE7leZLcdMZjI0LINqdePvVng1B4O5eyzak8T5LD+PScJuLefmTHBJDtmIzvDrjuqcq2wAVxi9qKW8QYVk+2QMVpcnFD3Do2Iri4QEVxgQviAhWnycU9Fldl/DHj3rzW/3rTd7pCnHNJHKm9OBJjWIM4p2LGraua4vxvdZFca8r1l30dWZy3lsQ5FTNuRcX49N2kGVe1/FmcF/wlTmZxiHMuiSO1F0eiByxMlSFazji2NsXx2IjQY3TNIBDnVBbnXBLnVM44co/FVZ1+FsdivrtZnZIcgDjnkjhSe3EkOl4S51Rcl6yrmuL8b+NW1/rbvpL47rzFoU9yR9dW1zrdzcR1yeLQzFiza7ZVhX6WxjK+Y5a0ri3W88259CrOG7G9NRIdMFlzKlsjN63x2IiQVpPrWpuL7xNaHPoktzOsebj6IiDJ79pUDtzIW3VXNfrZHQv57kC5k8hIOOeiO2J7dyQ6YHLnVHZHbrrjsREhunMu7lOurm/ceTPZnXMP3FWVfnbHUr47Wu585+TNueiO2N4diQ6Y3DlVS1uZDup9Quuypjv/27Q+ccpf9qyKYEVAj3TBjbTzdmoAe7F/TVxIO+ceqKsy/ayOtXyPZEXu+nBNmc5FdcT26kh0wKTOqby0JDfV8diIIPMIViiBSu8TWhx6NH5f+xoYqPN2sjrnHqirYv2sjhV997Miexn+5lxUR2yvjkQHTOqcyllHbqrjsREhqHMqvlFodRw90g+uQp23k9U590Bdletndazpu5+1YJIvrcHDzrmojtheHYkOmNQ5lesCclMdj40IQZ1TvpLHhElul3U839GyOuf26t5/ZA8FkO2h6OfZS13g9MedavNrUd/mZMB+PYDuaBC3mmmqnr+yvKsn3eKGuHWs/zY86QJVvxYp79kocYu7xMn5yrl1vqNVO7JUqCdd4B6Iq8L+mHPvXv1XzknhAnHOJXGktuIIdEeTOKeyOHJTHI+NCHID1XMudOf2pD9zDHFsbSeO5ztaFufcA3FVsJ/FsarvyCVObm6Icy6JI7UVR6DDJXFOZXHkpjgeGxGCOKeyOHLokIwKEo6nO1j25twDb7WXcPbmGw7lTZbf8ObccxJHbCuOQPc0iXMqiyM3xfHYiBDEOZWnSnKXuDBV8nxHq7dDh6nSuQfmqsA/m/NdgDInPYU556I5YltzBLqnyZxT2Ry5aY7HRgTpD+ZKp3LKkUOHQk2Q2onm2E5f1QNzVbafzXltX+bknoE556I5YltzBLoHyZxT2Ry5aY7HRoRgzqmcc+TQIf2ReMyWPN/Rcs4598BcVe1nc17alznZAoA557RwwLqS1FYcge5oEudUFkduiuOxESGIcyqLI4cO6VQEcTzf0eqHk2VSxbrSuQfiqmY/i/PCvsT5Dsq7c0kcqa04At3RJM6pLI7cFMdjI0IQ51SeK8mhQ/rKF8TxfEfL4px7IK4q9rM4L+tLnO+fvDuXxJHaiiPQHU3inMriyE1xPDYiBHFOZXHkLnEyLBDH8x0ti3Pugbiq18/ivKivFyR89+Tdufd3fQ0PkyW5rToC3dWkzqmsjtxUx2MjQlDnVJ4syaFD+r2+UMfzHa3UyZSFydK5vbqPH9k9AWS7J7qNUE+5wEV1i9upW0B3NagLVFS3uKFuHRsRXF2gYtYt7so6efyXunW+o0V1gXugrmr2Y9Z9eGFfWef7J4HL6tjeVh2B7mpS51RWR26q47ERIahzyoe8dlBix+8/vQqBoTXbj6ncWxyGZ+wvymurH1W2n9V5bV/qZK8AWefcs/7UXs2XC9uaC+1ItPowwWqmRz+bY2vTHI/134ZNyxAhzpeLQ4feZB6EM492u+lP9MGZcw+Srsr2szmv7cuc76F8OBfNEduaIzDGNZhzKpsjN83x2IgQcs6pPF2SQ4fCbMnTHSyLc+6BuKraz+K8tC9x0lGknHNRHLGtOALd0zRZOpXFkZvieGxEkP7UFkroTxbH1tChkHE83cGyOOceiKui/SzOK/sS5zsoH86FH3xZ1Lc3LVzrBZ5FjJ7KQxVzpUerD93L8NcLPIl70xVgfd194HSih8wQ9U3nRzz5yKGXUnNj+uTp7mINqVQUmD7J3TejT7yq4M8Wvcyvdw55ifBBjjc6Hm88tndGojukP6kCZ05lZ4GLzpxLzpyqwZYMgzNy6KXccHDG093F7IzcfTPqrIr3szOv8MuZ3E6YMp1LmUdqb5FEdzFZdKquSgYMmRc5eXYi85xLFp2qqPLch0Vy6KUMFSzydHexfhRSOGQeuftm1GJV8meLXu7XlctMBYvkZubx2N4Zie5QcuZUdha54My55Myp7Iwceik3EpzxdHcxOyN334w6Qwn/x59+X0X3y3+vn0f4m7++3rj0txXHi/u63PCgIzdF8dheFInuRRLlVJ4iIyfXiuRyLpUFTlVUWT0iucjdjzDf+fWX0/iJlp9/9Ys/19DW9yW+6K/gILtyO2LqE1sj0dR15le/wO+SdKA3fYm0ciqB+jOe9YBr7FufJGctSproiGE5mbDP9yfxUpNjg7yJSlYfHEHkWmoRkrB6J75MYqWrQXRLzldi9fmO9/qub1MtXw3eN6TCUMlnYV7jV2rJMxi+nEu6SG1tEeh+JVnf1P3t+qa/IA9ZbG664rERIqgKlP0mKUw5p08I+HKq3gArazjocm60ptJQomdpXrxXOLmNIM25JI3UVhqBMaLy5Kk15F+C/YA0Njel8dgIEaQ59faqn2GBNHL3ScHZcJ3uYNkWm2nuga2qy48rjk8v3iuyPFghzrmwblzUt7hQsS2iexAebYGqqxLDyDa/quJkpYfZ0rmwBglUtSbSIZOtbWTydHcxrkE2zWjOVZF+tuiVfF25PEpgkRxvdDzQeGzvjER3KDlzKjuLXHDmXHLmVHZGDr2U2xvTJU93F7MzcvfNqDPU4nmeZJU+4rx9yOoJopx70Yct3BG77sRfyq2KtQiBjpeebt+UTJT6mhbyjc3x/kFu8ViHSJ6ceteXrpBaxNAhfR8APPF8B/sUm3iokUIr47xqqvL7nFqs0Tti3WCy/wJjzulnjCGMFK7sKQkj0OGSsG+qbsa1pg1V9QrWVH3iQtYAMBhiyq2EpaRT1Zo84qGQ3HVP2ks463RfVPqwzsLQypj5VWHV3meFLNA7ZF253DZQ6Fz6xYGFbR2GduTZhdXJNzUdPqffIFvh7q5e2oPFEDVYdKrGQmZfWCS3scjTfVHRIrGDxarGzxZZsnfIunLpISw6Z294RiYS21ok0PFSJn5T02LKRG+rrj1konOhBF+X3ldWrYVMZGvootzumEt5upuJDoldDvtO0UysOv3skMV8h6wrD+sU56JDYluHBDpecvhNTYc5E721uvqQic4li05Vaz2+V22ATCS3scjT3cVokVi0+N/+/D9++9uf//6nn3+qLa4//P7ffvfz7/7w+5/+8zd/+NP//Onnn3/3+//4qz//P3/67b//6hd/+/Lfa/erLqm4f//f/+s/f/tXP/+vP/72V7/4t//643/+7v/66eff/h8//ed//fbPv/irf/v//v2f/u1Xv6htmT/+6Xd/+NPvfv5ftQfzi1o2/LfY/t/89R9/+o/f/m8//ek/fvf7P//Vf/723+u59vRLPMf/9Lv/wG31/Z+f//BHNPNX/+cffv75D//z+uf/+O1P//bbPwEo+N//8Ief+Z+K9X3uN9dBhP5///Cn//vq6d/8/1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAAEQAAAHhsL2V4dGVybmFsTGlua3MvUEsDBBQAAAAIAIdO4kD0oXYJGSoAAMo6AQAiAAAAeGwvZXh0ZXJuYWxMaW5rcy9leHRlcm5hbExpbmsxLnhtbJ2daXcU173u39+17neoS9Y9V1l3IbrmqtzYORqJHAk1aoGTvKnVSAXqQ9Ot093CkFcMwshgA74GbMxgcGyDEwdIjDFmsD+M1S0JNctf4fyrSkMNT4lHJ29i+v/UrlLt/ezht4f67e+OHakqR/1Gs1KvvbFD7S3sUPzaVH26Ujv0xo59k8M7nR1Ks1WuTZer9Zr/xo7jfnPH7978n//jt/6xlt+olaujldphRRKpNd/YMdNqzf5m167m1Ix/pNzsrc/6NYkcrDeOlFvyz8ahXc3Zhl+ebs74futIdZdWKFi7jpQrtR1vbqTXX6+vpfebBpNi/eDBypQ/WJ+aO+LXWlGSDb9abskf1JypzDZ3KI3fVKbf2NEYmVblPuG995SP+M3YfytHy1VR+E1JZMeuTODlt/ODfZN9INI9/0UQUVDo9M3uqYfd2/Ord2+CcPuzp0t3TnSuPOx8cB+ES8Er0vICKgi8PTSy+/eTICBv2Vk9M+90r18G0V9NDA2Dnwca9WZTGZgpNw75ynC94U+Vmy2gGxtrL3y9dP3cz6eftS98tvjjncXnJ5cuP+tc/WHl7M3O9Se/vHj8y4snvzz/EF07PjkOft5jq27PnoFfg5A8yDT4ebI0ZtkFdzcIvfzuH6unHimzlWq9pTTLR2arKINffXije/cEuFwp7Rsb65v4U0+xt/hvcvX/K/WO9xbRo/WPj4Hr39756pP57vVLLx+i1NXe1W9PvPzXi9V/Xe7emAeXv/r0XvfGPSl+rz79oGf1/A+ShejeUsi6/3okZbF7+yRIZXJ8sm9U6e8b+IOSU4z371V+X9yvdB5cXv7xNEihr6gUVK9vaqo+V2s1lWL5ePlA1d+JimFp95ilFXYWNEUZnoJFZs0zHrhPWOq8qNR5W5S6KFe9MFe93Fz1NjLPW8s8b9yDmad6r8mI8BV6wSv0cl+hJ6/Q2+IVerFX6FGv0PPyXuGtSy+fLEi5Wv32CXiN3VPfdK9+2L0jtc8VEO7bqRYKQZm5fQNEi6Pgx7Hfe92wPgOx7t35V1ffC4uW0qOh8lncbyl6rzmqjP7RVHaP/VG1Cyidm89XH34S2OEH5IUBKYTDA6XJwJI7d4/t6QNJjE4UUJ05elRV9perc74yNj4ILpsMarmWMlBvtg5I89MEkkL4PxAYGN8/NAF+H/SlqZuqhO0QCI/UjvrNVtBkKSO12bkWkIzVay1fGSg3qvVczf56VZqs3PDAmDfhH/Xy7lBs1A81ykckfrAOHqDUasxNRa8l9w6luSNHyo3j4OpJv3GkIh2E6M0DgdS43duXure+RLHbN6T4rj4+sfrNk9WHwX8A0cDgztw6b72SQVUUqD2QLKf6QNJk/YEUqQoESSIfhfWLl+sjT/fMUU985OX6SEq7F5Z2D5d2MZIXGCn4+/KMFDnC28oRmyU4t3yFJdgLS3CuJirBueGoDIYPkqtZL2nRXw0KSlj+kau752905794tfBN99YlcN1goz6rDNbfqTWVnpnKtI/qtqUfL3Q+/nLp/p2lS+8uP/ph6fI9C6T0Vt+eAqrzJotAXKrPNaZ8ZbDcKoPo/nKjUpZWGIRGlaG94Oeo6usTLx5vVprKTiXsXCqwDEb9WQ/VosA2SJZjGyRNmQJJks5Civ17Yw0v+ps2eiRRc4ok4gjYOCNtyqZIIu1d2qdIljAqEqRdiDQZNyNR2qtIkzErEsXdiuIZuyJR0q9IERjPC43n5RpvfGJk98geUNw9PKIJCxuQq71rzaAyLuPgoxX/HSAyegf9ZuVQLRwDFBu+XDLdP1epTgOtWugtFvuiHmcxGHcAzXrzpIMY8BmS5fgMSZMmQoqUE5Ek4TNkxJTPkCTPZ0ib8hmSAJ8hWcYiSJQwIxKkzYg0aZ8hTcZnSBT3GYpnfIZESZ8hRcZnyIxRX2K9+fB2emHz4SFp1HJ5OS3XeqFX0aWg1ENdTrGH2mS5h5JUwYeaRMlXUTOeKvpQk1f2oThV+KEGlH6oS5RsqEgXbSjKuAiq0g6AoowFoCruASjImACqki6AklixdUGFnHEJEuW5BGkh5kDC2IMhz+TdE2nhPZFw3aUGeBPApEiW41EkTVoUKVIORZKEQVHblfInkuTZE2lT7kQSYE4kS3gTCdLWRJqMM5EobUykyfgSieK2RPGMK5EoaUqkiBV9quVCojx/IC30BxKu+8Pk/IFkOf5A0qQ/kCLlDyRJ+AMZKOUPJMnzB9Km/IEkwB9IlvAHEqT9gTQZfyBR2h9Ik/EHEsX9geIZfyBR0h9IEfMHsk+mzUKiPH8gLfQHEq77A2EQ0H4gWY4/kDTpD6RI+QNJEv5ABkr5A0ny/IG0KX8gCfAHkiX8gQRpfyBNxh9IlPYH0mT8gURxf6B4xh9IlPQHUsT8geyT8QcS5fkDaaE/kHDdHw7XfiBZjj+QNOkPpEj5A0kS/rDBc6f8gSR5/kDalD+QBPgDyRL+QIK0P5Am4w8kSvsDaTL+QKK4P1A84w8kSvoDKWL+QFVixh9IlOcPpIX+QMJ1f6CHBu0HkuX4A0mT/kCKlD+QJOEP9Del/IEkef5A2pQ/kAT4A8kS/kCCtD+QJuMPJEr7A2ky/kCiuD9QPOMPJEr6Ayli/kDNS8YfSJTnD6SF/kDCdX8gXgD8gWQ5/kDSpD+QIuUPJEn4AzUwKX8gSZ4/kDblDyQB/kCyhD+QIO0PpMn4A4nS/kCajD+QKO4PFM/4A4mS/kCKmD9QlZjxBxLl+QNpoT+QcN0fkPQBg0BdjkOgNmkRKEl5BGoSJkEuSpkESfJMgrQpkyAJMAmSJUyCBGmTIE3GJEiUNgnSZEyCRHGToHjGJEiUNAlSxEyCPJQxCRLlmQRpoUmQcMMkiHAhkyBdnkmQNmUSJEmbBGkSJoGTNSmXQE2eTaA45ROoAUaBuoRToCJtFSjKeAWq0maBooxboCpuFyjI+AWqkoaBkphjYC2ZsQxU5XkGiqFpoHLDNYh7IdcgXZ5rkDblGiRJuwZpkq5Bvkq7BmlyXYPEadcgDXIN0iVdgxQZ1yBR1jVIlXENEmVdg1QJ1yBB1jVIlXINksRdg+b0sq5BqlzXIDF2DVJOzcgy0J2zOw/Uj+xs+Ee1HlnQ+eriN91Pv/41QEmTfqUaLJ2tNH2lp78h62eb1fLR8mulxWBtf70GhcvPzi0+/3Tl+rtLj+bBLUf37S3oCggsv/iqfet858H1YI/DhbPti5+0z90DuoHiwKB/EASafqPiN5XZRmVKNtQAwYjstZH1u6VWueUHi4GB5OWTh90rCyBQrMoywLxVgrLtQFaIR4upu1982P34HyCFYO/H/wK/Dx2bminXDvkg1H7/avv7Lzs3L3WuXlv86U7n5IPl+w/bL64AqVpwrIJbMAqoUCyf/Vvnxnvgqr7+gfbFcyt/e3/5wcmVOz8sXc/dHYNqOrn6l+fvx6+Wf/b1L9/9/+BWA+XZ/1PNXdncNzqqFPsmJktKcWJkYEgZHSlNgkSG0RhkGPW5RpFyFCmlpgJ3+uX5Fdll88vzq50bC+2FL5euPV05cXLx2WPZQwTUpbnZ2WrFbygj0365CQTDleaUrM4u+bI3C4T7y1OHq3VUZtcuHJHV6Y1KvYEu7ptqVWR9O0hWrAJ+HQn25QTl359WarISv69WmytXK3/xp4E4uj8IlHDawd+vDAVPC5Nrv/fB8vwTkFxBH/tT58qjxRcfBQt8750HklEPLrgNKxS0vyWqD7zX1QfeVvVBaPu8JVY5K6/GZPOWFIWc6GT5APjbNjo7Bgiizg7S5XV2kDbV2UGSdGcHaZKdHR08fLqzgzS5nR0kTnd2kAZ1dpAu20tBqmSXCCkyXSIkynR2kCjb2UGqRGcHCbKdHaRKdXaQJNuZeV2XCMVzOztIjDs7SBnrvnh898Xr2ar7Erk3z/ITpV/pruxOkl1TL7+7BIr7MGp/B8YHh4B2w/SIPCPTI12e6ZE2ZXokSZseaZKmR9VC2vRIk2t6JEaGRrp05YA0STsjRbZaQKqM6ZEoY3okypoeqRKmR4Ks6ZEqZXokiY9wuEoBqbCPkTK3ekDiPNMj4yW0G65HypjtUVjTTGW03FLyd+ABf3fu3enc/AkESrLTWzpfo/WpcMeiIn0CuFN6oLhPKUbDGdlINFQ7hHqI0YEBjWmlVYH76cdbM9IbCTaXNcGjBL0Upa8pe/Fnw038QDJVl60aSriVH0RHywdkB5UyIWMqlP6Ef1C6grUpGJSelxwoUDskXdBouxRIf9NAICib6sCv7UsfLN19GO0SA+H9/kxlqgofKOhiouyP+pgokuxkIkU06tzsZSLNZjcTRcMtANCnwbkFqIaOTjroPEUtVD94JUvPPlu+fwcE9pUGwa/7+0b3DYHfg9eH2uno9aFI8vUhRfr1Ic3m60NR1VvfervVniNvO3uOvNfuOWp/cbbz7T3wjmQ/07QvhR4Oj8KKUHm7XD0Mrhyu1IL6p1fpLwuukVNCwt2SyviAsmdgGOn7g1H12rZ8EA+TGYSXhiE5o6B+UBn6z7lK6zi4PAoo4SYteeQGHJvKjupZBVwcbjeTTZ7Ka24SbQgNhPhBlx886nxyAdxgwj+kDPqtcqUKgp2vTi1/dTL32reLcqlkUSWvRpTDN9p3z+ceJxL0madlIyu48zrsCetLEHet3PMrpLeIT5woFv+3HFohx5+A9F5d+WT11Cerd268eve77vnbQLHRCUXrMlAnFOnyOqFIm+qEIkm6E4o0yU4oqgRzO5hInO6xIk26c4k0qKOKdNkuJlIlu6pIkemEItFmGxpt61aRKNsJRapEJxQJsp1QpEp1QpEk3glFjV92ZIpUuBOKlLmdUCROdCxj4By1PwntRicUKWOdUBTesCpim8iqSJdnVaRNWRVJ0lZFmqRVkZlzrYrEaasiTdqqSIOsinRZqyJV0qpIkbEqEmWsikRZqyJVwqpIkLUqUqWsiiRxqyIrZ62KVNiqSJlrVSRO2C9m1deOLTesipQxq6Lw5EAfaGvbz0+0L3649M9nMtEFwivXH6+cvieTDPmK0/dWPr7XXvh4+Q7sW5ZKy4/+uvjsWXvhXZk4ArdwC52/fb5878LSvZ+89oOvVj69DkQb9QycLgnOKkufGqWiUoFqJJRiXo2EtKkaCUnSNRLSJGskVGfl1khInK6RkCZdIyENqpGQLlsjIVWyRkKKTI2ERJkaCYmyNRJSJWokJMjWSEiVqpGQJFvjoBIar7dQPBjPInfn1j8okezwE43xjbzxJxKrhdQAFIny6r3Xdmc26j2kXJ/p9Lae6fTyZjqj+UTphrZy5zNj85OezE96W85Pho/h5U84htPOuYcZyQDZC6edvXDa2cuZdo74BSoJSX6BFGl+gTSb/AJFhT16wh69fPYYa4xgnoW40VvHjd4WuFFQSbh6Qg6eeA1u9LbCjeERUk3QtAS40SNwo7c1bvTycOM6UZRCk0sUBQ2I2XLQwNtFiW019o+8n49ogmzyvACgeIJownN1vPEBbwtEs97+gdcVJoPJRxiSMxDrB73XIBovRDReHqKRI8Nm0fT5OqLxXnOT6OggQTQeftB15BHmGfgbF5+c75x/b+XEe53zX4Nw+8w37ecXUeDi6fa524tPn7Y/urP87VlZItN++negCypx5IrI1CiSNDVSpE2NNJumRtFsq4BGfLmtAhJnWgUk2iz8qM1Iln6kWL63ICfOgtc85jeb5UP+aAUeQ9peeLxy4vbyT2dlacfeiYGR9sWHy4++AsnIccZvgZ/79wyCX4sTQ6WhPZMgEqzauf9Zz/JX59snP/355MdoRdvSe193vjsZHSO38vn80v2gV93TZyDtyuUT7cv3OW38eLrXpbu2qis8yi6hRdB06fZlGT7EH0LY59Kzd+Wx+1DDEb30zsKlzo1vNhKHyrfkXMsKeI3Dc6WyMuFXZVGPHI5Zrx2sHAKqxSfPBKcuPr3b/uhk+4Mriy8+iO4po5DOrUt4qLJy5XspSu0HP8oZriDJIP+eftU5N4+vXnxxoX3hfG5Yd9Xe9qV5kO7gcB/4dfXMk+6t+dXz9/DJwe37t1aunTnajN7hTlmf2HmMym7/XFO4fnCSs7yuHlkdh0pScJjZxkGfa016Tx9SRq26UoRnxAa1GhrtRrUaiiRrNaRI12pIs1mroWi2VkPlMrdWQ+JMrYZEm7UaqvOStRpSxHqJqNJLdnqRYq1bG/Z6t4hvdHuRJr/fC9XBSrv1ji8SoL4t0qW6l0gSzVenOpBIKBPWqR4kUq3PWIddSCQIp6yjPiQKpzuRSBNOWke9SBSOZq2jbiSKZ/qRSBTUjnLkb1g7ytPm1Y7Rwt1sFY86XVJzebjmGiuVlHK1BWqvP8jUvl9TynNNRXVdFyj6qtVDsuIzqJxAVEblzbCLOFw5JqsS8lYKbCQCkpj0p2ZqdVnBWvGr0gHwgUTeqHzXoDEtT3GofCD4ZMFhJBuSc4xbreqcLAr4s19pTcuyAjSPFtaih1sHfOkvyPL1A6KHunp1+o8T4GmWvr/YvrTQDyK/l08mTAUnr8vKi3qrjm4+tNfrH1INNNjvL/XsK6HKfEBTDcXVC9avNFRxCq1bfu/p8vcPlp6iBSPRVGP76UfggaO2dvHJP9o/nV56Nr/07OzSs486t1Drt3r3i5cPT66+f6J7+iRI6e1x8GNRFmWDn19+//zVaXSiuX9UVhajYlYsN4LjrQOXzAU7Deo11MeRmrw8dRzc0O3fdwz8PKgdQz/3qxpy7EDez2phbAAtJRmCrcWftEJQOoLjvJWcDq+s6W8G5/+CRy4GkaOo8Hc/PrP6zaPVx/P4nO6JfaNDoVFLfmtuFqS81p1Q/l3pky9/AMFY+bgsJApWm8PrJ4qT6O9tv/hI1m0vXXi4dO4xSLR9/qf2wu2oJwvCg8bK2YuLz74HofhnOX55vhAkdO7eL8/fA9K1P837dy//TxNokfunBaVvrY5eK32o+h2QnN1YLbJ1zqLLW/WWLPLfXa0fkP8r1hutg/VqpQ7+mvBYaVnzhXyyQd9RTY6YOtKtM4WeYuJrDCrSppg6kqSZOtIkmTqi7rlMHYnTTB1p0kwdaRBTR7osU0eqJFNHigxTR6IMU0eiLFNHqgRTR4IsU0eqFFNHkixTR+Q9ztRRPBi4oJYTz/6hFHLpOxJH4yF0w+R4CCnS4yGk2RwPoWgeg0ddgIR2g8EjZXaUZYA6JneUhcSZURYSxTAzeqzkMEsHj7Q5TEPR2CAMtULJQRhSxAdhW8Q3BmFIkz8Ig+r4IAwJ0CAM6VKDMCSBgzAkzA7CkCoxCEOC2CAMhdODMKSJDcJQOD4IQ/HMIAyJNnk86vDJmsl8IA8vCBZNrreeSLCO5HNjcVyORBGtj0N5pAqpPApALI+ECS6PBLnsEZ42Dga7KNG1ASwKJSYCkGCdn8nf/lp+FtKB9SmxrfiZzJTCbyyVSt5Ww2lPhtNeznA6OWCOOAWo7TaHst5WQ9lgZOjljww3xqNBvxSPRycHgs++eHv8d4wieA63tzQ+EY0bgm+d4L3RS9cfdS6sbTUGaQzP1WSXqXzkD8SijcMRipZn/A9fPmM0Hc6vKbsnRsAFsd6Pcczwp+q1+pHjQOeiVmLtbk/OCGkG14zIvHI0uAxaZiB4u96Qrbbl6XABdd9RWSBcPlCp4iXOSy8+XHp2I+L5ne/OLz9Ad/z5xPvqTvvnEx90rj6Uve8ypuk8vdq5dmrl6kc/n/7bz6d++Pn0Qk/7TLCuBw9turc+7M7/M/iG2Pmb4IFt2RYre+OjYT6I6//X3fhmoNIz/ut9yli5MTWjqOjtqQVLW/7xjEyWgZRkUrRVPiQjFmWsd7p3oBdIou35EdiXWYUA0188t3ThgVD8nvbFB8t335U9679GF4Z/xNLlz4JpgmgyKCRi20pEslzeRDaR5cfn2+d++u89wNZXRXeM/upoTiK6V/QGtr5WPlKoHDiuLD75aPHJp0JmwFuJv4lAG/93sAhsAU1oRttBXNRDK0/J10R9cKOhGHUL9zYG/A3oSn/xa/LJo3o5nD5HKQX+OVitv+P1TYLrx3x48kL0yA7qoKtab0EKMP56oQTVgtI/Nw1uVfTrvYrwwTKIte+f7Hz7uRC+9qX3QXj42PTAzCEQmOwHP8oOCtX48wBqsQbK1am5tc+fylcGhQf5Uv+gSlLAV7NeVYZL4AZ7xvd440VlJKyjh7y39qNbha9QN01wfTQvtfT8qhSf3E0NXn+hgN5/+/qL9rtn2mefLn/wPUi7JB+cayn75UM9ysie4j6Y54db4MLdfk1q4vwTH8akoFaba9tHglUnEIZI/60sm8dA+kVpyoSx4dZMasDDfktiSjQ8VuTwhSmQSKSTT3TJfrwtwnI2AogGma+UDzQV2ZeTsxhGOjIzw2IWZXISdUJK5ap8zi/oSYPkVc3q1WB+d6896f71uRw68ura173v/CcqLS8fzndvPup+/HD15guQ9qwGPycqx6McAeq3+nb3gZ9b5QMy4QACu+cq0zm51pw7IkgeXLM+PaCE5QIIZPmKP1Ofk3noA8I2Dwf7a5Qe/XijiVqbQdT27Z2ryyceg/pr7Zts8m22qRl/eg7uvVz+65n2qWvBF0afnwaPs/j0/faFU51/nu2cQKshFp+c2Co80L8PpPkH/3h4akR0Sop8+BUeCiPD5IpgRnD9wERxL/hZNXt1b/8fVRXB6KBekpkZ5OCwxrFM9CqjkIMyP5cDR9e4BfCEcQ7cfnoFz/kHzenkOOrg7q5OyRQYSDe8pakaILSO70vy2ezg+9tAsg5iNfTIAMRC3fpQMgVioTYJYqEkBWKhJgliUR7lglgkToNYpEmDWKRBIBbpsiAWqZIgFikyIBaJYkOR8LuVsD7LgliUVALEIkEWxCJVCsQiSRbEIlwbB7EoHoBY1CHAIBalkAtikTgCseiGSRCLFGkQizSbIBZFE3A1tgnktdB2A8QiZRbEmqAeyQWxSJwBsUgUA7HosTYxK6r5kpgWKWIgFlb+a4ddRUvAkSIOYreIb4BYpMkHsVAdB7FIgEAs0qVALJJAEIuEWRCLVAkQiwQxEIvCaRCLNDEQi8JxEIviGRCLRJsgFmHaLUEsvCAOYpFgHcTmxuIgFomyIBapQhCLAhDEImECxCIBQKtIls9rkXoNxKJQAsQiQRbEojGGdKGClYxpEoukaxWWoFgYjVgsCkVrmzZgLJIgGot0CMciXRq4Ik2c2aI4QKJehEQ9jETB8gSUbmZ9AhIFw2JZegIpfnIZBbpalohsrKNA8XCNgxetcfC2WuMgXNIbrjf8KTkOzwu4pBdySQ9yyQ306I15094AWlwh/X/vwHGPxWmBlsJpquYV5EnzAJQnLXIugPK8HAAV4R5vC9zjvQb3BNzFC7iLl8dd1ghL7uamiLCsTTTlEpYNVOKtdWC3RCXyOdqtUIlXykclnqAST6bjXoNKPIxKwsG7Fwze176IK1/GncodvMtIOqSc0bsRMgdH0hvADnTaSsWiohUKhjIr0wgBmp0cLwHZr1RDUMrOlw8/BEFbRZVr8H7zuOVkPeITb1daMyDBUVmbGLELEFz99tHLb29352+A2N7xkrK7UZ5FifbvWz/VKu/IynAYbbioNijqsjJsZ/vsxZWzMv/xQ+fOgsyWdC7cxUP49tOLsncZPF/nxmfthZuLL66tfI6mQMJJgs/an9+SDT/wapmI+Eweog2zIYBwAbEGV07+AZ6XK83V1MwB/y/gClm51ausrbjNmR5sP5iXvSLRqb0ghfBtOnB5YhTSUZ98LYRGA8P7hkaV4ZHR0aEJcLtiXRhjsNiyb3Rs5eP7K59/0n7wvH3my/adv7ffvSb7Njr/PBVctqsZHCa1Rwh2883fhv8ddCxlpWHsX9EhYCPTb+wo7FAa/sGG35wZajTqjTd2bBaO4LJNocoKNVaos0KDFZqs0GKFNit0WKHLCuUsfTZr6LyReoxNk84doXJsmnT+yDEEbJp0Dql0Fgk7Iu8u2I5V0nmk0Xmk0Xmk0Xkki9rZv4jOI43OI43OI43OI53OI53OI53OI53OI2ktyDev03mk03mk03mk03mk03lk0Hlk0Hlk0Hlk0Hlk0Hlk0Hkk20/IfDfoPDLoPDLoPDLpPDLpPDLpPJLZK/ItmXQeyZwsmyadRyadRyadRyadRxadRxadRxadRxadRxadRxadRxadRxadRxadRxadRzadRzadRzadRzadRzadRzadRzadRzadRzadRzadRw6dRw6dRw6dRw6dRw6dRw6dRw6dR7IMjKw/HTqPZCkCmaYsQGCVdB65dB7Jklb27nQeuXQeuXQeuXQeuXQeydZk8m9XC3QmqQJw6FTpbFILdD6pBTqj1AKdU7JOl/+z6LySj0TxqfK5tR3kwOfWNqCDTCmwZWAb2EFOyaVT5XNL5XNrG+iBZw8qDx+CzdLsG+Dxg8rzB5UHECpPIGRhJf9n8bnFQwiVpxAqjyFUnkOoPIhQeRKh8ihC5VmEysMIlacRKo8jVJ5HqDyQUHkiIVNMdHnlmYTKQwmVpxLBqRhslcFzCZUHEypPJlQeTag8m1B5OKHydELl8YTK8wnV5HOLJxQqjyhUnlGoPKRQeUqh8phC5TmFyoMKlScVKo8qVJ5VqDysUHlaofK4QuV5hcoDC5UnFiqPLFSeWag8tFB5aqHy2ELluYXKgwuVJxcqjy5Unl2oPLxQeXqh8vhC5fmFygMMlScYKo8wVFm0wTbHPMRQeYqhyjZF+gH48RYPMlSeZKg8ypCVH+yfJYuIeCmdW1qB7hNqPMvQeJah8SxD41mGJlsUyeKi8SxDK/C5xbMMTeVzi2cZGs8y5NwA+mXxLEPjF1FoPMvQeJah8SxD41mGxrMMjWcZGs8yNJ5lyB4EOmN5lqFtYz0FzzI0nmVoPMvQeJah8SxD41mGxrMMjWcZGs8yNJ5laDzL0HiWofEsQ+NZhsazDI1nGRrPMjSeZWg8y9B4lqHxLEPjWYbGswyNZxkazzI0nmVoPMsI9r+z/QGeZWg8y9B4lqHxLEPjWYbGswyNZxkazzI0nmVoPMvQeJah8SxD41mGxrMMjWcZGs8yNJ5laDzL0HiWofEsQ+NZhsazDI1nGRrPMjSeZWg8y9B4lqHxLEPjWYbGswyNZxkazzI0nmVoPMvQeJah8SxD41mGxrMMjWcZGr8mQ+NZhsazDI1nGRrPMnSeZej8ugydZxk6zzJ0nmXoPMuQA9zZDonOswydZxk6zzJ0nmXoPMvQeZah8yxD51mGzrMMnWcZOs8ydJ5l6DzL0HmWofMsQ+dZhs6zDJ1nGTrPMnSeZeg8y9B5lqHzLEPnWYbOswydZxk6zzJ0nmXoPMvQeZah8yxD51mGzrMMnWcZOs8ydJ5l6DzL0HmWofMsQ+dZhs6zDJ1nGTrPMnSeZeg8y9B5lqHzLEPnWUZwdiPJMnSeZeg8y9B5lqHzLEPnWYbOswydZxk6zzJ0nmXoPMvQeZah8yxD51mGzrMMnWcZOs8ydJ5l6DzL0HmWofMsQ+dZhs6zDJ1nGTrPMnSeZeg8y9B5lqHzLEPnWYbOswydZxk6zzJ0nmXoPMvQeZYhhzPRbQHPMnSeZeg8y9B5lqHzLEPnWYbOswydZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMMg2cZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYbBswyDZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMMg2cZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYbBswyDZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMMg2cZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYbBswyDZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMMg2cZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGQbPMgyeZRg8ywgOBiW5tsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWEXw8hzS3ybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8yzB5lmHyLMPkWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8yzB5lmHyLMPkWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8yzB5lmHyLMPkWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLCD4CTa6gsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5lqAUeZoiWPqtVtPTGBdHq7CYH0dJHSoqW/maaaOlPs4rW3sbzOtvQuryWxxpqgecaot1GvvFkQ9LdRr7xbEPS3Ua+8XRD0t1GvvF8Qy3wgEO02/Abjzgk3W34jYccku42/MZjDkl3G37jQYekuw2/8ahDLfCsQ7Tb8BtPOyTdbfiN5x2SLvbbruaM77cGy61yyW+9+dtd/rGW36iVq/31+uHYP0crtcNv/hdQSwMEFAAAAAgAh07iQFQ3q/fmJwAAHgQBACIAAAB4bC9leHRlcm5hbExpbmtzL2V4dGVybmFsTGluazIueG1slZ1bcxPXtu/fT9X+Dn1InV3eZ2876ntr7ZW1SpZlo2DZWraAJC9dAiugjWx5yTJJ1hMXQ5xAErOCE0NMAgkEyCLEXGMCJlXwsB/2S9ZXOMEXLLn4CmfMbttIzr/lf6hKQnqMOWd3j9lzjvGbY0798c/vDpe0w4XKWLE88toOvSO2QyuM7C8PFUcOvLZjd6673duhjVXzI0P5Unmk8NqO9wpjO/78p3/5X38svFstVEbypd7iyCFNKhkZe23HwWp19A+vvjq2/2BhOD/WUR4tjIjk7XJlOF+V/60ceHVstFLID40dLBSqw6VXjVjMeXU4XxzZ8afN+jrL5fX6/lBhaiy//XZxf6GrvH98uDBSDausFEr5qjzQ2MHi6NgOrfKH4tBrOyrpIV3aCdruyw8Xxhr+rh3Ol17bsTeV7tmZ2/HqbwSZjNZm/BsQDKoHMYAg2Z/ujbjcqiodlKl/eaP2zenagwkgk6v189frdy+s3kXi+oX51Vt3cdG1M7P1q0dgg1+cXb17pPbtjbXzp1fvwHq/OKvu6sbdSA2zLiqnLtcvHgV3rYTJbiCIxZQofCgoNlqJ6yen6hfuyR2vnf8IltZblr44W780t3p7Ab+ud6P+gJZ2/t+IP0C3/vWJtenrQJAB11Df7AJ6qOvVj19AVarLsBMcv4BaE/VchDq6EVHvilCPuMdepF4pjMnXDR40+P5MIFj86qflS0eWpueWProJxNJJuhK5BJBIp1USDYheGUihTlu/OrH22QdaUAqPEvIW6sfm6hcnalcvgHpXb9+Q76Q+MQtkEXeZ7GqP/Lr2tq/NTNS/mFqdOwIqrJ+arU9cXpu8Uf9yCoiDFwquJ9Op3v7a3Gz9m0dAWp+Yr91HrdVuT8sY9O/ySYV/A2V7E339g+h6qifR9xYyUd/uzvQAEtQvTtdvX1ybmQfV1T45J59a/dgNIKufP1v/7Iy8EE3e3No59DVKwdU7F2v3J+oTyISx4A+q+uJE/fZdIJD3JX0CCKSZ1bkL9eNHa6fuio2BhvSUyNLqOWC1UmLt75Or83P1yYttOprLpEmZS0I91GoglleMx0d1U6ePrN6D73ditn5+PrxtVHMojqz5wwet7mv17hnplNH3FVS7em+qPnsJtX1hvn57drvSwVtDpYPK6+fv1meOrp1GH4BMKbVTN7BMjCEzVW3uEzXpyGyLK7h8RkwSWqV241Htygy4j7Xpu/VzwQsWf+DDy9JzaqceAD0Zglq9q/VZH96HWLZ2CY1Qq/e+r/3wqD53DbQnPUKaBIL6qYtrxydk5AQy9aUGPQLIZFiLGIGO3VBd/5KMstOgXMzSXXBZvbRvHoUffcc7f9WBSjKxuyudA4KdfsQfoBsOfjJKynPL9y0jjXh0QK8+OSMdYfX23OqdR0h8VV7nVP3LK0C2J18aL2gJccjfGyuOae1aMJJr6JH0jtqdI6rP3T5bn0UWUCY9dlcbLZbKVW0sPzxaQnNv6ECCW9EGd2cyiYE327Id2X+V0v852NHfkYVDzpdTq/OTYtTaHTRmJ0ql9lwnaCExoHWV3xkplfNDQOpGeNhr52bkqeWrk9l/9c496SnyCFqbie5MVOrTC/IW6p9/L70RtJJJBs9WO3VZ3ubaubNIRZcoSKIkIBrsyWjJ8ki1MgaEiXY9FlPf6kXUcP3kaTVhfSkd4QYoXDsxL4658jfuy0yPKtANp8OwbVA2MSZ+1mgQOQGp9F/1WiZnVPOB29q/C6ndmli9f7ptbXqmNjcjbxu/3nsy3aDCpy6LMxW+dyCunbpWv3xGzAZk9btqehNL1K7fRWIZHk6huVuiJ5kZa99dj5z8BwrVfLGkBfbWBjO9oPbegRgKA3MyxNU+Qd+YxF7SAVU3hJ9z6o1se7J/MAeakqEWuxS5/lyiV+tNw1LZikTJ2kB+5AD6liMKva7bMa0u86/MksGDhDNEVBuZnX7o6oK7Rp+xvPPaJWSSZDI3AOrQ/W0Grkzy/6geCh0gfawKqqxfeCRjoPJcoLecKw4XsqX8iBUDZbN7HM3ssOWVv2FrPZk3dBdpVQpva0P5ah5UIN1VvDH5ytdmUY+tVorDoFR9ZhI/YaxbG8y/Xai+Bwpl8qOjgnTCWQHIc53te4pD+eH9ZSDs3p3q1brTvb0pZJVRox3NMgPFsUMyxA0rKoMGudTugX4UuWWz6zaEtWYHUoODuwdSWk9id08K3Ovgzt25rv69fdqeRO8epCCulHIvFs7WPp3FA8na+Wv12WvSkcQ7axNHSqgBGsPUAH1buegYcrzy5BKOF18Bd7350EDW3T+QSaCB4PVEXwz1OFdHQ1H4Yah4sv7lidrFK6ClUEU5w3dQf1QBwsS8FmppkWN0wNZA7f0D6Z50HxC8nHU0DYjNjnBQiQ7OrA6ZCsWvihzA63MfybcG6q6gMWHxy1PP5j/89ejfQYE9/b1+6o0kkMSdyJg7PTJWrYzvj5pXewojhUq+BOrs7OsCV/X69GTc6yyWSvJFA3muXFYSbX8ZDnnZfKWqpUdGx+Fn2SVDlSbOpAwG6n5B9aoLdSYG0be15403QIHMm1q2WxvI9gOZjL/KS4iibm0D/btz6b4e9P31ZtPhG69fnFydm2rrTCR3IT2pXMKzkFdqbWHnR3phLwv7UEu9z+ckGFqdmxUc0lIveLTt6xPno351cn1mbXF/dsfe9EBKkaLz1yPma+mCZ1UMcX8SveoAcKpg8sZ8bW5O/gKUfvnil/l/Hv3nMTSiGzHdDkdFUDAtiwbDBW2wmq8W1JAPVNSIDy4ns2lwNR4vHwSXc2Vtb7lySNtbrCKxRB669VYS3f1YoVIsjGmj4gfhz2bl/e+WZj8AbQ6Oj46WioWKlh4q5NFU1l0c258vaYMFWeUA5Tvz+w+VyuhLXS+YHpEgoVjGsYAMG4dlzeW3ixLJLBqG0ipaUwYoDGkjhapEhCPj8jX/rTAEqgjbB4JBXLd6fi2l7hZWF+LWpZ+mQI3dxZH8iHigUYBRj3lOLB6zYsh2vVrqL6DOmJl5c2n67rOFT5c+v7J87RRQyWR8zGTVAk2EaB0B+6C6kPX6agiMKrzBEv3o2aiBOviYOgTRvL8RzfvtfvDafPRump1ipBGG834QzvuR4by/GbX761G73+/DqD0x4LeKviNeDIy+fRx9S3TsR0bHEr76OHwN4zQ/iNN8HKcFMZIfMXwGMZIfFSOpYMj/bTAUWdkexzd9u9eX6MBvFR34EdFBrNvfzp0PuwXop8pj9yM9duWay/uNdM03nGx/Oyfbj3KyQ1fRD11FP9JVfOn5+ehrM9fDyehPyfK38fzWfSG/hS/kt/SF/Ja+UOZNP9vtY9em0e/wW8zrjX5HS70Gv6OlXoPf0Uqv0e9opWf72/od4eTvt5r8w+nXj55+c2Vfzex+xMy+Pn9E9nhxy9EUIZG1RPYShw4VwGeiY85q4Mv1z8/K+K+1qbD90l3kQq7OTdQvCDKcq11YAM11DiR2pTQ9o8Wt2okJzRNvTetL9SCn6A2JHf2BRF9PahBUJMii/mAmjGHrV88gDcGDggCDKBdr9Kr1NVAy24KhCMsAJerHPxBABASGoCpN5tnaVx/U5y9hMu916HaH4nYn70nU2T7Yv7stBolsKxab21cebq+WkdO5em9OXkTI2er3z0pnUCsZVy+D2+3skoWxUFP8Y3nBmNxtvqCuvRnkgf05Ys02uI4CXCGAaoH0uxPgnpIJhFyS/V0o/Ar6F6jkdfEDu8cLJS0I7iTpxmyXf3lAszc1mExrr7tosUTiRsmaicDZ48PD+cp7oEa9I1spH5CSWr9kGR0uFt4BSvGOwf6BcKmgPF6J8M+7BGy27+xId4AK1Fh2YQbj7sXJ60v3v12cPLn05dTKpWug9EBZbk2TVwJk3eUK8py1DLvGEXhuFqg5HJpkHoZDUzjY+C0Gm8Davp7xg9HEV6OJHzGaqA/R3+5D9HXbZz7EoB+j6Xppcmpp9saz+e8Xfz6+/HBi+eH7yw8/XfpyAjz7r8dv/Hrsx1+PfYcN0lscg5FUrlyVOCs1XpHMsvyI1j8q3CSKqgwWquOjoOlUtwC1nODMvgQC+fIWazDnKYwkkH+9EUog2UYsAWVB4shmMAFVtkQTUGdLOIF0ouIJpNscUECUGKwPNgUUqKKIiAKpNoQUSOyqmAIJIoMKpPwyqkDS9bACibbGFUjnZWCBpA2RBRK3Ci2Qvqw8bI0tkJpM10FwgWSb0QUSrq8WhM4WUmiIL5C4KcBACs0RBtLY4PhhiIE0UIyB9BqDDCTfEmUgleYwA2k0xhlIrqDreqCBxGpibog0kMpmqIGEMNZAijDYgIoo2oCKKNxAijDeQIpbAw6kszXiQDqNEQWSN4ckSKMp6EAKKupA1wVeqKTpKph/lh9/rGjVzUvLUydX7j5YPnvNAVpuZ3u6L9fenWwvypo8il0y/TkUOAyLO4GWEsLpC43mG9MXkm1MX1DWPH1BlS3TF9TZMn0hnajpC+k2T18meLeAh6GKIqYvpNowfSFxMH0hQeT0hZRfTl9Iuj59IdHW6QvpvJy+kLRh+kLiVtMX0gfTF1LbmL6QbHP6QsKm6QspNExfSNw0fSGF5ukLaTRPX0gDTV9Ir3H6QvIt0xdSaZ6+kEbj9IXkDdMXEm+ZvpDK5vSFhHD6Qopw+oKKaPqCimj6Qopw+kKKW6cvpLN1+kI6zdMT0mic4JC8afpCCmr6Qtcdw8l1tSX7e/sHEOYaSPZqmTdRwSCYAUNucB2xj8XLV5d/uv38/U/adaPDQGHy83MfSVQZhu/t7WGMuXTtu8WpM4s/PFj64SxoLdEZkwS6mJbpAsKVhx8+e3T++Rcnl+GWmQQoEg2IJRAdkkREUCb17v6DKtlKUq6qaPq2OmxtTxoU3BtwkFxkDq/aIaMZKo0XptwGYj1SrDbQaFZrsdlaHN12UHl022r7TYu2A3F024E4uu1A3KLt4N5a1B7IW1S/3bNt93DbPd12j7fN86mszPuza5/Ito4reqwdfUhbVJBntEUFfeFbVJDz26gS3/ZW4u3oTuLxDld1lzD9SraZSaVaZK5VsEIfrHqjW06P/FchSL7RUn8dL45GZCdkijLgtmfBFylrFuCqym0/Jwmx9ySdAogVZf7kHBDsyiC3vUtGkiCnGZQIPQBZ6TojqwayNKEJLZYNDUBzT75SVKvsfszV40CeTCb8oDY/ZhvIdKnOdE57J186hAr370l3aRWV1mfEjJhm/bunDRRGyzCHSrU0UDhcGJGkdMkplhsyYm2SstTxb6DmveiNZAdyg0B39cdHa8dngUA1BqFhkO8kAdnbxQPjIS5EE9FA4UB+/3ug3njn7nfB5S7jXXS5U4fvNRl1WY9lkhlQfQp15OSb8to3cLpipKCgzDpjagMAEGWV5DCajOqfn5CccbW7CSYj95TK+4S7diaDfE7ZG1xVmTSghZysy2v92Vy6H60sBdJuNMHmTMl3n7lXPzGDKhWhVBolCbOyewZ379E0WHl3wtc9PWbYoAa5V787P1wsvdfWM5DV+vpR91R1+7/VjNhlENwJvBG1+ePH2fA5w6Wo2qe3JAG6NnddNoiAu3s7v15E9g9O3AIKoTusUsllV59kMj+YES9VsqqBauhP4E1/fTJatPUl0bOH2ACN0BvYAMk2sAGUNWMDqLIFG0CdLdgA6URhA6TbjA3Q/AmwAaooAhsg1QZsgMQBNkCCSGyAlF9iAyRdxwZItBUbIJ2X2ABJG7ABErfCBkgfYAOktoENkGwTGyBhEzZACg3YAImbsAFSaMYGSKMZGyANhA2QXug0qMUx30fyLdgAqTRjA6TRiA2QvAEbIPEWbIBUNrEBEkJsgBQhNoCKCBtARYQNkCLEBkhxKzZAOluxAdJpxgZIoxEbILmiAuh6E05ACsIFfMwFJAPBVxkIfmDybTMQfJyBECz/+hvLv37L5d9wmVdy4PAyr+6v+1F+q7QEn05L8NNoRXwdRPgQRIQLv2CqbmQiPmQiix9eXLk2aWrhf188Pv3i8VcvHn/+YmFBe7Fw+8XjC+uXFn548XgCtNCVSKe15JtJIAqXJJbmTyx+hFySxZMnVr5ZWLr2YGXiGCg9VHi7OCLuoSx/ACm4lCmMjeUPFCKcWXnI5bMPQbHFyfvPj1xc+fl9yfr9y0AyvfjJ3Mrdb4GiHEXzOrhcSJYrBe2wrrWVS0PI7xEaFYtr3fuhjy1CPaZ1jg+BmtWQuK+MQgNJgpGTasp+LjXgJ3vToGw4nkXmDfdnpaQmOwNTfYMwLWzp2rmlc8gs0eb84KOlT6b09uWHjxanJsEtmXG9Y3EK9qFxX5Lix0EZ8f5kDycQLF3/auX4wuLUR8tX557NH1n59ipQWrx5dOnO13I3i1OnkXjy5PKth5EHeyw+PrJ04crSjceg6J5yaSyIFrqL70p2fFK2x6BeKruODwhLkEOJfptznyvsPzhSlmT+YqEk8VcBqIQeM3IgNzxmJNvwmKGs2WOGKls8ZqizxWNGOlEeM9Jt9pht8CqAx4wqivCYkWqDx4zEgceMBJEeM1J+6TEj6brHjERbPWak89JjRtIGjxmJW3nMSB94zEhtw2NGsk2PGQmbPGak0OAxI3GTx4wUmj1mpNHsMSMN5DEjvUaPGcm3eMxIpdljRhqNHjOSN3jMSLzFY0Yqmx4zEkKPGSlCjxkqIo8ZKiKPGSlCjxkpbvWYkc5WjxnpNPrDSN7sUSONJs8YKSiXGl1vyAFFOHZLEihSicoCRboeTPFEmr9JGEVK6+4+Ev052CGFJKHXiyRb3F6kEhFGINUgk1nFEUgYGUgg5cZIAsl/G0ogrfhvYgmkFeY4SzCBhC+jCSTd2KXot96l6EftUgz3AkqOWvRexIa9hb7sLZT9aS32Fga34UdvFgySrn2cdO1vZldvtxdtPRLyfxsJ+XQk5ONIKIgR/MO6HxUjBP647AaP9Md1w4/F/cggwtdjPg4ixOv2sde9sawsu9Sg92n5tg+XlUOPeXHyc5xxvTQ7uXjzq7aVb08tHj3/69HPUUy0dHl2+e7XSxcuPXt4H3h7ldFqDFEBdR11WHUdeY1GxzZLa8FyfNQ+0jCuwA/5Vqc/uNfPjz/9qjAiO+CrBQnJSrK0IMEc3iSaLVTGJZwFD6sck1RfDkg6xytDUn1SVqPk2EKksHcQXM2hBQ61+ikHWwUH6kTsKhlMZLVd/bvQi4xLEkQ73HUfrBPuK8Hb07VMuUO26RZHwV2uL5KitZ+h4JAcUCbx+oBrxO24paOblB0HcviTFnnohCwMBUvboOKelBaztawcIAiEckaCOqBj4labOl9FbQ+ZlzZQt+6M2abWFo/H3Fi4/UdOEQwO9Wh1KAcoVPvwihyrsbk7CNyTys3wo3MMAnF0CoPKQPBbp2740QkOQenotgNxdNsq+6BF24E4uu1AHN12IG7RdnBvLWrf5tH07Z5tu4fb7um2e7xtni8e91Wqg9+Y6uCHPRD0oc1kBr9VMkMYy7xMGfAjUwbUir/fasXfVyv+Mk8bMV9W/GVRf/sVf79xxd9H31y4oux3JoNtyOsryoigqjVjtfYavaLsw7VWtaIs5cALDCQBBvKDhV1cvnm516cXhpVmxAb4oDV4s0HQ15ShgF6FWv3fpNYRwHR99R8VVxkmwb598E5kEvEjJhE5n29tZnrziNq2ICJHJs0lE6Bmxd/7kulEL5rzusdHIg/FMeK/Hjm6DqN/OLvy+DioPJkv7R9fP+nbl5cYbk9Ec24YzvqoP+yryOHmvhwQ/vyL754tfLF4Yg60lOjt1bIJyUjRsgPpZCrqALRutG+y2wMV9iLNXqSZTKC7FpY5Dk9Ezu+Xw9sLoMUAPKHrBdmbGXkKtTrz+H+DUuGJv+FpMMi5S8FT8rLw6vLCmeWHs+GOiKV7p1Z+mAYNbqS9DMqZ8upweqCSOYQ8tbTEM8EmQU0d5AaKqV3n6iRJTfqBljgsJ/3l9xVLRXiMWrZ/b2pAS8gRZJlgTEK9ev1YUNDS0sX55ZufP7/0YPmLm88Wzj3/+gL2Uwfy72hyYr6cCZMvod68eOLO87M3n82fX/zw0uLR91duItqdRbsbX7c8bTByr+5bWcQo/jZq+4feMVHffCvragcKcqZ/sfo39O73H5RTX9pH29X27ErhsNEm+6pVjuL562gEefboqDyTvBLx4cHby7TbSXwZDTzKobx4A+g7nXjrc3h6PCggFFt2kOMTPsMDodUpn6Cg2pFbO3ZdnE8NSMMh6T9U1ua0StsBKuqouuCYTzm0Sh1vpg7tPoH05PxdcZKDU8bXKwRa6pjVjQq1sC51+Or0JaAbcGhw3TD/9a/j5ep/RqcgPj3y9OqTH59eevLT01ugAnX5yc9P//H0+NMzT+aeolMSpIaPRfR+RA0iuPL06NP7aNSRmh9I0UdP5p/cfDop/557eg3dhKgF9/ngyT9aqJlBdQtP3xddtAgZyKN+xyAou/6w4BZiMWMbjSePnk5Lwx+pZ5CbfAAr0bep5OnRJ9/KP/elkm+j3ufRJ4/lEdGY++Th0wWUnBhch+9fCuTAjaoC8GcDlKArogD84QBVAA1swXV0S0PlkQPFfER837trT297clf7zlx7D2xOilYljf8gqjnX39ezKyVlwf2vTX8vaXhy0D4+9EId4Ssf9sw1OWHCXzsuJ8FOgUrQaJdq7waaPeCaDLL1i2fkBJC1Y6jv1NWp5NdROTmx/Fv0XWbh6W3qMJRpNHgt//iJLOJ2ghb0mGOsPD6x9Nk5IEwauqXFzZjzCkzYlCRoienVUd/wLF9XjgNbWfg23CUCarfFqQxVgFBt2iyXtG40qatMhJuSYPHoxcIczqkIz3mIo2kyKy5DMrdbnOB2OXsglUzAE3r3JnQ0Tyx9OL1y532V0LHwjxePv5D2wa3nUhnhILkUEKm1iZKW7E8AWXjPng1Eyd2Duf6MODs9cgRjVtubhgc+dhUPF9UvB4EKBgpvyzFxkowOZHJQkPygkHAyceTy+9RvBR1CaqnKcLFaLY3LWZZvFYrVIXGJUEviGg6NH6ruK0iyR6VQ3Cf6UG/9aZGFmhYE/t/fL9Y+nv6fiRaHS4S/n9EeLnAb4Al/efzLrV8e//OI/IMSMtQZzpMzoNyzhY8XPz619OEE9gy9cB8UGo4WT3+2+OOVpQtT8l09+/nS0tEfVm7OLS5Mg0YWP/tx6dFJobiLJ64s/vQp0OgrHwZX4VsCetldO8HVnfLDT/vL4yNVlcJehX0msJDtOKA0PJwl1IeiV3RLziVuX507AypTw0Bneu/z2SNLt5B5LJF3JfVUOFRIQPL8u9PL33+2OPn3PcbyB5MvHk1mE8F/P5BMIBs04EgFz36+uXLz68VbVxY/PomtOZjNqlNnLG1UIhNt33taDv4SytpM+MMGE6Ch3IDWP1LQspJDVQHizeXktZM//fckUAjgmKaOfTl+BIjl16NkEsNnY8teAXUYaXDQPCjamR8rBAcOAVlivFpWX/Ne+fmsEpDvlANsh/Lv+bm8QGogl5hY604O5tQvDbT3ZPrQ2KbaB0U33wiQNS5w/Hr80q/HLv967Aegt/LNicVj52Tv4cqj40CcGRzU8qUqkOySlCNZG8iPj2l6PB4HGpvJR5DNZ4KfE/BfHy+9p8kxq6Oggt7kX8DV59M/L565tjT7FZD1vtGetsB1mUdXHp98tvCzHFEQ+aUIF9QHc12gePBtOgZ6yFBkonEzFDkBHXl1TP26WuNPtan0BznXZ/332dT/aYFOWn7eTX64TvJYZMnlYKpSKctPx70cJJsVdVbRYBVNVtFiFW1W0WEVXVZRfu+Pe49xVlHnTUPbRo44J29Tp62j0+aRMZ9tnTaQ/EANWydtItkESNZp0DaS/W1snbSNDNpGkg7Ntk7byKBtZNA2MmgbyQhJPpFJ28ikbSSDMNs6bSOTtpFJ28ikbWTSNhKkyT47bSP5oRCyTou2kUXbyKJtZNE2smgbWbSNLNpGFm0ji7aRTdvIpm1k0zayaRvZtI3kx5zIXmfTNrJpG9m0jWzaRg5tI4e2kUPbyKFt5NA2cmgbSfxLWlP8ZFaTtpFD20h+7ohsXZIwWU3aRi5tI5e2kUvbyKVtJGfpss9O28ilbeTRNvJoG3m0jTzaRh5tI6GV5Pv0aBt5tI082kYebaM4baM4baM4baM4baM4baM4baM4baM4bSNh8GQPEQRDakoqJa9KW0lOpeBrpe2kx2hD6ZKBS78B2lR6jLaV/OwLfwO8tX4PcuCt9Tugw++gDr8DO/wO7qDz1vod5EHnrcWzB52HD+oYHba/Gvy3xfMHnQcQuixg0vfKW4tnEDoPIXSeQug8htB5DqHzIEI3+ZGQRxE6zyJ0HkboPI3QeRyhm/xIyAMJnScSsrZGd22eSeg8lNB5KqHzWELnuYTOgwmdJxPyC1P0e+XZhM7DCZ2nEzqPJ3SeT+g8oNB5QqHziELnGYXOQwqdpxQ6jyl0nlPoPKjQeVKh86hC51mF7vBeBk8r1K8zs9Mxzyt0lx8JeWKh88hC55mFzkMLnacWustbi+cWOg8u5HA/2rA8utB5dqHz8ELn6YXO4wud5xc6DzB0nmDoPMLQeYah8xBD5ymGzmMMnecYOg8ydJ5k6DzKkHwS9itQe67JkVB+8pdXpUdCQ/YJ0zdAswyDZxlGjI63DJ5lGDzLMGK8tXiWYei8tXiWYfAsQ3J3acPyLMPgWYbBswyDZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMM43ekU/Asw+BZhsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYbBswyDZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMMg2cZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGeqXx1nfhWcZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYbBswyDZxkGzzIMnmUYPMsweJZh8CzD4FmGwbMMg2cZBs8yDJ5lGDzLMHiWYfAsw+BZhsGzDINnGQbPMgyeZRg8yzB4lmHwLMPgWYacwETPWzzLMHiWYfAsw+BZhhzzwj6WybMMk8/LMHmWYfJ5GSbPMmSrLP8G6LwMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8yzB5lmHyLMPkWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8yzB5lmHyLMPkWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZZg8yzB5lmHyLMPkWYbJswyTZxkmzzJMnmWYPMsweZZh8izD5FmGybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsmzDJNnGSbPMkyeZciR43QYybMMk2cZJs8yTJ5lmDzLMHmWYfIsw+RZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPi8zIsnmVYPMuweJZh8SzD4lmGxbMMi2cZ6pR2cn3L4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMiyeZVg8y7B4lmHxLMPiWYbFswyLZxkWzzIsnmVYPMuweJZh8SzD4lmGxbMMi2cZFs8yLJ5lWDzLsHiWYfEsw+JZhsWzDItnGRbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLUD9tQS6u2DzLsHmWYfMsw+ZZhs2zDJtnGTbPMmyeZdg8y7B5lmHzLMPmWYbNswybZxk2zzJsnmXYPMuweZZh8yzD5lmGzbMMm2cZNs8ybJ5l2DzLsHmWYfMsQ364mx6zeJZh8yzD5lmGzbMMm2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsQ/1GE+mUOjzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZDs8yHJ5lODzLcHiW4fAsw+FZhsOzDIdnGQ7PMhyeZTg8y3B4luHwLMPhWYbDswyHZxkOzzIcnmU4PMtweJbh8CzD4VmGw7MMh2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGF8EyXh07WChUu/LV/GCh+qc/vlp4t1qojORLneXyoYb/7S2OHPrT/wdQSwMEFAAAAAgAh07iQI6ZzK91AQAAQwMAACIAAAB4bC9leHRlcm5hbExpbmtzL2V4dGVybmFsTGluazMueG1sjVLLTsJAFN2b+A/NLNxBHyoSpBAtII3oAjAuzaS90MZ2ppkZCLg3rgwrV36Af4BGfwdM+AunvJTQEndzzz1z7pwzt1gehIHSB8Z9SkykZzWkAHGo65OuiW7atUweKVxg4uKAEjDREDgql/b3ijAQwAgOGj65V6QI4SbyhIgKqsodD0LMszQCIjsdykIsZMm6Ko8YYJd7ACIMVEPTcmqIfYJKa71zSpd6BfYfRdrp+A5UqNMLgYiFJIMAC2mIe37EkcIKvmsiZru6nDOffY1D4H/OSh8HJrKoDAKp23i9al027FY7oWeTqCeUMxnE8AES+rUehwMcRqdN+aZhAuHWblYTYIu6i3utKJD+EhhXmMsfCHwu7qz6RcbQjJym64c7mbtYs6fR5PNt9jqefI2no/fvj8fp80uspm5FVsECt0Asg4orZc6xZcza+gGbuJ6CGyn4r5FNnaMU/nEKnkvBT1LwfIwvLK9tqqtlj5dTdldlvPulH1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAACQAAAHhsL3RoZW1lL1BLAwQUAAAACACHTuJAhPr7DPgFAAC+GAAAEwAAAHhsL3RoZW1lL3RoZW1lMS54bWztWc2PGzUUvyPxP4zm3u4kzcd21Wy1+epCd9tVk7bq0UmcjBvPeGQ7u80NtUckJERBXJC4cUBApVbiUv6ahSIoUv8Fnu3JxE4cohaEoGpOM57fe34fv/f8kStXHyQ0OMVcEJY2wtLFKAxwOmQjkk4a4e1+98JuGAiJ0hGiLMWNcI5FeHX//feuoD0Z4wQHIJ+KPdQIYymzvZ0dMYRhJC6yDKfwbcx4giS88snOiKMz0JvQnXIU1XYSRNIwSFECau+e9ML9hc4OBcWpFGpgSHlPacQrwNG0pD6LuWhRHpwi2ghB94id9fEDGQYUCQkfGmGkf+HO/pUdtJcLUblB1pLr6l8ulwuMpmU9J58MikkrlWqldlDo1wAq13GdeqfWqRX6NAANh+CmscXRuVuvtJo51gKZR4/uzm653HXwlv5LazZ3y82DqOzgNcjor6zh69Vmu+LiNcjgq2v4S1EralYc/Rpk8LU1fKdaaVU7Dl6DYkrS6Ro6isq1TjVHF5Axo4deeL1T6h60c/gSBWwoqKWmGLNUeomWoPuMd+GrQlEkSRrIeYbHaAi0bSFKBpwER2QSSzUH2sPI+m6GhmJtSE0XiCEnmWyEH2YICmGp9dXz7149fxq8ev7k/OGz84c/nj96dP7wB6PLETxE6cQWfPnNp3989VHw+9OvXz7+3I8XNv6X7z/++afP/EAooqVFL7548uuzJy++/OS3bx974AccDWx4nyRYBDfwWXCLJeCbDoxrOR7w15Pox4g4EigG3R7VHRk7wBtzRH24JnaDd4dD//ABr83uO7b2Yj6TxDPz9ThxgMeM0Sbj3gBcV3NZEe7P0ol/cj6zcbcQOvXN3UKpk9rOLIOuSXwqWzF2zDyhKJVoglMsA/WNTTH2eHePECeux2TImWBjGdwjQRMRb0j6ZOAQaSl0SBLIy9xnIKTaic3xnaDJqM/rNj51kVAQiHqM72PqhPEamkmU+FT2UULtgB8hGfuM7M350MZ1hIRMTzBlQWeEhfDJ3OTgr5X069A+/Gk/pvPERXJJpj6dR4gxG9lm01aMksyH7ZE0trEfiClQFAUnTPrgx8ytEPUOeUDpxnTfIdhJ9/ZGcBs6p23SkiDqy4x7cnkNM4e/vTkdI6y7DHR1p18nJN3avM0M79p2IzzgxFs8hyvNehPuf9ii22iWnmCoivUl6l2Hftehw7e+Q2+q5X++Ly9bMXRptRk02229+U78e+8xobQn5xQfCb39FrD6jLowqIT0QRMXB7EshkdVxqDdwU04KmQmItc0EUHGBBwPw42q1Ac6S26Ox+Z4WapXo2gxgT6SwoR6uok+qS5UlsyJc6NeY6KSAUsLg2AjEMD2oRGW60YeTgeI4pEyMZew/bCfX9OneIYLny6Uq3AU/4+4pWixknCa2umnaXAGdxQqQmEwRFkjHMOBDB6TDOIk1GYF0QlcYwwlN3l9E75kXMg2ErHJuqaSWR0SIjEPKEka4a7JkUkMTTVV3irj/k7ROASraH4tOFzU7L9QNyVP3bxRboGXLg/xeIyH0mamNaK4YF7zVsNmQJtePDoLBnTGbyGgaikq1RSHR0TA8b8aAZ3UC1xXVSt59S+JHHAm7xIZ92KUwZXDlo6FaBYjQ12YYkNlFybpNFjWgqteV7Sva55xPKYQCLg5hCvCA+WImhDuD0fwcil/PFFtVnu18LesnFz1V8wb4YW8deZVPIBz2KrvpuLe2OLC8WUuqvVStUhF6XJkXl4nFfbVnYoAOKdCZWcCglGUgIHryBfmbMuDm5ecWIOJWgptGjrrXlFrhg0b18ftQsobuPeSRtFllWbTEQWSx2xkhkt63cprrphbO+bMsOgsK6kt6ZgVy+FiMd3CdsuqRYhh9betMpwE2sB4jEY490E1cOMDLPFLHyLVrbw+uGu80aqVLnYCdpRXAraczDFNWbwIpGXactQ1beEgcMENr2vatu3HSiRqC7UrcfvrbQHYUKSq2LkUvWvzzgXkVlkLQ+PF9k+zRf+tYP8FwAb3ocu04cp1RqUwHUCD9v8EUEsDBBQAAAAIAIdO4kB6nqDMz50AAFV6AwAUAAAAeGwvc2hhcmVkU3RyaW5ncy54bWyl/V1vJEmSpgveL7D/IVEXi0gMWKSbuTud53T3wD/JiHRGMMyNZETdJArTtTMFdFf1VlUvztlfv6+ImhsZ+rzGiOy5YUaKi8qXioqKqqmK/tN//7/+/d9++v/+6W9///Nf//LPv5v9/up3P/3pL//jr//657/8z3/+3WN/uFj97qe//+OPf/nXP/7bX//yp3/+3f/9p7//7r//y//z//FPf//7P35S27/8/Z9/97/+8Y//+D8uL//+P/7Xn/79j3///V//409/0S//77/+7d//+A/979/+5+Xf/+Nvf/rjv/79f/3pT//493+7bK6ulpf//sc//+V3P/2Pv/7nX/7xz7+bX181N7/76T//8uf/z3/+aVtgN/Pr69/9yz/9/c//8k//+JfnP//tTz+93/3T5T/+5Z8uA1TA27/+21//VgNPf/7//emny59u//if//NP9W/3f/zHn/725z/+Ww3/9B//kAFq6P1//ts//vw//mpZv//XP/3lHz/1f/yfdaPD3/767z9t//qv4J0/PPwZXPq/WnSBDfKpm9cMb2vA4dh9vdjU0P3D1ayGHY6fPnU18NQdatBhd6xBp25RgwzOqsZ5rgGn7qYGfa0B6/s1CB0vQepzd9X8v/747//xf/5yezUr//h8dZX/uDgtr65AdnN/sa6BXbf5pYat7zcw3fMlDLffveaWfLcfr5Y1tb6dQZTueFqjx9aSj8D7TVNT/HoJH5DIsOtD3e4XuUSKeXiaLaftJIHbuunheHta9zV0c7q6rmEjk182Q/e8O26vmsvjtrn6OZnefkEv7Lbbms7m/gTQ6QpKjuwMl+T2aYMw0s8b9JLQ0OebE3vuUy3UKEDoW//YX8M+m91pu4AaX+qW4o1O+HoJ90hqGCxqDL5H0/jUwDM3p8bYoTEsWtO2RdsnjtvtaQvVLt59/DgbBrG89OfaHO/hzFu4B6m+f9jsjrCZ+COoGshpj+7sLr/Wgh3WQxA43u3KkPqeJvvtBSXdni72NendmmHoyDB02G2vrmH37eIcnN7dPV/NL/VnAatub+CIYvrT+iNH+u79w6/6rZZx3VyAtdBgOeEBtru7Qj8cnjjEd3cQR6AWQ1j0ANP4mNFRhQmHFgzGgLq7O0YEwWCCW3ZTSgJENYZdbjlksjEQd3cNDJiYGF7CREAIU09GyMU1pnvRMEZrDa8WUj3VfrO7aw2xORru7ubo093dwgi3MPSWMFl3iaxlv6bbfGX/HbplPXk+rZhi7U/rWtdHjfi7Giiu6JHNbn8LzYQIzZQAdIYg/He/pmsqW2y+MM/Yf7x9/xEhqL99OMCG+9vNzog5Q+c9M0/ZrxvQO/Tv4R/Co2Pd96bzOATUFuIdGbmFBsN+4iS5X7eQWBOxsf8cE+In521zBIH9mo7/zKb9irFCTaHrs9N1Dm9TU+h/a2a4frl0EsPZ+vnS8FjAePv1Ap4iGGQRDDz26yWMfMs++2as1gOlv9t393AuUTZaMoB8ZXBWU8QoNz6dea7RcswnX5J0F2eeto+07IbxaDTFhaOyvz9tavvsb0/0qb1JboXYsIc2nNQ/PZwME+aKYkIPkjSwkRDhLt8qmhPb6ROyxlDOyMx0WYgMaPuNE7o1BA2T245RbsP+75crGuGu2X+ACTdcXOw31zCMxi9ChPAgtBhjbO03hPVL5gbC44jarDjONysjCxXuWxM3Njf0+APXXB3jwfqIiSMmZczU0emMAocr6Na5Cfj2tKCnHphVdgwh649Dtv6ylXFePXd3u7rnQ/ZtDXw4NRf3NXB/YL4arUEy0kYTgg9chArTDIIDB0vw2dcCqfXK9OIMXvHuw/FqnqO4+6D14KX+Xl2++3CvnQT9actOwkUsGi/39/GT4mbZDeo+6mfDlyND1kGHPWhTp27c3T2tYW81xjj9umVjaWzm3sMM4y/ifc15f+Bq/NAxIIatb9F4+7g23swELKacuvHzA0ASxg2EumW4ErVTY/TxZnd/8QFQYcKwnWFisoMDM7rN3RU4aFvA0JtxU2h/4NoxhTa24aDQjgDZvH84rmuo2GBMyIomBB643FK4g3VEkKH30MIQMahyjLXdNSan97vt44XJOA9ceR+eb1aX+rO47LePTHNi0MPdJSO6OdwY81z4k8kzDlxACrNhuN0fmHG/00bt7FJ/5iWQKOyWYPOuW1+1lxlCLscdnXEnc4zOgVX3ori3zOPFHX0basIDIzMBTbUmTIggKUT0eHqqCSkmuzswpIgi+kdzUbpLxNpa/VCqA7Tbb5uLzgwXrj3WJ2aOu4e9yR0fTsjrkjtNdViAdeSJtez77QOmzqRovJaj8nTeArw4PN/VpJMMBt7h+HxnFDssoEK2R0536CbawwmyPRU+cAslMekuzKFvZ5wuYgq5PD5rIrZR76QvNLVlNF5u6UYiDicSDHYJhumL4zbW4ZchAbjYfthgMtweD+uPza8z5sJB/fewm6CA7bbsn9CCAypa/97pAU/Q5i0sc/d0p/3SE3QQVQzJmN/SDhejIUwP7LbcJhE1+JXGYLGqyTo1Eh+cShgjF5GLFTIfdl/vfnYdz4n6dsZUdRTHqCR8GE7GRKelm8Hsag1dZCQmONGcSbCawyPFHGyiNVdaag0x1RoUU3T0kVqDT+TIzszMedUaY3x9TgMuYlqs6UgytEirwBdF2zjD9uvV6jxrzIa83fFJmmgfNN1Imq1rOYW5MbBtDQs+zKrVeldjCrYnjHnsRcwANWKwYU54a7LMbJ4WereZKYJePC7MF7DddsYJebe9hxvfNuzDMZXZiXQtqVvdiAgIa3yg7fsHDQ9A1RrOHKOr5txtNsfnGqjGGB3nxOPCyX/bUqdxN8h9ULqds4HSr1sKLUwIfWtMePHGR7bj+0N/u+73Px2RHKw1J/UM80uKJ+thuI2EOxDuu85NubfXpHx7Q7X7P3y5YJAZo/ovn9nkfvsolujLAAPotimPzS1z4k3/ESQ3awfcXdx+VP4NVqdPpxr27uGDNhH0p40/8/izHMKS+4SvszANYs1Gn0P5YVn5D4bC4bj9z9Nfrtruay3HsT89A/ZMfxNV6MUln7AwagRD5L4/UEZ1LLx809eyPRw2LpU/9fcXSMfFBTI/WJIXHRA3PY9siCDUOxzX+pZl3GZ0VJM2SIsLnql6H4sX9J2YYqYdabvtmkihN//NGO6Cp6fuzeaMTt6AoUaQy1q5syOC6MVn7oX2zw1TH7YUNXQMIfePG1iNEGFBMkKEBY6E3D9uwZEQnQ9gwqumEIMQYUGMsBncT4iAyd5d3f33jzxZFATBhWhqCokJuX/cwyTBAECiqSkY3PLLI5HUEPLLexFuiKWWMBsh9493oP/N0Mt8yZ3t4ragRlDdJyQuUmAoISAqIZ2JqNrPLwugd9tbZXT6M+xYm4gUsYdu+HDibr44IQkYjRInHtMohoVOFjb82iFyWFxslDxOUVFGewMbdeYLg2DwvXGr0YiXFkCL/e3zxQdARRseqySU+1dCpLCfhy0CI8T2eVt7iUig/2Ors+Tq2odvLw/dYjjVaEjuH9YdDpeKqInx030nq3OxLCLouo/6LDLVdfvTCWMgrQ79RBlrsO5gzgnu+g4f1YSIDusfpnXL83lrmt2sFA6M51IAriAJEIPkHty3ESLGUuxATllQ+LCLCBtHP3DVJ99IuhqslPjxtMHmY2e+COSZ5mnx+GXg4ChLZvaR2MERhMgvdUKE87778KS9P/1pShZtBsJBTNnL/I6wM0FP/m/2GyUIui/6Ge4nRIyUUA1AIaKDY+wZwXnQ51UHGwm4Xd8duGfYdfdw3Q8xe+hPG3/QRd1+3f20ebx/2Hewbkef0pqwRjuZpVgksQeDCEOoMSKsYHAQwaCYYOg/bWWC3t7sOaoteu+knZNaZi39wXe37dFBWiM6GPX9dEIX3PKslcjBBPoshqbjCrSW+/b4ca0GNThHLlxUiDDG0yONO+YJH87b5N89XwSjPD3yk/d6+7CrJRWekYnzytMjR9LheIAzC8/Iwin/6ZHjXzA4gWBwPsGMzEs4ZIQjBv2nxyX69yvz6E33yzONtUSnjp019pHS0wz99hRXv+CUowYXX8jrGqPk2Xz8PzzzvL3wMCJ0UYfJzP4wTPjmG0L/3NI1Dt0vPFgeqQFCWPBDbwYQ3TkKYWajWBvBDIejESJIwysE5GeCoxYBpYPGPPyivxoMYbfV+2dK3XUPXV93WvCDcwWQUebZzFbHCZLOjkyJXpKOySVNfBSvZZaJ0SWHzt15kh7WwhgT9kqX+KD1wd6tul/zKIeMuFrXouvTRLkb9fp6WUkLX4zhdkA1vXLJFiw2NYvXlIvXBL0X96nx446aG3srRN76XMNrTj+oQ+uV2NdC/UZWGHAy19yxMhN53MeDi0UuPW2yGOMYH4fOXWIL6sa6Gy4fRRSjxt6LC5JmyG4okkhCzEkpwTz4wLvMtcRXfVV3Y3/DM855O9GZhHFPAR09K6kYsLYY0IEG3WUPID5wdoi2zhqMOi9jdveVGXT/PKdOhwiZJgxvGGtCDsgbRNH7hwjtlig6UEStUTnJvyjnonPd1UHX9SqXdN3RXorlkmu/P09x7sKtOhP5k76H2O7kKi3ENbZ1pp0gua0tYIaGIi8cuL9hfqhwtd5Am5Bx92Nc0FZcMHclF/iOuDBRDiCC4u4L0hD3TUu5ByybDurcg6vXYE11FHFrS+RIsjStjogGj0+v3SujvcvnWmZSWkZYN+OiIZSBMbp7OwDm8KhoDQcQkAsRLRy4RhDmDTKQ3ny2K/evnSlvNrXVX60ehht+Pneac4YrbOz3pvvDPfrXHAhYC8/cH+073cT9Nb931+JGCyrW6yQSMI/9xakGyq5rYOpOrPlyf/eVS5hty52Y/VYXBmYXRo1clfxqfggpoEQAMU62czKMz8n3nqy+5PsfTmuMoeCHMbRdkF/0xiRZZ2DMtZuD6Z93sYNzqT/DqVozVtWO9KU8gL+4r97H9x8xWu50iDcjgwt0pSdBXHQwakSnHKSbpMP+FR1EhEd/FIs7MlE8AVKMY/cixEi9TGGDWqH9E+sn3GJQRDkDmG9k+ANseh4nC5rTSow6uA91Zicgih5AwgCChcoUkO96h96IcgauMRdlm1NLigK65jveH8xDjy/lSMpW+IfzwTp3Pq83pwA3px3Hx4kbIcK75/AXEBnFpFy1D212hyNmsk1vLrd3x592po5M4NZEu+OOZzmEyFSh66aINiDaTRBta0xxYtIcA7QsHN+N5/ljMfmza13DtjtzbGPN0Sc81xS6BD2IHUD0LiFCY0b6fIkKJYEHcoQIjV/rA4i2Ah7Q1YQEGnR74OU3IkVLcCVEaIxyAYSZCdke75lgPPG4TNc/oSOPmK6CGpgGEPoHEKo9P1g8zuVqjH21MYK7q2unT058XpLRxe/O6Gk2RrbmW54SjxkvFEhVZpiJ6rTl3ki0R+Ixauvu2kV6ZtWA0USb37RH2p91QrC2xppHEYMIxkHkck4GLoVHdmZ2TDNhYRoMYZEAQr+vlw9Q4KGvQdEUM8b2YcbvZuPxje2D2bRpGGUDj6VhpNbWfM0NllCh4NIGDzPuye/W23W34OJu399d3HGcix8XwALSuP2MREMwYkZzqwPtFagw+zcWzvnJHV3uZ/QjzdwbZE3BA8tadQodO3sK7q6BtIG7qDmHroAMVAI6Y9CxQiTI+YmThPAYjAKIYBpADBL1mZXSuUHDyLBVMSiYA6WfvilhBePdn555HzpqPLHvVLvpUgWcaOsbuM3uXre5udURkdDVawp+UCRYlaXGm6Wi0E7EolZUU6sqOI9MB5AUXDQ4H6bIexCgvcXkq5sR9OoAwn4aKd2OFM1VL82HON0UJOHpVkgNHubS0Rx+GUAMlIOW579iYglUdP8t073Aw4g6Ek9Dgl9V1JiDJ4AQMoAQJ4DgLSBHVNx0SZ8zmwTRAMM6gLB+AJ1NGYkD04nLnXZhcjoLcY3jcD9dXW9djMezgo/TktvxckYk9dHaac49+sC0mpuOMleHdPPEjS5zSScwTQ81zuvN9PCJR2mCopOSn++FSWeW3W7Zae7ktVqjKzY2BJjPisHbdIWZRqJCHaJ9ABkYte42mOaKW5Sf20JLlZVzzU0EVg05gznnPozKrlkgN7Dj9D0coZ+zgwKRlrvruVG+O5kF1o989IqGmAcOfrOh+3TqnjC9aMrgHkaQhccEEHoLSMXvVSgko1+vE8l158kmIL1f3z/wflTQRnMXLIQHI3Q6mHupTUjGNWFDgGAF3Q5+J+jo7ej2goIsPUBAzjcns9hSczNTCAhRhcmoHkDYL4AwVgCdTRishcnvcupSpyU/rT0wYqkA4Bzx4Zv7jelJ9mSYqhG6jzlR8hAkoyIhgK/4nEsGRx2x5OjKaz3dwZ5BFwEqSx1OiMYzOZTC8N59+nKqh5J4c6dXQMasvavYdsWPayqpyE308ep9LOkpgwnlIsOwG0D0gIBG2nXD6UEFDZnbP2xRUEV4nAcE5C67gAtMDvtu+4TxEZhG9IbTHftyzPdthTqdD6MIAhpuLee8qN7oMJ3xW+p6dMNxTgf49PTEZZAKLPKLgoDsufcTzdmdak4lt+uP7xGcAtNoPqfmqitpnHZOV+yvOduIDc0WQMf7mj2pimssGKT2DEUBRBwJ4J4jbk6fURk8zHSPChmYKUSSztUvTNWY9Zwjs78mG1FkIOlXN5jjVPKSvRu1MY0xF+T99OmhoS0W5B1lNNkVqoBpgYb50om5dP62ZASIepmOpvGO9dL5wTVpjnupYyi282FUzbSzju5BUHcB6XAC7mojjzEtmZbp2MxQmmNM5BRBhOjn2/UTu1JfhOHrKud7MzP1fG3hXl3YAAF9Uj8xnN+eePZKVTdbrKcCiDtuG1fxU4ifa8NF68caOFpzPP0eh7Smk5wnU0lJdL/UdHt3DUkSMNAFED1vrgKpQx9qLtEWDqK2dC81puF1fwacRXL5FXx66yFmEOmqDXr9uT+Z0SpM18HXd2AuTDqtaDpEbKRJn5VTkueZDy4tU2voEyQPYB41XLF/EKhOyxW0DO6uh1ZQnS77nUiwuboBu6gAx2lcmM7HbtxYuulhAm1cwfP6lisUXbQ6mcbMQPqWp0De66OgaUyff3/7cWt8xJz6CExjDJM1B+bMcGdaEpimP2dmNtrMzMQj4NYwcsNjxuGx38yM13+8PZnwq2vY4KReM6ZzgUVno+lcm8Zp5JJrHWneUE1zOibKITtMppjCXCAoBtAM5HZhRmfLKV/NXbBrnZot88G9ztRiZAjI2V1HjYzh541RyOXCm/kSfXnS4Z/r2sa/fPy05T0PieS8zmS4wnQdt3DdsXA0V8yB+tblASuObFWAZhepIoQJvyv2UNR7Np1xw/VTv+BBg7uHgwmRN9RmrxLSxmFvzGJF97kgUH2+0VXi3T9BlNjrYNgRA4qilxUsJhzo3Uv1gdqN4nkGbDbpPhwdu9bnDaKhgyPKQRBrKoikMt0Y6bFfw3ElTAz/rNhvURHmgvuvze+vnASYtWWUBrlrijVFApvDRbQp9M+1GGOe4FYHqpmEFEZT1sdZTUVyMxEPTGejFjYKTOdlLQwUmJyExR1WC5GY5wkIiwXmx1qjVHPCii0GVKo6hd3VtIMhsufUbIrEH2oSgd1OYHOhEFXkGfZUwApDQKLN0eWxm2NSe6FiYMS+kfOOOfo8NqgsJvo8tvcWtQFCUPS5thscHnv8CeIEPThByjhlZcsKgabYborGl1rctN8UNnxm/3Q3hQuPkW0mcJmWjpc/tYkxHPl+ie657HVXbNfPu0fWaZBhOZk5urUp1HCJhEZHBFi9NDCdJy/pyacnx4YuJ4rwrlKw17WHg21PTxPGXiIajBtF5nZ6aIZeHxvY3Wk977CuZXSfJbMbPUvmbCMB1Y0qdxtMS9U84vVZaXADlUWu7J7Eeef55cvNgnCrclDd0jc3geM9CegbwE1thAAiawkgnCyAxp9mVwh3gWlCyezKeNTsykxHsysTRmZXsNg+Xk7wLjW7QtAJsXqn/6MDwsHUfAZVZ+a7rEajWQKu+7tPHWf+uFXF6rXv4lnAPFpW+v2NsqUq18qNseF2V1Mrtp7xrGfohYg7jia9PPRcUwnYiV/rgxCsNhLivZVN2SrsHshBj4r+6lx1hgD+Fn3IrVJjoPqLmW5nrRsS5gapCGJIjLnjtOlMrjZjpsj5xs0vsjpTxwC6wcYcbbTfS7gxJ72CHkafaWriUzSFewUQruJKttVdqDI6v67c5zoRhG/ojBfmIHHmcAkg4t27b4s6lYGoazoKxmWyd3dRghI8Iq5XXX7+5bw3bi+uqR3mZZVdhlRd3OSqrRJcEZoCiCjc3evqsmvuvIWpZHd/9M0RxF+sVww3Oourxxono51Q6L2a6rvPcThGf/iS0KH79LGfqLqljzEwwkFHbBZOCOS/o1/U2AfTX9ELmMyiUlj60FvyT5n6M9hO9SlG7GGi85H+PcpZazb73gXFOcb2Sx9lMbSh+1+PmhL3fW35bsMq8mFDDO4XNqODNbXI4VeWHJP7b56xqukceJhZMnFTdLwb8Fa/MiaF37hsbQH/H4veaDiVJUg8gVPCkSs8dzSlbkJy+PQo+Xq3xtAI2AUrGwQhuParEiZjlMx/vAhqKjkEKfh1AJGa1U+Lmclq/bB+ZBXVoAY//wFpvVn9G24LpEo/wMAUaQ9ZMa7GLnL3TaIFJtR4cK125f17OFW0xfB6y9O8xNzkVyU8HmcUN+4rBxDRZfRxd4UsWrgpz3zkUQ1WzC7K0Rs7j/KbYcl2EVskwAqL4XGWu7DJn5rA+mMTlwcHzHzUEB24R8hDD1CVWOgej9WZcNPw1HC8JIcMZP8Fwyjw0BnxOg68T4iwwPbZEkQ8GC3V3xm/Vp1YsDvGksvIQAfspjDhlUnTeIP7Qqd37mD98SGgUAeyPbDGrIxrvkcKyJ5RSVvYQO+3cXln8vQYESyno9b84DN5Vz0DvYnIQQWGCCCsG8ADrCIg3KvOxJN3vJBTt3448vJxsEFuzLopgYbEWNfvEeYDEcHgyO4VGtw/2honbZvPtSZjmQK5zksJg1Tcli6M6gPGU9umqylHPQOLiVwgpO3r5i+ThakxeNqjl9fmfKLomjDQNtbWiH4saRCCIh6Oc+i7yGkudQVx8XOtjBYC/OYb1DBHHo6yW91cmPyOHG8u1oi5lF3DltEeVhfu8jo7+o1vf0HQnNEUPZhLTBgDozT0tDNpKnIewmk7aDur8HDTyNAtBcSvrU0m0jwSNO63jMfQYu4titi94Ny9cmPTzP1i6Absyg3YFZLhkNfY3pwsRp543lF+9dBlqqTInf+NEEDzzPmt+ocp27g958nKHyb4SlRjbXOA479CeYiDNiWdu43V7z8oWtt5LP2JqUVvb84wW/1vaWFZYO77r7AYtTCjaj7DZPjDLOQ2xSEnugDz53+FsjULovtZlJetzHGzLh6CnRRTuyIL941mzu3m77CoR6QqdHrKTKrG7NYeiFZ2NjMnfPRo7abmKad0edWcCUpgIrqNUdTKEU1M7Js3mLJGOjYGnzYmWJrLjM/mpLze2sWg27uHv+c86ST5+a1RQJ47izcta9Pm06ut21Fa8HPbmKRd6MVTDLokdV0z2B8W/Bo3esZo0h94QnWCoZcd0/UbLCcfbZ07ZbgXfk5dnVFCfXTtK1mGMomj+tOyuMsDxeS/h2XElcNxfCzYvBVcXgU206+5eFteACaunjGEe8XbhjDirXlgVjXjb/cGVQ9m1u0Pz+t88ntV/7APwkAvlAHeK34CGA/ygWq3NiBewQ2CNzVmf0Mmxx0fkVZj3oSKZxdAUZgWyGoCwmyhYRTtcPq09CE15wA4uXduVXYRij+be/b707bGkzOdapjQzHcLAdHjKvNLoHzZkqQpVRGI8UpA8JFE5lyVavFAb2GyAoSAvK0bQCOSSYKjtuV5pkfa0MmA6GUdqWd8DiDU7ecLo4Mq+NSd8iLE+YVlV7+4k+3RVIzNpulJxXJqJpKGfihEkBQiYGLDCkVCBJdAdEqzIIAwWdUigMZDHkxvPm1Zm24M/pnTwQLLBbo4MiWGFlXePMAGhGRjivtsamHFVkItTyljhZW+qRu2F0nIE0CaOktjWVwwEgGO0Yt339Q7Kl/Lxo2Qtrt+qtVQcZgaJMp0wKIu5wDhOnnpb3vVot7UrG5z9N7+ctMyro1iv4tyspf6cz18/dMn9mzn9Ak59ZoOOA31g/VzLUO+aQcd1qZSmlTwhvmF6eN6eQGaMcU4AUQWuGpvOqbhJaHRTFEsF7oVawAcxZSbCVl4o0W2gHyyhYkfyQ6xu5RSlubYNn2/2z6GGPhBh5csSwBvNVzXtX4BRDYaQCScAURydUSoDTQ4DgvOBhpUCSCOTAQQy7EAYsEV9VicflhTRevPNaYeiretuxpR0fB2hYAUNJkyxBOKPLIVuH1Ndozp7kPmbnsNjw0qv4fnB/Sxph1AxLMAfqkxVXnckuQKKZp/rZsLyLNkAeT6IqBb137ngDBtEnUdxmNVierMx6tFYyfwXN46A+nFh91XuLcY8PRUAJ1+PFI1LmAniWPcBXF4cHd3dK4+hwc/jIeu3EHNciTTdMIcPqvaUa1DdL7GIzF3O+YKz3cssR7KOk/j6Rdh8gxLmPfSDarA3hjx+cV0pzr7DtGOCn5CECN+EAggXH38DDoWAjD7z7I6E+4gZwcZPzAEqgvvPAsuTH4oD6Bz7BtoE5hucrmx3J2T85px0MTmqQoFGc83hWsidjODuNWbeMYRTGWywDRqztxcNpth4EVzMzbMSeN4DpceN+PWq0hym0aPiJlPjoEKNYXa86RxoJo+nvHC3EnH82tBd+7p1iAJZzhpuXCpP9B19+SMx0+08dm5qfkHK8xscY72Mr8Y1ug5oa9qaBAxUcdc9hYmJ71xJnFL3MPjAz9BBxnYPDBN6JmZAygdO0LbGJwScgyY6dAc2o6PEsvL7ni+aKEPB1YYk5/NeE1u/B7++tAbej7MgMHsBHlrPjbnsvuu6SZcve3rzlcpqxoUcj3WQH3J4JsugYlR/iPfd2rqQejZAeHc8rbxkx+GY/iQSerM0fD10nBjliS5XGrjzmo3p40byDyXHTRNYjWbI9iPbjTxPKBTwSw1ZnOz1JjNnSvzsp+kZaIRQMTXAGJUq6yF83sWGYjWCJra7+SoDkxMq/qE5+eBhTP1Aqbu9LHaYsKe8fYnd+1CKFhZFWadU/NY7+HLcDfA5EBdt773RsCysHtkYJQMn6wQiDyhAjLtADq3XpyM8y0QXaI5QkkAMa5V/ZZ1K4XJT3gBhPO9TELnjaCLWNiUneCrX65ufjby8pzO+L14DDP2YFV3fDhuG0dxVwNjDmLlzNAB3t51h09IDXXfwzs2r3E+bM8PprilW9d2O+tHS/AMQrUeXXucaI5h0x2NHqExxtLkGb6c8RT+IEaQccn/bInRp7OA5cyD7cIkZLvQxcUlxlq0x9RH94kDiZPKxMnEdW3oIOwGLA9xxXFA1xq53PiSDuWztonneDDCQq4/GHZcQ27v7k/ojV4JhHdkriLzETrHitOLRhc/xklULjjDHWqa/VEPuLMSarTn6NSYx+gOTMxFfef6j6fVozEmogBinIz9NjEkrt3u2OwaMdodjy02qC0TYiCaH4/v0QOBiAjfmXfJAxED5lUACNVckL52osERVYgJvbvVRnLd+DivIZKLZcq08WAXzyvXGvFTMb/hF7dg1NXtu72dR3hqMFpjYI+z3suJpx+Y9law3q2zCjdJtl+vVhnMgm+tyW7Lgj8Smrsq31Ap5Mxiq2tPOs7qoiO3ZAqui1hup2bGTZmLd98IVT4pTYy1Gzv98Db/rR5TgPhRT5yGY+2GaFzjyauuzWAw7+v1uhRZt37/8QnjObhgQL91alPeWtMNGrsa+GROi/S896a2nP/0AcBpCX+LxujyzLb4jmbgQnIV5jBTfeN2vUx1ZZHkEigODdW2kD4majQLt6PacAEV54f4olVwh9UPdg2ksviYjKM5Jji9b9DUwqvMvm2MkBcUkQge/KKq4fJLQj7XvIMkZsJYKdWIh4kVUsMVWTye7BZvDddkwd5kfQ2vPIaFoXs0R7QPNWHjwMTEGMAvtaICuuVQw+XQeHrtXTyIcpmP32By1XdAN9KW1jOZfsYpOOOZmogxLM+nZncLzhub46fnPSx1q1p+iJ464nXL8w2BCo6Byk/fgYphc3ugS90eN2atpNZI9q7MXbTH/Xt0ndpi0HTmUYkQEc70cD2sIkw5su3JS4rM8ptTILV8W1PmI0TBAAzgQ906gJ9r4DudD2wv9Wcef5aXF3FmY/bqzIagTZlq7eGeIAq/CDmbmlNgnhwQM14tgmWcx0JaRw/pZHDm2BWQ0UxADOhanLBIZkRWrmCGFDCAyOe2H82HjuaKFzzHp9HqQ0K19jGeeM5FzLlQ1K2e2WVc7alpBDZmHQH5Rfmcg7h4cTt3hzsERAwITMz6AWQIEBDjJU7jmhAiVA4KATlPCsgEQ0AOHwExfPRYrVkaCBOeHuUtL9+4FxYqm5guKF1XQHhptIffpXiu9FJgwyEFZDhPA9NLhOq6kl/pNH+t4GNqzcVwcmIGKVznCvx4l+3nNS9Bm+tlDQ1VMUsEEOFf7Xk0MjAR/7Pi7ISxeUE1SDgXbZyL8gJINGfiI6DzW0ZoaeWNAr8NRtYvTUgVqvNLEw+XJjxov7ZjTwsTjtbfbk3oFCYCSec2Q4QIPrv94Zb2XJqya9qrZxctzfeXfGUK6dGtUKHQrUYJPH+3ZeKm95gvHFwE4OL2BNlu29WIZ5r44e7p/RG557ib0eiphZrUAx/qDiI3Nd77uzUba9kNgv0KAkTbxhDkeWy9E7VwiIgRIsnPGmrtePMzQbQGpjv6WsuiutUIjUHMAXkCX/cwaoJqzGcZ9Xgp7TUe7InjAOfdIlpVTVswERDq9s98D0yM7Zn7xciv/OPz+SqA22DS4XsnATs7uKG3X9Q0dxCiBRQR0Gzq3F0NQpuqOFLdScg8LEgD87WE4+VPdKx40GlFDvOaEF0vWq+wmLwbILE5AY5im2+hm8MJK6sgwijwsOGRZWHy3YZjp6qFtSNOHsI4J6bxebBuFJTQCdq5L5VBo0U65fhFSLQMCbqI6LLH49RUkvuORNzFPj6bCTKAG0ij0jNrB3SYXFuIJhcHAvKURQAdTW52CJObHfcHo9H62F8gYTn19xcP6Lhoj3XJZt3zrYyHw+aig7eoPe009rdx40PcRNz8t9q0ot5cdE48JsQjeeNFkoe9UYjDPwMXpt9vTrVsm92mr2HRtquB7/VBw9uIuYmUKIHprTOgslVjjCXm3CwlQWMeEWw9QbpWSWAmHAEh8v7RLF30PO1zbSTKaa4I9S2fF+W3SvHkJ5Z7lcXFyJUg6C1dCeTlrs1O9wtqkUWSTh7N6a+Pa7qfmtPPZv/6v/5R85mJN695CLhBtLx/NG+yC0g5BXQibSjS/eOWlgsgBomAjtGWY1WY5B6m42h83DI63j/uKFI0x1wuTCfS3jdnHHvc2+ZWeCar9497J7w5SqBrhpix7x/vOAd82rU8hqlvPHwsKjCRoz24x4jfbVV881J/5mXv0cVne3wyqKHHAghdBOQF2M7OUueS3+MX/igOmxO7kStIwA9/oGr4BKltPfZYz3yiJeKItgf5EVPicntAQE4aqrUwWT9dDehWYzkPLyAvgkjAGe+miTarQQTqCgsloV47tXXOvTajUFlOIoDouwCiF84Z3Zv79SkkHC/oYR+zO7oDhIGKTaIAYssygNi/OEwShZGUFvNDuIAMlOrMdP3vbUZvWbkx6NGSAmLWODMxM24QQSIYQOgUX9jP6Xfd/VF73ZJhfBsrXscW7vSoN2eQ83h/tni18fsWBaggvfiBMoBfa4UEtKPkxvifeQNZzZmhxKYY0vPANHKacxRaEvE1gFgnIesJ4IYamfMAZ8dwhxeCCiU7n+0zSaYa0GsEZMah6axlEhWoYDh+rfEMGSaDNudK0eah9gBirAQQUghoHEefMqcGhBpwJRf3nl2/MAff7O4vPsxNF/L47ssnx+FW+HnRbaeJhg+pvHMUJvOEUAxb/QG8raV9f/fIah6BiWh79sL9I2jo26cJcY0dm828rdsHO+yhjyuRce6P/EhPTyhJKnp7X+P7K/GNNz1AJN/IYEyV1nH2H4WJi4y1+PuH06mG7R42OzP9NryDGK2burksYs6JnnORb6SZCq1aKz1YCTCPOC2HekbGO4Ou60GeNn1Nd9LuQc6qj9H9bvx8+1b3M6DLljxsF0AY4vP5I/d3HIXH9NzO91THBGsMQzO6ywaE6YEgcGc8hncy66/4L4cxJ8gi7+r7V1vlUxqd1tsH5GEhJb4Z2ZMWSfZN0fLcg9MYQer1WH/TgIg3d8dBU2Oau0czAZnCwaflNI3u0HK5GkDMNafz0stIonlzxhpEQcYE4JbV6ALzc23Jtza5ogF2icbb8pKw9J4rpRdNYeZ3wUxXwWclJGcpv8vQ+I25rGV+KtouU2j5xElgmqmw5U23wMQa5azhm2ueaAlfDyCCWABhkwAit30djN7w5JY38F+P2bdaMqGRIExdxtlmciI2fhqUMGZeUxo+wOniRTrQ25sLLa8kkdb022QT8sErXtMsYsVmzFTUCxUZx+Ns9qX+DHs4I8lv7tu+RRIhTcTG9KVI9cO0EJTfovUdVbEmwm3a8575a/FKN090gBsIvMnzA3zeFp33gNR1vNsjoNscafkq/PsHv29hSkAH0bs63kbtox/xerNjInKYo4OHiz6s+jxGBt8hK8wMct+SucXDBlNee+gwDEIkF/tWSJQDs68NFMCnGqipjxuagYnpKYDOt3hNJTBxJExAl0W25nqHMBHlojlSywAi3tzpzkUa9Z3e+Gkv46Gf8rbi9Fy4fv/RmdCkfmNZh2liksk50w1CUEiP/oiXmKZcIhqYHjA1gTuVvUUGFEDkM+p/t68z5zxz8e68Uxnh9+fakYK66aA5n7wPTGQEugzLDf2LMfV7xboBZzVd1sDcCmlraHBZ1UChNkvubWl3Ciu9HzkogEZiytMrcTOoRKtzMHALb7WEDuPk99bJguA5rxV9bcQyQt64LRAUFjWFuHaXLV+TqpGiJYwsID9gBRD6BZCiCwhpOtXvQPPozQXcoevu+WUpgIboiU/WqNwAq350J3Nu7dUNxwjzJUyMPeVmCFGBS4cSPFEUDKFvXmWL3Oh1ORPDJ0jO2S0ieV13YKJyQAgV7cXou54UCq5rHvqgwRM7gXlXYwYQ4SKAmApFs+EJKqEyVwkgAqSAzFUCaDBNDSSZreU10NP2zhxGbPjFKfc9nSeYw4xBFKhjWmE+dfTtCvhCAywIw8X6lqM0EDF2en5yCzx4TT+7RpQMRPicEJ2IDMwSETFD/bGlmcWH0dg/vZqenXNQ7ZN9ewOlRJj7+v2cpuu6ze5Xo7+KEdV8QgV29Gl79ED0XGCilwJopD/S/MKkqdOs6KlANV11pEl0KIuKxkmtba29PnpxEtNhVagZiFAzgFBTQJ5LDKDFhJbCZDB4ejSxZJylx22gDypJWzzKbes8SVpXxP7pUTXtasMEELIJyJAmoBPYfKF7ejTP7ArIr2kCMrl8elw4zIXFdHIunJxL7uM9PS65cSUgFxfsAkW86R7oVxzTT4/XfEJ9vblfsIqsoJsWecfLK8CRytb9GG3m6N1R7rpU50s6fPsFE2r/POfJ3mQA1w4oJ6q84YMI9NaX6nhTy2RV58+k8XOaO4ZArbqOF6/ALAnChkK9xpCPKGSqDycFKDzWRx5FqtM0Ix6vcQfPGSNvEGWcSiiCUkKhYULhB2J3vYLhEhcaBi5P8ScuKCSutT0zdNVlvrhjAArCnNiSMCaBxMXknFAYQhTUq56E01ndAc8IytzMTyj4JRSGDyifv13fN+aqybj3x5ptdsQHEeoXUPjK7suw2HKE+mdToP2ge089ezaoU/WAQnWR5VG2uEXf1yMkzYE+CShTBqdAYqLzdM5x4YnSg4IVjPad/sh4FNmeU4cfoUPwbOJ26S0JjLbQCGYO5TnYEgoC43QwZhLOnEq9odPheHta941LK4IVH0VJKMiMc5jjm03QNxrHM9b1Fq6WbbXZHp8GG4/GNqvXfs7lsKYxnRSvySUT6JBQiHnUAcvs3pH1hb7Mlh63lbJi1EGBpA1HTChGXYwv5w1mFZ4EMBb2hx+xlu5QMdkI68O7ggs9J6EwV0Kh6OifY/29F2tGJb66g/rnBROVzT2PayQ7WDChMOF+/8oshiNv1CQdmDehRuQZZ7tAtWN4Q2ajRVwcKTHJFEsLb4Omydb6IEUMAlZFLpaTLPp2r0Lm3w6QiK+w79x7Gy+VBRcutRIKoz/29eCUp5UVVNyyqoVQwcITH/UL0qz7n1DYUBUTpyigF8KysEMJt7Vgycz2Ao/qxTF/dEKXUdyR5Ws4wYybMOt7zZTrmsIYSl7WFWYPWtk3M4IgyDN+AeVWm2HjAvwzk5Ggxw05Qc2xyjGUvyiTjhvxvFZcnccVaNR55SsbyWxbEzDMXiYOjRCkYMERVJKjmanWDRe4IQePZgSU16yMdN4KDY9kx815bwXevgpnpVJBwCrFnYAQn1+kAkoveulWhdDhy8nrYw51F4VwGLWqmLXeYNwnw01NwDC0ZyHqdpreJhhbq/BA4jeMXw5MkM/1BB+ExlRwXxMwfOqzoC7O9s+rCb4IXMHXj1/u9STurpYxoZB8fa/vVghnCUU3BpQbU2POkkaouUbIgzL6Hh/JdI0b9DmMBG14Lk1RwC0FhAqxJYLZeBJVHvoOXi5gbEwVu5DATEW6/u3M2fJ4vZi1NGdCEQoCyg8/CYW+CbUUGN+64+YX1w8tQ1R9yoWLdOsAIY21iHnJe1ylv4wnW81J+3Nu6aB768705mncIICJJVf8xifn1k/mNOa4+noR3yUBS65aDt1h7frRbA7LnnOWF00oKHT3vnfnPCgiAgvroguWb0lcF0nMVu4YHcYVzYVbyCTJW2P8Bd8JS1x8xfzFTAlSCcdHXj7TW25fLPRrDY2H1tYfew7fd3fP8bje89WifK6O7dK6sV7zpPPcfjydfhJJMxoP94bPdhFXDRbnqwY6tzwyJj+uUTY7VZX+dX0Qxxp90I2RuLz5F4LSJ7R7yOeH+/w8Fw1qHi+kmPbEJTB+E3g5fq2Ks9/q/qbqzE7j+bw3NUdkeG3czISnerVW8+7B2DcvuWGsnq1ek0hrYDJXjWXMqvniLrsz2YFAQg9k9qDnrmpoP7/B4NKuFBdt63s1x1IuUEEzUZFUihP8P5rPa5GyOWbfQIWkQtVJm5qAODmiDffU+gWlF6M5BE1GYD8eTurP17xeL72dXLDK6XHDwo3JzasAY0tZ2Crbo68Siu2DtasqFahur0JQaJW4MFhYEfZa9+ut2ZH49InOKsy6W7sDax2sn/SRHONNAYvWe1g/8tN5jqsnHDkMsoyRgurJw1qsu1+GE9IKHGUZcvHug5pf6k/7c42tYju7X0UIBkviDmocfAsvWLd8AjW40OWFabmwmtRrxcpK0j0iq2hV6xhBuAkl6x/yCdMJ5RsWRwpMbkptW86667lX3wzkuVW/Zb9uMVaz7zr4pcRsjZ2f7lXxsbbAdomMQc1Vxa9GFNTsdLJLtg+MYFtutwbaxVbZVc2nTJjsKvE/UfzNrm3np5pG1Oe7q4GBytdwOr2WYlB1pgmmOh+Zu+CVz37FHT0datvyyMpmJ9KIBb0tIy9MjCtxQuvkhDianBBz1R6KJSacSzJ5TER30TTcT9ulbw/ccY46H/Nw24wtq82H3JwUxkXAW9TM16CkBon7ldPitOUcl+0xbHS+DTQ1FW1nfBI+CWCK+ubBg8wHJz9FOLOteLgg2LMqYgrFje0UCh6nIzdGK/UG/dXcmU+a8MzJI9pWLYatVAtenLzgcfUpkrSr5wONgg9PQab5/NBi8JNTQVC9MQTnCeHpPn2z8kLBd7I9qFrl332I2+T6o4sX+kgzeUtCooNgsgFzYQKWmPAmK9CYvPhuQRBK0nCql3I9509QIpe9fdGteZhAx1atafWmC6cT9Q16kfymDFuEsN8cZqzLG+51Y0STDJCMMow6B7tkHNatNZLy0CesykRMQa1unIiA9jzVnYjQZMoFSprnXIBrrxyYoJz84Beq7Go1gAF6LgeTIqzeM+1JRMSe8w0Ml0YsGK1jcmdyEaR50undoz6xXM5Or64PFzdzpVK01ER/bXbdwdmFaWtwqjH7a1p1+76r0bqDTt0Z1tIIAUNCoktSdwSRWnfOm86LFhw+SR7eEfoWW4Z5a5V0WtyKyY4b7xy6zdqFn1U5rfQLbl2Eo7hcZXvHc3lqD1OH3kxKhGmHFLPQ/sZJr0yHtVyTFch+J27B5i3vvyVh9N3FD/nGGyNlzsK1wYk5iKwF7hGWzLI3CSAGI3l1bsK+LzzglskDIw3ptucB2ZIaxh3Hmfpx8pZ43/KyQdKFN4xz1lhB9+Jd/VVo5PQuJvPLuGn9c8lc9LraeZ4f79KP/hXIpbeD9s90LIaxlBFdmylrUgpJLifF0w3MUT5inS+Kj/JlajKdgbU8s5ziIQK97pqX8zcpr4uFLRPVfLCt+XVTmyj4XcPdzjPbW28Z9Tdu4hY1uNuZ2oV7eF5k4IkpFLx9DNzey+F3SQWz+2sqbwSKGx7NLEPTC4vc4OKH+cBcIfcKXdLf+FSNR/iFaaaECF1w+2QFQ4uA1XIFssI0Zhcrn2WvQLZfrYxQmmrcslZmATfMCPZhwXGh/bruxRu9vyKjNBVkfT0wSz5uWdWjTmr7bsfIFyasnqLAseup8ccNQelYWTR4MqUdb9XaIcm7ODGEeDM4acMLz1HDLrvqVQZUuOEZxxy/3GVK7nTMGybliQkP7G+4kZyYcJbf6Kv1UaBxHrRrgLmV11xozD1GeI8kVpWG2owJhcZBYYIbdE4K8OqEGhmU98IPEhfxNaC2LyeuS9oM09yXDCeZMSVOdmYgSmCjcpBAAE8S1sLca0tcS3hprCZLGPtob8vYMkQz4O2Ru1NhimsrsFtuioKxj6CeglXOXHwJS7gVmTZRDAnhWvtw4yPo2gn16Gc0OyEcXYQTXevvLiAJFz2Xqz/rPX7McQGey3LbGVyWhx3ssu44t/b1fs11bWphHc27H9erIZkbiPJgPjebyAhUCbVqcMGXswP3EYOEW4tHOuWm8KMPYHxXIAlbiV1EkRDWqZi6B12m4Am13eHvWDb8XpUk4K0BZbKaUGOesJrVg6URkoRx4kguvRQm0MhXvDX9cHa5qNTzEttAwxQp/IpHTkO7icU/j0EkstFOJKwDuch4ax6o2xzcx1Htk3LIHJQdsD/1dbl9QM4Q0M+A6jqaGUf3C1P+vFd1hg4E7j+YExLHOz7FuglMmOv2l2HDfNyYcSVvsy2M+r1sM1vRHySHS1FkCHAICrwDllBoIo+a8Z5k4rLjhOuZGaeWYAwRIZgZb8Ll4BSuTSNmJtwGruOmF0vR9buTGYP3H/SOaY3anbdgLjZmc1c2coEtoLRcQGmkgLqebnjLLriZ/g8oh5L6yaQugQsjXXz4cKr1Tl7OcI5XUIXlkoJzlcb6mqmNpCOyZTPObEkldWs3Otfdp0+7Zysft7U0FhqzxycNXTZ6MhlxoJKZyNLphWqTw5lJygOXPqVeZjkc2aal0/cLN7erLjt7OdpDhX5hpWrp6bd66rr2p/12W4NSTGeU1rjz5VfXnL4cRG3ca23YckcQRMH0dUBhk+BmPu4FlH0VUIz/byaP3ECy31+fGzfXiSCGgK6DTGgKUweqsyp3KvtnG41aLoOEiTEfh495myVsZxZMAaVHys9N3hW4tk/MqApc9knQRZ+kZLBWQM2CKaDWilxGJQXqFhSsFiZtClwrL8vAiZs51PdBh1ov9WdxGS9R1L2vRRarJiYhMB0J1TROp00NSgowqJiZm0uBywFcPydTtlrfaay8nPb82bG1HjY3Hia2XGZrZWiJYtSlLtAwdOF6PKBcN2sbxbBaMEnW+4noN81aN+gh8VnwsGYke06pBSN+EDD5hqrLWgI2mCxsiDaFLZKZs+DCZIASjCH6iW/jBVEbtZe0axjGrF3vPyyNEQPKkRzRxJlmaQymFJTdGGThW+PHv3GusHUsuqNu0jwYH1qa2K0+RBooY+lFaxCIaw8e14W9pe3vpXW5pUkEZRZG6RDMufeSuV4oYR1mSYdJXNNfqp6MZGW0/Xh/7HyG1N4j0+EUo4YcDISjSgaXBSO78RP1yNfyCyommQ2o6SVB4WVBgRN/Qh0Fc4r8DZndVTuR5ggSzIyVgKL/R3YvN7JGG03x40gYqYxtz/3qaES3mtntZEqzkPDYlZayYo+nbK3PGTLM6QaJXqbimBau9QuTDlOPl1ulVpHnxrxCEdJZn2vdskj1Wc1kGPVd6+g0Sjcaty6wd/vFmdVUzRlJGQqZbsgxavb90g5zLVyJSeFlFFOnJ6FQNKC2I01lmsRFyJ7U76U/ja10ad2l2BLGRZCN700bV3TpvDbS5rTTrSUDPXkor+OLwok37wPK8hOb/m7Gq8aCmifoBG03lFfQLaCP57tVryfucsjGnekN0pgV9GixinnVlgiog60xiQXmxrbfWNy9xd1b3IPFPRD3zu4Gr5j3xLcdZo/baA99dTwXsMSEVDrp4DEhab90WyO6o4O+TU6ITT3dMxGRAvQtD5EnJsa7zoW9XttkAIrXMLDI6Wk4ZbJb7jQkHwxaXeWBR4XdkYnL7rBwMOJSKhjRID2nrESEiXt+g0hEGnPGaJOYMKbMzqgi2We8nJQEaKU5v4AlJs00J6vAZOzul1zfJybFNzu5gcmw6n2m7mC5DKweXWkqkyUbIIuA9RoutoUJrwma5syOKeEdPreppdfNRsfcfE7KsOJxPdSJag+xyO09BYQGKXvkDmlC0c85buF7ieuh8L4ckAhvQYEDMqHo2oRiqCXUymu+xCSyFZjLtcDl0Ego2AWULl8c17Kz4dsc0gjCdMjt0d2rDijTjoRuak8V1NQRSujW4dLXA9ckB4KylE3gMskJKOs1CWpe5A0oE6KAWo1NiaPEdbo1fGAvcW+NHUz5M3XyzPZQw/pAQXexA93nJ47YwDwAM6B3FooiLsnrZHBblsbZRk2KdY3bm9ctEhPeJExqIJqmzwOK9qJqSkL1M+4nJybaCxPxJjHR38LkeAzue2hvjrUdOqXrNWIyQleN011cGc8UyX2C75+XPE602R02a2dP8/JvELCo1vSNNz13fkKna5gkodA0oRwsosBdgxAX6U4Q4Dv1yv4Y6wMTHTCa+t1nfRG/1J/m57qTghrc5tCxfkQIw9r+CYUzJRTiqMOvGKoO98fuZHpKuF9qYZPCVwdl8a5uki4DY3f81DEiSFxW7zps9ESpk4Afyw5TirGAZCjGZ8AP93rvyJqGD4EeJlGtFfkiZ4jA2qQa115dFqHqpK4zjIn2wQru0U1qu8CA66a0daNbW7Xw8NCLeZTkckNeUEgb5mIg6LoJR7pGzbFwJC8BXjs8TLnnNSqgHKYEMPmENOBDgqEXXxIMqJsddbQFs6NwZ1fO6WZXbuia7ZygYAf/bGYpcPAHBQ7zhFrJWkuXoz/cZm6cfMbRH8zsQJ9xoCcunDygHJHhN1YEjsgkYIKzyDp/nnGcJQVrsYW1GKeSoMDasmFHF9hmTDeSAObWsIIncOe6h+8cJlmr2dJqZsfPzI6fmR0/Mzt+TEa/W7stOM3l5WqROVfVr/hhIKlgouq5xZTLz0VttGwON9PrZUg9sj3WfdkeVHVd1DIC0d58WI99qxvbHNzjxVGdmDgXybqMROjyg/6UW5jaVS9bu+7rgP2+qcdQYMtUcVUL1PMYSyJC8u/LWPrbydjy5HIw4YgYNR23tcMK5SCG29fWKgA9FB3Mq+DJDzZRe4zKbA/MbE8Hm/GQRWLSlcw99MSEL40jp7Z4OgT6z94riL1ZdHWw4+nVmkvle274Nry9n7RhtL7hcfHEpCFZoVAh07xgmM1pXXZjIsK4PU9XJR+Ins0xUHvf3fxO1fO0VfKB5MkHg63ntm0gMhz1vFWSiPDq3myiBSbtMRWL4HkLnkNJirClzv4Ogzho52gOJwdBc6gwCaIbAsrlJ4NH+PIbwUNrWG6H5aIdKiRHSszdikSE241j2l05nfM4XOwq+0HGWxn9nK+cpRQIAK/KMJZOuENaJWJwnbUqRTYX67q7kgc89zvhxOnfcOyLttlrTyi6Jid0WDxxEWYSF3ZJXDcyza56UOCYSQpw08BteBsskb0QMGfgcpoMwjayHrn4TVwYIul6qDXERJbBK9dBmJNMQtFzCYUQGSfhhIlrRePuUlIA3aSAPkooOiMpWJ/i58CgwMCcUKuF9x47sRy5bxp0GfoSivCUUGiRscVah7ElKcA6CaWrqsostzN2gnItElCuLxK6Q5wJ3FsLxV55UvhicM1qRrhmNXNwBTkDlYvrg3KjO8PLvJ+wucQmSdDkVn03RdNa1mwDB1naO8r9c2dOuC33QwLKbc+Act8ioNy3CCjNFVBuDwSUZgio1bilbvH0jNfNeZjb0t3pgqfTze2nBq7TQpexOEMK12nh9qZE1+xNBdT1hdstClxndbcpE7hWXjMidltX5flc6OLi0RwfzyYMfkGIk0BAGY4E5UnDoMsiLQHl912djyu5n0k5soXlyYs2icsQKJ78Thy4PKuSUMuNlwGEa65oJ9TZ01wmTFxOlKLLz/OBy03d3bZvuQWmVySXmTW6Bf7KpHCiws3p3V1vOCpHMTtCQuX2T3x8O4tRUnv3KrYOWyEwBzn243u3edXrzYW6fUyb/MS3i/boGZ1D4mQcmPB+YaJ10oS/CBOwyO1YrDPbwwPUHrDERIIgTMCSk7ceLK32gCUntBcmYIFJn+zNsH/v1gjZTc6kR3aTWB3ZJQn1pnZqHXmMOCl4EzJrChk8XWcaUyhGJfvNg7ynu/f746524ouDisXnsImzzPWvpznveSZ1ShI8octIPJ5/uHz9f+WKrZ6HwLA48dBbsDSxKqCmOXoqm0O3gHKSSCiI3h3PU8d5/8AV+s+2ng+GuXA3nORU/B5hJjExUDeXz3VnJSKcrPviSJ4uHmxz+p3kNCMtoOjtEMBaVO+S1dz0qh43OZKA6z69QFYTSFwrrpmFJZiJqvcnvdpb0zWltHf3p4tDjSf+F/cnQkWTLnDSRv66xv2x5wd30XYz2faHXhJMGltDo2zQRzW5+sdowjxeQd8cwkxciJhQME0oolBAmakGN5aNS1xL12ThosuvikGB3/QDymMt63740uKSxmgBSfanZ3S1aLtMPKBon7jOQuZTauCarF1Qs8oQlPoFBasDl6cnJaKul5srp4NZHouXeV8woZYCv8UGLhNRWfzEaChUnpoIAiYHFdSaxhxeCgo8RaQkgx/8EtVqduP6t7nZm1FoXm8U3dba3K28hcst7aDAE54BtWOotWPIvJK4e+rMYkXv0TB8ByYC5V55C89Z75/u2toywlyt0f7QLUtIGxcFF6dPnOk+feElQBG8IcH9bWdYawWOgbBfa4RDoP1aZ1sNrjZ6ECReCX91kymZiTkiuCRBNjVf6bIp3PFV02EdNS7k3TpKRIzd92ttBRnl9XgkoP3KbGDs1/MFUffrRUNl9+vllYXODIXN1ewDRHi+XT+xW5X/GrKbq/YRHfjKaENX/fL5/GHJWi2ovGX6FypDIWhH5emBu1r7oIxo8kq+oVMl3xuUReX6DlomFFInFBwDeoShA/oZKdY+Xn413AQ13AQ13ObOCzcL42/7zco4hh6C4GagUJ0bK6NbUwlBD18QlgT9DDOM3eGikV41n5uYF1D6aEDnhul8gwibdLEcSCjS5oRiTSfogmFq9KTx6+q7QzdvLw/d4nw6xeST62fdDWQWLRbLL7DtSUVCyppUp36NtssvMHESMjaYXe3paYfZleu62dWtxTUjQxQ+GMkENZIJ6ujOXK/riWmMARl6ODm1HQaxuwK9P8xmlGlsy/vF67Jb1j0weUpa0OS7tBypgOGQZz7rCT1frtTjkdPXb5Beup0Kc/UwlHCOIqgZWDqZ+VsU3pQJ2tuuNdHtoCs1zmParfONdgfrSJ12x0go6B50x4CjPdqSSuzvbS+3eygdfHgxlxQvJkkiQL1qPExH2bj4n5vpUgaM5jGpC87ZeLIt4t7Y9oXzVOPbdR1yGPJ0Gg1ahtAsa5ZQi9uh2wKX0TChtpu+wo8PzzertIxCMmwQhL5aUb7C1olrPfOr9cw/WGX+ALG7P/3xbz/9+1//8de/1Ubu7rePhJm5/2AT7YDCHOMUNZazf1WNvGYmlee8055QmOc14WGq0mOUaXkXnZII+oNEfmg3J4mZKVzSmylcB7td15jkYhRnfF0grOasxBRkbDsa2m0qheRHONVLZfzxcOt5Eccd5TiM9XsrFF/urAm/ukQ02VNx5cXa9gFyx9t0SeeH6MZlHkv4MwjnrRmLy5Dx+Mt5Z5pHt8LcHanr5oklzrnyxYCv3uAbD+KOfe7O4ar07eb3GI8hkZ18F2vsJgt3YXO3xRfoNB7rizBvPHbxBUFrbBJquCZ/ABfpWb40jprHAz/FlbT8q4nEDZ8LpD5Sa2WTxJWdO1b3cPbIqA41syDLK28BZbfuD7pEC4MkdEe6wt1bqJGhaZlB3z3dmXW5ROCA3T4//WqqCodkn9dOBjdZNq3X2Pldc80V//HuU/dxQowbDsDRF8YdALdrc2huOniZmg5TxnnzYKopBtJrrsUDTdPD48M9WsqYNx2SgNeiTNLbH9oZDaCtT9VeYu8IFxonBSOScE1IEtRMaO3M9bqglpvrde1VYVBJsmZ9W2vBWBdPxdRY0Za5fbyclE8fWnQnbLOFacbnl9wjf/FAwsJZqNm6/mi2SGNC8p21xQ4Cdve6tgVoUoDYCbUyuLV02/yycUairwVd61UNt2lNeen1cfvp+GmLQ4JJ1gSYtumtwtwQDArc4Evozqi2tA64dHGyXW5cBy3d5kFr9lIirX74FXvgEm3FdWNCncorrggT1/XxinNA4HJvIqGWGye9wHXzW7uyXrJijrA/zK2fzRtOROOy+cIvEufNR+Oxc1OsS1xb01Ubs5MrTEaRaL+ljdT+9yYOzZe0Rnya4lli0V26kSSoGc2Cmp5eXJnV2cNGZ+9ql9/o4fgxTyr/cDt70ZZ8BOWpr31AmTOe1i6bCyjpBpTJYkA5FwWUkTagkEFfrdsVoHvh8gjLTKffLji8A9dDYdmkyx4LClZjfqVMCtYOPPeRuNBt3FuJwXLuZitTY7VqrFY88hHceWAvoZApoDwIklArg8lgggJnzIDCP247HscJXjzZn1ArAe+H6QFb2y+84ZVUIZXaA5aY8GRhAhaYPN6YUNtfvF+auNaCJmsRNxabDwosvJdQaxke8kxc6DZ6rI6upsO6MK9n7a35eG4pmPDKVULhmP3KhyLWJ4z2lKCfr6z78KBetOe114SaDty4gHwSlLi3quQLvfaBy0F/e2K1u0Q10UkE4C1jT42xxXzQP5m8NMQxPiIovGEvhcxuaVCgmrcnvgITCjG49zeEJSb6T++UczIPmrR9QGnlgFqDunAvXGsYnq6XYUxRpdSBRpQM1EI2gLbR3oV8Qa1cZvIPClYCF/I3Dzx7HTLwRGBCrXXd9CAKVl5OD6eV7UgedQ4B3JwhqDWj93uT7QVdjK3kBhVOKl1gxeXVsyRg+4HXYAPXTRGCWsF49SwouClCUNtnvIycFCw3PvORuCb+bx54HzZwXfwX1I5KlmNNCugK3bqwml17udATam/jCi9pCtP2OWclYVpX5KwkP/KYnpPVlE8th6VYPCKhtJ/bmIr2sF/f+uHh5s/NA2/a7qMywdose8rl9tcfEGETHYXmPNN1zydgBheeI07o5i3exglEaPtWk2Fb20z/IZnpKx1NgP4hGQ8fJhTMA8qjrFo4DhaUJGVpoe9steBhQYjUHZ9PNWIyecNUrzdk67bBxIxmSQ1djNTn41fuw3FQNmNClHe1EJby+AES4gVlWCsMA8y0zP4tdtMru+ACFwsuJtRuzf3H4M2jugmFaRMKsyQU0gs644nlkBaRIlHBLFCdDu4Ao3jN4FlBdgayAbXD2NRtTVxPwVlh1lgr2KE5s0PTVH4NGVrLrTXcNFBhB7nt+J1sOrLsT2oLXW1bOHW0dfoICorCNfZ/4fNWqMm2b+g3tn1rwCcRiGUEOH8XclEjiaBXXhOZHrHR1vmEoNAtcSFsQsFd0Ia93y9cQilMUO1Vf6WOQUGTsoqm8wFTHViYnqbj7mlCz/7acm9dFNN2EThJJ3f8NKDO/i1fBkoKkGt/Oj2amfD0cNx73Hlt7eM0LpIm4fLzdkiARDTlwlq6m2jvls2nR7M8FS+zR/m01b3AWq99QBsHNXvuwjV77oKab2UBdXQPTAfHj6wvBx3d1enGjJan7YGzi6H36pRnravGlpcT3mnoju8U2XegNBwsaTPJSREGCHXOgcFgr4ciOaDGcxsfP86GAOd2rp71fNimNsH+uVmwW/b93cUv9DlV/N/d/6of+blQZKjaQTkoTxPEe4eZt74p7mG7vmeidvfLcN5k1Fk1H6crTsePFyK0rtUO6uifZEnoToXxMXgePpyTb3NH+KAm4BhkPBSxONozsU4ocq+EInlThZZnpnQbPsyXiAhOCUVwCiidIqFULHCpWEARYJMCFXtem6vQW27UHYQIaz+vzcN6t3pnnHEwoVAgoVAgoPz4nFBLgfcVApfxNaGWAg9ABC6j7utX0C0hhuQkRBX1nDrMGfVp0UPZ3vTm4dNtTSBRQeDQTaHCoZMApluVoDJr38SFTyuEl+WyQgcUzCZw+DHqjx+/p9ruLcU9OiLaZ+x7p0fMVb70tvxpLy8edbn4Z2e2PXoomtaYh+7h06kGhlZ8Okp1jiZQ0UFJwPbFHn2RuLB6QmHYgB6syQ4wWeLCBgmF7yXUynCADLEsuNQfS+QWwh3vjg/uCFyw5OmOgN5BlezkupOOt8cHYGb7TY2a0C819PDxD3cQN1A/ADWerE33uzg83zk6VpAPX2vUkc4EGdtdn62Qn8EyLA1g6PPZk7UdyPNIQYHH5BJquX2xo+GLHQ1frWq8PSNujZWh4VG9xIXGKvrl/LvhAfBs72wzt1PgfL2ue3kMf69S6PQePU9YvOjD7ivcSHznnJBHWi9pczQuZNzdrSDDmXYMxBdTrDdQIylta+UCaufhOdc5gWu9d86zRYHLU0TvFGgWijazphzoN0dTN4cT/DBgPFCULOCdwSHN6WjvGpFyJuh6B31y/jz/unG4vOYS8vGaS0JdNyzoj3FA+uLksghzJfriXXwRvwzXwASq4eIG7OL3MLXEW2wc9IbrmtGZnROqbBxmZx2AulXJQWO+GyvJDRdqku+GC8JxPDhJssmuZjoKP47E7w7EG26hjlSmYsOkQIdaoBTT9fVNg+Aynn2YJI83Od6QdJ3jZZIUVrkpKaqAJBS7Pgn9aHV9sNDPFto5KAdMcONeTkIxhSTUTQw3vFsSuAc37G9sznPDs8xBgedcE2pHG6983OqVRKexoKAwdvboKHlc9a3ZSmSMiQQ1JhIUcTfFM0FmZi4GCNcctN+tN+uPvRkB+vhhArGg0DsIu7WmoE6NhnfjtQg3nq32TrVmY9J/4ZoIJyhS75DWzb2CWs3cGli4VjOe6E9uVosttDg+3VsrbK1mW2h2tx0S7Cjx3V5mmfjc2sTMFFJxFT+2v3ghMFwBNPtM3fr9RyYNSdna0aWeM5t6CuoGRfPF2tylyqJgbc5T6If7LeK8dGg55jvvoy3jQLS3Y8ecPO+OfhNBFJwNWo4oyfXpmYFaBFy0aO2QajmkRNZTdc7Y2mHW2mFmjs+/i5t8l50Kyg/uptvcGTXjnIZTjWPyLRLIiKKDOFQPqsw3lcN2x/W9XRjqQ6yLkqYGQDDlnkxCrY5ui2LW8ibGaLvaUHKtnkUGgiEvS4xXKd+8QRltH6Cu7lVO8OGQj26aXerPvOrpd91aISu4Dz9M9DyXqr+FpPUEBgVN5MPhlgkp3LJj1rplh6C2d//gYln7BzdkzZJ57K7P3VnS85C50HnY4QCKuQOrHjQleQLKRKtrThsuJgOXFRkSuqk9MKFbB71bW6ilcGcp8IpacOPVoYRaCvc7J8MJ/v3YD9umr0w7HkwydSe61l40DkE4X3ri49Eq5yVzHvfq2qO725wsLQmOzMDl4BJ0wW9VXTcVDRcfYb4g8dFlBAsrxMILwYxgMuL7JdVswfThrYR9koobogumGw/6fvTGCk/iIP9zLLtudzRLNlWZhKEvolrF+Am2+TnCLJBUi//oRoO56/gNtVQlLtvmPy4caXX0kquZWqofJQS3ndh0E0/0SKRq3mjICt1Jnu7Yy0zOZZdrdFpBXptQsmT5jzQR8vaEutBnrpoGrl2BLW2+uGS+mBRgsoTCOgmFygl1aeDSpoFLmwYu7WprycwuuLFIiVyxuPqUJ/4eDhSETjDz6NNThJ7RhANjqi0j3PbrVSkIZB1PYdynUkvGv1CHa5/Xsk0bqDgtFAuSLCcUUCY8ef28dW5v06ClTYOWTIOSriULn9XNCH6LVPsTw17q4Nz7mtLeO88xl7NF84ZROB47cQH2xo6CGzsKbjgKsraAixw3difihsubEJf+GMmKd7kbzpddF4GRnaOaqk0NfX3E/iWdyegfY6BG1145b1Fo23r2e+6AB5gxMLe5ec8lkRGeX4bh61Q/pfMD87R9bH4FmSDOHlRtReZMiWoJuLMRzcIt/5qF28xsFvwQdMhe/bWrzSwpTLnaWx0Ooid/1ikjtA9MjHpVA4xlnf5cl9XbeEApt58sEQ6yII0x/mAq8K/1Eju9MJpzqgoonC315WASLrdt+p4xJtrTARMK2yTUKsv9mf5ughcjV0hgtTXboMJl8IknFFzHcDtDh+MtooWaHQ6x5+JyZx4lClOZBaegnP3kazD1frs+HuFBQZWhTO1v5LA8UZZEnL3b9Q5mmMu7ZjVUtzR5Ne82UGGxXz6a6ieJSuVuNa+BgHjxrbkkAJd72D26r5ohFxxJZHkDL8lyLIkAR03gMiENaWGuRIW0Qj2xhxMXPZy4li5jc1Dg7BpQOn5CYfKAMjhLBvNUTuJ6Ck5jXsNPAk5hXplLVDruXKdgwUu47Rq4oYP1ptZ6iNyR89lyZmpy6at0QxmEWg+d22hOe90+mNPbyv6AKQ1MFhHNNzUrNYfLKIU48YJRFBDhW823QXVXU03o3kFpq1PbOgUarwE/ytdlnmOuhUXFxKppLlJJT/MmdWjUHKxGt4DeP5rcWwWPTrcXrUqr1Pj6RSEJRtjsLm5N8dG7B32ohDJbFlrIg9fCrdklAXC7e9JRX4TbhMJnE4poGVA6U0Itt5nlxqPJ4za0ywuSPCJDQuEEAeW5kJH8w46pQDaBsccmLjfMJlZhDv7ENdK/1/PT6Lan90fO0+Pe3UWjNwVsGyOLKGEGuxN9VjoYv+HzjMm65vb+YN+oW7H6gcbYliE220PavqVeiQn3ESZaJydAsz0srHcAMRlke2Bme/Rbv2ohU2KCqiT1mBhUwvTc0X/ChETJHePg4p0WJu2l/szjzzJWLG38Kangz3W/Si/KoFcGWQop+NFHx2XR/NXayNUjFiOYKt7JY6mNZAR3V3uYJdr7buG8qfYwVnJCZ/Ur1sNITBhK3UKdwkzoLD0dCI2SJtoL07o0g9ubHc1+5v2CNJ8VqwFURoGooUADYYUJT09MGvrG+z99TzTZ+eLOzu9v/Ehp2SU3LLoWcpqiWKsVul6Y5nH4jCiwXeLCTgmFTZICoIkLGRIXeiWuh7oeNA8/JgVn7yOTrxzCli5jReJaukwt0jehcUjGoZ1QazMmHIlrrcODrIHLYZeS2d7kqEkKHtfKS88PCvTyhFot6L3v79ZXMxy17JlTJuJnBI52gW7QsYsZx3jw6ermdz3n7b5dwGO0XV83TXmea6gaQ3EVfqjRonEDrRMKFUMdumUQgDpJwDGbtXe1CPHS6KX+lO+J8RxpjdGzKo41w6yFJn1jpsO79azF8bqeiY+00LMMkIaVdw7WsLM5dA2KcwiZUAiUUHAP6AJ0e9bd4Yn6bArmshAn/GACgXoz4wbiIy0Evz101huW0CSEXELIhEKghIJ7QPnGYm92jxNzU0sf2wGrGhiofM4+oSAQUL5glVCH21xDXdVmMwI01zjdrVEOUXUIy0ad5hrHwNX8umakIkI1SKI3110NVWM4jj4L1WjZ+EsN1aPfVsUVbBHtV1A8lITmiQolEwrpEwqxdLPcbGWNV1q++ZJVqxRtWQ1DUF/RZKi6++qj03BWy5wjSiLwnRexRiLmFmq09WKxoIhwzYXvuC6U38PMy4W6zvO+MZZomDT2z3ovzqICKlTuVaVw25rAixF0QK98tTNFB4KgFdNkPrIBFyajDWLfo5YhJDNDTlCT6gQU4VHycVcvyPKyTkC9Lm7hKNx1La6YsTphknUdwZKFiYqOCKoc0iHsrhbgpc/Gw3PmdGUQREoVvL3wE7gwtSiYYjAJhU4BNZE8oDBV4noKMMD7B60IoZtWb21tKmEeifn+4XbB3ZOjLVWxvr5iHetEhR8HKoBxDZbOHXe/x9GW/xivgLm76ccu3s+qlXt9QqVEmPEIjrk8eK8HHDsYqNtvLzr43cNhc8GvB6Jgbkq+328bg5wk5r93gjyuzUWgGMLo0qwi3mNCvX9cm6+FQQHmv3/cGGaCGgL3j1tzWyHIwmxCNYeJ7x93hlkQwAdioVoJ9hME0EX3j3tPwKvAZacIGBU+7u0GbMNldmwLMGJle/RC3zDbSEwYVphYdwWnhvtKSQAuM+5mu3Ek6pAt9YAcSRyS9C33EbM9MLM9gqf4A/YBKqS+LLSfJJFvSiQwT5GAme2R9EkkCJCYSE5Hy46h6gc29EUehII8t2JG8uo4DJf+GqCkgt7sTV6s7Vum+dkc3a561XWUTUSYqGdV3EREX/QslJuIsMqo/2je8WavL0218JZlcqMlKsRKH+MOaojGfSARgNsGJjewX+p/hTq1Kfv5DdROOsDUSuFlfgSZJUknGfSdKuTZYcBkp1/QRkGT5b/6uY9l3C961aPD46C2GP/C0jPbvk+XX2tT5EiH2hL8yDQ7ofD44giue80HxGSHsZCErYdxMz9xwY23hVOsGzfozU5yioXIlqw81HnhkSEpKHDCiJ1ZLt0TF9ZNqDUYp7nEtZJxSJdes8px+AZhDtWEYuAl1DoUx0zgcnwkFN6gcoAqJ1G7b0IdrllGC9cctfj0/mgCTUDB6/50YNzYMuB/uj/xOe/N7v3Dr/rFUoW9Ho66GQ9tVVXyPbZXEhUmCCj9MaGOmSkSvdn1XVdLKwLGhglFnJSLmXL5iQsnDSgzxIAyOUkoIkBCIUNC4eV6lu+e4S3ev20v43HWcnJW77WOO0LDXR5tTk1txCRNDN+EUlvx59z7cGp/i1T2Qdxp6UTbSCeokU5XWw10bqQLayXP8XFbs0f1cFJTw1xQy8YxF+917YzRXz/AXE03329q1pkPJzXd1k1rNzEND3l3hEe+gyC3gxIKCRMK5gHlhkhCLQVWxxWu2RxPqKMwMxR6u8JbMemOiY4R8yHaN7VZ+wVnmMSE4wgTs05iIl7qgwnGfkx8/PSe7RFENWOkf9mn7vqWRyWSDEKTVljw8xSD4SpMA2jfMrVMTlBOpoFhExP8hQnDpkzAjPYMzSocdwN76QEn9EwQ5USUUK5QkxdIiKzVipmVtIJQSRO6iiZgKRSg2Z6utWBqmpjgL5nQo4lJP1nw9Ehior1o+n4yHsFv2EkT7VUEGXwCk1vo/ZKwtB1oZnv0ndoDlpi0HV95S0Qwkjca1W/QbdGaybC+3oJ1YpLm0puTsUtKWlfiAO1XPOCf5iRqCMVxKwIwSGJC/X7FbZDApPqHbllynvHwpV96cmMy6dG3NYY3dcwPVD6u0y/9IDbxRtchDU2z8s2ZyDmdWeZKKtXssXRh0Ognnq1LCs6jjsRNCvCzpOCG45H39RIXDpAehOVv4DKYJy4P2iTYGo0BPQl7XJgy6cKUScFDrSl91/NLSdK1BjZ5pszjY5v186ONY0ezZAm66KKQjMEooVZeBpnAZZQo9oXZE9lDrdkZFIKCjX9HjuLA5YiN6hj36M6EYiTHfViHKyhx7ae3LqBwyk6reH6xSqjHhc0SFzbTQiCzxf1jHTuE35KjKpMPpZXOxwfMUiKbQqzXTc9h+uomuU/RgBKOxrDLOEWDKtsPepLZlD4V1DyrnFDIllDHbdnBecaT3cOF15cdZK/GskNcTXYYcgnFoP3OBds3+mDJMiNx6P3NFhAqTsifW+SlyfP/GJ+7ps9Jp2t+l40LqG/SYVcMvn7x7pvHG362UqDL4iJv8tMGd9lQ8V113XGghwLowLgD82MEYdCwiLmLH1AMO+GuPljoLxZq7b+i/YOu+bIeUFo+oLCoPu83O2yQaCIwDw0m7oY9JQpbC905aEcKg0886UCqaWEiYGTt2W31/TnrDrOWlhspHLr5ctqF1RSq9dvH5fVv4G5OLsiSi21X66pc0+x7Bu4OuFI0RdBOQ00mGnTo0oTS9IELDRPX0V3SMbN2coqSmx1ZRfnypB3QshdqOiSci+eCxdNE+XERcdbX7qhkW8wF49dMI0O2wBAJsd/wBTOHJB0Ta9wN2tCbOxeiYK7LJhQajZ/13thh9sreuHggxogHZDG9XTzFCvZQaZ0yxkbq35QofMPkNwzZbxE7bypPSYYg/hax87HEKWKY4Uftxj3tcZd7igaGKSohng/avVjse0pikP8Aze/pihDxQzTfGEzNFWNyd2gaBhhBTQTVYGq5PZa4TR0Qx34Zyyra7hAbjLh3j6pRdXnSuZD4c65rOfbJnQmSIoPAIrlM6EwoWCYUFF5nPiVx9zrYGCXmyHySDcZDQuHYr7Okt5nDn5Pgl7pHAupyp+Z6PatxXy830LU7PSgGoKhfrwF9Tedl6VNzC4KuS0yRpzEHN1+uJIIpADXm4GrxkoPb5u18DR/oDoIiYicUIXf0eT9V1GonEfgIidjJwBIzrtXOD8Y/WjO6Q5w/mLEl6N5wW7Jk6NuBvQQmb/gVXVDirOhQCYXhI2DkhDZFHVZOOhhzAWXFn4DuMEQSCodPqPHldsXKVoF7b3GftsbgK1ZcE4WbA3Cny5HLPGkmd5U6aLmFUXtjJP/hU87nPQp1EFQ6bsyjZbo2Z14QTCiMPfpb1EAuip3naVcAO4nQ3sEQw15TXbOk1wQug0FA4ZPBjTuvCYUiCfUUrAw8QpYU6M+SgXuhgcvD1wm1uvECxovhz1siUfyt9IC5m5CkrSL84hu4vGIXUG6oCmrKpiTUmdjURUpcdL6gvcmJAlo78dp2cc+kxswh99b/VcCFdU50XpGxPTApu/2KH4dss3vGhzd5m8DWplV1wVrlza7b/NqJTf1DwMxmQmfV1C7KHNbsBF1gunqdQRYfM7eKsikIvlSeVuZ2bstIJLbLTa3OOKloRp7e94qmsMS7Knl9xbyp2YTgSwgeqbYZBsLlvcrpeP+ab9FeZ6KcACtoPxJ9edLiMjdrxy2Gszk9QdhkfCXge+ZcMQcJtZmDBPRgtbmtoSqmfO7EcPyiw4fzoBh/c+l9cLmr6UWnrfBoUUJdV874yVe4M94EHy92S6TppF9Nzdh55eDZNe82qvKqJypVMPBnI7/2oGqorjOOTM+96wbLbMWm2mfhaW8p2fD2/kedq0ryr9zTsdHCtJYwCPJMVkI3FhcUYmA1lpsxqbjRSp3e23AyCGpkOH5laqC3b0+UVlnIuoa+G98aLS4bW3M1TteppeEsKEZHTe8HZ4FkgQWlITbkADY+K3OCfkF4YWVfmCggXBMFBP0v6KkUxniBMjbHYTYDB3VMceKJLpnNEISk7GyGu9kjoR/vi9nsc+0Er6m82Qkz1qQLuRorLZ9yS1zcOk8oNAtoa805N1Dl0Exx9PWYp07j3RSTngW0NsvakTTZWXdyN9kTSu8Urhn/AfW4mArH9HnscrNuXfPkR8jD+8EBZQWHhFp5riHPmguHoMkRKCjPs4qTarTUlh9VGyfX8baqUVaEzS5kQpuackJbC0U2fNq4B90SSrpxTQ169HMulTSHbGe8rXIKAiA7zuSRxl6+ykN056kE9fihVkcH0tApSR+Kf1Nlocza57WYJXxtCZu799Ico0ciNA1VPO9kj32t3i9RKBNwKDf3MvB4zWi8pGOt5zksHAfd+UH/lr6ESiedvGJfJhQ9IKgxX0IdXVOP4PTpdLVc12aKontN1tsrfpLpd42kD6N6yQPQ5xndNlE3DnVRA+/fb3+9PX76uD6d6p+CCsNNQkH76XF2dW2hDCOByzoBT4/NiofaR7cYP1UefhnWaK9ejtx+2GBWS3oIbK/oDQc2fhM9zGY/RG9SPOQar8gN+2lGPEcuLtSby0IFjGBZwPCFAl7WflDACFIJ5tRVwBh9BYxRst7cb1p69edfGCgf1hu+1Rbt53S80Y4vV23HvQV/6fa5YSHLJM4Fc4AXvPay3m5VQhaK12cozJyYLWcY2gWMQfXWkYr1Lr7DoMm4KRS/58zhclnVM2Alq0JxW/sEKcrk6N2giCCaFNnlwmWlsYILfQIXTl1wIWngwtMLLqJD4F7XqhZcxJfAxZgouHc1CeGyOFrico+ngKFyAUM70w+vX7jKvrbbff3znBW7c4rkFnnhbaw1n7AAt3DEbsoCCII/opNb1IVKnFc2J+0D1B0SiprquUVR09US3vaIngqsSQeNGYdgAaP/DsfuZD15Noe9D/fTyJiYDvdaPE1QhsUP07gwRirC9X0BeyMtoHbBhoYFDF0KGFJ3x09TKi4gdtdNI2O8Ht6gjL3AwxuUuX4+70SGTt/m8C6ApuaMlQUMY3eT/sGNaz0QM2W8Jfqlm3amJXqrm3Sm5Rc7WJhjpn6c1QvYOxPXsAUb4hUwnKmA4TYFDAcpYLhCAXstfaSfmfQiAsjKa8kd82TJeFvAXsuV15J734WI13LltWS2n0QYlgvYa3kDByzYvi9vfO/cTAj41fmg2WoOlg33eQrYym0quhVsK3fDiq8F28rdsN5qYvuJppl7AX0kafhFLGkzaBSw7Z1mab2qYSXTJOJHQ+NHQ8PRUDKVhe1LP0gaP0gaflgqycEEbatl6+fDlhveoXzr58OWG+EF27pPy63wgm1Hg1liJbbv+db3fMuJoRDxAi5t9Gm9n7TeT9qljT4tK+GmJH4mMWUNC7YdJK2fSdprr+W1Ga56CW+NdaAKWGHv73Dc8mz/Wrmp6uDVrq1KWXDJQzfZvq3bJ9kNxEowT0KJm1ncSDAej0oKexAWhVUtQxf6PtXQJMD3oo6Xm86i3jpe1zVqF7bxvPiejoQFUT4kqCfut6eaT0p/C3PzgFUi3oHN+r7Rpvq6JlufAOYz5m7PN4mZrQnxmDFG/RiPkqWawz7BbMYQ99uoYkwkVU5U4/bNj524LFSQIZPKDx25LNQQLl5TK5/T40R63ZPRuGFeNG5RjTubrkP7JY8IHY63p3UPjws+7RUcKcH0r5G95fo8ZxmrQzfN1rtca9KQEJJL2xSS3woLmPNIEuFMnGDOfwnGSqzQRu30AsYXzgJGkacC7l2Xt3NkmuNL9qPjjL0Qn1E8lT8YsL6hwbUfn4aDXyNxc8alX/CUl3RwHzQTzPTyqFu6GRFGNro0iEHc66sERSwkMYxI8iJoJhe/zyPioJLEGY0K2GMz+5HcM7PuDAsxJ0pkT3mChvkgG6SZ9e4PP9KZKhzuphN9uoV3hBlMufMEmz2swOZ8MXprXR909IXbL4g//fPS7KwHAwb5EEcvJdcer+3TBvN7wYWi2gScwkVXSbQpXKxxRhXH20dRcOoq6pKd762YIdw/30xwsBFTdc2hUOrp3b1pIGZicxTs9X7dt6P21SwNc98srVu5dWJ0GL2a7KLuJ/mw2mLKzwzcEmxJcAkmSZDrxwK25tNlhJpwYLccpQn2Y23Okv6BPff9u/DYa5OD69PT7GCc5EHfVKFObz7hr+8fZrMroCaYr3WKAsycqM71HvT5C7ZTbVisW7b96YE2VnOOin7Jcl4SQKgwwnik8vNnZvN6wA+KKJ+fkoOxYmm+ZKUcMKVEntfadd0UKx4wGvWIN39K9m1KYfZz3nY9PW6ea85pLO5jWSYDNxfIeJIymMGkyc1NKOoxJhOJzXlGLmMCkCgwsOmjt1XYzS0iwBk/RWB2Pprn4t34Oartrp9+BjfN300N3N1vL9Z00OA1cxm6wBw4ic0BUcBw/gKG2xYwXHT9sH5051A+qC7Lpf4MU9rF6yoSxTnc5+skBoneOWK1peL7F50oCJq9nASDT37p8jRMJA8ajOT5DcfToG+k8UzYD9I8wRLf1iYo+265wUZTfviboMHFUYqBxVF+0pqgwSWTaBhHtT2aAUpekf/V6fvXn585WpIwujA+XFnZ3LAIEpwv8xOVp2HGUNDg+MxvhJ4Go3R4wYxxtYC3tZ/HR7EJytYL3HHa+GI3QcN6wayFF+Qn0wka1gsabzyXp8oe7jNKgtHjYabGzBMJ9ticJ5II54QCRhcUsLV2w9PmBdvateHX5YLtLWimotDSTEUB9mGvMQvKwPYBzn1GCWwfyhofynTDunbi1JJZZgEjahWwt+ANPLNgWwuaNLiORK/nqbI9Me6qTUxY5tD1JFFDQt+ImqUdSOaeoJBnLEceGq958jSRJygD/JbIJXN8HY4T4nZUUhSWxyvgZe0GKSETtFCHi91EntckCuVVDRZyywtUBZmfI3q9Sm9yyqf7mVmG3P0yFElROlc8ZNzNGF3l4pU5a9G2XIZk6fj1Ey9NCyYRMCCsCCWrepMzyyofVEAPvpBcTbgOYRoIE3IbM2152L1gIiaHNjASIPGgVlOjJUUrqVvWBbZ5Ie+1NcveRuTnQxbyknrWvLfaO6xheqJs1/wqPvUPyuObCwNPkZg/BNgs/O1Js0C1FPSkPdbQW66H0vlYW0oiiAA6a4uhFjUYYYhsbTumNettYc+dsNw9ijcLfr3bdU/b2sKFBuW9gWzZHNC+2+zeoGx1mXtdFClheDrZeK36rSEbDuX8SdrqGju4rJ93j+YJiwJm7EzsBSyZ4OsafOpZtVdh9mR2joMAv1GnFFPY6I+CzdiUtKHKZhcXaYC9/XpV6s+NIdp/9MvBbibn/oZRrLCC1XT1BTokKvc7+psFJr2oX+wKvUot0hWBCV6wgFABK2Khg8elV5T6+HbOfymWYfePWsNCD7JxAk7OvLLTX/O4uFxrO5+wCPlpp8xbhF8M3j2qetzlTO8rlisyZ7VdVcN+yfBRdED/X9R0L959432F2eSe/3ekgL8UKTBLQopvZDi7ef7X6+uKRMsHW3gLOE3pW6bUl9X82bne1phbkkVjTD+/UQ77lf4H7OLiQLw56CMRyzD8sJgvn/9/QCo+Sp5WolT/285Zzwa6bIiuSN4LWERB1I/NJQbR2Scuxvv+r74upT3GW4LvIiZdRrU97A2JIXL8CCczVudJkVmdXy+4QY2gYK72FAoYHqIA7QoqzNbf8LpKQYUWQgWnIhciQVLgYwCiAAEKKkKMUCFAQQW4v3GeqEfQ+JZBUuANDlHwKnC1dC4BEQEsfeIiIjoc9GZlTKVQxokimieh15QNPW84fs05kwknBpnnG76UGF3Y8pBbMRUcUZ+CGY4LLlwucL3YXAhoFkbHpnPxy0hy46jur12YlM354U6ocLhCFW7ww6HzezPNhZ3yrlkkKgQxF/D6awaQeH9sXXdytv9N2eib01JNXvENflVYsv9v+ERKonJ/5WWGPpe9eSnWcalaEcOjaecQ7XZ/+tk1NyPDhYwDpBT/9Ynqjb6Gua79VNW8Mf+8kQLn3AQec2565dihx6TinHLOdn2pbj92yJh924AybxH7xLkhh8IYQbGft3YkNksEDj2jA1ihisDxI+poUYbEQNIAliw4D4z2CTrfJEt5T7FEdN2SQl/NrnnQpPAA62ke4f9vstjVfAuLTQ3+MRboIo01buUnC8bl84RkB/Q3/GvhCsH/3ZD8ZnRLI/rQvJwIzXwK6kfSxNJb55JX5hhyf8PnuYoB4N7/FX50xBs+8hX8Wvrsb+FX96HUwqBPNv+70ffNbqUUTAJSCkZh7VnAVgUVjqiI5HXju2LniGSD6Iq1P5LjDaj3Kx8uWzrla47Fy9/9SD8OlTvenZt/b0b4GaZe+Rg65wdE7VoxinQHvW8AU4c95pzeg8K2lqDgAhy4NizOeSEoNmiK0Wx2L0p7y/UHuuFHOsHRXnBZrwOltFTs5bVus1TvsDGiBQl4WRjQvIIZuHYGXvDj9TdxPS15diiburU3/HorKVTSxuWaAiPXTGy7VtAT2Zi/csPTk+aGZyE9gW2Mp5U6l75JxI2M2Gj0tLnRWIhgTVbA3iRuvSe72jWcwKZ/Y6NpQkDMTCkJI3uCuTeTYEbgzNmZ/xVsExliZ8Qrb/Pf42yKtlEnaJsulgUnuvgavpZyc88htFxMmIrpZiGCDLGATe/Ekt6oI7l5qLMQ8RZ062TZhCMqiTD5K+AJ2qYvVZmKh16DSOMjQeMjQcMVZnoVJ+ak7bvBLNGCiFmaJBG35tE5AK+k98xJ0rYrG+8mDfeYUj4eF0yw77NmwlKc4AoRK6BJJQO79eZuXSQQtrdg6wVsmTMlSy+3yUki/eBzg0HDpB8FvDXTtbBdrnGce0HM5F7mces9Zh4PScyUnWDOzpvd/YeW71Nu7j+4MycFjKVjgs32UxBpnmCTAPOkXBLh6ZdbFdrPrGH8dBrvNHmaNH+w4jG7bqPE0pIwBkoSE5RxlzuV4Bm2AJvjpwVszTm7Aku5ASvoFhJ0sGR463ScXd15MG4OFto4Q1LAuDmo86D8qF5wH2qGqlI/hfu5xj1M0+1q3MLu5MG9B3+1YJ5pUMCfmewnDM3jKYnMOTqR0bEpNW+qFPDeisfTu4nN07sF7Fn6MWhKPSURXn0tYO97czs0ZnM4WVSKbKNS5LCvaytFFk42kszmz9ZC8y81+OH6vJI7fYJHFg7eF+a4sXqr24yXD6b2qcao2QaNbueaN1nyEmYBe6uyNpEKpY8FyWuFkxKP3xawjzpmCR3Cm9VygHn8NmmbBVxiey/k8dsgYi5NFrCVu5lZ2o0fVA1PMhbaB2fBZmbjpTlHnkR4BK6AvYC8dFaw7ahvWP+6YNs437AC9ugsbsf7cDx0LmKpCOe6tsu40/2yJ2QelpRwaowOGxuPHzcm2zqjiaQbHAI7o+mSFqRPuZgVJNgO08bc3UlsO9M3ptB0YPsEwF2USmwzqQQR6+kCW5uYkvCFNj09Hpvk8jY5OvcSRwyLl+19HWO+/LC9Oj+UHO84XJ53ffJVh9qh+gUPaT2cHg+YLor4mFzOxN+JK1mfBZtgzcVTsO5qGQtrlF2Iqd6spNNyE+IjpTooH5owPvKsIoabwNQnyJ4K9oQubkIVkWevOSbUpG3jXaMnfi0RRrD1cfvp+GnL6jJJnaGngG1gmPnAYG4eFSIcBNFprbdh21uFfHQxpQaSpY8upiZ1YnNHvICh/NOlH6J22m5mZsc6FL/29vAxzpT5i4FgNluCNK+rpyasa1bANpDPTF0z0W54/TSINCxvWsAwHvenVe2/LDltndlCxrp3cwXJ6/uDuZQNBpfjh9v4P+db5u5Z8uaMWsDQrIC9pH6ybFrrAw3v3RXamAIKGOG5gBk6o6P8CGq4E5BEWFKngL3cc0Tagm2HeMMlQ2CbKnYFjL4uYCtJyxt2BdtasF1YU7ULq067sJHZVMhLlvx0VsDWfUyFvILtlWeFvIINLcc7SxeP5nBaaWQnz3YJG4zX2d+gZWfRdmn9oF0+meHYmjRYcqrm8tph+2SvndmwJLCzvorheNp2Vmwbm9IKjAw85G5YszHBXC/2zw23QR8Om/VHNyWqsA34BYXWWcl8so2a1x4VgUxfISlYUQLuGbgTImDAqoqO+UIVNrvGPJu4tpfMVVbVV5pb3bghL9RFjfogi3culWvNRVgRaCwBN6xaU2ZNBHD6ISSY1VTD4i09tX/mqapoby1grsOpPT03Cdix0vpB0drZsm3bCSJwstTO5m1ta0OpwJ42R5YyJp7MTYYcQwU8QdlLbbdn2rlNmATGsA2Wcx+Z5qy3U7Ax8AoYY6yAMZwSTF8qYC+g/e7Qzr07zH20nttsozUfhVIS05NhKpspuwuFIiKwU0dg15dzv6UgsCfCm+7B0hR34DXz75WHCUJm7+uwHjZXtRI3AUJNrKSmkm0wMBWrCtgTscsLnaVw2NqKcOFa4AlsN+QWpq6TBBTYE2G1s4LtTCUibhAJ7AbRwqQl45cyHV0qZ5fGC+GRd5nuERUIPm7TjVSmG8NGToTheaJpKrAGqYy53sRHQCkC470p/0GfAu1XHVGasLcLWsJGjvuaL2bS7P8Waf6bGtuvf+KMjPgbzuePp43tdxv4Flf2Y4/A6KLUwy7KhO0NOPcGtGu1hc+jBYa/hiQ+jxbYyj3jcr0QsXLPrqzc/nOqWLpF8GJmZyuBvTo+bpiylyk3x3ABY3QmmNnB4fjwDF8KXPMxpuumcO3Eu/DL/KUPxgI7ewjsVBEY3dvrCzPTT+kiZASIAnadLmzX6QKjd5WZmwfdC2kM8wJ+MiNSpN1qfmnCfBKxfS5sbyi7QSpsbxIbAJd+wSuw7zIbSYSNLkt1bCRZmofDE5vLpgL2ytvdxqXPrAT26tjMaumjlMCWiNsdjpsyK+cPph55KDmzy3eBrV1nLAdViFinn9kNpaX/hC2wV9KugoTtBbQp9dJ8YT5MBJ6lC1ITAW3pt1aXNkid1LlwqHGeHp/jGz9m+tf4Zua66/1JkRykN/cnfW80Nj35TW2BXbQU2A0PvQDjnFJgS8RVSZGA2vVyArZebrfr1V8v3Jx30p6XpWzWLiGH3eaPV9ItEbMIYUeOdZGvfuE5s/550XrVvbW1M+Mk0QvFAI+SvHxTr6tS335BKxlh442gutMem3YfWdcMR1sYzv3zNYtapDjW7zYTlvDuuHHueNqp8BMXbwLr438dOz+c3yWTcnUVkTe/76hA8KImpif3xGPuwTyMGNjcPAsi2kWuifyIoPamxMyd1EoeVlANzt/A2nEsCnCWSp7WChr5Nc8kYg7/6VFD37mKho72yVtYoQlqiqXATm6BLW0vdwQno47ATQ3e3um2OXcN5VvgV1AxVPslTzsHqqmnKKpQrqCSamtRdREC40oUBAaFABsZCpjYx/sr83L19qgKaFuHrS+QFry48+ATwaqKfP2LA8+WtwDv1uoo+sbFh+PwCnhsV+QSOsZp3c29jsbVsKRoY2wVhsaB78ZaPzN117RfvG14DyM5ciEgEhSjkEAQShKc2ESCdBOXlaN6XpYsmLC5qJJV4DbsCFkYIyZRObn1M15gKKjIsYRqTWAODAYqxkaStSaAsoFqPkL0DYvKFVQKq89RVtqWyzkdN3g93ZUrnOOmWfxWu2t8wPIKLpgofkM8R8VI2zpx0IY+UvNohlyCpxwWYic2fbO4N+a/xLY+d5yxGxOb354CbDw0wfTGArbKGy9LbC+JcZ7ANl+wChjrqwCbvtxtdTljQ9cWuPXguQcvPHjpwdcevPLgm60V8ObgwUcP/ujAmtss2Auo804W+2ZHcNRKNdj327W5i3Lx7tCez6XHGvJ863qs/Rkj7Od61J5mNeT+Pd+8U7VPsURIOjEHKJjw1hPPcxVMONm7u486eKk/w5nPl+Xwi37x+sPlqK3+r5xc18sEMyrIQ5mFM7aqxHNR9rjPFd1emfQ3sWRZ2sISmyQ6rAn7F1TsFro6yQX1ru5BoSLMq1d/5SHYJMCMrYDR3QWMvi1gdGQBw8oFDEsUMLQuYGiYYO70vOqvlxEQ90KauBey/MERYV4PkfU4ccSY4Or7xNt4RVrY7TRjVbeCClvGoJi9GhQvK/tQDv0/RRedoWHp/Y9HOIUKRkVadJpQvf91taRJgF+7C3jjsWHHgg2bFTBULmDvf3z+ObH5geM0YQvu0Zy8KTocnglOZt1awNYU5lDX6XrhjGa2wk4s0RchgqeCUgBmUwXs+mJj9vU/3Z8uHoxkGzOPifJmZn1CYGcIga0cM+7TJ212ZwF72tynL9jO3zbm5Fxgm5NzBWzlbrj1ntiMdwE2B64S3DCdeOp0ER5abltWKxeF5mL31KHLggSdYb9dH4+MQwU8r4kUMBZjKka3tKjcK0kK3ABJMG/NFXBjabMeRsGm0AcNIn5F3Qv8gR8Ttbwpa/1xV/+iezg9Z3Zht/ULHfgU6XyXzGpj+ucwW32wwgsMppJFYATON2RxG9yFCuIsqbxYxpNpV3unkcBch+0fNvczo2iA+aEwsM3B0QTzMuH+tH64Yv3mBDOkFDAG23h+5ml1vo1unv8rjREcChgdE2BzHGB/q+fUOaISGXIVGpbjjCfdEpshOsHeFCZKBXbraZtH4xOb0+toz8Mvw+b8aNiL7YcNUpNCBnq+QWaKijkAqFJ/2D4NhnOep04wA3qAF96CNzxtFtg3jPP700bbMwj/BWx6PrBhkcTmdk4BeyLcoCnYiAEJ5mpy7ISXLjT3q3XKqkEoD42NNW/dkazkzry9gL0deP2pYHMo3p5MYaNEdsNFUjOjKdheEGY0NNoHjQRrIOdXkoCDKiQwV8kK2Pb9jNe9A9uc4A+wOeOdYO+z5jx2YM89tjmum9jeznOvvCk+FkSWfjwsGcS0e2hK/ScNM2kFaZ5uSWyuzQN87YmsmNz12pW0kWBl5lRRXnFg9Kr8ZknccFu3XywmcD27G0aB/en59MyzpfGujznj9epZokyu4jRn/sOcHtZ+5KweGPGA0gVcOpg1v85YPKhIAfw33kJxx0u3uhpbC5KU6dIFDIYJpjfW1lCyNdaRrRluTVGsJEtvPnS7Zz0QWlMo4GuCzRXkgovZsYCxFEgwv/gWcEOGEo+lvAo2EvkCxjL58Phwr8o6Ne3RgvFK85RjRVu9wGraDgWH3mh7K6fccXAE+MDhnOAJbH7DSGyGigB/9rS/ePBXy3J5v32c1Hmcl/QILJx9p2pv6HRROyFfE/CCUGkAbwzYww4CCSQC8Blh3zT8QJzgewy3W1Vd+UIb9F3bnfrTc22E2yg6wpRKLlT2qV+cSkXIy5owXjWpyei7Ct8rCNq/J+0Am+Wp5qHbGT+nJvYaar5+WmX4xHz2XN1txkgK+SB0kQ+kA7z1Ym8pSGDvDHY8T0U310LHfHu7DWQ6v5BP+i5V2/q2O+6Od5jmbrvOgfPBLbp1AcPX7p70Gh+D9bo/1VIUTBgvwUwQEnzdOSJmORjY5nT4fvv0a/N7xL2CjSS0gLljsH2yUlDpJMAuLGDPjt+mE5vZbAFb65m7/YFtjmkmmDnM3dN71Xw1tANs5A4wzJREmIgG2Lx5OqYy9Vm62y/w00ICcoxB+GUbyu2xlNYQdxTgR1rvawcYeVN8a8aGV75HAX6YBOaPUYpRh2kD3FGFczKp8Ztx2jV+v9vqsVLMccwJR3Xii2zNa8uTGUHYPbFYGDY1hQSziOqWL6sVTE+AtcATm1WGE8wPnVuePSiYlt2GdhvPgYzfrVlXw5bT2JoDPsH6Qsk8PC5+2PC0XYJpgoMerV/hQktB9noZw/CGeRLgbsb7w/bOfFjU1+2Sgcb37rrze3P+8MtBT9xfYFgH+VlDCiuWUA3Ulku0/saIJ9zjBNhwC2xDWa9DalmC8LaRwDn+xiFklnelLXp6bKvaTbXVShOEzbHJxXf5ccU2Nh5XDJHuWc6cT143fskVfeNpsV9zRlxKnTk3Wc6+MWf1pMlZvYAhZwH7zph3TlmTzrzIe17jvqTXJlcNnmb+tlTKKHMZb6EChQwVvZjqFYHarxu/LBd9Y0yytnFrG/teM7chUknu5RYwxC9gCBZgk3SpeEZLry/I0yM3/LnWKSihRSGE/glcLmwTmVYRsjkwW5DBMJAn9KEFAxkUCmGYNXCnkGHsQPbGMJ9dgqG5KlHAMF2CubNewFaZllvBic397wLu6p5NMLP7AvYs+Y2+YMOsBQwDCtyuOjdiBW5qAePhbjNJxSlIi8o54nh3dBvs423rcYNAyRCkKo1hiAJGBxYwDFHAMMQowZiFxQwIrVL8Qw12jXnTvHBGMvVxr6SHg1SpBoZ+onJjXA9UYlMoUGe8x9EvplCxn6GuKFF5XElwMbKuLdHrdmINK6LAlqQ/rlTsQYH+eoI0v2S8Iv0j6xgZhTRCanNU+RXp2TIzM1oFHtqvvOjmWs4r+oPoP0J/zhP+kv9o3CrBdKEAG3cpYLhGAaNHE2wt6Q59B7YxwKf3RzkeHCvAZt8+wG4XR8euDobKlmfSFAF3vwq99tqkwACmRyJdOfwAm1wtwGvuHxbwomaZYK4LCxgRVmBXGjjB3MZJMKezAobDFjBCagEjpCaY81aAzbm+AK+5jitgZxNh41OLtndnfHGt0IBfJphfOBLMi4oFjChWwBCkgDFCHk7NvTku9m57q0rt+jNUan/jCXuzaEuiTHcSzGEXYBPXVF39N0k2/TKclVDEnYQCOwlbL+HcSRhWy4A7PrxuBVBbJ4DAToC5FaDXjMzkttdLIRwpgUvK/YonkR+Eam7w9osb5ruBayroaXaYugEXCVOax24R9fMFh1avGYJqivXRaBRgI32AjaBde5T7gWUBY2zF1ySLHWCDfdo+Mjvs2gC3dVAt4AkiGM6JzRBcwHNLe4bBX7ARhhLM7acMZaQxmWpTw0DlTNUdrpYdo97oQv3dsKtmhlF3aK46uobAjmQBI13vfK5fwBhIBYwpp4Ax5RTwHh3i8/OCjS3y7rjRyzhINVT3RqscChhg2kSX9koeOD7tG/snORLd6j2JM0AlmOcPCtiLws9iBZu2CsFZFaZgH2DCxDa2EhFuiCYR3nAOsDmkn2DjqYHNXYPEZo2WBDODTTATnATzy1OCGbYDbEpBJJhBOsHeJuar1oujfDx/Df+eo5hTZMnT69N6fcykJSIqtOTcShWfPNi67MnUMOnu/aDSeQZTdGtc7ox7mOYhi37J06Vd0DMDRmBXxSbAxvH0uqcJAFsT0oWJkbLRykGn0vlDkqUdz+U0tg9NuW5XVzavOejDDmaoza7bJNemxg5RTHmvcUNjZMvPSu7msc44QIWROSehYD5hYeNSiU3Ddd53NJUtuEk1VlbRBFbirRaOMEpOgxD38ZwtjQ7oZsFsi1n/3Ukdeak/7XA3/Dvszf7a3fmL1jsVSWgvo1LCZd5s+1GK6PyR4sULSRIrZtIlT2emVQczHb4MOcL3zLTqYKZO1lt1TAETzHwswfB2exl/rPrwfamYV3W640FfkrACO7MIDLMIu2ktEYEdEYGdfZo5iSgdNJcXguPck547+Y5fr5qu7uSxwOx5wFy8+6Z47c91g64THTO7d8on1psa++VJ+uJ4bgO1i6YbNE3wwVhOOQcZBfbCEpnNeLLtg5bc6fcT8sxmt06e2ewe8oykfiyCSs5Z44k3d5ZnwzdcVBPx3pyVH7OJz93LkrCknWNctPlnkONeTXIx+YOwzdXDwDZbC/32cXnN3S6Bf10pC7non2uXKS0QDGIM8NHtgowRXcBYbSWYy58CxjSRow7Qggw3SGRszidy42lwlymx0y3fHbp5e3noFldl2LgEyFVMK/xguwJGINXrUJzOC663KO8HJjYzsQSbt9DDGVgWuGB7qflqQcH2AnL7L7F5mqiAMREVsJdk4d2J9WaSCF9FKGB0wpOy0BU/BxYwAsJ6u42j6ut60Axw4NeOZDKa9W59ulpt0TRejOCiIrBVyBIuPWaUgVBSCn31L/8wJz40XLRlDi0KcQyugSnm3AEO0RO+/OLh1yzokfjXLGqQ8NUE/moC/2YD4ySdm43X62aC/o2n37SevuCWvgqCWXkE9/jGFUL+dslOz17EaBmwLXVRsb0o+MZ5Q3vt4XpcGVq9ccYwRHLkLz5YaUTdSq+nSn6A6xQztZ6g2oJq0NDzHxP4PE9X8Hl6LuFz2mo742XYwL34gJw0rsE42+nhAy/enOqIHegW0SZUnFNF0bAB44O5W7ZWRbfHNdeY/TWvShy69dY4RxDgBscHo7Iwby0r4B6OU6xueWxashrnDGYU63YKc4ueu2/W7fywnoBvJuATdG4n6DDB1RUy8b2doMMUt+AfJ+RhKCr4X2DyAU77pDxf6JUFTk8rcAa7exX7Msmz+AbcyR9w2kFX766WXNfUl9guvlmdjWuY/Ic5Bho3+nQXmGIEfDUBv/FwfbcFnWnxJAzTgITYj1EhqBjALv8VBm7nKunPqMAAB9+ENxP4DeVM/HYC35SjDnztPsKgCZ+gowsaHt+sh5OO8acBbvVV/VFP/9rrq6e4PP5qAn/CsfTMlpdnzWid8puP/3Fkg3shAzYWCwMcGX2Bc4U4wDlNRy+uzTxY4C2iacJNGlDgU/iMUgWfUarAGaUKHIuPohfr1g1wbx9zTUFVc7zsvE2cpM1lgwJnfrXVzTVrRh2p9XCTfqje+gTuBNykHw3P3hWZTdYlc7tJoQ5mvz2WuynlLaqTF55DdDcPOWLOdGq7q+GHY3eyrifkPZDv38A+EFv7S1O0b4E9iWzOHqUlzJMSA9xGJtUmg/YDPhR1Fj1P1791hhRfmOa79L/3RWkQHFbsNqeljTyS4q42eXf81J1sPBI2XnXpovOnsPGsSxHQbHqED5tqbgP+RM/xVZsBHz2nR6yWNmSKKbrhEAbwHqrd5Npch+4NbBhAPXGNvcVBapTOG+BYs3XBcsLmMzzkOlB5qAUvcH7UG+CbCfyJvuDNm4EO+mKAw+wDnAZW3030RgPnHYjATQc4+0PxZcKSvEJRiHDNNsAnLMN7vt30kOFDQwNxmKu7f0N0GDGpmCp+A9x3tnkBd8D3IbPhIzoDPqQf4BNy8vxHwefHqgHuTd/wKZ0B3zuluao74ENOBRSz7RJRrFl6p2yW3imbJZyyMOVplwE+0Vm8nzLgT3QWH7mPKGkT7HXDuqkDcVhmgEOpmIOmiPvI11wj8g3EfYxrrn2MM+8MFzpmTzx7kGU3B/wJS64m3Gk14fYsxxrG8WGoWU2402rCnVawfBGeXwUH+IQ7+Y2NdcNkcaAzYYSbCSPc0HOeoi44F6Kvd4PH7xDnyyvDNQqdi9DxvUv9aX+uJ65tw1LZ6+DlFu3Pu0d3tWCdcJ5IKnAeyC9wDuGTnnZAR2vz/WTeAEkaLs0NWcz5u4JvJvTEN9NZwqnTZre9O5oSLZvdB0nJz0ubXb7t29V21wNq1sYJX3yA3wVc6mJpPsAbR1/47QQcCe9Ah+YvfJcTdK4n4AhmA30stQuc33oG+IRe/NZT8PmtZ4BP2GE7YYfthB22E3bgOZTCt5/oR27sFnxu7A5wL7+q/1j7z3ae73zt8ecTfjKfkGe5QzyTnCpwdge+5/M27z5sddBLf4YK/496MvnyvHka/1Mroq/23FZ+OD0ejk4H8eaYOZO3vM+Ced6mql7w5tZb0buD+APcy9p+XtfqJn77GfYLeNOyllWB84NCwNuFxxfc0m8Xd5gXk87yF6tXu5zgu/zF+WkjfDfOAo5xli8qW6sJ242+oOKiUMBdFAq4i0IBt73SLvl5pljnuHW9KHykQgXfjnrxtaMs4M6a2oJkFiD6elTRw/VIuuv1eLrUwnXsAfZXafB4fQT4r95eeHWGcyziEqclahOdTGGQeH0EtJOn2dpPuNnCfyXL9DsQ776RDdnQqV3BN+IZCC+c+S6QhcTNQfIC5zn6Ameg0xVoDL3ENTt4Bc7d/AGOzhzgGJIDHLpOv0NxEc9stPHMxhymLNQmCrPPeMRqwPdSmeuvia9yE7V/DXCvddNM0OcptYEOQs4AR8gpcPZkwk3thQKnZ/2YtcsXxnjfxOpvymQUfs4D9UHS1IK+fTiQtPYhr5xjJhyxfB81sq6ciAk3Jkw4ovZAByNTpweHe+ibO7mh/tAN15unk/GFYMTjIv2k0ubb1/bh5A3EqqRFgZnxvZRjwnC8OD/QmTAQPyoV/AbTyACfkMeNhZCzga+NHeCO2w5MJnqZH+MGfPRygfNr1wCfUKKdoMPTmoUOv4QNcDjP7eWm8x3PQ5wDjYkOM8c4n2c8aFmIsMTaAIeAA3zCq7gzN+BPCMnzoAV/aSJveMmU/KyENtCBVw1w6zj6OmnmRW0sXvGYZdAR3NIXfIq+tYPw4VD1odN334lCrlhDkdFHojfw0ed5LtsOBU2dGP/r7cPuDepTdKxHif6EhXmVLKWENMUGPnrp4Zkp/AkpffQSHUhZ999UEFPbCV/xQUz48JWiow9iKmUBXdRDp+ke8sFNT0zbMSn4xJjhJ/0ipw9kojMxNkwgW6ygU6Ht45gqacOnB/wJr/NxTHQmZPRxTBXOJ2zm45jwJ+TkZ7giPz+tCr5xadRBtxgxsdye+FjbQMAJwo001T5m5ZeBAoeWkF2/hbyuHwKOcbXvn5wazs7RnmNLQnjdrlgve9CEA05EJiTmSqnXtAu3eTh9ghrZcyZaqz0keDi9n2g/oRzjdFHO5o2y3GxKP/bI7YnyDcRp/lTShlExZRjtD8ZtCw3Q3nxSaRZvFcbS9x/Xk8iwdtHGLTdjsNnAG/AJZ28nTNvStKkprwYVeWxAFl8bkAM+YRx+FhnoQx658lTAsFFdTHlmff98yyGcivIBwf65MQRu3+MLXJH4Gj4xwDH+grCbtyQxK+QHMqNZirxC4AnkCUPzY1jEhgmZV1NEpiSZ8LbVhLetXO/aeUY24cPuYVjlrd6GNrnQQ0beeUSGuga21VTYhAe21V/YVn/Bob8ms4ZHhAZF2UuBTbmLWeBvAxVGlqAyJeGmDmaaxI/Otkp9pVCNXXiaCWlBF9d85AgPJNDL/YKOrynpDRITlvLTktL+id7005JdJsiyfl4SNnsz+42Liv1Hve6wmNaLW4T9wkchJe6wwXN/mm3fID5hBD99ulVITJ9v0J8ww8Rs+QYh+nXa08+YWpLAoYqjmRmzt49JDOgTA4cTaWS/0+L7CXZixaOo5ydYwdHBRU4/wQofIUjjaorGRF+Z6VHz67Suiwk6Zu5dELbX1Dsh4JTX80GXfs58uBiKcUmjidE+fYsBSLgTspmJdzE1X0x1wGpKjolB6uddVT41nU4bFXvcIKYrYeBucTxXM+VjUzP3DcdOUIFw8SKkTp5vMLkIrjpBFq4a0RauBy4Bjxcu1464nogDcrxUp68JHt6yREXim695Bc4vlwXO8w0JN3d68+Uv80zkAIec5aUwngca4MQvT4gBrvos42tKpQaHubY2vCG2q407FncZS0OZxvH2VdR2mmw8Fi++cM9xRfPfI8iLoF7Owjga3j6CF6j8Nfx/eBAJuPHwxUwzYC1vwJUaQZTxqv34yXZ8mOHi7iNzxqBzwcl+ID/FFqqSbX2xoHx7mxJBqiDcDDJgPJOXK9QytMa4L3DuRgxwaExutWa+a5gADhwm9GQCOOBPaYD5ruD7vnQ3IV4fgiwPOYy+H85Tq7Xl42jBUZS3NSopjwPbUjbvrhXS/NA7wMFyfX+45zXpgPJqSB66KP74TlpdXepP+/NlnH+oNdkyJc36z+vD+mNfI4dsuv+2qeGqyoZ1U9ReA7eBAJTTa2QIGAMuoiD99cdqD0lIfoYvTHwv6JoeBB3wIZRKd6u4POmPIXv0vLGku3s/Kiq6w7pDbXHAhwLgiKhRgFmv7wB/NFPcEC53r86z0dqcyMk6zmaKHOAgP8BhsqFwL/DHETPKNVYxUxcXAd1d5ijcC2JD0V3As8KsKexonjdU6cnar0trXl4pcPZUgbOqUIHz6PyLFGPdywcz42UZXz73bFs3Xgd6ZpGJJ9MTbk5KFzhPPhc4M8EC5wn6hDfMpAY43GeAY8QN8L3Vt2kPE/DbCfgXwLP8HvdgsgJc08HTUErum+utpB515Hg+tNSX43nSPguJ8Y7PAIc0AxzWTLjp3QHu6ZgJsODz3PwAn6DDeCr81XzN7zeH55tVhqj6a+xELbDavqIbFdYQGwd+2PUY8H1BNklIPyiUmGbFjh43qAfsxsgZ1JECDfhIgQqck+UAR7Y8wCf48gN2wefuzwAH/dQWcXPAnuDKQ34D/hQdJMjJFQnDQGXCltziKfi2IJv6hMvyAX+KPvpKUprF/UAF+VLq1Fr/2PAtk6SiDS2Pz0MTUexuAtfrs5nwjQ23GAdZMKaG2m7wmaG4G+D5RqF5B+PQDiVX33718FlfIWsVy7OHaws2r5Boj4YLyEEsOGEgoxcHZNpUuz9w7wGZHTO7mSIMeD+7maDL0FT4cRdqgMP5BvgUfVhkwIfyCd8wsZHsngbrZsTo4GbvQBjd3utDge3zDb9ACdcrvmE+KFxvjA3d5htnLdn2qyTPiYwBNKgHe0oMwAZc50tTdOlLZhtmoAsa2SGAFmxOlgN8olMmPHLDHYaBzkQncIdhwPfWUmnw2klkWYTUpHGBTCrBKvBtSHin1rvBNe5Aw6uzpU8N+FPqoPMHfHR0wndUXzXjJoTcUdFSdM/sBnBzZFz8RpvaCGc6sDDpjEtGR0cV8mDggTbX9+cfwDR/UA0/zBmUJlCHTZY3LtLyM8/Agslz+WFO3tvp2n+QM24WNyodhR9e3fY9L/6rC8GuPOpAbVP3mqFWNranifBm72b3/oFrnUEDLqOHH7jWPP8AKYcfuAo9/zDRwtwgrhU+XxT83mZp4WSWXMMPxg3S5uZpiNLCvNpw/mFCG7PaHlpwa2P4gev88w9TPMx97tSj4WbNQIouOvxARxl+mOp5lVCr/TNb2L1KM98PyCZMhAp6LRjka28Yv0EY91d5sJkXrzFbqfNJ5AlPUSUw3ycb89Ctyic3XhbzFm8xi4tHnJkH3CkZzVwrUTDxJRXOtYW4mWzP1+hhX918nM2uvtC+w5VLmkz3B28/xiMwtXkudJ2qhLb4vnRdIn5spee/3t096wKz/ix+rhuK4kWQrOG5v+5+OIuAHtI3Ze1AmL3Y4QcW0yg/mIE//MDxPfzAYTz8wNH6+poPZt6h1ZRkZmumtDDeNvxA1xp+YFQYfmBU0JrNnkqQdRfELmSW3EUafpjt664dfpgSdUkjDi0Y8uIHZaOTP3ittfDxzOMHhIk8dztx4kTMZ5M8uJVdxJ1wOAUd73D6wTucfuD2er0XGJ/BXQ+o8ZTkE36nUMQYX1SaT9lzPsmDnqTTQROSTrhdXEDApFMEWk5JupySdMLtxMN6l06Nmi8mYp4/bI3F84fd1A8YJXEYcgLZqhDk6byDQPyScP4B7n7+YUoF64rB3A7b/GGKxxI8dGKQ29+DREuY6PwDjks/PbD22oDMhPn8A4Q5/3BXd0Oea6yBAzYHfexwcsF8RgfXccL48AuzkHOrKTfioBpa8NPW+QcIUH6YTXWn+fZ6boF+GH4w81ueO/UmbK7Q0TEjufle3tU0KL9RuDZ86PD8w4T1fJQVj3Y2oVk7NRh8oBQpHyj1w4JV04q4NywjGubADkyekkOueKZhTQrsz4ft08L3ys2CVtOJuqm7ADes2BeixFklF7HzBxsmooV10fiBIhUePkCqhQ+Q8QN46Dr7xKQfwvLZyUE9FmUcfvCuIlJ+oMUPUwZh3Bx4sCxhBtQ39GBQjdj5RgM/GUpaH1jjB5h2kNamBmFclsmrk5qp2KjGLC83sONX/PLDRKRTZjfVAbOpDvAJnFSaCC36YcqeZrVexDW7bsMPUx42EYyUzk2NkxumVYo5/FaS8WLaWW4oURwNUicxCPDA0rgfak8s9iqFg0hypo6BQ+rjLukkdRAZqNNo5x+mWkwKyp2lgRTDi9Hg9eNJZcEd5yrLv/yZIB7+VnKic6jYKz+LgQDbz5mjn5E5x8x5kfmMfKinmd+m4IR+NGgo2E4reFuLIQVZ52UQmsuz8w9TPc8cpBgcHyHOhGDw8w8w7vkHGLJoPMkBGg+EOFbZIzEka4Odm0+ZwLzEfH7QdjycHAcAa7pRKR65yJkZzHSw1cLP6DDewdY4PqPDpAdXEfmMjdyQdotgU+s3NOfsf/5hyqCcfM4tYJXzD9D//AM1tTXaz+hTvsPKxOcWMM75B2Tt5QfzCeD8w4Q9zLmrc4sJe8y4JXVuAXucf5jQ3OwjDS2YaZ5/QDp0/mFK3Gai+2bNF+9U5qvIwIPx8fzDlFTMZ88tpqTiqcJziykjtlhhn1vAfbIo/mJKbTiVGYpvnS8Y2E7F+dnUzDBjnD+TmurU+ZT55lOdygA98OC3o/MPU53Ktdy5xZRUi6mRsZjquwX67swDvXT+Aftdww9TMdIk6OcWU5pzhXRuMaX5ckrz5ZQ7T0XDGXP9gTnXTucfpvS4nvIrbiOcSU3pcT3Vg9cTPdhwdVB4NFcTMbq5mtCj4ebGmdREfzR83eTcYqI/Gr5Ecm4xqaB1Ud314Lplu+QZyCB/YW6G5O0Uu2gRMpcVWXVwFt/A+IXOfVrLzD8iXh0e46YZ/CWOFdz/6r6wbXZ919lfhuPkG3Rznm7UCWX8MB5RHrc17dlkVg4dKHLfsvxgSnkOP7CLzj9AuOEHTtXDD1z/Dz9wvJYfzAAYfmAPDj9MMW+meJhymIWU2Rg4/zChufmaPbRgnjD8wBlw+IGz0/mHKeZT1p1PmWQ+JdWcM2BhPp/kwVA8tJgyu/mQNbSg0+cPOo/sNdd20NQPxksWq1U9nAt58+lv+GFCBR1KnuJLSfPwm44ZI1ppH4jfE78cogpxLedAg9lU0FgSO4oFE7q+f1irfHL9Q9AwJytFo61RBzmYRcSelsEWjbmnYVYnhbhZBww/0ILDDzRL/rAxe2M6AmzMJcMImV06u7m20uv4Laxoz9++XHur6fQNizINUnMIGtpmmS+S3nE2ZmNcJ0+ndDMjXcUIagUGYfmZ7PwDzFl+MCuq8w9TLab61ywikpROmoLUaMJv1jG1UnEgFWbRMZnmwjxvPPBijM3jQzrisYYU9TGu86G+8Uqi294YyJlXV4Zf3Bsp5zN9EKG0aUxF8+EXUwVh+MUUGh9+MTXcz4eLmES83BZ+4zBTJFoYY5Fi/WSywUjAbJZ1FoIZYclb9fEJBtK2Jbt0QJ8TffhlMf0Lq0Sc2+zB/PzLYeqX5R5jfGiz3De1O59/maZ2O8HHvSFTqM3Mqx7nX6b00QN+U3yaLxNSz9q7qTYt39gYJGj5tsE34z3z+jcHm7Z8VdjNG3LWTgvLRxJGkTADDr/Mv0wpuJjq5NliqpNni0kTm2d8BgmWzDTGX6a6ZbmbcMDZcjfZZtIxricluGYGM8h2PSnB9aQE11MSaEk70QvN1ZSbNTroWXtI+A3voRSJhT9hGf2CrGlsA78pWbJuQID7+Av4jL+AT/lFZ3YnqOmXCWr6ZYraYpLaYpLaYora/HqKmn6ZkE2/TMg2X01SW01SW5Haq72E2gli0sJmS8GfPJnrNw5emEDP/ClmQn7ouahfbXg5Sux2OZz4mxqY7Kz0L4J4GXO/hVPpXu+ifUAfBRRPBsbHrLIV83B6Ll9jXRULlf54pjGSD8ZQCt168/2249bR2VtrrXbaXIUz7NUdZm1X0xqTQ33ySuVjB6hGUoazMZ/vtR5j2bNP/enBt0evR3vEhWgP0VMAZugF/Iru5d///o9/+f8DUEsDBBQAAAAIAIdO4kAtA0OdKwkAAP2cAAAPAAAAeGwvd29ya2Jvb2sueG1s7R1/T+NW8v+T+h287uq0lSAmgQChkMqQpKWEH02ycNVdFZn4hbg4dmqbA1RVomxY0YK0VF2u7C5Z7WlX+0tbLS10y0rcp0EnnbDzHe7ZDixmif3IqlUcJkIkcebNe56ZN2/ezHhe/0cLRZH6J1JUQZYG6GCgg6aQlJN5QZoZoK9nEu29NKVqnMRzoiyhAXoRqfRH0ff+0j8vK7PTsjxLYQSSOkAXNK3UxzBqroCKnBqQS0jCv+Rlpchp+Ksyw6glBXG8WkBIK4pMqKOjmylygkTbGPoUEhxyPi/kUEzOzRWRpNlIFCRyGh6+WhBK6jE2ftrq6ATnPJoOzJfUQE5ikNkuFGRqIHS0Py+IaNKmAcWVSmNcEd/pgkhTIqdqcV7QED9Ad+Kv8jx6cyFMU8pcaXBOEPGvkc6OEM1ET8gyoeAvJn0mBTSvvrlufqXmBYmX56cEXisM0KGeSBdGZV/7BAkzBQ0zIhQOhU18zCkc1h1hXNY7JVmjnBpOxTGHTKIO42EE8Zj6BPxBGeaDVvvjRmhBQ4rEiSmURwpmMcKI3rr2prF1My6/d5rIXX7vsjp/CwB3yqO8ICHeJLLzW+2OsguiVAxkE4KIBxzjNG6aU5FJ+xwnpo/vE4tpQeB5ZMosHTWJcOXq4NVQ39Xk1XCkJ9LPnOrF0WWtk3/YLweWr98fY9g261+CTabjbX/9ak7WPjQq+8a9Dfvzh+eD6K/Lxt1nIQKYIAGMO8junvG44tGVBePRlQXj2pVxc8Oo/OaOxoZxRaO/WjLK2/puWX/yyHi17Q57CuQbUiZiVhLx8f7G0f6qcXPduHvb2Fo19v99tL9DXQt/4Doi4/xWPQ216m6oVaiBVq73ZIurSYPlHf35ilHexwwibnH061L15gOvFpi2xvevzbmztm2UH1VXX2BKuvfxcv+CLap3tvVbd452y9X73+HxUNc8KBXppozyL0e7B/qrslGuuI/m+bPqD9vm4H9Z8QI0dp66gpiIniy5gthKxhbO6la5eueZDX6RSVDTaWffiOYG6Dis6eto9ybRcWf5+tZ3YLS5XLsysYkXs6z5YjPYgDtl2IBJwrY5bLFmN0lqXAwRcXGvYptEbUZlD1ta7gvE8gvjpxW8QODlzhVQX36qry8d/fbCFap66ztjb90VxMA93vjWHaSypz9278hY3fK0nvGIsY24vOPa19HrpermniuIUTnwwlK99aK6+bM7ll9/Nh4euINgC3LzPwTrgmlqHgPqq2VP3q29Nu7dPg3ovf7XJA7vTkFv+Fv7g/J3N8mbfj9qr+Cg+088J6D7a4vEaZVex0DVG9T9bAZUv+Wnq0NXP2gN0Pz+1/xsBhQ/KH4rYPCnGP2g932vM0DttwALQeuD1v/TtD4ofb9rjB6s9LPgq/N1pKYX2/pkPAQPv7U1N2MS4OE3Zb4hL08Eq30yeYMwvlcE2DWu88elKpnpbDif8FSI5v1UPHHFM8UpO4IWnSHhC7RzOgb/HvxCQSrOm7xCjsJp3DaC4d3H0OUgWyNj6HZiCH0xFR/++JPMBejQ824YxhUeKU42hsJhb+Zb7Zw8IGqXlhXNMWIyjnMc52hVL/vg/JQ4SKSDRLpz0md1vyTSsUPjY/XEP5O6frLLxUkGDzbtZcQ7Os+m66F0pLXAjGqzKQqpqS2UmsqmYwkQ/zMZ5+4GqPUgAWRmuwV0/bOgZIiEH/ZsTbpnG2InWOCgnz118Th+Nu7Unhs2NPvuSbZgfrWQ+ZXnuTxPIv+RCDU0Qk3MiWI7V8CP6LqaKBg4nfGCGE1SXiAfT7JjnkCjMepaXpGLVKTX/SE4PKrRmFeXEzaA964tn5+Z4YF0x1teTFxi0n05Oz375TRIXW0/exHSjYyQkK3OA6ngfQPvm5+9byMg/W89nO66noGp1kKmWpL9fPw6uAvc3D5Nn8efTMLyDb7OS1qFYpRNZ+KpehOg4fDZ6JlXvQ4gmHZe5SIwEVrIRBgfB+GH5eWSLi8Tn4Jx7Gvj+DNQXqC8Lqny+gyE/2zZRfBsneOrbcnyhOk0ZECC9F/W4pxY+iEFBeIal7Y4bSb733v3//f7SzpK9gTK5PBw4AKxEEibh7T51qvoPK9IATaZDGQD6QybSQdIts44zwRSuKwzBWoF/k0ixmIxIuJBSs1xphdEDFooYmBOAaUkE02B1MR4dkjmUXZY+mpOUBZJMyXNPlITGaI+4CANz1x6d7/IH3aQhsnFNFcsichcdLg80hbxh6ECp+Cje7IBVhSJGDwhcpJGZWQtQKVQTlbcE4kHM8SgNuKkrGpUjFtUXamUkUtUmLB/MozWQE2kZ8C984hNuuLFpbq+gR8ZxboV0xLXdz7aKVfvrhuVLfyT/nCdiLQGVBKBSiKOUviNVBKx5PHhARZALIn67t7R7oO60tdwzsbU1BSJxQpGFxhdLXgcz+LiIon0w37t+Ay42n4N0818kdAO7MhmtSMPl18eLj89vPH88MZBF6nPD58Upr/cB8Z7MrWJDy86LO/hP+Chn3noMgkbtgUxTvtMPyLRAHc+uPNbz52v79zGWy2iCQClQJq0FIjNwyAw0dcLnDURneUU61UEgZnY1DPRWVUUmOizUzJtddoF6tT/6jQMTPQ/E50FkuupUwhBQQjqnUNQtup31tOuJ3BghDWpEWasPTDuPgPN72fNb/MQdkO+fqzS2PzJWIPYib95+K8fjLUKabTMuLdRvXMbVK+vVa91hAARDyEkAiGR1guJ2NmQ+vqSsbpFNA1gJ9CkOwGc2qo/eYTjW8bjCnDSz4vS4cqPwEB/M3D7cOXsHxFLwcgAI8PvRgbDo/xxSqka7c9xYm5Cocy3YX6ADkaCHaEIzUT70YKWVDXrnZpThAH668Fw72BHZyTU3pUIJtq7gpGO9sHB7q72cCzRGe4Jxobi4cQ3NLVQFCW1b8HEmB+gC5pW6mMYNVdARU4NFIWcIqtyXgvk5CIj5/NCDjFqScHF9NUCQlpRZEIdwV7Gao04bQ6fxEhH+21sfebVRO3qycW8faGWHuvooC8VM2+l1toNMC1IMyIiBE5MEgIOjY1mRglhk/FMdipBCsyODsZYcng2lWI/z8T/dtwFcy5BGczzaL/53+I8My8rs9OyPBv9P1BLAwQUAAAACACHTuJAes74/VoNAAC8aQAADQAAAHhsL3N0eWxlcy54bWzdXe2P20gZ/47E/2Clgg+IbBLHefHe7pbd7Fo6qUIVLQgJUOUkzq6FE+ccp909dFKhVwqHioQKFE4ncdyplA+0wIG46rj2/pkm3f3Ev8AzM7bnmXjsuLubxHu30jVx5nn/Pc+M58XeuHzYd5Sbljey3cFmobJWLijWoON27cH+ZuG7141is6CMfHPQNR13YG0WjqxR4fLWV7+yMfKPHOvagWX5CrAYjDYLB74/XC+VRp0Dq2+O1tyhNYBfeq7XN3346u2XRkPPMrsjQtR3Smq5XC/1TXtQYBzW+50sTPqm9+PxsNhx+0PTt9u2Y/tHlFdB6XfW39wfuJ7ZdkDVQ08POcPHGOu+3fHckdvz14BVye317I4V07BSL3nWTZt4Ry9sbQzGfaPvj5SOOx74mwUtuqSwX97swsVKQWFGt9wuqHFD+YZy6ZuXLpVvKG+Qzz8s4m9ff2vs+m8U2T+0xbduKIVSKArzVWf5MqL/ffGIfcBiYj9hqbEf2YVMSlRnlQikrpVn7OMXBO6XL6cbqc3yjylLvRdyj/0a2Jn4e4oypSC6Wxs9d8CDrKoQZXJla2P0tnLTdCBNKiRCHddxPcUHtEOU6ZWB2bdYi8nTX718/oC2OjC9ESQJI6xq5BpNkaBl3wbAkoslJoP9v01ahdLKlA+V5u23NwuGUYb/DINc5iK3Pdt0aEuJRIF5yLixVuOc5XZkZzrGGiP/pGic4CRq7nwXzRHYBBc1KSvuorMJDN2Gox9YxyIixuNswtrYnc1YmKqZZFWyws3G0uLBaxjkL5PIjMETzIuj8JzNE6RR3kLuLlIacmaQYecsLQWVVaNqNOoLCxsyLUgDIrC6OJzEBRrbjd3yuSa5ABWJQIP8d54uTYnf8qyTF/+zVbAUw2DgVznfsKUI01vQE5xrFqQKq9cWb1kQrnMFvsyo84UFHYOMYCxlO040hK42yOgKrmxtwHDet7yBAV+U4PP1oyGMrQZw50FSrsTazWm975lHFZX2KdkIRq5jd4kW+y08xuJ9ejv4wR50rUMLhvh1OoorIYWzKjcrK2LJBhVLkURhswxJKu3qFigpGn0ZRqtFELIMWa2Wri9JlmrA33JkbdfI33Jktep7RmtvObIAGY3lydrb0ReNw6Am0wq0QLhHYhTfJlMd5bWGruvNSr3ZbOpatbJ8+TWQr1ebel0FNcqLhmrc/iqIb9RqzVpFV7XKoktAIH9JZtYKqw0zkr+SMCP5KwkzHZ4uPpvrKw4zkr+SMCP5KwlzY8F9XlA0GisOM5K/kjAj+SsJM52uW3w2w8rMSvtmJH8lYUbyVxLmJQ0BYBFrpWFG8lcSZiT/jGGm0wEwAdF2vS6seCrBKh7ceofXtjYcq+fDjaRn7x+Qf313SG4rXd+HNcKtja5t7rsD04GPJcZFpISlUlgV3Sz0ra497gNbNs9sjn03WCIqEQEB/wytqR5UjQyNQdlQ1wytmVEXyKbX8L9/AKvKofeDWYIdlfyRHlgWgzkU8TjMIZDEYg5F1niAATJ0JkQ8uo9hkCU4nh/yU4qI6pRGbhW1hlZuaDW1znye1bzQDpm3+DpU1hAiimwhRAQZQ4gozsNGvoaS1UZEkc1GRJDRRkTxujZ23THsxphNRsRQUhDn0sTtnEsisXQuTVZb5+SLXI5hwBI1XWGCruQ0eSnNFCHf59ssNE9TI+juoPfsWI5zjXRz3+9FXahGNscc9tBuFdhHRHYykA0x5CPM6QcfWbfJvmxtmI69P+hbA9gfYXm+3SG7Kzrw1WJbIg57M2w1uv9kHl/FHA6dIwPkU+nsG6jAv+3QIQD/vh3qwS9d9Vzf6vh0X1QZzHttVelWlguhKgyx5gcrH06lm6suhFM1ul/rQqiKkpXklzxZWfy/Pe63Lc+gm/p4rhjLTi6kMUmzi6UxKogwI8ULIvielqoEHwvlbAEFC/kU5kMvmE/BkRdMY5ilumAaw4SLVGPIwDTcCrVhsbglHZmsFuRHwwpKfvjIkx9SLidOTFQR9M2s4hIGWKhewRROFHjIK+5VKAspKi8WjBUyAAjQCKnDlQINV6cU6uAFpVbqKdSHQwpzT4GGq/NUUicIGqYoZSyx3FWSej2SwnnREfVzRC0e3HQddxZ/h4YLCOrbSDHJqZaofyPVJZ9aqsSvQd2rQLnJqZaoy4DdLBdBSyhIOfUljjjUpAugpTBKyFMlUjEuhR46t1oKXXautES4JFUp/7gk0c+plgiXcCTuImiZ374H4zK/fQ/WMr99D8ZlfvserGV++x4c8fz2PVjL/PY9KOJV0Dj/Vb0KGudUSxTxan77HqxlfvsejMv89j1Yy/z2PTjiK+97Snhlnq3ToyV6mC+YWUsnys9dolcOe6ddq0f8UTThKi8ycD3kz+ar2Jo9XKazVzvBHFD4Hc3Xkj17Zrhorxy4nv022IK2D8Q3FCi3PHN43TqETQFs20Vsd0EGjaH65FRj0CycdVmdj8kuszS3nlJJNqkawuB8YSFVGTa0RMmRWWdx3TbUVoT00i1BmEaGwMfMWZgTlYUeFZybloZLVzkBL0L/GtM5l3hJsCQdMLm0RI789JDkMlmF8U8MRctXmQ40YGiB9gKKOwGjgYhCnr2zWZg8e3b8+F2Usu2x7cChBjaygAIcI7h/5+Xz+5Nf/Pzk/d+GZGA4IqNHy2fJjv/9ePLspyEBgSyXQw+szhK8+uMLEDL9eySEFBlOQ09fztJMkG4/KP8olEZwxSnpgb5ZSqYeoiGB5TT0dFiM5j93Tx68mP76USiHDDM5DXsyULgjM3T3p58cP/3i5OHTV++/ezxLTyYfOD09wzIrc/qvv57cey8USOYBOAEs4UnidfzkL5PfvDf9/b3pB38L6cidOaJjz1KZ0XT64b2Tj/4QUtDlQUQidf/x449Buentx6I0umjHaWtSfDBxSpRCdA2NE8FyqsS2gAjQxHocuqSFiKRhC4gATgGRCI+KNG4BETQNiER8sDPHs8E6fvFgcjdCB1kRRl6HSW+JRYTk3meRFBERMAMtI3n651dPH0YkIiZgOlhCMv349vRPjyb3fze5e2f64ecRrYgL9oyIWaMY5GO0dA6fu16V5vT0n/emt/8biqMT6ohEiqnJo+dRe7FqqFJITD59GrUXK4YqRcPJ7Z+9fPYkIhGxoEqxMPn8s+N/3AGMT548PPnog+NffsJhCw83EYIsTWK1/DWlqKSyEbECk1SSKGrz2Yj4gVkkCZv6fDYipmCaR8JGYk6Ul6oIrKq0AiR6JWJD5+o4YNgT1GbxmegVzmamu5LiLtErnA18QvlclcMxjpWo8IAbBAZSfCZ6hbMRMVuVYjbRK5yNiNyqFLmJXuFsRORqUuRKsBJVVnjqEPYKPLJTArZEr3A2ImZhx7eETaJXOBsRuXDGQcIm0SsRG3CDYJS0Okq8AjFh/Q15cikCmybFbKJXOBsRs5oUs4le4WxE5GpS5CZ6hbMB/2CjpMiVeAUgFngFWGEGUswmeoWzETFbk2I20SucjYjcmhS5iV7hbETk1ihy+QQiDO27h/x4DwxX6IW5T+oKH28VHn6PHtCk6+ypaNJnZpVA1uvxDx/VFR1fio4epjylJlPji68gTIPCKeDgebO0ksSeUxs8DRb7fdFUbLZJOMk8cywuCg8UvxI9uRYdsc6uKM2q8GG3sAct5alyIVZjWAL5IX4FnWSPe4tpxg58B3Q0OQNtQgeQ447zT+5JDkUKB2IFxeKnIZPbSo4EJjcODwTy6fV0zaMslBzUL3Em6PA89t8pwxUJXUjqh2FjrjiD+aEvs4H6jBD+0vgkMZ0wcGjtSmy5oggm6hPTPFOtDq2A/E0HYVQ9syCWNE4FZi5zEnsw9wpm71h7ubQlM/CimiMr/pm7nVQuqVD9sjg6S96exkska2Bc75OXY9Dz+9GcPdyvda2eOXb869GPmwX++apnwRsMqje2O+RoPtwkBq2v2jddn7LaLPDPrLUatcYigwnqFNZDwpMeLA6ezgP3O/D2jvWxDU8S+ElN392pN9VWsabpWlHb290rbtfLzWK53NL3akbZ0NXqO3Cvwo3cc+D1DPB4AZ8+SfjWgetYVDoYwW7v6G1lUvsDeF2J5X3HvRU1pzezSc19F3Yg4Nb0Djqpdc/2Rn7LdcZ9eANKoA29Z08icMxYezpVkNSeCgB1rvmePbQiGfReL5WGKTVDxgaznA57OYhrMggUSofjSib7eWDVekOvN1vNYt0wdotaq1ovbrdalaK+t10xdivNZq21nRbYeKAqqYGNRYrN/XPrRNwkeLKSNb6zrkwNMxV2bdyO65ga7ZHVcQddKd38iBOUjNvEi/DinwgpsKgCI4QkpzCBCZT0RiyJcmjuW4ZtOd0rZttyRpE8OrUyl+h7pjOGtxCFKUMndEqcitw9RmUMCh5s+Lkyglti+FcZezZUkb2dhr67Z6jFZnmnWdSqVq2o13Z2oai0dnZ3Db2sllvvADrJa43WDyva6V4dVNZLOnu9Eey7qmjrIwdeMOQFlTeooNf4tc0C+nKFPH6MJRyoDRaFRpRG0WuXtv4PUEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAGAAAAX3JlbHMvUEsDBBQAAAAIAIdO4kB7OHa8/wAAAN8CAAALAAAAX3JlbHMvLnJlbHOtks9KxDAQxu+C7xDmvk13FRHZdC8i7E1kfYCYTP/QJhOSWe2+vUFRLNS6B4+Z+eab33xkuxvdIF4xpo68gnVRgkBvyHa+UfB8eFjdgkisvdUDeVRwwgS76vJi+4SD5jyU2i4kkV18UtAyhzspk2nR6VRQQJ87NUWnOT9jI4M2vW5QbsryRsafHlBNPMXeKoh7uwZxOIW8+W9vquvO4D2Zo0PPMyvkVJGddWyQFYyDfKPYvxD1RQYGOc9ydT7L73dKh6ytZi0NRVyFmFOK3OVcv3EsmcdcTh+KJaDN+UDT0+fCwZHRW7TLSDqEJaLr/yQyx8Tklnk+NV9IcvItq3dQSwMECgAAAAAAh07iQAAAAAAAAAAAAAAAABcAAAB4bC9leHRlcm5hbExpbmtzL19yZWxzL1BLAwQUAAAACACHTuJAZvNj7vgAAABeAQAALQAAAHhsL2V4dGVybmFsTGlua3MvX3JlbHMvZXh0ZXJuYWxMaW5rMS54bWwucmVsc22Qz0rDQBDG74LvsMzdbNqDiGRTPLQQsCC13nJZNrPJ0v0TdlZNj+IrePUlxLeyD+F6KFjxNMx8fL/5ZqrF5Cx7wkgmeAGzogSGXoXO+F7Aw3Z1cQWMkvSdtMGjgD0SLOrzs2qDVqZsosGMxDLFk4AhpfGac1IDOklFGNFnRYfoZMpt7Pko1U72yOdlecnjbwbUJ0zWdAJi082Abfdj3vyH7YyKgYJOhQqOB62N+o/KJ7ucEkYv7a3xuzuZhjz6KWtDlK/MeBl7TAK0sZjD87a92TTL+/bw/nl4ffn6eGuNI9NGpEeHxWSfj5Z16HKuIx54XfGTr9TfUEsDBBQAAAAIAIdO4kDjPd2HGQEAAHQBAAAtAAAAeGwvZXh0ZXJuYWxMaW5rcy9fcmVscy9leHRlcm5hbExpbmsyLnhtbC5yZWxzbZDBSsQwEIbvgu8QcrfpKogsTfegq1twYZGuXnoJadqGtknIBOk+gCKI4BMseBFPnrx42Meprm9hPCy44mmYGeb7//mjUdc26FpYkFpRPAhCjITiOpeqpHienu4dYQSOqZw1WgmKFwLwKN7diS5Ew5w/gkoaQJ6igOLKOTMkBHglWgaBNkL5TaFty5xvbUkM4zUrBdkPw0NifzNwvMVESU6xTfIBRunCeOU/7FZyq0EXLuC6JbooJP+PSrpm3DlhFWvOpapnzFV+9FOmEsB/6fHMlsJRXMhGePPkeJjNwSeSTWbZiYDaaZP172/98n69er4Mg4Ovm4fP1ev66aW/u/1YPmZX4+Rskm5AU517txtRTOKIbGUVfwNQSwMEFAAAAAgAh07iQOR8ERgjAQAAngEAAC0AAAB4bC9leHRlcm5hbExpbmtzL19yZWxzL2V4dGVybmFsTGluazMueG1sLnJlbHOFkE1Lw0AQhu+C/yHsPdkkQimSpAdTaaFCqektIEsy+SDJbthdJT3qQTxI6d2DUNCbgic9+WtM9Ge4ioKFgqfhnY/nnRln0FSldgZc5Iy6yDJMpAGNWJzT1EXz4FDvI01IQmNSMgouWoBAA293x5lBSaQaElleC01RqHBRJmW9j7GIMqiIMFgNVFUSxisileQprklUkBSwbZo9zP8ykLfB1Maxi/g4tpAWLGrl/D+bJUkegc+i0wqo3GKBoZHAKSknOS2mRGaKTXgK0kXhXKgnhKNp6IMoJKvD4cEsnIz8r6i3j+vu6vnj/rx7ulD67WXZLm/fV5ftzWu7uu4e7r67Aruvm8cntmn3TMva25YzmlI0v65HLFZ3DX92Qthz8MZXvU9QSwMECgAAAAAAh07iQAAAAAAAAAAAAAAAAAkAAAB4bC9fcmVscy9QSwMEFAAAAAgAh07iQGy0LWUQAQAAiAQAABoAAAB4bC9fcmVscy93b3JrYm9vay54bWwucmVsc8WUz0rEMBDG74LvEOZu03Z1Fdl0LyIseNL6AKGd/qFtUjKjbt/eUGHbhaVeCnsJfDPk+36Zgez2x64V3+iotkZBFIQg0GQ2r02p4DN9vXsCQaxNrltrUMGABPvk9mb3jq1mf4mquifhXQwpqJj7Zykpq7DTFNgeje8U1nWavXSl7HXW6BJlHIZb6eYekJx5ikOuwB3yRxDp0Pvk/71tUdQZvtjsq0PDFyIk8dD6B4hUuxJZwZ8OPCPIy/HbVeMr7TD/YOenO6eYl5dgHtaEYb8jnEYxSjme0RLD/ZoMeGR0RrdvtWkmlHmV5Fxtlsg21ySLl8jia5ItbjNak+zHuoYqRJ5WeSqRHDsnGHn2fyS/UEsDBBQAAAAIAIdO4kDkPApkhQEAAMwGAAATAAAAW0NvbnRlbnRfVHlwZXNdLnhtbM2V20oDMRCG7wXfYcmt7KatICLd9sLDlWjB+gAxme2GzYlMWtu3N5u2QqX2QAt6s0s2mf/7Z5LJ9odzrbIZeJTWlKRbdEgGhlshzaQk7+On/JZkGJgRTFkDJVkAkuHg8qI/XjjALEYbLEkdgrujFHkNmmFhHZg4U1mvWYhDP6GO8YZNgPY6nRvKrQlgQh5aDTLoP0DFpipkj/P4eenEg0KS3S8XtqySMOeU5CxEp3RmxA9KviIUMTKtwVo6vIo2CN1KaGd+B6ziXmNpvBSQjZgPL0xHG1RYPvLWIY2Git0qW2zaqpIcosZUxxIU0KYsQOQuSoIPEr4972Rz6+F4+LpGbfTRxCkGq49n/kiYJ5kD4XNF2wJ5w9SzNA1ujLone0HngQmsAYJWaSvWpPW52bYHO031/qOp678zhTXzIN6CjxcKntnGhvaeHcOwUHB2A0l0DznEOxFoep5+YpPMHuCn9c2Htc3Zqx3bpNBMmgP4qaeQptfpWW/2aZtfEl77oOlfNPgCUEsBAhQAFAAAAAgAh07iQOQ8CmSFAQAAzAYAABMAAAAAAAAAAQAgAAAAmO4GAFtDb250ZW50X1R5cGVzXS54bWxQSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAABgAAAAAAAAAAABAAAACT5wYAX3JlbHMvUEsBAhQAFAAAAAgAh07iQHs4drz/AAAA3wIAAAsAAAAAAAAAAQAgAAAAt+cGAF9yZWxzLy5yZWxzUEsBAhQACgAAAAAAh07iQAAAAAAAAAAAAAAAAAkAAAAAAAAAAAAQAAAAAAAAAGRvY1Byb3BzL1BLAQIUABQAAAAIAIdO4kDHfLL5MAEAADICAAAQAAAAAAAAAAEAIAAAACcAAABkb2NQcm9wcy9hcHAueG1sUEsBAhQAFAAAAAgAh07iQO7RhW5cAQAAZgIAABEAAAAAAAAAAQAgAAAAhQEAAGRvY1Byb3BzL2NvcmUueG1sUEsBAhQAFAAAAAgAh07iQD31DU1CAQAAhAIAABMAAAAAAAAAAQAgAAAAEAMAAGRvY1Byb3BzL2N1c3RvbS54bWxQSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAAAwAAAAAAAAAAABAAAACDBAAAeGwvUEsBAhQACgAAAAAAh07iQAAAAAAAAAAAAAAAAAkAAAAAAAAAAAAQAAAAKe0GAHhsL19yZWxzL1BLAQIUABQAAAAIAIdO4kBstC1lEAEAAIgEAAAaAAAAAAAAAAEAIAAAAFDtBgB4bC9fcmVscy93b3JrYm9vay54bWwucmVsc1BLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAARAAAAAAAAAAAAEAAAAALYBQB4bC9leHRlcm5hbExpbmtzL1BLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAXAAAAAAAAAAAAEAAAAN/oBgB4bC9leHRlcm5hbExpbmtzL19yZWxzL1BLAQIUABQAAAAIAIdO4kBm82Pu+AAAAF4BAAAtAAAAAAAAAAEAIAAAABTpBgB4bC9leHRlcm5hbExpbmtzL19yZWxzL2V4dGVybmFsTGluazEueG1sLnJlbHNQSwECFAAUAAAACACHTuJA4z3dhxkBAAB0AQAALQAAAAAAAAABACAAAABX6gYAeGwvZXh0ZXJuYWxMaW5rcy9fcmVscy9leHRlcm5hbExpbmsyLnhtbC5yZWxzUEsBAhQAFAAAAAgAh07iQOR8ERgjAQAAngEAAC0AAAAAAAAAAQAgAAAAu+sGAHhsL2V4dGVybmFsTGlua3MvX3JlbHMvZXh0ZXJuYWxMaW5rMy54bWwucmVsc1BLAQIUABQAAAAIAIdO4kD0oXYJGSoAAMo6AQAiAAAAAAAAAAEAIAAAADHYBQB4bC9leHRlcm5hbExpbmtzL2V4dGVybmFsTGluazEueG1sUEsBAhQAFAAAAAgAh07iQFQ3q/fmJwAAHgQBACIAAAAAAAAAAQAgAAAAigIGAHhsL2V4dGVybmFsTGlua3MvZXh0ZXJuYWxMaW5rMi54bWxQSwECFAAUAAAACACHTuJAjpnMr3UBAABDAwAAIgAAAAAAAAABACAAAACwKgYAeGwvZXh0ZXJuYWxMaW5rcy9leHRlcm5hbExpbmszLnhtbFBLAQIUABQAAAAIAIdO4kB6nqDMz50AAFV6AwAUAAAAAAAAAAEAIAAAALUyBgB4bC9zaGFyZWRTdHJpbmdzLnhtbFBLAQIUABQAAAAIAIdO4kB6zvj9Wg0AALxpAAANAAAAAAAAAAEAIAAAAA7aBgB4bC9zdHlsZXMueG1sUEsBAhQACgAAAAAAh07iQAAAAAAAAAAAAAAAAAkAAAAAAAAAAAAQAAAAZSwGAHhsL3RoZW1lL1BLAQIUABQAAAAIAIdO4kCE+vsM+AUAAL4YAAATAAAAAAAAAAEAIAAAAIwsBgB4bC90aGVtZS90aGVtZTEueG1sUEsBAhQAFAAAAAgAh07iQC0DQ50rCQAA/ZwAAA8AAAAAAAAAAQAgAAAAttAGAHhsL3dvcmtib29rLnhtbFBLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAOAAAAAAAAAAAAEAAAAKQEAAB4bC93b3Jrc2hlZXRzL1BLAQIUABQAAAAIAIdO4kASYV2//NIFAAtQKAAYAAAAAAAAAAEAIAAAANAEAAB4bC93b3Jrc2hlZXRzL3NoZWV0MS54bWxQSwUGAAAAABkAGQCMBgAATvAGAAAA'
-    },
-    CONNLIST: {        filename: 'T28-Connlist_20260113.xlsx',        data: 'UEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAZG9jUHJvcHMvUEsDBBQAAAAIAIdO4kAl4FPfaAEAAKECAAAQAAAAZG9jUHJvcHMvYXBwLnhtbJ2Sz0rDQBjE74LvEPbeJq2lSElSxD94EXuoXmXdfGkXkt2w+xla71oRfANBREVPXnrwUPo21rZv4aaBmognb7M7s8NvYN32II6sFJTmUnikVnWIBYLJgIueR066B5VtYmmkIqCRFOCRIWjS9jc33I6SCSjkoC1TIbRH+ohJy7Y160NMddXYwjihVDFFc1Q9W4YhZ7An2UUMAu264zRtGCCIAIJKsi4keWMrxf+WBpJlfPq0O0wMsO/uJEnEGUWz0j/iTEktQ7T2Bwwi1y6a7iHQbHyHcqV9N8VWCgylsjS/NPPrxDqnGrJaj6RUcSrQ1Gex/LDSUaJR+bOPl8/p/eLxzbWNn9+tZDFa1LzhN1YBI8rBrCDnMEaZsMsxAn0cdqjCP4AbReAVQ46b4+xKISKu8azu1JtOrbZVRF1Dz55HX+PSirW1vLqbT98Xr0/L0e2fb+fjyXzyMLu5NslioLTo1wb752/531BLAwQUAAAACACHTuJAFLd4zmQBAABrAgAAEQAAAGRvY1Byb3BzL2NvcmUueG1sfZJBS8MwGIbvgv+h5N4m7UZ1oetAZScHghPFW0i+zWKTliS67ea/EDyJJ09D0IO/aO5nmLbb3FA85nvf7+F9P5L0pjL37kGbrFBdFAYEeaB4ITI17qKLYd8/RJ6xTAmWFwq6aAYG9dL9vYSXlBcaznRRgrYZGM+RlKG87KIba0uKseE3IJkJnEM5cVRoyax76jEuGb9lY8ARITGWYJlgluEK6JcbIlohBd8gyzud1wDBMeQgQVmDwyDEP14LWpo/F2plyykzOytdp1XcbbbgjbhxT022MU4mk2DSqmO4/CG+Gpye11X9TFW34oDSRHDKNTBb6HTx/uIt558J3ppV98uZsQN36lEG4miWfj3NF28fi8fn5euD7/xuLcG/bY5cF2nwIDwXjTZF1spl6/hk2EdpRKK2T1p+FA9Jh0ZtSsh1lWJnv4raDOQqy//E2CehH3aG5IBGHUriLeIakNa5d79H+g1QSwMEFAAAAAgAh07iQBMy0OxgAQAAAAMAABMAAABkb2NQcm9wcy9jdXN0b20ueG1stZJfT4MwFMXfTfwOpO9AKXSMBVgGjMRooplzr6ZC2UhKS2iZLsbvbhlO56t/3npzb8753dsTzl8aZuxpJ2vBI+BYEBiUF6Ks+TYCD+vcnAJDKsJLwgSnEThQCebx5UV414mWdqqm0tASXEZgp1Q7s21Z7GhDpKXbXHcq0TVE6bLb2qKq6oJmougbypWNIJzYRS+VaMz2Uw6MerO9+qlkKYqBTm7Wh1bjxuGH+MGoGlWXEXjNcJplGGITLYPUdKCTmIEb+CacQogSlObBYvkGjHYYRsDgpNGrX6UbrbVXM9Y+S9XFmY/d3MeBE7iJFyR4ARNv6U5Qjv1gClH26KDQ/hoP7RPGL4HcE9D1/a3es+wLlfQ1Kze0+8aHIEamgyz9qRbyJtj/FxrvjGZFyRCcG3IQvRpZnoRgcUWYpEf3Y/lnl8An75SwomdE6RCvekZH69qL4dFUP84t7SEcY3Tjd1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAACgAAAGN1c3RvbVhtbC9QSwMEFAAAAAgAh07iQI/zmQUyAQAAoQIAABMAAABjdXN0b21YbWwvaXRlbTEueG1spZJfSgMxEIffBe8Q8u5md2tLLbtbRBQKPhS1z0u6O3YD2WTJDK3ewTv0Ht6n93D6h6oPhYoPgQRmvvy+SbLxW2vFEgIa73KZRLEU4CpfG7fI5ezl4WooBZJ2tbbeQS7fAeW4uLzItLV+dV8bmiEEwRSHuWyIOhwptYJ5tOowqpwCUmmcDFWrjZP7utGhkguxaqDVGPkOHDNefWg18TEsFHYBdI0NALWWGfHgwGg0TtzSoJlbmAbfPWm34GSxLLKw3T4aJLHreyZTs5QUfAVByKUUnhoI28hTCK3BvfYBJtUJQvpvwvXZhCLTYRdwUgsyZNls8/G5Wa/TMh2UvTItk7LPqyfFzvaOp0T+2w1vqwoQf+oBv9LW7SQ4uWHsgKEM/ztWHad+Ynz9s+U5pPr1sYovUEsDBBQAAAAIAIdO4kCcziD79AAAAIUBAAAYAAAAY3VzdG9tWG1sL2l0ZW1Qcm9wczEueG1sfZDBasMwEETvhf6D2bst2SRxGmIHN04g19JCrqq8jgWWZLRy01L675UxPaSHnJbZZWYeu9196j76QEfKmgLShEOERtpGmUsBb6/HeA0ReWEa0VuDBXwhwa58fNg2tGmEF+Stw5NHHYWFCvNUF/C9rJYrntdPMV/UWbyoD2lc7fkhrvI8z448fd7n6Q9EoduEGCqg837YMEayQy0osQOacGyt08IH6S7Mtq2SWFs5ajSeZZyvmBxDvT7rHsqJZ3a/YEu3ckIbnZpbKNRc8T25DpRIw3CKStdMC2WA3fHdp6PBoWioQ/S6n+H+Etk/sknffK78BVBLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAAAwAAAHhsL1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAADgAAAHhsL3dvcmtzaGVldHMvUEsDBBQAAAAIAIdO4kCnLnFWW/EAAGpoBgAYAAAAeGwvd29ya3NoZWV0cy9zaGVldDEueG1snP1dkzPJkaSJ3q/I+Q+Uul8y8Q20kL3SiXyRH3IuRnbP7rmuYVdPU4bF4lZVN2f2168izdzDTVUjI1BzUW+P84F5QNXN3D3gEfnH/+1//PjX3/3nDz//8pef/van7za/f/rudz/87c8//etf/vbf/vTd//n/u/2v5+9+98uv3//tX7//609/++FP3/3PH3757n/75//P//LHf/z083//5d9/+OHX3yHC337503f//uuvf/+nP/zhlz//+w8/fv/L73/6+w9/w//ybz/9/OP3v+L/+/N/+8Mvf//5h+//9fNDP/71D9unp+Mffvz+L3/7LiL8089rYvz0b//2lz//8PLTn//jxx/+9msE+fmHv37/K67/l3//y99/adH+x7+uivevP3//D3zXdj3DJb7E/9LjbfZyfT/+5c8///TLT//26+///NOPf4hL0295+cOlfM8f/yyBjFg/fv/zf/+Pv/+vCPx3fLn/+pe//uXX//n5ddsF/fDrFOcf//jH7//x919+/+e/5VUMAm1Of/jh1+t//PLrTz++fP/r99/98x8/HfgvP//hn//4r3+Binfrf/fzD//2p+/+ZfNPH5un7ek7/E+f0P/1lx/+8cvwf//u1+//6//xw19/+POvP/wrRst3v7uPgv/600///Q6+o+kJ4f/+/d9++N3/+D/+jiv+03e77373P/P/BP7rT3////7wb79ef/jrX//03cv2u999/+df//KfP/wXfOJP3/3Xn37FNf7vf/lv//7r55j7FW3/9vNP/88Pf/u8ns9ucan3a2v/9+/uff3pO4SNj5n/LaLeey1R8pOlz7iYvLgjruH//lTl5Xj/5B+6IOP/3cS5fQ7z//Lz7/71h3/7/j/++uv1p7/+///yr7/++5++u/z+uD1819r/95/+8fbD/RtCvf3v8T8g8p9/+ivC4L+/+/Ev9xz87nc/fv8/Qt0IsT///njeTf/vrs7//Cu+9x4K/vnT2exsk/EiEv7Xz0j49x8RaXP+/eZ+Nfl5dPXFx2Hd58fxb358f/n92g/v88P4Nz+8Q2+r+kUXn/3i39bv/vfn09qeYdznx/Fv+9a4iFU9n/Kj+Ldf9O93Q897aPGFYqiVn13j3/z8+feX1Xpf8tP4t1346T5E1l37BpX7s/P7/5Gf354HvxaufdPH3XF3nkZMDt8uX4zXHKkg2yDZxP/dv/Yg2tej7P7BNljy/84gpus/RK58puK9mP3zH3/+6R+/Q6G/j63P/4Y7kY7RjBJx/5/+Cbogy+7wvwS9xbdEHv6C5v/856c//uE/kdh/TuTZIJuKXA2yrciLQXYV+WaQfUVugeyhUr/cQ0VeDXKsyJtBThV5N8i5Ih8GuXTkD3CjWwJ1H7Ak6O1n/bp79Nwapu+8IY+uBiGP7lMMLgL/7cptyKNvBqGObgYhG18D2SNbp57Ix7dkUJgmhox8dww5+dH7uk9Lo+RIxgckD3qQvDUMl0cj5GoQGiEvBmHJDTINos8UvSmyJVdeA/la8mS+lNwwWxpHH6av7fStign3yQbrHnxiVS0KfHChNUwubGmwXQ1CY+1FERn4imxpNN4Mwi4E8rULyXzpgmG2PPB7Xzzw75Pk+vIf9CB5axgk54FvEB74iojkimx54BuEJQ/ka8mTGSXfUZz3ztwn9XvR/eiRWWDEeWRQBz4o3BomhXeUYleDTBn2eXlYiN+vAuVvqp+EfFNkR9lzU0RKSyBfK5wM/pmuhvLn3TA7ytSP3hdrjlXoI5oHPoqzo8t5Ngil2NUglAovisg4V2RH2XJTZENGvQZSXNhRurwl86ULK5gP09dcgb/fEVlfbIJG5eqjZE95+GwQTg6D0Mh/UURsUWRPmt8UEVsSgWLTV6JB/ZYM/unMhkbj+wrmo/fFyYFN0gMmBD3Uo9YwXd6eLu9qEEqWF0VEckX2lE83RaQeBVIyYcOSJ/NlJnSmV/wemQW+byMfUDjxz1sln8X6ubcMGlMRuDqGMvzFMKKyYQ6UZTfDiM7J7KHKNG5Z6IQOEGiCaPS8O+hAWY17bZ8aoztRP/ZZ+O+qReR98w6zztP2qbdM13iginF1DNWDF8Oo+q33oS8S7WbiqPoR54B/JmEp0FsGOowTnZQWBx3Ioo8Gfd40K0v4TeywcB3r1A/8gCV/v+4D1YrnjDle9oEqwdUxYkh0NsZRQ5Q5kI4305caEnG+rjsmkPphLkjs6J1JMsTua7UdgQ/VftNaBn+kFBlGSpEyqr0yRylFyqj2wSxon9BY9GWZn99+P9Xmj9b0ef+5Dv3YY63WOvCFoR8Q/O3pcaRSeN0ocxD5lVH5lVH5lVH5g1mQXwOp+o3pU25+VYSWgR77r9XiBz4O9NYyKC1V3zBSZJRRpZU5SpFRRpUOZkHphMaBrlXGQEcpM707UR/BH1nxBD6q31oG9WkauG4MQ9PAi2FUfROHStrNxFH1I86C+gnhn57Bqr6BjpTCH3lJbuzHDmz12A98ofAENBaeE9Xi60aZoxiijBqizFEMUUYNCWbBEA2kfiijdvTOJBli57XajsDHZGgt05A5SdE3DJWrl40yqr0yJyppNxNHtY84C9on9HUyGOhE1fEjL6l0N3fTYRMbtdW3lZNfyI8IWvKD6uU1AxVGPNI46pEy6pEy6lEwRTTZC5uL1vzQztSh3hnnx/ax7XHiQ370liE/eLJwDNcmw4j2hjlxbTKMaJ/M19o36Mv8cNCJJ4sG6UJpi7r0wFSd+Kh+BBhH9Zlnhv6pyaEzVbAXw6j6pi/KoJuJo+pHnAX1E/pafQOp+r07GfuQ7RH1Ax/Vby2DslSvr/df59EJ/tuXHGcqoC+GUfVNHKpxNxNH1Y84C+on9LX6BlL1e3eifuz54M6qmxPb3CJOt4Z6y6CsVJ72qYGRyqOMqq/MWSqPMqp+Mliv9OEgVb99sa/Vz0iYoHskVb93J+rHdm61+rz7e962lqn7MxW+q2EuVJ1eDKPqa18XqmA3F4dy8TWZMvYvVMLeGvS1+nFF472I9jlT5WOrtlrrwMc601omrS/03a6fB6xqnblInTFxqIZ8c3Gor5thdKRHXwtaJ/S11h3CII7fd/MCEFzGNUI9UtMDH7VuLYPWUlUMI1VFGR3XylykqiijWgezoHVC+KcXDFlMbjs0ad2Di9ax61o9rttGroV+xgldnhsvUkOU2TxJETEQ5fU309nmSaqIBlK1gylqaw1P6Gu1HfREF/6RF+4Ge+zOVhsQ+Nd7qW1AmLanUfJEBeBqITHFRKLv9s0GElM0kJoSzIIpGkgzwDBqSe9NciJ2WqstaZu3KSday6g/FfLr1kFUyV8cJPq7QFTubiaQ6h+BFvRPaEwKudGcvZWptQdnuXePbV8TH8p9bxnlplp+tRAV6hcHsdyOeaKKdzOQyJ3M13I3aJRbxruF+IjqR6N0wv08Dr/+GEniowPIFdogbTZUAq79Y4NNPJ2+OEgcWNHbzQRSByLQggMJfe2Ag/i0ykdeE/qTHIgtFqKs2kjtAh8daC2juFxy+sdGiEuOg8QB1xuXHBNIHYhACw4k9LUDDtpQFfjIa3IOxDZrtQOBjw60llFcKjDX+z1TSRQqHi8OEgdMIFb3ZgIx85rMggPRG+r58OVo4Ly3SAXS08sZyuRA7MecA/dnlPIBEvMIxS4+eMA/03pnuHkdZ4CSwjAZIF4UWYjS6MVC/cGDz96+WYYUuxlI/cldKjZQ03XTFb1loAV/MlL1h7L2o4Ua+xu0LD/Q72JX5xz7xfkU+JgzrWX4blvK2Wv2Uo2jxHqxEHvieqPku5lA6kkEWsiZhIrcNALes7dqHC+nPhplcgbRH9gq7wIfHWgtgwNyHLp/bISoIr04iJhvjpEz0QZSB+KyFxxICP/01GFt37O3canamozcsdlbPeADH+VuLdMVbfgU9nXnIBo5Lw4SuV0gSvibCaRyR6AFuRMa5dalqoN2lPIfeU3oTxZKsWtb7UDbCfa92a61jA5QNblaiCrFi4Eu5NI3w2z4zPXNQOpA361O1y23PTNQrSZ0Se8T1DT5aE1G7ti1rZY78FKq97QPeN45iIbu1UI0W784iAJ9c8ye5s+bg6iz12QoB0jdt0Z9nQS5Fx5OwbXPYdLotWpu2t0/tmFOvJpCVeDZQpSWVwtR7rw4iE1xzJ7y6+YgNiWZagoft35r1JemTFDPi9akebFHRjww7yY+TAS9ZbJ7w2eyrxYiLV8cRMw3xxxIy5uBpAwlU/SWMtSgr+UOBcd5t33OyI3BOyP3fWuw3/7+8xlvs+a8v5YAnyz3Szd8APk5qZIifEb7aiHKoxcHiRtxTbU3yrWbC3SgXHtNaMGO6O7rWaFFGkpSa1pVkmJXt3aeuD//D1fGfGgtYz5QRbj2jw0Qn6h9cZA4YHrjY8A3E0jzIQIVA+R3hAy0YEBGKklzpAv/aKFMisTubrUDgZe8kOcE7o/5f9o06k1l42oh/h3BQfTdvjlGTdFLUlOCWTBFA8li1V4RXfZHQuiN16r3C4B89x31qrt6yR/GhNvwOebnpO7P6/SVwoaPFl89JdUqrrDGoi/4zYeSemVCqTMBHcogp8XY2yRDm4jftemjNY2hZhdMgGDE6twIfKxOrWWUnIrx9Z7fki1Uwl4cJIKbQHxW+GYCqdwR6C7VNFRE7oTwzwTRsvY9e7v/M0F8hvajUSYVYtu32oHARwday9g/CXfdO4jq1YuDKNA3x/CBzJuB1IG4ogUHEiriigMOOhH1kdeE/qQYPbZx3rdtcsvB594yOkAF5WohKhUvDhIHWv9jb5RxNxNIHTAbZ52hE/raAQfJca28JufAY3vp+4Ofn+VkcqC1DJrISdH+sRGiLfiLg8QB1xtBNxNIHYhACzmQ0NcOOEgd6P1xDtwfk31gHkh8qEK9ZRSXCszVQlR1XxxE4n5zzJky/mYgcSCZrx1o0JcOWOhMVeCjUVqF7s/TPuJA4GWndKZy8pwxK0Sl4mohnpwdJKaYS+IDkTcXSDZvCS24Et2ViVfuYbdIw+atNY1T/9zy6P788iOmBD6mRWsZ0oIPd16zl2IT3zp4cZA44HqjJLy5QMS8JlMN4AOXb436Oi/imopNG74b/NFCmbyI3R/MXrVTuG/bPueGUXDKwmcLUfJcLUTJ8+IgccVdEiXYzQUSV3IjXEYunxZ8y0gQvE2P79r00ZqM4LH9Wy142y223p7vvzaTBVs+ini1ECn3YiA+FvPNMFs+0XezUP0N9DWZOuZpcnpr0NdDPgQoQ377RKE+WijjQOwFVzsQ+Fh1WsuUBNsnmh6v98202ESZ8mIgdcAFomy6uUAyviNQcWD7RCn3lpGKunJ/YoLasPxoTeikb9Rm6z78faTuBz460FqGvvgo3PW+2WcH+Gzai4HUAReIVrY3F0gciEBLDiSFf7qS6kCHJgdc9CnnywGKQ2zqVudA4KMDrWW6xi0Ld81expl3y2fTXgzEgb4ZZst7qZuD6HbgazJLDpgtr659OjQ5kE2rciA2dasdCHx0oLWMDkgVcpBUIYXUAWW2fMjtdjCQOBDMkgNJjTmgDnRocqBHR1Md8bE5W6134KPerWXUm6rn9eAgWoy8GEj1NoF4e3UzgZh5TWZJ7+iuVH3Vu0OT3tm0ZsQfH9sEJz440FsGB/iY39VCUxX8PCT3YiBxwDBbfgnpzUBc4F6TWXCgUV+O+AnqDrSmVQ5g9D8w7x4DHx1oLaMDtPK69o+NEBWmFwOpA643Kl43E0hyIJklB6K7r3OghZqW/x+taZUDsV1DT6u2W8e242x2P/eWUVxaDV4tRKXqxUDqQOt/7I3K2c0FknsOCS1ZEP0tWNChpsqHjT4lfZkIjo/teBMfk0A3nFuuldf+sUE5Pt74YiC1wPU2fbXPenYzgTQJ7PaWRsVbRlpwIEONSeCiT5dZHXhsC3xsG95m93NvGcWlxfbVQlSrXgykDrT+x96ont1cIE2C3LmWSiE7sAy1YEGGGi1w0ecswCU8MhMEPiZBaxlFodp8PTqIitWLgdQCF4iG7s0E0iSIQEtlKKmv5+IOtXH5kVdQo885ELu11TNB4KMDrWV0gGrz9WggPgb6YiB1wAXiPbALpEkQkapImgRJ4Z++CeYi+579IVMmC1z0OQtiu7bagsBHC1rLdI3b/dTZZ22+Hh1ExerFQGqBC0QF7WYCaRJEoCUHkvragQ5NDrjokyh1Jojt2moHAh8daC2jA1Sbr0cHUa16MZA64AJRPbu5QJoEEWnJgqS+tqBDkwUu+pwFsYNbbUHgowWtZbSAavP16CAqVi8GUgtMID52ezOBNAki0JIDSX3tQIcmB1z0GQdOj+2LEx8c6C2DA3Kk10LTFcW+2EDigGG2cqTXQXwnKJkFBxr1pQMT1B1oTZil+wQydz/6hNH/wGoo8dGBCICNydQXn/W99o+NENWqFwOpA643qmc3E0hyIJklB6K7r9ejLdQwFbemVQ7Eng49rdoXnwIfHWgto7hUmq/9YyNEperFQOqA643K2c0EUgci0JIDSX2dAx2acsBFn3K+TMWn2MCtdiDw0YHWMojLZ6Sv2Quua0oUPmr7YiB1wPU2fbXYFptA6kAEWnIgqdEB+U0muyuJsuEblB+NWpUWsaVbbUrgoymtZdSbFp/Xk4NoYfliIDXFBaIKdzOB1JQItGRKUqMpskfI7sY9Qmta5QCgR6aGwEcHWsvoABXr6+dDJPX9W1t5Aa+B1AHXG1W4mwmkDkSgJQeS+tqBDk2FyUWfsrcWJgR/xIHARwday+gAFevryUB89PnFQOqAC8QbZRNIHYhASw4khX96RdUc6NDkgIs+50Ds6FZXocBHB1rLdI3b09RZ7JNPDqJS9WIgdcAFonJ2M4HUgQi05EBSXzvQockBF30SpeZAbOhWOxD46EBrGR2gynw9OYhK1YuB1AEXiBZjNxNIHYhASw4k9bUDHZoccNHnHIgN3WoHAh8daC2jA1SZrycHUal6MZA6oIE2vM66mUDqQARaciCprx3o0OSAiz7jwPmxbXLigwO9ZXBATrFbiMr3i4HEAcNsz9NXiwWqg3ibnMyCA40aHZAFqoP4RsFHgzBF9xllbuN8Rj48MDcnPnoSAcp+4ExF/9o/NlyQvAbZQOqJ642q4M0Foit6TWbJk+iu7Adkbm6hho1za1rlQGzx0NOqjfP9j1rDsNGB1jKKS0X/2j82QlTQXwykDrjeqAreTCCpS8ksORDdFQc0KzrU65KNPiVvmZvvf/37kRxoG9fW2XMGwFVM+SZvQ3YQn/5/MZA60PofeuMj8zcTSB3ILXEZpfI7TkZacCBDjTngos85EPvA1TnQdqmTA61l1GTqLNan9z/Q/pk6I0SF4cVA6oALxOtTE0gdiEBLOZDUODNoFepQE+Ujr6BGn0SpORD7udUOBD5WodYyikuV+Xp2EJWqFwOpAy4QlbObCaQORKCqkeZAUl870KHJARd9zgEEf6QKBT460FpGB6gyX88O4vWpgdQBDbTjRy1uLhAl3GsySw5EdwtVqEOTA9kEI6baPOdA7OdW50DgY9Xf8WMcz2cHTf1nYXIQ6fRiIqkpLpAUpoDuf8NqkkTWrAEtuZLUGEorU4cmV1z0SZVamWKPt9qVwMe8aC3T193Jwx5nB0llchBVnW82EqXhzUKUhq8JFQ82/Ad+3xr1tQdx5UifyYNsWpUZsctb7UHgowetZfCAn+S4nh0kOzcDPYkHDhIPHCQeBLTkQVJfe9ChyQMTfW6ndonds30lyNcvOc1P3p+c6Am/49rxnFR5oceOj0JfPUUl5sVS4pKleHF/cxRf1mtC5e0guw3l71ujPp8o+yy979r00ZpGM2dNQUrMTNoLnsQH708ZDp7QOH6+BFWmmA2N46uFaBy/OEgNMd3xiunmIvFPZK8JLaRNo0al2f/3Cepp05rWlK5L7A1/S9rEJ5fSJqiaNsNwiRk+r6JSGzHJxVKXHKU2GUrTJqCltElqTBtp+sivWGINOpQ5/RJ7Qwy3Vfc8Eh/mk94yZA8/2nG1kJSquBR8nykPVXIDbWlzczPdqeARaCkvkvo6Lzo05YWJPmtB7BedBQvvxbvEJ2vp2lKtfU6q6CrvZ7YQ1bcXB6lDcVG1O8qvm4ukpSs30mNx0VVXhvp6PzJBk0Um+qxFuISZycW9I/sS+JglrWUY27w8v/aPjRCvugzEC4hvhtntpkX9ZyG8GUiTJC67JMmO3/X8lpEWHMhQw7q3fU4fK78g3x7RO/BR79YySkkF55q9lJG6o1ryYiDV2/VGaXhzgWhn+ZrMkt7R3YLeHZpGfDYZvWMX6EqQHd+Bj3q3llFvWkNdLw6SGqOQ6q3MbiclRiGeml/ziqrefKb/rVGQr89MujiK7oop8ntQi2QciD3gagfa/reZ+3xpLdM17vitzVcLUWF4MZA64Hqj0XwzgdSBCLTkQFKjA1w+37M7ONBE+WhNRu/Y763WO/BxxLeWUW+pMA6SCqOQ6q3Mbi8VRiHVO5glvZP6Wu8OTXr36Ggq60z8qbiHSnrjB8WnplFyLjKe4irjKBHdQTt5w7WjZCJt0ILuHftS+IHqyvc2Her443oPSh98kb41DdLzowLX1lGZULkGvjjKSO86pEp1c6FkxDdoUfrosRRwqTE92FBkepuTHlo8sJDZPAVfpG9No/RUaiG9o6gcQXqljPQK7fg92pBeqY08mtOoRe0j2JL2nRqGfbZhddnn5rlV/OYpdmUwetVmt/HFjQiBXnt3O37lMtxwFFUquKGUcUOhHesMN5QyiRDQohmJLdSgTg1m9A60/Mdua730bRfZoj9vnlrTKD2t+iC9ofjoPKRXykiv0E4OftlQbNBroxa1jy6XEqFTTZ0P28F8IsRmbL0bwZdEaE2DG/ymc7jhKCpecEMp44ZCO36vNhJBKZMIAS2akdhCInRqMKN3oImAaA/NCMEX6VvTKD2tKiG9o2jJCOmVMtIr5GYEpdyMENSi9onhn6nQ0k+j7+3qxyV/b4MF/ZPziRC7tvWJ0DaVzWuUpdY0dbfj5w3ghqN0VaqUcUOh3ZHqIBJBKZMIAS2akdiCGZ1q4qAq9Q40EWJPt176tuVs0SF9axqk5wcNIL2j+Laao4z0LpSuSpVyiRDUovaJLWjfqaYOtDcdzCdC7NzWuxF8KUutaXSDaj3ccJQuVJUybii045epIxGUMokQ0KIZiS2Y0anBjN6BJML9pyjMCPe/vLluWZofGLXvTaP2VOyvG0vJstRQqr2BdieqZzfXoWqfoZa0b9jX2k/UpH1rM/uzDQb8I7Nx8kX6CFF2BPw6c0hvKD4w/+IoI70LRfUM0itlpA9oUfrEFqTv1CB970CHfezcAKwc9cEX6VvTMOr5uQBI7yiqS5BeKSO9Qjs+PQ/plTLSB7QofWIL0ndqkL53oNLHPm299Lmv6zdWnzeb1jRKL2tQS1FZgvQay0iv0I7fIg/plTLSJ4S1SV8h7uSuf4+FaXTCZAnaejx3cT76J0/3tnobdBNbt/XStz1oMxbSt6bhss5UejHqHUWrREivlJFeoR2fl4f0ShnpA1oc9YktjPpONXEgfe9ApY9N2Xrpgy8FpzUN0vOBf0jvKFolQnqljPQK7S5UuyC9Ukb6gBalT2xB+k4N0vcOVHpEe2iaTX7TkwrDPtpQ1aZs5Pf8Q3tHUV2C9koZ7RXaXah4QXuljPYBLWqfGP6ZvqNWnE4N2vcOVPvYgq0f9sGXYd+ahsu60LoR0juK6hKkV8pIr9DuQsUL0itlpA9oUfrEFqTv1CB970Cljx3YeumDL9K3pkn6PR/uh/SOoiUhpFfKSK/Q/omKF6RXykgf0KL0iS1I36lB+t6BSh/7rfXSB1+kb02j9FR7Ib2jZD9rKCO9htIHjV2HRvoItSh9YgvSd2qQvncg0m8f/KU3+VH63jRKT1X8urEUFegXR6n0NhRVuJsNRQPitUFL0mePC3f6J2qSvrWZ7ewW4/2ReTb5In2EGKfZPT+FBekdRQUa0itlpFdozw8kQHqldNQntCh9xCrSy3me1mO5tzx1oKM+tlvr7+Js4wNF+9Y0DPsNlXFo7yiq0NBeKaO9Qns+uwDtlTLaB7SofWJjxTHad2oY9r0D1T42dLB13a2EbfBF+tY0Sk9lHNI7iuoSpFfKSK/Qnh+TgPRKGekDWpQ+sVF6PeCQPdZh3ztQ6WO/tV764Iv0rWmUnmovpHeUrC4NZaR3oah4QXqljPQBLUqf2IL0nRpGfe9ApY/91nrpc3827Km2rWmQnr8kpHcUlSWMeqWM9Arth98k4mSyDaXzbIbC8nvaLOldnHZZWCp2zBScDDbexWmfNHdxtjDyoXk2+DLqW9N0WXt5bmKTHaH09Yvfb6ksQXqNZaRXaC9PTthQKn2EWhz1ieGffvWm4HRqGPW9Ax31sd1aP+qDrwrSIvF5s3WU1iBHaQ1yFJWXb7ZHFgdFSGPx/IwVZ0DFjj3/gYS3jo12mEzIYOMBN9fBkLX1Duc2NmXrDQq+5EZrmsbNnp9fQFlyFI1V5IZSO3lmxVH7HeUZ3NBYxo2AihsbPisJNxJbcGMF9dFjuR1B7NPWuxF8caM1jW7QogduOIryDG4o5dxQar+jbIQbShk3Alp0I7EFN1ZQcKN3KcVr9+DWOPn73wLrFXS/o4rzvEms1Dh+HuLaqPK02J4nzJeGlWD8IME3T9Em5OYotSivvli031Miv9lYNArfHbTfUx5/NKr0OFvPdsidR+b65Kt+dKGwLKJWitIFljmKEgGOKWWSylD7PQ0lOOZi0eT12qgi4J5PxsOyCDbsJeCQtMGPbDP1aweFoP5veGh4kx+9/9G2KXm4EMOJ6OF+SGDAaHkLKyxGIx5eGMyZYbC9vPndRjMJFMHK8757fmU63EgMS93+RXX+n77AtBxrnxyr43y+xGbxNzkWH110LDByjFIMjlmMcgyOGcw5ZrD9gXIR+WMw41hQi44ltuBY73JwzHQw71jsMZGE626f3K1FTmI49XG05xPPyCtHUSWBSYbS49qGcha5WJTIcEgpY1BAtcDx8WakVGJjYpiU6tRgUO9AFwmxF11vR/BLdhjqSJMs7HAUzZ9IGaWcHUrtj5SlsEMpY0dAi3YktmBHpwY7egdqB6LNzP9fv1hks4tP1gXXkQoQEiWw4p8eILYUTd9wRmM5Z5Ta6wliE8s4E6HufzlzKgZ8BheJEtjCLfeJGpzJT8Kg3sF8JYvNq0udJa/ik9WrExUPeBVY8Urevu0pyjV4pbGcV0rtT5SRyCKljFcB1SziA7PwKjEI3xU3Ra1Tg1e9A82i2MjeC+bKSSY+cP9T6P0q9idNnsDqWuBE0zLqmsU0fQzmPDHYns98whSDGVeCqmsBPhoKVxL7XCPHG5NMG9bSJtx8vsRW1eWLe+5/swu+DP+zJomjaKUMSxylSeIoGv7YjTpKpxqldvyX7rG3CapmidnbtGBt+GNrw01woweTjNg/eC8g+aq95IOlJB0sJdlgKJMMhtrzK3dvG0NpKiRUpeeThm8tVplM+Nbp+0A1hz56m9lo7pEEv3GjmR8tr6fa87HA501itVRdJC88JonhMOdOfK3aqbHHYDt5IU/7CqVW6Rt5OjbWqibS1AY7otcSbrZW7THyZ9ZhtlYlv5QvEbVQeqrQxbpQfXnZGMo54nqkPEa+KGXyJaDFfElsnNBNvnRqyJfegZav3HWunc/3wSPgNJ2f6WsjRwylJw0tpeVLYzk7lNrrUUPTo7EjQi3akdiCHZ0a7OgdqB2xn0RCrVte7YMf7/P3psmhgx41tBQtAZAKLfwYi0rdN09RpUMqaCyjfUBF+8MTLRQwdSQ2aq9r24katO8dqPaxeVyvffBF+9Y06kUF5opKKzdeDk+UQ9DeUbQEgPaOUu0dRZn22mItih/ByrxtxO/UIH62uXkbVj40LQRfxG9No/hyp+p+2ehoLGAHPqcG8R1F6QHxHUXpgYGvlBn4AVXtGcPATwz/9PprtO/UoH3vQAd+7PfWD/zgi/atabqsw4bSFgPfUZQe0N5Rqr2jKImgvaH4GCQGflCL4ie2IH6nBvF7Byp+7i5XV/zgi/itaRSfKgXEdxTVAIjvKBXfUZRqEF8pHtHQPqBF7RNb0L5Tg/a9A9U+tnVu4C/cZ9rHJ8t9pgMfucI6qG0lB2d4OQ5nHEVlBM4oteeHFlGSlDrweSQ4o5RxJqDqDJ9aQklKbDppgk2btGGX0MOJD4cH99DJjznQm0alqbRccX5Diz+/aPXFUUZpG0tmXktRbr62HklqSs63jo1JoDuA7BJTxZQErQ0TcJ83ZrdoByTEI3Nx8sWOCFFm2S0VCNhhKP4+sEMpPRZnoAOfnbrZUGQZzIj+ihmQ/o9/+E88Bfrnf/7j5107mJHYaIZOxRM1mNE70EyInRqAdev/Q/BF+tY0OX3QU1f9gyNFUkB6E4ufIvpmKT115WIxBfGjxyL+gd/mCvETWxC/U4P4vQMVP/Zl68UPvojfmkZZaVWCce8oKgoQ31B65M1RfLQIA9/EMuIHtSh+Ygvid2oQv3eg4sfGbL34wRfxW9MovhYdQ+nxqYOh+BkOjHxD8YktiG8oXYQmVcXnE1sY+RHsvhHoldyUnU4N4mfbujkgtmrr7QgeydWvaq/3he4/A/Hma08rHaSHo7Q2KWXuC9lYtDGBQxpL10MJFYPcvBCxhun3vcUf2j56m9kM3++kPjQBB78kvlIH/uM3EN9RVMFQm5Ry4it12FOdg/hKGfEDWhQ/sWntA/GlDeL3cFqIYq+2fuQHP4p/4AN5z5v7rwoy8rU2GYpXHhBfKb6LjdKk0IFf4grtlTLaB1S0PxwobVGZEoO0vQbwag5udGqoTKaD+dVp7OfW+xN88YeP6MEfR1GdQHI4inYZ8Ecp449CB34DKfxRyvgTEPlDeQZ/Elvwp1ODP70DzZbY1a13I/j7tfRBctBTZ/ezg5wuB00XQ+mpMxNrz/Mq8sXFohsf8EMp40dAxQ9zEtrForGEdNEOzUnopEqPswl0P+TzyOyS/JJliZU846N2142lZG43lLHMUAd9laih1LKEioDGMhdLLDOQscz1OG8Z8ushy4JftCywahl9H1jmKFkRGMpZ5mJRpbq5Ho1lEWrRstZjK2fvLrwzyMSfNwgaPmRQ8IsGBVYNottCMMhRVCxfHOUMMrH4HCAMUsoYFNCiQSYWjUFYppCzzPQ4b1nsReHyulstx+AXLQsMVzLNb3wAEZY5ilZUsEwpZ5lShxOVVFimlLEsoEXLTCy1TCFnmelx3rLYwa63LPjxHsGxNY32yDrPUvQNYY+LRYXxm6coFuzRWPxzwmuDij3mjXcm1oHPUiKloseyJ21tZk96jG3teu3blrrV3edNhqipodWsfXB0iPSC9o5S7R1FsaC9Ukb7gIr2/AvnmwvlpM9Y0y71o30S8WWNfYzN6nrpgy/DvjWNotIUgarkKJIL0jtKpXcUxYL0huJDsxj3QRXtD3xgFeKbYGbcZ7Aifu9AxY+96f35hpXzRHygjHJ+mylywVFUtGGIofikNwxxlBriKDVEKTNNBFT84BOQsENDuVzIWMWOHl/tiK3o+lwIvuRCaxpygX9IhfSGMtI7SqV3lEqvlJE+oCK9SwWN5bTPYEX73oFqH3vR9dq3vSsiff5ohmHfmkbtSQlobyijvaNUe0dRj6hDShntA1rUXmM57TNY0b53INqfHty0Jz+O+940ak96XTeOUu0tRbG+rYp1c5Rqnx0uaW+vi/aX763HsvSZOlDtMeIf2dydgi/at6ZRe7ouaG8oo72jVHtHybg3PRrtIxRpTwu3N3/19B2hfQYbx31rwxzbN02zm4BTbPIQZt18nHxxI0LUKVpWQ/2D00UdjBsmFj/fhExwlLqhlHEjoOqGPl1he1Q3Mlhxo3egmRC7tfXatz3gNAOcWtOgKj9kgUwwlNHeUZoJjlLtlTLaB1S1ZwyZoLHMDJBUrUK9A9U+9mvrtW87ykH71jRqT3cdoL2hjPaOUu0dpdorxaK+tsuq2vNLtKG9xnLaB1W1z7Z1VSi2cOvdCL5UodY0uiG3Ik6GMm44St1wlLqhlHEjIHJDDknZq9cqlMFKFeodaCbEbm299m1fOGRCaxq1JyWQCYYy2jtKtXcU9Yi1kFJG+4Cq9rodNrFcJmSwon3vQLWPrdl67dsmcNC+NY3ak17Q3lBGe0dRLMy+jlLtlTLaB7SovcZy2mewon3vQLWPrdl67dsmcNC+NY3aUz5Ce0MZ7R2l2jtKtVfKaB/QovYay2mfwYr2vQPVPrZm67Vvm8BB+9Y0ak+raGhvKKO9o1R7R6n2ShntA1rUXmM57TNY0b53INqfH9z7Jj/Otb1p1F5W/I5S7S0l2ltKtDeUap9Q0f7Ij/S9bUwso30LNmrf2sy95zNG/CN73+SL9hECu4q+uTs+0cmK66Z/cKLMbstSqr32KLFurkejfYQq2pv7bfa6qK6+tx7LqjM/iQ503MdGDFewbqd7Dr5o35omVY98gBvaKyV6vXhKtV8RC9orZbQPqGh/fKKb5Bj3GsuN+wxWxn3vQLWPjdh67duWb6r359Y0ai/re0M57TXWQe8yrIkF7TWW0T6gor0b9xrLaZ/Biva9A9U+NmLr38F/bnu+QfzWNIpP5RcDXyknvqN04DuKeoT4ShnxA6ri6y0eE8uJn8GK+L0DFT/2XesHfvCl6LSmUXvSC9or5bR3FMX6tioWtNdYRvuAqva6uTKxnPYZrGjfO1DtY9+1Xvvgi/atadSeJiJor5TT3lGqvaN03CtltA9oUXuN5bTPYEX73oFqH/uu9drnPq0/ZPe8ObemUXtZ4BvKaa+xXMF3lGqvlNE+IfzTl2mu4Gssp31S43v42/c27+E/x75rvfZthzfU+9Y0Xf2RXwqFca+U095ROu4dpdordeTXDby261oc+BrMiR9UXWVmm1tlxsbLib/wEPQ5Pnl/tqwPmSM/JIW0CAxrrYGSu86GctZoLJcWjlJrlDqavAiqWHPUgz/28qnuYgOQwUpN6h1ITbo8uPFNfpwPetMoPklx3RjKiG8pyQtLUY831yMeUKjP2L42qoiv2tseRfukSlq0NkzJfWzO/vB4QYo8shVOvrgRIWoqkIJwQynnhqMo1rdVseCGxnJuBFXcMMcPTTBTpZKqdpgO5u2Izdv6XcIlPlD8aE2T/ccNjRz4oZTzw1Hqh6M0OwylT4zmdRU/zJRtL5++5Hv7ktWPuAx0oKUptm8wbN29iUvwRfzWNIpPJQDiK+XEd5SK7ygV31BG/KBIfLr8N3/5Kn4GG+eF/OKlg/lkiA3dejuCL3a0ptEOuUV6UcrZ4Si1w1Fqh6GMHUEVtQ66ZbaXr3ZksGJH70BzIXZ068XPHeCwdbi0pkF8PoOMXFDKie8oFd9RKr6hjPhJlb0DL6WQC4GhqPTJ1k0MGWzcO7QvbvYOl9jSrRe/bR6nvUOGGK/rqG/pMZQTv4Ufv6OK7ygV31BG/KBo5MtdUnv5OvIzWBn5poP5QhQ7v/V2BF8KUWuaJDwO/X2eJEUuKOXscJTa4Si1w1DGjqDIDjkYYS9f7chgxY7egRai2OWtF7/tJ4dcaE2j+DSYIL5STnxHqfiOUvENZcQPqoqvN+/s5av4GayI3ztQ8WMft1784MvIb02j+PKLwUUpJ76jVHxHqfiGMuIHtSi+CaZPaeSXrMvR3gGLv316bKfc+EH8qWkUn6S4OkrF9xSL7ynq8WYpEb9RC+I3bJzqdApu1Ch+b9O9wPYJY/6BjXHji/gRYryuI7+YDeIr5cR3lIrvKBXfUEb8oBbFN8Fk5LcvWcXvHejIh2YPiR98Eb81jSOfyiHEV8qJ7ygV31EqvlLHLe2wXtt1VfFl5d8whPxi8dmoKn5cBjpQ8WPfBndW7YK3T21riUjxRMzUNF3XUd6U5ygnfgs/xdK7o6tioexoLCd+UFV8mXBdMFd2Mtgw4bZPWvFjR7Ze/ODLyG9Nk2BHfmUNRr5STnxH6ch3lI58pZz4QS2Kr8Gc+BmsiN870JEfu7T14re93zDyW9MoPp8L2j4p5cR3lIrvKBVfqSO/QBFlJ6hF8TWYEz+DFfF7Byp+7MjWix98qX3ySOr2Sanjjpf+jnJ+aCxXiRylfih1lHcXtusqfsgzqY0qSpgpOHqss0C2uVkgdmTr7Qi+FKLWNOYCKYFCpJTT3lGaC46iHjELKHXcUSzkQlBFe70R3bAl8TNYyYXegeZC7MjWix98Eb81jeLr+kcpJ76jSLBv2ydHqfhKHfnVnhA/qCK+npJr2JL4GayI3ztQ8WNHtl78tvcbZoHWNIrPt523T0o58R2l4jtKxVfqyK8JhfhBFfHdyNdgbhbIYEX83oGIf/9jQI+s/JMfR35vGsTnV6Ndt4Yy4ltKxLeUiG+oI78n9LVdVxFfz0U3bGHkZ5el5rc2U/M3GPMPiR98Eb81jeLLfJsd1asnwV62llLxtUcx8uZiHfmPb0P8iFXENyPfXhjV1vcebBz5Uwc68qHGQ+IHX8RvTaP4JCtGvqNIVoivlFnsWIp6hPgai38HgvYBFe1R4OvpibeGAf5qy9uCFe1dB9ORnT/8/NM//vmP+M/vfsZfUtnEtg3jYd0mOPnihtls8oti4Yaj1A2lnBuOUjeUMm4EtOiGxjJzQH7HWoZcB7NuxJ5tvRttdzhNyZvWNI2bI7/RFm44St1QyrnhKHVDKT2l0q5r0Q4N5uwIqtqRbdif9bwafp+i5Ihd3Ho7gi/J0Zqm7o78hyxhh6Hk1cGOcnZoLDdPKGX2BnldxY4jv4gYtUqDOTuCqnZkG/5ZYUfs4tbb0faeQ3a0pqm7I78MGXY4iiZ3zBxKOTuUOh7oZyHMHErxT/CYOQIqbriZQ2M5NzJYmTlcB7O1KrZ1690IfpzQjgcqE8/bjaOoMMEgR9HCBAYp5QxS6nigWDBIKTOZBFQM4r8ogGzRUM6fjFX86fF1VRX7vPVuBL/khqNoqQI3HEUKwg2lnBtKOTeUMukS0JIbGsq5kbGKGyb+/FQSW0Hnz9cHtbeb+GQ9qM2v00biBFYM5ddpwypH0W1bWKWUs8pRlNBIHKV2fD4HpS2o4hX+pKEsijWYMyuDFbNMB7NmbR/cnCc/zvu9aZho5IXaW0vJRGMoY4elSMGb61HrWIYqbuhZYRfLuNGCjW60NrM33yJFZraH90S5/wWC2Km8/fCX/3ZvufN///5v98/8E/b8+dvcv2wzUDElYtccobn4On1wtI6EfHGUM8X1SLFgilJazhJaNEVjOVOCKmuxqQOZXbaQbMYUr33wo9AH+bMN24w6UsejzPWWktnFUM4Ova7jkWLBDqVMjgRU7OAbLW8ulHMjY5UUMfHnC1ZsMmHqul381mxnjT9KHY8y+5tYoinSRWM5f5SSWPBHKZMuAS35o6GcPxmr+NPja7bEHnO9G8HXGf5It9Gft9vAMC76VunIb3dH9XKUzPCGcnaYWCZdDGX8CKr4cTxNm4v4w3zu8p0hGawYYjqYT5jYd663KPiqPU3UcMhROr84iuYEJIxSziGljvzSEySMUgf9ETYpcojqMUqaCaa/wrZgxaH4ZOlg3qHYi653SHe9R36RPhxyFE0AyCFHqUNKOYeUcg4pZVIooKLfkV8kAYM0lkuhDFYMMh3MGxSb0fUGBV9TiGYTGOQoKoUwyFD85nGkkFLOIKWOHAsppJRLoaCqQ3qiygUzKZTBikO9A511Yju63g/d+B5P6oeh+PQJ/HAUHZuHH0o5P5RyfihlEiagRTs0lkuYDFbs6B2oHbHhdHYsbPi38cm6HDjrZBNYySd5E/o2g1VKS5nGcs44imIhU5QyzgREzuhco7GcMxmsOGM6mC1luwf3+8mPW8veNCzOzjKxWIpy7mVrKOOGpcQNR+nUnxTZQWX3zV8Yfcn3RpW95dSBJMoOKfLI3jL5In6EKIOcDxFft/2Do0UqvsZy4it15Bch31yPmgp5WYvaa48mFVqwMRVam7nZsoNkM9ovFKn8ZC1SelcyseoMLfrhTFxGpajgIS2Ucs44StNCKeNMQMUZc1PSXpdmRQYrzpgO5otUbDgxDGSPv+RVfLJ6daF9yfP2/jA+BgOuadpf8p++hFeOosINr5RyXjlKvVLKeBVQ8ep4IRdQwTSWy6IMVrwyHcx7FXtR55W9X7YL/v5n+AbtqTbBocSqRVSmYZHBTvzKSXhkMGeSxdQlgxmbkoKY/Yue+H2SsMkEcz51DLPK5w2Ej/bRMhDmfYodqfNpKafikyWnTvxyRjimm+UTvwQRhjmK8hN+OYp8+OYpyk/MTBpLX5/TqKLlif+KPdyKYJjwJ1Plr5oP1GBWfhL/9OEwb1bsTp1ZPqmCH5PlxOes4JCjNKUMxW+CgkOGelKHDMUvXoJDSjmHgqoObWiChUOJTQUNyzRpQ/L0cLpMi53nevWDL8u01jSZfeISgWRwlCaDo1RqpXY8BCC1UqcNpcxro4rU5qh2BhtWv5A6OhjaIHW2uVVZ7CrXS6371xO/CAcD3VE0xUB9R1E6YKA7StVXyqmvlFM/qEX1E8M47gWFnwmDH50aSlHvQId+7CXX+xF8mRvMrZVdYKU+8e9MMMRRcj/fUHu+GYC5wcWiYoF0cBStxpEOQRVDTlvKU1SexBYM6dRgiOlgdm7YP7iDT75YdNrSCH7eJlYtospw9RQtPV8cZSyyPYpFlhKLkiKLKOXf3IVpyvQeJ4Nc+HmDkD2/bae5j0+SVVSSYFVgxSr+GrDKUZJNjuIFzTcfS60yPW7VqqDIKsmmvLBhInlvlzG0ffS2VeuqPTSbscauq5KvStM3gh8RtVL0heCHoygNkTqGMn4Yih93u9lYO0rW10YVPw58KhCpE11C+6+mm4kakic/aab/few071tV2el7Q+IDNUP4WTM4Ehg67lPjiU8nwhFD8aNTcMRRlEfIEEdphjiKxhMcCao4ctIDFw0bV7rahgwx4eaLV+wzkaN//o9ffv3px9tPP//4PUS8J607erQPvhrCp9lgSGDFkL3OLo6iAQtDHKWGOEoNcZQaEtSiIYkVQ6QNhphw84bEvnG9IcGTITQTwpDAqiE00yBDDKWH9R3FT+chQ1wssg01y1B7NSSoOzwluMmQxIoh0gZDTLh5Q2LjuN6Q4O9/sny6Vj6ID0MCqxR9cRjiKJpqkCGGMoYYih94gCGGMoYkhZ3e9CWNIYlN78zDpC5tMMSEmzcktpfrDQm+Zogez98HVjLkoCXLUVqyDGUMMRS/axiGOIoyF3NIUIsZkljJEGmDISbcvCGxv1xvSPDVED7QjQwJrBhypAKCDHEU1X1kiKGMIYYyhjhKDQlq0ZDEiiHSBkNMuHlDYn+53pDgyRAqRjAksGoIFSMY4ihd9xrKGGIoPkaLDDGUKVlBLRqSWDFE2mCICTdryOHBPXzyZAiVmedtYtUQmvqvnhJDXCw1xFFqiKPUkKSWDGnYaIi2fbSvWcLNG4LceGRjeAieDKGkhyGBFUP0HKujjmqIiWUMMZQxxFDGkKCKgmYfkpePObvt+d7bFx/aYIgJN28INIMh63eGh/hAdeRE0wMcCaw6QtMDUsRRVP9eLGUccbGoSt5sLD5j8NqoRUeiy0F9OCJtcCTbxmX0vCOxjYSJ63aGdyfgIBlCwxqGBIYrmRaOfNAThjhKDTGUMcRQJzXEUMaQoBYNSaykiLTBEBNu3pDYRq43JHgyRCeRwKohOok4Sg0xlDHEUMYQQxlDglo0JLFiiLTBEBNu3pDYRq43JPi6MzzpJJK70zFD+NQuMsRRVP5QspQyd+YNdeKTsChZGuukt3sbhQ1ET/ADb3/fejAsazvG97RRxLLLaf8Ii7Jt7GDeothYrrco+JIMej714CiqKHDIUVQP4ZBSziGlTmfanMIhpfhXN8wpAZWMMfd/Gwb6K4My2JRXMKh3gPVBfevE/RHHh5ZdwY927PlrY0pR6qQHVC1FdQ52aKwdHwv55qjTmRIZdmgsPhMAOwIqdmz4nhvyJbEFOzrVlmawo3egdsSm8n4kaeUcHx+4p2AfFCc+jgpDAru/pmrAqDghQSxGizNYYjDnicGcKQYzrgR1H8r9G5jzkXlp0KPpjZqVH53a4IEJN1+zYme5vmYFPx5HObSm6epPF5qtob+jqIxBfqUOfKYHGaHUiU9YIiOUMtoHVDLidKFih4xIrFhE5RVudKo5BDd6B5IRxwc36smPBerERzOft5ai0nP1FBWVF0cZO0yPZz4meXOx1I4MVew467nGhn1tx0RNdrS2sajMJsf9HOkjM0jy9wTsiXzge3pwKMKOPp75yCMcchSlFRxSaq+LYEOdnyj54JDGOvApr9dGFYv2vL9/a9hxFJp/a35v1FROPlpTiT/vEER8yKHgq/SUxzDIUVQTYJCjaMcDg5Qy84mhziw9DNJYJoUCKvqd+a+Awp/EFlKoU0MK9Q60osUWE+No3RR/DL4kzJnPg8KPwNBvT6szzwrww1EywRvKJYyLRckHP5QyL8lOqhoif8DRBTP50noc7IimEn4+X2LL6QxaOKh930jyHZczXyCsCqxapanjKE0dpVzqKHXe0HwHq5QyqRNQkfK8oVkRqZPYQup0avCqd6CpEztN54w9G3EvrPBjqpzQvjUNacJbMqSJo2i5jLKllNNeqfMw9j4fJYD2ShntAyram0Vwxrr/httrAY9CTCsZbNwptjb8T/2Tw7XWveMR8R+aV4IvbrSmqbsz38GAG46imRluKOXcUMq5oZRxI6Dqhm4U87qW3Mhg+Kcrf+ZDopj4e5+aHLGtXJ8cwZcqxH9JB/niKKpCcMhRVF/gkFLOIaXO/HdOkC9KGYcCKg6ZW18Za8mhDFYc4jtkcMj0OZ9CsQ29P9Qii4GluSZ3sJjZpgGzoxoF/wIrLvPfqIB/jqKpHP4p5fxT6sxPAcM/pYx/AZF/NPow1yQ2OmPqnaHOxr/ep2ZYbFNdhi2ZFZ8sd/7PO11TB1bN0oWBo0gUmKWUM0spl2xKGbMCIrNobQmzElswy1DOLNPnbLKdHryVkHx1g4ra89ZStBy6WkpPuppYxjNDmQQzlHqWEHlGY+mtXf1CgWzBRmeNZw0zp5FPSK1HVhTJjyuK3jRURd7rw47oqFjLfzbgxVEnfcTOxqI6fHOxjB1xWdUOfaVL9rhkRwYb13ftk057iPGQ9sEX7VvTqD3NItDeUbKaM5TT3sWiHqG9Ukb7gBa1T2wc5DrXZI9waNrXtDanfWxPYZisAuy+5tR2uKPQMptYSmYTS1EFQCq4HqkWfvMU1ULYobHM3+xIqvhx1tV1wxb8iC6rH9nm/Igt6Ho/gsfQmJZiegT/ZCg+7ov0cBTNovDDUPzmffhhKH71IvxQyvkR1KIfiS340akhP3oHsvA6xVZ1vR/Bl9rUmgaL+NXoEN9RlFgQX6mD/iRpqDMfX4b4GsvUpoBIe0pSTNOJLWjfqUF708H8OgrxH5opgi9utKbRDSoncMNRVE7ghlJuplDqzCec4YZSxo2AihvmD9pkrKVZOoOVmaJ3oJkQu8v1mRB80b41DdrrKe6To7QMKeW0V8ppr5TRPqBF7RODkL0im1m6U0Mm9A5U+9gZrtc++KJ9a5ou63yk9QrGvaN0haSU014pp71SRvuAFrVPbEH7Tg3a9w5U+9jorT+NeooPFPFb0yg+FXeI7yhaNaHoKOXEV8qJr5T5STF7XFQ/gi1VnU4N6mebWQ+dH9w5Jz+K35tG8WkGu24tRfPCi6OM+DYWvSfy5mLpyM9QS9o37OuRP1GT9q3NaY9688hsew6+aN+aRu1pHoX2huKj8tBeKae9Umbgm1hG+wi1qH1iC9p3atC+dyBV5xybPQDr9mXJYyHbZ52znoC3FE2tsCM3miUWTRWwQylnh1JnPd9rYhk7MhSmyeE7UhV969eFit4xvtf6PlCDHaaD2aXoOfZw6w3SreeZz7o/bzMqLqRf+5lfmQuDXCytVUo5g5Q68zlk1CqlzESRVEmYMx9XhkMRbGGimKjBofykK1axh1vvR/ClWLWmQXy+BQbxHUU5hOwwlO6SHcVHjCG+xjLZEVDR/sDn/KB9YgvFKij85DdobzqYz47Y1a13I/jiRmsa3aClKNxwFNUEuGEo44ah+IQx3FDKuBHQohuJLbjRqcEN08G8G4j/0EQefKlCfIgatcpRVIVgkKNoBQCDlDrxrumbo8584hgGaSxjUEDFoDO/2hbpkhj+6QWZrwuTSacGg3oHaKunF86x0VufHMEXO/jPxsMOR9GsDTscRVkFO5Rydih11nO+JpaxI0KRHbT3gR2JLdixgvrosdxcErvB9QYFXw2iHQYMcpTmi6M0X5RyBil10ZO/5rqMQRGqGGTekZmxlqb2DPaVjTDIdDlf4mILud6y4EfLLnyQGZY5iuZ65JSjKPOQU0o5y5S66FFgE8tYFqGKZQd9dV3GgmWteKGg5UenNtjRw0lBuzy4SU++ik+T9vPWUlQSrp6i3HtxlBHf9kgZenOxDlvq8bVRpD4Fe+vYmAq6W8kLGzz66J/EQqBPTbPpcUFiPLICSH5cj/WmqbsLn1uGHdFRsZZPDMMOpZwdSl34XDHsUOrIh35gR1DFDp5D4UZS07h/N23QvkfTXMBXf0jp4O9nt7qNF361LZIhsKor1Rio7yiZ3R1F2ffNhyIK4muHWogSqtrzm2chfsRamDsmqpUr2JGfXJcKsYeEg+vurFyCLweoLvre2cRwJYONlO4wKIJVSmZ3R5H0MMiFIgoGKWUMCqgaxEeTYZCJRR0iXRo02GPCz1eq2GY6exZOul3ik9Uo/husyKTAigXD1XweioZRNhglHAqZw0gTWOW6pLSEVUoZqwIiq6hHWGViEQSrGjRY1cNrYYsd5/rfQS7xgeqHSZzAqh86zbtgPOvCD4fRF4cfrkv1QynjR0DkB+U9/DCx6LLgR4MGP3p49SM2mC5R7MmdS/Cjznu+u4XsUOrCR6CRHYbiVQvMUMocVjCU9Ijk0FjGjICqGXwwGWa0WE1nSM9NmFRMsKFO1C39Jbac680IHl302cKZodRFT1Bn32Osy04rlcYyD1bZWJoZGsuYEdD93Vj9O1744DHMaLEGM7gJZphg82bExnG9GcHjv/1CnRlKXfi9u8gMR9HmAJmhlDNDqQu/7xaZoZQxI6D7a5j6d3RmtFiDGdwEM0yweTNi27jejOCXypRSF33J78VRaoZSzgylnBlKGTMCojJF0wEyo8UazOAmmGGCzZmxe3pso974YRs4NQ0DiY+TXz1FJ5NfHKW/UDnqwiemb47SX6gaVaWXp6M7NtZUue07UM2hj96mdxV3T8iBB3aGjS/iR4gxOS78plWI7ygaXhDfUbTu+uYpSiGIr7GOXBtfG0Xi81qpYwviR5fjLZH+SSc+NHtI/OCL+K1pHPm0d4P4huKzwxDfUZQfEN9RdPsR4ivlRn5QRXw9OtiCfb0JH6hh5PcO0FZWR7un2ADCsVVb7sYj4DRZ8eHhZ0/RWgV+tP3oGEuTwVGaDI7SZFBK5oB2WcWOC7+L4q1jC7kQPdZcyDaXC7HJW28H7xOhfWsaVdVcMBSffEUuGIpPKyMXDMVnR5ELShntA6raHymvoH1iC9p3akgF08H8nBxbvPVu8C4RbrSmwQ052+kpyhe4YWLxowJww1D82lK4oZRxI6DihitMiS240anBjd6BFiZEe2hWCL4UJn7DKuxwFJUJFCZH0WQIO5Tim8NwQ6HLkbIRbihl3AiouMELa6RGUvinV2izPjLUhc/1YclkupzPltgIrs+W4Itjci4OTzp+joNKUUGAY47ijbajjGMuFOUiHFOK78piVRVQcYzXhHAsqQXHDOUc611qRsXecL0/wZd1VmuaxtblRDM2zHAUzdhIH6WMGQpd+NAdzFDKpE9AxYwtvykIbiQ2usH3z94HaihmroNppNK6K/aG683g7SVqWWsazaAqBTMcRQUIZihlzFDowkcIYYZSxoyAihk73qvCjMQWzOjUYEbvQPLg/r7DR2aW5EsFkruzO0tN7sdvF56SOmViqRsGuvAf3Lu5Dje8ln1tVLFD3rPUqdENnVryuso2xRSqhmEF0Oep2allgzx5yLLgx9KVIaqLUrosJaXLUMafdg3T97vwST34o5TOIwkVe0zpatjoj5auiZqypbWtMwMaPmRG8MWM1jRqI6Vr4ygpXYYyZphQcjxxZ0IZMyJUMcOUroxV0sCYkcGmUw0f7SrQgZau2DnaN8F+/RPsbhMfvb9Us+fbhU9VPjfsnp0DpnUsohGmhcxg+jvTTKey5sqvUDrVqcVRFz77+Gb7NMUsVfv0Iv6+d/sk3i+j/sTu8jf5Ex9d9CewosGF37p63W0sRhudF4s5f2w0ylfUMoMZfwzl/DGY8Seo4c2+yJ9os/7EfhM1d93drk3uT0syUAVCzii1eeLDnPDEYnRnEZ4o5ixRCn1SnsISg1GWYvZPCFuHnvMIRhxSJjmscyeOptD3gRrml96Dpgxmq4dmk+BRN6dreOJjmPDEYnSx8MRiOuErZn4N8cEo6eCJBjNZElCZZeRQXAtVJhmTJBmrTDI9vjoSW8j1SRL8oiMWoyICRyxGOYcsUcw5otTmic88whGD0ehHlgRUHEEwyl9kSXIQeBqhNPCQJZ0asqT3oJ7E3nK9J8GPnhz4T0UgSZTCN6IiAkssRgLBEsWcJUqhT53rDUY9wpKA2BISG5Ykt2BJpwZLeg9qSeww11sS/GgJvjiVGnhiMSoi8MRilE3wRDE9zesoXBrlHNJEg5nCFVDxxPx6krGWKlcGK5WrdyCWbB/c2Sc/7kx605C8T7wJuO48RrXgxWEmJXwwSsObC6byZ6wi/+aJ35761oIt6N+ijfq3NrM92SIZHpnLky/6R4iaJfxkBPS3GCU+9FfM6a8UJFP9DSYlKXtk/SnNoX8EW9K/U1NJap/EkqrPL8PF1tuMWwj5kCPBF0da09Qd1JGClD2RcVKQDOYcsX2qIwZTRwJiR4iDI8l9PUlM1OBI70ErUm6A1244tsEX/VtT0Z+KMzLCYXzDARmhmNNfKZsRBiNdX1uPrL9mRARbyohODfpn27qMyH3lakeCL460ptERPssKRyxGgxiOKOYcUWrzxEdJMUcoZg6cJEWW8JM5SImItmRJpwZLss1NErEXRGVbtwffBl8MaE3FAKr+MMBiNPBggGLOAKVgAJVBGKCYMyCoZQOSW6hJnRoM6D1oTUK0h+aE4FHk+nyDb06V/Xm3tZjWKYfxLz8wRTH9e2uO2jzxi11higY7sXUoVEEVU/QvrnUMdNeD6+z7QA2e9A7Uk9j6/ZYbh9v4aLlxCBGozsCf4MqdQ3BUr5E1nqMdGhwyHH7L/uMf/hNnzP78z3/8vFv6zWLolpIVHplwZnkbVPmDX3t+YyMKV2JIgu6R3heZuhw8Mh3Mr65id+hK2cLd+G18sjyAs9fjKonV1NtTBYNlEY0wsgKOKeYMUwp+UbrDL4PRWEJKBVRSas/HTGBXYmNKGbs6NdhlOpi3K3aOc3btt7//fFfm37//2708/hMyJUfxv+y28dHiF1Sh6oYkC646wWdMYZjFdPuomDNMqc0T/ylPGGYwNSwgMoySFYYltmBYpwbDegdSA3cP7t6THxcGvWlI+yc+nnrdeUwqnMH4d6RvM7FI2JvFCHptUFFfb/rmZZVVmU5AEzWJ39rMqmwXO02XG+6RtV3yRfwIQWOfxg7EtxjVtBeL0ZwG8W0sKnwQ32AqfkBF/POBYr21WEV9rVXZI6hBfdPBbK3aQUZUod+yIMiP3v+g6DT5PfGhj+ddcrQg4L/dDMPiUojTw8KOM79cOWzzpOeFHWeW0omVFQHC0VCBb+5b0OB8b1T5PdH1MO9b7EVh9brdzf2ZXfhc8qg1jfbpmeH+yYJpEdNozhSlICLJg0QymCZSQCWREIwyHI4k9/UkMlFDJvUedBKJjed6/XOj2vMUedGairBUCJAWFqN1EuqYYnt+aheFTClIRssL6G8w1T+hmv+66mrBsITqdcLMIxlt+Nve/TLGHuYzInai6x0Jvk4jei74/teRPhNnuvjN04nSHi5ZjDSDSxajZIJNFtM0UUzfnd+CUZ7wiyeRJxFtmEtQp6Tto7e52T12nus9CH7RA4tpplhMM8Vi6oHFNFUUcx4EtexBctN8Dg+kDR70eFqZYme53oPgFz1wGJ/KRR5YTHYcFuOXwiIPbDRKPpQrxZwHQS17kFzxQNrgQY+nHsR2cb0HwS964DB+WSg8sBgNcNQihxkPHHbWWqSY8yCoZQ+SKx5IGzzo8dSD2AGu9yD4skJqTWPt59eBQm+LUXmC3oq5GVqpzdOZihiGvMFotsE+LyBS+0w1DJU/ORSVPkObvUanoHWeUWyfNHPB/sFtdvI1B/js7DNOwJr5mM+XXmcwqhwvMxgJ+W0Go4y6zWCUKq8Ngy1NyLfeNg74/KrDhPzROSc4hvr9htLaLcE++EXBLUarbAhuMUkCj6ngNppkgY9G4xuCR7QqeLYVwaUNgo+frT967yHdQ4IHvyi4wXBMst7whuAWk5nWYU/8UmiMcBuN8gUj3GBPFxU8sCp4thXBpQ2Cj58lwWM/BkfWbXr3wSPgVNaeTEkxGH55EsEtRkUAJcVgTnCD4XZq7RSCG+yJ7w5ihAdWBc+2Iri0QfDxsyR4bMrWCx78ouAGwza0fneMcItpSTGYE9xgmFlrpxDcYG6EB1YFz7YiuLRB8PGzJHjst9YLrjvAjRvhBgNXvzsEdxgfY8UIN5gT3GAbPscKwQ3mBA+sCp5tRXBpg+DjZ0nw2EitFzz4MsI3fJQVqxSLaUmxmJYUxS786xxKuFKQm/qE3gYjCPUkoLtwU+nc8JoQy5bk8M/EURF7H6i24IEnvQdZue9jY7Xek+DHlXuGIJu0wrRPDle/4fcTYsArduCBDP2Vgv5aYBQzt5szGBtAKQsDItpdza8M6NRgQLaNFs/eXNvHPut+k3Tl1BsfqAbw+VbkicVoEYPCZDFancAnxc78izJ8UgoZTCmAPDEYQciTgMgmPkcKm5IrlUrakBUm3rwpsSFbnyfBL3piMUpqeGIxSjF4opjzRCl4QlM9PDGYehIQe0KJCE+SK55IGzwx8WY9OTy4601+37eCz7veNGT0hm/lXz3G99VfHMbLx28OwsxBaXhzmCld7fpRX6aStOGXVr71aBjyE0fD7H2gptI19SBzx/31ho/syZJfygmL8bFIeBK912h83hGeKGZywlAwhQSCKRqMJ/3XBnFO0EoDnkQwTCdNbTggbR+9bdXkcYAeD3kSfFVR544MWzF+5Rw8cdH4VB48Ucx5ohQ8odICTwwmdSoh9oSCwZMIVj2RNniSbes8iU3f/fcdmdAXzpTdDyfBziPK4pS3G35DEOpYcPeHogaOj2DCIM9R9YFDhnMWGWyz4XOK8MhxalJQJ5T18UsQB5OS24yJI20wKds+F6t1K3KIbSGy7WFH4pP32ONFUnbDkeAwTkaMKgoMsZjM7AZzdthgMrObYKaKRSzKGF7hwYzW51DEuAlW9Gg6iyAtMMTvv7I97EV8tB6T3egJPhz9+CyKdWDpEb4ZTrPDxHN2GMxmh+No1GNaCaoeitnwmUAYktx0xxvTirTBkmjDI/XTCJ1fasUO8n684GGT4qOnmjB8gA8Jkxy6GDKGzwEjYzxHmYUSZjhnksFgkiaN49SkpKDt+CUon2FScmXulzaYlG3j+m7epNhluqJmz/vdT5Mh88YBgI0A3fyGMQ7jQ3TwxWI0w8IWxZwrSuGOCO3IMa8oduSXsSFzgrqvrQZT+LAbTEluurmBzJE2mGLizZsCeR9akAVf5w1jisP4wB1MsZhs5g3mTLHBKAdgisEIgicB0fSim/nGlUTJz05t8MTEm/ckdpnrEyX4RU8cdqSVATyxmNYvxZwnSm02fC4PnhhMPQmIPaEURp4kN+mPPJE2eGLizXpyfHAzn/ySJxY7UnW/7jxG3/zFYcYTH0yKl8PEk4TYExpUb+3KysalfXby6aNz4wQ17wky5JHadQx+0ROH8VlGeGIxWYwZzHlig1EhvNk+1ZOIxZ7QaIEnyU36v5s2eGLizXsCdR/yJPjqyYm+0/PuaDEaZvDEYlK7DOY8scForQRPDEbX/9og8oRfKwpPNBjfx4NJDWp7GngUTSX+vEex8YStsli2C7Fj8LSnPNGAgknB4VKGdQz/9XCY5DA+PohippgzSSn8aqMmGUxNCqiIiF9tKKVhUgvW9Icl3ARLejTZUx5ju7negOCrsLroyrAV41fwQH8XjY8OQn/FnP5KQTJKTCSJYke+/YMsCYoM0JVw47D7mEYaZTk8yWhTfYMppof5PIkt6Hqbgp/W50iJ1jRc6IZPTMISi9EohiUWo9XCtxmM0hWeaDQeU7AkILJEzw02brTEVK6MVizpPWiexPZyvQHB1wTQQz74Q/b3OYowSnOYYjGak2GKYgcuQPDEUTRkYYlSxpKAyBI+x4UypcEOPOMgSzJasaT3oJbE5nK9JcGXnGhNY05cqGRAfouRZJDfYOQR1DfQhl9hCfkNprNEQEV+82bcjFV+jTcJkcGK+q6D6SvVO8X3+2MPrbeCL360puIHVRX4YTGqKvDDYNPF5xP6Dtrw2UH4obFMOgS06EdiGNp9zjB+dKrN7ZgzXAfTVyI/YlO5/nTE/beTz2LUOsSk0ZqmK8V9L7rxBUMsRmUMhjisHvdCgjhI3+3pME2QiFUMwWHl2iXKU2ILhnSq6QNDegdSnu4/zjySDsmPv7n3pqI+fcvrzmNUxV48VqX45iE9AGq61HRoEIrINM5V/YZhbE8YefTeL2x8Eq998nT/easO/hOmhYfUD75MxOb9hBm2YFs9I+oxqmNwRDu96B8YMhRykKrdzQXT36oyVkkIBKM7Lm8tWJky+JwdPInrH26lfPQ28yjACbI95Enw4wSRIar+fBYUGdE+OY2ozZbPxkF/xcyzL4ZCsKnqfk4k0F+DmWMoSZEBbBQMiGhLBnRqKkntk86A2Afan9ftdvv+UxTNCL2pSEvFBg60TxZMlkwGcw7YYLQngQOKOQeCYgcoOeFAcuOkYFKgU4MDvQctS7HpQ96su99xCr6kQGsqylI5gAEWo0RHCihmttaG2my54MMADeYMCKoYYP6uVgZbyoAMNq5a2yddBsQO74EMiA8gz/rchG9OK5vn3eerc2gftx128581AqbYaDShwxSDmaPsDtvyD0NwxUSjLl8bVEzBF6WERVZEsNM0DWMaiLY6DWSb8yC2dOtzIPh6z2+7pfSHB8GRVZTX8MBilD/wwGDOA4M5DwymHgTEHlDOwoPk8M80KMkpuNKpoTKZHoZRSkuo2Pw5nxbOYp3ik+QYb3HgWHDVMT7gCccsRhMwHDOYc8xgWz40iawxmDoWEDnGRyvhWHJTlYI/0obFk4k3709sBh+oZfEBtoVGDmwJjmyhfIMtFqN8gy0Gc7YYbKtnGF00tSVisS2aSMkVW6QNtph487bEltCljV9jBV/V5l0STLEYTUQwxWKaKxYjIbEbtBgt9pArirl5Pyhyhd+FiGRJbqG8dWoob70HWXidH9yNJ0+uUA487zxGOXCdwWTOMdEu+idODbXZ8lG+m+vTmJLBiilmMdawrz2ZqMmT1mYWAmfkyCP7weTvB1j6vHfQN3slVq3TI4weo4R62Rlsz+9Y/eaozZZPHMKT+MbjpR35EYTXRhVP9vyq0reGjcF4in2foMGRuIgSfraanRH+IY+CX/QosPHaoRfVH+SNxaj+wCPFnEdKHfjPd8IipXh3DocCKhI6hzSW+dmj9zhYZOLPWxTbzdUTzjn4RYsCw5X0ZINFtFiARRajQgmLFHMWKeUsUsplUVCLHmkw51GjBo9M/HmPYpu63iPdSUN8mlcw/ViM5hV4ZDFaDsEjh3HdQa1zGP8yjkRS7LilS0MmBVVccvNPYgvzT6cGm3oHaKsbnHPsUZ0p9w3OV2/EzY/SUppPlcKg6KImEb+eEQZZjMohDFLM/D0bQ2223Cf80WCm0AVU7EEwqsCYi5Jb8GcF9dFjAe6VZz6x0OND81PwZAhVNfhmMapq8M1ilKbwTTHnm1LWN4PRSEFaBcS+UfrBt+TwT9dab3KuoeBb71MzLfa1LtPsnugcPLlEBQsuOUyPR3pMV3oazbmklHXJYOpSQOQSv8YRLiW34NIKCi71PtWl2Oaudyn4+4G/afBs9cTk2XNURJBNnqPkRDoZzjllMGuV49SrpDDrj1+WSgK8ctHoK2BZvoKCV71P9Sq2us6rhZtz5/gkTV18GgfJFRyZSxUEplmMUhWeKaYPfBvowPtfTFwaykxcAZXUOvCGDG4ltpBZnYIP+Y659slVs9TlwbsPyY/aH3h39Lwz1GbLp1evM5iUPxNNHTLQgX+xvtkeJaEyFDlEc+dbi7XwM1ALNt3J++ifNHceLsibmVXDPXs+H1tyfwghP0e5w+da4UzEH/2DMyQBnLEY1cUXh5ly54NR5YE32if/kPfaoOINvoAUuwy2ZE50Wakt/zV4GJacMwxSwrDZpyq/Wqtf4rN3U4fKzS+vhGnB1Te9b/l8KVyzHJ/thG2Gc74ZDC/WoPyEcY6jIQXngro/Ddm/rPkzPg0bq5eu+yZqqnutbexgdnV+iT0yfF33c3fy+A794s/6Q5+hIBjd44ZPbc8+BQNGisEmxcwhHEMhGKUqTNJgOjclVLLLzE0NG5U2HkWP5cfX9snR3XmPYoO83qPgR4+gBNUZZJPFqILAJIvRLACTFHMmKYVLoyULTDIYDQskUkBkEl0YpqfEFkzq1JBIvQNZ3F1g3Mz0ZLdLyY+nRHpTGfy0LIP80VMxc8fnOyG/Yk5+pTa7Jy1kDqvnECF/QEV+PM1BXwD6J7egf6cG/XsPqj+iPaR/8EX/1jTov+NTrNDfYjQYob/BnvSl2A7b8V+Hx/g30ahLGBBQNWDHJ0FhQHL4p9dsU6U6NRjQe1ADYpN6f5f5yokjPlAcaE3Dde30qObFYpTncMBgzgGD7fSspoumDkSsZQeSW3CgU4MDvQd1ILae6w+PX+ID5VcFZD8lLOaF4GrF0ROcHqNaAls0Gk9F3xyE14jRegFpobHMD6ZJkSs8ySMvNJpJiwYNnkQT4qsnsQ1dP1PntrW//Afqt6YxKfjvz6MsWYzmeKivmFFfIahPCwGo7zCZFRLCuJ2KzY5fjQnxk4OWE0eX/z5Qg/y9B5Z///TYJr7xw4H+qWm4rB2/jPM6g1EqvThM/3Sro/DaOzpff/MY6d+hqj8fh3zr3Jf6D1TXv7fpkf79U2wP1w7/xg9zwtQ06j+sjOOY5gxGBRr6xwWNpczpr5TV32Gif0BUfPjIJ/RP7sspYaAG/U0Pg0DlB7T9E776fVcOm1dN0+0D5Y7xkRfozxaDZpTAyJPov4QDR7UFRhnOOWUwa5XlxKuksD+bahD+Nmvl4JWLRl/1faAGr0wP817FPhH2ilVf3zDeP8Un600v/NXS+kXgWnC4qPH7UtWCaQ7jgyvwzGC64LIY/kphvTZUNxON8vm1QZRdfD4HjplgaliDBr+iqcSf9yu2hw/kVnzg/oqMrr/LrcSqTXz+FTaZcJsdH22FTy6eM8pxzinLVT9hVVJQtH9ZXB25AKtcNKKQXJ0azDI9zJsVe0mXXG7Dvn8KvkxNral8ISplsMViVFTgimIH3n1+cxREpMRG8mgwPcnRqDK69SRHx8apibMfjkSX412t3qYr4/1TbCXX6x980b81Ff21ejmMT+tCf8X0D7g7yuqvwfS8Uwu2qH8EKzfjjf6dGjIi25z+sZFcr3/wRf/WNOrPBy0x/i1Geznob7AN/+KABDAY/vJIrTZIAMWOnCaoSUEVA478B1tQkhKDmlPp0pLkKPyNjnppHz2aMyV2kutNCb6Y0pqGS8XfragXAVMsRrULphjMmWIw/EWB2ilMUcyZEtSiKYktmNKpISt6B2ij5XHsJdcbEHwxoDUVA6hCwwCLUfGCAYrpX+xwFF7wrRtGDeZmhaCK/ohGCzRkRXILBnRqMKD3IAbcf8p74D7uPvnRgN40GsDnCK7TJwtGheTFYmat5Dul3L+5aHrDqlHFATMvZ58L88JETQa0NlOCNhj79w0i1lJ21/HFz7b7/Oz91YhTncS7eGsdeG7c/SpGjqoPLIprYY7qCjwynD6FYTEMbEpNmNTDNcVeWxt+pG1tb70NC5/+NXRebqJ8ah0nUfonx9SZXaluYs8468j2/Pv70sscftjnR+vv6Hh1pRgSXZDQfEAYhniOSgMMMZz+EW+LbfA2unp5MMSE49u3sCio8ju6mcwbtuBaBiuumQ7mXYudI4aSpJG3ijefSJPWNA0vqEMVCqZYjEoPPFHMzCSGQp+UwXBEgx35LybAkaBKHUM0ynMkUnJjOsid94FqKfjR21whi93gegOCLzNJayoGUPmBARajsgIDFHMGKAXJKGNhgGLOgKCWDUhuwYBODQb0HtBW11Kb2BCuNyD4YkBrGg2Q08L77Anp2evwBm81qWUEBmg0/UncUQimNUmDmbVUdlkMcDN5BCszuUmATg36Z5tLALj50FIq+KJ/ayrCagWymFYgxeS3p/1GIcivBUgxt5AKqsiPaFqAksM/0wiiPt/bpZU7HHm56EHHf+wH14//4Iv+rWm4LDxxXgc2CpDFtAAp5gqQUpBMC5BirgAFVQw46lYiv8DS+M9g0xoME4DpYH5Ojo3fekeCr3WFT+tinrYYlR+4ZDEqLKhSiu35pso3R+HPB1FmYprQYEezcgqquIRolMCYp1u0Vn+QE9wES0y0eUtiK7jekuDplw1+Jyo8CY6so8SHJxajBIMnirnlrFJQkdIQnjispjSWTgGxJZSGsCS5hcrVqeYcbOo9SOXaPrgJT55M4eO1z/vkqil8bPY6g0mimGjGFEPhT0xJoliMTUmITOEjpW/tCyyUsxZtLGetDbN6n4hmc2eLrLlv1QGv22PkB8YZpjdN/UEemvpgSXRFzlE6vTjMzDA+GCXdzQUzM0wGI090j9G4rxNloqZEaW1mit9CkEeWWMkXAyIEKUtFAwZYjMoBDDCYuV/rMBx/quMdDpholDmvDaoG4FBIDYakiGBLSdGpwYBscwbEzvG33BvZxkfrvREcsKjXjaIVXL03gh/3KweHPEd6wSLDmZtVDtvgZ8/aLTwy4cxKOLFyc4TP38OjCHb/61m9/Og+ZKIGj/KTY3rNF67YNK6e9LfBl7RpTcOF4ufGqg5MsZjWLYOZm7w+mhYujeYcCYrzhpIQniQ3Kms86dTgSe8BbXVvvo1t43oHgi8OtKbiAFUkOOAwPjyKrDCYc8BguJtabUdSKOYcCGrZgeQWHOjU4EDvQR1AtIemjuBRCqfM1Lfd7rcGw53RKhBcsZjWKsX0caiZYFqpNJhuRfLCiiemTkWopbmkU4Mj2QZjuo7zdSo2l+uzJPiSJa1p6m6DW0zih8W0Tinm/FAKz2FQYUGSGAz76XppmN8DK46Yxzo6B4G7svprSItWFr29B82S2Euud6BtR6drgNz01TGnW0xrl8P4HC5ql2LOFaXwx2S1dBmM8hKeBFQ8ufAPWZg6Ehst4bH3PlBDmvQO1JLYN663JPiSFK1pdGnIwjzTu7UYiQH5FTMHdwylT3m4WAc+QAf5o8ci/0FPsjVsGusQOz86tX30NrO+3T24E09+FLs3FbGpOl/3HhOxDWbENpQR21A6ISRUtEbeUAV9a9ePKaGN4nfT9tHbnNgY049Mybvgi9itqYhNdRxiW0zFVsyJrZQTWykjdkAsNs0JEDu5Ira0QeweT8rILjZ1AOTexcLh5vxkvduEKlYnrud9cmXFhFyrGLyICyFMvVDMeaGU80Ip40VA5AXPqPCiBRvGPTfBCRNtqLh1d3B/hGwmEZa8yW0g/umLgA2GQRUd3gSHixoxWaZabKveaDTnjVLOG6WMNwGxN3Rh8KYFG7zhJnhjos17E5u635I38cn7u1pH0WkmgDfBkTdUcJE3DjPeKOa8CQo/HTSlbrYDUvi1QewEVVw4IR1gesi2S+8UXkRbiTfvRWzvnBf2jMf9Ti3yqkwYral4QgUXYjvMiK2YE1splwhKmUQIqMhlft/Oy6+Tc350mkOgfg+n80Vs3NZrHXzRujUVrWnegNYOM1or5rRWymmtlNE6oEWtE5t0xUiXNmjdw6nWsSFbr3XbSbbkRRFpTUVrnXwdZrRWzGmtlNNaKaN1QFVrvvmKqpJY0VraoHUPp1rHTmu91sGXcd2aRq35AQeMa4cZrRVzWivltFbKaB1Q1Vr+bmq7/FpD8qOT/tC6h1OtY/O1XuvcrPX5AeO6NRWtaX0DrR1mtFbMaa2U01opo3VCGI99DeDqdWLTdIwaIm3QuocTrfcP7lyTH8d1b5qudbPfyyLRYqq1wYzWhjJaG0q1TmhpXDdsGsPve2376G1m47rHiJ5Zr9t1SPJF6whRF338WM0VB1FyBTNaYrRWzGmtlNNaKaN1QItaJ1a0ljZo3cPpuI6N1H3N/uf/+OXXn368/fTzj98jme4fcWew9/GBInZrGlXkB4UgtsOM2Io5sZVyYitlxA5oUezEitjSBrF7OBU7dkaQdqXWbXNVhKWtyzNe+25G8Z72DNDfYUZ/xZz+Sjn9lTL6B1T0R2GkTcNbu/4yY+Z3GtpgQI+nBuQWabUBwcPRPr3gymiJDQMsJqtDixkDNJozQClngFLGgICKAfojVV79IDUKe35yygnI36Op/LEfWj/+c/9U5OfnwCC/xWQR4zGaf19cNCe/9unkV8rIn9C4iNns+WWrGP/JjasYbYMBPZ4aEJuk9QYEX4p9axpT4kB3XVBsHGbGumJObKWc2EoZsQO6azSkND/TBbGTm0Y2Rru0QeweT8WOXdJ6sYOvxYZfbYvRbjGqljDAYcYAxZwBSjkDlDIGBMQGUE2FAckVA6QNBvR4akBsnR5Y28QHyAGq43DAYfp0mcWMAxrNOaCUc0Ap40BA5AD/5Qg4kFxxQNrgQI+nDsSGan0KBF8N4AfoYIDF6GYqUsBhxgDFnAFKOQOUMgYExAZQDYUByRUDpA0G9HhiwOHBbWvy1QB9wNJi/FjddW8xNcBgxgBDGQMMpQYkxAbQiuGtXT9qPIT9/BX/3bR99Dazlz1g7M/sZRd+e8pP0u+CfBL4eZ9ctewo84HFjBdxvWM054VSzguljBcBsReSDHn91Yv87OQPvOjxNBnwreDF+hcaHeID5e1e5oVGDtvsjzSlIR1MOPz2T3XrxXLOBBPOuWAwY0NS2DsN6yJ+UBMp0aMNKSFtsKHHUxtif3b/aUq2wUs5ER+lQ878BCVyIjg65MyPUMIRyxlHDOccMZhzxGDGkaDKEefNnp/chCPJfRafVqSkDY6YeLM/BR5iE2c9sreF8gOsOI1tOBOBmaN0hzOWM84YzjljMOeMwfiA3Gu7NnKmngmALz3WkCnSBl+iDdE0U2Inh4omieJNCH7crt3Pvn/+RjumNT9/CrkdZtRWzImtlNNaKXOoOS+sTA/mDn/DppkAM3V0MMwYEDvb8E8vc/NJEHu79fIHX+RvTVN3yGG5NXcfSuKSkV8xJ79STn6lnPxBLcqfWJFf2iB/D6djPfZx68UOvojdmorYuhJymBFbMSe2Uk5spZzYQS2KnVgRW9ogdg+nYseWbb3YwRexW1MRW9c8DjNiK+bEVsqJrZR5lcH9NeFIuUWxEytiSxvE7uFU7NierRc7+CJ2aypi040JVHGHGbEVc2Ir5cRWyrwZMC9sUewINlRsVHFpg9jZZvZbxwc3vMljDu7zAe7wy08sFuNH5697j9G+8sVhxgATzBhgKF1LNggVYfia/Fej3vqFjbeY22ento/OjfFmp9H7+2Af2nblB5a2XQ7b7PmlATAl+i/hwNGSE64YTrBvFnO+mGjGmKSwNh+NofEHY3o0lJdc5GsbjOnxpAzdv/9jNvRt3XRtZvebcVleWePMcDQ9wwbTrbPBYM4GgxkbkiIbaDaDDT3aYIO0wQYTbz4/YmMG52SVv7AdPsYn73/gfhw9NC8875PD4mvA+H0GSJQIR5hWL8WcP0o5e5Qy7gR0v9M/XT/+7hHvuPL6cXdvcCc+O7TBnYyHWaTHm3cnt2zGHbsHOwaPAdBj48c8ygZY4jD+0RWWWEwtUcxZopSzRCljSUDVEnNzIq+/zOjaBksy3qp92TE2cet/18kPLHoScSvG79aAJxZTTxRznijlPFHKeBJQWWRt9iZNkhuXtPmdBp/giYk3nyaxs3NFzKdJ8KQ1zXtIE4tRNsESi+nUopizRClniVLGkoCKJfp39trlD+q/mzY4YsLNOxLbv/WOBH8sVXbPb9GAJcGRczTnwBKDHfg1GpjtFXOWKOUsUcpYEhBZQkMFM31iJUmkDZb0cLrgii3hegOCL8Ie9AUeR4vRMRbobzG6Hwv9FXP6K7U58IvFby6Yuc3RuiyrloOeRk+uZkVcyNAGC/LiPqf9+uTXMTaK6y0InizQqmQxrUoWo6EGCxRzFijlUkApkwIBlRSAnbraTa7kgLTBgB5PcuD04HY8+dGAPZ+df94bCtcvJchi+q4Ogxn9DbU56Ks6DHbiOzCv7QsUB078yOdbw6Y7Qe/a9NGaSrDZWeGEXMAucHVGJD9dAtSPEKNHUEIKkMekABnMqa99mtFvYumvNwkVufjvz0H66HAoNNBe2iB+tplbUSco9JDUwRepW9OwmTjwxV6x7v7sCf+d9hwHzvsXhzmpbTCqgTcXjHvEOI9YRWve5EDrpMY6o23QukfTOhNbOpghe2i7/DwFj4CjYlTBMdQtRhUc+luM6in0V8zp36i2iYXWrWm6WjOuAypam7VmxqoDOz86GQCxTbj5qhLbt/Xy6x5T/8r2/qQUCo2WeYup+oo59ZXaHFhsOGIwKm0Y/QEtOpLYpD5KjbTBERNu3pHYvK13JPgxIZwjSkEd2voiHxzGr61BPijmHFHKOmIwdSSg4giC0dyFipRcsUTaYImJN0Sri9FT7N7WWxL8/dzGUKR4MYEiFdxoHb4T3R2DKRajug5TFHOmKIU+qX4iTQympgRUTLnwn2eFJ4kVT6QNnphw857E9m29J8GT1jQhwBKLUUmCJRajAgdLFHOWKOWWSEpxdUPhCqg4cjjQt4QjiRVHpA2O9HA6b8febb3+ZiO65fe7Qn+DHfhdI9DfYfxKFeivmNNfKZsSBtOUCGjRgMSKAdIGA3o4NSD2busNCL4kgDPAYAd+bwoMcJgxQDFngFLWAIOpAQEVAzYH/UOc+QXqaio/O7kCB0y82aJ0/z1nZuOw8INQfpKmDP7Tms/75IqL8mKw6wwmU4aJZuwxFBSVKcNhYk9CxZ6LvkSrx2pL6ffpK7Wmj9aEYJIdZ+TFjBN2W5H8qKu5fWEoKEHlFepH52MwYDSJvDjMqW+D0VRzc8F0V5cXVtXn5H6bYjWpoX67itYE9aOpBJvPDIjxkB/Bj1vqc2saF1X6dgmP0UoX4ms0J75SZmo2sYz2EarItTnwWwQgfnJTEYL60gb5ezwd/LEDhD/r9tTn4IvYramITemMkW4xWsFCbMWc2Eo5sZXSdVB2yGJTAYTYEazMAtoGsZNzlSY2d+vFDh7uTXsD82PN2WAHfTTcY2qARnMGKOUMUMoYENCyAcmV0S5tMKDH09EeW7n1BgRfRntrGjw58HPsGO0WU7EVc2IrZWdVg1EavrYLq2pvzjRJYLhHsDrcpQ1qZ5sb7rFJW6928HW464P4Z4MdGIMDFlMHFHMOKGUdMJg6ENCyA8mV8S5tcKDH0/Eem7L1DgRfHDjsaWxgZekwfmQfDlhMp1fFnANKWQcMpg4EVB0wt1H7F2grGUyv/aOtDQaMbfV20Dk2ZesNyE1cP9wEsVvTWHD4xQEQ22I63BVzYitlxTaYip0QRJpmsYM+jN++wHQEFWrnZ6c2qG3iza8lY0u2Xv/gS8FvTeXyaUsD/S1G630sbxRz+ivlZlelzFoyIB7rtMNAvU+uVBtpg/wm3qz8l9jkrn8YMz9wP1rZB4s5juqwzYEfYb7uPcdP8b9YztjiwhlfHKbGNArLxf5VNwd9Qr9x05h8H653qkKN2+kO94Lxjx3VAzbEBxZtMBi+At1phw2eo1IBGwznbDCYs8FgxoakyAYqnG/DtTXJYUPvobV99LYx3nx+YJw/stW9BD9mB/Smrcrz3mNSsjwmJctgcibi20yfVGZuDpNDKa+NoqKlDyrnpWGROuZQPTIMm0K1YSkLm7LNLFsvsYFb/1hsfuD+2OGQyfrAcnL1sdiDPrA8w1FaIV3iQks881eZHLY5nCj7YI0JZ/IlqPpc7OGk+ZLcp8D5MEP2AKGGfDHx5vMltnZIO7lbsXDT9BKfpJum/IwsUie4mmH6LKfHNHVMNPMXgnw0zR0TjVxE6gREqcN/CxX1LLlxvtc2JIqJN+9PbAZ/iz/xSfKHH76CP8FVf/jwGGYci2kGGcz5Y7ADP4OEBDKY+hPQsj/JFX+kDf6YePP+xFbR+WNvdV+Cn5YeMKA1jbWOn7OCARajmQolTDHz9zANtTmcaT6D/hrM1K+ASP8zpS7yIzn8MxR1mVo6NVQ008O8I7F3XO9I8MWR1jReKP/pJDhiMdrbwxHFnCNKbQ78sBEcMZhmREDkCP+JVTiS3IIjnRocMT3MOxL7ywem//gATf98Ag6ZE1yZriEa6QGjPEczLJwyHP9KjnWZodArZSKsMpxbmQVWpn/zqoaMRppI9mSwsh4wHcx7FZvR9dkTfMme1jRmz4VqC0yxGFUNeKIYSw1LFIIjOt0bjAYLpvuASvLw0EPqJLWQOp0aUqfHR1u5t4XnPB7avDR+EH9qKuJTTbpa7CiPmThMxHfQ5sgPYNwsxuI3qIi/lSP2HftS/YHq6vc2zPF9EppLBjxF8qAfwRc/WtPUHcShZRP8sBjJ8+Iw44eNRcUOfhiMOnxtUPFjxz/7vnVswY/ocdw19k/qrvHwFBtKfEi2Jm5p1fiifoQoa9uj/H3Y6ZPFJKpYUF+jGfUVguFU1qC+wVT9gIr6UopaqK+37AM1JEOPr6Uot66rxQ++iN+aiqpUlDH0LUYVC+IrZsRXaHPkR1cgvmLyI2qDiviuFEWsJfU7NaifbetKUWwa1ydD8MWP1jT6wY/iwA+LUcWCH4oZPxSCHzTO4Ydixo+Aih+uFCW2UIo6NfjRO9BsiC3hevWDL+q3pqI+VWWobzFaW0J9g+k222JHPiMM/U00MglTQUBFf5hJlQ1zQXILBnRqMMD0MD83I/4DN3oPT8EXS1pTsUQLlMW0QBnMWWIwZ4nB1JKAyBJOHViSHP7pix75C7ADNVhiepi3JDaFq38UwS7408OFH0UstjnK8xNznJYu0+3GWeU455Xj1KykUPUnE47GLBeNCsD78F0Hs0wP82bl7nT1BB98yZ/WVL4QfXGUNItR5UNJM5gzxWDOE8WO/LdVUNOC4gQitZFAyS0kUKcGT0wP857E1nD9NBN88aQ1FU9oKQtPLEa1HJ4YzHliMOeJYkfeS8CToJY9SW7Bk04NnpgeZj2531x6ZJ5JfvSkNxVPZJ7xmMwzBtOFl4E2R36S43ZwGOXva4OKIboLyVBlHcwdvvdY0z34j95mtoAbpMJD4gePbU0vsfo4Hn5q/Yw6UhCHTlFdZzCZTVw0gr65WBeegWGHuTC1I6BiBx7YoC7fWrBiCHcJQzJaMcT0MMSv96w2sYfER9bt0pMfxT/z6fxnPBfvLCItYJHFZGpxGOkFizTWhR8HhEVK8X4GGRMQWSSPwXTu6xLWohWLTA/zFsVGc71FwZcS1pqmxELK0DwJPyxGs8+LxdQPG4umKBhiMBonMCSgaoge0e3cgiEZrRjSe8A8QxkS+8r18gd/f0VOr2IQm+YL5EhwW0xQI0cTBkxJrmA878IUxbDKrD8wIEuU2hz3VDvhisHUlYCqK0d5KKMFW6pkEQ0+DGrw3y7EbGM6nc+c2JGuty74kjmtqVwWlSiYZDFKMJik2InVh0lKwSTqEyYZTE0KiE2inMZ0k9xC6nRqWo61T7r5H9Eemv+DL/q3pqI/jWvobzHKOeivmNNfKehPfUJ/g6n+AS3rnxz+mcY/jR9M950a9O89aOmKHeX68R980b81DZd15APw0N9hfAAe+ivm9FcK+lNhhP4GU/0DWtY/uQX9OzXo33tQ/WP3uF7/4Iv+rWnU/0AFG/pbjCZl6K+Y01+pzZH7hP4GU/0DIv35tD7qT3Kj/ocT5RwSoGODAb0LNSC2iusNCB6rsykJn/iGK6Zugx3lrwHOYJTUMMVEM7t0hx35FatwxURTVwKqrmz4JTNwJbnRFbMJ6dRgiulhdp6+r4EemSeSH/OkNw3OHfnlDVe808ZsTA4yTzjMWOKwIx+6v7lOZZn02qjqyZGP5r917mtP8tKw6Jo8aW2YxPvwnvcESfOQJ8EXT1rT1N3myOf54YnFpHY5zHlio1EGwBPFnCdBLXuS3IInnRo8MT3MexLbRnxk3WZ9G3wpZ8cjLSSfcfPBJAUfoodPFqOV5IvDzEbEB6N6D5tMn+QlMieg6tJOnuDs3IJLGa1kTu9Bppht7BzXexI8AvYcRFJQBYInFqM1EDxxGB+0hyeKOU+U2hz5ND48MZh6EhB5Iq9lbsEWNofZZa1mpof5zIlt43qXgi/VrDWNxvEfJoMjFiN94IjBqOR9s9CRnyyAISbWkU/yI00Cq5ZQMcD0ktRCkjjqyI8FfPRo66ac2F2uNyn4YlJrKiZRWYFJFqMkhEkGU5MMdOTHC2CSxWgxCJMCWzIpqQWTHOVMMn3OZxL6fGhdEHwxqTWNJvGTDTDJYrT1gUkGU5MMdOS/BAOTHGYyKbAlk5LCP1OpJ8PfW5e1ADqTTJ/zJsWedH0mBV9Mak3DxR/5EQ+YZDGqKjDJYGqSgY5nUgwmOcyYFNiSSUktmOQoZ5Lpc96k2LeuNyn4YlJrKibRkgwmWYyqIkwymJpkoCM/XAGTFOOzEih2AVWLzH39xo0m6Y+TEzUsr3sPunCLHep6+YMv8remIr8u0hzGz4ZAfoOp/AZy8htsz4e9YEBgywYkt2BApwYDeg9iwO7BXX/ydeXMT8U844WHZjfDP3hfZzBZp7loYoqDjrzWvdkujSkZbdGUxn1tykRNprQ2c8t+h3x4ZHpPnkyhmg1TMizScZoLj/JUyRwnpcrFO/Mrb761cHR1tM6DMXF1BaOR8NqgasvxQtn+1rnRFr1nll2WHU1rc7bg2h6yJfjyjU78gAhssRgtsZArFqM0eHGY88QEkzdawBODqScBVU9O/Cc64Ely057+3bR99DbnQGw3V08X97/TBMfQ8TjgNTEMduK/CgIHLEbR4IBizgGlNs4Bg6kDAVUHXFYkt5AVnRqKVe9BZ5DYha73JPjiicsKi8mq6v5AJDt84p/c4YlizhOlrCcGU08Cqp64rEiuZIW0ISt6PHUgto7rHQh+XETtWtOQKCd+ZgwZYDGqvlBbsRM/MYR5QanNSR80MRjOktYzFZgYIliRW58A7dhCBmSwyRPo3ztQ/RHtoXkh+KJ/axr11+dKdhbTOUCxPb/aGPorBf1pIGMOUMzpH9Si/onhn16RdRORXdZ5uXeg+seGb/34D77o35qmy4IWtIPG+LeYzgCKufGvFPqkCgf9FZPHfzD+g1rUP7FRf7Mu6hS0/nxLCsZ/70D1j/3dev2DH2cAvIu3ZjSWRUpBHlqEwhKLUX1ASVLswHdKkRKOInvhiFLOkaCKI/gCVCyxLNJo5jf3Tg2OmA5m73PsYgu43qPgS460pjFH+H4CDLEY2QtDFHM1SqnNafiSn4MTjijmalRQ5Aj/VQs4ktxCkgSFP4w4WNJ7kCTZP7jRTn40oDcVA6RIeYxG8cvBYHjAtWbhN0fBAClSJhiPjNcWq+hv5mgTS6eIDk3iZxPCq/gY94/M0Pvgi/itqYgv5ah/smBSjgzmxLd9UgW5HUwwI37EWhRfuzTiN2gQv4dX8WPfB2DdD+b74MfpYbPn2wrPePG4WfnztV5nMClHJpozxPZJSQNDFDvuKE+RDkFVRw4U7K1hgL9YMfUeB0dM+KFy1vPV+9jfrfco+PGizvy2Ilik1ObEfxICFlmM9ELBUsxZpBT6pOoHixRzFgVVLEI0Kn/wSKPxSHyfoMGjHl+zJvZ76x0Jvp54P/GfdoAnwY3O4RtRgYInFqPSA08Uc54otTnx6Xl4opjzJCjyhA9wwxONZjxp0OBJj6+exB5wvSfBj1q7LFEK6lAdgCMWo+0aHFHMOaIU+qSUgyMGMzfLE7v/02vUxvyEZMIZS1qfgyXRVOLPl7LYKK43Kfgy17em4euc9lRD4IjFqDjAEcWcI0rBEVpfwBGD0RjAzBJQ0csttDSWsaNBgx09vGZI7BLXix98Eb81FfG1QFlMC5RiTnylNic+OQ/xDabiB7QovsYy4jdoEL+HV/FjQ7he/LbzbNExO7SmUXw+dY6RbzEqWRj5ijnxlYL4pCvENxhBGPkBLYqvsYz4DWryfAzhVfzY+q0XP/gy8ltTEZ+KMsS3GFUniK+YE18piE81DOIbTMUPqIi/2fMPXpiZNZhRv0GD+j2+qH94cHed/Kh+byrqUwG+HjxG5enFYUZ9H4yK2M0F4/u0rw0q6puib7pU8Ts0iZ9NCK/iY9A/srs+BF/Eb02j+HzsHuJbTDZzBnPi22BUxCC+wWToJ7QovsYy4jdoED+arPixzQOwbnd9CL6I35qK+PQdIb7FqDxh5CvmxFdqc+Lj7hDfYHRhGPkBLYqvsYz4DRrE7+F15Mf+bb34bZ/Yoj8f7u+Wlh8wj1SAIb7FqDpBfMWc+EpBfKphEN9gKn5ARXxX9E0wo37rsenz0S7CDv3Yqa1XP/j7n/2btiknfn8/LEkOvg8cH+iHJ8nhokdOy1FeJ9YTnXOuGGxz4sPtsMVx6ktQ98eNeqeIRtxbizbVg3dtggsR7fRkqn9szta70PZ35bqojMAEi9EqBx5YjNIHeaGYc0ApSEZJBgMMRrqiKAVU8gIv6av31yG/xjJp0aAhLXp4LUqxPVtvSNvhFUOoGsAQi9FaBYY4jM+VwxDFnCFKbU78UyEMUUz+pCwcCao6wncG4YgGM440aHCkh1dHYs+23hHe9kH91jSaxGfnob7FaHBCfcWc+kpBfRrCUN9g1CPED6iIv9nzY3BQX4MZ9Rs0qN/jq/qxj1uvPu/7oH5rKuprMbKYFiPFnPpKQX0tRgZT9QOq6vP9DYivsYz4DRrE7+FV/NizrRe/bfuK0lqMLKbFyGF66PugmDNEqc2Jjz4jHQymhgRUDTnxAWk4osGMIw0aHOnxxZHj/Fb5679Wc8hP3ldyw5KC/1TAc+Pq8olPYl9nMEqqF4cZc/LaqE9ait1cMN1JZyw2h/L4zQVTc/qFTea4+LO3s49InUc218lP6zn4ESFIG6ok8MNilHrwQzHnh1JIFkpQ+GEwSZaEsPgcxt1Z7yuZYMaP1uPgRzTBb00WiPaQ+sEX9VtTuXgamVDfYnQ3Auor5tRXanPmE9lQ32CqfkA1G8zMbYIZ9VuPg/o9vqof20HYs+7expG3jxj7ramoT2sYqG8xrUWKOfWVgvpUPqC+YnpsIyFSn3cRJpTRvvU3aB9NduTnLnO19rnfvOfQ56ksaN+aivZadyymdUexC9+o/jbTp9YdDWbmgYCK9uaOan7N+49u07RIQ+e9XRioJtBHb3OFJ/Z364c+bxEhf2saLuvM56sx9C1G9QmFx2BbfjUc9DfYeUNlDGPfYFp5AlrUP7EF/Ts16N87QFs9EINjfY8V/uBL4W9NRX/6ltDfYlShoL9ilz3VFMiv1ObMB3whv8Howl4bVOSXN1BhFRSxloZ/pwb5sw0u9MSZXwfFBm99QrQ94hTbvMb2flyG776e+Qw2PLIYVTJ4pJjzSCl4RPUOHhlMPQqoeIRgVO9gUnJQvEvNwwI1qlODSaaHeZNiI7jepLaXnK7KvMj2qNTmzFMlTLKYFjLFnElKoU+tYwZTkwIik/TccX6BpUzKaGUi6T1oIYud4HpLeDOJiaQ1TS5BC6pQ0N9iNBEiSRRz+iuFPqneIUkMpvoHxPpT+iJJkltIkk4NSdJ7EP3vu5ZHdhDJjxNJbyr6U8G4HjxGpeDFYfrucx+Lury5WObcfQYr+pt1VMO+ln+iJvlbm1lHnTDwH5I/eOxJep2UYfeMv45spg1eccMRi0lFMph5MZShNmd+HzYsMX1KRiRUHdGjxw1bcCR6rGXrzMd8P9qVlU6HilrXX6fYFSL0uq1f8sU3PtUK3yLqSEFDqWQek0pmMOeb6fOJj6vCN4OpbwEVCXHLnLeDGas6Qpf/3nqs1JkPN8O33qkWt9g/rnepbUGn7DJPfp2Ugkv0LZFdFqMahXqn2J7l/+Yo9EnFEy5pMN03JlRcuugPTT1WK2SwpIVvTVA/mkqw+ayJHet6P9o2uPWHFGlNk0WbM5/VhvgW09KmmHkS0geTxZbDNEWix6KXm2wSWyhtnWoCwZDeAdqoaMV+cr38wZe5vjUV+elbQn6LUSHD2FfMrLUMBcupXmDsazDz2GNSRX9Eo5XbW4tWqw/1iYSIPkENBmQb/ulz9HxGwOCH5v/giyWtaeoOX0jLkcW0HCnmLFHKWqKYsyQotoSKGyzRaLpH7NBgiIk/b0jsJ1f/IWs8C/vp4P2gRLd7c+YfL1G4grv/DZ2Ro5KE1PEcVRvkjuHME6oOw+VRxiJ7TDi3Vg7sfghh/BaU2fAquc8l7+f9ViSLtKFamXjz3sQ2cn39Ch7rg+laN/zzKpwx2PlAuQ5jLEaFA74YjMzDdN6gNkphQGsaLpZcem1QTZUN/8QJ+SPYUJcgv7RB/mxzO5PYM64XO/hFsQ125iUixLaYViuDqdgNGsRuTZPYfMMGYge0LHZy0yQAsaUNYvd4uJA6M59jF26rzsKv3vnR+y/x0yg/8wvGnw/JUf3RM8wzHNWpFxvPvLNmJhyZdLPhdOnavmwtP0fKk7chWvP83bR9tLZSzmbLz/1gJubq32RSfHTZpODYJCqvVywYY9lQJxM+nwyTDOdMMtjmzKd8YZLjSPzXRhVREY04mNSjDSZJG0yKthJv3qTYDeIj6zbm5+DHBVVvGhPqKAsqj0mJcpj5YcphZz77Cwfa5Q7XRsLCgIBq4TrzAWEYkFzJJpr3kDedajbBkt6DlrLYEK43oO0ph2+04WKM8mWwM793HIlhMao2yAuDPfE0+s1iZz6jDFNMNDUlIDaFUhumJDfOJtoGC0y8+ayITeF6U4KHy9Oc4kwx2JnfsgtTLCYrJ4c5U2w0Sk+YYjA1JaFaR0+UxDAluLKe0jaY0uNpXsS2cL0FwS9aYLAzv1kcFjhMjz07zFlgo9ESARYYTC1IqFrAR4dhQXDVAmmDBT2eWhAbwd80gcdHlyfw4GgC11dinz1H1QCFynBuAjfY5qyvxXbhzCoropUJ107gvdc2M2C2kDZYYuLNl6rYEf4mk3IzWZfCZyo0mEuCY5OohCBpPEfVASYZzplkMJhE9zmQNo7TvAlq2aQebTBJ2mCSiTdvUuwb1xez4MsqqzUNU8yZN+fwwGJUamCBwdwqy2BnPtYMBwymBgTEE/oT/9qRwVC4hm+qq6yMNk37sKT3oKUs9pLrDQh+cTYx2JnXRTDFYlq8DOZmE4Od+TdfmGIwNSUgNoUuDbNJcpPcKF3SBgtMvNmsuMQufrUpyS+Z4rCzvhbbY1TUXg4OM6Y47Hyh0nez0cSUFqtO8Xza+q0FK1N8fnZo+2gcnh2UvLhA/Efupye/aEGELdiFT3hfDy7a5UmKlcOcBbZT2svAAoOpBQkVCy585BoWBDfI/W7aYEGPpxZApYcsCJ60pYx9PlwsRnUUFliMlgDIAoM5Cwx24dc3wwKDqQUB1dJ04VcFw4Lkvp4vJqpN6zDF9DBfrGL/CB/X3Si5BI8upi3hhR8YhU0WozUObHIYH/6FTQZzNhnswq8nhk0GU5sCWrYpuQWbOjXYZHqYtyl2lOttyh1osYkPOMMmi5EYsMlilJuwyWDOJoNd+Cc82GQwurLXBpFNfDQW2RTBFlZfEzXYlJ/EfrKP+HmbYte53qbcpQ6xNxdjk8VoTodNFqPJGjYZzNlksAuf2YVNBlObAlq2KbmFbOrUYJPpYd4mxJ+7hf/L37//233e+ifsC/MZkX85XOID9dfdi96eTK5uKS9bmvrhVMRjjiZ1WGU4XhJ/s9Tmwid3YZWJxt8BKZXfFf/0Ac97IySUicVHC7FmyFjT77+Ynkz8eadyi7p6egp+3GFeWtP0dSAOFS9YYjFaWMARxcwe31Dok5YfMESDmR/bkyrJg19DeIPZsNE3rqpwJLocVnZwJNvMz7+X2HuuL2jBF/1bU9Ffi5fFtHgpZo5q5WXXVQr/bQHor8Gc/kEV/fFju+zwM9rSHJPRpi0nDOg9oKDVn4QvsfNcb0Dw4zc3J4Mz6kjhG9GQQk5oMGBapRQzb603wY78iz8s0Vh6ZzIhdoSmHRQpDYajJjVxkBJB1ZTINswqvQjOFanj0/yG/+tf7dsn67PqFz7q+9w48ouK03UGo7Lz4jD1y1FH/vnz5ijxq0HsFznx1rjxa6pfjRr96m1awo5PyJ0HNqKNH0rY1DQNBuQB1SbIHz2Nlw+MNj2QXzEnv1JHeY2Di2Xkj1AkP5+WhfzapZM/ow0FrH0SPXABOz5BjofkD/7+ko+eeZvdE6mIlAiuis0npuGJxbiEOcx5YoNR2UFOGIyg1waxKbQugSkazJnSqL4ibh8sHcyXsNiMwtpVtwGOT8GXwnXkcwowKTBc3OTlhc/swqTA7s/mj5wWLg3nXFLKFS6lTOYEVDTcXPhULUzSYM6kjFYyx/Qw71LsRde7FPz90e9RVypcsCn3uBWjlINNDuMjrqhvBnviP0X+zWIXflQbyWSiaTIlhIXs8EX5jcDwKbgNFOycM6pjQzr1LrTExd5zvS3BlxmmNU3Xtbnwo05wwGIkBxxQzOWJo2hNAf2VMnkSUM2THe97ob8Gc/JntJInvQeVP7eiq2tX8EX+1lTkp1oM+S1GkkF+xZz8jqJYkF8pI39ALD9dP+TXYE7+jFbkNz3Ml6nYT97/GNTK2SQ+UOq//JVJlCmDIUtomoBNnqPlJnwynDPKYuqUwYxVSaHs9wq02W3p2mCViea86thQqUwX817F1nN97Qq+ztQHnVEspjOKw/gwMoxSzPnkKLVJKeNSQDWh9L2Y/sLIy/dG1Q1L70HrWew911uiu1x9XPH4pNTmcuQt/wxG9zrgiEZzjjhKHVHKOBJQdeRypIU88kaDubRp1JA1poPZrLnfuH1kU5N82dTgPYb1TsTzMbGaXHxi+jqDUbV/cZg+UuooPM9Wr+zmKPUoL794tOcV3ZuLZSzqWkwWufjzFiF/HrIo+GIREoSUgEfBkUcyByVWNkgIR7UBJmW343xgMmlVr7DJXBytDl8bVGzCpdFohE8mGMnxPkGDTfE5xJfStoFsD5kSfDHF5U1g5InMNtl7xfg8PCzRaC5vlHJ5o5TJm4CKIS5vNJbLm0YNhpj483kTG9L7nwdft3jbxAfG5XRvGtY4Fzmlj2dAP0cDrm5aCl34TeLwQzGXIY6i4YoEUcr4EVDxQ39wcbGcHxlsXE3nVdgMya3navWDL+q3piIrlQHMIhajCRXqK+bUd5Sqr5RRP6BF9TWWUz+DFfV7B1qfYpeJArZy7Ot+dqOPlh43BrvwHRE4YjFSEY4o5hxxFMVCPihlHAmoOIKvSSMKE4YGc5ZktGJJ70EtiZ3nekvaHrfVP0zZrakkhE7ZFtMZWzHZg36b6ZPmWOivwYz+ARX9XT1KDP9M9ZQcx4TdqSbQR29zM3ZsJtfLH3ypR61puKyLPJty3DhMnk1x2IHPeEF+G4x2O5BfseOWTMKCKahF/RNb0L9Tg/69Ax3+sU9cr3/b3rboGP6tadSfn6xB9bEYJTmqj2JOf6U2F3kpvwvm9I9gi/ontqB/p5pCGP+9A9U/toXr9eedJfRvTUV/SkzobzGqUtDfYObuusMu8l5+F01PQDSqGAA7KVEwAcS1fX0CYqAGB/KTpgLd/zbMI3uG5McK1JuKA7I/sBg/i/JydNiWt7nfLHbRX3BNNONAUuSAHMtqnS440KKNU3Brcw5g9D/kQPBLu7ZtYHX5z6uK69FjcrfDYGbXZqjNhU/U3WyfVAlfG1Q8Mds21yUl/3uLRVpQ8n80rHQ5u5PbxrZvdelKnm5ZXGgB9HxMjq6VigF8i+4Jo6RDNimm769x1PaJn7yAbxpMl1MJFRHd/Q8XTI1rPU61bIovs8k2NoP2qUZ38PSYHygHT/HFaSEDTyLw/Q5ZX/uBo90cTPEcjW24Yjh9a6DF0C0lJ3wx4Y58gAYZFVh5mBG/rdebkW8d+yxV8VYh04ZsMeHmsyV2heuzJXeR/ZVfMKE1FQ9oyMADi1GuwwLF9KSjo2AA5SwM0GAmMRLCanQcRJTZ0D+4+9vROycnTQdqSI3eg6ZGbAHX6x88Vas9XSxMCW4sQxCIyhBMcZg8ieKwjVl9+WiUtXBFO3Vzf1ClXm2f+CkB2KLRjCsKIRalGFKn96lGxQbSGbVw2nEbnyyWoXOqFrAsuGoZfxVYZjHNI8VcJWtUG6xwpzUNo5yEQskKiM2hBIQ5yU1LLkz60gbhezwVPnaJTng/dwRfFsKtafpKMIByBspajHIGFUoxXkphGazQ9omfOoDYDquFH2IHRGLT5UPrxCDlV/WpU81yqO86mCbRcjQbG9UHl8XBFz9a03ShEIfqBPyw2HRdn3Mg/FDM+KGQdgk/HCZ+BFT82Om50oy1tCnJYFOGwI/egWZD7BjXZ4Pum/G9KZ9ReyxGJQqOWIymejii2IVPpSFFlMKlUSGDJYpx4UaKBFQsQTCtR8kt5EinhhzpPYgnuwe36snXQq+eeIzS/nr0mFQtgxlPDLV94mc+bq5P9SRjLXrSuK89majJk9ZmNu87ZMgjm/fkxyrVm8YqJU+LHD0mVcpgTv+47Do0+G3t0F+xIz+g8tooMoAfs3jr3IIB0Wc5zpPXgR40KfAdYMD6H1R38QH66lRbnvE1P+MSRlUDWWExqgcvDjO/avhglIlwRftEKefZIyl2hRIWrkS0heljooa0yE9iMdsXArMbwLtBDyVK8Ohiiv3Ekx9ssphM8R7T5NFozialULzIANikmLMpKLaJpkTYlNxC8nRqsKn3oMkTG0Zk3LofZO93VmBiqV6tqfhEEz/yxGL0LZEnirnqpdT2iZ97gAGKOQOCKgaYn/8y2FKaZLBxldU+6YpX7APX69+2l81dJEBrKvprnbKY1inFXAIoBf01ARQzs3dAi/IntjD8O9UE+mgCoQMd/oj2UE0Kvgz/1lTkpyKL4e8wfbbDYE5+G4xqHoa/Ykb+gIr82yd+NALlJzn80+sx3zN4H6hBf9fDVHnrpm8XO8T1CRF8caQ1TReKL6QFyWJakBTjW0PfjnnVda7id5vDEI3FO3UspgIqhvA9HNiR1IIdhoIWVByQIr1PTZHYIq43JPhyE4o7RNEKigSjaoSssZh6pJjxSCFIQcs+eOQwWVoFtOSRhjIZo5B1qPeoDsWGcb1DucEc7qzvWlNJGarnsMNiVOswhytm7FBo+8SPJsAOh4kdCWEU99q0lVc+tVgL99Wzx0JZR1ync2Vt/+DOPfmxrPWm8TvqAwYem64r72UZTD0yEDyiSno7Wow9SqikjLmX1bCv65qjnEeNM1P/HvnyyNSffHEkQtQidqTqdD32TxbjqPC8OMz99OGjUUWHJ3pt5qePpIopcJjq8FuLtrD2bdHGtW9rcw5AuIccCB4L7CHJ+Vj983FvMSpScMVheljdYOY4lqG2T3wgG6Zon86UpGo143PbMCW4Uqh0fpmoaUXWrqP0MJWIuiLbx+5x9fSS/NLplMTwHQY3+aXvsCl6J4xyDMmjmDmdYijYRJkImzSYsykoyp0TZSJsCm7Jptbn4JLrYNal2Heudyn4UdcN/h53rdpIJsWgGNUHuGQxWj/AJcVcMimFPimB4ZJizqWgyCU+9gqXkluYdzo12OR6mLUp9qfrbcr97LBWu38VlE30OiQOv64Kllhsuq62DlDMWaIURgsNdViimLMkqVJ9nvjl7bAkuQVLgkJ6DZa4HqavTvUN8R+ahoIfMwdrTapIyByLUYLBJouRssgcxZxNSuHSqE/YpJizKai7C+NAo9yHTcnhn86ZaahTg029B7SRKRgcMOV+z3Pdjcl9fIBcoQoEVyxGtQWuOExPqhrMueKCyfvoXZ/OlQhGrvCxV7iS3IIrnRpc6T2oK7EJXV+9ctM6jIztEx+qhSkWo20GTLEYJR5SRTFnilK4NE0VxZwpSUG5ngKIRlkMU5KbFsjvra3WLxdvtn7FPnS9KcHXTNFTqHuLUULBFIvJ8+wGc6bYYNQn6pdizpSgOFMo12GKRjPlq0FDnvT4kieH+d3+whGu/GS5e7bd8EHc52NyxcQNH1u9zmDTSMpFgIl24LOt32aCUZreHIYfYurC8rVRxZ0DvzX0rWNjxuTVYt6ZzGjfQN9VfzwgMx6aSvIDpC19A1gQcQmjCgILLEal4cVhzgIbTC1QTG/8twsbjzRvTrwDgwURbJD73bR9tDY856D5AJEeWWIdgidpaeUBByxG5QIOJDZ+UeQUFQJYYDjngeuVT7IiDRQzHgRUsmC74cft4EFy42zOh2XgSqeGxOg9qCuxv4S965ZY96IEF+8Pskyz3IbvGsIWz9EohS+eo0SDL4ZzviRWr47yEb6YaMYYQ8EYSlsYE1xNDmlDcvR4akPsH9cvdQ/xARg72qDZYTHNDotpciiGFCJPMUcotpW/aAcTFDMeBFSSAxbQ2gIeJDfNB0gFaYMHJt7saZX7EyEPlazgF01xmB5Izd5rtOFa27yt0awpisEU8g6mKGZMCaiacuZn7WFKcsUUaYMpJt7wReuu8P7gyn0qh5FSspYWVvHRQ1mib3jBgeIVXH3QZ7OlMoLi5TkqEChehrMeGQ4mUVbDJMMZl4K6w0ON4CNicCm56eYJUkfa4JKLNy0jyaXYQP4ml+Kj7BJVI7gUHLnEMyJc8hydlIBLhrMuGW6L18vV1S1cMpxxKShyiQ9hwqXkikvSBpdcvOnayKXYY66f/YMff/+63+K/LwjKIOOlPkywGGUUPFDMzfJKwQBKOxigmNE/oFLLzM/GGet+n6snEw81pE0GmwoeDHEdzBoS+8n1hvCWFGnRmqYLhThUQ2CIxWhlAEMUc4YoZQ1RzBgSUDHE/EacF7ZkSAYrhvQOZBl2nN+z26d/kqfBL5XKYnyK9Xr0mNQpgxlLDOUsMZhaklCxhO/gvbXLX3CkxRodaW3m9+FjbDxXJ0TyY4XqTWNC7KcM/FxHQf3oqXrJbxx4cdieb/x/c9R2s6ddzW0Go6r42rCivzmcmt9gyYD4nqCmDWL7pDMAgjyyBr6/X/ZzPmjRn4+9qRhA5RoGtE8WjAoXDFDMGaAUDKDyBgMspgYEtmhAYl9PEtlnNaB3oDUpdo3rMyB3mcNEhW+uNclhfBYVplhMa5JiriYptd3wKVOYopi5eZjUoicRbCkpOtWG7Ue7DHSgnsQucr0nwcPkvnjAF6fNFxLFYlQ14InFaNAiURRzZ4kMhmuj7IQpJhp9ARSqgIonCEY5jKkiuTFR9H77RA2muB6mWl6Xt/fjFg/VruAXbbIY1RbYZDFKRNikmLVJsa3cB4FNipn5PKBlm5JbsKlTg02uh1mbEP8hm4JftMlhelbyaLHpWvM2i8GsTTYaJQpsUszYFNCyTcnhn15eTDZ1arDJ9TB9dcqm2FmuL3rBL9rkMD1AebSYFj3FrE2KIZu06ClmbApo2abkFmzq1GCT62HWpthvrrcp+EWbHMaHRFH0LEa1EUVPMWuTYrCJSiiySTEcjKz3YzA5BbXsU3ILPnVq8Mn1MF0HpVNsQ9f7FPyiTw7jI63wyWK6rlPM+qTYdsOHVeGTYs6noJZ9Sm7Bp04NPrke5nw6PXhPIPklnyzGP7xejx6jJeGLw5xPPhoV0ZuLZnzKYIs+Ne5rnyZq8qm1YTHRJ7bZ3wVOyKRHVhHJL/oUYSvGB3zhk8Vo4QufFLM+KYZ8oioKnxRzPgW17FNyCz51avDJ9TCbT5DyIZ+CJwNoDng+nhzGR3zhk8Wk7hnMPIJpqO2GX/oKm7RPXUUkRC7pgdjGLbgUXZZ7DO2T67IpNsQwVn5ks3dCT7pnhxRUp+CSxagAwSWL0fIM2aSYc0kpXBqlJlxSzLgUELtEmfnWgpW7Drokzy6rS70H5FddMZxi77vek+DHe6EZAqNjKqgbPoYK/dsnR0yPvhrMPKdvqC3+AHtdnkF/7dMc6EuKDNCb0Y1bSJPosxqQbea2zyl2tesNCL4Y0JqKsrQ/hAEWo3RCAihm3utpKBhASQcDNJgzIKhiwOZ8oEtDBiS3YECnhtmk96AZgGgPzR3BFwNaUzGASgsMsBgVDRigmLnvaSgYQEUDBrhgRL02qhiAaDQhwoCIVkqQ/mI5UYMB+Un4MFWJ2ek89qbrcyL4YklrGrvj466wxGJUR2CJYs4SpawliplJIaBlR5KDvF1X40inBkdcD7OOxC50vSPBF0da03ShW7zgrJZsOGIxKmZwRDHniFLWEcVclQpq2ZLkFizp1GCJ62FSiGbu2HCutyT4YklrKpZQ2YUlFqNaD0sUc5YoZS1RzCRJQMuOJLfgSKcGR1wPc46cH9zVJz860puKIzKTeExmEoMZRwzlHHGYHGp5PSa26EnjvvZkoiZPWtuqqeSM/Hhkdk/+fme411OUKZoJn48tLsbHwPFp7WvjyuIY531r1XtxmHMqvsw0YG7+gzK/59UWUzbmz2I2bvod/731UNazjTPr2XPsEleXpeTr4W8cUKwKQfCIyxxNDBDcc1TUoLjhnOSJVZup9sEGE03rlaPcqfzkBslhQ/QwtH20NvdkxDm2fOttyJ1qOYPvbPCcVijPaYkynLMhsWoDjXPYYKIZGwzlzuBntEFy2BCfHdpgQ4+HIlUn6XNs/NbboBtW8ydhMypGxFh7qEYhFTTYFrWsZhYyQTHzZ8kspXlgYvH7cjBHBFXLkfmbsLZPGkKwpPU5TBGmg9mbvOfYG673KPhRfex8aSyiYCkG9anywySLUfmDSYo5kxylJhnKmBRUNcnNGSYav8gBJmW0aWZB3vQeNG+wLHho2g7+fi62p4T5e6PnwEbr4InOIRbTKUQx824Q06f5e6OOMp5Ej8UT85drXDBjSbv8IW9M/Pm8iQ3k+rwJ/p6u3SP3h3rPuTEdMJhEoxiJE9j9QE8PB45mImSOhnOZo5R2iglGMbNTbBTgfmnuD9Ukd/97vRNHXxSpE32CGozK6xh7mDcqtpXrjQp+WmaimLWm6UIhD5VieGIxKo2wRDHz0Lah0CfNcrDEBDOZE1TJHGQ+TYZvLRrm9+mb6k327LOuAnoPWs1iF7negOCLAa1puixcvs4mFtPZRDH3k+FZMXRK5RIOKOaSIqjigDlwnMGKAWwTciKDlemkdyAGXB7cmSc/GtCbigE0J1yPHqOcfnGYmTp8MKpwNxfM6J/Biv5wk3L4rUUrBmgGtGijAa0N03ovZ7NF6YJseGSGT75O3fxq7Oejx6howKbovUbjpydgk2LOJqW22z3lJmxSzNkUVLHJzR0mmnGpdTnNHPm5En/eJAgEk+wTd/Yn20t8oD4/t+VzU7DJc1Ra4JPnKO1glOGcUwaDVZSesMpwzqvA6nN25oVTLpwxq3c6uOV6mMp53WxeYh/6gFvxgWW3PEeFCG55jkoM3DKcc8tgcIuWE3DLcM6twKpbrgCacMatTg1u2R76fpvcij0qMnTdaYhL8GVOak1jveXHMmCLw/ixDLiiGN+G++YgrM211plYlNyvLRaVIn52AzNSBBtWW++m7aO3mbuSl9hqrn8XQn4A6denMlThbuXnAW6UsQg7UlCDvigMsJgWMcWMAQqhS61giumNsLyuYoD5s40Nm+Z66B/xB0+gf7Y5/WNjuX6w894UWremyRF8cbIEWltMS5BiRmuF0KXWH8WM1gEVrRGMViYY7Mnhn2nkkb2Qv1ND9ek9oI1qTW4hV9ea4Mdx7Ua/Uth/05YKjliMSgbKj2LGEYXQ5TQhfuYlZgTFjCMBkSP8Fmo4klwZ/tKG4d/jqf6xN1w//NuetrmL4d+apmGBb041BGJbjMYPxFbM/G1FQ6FPSjmorcGM2gEVtfEUF30BqJ3cwvjvVFMI+vceVP/YGq7XP/gy17amoj/VFehvMSoZ0F8xp79S0J9KBvRXzOgfUNHfPAKfsZZ2fxlsSgnI3ztg+U9Pj22/Gz/IPzWN8ssjCDMY1xqHSa1xEG55ca1xmKjfoKK+/O2NTn059i2FC6NVx0fndDo+PSETHth8N74YEiHGKQIXQel8nT5ZfON65DC8Q4e+0jeHoVMuSA4zlsQXKJYgGGX0Wwv2dUYMVC9Ivc0ZAN0eMiD4UW08s0QyPp+eFMNXouoDU7J3FMy+xgBHheXFcmfef8EV1ysfk785zLgSsYor+KZ0aXAluYVU6dTgSu9B61Tu6VYuk05PwSNglxG3UanawBXFtlt5sfYMRvUGpmg054lS6JPWZvBEMeNJQNUTfLTuhuBJcguedGrwpPegnsTmb+3UfXpqO88WHfq3pskmaEGXj6ywGFU06K+Y018p9EkJC/0VM/oHVPRHMCp70D+5Bf071RTCVNF7UP1jU7def9144lqpqsITi2mlshhVA3iimC6nHIXfkzQnNJjxJKDiCV6nS4MKniS34EmnBk96D+oJoj00ewQ/1inricP4oQrkicW0TinmPFEKnpCMyBPFjCcBLXuSHP6Z6jal5nvrcrzD0dvcjB67v/V5Enz15ELVBnliMbpYeGIxqhDIE8Vc7VIKnlAKwxPFjCcBFU8QjBIdeWKC0beEJQ0asqTH1yyJ/eD9766tusN6eooP3N+l08cFdpV1moMlBsNXoqIETxy342cQYIrhnCsGs7YYzviSFCbe/l3xczitXeCLi6bGdGpwpvegzsRWcX2uBL9wuuf0FNhoH74SFSb4YjEqObBFMf2NwlF6usdR+OvIdWC9Nqrkip7uadj4NQ+8bUGutMsfHImmEn/up7/T/UehR+aY5MctYm8qQ4xK3LX1NH4f2EZj7MVhmF2rht8chWBUCG8Ow1/qqcFeG1UE0yMLHft6Pkk1ynzS2sx8cj8U9JD+wRf9W1PRn+o49LcYlT3or5jTXynoT7UR+ivm9A9qUf/EFvTv1JQReRnoQGrUBuPxIf2Dr6OYnwd4PmVYwqjswhMbjSoGPFHM1ChDbXa8/4EnGuyoE0dSxRMcRKLy+TZFa2q/a9NHa6rRpq9ZfsU4bWKXCB/XzefJj1rrYeoWdaTwfagWwJHonDCqP3BEMeeIUuhTq5Ri+EPIUqWCKhpednRlMKQFGwzhJhhigs3PEbFtXG9IbjP7QUbkQ2saa9RGa5TFtEYpdtmTYJgjlIL6WqMUc+onhXXosJDiU/aQP7j7u9Q6J6cKBqq5BEtcD7M5ErvG9ZYEPw7rzX5DwsImxbY7OczuMY6GJNFozialrE2KOZuCKkmCbzDJ+PnLIWxKbmEu6dRgU+8BbVS4EO2huST4Mpe3pmn04PKp6qJKWYyKGQxQzJz/dBg6pcqCiUOjuck8qOKAW0wlhn++ypNODQb0DtSA2CWuzwreaCIDWtN0WdCCagsMsBjVMxigmFtMKYU+KTmhv2JO/6CK/ohGZQ8ZkNyCAZ0aDHA9TBlGORHbw/WWBF9yojWNlvBZYVhiMVpywRLF9L0XjsKJ6OlLxgEEh/ESCduL6LE44jIisQVDOjUY0jvQjIi94Hr5c+84Tt2tqcivJcliWpIUsyVJMeivJUkxlxJJYdz2WuMMCGxp6u7UYEDvQAy4P8j6yJyQ/Dj+e9N09dBCSpLHpCQZTF98dDIU+pSSZDAd/wktjf+GfT3+J2qSv7WZ7d0WI/8h+YMv8remIj/V0+spexpXWFs5ePHiMDf+fTQqZjcXzdxwymDFAFwbVbO3Fm3hJ/AWbTgU0j/pHIAiDzkQ/N3Tnqy4WKo3z6dtchWjegNbLEaFBLYoZv5+i8NwbZSKsMVEoy/w2iB2hRIWrkSw4YbSu2n76G1Yn07CTR7XaXkb+7/VB2VP+QFcyxR8x2cE4ErbahZMk8VhclTZRTO/Ldk+5ayyC2ZqldsX7+Sscgu2lCoZraRK70HnitgBusn6679OddrGJ+9/JW6wh08ow57gqov8Ai4kjcU0aRRz9ii13fGBXuSMYsaegChn5CXxLdiSPRmt2NN7UHti5+fscQ/JnLbBk9g0h8ITi2nKOIxP4aKQKeY8UWq74/ebwxPFjCcBkSd8WBd1LLmF+b1Tw/zee1BPEO2h2SX4Mr+3pjF1+HgwcsJiNN9Af8XMPQ9DQX9KMOivwYz+AbH+NClB/+TwT68Remdqogb9ew+qf+wF1+dE8EX/1jRdFrSgaRD6W4yyCfor5vRXyuqvmNE/INafEhj6J7egf6cG/V0PszN7bAbX/xy+jQ8s/RzuMDxVRcdq4JMJB46WrjDKcM4pg1mrDGe8SqrOk3zYF165aJSeWIV1avDK9TDrVewbH1iF5eYTA6LnMMSltSXmlODq1KOndj1G3xNWaTRzy8RQuDQqQ6hpGsxs2ZOipOKfv2FURFua6Ds1GJVtZsuye3DPnnx9mdiOz+M+n5IjV6hQXD3GZzpfHGZcsX3yodSbC2ZcyWDkCr+1+q1FW3ClRRuXX63NuRL78NVTzS74carpTWP28C+kMKB9smAy1RvMGWCDUY7BAMWcAUGxAZRkMCC5r+eaiZrSorVhyTVVmLn6tcNQfmT1lXyxJELUnOBzpLDEYjL7G8zc3DLUdsdvsoYl2qezJCiyhI+bwpLkFizp1GBJ7wFtdRt/nzkeMiD4YkBrGvze6WnQ7AmXMg2LHb87G0VJozkDlNru9DSoCeYMiGBkgP7gkdGWilJGK0XJ9TCbE7GBRAKuO71wf4wfFhZLWlPRmuoPcsJiVFlgiWLmNyhDwRIqLMgJDeYsCapYYm64Z7AlRzJYcaR3oCkRm8X1+gdPA5u2H5i7LUYFCJ5YjKZ4eKKYSxOltns+WApPFDM3gZNa9CSCLXnSqaFMZZubumMDud6T4EdPcJKJthrwRDHoQzsNeGKxKX8/f8uDJ4qZIz2GQp+0AIcnGswcskqqeIIvSpmOuaNFa2q/a9NHayrRhpMPNHPEnnK9JcGPlphDVjuloA59HzhiMa1cijlHlEKfWrkUM+dH8sqKhuaQVf8CgyEtfmuCIdFUgs0bEhvH9YYEX+aN1jTMG/snKmVQ32JUypAPipn9uaGgPhU85IMGc+oHVQXb6SGrjLZUpDJamThcD1MpoByJLeJ6S4Ifc8QdstophtdIUXWDTQ7jN97BJsWcTUpZmxRzNgXFNk0y5iGrvLQlmzJasan3gGyqpuwf3JwnP+ZJbxrzhF/WfT15jL7li8PMXO6DybxhMDOXJ1UMMOurhmH26It2veM7UVPlam1mLt8jHR7ZciRf9I8QY54gAWSW6J+crh6YzBIGc/rbPmWWMMFMAiS1qH/0uTD+W7Bx/Lc2pz9ke0j/4MvNqc2Rj3I8n/bB1d/d93pEt3HDmIIrMnsYzPwOZSgEk9nDYHpvN6Fiykb+pt1b+6JLroQc2PlNqXPkUwgfPRjWvp2bneL3sY/EqFi3NUweVzLF3vNsCOciLGGyDPaYljON5tJJKbz+T8uZYma7mFdWnHPlLIItGdepoZxlm0un2Enet6IrTYkPHIrj+y1VL7gS3P3Rn9E9Kl+YZTxHlQnTjOGcMQaDM7QIvNlwzpoIV16m56xJ7FPgz9n/vfUAoQYjTLj5dIkN5fp0Cb7kwY7XVTDGYHs+bQtfLEalCbYoZvYohsLyS9NFg5ldYwa7/zONLPNoTu+06Q9PWgetCRUsmmq0qSrQ4is2oustaRvX6UrNrvGe0Z+3wCZqu9cDvh6jOgdHNJpzRCn0OX3vPOBrgrn1QAQrGppdYw/W1Ich7TJaEwwxweZzJLaY6w3hXSryoTUV9WlsIh8sRmUP6ivm1FcK6lNtRJFSzKkfVFEfJ95pQ4WJPzno2/OGl5NwpFODJa6HaaxQjsQWc70luSUdr0oWVLBJMUhG0wRsspjapJizSSlrk2LOpqSgZZcfNk0y5q4xv8HCMeyJGmzqPaCNTIkNpTNl4WjdPj5ZjtZtNnq0Lrky++z5tdvwJ8IRpstnxdx5VB+NJinkkYlGCf7aoJpGe35ZNtKoBWvCI2e4CVUsmmq0yevqzuHBPX3y5In+4J5cFZvf2H09eWy62M+B+eIw54mNthNPDKZ7moSqiuZdAT3Y5Ik0fbQvgGiSHwdkxsyuciE/8pPkheZHcuQFFSZ4ERdCGM0M8EIx64Vi272e13bRJD8SYi9oZf02XdrgRbuM1gQvoqlGm4Yc5QfkmHHHnjw9BE+emPwIjsSmYgRPLEYjGp4oZj1RzHqimMmPgKqKez5IDk9asGbAuzbBkx5N8yN2kDDtz//xy68//Xj76ecfv8c0dnfx79//7W7OP2Gr989//KwV/3K6S4/G4gBeQE+L1efGoeNpTtzzcXM4EOEIoyEKBxSzDiiGa6NUvNlo1OVrg9gBSlg40PocHOAmOBBNNdpsVuRWd7UnwY93Ig+tqcgviyqPUeZDfo1mFlWGgvqUdFBfgx15Mwv5gyqCbXY8ziB/cl+vfSequQRLeg+aFLF1XJ8UvPvE+G9NxQAqLRj/DtPD7wZzD1cZbLvX0+8GMxUorqwYgGDTmM1VbQa7b+56puvmY6IGA3oPakBsFdcbEPw9y6aLuPArv+BKcLXc6JF4j1EdQVpoNOuKYtYVxYwrARVXzF9XsZdGpQszRetx8KTHV09ir+g8ua+k9tvff/55eztpxEeLPZCALgj2BEf2aNWymFYtxcxryXyfWrU0mHEnoOIOvidlPYqWCUZiwJ0GDe70+OpObBF/kzvx0WV3gqvu6Dn5+1vOsEIgjBYISB7FnDtKbfd8rB1zimLGnYDIHT5jDndasCY8vOAmTB8u2lQdaZ0bm0bnjl9ltX3nVM7wtakAIV8sRiMJk4zFKK3giGLOEaWsI4oZRwJiRyiT4YgJRt8SHjWo2QaPenzJl+ODO/PkxzVWbyomUeW4njxGNeHFYeZXEBuMD5DdXDCzxspgRX7zG0jDMDVMk6vIP1GT/q3N7MuPyIVHdn7JF/0jRC00/AQA9LfYlKl5E8RgF15ufpsJRpsH6K99Ov2DWtQ/sQX9OzXobzoY7kvWGnV/TuohR4In+aVGZVjCaPjAJRtNapTBnEs2GJUVuKSYcymo4pL52/MtGhbCzYB30/bR21xSxC4Rrq3bjB+Dp5n7TCXo+ZQcvkhPYPwZMipB8CDCVYwP/KNSKWbmCUNt93z8Hh5oMJ0nEqoW4I8P1TfJvbVg1YLoYGiDBdF2etL7hfc/xzuTBQv3C/OTZAY/SQAzogdSmUoIzLAYpRfMUMyZoRTMIP1ghmLGjICKGQhGqQozklsoW51qWQN7XA9TwaayFbtIlzNLhsUn2TAqEzAsODKMkgyGWYySDIYp5gxTanvQE/ImmDEsYlXDDnycHIYlt2BYpwbDXA+zhiH+TIbZtfAx+GLTBi9aqMkPm4IrNh307ckeo/SDTRrN2aQUbKIkRV4pZmwKiG2i7wmbkivzjLQhi1y8WVNiZ/lbsig+yfbQj9Swp21nhznowKfZkUUWo5yEPYo5e5SCPZS5sEcxY09AbA/lN+xJrtgjbbDHxZu1Jzabzh6fM22/OontnjM5Koa/hUnWwROLyY7eYOYusaHQ5/TFP5fj8ET7NCeGkiqmuOdMerRWs7A0ax20JlgSTSXa/HI59pbrLWnb08kSvA2UtEaaGOzAoxGWWIwKD9JEMWeJUtYSxZwlQVURzSGufmlNf1jSOmhNsMRFmwZLXQpgPffQzJL8OGOYQ1yGgjpUlq8nj9Gq6MVhxhEfjKrgzQUzjmSw4og5xNX7bOq/T/Fb00drKsFmc+SE7Hhkqk9+3OT3piFtDnwqG+pHT6OVMImKM9RXzKmv1PbAx66gvmJO/aCqYOYQV0Zb+B1logZLXA+zOQKJHrIk+FFY9+jPSTFIRlMEbHKYsUkxZ5NS1ibFnE1BsU2TjPlzV36DJZsy2rQIQOb0HmAdFa7Yj8LHdfv+U9s0t0HwfOpNY54Mifl5+TCgfbJgsvo1mDPABqNJCHmimDMgqDO2EtNNioPu8TPakgERrez62yfNjZdT7DjXGxB8KVStqVw+1X8YYDGq7ChUijkDlEIGqAGKOQOCqhlw4PPjb+7SeDbEzNG6bCMU47/H1/Ef+0cn/8Ie/vMnR/qx6cCvSEB2RAfIwGFs6UFsj1EVgzkazTwClFTZGOFvq1NFQXpoNF7vvTaomOOeAcpgS9kRXSJHuhwIRlUAjgVWOh1KCtWw2G7a502WTIyPnvFPvx4oRdcDF4O7v6d15Gi8I8eCq0+oHPiOAXw0nDPSYLg8Sm0YaTjjZFD33977l7BOJgcPJo5WncizoM7YTE6Us9L0Om9lbE1dOtrd5in4+452uAh9Ei+5+iTeQY8SN24IB71p2w77otsxqZ17SiEYrQxhnmLGu4BKQljvkiseq3dBLWah6XTeutjCrreOd8HIstY0mbk98GlpJJnFtFYqZn7W9MG0VGowY1JAxSTzq2Z2uVQpM1hZyPUOdCKL7ep6+XnHC/lbU5GfaiHktxiVQuSIYu6IksHgOY1YJIlGMz+YJbVoQARbMqBTw0oi28xC7vzgLYDkx4VcbyoGULW/njwmCzmDmR8sDQX9qeLdXJ9G/wxW9Hd/KKNxX1epiZoMaG3j3DRbks7Ihkd2nMkXSyLEWOkhD9VwWOIwPjP94jBTknwwqm+wRPvUkpRQdeTAp6HfWrCFlGjRxprU2lxKxL4T1ymby4V12Tk+SStYfQIiuWoPH7uGPRGOMCoysEcxZ49S2wOf14A9ihl7AmJ7KOVhjwlGl/8+QUO69PgyYZxjn+rMsUut5EtyRAj00RdfUIIKEdS3GJUYqK/Ynt/b9M1R6JMSEuprMKN+QEX9zf5IUxnUT26hXHVq0L/3oPrHpnS9/ryvfT6dW9OoPx/hhv4Wo3oC/RVzE7bBtgc+nA0DTDRaSrw2qBhgFkwZa6k4RY+gBv2zzRWn2GKu1z/4Mv5bU9GfviX0txiNMuivmLnxYijIT7UA8mswc+MlqaL/Fm8Yrj9wIwEi2pIBnRoMyDb8M9WIaXVdN/L3bfhD83XwxZLWNHR3OFI9hSUWo+8NSxQz+zxDwRKqb7BEg5mSFFB15KDnuDPYkiMZraRE70FLUuz31qdE8LX+87FslCmLUf2BJxabxkqeljSYW9baYJSa8EQxt6wNikzhQ9FIk+SgcB/seoNyooY06T2oKbHnW29K8CUpWtN0WVv5U9swwGKUO0gKxcw7mg2FPinDYIAGM0kREOtPGQb9kxv151utWCZ1atC/96D6x5Zvvf7BF/1bU9Gf1izQ32F8whr6K+b0V2orUyv0V8wlQFDFgM2Z19kwILnRAJMAnRoM6D2IAZcHN9bJjwb0ptEAfsf69eQxKhovDjPbBB+MZv2bC2YMyGDFALxLmM5wvLVoC9NCizZOC63NrJQuGPuPTMvJFwMiRJ0pzrRqgQEWkwpkMGeADSYVyARzBkQwMoB/7oEByX2dARM1ZUBrW7VSusS+Dp09urPOT9LOWg9uJ0eOSc1qF4L62ae87YEHJnImL3jkzLE526se3TaYzhoJVcsOfCoalsWlLeVMpwbLss3lTGz8nEF2d30JHgG7jNh80Rrp+WQwqE0VCnmk0YBR7YEpijlPlEIwujQUMsWMJwGxJ1QI4ElyC2nUqcGT3oNOJLEZXO+JbmHxxakawROLUZ2BJxajNQw8Ucx5ohQujbITnihmPAmoeLLZ8DMa8CS5BU86NXjSe1BPYn+43pPgS56Y15hfFNse+RA7PLEYDW14opjZmRsKfdL+BZ5oMLMzT6qaYl5j3qM1td+nDlrTR2sq0Wbvml9g8EPTffCjJe54aYYt2JHf1wdLTLQjn2uHJYo5S5SylijmLAmqimiOl/ZLa/rDktZBa4IlLto0WOqNkUtsD9dnSfCj1uZ4aUYdKahDtRiOaDBgVAbhiGLOEaUQjIolkkQx50hQxRFzvLQHa+rDkBa/NcEQE2w+R2K/uN6Q4MuSuDVNMz6UoPkA6luMKj3UV8ypr9RWFrtQXzGnflBFffeOwIy2tL7KaGVP4nqYzZHYQa63JPhx9LvjpRfFIBlNEbDJYfzOftikmLNJKWuTYs6moNimScY8XpqXtmRTRis29R6QTaVwnZ8e27s3fjQF35yu9XkG42XwDMbLYIfpdtJRuDSqljeHqSmNqqYcN1RU3zqHyWLaF1Cf7wPVy1lv073J+Qk58sAE3/iheE1N02VBDCrj1xmMatyLw5wBcdk0NqgSwgDFnAFBkQF80h4GJLdgQKcGA3oPmhX4Dg8ZEHz95nzEHVlhMUoemGIxSh6YophuRBy1Pco5YIfJ03CvjWJTaLzDlLi0UqrkPu9ADabkJ11WxMYRrsktFbdjPz8Fj4A9M/HNKYNhisU0UyymmaKYyxSlcGmaKYrJ7rBdP3nCasMTE4yMQ6Fq0OBINCG+pklsG9c7Enx1ZEdTNRyxmKaJxTRNFHOOKGUdUcw4EhA7QtMaHDHB1JEGDY70+OpI7F1/w0nr81N89P675ZQvetK6cfWk9ZFPUKOKRbx60lpekYwyZjj9Dddi2yP/Eo7ZxYQzFgW1dNK6Rbu/oq6LwksKZE1Eu/9uOFF60rpxpde5Hcz5Kfaf65Mr+JJc+oczWtiCyV9GgXsm2pGPRsM8xVxyKbU98rFhWKeY7H0wBwVVskt+N0NyJYZ/Jk80uzo1pFfvQNMrtqA2vfwcFB8o4wd/mYJKAUpecJQs8tbmOY5qI3wx8ZwxBoMzVEPhjOGcNYGV8e2sSexzRvnc3CCFpO2jt40WzqdLbEXXp0vwNQ/2aozFaBwhXSxGaw3YophbsikFU2hFAlMUM4UuoJItCEbrFqSLCUbfEiY1aEiWHl+TJXad6x0JfnTEvJjg/KQYvhCtneCIw+TAr8N0v++o7VFOlDrM7Wziyool5sUEU7SmNgxoX6o1IUlMtNkkudeXR/Y1yY+WmDvHZ4cd+QjzdQajYvPiMGOJ75PWkjcXzFiSwYol+KJ0aW9TtKb/uzZ9tKYabSrR9QbMBvnxkCXBjzVR7xyfM+pIYcBSdYMjGgwY5T0cUcw5ohSCUQ2EI4o5R4K6/0WFPn3rneMWDDEHR+KjQxssMeHmswTj/SFLgj/3a3g+b1rTdPXQgko49LcYFWfor5jTXyn0SYUR+ivm9A/q/sb+rr+5d9yi3d8P1TldIGefoJpNsMT1MJslsQnF1azb+2/aPna4Kv37MmeDbY9yPttj/PZy2KSdOpuUsjYp5mwKqpYa/fsy7dLKDRljU0Yb7h33T5rt/yb2oetN4a0s8qQ1TT7BAKriyBOLTYMlTp46zBlggukBbRfMGRDB7uev+/jHc/ZUQjFzBLdkQKeGPMk2Z0DsO9cbEPx4n3jTmobLP8pbz88eo/kEGaDRnAFKmRPyLpgzIILVDNBXE7hoJgHalQ3y9/hoo6k7Norr5Q8edW8aKvIADXIiw2JlPXFHfoIASeE5mnBhiuHMX8hoXLm845HmLMwf+i3MVjCpYot5M2qLhrxokmNJFT0MbZgtss1lQW5OV88NwZcsaE1FcZqHoXj2RM7QFAvFDWcVd93y8XworphTPKj7q5qmYbPhI0eoRMEtVaJONV/ggethKsKUHLExXJ8cwRdXWtPwhY585A6uWGy6rjY5KGbuiPhgtBGAJRrMWRJUSQJzPySDLTmSwaZMgSO9Ay1OsS9crz9vLVGIWlPRn4o+9M+ekKHTwDueaApEVmg48/iaw7ZHfpQDDmg084NVUsUBRKMaiaSIaEsWdGpIimwzhen+MgvsI3ZYVa1bteYH6tHfIz+T8XxOrlZq/ktX1xlMqpWJ5nwxGJSkGnlznRpfMhj5wo9SvLloOmvbK+OXvX+0WLXPqUzU8nX/eeMx7+IDY/3KGNUmeajh7DEqOS8Osza16xiTkZ/ShU2KOZuCKpKZApbBFrJnoqbsaW0ue6DbI7vwbfDFgNZUtKDChDyxGNUIGKCYNUCx7ZGfpIABijkDgioGmOc/W7QlBzLaOIXkdVAP/flSyorYIGJUrCxowRdPWlPxhFaZ8MRiVG3giWLyXudvjoIlVAhhiQbDgTO6tNeGFcXMcezOjfMi/yz/PlBDVsSFoAeZ1rexG1zvQPDFgdY0OsAPhMABi9HWHA4o5hxQanvkJz3ggGLWgcCKAwhHJROzR3ILDnRqcMD1MDtXxBZxvSe8y8SM3pqKJ7LU8hgVNHii0ZwnSkFEKnvwRDG+MY6cCKg4YnMiuQVHOjU40nvQnEC0h2aK4EtOtKaiP6U+csJiWpUUc/orBf21Kil23NHIgAFBFQM4v5AQSeGfvlQ3JalTg/w9vsof20I3/L9+icx5G5+s690TPwWC7AgOs1e/6u2J/0gB3LHYlLW5ETSYc8cGoxKD7FDMuRNUcUdexgl7Eluwp1ODPb0DtSf2iM4ee2RhG3zJjtZU9KcxCP0tptVJMae/UvBcq5NiTv+giv4mO5JakL9Tg/w9vsof+8P18gdPY50qEVLCYlSJYInFqMZgwlDMWaLU9sSvqUdKKOYsCWrJkqQWLOnUYImJP/uL3+7B38WTrybxMwfPZ49RQbrOYFRqXhxmTPJ90nPoNxdMZ/WMVTwyZath07bivcXHhmSypHFmWbtDfjwyhSdPBlBFggERljCqSDDAYlRrYIBizgClkCWUwDBAMZMlSRUHtHA16ussmajBkrgKxJfCtYNqD1kSPGlNFQmWWIwqEixxGJ/+hyWKOUuU2p74eD4sUcxZEtSSJUktWNKpwZIeXy2JfSE8W7f9vt95hIXjVN6bxql8qIufayTI3z5ZMC1Jip34/ty3mWCUrJBfg5mSFNCS+kmN6vN1oUZ1alDfxB/kqbdD7udAH0qR4IsfrakIrRXKYlqhFDNHqfOyMc6G5fRWK5QGM34EVPwwdwizy4X7UxM1GNI70HSILeH6dAi+yN+aihRUtJAOFqOihWqkmJNfqe2Jd2FIB8WM/AEV+Td7fj36Wwu2pH9GK5O26WE+IZBwDyVE8HUk6gMhO4vpOspiWrQUcy4pBZe0aClmXAqouIRglOVwKTn80zPTlK1ODVniepgEorIVm8X1eRM8uUTFBzO7xaisIJcsRimHXFLMuaSUdclh/OcrXlufxSccWqBrg08RbljcYjKRto/e5lZXsWNc70Hw5AFVIHjgMH7SAh5YTO7tGsx5YINNg+9zSYF6ppjJlICWHdBg8u46eJLRSj3rPeh8ElvG9Z4Ev+iJw/gZC3hiMSo4yAvFnCdKbU/y0nYXDAtjGu/Ii4i27Ir26lzJaMWV3oO4sn9wb558dWUv1cpjUq08Rgq9nA1mFsKGgiuUxDcXTDMlYxVPtid+wOGtBSszPy823gdqmlNsD1Na1zllj6x5ZOZPflyL9aZp8sMXoqJ0PXtsuq68y2uwC4+CbzPBaMkAR+LbjWPKOBJQcUQeEoEhiX09yU/UYIjpYHYptsfFPmRI8ONXhPpUfp7PGZYwWsnAJBuNkhBpo5gzSSlcGqUqTFLMmBTQokmJLZjUqcEk08G8SbHbhK/rNvT74EvWtKaSNVSgYIjFqPTAEMWcIUptT3xsHoYoZgwJqBhy4LcdImsSWzCkU4MhpoN5Q2K3ud6Qtkdu/SFDWtNoiB5p95iWMY3mDFEKhmgZU8wYElAxxJWxxBYM6VQT6KMJVDqYNyS2n+sNCb5kSGsqhlBlQ4ZYjCobMkQxZ4hSMITqHzJEMWNIQEUvZ0hiC4Z0ajDEdDBvCOI/NK8Ef8Cyu+9pD/zsDLImMBTPTkEwqvEwKaMhp0eOyh1c0nDmQQRDoVMqinBJgxmXAiou7XmVjzpmYtEYw2pMoT0/mow8Mj3O2xbb0/V51HbMbZjAotY0Ss+n1WGRxWgZB4cUc6fpDLbFn0vt59Nyc2kw2be/tj6LR+ZmZQa769sHmd6GmagmESyJL4UO0EYL5Nh3rjcg+FLIWtN0WdCCqjwMsBjVOxigmDVAMXRKQxY5opgzIKhiwHa3JzuRJcktONCpwYHegzoQe8z1DuhuFt+cajjSwmJauSymhUsx64piuDatXIqZyhVQNQV/T6zmGExJbsGUTg2m9B7ElMODu/vkx7ToTWNa8PHv69ljNPReHOYMsNHUAIOpAQmxAZTYb+3SFupSizbeXmltpi7dn/B9ZD5PvhgQIerczUfOYYDFqJLAAMWsAYq5DHDRSNjX1iUbQKkOA6LPJQM6NWVA+yRWWn1KmZ2rD7GFRJh1u8LkiyURgiyRotQ/OVwV/vxGzXxYotGsJYrhmDVNPDcXzUwV2WfxxMzVDfu6KE3UYElcLTrQohRbxvUGBF8MaE1FWSrQyAmH8VlsGKCYNUAxa4BizoCgFg1IbMGATg0G9A7UgNg2rjcg+GJAaxoN4JfiwwCL6aygGBYpNU++zQSjcoME0GBO/6CK/lu84712iqKU3IIBnRoM6D2oAbElXG9AbiH7aa/n8/2dV5hY0MdU8fCe83r5MCCw+9/8GTmqvUgBDWdTQDG8wqB2CgeUcg4khUX9eGlUReFAcAvvwJiowYHegzoAPx+al4OvZ6nNs4P3l3Mh7jgziEBwRSmMPRrwMEUxa4pi0idMUcqZElRJC7xdoToMTzSYbuEMhHpJW9WPFqt0OT95xxbwfpRFZu+F4/CH+Oj9n3G80aSBzAru/tKiicP7hKsGMNFz9P3gouFcdTPYFi9xrd3CR8NxCmLNFdTdgv4l9GRjo5AnndJfryZqSC0Tf9602DWuL3fBl/mmNU0Xij//TmUMnigGDalAwRLFTvw2QMw3SmmfMEQxl1hBlVHuFlyJjb6ZzOrU4EjvQItdbBDX6x88Hvxt4ZEV2TaMFChLhQEGWIymJRigmHuDg8HQKbkOB0w08hwZEdCiAYlN+7v3/tGpDVWrhxO5jw9uupMfh3tvmoY7vjhNjdezx2QeMZj+yciZYFQebw4zwz27LGpvnviA11uLtrDna9FGA1qb2WAcMdIfmdyTLwZEiHEe3+LNc7UYwwCLyRRgMF6qfZuJRV1Cf+1Sy39CRX4t/436uthMVKsGH+0iEF9Hf2z8cJUyQdsHoo7Bj0qbv0NxNhgModkRhmg0YFQMXhxmfmbywajmwRHtk3t8bVBxBFdGlREJEcGWEqJTgyfZNk7ms1PyMXaH610KHl30hQKunirx8znDEqZ1y0bTuqWYc0kpXJq6pJirW0GxTVQFYVNyU0V6N21IlB5PEyX2h+stCH7U1iaKYlu8nEMql8W0cinmLFAKfVJyIlEUM4kSEDugiZLcQvHq1JAorofpYusPS/dt50NzSfCjSzZRHLalOoVyZjEa2yhnijmXlLIuKeYSJSi2SRMluZIo0oZE6fE0UWAxLLg/T7JySokPjB7YTFEMetBAgwcWo9IHDxRzHiiFPqlAIlMUcx4ExR7QN0CxSg7/9OrNMw/KV6eGVHE9zKZK7kxX2xT8aBO0oFkAc4rFaKDBJofxZhY2KeZsUsrapJizKSi2ib4BbEqupIq0IVV6PE2V2ASun1OCLyvf1jSNlS0ep5T5w2LT0MhzokfF3NZDKfRJ1RBZoZiTOyiS22w9klvIik4NWdF7UANiW7jegOCLAa2pGEBJjfFuMS1Lipn38vlgWpY0mJnAA6r6u61fcgv6d2rQv/cg+t/fz/jIdJ38qH9vKvpTWbqePUZJ/eIw/Wv1jtri1HhNupvDVP+8sKo/frytwd5asIWdRos2FaWP/kmz+zth5D+kf/DjHLA58t74+ZxhRwz6SFFqvSM/+0QHTqqS48wtWd+rlCWDGVfiixZX8E1pvMCV5L7OiomasqK1OVcg3EOuBD/KjR8eSG64ohjUptUpMsViVNCQKYo5T5RCn+qJYsaTgKonJ75dDE+SW/CkU4MnvQetVLEzhN3rFrWn4Eulak1ltNMUAP0tRvUA+ivm9FcK+lN1RKVSzOgfUNF/uz3TF4D+yS3o36lB/96D6h+7wPX6Bw9Dp9KyPZOKyAmD4WxXLb7wxGH8eBE8Ucw8jmaoLU7T1D7hiQYzngRUPNk8mZxIbsGTTg2e9B7Uk9gErvck+EVPDIZzMlUfeGIxKi3wRDHniVLwhGojPFHMeBLQsifJLXjSqcGT3oN6gmgPzR3BF0/wG34VG3liMUp9eGIxyjp4otiJ/5L3N0fBE61dGgwYpfBri1ZcQfGiRRuqV4TDOqvp/d7acNOjtWFVFdz5ovfUT7HjW58XwS964DB9liZ7r9GOlD7wQKM5D5SCaJRkyAuHGQ8CW/YgueJBtFUPos16EJu+9R4EX1UzeeCwI9UJ5IHFKKvggWLOA6XgAeUePHCY8SCwZQ+SKx5IG/Kgx9NaFBu/9R4Ev+iBw/TpmJPFqHzAA8WcB0rBAyoy8MBhxoPAlj1IrnggbfCgxxMPzg/usJNf8sBi+viLx2ip83I2mPHAUFjRUWG7uWBuPshoix40bvRA2z5at4inHiADHpmTz8EveuAwfQLGRuM/IQAPNJrzQCl4QIUNHjhM8yCxZQ8iXJmT22cnX+BBcs4DqPmQB8EveuAwfizmej5bTNZFBnMe2GBU2OCBw4wHgS17kNyk93vrYvAFHvR4mgexvYNJ6/bQ5+ARcNjD8Znf57PDUBLrEhYemGjI2oohDxSTDfM3R20x/GoweKDBdL+QUHVgy+dL32wwyjxY0nqE+p839eFINNnKFJu7+6thVloSH7gfe+ieHPlSYYnBoA/VanjiOVpfwhTDOVcMZm0xnPElKcjXv+t2x29ahi8umhrTqcGZ3oPmSmzx1udK8OP9pvufYUPJG62CGLJW9RhdPyzQaOaXCUOhT1mrGkz+BPZr67IkhjmEmcEW7oxP1KB/fCebGbG9W69/24W26M/42k5/KvrIAYtROYf+ipmf5gwF/akWoi5pMKd/UIv6J4Z/ep7o79XZZZ0regc6/mNrt17/4MfB7v5e8v2v0ktO8CNG8MRiVN7hiWLmwXpDbc98vA+eaDDzF/6SKp64v5fco7XxiKmhddCaMDVEU4k2HASqZ2vuT6U8tIQKfrRkz1MkskQpqEMzAByxGBUzOKKYc0Qp9EklD44odtxRLUOVCqpoaP44bw/W1IchLX5rgiEm2Lwhse1bnyPBlzmiNU2pCyXoO0J9i1Epg/qKmdMahkKfVPCgvgZz6gdV1Hd/mjejLU0SGW1a5MIS18O0kqk5cnlwu538mCPQgur189lhF33GxWHni9hkMGOToZxNBjM2JcU2TTJ+rlXf2hddsKlFG21qbWbvd0GGPFK4kr8f3JkmtOOORihcibj3v7jWue2FF4jXzlWMvvuLw8wvFa3TGozq5c0F0xVuxiqu4JkZujK4El90yZWgxuUygtGVffRgWHtNqk1dUj4hMx6yLvixxF1a09DdRR+F8RjNCTBJo7mH/AyGkUF1FS5pNLMOS6rYZNbBDft6HTZR06zT2lzuxOYR1q7bIF6CLwa0pmIAVSVkicUo6WCAYmYdbCjoT3UV+mswp39QRX/MMRQNaZLcggGdGgxwPczmROwa11sSfLGkNY2W6PMyF4vJMthg5tCUobYXfiQElmifpnAFVBxxGZHYgiGdGgzpHaCNSlJsGtfL3zbOLTomjtZU5KdKiYywmKx5DWZLko1GBQ76K+ZSIqhFAxJbMKBTTSLMEr0DNQDRHpoTkh8vAiOPijFcCQ4leZqXLvy3SuCKD6eFSsOZGya+UyotcEWDmawI6P6o3fAN+GES1KnglqbzTg2uZJubKGIruT4tkkfE4WKNK8FVV/jPlcAVG27YOuUJ5+TGcM4V1+lGXVHMuBJQcWWz21Iaw5Xgllzp1OBKtiFlJilnZ4/YYa73iTepSJTWNHR30adhPEbfGxO6RrPlS7HthR//QKIoduSHFF4bVcqXe/VaRlvyJPoENXiSbS5TYkO53oHg6zZjxwtr2JLcOAouWypzyBSL0XIMtijmnvk2GGyhYghbTDSa7+BKQOwKXRoyJblJ73fThjnExZvJC+ymH5pVGj8WEnxxKhHPHuPnXK4zGK+0HKZbREdtL7vpi3+WwpvDpHo1qHpy4Yc93jo3lnO5CTxQPVN6m2YKttIPehJ89YQfJYEnFqOVEDyxGOXTi8OcJzYYDW14opjxJCD2hJIOniS34EmnBk96D2gry9/LE9R9YPXVePJE8yTCVowfqYAnFtM8Ucx5otT2wnc/4IlixpOAyBMu0vAkuQVPOjV40ntQT2L7CNNkk/71W3YuT/HJ+qKkCz8UgJQJDpcwrTAu/Cc0YI/FNGUUc/YoBXs0ZRQz9gTE9mjKJLdgT6cGe3oPak9sJu1bkNxLFnB3KnKsLuT5WDpcsRyfS4ctntO0MZwzxmDbC5/QRuIYzlgTVHn3EaLR6gCZ06M10d9N20drq/GmyY+qWWwzf0vmxCcpc/jIODwKrmYOHyyFRRbTzFHMGaQUFNXMUczYExBlDh/Dhj3JLWROp5qJMMz1MGsY4j80/QQ/3PzCbdjPEOQIzUhwxGF8XhzTv2L6Y4qjthc+u42M0WDGkYCqIzs+EAxHksM/vWibJVmnBkd6D1rLYq/pEsaXsuCL/q1puixoMRn+uTyF/hajsgD9FXP6K2X1V8zoHxDrTwMI+ie3oH+nBv1dD5NAVMJip7n6DNflKT6wcIbLYtCM9u/wyYQDR8tpGGU455TBrFWGM14lhcm558B2x4eG4ZWLRl8B002nBq9cD7NexY50ffYEX36JxOVTEmCSCa6WNK4IsMpiNC/AKcX0fr6j4BOtqFDSNJjeT24U5ZQ8Bd25hZyKPscbMv2TZpt5f3fkI3NK8uwKffXnS3LkCtWJq8f4LP2Lw4wrtk9+FvjmghlXMhi5wsc431q0r2+TDdSUPVMPMtNskCUPuRL8ONNkiGoAJz8MaJ8casSFkwwGKOYMUGp74eP2MEAxZ0BQbAAtC2FAcl+nxUQNBrge5srXBko+ZEnwxZLWVLSmSgtLLEbfG5YopnfzHQVLqOzBEg3mLAmKLOEjhLAkuQVLOjVY0nvQnIhNJjyTjb5dfW2CLwa0pmIA1S4YYDGqXTBAMWeAUjjfTkfvYYBizoCgyAC+8woDklswoFODAa6H2ZzIbelqS4IvlrSm0RI+KQlLLDZdV/zC5TB9iMRRsIQWFrBE+3SWBFUs0Z/jW7ClaSKDTXf3P/on3eQdu8f1KRF80b81Ff1lobuxGJUupIRiLiWUgv5U4KC/YvpzVqMW9Y9gS/p3asiIbHP6I78emhOCL/q3pqI/1WeMf4tR5YL+iplthqGgP9U36K/B9HRjo4r+5hBq5xC070Z0R559ltVra4MP/ZPDj9t1R7iJ7eP6lAge006PbV7Ah6MQn06P2PbCEx9scpj8GRWHOZtsMLVJMWdTUGwTVVDMHMkt2NSpIU96Dzp1xz5xvSnBF7V3fEQLewyDXeQve8xg9M2ROxpNj887aqsPNDhMH2hoFJnCO3mY0i6tqf2uTZgogqrRpq9JeRLbxPWW6FZWH2i4bJRCmtDMijSxGE06cEQx54hS6JOmJlQzxVyaBFU01AcapmCDIS1+a4IhJths4bofcXhkLkl+nEt601TLoATNq9eLx2jKeXGYmct9MJqYbi6YmcszWFHfrKUa9nWNmqjJkdZm5vItUuEh/YMv+remoj8VbOiv2O6JH2iA/oo5/ZVCMPp1C/orZkZ/Uov6R7CFtVQLNq5lW5vTP3Z+CL1ue7cNvujfmib9ocVUAfPmev9kwahIQX+NZm55GAp9UimD/hqMy/xrg4r8CEal7K1zC+M/uixLqbyM0sN8RYqt4HpHgi+OtKYitVYki2lFUsw5opR1RDHjSEBFLwSj8gZHkltwpFNDReo9oK1O0dvYDK7Xv+1XW/TnS4bASOirW1y+VqT2yRHj9RYyQjGnv1JWf8WM/gEV/c350XZlSxUpo5WKZHqYz4jYCq7/uWkbH1j6uclheNieqjhmDhMOHFU4GGU455TBrFWGM14lhQE9DDbmkCsuGtW494Fqo/mjt409zHuFXMR8/oBX8YFFrwwGD6jiwyvP0ReFV4ZzXhnMemU49gAzTVKjksgrqrjwykWjrwCvOjV4ZXqY9yq2jusrXfDlR6iNPqR42QZ3X/WNQ1Lnn+QqRmrAKsXMARRDYXzQlIEVgQYzPgVU658+pNiCLdW/iFZM14cUezDkaVdt3rrYdN5/Xlm5bmt72SH4np/TwMylGFTUmcthHA3OKebW0krtnvhxCzinmLkvnFSxzu1lItiSc50aMizb3Fo6Np47/LPSlPjA/S9TTpbv+TkNuBLc/ZfLzkEimoBQ/Dyna2zDOWMMhm6p5sIZwzlrAiun5Jw1iX0K/Ll3QKmTNkxLJtwgSV3U7XKbvzpf8gP3P903Sk5F+PmSXF3qyRMQM5iUOhPN3KE0FGyRUmcws/lMqiQMolHKv7lvoPeRe5dTvrj48zbBn/vdgPU2xQdG+c39sZ1Suyd9IsJjtBx8uRjM3B8zFPqklL25YM6k+ALFJHN/rPfZ5H+f4remj9ZUgs07EtvZBxyJD4zb0V1rGlOJn+e44nGRT/Px3yHj+FEKyK+YyxGlID+lL+RXzMkfVFVsx/MdciQ5LML6VzBJ0qnBE9fDNFiomGEp8ViWxAfQx3RZe14boZYpBs1k2eYxmhXgk0ZzPillfVLM+RQU+zTp+DmdwKfkFnzq1OBT7wFt5EpsaR/IlPhAcWXDZ4DgimJQiKYOZI/FaFKAK4qZZ+wchk5pUkD6mGi02nhtUHFl98QP2sCVFqzJjerFTahe0VSizVev2PRaTxYeU9nFR8the1w1zQawJ7jRRWA05GCPxUgr2KOYtUcxdEopCHsU081OQkVQa08LNtjDTbAnmkq0eXtit2rtsYeLdvGBYspmc6JRDlOCI1Oo+sMUi1HBgymKWVMUs6YoZkwJqMiIYJT1yJkWbDCFm2BKj6ZVKzanD1gQHygWbPf8tyRgQXBkATkFCyxGhQYWKGYtUGz3xA8nIS8UMxYEVCzAF6VBBAtasMECboIFLtpUJWgqiT3mA6bEB8qiqzVNcz6koPIF/S02XVie8DKYm8xtMCpykF+xAx/Nw7QRVNF/s+NvAP2TwxifVjfkEmaSTjWb4EnvQdMiNpcPOBAfKA60pum64AAVaThgMfoCyADFzDsLHIZOqaTBAhONfIIDARUHtnt+bAYOJLfgQKcGB3oP4sD+0R17fqAUps2FX0X3fEmuFiZ+Uu06g1H9enGYs8V3KrYYTAtTQsWWjTwG8WYvjYbV+wRNpkzx1ZTYh+K/coPrvpzab3//+edq/v793+77k3/CDat8JfS/XPbx0fs783qaYjDRBcGe4MgemhBgj8P0UTmD6UucZ4JRrbw5zLgTF1bcwfekLwB39AvoVrFDgzs9vroD0e66/xZ34qPL7gRX3eGKAHcsRgUGyaOYc0ep3RM/FAZ3FDPuBETu8KYL7rRgTXhkCjd9tKYabZo766S+j62jc8eudRuPDwwJw491IGEiLq6uY5CH8gqWWIwqECxRzFmilLVEMWNJQEVEBJOlbr+ywZIWvzXBkh5N0yN2jusNSH40ALWdygIMaJvUYgDNFDDAYlQXYIBizgClrAGKGQMCIgP4aTDkhAlGwwxZ0qDBkh5fLYnd4npLkt/01x5B/rYJHeVnlyC/xaZkzYWuwcwvI4baPXEVQUnSPs1CN6n7Pz2Dze8iDft6lTVRgwFxGfif1IDYGa43IPliQLTVAsR1CgZYjAYQxr9i+rJNR8EAqmYwQIM5A4JaNCAx/NN9MlN2UPhb6YMBpoPZmyL72CmutyT5sUxt9/xHF5AnbVM6XT0kozILmyxG1Qw2KeZsUgp9Us2DTYo5m4IqNm0OfOgPdSq5yQGUJWnDVNHjaVrEznD99m8fHxi3f71p1Ju3udC7fbJgNMlAb8XctKDU7okfnoXeiplpIaAitytLiS1kRaeGrOgdqP6xL3xA//jAWIPM32K47BWDPrQuhScWo507PFHM/BBoKPRJdQ+eaDDzC0dSxRT3a22P1uRGCrQOWhMyIJpKtNm6dMgNudld2PVr8kuWGAzyUCW/XjxG1evFYcYSH4xq3M0FM5ZksCKis6R32vR/nzpoTR+tqUSbtwQ1f2bD5y0JfrTE/Fp+UAqOUNGGIw7jZ7PgiGLOEaV2T/xMERxRzDzfk1TRED9M1L+U9TYFa+rDkBa/NcGQaCrB5g2BtA8ZEvw4bRxa0zgf8J9ugfoWo0oG9RXDoqgq8c1RUJ/qHdTXYE79oKpg5sfyjLZwBGuiBktcD9NKvm677/cDH7Kk7Skn/d2TiRkWV9LXgpCMxhhs0mjA1CbFnE1KWZsUczYFxTZNMuZv5fkNlmzKaNOaC5nTe4B1ZEpsCZFach/RFy7eVT5fDq2pGEBDGwZYTOcNxZwBSsEAnTcUcwYEdf8jYX0IbQ/8emGUqeCWDOjUkCfZZvZ99yOHD2VF8KVQtabp8iGGThMGw5+LryUIhUoxZ4BS1gDFnAFB1Qw48Dk6GKDRdNvXoUH+Hl/Hf2wI3fhfOJZwPz0J48a6g0FDqiM7FMOTvLSrQHZYjGoAzFHMnMBO6p72fUCjUyp2mEY0mu4+EirmmL8T04ItZUd0OV6Z+TsxPRiM699gfq6P7eP9PIoUsSUT46P3v0839XPgE3FwMbj743udg6I0McPG4Or54A0/wQYfDeeMNBi6pdoKIw1nnAzqbmj/EtbJ5EbxTZ4Fdf8rcmM0GmSYfEyv81bGTtSlo5+Ogl98EOJ+evierONvXhCSZh/4l9zwnYDRvAL7FHPuKYVgVCFgnmLGu4CWszC54jEthrC6DmoxC02n89bFFna9dW0XPA0f3hkg7wy04QfzYJvFqMjCNsVQaeoEiDW4UrsNP2MG2xQztgVUbDvwy3IxsSW24FqnhqnNdDBr0f3PUDyy1kh+nOIO/G7e54uhoBfVgesMRhX0xWHGI98njfObC8YX9tog8ohKw1vHvvYoLwyz4ORRazOrvyPS5SFHgh9XfxliNAny06iG/O2TQ7rhwF4d/JBfMfMwnqHQJ5VJyK/BjPwBFfkRi8ok9E9uQf9ODfr3HmT5d3/Y8SH9gy/6t6YiLF0+9HcYH1yH/oq5UywG2230SS2Dmdv5SRUHzP3lhi0YEF+gJkC2uQSIrSkckqWbnfCPwRcDWtNowFADP7fPMMBiVKZggGK481TT5JujoD8VMySABnP6B1X0N39irkVbWGFnn9UA18O0uai3BI6xWV1vSfDFktZULKHyDEssRqULlijmpgSlYAkVOFiimKlJAVVHzLydwZYcyWhlTug9aE2K3arTf2E3c4xPln3f1s3YwSEr+8odUlH5hj0Wo8oGexRz9ihl7VHM2BMQ20MDB1OGCUaD8H2Chgmjx1dzUP0emjCCL8nRmkb19Rk4/G5976matKNKBPUVk5+cUa+U2uF591rWkByKGfUDKupv9nwMDOonh3/6MNNt5EQN+vceVP/YTbrk8PNF8EX/1jRdFrSgiQCj32JU4qG/YnbCVgyd0mCEAYoZAwIqBrj5OrEF/Ts16N87UP1jS7he/+CL/q2p6E/JC/0tRvUc+itmblcaCvJTxYP8Gszcrkyq6L/Fm9lrNiEBItrS7NCpwYBsQx3qqTOsaGi+ji3gekuCL5a0pqk7yEOVHpY4jB8fgyWKmbsjhtrh950qIizRYCYjAqqOHPSobwZbciSjlfm69yApcXpwV538WNi3Bz7k93wxGPShkn2dwaiavTjMLGt9n1Tzbi6YWdZmsGIKvgHVvLcWbcGUFm00pbWZfcUJ6fDIPJ38mBS9aUwK/skWBkRPo534llQMYIBiZmNtKASTOmUwZ0B0WQzYnPm5FxiQ3NcTxURNdaq1OQMgyEMGBF8MaE3FAKlKJ4fxo2YwQDFngFK7De//kAGKaVVKqOiPTCc3oX8EW0qATg36Z5vTP7Z8sHbdxvrUtqotOipQaxr155uXSACLaQVSzGwTfDCtQBrMJUBQ1YAdn4yBAcktJECnmkQf/ZPOgNjhrTcg+JIArakYQAUUBliMFlRIAMWcAUohAaicIQEUcwYERQbwj6QwILkFAzo1GOB6mCbJulL6fCTKP5ZjNw/JI8n6KuzMb5RBmuguE4pRlsMli1E1g0uKmeOlhtpt+KEruKTBTJkKqJiEYLQSg0nJLZjUqcEk08PscvaE+A9NHMGPJm1OfKwBLimGLzmNlLxL2HrHArx7Dk6rWV7lyDmfbK905gI+KWZ8Coh9otoIn5KbVkrvpg21y8SbdyW2hK6aLdyUOsUny00pKEpVDAYFN/oIjKoY0shiVJ+QRoo5e5RCn5S6sEcxY09AbA8lOOxJDur3Eaa3RSZqSKPeA9qossWG0dnjK1vwo9jugaqTYjskV92jwROLUQGBJ4o5T5SynihmPAmIPOE/AgVPklvwpFODJ70H9SS2jOs9Cb4sAFrTNFSgPxUj6G8xKgzQXzGnv1Lok9IVOaGY0T+gor/7bS+DLa2AM9pU2FDEeg+i//nBfXnyJSd2/JjIM/50kbkvyw88XWcwqVMmmjmUbSh4InXKYOaYfFLFFHdMvkdro/19+lKt6aM1lWizs8gZyfDI3J78oiURdsQgD1VeWOIwNvjFYc4SG4xq3s0Fc5ZEsCKitaR12vSHJdwES0y0eUug2kOWBD9qbZ5cOCu12/DjT3DEYlTf4IhizhGl0CdVQTiimLnHm1RxxDy50IMNhrT4rQmGRFMJNm9IbDPh4bqN+zn4cdroTeO0wQ86Qf32yYLRigvqK2busBsK6lO9g/oazKkfVBXMPLmQ0RbmjYkaLHE9TLuBuro6xyZzvSXBw/VphWfe8pdhRwySUVWHTRoNmNqkmLNJKWuTYs6moNimScZ8ciG/wZJNGW2c3tsnzf2V+3H9hwpX8KPa2yMf68P0rhgE0rnEYXxnCbmjmLnnYqjdRp+5MpgzJbqsphz5QNhbu7QlUzJaMaX3gHyiTIk95fpMCb4Ur9Y0JQ/EoDGFrLCYTh2KOQOUQp86dSjmDAiKDOCjXjAgOfwzlQlaZ2N+79RQvHoPakDsEdcbEHzNCj5IhqxQDALRxcIUi2mpUsxsRHwwnVE02IFPbL+2Kyum4BtQsYUpEW0pKzo1mJJtrlTFJnG9KcGXrGhN01jB5WtZMtiWb4ahLCnmskIpzMG6xFVMd4LZY9V/y3+bCPpHsCX9OzXon21O/9gk/pYHRM7x0cUHRJKrD4hs+ZEbZEjEqw+IbPlBEjhkOPMjusPgESUmll0mnDEpqMUHRDLa/UmrrypXRLtn1ESZP7fQoo11cHZ1fH8v1iOzfvKlvpm/tmAwyEiF64o/ePnZ+xgNGJWkF4eZ9PLBqCLdXDDzS0sGK/llzgQ1bNRabz5O1JRerc2k1wWFDZ7Y9LJ3H/MDZfxszV9bSI6TRaqe5/gxEfgSF1riOWMMttvyXyOCM4Zz1gRWsspZk9inwJ8L5/fWA4QajDDh5tMFQ/WhdAl+nHkurWnKYogh6zGPyXrMYGbqNxT6lPWYwbSoJVQyA8GoRL5dGreQGqEG5qfBkWwby+G8I7HxhInrtvcX3TC796kYDF9SC5hGA6YFTDFzw8X3qQVMg5lbYBms2mT++kXvtOmPLGkdtKaP1lSizVsSG8/1lujm2FqiGLTW4uUw3i2gdinmLFFqt+XlPCqXYs6SoIqI7q5kj9b0hyWtg9YES0y0eUtii7nekuCRiH2pYe5KXpSCOlrKLKalTDHniFLoU0uZYmZrmV+gOGLuSvbv2dSHIS1+a4Ih0VSCDWLUjf0ltpzr3wOVHygzScQYTYIUVIixyLIYlTIkhGLmfpeh0CcVPCSEBnPyB1UVwwKw/h6KqSQ5/NOHI084sKRTgyeuh2mAkiex43zAk/jAaIB7o8pFMWhGdR0+WUx9Usz5pJT1STHnU1Ds06Rj3pfMb7Cw2ZyowafeA9rIldiHri9dwZdEaU3T8IEYOnM4jB8kQaIo5gxQyp2QN8GcARHsfsOyJ4B7o0pGWzIgotU1V7a57UjudVevsIIvBrSm6fJ3W372BhlgMRpmMEAxZ4BS1gDFnAFB1Qwwb1Qxl2YKVetyGP89Po9/vFHmsS16/8BYlsxrMzu3gfV9VMEWmpivsyBNui8eNH/NooPjJaJnmrpultMdYceKPeYFmhM4bTfeXePH1KgJgf8NxeiBXWD/wJASQ1sRn8r9XfzsjFyiKfcuvgG9+AGS+DQf3cVXzoof2P3hgT6MsC6n8vrW431dnUas50dvrJ1MlaFMGaDx3R4zKD5QDWpt09fCGKWvdTfIcfIUj+X0ZonFdlt5jsdy1p24upIaerekh1s0J8NNCXTPld6HqV6xmbz/6YVVG3REy+3nU78l8Dw1DmMMqkwDII6bznFU0u7J0va4k7k+V5TDnStaod5zRTm5ddKpYsZ2xw+33FMlwg1T9L1OSeNd+2wsS4NJF06M2DQiY9ea0Taek07QnSr/3R/LUUG/J0tw9fQq/opEXfLfDdKAemPLYljZUXG8+6PhnD9BFX/wdSnc3R8Tjr7s3bBGjYWsd2FyJXaQD7gTH0D69crr3bEcVfy7O5ajknc3RzlrjmLb85l/8LLhnDkRbYU52q0swoZOR3N6F8ac3Eo+4E584n5be7CHn6S6J48HSai7Px6c0v2zDN4NciD/sPJthtvyO4nu+WMCOo8SqyNSHpGbiWcyqHc7utQ7+X9Lu7rdtm0w+ipGHqBx9GNbRhtgaZFhwHZTYLv3HDk15liZrSDt2+98IkXTn05n6+NN67KHPCIPeUhK/CEq+YnkCJVcDHnpGauknkVU8kAlp7IuUYkDlYuISgRINrtzYJ7pPTEiE0lx+PX+hIt1IjctnYBxplljCryxTj6wG1XpjsjPN0fo5GJonZQ5iU4eGD9ynunNPKITB6pmJzoRoF6sIY2JwECsWqeoRICsMXlYLBLSU4MZ6Y1YeqoCS3cUYLFIgYQ0Jj8rHSGSi3GFSB6oRFIDCxGJA1XuRCQCnOsv96ISwaFUVTMWlQiQqeRhSiXV2kUllp7Kh6gUYLFKgWSoknx+xWRHbtS6clDnY1xWqQcqlYYDh58AVeOESgzIVGK4PNNbZaASA870xODXE+6iTCxB4ngnWCRTH8gcT14rj5TJxVAy6QuA4Hg+aTXQ0Nty0Jh+AlSOIjJ56lj4Un+xR2NiOMikmrHIRBIkjamHxSqx2WqPi5+PiRRYY5F8IBUJxCNFcjGuEMkD40dGUSkDEJE4UBmUiESAVCSCA7NyKBGJAJlIHoa/woip1DgYHk1O5ReGd4LFIgUOYnh+youSvNbwXIwrRPJAJRIxPA4khkeAVCSCyzO9m0ZEIkBd+OJ3HhaLhPTU4EZUYukRlQIsVimQEJX8RHeESi7GFSp54LlKg+0wyBsHEr8jQKoSwaFUid8RIBuI90+oZFLlLzKRBJnjBVgskw+kjuenvCNkcjGukMkDlUzKyMTxOFAZlDgeAVKZCA4yqWYsjYkAqUwep2RSzV1kIgkymQIslimQkNbk5rxjBnl+lowmGlwarq8MQEYPYY4dA/XeC5GJA1WKIhMBUpkILs/03gSRiQCpTB6nZFJPKDKRBJlMARbLFEiITG7KO0YmP0m+LFOYYp/JpLxMZOJA5VEiEwFSmQgOMimPEpkIkHVNHnZZJZaeopUBRIDFKgUSopKb845Ryc+SL6sU5thnKhHP40DieQRIVSI4qEQ8jwBpY/K4yzKRBFljCrBYpkBCZHKT3hE9k4vQdXPdm1Bxtz7sTA9l3NJqCC4f7PSguOHBbxSW54O9HhRHtXBPd/7uG2sHzz+biLENs8Gk6FGxEoFiqITc8zDqe6qPcFZ1cr17A+pwnLIqqMNxygpgaQTH1CEwHCSmrBSGRnAz/fEPY20P0+qoRg91SHpEnYCK1DlREHXQQsap4yJcVofilEWJOhSnnEfUGeKoOkMYDu1TlULUGeLYF3AP0+ooCxB1hukxdXpUrI4LAwVRB8U8Th0X4VwdXeuk7QxxM712UsQZwtAtKBFFnB7X5wuvd0LYyTxL/cZChOijRrDBlsEAc6XklgyGwJNno0MP6fWPgu/cPowXsZuGQoQr3wdkLgIe+zQ0zlkRD3Gl3kcsRTyEoYhVhZUi7nF9vqSI+7DTo9AiHsLIyMonpkq4j9qzSgnrMClhF8ZL2M0gc/TW1xaxiyGXHMRlrIbiUo05UHVtUsocqFxbipkAhwsEOY6WPUmPFb6HoRjjHKtqID5D0tPLTEWjAOuFE5ECCQLVN7XMzR/HiORiXCESB6oOWETiQNUVikgESEUiuByn0ZyPfMSECHCmj2SXztrjLstEEmQyBVgsUyAhMrn54xiZXIwrZOJA1ROLTByo+kSRiQCpTARH2xLBUZU87rJKJEGmUoDFKgUSopKbP47oU/yEEw00av66QxbDc0Clpt5UJCJxoHJGEYkAh1tnOG6h90pLUyLpsVlJjzsXKVOOLI7nEpQdMqFs2NAq8MYi+cCYZLCt5vb4ra7bL6t2df9x9dY2j9tdWx8mh3rz6eaXu6UYJ5L5/rLbH5d1u/50861tX5e3t+/v7x/eX48f1vvbZrPZrusvzfrtpd63t9iYP7+t289vx7Z5kYRvJoi43HQJPzQtQh+b3a55//NYP31d7Z/rTzfTm/uP9ff292Mr9en0HPcf183+adtum/1q99gcXlZtu90/T47/dg/4gCWAiLnefH3b1ZP2xyuSenp73W3Xq7b+a7V7q483k6fvm9+ehGLyetg2h237AzuEu1WYtzTxS5w5TgawcOLLm2TOxFlgKbuFsyhSODMTZ+7G8sZ82vSE2drLFvdJW8o2T9ET9+xZOIu5PZ84tMHEiSZmLtsSFdCUT/fBxVSHZtZ8VvZ8zgqjngl1aI5VSZayxUDYrOc8s3HmCfV2gaO3TPlM8KHKWLYYmprLtsL42pLPPE/hnNk4E9pnVdjqEA6TtJbtZzNnt5XC1mdXRk/AQbIJ+bT5EI4dtnLialxb/4mDpRM4bW0FJ8cncNraCq4USOC09dm4RyKB09Y+cXlIAqex3to9AdcF35m8Dzvp7PnE3NXi8bguKoEzt3GmeALuozTlM8UTcMmiiTNh7iBXC5o4U3wIV/OZOFN8CDfImThTfAiV3sSZ4kM4INnEmeIJOBXYwokppN0TjGPqMsUT8BLLlM+UtoKjTUyc9rbSHRtj4rS3le4IFBNnQv+JDRe2iuu/k5km9yC1KYpt1ObWAlKb5eLDYAqpzXPxvTeF1Ga6WAGQQIrdH5bai6UdKaS24R/WCaWQ2voXLNRLIbW1U6zITSG1jQCxqD6F1NbF4CCXFFKbI2ElbQqpzZGwGD6F1OZI2KeSQmpzJHhKAimsxeJISd4AD7VwJtVddBYWziQ7Qq9o4UxqLnjpbeFMai3W97lJ9dbmRUkNFB+ILWWbMGIoZnfLh8L4LgWPazaGopqCGNtFLRnOEtyhKvMl3rTaajHuVzTnGJdigxjv3i05xhs2O/GiBDEO+7YQlwka46xrIbYVNc7Wtue4Wgixrbsrk7q7KUTGLMemMr5zWPP8ucqrJb7O2FTGSwwrsRxnMF3Kn8Y8p/S6S6xbySf4AzU8X8wn+KPCr6qaPCy6Wj9F2HyKsHmGX7Mp6sWsWOBXCZ3m8r9lgbiz6WwCN8qWD6X8mmeIsVgg5WIGtygWSK/K5qhTBWIU4iBFiV+VpILl44Kb4p9CVGUFEhWiskACKJeiqxElQFNQFQKvBF5M3f9n8hOBWCCEWHfTYlHCZyyN9Q4vNK064sFQLnICrIUZX67+h/h19Vz/sTo8b/fHya7eYP3V9INcPXzYPstNs+4fbfPa3eP8d7ewqfv5rV491QcBALxpGqyncv8Al/u/xy5QqN+bwz/dCqz7/wBQSwMEFAAAAAgAh07iQDLhXElJAgAAFAUAABgAAAB4bC93b3Jrc2hlZXRzL3NoZWV0Mi54bWyNlFtv2yAUx98n7Tsg3mtiO70kil31smqTVqmadnmm+DhGxcYDErfffgdIXGfJQ18S4M/5cS5/eXX92iqyBWOl7gqaJjNKoBO6kt26oL9+PpxdUWId7yqudAcFfQNLr8vPn1aDNi+2AXAECZ0taONcv2TMigZabhPdQ4dKrU3LHW7NmtneAK9CUKtYNptdsJbLjkbC0nyEoetaCrjXYtNC5yLEgOIO87eN7O2e9lp9iFcZPmCt+3wmKd5HZeSl86P8WimMtrp2idAti6kdV7lgi4M6W3EEOtGslpuXTX+G4B6Le5ZKurdQ7j4hcO+cYRiSobeJ6HZZTBqUXjJwdxvrdHvPHaflKkzgybByVUnsoh89MVAX9CZd3uYLikK48lvCYCdr4mf+rPWLF75VBZ15GCgQvvuE498W7kCpgn7JFuibv4Hq14hkI3O63vMfgk+eDKmg5hvl7rT6IyvXFBRBu7MfevgKct04NOo8yc4p0RunZAffYQsKI/DcvyS0Qiz+klaiqTNKWv4a/oeITPPzJL/EeBHasnsoxLIYHHL17SpXRg8ErZRiPT33Rk+XGdYt/OENnmI2FvfbMs+z+YptsTqxk2//k89HmSF1RGOCJ9D+kW2ZjiHhwVu8O33wYpQPiPlJYh6I2RgSiXh3Srwc5QPi/CRxHgsfQyIR706JV6N8QESjkTBKbFKcwzjcd7vEEfR8DY/crGVniYIa4bPEj89EM8SN032Y0rN2aPWwbPBzAzimWYKXa63dfoMmidpDOPTuHL9n5T9QSwMEFAAAAAgAh07iQERC4ofDEwAAgWcAABgAAAB4bC93b3Jrc2hlZXRzL3NoZWV0My54bWydnd1uI0lyhe8N+B0E+nol1h9/Gq1eTBXdsIGxsVh47csGR2J3CyOJsshuzbzDvsO+h99n38NRVRF5Mk4Ws9q+2GWP4jDrq8jIPPXHrPd//O3p8er74fX0cHy+XRTXy8XV4fnueP/w/OV28Zf/+PiHzeLqdN4/3+8fj8+H28Xvh9Pijx/+8R/evx1ffz19PRzOV9LC8+l28fV8fnl3c3O6+3p42p+ujy+HZ4l8Pr4+7c/yn69fbk4vr4f9/fClp8ebcrlc3TztH54XYwvvXn+kjePnzw93h93x7tvT4fk8NvJ6eNyfhf/09eHlZK39dv9D7d2/7t9kX40nQtyNkdBeUSd8Tw93r8fT8fP5+u74dDOipXu5vdm6/Xy6SxqaSNbT/vXXby9/kIZfZOd+eXh8OP8+7K4BHc5o5+3t7frt5XR996wUUYKK9c3h3H07nY9Pu/15v/jwfuiBP73efHh//yBZ7Lv+6vXw+XbxU/FuV1T1QiKD5j8fDm+n6N9X5+PLz4fP5+7w+Hi72K22i6u+DH45Hn/tpf96f7tY9u0fHg93fYdc7eXj+2GU/3Mp8tN/Dxvq/y0buQlbif9tW/w4lM6fXq/uD5/33x7P3fHxvx7uz19vF9KQ/u3Px7d/OTx8+XqW2q2vy2Zxdfx2fnx4Pvx8+H54lG/cLqp+S3fHR2lW/v/q6aGv88XV0/634fNtbHJzXfTfPp1/f5QqL+vF1d2QMt1ioY2MXy/16/KpXy+W16sf/36l35fP8P3y/wIgeAO/fGoDdX1dred24GZMw5D1vhY+vH89vl3JOJF8nF72/Sgu3tXSg3f9H3/q/yq5kFYlvSf58/cPVVXW72++S3fdqaqdVm29qptUVUuv2k2riqC6Ed4ALdkf+r2foVJ4ifbwqwEbLQx71oYg9qzZkKhT0drtflUGmKGpnaoEIkpSVQWVQ5YOzyBLFMi0nTYEsZ1yWVFndKoiZlLtVEXMzTSz1FiGWaJgxl6PaQ5Bx8yloSpiXgWaMc+qIuZ1ULk8S8lmmPthEkqDctOGIJibJYk6FRHyJsCMyKoiZOy+Q15lkSUKZHTUmOYQjJArEnUq8sg1D0BVeeQaI8MhS1uZLEsUyNSbbQgCuUirWVXyEY8tTrOqiBnjxzGLKsMsUTCjtsY0hyBoyqpEdw6qTlWeuaaRsVOVfER7VqPMHLPYXYa5d9VQzZSbNgSxnbLaUq93qpphVhUxo84ccyEHkhnoPgxqymGLKLA3DfVHZyrCplLbmYy40ZrnFgvKcatDbUdboUS2RQgDfFth+IwlYqo5cG2MwNHFHlyMKAceLK+38YKQ2iKEAV7US9q/zmRETv23M5knb9CaJxc7ypEH5xvIMa7HUVmEMMibgsZbZyoPXiGXQ2Ny8DuWJYEjWx5cPCkHHuxvACektgjhCHxLqs5Uc+CT9tggWR5cnCkHHjxwAMespBkPYYBXVZOQq8yT18nwVBmlHBv15GJQOfJghQM55iYlD2FHTrKuUJknbxJylRH5pYlFWsuRSxgTYkHbaosQduRUv53J5si1NSLHMPY5F1mOXMIROXZfcx7CIC+KFeaCQdYVKvPkLNuZTNSRca4uDVCxrBx5cMehWiiZbRHC2FaxWaMylVxlnjytc5UR+YURWubtsw9HOUfHjTlHGORluaau6Uw2Q24yIsd4d9VS5g20D4O8pDJoEQZ5Va045yabI5900BXGuyfPO2gZLLKvlhIlpzkPYZCXKx7InbXiyVc03ncmo5yjBz153kHLYJEDOUpOyUMY5JJzGg6dteLJkzo3GZGjRD153kL76zBRtaDklDyEQV6WG0pmZ63MkU966Bol6snFtzJzy3AxKByWJxdNEAZ5Va2pqDqTefLksMVkPudrdLQnF9/KkQeTHKoFg0VzHsIgL5YFyTq58DL0nCdPq0VlRI6O9uTSWo5cwlG1UBm0ZQiDXC5CJ3WuMvmILCYlVxmRY6by5CLLkUs4Iscw15yHMJDKZp2Qq2yOXGXyEe3gGj3oycW3cuTBJIdqIaR2uOY7DANsq9jydb/OZJ58TT24MxmRI12OvMp7aB+Oco4Jasw5wiCv+HpJZyoCpzTsTEbg2KYHz1to5SyUc9kiDPAyqXJTzYFPOujmwpxY5R20DyPjfFrcIgzwAuNp6JbORJ6br93uTOYTvrkwI1Z5/+zDETca0UoJ4Yg7OtlVcFUROGa6QbazbRE40uArJW+fcisnBqdttQhH4DXmAQXXRgicZDtrjMAxhD143j2r8aRQhk0/q/BV7hZhgNcNcqTgemZJ4JgtNOMqI3AMYQ8uhpWZDqvgjgM4JalFOAJfUUF1piJwzBYKPumd0cU9Dy6t5cAlHNU4um3YVluFMMA3SyLqTOXBE+s0mc/4Fgc/HlxkOXAJR+DUu20VwgAvNmmtqMyTb6lndtaaqCPrjC7aePK8dVbOOvmgrkUY29pESdIi10Y8eJpylRE4howDr/PO2YejlFMVtAgDvNhyLjuTefLE801G5BhZnjxvnbWzTnbzFmGQlys+Se1M5smTcziTETmGlifPe2ftvDO6IzOOT4RBXlVbGg2dyTx5Ui0mI/ILU2Kdd88+jGqpaUi1CIO8XEZXLsc6N9kcuW6MyFGiPud5+6ydffI9nBZhkBdVg2lMyaf8M7m0vrPWHHm9RGuePO+ftXraePc7uq+k1RLCIN/y/nXWiE95OkAn/HMbFajnzttn7eyTD0VahMEtx+RUUp3J5sCn/LNe4ijJk0trGRuqJRxVOQa5ZjyEQS4H5TiO1lpRmXxE/pKmXGVUK5dmc5HlyCUckdOU0dYhHCHVS8y/Sq6yOXKVyQd2sF4iXT7neQOtnYHWmJ405yGMbZXLLbal5CqbI1cZkSNdjrzJO2gfjnKO6WkkRxjkUue0g53JZshNRuTYqCfPO2ijDjreAOWznBbhmLzgOjeZI6/5ruTOZJ68wHj35HkHbdRBlRwTq+Y8hB05ZoOxWqyVOXJtjcgvjNAm76B9uK8WJcfuK3kIg7wskuMta2WOfMpB6+j6ns953kEb9T4lp2S2CIO8qpNr5iabI9eNUc4vjdC8gzbBIvsTOT5faBF25MkI1VaIHENv6MGdtebJo+NOn/O8hzbOQxuaqFuEQV5UfPDamcyT812PncmIHCXqyaW1jBM1EsasyPdbW4RBXtUlFVVnMk9eJDnXjRH5pREqshy5hCNylJyO0BB25NQ1XaMyR14lR+cmE3XkoSV8zedcfCtHHkxyqHMq4LYJYbct2sHOZHPkkx5aYqOOfJX30D4c5Zz6t0XYkZOsM9kMucl8zqNrr54876ErdxbK97hbhGNyvlzamWyOXDdG5BdG6CrvoX0YOY9uu491jjDI5RE5bGuQdSZz5HX0zOw4K5qMyC+M0FXeQ/twRE5ILcIgr+r0IUptxZFXyfG5tUbkF0boKu+hfTgip+muRdiR8wg12Rz5pIdG16Z8nec9dOU8lG/itwg78mSETnooX7vZWWs+55fOQ1d5D+3DUc5pom4RBrkccSXk2orLec1XQHbWGpGjo33OpbXMfL6ScESOktMRGsIgL9Lnm60VIsfQ0xGqrRE50uXJRZYjl3BETgXcrkIY5FXN5tiZzJGnHmoyIsdGPXneQ/vfwUTksDPNeQg7cpJ11spIfhjufPzTv9/8RA+Vm4zIUXuOfJ330D4ckaORkRzhiDy9Y26ymZybzJNHp5CePO+ha+eh0UMaSh7CIE/OiKwNx13zBbydyYgbFuK58w66dg7KD3y0CIO7KDbUMZ3JiBxTxjg+TUbkGMaePO+ga+eg0cMlmvEQBnlV8+lHZ6048nR8mozIMZ158ryDrp2DrilLLcKOHHPBsIOdyRx53dAw3pmMyNGDnjzvoMMvusJTRPzoYYtwTM4HlJ3JHPlEztVoPXl0kOfJ8w66dg4aPVyi1RLCjhxjSnM+5aAT5CojcnS0J5c8ZHxoLWHMiXxs1yLsyDGmlFxbmcu5yoj8goOuRZYjl3BETgXc9t8ewxF5mVw9N9kcubYmH9FZaHQdwec876DrYJH9WSg/2NQijG2VcurvrbEzmSOvV5SHncmIHAPZkW/yDtqHo5xjmI91jjDIpX5J1pnMkVfRYffQ2s5knjwyP0+ed9BNsMg+53wrokUY5EWZ/LDCZJ6cR83OZESOi7CePO+hG+eh/OxPi3BMzjeTOpM58pp9bWcyIr8wt2zyHtqHUS3R40haLSEckW+i/h3nFmvFkaezosmIHDOVz3neQzejh+oTORvsvpKHcEReFTT0Om2lfxITk8ZEnathE/mFWXGT99A+LDk3cuy+kodwhFRzAXfayiy5tiZjCztYR0/e+5yLb2Xm800wyWGEYveVPISxraLgC52dtTKX80kPjaZiTy6t5cglHNU5DtuUPIRBXtXrZFZUmXwgmRPVojJfLdGE5slFliOXcEROBdxuQhhITXSRYdi/zlRz4NqYfGD/6mg+8+B5C904C93AzTTlIYxtFXI3lCzUWvHkfJa9MxmRw5Ad+TZvoX24H6DlcMrL5zotwjF5MrWobG6AmozIMZ958ryFbp2FRk/ejTlHGOSbqC7HYjGVT3ni/SYjcExnHjzvoFvnoPxQWYswwKt6QxNQZzJHXvPPL3YmI3IMLU+ed9BtsMh+TuRT+hZhR06joTOZI08d1GREjkHjyfMOulVTG5/JiZ4Z1GIJ4Zica6qzVjx5Wi2TDhp1tCfPO+h2NDVdS2OLklPyEAZ5WVboX61zlTny9Kq/bcznPOpoT5530G2wyKFaqIBbhEFe1dw1nck8eXIF2mREjnR5cmkt40NbCcOH+KGVFmFHTjvYmcyRV3yBYGcyIodte3KR5cglHJFTGbTbEHbkJOtM5skTIzIZkWO8e/K8hW6DRw7Vgka0zkPYkWM20DpX2Ry5yhx5E/3i3pEXy7yHDvEo6wQlKyqE89QIvokeLxzhg26GPugI/8IRgPxALFszQxz40ro/LhH+YLXgL7Z8mCNrQqjO8/PhvCwKoTriv3AcUCzzfjrEY36c2I61EwnAX1bslcKvzuz4kxs0wq864scEQOWTd1VZeyUetNJ6kv8gAL8sEEFjRPhV5/jTO6RBR/wXppximffWIR7nH/1o+Z+w16Lme5LCrzrPn8w7QUf8mMYo/3mHLZbBQ/upR1pP8h8EUf6XfLAs/FMu23A/Sf2ojvgxbxB/3meLpTNaaT3hD4KYP7m0ERqazb+25/mjBw2JX9rLeFaxlHhcP6hDq58gAH+55GuLkn/VyQfO6ZrkycagI36MO+IXXZZf4jE/6tD4gwBcRcGrmQm/6hz/1PhVnXzE+4lxR/zidln+4K1j/dO8IvN/EGB7hSy55+tM+FXn+ZMjnqAjfow7z98vIpTjt0WGdLk5Pq+WhYEm/HfDt0W6IPP46fRjzRE+0kH4M/ZrKxIpfjSMtHwgQPo30a3bQSb4U+7b8AOdu6AjfFQt4c+4r603ZPiJ+0IA/GKzQrUa/5T7pueFhbVH/Kha4p9xX1t2yPgxC1j6J9xXfmmC2dr4J913onxU5/kvPXBa9IsQZas/mOswevkmgVR/EET5T2YVqZ9J903OboOO+NHvlH8xuyx/MNeRH7OA5T8IIv519FMRy7/qZoev6ogf/U78M+5rCxZZ/WAaMP4J962a5NFZWZdntJFZ/kn3jVa5IH5pL5t/iUfuxfOF1E8QIP/CT/sp9aM6+YArTY1f1VH+4frEL7osv8Rjfsxjlv8gAFexSm5gypMeP5h/1ckH9rMpsV3in3FfrHQ01j/mMeOfcF/JP+kk/5PuOzH/qI74MZ95/n4Folz+bYUiq3+0o/wQxPmKHt8ddLK8nbr0XP2YzvNHj+gS/4z92nJGyh/Nw8avvirDLvR3md5GlvuzP1Y/piP+S/NPvxpRNv9qm8aPedj4gwD8dZQuS/+k/abT/+TqSE30ADGlf8Z+bckiw0caDH/SfnlZAimfH7Rf01H6MZ0R/4z92vpGxk+HNbK445T9rnhYCv8P2q/piP/S9NkvT5Qtn+Cuw/QT2YjlPwhQPkXDD88Jv+pmh6/qiP/S9NmvZZTlVze0/KMfjT8IwC8LJibT5+SiSU1F05ksr6ntef7ogjTVj+Qjy69uaPzoR+MPAvBL/olL8q86+QjTVJXesA064se0Qfyiy/JLPLLfyAaNPwgiria131J1jn8q/6qTD+xnE/2Amvhn7NeWNbL8U13I+J20X/5Zt+R/yn4nTr9MR/yoW8/fr16Uy38fj/NPddEWELh8UZ3JIq2T9ptevDUd8V8av/1aR1n+4K7D/MOHBcIfBOAvl8kt6KBz9TNR/9Ye8aPfKf8z9muLHWn9sK8K/4T9yjV28gnJ/6T/sk/IKrmqI370O/HP+K+teWT8if9CEOefx7nw/6D/ms7zR5cziH/Gf23pI+OnvEr+J/y3avhBc+Gf8t+G18IYXtExDDjix3ZH/vH1GuOLHl5ej2d5Kcfh/s/75y8HeReG/4O9mGPXP6H1vH+Sd2D8/a//8/e//a38VK4+VZ/KT8WnRv43vExj+qttf1Tjv1ps5Ysr+Zp8fXjfh/+mUOy/nY8fHx7Ph1f/BhJ9Jcz/9x0nV/LFd5+HdtvjWd588vH4+Hh8+8tJ9398T8nht/PPp3P/HhJgSGL2Xw7/tn/98vB8unqUl52I9rp/gvp1fM3I+B/yIpThrRm/DK0P//wq77Y5yGszltci/nyUdOt/yAbG2Mfhj/32wstzPvwvUEsDBBQAAAAIAIdO4kCITXuVNToAAKx1AQAYAAAAeGwvd29ya3NoZWV0cy9zaGVldDQueG1spX3Zjh1JduT7APMPRL6rmLHHLRRLINXTGAEzgCDMaJ7ZZFYV0SSTIrO6uv9+jnv4Pb6YWaTrUg9UdpTdY+GL+RYWJ376579/+vjibw9fv314/Pzqbvjh/u7Fw+d3j+8/fP711d3//T9//qf97sW3p7ef37/9+Pj54dXdPx6+3f3zz//9v/30x+PXv3777eHh6YVF+Pzt1d1vT09ffnz58tu73x4+vf32w+OXh8/2X355/Prp7ZP9z6+/vvz25evD2/fxR58+vhzv79eXn95++Hx3RPjxa0+Mx19++fDu4U+P737/9PD56Qjy9eHj2ye7/2+/ffjy7Rrt7++74r3/+vYPK+v1fopb/NPxXzzeMMP9ffrw7uvjt8dfnn549/jp5XFrWMrLy0tVzk/vIBCprE9vv/719y//ZIG/WOH+8uHjh6d/xOJeb+jhKcf5448/fvjjy7cf3n1Od1FU0LC9fHj6l9+/PT1++tPbp7d3P/8UW+Dfvr78+af3H6wWQ9O/+Prwy6u718OPb/bLfmf/JWL+48PDH9+Kv1+ERv/L4+Nfw3/41/ev7u5DtIePD+9C9b94a//vbw//8vDx46u7/zFerOP8Zwwb/raQLz1m+fc1/p9jR/m3ry/eP/zy9vePT//y+PH/fXj/9NurOwuUrv374x//8+HDr789WU+dfxiXuxePvz99/PD54X89/O3ho/3Crgemd48fLaz9++LTh9Cr7158evv3+P//OEIO+w/bZj//9vSPj9apDfAuVlBivAY5fj6mn9v/Tz8f9x/2fcr/dx7o5XE7sfShBX7+6evjHy+sdxrtty9vg3aGH0eryXfh4utw9dWdkVkpv9nVv/083P/08m9WZ+8S5M0BmUrI6JCXFt0pLAyhCFcbis1/H+/iTcUvgtsNkODhah18nJrgPXc+0+DhahO8vXOD5JoTdx6aHms+XK2DT0Nz5wek5/5XShGuNhRrQ2GQZ+9/o8HD1Tr43N7/Aem5/zDuYxWFq6/uyiqel+b+D4hV1LOlCCMEUoSrTSn2huKA9JRisPmMcMTLr+7Kql5yVzkUkDBWY88WZBBKPnRqFeIRlrYo8adxjHPMkO+k0vLAxRwv1xW25gipLIfird6eZ7FqZTUWLjcsbc8dDkwXC5f3gPre2i6cMF0sXOcDCn2DshyYLhYu9QG1vsNAfmC6WLjmBxT93g63CdPFwmU/HKIuJ4UdauzAdLEYiPWxcLnuY/ulkf5wYHq0P3Ltx8s1y6WtsYTpYuHaHw/tlzV2aWssYbpYuPbHQ9cVS1tjCdPFYiDSLmO4XI/6w/3cNEwCddFw8Y8o/uG+nd0TqIuGqz8sG5teNgztIJNAXTRc/iPKfxig0g5QFw3X/4j6H4Z2kkmgLho+AIw4AAywrEugLho+AsRNQ63NYYQuYL99dhqbuPjj5YYAFnkB9DwB1/2Euh+mttkTqKeiJi78eLktR9vsCdRFYyCi/ClcbmjmdnGRQF00XPkTUf7cNnsCddFw5U9E+Uur/ATqouHKn4jyl3aVnEBdNFz5E1H+0g7+CdRFw5U/HcoPq+GsiRWKY6j8n3MPqRawExd9vNx0shX6co/oZy76eLkh2PI9HkvkAHq2BDMXfbzcErSzfQA9T8DlPuM8P8BiMoCeJ7CuQIQ+h8tNCWAdmUA9nWnmQo+XW5q2qROoi4YLfSZCv7RCT6AuGi70mQj90g5bAfR8q3CJzyjx8R7KYaDnCbi450PcZccZ71ttJ1BXRXGFz+Fy3ezjfTtUJVAPzcJ1Hi83NMVm+tB5AnXRcLUvOMWPQ1tpCdRFwzW/oOZHWNklUBeNgYjyl3C5qbSx7WMJ1EXDlb/gFD+O7boogbpouPIXVP4IC8gE6qLhyl9Q+ePUbu4TqIuG638h+p/avWoCddHwUWAho8DUTl8B9Owws3D9x8tNH5ta/QfQswQrV3683BDAOjWAnifgml+J5uHkM4F6WmLlmo+X23K082MAPV8Ouwui9jVcbghgCRxAzxNwna9E50ur8wB6noArfCUKX9pJN4CeJ+DaXom211bbAfQ8AVf1SlS9tqoOoOcJuJ5Xoue11XMAPU/A9byS+Xxt9RxAzxJsXM/xctNNYcUeQM8TcD1vRM9bO4cH0PMEXMkbmb23VskB9DwBV/JGlAxbggB6noAreSNKhi1BAD1PwJUcH8A2jQynygH0PAFX8kaUDAfKAfQ8AVfyRpR8aTeWAfQ8AVfyRpR8gW7ao+SNKzlebtrgAt20R8k7V3K8XBNM920VJVBPZ925nuPllqatqAQqaabigLk6q9i5rOPlhgcezydQH4+hyDy9h8vmCyiHuGloJ4mE6iPiKt9R5RPsMhKoj4eLfQ+X2wKN0BFKteu24XLfUe4TnFEHkKtRM3C976j3CXYXAdTBwAW/o+An2FgEkDMUG9y6A3PB7+Fy04HhfDqAniW4cMHHyy1Buz4LoOcJuNQvOHVP4HMIoOcJuMYvOHVPc7uEDaDnCbi4L4e4ywgTHHcH0PMEXNQXIuqlXcIG0PMEXM2XQ81VCZZ2dAqg5wm4li9Ey0u7hA2g5wm4lC9EynB6HkDPE3Alm40OhAa+jAB6noAr+UKUDOfyAfQswXDPpXxcb7S8tlqOqA4Orubhnsh5a/tqRHVwBOWio2i4D9ebcmxtd42oDg6u6eGeiBpdJQHVwcFlbQ/dSTnafVdEdXBwZQ/3RNp7O09HVAcHF/dwT9S9t6u1iOrg4Po25wDW1d6ubCOqg4NLfLgnGofnDBHVwcFVPtwTmV/a2SiinueIljaij2R1q4ZzeJAxJFRXD5aOOFT7fA9qD7/uKI1QOzHEzfeg9oDq4BBqT1a3cgqd4cHJEFAdHELtxAw330MPDqgODqF2YoWbwQwzBFQHh1A7McLN4IQZAqqDQ6id2ODmAWaqhOprFaF5YoWbR+zBx8jQxySUn6xuZT+dYT8zBNTz9Sa8cAMxw82wo7miTJbBxl/6y4foYSNDCvG/zRNMI8QBJ/dkQzSyMaowDtSz+zzBbEJscCdUQvbJ5FaNHfPcrkvNGRXvqGz9Ey4h/+R0q44AZjirH4gh7oRLDAPJ7laNVzN4VgbiijvhEsMBMcbNsPIeEqqzCsWoQMxxM5y0m8Hsv9JaYlggBrkZl8rEIXdSgWJcICa5GQ7Hh4Tqq0DhlhuSXa7ugxuMqwnWySU2AsQ5N+9IdSwg2FAkrHJDssHVhYBjWofNOMhFhxsZeYg9bsa1WULRWxbaJ4a4GRdkjoJROZrY2A3j4n7B5Zf75DCu0DSxvC24HHIUxhUCJh63BYwjQ0D5FLgUy5d6qopONlYpuIpfcH0Sft1DIkRLTG4LLlACqoNE+NwGYnRbwMtxRbH+KPxtAzG4LSNMsQlFA4u1OjG2LSPsaLucbUO0p5H2Jd62BZciCUVvXqiUuNkW8E0MCUUDi+mY+NcW8EsMAdXTWYRmiXttAc/E4CjQbDSnseo+ptNy2bqAVWJwaxvGFTMs8aotM3aVUqbTUlgP6sEgus3Y3Qf91ovJMkh6nSr82qv+hEUY1QbiVFs22NQ7CuoousvI3RNr2gJPnQdHYVwhU+JFWzaoe0dhXFsasIM5Yj5b4Bnz4CiMK5RJ3GbLjvUbfh3aGuMKYRJ72YIHV47CuEKLxE+2wKPwwVEYV8yfxEC24JrKURhXaJE4xhZ4sj44CuOKWZIYxRY8UHMUxBX2sIH4wxZcAToK44o1K7GFLbgAdBTGFXojPrAFnvsPjsK4Qm/E/rXAa2mDozCu0BtxfS24Xk0oNhNGVxcZ0IjbawF/wuAovGEhOGLyGi74CrDDMLBQHDF3LRcYKR2FcYXiiKdrBSv44CiMKxRHrFwr+DMGR0FcYeAaiINrhXcGMwrjCsUR49aKOw1HYVyhOOLXWu/hYMdRGFcojti01sJzktYTjsK4QnHEnbXi4bCjMK6Y4Ygpa8Udl6MwrhAc8WKthXXhWg/h13RGjlYrMkAQC9YKZvzBUXi/Qm/EebUO2B/Cr/n9Cr0Rw9WK+0BHwf0Km5W9DZTuJK9LV/DxZBTGFXojxqp1gPHMURhX6I0YqVY8RncUxhV6S5YoY/X1+YpbYEdhXKE34pNawb40OArjCr0lX1R9v/CwylEYV+iNmKFWeN9icBTGFfNbskBZLRX1CycBjsK4Qm/E+LSOoDdHYVyhN+J3WvEBh6MgrnA5DcTmtOLBhaMwrtAbcTetYAAbHIVxhd6IqWmFF58HR2FcoTfiZVrhFZXBURhX6I1YmFZ8qOMojCv0lpxLVf+d4JTZURhX6I0YllY8snEUxhV6Iz6lFdxug6MwrtAbsSetM4w7jsK4Qm/ElbTi6Y+j2riWFM7mMZznj+v1ucwKnrmMwrhcb/Y6Jc6bc/uQPaMwLtfbSCxHtsFojyAyDANzwY3EZ7TCMVhGYVwuuJF4i1bYEGUUxuWCs9dJsYLByZdRGJcLbiQeohWyK2UUxuWCG4lvyIav9oXIDMPAXHEjMQut8F4RQ9n5Yp5gq1NMe4lWqCVcb9QC5sPj12z1OkarD1FhvN7GhU7tKKgb2/pTdcfrbdx29h8dhXGFCokVaIXUAqOjMK4QYbL/lKs26yS5lY7tzOgwDCxUSDw/K7ghR0dhXKFC4vMZLjAu22vMqd9gYCFDYu6xmoAB1GEYWOiQOHpWOCIfCepELtG7w7r1dRtXLGrhKbe9fC0rR8iQOHhWODYfCeqkDMLJMxInzwq+zYyCdhBGnpEYeVY4Ss8ojCukmfw4pYRWOJoeCeqsboRckx+n4rq0nq3RUVgGoVaSsWqFY2V7zV31m+inIf0x+Wzq+4XRxVF4v0KsxHqzgTNyDCjf3G3F4Vo990TbDLv5IOh6LN/gBMleyu8jEZMpsdts8HrUGFC5JMWxUFMSIV9itNngTGUMqA4SYbGxtAFYXXAQElE9JGJ+Jd6aDXaVY0D1kAhFk5xUG7xaNAZUD4mQMrHcbLDPGh0F0oieGdJr3UtT3BwY+0ZHYVwx8bqXpozbnp+NjsK4QsrupSniwhs4o6Mwrph2ieNmw+W6ozCuEGxKI1U1/gqr6muyKTSajiJ51HG9GW5WWJIm+w159DQKM81xvQ0MCxu33EBNCC/NSLw0Gy7xHIVxhfyIlWYDW+DoKIwrFEfsMxu82DI6CuOKyZO4ZzbwKoyOwrhCcck8Y6x5mIEX40dHYVyhOHfClHGhozkK4wrFuROmjNueSI2OwrhCcckvU9keN3iYPmYYRhbzIknntGEK1cojI115o7DIHNcb+cGT34jyZj4hEfOiO2Fy3e/w1G8MKCeRft0x2l/I1OK2mBxkh0dJ8dc9JEKl7pEpSHAZEVA9JEKyyVZTSmuHNxLGgOohEfp190wOssOJ/RhQPSRCzG6lyUF28ASOAdVDIpTtvpocZAd/4BhQPSRC5m6yyUF2XBBV2ZtOurBQvDtuChI4hR6rDE564yBMOqPbb0qS9kg6ory6TkiE4t2LU5LASVNAOclenAfXG4dowCGKd2NOEQTe3BgDqodEKN5dOkUQPGCucjkthfOgKYlQPDH27HjKWuVzOmkToXi37xQlwbVhQHl1nZAIxbuVJwfZ4V2QscrrdEIiFO++npIENu5VbqcTEqF4N/mUJLBgqPI7nZAIxbvjpySBfUuV40mTCJPQSExCOy5ZA6qj4aPnh4jRvUA5yI6HewHVQyIW324MykH2HbY3Vb4nPaxENxArSRgJ6iXRjkdxVc6nExKheLcMlSWBbU+V92mTJyvRJ8RKEkaCpiS4gqxyP52QCMUTy5F93KhNW1/lfzohEYp3Z1Gurgv458aAyr1LV5dQPDEjXXCZGlA9JELx7jnKQS54bhdQHSTCpjQSm9IFz+0MBZuRaDEiXSlZj8o15wWMOaOhMKLQspuOckEvM5wWB1SuCHlKGp1G7LZRyxdIMjOGXzvJpTiPqmfvaDtiJEHjtcwu+KxYmpbGaDticVG+5Nm2NC2N0XbE4gYlN/cLr4Yevw4obFEhUpK36YJzv6MwrtCl25GKRoKXPseudE1jtCCxOglybeoE58iujE2jMDMd11sOWLaEX3tnLLybdV+M1iRSDrcs5RgXPO4JqA4OoVy3L+UYF3wG1pW6aYyWJVYOIlx4BST+uqMcYg52W1NZDpi5uhI4jdHKxMpxaLg6Hrrgw6sqiZPeP0RjE2M5FN2wwH6ryuR0wiL0nexPdZqKe3ixdazyOZ3QCLknN1Q5zVryI9RJCdCL4uiBYlWGgjcWbP1qIi7uopLjJPxUx/Va8pZkqU3QEGHej2VZpuiiwrIc14Gl3atEWGZRyyPLG2lDIWMJ11sWOPyKP88susaCwBkLCt9SRrUHwFOV4emkxrj0J2LDMhassXK9c8ISRM7KghO4sbTbuyl4t3pqjC/AJ2LRsjRZ7a4ownpYuPjtMIu0PnhxIqyHhWt/Iu4tKwvWWPh56IrtGmISVq3jepMY01J4tedeBQ5CR78VaeV4vdVFsYg8XEpTNTjLs8FJeLeO6y0LZBuMMK//Exahcfdo5Q5pSciglhyGlSRk7R6tKnA7qFvu1UIKxThZj7bRmMVa4liIVzVttw/dp0rmJCeoKdq0GM0h63JssCxqWEmlrE9YhKzdy1XWGCx7pyqh01wMLk2VCVkTZ5dla4MJKsC8W52wCFm7pysHMRYYbgOshyVM3axd2JQOzySnKpWTLotwgE3EAWa556D1A6yjLMIPNhE/mLG0K7oI62ERck++ryBnj2JJ7mDuCLgSkEtb97Lo7SItkzxfLQ8Wp5L/fXFW1fCIaf2azKm6XVvWNadRU8B1lSconZXnGAHq8thEBTzlEGAVmwFNecQYkJxkLQ/Wm/2+qzxiFEi5mVoeGDgrO9lZecQ4QPxk9lHIXCtpqqwMZfI8ZorGMdY6ZBywxHfQOOXSXj7UtrzQvA8QR9lgedpalgDzppHnxFO0jpGyEEuZscC8WXnKTljEOEA8ZcYCzV+Zyk5YxBrA7WK5QqzxofUDrKfGxBiQzGOVwgd4HjwFWA+LGAHcSpaDWP5GGGgCrIdF6N+NZTmIscBmKMB6WIT63WaWgxgLzM5V/qeT1hfaJ9Y0EyXqpVwDnLCINQBJAGUsWGOl9jWLMK1NbkcrawzXZgHW0S7Cwmbp1tMuJwcZ7F3+doQJsB4WoX23quUgxgI1ViWHOqkxoX03rpUscGg4BVhPWYT23caWg9hnemG0DDBnMUDu6vW0HN1rZFBOrrZmusRlU8bBPika2FjoMBI02zx7hQTavFS83CeJ3FGWBZ+R5FpI03CA5WrKe4KmkoTek+Otqmp7cxBKUupdl0TInXjkBnsrD0hKuUsS4ZGbPEFUWRvwYDDCvLouhZu3rq9ohiMtT0xytpyA+qpccnr3IlxyE3HJGQv0rwDzspywCLUTm5yxtIerU+WT02NK9MOxGgujQKMVe5WlbfzKKHeyaI2OOEZzLPZrxeFZYWWVO6MJCmc0h/JrOeAxXmWWO6MRkz1xy1kiXVgcV3a5MxqhfuKXsxy6MNtXhrkzGqF/4pgzGhjJHAbjsHDJTcQlZ8tuUGOAZZ0U5as1H+1wpM2JTc5YQCeVT87Kl8e3hkZM8cQoZ5l/QSiVU056NKboiGOFCYNBK0f4IF78uVfZCYuY4olVzlILY8OU884Ji1jeE6+csWDDlMt7e2Muj6NNwwjNE7fcYOaNdgSr7HJnNELzxC9nNLkXpfm+NszJ50PRGMfaPwwFdsReLuGMBnaRyVhnOFSjkDmxydn2FDtwOc3rGVj45CbikzMWGBoro9wJS1i9k2oiRjljgVqqnHInLELyxClnaaahxiqrnB3Jqg4svHKTZ9TKo6DRYJVVfeKERoieuOWGCVctlV3uRCfCLzd5vq2yNLhscRj03+iFY21+zO3losoSYWNrXGEYWCib+OIsMHamaiV/Uv9iNifOODu4wWY+RgDyWC663ljFBME3c8aEz/vcNAcVIxxwE3HADfj9sgjzyehkJyhscVOyxdUNCy/8R1gXjVAz8cpZaWA6qsxy+txUmOUmT9dVdn9IThJhuTC6Mwm73JSMcPVTuqnYL6XpKOOw1cW0nbxwTWhI/zFlHIYWU7Xn8CorBx/6BZhXzkkTCD27OS4HsbNLWM8GWA+LkDMx1Fl2d1h2OAwrSczTnuAr350FhoWGwyCwsM5NnuGrCgz1UnnndO0L89xEzHPDhA/dHIa3L/RLHHODsbXrPIdhYLHR9oxfZb1ACtspwDr6SzTEkVGaGOXs9mH4qZ1y+lhNeOWmlA6sXkDOuGjJOKwnoV7PCJarwRL0w8FgZZA7WQ5FJxyrqCDrZjqbwd09VQa5MxqhX88XVpamONZKA2iAeavrPZBwyE2ePSwHsS8UYJ2Vi27JYp8fo8vh43pbZZD6MsKeL8ssHHLH9ZYFFmAZ1nYs64Xi9sN1CJyX0UdTHD8PMAzMlW2fUmOB2yVXhmFgvpaek/Wt8o0M5RHf9ZbD7207t5J75tOvCer6k7LLwAufBQ7vmgt4Tia35q7Bf1bgMDSfc2fmbJshWWGGYWAuU/uKHGlCWNxmGAbm06yNKCQwvDuRYRA4LJDI3nSO19veXJxqpa7hMAzMN732sTt2x+0GKMMwsNBfeAYD+isOyK53fIVhYKG/MAthYBC2wzCw0J9nFSs1AnZB+3Rf4sfAQn2eVawK3O4FbQSXgYX2guigKuBF29lheMdCecx8NheHaNfGu86qGFgoj/nNZniiPTsMAwvlkSRi9u2WduU8OwwCC1eZfduQ1DFsL64wkmBlFk6y43qrafiC8RVGIwvtJfeY/Vefma0y2kX57DCsDKG9q12sPFy34xyY/DIOQwv1XR1iZWj7Sk67FJ8zDkML/aVEYfXmcy6O1FJ3zjgMLRRIMorZTbdLsdlhGFgoMBm/6iaEtDP2rUo1ZkRHF66EZ+b0msHxmWF4x0KBJFuYVUW7F7H1jLpj4eeamZ9rhjSCGQZ3LCxcM7NwzXDIn2EYWOiPubZmSLhn3wOVVSH0l4xaJqFC2HDcPjsM71iozxN7VYHb84HZYRhYaI/ZsWY4urfvlcqqEMpjDqwZTutnh+EdC+Ux09UCe11bh8o7FnMf81ktcCQ/OwzvWCgvWauqXrHArnN2GAQWbqqZuanw04AZhoHFqpMZqPBzgLPDMLBQHvNMLbhpdRgGFspjNin8tuDsMAwslMecUQu8VjU7DAML5SWPUzWDLCOMxw7DwEJ5nuKrGCsWyKZonwVWAhHup5m5nxYwWmQY3rFQHvl0nn1UDbYMDsPAQnnM5bTgfs9hEFg4m2bmbFpw9+QwDCyUx8xMC25yHIaBhfKSf6kehMDwMTsMAwvlMcvSAm8+zQ7DwEJ5KZtXLRB4dmPbHtWPhS/JPhydflEKBBfJDsM7FsojWbvso3iw+q6cSNI/b9suu02yQiRGJFvjw+6hMiKdsAhNJh9SvShfcL2fcVhNQpVuKirrH9fOVboufdhru0heT8yJtEDSm/jzvFqTT+VmYUU6rjfbRPyYY4Q5jXypbY6OI9LozIm07DBbVE6kExah5ZSzq2n04u2btBOrsnZpv8AcPUesNFfNlj0AV51V3q4zGjHFMjMSfu1urjJ3ndEI2TMzEn6kbu40I9lBgOjP1xVtUWn4bbn4c+9oZ6URwifpu+z7lNjT7OddNGIQYM6ktfg29rWn2c97aIQ1aWbWpBUMMBHmNCdjTfQgkQ7NvEn4fTM7LilKc0YjJnFmTlohw+XcaU6ahTnpuN4Mafi1qwjrqjQxwTNz0oor4E5zkh3rcN246yh3JPuEKBxcBVguTT5hrwyJszAqHdfbKoNXtCKsg0SMAMy0hF+dstOirpII/SfLUvXistUXHIdX6bz0VCMMTHZAZK3VVhhkmMowWF0IA5MdELHAsDxyGAYWS3NmWcJPG80Ow8BC1cyktOJjAodhYDGdM1/Sio8JqixeJ6OS8CXNyW9ULdRXXJAGWO77eqElsnrNnq+riLLCe3AR1kUjZnPmV1rx2N9h2BpCvcyitK6gK4dhYKFYtxuVFQOpCOauPF+zyPN1XG/1iufSXYm+7KyVD9XMrbTiiW/lVioO0uqhWpiVZnchldUFpu4Iy/1IzQfReUQWBO5IqkhgKxhgHSRC38zEtIJvfK5MTLq6xCzNPEz4FZm59jDJ6hJz9NWZVC4q7avOWF/lJC1ffLIDbNG/wvWmE2/wmer4c2+VExYh9JTuq2raDT4uPVdmphMWoXrmZdrwuLryMp2wiGU68zJtuBtwWDtoLcK+dFxvmwLW/xmGgfk0vZAvJg4brPgzDAPzadqeMZDOA2m8MgwDcxkvzLG0wRFzhmFgLt2FJeva4AW8DMPAXK4L+WjigB/syTAMzAVqj1tIHcMyOsMwMNekrU9J4DkPU8d2k8FsC503v9UMs0SfEg7+x/W2b4O5PcOwFFyNC/MvbXAkmmEQOBqQyB3H6+0dwxJ0cRgGFmpk/qUNlqB2PJmaBwMLNTL/0gaLTnvMJgMLNboxqZiYN3CqLA7DOxZqdGNSFbh9hmvP7+QdCzW6MakK3M6di8PwjoUakzGpyvtk36pvXTtLxmFooUfmYNrAmGHPHGVl8GlxcWtSWRngRsgwvGOhPbcmlYEhEYM9zFR3LBxMC3MwbZB7IcPgjoWByR5/plup7rjdcGQYBhbac2NSGRhyLSwOw8BCe8mXZLS+/Bq2S7t3XxyGgYX2kiupCrzDws+e68rGE9rzjxwWd7zDWm9xGN6x0J5bkqrAWBXXCRMDC+W5JakMDOkSljpjlXx12p5YW5WRGYX5mHbIWBV/7m0tXzxZRMaq43ozb+HHiyKsg0U4nOzhOQppx5VfgPWwiKmS2Z12XAZWGat0jUXzEmkXNzXlWx12OHRdAszLop8iLNHKxGiCwtuGARPC8fMAg+4brUws8FWi+faGHbwC5h5QSo5WJhY4KLy9Y/AKLFViKpnZdom+JsZy1Wt5+2AciD/36j9pZKHxZH6qn+PtuJ7LOKx/oWu3P5UFKD4AnhbSDsPAYn5lCah2XNA5DAILl5T5PWLDNpWBK7qMw9BCsskA1YZunStLxmFoMce6BaqsZ/AIL1V2KZ3hwrwpVgmkP7ohqqSBp/zx594fdbqRJdqgGM1VjhVN68ONP++iEbOxm6UqGljxBFgXjZibk3WqaXY4QjTfzrXnYbML5SaPVRsa5v2Mw9BCuW6fKsq+g+t1CbBcOXrij6Yp1tTXBXARZQcLwRJ+nmlkhs9FOLCO6+1wDQeGEdZFIxTuRqviZi+QjGupkkud6CPaq0ilJdtVOekOF3jNcgmwrtIItbsJq4iCH9Ex91YnTVA1Kw1RO35Gx7K+dNIItbtBqyzNAFIJsK5KE2pPrq5akhdIWGqvWUi1CyuXubbiT6pWveCSr7JyyTNcO6cSzRGuN1K54DFglVJKr2yie4s1OtH9BVKIL27+gnFL+LgW5uO64BTlMAwstM2SSF3gpfvFYRhYzN3JrFWnObzACy1LxmFooeDk0Kp7DHjnlsqgJZPgLMKfdVxvewweolT+LGkxXKINi/QYZs/C7+HEn7t+T1iEfJk764LHK5U7Sz8EX4Q767jeVhk8i4swL8zJek3kilquOaDKraYlh4SD7IzDriUW4MSRZZFhjdb3TcVFGLKO63U9jffwcnyGwe0LC5ZZU2GUs8D56D5tTByGgYWaielqvMfh32EYWGg55YCqhgmLDLuHjMPQYgZO1qo2NNbGMVMbDkOLWZfYqSxxaGunWhyGgYVQyfcQLTAcYzsMA4s1NbFNjffwcvbiMAwsJlaS3ckCw4n+1VGF3/hbhDvquN6qBF4DuMLIu6eLsEcd1yEybJGSPYpGFtOpG5/yamvET6CYA7tcjuWBq360Fs1OZM5wE1RFAv06wIph1vPFNCRCmMQ3Nd6D02ipfVOyJEKixDVlJCD+TtfUIlxTx/W2vcF1FGFeYXqSja4n1izH2res9RG/U7JUSZ5OWISQ3RqV23a8B0f/UiV5OmERqiZ2KmOBebCyU52wiNnWUzlVZUEdlttkzSIMVQsxVI3lXjtNipWh6oRFKJ84qowFaizAOvqYsFQtxFJlaZ5h4nEYDOPRLkU6L7FRWWC8/TBaBCVhYCFxYp2ywDBYOQwDizk42aXCk0Ov0BG/B7JkHIYWszBJ+GSR8Z7t5059cuAhEj4txCM14kdAIqyLRmg5maTCw3oPYzzYtvZ7B5wVR6g5+Z+qM4LREnr6xHMVWilnzbMK19RxvRnNLaFhQ5NhbbOvIs/TcR0Ct2cpGYaB+erZ3oPBZbllEIM7vsIwMJ+kV+KasnzseRY+apzBtKNnjY4pHCKO6231wHqMwc7IuLrtnR5SZZBCO8Owyri2V+KuGvGrKBFWiKE4t6iWT2v0VLHKwlMto2mHkPjzLhqubXsniVQTrNIirIuGS3slnqsRP4wSYT00YYggZ6ZrvN72MHjeE2FdNHyqtjesSKWBoyfCumiE6sPGszlyHM0h2Kq+2p/qQ5c1mq1IT3MTVh68jabdMsafd5WGz+P2vhgpDawII8xp5KHbGn1YrDBM9mB+jz/vYRFjgCebKqsMzqlWh8HgEi1Z7PYP1VtV+d2NAzz3Wav3isrsefXYEm1cjIWJHh772Kt3qcXw9oXM3bdV3D5+dWV1GAQW9q6V2LtGO+VppeAwDCykTOxdFhjWAg7DwEK87tuqqgJU5TAMLKbsa9qpchE04qda7I3G2HpW1xhaSPTq3KpWxLYCg2pOUr4nocV0fPVuNaGxPpJ+WWghRmLysu+wtFsae/VS9eZo5iIyISYvCwzLucrkJfd99k6m8TOWq8rKjgJHgfHnPiacjPLC5LV6SqqKBjt6UHaYQaHTCF/XSnxd4whvOmYYBhbSJFausXySntamDsPAQprJvVUNsiOuQx2GgYU0U0oqo/WWsjtujyPWAHOAepVoFd6t43qzxhkhVUiEdZAIuaZUVXUVQXYPe222qyRCuJ62KtfGOIKlaA2wjpLw467VU1jlGEYC/T7AnES+iLtGRxYRcXJq1fWFC88A62ER06vbtnIQG49gGxhgziL7l3B6rcnBVXfiYvuSZBdgBUlxYF+vQaJri9RYcnPVNQaZ9FYCk8/u12j3YlxhIGglA0ee8edepBMWoX7iAhvxOzdrgPWwWM2w6SLlyKoW/UYDG8OAcxr9jHSNbi9WZ8dE3PBA1vj4e+fRwokuLkZznZXzzY4jnHqu4efOctI0YhAgSbfGCVd5AeYs0ryxRg8YKwuZyad7WC9U3rATFjEIeJ6tfKvjBIYde6e+KIs0v67CGXZcbyRj3/tuV4Lh515jJyxiiifGsHGCVBz2Gn/BcrL2EcawlRjDjAbWnpUxTDdM9H+R5ie+sNG+3wxVFoYPy2xelsnOt/IqoR4/Y2YuxhbGh7aB4CU/S1TQWXViIUDsYVYorLo0WtSFKubyplBiRUByfxlbrpo091S5v876gxgOiGNsnCBthmVfgCo+OW0WxrE15faq5tMJF4WVcUyPo8I4trojLMtxnOAVwQhzvWoW4SJb3R5WsUD7BFgPixgV3CuWg9g3ImEXGmDOosee6A8jAkq+sbpdcMkWYD0sYlFArGbjhKupBOsdFITlbI3X20EBLGdXWDebGBuI9Wy07zO1A16CdbOJsYFY0IwNZleDwX5N2M3WeL2tLlziOAwDiz09Sf9lW2LYdDgMA4vJn9nL8Fs4lhCFzTFyOBY2s5Xk/RrtSxRtAwdYh0SE52x1M1kOYt9qhXkzwHpYwlqfyN2dZTmIscCCJsGazqprTsiefJnQ2KADXE1pZdHsW2S57PW0GQ1prGxpLVC2g9FhQ5WLAT36R9cZozkm+XJAHC1zP3SHKwx6tcj7tSY3Wv3gd4YHzAUOQ4up3v1oZbPjMqnK9mUpmb1MTQMIvTMPm2Xl9ihp3VJl+zphEeJP2b7KRrTzMGzlcuV/smAR5jZLFQTLntFSM7eFCTDX4xmNmOWZ023GI6bK6abrTFjdVmZ1m4vFdmqZyuqmH6hETxtRBvO6WapKqLK+rX80tTGWJPOi3u1r03mwuJal7CB6ryy8bivJEGYsrdkjwrz5T1jEbO6Zv3IfMhY4xXAYCD7a2Fgl4aJ9tHRy0BRXGAYWGmeONsuTBoGvhwAYWMiamdgsUxgELmWtK1yY2FZmYrOkVi1LZWI7YRGiZia2Gb7Vt1YmthMWMZe7O63oPPj1AsuvVSjlhEXM4czRhp8yWKvEYCcsQbykv7pvrSwLfBturTKD6WEwetUYy3VOLlnAkLaGn7uoT1iEqJntDb8fYBnJ+ljElM5cb5iaf60yg+nFTjS3sRpLOi6XZvaYBabBawYx9KWv0c/GQoeBwLYd5QRqoWEiD7/31pAl2ITN7bje7G4wb/8V1rnitURvtB8f14GtHV8izMukj2428cXD4zrQtDNthrWj8BYdb9gox3UI3I7CGYaBucAtZx0upzDTfIZh4KBddsdM08Xe4VgO2Dlm0YvOapyL2rLhkfuH05gI84aVQ8cm7G7H9bb6YQUVYc5yIgk+h1vOvViWcoE0Yjr+DMO24HP4xvxt9vZOM7teYY3WiuVotd3YhM3tuN5WFhzzXGHdbELZ4fftSfMCOZs2h0GlRR8b6cDxelsMWFFtDsPAfObekqOtbmZYUUWYdyY5c1vaQ64/ZmhbYEUVf97DIlTuCcfyVDCao7vtWQHWwyJE7k61HMSexLfL8S3AnEWLXLjbNk9EloOMmK4+wnpYhMjdtlaxwEyUYI06ivGz0aJQvnvZKjZsn2PO72UTPrjNDW4lG6wWI8xrUPdskfNsc7dbxQJlchgIM7raiOKvbrdqUYXJ17eMw9BC857OrLznCXqwwzCwkHn+FmMZuTgiSvNsxmFooe3rtxjLfYp5U2DaCLie5hTidudbDjJizu8twJxFi1u45SwlKk4TmMA8wnpYhLhJRjQrS3sGsgVYD4sQdTLLhSHCoxgNNoz93gH6DMyyuvIphHnn1hU6bYB10YgZ3C1yOcpox+7tHFInRSuO4uqRMPriiLiTX67uzPCoawuwojAFoKERQmcmOzvmg8LYz7tohOw991mOMtqhF9CUi4yT1bVImLYlo11ZJ0YDQy2B6XdiNpE37bjeLLjsYAjKFMaRGnZGxrfpGzPe2TEGkF2HDRg1hdduS167uspwReQwDCxUz+x1mNh8cxgEFpa6jVnqMJd5hmFgIWzijjM/IIwfDsPAVotsb0kSp422EG8bz2EYWKiXmeQ2yFyxOQwDC736tyMLvW7wUczNYRhYTNIkHdpoCxSoinKOLktUj2rCB7elLGdVp97gCViE+aim97/R70aGaOaDs7kSymKa7GERczTJkTbasA8s5ex6UhahVuaDs0EHWMopWrMIH9wWr9dj4WhCbVkqH9wJi9Ax88GZBoClXDefsAhRMxvcBl+v3GobXKHNuicLG9zGbHAbZM2MMO9j0r1jWc75ABWvt+0CGTTjz3tYhPaZ+22DlzC3KjnaSVnE+py53jZ4B3OrXG8nLGI+Jm62cQMjvGV/L7R/wiK0z9xumOzc6rBgOVk2CbvbdrW7leMlrGcZyNwVGVd3aGF6s7T1sBwaN3gNM8K8q50UKbrbyNjMXG8bfBvI+kVfzQnb28Zsbxs8H42wrtKIeZ753rYdVn9VirWzShPDADO8bbh8dhjM+iKt2sa8bRseIQZYVzUJ6TNT2wYOtK3Kq6bPc4TPbXMDW77XcQOTfYR1FUZoP6dLK3h2yPO5BZzznJRGTPzEA2evksMjIIdBmwu7mw1TKHRMQx9hfvsnm37hd9uY320HV12G4f2L+Z1Z3HYw0m0B5vdvG7ssyno8jOY0MlAxb9uOe4MAcxo9kQhP25aSr5X3Ou5gaYuwHhYxwXuCtXyrIyalt29q9JVFqNyzrVUssLwLsJ6yiAmeWd123EJUVreTdhEiZ1a3fYTnpJXV7YRFaJx82NJepcozdzpzdRhoRJjbNmZu2yc41nEYBhZLeGZn2/H8OcGa5wDyCaCwtW3M1rbjmXRla9MjrbC1bczWtoMTMMK8356wiDmc5XDbcTyvcridsAilJ1tb/T7bDu9h2Ddj4iTQ3UBC8sm41tAtsAnOOOxpQucpgVsbGibAKoObfJ1pi742Mswnv1tDU6yekwarFG4nNELpyf3W0uRJ6UpT7uM1jbC/bcn+1tLAcUHlfzuhEaNA8r81NODRtCVeMdSf0IiZPhngWhqYUSoH3AmNWMQnB1xLAz2tssCd0IgBgFngdrQzVBY4PQAIC5ytd8nqDnckDgM9iu9hbsz1tuMexGEYWAidGd12SNNin3Yq+pKeaoXRbbsa2IogIybnjzAf5E9YhMyv37Ysn2QZDczofZ4321RYY+KgdVxvjoUu8KJvhHlh9LbTPm4laMJ1oGkHk+PnAdY2+S7sbcf1NjAs4a+wzklqF5634/qru3LZOeInBiKsq7a4vm0LFWur3PUZDdbWAWsKVTzbrbYne0zwxroA0Tl+aOD4ObyGq9n4PL8zd9wF3mCOsK4q5EOBbQ9Jh4M3mCOsoCnMSE3d8cX9zrLBXeAV5ghzGnkOvUdTHGuhMEa0nRzW4PHnHSzCJGcbX8ICJ/cR1sMiRoLQW6Es4ODYq06tayzMtGxYi9ets9ajJ2QztF14MYqf0PD53r4sRwoDh+oR1lNlYjhgvjn8xsUeYM4iJ5xdJII7rredbG3X3xHWwyLkz3xzF7Ct2sf0YsVWvUC/82/HHKIbsFEA0lAfP4ehTe0x92iEIzJlPrrLhjUYxpL/AhtfIOzMR3cBB22GwZQqLHN2mkM6NbxplGEYWEjf7W+5m44XOEnfHYaBhdqv7rei/1vgdke0J1jTqeQMFp1vpJndEVcVA2bnAOsQSnTBMZZjci/Hp/EC1hP7UmMfC9/k22kXaWtYMV9h3TUnxM98dZdLexS2J1g3mxA/8ddN+M2SPcEaNil+kZXOPmYJNWls7c7vCutmE+InyemMDWvyWDj0sgnX3X513ZWz6XQ/QOEq252eTaO7jnR54rozFiiUw2B8EEa7PRntqtXAdA+WlAKHocUKgJjrpnt4XXqvMtjpuVmksLMvjZLOBa9LR1jHkCOsdXaqy1hgYAswZ9GPc3Zhqjuu1wsNSy0F02Sdxa78fEC9NI+2OdabcO6f7sFWsVd57E5aRmwA3DSXq8RYYOoJsKLOlIdzj1Y5VhjcARgNSsNgTiNPfHZhuzuuty2DS8Aqk90Ji1gGJHNdObNN92AVtsP5vrKINYE77XKFGEvr3NoDrKfGhPzddpeDWAKz9pBmdxiMK9FeRxrcbXdVYOhXDsPAYsYn7jy7YxC5wzCwmNyJIW+6h0TS9pyir8LFpJ4MeeWqZ7rHBUuVmE6rWiSmsz5NRsILDFFVYroTFjGJE0OelaV9tGaPXIoa0yzCkLcTQ96EHzBhMD2DR/sd6bVXW14pXSODbnvFFQU7IRMKv7rzqlWJnU02JsD9iusjE0InJr1pwHPGBGsWXHKLIcx6OzHrGVv7tOIK62YTQwIx7RkbrO4SrGErJqF6Xo4mPdZHjq19Oe4aG0xllXnv5MQ5uvQYDZn+B1zyuckPxrlozGOBydiA33bZ3deHgcVwcHXfFf10wo+57A6DwMKPtxM/ngWG3hRgPhWe1Ljw4+3Ej2c00I0qP54ezoQdbyd2PGOB7kNgeoSJ3jvS1MSTN+HHXnaHYYuEdTsLTNbzAzzB35MLr1dxwpq3E2ueFQOr7Fj+d7OJdQBx6E0DPMffHYaVJqZ+YsqzwDBdOgwDizW8Z5XL3d8Cw1Kxz4W3Rxsda/Mg+2ZxPeDiOvzcVagX18KStxNL3jTg+WqA9bCIJTxx5FlG3dbkv1cZ6E7KIiZ4Ys8zFhi3KnveCYuY2Yk7bxrgvbW9z523C3fecb1tfUhCHWHeLnpwFAnnduLOs7KA0hOsUbpcpYgsdDtx6U0DrpITrJtNyJ+49YwN5F+59U56gxgLiFvPWLAGr4sAGGTEt1XNnnHIv1oa25dm29VqwHkP0FOWsOvt7sPLQSb7wGfL4jC4/+i3I8PX1YdXDhwWGWom4zC00Dnx5lnmbNht9XnzduHNO643CrTM6VAzNkx4/WsFipRzO/HmTSN4SiOsh0Ws2EnKOWOBGSvAeljETH612llf9yiWbBy6bMA54ORAUGSgM+sPzoyWvxhaxmBdNELaJB+dlQY7gJR2dN4xaZCZ3fJ8wv2Xyj6pJuHI25MjLzwe82qwt3OAJ+NAgdFtR0qQXHhtaGjpjMPQQtzX1HOlrOyu4Ugg4zC0mLmv+eaa0DAlZByGFgv0q8OuCQ19MuMwtNDu1S/XhIZji4zD0EKwV8dcExrGhYzD0GL2vVrrmtCgnozD0EKXVz9dHRpXkxnnoV9+++3h4elPb5/e/vzTu8fP7z88fXj8/Pbjnx+/fnr79PTh868vvv3n14dfXt29Hn58M9wZ6Jd///3jw4unf3x5eHX3/vcvHz+8e/v08B9vP/7+8O3uxfu///Kv71/d2RT35euHx68fnv7x6s7O+AIdjf4cqR3R38RpTwG+g3O9idMO9W/lfGMH6zdx2pOkWzlf23z34xv75yZiOx7+DuI5EM+3EU/fQbzeG7Gd0tzUjQ9P5W3d+BKIbVq5ifhIL38TsSUA//GN/XMTsR373tzGc6hq++cmYnuieDPxMmw/vrF/biK2w+fbiTeT02Jb6Zva+MjleUsbv1ntWPkWTnuifmth36x2YncLp7XLd3De1o3NCfcdnLfVrVkEb+V8HT6lcEvd2lOuWzmtPW/jNF/I7Zw3asXcK9/BeVu/NV/OrZyv7RsCP74JHxK4pVHt2ePtxPvFiG3PdQux+S1uJX4TEvzewmmerO/gvK2cNjfezml+qFvKaabn7+Dcb+I0d913cN5Wt2YMvJ3TjsFuqtvvGJHCm5g3cd4u0jfhxZqbOL9jFAyvx9zCabbSm9szvP1yE+ftM+mbYIK/hfM7hqHghL+F8jvUGdz0t1B+hziDEfwWStvz3d6BzGl9E+ftg+3rYKS+hdO8X99Rzts4rUm+g/O2Xvs944FNSLdU7XfV7G3T2Pd0WttR3lJKO0e+tTFfB1PTLZzmhLyV882tnPamzHdw3jYg3D4evAl+kluq9nukad6TWyhv70BvwkPwmyi/Z968cX9kc9/NHcg883Yqd+O6xMz1NxMvs23MlluPbW6X6etw4Hs/vXhtJX/xer/YXZi1dF+29cXrebUD/uV+sb+GxY7ulovBLnZtHsIPwn+d9nBttP86xf86TvbXGMPZmZs9cH5h51+7RdnDX/v04s06beGfi/0zW11bnvHwl4Htg9b212JnhOuNI6TV3q31/9o+qWR3eeup6HfU/zKE6rGyvw5d4LV1AftrCTezDfbXZhW6bFv4a7f/atVo/4RTxX0Mf1lNL3uoxsnaK1St/WPx7J/wl7XNOocKnQ0Xqtv+sfCWpixcC7+wird/Ajj0P/vH/rImsH/CL5YQebF+YeeJ4Z/ws9V47ajPIGu4tsZrIcAW2nAPf4WTbfvs0IvXtukP/1g/sXTA4S8roH0PxP4awrXBbnez4ts/ATzazywzkv0VSmnJhcL/NHLbgoV/jMhSGVgfvbc7sGwA4X/aTdrG5Uf7xyD2ertdG8Jfw2rXBqO0NzXtmnVDW7eFn4X+aa/3hb/C3W/hTkM9r3ZSa/+EQm+h0FuIEgq9h0KbGdH+WgNRKLTZ7OxaANt7bnZttLu317ns2hI4bu29p8Pzl7e/Pvzvt19//fD524uPD7/Ys+r7H4Lj6OuHX3/z//H0+MVegb178ZfHp6fHT/HP3x7evn/4GtAG/uXx8en6P0wpx3/7c7wYhPPH49e/xmd/P/9/UEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAARAAAAeGwvZXh0ZXJuYWxMaW5rcy9QSwMEFAAAAAgAh07iQMAkH8GaHQAA/uEAACIAAAB4bC9leHRlcm5hbExpbmtzL2V4dGVybmFsTGluazEueG1slZ1fdxNHnobv95z9Dr3M2V3mAlD9bXt2MrP+m3jGxoptyMze9BF2AzoIySvJDOwVBCcYnADZQJIJhMBsAs4sAXZCCMGQfJixZBuLw1fYagkbdffb5iVXQfWoJfev3urqp6tbv/7t8aMl71hYrRUr5Td2iN25HV5Ynq7MFMuH3tixb2p4V88Or1YvlGcKpUo5fGPHibC247e/+cd/+HV4vB5Wy4XSaLF8xHMbKdfe2HG4Xp/91Z49tenD4dFCbXdlNiy7loOV6tFC3f2zemhPbbYaFmZqh8OwfrS0R+Zyds/RQrG84zdb2+uvVF5s71dVZouVgweL0+FgZXruaFiudzZZDUuFuvuDaoeLs7UdXvVXxZk3dlRHZoT7nPZn7y0cDWtd/+8dK5QcEdbcRnbsSTU8/W5+sG+qD7S0Fr+KWjzUdPqL1rv3WtfnN259AZobXz5avXGyefle88M7oHky2kUyq0GAhneGRt58awo0uL3cs/HefE/ryiXQ+ouJoWHw8kC1Uqt5A4cL1UOhN1yphtOFWh1wY2ONhW9Wr5z7++nlxvkvV366sfL41Oql5eYnP66f+aJ55eHzJw+eP3n4/PFH6L3jU+Pg5b2+6N25d+CXoMl9kRnw8tTkmPVzvW+Cpqfff7vx7n1vtliq1L1a4ehsCRX42UdXW7dOgrd7k/vGxvom/rgzvzv/L+7d/za5e3x3Hn21/vEx8P53dj37bL515eLTe2jrYvfGdyef/u3Jxt8uta7Og7c/+3ypdXXJdb9nn3+4c2PxR1dC9Nmuk7X+dt/1xdb1U2ArU+NTfaNef9/A772Mbrz/be+t/H6veffS2k+nwRb68l5OBH3T05W5cr3m5QsnCgdK4S7UDSffHLMytysnPW94GnaZF5kJwOe0e13Q6XXBNr2uU9WgXdUgs6rBVvGCF8ULxgNYPBG8ohDtXRhEuzDI3IWB24XBNrsw6NqFAbULgyBrF167+PThgutXG989BLux9e7t1icftW640ecyaO7bJXK5qM9cvwpa86PgxbG3glZ7PANtrVvzzz452+5a3k6J+md+v/XUbjPqjf7BeG+O/UH4ObSdLx5v3PssisOPKAsDrhMOD0xORZHc9ebY3j6widGJHBozR48Jb3+hNBd6Y+OD4G1T0ShX9wYqtfoBd/ipASTX/g80DIzvH5oArw+G7lA3XWwfh0DzSPlYWKtHhyxvpDw7VwfIWKVcD72BQrVUyWT2V0rukJXZPDAWTITHgqxPyFcrh6qFo679YAV8gcl6dW66s1syP2Fy7ujRQvUEePdUWD1adBOEzp4HgBtxW9cvtq59jdquX3Xdd+PByY3bDzfuRf8DoIHBXZlj3uYgg4YoMHogLGP4QGh8/EBEYgBBSCdH7fElyMxRoAIzGrgcBZk5cr09aPf2APd2F6QgClL092UFqZOIYLtEvOzBmf2r3YODdg/OZDo9OLO50wfbXyST2expnb8adJR2/0epbi1ebc1/9WzhduvaRfC+wWpl1hus/Klc83YeLs6EaGxb/el889OvV+/cWL34/tr9H1cvLVmwpd/17c2hMW8qD+DJylx1OvQGC/UCaN1fqBYL7igMmka9obfBy52hr89l8UStWPN2ee3JpQf7YGc+G6BRFMQGYRmxQWgiFAiJJwsR+9/uOvCiv2lrRtI5nCLEJQIenBGbiClC3PEumVOExYKKgGQKEZNKM4KSWUVMKqwI6k4rak/FFUHxvCIiCl7QDl6QGbzxiZE3R/aC7h7gM5p2ZwO42P3iMOiNu/PgY8XwTwDSuwfDWvFQuX0OkK+G7i0z/XPF0gxgRW53Pt/XmXHmo/MOwGwenhRoAzlDWEbOEBoPESISSURILGcoiImcISQrZ4hN5AwhIGcIS0UEQbEwIiAZRsQkc4aYVM4Q1J0z1J7KGYLiOUNEKmcojJ25xObhI9gVtA8fAUI7R64g48i12ekFeivo9ZDL6PaQjfd7iCQ6PmRiPV+gw3ii60Mmq+9DONH5IQN6P+RiPRsSya4NoVSKIJVMAIRSEYBUdwYgkAoBpOIpgEhXt+0FA3IqJQjKSglioeZAYNcXQ5nJ+kzEws9E4GZKNdgTIKQIy8goQuMRRUQioQiJBRQduxL5REhWPBGbSCdCQDgRFssmApLRREwqmQhKBhMxqVwiqDuWqD2VSgTFQ4mIrq5PHbkQlJUPxMJ8IHAzH4bLB8Iy8oHQeD4QkcgHQmL5QAFK5AMhWflAbCIfCAH5QFgsHwhI5gMxqXwgKJkPxKTygaDufKD2VD4QFM8HIrrygeKTOmYhKCsfiIX5QOBmPpAGAccPhGXkA6HxfCAikQ+ExPKBApTIB0Ky8oHYRD4QAvKBsFg+EJDMB2JS+UBQMh+ISeUDQd35QO2pfCAong9EdOUDxSeVDwRl5QOxMB8I3MxHD3f8QFhGPhAazwciEvlASCwfPvjeiXwgJCsfiE3kAyEgHwiL5QMByXwgJpUPBCXzgZhUPhDUnQ/UnsoHguL5QERXPtCQmMoHgrLygViYDwRu5gN9aXD8QFhGPhAazwciEvlASCwf6G9K5AMhWflAbCIfCAH5QFgsHwhI5gMxqXwgKJkPxKTygaDufKD2VD4QFM8HIrrygQ4vqXwgKCsfiIX5QOBmPpAvAPlAWEY+EBrPByIS+UBILB/oAJPIB0Ky8oHYRD4QAvKBsFg+EJDMB2JS+UBQMh+ISeUDQd35QO2pfCAong9EdOUDDYmpfCAoKx+IhflA4GY+oOkDAYFcRkIgG48IRBIZgUwsJChFiZAgJCskiE2EBCEgJAiLhQQByZAgJhUSBCVDgphUSBDUHRLUngoJguIhQURXSFCGUiFBUFZIEAtDgsCtkCDDhUKCuKyQIDYREoQkQ4KYWEjgxZpESiCTFRMIJ3ICGRAUyMWSAolkVCCUygqkkmGBUCotkOqOCwRSeYFUPDAQ6UoMHCVTkYFUVmYgDEMDya3UIO+FUoO4rNQgNpEahCRTg5h4alCukqlBTGZqEJxMDWJQahAXTw0iUqlBUDo1iEqlBkHp1CAqlhoEpFODqERqENKdGnRNL50aRGWmBsE4NYicPuyWge6a3XWgcnRXNTwmd7oFnc8u3G59/s0vgUqaCoulaOlssRZ6O/urbv1srVQ4Vnglmo/W9lfKEFxbPrfy+PP1K++v3p8HHzm67+2c8kDD2pObjWuLzbtXonsczp9pXPiscW4JcAP5gcHwIGiohdViWPNmq8Vpd0MNAEbcvTZu/e5kvVAPo8XAAHn68F7r8gJoyJfcMsCsVYLutgO3QryzmLr11UetT78FW4ju/fgn8PrQ8enDhfKhEDQ1Pvik8cPXzS8uNj/588rPN5qn7q7dudd4chmgItdjc705nUOdYu3MX5tXz4J39fUPNC6cW//rB2t3T63f+HH1SubdMWikc+9+/viD7ne7f/b1r936b/BRA4XZfy1lrmzuGx318n0TU5NefmJkYMgbHZmcAhsZRucgw2jONYrIUUS6kQp80vPHl91dNs8ff9K8utBY+Hr1z4/WT55aWX7g7iEC9OTc7GypGFa9kZmwUAPAcLE27VZnT4bu3izQ3F+YPlKqoD774o0jbnV6tVipojf3TdeLbn072KyLCnh1JLovJ+r/4YxXdivx+8rluUKp+F/hDIA7nw8aJvG2o7/fG4q+Ldxc4+yHa/MPweZyauyPzcv3V558HC3wXVoEyGgAF9y2BxR0f0tnPAheNR4E240H7dhnLbHKWHk15m7ecl0ho3WqcAD8bVuTHQ0a0WQHcVmTHcQmJjsISU52EBOf7Cjw5ZOTHcRkTnYQnJzsIAZNdhCXnqUgKj4lQkRqSoSg1GQHQenJDqJikx0EpCc7iEpMdhCSnsy8akqE2jMnOwjGkx1Edk1fAn76EuzcbvrSSW9W5Ccmf6F63d1J7q6pp99fBN19GB1/B8YHhwC7FXpknlHoEZcVesQmQo+QZOgREw89GhaSoUdMZugRjAKNuOTggJh4nBGRHhYQlQo9glKhR1A69IiKhR4B6dAjKhF6hHSf4XCDAqJwjhGZOTwgOCv0KHgxdiv1iOyKPWqW0nijhbqXfQceyHdz6Ubzi59Bw6S709tNvkYr0+07Fj03J4B3Sg/k93n5zumMu5FoqHwIzRA7Dwyoznj1Iryffrx+2M1GopvLauCrRLMUr6/m7sWfbd/ED5DpirtVw2vfyg9aRwsH3B1U3oQ7p0LbnwgPuqlgeRo2upmXe6BA+ZCbgnZulwLbfxkg0OhuqgOvNi5+uHrrXucuMdC8PzxcnC7BLxRNMVH5O3NM1BKfZCKic9b5cpaJmJfTTNTavgUA5jR6bgEaoTtPOmg+QkeofrBLVpe/XLtzAzTsmxwEr+7vG903BF6Pdh86Tnd2H2qJ7z5EJHcfYl7uPtQqgs1bb7e75yh4nXuOglfec9T46kzzuyWwj9z9TDOh6/Tw9Kg9EHrvFEpHwDuHi+Vo/Nnt9RecrnFPCWnfLemND3h7B4YR3x+dVb+4LR+0tzczCN/abnLPKKgc9Ib+c65YPwHe3mnw2jdpua9cheem7o7qWQ+8uX27mbvJ03vFh3RuCI1A/EXX7t5vfnYefMBEeMgbDOuFYgk0Nm++u3bzVOZ738m7t7oSFbNGRPfwjcatxczHiURz5hl3Iyv45E3Z0x4vQXuvzXx+hZst4idO5PP/7B5a4R5/Arb37PJnG+9+tnHj6rP3v28tXgfE1iQUrctAk1DEZU1CEZuYhCIkOQlFTHwSigbBzAkmgpMzVsQkJ5eIQRNVxKWnmIiKT1URkZqEIujlMbRzW7dAUHoSiqjYJBQB6UkoohKTUIR0T0LRwS99ZoooPAlFZOYkFMGxiWWXOEfHnxi7NQlFZNckFDVvRRW5TRRVxGVFFbGJqCIkGVXExKOKwpwZVQQno4qYZFQRg6KKuHRUERWPKiJSUUVQKqoISkcVUbGoIiAdVUQlooqQ7qiiKKejiigcVURmRhXBsfh1RfWV55ZbUUVkV1RR89RAHzjWNh6fbFz4aPX/lt2FLtC8fuXB+ukld5Ehmzi9tP7pUmPh07UbcG45Obl2/39WlpcbC++7C0fgI3pzzb/+ZW3p/OrSz0Hj7s31z68AaGucgZdLomeVJZ8aJVCvQCMS2mLWiITYxIiEkOSIhJj4iITGrMwRCcHJEQkxyREJMWhEQlx6REJUfERCRGpEQlBqREJQekRCVGxEQkB6REJUYkRCSHrEQT20e9xC7dH5LEp35viDNpI+/UTn+Drr/BPBIpc4AUVQ1rj3yunM1riHyM0rncH2VzqDrCudneuJbhpaz7ye2XV9MnDXJ4Ntr0+2v0aQfcGxfdk582FG7gQ5aF92DtqXnYOMy84df4F6QtxfICLpLxDz0l+gVuceA+ceg2z32HUwgjVr68ZgUzcG2+hGp0raqyfcgydeoRuD7XRj+xFSNXBoiXRjQOjGYHvdGGTpxk2j6DpNplF0asCFLUMNvJN3bdud+3eyn61oojIFQSRQAqdo2s/VCcYHgm0UzebxD+yu9maw+Wg3uWcgVg4Gr1A0QVvRBFmKxj0ybBZdPt9UNMErPqTz6CCnaAL8RTeVR7tm4G9cebjYXDy7fvJsc/Eb0Nx473bj8QXU8ORjt5pg9fy91XMPUPOF041z11cePWp8fGPtuzNuBU3j0f8CLhrjUWg6mUct8cwjIpl5xLzMPGpNHzTQCWHmQQPBqYMGgl5mAx1S4uFAxNrSgnsgLdjNY2GtVjgUjhbhU0obCw/WT15f+/mMW/nx9sTASOPCvbX7N8Fm3NOOfwde7t87CF7NTwxNDu2dAi3Rop47X+5cu7nYOPX53099iha8rZ79pvn9qc5T5tb/Mr96J5p07+zTiF2/dLJx6Q7Hdj+97lXbfbHoq/2kuxiLnOrq9Uvu7KL7Szg1urr8vvvafei40tnpzYWLzau3tzYOyd+5x14WwW4cnpsseBNhya35cc/OrJQPFg8BauXhsrOtK49uNT4+1fjw8sqTDzuf6U5Smtcu4jOZ9cs/uK7UuPuTe8Qr2GRUv0c3m+fm8btXnpxvnF/MbFa9Ynfj4jzY7uBwH3h1472HrWvzG4tL+MHCjTvX1v/83rFaZx/ucssXmw9Q3+2fqzntHz3o2e2unW7xHOpJ0bPOtp4D+uKIv7MPkZ2DvpeHj5CNRjV0MtwZ1VBLfFRDRHJUQ8zLUQ21pkc11C8zRzUEp0Y1BL0c1dCYFx/VENE1iUSDXnxOjIgXs972pHib9q1ZMWKyp8WQjhbibc6LEYCmvohLzD4R0rmcnZhfItBdz05MMBG1eUG7PcNEQPuKdmeKiZqTc0zEtK9pdyaZqLlzUbszy0TtqWkmgqLR0T0RuD06um+bNTp21vWmh3g0J3MjV4BHrrHJSa9QqoPR6/fuyn9Y9gpzNU/09vYCoq9UOuQWhEaDE2h1J+219gxyuHjcLVrIWkiwtRGwialw+nC54ha4FsOSmwCEAHF71P3sQXXGfYtDhQPRLxocQdiQe8xxvV6ac2sG/iMs1mfcqgN0ma09ih6pHwjdfMGtbj/geMhVSjN/mADfZvWHC42LC/2g5S33iwrT0YPZ3cKMSr2CPnzo7aB/SGjkAvond+6bRIP5gBTa61U5+wuJBk4n89bOPlr74e7qI7SepHMlsvHoY/CFO8falYffNn4+vbo8v7p8ZnX54+Y1dPTbuPXV03unNj442Tp9CmzpnXHwYt6t2QYvP/3h8bPT6IHn4TG38Bh1s3yhGj39OkrJXHQjQqWM5jhuJC9MnwAf2Nu/7zh4eVAeRy/3C4kSO5D1ssiNDaCVJkPwaPFHmYt6R/S0by9jwuuW/NeixwODr5yPWo6hzt/69L2N2/c3Hszjx3hP7Bsdagd1MqzPzYItv5hOeP/u9bkfBgHAWOGEW2cULUaH75/IT6G/t7H4c2PhemeqCjba/dsbzx8vRPS5peePzwJ0UK+fubCy/EPUtKdtALp/OyQa192f9uIHQ6J/dRYljbjfG3G/pFIND7rfFDk8VK1W3G+ZvCxvHBQsKFlQsaBmQcOClgV9FnQ/QMPtx14WdPf2kZt0tyiyJF0cQVdH0OVxV8/Z70kXSNAVEnSJBF0jSdfIDZvk3y7pGkm6RpKukTuKst+TrpGkayTpGkm6RoqukaJrpOgaKbpGiq6Romuk6BopukaKrpGia6TpGmm6RpqukaZrpOkaabpGbr5LJk7TNdJ0jTRdI0PXyNA1MnSNDF0jQ9fI0DUydI0MXSND18jQNbJ0jSxdI0vXyNI1snSNLF0jS9fI0jWydI0sXSP3q1Jk3n26Rj5dI5+ukU/XyKdr5NM18uka+XSNfLpGPXSNeuga9dA16qFr1EPXqIeuUQ9dox66Rj10jXroGvXSNeqla9RL16iXrlEvXaNeuka9dI166Rr10jVyLpQcwdwv+PEoXSXhfj6P/gJ0nUSOLpTI0ZUSObpUIkfXyj20gt8DfLVeRznw1RJ8tV7DOryGdngN7+DWY7I96zXMw2uoB949CF4+RHaW/bN4/SB4/yB4ASF4AyEkXy3eQQheQgjeQgheQwjeQwheRAjeRAheRQjeRQheRgjeRgheRwjeRwheSAjeSAheSQjeSQheSgjeSkSX4dghg/cSghcTgjcTglcTgncTgpcTgrcTgtcTgvcTghcUgjcUglcUgncUgpcUgrcUgtcUgvcUghcVgjcVglcVgncVgpcVgrcV0Y9gs+MA7ysELywEbywErywE7ywELy0Eby0Ery0E7y0ELy4Eby4Ery4E7y4ELy8Eby8Ery8E7y8ELzAEbzAErzAE7zAELzEEbzEErzEE7zEELzIEbzIErzLcwi52eJO8y5DuYZLkoCl5lyFztMuQvMuQvMuQvMuQvMuQvMuQOb5avMuQ/PoJybsMybsMt4SN7i68y5C8y5C8y5C8y5C8y5C8y5C8y5C8y5C8y5C8y3BLgOnC8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8i5D8S5D8S5D8S5D8S5D8S5D8S7D3THGnpop3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mUo3mW4H6qizw15l6F4l6F4l6F4l6F4l6F4l6F4l6F4l6F4l6F5lxH9yCe5LkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLkPzLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPwLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPyLsPnXYbPuwyfdxk+7zJ83mX4vMvweZfh8y7D512Gz7sMn3cZPu8yfN5l+LzL8HmX4fMuw+ddhs+7DJ93GT7vMnzeZfi8y/B5l+HzLsPnXYbPuwyfdxk+7zJ83mX4vMvweZfh8y7D512Gz7sMn3cZPu8yfN5l+LzL8HmX4fMuw+ddhs+7DJ93GX6Gy+j8SPnWD5PvCY/Xw2q5UOqvVI64nzDf/OdosXzkN/8PUEsDBBQAAAAIAIdO4kCoRwOfxB0AACXJAAAiAAAAeGwvZXh0ZXJuYWxMaW5rcy9leHRlcm5hbExpbmsyLnhtbJWdbXMU15XH32/VfocuUrulbEpi7r19W1I2tksaSXhsPWU0gJ03XRM0wCzSjDKSMN5XPAgsG7yIGILAAkOMDbiILYMgIjykavcLJJ/BloQ1rfJX2NPdkpgZ/j36w4sE9/nf2w/n9j3n/O7t4TdvHRsfc44WKpPFcumNXaottcsplA6UR4ulQ2/s2pvra+3Y5UxO5Uuj+bFyqfDGrg8Lk7veevNf/+U3hWNThUopP9ZfLB1xpJPS5Bu7Dk9NTfx69+7JA4cL4/nJtvJEoSSWg+XKeH5K/rNyaPfkRKWQH508XChMjY/t1qmUt3s8XyztenO7v+5yebO/X1eYHssHDxYPFHrKB6bHC6WpuMtKYSw/JTc0ebg4MbnLqfy6OPrGrkpmVMl5onMP5scLkzV/d47mx97Ytb83s+ft3K7drxgGBpwW/UtgGAlvRANDeijTn3C4WVcKtAmu36t+ea76eAbY5Ghw9W6wdG19CZmDa8vr3y/hphsXFoLbx+EJP7+4vnS8+vW9javn1h/Afj+/GF7VvaVEhQlEcvZWcOMEuOrQmO4DhlQqNMU3Bc26mTk4MxdceyhXvHH1U9haNW19YyG4ubh+/xl+XMeS/oAzvf0fCX+ANvjz6Y1Ld4FhABxDY7MH6NDQC05dQ12Gh+EgOHUNnU3kuQQ5uhCR9yTIE66xH8krhUl5u8GNRu+fAYaVL/62dvP46qXF1U+/BWYZJD1duS5gkUEbWhxg+kW2Fw3a4PbMxp8+dqJWeJaQpxCcXAxuzFRvXwP9rt+/J+9JMLMAbAlXme5pTXy79rduzM8En8+tLx4HHQZnF4KZWxuz94Lrc8AcPVBwPJ3p7R+qLi4EXz4F1mBmufoIna16/5LMQb+SVyr+G2jb3zU4NIKO9+7pGvwdctHg3u5MFhmCG5eC+zc25pdBd9XzV+RVC07eA7bg6sXgTxfkgTjy5DauoLdRGq4/uFF9NBPMIBemoj+o6xszwf0lYJDnJWMCGOQ064vXglMnqmeXxMdAISMlsXV4H7BbabHxx9n15cVg9kaLQrFMTimxJNahs0ZmecR4fgwv6tzx9Yfw+c4sBFeX48tGPcfmxJ4/edzsutaXLsigTL6uqNv1h3PBwk107mvLwf2FnVpHTw21jjoPri4F8yc2zqEXQEJK9ew9bBNnSKSqLp4Pg45EW9zBrQviktgr1XtPq1/Ng+vYuLQUXIkesOQDn9ySkVM9+xjoZApq9qw2oz68DvFs9SaaodYf/qX63dNg8Q44n4wIOSUwBGdvbJyakZkT2MI3NRoRwCbTWsIMdPJeOPRvyix7CbRLuaodHA4f2pdP45e+7YM/KCBJd+3tyeSA4W0/4Q/QxpOfzJJy3/J+y0wjGR3QBbPzMhDW7y+uP3iKzLflcc4F178Ctn35semC0yUJ+YeTxUmn1YlmcgfdkmqrPjgejrn7F4MF5IHQpSeXnIniWHnKmcyPT4yh2BsnkOBSnJG9AwNd2fdbhtuG/11a/+dI21DbMJxyrs+tL8+KU6sP0JzdNTbWmusGZ+jKOj3lD0pj5fwosLYnZNgbV+blruWtk+i//uChjBS5BafFoCsTSXDpmTyF4PJfZDSCswyko3urnr0lT3PjykUkUVIFSZUETCN7Bpx0uTRVmQTGrlaVSoXv6g104uDMuTBgXZeBcA80rp5elsQ8zDceSaRHHSjttWlrQduuScmzJqLKCVhl/IaPZXY+PH2Utg69i2Tfz6w/OteycWm+ujgvTxs/3ocSblDjs7ckmYqfOzBXz94Jbl0QtwFbsBSGN/FE9e4SMsv0cBbFbqmeJDJWv7mbGPyzhal8ccyJ/O2MDPSD3vuzKVQG5mSKq55H75jUXjIAw2EIX+fe94Zb00MjOXAqmWpxSpEbynX1O/0Z2Gq4IlWyk82XDqF3OaHRO8qmnEDir0TJ6EbiCJF0joG3/TjVBVeNXmN55tWbyCXpdC4L+lD+DhPXQPrfwhEKEyA1OQW6DK49lTkwzFxgtpwrjheGx/IlNwXaDu/zHNNm5ZG/Z509A++pdqSqFA46o/mpPOhAhqtkY/KWbyygETtVKY6DVsH8LL7DVJ8zkj9YmPoQNBrIT0wI0omjArDnulv3FUfz4wfKwNi3t7ff6cv09/cir0zoVhRlssXJIzLFjYdUBk1yvXuzQ6hyGx7e9CHsdTjbOzKyN9vr7Onau6cXXOvI23tzPUP7B519Xf37kEBSqTC9eHax+tkCnkg2rt4JFu7IQJLsrEUSKaEGaA4LJ+j7YYqOIccv/vcmrhd/Aa56+6aBrW8oO9CFJoJ3ugZTaMS1KzQVxS9GWE8G109Xb3wFzhRLwmT4ARqPYYEws+zEKidxjo7YGuh9KJvZkxkEhpdRx3GA2bTFk0pycea2SSiUvCpxAg8WP5V3DfRdQXPCyvWzPy5/8sOJP4IG+4b6/d730sDS6SXW3JnS5FRl+kBSXN1TKBUq+THQZ/dgDziqgkuznR3dxbExeaOBPVcuhxbnQBlOecP5ypSTKU1Mw9eyR6YqR5JJmQzC6wXdh0Oou2sEvVv73nsPNBh43xnuc7LDQ8Am82+YJSRRt5bs0N5cZnAPev/6hzPxEw9uzK4vzrV0d6XfRTrpXMqzmFc6LfHgR7p4lMVjqKnu8qIUQ+uLC4JDmuqiW9u5P0k+gtuzm5G1yfXZtv2ZbG9Iiq7eTYjXMgQvhjXEo1n0qCPAGRaT95ari4vyFyD6x+f/WP7niX+eRDO6Tikbz4qgYUYWDcYLzshUfqoQTvlAEs744HB6OAOOdnaWD4PDubKzv1w54uwvTiGzVB7K/V0aXf1koVIsTDoTkgfh1+bFR9+sLnwMzjkyPTExVixUnMxoIY9CWV9x8kB+zBkpyCoHaN+dP3BkrIze1M2GmZIUCcUyrgVk2jgqay6vLkqkh9E0lAmrtdABhVGnVJiSirA0LW/zfxdGQRfx+YFhBPcd3r/TG14t7C7Grat/mwM99hVL+ZJkoEmAUaU6vFRnyk0h3/U7vb8FfabMwPurl5Z+fPbZ6uWv1u6cBZKBAR8z2XCBJsG0iYB90F3Mev1wCkxqvMUS/eRoVEMdfEwdomre36rm/VY/emw+ejb1STFSxOW8H5XzfmI5729X7f5m1e4P+bBq78r6zarvhAcDq28fV99SHfuJ1bGUrz4uX+M6zY/qNB/XaVGN5CdMn1GN5CfVSGEx5L9aDCV2ts/zjW/7fakO/GbVgZ9QHaT6/J3S+XhYgHEaZux+YsYepubyfBNT860k298pyfaTkuw4VfTjVNFPTBVfZn4+etvMZjmZ/Cq5/g6Z32Yu5DfJhfymuZDfNBcaeN8f7vNxalObd/hN4npt3tFUV5N3NNXV5B3NdLV5RzOd9XfMO+Lg7zcL/nH49ZPDb67sh5HdT4jsm/EjccRLWo5ChFTWUtlLHTpaAK+JwpxV48PB5Ysy/zstYdl+cwmlkOuLM8E1QYaL1WvPwOm6s13v9jpqwOl0q6dnnA7J1pzB3j0oKXpPakc/2zW4p3cEdCTIIng8H9ewwe0LSCF4UBBgVOViRX+4vgZaDjdhKMIyQIvg1McCiIBBC6pyJM5Wv/g4WL6JyXxHm7JtIbc781CqztaRob0tKUhkm7HY3O/L461TZZR0rj9clAcRc7bg0UUZDOFKxu1b4HK7e2RhLFZKfiwPGJO77QfUs38AZWBvJazZRsdRgSsEMFwg/eY0uKZ0F0Iu6aEeVH5F4wt08o7kgX3ThTEnKu5k041plf/pAMr+3pF0xnmnHS2WSN0ou2YScPb0+Hi+8iHoUbUNV8qHpKUzJLuMjhYLHwBRZ9vIUDZeKihPVxLy8x4Bm61vt2XaQAfhXHZtHuPuldm7q4++Xpk9s3p97sXNO6B1tiyX5sgjAba+cgVlzs4Au8YRZW4u6DmemiQOw6kpnmz8JpNN5G1fDfjRbOKHs4mfMJuEL6K/04voK+szL2I0jlG4Xp2dW1249+PyX1b+fmrtyczak4/Wnny2en0G3PsPp+79cPKvP5z8BjukvzgJK6lceUrqrN7piuwsy5ecoQnhJklUZaQwNT0BTt3bJ0AtJzhzsAuBfHmKVbjnKa4kUH69VUog21YtAW3RxpHtYgJKGqoJqGkoJ5AmqZ5A2vqCAqLEaH2wrqBAHSVUFEhaU1Igc3tYUyBDYlGBxC+rCmTdLCuQqbGuQJqXhQWy1lQWyNystEB6WXlorC2QTMJ1VFwg23Z1gYybqwVxsoUENfUFMtcVGEhQX2EgxRbHj0sMpEA1BtLVFhnI3lBlIEl9mYEUtXUGsofQdbPQQOYwMNdUGkiyXWogI6w1kBAWG1CIqg0oROUGEsJ6AwkbCw6kaaw4kKa2okD2+pIEKeqKDiQIqw50XOBFuGl6CsSftef/E9Kqb2+uzZ15sfR47eIdD6jau1szg7nWvnRrUdbkUe0yMJRDhcO4pBNoKSEOX2g23wpfyLYVvqCtPnxBSUP4gpqG8IU0SeELaevDlwHPFvAw1FFC+ELSmvCFzFH4QobE8IXEL8MXsm6GL2RqDF9I8zJ8IWtN+ELmZuEL6UH4QrKt8IVs2+ELGevCFxLUhC9krgtfSFAfvpCiPnwhBQpfSFcbvpC9IXwhSX34Qora8IXsNeELmRvCF5Jshy9khOELCWH4gkIUvqAQhS8khOELCRvDF9I0hi+kqQ9PSFEb4JC9LnwhQRi+0HFPe7melvRQ/1AWYa5sut8ZeB81jIoZMOVGxxH7WLl1e+1v93/66Hyr0m0alck/XflUqsq4fG9tjWvM1TvfrMxdWPnu8ep3F8HZurpTsoEu5Qz0AOOLJ5/8+PTqT5+fWYOfzHSBJsmAWArRUdmICNr0HjtwONxsJVuuplD4dtussy8DGu6POEgucQ9v+IWMo8NtvHDLbWRWiebwAxrHbW42zc3J5446Tz53+PlNk3NH5uRzR+bkc0fmJueOrq1J75G9Sfc73dtON7fT3e10ezvcX7gr89HCxnn5rOMrlWpFL1KDBGVGDRL0hjdIUPJbK+nc8VI6W9GVdHa2tYfDJd5+JZ+ZSadO4l6raIU+WvVGl5wp/Vch2nzj9P5hujiRsDthoCgTbusweCNlzQIcDfe2X5ENsQ9lOwUwh5T5/BVgeHcApe09MpNEe5pBizgDkJWuC7JqIEsTjtBi+aABKPflK8Vwld1PtatOYE+nu/yoNz9lNXJdb3cm53yQHzuCGg/ty/Q4lXBbn07plOP+qsPJFibKcA9VeKZs4WihJJvSZU+xXJBOtciWpbZfgp73oycynM2NAO36X59unFoAhvBkEBpG+52kIDtYPDQd40IUiLKFQ/kDH4J+O7v3HgOHe/QxdLhbweeaTjqsUgPpAdB9LxrI6fflsW/h9JCRgoYSdSbDDwCAaTi0HEXBKLh8WvaMh183wc3Ie8bKvxfu2p2O9nPKt8FT4U4acIacrMs7Q8O5zBBaWYqsfSjA5ozsd59/GJyeR52KUTpNssS7sveM7N3nOLDzvi5fdaiUtqAHuVa/Lz9eHPuwZU922BkcQsMz7Nt/VZnwlUF0JfBCwo8//roQ32e8FFX97HvZAF1dvCsfiICrO5jfbCLfD858DwRxOhxuJZev+mQn8+N5yVJlVzWQxvkE/uhvUGaLlsE0uvcYG6AZegsbINsWNoC2emwAJQ3YAGoasAHSJGEDpK3HBih+AmyAOkrABkhagw2QOcIGyJCIDZD4JTZA1k1sgEyN2ABpXmIDZK3BBsjcDBsgPcAGSLaFDZBtGxsgYx02QIIabIDMddgACeqxAVLUYwOkQNgA6eKkIVwc831kb8AGSFKPDZCiFhsgew02QOYGbIAk29gAGSE2QEKIDaAQYQMoRNgACSE2QMJGbIA0jdgAaeqxAVLUYgNkD6kAOl6HE5BAuICPuYDsQPDDHQh+5PIddyD4eAdCtPzrby3/+k2Xf+NlXtkDh5d5lb+ZR/nNtiX49LYEP4NWxDdBhA9BRLzwC0J1LRPxIRNZ+eTGizuzxon//+fn535+/sXPzy///OyZ8/Oz+z8/v7Z56Nl3Pz+fAWfo6cpknPT7aWCKlyRWl0+vfIpSkpUzp198+Wz1zuMXMydB69HCwWJJ0kNZ/gBWcGigMDmZP1RISGblJtcuPgHNVmYf/XT8xou/fyS7fn+bTWdWzi++WPoaCOWnaN4BhwvpcqXgHFVOS3lsFOU9QqNSnU7fAZhji1GlnO7pUdBzOCX+voxKA9kEI79UU/ZzvVk/3Z8BbeP5LHHf8NCwtHTky8DewRG4LWz1zpXVK8gtye78+NPV83Oqde3J05W5WXBJplO1rczBMTTty6b4adBGsj/5hhMYVu9+8eLUs5W5T9duL/64fPzF17eBaOXbE6sP/ixXszJ3Dplnz6x9/yTxhz1Wnh9fvfbV6r3noOm+8thkVC30FY/J7vi0fB6DRql8dXxIWIL8KNGre+5zhQOHS2XZzF8sjEn9VQCSOGNGCeRWxoxsWxkztNVnzFDSkDFDTUPGjDRJGTPS1mfMFjwKkDGjjhIyZiStyZiROcqYkSExY0bilxkzsm5mzMjUmDEjzcuMGVlrMmZkbpYxIz3ImJFsK2NGtu2MGRnrMmYkqMmYkbkuY0aC+owZKeozZqRAGTPS1WbMyN6QMSNJfcaMFLUZM7LXZMzI3JAxI8l2xoyMMGNGQpgxQyHKmKEQZcxICDNmJGzMmJGmMWNGmtp8GNnrM2qkqMuMkSBMqdHxmj2gCMc2bAJFkqRdoEjbAbd4IuUrG0aRaDPdR6a3oi+kkCXOepGlIe1FkoQyAkmjncxhHYGMiYUEEtdWEsj+aimBVJ2v1BJIFe9xlmICGV9WE8i69ZWi3/wrRT/pK8X4W0DZo5b8LWLNt4W+fFso36c1+bYwugw/+WPBaNO1jzdd+9u7q3f6Fm2zEvJfrYR8uhLycSUU1Qj+UeUn1QhRPi5fgyfm40r7qU4/sYjwVcrHRYRk3T7OureWleUrNZh9ur714bJynDGvzF7GO65XF2ZXvv2i5cXXZ1dOXP3hxGVUE63eWlhb+vPqtZs/PnkEsr3KxFQKUYHwOBqw4XGUNeq2HZbWouX4pO9I47oC3+Tvuv2R/X5++v++KJTkC/ipgpRkY7K0IMUc/kh0uFCZlnIW3GyYmPQO5oCle7oyKt2nZTVKfrYQCfaPgKM5tMARrn7KD1tFP6iT8FXJSNew8+7Qu+hBdsomiNb4q/vdk+EPldb+6mmYScgW+c2fOg3/y4k0GfmlVPkNWEkJ5eoP91YqZfkV1pfuqxcqVqhZoWGFLiu0rNBjhe2sUH46l3uOnaxQ8a6hfSO/FkJepqK9o2j3KNo/inaQ/NYbe0e0i2Q9nexT0z6SpWK2T9pHmvaRkEX27LSPNO0jTftI0z7StI8M7SND+8jQPjK0jwztI0P7yNA+MrSPDO0jQ/tIfnOLHJ8u7SOX9pFL+8ilfeTSPnJpH7m0j1zaRy7tI0v7yNI+srSPLO0jS/tIfheRHHWW9pGlfWRpH1naRx7tI4/2kUf7yKN95NE+8mgfebSPPNpHHu0jj/aR/HIgOeqEZ7BK2kfttI/aaR+10z5qp30kn6Wz9077qJ32UQftow7aRx20jzpoH3XQPuqgfdRB+6iD9lEH7aMO2kedtI86aR910j7qpH3USfuok/ZRJ+2jTtpHnbSPOmkfCZVgX2Ml4Ih842WDJy+l/aRStKOUwCz6WmlXqRTtK/kFNf4CeG+9DnLgvfUa0OE1qMNrYIfX4A6vAR5egzwo3ls8e1A8fAh3pLPjVfPvFs8fFA8glGzepq+Vf7d4BqF4CKF4CqF4DKF4DqF4EKF4EqF4FKF4FqF4GKF4GqF4HKF4HqF4IKF4IqF4JKF4JqF4KKF4KqF4LKF4LqF4MKF4MiE/1khPGTybUDycUDydUDyeUDyfUDygUDyhUDyiUDyjUDykUDylUDymUDynUDyoUDypUDyqUDyrUDysUDytCP+hAzYc87xCtfNZBk8sFI8sFM8sFA8tFE8tVDufE/LcQvHgQr6Tox3LowvFswvFwwvF0wvF4wvF8wvFAwzFEwzFIwzFMwzFQwzFUwzFYwzFcwzFgwzFkwzFowzFs4xw+xI5E8qv5/NSeibUsuWGvgCaZWieZegUXW9pnmVonmXoFM0yNM8ytOK9xbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMM/RrbKXiWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWoXmWEf4jHmzuwrMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMMzbMM+ZktNhwbnmUYfl+G4VmG4fdlGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lGJ5lyK930IU0zzIMzzIMzzIMzzIMzzIMzzIMzzIMzzJcnmWE/+I8uQrh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmGy7MMl2cZLs8yXJ5luDzLcHmW4fIsw+VZhsuzDJdnGS7PMlyeZbg8y3B5luHyLMPlWYbLswyXZxkuzzJcnmW4PMtweZbh8izD5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VmG5VlG+A9mkpzQ8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD8izD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/B4luHxLMPjWYbHswyPZxkezzI8nmV4PMvweJbh8SzD41mGx7MMj2cZHs8yPJ5leDzL8HiW4fEsw+NZhsezDI9nGR7PMjyeZXg8y/ASWEb8L2Ju/yuYuwvH5N+9LeXHusvlI2/+Zvs/+4ulI2/+P1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAACQAAAHhsL3RoZW1lL1BLAwQUAAAACACHTuJATmyNJvAFAAArGQAAEwAAAHhsL3RoZW1lL3RoZW1lMS54bWztWUtvGzcQvhfof1jsvZFk6xEZkQNbj7iNnQSRkiJHapfaZcRdCiRlR7cgORUFChRIi1wKFL30UBQN0AAN2kP/S10kSNMf0SF3tSIlKn7AhzSI7IOW+83MxxnuN+TqytUHCfUOMReEpS2/cqnsezgNWEjSqOXfGfQ+uex7QqI0RJSluOXPsPCvbn/80RW0JWOcYA/sU7GFWn4s5WSrVBIBDCNxiU1wCvdGjCdIwiWPSiFHR+A3oaWNcrleShBJfS9FCbi9ORqRAHt/v/jj9Q9P/3r4Jfz72/MYXQqBUinUQEB5X0XAlqHGhuOKQoiZaFPuHSLa8iFcyI4G+IH0PYqEhBstv6w/fmn7Sglt5UZUrrE17Hr6k9vlBuF4Q8fk0bAIWq3WqvWdwr8GULmK6za69W698KcBKAhgphkX22djo13NsQYo++rw3Wl0NisW3vC/ucJ5p6b+LLwGZf6rK/herw1ZtPAalOFrK/jabnO3Y/vXoAxfX8E3yjudasPyr0ExJel4BV2u1Tfb89kWkBGje054s1btNTZy5wsUrIZidakQI5bKdWstQfcZ7wFAASmSJPXkbIJHKIDF3EaUDDnx9kkUSxUGbWFk3M+GArEypCJ6IuBkIlv+ZxMEj8fC68sXL44fPT9+9Nvx48fHj34xvVt2eyiNTLs3P37973cPvX9+/f7Nk2+y0Mt4YeJf/fzFq9//fJt7eJgMWt8+e/X82cunX73+6YnD+w5HQxM+IAkW3g185N1mCUxQZ8fmg4f8bBaDGBHLAsXg2+G6K2MLeGOGqAu3i+0U3uWgIy7gtel9i2s/5lNJHJGvx4kFPGCM7jLuTMB1FcvI8GCaRu7gfGribiN06IrdRqlV4O50AgJKXC7bMbZo3qIolSjCKZaeusfGGDtmd48QK68HJOBMsJH07hFvFxFnSgZkaC2khdEeSaAuMxdBKLWVm4O73i6jrll38KGNhMcCUQf5AaZWGq+hqUSJy+UAJdRM+D6SsYtkf8YDE9cVEiodYcq8boiFcNnc5DBfo+jXQUPcZT+gs8RGcknGLp/7iDET2WHjdoySiQvbJ2lsYj8VY1iiyLvFpAt+wOwnRF1DHVC6ttx3CbbKfbIQ3AH5NCktFoi6M+WOWl7DzFq//RkdIaxVBtTdEu2EpCcqeBbh4rXbwfxiVNvt2Mr7y7Pp9Q4nzqdmb0ml1+H+h9rcQdP0FobHYbU3fZDmD9Lsv/fSvO5ZvnhBXmgwyLPaBWb7bb37TtZuvkeE0r6cUbwv9P5bQOcJezCo7PT5ExeHsUkMX9WTDAEsXMSRtvE4k58TGfdjNIG9e8VXTiKRu46EN2ECzox62Olb4ek0OWBhduasVNT5MhMPgeRivFwrxuG8IDN0vbE4RxXuNdtIn3fnBJTtWUgYwWwSmw4SjfmgSpI+XUPSHCT0zC6ERdPB4rJyPy/VCgugVlQFtkYebKhafq0KJmAEhyZEcajqlJV6Xl1dzIus9LpkWiugDO838hWwqHRTcV07PTW7bKmdotIWCWO52SR0ZnQPEzEKcb461ehpaJy11s1FSS16KhV5LgwajctvY3HeWoPdsjbQ1FQKmnpHLb++WYMlE6BJyx/B2R2+JhNYO0JtaRGN4D1YIHn2wJ9HWSZcyA4ScZZwLTqZGiREYu5RkrR8Nf2iDDTVGqK5VTZAEN5Zck2QlXeNHBTdLjIejXAgzbIbIyrT2SUofKYVzrva/PxgZcmmUO5+HB55QzrltxEssVqjohIYEgEveCpZNkMC7yQLIVusv6XGlMuu+VJQr6FsHNFJjPKOYop5BtdSXtDRV0UOjKt8zpBQIyV5IxxGqsGaSbW6adE1Mg5ru+7JRipzhmgueqalKqprulXMijBvA0u5PF+TN1jNUwzt0uzwmXQvS25zrnVL+4SiS0DCi/w5uu4pGoJBbRHMoqYYr8qw0ux81O4d8wmeQO00TcJQ/frc7VLeih7hDAeD5+r8YLe8amFoNN9X6kzr3zDM3xfY8D6IRwfe5E6pFJlAaND2f1BLAwQUAAAACACHTuJAF1Hd3pV2AABm9QEAFAAAAHhsL3NoYXJlZFN0cmluZ3MueG1srb1bc1RH8i/6fiLOd1jhE7GDCU9b6tYF8Fx29FUSbknt1S3JnhdCBtnobyFxJDEe7ycwlkHchDHmYoEBg7nY5mYY7peI/VHOVndLT/MVzi+rVq9enZm1uoX/ETMYVldlZmVVZWVlZmX+9X/+a++M98+p+YXpudm/vZN8r/sdb2p219zu6dnP/vbOWKWQ2PaOt7A4Obt7cmZudupv73w5tfDO//z7//1//XVhYdFD39mFv72zZ3Fx3/tdXQu79kztnVx4b27f1Cx++XRufu/kIv45/1nXwr75qcndC3umphb3znSlurv7u/ZOTs++4+2a2z+7+Ld3tm/r63nH2z87/f/un8raTz19W5Pv/P2vC9N//+vi3zPz04vTC3u8ydnF6cTinqlPF73Jmcn5vX/tWvz7X7uojW1Xv3ynuvKEf117eqd29nBtZWX9zX3+W235QPXBj/WHL+ovLvPf1o89cPYrTO6dnvmS99hYOlF/dZd/Hcrm1t5crR28p/xQPXWiflNQVV15uH7k39Xrh2sPb/FOhcrQOP+WfK+v4tEPG+cP8N+qK99Wj96qXXxeO3mzeuSxPtRCcXTU5z0Lfn+Sf6tdXOafKqmUVxrMjzcIqJ/5d/XCrerJy/VT31RXX9fvvK7eOVdfPiL6DZQKKf7RjAQ/1J7erj6/sfbySu3ry4DGm6GFV8kPl/J+ujLm571yfqQ86ieoN2+aHxkYGsnzr4Ti5GlgCVEke5Ld3d09qVQ6ncAQ1p/cs5O2fvVWortbod9Okp3y2rkrtTvXq0cvrx96paByDrN68lj1yd2QBqWrV/Lz5XKbMWI0DJIdTbJbGQ1HMjQ+XtEJxA9YUP95eWT9zWrt/pn/vBRzPzS7OPn5lDc+OT89+cnMlJed3LuwZxLbszK9FyKEowKb+KfR9thpolTs+X/tmdwPOdQp+kLvjlR39cT31aVDdoaxPGsrp9aeX09ARmC7J0wLb7xQ5mSmulM9Xdu6tv7n5Q+11Ue1s/ftvP/n5fFkbrBSPX28B//Bmqm+/nrt6YnqqeMcQL6c5p/MWmfb01KXSO8ksLxDfrhslrg32Lsj2edlRnMfq+1o4/6Pyb37/lIYT/ZzINGRnL1f/enHTY1hZ7K/j0OMHQfxhXfQxqG1i4yje7sCJMO/xVAi2ipEcHBjox+V9dGuPT1ae/q0dv+mc+sWJ/d+sntq3hv915efTc165anZhbn5nWP7FhZxFO5VJVUUXO3kz9WVa00JZBZmoqc/meyWQrmQH/A57cSKBL5Xl0+0kaUFf3Sk4qGpkajvWVHKwZkVVz9za+PX8wAHaVhbOb324vF/Xh60/xvoHUj2Wfr6kjuTySQO+e7uZDqNnRuVsi27r3FEbEn+iePDKu3tSnZ3pba9v/Z0uf7ikd1b2HhYsbwxjb+Hf8S3Ev9GTCGexEtdYgWTuhwQARcYPxgZzX6gStL6kW82Lh52rpUPZud2fR4sEXVlsP5WeCXSqaTleE/y/xw4+GHzXwlwD0dZsjth2R2exYnuHkzdzsbPyqhU1WLt1UmwDGNW1Ivi6ESTWfmPBtNj5Yo3kC57fj5b9LNjxXRlaHREwQRYIUPsYrKrHbI0FM5ewko6EJxKdid7FTDjYhpAJ29H824HUX1+GSuy+s2J6utf6ifvrR/9qvbvg289LC83NlzyxtPFcaFggIr67eeEC4vt6Or6/UPABUTqBqAZwQB7uo3UDolae/Vd7cCL2pFTAyTvEz1b+/u6k92emFTSTsykJru3KoJS2RxDAyNZodsRl+q//Zasv3xa/+pZ/eCv9edvqheF3jb02Sy08blZLzs3PeMl9QUb6Q/RlewH8d19EF7pTP3OslyWqWAE6gCIWH1b/fZbalPEplRiCb5YRQEzejYFv8cJXyzdAH7vpuD3qvAnpCgy0M/8u/bgSu3+o9rDf/MNMZGu5CHksHp7vMKo72WGy7zJB6VusULy6SxvFmDCFQPLHascy73+8jauG7xh/dCd+t2ruBPoN5CJksDWGASuLm0GkTSDGB6tyEvMxEB6XF88uKbcOWXlwcY5ccPIz0ztWpyf3jU5401MQsccmFyc4kPK7pma/zJQxnAs0U6/cKu2fHP96nH8BVIM2795hNMeT3T3Jbq3cjhEo1iA+Uoc3SQj7p+Jp7uyZ35ucRFa+fjkzD+n1KVTGcz7wwJ1Y07vnCI0uInJC5hlz9zs9C6vAi7snYORYJGPq/b9o/VXN1ok3uprulyB8SFkI/u6tyXFJOWzpWEOsUmZviRwXFjw9ued1Sc/r19bql15Al2lhY6G6kHYe97r3v5eysrePwKgfvlhdfXV+olrnGpcQctllcuh9r/+6reNA5fDA1FAmP1senbKK++bmtodpyi44AUHCKmPqaTKCI5xsFRQ1ScogFjntd+fQapYi4Jyeg5Of7bHK81PLSzsn5/yCvunZrzS/r37OI4oLHtKQHHEOZ+UB0SyeUAkuzkcmkNczpLJ9wvp4aHix/UzD6YMw2pnnq09fT49+1/Yy3Pz/3m5+j/+n2T3X0zz7V3J7bjMfWrsOLad7cOBl7I7+CdahbVHL6pXf6x+86R64lH17JPq+UdObpSGypXRES87OlocGhnwduQrpDKMCZUh0JqTuLNL6FjW9WukqXQ0e6Olsko0ROnvz6xG4lxro0PFpkYXY1hpkAslf0vw91R3Ov0nMjUJJCrVduv3Jvs4rUMjaX2/WEOEHUCba01gmqhM7d03NT+5SAsRZkwPlki7KhfMjYxjHh8tCUFE011duVddOW+Hppyn42l/KJ0p5j3DPByrqrQ1yqzdOuF0qjKydutq7dIbUuN7urd3p7bOTn3BCZ3Q6bSHsC4cm4d+ypyXg+ODHGqwk7iZgzfLTqj3BLsbwqElYTnC5W3jwA9YtjAeJTSbRmNXWOKMKp1I9nUrVoOOjBmaGQHUuswW7ShWwQX7uIXi/j6VYqmNgxh9gRlJEvIuxXgnZkASIcBG5Vz17k+1I0/Wnj6qnXtsL9Ew+9R++Ir+eea1lXxQ9/GxeurkxqWf1mDnOvOseuT+UCg8jye7axePrL14Vf/haxzrG4derd84uPHT1/XvLzTFKq7syW3v264QiyQIzj8C4Nqly7CZiFFMSL3H7LZWZvRsnhnitG2Mg5OQHx8UjDPyffV3LNzq0SvQW3mf8Sn4IWYmzSVocAr/VSydRvXBdEbtyNjWOMYatkb8aMGTref6I3vVNSIxmVK0ofFBMaZgt+Lcqx65snHhOqezUKrwTzS0+uFDUkDzhvbQbgjLiBTlDbPpkSH9dvPTw/qrU85TMTs5/wldIidnpxcWYSjLzs0uzs/NxCirVolJJntgWErurBvw4YaJshpmXZjsiZWkTIh7RaVQKqtzbkGuf/1g48LXbQ7JCvwdn87MfcHPE1XuNzwkFjIZHA6v1Fe/rf37GMOScDpLhrL6iV5ffbr26kR4lndgqw9N9KU9kwvgu7VM8lllcPNk3stYa5OmnpEFAscVBHdPt1gM+XKntLe19HdGfN7P6nKl9pDm1bkkqZ9uzbEdcYyFauq27u3JdFZVa6z5rTfVl1h7fmbtxTVFQQ5Ec+/71plgtVA+BwXfsU6xe9dfwcNGhqVw6kVv0rr9SZhoQkXcTrW6RMf1KQKm+t0HDFMitXH7AUf3z8l9c/Pqbkikds9Pw8XMe4TW/Q8+lJaGxpZRCcBeN4a1dh5Gw+Vkqiu1/X3dcIxRq4JAxZro3dywe9sPW0j0jENxD6wLZsbb6L2ZOdzFm3NOXtLYG6O1W7Supch1MblVXeN8MitwQfJvyff6YQoWvtwtuCRXv1lSvIloq3t1+8U5VvB7hWcrhgRawRE/azwJzPaP/SLxl8qj6nCZ3IQ8DmWaG6mRxMEkeaNjFRUjCSdxUSLSjM049V53hUk3Nz4r58goxMdgXBj8IyFJMBeEGzhzZkjWQawVNRTWQK/KNjc2cj98SpJuniQdu9ypfIS1d0SoBDRExfTtxiuN4HKgQyM7YjGF+nEMmkD7NmZ2BQPGoggwMxZuGY9B0mLQJxu5ggljicO0mbE4MGAsQh4G88Kt8J2Ohezx+ljiMG1mLA4MGItQg4KxcIt/p2Mh278+ljhMmxmLjiE/MaBc9rHEWu3n7mFMGUu6MRV/AUv6lPcZTOneP0n8eJO7FvdPwjSnjg0WcE1OWMShAdyNOGLCF6ZwyUljCleXOLdYt8NohoootcAqro+NTMKqOHeZcGOwqsZhOcIPC44TJGqHDZVjN74Px9IjxaHKxx6ixia8bMUvWqVZHSgMYoodub+iWgndOMnV2JF0h+VQncSo5TDUmd34Autheno+okrBlNhUpSR/YTvU1iszHbpxakZEiYXCtdTzK2ERVQ8/XX91d/3VI2N0a4ZuxeB1RG8FV3HLCn1yN0dLB6qQK5QroCWI+FKJgSVHY38tYshx84BCfbTeNtCHgmgisT5uMG2jfuR8Zsu6lLPWkyO/1O78hJl0oyT7S5m8ueXBsUpudGIkZjNSW838CGneaqyJQdfGbCMHSOYWjbUx1hY3+hi7i8RcKg+piN02EzfiFh19aERdgXRh1xBuUqc1pjfHzV0OEndY9RxR77Du8bnu7xIhbtW9Xb0UmUUKSfRmGspVOOBgIV5//mv95gtEBqwffhieavVfRRg0XXpVmR2FzW697oHE3n/laDK5xEB+QMza7j2LsDPC5QOvLCwgtVN3Nr5DqNuRYFi/3lOur2FrPcJhwB8dG8lxTPmBssCeH0jIj0kXSVHWKlQZI8i2rlRPYANp2uq3d6X64QLVbcfkq0kl5LRYKqxF3wYputp4Q9ASRvLiZ/LjmDtrJV8W9/qA2m3v09wfvQK3OJBMz87A+w3fROCtNQG4zXGYwQVx2OYnzmMaS6IyIT7TWPq667ffIAjHhqCpTXq6vcogJm9g0JtIF4tw5I6M5LNKrAlNkYBgcQsuGJrkOR6QZBwmlr2uNgF7xc//LRxsMjdYJG3ZKwcoh+Jq41opZFTaCcsG5ykZOxTDEm/mMCdRb94U5qQesyYTH2Skz64NGcy4xGETGdykpNFAKohztH844FjDSKPm1MKw5SQixrglwJBzIWrS0vAba5MLGzM4cQQtZiYNOJmZXLBjTE0cT7yBSUNsDEwuzIqRiWPkpiUVB5mW2uAIr/4CQdOopMImo1IMbG5YEuCZOUnFQeakNjja04/zSdnLxP+eGNjcmBRPf4+OA/S3w+Gmn6xDMQRyC1E8gb1OAtvhcBPYWCA6bLIIOclvtQpx0juyBWmTCltQPMrQHsRRuq1AGh5rBXKh4pYgHRe3/2h4TEhgnwtPqNK9RVighs1YflzIVOsPH5nT5qOhI5uPC5tq9+HYNGuPhojixJxiRLX4cEzt7DwaVth5XKNjth6OTVp4NPjGwuPC0MbKIzB2ZNvRqKCHec4jRqcitO9skoqGVUcjA1YdFyuilh2OEVYVV7fA1NGwrIieDnuKRpy1p7RBZJ7dKjEA8QEwGjqypMQj+2OxKxpO2FCcKN12FM5Ubj3RMJH1xIVKtaBwJG67iYaO7CYx6GTYA0enW0w0VMbA4cIVY+TgGGNMGxpacxOk8Ie+8NWqfW6OJ1b2PscRDI2Mi6tRKtU9vnHgGxg3lGcA8ONv/Hxft3cMzSLoA5FdCYLAMVVK3eJaRxaHXt6QIjDx5jSR6i0NjeiXdGqC37cMlQe68sPyLSF+7ul3we3pd8IlsLIjuIqXiakuBCX+oEeVDOWyY4l8ZfADgdPfOl678Hzj9mvLseqJQ9Wlb9ZeIPzvl/qrb3nz9ddL1aO30XrjdvBsn8IJTP931w//Qq/6Hx6FQYr36wEab3p2cWpmZhpvTxc9CkRBjKK38CXcb3u9genPJj+ZXvTy5KOanRImC+rPYe7oz1cvX4ZzyMbZIcIOtPS+11/78XHtx691s1Nv19auZGB1CjWa6rWH9KwNIY8X71srEuw69V+Prd+9V315AM04ZmMME5aDbT3dXdt6u6PQeMegiYe0EzMz3mfzyCuxm7cpTKS3dRUmtm/jPwRWlJ5uZjUjy2eS9pNuNatkx3YCL4eGT+nBdGgfTPRvxaLTG3kAwX8hKvm3AJNi1gKyEFPUtrWlpwdYxUtbSxuh7dDKxVmjUtbbnebfMV1RJqTtZk70btN4YdoSUYm03kKbNMOT3u5MG8yZAHNPKh4z4h21FlasJrtSW4O1QWZwD6OrH31cO3CwYTrr6+rrSva+j++Z2tlntatH7M9rT08iU8Ta0wPrhx9RCLYxWM7to1hiTnZjONocY+k3bNPKHBvvhNtEbmciZsp17wa2ibGRUexVF4jr39r4p7Ai8TXSYEoPHumAceF5ZJOy4DyK5cBbMEA7D9sPW+tFC63tOPHUwSERtqXFiYpP4eTxOcdv3sAU+dj+xX+C3Vwz9vbSyyd6yqQfRta/IeVnhIaOnBuBxFYT5RDRn1miAznrbflkbveXSCW0W8gbu33sMwHz/mDtzSU8IcBeQFT02nPkqNFC2bNJ4VnLJus3XlRPHYFawgJUOeeyydAAy38qjHdvN7PrD+b4b8Ei3qQvwhmNjyGIaXCPIZGsXb3GKcqmJBdSHXMBaXqCXDICbo+E29Mx3B4n3HypLJ8pZSmA5+gtqDb0Lv7Vb9VT3+JL7fkpK5YFj+yPuo6ZBQY+mHRZhhOjmcJ8SQhe6yKBlIOQ6vPv66vndUKGROhHLp3x0iNi8+Nz9fpt0nzOvK5ev4nFm7D/hmMUKhViYzcuaLGxSJ2DTniSAkVJJ4EQIkHW1OzsJGdJtk/RtoezCXThTRX61p6+gNWmDX2EPTecVcCBCcLD2cRiFMG4gRPgYFjegKrEYZ/CHd3VS0LYCsHGcWO1NRNkb16CqmmuBnJZX5CdzWXXH12u/XiQZmrlNL3PsfmetJbeSH4AaS7G8wlFitA7epeEAWoNnsD85AbSgcmWI4KvIbKiFGd5GZ6EGw7tgTuncL9WXjWWRoVMpB0tCCnJjWQ3rd1Isr2+a3t5Q9q1/FtOQRbdtby9ggpJw0QrP51AkA/eig8gz93kwgIpT9iI4vQq7egWV8kBeTYNJJECqnbn5/Zn04D7bBqQUnmgp2O4bqkcnGutj0+cNgG8Ek0r4Qj4XL1+Fvcvqz2obzvRxjw0TWfVn8PFGveyM9CxoR6QxxxU0m3fpgRqKNRaui2iOtUB2doDzwjZ2s8RsqWr2Mgi0nFdT06McUA+76PPUdNAkm4eVvDwtUpNvYW9k/PiYm86eftm9n+m9cGzJO1zFGuq+y2wmk5urMoZyAebgAui/juOQzoXNRrjrBl7kGsggdDQXdOUw7JxVGhQEulxkVBCkEJJgW5+U/v26+qhFUh9DU4MNQkkPDBnlPfP6akvvF2Te/H2XINBtAhNx0EM6UjSLmKWgdvKE1JChh/k4vxicp6SenJa8gNDOyQdJnCHN6WT8NLl9Tc/4iqgayDQUTYuHuD98oOpvEihUCjmMuJwKRS9nJKHEjE3HKYRYdu7KHzJde3JVHinTA5YlY++8nGotDNdUJZuJke/yHU0+EG3DWryd3TbTCLZUkrE5TV6C46H3XcMS+XV9IIaJEkHLaMyc0+2X2p7BoYvtA36XBSnofmqohP7h5r6kjC/wL8NZ7r7usZGNMp8bVZ8gSqUu3gv2MPBZ3K+No0Vf+dgzh9Xxo2odQkDH13TXvHFMAu+toZ9dQ0HZy6exkeyRzbUVFhFYM2ktRz5kVNXyCgbxqTuyyDfRF5Ql4BSHbKsec3F8lSstfkdqbyInh7akR9IcTKGSpmcziP7i9waje86KGVdmw7Kujbf5Rqmz3INm68ZjXqxsKipYF/FxzjVtVMcKlSg7ue9ouAYdRLLynzUWUY/CcwhfF/Az1TkGihJQecrS8XPp5HmS10p/rCE6sOc4+2dw9MczkLsVqW5Lrn9gtJ0dFQIB+xdpaG+k/IDmZzY/jbUNFDatfWNY44PhJY3/0ac2wk/pBAYFgG2FBLF4mqgoGgj+PMDDqLb2GotYtUgG8gUmKEjYmOzijKxU5xTDaRQtTmHMrn8gGgfUIIY42icaFO8dRBEClRyCTToQCipjQSGDlK994xskXevw/fIiaPBiOuZBfL/HTgD6y7vQKOJ7SDGb/ilpZMJaNVuDIZnWh/Dt4bsP6umNsWCFOdzBFXcitSlP2eBpSGJIyhYR7opPgchmeR9A0Io+7d6w4MprtfYPiKkyIzEmVxOJv9rkuXU8Ygk16YyJGlzoZEkr3FEkgAdktQb5KRde3q9fvOEvYZi31WPP68i0avJAd9Y+/AWIiFOm6Mdh0DGSJ2Ug8Ebl35EKonq85s2dUvcpLeIIcP7xJYPBgITFKYhJUwaxEYXYouPUxXloehJrBMfg4VSGOeg0FrKmKC13eN2v1NofSgCOJDIxET9aW83Bxx4QMzb87+F+3ZGsiNSy8cgyGUYvtOAcTjAadyKnKxwzYhl2uBe2N+k++lozUhSHZT2dpEn7/3A7nf8LNnOvn6KPWBvY3Bv2l0RbInVx5R/ceUJcjBUX36FZlbGwAuG+eIjKw7IF6PF0YHR+sF7Jv4SroMGQt7Vvs6xT1j1KyoB8vBKb1+CJATvH4opvAIQaxgT9IeGzZHROAWSxkCx4xlzRfdwJHJXYcs3rM40ErHlB7bLG9RwdsyPhlMkIk+d3G4JGzxK1t4HV2x61+rSEv6pc59wyJdNYKxJ39gMU4qr2DFAQDgzBPHIYoZv8Fm4DLn4VTEP4mvAA/PgSz3U0KYlpsTVSA40nJTwCVQpN8aHYpbZ9q5e57FnKRfbXiMdCYiQzw066wEbgsBxSYISOkVmfnrfH0D2+fqLC3t37Y+uFKSFp51vlNBPTT7NpuQl33SsXkEgOVnNoRjvkIvBnn1Rp/7cWFOGja3qsSWR4yQ/OfDyz5wUTaVAmwYpjp/LAwntFzPViM8z+oGq/mVyw4kdKaEAjmZy4WFoZ9Y2XL8LI+ph5Ynl+r2jtbN39E0JYAnbnQ8++IV/HsnyL42BxIUh0EAyvKNrINbWqAwkwNQDI4bT8gdMvZ2yrNfJspAtvZzoBg1NfyNvYdjZ2+loe9uO1h1rmB+YSOxIdjBa2zB2tLYJHwvxAb/wzw0muOWUBdcBE2zDtkwwx4O6S0BiJyygZrTS+VBc3xtDNOFKLsRycza6uTcDEPaIKWt0c9u0ic4O2GmGo8yY63sDsVsKoafcukG3XvdORLceQS+62SCwRmQlnw0cQDiYU8rnticzurY/mQ0BcB20WE0UbIp2APgtNGgyndMgIBfL8hNFWJiUyeELetnGGWRjBkTZryES9eCpUlEGv5SKEqmJOXKGphVyRbnYy6NlCttdekjmZmfwClp55YlE4FsXY9vR3dOlOdaDkSHTQNTCxbsTXfxbSBZRtXxi4+pj3B6+mF7c4+WR0X8G5ru4+5All8MEhSlzfdMuB/ksvFTJhOIxqmRGP6oeP1c7e073b9LvXmZqevfc/obz0jgY5z+d3DXFabC7B8Fzjd1TP/IA0Q9KkKEJHpWxh2H7BBpw6JPT/5qeTQCY9iPiIPt4B5ADA0fE202h43GDzeRkGay49ogoSmlu2xZ/mZkULWjdkgduNU9qo5na1aSX18tlZXadcEvYm6VNiLhzK5pyhozkJyisVv0NPhih6cL4Idauik0NB0RvbaYUi4oKs0eJMDSF/AAATy5oIC25H1dfm2oJO/t3prZv6RWXymC3xm/W8exYkjONLpqvvwl4iwIapuQN6soo40B39fsg7nrGPR2WOtqJGBHkXqXxGKq7t8ryQU2KzemOS0wkxiRazK1xnzHXoMbJoReUpAFqpl7HILUjhAapfW+SG7nQbI40sdhUspCgT+F9E30bbvH5xXhSHbMkpQ49l5XREiAd9U/sskFm7eqlc2J06MaJifai4EuxGs0w7f3b5iBBfmUU9dRnOzvkC6TAANdE9es39V9/rl07gCzPKUr5HXc+Vu8uV5duUU7b1aP6JS27Z3pmt7d7ahGVLCjMZXoWwSXzArfmYAeNChMYiYnqkxtxFOr4OVxkehYk0QpDIiATZli/9bB69wc7wi0TQ5VBL1/KCEECKO4fM4PSdGWuW2IiLeJQrIjflZuAAeQYQQhI/G56CXsMQy9+N73E3ZL1Er+bXuIcZr3E76aXOHxYL/F7sBPc1598RVgCCOarV3a2a2cerz96Zo8QsVKa5ZUW5/A8K4s/7NLmLcc+kDEjgSgKtSDep5TOlMWNde3ZeVRBiG616sGLsF1Z/TVu8ZcQEIoSCUiWPjk9/8nkZ94CVMldezjWDxVKEcaQEAGzRMm3520G+LXXq2Q9NdUUOcBhZBKAB76Rc7A094XMok0ICrxjFAGi2TZ++rYjBIXJz2W0WoPXjZd8HFc+KxaBNQGjfmV99SwtBTxUbBTFoudPtiqUceOCLDhz4RwQUJvrY9eeyXlUP/rMQ4LxRVSMVlKJD2x1rpHmLdzeTqxfgqPL5sbEtsYoEKMP+smjh1GYurFYJqRS2AuE876DWgZBTW3PKKdeDjUO5qc/2W9k9xhmNUGRe/OzpobE5AwnJ7TLbqF8RNJ+H8yJGVtEF+BgMCr+qf2gnAEOHQwKp8Ts1MIURwpyKUCf7nGqGQV0JnLZEVm3UaUWCyZnw/Prz28258MRn98B1blsVy6b0GL3G3yOtWA3qOej3hzxaoh/x8Rz3JYm+TYmjqbanWstDBUw2y9qw8l3ecfG9Kdc019EpKU4H+lxzNHL9ZOHqUbP4Usb107Wlg+rimmjhBCgqL+Huyl0u+TUAs9wvtKLTSsqqz8eI4el6qHMEsHiaHYTnAhAqsBU6ozUyO7IiAAlzsuG+m8yMpIpzsqk6t0fa2dfgSLLNj4jZgCqTq4PQruNRLmu/R4ZV/DETuG65aR2OXAT0ik3m1id3MzLQC/i2YVvlB+geIopT+fS5USviCoi2k98ZwPre4OQeuWMy03+rz3757x/7Jn+r+lJzzQ0YfQ4G/iEhVEdhJH/aKjYoW6gBhU7enQFoJWEHT0u/BaFGP/gWI4TUzt+FWuufvJF/fSh2tHfEEJfO/+6fv057lq86WA+nfPGSl5uqIwg5I/Fz0V5qPsyLLh64DSUThgzN1afrL+mtAQw+FVXV+EBhm9imUPtNKmC0tXPj+f9ct7zwQ1vOC1f8O8YgCETfwg+FStSHYVBsrq0HNwqjAnVGj44wVY9ddwK51BVHAU+K3P7d6Hg4uTslFAljMDYirASp8NstKLc2pAhD5lPUch07fnz2tGf1+/cSFjJIsi7ftaZAWR0/+LC9O4pb2Hf1OTnSATSmc5jVB6Ohojk33QalbBATsfuub1TC4vTuzjAUGThL0Id9AdHfZGzgUhA1c+zh6sr5oK/8nDtNXQSseqor4dUglv8QXHdNUoG1U1DzbfAp0nmlzCsDGWmZBTuRKUsXTJILgiHPwxXVP/v6e3QmYDoURSDV206qIg4gXT8816kwlfjvuHsZavm1R7/zpLyRsrG9PbsbPkXXr0a/RmKNBnWGuVXjWS235qFcl3gE/meCmqa91AVU5m4spWNMVoxsY7PfDzntOMt1ZZzWi/Cnd0E8v4Kxa9gSStrqg0FMtWxQa6lIXKOXsuHEItW7RCE9+ACaWblUxMiwpkA4oSFhuhCogx9PXMAyXYTwjsQRnUuHCjj5qINcnUuklnXXKgEaKyNRat1MKdBf1eq4T6yMp1ut0dvQXKtP11B3dGmTrnVZDnSnYr5chnJWThTGajQaBZke+HNG8kZPXtOLE7t8/bjduxJwCPDUhswJGQ4TBcJQdoX3txJggAcHKU9QdhjyK+hbM6ubAEaLOLfXNTp+pmDOA4UzBHqn5GHSI2NW5fZdroBu1As+ByaJRHZt8knbYw4kVt27z6pnRbG8kWvMFQsogpBluwzCbUVUEnBa5Yew9WIcl5OpDrCprXKJLttRmftLM8PCb9AMGgY7k+dJJPZ9xc5WxpzgYrwQ7OzODL3TuOt57xopizUYC6S7liJ/Lg0o1mSag9eQb/FxR3/DLeTQBqYy7zxqT3Tu6ARZslohv/Yopoz0m5YKg5IeWsn4/5r8qsYj0oyQYGoJoDYBiNzxADDP/F4c3PGp/HujDckEhwCpNpCQ5QALEWnhUqGLzvQupZhBGuqg5HLcIhgFbXA6ZT6fHnCwQ16AIwkKXev1i4/WL95uvr8xvr9Q0h4Syvi4vMtNjGF0Csb69VD0repeTKg7pqb2b931kvPfoYVMrn7v/YvLO5Ffjg+L+mK1H5BnHjYZgcbJW7j+zd/lLgZGNoRpuGmrrGXYKiJ+iFhWCaFy2rNa0+1nACI09QiiywXw63VktVA0+EIjPbdEIay8n0BYUisZqlpnqeUO+59x3FaSvsfqOsS2TlO/ARXfWhDT9iUbXza7Hyb5MP7Juc/pwm3fgpXe8K4M8PB0KwqKE1CtjZv1WIoaHbn+IL5FJn2erosL83hFQ0IDzNVNPi6yaRieRo3pyJ21Jom1XasaqePxnXE69/cWj90gOr8kHdBbuVxcfm1BNcvXkbFdyV1S2Pz47Aan9y1f/9er7R/7z6OHLw3hvnuYFE2OGreOWx/H5ym1zfLx2C8ql+9u373OkIkrLSprpytPT7C4cGbqxg6zILauP2CjjFj6BDdzOnVsnI/mYfFwOFnyyAQS4AoZdQj/c6pAPGRx1BxdSsKqPaGR8dyxTyHCptfnzm+yDLAf8yNlSVORJrVrv2AX+yBjSdbvBt+87KDaX8gD6S5sWIe78WHBeay8lLezFYPirY47OjDQ9md8pW6pQizRoXdn0OROAb7HCeqeuvB2rNTOnsMWDza3WneBM8j3YY4MQooyW34pNpuCIDUMpt0IT7PRVeIuzAPTcZTkZs24nAKwD+5ETfsELwZ2szUp2JkhvYY4J3TrkHPjft8JurHfqNsqFePkyf97v3qq+/XXvzCG+VMQWVvnHKM+FO75tTUHmVF5TJLCHkpyVHw/Gbt+hJ7RsAR+X45lRhO5PLjQ1mxRkk2wH+LU9iAwhLDlYiiSlVntm2kL7GhWVQiX/SQj9bbO4nQlmn7b8S50Ccz6/aGOPep+TKLcS9MTYrZ8ocGBiteOS/jHv1iOVHucBxPbmAc1eV7+jgCWhskeDSvwfV1/ycJLflOMV9wE9Upcw1RTuZyBhIZMLd6AQebNLZjoJ1viKcRXK75aggm3Pjvbbjd+oGDVsdpM/mVxswywuTUziHMaWGRKoQGpH4xbXRX3GfgWl7gJNl5fQt64ye5BP5RjBUtP0HRP4M7VitlHSwEInY48bbEOiffxVwx62IkrSPgvDWaGaJ7ySdqtDD9ZXhBBtlVr/8A3+36oVf0LjQmm9KOYvA+HP4tcb4OFEfSSpDy2puv668QTn2v/uhm7cDP1W9fVld+DbX3BF3fwyxu5AxyJVQcKI6iekSZolz5wBHprZtTTDL1gBl6BnU/Vc4ImQ6jPEoj2KCc2smfEBFoRUuiD0IxharycZdaf3Qi5QFooo8kXiKV85FoUKD40G8Ep4dvvT+UN25DndCdYsmjovebIK93E+QJHpfT2ZJ0sRjmQcvFnXfj0k+wT/LpKudRkS3npbNeKT2SF4d1paIwws+IK4BlgxVkNkqs+vTGxpmDteVrHU1UQAbmy7PnUGYs+wHUOzx8iJ06H7Q45sRNTLtpaUuMY6KMgoB0Hc2wqcadoI8yn/e+79nce+uvv6su/YyrAWnV1myETLzPRBwXFIh0Rkx0lNU26hURsoewGfCf61hwfIZ9VDdNZxJb43ZAPhfooLACBUknlB3QbnxQjN5igL2cYPcA4ZluN0DH1KgDFKy1QpuKPrTIqcYs9uJWTbkJjTx3iDCaso4HZCdsi10D8uKqToq5KiCzQD/H0hHx5CVtR37sfmpZcXY+NkW/tStr9GO1K57+cDFYFdja7vSbsMnS1NRivXRux1gZyiNipbMiG5RKwbBLsMGEsnHu0R8UbMNDOVyTkUeqM8kGYhwz4aZmE5LNQY1j//hFF2sQ+04avwnCf2uZb7T8ThkDUhyMcdOyCcaotDjY0iIR4/ZV0S0WDP9atpVrQ6FWvAJGijZtbbdQqgaSQsFOZ2IZ20Ik9Bp7ginedZUkIeeB0L3hYXuwd2xjrI/Z8OEFMX6/p4uVRJmLTGQGheyFGyAuCbJtYZVk/QYO2Hkf+vaozxFo/jMzE/1dyUYFDByZcWkmKGfWVg63WREmktDL3iptBhveIYzeLOWkyp7PjqXFDSJEEVwPTATKzkLvjmR/dmc6yAyizf1wOWzFqQCizOYQZTpClFEQpdX6a85Rpbp3pgUUOxT1JxqJFoIQh0CSGSIQP6UrWsjUxvnf66vnmiFTrvsZntIOoSIN2U40MCXlsUXaH5apg2rLj7HJUc6r/tUzCrhDnYH7q9XVR4i/48xCfxRIqHjF9LCwt5eUpKppmYAdqdupbsKdU2Bi/cxlJeoR5eVGR7yB/AjSkFeETe1DxbaN1yycUlinUBcq+paFtyjhbosik/DIp4f8TFp4ac0WhjHZlae6VO5NCIt6gNZItdAcAZ39BE7N9aU3teXzQYamfvgrrZ7jpovMdCaM0l1QO408WVZZVIIqzQjgqYhVZkuwuHASOhiFPRYMaqvZ9joHFNK4JTvQ3d2FP3qEGmxIhU5OQZjR60XItoAkk0DOOtrtfSgMAozTeEvlnk4HGSIM7lucNc1VQ7OTYtOT2KqZVsEAa/yni1dX9F927lSfQJQjoR/3LVgjBkD2av5Rn/AIL0xuPd6rDS/62vHCjl5LFoDBk3fTZPowGpd1b9bfvFi/9y0nI1uWMg0Dgldg/eotWEPqSzdr508q0symzwt+Vuv2wGxSHiULxVi5lB8pk1xSRZ/rdZUJWnU4o7Ij0hMYkl1duV9dOWpPZWvT0bWjMizq8AUszu+nOAVvHwU4I0nCbkQyzC7Oz80EX/TneIOwBlU4N6OZ5uPMWoNwc3lts8pnckgLvbMNmmgaQxh0yEB56DgibHQtx6QEbgsyAsbmR7RIdJBmuW3r2vp+IT08VPy4fuZBlIzamWfVI/dx7QgJ4zzLDg6XhVUNjMTD6Kp1q8qjNIv5mp/yDBuHUXlvcWq3V16c22dy73EEDQLZzb5hszD+fRO/HrmeNH40/uue9zEilEhBAnoUV9PNGhmZKF0mr7PKcaJ++U79xZ31I79Q0Pv6q9tCrSpmA3PrwEfiNzMamM1xMJlLigUhjnDQI4MvOqZIgItQJH6L8NeKWMTphEO0z9v1iBnQmOKT5SSRgBqm8R7kPDdHKWi0tpNE9wcy5yqo7CPrlPulAsgR9i4nOZbt2fbEOGihXA8Nx8enLVnt6BfzKDqyHFtzR1gux8UiUX0STlo4FIRD1g/dsRF4EFLW9o17ihrCbyqdbB6UM4IJIaNGozrzzI4aI4PEMJWTICrWnj6HVjk0km/sP2JGGGNqHUTNn8h5hFBjw6fW38gOiTS6rekJow35iJBXiX+y/LIpd8PXuWvPT8Nmr1zqzOtpbzce4uINd/MhLgcaLlYF4bZunIRIJJJKp3eGk4ULRZQEqIsIWLePGVAlNdGNKxaO++6UzHscbMtU8n3rpCKV7+dzuAKvPX1UO/c41P3C75DQNu6myWFifig2W1kMsWmq7Nl4M4rcefJ7IOxXvqU32Refg8D686drT49yLmDwjo0fHSswHwn5jb/bYXTOe4GiqN30wOmWNzbG2OTcDfTQZhBhAFuKg39S90vA9Wa2s9atS69TXn+ti0NDnvZY0UmitsvMW6CQRK2FwSOY40RiA0wRL8JnsRWTTBObxz1XRtrDc4t370I6pffum5n+dBrB3eKn4WxwA0AckCDbIMlw0iwS8bmJRPxkjgcrT1TbXwbPq6RfdOPld/QE9uJzXTWyneDpn8HDdU5jrk86pf3B8bQ4UyDu4d/F7qQf9Vd8xrCv9S3BQ8IRk+IqTI0Aj0qZeg4xtM+PjKS9mCIPPCpbxSmYHkWKZLLNFORYbXHqs4zETsCim1SRCna2IMVb2j+EV0NrRMB2c4bXV+/Sc9ElCg3EpocobMhWeDu7rXCtPnuE1+AYsVFiqq/PVa89I4vqgyv2mTUfFepHpPg3jIkys54hZylODAouD0cGRq6/ulc9To+8KIsB72tmtUSr2yuPZj/Ii0vNjvFAG1WZDHJ6OEhOTpSW+tXfGrQ8ESIlRKXxNZcvDAjDGVBtXLi+cRGpVmjknBL0GRXGKQIkAgFCQLY8IgfkIy6bf0MXwnrxeRgfwlsY3g6Pwu5NVqiKP1r0xkaGBIcrqdT/vkKhudZduHH1GRYOxZoAPNy59tpgdZDwbWNiPPletz38+7u3bZFZPIji0k6NYYxovTojdfcK+3Ej1kJ7TekabRm2KXBmGJI1dcu8LYO5nT393cKcRdn3BCO1aFgwCIJxc9GwRAAHHmzYRgqaxhYNNBzoP00dx9gmrRsBiUJwttt0M/YLlU99c3jISPvayink3sFVHEZhji//D7x34B/tYJBuee31m/U3qwh/0I0W+XT5Yy9P6V28sponKNBAekwU5uslG1ldO3+veupG7eJyy+C2vm+V/+oqxMWJ2u9X0QA3XIQP4WH9n+111/6DUztR0k4QrFV6G/zw34FPQkztBGzSvldCnaBeU7qxuT84Ah/Obv4NLKKL+OOl6rX7tYc/2Rf5vJGJtfUpjNjzJ3ejzFB5Cq/Y53kz7R097PMupDChdYJ3eHr3bjx+aY/en5AlfTG8jdVb1SN3Oa2GS+gg9Q8UFCpqK4lSy508FmonKsDM6GiZZkPXbD6G0iW6KZWLaE6+vRWNwos7uM3kxNQuxNrFwZjqcidjLmCK+jhhZHBCKGDrwkhQzk61DoOdnk9NzPf+mcX5yQXzOGCelovpxeGH+TEIpDmmtYj9hhhpvNAJXmaZyCN72+Jw0xM5mXgQHIXzo3p4xap6gbA2Qc8Os3oaGc4m9kxBVJvIbQT+48Cx4UwcIxW3awwgSDer+z6C9zG2wkbUZ0AyDzduc1ePvj1zj5DTEDtAowTGLSF9sCYEjiNSByu0RHj19F2Pm+Cmdn2RQrXjZA4qwXESN1a/qR3BDZ+ej1gtQlfw6akI7xsIekqRbm0pMKSYbA72Gj5Uiqib9iwj21d4liWTtYtH1l68Wnv1Xf3kfQ48NyyPKPgEN24/JsPRy5XqkcN4N6YfUXYV7p2j3BzqEQXgMm2dhd5R5jrk7U00stchdR7Ee0LNXud/JIUY4S7w0TLccUntFNxqYru0fHG79vx67d8Hg6c7K9c4EYgwte9qxWFFoRlCkQugNQI0SE5I/VdW7wtWjcsxm5Y1w4Gojh0fodx1vKcp1ZlrEMiiJ/YelVq7KNYeinaIxU7hGV1UZ5JzjRq/l+JfE1vCDkIJachpt80fqboadkXd2g+kWznK8DVXIiyHqZRJD5EH5vuGPtZLxZnaI5UjBVor0XVkBDfZG/pAA3kOi8LVa/TSEZW/zN8RZxnWGtssSeL6F3IijhFgoTaX2+UIB5CQhTMb38RiwjexDvBNkIdvQnnFN7HkwqkKLaCuxZAUi0G9KgdbD5Wt4kzRIGUbH24LKap9Cr0U1tn91WIO4KATW7Ifd29r6ATJP5m/qeQPJGWJb7LNdVVK+MMfzIVAOI6AfAoadhCfSr4nM9eo57cNvk4Q0SqaiL/ANV2ycnKinJYnRTBdcD9Y/ZIsfcevWu8JasdQFM6zx1CzoREF/zRJ/axxl9Qk11gVeaXhB7/FPThCE1yqeB74VjQ1drhR8hoZPOCyQ0pCzlMiQt2SW98TG1Az2gQE05o37JBKcZSYFCn++gt2EII1wsmLWSKOFYL7BYpGAY31otmXBg6UPfLEGkip3wRhaCcFj2LxHehX4GEv84HanRxVjGN3dcuejtvSkBqCzkBqhFY7TosqMrTJN0JJyFplKE5UchwaHr7IokuKUiKIwKfNXWJo6XEeyEHwFnbBpvXPGf45OtDgYvahXBkYqLp+XaKmOyV3aTC7ar62Bvj3OXk4rcUSDwBpLiZDJ+4cLi0Tu8OxLBIwaPhaslycL5wogwVJVbc14jNMVT0EYjrY0e/aVgnczDScoSKjIAdH+p3Mhe0URdng5mQuaD6CgXkEr+xGLo1E2MNb/GIOUUmJuVncnpBRhXI6i269cmkEs0FWZNEcCe2k6AzK22kdwmUWFFzW89QO9DrXBAFV3aPgmthKEUJcfYSICv3oYdh2Qsn/GiyQVCOZi8KYHqf4C8fwngI5SrNzA9BB49J4wDvn6jGYNajEPdkLX3vk1wiHurfbE0AZB+dQQ3LStaGxrdpk+zXoXbs5HEoMEym/lzIzW99zAcVpoSfRbW4nJcMuDiOhTgWbBndn2F9gl7Khc7EnK+V8ijlQsTPlVmugMZmu+FALfi9utr5MOUn7S8Iya0DIYnwV3LK7uKU+Ecdt5k5cfFrITRC3TXZs3hkrzJ5UhXFlZRnQgk4G+v5KG9C4S6uwk4pSGsC2wdUdT2YQRaypFbRinOKBrxmnChMuGCcKMXOOkcShsMPQUGAZmMJCxqZuYqX0XH2mxhifY/UVvCly5rIB5YfzSD4zkv3Yo5plHN7gSGCtoHJn/McGpRA8d3+qHUG+ZXoFrOvmecU+GRCrJwHaO4WMdbO7vnSYJElcYhf2i9PJ7KJIWpymhCQXPpkGTISriWDjA0oXs6NF+NTFSDeWTtd/f41IsoRNepGo/XazvnpZ9J9BTrW5XZ+L/jt2lHnbgM7GUfc2ZHKQTSrjyeP90plxGaJQf3EJYw0iek1eqTCBMApCvReX/jT9iVGEpryMSdsUZJyyfj3TlRNAItXIaDKO8R8NddrDpFgKtXxbsXRpHUjKO+kyq59i6hBufOQKghpwSYm30Wv5DOIyGbhSGACOMl8mJQLMG9Wjq+FM4f5JJ7oSg5fuQn6EeaRQ2Y+47GBqqKngPnDxb4ETWqBCYALCYmhtACHJGz1TsYaaOnE0NEx13h0jtehpHjscb+q9UYm0JD5Fh8tSXMfwF+ylND94UuHLgWWzQkSEWOovbyNEhZ6NIYXChaAeUbsdh9nMzu3FCwU7oVncQ3btUfca/BzZVCxbdQK0/UEzqaDVmmYqg2Jnr393qb58Ye3FyTC2GVoAHgTWTv9Y+0kL2s3M7J9anJtDQsiFmcl/IjvU3O79M1OcvWPIHmM1vi0tgWfCsUA0ZXjvtkSZ7B/WLBY173A4IRUtNPBWREKWf2xPAjQLShbTngrAFytNAW/TwSHN69GjUMeU7UOj4WQCtvimwLY512Jg+xUhdSjn+y+nobLVrx1EGkSO2c8XkBUBLyZHKt54ujie5w1MIRH+sX3lGCrkogX0tvTULnq2gkosQjtXvEmkbAr/yZ4vSSpNrBqmUfRojPdZf/MjHl0gFmHj4uHoK+e4hYooin2L09hNuyf3Ir8y0oR+iRSxe8NHVZSBm+PJCKvq/N//Ol/CHwv/y/vn5Mzf3kkm3+n6+19JHZqntFl7p/CJvswXKHOfaVK9ewy+bNMM6bwWpoLPyZ5e+tZlwC3+vfrz4fq3P9q0x5XUtkQ6V7bxdcizDadS/5ZksK+BvGthGhTg/4t/p/LWnGobSL9+72jtLEzn18Tv6MO7UK1r/o2BEb9Toes2fcTv6JP4KK5T/cxtBK3xFqHRQCGdchUGWa14tzDBYiJo4LocAIY/OlgaHck3WnJQaNHLv4XgyQ9z6iT/uQnU693i+0IsD2ekOxl9BM+aaIyIiUHTs8UvCjRmf+FRD10JzAaD/mbjOe1xlLA7VhqjOSJEBY2lZIxCbflO/fJtpGmun/oG53h0O9qYkQBBh0FCFIeqxwhFBvLW9P8R8jcdAmSGokYA5XHMiBO5evYJpZ4//0hs2KHZ/0KVSEgY8Ut+B58lox3eCmA1ygrboiTwQ8NQ151Qa5JQyC6iB1LbOUDQKmuuhLQKqRDSKn4BIKmGhIDEsg8BiV8AqNfNPbFNQ0Dil3JlOJHl462eumeze0E7TVSPPsDRzJuUK2mfYqdNQJv8cVgGxVigpO+acBjrl+U9zQJH+ufmIx3eggguCcaqwEWrFqLFrwa3veXZIADdSZ3ODMuHMDa7TBhsnuZUoxP/VFbci1ESVE0AcFAWnYPi2BO1b29X759BqkT7C3QC5wstkCFCOGiIYnUxJOJ3Q5r4yntthjR6DSO2OzzrpXypHP8cpuAjpJ9zqaAGqi+fCKPU7WHAu+FnlrZZhV4qZEAu7wxq8XbHTbABhaxaw4gg9pT+hUwmlxYr1UKNvv9GqBZlBDCV0O2DJ9VfEyoRoW+G4mc50QXF5gCU0Wcsogsx3GvzVCXZRY9IeNexfFauaKBbP/KADLkXbtVXT4sVn59FYdgpPIJYgOlp7l8SAEEVi5FBFb9zqKKBgSrKXHKw79rAfHUGBIp3d2ruXiBKJTIdY6KLSkKJMlOwUdOdStPI0gicUkojyCfKBrnVinDUDa39eNAuOrJgrKIGnyO0BuPp2ex4FM+uazxKUzkepRH8W1gmHbNZv9gpRMkXl4RInrOtq1z8ziGLBgQ1xzcUW47idw5VNCCo4p7NoIrfOVTRgKAW2tAqfudQRQOCOtAGqvidQxUNCKrIusg4IH7nUEUDgiqUVQZV/M6higYE1deOyagAxduv6qufrM6F0j42tJ1CxSm6HWZkq7nY2/bo7NQnc//iPOV0SJQQDlQ+IrW1EfOhajCGXHEIMC5EyU0F9Z3t5qsvP8NLKE6cATo0MuAJwBAD1hOq7H6jbW2Lll9U4fZIT28MuT2JVMIW7EEoPh1gxN/bYLEtl8MxCLaiP28T0hmb8MrwoIf3jaW0Cifvqzfrr+6+JakcmSGhj3+NIaEvqC2KJkG45NMbNoqTAxF8EmgM8n7eLwZ5P67jywgbVd7PC2wCrlnsiN/ueT8arKib7wxlW6W7Ooa2reZ1lA0A1/3wgsStcpnCP2+s41pwfmO3NmyOTa8kwkso1NPk1WkTYBKMTKzYDkZ2AGHu+siaVMuoEItwE5O8NTC96KgkEznoUI2gIKYukia8hSFpG/8aw4Ftb7/oBRqDXNgrYpBvV5/dCT4IkIOjo7mJXn2UdKdfPQuXOf+ZOnnpHfJZbyEnwg9AMyq3IJsZLqtIejw4OlbxTNyD4qKwtyaqnqOmLStMyEwNAF999gY11Grffl09tIJHtHGGclt05gsqYTxpaqbtMu+i+fgK2bTySHD5BHtpbViu3gYsnuajaz1xCb26Nvt4x3Dg7gpXJd3jVKpU34aDMs3NISnTWsVSJh+REL+0E4rzyx71ilwWVPGxqwSJLaul48ACsX5ZSm958TkHjCBQ/olW7O0HYRgp3Yki+QbU+QYU9bv1fOBmluzpts/WWwyUq693oqfNKNAnX7TQb8l+cSC2oU+bT2Q78Cg0IPDEmHovGiXjMnaD5lbhEN7r2ZJG4b6jqLVqozw972EmOGGeIe9GqSNTu9BsvURQsJ7q0YtO2ottTI76YtvKDvXJdkGpMQ8w379Zf3Kpdu/X+oOH4dP2qPBAIJygyBatMo/ch+fw7pw3CJ8taycK6BBLliazHSFaUEcUkbgkGMUS6SiDqBZOZMbPDcgUlLWrP9ce/dg+p25mfno3CpHOwNXIAReUx5/5crrE20H/CbJLn7xJV5ULt1zVhMuZDjo76gAbLhi7L6k9yOzx4s4a6T/nYQVuaEUImEcWVxTGM+E/nE6/R6sqAuUSuYHgF2tNLy86j070eHjrbzLr8x/HKtIZD2xaqZkGumi1GQ4OJUoIl9IdQHNyrkkBNWOwR7MKzlZy0qa5lNWJ1xKnNxDJxOnRraYS4JuKYI7gQe2pETFQSRYbDtbS0ExzrO4rFHsBK8OyYyZhrqpbbaE57CI67AM+SpZrTnM6xMWAQJpMY+ukTDdIUSEaSZsWyx1HmxBBfo9WR8FOHNyyHazyomOVd7ID6XGNS1CBMmVJB1xDroBn5/F23dZfEgynHYHSBLJ2E4C6d8STGzE7wpTf0jYE0ele/OChqBrQdvEX4xY/4XMv9Aa+ThZ6s1DBcHpopN06b7PEqRgan4dwsvjmi1vijKo2KzxKlVjcZglu68KjEJNBw7r+YM422tDp44Hx6ejj2oGDJlvYgdoV8SDT7ylDE0s7hhaZ2yDqgGAnghMt2Y2AHCrojHokf2oz69jcJoV6NG+VvWMI3NG3azZSjrjAKbSEZ/jnYE4chAenaZIqvv9hwgXu5nw0AjY2PROpTUyFnV82GSbf5FtNRgHzyrkZnQp3fhczFSmZH9g5FwHlrbPxhyjX5wJO+TB8hg9tcGx4SGjltWdUEjyMTxZ99u+d3j29iKB/NQlUVsI793jj9OXqy2f1+zc5sCyF8nvlkg8bsPitLJ0ZSLIawkogsRcVWV89r1sesxTm75X3UTFKDrugvE3P5AqCg0Em8IiTNnDeGvdw4LBFxofahefId0Ir3dO8gi3XfqNDQL0XOkSwdbYFwYQUq46bJVJK0I0vmuU0otx2G5tfXNgDDUs+ZXuLgWn3zsjAAuejNjBDQorPweZI0I8TuoU5+UloFR/83euIeY/63ZUpbTOfevbR8MrWktLKkKeZewx5b8WUCHXapMTSIY07WHbQ0fCw0p0hzJAqDUCdc1KfPZVQsU4yOd+1L20dIpNmtbkXo8lHOXsJljS3BytRQouCin3BaOC6GNQGrvMJmpkYqkHiiC7O5IZKvmBXdDC25IR19OtrlmDgvB0Xel1okAsnSbPgUPdhrfaBpCKoH3cchWDP2SAgPcEvRo20PahUZX0yay9+rl7/pf7q2+rSQ3yBzK9dPSKnlcjIVwZFiVAXHXYL6TwJR0z7WKJCAYmEEvETxWSDau3L12rbERf8TG6nOA0CeN8srR88o3MKZUiVfplcfmArp9oCCyI+7HpsZBTXYacr4hwnGNfPstc1HFF6ODOUR0RRJT9c8sojvvgd4fsVcdTXzjxGwnDksCYTI8XhUgorW3GXA0AyuOk5D7Ypm9ra+6zx3N/TCnmnhwvDylwF+JBO/boWso33Mp8gSmm3l0ZO0NnZSU5DdiLLP+FJBhmRz10Bj202Mj0oLTs1M7NvDyUimJien5rBW6AgtxcH6H8oPVYDxYw09dDbXOSgR7UsWdMDoePj+czoR6q3ZaCgRJAhC9w2IQuqK8eRPDc0BHNSM9Ozc7v2zyAvqO5tyXd/BCsoVLVtw8ykTKb3+2fC/LscsBEFsOC560sUhmWRTUatrhxymr09KNWsKIogwdRLoOw2DhsirPjChhkEef/+DIlbzQ3PFb3fzNbaks3Y5HPl7Cj7Bf6J1u8v58LwVf5zeWzEHx0VvfKKAWssP8R7I/euSX99GXdn2pIyvd7YLB6lzC9MznhT9Izks+ld+Os0JdL9dHKXsJ2PDsoFV1u+XX3wffXSj1gKpOKi/gIde939qW14NYL/JQKhtXJi48aRjXN3N346ryRmpj5Btjdz7WxoyAh5Q11d5hWvHTsLF9XG6dv6YVKR3oSwB2fReFru0nxWHBokN2EJP3kseLfXeDS1M/6RLiBRC46UPuP9Hv/sRKK99TMM6zfp8QzDbJhx/cWjtTcIKjlgDlvtpEVq8gmxnqLdqku/IVqJ0+ZP7Zucng9Mvd6nU3snFdcKQIt++CbEURRd7d6Jtug0ZJWBrMRWvf8aVZ4w9o1zd/Q0nJX0UHEACZc9XFzLFLek1/ml/AR8KA1J4lDmKsU0CgZLbc6QRK/abQ4GDrXij418APGuFBsGEUKpaBLRai1DWgGbflaj3JLGMVtmEWXrh3+pnnrKf6/4YjYD/r6+S7FVakoBOxw/X0RKbrg7BARECAi9pPboXO3xdevF5USg+WCQHVv8NFhwgKo9/h0llkIDiEt0E2yvUBwbyjneEA8qhSJyox8JrGtPj9WePq3dvxmixKvgvgonePSjj5EEIsC1Mzf3BZVZm5rcqzZugbajvzvR04+Uj/3WlIjC7GAXFC1b9AZV6TguIrNH+ygWqEp8XOaBmGHI9+VEh/oSWkGriTknMq1xwReK6caNC1R71FUZtOCnB/DCNZt3VgetKGdesAmRRS3ObmNiaMQGtjNGWfHv3rMaZu+AV0lAx+OzVcG3RK8Y0RakC+ntwh9bA69WRjvBIA+SCdynOFANfSK8oulKwtDsp3Pze6Fdzc3iwerevXisusv+y74N93oHEnm8P52fxfNSp/IQXsq0ARgbi3ZbM0yUa/bN1drBe1Em9sUxsU8wEewTURsWVWdM6xtox7RwuBqqyAKKHN7qKjBUiZ0sp7ER2nbi+/qx3wwkl9gDQYKhIKi3S2gTlC/o2hKyJECFMyCBBG+fv+WLytAo+OmmkYN1U5oMypwq0X86DyPEqlQKD4yTyggkF335LGKbBUTwVwTxgdg+SjqMvKKRCZf8pTypbhYLRXJwpMkgIWnMnML6JONMYS1siK5PTZk9zipfjWzH3a926SRdVBuvg+jMfn7KBrcHweJkQhfgpnC1bLwYguteugo4rQICvcqRge8dUaSbLoPlQ0UFbcCtUpINbOCESIztxp2fwfPZeXOxwnspDg8LyMg+LSTBkIjoF+RytKtGdAZX+DcngTZzC29uik9ESGzMEmV+TGhu3QjBAneDYHNh00mu+Clf88SHZCOqjwJfjOtz7emBjTN3yap04HScupnyKPDCeGYLo0XL0LER+quigVYoCEWJBWhSYAMrHBTEeYit8osAkM6pCZahKUIgMrI2LsEmJbHTflGJHw7KzMKzLQMcTIoVvhzsCCwr07kdY6jMXp5IqM/Im17VAec1pWn3aRmKI5jLDkSsqnBinCPZitF1NpKtC7AS8abRkQhpns/INFDr331Nku/BFfy5cXglqvXHKc6ZyUUYVr709s19gUJFuveV0EnLgBOhpgWbJUWxhVY51SU88HA2OJFoIj2TrkgpHkLQy4U1xj879RnURyRDCRKGBt85PRkFAzJ4DIzk5M2GYbb2ZwEw4D/Dz5sF/IPUtaxDBZFMpauUqdgAFZRjxd//TCmU7vxUvfcSutFwoTuVpyqdZy4EXX74unZoqfrNvzlssE2m+gqJt886RZ+A7NLcwjSxLeHgF+imUC3ESuqi9yPUolZqT+IesnHtx6ACpW6yH/p05svFqc8jRvu0MdYjJS8nNlqXUlhQLAUZ3idKgSNSVFKQcVFgkciDOzLMbKfDzMYjycWNJNcpkpwbiZb4JeCWzSb1/EZ16Rhe2HBCGvwKim6R/rV3etf8nPFc8MYfFYBHil3LMOBBAHRneOwjgTaIxF0mGJDJL9MWka0n1MF4hDrcRNPBeAyadsMxgoL87o38kgj4QLQQWTcjlUPw0aa30ZNa+IjqkyfMxvmHqJGHOPqW44WqERz5pnZGWmcBxCsGIbGUDU/M5mCjXmxiy45id08X/uh12w8iI3u7AfElpo8HcfUdjofDC4fTHE1X4oNMt6z4WC4LeWPVSpu4RFcrTbqSRLkyWkLcbKUyOsLx78jKWjdDpfSw9O5ZDz5SRJAZavWR4uMbKnkNp2sREpqjGsJdLCtWswWLDBcbF26vPb2ETA0JqEfrR/6ttAWChlrPgSuZBgw+sX5i8Im2BoLY5jEQRFsDQahiMRBEW4Ig74tuCLKtSV5Lxz7nmd0cyEna2/Lc2mx+qmbL24MUwSJLSHiPDu6QvCcw0bvuUL7w3wlyQu51HXjLXV1T6SLLxNzR1Vhji9KxHPl4WlDq13CBVD7pQR2CnBrhYsfpSsaih4YQMBfHopCs09INQ42ZkQR1GjNDZOnxLy6YcfEvxVxZiJFgUTy6WTvwc/Xbl9WVX2vLv6FmKJwILvMW5sZY9hDemU9/IAttIl11Txf+6CdrtFjiQ9nhstDCLBW186/r159XH6yIBU0ekf17p5C9cPf0wr6ZyS95i/zARGKHsvyaMUb4Oe6OHhqqByYXp76Y/FKBRqZbjhdbMQhqMtnC6VBfurO+hExPmpPVUCk4EprZ4aBM7EhtjkoBLaAoRem29cAGQ4WQra1UiJ8lf2QTmgMhcVvhIuPfESx+eKWVV8QSh4BWGCvJp3gwYSEcA5BJfAFuIoVnoHymwvLMnjGsBXmXBfvCwFdUSxKzTdgFSQJ7b8fYBSxCIFZxiMCa6jY3QM6GMLAW4xOYCL2YVgV95yMU0KL4xY/IOp3jBAM9fPfrT1egKxmPaJear3rXLgRdzU9SQsLS1G5Eq+CV5/6ZKUca5lJOC7RoQaWZUNIuLFrj3HBFvKkHBtjJaw+/rr1csblQ9Wiy3PTkZ7NzC4vTuxaCgXiVydnPveLU5OecQY0nwh4htEdtGHhVv/O6eudcffkI7+SPDwvi7FuX6vGz1RvfbHx/UVFJ7eu68TTSYX7sDQ/5PvINStU2Nyilvj9QTlc4ERZh/af7SDrdNJZR1P23t2v3mtnyeD+CtdMXPkyDQ2xoHUkbDAU/m85wtBYSxbU9Pc9/s5xROuXzUowY/U141Wjqjt6CTdaudYGhXCrmxe6wNNke+Nk5Z+WhXN4r5XNFJGiQUPxySQTjRCGTwiZf4AdvLZuQ985h+3G6zXkEA1Q/ziNreZxDymNZp8n3S762QuAMa75k/Olr1K1IbJy5UTt4OjZu24TfWQJLfj5RQS74IWTS9Tl1xUIjX3m6UiyYk0Gt52ioE/IKPHKT5wz/VnBqtUgqiALWA5IN1iAI2cb82oD9tgHJGIWMurKDqJ98UT99qHri8MaFE/p0lyZ8bwL2hOGK7/mCkb6fm+DMlZD1a7WPMvcEWYYFmcUDS4pZPMZDynFQjXPh/yTEjhrn+nUj9MpHX3ikupDew75CGRmRJVR9YO7l5Ngh8+rqWoR9xAQ31qyrbkpiI8+2jIYidKkO0ZXSvKHx5wUoTRIEW3ZCANwx0C24SZjF0ifWCCRKZJhZq2uvTlIYeONiwftNIJQVwVzaoio5B41FunH4KDkBTcDZFqtV/onDtmNGONV84F+h4OxJJKnUq21nklJcY2nLQ85OtOPNse85U+H4LiG38ev5OB5VJvL5is6kYsnP8mFb8qqrz6t3f8CRUn/xNfI2OE8HIy2zowjxNwHlXnJLZjT3seSln5YXSIsJCWPqL753znBkFlD0xET2ewv7oMxMzXPKyVPAv9V++AoPBM0zX2FGweKs+LxDMDuXrkBKrt8/tH70K2t1T9iHP3GXEHLSwnFsjKamULqHu+c0CHW4O0eCVEB4xiv0aYgvCjKHQegneFKu2ODxunmzbP/EfdGaf+3JyIfh+xPOPf/q7saBy6HWZE6u6omrG6cfWumt3oEgaCcG83m8rje1UYKbEGpPDSHbbSL1xZ6pqRmP0ryIEO8tVB2oi2o8BtZh5XbUdrRRZ+/WwA0Jt1nAFlPwzbJF44OQQHaOkSsvng90V9EjFmKZ0Rthhtpd4YitV0Q3HD4Aw5rtXRh0EOazCqrotuoer1hMmxmvZseLn/yW8Wrd48YraM2Uc2XOg0BQrP4Ot0d99dvav49trKJs2WveDn29cjEtC4sktjQvj9hsdiHuUIwyhF1MgQt9hyVlWlCb3UaY3Qoj0eBYsnXBAsrA1FlNmRgyNB0S664X6YGTMCr9YJceWahMIsG1pyetZ8B6ofgs+D55LRxcxIU8dFs4bNRYbVHvhVYxlpIOGQYidoijjxK+CXo5GDvpreQadwhvyMlVHCAhucpvUBFGHeovPTx4eWD9zg2YNrUDmDST+enP9ix6uTkYL+b2Tc16X0zOzypvlvwxeTSScsIHE46agvhJ91o6wZvkRunqTm/0pdYFHUisXEIjLtwteEh/WTrhVMPyaSh45lBtoh7EvzlhlGJekhRi0t/1oU9+ZCS9ZfBPynCCY8lsAWOkRbzDUPHjPxeHChXz5KM4aJ9IhB8U00JxKMsptTTVl4/Xl25qEzsIz2sW5yxu3MLqjpxnfllExhJEyup+lowAj5dghQ/TmyXoYqJ6XqxqNUlvs+ZmYLueh+1rf/NCMU/avunN6SfrjesCo9OgXkvM0t0HW1UcfrUn4edEWaY60Mdea0b3L3rm9hRYdjlkM1y5rqE8C+ETEGFe6GxSc05tabwkUrTnwqgIOLeoNlZfayvI99BDWT2+j/pTIprWgqp99Vvtx8fQAW31rlhNFyKa3m7thyY+u0BR/CgdOTU7N72bakRJHZBtpDPPcOWqnT2sV0j1IdTF5g5G+8Op9XMrJJRNxTMxUU1RMTi9ezfE4W4SjHsmZ5W0fRGadGeHocN1jLUSkrAibFP0eJoMM7tbXKNp8LG722GaGHbbGTABXE6oO83sUWMCGAZHZ6a8ziwOhNnBOg2zY3sGKK2ciu5QAdonhHKLggiZnsoupUY88IvG9e7pIXwydx/zEuroLTGbeH2WT1dkTu8tfho3HB81d4MbTpgVDlcdo6ZAwRKTSnPzNsTpj/46okHYnEDDJkkwdyLICNibXfzZarjUm/OHxqXVNI5Oewly8KrnbQjdPK9CGgSvIC+Mv9adOgnc7OuYykb5LfsWXXFpQq808efD6TJZb8SRD13S3iEoSMkqw1iG5i+aQQFuCen+xFZg+XrFpBoBEMlqzBtogX4A6wy7Q/ugNp2X2lKQZeQSW1osquIsJHwZTkQUYaL67FH1x2NKxmEj8Sm6rmkTbtgVKMzVFKqySdJbPiNT6MrxDeM/0H3zBfI/VBSaSGiHqRQNADxsqS8fDuEFT6x4V5vXVvFBeJUhoRDmPpZJ4AxFQkiS4BMUIVojEXfUO2nhROc+aiS0xnrkP7ay3ujSui/HUM57Owm3T9R585ASE7/HfwUG3ZNBGbU348ko+BK07slohax7MgpxnoxeZL9JkeABJxCRp0djF+BHEYy3rIsOzKJ33L2bVGjXbswi2QS2oU7CierTG+tLb2rL5xFvCTMcUnkgfAV/2kBVG+Opm6gKfjmdEeLVEorri60yhnoOTRQJC9qaYyXTqVyV3SwAnBAH7dtR3RQBYP629wMg+Fv7ypJmgEJexw5wzWgflo+dDbM3Yc5Zzo30SLALt2QHuru78EdEKeGN/1s40yE/OO54dpjTcXPs6KPTkmOJY4cwPZp5E0okJzRc+I4KoFGBifWYcs6TVQ21HJ6GEMdWbu6QCCGGXXzsghAXh0JCJEdIrXatZHmDaGNp+NRkUkeqSLpHdGRoKBB+saGDGXHg1+9C5Ox1yJzO70F2AIJy7eJE+BwzKPDJ208wdfbyFed0JTRixdJHvhgszzhqGRrrwszhwdvr9lkQAVt5D50CzV8QhS2WJGQW4pdblDiOCSE4uSz/GKB/dYNKJB29As9PNKOpUZtD08fQ7AxyfcVpRfZKateDdfdMNgK8jDXE5EE1QFsNI54FzYlrDIo/rI6M1NRvsDHEOBrxHI3M8WoG+4KPmimuBeAY/x8eKx8R0mDE0fD8VzkHndKgcJpj9wel4dQuALhLFHvZYD6ds/5racAFOzl4C6qz0ARNS3SFJkBP3Exogl1+CEowr8G9+PAEDGNQPhS0I6GCSsevNm6iR4LET8tHKF4UFOFBPubGftUuqkZMBXthenb3wp7pqZndjexpCRh4zSNDzsRyuuEEK0wIc5/RTLZ39b2PCwujrkHQst0M9rkPXlSiJarkQXlC0ZXqkfvp/3PgYKZ2+QFHa/ngEM0MVRtGJNbvfY9sFhxDODBlXIRdvnJtPwv2+ekfmIXGC1VOrB5TAqZ3FlOirW74LzkWO8Cw7gpKN1kHbtyWtyeR0wTIUYCzTpnX4ueXHRuRDTI1ZSN0odfEL/CegfpsXaTmTmvN2tVTJ+o37/PWpfKY5FYw8w2DNtZ29e6z4Ia20WpjVuB1DZbHPFzZBtMjCM/kDRp5FRJjfTK+BOxyiUgyr99cXX+D4EnVtxDZ7ot75qcW9sxht38xNYNEPigRQ79ySvK+9D7igFDetjX54XrbhuFGvcMcFS7BqlMTK/rcrU6cmnKOCKQQUCGhBDPegRnVw+M9mEYN2NZFGURCl7tVZ5HxmzQlZ8Zv1C60cUD6k1CksULgs0Po8ShqQkQRsm0CnU0odcHfqWlwiDWwacW0wuiWmB4+c5ajKjFtKIliEwFgEZ46WQlVqj33OqNXv300eKXo20XtgoWXy44gVI3b5mmx426iZcAqAKe8VLlx6mPCsnZeqRxeWC021UiTNj5o/YLl8AG7HGXp+GtWOyewGa5YtGZ1od6U2bLmCHBtwNKo43hCXsH6q7uKUhqVG+g9VIE/Rc3aW+7WxKvDZQxBqLqMo9iM71h5ODzwgTxIzCFoKgXbLRT17P7ZxYwP1CcStOa/ubRxCBFCZ6qrIlwzSuHnU3Dupof8TFr4xfPIYWzdIY7YIFS/MD6cOCv0yD+UvJvGfG5TS1bPPqmef8Q0ZkU3hnwcGR39B95O4IohrFPFifYqsKE1qpfWb76A841ElgkIjLW0YhhiyVo5Gz+MhETIxV9Iu6rluqIMlk9sIsqAjvrNRBkUXIEDWPPxulR0abWPHDB4HIcpQ+QIDIjHp0YGmH0GN5Ur83/BLzg31ZuL8Du131QFBFpJGGPj7v2EF+3O40s/A5wmQnOItTkH9MMMJDhOsxgSHGca2RsdZkItbsF5oNnT2GXqVM8zQu1YVBpq12nmvDAJ2Ma4KsSD+co3u5UZChmKQkPjcBj/FACaPgPzN7Kp7fR1KpS8YyAPXjHefHhyGgFAFJJOqbEmF73J3f+1f2HRvAW3Tzg0H5dFzmFZBmio1ZjQ0uQCknF95kasBYKOlvG0UkN8/SyldbxJLyv5z/6gp3bLIWl/WvGT33qw9uyUrYqLn4PQl23JPmHjD7MuqQGARhjBCBtmhtqW6uuzYHWfH+hJbYIgQOMjDQnShAChN2f+ttT2Ppt/s2qGWn/4ov7isi17Gz5tHU9u9RIejaF7W2obR2RYNyLOagvPjpHVitDTMgGOBlrJoBsFzZPAxllISgV4l2SaEYQqtGRxkS1K81MJk7/lk7l/KQAsXCEvBFzRohWu+DmMQFdWv8UppJHAKVq04pQ/FzLKCBlYxMBUX/1kk44KhwMegXqFMcTiUtEM8WtT/bVCyCplUedxmBgV0s8Z84jhK2lXYshMBQ58JaFoC8FiEgwmwaYYTKJtC3zxKxhCySWbF6JP1Xywhgxx0saQIdq2kCF+DealGekT3vHj6HlPeU8QR1MCyWv4Jm8wwJEzzwxcSLcYJKJty8DFrwH6VCMvMCfP4Bf6Ugx+0bYFv/g1lxUcqeOm9e+DtgSOUjEklw3q3cxzWjP+B9L3gtrRrlIBmXk8C/TKX0wv7hGgZGZ/qkJ99BbP7J8vl0TMWcZHspqWvP5btGZmzaG8SGCKU0gY4t90GpC7pxMa1GZ4Z2dOQkXGGvoo+W/4np7Sv608yRTKQ/YdA/6W+rO9x9ttYs9STjU149/cI3GEGrVQY66yxqOpzInNoqRnTkIiJ1DTETHRalzWDeugTE63F5SSMxm8ODLiRibHv6r8WH/1Gzw5cFzZIb0lFcqAza5v2KHU1+7lbElsTGR8Wj/0KtyY9dWzfBTlvZPzi96uPZPzn+FVkbdvjv41B42aNxzYKoP+sqVUX0KcmBYpSmNu3Ma73BfIDhGbXWkIz1Nm4FUwGZygzBMZe/BmRAI2PNhma/tYwxO8gvQq3a5tLQeToVAsZUlhbGYlJ4UCsEGHONw0557EiOIc3WF1raCucJwu6CQCcIIaXJ5Aa+jRaqGZdRGdIrJj1H9HLTaqjfZWdAzC0Ovtm5/aNW3ei9BNXyujRksGHMp0wKGQPcE95q3IsuXJPIFvKJcd2zQhwX0K4b3Vb2+9S/k9vr2Fexsfi3OuAmKoah0S4SY+mU58MTX1+cyX3rueSUMQ/Ouf01NfCJiDY0puNGicJ286c6Ptwp6iN1+75vDfOTzftgnSvIVd8zCvcgzZinzBD5UWtmvn2/1sgMCR7c2cADBpNSoHVK8frj0ky6ZVpZH4sP7D15yM8lhmood/3Dh8gkVjJCiDt27kKe//5Iu5uU+lDAuvmOFFRQvOIwI6wF/aM/VP3iyKQMhFgiskhjKwaAHSuCUfRRbWqBZYzW2X0xkYCPhnais2im0rPlPbYXEu28aJtWfnq9+ety+5NSTDc7PTlI4LNpQFmRbIx+Pfrmy/9HmYsUgTSoC0unSrdgH3vAfVQysJzeQRljdFghLrvVRtHyo4xWARHEc93cFFoHEnRExXNxVZ21j9pnbkFCJVABCi1tqWjAp0ZePCdcGWcsbn32xHy8zayZ/wLJ63sG9wPGdfm0hM08mVd0FROokJK6fXXjx2YYS3wxumHMIobD+Sz1ZGBfX58oTM2gMFiep3372KyB0Khjh6y0ZD25AIKk0PQ5/QjfONECg8JZ2i2t7ehMlHQTeBXeIqkC0KKxuVKzt6q377OYUP3bpavXQOO4tMk4pLB37EMVkR3kKoPTyKdyfrr5eqR2+HcJyBU+mxyuhwujKU9Upp/wMvXYaPD6exN4YkaRJDmFHIpdknu7DWAivEmWe0sF78gjpejZhB4U+jgcAox2ew7UgsCoUzIYXKLdpwTUgJF64W7ccuNEzI2zFSILXjFp/fhhYnK8xwhb7tRBGqMn9wrAKjOWLNwtDfjFheiG6bJtTJCKRslaeafRkdhDnVDhxA8CFfhSal0Egeib2GqAbilvxAWWz7xBZKrmVuuxQCIn4vlktDIs+2LflhZUvt9Le1S0I9K+YLqFGCrkpMVVFLfmjLocQkPzQQ2+U+LFKQCGdDQO3b5TmUUUsGR6ozJG2CbgrFrPQVWnL1PIeGCUofzJKSV9BCistOaKepmUJQAQLQQtRHAVMoqUxOyAHvdeQmpEKyyeBwr16+TJq2mrq34P9DSQls6bD9diT1w9T4RHNze8mRlQ2U9B1Jr2TvB3waK9II8Y/sGG9lqHEsgYCa1CaoSbmoMXh6OPaWUfdsAk9PLJ7eWDy9m8DTG4tHWFtbxtO3CTx9sXj6Y8fTvwk8/bF4pJ/WyjKzmnds3QSerS48PtJkaGLNmf2SD91kmDN7EoZndzpOg0dbb05ElDrJXqYEyqL2RNSUE4m+pNTFR0uySxGL6heVJ6ICsj0aJVmuZJeFYXcYoeJ0jw/CiI9d0NyvPrBrW5Dc1iwZjRb6YMScyTHRWXIJYOOswT7UkMkgCYPGIoy8q+Lggrubs0wCDVisNb+oPXmxhOFSsNknL4ZIY/bp5MFLUdgkLEuYWYQPtJE/U1mn6iMVu1I7e6TSHIAtTxb/PgUbQwlIN/gcqTKLMakyiw6R0+GzBl/wAyuiD+VMk5Qb3zpIbPIaBGbrD9khj4pZzm47J2FuTRS/RtwnxVpHjTpdTrlkpGCHGTeR8g6Z7hrKcepPXZTkzf5TSTdpqNW0ApKejVSgAblRWqMGKPP3E9XjS9VTv4ZDUK6J2CfSkmg50yYXaHNFtUsF6he11J52Nb19ak97Ctlae3GZPQPx0Yt38teRrdG+kLbGyCCQHz/UrjyzsTKw+Vh3hV1XfM34RS2TZyBWWl62mNltyeRJJgw9nWex8ehFS+dpu0XSWHKaREbHRry/VvrAcANvucJXDQQ+yNxpEppy6DRiTdMiCd8uZ6chXSsy4LcfcTSRJacpbsTiJAiPj3DImGO7FoJVcOQbu4vsu389ZorY4DpV27HBorHZjCwOPqB4fhSwbCLzn1CrXCo8CQzNjbxHmv083ByuzLZNQyk9ALSbQg8kJw4J5geqQGccMumM3opBY/liIrpgNs+iMFePmGSwiKo0UQxNsF5WKeurzLTgXjjaDaKT/WPxGbZ0kvE4dlNRsd9WHqllX+OWUcgj4bgIl1H4UqojYdtcXNtQBQsMbrstsXXbrUG+tza1BP84m8f1/NJuvioKAB5taqYSLBmZc5YPF31h66csVcovStIpq0TKVLad5bElSh2bXpLaeXpcaCVq1lqrM3SQtbbY8i5RCy22KDiP7GKhR5eNJ49B3T3eEBI7+vIxofgBoEQryWQbQ8CtMj6Z7MzUp53kkoWmzmkLB9HJE0upXZPyPxgLM/6JZdNGEP/A0qSIdRPfPkWs6FvU0rvaBe5K71qMS+/q04sKnRPqawbetHm/bfegzWASG8lYEtTDYxmVCEXOSGNJsGeGoIRGIo42u1DUoai1K4zK/1Y5YnH/ynGaAuzx6VnVW1Zcdtai9tTObjr1qR02siM7a7GCi5hOdFiznG6MpOVaBTJ6AeMdbel1rQJo9GoYuLq1HOC+ocdxLWwhSFehNPXPwhReRzszLTDtsmo/TAsxw0evQDQXj4bRL45zkj8qe3x1uvBMEBeVq8drl06iYhdNV6DEdYLZL6pP58xq2sTTOTorNvN0zsdh4hLA8U/nmqK3/cM5g8WxnDp7OBeHzf1sLplCzjrdAeqXyllJUSNyK/TLRheLGhVi5C4FZgXBdgJmS1bLNuWByJrrkJyKDI43qQbvwTqzrBJiQbndSBpih3k1QGlEd5usvbodtZxwHYHPb9auL1WX71nPRJCBDZNj/bmqsclmUVXLQmyhXLNdfrFREUKTV+aegQWUatovGneIXrxzSG2nO37My29YopScsGY/25CfMJRmE6PRtW2g0tIdx+OyKXIVzoE3vQ17of1LJHcvF7ZAraW+1VG3T31LZWZMAJEj9a2ay/bJjTa5bM2CjE9lK66ZWPydpLJNbikURfwBUtUmM5xTUYDuVLUF8ppVlL54I/8HUspKN5qWUdYgV8WAQN5Z9liJlo/MoOQfSfCoGG0gUAc5SlozwZrVrGYkIW5rUx+Lvk2AhI5b5CfByJV0tGbkm/M1FsTdpODwNXaUjrbo9DUCqmNxRAkOontsYBCf2UIIXbsnF4rIm8m72MUQZr/kP9sX9WahKZ2pDp20KFtFjTkoVf+mSVJijnhxjqrtnTU6oFg4a3TwIdkcg+3uPhp+SvCi6g8yqYxTeXDkk9HaEzrHihDuX6kyBDNHpodYZYGwyOsqPnK+2ZXCMSsv1X1KHCy0FA6O8GpxEpSthK0dul/I7loySrO/KVT0vyMZpRmCna//hlyUhaKaPjKW4qh6zBnQCXW8T8HlSgfP39aVbhnUgS+9qCWPtEeRSR5pbt+JZG5QnM/NNJLFQbUBgd6Z7JeiSIDvaQdea0DgHRvR5r0MbqJKbvwo6XI21OACGIQ6Ks6pHUyu4IKOM2BG5H1pdIKqW+aL+TReacuYcixoLfOlYXk0zw0WcZuEj4IxJqHxDImuLzpPfGnpcczT5ghyZKAkDEqWybYjbp9lshA7YleSST0ao/Mkk4pmoyWZNOP7A0kmOzgKlByTBivzS4uFEvrJZI5JygspBmjPsLDQEV1vN50XsujICwlTj9GE9byQxg3C6W+S0/BR8BbQ6KLOCfmzlm7SLsj4dJOR46PDbJNQe9387MQ/IaeDQKrmsTCtZLx/IiKt4h0UBVcUOLQNNTWidgzZbINF9QQKcyUWxpP9MRcigiG0LbsMnHQk2I0oFKiKdUGlQ1yOAidvw3gHVyyNFzE0dPq9dTJMw2P3MayOTztuG3zWfouMr3t7Gz6n3oKWt+R1kxbBa7v0HMcS54m1aCt6RIMnUt02Jbqk5mMuYYpxUbvXBIXAqO6ly6ypdoMGLxFD+MjwVK27PRYIaUeXP5MTzXH70i9/2p3KIG2TDk3rZ7Bz6Wv3rQN57I2snRPRoBNyAjYNJdulkfZtsl1aS1FcssuCy9sWn9jSAHbltSwUtYSU9mCPS0hZ9D4Yyefb5aFU/PQFJGZ02JviEzPymS0U2+WXlD1cDqbN5WbcpIOp4HIwdZib0cxfew+TQeOQYZ15mCJHtUSnupiwIl3mqvW2mRftuoxPvKgsIOO8d8g0fZ87JdvbGJh853uDUyc7lOVNqboZUW7CExzCVUGsSciIQrnXUYpG62YwO1aWhtklVjt2jhmEUrQS5/metvJdoUKewgaqw5ylANAtWo70jEZgajkS1fSMbXMkKq+IYRlGZkh9+BpiNTljB3khlR1XVPMsEudj0jMi1EftVpZpwwJn4JtLGxdurz29VF89HWdUg2Lc14XUGc38ZpwpPhUllOvVqFvMg5So/vwzCrnVfz1Wvf4rh1MsBM8G0pVigf9oHl1JJGAKDN2tlQ9jkZjh9NmATOun39bbndGfU1ayYzv75QpeOY+SPoi3wDNMSr104vvq0qGdBIXTjP4J+p7o36o8D8avErghr7+LwkX1KAJknkglcuM+x0W+3YvPEQtCVsu796uvvqc3+a+/qy79zJtS8gpAQKap0pgwLBoCELDqJKA8KgzPSAxdO3m6+s2T6i+nYT+wRZ051goKOEwl5ue+QIKZT+eRZWkeOqfXWrNogXcK7zalnEzCka4MjvojYk2sH3tAxrXzv9dXz1XPogLmHQ41M48yMQt7PBAwnVjcQ0a1PXPzIg1NEtnOedd0JZ3l3yTCYGVcuMWbIufCkFcZpGff6WLaH6acFRV/tFiUAa2NiehxzkR6uDAMgIIBLGdoYuP3WxsPXm48PMGpgRNkes5L2/xIiTJSb33uFaYFH3LpjKfhwXcbxujGYLq2gz8wUi4TAk7eQKncDj6atKdfrc2Zz6aLxQSh5mjNL8jQ2QH6SNMOyTD389IOmcHMgOpRCYKEqR/7rYKkoJ1RVV5EFfLJmbnZKa/ZaTP0bRnEA64u/LFVBBqQ7NCYZsVPZ/QNIqeabdmeqExuqLRTQxhNsWezj4TzZTPo8WkdmjUV2nNzuz6ntC1DswuL8/tNhubIIoJMLA6N5EXfUianUmEx2xR7lqK2VIRom5QYwtpTQQkuOGU4JJQUF2aV1c493jh9ufryWf3+Td6tNeeFmvKiJeEF72+EE0KVmpFK+vsQU4lICCh46mFk1E3OOMRqP90Pf+OIoamZwWmFhox5WyIzumIIsMW+3QYZdDMnMskBHDrVb5acwhYd8KgTWfX1cz2Tq/i+usaiK504B1PSoeMYj81SaXajHk0eHp5aPsKG0BX8oh90eKYLGYqUbHog3rFFoiRHN0pb8kOGOeIpjcRMqtKIxF44EdW7P8AUpA+JrqpmigcnuuUd9/kKUpbyFWgf48qvlKKq9nQJwnrt6fNKahuSgCEluI0etN95HxuwYlPRVY+cq558gWxc9mPt3JXanevVo5cpaeaJh7Xz94Lvywc2Lh6IA2p/sw+F114srb1era58tX7gEEdun7npD4prj5erK0c/VbMp4+aG1NK29/rNaxuHRbInk7n0L0Olv+RHBiBL/4IAYfJE/AVV5s1/4b+x/w3+XRwqVAbSFRScGfyLCbrNjA2X8v5fwu/+4F8ylZGBv/Ah1K4QHfyrRR92BtDw7wDEW9toznBP4SJkExLZmCLFmyDBc5A2zDEEyX8O2cN/sKnIqi9XApqO3q4eXbVZynjTEEaulC+VxaCq91c2Xr2hgI9OgMlEaLHVkItmLtvMKSfYDgmLpXbmtRX98I7Bx9Ly/dRJSDV8550tQ2Xnlu+uzpZVHCRyKtusuWCxVdZt+v53Ny4gJdvV+svvNi6cGJSlXfPlrNpPWFgtWqTPFZMTJON7uaICGp2dQqZ8Tm6oaRP7rt9EKCRvgQrN4CtuYXEJD6lOt+i4fM9mX0WaRGsYCNavKbTOW1ORb/7NDpXv6i2Q9WvPTwYyrnHg2wxxkG6QYgTrz/ijt7b8Xf2rZ0LVROw1oyzYGC7KpLHOBcGUj9fHwaUVb7X2/DjddU10+IZ9338T/7xhabMpBN+1P1RX7tWOnq+uXBEw7H25ExjBkF2QNg7e3Tj/sHbpDfRvyuxoBoy1ULuA5/o/VBuJwmh1mL8rtb8oeJQTaJcSMrVXX16pP7oJMRKaWHjTYPZNgFsguHkTwm6uME6PTF653UcZDQjOcMzmb0/Pc8xUoIt/C9dUXAGwQC7BhnDxdn31LvQ6kuemLkp4RCiHA43U5P4Mpg05jH85xwlAo7DiJamlN1erJ4/VLl3l7XCC8k8wU1HOytXzhOjolfohYdqw09E8fDmE8od+oXdHSnDFfk/2C+OGBRgc5Qq0wd4dSaE5tXSyZ1QpU/nLcHasPJDo7YZHXQwtOHYbtjVwmXzdCo8dsJG1b8Ai+Ety955FAb/25Akl84/AJ/++Gz6BAxHberphUKv+eAzWurVXb+pnbsGgh1zBQ9kcvdY2kgtBAoE+dPUWCmavPT2wfviRAhmw0oNpzsNgPISP/wRUSodtvX3KVwsGE88FGBfMHAktR4wQN5dLF2oHDlLG+KVl1GEO3wjzDsHaXlqiv6xcU1K5AyQdIj+fs4/SOACkzyOJ4vKiDmblprWrY2P1VvXIXQ6OsD06V3t8ndVX4O1CDnGOhPohdEXeCcD7erujCX1pZXZ3rz09jOS+9UdXlHmG4UQeRdaGk8DhDgC9A8T17y7Vly80crcuC8wtPfo66EEGm3govQNYn5tEfbx+4wUd29/fr524W71zvvrVLUszRzU4khRihaTmNboTkQHLDr5jeDuyko1Y32z2OBWkEIPD6zdv1L59imWmzA8AC4kVdKMbkzlJ4/qX8pFfj5fKlqfY9htn7lZP3SMx8/JAdekhJ21HVjKolNdQbgaoWyOLnsnRixWnCzuxFxPVWz1wGpLAlsvmbezmaQMFel07OCiSIBfJ8olU2347ZL9oDgZ7VcbEV1/frT38qVHzW+yqHR9I02uwJw7/snHgqypejD25un7kF86AHUWp+VqpBAWpduBnq82DAIv63ch7TklEUa5sFRY2ThycpkTreKqXbllENn20vfSIoY5LjRCre+3pL7BV4ASE3Mf5oPQStiRkPGnT64OMnA99WBwfDBGwuPGvYd8OjQ+kluB/uaxiX4DHVan191YYlHugvRlx+uk5OP9GyUqwsFLvwhUk1hI6CLb3Nzqk3kU5EdGF6hVYeOrPfIA2TCXQ7ZvKnGEZNDo/1Lusere1j9Q784JpL6WzFUcqLFSkObxcIZXs1BESl0dX+Zg5ERYvZoo3rD59un7zax2IliIMwg51JEj5uP2Aw0J7x+02GGfMqCA7YHC3ucY43GJWztG27s/3Ku0E/lQ3Gm6BhxVO5o0zX/1J9IHTnH8Lrk5PbvyfAwexzHB16ugqB8UAfLH1ho2SF3vBiGpN4d8VCxtBPXq5fvKw03aB8hFyCEZPadMRoGvLj6Fq6nqmURZgreLsMeO8Z103uDrXl1C35KRyM7Z6qnVu64khAcn+DPUGMQ02qz9Hp3n70HEqOzkzw9v2Dnh5P50YKI7Ooq4nNik+9AzUfr9au7hscnL9quxnIBD6Zk8LoEyHkDD9UNciFHD6QHecYx0/gwdIyr3+6NbG4ZW1l1dqX1+GtQrf1x9dhiJZvSPODfwGtLCplNIZ64+pPlhZPyMk+4cfylUSrrs2Vt5eOoWWbm1cfkh5p5d/q167r9jQPvTlNg22Ehba0Z+R0Sg0g7wLO2Vt+ZpV9N6NK4zhp6VQabFtXDpV/fFXukMaa9IGDP6Ny71VarQ5+JVCUKpLvyEw3dozbCEI3hSOH8fOokcEHUFAxgIOtYV6Y4wz0iKon8Fb+yNvMX4Yr/A8SR+/X5KqILEsEhxF6w0xMG++cUKQg7ICp3Mgfd0TpJ6du2JuzHQZhiwRg2d2cv47CIUJCKvIRr1DTNMiM24frampZEb1bM7+Xj36sHbtgFKIhY62aydR5yBcRhySPVshEuwbNOuoAur69xcU6QIwVrrhxGbhRRwwsb01ACks+Mabhud7p2Rs3LhAyf5V1tgFGdRUMUFZHJ1xCNoqONd/CC7ey8cgbjZO/1w9jmEjZyZdjEcKWfuFA6Ch0RvaV7TU75xCiM36o2eYf5zKvKkdmj86WhDKijW0VL9+U//1Z332glAqIW/AJqfEUSaNKqlzujCE0PZp7ddxMcNojTvZBhwhWEyyckHtt5twv609P1b7fikMN+MYBz5K809YcuuvbqdptzyA7eRIqNhgEKQmGWfsB7480AY+yuiwMiGs+rUnG0tPN747CD2JgRNq1cb5F9X7L9ff/Fh/gbqU92C3rx5eqR2/pxwL6RGFl8KzsL70BoGNnET0dUmaDiHYsxF13jYunIKeTIazRrQjR4YpS6W6x2mFnjxGoX+Hn/MmOaWA5fWbNMXLh7dQBK7QL23dJnquuXKNQ6Nr78GLurGjACMZbx9uenVzVFe+hRqPtQYLDP4CB1z1griGbyydRnFAxUlY+VAe3mBIeW72Sxz7te+PcGLQQayK9bv3Nq79qLfPj3EI2AP11ctd9Qcv7N+CYKAHK6LhsbNkWDl9u1NhB8KhtNuSJBwYTm5Mb/3Fo7U38O9qdqbyaIl3anCefyclDcXrlo/Awp2oXf259uhHKMKwkiPPEG9r5atuMsj9g7ceSCa3vidupvmsEmqd+5h3hjVa0cdxwitfa8sHqg9+5BBQMyaXFVuv4Gtfx/LZhC80aIo8+4iDRR3cnPhYLMkgQn+4nJAxzPgopgZpwcpNNF0LC4t///8BUEsDBBQAAAAIAIdO4kDRXDK2iAkAAPidAAAPAAAAeGwvd29ya2Jvb2sueG1s7V3/TxtHFv/9pPsfNlt0ykngtQ0GTMHVgu2WYr7UduCqu8pa7DHest51d5cDVFXiiElpwymcLqgkwbmcEuWb0gstNEdU+tegXFq8/h9udtcQL+DdwVErr3kWwvb6zZvZ93nz5s28tzP97y3kBeqvSFZ4SRygfR4vTSExLWV4cWaAvpKMdvTSlKJyYoYTJBEN0ItIod8L/f53/fOSPDstSbMUZiAqA3ROVQt9DKOkcyjPKR6pgET8S1aS85yKv8ozjFKQEZdRcgipeYHxe73dTJ7jRdrk0CeT8JCyWT6NwlJ6Lo9E1WQiI4FTcfOVHF9Qjrhlpo2KjnnOo2nPfEHxpEUG6eX8PqZKQof6s7yAJk0ZUFyhMMbl8Z0uCDQlcIoayfAqygzQnfirNI/eXAjQlDxXGJzjBfxrsNPrp5nQsVgmZPxFl88kj+aVN9f1r9Q8L2ak+Sk+o+YGaH9PsAuzMq99gPiZnIqB8Af8AZ0fU8PDuCPMy3inRKOVQ5IoCryipvAtdXt9PtxK4+dh3CYfbmAfjz/Iwxmfzqy24KsHX/5v53ENtd8AWsV3nuMzGYRxOS5s3Flt4V9W/v76p//8/Oj+L19+XcOiqz6LzpP1v9758fWP/3q1eg3zqmGBJYHV7cxWdBnyMJqBhYAWVCSLnBBHWSRjlUVnXXtzC9164VNl3vzeYzA/RYCZZlCWF1FGVwrrtyoCqQVBzHtSUV7ADQpzKjfNKUjXlTQnJHRl16HA3cqUqo5K6BRol9rYNl9f24dtPq+/p5+pqdJS/3lqxHDW1FgLWLWycJuvs8uxrr+YLwuzz98ZY9h241+UjSUi7X/4bE5S39VKe9qddfPzu2eTlF8WtdtP/AQ0PgIae5KdXe1hyaEqg8ahKoPGtirt2rpW+sGejUljy6b8YkkrbpV3iuVHD7QXW/a0NSRfkIKIoSTC8e764d6qdm1Nu31T21zV9v59uLdNXQ780bZF2tmlehoq1d1QKX8DpWzvyVRXXQbL2+WnK1pxDwNEXOLw+6XKtXtOJbBsta9f6n3n+pZWfFBZfYYlaV/H871zlqjc2irfuHW4U6zc/Qq3h7rsIKlgN6UVvzvc2S+/KGrFkn1rnj6p/GNLb/x3K06E2vZjWxKd0aMlWxLTyJjKWdksVm49McnP0wmqNu3kG1HfABuHLX0d694kNu4krqe+A9D6cG0LYhMPZin9xSaxc1vj34BLwrZbfLFmd0mqKFq91Hoo7pZMl6hdK+1iT8t+gFh+pn2zggcIPNzZEpaXH5fXlg5/eGZLVbnxlba7Zkui4Rqv/s2epLRbfmhfkba66eg94xZjH3F527auw5dLlY1dWxKttO/EpXLjWWXjW3su33+r3d+3J8Ee5MZPBOOC7moeEZZXi47YXX+p3blZS+g8/lc1Dk+QwW642/qD8bd3yZt+PmqO4GD7j1dOwPZXB4lak17HQS03aPvZJJh+Y52ujlzdYDXA8rvf8rNJMPxg+I2AwW/i9IPdd73NALPfAhCC1Qer/5tZfTD6brcYPdjop2CtztWRml7s65NhCCv8xtRcj0nACr+u8w2t8gSx2SfTNwjjO0WAbeM6v16qkp5HhxMva0I078Qj0UuOKU6pEbRoDQmfo5x1YfDPvk9kpOAE00vkLKzObSMc3r4NOPuyRmyNtKHbysH/yVRk+P0PkueQQ8/bcRiXM0i2wugPBJzBN8pZMSAql5Bk1dJiMsQ5jrOUqhe3PjslDhLpIJHujPTZslsS6dih8bF66p+MXzme5eIkg3sb5jDiHJ1nE/VYWtJaoEe1mxKF1NQWSk1lE+EoqP+JjHN7B9R4kAAys+0Cuu4ZUJJEyg9ztiadsw2xEywg6OaVukgkQgQguF/gfrXek0HZDJfNkOh/MEgNjVATc4LQweXws8y2LgomTiSdKEZjlBPJ+5PsmCPRaJi6nJWlPBXstX8IDrdqNOxU5YRJ4Dxry2ZnZjIguqMpLxYuseg+nZ2e/XQatK5qUM8jupERErHVeSAVVt9g9c3Nq28joP2nHk63Hc9gpayFVspi7MfjV2C5wG7Zp+nz+GMxGL5hrfOC7kIxyiaSkXi9DtBw+Gz0xKteBRBMO2vnInARWshFGB8H5Yfh5YIOLxMfgnPsauf4IzBeYLwuqPH6CJT/5LaLsLJ1xlptS25PmEhABiRo/0XdnBNrP6SgQFzjwm5Om0y9unP35/8+p0NkT6BMDg97zhELgbwtyNtqvbyteVn0sLGYJ+VJJNlkwkMydcZ5JpDCZRxmUD1MQBdiOBwmEh6k1BxlekHEoIUiBnoXkAsSUReIT4ynhqQMSg2Ln83x8iJppqReR3wiSVQHHKThmEtvvy7yqx2koaOY4PIFAemDDpdF6iL+MJTjZHzGUcrDCgIRwBMCJ6pUUlI9VBylJdk+kXgwSUxqMo5JikqFuUXFVkpJqUAFCOsn42g0VGd6gtw5j1iXKx5cKmvr+JFRbFuxLPH+zofbxcrtNa20iX8q318jEq0GO4nATiKWrfAb2UnE0Mf7+1gBsSaWd3YPd+7V1b6GczampqZIPFZwusDpasHjeBYXF0m0H+ZrR4fPVedrWG76i0R24Ec2qx95sPz8YPnxwdWnB1f3u0jX/PBJYeXnewC8I6hNfHjRQXEX/wGGbsbQphM27AtinuaZfkSqAcv5sJzfesv55e2beKpF1AFgK5Am3QrExNAHILp6gDM6onU7xXpbHEJPbOqeaN1VFEB02SmZpjntAnPqfnMaABDdD6J1g+R65hRCUBCCeusQlGn6rftp11M4cMKa1AnTrt/Tbj8By+9my29iCLMhVz9WqW18o12H2Im7MbyzXrl1E4ypq42pcSgAEYYQ5IAgR+sFOcz8xvLakra6SdQNwLdvUt8eJ6uWHz3AESvtYQmQdPOgdLDyTwDQ3QBuHayc/COCFJwMcDLc7mQwGZQ9ShJVQv1pTkhPyJT+NpwZoH1Bn9cfpJlQP1pQY4pqvFNzMj9Afz4Y6B30dgb9HV1RX7Sjyxf0dgwOdnd1BMLRzkCPLzwUCUS/oKmFvCAqfQs6x+wAnVPVQh/DKOkcynOKJ8+nZUmRsqonLeUZKZvl04hRCjLeHl/JIaTmBcbv9fUyRmnEqXP4bEU61G9y69OvRqtXjy9mzQvVhFdLBX3xsH4r1dJ2hAlenBEQIXF0kpBwaGw0OUpIG4skU1NRUmJ2dDDMktOz8Tj7cTLyp6MqmDMFymDMQ/36fwN5Zl6SZ6claTb0f1BLAwQUAAAACACHTuJAEouKHg8PAADglAAADQAAAHhsL3N0eWxlcy54bWzdXe1v3EgZ/47E/2BtBR8Qifc12c1lU5qklk460EktEhKgytn1Jtbtrvdsb0kOIRV6pdyhIp0KFI6TOO5UygeagwNxVe/a/jPdNPnEv8Az45d5Zj1+SbK2JzRSY2888/zm9/zmeWbGs/b65f3RULlp2I5pjbuV2nK1ohjjntU3x7vdyveva0vtiuK4+rivD62x0a0cGE7l8sbXv7buuAdD49qeYbgKVDF2upU9152sqarT2zNGurNsTYwx/GVg2SPdhVN7V3UmtqH3HVJoNFTr1eqKOtLNccWrYW3Uy1LJSLffmk6WetZoorvmjjk03QNaV0UZ9dZe3x1btr4zBKj7dieoGQ4jVY/Mnm051sBdhqpUazAwe0YEYW1FtY2bJmGnU9lYH09H2sh1lJ41HbvdSjP8SPH+8nofPqxVFK/RW1YfYNxQvqVc+valS9Ubymvk+EdL+Oybb08t97Ul7xe94js3lIoamML11ufr9Qr998VD7wCbifwJW4380fsgE4jGPAjf6nJ1rn3sA672y5eTG9mcrz8ClrIX1B75q9/O2L8ngFF9726sD6wxc3K9DV4mn2ysO+8oN/UhdJMa8VDPGlq24oLawcv0k7E+MrwrXj1+79XTF/SqPd12oJN4BRtN8hntIv6VIxMESz5UPRu+Jdc23zLIpYWZ3CnPWp0SlUDn7Pnh8bPPTv505+TLD+i1AlJ5/gLaUqs+t6cyWzp1IziP0IYwgZ26Ml5IrKLztn8aIxt7d6db0bQq/NM04rNUk1VyVXrXSDHYBoNtWtWiDPLMeb3eb53XvkW2jvN5m9TMhZlGJlu1rGHGTHbeqkZ+MpnM6Dyuea28m8dZo9TlSSZnLZohFuy6BFU2tIa2ukLIXVQXiGua3w2IwUZ+OkFcBv3uyup2daGdPKWFGv23SEoT/KcV1rpTDV4ydvGEhsGAv7ZYtyUY62xBJlhoL0g0ttLKv2W+uxYqfFGjipKF2M7s8Ncvn90nfa0XP8yjoz0HBubmcBjOxxp0qA6fbKzD3NA17LEGJ4p/fP1gAgP1MUxjSd0qKemVT7h619YPanWaqLIVcKyh2ScTht0tOp4NAhYdCBG7O/4fzHHf2DdgvrhCpwQqApwVXIytTn272qIayd8WCYue7nO0FcpecU0y7V6qLteanU6n3VxtVlebrTrt5TkC8J1YrW4WSuzWVjGC0bStrU6nIFt1DX6KsXWlRX6KsbW1clXbulqMLfDXanG2rm528tah38FpIMyxG4dm/DhSXV4lUaS20m63O81GrXj7LbDfabQ7K3WAUc1bqtH2N8D8aqvVbtU69WYt7xDg2y+oma1KuW5G9ktxM7JfipvzTsq+mlZKdjOyX4qbkf1S3Lyac87z3bxaspuR/VLcjOyX4ma6FJl/boa7jd4Yv6TcjOyX4mZkvxQ3FzQEgBuzpboZ2S/Fzcj+Od1MVyVgHWTHsvtwF1/x70zXGrAG4X22sT40Bi6sPNjm7h757VoTsg5huS7c995Y75v6rjXWh3CoBiWC36Qk3P6HO/3dirsHd+qD2xH61LX8m54qucivPfVaioFCSL0UYAYoU6/1GlNaWySgM4QgO1ep+JDfz6pOf71ms05+yPgkVaPREilKjRZAuIVtjJbIqlpogKjvBlZGRt+cjsKuGc7ySLtzNhFGcX45zuM8q+2gHVyA8dlidyCzuhCVyOZCVCCjC1GJRbSR3T3L2kZUIlsbUYGMbUQlTtvGvjWF/VehHn1PogoFCSO1TLSdqUUELU0tk7WtKV1SbEfTYHMCvZl5xn4p7Clcf09vM3d5UnP9wQCMLXrGcHiNDAJ+MAgHGHCDYWN9f4D2p8HOQbJ3iWyBI4dwd8U/9AYT3snGuj40d8cjYww7ogzbNXtkP1UPTg2bBur9wVy1TbrjLK1eRZ9Mhgca2KfWvTOAwM426QCJnV8JcLCP3rQt1+i5dCckad6podLNaxcCKgxA050lB6l0O+WFILVJd2heCKios8KUM6azev7/3nS0Y9ga3cbL+gq5scrOCuhcCDERrzi8yIoYBURYyGEBEdZoaaiK4ZgLZzkELMRpDUGEQwYRTpIgligD2IV70XRQIxHiYkkXVhLEkGHhObMwctYuybsiViWCCD1dCBHCgSwsxkGUOAKAgwNWIY2xoAUnCazmrEZwaQAKMhUDBSflgUJZngNVKlMokZP8w6giZ6VxVQfjgQN5VJBwElBpXC7MV2T1uNxHMowsGFGyI7mauTfZu5v5z9SIh/25ah3lN0KepChRiiMZWVKUKIXAbhpZUaKsUQPEknKJUcKxpCixx7mpjVR9HKPkBgpSocQe55K0rChJppRflyRXXgCU8uYepEuSLSXlEqOUN/egSARfK5CVS4xS3tyDPS5v7sEo5c092OPy5h6EsiFv7kEeb8ibezBKeXMP9ri8uQejlDf3YI8DYvnzeAMQS4oSe1za3AMhUriQRb8cqOLb+t5NfnR/v7Nypvv7yv7grDf6CdjU/QNh/d4il7fkBjGWLnmhJbcad/t+z7LNd6BusteAbD6pZNx7kAES2A6aLIK06a9lSQWRgTr9HocMlEAykZ2SCMScKYHMJTslEYg5UwJpUnZKIhAXRAkEgyAscwOvaCyhGwCC2MEHO4alvOAHwUBCH3LDxCin9C5NwGmRLIJNodsjwcjbxhZALM/tcYCjbpdPp5wIIrGtPE5J/vS3KnATBeBawq4EaHfoCIYM6qI6jelKuYwqogTJJzqOrjMCLoi8PFwXFy/KYALEGvSzRXgl/xyLyFsE4FxkBMD4IBU748q2txvqS5vyRbRzpoztbzA//bQPMkcgI27FJITVhMVSOvlceNKOYobN/eI98ohHSCryAE7a148wo7WU8knOiBkJQ5zHpRAGARH0MIQ4hWV+NzJIvXSB43ZkV0tp7cioIbQem+IRSYIL6bP+4BUO2cgQTjLmhcWuxHGz5wgIjRvjxKaqBUCKy91RSAlj1oIApnBWEkBgKpuyknpCngwigPM3JXjpF6c6BCnFqVxHONMA6vyr5pB+EgJGcayh3dlAYBIk6bsC59bziF/5ia1Prhv78OVJ7+up0W9hooEE0l0ygzH5d2GwyRfcE5FmngTGIE1QQO69CA954hgPZyFwgWDTdzhy4xjPHTlBC8z53/4VhvUI8NxBZaET5MLH8hhZSEdnBLgUdELEv5h0RoBLQWfkbtRFUWcEeO50niUC8SOQRUJMz65nwZsZYWQp7qx4uEFmJILnx19qmgcsQZZJxhjTY8pM82LXJzcjP6rTpUG+1nPq7B7De255NL0ZiPbM6kmaembujRlWG9LRxwxmxAuR0FTZx4bcjLrAyJLONNIJOQTFkmFtWXhTI2FmjEX3SCFyMbnw6c7p7zl7Gs93EpwBL1zCj3kXGRjSSESRjCMx2qO4jJc7xAuRM4TkxgTa5PR8UfpWiizKHGXE8J6s6hjeOa3n1yihflDEOGPnLBgwJj4z4gtDPNdvI7N8ecZ3YtnIgV6o8xjZJCOWWzbEB/5wL7kZJfbQzBhjqM5tApYqEoQcDtl4L5KTxMgv1JCloAR01skMx380KOamkXS8ixw3FuQEofCJ2MH+3A0RoDpB99mS0aJ2+S0Cy/lnYELysogAAjQ/6xJHjfwidbqWcYZEwS+Z+KKbkeoANCTkkmLGsJ1N1OcXUro7xF0yuU1x8llUJ+SW7yKSjrN+fraEXo/RK5cs4KTcbidELnZtMvD8yD2VFOP2pkS6V1EdSUgwlkZmxDGhrMy0jDPL/0s7iPgzLVLH+KPE0Z6433JL7XAJH3Dy67eB8um35OF78egp+Pwz8MNv0SvkZevdyuzJk+NH7yKgO1NzCC878kZ/UG2kwL3bL5/dm/3qlycf/jYoBh0eFaNvjp8vdvzvR7MnPw8KkMzF7NAXWc4XePXH52Dk6LPQCBl7sDL0rYzzZWYI2w+rPw6skUzFStIX/c2X9OChMmSHMytD3xoXKfOfOyf3nx/95mFghziflaGvIJsvM/vi8+PDFycPDl99+O7xfHno1ag8fbfVfPmjf/3t5O77gUHyfB5mEJ5CKvDX8eO/zj54/+j3d48++ntQjjwxB5XzXlgfvDXBF8bRx3dPPvlDUII+7xQVEdJ//OhTAHd06xFvjT5Mk5VtCfXhmVPC1EGfbckK1YRe8wuFgw/6qElUSOg2vxDIyeucJK5iNoR+8wvBpX4hXh/eu0jnnXX8/P7sTqgOaAK2Aw+jE3kLitx9GlrhFQFPhhMVOfzLq8MHYRFeE3X6bpt5YEef3jr688PZvd/N7tw++virsCyvC3h4msCcJ/lIWfpsPUZ9Xdinj/559+jWl4E5+qA7VESoqdnDZ+H1fNTwXqM937TZF4fh9XzEqAvVcHLrFy+fPA6L8FqoC7Uw++rp8T9ug8Znjx+cfPLR8XufM9nSh6ShNgk7cb36DWVJSayG1wo8PErgiWZ6Nbx+4OlOgmpW0qvhNdUQakrQnLBf1nlhNYTCimUlrIY+Q4uR2xBqLJYVVs1cuhLqLpYVVg0cobgBD/8RkCtgJQw8QANXgVCfsaywanjNNoSajWWFVcNHtIZQubGssGp45TaFyhWwEkbWBq/ZplCzsaywanjNwrtOBN6JZYVVwysX3u4jqCaWlbAaoAG7uilUroAV8ImXb4AGrgKhZmNZYdXwmm0KNRvLCquGV25TqNxYVlg1wA/qQU2hcgWsgMR8VqAqXIFQs7GssGp4zcK7ogROjmWFVcMrtyVUbiwrrBpeuS2hcr1hu8IK0aazZ2TBBKC/z15/RZ4vBecb62S2tbE+0V14gdWYTEcU//j6wQRmA441NPtwbfDmXP9laJrW6VQpKyoqCl9n8KpTadXkfzDr6vA2Nfr6rXDiAeLvGwN9OnSvh3/sVtjxd+kbAUGa/lVvmjctl1bRrbDjN8j7QL1xIHz14w0HXuIJv5WpbXYrP726udrZvqrVl9rVzfZSs2G0ljqtze2lVnNrc3tb61Tr1a2fgWxGw7Gztl9rdit7rjtZU1Wnt2eMdGd5ZPZsy7EG7nIPXjNqDQZmz1CdiW3ofWfPMNzRUK1Xqx21o450+mJRqGTNGcJVtt9YH/w19lm3gk48+ERZKsD2/qeNUB3yrrJrxMjG/wBQSwMECgAAAAAAh07iQAAAAAAAAAAAAAAAAAYAAABfcmVscy9QSwMEFAAAAAgAh07iQHs4drz/AAAA3wIAAAsAAABfcmVscy8ucmVsc62Sz0rEMBDG74LvEOa+TXcVEdl0LyLsTWR9gJhM/9AmE5JZ7b69QVEs1LoHj5n55pvffGS7G90gXjGmjryCdVGCQG/Idr5R8Hx4WN2CSKy91QN5VHDCBLvq8mL7hIPmPJTaLiSRXXxS0DKHOymTadHpVFBAnzs1Rac5P2Mjgza9blBuyvJGxp8eUE08xd4qiHu7BnE4hbz5b2+q687gPZmjQ88zK+RUkZ11bJAVjIN8o9i/EPVFBgY5z3J1Psvvd0qHrK1mLQ1FXIWYU4rc5Vy/cSyZx1xOH4oloM35QNPT58LBkdFbtMtIOoQlouv/JDLHxOSWeT41X0hy8i2rd1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAAEAAAAGN1c3RvbVhtbC9fcmVscy9QSwMEFAAAAAgAh07iQHQ/OXq8AAAAKAEAAB4AAABjdXN0b21YbWwvX3JlbHMvaXRlbTEueG1sLnJlbHOFz8GKAjEMBuC74DuU3J3OeBCR6XhZFryJuOC1dDIzxWlTmij69hZPKyzsMQn5/qTdP8Ks7pjZUzTQVDUojI56H0cDP+fv1RYUi429nSmigScy7Lvloj3hbKUs8eQTq6JENjCJpJ3W7CYMlitKGMtkoByslDKPOll3tSPqdV1vdP5tQPdhqkNvIB/6BtT5mUry/zYNg3f4Re4WMMofEdrdWChcwnzMlLjINo8oBrxgeLeaqtwLumv1x3/dC1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAAFwAAAHhsL2V4dGVybmFsTGlua3MvX3JlbHMvUEsDBBQAAAAIAIdO4kAqJ6ccYwEAAO8BAAAtAAAAeGwvZXh0ZXJuYWxMaW5rcy9fcmVscy9leHRlcm5hbExpbmsxLnhtbC5yZWxzhZHPSsNAEMbvgu8QFjym+duklaaltikUFKXW20JZk2m6dLMbdrc1PYpXj1570EcQn0kQ+xAuYsGC4G2Gmfl98810enXJrDVIRQVPkNdwkQU8EznlRYJupiO7hSylCc8JExwStAGFet3jo84EGNFmSC1opSxD4SpBC62rU8dR2QJKohqiAm4qcyFLok0qC6ci2ZIU4PiuGznyNwN1D5jWOE+QHOcesqabyij/zxbzOc1gKLJVCVz/IeFArUFyws4pX14RvTBsIgvQCcJrInEpbikDPBBcE8rNUfCQaIL7VcVo9u0Wj4ax78deZPebg8gO43Rgt8O0bUdu4A7bZ2Ha7A/wfgWFvTDwWlHgxd4sY2KVz+aC5SDx+/Pjx/YFT/3Wie8aPQ6ZFtLEjCo9u5zOfNcPPD9wGzVTNe5Pxuk13m3fdg/3n69PmJaKYgnKGDUNd3sbFyI3h0p/TCKn23EO3tT9AlBLAwQUAAAACACHTuJAEhVgBj8BAADLAQAALQAAAHhsL2V4dGVybmFsTGlua3MvX3JlbHMvZXh0ZXJuYWxMaW5rMi54bWwucmVsc4WR3UrDMBTH7wXfoeS+S7t13Qdrx2w7N1AYsuFNYMT2tA1Lk5JkY3sHX8ELfTjBtzCKAweCl4fD+f0/zmR6bLhzAKWZFBHyOx5yQOSyYKKK0GY9d4fI0YaKgnIpIEIn0GgaX19NHoBTY490zVrtWIrQEaqNaccY67yGhuqObEHYTSlVQ40dVYVbmu9oBbjreSFWvxkovmA6yyJCaln4yFmfWqv8P1uWJcshlfm+AWH+kMBwNKAE5XdM7FbU1JZNVQUmQiXjYJ1jQg5UkUY+2ZkkUhjKhG2HpNRQMmtbzvLv2GSeDrrdgR+6s34SusEgS9xRkI3c0Ot56egmyPqzhJy9aOIHPX8Y9vyBv8253BfbUvICFHl/ff54eSPpmGz0l85iRVLQOyNb8pgtbxfrs8V7WdgSsp8ACMcTfPGC+BNQSwMECgAAAAAAh07iQAAAAAAAAAAAAAAAAAkAAAB4bC9fcmVscy9QSwMEFAAAAAgAh07iQLw5ZBVDAQAAJAYAABoAAAB4bC9fcmVscy93b3JrYm9vay54bWwucmVsc8WUT2uDQBDF74V+B9l7XTVp+oeYXEoh0FObQq+LTnSJ7srOpE2+fYe0rAbC9iLpRZi3+Oa343Pmy33bRJ/gUFuTizRORASmsKU2VS7e18839yJCUqZUjTWQiwOgWC6ur+av0Cjil7DWHUbsYjAXNVH3KCUWNbQKY9uB4ZONda0iLl0lO1VsVQUyS5KZdEMPsTjxjFZlLtyqfBDR+tBx57+97WajC3iyxa4FQ2daSKyVg/KNHF8P2Vi5CigXJ3LMxEKeh+FhjAdDPCToIY6lPD7TEMPdmAywJ3BGNS/abHuUoYpyWGUhstl/kgVndjsmWbFDsu0Hp8QHKI6lV6UmaIM00zFpvqzbYg1APY2XkAPPJ9PQR5tcGGYSgskuDBOMc8q7cLy/HenQ8O70kfmpQ8NIx2zvM9ETeOk3Jj6z8mS3L74BUEsDBBQAAAAIAIdO4kB6XKMVnAEAAFMIAAATAAAAW0NvbnRlbnRfVHlwZXNdLnhtbLWWS0/jMBSF90j8h8hb1Lg8hBBqymIGVmhAGpDYeuzbxqpf8r1l2n8/jnmIoiptmswmkePccz4f31iZ3KysKV4hovauYqflmBXgpFfazSv2/HQ3umIFknBKGO+gYmtAdjM9Ppo8rQNgkaodVqwmCteco6zBCix9AJdmZj5aQWkY5zwIuRBz4Gfj8SWX3hE4GlGjwaaTnzATS0PF7So9fiNJ5az48fZeY1UxEYLRUlAC5c0s31oXwWBL4atT3+hG72RlqsziWOuAJ+8ODymaqBUUjyLSL2ETB5dLJG9frOGawD5GH/C0bOfdYutnMy1Bebm0KYryU7TRg0gaWhlSXTbmKZXe3tDErkCNQjdv6SN0N//Iu6nu7Jij7+65New9zVeGNwFFJ8y9dgvcGPXfeAwRhMIagKwpvzq19WAr1FnvgA6GwlpEUL8ppvMDB8bY0N4RDtLawOAAWXSHM6UjEHi+9m+OLLPD8K+Piz/eLwZPO3VkaYV2e/jn9kWeb/1Xvdl9zfqycEeOob+CQznOB96YQzku/jcHz78E039QSwECFAAUAAAACACHTuJAelyjFZwBAABTCAAAEwAAAAAAAAABACAAAADjIwIAW0NvbnRlbnRfVHlwZXNdLnhtbFBLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAGAAAAAAAAAAAAEAAAAGIcAgBfcmVscy9QSwECFAAUAAAACACHTuJAezh2vP8AAADfAgAACwAAAAAAAAABACAAAACGHAIAX3JlbHMvLnJlbHNQSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAACgAAAAAAAAAAABAAAADhBAAAY3VzdG9tWG1sL1BLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAQAAAAAAAAAAAAEAAAAK4dAgBjdXN0b21YbWwvX3JlbHMvUEsBAhQAFAAAAAgAh07iQHQ/OXq8AAAAKAEAAB4AAAAAAAAAAQAgAAAA3B0CAGN1c3RvbVhtbC9fcmVscy9pdGVtMS54bWwucmVsc1BLAQIUABQAAAAIAIdO4kCP85kFMgEAAKECAAATAAAAAAAAAAEAIAAAAAkFAABjdXN0b21YbWwvaXRlbTEueG1sUEsBAhQAFAAAAAgAh07iQJzOIPv0AAAAhQEAABgAAAAAAAAAAQAgAAAAbAYAAGN1c3RvbVhtbC9pdGVtUHJvcHMxLnhtbFBLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAEAAAAAAAAABkb2NQcm9wcy9QSwECFAAUAAAACACHTuJAJeBT32gBAAChAgAAEAAAAAAAAAABACAAAAAnAAAAZG9jUHJvcHMvYXBwLnhtbFBLAQIUABQAAAAIAIdO4kAUt3jOZAEAAGsCAAARAAAAAAAAAAEAIAAAAL0BAABkb2NQcm9wcy9jb3JlLnhtbFBLAQIUABQAAAAIAIdO4kATMtDsYAEAAAADAAATAAAAAAAAAAEAIAAAAFADAABkb2NQcm9wcy9jdXN0b20ueG1sUEsBAhQACgAAAAAAh07iQAAAAAAAAAAAAAAAAAMAAAAAAAAAAAAQAAAAlgcAAHhsL1BLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAEAAAAEEiAgB4bC9fcmVscy9QSwECFAAUAAAACACHTuJAvDlkFUMBAAAkBgAAGgAAAAAAAAABACAAAABoIgIAeGwvX3JlbHMvd29ya2Jvb2sueG1sLnJlbHNQSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAAEQAAAAAAAAAAABAAAABXSgEAeGwvZXh0ZXJuYWxMaW5rcy9QSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAAFwAAAAAAAAAAABAAAADUHgIAeGwvZXh0ZXJuYWxMaW5rcy9fcmVscy9QSwECFAAUAAAACACHTuJAKienHGMBAADvAQAALQAAAAAAAAABACAAAAAJHwIAeGwvZXh0ZXJuYWxMaW5rcy9fcmVscy9leHRlcm5hbExpbmsxLnhtbC5yZWxzUEsBAhQAFAAAAAgAh07iQBIVYAY/AQAAywEAAC0AAAAAAAAAAQAgAAAAtyACAHhsL2V4dGVybmFsTGlua3MvX3JlbHMvZXh0ZXJuYWxMaW5rMi54bWwucmVsc1BLAQIUABQAAAAIAIdO4kDAJB/Bmh0AAP7hAAAiAAAAAAAAAAEAIAAAAIZKAQB4bC9leHRlcm5hbExpbmtzL2V4dGVybmFsTGluazEueG1sUEsBAhQAFAAAAAgAh07iQKhHA5/EHQAAJckAACIAAAAAAAAAAQAgAAAAYGgBAHhsL2V4dGVybmFsTGlua3MvZXh0ZXJuYWxMaW5rMi54bWxQSwECFAAUAAAACACHTuJAF1Hd3pV2AABm9QEAFAAAAAAAAAABACAAAACsjAEAeGwvc2hhcmVkU3RyaW5ncy54bWxQSwECFAAUAAAACACHTuJAEouKHg8PAADglAAADQAAAAAAAAABACAAAAAoDQIAeGwvc3R5bGVzLnhtbFBLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAEAAAAGSGAQB4bC90aGVtZS9QSwECFAAUAAAACACHTuJATmyNJvAFAAArGQAAEwAAAAAAAAABACAAAACLhgEAeGwvdGhlbWUvdGhlbWUxLnhtbFBLAQIUABQAAAAIAIdO4kDRXDK2iAkAAPidAAAPAAAAAAAAAAEAIAAAAHMDAgB4bC93b3JrYm9vay54bWxQSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAADgAAAAAAAAAAABAAAAC3BwAAeGwvd29ya3NoZWV0cy9QSwECFAAUAAAACACHTuJApy5xVlvxAABqaAYAGAAAAAAAAAABACAAAADjBwAAeGwvd29ya3NoZWV0cy9zaGVldDEueG1sUEsBAhQAFAAAAAgAh07iQDLhXElJAgAAFAUAABgAAAAAAAAAAQAgAAAAdPkAAHhsL3dvcmtzaGVldHMvc2hlZXQyLnhtbFBLAQIUABQAAAAIAIdO4kBEQuKHwxMAAIFnAAAYAAAAAAAAAAEAIAAAAPP7AAB4bC93b3Jrc2hlZXRzL3NoZWV0My54bWxQSwECFAAUAAAACACHTuJAiE17lTU6AACsdQEAGAAAAAAAAAABACAAAADsDwEAeGwvd29ya3NoZWV0cy9zaGVldDQueG1sUEsFBgAAAAAfAB8A/AcAALAlAgAAAA=='
-    },
-    INLINE: {        filename: 'inline.xlsx',        data: 'UEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAZG9jUHJvcHMvUEsDBBQAAAAIAIdO4kAkAofhSAEAAFUCAAAQAAAAZG9jUHJvcHMvYXBwLnhtbJ2STU7DMBCF90jcwfK+cVN+hKrEFeJHbBCVKOxdZ9JacmzLHqKUs7BhgcQNWHEbkDgGTiJBCqzYjf2e33wzcjZrKk1q8EFZk9M0GVMCRtpCmVVObxbnoyNKAgpTCG0N5HQDgc747k4299aBRwWBxAgTcrpGdFPGglxDJUISZROV0vpKYDz6FbNlqSScWnlXgUE2GY8PGTQIpoBi5L4CaZ84rfG/oYWVLV+4XWxcBObZsXNaSYFxSn6ppLfBlkjOGgmanNjKRWWpgTByFandptFkL0mTg4wNH2YXINrFzIXygWc1TmuQaD0J6j6uZkLJUgRoW+a0Fl4Jg7F1a+sPXa1dQM/fX57eXh8+Hp8zFvX+riuH1mGt9nnaGWKxbWwDeo4obBMuFGoIV+VcePwDOB0Cdww9bo9zvQbAyS++buLY6Uc2+/4P/BNQSwMEFAAAAAgAh07iQEbTO7BgAQAAagIAABEAAABkb2NQcm9wcy9jb3JlLnhtbH2ST0vDMBjG74LfoeTeJun+oKHtQGUnB4ITxVtI3m3FNi1JdNvNbyF4Ek+eRNCDn2juY5i225xMPOZ9nvfH87wk6s3yzLsDbdJCxYgGBHmgRCFTNY7RxbDvHyDPWK4kzwoFMZqDQb1kfy8SJROFhjNdlKBtCsZzJGWYKGM0sbZkGBsxgZybwDmUE0eFzrl1Tz3GJRc3fAw4JKSLc7BccstxBfTLDRGtkFJskOWtzmqAFBgyyEFZg2lA8Y/Xgs7Nnwu1suXMUzsvXadV3G22FI24cc9MujFOp9Ng2qpjuPwUXw1Oz+uqfqqqWwlASSQFExq4LXSyfP1cvD9HeGtUnS/jxg7cpUcpyKN58vX4unj7WDw8LV/u/fXKrs2B6x4NHaTnkrGmx1q5bB2fDPsoCUnY8knHp+GQUkY7jJDrKsWv/SppM8hXWf4ndn1Cfdoeki5rH7KwvUVcA5II7/yO5BtQSwMEFAAAAAgAh07iQPWQMrZEAQAAhAIAABMAAABkb2NQcm9wcy9jdXN0b20ueG1stZJdT4MwFIbvTfwPpPfQDz4GC7AMuiXGC43O3ZqmlI0EWkLLdDH+dztxftxqvGvzNs95zulJF89d6xzEoBslM4A9BBwhuaoaucvAw2btxsDRhsmKtUqKDByFBov88iK9HVQvBtMI7ViE1BnYG9PPIdR8LzqmPRtLm9Rq6Jix12EHVV03XFDFx05IAwlCEeSjNqpz+08cmHjzg/ktslL8ZKe3m2NvdfP0A3506s40VQZeaFhSGqLQJaukdDHChZv4ycxFMUKkIOU6Wa5egdOfHhPgSNbZ1q/vbyy2GrkpxqattmKw6IOZt/2TNkNOUEhcTDw7Q48EyA9S+BWm8OzwRxv/bHNVbn+UjynF1I+jIlkvg8ifxRG2FtESBTSOiB8/YvIvQsFZqGQtH1tm7CLdja2Y5JogR+9l7eH7DODpg6b1yd8AUEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAADAAAAeGwvUEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAOAAAAeGwvd29ya3NoZWV0cy9QSwMEFAAAAAgAh07iQDtZlStKBgAAWxwAABgAAAB4bC93b3Jrc2hlZXRzL3NoZWV0MS54bWydWV1v2zYUfR+w/yDovbaoD38EtoumQbAB3VA06/asyHQsVDI9iYnT/vpdflgSeS+RYi+tfX14D8lzjuiYm/evbRO98K6vxWkbs1kSR/xUiX19etrGX/+6f7eKo16Wp33ZiBPfxt95H7/f/frL5iK6b/2RcxlBh1O/jY9Snm/m87468rbsZ+LMT/DJQXRtKeFt9zTvzx0v93pQ28zTJFnM27I+xabDTfczPcThUFf8TlTPLT9J06TjTSlh/v2xPvfXbq/7n+q378oLrPU6n8kU78wnQz+Wo/m1ddWJXhzkrBLt3EwNr3I9XzvrbCvUiNistuy+PZ/fQeMzLO6xbmr5XS/3OiEuxz6Xy2V2Ofez6mRnMdkgtpxz+fG5l6K9K2UZ7zZagc/dfLfZ17CLSvqo44dt/IHd3BbrGD7QkL9rfuknryNZPj7whleS78ErcfRDiPahKhvwRZoUk/d/KtUbW5Xi/Ikf5EfeQOVDuowj5Z1HIb4pgt+hVaImpRurqZSVrF+4gd9lOfjvXz079RqmNh/mNn19nee99tvnLtrzQ/ncyI+i+afey+M2XsfX2hdx+Y3XT0cJi8hmMG/xLJv6xD/xF97AALU2IKpEA13h36itVTbiqC1f9f8X0xEGZzC6l9/VDsDnld5ly3ftYUandjT8fx2dzhbpG8PnZg56xUq83aYTlwiMDWT9uVSxYzcp7F6lih9UFTY9jmBlPVRfdslm/gLbVFnELUawATGH3gMBNCEIVHUbZxOCdBiup3BrECDaMIVsQDgE0IQgUFWXIB+GGwKDmBIUA8IhUMbBW6SqLsFiGG4IDGJKsBwQDoHSDhOoqkuwGoYbAoOYEqwHhEOwIAlU1SVgvsoGMmVgAZkhjMQaVNWj8HU2EIciILQ6QPA2qapH4SttID9DAdEmKFTVoxitYqQwEIditIOjBYODkeDQZY9ktIshsRiHZfSEyxLItYntNHds9IxlMZgpSzr6wmWhw82IdI+2sSw43+loDZeFTjjDEU9H51gWHPJ0dIfLAgumdFFlV5fUF58ZjLNjIfXprDMc9hSpj+OehtSnA89w4lOkPo58FlKfzjzDoc+Q+jj1WUh9OvYM5z5D6uPgZyH16eQzHP0MqY+znwXUT+ns67LrscxX32KmHssC6qd09nXZY/HVt5gpSx5QP6Wzr8suS+6rbzEOS0D9lM6+LnssvvoW47AE1E8BRGRflz0WX32LcVhC6tPZ11/dPBakPs5+HlKfzn6Ks58j9XH2i5D6dPbVd3LvaVkg9XH2i5D6dPZTnP0CqY+zX4TUp7Of4uwXSH2c/SKgfkZnX5dd9RGLxUw9VowOcU6xjM6+Lr/Fgs/9IuCxjM6+LnssvscsZrqWRcBjGZ19XX6LBZ/7i9GH7o7R2dd/Lr7FooZuY2ctASfrP+/wl1dddlkWvpMtxmEJODmjs6/LHovvZItxWEJOprOf4ewvRpea72MW47CEPEZnP8PZXyCP4ewvQx6js5/h7C9H/9i14OwvA+rndPZ12dVl6atvMdMdWwbUz+ns67LH4qtvMQ5LQP2czr4ueyy++hbjsATUz+ns67LH4qtvMVOWVUD9HEDEua/LLsvKV99iHJaQ+vS5n5szHRY6/MKxQurjc38VUp/Ofo7P/RVSH5/7q5D6dPZznP0VUt9gnB0LqU9nP8fZXyH1cfbXIfXp7Oc4+2ukPs7+OqB+QWdfl12PIRaLme7YenSIc4oVdPZ12WMZ/WOeYxbjsIwOcVno7Beq7LGM/rEsBuOwjA5xWejsF+ZMn+ZlPfrHshiMwzI6xGUBEJH9QpXdtbBkNJClMaApDUtGj7g8dPoLnH6WjBayPDj+LAk5gM5/gfPPEmQB/ABgScgD9BOgwE8AliAT4EcAS0IuoJ8BBX4GsATZAD8EWBLyAf0UgNsL5AP086gFOT5AP5Caawbzo3v5LMV93UjeOfck9t7q/17ERDDw5qDb3goJ1zP3omnE5WvP91/K0xNcKah7Ef4qP/VS3XuMs9htzuUT/6PsnupTHzVwuQLYGajUmVsN/RquXXQVzPio21/fHeESjsN1QTKD2B2EgGWZN0Ci+j5w+XyOzuWZdw/1D5gG7Knoarhu07ds2/gsOtmVtVSXJKbZve6iJjlcC+7+A1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAACQAAAHhsL3RoZW1lL1BLAwQUAAAACACHTuJAhPr7DPgFAAC+GAAAEwAAAHhsL3RoZW1lL3RoZW1lMS54bWztWc2PGzUUvyPxP4zm3u4kzcd21Wy1+epCd9tVk7bq0UmcjBvPeGQ7u80NtUckJERBXJC4cUBApVbiUv6ahSIoUv8Fnu3JxE4cohaEoGpOM57fe34fv/f8kStXHyQ0OMVcEJY2wtLFKAxwOmQjkk4a4e1+98JuGAiJ0hGiLMWNcI5FeHX//feuoD0Z4wQHIJ+KPdQIYymzvZ0dMYRhJC6yDKfwbcx4giS88snOiKMz0JvQnXIU1XYSRNIwSFECau+e9ML9hc4OBcWpFGpgSHlPacQrwNG0pD6LuWhRHpwi2ghB94id9fEDGQYUCQkfGmGkf+HO/pUdtJcLUblB1pLr6l8ulwuMpmU9J58MikkrlWqldlDo1wAq13GdeqfWqRX6NAANh+CmscXRuVuvtJo51gKZR4/uzm653HXwlv5LazZ3y82DqOzgNcjor6zh69Vmu+LiNcjgq2v4S1EralYc/Rpk8LU1fKdaaVU7Dl6DYkrS6Ro6isq1TjVHF5Axo4deeL1T6h60c/gSBWwoqKWmGLNUeomWoPuMd+GrQlEkSRrIeYbHaAi0bSFKBpwER2QSSzUH2sPI+m6GhmJtSE0XiCEnmWyEH2YICmGp9dXz7149fxq8ev7k/OGz84c/nj96dP7wB6PLETxE6cQWfPnNp3989VHw+9OvXz7+3I8XNv6X7z/++afP/EAooqVFL7548uuzJy++/OS3bx974AccDWx4nyRYBDfwWXCLJeCbDoxrOR7w15Pox4g4EigG3R7VHRk7wBtzRH24JnaDd4dD//ABr83uO7b2Yj6TxDPz9ThxgMeM0Sbj3gBcV3NZEe7P0ol/cj6zcbcQOvXN3UKpk9rOLIOuSXwqWzF2zDyhKJVoglMsA/WNTTH2eHePECeux2TImWBjGdwjQRMRb0j6ZOAQaSl0SBLIy9xnIKTaic3xnaDJqM/rNj51kVAQiHqM72PqhPEamkmU+FT2UULtgB8hGfuM7M350MZ1hIRMTzBlQWeEhfDJ3OTgr5X069A+/Gk/pvPERXJJpj6dR4gxG9lm01aMksyH7ZE0trEfiClQFAUnTPrgx8ytEPUOeUDpxnTfIdhJ9/ZGcBs6p23SkiDqy4x7cnkNM4e/vTkdI6y7DHR1p18nJN3avM0M79p2IzzgxFs8hyvNehPuf9ii22iWnmCoivUl6l2Hftehw7e+Q2+q5X++Ly9bMXRptRk02229+U78e+8xobQn5xQfCb39FrD6jLowqIT0QRMXB7EshkdVxqDdwU04KmQmItc0EUHGBBwPw42q1Ac6S26Ox+Z4WapXo2gxgT6SwoR6uok+qS5UlsyJc6NeY6KSAUsLg2AjEMD2oRGW60YeTgeI4pEyMZew/bCfX9OneIYLny6Uq3AU/4+4pWixknCa2umnaXAGdxQqQmEwRFkjHMOBDB6TDOIk1GYF0QlcYwwlN3l9E75kXMg2ErHJuqaSWR0SIjEPKEka4a7JkUkMTTVV3irj/k7ROASraH4tOFzU7L9QNyVP3bxRboGXLg/xeIyH0mamNaK4YF7zVsNmQJtePDoLBnTGbyGgaikq1RSHR0TA8b8aAZ3UC1xXVSt59S+JHHAm7xIZ92KUwZXDlo6FaBYjQ12YYkNlFybpNFjWgqteV7Sva55xPKYQCLg5hCvCA+WImhDuD0fwcil/PFFtVnu18LesnFz1V8wb4YW8deZVPIBz2KrvpuLe2OLC8WUuqvVStUhF6XJkXl4nFfbVnYoAOKdCZWcCglGUgIHryBfmbMuDm5ecWIOJWgptGjrrXlFrhg0b18ftQsobuPeSRtFllWbTEQWSx2xkhkt63cprrphbO+bMsOgsK6kt6ZgVy+FiMd3CdsuqRYhh9betMpwE2sB4jEY490E1cOMDLPFLHyLVrbw+uGu80aqVLnYCdpRXAraczDFNWbwIpGXactQ1beEgcMENr2vatu3HSiRqC7UrcfvrbQHYUKSq2LkUvWvzzgXkVlkLQ+PF9k+zRf+tYP8FwAb3ocu04cp1RqUwHUCD9v8EUEsDBBQAAAAIAIdO4kA/Cb6FbgIAAIQKAAAUAAAAeGwvc2hhcmVkU3RyaW5ncy54bWx1Vk2P2jAQvVfqf0C5L4FUpVUVsopxDNkmNDLp9hhFkC5IkFASqu6/r8e0K63n7ZH34Rm/eGzC+z+n4+h3c+kPXTv3puOJN2rabbc7tE9z73up7j57o36o21197Npm7j03vXcfvX8X9v0wMt62n3v7YTh/8f1+u29OdT/uzk1rmJ/d5VQP5uflye/Pl6be9fumGU5HP5hMZv6pPrTeaNtd28HUnZoy1/bw69os/iOBF4X9IQqHKF1n6Tq5yxJVhv4QhT7BryidLleME1JwrBTSXUNIyc0Ggspi6tplISQDzZpFgJQMJOUHpGSgkMnyo6tMlkIy0Cqr6QwSn9ASDBRSZSwpA6FQlOZKDZVpkVdJufrqtpCaDDEjZFpoJGegVbJ4aWXNUNJW8WPOCJJDwjr0AnVScdjUVK5UK5Sd5ikbCCp5yhqnXOqsilW8Zqe/1EK+QQlZal294YEEOaqV1I8sFCqDGaE2AdpbYAg3LzrZcAYYSMqZa6cZYGCyTB9cYfqQLF2MdPxsGCEDk4cgWTH7KkhYHSXQzpVwzWbyxBhcKAZl1WnNGC2AQeanWjHLU2ULuXBXtSBrS9GnZqiGqNJoWQLZAjSGAc2h2wWNISTIkYFdpwVHrRbkbrQMJS3sgoFWiSaIes4RcXMs15sN2mZeIYY8eLhvdxoa+5sHh4lCtnoZsyxsBYBbPWrWGhBhHd9yuO8K4BrOjgYdajAl5B6zU27uaMFR0la62LDzT3JIvDgC/hX/WRjz4oFd2TKM0Tm6PzQ7h6b5H/zxMSBT2ueAN22eDxckpXZB+2S4oHlFTIDom99emNeMb/5FRn8BUEsDBBQAAAAIAIdO4kCUVVWzJgIAAJMEAAAPAAAAeGwvd29ya2Jvb2sueG1sjZRfb5swEMDfJ+07MCuvwUBCG6KQKjRBq9RUVZu121Pl4KNYBRvZzsg07bvPhpBm2jTlyb7z3e/+wuxqX5XOd5CKCR4j3/WQAzwTlPHXGH3ZpMMJcpQmnJJScIjRD1Doav7xw6wR8m0rxJtjAFzFqNC6nmKssgIqolxRAzcvuZAV0UaUr1jVEghVBYCuShx43gWuCOOoI0zlOQyR5yyDpch2FXDdQSSURJv0VcFq1dPotg10ZDawdZtauRnHYP0CHx9M0HyWsxKeuh44pK7vSGUq3ZfIKYnSK8o00BiNjCgaeFeEyJG7Otmx0rxGIy9AeH5sy700gu3PE4NGveut6DSMU9E8M6qLGAWX0digOt1nYK+FNoMIwiC0PHzCaCsyrPZ0eJvlo21nYGZkzxuTiLnLKTMXeUP9ltC7UcgZB2qrM5AT6YB62Ze8cl9SVmqQS6LJliiwRWekbMNYvNmPglEKdlnQvIv+abAY+NNBMgijGT7hmuxPJBPTgLJ76djDsvzI94LI5gh7fat0ezo7yWL0MwkniTeKguE49dPh2I+8YZJcjIfhMh2Fl/7yehWmv/ph7y0xP86638GKZVIokWs3ExXuVuevLfQnuPUGonfSLPd81tGmVpsetEdl3ikOHfsjwPRhaUs5eP/P8NF8XCWcaZw+nWl4fbferM+0vV1tXp7Tc40X62S5ON9+8fCw+LZZfe1D4H82FJuZmwXpJ4/7/8n8N1BLAwQUAAAACACHTuJAm4Tegg0KAAD3QgAADQAAAHhsL3N0eWxlcy54bWzFXG2P21gV/o7Ef7BcwQdEJontvM1OUjqZsbTSIiG1SEiAKk/izFg4dnCcMrOrlQrdMrCoSKhAYbUSy65K+UAHWBBbLdvun2nSmU/8Bc69frnnxteJO7YnM9KM4/g85+059z3ZuX48tqU7pje1XKcr17dqsmQ6A3doOYdd+bu39Epblqa+4QwN23XMrnxiTuXrva9+ZWfqn9jmzSPT9CWAcKZd+cj3J9vV6nRwZI6N6ZY7MR14Z+R6Y8OHl95hdTrxTGM4JUJju6rUas3q2LAcOUDYHg+ygIwN70ezSWXgjieGbx1YtuWfUCxZGg+23zx0XM84sMHUY68TIcNlAnpsDTx36o78LYCquqORNTATFtabVc+8Y5HodOTejjMb62N/Kg3cmeN3ZS2+JQXvvDmEm3VZCpzuu0Mw47b0DenaN69dq92W3iDXP6jgV1//8cz136gE/+gT37otydVIFcZVlnEDof99+Ti4wGoSb2GtiTeDG5mMUJeNCLVu1Zb8Yzc49OvXVzupLeMnjKXRi9AT74Z+pr6/wphqmN3ezsh1WJIVBbJM7vR2pm9LdwwbyqROMjRwbdeTfGA7ZJnecYyxGTwxP/vVy+cP6VNHhjeFIgkEVY3coyUSPjm2gLDkZjXQEfw9IE9F2moUh2rzDg+6sq7X4EfXyW2m8oZnGTZ9UqCRA4+AW1sNhiz2IzvoDFuM4rPC4pQgUXfXh2iNwjaEqE2hWIjyKYzChrMfehdkhM9HPmUHOJztRJrUTLrqWelmYW3J5LV08ptJZcbkce4lWViwe5w2is3VbpnaUDDDCitY2wpWqrqqt5qlpQ25FpYBUaiWx5OkQv1Ga69WaJFzVBEo1MlPkSFdkb+r807c+OdrwVY4BgO/erFpW6Gs04eeoNAqWKms2SjfszBdhRJf5FSxtKBjkCmMpSzbjofQqkpGV3CntwPDed/0HB1eSOH1rZMJjK0cmHmQkqsGz615+tAzTuoK7VOyCUxd2xoSKw77eIxFCr3fJ3oPwjcsZ2gemzDEb9JRXBUZnNW4VF39fqdzRboUHX6vRteNBvm9Gl395r7e378aXcCM1tXp2t/tlM3DsNIpr0uke6xG8i0yga5ttTqdTrvebLfbHU2tX73+BujvqO1OUwEzamVTNem/CupbjUa7Ue8oWr3sJiDUf0VuNuTNphnp30iakf6NpJkOesqv5uaG04z0byTNSP9G0twquc8LG43WhtOM9G8kzUj/RtJMF4HKr2ZY799o34z0byTNSP9G0nxFQwDYGtlompH+jaQZ6c+ZZjrJhGntgesNYR9NCveG6jWYUgb3eju2OfJhIulZh0fkv+9OyLTS9X3YeertDC3j0HUMGy6rkUT0n0jCBhzstXVl/wj2yqJ9B2Pmu+G2Q5U8FKKvfZbaQE1Y+yiYGVm59tnAmUv6Ei4f7irkl/Rmaz1KSqzxKymwzrukRFYfwQFRpqMYjs2hNRvHiYznBEH6CSfWh/GSKuKa18i0S2tptZbWUJpBzLO6F/nB0TGMFtspyJpCJJEthUggYwqRRBE+slXurD4iiWw+IoGMPiKJ1/Vx6M5gvzzmY5hJBChoXtbKJP1cKyLwdK1MVl/X1ItYj67DJiLdA4Bm+TJ1KawUrt7X+8w9vsqMsOuAnmhg2vZN0mV8bxR3Rxo5vnA8QucJ4KQH2WsmRxbIJay6hpdB1xO86O0YtnXojE0HdrBNz7cGZP97AC/NYNP6eLQEq9ETAiXg0pMBxePCQKCUMNBTIMWbq9FTIMXjIjaQBBbFBgRL8lcCLOIuhIZxl5zaeF3uImth7aYMa2GtoAxYmJuWAQtzISEs2bPJEVtSciIm5ISFEbcYlxzTymFuKi4Z4efBJU1EGAeoOUbdRk5c0kSEuFB0DLeZExc1DBxuXntRywBlx+xt5bQ3rYbbOXHTiph0sXn4gKoYVLA45OUZKmNQURwuqmNQURiuguoYVBSHi+qN1HQ5wKCkOGAUiTrXu+WkBA5xnWt78gLjGHONRJHAXCuRFxjHuMiy42JcZN0pOMaFFh4GLrTyUIxJWEopEBKW4oBRKOAAcEnAhVYejnGhlYeBC608HONCKw8DF1p5OBSFVh4GLrTyUChUUFJKgaigpDhgFAr1MpVXxcsfwWIIWgchY9XXXwaRjkfh4ogxmdgnN6I1EbIAn2vMh5xdyk5WlUeuZ70N6zhkXYYs1MkZ12mI5nD5B3GEMwLu837rIEBclmgUdumGB3udGpUMJko/8YzJLfOYwpOF8MS6ErIXzW82Ze86E4m1oiluIqRFBjEyilYAcB6tBPLrgHGFSOSzEV15/uzZ+ZP3ULYPZpYN24MB5wE2IfDg3svnD+a/+PnFB7+NxMA1JEZPuS+Lnf/7yfzZTyMBUtxMDz36tSzw6o8vQMni77ES0mMyGXqOaVlmjmz7fu2HkTaNk6RHY5YlA/OQDOntmDZ6ziIh85/7Fw9fLH79ONJDOjImE3xyI1qPjcL92afnZ19ePDp79cF758vypL9i8nQ3eFnn4l9/vTh9P1JI+iEmABMbQb7On/5l/pv3F78/XXz4t0iOdDNILjjrvmTp4qPTi4//EEnQSRMSEYb//MknYNzi7hNeG3xoBqtrCPkRqJPiIqFzHqRQmLVQCNgUNFZ0PoOEhGkLhYBOoRBPj7owb6EQPBoK8fwITu8tJ+v8xcP5/ZgddZ4eMBgWZQtETj+PtfCMgGGuSOTsz6/OHsUiPCdgACsQWXxyd/Gnx/MHv5vfv7f46ItYlueFIkxUQPmELB3bs9Arwppe/PN0cfe/kTo6akciQk7NHz+Pn+dbDUVIiflnZ/HzfIuhCNlwcfdnL589jUV4LihCLsy/+Pz8H/eA4/Onjy4+/vD8l58y2sLhc8x1RVjESu1rUkVaCcNzBYZvgixq62F4/sBgTQDTXA/DcwqGZgIYgTtxXUIYcFTg4L8AIDUqMQwdxTLCBJ9wWy661KgwGL49UoW8S40Kg4Er1IqqYjomuRI3PBAGDkDIz9SoMBies6qQs6lRYTA8c1Uhc1OjwmB45mpC5gq4EresKs9Z+Ej163CFwfCchb0zAUxqVBgMz1zY4RTApEYlhoEw4FRrwtZREBXISdDfkE+WI7JpQs6mcoXB8JzVhJxNjQqD4ZmrCZmbGhUGA/HBTgmZK4gKUCyMCkBhACFnU6PCYHjONoScTY0Kg+GZ2xAyNzUqDIZnboMyl81sYWjvky85oLv88dge+DU0R8bM9m/Fb3Zldv1tevAIsh8+9R3rjutTiK7Mrt8ih9RgnAIch/nYW1M4WQb/pZlndeV39ndbnb19Xam0a7vtiqaajUqnsbtXaWj93b09vVNTav13ITPkGyG2j+va5b51odapdoJvhoDJel3bntrw3Qxe6Gxo/E12ryujF4H5xPoqmB38pU5Up/E3VvT+D1BLAwQKAAAAAACHTuJAAAAAAAAAAAAAAAAABgAAAF9yZWxzL1BLAwQUAAAACACHTuJAezh2vP8AAADfAgAACwAAAF9yZWxzLy5yZWxzrZLPSsQwEMbvgu8Q5r5NdxUR2XQvIuxNZH2AmEz/0CYTklntvr1BUSzUugePmfnmm998ZLsb3SBeMaaOvIJ1UYJAb8h2vlHwfHhY3YJIrL3VA3lUcMIEu+ryYvuEg+Y8lNouJJFdfFLQMoc7KZNp0elUUECfOzVFpzk/YyODNr1uUG7K8kbGnx5QTTzF3iqIe7sGcTiFvPlvb6rrzuA9maNDzzMr5FSRnXVskBWMg3yj2L8Q9UUGBjnPcnU+y+93SoesrWYtDUVchZhTitzlXL9xLJnHXE4fiiWgzflA09PnwsGR0Vu0y0g6hCWi6/8kMsfE5JZ5PjVfSHLyLat3UEsDBAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAeGwvX3JlbHMvUEsDBBQAAAAIAIdO4kDIbNly7AAAALoCAAAaAAAAeGwvX3JlbHMvd29ya2Jvb2sueG1sLnJlbHOtkk1qwzAQhfeF3kHMvpadllJK5GxKIdvWPYCQxpaJLQnN9Me3r3AhcSCkG28Ebwa9981I293POIgvTNQHr6AqShDoTbC97xR8NK93TyCItbd6CB4VTEiwq29vtm84aM6XyPWRRHbxpMAxx2cpyTgcNRUhos+dNqRRc5apk1Gbg+5QbsryUaalB9RnnmJvFaS9fQDRTDEn/+8d2rY3+BLM54ieL0RI4mnIA4hGpw5ZwZ8uMiPIy/H3q8Y7ndC+c8rbXVIsy9dgNmvCcH4jPK1ilnI+q2sM1ZoM3yEdyCHyieNYIjl3jjDy7MfVv1BLAwQUAAAACACHTuJAqPFac2cBAAANBQAAEwAAAFtDb250ZW50X1R5cGVzXS54bWytlMtOAjEUhvcmvsOkWzNTcGGMYWDhZakk4gPU9sA09JaegvD2nilgAkGBjJtJOu35v//8vQxGK2uKJUTU3tWsX/VYAU56pd2sZh+Tl/KeFZiEU8J4BzVbA7LR8PpqMFkHwIKqHdasSSk8cI6yASuw8gEczUx9tCLRMM54EHIuZsBve707Lr1L4FKZWg02HDzBVCxMKp5X9HvjJIJBVjxuFrasmokQjJYikVO+dOqAUm4JFVXmNdjogDdkg/GjhHbmd8C27o2iiVpBMRYxvQpLNrjychx9QE6Gqr9Vjtj006mWQBoLSxFU0LasQJWBJCEmDT+e/2RLH+Fy+C6jtvpi4gKTt5czDxqWWeZM+MpwbEQE9Z4inUjsTMcQQShsAJI11Z727qgci731kdYG/t1AFj1BTnSpgOdvv3MAWeYE8MvH+af3886ww7Qp9coK7c7g5y1C2n2q6d71vpG2vyy888HzYzb8BlBLAQIUABQAAAAIAIdO4kCo8VpzZwEAAA0FAAATAAAAAAAAAAEAIAAAAIAjAABbQ29udGVudF9UeXBlc10ueG1sUEsBAhQACgAAAAAAh07iQAAAAAAAAAAAAAAAAAYAAAAAAAAAAAAQAAAA6SAAAF9yZWxzL1BLAQIUABQAAAAIAIdO4kB7OHa8/wAAAN8CAAALAAAAAAAAAAEAIAAAAA0hAABfcmVscy8ucmVsc1BLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAEAAAAAAAAABkb2NQcm9wcy9QSwECFAAUAAAACACHTuJAJAKH4UgBAABVAgAAEAAAAAAAAAABACAAAAAnAAAAZG9jUHJvcHMvYXBwLnhtbFBLAQIUABQAAAAIAIdO4kBG0zuwYAEAAGoCAAARAAAAAAAAAAEAIAAAAJ0BAABkb2NQcm9wcy9jb3JlLnhtbFBLAQIUABQAAAAIAIdO4kD1kDK2RAEAAIQCAAATAAAAAAAAAAEAIAAAACwDAABkb2NQcm9wcy9jdXN0b20ueG1sUEsBAhQACgAAAAAAh07iQAAAAAAAAAAAAAAAAAMAAAAAAAAAAAAQAAAAoQQAAHhsL1BLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAEAAAADUiAAB4bC9fcmVscy9QSwECFAAUAAAACACHTuJAyGzZcuwAAAC6AgAAGgAAAAAAAAABACAAAABcIgAAeGwvX3JlbHMvd29ya2Jvb2sueG1sLnJlbHNQSwECFAAUAAAACACHTuJAPwm+hW4CAACECgAAFAAAAAAAAAABACAAAAC+EQAAeGwvc2hhcmVkU3RyaW5ncy54bWxQSwECFAAUAAAACACHTuJAm4Tegg0KAAD3QgAADQAAAAAAAAABACAAAACxFgAAeGwvc3R5bGVzLnhtbFBLAQIUAAoAAAAAAIdO4kAAAAAAAAAAAAAAAAAJAAAAAAAAAAAAEAAAAG4LAAB4bC90aGVtZS9QSwECFAAUAAAACACHTuJAhPr7DPgFAAC+GAAAEwAAAAAAAAABACAAAACVCwAAeGwvdGhlbWUvdGhlbWUxLnhtbFBLAQIUABQAAAAIAIdO4kCUVVWzJgIAAJMEAAAPAAAAAAAAAAEAIAAAAF4UAAB4bC93b3JrYm9vay54bWxQSwECFAAKAAAAAACHTuJAAAAAAAAAAAAAAAAADgAAAAAAAAAAABAAAADCBAAAeGwvd29ya3NoZWV0cy9QSwECFAAUAAAACACHTuJAO1mVK0oGAABbHAAAGAAAAAAAAAABACAAAADuBAAAeGwvd29ya3NoZWV0cy9zaGVldDEueG1sUEsFBgAAAAARABEABwQAABglAAAAAA=='
-    }
-};
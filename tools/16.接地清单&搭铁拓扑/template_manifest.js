@@ -0,0 +1,24 @@
+// 由 build_template_assets.py 生成，请勿手工修改
+const TEMPLATE_MANIFEST = {
+    "WIRELIST": {
+        "filename": "WIRELIST.xlsx",
+        "asset": "template_assets/WIRELIST.2f77f153f93c.js",
+        "size": 456432,
+        "compressed_size": 425954,
+        "sha256": "2f77f153f93c112bcc5427dd2e0fc821c0b1553c37b7e28353a37dce5e935426"
+    },
+    "CONNLIST": {
+        "filename": "T28-Connlist_20260113.xlsx",
+        "asset": "template_assets/CONNLIST.ee9a6c59a2ac.js",
+        "size": 142786,
+        "compressed_size": 135431,
+        "sha256": "ee9a6c59a2ac8869d5b536f942a356f975fdb8b51cdc5d93b726d90f801161f1"
+    },
+    "INLINE": {
+        "filename": "inline.xlsx",
+        "asset": "template_assets/INLINE.29c29c0147d3.js",
+        "size": 10549,
+        "compressed_size": 9324,
+        "sha256": "29c29c0147d3abf4fe4d3edbb29800ae9ea65264110ac29f4c2b832b2db84734"
+    }
+};
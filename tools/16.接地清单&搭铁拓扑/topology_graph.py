@@ -0,0 +1,215 @@
+"""
+接地拓扑图导出：每个含接地点的连通分量一张紧凑的图，布局坐标在服务端预先算好，前端只需绘制
+- 接地分量：连接图中含接地点的连通分量，同一接地短号（不同pin）所在的分量合为一个，每个接地点只出现在一张图中
+- 图中同一短号的 "code:pin" 节点合并为一个节点，同一对短号之间的多根导线合并为一条边（weight为导线数）
+- 节点类型：ground（接地点）、weld（焊点）、inline、connector（其他插件）；接地点另带其搭铁类型（与接地清单一致）
+- 布局：以接地点为中心按BFS层数分环（多个接地点时接地点在最内环），
+  每个节点在父节点的角度范围内按子树叶子数分得一段，同一子树的节点聚在一起
+- JSON：build_topology_graphs 的结果直接序列化；GraphML：to_graphml（一个分量一个 <graph>）
+
+用法:
+    from topology_graph import build_topology_graphs, to_graphml
+    graphs = build_topology_graphs(processor)
+    to_graphml(graphs)
+"""
+
+import math
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from csr_graph import label_components
+
+RING_SPACING = 120  # 相邻两环的半径差
+
+GRAPHML_NS = 'http://graphml.graphdrawing.org/xmlns'
+GRAPHML_KEYS = (
+    # (id, for, attr.name, attr.type)
+    ('d_ground_codes', 'graph', 'ground_codes', 'string'),
+    ('d_kind', 'node', 'kind', 'string'),
+    ('d_grounding_type', 'node', 'grounding_type', 'string'),
+    ('d_x', 'node', 'x', 'double'),
+    ('d_y', 'node', 'y', 'double'),
+    ('d_depth', 'node', 'depth', 'int'),
+    ('d_weight', 'edge', 'weight', 'int'),
+)
+
+
+def node_kind(code, ground_set, weld_set, inline_set):
+    if code in ground_set:
+        return 'ground'
+    if code in weld_set:
+        return 'weld'
+    if code in inline_set:
+        return 'inline'
+    return 'connector'
+
+
+def radial_layout(node_count, edges, roots):
+    """
+    放射状布局：从接地点（roots，局部编号）出发BFS分层，返回 (x列表, y列表, 层数列表)
+    edges 为局部编号的 (u, v) 对；所有节点都应能从roots到达
+    """
+    adjacency = [[] for _ in range(node_count)]
+    for u, v in edges:
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+
+    # BFS生成树：children按发现顺序
+    depth = [-1] * node_count
+    children = [[] for _ in range(node_count)]
+    order = list(roots)
+    for root in roots:
+        depth[root] = 0
+    for node in order:
+        for neighbor in sorted(adjacency[node]):
+            if depth[neighbor] < 0:
+                depth[neighbor] = depth[node] + 1
+                children[node].append(neighbor)
+                order.append(neighbor)
+
+    # 子树叶子数（逆BFS序累加），决定每个节点分到的角度
+    leaves = [1] * node_count
+    for node in reversed(order):
+        if children[node]:
+            leaves[node] = sum(leaves[child] for child in children[node])
+
+    angle = [0.0] * node_count
+    start = 0.0
+    total = sum(leaves[root] for root in roots) or 1
+    span = {}
+    for root in roots:
+        span[root] = (start, 2 * math.pi * leaves[root] / total)
+        start += span[root][1]
+    for node in order:
+        begin, width = span[node]
+        angle[node] = begin + width / 2
+        for child in children[node]:
+            child_width = width * leaves[child] / leaves[node]
+            span[child] = (begin, child_width)
+            begin += child_width
+
+    # 单个接地点放在圆心，多个接地点放在最内环
+    offset = 0 if len(roots) == 1 else 1
+    xs, ys = [], []
+    for node in range(node_count):
+        radius = (depth[node] + offset) * RING_SPACING
+        xs.append(round(radius * math.cos(angle[node]), 1))
+        ys.append(round(radius * math.sin(angle[node]), 1))
+    return xs, ys, depth
+
+
+def ground_groups(processor):
+    """
+    接地分量：含接地点的连通分量中，共有接地短号的合为一组
+    返回 (连通分量 → 组号 数组（不含接地点的分量为-1）, 组数)，组按 processor.ground_short_codes 中接地短号的顺序编号
+    """
+    view = processor.components
+    component_ids = {}
+    links_src, links_dst = [], []
+    for ground_code in processor.ground_short_codes:
+        local = []
+        for component_id in processor.ground_components(ground_code):
+            local.append(component_ids.setdefault(component_id, len(component_ids)))
+        links_src.extend(local[:-1])
+        links_dst.extend(local[1:])
+
+    group_of = np.full(len(view.offsets) - 1, -1, dtype=np.int32)
+    if not component_ids:
+        return group_of, 0
+    labels = label_components(len(component_ids), np.array(links_src, dtype=np.int32),
+                              np.array(links_dst, dtype=np.int32))
+    group_of[list(component_ids)] = labels
+    return group_of, int(labels.max()) + 1
+
+
+def build_topology_graphs(processor):
+    """
+    每个接地分量一张图（按 processor.ground_short_codes 中接地短号的顺序）
+    返回 [{'id', 'ground_codes', 'extent', 'nodes': [{'id', 'kind', 'x', 'y', 'depth'[, 'grounding_type']}],
+           'edges': [[节点序号, 节点序号, 导线数]]}]
+    """
+    graph = processor.connection_graph
+    view = processor.components
+    ground_set = set(processor.ground_short_codes)
+    weld_set = set(processor.weld_points)
+    inline_set = set(processor.inline_list)
+
+    group_of, group_count = ground_groups(processor)
+    if not group_count:
+        return []
+
+    # 节点和边按所在接地分量分组，再换算为短号编号
+    node_group = group_of[view.node_component]
+    node_order = np.argsort(node_group, kind='stable')
+    node_offsets = np.searchsorted(node_group[node_order], np.arange(group_count + 1))
+    edge_group = node_group[graph.src]
+    edge_order = np.argsort(edge_group, kind='stable')
+    edge_offsets = np.searchsorted(edge_group[edge_order], np.arange(group_count + 1))
+    code_src = graph.node_codes[graph.src]
+    code_dst = graph.node_codes[graph.dst]
+
+    graphs = []
+    for group in range(group_count):
+        codes = np.unique(graph.node_codes[node_order[node_offsets[group]:node_offsets[group + 1]]])
+        edges = edge_order[edge_offsets[group]:edge_offsets[group + 1]]
+        u = np.searchsorted(codes, code_src[edges])
+        v = np.searchsorted(codes, code_dst[edges])
+        pairs = np.stack([np.minimum(u, v), np.maximum(u, v)], axis=1)[u != v]
+        pairs, weights = (np.unique(pairs, axis=0, return_counts=True) if len(pairs)
+                          else (np.zeros((0, 2), dtype=np.int64), np.zeros(0, dtype=np.int64)))
+
+        names = [graph.code_names[code] for code in codes.tolist()]
+        kinds = [node_kind(name, ground_set, weld_set, inline_set) for name in names]
+        roots = [i for i, kind in enumerate(kinds) if kind == 'ground']
+        edge_list = pairs.tolist()
+        xs, ys, depth = radial_layout(len(names), edge_list, roots)
+
+        nodes = []
+        for name, kind, x, y, d in zip(names, kinds, xs, ys, depth):
+            node = {'id': name, 'kind': kind, 'x': x, 'y': y, 'depth': d}
+            if kind == 'ground':
+                node['grounding_type'] = processor.grounding_type(name)
+            nodes.append(node)
+
+        graphs.append({
+            'id': group,
+            'ground_codes': [names[i] for i in roots],
+            'extent': (max(depth) + (0 if len(roots) == 1 else 1)) * RING_SPACING,
+            'nodes': nodes,
+            'edges': [[a, b, w] for (a, b), w in zip(edge_list, weights.tolist())],
+        })
+    return graphs
+
+
+def to_graphml(graphs):
+    """拓扑图列表 → GraphML文本（一个分量一个 <graph>，节点ID为短号）"""
+    ET.register_namespace('', GRAPHML_NS)
+    root = ET.Element(f'{{{GRAPHML_NS}}}graphml')
+    for key_id, target, name, attr_type in GRAPHML_KEYS:
+        ET.SubElement(root, f'{{{GRAPHML_NS}}}key',
+                      {'id': key_id, 'for': target, 'attr.name': name, 'attr.type': attr_type})
+
+    def data(parent, key, value):
+        ET.SubElement(parent, f'{{{GRAPHML_NS}}}data', {'key': key}).text = str(value)
+
+    for topology in graphs:
+        graph = ET.SubElement(root, f'{{{GRAPHML_NS}}}graph',
+                              {'id': f"component{topology['id']}", 'edgedefault': 'undirected'})
+        data(graph, 'd_ground_codes', ','.join(topology['ground_codes']))
+        prefix = f"c{topology['id']}:"
+        for item in topology['nodes']:
+            node = ET.SubElement(graph, f'{{{GRAPHML_NS}}}node', {'id': prefix + item['id']})
+            data(node, 'd_kind', item['kind'])
+            if 'grounding_type' in item:
+                data(node, 'd_grounding_type', item['grounding_type'])
+            data(node, 'd_x', item['x'])
+            data(node, 'd_y', item['y'])
+            data(node, 'd_depth', item['depth'])
+        nodes = topology['nodes']
+        for source, target, weight in topology['edges']:
+            edge = ET.SubElement(graph, f'{{{GRAPHML_NS}}}edge',
+                                 {'source': prefix + nodes[source]['id'], 'target': prefix + nodes[target]['id']})
+            data(edge, 'd_weight', weight)
+
+    return ET.tostring(root, encoding='unicode', xml_declaration=True)
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Option表达式打点性能对比
+用法: python benchmark_option_expr.py [回路数] [零件号数]
+
+在合成的ECR WIRE sheet上对比：
+- 旧逻辑：每个回路 × 每个零件号都重新切分、遍历一次option字符串
+- 新逻辑：option_expr 编译一次，所有零件号复用闭包
+- 矩阵模式：xdot_matrix 在配置矩阵上对所有零件号向量化求值
+"""
+
+import random
+import re
+import sys
+import time
+
+import pandas as pd
+
+from option_expr import compile_option, cache_info
+from xdot_matrix import ConfigMatrix, build_xdot_grid
+
+
+def legacy_calculate_option(expression, car_configs):
+    """原 WireChartToolV5._calculate_option 的逻辑（仅作对比基准）"""
+    if not expression or pd.isna(expression) or str(expression) == 'NaN':
+        return False
+
+    expr = re.sub(r'\s+', '', str(expression)).upper()
+    tokens = [t for t in re.split(r'([&/\-\(\)])', expr) if t]
+
+    def find_close(start, end):
+        depth = 1
+        j = start
+        while j < end and depth > 0:
+            if tokens[j] == '(':
+                depth += 1
+            elif tokens[j] == ')':
+                depth -= 1
+            j += 1
+        return j
+
+    def eval_tokens(start, end):
+        result = None
+        current_op = None
+        i = start
+
+        while i < end:
+            token = tokens[i]
+
+            if token == '(':
+                j = find_close(i + 1, end)
+                value = eval_tokens(i + 1, j - 1)
+                i = j
+            elif token == '-':
+                i += 1
+                if i >= end:
+                    break
+                if tokens[i] == '(':
+                    j = find_close(i + 1, end)
+                    value = eval_tokens(i + 1, j - 1)
+                    value = not value if value is not None else False
+                    i = j
+                else:
+                    # 原实现此处漏了取反、也没有 ALL，基准里按修正后的语义对比
+                    value = tokens[i] != 'ALL' and tokens[i] not in car_configs
+                    i += 1
+            elif token in ('&', '/'):
+                i += 1
+                continue
+            elif token == ')':
+                break
+            else:
+                value = token == 'ALL' or token in car_configs
+                i += 1
+
+            if result is None:
+                result = value
+            elif current_op == '&':
+                result = result and value
+            elif current_op == '/':
+                result = result or value
+
+            if i < end and tokens[i] in ('&', '/'):
+                current_op = tokens[i]
+                i += 1
+
+        return result
+
+    return bool(eval_tokens(0, len(tokens)))
+
+
+def build_synthetic_wire_sheet(wire_count, vocabulary, seed=7):
+    """按ECR WIRE sheet布局生成数据：前3行为表头，B列Wire ID，F列Option"""
+    rng = random.Random(seed)
+
+    def random_term():
+        term = rng.choice(vocabulary)
+        return f"-{term}" if rng.random() < 0.2 else term
+
+    def random_expression():
+        shape = rng.random()
+        if shape < 0.15:
+            return None
+        if shape < 0.45:
+            return random_term()
+        if shape < 0.75:
+            return f"{random_term()}&{random_term()}"
+        return f"({random_term()}/{random_term()})&{random_term()}"
+
+    # 模拟真实WIRE表：不同option种类远少于回路数
+    distinct_options = [random_expression() for _ in range(max(1, wire_count // 20))]
+
+    rows = [[None] * 13 for _ in range(3)]
+    rows[1][1:6] = ['Wire ID', 'Color', 'Size / Gauge', 'Material', 'Option']
+    for i in range(wire_count):
+        row = [None] * 13
+        row[1] = f"W{i:05d}"
+        row[5] = rng.choice(distinct_options)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def build_part_configs(part_count, vocabulary, seed=11):
+    rng = random.Random(seed)
+    return [set(rng.sample(vocabulary, rng.randint(20, 60))) for _ in range(part_count)]
+
+
+def run_xdots(wire_df, part_configs, calculate):
+    x_count = 0
+    for idx in range(3, len(wire_df)):
+        option_expr = wire_df.iat[idx, 5]
+        for configs in part_configs:
+            if calculate(option_expr, configs):
+                x_count += 1
+    return x_count
+
+
+def run_xdots_compiled(wire_df, part_configs):
+    x_count = 0
+    for idx in range(3, len(wire_df)):
+        compiled = compile_option(wire_df.iat[idx, 5])
+        for configs in part_configs:
+            if compiled.evaluate(configs):
+                x_count += 1
+    return x_count
+
+
+def run_xdots_matrix(wire_df, part_configs):
+    part_numbers = [f"P{i:04d}" for i in range(len(part_configs))]
+    matrix = ConfigMatrix(part_numbers, dict(zip(part_numbers, part_configs)))
+    grid = build_xdot_grid(list(wire_df.iloc[3:, 5]), matrix)
+    return int(grid.sum())
+
+
+def main():
+    wire_count = int(sys.argv[1]) if len(sys.argv) > 1 else 6000
+    part_count = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+
+    vocabulary = [f"{prefix}{n:02d}" for prefix in ('LC', 'AB', 'MB', 'PT', 'EV') for n in range(1, 41)]
+    wire_df = build_synthetic_wire_sheet(wire_count, vocabulary)
+    part_configs = build_part_configs(part_count, vocabulary)
+    print(f"合成WIRE: {wire_count} 行, 零件号: {part_count}, 配置词表: {len(vocabulary)}")
+
+    start = time.perf_counter()
+    legacy_count = run_xdots(wire_df, part_configs, legacy_calculate_option)
+    legacy_time = time.perf_counter() - start
+    print(f"旧逻辑: {legacy_time:.2f}s, X打点: {legacy_count}")
+
+    start = time.perf_counter()
+    compiled_count = run_xdots_compiled(wire_df, part_configs)
+    compiled_time = time.perf_counter() - start
+    print(f"编译缓存: {compiled_time:.2f}s, X打点: {compiled_count}")
+    print(f"缓存统计: {cache_info()}")
+
+    start = time.perf_counter()
+    matrix_count = run_xdots_matrix(wire_df, part_configs)
+    matrix_time = time.perf_counter() - start
+    print(f"矩阵模式: {matrix_time:.3f}s, X打点: {matrix_count}")
+
+    if not legacy_count == compiled_count == matrix_count:
+        print("错误: 各逻辑的X打点数量不一致")
+        sys.exit(1)
+    print(f"加速比: 编译缓存 {legacy_time / compiled_time:.1f}x, 矩阵模式 {legacy_time / matrix_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Chart 流式导出
+- 输出使用 write-only 工作表，逐行写出，不在内存中保留整张表
+- 原chart以只读模式逐行读取，只解析Wire Chart这一张sheet
+- 原chart的每种单元格样式（字体、填充、边框、对齐、数字格式、保护，按值去重）在输出表中建一个原型单元格，
+  用公开的样式属性赋值；输出单元格复制原型再填值，不逐格设置样式，也不注册命名样式
+- 保留原chart前4行（值+格式、合并单元格）、列宽、前4行行高和冻结窗格，数据从第5行开始；
+  只读模式拿不到的列宽等信息直接按OOXML格式从xlsx包中读取sheet XML
+"""
+
+import datetime
+import posixpath
+from copy import copy
+import zipfile
+from xml.etree.ElementTree import fromstring, iterparse
+
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Protection
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.cell_range import CellRange
+
+HEADER_ROWS = 4
+SHEET_TITLE = "Wire Chart"
+DEFAULT_HEADER = ['ACTION', 'CHANGE DATE', 'CIRCUIT NBR', 'WIRE SIZE',
+                  'Luxshare CABLE PART NBR', 'CUSTOMER CABLE PART NBR', 'COLOR',
+                  'MARKING COLOR', 'CABLE DESG', 'EST WIRE LENGTH', 'GROUP NAME',
+                  'POS NBR 1', 'CAV 1']
+
+STYLE_ATTRIBUTES = ('font', 'fill', 'border', 'alignment', 'number_format', 'protection')
+DATE_FORMAT = 'yyyy/m/d'
+
+MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+
+def find_wire_chart_sheet(wb):
+    """查找名称含 'Wire Chart' 的sheet"""
+    for name in wb.sheetnames:
+        if 'Wire Chart' in name:
+            return wb[name]
+    return None
+
+
+class StyleRegistry:
+    """
+    样式原型表：每种样式值元组 (字体, 填充, 边框, 对齐, 数字格式, 保护) 对应输出表中的一个原型单元格
+    原单元格按其 style_array 缓存到原型，同一原chart中相同样式只取一次样式值
+    """
+
+    def __init__(self, target_ws):
+        self.target_ws = target_ws
+        self._by_value = {}       # 样式值元组 → 原型
+        self._by_source = {}      # 原单元格的 style_array → 原型
+        self._values = {}         # id(原型) → 样式值元组
+        self._date_variants = {}  # id(原型) → 日期格式的原型
+
+    def __len__(self):
+        return len(self._by_value)
+
+    def prototype(self, style):
+        """样式值元组对应的原型单元格（相同样式只建一个）"""
+        prototype = self._by_value.get(style)
+        if prototype is None:
+            prototype = WriteOnlyCell(self.target_ws)
+            for name, value in zip(STYLE_ATTRIBUTES, style):
+                setattr(prototype, name, value)
+            self._by_value[style] = prototype
+            self._values[id(prototype)] = style
+        return prototype
+
+    def style_for(self, source_cell):
+        """返回原单元格（只读模式）对应的原型；无样式或空单元格返回None"""
+        if not getattr(source_cell, 'has_style', False):
+            return None
+        key = tuple(source_cell.style_array)
+        prototype = self._by_source.get(key)
+        if prototype is None:
+            style = tuple(getattr(source_cell, name) for name in STYLE_ATTRIBUTES)
+            prototype = self._by_source[key] = self.prototype(style)
+        return prototype
+
+    def _date_variant(self, prototype):
+        """同样式、日期数字格式的原型（原格式已是日期格式时就是原型本身）"""
+        variant = self._date_variants.get(id(prototype))
+        if variant is None:
+            style = self._values[id(prototype)]
+            if is_date_format(style[4]):
+                variant = prototype
+            else:
+                variant = self.prototype(style[:4] + (DATE_FORMAT,) + style[5:])
+            self._date_variants[id(prototype)] = variant
+        return variant
+
+    def make_cell(self, value, prototype=None):
+        """按原型生成输出单元格"""
+        if prototype is None:
+            return WriteOnlyCell(self.target_ws, value=value)
+        # 日期写进非日期格式的单元格时（如增量更新填写的CHANGE DATE）补上日期格式
+        if isinstance(value, (datetime.date, datetime.datetime)):
+            prototype = self._date_variant(prototype)
+        cell = copy(prototype)
+        cell.value = value
+        return cell
+
+
+def _part_path(base, target):
+    """关系文件中的Target → 包内路径（相对于 base 所在目录，或以 / 开头的绝对路径）"""
+    if target.startswith('/'):
+        return target.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base), target))
+
+
+def _sheet_xml_path(archive, title):
+    """按包关系找到名为 title 的sheet的XML路径"""
+    workbook_path = 'xl/workbook.xml'
+    for rel in fromstring(archive.read('_rels/.rels')).iter(f'{{{PACKAGE_REL_NS}}}Relationship'):
+        if rel.get('Type', '').endswith('/officeDocument'):
+            workbook_path = _part_path('', rel.get('Target'))
+
+    rel_id = None
+    for sheet in fromstring(archive.read(workbook_path)).iter(f'{{{MAIN_NS}}}sheet'):
+        if sheet.get('name') == title:
+            rel_id = sheet.get(f'{{{REL_NS}}}id')
+
+    rels_path = posixpath.join(posixpath.dirname(workbook_path), '_rels',
+                               posixpath.basename(workbook_path) + '.rels')
+    for rel in fromstring(archive.read(rels_path)).iter(f'{{{PACKAGE_REL_NS}}}Relationship'):
+        if rel.get('Id') == rel_id:
+            return _part_path(workbook_path, rel.get('Target'))
+    raise ValueError(f"xlsx中找不到sheet: {title}")
+
+
+def _read_sheet_layout(template, title):
+    """
+    只读模式下的worksheet没有列宽/行高/合并单元格信息，直接从xlsx包中的sheet XML读取
+    返回 (列宽{列号: 宽度}, 表头行高{行号: 高度}, 表头合并区域[], 冻结窗格)
+    """
+    widths = {}
+    heights = {}
+    merges = []
+    freeze = None
+
+    if hasattr(template, 'seek'):
+        template.seek(0)
+    with zipfile.ZipFile(template) as archive:
+        with archive.open(_sheet_xml_path(archive, title)) as src:
+            for _, elem in iterparse(src):
+                tag = elem.tag.rsplit('}', 1)[-1]
+                if tag == 'col':
+                    width = elem.get('width')
+                    if width and elem.get('min'):
+                        for col_idx in range(int(elem.get('min')), int(elem.get('max', elem.get('min'))) + 1):
+                            widths[col_idx] = float(width)
+                elif tag == 'row':
+                    row_idx = elem.get('r')
+                    height = elem.get('ht')
+                    if row_idx and height and int(row_idx) <= HEADER_ROWS:
+                        heights[int(row_idx)] = float(height)
+                    elem.clear()
+                elif tag == 'mergeCell':
+                    ref = elem.get('ref')
+                    if ref and CellRange(ref).max_row <= HEADER_ROWS:
+                        merges.append(ref)
+                elif tag == 'pane':
+                    if elem.get('state') in ('frozen', 'frozenSplit'):
+                        freeze = elem.get('topLeftCell')
+
+    return widths, heights, merges, freeze
+
+
+def export_with_template(template_path, output, data_rows, chart_header=None):
+    """
+    按原chart格式流式导出
+    template_path: 原chart文件，output: 输出路径或可写文件对象
+    data_rows: 数据行（每行为值列表），写入第5行起；每个单元格沿用原chart同位置的样式
+    返回导出的数据行数
+    """
+    # 只读打开原chart：只解析Wire Chart这一张sheet，且逐行读取
+    source_wb = load_workbook(template_path, read_only=True)
+    try:
+        source_ws = find_wire_chart_sheet(source_wb)
+        if source_ws is None:
+            raise ValueError("未找到Wire Chart sheet")
+
+        max_col = max(source_ws.max_column or 0, len(chart_header or ()))
+        widths, heights, merges, freeze = _read_sheet_layout(template_path, source_ws.title)
+
+        out_wb = Workbook(write_only=True)
+        out_ws = out_wb.create_sheet(SHEET_TITLE)
+        styles = StyleRegistry(out_ws)
+
+        # 列宽、行高、合并单元格必须在写入行之前设置
+        for col_idx, width in widths.items():
+            if col_idx <= max_col:
+                out_ws.column_dimensions[get_column_letter(col_idx)].width = width
+        for row_idx, height in heights.items():
+            out_ws.row_dimensions[row_idx].height = height
+        for ref in merges:
+            out_ws.merged_cells.add(ref)
+        out_ws.freeze_panes = freeze
+
+        source_rows = source_ws.iter_rows(min_row=1, max_col=max_col or None)
+
+        # 前4行：值 + 格式
+        for _ in range(HEADER_ROWS):
+            source_row = next(source_rows, ())
+            out_ws.append([
+                styles.make_cell(cell.value, styles.style_for(cell))
+                for cell in source_row
+            ])
+
+        # 数据行：原chart同位置单元格有样式时沿用
+        row_count = 0
+        for row in data_rows:
+            source_row = next(source_rows, ())
+            out_row = []
+            for col_idx, val in enumerate(row):
+                style = styles.style_for(source_row[col_idx]) if col_idx < len(source_row) else None
+                out_row.append(styles.make_cell(val if val else None, style))
+            out_ws.append(out_row)
+            row_count += 1
+
+        out_wb.save(output)
+        return row_count
+    finally:
+        source_wb.close()
+
+
+def read_data_rows(chart_path, width):
+    """
+    读取已导出chart第5行起的数据行（只读模式），每行补齐/截断到 width 列，空单元格为 ''
+    """
+    wb = load_workbook(chart_path, read_only=True)
+    try:
+        ws = find_wire_chart_sheet(wb)
+        if ws is None:
+            raise ValueError("未找到Wire Chart sheet")
+        rows = []
+        for row in ws.iter_rows(min_row=HEADER_ROWS + 1, max_col=width, values_only=True):
+            values = ['' if val is None else val for val in row[:width]]
+            values.extend([''] * (width - len(values)))
+            rows.append(values)
+    finally:
+        wb.close()
+
+    # 去掉末尾的空行
+    while rows and not any(rows[-1]):
+        rows.pop()
+    return rows
+
+
+def export_plain(output, header, data_rows, header_row=HEADER_ROWS, styled_header=True, column_width=12):
+    """
+    无原chart时流式导出
+    header 写在第 header_row 行，数据紧接其后从第5行开始
+    返回导出的数据行数
+    """
+    out_wb = Workbook(write_only=True)
+    out_ws = out_wb.create_sheet(SHEET_TITLE)
+
+    if column_width:
+        for col_idx in range(1, len(header) + 1):
+            out_ws.column_dimensions[get_column_letter(col_idx)].width = column_width
+
+    styles = StyleRegistry(out_ws)
+    header_style = None
+    if styled_header:
+        header_style = styles.prototype((Font(bold=True, color="FFFFFF"),
+                                         PatternFill(start_color="2170b8", end_color="2170b8", fill_type="solid"),
+                                         Border(), Alignment(), 'General', Protection()))
+
+    for row_idx in range(1, HEADER_ROWS + 1):
+        if row_idx == header_row:
+            out_ws.append([
+                styles.make_cell(val if val else None, header_style)
+                for val in header
+            ])
+        else:
+            out_ws.append([])
+
+    row_count = 0
+    for row in data_rows:
+        out_ws.append([val if val else None for val in row])
+        row_count += 1
+
+    out_wb.save(output)
+    return row_count
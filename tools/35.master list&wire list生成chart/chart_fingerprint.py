@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Chart 指纹记录（增量更新用）
+- 每次导出时在输出文件旁写一个 <输出文件名>.fingerprint.json
+- 记录每个回路行（按输出顺序）的WIRE字段指纹、每个零件号的配置集合指纹
+- 下次ECR换版时对比指纹，只重算变化的回路和零件号列
+
+指纹文件格式:
+{
+    "version": 1,
+    "ecr": ECR文件名,
+    "row_len": 每行列数,
+    "part_numbers": [零件号...],
+    "parts": {零件号: 指纹},
+    "rows": [[回路键, 指纹], ...]   # 已删除(DEL)的行指纹为 null
+}
+"""
+
+import hashlib
+import json
+import os
+
+FINGERPRINT_VERSION = 1
+SIDECAR_SUFFIX = ".fingerprint.json"
+
+
+def _digest(parts):
+    return hashlib.blake2b('\x1f'.join(parts).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def wire_fingerprint(field_texts):
+    """WIRE行参与生成的字段（已转为文本）的指纹"""
+    return _digest(field_texts)
+
+
+def part_fingerprint(configs):
+    """零件号配置集合的指纹（与顺序无关）"""
+    return _digest(sorted(configs))
+
+
+def row_keys(wire_ids):
+    """回路号作为行键；同一回路号重复出现时依次加 #2、#3 区分"""
+    seen = {}
+    keys = []
+    for wire_id in wire_ids:
+        count = seen.get(wire_id, 0) + 1
+        seen[wire_id] = count
+        keys.append(wire_id if count == 1 else f"{wire_id}#{count}")
+    return keys
+
+
+def sidecar_path(output_path):
+    return str(output_path) + SIDECAR_SUFFIX
+
+
+def save_sidecar(output_path, state):
+    """写指纹文件；output_path 不是文件路径（如内存流）时不写"""
+    if not isinstance(output_path, (str, os.PathLike)):
+        return None
+    path = sidecar_path(output_path)
+    data = dict(state, version=FINGERPRINT_VERSION)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_sidecar(output_path):
+    """读取上次导出的指纹文件，不存在或版本不符时返回None"""
+    path = sidecar_path(output_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get('version') != FINGERPRINT_VERSION:
+        return None
+    return data
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Chart 导出结果缓存（磁盘）
+- 以 原Chart文件内容 + chartHeader/dataRows/partNumbers 的哈希为键，同样的导出直接返回上次的结果
+- 总大小超过上限时按最近使用时间淘汰最旧的结果（LRU）
+- 命中/未命中/淘汰次数供 /api/stats 查看
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+# 导出格式有变化时修改此值，旧缓存自动失效
+CACHE_VERSION = "1"
+CACHE_SUFFIX = ".xlsx"
+
+
+def export_key(chart_bytes, chartHeader, dataRows, partNumbers):
+    """导出请求的内容哈希"""
+    digest = hashlib.sha256()
+    digest.update(CACHE_VERSION.encode('ascii'))
+    chart_bytes = chart_bytes or b''
+    digest.update(len(chart_bytes).to_bytes(8, 'little'))
+    digest.update(chart_bytes)
+    payload = json.dumps([chartHeader, dataRows, partNumbers],
+                         ensure_ascii=False, separators=(',', ':'), default=str)
+    digest.update(payload.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """按总字节数限制大小的磁盘LRU缓存，线程安全"""
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.total_bytes = 0
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 键 → 字节数，最近使用的在末尾
+
+        os.makedirs(directory, exist_ok=True)
+        # 重启后按文件修改时间恢复使用顺序
+        existing = []
+        for name in os.listdir(directory):
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            stat = os.stat(os.path.join(directory, name))
+            existing.append((stat.st_mtime, name[:-len(CACHE_SUFFIX)], stat.st_size))
+        for _, key, size in sorted(existing):
+            self._entries[key] = size
+            self.total_bytes += size
+        with self._lock:
+            self._evict()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + CACHE_SUFFIX)
+
+    def get(self, key):
+        """返回缓存的xlsx字节，没有时返回None"""
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        try:
+            path = self._path(key)
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+            return data
+        except OSError:
+            # 文件被外部删除
+            with self._lock:
+                self.total_bytes -= self._entries.pop(key, 0)
+            return None
+
+    def put(self, key, data):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self.total_bytes -= self._entries.pop(key, 0)
+            self._entries[key] = len(data)
+            self.total_bytes += len(data)
+            self._evict()
+
+    def _evict(self):
+        """淘汰最久未使用的结果直到总大小不超过上限（调用方持有锁）"""
+        while self.total_bytes > self.max_bytes and self._entries:
+            key, size = self._entries.popitem(last=False)
+            self.total_bytes -= size
+            self.evictions += 1
+            try:
+                os.unlink(self._path(key))
+            except OSError:
+                pass
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self.total_bytes,
+                'max_bytes': self.max_bytes,
+            }
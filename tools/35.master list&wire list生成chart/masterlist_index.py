@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+ECR Masterlist 零件号 → 配置 索引
+- 单次遍历Masterlist sheet，列式读取第9列(索引8)起的配置列
+- 返回 零件号 → frozenset(配置)，供Wire Chart打点及其他读取同一Masterlist的工具复用
+
+Masterlist布局: A列(索引0)为零件号，前2行为表头，数据从第3行(索引2)开始；
+配置单元格为空或为 '-' 时视为无此配置。同一零件号出现多次时以第一行为准。
+"""
+
+import numpy as np
+import pandas as pd
+
+import sheet_cache
+
+DATA_START_ROW = 2
+PART_COL = 0
+CONFIG_COL_START = 8
+
+
+def find_masterlist_sheet(sheet_names):
+    """在ECR工作簿中查找Masterlist sheet（排除变更记录 Masterlist_CHG）"""
+    for name in sheet_names:
+        if 'Masterlist' in name and 'CHG' not in name:
+            return name
+    return None
+
+
+def build_part_config_index(masterlist_df, data_start_row=DATA_START_ROW,
+                            part_col=PART_COL, config_col_start=CONFIG_COL_START):
+    """
+    构建零件号配置索引
+    masterlist_df: header=None 读入的Masterlist sheet
+    返回 dict: 零件号(str) → frozenset(配置)
+    """
+    if masterlist_df is None or len(masterlist_df) <= data_start_row:
+        return {}
+
+    body = masterlist_df.iloc[data_start_row:]
+    part_values = body.iloc[:, part_col]
+    has_part = part_values.notna().to_numpy()
+
+    part_keys = part_values[has_part].astype(str).str.strip().to_numpy()
+    config_block = body.iloc[:, config_col_start:].to_numpy(dtype=object)[has_part]
+
+    # 同一零件号只保留首次出现的行
+    _, first_rows = np.unique(part_keys, return_index=True)
+    first_rows.sort()
+    part_keys = part_keys[first_rows]
+    config_block = config_block[first_rows]
+
+    index = {key: set() for key in part_keys}
+
+    # 只处理非空单元格，列式一次性取出
+    row_ids, col_ids = np.nonzero(pd.notna(config_block))
+    cells = pd.Series(config_block[row_ids, col_ids], dtype=object).astype(str).str.strip().to_numpy()
+    keep = (cells != '') & (cells != '-')
+
+    for row_id, config in zip(row_ids[keep], cells[keep]):
+        index[part_keys[row_id]].add(config)
+
+    return {key: frozenset(configs) for key, configs in index.items()}
+
+
+def load_part_config_index(ecr_path, sheet_name=None):
+    """直接从ECR文件读取Masterlist并构建索引（sheet解析结果走共用缓存）"""
+    if sheet_name is None:
+        sheet_name = find_masterlist_sheet(sheet_cache.sheet_names(ecr_path))
+        if sheet_name is None:
+            return {}
+    masterlist_df = sheet_cache.read_sheet(ecr_path, sheet_name, header=None)
+    return build_part_config_index(masterlist_df)
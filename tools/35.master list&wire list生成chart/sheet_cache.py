@@ -0,0 +1,330 @@
+# -*- coding: utf-8 -*-
+"""
+ECR等Excel工作簿的解析结果缓存（磁盘）
+- pd.read_excel 解析出的sheet按列存为 .npz（np.load 时 allow_pickle=False，缓存目录中的文件不会被当作代码执行）：
+  数值/日期列直接存数组；混合类型的列合并成一块，存每格的类型码 + 数值数组 + 字符串表下标，加载时向量化还原
+- 无法无损还原的sheet（时区日期、超出int64的整数等少见类型）不缓存，每次直接解析
+- 以文件内容哈希为键：同一ECR无论从哪个路径打开都共用缓存，文件内容变了自动失效
+- 文件 路径+大小+修改时间 → 内容哈希 也单独记录，文件未变时不必重新计算哈希
+- 缓存目录默认在用户目录下，各工具共用；可用环境变量 HARNESS_SHEET_CACHE 指定
+- 每个工作簿的缓存目录修改时间即最近使用时间：超过 CACHE_MAX_AGE 未用的删除，
+  总大小超过 CACHE_MAX_BYTES 时按最近使用时间从旧到新删除（启动时及每次写入后清理）
+
+用法:
+    from sheet_cache import sheet_names, read_sheets
+    names = sheet_names(ecr_path)
+    frames = read_sheets(ecr_path, ['WIRE', 'Masterlist-20260203'], header=None)
+"""
+
+import datetime
+import hashlib
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 2
+HASH_CHUNK_SIZE = 1024 * 1024
+CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024  # 所有工作簿缓存的总大小上限
+CACHE_MAX_AGE = 30 * 24 * 3600            # 未使用超过此秒数的缓存删除
+
+
+# 混合类型列中每格的类型码
+KIND_NONE, KIND_STR, KIND_FLOAT, KIND_INT, KIND_BOOL, KIND_DATETIME, KIND_TIMESTAMP, KIND_TIME = range(8)
+CELL_KINDS = {
+    type(None): KIND_NONE, str: KIND_STR,
+    float: KIND_FLOAT, np.float64: KIND_FLOAT,
+    int: KIND_INT, np.int64: KIND_INT,
+    bool: KIND_BOOL, np.bool_: KIND_BOOL,
+    datetime.datetime: KIND_DATETIME, pd.Timestamp: KIND_TIMESTAMP, datetime.time: KIND_TIME,
+}
+EPOCH = datetime.datetime(1970, 1, 1)
+ONE_MICROSECOND = datetime.timedelta(microseconds=1)
+NATIVE_KINDS = 'biufM'  # 直接存数组的列（bool/整数/浮点/日期）
+
+
+def _encode_objects(values, prefix, arrays):
+    """混合类型的一列 → 类型码、数值、字符串表等数组；有无法无损保存的值时抛 ValueError"""
+    count = len(values)
+    kinds = np.fromiter((CELL_KINDS.get(type(value), -1) for value in values), dtype=np.int8, count=count)
+    if (kinds < 0).any():
+        raise ValueError("不支持的单元格类型")
+    numbers = np.zeros(count, dtype=np.float64)
+    integers = np.zeros(count, dtype=np.int64)
+    codes = np.zeros(count, dtype=np.int32)
+    table = {}
+    for i in np.flatnonzero(kinds != KIND_NONE).tolist():
+        kind, value = kinds[i], values[i]
+        if kind == KIND_STR:
+            codes[i] = table.setdefault(value, len(table))
+        elif kind == KIND_FLOAT:
+            numbers[i] = value
+        elif kind in (KIND_INT, KIND_BOOL):
+            if not -2 ** 63 <= value < 2 ** 63:
+                raise ValueError("整数超出int64")
+            integers[i] = value
+        elif value.tzinfo is not None:
+            raise ValueError("不支持带时区的日期")
+        elif kind == KIND_TIMESTAMP:
+            integers[i] = value.value
+        elif kind == KIND_DATETIME:
+            integers[i] = (value - EPOCH) // ONE_MICROSECOND
+        else:
+            integers[i] = ((value.hour * 60 + value.minute) * 60 + value.second) * 1000000 + value.microsecond
+
+    strings = list(table)
+    arrays[f'{prefix}.kinds'] = kinds
+    arrays[f'{prefix}.numbers'] = numbers
+    arrays[f'{prefix}.integers'] = integers
+    arrays[f'{prefix}.codes'] = codes
+    arrays[f'{prefix}.text'] = np.array(''.join(strings))
+    arrays[f'{prefix}.offsets'] = np.cumsum([0] + [len(text) for text in strings], dtype=np.int64)
+
+
+def _decode_objects(data, prefix):
+    kinds = data[f'{prefix}.kinds']
+    integers = data[f'{prefix}.integers']
+    values = np.full(len(kinds), None, dtype=object)
+
+    text = str(data[f'{prefix}.text'])
+    offsets = data[f'{prefix}.offsets'].tolist()
+    strings = np.empty(len(offsets) - 1, dtype=object)
+    strings[:] = [text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    mask = kinds == KIND_STR
+    values[mask] = strings[data[f'{prefix}.codes'][mask]]
+    mask = kinds == KIND_FLOAT
+    values[mask] = data[f'{prefix}.numbers'][mask].tolist()
+    mask = kinds == KIND_INT
+    values[mask] = integers[mask].tolist()
+    mask = kinds == KIND_BOOL
+    values[mask] = integers[mask].astype(bool).tolist()
+    for kind, convert in ((KIND_DATETIME, lambda us: EPOCH + us * ONE_MICROSECOND),
+                          (KIND_TIMESTAMP, pd.Timestamp),
+                          (KIND_TIME, lambda us: (datetime.datetime.min + us * ONE_MICROSECOND).time())):
+        for i in np.flatnonzero(kinds == kind).tolist():
+            values[i] = convert(int(integers[i]))
+    return values
+
+
+def encode_frame(df):
+    """DataFrame → {名称: 数组}（可用 np.savez 保存）；无法无损保存时抛 ValueError"""
+    if not (isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1):
+        raise ValueError("只支持默认行索引")
+    arrays = {'shape': np.array(df.shape, dtype=np.int64)}
+    columns = df.columns
+    if isinstance(columns, pd.RangeIndex) and columns.start == 0 and columns.step == 1:
+        arrays['range_columns'] = np.array(True)
+    else:
+        _encode_objects(columns.to_numpy(dtype=object), 'columns', arrays)
+
+    # 混合类型的列合并成一块编码，npz 中的数组个数不随列数增长
+    object_columns, string_columns, block = [], [], []
+    for i in range(df.shape[1]):
+        column = df.iloc[:, i]
+        if isinstance(column.dtype, np.dtype) and column.dtype.kind in NATIVE_KINDS:
+            arrays[f'{i}.values'] = column.to_numpy()
+        elif column.dtype == object or column.dtype == 'str':
+            object_columns.append(i)
+            string_columns.append(column.dtype != object)  # pandas 3 的字符串列
+            block.append(column.to_numpy(dtype=object))
+        else:
+            raise ValueError(f"不支持的列类型: {column.dtype}")
+    arrays['object_columns'] = np.array(object_columns, dtype=np.int64)
+    arrays['string_columns'] = np.array(string_columns, dtype=bool)
+    _encode_objects(np.concatenate(block) if block else np.empty(0, dtype=object), 'objects', arrays)
+    return arrays
+
+
+def decode_frame(data):
+    """encode_frame 的结果（np.load 打开的 .npz）→ DataFrame"""
+    rows, width = data['shape'].tolist()
+    object_columns = data['object_columns'].tolist()
+    block = _decode_objects(data, 'objects').reshape(len(object_columns), rows)
+    columns = {}
+    for values, i, is_string in zip(block, object_columns, data['string_columns'].tolist()):
+        columns[i] = pd.Series(values, dtype='str' if is_string else object)
+    for i in range(width):
+        if i not in columns:
+            columns[i] = pd.Series(data[f'{i}.values'], copy=False)
+    frame = pd.DataFrame(dict(sorted(columns.items())), index=pd.RangeIndex(rows))
+    if 'range_columns' not in data:
+        frame.columns = pd.Index(_decode_objects(data, 'columns').tolist())
+    return frame
+
+
+def default_cache_dir():
+    configured = os.environ.get('HARNESS_SHEET_CACHE')
+    if configured:
+        return configured
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'harness_sheet_cache')
+
+
+def _write_atomic(path, data):
+    # 临时文件名带进程和线程号，同一进程内多个线程写同一文件互不干扰
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SheetCache:
+    """按文件内容哈希缓存解析后的sheet"""
+
+    def __init__(self, cache_dir=None, max_bytes=CACHE_MAX_BYTES, max_age=CACHE_MAX_AGE):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._stat_dir = os.path.join(self.cache_dir, 'stat')
+        self._sheet_dir = os.path.join(self.cache_dir, 'sheets')
+        self._prune_lock = threading.Lock()
+        os.makedirs(self._stat_dir, exist_ok=True)
+        os.makedirs(self._sheet_dir, exist_ok=True)
+        self.prune()
+
+    def file_digest(self, path):
+        """文件内容哈希；路径、大小、修改时间都没变时直接用记录的哈希"""
+        stat = os.stat(path)
+        stat_key = hashlib.sha1(
+            f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode('utf-8')
+        ).hexdigest()
+        stat_path = os.path.join(self._stat_dir, stat_key)
+        try:
+            with open(stat_path, 'r', encoding='ascii') as f:
+                content_hash = f.read().strip()
+            os.utime(stat_path)
+            return content_hash
+        except OSError:
+            pass
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        _write_atomic(stat_path, content_hash.encode('ascii'))
+        return content_hash
+
+    def _entry_dir(self, content_hash):
+        path = os.path.join(self._sheet_dir, content_hash)
+        os.makedirs(path, exist_ok=True)
+        os.utime(path)  # 记录最近使用时间
+        return path
+
+    def prune(self, keep=None):
+        """
+        删除过期的缓存，总大小超出上限时按最近使用时间从旧到新删除
+        keep 为正在使用的工作簿内容哈希，不删除
+        """
+        with self._prune_lock:
+            now = time.time()
+            entries = []
+            for name in os.listdir(self._sheet_dir):
+                path = os.path.join(self._sheet_dir, name)
+                try:
+                    used = os.path.getmtime(path)
+                    size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+                except OSError:
+                    continue
+                entries.append((used, name, size))
+
+            entries.sort()
+            total = sum(size for _, _, size in entries)
+            for used, name, size in entries:
+                if name == keep:
+                    continue
+                if now - used <= self.max_age and total <= self.max_bytes:
+                    break
+                shutil.rmtree(os.path.join(self._sheet_dir, name), ignore_errors=True)
+                total -= size
+
+            # 文件 → 内容哈希 的记录很小，只按时间清理
+            for entry in os.scandir(self._stat_dir):
+                try:
+                    if now - entry.stat().st_mtime > self.max_age:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+
+    def _sheet_path(self, content_hash, sheet_name, header):
+        options = json.dumps([CACHE_VERSION, sheet_name, header], ensure_ascii=False)
+        name = hashlib.sha1(options.encode('utf-8')).hexdigest() + '.npz'
+        return os.path.join(self._entry_dir(content_hash), name)
+
+    def sheet_names(self, path):
+        """工作簿中的sheet名称列表"""
+        names_path = os.path.join(self._entry_dir(self.file_digest(path)), 'sheet_names.json')
+        try:
+            with open(names_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass
+
+        with pd.ExcelFile(path) as xls:
+            names = list(xls.sheet_names)
+        _write_atomic(names_path, json.dumps(names, ensure_ascii=False).encode('utf-8'))
+        return names
+
+    def read_sheets(self, path, sheet_names, header=0):
+        """
+        读取多个sheet，返回 {sheet名: DataFrame}
+        未缓存的sheet只打开一次工作簿解析，解析结果写入缓存
+        """
+        content_hash = self.file_digest(path)
+        frames = {}
+        missing = []
+        for name in sheet_names:
+            try:
+                with np.load(self._sheet_path(content_hash, name, header), allow_pickle=False) as data:
+                    frames[name] = decode_frame(data)
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                missing.append(name)
+
+        if missing:
+            with pd.ExcelFile(path) as xls:
+                for name in missing:
+                    df = pd.read_excel(xls, sheet_name=name, header=header)
+                    frames[name] = df
+                    try:
+                        arrays = encode_frame(df)
+                    except ValueError:
+                        continue
+                    buffer = io.BytesIO()
+                    np.savez(buffer, **arrays)
+                    _write_atomic(self._sheet_path(content_hash, name, header), buffer.getvalue())
+            self.prune(keep=content_hash)
+
+        return frames
+
+    def read_sheet(self, path, sheet_name, header=0):
+        return self.read_sheets(path, [sheet_name], header=header)[sheet_name]
+
+
+_default_cache = None
+
+
+def get_cache():
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = SheetCache()
+    return _default_cache
+
+
+def sheet_names(path):
+    return get_cache().sheet_names(path)
+
+
+def read_sheets(path, sheet_names, header=0):
+    return get_cache().read_sheets(path, sheet_names, header=header)
+
+
+def read_sheet(path, sheet_name, header=0):
+    return get_cache().read_sheet(path, sheet_name, header=header)
@@ -2,24 +2,158 @@
 """
 Wire Chart 服务器
 同时启动HTTP服务器和浏览器，支持导出带格式Excel
+- 多线程HTTP服务器，页面文件和 /api/export 可同时处理多个请求
+- 只提供 STATIC_FILES 中列出的页面文件，其余路径（含目录列表、脚本源码、导出留下的文件）一律404
+- 上传的multipart表单用标准库 email 解析（cgi 模块在 Python 3.13 中已移除）
+- 导出在进程内的常驻线程池中执行（openpyxl 只在启动时导入一次），不再为每次导出启动新的Python进程
+- 每个请求的原Chart和导出结果都只在内存中，不写共享文件，多人同时导出互不覆盖
+- 导出结果按请求内容哈希缓存在磁盘（LRU，限制总大小），重复导出直接返回；GET /api/stats 查看命中情况
+- 缓存目录在用户目录下（不在页面目录中，不会被HTTP访问到），可用环境变量 WIRE_CHART_EXPORT_CACHE 指定
+- 线程池和缓存在 main() 中通过 start_export_service() 创建，导入本模块没有副作用
 """
 
 import http.server
-import socketserver
 import webbrowser
 import threading
 import os
-import sys
+import io
 import json
-import cgi
-import tempfile
-from urllib.parse import urlparse, parse_qs
-import subprocess
+import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from email.parser import BytesParser
+from email.policy import HTTP
+from functools import partial
+from urllib.parse import urlparse, quote
+
+from export_cache import ExportCache, export_key
+from export_with_format import export_payload
 
 PORT = 8765
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 优先使用V6版本（与原来相同），没有V6/V4时用V8
+HTML_CANDIDATES = ['wire_chart_v6.html', 'wire_chart_v4.html', 'wire_chart_v8.html']
+# 允许通过HTTP访问的文件（页面及其引用的本地JS）；新增本地资源时加到这里
+STATIC_FILES = frozenset(HTML_CANDIDATES)
+
+# 同时进行的导出数；超过的请求在线程池队列中等待
+EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+EXPORT_FILENAME = 'Wire_Chart_更新.xlsx'
+XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# 导出结果缓存（缓存的是各用户的导出结果，不能放在页面目录中）
+CACHE_MAX_BYTES = 512 * 1024 * 1024
+LEGACY_CACHE_DIR = os.path.join(SCRIPT_DIR, '.export_cache')
+
+
+def default_cache_dir():
+    configured = os.environ.get('WIRE_CHART_EXPORT_CACHE')
+    if configured:
+        return configured
+    base = os.environ.get('LOCALAPPDATA') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'wire_chart_export_cache')
+
+
+# 由 start_export_service() 创建
+export_pool = None
+export_cache = None
+
+# 正在导出的请求：相同内容的并发请求共用同一次导出
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def start_export_service(cache_dir=None):
+    """创建导出线程池和结果缓存（只在第一次调用时创建）"""
+    global export_pool, export_cache
+    if export_pool is not None:
+        return
+    # 旧版本把缓存放在页面目录下，启动时删除
+    shutil.rmtree(LEGACY_CACHE_DIR, ignore_errors=True)
+    export_cache = ExportCache(cache_dir or default_cache_dir(), CACHE_MAX_BYTES)
+    export_pool = ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix='export')
+
+
+def run_export(chart_bytes, chartHeader, dataRows):
+    """导出到内存，返回xlsx字节；chart_bytes 为None时创建新文件"""
+    chart_source = io.BytesIO(chart_bytes) if chart_bytes else None
+    output = io.BytesIO()
+    export_payload(chart_source, output, chartHeader, dataRows)
+    return output.getvalue()
+
+
+def cached_export(chart_bytes, chartHeader, dataRows, partNumbers):
+    """先查缓存，未命中时在线程池中导出并写入缓存；返回 (xlsx字节, 是否命中)"""
+    key = export_key(chart_bytes, chartHeader, dataRows, partNumbers)
+
+    # 先看是否有相同内容正在导出（导出完成时先写缓存再移出，故之后查缓存必能命中）
+    with _inflight_lock:
+        future = _inflight.get(key)
+    owner = False
+    if future is None:
+        file_data = export_cache.get(key)
+        if file_data is not None:
+            return file_data, True
+
+        with _inflight_lock:
+            future = _inflight.get(key)
+            owner = future is None
+            if owner:
+                future = _inflight[key] = export_pool.submit(run_export, chart_bytes, chartHeader, dataRows)
+
+    try:
+        file_data = future.result()
+        if owner:
+            export_cache.put(key, file_data)
+    finally:
+        if owner:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    return file_data, False
+
+
+def parse_multipart(content_type, body):
+    """解析multipart/form-data请求体，返回 {字段名: (文件名或None, 字节)}"""
+    message = BytesParser(policy=HTTP).parsebytes(
+        b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body)
+    if not message.is_multipart():
+        raise ValueError('需要multipart/form-data')
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param('name', header='content-disposition')
+        if name:
+            fields[name] = (part.get_filename(), part.get_payload(decode=True) or b'')
+    return fields
+
+
+def json_field(fields, name):
+    """表单中的JSON字段，没有时为空列表"""
+    if name not in fields:
+        return []
+    return json.loads(fields[name][1].decode('utf-8'))
+
+
+class APIHandler(http.server.SimpleHTTPRequestHandler):
+    def do_GET(self):
+        """/api/stats 返回导出缓存统计，其余路径只提供白名单中的页面文件"""
+        if urlparse(self.path).path == '/api/stats':
+            self.send_json(200, {'export_cache': export_cache.stats()})
+        elif self.is_static_allowed():
+            super().do_GET()
+        else:
+            self.send_error(404)
+
+    def do_HEAD(self):
+        if self.is_static_allowed():
+            super().do_HEAD()
+        else:
+            self.send_error(404)
+
+    def is_static_allowed(self):
+        """请求路径是否正好是白名单中的一个文件（不含子目录，不提供目录列表）"""
+        name = urlparse(self.path).path.lstrip('/')
+        return name in STATIC_FILES and os.path.isfile(os.path.join(SCRIPT_DIR, name))
 
-class APIHandler(http.server.BaseHTTPRequestHandler):
     def do_POST(self):
         """处理API请求"""
         path = urlparse(self.path).path
@@ -30,101 +164,76 @@ class APIHandler(http.server.BaseHTTPRequestHandler):
                 # 解析multipart表单数据
                 content_type = self.headers.get('Content-Type', '')
                 if 'multipart/form-data' in content_type:
-                    form = cgi.FieldStorage(
-                        fp=self.rfile,
-                        headers=self.headers,
-                        environ={'REQUEST_METHOD': 'POST',
-                                'CONTENT_TYPE': content_type}
-                    )
-
-                    chartFile = form['chartFile'] if 'chartFile' in form else None
-                    chartHeader = json.loads(form['chartHeader'].value) if 'chartHeader' in form else []
-                    dataRows = json.loads(form['dataRows'].value) if 'dataRows' in form else []
-                    partNumbers = json.loads(form['partNumbers'].value) if 'partNumbers' in form else []
-
-                    # 调用导出脚本
-                    cmd = [
-                        sys.executable,
-                        os.path.join(SCRIPT_DIR, 'export_with_format.py'),
-                    ]
-
-                    if chartFile.filename:
-                        # 保存临时chart文件
-                        with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp:
-                            tmp.write(chartFile.file.read())
-                            chart_file_path = tmp.name
-                        cmd.append(chart_file_path)
-                    else:
-                        cmd.append('')
-
-                    cmd.append('Wire_Chart_更新.xlsx')
-
-                    # 传递JSON数据通过临时文件
-                    json_data = json.dumps({
-                        'chartHeader': chartHeader,
-                        'dataRows': dataRows,
-                        'partNumbers': partNumbers
-                    }, ensure_ascii=False)
-
-                    with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False, encoding='utf-8') as tmp:
-                        tmp.write(json_data)
-                        json_path = tmp.name
-
-                    cmd.append(json_path)
-
-                    result = subprocess.run(cmd, capture_output=True=True, cwd=SCRIPT_DIR)
-
-                    # 清理临时文件
-                    if chartFile.filename:
-                        os.unlink(chart_file_path)
-                    os.unlink(json_path)
-
-                    if result.returncode == 0 and os.path.exists(os.path.join(SCRIPT_DIR, 'Wire_Chart_更新.xlsx')):
-                        # 发送文件
-                        output_file = os.path.join(SCRIPT_DIR, 'Wire_Chart_更新.xlsx')
-                        with open(output_file, 'rb') as f:
-                            file_data = f.read()
-
-                        self.send_response(200)
-                        self.send_header('Content-Type', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
-                        self.send_header('Content-Disposition', 'attachment; filename="Wire_Chart_更新.xlsx"')
-                        self.send_header('Content-Length', len(file_data))
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(file_data)
-                    else:
-                        self.send_response(500)
-                        self.send_header('Content-Type', 'application/json')
-                        self.send_header('Access-Control-Allow-Origin', '*')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({'error': '导出失败'}).encode('utf-8'))
+                    length = int(self.headers.get('Content-Length') or 0)
+                    form = parse_multipart(content_type, self.rfile.read(length))
+
+                    chartHeader = json_field(form, 'chartHeader')
+                    dataRows = json_field(form, 'dataRows')
+                    partNumbers = json_field(form, 'partNumbers')
+
+                    chart_filename, chart_bytes = form.get('chartFile', (None, None))
+                    if not chart_filename or not chart_bytes:
+                        chart_bytes = None
+
+                    # 命中缓存直接返回，否则交给常驻导出线程池，本请求线程等待结果
+                    start = time.perf_counter()
+                    file_data, hit = cached_export(chart_bytes, chartHeader, dataRows, partNumbers)
+                    source = "缓存" if hit else "导出"
+                    print(f"{source}完成: {len(dataRows)} 行, {len(file_data)} 字节, 用时 {time.perf_counter() - start:.2f}s")
+
+                    self.send_file(file_data, EXPORT_FILENAME)
 
                 else:
-                    self.send_response(400)
-                    self.send_header('Content-Type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps({'error': '需要multipart/form-data'}).encode('utf-8'))
+                    self.send_json(400, {'error': '需要multipart/form-data'})
+
+            except ValueError as e:
+                print(f"导出错误: {e}")
+                self.send_json(400, {'error': str(e)})
 
             except Exception as e:
                 print(f"导出错误: {e}")
-                self.send_response(500)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps({'error': str(e)}).encode('utf-8'))
+                self.send_json(500, {'error': str(e)})
 
         else:
             self.send_response(404)
             self.end_headers()
 
+    def send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_file(self, file_data, filename):
+        """发送文件；中文文件名按 RFC 5987 编码（HTTP头只能是latin-1）"""
+        self.send_response(200)
+        self.send_header('Content-Type', XLSX_MIME)
+        self.send_header('Content-Disposition',
+                         f"attachment; filename=\"Wire_Chart.xlsx\"; filename*=UTF-8''{quote(filename)}")
+        self.send_header('Content-Length', str(len(file_data)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(file_data)
+
     def log_message(self, format, *args):
         """自定义日志格式"""
         print(f"[{self.log_date_time_string()}] {format % args}")
 
-def start_server():
-    """启动HTTP服务器"""
-    os.chdir(SCRIPT_DIR)
 
+def find_html_file():
+    """按 HTML_CANDIDATES 的顺序查找页面文件"""
+    for name in HTML_CANDIDATES:
+        path = os.path.join(SCRIPT_DIR, name)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def start_server(html_name):
+    """启动HTTP服务器"""
     # 注册MIME类型
     http.server.SimpleHTTPRequestHandler.extensions_map.update({
         ".html": "text/html",
@@ -132,32 +241,34 @@ def start_server():
         ".css": "text/css",
     })
 
-    with socketserver.TCPServer(("", PORT), APIHandler) as httpd:
+    handler = partial(APIHandler, directory=SCRIPT_DIR)
+    with http.server.ThreadingHTTPServer(("", PORT), handler) as httpd:
         print(f"=" * 50)
-        print(f"Wire Chart 服务器已启动")
-        print(f"V6版本: http://localhost:{PORT}/wire_chart_v6.html")
+        print(f"Wire Chart 服务器已启动（导出线程: {EXPORT_WORKERS}）")
+        print(f"页面: http://localhost:{PORT}/{html_name}")
         print(f"=" * 50)
         httpd.serve_forever()
 
+
 def main():
-    # 获取HTML文件路径，优先使用V6版本
-    html_file_v6 = os.path.join(SCRIPT_DIR, 'wire_chart_v6.html')
-    html_file = html_file_v6 if os.path.exists(html_file_v6) else os.path.join(SCRIPT_DIR, 'wire_chart_v4.html')
+    html_file = find_html_file()
 
-    if not os.path.exists(html_file):
+    if not html_file:
         print(f"错误: 找不到 HTML文件")
         return
 
+    html_name = os.path.basename(html_file)
+    start_export_service()
+
     # 在新线程中启动服务器
-    server_thread = threading.Thread(target=start_server, daemon=True)
+    server_thread = threading.Thread(target=start_server, args=(html_name,), daemon=True)
     server_thread.start()
 
     # 等待服务器启动
-    import time
     time.sleep(1)
 
     # 打开浏览器
-    url = f"http://localhost:{PORT}/{os.path.basename(html_file)}"
+    url = f"http://localhost:{PORT}/{html_name}"
     print(f"正在打开浏览器: {url}")
     webbrowser.open(url)
 
@@ -168,6 +279,7 @@ def main():
         while True:
             time.sleep(1)
     except KeyboardInterrupt:
+        export_pool.shutdown(wait=False, cancel_futures=True)
         print("\n服务器已停止")
 
 if __name__ == "__main__":
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+虚拟化结果表格
+- 行数据一次性渲染为字符串；不同的字符串只存一份（字符串表），单元格按行平铺存为字符串表下标的 array，
+  每格2字节（不同字符串超过65536个时改为4字节），不再每格一个Python对象引用
+- Treeview 只保留一屏的行，滚动时仅替换可见窗口的值，不再整页删除/插入
+- 适合 2万+ 行 × 数百个零件号列的Wire Chart结果浏览
+"""
+
+import tkinter as tk
+from array import array
+from tkinter import ttk
+
+
+def render_cell(value):
+    """单元格显示文本：None/NaN 显示为空"""
+    if value is None:
+        return ''
+    if isinstance(value, float) and value != value:
+        return ''
+    return str(value)
+
+
+class StringTable(dict):
+    """显示字符串 → 下标；新字符串在第一次查找时追加到 strings（下标0为空串）"""
+
+    def __init__(self):
+        super().__init__({'': 0})
+        self.strings = ['']
+
+    def __missing__(self, text):
+        code = self[text] = len(self.strings)
+        self.strings.append(text)
+        return code
+
+
+# 下标数组类型：先用2字节，字符串表超出范围时换成4字节
+SMALL_CODE_TYPE = 'H'
+LARGE_CODE_TYPE = 'I'
+SMALL_CODE_LIMIT = 1 << 16
+
+
+class RowStore:
+    """预渲染的行存储：strings[codes[row * width + col]] 为显示字符串"""
+
+    def __init__(self, rows, width):
+        self.width = width
+        self.row_count = 0
+        self.codes = array(SMALL_CODE_TYPE)
+
+        table = StringTable()
+        lookup = table.__getitem__
+        blank_tail = [0] * width
+        for row in rows:
+            row_codes = list(map(lookup, (render_cell(v) for v in row[:width])))
+            if len(table.strings) > SMALL_CODE_LIMIT and self.codes.typecode == SMALL_CODE_TYPE:
+                self.codes = array(LARGE_CODE_TYPE, self.codes)
+            self.codes.extend(row_codes)
+            self.codes.extend(blank_tail[len(row_codes):])
+            self.row_count += 1
+        self.strings = table.strings
+
+    def __len__(self):
+        return self.row_count
+
+    def row(self, index):
+        start = index * self.width
+        return list(map(self.strings.__getitem__, self.codes[start:start + self.width]))
+
+
+class VirtualGrid(tk.Frame):
+    """只物化可见行的表格控件"""
+
+    def __init__(self, master, row_height=20, column_width=80, on_scroll=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.column_width = column_width
+        self.on_scroll = on_scroll
+
+        self.store = RowStore([], 0)
+        self.offset = 0
+        self.visible_rows = 0
+
+        self.tree = ttk.Treeview(self, show="headings", selectmode="browse")
+        self.vsb = ttk.Scrollbar(self, orient="vertical", command=self._on_scrollbar)
+        self.hsb = ttk.Scrollbar(self, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(xscrollcommand=self.hsb.set)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        self.vsb.grid(row=0, column=1, sticky="ns")
+        self.hsb.grid(row=1, column=0, sticky="ew")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll_rows(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll_rows(3))
+        self.tree.bind("<Prior>", lambda e: self.scroll_rows(-self.visible_rows))
+        self.tree.bind("<Next>", lambda e: self.scroll_rows(self.visible_rows))
+        self.tree.bind("<Home>", lambda e: self.scroll_to(0))
+        self.tree.bind("<End>", lambda e: self.scroll_to(len(self.store)))
+
+    def set_data(self, header, rows):
+        """设置表头和数据；rows 只在这里渲染一次"""
+        width = max(len(header), max((len(r) for r in rows), default=0))
+        self.store = RowStore(rows, width)
+        self.offset = 0
+
+        columns = list(range(width))
+        self.tree.delete(*self.tree.get_children())
+        self.tree["columns"] = columns
+        for col in columns:
+            text = render_cell(header[col]) if col < len(header) else str(col)
+            self.tree.heading(col, text=text)
+            self.tree.column(col, width=self.column_width, minwidth=50, stretch=False)
+
+        self.visible_rows = 0
+        self._sync_pool()
+
+    def scroll_rows(self, delta):
+        self.scroll_to(self.offset + delta)
+
+    def scroll_to(self, offset):
+        max_offset = max(0, len(self.store) - self.visible_rows)
+        offset = max(0, min(int(offset), max_offset))
+        if offset != self.offset:
+            self.offset = offset
+            self._refresh()
+
+    def _on_scrollbar(self, action, *args):
+        if action == "moveto":
+            self.scroll_to(float(args[0]) * len(self.store))
+        elif action == "scroll":
+            step = int(args[0])
+            if args[1] == "pages":
+                step *= max(1, self.visible_rows - 1)
+            self.scroll_rows(step)
+
+    def _on_mousewheel(self, event):
+        self.scroll_rows(int(-1 * (event.delta / 120)) * 3)
+        return "break"
+
+    def _on_resize(self, event):
+        self._sync_pool(event.height)
+
+    def _sync_pool(self, height=None):
+        """根据控件高度调整Treeview中常驻的行数"""
+        if height is None:
+            height = self.tree.winfo_height()
+        wanted = max(1, height // self.row_height - 1)
+        wanted = min(wanted, len(self.store))
+
+        if wanted != self.visible_rows:
+            items = self.tree.get_children()
+            if len(items) > wanted:
+                self.tree.delete(*items[wanted:])
+            else:
+                for i in range(len(items), wanted):
+                    self.tree.insert("", tk.END, iid=str(i))
+            self.visible_rows = wanted
+        self.offset = max(0, min(self.offset, len(self.store) - self.visible_rows))
+        self._refresh()
+
+    def _refresh(self):
+        """只更新可见窗口的行"""
+        for i in range(self.visible_rows):
+            row_idx = self.offset + i
+            if row_idx < len(self.store):
+                self.tree.item(str(i), values=self.store.row(row_idx))
+
+        total = len(self.store)
+        if total:
+            first = self.offset / total
+            last = min(1.0, (self.offset + self.visible_rows) / total)
+        else:
+            first, last = 0.0, 1.0
+        self.vsb.set(first, last)
+
+        if self.on_scroll:
+            self.on_scroll(self.offset, min(self.offset + self.visible_rows, total), total)
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Chart 批量生成（命令行）
+- 扫描目录（含子目录），每个目录中文件名含 'ECR' 的xlsx为ECR，其余xlsx为原chart
+- 每个原chart与同目录的ECR组成一个任务，多进程并行生成
+- 输出文件名为 <原chart名>_更新.xlsx，按原目录结构写到输出目录
+- 每个任务完成时打印各阶段耗时，最后打印汇总
+- --incremental: 输出文件及其指纹文件已存在时，只重算ECR中变化的回路和零件号列
+
+用法:
+    python wire_chart_batch.py 输入目录 [-o 输出目录] [-j 进程数] [--ecr-keyword ECR] [--incremental]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from chart_fingerprint import sidecar_path
+from wire_chart_engine import run_job
+
+OUTPUT_SUFFIX = "_更新"
+
+
+def discover_jobs(input_dir, output_dir, ecr_keyword="ECR"):
+    """
+    查找 ECR/chart 配对
+    返回 (任务列表[(ecr, chart, output)], 跳过的目录说明[])
+    """
+    jobs = []
+    skipped = []
+
+    for dirpath, dirnames, filenames in os.walk(input_dir):
+        dirnames.sort()
+        xlsx_files = sorted(
+            name for name in filenames
+            if name.lower().endswith('.xlsx') and not name.startswith('~$')
+            and OUTPUT_SUFFIX not in os.path.splitext(name)[0]
+        )
+        ecr_files = [name for name in xlsx_files if ecr_keyword in name]
+        chart_files = [name for name in xlsx_files if ecr_keyword not in name]
+
+        if not ecr_files:
+            if chart_files:
+                skipped.append(f"{dirpath}: 未找到ECR文件")
+            continue
+        if len(ecr_files) > 1:
+            skipped.append(f"{dirpath}: 有多个ECR文件 {ecr_files}，无法配对")
+            continue
+
+        ecr_path = os.path.join(dirpath, ecr_files[0])
+        target_dir = os.path.join(output_dir, os.path.relpath(dirpath, input_dir))
+        for chart_name in chart_files:
+            stem = os.path.splitext(chart_name)[0]
+            jobs.append((
+                ecr_path,
+                os.path.join(dirpath, chart_name),
+                os.path.join(target_dir, stem + OUTPUT_SUFFIX + ".xlsx"),
+            ))
+
+    return jobs, skipped
+
+
+def _run_one(ecr_path, chart_path, output_path, incremental=False):
+    """子进程入口：输出目录不存在时先创建；增量模式下以上次的输出为基础"""
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    previous_output = None
+    if incremental and os.path.exists(output_path) and os.path.exists(sidecar_path(output_path)):
+        previous_output = output_path
+    return run_job(ecr_path, chart_path, output_path, previous_output=previous_output)
+
+
+def _format_timings(timings):
+    stages = ('load_ecr', 'load_chart', 'generate', 'export')
+    parts = [f"{stage}={timings[stage]:.2f}s" for stage in stages if stage in timings]
+    return " ".join(parts) + f" total={timings['total']:.2f}s"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Wire Chart 批量生成")
+    parser.add_argument("input_dir", help="包含 ECR/chart 文件的目录")
+    parser.add_argument("-o", "--output-dir", help="输出目录（默认与输入目录相同）")
+    parser.add_argument("-j", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="并行进程数（默认CPU核数）")
+    parser.add_argument("--ecr-keyword", default="ECR", help="ECR文件名关键字（默认 ECR）")
+    parser.add_argument("--incremental", action="store_true",
+                        help="增量更新：按上次输出的指纹只重算变化部分，并填写ACTION/CHANGE DATE")
+    args = parser.parse_args(argv)
+
+    output_dir = args.output_dir or args.input_dir
+    jobs, skipped = discover_jobs(args.input_dir, output_dir, args.ecr_keyword)
+
+    for message in skipped:
+        print(f"跳过 {message}")
+    if not jobs:
+        print("没有找到可处理的 ECR/chart 配对")
+        return 1
+
+    workers = max(1, min(args.workers, len(jobs)))
+    print(f"共 {len(jobs)} 个任务，{workers} 个进程")
+
+    start = time.perf_counter()
+    failed = 0
+    total_rows = 0
+    busy = 0.0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_run_one, *job, args.incremental): job for job in jobs}
+        for future in as_completed(futures):
+            _, chart_path, output_path = futures[future]
+            name = os.path.basename(chart_path)
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[失败] {name}: {e}")
+                continue
+
+            total_rows += result['rows']
+            busy += result['timings']['total']
+            touched = result['touched']
+            changes = f", 新增 {touched['ADD']} 变更 {touched['CHG']} 删除 {touched['DEL']}" if touched else ""
+            print(f"[完成] {name}: {result['rows']} 行, X打点 {result['x_count']}{changes}, "
+                  f"{_format_timings(result['timings'])} → {output_path}")
+
+    elapsed = time.perf_counter() - start
+    print(f"汇总: 成功 {len(jobs) - failed}/{len(jobs)}, 共 {total_rows} 行, "
+          f"墙钟 {elapsed:.2f}s, 累计任务耗时 {busy:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
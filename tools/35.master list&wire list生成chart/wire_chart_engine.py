@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Chart 生成核心（不依赖界面）
+- 读取ECR：WIRE sheet + Masterlist sheet（零件号配置索引）
+- 读取原chart第4行表头及零件号
+- 生成回路数据并计算X打点
+- 导出Excel（有原chart时保留格式），同时写指纹文件
+- 增量更新：ECR换版时按指纹只重算变化的回路行和零件号列，并填写ACTION/CHANGE DATE
+
+供 wire_chart_tool_v5.py（Tk界面）和 wire_chart_batch.py（批量命令行）共用
+"""
+
+import datetime
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from chart_export import (DEFAULT_HEADER, HEADER_ROWS, export_plain,
+                          export_with_template, find_wire_chart_sheet,
+                          read_data_rows)
+from chart_fingerprint import (load_sidecar, part_fingerprint, row_keys,
+                               save_sidecar, wire_fingerprint)
+import sheet_cache
+from masterlist_index import build_part_config_index, find_masterlist_sheet
+from xdot_matrix import ConfigMatrix, build_xdot_grid
+
+# WIRE: A=0, B=1(Wire ID), C=2(Color), D=3(Size/Gauge), E=4(Material), F=5(Option),
+#       G=6(Multicore ID), H=7(Ident Tag), I=8(From Code), J=9(From Pin),
+#       K=10(To Code), L=11(To Pin)
+# 表头在第2行(索引1)，数据从第4行(索引3)开始
+WIRE_DATA_START_ROW = 3
+WIRE_ID_COL = 1
+WIRE_OPTION_COL = 5
+
+# chart列 → WIRE列
+WIRE_FIELD_MAP = [
+    ('CIRCUIT_NBR', 1), ('WIRE_SIZE', 3), ('COLOR', 2), ('CABLE_DESG', 4),
+    ('EST_WIRE_LENGTH', 7), ('GROUP_NAME', 6), ('POS_NBR_1', 8), ('CAV_1', 9),
+    ('POS_NBR_2', 10), ('CAV_2', 11), ('OPTION', 5),
+]
+
+# chart表头名称及找不到时的默认列索引
+CHART_COLUMNS = {
+    'ACTION': ('ACTION', 0),
+    'CHANGE_DATE': ('CHANGE DATE', 1),
+    'CIRCUIT_NBR': ('CIRCUIT NBR', 2),
+    'WIRE_SIZE': ('WIRE SIZE', 3),
+    'COLOR': ('COLOR', 6),
+    'CABLE_DESG': ('CABLE DESG', 8),
+    'EST_WIRE_LENGTH': ('EST WIRE LENGTH', 9),
+    'GROUP_NAME': ('GROUP NAME', 10),
+    'POS_NBR_1': ('POS NBR 1', 11),
+    'CAV_1': ('CAV 1', 12),
+    'OPTION': ('option', 22),
+    'POS_NBR_2': ('POS NBR 2', 25),
+    'CAV_2': ('CAV 2', 26),
+}
+
+# 零件号列起始位置
+PART_COL_START = 28
+
+# 增量更新时ACTION列的取值（与原chart中的 CHG 一致）
+ACTION_ADD = 'ADD'
+ACTION_CHANGE = 'CHG'
+ACTION_DELETE = 'DEL'
+
+
+def find_wire_sheet(sheet_names):
+    """在ECR工作簿中查找WIRE sheet"""
+    for name in sheet_names:
+        if 'WIRE' in name:
+            return name
+    return None
+
+
+def resolve_chart_columns(header_row):
+    """按chart表头查找各列索引，找不到时用默认位置"""
+    return {
+        key: header_row.index(name) if name in header_row else default
+        for key, (name, default) in CHART_COLUMNS.items()
+    }
+
+
+def _cell_text(value):
+    return str(value).strip() if pd.notna(value) else ''
+
+
+class WireChartEngine:
+    """Wire Chart 生成引擎"""
+
+    def __init__(self, log=None):
+        self.log = log or (lambda message: None)
+
+        self.ecr_path = None
+        self.wire_df = None
+        self.masterlist_df = None
+        self.part_config_index = {}  # 零件号 → frozenset(配置)
+
+        self.chart_path = None
+        self.chart_header = []  # 原chart第4行表头
+        self.part_numbers = []
+
+        self.generated_rows = None
+        self.row_keys = []  # 与 generated_rows 一一对应的回路键
+        self.row_hashes = []  # 与 generated_rows 一一对应的WIRE指纹（DEL行为None）
+        self.touched = {}  # 增量更新时 ACTION → [回路键]
+        self.x_count = 0
+
+    def load_ecr(self, ecr_path):
+        """读取ECR的WIRE和Masterlist sheet，并建好零件号配置索引"""
+        self.ecr_path = ecr_path
+        self.log("正在读取ECR文件...")
+        # 解析结果按文件内容缓存，同一ECR再次读取时直接加载
+        names = sheet_cache.sheet_names(ecr_path)
+        wire_sheet_name = find_wire_sheet(names)
+        masterlist_sheet_name = find_masterlist_sheet(names)
+        frames = sheet_cache.read_sheets(
+            ecr_path, [name for name in (wire_sheet_name, masterlist_sheet_name) if name], header=None)
+
+        if wire_sheet_name:
+            self.log(f"找到WIRE sheet: {wire_sheet_name}")
+            self.wire_df = frames[wire_sheet_name]
+            self.log(f"WIRE数据: {len(self.wire_df)} 行")
+
+        if masterlist_sheet_name:
+            self.log(f"找到Masterlist sheet: {masterlist_sheet_name}")
+            self.masterlist_df = frames[masterlist_sheet_name]
+            self.log(f"Masterlist数据: {len(self.masterlist_df)} 行")
+            self.part_config_index = build_part_config_index(self.masterlist_df)
+            self.log(f"Masterlist零件号索引: {len(self.part_config_index)} 个")
+        self.log("ECR文件读取完成")
+
+    def load_chart(self, chart_path):
+        """读取原chart第4行表头和零件号（从第28列开始）"""
+        wb = load_workbook(chart_path, read_only=True)
+        try:
+            ws = find_wire_chart_sheet(wb)
+            if ws is None:
+                raise ValueError("未找到Wire Chart sheet")
+            self.log(f"原Chart Sheet: {ws.title}")
+
+            header_row = next(ws.iter_rows(min_row=HEADER_ROWS, max_row=HEADER_ROWS, values_only=True), ())
+            self.chart_header = list(header_row)
+            self.chart_path = chart_path
+        finally:
+            wb.close()
+        self.log(f"表头前10列: {self.chart_header[:10]}")
+
+        self.part_numbers = [
+            str(val).strip() for val in self.chart_header[PART_COL_START:]
+            if val and str(val).strip()
+        ]
+        self.log(f"找到 {len(self.part_numbers)} 个零件号")
+
+    def _check_loaded(self):
+        if self.wire_df is None:
+            raise ValueError("请先上传ECR文件")
+        if self.masterlist_df is None:
+            raise ValueError("未找到Masterlist sheet")
+
+    def _layout(self):
+        """返回 (每行列数, 列索引映射, 参与打点的零件号)"""
+        if self.chart_path:
+            row_len = len(self.chart_header)
+            col_idx_map = resolve_chart_columns(self.chart_header)
+        else:
+            row_len = PART_COL_START
+            col_idx_map = {key: default for key, (_, default) in CHART_COLUMNS.items()}
+        part_slots = max(0, min(len(self.part_numbers), row_len - PART_COL_START))
+        return row_len, col_idx_map, self.part_numbers[:part_slots]
+
+    def _iter_wires(self, row_len, col_idx_map):
+        """
+        遍历WIRE数据行（跳过无回路号的行）
+        产出 (回路键, WIRE指纹, option原值, 新行)；新行只填了WIRE字段，未打点
+        """
+        wire_values = self.wire_df.to_numpy(dtype=object)[WIRE_DATA_START_ROW:]
+        wire_values = [row for row in wire_values if pd.notna(row[WIRE_ID_COL])]
+        keys = row_keys([_cell_text(row[WIRE_ID_COL]) for row in wire_values])
+
+        for key, wire_row in zip(keys, wire_values):
+            new_row = [''] * row_len
+            field_texts = []
+            for field, wire_col in WIRE_FIELD_MAP:
+                text = _cell_text(wire_row[wire_col]) if wire_col < len(wire_row) else ''
+                field_texts.append(text)
+                if wire_col < len(wire_row):
+                    new_row[col_idx_map[field]] = text
+            yield key, wire_fingerprint(field_texts), wire_row[WIRE_OPTION_COL], new_row
+
+    def _part_configs(self, part_numbers):
+        """零件号配置缓存（索引在读取ECR时已单次遍历Masterlist建好）"""
+        return {
+            part_num: self.part_config_index.get(part_num, frozenset())
+            for part_num in part_numbers
+        }
+
+    def generate(self):
+        """生成回路数据和X打点，返回生成的行（每行为值列表）"""
+        self._check_loaded()
+        self.log("开始生成Wire Chart...")
+
+        row_len, col_idx_map, parts = self._layout()
+        if self.chart_path:
+            self.log(f"列索引映射: {col_idx_map}")
+        part_config_cache = self._part_configs(self.part_numbers)
+        self.log(f"零件号配置缓存: {len(part_config_cache)}")
+
+        # 生成数据
+        self.log("生成回路数据...")
+        generated_rows = []
+        option_values = []
+        keys = []
+        hashes = []
+        for key, fingerprint, option, new_row in self._iter_wires(row_len, col_idx_map):
+            keys.append(key)
+            hashes.append(fingerprint)
+            option_values.append(option)
+            generated_rows.append(new_row)
+
+            if len(generated_rows) % 500 == 0:
+                self.log(f"已处理 {len(generated_rows)} 行...")
+
+        # 计算X打点：配置矩阵上一次性求出 回路 × 零件号 的打点矩阵
+        config_matrix = ConfigMatrix(parts, part_config_cache)
+        xdot_grid = build_xdot_grid(option_values, config_matrix)
+        for new_row, row_xdots in zip(generated_rows, xdot_grid):
+            for pi in np.flatnonzero(row_xdots):
+                new_row[PART_COL_START + pi] = 'X'
+
+        self.generated_rows = generated_rows
+        self.row_keys = keys
+        self.row_hashes = hashes
+        self.touched = {}
+        self.x_count = int(xdot_grid.sum())
+        self.log(f"生成完成: {len(generated_rows)} 行数据, X打点: {self.x_count}")
+        return generated_rows
+
+    def generate_incremental(self, previous_output, change_date=None):
+        """
+        基于上次导出的chart及其指纹文件增量生成
+        - WIRE字段变化或新增的回路整行重算，ACTION 记为 CHG / ADD
+        - Masterlist配置变化的零件号，只在未变化的回路上重算这些列，打点有变化的行记为 CHG
+        - 本次ECR中已不存在的回路保留原行，ACTION 记为 DEL，排在最后
+        - 其余行原样沿用上次的值（包括之前的ACTION/CHANGE DATE）
+        指纹文件缺失或零件号列与上次不一致时退回全量生成
+        """
+        self._check_loaded()
+        row_len, col_idx_map, parts = self._layout()
+
+        state = load_sidecar(previous_output)
+        if state is None:
+            self.log("未找到上次的指纹文件，全量生成")
+            return self.generate()
+        if state.get('row_len') != row_len or state.get('part_numbers') != parts:
+            self.log("chart表头或零件号与上次不一致，全量生成")
+            return self.generate()
+
+        previous_rows = read_data_rows(previous_output, row_len)
+        previous_keys = state.get('rows', [])
+        if len(previous_rows) != len(previous_keys):
+            self.log("上次导出的行数与指纹文件不一致，全量生成")
+            return self.generate()
+
+        self.log(f"增量生成: 上次 {len(previous_rows)} 行")
+        previous = {
+            key: (fingerprint, row)
+            for (key, fingerprint), row in zip(previous_keys, previous_rows)
+        }
+
+        # 配置集合有变化的零件号列
+        part_config_cache = self._part_configs(parts)
+        previous_parts = state.get('parts', {})
+        changed_parts = [
+            pi for pi, pn in enumerate(parts)
+            if previous_parts.get(pn) != part_fingerprint(part_config_cache[pn])
+        ]
+        self.log(f"配置变化的零件号: {len(changed_parts)} 个")
+
+        rows = []
+        keys = []
+        hashes = []
+        actions = {}
+        recompute = []  # (行号, option)：整行重算打点
+        reused = []  # (行号, option)：只重算变化的零件号列
+        for key, fingerprint, option, new_row in self._iter_wires(row_len, col_idx_map):
+            old_fingerprint, old_row = previous.pop(key, (None, None))
+            if old_row is not None and old_fingerprint == fingerprint:
+                reused.append((len(rows), option))
+                rows.append(list(old_row))
+            else:
+                actions[len(rows)] = ACTION_CHANGE if old_fingerprint else ACTION_ADD
+                recompute.append((len(rows), option))
+                rows.append(new_row)
+            keys.append(key)
+            hashes.append(fingerprint)
+
+        if recompute:
+            grid = build_xdot_grid([option for _, option in recompute],
+                                   ConfigMatrix(parts, part_config_cache))
+            for (row_idx, _), row_xdots in zip(recompute, grid):
+                for pi in np.flatnonzero(row_xdots):
+                    rows[row_idx][PART_COL_START + pi] = 'X'
+
+        if reused and changed_parts:
+            changed_numbers = [parts[pi] for pi in changed_parts]
+            grid = build_xdot_grid([option for _, option in reused],
+                                   ConfigMatrix(changed_numbers, part_config_cache))
+            for (row_idx, _), row_xdots in zip(reused, grid):
+                row = rows[row_idx]
+                for pi, xdot in zip(changed_parts, row_xdots):
+                    value = 'X' if xdot else ''
+                    if (row[PART_COL_START + pi] or '') != value:
+                        row[PART_COL_START + pi] = value
+                        actions[row_idx] = ACTION_CHANGE
+
+        # 本次ECR中已删除的回路（之前已是DEL的行原样保留）
+        for key, (old_fingerprint, old_row) in previous.items():
+            if old_fingerprint is not None:
+                actions[len(rows)] = ACTION_DELETE
+            rows.append(list(old_row))
+            keys.append(key)
+            hashes.append(None)
+
+        change_date = change_date or datetime.datetime.combine(datetime.date.today(), datetime.time())
+        touched = {ACTION_ADD: [], ACTION_CHANGE: [], ACTION_DELETE: []}
+        for row_idx, action in sorted(actions.items()):
+            rows[row_idx][col_idx_map['ACTION']] = action
+            rows[row_idx][col_idx_map['CHANGE_DATE']] = change_date
+            touched[action].append(keys[row_idx])
+
+        self.generated_rows = rows
+        self.row_keys = keys
+        self.row_hashes = hashes
+        self.touched = touched
+        self.x_count = sum(
+            1 for row in rows for value in row[PART_COL_START:PART_COL_START + len(parts)]
+            if value == 'X'
+        )
+        self.log(f"增量生成完成: 新增 {len(touched[ACTION_ADD])}, 变更 {len(touched[ACTION_CHANGE])}, "
+                 f"删除 {len(touched[ACTION_DELETE])}, 共 {len(rows)} 行, X打点: {self.x_count}")
+        for action, row_keys_touched in touched.items():
+            if row_keys_touched:
+                self.log(f"{action}: {', '.join(row_keys_touched)}")
+        return rows
+
+    def fingerprint_state(self):
+        """当前生成结果的指纹（随导出写入指纹文件）"""
+        _, _, parts = self._layout()
+        part_configs = self._part_configs(parts)
+        return {
+            'ecr': os.path.basename(self.ecr_path) if self.ecr_path else None,
+            'row_len': len(self.generated_rows[0]) if self.generated_rows else 0,
+            'part_numbers': parts,
+            'parts': {pn: part_fingerprint(configs) for pn, configs in part_configs.items()},
+            'rows': [[key, fingerprint] for key, fingerprint in zip(self.row_keys, self.row_hashes)],
+        }
+
+    def display_header(self):
+        """结果表头：有原chart时用原表头，否则用默认表头"""
+        if self.chart_path:
+            return self.chart_header
+        return DEFAULT_HEADER + self.part_numbers
+
+    def export(self, output, template=None):
+        """
+        导出Excel并写指纹文件，返回写出的数据行数
+        template: 格式来源，默认为原chart；增量更新时可传上次导出的chart
+        """
+        if not self.generated_rows:
+            raise ValueError("没有可导出的数据")
+        template = template or self.chart_path
+        if template:
+            # 模板与输出是同一文件时先写临时文件，避免边读边覆盖
+            target = output
+            if isinstance(output, str) and os.path.exists(output) and os.path.samefile(template, output):
+                target = output + ".tmp.xlsx"
+            # 流式写出，原chart的前4行、列宽、行高及单元格样式按命名样式共享
+            row_count = export_with_template(template, target, self.generated_rows)
+            if target is not output:
+                os.replace(target, output)
+        else:
+            row_count = export_plain(output, self.display_header(), self.generated_rows)
+        save_sidecar(output, self.fingerprint_state())
+        return row_count
+
+
+def run_job(ecr_path, chart_path, output_path, log=None, previous_output=None):
+    """
+    完整跑一遍：读ECR → 读chart → 生成 → 导出
+    previous_output: 上次导出的chart，给出时按指纹增量生成并以它为格式模板
+    返回 {'rows', 'x_count', 'touched', 'timings': {阶段: 秒}}
+    """
+    engine = WireChartEngine(log=log)
+    timings = {}
+
+    start = time.perf_counter()
+    engine.load_ecr(ecr_path)
+    timings['load_ecr'] = time.perf_counter() - start
+
+    stage = time.perf_counter()
+    if chart_path:
+        engine.load_chart(chart_path)
+    timings['load_chart'] = time.perf_counter() - stage
+
+    stage = time.perf_counter()
+    if previous_output:
+        engine.generate_incremental(previous_output)
+    else:
+        engine.generate()
+    timings['generate'] = time.perf_counter() - stage
+
+    stage = time.perf_counter()
+    engine.export(output_path, template=previous_output if engine.touched else None)
+    timings['export'] = time.perf_counter() - stage
+
+    timings['total'] = time.perf_counter() - start
+    return {
+        'rows': len(engine.generated_rows),
+        'x_count': engine.x_count,
+        'touched': {action: len(keys) for action, keys in engine.touched.items()},
+        'timings': timings,
+    }
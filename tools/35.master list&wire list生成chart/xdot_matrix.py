@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Wire Chart X打点矩阵
+- 零件号配置集合 → 以配置为行、零件号为列的布尔矩阵
+- 每个不同的option只在矩阵上向量化求值一次，得到该option对所有零件号的打点
+- 按回路展开后得到完整的 回路数 × 零件号数 打点矩阵
+"""
+
+import numpy as np
+
+from option_expr import compile_option
+
+
+class ConfigMatrix:
+    """零件号配置矩阵：bits[配置序号, 零件号序号] 为 True 表示该零件号带有此配置"""
+
+    def __init__(self, part_numbers, part_configs):
+        self.part_numbers = list(part_numbers)
+        self.part_count = len(self.part_numbers)
+
+        vocabulary = set()
+        for pn in self.part_numbers:
+            vocabulary.update(part_configs.get(pn, ()))
+        self.vocabulary = sorted(vocabulary)
+        self.index = {name: i for i, name in enumerate(self.vocabulary)}
+
+        # 按配置存行，column() 取出的是连续内存
+        self.bits = np.zeros((len(self.vocabulary), self.part_count), dtype=bool)
+        for pi, pn in enumerate(self.part_numbers):
+            rows = [self.index[name] for name in part_configs.get(pn, ())]
+            self.bits[rows, pi] = True
+
+        self._false = np.zeros(self.part_count, dtype=bool)
+        self._true = np.ones(self.part_count, dtype=bool)
+
+    def column(self, name):
+        """某个配置在所有零件号上的取值（词表中没有的配置全为False）"""
+        idx = self.index.get(name)
+        if idx is None:
+            return self._false
+        return self.bits[idx]
+
+    def constant(self, value):
+        return self._true if value else self._false
+
+
+def build_xdot_grid(option_values, matrix):
+    """
+    计算打点矩阵
+    option_values: 每个回路的option原始值（顺序与输出行一致）
+    返回 (回路数, 零件号数) 的布尔矩阵
+    """
+    grid = np.zeros((len(option_values), matrix.part_count), dtype=bool)
+    if not len(option_values) or not matrix.part_count:
+        return grid
+
+    # 相同option的回路共享一次求值
+    rows_by_option = {}
+    for row_idx, value in enumerate(option_values):
+        rows_by_option.setdefault(compile_option(value), []).append(row_idx)
+
+    for compiled, rows in rows_by_option.items():
+        grid[rows] = compiled.evaluate_matrix(matrix)
+
+    return grid
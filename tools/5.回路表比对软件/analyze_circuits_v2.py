@@ -6,10 +6,12 @@
 """
 
 import openpyxl
-from openpyxl.styles import PatternFill, Font
+from openpyxl.styles import Font
 from datetime import datetime
 import os
 
+from row_compare import ADDED_FILL, MODIFIED_FILL, annotate, compare_pairs, format_changes, read_rows
+
 def load_excel(filepath):
     """加载Excel文件"""
     return openpyxl.load_workbook(filepath)
@@ -43,6 +45,7 @@ def compare_circuits(old_sheet, new_sheet, log_file):
     比较两份回路表
     根据第2列回路号进行整行比较
     在NEW.xlsx第一列填写变更点
+    两张表各整体读取一次，比对完成后再单独一遍标注新文件（见 row_compare.py）
     """
     log_to_file("\n" + "="*80, log_file)
     log_to_file("开始比对两份回路表", log_file)
@@ -51,19 +54,21 @@ def compare_circuits(old_sheet, new_sheet, log_file):
     # 从第4行开始读取数据（前3行为表头）
     start_row = 4
     
+    # 两张表按相同列数整体读入
+    max_col = max(old_sheet.max_column, new_sheet.max_column, 2)
+    old_rows, old_circuits = read_rows(old_sheet, start_row, max_col)
+    new_rows, new_circuits = read_rows(new_sheet, start_row, max_col)
+    
     # 构建旧文件的回路号字典
     old_data = {}
     old_circuit_numbers = []
     
     log_to_file(f"\n读取旧文件（从第{start_row}行开始）...", log_file)
-    for row_idx in range(start_row, old_sheet.max_row + 1):
-        circuit_number = old_sheet.cell(row=row_idx, column=2).value
-        if circuit_number:
-            circuit_number = str(circuit_number).strip()
-            if circuit_number in old_data:
-                log_to_file(f"⚠️ 警告: 旧文件中发现重复的回路号 '{circuit_number}' 在第{row_idx}行", log_file)
-            old_data[circuit_number] = row_idx
-            old_circuit_numbers.append(circuit_number)
+    for circuit_number, row_idx in old_circuits:
+        if circuit_number in old_data:
+            log_to_file(f"⚠️ 警告: 旧文件中发现重复的回路号 '{circuit_number}' 在第{row_idx}行", log_file)
+        old_data[circuit_number] = row_idx
+        old_circuit_numbers.append(circuit_number)
     
     log_to_file(f"旧文件共读取 {len(old_data)} 条回路记录", log_file)
     
@@ -72,76 +77,51 @@ def compare_circuits(old_sheet, new_sheet, log_file):
     new_circuit_numbers = []
     
     log_to_file(f"\n读取新文件（从第{start_row}行开始）...", log_file)
-    for row_idx in range(start_row, new_sheet.max_row + 1):
-        circuit_number = new_sheet.cell(row=row_idx, column=2).value
-        if circuit_number:
-            circuit_number = str(circuit_number).strip()
-            if circuit_number in new_data:
-                log_to_file(f"⚠️ 警告: 新文件中发现重复的回路号 '{circuit_number}' 在第{row_idx}行", log_file)
-            new_data[circuit_number] = row_idx
-            new_circuit_numbers.append(circuit_number)
+    for circuit_number, row_idx in new_circuits:
+        if circuit_number in new_data:
+            log_to_file(f"⚠️ 警告: 新文件中发现重复的回路号 '{circuit_number}' 在第{row_idx}行", log_file)
+        new_data[circuit_number] = row_idx
+        new_circuit_numbers.append(circuit_number)
     
     log_to_file(f"新文件共读取 {len(new_data)} 条回路记录", log_file)
     
-    # 执行比较
+    # 执行比较：两边都有的回路一次批量比较（第1列是变更点列，不参与比较）
+    matched = [circuit_number for circuit_number in new_circuit_numbers if circuit_number in old_data]
+    changes = compare_pairs(old_rows, new_rows,
+                            [(old_data[circuit_number], new_data[circuit_number]) for circuit_number in matched],
+                            range(2, max_col + 1))
+    row_changes = dict(zip(matched, changes))
+    
     added_count = 0
     deleted_count = 0
     modified_count = 0
     unchanged_count = 0
+    marks = []
     
     log_to_file("\n" + "="*80, log_file)
     log_to_file("比对结果:", log_file)
     log_to_file("="*80, log_file)
     
-    # 在新文件第一列添加表头（如果第一列是空的）
-    first_header = new_sheet.cell(row=1, column=1).value
-    if first_header is None:
-        new_sheet.cell(row=1, column=1, value="变更点")
-        new_sheet.cell(row=1, column=1).font = Font(bold=True)
-    
     # 遍历新文件的每条记录
     for circuit_number in new_circuit_numbers:
         new_row_idx = new_data[circuit_number]
-        old_row_idx = old_data.get(circuit_number)
         
-        if old_row_idx is None:
+        if circuit_number not in old_data:
             # 新增的回路
             added_count += 1
-            new_sheet.cell(row=new_row_idx, column=1, value="✓ 新增")
-            new_sheet.cell(row=new_row_idx, column=1).fill = PatternFill(
-                start_color="00FF00", end_color="00FF00", fill_type="solid"
-            )
+            marks.append((new_row_idx, "✓ 新增", ADDED_FILL))
             log_to_file(f"✓ 新增: 回路号 '{circuit_number}' (新文件第{new_row_idx}行)", log_file)
+        elif row_changes[circuit_number]:
+            # 变更的回路
+            modified_count += 1
+            change_text = format_changes(row_changes[circuit_number])
+            marks.append((new_row_idx, f"★ 变更: {change_text}", MODIFIED_FILL))
+            log_to_file(f"★ 变更: 回路号 '{circuit_number}' (新文件第{new_row_idx}行)", log_file)
+            log_to_file(f"  变更内容: {change_text}", log_file)
         else:
-            # 比较整行内容
-            row_changes = []
-            max_col = max(old_sheet.max_column, new_sheet.max_column)
-            
-            for col_idx in range(1, max_col + 1):
-                old_value = old_sheet.cell(row=old_row_idx, column=col_idx).value
-                new_value = new_sheet.cell(row=new_row_idx, column=col_idx).value
-                
-                old_str = str(old_value).strip() if old_value is not None else ""
-                new_str = str(new_value).strip() if new_value is not None else ""
-                
-                if old_str != new_str:
-                    if col_idx != 1 and (old_str or new_str):
-                        row_changes.append(f"列{col_idx}:{old_str}→{new_str}")
-            
-            if row_changes:
-                # 变更的回路
-                modified_count += 1
-                change_text = "; ".join(row_changes)
-                new_sheet.cell(row=new_row_idx, column=1, value=f"★ 变更: {change_text}")
-                new_sheet.cell(row=new_row_idx, column=1).fill = PatternFill(
-                    start_color="FFFF00", end_color="FFFF00", fill_type="solid"
-                )
-                log_to_file(f"★ 变更: 回路号 '{circuit_number}' (新文件第{new_row_idx}行)", log_file)
-                log_to_file(f"  变更内容: {change_text}", log_file)
-            else:
-                # 未变更
-                unchanged_count += 1
-                new_sheet.cell(row=new_row_idx, column=1, value="")
+            # 未变更
+            unchanged_count += 1
+            marks.append((new_row_idx, "", None))
     
     # 标记删除的回路
     for circuit_number in old_circuit_numbers:
@@ -149,6 +129,12 @@ def compare_circuits(old_sheet, new_sheet, log_file):
             deleted_count += 1
             log_to_file(f"✗ 删除: 回路号 '{circuit_number}' (旧文件第{old_data[circuit_number]}行)", log_file)
     
+    # 标注新文件：第一列表头（如果第一列是空的）及各回路的变更点
+    if new_sheet.cell(row=1, column=1).value is None:
+        new_sheet.cell(row=1, column=1, value="变更点")
+        new_sheet.cell(row=1, column=1).font = Font(bold=True)
+    annotate(new_sheet, marks)
+    
     # 打印统计信息
     log_to_file("\n" + "="*80, log_file)
     log_to_file("比对统计:", log_file)
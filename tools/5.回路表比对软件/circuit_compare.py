@@ -6,9 +6,11 @@
 """
 
 import openpyxl
-from openpyxl.styles import PatternFill, Font
+from openpyxl.styles import Font
 import os
 
+from row_compare import ADDED_FILL, MODIFIED_FILL, annotate, compare_pairs, format_changes, read_rows
+
 def main():
     print("回路表比对工具")
     print("=" * 60)
@@ -39,65 +41,49 @@ def main():
     # 从第4行开始读取数据
     start_row = 4
     
+    # 两张表按相同列数整体读入（比对完成后再单独一遍标注新文件，见 row_compare.py）
+    max_col = max(old_sheet.max_column, new_sheet.max_column, 2)
+    old_rows, old_circuits = read_rows(old_sheet, start_row, max_col, falsy_as_empty=True)
+    new_rows, new_circuits = read_rows(new_sheet, start_row, max_col, falsy_as_empty=True)
+    
     # 构建旧文件数据字典
     old_data = {}
-    for row_idx in range(start_row, old_sheet.max_row + 1):
-        circuit_num = old_sheet.cell(row=row_idx, column=2).value
-        if circuit_num:
-            old_data[str(circuit_num).strip()] = row_idx
+    for circuit_num, row_idx in old_circuits:
+        old_data[circuit_num] = row_idx
     
     print(f"旧文件读取了 {len(old_data)} 条记录")
     
-    # 构建新文件数据字典并比较
-    new_data = {}
+    # 构建新文件数据字典，两边都有的回路一次批量比较（第1列是变更点列，不参与比较）
+    new_data = dict(new_circuits)
+    matched = [(circuit_num, row_idx) for circuit_num, row_idx in new_circuits if circuit_num in old_data]
+    changes = compare_pairs(old_rows, new_rows,
+                            [(old_data[circuit_num], row_idx) for circuit_num, row_idx in matched],
+                            range(2, max_col + 1))
+    row_changes = {row_idx: row_change for (_, row_idx), row_change in zip(matched, changes)}
+    
     added = 0
     modified = 0
     unchanged = 0
+    marks = []
     
-    for row_idx in range(start_row, new_sheet.max_row + 1):
-        circuit_num = new_sheet.cell(row=row_idx, column=2).value
-        if circuit_num:
-            circuit_num = str(circuit_num).strip()
-            new_data[circuit_num] = row_idx
-            
-            if circuit_num not in old_data:
-                # 新增
-                added += 1
-                new_sheet.cell(row=row_idx, column=1, value="✓ 新增")
-                new_sheet.cell(row=row_idx, column=1).fill = PatternFill(
-                    start_color="00FF00", end_color="00FF00", fill_type="solid"
-                )
-            else:
-                # 比较整行
-                old_row = old_data[circuit_num]
-                changes = []
-                
-                for col in range(1, max(old_sheet.max_column, new_sheet.max_column) + 1):
-                    old_val = old_sheet.cell(row=old_row, column=col).value
-                    new_val = new_sheet.cell(row=row_idx, column=col).value
-                    
-                    old_str = str(old_val).strip() if old_val else ""
-                    new_str = str(new_val).strip() if new_val else ""
-                    
-                    if col != 1 and old_str != new_str and (old_str or new_str):
-                        changes.append(f"列{col}:{old_str}→{new_str}")
-                
-                if changes:
-                    modified += 1
-                    change_text = "; ".join(changes)
-                    new_sheet.cell(row=row_idx, column=1, value=f"★ 变更: {change_text}")
-                    new_sheet.cell(row=row_idx, column=1).fill = PatternFill(
-                        start_color="FFFF00", end_color="FFFF00", fill_type="solid"
-                    )
-                else:
-                    unchanged += 1
+    for circuit_num, row_idx in new_circuits:
+        if circuit_num not in old_data:
+            # 新增
+            added += 1
+            marks.append((row_idx, "✓ 新增", ADDED_FILL))
+        elif row_changes[row_idx]:
+            modified += 1
+            marks.append((row_idx, f"★ 变更: {format_changes(row_changes[row_idx])}", MODIFIED_FILL))
+        else:
+            unchanged += 1
     
     # 计算删除
     deleted = len(old_data) - len(new_data) + added
     
-    # 添加表头
+    # 标注新文件：表头及各回路的变更点
     new_sheet.cell(row=1, column=1, value="变更点")
     new_sheet.cell(row=1, column=1).font = Font(bold=True)
+    annotate(new_sheet, marks)
     
     # 保存结果
     new_wb.save(output_file)
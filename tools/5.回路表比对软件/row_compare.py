@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+回路表整行比对引擎（analyze_circuits_v2.py、circuit_compare.py 共用）
+- 两张表各用 iter_rows(values_only=True) 整体读一次，每行规范化为等长的字符串元组（空值为 ""，去首尾空格）；
+  同一遍中按回路号单元格的原值（非空/非0才算有回路号，与原脚本一致）取出各数据行的回路号
+- 配对的行按参与比较的列整体比较：itemgetter 取出这些列组成元组后直接判等，整批在C层完成，
+  只有不相等的行才逐列找出变更的列
+- 比对只产生结果，不修改工作簿；在新文件第一列标注由调用方在比对完成后单独一遍写入
+"""
+
+from operator import eq, itemgetter
+
+from openpyxl.styles import PatternFill
+
+ADDED_FILL = PatternFill(start_color="00FF00", end_color="00FF00", fill_type="solid")
+MODIFIED_FILL = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+
+
+def read_rows(sheet, start_row, width=None, key_col=2, falsy_as_empty=False):
+    """
+    整张表读成规范化的行元组列表，返回 (rows, circuits)
+    rows[0] 为第1行；width 为列数（默认 sheet.max_column），每行都补齐到该列数
+    circuits 为从 start_row 起回路号单元格原值为真的行：[(回路号, 行号)]，按行顺序，重复的回路号保留每一行
+    （原值判断：0 不算回路号，只有空格的回路号记为 ""）
+    falsy_as_empty 为 True 时 0 等假值也视为空（circuit_compare.py 原来的判断方式）
+    """
+    width = max(width or sheet.max_column, key_col)
+    key_idx = key_col - 1
+    rows = []
+    circuits = []
+    for row_idx, values in enumerate(sheet.iter_rows(min_row=1, max_row=sheet.max_row, max_col=width,
+                                                     values_only=True), start=1):
+        if falsy_as_empty:
+            row = tuple(str(value).strip() if value else "" for value in values)
+        else:
+            row = tuple(str(value).strip() if value is not None else "" for value in values)
+        rows.append(row + ("",) * (width - len(row)))
+        if row_idx >= start_row and key_idx < len(values) and values[key_idx]:
+            circuits.append((str(values[key_idx]).strip(), row_idx))
+    return rows, circuits
+
+
+def compare_pairs(old_rows, new_rows, pairs, columns):
+    """
+    比较配对的行
+    pairs: [(旧文件行号, 新文件行号)]；columns: 参与比较的列号（从1开始）
+    返回与pairs一一对应的列表：内容相同为None，否则为 [(列号, 旧值, 新值)]
+    """
+    if not pairs or not columns:
+        return [None] * len(pairs)
+
+    pick = itemgetter(*[col - 1 for col in columns])
+    old_selected = [old_rows[old_idx - 1] for old_idx, _ in pairs]
+    new_selected = [new_rows[new_idx - 1] for _, new_idx in pairs]
+    same = list(map(eq, map(pick, old_selected), map(pick, new_selected)))
+
+    results = []
+    for is_same, old_row, new_row in zip(same, old_selected, new_selected):
+        if is_same:
+            results.append(None)
+        else:
+            results.append([(col, old_row[col - 1], new_row[col - 1])
+                             for col in columns if old_row[col - 1] != new_row[col - 1]])
+    return results
+
+
+def format_changes(changes):
+    """变更列表 → "列3:旧→新; 列5:旧→新" """
+    return "; ".join(f"列{col}:{old_value}→{new_value}" for col, old_value, new_value in changes)
+
+
+def annotate(sheet, marks, column=1):
+    """标注一遍写入：marks 为 [(行号, 文字, 填充或None)]"""
+    for row_idx, text, fill in marks:
+        cell = sheet.cell(row=row_idx, column=column, value=text)
+        if fill is not None:
+            cell.fill = fill